@@ -26,6 +26,7 @@ setup_args = dict(
     # long_description=README + '\n\n' + HISTORY,
     license='GPLv3+',
     packages=find_packages(exclude=EXCLUSION_LIST),
+    package_data={'t4gpd.demos': ['data/*/*.xz']},
     author='Thomas Leduc',
     author_email='thomas.leduc@crenau.archi.fr',
     keywords=['Geospatial analysis', 'Urban form', 'Urban morphology', 'Isovist'],
@@ -20,7 +20,22 @@ GNU General Public License for more details.
 You should have received a copy of the GNU General Public License
 along with t4gpd.  If not, see <https://www.gnu.org/licenses/>.
 '''
-from numpy import nan
+from binascii import a2b_base64, b2a_base64
+from numpy import (
+    array,
+    ascontiguousarray,
+    dtype,
+    frombuffer,
+    full,
+    iinfo,
+    integer,
+    isnan,
+    issubdtype,
+    nan,
+    ndarray,
+    rint,
+    uint8,
+)
 from pandas import isna
 
 
@@ -46,3 +61,133 @@ class ArrayCoding(object):
         if (0 == len(argument)):
             return []
         return [outputType(v) for v in argument.split(separator)]
+
+    @staticmethod
+    def __isMissing(value):
+        return (value is None) or (isinstance(value, float) and isna(value))
+
+    @staticmethod
+    def __validRows(column):
+        column = list(column)
+        valid = array([not ArrayCoding.__isMissing(v) for v in column], dtype=bool)
+        return column, valid
+
+    @staticmethod
+    def __output(nRows, valid, matrix):
+        if valid.all():
+            return matrix
+        result = full((nRows, matrix.shape[1]), nan)
+        result[valid] = matrix
+        return result
+
+    @staticmethod
+    def __dtype(_dtype, vmin, vmax):
+        # Fixed-size little-endian dtype
+        _dtype = dtype(_dtype).newbyteorder("<")
+        if (vmin is None) != (vmax is None):
+            raise Exception("vmin and vmax must be given together!")
+        if (vmin is not None) and not issubdtype(_dtype, integer):
+            raise Exception("Quantization requires an integer dtype (uint8, uint16)!")
+        return _dtype
+
+    @staticmethod
+    def encodeColumn(values, dtype="float32", vmin=None, vmax=None, raw=False):
+        """
+        Binary counterpart of encode, for a whole column of equal-length
+        vectors (ray lengths, angles, sunlit flags...). Each row is packed
+        into a fixed-dtype little-endian byte string, optionally quantized
+        into integer bins over [vmin, vmax] (the greatest bin is kept for
+        NaN), and given as base64 text (GeoPackage/CSV) or raw bytes.
+        :param values: 2D array or sequence of vectors (None or NaN rows allowed)
+        :param dtype: stored dtype, e.g. "float64", "float32", "uint16", "uint8"
+        :param vmin: lower bound of the quantization range (e.g. 0)
+        :param vmax: upper bound of the quantization range (e.g. pi / 2)
+        :param raw: bytes instead of base64 strings
+        :return: 1D object array (NaN for missing rows)
+        """
+        _dtype = ArrayCoding.__dtype(dtype, vmin, vmax)
+        if isinstance(values, ndarray) and (2 == values.ndim):
+            nRows, valid = len(values), full(len(values), True)
+            matrix = values
+        else:
+            values, valid = ArrayCoding.__validRows(values)
+            nRows = len(values)
+            try:
+                matrix = array(
+                    [v for v, ok in zip(values, valid) if ok], dtype=float, ndmin=2
+                )
+            except ValueError:
+                raise Exception("Illegal argument: vectors must share the same length!")
+            if not valid.any():
+                matrix = matrix.reshape(0, 0)
+
+        if vmin is not None:
+            nodata = iinfo(_dtype).max
+            q = rint((matrix - vmin) * ((nodata - 1) / (vmax - vmin)))
+            q = q.clip(0, nodata - 1)
+            q[isnan(matrix)] = nodata
+            matrix = q
+        b = ascontiguousarray(matrix.astype(_dtype)).view(uint8)
+        b = b.reshape(len(matrix), -1)
+
+        buf, n = b.tobytes(), b.shape[1]
+        rows = [buf[i * n : (i + 1) * n] for i in range(len(matrix))]
+        if not raw:
+            rows = [b2a_base64(row, newline=False).decode("ascii") for row in rows]
+        result = full(nRows, nan, dtype=object)
+        result[valid] = rows
+        return result
+
+    @staticmethod
+    def decodeColumn(column, dtype="float32", vmin=None, vmax=None):
+        """
+        Vectorized inverse of encodeColumn (same dtype, vmin and vmax)
+        :param column: sequence of base64 strings or bytes (None or NaN rows allowed)
+        :return: 2D array, one row per item (NaN for missing rows)
+        """
+        _dtype = ArrayCoding.__dtype(dtype, vmin, vmax)
+        column, valid = ArrayCoding.__validRows(column)
+        items = [v for v, ok in zip(column, valid) if ok]
+        if 0 == len(items):
+            return full((len(column), 0), nan)
+
+        if not isinstance(items[0], (bytes, bytearray)):
+            items = list(map(a2b_base64, items))
+        nBytes = len(items[0])
+        if any(len(v) != nBytes for v in items) or (0 != nBytes % _dtype.itemsize):
+            raise Exception(f"Illegal argument: items are not {_dtype} vectors!")
+        b = frombuffer(bytearray(b"".join(items)), uint8)
+        matrix = b.view(_dtype).reshape(len(items), -1)
+
+        if vmin is not None:
+            nodata = iinfo(_dtype).max
+            _matrix = vmin + matrix * ((vmax - vmin) / (nodata - 1))
+            _matrix[nodata == matrix] = nan
+            matrix = _matrix
+        elif not valid.all():
+            matrix = matrix.astype(float)
+        return ArrayCoding.__output(len(column), valid, matrix)
+
+    @staticmethod
+    def decodeJoinedColumn(column, outputType=float, separator="#"):
+        """
+        Vectorized counterpart of decode, for a whole column of equal-length
+        separator-joined strings
+        :return: 2D array, one row per item (NaN for missing rows)
+        """
+        column, valid = ArrayCoding.__validRows(column)
+        items = [v for v, ok in zip(column, valid) if ok]
+        if 0 == len(items):
+            return full((len(column), 0), nan)
+
+        nValues = array([0 if 0 == len(v) else v.count(separator) + 1 for v in items])
+        if (nValues != nValues[0]).any():
+            raise Exception("Illegal argument: items must share the same length!")
+        if 0 == nValues[0]:
+            matrix = full((len(items), 0), nan)
+        else:
+            matrix = array(separator.join(items).split(separator), dtype=outputType)
+            matrix = matrix.reshape(len(items), -1)
+        if not valid.all():
+            matrix = matrix.astype(float)
+        return ArrayCoding.__output(len(column), valid, matrix)
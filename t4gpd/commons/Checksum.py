@@ -20,9 +20,15 @@ GNU General Public License for more details.
 You should have received a copy of the GNU General Public License
 along with t4gpd.  If not, see <https://www.gnu.org/licenses/>.
 '''
-from hashlib import md5
+from hashlib import blake2b, md5
 from os import path
 
+from geopandas import GeoDataFrame, GeoSeries
+from numpy import asarray, ndarray
+from pandas import DataFrame, Series
+from pandas.util import hash_pandas_object
+from shapely import to_wkb
+
 
 class Checksum(object):
     '''
@@ -34,3 +40,79 @@ class Checksum(object):
         if path.exists(filename):
             return md5(open(filename, 'rb').read()).hexdigest()
         return None
+
+    @staticmethod
+    def fingerprint(gdf, fieldnames=None):
+        '''
+        Fast content hash of a scene: blake2b digest of the WKB array of its
+        geometries, of its crs and of the given attribute columns (the index
+        and the other columns are ignored)
+        :param gdf: GeoDataFrame or GeoSeries
+        :param fieldnames: relevant attribute columns (none by default)
+        :return: hexadecimal digest
+        '''
+        _hash = blake2b(digest_size=16)
+        Checksum.__updateWithGeometries(_hash, gdf.geometry)
+        for fieldname in ([] if fieldnames is None else fieldnames):
+            _hash.update(fieldname.encode())
+            Checksum.__updateWithColumn(_hash, gdf[fieldname])
+        return _hash.hexdigest()
+
+    @staticmethod
+    def __updateWithGeometries(_hash, geoms):
+        wkbs = to_wkb(asarray(geoms), output_dimension=3)
+        _hash.update(b''.join([b'' if wkb is None else wkb for wkb in wkbs.tolist()]))
+        _hash.update(str(getattr(geoms, 'crs', None)).encode())
+
+    @staticmethod
+    def __updateWithColumn(_hash, column):
+        try:
+            _hash.update(hash_pandas_object(column, index=False).to_numpy().tobytes())
+        except TypeError:
+            # Unhashable values, such as lists
+            _hash.update(repr(column.tolist()).encode())
+
+    @staticmethod
+    def __update(_hash, obj):
+        # Type name first, so that [1, 2] and (1, 2) have distinct digests
+        _hash.update(type(obj).__name__.encode())
+        if isinstance(obj, GeoSeries):
+            Checksum.__updateWithGeometries(_hash, obj.values)
+        elif isinstance(obj, DataFrame):
+            _hash.update(repr(list(obj.columns)).encode())
+            _hash.update(hash_pandas_object(obj.index).to_numpy().tobytes())
+            for fieldname in obj.columns:
+                if isinstance(obj, GeoDataFrame) and isinstance(obj[fieldname], GeoSeries):
+                    Checksum.__updateWithGeometries(_hash, obj[fieldname])
+                else:
+                    Checksum.__updateWithColumn(_hash, obj[fieldname])
+        elif isinstance(obj, Series):
+            _hash.update(hash_pandas_object(obj.index).to_numpy().tobytes())
+            Checksum.__updateWithColumn(_hash, obj)
+        elif isinstance(obj, ndarray) and (object != obj.dtype):
+            _hash.update(f'{obj.dtype.str}{obj.shape}'.encode())
+            _hash.update(obj.tobytes())
+        elif isinstance(obj, (list, tuple, ndarray)):
+            _hash.update(str(len(obj)).encode())
+            for item in obj:
+                Checksum.__update(_hash, item)
+        elif isinstance(obj, dict):
+            for key in sorted(obj, key=repr):
+                Checksum.__update(_hash, key)
+                Checksum.__update(_hash, obj[key])
+        else:
+            _hash.update(repr(obj).encode())
+
+    @staticmethod
+    def md5Of(*args, **kwargs):
+        '''
+        Digest of in-memory objects: GeoDataFrames (WKB of their geometries,
+        crs, and attribute values), DataFrames, Series, NumPy arrays, lists,
+        tuples and dicts of them, and any other object through its repr
+        (e.g. numbers, strings, datetimes)
+        :return: hexadecimal MD5 digest
+        '''
+        _hash = md5()
+        Checksum.__update(_hash, args)
+        Checksum.__update(_hash, kwargs)
+        return _hash.hexdigest()
@@ -0,0 +1,143 @@
+"""
+Created on 19 Oct. 2026
+
+@author: tleduc
+
+Copyright 2020-2026 Thomas Leduc
+
+This file is part of t4gpd.
+
+t4gpd is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+t4gpd is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with t4gpd.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from collections import OrderedDict
+from sys import getsizeof
+
+from geopandas.array import GeometryArray
+from geopandas.sindex import SpatialIndex
+from numpy import ndarray
+from pandas import DataFrame, Series
+from shapely import STRtree, get_num_coordinates
+from shapely.geometry.base import BaseGeometry
+
+
+class Memoizer(object):
+    """
+    classdocs
+
+    LRU memo of preprocessed artefacts (cleaned masks, spatial indexes,
+    graphs, edge arrays, etc.), typically keyed by a scene fingerprint (see
+    Checksum.fingerprint). The least recently used entries are evicted as
+    soon as the total estimated size of the entries exceeds maxsize bytes.
+    Cached values are shared: they must not be modified in place.
+    """
+
+    __shared = None
+
+    def __init__(self, maxsize=512 * 2**20):
+        """
+        Constructor
+        :param maxsize: maximum total size of the entries, in bytes
+        """
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self.nbytes = 0
+        self.hits, self.misses = 0, 0
+
+    @staticmethod
+    def shared():
+        """
+        :return: the memo shared by the t4gpd classes
+        """
+        if Memoizer.__shared is None:
+            Memoizer.__shared = Memoizer()
+        return Memoizer.__shared
+
+    @staticmethod
+    def sizeof(obj):
+        """
+        Rough estimate of the memory footprint of obj, in bytes
+        """
+        if isinstance(obj, ndarray):
+            if object == obj.dtype:
+                return obj.nbytes + sum([Memoizer.sizeof(item) for item in obj.tolist()])
+            return obj.nbytes
+        if isinstance(obj, (DataFrame, Series)):
+            result = int(obj.memory_usage(index=True, deep=False).sum())
+            columns = [obj] if isinstance(obj, Series) else [obj[c] for c in obj.columns]
+            for column in columns:
+                if isinstance(column.values, GeometryArray):
+                    result += Memoizer.sizeof(column.values)
+            return result
+        if isinstance(obj, (STRtree, SpatialIndex)):
+            return 100 * len(obj)
+        if isinstance(obj, (list, tuple)):
+            return getsizeof(obj) + sum([Memoizer.sizeof(item) for item in obj])
+        if isinstance(obj, dict):
+            return getsizeof(obj) + sum(
+                [Memoizer.sizeof(k) + Memoizer.sizeof(v) for k, v in obj.items()]
+            )
+        if isinstance(obj, GeometryArray):
+            return int(24 * get_num_coordinates(obj).sum()) + 100 * len(obj)
+        if isinstance(obj, BaseGeometry):
+            return 24 * get_num_coordinates(obj) + 100
+        if hasattr(obj, "number_of_edges"):
+            # networkx graphs
+            return 500 * (obj.number_of_nodes() + obj.number_of_edges())
+        return getsizeof(obj)
+
+    def __contains__(self, key):
+        return key in self.entries
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __evict(self):
+        while (self.maxsize < self.nbytes) and (0 < len(self.entries)):
+            _, (_, nbytes) = self.entries.popitem(last=False)
+            self.nbytes -= nbytes
+
+    def put(self, key, value):
+        """
+        Store value, and evict the least recently used entries if necessary
+        """
+        if key in self.entries:
+            self.nbytes -= self.entries.pop(key)[1]
+        nbytes = Memoizer.sizeof(value)
+        if nbytes <= self.maxsize:
+            self.entries[key] = (value, nbytes)
+            self.nbytes += nbytes
+            self.__evict()
+        return value
+
+    def get(self, key, factory=None):
+        """
+        :param key: hashable key, e.g. (name, fingerprint, parameters)
+        :param factory: function without argument computing the value on
+            a cache miss (None to only look up the memo)
+        :return: the memoized (or newly computed) value
+        """
+        if key in self.entries:
+            self.hits += 1
+            self.entries.move_to_end(key)
+            return self.entries[key][0]
+        self.misses += 1
+        if factory is None:
+            return None
+        return self.put(key, factory())
+
+    def clear(self):
+        self.entries.clear()
+        self.nbytes = 0
+        self.hits, self.misses = 0, 0
@@ -0,0 +1,158 @@
+"""
+Created on 19 Oct. 2026
+
+@author: tleduc
+
+Copyright 2020-2026 Thomas Leduc
+
+This file is part of t4gpd.
+
+t4gpd is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+t4gpd is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with t4gpd.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import numpy as np
+from shapely import (
+    STRtree,
+    get_coordinates,
+    get_parts,
+    line_interpolate_point,
+    linestrings,
+    points,
+)
+
+
+class SnappingLib(object):
+    """
+    classdocs
+
+    Bulk snapping of points onto lines: the lines are cut into segments, the
+    nearest segment of every point is found with an STRtree, and the points
+    are projected onto their nearest segment all at once.
+    """
+
+    @staticmethod
+    def segments(lines):
+        """
+        :param lines: array of (Multi)LineStrings
+        :return: (n, 2, 2) array of segments, (n,) array of the lines' indices,
+            (n,) array of the curvilinear abscissae of the segments' origins
+        """
+        parts, partIds = get_parts(np.asarray(lines), return_index=True)
+        xy, index = get_coordinates(parts, return_index=True)
+        sameLine = np.flatnonzero(index[:-1] == index[1:])
+
+        segments = np.empty((len(sameLine), 2, 2))
+        segments[:, 0], segments[:, 1] = xy[sameLine], xy[sameLine + 1]
+        lineIds = partIds[index[sameLine]]
+
+        # As in LineString.project(), the parts of a MultiLineString follow
+        # each other along the curvilinear abscissa
+        lengths = np.hypot(*(segments[:, 1] - segments[:, 0]).T)
+        cumLengths = np.cumsum(lengths) - lengths
+        _, firsts = np.unique(lineIds, return_index=True)
+        offsets = cumLengths - np.repeat(
+            cumLengths[firsts], np.diff(np.append(firsts, len(lineIds)))
+        )
+        return segments, lineIds, offsets
+
+    @staticmethod
+    def snap(pts, lines, maxDist=None):
+        """
+        Snap every point onto its nearest line
+        :param pts: array of Points (or (n, 2) array of coordinates)
+        :param lines: array of (Multi)LineStrings
+        :param maxDist: points farther than maxDist from any line are not snapped
+        :return: lineIds, abscissae, snappedPoints, distances arrays; the
+            lineIds are positions in lines (-1 if not snapped), the abscissae
+            are curvilinear abscissae along these lines (NaN if not snapped)
+        """
+        xy = np.asarray(pts)
+        xy = (
+            get_coordinates(xy)
+            if (xy.dtype == object) or (0 == len(xy))
+            else xy[:, :2].astype(float)
+        )
+        n = len(xy)
+        lineIds = np.full(n, -1, dtype=int)
+        abscissae, distances = np.full(n, np.nan), np.full(n, np.nan)
+        snapped = np.full(n, None, dtype=object)
+
+        segments, segLineIds, offsets = SnappingLib.segments(lines)
+        if (0 == n) or (0 == len(segments)):
+            return lineIds, abscissae, snapped, distances
+
+        tree = STRtree(linestrings(segments))
+        ptIds, segIds = tree.query_nearest(
+            points(xy), max_distance=maxDist, all_matches=False
+        )
+
+        # Vectorized point-to-segment projection
+        a, b = segments[segIds, 0], segments[segIds, 1]
+        ab, ap = b - a, xy[ptIds] - a
+        sqLengths = (ab * ab).sum(axis=1)
+        t = np.divide(
+            (ap * ab).sum(axis=1),
+            sqLengths,
+            out=np.zeros(len(segIds)),
+            where=0.0 < sqLengths,
+        )
+        t = np.clip(t, 0.0, 1.0)
+        proj = a + t[:, None] * ab
+
+        lineIds[ptIds] = segLineIds[segIds]
+        abscissae[ptIds] = offsets[segIds] + t * np.sqrt(sqLengths)
+        snapped[ptIds] = points(proj)
+        distances[ptIds] = np.hypot(*(xy[ptIds] - proj).T)
+        return lineIds, abscissae, snapped, distances
+
+    @staticmethod
+    def interpolate(lines, lineIds, abscissae, normalized=False):
+        """
+        Points located at the given curvilinear abscissae of the given lines
+        :return: array of Points (None where lineIds is -1 or abscissae is NaN)
+        """
+        lines, lineIds = np.asarray(lines), np.asarray(lineIds, dtype=int)
+        abscissae = np.asarray(abscissae, dtype=float)
+        result = np.full(len(abscissae), None, dtype=object)
+        valid = (0 <= lineIds) & ~np.isnan(abscissae)
+        result[valid] = line_interpolate_point(
+            lines[lineIds[valid]], abscissae[valid], normalized=normalized
+        )
+        return result
+
+    @staticmethod
+    def test():
+        import matplotlib.pyplot as plt
+        from geopandas import GeoDataFrame
+        from shapely import LineString
+
+        lines = [LineString([(0, 0), (100, 0), (100, 100)])]
+        rng = np.random.default_rng(0)
+        pts = points(rng.uniform(-10, 110, (1000, 2)))
+        _, abscissae, snapped, distances = SnappingLib.snap(pts, lines)
+
+        # PLOTTING
+        fig, ax = plt.subplots(figsize=(10, 10))
+        GeoDataFrame(geometry=lines).plot(ax=ax, color="red")
+        GeoDataFrame({"absc": abscissae}, geometry=snapped).plot(
+            ax=ax, column="absc", legend=True
+        )
+        GeoDataFrame(geometry=pts).plot(ax=ax, color="grey", marker="+")
+        ax.axis("off")
+        fig.tight_layout()
+        plt.show()
+        plt.close(fig)
+
+
+# SnappingLib.test()
@@ -20,9 +20,12 @@ GNU General Public License for more details.
 You should have received a copy of the GNU General Public License
 along with t4gpd.  If not, see <https://www.gnu.org/licenses/>.
 '''
+from multiprocessing import cpu_count, Pool
 from geopandas import GeoDataFrame
-from shapely import line_interpolate_point, LineString, Point, union_all
+from numpy import linspace, unique
+from shapely import line_interpolate_point, LineString, union_all
 from t4gpd.commons.ArrayCoding import ArrayCoding
+from t4gpd.commons.IllegalArgumentTypeException import IllegalArgumentTypeException
 from t4gpd.commons.graph.UrbanGraphFactory import UrbanGraphFactory
 
 
@@ -36,44 +39,80 @@ class NeighborhoodLib(object):
         return str_hash
 
     @staticmethod
-    def neighborhood(roads, fromPoint, maxDist):
-        # WRONG IDEA:
-        # roi = fromPoint.buffer(maxDist, cap_style=CAP_STYLE.round)
-        # roi = GeoDataFrame([{"geometry": roi}], crs=roads.crs)
-        # ug = UrbanGraphFactory.create(roads, method="networkx", roi=roi)
+    def _neighborhood(ug, fromPoint, maxDist):
+        overlay, coords = {}, {}
+        source = ug._snap(fromPoint, overlay, coords)
+        dist, pred = ug._dijkstra(overlay, source, cutoff=maxDist)
+
+        def _coords(idx):
+            return coords[idx] if idx in coords else ug.icVertices[idx]
+
+        # Full edges of the shortest paths tree
+        rows, tree_edges = [], set()
+        for id2, id1 in pred.items():
+            if id1 is not None:
+                tree_edges.add(frozenset((id1, id2)))
+                rows.append(LineString([_coords(id1), _coords(id2)]))
+
+        # Remaining (partial) edges in the neighborhood
+        for id1, d in dist.items():
+            remaining_dist = maxDist - d
+            if (0.0 < remaining_dist):
+                for id2, w in ug._neighbors(overlay, id1):
+                    if not frozenset((id1, id2)) in tree_edges:
+                        ls = LineString([_coords(id1), _coords(id2)])
+                        if (remaining_dist < w):
+                            rp = line_interpolate_point(ls, remaining_dist)
+                            ls = LineString([_coords(id1), rp])
+                        rows.append(ls)
+
+        rows = [ls for ls in rows if (0.0 < ls.length)]
+        return union_all(rows)
+
+    @staticmethod
+    def _neighborhoods(ug, fromPointsAndMaxDists):
+        return [NeighborhoodLib._neighborhood(ug, fromPoint, maxDist)
+                for fromPoint, maxDist in fromPointsAndMaxDists]
+
+    @staticmethod
+    def neighborhood(roads, fromPoint, maxDist, ug=None):
+        '''
+        Network neighborhood of fromPoint, i.e. the parts of the roads that
+        are within a network distance of maxDist. One bounded single-source
+        Dijkstra is run, the graph is neither copied nor modified.
+        :param roads: GeoDataFrame of roads
+        :param fromPoint: origin Point
+        :param maxDist: network distance
+        :param ug: "networkx" UrbanGraph of the roads, to be reused (built if None)
+        :return: single row GeoDataFrame
+        '''
+        if ug is None:
+            ug = UrbanGraphFactory.create(roads, method="networkx")
+        geom = NeighborhoodLib._neighborhoods(ug, [(fromPoint, maxDist)])[0]
+        return GeoDataFrame([{"geometry": geom}], crs=roads.crs)
+
+    @staticmethod
+    def neighborhoods(roads, fromPointsAndMaxDists, ncpus=1):
+        '''
+        Network neighborhoods of many origins, in one batch: the graph and
+        its spatial index are built only once.
+        :param roads: GeoDataFrame of roads
+        :param fromPointsAndMaxDists: list of (origin Point, network distance)
+        :param ncpus: number of processes (all CPUs if None)
+        :return: list of geometries, in the fromPointsAndMaxDists order
+        '''
+        if not isinstance(roads, GeoDataFrame):
+            raise IllegalArgumentTypeException(roads, "GeoDataFrame")
+
         ug = UrbanGraphFactory.create(roads, method="networkx")
-        sourceIdx = ug._add_new_point(fromPoint)
-
-        # Identification of full edges and vertices in the neighborhood
-        burned_vertices, burned_edges = {sourceIdx: maxDist}, {}
-        for vtxIdx, vtxGeom in ug.icVertices.items():
-            geom = Point(vtxGeom)
-            if (maxDist >= fromPoint.distance(geom)):
-                path = ug.shortest_path(fromPoint, geom)
-                if (0 < len(path)):
-                    pathVertices = ArrayCoding.decode(path.path.squeeze())
-                    pathLen = path.geometry.squeeze().length
-
-                    if (maxDist >= pathLen):
-                        burned_vertices[vtxIdx] = maxDist - pathLen
-                        for i in range(1, len(pathVertices)):
-                            burned_edges[NeighborhoodLib.hash_edge(
-                                pathVertices[i-1], pathVertices[i]
-                            )] = True
-
-        rows = []
-        for str_hash in burned_edges.keys():
-            id1, id2 = ArrayCoding.decode(str_hash, outputType=int)
-            rows.append(LineString([ug.icVertices[id1], ug.icVertices[id2]]))
-
-        # Identification of remaining edges in the neighborhood
-        for id1, remaining_dist in burned_vertices.items():
-            for id2 in ug.nx_graph.adj[id1].keys():
-                str_hash = NeighborhoodLib.hash_edge(id1, id2)
-                if not str_hash in burned_edges:
-                    ls = LineString([ug.icVertices[id1], ug.icVertices[id2]])
-                    rp = line_interpolate_point(ls, remaining_dist)
-                    ls = LineString([ug.icVertices[id1], rp])
-                    rows.append(ls)
-
-        return GeoDataFrame([{"geometry": union_all(rows)}], crs=roads.crs)
+        ncpus = cpu_count() if ncpus is None else ncpus
+        nrows = len(fromPointsAndMaxDists)
+        if (1 == ncpus) or (1 >= nrows):
+            return NeighborhoodLib._neighborhoods(ug, fromPointsAndMaxDists)
+
+        loi = unique(linspace(0, nrows, min(ncpus, nrows) + 1).astype(int))
+        chunks = [(ug, fromPointsAndMaxDists[loi[i - 1]:loi[i]])
+                  for i in range(1, len(loi))]
+        with Pool(processes=len(chunks)) as pool:
+            results = pool.starmap(NeighborhoodLib._neighborhoods, chunks)
+        return [geom for result in results for geom in result]
@@ -0,0 +1,193 @@
+'''
+Created on 19 Oct. 2026
+
+@author: tleduc
+
+Copyright 2020-2026 Thomas Leduc
+
+This file is part of t4gpd.
+
+t4gpd is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+t4gpd is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with t4gpd.  If not, see <https://www.gnu.org/licenses/>.
+'''
+from numpy import (arange, bincount, concatenate, empty, floor, flatnonzero, isin,
+                   lexsort, searchsorted, sort, unique, where, zeros)
+from shapely import (get_coordinates, get_parts, get_rings, get_type_id,
+                     intersection, linestrings, STRtree)
+
+
+class NodingLib(object):
+    '''
+    classdocs
+
+    Noding of road layers without any global union_all: the layer is cut
+    into (n, 2, 2) arrays of bipoints, the crossing bipoints are found with
+    an STRtree, tile by tile, and each bipoint is split at its crossings.
+    '''
+
+    @staticmethod
+    def bipoints(geoms):
+        '''
+        :param geoms: array of (Multi)LineStrings or (Multi)Polygons
+        :return: (n, 2, 2) array of the consecutive coordinates of every line
+        '''
+        parts = get_parts(geoms)
+        typeIds = get_type_id(parts)
+        lines = concatenate([parts[isin(typeIds, [1, 2])],
+                             get_rings(parts[3 == typeIds])])
+
+        xy, index = get_coordinates(lines, return_index=True)
+        sameLine = flatnonzero(index[:-1] == index[1:])
+        result = empty((len(sameLine), 2, 2))
+        result[:, 0], result[:, 1] = xy[sameLine], xy[sameLine + 1]
+        return result
+
+    @staticmethod
+    def __tiles(bipoints, tilesize):
+        if (tilesize is None) or (0 == len(bipoints)):
+            return [arange(len(bipoints))]
+        # Each bipoint belongs to the tile of its middle point
+        keys = floor(bipoints.mean(axis=1) / tilesize)
+        _, inverse = unique(keys, axis=0, return_inverse=True)
+        inverse = inverse.reshape(-1)
+        order = inverse.argsort(kind="stable")
+        bounds = flatnonzero(concatenate([[True], inverse[order][1:] != inverse[order][:-1], [True]]))
+        return [order[bounds[i]:bounds[i + 1]] for i in range(len(bounds) - 1)]
+
+    @staticmethod
+    def __crossings(geoms, tree, treeGeoms, tiles, selfNoding):
+        # Crossing points of geoms[i] and treeGeoms[j], each pair being
+        # intersected only once so that both bipoints share the same node
+        ii, jj, pts = [], [], []
+        for tile in tiles:
+            i, j = tree.query(geoms[tile], predicate="intersects")
+            i = tile[i]
+            if selfNoding:
+                keep = i < j
+                i, j = i[keep], j[keep]
+            xy, index = get_coordinates(
+                intersection(geoms[i], treeGeoms[j]), return_index=True)
+            ii.append(i[index])
+            jj.append(j[index])
+            pts.append(xy)
+        if (0 == len(pts)):
+            return zeros(0, dtype=int), zeros(0, dtype=int), zeros((0, 2))
+        return concatenate(ii), concatenate(jj), concatenate(pts)
+
+    @staticmethod
+    def split(bipoints, bipointIds, pts):
+        '''
+        Split every bipoint at the given points
+        :param bipoints: (n, 2, 2) array
+        :param bipointIds: (k, ) array of the bipoints the points belong to
+        :param pts: (k, 2) array of points
+        :return: (m, 2, 2) array of the split bipoints, and the (m, ) array
+            of the ids of the bipoints they come from
+        '''
+        n = len(bipoints)
+        # The bipoint ends are added, then the points are sorted along the bipoints
+        ids = concatenate([arange(n), arange(n), bipointIds]).astype(int)
+        xy = concatenate([bipoints[:, 0], bipoints[:, 1], pts])
+        a, b = bipoints[ids, 0], bipoints[ids, 1]
+        ab = b - a
+        norm2 = (ab * ab).sum(axis=1)
+        norm2[0 == norm2] = 1.0
+        t = ((xy - a) * ab).sum(axis=1) / norm2
+        t[:n], t[n:2 * n] = 0.0, 1.0
+        order = lexsort((t, ids))
+        ids, xy = ids[order], xy[order]
+
+        # Consecutive (distinct) points of the same bipoint
+        keep = (ids[1:] == ids[:-1]) & (xy[1:] != xy[:-1]).any(axis=1)
+        result = empty((keep.sum(), 2, 2))
+        result[:, 0], result[:, 1] = xy[:-1][keep], xy[1:][keep]
+        return result, ids[:-1][keep]
+
+    @staticmethod
+    def __keys(bipoints):
+        # Same key for both directions of a bipoint
+        p0, p1 = bipoints[:, 0], bipoints[:, 1]
+        ordered = ((p0[:, 0] < p1[:, 0]) |
+                   ((p0[:, 0] == p1[:, 0]) & (p0[:, 1] < p1[:, 1])))[:, None]
+        return concatenate([where(ordered, p0, p1), where(ordered, p1, p0)], axis=1)
+
+    @staticmethod
+    def dedup(bipoints, others=None):
+        '''
+        Remove the degenerated and the duplicated (in any direction) bipoints
+        :param others: if set, the bipoints that are already in this (p, 2, 2)
+            array are also removed
+        '''
+        bipoints = bipoints[(bipoints[:, 0] != bipoints[:, 1]).any(axis=1)]
+        keys = NodingLib.__keys(bipoints)
+        _, index = unique(keys, axis=0, return_index=True)
+        index = sort(index)
+        if (others is None) or (0 == len(others)) or (0 == len(index)):
+            return bipoints[index]
+
+        _, inverse = unique(concatenate([keys[index], NodingLib.__keys(others)]),
+                            axis=0, return_inverse=True)
+        inverse = inverse.reshape(-1)
+        known = isin(inverse[:len(index)], inverse[len(index):])
+        return bipoints[index[~known]]
+
+    @staticmethod
+    def node(bipoints, tilesize=None):
+        '''
+        Self-noding of a set of bipoints
+        :param bipoints: (n, 2, 2) array
+        :param tilesize: the crossings are searched tile by tile (one single
+            tile if None)
+        :return: (m, 2, 2) array of noded bipoints, without duplicates
+        '''
+        geoms = linestrings(bipoints)
+        i, j, pts = NodingLib.__crossings(
+            geoms, STRtree(geoms), geoms, NodingLib.__tiles(bipoints, tilesize), True)
+        result, _ = NodingLib.split(
+            bipoints, concatenate([i, j]), concatenate([pts, pts]))
+        return NodingLib.dedup(result)
+
+    @staticmethod
+    def node_against(bipoints, others, othersTree=None, tilesize=None):
+        '''
+        Noding of new bipoints against an already noded set of bipoints
+        :param bipoints: (n, 2, 2) array of new bipoints
+        :param others: (p, 2, 2) array of already noded bipoints
+        :param othersTree: STRtree of the others (built if None)
+        :param tilesize: the crossings are searched tile by tile
+        :return: the noded new bipoints (without the ones already in others),
+            the ids of the others that are cut, and their parts
+        '''
+        geoms, otherGeoms = linestrings(bipoints), linestrings(others)
+        othersTree = STRtree(otherGeoms) if othersTree is None else othersTree
+        tiles = NodingLib.__tiles(bipoints, tilesize)
+
+        i1, j1, pts1 = NodingLib.__crossings(
+            geoms, STRtree(geoms), geoms, tiles, True)
+        i2, j2, pts2 = NodingLib.__crossings(
+            geoms, othersTree, otherGeoms, tiles, False)
+
+        noded, _ = NodingLib.split(bipoints, concatenate([i1, j1, i2]),
+                                   concatenate([pts1, pts1, pts2]))
+
+        # Others that are touched at one of their ends are left unchanged
+        touchedIds = unique(j2)
+        parts, parentIds = NodingLib.split(
+            others[touchedIds], searchsorted(touchedIds, j2), pts2)
+        nparts = bincount(parentIds, minlength=len(touchedIds))
+        isCut = 1 < nparts
+        parts = parts[isCut[parentIds]]
+
+        # New bipoints may overlap the existing ones
+        noded = NodingLib.dedup(noded, concatenate([others, parts]))
+        return noded, touchedIds[isCut], parts
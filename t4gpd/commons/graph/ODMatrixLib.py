@@ -0,0 +1,123 @@
+'''
+Created on 19 Oct. 2026
+
+@author: tleduc
+
+Copyright 2020-2026 Thomas Leduc
+
+This file is part of t4gpd.
+
+t4gpd is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+t4gpd is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with t4gpd.  If not, see <https://www.gnu.org/licenses/>.
+'''
+from multiprocessing import cpu_count, Pool
+from geopandas import GeoDataFrame
+from numpy import full, inf, linspace, unique
+from shapely import LineString, Point
+from t4gpd.commons.ArrayCoding import ArrayCoding
+from t4gpd.commons.IllegalArgumentTypeException import IllegalArgumentTypeException
+from t4gpd.commons.graph.UrbanGraph import UrbanGraph
+from t4gpd.commons.graph.UrbanGraphFactory import UrbanGraphFactory
+
+
+class ODMatrixLib(object):
+    '''
+    classdocs
+    '''
+
+    @staticmethod
+    def __snap_targets(ug, toPoints):
+        overlay, coords = {}, {}
+        targetIds = [ug._snap(toPoint, overlay, coords) for toPoint in toPoints]
+        return overlay, coords, targetIds
+
+    @staticmethod
+    def _od(ug, overlay, coords, targetIds, fromPoints, withPaths):
+        '''
+        One multi-target Dijkstra per origin, the targets being snapped once
+        and for all in the (copied) overlay.
+        '''
+        distances, rows = full((len(fromPoints), len(targetIds)), inf), []
+        for i, fromPoint in enumerate(fromPoints):
+            _overlay = {k: dict(v) for k, v in overlay.items()}
+            _coords = dict(coords)
+            sourceIdx = ug._snap(fromPoint, _overlay, _coords)
+            dist, pred = ug._dijkstra(_overlay, sourceIdx, targets=targetIds)
+
+            for j, targetIdx in enumerate(targetIds):
+                if targetIdx in dist:
+                    distances[i, j] = dist[targetIdx]
+                    if withPaths and (sourceIdx != targetIdx):
+                        spath = UrbanGraph._path(pred, targetIdx)
+                        ls = LineString([
+                            _coords[nodeIndex] if nodeIndex in _coords else ug.icVertices[nodeIndex]
+                            for nodeIndex in spath
+                        ])
+                        rows.append({
+                            "fromIdx": i,
+                            "toIdx": j,
+                            "fromPoint": Point(ls.coords[0]).wkt,
+                            "toPoint": Point(ls.coords[-1]).wkt,
+                            "path": ArrayCoding.encode(spath),
+                            "pathLen": ls.length,
+                            "geometry": ls
+                        })
+        return distances, rows
+
+    @staticmethod
+    def odMatrix(roads, fromPoints, toPoints, withPaths=False, ncpus=1):
+        '''
+        Origin-destination matrix of the network distances between fromPoints
+        and toPoints. The graph is built and the toPoints are snapped on it
+        only once, then one multi-target Dijkstra is run per origin.
+        :param roads: GeoDataFrame of roads
+        :param fromPoints: list of origin Points
+        :param toPoints: list of destination Points
+        :param withPaths: if True, the shortest paths are also returned
+        :param ncpus: number of processes (all CPUs if None)
+        :return: (len(fromPoints), len(toPoints)) array (inf if there is no
+            path), and if withPaths, a GeoDataFrame of the shortest paths
+            (fromIdx and toIdx being row and column indices in the array)
+        '''
+        if not isinstance(roads, GeoDataFrame):
+            raise IllegalArgumentTypeException(roads, "GeoDataFrame")
+
+        ug = UrbanGraphFactory.create(roads, method="networkx")
+        fromPoints, toPoints = list(fromPoints), list(toPoints)
+        overlay, coords, targetIds = ODMatrixLib.__snap_targets(ug, toPoints)
+
+        ncpus = cpu_count() if ncpus is None else ncpus
+        nrows = len(fromPoints)
+        if (1 == ncpus) or (1 >= nrows):
+            distances, rows = ODMatrixLib._od(
+                ug, overlay, coords, targetIds, fromPoints, withPaths)
+        else:
+            loi = unique(linspace(0, nrows, min(ncpus, nrows) + 1).astype(int))
+            chunks = [(ug, overlay, coords, targetIds, fromPoints[loi[i - 1]:loi[i]], withPaths)
+                      for i in range(1, len(loi))]
+            with Pool(processes=len(chunks)) as pool:
+                results = pool.starmap(ODMatrixLib._od, chunks)
+
+            distances = full((nrows, len(toPoints)), inf)
+            rows = []
+            for i, (_distances, _rows) in enumerate(results):
+                distances[loi[i]:loi[i + 1]] = _distances
+                for row in _rows:
+                    row["fromIdx"] += loi[i]
+                rows += _rows
+
+        if withPaths:
+            return distances, GeoDataFrame(rows, columns=[
+                "fromIdx", "toIdx", "fromPoint", "toPoint", "path", "pathLen",
+                "geometry"], geometry="geometry", crs=roads.crs)
+        return distances
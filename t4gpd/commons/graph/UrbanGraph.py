@@ -20,11 +20,15 @@ GNU General Public License for more details.
 You should have received a copy of the GNU General Public License
 along with t4gpd.  If not, see <https://www.gnu.org/licenses/>.
 '''
-from copy import deepcopy
-from geopandas import GeoDataFrame, sjoin_nearest
-from networkx import betweenness_centrality, closeness_centrality, degree_centrality, DiGraph, NetworkXNoPath, shortest_path, to_numpy_array
-from scipy.sparse.csgraph import minimum_spanning_tree
-from shapely import delaunay_triangles, LineString, MultiPoint, Point
+from heapq import heappop, heappush
+from itertools import count
+from multiprocessing import cpu_count, Pool
+from geopandas import GeoDataFrame
+from networkx import betweenness_centrality, closeness_centrality, degree_centrality, to_scipy_sparse_array
+from numpy import arange, argsort, array, array_split, bincount, concatenate, cumsum, diff, divide, flatnonzero, inf, isin, maximum, ones, repeat, sqrt, zeros
+from numpy.random import default_rng
+from scipy.sparse.csgraph import connected_components, dijkstra, minimum_spanning_tree
+from shapely import delaunay_triangles, length, linestrings, LineString, MultiPoint, Point, points, STRtree
 from shapely.ops import nearest_points
 from t4gpd.commons.ArrayCoding import ArrayCoding
 from t4gpd.commons.IllegalArgumentTypeException import IllegalArgumentTypeException
@@ -37,12 +41,18 @@ class UrbanGraph(object):
     '''
 
     def __init__(self, ciVertices=None, icVertices=None, edges=None,
-                 nx_graph=None, dk_graph=None, gdfOfBipoints=None, crs=None):
+                 nx_graph=None, dk_graph=None, gdfOfBipoints=None, crs=None,
+                 coords=None, bipoints=None, csr_graph=None):
         '''
         Constructor
         '''
-        if not ((ciVertices is None) or (icVertices is None) or
-                (nx_graph is None) or (gdfOfBipoints is None)):
+        if not ((coords is None) or (bipoints is None) or (csr_graph is None)):
+            # Integer vertex ids, (n, 2) array of coordinates, (m, 2) array
+            # of bipoints vertex ids and sparse matrix of edge lengths
+            self.method = "csr"
+
+        elif not ((ciVertices is None) or (icVertices is None) or
+                  (nx_graph is None) or (gdfOfBipoints is None)):
             self.method = "networkx"
 
         elif not ((ciVertices is None) or (icVertices is None) or
@@ -64,6 +74,10 @@ class UrbanGraph(object):
         self.dk_graph = dk_graph
         self.gdfOfBipoints = gdfOfBipoints
         self.crs = crs
+        self.coords = coords
+        self.bipoints = bipoints
+        self.csr_graph = csr_graph
+        self._bipointsTree = None
 
     def __str__(self) -> str:
         if self.method is None:
@@ -76,97 +90,122 @@ class UrbanGraph(object):
 {edges}
 """
 
-    def __get_next_vertex(self, prev, curr):
-        succ = list(self.edges[curr])
-        if 2 == len(succ):
-            if (prev == succ[0]) and not (prev == succ[1]):
-                return succ[1]
-            elif (prev == succ[1]) and not (prev == succ[0]):
-                return succ[0]
-        return None
-
-    def __burn_edge(self, idx1, idx2, burnedEdges):
-        minIdx = min(idx1, idx2)
-        maxidx = max(idx1, idx2)
-        if minIdx in burnedEdges:
-            burnedEdges[minIdx].add(maxidx)
+    def __edges_array(self):
+        # Coordinates and (m, 2) array of the undirected edges
+        if ("csr" == self.method):
+            return self.coords, self.bipoints
+        if ("networkx" == self.method):
+            edges = [(u, v) for u, v in self.nx_graph.edges() if (u < v)]
         else:
-            burnedEdges[minIdx] = set({maxidx})
-
-    def __build_road_section(self, vertexIndex, nextVertexIndex, burnedEdges):
-        result = []
-
-        prevIdx = vertexIndex
-        result.append(self.icVertices[prevIdx])
-        currIdx = nextVertexIndex
-        result.append(self.icVertices[currIdx])
-        self.__burn_edge(prevIdx, currIdx, burnedEdges)
-
-        nextIdx = self.__get_next_vertex(prevIdx, currIdx)
-        while nextIdx is not None:
-            result.append(self.icVertices[nextIdx])
-            prevIdx = currIdx
-            currIdx = nextIdx
-            self.__burn_edge(prevIdx, currIdx, burnedEdges)
-
-            if (nextIdx == vertexIndex):
-                # current road section is a loop, stop the process
-                nextIdx = None
-            else:
-                nextIdx = self.__get_next_vertex(prevIdx, currIdx)
+            edges = [(k1, k2) for k1, v1 in self.edges.items() for k2 in v1 if (k1 < k2)]
+        return self.__coords_array(), array(edges, dtype=int).reshape(-1, 2)
 
-        return LineString(result)
+    @staticmethod
+    def _roads_sections(nvertices, edges):
+        '''
+        Degree-based chain collapsing: every chain of degree-2 vertices is
+        walked once, through an array adjacency (incident edges of each
+        vertex), from a vertex whose degree is not 2. Isolated cycles are
+        walked last.
+        :return: list of arrays of vertex ids, and the vertex degrees
+        '''
+        degrees = bincount(edges.reshape(-1), minlength=nvertices)
+        indptr = concatenate([[0], cumsum(degrees)])
+        incidentEdges = repeat(arange(len(edges)), 2)[
+            argsort(edges.reshape(-1), kind="stable")]
+        visited = zeros(len(edges), dtype=bool)
+
+        def _walk(v, e):
+            path = [v]
+            while True:
+                visited[e] = True
+                a, b = edges[e]
+                v = b if (a == v) else a
+                path.append(v)
+                if (2 != degrees[v]):
+                    return path
+                e1, e2 = incidentEdges[indptr[v]:indptr[v] + 2]
+                e = e2 if (e1 == e) else e1
+                if visited[e]:
+                    # Cycle
+                    return path
+
+        sections = []
+        for v in flatnonzero(2 != degrees):
+            for e in incidentEdges[indptr[v]:indptr[v + 1]]:
+                if not visited[e]:
+                    sections.append(_walk(v, e))
+        for e in flatnonzero(~visited):
+            if not visited[e]:
+                sections.append(_walk(edges[e, 0], e))
+        return sections, degrees
+
+    @staticmethod
+    def _prune_cul_de_sacs(nvertices, edges):
+        # Vectorized passes: the edges that have a degree-1 end are removed
+        # until there are no more
+        alive = ones(len(edges), dtype=bool)
+        while True:
+            degrees = bincount(edges[alive].reshape(-1), minlength=nvertices)
+            deadEnds = alive & ((1 == degrees[edges[:, 0]]) | (1 == degrees[edges[:, 1]]))
+            if not deadEnds.any():
+                return edges[alive]
+            alive &= ~deadEnds
+
+    def __fromSectionsToGeoDataFrame(self, coords, sections):
+        if (0 == len(sections)):
+            return GeoDataFrame(columns=["geometry", "gid", "distance"],
+                                geometry="geometry", crs=self.crs)
+        geoms = linestrings(
+            coords[concatenate(sections)],
+            indices=repeat(arange(len(sections)), [len(sec) for sec in sections]))
+        return GeoDataFrame({
+            "geometry": geoms,
+            "gid": range(len(sections)),
+            "distance": length(geoms)
+        }, crs=self.crs)
 
     def getUniqueRoadsSections(self):
-        if (self.method in [None, "dijkstar"]):
-            rows = []
-            burnedEdges = dict()
-            for vertexIndex in list(self.edges.keys()):
-                nbConnectedVertices = len(self.edges[vertexIndex])
-                if (2 != nbConnectedVertices):
-                    # current vertex is a "boundary" of a "road section"
-                    for nextVertexIndex in self.edges[vertexIndex]:
-                        minIdx = min(vertexIndex, nextVertexIndex)
-                        maxIdx = max(vertexIndex, nextVertexIndex)
-                        if not (minIdx in burnedEdges and (maxIdx in burnedEdges[minIdx])):
-                            geom = self.__build_road_section(
-                                vertexIndex, nextVertexIndex, burnedEdges)
-                            rows.append({
-                                "geometry": geom,
-                                "gid": len(rows),
-                                "distance": geom.length
-                            })
-            return GeoDataFrame(rows, crs=self.crs)
+        if (self.method in [None, "dijkstar", "csr"]):
+            coords, edges = self.__edges_array()
+            sections, _ = UrbanGraph._roads_sections(len(coords), edges)
+            return self.__fromSectionsToGeoDataFrame(coords, sections)
         raise NotImplementedError(
             "Bad invocation of the UrbanGraph constructor, use UrbanGraphFactory.create(...)")
 
     def getUniqueRoadsSectionsNodes(self):
-        if (self.method in [None, "dijkstar"]):
-            rows = []
-            for k, v in self.edges.items():
-                nbConnectedVertices = len(v)
-                if (2 != nbConnectedVertices):
-                    rows.append({
-                        "gid": k,
-                        "valency": nbConnectedVertices,
-                        # "nb_connections": nbConnectedVertices,
-                        "geometry": Point(self.icVertices[k]),
-                    })
-            return GeoDataFrame(rows, crs=self.crs)
+        if (self.method in [None, "dijkstar", "csr"]):
+            coords, edges = self.__edges_array()
+            degrees = bincount(edges.reshape(-1), minlength=len(coords))
+            nodes = flatnonzero((0 < degrees) & (2 != degrees))
+            return GeoDataFrame({
+                "gid": nodes,
+                "valency": degrees[nodes],
+                "geometry": points(coords[nodes]),
+            }, crs=self.crs)
         raise NotImplementedError(
             "Bad invocation of the UrbanGraph constructor, use UrbanGraphFactory.create(...)")
 
-    def getUniqueRoadsSectionsWithoutCulDeSac(self):
-        rs = self.getUniqueRoadsSections()
-        rows = []
-        for _, row in rs.iterrows():
-            _coords = list(row["geometry"].coords)
-            startHash = UrbanGraphVertex.hash_coord(_coords[0])
-            stopHash = UrbanGraphVertex.hash_coord(_coords[-1])
-            if ((1 < len(self.edges[self.ciVertices[startHash]])) and
-                    (1 < len(self.edges[self.ciVertices[stopHash]]))):
-                rows.append(row)
-        return GeoDataFrame(rows, crs=self.crs)
+    def getUniqueRoadsSectionsWithoutCulDeSac(self, iterative=False):
+        '''
+        :param iterative: if False, the sections ending with a degree-1
+            vertex are removed. Otherwise, degree-1 branches are pruned
+            iteratively (the branches of tree-like parts disappear) and the
+            remaining chains are collapsed again.
+        '''
+        if (self.method in [None, "dijkstar", "csr"]):
+            coords, edges = self.__edges_array()
+            if iterative:
+                edges = UrbanGraph._prune_cul_de_sacs(len(coords), edges)
+                sections, _ = UrbanGraph._roads_sections(len(coords), edges)
+                return self.__fromSectionsToGeoDataFrame(coords, sections)
+
+            sections, degrees = UrbanGraph._roads_sections(len(coords), edges)
+            keep = [(1 < degrees[sec[0]]) and (1 < degrees[sec[-1]])
+                    for sec in sections]
+            return self.__fromSectionsToGeoDataFrame(coords, sections)[keep]
+        raise NotImplementedError(
+            "Bad invocation of the UrbanGraph constructor, use UrbanGraphFactory.create(...)")
 
     def __fromGraphToGeoDataFrame1(self, nx_graph, centralities, label):
         rows = []
@@ -179,19 +218,157 @@ class UrbanGraph(object):
             })
         return GeoDataFrame(rows, crs=self.crs)
 
-    def betweenness_centrality(self):
-        if ("networkx" == self.method):
+    def __nvertices(self):
+        return len(self.coords) if ("csr" == self.method) else len(self.icVertices)
+
+    def __fromCentralitiesToGeoDataFrame(self, centralities, errors, label):
+        if ("csr" == self.method):
+            valencies = diff(self.csr_graph.indptr)
+        else:
+            valencies = [len(self.nx_graph.adj[nodeIndex])
+                         for nodeIndex in range(self.__nvertices())]
+        return GeoDataFrame({
+            "gid": range(self.__nvertices()),
+            "valency": valencies,
+            label: centralities,
+            f"{label}_err": errors,
+            "geometry": points(self.__coords_array())
+        }, crs=self.crs)
+
+    def _brandes(self, source, radius=None):
+        '''
+        Brandes' single-source step, bounded by radius
+        :return: dependencies and distances (dict) of the reached vertices
+        '''
+        S, P, D, sigma, seen = [], {source: []}, {}, {source: 1.0}, {source: 0.0}
+        c = count()
+        heap = [(0.0, next(c), source, source)]
+        while heap:
+            d, _, pred, v = heappop(heap)
+            if v in D:
+                continue
+            sigma[v] += sigma[pred] if (pred != v) else 0.0
+            S.append(v)
+            D[v] = d
+            for w, cost in self._neighbors({}, v):
+                vw_dist = d + cost
+                if (radius is not None) and (radius < vw_dist):
+                    continue
+                if (w not in D) and ((w not in seen) or (vw_dist < seen[w])):
+                    seen[w] = vw_dist
+                    heappush(heap, (vw_dist, next(c), v, w))
+                    sigma[w] = 0.0
+                    P[w] = [v]
+                elif (vw_dist == seen.get(w)):
+                    sigma[w] += sigma[v]
+                    P[w].append(v)
+
+        delta = dict.fromkeys(S, 0.0)
+        while S:
+            w = S.pop()
+            coeff = (1.0 + delta[w]) / sigma[w]
+            for v in P[w]:
+                delta[v] += sigma[v] * coeff
+        delta[source] = 0.0
+        return delta, D
+
+    @staticmethod
+    def _centralities_task(ug, pivots, radius, label):
+        # Sums (and sums of squares) of the per-pivot contributions
+        n = ug.__nvertices()
+        m, s, s2 = zeros(n), zeros(n), zeros(n)
+        for pivot in pivots:
+            delta, D = ug._brandes(pivot, radius)
+            idx = array([v for v in D if (v != pivot)], dtype=int)
+            if ("betweenness" == label):
+                m += 1.0
+                x = array([delta[v] for v in idx])
+            else:
+                # Only the reached vertices are counted
+                m[idx] += 1.0
+                x = array([D[v] for v in idx])
+            if (0 < len(idx)):
+                s[idx] += x
+                s2[idx] += x * x
+        if ("betweenness" == label):
+            # A pivot does not contribute to itself
+            m[pivots] -= 1.0
+        return m, s, s2
+
+    def __sampled_centralities(self, label, k, seed, radius, ncpus):
+        '''
+        Pivot sampling: the contribution of every vertex is averaged over k
+        randomly chosen source vertices (all vertices if k is None), with
+        the standard error of this mean as an error estimate.
+        '''
+        n = self.__nvertices()
+        if (k is None) or (n <= k):
+            pivots = arange(n)
+        else:
+            pivots = default_rng(seed).choice(n, size=k, replace=False)
+            pivots.sort()
+
+        ncpus = cpu_count() if ncpus is None else ncpus
+        chunks = [chunk for chunk in array_split(pivots, min(ncpus, len(pivots))) if len(chunk)]
+        if (1 >= len(chunks)):
+            m, s, s2 = UrbanGraph._centralities_task(self, pivots, radius, label)
+        else:
+            with Pool(processes=len(chunks)) as pool:
+                results = pool.starmap(UrbanGraph._centralities_task, [
+                    (self, chunk, radius, label) for chunk in chunks])
+            m, s, s2 = [sum(x) for x in zip(*results)]
+
+        # Number of pivots distinct from each vertex
+        kv = len(pivots) - isin(arange(n), pivots)
+        mean = divide(s, m, out=zeros(n), where=(0 < m))
+        var = divide(s2 - m * mean * mean, m - 1, out=zeros(n), where=(1 < m))
+        fpc = sqrt(maximum(n - 1 - kv, 0) / max(n - 2, 1))
+        se = sqrt(maximum(var, 0.0)) / sqrt(maximum(m, 1.0)) * fpc
+
+        if ("betweenness" == label):
+            scale = 1.0 / (n - 2) if (2 < n) else 0.0
+            return mean * scale, se * scale
+
+        # closeness = reached fraction / mean distance, as networkx does
+        # with wf_improved=True
+        reached = divide(m, kv, out=zeros(n), where=(0 < kv))
+        closeness = divide(reached, mean, out=zeros(n), where=(0 < mean))
+        err = divide(closeness * se, mean, out=zeros(n), where=(0 < mean))
+        return closeness, err
+
+    def betweenness_centrality(self, k=None, seed=None, radius=None, ncpus=1):
+        '''
+        Exact betweenness centrality, or its estimate:
+        :param k: number of sampled source pivots (all vertices if None)
+        :param seed: seed of the pivot sampling
+        :param radius: if set, only the shortest paths shorter than radius are
+            taken into account (local centrality)
+        :param ncpus: number of processes the pivots are split over (all
+            CPUs if None)
+        '''
+        if ("networkx" == self.method) and (k is None) and (radius is None) and (1 == ncpus):
             centralities = betweenness_centrality(
                 self.nx_graph, weight="weight")
             return self.__fromGraphToGeoDataFrame1(self.nx_graph, centralities, "betweenness")
+        if (self.method in ["networkx", "csr"]):
+            centralities, errors = self.__sampled_centralities(
+                "betweenness", k, seed, radius, ncpus)
+            return self.__fromCentralitiesToGeoDataFrame(centralities, errors, "betweenness")
         raise NotImplementedError(
             "Bad invocation of the UrbanGraph constructor, use UrbanGraphFactory.create(...)")
 
-    def closeness_centrality(self):
-        if ("networkx" == self.method):
+    def closeness_centrality(self, k=None, seed=None, radius=None, ncpus=1):
+        '''
+        Exact closeness centrality, or its estimate (see betweenness_centrality)
+        '''
+        if ("networkx" == self.method) and (k is None) and (radius is None) and (1 == ncpus):
             centralities = closeness_centrality(
                 self.nx_graph, distance="weight")
             return self.__fromGraphToGeoDataFrame1(self.nx_graph, centralities, "closeness")
+        if (self.method in ["networkx", "csr"]):
+            centralities, errors = self.__sampled_centralities(
+                "closeness", k, seed, radius, ncpus)
+            return self.__fromCentralitiesToGeoDataFrame(centralities, errors, "closeness")
         raise NotImplementedError(
             "Bad invocation of the UrbanGraph constructor, use UrbanGraphFactory.create(...)")
 
@@ -202,27 +379,51 @@ class UrbanGraph(object):
         raise NotImplementedError(
             "Bad invocation of the UrbanGraph constructor, use UrbanGraphFactory.create(...)")
 
-    def __fromGraphToGeoDataFrame2(self, nx_graph):
-        rows = []
-        for nodeIndex1, v1 in nx_graph.adj.items():
-            for nodeIndex2, v2 in v1.items():
-                rows.append({
-                    "from": nodeIndex1,
-                    "to": nodeIndex2,
-                    "weight": v2["weight"],
-                    "geometry": LineString([self.icVertices[nodeIndex1], self.icVertices[nodeIndex2]]),
-                })
-        return GeoDataFrame(rows, crs=self.crs)
+    def __sparse_graph(self):
+        if ("csr" == self.method):
+            return self.csr_graph
+        return to_scipy_sparse_array(
+            self.nx_graph, nodelist=range(len(self.icVertices)),
+            weight="weight", format="csr")
+
+    def __coords_array(self):
+        if ("csr" == self.method):
+            return self.coords
+        return array([self.icVertices[nodeIndex][0:2]
+                      for nodeIndex in range(len(self.icVertices))])
+
+    def __fromGraphToGeoDataFrame2(self, matrix):
+        matrix = matrix.tocsr()
+        matrix.sort_indices()
+        matrix = matrix.tocoo()
+        _coords = self.__coords_array()
+        return GeoDataFrame({
+            "from": matrix.row,
+            "to": matrix.col,
+            "weight": matrix.data,
+            "geometry": linestrings(
+                _coords[array([matrix.row, matrix.col]).T])
+        }, crs=self.crs)
 
     def minimum_spanning_tree(self):
-        if ("networkx" == self.method):
-            matrix = to_numpy_array(self.nx_graph)
-            mst = minimum_spanning_tree(matrix)
-            mst = DiGraph(mst.toarray())
+        if (self.method in ["networkx", "csr"]):
+            mst = minimum_spanning_tree(self.__sparse_graph())
             return self.__fromGraphToGeoDataFrame2(mst)
         raise NotImplementedError(
             "Bad invocation of the UrbanGraph constructor, use UrbanGraphFactory.create(...)")
 
+    def connected_components(self):
+        if (self.method in ["networkx", "csr"]):
+            _, labels = connected_components(
+                self.__sparse_graph(), directed=False)
+            return GeoDataFrame({
+                "gid": range(len(labels)),
+                "component": labels,
+                "geometry": points(self.__coords_array())
+            }, crs=self.crs)
+        raise NotImplementedError(
+            "Bad invocation of the UrbanGraph constructor, use UrbanGraphFactory.create(...)")
+
     def delaunay_triangulation(self):
         if (self.method in [None, "dijkstar"]):
             mpt = MultiPoint(list(self.icVertices.values()))
@@ -237,53 +438,92 @@ class UrbanGraph(object):
         raise NotImplementedError(
             "Bad invocation of the UrbanGraph constructor, use UrbanGraphFactory.create(...)")
 
-    def __spaths_to_lineString(self, spaths):
-        if 2 <= len(spaths):
-            return LineString([
-                self.icVertices[nodeIndex] for nodeIndex in spaths
-            ])
-        return None
-
-    def __fromGraphToGeoDataFrame3(self, spaths, source, target):
+    def __fromGraphToGeoDataFrame3(self, spaths, coords):
         rows = []
-
-        if (source is None) and (target is None):
-            raise NotImplementedError("")
-
-        elif (source is None) or (target is None):
-            for spath in spaths.values():
-                ls = self.__spaths_to_lineString(spath)
-                if not ls is None:
-                    rows.append({
-                        "fromPoint": Point(self.icVertices[spath[0]]).wkt,
-                        "toPoint": Point(self.icVertices[spath[-1]]).wkt,
-                        "path": ArrayCoding.encode(spath),
-                        "pathLen": ls.length,
-                        "geometry": ls
-                    })
-        else:
-            ls = self.__spaths_to_lineString(spaths)
-            if not ls is None:
+        for spath in spaths:
+            if 2 <= len(spath):
+                ls = LineString([
+                    coords[nodeIndex] if nodeIndex in coords else self.icVertices[nodeIndex]
+                    for nodeIndex in spath
+                ])
                 rows.append({
-                    "fromPoint": Point(self.icVertices[spaths[0]]).wkt,
-                    "toPoint": Point(self.icVertices[spaths[-1]]).wkt,
-                    "path": ArrayCoding.encode(spaths),
+                    "fromPoint": Point(ls.coords[0]).wkt,
+                    "toPoint": Point(ls.coords[-1]).wkt,
+                    "path": ArrayCoding.encode(spath),
                     "pathLen": ls.length,
                     "geometry": ls
                 })
-
         return GeoDataFrame(rows, crs=self.crs)
 
-    def __add_two_new_edges(self, id1, id2):
-        ls = LineString([self.icVertices[id1][0:2], self.icVertices[id2][0:2]])
-        self.nx_graph.add_edge(id1, id2, weight=ls.length, object={
-            "geometry": ls, "weight": ls.length})
-
-        ls = LineString([self.icVertices[id2][0:2], self.icVertices[id1][0:2]])
-        self.nx_graph.add_edge(id2, id1, weight=ls.length, object={
-            "geometry": ls, "weight": ls.length})
+    def _bipoints_tree(self):
+        # Built once, on the first query
+        if self._bipointsTree is None:
+            if ("csr" == self.method):
+                self._bipointsTree = STRtree(
+                    linestrings(self.coords[self.bipoints]))
+            else:
+                self._bipointsTree = STRtree(
+                    self.gdfOfBipoints.geometry.values)
+        return self._bipointsTree
 
-    def _add_new_point(self, pt):
+    def __csr_snap(self, pt):
+        if not isinstance(pt, Point):
+            raise IllegalArgumentTypeException(pt, "Point")
+        tree = self._bipoints_tree()
+        bipointIdx = tree.nearest(pt)
+        _, rp = nearest_points(pt, tree.geometries[bipointIdx])
+        ends = self.bipoints[bipointIdx]
+        d0 = pt.distance(rp)
+        offsets = [d0 + rp.distance(Point(self.coords[end])) for end in ends]
+        return bipointIdx, rp, ends, offsets
+
+    def __csr_shortest_path(self, sourcePt, targetPt):
+        sBipointIdx, sRp, sEnds, sOffsets = self.__csr_snap(sourcePt)
+        tBipointIdx, tRp, tEnds, tOffsets = self.__csr_snap(targetPt)
+
+        # A path leaves the source bipoint and reaches the target one
+        # through their ends
+        dist, pred = dijkstra(self.csr_graph, indices=sEnds,
+                              return_predecessors=True)
+        best, spath = inf, None
+        for k in range(2):
+            for l in range(2):
+                d = sOffsets[k] + dist[k, tEnds[l]] + tOffsets[l]
+                if (d < best):
+                    best, spath = d, [tEnds[l]]
+                    while (0 <= pred[k, spath[-1]]):
+                        spath.append(pred[k, spath[-1]])
+                    spath = spath[::-1]
+
+        if (sBipointIdx == tBipointIdx):
+            d = sourcePt.distance(sRp) + sRp.distance(tRp) + tRp.distance(targetPt)
+            if (d <= best):
+                best, spath = d, []
+
+        if (inf == best):
+            print("No path between the source and the target.")
+            return GeoDataFrame()
+
+        _coords = [sourcePt.coords[0][0:2], sRp.coords[0][0:2]]
+        _coords += [tuple(self.coords[nodeIndex]) for nodeIndex in spath]
+        _coords += [tRp.coords[0][0:2], targetPt.coords[0][0:2]]
+        _coords = [c for i, c in enumerate(_coords) if (0 == i) or (c != _coords[i - 1])]
+        ls = LineString(_coords)
+        return GeoDataFrame([{
+            "fromPoint": sourcePt.wkt,
+            "toPoint": targetPt.wkt,
+            "path": ArrayCoding.encode([int(nodeIndex) for nodeIndex in spath]),
+            "pathLen": ls.length,
+            "geometry": ls
+        }], crs=self.crs)
+
+    def _snap(self, pt, overlay, coords):
+        '''
+        Snap pt onto its nearest bipoint. pt and its projection become
+        virtual vertices (numbered from len(self.icVertices)) whose edges are
+        only stored in the query-local overlay and coords dicts: the graph
+        itself is neither copied nor modified.
+        '''
         if pt is None:
             return None
         if not isinstance(pt, Point):
@@ -291,28 +531,90 @@ class UrbanGraph(object):
         str_coord = UrbanGraphVertex.hash_coord(pt.coords[0])
         if str_coord in self.ciVertices:
             return self.ciVertices[str_coord]
+        for idx, _coords in coords.items():
+            if str_coord == UrbanGraphVertex.hash_coord(_coords):
+                return idx
+
+        bipointIdx = self._bipoints_tree().nearest(pt)
+        bipoint = self.gdfOfBipoints.geometry.values[bipointIdx]
+        _, rp = nearest_points(pt, bipoint)
+        id1 = len(self.icVertices) + len(coords)
+        coords[id1] = pt.coords[0][0:2]
 
-        tmp = sjoin_nearest(GeoDataFrame([{"geometry": pt}], crs=self.crs),
-                            self.gdfOfBipoints)
-
-        if (0 < len(tmp)):
-            # CAUTION WITH THE 2 FOLLOWING iat[]
-            bipoint = self.gdfOfBipoints.iat[tmp.iat[0, 1], 1]
-            _, rp = nearest_points(pt, bipoint)
-            id1 = UrbanGraphVertex.add_vertex(
-                self.ciVertices, self.icVertices, pt.coords[0])
-            id2 = UrbanGraphVertex.add_vertex(
-                self.ciVertices, self.icVertices, rp.coords[0])
-            id3 = self.ciVertices[UrbanGraphVertex.hash_coord(
-                bipoint.coords[0])]
-            id4 = self.ciVertices[UrbanGraphVertex.hash_coord(
-                bipoint.coords[-1])]
-            self.__add_two_new_edges(id1, id2)
-            self.__add_two_new_edges(id2, id3)
-            self.__add_two_new_edges(id2, id4)
-
-            return id1
-        raise Exception("Unreachable instruction!")
+        str_coord = UrbanGraphVertex.hash_coord(rp.coords[0])
+        if str_coord in self.ciVertices:
+            # pt is projected onto one of the bipoint ends
+            id2 = self.ciVertices[str_coord]
+            edges = [(id1, id2, pt.distance(rp))]
+        else:
+            id2 = id1 + 1
+            coords[id2] = rp.coords[0][0:2]
+            id3 = self.ciVertices[UrbanGraphVertex.hash_coord(bipoint.coords[0])]
+            id4 = self.ciVertices[UrbanGraphVertex.hash_coord(bipoint.coords[-1])]
+            edges = [
+                (id1, id2, pt.distance(rp)),
+                (id2, id3, rp.distance(Point(bipoint.coords[0]))),
+                (id2, id4, rp.distance(Point(bipoint.coords[-1]))),
+            ]
+            # Two projections on the same bipoint are directly connected
+            for idx in set(overlay.get(id3, {})).intersection(overlay.get(id4, {})):
+                edges.append((id2, idx, rp.distance(Point(coords[idx]))))
+
+        for idx1, idx2, w in edges:
+            overlay.setdefault(idx1, {})[idx2] = w
+            overlay.setdefault(idx2, {})[idx1] = w
+        return id1
+
+    def _neighbors(self, overlay, u):
+        if ("csr" == self.method):
+            start, stop = self.csr_graph.indptr[u:u + 2]
+            yield from zip(self.csr_graph.indices[start:stop].tolist(),
+                           self.csr_graph.data[start:stop].tolist())
+        elif u in self.nx_graph:
+            for v, attr in self.nx_graph.adj[u].items():
+                yield v, attr["weight"]
+        if u in overlay:
+            yield from overlay[u].items()
+
+    def _dijkstra(self, overlay, source, cutoff=None, target=None, targets=None):
+        '''
+        Single-source Dijkstra on the graph and the query-local overlay,
+        bounded by cutoff and stopped as soon as target (or every vertex of
+        the targets collection) is reached.
+        :return: dist, pred dictionaries
+        '''
+        remaining = None if targets is None else set(targets)
+        dist, pred, seen = {}, {source: None}, {source: 0.0}
+        c = count()
+        heap = [(0.0, next(c), source)]
+        while heap:
+            d, _, u = heappop(heap)
+            if u in dist:
+                continue
+            dist[u] = d
+            if (u == target):
+                break
+            if remaining is not None:
+                remaining.discard(u)
+                if (0 == len(remaining)):
+                    break
+            for v, w in self._neighbors(overlay, u):
+                vd = d + w
+                if ((cutoff is not None) and (cutoff < vd)) or (v in dist):
+                    continue
+                if (v not in seen) or (vd < seen[v]):
+                    seen[v] = vd
+                    pred[v] = u
+                    heappush(heap, (vd, next(c), v))
+        return dist, pred
+
+    @staticmethod
+    def _path(pred, target):
+        spath = []
+        while target is not None:
+            spath.append(target)
+            target = pred[target]
+        return spath[::-1]
 
     def shortest_path(self, sourcePt=None, targetPt=None):
         if ("networkx" == self.method):
@@ -323,24 +625,32 @@ class UrbanGraph(object):
             if (sourcePt == targetPt):
                 return GeoDataFrame([])
 
-            ugClone = UrbanGraph(
-                ciVertices=deepcopy(self.ciVertices),
-                icVertices=deepcopy(self.icVertices),
-                nx_graph=deepcopy(self.nx_graph),
-                gdfOfBipoints=self.gdfOfBipoints.copy(deep=True),
-                crs=self.crs)
-            sourceIdx = ugClone._add_new_point(sourcePt)
-            targetIdx = ugClone._add_new_point(targetPt)
-
-            try:
-                sp = shortest_path(ugClone.nx_graph, source=sourceIdx,
-                                   target=targetIdx, weight="weight",
-                                   method="dijkstra")
-            except NetworkXNoPath as error:
-                print(error)
+            overlay, coords = {}, {}
+            sourceIdx = self._snap(sourcePt, overlay, coords)
+            targetIdx = self._snap(targetPt, overlay, coords)
+
+            if (sourceIdx is None) or (targetIdx is None):
+                # The graph is symmetric: paths to targetIdx are reversed
+                # paths from targetIdx
+                rootIdx = targetIdx if sourceIdx is None else sourceIdx
+                _, pred = self._dijkstra(overlay, rootIdx)
+                spaths = [UrbanGraph._path(pred, nodeIndex) for nodeIndex in pred]
+                if sourceIdx is None:
+                    spaths = [spath[::-1] for spath in spaths]
+                return self.__fromGraphToGeoDataFrame3(spaths, coords)
+
+            dist, pred = self._dijkstra(overlay, sourceIdx, target=targetIdx)
+            if not targetIdx in dist:
+                print(f"No path between {sourceIdx} and {targetIdx}.")
                 return GeoDataFrame()
 
-            return ugClone.__fromGraphToGeoDataFrame3(sp, sourceIdx, targetIdx)
+            spath = UrbanGraph._path(pred, targetIdx)
+            return self.__fromGraphToGeoDataFrame3([spath], coords)
+
+        elif ("csr" == self.method):
+            if (sourcePt == targetPt):
+                return GeoDataFrame([])
+            return self.__csr_shortest_path(sourcePt, targetPt)
 
         raise NotImplementedError(
             "Bad invocation of the UrbanGraph constructor, use UrbanGraphFactory.create(...)")
@@ -23,9 +23,14 @@ along with t4gpd.  If not, see <https://www.gnu.org/licenses/>.
 from dijkstar.graph import Graph
 from geopandas import GeoDataFrame, overlay
 from networkx import DiGraph
-from shapely import LineString, union_all
+from numpy import arange, concatenate, empty, hypot, isin, lexsort, maximum, minimum, ones, unique
+from scipy.sparse import coo_matrix
+from shapely import get_coordinates, linestrings, LineString, union_all
+from t4gpd.commons.Checksum import Checksum
 from t4gpd.commons.GeomLib import GeomLib
 from t4gpd.commons.IllegalArgumentTypeException import IllegalArgumentTypeException
+from t4gpd.commons.Memoizer import Memoizer
+from t4gpd.commons.graph.NodingLib import NodingLib
 from t4gpd.commons.graph.UrbanGraph import UrbanGraph
 from t4gpd.commons.graph.UrbanGraphVertex import UrbanGraphVertex
 from warnings import warn
@@ -37,15 +42,44 @@ class UrbanGraphFactory(object):
     '''
 
     @staticmethod
-    def create(roads, method=None):
+    def create(roads, method=None, tilesize=None):
+        '''
+        :param roads: GeoDataFrame of roads
+        :param method: None, 'networkx', 'dijkstar' or 'csr'
+        :param tilesize: if set, the roads are noded tile by tile (see
+            NodingLib) instead of through a global union_all
+        '''
         if not isinstance(roads, GeoDataFrame):
             raise IllegalArgumentTypeException(roads, "GeoDataFrame")
 
-        geometryCollection = union_all(roads.geometry)
-        listOfBipoints = GeomLib.toListOfBipointsAsLineStrings(
-            geometryCollection)
-        listOfBipoints = [GeomLib.removeZCoordinate(
-            bp) for bp in listOfBipoints]
+        # Noding is done once per road network
+        memo, fingerprint = Memoizer.shared(), Checksum.fingerprint(roads)
+        if tilesize is None:
+            geometryCollection = memo.get(
+                ("UrbanGraphFactory.union_all", fingerprint),
+                lambda: union_all(roads.geometry))
+        else:
+            bipoints = memo.get(
+                ("UrbanGraphFactory.node", fingerprint, tilesize),
+                lambda: NodingLib.node(
+                    NodingLib.bipoints(roads.geometry.values), tilesize)).copy()
+
+        if ("csr" == method):
+            # USEFUL FOR LARGE GRAPHS: NO PER-VERTEX PYTHON OBJECT
+            if tilesize is None:
+                bipoints = NodingLib.bipoints(geometryCollection)
+            coords, bipoints, csr_graph = UrbanGraphFactory.__M4_build_graph(
+                bipoints)
+            return UrbanGraph(coords=coords, bipoints=bipoints,
+                              csr_graph=csr_graph, crs=roads.crs)
+
+        if tilesize is None:
+            listOfBipoints = GeomLib.toListOfBipointsAsLineStrings(
+                geometryCollection)
+            listOfBipoints = [GeomLib.removeZCoordinate(
+                bp) for bp in listOfBipoints]
+        else:
+            listOfBipoints = list(linestrings(bipoints))
 
         if method is None:
             ciVertices, icVertices, edges = UrbanGraphFactory.__M1_build_graph(
@@ -70,7 +104,7 @@ class UrbanGraphFactory(object):
                               edges=edges, dk_graph=dk_graph, crs=roads.crs)
 
         raise IllegalArgumentTypeException(
-            method, "None, 'networkx' or 'dijkstar'")
+            method, "None, 'networkx', 'dijkstar' or 'csr'")
 
     @ staticmethod
     def __M1_build_graph(listOfBipoints):
@@ -243,3 +277,102 @@ class UrbanGraphFactory(object):
                 edges[first][last] = edgeItem
         else:
             edges[first] = dict({last: edgeItem})
+
+    @staticmethod
+    def __M4_build_graph(bipoints):
+        # Vectorized deduplication of the bipoints ends
+        coords, inverse = unique(bipoints.reshape(-1, 2), axis=0, return_inverse=True)
+        bipoints = inverse.reshape(-1, 2)
+        bipoints = bipoints[bipoints[:, 0] != bipoints[:, 1]]
+        return coords, bipoints, UrbanGraphFactory.__M4_csr_graph(coords, bipoints)
+
+    @staticmethod
+    def __M4_csr_graph(coords, bipoints):
+        # Multigraph: only the shortest of the parallel edges is kept
+        first, last = bipoints[:, 0], bipoints[:, 1]
+        lo, hi = minimum(first, last), maximum(first, last)
+        weights = hypot(*(coords[first] - coords[last]).T)
+        order = lexsort((weights, hi, lo))
+        lo, hi, weights = lo[order], hi[order], weights[order]
+        keep = ones(len(lo), dtype=bool)
+        keep[1:] = (lo[1:] != lo[:-1]) | (hi[1:] != hi[:-1])
+        lo, hi, weights = lo[keep], hi[keep], weights[keep]
+
+        nvertices = len(coords)
+        return coo_matrix(
+            (concatenate([weights, weights]),
+             (concatenate([lo, hi]), concatenate([hi, lo]))),
+            shape=(nvertices, nvertices)).tocsr()
+
+    @staticmethod
+    def __M4_append(ug, bipoints, tilesize):
+        noded, cutIds, parts = NodingLib.node_against(
+            bipoints, ug.coords[ug.bipoints], ug._bipoints_tree(), tilesize)
+        newBipoints = concatenate([parts, noded])
+
+        # The ids of the existing vertices are kept, the new ones are appended
+        n = len(ug.coords)
+        _coords, first, inverse = unique(
+            concatenate([ug.coords, newBipoints.reshape(-1, 2)]), axis=0,
+            return_index=True, return_inverse=True)
+        isNew = n <= first
+        ids = empty(len(_coords), dtype=ug.bipoints.dtype)
+        ids[~isNew] = first[~isNew]
+        ids[isNew] = n + arange(isNew.sum())
+        newIds = ids[inverse.reshape(-1)[n:]].reshape(-1, 2)
+
+        keep = ones(len(ug.bipoints), dtype=bool)
+        keep[cutIds] = False
+        ug.coords = concatenate([ug.coords, _coords[isNew]])
+        ug.bipoints = concatenate([ug.bipoints[keep], newIds])
+        ug.csr_graph = UrbanGraphFactory.__M4_csr_graph(ug.coords, ug.bipoints)
+
+    @staticmethod
+    def __M2_append(ug, bipoints, tilesize):
+        others = get_coordinates(ug.gdfOfBipoints.geometry.values).reshape(-1, 2, 2)
+        noded, cutIds, parts = NodingLib.node_against(
+            bipoints, others, ug._bipoints_tree(), tilesize)
+
+        for first, last in others[cutIds]:
+            id1 = ug.ciVertices[UrbanGraphVertex.hash_coord(tuple(first))]
+            id2 = ug.ciVertices[UrbanGraphVertex.hash_coord(tuple(last))]
+            if ug.nx_graph.has_edge(id1, id2):
+                ug.nx_graph.remove_edge(id1, id2)
+                ug.nx_graph.remove_edge(id2, id1)
+
+        newBipoints = list(linestrings(concatenate([parts, noded])))
+        for linestring in newBipoints:
+            UrbanGraphFactory.__M2_add_linestring(
+                ug.ciVertices, ug.icVertices, ug.nx_graph, linestring)
+
+        listOfBipoints = list(ug.gdfOfBipoints.geometry.values[
+            ~isin(arange(len(others)), cutIds)]) + newBipoints
+        ug.gdfOfBipoints = GeoDataFrame(
+            {"gid": range(len(listOfBipoints)), "geometry": listOfBipoints}, crs=ug.crs)
+
+    @staticmethod
+    def append(ug, roads, tilesize=None):
+        '''
+        Append new roads to an existing "networkx" or "csr" UrbanGraph: the
+        new roads are noded against each other and against the existing
+        bipoints (only the crossed ones are split), without rebuilding the
+        whole graph.
+        :param ug: UrbanGraph created by UrbanGraphFactory.create(...)
+        :param roads: GeoDataFrame of the new roads
+        :param tilesize: the crossings are searched tile by tile
+        :return: the updated ug
+        '''
+        if not isinstance(roads, GeoDataFrame):
+            raise IllegalArgumentTypeException(roads, "GeoDataFrame")
+        bipoints = NodingLib.bipoints(roads.geometry.values)
+
+        if ("csr" == ug.method):
+            UrbanGraphFactory.__M4_append(ug, bipoints, tilesize)
+        elif ("networkx" == ug.method):
+            UrbanGraphFactory.__M2_append(ug, bipoints, tilesize)
+        else:
+            raise NotImplementedError(
+                "Only 'networkx' and 'csr' UrbanGraphs can be appended to")
+        # The spatial index of the bipoints is outdated
+        ug._bipointsTree = None
+        return ug
@@ -21,12 +21,13 @@ You should have received a copy of the GNU General Public License
 along with t4gpd.  If not, see <https://www.gnu.org/licenses/>.
 """
 from geopandas import GeoDataFrame, overlay, sjoin_nearest
-from numpy import ceil, gradient, linspace, ndarray, sqrt, zeros
+from numpy import ceil, gradient, linspace, maximum, minimum, ndarray, sqrt, zeros
 from shapely.geometry import box, LineString, MultiLineString
 from t4gpd.commons.ArrayCoding import ArrayCoding
 from t4gpd.commons.GeomLib import GeomLib
 from t4gpd.commons.IllegalArgumentTypeException import IllegalArgumentTypeException
 from t4gpd.commons.grid.AbstractGridLib import AbstractGridLib
+from t4gpd.commons.raster.DistanceTransformLib import DistanceTransformLib
 
 
 class GridLib(AbstractGridLib):
@@ -190,7 +191,10 @@ class GridLib(AbstractGridLib):
         return grid
 
     @staticmethod
-    def getDistanceToNearestContour(gdf, grid):
+    def getDistanceToNearestContour(gdf, grid, dx=None):
+        if dx is not None:
+            return GridLib.__getDistanceToNearestContourByEDT(gdf, grid, dx)
+
         gdf2 = gdf.copy(deep=True)
         gdf2.geometry = gdf2.geometry.apply(
             lambda geom: MultiLineString(GeomLib.toListOfLineStrings(geom))
@@ -211,6 +215,21 @@ class GridLib(AbstractGridLib):
         )
         return grid2
 
+    @staticmethod
+    def __getDistanceToNearestContourByEDT(gdf, grid, dx):
+        # Rasterize gdf once, then sample its Euclidean distance transform
+        minx, miny = minimum(gdf.total_bounds[:2], grid.total_bounds[:2])
+        maxx, maxy = maximum(gdf.total_bounds[2:], grid.total_bounds[2:])
+        roi = GeoDataFrame(geometry=[box(minx, miny, maxx, maxy)], crs=gdf.crs)
+        raster_data, raster_profile = DistanceTransformLib.distance_field(
+            gdf, dx, roi=roi
+        )
+        grid2 = grid.copy(deep=True)
+        grid2["dist_to_ctr"] = DistanceTransformLib.sample(
+            raster_data[0], raster_profile, grid2.geometry.centroid
+        )[0]
+        return grid2
+
     @staticmethod
     def fromGridToNumpyArray(
         gdf, fieldvalue, rowFieldname="row", colFieldname="column"
@@ -22,9 +22,22 @@ along with t4gpd.  If not, see <https://www.gnu.org/licenses/>.
 """
 
 from geopandas import GeoDataFrame
-from numpy import ceil, floor, sqrt
-from shapely import Polygon
-from shapely.affinity import translate
+from numpy import (
+    abs,
+    arange,
+    asarray,
+    ceil,
+    floor,
+    full,
+    repeat,
+    rint,
+    sqrt,
+    stack,
+    tile,
+    where,
+)
+from pandas import DataFrame
+from shapely import get_coordinates, polygons
 from t4gpd.commons.ArrayCoding import ArrayCoding
 from t4gpd.commons.grid.AbstractGridLib import AbstractGridLib
 
@@ -32,10 +45,17 @@ from t4gpd.commons.grid.AbstractGridLib import AbstractGridLib
 class HexagonalTilingLib(AbstractGridLib):
     """
     classdocs
+
+    Flat-topped hexagons, odd columns shifted up by half a hexagon. Cells are
+    indexed either by gid = row * ncols + column, or by axial coordinates
+    (q, r) with q = column and r = row - column // 2.
     """
 
     __slots__ = ("gdf", "dx", "dy", "minx", "miny", "ncols", "nrows")
 
+    # Axial offsets of the [ne, n, nw, sw, s, se] neighbors
+    NEIGHBORS6 = ((1, 0), (0, 1), (-1, 1), (-1, 0), (0, -1), (1, -1))
+
     def __init__(self, gdf, dx, dy=None, encode=True):
         """
         Constructor
@@ -51,35 +71,62 @@ class HexagonalTilingLib(AbstractGridLib):
         self.ncols = int(ceil((maxx - self.minx) / (1.5 * self.dx))) + 1
         self.nrows = int(floor((maxy - self.miny) / (2 * self.dy))) + 1
 
-    def __neighbors6(self, r, c):
-        _gid = r * self.ncols + c
-        if 0 == c % 2:
-            nw, ne = _gid - 1, _gid + 1
-            sw, se = nw - self.ncols, ne - self.ncols
-        else:
-            sw, se = _gid - 1, _gid + 1
-            nw, ne = sw + self.ncols, se + self.ncols
-
-        n = _gid + self.ncols
-        s = _gid - self.ncols
-
-        _na = -1
-        if 0 == c:
-            nw, sw = _na, _na
-        if 0 == r:
-            sw, s, se = _na, _na, _na
-        if self.ncols == c + 1:
-            ne, se = _na, _na
-        if self.nrows == r + 1:
-            if 0 == c % 2:
-                n = _na
-            else:
-                nw, n, ne = _na, _na, _na
-
-        return [ne, n, nw, sw, s, se]
-
-    def grid(self):
-        _hexagon = Polygon(
+    def axialCoordinates(self, gids):
+        """
+        :param gids: array of cell identifiers
+        :return: q, r arrays of axial coordinates
+        """
+        rows, cols = divmod(asarray(gids), self.ncols)
+        return cols, rows - cols // 2
+
+    def gids(self, q, r):
+        """
+        :param q, r: arrays of axial coordinates
+        :return: array of cell identifiers (-1 outside the tiling)
+        """
+        q, r = asarray(q), asarray(r)
+        rows = r + q // 2
+        inside = (0 <= q) & (q < self.ncols) & (0 <= rows) & (rows < self.nrows)
+        return where(inside, rows * self.ncols + q, -1)
+
+    def neighbors6(self, gids):
+        """
+        :param gids: array of cell identifiers
+        :return: (n, 6) array of the [ne, n, nw, sw, s, se] neighbors (-1 if none)
+        """
+        q, r = self.axialCoordinates(gids)
+        return stack(
+            [self.gids(q + dq, r + dr) for dq, dr in HexagonalTilingLib.NEIGHBORS6],
+            axis=-1,
+        )
+
+    def locate(self, points):
+        """
+        :param points: GeoSeries/GeoDataFrame of points or (n, 2) array of coordinates
+        :return: array of identifiers of the cells the points fall in (-1 outside)
+        """
+        if hasattr(points, "geometry"):
+            points = get_coordinates(points.geometry.values)
+        xy = asarray(points, dtype=float)
+        # Fractional axial coordinates, then cube rounding
+        fq = (xy[:, 0] - self.minx) / (1.5 * self.dx)
+        fr = (xy[:, 1] - self.miny) / (2 * self.dy) - fq / 2.0
+        fs = -fq - fr
+        q, r, s = rint(fq), rint(fr), rint(fs)
+        dq, dr, ds = abs(q - fq), abs(r - fr), abs(s - fs)
+        q = where((dq > dr) & (dq > ds), -r - s, q)
+        r = where(~((dq > dr) & (dq > ds)) & (dr > ds), -q - s, r)
+        return self.gids(q.astype(int), r.astype(int))
+
+    def grid(self, withAxialCoords=False):
+        # Same order as the former cell by cell loop: columns, then rows
+        cols = repeat(arange(self.ncols), self.nrows)
+        rows = tile(arange(self.nrows), self.ncols)
+        gids = rows * self.ncols + cols
+
+        xoff = self.minx + cols * (1.5 * self.dx)
+        yoff = self.miny + rows * (2 * self.dy) + (cols % 2) * self.dy
+        hexagon = asarray(
             [
                 (self.dx, 0),
                 (self.dx / 2, self.dy),
@@ -87,29 +134,44 @@ class HexagonalTilingLib(AbstractGridLib):
                 (-self.dx, 0),
                 (-self.dx / 2, -self.dy),
                 (self.dx / 2, -self.dy),
+                (self.dx, 0),
             ]
         )
+        vertices = hexagon[None, :, :] + stack([xoff, yoff], axis=-1)[:, None, :]
 
-        result = []
-        for c in range(self.ncols):
-            for r in range(self.nrows):
-                neighbors6 = self.__neighbors6(r, c)
-                if self.encode:
-                    neighbors6 = ArrayCoding.encode(neighbors6)
-
-                _xoff = self.minx + c * (1.5 * self.dx)
-
-                if 0 == c % 2:
-                    _yoff = self.miny + r * (2 * self.dy)
-                else:
-                    _yoff = self.miny + r * (2 * self.dy) + self.dy
-
-                result.append(
-                    {
-                        "gid": r * self.ncols + c,
-                        "neighbors6": neighbors6,
-                        "geometry": translate(_hexagon, xoff=_xoff, yoff=_yoff),
-                    }
-                )
-
-        return GeoDataFrame(result, crs=self.gdf.crs)
+        neighbors6 = self.neighbors6(gids).tolist()
+        if self.encode:
+            neighbors6 = [ArrayCoding.encode(nghbs) for nghbs in neighbors6]
+
+        result = GeoDataFrame(
+            {"gid": gids, "neighbors6": neighbors6, "geometry": polygons(vertices)},
+            crs=self.gdf.crs,
+        )
+        if withAxialCoords:
+            result["q"], result["r"] = self.axialCoordinates(gids)
+        return result
+
+    def hexbin(self, points, fieldname=None, aggfunc="mean"):
+        """
+        Aggregate (point) measurements per hexagon
+        :param points: GeoDataFrame of points
+        :param fieldname: field name of the values to aggregate (count only if None)
+        :param aggfunc: pandas aggregation function name
+        :return: GeoDataFrame of the non-empty hexagons with a "count" field
+            (and the aggregated fieldname)
+        """
+        gids = self.locate(points)
+        df = DataFrame({"gid": gids})
+        if fieldname is not None:
+            df[fieldname] = points[fieldname].values
+        df = df[0 <= df.gid]
+
+        groups = df.groupby("gid")
+        stats = groups.size().to_frame("count")
+        if fieldname is not None:
+            stats[fieldname] = groups[fieldname].agg(aggfunc)
+
+        _grid = self.grid()
+        result = _grid.merge(stats, left_on="gid", right_index=True, how="inner")
+        result.reset_index(drop=True, inplace=True)
+        return result
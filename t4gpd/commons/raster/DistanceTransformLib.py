@@ -0,0 +1,137 @@
+"""
+Created on 19 Oct. 2026
+
+@author: tleduc
+
+Copyright 2020-2026 Thomas Leduc
+
+This file is part of t4gpd.
+
+t4gpd is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+t4gpd is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with t4gpd.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import numpy as np
+from geopandas import GeoDataFrame, GeoSeries
+from rasterio import float64
+from scipy.ndimage import distance_transform_edt, map_coordinates
+from shapely import get_coordinates
+from t4gpd.commons.IllegalArgumentTypeException import IllegalArgumentTypeException
+from t4gpd.commons.raster.RasterLib import RasterLib
+
+
+class DistanceTransformLib(object):
+    """
+    classdocs
+    """
+
+    @staticmethod
+    def distance_field(gdf, dx, roi=None, withNearest=False, contour=True):
+        """
+        Rasterize the polygons once and compute the exact Euclidean distance
+        transform to their contours, and its gradient.
+        :param gdf: GeoDataFrame of polygons (e.g. buildings)
+        :param dx: pixel size
+        :param roi: region of interest (gdf by default)
+        :param withNearest: if True, two more bands give the x and y
+            coordinates of the nearest contour pixel
+        :param contour: if True, inner pixels get their distance to the
+            contour, otherwise their distance to the polygons (i.e. 0)
+        :return: raster_data, raster_profile; raster_data is a float64 array
+            whose bands are: distance, grad_x, grad_y (, nearest_x, nearest_y)
+        """
+        if not isinstance(gdf, GeoDataFrame):
+            raise IllegalArgumentTypeException(gdf, "GeoDataFrame")
+
+        mask, raster_profile = RasterLib.rasterize(gdf, dx, roi=roi, attr=None, ndv=0)
+        # One pixel wide outer margin, so that contours lying on the roi
+        # boundary are seen by the inner distance transform
+        inside = np.pad(1 == mask, 1, constant_values=False)
+        crop = (slice(1, -1), slice(1, -1))
+
+        # Distances between pixel centres: the contour lies half a pixel away
+        dist_out, (rows_out, cols_out) = distance_transform_edt(
+            ~inside, sampling=dx, return_indices=True
+        )
+        if contour:
+            dist_in, (rows_in, cols_in) = distance_transform_edt(
+                inside, sampling=dx, return_indices=True
+            )
+        else:
+            dist_in = np.zeros(inside.shape)
+            rows_in, cols_in = np.indices(inside.shape)
+        dist = np.where(inside, dist_in, dist_out)[crop]
+        dist = np.maximum(dist - dx / 2.0, 0.0)
+
+        # Rows are ordered from north to south
+        grad_row, grad_col = np.gradient(dist, dx)
+        bands = [dist, grad_col, -grad_row]
+
+        if withNearest:
+            rows = np.where(inside, rows_in, rows_out)[crop] - 1
+            cols = np.where(inside, cols_in, cols_out)[crop] - 1
+            nearest_x, nearest_y = raster_profile["transform"] * (cols + 0.5, rows + 0.5)
+            bands += [nearest_x, nearest_y]
+
+        raster_data = np.stack(bands).astype(float64, copy=False)
+        raster_profile = raster_profile.copy()
+        raster_profile.update({"count": len(bands), "dtype": float64, "nodata": None})
+        return raster_data, raster_profile
+
+    @staticmethod
+    def sample(raster_data, raster_profile, points, order=1):
+        """
+        Sample every band of a raster at the given locations.
+        :param raster_data: (count, height, width) or (height, width) array
+        :param raster_profile: raster profile (its transform is used)
+        :param points: GeoSeries/GeoDataFrame of points or (n, 2) array of coordinates
+        :param order: 0 for nearest pixel, 1 for bilinear interpolation
+        :return: (count, n) array (NaN outside the raster)
+        """
+        if isinstance(points, (GeoDataFrame, GeoSeries)):
+            points = get_coordinates(points.geometry.values)
+        xy = np.asarray(points, dtype=float)[:, :2]
+        cols, rows = ~raster_profile["transform"] * (xy[:, 0], xy[:, 1])
+        # map_coordinates works on pixel centres
+        coords = np.vstack([rows - 0.5, cols - 0.5])
+
+        raster_data = raster_data if 3 == raster_data.ndim else raster_data[None, ...]
+        return np.array(
+            [
+                map_coordinates(band, coords, order=order, mode="constant", cval=np.nan)
+                for band in raster_data
+            ]
+        )
+
+    @staticmethod
+    def test():
+        import matplotlib.pyplot as plt
+        from rasterio.plot import show
+        from t4gpd.demos.GeoDataFrameDemos import GeoDataFrameDemos
+
+        buildings = GeoDataFrameDemos.ensaNantesBuildings()
+        raster_data, raster_profile = DistanceTransformLib.distance_field(
+            buildings, dx=1
+        )
+
+        # PLOTTING
+        fig, ax = plt.subplots(figsize=(10, 10))
+        show(raster_data[0], ax=ax, transform=raster_profile["transform"])
+        buildings.boundary.plot(ax=ax, edgecolor="red")
+        ax.axis("off")
+        fig.tight_layout()
+        plt.show()
+        plt.close(fig)
+
+
+# DistanceTransformLib.test()
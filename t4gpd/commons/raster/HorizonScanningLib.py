@@ -0,0 +1,196 @@
+"""
+Created on 19 Oct. 2026
+
+@author: tleduc
+
+Copyright 2020-2026 Thomas Leduc
+
+This file is part of t4gpd.
+
+t4gpd is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+t4gpd is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with t4gpd.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import numpy as np
+from geopandas import GeoDataFrame
+from t4gpd.commons.IllegalArgumentTypeException import IllegalArgumentTypeException
+from t4gpd.commons.raster.RasterLib import RasterLib
+
+
+class HorizonScanningLib(object):
+    """
+    classdocs
+
+    Raster counterpart of the 2.5D ray casters: horizon angles are obtained,
+    for every pixel of a Digital Surface Model (DSM) at once, by scanning the
+    DSM along nRays azimuths (counted counterclockwise from the East, as the
+    panoptic rays of RayCasting3Lib).
+    """
+
+    @staticmethod
+    def dsm(buildings, dx, elevationFieldname="HAUTEUR", roi=None, ndv=0):
+        """
+        Build a Digital Surface Model from the buildings' heights
+        :param buildings: GeoDataFrame of building footprints
+        :param dx: pixel size
+        :param elevationFieldname: field name of the buildings' heights
+        :param roi: region of interest (buildings by default)
+        :param ndv: ground value
+        :return: raster_data, raster_profile (2D float32 raster_data)
+        """
+        if not isinstance(buildings, GeoDataFrame):
+            raise IllegalArgumentTypeException(buildings, "GeoDataFrame")
+        if not elevationFieldname in buildings:
+            raise Exception(f"{elevationFieldname} is not a relevant field name!")
+
+        _buildings = buildings[[elevationFieldname, "geometry"]].copy()
+        _buildings[elevationFieldname] = _buildings[elevationFieldname].astype(
+            np.float32
+        )
+        return RasterLib.rasterize(
+            _buildings, dx, roi=roi, attr=elevationFieldname, ndv=ndv
+        )
+
+    @staticmethod
+    def __offsets(azimuth, dx, maxDist):
+        # Pixel offsets (drow, dcol) met along the azimuth, without duplicates
+        ux, uy = np.cos(azimuth), np.sin(azimuth)
+        offsets = []
+        for d in np.arange(dx, maxDist + dx / 2.0, dx):
+            # Rows are ordered from north to south
+            offset = (-int(round(d * uy / dx)), int(round(d * ux / dx)))
+            if (offset != (0, 0)) and ((0 == len(offsets)) or (offset != offsets[-1])):
+                offsets.append(offset)
+        return offsets
+
+    @staticmethod
+    def __maxTangent(padded, pad, z0, offsets, dx):
+        # Max of (z - z0) / d over the scanned pixels, i.e. tan(horizon angle)
+        nrows, ncols = z0.shape
+        result = np.zeros((nrows, ncols), dtype=np.float32)
+        for dr, dc in offsets:
+            shifted = padded[pad + dr : pad + dr + nrows, pad + dc : pad + dc + ncols]
+            np.maximum(result, (shifted - z0) / (dx * np.hypot(dr, dc)), out=result)
+        return result
+
+    @staticmethod
+    def __blocks(dsm, dx, maxDist, h0, blocksize):
+        pad = int(np.ceil(maxDist / dx)) + 1
+        # Beyond the DSM, nothing masks the sky
+        padded = np.pad(dsm.astype(np.float32), pad, constant_values=-np.inf)
+        nrows, ncols = dsm.shape
+        for window in RasterLib.block_windows(nrows, ncols, blocksize):
+            rows, cols = window.toslices()
+            z0 = dsm[rows, cols].astype(np.float32) + h0
+            _padded = padded[
+                rows.start : rows.stop + 2 * pad, cols.start : cols.stop + 2 * pad
+            ]
+            yield (rows, cols), _padded, pad, z0
+
+    @staticmethod
+    def horizon_angles(dsm, dx, nRays=64, maxDist=100.0, h0=0.0, blocksize=512):
+        """
+        Horizon (elevation) angles of every pixel in nRays azimuths
+        :param dsm: 2D array of the Digital Surface Model
+        :param dx: pixel size
+        :param nRays: number of azimuths, counterclockwise from the East
+        :param maxDist: scanning distance
+        :param h0: height of the viewpoint above the DSM
+        :param blocksize: tile size in pixels
+        :return: (nRays, height, width) float32 array of angles in radians
+        """
+        azimuths = np.linspace(0, 2 * np.pi, nRays, endpoint=False)
+        offsets = [HorizonScanningLib.__offsets(az, dx, maxDist) for az in azimuths]
+
+        result = np.empty((nRays, *dsm.shape), dtype=np.float32)
+        for (rows, cols), padded, pad, z0 in HorizonScanningLib.__blocks(
+            dsm, dx, maxDist, h0, blocksize
+        ):
+            for k in range(nRays):
+                result[k, rows, cols] = np.arctan(
+                    HorizonScanningLib.__maxTangent(padded, pad, z0, offsets[k], dx)
+                )
+        return result
+
+    @staticmethod
+    def svf(dsm, dx, nRays=64, maxDist=100.0, h0=0.0, method=2018, blocksize=512):
+        """
+        Sky View Factor of every pixel, without storing the nRays horizon
+        angles of the whole DSM
+        :param method: 2018 (Bernard et al., 2018) or 1981 (Oke, 1981), as in SVFLib
+        :return: (height, width) float32 array
+        """
+        azimuths = np.linspace(0, 2 * np.pi, nRays, endpoint=False)
+        offsets = [HorizonScanningLib.__offsets(az, dx, maxDist) for az in azimuths]
+        # Same formulas as SVFLib.svfAngles1981 and SVFLib.svfAngles2018
+        func = np.cos if (1981 == method) else np.sin
+
+        result = np.zeros(dsm.shape, dtype=np.float32)
+        for (rows, cols), padded, pad, z0 in HorizonScanningLib.__blocks(
+            dsm, dx, maxDist, h0, blocksize
+        ):
+            for k in range(nRays):
+                result[rows, cols] += func(
+                    np.arctan(
+                        HorizonScanningLib.__maxTangent(
+                            padded, pad, z0, offsets[k], dx
+                        )
+                    )
+                )
+        result /= nRays
+        return result if (1981 == method) else 1.0 - result
+
+    @staticmethod
+    def sunlit(dsm, dx, radiationDirection, maxDist=100.0, h0=0.0, blocksize=512):
+        """
+        Sunlit mask of every pixel
+        :param radiationDirection: (x, y, z) direction towards the sun, as
+            given by SunLib.getRadiationDirection(dt)
+        :return: (height, width) boolean array
+        """
+        x, y, z = radiationDirection
+        if 0.0 >= z:
+            return np.zeros(dsm.shape, dtype=bool)
+        offsets = HorizonScanningLib.__offsets(np.arctan2(y, x), dx, maxDist)
+        tanSunElevation = z / np.hypot(x, y)
+
+        result = np.empty(dsm.shape, dtype=bool)
+        for (rows, cols), padded, pad, z0 in HorizonScanningLib.__blocks(
+            dsm, dx, maxDist, h0, blocksize
+        ):
+            result[rows, cols] = tanSunElevation > HorizonScanningLib.__maxTangent(
+                padded, pad, z0, offsets, dx
+            )
+        return result
+
+    @staticmethod
+    def test():
+        import matplotlib.pyplot as plt
+        from rasterio.plot import show
+        from t4gpd.demos.GeoDataFrameDemos import GeoDataFrameDemos
+
+        buildings = GeoDataFrameDemos.ensaNantesBuildings()
+        dsm, profile = HorizonScanningLib.dsm(buildings, dx=1)
+        svf = HorizonScanningLib.svf(dsm, dx=1, nRays=64, maxDist=100.0)
+
+        # PLOTTING
+        fig, ax = plt.subplots(figsize=(10, 10))
+        show(svf, ax=ax, transform=profile["transform"], cmap="gray")
+        buildings.boundary.plot(ax=ax, edgecolor="red")
+        ax.axis("off")
+        fig.tight_layout()
+        plt.show()
+        plt.close(fig)
+
+
+# HorizonScanningLib.test()
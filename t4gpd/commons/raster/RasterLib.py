@@ -26,11 +26,15 @@ import numpy as np
 import rasterio as rio
 import warnings
 from geopandas import GeoDataFrame
+from multiprocessing import cpu_count, Pool
 from rasterio.features import rasterize
 from rasterio.io import MemoryFile
 from rasterio.mask import mask
 from rasterio.transform import from_bounds
 from rasterio.warp import reproject, Resampling
+from rasterio.windows import Window
+from rasterio.windows import bounds as window_bounds
+from rasterio.windows import transform as window_transform
 from shapely import STRtree, box
 from t4gpd.commons.ArrayLib import ArrayLib
 from t4gpd.commons.IllegalArgumentTypeException import IllegalArgumentTypeException
@@ -57,6 +61,77 @@ class RasterLib(object):
         "object": rio.float32,  # Defaulting object to float32, may need adjustment based on actual data
     }
 
+    @staticmethod
+    def apply_by_block(
+        src, kernel, profile=None, ofile=None, indexes=None, blocksize=None, window=None
+    ):
+        """
+        Apply a NumPy kernel window by window and write the result to an output
+        dataset, without ever loading the whole input raster into memory.
+        :param src: input raster (DatasetReader or file path)
+        :param kernel: function mapping a (count, h, w) block (and its window)
+            to a (h, w) or (count_out, h, w) array
+        :param profile: dict used to update the output profile (count, dtype...)
+        :param ofile: output file path; if None, the output is a MemoryFile
+        :param indexes: input band indexes (1-based), all bands by default
+        :param blocksize: block size in pixels; native blocks by default
+        :param window: optional rasterio Window restricting the processed area
+        :return: the output dataset, opened in read mode
+        """
+        if isinstance(src, str):
+            with rio.open(src) as dataset:
+                return RasterLib.apply_by_block(
+                    dataset, kernel, profile, ofile, indexes, blocksize, window
+                )
+
+        o_profile = src.profile.copy()
+        o_profile.update({"driver": "GTiff"})
+        if window is not None:
+            o_profile.update(
+                {
+                    "height": int(window.height),
+                    "width": int(window.width),
+                    "transform": src.window_transform(window),
+                }
+            )
+        if profile is not None:
+            o_profile.update(profile)
+
+        memfile = None if ofile is not None else MemoryFile()
+        dst = (
+            rio.open(ofile, "w", **o_profile)
+            if memfile is None
+            else memfile.open(**o_profile)
+        )
+        with dst:
+            for _window, block in RasterLib.iter_blocks(
+                src, indexes, blocksize, window
+            ):
+                result = kernel(block, _window)
+                if 2 == result.ndim:
+                    result = result.reshape(1, *result.shape)
+                dst.write(result.astype(o_profile["dtype"], copy=False), window=_window)
+
+        return rio.open(ofile) if memfile is None else memfile.open()
+
+    @staticmethod
+    def block_windows(height, width, blocksize=512):
+        """
+        Generate the windows of a regular tiling of a height x width grid
+        :param height: number of rows of the grid
+        :param width: number of columns of the grid
+        :param blocksize: tile size in pixels, either an int or a (rows, cols) tuple
+        :return: generator of rasterio Window
+        """
+        bh, bw = (
+            (blocksize, blocksize) if isinstance(blocksize, int) else blocksize
+        )
+        for row_off in range(0, height, bh):
+            for col_off in range(0, width, bw):
+                yield Window(
+                    col_off, row_off, min(bw, width - col_off), min(bh, height - row_off)
+                )
+
     @staticmethod
     def clip(raster_data, raster_profile, roi, ndv=None):
         warnings.formatwarning = WarnUtils.format_Warning_alt
@@ -238,14 +313,58 @@ class RasterLib(object):
         return uint8_data, uint8_profile
 
     @staticmethod
-    def load(ifile: str) -> tuple:
+    def iter_blocks(src, indexes=None, blocksize=None, window=None):
+        """
+        Iterate over the blocks of a raster dataset
+        :param src: input raster (DatasetReader)
+        :param indexes: band indexes (1-based), all bands by default
+        :param blocksize: block size in pixels; native blocks by default
+        :param window: optional rasterio Window to iterate over (the yielded
+            windows are then relative to it)
+        :return: generator of (window, block) where block is a (count, h, w) array
+        """
+        indexes = list(src.indexes) if indexes is None else list(indexes)
+        if window is not None:
+            row0, col0 = int(window.row_off), int(window.col_off)
+            for _window in RasterLib.block_windows(
+                int(window.height), int(window.width), blocksize or 512
+            ):
+                yield _window, src.read(
+                    indexes,
+                    window=Window(
+                        col0 + _window.col_off,
+                        row0 + _window.row_off,
+                        _window.width,
+                        _window.height,
+                    ),
+                )
+            return
+
+        if blocksize is None:
+            windows = (_window for _, _window in src.block_windows(indexes[0]))
+        else:
+            windows = RasterLib.block_windows(src.height, src.width, blocksize)
+        for _window in windows:
+            yield _window, src.read(indexes, window=_window)
+
+    @staticmethod
+    def load(ifile: str, window=None) -> tuple:
         """
         Load a raster file into a numpy array and get its profile
         :param ifile: input raster file path
+        :param window: optional rasterio Window to restrict the reading to
         :return: raster_data, raster_profile"""
         with rio.open(ifile) as src:
-            raster_data = src.read()
+            raster_data = src.read(window=window)
             raster_profile = src.profile
+            if window is not None:
+                raster_profile.update(
+                    {
+                        "height": raster_data.shape[1],
+                        "width": raster_data.shape[2],
+                        "transform": src.window_transform(window),
+                    }
+                )
         return raster_data, raster_profile
 
     @staticmethod
@@ -256,7 +375,38 @@ class RasterLib(object):
         return raster
 
     @staticmethod
-    def rasterize(gdf, dx, dy=None, roi=None, attr=None, ndv=0):
+    def _rasterize_tile(geoms, values, out_shape, transform, ndv, dtype):
+        shapes = (
+            ((geom, 1) for geom in geoms)
+            if values is None
+            else ((geom, value) for geom, value in zip(geoms, values))
+        )
+        return rasterize(
+            shapes=shapes,
+            out_shape=out_shape,
+            transform=transform,
+            fill=ndv,  # background value
+            dtype=dtype,
+        )
+
+    @staticmethod
+    def rasterize(
+        gdf, dx, dy=None, roi=None, attr=None, ndv=0, tilesize=None, ncpus=None, ofile=None
+    ):
+        """
+        Rasterize a GeoDataFrame on a regular grid covering the roi
+        :param gdf: input GeoDataFrame
+        :param dx: pixel width
+        :param dy: pixel height (dx by default)
+        :param roi: region of interest (gdf by default)
+        :param attr: field name of the burnt values (1 by default)
+        :param ndv: no data value
+        :param tilesize: if set, tiled mode: the grid is split into tilesize x
+            tilesize tiles rasterized in a pool of ncpus processes
+        :param ncpus: number of processes of the tiled mode (all CPUs by default)
+        :param ofile: GeoTIFF file path of the tiled mode; if set, tiles are
+            written as they come and the returned raster_data is None
+        :return: raster_data, raster_profile"""
         if not isinstance(gdf, GeoDataFrame):
             raise IllegalArgumentTypeException(gdf, "GeoDataFrame")
         if (not roi is None) and (not isinstance(roi, GeoDataFrame)):
@@ -278,85 +428,167 @@ class RasterLib(object):
         transform = from_bounds(minx, miny, maxx, maxy, ncols, nrows)
 
         if attr:
-            shapes = ((geom, value) for geom, value in zip(gdf.geometry, gdf[attr]))
+            values = gdf[attr].values
             dtype = RasterLib.pd2rio_dtypes[str(gdf[attr].dtype)]
         else:
-            shapes = ((geom, 1) for geom in gdf.geometry)
+            values = None
             dtype = RasterLib.pd2rio_dtypes["uint8"]
 
+        raster_profile = {
+            "driver": "GTiff",
+            "height": nrows,
+            "width": ncols,
+            "count": 1,
+            "dtype": dtype,
+            "crs": gdf.crs,
+            "transform": transform,
+            "nodata": ndv,
+        }
+
+        if tilesize is not None:
+            raster_data = RasterLib.tiled_rasterize(
+                gdf.geometry.values,
+                values,
+                raster_profile,
+                tilesize=tilesize,
+                ncpus=ncpus,
+                ofile=ofile,
+            )
+            return raster_data, raster_profile
+
         with MemoryFile() as memfile:
-            raster_profile = {
-                "driver": "GTiff",
-                "height": nrows,
-                "width": ncols,
-                "count": 1,
-                "dtype": dtype,
-                "crs": gdf.crs,
-                "transform": transform,
-                "nodata": ndv,
-            }
             with memfile.open(**raster_profile) as raster:
-                raster_data = rasterize(
-                    shapes=shapes,
-                    out_shape=(nrows, ncols),
-                    transform=transform,
-                    fill=ndv,  # background value
-                    dtype=dtype,
+                raster_data = RasterLib._rasterize_tile(
+                    gdf.geometry.values, values, (nrows, ncols), transform, ndv, dtype
                 )
                 raster.write(raster_data, 1)
 
         return raster_data, raster_profile
 
     @staticmethod
-    def resize(raster_data, raster_profile, nrows, ncols):
+    def resize(raster_data, raster_profile, nrows, ncols, blocksize=512):
         warnings.formatwarning = WarnUtils.format_Warning_alt
         o_raster_data = np.empty(
             (raster_data.shape[0], nrows, ncols), dtype=raster_data.dtype
         )
-        for band in range(raster_data.shape[0]):
-            reproject(
-                source=raster_data[band],
-                destination=o_raster_data[band],
-                src_transform=raster_profile["transform"],
-                dst_transform=raster_profile["transform"]
-                * raster_profile["transform"].scale(
-                    (raster_data.shape[2] / ncols), (raster_data.shape[1] / nrows)
-                ),
-                src_crs=raster_profile["crs"],
-                dst_crs=raster_profile["crs"],
-                resampling=Resampling.average,  # Pixel averaging
-            )
-        o_raster_profile = raster_profile.copy()
-        o_raster_profile.update(
-            width=ncols,
-            height=nrows,
-            transform=raster_profile["transform"]
-            * raster_profile["transform"].scale(
-                (raster_data.shape[2] / ncols), (raster_data.shape[1] / nrows)
-            ),
+        o_transform = raster_profile["transform"] * raster_profile["transform"].scale(
+            (raster_data.shape[2] / ncols), (raster_data.shape[1] / nrows)
         )
+        # Full-width strips: each destination block is a contiguous view
+        for window in RasterLib.block_windows(nrows, ncols, (blocksize, ncols)):
+            rows = slice(window.row_off, window.row_off + window.height)
+            for band in range(raster_data.shape[0]):
+                reproject(
+                    source=raster_data[band],
+                    destination=o_raster_data[band, rows],
+                    src_transform=raster_profile["transform"],
+                    dst_transform=window_transform(window, o_transform),
+                    src_crs=raster_profile["crs"],
+                    dst_crs=raster_profile["crs"],
+                    resampling=Resampling.average,  # Pixel averaging
+                )
+        o_raster_profile = raster_profile.copy()
+        o_raster_profile.update(width=ncols, height=nrows, transform=o_transform)
         warnings.warn(
             f"Resizing raster from {raster_data.shape[2]}x{raster_data.shape[1]} to {ncols}x{nrows}"
         )
         return o_raster_data, o_raster_profile
 
     @staticmethod
-    def rgb2luminance(raster_data, raster_profile):
+    def rgb2luminance(raster_data, raster_profile, blocksize=512):
         rgb, gray_profile = raster_data, raster_profile.copy()
         if gray_profile["dtype"] == rio.uint8:
-            gray = (0.2989 * rgb[0] + 0.5870 * rgb[1] + 0.1140 * rgb[2]).astype(
-                np.uint8
-            )
+            factor = 1.0
         elif gray_profile["dtype"] in [rio.float32, rio.float64]:
-            gray = (255 * (0.2989 * rgb[0] + 0.5870 * rgb[1] + 0.1140 * rgb[2])).astype(
-                np.uint8
-            )
+            factor = 255.0
         else:
             raise ValueError("RGB data must be of type uint8 or float32/float64")
-        gray_data = gray.reshape(1, *gray.shape)
+
+        # Block-wise weighted sum: no full-size float64 temporaries
+        gray_data = np.empty((1, *rgb.shape[1:]), dtype=np.uint8)
+        for window in RasterLib.block_windows(*rgb.shape[1:], blocksize):
+            rows, cols = window.toslices()
+            block = rgb[:3, rows, cols].astype(np.float64)
+            gray_data[0, rows, cols] = factor * (
+                0.2989 * block[0] + 0.5870 * block[1] + 0.1140 * block[2]
+            )
         gray_profile.update({"count": 1, "dtype": rio.uint8})
         return gray_data, gray_profile
 
+    @staticmethod
+    def tiled_rasterize(geoms, values, raster_profile, tilesize=1024, ncpus=None, ofile=None):
+        """
+        Rasterize geometries tile by tile in a pool of processes and mosaic the
+        tiles. Each tile only receives the geometries its STRtree query returns.
+        :param geoms: array of shapely geometries
+        :param values: array of burnt values (1 if None)
+        :param raster_profile: profile of the target grid (height, width,
+            transform, dtype, nodata...)
+        :param tilesize: tile size in pixels
+        :param ncpus: number of processes (all CPUs by default, 1 means no pool)
+        :param ofile: if set, the mosaic is written in this GeoTIFF file
+        :return: the mosaic as a (height, width) array, or None if ofile is set
+        """
+        nrows, ncols = raster_profile["height"], raster_profile["width"]
+        transform = raster_profile["transform"]
+        dtype, ndv = raster_profile["dtype"], raster_profile.get("nodata", 0)
+        ndv = 0 if ndv is None else ndv
+        geoms = np.asarray(geoms)
+        values = None if values is None else np.asarray(values)
+        tree = STRtree(geoms)
+
+        windows, tasks = [], []
+        for window in RasterLib.block_windows(nrows, ncols, tilesize):
+            # Keep the input order so that overlapping features burn identically
+            hits = np.sort(tree.query(box(*window_bounds(window, transform))))
+            if 0 < hits.size:
+                windows.append(window)
+                tasks.append(
+                    (
+                        geoms[hits],
+                        None if values is None else values[hits],
+                        (int(window.height), int(window.width)),
+                        window_transform(window, transform),
+                        ndv,
+                        dtype,
+                    )
+                )
+
+        ncpus = cpu_count() if ncpus is None else ncpus
+        if 1 == ncpus or 1 >= len(tasks):
+            tiles = (RasterLib._rasterize_tile(*task) for task in tasks)
+            return RasterLib.__mosaic(windows, tiles, raster_profile, tilesize, ofile)
+
+        with Pool(processes=min(ncpus, len(tasks))) as pool:
+            tiles = pool.imap(RasterLib._rasterize_task, tasks)
+            return RasterLib.__mosaic(windows, tiles, raster_profile, tilesize, ofile)
+
+    @staticmethod
+    def _rasterize_task(task):
+        return RasterLib._rasterize_tile(*task)
+
+    @staticmethod
+    def __mosaic(windows, tiles, raster_profile, tilesize, ofile):
+        if ofile is None:
+            raster_data = np.full(
+                (raster_profile["height"], raster_profile["width"]),
+                0 if raster_profile.get("nodata") is None else raster_profile["nodata"],
+                dtype=raster_profile["dtype"],
+            )
+            for window, tile in zip(windows, tiles):
+                rows, cols = window.toslices()
+                raster_data[rows, cols] = tile
+            return raster_data
+
+        o_profile = raster_profile.copy()
+        if 0 == tilesize % 16:
+            o_profile.update({"tiled": True, "blockxsize": tilesize, "blockysize": tilesize})
+        # Tiles without any geometry are never written: GDAL fills them with ndv
+        with rio.open(ofile, "w", **o_profile) as dst:
+            for window, tile in zip(windows, tiles):
+                dst.write(tile, 1, window=window)
+        return None
+
     @staticmethod
     def write(raster_data, raster_profile, ofile):
         with rio.open(ofile, "w", **raster_profile) as dst:
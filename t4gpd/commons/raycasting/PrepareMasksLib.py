@@ -24,10 +24,12 @@ import warnings
 from geopandas import GeoDataFrame, overlay, sjoin
 from pandas import concat
 from shapely import MultiLineString, union_all
+from t4gpd.commons.Checksum import Checksum
 from t4gpd.commons.DataFrameLib import DataFrameLib
 from t4gpd.commons.GeoDataFrameLib import GeoDataFrameLib
 from t4gpd.commons.GeomLib import GeomLib
 from t4gpd.commons.IllegalArgumentTypeException import IllegalArgumentTypeException
+from t4gpd.commons.Memoizer import Memoizer
 from t4gpd.commons.WarnUtils import WarnUtils
 
 
@@ -92,6 +94,26 @@ class PrepareMasksLib(object):
         if vp_pk in buildings:
             warnings.warn(f"{vp_pk} is also a buildings' column!")
 
+        key = (
+            "PrepareMasksLib.localMaskClipping",
+            Checksum.fingerprint(viewpoints, [vp_pk]),
+            Checksum.fingerprint(
+                buildings, [c for c in buildings.columns if c != buildings.geometry.name]
+            ),
+            vp_pk,
+            buffDist,
+            strict,
+        )
+        # Memoized masks are shared: a copy is returned
+        return Memoizer.shared().get(
+            key,
+            lambda: PrepareMasksLib.__localMaskClipping(
+                viewpoints, buildings, vp_pk, buffDist, strict
+            ),
+        ).copy()
+
+    @staticmethod
+    def __localMaskClipping(viewpoints, buildings, vp_pk, buffDist, strict):
         viewpoints2 = viewpoints[[vp_pk, "geometry"]].copy(deep=True)
         viewpoints2.geometry = viewpoints2.geometry.apply(
             lambda geom: geom.buffer(buffDist)
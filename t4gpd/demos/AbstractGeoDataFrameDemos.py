@@ -20,6 +20,10 @@ GNU General Public License for more details.
 You should have received a copy of the GNU General Public License
 along with t4gpd.  If not, see <https://www.gnu.org/licenses/>.
 '''
+from functools import lru_cache
+from io import StringIO
+from lzma import open as lzmaopen
+from os import path
 from t4gpd.io.GpkgWriter import GpkgWriter
 
 
@@ -32,6 +36,21 @@ class AbstractGeoDataFrameDemos(object):
     def postprocess(sio, crs='epsg:2154'):
         raise Exception('Deprecated!')
 
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def __read(module, filename):
+        ifile = path.join(path.dirname(__file__), "data", module, f"{filename}.xz")
+        with lzmaopen(ifile, "rt", encoding="utf-8", newline="") as f:
+            return f.read()
+
+    @staticmethod
+    def _dataset(module, filename):
+        '''
+        Bundled dataset (t4gpd/demos/data/module/filename.xz), decompressed
+        on first access only, as a fresh StringIO
+        '''
+        return StringIO(AbstractGeoDataFrameDemos.__read(module, filename))
+
     @staticmethod
     def _dump(mapOfGdf, gpkgOutputFile="/tmp/dump.gpkg"):
         if (not mapOfGdf is None) and (0 < len(mapOfGdf)):
@@ -112,107 +112,8 @@ BATIMENT0000000302929690;Cour résidence Conan-Mériadec;POLYGON ((355735.5 6688
 
     @staticmethod
     def districtGraslinInNantesTrees():
-        _sio = StringIO(
-            """osm_id;geometry
-1655091483;POINT (354695.2113528537 6689168.569643417)
-1655091542;POINT (354692.8245936075 6689179.989896608)
-1655091603;POINT (354688.5791650632 6689186.410727716)
-1655091613;POINT (354682.5521281994 6689194.403354734)
-1937451436;POINT (354770.7397752265 6688993.042484771)
-1937451458;POINT (354790.8606589965 6689008.756969644)
-1937451469;POINT (354751.109551963 6689016.731410504)
-1937451497;POINT (354771.7980699734 6689033.870535889)
-1937451525;POINT (354852.437903517 6689061.70524129)
-1937451548;POINT (354871.8154967141 6689077.029047958)
-1937451563;POINT (354832.3473500602 6689084.252265594)
-1937451582;POINT (354853.1830421018 6689101.060472787)
-1961183507;POINT (354758.4278567361 6688976.54242483)
-1961183517;POINT (354762.1750139792 6688979.719140174)
-1961183521;POINT (354755.2937338342 6688980.684747941)
-1961183528;POINT (354759.0408905205 6688983.861461356)
-1961183533;POINT (354754.8146238491 6688990.748425889)
-1961183542;POINT (354759.7503971715 6688994.813227894)
-1961183547;POINT (354764.6868055364 6688998.889123245)
-1961183578;POINT (354746.3580402397 6689002.486480635)
-1961183585;POINT (354769.6225656653 6689002.953933524)
-1961183592;POINT (354750.7014253767 6689006.140499815)
-1961183599;POINT (354736.8151256329 6689003.049808635)
-1961183604;POINT (354774.5583192022 6689007.018747945)
-1961183610;POINT (354740.9609805979 6689006.303576801)
-1961183615;POINT (354733.6734766988 6689007.192580645)
-1961183618;POINT (354779.4947077554 6689011.094655712)
-1961183622;POINT (354755.5944193595 6689010.2522788)
-1961183624;POINT (354737.8268871449 6689010.445909417)
-1961183627;POINT (354784.4304480989 6689015.159478409)
-1961183629;POINT (354760.4880483872 6689014.375151067)
-1961183632;POINT (354765.3885854026 6689018.486500978)
-1961183664;POINT (354770.2815595734 6689022.598292179)
-1961183671;POINT (354789.3668234416 6689019.235394457)
-1961183678;POINT (354795.8952780293 6689024.621120458)
-1961183683;POINT (354775.1745271447 6689026.710087447)
-1961183698;POINT (354780.0750443412 6689030.821449591)
-1961183702;POINT (354786.1998089426 6689036.174890448)
-1961183747;POINT (354836.0600350258 6689058.658322955)
-1961183762;POINT (354840.8627534589 6689062.652999546)
-1961183769;POINT (354845.6654655932 6689066.647680055)
-1961183777;POINT (354828.1698431704 6689068.917072852)
-1961183782;POINT (354850.4688129128 6689070.65345371)
-1961183796;POINT (354837.7652898876 6689076.996005505)
-1961183804;POINT (354859.7080195763 6689078.341353173)
-1961183843;POINT (354864.4394942568 6689082.284536736)
-1961183859;POINT (354887.8693172134 6689084.56758715)
-1961183865;POINT (354869.1703213622 6689086.216634878)
-1961183871;POINT (354851.3295931966 6689088.416914748)
-1961183877;POINT (354892.0281429175 6689088.310261283)
-1961183881;POINT (354884.7276178931 6689088.710280662)
-1961183920;POINT (354895.2666944143 6689091.216060735)
-1961183924;POINT (354889.0216715032 6689092.300488618)
-1961183932;POINT (354873.9017838024 6689090.159826047)
-1961183935;POINT (354856.1190914282 6689092.445745879)
-1961183939;POINT (354878.6325986841 6689094.091931795)
-1961183943;POINT (354860.9085833307 6689096.474580908)
-1961183946;POINT (354883.3640488841 6689098.035130572)
-1961183956;POINT (354865.6905127679 6689100.503856922)
-1961183960;POINT (354870.4799920174 6689104.532699742)
-1961183965;POINT (354874.8232299446 6689108.186810518)
-1961183970;POINT (354866.5033590466 6689109.313396323)
-1961183994;POINT (354871.1486886183 6689113.995904894)
-1961183997;POINT (354861.6546376974 6689114.745364667)
-1961184005;POINT (354869.3876886268 6689121.430020862)
-1961184008;POINT (354866.6538977867 6689118.862206142)
-3645277788;POINT (354869.320098764 6688870.835717993)
-3645277789;POINT (354878.2550702859 6688875.225610798)
-3645277790;POINT (354854.1119337931 6688878.057417245)
-3645277791;POINT (354887.1900283559 6688879.615517054)
-3645277792;POINT (354863.2371008007 6688882.458538558)
-3645280093;POINT (354896.1243315949 6688883.994347539)
-3645280094;POINT (354872.3698104196 6688886.85923682)
-3645280095;POINT (354905.3010677301 6688888.370295525)
-3645280096;POINT (354881.494949831 6688891.260386198)
-3645280097;POINT (354913.9941805064 6688892.774227297)
-3645280098;POINT (354890.6276318424 6688895.661112544)
-3645280099;POINT (354922.929084784 6688897.16418735)
-3645280100;POINT (354899.7527436573 6688900.062289985)
-3645280101;POINT (354931.8633342949 6688901.543071629)
-3645280102;POINT (354908.8853980612 6688904.46304442)
-3645280103;POINT (354940.7982116842 6688905.933058579)
-3645280104;POINT (354917.0283751727 6688908.531628738)
-3645280105;POINT (354949.7330756213 6688910.323058981)
-3645280106;POINT (354926.1534468783 6688912.932846761)
-3645280107;POINT (354958.6679261063 6688914.713072831)
-3645280108;POINT (355017.1084582445 6688944.501387749)
-3645280110;POINT (355002.2254348428 6688950.658041175)
-3645280112;POINT (355011.2597004192 6688955.064632991)
-4524050783;POINT (354707.9230648418 6689113.248108857)
-4524050784;POINT (354695.7866833569 6689108.164774528)
-4687035226;POINT (354787.8671398876 6689208.080496858)
-4687035227;POINT (354782.5416626995 6689209.200850855)
-4687035228;POINT (354778.7302807597 6689206.484024755)
-4703259528;POINT (354720.7946205814 6689212.128541369)
-5578627658;POINT (354832.967569707 6689072.956537222)
-5578627659;POINT (354842.5630037121 6689081.035477702)
-5788113829;POINT (354766.3568106871 6689268.049965823)
-"""
+        _sio = AbstractGeoDataFrameDemos._dataset(
+            "GeoDataFrameDemos", "districtGraslinInNantesTrees.csv"
         )
         return GeoDataFrameLib.read_csv(_sio)
 
@@ -247,13 +148,8 @@ BATIMENT0000000302929690;Cour résidence Conan-Mériadec;POLYGON ((355735.5 6688
 
     @staticmethod
     def districtRoyaleInNantesPaths2():
-        _sio = StringIO(
-            """gid;geometry
-1;LINESTRING Z (355153.8641448712 6689313.891951761 0, 355138.85615811433 6689324.684929472 0, 355137.06797245814 6689352.018624502 0, 355144.7316252702 6689373.987762564 0, 355190.7135421426 6689424.056960936 0, 355199.1435602359 6689420.991499811 0, 355199.39901532966 6689364.280469002 0, 355205.5299375793 6689345.376792066 0, 355235.1627284526 6689353.295899971 0, 355277.31281891896 6689350.485893941 0, 355287.8503415355 6689354.637039212 0, 355322.656098057 6689387.399154986 0, 355339.5161342435 6689388.420975361 0, 355339.5161342435 6689388.420975361 0, 355329.55338558793 6689436.318805436 0, 355367.3607394608 6689440.789269576 0, 355384.9871409285 6689444.748823529 0, 355436.5890698631 6689433.636526953 0, 355457.66411509627 6689423.929233391 0)
-2;LINESTRING Z (355157.1211973164 6689309.485351397 0, 355170.14940709685 6689277.2980095865 0, 355150.2239097855 6689216.244242184 0, 355141.53843659855 6689180.225073966 0, 355172.959413128 6689159.533211374 0, 355116.5038374124 6689095.66943794 0, 355099.1328910384 6689051.22025163 0, 355081.76194466447 6689007.7928856965 0, 354929.51070879813 6688933.199998326 0, 354908.05248092435 6688949.549124325 0)
-3;LINESTRING Z (355167.59485615947 6689308.2080759285 0, 355203.35856928246 6689284.195297117 0, 355615.6630905715 6689475.275707231 0)
-4;LINESTRING Z (355163.5075746598 6689307.69716574 0, 355173.72577840916 6689277.298009585 0, 355161.4639339099 6689242.556116837 0, 355184.96580253355 6689233.359733462 0, 355200.5485632514 6689224.674260275 0, 355232.73590506206 6689208.58058937 0, 355256.49322877947 6689181.246894341 0, 355287.6587502152 6689200.661481464 0, 355258.7923246231 6689246.643398337 0, 355276.6741811846 6689257.627967368 0, 355285.87056455907 6689243.833392305 0, 355378.08985339757 6689276.787099398 0, 355383.9653205534 6689283.428931834 0, 355367.1052843669 6689316.893549114 0, 355459.8354833929 6689353.679082612 0)
-"""
+        _sio = AbstractGeoDataFrameDemos._dataset(
+            "GeoDataFrameDemos", "districtRoyaleInNantesPaths2.csv"
         )
         return GeoDataFrameLib.read_csv(_sio)
 
@@ -297,155 +193,15 @@ BATIMENT0000000302929690;Cour résidence Conan-Mériadec;POLYGON ((355735.5 6688
 
     @staticmethod
     def ensaNantesTrees():
-        _sio = StringIO(
-            """genre;espece;hauteurFut;hauteur;DIAMETRE;MI_PRINX;geometry
-Larix;decidua;5.5 m;6-10 m;17.0;6503094;POINT (355345.4265547934 6688506.44948356)
-Betula;verrucosa;5.5 m;0-5 m;5.0;6503455;POINT (355258.844440129 6688500.961984504)
-Quercus;robur;5.5 m;0-5 m;4.0;6504443;POINT (355342.703136137 6688410.522459004)
-Quercus;robur;5.5 m;6-10 m;9.0;6504444;POINT (355357.8443094885 6688412.007470774)
-Quercus;robur;5.5 m;0-5 m;3.0;6504445;POINT (355378.4466366756 6688414.117335526)
-Prunus;sp;5.5 m;6-10 m;13.0;6504446;POINT (355382.3826479648 6688406.650631208)
-Prunus;sp;5.5 m;6-10 m;14.0;6504447;POINT (355374.8339665656 6688406.142773321)
-Prunus;sp;5.5 m;6-10 m;12.0;6504448;POINT (355368.0817087357 6688405.268668492)
-Prunus;sp;5.5 m;6-10 m;16.0;6504449;POINT (355354.6811196086 6688404.009248156)
-Prunus;sp;5.5 m;6-10 m;16.0;6504450;POINT (355345.8324866063 6688403.392107639)
-Prunus;sp;5.5 m;6-10 m;16.0;6504451;POINT (355328.8800487901 6688401.592148742)
-Prunus;sp;5.5 m;6-10 m;16.0;6504452;POINT (355314.332168769 6688400.561946942)
-Prunus;sp;5.5 m;0-5 m;9.0;6504453;POINT (355305.1791953855 6688399.387707062)
-Liquidambar;styraciflua;5.5 m;16-20 m;27.0;6503171;POINT (355402.3206735904 6688322.679369161)
-Koelreuteria;paniculata;5.5 m;6-10 m;16.0;6503203;POINT (355184.0847714964 6688446.743659912)
-Acer;negundo;5.5 m;6-10 m;15.0;6503217;POINT (355183.647508496 6688504.444711548)
-Acer;negundo;5.5 m;6-10 m;20.0;6503218;POINT (355184.166228288 6688497.00594948)
-Acer;negundo;5.5 m;6-10 m;19.0;6503219;POINT (355184.5724822176 6688490.477436834)
-Acer;negundo;5.5 m;6-10 m;15.0;6503220;POINT (355185.1965999826 6688483.707319627)
-Acer;negundo;5.5 m;6-10 m;17.0;6503221;POINT (355185.7084153832 6688477.867435764)
-Acer;negundo;5.5 m;6-10 m;15.0;6503222;POINT (355186.3441789497 6688470.077974583)
-Acer;negundo;5.5 m;6-10 m;12.0;6503223;POINT (355186.7635126515 6688465.148176744)
-Acer;negundo;5.5 m;6-10 m;14.0;6503224;POINT (355187.0639223526 6688460.339262908)
-Quercus;robur;5.5 m;0-5 m;3.0;6504485;POINT (355304.2018211054 6688406.950131067)
-Quercus;robur;5.5 m;0-5 m;4.0;6504486;POINT (355316.582236908 6688408.097981722)
-Prunus;avium;5.5 m;6-10 m;22.0;6503247;POINT (355254.3256648652 6688424.984952416)
-Prunus;avium;5.5 m;6-10 m;17.0;6503248;POINT (355252.7940713239 6688420.990428664)
-Prunus;avium;5.5 m;6-10 m;18.0;6503249;POINT (355243.7890477881 6688412.250553689)
-Prunus;avium;5.5 m;6-10 m;22.0;6503250;POINT (355242.8409564095 6688406.292702506)
-Prunus;avium;5.5 m;6-10 m;24.0;6503251;POINT (355237.3332126389 6688404.858826444)
-Prunus;avium;5.5 m;6-10 m;24.0;6503252;POINT (355237.207728291 6688389.521157583)
-Prunus;avium;5.5 m;6-10 m;23.0;6503253;POINT (355243.0496438963 6688390.272802042)
-Prunus;avium;5.5 m;6-10 m;23.0;6503254;POINT (355249.4033747813 6688385.184562725)
-Prunus;avium;5.5 m;6-10 m;23.0;6503255;POINT (355255.4311273969 6688380.558649936)
-Prunus;avium;5.5 m;6-10 m;25.0;6503256;POINT (355258.4568785183 6688372.979477745)
-Prunus;avium;5.5 m;6-10 m;25.0;6503257;POINT (355274.287731833 6688375.707930178)
-Prunus;avium;5.5 m;6-10 m;26.0;6503258;POINT (355273.9820716163 6688381.096459782)
-Prunus;avium;5.5 m;6-10 m;27.0;6503259;POINT (355279.6581343997 6688387.225497947)
-Prunus;avium;5.5 m;6-10 m;27.0;6503260;POINT (355285.4307476004 6688394.163150174)
-Prunus;avium;5.5 m;6-10 m;23.0;6503261;POINT (355290.3468517925 6688394.122953558)
-Prunus;avium;5.5 m;6-10 m;23.0;6503262;POINT (355286.491362982 6688411.43174471)
-Prunus;avium;5.5 m;6-10 m;21.0;6503263;POINT (355280.3173192 6688411.61213107)
-Prunus;avium;5.5 m;6-10 m;26.0;6503264;POINT (355278.9951643652 6688417.338729162)
-Prunus;avium;5.5 m;6-10 m;23.0;6503265;POINT (355271.5404804081 6688418.548835431)
-Prunus;avium;5.5 m;6-10 m;21.0;6503266;POINT (355269.781535167 6688424.62874716)
-Fraxinus;excelsior;5.5 m;6-10 m;15.0;6504376;POINT (355176.1927372587 6688516.636724089)
-Quercus;robur;5.5 m;11-15 m;21.0;6504392;POINT (355227.4208155124 6688400.023498422)
-Prunus;maackii;5.5 m;0-5 m;16.0;6504393;POINT (355228.2963071818 6688392.222084661)
-Prunus;subhirtella;5.5 m;0-5 m;24.0;6504394;POINT (355216.1375157258 6688391.292259285)
-Quercus;robur;5.5 m;0-5 m;4.0;6504487;POINT (355323.6732445246 6688408.849405356)
-Quercus;robur;5.5 m;0-5 m;4.0;6504488;POINT (355332.0431568563 6688409.580379305)
-Quercus;robur;5.5 m;11-15 m;24.0;6504395;POINT (355192.8381951794 6688396.638964815)
-Quercus;robur;5.5 m;11-15 m;25.0;6504396;POINT (355207.7386592286 6688398.016027095)
-Prunus;subhirtella;5.5 m;0-5 m;22.0;6504397;POINT (355202.1745089137 6688389.687694112)
-Prunus;maackii;5.5 m;0-5 m;17.0;6504398;POINT (355188.4180471327 6688388.900836068)
-Prunus;serrulata;5.5 m;6-10 m;22.0;6504399;POINT (355176.1726156583 6688387.152322765)
-Quercus;robur;5.5 m;11-15 m;19.0;6504411;POINT (355185.2632980069 6688396.590981571)
-Quercus;robur;5.5 m;11-15 m;21.0;6504412;POINT (355215.5189569482 6688398.741829951)
-Koelreuteria;paniculata;5.5 m;6-10 m;17.0;6503758;POINT (355196.7431162335 6688440.334807208)
-Koelreuteria;paniculata;5.5 m;6-10 m;14.0;6503759;POINT (355209.1798366485 6688433.707928441)
-Koelreuteria;paniculata;5.5 m;6-10 m;14.0;6503760;POINT (355221.2459507499 6688426.974160755)
-Koelreuteria;paniculata;5.5 m;6-10 m;13.0;6503761;POINT (355234.2459063362 6688420.79234495)
-Populus;nigra;5.5 m;11-15 m;23.0;6503407;POINT (355379.8845813656 6688516.590057508)
-Quercus;rubra;5.5 m;0-5 m;17.0;6503412;POINT (355347.0282892206 6688519.017116451)
-Metasequoïa;glyptostroboïdes;5.5 m;6-10 m;17.0;6503413;POINT (355231.438276105 6688539.307975003)
-Metasequoïa;glyptostroboïdes;5.5 m;11-15 m;27.0;6503414;POINT (355237.2316332031 6688534.124391289)
-Metasequoïa;glyptostroboïdes;5.5 m;6-10 m;15.0;6503415;POINT (355241.5109676206 6688538.086456191)
-Metasequoïa;glyptostroboïdes;5.5 m;11-15 m;37.0;6503416;POINT (355244.3184906206 6688533.147123788)
-Betula;verrucosa;5.5 m;6-10 m;5.0;6503421;POINT (355258.5765903096 6688497.53670043)
-Betula;verrucosa;5.5 m;11-15 m;16.0;6503422;POINT (355259.240110863 6688495.582711187)
-Betula;verrucosa;5.5 m;11-15 m;14.0;6503423;POINT (355259.0014828264 6688493.286356054)
-Betula;verrucosa;5.5 m;11-15 m;15.0;6503424;POINT (355259.6595262063 6688490.662904995)
-EMPLACEMENT CONSERVE;VIDE;Z.N.R.;Z.N.R;0.0;6503425;POINT (355259.1829684256 6688488.598325909)
-Betula;verrucosa;5.5 m;16-20 m;20.0;6503426;POINT (355260.4644311212 6688476.676626176)
-Betula;verrucosa;5.5 m;11-15 m;13.0;6503427;POINT (355260.8822489314 6688469.118777257)
-EMPLACEMENT CONSERVE;VIDE;Z.N.R.;Z.N.R;0.0;6503428;POINT (355261.4188153713 6688467.525560963)
-Betula;verrucosa;5.5 m;6-10 m;5.0;6503429;POINT (355261.1792880988 6688465.119294235)
-Betula;verrucosa;5.5 m;6-10 m;5.0;6503430;POINT (355261.9270967111 6688462.475123979)
-EMPLACEMENT CONSERVE;VIDE;Z.N.R.;Z.N.R;0.0;6503431;POINT (355262.3364943861 6688453.888102501)
-Betula;verrucosa;5.5 m;6-10 m;10.0;6503432;POINT (355263.1342634048 6688451.243523762)
-Betula;verrucosa;5.5 m;6-10 m;5.0;6503433;POINT (355262.8538685676 6688448.727672219)
-Betula;verrucosa;5.5 m;16-20 m;15.0;6503434;POINT (355263.2957648337 6688446.555657144)
-Betula;verrucosa;5.5 m;11-15 m;16.0;6503435;POINT (355263.930547226 6688438.646292115)
-Betula;verrucosa;5.5 m;6-10 m;13.0;6503436;POINT (355270.1953347632 6688364.060001295)
-Betula;verrucosa;5.5 m;6-10 m;11.0;6503437;POINT (355271.6726520408 6688350.427960434)
-Betula;verrucosa;5.5 m;6-10 m;14.0;6503438;POINT (355272.4126876125 6688341.948155071)
-Betula;verrucosa;5.5 m;6-10 m;10.0;6503439;POINT (355273.1833159755 6688335.986243592)
-Betula;verrucosa;5.5 m;11-15 m;18.0;6503440;POINT (355274.2060471926 6688324.196564693)
-Liquidambar;styraciflua;5.5 m;11-15 m;35.0;6504550;POINT (355409.9558042372 6688389.937327192)
-Liquidambar;styraciflua;5.5 m;16-20 m;42.0;6504551;POINT (355406.4748114917 6688426.149125609)
-Liquidambar;styraciflua;5.5 m;16-20 m;40.0;6504552;POINT (355405.6487528123 6688436.328383768)
-Liquidambar;styraciflua;5.5 m;16-20 m;40.0;6504553;POINT (355404.6958217875 6688446.878406915)
-Liquidambar;styraciflua;5.5 m;16-20 m;36.0;6504554;POINT (355403.7609129389 6688457.188459496)
-Liquidambar;styraciflua;5.5 m;11-15 m;40.0;6504555;POINT (355402.8160937526 6688467.508585809)
-Liquidambar;styraciflua;5.5 m;6-10 m;24.0;6504556;POINT (355401.871192812 6688477.818720216)
-Liquidambar;styraciflua;5.5 m;16-20 m;36.0;6504557;POINT (355388.3949832175 6688494.186928874)
-Liquidambar;styraciflua;5.5 m;16-20 m;33.0;6504558;POINT (355389.0908996474 6688483.978756651)
-Liquidambar;styraciflua;5.5 m;16-20 m;34.0;6504559;POINT (355390.029650761 6688474.138326491)
-Liquidambar;styraciflua;5.5 m;6-10 m;10.0;6504560;POINT (355391.1091902583 6688464.406664231)
-Liquidambar;styraciflua;5.5 m;16-20 m;35.0;6504561;POINT (355392.0649008043 6688454.196367968)
-Liquidambar;styraciflua;5.5 m;16-20 m;36.0;6504562;POINT (355393.1306059941 6688443.995165025)
-Liquidambar;styraciflua;5.5 m;16-20 m;39.0;6504563;POINT (355393.9865031864 6688437.462975182)
-Liquidambar;styraciflua;5.5 m;11-15 m;26.0;6504564;POINT (355397.3051258918 6688398.504529515)
-EMPLACEMENT CONSERVE;VIDE;> 5.5 m;Z.N.R;35.0;6504565;POINT (355398.1401139323 6688388.195294388)
-Liquidambar;styraciflua;5.5 m;11-15 m;28.0;6504566;POINT (355399.2167921605 6688378.113913747)
-Liquidambar;styraciflua;5.5 m;11-15 m;31.0;6504567;POINT (355399.9566008321 6688368.385029871)
-Liquidambar;styraciflua;5.5 m;11-15 m;26.0;6504568;POINT (355401.1104362272 6688357.963268838)
-Liquidambar;styraciflua;5.5 m;6-10 m;15.0;6504569;POINT (355402.0570538803 6688347.862966559)
-Liquidambar;styraciflua;5.5 m;11-15 m;31.0;6504570;POINT (355403.0048977674 6688337.912543846)
-Liquidambar;styraciflua;5.5 m;11-15 m;30.0;6504571;POINT (355403.7236595186 6688328.053928033)
-Magnolia;sp;5.5 m;6-10 m;16.0;6504747;POINT (355258.89683293 6688326.600061896)
-Magnolia;sp;5.5 m;6-10 m;15.0;6504750;POINT (355257.8118159043 6688335.662260671)
-Acer;negundo;5.5 m;6-10 m;17.0;6504907;POINT (355180.5280265937 6688540.873389263)
-Acer;negundo;5.5 m;11-15 m;16.0;6504908;POINT (355181.1513268879 6688534.003352175)
-Acer;negundo;5.5 m;6-10 m;14.0;6504909;POINT (355181.5194927157 6688527.704981425)
-Acer;negundo;5.5 m;6-10 m;17.0;6504910;POINT (355182.1627771702 6688520.834780996)
-"""
+        _sio = AbstractGeoDataFrameDemos._dataset(
+            "GeoDataFrameDemos", "ensaNantesTrees.csv"
         )
         return GeoDataFrameLib.read_csv(_sio)
 
     @staticmethod
     def squaresInNantes(filter=None):
-        _sio = StringIO(
-            """gid;label;type;civel_nm;geometry
-1;Place du Sanitat;semicircular;1092437;POLYGON ((354394.17522472894 6688887.16606739, 354394.7186726339 6688888.155835198, 354395.5 6688888.4, 354395.31041625945 6688888.94260174, 354405.731971105 6688888.857399379, 354406.3 6688887.2, 354407.3316453444 6688887.561075871, 354409.9781013671 6688878.703061079, 354410.2150705666 6688878.024087492, 354409.3 6688877.7, 354412.7 6688867.1, 354413 6688867.1, 354414.1 6688862.2, 354414.6 6688857.8, 354414.7 6688856.3, 354414.6 6688854.7, 354414.5 6688853.1, 354414.3 6688851.8, 354414 6688850.6, 354413.7 6688849.7, 354413.4 6688848.6, 354412.9 6688847.2, 354412.3 6688845.8, 354411.7 6688844.5, 354411 6688843.2, 354410.3 6688841.9, 354409.5 6688840.7, 354409.2 6688840.3, 354408.6 6688839.4, 354407.7 6688838.3, 354406.7 6688837.1, 354405.5 6688836, 354404.3 6688834.9, 354403 6688833.9, 354401.7 6688833, 354400.3 6688832.2, 354400.44542722096 6688831.793659235, 354400.1857475141 6688831.594705168, 354388.71601196943 6688828.048291013, 354388.0904273217 6688828.028718035, 354388 6688828.3, 354387.9 6688828.5, 354387.7 6688828.7, 354387.5 6688828.8, 354387.3 6688828.8, 354387.1 6688828.8, 354386.9 6688828.8, 354386.7 6688828.8, 354386 6688828.6, 354385.3 6688828.4, 354385.1 6688828.3, 354384.6 6688828.3, 354384.4 6688828.2, 354384.2 6688828.2, 354383.9 6688828.2, 354383.4 6688828.2, 354382.9 6688828.2, 354381.7 6688828.2, 354381.5 6688828.2, 354381.2 6688828.2, 354380.7 6688828.3, 354380.3 6688828.4, 354380 6688828.4, 354379.7 6688828.5, 354373.6 6688830.4, 354373.4 6688830.5, 354372.6 6688830.9, 354371.8 6688831.3, 354371.4 6688831.5, 354371.2 6688831.6, 354370.1 6688832.2, 354370 6688832.3, 354369.1 6688832.9, 354368.9 6688833, 354368.8 6688833.1, 354368.1 6688833.6, 354367.4 6688834.1, 354366 6688835.1, 354365.1 6688835.8, 354364.6 6688836.3, 354364.4 6688836.4, 354363.6 6688837.2, 354363.3 6688837.5, 354363.1 6688837.7, 354361.2 6688840, 354359.4 6688843.9, 354356.8 6688848.1, 354357.3 6688848.4, 354353.7 6688859.1, 354352.5577846434 6688858.703479643, 354352.31974487845 6688859.518916151, 354349.0492688113 6688867.893030189, 354350.6 6688868.4, 354349.99784332694 6688870.154856591, 354357.2714406123 6688876.536015063, 354358.66342137015 6688876.590897458, 354358.8 6688876.2, 354360.25119884376 6688876.653499639, 354360.41414440586 6688876.659924184, 354361 6688875, 354369.9 6688878, 354370.6 6688876, 354386 6688881.2, 354385.4 6688883.2, 354394.5 6688886.3, 354394.17522472894 6688887.16606739))
-2;Place Graslin;semicircular;1091190;POLYGON ((354878.4803403586 6689205.148994912, 354878.555177892 6689205.144901542, 354878.5 6689204.4, 354878.9 6689204.4, 354883 6689204.1, 354882.8 6689201, 354882.4 6689201, 354882.4 6689199.6, 354905.9 6689197.7, 354905.9 6689199.1, 354905.7 6689199.2, 354906 6689202.2, 354910.1 6689201.9, 354910.5 6689201.9, 354910.5821626755 6689203.009196119, 354918.16667298286 6689203.2351559475, 354918.53467195795 6689203.2058448, 354918.4 6689201.5, 354928.6 6689200.6, 354930.9183377604 6689201.548410902, 354929.53010050807 6689190.853760232, 354928.1 6689190.2, 354927.7 6689186.2, 354927.4 6689186.1, 354926.4 6689175.9, 354925.8 6689169.2, 354926.1 6689169.1, 354925.7 6689165.1, 354927.3306120192 6689164.080867488, 354926.18891967053 6689153.802724456, 354925 6689154.6, 354914.4 6689155.4, 354912.8 6689150.7, 354910.8 6689147.4, 354908.3 6689144.4, 354907.8 6689143.9, 354906 6689142, 354902.3 6689139.4, 354897.5 6689137.5, 354894.1 6689136.8, 354893.9848295276 6689135.575004975, 354884.07921662426 6689136.4820678765, 354883.46360747854 6689136.7265794845, 354883.5 6689137.6, 354883.5 6689137.9, 354883.4 6689138.1, 354883.2 6689138.2, 354883 6689138.3, 354882.9 6689138.4, 354882.5 6689138.5, 354882 6689138.6, 354881.8 6689138.6, 354880.9 6689138.8, 354880.7 6689138.8, 354880.3 6689139, 354879.2 6689139.6, 354878.1 6689140.2, 354878 6689140.3, 354877.3 6689140.8, 354876.9 6689141, 354876.7 6689141.2, 354876.2 6689141.6, 354875.8 6689141.9, 354875.6 6689142.1, 354875.3 6689142.3, 354874.8 6689142.8, 354874.6 6689142.9, 354874.1 6689143.4, 354873.6 6689143.8, 354873.5 6689144, 354873.4 6689144.2, 354873.1 6689144.5, 354870.7 6689147.8, 354870.6 6689148.1, 354870.1 6689149, 354870 6689149.2, 354869.4 6689150.3, 354869.2 6689150.7, 354868.9 6689151.2, 354868.7 6689151.6, 354868.2 6689152.6, 354867.8 6689153.3, 354867.7 6689153.7, 354867.6 6689154.2, 354866.8 6689158.8, 354856.7 6689159.3, 354854.9268408875 6689157.804983493, 354855.668250929 6689169.054594965, 354857.4 6689169.8, 354859.1 6689194.9, 354857.8487552211 6689195.6827692455, 354858.97216106753 6689206.821995529, 354860.3 6689206, 354870.6 6689205.2, 354870.7420101468 6689206.880453404, 354878.4803403586 6689205.148994912))
-3;Cours Cambronne;mails;1090437;POLYGON ((354876.6541341984 6689120.523307359, 354877.0277306325 6689120.11154799, 354894.1458408228 6689098.578906121, 354894.29134326783 6689098.413789249, 354893.3 6689097.6, 354899.5 6689090.3, 354888.5 6689081, 354890.5 6689078.8, 354870.3 6689061.7, 354845 6689040.4, 354822.1 6689021.1, 354810.8 6689011.6, 354792.5 6688996.2, 354781 6688986.5, 354762.3 6688970.8, 354763.2539877639 6688969.717960187, 354761.7936346251 6688968.489783026, 354724.2698823869 6689011.0991791515, 354725.9474622012 6689012.51922758, 354726.4 6689012, 354737.9 6689021.7, 354749.5 6689031.3, 354759.9 6689040.1, 354770 6689048.6, 354790.8 6689065.9, 354800.5 6689074.1, 354811.4 6689083.2, 354831.9 6689100.4, 354843.3 6689109.9, 354854.8 6689119.6, 354866.4 6689129.3, 354868.6 6689126.7, 354875 6689119.2, 354876.6541341984 6689120.523307359))
-4;Place des Volontaires de la D;circular;1092681;POLYGON ((354992.5601400015 6689457.6307054525, 355001.0561000859 6689464.511480084, 355002.1 6689463, 355005.1 6689464.3, 355007.7 6689465.1, 355010.4 6689465.6, 355014.3 6689465.8, 355016 6689465.6, 355016.8360273081 6689466.802376353, 355028.919918931 6689462.437530224, 355028.2 6689461.4, 355028.9 6689460.9, 355030.1 6689459.7, 355031.3 6689458.5, 355032.4 6689457.1, 355033.3 6689455.7, 355034.1 6689454.2, 355034.5 6689453.3, 355034.9 6689452.5, 355035.3 6689451.6, 355035.6 6689450.7, 355035.9 6689449.9, 355037.2725304236 6689450.135739959, 355037.4254095839 6689449.664172007, 355053.4843570538 6689426.8307372425, 355031.9 6689423, 355031.7 6689422.1, 355031.4 6689421.2, 355031.2 6689420.7, 355031.1 6689420.3, 355030.7 6689419.5, 355030.3 6689418.6, 355030 6689418.1, 355029.6 6689417.4, 355029.1 6689416.5, 355028.5 6689415.6, 355027.8 6689414.8, 355027.1 6689414, 355026.1 6689413.2, 355025.3 6689412.6, 355024.4 6689412, 355023.5 6689411.5, 355022.6 6689411.1, 355022.7874598251 6689409.43491567, 355010.842585379 6689408.756041169, 355010.8 6689409.1, 355009.8 6689409.4, 355009.2 6689409.6, 355008.9 6689409.7, 355008 6689410.1, 355006.8 6689410.7, 355006.2 6689411, 355005.2 6689411.7, 355004.3 6689412.3, 355002.9 6689413.4, 355002.4 6689413.9, 355001.8 6689414.5, 355001.4 6689415, 355001 6689415.5, 355000.6 6689416, 355000.3 6689416.6, 355000 6689417.1, 354974.8 6689412.7, 354974.3 6689412.6, 354972.8 6689420, 354972.53924649075 6689419.95580449, 354972.51484519406 6689420.086763554, 354970.08682366635 6689429.319469932, 354970.0303828221 6689429.67607766, 354972.4 6689430.1, 354970.6 6689437.5, 354988 6689440.5, 354987.9 6689441.7, 354987.9 6689442.3, 354988 6689443.9, 354988.1 6689445.3, 354988.2 6689445.4, 354988.4 6689446.6, 354988.5 6689446.9, 354988.9 6689448.4, 354989.4 6689449.9, 354990 6689451.3, 354990.6 6689452.4, 354991.1 6689453.5, 354991.8 6689454.6, 354992.4 6689455.7, 354993.2 6689456.7, 354992.5601400015 6689457.6307054525))
-5;Place Aristide Briand;closed rectangular;1090163;POLYGON ((354828.16108483804 6689633.525204345, 354826.7162748517 6689657.773890847, 354827.3 6689656.9, 354843.5 6689667.6, 354845.9 6689664.2, 354850 6689667, 354849.5 6689667.8, 354856.7 6689672.6, 354857.2 6689672, 354861 6689674.8, 354858.7 6689678.2, 354874.4 6689688.7, 354872.963494447 6689690.8298478285, 354874.07240844076 6689691.602358668, 354894.49208760646 6689680.121338353, 354894.8308240028 6689679.6309050415, 354893.9 6689678.8, 354904.3 6689663.3, 354912.2 6689651.6, 354912.4 6689651.8, 354922.7 6689636.4, 354924.1368336427 6689637.209251133, 354930.8080647723 6689628.787734921, 354929.2935230426 6689627.778198863, 354928.7 6689628.6, 354901 6689609.6, 354901.3203246163 6689609.13232606, 354901.0810075249 6689608.972806366, 354893.73529708124 6689602.935981871, 354893 6689604, 354878.1 6689593.6, 354866 6689585.3, 354865.8733858561 6689585.146254254, 354857.6749652662 6689591.483412604, 354857.59685586364 6689591.594677513, 354858.9 6689593.2, 354849.1 6689607.9, 354849.3 6689608.1, 354841.6 6689619.4, 354841.3 6689619.3, 354831.4 6689634.1, 354828.27463857725 6689633.363449856, 354828.16108483804 6689633.525204345))
-6;Place Royale;semicircular;1092355;POLYGON ((355147.26912194624 6689314.13012492, 355150.93356646405 6689320.295528646, 355151.0920187481 6689320.559921772, 355152 6689320, 355154.3 6689323.5, 355154.5 6689323.7, 355154.5 6689323.8, 355154.7 6689324, 355154.9 6689324.3, 355155 6689324.3, 355155.1 6689324.5, 355155.2 6689324.5, 355155.2 6689324.6, 355155.4 6689324.8, 355155.5 6689324.9, 355155.6 6689325, 355155.7 6689325.1, 355156 6689325.4, 355156.1 6689325.4, 355156.3 6689325.7, 355156.4 6689325.7, 355156.4 6689325.8, 355156.6 6689326, 355159.7 6689328.7, 355159.14777192735 6689330.036973229, 355162.94388858875 6689335.6313309595, 355163.75982040993 6689335.979372714, 355164.3 6689334.7, 355177.3 6689340.2, 355185.9 6689343.9, 355199 6689349.4, 355198.43875619484 6689350.771929301, 355198.94448985625 6689350.987653736, 355207.7107173752 6689352.0339696165, 355208 6689351.1, 355209.936730003 6689351.932612898, 355212.413921414 6689343.038494742, 355212.1 6689342.9, 355216.6 6689332.5, 355216.9 6689332.6, 355219.2 6689327.1, 355219.4 6689326.7, 355225.1 6689313.5, 355225.2 6689313.1, 355225 6689313, 355229.4 6689302.7, 355230.2671023516 6689303.085378823, 355230.7640130113 6689301.979647569, 355235.58529386396 6689293.1101329895, 355234.9 6689292.8, 355235.284198236 6689292.144213356, 355227.3928153787 6689285.552341374, 355227.0863688571 6689285.4227185715, 355226.8 6689285.9, 355208.2 6689278.3, 355192.3 6689271.8, 355192.6386463479 6689270.851790226, 355191.75712396886 6689270.478917987, 355185.4152679812 6689271.821233495, 355184.6 6689273.6, 355182.3 6689273.2, 355180.3 6689273, 355177.2 6689273.1, 355174.2 6689273.4, 355173.52925109543 6689271.493661009, 355173.40033695474 6689271.503611144, 355165.44119516545 6689273.329175219, 355164.3305014766 6689273.876609227, 355164.6 6689274.6, 355160.5 6689276.3, 355160 6689276.5, 355159.4 6689276.8, 355159.1 6689277.1, 355158.5 6689277.4, 355158.4 6689277.6, 355158 6689277.8, 355157.8 6689278, 355157.7 6689278.1, 355157.2 6689278.5, 355156.7 6689279, 355156 6689279.5, 355155.9 6689279.7, 355155.7 6689279.8, 355155.6 6689279.9, 355155.1 6689280.4, 355154.7 6689280.8, 355154.4 6689281.1, 355154.1 6689281.4, 355154 6689281.5, 355153.7 6689281.8, 355153.3 6689282.3, 355153.1 6689282.5, 355153 6689282.6, 355152.7 6689282.9, 355152.3 6689283.4, 355151.8 6689284.1, 355151.2 6689284.9, 355151.1 6689285.1, 355150.8 6689285.4, 355150.1 6689286.4, 355149.99249239994 6689286.353257566, 355149.90820565604 6689286.509517985, 355146.462725729 6689294.488434676, 355147.7 6689295, 355147.6 6689295.4, 355147.5 6689295.6, 355147.4 6689296, 355147.4 6689296.2, 355147.2 6689296.8, 355147.1 6689297.4, 355147 6689298.2, 355146.9 6689298.7, 355146.8 6689299.4, 355146.8 6689299.7, 355146.7 6689300.6, 355146.7 6689301.1, 355146.7 6689301.8, 355146.8 6689304.9, 355147.2 6689308.5, 355148.3 6689313.1, 355147.1948089911 6689313.808180646, 355147.26912194624 6689314.13012492))
-7;Place Delorme;opened rectangular;1090743;POLYGON ((354774.8494099697 6689399.724652105, 354789.5510122577 6689420.885369166, 354790.5 6689420.1, 354791.5622303462 6689421.587122484, 354803.4356992948 6689418.194363667, 354803.8 6689416.3, 354807.4 6689413.8, 354807.3 6689413.3, 354818 6689405.8, 354818.2 6689406.1, 354821.8 6689403.4, 354823.31212066254 6689403.67493103, 354826.805330981 6689395.051516171, 354825.83581015165 6689394.316168754, 354822.5 6689393.7, 354820.4 6689390.8, 354820.2 6689390.9, 354818.8 6689388.6, 354813.8 6689381.5, 354814 6689381.4, 354811.9 6689378.3, 354812.0557092025 6689377.529239448, 354804.3775712537 6689373.071640441, 354804.17382987775 6689373.206453435, 354804 6689374.1, 354800.2 6689376.6, 354800.3 6689376.8, 354789.6 6689384.2, 354789.4 6689383.9, 354785.6 6689386.7, 354784.1732306338 6689386.440587388, 354783.4824671443 6689386.897656521, 354775.31874572934 6689398.691727671, 354775.6 6689399.1, 354774.8494099697 6689399.724652105))
-8;Place du Pilori;triangular;1092118;POLYGON ((355621.47837073356 6689500.301849961, 355625.02535686933 6689489.12292423, 355624.5 6689488.2, 355627 6689480.4, 355629 6689473.8, 355630.2626076812 6689473.937239965, 355630.4714786577 6689473.332259023, 355633.60778645927 6689469.197262835, 355632.7 6689469.1, 355632.4 6689468.2, 355632.5921349473 6689467.721475226, 355626.2247914502 6689466.50209767, 355625.5 6689468, 355620.3 6689466.4, 355611.8 6689463.8, 355601.5 6689460.6, 355591.7 6689457.6, 355586 6689455.9, 355578.5 6689453.7, 355578.97832126205 6689452.583917055, 355574.21881749004 6689451.277805028, 355583.518717611 6689468.43028826, 355586.9 6689470, 355587.2 6689470.2, 355587.6 6689469.3, 355587.8 6689468.9, 355601.7 6689479.3, 355604.9 6689481.6, 355612.9 6689488.8, 355616.8 6689492.2, 355616.9 6689493.1, 355616.2672169632 6689494.142755145, 355618.98733139515 6689498.189399316, 355619.4 6689497.5, 355620 6689497.6, 355621.47837073356 6689500.301849961))
-9;Place Sainte Croix;closed rectangular;1092378;POLYGON ((355489.00839961675 6689397.181686965, 355490.1360159174 6689404.638635149, 355492.9 6689402.9, 355503.8 6689403.9, 355503.70058308117 6689405.291836864, 355503.96429868526 6689405.30039789, 355519.60257128766 6689400.415054793, 355519.68996112084 6689399.565268063, 355516.1 6689399.3, 355516.2 6689396.8, 355510.9 6689396.3, 355510.9 6689396.2, 355510.6 6689396.2, 355510.7 6689394.9, 355511 6689394.9, 355511.1 6689392.7, 355510.8 6689392.7, 355510.9 6689391.6, 355511.2 6689391.6, 355511.3 6689390.1, 355510.2 6689390, 355510.3 6689389, 355509.6 6689388.9, 355509.8 6689385.7, 355510.4 6689385.7, 355510.6 6689384.5, 355511.6 6689384.6, 355511.8 6689382.9, 355511.4 6689382.9, 355511.5 6689381.8, 355511.9 6689381.8, 355512 6689379.5, 355511.7 6689379.5, 355511.8 6689378.4, 355512.3 6689378.4, 355512.3 6689378.1, 355517.3 6689378.3, 355517.5 6689376.2, 355518.99969660316 6689376.31736756, 355519.0641840153 6689375.1720568, 355514.17130797595 6689371.588275729, 355512.6 6689371.5, 355512.6348947231 6689370.662526645, 355506.98910476326 6689369.400468709, 355506.0778837744 6689369.356082063, 355506 6689370.5, 355495.1 6689370, 355493.6692602494 6689368.803605554, 355490.23663276073 6689374.105552438, 355491.1 6689374.8, 355489.8 6689396.6, 355489.01381874795 6689397.072937159, 355489.00839961675 6689397.181686965))
-10;Place Saint Pierre;square;1092412;POLYGON ((355781.6 6689734.7, 355784.2 6689734.7, 355792.7 6689721.3, 355793.2 6689718.9, 355790.9 6689718.5, 355791.5 6689716.8, 355790.3 6689715.1, 355784.2 6689714.1, 355783.5 6689717, 355781.7 6689716.6, 355781.2 6689715.4, 355779.6 6689714.2, 355779 6689715, 355778.4 6689715, 355779.4 6689709.7, 355780.5 6689710.1, 355780.8 6689709.6, 355781.4 6689709.9, 355781.6 6689709.3, 355782.5 6689709.6, 355782.6 6689708.9, 355783.6 6689708.9, 355784.3 6689706, 355783.6 6689705.8, 355783.7 6689705, 355782.7 6689704.8, 355782.6 6689703.8, 355781.7 6689704, 355781.5 6689703.4, 355780.5 6689703.4, 355781.1 6689700.6, 355781.9 6689700.5, 355782 6689700.9, 355783.3 6689701.2, 355783.6 6689700.4, 355784.2 6689700.6, 355784.3 6689700, 355785.3 6689700.3, 355786.8 6689692.2, 355786.1 6689692.1, 355786.4 6689691.4, 355785.2 6689691.4, 355785.4 6689690.6, 355784.3 6689690.6, 355784.1 6689690, 355783.7 6689690.4, 355782.8 6689690, 355783.3 6689686.9, 355784.7 6689687.4, 355785 6689687, 355785.8 6689687.2, 355786 6689686.7, 355786.9 6689687, 355787.1 6689686.4, 355787.8 6689686.4, 355788.6 6689683.1, 355787.7 6689683.1, 355787.6 6689682.5, 355786.5 6689682.4, 355786.4 6689681.2, 355784.5 6689680.9, 355785.4 6689677.3, 355786 6689676.6, 355787.2 6689676, 355789.1 6689676, 355792.2 6689677.3, 355791.9 6689679.7, 355792.9 6689681.9, 355795.6 6689682.6, 355795.8 6689680.9, 355796.7 6689681.1, 355797 6689680.3, 355798.2 6689679.8, 355798.2 6689678.2, 355800.3 6689678.6, 355800.9 6689673.8, 355795.6 6689672.7, 355795.7694617237 6689671.174844487, 355797.3 6689657.4, 355800.3 6689641.6, 355786.7 6689642.3, 355775.8 6689641.3, 355775.3 6689650.6, 355774.51504571206 6689655.309725727, 355774.3 6689656.6, 355768.4 6689660.4, 355761.6 6689659.1, 355749.1 6689656.7, 355742.8 6689655.5, 355733.5 6689653.8, 355729.9 6689653.1, 355721.9641877888 6689658.924885754, 355722.2 6689659.2, 355719.6 6689676, 355719.4084176295 6689675.976052204, 355719.3649268876 6689676.297318773, 355717.3 6689690.5, 355714.8 6689707.5, 355719.1 6689716.3, 355744.5 6689720.9, 355757.6 6689723.1, 355761.3 6689728.9, 355781.6 6689734.7))
-11;Place Roger Salengro;closed rectangular;1092332;POLYGON ((355622.62954597874 6689918.360592341, 355626.4313429898 6689920.5714557255, 355627 6689919.6, 355631.9 6689922.5, 355631.32625154767 6689923.417997524, 355674.7474506905 6689948.668777355, 355674.9 6689948.4, 355679.9 6689951.4, 355679.7804518243 6689951.595624288, 355684.9124419585 6689954.580036407, 355685.2 6689954.1, 355686.43764557363 6689954.817048626, 355690.06862113933 6689946.851598256, 355689 6689946.2, 355699.7 6689928.5, 355707.1 6689916.3, 355707.87235809886 6689916.338617905, 355706.9555829431 6689908.760102896, 355705.525182368 6689907.903537531, 355704.7 6689909.3, 355684.4 6689897.3, 355685.32030230376 6689895.813357817, 355674.20765251823 6689889.268800272, 355673.1 6689891.1, 355653.2 6689879.1, 355653 6689878.1, 355653.9097999357 6689876.655023632, 355652.7675328941 6689875.945162308, 355644.9005228034 6689879.212706209, 355645.7 6689880.5, 355637.4 6689894.3, 355628.6 6689909, 355627.56185045675 6689908.522746419, 355627.3356921637 6689908.908094323, 355622.42326052004 6689916.408855676, 355623.5 6689916.9, 355622.62954597874 6689918.360592341))
-12;Place Canclaux;circular;1090445;POLYGON ((353944.86213114735 6689400.779903113, 353973.43207378726 6689413.142105664, 353973.92351785366 6689412.929446439, 353974 6689412.7, 353974 6689412.6, 353974.1 6689412.2, 353974.3 6689411.6, 353974.5 6689411.1, 353974.7 6689410.8, 353974.7 6689410.7, 353975.5 6689410.7, 353976.3 6689410.9, 353976.6 6689411.1, 353976.8 6689410.3, 353983.7 6689408.8, 353983.7 6689408.9, 353984 6689409.9, 353986.8 6689408.2, 353986.8 6689409.5, 353987.172236158 6689409.804556857, 353988.8716197243 6689409.428380276, 353989.5 6689408.8, 353989.3 6689407.7, 353989.3 6689407.6, 354001.9 6689405, 354012.1 6689402.8, 354021.8 6689400.7, 354026.2 6689399.8, 354033.9 6689398.2, 354034.1369451527 6689399.408420279, 354037.2687383325 6689398.7151646335, 354037.06774643436 6689397.806331703, 354019.5936446729 6689386.201381593, 354017.3 6689386.7, 354012.9 6689383, 354014.3 6689378.2, 354015.5 6689372.1, 354016.3161086817 6689372.1, 354017.6395889134 6689367.608489575, 354017.6216281337 6689367.105587743, 354015.6718233014 6689360.771986911, 354014.7 6689360.7, 354014.2 6689358.1, 354013.4 6689355.6, 354012.6 6689353.1, 354011.6 6689350.7, 354010.5 6689348.3, 354010.5 6689344.8, 354010.9567834993 6689344.305151209, 353998.2960925848 6689333.361402079, 353996.6 6689335, 353993.2 6689333.2, 353987.7 6689331, 353982.1 6689329.5, 353976.7 6689328.9, 353971.2 6689328.9, 353965.7 6689329.7, 353965.047644433 6689328.286562938, 353948.18673713936 6689336.185739536, 353948.8 6689337.4, 353948.6 6689338.9, 353946.5 6689341.2, 353944.4 6689343.6, 353942.6 6689346.1, 353941 6689348.8, 353939.5 6689351.6, 353937.8 6689356.1, 353936.8 6689360.2, 353934.9 6689368.5, 353929.8 6689370.6, 353928.88578475756 6689369.17970132, 353928.58160101634 6689369.327605198, 353927.3309671443 6689390.099792678, 353927.9595085764 6689390.4827046115, 353929.3 6689389.4, 353935.3 6689393.1, 353942.1 6689397.2, 353945.8 6689399.3, 353944.8094101794 6689400.747785122, 353944.86213114735 6689400.779903113))
-13;Place Sarradin;;1090860;POLYGON ((354308.46399553097 6690066.79722341, 354308.541001868 6690066.8777498, 354310.2 6690066.7, 354313.6 6690070.3, 354322.3 6690079.1, 354322.049661243 6690080.834489959, 354332.4166548601 6690085.427161552, 354333.1 6690080.9, 354340 6690074.5, 354341.5721082309 6690076.229319054, 354343.6926739678 6690074.096738156, 354342.6 6690072.9, 354350.2 6690065.8, 354353.8 6690062.3, 354354.55994758446 6690062.217397002, 354353.05240184325 6690050.436552778, 354351.2 6690050.6, 354340.4 6690037.9, 354340.596660388 6690036.646290027, 354328.43154488946 6690036.011957769, 354328.4138230502 6690036.025355529, 354328.4 6690036.1, 354319 6690045.1, 354315.4 6690044.5, 354315.26233774255 6690043.938761566, 354314.5076719788 6690044.233339314, 354305.3859220252 6690051.720610139, 354308.46399553097 6690066.79722341))
-14;Place Viarme;irregular;1092643;POLYGON ((354847.0686055335 6690097.254562606, 354847.0103669823 6690097.175844917, 354845.3 6690098.5, 354844.540327171 6690099.091423142, 354844.8534012011 6690111.759415087, 354847.3 6690109.9, 354848.9 6690108.7, 354849.9 6690108.9, 354878.1 6690128, 354878.7 6690130.3, 354878.4 6690131.8, 354877.93948933214 6690132.778585169, 354891.76012082124 6690144.139358211, 354892.90943189716 6690144.645284051, 354893.8 6690144.2, 354898.1 6690146, 354898.5 6690145.1, 354900.2 6690145.8, 354900.4 6690145.4, 354906.7 6690148.1, 354906.6 6690148.6, 354908.6 6690149.5, 354908.4 6690150.4, 354912.7 6690152.3, 354913 6690153.2, 354913.12517810223 6690153.544239781, 354914.27988557203 6690154.05254111, 354924.21519597335 6690154.349709186, 354924.5 6690153.7, 354925.3 6690153, 354926.71894846985 6690152.9423777275, 354931.10027024744 6690142.886357495, 354930.5 6690142.9, 354929.6 6690142, 354930.8 6690138.9, 354934.2 6690129, 354936.3 6690123.7, 354937.1 6690121.5, 354939.4 6690115.1, 354948.8 6690088.7, 354950.7 6690083.4, 354952.33128129767 6690083.793757554, 354954.2695014279 6690080.312798994, 354954.4227857706 6690079.86021237, 354954.2 6690079.8, 354952 6690079.1, 354955.2 6690070.1, 354960.8 6690054.8, 354963.7 6690046.7, 354965.6 6690044.7, 354966.3056702625 6690044.969815101, 354973.46138362004 6690028.435765427, 354973.6485773471 6690028.181898649, 354971.2 6690027.4, 354988.6 6689979.8, 354987.7 6689978.9, 354987.3 6689978.1, 354987.2 6689977.5, 354986.5 6689976.6, 354986 6689975.3, 354986 6689974.5, 354986.3 6689973.4, 354986.8 6689972.2, 354987.5 6689971.5, 354988.5 6689970.7, 354989.6 6689970.1, 354989.9086205396 6689969.931661524, 354987.0678490354 6689956.413376011, 354985.7852418639 6689955.924601214, 354985.1 6689957.8, 354978.8 6689955.4, 354979 6689954.1, 354976.7 6689953.4, 354976.86900461715 6689952.526809478, 354975.7831257319 6689952.113003721, 354956.09904585785 6689944.648490452, 354955.8 6689945.6, 354955.5 6689946.4, 354929.6 6689951.7, 354928.22214322153 6689949.944935283, 354905.75191096566 6689937.690290156, 354907.2 6689939.2, 354903.4 6689946, 354903.2 6689946.7, 354897.4 6689962, 354891.8 6689978.3, 354886.8 6689978.9, 354886.2160388706 6689978.171896567, 354886.01103792235 6689978.183339026, 354883.495765262 6689995.640745046, 354883.45995217364 6689995.734551003, 354884.4 6689997, 354871.7 6690032, 354869.8188438638 6690032.027529114, 354866.2455482223 6690044.245206576, 354865.40770120325 6690046.42692771, 354866.7 6690047.1, 354858.9 6690068.2, 354857.20857167593 6690067.77714292, 354856.5757059018 6690069.425100843, 354858.5 6690069.7, 354851.9 6690087.5, 354854.6 6690091.3, 354848.29569102044 6690096.180755339, 354847.0686055335 6690097.254562606))
-15;Place du Bon Pasteur;irregular;1090356;POLYGON ((355141.6078428579 6689444.353822195, 355167.6819064689 6689448.536933502, 355167.92316250375 6689447.1401630575, 355166.6 6689446.9, 355169.4 6689432.6, 355169.81487268396 6689431.6430270085, 355163.6133552135 6689419.895575613, 355161 6689417.5, 355152.1 6689409.1, 355150.6946110989 6689407.0779608665, 355144.69396526535 6689427.404549804, 355145.5 6689429, 355144.8 6689432.4, 355142.9 6689442.7, 355141.9211298636 6689442.526272598, 355141.6078428579 6689444.353822195, 355141.6078428579 6689444.353822195, 355141.6078428579 6689444.353822195, 355141.6078428579 6689444.353822195, 355141.6078428579 6689444.353822195, 355141.6078428579 6689444.353822195, 355141.6078428579 6689444.353822195, 355141.6078428579 6689444.353822195, 355141.6078428579 6689444.353822195, 355141.6078428579 6689444.353822195, 355141.6078428579 6689444.353822195, 355141.6078428579 6689444.353822195, 355141.6078428579 6689444.353822195, 355141.6078428579 6689444.353822195, 355141.6078428579 6689444.353822195, 355141.6078428579 6689444.353822195), (355154.1 6689442.1, 355152.5 6689439.8, 355152.4 6689437.1, 355153.7 6689435, 355154 6689432.3, 355158.4 6689431.9, 355159.5 6689434.1, 355161.3 6689435.9, 355161.8 6689438.5, 355160.9 6689441, 355158.9 6689442.5, 355156.3 6689442.9, 355154.1 6689442.1, 355154.1 6689442.1, 355154.1 6689442.1, 355154.1 6689442.1, 355154.1 6689442.1, 355154.1 6689442.1, 355154.1 6689442.1, 355154.1 6689442.1, 355154.1 6689442.1, 355154.1 6689442.1, 355154.1 6689442.1, 355154.1 6689442.1, 355154.1 6689442.1, 355154.1 6689442.1, 355154.1 6689442.1, 355154.1 6689442.1))
-16;Place Catinat;circular;1090477;POLYGON ((354078.3367079489 6689130.42790312, 354078.3876254599 6689130.959675118, 354080.1 6689131.4, 354080.1 6689132.8, 354080.2 6689134.3, 354080.4 6689135.7, 354080.7 6689137.1, 354081.1 6689138.5, 354079.3383544788 6689139.322101244, 354084.5094849004 6689146.33322014, 354085.3 6689145.9, 354086.5 6689147, 354087.8 6689147.9, 354089.2 6689148.8, 354090.6 6689149.6, 354092.1 6689150.2, 354093.6 6689150.8, 354092.7867683747 6689152.066508269, 354094.36339259986 6689153.02475985, 354101.2032785008 6689154.387783272, 354102.1 6689153, 354104.2 6689152.8, 354106.5 6689152.4, 354108 6689153.9, 354110.5 6689150.8, 354112.2 6689149.9, 354113.9 6689148.7, 354115.1 6689147.7, 354116.2 6689146.6, 354117.5 6689145.1, 354118.6 6689143.6, 354119.2 6689142.6, 354120.4228257624 6689142.971214963, 354126.6576665395 6689122.076272122, 354125.2 6689121.3, 354123.9 6689115.4, 354124.65109284257 6689114.285044403, 354113.4697965268 6689112.721867575, 354112.47763109783 6689112.347528299, 354111.9 6689113.2, 354111 6689112.5, 354109.9 6689111.9, 354108.8 6689111.3, 354107.7 6689110.8, 354106.5 6689110.4, 354105.4 6689110.1, 354105.2825073419 6689109.862239266, 354092.6496014391 6689110.577061601, 354092.37599715014 6689110.785779785, 354093.2 6689112.5, 354092.8 6689112.7, 354092.1 6689112.9, 354091.1 6689113.4, 354090.5 6689113.7, 354089.7 6689114.2, 354089 6689114.7, 354088.4 6689115.1, 354087.6 6689115.7, 354087.2 6689116.1, 354086.4 6689116.7, 354085.2 6689118.2, 354084.5 6689119, 354083.9 6689119.9, 354083.4 6689120.8, 354082.9 6689121.5, 354082.4 6689121.5, 354080.7368505471 6689120.956704512, 354078.3367079489 6689130.42790312))
-17;Place Saint Elisabeth;irregular;1092380;POLYGON ((354946.020538987 6689855.750168548, 354936.95634053735 6689861.198356428, 354938.7 6689862.9, 354938 6689863.8, 354947.3 6689872.2, 354947.6 6689871.9, 354961.8 6689884.1, 354962.7 6689884.9, 354963.5 6689885.7, 354964.3 6689886.6, 354964.9 6689887.5, 354965.5 6689888.5, 354966 6689889.5, 354966.4 6689890.6, 354966.7856571462 6689891.660557152, 355009.8958951263 6689817.256564065, 355007.17539774836 6689818.581670791, 355005.5 6689820.1, 355000.5 6689822.7, 354995.5 6689825.5, 354989.2 6689829.1, 354981.2 6689833.6, 354980.2955595177 6689832.352495886, 354980.01262044505 6689832.50162296, 354973.089723321 6689835.47809578, 354972.8709794825 6689835.615184391, 354973.8 6689836.9, 354973.5 6689837.6, 354966.4 6689841.7, 354957.6 6689848.3, 354947.7 6689857, 354946.020538987 6689855.750168548))
-18;Place Saint Nicolas;;1090951;POLYGON ((355218.91554666875 6689391.297493401, 355229.03798314644 6689391.337983146, 355228.7 6689391, 355228.7 6689389.7, 355229.1 6689388.7, 355230.1 6689388.7, 355231.1 6689389.4, 355231.9 6689389.4, 355232 6689390.7, 355233.6 6689390.8, 355234.1 6689389.3, 355234.6 6689389.3, 355234.6 6689388.3, 355235.8 6689388.3, 355235.7 6689389.2, 355237.7 6689389.2, 355239.3 6689389.2, 355239.3 6689387, 355238.8 6689387.1, 355238.7 6689386.4, 355237.9 6689386.4, 355237.8 6689385.4, 355238.9 6689385.4, 355238.8 6689384.7, 355239.5 6689384.7, 355239.5 6689383.9, 355240.6 6689383.9, 355240.5 6689384.7, 355240.9 6689384.7, 355242.2 6689386.3, 355242.1 6689387, 355245.8 6689386.9, 355245.8 6689386, 355247.5 6689384.5, 355247.9 6689384.6, 355247.9 6689383.7, 355248.9 6689383.7, 355248.9 6689384.4, 355249.4 6689384.5, 355249.4 6689385, 355250.3 6689385.1, 355250.4 6689386.1, 355249.4 6689386.3, 355249.3 6689386.8, 355248.9 6689386.9, 355249 6689389, 355250.5 6689389, 355252.9 6689389, 355252.9 6689388, 355254 6689387.9, 355254.1 6689389, 355254.5 6689389, 355255 6689390.3, 355256.6 6689390.3, 355256.6 6689388.9, 355257.4 6689388.9, 355258 6689388, 355258.8 6689388, 355259.8 6689388.9, 355259.8 6689390, 355259.1 6689390.5, 355259.2 6689390.7, 355258.4443912212 6689391.455608779, 355270.05674713734 6689391.502058202, 355270 6689387.7, 355269.8 6689371.1, 355267.9 6689369.6, 355277.3 6689352.9, 355277.59346012713 6689352.841307974, 355277.59346012713 6689347.883407384, 355270.4 6689347, 355267.1 6689346.6, 355262.8 6689346, 355249.1 6689346.9, 355235.8 6689347.7, 355234.6 6689345.8, 355234.705216881 6689345.606957458, 355222.3 6689347.4, 355220.50524454995 6689346.608196125, 355217.49665568 6689355.182674404, 355218.7 6689355.7, 355218.9 6689360.8, 355218.6 6689361, 355218.8 6689368.2, 355218.5 6689375.7, 355215.5 6689375.7, 355215.5 6689376.9, 355213.6 6689376.9, 355213.5 6689378.5, 355214.1 6689378.5, 355214.5 6689378.9, 355215 6689379.5, 355218.6 6689379.5, 355218.7 6689384.4, 355218.91554666875 6689391.297493401))
-19;Place de Bretagne;;1090403;POLYGON ((355132.3 6689681, 355153 6689699.7, 355155.1 6689701.1, 355157.2 6689702.4, 355159.4 6689703.7, 355161.7 6689704.8, 355164 6689705.7, 355169.4 6689707.8, 355174.9 6689709.7, 355180.4 6689711.4, 355186.1 6689712.9, 355191.7 6689714.2, 355230.5 6689714.8, 355233.1 6689715, 355236.6 6689715.4, 355237 6689709.1, 355235.4 6689709, 355235.7 6689705.3, 355236.3 6689705.3, 355236.8 6689695.9, 355234.6 6689695.7, 355228.8 6689695.2, 355225.5 6689695.1, 355227.2 6689681.9, 355223 6689670.7, 355205.3 6689657.2, 355205.1 6689657, 355201.2 6689654.2, 355201.1 6689651.9, 355200.4 6689649, 355198.4 6689644.2, 355217.9 6689617.6, 355202.7 6689597.4, 355196.6 6689604.6, 355183.6 6689617.2, 355177.6 6689622.9, 355176 6689621.2, 355171 6689623.1, 355165.1 6689622.2, 355163.7 6689623.5, 355136.8 6689595.9, 355124.1 6689586.5, 355114.8 6689594.6, 355108.7 6689600.6, 355104.4608695572 6689604.62717392, 355091.6 6689617.1, 355111.5 6689641.2, 355118 6689657.1, 355123.7 6689668.6, 355132.3 6689680.7, 355132.3 6689681))
-20;Place du Bouffay;;1090370;POLYGON ((355551.6 6689329.5, 355550.07485454605 6689336.585296951, 355558.7 6689335.1, 355558.8 6689334.5, 355572.2 6689337.8, 355572.4 6689337.2, 355582.7 6689339.8, 355582.6 6689340.4, 355595.9 6689343.8, 355596.4 6689345.3, 355606 6689348.7, 355607.63678646943 6689341.152595725, 355607.4 6689341, 355607.8 6689340.4, 355605.4 6689338.8, 355607.4 6689330.8, 355609.8 6689331.4, 355609.9 6689331.1, 355616.8 6689320.6, 355617.4 6689319.7, 355619.5956994446 6689316.607465571, 355611.4 6689314.5, 355613.4 6689306.5, 355560.4 6689294.1, 355551.6 6689329.5))
-21;Place Rene Bouhier;;1092281;POLYGON ((354233.6 6688855, 354256.5 6688849.9, 354273.3 6688842, 354278.4 6688833.2, 354273 6688821.3, 354268.2 6688805.7, 354262.2 6688804.3, 354259.5 6688798.3, 354264.1 6688772.6, 354266.2 6688761, 354270.9 6688752.8, 354271.5 6688752.4, 354256.9 6688733.5, 354228.3 6688749.7, 354217.7 6688755.2, 354206.9 6688761.5, 354191.1 6688770.5, 354172.7 6688781, 354171.19495327084 6688781.889345794, 354171.2 6688781.9, 354168.3 6688783.6, 354201.2 6688814.3, 354215.1 6688819.9, 354219.5 6688828.8, 354229.0818319158 6688846.604538737, 354229.5 6688846.4, 354233.6 6688855, 354233.6 6688855, 354233.6 6688855, 354233.6 6688855, 354233.6 6688855, 354233.6 6688855, 354233.6 6688855, 354233.6 6688855), (354201.7 6688792.8, 354209.4 6688796.1, 354207.9 6688799.6, 354200.2 6688796.4, 354201.7 6688792.8, 354201.7 6688792.8, 354201.7 6688792.8, 354201.7 6688792.8, 354201.7 6688792.8, 354201.7 6688792.8, 354201.7 6688792.8, 354201.7 6688792.8))
-22;Place du Change;;1090504;POLYGON ((355432.5 6689425.6, 355434.3 6689439, 355447.5 6689442.4, 355457.7015006621 6689445.4527217895, 355459.3 6689437.7, 355463.1 6689438.9, 355466 6689428.6, 355468.9 6689417.2, 355474 6689414.7, 355477 6689404.3, 355470.5 6689401.2, 355469.1 6689398.5, 355459.9 6689395.5, 355457.6 6689396.5, 355453.1 6689405, 355454.4 6689407.7, 355452.8 6689415.3, 355451.9 6689419.5, 355451.6 6689419.8, 355445.9 6689421.5, 355442.1 6689422.7, 355436.8 6689424.3, 355432.5 6689425.6))
-"""
+        _sio = AbstractGeoDataFrameDemos._dataset(
+            "GeoDataFrameDemos", "squaresInNantes.csv"
         )
         squares = GeoDataFrameLib.read_csv(_sio)
         if not filter is None:
@@ -504,10 +260,8 @@ BDT_3-0_SHP_LAMB93_D044-ED2021-12-15/BATI/BATIMENT.shp')
         _building = buildings.loc[ buildings[buildings.ID == 'BATIMENT0000000302909608'].index ]
         _building.to_csv('/tmp/building.csv', sep=';', index=False)
         """
-        _sio = StringIO(
-            """ID;NATURE;USAGE1;USAGE2;LEGER;ETAT;DATE_CREAT;DATE_MAJ;DATE_APP;DATE_CONF;SOURCE;ID_SOURCE;PREC_PLANI;PREC_ALTI;NB_LOGTS;NB_ETAGES;MAT_MURS;MAT_TOITS;HAUTEUR;Z_MIN_SOL;Z_MIN_TOIT;Z_MAX_TOIT;Z_MAX_SOL;ORIGIN_BAT;APP_FF;geometry
-BATIMENT0000000302909608;Indifférenciée;Commercial et services;;Non;En service;2012-06-19 17:58:16;2019-07-01 11:16:34;;;;;3.0;2.5;;;;;4.1;42.1;46.2;;;Cadastre;;POLYGON Z ((353904.8 6695053.6 46.2, 353898.4 6695053.2 46.2, 353896.7 6695050.7 46.2, 353884 6695049.8 46.2, 353880.9 6695052.6 46.2, 353880.6 6695054.3 46.2, 353872.8 6695053.5 46.2, 353871.9 6695061 46.2, 353868.6 6695060.9 46.2, 353868.9 6695065.8 46.2, 353869 6695068.4 46.2, 353869.6 6695075.7 46.2, 353872 6695075.9 46.2, 353872.4 6695074 46.2, 353874.2 6695074.2 46.2, 353874.2 6695075.4 46.2, 353880.2 6695076 46.2, 353880.4 6695074.8 46.2, 353891 6695075.8 46.2, 353891.4 6695074 46.2, 353894.3 6695074.3 46.2, 353894.1 6695076.1 46.2, 353901.3 6695076.9 46.2, 353900.9 6695079.8 46.2, 353908.7 6695080.5 46.2, 353908.7 6695081.3 46.2, 353911.2 6695081.5 46.2, 353911.3 6695080.8 46.2, 353917.8 6695081.6 46.2, 353918.7 6695073.6 46.2, 353917 6695073.4 46.2, 353917.1 6695071.3 46.2, 353918.9 6695071.5 46.2, 353919.2 6695068.4 46.2, 353918.3 6695068.2 46.2, 353919.1 6695060.8 46.2, 353920.2 6695060.9 46.2, 353920.5 6695058.5 46.2, 353917.2 6695058.2 46.2, 353917.7 6695053.9 46.2, 353919.3 6695054 46.2, 353919.7 6695052 46.2, 353927.3 6695052.6 46.2, 353927.9 6695043.3 46.2, 353922.4 6695040.6 46.2, 353923.7 6695038.8 46.2, 353930.1 6695038.4 46.2, 353932.9 6695031.7 46.2, 353930 6695030.5 46.2, 353932.1 6695025.5 46.2, 353941.2 6695028.9 46.2, 353943.2 6695022.3 46.2, 353939.9 6695021.1 46.2, 353942.6 6695014 46.2, 353934.8 6695011.1 46.2, 353933.6 6695013.9 46.2, 353926.8 6695011.2 46.2, 353925.4 6695014.9 46.2, 353918.5 6695012.3 46.2, 353916.9 6695013.2 46.2, 353916.1 6695011.7 46.2, 353914.5 6695012.4 46.2, 353909.3 6695001 46.2, 353902 6695004.3 46.2, 353902.4 6695005.1 46.2, 353894.5 6695008.9 46.2, 353897.8 6695015.9 46.2, 353896.2 6695016.7 46.2, 353897.6 6695019.9 46.2, 353899.3 6695019.2 46.2, 353902 6695025.3 46.2, 353906.9 6695023.1 46.2, 353908.3 6695026 46.2, 353911.8 6695024.4 46.2, 353917.4 6695026.8 46.2, 353911.7 6695040.1 46.2, 353911.6 6695040.1 46.2, 353911.6 6695040.2 46.2, 353911.7 6695040.3 46.2, 353911.8 6695040.3 46.2, 353911.9 6695040.4 46.2, 353912 6695040.4 46.2, 353912.3 6695040.4 46.2, 353912.5 6695040.4 46.2, 353912.8 6695040.4 46.2, 353912.8 6695040.3 46.2, 353913.2 6695040.3 46.2, 353913.2 6695040.4 46.2, 353913.3 6695040.4 46.2, 353913.4 6695040.4 46.2, 353913.5 6695040.4 46.2, 353913.6 6695040.4 46.2, 353913.7 6695040.5 46.2, 353913.8 6695040.6 46.2, 353914 6695040.6 46.2, 353914 6695040.7 46.2, 353914.1 6695040.8 46.2, 353914.2 6695040.8 46.2, 353914.5 6695041 46.2, 353914.5 6695041.1 46.2, 353914.7 6695041.3 46.2, 353914.8 6695041.3 46.2, 353914.8 6695041.4 46.2, 353915 6695041.6 46.2, 353915 6695041.7 46.2, 353915.1 6695041.8 46.2, 353915.2 6695042 46.2, 353915.2 6695042.1 46.2, 353915.2 6695042.2 46.2, 353915.3 6695042.2 46.2, 353915.3 6695042.3 46.2, 353915.3 6695042.4 46.2, 353915.4 6695042.6 46.2, 353915.4 6695042.7 46.2, 353915.4 6695042.9 46.2, 353915.4 6695043.2 46.2, 353915.4 6695043.3 46.2, 353915.4 6695043.4 46.2, 353915.4 6695043.5 46.2, 353915.4 6695043.6 46.2, 353915.3 6695043.7 46.2, 353915.3 6695043.8 46.2, 353915.3 6695044 46.2, 353915.2 6695044.1 46.2, 353915.2 6695044.2 46.2, 353915.1 6695044.3 46.2, 353915 6695044.4 46.2, 353914.9 6695044.5 46.2, 353914.8 6695044.6 46.2, 353913.7 6695044.9 46.2, 353905.3 6695049.2 46.2, 353904.8 6695053.6 46.2))
-"""
+        _sio = AbstractGeoDataFrameDemos._dataset(
+            "GeoDataFrameDemos", "singleBuildingInNantes.csv"
         )
         return GeoDataFrameLib.read_csv(_sio)
 
@@ -20,7 +20,6 @@ GNU General Public License for more details.
 You should have received a copy of the GNU General Public License
 along with t4gpd.  If not, see <https://www.gnu.org/licenses/>.
 '''
-from io import StringIO
 
 from t4gpd.commons.GeoDataFrameLib import GeoDataFrameLib
 from t4gpd.demos.AbstractGeoDataFrameDemos import AbstractGeoDataFrameDemos
@@ -46,9 +45,9 @@ class GeoDataFrameDemos3(AbstractGeoDataFrameDemos):
      
         pasDuLoup.to_csv('/tmp/pasDuLoup.csv', sep=';', index=False)
         '''
-        _sio = StringIO("""INSEE_COM;NOM_COM;IRIS;CODE_IRIS;NOM_IRIS;TYP_IRIS;geometry
-34172;Montpellier;1402;341721402;Pas du Loup;H;POLYGON ((768655.2 6278359.9, 768634.3 6278345.7, 768612 6278334, 768598.2 6278327.4, 768585.9 6278321.9, 768574.6 6278316.2, 768539.3 6278294.1, 768529.2 6278286.8, 768528 6278285.9, 768505.4 6278264.9, 768486.7 6278247.5, 768469.4 6278230.4, 768456.5 6278217.5, 768449.6 6278206.1, 768447.9 6278195.1, 768439.5 6278194.9, 768438.1 6278194.6, 768436.3 6278193.7, 768434.4 6278192.2, 768418.1 6278167.9, 768381.5 6278107.3, 768353.5 6278054.7, 768334.3 6278012.1, 768333.9 6278011.3, 768318 6277982, 768305.9 6277960.8, 768270.2 6277899.9, 768256.1 6277878.6, 768230 6277893.1, 768183.4 6277920.6, 768169.8 6277929.4, 768145.5 6277945.5, 768122.5 6277961.8, 768108.7 6277972.7, 768095 6277985.2, 768078.6 6278000.2, 768061.5 6278017.5, 768055.1 6278024.7, 768034.6 6278048.3, 768020.7 6278066.7, 768002.7 6278092.3, 767999 6278097.5, 768005.2 6278103.8, 768048.8 6278151.5, 768068.7 6278174.1, 768081.3 6278187.7, 768105.6 6278210.2, 768119 6278221, 768175 6278261.8, 768182.9 6278267.55, 768264.8 6278326.7, 768283.5 6278339, 768315.4 6278358.4, 768339.5 6278371.4, 768377.9 6278387.4, 768401.5 6278393.4, 768433.9 6278399.7, 768476.7 6278404.6, 768494.9 6278405.5, 768512.9 6278404.9, 768522.7 6278403.6, 768531.7 6278401.4, 768544.8 6278396.8, 768557.1 6278391.6, 768590.8 6278375.3, 768609.1 6278366, 768614.7 6278364.1, 768631.8 6278360.5, 768644.8 6278358.8, 768650 6278358.9, 768655.2 6278359.9))
-""")
+        _sio = AbstractGeoDataFrameDemos._dataset(
+            "GeoDataFrameDemos3", "irisPasDuLoupInMontpellier.csv"
+        )
         return GeoDataFrameLib.read_csv(_sio)
 
     @staticmethod
@@ -63,774 +62,9 @@ BDT_3-0_SHP_LAMB93_D034-ED2021-12-15/BATI/BATIMENT.shp', bbox=grid)
         
         buildings.to_csv('/tmp/pasDuLoup-buildings.csv', sep=';', index=True)
         '''
-        _sio = StringIO("""ID;NATURE;USAGE1;USAGE2;LEGER;ETAT;DATE_CREAT;DATE_MAJ;DATE_APP;DATE_CONF;SOURCE;ID_SOURCE;PREC_PLANI;PREC_ALTI;NB_LOGTS;NB_ETAGES;MAT_MURS;MAT_TOITS;HAUTEUR;Z_MIN_SOL;Z_MIN_TOIT;Z_MAX_TOIT;Z_MAX_SOL;ORIGIN_BAT;APP_FF;geometry
-BATIMENT0000000211110237;Indifférenciée;Indifférencié;;Non;En service;2008-11-18 15:19:53;2017-03-30 17:33:13;;;;;5.0;1.0;;;;;4.8;55.9;60.7;61.5;58.2;Cadastre;;POLYGON Z ((768652.4 6278006.5 60.6, 768654.5 6278004 60.6, 768651.5 6278001.6 60.6, 768649.3 6278004.2 60.6, 768652.4 6278006.5 60.6))
-BATIMENT0000000211110638;Eglise;Religieux;;Non;En service;2008-11-18 15:19:53;;;;;;3.0;2.5;;;;;3.7;44.9;48.6;;;Cadastre;;POLYGON Z ((768623 6278463.9 48.6, 768619.6 6278461.5 48.6, 768612 6278456.2 48.6, 768609.3 6278460 48.6, 768604.3 6278456.5 48.6, 768594.8 6278469.2 48.6, 768599.9 6278472.8 48.6, 768593.9 6278480.8 48.6, 768605.9 6278489.8 48.6, 768608.3 6278486.4 48.6, 768609.7 6278487.4 48.6, 768610.4 6278486.4 48.6, 768613.3 6278488.6 48.6, 768625.4 6278471.9 48.6, 768621.1 6278468.8 48.6, 768624 6278464.6 48.6, 768623 6278463.9 48.6))
-BATIMENT0000000211110170;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;1965-01-01;;;;3.0;1.0;1.0;1.0;45.0;10.0;7.1;54.9;62.0;63.0;56.2;Cadastre;A 1.0;POLYGON Z ((768583.6 6278042.4 62, 768589 6278034.3 62, 768577.3 6278026.4 62, 768572 6278034.4 62, 768583.6 6278042.4 62))
-BATIMENT0000000211117300;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:25:44;;;;;;5.0;9999.0;;;;;0.0;53.7;;;;Cadastre;;POLYGON Z ((768762 6277972.4 -1000, 768763.2 6277971 -1000, 768762 6277969.6 -1000, 768760.5 6277971.1 -1000, 768762 6277972.4 -1000))
-BATIMENT0000000211117194;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:25:44;2015-07-20 14:31:58;;;;;3.0;2.5;;;;;6.9;43.1;50.0;;;Cadastre;;POLYGON Z ((768138.2 6277882 50, 768152.3 6277875 50, 768151 6277872.3 50, 768136.9 6277879.2 50, 768138.2 6277882 50))
-BATIMENT0000000211110568;Indifférenciée;Commercial et services;;Non;En service;2008-11-18 15:19:53;2019-07-29 10:55:42;;;;;3.0;1.0;0.0;1.0;;;4.3;46.3;50.6;50.7;49.3;Cadastre;A 1.0;POLYGON Z ((768439.5 6278266.8 50.5, 768446 6278268.7 50.5, 768449.6 6278255.7 50.5, 768442.9 6278253.7 50.5, 768439.5 6278266.8 50.5))
-BATIMENT0000000211117219;Indifférenciée;Commercial et services;;Non;En service;2008-11-18 15:25:44;2019-07-29 10:55:49;;;;;3.0;2.5;;;;;9.7;48.0;57.7;58.5;50.1;Cadastre;;POLYGON Z ((768382.1 6277868.9 57.7, 768389.1 6277863.7 57.7, 768392.9 6277868.8 57.7, 768407.6 6277858 57.7, 768403.8 6277852.7 57.7, 768402.3 6277850.7 57.7, 768397 6277843.3 57.7, 768394.8 6277840.3 57.7, 768382.3 6277849.5 57.7, 768379.3 6277851.6 57.7, 768381.6 6277854.8 57.7, 768375.5 6277859.2 57.7, 768372.5 6277855.2 57.7, 768368.5 6277858.1 57.7, 768364 6277861.5 57.7, 768366.4 6277864.9 57.7, 768378 6277880.6 57.7, 768379.3 6277879.7 57.7, 768380.6 6277878.7 57.7, 768384.2 6277876.1 57.7, 768380 6277870.4 57.7, 768382.1 6277868.9 57.7))
-BATIMENT0000000211117220;Indifférenciée;Commercial et services;;Oui;En service;2008-11-18 15:25:44;2019-07-29 10:55:49;;;;;3.0;2.5;;;;;9.6;48.0;57.6;57.7;49.6;Cadastre;;POLYGON Z ((768409.4 6277845.6 57.6, 768402.3 6277850.7 57.6, 768403.8 6277852.7 57.6, 768410.8 6277847.7 57.6, 768409.4 6277845.6 57.6))
-BATIMENT0000000211117222;Indifférenciée;Commercial et services;;Oui;En service;2008-11-18 15:25:44;2019-07-29 10:55:49;;;;;3.0;2.5;;;;;9.7;48.0;57.7;58.0;49.1;Cadastre;;POLYGON Z ((768384.2 6277876.1 57.7, 768380.6 6277878.7 57.7, 768382.9 6277881.9 57.7, 768386.5 6277879.2 57.7, 768384.2 6277876.1 57.7))
-BATIMENT0000000211117224;Indifférenciée;Commercial et services;;Oui;En service;2008-11-18 15:25:44;2019-07-29 10:55:49;;;;;3.0;2.5;;;;;9.7;48.0;57.7;58.4;50.0;Cadastre;;POLYGON Z ((768433.4 6277874.8 57.7, 768431.1 6277871.5 57.7, 768417.1 6277852.4 57.7, 768414.9 6277849.3 57.7, 768413 6277846.6 57.7, 768406 6277836.9 57.7, 768404.2 6277838.3 57.7, 768409.4 6277845.6 57.7, 768410.8 6277847.7 57.7, 768415.2 6277853.8 57.7, 768434 6277879.5 57.7, 768435.8 6277878.2 57.7, 768433.4 6277874.8 57.7))
-BATIMENT0000000211117225;Indifférenciée;Commercial et services;;Non;En service;2008-11-18 15:25:44;2019-07-29 10:55:49;;;;;3.0;2.5;;;;;7.8;48.0;55.8;58.2;49.5;Cadastre;;POLYGON Z ((768438.5 6277871.2 55.8, 768446.4 6277865.5 55.8, 768439.8 6277856.3 55.8, 768432.2 6277845.9 55.8, 768430.2 6277843.1 55.8, 768421.1 6277849.6 55.8, 768417.1 6277852.4 55.8, 768431.1 6277871.5 55.8, 768433.4 6277874.8 55.8, 768437.3 6277872 55.8, 768438.5 6277871.2 55.8))
-BATIMENT0000000211117240;Indifférenciée;Commercial et services;;Non;En service;2008-11-18 15:25:44;2019-07-29 10:55:49;;;;;3.0;2.5;;;;;9.6;48.0;57.6;58.3;49.1;Cadastre;;POLYGON Z ((768438.1 6277880.7 57.6, 768451.2 6277898.5 57.6, 768454.8 6277895.9 57.6, 768464 6277889.1 57.6, 768451 6277871.4 57.6, 768438.1 6277880.7 57.6))
-BATIMENT0000000211117242;Indifférenciée;Commercial et services;;Non;En service;2008-11-18 15:25:44;2019-07-29 10:55:49;;;;;3.0;2.5;;;;;10.2;48.0;58.2;58.5;50.2;Cadastre;;POLYGON Z ((768406 6277836.9 58.2, 768413 6277846.6 58.2, 768425.9 6277837.4 58.2, 768419 6277827.8 58.2, 768406 6277836.9 58.2))
-BATIMENT0000000211117241;Indifférenciée;Commercial et services;;Oui;En service;2008-11-18 15:25:44;2019-07-29 10:55:49;;;;;3.0;1.0;;;;;9.7;47.0;56.7;58.3;47.2;Cadastre;;POLYGON Z ((768439.9 6277947.9 56.7, 768442.8 6277945.7 56.7, 768443 6277945.5 56.7, 768443.2 6277945.3 56.7, 768443.3 6277945 56.7, 768443.3 6277944.8 56.7, 768443.4 6277944.4 56.7, 768443.4 6277944.2 56.7, 768443.3 6277943.9 56.7, 768443.3 6277943.7 56.7, 768443.2 6277943.5 56.7, 768443 6277943.3 56.7, 768442.9 6277943.1 56.7, 768442.7 6277942.9 56.7, 768442.5 6277942.7 56.7, 768442.3 6277942.6 56.7, 768442.1 6277942.6 56.7, 768441.9 6277942.5 56.7, 768441.7 6277942.5 56.7, 768441.4 6277942.5 56.7, 768441.2 6277942.5 56.7, 768440.9 6277942.5 56.7, 768440.8 6277942.6 56.7, 768440.6 6277942.7 56.7, 768437.6 6277944.8 56.7, 768439.9 6277947.9 56.7))
-BATIMENT0000000211117229;Indifférenciée;Commercial et services;;Oui;En service;2008-11-18 15:25:44;2019-07-29 10:55:49;;;;;3.0;2.5;;;;;9.7;48.0;57.7;57.8;49.1;Cadastre;;POLYGON Z ((768403.3 6277902.1 57.7, 768399.7 6277904.7 57.7, 768401.8 6277907.5 57.7, 768405.4 6277904.9 57.7, 768403.3 6277902.1 57.7))
-BATIMENT0000000211116336;Eglise;Religieux;;Non;En service;2008-11-18 15:25:02;2015-05-18 13:10:15;;;;;3.0;2.5;;;;;5.2;37.1;42.3;;;Cadastre;;POLYGON Z ((767838.1 6277919.5 42.3, 767854.9 6277901.2 42.3, 767846.7 6277893.6 42.3, 767829.8 6277911.6 42.3, 767828.3 6277913.2 42.3, 767827.3 6277912.3 42.3, 767820.4 6277920.1 42.3, 767830.6 6277929.7 42.3, 767837.7 6277922.1 42.3, 767836.7 6277921 42.3, 767838.1 6277919.5 42.3))
-BATIMENT0000000211110229;Indifférenciée;Indifférencié;;Non;En service;2008-11-18 15:19:53;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;19.1;41.9;61.0;61.5;46.8;Cadastre;;POLYGON Z ((768682.6 6278204.7 61, 768686.5 6278200.6 61, 768682.4 6278197 61, 768678.7 6278200.8 61, 768682.6 6278204.7 61))
-BATIMENT0000000211110176;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;7.9;59.1;67.0;69.0;59.5;Cadastre;;POLYGON Z ((768645.5 6278091.8 67, 768644.6 6278090 67, 768640.7 6278091.9 67, 768641.7 6278093.7 67, 768645.5 6278091.8 67))
-BATIMENT0000000211110178;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;16.6;58.9;75.5;77.4;59.2;Cadastre;;POLYGON Z ((768623.6 6278102.2 75.5, 768627.5 6278100.4 75.5, 768626.7 6278098.4 75.5, 768622.7 6278100.4 75.5, 768623.6 6278102.2 75.5))
-BATIMENT0000000211110181;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;9.8;59.0;68.8;71.5;59.4;Cadastre;;POLYGON Z ((768641.7 6278093.7 68.7, 768640.7 6278091.9 68.7, 768636.4 6278094 68.7, 768637.3 6278095.7 68.7, 768641.7 6278093.7 68.7))
-BATIMENT0000000211110228;Indifférenciée;Indifférencié;;Non;En service;2008-11-18 15:19:53;2017-03-30 17:33:13;;;;;5.0;1.0;;;;;2.5;55.9;58.4;58.6;58.1;Cadastre;;POLYGON Z ((768653.5 6278002.2 58.4, 768654.5 6278000.9 58.4, 768653.3 6278000 58.4, 768652.4 6278001.3 58.4, 768653.5 6278002.2 58.4))
-BATIMENT0000000211110554;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;6.3;40.7;47.0;47.4;41.1;Cadastre;;POLYGON Z ((768634 6278270.3 47, 768637.9 6278266.1 47, 768631.7 6278260.3 47, 768631.1 6278259.8 47, 768627.2 6278264 47, 768633.1 6278269.4 47, 768634 6278270.3 47))
-BATIMENT0000000211110555;Indifférenciée;Indifférencié;;Non;En service;2008-11-18 15:19:53;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;5.1;40.7;45.8;47.1;41.2;Cadastre;;POLYGON Z ((768624.9 6278262 45.7, 768622.2 6278265 45.7, 768633.3 6278275.3 45.7, 768636.1 6278272.3 45.7, 768634 6278270.3 45.7, 768633.1 6278269.4 45.7, 768627.2 6278264 45.7, 768624.9 6278262 45.7))
-BATIMENT0000000211116924;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:25:44;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;3.6;49.9;53.5;54.7;50.2;Cadastre;;POLYGON Z ((768811.4 6277822.5 53.4, 768809.7 6277818.9 53.4, 768806.5 6277820.5 53.4, 768808.3 6277824 53.4, 768811.4 6277822.5 53.4))
-BATIMENT0000000211117256;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:25:44;2017-03-30 17:33:13;;;;;5.0;1.0;;;;;3.3;53.2;56.5;58.0;53.7;Cadastre;;POLYGON Z ((768618.2 6277959.1 56.5, 768621.1 6277954.6 56.5, 768618.6 6277953.1 56.5, 768615.8 6277957.3 56.5, 768618.2 6277959.1 56.5))
-BATIMENT0000000211117308;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:25:44;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;6.4;47.6;54.0;55.4;48.0;Cadastre;;POLYGON Z ((768833.9 6277932.4 54, 768835.7 6277931.8 54, 768833.7 6277926.4 54, 768832 6277927 54, 768833.9 6277932.4 54))
-BATIMENT0000000211117297;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:25:44;2017-03-30 17:33:13;;;;;5.0;1.0;;;;;2.8;52.2;55.0;55.3;52.6;Cadastre;;POLYGON Z ((768748.9 6277916.5 55, 768750 6277915.3 55, 768748.4 6277913.8 55, 768747.5 6277914.8 55, 768748.9 6277916.5 55))
-BATIMENT0000000211117299;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:25:44;2017-03-30 17:33:13;;;;;5.0;1.0;;;;;1.8;53.2;55.0;56.5;53.6;Cadastre;;POLYGON Z ((768750.8 6277958.3 55, 768751.9 6277956.8 55, 768750.7 6277955.3 55, 768749.2 6277956.7 55, 768750.8 6277958.2 55, 768750.8 6277958.3 55))
-BATIMENT0000000211117301;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:25:44;2017-03-30 17:33:13;;;;;5.0;1.0;;;;;2.2;53.3;55.5;55.8;53.5;Cadastre;;POLYGON Z ((768719 6277918.2 55.4, 768720.5 6277916.9 55.4, 768719.1 6277915.2 55.4, 768717.5 6277916.6 55.4, 768719 6277918.2 55.4))
-BATIMENT0000000211117330;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:25:44;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;5.0;48.3;53.3;54.3;48.7;Cadastre;;POLYGON Z ((768824 6277856.9 53.2, 768825.2 6277856.1 53.2, 768824.3 6277854.3 53.2, 768823 6277854.9 53.2, 768824 6277856.9 53.2))
-BATIMENT0000000211117332;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:25:44;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;8.0;55.8;63.8;64.4;55.9;Cadastre;;POLYGON Z ((768667.8 6277980.1 63.7, 768668.4 6277979.4 63.7, 768668.9 6277978.6 63.7, 768666.7 6277976.9 63.7, 768666.1 6277977.6 63.7, 768665.5 6277978.4 63.7, 768667.8 6277980.1 63.7))
-BATIMENT0000000211117335;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:25:44;2017-03-30 17:33:13;;;;;5.0;1.0;;;;;3.5;55.8;59.3;61.5;56.1;Cadastre;;POLYGON Z ((768665 6277994.4 59.3, 768663.4 6277992.9 59.3, 768658.7 6277998.2 59.3, 768660.2 6277999.7 59.3, 768665 6277994.4 59.3))
-BATIMENT0000000211117344;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:25:44;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;7.4;52.4;59.8;61.3;52.7;Cadastre;;POLYGON Z ((768773.8 6277847.4 59.7, 768776.3 6277845.7 59.7, 768774.8 6277843.6 59.7, 768772.4 6277845.3 59.7, 768773.8 6277847.4 59.7))
-BATIMENT0000000211117369;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:25:44;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;3.5;47.5;51.0;56.3;50.1;Cadastre;;POLYGON Z ((768823.4 6277897 51, 768826.7 6277895.4 51, 768827.7 6277894.9 51, 768824.1 6277885.4 51, 768820.4 6277886.7 51, 768820.8 6277888.9 51, 768821 6277890.5 51, 768821.4 6277892 51, 768821.8 6277893.5 51, 768822.4 6277894.8 51, 768823 6277895.9 51, 768823.4 6277897 51))
-BATIMENT0000000211110525;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;4.3;43.5;47.8;48.9;43.9;Cadastre;;POLYGON Z ((768623 6278463.9 47.7, 768625.1 6278460.9 47.7, 768621.7 6278458.4 47.7, 768619.6 6278461.5 47.7, 768623 6278463.9 47.7))
-BATIMENT0000000211110583;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2017-03-30 17:33:13;;;;;3.0;2.5;;;;;3.9;42.7;46.6;46.8;43.2;Cadastre;;POLYGON Z ((768611.2 6278426.3 46.6, 768611.9 6278428.7 46.6, 768613.6 6278428.4 46.6, 768613 6278425.8 46.6, 768611.2 6278426.3 46.6))
-BATIMENT0000000211110622;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2017-03-30 17:33:13;;;;;3.0;2.5;;;;;2.9;42.3;45.2;46.3;42.5;Cadastre;;POLYGON Z ((768642.2 6278429.4 45.2, 768642.7 6278428.6 45.2, 768652.6 6278410.9 45.2, 768651.2 6278410 45.2, 768640.8 6278428.5 45.2, 768642.2 6278429.4 45.2))
-BATIMENT0000000211110693;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;4.2;40.8;45.0;46.3;41.0;Cadastre;;POLYGON Z ((768742.5 6278484 45, 768748.8 6278476.1 45, 768747.7 6278475.3 45, 768741.5 6278483.2 45, 768742.5 6278484 45))
-BATIMENT0000000211110765;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2017-03-30 17:33:13;;;;;3.0;2.5;;;;;2.7;42.2;44.9;46.2;42.4;Cadastre;;POLYGON Z ((768700.3 6278413.6 44.9, 768701.3 6278412 44.9, 768682.7 6278401.3 44.9, 768681.8 6278402.9 44.9, 768699.1 6278412.9 44.9, 768700.3 6278413.6 44.9))
-BATIMENT0000000211110768;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2017-03-30 17:33:13;;;;;3.0;2.5;;;;;3.0;42.2;45.2;46.0;42.4;Cadastre;;POLYGON Z ((768655.3 6278437.1 45.2, 768656.5 6278437.8 45.2, 768667.5 6278418.8 45.2, 768666.4 6278418.2 45.2, 768655.9 6278436.2 45.2, 768655.3 6278437.1 45.2))
-BATIMENT0000000211110797;Indifférenciée;Indifférencié;;Non;En service;2008-11-18 15:19:53;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;2.8;40.4;43.2;43.3;40.6;Cadastre;;POLYGON Z ((768752.2 6278449 43.1, 768757 6278451.1 43.1, 768758 6278448.8 43.1, 768757.6 6278447.4 43.1, 768753.6 6278445.7 43.1, 768752.2 6278449 43.1))
-BATIMENT0000000211116989;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:25:44;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;1.3;49.7;51.0;51.5;50.0;Cadastre;;POLYGON Z ((768815 6277829.5 51, 768822.2 6277825.8 51, 768820.4 6277821 51, 768815.1 6277823.8 51, 768813.4 6277826.3 51, 768815 6277829.5 51))
-BATIMENT0000000211116991;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:25:44;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;1.4;49.3;50.7;51.1;49.8;Cadastre;;POLYGON Z ((768827.6 6277827.8 50.6, 768824.4 6277820.1 50.6, 768822.6 6277820.8 50.6, 768825.9 6277828.5 50.6, 768827.6 6277827.8 50.6))
-BATIMENT0000000211117321;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:25:44;2017-03-30 17:33:13;;;;;3.0;2.5;;;;;4.6;49.6;54.2;55.8;50.2;Cadastre;;POLYGON Z ((768818.4 6277895.1 54.2, 768820.1 6277894.5 54.2, 768818.7 6277891 54.2, 768817.2 6277891.6 54.2, 768818.4 6277895.1 54.2))
-BATIMENT0000000211117352;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:25:44;2017-03-30 17:33:13;;;;;3.0;2.5;;;;;7.6;50.7;58.3;59.4;51.0;Cadastre;;POLYGON Z ((768790.2 6277890.5 58.3, 768788.5 6277888 58.3, 768786.2 6277889.6 58.3, 768788 6277892 58.3, 768790.2 6277890.5 58.3))
-BATIMENT0000000211110212;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;7.8;47.5;55.3;57.0;48.7;Cadastre;;POLYGON Z ((768532.8 6278220.4 55.2, 768537.6 6278226.3 55.2, 768538.2 6278225.7 55.2, 768538.6 6278225.1 55.2, 768538.7 6278224.7 55.2, 768538.7 6278224.2 55.2, 768538.7 6278223.7 55.2, 768538.5 6278223.3 55.2, 768535.8 6278219.8 55.2, 768535.4 6278219.5 55.2, 768534.9 6278219.4 55.2, 768534.5 6278219.4 55.2, 768533.8 6278219.6 55.2, 768533.3 6278219.9 55.2, 768532.8 6278220.4 55.2))
-BATIMENT0000000211110182;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;4.1;51.9;56.0;56.8;52.0;Cadastre;;POLYGON Z ((768506.6 6278172.4 56, 768505.7 6278173.6 56, 768506.8 6278174.4 56, 768507.7 6278173.2 56, 768506.6 6278172.4 56))
-BATIMENT0000000211110184;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;4.8;52.0;56.8;58.0;52.2;Cadastre;;POLYGON Z ((768510.2 6278162.3 56.7, 768508.9 6278164.1 56.7, 768511.4 6278165.9 56.7, 768512.7 6278164.1 56.7, 768510.2 6278162.3 56.7))
-BATIMENT0000000211110191;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;2.3;51.5;53.8;55.5;51.6;Cadastre;;POLYGON Z ((768486.4 6278153.5 53.8, 768486.1 6278155.8 53.8, 768489.2 6278156.2 53.8, 768489.5 6278154 53.8, 768486.4 6278153.5 53.8))
-BATIMENT0000000211110211;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;8.2;47.8;56.0;57.3;48.8;Cadastre;;POLYGON Z ((768514.8 6278217 56, 768514.1 6278217.5 56, 768513.6 6278218.2 56, 768513.5 6278218.8 56, 768513.5 6278219.2 56, 768513.6 6278219.8 56, 768516.3 6278222.9 56, 768516.8 6278223.3 56, 768517.4 6278223.3 56, 768518.1 6278223.1 56, 768518.5 6278223 56, 768519.2 6278222.4 56, 768514.8 6278217 56))
-BATIMENT0000000211110213;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;5.2;50.1;55.3;56.3;50.3;Cadastre;;POLYGON Z ((768480.6 6278187.5 55.2, 768482.3 6278190 55.2, 768484.2 6278188.8 55.2, 768482.5 6278186.2 55.2, 768480.6 6278187.5 55.2))
-BATIMENT0000000211110215;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;5.8;50.1;55.9;56.3;50.2;Cadastre;;POLYGON Z ((768484.2 6278188.8 55.9, 768482.3 6278190 55.9, 768484.1 6278192.6 55.9, 768486 6278191.4 55.9, 768484.2 6278188.8 55.9))
-BATIMENT0000000211110217;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;3.9;50.1;54.0;55.2;50.2;Cadastre;;POLYGON Z ((768476 6278197.8 54, 768476.8 6278198.9 54, 768478 6278198 54, 768477.3 6278197 54, 768476 6278197.8 54))
-BATIMENT0000000211110407;Indifférenciée;Commercial et services;;Non;En service;2008-11-18 15:19:53;2019-07-29 10:55:42;;;;;5.0;1.0;;;;;16.5;50.3;66.8;69.3;50.4;Cadastre;;POLYGON Z ((768400.6 6278341.9 66.8, 768400.7 6278336.6 66.8, 768399.8 6278335.9 66.8, 768398.7 6278335.4 66.8, 768397.2 6278335.5 66.8, 768396 6278336.1 66.8, 768395 6278337 66.8, 768394.4 6278338.3 66.8, 768394.4 6278339.5 66.8, 768394.7 6278340.7 66.8, 768395.3 6278341.7 66.8, 768396.3 6278342.5 66.8, 768397.3 6278342.9 66.8, 768398.5 6278342.9 66.8, 768399.6 6278342.6 66.8, 768400.6 6278341.9 66.8))
-BATIMENT0000000211110312;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;6.1;50.9;57.0;60.3;51.4;Cadastre;;POLYGON Z ((768220.6 6278355.8 56.9, 768223.3 6278352.5 56.9, 768217.3 6278347.6 56.9, 768214.3 6278351.2 56.9, 768220.6 6278355.8 56.9))
-BATIMENT0000000211110337;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;5.4;50.8;56.2;56.5;51.0;Cadastre;;POLYGON Z ((768225.9 6278335.2 56.2, 768221.4 6278340.8 56.2, 768222.3 6278341.7 56.2, 768226.9 6278336.1 56.2, 768225.9 6278335.2 56.2))
-BATIMENT0000000211110426;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;4.7;49.3;54.0;55.3;49.9;Cadastre;;POLYGON Z ((768382.1 6278432.3 54, 768378.5 6278437.7 54, 768379.5 6278438.4 54, 768383 6278432.9 54, 768382.1 6278432.3 54))
-BATIMENT0000000211110413;Indifférenciée;Commercial et services;;Oui;En service;2008-11-18 15:19:53;2019-07-29 10:55:42;;;;;3.0;2.5;;;;;2.8;51.8;54.6;55.5;;Cadastre;;POLYGON Z ((768375.1 6278314.7 54.6, 768378.2 6278313.1 54.6, 768379.6 6278315.7 54.6, 768384.1 6278312.9 54.6, 768382.5 6278310.2 54.6, 768385.5 6278308.4 54.6, 768378.5 6278309.1 54.6, 768375.1 6278314.7 54.6))
-BATIMENT0000000211110499;Indifférenciée;Commercial et services;;Non;En service;2008-11-18 15:19:53;2019-07-29 10:55:42;;;;;3.0;2.5;;;;;2.8;51.8;54.6;55.5;;Cadastre;;POLYGON Z ((768375.1 6278314.7 54.6, 768375.7 6278322 54.6, 768381.4 6278325.5 54.6, 768387.9 6278325 54.6, 768392.2 6278318.8 54.6, 768391.5 6278312.4 54.6, 768385.5 6278308.4 54.6, 768382.5 6278310.2 54.6, 768384.1 6278312.9 54.6, 768379.6 6278315.7 54.6, 768378.2 6278313.1 54.6, 768375.1 6278314.7 54.6))
-BATIMENT0000000211110506;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;2.7;45.6;48.3;48.4;46.0;Cadastre;;POLYGON Z ((768538.3 6278473.8 48.2, 768536.4 6278475.8 48.2, 768537.5 6278476.9 48.2, 768539.3 6278474.7 48.2, 768538.3 6278473.8 48.2))
-BATIMENT0000000211110517;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;3.0;44.9;47.9;48.0;45.1;Cadastre;;POLYGON Z ((768504.8 6278432.3 47.8, 768505.3 6278429.2 47.8, 768503.8 6278429 47.8, 768503.7 6278429.3 47.8, 768503.3 6278432.1 47.8, 768504.8 6278432.3 47.8))
-BATIMENT0000000211110527;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2017-03-30 17:33:13;;;;;5.0;1.0;;;;;6.5;40.8;47.3;48.3;41.0;Cadastre;;POLYGON Z ((768636 6278260.4 47.2, 768637.9 6278258.4 47.2, 768635.9 6278256.5 47.2, 768634 6278258.5 47.2, 768636 6278260.4 47.2))
-BATIMENT0000000211110529;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;6.0;43.7;49.7;53.8;47.6;Cadastre;;POLYGON Z ((768501 6278234.8 49.7, 768498.1 6278237.9 49.7, 768508.2 6278247.8 49.7, 768511.2 6278244.9 49.7, 768501 6278234.8 49.7))
-BATIMENT0000000211110553;Indifférenciée;Indifférencié;;Non;En service;2008-11-18 15:19:53;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;6.6;40.3;46.9;48.2;40.8;Cadastre;;POLYGON Z ((768647.8 6278291.2 46.9, 768642.5 6278287.4 46.9, 768644.4 6278285 46.9, 768638.1 6278278.4 46.9, 768629.2 6278287.6 46.9, 768635.9 6278293.3 46.9, 768636.6 6278293.1 46.9, 768637.3 6278293 46.9, 768638 6278293 46.9, 768638.7 6278293.2 46.9, 768643 6278296.3 46.9, 768647.8 6278291.2 46.9))
-BATIMENT0000000211110567;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;3.9;45.8;49.7;50.5;46.1;Cadastre;;POLYGON Z ((768472.7 6278425.9 49.6, 768472.8 6278424.3 49.6, 768466.7 6278423.5 49.6, 768466.4 6278425.5 49.6, 768472.6 6278426.2 49.6, 768472.7 6278425.9 49.6))
-BATIMENT0000000211110621;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2017-03-30 17:33:13;;;;;3.0;2.5;;;;;2.9;42.3;45.2;48.3;42.5;Cadastre;;POLYGON Z ((768642.2 6278429.4 45.2, 768655.3 6278437.1 45.2, 768655.9 6278436.2 45.2, 768642.7 6278428.6 45.2, 768642.2 6278429.4 45.2))
-BATIMENT0000000211110767;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2017-03-30 17:33:13;;;;;3.0;2.5;;;;;3.1;42.2;45.3;46.0;42.3;Cadastre;;POLYGON Z ((768674 6278416.1 45.3, 768673.1 6278417.6 45.3, 768691.8 6278428.3 45.3, 768692.6 6278427 45.3, 768691.4 6278426.2 45.3, 768674 6278416.1 45.3))
-BATIMENT0000000211117216;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:25:44;2017-03-30 17:33:13;;;;;3.0;2.5;;;;;11.2;45.6;56.8;56.9;46.4;Cadastre;;POLYGON Z ((768345.8 6277955.1 56.8, 768344.2 6277952.9 56.8, 768341.7 6277954.6 56.8, 768342.6 6277956 56.8, 768343.2 6277956.8 56.8, 768345.8 6277955.1 56.8))
-BATIMENT0000000211117246;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:25:44;2017-03-30 17:33:13;;;;;3.0;2.5;;;;;10.7;46.9;57.6;58.1;47.0;Cadastre;;POLYGON Z ((768384.5 6277928.2 57.6, 768386.9 6277926.3 57.6, 768385.7 6277924.7 57.6, 768384.8 6277923.5 57.6, 768382.4 6277925.4 57.6, 768383.1 6277926.4 57.6, 768384.5 6277928.2 57.6))
-BATIMENT0000000211117322;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:25:44;2017-03-30 17:33:13;;;;;3.0;2.5;;;;;3.7;50.0;53.7;55.0;50.3;Cadastre;;POLYGON Z ((768803.9 6277905.1 53.7, 768801.8 6277899.2 53.7, 768800.2 6277899.8 53.7, 768802.2 6277905.5 53.7, 768803.9 6277905.1 53.7))
-BATIMENT0000000211117327;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:25:44;2017-03-30 17:33:13;;;;;5.0;1.0;;;;;1.4;52.9;54.3;55.0;53.1;Cadastre;;POLYGON Z ((768736 6277900.3 54.2, 768737.3 6277898.8 54.2, 768735.9 6277897.5 54.2, 768734.8 6277898.7 54.2, 768736 6277900.3 54.2))
-BATIMENT0000000211117329;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:25:44;2017-03-30 17:33:13;;;;;5.0;1.0;;;;;2.1;53.4;55.5;55.7;53.6;Cadastre;;POLYGON Z ((768729.2 6277930.9 55.4, 768730.4 6277929.5 55.4, 768729.1 6277927.9 55.4, 768727.7 6277929.6 55.4, 768729.2 6277930.9 55.4))
-BATIMENT0000000211117232;Indifférenciée;Commercial et services;;Non;En service;2008-11-18 15:25:44;2019-07-29 10:55:49;;;;;3.0;2.5;;;;;9.4;48.0;57.4;58.3;;Cadastre;;POLYGON Z ((768418.1 6277930.5 57.4, 768422.3 6277928.2 57.4, 768420.5 6277925.8 57.4, 768417 6277928.3 57.4, 768414.1 6277930.5 57.4, 768415.2 6277932 57.4, 768418.1 6277930.5 57.4))
-BATIMENT0000000211117280;Indifférenciée;Commercial et services;;Non;En service;2008-11-18 15:25:44;2019-07-29 10:55:49;;;;;3.0;2.5;;;;;6.4;49.4;55.8;56.6;;Cadastre;;POLYGON Z ((768504.4 6277910.9 55.8, 768514.9 6277903.6 55.8, 768508.1 6277893.9 55.8, 768497.6 6277901.3 55.8, 768504.4 6277910.9 55.8))
-BATIMENT0000000211117254;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:25:44;2018-02-20 11:33:35;;;;;3.0;2.5;;;;;13.1;45.8;58.9;60.2;45.8;Cadastre;;POLYGON Z ((768306.9 6277919 58.9, 768300.9 6277922.5 58.9, 768301.7 6277924 58.9, 768302.4 6277924.5 58.9, 768303.4 6277924.3 58.9, 768304.3 6277924.1 58.9, 768304.9 6277923.7 58.9, 768305.6 6277923.4 58.9, 768306.2 6277923 58.9, 768307 6277922.3 58.9, 768307.5 6277921.7 58.9, 768307.9 6277921.4 58.9, 768308.1 6277921.1 58.9, 768307.8 6277920.5 58.9, 768306.9 6277919 58.9))
-BATIMENT0000000211110379;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;3.7;50.3;54.0;56.8;50.6;Cadastre;;POLYGON Z ((768219.5 6278328.8 54, 768217.4 6278327.2 54, 768216 6278326.2 54, 768214.7 6278328 54, 768211.3 6278331.6 54, 768211.4 6278332.7 54, 768216.7 6278332.6 54, 768219.5 6278328.8 54))
-BATIMENT0000000336668880;Indifférenciée;Commercial et services;;Oui;En service;2014-07-28 18:18:33;2019-07-29 10:55:49;;;;;3.0;2.5;;;;;9.8;48.0;57.8;58.3;48.0;Cadastre;;POLYGON Z ((768422.3 6277928.2 57.8, 768418.1 6277930.5 56.4, 768415.2 6277932 56.4, 768437.2 6277962 56.4, 768437.1 6277962.4 56.4, 768437 6277962.8 56.4, 768437 6277963.2 56.4, 768437 6277963.7 56.4, 768437 6277964.1 56.4, 768437 6277964.2 56.4, 768437.1 6277964.6 56.4, 768433.7 6277968.2 56.4, 768428.2 6277962.9 56.4, 768416 6277971.5 56.4, 768438.1 6277989.1 56.4, 768446.3 6277980.6 56.4, 768442.6 6277977 56.4, 768446 6277973.4 56.4, 768446.6 6277973.5 56.4, 768447.4 6277973.5 56.4, 768447.8 6277973.4 56.4, 768448.4 6277973.4 56.4, 768449.1 6277973.2 56.4, 768449.8 6277973 56.4, 768450.4 6277972.8 56.4, 768451.1 6277972.5 56.4, 768451.7 6277972.2 56.4, 768452.6 6277971.6 56.4, 768453 6277971.3 56.4, 768453.4 6277970.9 56.4, 768453.9 6277970.4 56.4, 768454.4 6277969.9 56.4, 768454.8 6277969.3 56.4, 768455.1 6277969 56.4, 768455.6 6277968 56.4, 768455.9 6277967.2 56.4, 768456.2 6277966.4 56.4, 768456.5 6277965.3 56.4, 768456.5 6277964.8 56.4, 768456.6 6277964.3 56.4, 768456.6 6277963.9 56.4, 768456.6 6277963.7 56.4, 768456.6 6277963.1 56.4, 768456.5 6277962.7 56.4, 768456.4 6277962.1 56.4, 768456.3 6277961.5 56.4, 768456.2 6277960.9 56.4, 768455.9 6277960.3 56.4, 768455.7 6277959.7 56.4, 768455.4 6277959 56.4, 768455 6277958.3 56.4, 768454.2 6277957.4 56.4, 768453.7 6277956.8 56.4, 768453 6277956.1 56.4, 768452.3 6277955.6 56.4, 768451.6 6277955.1 56.4, 768451 6277954.9 56.4, 768450 6277954.5 56.4, 768449.3 6277954.2 56.4, 768448.6 6277954.1 56.4, 768447.9 6277954 56.4, 768447.3 6277953.9 56.4, 768446.1 6277953.9 56.4, 768445.1 6277954.1 56.4, 768444.5 6277954.2 57.8, 768439.9 6277947.9 57.8, 768437.6 6277944.8 57.8, 768434.5 6277940.6 57.8, 768427.4 6277930.9 57.8, 768424.6 6277927 57.8, 768422.3 6277928.2 57.8))
-BATIMENT0000000211103634;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:15:23;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;3.0;42.3;45.3;46.5;42.4;Cadastre;;POLYGON Z ((767853.7 6278173.9 45.2, 767856.6 6278173.3 45.2, 767856.4 6278172.2 45.2, 767853.4 6278172.8 45.2, 767853.7 6278173.9 45.2))
-BATIMENT0000000211103645;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:15:23;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;3.6;41.9;45.5;47.7;42.0;Cadastre;;POLYGON Z ((767884.1 6278127.3 45.5, 767885.3 6278124.8 45.5, 767884.3 6278124.3 45.5, 767884.2 6278124.3 45.5, 767883.1 6278126.8 45.5, 767884.1 6278127.3 45.5))
-BATIMENT0000000211103683;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:15:23;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;5.6;41.9;47.5;48.0;42.0;Cadastre;;POLYGON Z ((767882.8 6278129.9 47.5, 767884.1 6278127.3 47.5, 767883.1 6278126.8 47.5, 767881.8 6278129.4 47.5, 767882.8 6278129.9 47.5))
-BATIMENT0000000211103688;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:15:23;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;4.3;41.9;46.2;46.5;41.9;Cadastre;;POLYGON Z ((767869.3 6278107 46.1, 767870 6278105.6 46.1, 767868.7 6278105 46.1, 767868 6278106.4 46.1, 767869.3 6278107 46.1))
-BATIMENT0000000211103690;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:15:23;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;3.7;42.3;46.0;46.6;42.4;Cadastre;;POLYGON Z ((767851 6278174.4 46, 767853.7 6278173.9 46, 767853.4 6278172.8 46, 767850.7 6278173.4 46, 767851 6278174.4 46))
-BATIMENT0000000211104423;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:15:23;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;4.1;47.9;52.0;53.5;48.4;Cadastre;;POLYGON Z ((767962.9 6278435.1 52, 767964.5 6278433.5 52, 767963.5 6278432.6 52, 767962 6278434.2 52, 767962.9 6278435.1 52))
-BATIMENT0000000211104427;Indifférenciée;Indifférencié;;Non;En service;2008-11-18 15:15:23;2017-03-30 17:33:13;;;;;5.0;1.0;;;;;2.6;54.0;56.6;56.7;55.6;Cadastre;;POLYGON Z ((767991.8 6278469.6 56.6, 767994.6 6278466.8 56.6, 767992.9 6278465.2 56.6, 767990.1 6278467.9 56.6, 767991.8 6278469.6 56.6))
-BATIMENT0000000211104452;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:15:23;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;4.2;46.6;50.8;51.3;46.8;Cadastre;;POLYGON Z ((767910.1 6278476 50.7, 767911.5 6278474.6 50.7, 767910.5 6278473.7 50.7, 767909.2 6278475.1 50.7, 767910.1 6278476 50.7))
-BATIMENT0000000211104454;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:15:23;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;3.3;47.7;51.0;52.0;48.2;Cadastre;;POLYGON Z ((767971 6278423.9 51, 767971.9 6278422.9 51, 767970.1 6278421.2 51, 767969.7 6278420.8 51, 767968.8 6278421.9 51, 767971 6278423.9 51))
-BATIMENT0000000211104484;Indifférenciée;Indifférencié;;Non;En service;2008-11-18 15:15:23;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;5.9;43.1;49.0;49.6;43.4;Cadastre;;POLYGON Z ((767957.5 6278352.6 49, 767954.7 6278355.2 49, 767957.3 6278357.8 49, 767958.2 6278357.1 49, 767959.8 6278355 49, 767957.5 6278352.6 49))
-BATIMENT0000000211110118;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;5.8;43.3;49.1;50.8;43.6;Cadastre;;POLYGON Z ((768094 6278228.7 49, 768088 6278232.8 49, 768088.5 6278233.5 49, 768084.7 6278236.2 49, 768085.6 6278237.1 49, 768089.4 6278234.8 49, 768095.6 6278231 49, 768094 6278228.7 49))
-BATIMENT0000000211110282;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;5.1;54.4;59.5;66.0;56.8;Cadastre;;POLYGON Z ((768029.5 6278460.6 59.5, 768029.6 6278460.5 59.5, 768030.5 6278459.5 59.5, 768024.1 6278453.6 59.5, 768023.1 6278454.7 59.5, 768029.5 6278460.6 59.5))
-BATIMENT0000000211110291;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;5.9;45.4;51.3;53.7;46.0;Cadastre;;POLYGON Z ((768115.4 6278310.3 51.2, 768117.1 6278308 51.2, 768113.4 6278305.2 51.2, 768111.6 6278307.5 51.2, 768115.4 6278310.3 51.2))
-BATIMENT0000000211110307;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;4.4;46.4;50.8;51.5;46.6;Cadastre;;POLYGON Z ((768154.3 6278289.4 50.7, 768153.1 6278288.6 50.7, 768151.6 6278290.8 50.7, 768152.7 6278291.6 50.7, 768154.3 6278289.4 50.7))
-BATIMENT0000000211110319;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;7.0;50.0;57.0;57.7;50.6;Cadastre;;POLYGON Z ((768135.9 6278370.8 57, 768135.7 6278369 57, 768134.1 6278369.2 57, 768134.3 6278371 57, 768135.9 6278370.8 57))
-BATIMENT0000000211110293;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2018-02-20 11:33:35;;;;;3.0;2.5;;;;;5.0;47.1;52.1;53.0;47.1;Cadastre;;POLYGON Z ((768129.1 6278301.6 52.1, 768120.7 6278295.7 52.1, 768118.9 6278298 52.1, 768127.3 6278303.8 52.1, 768129.1 6278301.6 52.1))
-BATIMENT0000000211110323;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2018-02-20 11:33:35;;;;;3.0;2.5;;;;;4.1;44.8;48.9;49.1;44.8;Cadastre;;POLYGON Z ((768093.9 6278252.7 48.9, 768092.6 6278254.5 48.9, 768094 6278255.7 48.9, 768095.4 6278253.9 48.9, 768093.9 6278252.7 48.9))
-BATIMENT0000000211110295;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2018-02-20 16:11:34;;;;;3.0;2.5;;;;;3.6;44.5;48.1;48.3;;Cadastre;;POLYGON Z ((768050.7 6278280.9 48.1, 768058.4 6278271.4 48.1, 768056.5 6278269.9 48.1, 768048.8 6278279.3 48.1, 768050.7 6278280.9 48.1))
-BATIMENT0000000211110352;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;5.4;51.7;57.1;59.0;52.6;Cadastre;;POLYGON Z ((768121.1 6278395.3 57.1, 768123.5 6278392.3 57.1, 768124.2 6278392.7 57.1, 768126.3 6278390 57.1, 768125.6 6278389.4 57.1, 768124.8 6278388.9 57.1, 768122.6 6278391.7 57.1, 768122.5 6278391.9 57.1, 768120.3 6278394.7 57.1, 768121.1 6278395.3 57.1))
-BATIMENT0000000211116388;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:25:02;2017-03-30 17:33:13;;;;;3.0;2.5;;;;;12.1;37.0;49.1;49.7;39.1;Cadastre;;POLYGON Z ((767924.6 6277867.6 49.1, 767925.6 6277866.2 49.1, 767920.6 6277862.5 49.1, 767919.6 6277863.9 49.1, 767924.6 6277867.6 49.1))
-BATIMENT0000000211116392;Indifférenciée;Indifférencié;;Non;En service;2008-11-18 15:25:02;2017-03-30 17:33:13;;;;;3.0;2.5;;;;;9.7;39.1;48.8;49.5;40.5;Cadastre;;POLYGON Z ((767933.8 6277845.7 48.8, 767943 6277839.2 48.8, 767943.3 6277839 48.8, 767939.6 6277834 48.8, 767930.2 6277841 48.8, 767933.8 6277845.7 48.8))
-BATIMENT0000000211116394;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:25:02;2017-03-30 17:33:13;;;;;3.0;2.5;;;;;10.2;38.7;48.9;50.3;39.3;Cadastre;;POLYGON Z ((767937.7 6277854.2 48.9, 767939.1 6277853.2 48.9, 767935.5 6277848.1 48.9, 767934.1 6277849.2 48.9, 767937.7 6277854.2 48.9))
-BATIMENT0000000211116465;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:25:44;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;3.7;44.8;48.5;49.3;45.3;Cadastre;;POLYGON Z ((768021.2 6277817 48.5, 768023.5 6277822.5 48.5, 768024.8 6277821.9 48.5, 768022.6 6277816.4 48.5, 768021.2 6277817 48.5))
-BATIMENT0000000211116521;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:25:44;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;3.3;46.0;49.3;49.8;46.4;Cadastre;;POLYGON Z ((768114.4 6277819.2 49.2, 768113.7 6277817.4 49.2, 768108.1 6277819.7 49.2, 768108.9 6277821.6 49.2, 768114.4 6277819.2 49.2))
-BATIMENT0000000211117226;Indifférenciée;Commercial et services;;Oui;En service;2008-11-18 15:25:44;2019-07-29 10:55:49;;;;;3.0;2.5;;;;;8.4;48.0;56.4;57.3;49.5;Cadastre;;POLYGON Z ((768414.9 6277849.3 56.4, 768417.1 6277852.4 56.4, 768421.1 6277849.6 56.4, 768418.9 6277846.5 56.4, 768414.9 6277849.3 56.4))
-BATIMENT0000000211117191;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:25:44;2017-03-30 17:33:13;;;;;3.0;2.5;;;;;6.0;44.3;50.3;51.3;45.4;Cadastre;;POLYGON Z ((768075.5 6277842.3 50.3, 768082 6277839.6 50.3, 768081.5 6277838.4 50.3, 768075.6 6277840.9 50.3, 768075 6277841.2 50.3, 768075.5 6277842.3 50.3))
-BATIMENT0000000211117196;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:25:44;2017-03-30 17:33:13;;;;;3.0;2.5;;;;;7.6;42.5;50.1;50.5;44.1;Cadastre;;POLYGON Z ((768049 6277849.1 50.1, 768047.4 6277845.3 50.1, 768046.3 6277845.8 50.1, 768047.9 6277849.6 50.1, 768049 6277849.1 50.1))
-BATIMENT0000000211117262;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:25:44;2017-03-30 17:33:13;;;;;5.0;1.0;;;;;4.7;49.8;54.5;57.3;51.6;Cadastre;;POLYGON Z ((768560.2 6277831.2 54.5, 768551.6 6277826.3 54.5, 768546.1 6277833.6 54.5, 768555.9 6277839 54.5, 768560.2 6277831.2 54.5))
-BATIMENT0000000211115956;Indifférenciée;Indifférencié;;Non;En service;2008-11-18 15:25:02;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;6.5;39.6;46.1;46.8;41.0;Cadastre;;POLYGON Z ((767929.4 6277818.3 46, 767923.4 6277823.6 46, 767927.1 6277828.1 46, 767933.1 6277822.9 46, 767929.4 6277818.3 46))
-BATIMENT0000000211116001;Indifférenciée;Indifférencié;;Non;En service;2008-11-18 15:25:02;2017-03-30 17:33:13;;;;;5.0;1.0;;;;;7.3;40.2;47.5;49.9;41.2;Cadastre;;POLYGON Z ((767922.3 6277809.5 47.5, 767917.2 6277813.8 47.5, 767920.8 6277818.1 47.5, 767925.8 6277813.6 47.5, 767922.3 6277809.5 47.5))
-BATIMENT0000000211116373;Indifférenciée;Indifférencié;;Non;En service;2008-11-18 15:25:02;2017-03-30 17:33:13;;;;;3.0;2.5;;;;;12.1;36.9;49.0;49.3;39.0;Cadastre;;POLYGON Z ((767910.7 6277871.5 49, 767910.9 6277871.2 49, 767916.7 6277863.4 49, 767917.4 6277862.4 49, 767912.6 6277858.8 49, 767907.6 6277865.5 49, 767905.8 6277867.9 49, 767910.7 6277871.5 49))
-BATIMENT0000000211116382;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:25:02;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;9.2;39.3;48.5;50.0;39.5;Cadastre;;POLYGON Z ((767950.7 6277878.4 48.5, 767955.9 6277874.8 48.5, 767954.7 6277873.1 48.5, 767949.6 6277876.9 48.5, 767950.7 6277878.4 48.5))
-BATIMENT0000000211116385;Indifférenciée;Indifférencié;;Non;En service;2008-11-18 15:25:02;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;10.9;39.2;50.1;50.5;39.4;Cadastre;;POLYGON Z ((767955.9 6277885.6 50, 767961 6277881.8 50, 767955.9 6277874.8 50, 767950.7 6277878.4 50, 767954.2 6277883.3 50, 767955.9 6277885.6 50))
-BATIMENT0000000211116389;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:25:02;2017-03-30 17:33:13;;;;;3.0;2.5;;;;;12.1;36.9;49.0;50.1;39.0;Cadastre;;POLYGON Z ((767913.1 6277872.8 49, 767916.6 6277868 49, 767918.8 6277864.9 49, 767916.7 6277863.4 49, 767910.9 6277871.2 49, 767913.1 6277872.8 49))
-BATIMENT0000000211116386;Indifférenciée;Indifférencié;;Non;En service;2008-11-18 15:25:02;2018-02-20 11:33:35;;;;;3.0;2.5;;;;;7.2;39.6;46.8;47.6;39.6;Cadastre;;POLYGON Z ((767923.7 6277834.8 46.8, 767919.1 6277829.5 46.8, 767915.2 6277832.8 46.8, 767919.7 6277838.1 46.8, 767923.7 6277834.8 46.8))
-BATIMENT0000000211116537;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:25:44;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;4.5;45.0;49.5;50.0;46.4;Cadastre;;POLYGON Z ((768123.5 6277827 49.4, 768125.4 6277826.2 49.4, 768124.5 6277824.2 49.4, 768122.7 6277825 49.4, 768123.5 6277827 49.4))
-BATIMENT0000000211116626;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:25:44;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;5.3;45.0;50.3;51.3;45.8;Cadastre;;POLYGON Z ((768125.9 6277827.4 50.2, 768129.5 6277825.8 50.2, 768128.1 6277822.6 50.2, 768124.5 6277824.2 50.2, 768125.4 6277826.2 50.2, 768125.9 6277827.4 50.2))
-BATIMENT0000000211117184;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:25:44;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;5.6;44.2;49.8;50.8;44.5;Cadastre;;POLYGON Z ((768040.8 6277836.5 49.7, 768039.9 6277834.3 49.7, 768038.8 6277834.8 49.7, 768039.7 6277836.9 49.7, 768040.8 6277836.5 49.7))
-BATIMENT0000000211117188;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:25:44;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;4.7;43.8;48.5;50.8;44.0;Cadastre;;POLYGON Z ((768062.4 6277851.2 48.5, 768066.6 6277849.5 48.5, 768066.3 6277848.5 48.5, 768062.1 6277850.3 48.5, 768062.4 6277851.2 48.5))
-BATIMENT0000000211117189;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:25:44;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;7.7;45.0;52.7;52.7;45.1;Cadastre;;POLYGON Z ((768179.6 6277874.6 52.6, 768181.7 6277873.6 52.6, 768180.7 6277871.5 52.6, 768178.6 6277872.5 52.6, 768179.6 6277874.6 52.6))
-BATIMENT0000000211117356;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:25:44;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;8.9;51.4;60.3;60.8;51.8;Cadastre;;POLYGON Z ((768778.5 6277879 60.2, 768775.2 6277874.4 60.2, 768774.2 6277875.2 60.2, 768777.4 6277879.7 60.2, 768778.5 6277879 60.2))
-BATIMENT0000000211117309;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:25:44;2017-03-30 17:33:13;;;;;5.0;1.0;;;;;1.9;53.4;55.3;55.5;53.7;Cadastre;;POLYGON Z ((768734.2 6277937.3 55.2, 768735.4 6277935.8 55.2, 768734.2 6277934.5 55.2, 768732.8 6277936 55.2, 768734.2 6277937.3 55.2))
-BATIMENT0000000211116971;Indifférenciée;Indifférencié;;Non;En service;2008-11-18 15:25:44;2017-03-30 17:33:13;;;;;3.0;2.5;;;;;2.8;49.0;51.8;52.8;49.8;Cadastre;;POLYGON Z ((768827.6 6277827.8 51.8, 768835.4 6277824.6 51.8, 768833.8 6277820.4 51.8, 768833.1 6277820.7 51.8, 768831.8 6277817.1 51.8, 768824.4 6277820.1 51.8, 768827.6 6277827.8 51.8))
-BATIMENT0000000211117298;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:25:44;2017-03-30 17:33:13;;;;;5.0;1.0;;;;;2.0;53.3;55.3;55.4;53.7;Cadastre;;POLYGON Z ((768745.6 6277951.6 55.2, 768746.8 6277950.3 55.2, 768745.5 6277948.7 55.2, 768744.1 6277950.3 55.2, 768745.6 6277951.6 55.2))
-BATIMENT0000000211117302;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:25:44;2017-03-30 17:33:13;;;;;5.0;1.0;;;;;1.6;52.9;54.5;55.0;53.2;Cadastre;;POLYGON Z ((768777 6277991.5 54.5, 768778.2 6277990.1 54.5, 768776.9 6277988.5 54.5, 768775.5 6277990.2 54.5, 768777 6277991.5 54.5))
-BATIMENT0000000211117314;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:25:44;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;2.8;49.2;52.0;54.0;50.6;Cadastre;;POLYGON Z ((768811.5 6277872.5 52, 768813.9 6277876 52, 768815.5 6277874.8 52, 768813 6277871.4 52, 768811.5 6277872.5 52))
-BATIMENT0000000211117326;Indifférenciée;Indifférencié;;Non;En service;2008-11-18 15:25:44;2017-03-30 17:33:13;;;;;5.0;1.0;;;;;4.5;55.3;59.8;68.8;55.6;Cadastre;;POLYGON Z ((768651.7 6277973.9 59.7, 768658.4 6277965.4 59.7, 768654.2 6277962.1 59.7, 768647.6 6277970.7 59.7, 768651.7 6277973.9 59.7))
-BATIMENT0000000211117349;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:25:44;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;7.4;51.7;59.1;61.3;52.1;Cadastre;;POLYGON Z ((768780.1 6277861.5 59, 768782.4 6277860 59, 768780.7 6277857.6 59, 768778.5 6277859.2 59, 768780.1 6277861.5 59))
-BATIMENT0000000211117353;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:25:44;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;7.5;51.5;59.0;61.2;51.8;Cadastre;;POLYGON Z ((768783.4 6277866.2 59, 768785.2 6277865 59, 768783.5 6277862.6 59, 768781.8 6277863.8 59, 768783.4 6277866.2 59))
-BATIMENT0000000211117354;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:25:44;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;9.4;51.1;60.5;61.3;51.4;Cadastre;;POLYGON Z ((768790.1 6277875.5 60.5, 768791.1 6277874.9 60.5, 768788.2 6277870.5 60.5, 768787.1 6277871.2 60.5, 768790.1 6277875.5 60.5))
-BATIMENT0000000211117377;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:25:44;2018-02-20 14:11:41;;;;;3.0;2.5;;;;;5.6;49.0;54.6;55.3;;Cadastre;;POLYGON Z ((768827.4 6277909.7 54.6, 768826 6277910.3 54.6, 768826.6 6277912 54.6, 768828.1 6277911.5 54.6, 768827.4 6277909.7 54.6))
-BATIMENT0000000211110548;Indifférenciée;Indifférencié;;Non;En service;2008-11-18 15:19:53;2017-03-30 17:33:13;;;;;5.0;1.0;;;;;4.2;41.6;45.8;47.2;41.8;Cadastre;;POLYGON Z ((768608.1 6278326.4 45.7, 768612.2 6278328.7 45.7, 768613.8 6278325.9 45.7, 768609.7 6278323.6 45.7, 768608.1 6278326.4 45.7))
-BATIMENT0000000211117207;Indifférenciée;Indifférencié;;Non;En service;2008-11-18 15:25:44;2017-03-30 17:33:13;;;;;3.0;2.5;;;;;7.2;46.8;54.0;55.5;48.4;Cadastre;;POLYGON Z ((768348.4 6277864.3 54, 768306.6 6277889.4 54, 768312.2 6277898.7 54, 768338.4 6277883 54, 768337.8 6277882 54, 768353.4 6277872.7 54, 768348.4 6277864.3 54))
-BATIMENT0000000211117233;Indifférenciée;Commercial et services;;Oui;En service;2008-11-18 15:25:44;2019-07-29 10:55:49;;;;;3.0;2.5;;;;;9.7;48.0;57.7;58.4;49.1;Cadastre;;POLYGON Z ((768415.7 6277914.8 57.7, 768422.3 6277910 57.7, 768437.1 6277899.1 57.7, 768444.5 6277893.7 57.7, 768443 6277891.5 57.7, 768436.2 6277896.5 57.7, 768420.6 6277908 57.7, 768414.1 6277912.7 57.7, 768415.7 6277914.8 57.7))
-BATIMENT0000000211117252;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:25:44;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;14.0;45.3;59.3;60.1;45.9;Cadastre;;POLYGON Z ((768296.4 6277898.6 59.2, 768295.6 6277896.6 59.2, 768295.4 6277896.4 59.2, 768293.9 6277896.7 59.2, 768292.4 6277897.4 59.2, 768291.1 6277898 59.2, 768290 6277898.7 59.2, 768288.6 6277899.6 59.2, 768287.8 6277900.4 59.2, 768286.5 6277901.5 59.2, 768287 6277901.9 59.2, 768288.2 6277903.3 59.2, 768296.4 6277898.6 59.2))
-BATIMENT0000000211117237;Indifférenciée;Commercial et services;;Oui;En service;2008-11-18 15:25:44;2019-07-29 10:55:49;;;;;3.0;2.5;;;;;10.3;48.0;58.3;58.4;49.1;Cadastre;;POLYGON Z ((768420.6 6277908 58.3, 768436.2 6277896.5 58.3, 768432.4 6277891.3 58.3, 768416.6 6277902.4 58.3, 768420.6 6277908 58.3))
-BATIMENT0000000211110425;Indifférenciée;Commercial et services;;Non;En service;2008-11-18 15:19:53;2019-07-29 10:55:42;;;;;5.0;1.0;;;;;3.5;48.9;52.4;52.5;49.1;Cadastre;;POLYGON Z ((768336.2 6278261.5 52.4, 768333.1 6278259.9 52.4, 768331.2 6278263.3 52.4, 768334.3 6278265.1 52.4, 768336.2 6278261.5 52.4))
-BATIMENT0000000211117238;Indifférenciée;Commercial et services;;Oui;En service;2008-11-18 15:25:44;2019-07-29 10:55:49;;;;;3.0;1.0;;;;;11.9;46.4;58.3;58.5;49.1;Cadastre;;POLYGON Z ((768451.2 6277898.5 58.3, 768438.1 6277880.7 58.3, 768436 6277882.2 58.3, 768443 6277891.5 58.3, 768444.5 6277893.7 58.3, 768455 6277908 58.3, 768456 6277907.1 58.3, 768456.9 6277906.3 58.3, 768453.5 6277901.7 58.3, 768454.1 6277898.8 58.3, 768451.2 6277898.5 58.3))
-BATIMENT0000000211117288;Indifférenciée;Commercial et services;;Non;En service;2008-11-18 15:25:44;2019-07-29 10:55:49;;;;;3.0;2.5;;;;;9.4;48.0;57.4;58.3;48.9;Cadastre;;POLYGON Z ((768467.9 6277894.5 57.4, 768466.3 6277892.3 57.4, 768457.1 6277899.1 57.4, 768453.5 6277901.7 57.4, 768456.9 6277906.3 57.4, 768460.1 6277910.6 57.4, 768472.9 6277901.2 57.4, 768467.9 6277894.5 57.4))
-BATIMENT0000000211110207;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;3.4;51.4;54.8;56.0;51.5;Cadastre;;POLYGON Z ((768476.7 6278152 54.7, 768476.4 6278154.3 54.7, 768479.4 6278154.8 54.7, 768479.8 6278152.5 54.7, 768476.7 6278152 54.7))
-BATIMENT0000000211110432;Indifférenciée;Commercial et services;;Oui;En service;2008-11-18 15:19:53;2019-07-29 10:55:42;;;;;3.0;1.0;;;;;3.3;50.7;54.0;55.3;51.2;Cadastre;;POLYGON Z ((768338.7 6278341.7 54, 768334.3 6278350.2 54, 768339.9 6278353.2 54, 768344.2 6278344.8 54, 768338.7 6278341.7 54))
-BATIMENT0000000211110208;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;6.9;49.4;56.3;57.0;50.7;Cadastre;;POLYGON Z ((768519.9 6278204.9 56.2, 768524.8 6278210.8 56.2, 768526.8 6278209.2 56.2, 768522.5 6278204.2 56.2, 768521.9 6278203.9 56.2, 768521.4 6278204 56.2, 768520.9 6278204.1 56.2, 768520.4 6278204.4 56.2, 768519.9 6278204.9 56.2))
-BATIMENT0000000211110209;Indifférenciée;Indifférencié;;Non;En service;2008-11-18 15:19:53;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;12.3;47.2;59.5;60.5;50.6;Cadastre;;POLYGON Z ((768510.9 6278212.2 59.5, 768514.8 6278217 59.5, 768519.2 6278222.4 59.5, 768522.5 6278226.4 59.5, 768524.3 6278228.6 59.5, 768528.6 6278233.8 59.5, 768529.7 6278233 59.5, 768531.4 6278231.5 59.5, 768537.6 6278226.3 59.5, 768532.8 6278220.4 59.5, 768528.1 6278214.8 59.5, 768524.8 6278210.8 59.5, 768519.9 6278204.9 59.5, 768510.9 6278212.2 59.5))
-BATIMENT0000000211110143;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;7.0;48.9;55.9;56.8;50.0;Cadastre;;POLYGON Z ((768524.8 6278210.8 55.9, 768528.1 6278214.8 55.9, 768528.8 6278211.4 55.9, 768526.8 6278209.2 55.9, 768524.8 6278210.8 55.9))
-BATIMENT0000000211110144;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;5.0;55.5;60.5;62.9;56.1;Cadastre;;POLYGON Z ((768568.2 6278151.5 60.5, 768570.7 6278147.9 60.5, 768567.6 6278145.9 60.5, 768565.2 6278149.4 60.5, 768568.2 6278151.5 60.5))
-BATIMENT0000000211110148;Indifférenciée;Indifférencié;;Non;En service;2008-11-18 15:19:53;2017-03-30 17:33:13;;;;;5.0;1.0;;;;;13.1;54.7;67.8;68.8;55.7;Cadastre;;POLYGON Z ((768596.9 6278137.1 67.7, 768598.8 6278135.2 67.7, 768597.2 6278133.5 67.7, 768595.2 6278135.5 67.7, 768596.9 6278137.1 67.7))
-BATIMENT0000000211110153;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;5.3;56.4;61.7;63.2;56.7;Cadastre;;POLYGON Z ((768574.8 6278132.4 61.7, 768579 6278126.2 61.7, 768577.5 6278125.2 61.7, 768575 6278129 61.7, 768575.7 6278129.3 61.7, 768574 6278131.9 61.7, 768574.8 6278132.4 61.7))
-BATIMENT0000000211110155;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;6.6;52.0;58.6;59.0;53.4;Cadastre;;POLYGON Z ((768538.5 6278064 58.5, 768540.7 6278065.5 58.5, 768543 6278062.1 58.5, 768540.8 6278060.6 58.5, 768538.5 6278064 58.5))
-BATIMENT0000000211110164;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;9.6;46.2;55.8;57.5;47.9;Cadastre;;POLYGON Z ((768524.3 6278228.6 55.7, 768522.5 6278226.4 55.7, 768521 6278227.7 55.7, 768522.8 6278229.8 55.7, 768524.3 6278228.6 55.7))
-BATIMENT0000000211110172;Indifférenciée;Indifférencié;;Non;En service;2008-11-18 15:19:53;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;8.1;51.7;59.8;60.4;52.4;Cadastre;;POLYGON Z ((768538.5 6278064 59.8, 768540.8 6278060.6 59.8, 768545.7 6278053.3 59.8, 768538.2 6278048.4 59.8, 768531 6278058.9 59.8, 768538.5 6278064 59.8))
-BATIMENT0000000211110180;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;11.8;59.0;70.8;73.0;59.4;Cadastre;;POLYGON Z ((768633.1 6278097.6 70.7, 768637.3 6278095.7 70.7, 768636.4 6278094 70.7, 768632.3 6278095.9 70.7, 768633.1 6278097.6 70.7))
-BATIMENT0000000211110185;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;3.6;51.9;55.5;58.0;52.2;Cadastre;;POLYGON Z ((768507.6 6278160.5 55.5, 768506.3 6278162.4 55.5, 768508.9 6278164.1 55.5, 768510.2 6278162.3 55.5, 768507.6 6278160.5 55.5))
-BATIMENT0000000211110188;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2017-03-30 17:33:13;;;;;3.0;2.5;;;;;6.6;50.2;56.8;57.4;51.8;Cadastre;;POLYGON Z ((768495 6278161.7 56.8, 768494.2 6278166.7 56.8, 768496.3 6278167 56.8, 768498.2 6278162.2 56.8, 768495 6278161.7 56.8))
-BATIMENT0000000211110192;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;5.2;52.1;57.3;59.0;52.4;Cadastre;;POLYGON Z ((768518.3 6278168 57.2, 768517 6278169.9 57.2, 768519.5 6278171.6 57.2, 768520.8 6278169.8 57.2, 768518.3 6278168 57.2))
-BATIMENT0000000211110193;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;4.1;52.2;56.3;58.1;52.4;Cadastre;;POLYGON Z ((768520.8 6278169.8 56.2, 768519.5 6278171.6 56.2, 768522.3 6278173.6 56.2, 768523.6 6278171.7 56.2, 768520.8 6278169.8 56.2))
-BATIMENT0000000211110194;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;3.3;52.0;55.3;56.5;52.1;Cadastre;;POLYGON Z ((768511.3 6278175.7 55.2, 768510.5 6278177 55.2, 768511.5 6278177.7 55.2, 768512.4 6278176.5 55.2, 768511.3 6278175.7 55.2))
-BATIMENT0000000211110210;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;6.0;46.8;52.8;53.8;47.3;Cadastre;;POLYGON Z ((768529.7 6278233 52.7, 768529.9 6278233.3 52.7, 768530.4 6278233.5 52.7, 768530.8 6278233.5 52.7, 768531.2 6278233.3 52.7, 768531.5 6278233 52.7, 768531.7 6278232.7 52.7, 768531.7 6278232.2 52.7, 768531.6 6278231.9 52.7, 768531.4 6278231.5 52.7, 768529.7 6278233 52.7))
-BATIMENT0000000211110219;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;3.4;50.1;53.5;54.8;50.2;Cadastre;;POLYGON Z ((768473.3 6278190.9 53.5, 768472 6278191.8 53.5, 768472.7 6278192.9 53.5, 768474 6278192 53.5, 768473.3 6278190.9 53.5))
-BATIMENT0000000211110221;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;4.0;50.3;54.3;56.5;50.5;Cadastre;;POLYGON Z ((768489.7 6278197 54.2, 768487.8 6278198.3 54.2, 768489.5 6278200.8 54.2, 768491.4 6278199.6 54.2, 768489.7 6278197 54.2))
-BATIMENT0000000211110222;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;4.0;50.3;54.3;56.5;50.5;Cadastre;;POLYGON Z ((768491.4 6278199.6 54.2, 768489.5 6278200.8 54.2, 768491.3 6278203.4 54.2, 768493.2 6278202.2 54.2, 768491.4 6278199.6 54.2))
-BATIMENT0000000211110224;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;3.4;50.4;53.8;54.8;50.6;Cadastre;;POLYGON Z ((768484.5 6278207.8 53.7, 768483.2 6278208.6 53.7, 768484 6278209.7 53.7, 768485.2 6278208.9 53.7, 768484.5 6278207.8 53.7))
-BATIMENT0000000211110314;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;4.2;44.6;48.8;49.8;45.0;Cadastre;;POLYGON Z ((768056.5 6278313.6 48.7, 768057.3 6278312.5 48.7, 768052.5 6278308.6 48.7, 768051.7 6278309.6 48.7, 768056.5 6278313.6 48.7))
-BATIMENT0000000211110304;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2018-02-20 11:33:35;;;;;3.0;2.5;;;;;5.1;44.7;49.8;50.6;44.7;Cadastre;;POLYGON Z ((768034.4 6278300.5 49.8, 768031.2 6278304.3 49.8, 768033.1 6278305.8 49.8, 768036 6278301.9 49.8, 768034.4 6278300.5 49.8))
-BATIMENT0000000211110294;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2018-02-20 14:11:41;;;;;3.0;2.5;;;;;5.6;44.5;50.1;50.5;;Cadastre;;POLYGON Z ((768073 6278257.6 50.1, 768071.2 6278256.1 50.1, 768068.1 6278259.6 50.1, 768064.7 6278263.9 50.1, 768066.5 6278265.4 50.1, 768073 6278257.6 50.1))
-BATIMENT0000000211110310;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;2.9;49.9;52.8;53.5;50.2;Cadastre;;POLYGON Z ((768204.6 6278324.4 52.7, 768204.8 6278327 52.7, 768206.2 6278326.9 52.7, 768206 6278325.5 52.7, 768204.6 6278324.4 52.7))
-BATIMENT0000000211110316;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2017-03-30 17:33:13;;;;;3.0;2.5;;;;;2.6;47.8;50.4;51.1;48.4;Cadastre;;POLYGON Z ((768173.9 6278305.1 50.4, 768172.5 6278304.1 50.4, 768169.7 6278307.8 50.4, 768171.1 6278308.9 50.4, 768173.9 6278305.1 50.4))
-BATIMENT0000000211110320;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;7.5;44.4;51.9;53.4;44.8;Cadastre;;POLYGON Z ((768105.7 6278288.5 51.9, 768103.5 6278286.6 51.9, 768100.3 6278287.4 51.9, 768093.5 6278295.1 51.9, 768094.5 6278296 51.9, 768101.4 6278288.5 51.9, 768104 6278290.5 51.9, 768105.7 6278288.5 51.9))
-BATIMENT0000000211110321;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;2.9;49.9;52.8;53.8;50.4;Cadastre;;POLYGON Z ((768213.4 6278314.8 52.7, 768210.8 6278313 52.7, 768207.2 6278318 52.7, 768209.8 6278319.8 52.7, 768213.4 6278314.8 52.7))
-BATIMENT0000000211110341;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;3.4;43.6;47.0;48.5;43.9;Cadastre;;POLYGON Z ((768065.6 6278282.9 47, 768063.7 6278281.3 47, 768062.1 6278283.3 47, 768062.7 6278283.8 47, 768064 6278284.8 47, 768065.6 6278282.9 47))
-BATIMENT0000000211110342;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;5.6;47.2;52.8;53.8;47.7;Cadastre;;POLYGON Z ((768134 6278325.9 52.7, 768131.9 6278326.2 52.7, 768132.1 6278327.8 52.7, 768134.2 6278327.5 52.7, 768134 6278325.9 52.7))
-BATIMENT0000000211110347;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2017-03-30 17:33:13;;;;;3.0;2.5;;;;;4.6;48.6;53.2;54.6;49.2;Cadastre;;POLYGON Z ((768190.4 6278317.3 53.2, 768194.6 6278311.7 53.2, 768192.2 6278309.9 53.2, 768188 6278315.6 53.2, 768190.4 6278317.3 53.2))
-BATIMENT0000000211117203;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:25:44;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;5.4;45.9;51.3;53.3;46.1;Cadastre;;POLYGON Z ((768355.1 6277962 51.2, 768352.5 6277963.8 51.2, 768353.4 6277965.2 51.2, 768356.1 6277963.2 51.2, 768355.1 6277962 51.2))
-BATIMENT0000000211110401;Indifférenciée;Commercial et services;;Non;En service;2008-11-18 15:19:53;2019-07-29 10:55:42;;;;;3.0;1.0;;;;;10.7;49.3;60.0;60.1;50.4;Cadastre;;POLYGON Z ((768330.2 6278321.2 60, 768344.8 6278294.5 60, 768339.1 6278291.5 60, 768348.2 6278274.4 60, 768339.4 6278269.5 60, 768315.6 6278313.4 60, 768330.2 6278321.2 60))
-BATIMENT0000000211110403;Indifférenciée;Commercial et services;;Non;En service;2008-11-18 15:19:53;2019-07-29 10:55:42;;;;;3.0;1.0;;;;;4.6;50.0;54.6;54.8;50.3;Cadastre;;POLYGON Z ((768410.7 6278302 54.5, 768415.5 6278296.5 54.5, 768399.6 6278283.3 54.5, 768395 6278288.8 54.5, 768410.7 6278302 54.5))
-BATIMENT0000000211110408;Indifférenciée;Commercial et services;;Non;En service;2008-11-18 15:19:53;2019-07-29 10:55:42;;;;;5.0;1.0;;;;;3.7;48.8;52.5;52.6;49.0;Cadastre;;POLYGON Z ((768336.2 6278261.5 52.4, 768338.2 6278258 52.4, 768335 6278256.3 52.4, 768333.1 6278259.9 52.4, 768336.2 6278261.5 52.4))
-BATIMENT0000000211117201;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:25:44;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;9.0;45.4;54.4;54.4;45.9;Cadastre;;POLYGON Z ((768319.7 6277940.7 54.3, 768318.6 6277939.1 54.3, 768316.4 6277940.8 54.3, 768318.3 6277943.4 54.3, 768320.5 6277941.7 54.3, 768319.7 6277940.7 54.3))
-BATIMENT0000000211117205;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:25:44;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;6.5;45.5;52.0;54.3;46.2;Cadastre;;POLYGON Z ((768324.8 6277952.8 52, 768322.4 6277954.7 52, 768323.2 6277955.7 52, 768325.7 6277953.8 52, 768324.8 6277952.8 52))
-BATIMENT0000000211117206;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:25:44;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;9.2;45.0;54.2;54.4;45.6;Cadastre;;POLYGON Z ((768314.2 6277944.3 54.2, 768311.8 6277946.1 54.2, 768312.6 6277947.5 54.2, 768313.3 6277948.5 54.2, 768315.9 6277946.5 54.2, 768315.2 6277945.6 54.2, 768314.2 6277944.3 54.2))
-BATIMENT0000000211117230;Indifférenciée;Commercial et services;;Non;En service;2008-11-18 15:25:44;2019-07-29 10:55:49;;;;;3.0;2.5;;;;;9.4;48.0;57.4;58.2;49.1;Cadastre;;POLYGON Z ((768405.4 6277904.9 57.4, 768401.8 6277907.5 57.4, 768398.9 6277909.6 57.4, 768411.7 6277927.2 57.4, 768414.6 6277925.1 57.4, 768418.2 6277922.5 57.4, 768405.4 6277904.9 57.4))
-BATIMENT0000000211117209;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:25:44;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;8.3;46.2;54.5;57.5;46.4;Cadastre;;POLYGON Z ((768377.9 6277946.3 54.5, 768376.6 6277944.6 54.5, 768374.2 6277946.5 54.5, 768375.4 6277948.1 54.5, 768377.9 6277946.3 54.5))
-BATIMENT0000000211117215;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:25:44;2017-03-30 17:33:13;;;;;3.0;2.5;;;;;11.0;45.6;56.6;56.8;46.3;Cadastre;;POLYGON Z ((768350.9 6277951.3 56.6, 768349.8 6277949.8 56.6, 768347.2 6277951.7 56.6, 768348.3 6277953.3 56.6, 768349 6277954.1 56.6, 768351.5 6277952.2 56.6, 768350.9 6277951.3 56.6))
-BATIMENT0000000211117249;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:25:44;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;15.1;45.1;60.2;60.4;45.5;Cadastre;;POLYGON Z ((768293.6 6277907.4 60.1, 768287.5 6277911 60.1, 768292.8 6277920.1 60.1, 768298.9 6277916.6 60.1, 768297.5 6277914.3 60.1, 768296.3 6277915.1 60.1, 768293.3 6277910 60.1, 768294.6 6277909.2 60.1, 768293.6 6277907.4 60.1))
-BATIMENT0000000211117260;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:25:44;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;3.5;54.3;57.8;59.8;55.1;Cadastre;;POLYGON Z ((768617.7 6277991.2 57.7, 768619 6277989.4 57.7, 768614 6277986 57.7, 768613.5 6277986.9 57.7, 768611.8 6277985.9 57.7, 768609.4 6277989.4 57.7, 768610.9 6277990.4 57.7, 768612.5 6277987.9 57.7, 768613 6277988.1 57.7, 768617.7 6277991.2 57.7))
-BATIMENT0000000211117268;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:25:44;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;5.1;54.9;60.0;60.8;55.4;Cadastre;;POLYGON Z ((768629.3 6277987.4 60, 768629.9 6277986.2 60, 768626.5 6277984.3 60, 768625.7 6277985.7 60, 768629.1 6277987.6 60, 768629.3 6277987.4 60))
-BATIMENT0000000211117248;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:25:44;2018-02-20 11:33:35;;;;;3.0;2.5;;;;;9.9;46.9;56.8;57.5;46.9;Cadastre;;POLYGON Z ((768387.4 6277938 56.8, 768384.8 6277940 56.8, 768385.1 6277940.5 56.8, 768385.9 6277941.4 56.8, 768388.4 6277939.5 56.8, 768387.4 6277938 56.8))
-BATIMENT0000000211110124;Indifférenciée;Sportif;;Non;En service;2008-11-18 15:19:53;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;7.2;40.6;47.8;49.8;41.7;Cadastre;;POLYGON Z ((768129.5 6278021.9 47.7, 768091.7 6278046.6 47.7, 768091.3 6278046.4 47.7, 768091 6278046.3 47.7, 768090.6 6278046.3 47.7, 768090 6278046.4 47.7, 768089.7 6278046.8 47.7, 768089.5 6278047.4 47.7, 768083.4 6278046.4 47.7, 768088.2 6278068.6 47.7, 768103.3 6278065.4 47.7, 768115.8 6278062.6 47.7, 768116.9 6278067.5 47.7, 768135.1 6278060.3 47.7, 768138.5 6278058 47.7, 768138.4 6278057.5 47.7, 768138.3 6278056.7 47.7, 768138.5 6278056.2 47.7, 768138.9 6278055.6 47.7, 768139.7 6278055.3 47.7, 768140.4 6278055.3 47.7, 768141.1 6278055.6 47.7, 768148.3 6278048.1 47.7, 768141.8 6278042.9 47.7, 768137.9 6278045 47.7, 768137.1 6278043.5 47.7, 768137.4 6278043.1 47.7, 768137.7 6278042.5 47.7, 768137.7 6278042 47.7, 768137.5 6278041.3 47.7, 768137 6278040.9 47.7, 768136.4 6278040.6 47.7, 768135.5 6278040.6 47.7, 768135.2 6278040.3 47.7, 768139.6 6278037.8 47.7, 768129.5 6278021.9 47.7))
-BATIMENT0000000231242889;Indifférenciée;Annexe;;Non;En service;2010-04-30 11:37:59;2019-04-08 10:00:52;1972-01-01;2009-07-01;;;2.5;1.5;0.0;1.0;0.0;0.0;20.5;57.0;;;;Imagerie aérienne;C 0.1;POLYGON Z ((768612.2 6278127.6 77.5, 768612.4 6278127.5 77.5, 768621.1 6278121 77.5, 768612.6 6278120.4 77.5, 768612.1 6278127.6 77.5, 768612.2 6278127.6 77.5))
-BATIMENT0000000211110547;Indifférenciée;Indifférencié;;Non;En service;2008-11-18 15:19:53;2017-03-30 17:33:13;;;;;5.0;1.0;;;;;1.9;40.9;42.8;43.3;41.2;Cadastre;;POLYGON Z ((768644.3 6278333 42.8, 768641.8 6278330.7 42.8, 768640.3 6278332.3 42.8, 768642.8 6278334.6 42.8, 768644.3 6278333 42.8))
-BATIMENT0000000211117316;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:25:44;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;3.4;50.6;54.0;54.5;51.0;Cadastre;;POLYGON Z ((768807.8 6277867.4 53.9, 768809.4 6277866.4 53.9, 768807.1 6277863.3 53.9, 768805.6 6277864.3 53.9, 768807.8 6277867.4 53.9))
-BATIMENT0000000211117310;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:25:44;2018-02-20 11:33:35;;;;;3.0;2.5;;;;;5.8;48.8;54.6;55.4;48.8;Cadastre;;POLYGON Z ((768844.3 6277952.8 54.6, 768842.4 6277947.4 54.6, 768840.8 6277948 54.6, 768842.8 6277953.4 54.6, 768844.3 6277952.8 54.6))
-BATIMENT0000000211110709;Indifférenciée;Indifférencié;;Non;En service;2008-11-18 15:19:53;2017-03-30 17:33:13;;;;;5.0;1.0;;;;;2.8;41.6;44.4;44.5;41.9;Cadastre;;POLYGON Z ((768697.1 6278469 44.3, 768694.8 6278467.1 44.3, 768693.5 6278468.6 44.3, 768696 6278470.5 44.3, 768697.1 6278469 44.3))
-BATIMENT0000000211110664;Indifférenciée;Indifférencié;;Non;En service;2008-11-18 15:19:53;2017-03-30 17:33:13;;;;;3.0;2.5;;;;;3.3;42.7;46.0;47.8;43.3;Cadastre;;POLYGON Z ((768611.2 6278426.3 46, 768613 6278425.8 46, 768613.6 6278428.4 46, 768611.9 6278428.7 46, 768612.6 6278431.1 46, 768617.3 6278429.8 46, 768618.7 6278434.3 46, 768633.1 6278430.4 46, 768630.9 6278422.3 46, 768639.4 6278420.1 46, 768636.4 6278408.9 46, 768625.7 6278411.6 46, 768627.1 6278416.8 46, 768622.8 6278417.9 46, 768622.3 6278416.1 46, 768619.6 6278414.9 46, 768618 6278415.3 46, 768616.8 6278411.1 46, 768621.4 6278409.9 46, 768618.8 6278400.1 46, 768608.3 6278402.7 46, 768610.3 6278411 46, 768602.3 6278413.1 46, 768606.1 6278427.7 46, 768611.2 6278426.3 46))
-BATIMENT0000000211110695;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;3.5;41.0;44.5;47.8;41.1;Cadastre;;POLYGON Z ((768724 6278465.2 44.5, 768730.4 6278470 44.5, 768732.4 6278467.6 44.5, 768726 6278462.7 44.5, 768724 6278465.2 44.5))
-BATIMENT0000000211110799;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;3.9;40.6;44.5;46.7;40.8;Cadastre;;POLYGON Z ((768745.1 6278457.4 44.5, 768751.6 6278448.7 44.5, 768749.2 6278446.9 44.5, 768742.7 6278455.7 44.5, 768745.1 6278457.4 44.5))
-BATIMENT0000000211103646;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:15:23;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;2.4;42.1;44.5;45.3;42.3;Cadastre;;POLYGON Z ((767867.3 6278164.1 44.5, 767868 6278162.8 44.5, 767866.5 6278162 44.5, 767865.8 6278163.4 44.5, 767867.3 6278164.1 44.5))
-BATIMENT0000000211103656;Indifférenciée;Indifférencié;;Non;En service;2008-11-18 15:15:23;2017-03-30 17:33:13;;;;;5.0;1.0;;;;;4.1;40.8;44.9;45.3;41.9;Cadastre;;POLYGON Z ((767902.4 6278123.7 44.9, 767904.2 6278120.1 44.9, 767901 6278116.3 44.9, 767898.2 6278118.6 44.9, 767902.4 6278123.7 44.9))
-BATIMENT0000000211103671;Indifférenciée;Indifférencié;;Non;En service;2008-11-18 15:15:23;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;2.6;42.6;45.2;46.3;42.9;Cadastre;;POLYGON Z ((767856.9 6278201.6 45.1, 767858.6 6278198.3 45.1, 767856.6 6278197.3 45.1, 767854.9 6278200.6 45.1, 767856.8 6278201.6 45.1, 767856.9 6278201.6 45.1))
-BATIMENT0000000211103676;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:15:23;2018-02-20 14:11:41;;;;;3.0;2.5;;;;;3.6;42.0;45.6;46.2;;Cadastre;;POLYGON Z ((767860.5 6278047.8 45.6, 767866.1 6278050.9 45.6, 767868.3 6278046.4 45.6, 767862.8 6278043.6 45.6, 767860.5 6278047.8 45.6))
-BATIMENT0000000211116393;Indifférenciée;Indifférencié;;Non;En service;2008-11-18 15:25:02;2017-03-30 17:33:13;;;;;5.0;1.0;;;;;3.4;37.4;40.8;40.9;37.5;Cadastre;;POLYGON Z ((767955.7 6277960.4 40.7, 767957.7 6277959.9 40.7, 767956.9 6277957 40.7, 767954.9 6277957.5 40.7, 767955.7 6277960.4 40.7))
-BATIMENT0000000211104440;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:15:23;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;2.3;45.2;47.5;48.8;45.4;Cadastre;;POLYGON Z ((767877.4 6278464.3 47.5, 767881.4 6278459.8 47.5, 767880.5 6278458.9 47.5, 767876.4 6278463.5 47.5, 767877.4 6278464.3 47.5))
-BATIMENT0000000211104461;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:15:23;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;4.4;45.9;50.3;52.3;46.3;Cadastre;;POLYGON Z ((767899.3 6278457.2 50.2, 767903.2 6278452.9 50.2, 767901.8 6278451.7 50.2, 767898.3 6278455.6 50.2, 767898 6278456 50.2, 767899.3 6278457.2 50.2))
-BATIMENT0000000211104466;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:15:23;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;3.5;46.0;49.5;50.5;46.3;Cadastre;;POLYGON Z ((767899 6278461.6 49.5, 767901.3 6278459.1 49.5, 767900.6 6278458.4 49.5, 767898.3 6278461 49.5, 767899 6278461.6 49.5))
-BATIMENT0000000211110280;Indifférenciée;Indifférencié;;Non;En service;2008-11-18 15:19:53;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;3.9;53.8;57.7;58.0;54.6;Cadastre;;POLYGON Z ((768018.9 6278454.1 57.6, 768022.6 6278450.2 57.6, 768017.7 6278445.6 57.6, 768014 6278449.6 57.6, 768018.9 6278454.1 57.6))
-BATIMENT0000000211110289;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;2.8;50.7;53.5;53.9;50.9;Cadastre;;POLYGON Z ((768029.8 6278399.7 53.5, 768032 6278397.4 53.5, 768030.1 6278395.6 53.5, 768027.9 6278397.9 53.5, 768029.8 6278399.7 53.5))
-BATIMENT0000000211110272;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;4.4;51.1;55.5;56.0;51.4;Cadastre;;POLYGON Z ((768024.8 6278416 55.5, 768027.1 6278413.6 55.5, 768026.3 6278412.9 55.5, 768024.1 6278415.3 55.5, 768024.8 6278416 55.5))
-BATIMENT0000000211110279;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;3.5;53.8;57.3;57.9;54.4;Cadastre;;POLYGON Z ((768022.6 6278450.2 57.2, 768023.6 6278449.1 57.2, 768018.8 6278444.5 57.2, 768017.7 6278445.6 57.2, 768022.6 6278450.2 57.2))
-BATIMENT0000000211110299;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;5.3;51.7;57.0;57.1;52.2;Cadastre;;POLYGON Z ((768134.2 6278390.7 56.9, 768132.8 6278389.6 56.9, 768132.2 6278390.6 56.9, 768133.5 6278391.6 56.9, 768134.2 6278390.7 56.9))
-BATIMENT0000000211110301;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2017-03-30 17:33:13;;;;;3.0;2.5;;;;;3.5;52.0;55.5;58.0;52.4;Cadastre;;POLYGON Z ((768198.9 6278381.2 55.5, 768200 6278379.6 55.5, 768191.9 6278374.2 55.5, 768185.4 6278382.9 55.5, 768187.1 6278383.1 55.5, 768192.2 6278376.5 55.5, 768198.9 6278381.2 55.5))
-BATIMENT0000000211110303;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;2.7;46.1;48.8;51.3;46.5;Cadastre;;POLYGON Z ((768043.9 6278346.3 48.7, 768040.9 6278344 48.7, 768039.4 6278345.9 48.7, 768042.4 6278348.2 48.7, 768043.5 6278346.7 48.7, 768043.9 6278346.3 48.7))
-BATIMENT0000000211110309;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;7.2;49.6;56.8;58.0;50.4;Cadastre;;POLYGON Z ((768127.8 6278366.1 56.7, 768128.2 6278370 56.7, 768130 6278369.8 56.7, 768129.6 6278365.9 56.7, 768127.8 6278366.1 56.7))
-BATIMENT0000000211110324;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;7.1;47.4;54.5;55.6;48.1;Cadastre;;POLYGON Z ((768101.9 6278353.8 54.5, 768101.4 6278350.9 54.5, 768099.3 6278351.2 54.5, 768097.3 6278350 54.5, 768096.2 6278351.5 54.5, 768095.9 6278352 54.5, 768099 6278354 54.5, 768101.9 6278353.8 54.5))
-BATIMENT0000000211110328;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2017-03-30 17:33:13;;;;;3.0;2.5;;;;;4.8;53.8;58.6;60.5;53.8;Cadastre;;POLYGON Z ((768054.3 6278422.2 58.6, 768058 6278418.4 58.6, 768061 6278421.3 58.6, 768066.7 6278421.9 58.6, 768068.3 6278420.2 58.6, 768067.5 6278419.4 58.6, 768061.3 6278418.9 58.6, 768057.5 6278415.3 58.6, 768052.6 6278420.6 58.6, 768054.3 6278422.2 58.6))
-BATIMENT0000000211110340;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;7.8;48.2;56.0;56.3;48.9;Cadastre;;POLYGON Z ((768140.3 6278341.9 55.9, 768136 6278340.5 55.9, 768135.5 6278341.8 55.9, 768139.8 6278343.2 55.9, 768140.3 6278341.9 55.9))
-BATIMENT0000000211110318;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2018-02-20 14:11:41;;;;;3.0;2.5;;;;;4.1;50.8;54.9;56.3;;Cadastre;;POLYGON Z ((768132.6 6278360.2 54.9, 768132.4 6278358.7 54.9, 768126.8 6278359.5 54.9, 768127.1 6278361 54.9, 768132.6 6278360.2 54.9))
-BATIMENT0000000211110373;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;5.3;52.1;57.4;57.6;52.8;Cadastre;;POLYGON Z ((768154.2 6278405 57.4, 768155.8 6278402.8 57.4, 768153.6 6278401.1 57.4, 768153.9 6278400.4 57.4, 768149.9 6278397.4 57.4, 768147.8 6278395.9 57.4, 768145.7 6278398.5 57.4, 768148.1 6278400.3 57.4, 768148.8 6278399.3 57.4, 768152.7 6278402 57.4, 768151.9 6278403.3 57.4, 768154.2 6278405 57.4))
-BATIMENT0000000211110350;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2018-02-20 14:11:41;;;;;3.0;2.5;;;;;4.8;54.2;59.0;59.3;;Cadastre;;POLYGON Z ((768170.1 6278407.8 59, 768165.5 6278404.5 59, 768164.1 6278406.4 59, 768168.7 6278409.7 59, 768170.1 6278407.8 59))
-BATIMENT0000000211110518;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;1.9;45.1;47.0;49.5;45.4;Cadastre;;POLYGON Z ((768492.9 6278424.5 47, 768488.6 6278423.9 47, 768488 6278428 47, 768492.4 6278428.5 47, 768492.9 6278424.5 47))
-BATIMENT0000000211110395;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;2.9;48.6;51.5;53.5;48.8;Cadastre;;POLYGON Z ((768402.6 6278463 51.5, 768405.7 6278463.1 51.5, 768405.7 6278460.4 51.5, 768402.7 6278460.3 51.5, 768402.6 6278463 51.5))
-BATIMENT0000000211110419;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2017-03-30 17:33:13;;;;;3.0;2.5;;;;;3.7;50.8;54.5;55.8;50.9;Cadastre;;POLYGON Z ((768367.7 6278457 54.5, 768366.8 6278456.4 54.5, 768364.1 6278460.5 54.5, 768365.1 6278461.2 54.5, 768367.7 6278457 54.5))
-BATIMENT0000000211110427;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2017-03-30 17:33:13;;;;;3.0;2.5;;;;;4.6;51.2;55.8;58.0;52.1;Cadastre;;POLYGON Z ((768351.3 6278467.7 55.8, 768348.4 6278465.8 55.8, 768344.2 6278472.4 55.8, 768345.6 6278473.4 55.8, 768347.2 6278474.3 55.8, 768351.3 6278467.7 55.8))
-BATIMENT0000000211110439;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;1.8;47.5;49.3;49.8;47.9;Cadastre;;POLYGON Z ((768437.8 6278460.4 49.2, 768437.9 6278458.1 49.2, 768429.7 6278457.5 49.2, 768429.6 6278459.7 49.2, 768437.8 6278460.4 49.2))
-BATIMENT0000000211110440;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2017-03-30 17:33:13;;;;;3.0;2.5;;;;;5.3;51.2;56.5;57.4;52.1;Cadastre;;POLYGON Z ((768351 6278482.4 56.5, 768351.6 6278481.4 56.5, 768347.9 6278479.2 56.5, 768347.4 6278480 56.5, 768351 6278482.4 56.5))
-BATIMENT0000000211110539;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;5.2;45.1;50.3;51.3;45.3;Cadastre;;POLYGON Z ((768512.5 6278443.9 50.2, 768512.6 6278442.2 50.2, 768509.7 6278441.9 50.2, 768509.6 6278442.7 50.2, 768509.6 6278443.6 50.2, 768512.5 6278443.9 50.2))
-BATIMENT0000000211110572;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;3.9;46.1;50.0;51.3;46.4;Cadastre;;POLYGON Z ((768475.8 6278461.6 50, 768472.3 6278461.3 50, 768472.1 6278463.7 50, 768473.5 6278463.8 50, 768473.3 6278466.1 50, 768475.4 6278466.3 50, 768475.6 6278464 50, 768475.8 6278461.6 50))
-BATIMENT0000000211110582;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;1.1;45.9;47.0;47.5;46.1;Cadastre;;POLYGON Z ((768499.7 6278474.3 47, 768498.7 6278474.2 47, 768498.6 6278476.1 47, 768499.5 6278476.1 47, 768499.7 6278474.3 47))
-BATIMENT0000000211110589;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;5.4;45.7;51.1;52.3;45.9;Cadastre;;POLYGON Z ((768504.6 6278466.6 51, 768504.7 6278465 51, 768497.8 6278464.3 51, 768497.6 6278466 51, 768504.6 6278466.6 51))
-BATIMENT0000000211116379;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:25:02;2017-03-30 17:33:13;;;;;3.0;2.5;;;;;12.5;36.9;49.4;49.8;39.4;Cadastre;;POLYGON Z ((767931.6 6277872.8 49.4, 767932.7 6277871.4 49.4, 767927.8 6277867.7 49.4, 767926.7 6277869.2 49.4, 767931.6 6277872.8 49.4))
-BATIMENT0000000211116369;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:25:02;2017-03-30 17:33:13;;;;;3.0;2.5;;;;;11.9;38.5;50.4;50.4;39.5;Cadastre;;POLYGON Z ((767948.2 6277868.2 50.4, 767949.2 6277867.4 50.4, 767945.8 6277862.6 50.4, 767944.7 6277863.5 50.4, 767948.2 6277868.2 50.4))
-BATIMENT0000000211116384;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:25:02;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;11.3;39.2;50.5;50.5;39.4;Cadastre;;POLYGON Z ((767952.1 6277884.8 50.4, 767954.2 6277883.3 50.4, 767950.7 6277878.4 50.4, 767948.7 6277879.9 50.4, 767952.1 6277884.8 50.4))
-BATIMENT0000000211116387;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:25:02;2017-03-30 17:33:13;;;;;3.0;2.5;;;;;13.1;36.6;49.7;50.2;39.4;Cadastre;;POLYGON Z ((767926.8 6277883.5 49.7, 767932.8 6277875.6 49.7, 767930.7 6277874 49.7, 767924.8 6277881.9 49.7, 767926.8 6277883.5 49.7))
-BATIMENT0000000211116400;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:25:02;2017-03-30 17:33:13;;;;;3.0;2.5;;;;;11.0;38.4;49.4;50.4;39.5;Cadastre;;POLYGON Z ((767943 6277861.3 49.4, 767944.2 6277860.4 49.4, 767940.6 6277855.3 49.4, 767939.3 6277856.3 49.4, 767943 6277861.3 49.4))
-BATIMENT0000000211116514;Indifférenciée;Indifférencié;;Non;En service;2008-11-18 15:25:44;2017-03-30 17:33:13;;;;;5.0;1.0;;;;;3.7;46.1;49.8;50.3;46.5;Cadastre;;POLYGON Z ((768209.2 6277808.2 49.8, 768210.5 6277811.7 49.8, 768215 6277810 49.8, 768213.8 6277806.5 49.8, 768209.2 6277808.2 49.8))
-BATIMENT0000000211117177;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:25:44;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;3.6;43.9;47.5;48.0;44.2;Cadastre;;POLYGON Z ((768030.3 6277849 47.5, 768034.8 6277847.1 47.5, 768033.4 6277843.9 47.5, 768028.2 6277846.1 47.5, 768030.3 6277849 47.5))
-BATIMENT0000000211117190;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:25:44;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;5.0;45.5;50.5;52.5;45.8;Cadastre;;POLYGON Z ((768218.3 6277857.3 50.4, 768220.6 6277856.2 50.4, 768210 6277834.9 50.4, 768207.8 6277836.1 50.4, 768218.3 6277857.3 50.4))
-BATIMENT0000000211117221;Indifférenciée;Commercial et services;;Non;En service;2008-11-18 15:25:44;2019-07-29 10:55:49;;;;;3.0;2.5;;;;;10.2;48.0;58.2;58.4;50.0;Cadastre;;POLYGON Z ((768397 6277843.3 58.2, 768402.3 6277850.7 58.2, 768409.4 6277845.6 58.2, 768404.2 6277838.3 58.2, 768397 6277843.3 58.2))
-BATIMENT0000000211117346;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:25:44;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;7.4;52.6;60.0;61.4;53.7;Cadastre;;POLYGON Z ((768769.2 6277850.8 60, 768767.9 6277849.2 60, 768762.3 6277853.2 60, 768763.7 6277855.2 60, 768769.4 6277851.3 60, 768769.2 6277850.8 60))
-BATIMENT0000000211104457;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:15:23;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;4.1;54.2;58.3;60.1;55.4;Cadastre;;POLYGON Z ((767998.8 6278463.6 58.2, 768003.9 6278458.8 58.2, 768004.7 6278459.6 58.2, 768005.5 6278458.8 58.2, 768004.7 6278458 58.2, 768009.7 6278453.4 58.2, 768009 6278452.7 58.2, 767998.1 6278462.9 58.2, 767998.8 6278463.6 58.2))
-BATIMENT0000000211104462;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:15:23;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;3.8;46.2;50.0;51.8;46.4;Cadastre;;POLYGON Z ((767910.1 6278450.3 50, 767912.1 6278448.1 50, 767911 6278447.1 50, 767909 6278449.3 50, 767910.1 6278450.3 50))
-BATIMENT0000000211104483;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:15:23;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;5.2;43.0;48.2;52.8;43.4;Cadastre;;POLYGON Z ((767950.3 6278364.2 48.2, 767957.3 6278357.8 48.2, 767954.7 6278355.2 48.2, 767947.6 6278361.4 48.2, 767950.3 6278364.2 48.2))
-BATIMENT0000000211110120;Indifférenciée;Indifférencié;;Non;En service;2008-11-18 15:19:53;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;8.1;42.7;50.8;52.8;43.7;Cadastre;;POLYGON Z ((768206.8 6278052.4 50.7, 768209.9 6278048.2 50.7, 768200.4 6278041 50.7, 768197.2 6278045.1 50.7, 768206.8 6278052.4 50.7))
-BATIMENT0000000211110338;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2017-03-30 17:33:13;;;;;3.0;2.5;;;;;2.9;45.6;48.5;49.7;45.7;Cadastre;;POLYGON Z ((768129.3 6278271.6 48.5, 768125.3 6278277.2 48.5, 768126.4 6278278.1 48.5, 768130.4 6278272.3 48.5, 768129.3 6278271.6 48.5))
-BATIMENT0000000211110273;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;4.6;50.6;55.2;57.5;50.9;Cadastre;;POLYGON Z ((768022.3 6278405.2 55.2, 768025.3 6278402 55.2, 768025.7 6278401.6 55.2, 768022.5 6278398.5 55.2, 768014.1 6278407.3 55.2, 768015.6 6278408.8 55.2, 768020.2 6278404 55.2, 768022.3 6278405.2 55.2))
-BATIMENT0000000211110296;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;2.4;50.4;52.8;54.5;50.6;Cadastre;;POLYGON Z ((768219.5 6278328.8 52.7, 768223.1 6278323.8 52.7, 768221.1 6278322.3 52.7, 768217.4 6278327.2 52.7, 768219.5 6278328.8 52.7))
-BATIMENT0000000211110297;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;3.4;44.6;48.0;48.8;44.9;Cadastre;;POLYGON Z ((768089 6278308.1 48, 768086.2 6278306.2 48, 768085.6 6278307.2 48, 768088.3 6278309.1 48, 768089 6278308.1 48))
-BATIMENT0000000211110298;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;6.5;45.0;51.5;51.8;45.3;Cadastre;;POLYGON Z ((768087.8 6278317.3 51.5, 768088.3 6278316.5 51.5, 768086.7 6278315.3 51.5, 768086.1 6278316.1 51.5, 768087.8 6278317.3 51.5))
-BATIMENT0000000211110300;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;4.3;52.5;56.8;57.1;52.7;Cadastre;;POLYGON Z ((768193.7 6278388.2 56.8, 768192.5 6278387.4 56.8, 768188.3 6278393.2 56.8, 768189.5 6278393.9 56.8, 768193.7 6278388.2 56.8))
-BATIMENT0000000211110306;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2017-03-30 17:33:13;;;;;3.0;2.5;;;;;3.4;45.1;48.5;50.2;45.3;Cadastre;;POLYGON Z ((768124.7 6278258.1 48.5, 768121.1 6278263 48.5, 768119.5 6278262 48.5, 768118 6278264 48.5, 768120.8 6278266 48.5, 768122.6 6278263.5 48.5, 768122.8 6278263.3 48.5, 768125.9 6278258.9 48.5, 768124.7 6278258.1 48.5))
-BATIMENT0000000211110326;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;3.8;53.9;57.7;59.1;54.3;Cadastre;;POLYGON Z ((768039.7 6278433.7 57.6, 768043.5 6278433.5 57.6, 768043.4 6278432 57.6, 768039.6 6278432.2 57.6, 768039.7 6278433.7 57.6))
-BATIMENT0000000211110332;Indifférenciée;Indifférencié;;Non;En service;2008-11-18 15:19:53;2017-03-30 17:33:13;;;;;5.0;1.0;;;;;2.2;48.2;50.4;50.6;48.8;Cadastre;;POLYGON Z ((768156.4 6278323.4 50.3, 768161.9 6278322.6 50.3, 768161.4 6278319.2 50.3, 768156.1 6278320 50.3, 768156.4 6278323.4 50.3))
-BATIMENT0000000211110333;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2017-03-30 17:33:13;;;;;3.0;2.5;;;;;4.3;49.4;53.7;54.0;49.5;Cadastre;;POLYGON Z ((768177.5 6278329.8 53.7, 768177.1 6278327.3 53.7, 768172.7 6278327.9 53.7, 768173 6278330.6 53.7, 768177.5 6278329.8 53.7))
-BATIMENT0000000211110348;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;4.5;44.2;48.7;51.1;44.6;Cadastre;;POLYGON Z ((768104.1 6278253.3 48.6, 768107.4 6278248.9 48.6, 768104.4 6278246.6 48.6, 768102.9 6278248.6 48.6, 768101 6278251 48.6, 768104.1 6278253.3 48.6))
-BATIMENT0000000211110356;Indifférenciée;Indifférencié;;Non;En service;2008-11-18 15:19:53;2017-03-30 17:33:13;;;;;5.0;1.0;;;;;2.4;48.3;50.7;50.9;48.8;Cadastre;;POLYGON Z ((768165.4 6278322 50.7, 768164.9 6278319.1 50.7, 768162.5 6278319.5 50.7, 768162.9 6278322.4 50.7, 768165.4 6278322 50.7))
-BATIMENT0000000211117311;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:25:44;2017-03-30 17:33:13;;;;;3.0;2.5;;;;;4.7;49.6;54.3;55.3;50.4;Cadastre;;POLYGON Z ((768813.6 6277881.6 54.3, 768814.9 6277885.3 54.3, 768816.5 6277884.7 54.3, 768815.1 6277881 54.3, 768813.6 6277881.6 54.3))
-BATIMENT0000000211110441;Indifférenciée;Commercial et services;;Oui;En service;2008-11-18 15:19:53;2019-07-29 10:55:42;;;;;5.0;1.0;;;;;16.1;50.2;66.3;67.3;50.3;Cadastre;;POLYGON Z ((768400.7 6278336.6 66.2, 768400.6 6278341.9 66.2, 768402.6 6278342.8 66.2, 768402.3 6278335.3 66.2, 768400.7 6278336.6 66.2))
-BATIMENT0000000211117347;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:25:44;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;9.6;52.3;61.9;62.6;52.6;Cadastre;;POLYGON Z ((768783 6277834.4 61.9, 768781.2 6277831.8 61.9, 768778.4 6277833.8 61.9, 768780.1 6277836.4 61.9, 768783 6277834.4 61.9))
-BATIMENT0000000211117348;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:25:44;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;9.6;51.6;61.2;61.7;52.0;Cadastre;;POLYGON Z ((768790.3 6277850.8 61.1, 768793.2 6277848.8 61.1, 768791.4 6277846.2 61.1, 768788.6 6277848.3 61.1, 768790.3 6277850.8 61.1))
-BATIMENT0000000211117351;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:25:44;2017-03-30 17:33:13;;;;;3.0;2.5;;;;;7.3;50.6;57.9;59.1;51.1;Cadastre;;POLYGON Z ((768794.9 6277887.2 57.9, 768798.4 6277884.8 57.9, 768794.8 6277879.7 57.9, 768793.7 6277880.5 57.9, 768795.5 6277883.1 57.9, 768793.1 6277884.7 57.9, 768794.9 6277887.2 57.9))
-BATIMENT0000000211117355;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:25:44;2020-05-29 12:14:55;;;;;3.0;2.5;;;;;7.8;50.7;58.5;61.3;51.6;Cadastre;;POLYGON Z ((768786.1 6277870 58.5, 768787.3 6277869.2 58.5, 768785.3 6277866.6 58.5, 768784.3 6277867.4 58.5, 768786.1 6277870 58.5))
-BATIMENT0000000211117378;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:25:44;2018-02-20 14:11:41;;;;;3.0;2.5;;;;;5.6;49.0;54.6;55.5;;Cadastre;;POLYGON Z ((768829.2 6277914.5 54.6, 768827.5 6277915.2 54.6, 768829.5 6277920.3 54.6, 768831.2 6277919.6 54.6, 768829.2 6277914.5 54.6))
-BATIMENT0000000211110157;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;5.5;47.5;53.0;54.0;48.3;Cadastre;;POLYGON Z ((768511.7 6278223.6 53, 768509.4 6278221.5 53, 768498.7 6278232.7 53, 768501 6278234.8 53, 768511.7 6278223.6 53))
-BATIMENT0000000211110163;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;4.5;56.0;60.5;61.0;57.6;Cadastre;;POLYGON Z ((768618.7 6278019.4 60.5, 768621.5 6278015.3 60.5, 768618.3 6278013.1 60.5, 768615.5 6278017.2 60.5, 768618.7 6278019.4 60.5))
-BATIMENT0000000211110173;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;5.0;51.5;56.5;57.7;51.7;Cadastre;;POLYGON Z ((768491.5 6278133.8 56.5, 768485.4 6278129.7 56.5, 768483.3 6278132.8 56.5, 768489.5 6278136.8 56.5, 768491.5 6278133.8 56.5))
-BATIMENT0000000211110195;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;2.9;51.6;54.5;56.0;51.7;Cadastre;;POLYGON Z ((768489.5 6278154 54.5, 768489.2 6278156.2 54.5, 768492.2 6278156.7 54.5, 768492.6 6278154.5 54.5, 768489.5 6278154 54.5))
-BATIMENT0000000211110197;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;3.7;51.8;55.5;56.0;51.9;Cadastre;;POLYGON Z ((768500.8 6278168.3 55.5, 768499.9 6278169.5 55.5, 768500.9 6278170.3 55.5, 768501.8 6278169 55.5, 768500.8 6278168.3 55.5))
-BATIMENT0000000211110198;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2017-03-30 17:33:13;;;;;3.0;2.5;;;;;5.4;50.2;55.6;55.8;51.7;Cadastre;;POLYGON Z ((768490.8 6278164.7 55.6, 768490.6 6278166.1 55.6, 768491.9 6278166.3 55.6, 768492.1 6278164.9 55.6, 768490.8 6278164.7 55.6))
-BATIMENT0000000211110202;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;3.8;52.0;55.8;56.5;52.1;Cadastre;;POLYGON Z ((768517.3 6278179.9 55.7, 768516.4 6278181.2 55.7, 768517.5 6278181.9 55.7, 768518.3 6278180.7 55.7, 768517.3 6278179.9 55.7))
-BATIMENT0000000211110204;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;2.1;51.4;53.5;55.3;51.5;Cadastre;;POLYGON Z ((768473.6 6278151.6 53.5, 768473.3 6278153.8 53.5, 768476.4 6278154.3 53.5, 768476.7 6278152 53.5, 768473.6 6278151.6 53.5))
-BATIMENT0000000211110220;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;3.8;50.2;54.0;55.3;50.4;Cadastre;;POLYGON Z ((768480.5 6278201.8 54, 768479.3 6278202.6 54, 768480 6278203.7 54, 768481.2 6278202.9 54, 768480.5 6278201.8 54))
-BATIMENT0000000211110391;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;3.2;48.3;51.5;51.8;48.5;Cadastre;;POLYGON Z ((768414.5 6278461.9 51.5, 768414.6 6278460.7 51.5, 768411.5 6278460.6 51.5, 768411.4 6278461.8 51.5, 768414.5 6278461.9 51.5))
-BATIMENT0000000211117236;Indifférenciée;Commercial et services;;Non;En service;2008-11-18 15:25:44;2019-07-29 10:55:49;;;;;3.0;2.5;;;;;9.3;48.0;57.3;58.1;49.1;Cadastre;;POLYGON Z ((768428.9 6277918.9 57.3, 768443.7 6277908.1 57.3, 768437.1 6277899.1 57.3, 768422.3 6277910 57.3, 768428.9 6277918.9 57.3))
-BATIMENT0000000211117275;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:25:44;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;3.2;53.9;57.1;57.4;54.4;Cadastre;;POLYGON Z ((768628.7 6277959.6 57, 768632.5 6277954.6 57, 768629.7 6277952.6 57, 768626 6277957.6 57, 768628.7 6277959.6 57))
-BATIMENT0000000211110549;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2017-03-30 17:33:13;;;;;5.0;1.0;;;;;5.7;43.1;48.8;50.3;43.2;Cadastre;;POLYGON Z ((768575.3 6278406.8 48.8, 768577.8 6278408.2 48.8, 768580 6278407.2 48.8, 768581 6278404.9 48.8, 768580.4 6278403.1 48.8, 768578 6278401.9 48.8, 768576 6278402.5 48.8, 768574.6 6278404.9 48.8, 768575.3 6278406.8 48.8))
-BATIMENT0000000211117284;Indifférenciée;Commercial et services;;Non;En service;2008-11-18 15:25:44;2019-07-29 10:55:49;;;;;3.0;2.5;;;;;3.5;49.1;52.6;54.8;;Cadastre;;POLYGON Z ((768495.5 6277913.9 52.6, 768500 6277910.8 52.6, 768496.2 6277905.4 52.6, 768491.7 6277908.5 52.6, 768495.5 6277913.9 52.6))
-BATIMENT0000000211110689;Indifférenciée;Indifférencié;;Non;En service;2008-11-18 15:19:53;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;10.0;40.5;50.5;51.6;41.2;Cadastre;;POLYGON Z ((768619.8 6278309.5 50.5, 768638.9 6278326.3 50.5, 768639.5 6278325.7 50.5, 768643.7 6278329.7 50.5, 768645.1 6278328.2 50.5, 768647.5 6278330.4 50.5, 768651.9 6278325.2 50.5, 768645.1 6278319.1 50.5, 768646.8 6278317.3 50.5, 768646.1 6278316.6 50.5, 768647.1 6278315.5 50.5, 768644.7 6278313.4 50.5, 768643.6 6278314.6 50.5, 768636.1 6278307.9 50.5, 768635.8 6278307.6 50.5, 768628.8 6278301.3 50.5, 768627.9 6278300.6 50.5, 768619.8 6278309.5 50.5))
-BATIMENT0000000211110766;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;4.7;41.8;46.5;48.5;42.0;Cadastre;;POLYGON Z ((768692.6 6278427 46.5, 768700.3 6278413.6 46.5, 768699.1 6278412.9 46.5, 768691.4 6278426.2 46.5, 768692.6 6278427 46.5))
-BATIMENT0000000211117223;Indifférenciée;Commercial et services;;Oui;En service;2008-11-18 15:25:44;2019-07-29 10:55:49;;;;;3.0;2.5;;;;;10.0;48.0;58.0;58.3;49.2;Cadastre;;POLYGON Z ((768422.3 6277928.2 58, 768424.6 6277927 58, 768420.2 6277921 58, 768415.7 6277914.8 58, 768414.1 6277912.7 58, 768382.1 6277868.9 58, 768380 6277870.4 58, 768384.2 6277876.1 58, 768386.5 6277879.2 58, 768403.3 6277902.1 58, 768405.4 6277904.9 58, 768418.2 6277922.5 58, 768420.5 6277925.8 58, 768422.3 6277928.2 58))
-BATIMENT0000000211117210;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:25:44;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;9.9;45.6;55.5;56.6;46.1;Cadastre;;POLYGON Z ((768332 6277962.7 55.5, 768329.6 6277964.5 55.5, 768330.8 6277966 55.5, 768331.3 6277966.9 55.5, 768333.7 6277965.2 55.5, 768333.2 6277964.3 55.5, 768332 6277962.7 55.5))
-BATIMENT0000000211117212;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:25:44;2017-03-30 17:33:13;;;;;3.0;2.5;;;;;8.4;45.6;54.0;54.3;46.5;Cadastre;;POLYGON Z ((768334.7 6277945 54, 768331.9 6277947.2 54, 768332.9 6277948.5 54, 768333.2 6277948.9 54, 768336 6277946.7 54, 768334.7 6277945 54))
-BATIMENT0000000211117213;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:25:44;2017-03-30 17:33:13;;;;;3.0;2.5;;;;;8.6;45.6;54.2;54.4;46.3;Cadastre;;POLYGON Z ((768332.6 6277932.3 54.2, 768331.8 6277931.1 54.2, 768329.4 6277932.7 54.2, 768330.3 6277934.2 54.2, 768331.1 6277935.2 54.2, 768333.5 6277933.4 54.2, 768332.6 6277932.3 54.2))
-BATIMENT0000000211117227;Indifférenciée;Commercial et services;;Oui;En service;2008-11-18 15:25:44;2019-07-29 10:55:49;;;;;3.0;2.5;;;;;8.5;48.0;56.5;57.0;49.1;Cadastre;;POLYGON Z ((768437.3 6277872 56.5, 768433.4 6277874.8 56.5, 768435.8 6277878.2 56.5, 768439.7 6277875.4 56.5, 768437.3 6277872 56.5))
-BATIMENT0000000211117217;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:25:44;2017-03-30 17:33:13;;;;;3.0;2.5;;;;;10.7;45.6;56.3;56.9;46.0;Cadastre;;POLYGON Z ((768345.3 6277969.7 56.3, 768342.8 6277971.5 56.3, 768344.1 6277973.3 56.3, 768346.5 6277971.6 56.3, 768346 6277970.7 56.3, 768345.3 6277969.7 56.3))
-BATIMENT0000000211117255;Indifférenciée;Indifférencié;;Non;En service;2008-11-18 15:25:44;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;2.5;54.2;56.7;56.8;54.6;Cadastre;;POLYGON Z ((768622.1 6277974 56.7, 768623.3 6277975 56.7, 768624.2 6277973.8 56.7, 768622.8 6277973 56.7, 768622.1 6277974 56.7))
-BATIMENT0000000211117257;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:25:44;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;4.1;52.4;56.5;57.5;53.0;Cadastre;;POLYGON Z ((768612 6277940.2 56.5, 768613.9 6277937.4 56.5, 768606 6277932.3 56.5, 768605.1 6277933.6 56.5, 768610.2 6277937.2 56.5, 768609.3 6277938.5 56.5, 768612 6277940.2 56.5))
-BATIMENT0000000211117318;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:25:44;2017-03-30 17:33:13;;;;;3.0;1.0;;;;;8.2;55.6;63.8;64.4;55.8;Cadastre;;POLYGON Z ((768661.7 6277975.9 63.7, 768662.6 6277974.8 63.7, 768663.2 6277974.1 63.7, 768661.4 6277972.7 63.7, 768660.6 6277972 63.7, 768659.1 6277973.9 63.7, 768659.3 6277974.1 63.7, 768661.7 6277975.9 63.7))
-BATIMENT0000000211117319;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:25:44;2017-03-30 17:33:13;;;;;5.0;1.0;;;;;1.8;52.9;54.7;54.8;53.3;Cadastre;;POLYGON Z ((768767.1 6277978.8 54.7, 768768.3 6277977.6 54.7, 768767 6277976.1 54.7, 768765.6 6277977.5 54.7, 768767.1 6277978.8 54.7))
-BATIMENT0000000211117296;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:25:44;2020-05-29 12:14:55;;;;;5.0;1.0;;;;;1.9;52.8;54.7;55.0;52.9;Cadastre;;POLYGON Z ((768740.7 6277906.3 54.6, 768741.9 6277905 54.6, 768740.5 6277903.7 54.6, 768739.5 6277904.7 54.6, 768740.7 6277906.3 54.6))
-BATIMENT0000000211117287;Indifférenciée;Commercial et services;;Oui;En service;2008-11-18 15:25:44;2020-05-29 12:14:55;;;;;3.0;2.5;;;;;9.9;48.0;57.9;58.4;48.0;Cadastre;;POLYGON Z ((768458 6277912.1 57.9, 768460.1 6277910.6 57.9, 768456.9 6277906.3 57.9, 768456 6277907.1 57.9, 768455 6277908 57.9, 768458 6277912.1 57.9))
-BATIMENT0000002000330295;Indifférenciée;Commercial et services;;Non;En service;2016-11-10 15:15:48;2019-07-29 10:55:42;;2015-07-01;;;2.5;1.5;;;;;5.8;50.6;;;;Imagerie aérienne;;POLYGON Z ((768361.7 6278333.5 56.4, 768347.4 6278359 56.4, 768352.8 6278362.2 56.4, 768366.8 6278336.3 56.4, 768361.7 6278333.5 56.4))
-BATIMENT0000000211116825;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:25:44;2020-05-29 12:14:55;;;;;3.0;1.0;;;;;11.1;48.7;59.8;59.9;48.9;Cadastre;;POLYGON Z ((768279.5 6277809.4 59.8, 768282.3 6277814.2 59.8, 768284.5 6277813.1 59.8, 768284.6 6277812.4 59.8, 768284.7 6277811.9 59.8, 768284.8 6277811.3 59.8, 768284.7 6277810.8 59.8, 768284.6 6277810.5 59.8, 768284.2 6277809.7 59.8, 768283.6 6277809.2 59.8, 768282.2 6277808.1 59.8, 768279.5 6277809.4 59.8))
-BATIMENT0000000211117269;Indifférenciée;Indifférencié;;Non;En service;2008-11-18 15:25:44;2020-05-29 12:14:55;;;;;5.0;1.0;;;;;15.1;53.0;68.1;68.1;53.5;Cadastre;;POLYGON Z ((768616.1 6277943.8 68.1, 768618.9 6277945.8 68.1, 768622.5 6277940.4 68.1, 768619.7 6277938.6 68.1, 768616.1 6277943.8 68.1))
-BATIMENT0000000211116533;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:25:44;2020-05-29 12:14:55;;;;;3.0;1.0;;;;;1.6;45.7;47.3;48.0;45.9;Cadastre;;POLYGON Z ((768101.5 6277822.5 47.2, 768101.1 6277821.6 47.2, 768099.5 6277822.3 47.2, 768099.9 6277823.2 47.2, 768101.5 6277822.5 47.2))
-BATIMENT0000000211117239;Indifférenciée;Commercial et services;;Non;En service;2008-11-18 15:25:44;2020-05-29 12:14:55;;;;;3.0;2.5;;;;;9.6;48.0;57.6;58.4;48.0;Cadastre;;POLYGON Z ((768434.5 6277940.6 57.6, 768439 6277937.3 57.6, 768431.9 6277927.6 57.6, 768427.4 6277930.9 57.6, 768434.5 6277940.6 57.6))
-BATIMENT0000000211103661;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:15:23;2020-05-29 12:14:55;;;;;3.0;1.0;;;;;2.7;41.9;44.6;44.7;42.1;Cadastre;;POLYGON Z ((767875.1 6278146.4 44.6, 767876.3 6278143.8 44.6, 767877.5 6278141.2 44.6, 767876.6 6278140.8 44.6, 767875.4 6278143.4 44.6, 767874.2 6278145.9 44.6, 767875.1 6278146.4 44.6))
-BATIMENT0000000211110205;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2020-05-29 12:14:55;;;;;3.0;1.0;;;;;3.1;51.4;54.5;55.8;51.6;Cadastre;;POLYGON Z ((768483.7 6278163.6 54.5, 768483.5 6278165 54.5, 768484.8 6278165.3 54.5, 768485 6278163.8 54.5, 768483.7 6278163.6 54.5))
-BATIMENT0000000211110801;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:19:53;2020-05-29 12:14:55;1975-01-01;;;;3.0;1.0;1.0;2.0;50.0;10.0;7.0;40.8;47.8;48.4;41.0;Cadastre;A 1.0;POLYGON Z ((768722.1 6278437 47.7, 768725.9 6278439.8 47.7, 768725.5 6278440.5 47.7, 768728.8 6278443 47.7, 768728.1 6278443.9 47.7, 768729.1 6278444.7 47.7, 768730.4 6278443.1 47.7, 768731.5 6278444 47.7, 768731.9 6278443.6 47.7, 768730.9 6278442.7 47.7, 768738.7 6278432.6 47.7, 768739.6 6278433.5 47.7, 768740.1 6278432.9 47.7, 768734.9 6278428.8 47.7, 768733.7 6278430.2 47.7, 768729.8 6278426.9 47.7, 768729.2 6278427.6 47.7, 768730 6278428.1 47.7, 768723.4 6278436.9 47.7, 768722.6 6278436.2 47.7, 768722.1 6278437 47.7))
-BATIMENT0000002215845079;Indifférenciée;Indifférencié;;Non;En service;2020-11-10 17:31:25;;;2018-07-08;;;2.5;1.5;;;;;18.3;48.0;;;;Imagerie aérienne;;POLYGON Z ((768409.9 6278040.3 66.3, 768413.4 6278061.6 66.3, 768414.5 6278061.3 66.3, 768415.3 6278064.6 66.3, 768425.1 6278062.9 66.3, 768424.2 6278058.9 66.3, 768425.4 6278058.7 66.3, 768446.4 6278054.1 66.3, 768444 6278039.7 66.3, 768441.3 6278040.1 66.3, 768439.9 6278033.9 66.3, 768409.9 6278040.3 66.3))
-BATIMENT0000000211110125;Indifférenciée;Indifférencié;;Non;En service;2008-11-18 15:19:53;2017-12-13 14:38:36;;;;;2.5;1.5;;;;;4.4;48.0;;54.2;49.4;Imagerie aérienne;;POLYGON Z ((768414.1 6278121.8 52.4, 768414.5 6278119.8 52.4, 768418.1 6278119.2 52.4, 768418 6278116.8 52.4, 768411 6278117.1 52.4, 768414.1 6278121.8 52.4))
-BATIMENT0000000211117276;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:25:44;2018-02-20 09:16:47;;;;;3.0;2.5;;;;;2.6;53.9;56.5;;;Cadastre;;POLYGON Z ((768604.7 6277945.3 56.5, 768605.6 6277944 56.5, 768600.4 6277940.7 56.5, 768599.6 6277941.9 56.5, 768604.7 6277945.3 56.5))
-BATIMENT0000000211117350;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:25:44;2018-02-20 09:16:47;;;;;3.0;2.5;;;;;8.0;50.8;58.8;;;Cadastre;;POLYGON Z ((768784.2 6277855.1 58.8, 768785 6277856.3 58.8, 768787.6 6277854.5 58.8, 768786.8 6277853.3 58.8, 768784.2 6277855.1 58.8))
-BATIMENT0000000211117358;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:25:44;2018-02-20 09:16:47;;;;;3.0;2.5;;;;;13.2;55.2;68.4;;;Cadastre;;POLYGON Z ((768672.6 6277850.9 68.4, 768672.5 6277844.7 68.4, 768671.3 6277844.7 68.4, 768671.4 6277851 68.4, 768672.6 6277850.9 68.4))
-BATIMENT0000000211117359;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:25:44;2018-02-20 09:16:47;;;;;3.0;2.5;;;;;13.2;55.2;68.4;;;Cadastre;;POLYGON Z ((768672.4 6277838.5 68.4, 768671.2 6277838.5 68.4, 768671.3 6277844.7 68.4, 768672.5 6277844.7 68.4, 768672.4 6277838.5 68.4))
-BATIMENT0000000211117362;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:25:44;2018-02-20 09:16:47;;;;;3.0;2.5;;;;;13.0;55.4;68.4;;;Cadastre;;POLYGON Z ((768687.9 6277832.3 68.4, 768689.2 6277832.3 68.4, 768689.1 6277826.1 68.4, 768687.8 6277826.2 68.4, 768687.9 6277832.3 68.4))
-BATIMENT0000000211117363;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:25:44;2018-02-20 09:16:47;;;;;3.0;2.5;;;;;13.0;55.4;68.4;;;Cadastre;;POLYGON Z ((768689.2 6277838.4 68.4, 768689.2 6277832.3 68.4, 768687.9 6277832.3 68.4, 768688 6277838.4 68.4, 768689.2 6277838.4 68.4))
-BATIMENT0000000211117365;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:25:44;2018-02-20 09:16:47;;;;;3.0;2.5;;;;;13.0;55.4;68.4;;;Cadastre;;POLYGON Z ((768689.4 6277850.7 68.4, 768689.3 6277844.6 68.4, 768688.1 6277844.6 68.4, 768688.2 6277850.7 68.4, 768689.4 6277850.7 68.4))
-BATIMENT0000000211117303;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:25:44;2018-02-20 09:16:47;;;;;3.0;2.5;;;;;5.3;48.1;53.4;;;Cadastre;;POLYGON Z ((768841.5 6277907.8 53.4, 768846.4 6277905 53.4, 768845.8 6277903.7 53.4, 768840.8 6277906.5 53.4, 768841.5 6277907.8 53.4))
-BATIMENT0000000211117364;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:25:44;2018-02-20 09:16:47;;;;;3.0;2.5;;;;;13.0;55.4;68.4;;;Cadastre;;POLYGON Z ((768689.3 6277844.6 68.4, 768689.2 6277838.4 68.4, 768688 6277838.4 68.4, 768688.1 6277844.6 68.4, 768689.3 6277844.6 68.4))
-BATIMENT0000000211110660;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2018-02-20 09:16:47;;;;;3.0;2.5;;;;;5.5;46.1;51.6;;;Cadastre;;POLYGON Z ((768534.5 6278482.7 51.6, 768537.6 6278479.5 51.6, 768537.2 6278479.1 51.6, 768538.5 6278477.9 51.6, 768537.5 6278476.9 51.6, 768536.8 6278477.7 51.6, 768533.1 6278481.2 51.6, 768534.5 6278482.7 51.6))
-BATIMENT0000000211103638;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:15:23;2018-02-20 09:16:47;;;;;3.0;2.5;;;;;5.6;43.0;48.6;;;Cadastre;;POLYGON Z ((767861.5 6278209.9 48.6, 767860.6 6278211.7 48.6, 767865.9 6278214.3 48.6, 767866.8 6278212.5 48.6, 767861.5 6278209.9 48.6))
-BATIMENT0000000211103668;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:15:23;2018-02-20 09:16:47;;;;;3.0;2.5;;;;;4.5;43.0;47.5;;;Cadastre;;POLYGON Z ((767870.4 6278157.7 47.5, 767868.8 6278157 47.5, 767868.2 6278158.4 47.5, 767869.7 6278159.1 47.5, 767870.4 6278157.7 47.5))
-BATIMENT0000000211104459;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:15:23;2018-02-20 09:16:47;;;;;3.0;2.5;;;;;4.3;49.1;53.4;;;Cadastre;;POLYGON Z ((767982.2 6278410.7 53.4, 767984.8 6278407.9 53.4, 767982.4 6278405.7 53.4, 767979.8 6278408.4 53.4, 767982.2 6278410.7 53.4))
-BATIMENT0000000211110292;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2018-02-20 09:16:47;;;;;3.0;2.5;;;;;3.8;48.6;52.4;;;Cadastre;;POLYGON Z ((768139.6 6278325.1 52.4, 768142.2 6278324.7 52.4, 768140.4 6278315 52.4, 768137.8 6278315.4 52.4, 768139.6 6278325.1 52.4))
-BATIMENT0000000211110336;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2018-02-20 09:16:47;;;;;3.0;2.5;;;;;8.4;48.5;56.9;;;Cadastre;;POLYGON Z ((768033.7 6278395.4 56.9, 768036.4 6278392.6 56.9, 768035.3 6278391.7 56.9, 768034.5 6278390.9 56.9, 768031.9 6278393.7 56.9, 768033.7 6278395.4 56.9))
-BATIMENT0000000211110339;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2018-02-20 09:16:47;;;;;3.0;2.5;;;;;4.7;49.6;54.3;;;Cadastre;;POLYGON Z ((768125.5 6278339.1 54.3, 768123.7 6278338.5 54.3, 768122.9 6278341.4 54.3, 768124.5 6278342 54.3, 768125.5 6278339.1 54.3))
-BATIMENT0000000211110343;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2018-02-20 09:16:47;;;;;3.0;2.5;;;;;5.6;44.5;50.1;;;Cadastre;;POLYGON Z ((768077.3 6278264.1 50.1, 768074.9 6278267.1 50.1, 768076.4 6278268.4 50.1, 768078.9 6278265.5 50.1, 768077.3 6278264.1 50.1))
-BATIMENT0000000211110270;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2018-02-20 09:16:47;;;;;3.0;2.5;;;;;2.9;48.5;51.4;;;Cadastre;;POLYGON Z ((768019.6 6278371.3 51.4, 768024.8 6278366.1 51.4, 768023.7 6278365.1 51.4, 768018.7 6278370.4 51.4, 768019.6 6278371.3 51.4))
-BATIMENT0000000211116370;Indifférenciée;Indifférencié;;Non;En service;2008-11-18 15:25:02;2018-02-20 09:16:47;;;;;3.0;2.5;;;;;13.3;36.8;50.1;;;Cadastre;;POLYGON Z ((767931.8 6277887.2 50.1, 767938.6 6277878 50.1, 767933.7 6277874.4 50.1, 767932.8 6277875.6 50.1, 767926.8 6277883.5 50.1, 767931.8 6277887.2 50.1))
-BATIMENT0000000211116374;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:25:02;2018-02-20 09:16:47;;;;;3.0;2.5;;;;;12.1;36.9;49.0;;;Cadastre;;POLYGON Z ((767917.4 6277862.4 49, 767918.5 6277860.9 49, 767913.7 6277857.4 49, 767912.6 6277858.8 49, 767917.4 6277862.4 49))
-BATIMENT0000000211117243;Indifférenciée;Commercial et services;;Oui;En service;2008-11-18 15:25:44;2019-07-29 10:55:49;;;;;3.0;2.5;;;;;7.4;48.0;55.4;;;Cadastre;;POLYGON Z ((768432.2 6277845.9 55.4, 768439.8 6277856.3 55.4, 768442.7 6277854.3 55.4, 768435.3 6277843.9 55.4, 768432.2 6277845.9 55.4))
-BATIMENT0000000211104436;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:15:23;2018-02-20 09:16:47;;;;;3.0;2.5;;;;;5.7;46.7;52.4;;;Cadastre;;POLYGON Z ((767921.6 6278470.4 52.4, 767924.7 6278467.2 52.4, 767921.3 6278464 52.4, 767918.3 6278467.3 52.4, 767921.6 6278470.4 52.4))
-BATIMENT0000000211104448;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:15:23;2018-02-20 09:16:47;;;;;3.0;2.5;;;;;6.2;46.7;52.9;;;Cadastre;;POLYGON Z ((767932.2 6278477.2 52.9, 767933.7 6278475.6 52.9, 767930.4 6278472.5 52.9, 767927.4 6278475.7 52.9, 767928.8 6278477.1 52.9, 767930.3 6278475.4 52.9, 767932.2 6278477.2 52.9))
-BATIMENT0000000211116391;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:25:02;2018-02-20 09:16:47;;;;;3.0;2.5;;;;;10.2;38.6;48.8;;;Cadastre;;POLYGON Z ((767932.4 6277846.8 48.8, 767933.8 6277845.7 48.8, 767930.2 6277841 48.8, 767928.7 6277842 48.8, 767932.4 6277846.8 48.8))
-BATIMENT0000000211116383;Indifférenciée;Indifférencié;;Non;En service;2008-11-18 15:25:02;2018-02-20 09:16:47;;;;;3.0;2.5;;;;;14.1;37.0;51.1;;;Cadastre;;POLYGON Z ((767949 6277890.7 51.1, 767953.9 6277887 51.1, 767952.1 6277884.8 51.1, 767948.7 6277879.9 51.1, 767943.8 6277883.8 51.1, 767949 6277890.7 51.1))
-BATIMENT0000000211116548;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:25:44;2018-02-20 09:16:47;;;;;3.0;2.5;;;;;2.2;47.2;49.4;;;Cadastre;;POLYGON Z ((768055 6277815.1 49.4, 768057.7 6277813.9 49.4, 768057.1 6277812.5 49.4, 768054.4 6277813.6 49.4, 768055 6277815.1 49.4))
-BATIMENT0000000211116621;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:25:44;2018-02-20 09:16:47;;;;;3.0;2.5;;;;;5.8;45.4;51.2;;;Cadastre;;POLYGON Z ((768143.2 6277820.7 51.2, 768142.8 6277819.7 51.2, 768137.7 6277822 51.2, 768138.2 6277823 51.2, 768143.2 6277820.7 51.2))
-BATIMENT0000000211117328;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:25:44;2018-02-20 09:16:47;;;;;3.0;2.5;;;;;5.8;48.8;54.6;;;Cadastre;;POLYGON Z ((768841 6277943.8 54.6, 768839.2 6277939 54.6, 768837.6 6277939.6 54.6, 768839.5 6277944.4 54.6, 768841 6277943.8 54.6))
-BATIMENT0000000211117361;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:25:44;2018-02-20 09:16:47;;;;;3.0;2.5;;;;;13.2;55.2;68.4;;;Cadastre;;POLYGON Z ((768672.3 6277826.4 68.4, 768671 6277826.4 68.4, 768671.1 6277832.8 68.4, 768672.3 6277832.8 68.4, 768672.3 6277826.4 68.4))
-BATIMENT0000000211117218;Indifférenciée;Commercial et services;;Oui;En service;2008-11-18 15:25:44;2019-07-29 10:55:49;;;;;3.0;2.5;;;;;10.1;48.0;58.1;;;Cadastre;;POLYGON Z ((768375.5 6277859.2 58.1, 768381.6 6277854.8 58.1, 768379.3 6277851.6 58.1, 768382.3 6277849.5 58.1, 768378 6277843.6 58.1, 768377.8 6277843.4 58.1, 768364.7 6277852.9 58.1, 768368.5 6277858.1 58.1, 768372.5 6277855.2 58.1, 768375.5 6277859.2 58.1))
-BATIMENT0000000211117258;Indifférenciée;Commercial et services;;Non;En service;2008-11-18 15:25:44;2019-07-29 10:55:49;;;;;3.0;2.5;;;;;6.2;49.2;55.4;;;Cadastre;;POLYGON Z ((768494.3 6277896.7 55.4, 768504.8 6277889.4 55.4, 768501.3 6277884.4 55.4, 768490.8 6277891.7 55.4, 768494.3 6277896.7 55.4))
-BATIMENT0000000211117251;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:25:44;2018-02-20 09:16:47;;;;;3.0;2.5;;;;;14.4;46.5;60.9;;;Cadastre;;POLYGON Z ((768309.5 6277904 60.9, 768307.7 6277905.1 60.9, 768308.9 6277907.1 60.9, 768310.8 6277906 60.9, 768309.5 6277904 60.9))
-BATIMENT0000000211117253;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:25:44;2018-02-20 09:16:47;;;;;3.0;2.5;;;;;14.4;46.5;60.9;;;Cadastre;;POLYGON Z ((768308.3 6277902 60.9, 768306.5 6277903 60.9, 768307.7 6277905.1 60.9, 768309.5 6277904 60.9, 768308.3 6277902 60.9))
-BATIMENT0000000211117264;Indifférenciée;Commercial et services;;Non;En service;2008-11-18 15:25:44;2019-07-29 10:55:49;;;;;3.0;2.5;;;;;3.7;49.0;52.7;;;Cadastre;;POLYGON Z ((768486.2 6277900.8 52.7, 768490.8 6277897.6 52.7, 768488.8 6277894.8 52.7, 768484.2 6277898.1 52.7, 768486.2 6277900.8 52.7))
-BATIMENT0000000211110196;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2018-02-20 09:16:47;;;;;3.0;2.5;;;;;6.5;50.2;56.7;;;Cadastre;;POLYGON Z ((768498.2 6278162.2 56.7, 768496.3 6278167 56.7, 768497.9 6278168.1 56.7, 768500.7 6278164 56.7, 768498.2 6278162.2 56.7))
-BATIMENT0000000211110203;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2018-02-20 09:16:47;;;;;3.0;2.5;;;;;5.9;50.2;56.1;;;Cadastre;;POLYGON Z ((768470.9 6278161.6 56.1, 768470.7 6278163.1 56.1, 768472 6278163.3 56.1, 768472.2 6278161.8 56.1, 768472.1 6278161.8 56.1, 768470.9 6278161.6 56.1))
-BATIMENT0000000211110277;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2018-02-20 09:16:47;;;;;3.0;2.5;;;;;6.9;45.1;52.0;;;Cadastre;;POLYGON Z ((768011.9 6278327.9 52, 768009.9 6278326 52, 768006.4 6278329.5 52, 768004.5 6278327.5 52, 768003.4 6278328.5 52, 768006.5 6278331.6 52, 768008.6 6278329.4 52, 768009.5 6278330.4 52, 768011.9 6278327.9 52))
-BATIMENT0000000211110317;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2018-02-20 09:16:47;;;;;3.0;2.5;;;;;4.1;45.7;49.8;;;Cadastre;;POLYGON Z ((768051.7 6278309.6 49.8, 768046.4 6278305.4 49.8, 768045 6278307.3 49.8, 768050.1 6278311.4 49.8, 768051.7 6278309.6 49.8))
-BATIMENT0000000211110345;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2018-02-20 09:16:47;;;;;3.0;2.5;;;;;2.9;47.8;50.7;;;Cadastre;;POLYGON Z ((768068.9 6278323 50.7, 768066.1 6278322.1 50.7, 768063.7 6278329.1 50.7, 768066.6 6278330.1 50.7, 768068.9 6278323 50.7))
-BATIMENT0000000211117263;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:25:44;2018-02-20 09:16:47;;;;;3.0;2.5;;;;;20.5;48.7;69.2;;;Cadastre;;POLYGON Z ((768510.7 6277975.4 69.2, 768515.1 6277970.8 69.2, 768511.5 6277967.3 69.2, 768507.2 6277972.1 69.2, 768510.7 6277975.4 69.2))
-BATIMENT0000000211117283;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:25:44;2018-02-20 09:16:47;;;;;3.0;2.5;;;;;7.0;49.8;56.8;;;Cadastre;;POLYGON Z ((768568.8 6277970 56.8, 768571.7 6277965.8 56.8, 768564.5 6277960.8 56.8, 768564.8 6277963 56.8, 768567.2 6277964.5 56.8, 768565.1 6277967.5 56.8, 768568.8 6277970 56.8))
-BATIMENT0000000211103687;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:15:23;2018-02-20 09:16:47;;;;;3.0;2.5;;;;;5.0;43.0;48.0;;;Cadastre;;POLYGON Z ((767863.3 6278104.2 48, 767864.6 6278104.8 48, 767865.2 6278103.4 48, 767864 6278102.8 48, 767863.3 6278104.2 48))
-BATIMENT0000000211104411;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:15:23;2018-02-20 09:16:47;;;;;3.0;2.5;;;;;4.8;48.9;53.7;;;Cadastre;;POLYGON Z ((767973.5 6278421.2 53.7, 767978.4 6278415.9 53.7, 767976.2 6278413.9 53.7, 767971.3 6278419.2 53.7, 767973.5 6278421.2 53.7))
-BATIMENT0000000211104475;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:15:23;2018-02-20 09:16:47;;;;;3.0;2.5;;;;;4.8;45.1;49.9;;;Cadastre;;POLYGON Z ((767998.8 6278346.1 49.9, 768001.9 6278343 49.9, 767999.7 6278340.8 49.9, 767996.6 6278343.9 49.9, 767998.8 6278346.1 49.9))
-BATIMENT0000000211110274;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2018-02-20 09:16:47;;;;;3.0;2.5;;;;;3.0;48.7;51.7;;;Cadastre;;POLYGON Z ((768007.3 6278387.1 51.7, 768011.8 6278382.4 51.7, 768010.6 6278381.3 51.7, 768006.1 6278386 51.7, 768007.3 6278387.1 51.7))
-BATIMENT0000000211110278;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2018-02-20 09:16:47;;;;;3.0;2.5;;;;;5.6;45.1;50.7;;;Cadastre;;POLYGON Z ((768003 6278352.2 50.7, 768005.3 6278349.9 50.7, 768004.5 6278349.1 50.7, 768002.2 6278351.4 50.7, 768003 6278352.2 50.7))
-BATIMENT0000000211110360;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2018-02-20 09:16:47;;;;;3.0;2.5;;;;;7.5;48.5;56.0;;;Cadastre;;POLYGON Z ((768042.3 6278386.8 56, 768044.6 6278384.4 56, 768043.4 6278383.2 56, 768041 6278385.7 56, 768042.3 6278386.8 56))
-BATIMENT0000000211116378;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:25:02;2018-02-20 09:16:47;;;;;3.0;2.5;;;;;13.1;36.9;50.0;;;Cadastre;;POLYGON Z ((767938.6 6277878 50, 767939.6 6277876.6 50, 767934.8 6277873 50, 767933.7 6277874.4 50, 767938.6 6277878 50))
-BATIMENT0000000211116371;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:25:02;2018-02-20 09:16:47;;;;;3.0;2.5;;;;;14.0;37.1;51.1;;;Cadastre;;POLYGON Z ((767943.8 6277883.8 51.1, 767948.7 6277879.9 51.1, 767947.4 6277878.3 51.1, 767942.5 6277882.1 51.1, 767943.8 6277883.8 51.1))
-BATIMENT0000000211116624;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:25:44;2018-02-20 09:16:47;;;;;3.0;2.5;;;;;5.0;45.4;50.4;;;Cadastre;;POLYGON Z ((768152.4 6277814.1 50.4, 768151.9 6277812.9 50.4, 768147 6277815.2 50.4, 768147.5 6277816.3 50.4, 768152.4 6277814.1 50.4))
-BATIMENT0000000211117186;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:25:44;2018-02-20 09:16:47;;;;;3.0;2.5;;;;;7.2;44.4;51.6;;;Cadastre;;POLYGON Z ((768084.3 6277832.5 51.6, 768087.9 6277831 51.6, 768087.3 6277829.8 51.6, 768083.8 6277831.3 51.6, 768084.3 6277832.5 51.6))
-BATIMENT0000000211104413;Indifférenciée;Indifférencié;;Non;En service;2008-11-18 15:15:23;2018-02-20 09:16:47;;;;;3.0;2.5;;;;;7.6;51.0;58.6;;;Cadastre;;POLYGON Z ((767999.6 6278439.3 58.6, 768002 6278436.9 58.6, 767998.9 6278433.8 58.6, 767996.6 6278436.1 58.6, 767999.6 6278439.3 58.6))
-BATIMENT0000000211104480;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:15:23;2018-02-20 09:16:47;;;;;3.0;2.5;;;;;5.0;48.1;53.1;;;Cadastre;;POLYGON Z ((767999.2 6278396.1 53.1, 768000.3 6278395 53.1, 767997.2 6278392 53.1, 767996.1 6278393.2 53.1, 767999.2 6278396.1 53.1))
-BATIMENT0000000211104481;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:15:23;2018-02-20 09:16:47;;;;;3.0;2.5;;;;;7.8;50.8;58.6;;;Cadastre;;POLYGON Z ((767980.4 6278459.9 58.6, 767982.2 6278458.1 58.6, 767981.7 6278457.6 58.6, 767981.3 6278457.2 58.6, 767979.5 6278459.1 58.6, 767980.4 6278459.9 58.6))
-BATIMENT0000000211104487;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:15:23;2018-02-20 09:16:47;;;;;3.0;2.5;;;;;5.7;46.6;52.3;;;Cadastre;;POLYGON Z ((767911.3 6278477.1 52.3, 767912.6 6278475.6 52.3, 767911.5 6278474.6 52.3, 767910.1 6278476 52.3, 767911.3 6278477.1 52.3))
-BATIMENT0000000211110271;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2018-02-20 09:16:47;;;;;3.0;2.5;;;;;3.1;48.4;51.5;;;Cadastre;;POLYGON Z ((768029.1 6278371.7 51.5, 768029.9 6278370.8 51.5, 768029.1 6278370.1 51.5, 768028.2 6278371 51.5, 768029.1 6278371.7 51.5))
-BATIMENT0000000211110330;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2018-02-20 09:16:47;;;;;3.0;2.5;;;;;3.3;51.2;54.5;;;Cadastre;;POLYGON Z ((768067 6278387.9 54.5, 768067.3 6278384.8 54.5, 768065.6 6278384.6 54.5, 768065.2 6278387.7 54.5, 768067 6278387.9 54.5))
-BATIMENT0000000211110359;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2018-02-20 09:16:47;;;;;3.0;2.5;;;;;8.8;48.6;57.4;;;Cadastre;;POLYGON Z ((768038.8 6278400.2 57.4, 768041.4 6278397.5 57.4, 768040.4 6278396.5 57.4, 768037.8 6278399.2 57.4, 768038.8 6278400.2 57.4))
-BATIMENT0000000211110813;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2018-02-20 09:16:47;;;;;3.0;2.5;;;;;5.3;39.9;45.2;;;Cadastre;;POLYGON Z ((768848.4 6278475.9 45.2, 768849.2 6278474.6 45.2, 768842 6278470 45.2, 768841.2 6278471.2 45.2, 768848.4 6278475.9 45.2))
-BATIMENT0000000211110699;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2018-02-20 09:16:47;;;;;3.0;2.5;;;;;3.7;41.0;44.7;;;Cadastre;;POLYGON Z ((768796.1 6278454.8 44.7, 768798.2 6278455.8 44.7, 768799.4 6278453.5 44.7, 768797.2 6278452.4 44.7, 768796.1 6278454.8 44.7))
-BATIMENT0000000211110206;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2018-02-20 09:16:47;;;;;3.0;2.5;;;;;5.9;50.2;56.1;;;Cadastre;;POLYGON Z ((768478.1 6278162.7 56.1, 768477.9 6278164.2 56.1, 768479.2 6278164.4 56.1, 768479.4 6278162.9 56.1, 768478.1 6278162.7 56.1))
-BATIMENT0000000211110817;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2018-02-20 09:16:47;;;;;3.0;2.5;;;;;5.3;39.9;45.2;;;Cadastre;;POLYGON Z ((768837.6 6278479.2 45.2, 768839 6278477 45.2, 768837.9 6278476.3 45.2, 768836.5 6278478.5 45.2, 768837.6 6278479.2 45.2))
-BATIMENT0000000211117285;Indifférenciée;Commercial et services;;Oui;En service;2008-11-18 15:25:44;2019-07-29 10:55:49;;;;;3.0;2.5;;;;;9.6;48.0;57.6;;;Cadastre;;POLYGON Z ((768453.5 6277901.7 57.6, 768457.1 6277899.1 57.6, 768454.8 6277895.9 57.6, 768451.2 6277898.5 57.6, 768454.1 6277898.8 57.6, 768453.5 6277901.7 57.6))
-BATIMENT0000000211110275;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2018-02-20 09:16:47;;;;;3.0;2.5;;;;;4.6;51.8;56.4;;;Cadastre;;POLYGON Z ((768007.5 6278421.8 56.4, 768011.2 6278417.9 56.4, 768007.8 6278414.6 56.4, 768004.1 6278418.5 56.4, 768007.5 6278421.8 56.4))
-BATIMENT0000000211110422;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2018-02-20 11:33:35;;;;;3.0;2.5;;;;;3.6;50.8;54.4;55.3;50.8;Cadastre;;POLYGON Z ((768370.2 6278454.2 54.4, 768371.7 6278452 54.4, 768370.3 6278451.1 54.4, 768368.9 6278453.1 54.4, 768370.2 6278454.2 54.4))
-BATIMENT0000000211110423;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2018-02-20 11:33:35;;;;;3.0;2.5;;;;;2.8;48.7;51.5;52.2;48.7;Cadastre;;POLYGON Z ((768424.1 6278467.6 51.5, 768432.1 6278468.2 51.5, 768432.2 6278465.8 51.5, 768429.1 6278465.6 51.5, 768429.2 6278464.9 51.5, 768424.3 6278464.7 51.5, 768424.1 6278467.6 51.5))
-BATIMENT0000000211110505;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2018-02-20 11:33:35;;;;;3.0;2.5;;;;;3.8;45.3;49.1;49.8;45.3;Cadastre;;POLYGON Z ((768507.9 6278429.3 49.1, 768516.2 6278430.5 49.1, 768516.4 6278428.5 49.1, 768508.2 6278427.3 49.1, 768507.9 6278429.3 49.1))
-BATIMENT0000000211117247;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:25:44;2018-02-20 11:33:35;;;;;3.0;2.5;;;;;10.8;46.9;57.7;58.0;46.9;Cadastre;;POLYGON Z ((768372.4 6277933.2 57.7, 768371.1 6277931.4 57.7, 768368.7 6277933.2 57.7, 768370.6 6277935.8 57.7, 768373 6277933.9 57.7, 768372.4 6277933.2 57.7))
-BATIMENT0000000211110431;Indifférenciée;Commercial et services;;Non;En service;2008-11-18 15:19:53;2019-07-29 10:55:42;;;;;3.0;2.5;;;;;2.6;51.8;54.4;54.5;51.8;Cadastre;;POLYGON Z ((768303.7 6278336.9 54.4, 768331.7 6278351.9 54.4, 768339.8 6278337.2 54.4, 768311.8 6278322 54.4, 768303.7 6278336.9 54.4))
-BATIMENT0000000211110115;Indifférenciée;Indifférencié;;Non;En service;2008-11-18 15:19:53;2018-02-20 11:33:35;;;;;3.0;2.5;;;;;1.0;43.0;44.0;45.2;43.0;Cadastre;;POLYGON Z ((768179.8 6278036.2 44, 768183.6 6278033.6 44, 768181 6278029.7 44, 768181.6 6278029.3 44, 768174.3 6278018.7 44, 768173.8 6278019 44, 768171.9 6278016.2 44, 768168 6278018.8 44, 768179.8 6278036.2 44))
-BATIMENT0000000211110623;Indifférenciée;Indifférencié;;Non;En service;2008-11-18 15:19:53;2018-02-20 11:33:35;;;;;3.0;2.5;;;;;3.1;44.2;47.3;48.3;44.2;Cadastre;;POLYGON Z ((768636.8 6278477.9 47.3, 768637 6278482.8 47.3, 768649.2 6278482.3 47.3, 768648.6 6278470.7 47.3, 768651.5 6278470.6 47.3, 768651.2 6278465.3 47.3, 768655 6278465.1 47.3, 768654.9 6278460.1 47.3, 768651.1 6278460.1 47.3, 768651.1 6278463.3 47.3, 768644.8 6278463.4 47.3, 768645 6278465.6 47.3, 768636.4 6278465.9 47.3, 768636.6 6278471.4 47.3, 768643.8 6278471.2 47.3, 768644.1 6278477.5 47.3, 768636.8 6278477.9 47.3))
-BATIMENT0000000211110283;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2018-02-20 11:33:35;;;;;3.0;2.5;;;;;3.7;55.5;59.2;61.0;55.5;Cadastre;;POLYGON Z ((768028.3 6278445.6 59.2, 768032.9 6278440.5 59.2, 768037.8 6278445.1 59.2, 768039.1 6278443.6 59.2, 768031 6278436 59.2, 768025 6278442.6 59.2, 768028.3 6278445.6 59.2))
-BATIMENT0000000211110386;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2018-02-20 11:33:35;;;;;3.0;2.5;;;;;4.1;50.8;54.9;57.0;50.8;Cadastre;;POLYGON Z ((768140.1 6278359.3 54.9, 768138.8 6278359.5 54.9, 768138.9 6278361.9 54.9, 768138 6278362.9 54.9, 768138.1 6278363.8 54.9, 768138.5 6278363.8 54.9, 768140.7 6278363.7 54.9, 768140.1 6278359.3 54.9))
-BATIMENT0000000211110557;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2018-02-20 11:33:35;;;;;3.0;2.5;;;;;3.6;47.9;51.5;53.8;47.9;Cadastre;;POLYGON Z ((768457 6278473.3 51.5, 768452.1 6278473 51.5, 768451.9 6278475.9 51.5, 768456.8 6278476.2 51.5, 768457 6278473.3 51.5))
-BATIMENT0000000211110558;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2018-02-20 11:33:35;;;;;3.0;2.5;;;;;3.6;47.9;51.5;52.2;47.9;Cadastre;;POLYGON Z ((768457.8 6278464.4 51.5, 768458 6278462 51.5, 768452.2 6278461.5 51.5, 768452.1 6278464 51.5, 768457.8 6278464.4 51.5))
-BATIMENT0000000211110571;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2018-02-20 11:33:35;;;;;3.0;2.5;;;;;2.9;47.3;50.2;51.5;47.3;Cadastre;;POLYGON Z ((768465.9 6278475.5 50.2, 768468 6278475.7 50.2, 768468.3 6278471.9 50.2, 768466.6 6278471.8 50.2, 768465.4 6278471.7 50.2, 768465.1 6278475.5 50.2, 768465.9 6278475.5 50.2))
-BATIMENT0000000211110584;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2018-02-20 11:33:35;;;;;3.0;2.5;;;;;3.7;46.3;50.0;50.0;46.3;Cadastre;;POLYGON Z ((768492.8 6278463.6 50, 768488.3 6278463.1 50, 768488 6278466.2 50, 768492.5 6278466.7 50, 768492.8 6278463.6 50))
-BATIMENT0000000211110587;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2018-02-20 11:33:35;;;;;3.0;2.5;;;;;3.6;46.3;49.9;51.5;46.3;Cadastre;;POLYGON Z ((768487.6 6278470.7 49.9, 768487.2 6278473.7 49.9, 768490 6278474 49.9, 768490.3 6278471.1 49.9, 768487.6 6278470.7 49.9))
-BATIMENT0000000211110580;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2020-05-29 12:14:55;;;;;3.0;2.5;;;;;3.8;45.3;49.1;50.9;45.3;Cadastre;;POLYGON Z ((768517.9 6278435.4 49.1, 768516.5 6278435.3 49.1, 768516.3 6278436.6 49.1, 768517.7 6278436.8 49.1, 768517.9 6278435.4 49.1))
-BATIMENT0000000211110740;Indifférenciée;Indifférencié;;Non;En service;2008-11-18 15:19:53;2018-02-20 11:33:35;;;;;3.0;2.5;;;;;1.2;41.4;42.6;43.8;41.4;Cadastre;;POLYGON Z ((768759.7 6278430.6 42.6, 768764.9 6278432.8 42.6, 768766.1 6278430.2 42.6, 768760.8 6278428 42.6, 768759.7 6278430.6 42.6))
-BATIMENT0000000211110546;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2018-02-20 11:33:35;;;;;3.0;2.5;;;;;3.4;46.4;49.8;50.5;46.4;Cadastre;;POLYGON Z ((768473.1 6278437.9 49.8, 768473.2 6278436.8 49.8, 768468.5 6278436.3 49.8, 768468.5 6278437.4 49.8, 768473.1 6278437.9 49.8))
-BATIMENT0000000211117244;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:25:44;2018-02-20 11:33:35;;;;;3.0;2.5;;;;;10.4;46.9;57.3;57.9;46.9;Cadastre;;POLYGON Z ((768369.1 6277939.2 57.3, 768368 6277937.9 57.3, 768366.9 6277936.7 57.3, 768364.6 6277938.5 57.3, 768365.1 6277939.5 57.3, 768366.6 6277941.1 57.3, 768369.1 6277939.2 57.3))
-BATIMENT0000000211117305;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:25:44;2018-02-20 11:33:35;;;;;3.0;2.5;;;;;6.8;57.0;63.8;64.6;57.0;Cadastre;;POLYGON Z ((768674.2 6277985.8 63.8, 768675.9 6277984.2 63.8, 768673.3 6277982.1 63.8, 768672.7 6277982.8 63.8, 768671.8 6277983.9 63.8, 768674.2 6277985.8 63.8))
-BATIMENT0000000211110325;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2018-02-20 14:11:41;;;;;3.0;2.5;;;;;4.4;49.2;53.6;53.7;;Cadastre;;POLYGON Z ((768114 6278344.9 53.6, 768113.8 6278343.5 53.6, 768108.3 6278344.4 53.6, 768101.7 6278345.2 53.6, 768101.7 6278345.8 53.6, 768101.9 6278346.5 53.6, 768114 6278344.9 53.6))
-BATIMENT0000000211103655;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:15:23;2018-02-20 16:11:34;;;;;3.0;2.5;;;;;3.4;43.0;46.4;46.5;;Cadastre;;POLYGON Z ((767883.8 6278112.6 46.4, 767887.2 6278111.3 46.4, 767886.6 6278109.7 46.4, 767883.2 6278111 46.4, 767883.8 6278112.6 46.4))
-BATIMENT0000000211117231;Indifférenciée;Commercial et services;;Oui;En service;2008-11-18 15:25:44;2019-07-29 10:55:49;;;;;3.0;2.5;;;;;9.4;48.0;57.4;57.9;;Cadastre;;POLYGON Z ((768417 6277928.3 57.4, 768420.5 6277925.8 57.4, 768418.2 6277922.5 57.4, 768414.6 6277925.1 57.4, 768417 6277928.3 57.4))
-BATIMENT0000000211110177;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2018-05-25 08:24:25;;;;;3.0;1.0;;;;;22.0;58.0;80.0;80.3;59.1;Cadastre;;POLYGON Z ((768613.8 6278100.1 80, 768619.5 6278104.1 80, 768623.6 6278102.2 80, 768622.7 6278100.4 80, 768619.5 6278101.9 80, 768615 6278098.6 80, 768613.8 6278100.1 80))
-BATIMENT0000000211110551;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:19:53;2018-05-25 08:24:25;;;;;3.0;2.5;;;;;5.0;41.0;46.0;49.8;41.0;Cadastre;;POLYGON Z ((768628.8 6278301.3 46, 768635.8 6278307.6 46, 768639.7 6278302.1 46, 768633.4 6278296.6 46, 768632.3 6278295.6 46, 768627.9 6278300.6 46, 768628.8 6278301.3 46))
-BATIMENT0000002101819272;Indifférenciée;Indifférencié;;Non;En service;2018-11-09 10:15:07;;;;DGFiP;;5.0;9999.0;;;;;0.0;;;;;Cadastre;;POLYGON Z ((768438.3 6278162.9 -1000, 768444.7 6278164.6 -1000, 768446.7 6278157.1 -1000, 768440.3 6278155.3 -1000, 768438.3 6278162.9 -1000))
-BATIMENT0000002101819271;Indifférenciée;Indifférencié;;Oui;En service;2018-11-09 10:15:07;;;;DGFiP;;5.0;9999.0;;;;;0.0;;;;;Cadastre;;POLYGON Z ((768437.6 6278165.2 -1000, 768444 6278166.9 -1000, 768444.7 6278164.6 -1000, 768438.3 6278162.9 -1000, 768437.6 6278165.2 -1000))
-BATIMENT0000002101819409;Indifférenciée;Commercial et services;;Oui;En service;2018-11-09 10:15:07;2019-07-29 10:55:49;;;DGFiP;;5.0;9999.0;;;;;0.0;;;;;Cadastre;;POLYGON Z ((768480.6 6277883.2 -1000, 768486.6 6277887.3 -1000, 768492.4 6277878.9 -1000, 768486.3 6277874.8 -1000, 768480.6 6277883.2 -1000))
-BATIMENT0000002101819456;Indifférenciée;Indifférencié;;Non;En service;2018-11-09 10:15:07;;;;DGFiP;;5.0;9999.0;;;;;0.0;;;;;Cadastre;;POLYGON Z ((768488.1 6277871.8 -1000, 768493.4 6277875.4 -1000, 768495.2 6277872.8 -1000, 768489.9 6277869.2 -1000, 768488.1 6277871.8 -1000))
-BATIMENT0000000101215132;Indifférenciée;Résidentiel;;Non;En service;2007-10-19 17:55:55;2019-04-08 10:00:52;2003-01-01;;;;2.5;1.5;1.0;2.0;50.0;10.0;5.2;39.6;;;;Imagerie aérienne;C 0.2;POLYGON Z ((767936.3 6278106.1 44.8, 767933.1 6278111 44.8, 767938.6 6278114.4 44.8, 767941.9 6278109.1 44.8, 767936.3 6278106.1 44.8))
-BATIMENT0000000101215538;Indifférenciée;Résidentiel;;Non;En service;2007-10-19 17:56:29;2019-04-08 10:00:52;1981-01-01;;;;2.5;1.5;1.0;1.0;40.0;10.0;6.1;49.6;;56.0;50.7;Imagerie aérienne;A 1.0;POLYGON Z ((768812.1 6277933.2 55, 768806.5 6277935.3 55, 768807.9 6277939.3 55, 768801.6 6277942 55, 768802.2 6277943.7 55.3, 768795 6277946.5 55.3, 768798 6277953.8 54.8, 768818.7 6277946 54.7, 768816.3 6277940.3 55.4, 768814.7 6277940.8 55.7, 768812.1 6277933.2 55))
-BATIMENT0000000044593909;Indifférenciée;Résidentiel;Annexe;Non;En service;2006-12-12 11:20:44;2019-04-08 10:00:52;1978-01-01;;;;2.5;1.5;56.0;8.0;0.0;0.0;3.5;40.0;;43.8;40.0;Imagerie aérienne;C 0.6;POLYGON Z ((768750.9 6278372.6 43.3, 768757.4 6278370.4 43.2, 768761.6 6278373.7 43.2, 768761.6 6278379.8 43.2, 768766.6 6278383.3 43.2, 768772.2 6278380.5 43.4, 768777.2 6278384.6 43.4, 768782.7 6278381.3 43.3, 768788 6278384.9 43.1, 768793.9 6278382.3 43.1, 768798.4 6278385.9 43.2, 768798.4 6278392.4 43.4, 768803.2 6278395.2 43.2, 768803.2 6278402.1 43.1, 768808.2 6278405 42.9, 768813.9 6278402.2 42.9, 768819.3 6278405.9 43, 768825.9 6278403 43, 768826.5 6278397.4 43, 768820.4 6278393 43, 768821.3 6278387 43, 768826.6 6278384.1 43.1, 768826.8 6278377.8 43.1, 768821.2 6278373.8 43, 768821.9 6278367.5 42.6, 768817.7 6278364.3 42.9, 768811.1 6278367.2 43, 768806 6278363.5 42.7, 768806.8 6278357.9 42.8, 768801.5 6278353.5 42.6, 768795.6 6278356.7 42.9, 768790.7 6278353.4 42.7, 768791.3 6278347.5 42.6, 768785.4 6278343.7 42.7, 768780.4 6278346.7 42.6, 768779.5 6278352.8 42.9, 768773.8 6278355.3 42.8, 768769 6278351.9 42.9, 768763.2 6278354.9 43, 768758.5 6278351.8 42.9, 768752.1 6278354.4 43.2, 768751.5 6278360.3 43.3, 768745.8 6278363.2 43.5, 768746 6278369.4 43.5, 768750.9 6278372.6 43.3))
-BATIMENT0000000044594033;Indifférenciée;Résidentiel;Annexe;Non;En service;2006-12-12 11:20:44;2019-04-08 10:00:52;1972-01-01;;;;2.5;1.5;10.0;5.0;1.0;1.0;5.4;39.7;;;;Imagerie aérienne;C 0.1;POLYGON Z ((768688.4 6278302.1 45.1, 768686.1 6278320.3 45, 768720 6278303.6 45, 768705.4 6278294.1 45.1, 768688.4 6278302.1 45.1))
-BATIMENT0000000211103637;Indifférenciée;Commercial et services;;Non;En service;2008-11-18 15:15:23;2019-04-08 10:00:52;;;;;3.0;2.5;0.0;1.0;;;5.5;38.3;43.8;45.2;38.3;Cadastre;A 1.0;POLYGON Z ((767949 6278006.4 43.8, 767967.7 6278001.3 43.8, 767962.5 6277982.7 43.8, 767943.9 6277987.8 43.8, 767949 6278006.4 43.8))
-BATIMENT0000000211103636;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:15:23;2019-04-08 10:00:52;2001-01-01;;;;3.0;2.5;1.0;2.0;35.0;10.0;4.9;43.0;47.9;48.9;43.0;Cadastre;A 1.0;POLYGON Z ((767875.8 6278164.1 47.9, 767878.9 6278157.3 47.9, 767872.1 6278154.1 47.9, 767870.4 6278157.7 47.9, 767869.7 6278159.1 47.9, 767868.2 6278158.4 47.9, 767868.8 6278157 47.9, 767863.7 6278154.7 47.9, 767862.3 6278157.8 47.9, 767875.8 6278164.1 47.9))
-BATIMENT0000000211103630;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:15:23;2019-04-08 10:00:52;2001-01-01;;;;3.0;2.5;1.0;2.0;2.0;1.0;5.0;43.0;48.0;48.9;43.0;Cadastre;A 1.0;POLYGON Z ((767872.5 6278171.1 48, 767875.8 6278164.1 48, 767862.3 6278157.8 48, 767860.8 6278161 48, 767865.8 6278163.4 48, 767866.5 6278162 48, 767868 6278162.8 48, 767867.3 6278164.1 48, 767865.6 6278167.9 48, 767872.5 6278171.1 48))
-BATIMENT0000000211103631;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:15:23;2019-04-08 10:00:52;2001-01-01;;;;3.0;2.5;1.0;2.0;5.0;2.0;4.9;43.0;47.9;48.4;43.0;Cadastre;C 0.4;POLYGON Z ((767887.6 6278137.5 47.9, 767890.9 6278130.5 47.9, 767884.1 6278127.3 47.9, 767882.8 6278129.9 47.9, 767880.8 6278134.3 47.9, 767887.6 6278137.5 47.9))
-BATIMENT0000000211103633;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:15:23;2019-04-08 10:00:52;2001-01-01;;;;3.0;2.5;1.0;1.0;2.0;1.0;5.1;43.0;48.1;48.6;;Cadastre;A 1.0;POLYGON Z ((767873.9 6278107.5 48.1, 767877 6278100.8 48.1, 767870.1 6278097.5 48.1, 767863.9 6278110.7 48.1, 767866.9 6278112.1 48.1, 767869.3 6278107 48.1, 767868 6278106.4 48.1, 767868.7 6278105 48.1, 767870 6278105.6 48.1, 767873.9 6278107.5 48.1))
-BATIMENT0000000211103639;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:15:23;2019-04-08 10:00:52;1979-01-01;;;;3.0;2.5;1.0;2.0;30.0;10.0;5.6;43.0;48.6;48.7;43.0;Cadastre;C 0.6;POLYGON Z ((767861.5 6278209.9 48.6, 767866.8 6278212.5 48.6, 767865.9 6278214.3 48.6, 767869.3 6278216.1 48.6, 767873.9 6278207.1 48.6, 767865 6278202.7 48.6, 767861.5 6278209.9 48.6))
-BATIMENT0000000211103640;Indifférenciée;Annexe;;Non;En service;2008-11-18 15:15:23;2019-04-08 10:00:52;1979-01-01;;;;3.0;1.0;0.0;1.0;0.0;0.0;2.8;42.0;44.8;45.2;42.5;Cadastre;C 0.4;POLYGON Z ((767854.5 6278217.9 44.7, 767856.8 6278214 44.7, 767857.9 6278214.5 44.7, 767859.9 6278210.6 44.7, 767856.2 6278208.9 44.7, 767854.6 6278211.4 44.7, 767853.8 6278212.6 44.7, 767851.5 6278216.3 44.7, 767854.5 6278217.9 44.7))
-BATIMENT0000000211103641;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:15:23;2019-04-08 10:00:52;1979-01-01;;;;3.0;2.5;1.0;1.0;90.0;10.0;3.0;43.3;46.3;47.4;43.3;Cadastre;B 0.6;POLYGON Z ((767837.4 6278203.6 46.3, 767842.9 6278206.3 46.3, 767844 6278204.3 46.3, 767848 6278206.3 46.3, 767847.3 6278207.9 46.3, 767850.1 6278209.2 46.3, 767854.8 6278200.2 46.3, 767842.4 6278193.8 46.3, 767837.4 6278203.6 46.3))
-BATIMENT0000000211103643;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:15:23;2019-04-08 10:00:52;2000-01-01;;;;3.0;2.5;1.0;1.0;5.0;1.0;5.5;43.0;48.5;;;Cadastre;C 0.4;POLYGON Z ((767849.5 6278094.8 48.5, 767852.6 6278088.2 48.5, 767845.9 6278085.1 48.5, 767842.9 6278091.7 48.5, 767849.5 6278094.8 48.5))
-BATIMENT0000000211103647;Indifférenciée;Commercial et services;;Non;En service;2008-11-18 15:15:23;2019-04-08 10:00:52;;;;;3.0;2.5;0.0;1.0;;;5.5;42.7;48.2;49.0;;Cadastre;A 1.0;POLYGON Z ((767881.4 6278179.2 48.2, 767891.9 6278184.5 48.2, 767897.2 6278174.3 48.2, 767886.7 6278168.9 48.2, 767881.4 6278179.2 48.2))
-BATIMENT0000000211103648;Indifférenciée;Annexe;;Non;En service;2008-11-18 15:15:23;2019-04-08 10:00:52;1979-01-01;;;;3.0;1.0;0.0;1.0;0.0;0.0;3.0;42.0;45.0;45.2;42.5;Cadastre;B 0.2;POLYGON Z ((767851.5 6278216.3 44.9, 767853.8 6278212.6 44.9, 767854.6 6278211.4 44.9, 767851.7 6278209.8 44.9, 767848.5 6278214.8 44.9, 767851.5 6278216.3 44.9))
-BATIMENT0000000211103652;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:15:23;2019-04-08 10:00:52;1977-01-01;;;;3.0;1.0;1.0;1.0;45.0;10.0;7.5;40.8;48.3;50.0;41.2;Cadastre;A 1.0;POLYGON Z ((767863.8 6278062.8 48.2, 767865.7 6278063.9 48.2, 767864.8 6278065.4 48.2, 767877.2 6278072.9 48.2, 767882 6278064.9 48.2, 767873.6 6278059.6 48.2, 767874.3 6278058.1 48.2, 767868.6 6278054.6 48.2, 767863.8 6278062.8 48.2))
-BATIMENT0000000211103654;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:15:23;2019-04-08 10:00:52;2001-01-01;;;;3.0;2.5;1.0;2.0;30.0;10.0;5.9;43.0;48.9;49.5;43.0;Cadastre;A 1.0;POLYGON Z ((767855.2 6278181.3 48.9, 767862.8 6278179.7 48.9, 767861.3 6278172.4 48.9, 767856.6 6278173.3 48.9, 767853.7 6278173.9 48.9, 767855.2 6278181.3 48.9))
-BATIMENT0000000211103657;Indifférenciée;Commercial et services;;Non;En service;2008-11-18 15:15:23;2019-04-08 10:00:52;1982-01-01;;;;3.0;2.5;0.0;1.0;;;8.7;41.1;49.8;53.0;43.0;Cadastre;A 1.0;POLYGON Z ((767982.1 6278200.1 49.8, 768024.8 6278159.4 49.8, 768003.8 6278137.2 49.8, 767956 6278182.9 49.8, 767958.8 6278186.1 49.8, 767946.4 6278198.3 49.8, 767950.4 6278202.4 49.8, 767942.4 6278210.3 49.8, 767947.2 6278215.4 49.8, 767944 6278218.5 49.8, 767951.9 6278226.6 49.8, 767980.9 6278198.9 49.8, 767982.1 6278200.1 49.8))
-BATIMENT0000000211103658;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:15:23;2019-04-08 10:00:52;2001-01-01;;;;3.0;2.5;1.0;2.0;3.0;1.0;5.4;43.0;48.4;48.8;43.0;Cadastre;A 1.0;POLYGON Z ((767850 6278150 48.4, 767853.5 6278142.7 48.4, 767846.2 6278139.3 48.4, 767845.9 6278140 48.4, 767843.3 6278138.7 48.4, 767840.6 6278144.6 48.4, 767843.2 6278145.8 48.4, 767842.8 6278146.6 48.4, 767843.1 6278146.8 48.4, 767846.3 6278148.2 48.4, 767850 6278150 48.4))
-BATIMENT0000000211103662;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:15:23;2019-04-08 10:00:52;2001-01-01;;;;3.0;2.5;1.0;2.0;5.0;1.0;5.0;43.0;48.0;48.7;43.0;Cadastre;A 1.0;POLYGON Z ((767879.8 6278154 48, 767883.1 6278147 48, 767876.3 6278143.8 48, 767875.1 6278146.4 48, 767873 6278150.8 48, 767873.3 6278150.9 48, 767879.8 6278154 48))
-BATIMENT0000000211103664;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:15:23;2019-04-08 10:00:52;1980-01-01;;;;3.0;1.0;1.0;2.0;40.0;10.0;6.4;40.6;47.0;48.0;41.0;Cadastre;A 1.0;POLYGON Z ((767893.4 6278162.4 47, 767901.2 6278166.3 47, 767902.5 6278163.9 47, 767901.9 6278163.7 47, 767905 6278157.1 47, 767898.1 6278153.6 47, 767893.4 6278162.4 47))
-BATIMENT0000000211103666;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:15:23;2019-04-08 10:00:52;2001-01-01;;;;3.0;2.5;1.0;2.0;30.0;10.0;4.6;43.0;47.6;48.3;;Cadastre;A 1.0;POLYGON Z ((767880.8 6278113.7 47.6, 767883.8 6278112.6 47.6, 767883.2 6278111 47.6, 767886.6 6278109.7 47.6, 767890.1 6278108.4 47.6, 767887.4 6278101.2 47.6, 767879.9 6278104.1 47.6, 767881 6278107 47.6, 767878.6 6278107.9 47.6, 767880.8 6278113.7 47.6))
-BATIMENT0000000211103667;Indifférenciée;Annexe;;Non;En service;2008-11-18 15:15:23;2019-04-08 10:00:52;;;;;5.0;1.0;0.0;1.0;;;2.4;41.9;44.3;45.2;41.9;Cadastre;B 0.4;POLYGON Z ((767856 6278106.6 44.3, 767858.4 6278101.4 44.3, 767855.3 6278099.9 44.3, 767852.9 6278105.1 44.3, 767856 6278106.6 44.3))
-BATIMENT0000000211103684;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:15:23;2019-04-08 10:00:52;2001-01-01;;;;3.0;2.5;1.0;2.0;3.0;1.0;4.9;43.0;47.9;48.5;;Cadastre;A 1.0;POLYGON Z ((767890.9 6278130.5 47.9, 767894.1 6278123.7 47.9, 767887.3 6278120.5 47.9, 767885.3 6278124.8 47.9, 767884.1 6278127.3 47.9, 767890.9 6278130.5 47.9))
-BATIMENT0000000211103673;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:15:23;2019-04-08 10:00:52;1964-01-01;;;;3.0;2.5;1.0;1.0;50.0;10.0;5.4;42.0;47.4;49.1;42.0;Cadastre;B 0.4;POLYGON Z ((767860.5 6278047.8 47.4, 767862.8 6278043.6 47.4, 767868.3 6278046.4 47.4, 767871.2 6278040.8 47.4, 767867.9 6278039.1 47.4, 767872.5 6278030.2 47.4, 767860.1 6278023.8 47.4, 767855.5 6278032.4 47.4, 767859.2 6278034.5 47.4, 767854 6278044.5 47.4, 767860.5 6278047.8 47.4))
-BATIMENT0000000211103675;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:15:23;2019-04-08 10:00:52;2001-01-01;;;;3.0;2.5;1.0;2.0;5.0;1.0;4.9;43.0;47.9;48.7;43.0;Cadastre;C 0.2;POLYGON Z ((767883.1 6278147 47.9, 767886.4 6278140.2 47.9, 767879.5 6278136.9 47.9, 767877.5 6278141.2 47.9, 767876.3 6278143.8 47.9, 767883.1 6278147 47.9))
-BATIMENT0000000211103677;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:15:23;2019-04-08 10:00:52;2000-01-01;;;;3.0;2.5;1.0;2.0;5.0;1.0;5.1;43.0;48.1;48.7;;Cadastre;B 0.5;POLYGON Z ((767859.9 6278098.3 48.1, 767863 6278091.5 48.1, 767856.4 6278088.4 48.1, 767853.2 6278095.2 48.1, 767859.9 6278098.3 48.1))
-BATIMENT0000000211103678;Indifférenciée;Commercial et services;;Non;En service;2008-11-18 15:15:23;2019-04-08 10:00:52;;;;;3.0;2.5;0.0;2.0;;;5.6;43.0;48.6;49.8;;Cadastre;A 1.0;POLYGON Z ((767873.6 6278197.5 48.6, 767883.6 6278202.5 48.6, 767888.2 6278193.6 48.6, 767878.3 6278188.5 48.6, 767873.6 6278197.5 48.6))
-BATIMENT0000000211103679;Indifférenciée;Commercial et services;;Non;En service;2008-11-18 15:15:23;2019-04-08 10:00:52;;;;;3.0;1.0;0.0;2.0;;;7.1;40.1;47.2;47.7;40.4;Cadastre;A 1.0;POLYGON Z ((767910.7 6278125.9 47.1, 767920.8 6278131.1 47.1, 767925.9 6278121.4 47.1, 767915.8 6278116.2 47.1, 767910.7 6278125.9 47.1))
-BATIMENT0000000211103680;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:15:23;2019-04-08 10:00:52;2001-01-01;;;;3.0;2.5;1.0;2.0;3.0;1.0;4.9;43.0;47.9;48.7;;Cadastre;A 1.0;POLYGON Z ((767854 6278133.3 47.9, 767855.3 6278130.6 47.9, 767857.1 6278131.4 47.9, 767860.4 6278124.2 47.9, 767853.3 6278120.9 47.9, 767850.2 6278127.7 47.9, 767849.3 6278127.3 47.9, 767849.2 6278127.3 47.9, 767847.8 6278130.4 47.9, 767854 6278133.3 47.9))
-BATIMENT0000000211103681;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:15:23;2019-04-08 10:00:52;2001-01-01;;;;3.0;2.5;1.0;2.0;5.0;1.0;4.9;43.0;47.9;48.7;;Cadastre;A 1.0;POLYGON Z ((767837.5 6278123.2 47.9, 767844.7 6278126.6 47.9, 767845.1 6278125.7 47.9, 767845.6 6278125.9 47.9, 767847.7 6278126.9 47.9, 767850.4 6278121.1 47.9, 767847.8 6278119.9 47.9, 767848 6278119.5 47.9, 767847.6 6278119.3 47.9, 767844.6 6278117.9 47.9, 767840.8 6278116.1 47.9, 767837.5 6278123.2 47.9))
-BATIMENT0000000211103685;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:15:23;2019-04-08 10:00:52;1999-01-01;;;;3.0;2.5;1.0;2.0;2.0;1.0;5.0;43.0;48.0;48.5;;Cadastre;A 1.0;POLYGON Z ((767863.9 6278110.7 48, 767870.1 6278097.5 48, 767863.2 6278094.2 48, 767860 6278100.9 48, 767864 6278102.8 48, 767865.2 6278103.4 48, 767864.6 6278104.8 48, 767863.3 6278104.2 48, 767860.9 6278109.3 48, 767863.9 6278110.7 48))
-BATIMENT0000000211103689;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:15:23;2019-04-08 10:00:52;2001-01-01;;;;3.0;2.5;1.0;2.0;3.0;1.0;5.9;43.0;48.9;49.4;43.0;Cadastre;A 1.0;POLYGON Z ((767847.8 6278182.8 48.9, 767855.2 6278181.3 48.9, 767853.7 6278173.9 48.9, 767851 6278174.4 48.9, 767846.3 6278175.4 48.9, 767847.8 6278182.8 48.9))
-BATIMENT0000000211103691;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:15:23;2019-04-08 10:00:52;2003-01-01;;;;3.0;2.5;2.0;2.0;50.0;10.0;6.4;40.9;47.3;47.7;40.9;Cadastre;A 1.0;POLYGON Z ((767917.5 6278094.9 47.3, 767914.6 6278099.9 47.3, 767914.2 6278099.7 47.3, 767912.6 6278102.5 47.3, 767913.2 6278102.9 47.3, 767913 6278103.2 47.3, 767922.9 6278109.6 47.3, 767924.1 6278107.6 47.3, 767928.9 6278110.3 47.3, 767932 6278105.6 47.3, 767927 6278102.7 47.3, 767928.1 6278100.7 47.3, 767917.6 6278093.9 47.3, 767917.1 6278094.7 47.3, 767917.5 6278094.9 47.3), (767921.8 6278105.1 47.3, 767923.6 6278101.9 47.3, 767926.5 6278103.5 47.3, 767924.6 6278106.7 47.3, 767921.8 6278105.1 47.3))
-BATIMENT0000000211103692;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:15:23;2019-04-08 10:00:52;2003-01-01;;;;3.0;2.5;4.0;2.0;50.0;10.0;7.6;40.9;48.5;49.6;40.9;Cadastre;C 0.3;POLYGON Z ((767928.4 6278078 48.5, 767927.6 6278077.5 48.5, 767927.1 6278078.3 48.5, 767926.7 6278078.1 48.5, 767925 6278081 48.5, 767925.4 6278081.2 48.5, 767922.6 6278086.1 48.5, 767922.2 6278085.9 48.5, 767917.6 6278093.9 48.5, 767928.1 6278100.7 48.5, 767929.1 6278099.1 48.5, 767933.7 6278101.8 48.5, 767936.6 6278096.9 48.5, 767931.9 6278094.2 48.5, 767934.1 6278090.4 48.5, 767938.8 6278093.1 48.5, 767941.6 6278088.3 48.5, 767936.9 6278085.5 48.5, 767938.1 6278083.6 48.5, 767935.3 6278081.9 48.5, 767938.9 6278075.6 48.5, 767932.1 6278071.7 48.5, 767928.4 6278078 48.5), (767928.6 6278093.4 48.5, 767931.4 6278095.1 48.5, 767929.6 6278098.2 48.5, 767926.7 6278096.6 48.5, 767928.6 6278093.4 48.5), (767933.6 6278084.8 48.5, 767936.4 6278086.4 48.5, 767934.6 6278089.5 48.5, 767931.8 6278087.9 48.5, 767933.6 6278084.8 48.5))
-BATIMENT0000000211104421;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:15:23;2019-04-08 10:00:52;2003-01-01;;;;3.0;2.5;1.0;3.0;1.0;1.0;7.7;53.0;60.7;;;Cadastre;A 1.0;POLYGON Z ((767969.3 6278487.6 60.7, 767976.8 6278480.4 60.7, 767968.4 6278477.7 60.7, 767959.9 6278472.7 60.7, 767957.6 6278476.6 60.7, 767963.5 6278480.2 60.7, 767961.8 6278483 60.7, 767960.3 6278482.1 60.7, 767956.2 6278488.9 60.7, 767962.3 6278492.6 60.7, 767966.4 6278485.8 60.7, 767969.3 6278487.6 60.7))
-BATIMENT0000000211104422;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:15:23;2019-04-08 10:00:52;2002-01-01;;;;3.0;2.5;1.0;2.0;0.0;0.0;7.7;52.0;59.7;60.2;52.4;Cadastre;A 1.0;POLYGON Z ((768008.3 6278433.4 59.7, 768017.5 6278423.8 59.7, 768011.2 6278417.9 59.7, 768007.5 6278421.8 59.7, 768002.3 6278427.2 59.7, 768000.4 6278425.4 59.7, 767997.1 6278428.9 59.7, 768003.3 6278434.9 59.7, 768006.4 6278431.6 59.7, 768008.3 6278433.4 59.7))
-BATIMENT0000000211104424;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:15:23;2019-04-08 10:00:52;1979-01-01;;;;3.0;2.5;1.0;1.0;90.0;10.0;3.5;43.7;47.2;47.2;;Cadastre;A 1.0;POLYGON Z ((767845.7 6278244.5 47.2, 767852.4 6278248.6 47.2, 767853.5 6278246.6 47.2, 767858.8 6278249.7 47.2, 767863 6278242.3 47.2, 767857.9 6278239.4 47.2, 767856.8 6278241.4 47.2, 767852.5 6278238.9 47.2, 767853.4 6278237.3 47.2, 767850.9 6278236 47.2, 767845.7 6278244.5 47.2))
-BATIMENT0000000211104439;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:15:23;2019-04-08 10:00:52;2001-01-01;;;;3.0;2.5;1.0;2.0;0.0;0.0;5.1;48.8;53.9;56.3;49.3;Cadastre;A 1.0;POLYGON Z ((767963.5 6278432.6 53.9, 767964.5 6278433.5 53.9, 767962.9 6278435.1 53.9, 767962 6278434.2 53.9, 767956.2 6278440.5 53.9, 767958.8 6278442.8 53.9, 767962 6278445.8 53.9, 767968.7 6278439.6 53.9, 767972.7 6278435.8 53.9, 767966.2 6278429.7 53.9, 767963.5 6278432.6 53.9))
-BATIMENT0000000211104456;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:15:23;2019-04-08 10:00:52;2000-01-01;;;;3.0;2.5;1.0;2.0;5.0;1.0;5.9;49.1;55.0;55.5;49.5;Cadastre;A 1.0;POLYGON Z ((767989.9 6278418.1 55, 767994.7 6278413 55, 767986.9 6278405.7 55, 767984.8 6278407.9 55, 767982.2 6278410.7 55, 767979.8 6278408.4 55, 767977.3 6278411.1 55, 767983.2 6278416.7 55, 767985.6 6278414.1 55, 767989.9 6278418.1 55))
-BATIMENT0000000211104463;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:15:23;2019-04-08 10:00:52;1983-01-01;;;;3.0;2.5;1.0;1.0;45.0;10.0;3.4;44.5;47.9;48.0;;Cadastre;A 1.0;POLYGON Z ((767842.9 6278257.9 47.9, 767840.4 6278262.1 47.9, 767836.4 6278269.2 47.9, 767835.5 6278268.9 47.9, 767833.9 6278271.7 47.9, 767839.4 6278274.7 47.9, 767840.9 6278271.9 47.9, 767844.7 6278273.9 47.9, 767851.1 6278262.5 47.9, 767842.9 6278257.9 47.9))
-BATIMENT0000000211104472;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:15:23;2019-04-08 10:00:52;2003-01-01;;;;3.0;2.5;1.0;2.0;5.0;1.0;7.4;45.1;52.5;;;Cadastre;A 1.0;POLYGON Z ((768006.7 6278343.8 52.5, 768009.2 6278341.3 52.5, 768008.4 6278340.5 52.5, 768014.6 6278334.3 52.5, 768014.2 6278333.9 52.5, 768016 6278332 52.5, 768011.9 6278327.9 52.5, 768009.5 6278330.4 52.5, 768008.6 6278329.4 52.5, 768006.5 6278331.6 52.5, 768003.4 6278328.5 52.5, 767999.7 6278332.2 52.5, 768003.6 6278336.1 52.5, 768001.3 6278338.4 52.5, 768001.7 6278338.8 52.5, 768006.7 6278343.8 52.5))
-BATIMENT0000000211104473;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:15:23;2019-04-08 10:00:52;2002-01-01;;;;3.0;1.0;1.0;2.0;50.0;10.0;8.3;54.3;62.6;65.0;58.2;Cadastre;A 1.0;POLYGON Z ((768006.1 6278471.4 62.5, 768020.4 6278463.2 62.5, 768021.3 6278462.3 62.5, 768012.3 6278452.7 62.5, 768010.6 6278454.3 62.5, 768009.7 6278453.4 62.5, 768004.7 6278458 62.5, 768005.5 6278458.8 62.5, 768004.7 6278459.6 62.5, 768003.9 6278458.8 62.5, 767998.8 6278463.6 62.5, 768006.1 6278471.4 62.5))
-BATIMENT0000000211104474;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:15:23;2019-04-08 10:00:52;2001-01-01;;;;3.0;2.5;1.0;2.0;0.0;0.0;6.4;45.1;51.5;52.6;46.1;Cadastre;A 1.0;POLYGON Z ((767996.8 6278356.8 51.5, 768002.2 6278351.4 51.5, 768004.5 6278349.1 51.5, 768003 6278347.6 51.5, 768006.7 6278343.8 51.5, 768001.7 6278338.8 51.5, 767999.7 6278340.8 51.5, 768001.9 6278343 51.5, 767998.8 6278346.1 51.5, 767995.5 6278349.3 51.5, 767992 6278345.9 51.5, 767988.9 6278349 51.5, 767996.8 6278356.8 51.5))
-BATIMENT0000000211104477;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:15:23;2019-04-08 10:00:52;2002-01-01;;;;3.0;2.5;1.0;2.0;0.0;0.0;5.4;48.9;54.3;55.5;50.4;Cadastre;A 1.0;POLYGON Z ((767975 6278433.7 54.3, 767975.8 6278434.4 54.3, 767984.3 6278425.3 54.3, 767986.2 6278423.2 54.3, 767978.4 6278415.9 54.3, 767973.5 6278421.2 54.3, 767971.9 6278422.9 54.3, 767971 6278423.9 54.3, 767968.8 6278421.9 54.3, 767965.8 6278425.1 54.3, 767975 6278433.7 54.3))
-BATIMENT0000000211104479;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:15:23;2019-04-08 10:00:52;2002-01-01;;;;3.0;2.5;1.0;2.0;35.0;10.0;7.1;48.1;55.2;;;Cadastre;A 1.0;POLYGON Z ((767997.4 6278405.6 55.2, 767999.7 6278403.2 55.2, 768003.3 6278406.6 55.2, 768010.5 6278399 55.2, 768006.6 6278395.3 55.2, 768003.8 6278398.3 55.2, 768000.3 6278395 55.2, 767999.2 6278396.1 55.2, 767996.1 6278393.2 55.2, 767992.7 6278396.7 55.2, 767993.7 6278397.6 55.2, 767991.8 6278399.7 55.2, 767991.5 6278400 55.2, 767997.4 6278405.6 55.2))
-BATIMENT0000000211104482;Indifférenciée;Résidentiel;Commercial et services;Non;En service;2008-11-18 15:15:23;2019-04-08 10:00:52;1760-01-01;;;;3.0;1.0;1.0;3.0;10.0;10.0;8.1;42.7;50.8;54.1;43.7;Cadastre;A 0.5;POLYGON Z ((767926.8 6278403.8 50.7, 767938 6278391.3 50.7, 767956.8 6278370.8 50.7, 767950.3 6278364.2 50.7, 767947.6 6278361.4 50.7, 767936.6 6278371.3 50.7, 767916.3 6278390.4 50.7, 767924.7 6278397.9 50.7, 767923.1 6278400.3 50.7, 767926.8 6278403.8 50.7))
-BATIMENT0000000211104519;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:15:23;2019-04-08 10:00:52;2001-01-01;;;;3.0;2.5;1.0;2.0;5.0;1.0;6.6;45.6;52.2;53.4;46.4;Cadastre;A 1.0;POLYGON Z ((767909 6278449.3 52.2, 767911 6278447.1 52.2, 767914.4 6278443.3 52.2, 767908 6278437.5 52.2, 767903.1 6278442.9 52.2, 767900.6 6278440.6 52.2, 767898.3 6278443.1 52.2, 767903.9 6278448.2 52.2, 767905.6 6278446.3 52.2, 767908.9 6278449.2 52.2, 767909 6278449.3 52.2))
-BATIMENT0000000211104520;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:15:23;2019-04-08 10:00:52;2000-01-01;;;;3.0;2.5;1.0;1.0;5.0;1.0;5.2;45.6;50.8;53.3;46.4;Cadastre;A 1.0;POLYGON Z ((767898 6278456 50.8, 767898.3 6278455.6 50.8, 767901.8 6278451.7 50.8, 767903.2 6278452.9 50.8, 767904.8 6278454.4 50.8, 767907.4 6278451.5 50.8, 767903.9 6278448.2 50.8, 767898.3 6278443.1 50.8, 767895.8 6278445.8 50.8, 767893.5 6278443.7 50.8, 767889.4 6278448.3 50.8, 767891.5 6278450.1 50.8, 767898 6278456 50.8))
-BATIMENT0000000211104521;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:15:23;2019-04-08 10:00:52;2000-01-01;;;;3.0;2.5;1.0;2.0;5.0;1.0;6.8;45.6;52.4;53.0;46.3;Cadastre;A 1.0;POLYGON Z ((767894.5 6278465.2 52.4, 767898.3 6278461 52.4, 767900.6 6278458.4 52.4, 767899.3 6278457.2 52.4, 767898 6278456 52.4, 767891.5 6278450.1 52.4, 767889.1 6278452.7 52.4, 767893.2 6278456.5 52.4, 767889.8 6278460.2 52.4, 767889.4 6278460.6 52.4, 767894.5 6278465.2 52.4))
-BATIMENT0000000211104522;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:15:23;2019-04-08 10:00:52;2001-01-01;;;;3.0;2.5;1.0;1.0;50.0;10.0;5.3;45.6;50.9;52.1;46.2;Cadastre;A 1.0;POLYGON Z ((767889.5 6278472.1 50.9, 767895.2 6278465.8 50.9, 767894.5 6278465.2 50.9, 767889.4 6278460.6 50.9, 767883.2 6278455 50.9, 767880 6278458.5 50.9, 767880.5 6278458.9 50.9, 767881.4 6278459.8 50.9, 767877.4 6278464.3 50.9, 767882.9 6278469.3 50.9, 767883.7 6278468.4 50.9, 767886.6 6278470.9 50.9, 767889.5 6278472.1 50.9))
-BATIMENT0000000211104523;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:15:23;2019-04-08 10:00:52;2001-01-01;;;;3.0;2.5;1.0;2.0;0.0;0.0;5.4;48.8;54.2;56.2;49.9;Cadastre;A 1.0;POLYGON Z ((767951.9 6278453.7 54.2, 767954.3 6278455.9 54.2, 767954.8 6278456 54.2, 767955 6278456 54.2, 767961.1 6278449.3 54.2, 767959.7 6278448 54.2, 767956.6 6278445.2 54.2, 767958.8 6278442.8 54.2, 767956.2 6278440.5 54.2, 767952.8 6278437.3 54.2, 767950.4 6278440 54.2, 767950.4 6278440.1 54.2, 767951.4 6278440.9 54.2, 767947.3 6278445.3 54.2, 767949.4 6278447.3 54.2, 767946.2 6278450.8 54.2, 767950.1 6278454.4 54.2, 767951.2 6278453.1 54.2, 767951.9 6278453.7 54.2))
-BATIMENT0000000211104527;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:15:23;2019-04-08 10:00:52;2003-01-01;;;;3.0;2.5;1.0;2.0;50.0;10.0;8.1;50.8;58.9;59.8;53.2;Cadastre;A 1.0;POLYGON Z ((767980.9 6278443.7 58.9, 767979.1 6278448.1 58.9, 767979.8 6278448.7 58.9, 767976.3 6278452.3 58.9, 767977.5 6278453.4 58.9, 767975.7 6278455.3 58.9, 767968.6 6278453 58.9, 767966.5 6278459.2 58.9, 767974.3 6278461.9 58.9, 767975.3 6278462.2 58.9, 767976.3 6278462.2 58.9, 767977.3 6278462.1 58.9, 767978.4 6278461.7 58.9, 767979.4 6278461.1 58.9, 767980.4 6278459.9 58.9, 767979.5 6278459.1 58.9, 767981.3 6278457.2 58.9, 767981.7 6278457.6 58.9, 767985.8 6278453.4 58.9, 767985.1 6278452.7 58.9, 767987.7 6278449.9 58.9, 767980.9 6278443.7 58.9))
-BATIMENT0000000211104528;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:15:23;2019-04-08 10:00:52;2006-01-01;;;;3.0;2.5;1.0;2.0;1.0;1.0;8.1;50.8;58.9;;;Cadastre;A 1.0;POLYGON Z ((767990.1 6278447.2 58.9, 767998.1 6278439.4 58.9, 767998.8 6278440.1 58.9, 767999.6 6278439.3 58.9, 767996.6 6278436.1 58.9, 767995.9 6278436.8 58.9, 767991.2 6278432 58.9, 767988.9 6278434.3 58.9, 767988.9 6278435.8 58.9, 767989 6278436 58.9, 767987 6278437.9 58.9, 767986.9 6278437.8 58.9, 767985.3 6278437.8 58.9, 767983.8 6278439.3 58.9, 767983.7 6278440.9 58.9, 767980.9 6278443.7 58.9, 767987.7 6278449.9 58.9, 767990.5 6278447.7 58.9, 767990.1 6278447.2 58.9))
-BATIMENT0000000211104529;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:15:23;2019-04-08 10:00:52;2003-01-01;;;;3.0;2.5;1.0;3.0;0.0;0.0;6.0;46.7;52.7;53.3;48.7;Cadastre;A 1.0;POLYGON Z ((767918 6278492.4 52.7, 767923.1 6278487 52.7, 767919.4 6278483.5 52.7, 767923.6 6278479.1 52.7, 767927.2 6278482.5 52.7, 767932.2 6278477.2 52.7, 767930.3 6278475.4 52.7, 767928.8 6278477.1 52.7, 767927.4 6278475.7 52.7, 767921.6 6278470.4 52.7, 767918.3 6278467.3 52.7, 767911.5 6278474.6 52.7, 767912.6 6278475.6 52.7, 767911.3 6278477.1 52.7, 767910.1 6278476 52.7, 767903.9 6278482.7 52.7, 767908.2 6278486.7 52.7, 767908.8 6278486.2 52.7, 767911.3 6278488.6 52.7, 767912.5 6278487.3 52.7, 767918 6278492.4 52.7))
-BATIMENT0000000211110151;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;1964-01-01;;;;3.0;1.0;1.0;1.0;40.0;10.0;8.2;52.0;60.2;60.9;52.7;Cadastre;A 1.0;POLYGON Z ((768562.7 6278027.6 60.2, 768569.9 6278017.2 60.2, 768562.5 6278012.1 60.2, 768555.2 6278022.5 60.2, 768562.7 6278027.6 60.2))
-BATIMENT0000000211110116;Indifférenciée;Résidentiel;Annexe;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;;;;;3.0;2.5;39.0;5.0;1.0;2.0;15.2;43.2;58.4;59.7;46.0;Cadastre;C 0.8;POLYGON Z ((768179.9 6278246.7 58.4, 768189 6278240.8 58.4, 768152.2 6278186.4 58.4, 768177.6 6278168.9 58.4, 768188.8 6278185.3 58.4, 768197.5 6278179.3 58.4, 768180.5 6278154.2 58.4, 768137.2 6278184 58.4, 768179.9 6278246.7 58.4))
-BATIMENT0000000211110152;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;1965-01-01;;;;3.0;1.0;1.0;1.0;14.0;10.0;8.2;51.6;59.8;60.4;53.2;Cadastre;A 1.0;POLYGON Z ((768528.5 6278082.9 59.8, 768536 6278071.9 59.8, 768528.6 6278066.7 59.8, 768521 6278078 59.8, 768528.5 6278082.9 59.8))
-BATIMENT0000000211110117;Indifférenciée;Commercial et services;;Oui;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;2008-01-01;;;;3.0;2.5;0.0;1.0;;;5.5;41.3;46.8;;;Cadastre;C 0.4;POLYGON Z ((768128 6278019.6 46.8, 768089.8 6278045 46.8, 768090.6 6278046.3 46.8, 768091.3 6278046.4 46.8, 768129.5 6278021.9 46.8, 768128 6278019.6 46.8))
-BATIMENT0000000211110119;Indifférenciée;Indifférencié;;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;1971-01-01;;;;5.0;1.0;0.0;4.0;;;4.3;41.8;46.1;47.0;44.0;Cadastre;C 0.1;POLYGON Z ((768183.8 6278145 46.1, 768192.6 6278138.6 46.1, 768190.8 6278136 46.1, 768182 6278142.3 46.1, 768183.8 6278145 46.1))
-BATIMENT0000000211110121;Indifférenciée;Résidentiel;Annexe;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;;;;;3.0;2.5;37.0;5.0;3.0;1.0;14.3;45.9;60.2;61.0;46.6;Cadastre;C 0.7;POLYGON Z ((768202 6278231.7 60.2, 768269.8 6278185.7 60.2, 768244.8 6278148.7 60.2, 768213.7 6278169.4 60.2, 768219.6 6278178.1 60.2, 768241.6 6278163.3 60.2, 768255 6278183 60.2, 768196.3 6278223.2 60.2, 768202 6278231.7 60.2))
-BATIMENT0000000211110122;Indifférenciée;Résidentiel;Annexe;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;;;;;3.0;2.5;43.0;8.0;10.0;10.0;14.0;40.3;54.3;62.8;40.8;Cadastre;C 0.6;POLYGON Z ((768100.2 6278173.5 54.3, 768153.8 6278137.1 54.3, 768137.6 6278113.3 54.3, 768151.9 6278103.7 54.3, 768145.8 6278095.1 54.3, 768122.9 6278110.5 54.3, 768138.9 6278134.3 54.3, 768103.1 6278158.7 54.3, 768087.9 6278136.8 54.3, 768079 6278142.7 54.3, 768100.2 6278173.5 54.3))
-BATIMENT0000000211110123;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;1989-01-01;;;;3.0;1.0;1.0;2.0;5.0;1.0;6.3;43.2;49.5;51.7;43.5;Cadastre;A 1.0;POLYGON Z ((768094 6278228.7 49.4, 768091.2 6278224.8 49.4, 768080.8 6278231.4 49.4, 768078.2 6278236.5 49.4, 768079.8 6278237.4 49.4, 768078 6278240.5 49.4, 768082.4 6278242.7 49.4, 768085.6 6278237.1 49.4, 768084.7 6278236.2 49.4, 768088.5 6278233.5 49.4, 768088 6278232.8 49.4, 768094 6278228.7 49.4))
-BATIMENT0000000211110128;Indifférenciée;Résidentiel;Annexe;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;;;;;3.0;2.5;49.0;5.0;10.0;10.0;13.5;44.0;57.5;58.0;44.8;Cadastre;C 0.7;POLYGON Z ((768245.9 6278093.2 57.5, 768286.2 6278066.1 57.5, 768264.4 6278033.3 57.5, 768298 6278010.4 57.5, 768320 6278042.9 57.5, 768328.6 6278036.9 57.5, 768300.7 6277995.6 57.5, 768249.3 6278030.5 57.5, 768271.4 6278063.3 57.5, 768240.1 6278084.5 57.5, 768245.9 6278093.2 57.5))
-BATIMENT0000000211110129;Indifférenciée;Résidentiel;Annexe;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;1992-01-01;;;;3.0;1.0;33.0;7.0;1.0;1.0;17.5;46.3;63.8;65.5;46.8;Cadastre;A 1.0;POLYGON Z ((768378.6 6277972.2 63.7, 768401.9 6278008.5 63.7, 768411.7 6278002.2 63.7, 768388.4 6277966 63.7, 768378.6 6277972.2 63.7))
-BATIMENT0000000211110131;Indifférenciée;Résidentiel;Annexe;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;1971-01-01;;;;3.0;2.5;59.0;8.0;0.0;0.0;14.5;45.8;60.3;67.9;47.3;Cadastre;C 0.7;POLYGON Z ((768309 6278121.4 60.3, 768341.6 6278099.2 60.3, 768389.9 6278170.4 60.3, 768398.3 6278164.6 60.3, 768343.9 6278084.7 60.3, 768312 6278106.8 60.3, 768296.9 6278084.2 60.3, 768288 6278090.4 60.3, 768309 6278121.4 60.3))
-BATIMENT0000000211110134;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;;;;;3.0;1.0;75.0;5.0;0.0;0.0;12.0;48.8;60.8;64.6;49.9;Cadastre;C 0.5;POLYGON Z ((768356.6 6278266.5 60.7, 768364.7 6278261.1 60.7, 768362 6278257.1 60.7, 768384.4 6278241.7 60.7, 768407.3 6278275.6 60.7, 768411 6278272.8 60.7, 768411.8 6278273.8 60.7, 768413.6 6278272.6 60.7, 768413 6278271.7 60.7, 768417.4 6278268.7 60.7, 768387.3 6278224.3 60.7, 768380.3 6278229.2 60.7, 768376.3 6278223.6 60.7, 768370.2 6278227.8 60.7, 768374.7 6278234.5 60.7, 768372.8 6278235.8 60.7, 768372.3 6278235.1 60.7, 768359.2 6278244.1 60.7, 768356.7 6278240.6 60.7, 768344.8 6278248.8 60.7, 768356.6 6278266.5 60.7))
-BATIMENT0000000211110135;Indifférenciée;Résidentiel;Annexe;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;1989-01-01;;;;3.0;2.5;59.0;5.0;10.0;10.0;14.2;48.0;62.2;64.2;50.4;Cadastre;C 0.7;POLYGON Z ((768267.5 6278308.6 62.2, 768302.3 6278284.9 62.2, 768264.9 6278229.7 62.2, 768308.7 6278199.7 62.2, 768322 6278219.1 62.2, 768300 6278234.2 62.2, 768306 6278242.8 62.2, 768336.6 6278222 62.2, 768311.6 6278185.1 62.2, 768249.8 6278227.2 62.2, 768287.3 6278282.2 62.2, 768261.8 6278299.9 62.2, 768267.5 6278308.6 62.2))
-BATIMENT0000000211110136;Indifférenciée;Résidentiel;Annexe;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;;;;;3.0;1.0;9.0;2.0;0.0;0.0;7.2;46.2;53.4;54.9;50.2;Cadastre;C 0.6;POLYGON Z ((768429.2 6278159.5 53.4, 768438.8 6278153.2 53.4, 768441.1 6278151.7 53.4, 768438.5 6278147.8 53.4, 768436.7 6278149 53.4, 768431.7 6278141.3 53.4, 768431.1 6278141.7 53.4, 768427.7 6278136.7 53.4, 768425 6278138.5 53.4, 768421.6 6278133.2 53.4, 768426.4 6278130 53.4, 768422.5 6278123.9 53.4, 768417.6 6278127.1 53.4, 768414.1 6278121.8 53.4, 768411 6278117.1 53.4, 768405.5 6278108.7 53.4, 768401.8 6278110.7 53.4, 768399.9 6278107.2 53.4, 768398.7 6278107.8 53.4, 768395.1 6278100.7 53.4, 768396.3 6278100.1 53.4, 768392.4 6278092.7 53.4, 768383.8 6278097.4 53.4, 768391.6 6278112 53.4, 768392.7 6278111.4 53.4, 768394 6278113.6 53.4, 768396.9 6278112 53.4, 768399.3 6278116.5 53.4, 768400.7 6278115.8 53.4, 768403.6 6278120.1 53.4, 768405.1 6278122.4 53.4, 768396.6 6278128 53.4, 768401.1 6278135.6 53.4, 768403 6278138.7 53.4, 768406.2 6278143.5 53.4, 768415.1 6278137.7 53.4, 768418.8 6278143.3 53.4, 768420.1 6278142.5 53.4, 768425 6278150 53.4, 768423.4 6278151 53.4, 768429.1 6278159.6 53.4, 768429.2 6278159.5 53.4))
-BATIMENT0000000211110137;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;2006-01-01;;;;3.0;1.0;2.0;1.0;5.0;1.0;7.7;49.3;57.0;58.2;50.1;Cadastre;C 0.2;POLYGON Z ((768418.8 6278118.3 57, 768424.2 6278118.1 57, 768424.3 6278117.5 57, 768434.4 6278116.9 57, 768434.4 6278118.7 57, 768439.1 6278118.4 57, 768438.3 6278106.4 57, 768433.9 6278106.6 57, 768433.9 6278107.3 57, 768423.7 6278107.9 57, 768423.3 6278101.1 57, 768417.9 6278101.4 57, 768418.8 6278118.3 57))
-BATIMENT0000000211110139;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;1965-01-01;;;;3.0;1.0;1.0;2.0;50.0;10.0;6.6;51.6;58.2;59.1;51.9;Cadastre;A 1.0;POLYGON Z ((768542.2 6278016.1 58.1, 768550.3 6278004.4 58.1, 768541.9 6277998.7 58.1, 768533.9 6278010.3 58.1, 768536.8 6278012.3 58.1, 768536.5 6278012.8 58.1, 768537.7 6278013.6 58.1, 768538.1 6278013.1 58.1, 768542.2 6278016.1 58.1))
-BATIMENT0000000211110140;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;1966-01-01;;;;3.0;2.5;1.0;1.0;14.0;10.0;7.2;53.3;60.5;62.0;53.5;Cadastre;A 1.0;POLYGON Z ((768526.8 6278158.5 60.5, 768531.7 6278151.4 60.5, 768528.6 6278149.4 60.5, 768529.3 6278148.4 60.5, 768521.5 6278143.3 60.5, 768516 6278151.2 60.5, 768526.8 6278158.5 60.5))
-BATIMENT0000000211110141;Indifférenciée;Résidentiel;Annexe;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;1966-01-01;;;;3.0;1.0;2.0;2.0;14.0;10.0;8.7;52.0;60.7;61.2;53.4;Cadastre;A 1.0;POLYGON Z ((768553.2 6278047.3 60.6, 768560.7 6278036.2 60.6, 768553.3 6278031.5 60.6, 768545.9 6278042.5 60.6, 768553.2 6278047.3 60.6))
-BATIMENT0000000211110142;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;1965-01-01;;;;3.0;1.0;1.0;1.0;50.0;10.0;6.4;54.6;61.0;61.5;55.8;Cadastre;A 1.0;POLYGON Z ((768617.7 6277991.2 60.9, 768613 6277988.1 60.9, 768608.6 6277994.6 60.9, 768620.2 6278002.2 60.9, 768624.5 6277995.7 60.9, 768617.7 6277991.2 60.9))
-BATIMENT0000000211110145;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;1965-01-01;;;;3.0;1.0;1.0;1.0;40.0;10.0;6.6;55.0;61.6;62.7;56.0;Cadastre;A 1.0;POLYGON Z ((768600.6 6278030.1 61.5, 768605.7 6278022.6 61.5, 768595.3 6278015.4 61.5, 768590.2 6278022.7 61.5, 768600.6 6278030.1 61.5))
-BATIMENT0000000211110146;Indifférenciée;Résidentiel;Commercial et services;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;1965-01-01;;;;3.0;1.0;1.0;2.0;41.0;10.0;6.9;55.2;62.1;63.0;56.6;Cadastre;A 1.0;POLYGON Z ((768614.7 6278018.3 62, 768615.5 6278017.2 62, 768618.3 6278013.1 62, 768619.9 6278010.8 62, 768609.1 6278003.5 62, 768604.1 6278011 62, 768614.7 6278018.3 62))
-BATIMENT0000000211110147;Indifférenciée;Commercial et services;Résidentiel;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;;;;;3.0;1.0;1.0;2.0;;;7.2;43.9;51.1;54.1;48.1;Cadastre;C 0.4;POLYGON Z ((768511.7 6278223.6 51, 768501 6278234.8 51, 768511.2 6278244.9 51, 768515.6 6278249.2 51, 768526.5 6278238 51, 768511.7 6278223.6 51))
-BATIMENT0000000211110150;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;1966-01-01;;;;3.0;2.5;1.0;1.0;15.0;10.0;5.2;56.5;61.7;64.0;56.5;Cadastre;A 1.0;POLYGON Z ((768562.9 6278125.8 61.7, 768568.1 6278118.6 61.7, 768558 6278111.5 61.7, 768552.9 6278118.6 61.7, 768562.9 6278125.8 61.7))
-BATIMENT0000000211110154;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;1965-01-01;;;;3.0;1.0;1.0;1.0;50.0;10.0;7.0;51.3;58.3;59.0;51.6;Cadastre;A 1.0;POLYGON Z ((768525.4 6278040.1 58.2, 768530.5 6278032.5 58.2, 768531.3 6278033.1 58.2, 768532.6 6278031.1 58.2, 768530.4 6278029.7 58.2, 768532.9 6278026 58.2, 768526.8 6278022.2 58.2, 768518.1 6278035.2 58.2, 768525.4 6278040.1 58.2))
-BATIMENT0000000211110156;Indifférenciée;Indifférencié;;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;1989-01-01;;;;5.0;1.0;0.0;1.0;;;2.0;52.0;54.0;54.8;54.0;Cadastre;C 0.2;POLYGON Z ((768552.2 6278169.3 54, 768554.7 6278167.6 54, 768553.8 6278166.1 54, 768551.2 6278167.8 54, 768552.2 6278169.3 54))
-BATIMENT0000000211110158;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;1965-01-01;;;;3.0;2.5;1.0;1.0;54.0;10.0;7.0;55.5;62.5;65.0;56.7;Cadastre;A 1.0;POLYGON Z ((768574.8 6278132.4 62.5, 768572.9 6278135.3 62.5, 768580.6 6278140.5 62.5, 768586.6 6278131.3 62.5, 768579 6278126.2 62.5, 768574.8 6278132.4 62.5))
-BATIMENT0000000211110159;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;1964-01-01;;;;3.0;2.5;1.0;1.0;40.0;10.0;4.5;51.9;56.4;58.6;51.9;Cadastre;A 1.0;POLYGON Z ((768499.3 6278118.5 56.4, 768504.3 6278111.1 56.4, 768493.7 6278104.1 56.4, 768488.7 6278111.4 56.4, 768499.3 6278118.5 56.4))
-BATIMENT0000000211110161;Indifférenciée;Résidentiel;Annexe;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;1860-01-01;;;;3.0;2.5;2.0;2.0;0.0;0.0;6.8;45.3;52.1;54.2;47.6;Cadastre;A 1.0;POLYGON Z ((768549.4 6278230.9 52.1, 768549.4 6278232.7 52.1, 768555.2 6278239.9 52.1, 768560.8 6278234.4 52.1, 768557.1 6278230.5 52.1, 768555.2 6278231 52.1, 768554.7 6278229.4 52.1, 768551.4 6278225.4 52.1, 768547 6278228.6 52.1, 768548.3 6278230.3 52.1, 768549.4 6278230.9 52.1))
-BATIMENT0000000211110162;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;1965-01-01;;;;3.0;2.5;1.0;1.0;15.0;10.0;5.3;54.5;59.8;61.4;54.5;Cadastre;A 1.0;POLYGON Z ((768531 6278110.9 59.8, 768535.8 6278103.8 59.8, 768535.5 6278103.6 59.8, 768536.3 6278102.5 59.8, 768531.6 6278099.4 59.8, 768531 6278100.4 59.8, 768525.5 6278096.9 59.8, 768520.7 6278103.9 59.8, 768531 6278110.9 59.8))
-BATIMENT0000000211110165;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;1964-01-01;;;;3.0;1.0;1.0;1.0;59.0;10.0;8.3;52.0;60.3;61.2;52.7;Cadastre;A 1.0;POLYGON Z ((768510 6278147.6 60.3, 768517.5 6278136.8 60.3, 768510.1 6278131.9 60.3, 768502.8 6278142.7 60.3, 768510 6278147.6 60.3))
-BATIMENT0000000211110166;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;1963-01-01;;;;3.0;1.0;1.0;1.0;50.0;10.0;5.8;51.3;57.1;57.7;53.2;Cadastre;A 1.0;POLYGON Z ((768513.5 6278099.2 57, 768521.4 6278087.5 57, 768514.9 6278083.1 57, 768507.1 6278094.8 57, 768513.5 6278099.2 57))
-BATIMENT0000000211110167;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;1965-01-01;;;;3.0;2.5;1.0;1.0;14.0;10.0;7.5;53.3;60.8;62.8;54.8;Cadastre;A 1.0;POLYGON Z ((768543.5 6278164.9 60.8, 768551.1 6278153.7 60.8, 768543.9 6278148.7 60.8, 768536.4 6278160 60.8, 768543.5 6278164.9 60.8))
-BATIMENT0000000211110168;Indifférenciée;Résidentiel;Annexe;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;1965-01-01;;;;3.0;1.0;2.0;2.0;0.0;0.0;7.1;51.2;58.3;58.8;51.4;Cadastre;A 1.0;POLYGON Z ((768513.9 6278059.5 58.2, 768522.2 6278047.6 58.2, 768514.6 6278042.6 58.2, 768506.6 6278054.4 58.2, 768513.9 6278059.5 58.2))
-BATIMENT0000000211110169;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;1965-01-01;;;;3.0;1.0;1.0;1.0;14.0;10.0;6.9;54.3;61.2;61.8;55.4;Cadastre;A 1.0;POLYGON Z ((768543.5 6278119.3 61.1, 768550.7 6278108.5 61.1, 768544.1 6278104.1 61.1, 768537 6278114.7 61.1, 768543.5 6278119.3 61.1))
-BATIMENT0000000211110171;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;1964-01-01;;;;3.0;2.5;1.0;1.0;15.0;10.0;6.9;51.6;58.5;60.2;51.9;Cadastre;A 1.0;POLYGON Z ((768491.5 6278133.8 58.5, 768494.8 6278135.9 58.5, 768499.4 6278129.2 58.5, 768490.1 6278122.7 58.5, 768485.4 6278129.7 58.5, 768491.5 6278133.8 58.5))
-BATIMENT0000000211110174;Indifférenciée;Résidentiel;Annexe;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;1987-01-01;;;;3.0;1.0;77.0;8.0;0.0;0.0;23.1;47.6;70.7;71.3;49.7;Cadastre;C 0.2;POLYGON Z ((768510.7 6277975.4 70.7, 768507.2 6277972.1 70.7, 768504.1 6277969.2 70.7, 768490 6277984.1 70.7, 768489.4 6277984.1 70.7, 768489.4 6277983.7 70.7, 768489.3 6277983.4 70.7, 768489 6277982.9 70.7, 768488.4 6277982.3 70.7, 768487.7 6277982 70.7, 768487.3 6277982.1 70.7, 768486.9 6277982.2 70.7, 768486.5 6277982.5 70.7, 768486.2 6277982.9 70.7, 768486.1 6277983.2 70.7, 768485.7 6277983.9 70.7, 768484.8 6277984 70.7, 768475.2 6277974.8 70.7, 768473.7 6277976.3 70.7, 768470.8 6277973.6 70.7, 768467.9 6277976.3 70.7, 768466.2 6277974.9 70.7, 768447.3 6277994.6 70.7, 768451.3 6277998.5 70.7, 768450.7 6277999.2 70.7, 768453.2 6278001.6 70.7, 768453.8 6278000.8 70.7, 768456.9 6278003.7 70.7, 768461.5 6277998.6 70.7, 768461.7 6277999 70.7, 768462.5 6277999.2 70.7, 768463 6277999.2 70.7, 768463.6 6277999 70.7, 768464 6277998.9 70.7, 768464.3 6277998.7 70.7, 768464.6 6277998.1 70.7, 768464.7 6277997.7 70.7, 768464.7 6277997.3 70.7, 768464.6 6277996.8 70.7, 768464.1 6277996.2 70.7, 768463.6 6277995.7 70.7, 768464.8 6277994.4 70.7, 768464 6277993.7 70.7, 768468.6 6277988.6 70.7, 768469.8 6277989.7 70.7, 768469.6 6277990.1 70.7, 768469.5 6277990.5 70.7, 768469.6 6277991.4 70.7, 768469.9 6277991.9 70.7, 768470.6 6277992.2 70.7, 768471.1 6277992.3 70.7, 768471.5 6277992.4 70.7, 768472 6277992.1 70.7, 768472.3 6277991.8 70.7, 768472.6 6277991.5 70.7, 768473 6277990.9 70.7, 768473 6277990.5 70.7, 768472.8 6277990.1 70.7, 768472.5 6277989.8 70.7, 768473.8 6277988.4 70.7, 768482.5 6277996.8 70.7, 768484.1 6277995.2 70.7, 768488.2 6277999.2 70.7, 768491.8 6277995.4 70.7, 768492.3 6277995.8 70.7, 768493.2 6277995 70.7, 768494.2 6277995.8 70.7, 768505 6277984.4 70.7, 768506.5 6277985.8 70.7, 768506.9 6277985.8 70.7, 768507.2 6277985.9 70.7, 768507.7 6277986 70.7, 768508.3 6277985.6 70.7, 768508.9 6277985.1 70.7, 768509 6277984.7 70.7, 768509.1 6277984.4 70.7, 768509.1 6277984.1 70.7, 768509.1 6277983.7 70.7, 768509 6277983.4 70.7, 768508.5 6277982.9 70.7, 768507.5 6277981.8 70.7, 768512.2 6277976.8 70.7, 768510.7 6277975.4 70.7))
-BATIMENT0000000211110175;Indifférenciée;Résidentiel;Annexe;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;1990-01-01;;;;3.0;1.0;23.0;5.0;36.0;40.0;13.1;56.1;69.2;74.8;59.2;Cadastre;C 0.1;POLYGON Z ((768600.2 6278104.6 69.2, 768606.7 6278094.9 69.2, 768580.4 6278076.6 69.2, 768573.8 6278086.1 69.2, 768600.2 6278104.6 69.2))
-BATIMENT0000000211110183;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;2000-01-01;;;;3.0;2.5;1.0;2.0;3.0;10.0;7.5;50.7;58.2;59.4;52.2;Cadastre;C 0.9;POLYGON Z ((768508.7 6278175.7 58.2, 768514.2 6278167.9 58.2, 768511.4 6278165.9 58.2, 768508.9 6278164.1 58.2, 768503.3 6278172 58.2, 768500.9 6278175.5 58.2, 768503.2 6278177.2 58.2, 768505.7 6278173.6 58.2, 768506.6 6278172.4 58.2, 768507.7 6278173.2 58.2, 768506.8 6278174.4 58.2, 768508.7 6278175.7 58.2))
-BATIMENT0000000211110186;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;2000-01-01;;;;3.0;2.5;1.0;2.0;3.0;10.0;7.0;50.3;57.3;59.0;52.1;Cadastre;C 0.8;POLYGON Z ((768503.3 6278172 57.3, 768508.9 6278164.1 57.3, 768506.3 6278162.4 57.3, 768503.4 6278160.3 57.3, 768500.7 6278164 57.3, 768497.9 6278168.1 57.3, 768499.9 6278169.5 57.3, 768500.8 6278168.3 57.3, 768501.8 6278169 57.3, 768500.9 6278170.3 57.3, 768498.4 6278173.8 57.3, 768500.9 6278175.5 57.3, 768503.3 6278172 57.3))
-BATIMENT0000000211110187;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;2000-01-01;;;;3.0;2.5;1.0;2.0;3.0;10.0;7.8;50.4;58.2;59.3;52.3;Cadastre;C 0.9;POLYGON Z ((768511.5 6278183 58.2, 768519.5 6278171.6 58.2, 768517 6278169.9 58.2, 768514.2 6278167.9 58.2, 768508.7 6278175.7 58.2, 768510.5 6278177 58.2, 768511.3 6278175.7 58.2, 768512.4 6278176.5 58.2, 768511.5 6278177.7 58.2, 768509.1 6278181.3 58.2, 768511.5 6278183 58.2))
-BATIMENT0000000211110189;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;2000-01-01;;;;3.0;2.5;1.0;2.0;3.0;10.0;6.4;50.2;56.6;58.2;51.8;Cadastre;C 0.8;POLYGON Z ((768494.2 6278166.7 56.6, 768495 6278161.7 56.6, 768495.6 6278157.2 56.6, 768492.2 6278156.7 56.6, 768489.2 6278156.2 56.6, 768487.1 6278169.9 56.6, 768490 6278170.4 56.6, 768490.6 6278166.1 56.6, 768490.8 6278164.7 56.6, 768492.1 6278164.9 56.6, 768491.9 6278166.3 56.6, 768494.2 6278166.7 56.6))
-BATIMENT0000000211110190;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;2000-01-01;;;;3.0;2.5;1.0;2.0;3.0;10.0;7.9;50.3;58.2;59.1;52.3;Cadastre;C 0.9;POLYGON Z ((768519.5 6278183.3 58.2, 768525 6278175.5 58.2, 768522.3 6278173.6 58.2, 768519.5 6278171.6 58.2, 768511.5 6278183 58.2, 768513.9 6278184.7 58.2, 768516.4 6278181.2 58.2, 768517.3 6278179.9 58.2, 768518.3 6278180.7 58.2, 768517.5 6278181.9 58.2, 768519.5 6278183.3 58.2))
-BATIMENT0000000211110199;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;2000-01-01;;;;3.0;2.5;1.0;2.0;3.0;10.0;6.7;50.2;56.9;58.4;51.6;Cadastre;C 0.9;POLYGON Z ((768487.1 6278169.9 56.9, 768489.2 6278156.2 56.9, 768486.1 6278155.8 56.9, 768482.9 6278155.3 56.9, 768481.4 6278164.7 56.9, 768483.5 6278165 56.9, 768483.7 6278163.6 56.9, 768485 6278163.8 56.9, 768484.8 6278165.3 56.9, 768484.2 6278169.5 56.9, 768487.1 6278169.9 56.9))
-BATIMENT0000000211110200;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;2000-01-01;;;;3.0;2.5;1.0;2.0;3.0;10.0;6.6;50.2;56.8;58.5;51.5;Cadastre;C 0.9;POLYGON Z ((768481.4 6278164.7 56.8, 768482.9 6278155.3 56.8, 768479.4 6278154.8 56.8, 768476.4 6278154.3 56.8, 768474.3 6278168 56.8, 768477.3 6278168.4 56.8, 768477.9 6278164.2 56.8, 768478.1 6278162.7 56.8, 768479.4 6278162.9 56.8, 768479.2 6278164.4 56.8, 768481.4 6278164.7 56.8))
-BATIMENT0000000211110201;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;2000-01-01;;;;3.0;2.5;1.0;2.0;3.0;10.0;7.0;50.2;57.2;58.2;51.4;Cadastre;C 0.9;POLYGON Z ((768474.3 6278168 57.2, 768476.4 6278154.3 57.2, 768473.3 6278153.8 57.2, 768469.6 6278153.2 57.2, 768468.3 6278162.7 57.2, 768470.7 6278163.1 57.2, 768470.9 6278161.6 57.2, 768472.1 6278161.8 57.2, 768472 6278163.3 57.2, 768471.4 6278167.5 57.2, 768474.3 6278168 57.2))
-BATIMENT0000000211110214;Indifférenciée;Annexe;;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;2000-01-01;;;;3.0;2.5;0.0;2.0;0.0;0.0;8.4;48.5;56.9;57.5;50.3;Cadastre;C 0.3;POLYGON Z ((768478 6278200.7 56.9, 768485.9 6278195.4 56.9, 768484.1 6278192.6 56.9, 768482.3 6278190 56.9, 768470.8 6278197.8 56.9, 768472.4 6278200.2 56.9, 768476 6278197.8 56.9, 768477.3 6278197 56.9, 768478 6278198 56.9, 768476.8 6278198.9 56.9, 768478 6278200.7 56.9))
-BATIMENT0000000211110216;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;2000-01-01;;;;3.0;2.5;1.0;2.0;3.0;10.0;8.5;48.5;57.0;57.7;50.5;Cadastre;C 0.2;POLYGON Z ((768470.8 6278197.8 57, 768482.3 6278190 57, 768480.6 6278187.5 57, 768478.6 6278184.4 57, 768470.6 6278189.8 57, 768472 6278191.8 57, 768473.3 6278190.9 57, 768474 6278192 57, 768472.7 6278192.9 57, 768469.1 6278195.3 57, 768470.8 6278197.8 57))
-BATIMENT0000000211110218;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;2000-01-01;;;;3.0;2.5;1.0;2.0;3.0;10.0;8.3;48.5;56.8;57.9;50.5;Cadastre;C 0.3;POLYGON Z ((768478 6278208.5 56.8, 768489.5 6278200.8 56.8, 768487.8 6278198.3 56.8, 768485.9 6278195.4 56.8, 768478 6278200.7 56.8, 768479.3 6278202.6 56.8, 768480.5 6278201.8 56.8, 768481.2 6278202.9 56.8, 768480 6278203.7 56.8, 768476.4 6278206.1 56.8, 768478 6278208.5 56.8))
-BATIMENT0000000211110223;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;1998-01-01;;;;3.0;2.5;1.0;1.0;3.0;10.0;7.9;48.5;56.4;57.7;50.6;Cadastre;C 0.1;POLYGON Z ((768485.3 6278211.6 56.4, 768493.2 6278206.3 56.4, 768491.3 6278203.4 56.4, 768489.5 6278200.8 56.4, 768478 6278208.5 56.4, 768479.6 6278211 56.4, 768483.2 6278208.6 56.4, 768484.5 6278207.8 56.4, 768485.2 6278208.9 56.4, 768484 6278209.7 56.4, 768485.3 6278211.6 56.4))
-BATIMENT0000000211110234;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;1920-01-01;;;;5.0;1.0;1.0;1.0;50.0;10.0;6.4;55.9;62.3;63.8;58.8;Cadastre;A 0.6;POLYGON Z ((768668.7 6277997.8 62.2, 768665 6277994.4 62.2, 768660.2 6277999.7 62.2, 768654.2 6278006.2 62.2, 768657.6 6278009.2 62.2, 768662.3 6278004.1 62.2, 768662.5 6278004.5 62.2, 768668.7 6277997.8 62.2))
-BATIMENT0000000211110225;Indifférenciée;Résidentiel;Annexe;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;1989-01-01;;;;3.0;1.0;38.0;5.0;3.0;1.0;19.0;40.9;59.9;64.1;48.3;Cadastre;C 0.9;POLYGON Z ((768748.6 6278176.3 59.9, 768710.6 6278150.1 59.9, 768692.7 6278158.8 59.9, 768685.8 6278162.1 59.9, 768679.5 6278165.1 59.9, 768671.9 6278168.8 59.9, 768666.2 6278171.5 59.9, 768666.7 6278173.3 59.9, 768656.4 6278178.2 59.9, 768651 6278180.8 59.9, 768644.2 6278184 59.9, 768634.1 6278188.9 59.9, 768627.4 6278192.1 59.9, 768627 6278192.3 59.9, 768633.2 6278204.6 59.9, 768633.6 6278204.4 59.9, 768641.1 6278201 59.9, 768672.7 6278186 59.9, 768672.5 6278185.4 59.9, 768672.1 6278184.1 59.9, 768709.5 6278166.5 59.9, 768710.6 6278167.2 59.9, 768733.8 6278183.3 59.9, 768731.9 6278217 59.9, 768735.3 6278217.4 59.9, 768735.1 6278221.3 59.9, 768738.8 6278221.6 59.9, 768738.9 6278220.4 59.9, 768739.2 6278217.5 59.9, 768745.5 6278218 59.9, 768746 6278212.1 59.9, 768746.6 6278203.9 59.9, 768747.2 6278195.7 59.9, 768747.5 6278191.2 59.9, 768748.6 6278176.6 59.9, 768748.6 6278176.3 59.9))
-BATIMENT0000000211110226;Indifférenciée;Résidentiel;Annexe;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;1972-01-01;;;;3.0;2.5;21.0;7.0;1.0;1.0;16.3;44.0;60.3;65.2;47.8;Cadastre;C 0.2;POLYGON Z ((768591.7 6278210.4 60.3, 768583.1 6278214.7 60.3, 768582.6 6278213.6 60.3, 768578.3 6278215.8 60.3, 768577.9 6278220.5 60.3, 768578.6 6278220.5 60.3, 768577.7 6278231.1 60.3, 768577.3 6278235.8 60.3, 768575.7 6278255.2 60.3, 768587.3 6278256.1 60.3, 768588.9 6278236.7 60.3, 768589.3 6278232 60.3, 768589.9 6278224.5 60.3, 768596.8 6278221.1 60.3, 768613.3 6278213.3 60.3, 768612.9 6278212.3 60.3, 768619.9 6278208.9 60.3, 768615.2 6278199 60.3, 768613.4 6278199.8 60.3, 768609.7 6278198.8 60.3, 768607 6278200.2 60.3, 768596.9 6278205.2 60.3, 768594.3 6278206.5 60.3, 768593.2 6278209.6 60.3, 768591.7 6278210.4 60.3))
-BATIMENT0000000211110227;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;1965-01-01;;;;3.0;2.5;1.0;1.0;14.0;10.0;8.2;54.9;63.1;64.5;56.1;Cadastre;A 1.0;POLYGON Z ((768563.8 6278151.6 63.1, 768565.2 6278149.4 63.1, 768567.6 6278145.9 63.1, 768567.9 6278145.4 63.1, 768568.5 6278145.8 63.1, 768569.1 6278145 63.1, 768568.6 6278144.5 63.1, 768570.3 6278141.9 63.1, 768562.3 6278136.3 63.1, 768555.6 6278145.9 63.1, 768563.8 6278151.6 63.1))
-BATIMENT0000000211110231;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;1850-01-01;;;;3.0;2.5;2.0;2.0;10.0;10.0;9.6;57.6;67.2;68.7;59.2;Cadastre;A 1.0;POLYGON Z ((768700.6 6278058.3 67.2, 768710.1 6278048.3 67.2, 768692.5 6278032.3 67.2, 768687.7 6278037.4 67.2, 768685.8 6278035.6 67.2, 768681.1 6278040.5 67.2, 768682 6278041.3 67.2, 768679.8 6278043.7 67.2, 768686.9 6278049.9 67.2, 768688.9 6278047.8 67.2, 768700.6 6278058.3 67.2))
-BATIMENT0000000211110232;Indifférenciée;Annexe;;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;;;;;5.0;1.0;0.0;1.0;0.0;0.0;1.6;59.4;61.0;61.1;59.7;Cadastre;C 0.1;POLYGON Z ((768647.6 6278086.4 60.9, 768649.2 6278085.6 60.9, 768648.6 6278084.2 60.9, 768646.9 6278084.9 60.9, 768647.6 6278086.4 60.9))
-BATIMENT0000000211110236;Indifférenciée;Annexe;;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;;;;;5.0;1.0;0.0;1.0;3.0;0.0;4.2;38.5;42.7;46.7;41.0;Cadastre;C 0.1;POLYGON Z ((768852.3 6278158 42.6, 768858.8 6278148.1 42.6, 768852.5 6278144 42.6, 768842 6278160.4 42.6, 768845.6 6278162.8 42.6, 768849.8 6278156.7 42.6, 768852.3 6278158 42.6))
-BATIMENT0000000211110238;Indifférenciée;Indifférencié;;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;1983-01-01;;;;3.0;1.0;0.0;1.0;;;1.3;52.7;54.0;54.5;53.1;Cadastre;C 0.2;POLYGON Z ((768779.3 6278001.5 53.9, 768782.4 6277999.9 53.9, 768781.2 6277997.7 53.9, 768778.2 6277999.2 53.9, 768779.3 6278001.5 53.9))
-BATIMENT0000000211110239;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;1998-01-01;;;;3.0;2.5;1.0;1.0;3.0;10.0;4.9;53.1;58.0;;;Cadastre;C 1.0;POLYGON Z ((768769.2 6278008.5 58, 768776.7 6278000.3 58, 768772.1 6277996.1 58, 768770.7 6277997.5 58, 768769.3 6277996.3 58, 768770.2 6277995.3 58, 768767.7 6277993 58, 768758.5 6278003.1 58, 768763.3 6278007.3 58, 768764.4 6278006.1 58, 768766.4 6278007.9 58, 768767.4 6278006.8 58, 768769.2 6278008.5 58))
-BATIMENT0000000211110240;Indifférenciée;Résidentiel;Annexe;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;;;;;3.0;2.5;22.0;6.0;0.0;0.0;14.8;45.6;60.4;64.8;47.8;Cadastre;C 1.0;POLYGON Z ((768805.1 6278110 60.4, 768808.3 6278070.8 60.4, 768844.1 6278052.5 60.4, 768837.6 6278040 60.4, 768830.6 6278043.5 60.4, 768828.6 6278044.6 60.4, 768824.2 6278046.8 60.4, 768818.4 6278049.8 60.4, 768816 6278051 60.4, 768812.4 6278052.8 60.4, 768807.2 6278055.5 60.4, 768804.7 6278056.7 60.4, 768795.2 6278061.5 60.4, 768793.1 6278088.3 60.4, 768791.3 6278108.9 60.4, 768796.4 6278109.5 60.4, 768794.2 6278139.2 60.4, 768808.1 6278140.1 60.4, 768810.3 6278110.4 60.4, 768805.1 6278110 60.4))
-BATIMENT0000000211110241;Indifférenciée;Résidentiel;Annexe;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;;;;;3.0;1.0;28.0;6.0;0.0;0.0;15.5;37.7;53.2;56.0;43.7;Cadastre;C 0.8;POLYGON Z ((768796.8 6278229.6 53.1, 768801.3 6278164.6 53.1, 768787.2 6278163.7 53.1, 768784.8 6278199.2 53.1, 768782.7 6278226.3 53.1, 768781.9 6278237.8 53.1, 768820 6278263.5 53.1, 768828 6278252 53.1, 768797.1 6278231.1 53.1, 768796.9 6278230.8 53.1, 768796.8 6278230.4 53.1, 768796.8 6278230 53.1, 768796.8 6278229.6 53.1))
-BATIMENT0000000211110242;Indifférenciée;Commercial et services;Annexe;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;1984-01-01;;;;3.0;2.5;0.0;1.0;;;13.2;36.5;49.7;57.5;37.5;Cadastre;C 0.3;POLYGON Z ((768904.7 6278258.8 49.7, 768907.7 6278222.9 49.7, 768973.5 6278190.4 49.7, 768967.3 6278177.6 49.7, 768946.6 6278188 49.7, 768901.8 6278210.2 49.7, 768887.8 6278201.2 49.7, 768880.5 6278196.3 49.7, 768872.7 6278207.6 49.7, 768885.4 6278216.2 49.7, 768890.7 6278219.8 49.7, 768891.8 6278220.6 49.7, 768893.8 6278221.8 49.7, 768893.3 6278228.2 49.7, 768892.8 6278235.2 49.7, 768892.1 6278244.3 49.7, 768891.7 6278249.7 49.7, 768886.2 6278252.4 49.7, 768883 6278254 49.7, 768873.6 6278258.6 49.7, 768872 6278259.4 49.7, 768857.7 6278266.4 49.7, 768850.6 6278269.9 49.7, 768849.1 6278270.6 49.7, 768842.9 6278273.7 49.7, 768838 6278276.1 49.7, 768837.8 6278276 49.7, 768832.6 6278273 49.7, 768825.2 6278284.6 49.7, 768836.7 6278292.3 49.7, 768904.7 6278258.8 49.7))
-BATIMENT0000000211110281;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;2001-01-01;;;;3.0;1.0;1.0;2.0;35.0;10.0;7.6;54.2;61.8;62.9;56.5;Cadastre;C 0.6;POLYGON Z ((768030.5 6278459.5 61.7, 768042.5 6278446.7 61.7, 768039.1 6278443.6 61.7, 768037.8 6278445.1 61.7, 768032.9 6278440.5 61.7, 768028.3 6278445.6 61.7, 768025.5 6278448.6 61.7, 768027.2 6278450.2 61.7, 768024.1 6278453.6 61.7, 768030.5 6278459.5 61.7))
-BATIMENT0000000211110285;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;2001-01-01;;;;3.0;2.5;1.0;2.0;5.0;1.0;3.7;48.7;52.4;54.5;48.7;Cadastre;A 1.0;POLYGON Z ((768009.3 6278394 52.4, 768011.4 6278391.7 52.4, 768013.6 6278393.8 52.4, 768020.8 6278386.1 52.4, 768015.3 6278380.9 52.4, 768012.9 6278383.5 52.4, 768011.8 6278382.4 52.4, 768007.3 6278387.1 52.4, 768006.1 6278386 52.4, 768004.7 6278384.6 52.4, 768002.2 6278387.2 52.4, 768009.3 6278394 52.4))
-BATIMENT0000000211110286;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;2001-01-01;;;;3.0;2.5;1.0;2.0;0.0;0.0;5.4;51.4;56.8;58.7;51.5;Cadastre;A 1.0;POLYGON Z ((768024.1 6278415.3 56.8, 768026.3 6278412.9 56.8, 768027.1 6278413.6 56.8, 768030.3 6278410.2 56.8, 768028 6278408.7 56.8, 768030.1 6278406.6 56.8, 768025.3 6278402 56.8, 768022.3 6278405.2 56.8, 768020.2 6278404 56.8, 768015.6 6278408.8 56.8, 768017.6 6278410.6 56.8, 768014 6278414.3 56.8, 768019.7 6278419.8 56.8, 768023.2 6278416.2 56.8, 768022.2 6278415.2 56.8, 768023 6278414.3 56.8, 768024.1 6278415.3 56.8))
-BATIMENT0000000211110287;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;2001-01-01;;;;3.0;2.5;1.0;1.0;0.0;0.0;3.2;48.5;51.7;52.2;49.4;Cadastre;A 1.0;POLYGON Z ((768025.6 6278382.2 51.7, 768033.3 6278374 51.7, 768029.9 6278370.8 51.7, 768029.1 6278371.7 51.7, 768028.2 6278371 51.7, 768029.1 6278370.1 51.7, 768024.8 6278366.1 51.7, 768019.7 6278371.5 51.7, 768019.6 6278371.3 51.7, 768018.7 6278370.4 51.7, 768014.1 6278375.3 51.7, 768019.9 6278380.7 51.7, 768021.8 6278378.7 51.7, 768025.6 6278382.2 51.7))
-BATIMENT0000000211110288;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;1983-01-01;;;;3.0;2.5;1.0;2.0;50.0;10.0;5.2;44.6;49.8;51.4;44.6;Cadastre;A 1.0;POLYGON Z ((768034.4 6278300.5 49.8, 768035.9 6278298.7 49.8, 768037.7 6278300 49.8, 768040.6 6278296.4 49.8, 768036.2 6278292.9 49.8, 768033.5 6278296.1 49.8, 768031.1 6278294.3 49.8, 768028.5 6278294.8 49.8, 768021.7 6278303.3 49.8, 768030.5 6278310.3 49.8, 768033.7 6278306.3 49.8, 768033.1 6278305.8 49.8, 768031.2 6278304.3 49.8, 768034.4 6278300.5 49.8))
-BATIMENT0000000211110290;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;1984-01-01;;;;3.0;1.0;1.0;2.0;90.0;10.0;7.8;45.5;53.3;55.0;46.7;Cadastre;A 1.0;POLYGON Z ((768129.1 6278301.6 53.2, 768127.3 6278303.8 53.2, 768118.9 6278298 53.2, 768113.4 6278305.2 53.2, 768117.1 6278308 53.2, 768115.4 6278310.3 53.2, 768120.3 6278313.8 53.2, 768125.7 6278306.8 53.2, 768128.1 6278308.4 53.2, 768131.8 6278303.5 53.2, 768129.1 6278301.6 53.2))
-BATIMENT0000000211110305;Indifférenciée;Résidentiel;Annexe;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;;;;;3.0;1.0;1.0;2.0;5.0;1.0;6.7;44.8;51.5;52.8;45.3;Cadastre;A 1.0;POLYGON Z ((768124.7 6278258.1 51.5, 768116.3 6278252.2 51.5, 768108.1 6278263.4 51.5, 768114.9 6278268.3 51.5, 768118 6278264 51.5, 768119.5 6278262 51.5, 768121.1 6278263 51.5, 768124.7 6278258.1 51.5))
-BATIMENT0000000211110308;Indifférenciée;Résidentiel;Annexe;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;1989-01-01;;;;3.0;2.5;14.0;5.0;10.0;10.0;13.9;47.4;61.3;62.2;48.4;Cadastre;C 0.7;POLYGON Z ((768237 6278283.2 61.3, 768246 6278277.4 61.3, 768223.9 6278244.7 61.3, 768215.1 6278250.7 61.3, 768237 6278283.2 61.3))
-BATIMENT0000000211110311;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;1983-01-01;;;;3.0;1.0;1.0;2.0;35.0;10.0;5.8;52.2;58.0;59.4;52.7;Cadastre;A 1.0;POLYGON Z ((768193.7 6278388.2 57.9, 768198.9 6278381.2 57.9, 768192.2 6278376.5 57.9, 768187.1 6278383.1 57.9, 768185.4 6278382.9 57.9, 768183.7 6278385.3 57.9, 768182.3 6278385.4 57.9, 768180.7 6278387.6 57.9, 768188.3 6278393.2 57.9, 768192.5 6278387.4 57.9, 768193.7 6278388.2 57.9))
-BATIMENT0000000211110313;Indifférenciée;Résidentiel;Commercial et services;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;1988-01-01;;;;3.0;1.0;1.0;2.0;5.0;1.0;6.2;44.6;50.8;51.6;45.3;Cadastre;A 1.0;POLYGON Z ((768056.5 6278313.6 50.7, 768051.7 6278309.6 50.7, 768050.1 6278311.4 50.7, 768045 6278307.3 50.7, 768039 6278314.6 50.7, 768044.1 6278319 50.7, 768045.3 6278317.5 50.7, 768050 6278321.4 50.7, 768056.5 6278313.6 50.7))
-BATIMENT0000000211110315;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;1983-01-01;;;;3.0;2.5;1.0;1.0;30.0;10.0;2.2;47.9;50.1;52.6;48.8;Cadastre;B 0.5;POLYGON Z ((768173.9 6278305.1 50.1, 768171.1 6278308.9 50.1, 768169.7 6278307.8 50.1, 768167.4 6278310.4 50.1, 768175.8 6278316.5 50.1, 768185.3 6278303.7 50.1, 768178.5 6278298.9 50.1, 768173.9 6278305.1 50.1))
-BATIMENT0000000211110322;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;2001-01-01;;;;3.0;1.0;1.0;2.0;50.0;10.0;7.6;47.2;54.8;55.7;48.9;Cadastre;A 1.0;POLYGON Z ((768059.3 6278374.8 54.7, 768066.9 6278368.3 54.7, 768064 6278364.9 54.7, 768062.3 6278366.3 54.7, 768058.4 6278361.7 54.7, 768055.1 6278357.9 54.7, 768049.2 6278362.9 54.7, 768059.3 6278374.8 54.7))
-BATIMENT0000000211110327;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;1985-01-01;;;;3.0;2.5;1.0;2.0;5.0;1.0;4.8;54.2;59.0;61.1;54.2;Cadastre;A 1.0;POLYGON Z ((768170.1 6278407.8 59, 768168.7 6278409.7 59, 768164.1 6278406.4 59, 768156.8 6278416.3 59, 768163.9 6278421.6 59, 768166.6 6278418.1 59, 768167.2 6278418.5 59, 768173.3 6278410.2 59, 768170.1 6278407.8 59))
-BATIMENT0000000211110335;Indifférenciée;Commercial et services;Résidentiel;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;1984-01-01;;;;3.0;1.0;1.0;1.0;;;6.1;50.8;56.9;57.7;51.4;Cadastre;A 1.0;POLYGON Z ((768225.9 6278335.2 56.9, 768226.9 6278336.1 56.9, 768222.3 6278341.7 56.9, 768217.3 6278347.6 56.9, 768223.3 6278352.5 56.9, 768236.4 6278337.1 56.9, 768229.2 6278331.3 56.9, 768225.9 6278335.2 56.9))
-BATIMENT0000000211110344;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;1984-01-01;;;;3.0;1.0;1.0;2.0;45.0;10.0;7.9;46.6;54.5;56.4;47.9;Cadastre;A 1.0;POLYGON Z ((768139.6 6278325.1 54.4, 768137.8 6278315.4 54.4, 768126.6 6278317.2 54.4, 768126.9 6278319.6 54.4, 768123 6278320.2 54.4, 768124.1 6278327.4 54.4, 768131.9 6278326.2 54.4, 768134 6278325.9 54.4, 768139.6 6278325.1 54.4))
-BATIMENT0000000211110346;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;1983-01-01;;;;3.0;2.5;1.0;1.0;30.0;10.0;4.6;48.6;53.2;55.1;49.8;Cadastre;A 1.0;POLYGON Z ((768199.2 6278314.9 53.2, 768203.6 6278308.8 53.2, 768196.6 6278303.9 53.2, 768192.2 6278309.9 53.2, 768194.6 6278311.7 53.2, 768190.4 6278317.3 53.2, 768197.1 6278322.4 53.2, 768201.4 6278316.6 53.2, 768199.2 6278314.9 53.2))
-BATIMENT0000000211110357;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;2000-01-01;;;;3.0;1.0;1.0;2.0;5.0;1.0;6.8;46.0;52.8;53.8;46.7;Cadastre;A 1.0;POLYGON Z ((768041.5 6278355.8 52.8, 768046.6 6278349.1 52.8, 768043.5 6278346.7 52.8, 768042.4 6278348.2 52.8, 768039.4 6278345.9 52.8, 768034.2 6278342 52.8, 768029.6 6278348.1 52.8, 768037.9 6278354.5 52.8, 768038.5 6278353.6 52.8, 768041.5 6278355.8 52.8))
-BATIMENT0000000211110358;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;2005-01-01;;;;3.0;2.5;1.0;2.0;5.0;1.0;8.5;48.5;57.0;;;Cadastre;A 1.0;POLYGON Z ((768041.4 6278397.5 57, 768049.5 6278389 57, 768044.6 6278384.4 57, 768042.3 6278386.8 57, 768041 6278385.7 57, 768035.3 6278391.7 57, 768036.4 6278392.6 57, 768033.7 6278395.4 57, 768031.9 6278393.7 57, 768030.1 6278395.6 57, 768032 6278397.4 57, 768029.8 6278399.7 57, 768034.8 6278404.5 57, 768038.8 6278400.2 57, 768037.8 6278399.2 57, 768040.4 6278396.5 57, 768041.4 6278397.5 57))
-BATIMENT0000000211110365;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;2001-01-01;;;;3.0;2.5;1.0;2.0;5.0;1.0;3.8;51.2;55.0;57.0;51.2;Cadastre;A 1.0;POLYGON Z ((768075.1 6278388.8 55, 768081.6 6278383.4 55, 768076 6278376.6 55, 768071.4 6278380.4 55, 768069 6278380.1 55, 768066.3 6278376.9 55, 768062.1 6278380.4 55, 768065.6 6278384.6 55, 768067.3 6278384.8 55, 768067 6278387.9 55, 768066.7 6278390.3 55, 768064.3 6278390.1 55, 768063.9 6278394.3 55, 768070.7 6278395.1 55, 768071.2 6278391.2 55, 768070.6 6278391.2 55, 768070.9 6278388.4 55, 768075.1 6278388.8 55))
-BATIMENT0000000211110367;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;2001-01-01;;;;3.0;2.5;1.0;2.0;50.0;10.0;5.5;54.3;59.8;61.7;55.2;Cadastre;A 1.0;POLYGON Z ((768053.4 6278437.7 59.8, 768056.1 6278434.9 59.8, 768057.2 6278435.9 59.8, 768060 6278432.9 59.8, 768049.4 6278423 59.8, 768047.8 6278424.8 59.8, 768047.8 6278427.1 59.8, 768043.4 6278432 59.8, 768043.5 6278433.5 59.8, 768039.7 6278433.7 59.8, 768039.6 6278432.2 59.8, 768033.9 6278426.9 59.8, 768030.3 6278430.7 59.8, 768038.1 6278438 59.8, 768040.1 6278435.8 59.8, 768043.6 6278438.9 59.8, 768044.7 6278438.5 59.8, 768050.1 6278443.3 59.8, 768054.4 6278438.7 59.8, 768053.4 6278437.7 59.8))
-BATIMENT0000000211110368;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;1987-01-01;;;;3.0;1.0;1.0;2.0;5.0;1.0;6.9;51.7;58.6;60.4;53.0;Cadastre;A 1.0;POLYGON Z ((768134.2 6278390.7 58.5, 768133.5 6278391.6 58.5, 768132.2 6278390.6 58.5, 768132.8 6278389.6 58.5, 768128.1 6278386.2 58.5, 768125.6 6278389.4 58.5, 768126.3 6278390 58.5, 768124.2 6278392.7 58.5, 768123.5 6278392.3 58.5, 768121.1 6278395.3 58.5, 768130.1 6278402.1 58.5, 768137.5 6278392.2 58.5, 768134.6 6278390.1 58.5, 768134.2 6278390.7 58.5))
-BATIMENT0000000211110371;Indifférenciée;Résidentiel;Annexe;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;2001-01-01;;;;3.0;2.5;1.0;2.0;5.0;1.0;4.7;53.8;58.5;61.4;54.1;Cadastre;A 1.0;POLYGON Z ((768067.9 6278429.2 58.5, 768075.8 6278420.7 58.5, 768070.6 6278416 58.5, 768067.5 6278419.4 58.5, 768068.3 6278420.2 58.5, 768066.7 6278421.9 58.5, 768061 6278421.3 58.5, 768058 6278418.4 58.5, 768054.3 6278422.2 58.5, 768052.6 6278420.6 58.5, 768050.7 6278418.8 58.5, 768048.5 6278421.2 58.5, 768053.9 6278426.2 58.5, 768055.6 6278424.3 58.5, 768060 6278428.4 58.5, 768067.9 6278429.2 58.5))
-BATIMENT0000000211110372;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;1984-01-01;;;;3.0;1.0;1.0;1.0;50.0;10.0;6.4;52.4;58.8;59.9;53.5;Cadastre;A 1.0;POLYGON Z ((768154.2 6278405 58.8, 768151.9 6278403.3 58.8, 768152.7 6278402 58.8, 768148.8 6278399.3 58.8, 768148.1 6278400.3 58.8, 768145.7 6278398.5 58.8, 768142.9 6278402.1 58.8, 768142.1 6278401.6 58.8, 768137.9 6278407 58.8, 768141.3 6278409.7 58.8, 768140.7 6278410.7 58.8, 768144.6 6278413.7 58.8, 768147.7 6278409.7 58.8, 768149.5 6278411 58.8, 768154.2 6278405 58.8))
-BATIMENT0000000211110374;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;1986-01-01;;;;3.0;1.0;1.0;2.0;5.0;1.0;8.1;46.7;54.8;56.3;48.7;Cadastre;A 1.0;POLYGON Z ((768106.4 6278357.4 54.8, 768115.6 6278356.1 54.8, 768114.6 6278348.3 54.8, 768114 6278344.9 54.8, 768101.9 6278346.5 54.8, 768101.7 6278345.8 54.8, 768098.3 6278343.9 54.8, 768090.9 6278339.3 54.8, 768086.9 6278345.6 54.8, 768096.2 6278351.5 54.8, 768097.3 6278350 54.8, 768099.3 6278351.2 54.8, 768101.4 6278350.9 54.8, 768101.9 6278353.8 54.8, 768105.9 6278353.4 54.8, 768106.4 6278357.4 54.8))
-BATIMENT0000000211110375;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;1985-01-01;;;;3.0;1.0;1.0;2.0;45.0;10.0;6.4;43.9;50.3;51.2;44.6;Cadastre;A 1.0;POLYGON Z ((768093.9 6278252.7 50.3, 768095.4 6278253.9 50.3, 768094 6278255.7 50.3, 768092.4 6278257.8 50.3, 768097.7 6278261.8 50.3, 768104.1 6278253.3 50.3, 768101 6278251 50.3, 768097.6 6278248.5 50.3, 768095 6278246.5 50.3, 768091.6 6278251 50.3, 768093.9 6278252.7 50.3))
-BATIMENT0000000211110376;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;1985-01-01;;;;3.0;1.0;1.0;2.0;50.0;10.0;5.8;44.8;50.6;52.0;45.8;Cadastre;A 1.0;POLYGON Z ((768089 6278308.1 50.5, 768088.3 6278309.1 50.5, 768085.6 6278307.2 50.5, 768081.5 6278312.8 50.5, 768086.1 6278316.1 50.5, 768086.7 6278315.3 50.5, 768088.3 6278316.5 50.5, 768087.8 6278317.3 50.5, 768085.5 6278320.5 50.5, 768092.6 6278325.4 50.5, 768097 6278319.2 50.5, 768093.9 6278317.1 50.5, 768096.5 6278313.2 50.5, 768089 6278308.1 50.5))
-BATIMENT0000000211110377;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;1984-01-01;;;;3.0;1.0;1.0;2.0;50.0;10.0;5.4;45.5;50.9;52.9;46.6;Cadastre;A 1.0;POLYGON Z ((768068.9 6278323 50.9, 768066.6 6278330.1 50.9, 768071.7 6278331.9 50.9, 768070.6 6278334.9 50.9, 768074.4 6278336.5 50.9, 768073.9 6278338 50.9, 768076.2 6278338.9 50.9, 768076.8 6278337.2 50.9, 768080.4 6278338.3 50.9, 768082.7 6278331 50.9, 768077.2 6278328.8 50.9, 768078.2 6278326 50.9, 768068.9 6278323 50.9))
-BATIMENT0000000211110378;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;1982-01-01;;;;3.0;2.5;1.0;2.0;31.0;13.0;5.2;49.6;54.8;57.8;50.4;Cadastre;A 1.0;POLYGON Z ((768216 6278326.2 54.8, 768220.5 6278320.1 54.8, 768213.4 6278314.8 54.8, 768209.8 6278319.8 54.8, 768207.2 6278318 54.8, 768203.4 6278323.4 54.8, 768204.6 6278324.4 54.8, 768206 6278325.5 54.8, 768206.2 6278326.9 54.8, 768204.8 6278327 54.8, 768201.7 6278327.1 54.8, 768202.1 6278331 54.8, 768204.7 6278330.9 54.8, 768205 6278333 54.8, 768211.4 6278332.7 54.8, 768211.3 6278331.6 54.8, 768214.7 6278328 54.8, 768216 6278326.2 54.8))
-BATIMENT0000000211110380;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;1985-01-01;;;;3.0;1.0;2.0;2.0;0.0;0.0;7.8;43.3;51.1;51.5;43.6;Cadastre;A 1.0;POLYGON Z ((768077.3 6278264.1 51.1, 768079.7 6278261.4 51.1, 768078.7 6278257.1 51.1, 768075.5 6278254.6 51.1, 768073 6278257.6 51.1, 768066.5 6278265.4 51.1, 768073.8 6278271.6 51.1, 768076.4 6278268.4 51.1, 768074.9 6278267.1 51.1, 768077.3 6278264.1 51.1))
-BATIMENT0000000211110381;Indifférenciée;Résidentiel;Annexe;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;1983-01-01;;;;3.0;1.0;1.0;2.0;40.0;10.0;6.6;43.3;49.9;50.6;43.9;Cadastre;A 1.0;POLYGON Z ((768060.1 6278286.9 49.8, 768062.7 6278283.8 49.8, 768062.1 6278283.3 49.8, 768063.7 6278281.3 49.8, 768065.6 6278282.9 49.8, 768068.3 6278279.5 49.8, 768065.9 6278277.6 49.8, 768068.9 6278274 49.8, 768065.5 6278271.1 49.8, 768062.5 6278274.7 49.8, 768058.4 6278271.4 49.8, 768050.7 6278280.9 49.8, 768056.8 6278285.6 49.8, 768057.5 6278284.8 49.8, 768060.1 6278286.9 49.8))
-BATIMENT0000000211110382;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;1983-01-01;;;;3.0;2.5;1.0;2.0;50.0;10.0;5.4;51.5;56.9;58.9;52.0;Cadastre;A 1.0;POLYGON Z ((768175 6278379.1 56.9, 768183.4 6278366.5 56.9, 768175.2 6278361.3 56.9, 768171.2 6278367.1 56.9, 768172.1 6278367.7 56.9, 768173.1 6278368.4 56.9, 768172.4 6278369.3 56.9, 768172 6278370 56.9, 768171.6 6278370.6 56.9, 768171.1 6278371.4 56.9, 768170.7 6278371.9 56.9, 768170.3 6278372.5 56.9, 768168.7 6278374.9 56.9, 768175 6278379.1 56.9))
-BATIMENT0000000211110383;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;1985-01-01;;;;3.0;1.0;1.0;2.0;35.0;10.0;7.3;47.5;54.8;56.4;48.8;Cadastre;A 1.0;POLYGON Z ((768140.3 6278341.9 54.7, 768142.5 6278335.1 54.7, 768135.6 6278333.2 54.7, 768134.2 6278336.6 54.7, 768127 6278334.4 54.7, 768125.5 6278339.1 54.7, 768124.5 6278342 54.7, 768134.3 6278345.1 54.7, 768135.5 6278341.8 54.7, 768136 6278340.5 54.7, 768140.3 6278341.9 54.7))
-BATIMENT0000000211110384;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;1983-01-01;;;;3.0;1.0;1.0;2.0;40.0;40.0;8.9;44.4;53.3;54.2;45.1;Cadastre;A 1.0;POLYGON Z ((768105.7 6278288.5 53.3, 768104 6278290.5 53.3, 768101.4 6278288.5 53.3, 768094.5 6278296 53.3, 768093.5 6278295.1 53.3, 768092.4 6278294.2 53.3, 768089.4 6278297.8 53.3, 768098.3 6278305.5 53.3, 768101.6 6278301.8 53.3, 768100.9 6278301.2 53.3, 768107.6 6278293.5 53.3, 768108.3 6278294 53.3, 768112.2 6278289.5 53.3, 768107.9 6278286 53.3, 768105.7 6278288.5 53.3))
-BATIMENT0000000211110385;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;1985-01-01;;;;3.0;1.0;1.0;2.0;90.0;10.0;8.8;49.1;57.9;59.0;50.6;Cadastre;A 1.0;POLYGON Z ((768139.3 6278353.9 57.8, 768133 6278354.7 57.8, 768133.8 6278360.1 57.8, 768132.6 6278360.2 57.8, 768127.1 6278361 57.8, 768127.8 6278366.1 57.8, 768129.6 6278365.9 57.8, 768130 6278369.8 57.8, 768134.1 6278369.2 57.8, 768135.7 6278369 57.8, 768135.9 6278370.8 57.8, 768141.5 6278370 57.8, 768140.7 6278363.7 57.8, 768138.5 6278363.8 57.8, 768138 6278362.9 57.8, 768138.9 6278361.9 57.8, 768138.8 6278359.5 57.8, 768140.1 6278359.3 57.8, 768139.3 6278353.9 57.8))
-BATIMENT0000000211110387;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;1985-01-01;;;;3.0;1.0;1.0;2.0;3.0;1.0;7.3;46.3;53.6;54.2;46.7;Cadastre;A 1.0;POLYGON Z ((768154.3 6278289.4 53.5, 768157 6278285.6 53.5, 768155.1 6278284.2 53.5, 768156.8 6278281.7 53.5, 768149.1 6278276.5 53.5, 768140.6 6278288.4 53.5, 768148.1 6278293.8 53.5, 768148.8 6278293 53.5, 768150.7 6278294.3 53.5, 768152.7 6278291.6 53.5, 768151.6 6278290.8 53.5, 768153.1 6278288.6 53.5, 768154.3 6278289.4 53.5))
-BATIMENT0000000211110388;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;1983-01-01;;;;3.0;2.5;1.0;2.0;30.0;10.0;2.9;45.6;48.5;51.3;46.0;Cadastre;A 1.0;POLYGON Z ((768129.3 6278271.6 48.5, 768130.4 6278272.3 48.5, 768126.4 6278278.1 48.5, 768132.3 6278282.1 48.5, 768139.9 6278271.5 48.5, 768140.6 6278272 48.5, 768142.1 6278269.8 48.5, 768135.1 6278265 48.5, 768133.5 6278267.2 48.5, 768131.6 6278266.1 48.5, 768128.2 6278270.7 48.5, 768129.3 6278271.6 48.5))
-BATIMENT0000000211110389;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;1984-01-01;;;;3.0;1.0;1.0;2.0;35.0;19.0;7.8;49.0;56.8;57.8;50.1;Cadastre;A 1.0;POLYGON Z ((768177.5 6278329.8 56.7, 768173 6278330.6 56.7, 768172.7 6278327.9 56.7, 768164.2 6278329.2 56.7, 768164.7 6278333.6 56.7, 768163.4 6278333.8 56.7, 768164.2 6278340.9 56.7, 768179.6 6278338.8 56.7, 768179.1 6278335.6 56.7, 768178.4 6278335.6 56.7, 768177.5 6278329.8 56.7))
-BATIMENT0000000211110411;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;1983-01-01;;;;3.0;1.0;2.0;2.0;50.0;10.0;5.2;46.5;51.7;52.0;47.8;Cadastre;A 1.0;POLYGON Z ((768436.9 6278431.1 51.6, 768437.8 6278423.2 51.6, 768432.5 6278422.6 51.6, 768425.9 6278421.8 51.6, 768424.7 6278431.1 51.6, 768427.9 6278431.4 51.6, 768428.1 6278430.1 51.6, 768436.9 6278431.1 51.6))
-BATIMENT0000000211110433;Indifférenciée;Résidentiel;Annexe;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;1965-01-01;;;;3.0;2.5;8.0;5.0;0.0;0.0;13.8;44.7;58.5;60.7;46.8;Cadastre;C 0.7;POLYGON Z ((768426.6 6278376.4 58.5, 768509.4 6278385 58.5, 768510.4 6278375.4 58.5, 768427.6 6278366.7 58.5, 768426.6 6278376.4 58.5))
-BATIMENT0000000211110453;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;1984-01-01;;;;3.0;1.0;1.0;2.0;10.0;10.0;6.0;49.5;55.5;57.2;50.6;Cadastre;A 1.0;POLYGON Z ((768382.1 6278432.3 55.5, 768379.6 6278430.5 55.5, 768380.2 6278429.4 55.5, 768374.8 6278425.9 55.5, 768373.5 6278428 55.5, 768372.9 6278427.6 55.5, 768370.2 6278431.8 55.5, 768369.9 6278431.5 55.5, 768365.5 6278438 55.5, 768371.8 6278442.3 55.5, 768372.2 6278441.7 55.5, 768375.8 6278444 55.5, 768379.5 6278438.4 55.5, 768378.5 6278437.7 55.5, 768382.1 6278432.3 55.5))
-BATIMENT0000000211110454;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;1983-01-01;;;;3.0;1.0;1.0;2.0;40.0;10.0;7.5;48.4;55.9;56.7;48.7;Cadastre;A 1.0;POLYGON Z ((768417.3 6278431 55.9, 768417.6 6278423.3 55.9, 768407.8 6278422.9 55.9, 768408 6278417.4 55.9, 768404.3 6278417.2 55.9, 768404.1 6278423.2 55.9, 768403.5 6278423.3 55.9, 768403.2 6278430.7 55.9, 768407.8 6278430.9 55.9, 768407.8 6278431.8 55.9, 768413 6278432 55.9, 768413 6278430.9 55.9, 768417.3 6278431 55.9))
-BATIMENT0000000211110456;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;1988-01-01;;;;3.0;2.5;1.0;2.0;5.0;1.0;5.0;51.2;56.2;59.2;52.3;Cadastre;A 1.0;POLYGON Z ((768351.3 6278467.7 56.2, 768347.2 6278474.3 56.2, 768345.6 6278473.4 56.2, 768343.2 6278477.3 56.2, 768347.4 6278480 56.2, 768347.9 6278479.2 56.2, 768351.6 6278481.4 56.2, 768351 6278482.4 56.2, 768352.9 6278483.5 56.2, 768354.5 6278480.9 56.2, 768355.9 6278481.8 56.2, 768361.1 6278473.9 56.2, 768351.3 6278467.7 56.2))
-BATIMENT0000000211110480;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;1981-01-01;;;;3.0;1.0;1.0;1.0;90.0;10.0;5.2;47.6;52.8;54.0;48.2;Cadastre;A 1.0;POLYGON Z ((768437.8 6278460.4 52.8, 768429.6 6278459.7 52.8, 768429.2 6278464.9 52.8, 768429.1 6278465.6 52.8, 768432.2 6278465.8 52.8, 768432.1 6278468.2 52.8, 768424.1 6278467.6 52.8, 768423.4 6278478 52.8, 768436.4 6278478.9 52.8, 768437.8 6278460.4 52.8))
-BATIMENT0000000211110482;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;1985-01-01;;;;3.0;2.5;1.0;1.0;4.0;1.0;3.8;50.8;54.6;57.3;51.4;Cadastre;A 1.0;POLYGON Z ((768370.2 6278454.2 54.6, 768368.9 6278453.1 54.6, 768370.3 6278451.1 54.6, 768363.5 6278446.5 54.6, 768357.2 6278456 54.6, 768356.4 6278455.5 54.6, 768354.8 6278458.1 54.6, 768363.6 6278464.2 54.6, 768365.4 6278461.4 54.6, 768365.1 6278461.2 54.6, 768364.1 6278460.5 54.6, 768366.8 6278456.4 54.6, 768367.7 6278457 54.6, 768368.2 6278457.2 54.6, 768370.2 6278454.2 54.6))
-BATIMENT0000000211110487;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;1982-01-01;;;;3.0;1.0;1.0;2.0;50.0;10.0;6.5;48.4;54.9;56.6;48.9;Cadastre;A 1.0;POLYGON Z ((768414.5 6278461.9 54.9, 768411.4 6278461.8 54.9, 768411.5 6278460.6 54.9, 768405.7 6278460.4 54.9, 768405.7 6278463.1 54.9, 768402.6 6278463 54.9, 768402.4 6278466.8 54.9, 768403.3 6278466.9 54.9, 768403.1 6278475.9 54.9, 768410.4 6278476.2 54.9, 768410.6 6278471.4 54.9, 768411.9 6278469.6 54.9, 768414.2 6278469.6 54.9, 768414.5 6278461.9 54.9))
-BATIMENT0000000211110502;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;1962-01-01;;;;3.0;2.5;1.0;2.0;50.0;10.0;5.7;45.0;50.7;52.4;45.8;Cadastre;A 1.0;POLYGON Z ((768543.1 6278462.6 50.7, 768537.5 6278468.2 50.7, 768542.4 6278472.9 50.7, 768548 6278467.2 50.7, 768543.1 6278462.6 50.7))
-BATIMENT0000000211110511;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;1982-01-01;;;;3.0;2.5;1.0;2.0;50.0;10.0;5.6;47.3;52.9;54.4;47.3;Cadastre;A 1.0;POLYGON Z ((768457 6278435.7 52.9, 768458.3 6278426.2 52.9, 768454.5 6278425.7 52.9, 768454.4 6278427.2 52.9, 768446 6278426.3 52.9, 768444.8 6278434.2 52.9, 768457 6278435.7 52.9))
-BATIMENT0000000211110512;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;1963-01-01;;;;3.0;2.5;1.0;2.0;50.0;10.0;5.3;44.9;50.2;51.9;45.2;Cadastre;A 1.0;POLYGON Z ((768554.5 6278451 50.2, 768559.3 6278455.8 50.2, 768564.7 6278450.3 50.2, 768562.9 6278448.2 50.2, 768564.3 6278446.9 50.2, 768561.4 6278444 50.2, 768554.5 6278451 50.2))
-BATIMENT0000000211110513;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;1962-01-01;;;;3.0;2.5;1.0;2.0;50.0;10.0;5.5;44.9;50.4;51.9;45.6;Cadastre;A 1.0;POLYGON Z ((768553.5 6278461.6 50.4, 768548.7 6278456.9 50.4, 768543.1 6278462.6 50.4, 768548 6278467.2 50.4, 768553.5 6278461.6 50.4))
-BATIMENT0000000211110515;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;1963-01-01;;;;3.0;2.5;1.0;1.0;50.0;10.0;5.3;44.9;50.2;51.8;45.4;Cadastre;A 1.0;POLYGON Z ((768553.5 6278461.6 50.2, 768559.3 6278455.8 50.2, 768554.5 6278451 50.2, 768548.7 6278456.9 50.2, 768553.5 6278461.6 50.2))
-BATIMENT0000000211110531;Indifférenciée;Résidentiel;Annexe;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;1965-01-01;;;;3.0;2.5;16.0;4.0;50.0;90.0;13.3;42.8;56.1;56.4;43.6;Cadastre;C 0.7;POLYGON Z ((768574 6278369.1 56.1, 768574.8 6278360 56.1, 768584.3 6278360.9 56.1, 768586.3 6278340.9 56.1, 768576.9 6278340 56.1, 768574.9 6278359.4 56.1, 768513.5 6278353.6 56.1, 768512.5 6278363.4 56.1, 768574 6278369.1 56.1))
-BATIMENT0000000211110535;Indifférenciée;Résidentiel;Annexe;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;1981-01-01;;;;3.0;1.0;2.0;2.0;35.0;10.0;8.1;45.0;53.1;53.9;45.6;Cadastre;A 1.0;POLYGON Z ((768492.9 6278424.5 53, 768492.4 6278428.5 53, 768488 6278428 53, 768486.5 6278439.5 53, 768497 6278440.6 53, 768498.5 6278429.4 53, 768497.8 6278429.3 53, 768498.3 6278425.2 53, 768492.9 6278424.5 53))
-BATIMENT0000000211110552;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;1880-01-01;;;;3.0;1.0;2.0;2.0;10.0;10.0;8.6;39.8;48.4;50.1;40.6;Cadastre;C 0.6;POLYGON Z ((768640.7 6278275.7 48.3, 768638.1 6278278.4 48.3, 768644.4 6278285 48.3, 768642.5 6278287.4 48.3, 768647.8 6278291.2 48.3, 768649.3 6278289.6 48.3, 768657.1 6278296.9 48.3, 768665.4 6278287.8 48.3, 768646.2 6278269.8 48.3, 768640.7 6278275.7 48.3))
-BATIMENT0000000211110570;Indifférenciée;Commercial et services;;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;;;;;3.0;2.5;0.0;1.0;;;3.2;44.6;47.8;47.9;44.6;Cadastre;A 1.0;POLYGON Z ((768586.1 6278445.6 47.8, 768591.8 6278441.9 47.8, 768588.1 6278436.1 47.8, 768582.2 6278439.7 47.8, 768586.1 6278445.6 47.8))
-BATIMENT0000000211110585;Indifférenciée;Résidentiel;Annexe;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;1965-01-01;;;;3.0;2.5;12.0;4.0;50.0;90.0;12.6;45.2;57.8;;;Cadastre;C 0.8;POLYGON Z ((768447.3 6278346.9 57.8, 768456.7 6278347.9 57.8, 768460.8 6278309.1 57.8, 768474.2 6278310.5 57.8, 768477.9 6278275 57.8, 768463.3 6278273.6 57.8, 768459.5 6278308.8 57.8, 768451 6278308 57.8, 768447.3 6278346.9 57.8))
-BATIMENT0000000211110620;Indifférenciée;Commercial et services;;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;2008-01-01;;;;3.0;1.0;0.0;1.0;;;5.7;42.1;47.8;48.6;42.5;Cadastre;B 0.2;POLYGON Z ((768652.6 6278410.9 47.7, 768642.7 6278428.6 47.7, 768655.9 6278436.2 47.7, 768666.4 6278418.2 47.7, 768665.4 6278417.7 47.7, 768668.8 6278411.9 47.7, 768674.4 6278415.2 47.7, 768674 6278416.1 47.7, 768691.4 6278426.2 47.7, 768699.1 6278412.9 47.7, 768681.8 6278402.9 47.7, 768678.7 6278401.1 47.7, 768677.7 6278402.9 47.7, 768671.7 6278399.5 47.7, 768669.2 6278403.9 47.7, 768663.8 6278405.3 47.7, 768659.6 6278402.9 47.7, 768656.1 6278408.9 47.7, 768654.3 6278407.8 47.7, 768652.6 6278410.9 47.7))
-BATIMENT0000000211110624;Indifférenciée;Commercial et services;Résidentiel;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;;;;;3.0;2.5;1.0;2.0;;;6.7;44.8;51.5;53.0;44.9;Cadastre;A 1.0;POLYGON Z ((768540.4 6278432.2 51.5, 768540.9 6278427.8 51.5, 768544.5 6278428.2 51.5, 768545.1 6278423.7 51.5, 768538.4 6278422.8 51.5, 768538.1 6278425.2 51.5, 768528.7 6278424.1 51.5, 768528.3 6278427.2 51.5, 768528.2 6278428.1 51.5, 768528.1 6278428.8 51.5, 768528 6278429.6 51.5, 768527.9 6278430.1 51.5, 768527.8 6278431 51.5, 768527.7 6278431.6 51.5, 768527.6 6278432.2 51.5, 768527.5 6278433.1 51.5, 768527.4 6278433.8 51.5, 768527.2 6278434.7 51.5, 768526.7 6278438.8 51.5, 768533.2 6278439.6 51.5, 768533.6 6278436.2 51.5, 768536.5 6278436.4 51.5, 768537.1 6278431.9 51.5, 768540.4 6278432.2 51.5))
-BATIMENT0000000211110625;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;1982-01-01;;;;3.0;2.5;1.0;2.0;50.0;14.0;3.5;46.3;49.8;52.7;46.4;Cadastre;A 1.0;POLYGON Z ((768504.6 6278466.6 49.8, 768497.6 6278466 49.8, 768497.8 6278464.3 49.8, 768492.9 6278463.3 49.8, 768492.8 6278463.6 49.8, 768492.5 6278466.7 49.8, 768488 6278466.2 49.8, 768487.6 6278470.7 49.8, 768490.3 6278471.1 49.8, 768490 6278474 49.8, 768487.2 6278473.7 49.8, 768486.4 6278481.2 49.8, 768492.2 6278481.7 49.8, 768492.7 6278478 49.8, 768497.1 6278478.2 49.8, 768497.4 6278476 49.8, 768498.6 6278476.1 49.8, 768498.7 6278474.2 49.8, 768499.7 6278474.3 49.8, 768499.7 6278473.3 49.8, 768502.3 6278473.5 49.8, 768502.4 6278471.7 49.8, 768504.1 6278471.7 49.8, 768504.6 6278466.6 49.8))
-BATIMENT0000000211110639;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;1962-01-01;;;;3.0;2.5;1.0;2.0;50.0;10.0;5.7;45.8;51.5;52.3;46.3;Cadastre;A 1.0;POLYGON Z ((768566.2 6278474.2 51.5, 768560.5 6278480 51.5, 768565.2 6278484.7 51.5, 768570.9 6278478.9 51.5, 768566.2 6278474.2 51.5))
-BATIMENT0000000211110640;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;1962-01-01;;;;3.0;2.5;1.0;2.0;50.0;10.0;5.6;45.8;51.4;52.7;46.1;Cadastre;A 1.0;POLYGON Z ((768566.2 6278474.2 51.4, 768570.9 6278478.9 51.4, 768576.5 6278473.2 51.4, 768571.8 6278468.5 51.4, 768566.2 6278474.2 51.4))
-BATIMENT0000000211110641;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;1963-01-01;;;;3.0;2.5;1.0;2.0;50.0;10.0;5.5;46.0;51.5;52.7;46.5;Cadastre;A 1.0;POLYGON Z ((768554.9 6278485.6 51.5, 768559.7 6278490.3 51.5, 768565.2 6278484.7 51.5, 768560.5 6278480 51.5, 768554.9 6278485.6 51.5))
-BATIMENT0000000211110658;Indifférenciée;Annexe;;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;;;;;3.0;1.0;0.0;1.0;;;3.4;45.7;49.1;49.5;46.2;Cadastre;C 0.4;POLYGON Z ((768543.7 6278479 49.1, 768539.3 6278474.7 49.1, 768537.5 6278476.9 49.1, 768538.5 6278477.9 49.1, 768537.2 6278479.1 49.1, 768537.6 6278479.5 49.1, 768540.4 6278482.4 49.1, 768543.7 6278479 49.1))
-BATIMENT0000000211110659;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;1963-01-01;;;;3.0;2.5;1.0;2.0;50.0;10.0;5.5;46.1;51.6;52.2;46.3;Cadastre;C 0.5;POLYGON Z ((768527 6278479.4 51.6, 768531.1 6278483.5 51.6, 768532.4 6278484.8 51.6, 768534.5 6278482.7 51.6, 768533.1 6278481.2 51.6, 768536.8 6278477.7 51.6, 768532.6 6278473.6 51.6, 768527 6278479.4 51.6))
-BATIMENT0000000211110661;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;1963-01-01;;;;3.0;2.5;1.0;2.0;50.0;10.0;5.5;46.1;51.6;52.7;46.3;Cadastre;A 1.0;POLYGON Z ((768527 6278479.4 51.6, 768521.5 6278485.1 51.6, 768525.6 6278489.2 51.6, 768531.1 6278483.5 51.6, 768527 6278479.4 51.6))
-BATIMENT0000000211110665;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;1982-01-01;;;;3.0;1.0;1.0;1.0;50.0;10.0;5.7;45.6;51.3;52.1;46.2;Cadastre;A 1.0;POLYGON Z ((768472.7 6278425.9 51.3, 768472.6 6278426.2 51.3, 768466.4 6278425.5 51.3, 768464.9 6278437.4 51.3, 768468.4 6278437.6 51.3, 768468.5 6278437.4 51.3, 768468.5 6278436.3 51.3, 768473.2 6278436.8 51.3, 768473.1 6278437.9 51.3, 768477.5 6278438.2 51.3, 768478.8 6278426.7 51.3, 768472.7 6278425.9 51.3))
-BATIMENT0000000211110669;Indifférenciée;Résidentiel;Annexe;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;1983-01-01;;;;3.0;2.5;2.0;1.0;0.0;0.0;4.2;45.3;49.5;52.2;45.3;Cadastre;A 1.0;POLYGON Z ((768516.6 6278444.6 49.5, 768517.7 6278436.8 49.5, 768516.3 6278436.6 49.5, 768516.5 6278435.3 49.5, 768517.9 6278435.4 49.5, 768519 6278435.6 49.5, 768519.9 6278428.5 49.5, 768516.5 6278428 49.5, 768516.4 6278428.5 49.5, 768516.2 6278430.5 49.5, 768507.9 6278429.3 49.5, 768507.4 6278432.7 49.5, 768504.8 6278432.3 49.5, 768503.3 6278432.1 49.5, 768503.1 6278433.3 49.5, 768502.9 6278435.2 49.5, 768502.4 6278438.5 49.5, 768505.4 6278439 49.5, 768505.5 6278438.5 49.5, 768506.7 6278438.7 49.5, 768506.1 6278442.2 49.5, 768509.6 6278442.7 49.5, 768509.7 6278441.9 49.5, 768512.6 6278442.2 49.5, 768512.5 6278443.9 49.5, 768516.6 6278444.6 49.5))
-BATIMENT0000000211110683;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;1984-01-01;;;;3.0;1.0;1.0;1.0;50.0;10.0;6.2;46.1;52.3;53.9;46.9;Cadastre;A 1.0;POLYGON Z ((768475.8 6278461.6 52.2, 768475.6 6278464 52.2, 768475.4 6278466.3 52.2, 768473.3 6278466.1 52.2, 768473.5 6278463.8 52.2, 768472.1 6278463.7 52.2, 768467.4 6278463.4 52.2, 768466.6 6278471.8 52.2, 768468.3 6278471.9 52.2, 768468 6278475.7 52.2, 768465.9 6278475.5 52.2, 768465.5 6278479.6 52.2, 768474.3 6278480.1 52.2, 768474.4 6278478.1 52.2, 768477.8 6278478.2 52.2, 768479.3 6278461.9 52.2, 768475.8 6278461.6 52.2))
-BATIMENT0000000211110688;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;1984-01-01;;;;3.0;1.0;1.0;2.0;35.0;14.0;7.4;46.9;54.3;55.5;47.5;Cadastre;A 1.0;POLYGON Z ((768457 6278473.3 54.2, 768457.8 6278464.4 54.2, 768452.1 6278464 54.2, 768452.2 6278461.5 54.2, 768445.1 6278460.8 54.2, 768443.9 6278475.2 54.2, 768451.9 6278475.9 54.2, 768452.1 6278473 54.2, 768457 6278473.3 54.2))
-BATIMENT0000000211110690;Indifférenciée;Résidentiel;Annexe;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;1965-01-01;;;;3.0;2.5;14.0;4.0;50.0;90.0;14.2;42.3;56.5;56.7;44.1;Cadastre;C 0.8;POLYGON Z ((768503.6 6278324.4 56.5, 768543.9 6278328.5 56.5, 768543.4 6278335.4 56.5, 768563.1 6278337.5 56.5, 768564.1 6278327.9 56.5, 768544.3 6278325.8 56.5, 768544.9 6278318.5 56.5, 768504.8 6278314.6 56.5, 768507.1 6278292.2 56.5, 768497.2 6278291.2 56.5, 768494.9 6278314.7 56.5, 768504.6 6278315.7 56.5, 768503.6 6278324.4 56.5))
-BATIMENT0000000211110691;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;1961-01-01;;;;3.0;1.0;1.0;2.0;50.0;40.0;6.4;40.4;46.8;47.0;40.7;Cadastre;A 1.0;POLYGON Z ((768749.8 6278462.1 46.8, 768757.9 6278468.2 46.8, 768762.9 6278461.9 46.8, 768752.2 6278453.9 46.8, 768747.6 6278459.7 46.8, 768750.1 6278461.6 46.8, 768749.8 6278462.1 46.8))
-BATIMENT0000000211110694;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;1957-01-01;;;;3.0;1.0;1.0;2.0;20.0;40.0;6.4;40.0;46.4;47.2;40.7;Cadastre;B 0.7;POLYGON Z ((768773.2 6278431.5 46.3, 768775.7 6278425.8 46.3, 768769.1 6278422.8 46.3, 768766.3 6278429.1 46.3, 768768.1 6278430 46.3, 768772.9 6278432.3 46.3, 768773.2 6278431.5 46.3))
-BATIMENT0000000211110697;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;1970-01-01;;;;3.0;1.0;1.0;2.0;20.0;10.0;7.3;40.7;48.0;48.3;41.0;Cadastre;A 1.0;POLYGON Z ((768742.5 6278484 47.9, 768741.3 6278485.4 47.9, 768746.5 6278489.6 47.9, 768747.8 6278487.9 47.9, 768748.6 6278488.7 47.9, 768754.9 6278480.7 47.9, 768748.8 6278476.1 47.9, 768742.5 6278484 47.9))
-BATIMENT0000000211110702;Indifférenciée;Annexe;;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;1960-01-01;;;;3.0;1.0;0.0;1.0;5.0;1.0;1.6;40.6;42.2;42.5;40.9;Cadastre;C 0.3;POLYGON Z ((768720.3 6278402.4 42.2, 768724.5 6278404.6 42.2, 768726.9 6278399.8 42.2, 768723.2 6278397.9 42.2, 768720.3 6278402.4 42.2))
-BATIMENT0000000211110703;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;1959-01-01;;;;3.0;1.0;1.0;1.0;34.0;10.0;5.4;40.8;46.2;46.9;41.0;Cadastre;A 1.0;POLYGON Z ((768748.3 6278424 46.2, 768756.7 6278427.7 46.2, 768761.4 6278417.1 46.2, 768759.2 6278416.1 46.2, 768760.1 6278414.2 46.2, 768753.8 6278411.6 46.2, 768748.3 6278424 46.2))
-BATIMENT0000000211110707;Indifférenciée;Annexe;;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;1953-01-01;;;;5.0;1.0;0.0;1.0;2.0;4.0;2.4;39.0;41.4;41.5;39.1;Cadastre;C 0.4;POLYGON Z ((768815.8 6278434.9 41.3, 768811.9 6278440 41.3, 768816.4 6278443.3 41.3, 768820.7 6278437.4 41.3, 768815.8 6278434.9 41.3))
-BATIMENT0000000211110708;Indifférenciée;Annexe;;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;;;;;5.0;9999.0;0.0;1.0;;;0.0;41.5;;;;Cadastre;C 0.2;POLYGON Z ((768734.4 6278407.5 -1000, 768737.2 6278408.9 -1000, 768739.2 6278404 -1000, 768736.3 6278402.8 -1000, 768734.4 6278407.5 -1000))
-BATIMENT0000000211110711;Indifférenciée;Résidentiel;Commercial et services;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;1900-01-01;;;;3.0;1.0;1.0;2.0;15.0;10.0;7.4;41.0;48.4;48.9;41.4;Cadastre;A 1.0;POLYGON Z ((768724 6278465.2 48.3, 768721.2 6278463.1 48.3, 768712.4 6278474.8 48.3, 768725.3 6278484.5 48.3, 768728.9 6278479.9 48.3, 768725.2 6278477.2 48.3, 768730.7 6278470.1 48.3, 768730.4 6278470 48.3, 768724 6278465.2 48.3))
-BATIMENT0000000211110716;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;1959-01-01;;;;3.0;2.5;1.0;1.0;20.0;10.0;3.2;41.9;45.1;45.9;;Cadastre;A 1.0;POLYGON Z ((768777.5 6278479.6 45.1, 768788.6 6278486 45.1, 768792.5 6278479 45.1, 768795 6278480.4 45.1, 768797 6278476.9 45.1, 768792.1 6278474.2 45.1, 768790.3 6278477.6 45.1, 768781.4 6278472.6 45.1, 768777.5 6278479.6 45.1))
-BATIMENT0000000211110724;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;1956-01-01;;;;3.0;1.0;1.0;1.0;50.0;10.0;6.4;41.6;48.0;48.9;42.3;Cadastre;A 1.0;POLYGON Z ((768691.4 6278485 48, 768696.9 6278489.3 48, 768698.2 6278487.5 48, 768703.3 6278491.4 48, 768708.5 6278484.5 48, 768697.7 6278476.5 48, 768691.4 6278485 48))
-BATIMENT0000000211110729;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;1959-01-01;;;;3.0;1.0;1.0;2.0;35.0;10.0;7.1;39.2;46.3;47.8;39.8;Cadastre;A 1.0;POLYGON Z ((768796.1 6278454.8 46.3, 768797.2 6278452.4 46.3, 768799.4 6278453.5 46.3, 768804.7 6278443.1 46.3, 768794.8 6278438.2 46.3, 768788.6 6278451.1 46.3, 768796.1 6278454.8 46.3))
-BATIMENT0000000211110737;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;1965-01-01;;;;3.0;1.0;1.0;1.0;50.0;10.0;3.6;40.9;44.5;45.5;41.0;Cadastre;C 0.5;POLYGON Z ((768729.6 6278419.4 44.5, 768741.1 6278425.1 44.5, 768744.7 6278418.1 44.5, 768739.4 6278415.5 44.5, 768740.8 6278412.6 44.5, 768737.2 6278410.9 44.5, 768735.8 6278413.7 44.5, 768733.1 6278412.4 44.5, 768729.6 6278419.4 44.5))
-BATIMENT0000000211110747;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;1958-01-01;;;;3.0;1.0;1.0;1.0;50.0;10.0;4.7;42.1;46.8;47.8;42.7;Cadastre;A 0.8;POLYGON Z ((768674.8 6278470.8 46.7, 768677.3 6278472.6 46.7, 768674.9 6278475.8 46.7, 768684.8 6278483.1 46.7, 768689.3 6278477 46.7, 768684.6 6278473.6 46.7, 768685.5 6278472.4 46.7, 768677.8 6278466.5 46.7, 768674.8 6278470.8 46.7))
-BATIMENT0000000211110748;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;1953-01-01;;;;3.0;1.0;1.0;1.0;20.0;10.0;5.5;39.1;44.6;45.4;39.4;Cadastre;C 0.6;POLYGON Z ((768814.4 6278459.5 44.5, 768819.2 6278453.3 44.5, 768811 6278447.1 44.5, 768809.9 6278448.5 44.5, 768807.9 6278446.9 44.5, 768806.8 6278448.6 44.5, 768807.4 6278449.1 44.5, 768804.9 6278452.3 44.5, 768814.4 6278459.5 44.5))
-BATIMENT0000000211110750;Indifférenciée;Résidentiel;Annexe;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;1969-01-01;;;;3.0;1.0;2.0;1.0;0.0;0.0;6.7;39.7;46.4;46.5;40.0;Cadastre;A 1.0;POLYGON Z ((768781.8 6278465.1 46.3, 768797.6 6278471.7 46.3, 768799.2 6278467.9 46.3, 768795.8 6278466.4 46.3, 768796.9 6278463.7 46.3, 768789.8 6278460.7 46.3, 768789.1 6278462.5 46.3, 768783.8 6278460.3 46.3, 768781.8 6278465.1 46.3))
-BATIMENT0000000211110758;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;1958-01-01;;;;3.0;2.5;1.0;2.0;10.0;10.0;2.7;42.1;44.8;46.4;42.1;Cadastre;A 1.0;POLYGON Z ((768709.3 6278433.7 44.8, 768713.7 6278437.1 44.8, 768722.4 6278425.8 44.8, 768715.1 6278420.2 44.8, 768707.7 6278429.7 44.8, 768710.7 6278431.9 44.8, 768709.3 6278433.7 44.8))
-BATIMENT0000000211110759;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;1959-01-01;;;;3.0;1.0;1.0;1.0;10.0;10.0;4.7;41.3;46.0;47.0;41.8;Cadastre;A 1.0;POLYGON Z ((768701.9 6278456.9 46, 768704.5 6278453.7 46, 768701.8 6278451.6 46, 768706.7 6278445.4 46, 768699.5 6278440.1 46, 768692.7 6278448.7 46, 768699.8 6278454.2 46, 768699.3 6278454.9 46, 768701.9 6278456.9 46))
-BATIMENT0000000211110763;Indifférenciée;Commercial et services;Annexe;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;1957-01-01;;;;3.0;2.5;0.0;1.0;;;1.2;41.4;42.6;42.7;41.4;Cadastre;B 0.3;POLYGON Z ((768767.6 6278412 42.6, 768764.6 6278419.1 42.6, 768767.3 6278420.3 42.6, 768768 6278418.8 42.6, 768774 6278421.5 42.6, 768776.5 6278415.7 42.6, 768767.6 6278412 42.6))
-BATIMENT0000000211110777;Indifférenciée;Annexe;;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;1950-01-01;;;;3.0;2.5;0.0;1.0;0.0;0.0;1.9;41.4;43.3;45.3;41.4;Cadastre;A 1.0;POLYGON Z ((768768.7 6278434.4 43.3, 768776.5 6278437.7 43.3, 768778.2 6278433.7 43.3, 768773.2 6278431.5 43.3, 768772.9 6278432.3 43.3, 768768.1 6278430 43.3, 768766.8 6278432.7 43.3, 768769 6278433.6 43.3, 768768.7 6278434.4 43.3))
-BATIMENT0000000211110790;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;1960-01-01;;;;3.0;1.0;1.0;1.0;50.0;10.0;4.7;40.9;45.6;46.1;41.3;Cadastre;C 0.5;POLYGON Z ((768717.8 6278415.4 45.6, 768720.1 6278416.4 45.6, 768719.4 6278417.7 45.6, 768721.8 6278419 45.6, 768722.5 6278417.4 45.6, 768726.5 6278419.5 45.6, 768728.2 6278415.6 45.6, 768727.1 6278414.9 45.6, 768730.2 6278408.2 45.6, 768726.7 6278406.6 45.6, 768726.3 6278407.5 45.6, 768722.5 6278405.7 45.6, 768717.8 6278415.4 45.6))
-BATIMENT0000000211110798;Indifférenciée;Résidentiel;Commercial et services;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;1957-01-01;;;;3.0;1.0;1.0;2.0;0.0;0.0;7.9;40.1;48.0;49.0;40.5;Cadastre;B 0.9;POLYGON Z ((768759.1 6278448.3 47.9, 768768.7 6278452.4 47.9, 768771.1 6278446.9 47.9, 768772.6 6278447.6 47.9, 768774.7 6278442.4 47.9, 768764.6 6278438.3 47.9, 768763.4 6278441.5 47.9, 768762.2 6278441 47.9, 768759.1 6278448.3 47.9))
-BATIMENT0000000211110800;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;1962-01-01;;;;3.0;1.0;1.0;1.0;50.0;10.0;6.6;40.6;47.2;47.8;40.9;Cadastre;A 1.0;POLYGON Z ((768733.8 6278450.7 47.1, 768741.9 6278456.7 47.1, 768742.7 6278455.7 47.1, 768749.2 6278446.9 47.1, 768746.7 6278445.1 47.1, 768749.1 6278441.8 47.1, 768745.9 6278439.5 47.1, 768743.7 6278442.5 47.1, 768741.2 6278440.8 47.1, 768733.8 6278450.7 47.1))
-BATIMENT0000000211110802;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;1956-01-01;;;;3.0;2.5;1.0;1.0;10.0;10.0;3.0;41.1;44.1;46.0;41.1;Cadastre;A 1.0;POLYGON Z ((768807.8 6278468 44.1, 768805.9 6278470.5 44.1, 768810.4 6278474 44.1, 768803 6278483.4 44.1, 768809.5 6278488.4 44.1, 768815.7 6278480.1 44.1, 768813.2 6278478.2 44.1, 768814.8 6278476.2 44.1, 768811.3 6278473.5 44.1, 768812.8 6278471.7 44.1, 768808.9 6278468.7 44.1, 768807.8 6278468 44.1))
-BATIMENT0000000211110811;Indifférenciée;Résidentiel;Annexe;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;;;;;3.0;2.5;59.0;7.0;0.0;0.0;15.9;37.6;53.5;61.3;38.8;Cadastre;C 0.5;POLYGON Z ((768842.7 6278356.4 53.5, 768835.6 6278351.6 53.5, 768834.5 6278350.9 53.5, 768830.5 6278348.1 53.5, 768822.7 6278342.8 53.5, 768817.7 6278339.4 53.5, 768813.6 6278336.5 53.5, 768808.8 6278333.1 53.5, 768803.8 6278329.7 53.5, 768802.2 6278328.6 53.5, 768796.1 6278324.4 53.5, 768790.6 6278320.6 53.5, 768784.1 6278316.1 53.5, 768777.4 6278319.2 53.5, 768771.4 6278322 53.5, 768764.7 6278325.1 53.5, 768762.9 6278325.9 53.5, 768756.4 6278328.9 53.5, 768750.4 6278331.7 53.5, 768742.1 6278335.5 53.5, 768748.4 6278348.7 53.5, 768782.7 6278332.7 53.5, 768804 6278347.4 53.5, 768825.8 6278362.2 53.5, 768834.4 6278368.3 53.5, 768833.6 6278386.6 53.5, 768832.7 6278399.5 53.5, 768832.3 6278409 53.5, 768847 6278410 53.5, 768848 6278391.4 53.5, 768849.6 6278369.5 53.5, 768899.1 6278345.9 53.5, 768902.7 6278299.2 53.5, 768888.2 6278298.1 53.5, 768888.1 6278298.8 53.5, 768887.2 6278309.3 53.5, 768886.6 6278316 53.5, 768886.2 6278321.4 53.5, 768886 6278323.6 53.5, 768885.4 6278331.1 53.5, 768884.9 6278336.7 53.5, 768879.5 6278339.2 53.5, 768877.8 6278340 53.5, 768871 6278343.1 53.5, 768864.4 6278346.1 53.5, 768855.7 6278350.3 53.5, 768850 6278353 53.5, 768842.7 6278356.4 53.5))
-BATIMENT0000000211110814;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;2002-01-01;;;;3.0;2.5;1.0;1.0;50.0;10.0;5.4;39.9;45.3;;;Cadastre;A 1.0;POLYGON Z ((768847.6 6278492.1 45.3, 768855.8 6278479.3 45.3, 768856.7 6278478 45.3, 768851.7 6278474.8 45.3, 768850 6278477.5 45.3, 768849.7 6278477.9 45.3, 768847.9 6278476.7 45.3, 768848.2 6278476.3 45.3, 768841.2 6278471.2 45.3, 768837.9 6278476.3 45.3, 768839 6278477 45.3, 768837.6 6278479.2 45.3, 768843.8 6278483.1 45.3, 768844.2 6278482.5 45.3, 768844.6 6278481.8 45.3, 768846.4 6278483 45.3, 768846 6278483.7 45.3, 768844.6 6278485.8 45.3, 768842.8 6278488.1 45.3, 768847.6 6278492.1 45.3))
-BATIMENT0000000211111515;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;2000-01-01;;;;3.0;1.0;1.0;2.0;3.0;10.0;21.9;52.4;74.3;76.3;56.4;Cadastre;C 0.1;POLYGON Z ((768612.1 6278130.4 74.2, 768624.9 6278131.4 74.2, 768625.1 6278129.7 74.2, 768625.9 6278121.3 74.2, 768621.2 6278121 74.2, 768612.4 6278127.5 74.2, 768612.2 6278129 74.2, 768612.1 6278130.4 74.2))
-BATIMENT0000000211111516;Indifférenciée;Résidentiel;Annexe;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;;;;;3.0;1.0;36.0;6.0;1.0;1.0;18.2;49.4;67.6;73.2;55.7;Cadastre;C 0.2;POLYGON Z ((768543.3 6278190.8 67.6, 768550.1 6278195.4 67.6, 768549.4 6278196.6 67.6, 768555.1 6278200.5 67.6, 768622.2 6278168 67.6, 768624.9 6278131.4 67.6, 768612.1 6278130.4 67.6, 768610.5 6278152.6 67.6, 768611.8 6278152.9 67.6, 768611.1 6278160.6 67.6, 768597.7 6278167 67.6, 768597.1 6278165.8 67.6, 768582.8 6278172.7 67.6, 768583.2 6278173.9 67.6, 768557.3 6278186.5 67.6, 768549.4 6278181.5 67.6, 768543.3 6278190.8 67.6))
-BATIMENT0000000211111517;Indifférenciée;Résidentiel;Annexe;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;;;;;3.0;2.5;40.0;5.0;1.0;1.0;16.0;50.2;66.2;72.9;59.1;Cadastre;C 0.2;POLYGON Z ((768621.2 6278121 66.2, 768625.9 6278121.3 66.2, 768626.2 6278117.8 66.2, 768652.6 6278104.5 66.2, 768663.5 6278111.6 66.2, 768682.2 6278124.1 66.2, 768754.6 6278088.1 66.2, 768756.5 6278055.5 66.2, 768741.8 6278054.9 66.2, 768740.5 6278078.5 66.2, 768682.5 6278107.8 66.2, 768671.2 6278100.1 66.2, 768660.5 6278094.7 66.2, 768660.3 6278094.8 66.2, 768647.9 6278103 66.2, 768636.7 6278110.2 66.2, 768628.9 6278115.4 66.2, 768628.3 6278115.8 66.2, 768626.3 6278117 66.2, 768625.9 6278117.4 66.2, 768623.8 6278119 66.2, 768622.9 6278119.7 66.2, 768621.2 6278121 66.2))
-BATIMENT0000000211111519;Indifférenciée;Résidentiel;Annexe;Non;En service;2008-11-18 15:19:53;2019-04-08 10:00:52;1990-01-01;;;;3.0;1.0;22.0;7.0;36.0;40.0;24.4;53.0;77.4;80.4;59.5;Cadastre;C 0.2;POLYGON Z ((768600.2 6278104.6 77.3, 768613.1 6278113.6 77.3, 768612.6 6278120.4 77.3, 768621.1 6278121 77.3, 768622.9 6278119.7 77.3, 768623.7 6278119 77.3, 768623.8 6278119 77.3, 768625.9 6278117.4 77.3, 768626.3 6278117 77.3, 768628.3 6278115.8 77.3, 768628.9 6278115.4 77.3, 768636.7 6278110.2 77.3, 768647.9 6278103 77.3, 768660.3 6278094.8 77.3, 768651.2 6278089.1 77.3, 768645.5 6278091.8 77.3, 768641.7 6278093.7 77.3, 768637.3 6278095.7 77.3, 768633.1 6278097.6 77.3, 768627.5 6278100.4 77.3, 768623.6 6278102.2 77.3, 768619.5 6278104.1 77.3, 768613.8 6278100.1 77.3, 768606.7 6278094.9 77.3, 768600.2 6278104.6 77.3))
-BATIMENT0000000211115972;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:25:02;2019-04-08 10:00:52;1800-01-01;;;;3.0;2.5;1.0;2.0;9.0;1.0;6.7;40.4;47.1;48.7;40.4;Cadastre;C 0.4;POLYGON Z ((767885.3 6277798.9 47.1, 767899.9 6277816 47.1, 767908.3 6277808.9 47.1, 767896.5 6277795.4 47.1, 767897.8 6277794.2 47.1, 767893.5 6277789.1 47.1, 767889.6 6277792.3 47.1, 767891.1 6277794 47.1, 767885.3 6277798.9 47.1))
-BATIMENT0000000211116367;Indifférenciée;Commercial et services;;Non;En service;2008-11-18 15:25:02;2019-04-08 10:00:52;1991-01-01;;;;3.0;2.5;0.0;1.0;;;11.7;37.0;48.7;;;Cadastre;A 1.0;POLYGON Z ((767981.8 6277906.1 48.7, 767997.3 6277894.9 48.7, 767985.8 6277879.5 48.7, 767970.2 6277890.8 48.7, 767981.8 6277906.1 48.7))
-BATIMENT0000000211116068;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:25:02;2019-04-08 10:00:52;1999-01-01;;;;3.0;2.5;5.0;2.0;3.0;1.0;9.5;41.6;51.1;52.6;44.9;Cadastre;C 0.8;POLYGON Z ((767961 6277841.2 51.1, 767960.6 6277840.6 51.1, 767963 6277838.8 51.1, 767960.4 6277835.3 51.1, 767963.2 6277833.1 51.1, 767964.7 6277831.9 51.1, 767961.1 6277827.2 51.1, 767961 6277827.4 51.1, 767956.8 6277830.5 51.1, 767951.8 6277823.9 51.1, 767956 6277820.8 51.1, 767956.1 6277820.7 51.1, 767952.4 6277815.8 51.1, 767952.3 6277815.8 51.1, 767948.1 6277819 51.1, 767943.1 6277812.4 51.1, 767947.3 6277809.3 51.1, 767943.6 6277804.3 51.1, 767939.4 6277807.5 51.1, 767934.5 6277801 51.1, 767938.6 6277797.8 51.1, 767934.8 6277792.8 51.1, 767934 6277793.3 51.1, 767930.7 6277795.9 51.1, 767927.7 6277792 51.1, 767925.2 6277793.8 51.1, 767922.7 6277795.7 51.1, 767958.6 6277843 51.1, 767959.4 6277842.4 51.1, 767961 6277841.2 51.1))
-BATIMENT0000000211116153;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:25:02;2019-04-08 10:00:52;1999-01-01;;;;3.0;2.5;5.0;2.0;3.0;1.0;7.6;43.3;50.9;52.5;45.8;Cadastre;C 1.0;POLYGON Z ((767984 6277833.8 50.9, 767935.4 6277768.9 50.9, 767931.2 6277772 50.9, 767930.4 6277772.5 50.9, 767932.6 6277775.5 50.9, 767932.2 6277775.7 50.9, 767937.9 6277783.2 50.9, 767938.9 6277782.4 50.9, 767947.7 6277794.3 50.9, 767946.9 6277795 50.9, 767950.1 6277799.2 50.9, 767950.9 6277798.6 50.9, 767959.9 6277810.3 50.9, 767959 6277810.9 50.9, 767979.2 6277837.6 50.9, 767984 6277833.8 50.9))
-BATIMENT0000000211116398;Indifférenciée;Commercial et services;;Non;En service;2008-11-18 15:25:02;2019-04-08 10:00:52;;;;;5.0;1.0;0.0;1.0;;;2.1;37.3;39.4;39.7;37.5;Cadastre;C 1.0;POLYGON Z ((767866.5 6277887.3 39.4, 767868.7 6277889.4 39.4, 767870.8 6277887.3 39.4, 767868.6 6277885.2 39.4, 767866.5 6277887.3 39.4))
-BATIMENT0000000211116368;Indifférenciée;Commercial et services;;Non;En service;2008-11-18 15:25:02;2019-04-08 10:00:52;;;;;3.0;2.5;0.0;1.0;;;6.1;37.0;43.1;;;Cadastre;A 1.0;POLYGON Z ((767991.8 6277943 43.1, 768018.7 6277923.2 43.1, 768004.3 6277903.8 43.1, 767977.4 6277923.8 43.1, 767991.8 6277943 43.1))
-BATIMENT0000000211116377;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:25:02;2019-04-08 10:00:52;1998-01-01;;;;3.0;2.5;8.0;4.0;0.0;0.0;11.2;39.5;50.7;;;Cadastre;C 0.1;POLYGON Z ((767951.5 6277865.7 50.7, 767958.9 6277860.2 50.7, 767955.4 6277855.4 50.7, 767945.8 6277862.6 50.7, 767949.2 6277867.4 50.7, 767951.5 6277865.7 50.7))
-BATIMENT0000000211116395;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:25:02;2019-04-08 10:00:52;1998-01-01;;;;3.0;1.0;7.0;4.0;0.0;0.0;11.4;39.0;50.4;50.7;40.4;Cadastre;C 0.2;POLYGON Z ((767939.1 6277853.2 50.4, 767948.6 6277846.2 50.4, 767944.9 6277841.2 50.4, 767937.8 6277846.5 50.4, 767935.5 6277848.1 50.4, 767939.1 6277853.2 50.4))
-BATIMENT0000000211116396;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:25:02;2019-04-08 10:00:52;1998-01-01;;;;3.0;2.5;8.0;4.0;0.0;0.0;10.2;39.3;49.5;50.7;40.3;Cadastre;C 0.1;POLYGON Z ((767944.2 6277860.4 49.5, 767953.8 6277853.3 49.5, 767950.1 6277848.2 49.5, 767940.6 6277855.3 49.5, 767944.2 6277860.4 49.5))
-BATIMENT0000000211116397;Indifférenciée;Commercial et services;;Non;En service;2008-11-18 15:25:02;2019-04-08 10:00:52;;;;;3.0;2.5;0.0;3.0;;;6.7;38.9;45.6;49.2;38.9;Cadastre;A 1.0;POLYGON Z ((768021.6 6277992.3 45.6, 768024.2 6277988.9 45.6, 768023.9 6277988.4 45.6, 768027.9 6277985.5 45.6, 768028.1 6277985.9 45.6, 768052.5 6277968.1 45.6, 768034.1 6277943.3 45.6, 768010.9 6277960.5 45.6, 768014.8 6277965.8 45.6, 767997.8 6277978.2 45.6, 768007.1 6277985.7 45.6, 768009.7 6277989.1 45.6, 768011.8 6277987.8 45.6, 768015.1 6277989.2 45.6, 768014.3 6277987.1 45.6, 768016.6 6277985.5 45.6, 768021.6 6277992.3 45.6))
-BATIMENT0000000211116399;Indifférenciée;Commercial et services;;Non;En service;2008-11-18 15:25:02;2019-04-08 10:00:52;;;;;5.0;1.0;0.0;1.0;;;2.8;37.4;40.2;40.6;37.5;Cadastre;C 0.2;POLYGON Z ((767960 6277959.8 40.2, 767962.7 6277959.1 40.2, 767960.6 6277953.3 40.2, 767957.9 6277954.2 40.2, 767960 6277959.8 40.2))
-BATIMENT0000000211116401;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:25:02;2019-04-08 10:00:52;1999-01-01;;;;3.0;2.5;3.0;2.0;3.0;1.0;7.3;43.6;50.9;51.9;46.7;Cadastre;C 0.9;POLYGON Z ((768006.7 6277843.6 50.9, 768005.1 6277841.4 50.9, 768005.6 6277841 50.9, 767994.3 6277826 50.9, 767984.3 6277833.5 50.9, 767986.1 6277835.9 50.9, 767990.6 6277832.6 50.9, 767991.8 6277834.2 50.9, 767991.4 6277834.4 50.9, 767994.1 6277837.9 50.9, 767994.4 6277837.6 50.9, 767995.6 6277839.2 50.9, 767991.1 6277842.6 50.9, 767994.7 6277847.3 50.9, 767999.1 6277843.9 50.9, 768000.3 6277845.5 50.9, 768000 6277845.8 50.9, 768001.4 6277847.6 50.9, 768003.9 6277845.8 50.9, 768004.4 6277846.4 50.9, 768006.8 6277844.6 50.9, 768006.3 6277843.9 50.9, 768006.7 6277843.6 50.9))
-BATIMENT0000000211116402;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:25:02;2019-04-08 10:00:52;1998-01-01;;;;3.0;2.5;8.0;4.0;0.0;0.0;12.9;36.3;49.2;50.0;39.4;Cadastre;C 0.5;POLYGON Z ((767924.8 6277881.9 49.2, 767930.7 6277874 49.2, 767931.6 6277872.8 49.2, 767926.7 6277869.2 49.2, 767924.6 6277867.6 49.2, 767919.6 6277863.9 49.2, 767918.8 6277864.9 49.2, 767916.6 6277868 49.2, 767913.1 6277872.8 49.2, 767917.8 6277876.8 49.2, 767917.9 6277876.6 49.2, 767919.9 6277878.1 49.2, 767919.8 6277878.3 49.2, 767924.8 6277881.9 49.2))
-BATIMENT0000000211116506;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:25:44;2019-04-08 10:00:52;1999-01-01;;;;3.0;1.0;1.0;2.0;5.0;1.0;4.7;44.6;49.3;51.5;45.8;Cadastre;A 1.0;POLYGON Z ((768032.9 6277828.5 49.2, 768031.8 6277825.7 49.2, 768033.3 6277825 49.2, 768031.8 6277821.5 49.2, 768027.4 6277823.3 49.2, 768026.5 6277821.2 49.2, 768024.8 6277821.9 49.2, 768023.5 6277822.5 49.2, 768021.2 6277817 49.2, 768017.1 6277818.7 49.2, 768019.5 6277824.4 49.2, 768020.5 6277824 49.2, 768022.8 6277829.4 49.2, 768023.4 6277829.2 49.2, 768024.6 6277831.9 49.2, 768032.9 6277828.5 49.2))
-BATIMENT0000000211116520;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:25:44;2019-04-08 10:00:52;2000-01-01;;;;3.0;1.0;1.0;1.0;30.0;10.0;4.1;44.7;48.8;49.6;45.1;Cadastre;A 1.0;POLYGON Z ((768039.7 6277820.9 48.8, 768048.4 6277817.2 48.8, 768044.4 6277807.7 48.8, 768035.5 6277811.4 48.8, 768039.7 6277820.9 48.8))
-BATIMENT0000000211116532;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:25:44;2019-04-08 10:00:52;2000-01-01;;;;3.0;2.5;1.0;1.0;1.0;1.0;4.5;45.7;50.2;51.4;46.3;Cadastre;A 1.0;POLYGON Z ((768104.5 6277821.2 50.2, 768101.5 6277822.5 50.2, 768099.9 6277823.2 50.2, 768095.2 6277825.2 50.2, 768099.6 6277835.7 50.2, 768108.9 6277831.7 50.2, 768104.5 6277821.2 50.2))
-BATIMENT0000000211116575;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:25:44;2019-04-08 10:00:52;2000-01-01;;;;3.0;2.5;1.0;2.0;50.0;10.0;5.8;46.9;52.7;53.4;46.9;Cadastre;A 1.0;POLYGON Z ((768161.2 6277817.9 52.7, 768168 6277814.8 52.7, 768169.1 6277817.1 52.7, 768172.2 6277815.7 52.7, 768171.9 6277815 52.7, 768170 6277810.7 52.7, 768167 6277812.1 52.7, 768164.5 6277806.5 52.7, 768161.4 6277807.9 52.7, 768160.9 6277806.8 52.7, 768157 6277808.6 52.7, 768161.2 6277817.9 52.7))
-BATIMENT0000000211116576;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:25:44;2019-04-08 10:00:52;2000-01-01;;;;3.0;2.5;1.0;2.0;3.0;1.0;5.3;46.9;52.2;;;Cadastre;A 1.0;POLYGON Z ((768171.9 6277815 52.2, 768180.1 6277811.3 52.2, 768176.9 6277804.3 52.2, 768176.1 6277802.4 52.2, 768167.9 6277806.1 52.2, 768170 6277810.7 52.2, 768171.9 6277815 52.2))
-BATIMENT0000000211116622;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:25:44;2019-04-08 10:00:52;1999-01-01;;;;3.0;2.5;1.0;2.0;5.0;1.0;6.3;45.4;51.7;52.8;45.4;Cadastre;A 1.0;POLYGON Z ((768137.8 6277830.2 51.7, 768145.9 6277826.5 51.7, 768144.3 6277823.1 51.7, 768143.2 6277820.7 51.7, 768138.2 6277823 51.7, 768137.7 6277822 51.7, 768137.3 6277821 51.7, 768134.3 6277822.3 51.7, 768137.8 6277830.2 51.7))
-BATIMENT0000000211116623;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:25:44;2019-04-08 10:00:52;2000-01-01;;;;3.0;2.5;1.0;1.0;5.0;1.0;5.2;45.4;50.6;51.8;45.5;Cadastre;A 1.0;POLYGON Z ((768149.4 6277827.1 50.6, 768156.8 6277823.7 50.6, 768152.4 6277814.1 50.6, 768147.5 6277816.3 50.6, 768145.2 6277817.4 50.6, 768144.7 6277816.3 50.6, 768141.8 6277817.6 50.6, 768142.8 6277819.7 50.6, 768143.2 6277820.7 50.6, 768144.3 6277823.1 50.6, 768147.1 6277821.9 50.6, 768149.4 6277827.1 50.6))
-BATIMENT0000000211116625;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:25:44;2019-04-08 10:00:52;2002-01-01;;;;3.0;2.5;1.0;1.0;0.0;0.0;6.3;45.4;51.7;52.3;46.4;Cadastre;A 1.0;POLYGON Z ((768128.2 6277837.5 51.7, 768138.9 6277832.7 51.7, 768137.8 6277830.2 51.7, 768134.3 6277822.3 51.7, 768130.9 6277814.8 51.7, 768125.6 6277817.1 51.7, 768128.1 6277822.6 51.7, 768129.5 6277825.8 51.7, 768125.9 6277827.4 51.7, 768125.4 6277826.2 51.7, 768123.5 6277827 51.7, 768128.2 6277837.5 51.7))
-BATIMENT0000000211116665;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:25:44;2019-04-08 10:00:52;1999-01-01;;;;3.0;1.0;1.0;2.0;5.0;1.0;5.1;44.7;49.8;52.0;45.3;Cadastre;A 1.0;POLYGON Z ((768051.5 6277817.4 49.7, 768055.3 6277815.8 49.7, 768055 6277815.1 49.7, 768054.4 6277813.6 49.7, 768057.1 6277812.5 49.7, 768057.7 6277813.9 49.7, 768058.7 6277816.1 49.7, 768062.4 6277814.5 49.7, 768057.7 6277803.7 49.7, 768047.5 6277808.1 49.7, 768051.5 6277817.4 49.7))
-BATIMENT0000000211116683;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:25:44;2019-04-08 10:00:52;2000-01-01;;;;3.0;2.5;1.0;2.0;20.0;10.0;5.8;45.7;51.5;53.2;46.4;Cadastre;A 1.0;POLYGON Z ((768109.2 6277832.6 51.5, 768118.4 6277828.7 51.5, 768114.4 6277819.2 51.5, 768108.9 6277821.6 51.5, 768108.1 6277819.7 51.5, 768104.5 6277821.2 51.5, 768108.9 6277831.7 51.5, 768109.2 6277832.6 51.5))
-BATIMENT0000000211116686;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:25:44;2019-04-08 10:00:52;2000-01-01;;;;3.0;1.0;1.0;1.0;50.0;10.0;5.4;44.7;50.1;51.0;45.8;Cadastre;A 1.0;POLYGON Z ((768069.7 6277815.1 50, 768075.9 6277812.4 50, 768074.8 6277809.9 50, 768074.4 6277809 50, 768076 6277808.3 50, 768076.4 6277809.2 50, 768077.3 6277811.2 50, 768080.1 6277810 50, 768076.5 6277801.6 50, 768075.1 6277798.5 50, 768072.3 6277799.7 50, 768072.6 6277800.2 50, 768069.8 6277801.4 50, 768066.7 6277800.1 50, 768065.2 6277804.4 50, 768069.7 6277815.1 50))
-BATIMENT0000000211116751;Indifférenciée;Résidentiel;Annexe;Non;En service;2008-11-18 15:25:44;2019-04-08 10:00:52;1993-01-01;;;;3.0;1.0;2.0;2.0;0.0;0.0;6.3;48.5;54.8;55.8;48.7;Cadastre;A 1.0;POLYGON Z ((768256.2 6277821.3 54.7, 768261.7 6277825.4 54.7, 768264.3 6277821.8 54.7, 768265.4 6277822.6 54.7, 768275 6277809.7 54.7, 768268.6 6277804.9 54.7, 768256.2 6277821.3 54.7))
-BATIMENT0000000211116753;Indifférenciée;Commercial et services;;Non;En service;2008-11-18 15:25:44;2019-04-08 10:00:52;;;;;3.0;2.5;0.0;4.0;;;10.2;49.3;59.5;59.9;49.3;Cadastre;A 1.0;POLYGON Z ((768291.9 6277818.3 59.5, 768305.9 6277810.5 59.5, 768294 6277789.2 59.5, 768280.3 6277796.8 59.5, 768286.6 6277807.9 59.5, 768287.3 6277809.3 59.5, 768291.9 6277818.3 59.5))
-BATIMENT0000000211116837;Indifférenciée;Indifférencié;;Non;En service;2008-11-18 15:25:44;2019-04-08 10:00:52;1979-01-01;;;;5.0;1.0;0.0;1.0;;;2.7;51.3;54.0;54.5;51.5;Cadastre;C 0.2;POLYGON Z ((768560.4 6277824.4 54, 768561.3 6277822.8 54, 768559.4 6277821.9 54, 768556.8 6277820.6 54, 768555 6277824.4 54, 768559.5 6277826.5 54, 768560.4 6277824.4 54))
-BATIMENT0000000211116839;Indifférenciée;Résidentiel;Annexe;Non;En service;2008-11-18 15:25:44;2019-04-08 10:00:52;1968-01-01;;;;3.0;2.5;16.0;6.0;30.0;40.0;15.4;54.0;69.4;69.8;54.0;Cadastre;C 0.3;POLYGON Z ((768661 6277820.4 69.4, 768661 6277810 69.4, 768652.1 6277810 69.4, 768652.1 6277806.1 69.4, 768640 6277806.3 69.4, 768640.1 6277817.7 69.4, 768636.6 6277817.7 69.4, 768636.7 6277828 69.4, 768645.7 6277828 69.4, 768645.7 6277832 69.4, 768657.7 6277831.7 69.4, 768657.5 6277820.3 69.4, 768661 6277820.4 69.4))
-BATIMENT0000000211116851;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:25:44;2019-04-08 10:00:52;1980-01-01;;;;3.0;2.5;77.0;7.0;30.0;40.0;20.5;52.5;73.0;;;Cadastre;C 0.6;POLYGON Z ((768574.8 6277813.9 73, 768589 6277818.3 73, 768590.6 6277813 73, 768593.1 6277813.7 73, 768595.1 6277807.7 73, 768592.2 6277806.7 73, 768593.2 6277803.6 73, 768596 6277804.6 73, 768598.1 6277798.4 73, 768597.5 6277798.2 73, 768598.6 6277794.9 73, 768600.2 6277795.5 73, 768602.1 6277789.4 73, 768600.3 6277788.8 73, 768603.2 6277779.5 73, 768595.4 6277777 73, 768598.3 6277768.3 73, 768600.2 6277768.9 73, 768602.1 6277762.7 73, 768600.7 6277762.2 73, 768601.6 6277759.1 73, 768611.8 6277762.2 73, 768614.2 6277754.9 73, 768611.1 6277753.7 73, 768611.8 6277751.4 73, 768605.7 6277749.4 73, 768605 6277751.5 73, 768601.7 6277750.4 73, 768602.6 6277747.3 73, 768596.9 6277745.5 73, 768596.7 6277746.3 73, 768593.1 6277745.2 73, 768594.4 6277740.1 73, 768587.1 6277738 73, 768586.1 6277741.4 73, 768584.1 6277740.7 73, 768582.2 6277746.9 73, 768583.6 6277747.2 73, 768582.8 6277750.4 73, 768573.4 6277747.3 73, 768570.9 6277755.1 73, 768576.7 6277756.8 73, 768576.1 6277759.2 73, 768581.8 6277760.9 73, 768581.5 6277761.9 73, 768590.9 6277764.9 73, 768587.8 6277774.7 73, 768585.7 6277774 73, 768583.9 6277780.1 73, 768585.6 6277780.6 73, 768584.4 6277783.8 73, 768581.6 6277782.9 73, 768579.8 6277789 73, 768580.5 6277789.2 73, 768579.3 6277792.5 73, 768578.6 6277792.2 73, 768576.8 6277798.3 73, 768579.7 6277799.2 73, 768578.8 6277802.5 73, 768575.7 6277801.6 73, 768573.7 6277807.5 73, 768576.4 6277808.4 73, 768574.8 6277813.9 73))
-BATIMENT0000000211116852;Indifférenciée;Résidentiel;Annexe;Non;En service;2008-11-18 15:25:44;2019-04-08 10:00:52;;;;;3.0;2.5;37.0;7.0;30.0;40.0;18.4;50.6;69.0;70.9;53.4;Cadastre;C 0.2;POLYGON Z ((768553.4 6277804.6 69, 768557.7 6277790.5 69, 768554.6 6277789.5 69, 768555.2 6277787.5 69, 768549.2 6277785.7 69, 768549.6 6277783.6 69, 768534.3 6277779 69, 768533.9 6277780 69, 768524.7 6277777.4 69, 768524.2 6277779.1 69, 768520.1 6277777.5 69, 768521.8 6277771.3 69, 768519.4 6277770.5 69, 768521 6277765 69, 768506.9 6277760.7 69, 768505.3 6277766.3 69, 768502.7 6277765.6 69, 768500.8 6277771.7 69, 768501.4 6277772 69, 768500.3 6277775.3 69, 768499.7 6277775.2 69, 768497.8 6277781 69, 768500.8 6277782 69, 768499.8 6277785.3 69, 768495.3 6277784.1 69, 768492.6 6277792.8 69, 768480 6277789.1 69, 768475.8 6277802.3 69, 768478.1 6277802.9 69, 768477.3 6277805.9 69, 768476.7 6277805.8 69, 768471.2 6277824.6 69, 768490.7 6277830.3 69, 768496.4 6277812 69, 768495.6 6277811.7 69, 768496.5 6277808.2 69, 768497.2 6277808.5 69, 768498.1 6277805.2 69, 768499.3 6277805.5 69, 768502 6277796.1 69, 768504.9 6277796.9 69, 768507.1 6277789.8 69, 768529.1 6277796.3 69, 768528.6 6277798.5 69, 768543.9 6277803 69, 768544.1 6277801.9 69, 768553.4 6277804.6 69))
-BATIMENT0000000211116928;Indifférenciée;Annexe;;Non;En service;2008-11-18 15:25:44;2019-04-08 10:00:52;1963-01-01;;;;5.0;1.0;0.0;1.0;0.0;0.0;3.6;50.2;53.8;55.7;52.7;Cadastre;C 0.3;POLYGON Z ((768788.8 6277827.3 53.7, 768792.1 6277824.4 53.7, 768789.5 6277821.5 53.7, 768787.8 6277823 53.7, 768785.7 6277820.7 53.7, 768784.2 6277822.2 53.7, 768788.8 6277827.3 53.7))
-BATIMENT0000000211116936;Indifférenciée;Annexe;;Non;En service;2008-11-18 15:25:44;2019-04-08 10:00:52;;;;;5.0;1.0;0.0;1.0;;;2.4;54.8;57.2;57.3;55.3;Cadastre;C 0.4;POLYGON Z ((768747.7 6277825.4 57.2, 768750.2 6277822 57.2, 768745.4 6277817.9 57.2, 768745.5 6277818.3 57.2, 768743.1 6277821.6 57.2, 768747.7 6277825.4 57.2))
-BATIMENT0000000211116972;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:25:44;2019-04-08 10:00:52;1964-01-01;;;;3.0;2.5;1.0;1.0;50.0;10.0;3.7;55.7;59.4;60.7;56.0;Cadastre;C 0.8;POLYGON Z ((768745.8 6277812 59.4, 768751 6277804.5 59.4, 768744 6277799.7 59.4, 768740.3 6277805.1 59.4, 768735.6 6277801.8 59.4, 768733.4 6277805.3 59.4, 768742.5 6277811.7 59.4, 768743.5 6277810.4 59.4, 768745.8 6277812 59.4))
-BATIMENT0000000211116990;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:25:44;2019-04-08 10:00:52;1992-01-01;;;;3.0;2.5;1.0;1.0;3.0;1.0;3.6;53.7;57.3;58.3;54.2;Cadastre;A 1.0;POLYGON Z ((768768.5 6277832.3 57.3, 768775.8 6277821.4 57.3, 768768.4 6277816.3 57.3, 768761 6277827.2 57.3, 768768.5 6277832.3 57.3))
-BATIMENT0000000211116994;Indifférenciée;Résidentiel;Annexe;Non;En service;2008-11-18 15:25:44;2019-04-08 10:00:52;1974-01-01;;;;3.0;2.5;16.0;4.0;30.0;30.0;12.5;56.0;68.5;69.0;56.0;Cadastre;C 0.4;POLYGON Z ((768731.1 6277830.5 68.5, 768730.7 6277820.3 68.5, 768722 6277820.5 68.5, 768721.9 6277816.6 68.5, 768709.6 6277816.9 68.5, 768709.9 6277828.4 68.5, 768706.3 6277828.4 68.5, 768706.6 6277838 68.5, 768715.4 6277837.8 68.5, 768715.5 6277841.9 68.5, 768727.8 6277841.6 68.5, 768727.4 6277830.6 68.5, 768731.1 6277830.5 68.5))
-BATIMENT0000000211117046;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:25:44;2019-04-08 10:00:52;1963-01-01;;;;3.0;2.5;1.0;2.0;40.0;10.0;3.2;50.8;54.0;56.9;52.6;Cadastre;C 0.6;POLYGON Z ((768805.1 6277815.3 54, 768815.9 6277810.1 54, 768812.5 6277802.9 54, 768806.8 6277796.6 54, 768803.1 6277800.5 54, 768801.3 6277802.5 54, 768795.6 6277809.2 54, 768795.7 6277809.3 54, 768797 6277810.7 54, 768800.2 6277809.5 54, 768802.5 6277813.4 54, 768803.4 6277812.5 54, 768805.1 6277815.3 54))
-BATIMENT0000000211117048;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:25:44;2019-04-08 10:00:52;1979-01-01;;;;3.0;2.5;1.0;2.0;40.0;10.0;5.4;49.6;55.0;57.5;50.7;Cadastre;A 1.0;POLYGON Z ((768806.2 6277834 55, 768809 6277832.6 55, 768813.5 6277830.3 55, 768815 6277829.5 55, 768813.4 6277826.3 55, 768811.4 6277822.5 55, 768808.3 6277824 55, 768806.5 6277820.5 55, 768794.6 6277826.4 55, 768798.4 6277833.8 55, 768804.3 6277830.9 55, 768805 6277832.3 55, 768803 6277833.3 55, 768804.1 6277835.1 55, 768806.2 6277834 55))
-BATIMENT0000000211117178;Indifférenciée;Commercial et services;;Non;En service;2008-11-18 15:25:44;2019-04-08 10:00:52;1991-01-01;;;;3.0;2.5;0.0;2.0;;;5.1;38.9;44.0;46.8;39.8;Cadastre;A 1.0;POLYGON Z ((768026.1 6277905.4 44, 768048.9 6277905.4 44, 768049 6277872.2 44, 768026.2 6277872.1 44, 768026.1 6277905.4 44))
-BATIMENT0000000211117179;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:25:44;2019-04-08 10:00:52;2000-01-01;;;;3.0;2.5;1.0;2.0;5.0;1.0;7.8;42.2;50.0;52.2;44.6;Cadastre;A 1.0;POLYGON Z ((768034.8 6277847.1 50, 768039.7 6277845.1 50, 768045.9 6277842.5 50, 768044.5 6277839.1 50, 768042.3 6277840 50, 768040.8 6277836.5 50, 768039.7 6277836.9 50, 768038.8 6277834.8 50, 768036.8 6277830.1 50, 768029 6277833.3 50, 768033.4 6277843.9 50, 768034.8 6277847.1 50))
-BATIMENT0000000211117185;Indifférenciée;Commercial et services;;Non;En service;2008-11-18 15:25:44;2019-04-08 10:00:52;;;;;3.0;2.5;0.0;1.0;;;6.2;43.5;49.7;;;Cadastre;A 1.0;POLYGON Z ((768138.2 6277882 49.7, 768136.9 6277879.2 49.7, 768151 6277872.3 49.7, 768152.3 6277875 49.7, 768157.7 6277885.9 49.7, 768171.7 6277878.8 49.7, 768156.4 6277847.3 49.7, 768099.1 6277875.3 49.7, 768110.7 6277899.2 49.7, 768139.6 6277884.9 49.7, 768138.2 6277882 49.7))
-BATIMENT0000000211117192;Indifférenciée;Commercial et services;;Non;En service;2008-11-18 15:25:44;2019-04-08 10:00:52;1991-01-01;;;;3.0;2.5;0.0;1.0;;;8.2;40.0;48.2;49.6;40.0;Cadastre;A 1.0;POLYGON Z ((768068.2 6277954.4 48.2, 768099.5 6277931.5 48.2, 768090.3 6277918.9 48.2, 768059 6277941.6 48.2, 768068.2 6277954.4 48.2))
-BATIMENT0000000211117193;Indifférenciée;Indifférencié;;Non;En service;2008-11-18 15:25:44;2019-04-08 10:00:52;1984-01-01;;;;5.0;1.0;0.0;1.0;;;2.0;38.8;40.8;41.5;38.9;Cadastre;A 0.2;POLYGON Z ((768051 6277923.1 40.8, 768053.5 6277922.5 40.8, 768052.6 6277918.4 40.8, 768050.2 6277919 40.8, 768051 6277923.1 40.8))
-BATIMENT0000000211117195;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:25:44;2019-04-08 10:00:52;2001-01-01;;;;3.0;2.5;1.0;2.0;5.0;1.0;8.7;42.2;50.9;51.5;44.2;Cadastre;A 1.0;POLYGON Z ((768042 6277856.6 50.9, 768049.4 6277853.3 50.9, 768047.9 6277849.6 50.9, 768046.3 6277845.8 50.9, 768047.4 6277845.3 50.9, 768046.3 6277842.6 50.9, 768046.2 6277842.4 50.9, 768045.9 6277842.5 50.9, 768039.7 6277845.1 50.9, 768040.9 6277848.1 50.9, 768038.8 6277849 50.9, 768042 6277856.6 50.9))
-BATIMENT0000000211117197;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:25:44;2019-04-08 10:00:52;2001-01-01;;;;3.0;2.5;1.0;2.0;50.0;10.0;7.3;44.3;51.6;51.7;46.1;Cadastre;A 1.0;POLYGON Z ((768084.6 6277841.9 51.6, 768092.2 6277838.7 51.6, 768088.8 6277830.6 51.6, 768087.9 6277831 51.6, 768084.3 6277832.5 51.6, 768083.8 6277831.3 51.6, 768083.6 6277830.8 51.6, 768080.4 6277832.1 51.6, 768084.6 6277841.9 51.6))
-BATIMENT0000000211117198;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:25:44;2019-04-08 10:00:52;2001-01-01;;;;3.0;2.5;1.0;1.0;30.0;10.0;5.4;44.3;49.7;52.3;45.5;Cadastre;A 1.0;POLYGON Z ((768075.5 6277851.2 49.7, 768085.1 6277847.1 49.7, 768082 6277839.6 49.7, 768075.5 6277842.3 49.7, 768075 6277841.2 49.7, 768071.9 6277842.5 49.7, 768075.5 6277851.2 49.7))
-BATIMENT0000000211117199;Industriel, agricole ou commercial;Commercial et services;;Non;En service;2008-11-18 15:25:44;2019-04-08 10:00:52;;;;;3.0;2.5;0.0;1.0;;;6.1;45.0;51.1;;;Cadastre;A 0.3;POLYGON Z ((768182 6277879.7 51.1, 768220.1 6277860.8 51.1, 768218.3 6277857.3 51.1, 768207.8 6277836.1 51.1, 768205.8 6277832 51.1, 768169.9 6277849.9 51.1, 768180.7 6277871.5 51.1, 768181.7 6277873.6 51.1, 768179.6 6277874.6 51.1, 768182 6277879.7 51.1))
-BATIMENT0000000211117200;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:25:44;2019-04-08 10:00:52;2000-01-01;;;;3.0;2.5;1.0;2.0;50.0;10.0;7.3;43.0;50.3;51.4;44.1;Cadastre;A 1.0;POLYGON Z ((768060 6277858.7 50.3, 768072.4 6277853.4 50.3, 768069 6277845.4 50.3, 768065.5 6277846.8 50.3, 768066.3 6277848.5 50.3, 768066.6 6277849.5 50.3, 768062.4 6277851.2 50.3, 768062.1 6277850.3 50.3, 768061.7 6277849.5 50.3, 768061.3 6277848.6 50.3, 768061.1 6277848.2 50.3, 768056.4 6277850.2 50.3, 768060 6277858.7 50.3))
-BATIMENT0000000211117211;Indifférenciée;Résidentiel;Annexe;Non;En service;2008-11-18 15:25:44;2019-04-08 10:00:52;1992-01-01;;;;3.0;2.5;11.0;3.0;10.0;10.0;8.6;45.6;54.2;54.5;46.5;Cadastre;A 1.0;POLYGON Z ((768333.9 6277944.1 54.2, 768341.1 6277938.5 54.2, 768335 6277930.5 54.2, 768332.6 6277932.3 54.2, 768333.5 6277933.4 54.2, 768331.1 6277935.2 54.2, 768330.3 6277934.2 54.2, 768327.7 6277936.2 54.2, 768326.9 6277935.2 54.2, 768319.7 6277940.7 54.2, 768320.5 6277941.7 54.2, 768318.3 6277943.4 54.2, 768315.2 6277945.6 54.2, 768315.9 6277946.5 54.2, 768313.3 6277948.5 54.2, 768312.6 6277947.5 54.2, 768310.2 6277949.4 54.2, 768316.3 6277957.3 54.2, 768321.4 6277953.4 54.2, 768322.4 6277954.7 54.2, 768324.8 6277952.8 54.2, 768325.7 6277953.8 54.2, 768332.9 6277948.5 54.2, 768331.9 6277947.2 54.2, 768334.7 6277945 54.2, 768333.9 6277944.1 54.2))
-BATIMENT0000000211117261;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:25:44;2019-04-08 10:00:52;1965-01-01;;;;3.0;1.0;1.0;1.0;54.0;10.0;7.3;53.2;60.5;61.2;54.3;Cadastre;A 1.0;POLYGON Z ((768598.4 6277995.9 60.5, 768604.6 6277987 60.5, 768597.4 6277982.1 60.5, 768591 6277991 60.5, 768598.4 6277995.9 60.5))
-BATIMENT0000000211117214;Indifférenciée;Annexe;;Non;En service;2008-11-18 15:25:44;2019-04-08 10:00:52;1992-01-01;;;;3.0;2.5;0.0;1.0;0.0;0.0;10.7;45.6;56.3;57.3;46.4;Cadastre;C 0.3;POLYGON Z ((768333.3 6277976 56.3, 768341.4 6277969.9 56.3, 768342.8 6277971.5 56.3, 768345.3 6277969.7 56.3, 768346 6277970.7 56.3, 768353.4 6277965.2 56.3, 768352.5 6277963.8 56.3, 768355.1 6277962 56.3, 768354.5 6277961 56.3, 768359.4 6277957.3 56.3, 768353.7 6277949.2 56.3, 768350.9 6277951.3 56.3, 768351.5 6277952.2 56.3, 768349 6277954.1 56.3, 768348.3 6277953.3 56.3, 768345.8 6277955.1 56.3, 768343.2 6277956.8 56.3, 768342.6 6277956 56.3, 768335 6277961.5 56.3, 768335.6 6277962.5 56.3, 768333.2 6277964.3 56.3, 768333.7 6277965.2 56.3, 768331.3 6277966.9 56.3, 768330.8 6277966 56.3, 768328.3 6277967.9 56.3, 768333.3 6277976 56.3))
-BATIMENT0000000211117228;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:25:44;2019-04-08 10:00:52;2001-01-01;;;;3.0;2.5;3.0;2.0;1.0;1.0;9.6;48.0;57.6;58.2;49.1;Cadastre;C 0.8;POLYGON Z ((768380.2 6277883.8 57.6, 768396.9 6277906.8 57.6, 768399.7 6277904.7 57.6, 768403.3 6277902.1 57.6, 768386.5 6277879.2 57.6, 768382.9 6277881.9 57.6, 768380.2 6277883.8 57.6))
-BATIMENT0000000211117245;Indifférenciée;Résidentiel;Annexe;Non;En service;2008-11-18 15:25:44;2019-04-08 10:00:52;1992-01-01;;;;3.0;2.5;15.0;4.0;5.0;1.0;10.4;46.9;57.3;58.1;47.1;Cadastre;C 0.1;POLYGON Z ((768362.7 6277941.3 57.3, 768368.8 6277949.1 57.3, 768373.4 6277945.5 57.3, 768374.2 6277946.5 57.3, 768376.6 6277944.6 57.3, 768377.9 6277946.3 57.3, 768385.1 6277940.5 57.3, 768384.8 6277940 57.3, 768387.4 6277938 57.3, 768386.1 6277936.4 57.3, 768393.5 6277930.6 57.3, 768387.6 6277923.1 57.3, 768385.7 6277924.7 57.3, 768386.9 6277926.3 57.3, 768384.5 6277928.2 57.3, 768383.1 6277926.4 57.3, 768380.6 6277928.4 57.3, 768379.8 6277927.4 57.3, 768372.4 6277933.2 57.3, 768373 6277933.9 57.3, 768370.6 6277935.8 57.3, 768368 6277937.9 57.3, 768369.1 6277939.2 57.3, 768366.6 6277941.1 57.3, 768365.1 6277939.5 57.3, 768362.7 6277941.3 57.3))
-BATIMENT0000000211117250;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:25:44;2019-04-08 10:00:52;1996-01-01;;;;3.0;2.5;32.0;5.0;0.0;0.0;13.4;46.2;59.6;60.8;46.2;Cadastre;C 0.3;POLYGON Z ((768316.3 6277915.6 59.6, 768310.8 6277906 59.6, 768308.9 6277907.1 59.6, 768307.7 6277905.1 59.6, 768306.5 6277903 59.6, 768308.3 6277902 59.6, 768302.8 6277892.5 59.6, 768295.6 6277896.6 59.6, 768296.4 6277898.6 59.6, 768288.2 6277903.3 59.6, 768287 6277901.9 59.6, 768281.6 6277905 59.6, 768285.7 6277912.1 59.6, 768287.5 6277911 59.6, 768293.6 6277907.4 59.6, 768294.6 6277909.2 59.6, 768293.3 6277910 59.6, 768296.3 6277915.1 59.6, 768297.5 6277914.3 59.6, 768298.9 6277916.6 59.6, 768292.8 6277920.1 59.6, 768290.8 6277921.3 59.6, 768294.8 6277928.1 59.6, 768301.7 6277924 59.6, 768300.9 6277922.5 59.6, 768306.9 6277919 59.6, 768307.8 6277920.5 59.6, 768316.3 6277915.6 59.6))
-BATIMENT0000000211117259;Indifférenciée;Annexe;;Non;En service;2008-11-18 15:25:44;2019-04-08 10:00:52;;;;;3.0;1.0;0.0;1.0;0.0;0.0;3.0;53.8;56.8;58.3;54.7;Cadastre;A 1.0;POLYGON Z ((768611.6 6277982.9 56.7, 768614.9 6277984.7 56.7, 768622.1 6277974 56.7, 768622.8 6277973 56.7, 768623.1 6277972.5 56.7, 768617.9 6277968.8 56.7, 768609.1 6277981.6 56.7, 768611.6 6277982.9 56.7))
-BATIMENT0000000211117267;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:25:44;2019-04-08 10:00:52;1975-01-01;;;;3.0;1.0;1.0;1.0;30.0;10.0;5.1;54.7;59.8;61.1;55.7;Cadastre;C 0.9;POLYGON Z ((768635.9 6277991.2 59.7, 768640.8 6277982.4 59.7, 768627.6 6277975.1 59.7, 768622.5 6277984 59.7, 768625.7 6277985.7 59.7, 768626.5 6277984.3 59.7, 768629.9 6277986.2 59.7, 768629.3 6277987.4 59.7, 768635.9 6277991.2 59.7))
-BATIMENT0000000211117272;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:25:44;2019-04-08 10:00:52;1982-01-01;;;;3.0;1.0;1.0;1.0;4.0;10.0;5.7;52.1;57.8;58.3;52.9;Cadastre;A 1.0;POLYGON Z ((768604.7 6277945.3 57.7, 768607.5 6277947.2 57.7, 768612 6277940.2 57.7, 768609.3 6277938.5 57.7, 768610.2 6277937.2 57.7, 768605.1 6277933.6 57.7, 768599.2 6277929.7 57.7, 768594.5 6277936.9 57.7, 768600.4 6277940.7 57.7, 768605.6 6277944 57.7, 768604.7 6277945.3 57.7))
-BATIMENT0000000211117274;Indifférenciée;Annexe;Résidentiel;Non;En service;2008-11-18 15:25:44;2019-04-08 10:00:52;;;;;3.0;1.0;1.0;2.0;0.0;0.0;6.7;52.6;59.3;59.4;53.8;Cadastre;A 1.0;POLYGON Z ((768607.2 6277974.7 59.2, 768613.6 6277964.4 59.2, 768603.6 6277957.5 59.2, 768596.8 6277967.8 59.2, 768607.2 6277974.7 59.2))
-BATIMENT0000000211117277;Indifférenciée;Résidentiel;Annexe;Non;En service;2008-11-18 15:25:44;2019-04-08 10:00:52;1996-01-01;;;;3.0;1.0;2.0;2.0;0.0;0.0;7.2;51.2;58.4;58.5;52.0;Cadastre;A 1.0;POLYGON Z ((768580.9 6277961.2 58.3, 768587.6 6277951.1 58.3, 768578.2 6277944.8 58.3, 768571.6 6277954.8 58.3, 768580.9 6277961.2 58.3))
-BATIMENT0000000211117278;Indifférenciée;Annexe;;Non;En service;2008-11-18 15:25:44;2019-04-08 10:00:52;;;;;3.0;1.0;0.0;1.0;0.0;0.0;3.6;51.7;55.3;58.4;52.3;Cadastre;A 1.0;POLYGON Z ((768589.4 6277948.4 55.3, 768587.6 6277951.1 55.3, 768580.9 6277961.2 55.3, 768586.4 6277965 55.3, 768595.1 6277952.3 55.3, 768589.4 6277948.4 55.3))
-BATIMENT0000000211117281;Indifférenciée;Commercial et services;Résidentiel;Non;En service;2008-11-18 15:25:44;2019-04-08 10:00:52;2013-01-01;;;;3.0;2.5;1.0;2.0;;;4.4;52.9;57.3;60.7;52.9;Cadastre;A 1.0;POLYGON Z ((768591.3 6277938.1 57.3, 768599.5 6277923.3 57.3, 768595.1 6277920.6 57.3, 768595.5 6277919.7 57.3, 768587.7 6277915.2 57.3, 768587.2 6277916.2 57.3, 768586.5 6277915.8 57.3, 768578.2 6277930.6 57.3, 768591.3 6277938.1 57.3))
-BATIMENT0000000211117282;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:25:44;2019-04-08 10:00:52;1965-01-01;;;;3.0;1.0;1.0;1.0;40.0;10.0;7.4;51.9;59.3;60.3;53.0;Cadastre;A 1.0;POLYGON Z ((768584 6277989.2 59.3, 768589.1 6277981.6 59.3, 768577.9 6277974.3 59.3, 768573 6277981.8 59.3, 768584 6277989.2 59.3))
-BATIMENT0000000211117289;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:25:44;2019-04-08 10:00:52;1900-01-01;;;;3.0;1.0;1.0;1.0;20.0;10.0;3.9;54.1;58.0;60.3;55.1;Cadastre;C 0.4;POLYGON Z ((768640.3 6277968.1 57.9, 768642.4 6277965.3 57.9, 768641.9 6277964.9 57.9, 768643.7 6277962.5 57.9, 768638.6 6277958.7 57.9, 768640.8 6277955.8 57.9, 768638.4 6277954 57.9, 768638.6 6277953.7 57.9, 768635.1 6277951 57.9, 768635.7 6277950.1 57.9, 768633.2 6277948 57.9, 768629.7 6277952.6 57.9, 768632.5 6277954.6 57.9, 768628.7 6277959.6 57.9, 768626.4 6277962.7 57.9, 768629.8 6277965.1 57.9, 768632.2 6277962 57.9, 768640.3 6277968.1 57.9))
-BATIMENT0000000211117290;Indifférenciée;Résidentiel;Annexe;Non;En service;2008-11-18 15:25:44;2019-04-08 10:00:52;;;;;3.0;2.5;24.0;6.0;0.0;0.0;18.1;54.4;72.5;74.2;54.6;Cadastre;C 0.4;POLYGON Z ((768626.2 6277922.1 72.5, 768636.6 6277921.9 72.5, 768636.6 6277918.3 72.5, 768648.2 6277918.2 72.5, 768648.1 6277906.1 72.5, 768643.9 6277906.2 72.5, 768643.8 6277897.4 72.5, 768633.5 6277897.5 72.5, 768633.6 6277901 72.5, 768622.2 6277901 72.5, 768622.3 6277913.2 72.5, 768626.1 6277913.1 72.5, 768626.2 6277922.1 72.5))
-BATIMENT0000000211117294;Indifférenciée;Résidentiel;Annexe;Non;En service;2008-11-18 15:25:44;2019-04-08 10:00:52;;;;;3.0;1.0;70.0;8.0;0.0;0.0;21.7;48.5;70.2;71.1;49.7;Cadastre;C 0.1;POLYGON Z ((768515.1 6277970.8 70.1, 768515.8 6277971.4 70.1, 768522.8 6277964.1 70.1, 768522.1 6277963.3 70.1, 768526.2 6277959.2 70.1, 768521.5 6277954.6 70.1, 768522.7 6277953.3 70.1, 768514.9 6277945.8 70.1, 768516.1 6277944.5 70.1, 768516.5 6277944.7 70.1, 768516.8 6277944.8 70.1, 768517.4 6277944.7 70.1, 768518.2 6277944.2 70.1, 768518.6 6277943.9 70.1, 768518.9 6277943.5 70.1, 768519 6277943.1 70.1, 768519.1 6277942.8 70.1, 768518.8 6277942.1 70.1, 768518.6 6277941.7 70.1, 768518.2 6277941.4 70.1, 768517.7 6277941.3 70.1, 768517.2 6277941.4 70.1, 768516.7 6277941.5 70.1, 768516 6277941.7 70.1, 768514.8 6277940.5 70.1, 768520.9 6277934 70.1, 768522.8 6277935.8 70.1, 768523.4 6277936.1 70.1, 768523.8 6277936.1 70.1, 768524.6 6277935.9 70.1, 768524.8 6277935.6 70.1, 768525.2 6277934.7 70.1, 768525.2 6277933.8 70.1, 768525 6277933.4 70.1, 768523.3 6277931.8 70.1, 768531.3 6277923.3 70.1, 768532.2 6277924.1 70.1, 768533.6 6277922.7 70.1, 768534 6277923.2 70.1, 768534.3 6277923.5 70.1, 768534.8 6277923.8 70.1, 768535.2 6277923.9 70.1, 768535.5 6277924 70.1, 768536 6277923.9 70.1, 768536.6 6277923.6 70.1, 768537.1 6277922.8 70.1, 768537.3 6277922.2 70.1, 768537.3 6277921.8 70.1, 768537.1 6277921.4 70.1, 768536.8 6277920.9 70.1, 768541.2 6277915.9 70.1, 768538.5 6277913.3 70.1, 768539.3 6277912.4 70.1, 768536.8 6277910.1 70.1, 768536 6277910.8 70.1, 768531.8 6277906.7 70.1, 768517.6 6277921.6 70.1, 768517.3 6277921.3 70.1, 768516.9 6277920.8 70.1, 768516.5 6277920.6 70.1, 768516 6277920.4 70.1, 768515.4 6277920.4 70.1, 768515.1 6277920.7 70.1, 768514.5 6277921.5 70.1, 768514.3 6277922.2 70.1, 768514.2 6277922.6 70.1, 768514.6 6277923.4 70.1, 768515.2 6277923.9 70.1, 768501.1 6277939 70.1, 768502.5 6277940.6 70.1, 768499.6 6277943.5 70.1, 768502.6 6277946.3 70.1, 768501.2 6277947.8 70.1, 768510.7 6277957.2 70.1, 768510.8 6277958.2 70.1, 768510.4 6277958.2 70.1, 768510.1 6277958.5 70.1, 768509.7 6277959 70.1, 768509.5 6277959.4 70.1, 768509.5 6277960 70.1, 768509.5 6277960.3 70.1, 768509.6 6277960.8 70.1, 768510.1 6277961.3 70.1, 768510.5 6277961.5 70.1, 768510.9 6277961.7 70.1, 768511 6277962.4 70.1, 768508.6 6277964.5 70.1, 768511.5 6277967.3 70.1, 768515.1 6277970.8 70.1))
-BATIMENT0000000211117295;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:25:44;2019-04-08 10:00:52;;;;;3.0;2.5;2.0;2.0;50.0;10.0;8.9;49.8;58.7;;;Cadastre;A 1.0;POLYGON Z ((768560.4 6277985.9 58.7, 768562.9 6277982.1 58.7, 768561.8 6277981.4 58.7, 768567.3 6277973.2 58.7, 768563.2 6277970.4 58.7, 768565.1 6277967.5 58.7, 768567.2 6277964.5 58.7, 768564.8 6277963 58.7, 768564.5 6277960.8 58.7, 768562.4 6277961.3 58.7, 768560.2 6277959.9 58.7, 768555.8 6277966.2 58.7, 768560.4 6277969.3 58.7, 768552.6 6277980.6 58.7, 768560.4 6277985.9 58.7))
-BATIMENT0000000211117306;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:25:44;2019-04-08 10:00:52;1976-01-01;;;;3.0;2.5;2.0;1.0;90.0;10.0;1.7;47.5;49.2;51.8;47.5;Cadastre;A 1.0;POLYGON Z ((768843.6 6277883.2 49.2, 768857.7 6277877 49.2, 768854.6 6277869.6 49.2, 768843.4 6277874.7 49.2, 768843.6 6277875.2 49.2, 768840.6 6277876.6 49.2, 768843.6 6277883.2 49.2))
-BATIMENT0000000211117307;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:25:44;2019-04-08 10:00:52;1977-01-01;;;;3.0;2.5;1.0;1.0;40.0;10.0;5.3;48.1;53.4;53.5;48.1;Cadastre;A 1.0;POLYGON Z ((768849.5 6277903.2 53.4, 768844.6 6277894.9 53.4, 768843.8 6277893.4 53.4, 768836 6277897.9 53.4, 768840.8 6277906.5 53.4, 768845.8 6277903.7 53.4, 768846.4 6277905 53.4, 768849.5 6277903.2 53.4))
-BATIMENT0000000211117313;Indifférenciée;Résidentiel;Annexe;Non;En service;2008-11-18 15:25:44;2019-04-08 10:00:52;;;;;3.0;2.5;2.0;2.0;0.0;0.0;6.5;47.5;54.0;55.7;48.6;Cadastre;C 0.3;POLYGON Z ((768841.3 6277849.2 54, 768853.9 6277843.5 54, 768848.9 6277832.7 54, 768836.4 6277838.6 54, 768841.3 6277849.2 54))
-BATIMENT0000000211117315;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:25:44;2019-04-08 10:00:52;1993-01-01;;;;3.0;1.0;1.0;2.0;50.0;10.0;6.2;50.6;56.8;57.6;51.1;Cadastre;A 1.0;POLYGON Z ((768809.9 6277870.3 56.8, 768807.8 6277867.4 56.8, 768805.6 6277864.3 56.8, 768797.6 6277870.1 56.8, 768801.9 6277876.1 56.8, 768809.9 6277870.3 56.8))
-BATIMENT0000000211117317;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:25:44;2019-04-08 10:00:52;1994-01-01;;;;3.0;2.5;1.0;2.0;30.0;10.0;4.9;49.8;54.7;57.4;50.9;Cadastre;A 1.0;POLYGON Z ((768809.9 6277870.3 54.7, 768801.9 6277876.1 54.7, 768805.9 6277881.8 54.7, 768813.9 6277876 54.7, 768811.5 6277872.5 54.7, 768809.9 6277870.3 54.7))
-BATIMENT0000000211117320;Indifférenciée;Annexe;;Non;En service;2008-11-18 15:25:44;2019-04-08 10:00:52;;;;;5.0;1.0;0.0;1.0;;;3.4;48.4;51.8;51.9;49.1;Cadastre;B 0.5;POLYGON Z ((768842.3 6277993.3 51.7, 768840.5 6277988.5 51.7, 768835.4 6277990.5 51.7, 768837.3 6277995.2 51.7, 768842.3 6277993.3 51.7))
-BATIMENT0000000211117323;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:25:44;2019-04-08 10:00:52;1992-01-01;;;;3.0;1.0;1.0;2.0;5.0;1.0;7.1;49.1;56.2;56.8;50.7;Cadastre;A 1.0;POLYGON Z ((768807.9 6277904 56.2, 768805.4 6277897.7 56.2, 768802.7 6277898.6 56.2, 768800.3 6277892.1 56.2, 768791.6 6277895.5 56.2, 768794.1 6277902.1 56.2, 768800.2 6277899.8 56.2, 768801.8 6277899.2 56.2, 768803.9 6277905.1 56.2, 768807.9 6277904 56.2))
-BATIMENT0000000211117324;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:25:44;2019-04-08 10:00:52;1998-01-01;;;;3.0;2.5;1.0;1.0;3.0;10.0;3.2;55.0;58.2;;;Cadastre;C 0.9;POLYGON Z ((768716.7 6277949.1 58.2, 768724.1 6277955.8 58.2, 768734.9 6277943.8 58.2, 768731.5 6277940.6 58.2, 768727.9 6277944.5 58.2, 768726.4 6277943.2 58.2, 768727.3 6277942.2 58.2, 768724.9 6277940 58.2, 768716.7 6277949.1 58.2))
-BATIMENT0000000211117325;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:25:44;2019-04-08 10:00:52;1998-01-01;;;;3.0;2.5;1.0;1.0;3.0;10.0;4.0;54.0;58.0;;;Cadastre;C 1.0;POLYGON Z ((768743.5 6277996.2 58, 768751.8 6277986.9 58, 768749.3 6277984.7 58, 768748.4 6277985.7 58, 768746.9 6277984.4 58, 768750.5 6277980.5 58, 768746.9 6277977.3 58, 768736 6277989.4 58, 768743.5 6277996.2 58))
-BATIMENT0000000211117331;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:25:44;2019-04-08 10:00:52;1984-01-01;;;;3.0;2.5;1.0;1.0;40.0;10.0;4.7;49.6;54.3;57.0;49.9;Cadastre;A 1.0;POLYGON Z ((768806.2 6277834 54.3, 768812 6277845.6 54.3, 768821 6277841 54.3, 768816.9 6277833.2 54.3, 768815.5 6277834 54.3, 768813.5 6277830.3 54.3, 768809 6277832.6 54.3, 768806.2 6277834 54.3))
-BATIMENT0000000211117333;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:25:44;2019-04-08 10:00:52;1998-01-01;;;;3.0;2.5;1.0;1.0;3.0;10.0;4.2;52.9;57.1;57.2;53.0;Cadastre;C 1.0;POLYGON Z ((768754.2 6277903.7 57.1, 768759.9 6277897.4 57.1, 768761.2 6277895.9 57.1, 768750.9 6277886.7 57.1, 768741.8 6277896.9 57.1, 768744.1 6277898.9 57.1, 768746.2 6277896.5 57.1, 768754.2 6277903.7 57.1))
-BATIMENT0000000211117334;Indifférenciée;Résidentiel;Annexe;Non;En service;2008-11-18 15:25:44;2019-04-08 10:00:52;1998-01-01;;;;3.0;2.5;1.0;1.0;3.0;10.0;4.1;53.9;58.0;58.1;55.2;Cadastre;C 1.0;POLYGON Z ((768750.9 6278002.9 58, 768761.8 6277990.6 58, 768758.3 6277987.6 58, 768754.7 6277991.5 58, 768753.3 6277990.3 58, 768754.2 6277989.2 58, 768751.8 6277986.9 58, 768743.5 6277996.2 58, 768750.9 6278002.9 58))
-BATIMENT0000000211117336;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:25:44;2019-04-08 10:00:52;1890-01-01;;;;3.0;1.0;1.0;1.0;14.0;10.0;7.7;50.9;58.6;59.7;52.1;Cadastre;A 1.0;POLYGON Z ((768795.7 6277992.2 58.5, 768805.9 6277988.1 58.5, 768803.6 6277981.6 58.5, 768799.2 6277983.3 58.5, 768797.9 6277980.1 58.5, 768792.8 6277982 58.5, 768793.1 6277982.6 58.5, 768791.6 6277983.1 58.5, 768792.7 6277986.1 58.5, 768793.5 6277985.8 58.5, 768795.7 6277992.2 58.5))
-BATIMENT0000000211117337;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:25:44;2019-04-08 10:00:52;1998-01-01;;;;3.0;2.5;1.0;1.0;3.0;10.0;3.3;54.7;58.0;;;Cadastre;C 0.9;POLYGON Z ((768730.5 6277972.6 58, 768734.6 6277968 58, 768738.7 6277963.5 58, 768736.3 6277961.3 58, 768735.9 6277961.8 58, 768734.4 6277960.4 58, 768737.4 6277957.1 58, 768733.9 6277953.9 58, 768723 6277965.9 58, 768730.5 6277972.6 58))
-BATIMENT0000000211117338;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:25:44;2019-04-08 10:00:52;1998-01-01;;;;3.0;2.5;1.0;1.0;3.0;10.0;3.4;54.7;58.1;;;Cadastre;C 0.9;POLYGON Z ((768733.9 6277983.9 58.1, 768744.8 6277971.8 58.1, 768741.2 6277968.7 58.1, 768737.7 6277972.5 58.1, 768736.3 6277971.3 58.1, 768737.1 6277970.3 58.1, 768734.6 6277968 58.1, 768730.5 6277972.6 58.1, 768726.4 6277977.1 58.1, 768733.9 6277983.9 58.1))
-BATIMENT0000000211117339;Indifférenciée;Résidentiel;Annexe;Non;En service;2008-11-18 15:25:44;2019-04-08 10:00:52;1990-01-01;;;;3.0;2.5;6.0;3.0;35.0;40.0;7.1;57.0;64.1;64.8;57.0;Cadastre;C 0.1;POLYGON Z ((768674.2 6277985.8 64.1, 768671.8 6277983.9 64.1, 768672.7 6277982.8 64.1, 768668.4 6277979.4 64.1, 768667.8 6277980.1 64.1, 768665.5 6277978.4 64.1, 768666.1 6277977.6 64.1, 768662.6 6277974.8 64.1, 768661.7 6277975.9 64.1, 768659.3 6277974.1 64.1, 768653.7 6277981.2 64.1, 768660.7 6277986.8 64.1, 768661.8 6277985.5 64.1, 768662.9 6277986.3 64.1, 768662.4 6277986.9 64.1, 768669.1 6277992.2 64.1, 768674.2 6277985.8 64.1))
-BATIMENT0000000211117340;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:25:44;2019-04-08 10:00:52;1998-01-01;;;;3.0;2.5;1.0;1.0;3.0;10.0;4.0;52.9;56.9;;;Cadastre;C 1.0;POLYGON Z ((768758.7 6277912.7 56.9, 768762.8 6277908 56.9, 768765.6 6277910.5 56.9, 768770.7 6277904.9 56.9, 768765.3 6277900.1 56.9, 768764.2 6277901.3 56.9, 768759.9 6277897.4 56.9, 768754.2 6277903.7 56.9, 768750.7 6277907.6 56.9, 768752.9 6277909.6 56.9, 768754 6277908.5 56.9, 768758.7 6277912.7 56.9))
-BATIMENT0000000211117341;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:25:44;2019-04-08 10:00:52;1998-01-01;;;;3.0;2.5;1.0;1.0;3.0;10.0;4.2;52.9;57.1;57.3;54.7;Cadastre;C 1.0;POLYGON Z ((768750.9 6277886.7 57.1, 768746.7 6277882.9 57.1, 768747.8 6277881.6 57.1, 768742.3 6277876.7 57.1, 768737.2 6277882.3 57.1, 768740 6277884.8 57.1, 768735.8 6277889.5 57.1, 768740.5 6277893.7 57.1, 768739.5 6277894.9 57.1, 768741.8 6277896.9 57.1, 768750.9 6277886.7 57.1))
-BATIMENT0000000211117342;Indifférenciée;Commercial et services;;Non;En service;2008-11-18 15:25:44;2019-04-08 10:00:52;;;;;3.0;2.5;0.0;1.0;;;3.1;55.0;58.1;;;Cadastre;C 0.4;POLYGON Z ((768716.7 6277949.1 58.1, 768724.9 6277940 58.1, 768722.4 6277937.8 58.1, 768721.7 6277938.6 58.1, 768720.2 6277937.3 58.1, 768723.6 6277933.5 58.1, 768720.1 6277930.4 58.1, 768708.2 6277943.5 58.1, 768715.7 6277950.2 58.1, 768716.7 6277949.1 58.1))
-BATIMENT0000000211117343;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:25:44;2019-04-08 10:00:52;2010-01-01;;;;3.0;2.5;8.0;4.0;0.0;0.0;11.5;55.9;67.4;67.8;55.9;Cadastre;C 0.4;POLYGON Z ((768660.3 6277954.9 67.4, 768672.2 6277954.4 67.4, 768672.3 6277950.4 67.4, 768681.2 6277950.2 67.4, 768680.9 6277940.1 67.4, 768677.3 6277940.2 67.4, 768677.1 6277929.1 67.4, 768665 6277929.3 67.4, 768665.1 6277932.8 67.4, 768656.2 6277932.8 67.4, 768656.3 6277943.1 67.4, 768660.3 6277943.1 67.4, 768660.3 6277954.9 67.4))
-BATIMENT0000000211117345;Indifférenciée;Résidentiel;Annexe;Non;En service;2008-11-18 15:25:44;2019-04-08 10:00:52;1993-01-01;;;;3.0;1.0;26.0;4.0;30.0;10.0;11.0;51.0;62.0;63.2;53.2;Cadastre;A 1.0;POLYGON Z ((768794.9 6277887.2 62, 768793.1 6277884.7 62, 768795.5 6277883.1 62, 768793.7 6277880.5 62, 768790.1 6277875.5 62, 768787.1 6277871.2 62, 768786.1 6277870 62, 768784.3 6277867.4 62, 768783.4 6277866.2 62, 768781.8 6277863.8 62, 768780.1 6277861.5 62, 768778.5 6277859.2 62, 768780.7 6277857.6 62, 768784.2 6277855.1 62, 768786.8 6277853.3 62, 768790.3 6277850.8 62, 768788.6 6277848.3 62, 768791.4 6277846.2 62, 768783 6277834.4 62, 768780.1 6277836.4 62, 768778.4 6277833.8 62, 768771.5 6277838.8 62, 768774.8 6277843.6 62, 768776.3 6277845.7 62, 768773.8 6277847.4 62, 768769.2 6277850.8 62, 768769.4 6277851.3 62, 768763.7 6277855.2 62, 768763.2 6277857.5 62, 768765.7 6277861.1 62, 768767.3 6277859.9 62, 768772.1 6277866.9 62, 768770.6 6277868 62, 768775.2 6277874.4 62, 768778.5 6277879 62, 768786.2 6277889.6 62, 768788.5 6277888 62, 768790.2 6277890.5 62, 768794.9 6277887.2 62))
-BATIMENT0000000211117357;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:25:44;2019-04-08 10:00:52;1895-01-01;;;;3.0;1.0;1.0;2.0;1.0;1.0;5.7;47.6;53.3;55.4;50.0;Cadastre;A 1.0;POLYGON Z ((768815.6 6277865.2 53.2, 768817.2 6277867.7 53.2, 768816.4 6277868.1 53.2, 768817.2 6277870 53.2, 768819 6277869.1 53.2, 768819.7 6277870.5 53.2, 768817.8 6277871.2 53.2, 768820.6 6277879.4 53.2, 768827.7 6277876.8 53.2, 768826.2 6277873.1 53.2, 768828.7 6277872.2 53.2, 768826.5 6277866.8 53.2, 768827 6277866.6 53.2, 768826.6 6277865.5 53.2, 768826.4 6277865 53.2, 768826 6277864.7 53.2, 768825.6 6277864.6 53.2, 768825 6277864.5 53.2, 768824.5 6277864.6 53.2, 768823.5 6277864.9 53.2, 768822.6 6277865.3 53.2, 768823.2 6277866 53.2, 768820.2 6277867.2 53.2, 768818.7 6277864 53.2, 768815.6 6277865.2 53.2))
-BATIMENT0000000211117360;Indifférenciée;Résidentiel;Annexe;Non;En service;2008-11-18 15:25:44;2019-04-08 10:00:52;1999-01-01;;;;3.0;2.5;28.0;5.0;0.0;0.0;13.0;55.4;68.4;;;Cadastre;A 1.0;POLYGON Z ((768688.2 6277850.7 68.4, 768688.1 6277844.6 68.4, 768688 6277838.4 68.4, 768687.9 6277832.3 68.4, 768687.8 6277826.2 68.4, 768672.3 6277826.4 68.4, 768672.3 6277832.8 68.4, 768672.9 6277832.8 68.4, 768673 6277838.5 68.4, 768672.4 6277838.5 68.4, 768672.5 6277844.7 68.4, 768672.6 6277850.9 68.4, 768688.2 6277850.7 68.4))
-BATIMENT0000000211117366;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:25:44;2019-04-08 10:00:52;1995-01-01;;;;3.0;1.0;1.0;2.0;5.0;1.0;6.3;48.0;54.3;55.3;49.2;Cadastre;A 1.0;POLYGON Z ((768822.4 6277865.3 54.2, 768822.6 6277865.3 54.2, 768823.5 6277864.9 54.2, 768824.3 6277864.6 54.2, 768824.5 6277864.6 54.2, 768825 6277864.5 54.2, 768830 6277861.9 54.2, 768828.2 6277858.1 54.2, 768825.4 6277859.5 54.2, 768824 6277856.9 54.2, 768823 6277854.9 54.2, 768824.3 6277854.3 54.2, 768822.5 6277850.7 54.2, 768814.1 6277854.6 54.2, 768816.3 6277859.2 54.2, 768814.9 6277859.8 54.2, 768817 6277864 54.2, 768821 6277862.1 54.2, 768822.4 6277865.3 54.2))
-BATIMENT0000000211117367;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:25:44;2019-04-08 10:00:52;1998-01-01;;;;3.0;2.5;1.0;1.0;3.0;10.0;2.2;56.0;58.2;;;Cadastre;C 0.8;POLYGON Z ((768701.9 6277941.6 58.2, 768711.1 6277931.5 58.2, 768708.6 6277929.2 58.2, 768707.7 6277930.3 58.2, 768706.2 6277929 58.2, 768707.7 6277927.4 58.2, 768703 6277923.3 58.2, 768695.6 6277931.5 58.2, 768697.4 6277933.1 58.2, 768696.3 6277934.2 58.2, 768698.4 6277936.1 58.2, 768697.3 6277937.3 58.2, 768701.9 6277941.6 58.2))
-BATIMENT0000000211117368;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:25:44;2019-04-08 10:00:52;2010-01-01;;;;3.0;2.5;17.0;6.0;0.0;0.0;15.7;56.0;71.7;72.8;56.0;Cadastre;C 0.3;POLYGON Z ((768668.4 6277896.2 71.7, 768687.2 6277895.9 71.7, 768687.1 6277891.2 71.7, 768686.8 6277891.1 71.7, 768686.8 6277889.2 71.7, 768687.2 6277889.1 71.7, 768687 6277884.5 71.7, 768668.1 6277885 71.7, 768668.2 6277889.5 71.7, 768668.6 6277889.4 71.7, 768668.6 6277891.8 71.7, 768668.2 6277891.8 71.7, 768668.4 6277896.2 71.7))
-BATIMENT0000000211117370;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:25:44;2019-04-08 10:00:52;1992-01-01;;;;3.0;1.0;1.0;2.0;5.0;1.0;6.3;50.1;56.4;57.2;50.5;Cadastre;A 1.0;POLYGON Z ((768808.4 6277896.6 56.4, 768809 6277898.5 56.4, 768818.4 6277895.1 56.4, 768817.2 6277891.6 56.4, 768816 6277888.4 56.4, 768806.6 6277891.8 56.4, 768808.4 6277896.6 56.4))
-BATIMENT0000000211117371;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:25:44;2019-04-08 10:00:52;1992-01-01;;;;3.0;2.5;1.0;2.0;1.0;1.0;4.8;49.7;54.5;57.2;50.7;Cadastre;A 1.0;POLYGON Z ((768813.6 6277881.6 54.5, 768806.3 6277884.3 54.5, 768804.2 6277885 54.5, 768806.6 6277891.8 54.5, 768816 6277888.4 54.5, 768814.9 6277885.3 54.5, 768813.6 6277881.6 54.5))
-BATIMENT0000000211117372;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:25:44;2019-04-08 10:00:52;1978-01-01;;;;3.0;1.0;1.0;2.0;40.0;10.0;8.3;48.2;56.5;57.2;48.8;Cadastre;A 1.0;POLYGON Z ((768837.1 6277959.1 56.4, 768846.4 6277955.7 56.4, 768847.3 6277955.3 56.4, 768846.1 6277952 56.4, 768844.3 6277952.8 56.4, 768842.8 6277953.4 56.4, 768840.8 6277948 56.4, 768834.4 6277950.4 56.4, 768836.3 6277955.7 56.4, 768835.2 6277956 56.4, 768836.5 6277959.3 56.4, 768837.1 6277959.1 56.4))
-BATIMENT0000000211117373;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:25:44;2019-04-08 10:00:52;1978-01-01;;;;3.0;1.0;1.0;2.0;40.0;10.0;7.9;48.1;56.0;57.0;48.7;Cadastre;A 1.0;POLYGON Z ((768842.4 6277947.4 56, 768844 6277946.8 56, 768842.8 6277943.1 56, 768841 6277943.8 56, 768839.5 6277944.4 56, 768837.6 6277939.6 56, 768831 6277942 56, 768833 6277946.8 56, 768831.8 6277947.2 56, 768833.3 6277950.8 56, 768834.4 6277950.4 56, 768840.8 6277948 56, 768842.4 6277947.4 56))
-BATIMENT0000000211117374;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:25:44;2019-04-08 10:00:52;1978-01-01;;;;3.0;2.5;1.0;2.0;40.0;10.0;5.9;48.8;54.7;57.0;48.8;Cadastre;A 1.0;POLYGON Z ((768837.1 6277959.1 54.7, 768840.2 6277967.5 54.7, 768849.5 6277964 54.7, 768848.2 6277960.5 54.7, 768846.7 6277961.2 54.7, 768846.2 6277959.4 54.7, 768847.6 6277959 54.7, 768846.4 6277955.7 54.7, 768837.1 6277959.1 54.7))
-BATIMENT0000000211117375;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:25:44;2019-04-08 10:00:52;1978-01-01;;;;3.0;1.0;1.0;2.0;40.0;10.0;8.2;47.4;55.6;56.4;47.6;Cadastre;A 1.0;POLYGON Z ((768821.2 6277917.6 55.5, 768827.5 6277915.2 55.5, 768829.2 6277914.5 55.5, 768828.1 6277911.5 55.5, 768826.6 6277912 55.5, 768826 6277910.3 55.5, 768827.4 6277909.7 55.5, 768826 6277906 55.5, 768816.2 6277909.8 55.5, 768819.4 6277918.3 55.5, 768821.2 6277917.6 55.5))
-BATIMENT0000000211117376;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:25:44;2019-04-08 10:00:52;1978-01-01;;;;3.0;1.0;1.0;2.0;40.0;10.0;8.4;47.4;55.8;56.4;47.8;Cadastre;A 1.0;POLYGON Z ((768823.4 6277926.6 55.8, 768834.2 6277922.4 55.8, 768832.9 6277918.8 55.8, 768831.2 6277919.6 55.8, 768829.5 6277920.3 55.8, 768827.5 6277915.2 55.8, 768821.2 6277917.6 55.8, 768823.1 6277922.8 55.8, 768822.1 6277923.2 55.8, 768823.4 6277926.6 55.8))
-BATIMENT0000000211117379;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:25:44;2019-04-08 10:00:52;1978-01-01;;;;3.0;1.0;1.0;2.0;40.0;10.0;8.0;47.5;55.5;56.4;48.2;Cadastre;A 1.0;POLYGON Z ((768823.4 6277926.6 55.5, 768824.6 6277929.9 55.5, 768825.6 6277929.4 55.5, 768827.6 6277934.7 55.5, 768833.9 6277932.4 55.5, 768832 6277927 55.5, 768833.7 6277926.4 55.5, 768835.4 6277925.9 55.5, 768834.2 6277922.4 55.5, 768823.4 6277926.6 55.5))
-BATIMENT0000000231242872;Indifférenciée;Indifférencié;;Non;En service;2010-04-30 11:37:59;2019-04-08 10:00:52;;2009-07-01;;;2.5;1.5;0.0;1.0;;;3.7;40.9;;45.4;42.5;Imagerie aérienne;C 0.2;POLYGON Z ((768168 6278018.8 44, 768171.9 6278016.2 44, 768159.6 6277998.7 44.6, 768156 6278001.4 44, 768168 6278018.8 44))
-BATIMENT0000000231242875;Indifférenciée;Résidentiel;Commercial et services;Non;En service;2010-04-30 11:37:59;2019-04-08 10:00:52;2006-01-01;2009-07-01;;;2.5;1.5;1.0;2.0;50.0;40.0;4.4;41.7;;47.4;41.7;Imagerie aérienne;A 1.0;POLYGON Z ((768058.3 6277882.5 46, 768072.1 6277875.8 46.1, 768071.6 6277874.5 46.1, 768075.6 6277873.1 46.1, 768075.2 6277871.9 46.1, 768081.8 6277868.8 46.1, 768078.9 6277861.7 46.1, 768071 6277865.1 46.1, 768072.6 6277869.2 46.1, 768056.8 6277875.9 46.1, 768058.3 6277882.5 46))
-BATIMENT0000000231242876;Indifférenciée;Commercial et services;Résidentiel;Non;En service;2010-04-30 11:37:59;2019-04-08 10:00:52;2005-01-01;2009-07-01;;;2.5;1.5;1.0;3.0;;;7.1;42.2;;51.0;42.2;Imagerie aérienne;A 0.3;POLYGON Z ((768061.7 6277908.5 47.8, 768080.9 6277894.9 49.3, 768083.2 6277898 49.3, 768092.2 6277891.2 49.3, 768085.2 6277875.1 47.8, 768059.3 6277893.7 47.8, 768059.1 6277906.2 47.8, 768061.7 6277908.5 47.8))
-BATIMENT0000000231242877;Indifférenciée;Commercial et services;;Non;En service;2010-04-30 11:37:59;2019-04-08 10:00:52;;2009-07-01;;;2.5;1.5;0.0;1.0;;;8.0;39.4;;;;Imagerie aérienne;B 0.1;POLYGON Z ((767855.5 6278032.4 47.4, 767850.5 6278042.5 47.4, 767854 6278044.5 47.4, 767859.2 6278034.5 47.4, 767855.5 6278032.4 47.4))
-BATIMENT0000000231242878;Indifférenciée;Résidentiel;;Non;En service;2010-04-30 11:37:59;2019-04-08 10:00:52;;2009-07-01;;;2.5;1.5;17.0;5.0;10.0;10.0;12.1;41.1;;53.9;;Imagerie aérienne;C 0.1;POLYGON Z ((768065.5 6278123 53.1, 768110.1 6278092.8 53.2, 768103.9 6278084 53.2, 768059.6 6278114.3 53.2, 768065.5 6278123 53.1))
-BATIMENT0000000231242881;Indifférenciée;Indifférencié;;Non;En service;2010-04-30 11:37:59;2019-04-08 10:00:52;1979-01-01;2009-07-01;;;2.5;1.5;0.0;1.0;;;4.4;55.6;;60.1;56.5;Imagerie aérienne;C 0.2;POLYGON Z ((768561.7 6278106.6 60, 768566.4 6278109.9 60, 768572.6 6278101.3 60, 768568.3 6278098.1 60, 768561.7 6278106.6 60))
-BATIMENT0000000231242882;Indifférenciée;Indifférencié;;Non;En service;2010-04-30 11:37:59;2019-04-08 10:00:52;1977-01-01;2009-07-01;;;2.5;1.5;0.0;1.0;;;3.3;56.4;;60.0;57.0;Imagerie aérienne;C 0.2;POLYGON Z ((768584.7 6278122.5 59.6, 768589.1 6278125.9 59.7, 768594.8 6278117.1 59.7, 768590.6 6278114 59.7, 768584.7 6278122.5 59.6))
-BATIMENT0000000231242893;Indifférenciée;Commercial et services;;Non;En service;2010-04-30 11:37:59;2019-04-08 10:00:52;2008-01-01;2009-07-01;;;2.5;1.5;0.0;1.0;;;6.0;38.2;;46.1;39.2;Imagerie aérienne;A 1.0;POLYGON Z ((768827.2 6278468.3 44.1, 768837.5 6278455.9 44.2, 768827.9 6278448.9 44.2, 768820.8 6278458.6 44.2, 768822.2 6278459.8 44.2, 768819.6 6278462.9 44.2, 768827.2 6278468.3 44.1))
-BATIMENT0000000231242894;Indifférenciée;Annexe;;Non;En service;2010-04-30 11:37:59;2019-04-08 10:00:52;1972-01-01;2009-07-01;;;2.5;1.5;0.0;1.0;0.0;0.0;4.1;37.3;;42.2;39.4;Imagerie aérienne;C 0.1;POLYGON Z ((768698.4 6278344.4 41.3, 768701.3 6278351.1 41.4, 768707 6278348.7 41.4, 768703.9 6278341.5 41.4, 768698.4 6278344.4 41.3))
-BATIMENT0000000231242897;Indifférenciée;Annexe;;Non;En service;2010-04-30 11:37:59;2019-04-08 10:00:52;;2009-07-01;;;2.5;1.5;0.0;1.0;0.0;0.0;4.0;55.4;;60.1;56.9;Imagerie aérienne;C 0.1;POLYGON Z ((768570.6 6278113.2 59.4, 768580.3 6278119.6 59.4, 768586.1 6278111.3 59.4, 768576.6 6278104.9 59.4, 768570.6 6278113.2 59.4))
-BATIMENT0000000335204987;Indifférenciée;Résidentiel;;Non;En service;2014-06-19 12:22:57;2019-04-08 10:00:52;2000-01-01;2012-07-01;;;2.5;1.5;1.0;2.0;3.0;10.0;4.2;52.6;;;;Imagerie aérienne;C 0.1;POLYGON Z ((768759.8 6277868.4 56.8, 768755.8 6277864.7 56.8, 768753 6277867.7 56.8, 768761.3 6277875.1 56.8, 768763.2 6277873 56.8, 768759.8 6277868.4 56.8))
-BATIMENT0000000335205042;Indifférenciée;Résidentiel;Annexe;Non;En service;2014-06-19 12:22:57;2019-04-08 10:00:52;;2012-07-01;;;2.5;1.5;12.0;4.0;0.0;0.0;16.1;38.6;;;;Imagerie aérienne;C 0.5;POLYGON Z ((768722.5 6278285.6 46.8, 768729.3 6278298.6 46.8, 768738 6278294.2 49.5, 768740.3 6278266.6 53.6, 768741.8 6278249.9 53.6, 768741.7 6278246.1 49.5, 768741.9 6278243.1 49.5, 768742.3 6278237.6 49.5, 768727.7 6278236.6 49.5, 768727.8 6278248.6 54.7, 768726.8 6278262.7 54.1, 768726.5 6278265.8 53.9, 768724.9 6278284.7 50.5, 768722.5 6278285.6 46.8))
-BATIMENT0000000335205142;Indifférenciée;Résidentiel;Commercial et services;Non;En service;2014-06-19 12:22:57;2019-04-08 10:00:52;;2012-07-01;;;2.5;1.5;17.0;6.0;0.0;0.0;17.3;55.4;;;;Imagerie aérienne;C 0.3;POLYGON Z ((768692.3 6277892.5 69.1, 768692.2 6277898.1 69.2, 768699.2 6277898 69.2, 768699.1 6277896.4 69.2, 768704.9 6277896.1 69.2, 768704.8 6277893 69.2, 768706.7 6277890.3 72.5, 768707.6 6277890.9 72.5, 768708.8 6277891.8 69.7, 768710.7 6277889.4 72.2, 768713.5 6277886 72.2, 768712.4 6277885.1 72.2, 768717.4 6277878.4 72.2, 768718.5 6277879.4 72.2, 768725.2 6277870.9 72.2, 768724 6277869.9 72.2, 768726 6277867.5 69.8, 768723.2 6277865.3 69.8, 768721.1 6277868 72.6, 768716.2 6277864 72.5, 768715.2 6277865.2 72.5, 768713.3 6277863.4 69.9, 768711.3 6277865.7 72.7, 768709.1 6277863.7 69.4, 768705.4 6277868.2 69.4, 768707.7 6277869.9 72.7, 768707.3 6277870.6 72.7, 768711.8 6277874 72.6, 768709.9 6277876.4 72.6, 768705.5 6277872.8 72.6, 768705 6277873.5 72.6, 768702.9 6277871.6 67.8, 768700.6 6277874.4 68.5, 768699 6277876.6 68.2, 768701.5 6277878.1 72.5, 768699.4 6277880.6 69.6, 768701.6 6277882.4 72.6, 768699.9 6277884.9 72.6, 768697.3 6277882.6 69.5, 768695.9 6277882.4 69.5, 768695.8 6277883.9 69.5, 768692.3 6277883.9 69.5, 768692.2 6277887.2 69.5, 768691.1 6277887.1 66.6, 768690.8 6277892.5 66.6, 768692.3 6277892.5 69.1))
-BATIMENT0000000335205403;Indifférenciée;Résidentiel;Annexe;Non;En service;2014-06-19 12:27:04;2019-04-08 10:00:52;2012-01-01;2012-07-01;;;2.5;1.5;2.0;1.0;1.0;2.0;7.8;45.0;;;;Imagerie aérienne;C 0.5;POLYGON Z ((767969.1 6278375 52.8, 767953.5 6278391.6 52.8, 767962.9 6278400.3 52.8, 767978.4 6278383.9 52.8, 767969.1 6278375 52.8))
-BATIMENT0000000335205409;Indifférenciée;Résidentiel;Annexe;Non;En service;2014-06-19 12:27:04;2019-04-08 10:00:52;2012-01-01;2012-07-01;;;2.5;1.5;4.0;1.0;0.0;0.0;9.6;43.6;;;;Imagerie aérienne;C 0.5;POLYGON Z ((767950.8 6278391.4 48.4, 767913.2 6278432.1 48.4, 767914.7 6278433.6 53.2, 767924.3 6278442.4 53.2, 767962.1 6278401.6 53.2, 767952.5 6278392.7 53.2, 767950.8 6278391.4 48.4))
-BATIMENT0000000335205423;Indifférenciée;Résidentiel;Annexe;Non;En service;2014-06-19 12:27:04;2019-04-08 10:00:52;2012-01-01;2012-07-01;;;2.5;1.5;2.0;1.0;1.0;2.0;8.9;43.9;;;;Imagerie aérienne;C 0.6;POLYGON Z ((767969.2 6278372 47.5, 767970.6 6278373.3 52.5, 767979.9 6278382.2 52.8, 767995.7 6278365.2 52.8, 767986.5 6278356.7 52.5, 767984.7 6278355.1 47.6, 767969.2 6278372 47.5))
-BATIMENT0000000335445326;Industriel, agricole ou commercial;Résidentiel;Annexe;Non;En service;2014-06-25 12:00:41;2019-04-08 10:00:52;;2012-07-01;;;2.5;1.5;7.0;4.0;0.0;0.0;3.3;38.2;;;;Imagerie aérienne;C 0.4;POLYGON Z ((768726.8 6278262.7 41.5, 768722.2 6278262.4 41.5, 768722.1 6278264.9 41.5, 768699 6278262.7 41.5, 768698.1 6278274.6 41.5, 768716 6278286.6 41.5, 768721.5 6278290.5 41.5, 768719.1 6278291.8 41.5, 768723.3 6278294.7 41.5, 768720.9 6278295.8 41.5, 768726.6 6278299.7 41.5, 768729.3 6278298.6 41.5, 768722.5 6278285.6 41.5, 768724.9 6278284.7 41.5, 768726.5 6278265.8 41.5, 768726.8 6278262.7 41.5))
-BATIMENT0000002000330145;Indifférenciée;Résidentiel;Annexe;Non;En service;2016-11-10 15:15:48;2019-04-08 10:00:52;2015-01-01;2015-07-01;;;2.5;1.5;6.0;2.0;0.0;0.0;7.2;40.1;;;;Imagerie aérienne;A 1.0;POLYGON Z ((767902.7 6278129.8 47.3, 767896.3 6278142.7 47.3, 767915.4 6278152.3 47.3, 767921.5 6278139.4 47.3, 767902.7 6278129.8 47.3))
-BATIMENT0000002000330258;Indifférenciée;Résidentiel;Annexe;Non;En service;2016-11-10 15:15:48;2019-04-08 10:00:52;2011-01-01;2015-07-01;;;2.5;1.5;14.0;5.0;0.0;0.0;15.3;44.9;;;;Imagerie aérienne;C 0.4;POLYGON Z ((768355 6278037.7 60.2, 768362.2 6278034.7 60.2, 768361.3 6278032.5 60.2, 768368.4 6278029.8 60.2, 768353.6 6277993.3 60.2, 768353.6 6277993.2 60.2, 768345.9 6277996.1 60.2, 768346.7 6277998 60.2, 768339.8 6278000.9 60.2, 768355 6278037.7 60.2))
-BATIMENT0000002000330366;Indifférenciée;Résidentiel;Annexe;Non;En service;2016-11-10 15:15:48;2019-04-08 10:00:52;2011-01-01;2015-07-01;;;2.5;1.5;29.0;5.0;0.0;0.0;15.7;45.7;;;;Imagerie aérienne;C 0.7;POLYGON Z ((768358.5 6278044.5 61.4, 768373.3 6278075 60.8, 768374.1 6278076.6 58.5, 768379.6 6278073.8 58.5, 768380.3 6278075.2 58.5, 768383.4 6278073.7 60.7, 768388.8 6278071.3 60.7, 768386.1 6278065.1 60.7, 768383.4 6278061.8 57.9, 768381.3 6278062.7 60.6, 768369.6 6278038.8 60.6, 768358.5 6278044.5 61.4))
-BATIMENT0000002000330370;Indifférenciée;Résidentiel;;Non;En service;2016-11-10 15:15:48;2019-04-08 10:00:52;1970-01-01;2015-07-01;;;2.5;1.5;2.0;2.0;1.0;1.0;4.2;43.1;;;;Imagerie aérienne;C 0.3;POLYGON Z ((768641.6 6278465.7 47.3, 768641.6 6278461.6 47.2, 768642.8 6278461.5 47.2, 768642.7 6278453.7 47.2, 768634 6278449.5 47.3, 768635 6278473.6 47.3, 768643.9 6278473.4 47.3, 768643.8 6278471.2 47.3, 768636.6 6278471.4 47.3, 768636.4 6278465.9 47.3, 768641.6 6278465.7 47.3))
-BATIMENT0000002101819270;Indifférenciée;Résidentiel;;Non;En service;2018-11-09 10:15:07;2019-04-08 10:00:52;1969-01-01;;DGFiP;;5.0;9999.0;1.0;2.0;50.0;10.0;0.0;;;;;Cadastre;C 0.2;POLYGON Z ((768420.8 6278164.5 -1000, 768425.7 6278170.8 -1000, 768430.8 6278176.6 -1000, 768433.9 6278180 -1000, 768441.1 6278177.8 -1000, 768444 6278166.9 -1000, 768437.6 6278165.2 -1000, 768435.9 6278171.6 -1000, 768434.7 6278172 -1000, 768426.3 6278160.7 -1000, 768420.8 6278164.5 -1000))
-BATIMENT0000000044594084;Indifférenciée;Sportif;;Non;En service;2006-12-12 11:20:44;2019-03-15 19:18:06;;;;;2.5;1.5;;;;;8.1;46.7;;58.4;48.9;Imagerie aérienne;;POLYGON Z ((768388.8 6278211 56.9, 768427.5 6278230.7 56.9, 768434.2 6278219.5 56.9, 768440.8 6278221.2 56.9, 768442.2 6278203.9 56.9, 768431.8 6278199.1 56.9, 768418.7 6278182.8 56.9, 768410.4 6278189.4 56.9, 768402.4 6278185.7 56.9, 768388.5 6278194.2 56.9, 768392.9 6278198.4 56.9, 768388.8 6278211 56.9))
-BATIMENT0000002274991911;Indifférenciée;Résidentiel;;Non;En service;2021-11-18 10:38:25;2021-12-08 15:45:21;;;DGFiP 2021-11-09;;5.0;9999.0;;;;;;;;;;Cadastre;;POLYGON Z ((767882.2 6277903.1 -1000, 767882.5 6277904.1 -1000, 767884.4 6277910.9 -1000, 767890.5 6277909.3 -1000, 767888.7 6277902.5 -1000, 767888.5 6277901.5 -1000, 767882.2 6277903.1 -1000))
-BATIMENT0000000211117292;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:25:44;2021-12-02 15:42:45;;;DGFiP;;5.0;9999.0;3.0;2.0;50.0;10.0;;;;;;Cadastre;A 1.0;POLYGON Z ((768495.8 6277865 -1000, 768502.3 6277869.6 -1000, 768556.2 6277895.6 -1000, 768563.1 6277887.2 -1000, 768548.6 6277875.5 -1000, 768547.3 6277877.1 -1000, 768543.1 6277873.7 -1000, 768544.4 6277872.2 -1000, 768531.1 6277861.4 -1000, 768529.4 6277864 -1000, 768519.9 6277857.4 -1000, 768537.1 6277832.7 -1000, 768524.3 6277823.9 -1000, 768495.8 6277865 -1000))
-BATIMENT0000000211117293;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:25:44;2021-12-02 15:42:45;1979-01-01;;DGFiP;;5.0;9999.0;1.0;1.0;40.0;10.0;;;;;;Cadastre;C 0.2;POLYGON Z ((768584.1 6277850.7 -1000, 768572.4 6277844.5 -1000, 768569.9 6277849.3 -1000, 768572.1 6277850.4 -1000, 768568.9 6277856.6 -1000, 768557 6277850.4 -1000, 768550.7 6277862.3 -1000, 768569.8 6277872.3 -1000, 768567.4 6277877 -1000, 768572.2 6277879.4 -1000, 768583.8 6277857.2 -1000, 768581.3 6277856 -1000, 768584.1 6277850.7 -1000))
-BATIMENT0000000211117204;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:25:44;2021-12-02 15:42:49;1986-01-01;;DGFiP;;5.0;9999.0;1.0;2.0;4.0;1.0;;;;;;Cadastre;C 0.3;POLYGON Z ((768382.1 6277913.9 -1000, 768376 6277904.7 -1000, 768374.5 6277905.7 -1000, 768371.7 6277901.5 -1000, 768372.5 6277901 -1000, 768370.1 6277897.3 -1000, 768369.3 6277897.8 -1000, 768366 6277892.9 -1000, 768367.4 6277891.8 -1000, 768364.9 6277888 -1000, 768354.9 6277894.7 -1000, 768352.5 6277893.6 -1000, 768348.2 6277886.9 -1000, 768328.7 6277899.5 -1000, 768333.3 6277906.7 -1000, 768332.4 6277907.1 -1000, 768336.8 6277913.9 -1000, 768351.6 6277904.4 -1000, 768355 6277909 -1000, 768351.3 6277911.8 -1000, 768353.2 6277914.3 -1000, 768356.9 6277911.5 -1000, 768366.2 6277923.9 -1000, 768382.1 6277913.9 -1000))
-BATIMENT0000000211110366;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:19:53;2021-12-02 15:42:57;2000-01-01;;;;3.0;2.5;1.0;2.0;50.0;10.0;5.9;53.3;59.2;60.0;53.3;Cadastre;A 1.0;POLYGON Z ((768081.7 6278408.3 59.2, 768090.7 6278401 59.2, 768089.6 6278399.2 59.2, 768085.7 6278394.7 59.2, 768076.7 6278402 59.2, 768077.5 6278403.1 59.2, 768075.2 6278405.5 59.2, 768071.6 6278402.2 59.2, 768068.6 6278405.4 59.2, 768074.8 6278411.1 59.2, 768079.6 6278405.8 59.2, 768081.7 6278408.3 59.2))
-BATIMENT0000000211116372;Indifférenciée;Commercial et services;;Non;En service;2008-11-18 15:25:02;2021-12-02 15:43:00;;;;;3.0;2.5;0.0;5.0;;;15.4;36.9;52.3;53.1;38.3;Cadastre;C 0.5;POLYGON Z ((767934.1 6277950.8 52.3, 767944.7 6277947.8 52.3, 767943.2 6277942 52.3, 767941.8 6277936.4 52.3, 767941.6 6277935.8 52.3, 767940.1 6277930.3 52.3, 767938.3 6277923.3 52.3, 767938 6277922.8 52.3, 767937.5 6277922.5 52.3, 767937 6277922.2 52.3, 767936.1 6277922.2 52.3, 767935.2 6277922.4 52.3, 767930.7 6277923.6 52.3, 767926.8 6277924.7 52.3, 767917.8 6277927 52.3, 767913.9 6277928.1 52.3, 767907.5 6277929.8 52.3, 767903.7 6277930.8 52.3, 767902.3 6277931.2 52.3, 767898.4 6277932.2 52.3, 767891.6 6277934 52.3, 767891.1 6277932.5 52.3, 767890 6277928.4 52.3, 767889.7 6277927.3 52.3, 767888.7 6277923.2 52.3, 767887.2 6277918.6 52.3, 767876.1 6277921.6 52.3, 767878.1 6277927.2 52.3, 767879.6 6277932.8 52.3, 767880 6277934.3 52.3, 767881.5 6277939.9 52.3, 767883.1 6277946.9 52.3, 767883.6 6277947.2 52.3, 767884.4 6277947.3 52.3, 767885 6277947.3 52.3, 767885.8 6277947 52.3, 767890.9 6277945.6 52.3, 767896.5 6277944.1 52.3, 767904 6277942.2 52.3, 767909.6 6277940.7 52.3, 767914.3 6277939.4 52.3, 767919.9 6277937.9 52.3, 767920.8 6277937.7 52.3, 767926.4 6277936.2 52.3, 767930 6277935.3 52.3, 767930.6 6277937 52.3, 767931.6 6277941 52.3, 767931.9 6277942.3 52.3, 767932.9 6277946.2 52.3, 767934.1 6277950.8 52.3))
-BATIMENT0000002274991912;Indifférenciée;Résidentiel;;Non;En service;2021-11-18 10:38:25;2021-12-08 15:45:21;;;DGFiP 2021-11-09;;5.0;9999.0;;;;;;;;;;Cadastre;;POLYGON Z ((767888.7 6277902.5 -1000, 767890.5 6277909.3 -1000, 767890.8 6277910.2 -1000, 767897 6277908.6 -1000, 767896.7 6277907.7 -1000, 767894.9 6277900.8 -1000, 767888.7 6277902.5 -1000))
-BATIMENT0000002274991913;Indifférenciée;Résidentiel;;Non;En service;2021-11-18 10:38:25;2021-12-08 15:45:21;;;DGFiP 2021-11-09;;5.0;9999.0;;;;;;;;;;Cadastre;;POLYGON Z ((767894.6 6277899.9 -1000, 767894.9 6277900.8 -1000, 767896.7 6277907.7 -1000, 767902.9 6277906 -1000, 767901.1 6277899.2 -1000, 767900.9 6277898.2 -1000, 767894.6 6277899.9 -1000))
-BATIMENT0000002274991914;Indifférenciée;Résidentiel;;Non;En service;2021-11-18 10:38:25;2021-12-08 15:45:21;;;DGFiP 2021-11-09;;5.0;9999.0;;;;;;;;;;Cadastre;;POLYGON Z ((767901.1 6277899.2 -1000, 767902.9 6277906 -1000, 767903.1 6277907 -1000, 767909.3 6277905.2 -1000, 767907.3 6277897.6 -1000, 767901.1 6277899.2 -1000))
-BATIMENT0000002274991915;Indifférenciée;Résidentiel;;Non;En service;2021-11-18 10:38:25;2021-12-08 15:45:21;;;DGFiP 2021-11-09;;5.0;9999.0;;;;;;;;;;Cadastre;;POLYGON Z ((767907.8 6277899.5 -1000, 767909.3 6277905.2 -1000, 767909.8 6277907.3 -1000, 767916.1 6277905.5 -1000, 767914 6277897.9 -1000, 767907.8 6277899.5 -1000))
-BATIMENT0000002274991916;Indifférenciée;Résidentiel;;Oui;En service;2021-11-18 10:38:25;2021-12-08 15:45:21;;;DGFiP 2021-11-09;;5.0;9999.0;;;;;;;;;;Cadastre;;POLYGON Z ((767928.3 6277912.8 -1000, 767929.8 6277918.4 -1000, 767937.8 6277916.2 -1000, 767933.8 6277911.6 -1000, 767933.2 6277911.5 -1000, 767928.3 6277912.8 -1000))
-BATIMENT0000002274991909;Indifférenciée;Résidentiel;;Non;En service;2021-11-18 10:38:25;2021-12-08 15:45:21;;;DGFiP 2021-11-09;;5.0;9999.0;;;;;;;;;;Cadastre;;POLYGON Z ((767869.6 6277911.3 -1000, 767871.2 6277917.6 -1000, 767879 6277915.6 -1000, 767878.4 6277913.5 -1000, 767877.3 6277909.2 -1000, 767869.6 6277911.3 -1000))
-BATIMENT0000002274991910;Indifférenciée;Résidentiel;;Non;En service;2021-11-18 10:38:25;2021-12-08 15:45:21;;;DGFiP 2021-11-09;;5.0;9999.0;;;;;;;;;;Cadastre;;POLYGON Z ((767876.3 6277905.7 -1000, 767877.3 6277909.2 -1000, 767878.4 6277913.5 -1000, 767884.6 6277911.9 -1000, 767884.4 6277910.9 -1000, 767882.5 6277904.1 -1000, 767876.3 6277905.7 -1000))
-BATIMENT0000002275435333;Indifférenciée;Résidentiel;;Non;En service;2021-12-09 16:35:01;;;;DGFiP;;3.0;9999.0;;;;;;;;;;Cadastre;;POLYGON Z ((768522.9 6278448.9 -1000, 768527.6 6278447.9 -1000, 768531.6 6278446.1 -1000, 768523.5 6278444.9 -1000, 768522.9 6278448.9 -1000))
-BATIMENT0000002275435334;Indifférenciée;Résidentiel;;Oui;En service;2021-12-09 16:35:03;;;;DGFiP;;5.0;9999.0;;;;;;;;;;Cadastre;;POLYGON Z ((768570.8 6277847.5 -1000, 768572.4 6277844.5 -1000, 768577.2 6277847 -1000, 768577.6 6277846.2 -1000, 768571 6277842.6 -1000, 768568.9 6277846.5 -1000, 768570.8 6277847.5 -1000))
-BATIMENT0000002275435335;Indifférenciée;Résidentiel;;Oui;En service;2021-12-09 16:35:03;;;;DGFiP;;5.0;9999.0;;;;;;;;;;Cadastre;;POLYGON Z ((768560.5 6277852.3 -1000, 768568.9 6277856.6 -1000, 768572.1 6277850.4 -1000, 768569.9 6277849.3 -1000, 768567.6 6277853.7 -1000, 768561.5 6277850.5 -1000, 768560.5 6277852.3 -1000))
-BATIMENT0000002275435336;Indifférenciée;Résidentiel;;Oui;En service;2021-12-09 16:35:03;;;;DGFiP;;5.0;9999.0;;;;;;;;;;Cadastre;;POLYGON Z ((768569.8 6277872.3 -1000, 768559 6277866.6 -1000, 768558 6277868.5 -1000, 768568.8 6277874.3 -1000, 768569.8 6277872.3 -1000))
-BATIMENT0000002275435337;Indifférenciée;Résidentiel;;Oui;En service;2021-12-09 16:35:03;;;;DGFiP;;5.0;9999.0;;;;;;;;;;Cadastre;;POLYGON Z ((768583.8 6277857.2 -1000, 768586.1 6277852.8 -1000, 768583.6 6277851.6 -1000, 768581.3 6277856 -1000, 768583.8 6277857.2 -1000))
-BATIMENT0000002275435338;Indifférenciée;Résidentiel;;Oui;En service;2021-12-09 16:35:03;;;;DGFiP;;5.0;9999.0;;;;;;;;;;Cadastre;;POLYGON Z ((768551.5 6277861 -1000, 768554.3 6277855.7 -1000, 768552.3 6277854.7 -1000, 768549.5 6277860 -1000, 768551.5 6277861 -1000))
-BATIMENT0000002275435339;Indifférenciée;Résidentiel;;Oui;En service;2021-12-09 16:35:03;;;;DGFiP;;5.0;9999.0;;;;;;;;;;Cadastre;;POLYGON Z ((768561.1 6277898 -1000, 768569.5 6277902.1 -1000, 768573.2 6277895.4 -1000, 768566.9 6277890.4 -1000, 768561.1 6277898 -1000))
-BATIMENT0000002275435363;Indifférenciée;Résidentiel;;Oui;En service;2021-12-09 16:35:36;;;;DGFiP;;5.0;9999.0;;;;;;;;;;Cadastre;;POLYGON Z ((768348.2 6277886.9 -1000, 768347.2 6277885.4 -1000, 768344.2 6277887.2 -1000, 768345.3 6277888.8 -1000, 768348.2 6277886.9 -1000))
-BATIMENT0000002275435364;Indifférenciée;Résidentiel;;Non;En service;2021-12-09 16:35:36;;;;DGFiP;;3.0;9999.0;;;;;;;;;;Cadastre;;POLYGON Z ((768309.1 6277935.9 -1000, 768313.7 6277932.9 -1000, 768311.2 6277928.8 -1000, 768306.5 6277931.6 -1000, 768309.1 6277935.9 -1000))
-BATIMENT0000002275435365;Indifférenciée;Résidentiel;;Oui;En service;2021-12-09 16:35:36;;;;DGFiP;;5.0;9999.0;;;;;;;;;;Cadastre;;POLYGON Z ((768353.9 6277920.9 -1000, 768356.2 6277919 -1000, 768351.7 6277912.3 -1000, 768348.7 6277914.3 -1000, 768353.9 6277920.9 -1000))
-BATIMENT0000002275435366;Indifférenciée;Résidentiel;;Oui;En service;2021-12-09 16:35:36;;;;DGFiP;;5.0;9999.0;;;;;;;;;;Cadastre;;POLYGON Z ((768350.2 6277905.2 -1000, 768341.8 6277910.6 -1000, 768342.8 6277912.1 -1000, 768351.2 6277906.8 -1000, 768350.2 6277905.2 -1000))
-BATIMENT0000002275435367;Indifférenciée;Résidentiel;;Non;En service;2021-12-09 16:35:36;;;;DGFiP;;5.0;9999.0;;;;;;;;;;Cadastre;;POLYGON Z ((768300.4 6277940.4 -1000, 768304.9 6277937.6 -1000, 768303.3 6277934.9 -1000, 768298.7 6277937.6 -1000, 768300.4 6277940.4 -1000))
-BATIMENT0000002275435368;Indifférenciée;Résidentiel;;Oui;En service;2021-12-09 16:35:36;;;;DGFiP;;5.0;9999.0;;;;;;;;;;Cadastre;;POLYGON Z ((768342.7 6277890.4 -1000, 768341.7 6277889 -1000, 768336.5 6277893.7 -1000, 768336.8 6277894.3 -1000, 768342.7 6277890.4 -1000))
-BATIMENT0000002275435369;Indifférenciée;Résidentiel;;Oui;En service;2021-12-09 16:35:36;;;;DGFiP;;5.0;9999.0;;;;;;;;;;Cadastre;;POLYGON Z ((768356.9 6277911.5 -1000, 768354.9 6277913 -1000, 768362.5 6277922.3 -1000, 768364.1 6277921.1 -1000, 768356.9 6277911.5 -1000))
-BATIMENT0000002275435397;Indifférenciée;Résidentiel;;Non;En service;2021-12-09 16:36:04;;;;DGFiP;;5.0;9999.0;;;;;;;;;;Cadastre;;POLYGON Z ((768083.3 6278391.3 -1000, 768085.7 6278394.7 -1000, 768089.6 6278399.2 -1000, 768093.6 6278396 -1000, 768090 6278385.9 -1000, 768083.3 6278391.3 -1000))
-BATIMENT0000002275435411;Indifférenciée;Résidentiel;;Non;En service;2021-12-09 16:36:27;;;;DGFiP;;5.0;9999.0;;;;;;;;;;Cadastre;;POLYGON Z ((767878.1 6277927.2 -1000, 767876.2 6277927.7 -1000, 767877.6 6277933.3 -1000, 767879.6 6277932.8 -1000, 767878.1 6277927.2 -1000))
-BATIMENT0000002275435412;Indifférenciée;Résidentiel;;Non;En service;2021-12-09 16:36:27;;;;DGFiP;;5.0;9999.0;;;;;;;;;;Cadastre;;POLYGON Z ((767880 6277934.3 -1000, 767878 6277934.7 -1000, 767879.5 6277940.4 -1000, 767881.5 6277939.9 -1000, 767880 6277934.3 -1000))
-BATIMENT0000002275435413;Indifférenciée;Résidentiel;;Non;En service;2021-12-09 16:36:27;;;;DGFiP;;5.0;9999.0;;;;;;;;;;Cadastre;;POLYGON Z ((767890.9 6277945.6 -1000, 767891.5 6277947.6 -1000, 767897.1 6277946.1 -1000, 767896.5 6277944.1 -1000, 767890.9 6277945.6 -1000))
-BATIMENT0000002275435414;Indifférenciée;Résidentiel;;Non;En service;2021-12-09 16:36:27;;;;DGFiP;;5.0;9999.0;;;;;;;;;;Cadastre;;POLYGON Z ((767904 6277942.2 -1000, 767904.5 6277944.1 -1000, 767910.1 6277942.6 -1000, 767909.6 6277940.7 -1000, 767904 6277942.2 -1000))
-BATIMENT0000002275435415;Indifférenciée;Résidentiel;;Non;En service;2021-12-09 16:36:27;;;;DGFiP;;5.0;9999.0;;;;;;;;;;Cadastre;;POLYGON Z ((767914.3 6277939.4 -1000, 767914.9 6277941.4 -1000, 767920.5 6277939.9 -1000, 767919.9 6277937.9 -1000, 767914.3 6277939.4 -1000))
-BATIMENT0000002275435416;Indifférenciée;Résidentiel;;Non;En service;2021-12-09 16:36:27;;;;DGFiP;;5.0;9999.0;;;;;;;;;;Cadastre;;POLYGON Z ((767920.8 6277937.7 -1000, 767921.4 6277939.7 -1000, 767927 6277938.2 -1000, 767926.4 6277936.2 -1000, 767920.8 6277937.7 -1000))
-BATIMENT0000002275435417;Indifférenciée;Résidentiel;;Non;En service;2021-12-09 16:36:27;;;;DGFiP;;5.0;9999.0;;;;;;;;;;Cadastre;;POLYGON Z ((767930.6 6277937 -1000, 767928.7 6277937.6 -1000, 767929.7 6277941.5 -1000, 767931.6 6277941 -1000, 767930.6 6277937 -1000))
-BATIMENT0000002275435418;Indifférenciée;Résidentiel;;Non;En service;2021-12-09 16:36:27;;;;DGFiP;;5.0;9999.0;;;;;;;;;;Cadastre;;POLYGON Z ((767931.9 6277942.3 -1000, 767930 6277942.8 -1000, 767931.1 6277946.6 -1000, 767932.9 6277946.2 -1000, 767931.9 6277942.3 -1000))
-BATIMENT0000002275435419;Indifférenciée;Résidentiel;;Non;En service;2021-12-09 16:36:27;;;;DGFiP;;5.0;9999.0;;;;;;;;;;Cadastre;;POLYGON Z ((767943.2 6277942 -1000, 767945.2 6277941.4 -1000, 767943.7 6277935.8 -1000, 767941.8 6277936.4 -1000, 767943.2 6277942 -1000))
-BATIMENT0000002275435420;Indifférenciée;Résidentiel;;Non;En service;2021-12-09 16:36:27;;;;DGFiP;;5.0;9999.0;;;;;;;;;;Cadastre;;POLYGON Z ((767941.6 6277935.8 -1000, 767943.5 6277935.3 -1000, 767942.1 6277929.7 -1000, 767940.1 6277930.3 -1000, 767941.6 6277935.8 -1000))
-BATIMENT0000002275435421;Indifférenciée;Résidentiel;;Non;En service;2021-12-09 16:36:27;;;;DGFiP;;5.0;9999.0;;;;;;;;;;Cadastre;;POLYGON Z ((767930.7 6277923.6 -1000, 767930.3 6277921.7 -1000, 767926.4 6277922.8 -1000, 767926.8 6277924.7 -1000, 767930.7 6277923.6 -1000))
-BATIMENT0000002275435422;Indifférenciée;Résidentiel;;Non;En service;2021-12-09 16:36:27;;;;DGFiP;;5.0;9999.0;;;;;;;;;;Cadastre;;POLYGON Z ((767917.8 6277927 -1000, 767917.2 6277925.1 -1000, 767913.4 6277926.2 -1000, 767913.9 6277928.1 -1000, 767917.8 6277927 -1000))
-BATIMENT0000002275435423;Indifférenciée;Résidentiel;;Non;En service;2021-12-09 16:36:27;;;;DGFiP;;5.0;9999.0;;;;;;;;;;Cadastre;;POLYGON Z ((767907.5 6277929.8 -1000, 767907 6277927.8 -1000, 767903.1 6277928.9 -1000, 767903.7 6277930.8 -1000, 767907.5 6277929.8 -1000))
-BATIMENT0000002275435424;Indifférenciée;Résidentiel;;Non;En service;2021-12-09 16:36:27;;;;DGFiP;;5.0;9999.0;;;;;;;;;;Cadastre;;POLYGON Z ((767902.3 6277931.2 -1000, 767901.8 6277929.2 -1000, 767898 6277930.2 -1000, 767898.4 6277932.2 -1000, 767902.3 6277931.2 -1000))
-BATIMENT0000002275435425;Indifférenciée;Résidentiel;;Non;En service;2021-12-09 16:36:27;;;;DGFiP;;5.0;9999.0;;;;;;;;;;Cadastre;;POLYGON Z ((767891.1 6277932.5 -1000, 767893 6277932 -1000, 767891.9 6277927.8 -1000, 767890 6277928.4 -1000, 767891.1 6277932.5 -1000))
-BATIMENT0000002275435426;Indifférenciée;Résidentiel;;Non;En service;2021-12-09 16:36:27;;;;DGFiP;;5.0;9999.0;;;;;;;;;;Cadastre;;POLYGON Z ((767889.7 6277927.3 -1000, 767891.6 6277926.7 -1000, 767890.5 6277922.6 -1000, 767888.7 6277923.2 -1000, 767889.7 6277927.3 -1000))
-""")
+        _sio = AbstractGeoDataFrameDemos._dataset(
+            "GeoDataFrameDemos3", "irisPasDuLoupInMontpellierBuildings.csv"
+        )
         return GeoDataFrameLib.read_csv(_sio)
 
     @staticmethod
@@ -850,326 +84,9 @@ BDT_3-0_SHP_LAMB93_D034-ED2021-12-15/TRANSPORT/TRONCON_DE_ROUTE.shp', bbox=grid)
         # roads = clip(roads, pasDuLoup)
         # roads = roads[ (roads.length > 0) ]
         '''
-        _sio = StringIO("""ID;NATURE;NOM_1_G;NOM_1_D;NOM_2_G;NOM_2_D;IMPORTANCE;FICTIF;POS_SOL;ETAT;DATE_CREAT;DATE_MAJ;DATE_APP;DATE_CONF;SOURCE;ID_SOURCE;PREC_PLANI;PREC_ALTI;NB_VOIES;LARGEUR;IT_VERT;PRIVE;SENS;CYCLABLE;BUS;URBAIN;VIT_MOY_VL;ACCES_VL;ACCES_PED;FERMETURE;NAT_RESTR;RESTR_H;RESTR_P;RESTR_PPE;RESTR_LAR;RESTR_LON;RESTR_MAT;BORNEDEB_G;BORNEDEB_D;BORNEFIN_G;BORNEFIN_D;INSEECOM_G;INSEECOM_D;TYP_ADRES;ALIAS_G;ALIAS_D;C_POSTAL_G;C_POSTAL_D;DATE_SERV;ID_VOIE_G;ID_VOIE_D;ID_RN;ID_ITI;NUMERO;NUM_EUROP;CL_ADMIN;GESTION;TOPONYME;ITI_CYCL;VOIE_VERTE;NATURE_ITI;NOM_ITI;geometry
-TRONROUT0000000240976886;Sentier;;;;;6;Non;0;En service;2010-07-16 12:50:50;;;;;;2.5;1.5;;;Non;Non;Sans objet;;;Oui;0;Physiquement impossible;;;;;;;;;Non;;;;;34172;34172;Classique;;;;;;;;;;;;;;;;;;;LINESTRING Z (768813.9 6278284.1 37.2, 768801.3 6278303.2 37)
-TRONROUT0000000044843837;Route à 1 chaussée;R DU LAVANDIN;R DU LAVANDIN;;;5;Non;0;En service;2006-12-12 11:20:44;2011-09-09 10:55:38;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;274.0;275.0;156.0;157.0;34172;34172;Métrique;;;34070.0;34070.0;;341723193;341723193;;;;;;;;;;;;LINESTRING Z (768909.2 6278274.8 36, 768839.6 6278308.9 37.3, 768826.1 6278313.3 37.3, 768817.3 6278311.1 37.3, 768806.3 6278306.2 37.3, 768801.3 6278303.2 37)
-TRONROUT0000000044843876;Rond-point;;;;;5;Non;0;En service;2006-12-12 11:20:44;2018-11-14 08:46:16;;;;;2.5;1.5;1.0;3.0;Non;Non;Sens direct;;;Oui;25;Libre;;;;;;;;;Non;;;;;34172;34172;Métrique;;;;;;;;;;;;;;;;;;;LINESTRING Z (768768.6 6278300.2 40, 768765.1 6278301.2 38.5, 768761.9 6278301.7 38.5, 768757.9 6278301.1 38.5, 768754.1 6278299.5 38.5, 768751 6278296.7 38.5, 768749.3 6278293.6 38.6, 768748.7 6278290.1 38.5)
-TRONROUT0000000044843868;Route à 1 chaussée;R DU LAVANDIN;R DU LAVANDIN;;;5;Non;0;En service;2006-12-12 11:20:44;2011-09-09 10:55:38;;;;;2.5;1.5;1.0;4.0;Non;Non;Sens direct;;;Oui;30;Libre;;;;;;;;;Non;;155.0;;123.0;34172;34172;Métrique;;;34070.0;34070.0;;341723193;341723193;;;;;;;;;;;;LINESTRING Z (768801.3 6278303.2 37, 768794 6278298.7 37.4, 768781.8 6278296.1 37.4, 768768.6 6278300.2 40)
-TRONROUT0000000044843797;Route à 1 chaussée;R DU LAVANDIN;R DU LAVANDIN;;;5;Non;0;En service;2006-12-12 11:20:44;2015-10-05 19:17:23;;;;;2.5;1.5;1.0;3.0;Non;Non;Sens direct;;;Oui;30;Libre;;;;;;;;;Non;;86.0;;120.0;34172;34172;Métrique;;;34070.0;34070.0;;341723193;341723193;;;;;;;;;;;;LINESTRING Z (768735.9 6278316.5 38.5, 768747 6278298 37.5, 768748.7 6278290.1 38.5)
-TRONROUT0000000044843870;Route à 1 chaussée;R DU LAVANDIN;R DU LAVANDIN;;;5;Non;0;En service;2006-12-12 11:20:44;2015-10-05 19:17:23;;;;;2.5;1.5;1.0;3.0;Non;Non;Sens direct;;;Oui;30;Libre;;;;;;;;;Non;120.0;121.0;86.0;85.0;34172;34172;Métrique;;;34070.0;34070.0;;341723193;341723193;;;;;;;;;;;;LINESTRING Z (768768.6 6278300.2 40, 768753.9 6278307.5 38.8, 768748.5 6278310.2 38.4, 768735.9 6278316.5 38.5)
-TRONROUT0000000044843793;Route à 1 chaussée;R DU LAVANDIN;R DU LAVANDIN;;;5;Non;0;En service;2006-12-12 11:20:44;2019-12-12 11:13:15;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;84.0;83.0;56.0;55.0;34172;34172;Métrique;;;34070.0;34070.0;;341723193;341723193;;;;;;;;;;;;LINESTRING Z (768735.9 6278316.5 38.5, 768717.6 6278324.5 39.2, 768705.5 6278329.9 39)
-TRONROUT0000000044843835;Route à 1 chaussée;R DU PAS DU LOUP;R DU PAS DU LOUP;;;4;Non;0;En service;2006-12-12 11:20:44;2012-01-10 11:04:44;;;;;2.5;1.5;2.0;6.0;Non;Non;Sens direct;;;Oui;40;Libre;;;;;;;;;Non;74.0;75.0;48.0;49.0;34172;34172;Métrique;;;34070.0;34070.0;;341724150;341724150;;;;;;;;;;;;LINESTRING Z (768590.6 6278324.5 41.5, 768598.2 6278327.4 40.8, 768612 6278334 41, 768623.7 6278340.2 41.1)
-TRONROUT0000002206071298;Route à 1 chaussée;R DU LAVANDIN;R DU LAVANDIN;;;5;Non;0;En service;2019-12-12 11:13:15;;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;56.0;55.0;2.0;1.0;34172;34172;Métrique;;;34070.0;34070.0;;341723193;341723193;;;;;;;;;;;;LINESTRING Z (768705.5 6278329.9 39, 768691.2 6278337.2 39)
-TRONROUT0000000044843891;Route à 1 chaussée;;;;;4;Non;0;En service;2006-12-12 11:20:44;2019-12-12 11:13:15;;;;;2.5;1.5;2.0;5.0;Non;Non;Sens direct;;;Oui;40;Libre;;;;;;;;;Non;;;;;34172;34172;Classique;;;;;;;;;;;;;;;;;;;LINESTRING Z (768600.5 6278343.7 42.4, 768595.8 6278332.1 42.1, 768590.6 6278324.5 41.5)
-TRONROUT0000000044843823;Route à 1 chaussée;R DU PAS DU LOUP;R DU PAS DU LOUP;;;4;Non;0;En service;2006-12-12 11:20:44;2012-01-10 11:02:47;;;;;2.5;1.5;2.0;6.0;Non;Non;Sens direct;;;Oui;40;Libre;;;;;;;;;Non;46.0;47.0;42.0;41.0;34172;34172;Métrique;;;34070.0;34070.0;;341724150;341724150;;;;;;;;;;;;LINESTRING Z (768623.7 6278340.2 41.1, 768627.5 6278342.2 41.1)
-TRONROUT0000000044843853;Route à 1 chaussée;R DE L'ESCOUTADOU;R DE L'ESCOUTADOU;;;5;Non;0;En service;2006-12-12 11:20:44;2012-01-10 14:13:06;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;0;Restreint aux ayants droit;;;;;;;;;Non;;20.0;;28.0;34172;34172;Classique;;;34070.0;34070.0;;341722041;341722041;;;;;;;;;;;;LINESTRING Z (768828.8 6278414.8 40.2, 768834.7 6278417.4 39.2, 768839.1 6278417.3 39.2, 768845.1 6278416.1 39.2, 768849.3 6278413.5 39.2, 768853.5 6278409.4 39.2, 768855.9 6278397.5 37.6, 768857.2 6278383.4 37.3, 768858.7 6278377.6 37.1, 768862 6278371.6 36.9, 768866.4 6278367.8 36.9, 768873.7 6278364.2 37, 768897.2 6278353.5 36, 768902.9 6278349.9 35.9, 768906.6 6278347.1 36.4, 768909.2 6278274.8 36)
-TRONROUT0000000044843802;Route à 1 chaussée;;;;;5;Non;0;En service;2006-12-12 11:20:44;2019-12-12 11:13:15;;;;;2.5;1.5;1.0;3.5;Non;Non;Sens inverse;;;Oui;30;Libre;;;;;;;;;Non;;;;;34172;34172;Classique;;;;;;;;;;;;;;;;;;;LINESTRING Z (768600.5 6278343.7 42.4, 768605.6 6278351 42, 768613.2 6278354.1 42, 768617.2 6278354.1 42, 768620.2 6278352.9 42, 768622.4 6278350.6 42.2, 768623.3 6278347.4 42.3, 768623.7 6278340.2 41.1)
-TRONROUT0000002206071299;Route à 1 chaussée;;;;;5;Non;0;En service;2019-12-12 11:13:15;2020-05-29 09:17:26;;;;;3.0;9999.0;2.0;5.0;Non;Non;Sens inverse;;;Oui;30;Libre;Libre;;;;;;;;;;;;;34172;34172;Classique;;;;;;;;;;;;;;;;;;;LINESTRING Z (768691.2 6278337.2 -1000, 768680.5 6278340.6 -1000, 768679 6278342.9 -1000, 768674 6278349.8 -1000, 768671.7 6278357.9 -1000, 768671 6278359.9 -1000, 768668.8 6278364.4 -1000)
-TRONROUT0000002206071300;Route à 1 chaussée;;;;;4;Non;0;En service;2019-12-12 11:13:15;;;;;;2.5;1.5;2.0;7.0;Non;Non;Sens inverse;;;Oui;40;Libre;;;;;;;;;Non;;;;;34172;34172;Classique;;;;;;;;;;;;;;;;;;;LINESTRING Z (768600.5 6278343.7 42.4, 768605.1 6278358.7 41.8)
-TRONROUT0000000356813571;Route à 1 chaussée;R DU PAS DU LOUP;R DU PAS DU LOUP;;;4;Non;0;En service;2016-03-14 10:22:33;;;;;;2.5;1.5;2.0;6.0;Non;Non;Sens inverse;;;Oui;40;Libre;;;;;;;;;Non;1.0;2.0;41.0;42.0;34172;34172;Métrique;;;34070.0;34070.0;;341724150;341724150;;;;;;;;;;;;LINESTRING Z (768663.5 6278362.7 40.8, 768655.2 6278359.9 40.9, 768634.3 6278345.7 41.1, 768627.5 6278342.2 41.1)
-TRONROUT0000000044843874;Route à 1 chaussée;R DU LAVANDIN;R DU LAVANDIN;;;5;Non;0;En service;2006-12-12 11:20:44;2019-12-12 11:13:15;;;;;2.5;1.5;2.0;5.0;Non;Non;Sens direct;;;Oui;30;Libre;;;;;;;;;Non;56.0;55.0;2.0;1.0;34172;34172;Métrique;;;34070.0;34070.0;;341723193;341723193;;;;;;;;;;;;LINESTRING Z (768691.2 6278337.2 39, 768684.3 6278344.2 39.2, 768682.4 6278351.3 40.8, 768681.1 6278357.3 41.1, 768680 6278367.9 40.7)
-TRONROUT0000000044843889;Route à 1 chaussée;;;;;4;Non;0;En service;2006-12-12 11:20:44;2016-03-14 10:22:33;;;;;2.5;1.5;1.0;3.5;Non;Non;Sens inverse;;;Oui;40;Libre;;;;;;;;;Non;;;;;34172;34172;Classique;;;;;;;;;;;;;;;;;;;LINESTRING Z (768630.5 6278364.1 41.7, 768631.5 6278361.6 41.8, 768632.4 6278356 41.8, 768631.1 6278347.4 41.8, 768627.5 6278342.2 41.1)
-TRONROUT0000000356813570;Route à 1 chaussée;RTE DE LAVERUNE;RTE DE LAVERUNE;;;4;Non;0;En service;2016-03-14 10:22:33;2019-12-12 11:13:15;;;;;2.5;1.5;4.0;14.0;Non;Non;Double sens;;;Oui;40;Libre;;;;;;;;;Non;;;;;34172;34172;;;;34070.0;34070.0;;341723200;341723200;;;;;;;;;;;;LINESTRING Z (768630.5 6278364.1 41.7, 768638.8 6278362.6 41.3, 768647.7 6278362.2 40.8, 768657.7 6278362.3 40.7, 768663.5 6278362.7 40.8)
-TRONROUT0000002206071302;Route à 1 chaussée;RTE DE LAVERUNE;RTE DE LAVERUNE;;;4;Non;0;En service;2019-12-12 11:13:15;;;;;;2.5;1.5;4.0;14.0;Non;Non;Double sens;;;Oui;40;Libre;;;;;;;;;Non;64.0;;64.0;;34172;34172;Classique;;;34070.0;34070.0;;341723200;341723200;;;;;;;;;;;;LINESTRING Z (768663.5 6278362.7 40.8, 768668.8 6278364.4 40.7)
-TRONROUT0000000356813567;Route à 1 chaussée;;;;;5;Non;0;En service;2016-03-14 10:22:33;2019-12-12 11:13:15;;;;;2.5;1.5;2.0;5.0;Non;Non;Sens inverse;;;Oui;30;Libre;;;;;;;;;Non;;;;;34172;34172;Classique;;;;;;;;;;;;;;;;;;;LINESTRING Z (768605.1 6278358.7 41.8, 768606.6 6278363.2 41.8, 768609.2 6278369.8 41.8)
-TRONROUT0000002206071301;Route à 1 chaussée;RTE DE LAVERUNE;RTE DE LAVERUNE;;;4;Non;0;En service;2019-12-12 11:13:15;;;;;;2.5;1.5;3.0;10.5;Non;Non;Double sens;;;Oui;40;Libre;;;;;;;;;Non;;62.0;;64.0;34172;34172;Classique;;;34070.0;34070.0;;341723200;341723200;;;;;;;;;;;;LINESTRING Z (768680 6278367.9 40.8, 768673.4 6278366.1 40.7, 768668.8 6278364.4 40.7)
-TRONROUT0000000044843892;Route à 1 chaussée;;;;;4;Non;0;En service;2006-12-12 11:20:44;2019-12-12 11:13:15;;;;;2.5;1.5;1.0;3.5;Non;Non;Sens direct;;;Oui;40;Libre;;;;;;;;;Non;;;;;34172;34172;Classique;;;;;;;;;;;;;;;;;;;LINESTRING Z (768595.8 6278374.2 42.4, 768599.7 6278369.1 42.5, 768601.9 6278365.7 42.5, 768605.1 6278358.7 42.5)
-TRONROUT0000000356813569;Route à 1 chaussée;RTE DE LAVERUNE;RTE DE LAVERUNE;;;4;Non;0;En service;2016-03-14 10:22:33;2019-12-12 11:13:15;;;;;2.5;1.5;4.0;14.0;Non;Non;Double sens;;;Oui;40;Libre;;;;;;;;;Non;66.0;;66.0;;34172;34172;Classique;;;34070.0;34070.0;;341723200;341723200;;;;;;;;;;;;LINESTRING Z (768609.2 6278369.8 41.8, 768619.2 6278366.7 42.4, 768629.5 6278364.3 41.8, 768630.5 6278364.1 41.7)
-TRONROUT0000000356813568;Route à 1 chaussée;RTE DE LAVERUNE;RTE DE LAVERUNE;;;4;Non;0;En service;2016-03-14 10:22:33;2019-12-12 11:13:15;;;;;2.5;1.5;4.0;14.0;Non;Non;Double sens;;;Oui;40;Libre;;;;;;;;;Non;;;;;34172;34172;;;;34070.0;34070.0;;341723200;341723200;;;;;;;;;;;;LINESTRING Z (768595.8 6278374.2 42.4, 768609.2 6278369.8 41.8)
-TRONROUT0000000044843816;Route à 1 chaussée;R DE L'ESCOUTADOU;R DE L'ESCOUTADOU;;;5;Non;0;En service;2006-12-12 11:20:44;2019-12-12 11:13:15;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;;2.0;;18.0;34172;34172;Linéaire;;;34070.0;34070.0;;341722041;341722041;;;;;;;;;;;;LINESTRING Z (768705.5 6278329.9 39, 768721.6 6278359.5 38.9, 768726.1 6278365.1 39.2, 768732.4 6278370.6 39.4, 768743 6278376 39.3, 768784.2 6278394.6 39.4, 768821.1 6278411.6 39.4, 768828.8 6278414.8 40.2)
-TRONROUT0000000044841453;Route à 1 chaussée;RTE DE LAVERUNE;RTE DE LAVERUNE;;;4;Non;0;En service;2006-12-12 11:20:44;2019-12-12 11:13:15;;;;;2.5;1.5;3.0;10.5;Non;Non;Double sens;;;Oui;40;Libre;;;;;;;;;Non;62.0;;62.0;;34172;34172;Classique;;;34070.0;34070.0;;341723200;341723200;;;;;;;;;;;;LINESTRING Z (768680 6278367.9 40.8, 768718.2 6278384.4 39.5, 768727.1 6278388.4 39.5)
-TRONROUT0000000044841451;Route à 1 chaussée;RTE DE LAVERUNE;RTE DE LAVERUNE;;;4;Non;0;En service;2006-12-12 11:20:44;2019-12-12 11:13:15;;;;;2.5;1.5;4.0;14.0;Non;Non;Double sens;;;Oui;40;Libre;;;;;;;;;Non;872.0;873.0;822.0;823.0;34172;34172;Métrique;;;34070.0;34070.0;;341723200;341723200;;;;;;;;;;;;LINESTRING Z (768544.8 6278396.8 45, 768557.1 6278391.6 43, 768595.8 6278374.2 42.4)
-TRONROUT0000000044841497;Route à 1 chaussée;RTE DE LAVERUNE;RTE DE LAVERUNE;;;4;Non;0;En service;2006-12-12 11:20:44;2016-03-14 10:22:33;;;;;2.5;1.5;2.0;9.0;Non;Non;Double sens;;;Oui;40;Libre;;;;;;;;;Non;62.0;;58.0;;34172;34172;Classique;;;34070.0;34070.0;;341723200;341723200;;;;;;;;;;;;LINESTRING Z (768727.1 6278388.4 39.5, 768791.9 6278417.5 38.5)
-TRONROUT0000000044841525;Route à 1 chaussée;R DE L'ESCOUTADOU;R DE L'ESCOUTADOU;;;5;Non;0;En service;2006-12-12 11:20:44;2011-09-09 10:55:38;;;;;2.5;1.5;2.0;4.0;Non;Non;Sens direct;;;Oui;30;Libre;;;;;;;;;Non;;;;;34172;34172;Classique;;;34070.0;34070.0;;341722041;341722041;;;;;;;;;;;;LINESTRING Z (768828.8 6278414.8 40.2, 768818.2 6278430.3 39)
-TRONROUT0000000044841495;Route à 1 chaussée;RTE DE LAVERUNE;RTE DE LAVERUNE;;;4;Non;0;En service;2006-12-12 11:20:44;2016-03-14 10:22:33;;;;;2.5;1.5;2.0;9.0;Non;Non;Double sens;;;Oui;40;Libre;;;;;;;;;Non;;65.0;;65.0;34172;34172;Classique;;;34070.0;34070.0;;341723200;341723200;;;;;;;;;;;;LINESTRING Z (768791.9 6278417.5 38.5, 768818.2 6278430.3 39)
-TRONROUT0000000044841517;Route à 1 chaussée;RTE DE LAVERUNE;RTE DE LAVERUNE;;;4;Non;0;En service;2006-12-12 11:20:44;2016-03-14 10:22:33;;;;;2.5;1.5;2.0;9.0;Non;Non;Double sens;;;Oui;40;Libre;;;;;;;;;Non;56.0;;54.0;;34172;34172;Classique;;;34070.0;34070.0;;341723200;341723200;;;;;;;;;;;;LINESTRING Z (768818.2 6278430.3 39, 768828.4 6278435.1 40.3, 768852.8 6278448.2 39.9)
-TRONROUT0000000044841508;Route à 1 chaussée;R DES CAPRIERS;R DES CAPRIERS;;;5;Non;0;En service;2006-12-12 11:20:44;2011-09-09 10:55:38;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;1.0;2.0;3.0;8.0;34172;34172;Classique;;;34070.0;34070.0;;341721015;341721015;;;;;;;;;;;;LINESTRING Z (768791.9 6278417.5 38.6, 768772.1 6278465 39.3, 768763.6 6278481.8 41.6)
-TRONROUT0000000044841510;Sentier;ALL CESAR SANQUETTE;ALL CESAR SANQUETTE;;;6;Non;0;En service;2006-12-12 11:20:44;2011-09-09 10:55:38;;;;;2.5;1.5;;;Non;Non;Sans objet;;;Oui;0;Physiquement impossible;;;;;;;;;Non;;;;;34172;34172;Classique;;;34070.0;34070.0;;34172#0HE;34172#0HE;;;;;;;;;;;;LINESTRING Z (768652.131343284 6278492.6 44.440298507461556, 768666.8 6278476.4 44.4, 768673 6278469.4 44.5, 768695.8 6278436 43.2, 768719.7 6278400.7 42.5, 768727.1 6278388.4 39.5)
-TRONROUT0000000044841507;Route à 1 chaussée;IMP DU PETIT HOUX;IMP DU PETIT HOUX;;;5;Non;0;En service;2006-12-12 11:20:44;2011-09-09 10:55:38;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;8.0;7.0;2.0;1.0;34172;34172;Classique;;;34070.0;34070.0;;341724300;341724300;;;;;;;;;;;;LINESTRING Z (768713.8 6278444.4 41.4, 768763.6 6278481.8 41.6)
-TRONROUT0000000118730989;Route à 1 chaussée;R DU PERE CYPRIEN ROME;R DU PERE CYPRIEN ROME;;;5;Non;0;En service;2008-03-12 11:21:14;2011-09-09 10:55:38;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;1.0;2.0;1.0;2.0;34172;34172;Classique;;;34070.0;34070.0;;341724262;341724262;;;;;;;;;;;;LINESTRING Z (768577.1 6278452.8 45.3, 768580.8 6278464.8 43.9, 768587.5 6278480.4 44.3, 768596.7158273379 6278492.6 44.3)
-TRONROUT0000000044841468;Route à 1 chaussée;R DES CAPRIERS;R DES CAPRIERS;;;5;Non;0;En service;2006-12-12 11:20:44;2011-09-09 10:55:38;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;9.0;8.0;9.0;14.0;34172;34172;Classique;;;34070.0;34070.0;;341721015;341721015;;;;;;;;;;;;LINESTRING Z (768763.6 6278481.8 41.6, 768762.4 6278484.2 39.9, 768755.4647686837 6278492.6 40.34839857648835)
-TRONROUT0000000044841483;Route à 1 chaussée;R DES POURPIERS;R DES POURPIERS;;;5;Non;0;En service;2006-12-12 11:20:44;2011-09-09 10:55:38;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;1.0;2.0;15.0;14.0;34172;34172;Classique;;;34070.0;34070.0;;341724590;341724590;;;;;;;;;;;;LINESTRING Z (768852.8 6278448.2 39.9, 768819.8956848034 6278492.6 39.566791744843634)
-TRONROUT0000000044848178;Route à 2 chaussées;AV DE VANIERES;AV DE VANIERES;;;3;Non;0;En service;2006-12-12 11:20:44;2021-12-10 18:01:06;;;;;2.5;1.5;2.0;7.0;Non;Non;Sens direct;;;Oui;45;Libre;;;;;;;;;Non;;491.0;;491.0;34172;34172;Classique;;;34070.0;34070.0;;341725704;341725704;ROUTNOMM0000002275428288;;M65;;Route intercommunale;Montpellier Méditerranée Métropole;;;;;;LINESTRING Z (768509.6793103452 6277738 54.710344827582674, 768500.4 6277743.2 54.8, 768405.3 6277796 46.5, 768307.8 6277849.8 46.3)
-TRONROUT0000000044846060;Route à 1 chaussée;RES CONDORCET;RES CONDORCET;;;5;Non;0;En service;2006-12-12 11:20:44;2017-01-10 11:47:49;;;;;2.5;1.5;2.0;7.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;;;;;34172;34172;Classique;;;;;;34172#0UG;34172#0UG;;;;;;;;;;;;LINESTRING Z (768622.6 6277791.1 52, 768627.8 6277793.2 52.2, 768635.3 6277796.2 52.6, 768693.8 6277819.7 55, 768693.9 6277819.9 55)
-TRONROUT0000000044845997;Route à 1 chaussée;BD PAUL VALERY;BD PAUL VALERY;;;4;Non;0;En service;2006-12-12 11:20:44;2016-09-02 11:30:49;;;;;2.5;1.5;2.0;6.0;Non;Non;Double sens;;;Oui;40;Libre;;;;;;;;;Non;2626.0;2625.0;2578.0;2579.0;34172;34172;Métrique;;;34070.0;34070.0;;341724215;341724215;;;;;;;;;;;;LINESTRING Z (768622.6 6277791.1 52, 768608.7 6277836.2 51.8)
-TRONROUT0000000044846025;Route à 1 chaussée;R CHARLES DE COULOMB;R CHARLES DE COULOMB;;;5;Non;0;En service;2006-12-12 11:20:44;2011-09-09 10:55:38;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;23.0;18.0;25.0;18.0;34172;34172;Classique;;;34070.0;34070.0;;341721239;341721239;;;;;;;;;;;;LINESTRING Z (768763.2 6277809.4 53.9, 768751.4 6277827.8 54.5)
-TRONROUT0000000044846058;Route à 1 chaussée;RES LE VEGA;RES LE VEGA;;;5;Non;0;En service;2006-12-12 11:20:44;2010-06-03 07:44:46;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;;;;;34172;34172;Classique;;;;;;34172#09Q;34172#09Q;;;;;;;;;;;;LINESTRING Z (768561.5 6277818.1 52.5, 768565.6 6277825.5 52.5, 768574 6277832.2 51.9, 768584.6 6277837.1 51.9, 768596.9 6277841.6 51.6, 768604.9 6277845.7 51.4)
-TRONROUT0000000044846032;Route à 1 chaussée;IMP DU BEAUPRE;IMP DU BEAUPRE;;;5;Non;0;En service;2006-12-12 11:20:44;2011-09-09 10:55:38;;;;;2.5;1.5;1.0;3.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;1.0;2.0;139.0;140.0;34172;34172;Métrique;;;34070.0;34070.0;;341720591;341720591;;;;;;;;;;;;LINESTRING Z (768763.2 6277809.4 53.9, 768777.2 6277821.4 53.3, 768804 6277857.5 50.4, 768792.9 6277864 50.1)
-TRONROUT0000002221594429;Route à 1 chaussée;;;;;5;Non;0;En service;2020-12-04 15:20:43;;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;Libre;;;;;;;;;;;;;34172;34172;;;;;;;;;;;;;;;;;;;;LINESTRING Z (768699.9 6277848.7 55.2, 768701.1 6277842.1 55.2, 768700.1 6277826.3 55.2)
-TRONROUT0000000336574728;Route à 1 chaussée;R CHARLES DE COULOMB;R CHARLES DE COULOMB;;;5;Non;0;En service;2014-07-21 13:50:11;2020-12-04 15:20:43;;2012-07-01;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;;;;;34172;34172;Classique;;;34070.0;34070.0;;341721239;341721239;;;;;;;;;;;;LINESTRING Z (768751.4 6277827.8 54.5, 768737.2 6277845.8 55.4, 768736.7 6277846.7 55.3, 768736.4 6277847.7 55.3)
-TRONROUT0000000044846044;Route à 1 chaussée;R DE LA BEGUDE;R DE LA BEGUDE;;;5;Non;0;En service;2006-12-12 11:20:44;2011-09-09 10:55:38;;;;;2.5;1.5;2.0;3.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;415.0;416.0;473.0;472.0;34172;34172;Métrique;;;34070.0;34070.0;;341720602;341720602;;;;;;;;;;;;LINESTRING Z (768841.9 6277865.2 48.4, 768837.1 6277863.2 47.6, 768834.9 6277858.1 47.9, 768826.1 6277834.8 49.5, 768819.6 6277816.1 49.8)
-TRONROUT0000000044846046;Route à 1 chaussée;BD PAUL VALERY;BD PAUL VALERY;;;4;Non;0;En service;2006-12-12 11:20:44;2016-09-02 11:30:49;;;;;2.5;1.5;2.0;6.0;Non;Non;Double sens;;;Oui;40;Libre;;;;;;;;;Non;2578.0;2579.0;2568.0;2569.0;34172;34172;Métrique;;;34070.0;34070.0;;341724215;341724215;;;;;;;;;;;;LINESTRING Z (768608.7 6277836.2 51.8, 768604.9 6277845.7 51.4)
-TRONROUT0000002221594441;Route à 1 chaussée;;;;;5;Non;0;En service;2020-12-04 15:20:43;;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;Libre;;;;;;;;;;;;;34172;34172;;;;;;;;;;;;;;;;;;;;LINESTRING Z (768699.9 6277848.7 55.2, 768702.9 6277847.5 55.2, 768711.4 6277846.8 55.2, 768727.2 6277847 55.2, 768736.4 6277847.7 55.3)
-TRONROUT0000002221594427;Route à 1 chaussée;RES D'ESTANOVE;RES D'ESTANOVE;;;5;Non;0;En service;2020-12-04 15:20:43;;;2009-07-01;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;0;Restreint aux ayants droit;;;;;;;;;Non;;;;;34172;34172;Classique;;;;;;34172#08J;34172#08J;;;;;;;;;;;;LINESTRING Z (768608.7 6277836.2 51.8, 768649.1 6277852.9 53.1, 768655.3 6277856.4 53.9, 768655.8 6277856.8 53.9, 768656.8 6277858.6 53.9, 768657.7 6277861.6 54.3, 768657.7 6277866.5 54.7, 768657.8 6277868.1 54.7, 768657.9 6277869.1 54.6)
-TRONROUT0000000044846049;Route à 1 chaussée;R DE LA BEGUDE;R DE LA BEGUDE;;;5;Non;0;En service;2006-12-12 11:20:44;2011-09-09 10:55:38;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;359.0;360.0;415.0;416.0;34172;34172;Métrique;;;34070.0;34070.0;;341720602;341720602;;;;;;;;;;;;LINESTRING Z (768895.9 6277847.8 44.7, 768891 6277849.2 44.6, 768873.9 6277856.2 45.7, 768873.7 6277856.3 45.7, 768857.6 6277861.9 46.3, 768845.9 6277865 47.4, 768841.9 6277865.2 48.4)
-TRONROUT0000002221594438;Route à 1 chaussée;;;;;5;Non;0;En service;2020-12-04 15:20:43;;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;Libre;;;;;;;;;;;;;34172;34172;;;;;;;;;;;;;;;;;;;;LINESTRING Z (768657.9 6277869.1 54.6, 768664.9 6277875.7 54.6, 768670.2 6277876.8 54.6, 768692.1 6277876 54.6, 768696.6 6277874.1 54.6, 768698.5 6277871.8 54.6, 768699.3 6277867.8 54.6, 768699.9 6277848.7 55.2)
-TRONROUT0000002221594428;Route à 1 chaussée;R CHARLES DE COULOMB;R CHARLES DE COULOMB;;;5;Non;0;En service;2020-12-04 15:20:43;;;2012-07-01;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;;;;;34172;34172;Classique;;;34070.0;34070.0;;341721239;341721239;;;;;;;;;;;;LINESTRING Z (768736.4 6277847.7 55.3, 768736.7 6277849 55.3, 768737.9 6277850.3 55.3, 768741.4 6277853.3 55.3, 768741.9 6277854.6 55.3, 768741.4 6277856.3 55.3, 768740 6277858.1 55.3, 768717.1 6277888.5 55.3, 768708.2 6277899.7 55.3, 768705.3 6277902.3 55.3, 768700.9 6277905 55.3, 768696.8 6277906.9 55.3, 768692.7 6277907.6 55.2, 768687.2 6277907.6 55, 768659.6 6277907.1 54.5)
-TRONROUT0000000044846031;Route à 1 chaussée;BD PAUL VALERY;BD PAUL VALERY;;;4;Non;0;En service;2006-12-12 11:20:44;2016-09-02 11:30:49;;;;;2.5;1.5;2.0;6.0;Non;Non;Double sens;;;Oui;40;Libre;;;;;;;;;Non;2568.0;2569.0;2492.0;2491.0;34172;34172;Métrique;;;34070.0;34070.0;;341724215;341724215;;;;;;;;;;;;LINESTRING Z (768604.9 6277845.7 51.4, 768596.3 6277866.9 51.4, 768588.7 6277888.9 51.4, 768580.9 6277904.5 51.4, 768578.9 6277909 51.4, 768574.6 6277916.1 51.2)
-TRONROUT0000000336574729;Route à 1 chaussée;RES D'ESTANOVE;RES D'ESTANOVE;;;5;Non;0;En service;2014-07-21 13:50:11;2020-12-04 15:20:43;;2009-07-01;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;0;Restreint aux ayants droit;;;;;;;;;Non;;;;;34172;34172;Classique;;;;;;34172#08J;34172#08J;;;;;;;;;;;;LINESTRING Z (768657.9 6277869.1 54.6, 768659.6 6277907.1 54.5)
-TRONROUT0000000115740649;Route à 1 chaussée;R CLAUDE BOURDET;R CLAUDE BOURDET;;;5;Non;0;En service;2008-02-08 12:49:34;2012-01-10 14:11:11;;;;;2.5;1.5;2.0;7.0;Non;Non;Double sens;;;Oui;0;Restreint aux ayants droit;;;;;;;;;Non;;;;;34172;34172;Métrique;;;34070.0;34070.0;;341727992;341727992;;;;;;;;;;;;LINESTRING Z (768730.7 6277919.2 53.8, 768727.9 6277918.8 53.8, 768726.2 6277917.4 53.8, 768724.9 6277915.9 53.8, 768724.2 6277914.1 53.8, 768723.9 6277911.8 53.8, 768724.3 6277909.5 53.8, 768725.3 6277907.6 53.8, 768727 6277906.1 53.8, 768729.4 6277905.2 53.8, 768732.1 6277905.2 53.8, 768735 6277906.2 53.8, 768736.8 6277907.7 53.8, 768737.7 6277909.5 53.8, 768738.1 6277911.4 53.8, 768737.8 6277913.9 53.8, 768736.7 6277916.6 53.8, 768735.1 6277918.1 53.8, 768733.3 6277919.1 53.8, 768730.7 6277919.2 53.8)
-TRONROUT0000000044846057;Route à 1 chaussée;RES D'ESTANOVE;RES D'ESTANOVE;;;5;Non;0;En service;2006-12-12 11:20:44;2014-07-21 13:50:11;;2009-07-01;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;0;Restreint aux ayants droit;;;;;;;;;Non;;;;;34172;34172;Classique;;;;;;34172#08J;34172#08J;;;;;;;;;;;;LINESTRING Z (768659.6 6277907.1 54.5, 768660.1 6277916.6 54.5, 768659.9 6277919.9 54.5, 768659.1 6277922.1 54.5, 768656.8 6277924.5 54.5, 768638.6 6277937.3 54)
-TRONROUT0000000044846001;Route à 1 chaussée;BD PAUL VALERY;BD PAUL VALERY;;;4;Non;0;En service;2006-12-12 11:20:44;2016-09-02 11:30:49;;;;;2.5;1.5;2.0;6.0;Non;Non;Double sens;;;Oui;40;Libre;;;;;;;;;Non;2492.0;2491.0;2476.0;2477.0;34172;34172;Métrique;;;34070.0;34070.0;;341724215;341724215;;;;;;;;;;;;LINESTRING Z (768574.6 6277916.1 51.2, 768566.4 6277928.7 51.1)
-TRONROUT0000000044846064;Route à 1 chaussée;;;;;5;Non;0;En service;2006-12-12 11:20:44;2008-02-08 12:49:34;;;;;2.5;1.5;2.0;7.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;;;;;34172;34172;Classique;;;;;;;;;;;;;;;;;;;LINESTRING Z (768566.4 6277928.7 51.1, 768584.5 6277940.4 52.5, 768607.5 6277956 54, 768635.6 6277974.9 56.2, 768651.9 6277986.4 57.4)
-TRONROUT0000000044846043;Route à 1 chaussée;R CLAUDE BOURDET;R CLAUDE BOURDET;;;5;Non;0;En service;2006-12-12 11:20:44;2012-01-10 13:19:26;;;;;2.5;1.5;2.0;7.0;Non;Non;Double sens;;;Oui;0;Restreint aux ayants droit;;;;;;;;;Non;1.0;2.0;111.0;110.0;34172;34172;Métrique;;;34070.0;34070.0;;341727992;341727992;;;;;;;;;;;;LINESTRING Z (768794.2 6278007.2 52.1, 768790.9 6278001.4 52.7, 768788.8 6277998 52.9, 768775.2 6277980.2 53.6, 768733.1 6277926.5 53.8, 768731.2 6277922.7 53.8, 768730.7 6277919.2 53.8)
-TRONROUT0000000044843834;Route à 1 chaussée;R DE LA SARDANE;R DE LA SARDANE;;;5;Non;0;En service;2006-12-12 11:20:44;2012-01-10 14:24:33;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;15.0;14.0;15.0;14.0;34172;34172;Classique;;;34070.0;34070.0;;341725278;341725278;;;;;;;;;;;;LINESTRING Z (768865.1 6277968.9 48, 768839.2 6277979.8 49.1)
-TRONROUT0000000044843804;Route à 1 chaussée;;;;;5;Non;0;En service;2006-12-12 11:20:44;2012-01-10 12:17:06;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;0;Restreint aux ayants droit;;;;;;;;;Non;;;;;34172;34172;Classique;;;;;;;;;;;;;;;;;;;LINESTRING Z (768828.4 6278009.2 48.5, 768823.9 6278004.5 50.2, 768820.5 6278001.3 50.6, 768818.4 6278000 51, 768815.8 6277999.1 51.2, 768812.2 6277999.6 51.2, 768794.2 6278007.2 52.1)
-TRONROUT0000000044843839;Route à 1 chaussée;PL FRANCOIS ASTIER;PL FRANCOIS ASTIER;;;5;Non;0;En service;2006-12-12 11:20:44;2011-09-09 10:55:38;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;45.0;43.0;51.0;15.0;34172;34172;Linéaire;;;34070.0;34070.0;;341722381;341722381;;;;;;;;;;;;LINESTRING Z (768582.9 6278009.4 55.3, 768561.5 6278003.7 53.2, 768559.7 6278002.4 53)
-TRONROUT0000000044843806;Route à 1 chaussée;;;;;5;Non;0;En service;2006-12-12 11:20:44;2012-01-10 08:55:43;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;0;Restreint aux ayants droit;;;;;;;;;Non;;;;;34172;34172;Classique;;;;;;;;;;;;;;;;;;;LINESTRING Z (768794.2 6278007.2 52.1, 768777.5 6278016.1 52.7)
-TRONROUT0000000044843871;Route à 1 chaussée;R JACQUES TATI;R JACQUES TATI;;;5;Non;0;En service;2006-12-12 11:20:44;2012-01-10 12:18:12;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;0;Restreint aux ayants droit;;;;;;;;;Non;147.0;146.0;219.0;220.0;34172;34172;Métrique;;;34070.0;34070.0;;341722921;341722921;;;;;;;;;;;;LINESTRING Z (768828.4 6278009.2 48.5, 768842.7 6278039.6 45.6, 768850.8 6278058.2 45.4, 768860 6278079.8 45.5)
-TRONROUT0000000044843828;Route à 1 chaussée;R CLAUDE BOURDET;R CLAUDE BOURDET;;;5;Non;0;En service;2006-12-12 11:20:44;2012-01-10 08:55:43;;;;;2.5;1.5;1.0;4.0;Non;Non;Sens direct;;;Oui;0;Restreint aux ayants droit;;;;;;;;;Non;;;;;34172;34172;Classique;;;34070.0;34070.0;;341727992;341727992;;;;;;;;;;;;LINESTRING Z (768761.5 6278089.5 48, 768765.4 6278027.3 52.8, 768766.2 6278023.6 53, 768767.4 6278021.6 53, 768777.5 6278016.1 52.7)
-TRONROUT0000000044843817;Route à 1 chaussée;R JACQUES TATI;R JACQUES TATI;;;5;Non;0;En service;2006-12-12 11:20:44;2012-01-10 08:55:43;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;0;Restreint aux ayants droit;;;;;;;;;Non;1.0;2.0;147.0;146.0;34172;34172;Métrique;;;34070.0;34070.0;;341722921;341722921;;;;;;;;;;;;LINESTRING Z (768772.9 6278117.3 47.1, 768779.9 6278112.5 46.5, 768782.1 6278107.3 46.7, 768782.5 6278100.8 47.1, 768786.9 6278046.8 49.5, 768787.5 6278034 49.9, 768788.4 6278028 50.2, 768794.4 6278024.9 50.4, 768828.4 6278009.2 49.1)
-TRONROUT0000000044843833;Route à 1 chaussée;R CLAUDE BOURDET;R CLAUDE BOURDET;;;5;Non;0;En service;2006-12-12 11:20:44;2012-01-10 08:55:43;;;;;2.5;1.5;1.0;4.0;Non;Non;Sens inverse;;;Oui;0;Restreint aux ayants droit;;;;;;;;;Non;;;;;34172;34172;Classique;;;34070.0;34070.0;;341727992;341727992;;;;;;;;;;;;LINESTRING Z (768770.6 6278115.7 47.2, 768774.2 6278061 50.2, 768776.4 6278033.7 52.7, 768777.8 6278022.8 53.2, 768777.5 6278016.1 52.7)
-TRONROUT0000000044843841;Route à 1 chaussée;R CLAUDE BOURDET;R CLAUDE BOURDET;;;5;Non;0;En service;2006-12-12 11:20:44;2012-01-10 08:59:37;;;;;2.5;1.5;1.0;4.0;Non;Non;Sens inverse;;;Oui;0;Restreint aux ayants droit;;;;;;;;;Non;;;;;34172;34172;Classique;;;34070.0;34070.0;;341727992;341727992;;;;;;;;;;;;LINESTRING Z (768761.5 6278089.5 48, 768759 6278105.2 46.5, 768756.4 6278117.9 45.9)
-TRONROUT0000000044843812;Route à 1 chaussée;R RENE CLAIR;R RENE CLAIR;;;5;Non;0;En service;2006-12-12 11:20:44;2015-10-05 19:17:23;;;;;2.5;1.5;2.0;5.0;Non;Non;Double sens;;;Oui;0;Restreint aux ayants droit;;;;;;;;;Non;43.0;;91.0;;34172;34172;Classique;;;34070.0;34070.0;;341724844;341724844;;;;;;;;;;;;LINESTRING Z (768603.6 6278126.2 57.3, 768603.3 6278120.3 57.8, 768602.7 6278118.3 57.5, 768601.1 6278116.2 57.5, 768581.4 6278103.5 58.2, 768558.3 6278088.5 56.4, 768549.2 6278082.5 55.9)
-TRONROUT0000000044843845;Route à 1 chaussée;R JACQUES BECKER;R JACQUES BECKER;;;5;Non;0;En service;2006-12-12 11:20:44;2015-08-25 13:06:22;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;0;Restreint aux ayants droit;;;;;;;;;Non;;;;;34172;34172;Classique;;;34070.0;34070.0;;341722896;341722896;;;;;;;;;;;;LINESTRING Z (768662.1 6278118 53, 768677.9 6278130.3 51.6, 768679.8 6278131 51.6, 768681.9 6278130.9 51.6, 768683.9 6278130.2 51.4, 768750.4 6278098.3 49.9, 768751.4 6278097.4 49.9, 768752 6278093.8 49.9, 768752.4 6278093 49.9, 768753.4 6278092.1 49.9, 768757.2 6278090.5 49.3, 768761.5 6278089.5 48)
-TRONROUT0000000044843800;Rond-point;R JACQUES TATI;R JACQUES TATI;;;5;Non;0;En service;2006-12-12 11:20:44;2018-03-08 12:03:44;;;;;2.5;1.5;2.0;5.0;Non;Non;Sens direct;;;Oui;0;Restreint aux ayants droit;;;;;;;;;Non;;;;;34172;34172;Classique;;;34070.0;34070.0;;341722921;341722921;;;;;;;;;;;;LINESTRING Z (768756.4 6278117.9 45.9, 768759.8 6278115.7 46.7, 768763.7 6278114.8 47.4, 768768.1 6278115 47.1, 768770.6 6278115.7 47.2)
-TRONROUT0000000115740650;Rond-point;R JACQUES TATI;R JACQUES TATI;;;5;Non;0;En service;2008-02-08 12:49:34;2018-03-08 12:03:44;;;;;2.5;1.5;1.0;4.0;Non;Non;Sens direct;;;Oui;25;Libre;;;;;;;;;Non;;;;;34172;34172;Classique;;;34070.0;34070.0;;341722921;341722921;;;;;;;;;;;;LINESTRING Z (768770.6 6278115.7 47.2, 768772.9 6278117.3 47.1)
-TRONROUT0000000353436218;Route à 1 chaussée;R JACQUES BECKER;R JACQUES BECKER;;;5;Non;0;En service;2015-08-25 13:06:22;;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;0;Restreint aux ayants droit;;;;;;;;;Non;;60.0;;88.0;34172;34172;Classique;;;34070.0;34070.0;;341722896;341722896;;;;;;;;;;;;LINESTRING Z (768632.4 6278128.8 54, 768633.1 6278124 54.1, 768633.8 6278122.2 54.1, 768634.8 6278121.2 54.2, 768650.4 6278114 54, 768652.9 6278113.6 54, 768655.7 6278114.3 53.7, 768662.1 6278118 53)
-TRONROUT0000000044843798;Route à 1 chaussée;R ABEL GANCE;R ABEL GANCE;;;5;Non;0;En service;2006-12-12 11:20:44;2012-01-10 08:51:18;;;;;2.5;1.5;2.0;4.0;Non;Non;Sens direct;;;Oui;0;Restreint aux ayants droit;;;;;;;;;Non;;39.0;;1.0;34172;34172;Métrique;;;34070.0;34070.0;;341720016;341720016;;;;;;;;;;;;LINESTRING Z (768714.5 6278137.2 48.3, 768749.4 6278121.1 46.3, 768756.4 6278117.9 45.9)
-TRONROUT0000000044843787;Route à 1 chaussée;R RENE CLAIR;R RENE CLAIR;;;5;Non;0;En service;2006-12-12 11:20:44;2012-12-21 12:29:28;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;0;Restreint aux ayants droit;;;;3.0;;;;;Non;;;;;34172;34172;Classique;;;34070.0;34070.0;;341724844;341724844;;;;;;;;;;;;LINESTRING Z (768603.6 6278126.2 57.3, 768608.6 6278128.4 57.1, 768623.4 6278128.9 56.2, 768627.9 6278129.3 54.8, 768632.4 6278128.8 54)
-TRONROUT0000000044843805;Sentier;;;;;6;Non;0;En service;2006-12-12 11:20:44;2012-01-10 08:59:13;;;;;2.5;1.5;;;Non;Non;Sans objet;;;Oui;0;Physiquement impossible;;;;;;;;;Non;;;;;34172;34172;Classique;;;;;;;;;;;;;;;;;;;LINESTRING Z (768781 6278159 44.3, 768824.4 6278156.2 43.8, 768827.8 6278155 43.8, 768837.1 6278148.1 43.8, 768848.8 6278138 43.3, 768863.3 6278127.3 42.8, 768878.7 6278119.6 41.6, 768897.8 6278111.5 41.3, 768914.8 6278105.9 41.3, 768927.3 6278107 40.1)
-TRONROUT0000000044843813;Rond-point;R JACQUES TATI;R JACQUES TATI;;;5;Non;0;En service;2006-12-12 11:20:44;2018-11-13 07:54:47;;;;;20.0;2.5;2.0;5.0;Non;Non;Sens direct;;;Oui;0;Restreint aux ayants droit;;;;;;;;;Non;;;;;34172;34172;Classique;;;34070.0;34070.0;;341722921;341722921;;;;;;;;;;;;LINESTRING Z (768772.9 6278117.3 47.1, 768775.4 6278121.2 46.1, 768779.9 6278133.3 44.5, 768777.6 6278145.3 44.1, 768773.3 6278153 43.8, 768766.9 6278158.5 44.5)
-TRONROUT0000000044843848;Rond-point;R JACQUES TATI;R JACQUES TATI;;;5;Non;0;En service;2006-12-12 11:20:44;2018-03-08 12:03:44;;;;;20.0;2.5;2.0;5.0;Non;Non;Sens direct;;;Oui;0;Restreint aux ayants droit;;;;;;;;;Non;;;;;34172;34172;Classique;;;34070.0;34070.0;;341722921;341722921;;;;;;;;;;;;LINESTRING Z (768755.6 6278158 44.6, 768750.6 6278141.6 45.4, 768751.9 6278127 45.7, 768756.4 6278117.9 45.9)
-TRONROUT0000000044843847;Route à 1 chaussée;R ABEL GANCE;R ABEL GANCE;;;5;Non;0;En service;2006-12-12 11:20:44;2018-03-08 12:03:44;;;;;2.5;1.5;2.0;4.0;Non;Non;Sens inverse;;;Oui;0;Restreint aux ayants droit;;;;;;;;;Non;36.0;;2.0;;34172;34172;Classique;;;34070.0;34070.0;;341720016;341720016;;;;;;;;;;;;LINESTRING Z (768714.5 6278137.2 48.3, 768719.4 6278138.8 47.6, 768732 6278145.3 46.7, 768745.9 6278154 45.4, 768755.6 6278158 44.6)
-TRONROUT0000000044843867;Route à 1 chaussée;R JACQUES BECKER;R JACQUES BECKER;;;5;Non;0;En service;2006-12-12 11:20:44;2012-01-10 08:51:18;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;0;Restreint aux ayants droit;;;;;;;;;Non;;185.0;;185.0;34172;34172;Classique;;;34070.0;34070.0;;341722896;341722896;;;;;;;;;;;;LINESTRING Z (768634.3 6278173.1 48.7, 768631.8 6278166.8 50.3, 768631.3 6278163.1 50.6, 768632.4 6278128.8 54)
-TRONROUT0000000044843840;Route à 1 chaussée;R ABEL GANCE;R ABEL GANCE;;;5;Non;0;En service;2006-12-12 11:20:44;2012-01-10 08:51:18;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;0;Restreint aux ayants droit;;;;;;;;;Non;130.0;129.0;38.0;39.0;34172;34172;Métrique;;;34070.0;34070.0;;341720016;341720016;;;;;;;;;;;;LINESTRING Z (768634.3 6278173.1 48.7, 768714.5 6278137.2 48.3)
-TRONROUT0000000044843852;Rond-point;R JACQUES TATI;R JACQUES TATI;;;5;Non;0;En service;2006-12-12 11:20:44;2018-11-13 07:54:47;;;;;2.5;1.5;2.0;5.0;Non;Non;Sens direct;;;Oui;0;Restreint aux ayants droit;;;;;;;;;Non;;;;;34172;34172;Classique;;;34070.0;34070.0;;341722921;341722921;;;;;;;;;;;;LINESTRING Z (768766.9 6278158.5 44.5, 768755.6 6278158 44.6)
-TRONROUT0000000240976887;Sentier;;;;;6;Non;0;En service;2010-07-16 12:50:50;2018-03-08 12:03:44;;;;;2.5;1.5;;;Non;Non;Sans objet;;;Oui;0;Physiquement impossible;;;;;;;;;Non;;;;;34172;34172;Classique;;;;;;;;;;;;;;;;;;;LINESTRING Z (768766.9 6278158.5 44.5, 768781 6278159 44.3)
-TRONROUT0000000044843885;Route à 1 chaussée;R ABEL GANCE;R ABEL GANCE;;;5;Non;0;En service;2006-12-12 11:20:44;2012-01-10 08:51:18;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;0;Restreint aux ayants droit;;;;;;;;;Non;152.0;153.0;130.0;129.0;34172;34172;Métrique;;;34070.0;34070.0;;341720016;341720016;;;;;;;;;;;;LINESTRING Z (768614 6278183.5 49, 768634.3 6278173.1 48.7)
-TRONROUT0000002221594456;Route à 1 chaussée;;;;;5;Non;0;En service;2020-12-04 15:20:43;;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;Libre;;;;;;;;;;;;;34172;34172;;;;;;;;;;;;;;;;;;;;LINESTRING Z (768695.2 6278180.3 47, 768698.8 6278186.8 47.1, 768716.4 6278199.6 47.1)
-TRONROUT0000000044843883;Route à 1 chaussée;R JACQUES TATI;R JACQUES TATI;;;5;Non;0;En service;2006-12-12 11:20:44;2018-03-08 12:03:44;;;;;2.5;1.5;2.0;4.0;Non;Non;Sens inverse;;;Oui;0;Restreint aux ayants droit;;;;;;;;;Non;;;;;34172;34172;Classique;;;34070.0;34070.0;;341722921;341722921;;;;;;;;;;;;LINESTRING Z (768755.6 6278158 44.6, 768752.2 6278222.1 41.1, 768752 6278229.2 40.7)
-TRONROUT0000000044843886;Route à 1 chaussée;R JACQUES TATI;R JACQUES TATI;;;5;Non;0;En service;2006-12-12 11:20:44;2018-03-08 12:03:44;;;;;2.5;1.5;2.0;4.0;Non;Non;Sens inverse;;;Oui;0;Restreint aux ayants droit;;;;;;;;;Non;;;;;34172;34172;Classique;;;34070.0;34070.0;;341722921;341722921;;;;;;;;;;;;LINESTRING Z (768763.5 6278229.7 39.8, 768766.8 6278164.9 42.2, 768766.9 6278158.5 44.5)
-TRONROUT0000002221594445;Route à 1 chaussée;R JEAN GREMILLON;R JEAN GREMILLON;;;5;Non;0;En service;2020-12-04 15:20:43;;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;0;Restreint aux ayants droit;;;;;;;;;Non;166.0;165.0;100.0;99.0;34172;34172;Métrique;;;34070.0;34070.0;;341722982;341722982;;;;;;;;;;;;LINESTRING Z (768629.8 6278211 48, 768632.6 6278210 48.3, 768669.3 6278192.6 48.4, 768695.2 6278180.3 47)
-TRONROUT0000000044843820;Route à 1 chaussée;R ABEL GANCE;R ABEL GANCE;;;5;Non;0;En service;2006-12-12 11:20:44;2012-01-10 11:05:50;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;0;Restreint aux ayants droit;;;;;;;;;Non;204.0;205.0;152.0;153.0;34172;34172;Métrique;;;34070.0;34070.0;;341720016;341720016;;;;;;;;;;;;LINESTRING Z (768563.9 6278208.6 47.9, 768566 6278207.8 48.5, 768589.2 6278195.3 49.2, 768614 6278183.5 49)
-TRONROUT0000002221594444;Route à 1 chaussée;R JEAN GREMILLON;R JEAN GREMILLON;;;5;Non;0;En service;2020-12-04 15:20:43;;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;0;Restreint aux ayants droit;;;;;;;;;Non;198.0;197.0;168.0;167.0;34172;34172;Métrique;;;34070.0;34070.0;;341722982;341722982;;;;;;;;;;;;LINESTRING Z (768614 6278183.5 48.9, 768625.9 6278209.1 47.8, 768627.6 6278210.6 48.1, 768629.8 6278211 48)
-TRONROUT0000002221594446;Route à 1 chaussée;R JEAN GREMILLON;R JEAN GREMILLON;;;5;Non;0;En service;2020-12-04 15:20:43;;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;0;Restreint aux ayants droit;;;;;;;;;Non;98.0;97.0;24.0;23.0;34172;34172;Métrique;;;34070.0;34070.0;;341722982;341722982;;;;;;;;;;;;LINESTRING Z (768695.2 6278180.3 47, 768706 6278175.2 46.6, 768707.6 6278174.8 45.9, 768710.5 6278176 46, 768725.8 6278185.3 43.4, 768726.4 6278186.2 43.4, 768726.7 6278188.9 43.4, 768725.2 6278220 41, 768725.8 6278222.9 41, 768727.3 6278225.5 40.9, 768729 6278227.4 40.9, 768729.3 6278227.5 40.8)
-TRONROUT0000002221594457;Route à 1 chaussée;;;;;5;Non;0;En service;2020-12-04 15:20:43;;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;Libre;;;;;;;;;;;;;34172;34172;;;;;;;;;;;;;;;;;;;;LINESTRING Z (768629.8 6278211 48, 768629 6278215.7 46.8)
-TRONROUT0000002221594454;Route à 1 chaussée;;;;;5;Non;0;En service;2020-12-04 15:20:43;;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;Libre;;;;;;;;;;;;;34172;34172;;;;;;;;;;;;;;;;;;;;LINESTRING Z (768636.9 6278227.7 45.7, 768642.4 6278222.2 45.7, 768660.6 6278211.3 45.7)
-TRONROUT0000000044843877;Sentier;;;;;6;Non;0;En service;2006-12-12 11:20:44;2010-07-16 12:50:50;;;;;2.5;1.5;;;Non;Non;Sans objet;;;Oui;0;Physiquement impossible;;;;;;;;;Non;;;;;34172;34172;Classique;;;;;;;;;;;;;;;;;;;LINESTRING Z (768968.6 6278158.8 38.6, 768898.6 6278194.1 37.8, 768895.8 6278190.9 37.9, 768889.6 6278186.8 38.2, 768882 6278185.2 38.2, 768875.6 6278190.7 38.2, 768813.9 6278284.1 37.2)
-TRONROUT0000000240976893;Sentier;;;;;6;Non;0;En service;2010-07-16 12:50:50;2012-02-09 07:19:17;;2009-07-01;;;2.5;1.5;;;Non;Non;Sans objet;;;Oui;0;Physiquement impossible;;;;;;;;;Non;;;;;34172;34172;;;;;;;;;;;;;;;;;;;;LINESTRING Z (768781 6278159 44.3, 768777.8 6278196 41.7, 768774.7 6278237.8 39.2, 768774 6278251.3 39.1, 768774.8 6278256.1 39, 768777.6 6278260.3 39, 768797.3 6278273.1 39, 768813.9 6278284.1 37.2)
-TRONROUT0000002221594453;Route à 1 chaussée;;;;;5;Non;0;En service;2020-12-04 15:20:43;;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;Libre;;;;;;;;;;;;;34172;34172;;;;;;;;;;;;;;;;;;;;LINESTRING Z (768629 6278215.7 46.8, 768634.2 6278223.2 46.2, 768636.9 6278227.7 45.7)
-TRONROUT0000002221594452;Route à 1 chaussée;;;;;5;Non;0;En service;2020-12-04 15:20:43;;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;Libre;;;;;;;;;;;;;34172;34172;;;;;;;;;;;;;;;;;;;;LINESTRING Z (768629 6278215.7 46.8, 768624.8 6278216.7 46.8, 768620.6 6278220.8 46.3, 768617.7 6278227.4 45.8, 768614.8 6278230.7 45.8, 768608.7 6278234.4 45.8)
-TRONROUT0000000044843844;Route à 1 chaussée;R JEAN GREMILLON;R JEAN GREMILLON;;;5;Non;0;En service;2006-12-12 11:20:44;2020-12-04 15:20:43;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;0;Restreint aux ayants droit;;;;;;;;;Non;22.0;21.0;2.0;1.0;34172;34172;Métrique;;;34070.0;34070.0;;341722982;341722982;;;;;;;;;;;;LINESTRING Z (768729.3 6278227.5 40.8, 768730.6 6278228.1 40.7, 768734.6 6278228.3 40.6, 768752 6278229.2 40.7)
-TRONROUT0000000044843893;Route à 1 chaussée;;;;;5;Non;0;En service;2006-12-12 11:20:44;2012-01-10 08:59:31;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;0;Restreint aux ayants droit;;;;;;;;;Non;;;;;34172;34172;Classique;;;;;;;;;;;;;;;;;;;LINESTRING Z (768752 6278229.2 40.7, 768763.5 6278229.7 39.5)
-TRONROUT0000002221594455;Route à 1 chaussée;;;;;5;Non;0;En service;2020-12-04 15:20:43;;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;Libre;;;;;;;;;;;;;34172;34172;;;;;;;;;;;;;;;;;;;;LINESTRING Z (768729.3 6278227.5 40.8, 768725.9 6278233.7 40.8, 768724.1 6278243 40.6, 768708.3 6278260.4 40.2)
-TRONROUT0000002221594451;Route à 1 chaussée;;;;;5;Non;0;En service;2020-12-04 15:20:43;;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;Libre;;;;;;;;;;;;;34172;34172;;;;;;;;;;;;;;;;;;;;LINESTRING Z (768636.9 6278227.7 45.7, 768635.9 6278230.5 45.5, 768625.8 6278240.9 44.4, 768613.2 6278251 44.4, 768604.9 6278257.1 44.4, 768597.1 6278258.8 44.4, 768584.8 6278257.5 44.4, 768576.2 6278257.3 44.4, 768570.2 6278259.6 44.4, 768558.6 6278272.1 44.4)
-TRONROUT0000000044843829;Route à 1 chaussée;R JACQUES TATI;R JACQUES TATI;;;5;Non;0;En service;2006-12-12 11:20:44;2012-01-10 11:10:53;;;;;20.0;2.5;1.0;4.0;Non;Non;Sens inverse;;;Oui;0;Restreint aux ayants droit;;;;;;;;;Non;;;;;34172;34172;Classique;;;34070.0;34070.0;;341722921;341722921;;;;;;;;;;;;LINESTRING Z (768769.1 6278282.3 38.5, 768767.1 6278277.1 37.9, 768761.6 6278267.6 38, 768763.5 6278229.7 39.8)
-TRONROUT0000000115740646;Route à 1 chaussée;R JACQUES TATI;R JACQUES TATI;;;5;Non;0;En service;2008-02-08 12:49:34;2012-01-10 08:59:31;;;;;20.0;2.5;1.0;4.0;Non;Non;Sens direct;;;Oui;0;Restreint aux ayants droit;;;;;;;;;Non;;;;;34172;34172;Classique;;;34070.0;34070.0;;341722921;341722921;;;;;;;;;;;;LINESTRING Z (768749.3 6278287.6 38.5, 768749.7 6278285.8 37.6, 768752 6278229.2 40.7)
-TRONROUT0000000044843875;Rond-point;;;;;5;Non;0;En service;2006-12-12 11:20:44;2018-11-14 08:46:16;;;;;2.5;1.5;1.0;3.0;Non;Non;Sens direct;;;Oui;25;Libre;;;;;;;;;Non;;;;;34172;34172;Métrique;;;;;;;;;;;;;;;;;;;LINESTRING Z (768749.3 6278287.6 38.5, 768752.3 6278283.5 38.6, 768755.1 6278280.9 38.6, 768758.7 6278279.6 38.5, 768762.8 6278279.3 38.5, 768766.2 6278280.3 38.5, 768769.1 6278282.3 38.5)
-TRONROUT0000000044843894;Rond-point;;;;;5;Non;0;En service;2006-12-12 11:20:44;2017-10-26 14:33:20;;;;;2.5;1.5;1.0;3.0;Non;Non;Sens direct;;;Oui;25;Libre;;;;;;;;;Non;;;;;34172;34172;Métrique;;;;;;;;;;;;;;;;;;;LINESTRING Z (768748.7 6278290.1 38.5, 768749.3 6278287.6 38.5)
-TRONROUT0000000044843888;Rond-point;;;;;5;Non;0;En service;2006-12-12 11:20:44;2018-11-14 08:46:16;;;;;2.5;1.5;1.0;3.0;Non;Non;Sens direct;;;Oui;25;Libre;;;;;;;;;Non;;;;;34172;34172;Métrique;;;;;;;;;;;;;;;;;;;LINESTRING Z (768769.1 6278282.3 38.5, 768770.3 6278285.3 37.8, 768770.2 6278296.1 37.3, 768768.6 6278300.2 40)
-TRONROUT0000000044843795;Route à 1 chaussée;R DU LAVANDIN;R DU LAVANDIN;;;5;Non;0;En service;2006-12-12 11:20:44;2011-09-09 10:55:38;;;;;2.5;1.5;1.0;4.0;Non;Non;Sens inverse;;;Oui;30;Libre;;;;;;;;;Non;154.0;;122.0;;34172;34172;Métrique;;;34070.0;34070.0;;341723193;341723193;;;;;;;;;;;;LINESTRING Z (768801.3 6278303.2 37, 768769.1 6278282.3 38.5)
-TRONROUT0000000044846159;Route à 2 chaussées;AV DE VANIERES;AV DE VANIERES;;;3;Non;0;En service;2006-12-12 11:20:44;2021-12-10 18:01:06;;;;;20.0;2.5;2.0;7.0;Non;Non;Sens direct;;;Oui;45;Libre;;;;;;;;;Non;;;;;34172;34172;Classique;;;34070.0;34070.0;;341725704;341725704;ROUTNOMM0000002275428288;;M65;;Route intercommunale;Montpellier Méditerranée Métropole;;;;;;LINESTRING Z (768252.2 6277871.7 46.3, 768401.3 6277789 46.5, 768493.4290322578 6277738 54.532258064488914)
-TRONROUT0000000044846038;Route à 1 chaussée;RES LE VEGA;RES LE VEGA;;;5;Non;0;En service;2006-12-12 11:20:44;2020-07-31 15:59:25;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;;;;;34172;34172;Classique;;;;;;34172#09Q;34172#09Q;;;;;;;;;;;;LINESTRING Z (768526.2 6277739.4 52.9, 768529.2 6277742.1 53.9, 768546.4 6277757.6 52.8, 768556.7 6277768.5 52.8, 768562.6 6277778.5 51.8, 768565.8 6277789.4 52, 768563 6277808.7 52.2, 768561.7 6277812.2 52.2, 768561.5 6277818.1 52.5)
-TRONROUT0000000044846104;Route à 1 chaussée;IMP DE SUMER;IMP DE SUMER;;;5;Non;0;En service;2006-12-12 11:20:44;2011-11-22 12:28:30;;;;;2.5;1.5;2.0;5.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;84.0;85.0;2.0;1.0;34172;34172;Métrique;;;34070.0;34070.0;;341728063;341728063;;;;;;;;;;;;LINESTRING Z (767985.5 6277852.3 44.1, 767937.8 6277789.6 43.7, 767910.8 6277753.2 43.8, 767917.9 6277746.2 43.9)
-TRONROUT0000000044846099;Route à 1 chaussée;IMP GUY DE MAUPASSANT;IMP GUY DE MAUPASSANT;;;5;Non;0;En service;2006-12-12 11:20:44;2011-09-09 10:55:38;;2009-07-01;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;1.0;2.0;157.0;156.0;34172;34172;Métrique;;;34070.0;34070.0;;341728082;341728082;;;;;;;;;;;;LINESTRING Z (768213 6277772.7 47.8, 768196.7 6277779.6 47.8, 768171.8 6277791.8 47.8, 768156.7 6277797.8 46.8, 768150.9 6277799.2 46.8, 768143.9 6277799.9 46.8, 768130.2 6277801.9 46.4, 768120.6 6277803.9 46.4, 768103.4 6277809.9 45.4, 768070.6 6277823.4 45.4, 768063 6277826.5 45.4)
-TRONROUT0000000116146453;Route à 1 chaussée;R TOPAZE;R TOPAZE;;;5;Non;0;En service;2008-02-15 07:34:16;2012-01-10 09:02:12;;;;;2.5;1.5;1.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;;;;;34172;34172;Classique;;;34070.0;34070.0;;341728035;341728035;;;;;;;;;;;;LINESTRING Z (768414.1 6277798.5 52.5, 768411.8 6277799.7 52.4, 768385.5 6277813.8 51.4, 768351.7 6277832.5 49.7, 768347 6277835.4 49.6)
-TRONROUT0000000044846118;Route à 1 chaussée;R DU PAS DU LOUP;R DU PAS DU LOUP;;;5;Non;0;En service;2006-12-12 11:20:44;2011-09-09 10:55:38;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;677.0;676.0;777.0;776.0;34172;34172;Métrique;;;34070.0;34070.0;;341724150;341724150;;;;;;;;;;;;LINESTRING Z (768246.5 6277863.2 46, 768238.7 6277843.5 46.4, 768232.7 6277830.3 46.5, 768218.2 6277789.2 47.7, 768213 6277772.7 47.8)
-TRONROUT0000000116146454;Route à 1 chaussée;;;;;6;Non;0;En service;2008-02-15 07:34:16;2015-04-21 15:54:10;;;;;2.5;1.5;1.0;3.0;Non;Non;Sens inverse;;;Oui;0;Physiquement impossible;;;;;;;;;Non;;;;;34172;34172;Classique;;;;;;;;;;;;;;;;;;;LINESTRING Z (768347 6277835.4 49.5, 768354.8 6277838.5 50.4, 768360.4 6277838.7 50.4, 768366.7 6277835.5 50.5, 768378.7 6277827.9 50.9, 768403.2 6277811.4 52, 768409.2 6277805.8 52.1, 768414.1 6277798.5 52.5)
-TRONROUT0000000044846129;Route à 1 chaussée;AV MAURICE PLANES;AV MAURICE PLANES;;;5;Non;0;En service;2006-12-12 11:20:44;2011-09-09 10:55:38;;;;;2.5;1.5;2.0;4.0;Non;Non;Sens direct;;;Oui;30;Libre;;;;;;;;;Non;275.0;274.0;441.0;440.0;34172;34172;Métrique;;;34070.0;34070.0;;341723666;341723666;;;;;;;;;;;;LINESTRING Z (768246.5 6277863.2 46, 768374.5 6277791.4 51, 768391.2 6277782.1 51.7)
-TRONROUT0000000044846124;Route à 1 chaussée;QU JEAN PERIDIER;QU JEAN PERIDIER;;;5;Non;0;En service;2006-12-12 11:20:44;2011-09-09 10:55:38;;;;;2.5;1.5;2.0;4.0;Non;Non;Sens direct;;;Oui;30;Libre;;;;;;;;;Non;;343.0;;199.0;34172;34172;Métrique;;;34070.0;34070.0;;341722996;341722996;;;;;;;;;;;;LINESTRING Z (767829.8 6277782.7 35.5, 767839.6 6277802.2 36.5, 767846.1 6277815.5 36.1, 767855.4 6277831.9 35.2, 767864.6 6277844.1 35.8, 767887.2 6277861.6 36, 767895.6 6277868.2 35.7)
-TRONROUT0000000044846003;Route à 1 chaussée;;;;;5;Non;0;En service;2006-12-12 11:20:44;2015-10-05 19:17:23;;;;;2.5;1.5;2.0;5.0;Non;Non;Double sens;;;Oui;0;Restreint aux ayants droit;;;;;;;;;Non;;;;;34172;34172;Classique;;;;;;;;;;;;;;;;;;;LINESTRING Z (768561.5 6277818.1 52.5, 768529.2 6277807.1 52, 768523.6 6277805.6 52, 768519.5 6277805.2 52, 768515.8 6277807.5 52, 768513 6277810.8 52, 768484.4 6277852.8 52)
-TRONROUT0000000240976752;Route à 1 chaussée;IMP GUY DE MAUPASSANT;IMP GUY DE MAUPASSANT;;;5;Non;0;En service;2010-07-16 12:45:59;2011-09-09 10:55:38;;2009-07-01;;;2.5;1.5;2.0;4.0;Non;Non;Sens direct;;;Oui;30;Libre;;;;;;;;;Non;;;;;34172;34172;Métrique;;;34070.0;34070.0;;341728082;341728082;;;;;;;;;;;;LINESTRING Z (768063 6277826.5 45.4, 768063.7 6277829.1 45.4, 768063.5 6277832.7 45.4, 768062.7 6277835 45.4, 768060.7 6277836.1 45.4, 768057.9 6277836.5 45.4, 768054.4 6277836.5 45.4, 768052.7 6277835.4 45.4, 768050.9 6277833.4 45.4, 768050.4 6277831.1 45.4, 768050.8 6277828.1 45.4, 768052.6 6277825.7 45.4, 768055.2 6277824.5 45.4, 768058.7 6277824.4 45.4, 768061.5 6277825.1 45.4, 768063 6277826.5 45.4)
-TRONROUT0000000044846144;Route à 1 chaussée;R TOPAZE;R TOPAZE;;;5;Non;0;En service;2006-12-12 11:20:44;2015-04-21 15:54:10;;;;;2.5;1.5;1.0;4.0;Non;Non;Sens inverse;;;Oui;30;Libre;;;;;;;;;Non;;;;;34172;34172;Classique;;;34070.0;34070.0;;341728035;341728035;;;;;;;;;;;;LINESTRING Z (768340.6 6277839.3 49.6, 768347 6277835.4 49.6)
-TRONROUT0000000291716390;Route à 1 chaussée;QU FLORA TRISTAN;QU FLORA TRISTAN;;;5;Non;0;En service;2011-11-22 12:28:30;;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;;232.0;;380.0;34172;34172;Métrique;;;34070.0;34070.0;;341722243;341722243;;;;;;;;;;;;LINESTRING Z (767889.5 6277874.9 35.2, 767851.9 6277847.5 35.3, 767848.2 6277842.3 35.3, 767834.3 6277814.9 35.6, 767826.6 6277800.5 35.6)
-TRONROUT0000000349592970;Route à 1 chaussée;R TOPAZE;R TOPAZE;;;5;Non;0;En service;2015-04-21 15:54:10;;;;;;2.5;1.5;1.0;4.0;Non;Non;Sens inverse;;;Oui;30;Libre;;;;;;;;;Non;;;;;34172;34172;Classique;;;34070.0;34070.0;;341728035;341728035;;;;;;;;;;;;LINESTRING Z (768307.8 6277849.8 46.3, 768311.9 6277853.8 49.1, 768314.7 6277853.9 49.1, 768317 6277853.1 49.2, 768328.5 6277846.8 49.2, 768340.6 6277839.3 49.6)
-TRONROUT0000000044846160;Route à 1 chaussée;PL DE BABYLONE;PL DE BABYLONE;;;5;Non;0;En service;2006-12-12 11:20:44;2011-09-09 10:55:38;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;;;;;34172;34172;Linéaire;;;34070.0;34070.0;;341728081;341728081;;;;;;;;;;;;LINESTRING Z (767928.4 6277836.7 39.5, 767906.6 6277856.7 37.3, 767895.6 6277868.2 35.8)
-TRONROUT0000000349592969;Sentier;ALL HONORE DE BALZAC;ALL HONORE DE BALZAC;;;6;Non;0;En service;2015-04-21 15:54:10;;;;;;2.5;1.5;;;Non;Non;Sans objet;;;Oui;0;Physiquement impossible;;;;;;;;;Non;;;;;34172;34172;Classique;;;;;;34172#0SZ;34172#0SZ;;;;;;;;;;;;LINESTRING Z (768359.4 6277866.1 50, 768359.2 6277865.8 50, 768357.6 6277863.5 50, 768355.3 6277860.1 50, 768354 6277858.3 50, 768352.8 6277856.5 50, 768351.6 6277854.8 50, 768350.4 6277853 50, 768348.1 6277849.5 50, 768345.4 6277846 50, 768342.7 6277842 49.9, 768340.6 6277839.3 49.6)
-TRONROUT0000000044846087;Route à 2 chaussées;AV DE VANIERES;AV DE VANIERES;;;3;Non;0;En service;2006-12-12 11:20:44;2021-12-10 18:01:06;;;;;20.0;2.5;2.0;7.0;Non;Non;Sens direct;;;Oui;45;Libre;;;;;;;;;Non;;;;;34172;34172;Classique;;;34070.0;34070.0;;341725704;341725704;ROUTNOMM0000002275428288;;M65;;Route intercommunale;Montpellier Méditerranée Métropole;;;;;;LINESTRING Z (768307.8 6277849.8 46.3, 768256.5 6277878.3 46.2)
-TRONROUT0000000044846108;Route à 1 chaussée;R DU PAS DU LOUP;R DU PAS DU LOUP;;;5;Non;0;En service;2006-12-12 11:20:44;2011-09-09 10:55:38;;;;;2.5;1.5;2.0;7.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;;;;;34172;34172;Métrique;;;34070.0;34070.0;;341724150;341724150;;;;;;;;;;;;LINESTRING Z (768246.5 6277863.2 46, 768252.2 6277871.7 46.3)
-TRONROUT0000000349592963;Route à 1 chaussée;R FELIX EBOUE;R FELIX EBOUE;;;5;Non;0;En service;2015-04-21 15:54:10;2015-04-24 10:28:59;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;87.0;88.0;129.0;130.0;34172;34172;Métrique;;;;;;341728068;341728068;;;;;;;;;;;;LINESTRING Z (768300.4 6277881.5 47.1, 768302.5 6277880.2 47.2, 768307.2 6277877.4 47.4, 768312.1 6277874.5 47.6, 768317 6277871.6 47.8, 768321.6 6277868.9 48, 768325.9 6277866.4 48.2, 768329.8 6277864.2 48.3, 768333.4 6277862.2 48.6, 768336.8 6277860.2 48.7)
-TRONROUT0000000044846172;Sentier;;;;;6;Non;0;En service;2006-12-12 11:20:44;2011-11-22 12:28:30;;;;;2.5;1.5;;;Non;Non;Sans objet;;;Oui;0;Physiquement impossible;;;;;;;;;Non;;;;;34172;34172;Classique;;;;;;;;;;;;;;;;;;;LINESTRING Z (767889.5 6277874.9 35.2, 767895.6 6277868.2 35.8)
-TRONROUT0000000044846127;Route à 1 chaussée;R DU PAS DU LOUP;R DU PAS DU LOUP;;;5;Non;0;En service;2006-12-12 11:20:44;2011-09-09 10:55:38;;;;;2.5;1.5;2.0;7.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;;;;;34172;34172;Métrique;;;34070.0;34070.0;;341724150;341724150;;;;;;;;;;;;LINESTRING Z (768252.2 6277871.7 46.3, 768254.2 6277875.2 46.5, 768256.5 6277878.3 46.2)
-TRONROUT0000000109054346;Route à 1 chaussée;QU FLORA TRISTAN;QU FLORA TRISTAN;;;5;Non;0;En service;2007-12-11 13:15:21;2015-04-29 15:14:41;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;;;;;34172;34172;;;;34070.0;34070.0;;341722243;341722243;;;;;;;;;;;;LINESTRING Z (767892.7 6277877.1 35.2, 767889.5 6277874.9 35.2)
-TRONROUT0000000044846145;Route à 1 chaussée;AV MAURICE PLANES;AV MAURICE PLANES;;;5;Non;0;En service;2006-12-12 11:20:44;2011-09-09 10:55:38;;;;;2.5;1.5;2.0;4.0;Non;Non;Sens inverse;;;Oui;30;Libre;;;;;;;;;Non;219.0;220.0;275.0;274.0;34172;34172;Métrique;;;34070.0;34070.0;;341723666;341723666;;;;;;;;;;;;LINESTRING Z (768197.5 6277889.9 45.3, 768211 6277883.1 45.8, 768246.5 6277863.2 46)
-TRONROUT0000000044846083;Route à 1 chaussée;R DU PAS DU LOUP;R DU PAS DU LOUP;;;5;Non;0;En service;2006-12-12 11:20:44;2011-09-09 10:55:38;;;;;2.5;1.5;2.0;7.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;;;;;34172;34172;Métrique;;;34070.0;34070.0;;341724150;341724150;;;;;;;;;;;;LINESTRING Z (768256.5 6277878.3 46.2, 768265.7 6277890.8 45.5)
-TRONROUT0000000349592965;Route à 1 chaussée;R FELIX EBOUE;R FELIX EBOUE;;;5;Non;0;En service;2015-04-21 15:54:10;;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;;;;;34172;34172;Classique;;;;;;341728068;341728068;;;;;;;;;;;;LINESTRING Z (768283.8 6277891.8 46.8, 768284.1 6277891.6 46.8, 768285.4 6277890.8 46.9, 768287.9 6277889.2 46.9, 768291 6277887.2 47, 768294.6 6277885 47, 768298.3 6277882.8 47.1, 768300.4 6277881.5 47.1)
-TRONROUT0000000349592966;Route à 1 chaussée;R FELIX EBOUE;R FELIX EBOUE;;;5;Non;0;En service;2015-04-21 15:54:10;2015-04-24 10:28:59;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;55.0;54.0;87.0;88.0;34172;34172;Métrique;;;;;;341728068;341728068;;;;;;;;;;;;LINESTRING Z (768320 6277905.2 46.4, 768317.5 6277905.5 46.4, 768315.8 6277905.3 46.2, 768314.1 6277903.7 46.3, 768312.7 6277901.3 46.8, 768308.6 6277894.8 47.5, 768306.5 6277891.3 47.3, 768305.3 6277889.8 47.5, 768304 6277887.9 47.4, 768303.2 6277886.5 47.2, 768302.2 6277884.7 47.3, 768301.3 6277883.2 46.9, 768300.7 6277882 47.1, 768300.4 6277881.5 47.1)
-TRONROUT0000000349592967;Sentier;ALL HONORE DE BALZAC;ALL HONORE DE BALZAC;;;6;Non;0;En service;2015-04-21 15:54:10;2018-04-27 02:47:08;;;;;3.0;0.5;;;Non;Non;Sans objet;;;Oui;0;Physiquement impossible;;;;;;;;;Non;;;;;34172;34172;Classique;;;;;;34172#0SZ;34172#0SZ;;;;;;;;;;;;LINESTRING Z (768397.9 6277952.8 46.3, 768397.7 6277949.9 46.5, 768410.8 6277940.6 47, 768410.6 6277937.1 46.9, 768359.4 6277866.1 49.9)
-TRONROUT0000000109054345;Route à 1 chaussée;R DAUNOU;R DAUNOU;;;5;Non;0;En service;2007-12-11 13:15:21;2011-11-22 12:28:30;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;1.0;2.0;113.0;112.0;34172;34172;Métrique;;;34070.0;34070.0;;341726012;341726012;;;;;;;;;;;;LINESTRING Z (767846.8 6277946.2 40.5, 767851.5 6277939.1 39.4, 767851.9 6277937.8 39.5, 767851.4 6277935 39.5, 767850.2 6277924.5 39, 767850.7 6277922.9 39, 767851.7 6277921.6 39, 767869 6277902 37.6, 767884.6 6277885 36.8, 767892.7 6277877.1 35.2)
-TRONROUT0000000044846130;Route à 2 chaussées;AV DE VANIERES;AV DE VANIERES;;;3;Non;0;En service;2006-12-12 11:20:44;2021-12-10 18:01:06;;;;;20.0;2.5;2.0;7.0;Non;Non;Sens direct;;;Oui;45;Libre;;;;;;;;;Non;;;;;34172;34172;Classique;;;34070.0;34070.0;;341725704;341725704;ROUTNOMM0000002275428288;;M65;;Route intercommunale;Montpellier Méditerranée Métropole;;;;;;LINESTRING Z (768256.5 6277878.3 46.2, 768256.1 6277878.6 46.4, 768230 6277893.1 44.8, 768183.4 6277920.6 44.7, 768169.8 6277929.4 43.7, 768158.1 6277937.7 42.7, 768145.5 6277945.5 42)
-TRONROUT0000000044846116;Route à 1 chaussée;R DU PAS DU LOUP;R DU PAS DU LOUP;;;5;Non;0;En service;2006-12-12 11:20:44;2011-09-09 10:55:38;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;567.0;566.0;619.0;620.0;34172;34172;Métrique;;;34070.0;34070.0;;341724150;341724150;;;;;;;;;;;;LINESTRING Z (768290.6 6277937.3 45.2, 768283.8 6277925.7 45.2, 768270.2 6277899.9 45.5, 768267 6277894.9 45.5, 768265.7 6277890.8 45.5)
-TRONROUT0000000349592964;Route à 1 chaussée;R FELIX EBOUE;R FELIX EBOUE;;;5;Non;0;En service;2015-04-21 15:54:10;2015-04-24 10:28:59;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;0;Restreint aux ayants droit;;;;;;;;;Non;1.0;2.0;55.0;54.0;34172;34172;Métrique;;;;;;341728068;341728068;;;;;;;;;;;;LINESTRING Z (768290.6 6277937.3 45.3, 768296.7 6277933.2 45.3, 768298.8 6277932 45.3, 768326.5 6277915.9 45.3, 768320 6277905.2 45.3)
-TRONROUT0000000044846136;Route à 2 chaussées;AV DE VANIERES;AV DE VANIERES;;;3;Non;0;En service;2006-12-12 11:20:44;2021-12-10 18:01:06;;;;;20.0;2.5;2.0;7.0;Non;Non;Sens direct;;;Oui;45;Libre;;;;;;;;;Non;;;;;34172;34172;Classique;;;34070.0;34070.0;;341725704;341725704;ROUTNOMM0000002275428288;;M65;;Route intercommunale;Montpellier Méditerranée Métropole;;;;;;LINESTRING Z (768093.7 6277974.6 41.7, 768098.7 6277970.4 41.9, 768110.1 6277961.6 42, 768128.2 6277946.8 42, 768142.7 6277937.7 42.7, 768155.5 6277928.7 43.7, 768171 6277918.6 44.7, 768223 6277887.8 44.8, 768252.2 6277871.7 46.3)
-TRONROUT0000000044846008;Route à 1 chaussée;;;;;5;Non;0;En service;2006-12-12 11:20:44;2020-07-31 15:59:25;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;0;Restreint aux ayants droit;;;;;;;;;Non;;;;;34172;34172;Classique;;;;;;;;;;;;;;;;;;;LINESTRING Z (768529.3 6277939 51.5, 768541.1 6277928 50.5, 768559.7 6277908.3 52, 768574.6 6277916.1 51.2)
-TRONROUT0000000113161397;Route à 1 chaussée;IMP STEPHANE ZWEIG;IMP STEPHANE ZWEIG;;;5;Non;0;En service;2008-01-16 06:54:54;2015-04-21 15:54:10;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;0;Restreint aux ayants droit;;;;;;;;;Non;;;;;34172;34172;Métrique;;;34070.0;34070.0;;341725387;341725387;;;;;;;;;;;;LINESTRING Z (768354.9 6277938 46.9, 768344.5 6277922.7 47.2)
-TRONROUT0000000044846134;Route à 1 chaussée;AV MAURICE PLANES;AV MAURICE PLANES;;;5;Non;0;En service;2006-12-12 11:20:44;2012-06-08 17:25:28;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;65.0;64.0;219.0;220.0;34172;34172;Métrique;;;34070.0;34070.0;;341723666;341723666;;;;;;;;;;;;LINESTRING Z (768066.9 6277971.2 40.7, 768086 6277955.4 40.9, 768133.9 6277922.3 42.3, 768150.4 6277912.6 42.7, 768165 6277906.4 44.1, 768197.5 6277889.9 45.3)
-TRONROUT0000000044846135;Route à 1 chaussée;QU JEAN PERIDIER;QU JEAN PERIDIER;;;5;Non;0;En service;2006-12-12 11:20:44;2015-04-29 15:14:41;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;;199.0;;1.0;34172;34172;Métrique;;;34070.0;34070.0;;341722996;341722996;;;;;;;;;;;;LINESTRING Z (767895.6 6277868.2 35.7, 767904.5 6277875 35.5, 767953.1 6277907 39.5, 767969.7 6277929.3 36.6, 767973.7 6277939.5 37, 767986 6277979.3 37.5, 767988.4 6277983.2 37.7, 767988.8 6277983.9 37.7, 767994.4 6277988.6 38.1, 768001.5 6277993.7 38.3, 768007.4 6277996.7 39.1, 768011.2 6277999.5 39.4, 768013.1 6278002.7 39.1, 768015.6 6278008.2 39)
-TRONROUT0000000044846125;Route à 1 chaussée;QU FLORA TRISTAN;QU FLORA TRISTAN;;;5;Non;0;En service;2006-12-12 11:20:44;2015-04-29 15:14:41;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;232.0;;2.0;;34172;34172;Métrique;;;34070.0;34070.0;;341722243;341722243;;;;;;;;;;;;LINESTRING Z (767892.7 6277877.1 35.2, 767930.1 6277903.5 37.2, 767942 6277914.8 37.2, 767962.4 6277938.3 37.1, 767976 6277985 37.6, 767981.5 6278004.6 37.9, 767983.5 6278007.9 37.9, 767987.9 6278010.1 37.9, 767993.3 6278012.6 38.4, 767998.5 6278013.6 38.4, 768005.1 6278013 38.5, 768011.6 6278010.8 38.8, 768015.6 6278008.2 39)
-TRONROUT0000000113161396;Route à 1 chaussée;IMP STEPHANE ZWEIG;IMP STEPHANE ZWEIG;;;5;Non;0;En service;2008-01-16 06:54:54;2015-04-21 15:54:10;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;0;Restreint aux ayants droit;;;;;;;;;Non;;;;;34172;34172;Métrique;;;34070.0;34070.0;;341725387;341725387;;;;;;;;;;;;LINESTRING Z (768354.9 6277938 46.9, 768367.5 6277957.1 47.3)
-TRONROUT0000000044846140;Route à 1 chaussée;IMP MAC GAFFEY;IMP MAC GAFFEY;;;5;Non;0;En service;2006-12-12 11:20:44;2011-11-22 12:28:30;;;;;20.0;2.5;2.0;7.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;1.0;2.0;125.0;124.0;34172;34172;Métrique;;;34070.0;34070.0;;341723364;341723364;;;;;;;;;;;;LINESTRING Z (768066.9 6277971.2 40.7, 768035.2 6277925.2 39)
-TRONROUT0000000109054352;Rond-point;RPT SAINT-EXUPERY;RPT SAINT-EXUPERY;;;3;Non;0;En service;2007-12-11 13:15:21;2021-12-10 18:01:06;;;;;2.5;1.5;2.0;6.0;Non;Non;Sens direct;;;Oui;25;Libre;;;;;;;;;Non;;;;;34172;34172;Classique;;;;;;34172#0AZ;34172#0AZ;ROUTNOMM0000002275427566;;M5;;Route intercommunale;Montpellier Méditerranée Métropole;;;;;;LINESTRING Z (767846.8 6277946.2 40.5, 767848.9 6277947.5 40.5, 767852.5 6277951.7 40.5, 767854.1 6277955.8 40.5, 767854.4 6277958.5 40.5)
-TRONROUT0000000211407861;Route à 1 chaussée;R DU PAS DU LOUP;R DU PAS DU LOUP;;;5;Non;0;En service;2008-11-21 10:29:38;2011-09-09 10:55:38;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;531.0;530.0;567.0;566.0;34172;34172;Métrique;;;34070.0;34070.0;;341724150;341724150;;;;;;;;;;;;LINESTRING Z (768309.7 6277967.6 44.9, 768305.9 6277960.8 44.9, 768293.9 6277943 45.2, 768290.6 6277937.3 45.2)
-TRONROUT0000000044846148;Route à 1 chaussée;IMP STEPHANE ZWEIG;IMP STEPHANE ZWEIG;;;5;Non;0;En service;2006-12-12 11:20:44;2012-01-10 15:17:32;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;0;Restreint aux ayants droit;;;;;;;;;Non;1.0;2.0;55.0;54.0;34172;34172;Classique;;;34070.0;34070.0;;341725387;341725387;;;;;;;;;;;;LINESTRING Z (768309.7 6277967.6 44.9, 768322.5 6277959.7 46.8, 768354.9 6277938 46.9)
-TRONROUT0000000044846052;Route à 1 chaussée;BD PAUL VALERY;BD PAUL VALERY;;;4;Non;0;En service;2006-12-12 11:20:44;2016-09-02 11:30:49;;;;;2.5;1.5;2.0;6.0;Non;Non;Double sens;;;Oui;40;Libre;;;;;;;;;Non;2476.0;2477.0;2412.0;2413.0;34172;34172;Métrique;;;34070.0;34070.0;;341724215;341724215;;;;;;;;;;;;LINESTRING Z (768566.4 6277928.7 51.1, 768560 6277938.5 51, 768530.4 6277980.8 49.9)
-TRONROUT0000000109054354;Rond-point;RPT SAINT-EXUPERY;RPT SAINT-EXUPERY;;;3;Non;0;En service;2007-12-11 13:15:21;2021-12-10 18:01:06;;;;;2.5;1.5;2.0;6.0;Non;Non;Sens direct;;;Oui;25;Libre;;;;;;;;;Non;;;;;34172;34172;Classique;;;;;;34172#0AZ;34172#0AZ;ROUTNOMM0000002275427566;;M5;;Route intercommunale;Montpellier Méditerranée Métropole;;;;;;LINESTRING Z (767854.4 6277958.5 40.5, 767854.5 6277960.7 40.5, 767854 6277964.6 40.5, 767851.8 6277968.5 40.5, 767848.7 6277971.4 40.5, 767844.9 6277973.5 40.5, 767841.4 6277974.3 40.5)
-TRONROUT0000000044844000;Route à 1 chaussée;R DU PAS DU LOUP;R DU PAS DU LOUP;;;5;Non;0;En service;2006-12-12 11:20:44;2011-09-09 10:55:38;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;519.0;518.0;531.0;530.0;34172;34172;Métrique;;;34070.0;34070.0;;341724150;341724150;;;;;;;;;;;;LINESTRING Z (768315.7 6277978 44.8, 768309.7 6277967.6 44.9)
-TRONROUT0000000044843981;Route à 1 chaussée;RTE DE LAVERUNE;RTE DE LAVERUNE;;;3;Non;0;En service;2006-12-12 11:20:44;2021-12-10 18:01:06;;;;;2.5;1.5;1.0;3.0;Non;Non;Sens inverse;;;Oui;45;Libre;;;;;;;;;Non;;;;;34172;34172;Métrique;;;34070.0;34070.0;;341723200;341723200;ROUTNOMM0000002275427566;;M5;;Route intercommunale;Montpellier Méditerranée Métropole;;;;;;LINESTRING Z (767877.1 6277988.8 40.4, 767866.1 6277976.5 40.5, 767861.5 6277970.9 40.2, 767858.9 6277966.7 40.2, 767854.4 6277958.5 40.5)
-TRONROUT0000000349434848;Sentier;;;;;6;Non;0;En service;2015-04-09 16:56:23;2015-04-21 15:54:10;;;;;2.5;1.5;;;Non;Non;Sans objet;;;Oui;0;Physiquement impossible;;;;;;;;;Non;;;;;34172;34172;Classique;;;34070.0;34070.0;;;;;;;;;;;;;;;LINESTRING Z (768397.9 6277952.8 46.8, 768399.1 6277952.7 46.8, 768404.4 6277958.9 46.8, 768408.9 6277964.7 46.8, 768413 6277971.1 47.2, 768418.1 6277976.7 47.2, 768420.7 6277981.7 47.2, 768427.7 6277992.6 47.2, 768432.9 6277999.5 47.1)
-TRONROUT0000000044846093;Route à 1 chaussée;;;;;5;Non;0;En service;2006-12-12 11:20:44;2012-01-10 14:15:57;;;;;2.5;1.5;1.0;3.0;Non;Non;Sens inverse;;;Oui;30;Libre;;;;;;;;;Non;;;;;34172;34172;;;;;;;;;;;;;;;;;;;;LINESTRING Z (768126.8 6278009.2 41.2, 768121.1 6277999.5 41.9, 768119.2 6277993.6 41.9, 768118.2 6277987.7 41.9, 768119 6277980.6 41.9, 768121.2 6277973.7 41.9, 768123.3 6277968.8 41.9, 768127.9 6277961.7 41.9, 768145.5 6277945.5 42)
-TRONROUT0000000349592968;Sentier;ALL ARISTIDE BRIAND;ALL ARISTIDE BRIAND;;;6;Non;0;En service;2015-04-21 15:54:10;;;;;;2.5;1.5;;;Non;Non;Sans objet;;;Oui;0;Physiquement impossible;;;;;;;;;Non;;;;;34172;34172;Classique;;;34070.0;34070.0;;34172#0T4;34172#0T4;;;;;;;;;;;;LINESTRING Z (768328.7 6278002 46.1, 768356.3 6277974.1 46.4, 768361.7 6277969.9 46.4, 768364.3 6277968.5 46.4, 768369.1 6277969.4 46.4, 768373.1 6277967.9 46.4, 768385 6277959 46.7, 768394.4 6277953.3 46.8, 768397.9 6277952.8 46.8)
-TRONROUT0000000044843914;Route à 1 chaussée;RTE DE LAVERUNE;RTE DE LAVERUNE;;;3;Non;0;En service;2006-12-12 11:20:44;2021-12-10 18:01:06;;;;;2.5;1.5;1.0;3.0;Non;Non;Sens inverse;;;Oui;45;Libre;;;;;;;;;Non;1718.0;1719.0;1702.0;1701.0;34172;34172;Métrique;;;34070.0;34070.0;;341723200;341723200;ROUTNOMM0000002275427566;;M5;;Route intercommunale;Montpellier Méditerranée Métropole;;;;;;LINESTRING Z (767841.4 6277974.3 40.5, 767852.9 6277977.1 40.5, 767862.6 6277981.2 40.6, 767877.1 6277988.8 40.4)
-TRONROUT0000000044846121;Route à 2 chaussées;AV DE VANIERES;AV DE VANIERES;;;3;Non;0;En service;2006-12-12 11:20:44;2021-12-10 18:01:06;;;;;20.0;2.5;2.0;7.0;Non;Non;Sens direct;;;Oui;45;Libre;;;;;;;;;Non;;;;;34172;34172;Classique;;;34070.0;34070.0;;341725704;341725704;ROUTNOMM0000002275428288;;M65;;Route intercommunale;Montpellier Méditerranée Métropole;;;;;;LINESTRING Z (768145.5 6277945.5 42, 768122.5 6277961.8 42, 768108.7 6277972.7 41.9, 768095 6277985.2 41.2, 768078.6 6278000.2 41, 768065.7 6278013.4 40, 768061.5 6278017.5 41, 768055.1 6278024.7 40.9)
-TRONROUT0000000044844006;Route à 1 chaussée;AV MAURICE PLANES;AV MAURICE PLANES;;;5;Non;0;En service;2006-12-12 11:20:44;2011-09-09 10:55:38;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;1.0;2.0;65.0;64.0;34172;34172;Métrique;;;34070.0;34070.0;;341723666;341723666;;;;;;;;;;;;LINESTRING Z (768015.6 6278008.2 39, 768018.3 6278006.6 39.2, 768039.1 6277992.7 40.1, 768054.7 6277981.2 39.8, 768066.9 6277971.2 40.7)
-TRONROUT0000000044843934;Route à 1 chaussée;R DU PAS DU LOUP;R DU PAS DU LOUP;;;5;Non;0;En service;2006-12-12 11:20:44;2011-09-09 10:55:38;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;491.0;492.0;519.0;518.0;34172;34172;Métrique;;;34070.0;34070.0;;341724150;341724150;;;;;;;;;;;;LINESTRING Z (768328.7 6278002 46.1, 768326.2 6277997.4 45.1, 768318 6277982 45.2, 768315.7 6277978 44.8)
-TRONROUT0000000044843799;Route à 1 chaussée;R ALBERT VIGER;R ALBERT VIGER;;;5;Non;0;En service;2006-12-12 11:20:44;2011-09-09 10:55:38;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;143.0;150.0;147.0;150.0;34172;34172;Classique;;;34070.0;34070.0;;341720156;341720156;;;;;;;;;;;;LINESTRING Z (768559.7 6278002.4 53, 768530.4 6277980.8 49.9)
-TRONROUT0000000044843901;Route à 1 chaussée;RTE DE LAVERUNE;RTE DE LAVERUNE;;;3;Non;0;En service;2006-12-12 11:20:44;2021-12-10 18:01:06;;;;;2.5;1.5;2.0;7.0;Non;Non;Double sens;;;Oui;45;Libre;;;;;;;;;Non;1702.0;1701.0;1666.0;1667.0;34172;34172;Métrique;;;34070.0;34070.0;;341723200;341723200;ROUTNOMM0000002275427566;;M5;;Route intercommunale;Montpellier Méditerranée Métropole;;;;;;LINESTRING Z (767877.1 6277988.8 40.4, 767894.1 6278000.9 40.7)
-TRONROUT0000000044844021;Bretelle;;;;;3;Non;0;En service;2006-12-12 11:20:44;2021-12-10 18:01:06;;;;;2.5;1.5;1.0;3.5;Non;Non;Sens direct;;;Oui;45;Libre;;;;;;;;;Non;;;;;34172;34172;;;;;;;;;ROUTNOMM0000002275428288;;M65;;Route intercommunale;Montpellier Méditerranée Métropole;;;;;;LINESTRING Z (768022.2 6278026.5 40.3, 768043.5 6278008.7 41.4, 768063.6 6277990.6 41.9, 768093.7 6277974.6 41.7)
-TRONROUT0000000115740633;Route à 1 chaussée;;;;;5;Non;0;En service;2008-02-08 12:46:31;2015-10-05 19:17:23;;;;;2.5;1.5;2.0;5.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;;;;;34172;34172;Classique;;;;;;;;;;;;;;;;;;;LINESTRING Z (768432.9 6277999.5 47.1, 768433.7 6278003.2 47.1, 768433.5 6278007.7 47.1, 768433.7 6278011.5 47.1)
-TRONROUT0000000044843997;Route à 1 chaussée;;;;;5;Non;0;En service;2006-12-12 11:20:44;2015-10-05 19:17:23;;;;;2.5;1.5;2.0;5.0;Non;Non;Double sens;;;Oui;0;Restreint aux ayants droit;;;;;;;;;Non;;;;;34172;34172;Classique;;;34070.0;34070.0;;;;;;;;;;;;;;;LINESTRING Z (768433.7 6278011.5 47.1, 768418.3 6278021.2 48.1, 768415.2 6278022.1 48.2, 768404.4 6278024 48.1, 768403.2 6278023.3 48.1, 768402.1 6278022.1 48.1, 768380.2 6277987.1 47.8)
-TRONROUT0000000044843869;Route à 1 chaussée;BD PAUL VALERY;BD PAUL VALERY;;;4;Non;0;En service;2006-12-12 11:20:44;2016-09-02 11:30:49;;;;;2.5;1.5;2.0;6.0;Non;Non;Double sens;;;Oui;40;Libre;;;;;;;;;Non;2412.0;2413.0;2328.0;2327.0;34172;34172;Métrique;;;34070.0;34070.0;;341724215;341724215;;;;;;;;;;;;LINESTRING Z (768530.4 6277980.8 49.9, 768499.8 6278023.8 50.1, 768492.5 6278036.7 50.1, 768484.8 6278053.2 49.8)
-TRONROUT0000000044844019;Bretelle;;;;;3;Non;0;En service;2006-12-12 11:20:44;2021-12-10 18:01:06;;;;;2.5;1.5;1.0;3.5;Non;Non;Sens inverse;;;Oui;45;Libre;;;;;;;;;Non;;;;;34172;34172;;;;;;;;;ROUTNOMM0000002275428288;;M65;;Route intercommunale;Montpellier Méditerranée Métropole;;;;;;LINESTRING Z (768022.2 6278026.5 40.3, 768004.5 6278033.4 43.1, 767995.2 6278036.1 43.1, 767981.1 6278036.6 43.1, 767968.3 6278035.9 43.1, 767952.5 6278033.6 43.1, 767939.4 6278027.7 42.2, 767928 6278020.6 41.2, 767894.1 6278000.9 40.7)
-TRONROUT0000000044843917;Route à 1 chaussée;;;;;5;Non;0;En service;2006-12-12 11:20:44;2015-10-05 19:17:23;;;;;2.5;1.5;2.0;5.0;Non;Non;Double sens;;;Oui;0;Restreint aux ayants droit;;;;;;;;;Non;;;;;34172;34172;Classique;;;;;;;;;;;;;;;;;;;LINESTRING Z (768484.8 6278053.2 49.8, 768473.4 6278048.1 49.9, 768465.6 6278040.9 49.1, 768455.5 6278026.7 48.6, 768444.2 6278010.7 48, 768441 6278004.9 46.9)
-TRONROUT0000002221594419;Route à 1 chaussée;;;;;5;Non;0;En service;2020-12-04 15:20:43;;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;Libre;;;;;;;;;;;;;34172;34172;;;;;;;;;;;;;;;;;;;;LINESTRING Z (768368.9 6278081.9 46.3, 768371 6278080.8 46.3, 768398.5 6278073.1 46.3, 768399.1 6278070.5 46.3, 768387.9 6278027.3 46.3, 768380.2 6278010.9 46.3, 768371.9 6277997.6 46.3, 768361 6277982.9 46.3)
-TRONROUT0000000044843939;Route à 2 chaussées;AV DE VANIERES;AV DE VANIERES;;;3;Non;0;En service;2006-12-12 11:20:44;2021-12-10 18:01:06;;2009-07-01;;;2.5;1.5;2.0;7.0;Non;Non;Sens inverse;;;Oui;45;Libre;;;;;;;;;Non;;;;;34172;34172;Classique;;;34070.0;34070.0;;341725704;341725704;ROUTNOMM0000002275428288;;M65;;Route intercommunale;Montpellier Méditerranée Métropole;;;;;;LINESTRING Z (768093.7 6277974.6 41.7, 768084 6277983.2 41.2, 768069.5 6277997.1 41.1, 768058.4 6278009 40, 768054.7 6278012.9 41.1, 768028.5 6278043.2 40.3, 768014.1 6278062.1 40.1, 768005.7 6278074 40, 767988.3 6278099.1 40.1, 767986.4 6278101.8 40.5)
-TRONROUT0000000044843957;Route à 1 chaussée;RTE DE LAVERUNE;RTE DE LAVERUNE;;;3;Non;0;En service;2006-12-12 11:20:44;2021-12-10 18:01:06;;;;;2.5;1.5;2.0;7.0;Non;Non;Double sens;;;Oui;45;Libre;;;;;;;;;Non;1666.0;1667.0;1554.0;1555.0;34172;34172;Métrique;;;34070.0;34070.0;;341723200;341723200;ROUTNOMM0000002275427566;;M5;;Route intercommunale;Montpellier Méditerranée Métropole;;;;;;LINESTRING Z (767894.1 6278000.9 40.7, 767912.2 6278015.6 39, 767977.6 6278076.4 44.7)
-TRONROUT0000000044843916;Route à 1 chaussée;;;;;5;Non;0;En service;2006-12-12 11:20:44;2015-10-05 19:17:23;;;;;2.5;1.5;2.0;5.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;;;;;34172;34172;Classique;;;;;;;;;;;;;;;;;;;LINESTRING Z (768433.7 6278011.5 47.1, 768433.7 6278012.4 47.1, 768435.9 6278017.1 47.1, 768442.6 6278028.4 47.6, 768462.3 6278055.5 48.8, 768470.2 6278064.4 49.6, 768478.9 6278069.7 50.5)
-TRONROUT0000000044843932;Route à 1 chaussée;R DU PAS DU LOUP;R DU PAS DU LOUP;;;5;Non;0;En service;2006-12-12 11:20:44;2020-12-04 15:20:43;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;401.0;402.0;491.0;490.0;34172;34172;Métrique;;;34070.0;34070.0;;341724150;341724150;;;;;;;;;;;;LINESTRING Z (768368.9 6278081.9 46.3, 768353.5 6278054.7 45.2, 768334.3 6278012.1 45, 768333.9 6278011.3 45.1, 768328.7 6278002 46.1)
-TRONROUT0000000113161398;Route à 1 chaussée;R HEBERT;R HEBERT;;;5;Non;0;En service;2008-01-16 06:54:54;2015-07-03 16:40:42;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;183.0;182.0;375.0;374.0;34172;34172;Métrique;;;34070.0;34070.0;;341722756;341722756;;;;;;;;;;;;LINESTRING Z (768261.4 6278109.9 44.9, 768249.7 6278102.4 44.5, 768247 6278100.4 44.4, 768233.3 6278090.3 44, 768230.1 6278085.7 43.6, 768228.6 6278079.8 43.1, 768227.6 6278071.5 43.1, 768227.5 6278053.5 42.9, 768228.3 6278045.7 42.9, 768230.4 6278038.7 43.6, 768234.8 6278031.9 43.7, 768242.7 6278025.4 43.5, 768298.2 6277990.1 43.1, 768315.7 6277978 44.8)
-TRONROUT0000000044844020;Bretelle;;;;;4;Non;0;En service;2006-12-12 11:20:44;2011-11-22 12:28:30;;;;;2.5;1.5;1.0;3.0;Non;Non;Sens inverse;;;Oui;45;Libre;;;;;;;;;Non;;;;;34172;34172;;;;;;;;;;;;;;;;;;;;LINESTRING Z (768033.7 6278070.8 40.1, 768037.6 6278059.1 39.7, 768042.5 6278049.6 39.6, 768048.1 6278039.1 39.8, 768055.1 6278024.7 40.9)
-TRONROUT0000000044843991;Route à 1 chaussée;ALL DES DAUPHINS;ALL DES DAUPHINS;;;5;Non;0;En service;2006-12-12 11:20:44;2012-06-08 17:25:28;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;;;;;34172;34172;Classique;;;34070.0;34070.0;;34172#0MI;34172#0MI;;;;;;;;;;;;LINESTRING Z (768141.9 6278089 42.7, 768156.6 6278059.4 40.8, 768156.6 6278056.5 41.2, 768155.8 6278051.1 41.4, 768151.4 6278043.4 41.4, 768126.8 6278009.2 41.2)
-TRONROUT0000000044843860;Route à 1 chaussée;R ALBERT VIGER;R ALBERT VIGER;;;5;Non;0;En service;2006-12-12 11:20:44;2011-09-09 10:55:38;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;37.0;90.0;115.0;110.0;34172;34172;Classique;;;34070.0;34070.0;;341720156;341720156;;;;;;;;;;;;LINESTRING Z (768499.7 6278098.2 52.8, 768559.7 6278002.4 53)
-TRONROUT0000000044844018;Bretelle;;;;;3;Non;0;En service;2006-12-12 11:20:44;2021-12-10 18:01:06;;;;;2.5;1.5;1.0;3.5;Non;Non;Sens inverse;;;Oui;45;Libre;;;;;;;;;Non;;;;;34172;34172;;;;;;;;;ROUTNOMM0000002275428288;;M65;;Route intercommunale;Montpellier Méditerranée Métropole;;;;;;LINESTRING Z (768022.2 6278026.5 40.3, 767985 6278058.6 44.5, 767979.7 6278068 44.7, 767977.6 6278076.4 44.7)
-TRONROUT0000000044843880;Route à 1 chaussée;BD PAUL VALERY;BD PAUL VALERY;;;4;Non;0;En service;2006-12-12 11:20:44;2016-09-02 11:30:49;;;;;2.5;1.5;2.0;6.0;Non;Non;Double sens;;;Oui;40;Libre;;;;;;;;;Non;2328.0;2327.0;2310.0;2309.0;34172;34172;Métrique;;;34070.0;34070.0;;341724215;341724215;;;;;;;;;;;;LINESTRING Z (768484.8 6278053.2 49.8, 768483.2 6278056 49.6, 768478.9 6278069.7 50.5)
-TRONROUT0000000115740647;Route à 1 chaussée;;;;;5;Non;0;En service;2008-02-08 12:49:34;2015-10-05 19:17:23;;;;;2.5;1.5;2.0;5.0;Non;Non;Double sens;;;Oui;0;Restreint aux ayants droit;;;;;;;;;Non;;;;;34172;34172;Classique;;;;;;;;;;;;;;;;;;;LINESTRING Z (768549.2 6278082.5 55.9, 768561.6 6278064 55.8)
-TRONROUT0000000044843959;Bretelle;;;;;3;Non;0;En service;2006-12-12 11:20:44;2011-11-22 12:28:30;;;;;2.5;1.5;1.0;3.5;Non;Non;Sens inverse;;;Oui;45;Libre;;;;;;;;;Non;;;;;34172;34172;;;;;;;;;;;;;;;;;;;;LINESTRING Z (767894.1 6278000.9 40.7, 767927.6 6278036.4 42.5, 767940.1 6278053.5 43.5, 767944.6 6278061.3 43.6, 767949.6 6278079.2 43.6, 767950.6 6278088.4 43.6, 767950.5 6278097.8 42.9, 767947.7 6278114.1 41.8, 767945.3 6278122.4 41.8, 767941.8 6278133.1 41.8, 767934 6278150 42.1)
-TRONROUT0000000044843907;Route à 1 chaussée;;;;;5;Non;0;En service;2006-12-12 11:20:44;2011-11-22 12:28:30;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;;;;;34172;34172;Métrique;;;;;;;;;;;;;;;;;;;LINESTRING Z (768061.7 6278078.6 40, 768070.2 6278072.8 40, 768074.6 6278072.4 40, 768076.9 6278072.8 40, 768078.8 6278073 40, 768097.1 6278078.7 40.2)
-TRONROUT0000000044843919;Sentier;;;;;6;Non;0;En service;2006-12-12 11:20:44;;;;;;2.5;1.5;;;Non;Non;Sans objet;;;Oui;0;Physiquement impossible;;;;;;;;;Non;;;;;34172;34172;Classique;;;;;;;;;;;;;;;;;;;LINESTRING Z (768202 6278096.9 43.5, 768198.5 6278100 43.6, 768194 6278101.7 43.6, 768189.1 6278102.1 43.5, 768184.3 6278101.9 43.5, 768180.4 6278101.1 43.5, 768176.8 6278099.3 43.5, 768172.3 6278095.8 43.5, 768168.6 6278092.2 43.5, 768166.5 6278088.3 43.5, 768165 6278084.3 43.5, 768164.4 6278080 43.5, 768164.4 6278075.9 43.5, 768164.6 6278069.6 43.5, 768166.4 6278064.3 43.5, 768171.8 6278058.1 43.5, 768176.4 6278055.6 43.5, 768181 6278053.7 43.5, 768187.7 6278053.2 43.5, 768196.5 6278054.2 43.5, 768200.8 6278056.6 43.5, 768204.4 6278060.2 43.5, 768208.5 6278065.1 43.5, 768210.4 6278070.3 43.5, 768211.1 6278075.4 43.5, 768211.2 6278080.9 43.5, 768209.8 6278087.1 43.5, 768207.1 6278092.4 43.5, 768202 6278096.9 42.8)
-TRONROUT0000000044843996;Route à 1 chaussée;;;;;5;Non;0;En service;2006-12-12 11:20:44;2011-11-22 12:28:30;;;;;2.5;1.5;1.0;3.0;Non;Non;Sens inverse;;;Oui;30;Libre;;;;;;;;;Non;;;;;34172;34172;Classique;;;;;;;;;;;;;;;;;;;LINESTRING Z (768061.7 6278078.6 40, 768051.5 6278084.1 40.7, 768047.3 6278084.7 40.7, 768043.5 6278084.7 40.7, 768040.1 6278083.3 40.7, 768037.2 6278080.7 40.7, 768035.1 6278077.1 40.7, 768033.7 6278070.8 40.1)
-TRONROUT0000000044843887;Route à 1 chaussée;BD PAUL VALERY;BD PAUL VALERY;;;4;Non;0;En service;2006-12-12 11:20:44;2020-07-31 15:57:20;;;;;2.5;1.5;2.0;6.0;Non;Non;Double sens;;;Oui;40;Libre;;;;;;;;;Non;2310.0;2309.0;2284.0;2285.0;34172;34172;Métrique;;;34070.0;34070.0;;341724215;341724215;;;;;;;;;;;;LINESTRING Z (768478.9 6278069.7 50.5, 768472.4 6278089.8 49.7)
-TRONROUT0000000044843899;Route à 1 chaussée;RTE DE LAVERUNE;RTE DE LAVERUNE;;;3;Non;0;En service;2006-12-12 11:20:44;2021-12-10 18:01:06;;;;;2.5;1.5;2.0;7.0;Non;Non;Double sens;;;Oui;45;Libre;;;;;;;;;Non;1554.0;1555.0;1540.0;1541.0;34172;34172;Métrique;;;34070.0;34070.0;;341723200;341723200;;;;;;;;;;;;LINESTRING Z (767977.6 6278076.4 44.7, 767988.1 6278086.1 45.8)
-TRONROUT0000000044843942;Route à 1 chaussée;R CAMILLE DESMOULINS;R CAMILLE DESMOULINS;;;5;Non;0;En service;2006-12-12 11:20:44;2011-09-09 10:55:38;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;157.0;156.0;203.0;204.0;34172;34172;Métrique;;;34070.0;34070.0;;341720947;341720947;;;;;;;;;;;;LINESTRING Z (768097.1 6278078.7 40.2, 768098.5 6278079.1 40.2, 768141.9 6278089 42.7)
-TRONROUT0000000115740648;Route à 1 chaussée;;;;;5;Non;0;En service;2008-02-08 12:49:34;2015-10-05 19:17:23;;;;;2.5;1.5;2.0;5.0;Non;Non;Double sens;;;Oui;0;Restreint aux ayants droit;;;;;;;;;Non;;;;;34172;34172;Classique;;;;;;;;;;;;;;;;;;;LINESTRING Z (768549.2 6278082.5 55.9, 768543 6278091.6 55.9)
-TRONROUT0000000044843918;Route à 1 chaussée;;;;;4;Non;0;En service;2006-12-12 11:20:44;2011-11-22 12:28:30;;;;;2.5;1.5;1.0;3.0;Non;Non;Sens direct;;;Oui;40;Libre;;;;;;;;;Non;;;;;34172;34172;Classique;;;;;;;;;;;;;;;;;;;LINESTRING Z (768033.7 6278070.8 40.1, 768032.1 6278078.4 40.2, 768031.4 6278085.3 40.3, 768031.6 6278092.6 40.5, 768032 6278096.5 40.5, 768032.9 6278100.7 40.6, 768035 6278107.4 40.5, 768037.4 6278112.4 40.6)
-TRONROUT0000000044843850;Route à 1 chaussée;R ALBERT VIGER;R ALBERT VIGER;;;5;Non;0;En service;2006-12-12 11:20:44;2020-07-31 15:57:20;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;;31.0;;31.0;34172;34172;Classique;;;34070.0;34070.0;;341720156;341720156;;;;;;;;;;;;LINESTRING Z (768499.7 6278098.2 52.8, 768489 6278094.8 51.5, 768472.4 6278089.8 49.7)
-TRONROUT0000000044843897;Route à 1 chaussée;RTE DE LAVERUNE;RTE DE LAVERUNE;;;3;Non;1;En service;2006-12-12 11:20:44;2021-12-10 18:01:06;;;;;2.5;1.5;2.0;7.0;Non;Non;Double sens;;;Oui;45;Libre;;;;;;;;;Non;1538.0;1539.0;1516.0;1517.0;34172;34172;Métrique;;;34070.0;34070.0;;341723200;341723200;;;;;;;;;;;;LINESTRING Z (767988.1 6278086.1 45.8, 767993.3 6278091.8 45.5, 768005.2 6278103.8 46)
-TRONROUT0000000044844007;Route à 1 chaussée;;;;;5;Non;0;En service;2006-12-12 11:20:44;2011-11-22 12:28:30;;;;;2.5;1.5;1.0;3.0;Non;Non;Sens inverse;;;Oui;30;Libre;;;;;;;;;Non;;;;;34172;34172;Métrique;;;;;;;;;;;;;;;;;;;LINESTRING Z (768037.4 6278112.4 40.6, 768038.6 6278104 40.9, 768039.2 6278098.7 40.9, 768041.1 6278094.9 41, 768043.7 6278091.8 40.6, 768047.8 6278088.3 40.6, 768061.7 6278078.6 40)
-TRONROUT0000000044843983;Route à 1 chaussée;R MARCEL RAJMAN;R MARCEL RAJMAN;;;5;Non;0;En service;2006-12-12 11:20:44;2015-10-06 20:00:48;;;;;2.5;1.5;2.0;5.0;Non;Non;Sens inverse;;;Oui;0;Restreint aux ayants droit;;;;;;;;;Non;1.0;2.0;45.0;44.0;34172;34172;Métrique;;;34070.0;34070.0;;341728146;341728146;;;;;;;;;;;;LINESTRING Z (767820.4 6278095.086225403 42.01109123434821, 767838 6278102.8 42.2, 767863.4 6278114.7 42.2, 767866.7 6278116.6 42.2, 767866.8 6278116.8 42.2, 767868.4 6278120 42.2)
-TRONROUT0000000240976753;Route à 2 chaussées;AV DE LA RECAMBALE;AV DE LA RECAMBALE;;;3;Non;0;En service;2010-07-16 12:45:59;2021-12-10 18:01:06;;2009-07-01;;;2.5;1.5;2.0;7.0;Non;Non;Sens direct;;;Oui;45;Libre;;;;;;;;;Non;;;;;34172;34172;Classique;;;34070.0;34070.0;;341724832;341724832;ROUTNOMM0000002275428288;;M65;;Route intercommunale;Montpellier Méditerranée Métropole;;;;;;LINESTRING Z (768055.1 6278024.7 40.9, 768034.6 6278048.3 40.3, 768020.7 6278066.7 39.9, 768002.7 6278092.3 39.6, 767944.7 6278174.7 42.9)
-TRONROUT0000000044843903;Route à 1 chaussée;R MARCEL RAJMAN;R MARCEL RAJMAN;;;5;Non;0;En service;2006-12-12 11:20:44;2011-11-22 12:28:30;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;0;Restreint aux ayants droit;;;;;;;;;Non;45.0;44.0;69.0;68.0;34172;34172;Métrique;;;34070.0;34070.0;;341728146;341728146;;;;;;;;;;;;LINESTRING Z (767868.4 6278120 42.2, 767895.6 6278113.8 42.1, 767897.9 6278112.2 42.1, 767902.1 6278105.8 41.7, 767903.8 6278104.7 41.7, 767905.7 6278104.6 41.7, 767908.7 6278105.3 41.5, 767926.7 6278113.4 40.5, 767927.8 6278113.5 40.5, 767928.9 6278113 40.5, 767942.2 6278092 40.8)
-TRONROUT0000000044843973;Route à 1 chaussée;ALL LAFAYETTE;ALL LAFAYETTE;;;5;Non;0;En service;2006-12-12 11:20:44;2015-10-05 19:17:23;;;;;2.5;1.5;2.0;5.0;Non;Non;Double sens;;;Oui;0;Restreint aux ayants droit;;;;;;;;;Non;1.0;2.0;55.0;56.0;34172;34172;Métrique;;;;;;341723122;341723122;;;;;;;;;;;;LINESTRING Z (768261.4 6278109.9 44.9, 768264.1 6278105.6 45.3, 768266.3 6278103.3 45.4, 768275.6 6278097.4 45.8, 768277.3 6278096.7 45.8, 768278.2 6278097 45.8, 768279.1 6278097.9 45.9, 768292.6 6278118.7 46.8, 768293 6278119.9 46.8, 768292.6 6278125 45.2)
-TRONROUT0000000044843984;Route à 1 chaussée;R CAMILLE DESMOULINS;R CAMILLE DESMOULINS;;;5;Non;0;En service;2006-12-12 11:20:44;2011-09-09 10:55:38;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;203.0;204.0;263.0;264.0;34172;34172;Métrique;;;34070.0;34070.0;;341720947;341720947;;;;;;;;;;;;LINESTRING Z (768141.9 6278089 42.7, 768148.8 6278090.5 40.3, 768152.9 6278093.8 40.4, 768161.3 6278105.8 41, 768179.9 6278133.7 42.1)
-TRONROUT0000000044843814;Route à 1 chaussée;PL ALBERT LOUVEL;PL ALBERT LOUVEL;;;5;Non;0;En service;2006-12-12 11:20:44;2011-09-09 10:55:38;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;85.0;75.0;115.0;25.0;34172;34172;Linéaire;;;34070.0;34070.0;;341720157;341720157;;;;;;;;;;;;LINESTRING Z (768541.7 6278130.4 55.3, 768499.7 6278098.2 52.8)
-TRONROUT0000000113161399;Route à 1 chaussée;R HEBERT;R HEBERT;;;5;Non;0;En service;2008-01-16 06:54:54;2015-07-03 16:40:42;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;182.0;183.0;148.0;147.0;34172;34172;Métrique;;;34070.0;34070.0;;341722756;341722756;;;;;;;;;;;;LINESTRING Z (768261.4 6278109.9 44.9, 768284.7 6278122.7 44.9, 768292.6 6278125 45.2)
-TRONROUT0000000044843924;Sentier;;;;;6;Non;0;En service;2006-12-12 11:20:44;;;;;;2.5;1.5;;;Non;Non;Sans objet;;;Oui;0;Physiquement impossible;;;;;;;;;Non;;;;;34172;34172;Classique;;;;;;;;;;;;;;;;;;;LINESTRING Z (768202 6278096.9 42.8, 768210.1 6278101.3 43.8, 768292.9 6278146.2 45.9)
-TRONROUT0000002221594442;Route à 1 chaussée;R DU PAS DU LOUP;R DU PAS DU LOUP;;;5;Non;0;En service;2020-12-04 15:20:43;;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;301.0;302.0;399.0;400.0;34172;34172;Métrique;;;34070.0;34070.0;;341724150;341724150;;;;;;;;;;;;LINESTRING Z (768418.1 6278167.9 49.5, 768381.5 6278107.3 47, 768370.3 6278084.4 46.5, 768368.9 6278081.9 46.3)
-TRONROUT0000000044844015;Bretelle;;;;;5;Non;0;En service;2006-12-12 11:20:44;2011-03-08 16:58:50;;2009-07-01;;;2.5;1.5;1.0;3.0;Non;Non;Sens direct;;;Oui;30;Libre;;;;;;;;;Non;;;;;34172;34172;;;;;;;;;;;;;;;;;;;;LINESTRING Z (767934 6278150 42.1, 767954.3 6278128.5 40.6, 767973.6 6278111.2 40.6, 767986.4 6278101.8 40.5)
-TRONROUT0000000044843940;Route à 1 chaussée;RTE DE LAVERUNE;RTE DE LAVERUNE;;;3;Non;0;En service;2006-12-12 11:20:44;2014-11-28 13:33:29;;;;;2.5;1.5;2.0;7.0;Non;Non;Double sens;;;Oui;45;Libre;;;;;;;;;Non;1514.0;1515.0;1452.0;1451.0;34172;34172;Métrique;;;34070.0;34070.0;;341723200;341723200;;;;;;;;;;;;LINESTRING Z (768005.2 6278103.8 46, 768048.8 6278151.5 43)
-TRONROUT0000000044843954;Route à 1 chaussée;R HEBERT;R HEBERT;;;5;Non;0;En service;2006-12-12 11:20:44;2015-07-03 16:40:42;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;148.0;147.0;126.0;127.0;34172;34172;Métrique;;;34070.0;34070.0;;341722756;341722756;;;;;;;;;;;;LINESTRING Z (768292.6 6278125 45.2, 768312.8 6278130.8 45.9)
-TRONROUT0000000114009678;Route à 1 chaussée;R DANTON;R DANTON;;;5;Non;0;En service;2008-01-30 13:28:30;2011-09-09 10:55:38;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;221.0;222.0;259.0;258.0;34172;34172;Métrique;;;34070.0;34070.0;;341721702;341721702;;;;;;;;;;;;LINESTRING Z (768213.5 6278125.8 43, 768201.7 6278123 42.7, 768197.3 6278124.5 42.7, 768190 6278127 42.7, 768179.9 6278133.7 42.1)
-TRONROUT0000000114009679;Route à 1 chaussée;R DANTON;R DANTON;;;5;Non;0;En service;2008-01-30 13:28:30;2011-09-09 10:55:38;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;222.0;221.0;198.0;197.0;34172;34172;Métrique;;;34070.0;34070.0;;341721702;341721702;;;;;;;;;;;;LINESTRING Z (768213.5 6278125.8 43, 768215.9 6278126.4 43.1, 768234.3 6278137.3 44.3)
-TRONROUT0000000044843832;Route à 1 chaussée;BD PAUL VALERY;BD PAUL VALERY;;;4;Non;0;En service;2006-12-12 11:20:44;2020-07-31 15:57:20;;;;;2.5;1.5;2.0;6.0;Non;Non;Double sens;;;Oui;40;Libre;;;;;;;;;Non;2284.0;2285.0;2200.0;2199.0;34172;34172;Métrique;;;34070.0;34070.0;;341724215;341724215;;;;;;;;;;;;LINESTRING Z (768472.4 6278089.8 49.7, 768460.7 6278130.1 49.9, 768449.3 6278175.8 46)
-TRONROUT0000000044843978;Route à 1 chaussée;R CAMILLE DESMOULINS;R CAMILLE DESMOULINS;;;5;Non;0;En service;2006-12-12 11:20:44;2015-11-03 13:29:56;;;;;2.5;1.5;2.0;5.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;156.0;157.0;2.0;1.0;34172;34172;Métrique;;;34070.0;34070.0;;341720947;341720947;;;;;;;;;;;;LINESTRING Z (768097.1 6278078.7 40.2, 768091.7 6278079.7 40.9, 768084.8 6278082.5 41, 768051.1 6278105.3 41.3, 768048.3 6278107.8 41.3, 768047 6278110.9 41.3, 768047.2 6278113.7 41.3, 768048.4 6278117 41.3, 768050.6 6278120.8 41.3, 768067.9 6278145.9 41, 768098.5 6278190.3 40.5)
-TRONROUT0000000113161513;Route à 1 chaussée;R ROBERT DESNOS;R ROBERT DESNOS;;;5;Non;0;En service;2008-01-16 07:07:58;2015-10-06 20:00:48;;;;;2.5;1.5;2.0;5.0;Non;Non;Sens direct;;;Oui;0;Restreint aux ayants droit;;;;;;;;;Non;1.0;2.0;95.0;94.0;34172;34172;Métrique;;;34070.0;34070.0;;341728147;341728147;;;;;;;;;;;;LINESTRING Z (767820.4 6278144.890038314 42.746360153257484, 767841.7 6278155.2 43.1, 767846.2 6278156.9 42.7, 767850.2 6278157 42.6, 767853.3 6278155 42.6, 767855 6278151.5 42.6, 767866.2 6278126.9 42.2, 767868.4 6278122.9 42.2, 767868.4 6278120 42.2)
-TRONROUT0000000044844012;Route à 1 chaussée;R MICHEL PERONNET;R MICHEL PERONNET;;;5;Non;0;En service;2006-12-12 11:20:44;2015-04-09 16:56:07;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;;;;;34172;34172;Classique;;;;;;34172#0SD;34172#0SD;;;;;;;;;;;;LINESTRING Z (768292.9 6278146.2 45.9, 768312.8 6278130.8 45.9)
-TRONROUT0000000044843943;Route à 1 chaussée;SQ COUTHON;SQ COUTHON;;;5;Non;0;En service;2006-12-12 11:20:44;2011-11-22 12:28:30;;;;;2.5;1.5;2.0;5.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;106.0;40.0;106.0;66.0;34172;34172;Classique;;;34070.0;34070.0;;341721586;341721586;;;;;;;;;;;;LINESTRING Z (768213.5 6278125.8 43, 768211.1 6278132.4 44.5, 768209.7 6278134 44.8, 768191 6278147 44.6, 768190.3 6278148.1 44.6, 768190.2 6278149.2 44.6, 768190.5 6278150 44.6, 768197.2 6278160.2 45.1, 768198.2 6278160.8 45.1, 768199.4 6278161.1 45.1, 768200.7 6278160.5 45.1, 768234.3 6278137.3 44.3)
-TRONROUT0000000044844013;Route à 1 chaussée;;;;;4;Non;0;En service;2006-12-12 11:20:44;2008-01-30 13:28:30;;;;;2.5;1.5;2.0;3.0;Non;Non;Double sens;;;Oui;40;Libre;;;;;;;;;Non;;;;;34172;34172;Classique;;;;;;;;;;;;;;;;;;;LINESTRING Z (768078.9 6278185.1 42.2, 768079.9 6278181 41.8, 768080 6278178.5 41.8, 768078.9 6278175.7 41.6, 768049.8 6278131.7 41.1, 768042.6 6278121 41.1, 768037.4 6278112.4 40.6)
-TRONROUT0000000044843966;Route à 1 chaussée;R DANTON;R DANTON;;;5;Non;0;En service;2006-12-12 11:20:44;2011-09-09 10:55:38;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;198.0;197.0;152.0;153.0;34172;34172;Métrique;;;34070.0;34070.0;;341721702;341721702;;;;;;;;;;;;LINESTRING Z (768234.3 6278137.3 44.3, 768267.3 6278156.7 46.5, 768272.6 6278161.7 46.1)
-TRONROUT0000000044843920;Sentier;;;;;6;Non;0;En service;2006-12-12 11:20:44;;;;;;2.5;1.5;;;Non;Non;Sans objet;;;Oui;0;Physiquement impossible;;;;;;;;;Non;;;;;34172;34172;Classique;;;;;;;;;;;;;;;;;;;LINESTRING Z (768305.5 6278154.7 47.4, 768292.9 6278146.2 45.9)
-TRONROUT0000000044843933;Route à 1 chaussée;R HEBERT;R HEBERT;;;5;Non;0;En service;2006-12-12 11:20:44;2015-07-03 16:40:42;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;126.0;127.0;44.0;43.0;34172;34172;Métrique;;;34070.0;34070.0;;341722756;341722756;;;;;;;;;;;;LINESTRING Z (768312.8 6278130.8 45.9, 768335.6 6278136.9 47, 768347.3 6278142.3 47.3, 768357.3 6278148.4 47.3, 768365.4 6278155.3 47.8, 768375.1 6278167.2 48, 768379.3 6278174.6 47.4)
-TRONROUT0000000044844011;Route à 1 chaussée;R MICHEL PERONNET;R MICHEL PERONNET;;;5;Non;0;En service;2006-12-12 11:20:44;2015-04-09 16:56:07;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;;;;;34172;34172;Classique;;;;;;34172#0SD;34172#0SD;;;;;;;;;;;;LINESTRING Z (768272.6 6278161.7 46.1, 768292.9 6278146.2 45.9)
-TRONROUT0000000044843819;Route à 1 chaussée;R RENE CLAIR;R RENE CLAIR;;;5;Non;0;En service;2006-12-12 11:20:44;2015-10-05 19:17:23;;;;;2.5;1.5;2.0;5.0;Non;Non;Sens direct;;;Oui;0;Restreint aux ayants droit;;;;;;;;;Non;1.0;;41.0;;34172;34172;Classique;;;34070.0;34070.0;;341724844;341724844;;;;;;;;;;;;LINESTRING Z (768533.2 6278186.1 50.7, 768536.5 6278182.5 51.5, 768552.2 6278172.6 53.2, 768598.2 6278146.2 55.9, 768601 6278142.7 56.1, 768602.3 6278138.4 56.6, 768603.6 6278126.2 57.3)
-TRONROUT0000000044843922;Sentier;;;;;6;Non;0;En service;2006-12-12 11:20:44;;;;;;2.5;1.5;;;Non;Non;Sans objet;;;Oui;0;Physiquement impossible;;;;;;;;;Non;;;;;34172;34172;Classique;;;;;;;;;;;;;;;;;;;LINESTRING Z (768327.8 6278165.8 46.6, 768328.9 6278161.6 47.9, 768329 6278157.7 47.9, 768328.2 6278153.2 47.6, 768325.6 6278150.3 47.5, 768322.5 6278148.1 47.3, 768318.4 6278147.4 47.3, 768314.1 6278147.5 47.2, 768310.5 6278148.6 47.2, 768307.7 6278150.9 47.2, 768305.5 6278154.7 47.4)
-TRONROUT0000000044843960;Route à 1 chaussée;R DANTON;R DANTON;;;5;Non;0;En service;2006-12-12 11:20:44;2011-09-09 10:55:38;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;358.0;357.0;258.0;259.0;34172;34172;Métrique;;;34070.0;34070.0;;341721702;341721702;;;;;;;;;;;;LINESTRING Z (768098.5 6278190.3 40.5, 768165.6 6278143.2 42, 768179.9 6278133.7 42.1)
-TRONROUT0000000044843915;Sentier;;;;;6;Non;0;En service;2006-12-12 11:20:44;;;;;;2.5;1.5;;;Non;Non;Sans objet;;;Oui;0;Physiquement impossible;;;;;;;;;Non;;;;;34172;34172;Classique;;;;;;;;;;;;;;;;;;;LINESTRING Z (768305.5 6278154.7 47.4, 768304.9 6278158.6 47.5, 768305.1 6278162.5 47.6, 768306.2 6278166.2 47.6, 768308.2 6278168.7 47.8, 768311.1 6278170.5 47.9, 768314.4 6278171.6 47.9, 768317.9 6278171.2 47.9, 768321.7 6278170 47.9, 768324.5 6278168.4 47.9, 768327.8 6278165.8 46.6)
-TRONROUT0000000044843969;Route à 1 chaussée;RTE DE LAVERUNE;RTE DE LAVERUNE;;;4;Non;0;En service;2006-12-12 11:20:44;2014-11-28 13:33:29;;;;;2.5;1.5;2.0;6.0;Non;Non;Double sens;;;Oui;40;Libre;;;;;;;;;Non;1450.0;1449.0;1404.0;1405.0;34172;34172;Métrique;;;34070.0;34070.0;;341723200;341723200;;;;;;;;;;;;LINESTRING Z (768048.8 6278151.5 43, 768068.7 6278174.1 42.4, 768078.9 6278185.1 42.2)
-TRONROUT0000000044843912;Route à 1 chaussée;R HEBERT;R HEBERT;;;5;Non;0;En service;2006-12-12 11:20:44;2011-09-09 10:55:38;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;44.0;43.0;2.0;1.0;34172;34172;Métrique;;;34070.0;34070.0;;341722756;341722756;;;;;;;;;;;;LINESTRING Z (768379.3 6278174.6 47.4, 768381.9 6278177.4 48, 768384.7 6278179.2 48, 768389 6278180.2 48, 768393.9 6278179.8 48, 768398.3 6278178.3 48, 768409.1 6278173.2 48, 768415 6278170.2 47.8, 768418.1 6278167.9 49.5)
-TRONROUT0000000044843967;Route à 1 chaussée;AV DE MONSIEUR TESTE;AV DE MONSIEUR TESTE;;;3;Non;0;En service;2006-12-12 11:20:44;2011-09-09 10:55:38;;;;;2.5;1.5;1.0;3.5;Non;Non;Sens inverse;;;Oui;45;Libre;;;;;;;;;Non;1796.0;1795.0;1738.0;1737.0;34172;34172;Métrique;;;34070.0;34070.0;;341723793;341723793;;;;;;;;;;;;LINESTRING Z (767934 6278150 42.1, 767929.8 6278158.8 41.4, 767915.6 6278184.3 42.1, 767909.7 6278193 42.5, 767903.5 6278200.5 42.3)
-TRONROUT0000000115740645;Route à 1 chaussée;R DU PAS DU LOUP;R DU PAS DU LOUP;;;5;Non;0;En service;2008-02-08 12:49:34;2011-09-09 10:55:38;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;302.0;301.0;284.0;283.0;34172;34172;Métrique;;;34070.0;34070.0;;341724150;341724150;;;;;;;;;;;;LINESTRING Z (768418.1 6278167.9 49.5, 768428.1 6278182.8 48.2)
-TRONROUT0000000044843921;Sentier;;;;;6;Non;0;En service;2006-12-12 11:20:44;2008-01-30 13:28:30;;;;;2.5;1.5;;;Non;Non;Sans objet;;;Oui;0;Physiquement impossible;;;;;;;;;Non;;;;;34172;34172;Classique;;;;;;;;;;;;;;;;;;;LINESTRING Z (768369 6278186.8 48.3, 768327.8 6278165.8 46.6)
-TRONROUT0000000240976754;Route à 2 chaussées;AV DE LA RECAMBALE;AV DE LA RECAMBALE;;;3;Non;0;En service;2010-07-16 12:45:59;2021-12-10 18:01:06;;2009-07-01;;;2.5;1.5;2.0;7.0;Non;Non;Sens direct;;;Oui;45;Libre;;;;;;;;;Non;;;;;34172;34172;Classique;;;34070.0;34070.0;;341724832;341724832;ROUTNOMM0000002275428288;;M65;;Route intercommunale;Montpellier Méditerranée Métropole;;;;;;LINESTRING Z (767881.2 6278253.1 42.2, 767906.9 6278214.4 41.6, 767918.3 6278198.4 41.3, 767932 6278178.6 40.5, 767952 6278149.6 40.6, 767984.5 6278104.4 40.5, 767986.4 6278101.8 40.5)
-TRONROUT0000000044843825;Route à 1 chaussée;BD PAUL VALERY;BD PAUL VALERY;;;4;Non;0;En service;2006-12-12 11:20:44;2016-09-02 11:30:49;;;;;2.5;1.5;2.0;6.0;Non;Non;Double sens;;;Oui;40;Libre;;;;;;;;;Non;2191.0;2190.0;2199.0;2200.0;34172;34172;Métrique;;;34070.0;34070.0;;341724215;341724215;;;;;;;;;;;;LINESTRING Z (768447.8 6278185.1 46, 768449.2 6278176.3 46, 768449.3 6278175.8 46)
-TRONROUT0000000044844002;Route à 1 chaussée;ESP PAUL VALERY;ESP PAUL VALERY;;;5;Non;0;En service;2006-12-12 11:20:44;2010-06-03 07:44:46;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;0;Restreint aux ayants droit;;;;;;;;;Non;;;;;34172;34172;Classique;;;;;;34172#022;34172#022;;;;;;;;;;;;LINESTRING Z (768369 6278186.8 48.3, 768370.2 6278184 48.2, 768372 6278180.9 48.2, 768373.5 6278179.4 48.4, 768379.3 6278174.6 47.4)
-TRONROUT0000000044843982;Route à 1 chaussée;R DU PAS DU LOUP;R DU PAS DU LOUP;;;5;Non;0;En service;2006-12-12 11:20:44;2011-09-09 10:55:38;;;;;2.5;1.5;1.0;7.0;Non;Non;Sens direct;;;Oui;30;Libre;;;;;;;;;Non;;325.0;;289.0;34172;34172;Métrique;;;34070.0;34070.0;;341724150;341724150;;;;;;;;;;;;LINESTRING Z (768428.1 6278182.8 48.2, 768431.4 6278184.4 48.3, 768436.2 6278185.2 48.3, 768447.8 6278185.1 46)
-TRONROUT0000000044843864;Rond-point;;;;;5;Non;0;En service;2006-12-12 11:20:44;2017-10-26 14:33:20;;;;;2.5;1.5;2.0;5.0;Non;Non;Sens direct;;;Oui;0;Restreint aux ayants droit;;;;;;;;;Non;;;;;34172;34172;Métrique;;;;;;;;;;;;;;;;;;;LINESTRING Z (768525.9 6278189.9 50.7, 768526.4 6278188 50.7, 768528.3 6278186.1 50.7, 768530.8 6278185.4 50.7, 768533.2 6278186.1 50.7)
-TRONROUT0000000044843992;Route à 1 chaussée;R DU PAS DU LOUP;R DU PAS DU LOUP;;;5;Non;0;En service;2006-12-12 11:20:44;2011-09-09 10:55:38;;;;;2.5;1.5;1.0;7.0;Non;Non;Sens inverse;;;Oui;30;Libre;;;;;;;;;Non;284.0;283.0;258.0;259.0;34172;34172;Métrique;;;34070.0;34070.0;;341724150;341724150;;;;;;;;;;;;LINESTRING Z (768428.1 6278182.8 48.2, 768434.4 6278192.2 47.9, 768436.3 6278193.7 47.9, 768438.1 6278194.6 47.7, 768439.5 6278194.9 47.5, 768447.9 6278195.1 45.8)
-TRONROUT0000000115740653;Route à 1 chaussée;R DU PAS DU LOUP;R DU PAS DU LOUP;;;4;Non;0;En service;2008-02-08 12:49:34;2012-01-10 11:15:04;;;;;2.5;1.5;2.0;6.0;Non;Non;Double sens;;;Oui;40;Libre;;;;;;;;;Non;221.0;220.0;289.0;290.0;34172;34172;Métrique;;;34070.0;34070.0;;341724150;341724150;;;;;;;;;;;;LINESTRING Z (768447.9 6278195.1 45.8, 768447.5 6278192.3 45.8, 768447.8 6278185.1 46)
-TRONROUT0000000114009680;Route à 1 chaussée;RTE DE LAVERUNE;RTE DE LAVERUNE;;;4;Non;0;En service;2008-01-30 13:28:30;2014-11-28 13:33:29;;;;;2.5;1.5;2.0;6.0;Non;Non;Double sens;;;Oui;40;Libre;;;;;;;;;Non;1404.0;1405.0;1388.0;1389.0;34172;34172;Métrique;;;34070.0;34070.0;;341723200;341723200;;;;;;;;;;;;LINESTRING Z (768078.9 6278185.1 42.2, 768081.3 6278187.7 42.1, 768090.9 6278196.3 42.9)
-TRONROUT0000000044843865;Rond-point;;;;;5;Non;0;En service;2006-12-12 11:20:44;2017-10-26 14:33:20;;;;;2.5;1.5;2.0;5.0;Non;Non;Sens direct;;;Oui;0;Restreint aux ayants droit;;;;;;;;;Non;;;;;34172;34172;Métrique;;;;;;;;;;;;;;;;;;;LINESTRING Z (768533.2 6278186.1 50.7, 768533.4 6278186.1 50.7, 768535.4 6278188 50.7, 768536.1 6278190.5 50.7, 768535.4 6278193.1 50.7, 768533.5 6278195.1 50.7, 768532.9 6278195.3 50.7)
-TRONROUT0000000044843861;Rond-point;;;;;5;Non;0;En service;2006-12-12 11:20:44;2017-10-26 14:33:20;;;;;2.5;1.5;2.0;5.0;Non;Non;Sens direct;;;Oui;0;Restreint aux ayants droit;;;;;;;;;Non;;;;;34172;34172;Métrique;;;;;;;;;;;;;;;;;;;LINESTRING Z (768526.4 6278193.1 50.7, 768525.7 6278190.6 50.7, 768525.9 6278189.9 50.7)
-TRONROUT0000000044843831;Route à 1 chaussée;R DES FRERES ALLEGRET;R DES FRERES ALLEGRET;;;5;Non;0;En service;2006-12-12 11:20:44;2015-10-05 19:17:23;;;;;2.5;1.5;2.0;5.0;Non;Non;Double sens;;;Oui;0;Restreint aux ayants droit;;;;;;;;;Non;1.0;2.0;111.0;110.0;34172;34172;Métrique;;;34070.0;34070.0;;341722419;341722419;;;;;;;;;;;;LINESTRING Z (768525.9 6278189.9 50.7, 768519.2 6278189.3 52.4, 768513.1 6278187.4 52.5, 768504.7 6278182.1 52, 768495.3 6278175.2 51.9, 768490.7 6278173.3 51.7, 768483.1 6278172.2 51.7, 768477 6278171.6 51.7, 768473.7 6278171.2 51.7, 768470.5 6278171.3 51.7, 768467.1 6278173.8 51.7, 768464.6 6278177.6 51.7, 768464 6278182.8 51.4, 768464.6 6278188.3 51.4, 768466.5 6278197.7 51.3, 768472.6 6278207.5 51.3, 768479.5 6278214.1 51.3)
-TRONROUT0000000114009689;Route à 1 chaussée;R DANTON;R DANTON;;;5;Non;0;En service;2008-01-30 13:28:30;2011-09-09 10:55:38;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;368.0;357.0;258.0;249.0;34172;34172;Métrique;;;34070.0;34070.0;;341721702;341721702;;;;;;;;;;;;LINESTRING Z (768090.9 6278196.3 42.9, 768097.4 6278191.1 40.5, 768098.5 6278190.3 40.5)
-TRONROUT0000000044844024;Route à 1 chaussée;ALL DE LA MARTELLE;ALL DE LA MARTELLE;;;3;Non;0;En service;2006-12-12 11:20:44;2016-09-29 12:02:11;;;;;2.5;1.5;2.0;5.5;Non;Non;Double sens;;;Oui;45;Libre;;;;;;;;;Non;881.0;882.0;1005.0;1004.0;34172;34172;Métrique;;;34070.0;34070.0;;341723526;341723526;;;;;;;;;;;;LINESTRING Z (767959.4 6278236.8 42.4, 768048.8 6278151.5 43)
-TRONROUT0000000044843866;Rond-point;;;;;5;Non;0;En service;2006-12-12 11:20:44;2017-10-26 14:33:20;;;;;2.5;1.5;2.0;5.0;Non;Non;Sens direct;;;Oui;0;Restreint aux ayants droit;;;;;;;;;Non;;;;;34172;34172;Métrique;;;;;;;;;;;;;;;;;;;LINESTRING Z (768532.9 6278195.3 50.7, 768530.9 6278195.8 50.7, 768528.3 6278195.1 50.7, 768526.4 6278193.1 50.7)
-TRONROUT0000000044843902;Route à 1 chaussée;RTE DE LAVERUNE;RTE DE LAVERUNE;;;4;Non;0;En service;2006-12-12 11:20:44;2014-11-28 13:33:29;;;;;2.5;1.5;2.0;6.0;Non;Non;Double sens;;;Oui;40;Libre;;;;;;;;;Non;1388.0;1389.0;1382.0;1381.0;34172;34172;Métrique;;;34070.0;34070.0;;341723200;341723200;;;;;;;;;;;;LINESTRING Z (768090.9 6278196.3 42.9, 768096.3 6278200.9 42.9)
-TRONROUT0000000114009688;Route à 1 chaussée;;;;;5;Non;0;En service;2008-01-30 13:28:30;2008-09-17 23:51:04;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;;;;;34172;34172;Classique;;;;;;;;;;;;;;;;;;;LINESTRING Z (768352.6 6278214.6 49.2, 768320.3 6278183.9 49.6)
-TRONROUT0000000044844005;Route à 1 chaussée;ESP PAUL VALERY;ESP PAUL VALERY;;;5;Non;0;En service;2006-12-12 11:20:44;2010-06-03 07:44:46;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;0;Restreint aux ayants droit;;;;;;;;;Non;;;;;34172;34172;Classique;;;;;;34172#022;34172#022;;;;;;;;;;;;LINESTRING Z (768369 6278186.8 48.3, 768362.8 6278201.1 49.1, 768360.8 6278203.7 49.1, 768355.1 6278210.6 49.3, 768352.6 6278214.6 49.2)
-TRONROUT0000000044843872;Route à 1 chaussée;R ABEL GANCE;R ABEL GANCE;;;5;Non;0;En service;2006-12-12 11:20:44;2015-10-05 19:17:23;;;;;2.5;1.5;2.0;5.0;Non;Non;Double sens;;;Oui;0;Restreint aux ayants droit;;;;;;;;;Non;221.0;222.0;249.0;248.0;34172;34172;Métrique;;;34070.0;34070.0;;341720016;341720016;;;;;;;;;;;;LINESTRING Z (768554.2 6278210.5 47.9, 768550.6 6278210.8 49.2, 768544.4 6278210.1 49.5, 768539.3 6278207.4 49.9, 768535.9 6278202.4 50.2, 768532.9 6278195.3 50.7)
-TRONROUT0000000044843931;Route à 1 chaussée;R DANTON;R DANTON;;;5;Non;0;En service;2006-12-12 11:20:44;2011-09-09 10:55:38;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;152.0;153.0;14.0;13.0;34172;34172;Métrique;;;34070.0;34070.0;;341721702;341721702;;;;;;;;;;;;LINESTRING Z (768272.6 6278161.7 46.1, 768286.1 6278181.3 47.6, 768287.1 6278184.7 47.6, 768286.7 6278186.6 47.6, 768285.1 6278188.3 47.6, 768270.1 6278198.9 47.6, 768217.8 6278234.6 47.2, 768196.8 6278248.9 46.6)
-TRONROUT0000000044843863;Rond-point;;;;;5;Non;0;En service;2006-12-12 11:20:44;2017-10-26 14:33:20;;;;;2.5;1.5;2.0;5.0;Non;Non;Sens direct;;;Oui;0;Restreint aux ayants droit;;;;;;;;;Non;;;;;34172;34172;Métrique;;;;;;;;;;;;;;;;;;;LINESTRING Z (768554.2 6278210.5 47.9, 768554.9 6278208 47.9, 768556.7 6278206.2 47.9, 768559.3 6278205.4 47.9, 768561.9 6278206.1 47.9, 768563.7 6278207.9 47.9, 768563.9 6278208.6 47.9)
-TRONROUT0000000044844017;Bretelle;;;;;3;Non;0;En service;2006-12-12 11:20:44;2010-07-16 12:45:59;;2009-07-01;;;2.5;1.5;1.0;3.0;Non;Non;Sens inverse;;;Oui;45;Libre;;;;;;;;;Non;;;;;34172;34172;;;;;;;;;;;;;;;;;;;;LINESTRING Z (767959.4 6278236.8 42.4, 767946.3 6278242.2 41.6, 767939.7 6278242.5 41.4, 767930.4 6278240.1 41.4, 767928.2 6278238.3 41.4, 767925.4 6278234.7 41.4, 767923.8 6278231.6 41.4, 767923.1 6278226.4 41.4, 767923.3 6278220.2 41.4, 767925.2 6278215.1 41.4, 767930.1 6278204.8 41.4, 767939.6 6278186.3 41.4, 767944.7 6278174.7 42.9)
-TRONROUT0000000044843896;Escalier;R ABEL GANCE;R ABEL GANCE;;;6;Non;0;En service;2006-12-12 11:20:44;2011-09-09 10:55:38;;;;;2.5;1.5;;;Non;Non;Sans objet;;;Oui;0;Physiquement impossible;;;;;;;;;Non;249.0;248.0;317.0;316.0;34172;34172;Métrique;;;34070.0;34070.0;;341720016;341720016;;;;;;;;;;;;LINESTRING Z (768526.4 6278193.1 50.7, 768504.1 6278205.3 48.2, 768469.4 6278230.4 45.7)
-TRONROUT0000000044843882;Rond-point;;;;;5;Non;0;En service;2006-12-12 11:20:44;2017-10-26 14:33:20;;;;;2.5;1.5;2.0;5.0;Non;Non;Sens direct;;;Oui;0;Restreint aux ayants droit;;;;;;;;;Non;;;;;34172;34172;Métrique;;;;;;;;;;;;;;;;;;;LINESTRING Z (768563.9 6278208.6 47.9, 768564.4 6278210.5 47.9, 768563.7 6278213.1 47.9, 768562 6278214.9 47.9, 768561.4 6278215 47.9)
-TRONROUT0000000115740652;Route à 1 chaussée;R DU PAS DU LOUP;R DU PAS DU LOUP;;;4;Non;0;En service;2008-02-08 12:49:34;2012-01-10 11:15:04;;;;;2.5;1.5;2.0;6.0;Non;Non;Double sens;;;Oui;40;Libre;;;;;;;;;Non;221.0;220.0;289.0;290.0;34172;34172;Métrique;;;34070.0;34070.0;;341724150;341724150;;;;;;;;;;;;LINESTRING Z (768469.4 6278230.4 45.7, 768456.5 6278217.5 45.7, 768449.6 6278206.1 45.8, 768447.9 6278195.1 45.8)
-TRONROUT0000000044843862;Rond-point;;;;;5;Non;0;En service;2006-12-12 11:20:44;2017-10-26 14:33:20;;;;;2.5;1.5;2.0;5.0;Non;Non;Sens direct;;;Oui;0;Restreint aux ayants droit;;;;;;;;;Non;;;;;34172;34172;Métrique;;;;;;;;;;;;;;;;;;;LINESTRING Z (768561.4 6278215 47.9, 768559.4 6278215.6 47.9, 768556.8 6278214.9 47.9, 768555 6278213.2 47.9, 768554.2 6278210.5 47.9)
-TRONROUT0000000044843908;Route à 1 chaussée;AV DE MONSIEUR TESTE;AV DE MONSIEUR TESTE;;;5;Non;0;En service;2006-12-12 11:20:44;2011-09-09 10:55:38;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;1738.0;1737.0;1694.0;1695.0;34172;34172;Métrique;;;34070.0;34070.0;;341723793;341723793;;;;;;;;;;;;LINESTRING Z (767903.5 6278200.5 42.3, 767896.5 6278207.9 43, 767876.9 6278233.9 43.1)
-TRONROUT0000000291716455;Route à 1 chaussée;R MARIE DE SEVIGNE;R MARIE DE SEVIGNE;;;5;Non;0;En service;2011-11-22 12:28:30;;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;1.0;2.0;99.0;100.0;34172;34172;Métrique;;;34070.0;34070.0;;34172#0HO;34172#0HO;;;;;;;;;;;;LINESTRING Z (768096.3 6278200.9 42.9, 768086.8 6278211.9 42.7, 768065.4 6278236.7 42.7)
-TRONROUT0000000044844008;Route à 1 chaussée;ESP PAUL VALERY;ESP PAUL VALERY;;;5;Non;0;En service;2006-12-12 11:20:44;2010-06-03 07:44:46;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;;;;;34172;34172;Classique;;;;;;34172#022;34172#022;;;;;;;;;;;;LINESTRING Z (768338.6 6278237.1 49.4, 768339.6 6278235 49.3, 768341 6278233.2 48.9, 768344 6278230 49, 768345.5 6278227.9 49.1, 768351.5 6278216.3 49.1, 768352.6 6278214.6 49.2)
-TRONROUT0000000044844023;Bretelle;;;;;3;Non;0;En service;2006-12-12 11:20:44;2010-07-16 12:45:59;;;;;2.5;1.5;1.0;3.5;Non;Non;Sens direct;;;Oui;45;Libre;;;;;;;;;Non;;;;;34172;34172;;;;;;;;;;;;;;;;;;;;LINESTRING Z (767881.2 6278253.1 42.2, 767892.5 6278223.3 42.6, 767903.5 6278200.5 42.3)
-TRONROUT0000000044843913;Route à 1 chaussée;R DES FELIBRES;R DES FELIBRES;;;5;Non;0;En service;2006-12-12 11:20:44;2011-09-09 10:55:38;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;1.0;2.0;33.0;34.0;34172;34172;Métrique;;;34070.0;34070.0;;341722172;341722172;;;;;;;;;;;;LINESTRING Z (767876.9 6278233.9 43.1, 767847.3 6278219.7 43.9)
-TRONROUT0000000044843989;Route à 1 chaussée;R SAINT-JUST;R SAINT-JUST;;;5;Non;0;En service;2006-12-12 11:20:44;2011-11-22 12:28:30;;;;;2.5;1.5;2.0;5.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;96.0;97.0;2.0;1.0;34172;34172;Métrique;;;34070.0;34070.0;;341725129;341725129;;;;;;;;;;;;LINESTRING Z (768127.8 6278200.2 44.7, 768135.4 6278203.4 44.9, 768137.4 6278205 45.1, 768151 6278225.2 45.7, 768160.1 6278236.5 46, 768172.2 6278248.7 46.2, 768179.9 6278256.9 46.3)
-TRONROUT0000000044843928;Route à 1 chaussée;RTE DE LAVERUNE;RTE DE LAVERUNE;;;4;Non;0;En service;2006-12-12 11:20:44;2020-12-04 15:20:43;;;;;2.5;1.5;2.0;6.0;Non;Non;Double sens;;;Oui;40;Libre;;;;;;;;;Non;1382.0;1381.0;1282.0;1281.0;34172;34172;Métrique;;;34070.0;34070.0;;341723200;341723200;;;;;;;;;;;;LINESTRING Z (768096.3 6278200.9 42.9, 768105.3 6278210 42.3, 768118.3 6278220.5 43.3, 768172.8 6278260.2 46.1)
-TRONROUT0000000044843791;Route à 1 chaussée;R DU PAS DU LOUP;R DU PAS DU LOUP;;;4;Non;0;En service;2006-12-12 11:20:44;2012-01-10 11:05:56;;;;;2.5;1.5;2.0;6.0;Non;Non;Double sens;;;Oui;40;Libre;;;;;;;;;Non;220.0;221.0;204.0;203.0;34172;34172;Métrique;;;34070.0;34070.0;;341724150;341724150;;;;;;;;;;;;LINESTRING Z (768469.4 6278230.4 45.7, 768486.7 6278247.5 43.7)
-TRONROUT0000000044843873;Route à 1 chaussée;R ABEL GANCE;R ABEL GANCE;;;5;Non;0;En service;2006-12-12 11:20:44;2012-01-10 11:05:50;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;0;Restreint aux ayants droit;;;;;;;;;Non;;;;;34172;34172;Classique;;;34070.0;34070.0;;341720016;341720016;;;;;;;;;;;;LINESTRING Z (768529.2 6278286.8 43, 768541.4 6278272 43.6, 768558.1 6278250.6 44.9, 768565.1 6278242.2 45.6, 768567.2 6278238.6 45.9, 768567.8 6278235.4 46.2, 768567.7 6278231.3 46.5, 768566.4 6278227 47.2, 768564 6278221.1 47.7, 768561.4 6278215 47.9)
-TRONROUT0000000044844001;Route à 1 chaussée;R DANTON;R DANTON;;;5;Non;0;En service;2006-12-12 11:20:44;2011-09-09 10:55:38;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;14.0;13.0;2.0;1.0;34172;34172;Métrique;;;34070.0;34070.0;;341721702;341721702;;;;;;;;;;;;LINESTRING Z (768196.8 6278248.9 46.6, 768190.1 6278253.3 46.3, 768187.2 6278256.3 46.3)
-TRONROUT0000000044843849;Route à 1 chaussée;R DES MANGUIERS;R DES MANGUIERS;;;5;Non;0;En service;2006-12-12 11:20:44;2011-09-09 10:55:38;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;;;;;34172;34172;Classique;;;34070.0;34070.0;;341723427;341723427;;;;;;;;;;;;LINESTRING Z (768486.7 6278247.5 43.7, 768475 6278255.1 44.2, 768470.8 6278258.7 47)
-TRONROUT0000000044843846;Route à 1 chaussée;IMP THOMAS MORE;IMP THOMAS MORE;;;5;Non;0;En service;2006-12-12 11:20:44;2012-01-10 11:05:56;;;;;2.5;1.5;2.0;7.0;Non;Non;Double sens;;;Oui;0;Restreint aux ayants droit;;;;;;;;;Non;2.0;1.0;56.0;55.0;34172;34172;Métrique;;;34070.0;34070.0;;341725493;341725493;;;;;;;;;;;;LINESTRING Z (768508.7 6278267.9 43.1, 768533.6 6278241.9 46.4)
-TRONROUT0000000291716454;Sentier;;;;;6;Non;0;En service;2011-11-22 12:28:30;2018-04-27 02:47:24;;;;;3.0;0.5;;;Non;Non;Sans objet;;;Oui;0;Physiquement impossible;;;;;;;;;Non;;;;;34172;34172;Classique;;;;;;;;;;;;;;;;;;;LINESTRING Z (768087 6278274.5 43.8, 768082.9 6278253.6 43.3, 768065.4 6278236.7 41.8)
-TRONROUT0000000044843964;Route à 1 chaussée;COUR MIRABEAU;COUR MIRABEAU;;;5;Non;0;En service;2006-12-12 11:20:44;2011-09-09 10:55:38;;;;;2.5;1.5;1.0;4.0;Non;Non;Sens inverse;;;Oui;30;Libre;;;;;;;;;Non;;;;;34172;34172;Classique;;;34070.0;34070.0;;341723763;341723763;;;;;;;;;;;;LINESTRING Z (768317.5 6278275.8 50.3, 768313.7 6278273.4 50.3, 768311 6278270.8 50.3, 768304.2 6278260.9 50.2, 768303.8 6278259.9 50.3, 768303.8 6278259 50.3, 768304 6278258.2 50.3, 768331.5 6278238 49.4, 768333.8 6278236.6 49.4, 768335 6278236.6 49.4, 768338.6 6278237.1 49.4)
-TRONROUT0000000044843956;Route à 2 chaussées;AV DE LA RECAMBALE;AV DE LA RECAMBALE;;;3;Non;0;En service;2006-12-12 11:20:44;2021-12-10 18:01:06;;;;;20.0;2.5;2.0;7.0;Non;Non;Sens inverse;;;Oui;45;Libre;;;;;;;;;Non;;;;;34172;34172;Classique;;;34070.0;34070.0;;341724832;341724832;ROUTNOMM0000002275428288;;M65;;Route intercommunale;Montpellier Méditerranée Métropole;;;;;;LINESTRING Z (767843.2 6278337.7 44, 767846.6 6278330.2 43.9, 767871.1 6278284.4 42.7, 767894.3 6278248.9 42.2, 767913.5 6278219 41.6, 767918.8 6278211.6 41.4, 767924.8 6278203 41.3, 767944.7 6278174.7 42.9)
-TRONROUT0000000114009683;Route à 1 chaussée;;;;;5;Non;0;En service;2008-01-30 13:28:30;2012-02-09 07:19:17;;;;;2.5;1.5;2.0;5.0;Non;Non;Sens direct;;;Oui;30;Libre;;;;;;;;;Non;;;;;34172;34172;Classique;;;;;;;;;;;;;;;;;;;LINESTRING Z (768179.9 6278256.9 46.3, 768183.2 6278255.7 46.3, 768187.2 6278256.3 46.3)
-TRONROUT0000000044843948;Route à 1 chaussée;R ROBESPIERRE;R ROBESPIERRE;;;5;Non;0;En service;2006-12-12 11:20:44;2011-09-09 10:55:38;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;65.0;64.0;115.0;116.0;34172;34172;Métrique;;;34070.0;34070.0;;341724913;341724913;;;;;;;;;;;;LINESTRING Z (768317.5 6278275.8 50.3, 768320.6 6278270.1 50.1, 768326.2 6278262.4 49.9, 768327.9 6278259.5 49.9, 768338.6 6278237.1 49.4)
-TRONROUT0000000044843990;Route à 1 chaussée;R MARIE DE SEVIGNE;R MARIE DE SEVIGNE;;;5;Non;0;En service;2006-12-12 11:20:44;2011-11-22 12:28:30;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;1.0;2.0;99.0;100.0;34172;34172;Métrique;;;34070.0;34070.0;;34172#0HO;34172#0HO;;;;;;;;;;;;LINESTRING Z (768065.4 6278236.7 42.7, 768031.3 6278276.4 42.9)
-TRONROUT0000000044843790;Route à 1 chaussée;R DU PAS DU LOUP;R DU PAS DU LOUP;;;4;Non;0;En service;2006-12-12 11:20:44;2012-01-10 11:05:56;;;;;2.5;1.5;2.0;6.0;Non;Non;Double sens;;;Oui;40;Libre;;;;;;;;;Non;204.0;203.0;178.0;179.0;34172;34172;Métrique;;;34070.0;34070.0;;341724150;341724150;;;;;;;;;;;;LINESTRING Z (768486.7 6278247.5 43.7, 768505.4 6278264.9 43.2, 768508.7 6278267.9 43.1)
-TRONROUT0000000114009681;Route à 1 chaussée;;;;;5;Non;0;En service;2008-01-30 13:28:30;2020-12-04 15:20:43;;;;;2.5;1.5;1.0;5.0;Non;Non;Sens direct;;;Oui;30;Libre;;;;;;;;;Non;;;;;34172;34172;Classique;;;;;;;;;;;;;;;;;;;LINESTRING Z (768172.8 6278260.2 46.1, 768175.5 6278258.1 46.1, 768177.8 6278257.4 45.7, 768179.9 6278256.9 46.3)
-TRONROUT0000000044844022;Route à 1 chaussée;ALL DE LA MARTELLE;ALL DE LA MARTELLE;;;3;Non;0;En service;2006-12-12 11:20:44;2016-09-29 12:02:11;;;;;2.5;1.5;2.0;5.5;Non;Non;Double sens;;;Oui;45;Libre;;;;;;;;;Non;813.0;812.0;881.0;882.0;34172;34172;Métrique;;;34070.0;34070.0;;341723526;341723526;;;;;;;;;;;;LINESTRING Z (767908.1 6278282.3 42.5, 767916.9 6278276.7 39.7, 767959.4 6278236.8 42.4)
-TRONROUT0000000114009682;Route à 1 chaussée;;;;;5;Non;0;En service;2008-01-30 13:28:30;2012-02-09 07:19:17;;;;;2.5;1.5;2.0;5.0;Non;Non;Sens direct;;;Oui;30;Libre;;;;;;;;;Non;;;;;34172;34172;Classique;;;;;;;;;;;;;;;;;;;LINESTRING Z (768187.2 6278256.3 46.3, 768189.7 6278257.9 46.3, 768191.1 6278260.1 46.3, 768192.2 6278263.3 46.3, 768191 6278267 46.3, 768188.3 6278271.4 47.2)
-TRONROUT0000000114009686;Route à 1 chaussée;RTE DE LAVERUNE;RTE DE LAVERUNE;;;4;Non;0;En service;2008-01-30 13:28:30;2020-12-04 15:20:43;;;;;2.5;1.5;2.0;6.0;Non;Non;Double sens;;;Oui;40;Libre;;;;;;;;;Non;1282.0;1281.0;1270.0;1269.0;34172;34172;Métrique;;;34070.0;34070.0;;341723200;341723200;;;;;;;;;;;;LINESTRING Z (768172.8 6278260.2 46.1, 768181.8 6278266.8 46.7, 768188.3 6278271.4 47.2)
-TRONROUT0000000044843941;Route à 1 chaussée;AV DE MONSIEUR TESTE;AV DE MONSIEUR TESTE;;;5;Non;0;En service;2006-12-12 11:20:44;2011-09-09 10:55:38;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;1694.0;1695.0;1606.0;1605.0;34172;34172;Métrique;;;34070.0;34070.0;;341723793;341723793;;;;;;;;;;;;LINESTRING Z (767876.9 6278233.9 43.1, 767873.4 6278238.1 43, 767863.2 6278258.8 43.2, 767834.2 6278311.7 44.8)
-TRONROUT0000000044843976;Route à 1 chaussée;R MARAT;R MARAT;;;5;Non;0;En service;2006-12-12 11:20:44;2012-01-10 13:23:54;;;;;2.5;1.5;2.0;5.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;1.0;2.0;69.0;70.0;34172;34172;Linéaire;;;34070.0;34070.0;;341723518;341723518;;;;;;;;;;;;LINESTRING Z (768196.8 6278248.9 46.6, 768201.8 6278255.2 47.9, 768217.8 6278272.3 48, 768233.1 6278287.3 48.6, 768249.2 6278299 49.8)
-TRONROUT0000002221594443;Route à 1 chaussée;RTE DE LAVERUNE;RTE DE LAVERUNE;;;4;Non;0;En service;2020-12-04 15:20:43;;;;;;2.5;1.5;2.0;6.0;Non;Non;Double sens;;;Oui;40;Libre;;;;;;;;;Non;1247.0;1246.0;1265.0;1264.0;34172;34172;Métrique;;;34070.0;34070.0;;341723200;341723200;;;;;;;;;;;;LINESTRING Z (768204.7 6278282.8 48.2, 768203.7 6278282.1 48.2, 768188.3 6278271.4 47.2)
-TRONROUT0000002221594450;Route à 1 chaussée;;;;;5;Non;0;En service;2020-12-04 15:20:43;;;;;;2.5;1.5;1.0;3.0;Non;Non;Sens direct;;;Oui;30;Libre;Libre;;;;;;;;;;;;;34172;34172;;;;;;;;;;;;;;;;;;;;LINESTRING Z (768164.8 6278294.2 47.2, 768165.9 6278287.5 47, 768167.3 6278282.1 46.6, 768167.1 6278276.1 46.5, 768166.4 6278271.8 46, 768167.8 6278266.3 45.7, 768169.9 6278263 45.8, 768172.8 6278260.2 46.1)
-TRONROUT0000000044843788;Route à 1 chaussée;R DU PAS DU LOUP;R DU PAS DU LOUP;;;4;Non;0;En service;2006-12-12 11:20:44;2012-01-10 11:05:56;;;;;2.5;1.5;2.0;6.0;Non;Non;Double sens;;;Oui;40;Libre;;;;;;;;;Non;178.0;179.0;148.0;147.0;34172;34172;Métrique;;;34070.0;34070.0;;341724150;341724150;;;;;;;;;;;;LINESTRING Z (768508.7 6278267.9 43.1, 768523.6 6278281.8 42.7, 768528 6278285.9 42.7, 768529.2 6278286.8 43)
-TRONROUT0000002221594449;Route à 1 chaussée;R FABRE D'EGLANTINE;R FABRE D'EGLANTINE;;;5;Non;0;En service;2020-12-04 15:20:43;;;;;;2.5;1.5;2.0;4.0;Non;Non;Sens direct;;;Oui;30;Libre;;;;;;;;;Non;1.0;2.0;31.0;32.0;34172;34172;Métrique;;;34070.0;34070.0;;341722119;341722119;;;;;;;;;;;;LINESTRING Z (768188.3 6278271.4 47.2, 768164.8 6278294.2 47.2)
-TRONROUT0000000291716476;Route à 1 chaussée;R CHATEAUBRIAND;R CHATEAUBRIAND;;;5;Non;0;En service;2011-11-22 12:28:30;;;;;;2.5;1.5;2.0;4.0;Non;Non;Sens inverse;;;Oui;30;Libre;;;;;;;;;Non;152.0;153.0;2.0;1.0;34172;34172;Métrique;;;34070.0;34070.0;;341721281;341721281;;;;;;;;;;;;LINESTRING Z (768031.3 6278276.4 42.9, 768063.1 6278298.6 43.6, 768087 6278274.5 43.6)
-TRONROUT0000002221594448;Route à 1 chaussée;;;;;5;Non;0;En service;2020-12-04 15:20:43;;;;;;2.5;1.5;1.0;3.0;Non;Non;Sens direct;;;Oui;30;Libre;Libre;;;;;;;;;;;;;34172;34172;;;;;;;;;;;;;;;;;;;;LINESTRING Z (768204.7 6278282.8 48.2, 768186.1 6278284.3 47, 768176.6 6278287.5 47, 768164.8 6278294.2 47.2)
-TRONROUT0000000044843968;Route à 1 chaussée;R CHATEAUBRIAND;R CHATEAUBRIAND;;;5;Non;0;En service;2006-12-12 11:20:44;2011-11-22 12:28:30;;;;;2.5;1.5;2.0;4.0;Non;Non;Sens inverse;;;Oui;30;Libre;;;;;;;;;Non;152.0;153.0;2.0;1.0;34172;34172;Métrique;;;34070.0;34070.0;;341721281;341721281;;;;;;;;;;;;LINESTRING Z (768087 6278274.5 43.6, 768104.5 6278271.3 45.1, 768153.4 6278308.4 47.9)
-TRONROUT0000000044843985;Route à 1 chaussée;R MARIE DE SEVIGNE;R MARIE DE SEVIGNE;;;5;Non;0;En service;2006-12-12 11:20:44;2011-09-09 10:55:38;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;99.0;100.0;145.0;146.0;34172;34172;Métrique;;;34070.0;34070.0;;34172#0HO;34172#0HO;;;;;;;;;;;;LINESTRING Z (768031.3 6278276.4 42.9, 768003.1 6278308.2 43.5)
-TRONROUT0000000114009685;Route à 1 chaussée;R FABRE D'EGLANTINE;R FABRE D'EGLANTINE;;;5;Non;0;En service;2008-01-30 13:28:30;2020-12-04 15:20:43;;;;;2.5;1.5;2.0;4.0;Non;Non;Sens inverse;;;Oui;30;Libre;;;;;;;;;Non;52.0;51.0;34.0;33.0;34172;34172;Métrique;;;34070.0;34070.0;;341722119;341722119;;;;;;;;;;;;LINESTRING Z (768153.4 6278308.4 47.9, 768164.8 6278294.2 47.2)
-TRONROUT0000000044843857;Route à 1 chaussée;R DU PAS DU LOUP;R DU PAS DU LOUP;;;4;Non;0;En service;2006-12-12 11:20:44;2012-01-10 11:04:44;;;;;2.5;1.5;2.0;6.0;Non;Non;Double sens;;;Oui;40;Libre;;;;;;;;;Non;148.0;147.0;74.0;75.0;34172;34172;Métrique;;;34070.0;34070.0;;341724150;341724150;;;;;;;;;;;;LINESTRING Z (768529.2 6278286.8 43, 768539.3 6278294.1 42.1, 768559.7 6278306.3 41.6, 768574.6 6278316.2 41.1, 768585.9 6278321.9 40.8, 768590.6 6278324.5 41.5)
-TRONROUT0000000044844003;Route à 1 chaussée;R ROBESPIERRE;R ROBESPIERRE;;;5;Non;0;En service;2006-12-12 11:20:44;2011-09-09 10:55:38;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;1.0;2.0;65.0;64.0;34172;34172;Métrique;;;34070.0;34070.0;;341724913;341724913;;;;;;;;;;;;LINESTRING Z (768283.5 6278339 50.9, 768299.2 6278310.6 51.2, 768317.5 6278275.8 50.3)
-TRONROUT0000000044844016;Bretelle;;;;;3;Non;0;En service;2006-12-12 11:20:44;2009-03-05 18:15:18;;;;;2.5;1.5;1.0;3.5;Non;Non;Sens direct;;;Oui;45;Libre;;;;;;;;;Non;;;;;34172;34172;;;;;;;;;;;;;;;;;;;;LINESTRING Z (767908.1 6278282.3 42.5, 767905.3 6278284.1 40.9, 767887.6 6278288.6 40.9, 767874 6278296.9 41.3, 767864.9 6278307.4 42, 767843.2 6278337.7 44)
-TRONROUT0000000044843952;Route à 1 chaussée;RTE DE LAVERUNE;RTE DE LAVERUNE;;;4;Non;0;En service;2006-12-12 11:20:44;2020-12-04 15:20:43;;;;;2.5;1.5;2.0;6.0;Non;Non;Double sens;;;Oui;40;Libre;;;;;;;;;Non;1149.0;1148.0;1245.0;1244.0;34172;34172;Métrique;;;34070.0;34070.0;;341723200;341723200;;;;;;;;;;;;LINESTRING Z (768283.5 6278339 50.9, 768264.8 6278326.7 51, 768238.7 6278306.5 50.3, 768233.5 6278302.5 50, 768204.7 6278282.8 48.2)
-TRONROUT0000000044843988;Route à 1 chaussée;R MARIE DE SEVIGNE;R MARIE DE SEVIGNE;;;5;Non;0;En service;2006-12-12 11:20:44;2011-09-09 10:55:38;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;147.0;148.0;183.0;184.0;34172;34172;Métrique;;;34070.0;34070.0;;34172#0HO;34172#0HO;;;;;;;;;;;;LINESTRING Z (768003.1 6278308.2 43.5, 768031.9 6278324.8 46.5)
-TRONROUT0000002000485114;Route à 1 chaussée;;;;;5;Non;0;En service;2016-12-07 16:06:17;2020-02-12 17:33:37;;2015-07-01;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;;;;;34172;34172;Classique;;;;;;;;;;;;;;;;;;;LINESTRING Z (768396.5 6278392.1 48.4, 768405.6 6278370.5 48.8, 768413.6 6278352.6 49.6, 768423.3 6278334.2 49.9, 768428.7 6278322.8 49.8, 768435.9 6278304.1 48.4, 768440.7 6278290.1 47.6, 768446.8 6278270.1 47.5, 768451.7 6278254 47.1, 768453.5 6278249.1 46.8, 768455.5 6278246.7 46.5, 768457.8 6278247.2 46.4, 768459.7 6278248.6 46.3, 768463.8 6278253 45.6, 768470.8 6278258.7 47)
-TRONROUT0000000044843925;Route à 1 chaussée;R DES MANGUIERS;R DES MANGUIERS;;;5;Non;0;En service;2006-12-12 11:20:44;2012-01-10 14:19:35;;;;;2.5;1.5;1.0;3.0;Non;Non;Sens inverse;;;Oui;30;Libre;;;;;;;;;Non;33.0;;1.0;;34172;34172;Classique;;;34070.0;34070.0;;341723427;341723427;;;;;;;;;;;;LINESTRING Z (768470.8 6278258.7 47, 768464.2 6278264.8 45.1, 768459.8 6278270.8 45.2, 768455.3 6278279.3 45.6, 768447.4 6278305.6 46.2, 768443.2 6278315.4 46.2, 768438 6278324.8 46.1, 768430 6278344.3 46, 768422.7 6278359.7 46.3, 768421 6278367.6 46.3, 768420.7 6278374 46.2, 768421.5 6278377.2 46.2, 768423.9 6278381.8 46, 768428.1 6278384 45.6, 768443.1 6278386.4 45.6, 768521 6278391.1 43.9, 768528.6 6278390.2 43.8, 768538.6 6278387.9 43.3, 768548 6278384.8 43.3, 768562.7 6278377.7 43.1, 768578.9 6278371.8 42.4, 768585.4 6278368.1 42.4, 768589.4 6278363.1 42.4, 768592.3 6278356.9 42.4, 768593.5 6278350.5 42.4, 768592.4 6278344.7 42.4, 768589.8 6278339.1 42, 768585.7 6278334.9 42, 768571.9 6278328.2 42.3, 768487.8 6278277.1 44.5, 768479.5 6278270.3 44.2, 768470.8 6278258.7 47)
-TRONROUT0000000044843958;Route à 1 chaussée;R FABRE D'EGLANTINE;R FABRE D'EGLANTINE;;;5;Non;0;En service;2006-12-12 11:20:44;2011-09-09 10:55:38;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;96.0;97.0;52.0;51.0;34172;34172;Métrique;;;34070.0;34070.0;;341722119;341722119;;;;;;;;;;;;LINESTRING Z (768155 6278350 50, 768149.2 6278314 48.2, 768153.4 6278308.4 47.9)
-TRONROUT0000000044844014;Route à 1 chaussée;;;;;5;Non;0;En service;2006-12-12 11:20:44;;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;;;;;34172;34172;Classique;;;;;;;;;;;;;;;;;;;LINESTRING Z (768003.1 6278308.2 43.5, 767962.8 6278353.7 43.5, 767960.2 6278356.7 43.8)
-TRONROUT0000000044843904;Route à 1 chaussée;R MADELEINE DE SCUDERY;R MADELEINE DE SCUDERY;;;5;Non;0;En service;2006-12-12 11:20:44;2015-10-05 19:17:23;;;;;2.5;1.5;2.0;5.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;1.0;2.0;37.0;36.0;34172;34172;Métrique;;;34070.0;34070.0;;341728005;341728005;;;;;;;;;;;;LINESTRING Z (768031.9 6278324.8 46.5, 768017.9 6278352.2 46.5)
-TRONROUT0000000044843993;Route à 1 chaussée;PL FLORIAN;PL FLORIAN;;;5;Non;0;En service;2006-12-12 11:20:44;2011-09-09 10:55:38;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;70.0;69.0;2.0;1.0;34172;34172;Métrique;;;34070.0;34070.0;;341722242;341722242;;;;;;;;;;;;LINESTRING Z (768203.8 6278345.6 51.3, 768155 6278350 50)
-TRONROUT0000000044844004;Route à 1 chaussée;;;;;5;Non;0;En service;2006-12-12 11:20:44;2011-11-22 12:28:30;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;0;Restreint aux ayants droit;;;;;;;;;Non;;;;;34172;34172;Classique;;;;;;;;;;;;;;;;;;;LINESTRING Z (768031.9 6278324.8 46.5, 768036.9 6278327.7 45.5, 768058.3 6278340.2 47.3, 768059 6278340.8 47.9, 768073.1 6278353.1 49.6, 768083.9 6278365.8 50.8, 768093.5 6278382.2 52.5, 768096.2 6278389 53)
-TRONROUT0000002000485115;Route à 1 chaussée;RTE DE LAVERUNE;RTE DE LAVERUNE;;;4;Non;0;En service;2016-12-07 16:06:17;;;;;;2.5;1.5;2.0;6.0;Non;Non;Double sens;;;Oui;40;Libre;;;;;;;;;Non;1148.0;1149.0;1022.0;1023.0;34172;34172;Métrique;;;34070.0;34070.0;;341723200;341723200;;;;;;;;;;;;LINESTRING Z (768283.5 6278339 50.9, 768315.4 6278358.4 51.9, 768326 6278363.8 51.9, 768339.5 6278371.4 51.8, 768377.9 6278387.4 49.9, 768389.7 6278390.4 48.5, 768396.5 6278392.1 48.4)
-TRONROUT0000000044843930;Route à 1 chaussée;R FABRE D'EGLANTINE;R FABRE D'EGLANTINE;;;5;Non;0;En service;2006-12-12 11:20:44;2011-09-09 10:55:38;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;158.0;159.0;96.0;97.0;34172;34172;Métrique;;;34070.0;34070.0;;341722119;341722119;;;;;;;;;;;;LINESTRING Z (768180.8 6278403.2 54.3, 768161.3 6278387.8 51.9, 768155 6278350 50)
-TRONROUT0000000044843950;Route à 1 chaussée;RTE DE LAVERUNE;RTE DE LAVERUNE;;;4;Non;0;En service;2006-12-12 11:20:44;2016-12-07 16:06:17;;;;;2.5;1.5;2.0;6.0;Non;Non;Double sens;;;Oui;40;Libre;;;;;;;;;Non;1022.0;1023.0;872.0;873.0;34172;34172;Métrique;;;34070.0;34070.0;;341723200;341723200;;;;;;;;;;;;LINESTRING Z (768396.5 6278392.1 48.4, 768398.4 6278392.5 48.4, 768401.5 6278393.4 48.4, 768433.9 6278399.7 45.1, 768476.7 6278404.6 44.1, 768494.9 6278405.5 44, 768512.9 6278404.9 43.7, 768522.7 6278403.6 43.7, 768531.7 6278401.4 43.6, 768544.8 6278396.8 45)
-TRONROUT0000000044843995;Route à 1 chaussée;R MADELEINE DE SCUDERY;R MADELEINE DE SCUDERY;;;5;Non;0;En service;2006-12-12 11:20:44;2015-10-05 19:17:23;;;;;2.5;1.5;2.0;5.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;37.0;36.0;173.0;172.0;34172;34172;Métrique;;;34070.0;34070.0;;341728005;341728005;;;;;;;;;;;;LINESTRING Z (768017.9 6278352.2 46.5, 767943.6 6278434.6 47.2, 767921.6 6278451.4 47.3)
-TRONROUT0000000044843951;Route à 1 chaussée;R GERMAINE DE STAEL;R GERMAINE DE STAEL;;;5;Non;0;En service;2006-12-12 11:20:44;2015-10-05 19:17:23;;;;;2.5;1.5;2.0;5.0;Non;Non;Sens direct;;;Oui;30;Libre;;;;;;;;;Non;234.0;233.0;2.0;1.0;34172;34172;Métrique;;;34070.0;34070.0;;341728004;341728004;;;;;;;;;;;;LINESTRING Z (767921.6 6278451.4 47.3, 767953.3 6278461.8 50.9, 767969.8 6278467.2 54, 767974.5 6278468.3 54.4, 767978.9 6278467.8 54.4, 767982.7 6278466.2 54.5, 767993 6278457.1 54.5, 768014.9 6278435.8 53, 768035.7 6278415.9 52, 768045.5 6278406.5 51.5, 768051.8 6278399.8 50.8, 768054.6 6278396.2 50.8, 768054.8 6278391.4 50.1, 768054.3 6278387.6 49.9, 768052 6278381.9 49.5, 768046.2 6278374.6 48.1, 768032 6278362.5 47.4, 768017.9 6278352.2 46.5)
-TRONROUT0000000044841455;Route à 1 chaussée;R DU PERE CYPRIEN ROME;R DU PERE CYPRIEN ROME;;;5;Non;0;En service;2006-12-12 11:20:44;2011-09-09 10:55:38;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;;;;;34172;34172;Classique;;;34070.0;34070.0;;341724262;341724262;;;;;;;;;;;;LINESTRING Z (768544.8 6278396.8 45, 768554 6278415.1 42.8, 768562.8 6278428.4 43)
-TRONROUT0000000044841553;Chemin;;;;;5;Non;0;En service;2006-12-12 11:20:44;2014-08-11 15:32:04;;;;;2.5;1.5;;;Non;Non;Double sens;;;Oui;1;Libre;;;;;;;;;Non;;;;;34172;34172;Classique;;;;;;;;;;;;;;;;;;;LINESTRING Z (768096.2 6278389 53, 768104.2 6278392 53.2, 768114.8 6278398.7 53.5, 768159.7 6278433.3 55.1, 768165.3 6278437.1 55.4)
-TRONROUT0000000044841491;Route à 1 chaussée;R DU PERE CYPRIEN ROME;R DU PERE CYPRIEN ROME;;;5;Non;0;En service;2006-12-12 11:20:44;2011-09-09 10:55:38;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;;;;;34172;34172;Classique;;;34070.0;34070.0;;341724262;341724262;;;;;;;;;;;;LINESTRING Z (768562.8 6278428.4 43, 768571.1 6278440.9 43.3, 768575 6278446.8 43.4, 768575.9 6278449.2 43.5, 768577.1 6278452.8 45.3)
-TRONROUT0000000044841452;Route à 1 chaussée;R MARTIN LUTHER KING;R MARTIN LUTHER KING;;;5;Non;0;En service;2006-12-12 11:20:44;2011-09-09 10:55:38;;2009-07-01;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;42.0;41.0;2.0;1.0;34172;34172;Métrique;;;34070.0;34070.0;;341723527;341723527;;;;;;;;;;;;LINESTRING Z (768526.7 6278456.7 45.1, 768533.4 6278453.5 44.4, 768546.1 6278443.2 43.5, 768562.8 6278428.4 43)
-TRONROUT0000000044841542;Route à 1 chaussée;;;;;5;Non;0;En service;2006-12-12 11:20:44;2011-11-22 12:28:30;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;0;Restreint aux ayants droit;;;;;;;;;Non;;;;;34172;34172;Classique;;;;;;;;;;;;;;;;;;;LINESTRING Z (768096.2 6278389 53, 768100.2 6278398.9 54, 768101.5 6278408.8 54.7, 768100.9 6278417.5 55.6, 768098.1 6278425.2 56, 768090.4 6278440.1 57.6, 768083.5 6278447.6 57.8, 768075.6 6278453 59.1, 768064.5 6278457.9 60, 768051.5 6278463.2 61, 768039.9 6278468.8 61.9, 768033.3 6278474 62.4, 768029 6278481.6 63.7, 768027.7 6278487.2 64.4, 768027.6393258426 6278492.6 64.58202247190273)
-TRONROUT0000000240976813;Rond-point;R MARTIN LUTHER KING;R MARTIN LUTHER KING;;;5;Non;0;En service;2010-07-16 12:47:24;2017-10-26 14:33:20;;2009-07-01;;;2.5;1.5;2.0;4.0;Non;Non;Sens direct;;;Oui;25;Libre;;;;;;;;;Non;;;;;34172;34172;Métrique;;;34070.0;34070.0;;341723527;341723527;;;;;;;;;;;;LINESTRING Z (768517.6 6278456.2 44.3, 768519.7 6278455.1 44.3, 768521.1 6278454.7 44.3, 768523.7 6278454.7 44.3, 768525.3 6278455.3 44.3, 768526.7 6278456.7 45.1)
-TRONROUT0000000240976812;Rond-point;R MARTIN LUTHER KING;R MARTIN LUTHER KING;;;5;Non;0;En service;2010-07-16 12:47:24;2017-10-26 14:33:20;;2009-07-01;;;2.5;1.5;2.0;4.0;Non;Non;Sens direct;;;Oui;25;Libre;;;;;;;;;Non;;;;;34172;34172;Métrique;;;34070.0;34070.0;;341723527;341723527;;;;;;;;;;;;LINESTRING Z (768519.1 6278465.7 45.4, 768517.9 6278464.7 45.4, 768516.4 6278462.5 45.4, 768516.1 6278461.5 45.4, 768516 6278459.7 45.4, 768516.3 6278457.4 45.4, 768517.6 6278456.2 44.3)
-TRONROUT0000000240976814;Rond-point;R MARTIN LUTHER KING;R MARTIN LUTHER KING;;;5;Non;0;En service;2010-07-16 12:47:24;2017-10-26 14:33:20;;2009-07-01;;;2.5;1.5;2.0;4.0;Non;Non;Sens direct;;;Oui;25;Libre;;;;;;;;;Non;41.0;42.0;57.0;58.0;34172;34172;Métrique;;;34070.0;34070.0;;341723527;341723527;;;;;;;;;;;;LINESTRING Z (768526.7 6278456.7 45.1, 768526.9 6278458.6 45.1, 768526.8 6278462.2 45.1, 768526 6278464.2 45.1, 768524.3 6278465.6 45.1, 768522.7 6278466.3 45.1, 768520.5 6278466.6 45.1, 768519.1 6278465.7 45.4)
-TRONROUT0000000044841597;Route à 1 chaussée;R MADELEINE DE SCUDERY;R MADELEINE DE SCUDERY;;;5;Non;0;En service;2006-12-12 11:20:44;2015-10-06 10:04:31;;;;;2.5;1.5;2.0;5.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;173.0;172.0;245.0;246.0;34172;34172;Métrique;;;34070.0;34070.0;;341728005;341728005;;;;;;;;;;;;LINESTRING Z (767921.6 6278451.4 47.3, 767891.8 6278480.9 47)
-TRONROUT0000000044841586;Route à 1 chaussée;R ARMAND LUNEL;R ARMAND LUNEL;;;5;Non;0;En service;2006-12-12 11:20:44;2011-09-09 10:55:38;;2009-07-01;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;1.0;2.0;209.0;198.0;34172;34172;Métrique;;;34070.0;34070.0;;341720341;341720341;;;;;;;;;;;;LINESTRING Z (768517.6 6278456.2 44.3, 768512.6 6278453.9 44.3, 768499.1 6278451.8 44.3, 768451.2 6278445.5 45.9, 768421.7 6278443 47.1, 768410.6 6278443.1 48.6, 768403 6278445.1 48.6, 768398.7 6278447.4 48.6, 768392.9 6278451.3 48.6, 768386.6 6278458 48.7, 768376.9 6278469.7 49.2, 768364.7 6278484.7 49.9, 768358.916071429 6278492.6 51.66339285699191)
-TRONROUT0000000044841595;Route à 1 chaussée;ALL DE LA MARTELLE;ALL DE LA MARTELLE;;;5;Non;0;En service;2006-12-12 11:20:44;2016-09-29 12:02:11;;;;;2.5;1.5;1.0;3.0;Non;Non;Sens direct;;;Oui;30;Libre;;;;;;;;;Non;399.0;400.0;813.0;812.0;34172;34172;Métrique;;;34070.0;34070.0;;341723526;341723526;;;;;;;;;;;;LINESTRING Z (767820.4 6278471.821568628 45.166666666673514, 767827.4 6278452.4 44, 767841.9 6278415.6 42.5, 767853.8 6278402.5 42.2, 767858 6278384.1 42.2, 767861.7 6278363.1 42.2, 767868 6278341.8 42.2, 767876.6 6278322.5 42.2, 767878 6278320.3 43.3, 767885.1 6278308.4 42.1, 767891 6278302.4 42.2, 767903.4 6278289.5 40.9, 767908.1 6278282.3 42.5)
-TRONROUT0000000044841560;Chemin;;;;;5;Non;0;En service;2006-12-12 11:20:44;2014-08-11 15:32:04;;;;;2.5;1.5;;;Non;Non;Double sens;;;Oui;1;Libre;;;;;;;;;Non;;;;;34172;34172;Classique;;;;;;;;;;;;;;;;;;;LINESTRING Z (768116.8472727276 6278492.6 61.29090909086934, 768144.6 6278459 57.8, 768165.3 6278437.1 55.4)
-TRONROUT0000000044841490;Route à 1 chaussée;R DES HORTENSIAS;R DES HORTENSIAS;;;5;Non;0;En service;2006-12-12 11:20:44;2011-09-09 10:55:38;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;1.0;2.0;19.0;14.0;34172;34172;Classique;;;34070.0;34070.0;;341722843;341722843;;;;;;;;;;;;LINESTRING Z (768577.1 6278452.8 45.3, 768537.7465638149 6278492.6 47.421178120612595)
-TRONROUT0000000044841593;Route à 1 chaussée;R MARTIN LUTHER KING;R MARTIN LUTHER KING;;;5;Non;0;En service;2006-12-12 11:20:44;2011-09-09 10:55:38;;2009-07-01;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;206.0;205.0;60.0;59.0;34172;34172;Métrique;;;34070.0;34070.0;;341723527;341723527;;;;;;;;;;;;LINESTRING Z (768498.3536170217 6278492.6 46.25063829784898, 768510.9 6278480 45.5, 768516 6278473 45.4, 768518 6278468.9 45.4, 768519.1 6278465.7 45.4)
-TRONROUT0000000044841543;Chemin;;;;;5;Non;0;En service;2006-12-12 11:20:44;2014-08-11 15:32:04;;;;;2.5;1.5;;;Non;Non;Double sens;;;Oui;1;Libre;;;;;;;;;Non;;;;;34172;34172;Classique;;;;;;;;;;;;;;;;;;;LINESTRING Z (768165.3 6278437.1 55.4, 768186.6 6278450.4 56.1, 768204.4 6278462.1 57.6, 768212.2 6278467.1 56.4, 768248.3 6278489.7 56.1, 768250.2543478259 6278492.6 56.66739130428336)
-TRONROUT0000000291716477;Route à 2 chaussées;AV DE LA RECAMBALE;AV DE LA RECAMBALE;;;3;Non;0;En service;2011-11-22 12:28:30;2021-12-10 18:01:06;;;;;2.5;1.5;2.0;7.0;Non;Non;Sens inverse;;;Oui;45;Libre;;;;;;;;;Non;;;;;34172;34172;Classique;;;34070.0;34070.0;;341724832;341724832;ROUTNOMM0000002275428288;;M65;;Route intercommunale;Montpellier Méditerranée Métropole;;;;;;LINESTRING Z (767881.2 6278253.1 42.2, 767867.9 6278272.2 43.2, 767855.2 6278294.7 43.6, 767834.6 6278333 44.1, 767820.4 6278368.264900662 45.04039735098749)
-""")
+        _sio = AbstractGeoDataFrameDemos._dataset(
+            "GeoDataFrameDemos3", "irisPasDuLoupInMontpellierRoads.csv"
+        )
         return GeoDataFrameLib.read_csv(_sio)
 
     @staticmethod
@@ -1183,18 +100,9 @@ TRONROUT0000000291716477;Route à 2 chaussées;AV DE LA RECAMBALE;AV DE LA RECAM
 
         grid.to_csv('/tmp/pasDuLoup-grid.csv', sep=';', index=False)
         '''
-        _sio = StringIO("""IdINSPIRE;Id_carr1km;I_est_cr;Id_carr_n;Groupe;Depcom;I_pauv;Id_car2010;Ind;Men;Men_pauv;Men_1ind;Men_5ind;Men_prop;Men_fmp;Ind_snv;Men_surf;Men_coll;Men_mais;Log_av45;Log_45_70;Log_70_90;Log_ap90;Log_inc;Log_soc;Ind_0_3;Ind_4_5;Ind_6_10;Ind_11_17;Ind_18_24;Ind_25_39;Ind_40_54;Ind_55_64;Ind_65_79;Ind_80p;Ind_inc;I_est_1km;geometry
-CRS3035RES200mN2297000E3823200;CRS3035RES1000mN2297000E3823000;0;CRS3035RES1000mN2297000E3823000;456697;34172;0;CRS3035RES200mN2297000E3823200;536.5;200.0;107.0;64.0;34.0;2.0;53.0;6579115.2;15196.0;200.0;0.0;0.0;0.0;147.0;53.0;0.0;198.0;31.0;23.0;48.0;75.5;34.0;100.0;94.0;57.0;46.0;26.0;2.0;0;POLYGON ((768066.243486198 6278011.250603366, 768048.6994213798 6278210.879150139, 768247.5695183798 6278229.445175951, 768265.1136839408 6278029.8165421635, 768066.243486198 6278011.250603366))
-CRS3035RES200mN2297000E3823600;CRS3035RES1000mN2297000E3823000;0;CRS3035RES1000mN2297000E3823000;456695;34172;0;CRS3035RES200mN2297000E3823600;301.5;170.0;24.0;90.0;1.0;85.0;16.0;7069971.6;11566.0;145.0;25.0;1.0;11.0;26.0;132.0;0.0;0.0;17.0;5.0;16.0;17.0;9.5;73.0;50.0;21.0;58.0;32.0;3.0;0;POLYGON ((768463.9837656781 6278048.382124617, 768446.439499393 6278248.010845389, 768645.3093644815 6278266.576158444, 768662.8537314722 6278066.947350725, 768463.9837656781 6278048.382124617))
-CRS3035RES200mN2297000E3823400;CRS3035RES1000mN2297000E3823000;0;CRS3035RES1000mN2297000E3823000;456698;34172;0;CRS3035RES200mN2297000E3823400;564.5;227.0;93.0;86.0;31.0;6.0;40.0;7567978.2;16209.0;221.0;6.0;0.0;4.0;65.0;157.0;1.0;163.0;36.0;19.0;51.0;51.5;56.0;135.0;102.0;59.0;34.0;19.0;2.0;0;POLYGON ((768265.1136839408 6278029.8165421635, 768247.5695183798 6278229.445175951, 768446.439499393 6278248.010845389, 768463.9837656781 6278048.382124617, 768265.1136839408 6278029.8165421635))
-CRS3035RES200mN2297200E3823400;CRS3035RES1000mN2297000E3823000;0;CRS3035RES1000mN2297000E3823000;456688;34172;0;CRS3035RES200mN2297200E3823400;261.0;99.0;51.0;30.0;15.0;1.0;26.0;3477339.9;7555.0;98.0;1.0;0.0;6.0;75.0;18.0;0.0;96.0;15.5;13.0;21.5;25.0;19.0;52.0;44.0;35.0;30.0;6.0;0.0;0;POLYGON ((768247.5695183798 6278229.445175951, 768230.0250571979 6278429.0732500255, 768428.8949376224 6278447.639006475, 768446.439499393 6278248.010845389, 768247.5695183798 6278229.445175951))
-CRS3035RES200mN2297200E3823600;CRS3035RES1000mN2297000E3823000;0;CRS3035RES1000mN2297000E3823000;456692;34172;0;CRS3035RES200mN2297200E3823600;263.0;128.0;33.0;59.0;9.0;8.0;25.0;3954772.1;10117.0;122.0;6.0;0.0;113.0;7.0;8.0;0.0;119.0;7.0;6.0;25.0;26.0;9.0;36.0;57.0;22.0;43.0;29.0;3.0;0;POLYGON ((768446.439499393 6278248.010845389, 768428.8949376224 6278447.639006475, 768627.7647021405 6278466.204406503, 768645.3093644815 6278266.576158444, 768446.439499393 6278248.010845389))
-CRS3035RES200mN2297000E3823000;CRS3035RES1000mN2297000E3823000;1;CRS3035RES1000mN2297000E3823000;456676;34172;0;CRS3035RES200mN2297000E3823000;55.5;20.3;1.7;5.1;3.4;8.5;2.5;1304298.8;2164.9;1.7;18.6;0.0;0.0;2.5;17.8;0.0;5.9;4.6;1.7;5.1;5.1;1.7;10.2;10.2;6.8;2.5;5.1;2.5;0;POLYGON ((767867.3731723882 6277992.684308242, 767849.8292083316 6278192.31276796, 768048.6994213798 6278210.879150139, 768066.243486198 6278011.250603366, 767867.3731723882 6277992.684308242))
-CRS3035RES200mN2297200E3823200;CRS3035RES1000mN2297000E3823000;0;CRS3035RES1000mN2297000E3823000;456685;34172;0;CRS3035RES200mN2297200E3823200;232.5;86.0;26.0;25.0;13.0;23.0;16.0;3806867.3;8326.0;57.0;29.0;0.0;0.0;63.0;22.0;1.0;55.0;15.5;2.0;21.5;31.5;14.0;29.0;45.0;34.0;24.0;12.0;4.0;0;POLYGON ((768048.6994213798 6278210.879150139, 768031.1550608053 6278410.507137166, 768230.0250571979 6278429.0732500255, 768247.5695183798 6278229.445175951, 768048.6994213798 6278210.879150139))
-CRS3035RES200mN2297200E3823800;CRS3035RES1000mN2297000E3823000;0;CRS3035RES1000mN2297000E3823000;456696;34172;0;CRS3035RES200mN2297200E3823800;316.0;183.0;18.0;96.0;7.0;120.0;18.0;8300000.4;14385.0;169.0;14.0;1.0;14.0;153.0;15.0;0.0;0.0;3.0;6.5;13.0;11.0;18.5;38.0;51.0;37.0;85.0;45.0;8.0;0;POLYGON ((768645.3093644815 6278266.576158444, 768627.7647021405 6278466.204406503, 768826.634350814 6278484.769450104, 768844.1791137063 6278285.141115108, 768645.3093644815 6278266.576158444))
-CRS3035RES200mN2296800E3823200;CRS3035RES1000mN2296000E3823000;1;CRS3035RES1000mN2296000E3823000;456654;34172;0;CRS3035RES200mN2296800E3823200;16.0;6.4;0.8;1.6;1.2;4.8;0.8;360454.4;533.6;1.2;5.2;1.2;0.8;0.0;4.4;0.0;0.0;0.4;0.4;0.6;1.4;0.8;4.4;3.6;2.4;1.2;0.0;0.8;0;POLYGON ((768083.787255292 6277811.62149661, 768066.243486198 6278011.250603366, 768265.1136839408 6278029.8165421635, 768282.657553913 6277830.187348414, 768083.787255292 6277811.62149661))
-CRS3035RES200mN2296800E3823400;CRS3035RES1000mN2296000E3823000;0;CRS3035RES1000mN2296000E3823000;456667;34172;0;CRS3035RES200mN2296800E3823400;329.0;131.0;33.0;50.0;17.0;25.0;24.0;5435353.4;9169.0;127.0;4.0;0.0;1.0;1.0;129.0;0.0;87.0;20.0;11.0;25.0;32.0;26.0;65.0;78.0;32.0;29.0;7.0;4.0;0;POLYGON ((768282.657553913 6277830.187348414, 768265.1136839408 6278029.8165421635, 768463.9837656781 6278048.382124617, 768481.52773651 6277848.752843911, 768282.657553913 6277830.187348414))
-""")
+        _sio = AbstractGeoDataFrameDemos._dataset(
+            "GeoDataFrameDemos3", "irisPasDuLoupInMontpellierINSEEGrid.csv"
+        )
         return GeoDataFrameLib.read_csv(_sio)
 
     @staticmethod
@@ -20,7 +20,6 @@ GNU General Public License for more details.
 You should have received a copy of the GNU General Public License
 along with t4gpd.  If not, see <https://www.gnu.org/licenses/>.
 '''
-from io import StringIO
 
 from t4gpd.demos.AbstractGeoDataFrameDemos import AbstractGeoDataFrameDemos
 from t4gpd.io.CirReader import CirReader
@@ -33,3343 +32,9 @@ class GeoDataFrameDemos5(AbstractGeoDataFrameDemos):
 
     @staticmethod
     def cirSceneMasque1():
-        sio = StringIO("""370      370 
-     1      0
-     1      0
-     1      0
-     1      0
-     1      0
-f1    1
--0.0 -0.0 1.0 
-c0
-5
-    -30.0 -30.0 0.0 
-    -30.0 120.0 0.0 
-    120.0 120.0 0.0 
-    120.0 -30.0 0.0 
-    -30.0 -30.0 0.0 
-f2    1
--0.0 1.0 -0.0 
-c0
-5
-    100.0 60.0 0.0 
-    80.0 60.0 0.0 
-    80.0 60.0 3.0 
-    100.0 60.0 3.0 
-    100.0 60.0 0.0 
-f3    1
-1.0 -0.0 -0.0 
-c0
-5
-    100.0 60.0 0.0 
-    100.0 40.0 0.0 
-    100.0 40.0 3.0 
-    100.0 60.0 3.0 
-    100.0 60.0 0.0 
-f4    1
--1.0 0.0 0.0 
-c0
-5
-    80.0 60.0 0.0 
-    80.0 40.0 0.0 
-    80.0 40.0 3.0 
-    80.0 60.0 3.0 
-    80.0 60.0 0.0 
-f5    1
-0.0 -1.0 0.0 
-c0
-5
-    80.0 40.0 0.0 
-    80.0 40.0 3.0 
-    100.0 40.0 3.0 
-    100.0 40.0 0.0 
-    80.0 40.0 0.0 
-f6    1
-1.0 -0.0 -0.0 
-c0
-5
-    70.0 70.0 0.0 
-    70.0 50.0 0.0 
-    70.0 50.0 3.0 
-    70.0 70.0 3.0 
-    70.0 70.0 0.0 
-f7    1
--0.0 1.0 -0.0 
-c0
-5
-    70.0 70.0 0.0 
-    50.0 70.0 0.0 
-    50.0 70.0 3.0 
-    70.0 70.0 3.0 
-    70.0 70.0 0.0 
-f8    1
-0.0 -1.0 0.0 
-c0
-5
-    70.0 50.0 0.0 
-    50.0 50.0 0.0 
-    50.0 50.0 3.0 
-    70.0 50.0 3.0 
-    70.0 50.0 0.0 
-f9    1
--1.0 0.0 0.0 
-c0
-5
-    50.0 70.0 0.0 
-    50.0 70.0 3.0 
-    50.0 50.0 3.0 
-    50.0 50.0 0.0 
-    50.0 70.0 0.0 
-f10    1
--0.0 1.0 -0.0 
-c0
-5
-    40.0 65.0 0.0 
-    20.0 65.0 0.0 
-    20.0 65.0 3.0 
-    40.0 65.0 3.0 
-    40.0 65.0 0.0 
-f11    1
-1.0 -0.0 -0.0 
-c0
-5
-    40.0 65.0 0.0 
-    40.0 45.0 0.0 
-    40.0 45.0 3.0 
-    40.0 65.0 3.0 
-    40.0 65.0 0.0 
-f12    1
--1.0 0.0 0.0 
-c0
-5
-    20.0 65.0 0.0 
-    20.0 45.0 0.0 
-    20.0 45.0 3.0 
-    20.0 65.0 3.0 
-    20.0 65.0 0.0 
-f13    1
-0.0 -1.0 0.0 
-c0
-5
-    40.0 45.0 0.0 
-    20.0 45.0 0.0 
-    20.0 45.0 3.0 
-    40.0 45.0 3.0 
-    40.0 45.0 0.0 
-f14    1
-1.0 -0.0 -0.0 
-c0
-5
-    20.0 95.0 0.0 
-    20.0 75.0 0.0 
-    20.0 75.0 3.0 
-    20.0 95.0 3.0 
-    20.0 95.0 0.0 
-f15    1
--0.0 1.0 -0.0 
-c0
-5
-    20.0 95.0 0.0 
-    0.0 95.0 0.0 
-    0.0 95.0 3.0 
-    20.0 95.0 3.0 
-    20.0 95.0 0.0 
-f16    1
-0.0 -1.0 0.0 
-c0
-5
-    20.0 75.0 0.0 
-    0.0 75.0 0.0 
-    0.0 75.0 3.0 
-    20.0 75.0 3.0 
-    20.0 75.0 0.0 
-f17    1
--1.0 0.0 0.0 
-c0
-5
-    0.0 95.0 0.0 
-    0.0 75.0 0.0 
-    0.0 75.0 3.0 
-    0.0 95.0 3.0 
-    0.0 95.0 0.0 
-f18    1
-1.0 -0.0 -0.0 
-c0
-5
-    95.0 70.0 0.0 
-    95.0 70.0 3.0 
-    95.0 90.0 3.0 
-    95.0 90.0 0.0 
-    95.0 70.0 0.0 
-f19    1
--0.0 1.0 -0.0 
-c0
-5
-    95.0 90.0 0.0 
-    75.0 90.0 0.0 
-    75.0 90.0 3.0 
-    95.0 90.0 3.0 
-    95.0 90.0 0.0 
-f20    1
-0.0 -1.0 0.0 
-c0
-5
-    95.0 70.0 0.0 
-    75.0 70.0 0.0 
-    75.0 70.0 3.0 
-    95.0 70.0 3.0 
-    95.0 70.0 0.0 
-f21    1
--1.0 0.0 0.0 
-c0
-5
-    75.0 70.0 0.0 
-    75.0 70.0 3.0 
-    75.0 90.0 3.0 
-    75.0 90.0 0.0 
-    75.0 70.0 0.0 
-f22    1
-1.0 -0.0 -0.0 
-c0
-5
-    55.0 40.0 0.0 
-    55.0 20.0 0.0 
-    55.0 20.0 3.0 
-    55.0 40.0 3.0 
-    55.0 40.0 0.0 
-f23    1
--0.0 1.0 -0.0 
-c0
-5
-    55.0 40.0 0.0 
-    35.0 40.0 0.0 
-    35.0 40.0 3.0 
-    55.0 40.0 3.0 
-    55.0 40.0 0.0 
-f24    1
-0.0 -1.0 0.0 
-c0
-5
-    55.0 20.0 0.0 
-    35.0 20.0 0.0 
-    35.0 20.0 3.0 
-    55.0 20.0 3.0 
-    55.0 20.0 0.0 
-f25    1
--1.0 0.0 0.0 
-c0
-5
-    35.0 40.0 0.0 
-    35.0 20.0 0.0 
-    35.0 20.0 3.0 
-    35.0 40.0 3.0 
-    35.0 40.0 0.0 
-f26    1
--1.0 0.0 0.0 
-c0
-5
-    65.0 25.0 0.0 
-    65.0 5.0 0.0 
-    65.0 5.0 3.0 
-    65.0 25.0 3.0 
-    65.0 25.0 0.0 
-f27    1
--0.0 1.0 -0.0 
-c0
-5
-    65.0 25.0 0.0 
-    85.0 25.0 0.0 
-    85.0 25.0 3.0 
-    65.0 25.0 3.0 
-    65.0 25.0 0.0 
-f28    1
-0.0 -1.0 0.0 
-c0
-5
-    85.0 5.0 0.0 
-    65.0 5.0 0.0 
-    65.0 5.0 3.0 
-    85.0 5.0 3.0 
-    85.0 5.0 0.0 
-f29    1
-1.0 -0.0 -0.0 
-c0
-5
-    85.0 25.0 0.0 
-    85.0 5.0 0.0 
-    85.0 5.0 3.0 
-    85.0 25.0 3.0 
-    85.0 25.0 0.0 
-f30    1
-1.0 -0.0 -0.0 
-c0
-5
-    25.0 20.0 0.0 
-    25.0 0.0 0.0 
-    25.0 0.0 3.0 
-    25.0 20.0 3.0 
-    25.0 20.0 0.0 
-f31    1
--0.0 1.0 -0.0 
-c0
-5
-    25.0 20.0 0.0 
-    5.0 20.0 0.0 
-    5.0 20.0 3.0 
-    25.0 20.0 3.0 
-    25.0 20.0 0.0 
-f32    1
-0.0 -1.0 0.0 
-c0
-5
-    25.0 0.0 0.0 
-    5.0 0.0 0.0 
-    5.0 0.0 3.0 
-    25.0 0.0 3.0 
-    25.0 0.0 0.0 
-f33    1
--1.0 0.0 0.0 
-c0
-5
-    5.0 0.0 0.0 
-    5.0 0.0 3.0 
-    5.0 20.0 3.0 
-    5.0 20.0 0.0 
-    5.0 0.0 0.0 
-f34    1
-1.0 -0.0 -0.0 
-c0
-5
-    60.0 100.0 0.0 
-    60.0 80.0 0.0 
-    60.0 80.0 3.0 
-    60.0 100.0 3.0 
-    60.0 100.0 0.0 
-f35    1
--0.0 1.0 -0.0 
-c0
-5
-    60.0 100.0 0.0 
-    40.0 100.0 0.0 
-    40.0 100.0 3.0 
-    60.0 100.0 3.0 
-    60.0 100.0 0.0 
-f36    1
--1.0 0.0 0.0 
-c0
-5
-    40.0 100.0 0.0 
-    40.0 80.0 0.0 
-    40.0 80.0 3.0 
-    40.0 100.0 3.0 
-    40.0 100.0 0.0 
-f37    1
-0.0 -1.0 0.0 
-c0
-5
-    60.0 80.0 3.0 
-    40.0 80.0 3.0 
-    40.0 80.0 0.0 
-    60.0 80.0 0.0 
-    60.0 80.0 3.0 
-f38    1
--0.0 1.0 -0.0 
-c0
-5
-    100.0 60.0 3.0 
-    80.0 60.0 3.0 
-    80.0 60.0 6.0 
-    100.0 60.0 6.0 
-    100.0 60.0 3.0 
-f39    1
-1.0 -0.0 -0.0 
-c0
-5
-    100.0 60.0 3.0 
-    100.0 40.0 3.0 
-    100.0 40.0 6.0 
-    100.0 60.0 6.0 
-    100.0 60.0 3.0 
-f40    1
--1.0 0.0 0.0 
-c0
-5
-    80.0 60.0 3.0 
-    80.0 40.0 3.0 
-    80.0 40.0 6.0 
-    80.0 60.0 6.0 
-    80.0 60.0 3.0 
-f41    1
-0.0 -1.0 0.0 
-c0
-5
-    100.0 40.0 3.0 
-    80.0 40.0 3.0 
-    80.0 40.0 6.0 
-    100.0 40.0 6.0 
-    100.0 40.0 3.0 
-f42    1
-1.0 -0.0 -0.0 
-c0
-5
-    70.0 50.0 3.0 
-    70.0 70.0 3.0 
-    70.0 70.0 6.0 
-    70.0 50.0 6.0 
-    70.0 50.0 3.0 
-f43    1
--0.0 1.0 -0.0 
-c0
-5
-    70.0 70.0 3.0 
-    50.0 70.0 3.0 
-    50.0 70.0 6.0 
-    70.0 70.0 6.0 
-    70.0 70.0 3.0 
-f44    1
-0.0 -1.0 0.0 
-c0
-5
-    70.0 50.0 3.0 
-    50.0 50.0 3.0 
-    50.0 50.0 6.0 
-    70.0 50.0 6.0 
-    70.0 50.0 3.0 
-f45    1
--1.0 0.0 0.0 
-c0
-5
-    50.0 70.0 3.0 
-    50.0 50.0 3.0 
-    50.0 50.0 6.0 
-    50.0 70.0 6.0 
-    50.0 70.0 3.0 
-f46    1
--0.0 1.0 -0.0 
-c0
-5
-    40.0 65.0 3.0 
-    20.0 65.0 3.0 
-    20.0 65.0 6.0 
-    40.0 65.0 6.0 
-    40.0 65.0 3.0 
-f47    1
-1.0 -0.0 -0.0 
-c0
-5
-    40.0 45.0 3.0 
-    40.0 45.0 6.0 
-    40.0 65.0 6.0 
-    40.0 65.0 3.0 
-    40.0 45.0 3.0 
-f48    1
--1.0 0.0 0.0 
-c0
-5
-    20.0 65.0 3.0 
-    20.0 45.0 3.0 
-    20.0 45.0 6.0 
-    20.0 65.0 6.0 
-    20.0 65.0 3.0 
-f49    1
-0.0 -1.0 0.0 
-c0
-5
-    40.0 45.0 6.0 
-    40.0 45.0 3.0 
-    20.0 45.0 3.0 
-    20.0 45.0 6.0 
-    40.0 45.0 6.0 
-f50    1
-1.0 -0.0 -0.0 
-c0
-5
-    20.0 75.0 3.0 
-    20.0 95.0 3.0 
-    20.0 95.0 6.0 
-    20.0 75.0 6.0 
-    20.0 75.0 3.0 
-f51    1
--0.0 1.0 -0.0 
-c0
-5
-    20.0 95.0 3.0 
-    0.0 95.0 3.0 
-    0.0 95.0 6.0 
-    20.0 95.0 6.0 
-    20.0 95.0 3.0 
-f52    1
-0.0 -1.0 0.0 
-c0
-5
-    20.0 75.0 3.0 
-    0.0 75.0 3.0 
-    0.0 75.0 6.0 
-    20.0 75.0 6.0 
-    20.0 75.0 3.0 
-f53    1
--1.0 0.0 0.0 
-c0
-5
-    0.0 95.0 3.0 
-    0.0 75.0 3.0 
-    0.0 75.0 6.0 
-    0.0 95.0 6.0 
-    0.0 95.0 3.0 
-f54    1
-1.0 -0.0 -0.0 
-c0
-5
-    95.0 70.0 3.0 
-    95.0 90.0 3.0 
-    95.0 90.0 6.0 
-    95.0 70.0 6.0 
-    95.0 70.0 3.0 
-f55    1
--0.0 1.0 -0.0 
-c0
-5
-    95.0 90.0 3.0 
-    75.0 90.0 3.0 
-    75.0 90.0 6.0 
-    95.0 90.0 6.0 
-    95.0 90.0 3.0 
-f56    1
-0.0 -1.0 0.0 
-c0
-5
-    75.0 70.0 3.0 
-    75.0 70.0 6.0 
-    95.0 70.0 6.0 
-    95.0 70.0 3.0 
-    75.0 70.0 3.0 
-f57    1
--1.0 0.0 0.0 
-c0
-5
-    75.0 90.0 3.0 
-    75.0 70.0 3.0 
-    75.0 70.0 6.0 
-    75.0 90.0 6.0 
-    75.0 90.0 3.0 
-f58    1
-1.0 -0.0 -0.0 
-c0
-5
-    55.0 20.0 3.0 
-    55.0 40.0 3.0 
-    55.0 40.0 6.0 
-    55.0 20.0 6.0 
-    55.0 20.0 3.0 
-f59    1
--0.0 1.0 -0.0 
-c0
-5
-    55.0 40.0 3.0 
-    55.0 40.0 6.0 
-    35.0 40.0 6.0 
-    35.0 40.0 3.0 
-    55.0 40.0 3.0 
-f60    1
-0.0 -1.0 0.0 
-c0
-5
-    55.0 20.0 3.0 
-    35.0 20.0 3.0 
-    35.0 20.0 6.0 
-    55.0 20.0 6.0 
-    55.0 20.0 3.0 
-f61    1
--1.0 0.0 0.0 
-c0
-5
-    35.0 40.0 6.0 
-    35.0 40.0 3.0 
-    35.0 20.0 3.0 
-    35.0 20.0 6.0 
-    35.0 40.0 6.0 
-f62    1
--1.0 0.0 0.0 
-c0
-5
-    65.0 5.0 3.0 
-    65.0 25.0 3.0 
-    65.0 25.0 6.0 
-    65.0 5.0 6.0 
-    65.0 5.0 3.0 
-f63    1
--0.0 1.0 -0.0 
-c0
-5
-    65.0 25.0 3.0 
-    85.0 25.0 3.0 
-    85.0 25.0 6.0 
-    65.0 25.0 6.0 
-    65.0 25.0 3.0 
-f64    1
-0.0 -1.0 0.0 
-c0
-5
-    65.0 5.0 3.0 
-    85.0 5.0 3.0 
-    85.0 5.0 6.0 
-    65.0 5.0 6.0 
-    65.0 5.0 3.0 
-f65    1
-1.0 -0.0 -0.0 
-c0
-5
-    85.0 25.0 3.0 
-    85.0 5.0 3.0 
-    85.0 5.0 6.0 
-    85.0 25.0 6.0 
-    85.0 25.0 3.0 
-f66    1
-1.0 -0.0 -0.0 
-c0
-5
-    25.0 0.0 3.0 
-    25.0 0.0 6.0 
-    25.0 20.0 6.0 
-    25.0 20.0 3.0 
-    25.0 0.0 3.0 
-f67    1
--0.0 1.0 -0.0 
-c0
-5
-    25.0 20.0 3.0 
-    5.0 20.0 3.0 
-    5.0 20.0 6.0 
-    25.0 20.0 6.0 
-    25.0 20.0 3.0 
-f68    1
-0.0 -1.0 0.0 
-c0
-5
-    25.0 0.0 3.0 
-    5.0 0.0 3.0 
-    5.0 0.0 6.0 
-    25.0 0.0 6.0 
-    25.0 0.0 3.0 
-f69    1
--1.0 0.0 0.0 
-c0
-5
-    5.0 20.0 3.0 
-    5.0 0.0 3.0 
-    5.0 0.0 6.0 
-    5.0 20.0 6.0 
-    5.0 20.0 3.0 
-f70    1
-1.0 -0.0 -0.0 
-c0
-5
-    60.0 80.0 3.0 
-    60.0 100.0 3.0 
-    60.0 100.0 6.0 
-    60.0 80.0 6.0 
-    60.0 80.0 3.0 
-f71    1
--0.0 1.0 -0.0 
-c0
-5
-    60.0 100.0 3.0 
-    40.0 100.0 3.0 
-    40.0 100.0 6.0 
-    60.0 100.0 6.0 
-    60.0 100.0 3.0 
-f72    1
--1.0 0.0 0.0 
-c0
-5
-    40.0 80.0 3.0 
-    40.0 80.0 6.0 
-    40.0 100.0 6.0 
-    40.0 100.0 3.0 
-    40.0 80.0 3.0 
-f73    1
-0.0 -1.0 0.0 
-c0
-5
-    60.0 80.0 3.0 
-    40.0 80.0 3.0 
-    40.0 80.0 6.0 
-    60.0 80.0 6.0 
-    60.0 80.0 3.0 
-f74    1
--0.0 1.0 -0.0 
-c0
-5
-    80.0 60.0 6.0 
-    100.0 60.0 6.0 
-    100.0 60.0 9.0 
-    80.0 60.0 9.0 
-    80.0 60.0 6.0 
-f75    1
-1.0 -0.0 -0.0 
-c0
-5
-    100.0 60.0 6.0 
-    100.0 40.0 6.0 
-    100.0 40.0 9.0 
-    100.0 60.0 9.0 
-    100.0 60.0 6.0 
-f76    1
--1.0 0.0 0.0 
-c0
-5
-    80.0 60.0 9.0 
-    80.0 40.0 9.0 
-    80.0 40.0 6.0 
-    80.0 60.0 6.0 
-    80.0 60.0 9.0 
-f77    1
-0.0 -1.0 0.0 
-c0
-5
-    100.0 40.0 6.0 
-    80.0 40.0 6.0 
-    80.0 40.0 9.0 
-    100.0 40.0 9.0 
-    100.0 40.0 6.0 
-f78    1
-1.0 -0.0 -0.0 
-c0
-5
-    70.0 50.0 6.0 
-    70.0 70.0 6.0 
-    70.0 70.0 9.0 
-    70.0 50.0 9.0 
-    70.0 50.0 6.0 
-f79    1
--0.0 1.0 -0.0 
-c0
-5
-    70.0 70.0 6.0 
-    50.0 70.0 6.0 
-    50.0 70.0 9.0 
-    70.0 70.0 9.0 
-    70.0 70.0 6.0 
-f80    1
-0.0 -1.0 0.0 
-c0
-5
-    70.0 50.0 6.0 
-    50.0 50.0 6.0 
-    50.0 50.0 9.0 
-    70.0 50.0 9.0 
-    70.0 50.0 6.0 
-f81    1
--1.0 0.0 0.0 
-c0
-5
-    50.0 70.0 6.0 
-    50.0 50.0 6.0 
-    50.0 50.0 9.0 
-    50.0 70.0 9.0 
-    50.0 70.0 6.0 
-f82    1
--0.0 1.0 -0.0 
-c0
-5
-    20.0 65.0 6.0 
-    40.0 65.0 6.0 
-    40.0 65.0 9.0 
-    20.0 65.0 9.0 
-    20.0 65.0 6.0 
-f83    1
-1.0 -0.0 -0.0 
-c0
-5
-    40.0 65.0 6.0 
-    40.0 45.0 6.0 
-    40.0 45.0 9.0 
-    40.0 65.0 9.0 
-    40.0 65.0 6.0 
-f84    1
--1.0 0.0 0.0 
-c0
-5
-    20.0 65.0 6.0 
-    20.0 45.0 6.0 
-    20.0 45.0 9.0 
-    20.0 65.0 9.0 
-    20.0 65.0 6.0 
-f85    1
-0.0 -1.0 0.0 
-c0
-5
-    40.0 45.0 6.0 
-    40.0 45.0 9.0 
-    20.0 45.0 9.0 
-    20.0 45.0 6.0 
-    40.0 45.0 6.0 
-f86    1
-1.0 -0.0 -0.0 
-c0
-5
-    20.0 75.0 6.0 
-    20.0 95.0 6.0 
-    20.0 95.0 9.0 
-    20.0 75.0 9.0 
-    20.0 75.0 6.0 
-f87    1
--0.0 1.0 -0.0 
-c0
-5
-    20.0 95.0 6.0 
-    0.0 95.0 6.0 
-    0.0 95.0 9.0 
-    20.0 95.0 9.0 
-    20.0 95.0 6.0 
-f88    1
-0.0 -1.0 0.0 
-c0
-5
-    20.0 75.0 6.0 
-    0.0 75.0 6.0 
-    0.0 75.0 9.0 
-    20.0 75.0 9.0 
-    20.0 75.0 6.0 
-f89    1
--1.0 0.0 0.0 
-c0
-5
-    0.0 95.0 6.0 
-    0.0 75.0 6.0 
-    0.0 75.0 9.0 
-    0.0 95.0 9.0 
-    0.0 95.0 6.0 
-f90    1
-1.0 -0.0 -0.0 
-c0
-5
-    95.0 70.0 6.0 
-    95.0 90.0 6.0 
-    95.0 90.0 9.0 
-    95.0 70.0 9.0 
-    95.0 70.0 6.0 
-f91    1
--0.0 1.0 -0.0 
-c0
-5
-    95.0 90.0 6.0 
-    75.0 90.0 6.0 
-    75.0 90.0 9.0 
-    95.0 90.0 9.0 
-    95.0 90.0 6.0 
-f92    1
-0.0 -1.0 0.0 
-c0
-5
-    95.0 70.0 6.0 
-    75.0 70.0 6.0 
-    75.0 70.0 9.0 
-    95.0 70.0 9.0 
-    95.0 70.0 6.0 
-f93    1
--1.0 0.0 0.0 
-c0
-5
-    75.0 90.0 6.0 
-    75.0 70.0 6.0 
-    75.0 70.0 9.0 
-    75.0 90.0 9.0 
-    75.0 90.0 6.0 
-f94    1
-1.0 -0.0 -0.0 
-c0
-5
-    55.0 20.0 9.0 
-    55.0 40.0 9.0 
-    55.0 40.0 6.0 
-    55.0 20.0 6.0 
-    55.0 20.0 9.0 
-f95    1
--0.0 1.0 -0.0 
-c0
-5
-    55.0 40.0 6.0 
-    35.0 40.0 6.0 
-    35.0 40.0 9.0 
-    55.0 40.0 9.0 
-    55.0 40.0 6.0 
-f96    1
-0.0 -1.0 0.0 
-c0
-5
-    55.0 20.0 6.0 
-    35.0 20.0 6.0 
-    35.0 20.0 9.0 
-    55.0 20.0 9.0 
-    55.0 20.0 6.0 
-f97    1
--1.0 0.0 0.0 
-c0
-5
-    35.0 40.0 6.0 
-    35.0 20.0 6.0 
-    35.0 20.0 9.0 
-    35.0 40.0 9.0 
-    35.0 40.0 6.0 
-f98    1
--1.0 0.0 0.0 
-c0
-5
-    65.0 5.0 6.0 
-    65.0 25.0 6.0 
-    65.0 25.0 9.0 
-    65.0 5.0 9.0 
-    65.0 5.0 6.0 
-f99    1
--0.0 1.0 -0.0 
-c0
-5
-    65.0 25.0 6.0 
-    65.0 25.0 9.0 
-    85.0 25.0 9.0 
-    85.0 25.0 6.0 
-    65.0 25.0 6.0 
-f100    1
-0.0 -1.0 0.0 
-c0
-5
-    65.0 5.0 6.0 
-    85.0 5.0 6.0 
-    85.0 5.0 9.0 
-    65.0 5.0 9.0 
-    65.0 5.0 6.0 
-f101    1
-1.0 -0.0 -0.0 
-c0
-5
-    85.0 25.0 6.0 
-    85.0 5.0 6.0 
-    85.0 5.0 9.0 
-    85.0 25.0 9.0 
-    85.0 25.0 6.0 
-f102    1
-1.0 -0.0 -0.0 
-c0
-5
-    25.0 0.0 6.0 
-    25.0 20.0 6.0 
-    25.0 20.0 9.0 
-    25.0 0.0 9.0 
-    25.0 0.0 6.0 
-f103    1
--0.0 1.0 -0.0 
-c0
-5
-    25.0 20.0 9.0 
-    5.0 20.0 9.0 
-    5.0 20.0 6.0 
-    25.0 20.0 6.0 
-    25.0 20.0 9.0 
-f104    1
-0.0 -1.0 0.0 
-c0
-5
-    25.0 0.0 6.0 
-    5.0 0.0 6.0 
-    5.0 0.0 9.0 
-    25.0 0.0 9.0 
-    25.0 0.0 6.0 
-f105    1
--1.0 0.0 0.0 
-c0
-5
-    5.0 20.0 6.0 
-    5.0 0.0 6.0 
-    5.0 0.0 9.0 
-    5.0 20.0 9.0 
-    5.0 20.0 6.0 
-f106    1
-1.0 -0.0 -0.0 
-c0
-5
-    60.0 80.0 6.0 
-    60.0 100.0 6.0 
-    60.0 100.0 9.0 
-    60.0 80.0 9.0 
-    60.0 80.0 6.0 
-f107    1
--0.0 1.0 -0.0 
-c0
-5
-    60.0 100.0 6.0 
-    40.0 100.0 6.0 
-    40.0 100.0 9.0 
-    60.0 100.0 9.0 
-    60.0 100.0 6.0 
-f108    1
--1.0 0.0 0.0 
-c0
-5
-    40.0 100.0 6.0 
-    40.0 80.0 6.0 
-    40.0 80.0 9.0 
-    40.0 100.0 9.0 
-    40.0 100.0 6.0 
-f109    1
-0.0 -1.0 0.0 
-c0
-5
-    60.0 80.0 6.0 
-    40.0 80.0 6.0 
-    40.0 80.0 9.0 
-    60.0 80.0 9.0 
-    60.0 80.0 6.0 
-f110    1
--0.0 1.0 -0.0 
-c0
-5
-    80.0 60.0 12.0 
-    100.0 60.0 12.0 
-    100.0 60.0 9.0 
-    80.0 60.0 9.0 
-    80.0 60.0 12.0 
-f111    1
-1.0 -0.0 -0.0 
-c0
-5
-    100.0 60.0 9.0 
-    100.0 40.0 9.0 
-    100.0 40.0 12.0 
-    100.0 60.0 12.0 
-    100.0 60.0 9.0 
-f112    1
--1.0 0.0 0.0 
-c0
-5
-    80.0 40.0 9.0 
-    80.0 40.0 12.0 
-    80.0 60.0 12.0 
-    80.0 60.0 9.0 
-    80.0 40.0 9.0 
-f113    1
-0.0 -1.0 0.0 
-c0
-5
-    80.0 40.0 12.0 
-    80.0 40.0 9.0 
-    100.0 40.0 9.0 
-    100.0 40.0 12.0 
-    80.0 40.0 12.0 
-f114    1
-1.0 -0.0 -0.0 
-c0
-5
-    70.0 50.0 9.0 
-    70.0 70.0 9.0 
-    70.0 70.0 12.0 
-    70.0 50.0 12.0 
-    70.0 50.0 9.0 
-f115    1
--0.0 1.0 -0.0 
-c0
-5
-    70.0 70.0 9.0 
-    50.0 70.0 9.0 
-    50.0 70.0 12.0 
-    70.0 70.0 12.0 
-    70.0 70.0 9.0 
-f116    1
-0.0 -1.0 0.0 
-c0
-5
-    70.0 50.0 9.0 
-    50.0 50.0 9.0 
-    50.0 50.0 12.0 
-    70.0 50.0 12.0 
-    70.0 50.0 9.0 
-f117    1
--1.0 0.0 0.0 
-c0
-5
-    50.0 70.0 9.0 
-    50.0 50.0 9.0 
-    50.0 50.0 12.0 
-    50.0 70.0 12.0 
-    50.0 70.0 9.0 
-f118    1
--0.0 1.0 -0.0 
-c0
-5
-    20.0 65.0 9.0 
-    40.0 65.0 9.0 
-    40.0 65.0 12.0 
-    20.0 65.0 12.0 
-    20.0 65.0 9.0 
-f119    1
-1.0 -0.0 -0.0 
-c0
-5
-    40.0 65.0 9.0 
-    40.0 45.0 9.0 
-    40.0 45.0 12.0 
-    40.0 65.0 12.0 
-    40.0 65.0 9.0 
-f120    1
--1.0 0.0 0.0 
-c0
-5
-    20.0 65.0 9.0 
-    20.0 45.0 9.0 
-    20.0 45.0 12.0 
-    20.0 65.0 12.0 
-    20.0 65.0 9.0 
-f121    1
-0.0 -1.0 0.0 
-c0
-5
-    40.0 45.0 9.0 
-    20.0 45.0 9.0 
-    20.0 45.0 12.0 
-    40.0 45.0 12.0 
-    40.0 45.0 9.0 
-f122    1
-1.0 -0.0 -0.0 
-c0
-5
-    20.0 95.0 9.0 
-    20.0 95.0 12.0 
-    20.0 75.0 12.0 
-    20.0 75.0 9.0 
-    20.0 95.0 9.0 
-f123    1
--0.0 1.0 -0.0 
-c0
-5
-    20.0 95.0 9.0 
-    0.0 95.0 9.0 
-    0.0 95.0 12.0 
-    20.0 95.0 12.0 
-    20.0 95.0 9.0 
-f124    1
-0.0 -1.0 0.0 
-c0
-5
-    20.0 75.0 9.0 
-    20.0 75.0 12.0 
-    0.0 75.0 12.0 
-    0.0 75.0 9.0 
-    20.0 75.0 9.0 
-f125    1
--1.0 0.0 0.0 
-c0
-5
-    0.0 95.0 9.0 
-    0.0 75.0 9.0 
-    0.0 75.0 12.0 
-    0.0 95.0 12.0 
-    0.0 95.0 9.0 
-f126    1
-1.0 -0.0 -0.0 
-c0
-5
-    95.0 70.0 9.0 
-    95.0 90.0 9.0 
-    95.0 90.0 12.0 
-    95.0 70.0 12.0 
-    95.0 70.0 9.0 
-f127    1
--0.0 1.0 -0.0 
-c0
-5
-    95.0 90.0 9.0 
-    75.0 90.0 9.0 
-    75.0 90.0 12.0 
-    95.0 90.0 12.0 
-    95.0 90.0 9.0 
-f128    1
-0.0 -1.0 0.0 
-c0
-5
-    95.0 70.0 9.0 
-    75.0 70.0 9.0 
-    75.0 70.0 12.0 
-    95.0 70.0 12.0 
-    95.0 70.0 9.0 
-f129    1
--1.0 0.0 0.0 
-c0
-5
-    75.0 90.0 9.0 
-    75.0 70.0 9.0 
-    75.0 70.0 12.0 
-    75.0 90.0 12.0 
-    75.0 90.0 9.0 
-f130    1
-1.0 -0.0 -0.0 
-c0
-5
-    55.0 20.0 9.0 
-    55.0 40.0 9.0 
-    55.0 40.0 12.0 
-    55.0 20.0 12.0 
-    55.0 20.0 9.0 
-f131    1
--0.0 1.0 -0.0 
-c0
-5
-    55.0 40.0 9.0 
-    55.0 40.0 12.0 
-    35.0 40.0 12.0 
-    35.0 40.0 9.0 
-    55.0 40.0 9.0 
-f132    1
-0.0 -1.0 0.0 
-c0
-5
-    35.0 20.0 12.0 
-    35.0 20.0 9.0 
-    55.0 20.0 9.0 
-    55.0 20.0 12.0 
-    35.0 20.0 12.0 
-f133    1
--1.0 0.0 0.0 
-c0
-5
-    35.0 40.0 9.0 
-    35.0 20.0 9.0 
-    35.0 20.0 12.0 
-    35.0 40.0 12.0 
-    35.0 40.0 9.0 
-f134    1
--1.0 0.0 0.0 
-c0
-5
-    65.0 5.0 9.0 
-    65.0 25.0 9.0 
-    65.0 25.0 12.0 
-    65.0 5.0 12.0 
-    65.0 5.0 9.0 
-f135    1
--0.0 1.0 -0.0 
-c0
-5
-    65.0 25.0 9.0 
-    85.0 25.0 9.0 
-    85.0 25.0 12.0 
-    65.0 25.0 12.0 
-    65.0 25.0 9.0 
-f136    1
-0.0 -1.0 0.0 
-c0
-5
-    65.0 5.0 12.0 
-    85.0 5.0 12.0 
-    85.0 5.0 9.0 
-    65.0 5.0 9.0 
-    65.0 5.0 12.0 
-f137    1
-1.0 -0.0 -0.0 
-c0
-5
-    85.0 25.0 9.0 
-    85.0 5.0 9.0 
-    85.0 5.0 12.0 
-    85.0 25.0 12.0 
-    85.0 25.0 9.0 
-f138    1
-1.0 -0.0 -0.0 
-c0
-5
-    25.0 0.0 12.0 
-    25.0 20.0 12.0 
-    25.0 20.0 9.0 
-    25.0 0.0 9.0 
-    25.0 0.0 12.0 
-f139    1
--0.0 1.0 -0.0 
-c0
-5
-    25.0 20.0 9.0 
-    5.0 20.0 9.0 
-    5.0 20.0 12.0 
-    25.0 20.0 12.0 
-    25.0 20.0 9.0 
-f140    1
-0.0 -1.0 0.0 
-c0
-5
-    25.0 0.0 9.0 
-    5.0 0.0 9.0 
-    5.0 0.0 12.0 
-    25.0 0.0 12.0 
-    25.0 0.0 9.0 
-f141    1
--1.0 0.0 0.0 
-c0
-5
-    5.0 0.0 12.0 
-    5.0 20.0 12.0 
-    5.0 20.0 9.0 
-    5.0 0.0 9.0 
-    5.0 0.0 12.0 
-f142    1
-1.0 -0.0 -0.0 
-c0
-5
-    60.0 80.0 9.0 
-    60.0 100.0 9.0 
-    60.0 100.0 12.0 
-    60.0 80.0 12.0 
-    60.0 80.0 9.0 
-f143    1
--0.0 1.0 -0.0 
-c0
-5
-    60.0 100.0 9.0 
-    40.0 100.0 9.0 
-    40.0 100.0 12.0 
-    60.0 100.0 12.0 
-    60.0 100.0 9.0 
-f144    1
--1.0 0.0 0.0 
-c0
-5
-    40.0 100.0 9.0 
-    40.0 80.0 9.0 
-    40.0 80.0 12.0 
-    40.0 100.0 12.0 
-    40.0 100.0 9.0 
-f145    1
-0.0 -1.0 0.0 
-c0
-5
-    60.0 80.0 9.0 
-    40.0 80.0 9.0 
-    40.0 80.0 12.0 
-    60.0 80.0 12.0 
-    60.0 80.0 9.0 
-f146    1
--0.0 1.0 -0.0 
-c0
-5
-    80.0 60.0 12.0 
-    100.0 60.0 12.0 
-    100.0 60.0 15.0 
-    80.0 60.0 15.0 
-    80.0 60.0 12.0 
-f147    1
-1.0 -0.0 -0.0 
-c0
-5
-    100.0 60.0 12.0 
-    100.0 40.0 12.0 
-    100.0 40.0 15.0 
-    100.0 60.0 15.0 
-    100.0 60.0 12.0 
-f148    1
--1.0 0.0 0.0 
-c0
-5
-    80.0 60.0 12.0 
-    80.0 40.0 12.0 
-    80.0 40.0 15.0 
-    80.0 60.0 15.0 
-    80.0 60.0 12.0 
-f149    1
-0.0 -1.0 0.0 
-c0
-5
-    80.0 40.0 12.0 
-    100.0 40.0 12.0 
-    100.0 40.0 15.0 
-    80.0 40.0 15.0 
-    80.0 40.0 12.0 
-f150    1
-1.0 -0.0 -0.0 
-c0
-5
-    70.0 50.0 12.0 
-    70.0 70.0 12.0 
-    70.0 70.0 15.0 
-    70.0 50.0 15.0 
-    70.0 50.0 12.0 
-f151    1
--0.0 1.0 -0.0 
-c0
-5
-    70.0 70.0 15.0 
-    70.0 70.0 12.0 
-    50.0 70.0 12.0 
-    50.0 70.0 15.0 
-    70.0 70.0 15.0 
-f152    1
-0.0 -1.0 0.0 
-c0
-5
-    70.0 50.0 12.0 
-    50.0 50.0 12.0 
-    50.0 50.0 15.0 
-    70.0 50.0 15.0 
-    70.0 50.0 12.0 
-f153    1
--1.0 0.0 0.0 
-c0
-5
-    50.0 70.0 12.0 
-    50.0 50.0 12.0 
-    50.0 50.0 15.0 
-    50.0 70.0 15.0 
-    50.0 70.0 12.0 
-f154    1
--0.0 1.0 -0.0 
-c0
-5
-    20.0 65.0 12.0 
-    40.0 65.0 12.0 
-    40.0 65.0 15.0 
-    20.0 65.0 15.0 
-    20.0 65.0 12.0 
-f155    1
-1.0 -0.0 -0.0 
-c0
-5
-    40.0 65.0 12.0 
-    40.0 45.0 12.0 
-    40.0 45.0 15.0 
-    40.0 65.0 15.0 
-    40.0 65.0 12.0 
-f156    1
--1.0 0.0 0.0 
-c0
-5
-    20.0 65.0 12.0 
-    20.0 45.0 12.0 
-    20.0 45.0 15.0 
-    20.0 65.0 15.0 
-    20.0 65.0 12.0 
-f157    1
-0.0 -1.0 0.0 
-c0
-5
-    40.0 45.0 12.0 
-    20.0 45.0 12.0 
-    20.0 45.0 15.0 
-    40.0 45.0 15.0 
-    40.0 45.0 12.0 
-f158    1
-1.0 -0.0 -0.0 
-c0
-5
-    20.0 75.0 12.0 
-    20.0 95.0 12.0 
-    20.0 95.0 15.0 
-    20.0 75.0 15.0 
-    20.0 75.0 12.0 
-f159    1
--0.0 1.0 -0.0 
-c0
-5
-    20.0 95.0 12.0 
-    20.0 95.0 15.0 
-    0.0 95.0 15.0 
-    0.0 95.0 12.0 
-    20.0 95.0 12.0 
-f160    1
-0.0 -1.0 0.0 
-c0
-5
-    20.0 75.0 12.0 
-    20.0 75.0 15.0 
-    0.0 75.0 15.0 
-    0.0 75.0 12.0 
-    20.0 75.0 12.0 
-f161    1
--1.0 0.0 0.0 
-c0
-5
-    0.0 95.0 15.0 
-    0.0 95.0 12.0 
-    0.0 75.0 12.0 
-    0.0 75.0 15.0 
-    0.0 95.0 15.0 
-f162    1
-1.0 -0.0 -0.0 
-c0
-5
-    95.0 70.0 12.0 
-    95.0 90.0 12.0 
-    95.0 90.0 15.0 
-    95.0 70.0 15.0 
-    95.0 70.0 12.0 
-f163    1
--0.0 1.0 -0.0 
-c0
-5
-    95.0 90.0 12.0 
-    75.0 90.0 12.0 
-    75.0 90.0 15.0 
-    95.0 90.0 15.0 
-    95.0 90.0 12.0 
-f164    1
-0.0 -1.0 0.0 
-c0
-5
-    95.0 70.0 12.0 
-    75.0 70.0 12.0 
-    75.0 70.0 15.0 
-    95.0 70.0 15.0 
-    95.0 70.0 12.0 
-f165    1
--1.0 0.0 0.0 
-c0
-5
-    75.0 90.0 12.0 
-    75.0 70.0 12.0 
-    75.0 70.0 15.0 
-    75.0 90.0 15.0 
-    75.0 90.0 12.0 
-f166    1
-1.0 -0.0 -0.0 
-c0
-5
-    55.0 20.0 12.0 
-    55.0 40.0 12.0 
-    55.0 40.0 15.0 
-    55.0 20.0 15.0 
-    55.0 20.0 12.0 
-f167    1
--0.0 1.0 -0.0 
-c0
-5
-    55.0 40.0 12.0 
-    35.0 40.0 12.0 
-    35.0 40.0 15.0 
-    55.0 40.0 15.0 
-    55.0 40.0 12.0 
-f168    1
-0.0 -1.0 0.0 
-c0
-5
-    55.0 20.0 12.0 
-    35.0 20.0 12.0 
-    35.0 20.0 15.0 
-    55.0 20.0 15.0 
-    55.0 20.0 12.0 
-f169    1
--1.0 0.0 0.0 
-c0
-5
-    35.0 40.0 12.0 
-    35.0 20.0 12.0 
-    35.0 20.0 15.0 
-    35.0 40.0 15.0 
-    35.0 40.0 12.0 
-f170    1
--1.0 0.0 0.0 
-c0
-5
-    65.0 5.0 12.0 
-    65.0 25.0 12.0 
-    65.0 25.0 15.0 
-    65.0 5.0 15.0 
-    65.0 5.0 12.0 
-f171    1
--0.0 1.0 -0.0 
-c0
-5
-    65.0 25.0 12.0 
-    85.0 25.0 12.0 
-    85.0 25.0 15.0 
-    65.0 25.0 15.0 
-    65.0 25.0 12.0 
-f172    1
-0.0 -1.0 0.0 
-c0
-5
-    65.0 5.0 12.0 
-    85.0 5.0 12.0 
-    85.0 5.0 15.0 
-    65.0 5.0 15.0 
-    65.0 5.0 12.0 
-f173    1
-1.0 -0.0 -0.0 
-c0
-5
-    85.0 25.0 12.0 
-    85.0 5.0 12.0 
-    85.0 5.0 15.0 
-    85.0 25.0 15.0 
-    85.0 25.0 12.0 
-f174    1
-1.0 -0.0 -0.0 
-c0
-5
-    25.0 0.0 12.0 
-    25.0 20.0 12.0 
-    25.0 20.0 15.0 
-    25.0 0.0 15.0 
-    25.0 0.0 12.0 
-f175    1
--0.0 1.0 -0.0 
-c0
-5
-    25.0 20.0 12.0 
-    25.0 20.0 15.0 
-    5.0 20.0 15.0 
-    5.0 20.0 12.0 
-    25.0 20.0 12.0 
-f176    1
-0.0 -1.0 0.0 
-c0
-5
-    25.0 0.0 12.0 
-    5.0 0.0 12.0 
-    5.0 0.0 15.0 
-    25.0 0.0 15.0 
-    25.0 0.0 12.0 
-f177    1
--1.0 0.0 0.0 
-c0
-5
-    5.0 20.0 12.0 
-    5.0 0.0 12.0 
-    5.0 0.0 15.0 
-    5.0 20.0 15.0 
-    5.0 20.0 12.0 
-f178    1
-1.0 -0.0 -0.0 
-c0
-5
-    60.0 80.0 12.0 
-    60.0 100.0 12.0 
-    60.0 100.0 15.0 
-    60.0 80.0 15.0 
-    60.0 80.0 12.0 
-f179    1
--0.0 1.0 -0.0 
-c0
-5
-    60.0 100.0 12.0 
-    40.0 100.0 12.0 
-    40.0 100.0 15.0 
-    60.0 100.0 15.0 
-    60.0 100.0 12.0 
-f180    1
--1.0 0.0 0.0 
-c0
-5
-    40.0 100.0 12.0 
-    40.0 80.0 12.0 
-    40.0 80.0 15.0 
-    40.0 100.0 15.0 
-    40.0 100.0 12.0 
-f181    1
-0.0 -1.0 0.0 
-c0
-5
-    60.0 80.0 12.0 
-    40.0 80.0 12.0 
-    40.0 80.0 15.0 
-    60.0 80.0 15.0 
-    60.0 80.0 12.0 
-f182    1
--0.0 1.0 -0.0 
-c0
-5
-    80.0 60.0 15.0 
-    100.0 60.0 15.0 
-    100.0 60.0 18.0 
-    80.0 60.0 18.0 
-    80.0 60.0 15.0 
-f183    1
-1.0 -0.0 -0.0 
-c0
-5
-    100.0 60.0 15.0 
-    100.0 40.0 15.0 
-    100.0 40.0 18.0 
-    100.0 60.0 18.0 
-    100.0 60.0 15.0 
-f184    1
--1.0 0.0 0.0 
-c0
-5
-    80.0 60.0 15.0 
-    80.0 40.0 15.0 
-    80.0 40.0 18.0 
-    80.0 60.0 18.0 
-    80.0 60.0 15.0 
-f185    1
-0.0 -1.0 0.0 
-c0
-5
-    100.0 40.0 15.0 
-    80.0 40.0 15.0 
-    80.0 40.0 18.0 
-    100.0 40.0 18.0 
-    100.0 40.0 15.0 
-f186    1
-1.0 -0.0 -0.0 
-c0
-5
-    70.0 50.0 15.0 
-    70.0 70.0 15.0 
-    70.0 70.0 18.0 
-    70.0 50.0 18.0 
-    70.0 50.0 15.0 
-f187    1
--0.0 1.0 -0.0 
-c0
-5
-    50.0 70.0 15.0 
-    70.0 70.0 15.0 
-    70.0 70.0 18.0 
-    50.0 70.0 18.0 
-    50.0 70.0 15.0 
-f188    1
-0.0 -1.0 0.0 
-c0
-5
-    70.0 50.0 15.0 
-    50.0 50.0 15.0 
-    50.0 50.0 18.0 
-    70.0 50.0 18.0 
-    70.0 50.0 15.0 
-f189    1
--1.0 0.0 0.0 
-c0
-5
-    50.0 50.0 15.0 
-    50.0 70.0 15.0 
-    50.0 70.0 18.0 
-    50.0 50.0 18.0 
-    50.0 50.0 15.0 
-f190    1
--0.0 1.0 -0.0 
-c0
-5
-    20.0 65.0 15.0 
-    40.0 65.0 15.0 
-    40.0 65.0 18.0 
-    20.0 65.0 18.0 
-    20.0 65.0 15.0 
-f191    1
-1.0 -0.0 -0.0 
-c0
-5
-    40.0 65.0 15.0 
-    40.0 45.0 15.0 
-    40.0 45.0 18.0 
-    40.0 65.0 18.0 
-    40.0 65.0 15.0 
-f192    1
--1.0 0.0 0.0 
-c0
-5
-    20.0 65.0 15.0 
-    20.0 45.0 15.0 
-    20.0 45.0 18.0 
-    20.0 65.0 18.0 
-    20.0 65.0 15.0 
-f193    1
-0.0 -1.0 0.0 
-c0
-5
-    40.0 45.0 15.0 
-    20.0 45.0 15.0 
-    20.0 45.0 18.0 
-    40.0 45.0 18.0 
-    40.0 45.0 15.0 
-f194    1
-1.0 -0.0 -0.0 
-c0
-5
-    20.0 75.0 15.0 
-    20.0 95.0 15.0 
-    20.0 95.0 18.0 
-    20.0 75.0 18.0 
-    20.0 75.0 15.0 
-f195    1
--0.0 1.0 -0.0 
-c0
-5
-    20.0 95.0 15.0 
-    0.0 95.0 15.0 
-    0.0 95.0 18.0 
-    20.0 95.0 18.0 
-    20.0 95.0 15.0 
-f196    1
-0.0 -1.0 0.0 
-c0
-5
-    20.0 75.0 15.0 
-    0.0 75.0 15.0 
-    0.0 75.0 18.0 
-    20.0 75.0 18.0 
-    20.0 75.0 15.0 
-f197    1
--1.0 0.0 0.0 
-c0
-5
-    0.0 95.0 18.0 
-    0.0 95.0 15.0 
-    0.0 75.0 15.0 
-    0.0 75.0 18.0 
-    0.0 95.0 18.0 
-f198    1
-1.0 -0.0 -0.0 
-c0
-5
-    95.0 70.0 15.0 
-    95.0 90.0 15.0 
-    95.0 90.0 18.0 
-    95.0 70.0 18.0 
-    95.0 70.0 15.0 
-f199    1
--0.0 1.0 -0.0 
-c0
-5
-    75.0 90.0 15.0 
-    95.0 90.0 15.0 
-    95.0 90.0 18.0 
-    75.0 90.0 18.0 
-    75.0 90.0 15.0 
-f200    1
-0.0 -1.0 0.0 
-c0
-5
-    95.0 70.0 15.0 
-    75.0 70.0 15.0 
-    75.0 70.0 18.0 
-    95.0 70.0 18.0 
-    95.0 70.0 15.0 
-f201    1
--1.0 0.0 0.0 
-c0
-5
-    75.0 90.0 15.0 
-    75.0 70.0 15.0 
-    75.0 70.0 18.0 
-    75.0 90.0 18.0 
-    75.0 90.0 15.0 
-f202    1
-1.0 -0.0 -0.0 
-c0
-5
-    55.0 20.0 15.0 
-    55.0 40.0 15.0 
-    55.0 40.0 18.0 
-    55.0 20.0 18.0 
-    55.0 20.0 15.0 
-f203    1
--0.0 1.0 -0.0 
-c0
-5
-    55.0 40.0 15.0 
-    35.0 40.0 15.0 
-    35.0 40.0 18.0 
-    55.0 40.0 18.0 
-    55.0 40.0 15.0 
-f204    1
-0.0 -1.0 0.0 
-c0
-5
-    55.0 20.0 15.0 
-    35.0 20.0 15.0 
-    35.0 20.0 18.0 
-    55.0 20.0 18.0 
-    55.0 20.0 15.0 
-f205    1
--1.0 0.0 0.0 
-c0
-5
-    35.0 40.0 15.0 
-    35.0 20.0 15.0 
-    35.0 20.0 18.0 
-    35.0 40.0 18.0 
-    35.0 40.0 15.0 
-f206    1
--1.0 0.0 0.0 
-c0
-5
-    65.0 5.0 15.0 
-    65.0 25.0 15.0 
-    65.0 25.0 18.0 
-    65.0 5.0 18.0 
-    65.0 5.0 15.0 
-f207    1
--0.0 1.0 -0.0 
-c0
-5
-    65.0 25.0 15.0 
-    85.0 25.0 15.0 
-    85.0 25.0 18.0 
-    65.0 25.0 18.0 
-    65.0 25.0 15.0 
-f208    1
-0.0 -1.0 0.0 
-c0
-5
-    65.0 5.0 15.0 
-    65.0 5.0 18.0 
-    85.0 5.0 18.0 
-    85.0 5.0 15.0 
-    65.0 5.0 15.0 
-f209    1
-1.0 -0.0 -0.0 
-c0
-5
-    85.0 25.0 15.0 
-    85.0 5.0 15.0 
-    85.0 5.0 18.0 
-    85.0 25.0 18.0 
-    85.0 25.0 15.0 
-f210    1
-1.0 -0.0 -0.0 
-c0
-5
-    25.0 0.0 15.0 
-    25.0 20.0 15.0 
-    25.0 20.0 18.0 
-    25.0 0.0 18.0 
-    25.0 0.0 15.0 
-f211    1
--0.0 1.0 -0.0 
-c0
-5
-    25.0 20.0 15.0 
-    5.0 20.0 15.0 
-    5.0 20.0 18.0 
-    25.0 20.0 18.0 
-    25.0 20.0 15.0 
-f212    1
-0.0 -1.0 0.0 
-c0
-5
-    5.0 0.0 15.0 
-    5.0 0.0 18.0 
-    25.0 0.0 18.0 
-    25.0 0.0 15.0 
-    5.0 0.0 15.0 
-f213    1
--1.0 0.0 0.0 
-c0
-5
-    5.0 20.0 15.0 
-    5.0 0.0 15.0 
-    5.0 0.0 18.0 
-    5.0 20.0 18.0 
-    5.0 20.0 15.0 
-f214    1
-1.0 -0.0 -0.0 
-c0
-5
-    60.0 80.0 18.0 
-    60.0 80.0 15.0 
-    60.0 100.0 15.0 
-    60.0 100.0 18.0 
-    60.0 80.0 18.0 
-f215    1
--0.0 1.0 -0.0 
-c0
-5
-    60.0 100.0 15.0 
-    40.0 100.0 15.0 
-    40.0 100.0 18.0 
-    60.0 100.0 18.0 
-    60.0 100.0 15.0 
-f216    1
--1.0 0.0 0.0 
-c0
-5
-    40.0 100.0 15.0 
-    40.0 80.0 15.0 
-    40.0 80.0 18.0 
-    40.0 100.0 18.0 
-    40.0 100.0 15.0 
-f217    1
-0.0 -1.0 0.0 
-c0
-5
-    60.0 80.0 15.0 
-    40.0 80.0 15.0 
-    40.0 80.0 18.0 
-    60.0 80.0 18.0 
-    60.0 80.0 15.0 
-f218    1
--0.0 1.0 -0.0 
-c0
-5
-    80.0 60.0 18.0 
-    100.0 60.0 18.0 
-    100.0 60.0 21.0 
-    80.0 60.0 21.0 
-    80.0 60.0 18.0 
-f219    1
-1.0 -0.0 -0.0 
-c0
-5
-    100.0 40.0 21.0 
-    100.0 40.0 18.0 
-    100.0 60.0 18.0 
-    100.0 60.0 21.0 
-    100.0 40.0 21.0 
-f220    1
--1.0 0.0 0.0 
-c0
-5
-    80.0 60.0 18.0 
-    80.0 40.0 18.0 
-    80.0 40.0 21.0 
-    80.0 60.0 21.0 
-    80.0 60.0 18.0 
-f221    1
-0.0 -1.0 0.0 
-c0
-5
-    100.0 40.0 18.0 
-    80.0 40.0 18.0 
-    80.0 40.0 21.0 
-    100.0 40.0 21.0 
-    100.0 40.0 18.0 
-f222    1
--0.0 -0.0 1.0 
-c0
-5
-    70.0 50.0 18.0 
-    70.0 70.0 18.0 
-    50.0 70.0 18.0 
-    50.0 50.0 18.0 
-    70.0 50.0 18.0 
-f223    1
--0.0 1.0 -0.0 
-c0
-5
-    20.0 65.0 18.0 
-    40.0 65.0 18.0 
-    40.0 65.0 21.0 
-    20.0 65.0 21.0 
-    20.0 65.0 18.0 
-f224    1
-1.0 -0.0 -0.0 
-c0
-5
-    40.0 65.0 18.0 
-    40.0 45.0 18.0 
-    40.0 45.0 21.0 
-    40.0 65.0 21.0 
-    40.0 65.0 18.0 
-f225    1
--1.0 0.0 0.0 
-c0
-5
-    20.0 65.0 18.0 
-    20.0 45.0 18.0 
-    20.0 45.0 21.0 
-    20.0 65.0 21.0 
-    20.0 65.0 18.0 
-f226    1
-0.0 -1.0 0.0 
-c0
-5
-    40.0 45.0 18.0 
-    20.0 45.0 18.0 
-    20.0 45.0 21.0 
-    40.0 45.0 21.0 
-    40.0 45.0 18.0 
-f227    1
-1.0 -0.0 -0.0 
-c0
-5
-    20.0 75.0 21.0 
-    20.0 95.0 21.0 
-    20.0 95.0 18.0 
-    20.0 75.0 18.0 
-    20.0 75.0 21.0 
-f228    1
--0.0 1.0 -0.0 
-c0
-5
-    20.0 95.0 18.0 
-    0.0 95.0 18.0 
-    0.0 95.0 21.0 
-    20.0 95.0 21.0 
-    20.0 95.0 18.0 
-f229    1
-0.0 -1.0 0.0 
-c0
-5
-    20.0 75.0 21.0 
-    0.0 75.0 21.0 
-    0.0 75.0 18.0 
-    20.0 75.0 18.0 
-    20.0 75.0 21.0 
-f230    1
--1.0 0.0 0.0 
-c0
-5
-    0.0 95.0 21.0 
-    0.0 95.0 18.0 
-    0.0 75.0 18.0 
-    0.0 75.0 21.0 
-    0.0 95.0 21.0 
-f231    1
-1.0 -0.0 -0.0 
-c0
-5
-    95.0 70.0 18.0 
-    95.0 90.0 18.0 
-    95.0 90.0 21.0 
-    95.0 70.0 21.0 
-    95.0 70.0 18.0 
-f232    1
--0.0 1.0 -0.0 
-c0
-5
-    95.0 90.0 18.0 
-    75.0 90.0 18.0 
-    75.0 90.0 21.0 
-    95.0 90.0 21.0 
-    95.0 90.0 18.0 
-f233    1
-0.0 -1.0 0.0 
-c0
-5
-    95.0 70.0 18.0 
-    75.0 70.0 18.0 
-    75.0 70.0 21.0 
-    95.0 70.0 21.0 
-    95.0 70.0 18.0 
-f234    1
--1.0 0.0 0.0 
-c0
-5
-    75.0 90.0 18.0 
-    75.0 70.0 18.0 
-    75.0 70.0 21.0 
-    75.0 90.0 21.0 
-    75.0 90.0 18.0 
-f235    1
-1.0 -0.0 -0.0 
-c0
-5
-    55.0 40.0 18.0 
-    55.0 40.0 21.0 
-    55.0 20.0 21.0 
-    55.0 20.0 18.0 
-    55.0 40.0 18.0 
-f236    1
--0.0 1.0 -0.0 
-c0
-5
-    55.0 40.0 18.0 
-    35.0 40.0 18.0 
-    35.0 40.0 21.0 
-    55.0 40.0 21.0 
-    55.0 40.0 18.0 
-f237    1
-0.0 -1.0 0.0 
-c0
-5
-    35.0 20.0 21.0 
-    35.0 20.0 18.0 
-    55.0 20.0 18.0 
-    55.0 20.0 21.0 
-    35.0 20.0 21.0 
-f238    1
--1.0 0.0 0.0 
-c0
-5
-    35.0 40.0 21.0 
-    35.0 20.0 21.0 
-    35.0 20.0 18.0 
-    35.0 40.0 18.0 
-    35.0 40.0 21.0 
-f239    1
--1.0 0.0 0.0 
-c0
-5
-    65.0 25.0 21.0 
-    65.0 25.0 18.0 
-    65.0 5.0 18.0 
-    65.0 5.0 21.0 
-    65.0 25.0 21.0 
-f240    1
--0.0 1.0 -0.0 
-c0
-5
-    65.0 25.0 18.0 
-    85.0 25.0 18.0 
-    85.0 25.0 21.0 
-    65.0 25.0 21.0 
-    65.0 25.0 18.0 
-f241    1
-0.0 -1.0 0.0 
-c0
-5
-    65.0 5.0 18.0 
-    85.0 5.0 18.0 
-    85.0 5.0 21.0 
-    65.0 5.0 21.0 
-    65.0 5.0 18.0 
-f242    1
-1.0 -0.0 -0.0 
-c0
-5
-    85.0 25.0 18.0 
-    85.0 5.0 18.0 
-    85.0 5.0 21.0 
-    85.0 25.0 21.0 
-    85.0 25.0 18.0 
-f243    1
--0.0 -0.0 1.0 
-c0
-5
-    25.0 0.0 18.0 
-    25.0 20.0 18.0 
-    5.0 20.0 18.0 
-    5.0 0.0 18.0 
-    25.0 0.0 18.0 
-f244    1
-1.0 -0.0 -0.0 
-c0
-5
-    60.0 80.0 18.0 
-    60.0 100.0 18.0 
-    60.0 100.0 21.0 
-    60.0 80.0 21.0 
-    60.0 80.0 18.0 
-f245    1
--0.0 1.0 -0.0 
-c0
-5
-    60.0 100.0 18.0 
-    40.0 100.0 18.0 
-    40.0 100.0 21.0 
-    60.0 100.0 21.0 
-    60.0 100.0 18.0 
-f246    1
--1.0 0.0 0.0 
-c0
-5
-    40.0 100.0 18.0 
-    40.0 80.0 18.0 
-    40.0 80.0 21.0 
-    40.0 100.0 21.0 
-    40.0 100.0 18.0 
-f247    1
-0.0 -1.0 0.0 
-c0
-5
-    60.0 80.0 18.0 
-    40.0 80.0 18.0 
-    40.0 80.0 21.0 
-    60.0 80.0 21.0 
-    60.0 80.0 18.0 
-f248    1
--0.0 1.0 -0.0 
-c0
-5
-    80.0 60.0 21.0 
-    100.0 60.0 21.0 
-    100.0 60.0 24.0 
-    80.0 60.0 24.0 
-    80.0 60.0 21.0 
-f249    1
-1.0 -0.0 -0.0 
-c0
-5
-    100.0 40.0 21.0 
-    100.0 60.0 21.0 
-    100.0 60.0 24.0 
-    100.0 40.0 24.0 
-    100.0 40.0 21.0 
-f250    1
--1.0 0.0 0.0 
-c0
-5
-    80.0 40.0 24.0 
-    80.0 40.0 21.0 
-    80.0 60.0 21.0 
-    80.0 60.0 24.0 
-    80.0 40.0 24.0 
-f251    1
-0.0 -1.0 0.0 
-c0
-5
-    100.0 40.0 21.0 
-    80.0 40.0 21.0 
-    80.0 40.0 24.0 
-    100.0 40.0 24.0 
-    100.0 40.0 21.0 
-f252    1
--0.0 1.0 -0.0 
-c0
-5
-    20.0 65.0 21.0 
-    40.0 65.0 21.0 
-    40.0 65.0 24.0 
-    20.0 65.0 24.0 
-    20.0 65.0 21.0 
-f253    1
-1.0 -0.0 -0.0 
-c0
-5
-    40.0 65.0 21.0 
-    40.0 45.0 21.0 
-    40.0 45.0 24.0 
-    40.0 65.0 24.0 
-    40.0 65.0 21.0 
-f254    1
--1.0 0.0 0.0 
-c0
-5
-    20.0 45.0 21.0 
-    20.0 65.0 21.0 
-    20.0 65.0 24.0 
-    20.0 45.0 24.0 
-    20.0 45.0 21.0 
-f255    1
-0.0 -1.0 0.0 
-c0
-5
-    40.0 45.0 24.0 
-    20.0 45.0 24.0 
-    20.0 45.0 21.0 
-    40.0 45.0 21.0 
-    40.0 45.0 24.0 
-f256    1
-1.0 -0.0 -0.0 
-c0
-5
-    20.0 75.0 24.0 
-    20.0 95.0 24.0 
-    20.0 95.0 21.0 
-    20.0 75.0 21.0 
-    20.0 75.0 24.0 
-f257    1
--0.0 1.0 -0.0 
-c0
-5
-    20.0 95.0 21.0 
-    0.0 95.0 21.0 
-    0.0 95.0 24.0 
-    20.0 95.0 24.0 
-    20.0 95.0 21.0 
-f258    1
-0.0 -1.0 0.0 
-c0
-5
-    20.0 75.0 21.0 
-    0.0 75.0 21.0 
-    0.0 75.0 24.0 
-    20.0 75.0 24.0 
-    20.0 75.0 21.0 
-f259    1
--1.0 0.0 0.0 
-c0
-5
-    0.0 95.0 21.0 
-    0.0 75.0 21.0 
-    0.0 75.0 24.0 
-    0.0 95.0 24.0 
-    0.0 95.0 21.0 
-f260    1
-1.0 -0.0 -0.0 
-c0
-5
-    95.0 70.0 21.0 
-    95.0 90.0 21.0 
-    95.0 90.0 24.0 
-    95.0 70.0 24.0 
-    95.0 70.0 21.0 
-f261    1
--0.0 1.0 -0.0 
-c0
-5
-    95.0 90.0 21.0 
-    75.0 90.0 21.0 
-    75.0 90.0 24.0 
-    95.0 90.0 24.0 
-    95.0 90.0 21.0 
-f262    1
-0.0 -1.0 0.0 
-c0
-5
-    95.0 70.0 21.0 
-    75.0 70.0 21.0 
-    75.0 70.0 24.0 
-    95.0 70.0 24.0 
-    95.0 70.0 21.0 
-f263    1
--1.0 0.0 0.0 
-c0
-5
-    75.0 90.0 21.0 
-    75.0 70.0 21.0 
-    75.0 70.0 24.0 
-    75.0 90.0 24.0 
-    75.0 90.0 21.0 
-f264    1
-1.0 -0.0 -0.0 
-c0
-5
-    55.0 20.0 21.0 
-    55.0 40.0 21.0 
-    55.0 40.0 24.0 
-    55.0 20.0 24.0 
-    55.0 20.0 21.0 
-f265    1
--0.0 1.0 -0.0 
-c0
-5
-    55.0 40.0 21.0 
-    35.0 40.0 21.0 
-    35.0 40.0 24.0 
-    55.0 40.0 24.0 
-    55.0 40.0 21.0 
-f266    1
-0.0 -1.0 0.0 
-c0
-5
-    55.0 20.0 21.0 
-    35.0 20.0 21.0 
-    35.0 20.0 24.0 
-    55.0 20.0 24.0 
-    55.0 20.0 21.0 
-f267    1
--1.0 0.0 0.0 
-c0
-5
-    35.0 40.0 21.0 
-    35.0 20.0 21.0 
-    35.0 20.0 24.0 
-    35.0 40.0 24.0 
-    35.0 40.0 21.0 
-f268    1
--1.0 0.0 0.0 
-c0
-5
-    65.0 5.0 21.0 
-    65.0 25.0 21.0 
-    65.0 25.0 24.0 
-    65.0 5.0 24.0 
-    65.0 5.0 21.0 
-f269    1
--0.0 1.0 -0.0 
-c0
-5
-    65.0 25.0 21.0 
-    85.0 25.0 21.0 
-    85.0 25.0 24.0 
-    65.0 25.0 24.0 
-    65.0 25.0 21.0 
-f270    1
-0.0 -1.0 0.0 
-c0
-5
-    65.0 5.0 21.0 
-    85.0 5.0 21.0 
-    85.0 5.0 24.0 
-    65.0 5.0 24.0 
-    65.0 5.0 21.0 
-f271    1
--0.0 -0.0 1.0 
-c0
-5
-    20.0 65.0 30.0 
-    40.0 65.0 30.0 
-    40.0 45.0 30.0 
-    20.0 45.0 30.0 
-    20.0 65.0 30.0 
-f272    1
-1.0 -0.0 -0.0 
-c0
-5
-    20.0 75.0 33.0 
-    20.0 95.0 33.0 
-    20.0 95.0 30.0 
-    20.0 75.0 30.0 
-    20.0 75.0 33.0 
-f273    1
--0.0 1.0 -0.0 
-c0
-5
-    20.0 95.0 30.0 
-    0.0 95.0 30.0 
-    0.0 95.0 33.0 
-    20.0 95.0 33.0 
-    20.0 95.0 30.0 
-f274    1
-0.0 -1.0 0.0 
-c0
-5
-    20.0 75.0 30.0 
-    0.0 75.0 30.0 
-    0.0 75.0 33.0 
-    20.0 75.0 33.0 
-    20.0 75.0 30.0 
-f275    1
--1.0 0.0 0.0 
-c0
-5
-    0.0 95.0 30.0 
-    0.0 75.0 30.0 
-    0.0 75.0 33.0 
-    0.0 95.0 33.0 
-    0.0 95.0 30.0 
-f276    1
--0.0 -0.0 1.0 
-c0
-5
-    95.0 70.0 30.0 
-    95.0 90.0 30.0 
-    75.0 90.0 30.0 
-    75.0 70.0 30.0 
-    95.0 70.0 30.0 
-f277    1
--0.0 -0.0 1.0 
-c0
-5
-    65.0 5.0 30.0 
-    65.0 25.0 30.0 
-    85.0 25.0 30.0 
-    85.0 5.0 30.0 
-    65.0 5.0 30.0 
-f278    1
-1.0 -0.0 -0.0 
-c0
-5
-    60.0 100.0 30.0 
-    60.0 80.0 30.0 
-    60.0 80.0 33.0 
-    60.0 100.0 33.0 
-    60.0 100.0 30.0 
-f279    1
--0.0 1.0 -0.0 
-c0
-5
-    60.0 100.0 30.0 
-    40.0 100.0 30.0 
-    40.0 100.0 33.0 
-    60.0 100.0 33.0 
-    60.0 100.0 30.0 
-f280    1
--1.0 0.0 0.0 
-c0
-5
-    40.0 100.0 30.0 
-    40.0 80.0 30.0 
-    40.0 80.0 33.0 
-    40.0 100.0 33.0 
-    40.0 100.0 30.0 
-f281    1
-0.0 -1.0 0.0 
-c0
-5
-    60.0 80.0 30.0 
-    40.0 80.0 30.0 
-    40.0 80.0 33.0 
-    60.0 80.0 33.0 
-    60.0 80.0 30.0 
-f282    1
--0.0 1.0 -0.0 
-c0
-5
-    100.0 60.0 33.0 
-    100.0 60.0 36.0 
-    80.0 60.0 36.0 
-    80.0 60.0 33.0 
-    100.0 60.0 33.0 
-f283    1
-1.0 -0.0 -0.0 
-c0
-5
-    100.0 60.0 33.0 
-    100.0 40.0 33.0 
-    100.0 40.0 36.0 
-    100.0 60.0 36.0 
-    100.0 60.0 33.0 
-f284    1
--1.0 0.0 0.0 
-c0
-5
-    80.0 60.0 33.0 
-    80.0 40.0 33.0 
-    80.0 40.0 36.0 
-    80.0 60.0 36.0 
-    80.0 60.0 33.0 
-f285    1
-0.0 -1.0 0.0 
-c0
-5
-    100.0 40.0 33.0 
-    80.0 40.0 33.0 
-    80.0 40.0 36.0 
-    100.0 40.0 36.0 
-    100.0 40.0 33.0 
-f286    1
-1.0 -0.0 -0.0 
-c0
-5
-    20.0 75.0 33.0 
-    20.0 95.0 33.0 
-    20.0 95.0 36.0 
-    20.0 75.0 36.0 
-    20.0 75.0 33.0 
-f287    1
--0.0 1.0 -0.0 
-c0
-5
-    20.0 95.0 33.0 
-    0.0 95.0 33.0 
-    0.0 95.0 36.0 
-    20.0 95.0 36.0 
-    20.0 95.0 33.0 
-f288    1
-0.0 -1.0 0.0 
-c0
-5
-    20.0 75.0 33.0 
-    0.0 75.0 33.0 
-    0.0 75.0 36.0 
-    20.0 75.0 36.0 
-    20.0 75.0 33.0 
-f289    1
--1.0 0.0 0.0 
-c0
-5
-    0.0 95.0 33.0 
-    0.0 75.0 33.0 
-    0.0 75.0 36.0 
-    0.0 95.0 36.0 
-    0.0 95.0 33.0 
-f290    1
-1.0 -0.0 -0.0 
-c0
-5
-    60.0 80.0 33.0 
-    60.0 100.0 33.0 
-    60.0 100.0 36.0 
-    60.0 80.0 36.0 
-    60.0 80.0 33.0 
-f291    1
--0.0 1.0 -0.0 
-c0
-5
-    60.0 100.0 33.0 
-    40.0 100.0 33.0 
-    40.0 100.0 36.0 
-    60.0 100.0 36.0 
-    60.0 100.0 33.0 
-f292    1
--1.0 0.0 0.0 
-c0
-5
-    40.0 80.0 36.0 
-    40.0 80.0 33.0 
-    40.0 100.0 33.0 
-    40.0 100.0 36.0 
-    40.0 80.0 36.0 
-f293    1
-0.0 -1.0 0.0 
-c0
-5
-    60.0 80.0 33.0 
-    40.0 80.0 33.0 
-    40.0 80.0 36.0 
-    60.0 80.0 36.0 
-    60.0 80.0 33.0 
-f294    1
--0.0 1.0 -0.0 
-c0
-5
-    80.0 60.0 36.0 
-    100.0 60.0 36.0 
-    100.0 60.0 39.0 
-    80.0 60.0 39.0 
-    80.0 60.0 36.0 
-f295    1
-1.0 -0.0 -0.0 
-c0
-5
-    100.0 60.0 36.0 
-    100.0 40.0 36.0 
-    100.0 40.0 39.0 
-    100.0 60.0 39.0 
-    100.0 60.0 36.0 
-f296    1
--1.0 0.0 0.0 
-c0
-5
-    80.0 60.0 36.0 
-    80.0 40.0 36.0 
-    80.0 40.0 39.0 
-    80.0 60.0 39.0 
-    80.0 60.0 36.0 
-f297    1
-0.0 -1.0 0.0 
-c0
-5
-    100.0 40.0 36.0 
-    80.0 40.0 36.0 
-    80.0 40.0 39.0 
-    100.0 40.0 39.0 
-    100.0 40.0 36.0 
-f298    1
-1.0 -0.0 -0.0 
-c0
-5
-    20.0 75.0 36.0 
-    20.0 95.0 36.0 
-    20.0 95.0 39.0 
-    20.0 75.0 39.0 
-    20.0 75.0 36.0 
-f299    1
--0.0 1.0 -0.0 
-c0
-5
-    20.0 95.0 36.0 
-    0.0 95.0 36.0 
-    0.0 95.0 39.0 
-    20.0 95.0 39.0 
-    20.0 95.0 36.0 
-f300    1
-0.0 -1.0 0.0 
-c0
-5
-    20.0 75.0 36.0 
-    0.0 75.0 36.0 
-    0.0 75.0 39.0 
-    20.0 75.0 39.0 
-    20.0 75.0 36.0 
-f301    1
--1.0 0.0 0.0 
-c0
-5
-    0.0 95.0 36.0 
-    0.0 95.0 39.0 
-    0.0 75.0 39.0 
-    0.0 75.0 36.0 
-    0.0 95.0 36.0 
-f302    1
--0.0 -0.0 1.0 
-c0
-5
-    60.0 80.0 36.0 
-    60.0 100.0 36.0 
-    40.0 100.0 36.0 
-    40.0 80.0 36.0 
-    60.0 80.0 36.0 
-f303    1
--0.0 1.0 -0.0 
-c0
-5
-    80.0 60.0 39.0 
-    100.0 60.0 39.0 
-    100.0 60.0 42.0 
-    80.0 60.0 42.0 
-    80.0 60.0 39.0 
-f304    1
-1.0 -0.0 -0.0 
-c0
-5
-    100.0 60.0 39.0 
-    100.0 40.0 39.0 
-    100.0 40.0 42.0 
-    100.0 60.0 42.0 
-    100.0 60.0 39.0 
-f305    1
--1.0 0.0 0.0 
-c0
-5
-    80.0 60.0 42.0 
-    80.0 40.0 42.0 
-    80.0 40.0 39.0 
-    80.0 60.0 39.0 
-    80.0 60.0 42.0 
-f306    1
-0.0 -1.0 0.0 
-c0
-5
-    100.0 40.0 39.0 
-    80.0 40.0 39.0 
-    80.0 40.0 42.0 
-    100.0 40.0 42.0 
-    100.0 40.0 39.0 
-f307    1
-1.0 -0.0 -0.0 
-c0
-5
-    20.0 75.0 39.0 
-    20.0 95.0 39.0 
-    20.0 95.0 42.0 
-    20.0 75.0 42.0 
-    20.0 75.0 39.0 
-f308    1
--0.0 1.0 -0.0 
-c0
-5
-    20.0 95.0 39.0 
-    0.0 95.0 39.0 
-    0.0 95.0 42.0 
-    20.0 95.0 42.0 
-    20.0 95.0 39.0 
-f309    1
-0.0 -1.0 0.0 
-c0
-5
-    20.0 75.0 39.0 
-    0.0 75.0 39.0 
-    0.0 75.0 42.0 
-    20.0 75.0 42.0 
-    20.0 75.0 39.0 
-f310    1
--1.0 0.0 0.0 
-c0
-5
-    0.0 95.0 39.0 
-    0.0 75.0 39.0 
-    0.0 75.0 42.0 
-    0.0 95.0 42.0 
-    0.0 95.0 39.0 
-f311    1
--0.0 -0.0 1.0 
-c0
-5
-    100.0 60.0 42.0 
-    100.0 40.0 42.0 
-    80.0 40.0 42.0 
-    80.0 60.0 42.0 
-    100.0 60.0 42.0 
-f312    1
--0.0 -0.0 1.0 
-c0
-5
-    20.0 75.0 42.0 
-    20.0 95.0 42.0 
-    0.0 95.0 42.0 
-    0.0 75.0 42.0 
-    20.0 75.0 42.0 
-f313    1
-1.0 -0.0 -0.0 
-c0
-5
-    85.0 25.0 21.0 
-    85.0 5.0 21.0 
-    85.0 5.0 24.0 
-    85.0 25.0 24.0 
-    85.0 25.0 21.0 
-f314    1
-1.0 -0.0 -0.0 
-c0
-5
-    60.0 80.0 21.0 
-    60.0 100.0 21.0 
-    60.0 100.0 24.0 
-    60.0 80.0 24.0 
-    60.0 80.0 21.0 
-f315    1
--0.0 1.0 -0.0 
-c0
-5
-    60.0 100.0 21.0 
-    40.0 100.0 21.0 
-    40.0 100.0 24.0 
-    60.0 100.0 24.0 
-    60.0 100.0 21.0 
-f316    1
--1.0 0.0 0.0 
-c0
-5
-    40.0 100.0 21.0 
-    40.0 80.0 21.0 
-    40.0 80.0 24.0 
-    40.0 100.0 24.0 
-    40.0 100.0 21.0 
-f317    1
-0.0 -1.0 0.0 
-c0
-5
-    60.0 80.0 21.0 
-    40.0 80.0 21.0 
-    40.0 80.0 24.0 
-    60.0 80.0 24.0 
-    60.0 80.0 21.0 
-f318    1
--0.0 1.0 -0.0 
-c0
-5
-    80.0 60.0 24.0 
-    100.0 60.0 24.0 
-    100.0 60.0 27.0 
-    80.0 60.0 27.0 
-    80.0 60.0 24.0 
-f319    1
-1.0 -0.0 -0.0 
-c0
-5
-    100.0 40.0 24.0 
-    100.0 60.0 24.0 
-    100.0 60.0 27.0 
-    100.0 40.0 27.0 
-    100.0 40.0 24.0 
-f320    1
--1.0 0.0 0.0 
-c0
-5
-    80.0 60.0 24.0 
-    80.0 40.0 24.0 
-    80.0 40.0 27.0 
-    80.0 60.0 27.0 
-    80.0 60.0 24.0 
-f321    1
-0.0 -1.0 0.0 
-c0
-5
-    100.0 40.0 24.0 
-    80.0 40.0 24.0 
-    80.0 40.0 27.0 
-    100.0 40.0 27.0 
-    100.0 40.0 24.0 
-f322    1
--0.0 1.0 -0.0 
-c0
-5
-    20.0 65.0 24.0 
-    40.0 65.0 24.0 
-    40.0 65.0 27.0 
-    20.0 65.0 27.0 
-    20.0 65.0 24.0 
-f323    1
-1.0 -0.0 -0.0 
-c0
-5
-    40.0 65.0 24.0 
-    40.0 45.0 24.0 
-    40.0 45.0 27.0 
-    40.0 65.0 27.0 
-    40.0 65.0 24.0 
-f324    1
--1.0 0.0 0.0 
-c0
-5
-    20.0 65.0 24.0 
-    20.0 45.0 24.0 
-    20.0 45.0 27.0 
-    20.0 65.0 27.0 
-    20.0 65.0 24.0 
-f325    1
-0.0 -1.0 0.0 
-c0
-5
-    40.0 45.0 24.0 
-    20.0 45.0 24.0 
-    20.0 45.0 27.0 
-    40.0 45.0 27.0 
-    40.0 45.0 24.0 
-f326    1
-1.0 -0.0 -0.0 
-c0
-5
-    20.0 75.0 24.0 
-    20.0 95.0 24.0 
-    20.0 95.0 27.0 
-    20.0 75.0 27.0 
-    20.0 75.0 24.0 
-f327    1
--0.0 1.0 -0.0 
-c0
-5
-    20.0 95.0 24.0 
-    0.0 95.0 24.0 
-    0.0 95.0 27.0 
-    20.0 95.0 27.0 
-    20.0 95.0 24.0 
-f328    1
-0.0 -1.0 0.0 
-c0
-5
-    20.0 75.0 24.0 
-    0.0 75.0 24.0 
-    0.0 75.0 27.0 
-    20.0 75.0 27.0 
-    20.0 75.0 24.0 
-f329    1
--1.0 0.0 0.0 
-c0
-5
-    0.0 95.0 24.0 
-    0.0 75.0 24.0 
-    0.0 75.0 27.0 
-    0.0 95.0 27.0 
-    0.0 95.0 24.0 
-f330    1
-1.0 -0.0 -0.0 
-c0
-5
-    95.0 70.0 24.0 
-    95.0 90.0 24.0 
-    95.0 90.0 27.0 
-    95.0 70.0 27.0 
-    95.0 70.0 24.0 
-f331    1
--0.0 1.0 -0.0 
-c0
-5
-    95.0 90.0 24.0 
-    75.0 90.0 24.0 
-    75.0 90.0 27.0 
-    95.0 90.0 27.0 
-    95.0 90.0 24.0 
-f332    1
-0.0 -1.0 0.0 
-c0
-5
-    95.0 70.0 24.0 
-    75.0 70.0 24.0 
-    75.0 70.0 27.0 
-    95.0 70.0 27.0 
-    95.0 70.0 24.0 
-f333    1
--1.0 0.0 0.0 
-c0
-5
-    75.0 90.0 24.0 
-    75.0 70.0 24.0 
-    75.0 70.0 27.0 
-    75.0 90.0 27.0 
-    75.0 90.0 24.0 
-f334    1
--0.0 -0.0 1.0 
-c0
-5
-    35.0 40.0 24.0 
-    35.0 20.0 24.0 
-    55.0 20.0 24.0 
-    55.0 40.0 24.0 
-    35.0 40.0 24.0 
-f335    1
--1.0 0.0 0.0 
-c0
-5
-    65.0 5.0 24.0 
-    65.0 25.0 24.0 
-    65.0 25.0 27.0 
-    65.0 5.0 27.0 
-    65.0 5.0 24.0 
-f336    1
--0.0 1.0 -0.0 
-c0
-5
-    65.0 25.0 24.0 
-    85.0 25.0 24.0 
-    85.0 25.0 27.0 
-    65.0 25.0 27.0 
-    65.0 25.0 24.0 
-f337    1
-0.0 -1.0 0.0 
-c0
-5
-    65.0 5.0 24.0 
-    85.0 5.0 24.0 
-    85.0 5.0 27.0 
-    65.0 5.0 27.0 
-    65.0 5.0 24.0 
-f338    1
-1.0 -0.0 -0.0 
-c0
-5
-    85.0 25.0 24.0 
-    85.0 5.0 24.0 
-    85.0 5.0 27.0 
-    85.0 25.0 27.0 
-    85.0 25.0 24.0 
-f339    1
-1.0 -0.0 -0.0 
-c0
-5
-    60.0 80.0 27.0 
-    60.0 100.0 27.0 
-    60.0 100.0 24.0 
-    60.0 80.0 24.0 
-    60.0 80.0 27.0 
-f340    1
--0.0 1.0 -0.0 
-c0
-5
-    60.0 100.0 24.0 
-    40.0 100.0 24.0 
-    40.0 100.0 27.0 
-    60.0 100.0 27.0 
-    60.0 100.0 24.0 
-f341    1
--1.0 0.0 0.0 
-c0
-5
-    40.0 100.0 24.0 
-    40.0 80.0 24.0 
-    40.0 80.0 27.0 
-    40.0 100.0 27.0 
-    40.0 100.0 24.0 
-f342    1
-0.0 -1.0 0.0 
-c0
-5
-    60.0 80.0 24.0 
-    40.0 80.0 24.0 
-    40.0 80.0 27.0 
-    60.0 80.0 27.0 
-    60.0 80.0 24.0 
-f343    1
--0.0 1.0 -0.0 
-c0
-5
-    80.0 60.0 27.0 
-    100.0 60.0 27.0 
-    100.0 60.0 30.0 
-    80.0 60.0 30.0 
-    80.0 60.0 27.0 
-f344    1
-1.0 -0.0 -0.0 
-c0
-5
-    100.0 60.0 27.0 
-    100.0 40.0 27.0 
-    100.0 40.0 30.0 
-    100.0 60.0 30.0 
-    100.0 60.0 27.0 
-f345    1
--1.0 0.0 0.0 
-c0
-5
-    80.0 60.0 27.0 
-    80.0 40.0 27.0 
-    80.0 40.0 30.0 
-    80.0 60.0 30.0 
-    80.0 60.0 27.0 
-f346    1
-0.0 -1.0 0.0 
-c0
-5
-    100.0 40.0 27.0 
-    80.0 40.0 27.0 
-    80.0 40.0 30.0 
-    100.0 40.0 30.0 
-    100.0 40.0 27.0 
-f347    1
--0.0 1.0 -0.0 
-c0
-5
-    20.0 65.0 27.0 
-    40.0 65.0 27.0 
-    40.0 65.0 30.0 
-    20.0 65.0 30.0 
-    20.0 65.0 27.0 
-f348    1
-1.0 -0.0 -0.0 
-c0
-5
-    40.0 65.0 30.0 
-    40.0 45.0 30.0 
-    40.0 45.0 27.0 
-    40.0 65.0 27.0 
-    40.0 65.0 30.0 
-f349    1
--1.0 0.0 0.0 
-c0
-5
-    20.0 65.0 30.0 
-    20.0 45.0 30.0 
-    20.0 45.0 27.0 
-    20.0 65.0 27.0 
-    20.0 65.0 30.0 
-f350    1
-0.0 -1.0 0.0 
-c0
-5
-    20.0 45.0 30.0 
-    20.0 45.0 27.0 
-    40.0 45.0 27.0 
-    40.0 45.0 30.0 
-    20.0 45.0 30.0 
-f351    1
-1.0 -0.0 -0.0 
-c0
-5
-    20.0 75.0 27.0 
-    20.0 95.0 27.0 
-    20.0 95.0 30.0 
-    20.0 75.0 30.0 
-    20.0 75.0 27.0 
-f352    1
--0.0 1.0 -0.0 
-c0
-5
-    20.0 95.0 27.0 
-    0.0 95.0 27.0 
-    0.0 95.0 30.0 
-    20.0 95.0 30.0 
-    20.0 95.0 27.0 
-f353    1
-0.0 -1.0 0.0 
-c0
-5
-    20.0 75.0 27.0 
-    0.0 75.0 27.0 
-    0.0 75.0 30.0 
-    20.0 75.0 30.0 
-    20.0 75.0 27.0 
-f354    1
--1.0 0.0 0.0 
-c0
-5
-    0.0 95.0 27.0 
-    0.0 75.0 27.0 
-    0.0 75.0 30.0 
-    0.0 95.0 30.0 
-    0.0 95.0 27.0 
-f355    1
-1.0 -0.0 -0.0 
-c0
-5
-    95.0 70.0 27.0 
-    95.0 90.0 27.0 
-    95.0 90.0 30.0 
-    95.0 70.0 30.0 
-    95.0 70.0 27.0 
-f356    1
--0.0 1.0 -0.0 
-c0
-5
-    95.0 90.0 27.0 
-    75.0 90.0 27.0 
-    75.0 90.0 30.0 
-    95.0 90.0 30.0 
-    95.0 90.0 27.0 
-f357    1
-0.0 -1.0 0.0 
-c0
-5
-    95.0 70.0 27.0 
-    75.0 70.0 27.0 
-    75.0 70.0 30.0 
-    95.0 70.0 30.0 
-    95.0 70.0 27.0 
-f358    1
--1.0 0.0 0.0 
-c0
-5
-    75.0 90.0 30.0 
-    75.0 70.0 30.0 
-    75.0 70.0 27.0 
-    75.0 90.0 27.0 
-    75.0 90.0 30.0 
-f359    1
--1.0 0.0 0.0 
-c0
-5
-    65.0 5.0 27.0 
-    65.0 25.0 27.0 
-    65.0 25.0 30.0 
-    65.0 5.0 30.0 
-    65.0 5.0 27.0 
-f360    1
--0.0 1.0 -0.0 
-c0
-5
-    65.0 25.0 27.0 
-    85.0 25.0 27.0 
-    85.0 25.0 30.0 
-    65.0 25.0 30.0 
-    65.0 25.0 27.0 
-f361    1
-0.0 -1.0 0.0 
-c0
-5
-    65.0 5.0 27.0 
-    85.0 5.0 27.0 
-    85.0 5.0 30.0 
-    65.0 5.0 30.0 
-    65.0 5.0 27.0 
-f362    1
-1.0 -0.0 -0.0 
-c0
-5
-    85.0 25.0 27.0 
-    85.0 5.0 27.0 
-    85.0 5.0 30.0 
-    85.0 25.0 30.0 
-    85.0 25.0 27.0 
-f363    1
--0.0 1.0 -0.0 
-c0
-5
-    60.0 100.0 27.0 
-    40.0 100.0 27.0 
-    40.0 100.0 30.0 
-    60.0 100.0 30.0 
-    60.0 100.0 27.0 
-f364    1
--1.0 0.0 0.0 
-c0
-5
-    40.0 100.0 27.0 
-    40.0 80.0 27.0 
-    40.0 80.0 30.0 
-    40.0 100.0 30.0 
-    40.0 100.0 27.0 
-f365    1
-0.0 -1.0 0.0 
-c0
-5
-    60.0 80.0 27.0 
-    40.0 80.0 27.0 
-    40.0 80.0 30.0 
-    60.0 80.0 30.0 
-    60.0 80.0 27.0 
-f366    1
--0.0 1.0 -0.0 
-c0
-5
-    100.0 60.0 30.0 
-    100.0 60.0 33.0 
-    80.0 60.0 33.0 
-    80.0 60.0 30.0 
-    100.0 60.0 30.0 
-f367    1
-1.0 -0.0 -0.0 
-c0
-5
-    100.0 60.0 30.0 
-    100.0 40.0 30.0 
-    100.0 40.0 33.0 
-    100.0 60.0 33.0 
-    100.0 60.0 30.0 
-f368    1
--1.0 0.0 0.0 
-c0
-5
-    80.0 60.0 30.0 
-    80.0 40.0 30.0 
-    80.0 40.0 33.0 
-    80.0 60.0 33.0 
-    80.0 60.0 30.0 
-f369    1
-0.0 -1.0 0.0 
-c0
-5
-    100.0 40.0 30.0 
-    80.0 40.0 30.0 
-    80.0 40.0 33.0 
-    100.0 40.0 33.0 
-    100.0 40.0 30.0 
-f370    1
-1.0 -0.0 -0.0 
-c0
-5
-    60.0 80.0 27.0 
-    60.0 100.0 27.0 
-    60.0 100.0 30.0 
-    60.0 80.0 30.0 
-    60.0 80.0 27.0 
-""")
+        sio = AbstractGeoDataFrameDemos._dataset(
+            "GeoDataFrameDemos5", "cirSceneMasque1.cir"
+        )
         return CirReader(sio).run()
 
     @staticmethod
@@ -3387,3406 +52,9 @@ c0
 
         PUIS TRAITEMENT DES ORIENTATIONS DES FACES SOUS SketchUp
         '''
-        sio = StringIO("""370    370
-    99999    99999
-    99999    99999
-    99999    99999
-    99999    99999
-    99999    99999
-f1 1
-    -0.0    1.0    -0.0
-c0
-5
-    130.0    90.0    0.0
-    110.0    90.0    0.0
-    110.0    90.0    3.0
-    130.0    90.0    3.0
-    130.0    90.0    0.0
-f2 1
-    1.0    -0.0    -0.0
-c0
-5
-    130.0    70.0    0.0
-    130.0    90.0    0.0
-    130.0    90.0    3.0
-    130.0    70.0    3.0
-    130.0    70.0    0.0
-f3 1
-    -1.0    0.0    0.0
-c0
-5
-    110.0    90.0    0.0
-    110.0    70.0    0.0
-    110.0    70.0    3.0
-    110.0    90.0    3.0
-    110.0    90.0    0.0
-f4 1
-    0.0    -1.0    0.0
-c0
-5
-    110.0    70.0    3.0
-    110.0    70.0    0.0
-    130.0    70.0    0.0
-    130.0    70.0    3.0
-    110.0    70.0    3.0
-f5 1
-    1.0    -0.0    -0.0
-c0
-5
-    100.0    80.0    0.0
-    100.0    100.0    0.0
-    100.0    100.0    3.0
-    100.0    80.0    3.0
-    100.0    80.0    0.0
-f6 1
-    -0.0    1.0    -0.0
-c0
-5
-    100.0    100.0    0.0
-    80.0    100.0    0.0
-    80.0    100.0    3.0
-    100.0    100.0    3.0
-    100.0    100.0    0.0
-f7 1
-    0.0    -1.0    0.0
-c0
-5
-    80.0    80.0    0.0
-    100.0    80.0    0.0
-    100.0    80.0    3.0
-    80.0    80.0    3.0
-    80.0    80.0    0.0
-f8 1
-    -1.0    0.0    0.0
-c0
-5
-    80.0    100.0    3.0
-    80.0    100.0    0.0
-    80.0    80.0    0.0
-    80.0    80.0    3.0
-    80.0    100.0    3.0
-f9 1
-    -0.0    1.0    -0.0
-c0
-5
-    70.0    95.0    0.0
-    50.0    95.0    0.0
-    50.0    95.0    3.0
-    70.0    95.0    3.0
-    70.0    95.0    0.0
-f10 1
-    1.0    -0.0    -0.0
-c0
-5
-    70.0    75.0    0.0
-    70.0    95.0    0.0
-    70.0    95.0    3.0
-    70.0    75.0    3.0
-    70.0    75.0    0.0
-f11 1
-    -1.0    0.0    0.0
-c0
-5
-    50.0    95.0    0.0
-    50.0    75.0    0.0
-    50.0    75.0    3.0
-    50.0    95.0    3.0
-    50.0    95.0    0.0
-f12 1
-    0.0    -1.0    0.0
-c0
-5
-    50.0    75.0    0.0
-    70.0    75.0    0.0
-    70.0    75.0    3.0
-    50.0    75.0    3.0
-    50.0    75.0    0.0
-f13 1
-    1.0    -0.0    -0.0
-c0
-5
-    50.0    105.0    0.0
-    50.0    125.0    0.0
-    50.0    125.0    3.0
-    50.0    105.0    3.0
-    50.0    105.0    0.0
-f14 1
-    -0.0    1.0    -0.0
-c0
-5
-    50.0    125.0    0.0
-    30.0    125.0    0.0
-    30.0    125.0    3.0
-    50.0    125.0    3.0
-    50.0    125.0    0.0
-f15 1
-    0.0    -1.0    0.0
-c0
-5
-    30.0    105.0    0.0
-    50.0    105.0    0.0
-    50.0    105.0    3.0
-    30.0    105.0    3.0
-    30.0    105.0    0.0
-f16 1
-    -1.0    0.0    0.0
-c0
-5
-    30.0    125.0    0.0
-    30.0    105.0    0.0
-    30.0    105.0    3.0
-    30.0    125.0    3.0
-    30.0    125.0    0.0
-f17 1
-    1.0    -0.0    -0.0
-c0
-5
-    125.0    100.0    3.0
-    125.0    100.0    0.0
-    125.0    120.0    0.0
-    125.0    120.0    3.0
-    125.0    100.0    3.0
-f18 1
-    -0.0    1.0    -0.0
-c0
-5
-    125.0    120.0    0.0
-    105.0    120.0    0.0
-    105.0    120.0    3.0
-    125.0    120.0    3.0
-    125.0    120.0    0.0
-f19 1
-    0.0    -1.0    0.0
-c0
-5
-    105.0    100.0    0.0
-    125.0    100.0    0.0
-    125.0    100.0    3.0
-    105.0    100.0    3.0
-    105.0    100.0    0.0
-f20 1
-    -1.0    0.0    0.0
-c0
-5
-    105.0    100.0    0.0
-    105.0    100.0    3.0
-    105.0    120.0    3.0
-    105.0    120.0    0.0
-    105.0    100.0    0.0
-f21 1
-    1.0    -0.0    -0.0
-c0
-5
-    85.0    50.0    0.0
-    85.0    70.0    0.0
-    85.0    70.0    3.0
-    85.0    50.0    3.0
-    85.0    50.0    0.0
-f22 1
-    -0.0    1.0    -0.0
-c0
-5
-    85.0    70.0    0.0
-    65.0    70.0    0.0
-    65.0    70.0    3.0
-    85.0    70.0    3.0
-    85.0    70.0    0.0
-f23 1
-    0.0    -1.0    0.0
-c0
-5
-    65.0    50.0    0.0
-    85.0    50.0    0.0
-    85.0    50.0    3.0
-    65.0    50.0    3.0
-    65.0    50.0    0.0
-f24 1
-    -1.0    0.0    0.0
-c0
-5
-    65.0    70.0    0.0
-    65.0    50.0    0.0
-    65.0    50.0    3.0
-    65.0    70.0    3.0
-    65.0    70.0    0.0
-f25 1
-    -1.0    0.0    0.0
-c0
-5
-    95.0    55.0    0.0
-    95.0    35.0    0.0
-    95.0    35.0    3.0
-    95.0    55.0    3.0
-    95.0    55.0    0.0
-f26 1
-    -0.0    1.0    -0.0
-c0
-5
-    115.0    55.0    0.0
-    95.0    55.0    0.0
-    95.0    55.0    3.0
-    115.0    55.0    3.0
-    115.0    55.0    0.0
-f27 1
-    0.0    -1.0    0.0
-c0
-5
-    95.0    35.0    0.0
-    115.0    35.0    0.0
-    115.0    35.0    3.0
-    95.0    35.0    3.0
-    95.0    35.0    0.0
-f28 1
-    1.0    -0.0    -0.0
-c0
-5
-    115.0    35.0    0.0
-    115.0    55.0    0.0
-    115.0    55.0    3.0
-    115.0    35.0    3.0
-    115.0    35.0    0.0
-f29 1
-    1.0    -0.0    -0.0
-c0
-5
-    55.0    30.0    0.0
-    55.0    50.0    0.0
-    55.0    50.0    3.0
-    55.0    30.0    3.0
-    55.0    30.0    0.0
-f30 1
-    -0.0    1.0    -0.0
-c0
-5
-    55.0    50.0    0.0
-    35.0    50.0    0.0
-    35.0    50.0    3.0
-    55.0    50.0    3.0
-    55.0    50.0    0.0
-f31 1
-    0.0    -1.0    0.0
-c0
-5
-    35.0    30.0    0.0
-    55.0    30.0    0.0
-    55.0    30.0    3.0
-    35.0    30.0    3.0
-    35.0    30.0    0.0
-f32 1
-    -1.0    0.0    0.0
-c0
-5
-    35.0    30.0    0.0
-    35.0    30.0    3.0
-    35.0    50.0    3.0
-    35.0    50.0    0.0
-    35.0    30.0    0.0
-f33 1
-    1.0    -0.0    -0.0
-c0
-5
-    90.0    110.0    0.0
-    90.0    130.0    0.0
-    90.0    130.0    3.0
-    90.0    110.0    3.0
-    90.0    110.0    0.0
-f34 1
-    -0.0    1.0    -0.0
-c0
-5
-    90.0    130.0    0.0
-    70.0    130.0    0.0
-    70.0    130.0    3.0
-    90.0    130.0    3.0
-    90.0    130.0    0.0
-f35 1
-    -1.0    0.0    0.0
-c0
-5
-    70.0    130.0    0.0
-    70.0    110.0    0.0
-    70.0    110.0    3.0
-    70.0    130.0    3.0
-    70.0    130.0    0.0
-f36 1
-    0.0    -1.0    0.0
-c0
-5
-    90.0    110.0    3.0
-    70.0    110.0    3.0
-    70.0    110.0    0.0
-    90.0    110.0    0.0
-    90.0    110.0    3.0
-f37 1
-    -0.0    1.0    -0.0
-c0
-5
-    130.0    90.0    3.0
-    110.0    90.0    3.0
-    110.0    90.0    6.0
-    130.0    90.0    6.0
-    130.0    90.0    3.0
-f38 1
-    1.0    -0.0    -0.0
-c0
-5
-    130.0    70.0    3.0
-    130.0    90.0    3.0
-    130.0    90.0    6.0
-    130.0    70.0    6.0
-    130.0    70.0    3.0
-f39 1
-    -1.0    0.0    0.0
-c0
-5
-    110.0    90.0    3.0
-    110.0    70.0    3.0
-    110.0    70.0    6.0
-    110.0    90.0    6.0
-    110.0    90.0    3.0
-f40 1
-    0.0    -1.0    0.0
-c0
-5
-    110.0    70.0    3.0
-    130.0    70.0    3.0
-    130.0    70.0    6.0
-    110.0    70.0    6.0
-    110.0    70.0    3.0
-f41 1
-    1.0    -0.0    -0.0
-c0
-5
-    100.0    80.0    3.0
-    100.0    100.0    3.0
-    100.0    100.0    6.0
-    100.0    80.0    6.0
-    100.0    80.0    3.0
-f42 1
-    -0.0    1.0    -0.0
-c0
-5
-    100.0    100.0    3.0
-    80.0    100.0    3.0
-    80.0    100.0    6.0
-    100.0    100.0    6.0
-    100.0    100.0    3.0
-f43 1
-    0.0    -1.0    0.0
-c0
-5
-    80.0    80.0    3.0
-    100.0    80.0    3.0
-    100.0    80.0    6.0
-    80.0    80.0    6.0
-    80.0    80.0    3.0
-f44 1
-    -1.0    0.0    0.0
-c0
-5
-    80.0    100.0    3.0
-    80.0    80.0    3.0
-    80.0    80.0    6.0
-    80.0    100.0    6.0
-    80.0    100.0    3.0
-f45 1
-    -0.0    1.0    -0.0
-c0
-5
-    70.0    95.0    3.0
-    50.0    95.0    3.0
-    50.0    95.0    6.0
-    70.0    95.0    6.0
-    70.0    95.0    3.0
-f46 1
-    1.0    -0.0    -0.0
-c0
-5
-    70.0    75.0    6.0
-    70.0    75.0    3.0
-    70.0    95.0    3.0
-    70.0    95.0    6.0
-    70.0    75.0    6.0
-f47 1
-    -1.0    0.0    0.0
-c0
-5
-    50.0    95.0    3.0
-    50.0    75.0    3.0
-    50.0    75.0    6.0
-    50.0    95.0    6.0
-    50.0    95.0    3.0
-f48 1
-    0.0    -1.0    0.0
-c0
-5
-    70.0    75.0    3.0
-    70.0    75.0    6.0
-    50.0    75.0    6.0
-    50.0    75.0    3.0
-    70.0    75.0    3.0
-f49 1
-    1.0    -0.0    -0.0
-c0
-5
-    50.0    105.0    3.0
-    50.0    125.0    3.0
-    50.0    125.0    6.0
-    50.0    105.0    6.0
-    50.0    105.0    3.0
-f50 1
-    -0.0    1.0    -0.0
-c0
-5
-    50.0    125.0    3.0
-    30.0    125.0    3.0
-    30.0    125.0    6.0
-    50.0    125.0    6.0
-    50.0    125.0    3.0
-f51 1
-    0.0    -1.0    0.0
-c0
-5
-    30.0    105.0    3.0
-    50.0    105.0    3.0
-    50.0    105.0    6.0
-    30.0    105.0    6.0
-    30.0    105.0    3.0
-f52 1
-    -1.0    0.0    0.0
-c0
-5
-    30.0    125.0    3.0
-    30.0    105.0    3.0
-    30.0    105.0    6.0
-    30.0    125.0    6.0
-    30.0    125.0    3.0
-f53 1
-    1.0    -0.0    -0.0
-c0
-5
-    125.0    100.0    3.0
-    125.0    120.0    3.0
-    125.0    120.0    6.0
-    125.0    100.0    6.0
-    125.0    100.0    3.0
-f54 1
-    -0.0    1.0    -0.0
-c0
-5
-    125.0    120.0    3.0
-    105.0    120.0    3.0
-    105.0    120.0    6.0
-    125.0    120.0    6.0
-    125.0    120.0    3.0
-f55 1
-    0.0    -1.0    0.0
-c0
-5
-    105.0    100.0    6.0
-    105.0    100.0    3.0
-    125.0    100.0    3.0
-    125.0    100.0    6.0
-    105.0    100.0    6.0
-f56 1
-    -1.0    0.0    0.0
-c0
-5
-    105.0    120.0    3.0
-    105.0    100.0    3.0
-    105.0    100.0    6.0
-    105.0    120.0    6.0
-    105.0    120.0    3.0
-f57 1
-    1.0    -0.0    -0.0
-c0
-5
-    85.0    50.0    3.0
-    85.0    70.0    3.0
-    85.0    70.0    6.0
-    85.0    50.0    6.0
-    85.0    50.0    3.0
-f58 1
-    -0.0    1.0    -0.0
-c0
-5
-    85.0    70.0    6.0
-    85.0    70.0    3.0
-    65.0    70.0    3.0
-    65.0    70.0    6.0
-    85.0    70.0    6.0
-f59 1
-    0.0    -1.0    0.0
-c0
-5
-    65.0    50.0    3.0
-    85.0    50.0    3.0
-    85.0    50.0    6.0
-    65.0    50.0    6.0
-    65.0    50.0    3.0
-f60 1
-    -1.0    0.0    0.0
-c0
-5
-    65.0    70.0    6.0
-    65.0    70.0    3.0
-    65.0    50.0    3.0
-    65.0    50.0    6.0
-    65.0    70.0    6.0
-f61 1
-    -1.0    0.0    0.0
-c0
-5
-    95.0    55.0    3.0
-    95.0    35.0    3.0
-    95.0    35.0    6.0
-    95.0    55.0    6.0
-    95.0    55.0    3.0
-f62 1
-    -0.0    1.0    -0.0
-c0
-5
-    115.0    55.0    3.0
-    95.0    55.0    3.0
-    95.0    55.0    6.0
-    115.0    55.0    6.0
-    115.0    55.0    3.0
-f63 1
-    0.0    -1.0    0.0
-c0
-5
-    95.0    35.0    3.0
-    115.0    35.0    3.0
-    115.0    35.0    6.0
-    95.0    35.0    6.0
-    95.0    35.0    3.0
-f64 1
-    1.0    -0.0    -0.0
-c0
-5
-    115.0    35.0    3.0
-    115.0    55.0    3.0
-    115.0    55.0    6.0
-    115.0    35.0    6.0
-    115.0    35.0    3.0
-f65 1
-    1.0    -0.0    -0.0
-c0
-5
-    55.0    30.0    6.0
-    55.0    30.0    3.0
-    55.0    50.0    3.0
-    55.0    50.0    6.0
-    55.0    30.0    6.0
-f66 1
-    -0.0    1.0    -0.0
-c0
-5
-    55.0    50.0    3.0
-    35.0    50.0    3.0
-    35.0    50.0    6.0
-    55.0    50.0    6.0
-    55.0    50.0    3.0
-f67 1
-    0.0    -1.0    0.0
-c0
-5
-    35.0    30.0    3.0
-    55.0    30.0    3.0
-    55.0    30.0    6.0
-    35.0    30.0    6.0
-    35.0    30.0    3.0
-f68 1
-    -1.0    0.0    0.0
-c0
-5
-    35.0    50.0    3.0
-    35.0    30.0    3.0
-    35.0    30.0    6.0
-    35.0    50.0    6.0
-    35.0    50.0    3.0
-f69 1
-    1.0    -0.0    -0.0
-c0
-5
-    90.0    110.0    3.0
-    90.0    130.0    3.0
-    90.0    130.0    6.0
-    90.0    110.0    6.0
-    90.0    110.0    3.0
-f70 1
-    -0.0    1.0    -0.0
-c0
-5
-    90.0    130.0    3.0
-    70.0    130.0    3.0
-    70.0    130.0    6.0
-    90.0    130.0    6.0
-    90.0    130.0    3.0
-f71 1
-    -1.0    0.0    0.0
-c0
-5
-    70.0    110.0    3.0
-    70.0    110.0    6.0
-    70.0    130.0    6.0
-    70.0    130.0    3.0
-    70.0    110.0    3.0
-f72 1
-    0.0    -1.0    0.0
-c0
-5
-    70.0    110.0    3.0
-    90.0    110.0    3.0
-    90.0    110.0    6.0
-    70.0    110.0    6.0
-    70.0    110.0    3.0
-f73 1
-    -0.0    1.0    -0.0
-c0
-5
-    130.0    90.0    6.0
-    110.0    90.0    6.0
-    110.0    90.0    9.0
-    130.0    90.0    9.0
-    130.0    90.0    6.0
-f74 1
-    1.0    -0.0    -0.0
-c0
-5
-    130.0    70.0    6.0
-    130.0    90.0    6.0
-    130.0    90.0    9.0
-    130.0    70.0    9.0
-    130.0    70.0    6.0
-f75 1
-    -1.0    0.0    0.0
-c0
-5
-    110.0    70.0    9.0
-    110.0    90.0    9.0
-    110.0    90.0    6.0
-    110.0    70.0    6.0
-    110.0    70.0    9.0
-f76 1
-    0.0    -1.0    0.0
-c0
-5
-    110.0    70.0    6.0
-    130.0    70.0    6.0
-    130.0    70.0    9.0
-    110.0    70.0    9.0
-    110.0    70.0    6.0
-f77 1
-    1.0    -0.0    -0.0
-c0
-5
-    100.0    80.0    6.0
-    100.0    100.0    6.0
-    100.0    100.0    9.0
-    100.0    80.0    9.0
-    100.0    80.0    6.0
-f78 1
-    -0.0    1.0    -0.0
-c0
-5
-    100.0    100.0    6.0
-    80.0    100.0    6.0
-    80.0    100.0    9.0
-    100.0    100.0    9.0
-    100.0    100.0    6.0
-f79 1
-    0.0    -1.0    0.0
-c0
-5
-    80.0    80.0    6.0
-    100.0    80.0    6.0
-    100.0    80.0    9.0
-    80.0    80.0    9.0
-    80.0    80.0    6.0
-f80 1
-    -1.0    0.0    0.0
-c0
-5
-    80.0    100.0    6.0
-    80.0    80.0    6.0
-    80.0    80.0    9.0
-    80.0    100.0    9.0
-    80.0    100.0    6.0
-f81 1
-    -0.0    1.0    -0.0
-c0
-5
-    70.0    95.0    6.0
-    50.0    95.0    6.0
-    50.0    95.0    9.0
-    70.0    95.0    9.0
-    70.0    95.0    6.0
-f82 1
-    1.0    -0.0    -0.0
-c0
-5
-    70.0    75.0    6.0
-    70.0    95.0    6.0
-    70.0    95.0    9.0
-    70.0    75.0    9.0
-    70.0    75.0    6.0
-f83 1
-    -1.0    0.0    0.0
-c0
-5
-    50.0    95.0    6.0
-    50.0    75.0    6.0
-    50.0    75.0    9.0
-    50.0    95.0    9.0
-    50.0    95.0    6.0
-f84 1
-    0.0    -1.0    0.0
-c0
-5
-    70.0    75.0    6.0
-    70.0    75.0    9.0
-    50.0    75.0    9.0
-    50.0    75.0    6.0
-    70.0    75.0    6.0
-f85 1
-    1.0    -0.0    -0.0
-c0
-5
-    50.0    105.0    6.0
-    50.0    125.0    6.0
-    50.0    125.0    9.0
-    50.0    105.0    9.0
-    50.0    105.0    6.0
-f86 1
-    -0.0    1.0    -0.0
-c0
-5
-    50.0    125.0    6.0
-    30.0    125.0    6.0
-    30.0    125.0    9.0
-    50.0    125.0    9.0
-    50.0    125.0    6.0
-f87 1
-    0.0    -1.0    0.0
-c0
-5
-    30.0    105.0    6.0
-    50.0    105.0    6.0
-    50.0    105.0    9.0
-    30.0    105.0    9.0
-    30.0    105.0    6.0
-f88 1
-    -1.0    0.0    0.0
-c0
-5
-    30.0    125.0    6.0
-    30.0    105.0    6.0
-    30.0    105.0    9.0
-    30.0    125.0    9.0
-    30.0    125.0    6.0
-f89 1
-    1.0    -0.0    -0.0
-c0
-5
-    125.0    100.0    6.0
-    125.0    120.0    6.0
-    125.0    120.0    9.0
-    125.0    100.0    9.0
-    125.0    100.0    6.0
-f90 1
-    -0.0    1.0    -0.0
-c0
-5
-    125.0    120.0    6.0
-    105.0    120.0    6.0
-    105.0    120.0    9.0
-    125.0    120.0    9.0
-    125.0    120.0    6.0
-f91 1
-    0.0    -1.0    0.0
-c0
-5
-    105.0    100.0    6.0
-    125.0    100.0    6.0
-    125.0    100.0    9.0
-    105.0    100.0    9.0
-    105.0    100.0    6.0
-f92 1
-    -1.0    0.0    0.0
-c0
-5
-    105.0    120.0    6.0
-    105.0    100.0    6.0
-    105.0    100.0    9.0
-    105.0    120.0    9.0
-    105.0    120.0    6.0
-f93 1
-    1.0    -0.0    -0.0
-c0
-5
-    85.0    70.0    9.0
-    85.0    50.0    9.0
-    85.0    50.0    6.0
-    85.0    70.0    6.0
-    85.0    70.0    9.0
-f94 1
-    -0.0    1.0    -0.0
-c0
-5
-    85.0    70.0    6.0
-    65.0    70.0    6.0
-    65.0    70.0    9.0
-    85.0    70.0    9.0
-    85.0    70.0    6.0
-f95 1
-    0.0    -1.0    0.0
-c0
-5
-    65.0    50.0    6.0
-    85.0    50.0    6.0
-    85.0    50.0    9.0
-    65.0    50.0    9.0
-    65.0    50.0    6.0
-f96 1
-    -1.0    0.0    0.0
-c0
-5
-    65.0    70.0    6.0
-    65.0    50.0    6.0
-    65.0    50.0    9.0
-    65.0    70.0    9.0
-    65.0    70.0    6.0
-f97 1
-    -1.0    0.0    0.0
-c0
-5
-    95.0    55.0    6.0
-    95.0    35.0    6.0
-    95.0    35.0    9.0
-    95.0    55.0    9.0
-    95.0    55.0    6.0
-f98 1
-    -0.0    1.0    -0.0
-c0
-5
-    95.0    55.0    6.0
-    95.0    55.0    9.0
-    115.0    55.0    9.0
-    115.0    55.0    6.0
-    95.0    55.0    6.0
-f99 1
-    0.0    -1.0    0.0
-c0
-5
-    95.0    35.0    6.0
-    115.0    35.0    6.0
-    115.0    35.0    9.0
-    95.0    35.0    9.0
-    95.0    35.0    6.0
-f100 1
-    1.0    -0.0    -0.0
-c0
-5
-    115.0    35.0    6.0
-    115.0    55.0    6.0
-    115.0    55.0    9.0
-    115.0    35.0    9.0
-    115.0    35.0    6.0
-f101 1
-    1.0    -0.0    -0.0
-c0
-5
-    55.0    30.0    6.0
-    55.0    50.0    6.0
-    55.0    50.0    9.0
-    55.0    30.0    9.0
-    55.0    30.0    6.0
-f102 1
-    -0.0    1.0    -0.0
-c0
-5
-    35.0    50.0    9.0
-    55.0    50.0    9.0
-    55.0    50.0    6.0
-    35.0    50.0    6.0
-    35.0    50.0    9.0
-f103 1
-    0.0    -1.0    0.0
-c0
-5
-    35.0    30.0    6.0
-    55.0    30.0    6.0
-    55.0    30.0    9.0
-    35.0    30.0    9.0
-    35.0    30.0    6.0
-f104 1
-    -1.0    0.0    0.0
-c0
-5
-    35.0    50.0    6.0
-    35.0    30.0    6.0
-    35.0    30.0    9.0
-    35.0    50.0    9.0
-    35.0    50.0    6.0
-f105 1
-    1.0    -0.0    -0.0
-c0
-5
-    90.0    110.0    6.0
-    90.0    130.0    6.0
-    90.0    130.0    9.0
-    90.0    110.0    9.0
-    90.0    110.0    6.0
-f106 1
-    -0.0    1.0    -0.0
-c0
-5
-    90.0    130.0    6.0
-    70.0    130.0    6.0
-    70.0    130.0    9.0
-    90.0    130.0    9.0
-    90.0    130.0    6.0
-f107 1
-    -1.0    0.0    0.0
-c0
-5
-    70.0    130.0    6.0
-    70.0    110.0    6.0
-    70.0    110.0    9.0
-    70.0    130.0    9.0
-    70.0    130.0    6.0
-f108 1
-    0.0    -1.0    0.0
-c0
-5
-    70.0    110.0    6.0
-    90.0    110.0    6.0
-    90.0    110.0    9.0
-    70.0    110.0    9.0
-    70.0    110.0    6.0
-f109 1
-    -0.0    1.0    -0.0
-c0
-5
-    110.0    90.0    12.0
-    130.0    90.0    12.0
-    130.0    90.0    9.0
-    110.0    90.0    9.0
-    110.0    90.0    12.0
-f110 1
-    1.0    -0.0    -0.0
-c0
-5
-    130.0    70.0    9.0
-    130.0    90.0    9.0
-    130.0    90.0    12.0
-    130.0    70.0    12.0
-    130.0    70.0    9.0
-f111 1
-    -1.0    0.0    0.0
-c0
-5
-    110.0    70.0    9.0
-    110.0    70.0    12.0
-    110.0    90.0    12.0
-    110.0    90.0    9.0
-    110.0    70.0    9.0
-f112 1
-    0.0    -1.0    0.0
-c0
-5
-    110.0    70.0    12.0
-    110.0    70.0    9.0
-    130.0    70.0    9.0
-    130.0    70.0    12.0
-    110.0    70.0    12.0
-f113 1
-    1.0    -0.0    -0.0
-c0
-5
-    100.0    80.0    9.0
-    100.0    100.0    9.0
-    100.0    100.0    12.0
-    100.0    80.0    12.0
-    100.0    80.0    9.0
-f114 1
-    -0.0    1.0    -0.0
-c0
-5
-    100.0    100.0    9.0
-    80.0    100.0    9.0
-    80.0    100.0    12.0
-    100.0    100.0    12.0
-    100.0    100.0    9.0
-f115 1
-    0.0    -1.0    0.0
-c0
-5
-    80.0    80.0    9.0
-    100.0    80.0    9.0
-    100.0    80.0    12.0
-    80.0    80.0    12.0
-    80.0    80.0    9.0
-f116 1
-    -1.0    0.0    0.0
-c0
-5
-    80.0    100.0    9.0
-    80.0    80.0    9.0
-    80.0    80.0    12.0
-    80.0    100.0    12.0
-    80.0    100.0    9.0
-f117 1
-    -0.0    1.0    -0.0
-c0
-5
-    70.0    95.0    9.0
-    50.0    95.0    9.0
-    50.0    95.0    12.0
-    70.0    95.0    12.0
-    70.0    95.0    9.0
-f118 1
-    1.0    -0.0    -0.0
-c0
-5
-    70.0    75.0    9.0
-    70.0    95.0    9.0
-    70.0    95.0    12.0
-    70.0    75.0    12.0
-    70.0    75.0    9.0
-f119 1
-    -1.0    0.0    0.0
-c0
-5
-    50.0    95.0    9.0
-    50.0    75.0    9.0
-    50.0    75.0    12.0
-    50.0    95.0    12.0
-    50.0    95.0    9.0
-f120 1
-    0.0    -1.0    0.0
-c0
-5
-    50.0    75.0    9.0
-    70.0    75.0    9.0
-    70.0    75.0    12.0
-    50.0    75.0    12.0
-    50.0    75.0    9.0
-f121 1
-    1.0    -0.0    -0.0
-c0
-5
-    50.0    125.0    9.0
-    50.0    125.0    12.0
-    50.0    105.0    12.0
-    50.0    105.0    9.0
-    50.0    125.0    9.0
-f122 1
-    -0.0    1.0    -0.0
-c0
-5
-    50.0    125.0    9.0
-    30.0    125.0    9.0
-    30.0    125.0    12.0
-    50.0    125.0    12.0
-    50.0    125.0    9.0
-f123 1
-    0.0    -1.0    0.0
-c0
-5
-    50.0    105.0    9.0
-    50.0    105.0    12.0
-    30.0    105.0    12.0
-    30.0    105.0    9.0
-    50.0    105.0    9.0
-f124 1
-    -1.0    0.0    0.0
-c0
-5
-    30.0    125.0    9.0
-    30.0    105.0    9.0
-    30.0    105.0    12.0
-    30.0    125.0    12.0
-    30.0    125.0    9.0
-f125 1
-    1.0    -0.0    -0.0
-c0
-5
-    125.0    100.0    9.0
-    125.0    120.0    9.0
-    125.0    120.0    12.0
-    125.0    100.0    12.0
-    125.0    100.0    9.0
-f126 1
-    -0.0    1.0    -0.0
-c0
-5
-    125.0    120.0    9.0
-    105.0    120.0    9.0
-    105.0    120.0    12.0
-    125.0    120.0    12.0
-    125.0    120.0    9.0
-f127 1
-    0.0    -1.0    0.0
-c0
-5
-    105.0    100.0    9.0
-    125.0    100.0    9.0
-    125.0    100.0    12.0
-    105.0    100.0    12.0
-    105.0    100.0    9.0
-f128 1
-    -1.0    0.0    0.0
-c0
-5
-    105.0    120.0    9.0
-    105.0    100.0    9.0
-    105.0    100.0    12.0
-    105.0    120.0    12.0
-    105.0    120.0    9.0
-f129 1
-    1.0    -0.0    -0.0
-c0
-5
-    85.0    50.0    9.0
-    85.0    70.0    9.0
-    85.0    70.0    12.0
-    85.0    50.0    12.0
-    85.0    50.0    9.0
-f130 1
-    -0.0    1.0    -0.0
-c0
-5
-    85.0    70.0    12.0
-    85.0    70.0    9.0
-    65.0    70.0    9.0
-    65.0    70.0    12.0
-    85.0    70.0    12.0
-f131 1
-    0.0    -1.0    0.0
-c0
-5
-    65.0    50.0    12.0
-    65.0    50.0    9.0
-    85.0    50.0    9.0
-    85.0    50.0    12.0
-    65.0    50.0    12.0
-f132 1
-    -1.0    0.0    0.0
-c0
-5
-    65.0    70.0    9.0
-    65.0    50.0    9.0
-    65.0    50.0    12.0
-    65.0    70.0    12.0
-    65.0    70.0    9.0
-f133 1
-    -1.0    0.0    0.0
-c0
-5
-    95.0    55.0    9.0
-    95.0    35.0    9.0
-    95.0    35.0    12.0
-    95.0    55.0    12.0
-    95.0    55.0    9.0
-f134 1
-    -0.0    1.0    -0.0
-c0
-5
-    115.0    55.0    9.0
-    95.0    55.0    9.0
-    95.0    55.0    12.0
-    115.0    55.0    12.0
-    115.0    55.0    9.0
-f135 1
-    0.0    -1.0    0.0
-c0
-5
-    115.0    35.0    12.0
-    95.0    35.0    12.0
-    95.0    35.0    9.0
-    115.0    35.0    9.0
-    115.0    35.0    12.0
-f136 1
-    1.0    -0.0    -0.0
-c0
-5
-    115.0    35.0    9.0
-    115.0    55.0    9.0
-    115.0    55.0    12.0
-    115.0    35.0    12.0
-    115.0    35.0    9.0
-f137 1
-    1.0    -0.0    -0.0
-c0
-5
-    55.0    50.0    12.0
-    55.0    30.0    12.0
-    55.0    30.0    9.0
-    55.0    50.0    9.0
-    55.0    50.0    12.0
-f138 1
-    -0.0    1.0    -0.0
-c0
-5
-    55.0    50.0    9.0
-    35.0    50.0    9.0
-    35.0    50.0    12.0
-    55.0    50.0    12.0
-    55.0    50.0    9.0
-f139 1
-    0.0    -1.0    0.0
-c0
-5
-    35.0    30.0    9.0
-    55.0    30.0    9.0
-    55.0    30.0    12.0
-    35.0    30.0    12.0
-    35.0    30.0    9.0
-f140 1
-    -1.0    0.0    0.0
-c0
-5
-    35.0    30.0    12.0
-    35.0    50.0    12.0
-    35.0    50.0    9.0
-    35.0    30.0    9.0
-    35.0    30.0    12.0
-f141 1
-    1.0    -0.0    -0.0
-c0
-5
-    90.0    110.0    9.0
-    90.0    130.0    9.0
-    90.0    130.0    12.0
-    90.0    110.0    12.0
-    90.0    110.0    9.0
-f142 1
-    -0.0    1.0    -0.0
-c0
-5
-    90.0    130.0    9.0
-    70.0    130.0    9.0
-    70.0    130.0    12.0
-    90.0    130.0    12.0
-    90.0    130.0    9.0
-f143 1
-    -1.0    0.0    0.0
-c0
-5
-    70.0    130.0    9.0
-    70.0    110.0    9.0
-    70.0    110.0    12.0
-    70.0    130.0    12.0
-    70.0    130.0    9.0
-f144 1
-    0.0    -1.0    0.0
-c0
-5
-    70.0    110.0    9.0
-    90.0    110.0    9.0
-    90.0    110.0    12.0
-    70.0    110.0    12.0
-    70.0    110.0    9.0
-f145 1
-    -0.0    1.0    -0.0
-c0
-5
-    130.0    90.0    12.0
-    110.0    90.0    12.0
-    110.0    90.0    15.0
-    130.0    90.0    15.0
-    130.0    90.0    12.0
-f146 1
-    1.0    -0.0    -0.0
-c0
-5
-    130.0    70.0    12.0
-    130.0    90.0    12.0
-    130.0    90.0    15.0
-    130.0    70.0    15.0
-    130.0    70.0    12.0
-f147 1
-    -1.0    0.0    0.0
-c0
-5
-    110.0    90.0    12.0
-    110.0    70.0    12.0
-    110.0    70.0    15.0
-    110.0    90.0    15.0
-    110.0    90.0    12.0
-f148 1
-    0.0    -1.0    0.0
-c0
-5
-    110.0    70.0    12.0
-    130.0    70.0    12.0
-    130.0    70.0    15.0
-    110.0    70.0    15.0
-    110.0    70.0    12.0
-f149 1
-    1.0    -0.0    -0.0
-c0
-5
-    100.0    80.0    12.0
-    100.0    100.0    12.0
-    100.0    100.0    15.0
-    100.0    80.0    15.0
-    100.0    80.0    12.0
-f150 1
-    -0.0    1.0    -0.0
-c0
-5
-    100.0    100.0    15.0
-    100.0    100.0    12.0
-    80.0    100.0    12.0
-    80.0    100.0    15.0
-    100.0    100.0    15.0
-f151 1
-    0.0    -1.0    0.0
-c0
-5
-    80.0    80.0    12.0
-    100.0    80.0    12.0
-    100.0    80.0    15.0
-    80.0    80.0    15.0
-    80.0    80.0    12.0
-f152 1
-    -1.0    0.0    0.0
-c0
-5
-    80.0    100.0    12.0
-    80.0    80.0    12.0
-    80.0    80.0    15.0
-    80.0    100.0    15.0
-    80.0    100.0    12.0
-f153 1
-    -0.0    1.0    -0.0
-c0
-5
-    70.0    95.0    12.0
-    50.0    95.0    12.0
-    50.0    95.0    15.0
-    70.0    95.0    15.0
-    70.0    95.0    12.0
-f154 1
-    1.0    -0.0    -0.0
-c0
-5
-    70.0    75.0    12.0
-    70.0    95.0    12.0
-    70.0    95.0    15.0
-    70.0    75.0    15.0
-    70.0    75.0    12.0
-f155 1
-    -1.0    0.0    0.0
-c0
-5
-    50.0    95.0    12.0
-    50.0    75.0    12.0
-    50.0    75.0    15.0
-    50.0    95.0    15.0
-    50.0    95.0    12.0
-f156 1
-    0.0    -1.0    0.0
-c0
-5
-    50.0    75.0    12.0
-    70.0    75.0    12.0
-    70.0    75.0    15.0
-    50.0    75.0    15.0
-    50.0    75.0    12.0
-f157 1
-    1.0    -0.0    -0.0
-c0
-5
-    50.0    105.0    12.0
-    50.0    125.0    12.0
-    50.0    125.0    15.0
-    50.0    105.0    15.0
-    50.0    105.0    12.0
-f158 1
-    -0.0    1.0    -0.0
-c0
-5
-    50.0    125.0    15.0
-    50.0    125.0    12.0
-    30.0    125.0    12.0
-    30.0    125.0    15.0
-    50.0    125.0    15.0
-f159 1
-    0.0    -1.0    0.0
-c0
-5
-    50.0    105.0    12.0
-    50.0    105.0    15.0
-    30.0    105.0    15.0
-    30.0    105.0    12.0
-    50.0    105.0    12.0
-f160 1
-    -1.0    0.0    0.0
-c0
-5
-    30.0    125.0    15.0
-    30.0    125.0    12.0
-    30.0    105.0    12.0
-    30.0    105.0    15.0
-    30.0    125.0    15.0
-f161 1
-    1.0    -0.0    -0.0
-c0
-5
-    125.0    100.0    12.0
-    125.0    120.0    12.0
-    125.0    120.0    15.0
-    125.0    100.0    15.0
-    125.0    100.0    12.0
-f162 1
-    -0.0    1.0    -0.0
-c0
-5
-    125.0    120.0    12.0
-    105.0    120.0    12.0
-    105.0    120.0    15.0
-    125.0    120.0    15.0
-    125.0    120.0    12.0
-f163 1
-    0.0    -1.0    0.0
-c0
-5
-    105.0    100.0    12.0
-    125.0    100.0    12.0
-    125.0    100.0    15.0
-    105.0    100.0    15.0
-    105.0    100.0    12.0
-f164 1
-    -1.0    0.0    0.0
-c0
-5
-    105.0    120.0    12.0
-    105.0    100.0    12.0
-    105.0    100.0    15.0
-    105.0    120.0    15.0
-    105.0    120.0    12.0
-f165 1
-    1.0    -0.0    -0.0
-c0
-5
-    85.0    50.0    12.0
-    85.0    70.0    12.0
-    85.0    70.0    15.0
-    85.0    50.0    15.0
-    85.0    50.0    12.0
-f166 1
-    -0.0    1.0    -0.0
-c0
-5
-    85.0    70.0    12.0
-    65.0    70.0    12.0
-    65.0    70.0    15.0
-    85.0    70.0    15.0
-    85.0    70.0    12.0
-f167 1
-    0.0    -1.0    0.0
-c0
-5
-    65.0    50.0    12.0
-    85.0    50.0    12.0
-    85.0    50.0    15.0
-    65.0    50.0    15.0
-    65.0    50.0    12.0
-f168 1
-    -1.0    0.0    0.0
-c0
-5
-    65.0    70.0    12.0
-    65.0    50.0    12.0
-    65.0    50.0    15.0
-    65.0    70.0    15.0
-    65.0    70.0    12.0
-f169 1
-    -1.0    0.0    0.0
-c0
-5
-    95.0    55.0    12.0
-    95.0    35.0    12.0
-    95.0    35.0    15.0
-    95.0    55.0    15.0
-    95.0    55.0    12.0
-f170 1
-    -0.0    1.0    -0.0
-c0
-5
-    115.0    55.0    12.0
-    95.0    55.0    12.0
-    95.0    55.0    15.0
-    115.0    55.0    15.0
-    115.0    55.0    12.0
-f171 1
-    0.0    -1.0    0.0
-c0
-5
-    95.0    35.0    12.0
-    115.0    35.0    12.0
-    115.0    35.0    15.0
-    95.0    35.0    15.0
-    95.0    35.0    12.0
-f172 1
-    1.0    -0.0    -0.0
-c0
-5
-    115.0    35.0    12.0
-    115.0    55.0    12.0
-    115.0    55.0    15.0
-    115.0    35.0    15.0
-    115.0    35.0    12.0
-f173 1
-    1.0    -0.0    -0.0
-c0
-5
-    55.0    30.0    12.0
-    55.0    50.0    12.0
-    55.0    50.0    15.0
-    55.0    30.0    15.0
-    55.0    30.0    12.0
-f174 1
-    -0.0    1.0    -0.0
-c0
-5
-    55.0    50.0    15.0
-    55.0    50.0    12.0
-    35.0    50.0    12.0
-    35.0    50.0    15.0
-    55.0    50.0    15.0
-f175 1
-    0.0    -1.0    0.0
-c0
-5
-    35.0    30.0    12.0
-    55.0    30.0    12.0
-    55.0    30.0    15.0
-    35.0    30.0    15.0
-    35.0    30.0    12.0
-f176 1
-    -1.0    0.0    0.0
-c0
-5
-    35.0    50.0    12.0
-    35.0    30.0    12.0
-    35.0    30.0    15.0
-    35.0    50.0    15.0
-    35.0    50.0    12.0
-f177 1
-    1.0    -0.0    -0.0
-c0
-5
-    90.0    110.0    12.0
-    90.0    130.0    12.0
-    90.0    130.0    15.0
-    90.0    110.0    15.0
-    90.0    110.0    12.0
-f178 1
-    -0.0    1.0    -0.0
-c0
-5
-    90.0    130.0    12.0
-    70.0    130.0    12.0
-    70.0    130.0    15.0
-    90.0    130.0    15.0
-    90.0    130.0    12.0
-f179 1
-    -1.0    0.0    0.0
-c0
-5
-    70.0    130.0    12.0
-    70.0    110.0    12.0
-    70.0    110.0    15.0
-    70.0    130.0    15.0
-    70.0    130.0    12.0
-f180 1
-    0.0    -1.0    0.0
-c0
-5
-    70.0    110.0    12.0
-    90.0    110.0    12.0
-    90.0    110.0    15.0
-    70.0    110.0    15.0
-    70.0    110.0    12.0
-f181 1
-    -0.0    1.0    -0.0
-c0
-5
-    130.0    90.0    15.0
-    110.0    90.0    15.0
-    110.0    90.0    18.0
-    130.0    90.0    18.0
-    130.0    90.0    15.0
-f182 1
-    1.0    -0.0    -0.0
-c0
-5
-    130.0    70.0    15.0
-    130.0    90.0    15.0
-    130.0    90.0    18.0
-    130.0    70.0    18.0
-    130.0    70.0    15.0
-f183 1
-    -1.0    0.0    0.0
-c0
-5
-    110.0    90.0    15.0
-    110.0    70.0    15.0
-    110.0    70.0    18.0
-    110.0    90.0    18.0
-    110.0    90.0    15.0
-f184 1
-    0.0    -1.0    0.0
-c0
-5
-    110.0    70.0    15.0
-    130.0    70.0    15.0
-    130.0    70.0    18.0
-    110.0    70.0    18.0
-    110.0    70.0    15.0
-f185 1
-    1.0    -0.0    -0.0
-c0
-5
-    100.0    80.0    15.0
-    100.0    100.0    15.0
-    100.0    100.0    18.0
-    100.0    80.0    18.0
-    100.0    80.0    15.0
-f186 1
-    -0.0    1.0    -0.0
-c0
-5
-    100.0    100.0    15.0
-    80.0    100.0    15.0
-    80.0    100.0    18.0
-    100.0    100.0    18.0
-    100.0    100.0    15.0
-f187 1
-    0.0    -1.0    0.0
-c0
-5
-    80.0    80.0    15.0
-    100.0    80.0    15.0
-    100.0    80.0    18.0
-    80.0    80.0    18.0
-    80.0    80.0    15.0
-f188 1
-    -1.0    0.0    0.0
-c0
-5
-    80.0    100.0    15.0
-    80.0    80.0    15.0
-    80.0    80.0    18.0
-    80.0    100.0    18.0
-    80.0    100.0    15.0
-f189 1
-    -0.0    1.0    -0.0
-c0
-5
-    70.0    95.0    15.0
-    50.0    95.0    15.0
-    50.0    95.0    18.0
-    70.0    95.0    18.0
-    70.0    95.0    15.0
-f190 1
-    1.0    -0.0    -0.0
-c0
-5
-    70.0    75.0    15.0
-    70.0    95.0    15.0
-    70.0    95.0    18.0
-    70.0    75.0    18.0
-    70.0    75.0    15.0
-f191 1
-    -1.0    0.0    0.0
-c0
-5
-    50.0    95.0    15.0
-    50.0    75.0    15.0
-    50.0    75.0    18.0
-    50.0    95.0    18.0
-    50.0    95.0    15.0
-f192 1
-    0.0    -1.0    0.0
-c0
-5
-    50.0    75.0    15.0
-    70.0    75.0    15.0
-    70.0    75.0    18.0
-    50.0    75.0    18.0
-    50.0    75.0    15.0
-f193 1
-    1.0    -0.0    -0.0
-c0
-5
-    50.0    105.0    15.0
-    50.0    125.0    15.0
-    50.0    125.0    18.0
-    50.0    105.0    18.0
-    50.0    105.0    15.0
-f194 1
-    -0.0    1.0    -0.0
-c0
-5
-    50.0    125.0    15.0
-    30.0    125.0    15.0
-    30.0    125.0    18.0
-    50.0    125.0    18.0
-    50.0    125.0    15.0
-f195 1
-    0.0    -1.0    0.0
-c0
-5
-    30.0    105.0    15.0
-    50.0    105.0    15.0
-    50.0    105.0    18.0
-    30.0    105.0    18.0
-    30.0    105.0    15.0
-f196 1
-    -1.0    0.0    0.0
-c0
-5
-    30.0    125.0    18.0
-    30.0    125.0    15.0
-    30.0    105.0    15.0
-    30.0    105.0    18.0
-    30.0    125.0    18.0
-f197 1
-    1.0    -0.0    -0.0
-c0
-5
-    125.0    100.0    15.0
-    125.0    120.0    15.0
-    125.0    120.0    18.0
-    125.0    100.0    18.0
-    125.0    100.0    15.0
-f198 1
-    -0.0    1.0    -0.0
-c0
-5
-    125.0    120.0    15.0
-    105.0    120.0    15.0
-    105.0    120.0    18.0
-    125.0    120.0    18.0
-    125.0    120.0    15.0
-f199 1
-    0.0    -1.0    0.0
-c0
-5
-    105.0    100.0    15.0
-    125.0    100.0    15.0
-    125.0    100.0    18.0
-    105.0    100.0    18.0
-    105.0    100.0    15.0
-f200 1
-    -1.0    0.0    0.0
-c0
-5
-    105.0    120.0    15.0
-    105.0    100.0    15.0
-    105.0    100.0    18.0
-    105.0    120.0    18.0
-    105.0    120.0    15.0
-f201 1
-    1.0    -0.0    -0.0
-c0
-5
-    85.0    50.0    15.0
-    85.0    70.0    15.0
-    85.0    70.0    18.0
-    85.0    50.0    18.0
-    85.0    50.0    15.0
-f202 1
-    -0.0    1.0    -0.0
-c0
-5
-    85.0    70.0    15.0
-    65.0    70.0    15.0
-    65.0    70.0    18.0
-    85.0    70.0    18.0
-    85.0    70.0    15.0
-f203 1
-    0.0    -1.0    0.0
-c0
-5
-    65.0    50.0    15.0
-    85.0    50.0    15.0
-    85.0    50.0    18.0
-    65.0    50.0    18.0
-    65.0    50.0    15.0
-f204 1
-    -1.0    0.0    0.0
-c0
-5
-    65.0    70.0    15.0
-    65.0    50.0    15.0
-    65.0    50.0    18.0
-    65.0    70.0    18.0
-    65.0    70.0    15.0
-f205 1
-    -1.0    0.0    0.0
-c0
-5
-    95.0    55.0    15.0
-    95.0    35.0    15.0
-    95.0    35.0    18.0
-    95.0    55.0    18.0
-    95.0    55.0    15.0
-f206 1
-    -0.0    1.0    -0.0
-c0
-5
-    115.0    55.0    15.0
-    95.0    55.0    15.0
-    95.0    55.0    18.0
-    115.0    55.0    18.0
-    115.0    55.0    15.0
-f207 1
-    0.0    -1.0    0.0
-c0
-5
-    95.0    35.0    18.0
-    95.0    35.0    15.0
-    115.0    35.0    15.0
-    115.0    35.0    18.0
-    95.0    35.0    18.0
-f208 1
-    1.0    -0.0    -0.0
-c0
-5
-    115.0    35.0    15.0
-    115.0    55.0    15.0
-    115.0    55.0    18.0
-    115.0    35.0    18.0
-    115.0    35.0    15.0
-f209 1
-    1.0    -0.0    -0.0
-c0
-5
-    55.0    30.0    15.0
-    55.0    50.0    15.0
-    55.0    50.0    18.0
-    55.0    30.0    18.0
-    55.0    30.0    15.0
-f210 1
-    -0.0    1.0    -0.0
-c0
-5
-    55.0    50.0    15.0
-    35.0    50.0    15.0
-    35.0    50.0    18.0
-    55.0    50.0    18.0
-    55.0    50.0    15.0
-f211 1
-    0.0    -1.0    0.0
-c0
-5
-    35.0    30.0    18.0
-    35.0    30.0    15.0
-    55.0    30.0    15.0
-    55.0    30.0    18.0
-    35.0    30.0    18.0
-f212 1
-    -1.0    0.0    0.0
-c0
-5
-    35.0    50.0    15.0
-    35.0    30.0    15.0
-    35.0    30.0    18.0
-    35.0    50.0    18.0
-    35.0    50.0    15.0
-f213 1
-    1.0    -0.0    -0.0
-c0
-5
-    90.0    110.0    18.0
-    90.0    110.0    15.0
-    90.0    130.0    15.0
-    90.0    130.0    18.0
-    90.0    110.0    18.0
-f214 1
-    -0.0    1.0    -0.0
-c0
-5
-    90.0    130.0    15.0
-    70.0    130.0    15.0
-    70.0    130.0    18.0
-    90.0    130.0    18.0
-    90.0    130.0    15.0
-f215 1
-    -1.0    0.0    0.0
-c0
-5
-    70.0    130.0    15.0
-    70.0    110.0    15.0
-    70.0    110.0    18.0
-    70.0    130.0    18.0
-    70.0    130.0    15.0
-f216 1
-    0.0    -1.0    0.0
-c0
-5
-    70.0    110.0    15.0
-    90.0    110.0    15.0
-    90.0    110.0    18.0
-    70.0    110.0    18.0
-    70.0    110.0    15.0
-f217 1
-    -0.0    1.0    -0.0
-c0
-5
-    130.0    90.0    18.0
-    110.0    90.0    18.0
-    110.0    90.0    21.0
-    130.0    90.0    21.0
-    130.0    90.0    18.0
-f218 1
-    1.0    -0.0    -0.0
-c0
-5
-    130.0    70.0    21.0
-    130.0    70.0    18.0
-    130.0    90.0    18.0
-    130.0    90.0    21.0
-    130.0    70.0    21.0
-f219 1
-    -1.0    0.0    0.0
-c0
-5
-    110.0    90.0    18.0
-    110.0    70.0    18.0
-    110.0    70.0    21.0
-    110.0    90.0    21.0
-    110.0    90.0    18.0
-f220 1
-    0.0    -1.0    0.0
-c0
-5
-    110.0    70.0    18.0
-    130.0    70.0    18.0
-    130.0    70.0    21.0
-    110.0    70.0    21.0
-    110.0    70.0    18.0
-f221 1
-    -0.0    -0.0    1.0
-c0
-5
-    100.0    100.0    18.0
-    80.0    100.0    18.0
-    80.0    80.0    18.0
-    100.0    80.0    18.0
-    100.0    100.0    18.0
-f222 1
-    -0.0    1.0    -0.0
-c0
-5
-    70.0    95.0    18.0
-    50.0    95.0    18.0
-    50.0    95.0    21.0
-    70.0    95.0    21.0
-    70.0    95.0    18.0
-f223 1
-    1.0    -0.0    -0.0
-c0
-5
-    70.0    75.0    18.0
-    70.0    95.0    18.0
-    70.0    95.0    21.0
-    70.0    75.0    21.0
-    70.0    75.0    18.0
-f224 1
-    -1.0    0.0    0.0
-c0
-5
-    50.0    95.0    18.0
-    50.0    75.0    18.0
-    50.0    75.0    21.0
-    50.0    95.0    21.0
-    50.0    95.0    18.0
-f225 1
-    0.0    -1.0    0.0
-c0
-5
-    50.0    75.0    18.0
-    70.0    75.0    18.0
-    70.0    75.0    21.0
-    50.0    75.0    21.0
-    50.0    75.0    18.0
-f226 1
-    1.0    -0.0    -0.0
-c0
-5
-    50.0    125.0    21.0
-    50.0    105.0    21.0
-    50.0    105.0    18.0
-    50.0    125.0    18.0
-    50.0    125.0    21.0
-f227 1
-    -0.0    1.0    -0.0
-c0
-5
-    50.0    125.0    18.0
-    30.0    125.0    18.0
-    30.0    125.0    21.0
-    50.0    125.0    21.0
-    50.0    125.0    18.0
-f228 1
-    0.0    -1.0    0.0
-c0
-5
-    50.0    105.0    21.0
-    30.0    105.0    21.0
-    30.0    105.0    18.0
-    50.0    105.0    18.0
-    50.0    105.0    21.0
-f229 1
-    -1.0    0.0    0.0
-c0
-5
-    30.0    125.0    21.0
-    30.0    125.0    18.0
-    30.0    105.0    18.0
-    30.0    105.0    21.0
-    30.0    125.0    21.0
-f230 1
-    1.0    -0.0    -0.0
-c0
-5
-    125.0    100.0    18.0
-    125.0    120.0    18.0
-    125.0    120.0    21.0
-    125.0    100.0    21.0
-    125.0    100.0    18.0
-f231 1
-    -0.0    1.0    -0.0
-c0
-5
-    125.0    120.0    18.0
-    105.0    120.0    18.0
-    105.0    120.0    21.0
-    125.0    120.0    21.0
-    125.0    120.0    18.0
-f232 1
-    0.0    -1.0    0.0
-c0
-5
-    105.0    100.0    18.0
-    125.0    100.0    18.0
-    125.0    100.0    21.0
-    105.0    100.0    21.0
-    105.0    100.0    18.0
-f233 1
-    -1.0    0.0    0.0
-c0
-5
-    105.0    120.0    18.0
-    105.0    100.0    18.0
-    105.0    100.0    21.0
-    105.0    120.0    21.0
-    105.0    120.0    18.0
-f234 1
-    1.0    -0.0    -0.0
-c0
-5
-    85.0    70.0    18.0
-    85.0    70.0    21.0
-    85.0    50.0    21.0
-    85.0    50.0    18.0
-    85.0    70.0    18.0
-f235 1
-    -0.0    1.0    -0.0
-c0
-5
-    85.0    70.0    18.0
-    65.0    70.0    18.0
-    65.0    70.0    21.0
-    85.0    70.0    21.0
-    85.0    70.0    18.0
-f236 1
-    0.0    -1.0    0.0
-c0
-5
-    65.0    50.0    21.0
-    65.0    50.0    18.0
-    85.0    50.0    18.0
-    85.0    50.0    21.0
-    65.0    50.0    21.0
-f237 1
-    -1.0    0.0    0.0
-c0
-5
-    65.0    50.0    21.0
-    65.0    70.0    21.0
-    65.0    70.0    18.0
-    65.0    50.0    18.0
-    65.0    50.0    21.0
-f238 1
-    -1.0    0.0    0.0
-c0
-5
-    95.0    55.0    21.0
-    95.0    55.0    18.0
-    95.0    35.0    18.0
-    95.0    35.0    21.0
-    95.0    55.0    21.0
-f239 1
-    -0.0    1.0    -0.0
-c0
-5
-    115.0    55.0    18.0
-    95.0    55.0    18.0
-    95.0    55.0    21.0
-    115.0    55.0    21.0
-    115.0    55.0    18.0
-f240 1
-    0.0    -1.0    0.0
-c0
-5
-    95.0    35.0    18.0
-    115.0    35.0    18.0
-    115.0    35.0    21.0
-    95.0    35.0    21.0
-    95.0    35.0    18.0
-f241 1
-    1.0    -0.0    -0.0
-c0
-5
-    115.0    35.0    18.0
-    115.0    55.0    18.0
-    115.0    55.0    21.0
-    115.0    35.0    21.0
-    115.0    35.0    18.0
-f242 1
-    -0.0    -0.0    1.0
-c0
-5
-    55.0    50.0    18.0
-    35.0    50.0    18.0
-    35.0    30.0    18.0
-    55.0    30.0    18.0
-    55.0    50.0    18.0
-f243 1
-    1.0    -0.0    -0.0
-c0
-5
-    90.0    110.0    18.0
-    90.0    130.0    18.0
-    90.0    130.0    21.0
-    90.0    110.0    21.0
-    90.0    110.0    18.0
-f244 1
-    -0.0    1.0    -0.0
-c0
-5
-    90.0    130.0    18.0
-    70.0    130.0    18.0
-    70.0    130.0    21.0
-    90.0    130.0    21.0
-    90.0    130.0    18.0
-f245 1
-    -1.0    0.0    0.0
-c0
-5
-    70.0    130.0    18.0
-    70.0    110.0    18.0
-    70.0    110.0    21.0
-    70.0    130.0    21.0
-    70.0    130.0    18.0
-f246 1
-    0.0    -1.0    0.0
-c0
-5
-    70.0    110.0    18.0
-    90.0    110.0    18.0
-    90.0    110.0    21.0
-    70.0    110.0    21.0
-    70.0    110.0    18.0
-f247 1
-    -0.0    1.0    -0.0
-c0
-5
-    130.0    90.0    21.0
-    110.0    90.0    21.0
-    110.0    90.0    24.0
-    130.0    90.0    24.0
-    130.0    90.0    21.0
-f248 1
-    1.0    -0.0    -0.0
-c0
-5
-    130.0    70.0    21.0
-    130.0    90.0    21.0
-    130.0    90.0    24.0
-    130.0    70.0    24.0
-    130.0    70.0    21.0
-f249 1
-    -1.0    0.0    0.0
-c0
-5
-    110.0    70.0    21.0
-    110.0    70.0    24.0
-    110.0    90.0    24.0
-    110.0    90.0    21.0
-    110.0    70.0    21.0
-f250 1
-    0.0    -1.0    0.0
-c0
-5
-    110.0    70.0    21.0
-    130.0    70.0    21.0
-    130.0    70.0    24.0
-    110.0    70.0    24.0
-    110.0    70.0    21.0
-f251 1
-    -0.0    1.0    -0.0
-c0
-5
-    70.0    95.0    21.0
-    50.0    95.0    21.0
-    50.0    95.0    24.0
-    70.0    95.0    24.0
-    70.0    95.0    21.0
-f252 1
-    1.0    -0.0    -0.0
-c0
-5
-    70.0    75.0    21.0
-    70.0    95.0    21.0
-    70.0    95.0    24.0
-    70.0    75.0    24.0
-    70.0    75.0    21.0
-f253 1
-    -1.0    0.0    0.0
-c0
-5
-    50.0    95.0    21.0
-    50.0    75.0    21.0
-    50.0    75.0    24.0
-    50.0    95.0    24.0
-    50.0    95.0    21.0
-f254 1
-    0.0    -1.0    0.0
-c0
-5
-    70.0    75.0    24.0
-    50.0    75.0    24.0
-    50.0    75.0    21.0
-    70.0    75.0    21.0
-    70.0    75.0    24.0
-f255 1
-    1.0    -0.0    -0.0
-c0
-5
-    50.0    125.0    24.0
-    50.0    105.0    24.0
-    50.0    105.0    21.0
-    50.0    125.0    21.0
-    50.0    125.0    24.0
-f256 1
-    -0.0    1.0    -0.0
-c0
-5
-    50.0    125.0    21.0
-    30.0    125.0    21.0
-    30.0    125.0    24.0
-    50.0    125.0    24.0
-    50.0    125.0    21.0
-f257 1
-    0.0    -1.0    0.0
-c0
-5
-    30.0    105.0    21.0
-    50.0    105.0    21.0
-    50.0    105.0    24.0
-    30.0    105.0    24.0
-    30.0    105.0    21.0
-f258 1
-    -1.0    0.0    0.0
-c0
-5
-    30.0    125.0    21.0
-    30.0    105.0    21.0
-    30.0    105.0    24.0
-    30.0    125.0    24.0
-    30.0    125.0    21.0
-f259 1
-    1.0    -0.0    -0.0
-c0
-5
-    125.0    100.0    21.0
-    125.0    120.0    21.0
-    125.0    120.0    24.0
-    125.0    100.0    24.0
-    125.0    100.0    21.0
-f260 1
-    -0.0    1.0    -0.0
-c0
-5
-    125.0    120.0    21.0
-    105.0    120.0    21.0
-    105.0    120.0    24.0
-    125.0    120.0    24.0
-    125.0    120.0    21.0
-f261 1
-    0.0    -1.0    0.0
-c0
-5
-    105.0    100.0    21.0
-    125.0    100.0    21.0
-    125.0    100.0    24.0
-    105.0    100.0    24.0
-    105.0    100.0    21.0
-f262 1
-    -1.0    0.0    0.0
-c0
-5
-    105.0    120.0    21.0
-    105.0    100.0    21.0
-    105.0    100.0    24.0
-    105.0    120.0    24.0
-    105.0    120.0    21.0
-f263 1
-    1.0    -0.0    -0.0
-c0
-5
-    85.0    50.0    21.0
-    85.0    70.0    21.0
-    85.0    70.0    24.0
-    85.0    50.0    24.0
-    85.0    50.0    21.0
-f264 1
-    -0.0    1.0    -0.0
-c0
-5
-    85.0    70.0    21.0
-    65.0    70.0    21.0
-    65.0    70.0    24.0
-    85.0    70.0    24.0
-    85.0    70.0    21.0
-f265 1
-    0.0    -1.0    0.0
-c0
-5
-    65.0    50.0    21.0
-    85.0    50.0    21.0
-    85.0    50.0    24.0
-    65.0    50.0    24.0
-    65.0    50.0    21.0
-f266 1
-    -1.0    0.0    0.0
-c0
-5
-    65.0    70.0    21.0
-    65.0    50.0    21.0
-    65.0    50.0    24.0
-    65.0    70.0    24.0
-    65.0    70.0    21.0
-f267 1
-    -1.0    0.0    0.0
-c0
-5
-    95.0    55.0    21.0
-    95.0    35.0    21.0
-    95.0    35.0    24.0
-    95.0    55.0    24.0
-    95.0    55.0    21.0
-f268 1
-    -0.0    1.0    -0.0
-c0
-5
-    115.0    55.0    21.0
-    95.0    55.0    21.0
-    95.0    55.0    24.0
-    115.0    55.0    24.0
-    115.0    55.0    21.0
-f269 1
-    0.0    -1.0    0.0
-c0
-5
-    95.0    35.0    21.0
-    115.0    35.0    21.0
-    115.0    35.0    24.0
-    95.0    35.0    24.0
-    95.0    35.0    21.0
-f270 1
-    -0.0    -0.0    1.0
-c0
-5
-    50.0    95.0    30.0
-    50.0    75.0    30.0
-    70.0    75.0    30.0
-    70.0    95.0    30.0
-    50.0    95.0    30.0
-f271 1
-    1.0    -0.0    -0.0
-c0
-5
-    50.0    125.0    33.0
-    50.0    105.0    33.0
-    50.0    105.0    30.0
-    50.0    125.0    30.0
-    50.0    125.0    33.0
-f272 1
-    -0.0    1.0    -0.0
-c0
-5
-    50.0    125.0    30.0
-    30.0    125.0    30.0
-    30.0    125.0    33.0
-    50.0    125.0    33.0
-    50.0    125.0    30.0
-f273 1
-    0.0    -1.0    0.0
-c0
-5
-    30.0    105.0    30.0
-    50.0    105.0    30.0
-    50.0    105.0    33.0
-    30.0    105.0    33.0
-    30.0    105.0    30.0
-f274 1
-    -1.0    0.0    0.0
-c0
-5
-    30.0    125.0    30.0
-    30.0    105.0    30.0
-    30.0    105.0    33.0
-    30.0    125.0    33.0
-    30.0    125.0    30.0
-f275 1
-    -0.0    -0.0    1.0
-c0
-5
-    125.0    120.0    30.0
-    105.0    120.0    30.0
-    105.0    100.0    30.0
-    125.0    100.0    30.0
-    125.0    120.0    30.0
-f276 1
-    -0.0    -0.0    1.0
-c0
-5
-    95.0    35.0    30.0
-    115.0    35.0    30.0
-    115.0    55.0    30.0
-    95.0    55.0    30.0
-    95.0    35.0    30.0
-f277 1
-    1.0    -0.0    -0.0
-c0
-5
-    90.0    110.0    30.0
-    90.0    130.0    30.0
-    90.0    130.0    33.0
-    90.0    110.0    33.0
-    90.0    110.0    30.0
-f278 1
-    -0.0    1.0    -0.0
-c0
-5
-    90.0    130.0    30.0
-    70.0    130.0    30.0
-    70.0    130.0    33.0
-    90.0    130.0    33.0
-    90.0    130.0    30.0
-f279 1
-    -1.0    0.0    0.0
-c0
-5
-    70.0    130.0    30.0
-    70.0    110.0    30.0
-    70.0    110.0    33.0
-    70.0    130.0    33.0
-    70.0    130.0    30.0
-f280 1
-    0.0    -1.0    0.0
-c0
-5
-    70.0    110.0    30.0
-    90.0    110.0    30.0
-    90.0    110.0    33.0
-    70.0    110.0    33.0
-    70.0    110.0    30.0
-f281 1
-    -0.0    1.0    -0.0
-c0
-5
-    130.0    90.0    36.0
-    130.0    90.0    33.0
-    110.0    90.0    33.0
-    110.0    90.0    36.0
-    130.0    90.0    36.0
-f282 1
-    1.0    -0.0    -0.0
-c0
-5
-    130.0    70.0    33.0
-    130.0    90.0    33.0
-    130.0    90.0    36.0
-    130.0    70.0    36.0
-    130.0    70.0    33.0
-f283 1
-    -1.0    0.0    0.0
-c0
-5
-    110.0    90.0    33.0
-    110.0    70.0    33.0
-    110.0    70.0    36.0
-    110.0    90.0    36.0
-    110.0    90.0    33.0
-f284 1
-    0.0    -1.0    0.0
-c0
-5
-    110.0    70.0    33.0
-    130.0    70.0    33.0
-    130.0    70.0    36.0
-    110.0    70.0    36.0
-    110.0    70.0    33.0
-f285 1
-    1.0    -0.0    -0.0
-c0
-5
-    50.0    105.0    33.0
-    50.0    125.0    33.0
-    50.0    125.0    36.0
-    50.0    105.0    36.0
-    50.0    105.0    33.0
-f286 1
-    -0.0    1.0    -0.0
-c0
-5
-    50.0    125.0    33.0
-    30.0    125.0    33.0
-    30.0    125.0    36.0
-    50.0    125.0    36.0
-    50.0    125.0    33.0
-f287 1
-    0.0    -1.0    0.0
-c0
-5
-    30.0    105.0    33.0
-    50.0    105.0    33.0
-    50.0    105.0    36.0
-    30.0    105.0    36.0
-    30.0    105.0    33.0
-f288 1
-    -1.0    0.0    0.0
-c0
-5
-    30.0    125.0    33.0
-    30.0    105.0    33.0
-    30.0    105.0    36.0
-    30.0    125.0    36.0
-    30.0    125.0    33.0
-f289 1
-    1.0    -0.0    -0.0
-c0
-5
-    90.0    110.0    33.0
-    90.0    130.0    33.0
-    90.0    130.0    36.0
-    90.0    110.0    36.0
-    90.0    110.0    33.0
-f290 1
-    -0.0    1.0    -0.0
-c0
-5
-    90.0    130.0    33.0
-    70.0    130.0    33.0
-    70.0    130.0    36.0
-    90.0    130.0    36.0
-    90.0    130.0    33.0
-f291 1
-    -1.0    0.0    0.0
-c0
-5
-    70.0    110.0    33.0
-    70.0    110.0    36.0
-    70.0    130.0    36.0
-    70.0    130.0    33.0
-    70.0    110.0    33.0
-f292 1
-    0.0    -1.0    0.0
-c0
-5
-    70.0    110.0    33.0
-    90.0    110.0    33.0
-    90.0    110.0    36.0
-    70.0    110.0    36.0
-    70.0    110.0    33.0
-f293 1
-    -0.0    1.0    -0.0
-c0
-5
-    130.0    90.0    36.0
-    110.0    90.0    36.0
-    110.0    90.0    39.0
-    130.0    90.0    39.0
-    130.0    90.0    36.0
-f294 1
-    1.0    -0.0    -0.0
-c0
-5
-    130.0    70.0    36.0
-    130.0    90.0    36.0
-    130.0    90.0    39.0
-    130.0    70.0    39.0
-    130.0    70.0    36.0
-f295 1
-    -1.0    0.0    0.0
-c0
-5
-    110.0    90.0    36.0
-    110.0    70.0    36.0
-    110.0    70.0    39.0
-    110.0    90.0    39.0
-    110.0    90.0    36.0
-f296 1
-    0.0    -1.0    0.0
-c0
-5
-    110.0    70.0    36.0
-    130.0    70.0    36.0
-    130.0    70.0    39.0
-    110.0    70.0    39.0
-    110.0    70.0    36.0
-f297 1
-    1.0    -0.0    -0.0
-c0
-5
-    50.0    105.0    36.0
-    50.0    125.0    36.0
-    50.0    125.0    39.0
-    50.0    105.0    39.0
-    50.0    105.0    36.0
-f298 1
-    -0.0    1.0    -0.0
-c0
-5
-    50.0    125.0    36.0
-    30.0    125.0    36.0
-    30.0    125.0    39.0
-    50.0    125.0    39.0
-    50.0    125.0    36.0
-f299 1
-    0.0    -1.0    0.0
-c0
-5
-    30.0    105.0    36.0
-    50.0    105.0    36.0
-    50.0    105.0    39.0
-    30.0    105.0    39.0
-    30.0    105.0    36.0
-f300 1
-    -1.0    0.0    0.0
-c0
-5
-    30.0    125.0    39.0
-    30.0    125.0    36.0
-    30.0    105.0    36.0
-    30.0    105.0    39.0
-    30.0    125.0    39.0
-f301 1
-    -0.0    -0.0    1.0
-c0
-5
-    90.0    130.0    36.0
-    70.0    130.0    36.0
-    70.0    110.0    36.0
-    90.0    110.0    36.0
-    90.0    130.0    36.0
-f302 1
-    -0.0    1.0    -0.0
-c0
-5
-    130.0    90.0    39.0
-    110.0    90.0    39.0
-    110.0    90.0    42.0
-    130.0    90.0    42.0
-    130.0    90.0    39.0
-f303 1
-    1.0    -0.0    -0.0
-c0
-5
-    130.0    70.0    39.0
-    130.0    90.0    39.0
-    130.0    90.0    42.0
-    130.0    70.0    42.0
-    130.0    70.0    39.0
-f304 1
-    -1.0    0.0    0.0
-c0
-5
-    110.0    70.0    42.0
-    110.0    90.0    42.0
-    110.0    90.0    39.0
-    110.0    70.0    39.0
-    110.0    70.0    42.0
-f305 1
-    0.0    -1.0    0.0
-c0
-5
-    110.0    70.0    39.0
-    130.0    70.0    39.0
-    130.0    70.0    42.0
-    110.0    70.0    42.0
-    110.0    70.0    39.0
-f306 1
-    1.0    -0.0    -0.0
-c0
-5
-    50.0    105.0    39.0
-    50.0    125.0    39.0
-    50.0    125.0    42.0
-    50.0    105.0    42.0
-    50.0    105.0    39.0
-f307 1
-    -0.0    1.0    -0.0
-c0
-5
-    50.0    125.0    39.0
-    30.0    125.0    39.0
-    30.0    125.0    42.0
-    50.0    125.0    42.0
-    50.0    125.0    39.0
-f308 1
-    0.0    -1.0    0.0
-c0
-5
-    30.0    105.0    39.0
-    50.0    105.0    39.0
-    50.0    105.0    42.0
-    30.0    105.0    42.0
-    30.0    105.0    39.0
-f309 1
-    -1.0    0.0    0.0
-c0
-5
-    30.0    125.0    39.0
-    30.0    105.0    39.0
-    30.0    105.0    42.0
-    30.0    125.0    42.0
-    30.0    125.0    39.0
-f310 1
-    -0.0    -0.0    1.0
-c0
-5
-    130.0    90.0    42.0
-    110.0    90.0    42.0
-    110.0    70.0    42.0
-    130.0    70.0    42.0
-    130.0    90.0    42.0
-f311 1
-    -0.0    -0.0    1.0
-c0
-5
-    50.0    125.0    42.0
-    30.0    125.0    42.0
-    30.0    105.0    42.0
-    50.0    105.0    42.0
-    50.0    125.0    42.0
-f312 1
-    1.0    -0.0    -0.0
-c0
-5
-    115.0    35.0    21.0
-    115.0    55.0    21.0
-    115.0    55.0    24.0
-    115.0    35.0    24.0
-    115.0    35.0    21.0
-f313 1
-    1.0    -0.0    -0.0
-c0
-5
-    90.0    110.0    21.0
-    90.0    130.0    21.0
-    90.0    130.0    24.0
-    90.0    110.0    24.0
-    90.0    110.0    21.0
-f314 1
-    -0.0    1.0    -0.0
-c0
-5
-    90.0    130.0    21.0
-    70.0    130.0    21.0
-    70.0    130.0    24.0
-    90.0    130.0    24.0
-    90.0    130.0    21.0
-f315 1
-    -1.0    0.0    0.0
-c0
-5
-    70.0    130.0    21.0
-    70.0    110.0    21.0
-    70.0    110.0    24.0
-    70.0    130.0    24.0
-    70.0    130.0    21.0
-f316 1
-    0.0    -1.0    0.0
-c0
-5
-    70.0    110.0    21.0
-    90.0    110.0    21.0
-    90.0    110.0    24.0
-    70.0    110.0    24.0
-    70.0    110.0    21.0
-f317 1
-    -0.0    1.0    -0.0
-c0
-5
-    130.0    90.0    24.0
-    110.0    90.0    24.0
-    110.0    90.0    27.0
-    130.0    90.0    27.0
-    130.0    90.0    24.0
-f318 1
-    1.0    -0.0    -0.0
-c0
-5
-    130.0    70.0    24.0
-    130.0    90.0    24.0
-    130.0    90.0    27.0
-    130.0    70.0    27.0
-    130.0    70.0    24.0
-f319 1
-    -1.0    0.0    0.0
-c0
-5
-    110.0    90.0    24.0
-    110.0    70.0    24.0
-    110.0    70.0    27.0
-    110.0    90.0    27.0
-    110.0    90.0    24.0
-f320 1
-    0.0    -1.0    0.0
-c0
-5
-    110.0    70.0    24.0
-    130.0    70.0    24.0
-    130.0    70.0    27.0
-    110.0    70.0    27.0
-    110.0    70.0    24.0
-f321 1
-    -0.0    1.0    -0.0
-c0
-5
-    70.0    95.0    24.0
-    50.0    95.0    24.0
-    50.0    95.0    27.0
-    70.0    95.0    27.0
-    70.0    95.0    24.0
-f322 1
-    1.0    -0.0    -0.0
-c0
-5
-    70.0    75.0    24.0
-    70.0    95.0    24.0
-    70.0    95.0    27.0
-    70.0    75.0    27.0
-    70.0    75.0    24.0
-f323 1
-    -1.0    0.0    0.0
-c0
-5
-    50.0    95.0    24.0
-    50.0    75.0    24.0
-    50.0    75.0    27.0
-    50.0    95.0    27.0
-    50.0    95.0    24.0
-f324 1
-    0.0    -1.0    0.0
-c0
-5
-    50.0    75.0    24.0
-    70.0    75.0    24.0
-    70.0    75.0    27.0
-    50.0    75.0    27.0
-    50.0    75.0    24.0
-f325 1
-    1.0    -0.0    -0.0
-c0
-5
-    50.0    105.0    24.0
-    50.0    125.0    24.0
-    50.0    125.0    27.0
-    50.0    105.0    27.0
-    50.0    105.0    24.0
-f326 1
-    -0.0    1.0    -0.0
-c0
-5
-    50.0    125.0    24.0
-    30.0    125.0    24.0
-    30.0    125.0    27.0
-    50.0    125.0    27.0
-    50.0    125.0    24.0
-f327 1
-    0.0    -1.0    0.0
-c0
-5
-    30.0    105.0    24.0
-    50.0    105.0    24.0
-    50.0    105.0    27.0
-    30.0    105.0    27.0
-    30.0    105.0    24.0
-f328 1
-    -1.0    0.0    0.0
-c0
-5
-    30.0    125.0    24.0
-    30.0    105.0    24.0
-    30.0    105.0    27.0
-    30.0    125.0    27.0
-    30.0    125.0    24.0
-f329 1
-    1.0    -0.0    -0.0
-c0
-5
-    125.0    100.0    24.0
-    125.0    120.0    24.0
-    125.0    120.0    27.0
-    125.0    100.0    27.0
-    125.0    100.0    24.0
-f330 1
-    -0.0    1.0    -0.0
-c0
-5
-    125.0    120.0    24.0
-    105.0    120.0    24.0
-    105.0    120.0    27.0
-    125.0    120.0    27.0
-    125.0    120.0    24.0
-f331 1
-    0.0    -1.0    0.0
-c0
-5
-    105.0    100.0    24.0
-    125.0    100.0    24.0
-    125.0    100.0    27.0
-    105.0    100.0    27.0
-    105.0    100.0    24.0
-f332 1
-    -1.0    0.0    0.0
-c0
-5
-    105.0    120.0    24.0
-    105.0    100.0    24.0
-    105.0    100.0    27.0
-    105.0    120.0    27.0
-    105.0    120.0    24.0
-f333 1
-    -0.0    -0.0    1.0
-c0
-5
-    65.0    50.0    24.0
-    85.0    50.0    24.0
-    85.0    70.0    24.0
-    65.0    70.0    24.0
-    65.0    50.0    24.0
-f334 1
-    -1.0    0.0    0.0
-c0
-5
-    95.0    55.0    24.0
-    95.0    35.0    24.0
-    95.0    35.0    27.0
-    95.0    55.0    27.0
-    95.0    55.0    24.0
-f335 1
-    -0.0    1.0    -0.0
-c0
-5
-    115.0    55.0    24.0
-    95.0    55.0    24.0
-    95.0    55.0    27.0
-    115.0    55.0    27.0
-    115.0    55.0    24.0
-f336 1
-    0.0    -1.0    0.0
-c0
-5
-    95.0    35.0    24.0
-    115.0    35.0    24.0
-    115.0    35.0    27.0
-    95.0    35.0    27.0
-    95.0    35.0    24.0
-f337 1
-    1.0    -0.0    -0.0
-c0
-5
-    115.0    35.0    24.0
-    115.0    55.0    24.0
-    115.0    55.0    27.0
-    115.0    35.0    27.0
-    115.0    35.0    24.0
-f338 1
-    1.0    -0.0    -0.0
-c0
-5
-    90.0    130.0    27.0
-    90.0    110.0    27.0
-    90.0    110.0    24.0
-    90.0    130.0    24.0
-    90.0    130.0    27.0
-f339 1
-    -0.0    1.0    -0.0
-c0
-5
-    90.0    130.0    24.0
-    70.0    130.0    24.0
-    70.0    130.0    27.0
-    90.0    130.0    27.0
-    90.0    130.0    24.0
-f340 1
-    -1.0    0.0    0.0
-c0
-5
-    70.0    130.0    24.0
-    70.0    110.0    24.0
-    70.0    110.0    27.0
-    70.0    130.0    27.0
-    70.0    130.0    24.0
-f341 1
-    0.0    -1.0    0.0
-c0
-5
-    70.0    110.0    24.0
-    90.0    110.0    24.0
-    90.0    110.0    27.0
-    70.0    110.0    27.0
-    70.0    110.0    24.0
-f342 1
-    -0.0    1.0    -0.0
-c0
-5
-    130.0    90.0    27.0
-    110.0    90.0    27.0
-    110.0    90.0    30.0
-    130.0    90.0    30.0
-    130.0    90.0    27.0
-f343 1
-    1.0    -0.0    -0.0
-c0
-5
-    130.0    70.0    27.0
-    130.0    90.0    27.0
-    130.0    90.0    30.0
-    130.0    70.0    30.0
-    130.0    70.0    27.0
-f344 1
-    -1.0    0.0    0.0
-c0
-5
-    110.0    90.0    27.0
-    110.0    70.0    27.0
-    110.0    70.0    30.0
-    110.0    90.0    30.0
-    110.0    90.0    27.0
-f345 1
-    0.0    -1.0    0.0
-c0
-5
-    110.0    70.0    27.0
-    130.0    70.0    27.0
-    130.0    70.0    30.0
-    110.0    70.0    30.0
-    110.0    70.0    27.0
-f346 1
-    -0.0    1.0    -0.0
-c0
-5
-    70.0    95.0    27.0
-    50.0    95.0    27.0
-    50.0    95.0    30.0
-    70.0    95.0    30.0
-    70.0    95.0    27.0
-f347 1
-    1.0    -0.0    -0.0
-c0
-5
-    70.0    95.0    30.0
-    70.0    75.0    30.0
-    70.0    75.0    27.0
-    70.0    95.0    27.0
-    70.0    95.0    30.0
-f348 1
-    -1.0    0.0    0.0
-c0
-5
-    50.0    75.0    30.0
-    50.0    95.0    30.0
-    50.0    95.0    27.0
-    50.0    75.0    27.0
-    50.0    75.0    30.0
-f349 1
-    0.0    -1.0    0.0
-c0
-5
-    50.0    75.0    30.0
-    50.0    75.0    27.0
-    70.0    75.0    27.0
-    70.0    75.0    30.0
-    50.0    75.0    30.0
-f350 1
-    1.0    -0.0    -0.0
-c0
-5
-    50.0    105.0    27.0
-    50.0    125.0    27.0
-    50.0    125.0    30.0
-    50.0    105.0    30.0
-    50.0    105.0    27.0
-f351 1
-    -0.0    1.0    -0.0
-c0
-5
-    50.0    125.0    27.0
-    30.0    125.0    27.0
-    30.0    125.0    30.0
-    50.0    125.0    30.0
-    50.0    125.0    27.0
-f352 1
-    0.0    -1.0    0.0
-c0
-5
-    30.0    105.0    27.0
-    50.0    105.0    27.0
-    50.0    105.0    30.0
-    30.0    105.0    30.0
-    30.0    105.0    27.0
-f353 1
-    -1.0    0.0    0.0
-c0
-5
-    30.0    125.0    27.0
-    30.0    105.0    27.0
-    30.0    105.0    30.0
-    30.0    125.0    30.0
-    30.0    125.0    27.0
-f354 1
-    1.0    -0.0    -0.0
-c0
-5
-    125.0    100.0    27.0
-    125.0    120.0    27.0
-    125.0    120.0    30.0
-    125.0    100.0    30.0
-    125.0    100.0    27.0
-f355 1
-    -0.0    1.0    -0.0
-c0
-5
-    125.0    120.0    27.0
-    105.0    120.0    27.0
-    105.0    120.0    30.0
-    125.0    120.0    30.0
-    125.0    120.0    27.0
-f356 1
-    0.0    -1.0    0.0
-c0
-5
-    105.0    100.0    27.0
-    125.0    100.0    27.0
-    125.0    100.0    30.0
-    105.0    100.0    30.0
-    105.0    100.0    27.0
-f357 1
-    -1.0    0.0    0.0
-c0
-5
-    105.0    100.0    30.0
-    105.0    120.0    30.0
-    105.0    120.0    27.0
-    105.0    100.0    27.0
-    105.0    100.0    30.0
-f358 1
-    -1.0    0.0    0.0
-c0
-5
-    95.0    55.0    27.0
-    95.0    35.0    27.0
-    95.0    35.0    30.0
-    95.0    55.0    30.0
-    95.0    55.0    27.0
-f359 1
-    -0.0    1.0    -0.0
-c0
-5
-    115.0    55.0    27.0
-    95.0    55.0    27.0
-    95.0    55.0    30.0
-    115.0    55.0    30.0
-    115.0    55.0    27.0
-f360 1
-    0.0    -1.0    0.0
-c0
-5
-    95.0    35.0    27.0
-    115.0    35.0    27.0
-    115.0    35.0    30.0
-    95.0    35.0    30.0
-    95.0    35.0    27.0
-f361 1
-    1.0    -0.0    -0.0
-c0
-5
-    115.0    35.0    27.0
-    115.0    55.0    27.0
-    115.0    55.0    30.0
-    115.0    35.0    30.0
-    115.0    35.0    27.0
-f362 1
-    -0.0    1.0    -0.0
-c0
-5
-    90.0    130.0    27.0
-    70.0    130.0    27.0
-    70.0    130.0    30.0
-    90.0    130.0    30.0
-    90.0    130.0    27.0
-f363 1
-    -1.0    0.0    0.0
-c0
-5
-    70.0    130.0    27.0
-    70.0    110.0    27.0
-    70.0    110.0    30.0
-    70.0    130.0    30.0
-    70.0    130.0    27.0
-f364 1
-    0.0    -1.0    0.0
-c0
-5
-    70.0    110.0    27.0
-    90.0    110.0    27.0
-    90.0    110.0    30.0
-    70.0    110.0    30.0
-    70.0    110.0    27.0
-f365 1
-    -0.0    1.0    -0.0
-c0
-5
-    130.0    90.0    33.0
-    130.0    90.0    30.0
-    110.0    90.0    30.0
-    110.0    90.0    33.0
-    130.0    90.0    33.0
-f366 1
-    1.0    -0.0    -0.0
-c0
-5
-    130.0    70.0    30.0
-    130.0    90.0    30.0
-    130.0    90.0    33.0
-    130.0    70.0    33.0
-    130.0    70.0    30.0
-f367 1
-    -1.0    0.0    0.0
-c0
-5
-    110.0    90.0    30.0
-    110.0    70.0    30.0
-    110.0    70.0    33.0
-    110.0    90.0    33.0
-    110.0    90.0    30.0
-f368 1
-    0.0    -1.0    0.0
-c0
-5
-    110.0    70.0    30.0
-    130.0    70.0    30.0
-    130.0    70.0    33.0
-    110.0    70.0    33.0
-    110.0    70.0    30.0
-f369 1
-    1.0    -0.0    -0.0
-c0
-5
-    90.0    110.0    27.0
-    90.0    130.0    27.0
-    90.0    130.0    30.0
-    90.0    110.0    30.0
-    90.0    110.0    27.0
-f370 1
-    -0.0    -0.0    1.0
-c9
-5
-    0.0    150.0    0.0
-    0.0    0.0    0.0
-    150.0    0.0    0.0
-    150.0    150.0    0.0
-    0.0    150.0    0.0
-t
-5
-    55.0    50.0    0.0
-    55.0    30.0    0.0
-    35.0    30.0    0.0
-    35.0    50.0    0.0
-    55.0    50.0    0.0
-t
-5
-    95.0    35.0    0.0
-    95.0    55.0    0.0
-    115.0    55.0    0.0
-    115.0    35.0    0.0
-    95.0    35.0    0.0
-t
-5
-    65.0    50.0    0.0
-    65.0    70.0    0.0
-    85.0    70.0    0.0
-    85.0    50.0    0.0
-    65.0    50.0    0.0
-t
-5
-    130.0    90.0    0.0
-    130.0    70.0    0.0
-    110.0    70.0    0.0
-    110.0    90.0    0.0
-    130.0    90.0    0.0
-t
-5
-    50.0    95.0    0.0
-    70.0    95.0    0.0
-    70.0    75.0    0.0
-    50.0    75.0    0.0
-    50.0    95.0    0.0
-t
-5
-    100.0    100.0    0.0
-    100.0    80.0    0.0
-    80.0    80.0    0.0
-    80.0    100.0    0.0
-    100.0    100.0    0.0
-t
-5
-    125.0    120.0    0.0
-    125.0    100.0    0.0
-    105.0    100.0    0.0
-    105.0    120.0    0.0
-    125.0    120.0    0.0
-t
-5
-    50.0    105.0    0.0
-    30.0    105.0    0.0
-    30.0    125.0    0.0
-    50.0    125.0    0.0
-    50.0    105.0    0.0
-t
-5
-    90.0    110.0    0.0
-    70.0    110.0    0.0
-    70.0    130.0    0.0
-    90.0    130.0    0.0
-    90.0    110.0    0.0
-""")
+        sio = AbstractGeoDataFrameDemos._dataset(
+            "GeoDataFrameDemos5", "cirSceneMasque1Corr.cir"
+        )
         return CirReader(sio).run()
 
     @staticmethod
@@ -6800,19994 +68,16 @@ t
 
         PUIS TRAITEMENT DES ORIENTATIONS DES FACES SOUS SketchUp
         '''
-        sio = StringIO("""2080    2080
-    99999    99999
-    99999    99999
-    99999    99999
-    99999    99999
-    99999    99999
-f1 1
-    -0.0    1.0    -0.0
-c0
-4
-    130.0    90.0    0.0
-    120.0    90.0    3.0
-    130.0    90.0    3.0
-    130.0    90.0    0.0
-f2 1
-    -0.0    1.0    -0.0
-c0
-4
-    120.0    90.0    0.0
-    120.0    90.0    3.0
-    130.0    90.0    0.0
-    120.0    90.0    0.0
-f3 1
-    -0.0    1.0    -0.0
-c0
-4
-    110.0    90.0    0.0
-    110.0    90.0    3.0
-    120.0    90.0    3.0
-    110.0    90.0    0.0
-f4 1
-    -0.0    1.0    -0.0
-c0
-4
-    120.0    90.0    0.0
-    110.0    90.0    0.0
-    120.0    90.0    3.0
-    120.0    90.0    0.0
-f5 1
-    1.0    -0.0    -0.0
-c0
-4
-    130.0    80.0    3.0
-    130.0    90.0    0.0
-    130.0    90.0    3.0
-    130.0    80.0    3.0
-f6 1
-    1.0    -0.0    -0.0
-c0
-4
-    130.0    80.0    3.0
-    130.0    80.0    0.0
-    130.0    90.0    0.0
-    130.0    80.0    3.0
-f7 1
-    1.0    -0.0    -0.0
-c0
-4
-    130.0    70.0    3.0
-    130.0    70.0    0.0
-    130.0    80.0    0.0
-    130.0    70.0    3.0
-f8 1
-    1.0    -0.0    -0.0
-c0
-4
-    130.0    80.0    3.0
-    130.0    70.0    3.0
-    130.0    80.0    0.0
-    130.0    80.0    3.0
-f9 1
-    -1.0    0.0    0.0
-c0
-4
-    110.0    90.0    0.0
-    110.0    80.0    0.0
-    110.0    90.0    3.0
-    110.0    90.0    0.0
-f10 1
-    -1.0    0.0    0.0
-c0
-4
-    110.0    80.0    0.0
-    110.0    80.0    3.0
-    110.0    90.0    3.0
-    110.0    80.0    0.0
-f11 1
-    -1.0    0.0    0.0
-c0
-4
-    110.0    80.0    0.0
-    110.0    70.0    0.0
-    110.0    70.0    3.0
-    110.0    80.0    0.0
-f12 1
-    -1.0    0.0    0.0
-c0
-4
-    110.0    80.0    0.0
-    110.0    70.0    3.0
-    110.0    80.0    3.0
-    110.0    80.0    0.0
-f13 1
-    0.0    -1.0    0.0
-c0
-4
-    130.0    70.0    3.0
-    120.0    70.0    0.0
-    130.0    70.0    0.0
-    130.0    70.0    3.0
-f14 1
-    0.0    -1.0    0.0
-c0
-4
-    120.0    70.0    3.0
-    120.0    70.0    0.0
-    130.0    70.0    3.0
-    120.0    70.0    3.0
-f15 1
-    0.0    -1.0    0.0
-c0
-4
-    120.0    70.0    3.0
-    110.0    70.0    3.0
-    110.0    70.0    0.0
-    120.0    70.0    3.0
-f16 1
-    0.0    -1.0    0.0
-c0
-4
-    120.0    70.0    3.0
-    110.0    70.0    0.0
-    120.0    70.0    0.0
-    120.0    70.0    3.0
-f17 1
-    1.0    -0.0    -0.0
-c0
-4
-    100.0    90.0    3.0
-    100.0    80.0    3.0
-    100.0    80.0    0.0
-    100.0    90.0    3.0
-f18 1
-    1.0    -0.0    -0.0
-c0
-4
-    100.0    90.0    3.0
-    100.0    80.0    0.0
-    100.0    90.0    0.0
-    100.0    90.0    3.0
-f19 1
-    1.0    -0.0    -0.0
-c0
-4
-    100.0    100.0    3.0
-    100.0    90.0    3.0
-    100.0    100.0    0.0
-    100.0    100.0    3.0
-f20 1
-    1.0    -0.0    -0.0
-c0
-4
-    100.0    90.0    3.0
-    100.0    90.0    0.0
-    100.0    100.0    0.0
-    100.0    90.0    3.0
-f21 1
-    -0.0    1.0    -0.0
-c0
-4
-    100.0    100.0    0.0
-    90.0    100.0    0.0
-    100.0    100.0    3.0
-    100.0    100.0    0.0
-f22 1
-    -0.0    1.0    -0.0
-c0
-4
-    90.0    100.0    0.0
-    90.0    100.0    3.0
-    100.0    100.0    3.0
-    90.0    100.0    0.0
-f23 1
-    -0.0    1.0    -0.0
-c0
-4
-    80.0    100.0    0.0
-    80.0    100.0    3.0
-    90.0    100.0    3.0
-    80.0    100.0    0.0
-f24 1
-    -0.0    1.0    -0.0
-c0
-4
-    80.0    100.0    0.0
-    90.0    100.0    3.0
-    90.0    100.0    0.0
-    80.0    100.0    0.0
-f25 1
-    0.0    -1.0    0.0
-c0
-4
-    90.0    80.0    3.0
-    100.0    80.0    0.0
-    100.0    80.0    3.0
-    90.0    80.0    3.0
-f26 1
-    0.0    -1.0    0.0
-c0
-4
-    90.0    80.0    3.0
-    90.0    80.0    0.0
-    100.0    80.0    0.0
-    90.0    80.0    3.0
-f27 1
-    0.0    -1.0    0.0
-c0
-4
-    80.0    80.0    3.0
-    80.0    80.0    0.0
-    90.0    80.0    0.0
-    80.0    80.0    3.0
-f28 1
-    0.0    -1.0    0.0
-c0
-4
-    90.0    80.0    3.0
-    80.0    80.0    3.0
-    90.0    80.0    0.0
-    90.0    80.0    3.0
-f29 1
-    -1.0    0.0    0.0
-c0
-4
-    80.0    100.0    3.0
-    80.0    100.0    0.0
-    80.0    90.0    3.0
-    80.0    100.0    3.0
-f30 1
-    -1.0    0.0    0.0
-c0
-4
-    80.0    90.0    3.0
-    80.0    100.0    0.0
-    80.0    90.0    0.0
-    80.0    90.0    3.0
-f31 1
-    -1.0    0.0    0.0
-c0
-4
-    80.0    90.0    3.0
-    80.0    80.0    0.0
-    80.0    80.0    3.0
-    80.0    90.0    3.0
-f32 1
-    -1.0    0.0    0.0
-c0
-4
-    80.0    90.0    3.0
-    80.0    90.0    0.0
-    80.0    80.0    0.0
-    80.0    90.0    3.0
-f33 1
-    -0.0    1.0    -0.0
-c0
-4
-    60.0    95.0    0.0
-    70.0    95.0    3.0
-    70.0    95.0    0.0
-    60.0    95.0    0.0
-f34 1
-    -0.0    1.0    -0.0
-c0
-4
-    50.0    95.0    0.0
-    50.0    95.0    3.0
-    60.0    95.0    3.0
-    50.0    95.0    0.0
-f35 1
-    -0.0    1.0    -0.0
-c0
-4
-    60.0    95.0    0.0
-    50.0    95.0    0.0
-    60.0    95.0    3.0
-    60.0    95.0    0.0
-f36 1
-    -0.0    1.0    -0.0
-c0
-4
-    60.0    95.0    0.0
-    60.0    95.0    3.0
-    70.0    95.0    3.0
-    60.0    95.0    0.0
-f37 1
-    1.0    -0.0    -0.0
-c0
-4
-    70.0    85.0    3.0
-    70.0    95.0    0.0
-    70.0    95.0    3.0
-    70.0    85.0    3.0
-f38 1
-    1.0    -0.0    -0.0
-c0
-4
-    70.0    85.0    3.0
-    70.0    85.0    0.0
-    70.0    95.0    0.0
-    70.0    85.0    3.0
-f39 1
-    1.0    -0.0    -0.0
-c0
-4
-    70.0    75.0    3.0
-    70.0    75.0    0.0
-    70.0    85.0    0.0
-    70.0    75.0    3.0
-f40 1
-    1.0    -0.0    -0.0
-c0
-4
-    70.0    85.0    3.0
-    70.0    75.0    3.0
-    70.0    85.0    0.0
-    70.0    85.0    3.0
-f41 1
-    -1.0    0.0    0.0
-c0
-4
-    50.0    95.0    0.0
-    50.0    85.0    3.0
-    50.0    95.0    3.0
-    50.0    95.0    0.0
-f42 1
-    -1.0    0.0    0.0
-c0
-4
-    50.0    95.0    0.0
-    50.0    85.0    0.0
-    50.0    85.0    3.0
-    50.0    95.0    0.0
-f43 1
-    -1.0    0.0    0.0
-c0
-4
-    50.0    75.0    0.0
-    50.0    75.0    3.0
-    50.0    85.0    3.0
-    50.0    75.0    0.0
-f44 1
-    -1.0    0.0    0.0
-c0
-4
-    50.0    85.0    0.0
-    50.0    75.0    0.0
-    50.0    85.0    3.0
-    50.0    85.0    0.0
-f45 1
-    0.0    -1.0    0.0
-c0
-4
-    70.0    75.0    3.0
-    60.0    75.0    0.0
-    70.0    75.0    0.0
-    70.0    75.0    3.0
-f46 1
-    0.0    -1.0    0.0
-c0
-4
-    60.0    75.0    3.0
-    60.0    75.0    0.0
-    70.0    75.0    3.0
-    60.0    75.0    3.0
-f47 1
-    0.0    -1.0    0.0
-c0
-4
-    60.0    75.0    3.0
-    50.0    75.0    3.0
-    50.0    75.0    0.0
-    60.0    75.0    3.0
-f48 1
-    0.0    -1.0    0.0
-c0
-4
-    60.0    75.0    3.0
-    50.0    75.0    0.0
-    60.0    75.0    0.0
-    60.0    75.0    3.0
-f49 1
-    1.0    -0.0    -0.0
-c0
-4
-    50.0    105.0    3.0
-    50.0    105.0    0.0
-    50.0    115.0    0.0
-    50.0    105.0    3.0
-f50 1
-    1.0    -0.0    -0.0
-c0
-4
-    50.0    125.0    3.0
-    50.0    115.0    0.0
-    50.0    125.0    0.0
-    50.0    125.0    3.0
-f51 1
-    1.0    -0.0    -0.0
-c0
-4
-    50.0    115.0    3.0
-    50.0    115.0    0.0
-    50.0    125.0    3.0
-    50.0    115.0    3.0
-f52 1
-    1.0    -0.0    -0.0
-c0
-4
-    50.0    115.0    3.0
-    50.0    105.0    3.0
-    50.0    115.0    0.0
-    50.0    115.0    3.0
-f53 1
-    -0.0    1.0    -0.0
-c0
-4
-    50.0    125.0    0.0
-    40.0    125.0    3.0
-    50.0    125.0    3.0
-    50.0    125.0    0.0
-f54 1
-    -0.0    1.0    -0.0
-c0
-4
-    50.0    125.0    0.0
-    40.0    125.0    0.0
-    40.0    125.0    3.0
-    50.0    125.0    0.0
-f55 1
-    -0.0    1.0    -0.0
-c0
-4
-    30.0    125.0    0.0
-    30.0    125.0    3.0
-    40.0    125.0    3.0
-    30.0    125.0    0.0
-f56 1
-    -0.0    1.0    -0.0
-c0
-4
-    30.0    125.0    0.0
-    40.0    125.0    3.0
-    40.0    125.0    0.0
-    30.0    125.0    0.0
-f57 1
-    0.0    -1.0    0.0
-c0
-4
-    50.0    105.0    3.0
-    40.0    105.0    3.0
-    50.0    105.0    0.0
-    50.0    105.0    3.0
-f58 1
-    0.0    -1.0    0.0
-c0
-4
-    40.0    105.0    3.0
-    40.0    105.0    0.0
-    50.0    105.0    0.0
-    40.0    105.0    3.0
-f59 1
-    0.0    -1.0    0.0
-c0
-4
-    30.0    105.0    3.0
-    30.0    105.0    0.0
-    40.0    105.0    3.0
-    30.0    105.0    3.0
-f60 1
-    0.0    -1.0    0.0
-c0
-4
-    40.0    105.0    3.0
-    30.0    105.0    0.0
-    40.0    105.0    0.0
-    40.0    105.0    3.0
-f61 1
-    -1.0    0.0    0.0
-c0
-4
-    30.0    115.0    0.0
-    30.0    125.0    3.0
-    30.0    125.0    0.0
-    30.0    115.0    0.0
-f62 1
-    -1.0    0.0    0.0
-c0
-4
-    30.0    115.0    0.0
-    30.0    115.0    3.0
-    30.0    125.0    3.0
-    30.0    115.0    0.0
-f63 1
-    -1.0    0.0    0.0
-c0
-4
-    30.0    115.0    0.0
-    30.0    105.0    0.0
-    30.0    105.0    3.0
-    30.0    115.0    0.0
-f64 1
-    -1.0    0.0    0.0
-c0
-4
-    30.0    115.0    0.0
-    30.0    105.0    3.0
-    30.0    115.0    3.0
-    30.0    115.0    0.0
-f65 1
-    1.0    -0.0    -0.0
-c0
-4
-    125.0    100.0    3.0
-    125.0    100.0    0.0
-    125.0    110.0    3.0
-    125.0    100.0    3.0
-f66 1
-    1.0    -0.0    -0.0
-c0
-4
-    125.0    110.0    3.0
-    125.0    100.0    0.0
-    125.0    110.0    0.0
-    125.0    110.0    3.0
-f67 1
-    1.0    -0.0    -0.0
-c0
-4
-    125.0    120.0    3.0
-    125.0    110.0    0.0
-    125.0    120.0    0.0
-    125.0    120.0    3.0
-f68 1
-    1.0    -0.0    -0.0
-c0
-4
-    125.0    120.0    3.0
-    125.0    110.0    3.0
-    125.0    110.0    0.0
-    125.0    120.0    3.0
-f69 1
-    -0.0    1.0    -0.0
-c0
-4
-    125.0    120.0    0.0
-    115.0    120.0    3.0
-    125.0    120.0    3.0
-    125.0    120.0    0.0
-f70 1
-    -0.0    1.0    -0.0
-c0
-4
-    115.0    120.0    0.0
-    115.0    120.0    3.0
-    125.0    120.0    0.0
-    115.0    120.0    0.0
-f71 1
-    -0.0    1.0    -0.0
-c0
-4
-    115.0    120.0    0.0
-    105.0    120.0    0.0
-    105.0    120.0    3.0
-    115.0    120.0    0.0
-f72 1
-    -0.0    1.0    -0.0
-c0
-4
-    115.0    120.0    0.0
-    105.0    120.0    3.0
-    115.0    120.0    3.0
-    115.0    120.0    0.0
-f73 1
-    0.0    -1.0    0.0
-c0
-4
-    125.0    100.0    3.0
-    115.0    100.0    0.0
-    125.0    100.0    0.0
-    125.0    100.0    3.0
-f74 1
-    0.0    -1.0    0.0
-c0
-4
-    125.0    100.0    3.0
-    115.0    100.0    3.0
-    115.0    100.0    0.0
-    125.0    100.0    3.0
-f75 1
-    0.0    -1.0    0.0
-c0
-4
-    105.0    100.0    3.0
-    105.0    100.0    0.0
-    115.0    100.0    3.0
-    105.0    100.0    3.0
-f76 1
-    0.0    -1.0    0.0
-c0
-4
-    115.0    100.0    3.0
-    105.0    100.0    0.0
-    115.0    100.0    0.0
-    115.0    100.0    3.0
-f77 1
-    -1.0    0.0    0.0
-c0
-4
-    105.0    110.0    0.0
-    105.0    120.0    3.0
-    105.0    120.0    0.0
-    105.0    110.0    0.0
-f78 1
-    -1.0    0.0    0.0
-c0
-4
-    105.0    110.0    0.0
-    105.0    110.0    3.0
-    105.0    120.0    3.0
-    105.0    110.0    0.0
-f79 1
-    -1.0    0.0    0.0
-c0
-4
-    105.0    100.0    0.0
-    105.0    100.0    3.0
-    105.0    110.0    3.0
-    105.0    100.0    0.0
-f80 1
-    -1.0    0.0    0.0
-c0
-4
-    105.0    100.0    0.0
-    105.0    110.0    3.0
-    105.0    110.0    0.0
-    105.0    100.0    0.0
-f81 1
-    1.0    -0.0    -0.0
-c0
-4
-    85.0    50.0    3.0
-    85.0    50.0    0.0
-    85.0    60.0    3.0
-    85.0    50.0    3.0
-f82 1
-    1.0    -0.0    -0.0
-c0
-4
-    85.0    60.0    3.0
-    85.0    50.0    0.0
-    85.0    60.0    0.0
-    85.0    60.0    3.0
-f83 1
-    1.0    -0.0    -0.0
-c0
-4
-    85.0    70.0    3.0
-    85.0    60.0    0.0
-    85.0    70.0    0.0
-    85.0    70.0    3.0
-f84 1
-    1.0    -0.0    -0.0
-c0
-4
-    85.0    60.0    3.0
-    85.0    60.0    0.0
-    85.0    70.0    3.0
-    85.0    60.0    3.0
-f85 1
-    -0.0    1.0    -0.0
-c0
-4
-    85.0    70.0    0.0
-    75.0    70.0    0.0
-    85.0    70.0    3.0
-    85.0    70.0    0.0
-f86 1
-    -0.0    1.0    -0.0
-c0
-4
-    75.0    70.0    0.0
-    75.0    70.0    3.0
-    85.0    70.0    3.0
-    75.0    70.0    0.0
-f87 1
-    -0.0    1.0    -0.0
-c0
-4
-    65.0    70.0    0.0
-    65.0    70.0    3.0
-    75.0    70.0    3.0
-    65.0    70.0    0.0
-f88 1
-    -0.0    1.0    -0.0
-c0
-4
-    65.0    70.0    0.0
-    75.0    70.0    3.0
-    75.0    70.0    0.0
-    65.0    70.0    0.0
-f89 1
-    0.0    -1.0    0.0
-c0
-4
-    85.0    50.0    3.0
-    75.0    50.0    3.0
-    85.0    50.0    0.0
-    85.0    50.0    3.0
-f90 1
-    0.0    -1.0    0.0
-c0
-4
-    75.0    50.0    3.0
-    75.0    50.0    0.0
-    85.0    50.0    0.0
-    75.0    50.0    3.0
-f91 1
-    0.0    -1.0    0.0
-c0
-4
-    65.0    50.0    3.0
-    65.0    50.0    0.0
-    75.0    50.0    3.0
-    65.0    50.0    3.0
-f92 1
-    0.0    -1.0    0.0
-c0
-4
-    75.0    50.0    3.0
-    65.0    50.0    0.0
-    75.0    50.0    0.0
-    75.0    50.0    3.0
-f93 1
-    -1.0    0.0    0.0
-c0
-4
-    65.0    70.0    0.0
-    65.0    60.0    3.0
-    65.0    70.0    3.0
-    65.0    70.0    0.0
-f94 1
-    -1.0    0.0    0.0
-c0
-4
-    65.0    60.0    0.0
-    65.0    60.0    3.0
-    65.0    70.0    0.0
-    65.0    60.0    0.0
-f95 1
-    -1.0    0.0    0.0
-c0
-4
-    65.0    60.0    0.0
-    65.0    50.0    0.0
-    65.0    50.0    3.0
-    65.0    60.0    0.0
-f96 1
-    -1.0    0.0    0.0
-c0
-4
-    65.0    60.0    0.0
-    65.0    50.0    3.0
-    65.0    60.0    3.0
-    65.0    60.0    0.0
-f97 1
-    -1.0    0.0    0.0
-c0
-4
-    95.0    55.0    0.0
-    95.0    45.0    3.0
-    95.0    55.0    3.0
-    95.0    55.0    0.0
-f98 1
-    -1.0    0.0    0.0
-c0
-4
-    95.0    55.0    0.0
-    95.0    45.0    0.0
-    95.0    45.0    3.0
-    95.0    55.0    0.0
-f99 1
-    -1.0    0.0    0.0
-c0
-4
-    95.0    35.0    0.0
-    95.0    35.0    3.0
-    95.0    45.0    0.0
-    95.0    35.0    0.0
-f100 1
-    -1.0    0.0    0.0
-c0
-4
-    95.0    45.0    0.0
-    95.0    35.0    3.0
-    95.0    45.0    3.0
-    95.0    45.0    0.0
-f101 1
-    -0.0    1.0    -0.0
-c0
-4
-    95.0    55.0    0.0
-    95.0    55.0    3.0
-    105.0    55.0    0.0
-    95.0    55.0    0.0
-f102 1
-    -0.0    1.0    -0.0
-c0
-4
-    105.0    55.0    0.0
-    95.0    55.0    3.0
-    105.0    55.0    3.0
-    105.0    55.0    0.0
-f103 1
-    -0.0    1.0    -0.0
-c0
-4
-    115.0    55.0    0.0
-    105.0    55.0    0.0
-    115.0    55.0    3.0
-    115.0    55.0    0.0
-f104 1
-    -0.0    1.0    -0.0
-c0
-4
-    105.0    55.0    0.0
-    105.0    55.0    3.0
-    115.0    55.0    3.0
-    105.0    55.0    0.0
-f105 1
-    0.0    -1.0    0.0
-c0
-4
-    105.0    35.0    3.0
-    95.0    35.0    3.0
-    95.0    35.0    0.0
-    105.0    35.0    3.0
-f106 1
-    0.0    -1.0    0.0
-c0
-4
-    105.0    35.0    3.0
-    95.0    35.0    0.0
-    105.0    35.0    0.0
-    105.0    35.0    3.0
-f107 1
-    0.0    -1.0    0.0
-c0
-4
-    115.0    35.0    3.0
-    105.0    35.0    0.0
-    115.0    35.0    0.0
-    115.0    35.0    3.0
-f108 1
-    0.0    -1.0    0.0
-c0
-4
-    105.0    35.0    3.0
-    105.0    35.0    0.0
-    115.0    35.0    3.0
-    105.0    35.0    3.0
-f109 1
-    1.0    -0.0    -0.0
-c0
-4
-    115.0    55.0    3.0
-    115.0    45.0    0.0
-    115.0    55.0    0.0
-    115.0    55.0    3.0
-f110 1
-    1.0    -0.0    -0.0
-c0
-4
-    115.0    55.0    3.0
-    115.0    45.0    3.0
-    115.0    45.0    0.0
-    115.0    55.0    3.0
-f111 1
-    1.0    -0.0    -0.0
-c0
-4
-    115.0    45.0    3.0
-    115.0    35.0    3.0
-    115.0    35.0    0.0
-    115.0    45.0    3.0
-f112 1
-    1.0    -0.0    -0.0
-c0
-4
-    115.0    45.0    3.0
-    115.0    35.0    0.0
-    115.0    45.0    0.0
-    115.0    45.0    3.0
-f113 1
-    1.0    -0.0    -0.0
-c0
-4
-    55.0    30.0    3.0
-    55.0    30.0    0.0
-    55.0    40.0    3.0
-    55.0    30.0    3.0
-f114 1
-    1.0    -0.0    -0.0
-c0
-4
-    55.0    40.0    3.0
-    55.0    30.0    0.0
-    55.0    40.0    0.0
-    55.0    40.0    3.0
-f115 1
-    1.0    -0.0    -0.0
-c0
-4
-    55.0    50.0    3.0
-    55.0    40.0    0.0
-    55.0    50.0    0.0
-    55.0    50.0    3.0
-f116 1
-    1.0    -0.0    -0.0
-c0
-4
-    55.0    50.0    3.0
-    55.0    40.0    3.0
-    55.0    40.0    0.0
-    55.0    50.0    3.0
-f117 1
-    -0.0    1.0    -0.0
-c0
-4
-    55.0    50.0    0.0
-    45.0    50.0    0.0
-    55.0    50.0    3.0
-    55.0    50.0    0.0
-f118 1
-    -0.0    1.0    -0.0
-c0
-4
-    45.0    50.0    0.0
-    45.0    50.0    3.0
-    55.0    50.0    3.0
-    45.0    50.0    0.0
-f119 1
-    -0.0    1.0    -0.0
-c0
-4
-    35.0    50.0    0.0
-    35.0    50.0    3.0
-    45.0    50.0    3.0
-    35.0    50.0    0.0
-f120 1
-    -0.0    1.0    -0.0
-c0
-4
-    35.0    50.0    0.0
-    45.0    50.0    3.0
-    45.0    50.0    0.0
-    35.0    50.0    0.0
-f121 1
-    0.0    -1.0    0.0
-c0
-4
-    55.0    30.0    3.0
-    45.0    30.0    0.0
-    55.0    30.0    0.0
-    55.0    30.0    3.0
-f122 1
-    0.0    -1.0    0.0
-c0
-4
-    55.0    30.0    3.0
-    45.0    30.0    3.0
-    45.0    30.0    0.0
-    55.0    30.0    3.0
-f123 1
-    0.0    -1.0    0.0
-c0
-4
-    35.0    30.0    3.0
-    35.0    30.0    0.0
-    45.0    30.0    3.0
-    35.0    30.0    3.0
-f124 1
-    0.0    -1.0    0.0
-c0
-4
-    45.0    30.0    3.0
-    35.0    30.0    0.0
-    45.0    30.0    0.0
-    45.0    30.0    3.0
-f125 1
-    -1.0    0.0    0.0
-c0
-4
-    35.0    50.0    0.0
-    35.0    40.0    3.0
-    35.0    50.0    3.0
-    35.0    50.0    0.0
-f126 1
-    -1.0    0.0    0.0
-c0
-4
-    35.0    40.0    0.0
-    35.0    40.0    3.0
-    35.0    50.0    0.0
-    35.0    40.0    0.0
-f127 1
-    -1.0    0.0    0.0
-c0
-4
-    35.0    40.0    0.0
-    35.0    30.0    0.0
-    35.0    30.0    3.0
-    35.0    40.0    0.0
-f128 1
-    -1.0    0.0    0.0
-c0
-4
-    35.0    40.0    0.0
-    35.0    30.0    3.0
-    35.0    40.0    3.0
-    35.0    40.0    0.0
-f129 1
-    1.0    -0.0    -0.0
-c0
-4
-    90.0    110.0    3.0
-    90.0    110.0    0.0
-    90.0    120.0    0.0
-    90.0    110.0    3.0
-f130 1
-    1.0    -0.0    -0.0
-c0
-4
-    90.0    120.0    3.0
-    90.0    130.0    0.0
-    90.0    130.0    3.0
-    90.0    120.0    3.0
-f131 1
-    1.0    -0.0    -0.0
-c0
-4
-    90.0    120.0    3.0
-    90.0    120.0    0.0
-    90.0    130.0    0.0
-    90.0    120.0    3.0
-f132 1
-    1.0    -0.0    -0.0
-c0
-4
-    90.0    120.0    3.0
-    90.0    110.0    3.0
-    90.0    120.0    0.0
-    90.0    120.0    3.0
-f133 1
-    -0.0    1.0    -0.0
-c0
-4
-    90.0    130.0    0.0
-    80.0    130.0    3.0
-    90.0    130.0    3.0
-    90.0    130.0    0.0
-f134 1
-    -0.0    1.0    -0.0
-c0
-4
-    90.0    130.0    0.0
-    80.0    130.0    0.0
-    80.0    130.0    3.0
-    90.0    130.0    0.0
-f135 1
-    -0.0    1.0    -0.0
-c0
-4
-    70.0    130.0    0.0
-    70.0    130.0    3.0
-    80.0    130.0    0.0
-    70.0    130.0    0.0
-f136 1
-    -0.0    1.0    -0.0
-c0
-4
-    80.0    130.0    0.0
-    70.0    130.0    3.0
-    80.0    130.0    3.0
-    80.0    130.0    0.0
-f137 1
-    -1.0    0.0    0.0
-c0
-4
-    70.0    130.0    0.0
-    70.0    120.0    3.0
-    70.0    130.0    3.0
-    70.0    130.0    0.0
-f138 1
-    -1.0    0.0    0.0
-c0
-4
-    70.0    120.0    0.0
-    70.0    120.0    3.0
-    70.0    130.0    0.0
-    70.0    120.0    0.0
-f139 1
-    -1.0    0.0    0.0
-c0
-4
-    70.0    120.0    0.0
-    70.0    110.0    0.0
-    70.0    110.0    3.0
-    70.0    120.0    0.0
-f140 1
-    -1.0    0.0    0.0
-c0
-4
-    70.0    120.0    0.0
-    70.0    110.0    3.0
-    70.0    120.0    3.0
-    70.0    120.0    0.0
-f141 1
-    0.0    -1.0    0.0
-c0
-4
-    80.0    110.0    0.0
-    90.0    110.0    0.0
-    90.0    110.0    3.0
-    80.0    110.0    0.0
-f142 1
-    0.0    -1.0    0.0
-c0
-4
-    80.0    110.0    0.0
-    90.0    110.0    3.0
-    80.0    110.0    3.0
-    80.0    110.0    0.0
-f143 1
-    0.0    -1.0    0.0
-c0
-4
-    70.0    110.0    0.0
-    80.0    110.0    3.0
-    70.0    110.0    3.0
-    70.0    110.0    0.0
-f144 1
-    0.0    -1.0    0.0
-c0
-4
-    80.0    110.0    0.0
-    80.0    110.0    3.0
-    70.0    110.0    0.0
-    80.0    110.0    0.0
-f145 1
-    -0.0    1.0    -0.0
-c0
-4
-    110.0    90.0    3.0
-    110.0    90.0    6.0
-    120.0    90.0    6.0
-    110.0    90.0    3.0
-f146 1
-    -0.0    1.0    -0.0
-c0
-4
-    110.0    90.0    3.0
-    120.0    90.0    6.0
-    120.0    90.0    3.0
-    110.0    90.0    3.0
-f147 1
-    -0.0    1.0    -0.0
-c0
-4
-    130.0    90.0    3.0
-    120.0    90.0    3.0
-    130.0    90.0    6.0
-    130.0    90.0    3.0
-f148 1
-    -0.0    1.0    -0.0
-c0
-4
-    120.0    90.0    3.0
-    120.0    90.0    6.0
-    130.0    90.0    6.0
-    120.0    90.0    3.0
-f149 1
-    1.0    -0.0    -0.0
-c0
-4
-    130.0    80.0    6.0
-    130.0    90.0    3.0
-    130.0    90.0    6.0
-    130.0    80.0    6.0
-f150 1
-    1.0    -0.0    -0.0
-c0
-4
-    130.0    80.0    6.0
-    130.0    80.0    3.0
-    130.0    90.0    3.0
-    130.0    80.0    6.0
-f151 1
-    1.0    -0.0    -0.0
-c0
-4
-    130.0    70.0    6.0
-    130.0    70.0    3.0
-    130.0    80.0    3.0
-    130.0    70.0    6.0
-f152 1
-    1.0    -0.0    -0.0
-c0
-4
-    130.0    80.0    6.0
-    130.0    70.0    6.0
-    130.0    80.0    3.0
-    130.0    80.0    6.0
-f153 1
-    -1.0    0.0    0.0
-c0
-4
-    110.0    90.0    3.0
-    110.0    80.0    6.0
-    110.0    90.0    6.0
-    110.0    90.0    3.0
-f154 1
-    -1.0    0.0    0.0
-c0
-4
-    110.0    90.0    3.0
-    110.0    80.0    3.0
-    110.0    80.0    6.0
-    110.0    90.0    3.0
-f155 1
-    -1.0    0.0    0.0
-c0
-4
-    110.0    70.0    3.0
-    110.0    70.0    6.0
-    110.0    80.0    3.0
-    110.0    70.0    3.0
-f156 1
-    -1.0    0.0    0.0
-c0
-4
-    110.0    80.0    3.0
-    110.0    70.0    6.0
-    110.0    80.0    6.0
-    110.0    80.0    3.0
-f157 1
-    0.0    -1.0    0.0
-c0
-4
-    120.0    70.0    6.0
-    130.0    70.0    3.0
-    130.0    70.0    6.0
-    120.0    70.0    6.0
-f158 1
-    0.0    -1.0    0.0
-c0
-4
-    120.0    70.0    6.0
-    120.0    70.0    3.0
-    130.0    70.0    3.0
-    120.0    70.0    6.0
-f159 1
-    0.0    -1.0    0.0
-c0
-4
-    110.0    70.0    6.0
-    110.0    70.0    3.0
-    120.0    70.0    3.0
-    110.0    70.0    6.0
-f160 1
-    0.0    -1.0    0.0
-c0
-4
-    120.0    70.0    6.0
-    110.0    70.0    6.0
-    120.0    70.0    3.0
-    120.0    70.0    6.0
-f161 1
-    1.0    -0.0    -0.0
-c0
-4
-    100.0    100.0    6.0
-    100.0    90.0    3.0
-    100.0    100.0    3.0
-    100.0    100.0    6.0
-f162 1
-    1.0    -0.0    -0.0
-c0
-4
-    100.0    90.0    6.0
-    100.0    80.0    6.0
-    100.0    80.0    3.0
-    100.0    90.0    6.0
-f163 1
-    1.0    -0.0    -0.0
-c0
-4
-    100.0    90.0    6.0
-    100.0    80.0    3.0
-    100.0    90.0    3.0
-    100.0    90.0    6.0
-f164 1
-    1.0    -0.0    -0.0
-c0
-4
-    100.0    100.0    6.0
-    100.0    90.0    6.0
-    100.0    90.0    3.0
-    100.0    100.0    6.0
-f165 1
-    -0.0    1.0    -0.0
-c0
-4
-    100.0    100.0    3.0
-    90.0    100.0    3.0
-    100.0    100.0    6.0
-    100.0    100.0    3.0
-f166 1
-    -0.0    1.0    -0.0
-c0
-4
-    80.0    100.0    3.0
-    80.0    100.0    6.0
-    90.0    100.0    6.0
-    80.0    100.0    3.0
-f167 1
-    -0.0    1.0    -0.0
-c0
-4
-    80.0    100.0    3.0
-    90.0    100.0    6.0
-    90.0    100.0    3.0
-    80.0    100.0    3.0
-f168 1
-    -0.0    1.0    -0.0
-c0
-4
-    90.0    100.0    3.0
-    90.0    100.0    6.0
-    100.0    100.0    6.0
-    90.0    100.0    3.0
-f169 1
-    0.0    -1.0    0.0
-c0
-4
-    100.0    80.0    6.0
-    90.0    80.0    3.0
-    100.0    80.0    3.0
-    100.0    80.0    6.0
-f170 1
-    0.0    -1.0    0.0
-c0
-4
-    80.0    80.0    6.0
-    80.0    80.0    3.0
-    90.0    80.0    3.0
-    80.0    80.0    6.0
-f171 1
-    0.0    -1.0    0.0
-c0
-4
-    90.0    80.0    6.0
-    90.0    80.0    3.0
-    100.0    80.0    6.0
-    90.0    80.0    6.0
-f172 1
-    0.0    -1.0    0.0
-c0
-4
-    80.0    80.0    6.0
-    90.0    80.0    3.0
-    90.0    80.0    6.0
-    80.0    80.0    6.0
-f173 1
-    -1.0    0.0    0.0
-c0
-4
-    80.0    100.0    3.0
-    80.0    90.0    6.0
-    80.0    100.0    6.0
-    80.0    100.0    3.0
-f174 1
-    -1.0    0.0    0.0
-c0
-4
-    80.0    90.0    3.0
-    80.0    90.0    6.0
-    80.0    100.0    3.0
-    80.0    90.0    3.0
-f175 1
-    -1.0    0.0    0.0
-c0
-4
-    80.0    80.0    3.0
-    80.0    80.0    6.0
-    80.0    90.0    6.0
-    80.0    80.0    3.0
-f176 1
-    -1.0    0.0    0.0
-c0
-4
-    80.0    80.0    3.0
-    80.0    90.0    6.0
-    80.0    90.0    3.0
-    80.0    80.0    3.0
-f177 1
-    -0.0    1.0    -0.0
-c0
-4
-    50.0    95.0    3.0
-    50.0    95.0    6.0
-    60.0    95.0    6.0
-    50.0    95.0    3.0
-f178 1
-    -0.0    1.0    -0.0
-c0
-4
-    50.0    95.0    3.0
-    60.0    95.0    6.0
-    60.0    95.0    3.0
-    50.0    95.0    3.0
-f179 1
-    -0.0    1.0    -0.0
-c0
-4
-    70.0    95.0    3.0
-    60.0    95.0    6.0
-    70.0    95.0    6.0
-    70.0    95.0    3.0
-f180 1
-    -0.0    1.0    -0.0
-c0
-4
-    70.0    95.0    3.0
-    60.0    95.0    3.0
-    60.0    95.0    6.0
-    70.0    95.0    3.0
-f181 1
-    1.0    -0.0    -0.0
-c0
-4
-    70.0    95.0    6.0
-    70.0    85.0    3.0
-    70.0    95.0    3.0
-    70.0    95.0    6.0
-f182 1
-    1.0    -0.0    -0.0
-c0
-4
-    70.0    75.0    6.0
-    70.0    75.0    3.0
-    70.0    85.0    3.0
-    70.0    75.0    6.0
-f183 1
-    1.0    -0.0    -0.0
-c0
-4
-    70.0    85.0    6.0
-    70.0    85.0    3.0
-    70.0    95.0    6.0
-    70.0    85.0    6.0
-f184 1
-    1.0    -0.0    -0.0
-c0
-4
-    70.0    85.0    6.0
-    70.0    75.0    6.0
-    70.0    85.0    3.0
-    70.0    85.0    6.0
-f185 1
-    -1.0    0.0    0.0
-c0
-4
-    50.0    95.0    3.0
-    50.0    85.0    6.0
-    50.0    95.0    6.0
-    50.0    95.0    3.0
-f186 1
-    -1.0    0.0    0.0
-c0
-4
-    50.0    85.0    3.0
-    50.0    85.0    6.0
-    50.0    95.0    3.0
-    50.0    85.0    3.0
-f187 1
-    -1.0    0.0    0.0
-c0
-4
-    50.0    85.0    3.0
-    50.0    75.0    3.0
-    50.0    75.0    6.0
-    50.0    85.0    3.0
-f188 1
-    -1.0    0.0    0.0
-c0
-4
-    50.0    85.0    3.0
-    50.0    75.0    6.0
-    50.0    85.0    6.0
-    50.0    85.0    3.0
-f189 1
-    0.0    -1.0    0.0
-c0
-4
-    70.0    75.0    3.0
-    70.0    75.0    6.0
-    60.0    75.0    3.0
-    70.0    75.0    3.0
-f190 1
-    0.0    -1.0    0.0
-c0
-4
-    50.0    75.0    3.0
-    60.0    75.0    6.0
-    50.0    75.0    6.0
-    50.0    75.0    3.0
-f191 1
-    0.0    -1.0    0.0
-c0
-4
-    50.0    75.0    3.0
-    60.0    75.0    3.0
-    60.0    75.0    6.0
-    50.0    75.0    3.0
-f192 1
-    0.0    -1.0    0.0
-c0
-4
-    60.0    75.0    3.0
-    70.0    75.0    6.0
-    60.0    75.0    6.0
-    60.0    75.0    3.0
-f193 1
-    1.0    -0.0    -0.0
-c0
-4
-    50.0    125.0    6.0
-    50.0    115.0    3.0
-    50.0    125.0    3.0
-    50.0    125.0    6.0
-f194 1
-    1.0    -0.0    -0.0
-c0
-4
-    50.0    105.0    6.0
-    50.0    105.0    3.0
-    50.0    115.0    3.0
-    50.0    105.0    6.0
-f195 1
-    1.0    -0.0    -0.0
-c0
-4
-    50.0    115.0    6.0
-    50.0    115.0    3.0
-    50.0    125.0    6.0
-    50.0    115.0    6.0
-f196 1
-    1.0    -0.0    -0.0
-c0
-4
-    50.0    115.0    6.0
-    50.0    105.0    6.0
-    50.0    115.0    3.0
-    50.0    115.0    6.0
-f197 1
-    -0.0    1.0    -0.0
-c0
-4
-    50.0    125.0    3.0
-    40.0    125.0    3.0
-    50.0    125.0    6.0
-    50.0    125.0    3.0
-f198 1
-    -0.0    1.0    -0.0
-c0
-4
-    30.0    125.0    3.0
-    30.0    125.0    6.0
-    40.0    125.0    6.0
-    30.0    125.0    3.0
-f199 1
-    -0.0    1.0    -0.0
-c0
-4
-    40.0    125.0    3.0
-    30.0    125.0    3.0
-    40.0    125.0    6.0
-    40.0    125.0    3.0
-f200 1
-    -0.0    1.0    -0.0
-c0
-4
-    40.0    125.0    3.0
-    40.0    125.0    6.0
-    50.0    125.0    6.0
-    40.0    125.0    3.0
-f201 1
-    0.0    -1.0    0.0
-c0
-4
-    50.0    105.0    6.0
-    40.0    105.0    6.0
-    50.0    105.0    3.0
-    50.0    105.0    6.0
-f202 1
-    0.0    -1.0    0.0
-c0
-4
-    40.0    105.0    6.0
-    40.0    105.0    3.0
-    50.0    105.0    3.0
-    40.0    105.0    6.0
-f203 1
-    0.0    -1.0    0.0
-c0
-4
-    30.0    105.0    6.0
-    30.0    105.0    3.0
-    40.0    105.0    3.0
-    30.0    105.0    6.0
-f204 1
-    0.0    -1.0    0.0
-c0
-4
-    30.0    105.0    6.0
-    40.0    105.0    3.0
-    40.0    105.0    6.0
-    30.0    105.0    6.0
-f205 1
-    -1.0    0.0    0.0
-c0
-4
-    30.0    125.0    3.0
-    30.0    115.0    3.0
-    30.0    125.0    6.0
-    30.0    125.0    3.0
-f206 1
-    -1.0    0.0    0.0
-c0
-4
-    30.0    115.0    3.0
-    30.0    105.0    3.0
-    30.0    105.0    6.0
-    30.0    115.0    3.0
-f207 1
-    -1.0    0.0    0.0
-c0
-4
-    30.0    115.0    3.0
-    30.0    115.0    6.0
-    30.0    125.0    6.0
-    30.0    115.0    3.0
-f208 1
-    -1.0    0.0    0.0
-c0
-4
-    30.0    115.0    3.0
-    30.0    105.0    6.0
-    30.0    115.0    6.0
-    30.0    115.0    3.0
-f209 1
-    1.0    -0.0    -0.0
-c0
-4
-    125.0    100.0    6.0
-    125.0    100.0    3.0
-    125.0    110.0    3.0
-    125.0    100.0    6.0
-f210 1
-    1.0    -0.0    -0.0
-c0
-4
-    125.0    120.0    6.0
-    125.0    110.0    6.0
-    125.0    120.0    3.0
-    125.0    120.0    6.0
-f211 1
-    1.0    -0.0    -0.0
-c0
-4
-    125.0    110.0    6.0
-    125.0    110.0    3.0
-    125.0    120.0    3.0
-    125.0    110.0    6.0
-f212 1
-    1.0    -0.0    -0.0
-c0
-4
-    125.0    110.0    6.0
-    125.0    100.0    6.0
-    125.0    110.0    3.0
-    125.0    110.0    6.0
-f213 1
-    -0.0    1.0    -0.0
-c0
-4
-    125.0    120.0    3.0
-    115.0    120.0    3.0
-    125.0    120.0    6.0
-    125.0    120.0    3.0
-f214 1
-    -0.0    1.0    -0.0
-c0
-4
-    105.0    120.0    3.0
-    105.0    120.0    6.0
-    115.0    120.0    6.0
-    105.0    120.0    3.0
-f215 1
-    -0.0    1.0    -0.0
-c0
-4
-    105.0    120.0    3.0
-    115.0    120.0    6.0
-    115.0    120.0    3.0
-    105.0    120.0    3.0
-f216 1
-    -0.0    1.0    -0.0
-c0
-4
-    115.0    120.0    3.0
-    115.0    120.0    6.0
-    125.0    120.0    6.0
-    115.0    120.0    3.0
-f217 1
-    0.0    -1.0    0.0
-c0
-4
-    115.0    100.0    6.0
-    125.0    100.0    3.0
-    125.0    100.0    6.0
-    115.0    100.0    6.0
-f218 1
-    0.0    -1.0    0.0
-c0
-4
-    115.0    100.0    6.0
-    115.0    100.0    3.0
-    125.0    100.0    3.0
-    115.0    100.0    6.0
-f219 1
-    0.0    -1.0    0.0
-c0
-4
-    105.0    100.0    6.0
-    105.0    100.0    3.0
-    115.0    100.0    6.0
-    105.0    100.0    6.0
-f220 1
-    0.0    -1.0    0.0
-c0
-4
-    115.0    100.0    6.0
-    105.0    100.0    3.0
-    115.0    100.0    3.0
-    115.0    100.0    6.0
-f221 1
-    -1.0    0.0    0.0
-c0
-4
-    105.0    120.0    3.0
-    105.0    110.0    3.0
-    105.0    120.0    6.0
-    105.0    120.0    3.0
-f222 1
-    -1.0    0.0    0.0
-c0
-4
-    105.0    110.0    3.0
-    105.0    100.0    3.0
-    105.0    100.0    6.0
-    105.0    110.0    3.0
-f223 1
-    -1.0    0.0    0.0
-c0
-4
-    105.0    110.0    3.0
-    105.0    110.0    6.0
-    105.0    120.0    6.0
-    105.0    110.0    3.0
-f224 1
-    -1.0    0.0    0.0
-c0
-4
-    105.0    110.0    3.0
-    105.0    100.0    6.0
-    105.0    110.0    6.0
-    105.0    110.0    3.0
-f225 1
-    1.0    -0.0    -0.0
-c0
-4
-    85.0    70.0    6.0
-    85.0    60.0    6.0
-    85.0    70.0    3.0
-    85.0    70.0    6.0
-f226 1
-    1.0    -0.0    -0.0
-c0
-4
-    85.0    60.0    6.0
-    85.0    60.0    3.0
-    85.0    70.0    3.0
-    85.0    60.0    6.0
-f227 1
-    1.0    -0.0    -0.0
-c0
-4
-    85.0    50.0    6.0
-    85.0    50.0    3.0
-    85.0    60.0    3.0
-    85.0    50.0    6.0
-f228 1
-    1.0    -0.0    -0.0
-c0
-4
-    85.0    50.0    6.0
-    85.0    60.0    3.0
-    85.0    60.0    6.0
-    85.0    50.0    6.0
-f229 1
-    -0.0    1.0    -0.0
-c0
-4
-    85.0    70.0    6.0
-    85.0    70.0    3.0
-    75.0    70.0    3.0
-    85.0    70.0    6.0
-f230 1
-    -0.0    1.0    -0.0
-c0
-4
-    75.0    70.0    6.0
-    65.0    70.0    3.0
-    65.0    70.0    6.0
-    75.0    70.0    6.0
-f231 1
-    -0.0    1.0    -0.0
-c0
-4
-    75.0    70.0    6.0
-    75.0    70.0    3.0
-    65.0    70.0    3.0
-    75.0    70.0    6.0
-f232 1
-    -0.0    1.0    -0.0
-c0
-4
-    85.0    70.0    6.0
-    75.0    70.0    3.0
-    75.0    70.0    6.0
-    85.0    70.0    6.0
-f233 1
-    0.0    -1.0    0.0
-c0
-4
-    85.0    50.0    6.0
-    75.0    50.0    3.0
-    85.0    50.0    3.0
-    85.0    50.0    6.0
-f234 1
-    0.0    -1.0    0.0
-c0
-4
-    75.0    50.0    6.0
-    65.0    50.0    6.0
-    65.0    50.0    3.0
-    75.0    50.0    6.0
-f235 1
-    0.0    -1.0    0.0
-c0
-4
-    75.0    50.0    6.0
-    65.0    50.0    3.0
-    75.0    50.0    3.0
-    75.0    50.0    6.0
-f236 1
-    0.0    -1.0    0.0
-c0
-4
-    75.0    50.0    6.0
-    75.0    50.0    3.0
-    85.0    50.0    6.0
-    75.0    50.0    6.0
-f237 1
-    -1.0    0.0    0.0
-c0
-4
-    65.0    70.0    6.0
-    65.0    70.0    3.0
-    65.0    60.0    3.0
-    65.0    70.0    6.0
-f238 1
-    -1.0    0.0    0.0
-c0
-4
-    65.0    50.0    6.0
-    65.0    60.0    3.0
-    65.0    50.0    3.0
-    65.0    50.0    6.0
-f239 1
-    -1.0    0.0    0.0
-c0
-4
-    65.0    60.0    6.0
-    65.0    70.0    6.0
-    65.0    60.0    3.0
-    65.0    60.0    6.0
-f240 1
-    -1.0    0.0    0.0
-c0
-4
-    65.0    60.0    6.0
-    65.0    60.0    3.0
-    65.0    50.0    6.0
-    65.0    60.0    6.0
-f241 1
-    -1.0    0.0    0.0
-c0
-4
-    95.0    35.0    3.0
-    95.0    35.0    6.0
-    95.0    45.0    3.0
-    95.0    35.0    3.0
-f242 1
-    -1.0    0.0    0.0
-c0
-4
-    95.0    55.0    3.0
-    95.0    45.0    6.0
-    95.0    55.0    6.0
-    95.0    55.0    3.0
-f243 1
-    -1.0    0.0    0.0
-c0
-4
-    95.0    55.0    3.0
-    95.0    45.0    3.0
-    95.0    45.0    6.0
-    95.0    55.0    3.0
-f244 1
-    -1.0    0.0    0.0
-c0
-4
-    95.0    45.0    3.0
-    95.0    35.0    6.0
-    95.0    45.0    6.0
-    95.0    45.0    3.0
-f245 1
-    -0.0    1.0    -0.0
-c0
-4
-    95.0    55.0    3.0
-    95.0    55.0    6.0
-    105.0    55.0    3.0
-    95.0    55.0    3.0
-f246 1
-    -0.0    1.0    -0.0
-c0
-4
-    105.0    55.0    3.0
-    115.0    55.0    6.0
-    115.0    55.0    3.0
-    105.0    55.0    3.0
-f247 1
-    -0.0    1.0    -0.0
-c0
-4
-    105.0    55.0    3.0
-    95.0    55.0    6.0
-    105.0    55.0    6.0
-    105.0    55.0    3.0
-f248 1
-    -0.0    1.0    -0.0
-c0
-4
-    105.0    55.0    3.0
-    105.0    55.0    6.0
-    115.0    55.0    6.0
-    105.0    55.0    3.0
-f249 1
-    0.0    -1.0    0.0
-c0
-4
-    95.0    35.0    6.0
-    95.0    35.0    3.0
-    105.0    35.0    3.0
-    95.0    35.0    6.0
-f250 1
-    0.0    -1.0    0.0
-c0
-4
-    115.0    35.0    6.0
-    105.0    35.0    6.0
-    115.0    35.0    3.0
-    115.0    35.0    6.0
-f251 1
-    0.0    -1.0    0.0
-c0
-4
-    105.0    35.0    6.0
-    105.0    35.0    3.0
-    115.0    35.0    3.0
-    105.0    35.0    6.0
-f252 1
-    0.0    -1.0    0.0
-c0
-4
-    95.0    35.0    6.0
-    105.0    35.0    3.0
-    105.0    35.0    6.0
-    95.0    35.0    6.0
-f253 1
-    1.0    -0.0    -0.0
-c0
-4
-    115.0    55.0    6.0
-    115.0    45.0    3.0
-    115.0    55.0    3.0
-    115.0    55.0    6.0
-f254 1
-    1.0    -0.0    -0.0
-c0
-4
-    115.0    35.0    6.0
-    115.0    35.0    3.0
-    115.0    45.0    3.0
-    115.0    35.0    6.0
-f255 1
-    1.0    -0.0    -0.0
-c0
-4
-    115.0    55.0    6.0
-    115.0    45.0    6.0
-    115.0    45.0    3.0
-    115.0    55.0    6.0
-f256 1
-    1.0    -0.0    -0.0
-c0
-4
-    115.0    35.0    6.0
-    115.0    45.0    3.0
-    115.0    45.0    6.0
-    115.0    35.0    6.0
-f257 1
-    1.0    -0.0    -0.0
-c0
-4
-    55.0    50.0    6.0
-    55.0    40.0    6.0
-    55.0    50.0    3.0
-    55.0    50.0    6.0
-f258 1
-    1.0    -0.0    -0.0
-c0
-4
-    55.0    40.0    6.0
-    55.0    40.0    3.0
-    55.0    50.0    3.0
-    55.0    40.0    6.0
-f259 1
-    1.0    -0.0    -0.0
-c0
-4
-    55.0    30.0    6.0
-    55.0    30.0    3.0
-    55.0    40.0    6.0
-    55.0    30.0    6.0
-f260 1
-    1.0    -0.0    -0.0
-c0
-4
-    55.0    40.0    6.0
-    55.0    30.0    3.0
-    55.0    40.0    3.0
-    55.0    40.0    6.0
-f261 1
-    -0.0    1.0    -0.0
-c0
-4
-    45.0    50.0    3.0
-    55.0    50.0    6.0
-    55.0    50.0    3.0
-    45.0    50.0    3.0
-f262 1
-    -0.0    1.0    -0.0
-c0
-4
-    35.0    50.0    3.0
-    35.0    50.0    6.0
-    45.0    50.0    6.0
-    35.0    50.0    3.0
-f263 1
-    -0.0    1.0    -0.0
-c0
-4
-    45.0    50.0    3.0
-    35.0    50.0    3.0
-    45.0    50.0    6.0
-    45.0    50.0    3.0
-f264 1
-    -0.0    1.0    -0.0
-c0
-4
-    45.0    50.0    3.0
-    45.0    50.0    6.0
-    55.0    50.0    6.0
-    45.0    50.0    3.0
-f265 1
-    0.0    -1.0    0.0
-c0
-4
-    55.0    30.0    6.0
-    45.0    30.0    3.0
-    55.0    30.0    3.0
-    55.0    30.0    6.0
-f266 1
-    0.0    -1.0    0.0
-c0
-4
-    35.0    30.0    6.0
-    35.0    30.0    3.0
-    45.0    30.0    3.0
-    35.0    30.0    6.0
-f267 1
-    0.0    -1.0    0.0
-c0
-4
-    55.0    30.0    6.0
-    45.0    30.0    6.0
-    45.0    30.0    3.0
-    55.0    30.0    6.0
-f268 1
-    0.0    -1.0    0.0
-c0
-4
-    35.0    30.0    6.0
-    45.0    30.0    3.0
-    45.0    30.0    6.0
-    35.0    30.0    6.0
-f269 1
-    -1.0    0.0    0.0
-c0
-4
-    35.0    50.0    3.0
-    35.0    40.0    6.0
-    35.0    50.0    6.0
-    35.0    50.0    3.0
-f270 1
-    -1.0    0.0    0.0
-c0
-4
-    35.0    50.0    3.0
-    35.0    40.0    3.0
-    35.0    40.0    6.0
-    35.0    50.0    3.0
-f271 1
-    -1.0    0.0    0.0
-c0
-4
-    35.0    40.0    3.0
-    35.0    30.0    3.0
-    35.0    30.0    6.0
-    35.0    40.0    3.0
-f272 1
-    -1.0    0.0    0.0
-c0
-4
-    35.0    40.0    3.0
-    35.0    30.0    6.0
-    35.0    40.0    6.0
-    35.0    40.0    3.0
-f273 1
-    1.0    -0.0    -0.0
-c0
-4
-    90.0    130.0    6.0
-    90.0    120.0    3.0
-    90.0    130.0    3.0
-    90.0    130.0    6.0
-f274 1
-    1.0    -0.0    -0.0
-c0
-4
-    90.0    110.0    6.0
-    90.0    110.0    3.0
-    90.0    120.0    3.0
-    90.0    110.0    6.0
-f275 1
-    1.0    -0.0    -0.0
-c0
-4
-    90.0    120.0    6.0
-    90.0    120.0    3.0
-    90.0    130.0    6.0
-    90.0    120.0    6.0
-f276 1
-    1.0    -0.0    -0.0
-c0
-4
-    90.0    120.0    6.0
-    90.0    110.0    6.0
-    90.0    120.0    3.0
-    90.0    120.0    6.0
-f277 1
-    -0.0    1.0    -0.0
-c0
-4
-    90.0    130.0    3.0
-    80.0    130.0    6.0
-    90.0    130.0    6.0
-    90.0    130.0    3.0
-f278 1
-    -0.0    1.0    -0.0
-c0
-4
-    90.0    130.0    3.0
-    80.0    130.0    3.0
-    80.0    130.0    6.0
-    90.0    130.0    3.0
-f279 1
-    -0.0    1.0    -0.0
-c0
-4
-    70.0    130.0    3.0
-    70.0    130.0    6.0
-    80.0    130.0    3.0
-    70.0    130.0    3.0
-f280 1
-    -0.0    1.0    -0.0
-c0
-4
-    80.0    130.0    3.0
-    70.0    130.0    6.0
-    80.0    130.0    6.0
-    80.0    130.0    3.0
-f281 1
-    -1.0    0.0    0.0
-c0
-4
-    70.0    130.0    3.0
-    70.0    120.0    6.0
-    70.0    130.0    6.0
-    70.0    130.0    3.0
-f282 1
-    -1.0    0.0    0.0
-c0
-4
-    70.0    120.0    3.0
-    70.0    120.0    6.0
-    70.0    130.0    3.0
-    70.0    120.0    3.0
-f283 1
-    -1.0    0.0    0.0
-c0
-4
-    70.0    120.0    3.0
-    70.0    110.0    3.0
-    70.0    110.0    6.0
-    70.0    120.0    3.0
-f284 1
-    -1.0    0.0    0.0
-c0
-4
-    70.0    120.0    3.0
-    70.0    110.0    6.0
-    70.0    120.0    6.0
-    70.0    120.0    3.0
-f285 1
-    0.0    -1.0    0.0
-c0
-4
-    90.0    110.0    6.0
-    80.0    110.0    3.0
-    90.0    110.0    3.0
-    90.0    110.0    6.0
-f286 1
-    0.0    -1.0    0.0
-c0
-4
-    80.0    110.0    6.0
-    70.0    110.0    6.0
-    70.0    110.0    3.0
-    80.0    110.0    6.0
-f287 1
-    0.0    -1.0    0.0
-c0
-4
-    80.0    110.0    6.0
-    70.0    110.0    3.0
-    80.0    110.0    3.0
-    80.0    110.0    6.0
-f288 1
-    0.0    -1.0    0.0
-c0
-4
-    90.0    110.0    6.0
-    80.0    110.0    6.0
-    80.0    110.0    3.0
-    90.0    110.0    6.0
-f289 1
-    -0.0    1.0    -0.0
-c0
-4
-    110.0    90.0    6.0
-    110.0    90.0    9.0
-    120.0    90.0    9.0
-    110.0    90.0    6.0
-f290 1
-    -0.0    1.0    -0.0
-c0
-4
-    110.0    90.0    6.0
-    120.0    90.0    9.0
-    120.0    90.0    6.0
-    110.0    90.0    6.0
-f291 1
-    -0.0    1.0    -0.0
-c0
-4
-    130.0    90.0    6.0
-    120.0    90.0    6.0
-    130.0    90.0    9.0
-    130.0    90.0    6.0
-f292 1
-    -0.0    1.0    -0.0
-c0
-4
-    120.0    90.0    6.0
-    120.0    90.0    9.0
-    130.0    90.0    9.0
-    120.0    90.0    6.0
-f293 1
-    1.0    -0.0    -0.0
-c0
-4
-    130.0    80.0    9.0
-    130.0    90.0    6.0
-    130.0    90.0    9.0
-    130.0    80.0    9.0
-f294 1
-    1.0    -0.0    -0.0
-c0
-4
-    130.0    80.0    9.0
-    130.0    80.0    6.0
-    130.0    90.0    6.0
-    130.0    80.0    9.0
-f295 1
-    1.0    -0.0    -0.0
-c0
-4
-    130.0    80.0    9.0
-    130.0    70.0    9.0
-    130.0    70.0    6.0
-    130.0    80.0    9.0
-f296 1
-    1.0    -0.0    -0.0
-c0
-4
-    130.0    80.0    9.0
-    130.0    70.0    6.0
-    130.0    80.0    6.0
-    130.0    80.0    9.0
-f297 1
-    -1.0    0.0    0.0
-c0
-4
-    110.0    90.0    9.0
-    110.0    90.0    6.0
-    110.0    80.0    9.0
-    110.0    90.0    9.0
-f298 1
-    -1.0    0.0    0.0
-c0
-4
-    110.0    80.0    9.0
-    110.0    90.0    6.0
-    110.0    80.0    6.0
-    110.0    80.0    9.0
-f299 1
-    -1.0    0.0    0.0
-c0
-4
-    110.0    70.0    9.0
-    110.0    80.0    6.0
-    110.0    70.0    6.0
-    110.0    70.0    9.0
-f300 1
-    -1.0    0.0    0.0
-c0
-4
-    110.0    80.0    9.0
-    110.0    80.0    6.0
-    110.0    70.0    9.0
-    110.0    80.0    9.0
-f301 1
-    0.0    -1.0    0.0
-c0
-4
-    130.0    70.0    9.0
-    120.0    70.0    6.0
-    130.0    70.0    6.0
-    130.0    70.0    9.0
-f302 1
-    0.0    -1.0    0.0
-c0
-4
-    110.0    70.0    9.0
-    110.0    70.0    6.0
-    120.0    70.0    9.0
-    110.0    70.0    9.0
-f303 1
-    0.0    -1.0    0.0
-c0
-4
-    120.0    70.0    9.0
-    110.0    70.0    6.0
-    120.0    70.0    6.0
-    120.0    70.0    9.0
-f304 1
-    0.0    -1.0    0.0
-c0
-4
-    120.0    70.0    9.0
-    120.0    70.0    6.0
-    130.0    70.0    9.0
-    120.0    70.0    9.0
-f305 1
-    1.0    -0.0    -0.0
-c0
-4
-    100.0    100.0    9.0
-    100.0    90.0    6.0
-    100.0    100.0    6.0
-    100.0    100.0    9.0
-f306 1
-    1.0    -0.0    -0.0
-c0
-4
-    100.0    90.0    9.0
-    100.0    80.0    9.0
-    100.0    80.0    6.0
-    100.0    90.0    9.0
-f307 1
-    1.0    -0.0    -0.0
-c0
-4
-    100.0    90.0    9.0
-    100.0    80.0    6.0
-    100.0    90.0    6.0
-    100.0    90.0    9.0
-f308 1
-    1.0    -0.0    -0.0
-c0
-4
-    100.0    100.0    9.0
-    100.0    90.0    9.0
-    100.0    90.0    6.0
-    100.0    100.0    9.0
-f309 1
-    -0.0    1.0    -0.0
-c0
-4
-    100.0    100.0    6.0
-    90.0    100.0    9.0
-    100.0    100.0    9.0
-    100.0    100.0    6.0
-f310 1
-    -0.0    1.0    -0.0
-c0
-4
-    100.0    100.0    6.0
-    90.0    100.0    6.0
-    90.0    100.0    9.0
-    100.0    100.0    6.0
-f311 1
-    -0.0    1.0    -0.0
-c0
-4
-    80.0    100.0    6.0
-    80.0    100.0    9.0
-    90.0    100.0    9.0
-    80.0    100.0    6.0
-f312 1
-    -0.0    1.0    -0.0
-c0
-4
-    80.0    100.0    6.0
-    90.0    100.0    9.0
-    90.0    100.0    6.0
-    80.0    100.0    6.0
-f313 1
-    0.0    -1.0    0.0
-c0
-4
-    100.0    80.0    9.0
-    90.0    80.0    9.0
-    100.0    80.0    6.0
-    100.0    80.0    9.0
-f314 1
-    0.0    -1.0    0.0
-c0
-4
-    90.0    80.0    9.0
-    90.0    80.0    6.0
-    100.0    80.0    6.0
-    90.0    80.0    9.0
-f315 1
-    0.0    -1.0    0.0
-c0
-4
-    90.0    80.0    9.0
-    80.0    80.0    9.0
-    80.0    80.0    6.0
-    90.0    80.0    9.0
-f316 1
-    0.0    -1.0    0.0
-c0
-4
-    90.0    80.0    9.0
-    80.0    80.0    6.0
-    90.0    80.0    6.0
-    90.0    80.0    9.0
-f317 1
-    -1.0    0.0    0.0
-c0
-4
-    80.0    100.0    6.0
-    80.0    90.0    9.0
-    80.0    100.0    9.0
-    80.0    100.0    6.0
-f318 1
-    -1.0    0.0    0.0
-c0
-4
-    80.0    100.0    6.0
-    80.0    90.0    6.0
-    80.0    90.0    9.0
-    80.0    100.0    6.0
-f319 1
-    -1.0    0.0    0.0
-c0
-4
-    80.0    90.0    6.0
-    80.0    80.0    6.0
-    80.0    80.0    9.0
-    80.0    90.0    6.0
-f320 1
-    -1.0    0.0    0.0
-c0
-4
-    80.0    90.0    6.0
-    80.0    80.0    9.0
-    80.0    90.0    9.0
-    80.0    90.0    6.0
-f321 1
-    -0.0    1.0    -0.0
-c0
-4
-    50.0    95.0    6.0
-    50.0    95.0    9.0
-    60.0    95.0    6.0
-    50.0    95.0    6.0
-f322 1
-    -0.0    1.0    -0.0
-c0
-4
-    70.0    95.0    6.0
-    60.0    95.0    9.0
-    70.0    95.0    9.0
-    70.0    95.0    6.0
-f323 1
-    -0.0    1.0    -0.0
-c0
-4
-    70.0    95.0    6.0
-    60.0    95.0    6.0
-    60.0    95.0    9.0
-    70.0    95.0    6.0
-f324 1
-    -0.0    1.0    -0.0
-c0
-4
-    60.0    95.0    6.0
-    50.0    95.0    9.0
-    60.0    95.0    9.0
-    60.0    95.0    6.0
-f325 1
-    1.0    -0.0    -0.0
-c0
-4
-    70.0    95.0    9.0
-    70.0    85.0    6.0
-    70.0    95.0    6.0
-    70.0    95.0    9.0
-f326 1
-    1.0    -0.0    -0.0
-c0
-4
-    70.0    85.0    9.0
-    70.0    75.0    9.0
-    70.0    75.0    6.0
-    70.0    85.0    9.0
-f327 1
-    1.0    -0.0    -0.0
-c0
-4
-    70.0    85.0    9.0
-    70.0    75.0    6.0
-    70.0    85.0    6.0
-    70.0    85.0    9.0
-f328 1
-    1.0    -0.0    -0.0
-c0
-4
-    70.0    85.0    9.0
-    70.0    85.0    6.0
-    70.0    95.0    9.0
-    70.0    85.0    9.0
-f329 1
-    -1.0    0.0    0.0
-c0
-4
-    50.0    95.0    6.0
-    50.0    85.0    6.0
-    50.0    95.0    9.0
-    50.0    95.0    6.0
-f330 1
-    -1.0    0.0    0.0
-c0
-4
-    50.0    75.0    6.0
-    50.0    75.0    9.0
-    50.0    85.0    9.0
-    50.0    75.0    6.0
-f331 1
-    -1.0    0.0    0.0
-c0
-4
-    50.0    85.0    6.0
-    50.0    75.0    6.0
-    50.0    85.0    9.0
-    50.0    85.0    6.0
-f332 1
-    -1.0    0.0    0.0
-c0
-4
-    50.0    85.0    6.0
-    50.0    85.0    9.0
-    50.0    95.0    9.0
-    50.0    85.0    6.0
-f333 1
-    0.0    -1.0    0.0
-c0
-4
-    70.0    75.0    6.0
-    70.0    75.0    9.0
-    60.0    75.0    9.0
-    70.0    75.0    6.0
-f334 1
-    0.0    -1.0    0.0
-c0
-4
-    60.0    75.0    6.0
-    70.0    75.0    6.0
-    60.0    75.0    9.0
-    60.0    75.0    6.0
-f335 1
-    0.0    -1.0    0.0
-c0
-4
-    50.0    75.0    6.0
-    60.0    75.0    6.0
-    50.0    75.0    9.0
-    50.0    75.0    6.0
-f336 1
-    0.0    -1.0    0.0
-c0
-4
-    60.0    75.0    6.0
-    60.0    75.0    9.0
-    50.0    75.0    9.0
-    60.0    75.0    6.0
-f337 1
-    1.0    -0.0    -0.0
-c0
-4
-    50.0    115.0    9.0
-    50.0    125.0    6.0
-    50.0    125.0    9.0
-    50.0    115.0    9.0
-f338 1
-    1.0    -0.0    -0.0
-c0
-4
-    50.0    115.0    9.0
-    50.0    115.0    6.0
-    50.0    125.0    6.0
-    50.0    115.0    9.0
-f339 1
-    1.0    -0.0    -0.0
-c0
-4
-    50.0    105.0    9.0
-    50.0    105.0    6.0
-    50.0    115.0    6.0
-    50.0    105.0    9.0
-f340 1
-    1.0    -0.0    -0.0
-c0
-4
-    50.0    115.0    9.0
-    50.0    105.0    9.0
-    50.0    115.0    6.0
-    50.0    115.0    9.0
-f341 1
-    -0.0    1.0    -0.0
-c0
-4
-    40.0    125.0    6.0
-    50.0    125.0    9.0
-    50.0    125.0    6.0
-    40.0    125.0    6.0
-f342 1
-    -0.0    1.0    -0.0
-c0
-4
-    30.0    125.0    6.0
-    30.0    125.0    9.0
-    40.0    125.0    9.0
-    30.0    125.0    6.0
-f343 1
-    -0.0    1.0    -0.0
-c0
-4
-    30.0    125.0    6.0
-    40.0    125.0    9.0
-    40.0    125.0    6.0
-    30.0    125.0    6.0
-f344 1
-    -0.0    1.0    -0.0
-c0
-4
-    40.0    125.0    6.0
-    40.0    125.0    9.0
-    50.0    125.0    9.0
-    40.0    125.0    6.0
-f345 1
-    0.0    -1.0    0.0
-c0
-4
-    50.0    105.0    9.0
-    40.0    105.0    9.0
-    50.0    105.0    6.0
-    50.0    105.0    9.0
-f346 1
-    0.0    -1.0    0.0
-c0
-4
-    40.0    105.0    9.0
-    40.0    105.0    6.0
-    50.0    105.0    6.0
-    40.0    105.0    9.0
-f347 1
-    0.0    -1.0    0.0
-c0
-4
-    30.0    105.0    9.0
-    30.0    105.0    6.0
-    40.0    105.0    9.0
-    30.0    105.0    9.0
-f348 1
-    0.0    -1.0    0.0
-c0
-4
-    40.0    105.0    9.0
-    30.0    105.0    6.0
-    40.0    105.0    6.0
-    40.0    105.0    9.0
-f349 1
-    -1.0    0.0    0.0
-c0
-4
-    30.0    115.0    6.0
-    30.0    125.0    9.0
-    30.0    125.0    6.0
-    30.0    115.0    6.0
-f350 1
-    -1.0    0.0    0.0
-c0
-4
-    30.0    115.0    6.0
-    30.0    105.0    6.0
-    30.0    105.0    9.0
-    30.0    115.0    6.0
-f351 1
-    -1.0    0.0    0.0
-c0
-4
-    30.0    115.0    6.0
-    30.0    115.0    9.0
-    30.0    125.0    9.0
-    30.0    115.0    6.0
-f352 1
-    -1.0    0.0    0.0
-c0
-4
-    30.0    115.0    6.0
-    30.0    105.0    9.0
-    30.0    115.0    9.0
-    30.0    115.0    6.0
-f353 1
-    1.0    -0.0    -0.0
-c0
-4
-    125.0    120.0    9.0
-    125.0    110.0    9.0
-    125.0    120.0    6.0
-    125.0    120.0    9.0
-f354 1
-    1.0    -0.0    -0.0
-c0
-4
-    125.0    110.0    9.0
-    125.0    110.0    6.0
-    125.0    120.0    6.0
-    125.0    110.0    9.0
-f355 1
-    1.0    -0.0    -0.0
-c0
-4
-    125.0    100.0    9.0
-    125.0    100.0    6.0
-    125.0    110.0    6.0
-    125.0    100.0    9.0
-f356 1
-    1.0    -0.0    -0.0
-c0
-4
-    125.0    100.0    9.0
-    125.0    110.0    6.0
-    125.0    110.0    9.0
-    125.0    100.0    9.0
-f357 1
-    -0.0    1.0    -0.0
-c0
-4
-    125.0    120.0    6.0
-    115.0    120.0    6.0
-    125.0    120.0    9.0
-    125.0    120.0    6.0
-f358 1
-    -0.0    1.0    -0.0
-c0
-4
-    105.0    120.0    6.0
-    105.0    120.0    9.0
-    115.0    120.0    9.0
-    105.0    120.0    6.0
-f359 1
-    -0.0    1.0    -0.0
-c0
-4
-    105.0    120.0    6.0
-    115.0    120.0    9.0
-    115.0    120.0    6.0
-    105.0    120.0    6.0
-f360 1
-    -0.0    1.0    -0.0
-c0
-4
-    115.0    120.0    6.0
-    115.0    120.0    9.0
-    125.0    120.0    9.0
-    115.0    120.0    6.0
-f361 1
-    0.0    -1.0    0.0
-c0
-4
-    125.0    100.0    9.0
-    115.0    100.0    6.0
-    125.0    100.0    6.0
-    125.0    100.0    9.0
-f362 1
-    0.0    -1.0    0.0
-c0
-4
-    105.0    100.0    9.0
-    105.0    100.0    6.0
-    115.0    100.0    9.0
-    105.0    100.0    9.0
-f363 1
-    0.0    -1.0    0.0
-c0
-4
-    115.0    100.0    9.0
-    105.0    100.0    6.0
-    115.0    100.0    6.0
-    115.0    100.0    9.0
-f364 1
-    0.0    -1.0    0.0
-c0
-4
-    125.0    100.0    9.0
-    115.0    100.0    9.0
-    115.0    100.0    6.0
-    125.0    100.0    9.0
-f365 1
-    -1.0    0.0    0.0
-c0
-4
-    105.0    120.0    6.0
-    105.0    110.0    9.0
-    105.0    120.0    9.0
-    105.0    120.0    6.0
-f366 1
-    -1.0    0.0    0.0
-c0
-4
-    105.0    110.0    6.0
-    105.0    110.0    9.0
-    105.0    120.0    6.0
-    105.0    110.0    6.0
-f367 1
-    -1.0    0.0    0.0
-c0
-4
-    105.0    110.0    6.0
-    105.0    100.0    6.0
-    105.0    100.0    9.0
-    105.0    110.0    6.0
-f368 1
-    -1.0    0.0    0.0
-c0
-4
-    105.0    110.0    6.0
-    105.0    100.0    9.0
-    105.0    110.0    9.0
-    105.0    110.0    6.0
-f369 1
-    1.0    -0.0    -0.0
-c0
-4
-    85.0    70.0    6.0
-    85.0    70.0    9.0
-    85.0    60.0    9.0
-    85.0    70.0    6.0
-f370 1
-    1.0    -0.0    -0.0
-c0
-4
-    85.0    70.0    6.0
-    85.0    60.0    9.0
-    85.0    60.0    6.0
-    85.0    70.0    6.0
-f371 1
-    1.0    -0.0    -0.0
-c0
-4
-    85.0    50.0    6.0
-    85.0    60.0    6.0
-    85.0    50.0    9.0
-    85.0    50.0    6.0
-f372 1
-    1.0    -0.0    -0.0
-c0
-4
-    85.0    60.0    6.0
-    85.0    60.0    9.0
-    85.0    50.0    9.0
-    85.0    60.0    6.0
-f373 1
-    -0.0    1.0    -0.0
-c0
-4
-    85.0    70.0    6.0
-    75.0    70.0    9.0
-    85.0    70.0    9.0
-    85.0    70.0    6.0
-f374 1
-    -0.0    1.0    -0.0
-c0
-4
-    85.0    70.0    6.0
-    75.0    70.0    6.0
-    75.0    70.0    9.0
-    85.0    70.0    6.0
-f375 1
-    -0.0    1.0    -0.0
-c0
-4
-    65.0    70.0    6.0
-    65.0    70.0    9.0
-    75.0    70.0    6.0
-    65.0    70.0    6.0
-f376 1
-    -0.0    1.0    -0.0
-c0
-4
-    75.0    70.0    6.0
-    65.0    70.0    9.0
-    75.0    70.0    9.0
-    75.0    70.0    6.0
-f377 1
-    0.0    -1.0    0.0
-c0
-4
-    85.0    50.0    9.0
-    75.0    50.0    6.0
-    85.0    50.0    6.0
-    85.0    50.0    9.0
-f378 1
-    0.0    -1.0    0.0
-c0
-4
-    75.0    50.0    9.0
-    65.0    50.0    9.0
-    65.0    50.0    6.0
-    75.0    50.0    9.0
-f379 1
-    0.0    -1.0    0.0
-c0
-4
-    75.0    50.0    9.0
-    65.0    50.0    6.0
-    75.0    50.0    6.0
-    75.0    50.0    9.0
-f380 1
-    0.0    -1.0    0.0
-c0
-4
-    75.0    50.0    9.0
-    75.0    50.0    6.0
-    85.0    50.0    9.0
-    75.0    50.0    9.0
-f381 1
-    -1.0    0.0    0.0
-c0
-4
-    65.0    70.0    6.0
-    65.0    60.0    9.0
-    65.0    70.0    9.0
-    65.0    70.0    6.0
-f382 1
-    -1.0    0.0    0.0
-c0
-4
-    65.0    70.0    6.0
-    65.0    60.0    6.0
-    65.0    60.0    9.0
-    65.0    70.0    6.0
-f383 1
-    -1.0    0.0    0.0
-c0
-4
-    65.0    50.0    6.0
-    65.0    50.0    9.0
-    65.0    60.0    9.0
-    65.0    50.0    6.0
-f384 1
-    -1.0    0.0    0.0
-c0
-4
-    65.0    60.0    6.0
-    65.0    50.0    6.0
-    65.0    60.0    9.0
-    65.0    60.0    6.0
-f385 1
-    -1.0    0.0    0.0
-c0
-4
-    95.0    35.0    6.0
-    95.0    35.0    9.0
-    95.0    45.0    6.0
-    95.0    35.0    6.0
-f386 1
-    -1.0    0.0    0.0
-c0
-4
-    95.0    55.0    6.0
-    95.0    45.0    6.0
-    95.0    55.0    9.0
-    95.0    55.0    6.0
-f387 1
-    -1.0    0.0    0.0
-c0
-4
-    95.0    45.0    6.0
-    95.0    35.0    9.0
-    95.0    45.0    9.0
-    95.0    45.0    6.0
-f388 1
-    -1.0    0.0    0.0
-c0
-4
-    95.0    45.0    6.0
-    95.0    45.0    9.0
-    95.0    55.0    9.0
-    95.0    45.0    6.0
-f389 1
-    -0.0    1.0    -0.0
-c0
-4
-    95.0    55.0    6.0
-    95.0    55.0    9.0
-    105.0    55.0    6.0
-    95.0    55.0    6.0
-f390 1
-    -0.0    1.0    -0.0
-c0
-4
-    115.0    55.0    6.0
-    105.0    55.0    9.0
-    115.0    55.0    9.0
-    115.0    55.0    6.0
-f391 1
-    -0.0    1.0    -0.0
-c0
-4
-    115.0    55.0    6.0
-    105.0    55.0    6.0
-    105.0    55.0    9.0
-    115.0    55.0    6.0
-f392 1
-    -0.0    1.0    -0.0
-c0
-4
-    105.0    55.0    6.0
-    95.0    55.0    9.0
-    105.0    55.0    9.0
-    105.0    55.0    6.0
-f393 1
-    0.0    -1.0    0.0
-c0
-4
-    95.0    35.0    9.0
-    95.0    35.0    6.0
-    105.0    35.0    6.0
-    95.0    35.0    9.0
-f394 1
-    0.0    -1.0    0.0
-c0
-4
-    105.0    35.0    9.0
-    115.0    35.0    6.0
-    115.0    35.0    9.0
-    105.0    35.0    9.0
-f395 1
-    0.0    -1.0    0.0
-c0
-4
-    105.0    35.0    9.0
-    105.0    35.0    6.0
-    115.0    35.0    6.0
-    105.0    35.0    9.0
-f396 1
-    0.0    -1.0    0.0
-c0
-4
-    95.0    35.0    9.0
-    105.0    35.0    6.0
-    105.0    35.0    9.0
-    95.0    35.0    9.0
-f397 1
-    1.0    -0.0    -0.0
-c0
-4
-    115.0    55.0    9.0
-    115.0    45.0    6.0
-    115.0    55.0    6.0
-    115.0    55.0    9.0
-f398 1
-    1.0    -0.0    -0.0
-c0
-4
-    115.0    35.0    9.0
-    115.0    35.0    6.0
-    115.0    45.0    9.0
-    115.0    35.0    9.0
-f399 1
-    1.0    -0.0    -0.0
-c0
-4
-    115.0    45.0    9.0
-    115.0    35.0    6.0
-    115.0    45.0    6.0
-    115.0    45.0    9.0
-f400 1
-    1.0    -0.0    -0.0
-c0
-4
-    115.0    45.0    9.0
-    115.0    45.0    6.0
-    115.0    55.0    9.0
-    115.0    45.0    9.0
-f401 1
-    1.0    -0.0    -0.0
-c0
-4
-    55.0    30.0    9.0
-    55.0    30.0    6.0
-    55.0    40.0    6.0
-    55.0    30.0    9.0
-f402 1
-    1.0    -0.0    -0.0
-c0
-4
-    55.0    40.0    9.0
-    55.0    50.0    6.0
-    55.0    50.0    9.0
-    55.0    40.0    9.0
-f403 1
-    1.0    -0.0    -0.0
-c0
-4
-    55.0    40.0    9.0
-    55.0    40.0    6.0
-    55.0    50.0    6.0
-    55.0    40.0    9.0
-f404 1
-    1.0    -0.0    -0.0
-c0
-4
-    55.0    40.0    9.0
-    55.0    30.0    9.0
-    55.0    40.0    6.0
-    55.0    40.0    9.0
-f405 1
-    -0.0    1.0    -0.0
-c0
-4
-    55.0    50.0    9.0
-    55.0    50.0    6.0
-    45.0    50.0    6.0
-    55.0    50.0    9.0
-f406 1
-    -0.0    1.0    -0.0
-c0
-4
-    35.0    50.0    9.0
-    45.0    50.0    9.0
-    35.0    50.0    6.0
-    35.0    50.0    9.0
-f407 1
-    -0.0    1.0    -0.0
-c0
-4
-    45.0    50.0    9.0
-    45.0    50.0    6.0
-    35.0    50.0    6.0
-    45.0    50.0    9.0
-f408 1
-    -0.0    1.0    -0.0
-c0
-4
-    45.0    50.0    9.0
-    55.0    50.0    9.0
-    45.0    50.0    6.0
-    45.0    50.0    9.0
-f409 1
-    0.0    -1.0    0.0
-c0
-4
-    55.0    30.0    9.0
-    45.0    30.0    6.0
-    55.0    30.0    6.0
-    55.0    30.0    9.0
-f410 1
-    0.0    -1.0    0.0
-c0
-4
-    45.0    30.0    9.0
-    35.0    30.0    9.0
-    35.0    30.0    6.0
-    45.0    30.0    9.0
-f411 1
-    0.0    -1.0    0.0
-c0
-4
-    45.0    30.0    9.0
-    35.0    30.0    6.0
-    45.0    30.0    6.0
-    45.0    30.0    9.0
-f412 1
-    0.0    -1.0    0.0
-c0
-4
-    45.0    30.0    9.0
-    45.0    30.0    6.0
-    55.0    30.0    9.0
-    45.0    30.0    9.0
-f413 1
-    -1.0    0.0    0.0
-c0
-4
-    35.0    40.0    6.0
-    35.0    50.0    9.0
-    35.0    50.0    6.0
-    35.0    40.0    6.0
-f414 1
-    -1.0    0.0    0.0
-c0
-4
-    35.0    30.0    6.0
-    35.0    30.0    9.0
-    35.0    40.0    9.0
-    35.0    30.0    6.0
-f415 1
-    -1.0    0.0    0.0
-c0
-4
-    35.0    30.0    6.0
-    35.0    40.0    9.0
-    35.0    40.0    6.0
-    35.0    30.0    6.0
-f416 1
-    -1.0    0.0    0.0
-c0
-4
-    35.0    40.0    6.0
-    35.0    40.0    9.0
-    35.0    50.0    9.0
-    35.0    40.0    6.0
-f417 1
-    1.0    -0.0    -0.0
-c0
-4
-    90.0    130.0    9.0
-    90.0    120.0    6.0
-    90.0    130.0    6.0
-    90.0    130.0    9.0
-f418 1
-    1.0    -0.0    -0.0
-c0
-4
-    90.0    110.0    9.0
-    90.0    110.0    6.0
-    90.0    120.0    9.0
-    90.0    110.0    9.0
-f419 1
-    1.0    -0.0    -0.0
-c0
-4
-    90.0    120.0    9.0
-    90.0    110.0    6.0
-    90.0    120.0    6.0
-    90.0    120.0    9.0
-f420 1
-    1.0    -0.0    -0.0
-c0
-4
-    90.0    130.0    9.0
-    90.0    120.0    9.0
-    90.0    120.0    6.0
-    90.0    130.0    9.0
-f421 1
-    -0.0    1.0    -0.0
-c0
-4
-    90.0    130.0    6.0
-    80.0    130.0    9.0
-    90.0    130.0    9.0
-    90.0    130.0    6.0
-f422 1
-    -0.0    1.0    -0.0
-c0
-4
-    90.0    130.0    6.0
-    80.0    130.0    6.0
-    80.0    130.0    9.0
-    90.0    130.0    6.0
-f423 1
-    -0.0    1.0    -0.0
-c0
-4
-    70.0    130.0    6.0
-    70.0    130.0    9.0
-    80.0    130.0    6.0
-    70.0    130.0    6.0
-f424 1
-    -0.0    1.0    -0.0
-c0
-4
-    80.0    130.0    6.0
-    70.0    130.0    9.0
-    80.0    130.0    9.0
-    80.0    130.0    6.0
-f425 1
-    -1.0    0.0    0.0
-c0
-4
-    70.0    130.0    6.0
-    70.0    120.0    9.0
-    70.0    130.0    9.0
-    70.0    130.0    6.0
-f426 1
-    -1.0    0.0    0.0
-c0
-4
-    70.0    120.0    6.0
-    70.0    120.0    9.0
-    70.0    130.0    6.0
-    70.0    120.0    6.0
-f427 1
-    -1.0    0.0    0.0
-c0
-4
-    70.0    110.0    6.0
-    70.0    110.0    9.0
-    70.0    120.0    6.0
-    70.0    110.0    6.0
-f428 1
-    -1.0    0.0    0.0
-c0
-4
-    70.0    120.0    6.0
-    70.0    110.0    9.0
-    70.0    120.0    9.0
-    70.0    120.0    6.0
-f429 1
-    0.0    -1.0    0.0
-c0
-4
-    90.0    110.0    9.0
-    80.0    110.0    9.0
-    90.0    110.0    6.0
-    90.0    110.0    9.0
-f430 1
-    0.0    -1.0    0.0
-c0
-4
-    80.0    110.0    9.0
-    80.0    110.0    6.0
-    90.0    110.0    6.0
-    80.0    110.0    9.0
-f431 1
-    0.0    -1.0    0.0
-c0
-4
-    70.0    110.0    9.0
-    70.0    110.0    6.0
-    80.0    110.0    9.0
-    70.0    110.0    9.0
-f432 1
-    0.0    -1.0    0.0
-c0
-4
-    80.0    110.0    9.0
-    70.0    110.0    6.0
-    80.0    110.0    6.0
-    80.0    110.0    9.0
-f433 1
-    -0.0    1.0    -0.0
-c0
-4
-    110.0    90.0    12.0
-    120.0    90.0    9.0
-    110.0    90.0    9.0
-    110.0    90.0    12.0
-f434 1
-    -0.0    1.0    -0.0
-c0
-4
-    130.0    90.0    12.0
-    130.0    90.0    9.0
-    120.0    90.0    9.0
-    130.0    90.0    12.0
-f435 1
-    -0.0    1.0    -0.0
-c0
-4
-    110.0    90.0    12.0
-    120.0    90.0    12.0
-    120.0    90.0    9.0
-    110.0    90.0    12.0
-f436 1
-    -0.0    1.0    -0.0
-c0
-4
-    130.0    90.0    12.0
-    120.0    90.0    9.0
-    120.0    90.0    12.0
-    130.0    90.0    12.0
-f437 1
-    1.0    -0.0    -0.0
-c0
-4
-    130.0    90.0    12.0
-    130.0    80.0    9.0
-    130.0    90.0    9.0
-    130.0    90.0    12.0
-f438 1
-    1.0    -0.0    -0.0
-c0
-4
-    130.0    70.0    12.0
-    130.0    70.0    9.0
-    130.0    80.0    9.0
-    130.0    70.0    12.0
-f439 1
-    1.0    -0.0    -0.0
-c0
-4
-    130.0    80.0    12.0
-    130.0    80.0    9.0
-    130.0    90.0    12.0
-    130.0    80.0    12.0
-f440 1
-    1.0    -0.0    -0.0
-c0
-4
-    130.0    80.0    12.0
-    130.0    70.0    12.0
-    130.0    80.0    9.0
-    130.0    80.0    12.0
-f441 1
-    -1.0    0.0    0.0
-c0
-4
-    110.0    90.0    9.0
-    110.0    80.0    12.0
-    110.0    90.0    12.0
-    110.0    90.0    9.0
-f442 1
-    -1.0    0.0    0.0
-c0
-4
-    110.0    80.0    9.0
-    110.0    80.0    12.0
-    110.0    90.0    9.0
-    110.0    80.0    9.0
-f443 1
-    -1.0    0.0    0.0
-c0
-4
-    110.0    70.0    9.0
-    110.0    70.0    12.0
-    110.0    80.0    12.0
-    110.0    70.0    9.0
-f444 1
-    -1.0    0.0    0.0
-c0
-4
-    110.0    80.0    9.0
-    110.0    70.0    9.0
-    110.0    80.0    12.0
-    110.0    80.0    9.0
-f445 1
-    0.0    -1.0    0.0
-c0
-4
-    130.0    70.0    12.0
-    120.0    70.0    12.0
-    130.0    70.0    9.0
-    130.0    70.0    12.0
-f446 1
-    0.0    -1.0    0.0
-c0
-4
-    120.0    70.0    12.0
-    120.0    70.0    9.0
-    130.0    70.0    9.0
-    120.0    70.0    12.0
-f447 1
-    0.0    -1.0    0.0
-c0
-4
-    110.0    70.0    12.0
-    110.0    70.0    9.0
-    120.0    70.0    12.0
-    110.0    70.0    12.0
-f448 1
-    0.0    -1.0    0.0
-c0
-4
-    120.0    70.0    12.0
-    110.0    70.0    9.0
-    120.0    70.0    9.0
-    120.0    70.0    12.0
-f449 1
-    1.0    -0.0    -0.0
-c0
-4
-    100.0    100.0    12.0
-    100.0    90.0    9.0
-    100.0    100.0    9.0
-    100.0    100.0    12.0
-f450 1
-    1.0    -0.0    -0.0
-c0
-4
-    100.0    80.0    12.0
-    100.0    80.0    9.0
-    100.0    90.0    12.0
-    100.0    80.0    12.0
-f451 1
-    1.0    -0.0    -0.0
-c0
-4
-    100.0    90.0    12.0
-    100.0    80.0    9.0
-    100.0    90.0    9.0
-    100.0    90.0    12.0
-f452 1
-    1.0    -0.0    -0.0
-c0
-4
-    100.0    90.0    12.0
-    100.0    90.0    9.0
-    100.0    100.0    12.0
-    100.0    90.0    12.0
-f453 1
-    -0.0    1.0    -0.0
-c0
-4
-    100.0    100.0    9.0
-    90.0    100.0    12.0
-    100.0    100.0    12.0
-    100.0    100.0    9.0
-f454 1
-    -0.0    1.0    -0.0
-c0
-4
-    90.0    100.0    9.0
-    90.0    100.0    12.0
-    100.0    100.0    9.0
-    90.0    100.0    9.0
-f455 1
-    -0.0    1.0    -0.0
-c0
-4
-    80.0    100.0    9.0
-    80.0    100.0    12.0
-    90.0    100.0    9.0
-    80.0    100.0    9.0
-f456 1
-    -0.0    1.0    -0.0
-c0
-4
-    90.0    100.0    9.0
-    80.0    100.0    12.0
-    90.0    100.0    12.0
-    90.0    100.0    9.0
-f457 1
-    0.0    -1.0    0.0
-c0
-4
-    100.0    80.0    12.0
-    90.0    80.0    12.0
-    100.0    80.0    9.0
-    100.0    80.0    12.0
-f458 1
-    0.0    -1.0    0.0
-c0
-4
-    90.0    80.0    12.0
-    90.0    80.0    9.0
-    100.0    80.0    9.0
-    90.0    80.0    12.0
-f459 1
-    0.0    -1.0    0.0
-c0
-4
-    80.0    80.0    12.0
-    80.0    80.0    9.0
-    90.0    80.0    12.0
-    80.0    80.0    12.0
-f460 1
-    0.0    -1.0    0.0
-c0
-4
-    90.0    80.0    12.0
-    80.0    80.0    9.0
-    90.0    80.0    9.0
-    90.0    80.0    12.0
-f461 1
-    -1.0    0.0    0.0
-c0
-4
-    80.0    100.0    9.0
-    80.0    90.0    12.0
-    80.0    100.0    12.0
-    80.0    100.0    9.0
-f462 1
-    -1.0    0.0    0.0
-c0
-4
-    80.0    90.0    9.0
-    80.0    90.0    12.0
-    80.0    100.0    9.0
-    80.0    90.0    9.0
-f463 1
-    -1.0    0.0    0.0
-c0
-4
-    80.0    80.0    9.0
-    80.0    80.0    12.0
-    80.0    90.0    12.0
-    80.0    80.0    9.0
-f464 1
-    -1.0    0.0    0.0
-c0
-4
-    80.0    90.0    9.0
-    80.0    80.0    9.0
-    80.0    90.0    12.0
-    80.0    90.0    9.0
-f465 1
-    -0.0    1.0    -0.0
-c0
-4
-    50.0    95.0    9.0
-    50.0    95.0    12.0
-    60.0    95.0    12.0
-    50.0    95.0    9.0
-f466 1
-    -0.0    1.0    -0.0
-c0
-4
-    50.0    95.0    9.0
-    60.0    95.0    12.0
-    60.0    95.0    9.0
-    50.0    95.0    9.0
-f467 1
-    -0.0    1.0    -0.0
-c0
-4
-    70.0    95.0    9.0
-    60.0    95.0    12.0
-    70.0    95.0    12.0
-    70.0    95.0    9.0
-f468 1
-    -0.0    1.0    -0.0
-c0
-4
-    60.0    95.0    9.0
-    60.0    95.0    12.0
-    70.0    95.0    9.0
-    60.0    95.0    9.0
-f469 1
-    1.0    -0.0    -0.0
-c0
-4
-    70.0    95.0    12.0
-    70.0    85.0    9.0
-    70.0    95.0    9.0
-    70.0    95.0    12.0
-f470 1
-    1.0    -0.0    -0.0
-c0
-4
-    70.0    75.0    12.0
-    70.0    75.0    9.0
-    70.0    85.0    12.0
-    70.0    75.0    12.0
-f471 1
-    1.0    -0.0    -0.0
-c0
-4
-    70.0    85.0    12.0
-    70.0    75.0    9.0
-    70.0    85.0    9.0
-    70.0    85.0    12.0
-f472 1
-    1.0    -0.0    -0.0
-c0
-4
-    70.0    95.0    12.0
-    70.0    85.0    12.0
-    70.0    85.0    9.0
-    70.0    95.0    12.0
-f473 1
-    -1.0    0.0    0.0
-c0
-4
-    50.0    95.0    9.0
-    50.0    85.0    12.0
-    50.0    95.0    12.0
-    50.0    95.0    9.0
-f474 1
-    -1.0    0.0    0.0
-c0
-4
-    50.0    95.0    9.0
-    50.0    85.0    9.0
-    50.0    85.0    12.0
-    50.0    95.0    9.0
-f475 1
-    -1.0    0.0    0.0
-c0
-4
-    50.0    75.0    9.0
-    50.0    75.0    12.0
-    50.0    85.0    9.0
-    50.0    75.0    9.0
-f476 1
-    -1.0    0.0    0.0
-c0
-4
-    50.0    85.0    9.0
-    50.0    75.0    12.0
-    50.0    85.0    12.0
-    50.0    85.0    9.0
-f477 1
-    0.0    -1.0    0.0
-c0
-4
-    70.0    75.0    12.0
-    60.0    75.0    9.0
-    70.0    75.0    9.0
-    70.0    75.0    12.0
-f478 1
-    0.0    -1.0    0.0
-c0
-4
-    60.0    75.0    12.0
-    50.0    75.0    12.0
-    50.0    75.0    9.0
-    60.0    75.0    12.0
-f479 1
-    0.0    -1.0    0.0
-c0
-4
-    60.0    75.0    12.0
-    50.0    75.0    9.0
-    60.0    75.0    9.0
-    60.0    75.0    12.0
-f480 1
-    0.0    -1.0    0.0
-c0
-4
-    60.0    75.0    12.0
-    60.0    75.0    9.0
-    70.0    75.0    12.0
-    60.0    75.0    12.0
-f481 1
-    1.0    -0.0    -0.0
-c0
-4
-    50.0    125.0    9.0
-    50.0    125.0    12.0
-    50.0    115.0    12.0
-    50.0    125.0    9.0
-f482 1
-    1.0    -0.0    -0.0
-c0
-4
-    50.0    115.0    9.0
-    50.0    125.0    9.0
-    50.0    115.0    12.0
-    50.0    115.0    9.0
-f483 1
-    1.0    -0.0    -0.0
-c0
-4
-    50.0    115.0    9.0
-    50.0    105.0    12.0
-    50.0    105.0    9.0
-    50.0    115.0    9.0
-f484 1
-    1.0    -0.0    -0.0
-c0
-4
-    50.0    115.0    9.0
-    50.0    115.0    12.0
-    50.0    105.0    12.0
-    50.0    115.0    9.0
-f485 1
-    -0.0    1.0    -0.0
-c0
-4
-    50.0    125.0    9.0
-    40.0    125.0    12.0
-    50.0    125.0    12.0
-    50.0    125.0    9.0
-f486 1
-    -0.0    1.0    -0.0
-c0
-4
-    40.0    125.0    9.0
-    40.0    125.0    12.0
-    50.0    125.0    9.0
-    40.0    125.0    9.0
-f487 1
-    -0.0    1.0    -0.0
-c0
-4
-    30.0    125.0    9.0
-    30.0    125.0    12.0
-    40.0    125.0    12.0
-    30.0    125.0    9.0
-f488 1
-    -0.0    1.0    -0.0
-c0
-4
-    40.0    125.0    9.0
-    30.0    125.0    9.0
-    40.0    125.0    12.0
-    40.0    125.0    9.0
-f489 1
-    0.0    -1.0    0.0
-c0
-4
-    50.0    105.0    9.0
-    50.0    105.0    12.0
-    40.0    105.0    12.0
-    50.0    105.0    9.0
-f490 1
-    0.0    -1.0    0.0
-c0
-4
-    50.0    105.0    9.0
-    40.0    105.0    12.0
-    40.0    105.0    9.0
-    50.0    105.0    9.0
-f491 1
-    0.0    -1.0    0.0
-c0
-4
-    30.0    105.0    9.0
-    40.0    105.0    12.0
-    30.0    105.0    12.0
-    30.0    105.0    9.0
-f492 1
-    0.0    -1.0    0.0
-c0
-4
-    30.0    105.0    9.0
-    40.0    105.0    9.0
-    40.0    105.0    12.0
-    30.0    105.0    9.0
-f493 1
-    -1.0    0.0    0.0
-c0
-4
-    30.0    125.0    9.0
-    30.0    115.0    12.0
-    30.0    125.0    12.0
-    30.0    125.0    9.0
-f494 1
-    -1.0    0.0    0.0
-c0
-4
-    30.0    125.0    9.0
-    30.0    115.0    9.0
-    30.0    115.0    12.0
-    30.0    125.0    9.0
-f495 1
-    -1.0    0.0    0.0
-c0
-4
-    30.0    105.0    9.0
-    30.0    105.0    12.0
-    30.0    115.0    9.0
-    30.0    105.0    9.0
-f496 1
-    -1.0    0.0    0.0
-c0
-4
-    30.0    115.0    9.0
-    30.0    105.0    12.0
-    30.0    115.0    12.0
-    30.0    115.0    9.0
-f497 1
-    1.0    -0.0    -0.0
-c0
-4
-    125.0    120.0    12.0
-    125.0    110.0    9.0
-    125.0    120.0    9.0
-    125.0    120.0    12.0
-f498 1
-    1.0    -0.0    -0.0
-c0
-4
-    125.0    100.0    12.0
-    125.0    100.0    9.0
-    125.0    110.0    9.0
-    125.0    100.0    12.0
-f499 1
-    1.0    -0.0    -0.0
-c0
-4
-    125.0    110.0    12.0
-    125.0    110.0    9.0
-    125.0    120.0    12.0
-    125.0    110.0    12.0
-f500 1
-    1.0    -0.0    -0.0
-c0
-4
-    125.0    110.0    12.0
-    125.0    100.0    12.0
-    125.0    110.0    9.0
-    125.0    110.0    12.0
-f501 1
-    -0.0    1.0    -0.0
-c0
-4
-    125.0    120.0    9.0
-    115.0    120.0    12.0
-    125.0    120.0    12.0
-    125.0    120.0    9.0
-f502 1
-    -0.0    1.0    -0.0
-c0
-4
-    115.0    120.0    9.0
-    115.0    120.0    12.0
-    125.0    120.0    9.0
-    115.0    120.0    9.0
-f503 1
-    -0.0    1.0    -0.0
-c0
-4
-    105.0    120.0    9.0
-    105.0    120.0    12.0
-    115.0    120.0    9.0
-    105.0    120.0    9.0
-f504 1
-    -0.0    1.0    -0.0
-c0
-4
-    115.0    120.0    9.0
-    105.0    120.0    12.0
-    115.0    120.0    12.0
-    115.0    120.0    9.0
-f505 1
-    0.0    -1.0    0.0
-c0
-4
-    125.0    100.0    12.0
-    115.0    100.0    9.0
-    125.0    100.0    9.0
-    125.0    100.0    12.0
-f506 1
-    0.0    -1.0    0.0
-c0
-4
-    105.0    100.0    12.0
-    105.0    100.0    9.0
-    115.0    100.0    9.0
-    105.0    100.0    12.0
-f507 1
-    0.0    -1.0    0.0
-c0
-4
-    115.0    100.0    12.0
-    115.0    100.0    9.0
-    125.0    100.0    12.0
-    115.0    100.0    12.0
-f508 1
-    0.0    -1.0    0.0
-c0
-4
-    115.0    100.0    12.0
-    105.0    100.0    12.0
-    115.0    100.0    9.0
-    115.0    100.0    12.0
-f509 1
-    -1.0    0.0    0.0
-c0
-4
-    105.0    110.0    9.0
-    105.0    120.0    12.0
-    105.0    120.0    9.0
-    105.0    110.0    9.0
-f510 1
-    -1.0    0.0    0.0
-c0
-4
-    105.0    100.0    9.0
-    105.0    100.0    12.0
-    105.0    110.0    12.0
-    105.0    100.0    9.0
-f511 1
-    -1.0    0.0    0.0
-c0
-4
-    105.0    110.0    9.0
-    105.0    100.0    9.0
-    105.0    110.0    12.0
-    105.0    110.0    9.0
-f512 1
-    -1.0    0.0    0.0
-c0
-4
-    105.0    110.0    9.0
-    105.0    110.0    12.0
-    105.0    120.0    12.0
-    105.0    110.0    9.0
-f513 1
-    1.0    -0.0    -0.0
-c0
-4
-    85.0    70.0    12.0
-    85.0    60.0    12.0
-    85.0    70.0    9.0
-    85.0    70.0    12.0
-f514 1
-    1.0    -0.0    -0.0
-c0
-4
-    85.0    60.0    12.0
-    85.0    60.0    9.0
-    85.0    70.0    9.0
-    85.0    60.0    12.0
-f515 1
-    1.0    -0.0    -0.0
-c0
-4
-    85.0    50.0    12.0
-    85.0    50.0    9.0
-    85.0    60.0    9.0
-    85.0    50.0    12.0
-f516 1
-    1.0    -0.0    -0.0
-c0
-4
-    85.0    50.0    12.0
-    85.0    60.0    9.0
-    85.0    60.0    12.0
-    85.0    50.0    12.0
-f517 1
-    -0.0    1.0    -0.0
-c0
-4
-    75.0    70.0    12.0
-    85.0    70.0    12.0
-    85.0    70.0    9.0
-    75.0    70.0    12.0
-f518 1
-    -0.0    1.0    -0.0
-c0
-4
-    75.0    70.0    12.0
-    85.0    70.0    9.0
-    75.0    70.0    9.0
-    75.0    70.0    12.0
-f519 1
-    -0.0    1.0    -0.0
-c0
-4
-    65.0    70.0    12.0
-    75.0    70.0    9.0
-    65.0    70.0    9.0
-    65.0    70.0    12.0
-f520 1
-    -0.0    1.0    -0.0
-c0
-4
-    75.0    70.0    12.0
-    75.0    70.0    9.0
-    65.0    70.0    12.0
-    75.0    70.0    12.0
-f521 1
-    0.0    -1.0    0.0
-c0
-4
-    85.0    50.0    12.0
-    75.0    50.0    12.0
-    85.0    50.0    9.0
-    85.0    50.0    12.0
-f522 1
-    0.0    -1.0    0.0
-c0
-4
-    75.0    50.0    12.0
-    75.0    50.0    9.0
-    85.0    50.0    9.0
-    75.0    50.0    12.0
-f523 1
-    0.0    -1.0    0.0
-c0
-4
-    65.0    50.0    12.0
-    65.0    50.0    9.0
-    75.0    50.0    9.0
-    65.0    50.0    12.0
-f524 1
-    0.0    -1.0    0.0
-c0
-4
-    65.0    50.0    12.0
-    75.0    50.0    9.0
-    75.0    50.0    12.0
-    65.0    50.0    12.0
-f525 1
-    -1.0    0.0    0.0
-c0
-4
-    65.0    70.0    9.0
-    65.0    60.0    12.0
-    65.0    70.0    12.0
-    65.0    70.0    9.0
-f526 1
-    -1.0    0.0    0.0
-c0
-4
-    65.0    60.0    9.0
-    65.0    60.0    12.0
-    65.0    70.0    9.0
-    65.0    60.0    9.0
-f527 1
-    -1.0    0.0    0.0
-c0
-4
-    65.0    50.0    9.0
-    65.0    50.0    12.0
-    65.0    60.0    12.0
-    65.0    50.0    9.0
-f528 1
-    -1.0    0.0    0.0
-c0
-4
-    65.0    50.0    9.0
-    65.0    60.0    12.0
-    65.0    60.0    9.0
-    65.0    50.0    9.0
-f529 1
-    -1.0    0.0    0.0
-c0
-4
-    95.0    35.0    9.0
-    95.0    35.0    12.0
-    95.0    45.0    9.0
-    95.0    35.0    9.0
-f530 1
-    -1.0    0.0    0.0
-c0
-4
-    95.0    55.0    9.0
-    95.0    45.0    9.0
-    95.0    55.0    12.0
-    95.0    55.0    9.0
-f531 1
-    -1.0    0.0    0.0
-c0
-4
-    95.0    45.0    9.0
-    95.0    35.0    12.0
-    95.0    45.0    12.0
-    95.0    45.0    9.0
-f532 1
-    -1.0    0.0    0.0
-c0
-4
-    95.0    45.0    9.0
-    95.0    45.0    12.0
-    95.0    55.0    12.0
-    95.0    45.0    9.0
-f533 1
-    -0.0    1.0    -0.0
-c0
-4
-    105.0    55.0    9.0
-    95.0    55.0    9.0
-    95.0    55.0    12.0
-    105.0    55.0    9.0
-f534 1
-    -0.0    1.0    -0.0
-c0
-4
-    115.0    55.0    9.0
-    105.0    55.0    9.0
-    115.0    55.0    12.0
-    115.0    55.0    9.0
-f535 1
-    -0.0    1.0    -0.0
-c0
-4
-    105.0    55.0    9.0
-    95.0    55.0    12.0
-    105.0    55.0    12.0
-    105.0    55.0    9.0
-f536 1
-    -0.0    1.0    -0.0
-c0
-4
-    105.0    55.0    9.0
-    105.0    55.0    12.0
-    115.0    55.0    12.0
-    105.0    55.0    9.0
-f537 1
-    0.0    -1.0    0.0
-c0
-4
-    95.0    35.0    9.0
-    105.0    35.0    12.0
-    95.0    35.0    12.0
-    95.0    35.0    9.0
-f538 1
-    0.0    -1.0    0.0
-c0
-4
-    95.0    35.0    9.0
-    105.0    35.0    9.0
-    105.0    35.0    12.0
-    95.0    35.0    9.0
-f539 1
-    0.0    -1.0    0.0
-c0
-4
-    115.0    35.0    9.0
-    115.0    35.0    12.0
-    105.0    35.0    9.0
-    115.0    35.0    9.0
-f540 1
-    0.0    -1.0    0.0
-c0
-4
-    105.0    35.0    9.0
-    115.0    35.0    12.0
-    105.0    35.0    12.0
-    105.0    35.0    9.0
-f541 1
-    1.0    -0.0    -0.0
-c0
-4
-    115.0    55.0    12.0
-    115.0    45.0    9.0
-    115.0    55.0    9.0
-    115.0    55.0    12.0
-f542 1
-    1.0    -0.0    -0.0
-c0
-4
-    115.0    35.0    12.0
-    115.0    35.0    9.0
-    115.0    45.0    9.0
-    115.0    35.0    12.0
-f543 1
-    1.0    -0.0    -0.0
-c0
-4
-    115.0    45.0    12.0
-    115.0    45.0    9.0
-    115.0    55.0    12.0
-    115.0    45.0    12.0
-f544 1
-    1.0    -0.0    -0.0
-c0
-4
-    115.0    45.0    12.0
-    115.0    35.0    12.0
-    115.0    45.0    9.0
-    115.0    45.0    12.0
-f545 1
-    1.0    -0.0    -0.0
-c0
-4
-    55.0    40.0    9.0
-    55.0    50.0    9.0
-    55.0    50.0    12.0
-    55.0    40.0    9.0
-f546 1
-    1.0    -0.0    -0.0
-c0
-4
-    55.0    30.0    9.0
-    55.0    40.0    12.0
-    55.0    30.0    12.0
-    55.0    30.0    9.0
-f547 1
-    1.0    -0.0    -0.0
-c0
-4
-    55.0    40.0    9.0
-    55.0    40.0    12.0
-    55.0    30.0    9.0
-    55.0    40.0    9.0
-f548 1
-    1.0    -0.0    -0.0
-c0
-4
-    55.0    40.0    9.0
-    55.0    50.0    12.0
-    55.0    40.0    12.0
-    55.0    40.0    9.0
-f549 1
-    -0.0    1.0    -0.0
-c0
-4
-    55.0    50.0    9.0
-    45.0    50.0    12.0
-    55.0    50.0    12.0
-    55.0    50.0    9.0
-f550 1
-    -0.0    1.0    -0.0
-c0
-4
-    55.0    50.0    9.0
-    45.0    50.0    9.0
-    45.0    50.0    12.0
-    55.0    50.0    9.0
-f551 1
-    -0.0    1.0    -0.0
-c0
-4
-    35.0    50.0    9.0
-    35.0    50.0    12.0
-    45.0    50.0    12.0
-    35.0    50.0    9.0
-f552 1
-    -0.0    1.0    -0.0
-c0
-4
-    35.0    50.0    9.0
-    45.0    50.0    12.0
-    45.0    50.0    9.0
-    35.0    50.0    9.0
-f553 1
-    0.0    -1.0    0.0
-c0
-4
-    45.0    30.0    12.0
-    55.0    30.0    9.0
-    55.0    30.0    12.0
-    45.0    30.0    12.0
-f554 1
-    0.0    -1.0    0.0
-c0
-4
-    45.0    30.0    12.0
-    45.0    30.0    9.0
-    55.0    30.0    9.0
-    45.0    30.0    12.0
-f555 1
-    0.0    -1.0    0.0
-c0
-4
-    35.0    30.0    12.0
-    35.0    30.0    9.0
-    45.0    30.0    9.0
-    35.0    30.0    12.0
-f556 1
-    0.0    -1.0    0.0
-c0
-4
-    45.0    30.0    12.0
-    35.0    30.0    12.0
-    45.0    30.0    9.0
-    45.0    30.0    12.0
-f557 1
-    -1.0    0.0    0.0
-c0
-4
-    35.0    50.0    12.0
-    35.0    50.0    9.0
-    35.0    40.0    12.0
-    35.0    50.0    12.0
-f558 1
-    -1.0    0.0    0.0
-c0
-4
-    35.0    40.0    12.0
-    35.0    50.0    9.0
-    35.0    40.0    9.0
-    35.0    40.0    12.0
-f559 1
-    -1.0    0.0    0.0
-c0
-4
-    35.0    30.0    12.0
-    35.0    40.0    9.0
-    35.0    30.0    9.0
-    35.0    30.0    12.0
-f560 1
-    -1.0    0.0    0.0
-c0
-4
-    35.0    40.0    12.0
-    35.0    40.0    9.0
-    35.0    30.0    12.0
-    35.0    40.0    12.0
-f561 1
-    1.0    -0.0    -0.0
-c0
-4
-    90.0    130.0    12.0
-    90.0    120.0    9.0
-    90.0    130.0    9.0
-    90.0    130.0    12.0
-f562 1
-    1.0    -0.0    -0.0
-c0
-4
-    90.0    110.0    12.0
-    90.0    110.0    9.0
-    90.0    120.0    9.0
-    90.0    110.0    12.0
-f563 1
-    1.0    -0.0    -0.0
-c0
-4
-    90.0    130.0    12.0
-    90.0    120.0    12.0
-    90.0    120.0    9.0
-    90.0    130.0    12.0
-f564 1
-    1.0    -0.0    -0.0
-c0
-4
-    90.0    120.0    12.0
-    90.0    110.0    12.0
-    90.0    120.0    9.0
-    90.0    120.0    12.0
-f565 1
-    -0.0    1.0    -0.0
-c0
-4
-    90.0    130.0    9.0
-    80.0    130.0    12.0
-    90.0    130.0    12.0
-    90.0    130.0    9.0
-f566 1
-    -0.0    1.0    -0.0
-c0
-4
-    80.0    130.0    9.0
-    80.0    130.0    12.0
-    90.0    130.0    9.0
-    80.0    130.0    9.0
-f567 1
-    -0.0    1.0    -0.0
-c0
-4
-    80.0    130.0    9.0
-    70.0    130.0    9.0
-    70.0    130.0    12.0
-    80.0    130.0    9.0
-f568 1
-    -0.0    1.0    -0.0
-c0
-4
-    80.0    130.0    9.0
-    70.0    130.0    12.0
-    80.0    130.0    12.0
-    80.0    130.0    9.0
-f569 1
-    -1.0    0.0    0.0
-c0
-4
-    70.0    120.0    9.0
-    70.0    130.0    12.0
-    70.0    130.0    9.0
-    70.0    120.0    9.0
-f570 1
-    -1.0    0.0    0.0
-c0
-4
-    70.0    110.0    9.0
-    70.0    110.0    12.0
-    70.0    120.0    9.0
-    70.0    110.0    9.0
-f571 1
-    -1.0    0.0    0.0
-c0
-4
-    70.0    120.0    9.0
-    70.0    120.0    12.0
-    70.0    130.0    12.0
-    70.0    120.0    9.0
-f572 1
-    -1.0    0.0    0.0
-c0
-4
-    70.0    120.0    9.0
-    70.0    110.0    12.0
-    70.0    120.0    12.0
-    70.0    120.0    9.0
-f573 1
-    0.0    -1.0    0.0
-c0
-4
-    90.0    110.0    12.0
-    80.0    110.0    12.0
-    90.0    110.0    9.0
-    90.0    110.0    12.0
-f574 1
-    0.0    -1.0    0.0
-c0
-4
-    80.0    110.0    12.0
-    80.0    110.0    9.0
-    90.0    110.0    9.0
-    80.0    110.0    12.0
-f575 1
-    0.0    -1.0    0.0
-c0
-4
-    70.0    110.0    12.0
-    70.0    110.0    9.0
-    80.0    110.0    9.0
-    70.0    110.0    12.0
-f576 1
-    0.0    -1.0    0.0
-c0
-4
-    70.0    110.0    12.0
-    80.0    110.0    9.0
-    80.0    110.0    12.0
-    70.0    110.0    12.0
-f577 1
-    -0.0    1.0    -0.0
-c0
-4
-    110.0    90.0    12.0
-    110.0    90.0    15.0
-    120.0    90.0    15.0
-    110.0    90.0    12.0
-f578 1
-    -0.0    1.0    -0.0
-c0
-4
-    120.0    90.0    12.0
-    110.0    90.0    12.0
-    120.0    90.0    15.0
-    120.0    90.0    12.0
-f579 1
-    -0.0    1.0    -0.0
-c0
-4
-    130.0    90.0    12.0
-    120.0    90.0    15.0
-    130.0    90.0    15.0
-    130.0    90.0    12.0
-f580 1
-    -0.0    1.0    -0.0
-c0
-4
-    120.0    90.0    12.0
-    120.0    90.0    15.0
-    130.0    90.0    12.0
-    120.0    90.0    12.0
-f581 1
-    1.0    -0.0    -0.0
-c0
-4
-    130.0    90.0    15.0
-    130.0    80.0    12.0
-    130.0    90.0    12.0
-    130.0    90.0    15.0
-f582 1
-    1.0    -0.0    -0.0
-c0
-4
-    130.0    70.0    15.0
-    130.0    70.0    12.0
-    130.0    80.0    12.0
-    130.0    70.0    15.0
-f583 1
-    1.0    -0.0    -0.0
-c0
-4
-    130.0    90.0    15.0
-    130.0    80.0    15.0
-    130.0    80.0    12.0
-    130.0    90.0    15.0
-f584 1
-    1.0    -0.0    -0.0
-c0
-4
-    130.0    80.0    15.0
-    130.0    70.0    15.0
-    130.0    80.0    12.0
-    130.0    80.0    15.0
-f585 1
-    -1.0    0.0    0.0
-c0
-4
-    110.0    90.0    12.0
-    110.0    80.0    15.0
-    110.0    90.0    15.0
-    110.0    90.0    12.0
-f586 1
-    -1.0    0.0    0.0
-c0
-4
-    110.0    80.0    12.0
-    110.0    80.0    15.0
-    110.0    90.0    12.0
-    110.0    80.0    12.0
-f587 1
-    -1.0    0.0    0.0
-c0
-4
-    110.0    70.0    12.0
-    110.0    70.0    15.0
-    110.0    80.0    12.0
-    110.0    70.0    12.0
-f588 1
-    -1.0    0.0    0.0
-c0
-4
-    110.0    80.0    12.0
-    110.0    70.0    15.0
-    110.0    80.0    15.0
-    110.0    80.0    12.0
-f589 1
-    0.0    -1.0    0.0
-c0
-4
-    130.0    70.0    15.0
-    120.0    70.0    12.0
-    130.0    70.0    12.0
-    130.0    70.0    15.0
-f590 1
-    0.0    -1.0    0.0
-c0
-4
-    120.0    70.0    15.0
-    110.0    70.0    15.0
-    110.0    70.0    12.0
-    120.0    70.0    15.0
-f591 1
-    0.0    -1.0    0.0
-c0
-4
-    120.0    70.0    15.0
-    110.0    70.0    12.0
-    120.0    70.0    12.0
-    120.0    70.0    15.0
-f592 1
-    0.0    -1.0    0.0
-c0
-4
-    120.0    70.0    15.0
-    120.0    70.0    12.0
-    130.0    70.0    15.0
-    120.0    70.0    15.0
-f593 1
-    1.0    -0.0    -0.0
-c0
-4
-    100.0    90.0    15.0
-    100.0    100.0    12.0
-    100.0    100.0    15.0
-    100.0    90.0    15.0
-f594 1
-    1.0    -0.0    -0.0
-c0
-4
-    100.0    90.0    15.0
-    100.0    90.0    12.0
-    100.0    100.0    12.0
-    100.0    90.0    15.0
-f595 1
-    1.0    -0.0    -0.0
-c0
-4
-    100.0    80.0    15.0
-    100.0    80.0    12.0
-    100.0    90.0    12.0
-    100.0    80.0    15.0
-f596 1
-    1.0    -0.0    -0.0
-c0
-4
-    100.0    80.0    15.0
-    100.0    90.0    12.0
-    100.0    90.0    15.0
-    100.0    80.0    15.0
-f597 1
-    -0.0    1.0    -0.0
-c0
-4
-    100.0    100.0    15.0
-    100.0    100.0    12.0
-    90.0    100.0    12.0
-    100.0    100.0    15.0
-f598 1
-    -0.0    1.0    -0.0
-c0
-4
-    90.0    100.0    15.0
-    80.0    100.0    12.0
-    80.0    100.0    15.0
-    90.0    100.0    15.0
-f599 1
-    -0.0    1.0    -0.0
-c0
-4
-    90.0    100.0    15.0
-    90.0    100.0    12.0
-    80.0    100.0    12.0
-    90.0    100.0    15.0
-f600 1
-    -0.0    1.0    -0.0
-c0
-4
-    90.0    100.0    15.0
-    100.0    100.0    15.0
-    90.0    100.0    12.0
-    90.0    100.0    15.0
-f601 1
-    0.0    -1.0    0.0
-c0
-4
-    100.0    80.0    15.0
-    90.0    80.0    15.0
-    100.0    80.0    12.0
-    100.0    80.0    15.0
-f602 1
-    0.0    -1.0    0.0
-c0
-4
-    90.0    80.0    15.0
-    90.0    80.0    12.0
-    100.0    80.0    12.0
-    90.0    80.0    15.0
-f603 1
-    0.0    -1.0    0.0
-c0
-4
-    90.0    80.0    15.0
-    80.0    80.0    15.0
-    80.0    80.0    12.0
-    90.0    80.0    15.0
-f604 1
-    0.0    -1.0    0.0
-c0
-4
-    90.0    80.0    15.0
-    80.0    80.0    12.0
-    90.0    80.0    12.0
-    90.0    80.0    15.0
-f605 1
-    -1.0    0.0    0.0
-c0
-4
-    80.0    100.0    12.0
-    80.0    90.0    15.0
-    80.0    100.0    15.0
-    80.0    100.0    12.0
-f606 1
-    -1.0    0.0    0.0
-c0
-4
-    80.0    100.0    12.0
-    80.0    90.0    12.0
-    80.0    90.0    15.0
-    80.0    100.0    12.0
-f607 1
-    -1.0    0.0    0.0
-c0
-4
-    80.0    80.0    12.0
-    80.0    80.0    15.0
-    80.0    90.0    15.0
-    80.0    80.0    12.0
-f608 1
-    -1.0    0.0    0.0
-c0
-4
-    80.0    90.0    12.0
-    80.0    80.0    12.0
-    80.0    90.0    15.0
-    80.0    90.0    12.0
-f609 1
-    -0.0    1.0    -0.0
-c0
-4
-    50.0    95.0    12.0
-    50.0    95.0    15.0
-    60.0    95.0    15.0
-    50.0    95.0    12.0
-f610 1
-    -0.0    1.0    -0.0
-c0
-4
-    50.0    95.0    12.0
-    60.0    95.0    15.0
-    60.0    95.0    12.0
-    50.0    95.0    12.0
-f611 1
-    -0.0    1.0    -0.0
-c0
-4
-    70.0    95.0    12.0
-    60.0    95.0    12.0
-    70.0    95.0    15.0
-    70.0    95.0    12.0
-f612 1
-    -0.0    1.0    -0.0
-c0
-4
-    60.0    95.0    12.0
-    60.0    95.0    15.0
-    70.0    95.0    15.0
-    60.0    95.0    12.0
-f613 1
-    1.0    -0.0    -0.0
-c0
-4
-    70.0    85.0    15.0
-    70.0    95.0    12.0
-    70.0    95.0    15.0
-    70.0    85.0    15.0
-f614 1
-    1.0    -0.0    -0.0
-c0
-4
-    70.0    85.0    15.0
-    70.0    85.0    12.0
-    70.0    95.0    12.0
-    70.0    85.0    15.0
-f615 1
-    1.0    -0.0    -0.0
-c0
-4
-    70.0    75.0    15.0
-    70.0    75.0    12.0
-    70.0    85.0    15.0
-    70.0    75.0    15.0
-f616 1
-    1.0    -0.0    -0.0
-c0
-4
-    70.0    85.0    15.0
-    70.0    75.0    12.0
-    70.0    85.0    12.0
-    70.0    85.0    15.0
-f617 1
-    -1.0    0.0    0.0
-c0
-4
-    50.0    95.0    12.0
-    50.0    85.0    15.0
-    50.0    95.0    15.0
-    50.0    95.0    12.0
-f618 1
-    -1.0    0.0    0.0
-c0
-4
-    50.0    85.0    12.0
-    50.0    85.0    15.0
-    50.0    95.0    12.0
-    50.0    85.0    12.0
-f619 1
-    -1.0    0.0    0.0
-c0
-4
-    50.0    75.0    12.0
-    50.0    75.0    15.0
-    50.0    85.0    12.0
-    50.0    75.0    12.0
-f620 1
-    -1.0    0.0    0.0
-c0
-4
-    50.0    85.0    12.0
-    50.0    75.0    15.0
-    50.0    85.0    15.0
-    50.0    85.0    12.0
-f621 1
-    0.0    -1.0    0.0
-c0
-4
-    60.0    75.0    15.0
-    70.0    75.0    12.0
-    70.0    75.0    15.0
-    60.0    75.0    15.0
-f622 1
-    0.0    -1.0    0.0
-c0
-4
-    60.0    75.0    15.0
-    60.0    75.0    12.0
-    70.0    75.0    12.0
-    60.0    75.0    15.0
-f623 1
-    0.0    -1.0    0.0
-c0
-4
-    50.0    75.0    15.0
-    50.0    75.0    12.0
-    60.0    75.0    15.0
-    50.0    75.0    15.0
-f624 1
-    0.0    -1.0    0.0
-c0
-4
-    60.0    75.0    15.0
-    50.0    75.0    12.0
-    60.0    75.0    12.0
-    60.0    75.0    15.0
-f625 1
-    1.0    -0.0    -0.0
-c0
-4
-    50.0    125.0    15.0
-    50.0    115.0    12.0
-    50.0    125.0    12.0
-    50.0    125.0    15.0
-f626 1
-    1.0    -0.0    -0.0
-c0
-4
-    50.0    105.0    15.0
-    50.0    105.0    12.0
-    50.0    115.0    15.0
-    50.0    105.0    15.0
-f627 1
-    1.0    -0.0    -0.0
-c0
-4
-    50.0    115.0    15.0
-    50.0    105.0    12.0
-    50.0    115.0    12.0
-    50.0    115.0    15.0
-f628 1
-    1.0    -0.0    -0.0
-c0
-4
-    50.0    125.0    15.0
-    50.0    115.0    15.0
-    50.0    115.0    12.0
-    50.0    125.0    15.0
-f629 1
-    -0.0    1.0    -0.0
-c0
-4
-    50.0    125.0    15.0
-    50.0    125.0    12.0
-    40.0    125.0    12.0
-    50.0    125.0    15.0
-f630 1
-    -0.0    1.0    -0.0
-c0
-4
-    30.0    125.0    15.0
-    40.0    125.0    15.0
-    30.0    125.0    12.0
-    30.0    125.0    15.0
-f631 1
-    -0.0    1.0    -0.0
-c0
-4
-    40.0    125.0    15.0
-    40.0    125.0    12.0
-    30.0    125.0    12.0
-    40.0    125.0    15.0
-f632 1
-    -0.0    1.0    -0.0
-c0
-4
-    40.0    125.0    15.0
-    50.0    125.0    15.0
-    40.0    125.0    12.0
-    40.0    125.0    15.0
-f633 1
-    0.0    -1.0    0.0
-c0
-4
-    50.0    105.0    12.0
-    50.0    105.0    15.0
-    40.0    105.0    15.0
-    50.0    105.0    12.0
-f634 1
-    0.0    -1.0    0.0
-c0
-4
-    40.0    105.0    12.0
-    50.0    105.0    12.0
-    40.0    105.0    15.0
-    40.0    105.0    12.0
-f635 1
-    0.0    -1.0    0.0
-c0
-4
-    30.0    105.0    12.0
-    40.0    105.0    12.0
-    30.0    105.0    15.0
-    30.0    105.0    12.0
-f636 1
-    0.0    -1.0    0.0
-c0
-4
-    40.0    105.0    12.0
-    40.0    105.0    15.0
-    30.0    105.0    15.0
-    40.0    105.0    12.0
-f637 1
-    -1.0    0.0    0.0
-c0
-4
-    30.0    125.0    15.0
-    30.0    125.0    12.0
-    30.0    115.0    15.0
-    30.0    125.0    15.0
-f638 1
-    -1.0    0.0    0.0
-c0
-4
-    30.0    115.0    15.0
-    30.0    125.0    12.0
-    30.0    115.0    12.0
-    30.0    115.0    15.0
-f639 1
-    -1.0    0.0    0.0
-c0
-4
-    30.0    105.0    15.0
-    30.0    115.0    15.0
-    30.0    105.0    12.0
-    30.0    105.0    15.0
-f640 1
-    -1.0    0.0    0.0
-c0
-4
-    30.0    115.0    15.0
-    30.0    115.0    12.0
-    30.0    105.0    12.0
-    30.0    115.0    15.0
-f641 1
-    1.0    -0.0    -0.0
-c0
-4
-    125.0    120.0    15.0
-    125.0    110.0    12.0
-    125.0    120.0    12.0
-    125.0    120.0    15.0
-f642 1
-    1.0    -0.0    -0.0
-c0
-4
-    125.0    100.0    15.0
-    125.0    100.0    12.0
-    125.0    110.0    12.0
-    125.0    100.0    15.0
-f643 1
-    1.0    -0.0    -0.0
-c0
-4
-    125.0    120.0    15.0
-    125.0    110.0    15.0
-    125.0    110.0    12.0
-    125.0    120.0    15.0
-f644 1
-    1.0    -0.0    -0.0
-c0
-4
-    125.0    110.0    15.0
-    125.0    100.0    15.0
-    125.0    110.0    12.0
-    125.0    110.0    15.0
-f645 1
-    -0.0    1.0    -0.0
-c0
-4
-    125.0    120.0    12.0
-    115.0    120.0    15.0
-    125.0    120.0    15.0
-    125.0    120.0    12.0
-f646 1
-    -0.0    1.0    -0.0
-c0
-4
-    125.0    120.0    12.0
-    115.0    120.0    12.0
-    115.0    120.0    15.0
-    125.0    120.0    12.0
-f647 1
-    -0.0    1.0    -0.0
-c0
-4
-    105.0    120.0    12.0
-    105.0    120.0    15.0
-    115.0    120.0    15.0
-    105.0    120.0    12.0
-f648 1
-    -0.0    1.0    -0.0
-c0
-4
-    115.0    120.0    12.0
-    105.0    120.0    12.0
-    115.0    120.0    15.0
-    115.0    120.0    12.0
-f649 1
-    0.0    -1.0    0.0
-c0
-4
-    115.0    100.0    15.0
-    125.0    100.0    12.0
-    125.0    100.0    15.0
-    115.0    100.0    15.0
-f650 1
-    0.0    -1.0    0.0
-c0
-4
-    115.0    100.0    15.0
-    115.0    100.0    12.0
-    125.0    100.0    12.0
-    115.0    100.0    15.0
-f651 1
-    0.0    -1.0    0.0
-c0
-4
-    105.0    100.0    15.0
-    105.0    100.0    12.0
-    115.0    100.0    12.0
-    105.0    100.0    15.0
-f652 1
-    0.0    -1.0    0.0
-c0
-4
-    105.0    100.0    15.0
-    115.0    100.0    12.0
-    115.0    100.0    15.0
-    105.0    100.0    15.0
-f653 1
-    -1.0    0.0    0.0
-c0
-4
-    105.0    120.0    12.0
-    105.0    110.0    15.0
-    105.0    120.0    15.0
-    105.0    120.0    12.0
-f654 1
-    -1.0    0.0    0.0
-c0
-4
-    105.0    110.0    12.0
-    105.0    110.0    15.0
-    105.0    120.0    12.0
-    105.0    110.0    12.0
-f655 1
-    -1.0    0.0    0.0
-c0
-4
-    105.0    110.0    12.0
-    105.0    100.0    12.0
-    105.0    100.0    15.0
-    105.0    110.0    12.0
-f656 1
-    -1.0    0.0    0.0
-c0
-4
-    105.0    110.0    12.0
-    105.0    100.0    15.0
-    105.0    110.0    15.0
-    105.0    110.0    12.0
-f657 1
-    1.0    -0.0    -0.0
-c0
-4
-    85.0    70.0    15.0
-    85.0    60.0    12.0
-    85.0    70.0    12.0
-    85.0    70.0    15.0
-f658 1
-    1.0    -0.0    -0.0
-c0
-4
-    85.0    50.0    15.0
-    85.0    50.0    12.0
-    85.0    60.0    12.0
-    85.0    50.0    15.0
-f659 1
-    1.0    -0.0    -0.0
-c0
-4
-    85.0    70.0    15.0
-    85.0    60.0    15.0
-    85.0    60.0    12.0
-    85.0    70.0    15.0
-f660 1
-    1.0    -0.0    -0.0
-c0
-4
-    85.0    50.0    15.0
-    85.0    60.0    12.0
-    85.0    60.0    15.0
-    85.0    50.0    15.0
-f661 1
-    -0.0    1.0    -0.0
-c0
-4
-    85.0    70.0    12.0
-    75.0    70.0    15.0
-    85.0    70.0    15.0
-    85.0    70.0    12.0
-f662 1
-    -0.0    1.0    -0.0
-c0
-4
-    75.0    70.0    12.0
-    75.0    70.0    15.0
-    85.0    70.0    12.0
-    75.0    70.0    12.0
-f663 1
-    -0.0    1.0    -0.0
-c0
-4
-    65.0    70.0    12.0
-    65.0    70.0    15.0
-    75.0    70.0    12.0
-    65.0    70.0    12.0
-f664 1
-    -0.0    1.0    -0.0
-c0
-4
-    75.0    70.0    12.0
-    65.0    70.0    15.0
-    75.0    70.0    15.0
-    75.0    70.0    12.0
-f665 1
-    0.0    -1.0    0.0
-c0
-4
-    85.0    50.0    15.0
-    75.0    50.0    12.0
-    85.0    50.0    12.0
-    85.0    50.0    15.0
-f666 1
-    0.0    -1.0    0.0
-c0
-4
-    65.0    50.0    15.0
-    65.0    50.0    12.0
-    75.0    50.0    12.0
-    65.0    50.0    15.0
-f667 1
-    0.0    -1.0    0.0
-c0
-4
-    75.0    50.0    15.0
-    75.0    50.0    12.0
-    85.0    50.0    15.0
-    75.0    50.0    15.0
-f668 1
-    0.0    -1.0    0.0
-c0
-4
-    75.0    50.0    15.0
-    65.0    50.0    15.0
-    75.0    50.0    12.0
-    75.0    50.0    15.0
-f669 1
-    -1.0    0.0    0.0
-c0
-4
-    65.0    60.0    12.0
-    65.0    70.0    15.0
-    65.0    70.0    12.0
-    65.0    60.0    12.0
-f670 1
-    -1.0    0.0    0.0
-c0
-4
-    65.0    60.0    12.0
-    65.0    50.0    12.0
-    65.0    50.0    15.0
-    65.0    60.0    12.0
-f671 1
-    -1.0    0.0    0.0
-c0
-4
-    65.0    60.0    12.0
-    65.0    60.0    15.0
-    65.0    70.0    15.0
-    65.0    60.0    12.0
-f672 1
-    -1.0    0.0    0.0
-c0
-4
-    65.0    60.0    12.0
-    65.0    50.0    15.0
-    65.0    60.0    15.0
-    65.0    60.0    12.0
-f673 1
-    -1.0    0.0    0.0
-c0
-4
-    95.0    35.0    12.0
-    95.0    35.0    15.0
-    95.0    45.0    15.0
-    95.0    35.0    12.0
-f674 1
-    -1.0    0.0    0.0
-c0
-4
-    95.0    35.0    12.0
-    95.0    45.0    15.0
-    95.0    45.0    12.0
-    95.0    35.0    12.0
-f675 1
-    -1.0    0.0    0.0
-c0
-4
-    95.0    55.0    12.0
-    95.0    45.0    12.0
-    95.0    55.0    15.0
-    95.0    55.0    12.0
-f676 1
-    -1.0    0.0    0.0
-c0
-4
-    95.0    45.0    12.0
-    95.0    45.0    15.0
-    95.0    55.0    15.0
-    95.0    45.0    12.0
-f677 1
-    -0.0    1.0    -0.0
-c0
-4
-    95.0    55.0    12.0
-    95.0    55.0    15.0
-    105.0    55.0    15.0
-    95.0    55.0    12.0
-f678 1
-    -0.0    1.0    -0.0
-c0
-4
-    95.0    55.0    12.0
-    105.0    55.0    15.0
-    105.0    55.0    12.0
-    95.0    55.0    12.0
-f679 1
-    -0.0    1.0    -0.0
-c0
-4
-    115.0    55.0    12.0
-    105.0    55.0    12.0
-    115.0    55.0    15.0
-    115.0    55.0    12.0
-f680 1
-    -0.0    1.0    -0.0
-c0
-4
-    105.0    55.0    12.0
-    105.0    55.0    15.0
-    115.0    55.0    15.0
-    105.0    55.0    12.0
-f681 1
-    0.0    -1.0    0.0
-c0
-4
-    95.0    35.0    15.0
-    95.0    35.0    12.0
-    105.0    35.0    12.0
-    95.0    35.0    15.0
-f682 1
-    0.0    -1.0    0.0
-c0
-4
-    105.0    35.0    15.0
-    115.0    35.0    12.0
-    115.0    35.0    15.0
-    105.0    35.0    15.0
-f683 1
-    0.0    -1.0    0.0
-c0
-4
-    105.0    35.0    15.0
-    105.0    35.0    12.0
-    115.0    35.0    12.0
-    105.0    35.0    15.0
-f684 1
-    0.0    -1.0    0.0
-c0
-4
-    95.0    35.0    15.0
-    105.0    35.0    12.0
-    105.0    35.0    15.0
-    95.0    35.0    15.0
-f685 1
-    1.0    -0.0    -0.0
-c0
-4
-    115.0    55.0    15.0
-    115.0    45.0    12.0
-    115.0    55.0    12.0
-    115.0    55.0    15.0
-f686 1
-    1.0    -0.0    -0.0
-c0
-4
-    115.0    45.0    15.0
-    115.0    35.0    15.0
-    115.0    35.0    12.0
-    115.0    45.0    15.0
-f687 1
-    1.0    -0.0    -0.0
-c0
-4
-    115.0    45.0    15.0
-    115.0    35.0    12.0
-    115.0    45.0    12.0
-    115.0    45.0    15.0
-f688 1
-    1.0    -0.0    -0.0
-c0
-4
-    115.0    55.0    15.0
-    115.0    45.0    15.0
-    115.0    45.0    12.0
-    115.0    55.0    15.0
-f689 1
-    1.0    -0.0    -0.0
-c0
-4
-    55.0    50.0    15.0
-    55.0    40.0    12.0
-    55.0    50.0    12.0
-    55.0    50.0    15.0
-f690 1
-    1.0    -0.0    -0.0
-c0
-4
-    55.0    40.0    15.0
-    55.0    30.0    15.0
-    55.0    30.0    12.0
-    55.0    40.0    15.0
-f691 1
-    1.0    -0.0    -0.0
-c0
-4
-    55.0    40.0    15.0
-    55.0    30.0    12.0
-    55.0    40.0    12.0
-    55.0    40.0    15.0
-f692 1
-    1.0    -0.0    -0.0
-c0
-4
-    55.0    40.0    15.0
-    55.0    40.0    12.0
-    55.0    50.0    15.0
-    55.0    40.0    15.0
-f693 1
-    -0.0    1.0    -0.0
-c0
-4
-    45.0    50.0    15.0
-    55.0    50.0    15.0
-    55.0    50.0    12.0
-    45.0    50.0    15.0
-f694 1
-    -0.0    1.0    -0.0
-c0
-4
-    45.0    50.0    15.0
-    55.0    50.0    12.0
-    45.0    50.0    12.0
-    45.0    50.0    15.0
-f695 1
-    -0.0    1.0    -0.0
-c0
-4
-    35.0    50.0    15.0
-    45.0    50.0    12.0
-    35.0    50.0    12.0
-    35.0    50.0    15.0
-f696 1
-    -0.0    1.0    -0.0
-c0
-4
-    45.0    50.0    15.0
-    45.0    50.0    12.0
-    35.0    50.0    15.0
-    45.0    50.0    15.0
-f697 1
-    0.0    -1.0    0.0
-c0
-4
-    55.0    30.0    15.0
-    45.0    30.0    12.0
-    55.0    30.0    12.0
-    55.0    30.0    15.0
-f698 1
-    0.0    -1.0    0.0
-c0
-4
-    45.0    30.0    15.0
-    35.0    30.0    15.0
-    35.0    30.0    12.0
-    45.0    30.0    15.0
-f699 1
-    0.0    -1.0    0.0
-c0
-4
-    45.0    30.0    15.0
-    35.0    30.0    12.0
-    45.0    30.0    12.0
-    45.0    30.0    15.0
-f700 1
-    0.0    -1.0    0.0
-c0
-4
-    55.0    30.0    15.0
-    45.0    30.0    15.0
-    45.0    30.0    12.0
-    55.0    30.0    15.0
-f701 1
-    -1.0    0.0    0.0
-c0
-4
-    35.0    50.0    12.0
-    35.0    40.0    15.0
-    35.0    50.0    15.0
-    35.0    50.0    12.0
-f702 1
-    -1.0    0.0    0.0
-c0
-4
-    35.0    40.0    12.0
-    35.0    40.0    15.0
-    35.0    50.0    12.0
-    35.0    40.0    12.0
-f703 1
-    -1.0    0.0    0.0
-c0
-4
-    35.0    40.0    12.0
-    35.0    30.0    12.0
-    35.0    30.0    15.0
-    35.0    40.0    12.0
-f704 1
-    -1.0    0.0    0.0
-c0
-4
-    35.0    40.0    12.0
-    35.0    30.0    15.0
-    35.0    40.0    15.0
-    35.0    40.0    12.0
-f705 1
-    1.0    -0.0    -0.0
-c0
-4
-    90.0    130.0    15.0
-    90.0    120.0    12.0
-    90.0    130.0    12.0
-    90.0    130.0    15.0
-f706 1
-    1.0    -0.0    -0.0
-c0
-4
-    90.0    110.0    15.0
-    90.0    110.0    12.0
-    90.0    120.0    12.0
-    90.0    110.0    15.0
-f707 1
-    1.0    -0.0    -0.0
-c0
-4
-    90.0    120.0    15.0
-    90.0    120.0    12.0
-    90.0    130.0    15.0
-    90.0    120.0    15.0
-f708 1
-    1.0    -0.0    -0.0
-c0
-4
-    90.0    120.0    15.0
-    90.0    110.0    15.0
-    90.0    120.0    12.0
-    90.0    120.0    15.0
-f709 1
-    -0.0    1.0    -0.0
-c0
-4
-    90.0    130.0    12.0
-    80.0    130.0    15.0
-    90.0    130.0    15.0
-    90.0    130.0    12.0
-f710 1
-    -0.0    1.0    -0.0
-c0
-4
-    90.0    130.0    12.0
-    80.0    130.0    12.0
-    80.0    130.0    15.0
-    90.0    130.0    12.0
-f711 1
-    -0.0    1.0    -0.0
-c0
-4
-    70.0    130.0    12.0
-    70.0    130.0    15.0
-    80.0    130.0    12.0
-    70.0    130.0    12.0
-f712 1
-    -0.0    1.0    -0.0
-c0
-4
-    80.0    130.0    12.0
-    70.0    130.0    15.0
-    80.0    130.0    15.0
-    80.0    130.0    12.0
-f713 1
-    -1.0    0.0    0.0
-c0
-4
-    70.0    130.0    12.0
-    70.0    120.0    15.0
-    70.0    130.0    15.0
-    70.0    130.0    12.0
-f714 1
-    -1.0    0.0    0.0
-c0
-4
-    70.0    120.0    12.0
-    70.0    120.0    15.0
-    70.0    130.0    12.0
-    70.0    120.0    12.0
-f715 1
-    -1.0    0.0    0.0
-c0
-4
-    70.0    120.0    12.0
-    70.0    110.0    12.0
-    70.0    110.0    15.0
-    70.0    120.0    12.0
-f716 1
-    -1.0    0.0    0.0
-c0
-4
-    70.0    120.0    12.0
-    70.0    110.0    15.0
-    70.0    120.0    15.0
-    70.0    120.0    12.0
-f717 1
-    0.0    -1.0    0.0
-c0
-4
-    90.0    110.0    15.0
-    80.0    110.0    15.0
-    90.0    110.0    12.0
-    90.0    110.0    15.0
-f718 1
-    0.0    -1.0    0.0
-c0
-4
-    80.0    110.0    15.0
-    80.0    110.0    12.0
-    90.0    110.0    12.0
-    80.0    110.0    15.0
-f719 1
-    0.0    -1.0    0.0
-c0
-4
-    70.0    110.0    15.0
-    70.0    110.0    12.0
-    80.0    110.0    12.0
-    70.0    110.0    15.0
-f720 1
-    0.0    -1.0    0.0
-c0
-4
-    70.0    110.0    15.0
-    80.0    110.0    12.0
-    80.0    110.0    15.0
-    70.0    110.0    15.0
-f721 1
-    -0.0    1.0    -0.0
-c0
-4
-    110.0    90.0    15.0
-    110.0    90.0    18.0
-    120.0    90.0    18.0
-    110.0    90.0    15.0
-f722 1
-    -0.0    1.0    -0.0
-c0
-4
-    110.0    90.0    15.0
-    120.0    90.0    18.0
-    120.0    90.0    15.0
-    110.0    90.0    15.0
-f723 1
-    -0.0    1.0    -0.0
-c0
-4
-    120.0    90.0    15.0
-    130.0    90.0    18.0
-    130.0    90.0    15.0
-    120.0    90.0    15.0
-f724 1
-    -0.0    1.0    -0.0
-c0
-4
-    120.0    90.0    15.0
-    120.0    90.0    18.0
-    130.0    90.0    18.0
-    120.0    90.0    15.0
-f725 1
-    1.0    -0.0    -0.0
-c0
-4
-    130.0    90.0    18.0
-    130.0    80.0    18.0
-    130.0    90.0    15.0
-    130.0    90.0    18.0
-f726 1
-    1.0    -0.0    -0.0
-c0
-4
-    130.0    80.0    18.0
-    130.0    80.0    15.0
-    130.0    90.0    15.0
-    130.0    80.0    18.0
-f727 1
-    1.0    -0.0    -0.0
-c0
-4
-    130.0    70.0    18.0
-    130.0    70.0    15.0
-    130.0    80.0    15.0
-    130.0    70.0    18.0
-f728 1
-    1.0    -0.0    -0.0
-c0
-4
-    130.0    70.0    18.0
-    130.0    80.0    15.0
-    130.0    80.0    18.0
-    130.0    70.0    18.0
-f729 1
-    -1.0    0.0    0.0
-c0
-4
-    110.0    90.0    15.0
-    110.0    80.0    18.0
-    110.0    90.0    18.0
-    110.0    90.0    15.0
-f730 1
-    -1.0    0.0    0.0
-c0
-4
-    110.0    90.0    15.0
-    110.0    80.0    15.0
-    110.0    80.0    18.0
-    110.0    90.0    15.0
-f731 1
-    -1.0    0.0    0.0
-c0
-4
-    110.0    70.0    15.0
-    110.0    70.0    18.0
-    110.0    80.0    18.0
-    110.0    70.0    15.0
-f732 1
-    -1.0    0.0    0.0
-c0
-4
-    110.0    80.0    15.0
-    110.0    70.0    15.0
-    110.0    80.0    18.0
-    110.0    80.0    15.0
-f733 1
-    0.0    -1.0    0.0
-c0
-4
-    130.0    70.0    18.0
-    120.0    70.0    18.0
-    130.0    70.0    15.0
-    130.0    70.0    18.0
-f734 1
-    0.0    -1.0    0.0
-c0
-4
-    120.0    70.0    18.0
-    120.0    70.0    15.0
-    130.0    70.0    15.0
-    120.0    70.0    18.0
-f735 1
-    0.0    -1.0    0.0
-c0
-4
-    120.0    70.0    18.0
-    110.0    70.0    18.0
-    110.0    70.0    15.0
-    120.0    70.0    18.0
-f736 1
-    0.0    -1.0    0.0
-c0
-4
-    120.0    70.0    18.0
-    110.0    70.0    15.0
-    120.0    70.0    15.0
-    120.0    70.0    18.0
-f737 1
-    1.0    -0.0    -0.0
-c0
-4
-    100.0    100.0    18.0
-    100.0    90.0    15.0
-    100.0    100.0    15.0
-    100.0    100.0    18.0
-f738 1
-    1.0    -0.0    -0.0
-c0
-4
-    100.0    80.0    18.0
-    100.0    80.0    15.0
-    100.0    90.0    18.0
-    100.0    80.0    18.0
-f739 1
-    1.0    -0.0    -0.0
-c0
-4
-    100.0    90.0    18.0
-    100.0    80.0    15.0
-    100.0    90.0    15.0
-    100.0    90.0    18.0
-f740 1
-    1.0    -0.0    -0.0
-c0
-4
-    100.0    90.0    18.0
-    100.0    90.0    15.0
-    100.0    100.0    18.0
-    100.0    90.0    18.0
-f741 1
-    -0.0    1.0    -0.0
-c0
-4
-    100.0    100.0    15.0
-    90.0    100.0    18.0
-    100.0    100.0    18.0
-    100.0    100.0    15.0
-f742 1
-    -0.0    1.0    -0.0
-c0
-4
-    90.0    100.0    15.0
-    90.0    100.0    18.0
-    100.0    100.0    15.0
-    90.0    100.0    15.0
-f743 1
-    -0.0    1.0    -0.0
-c0
-4
-    90.0    100.0    15.0
-    80.0    100.0    15.0
-    80.0    100.0    18.0
-    90.0    100.0    15.0
-f744 1
-    -0.0    1.0    -0.0
-c0
-4
-    90.0    100.0    15.0
-    80.0    100.0    18.0
-    90.0    100.0    18.0
-    90.0    100.0    15.0
-f745 1
-    0.0    -1.0    0.0
-c0
-4
-    100.0    80.0    18.0
-    90.0    80.0    18.0
-    100.0    80.0    15.0
-    100.0    80.0    18.0
-f746 1
-    0.0    -1.0    0.0
-c0
-4
-    90.0    80.0    18.0
-    90.0    80.0    15.0
-    100.0    80.0    15.0
-    90.0    80.0    18.0
-f747 1
-    0.0    -1.0    0.0
-c0
-4
-    80.0    80.0    18.0
-    80.0    80.0    15.0
-    90.0    80.0    18.0
-    80.0    80.0    18.0
-f748 1
-    0.0    -1.0    0.0
-c0
-4
-    90.0    80.0    18.0
-    80.0    80.0    15.0
-    90.0    80.0    15.0
-    90.0    80.0    18.0
-f749 1
-    -1.0    0.0    0.0
-c0
-4
-    80.0    100.0    15.0
-    80.0    90.0    18.0
-    80.0    100.0    18.0
-    80.0    100.0    15.0
-f750 1
-    -1.0    0.0    0.0
-c0
-4
-    80.0    90.0    15.0
-    80.0    90.0    18.0
-    80.0    100.0    15.0
-    80.0    90.0    15.0
-f751 1
-    -1.0    0.0    0.0
-c0
-4
-    80.0    80.0    15.0
-    80.0    80.0    18.0
-    80.0    90.0    18.0
-    80.0    80.0    15.0
-f752 1
-    -1.0    0.0    0.0
-c0
-4
-    80.0    80.0    15.0
-    80.0    90.0    18.0
-    80.0    90.0    15.0
-    80.0    80.0    15.0
-f753 1
-    -0.0    1.0    -0.0
-c0
-4
-    50.0    95.0    15.0
-    50.0    95.0    18.0
-    60.0    95.0    18.0
-    50.0    95.0    15.0
-f754 1
-    -0.0    1.0    -0.0
-c0
-4
-    50.0    95.0    15.0
-    60.0    95.0    18.0
-    60.0    95.0    15.0
-    50.0    95.0    15.0
-f755 1
-    -0.0    1.0    -0.0
-c0
-4
-    70.0    95.0    15.0
-    60.0    95.0    18.0
-    70.0    95.0    18.0
-    70.0    95.0    15.0
-f756 1
-    -0.0    1.0    -0.0
-c0
-4
-    60.0    95.0    15.0
-    60.0    95.0    18.0
-    70.0    95.0    15.0
-    60.0    95.0    15.0
-f757 1
-    1.0    -0.0    -0.0
-c0
-4
-    70.0    95.0    18.0
-    70.0    85.0    18.0
-    70.0    95.0    15.0
-    70.0    95.0    18.0
-f758 1
-    1.0    -0.0    -0.0
-c0
-4
-    70.0    85.0    18.0
-    70.0    85.0    15.0
-    70.0    95.0    15.0
-    70.0    85.0    18.0
-f759 1
-    1.0    -0.0    -0.0
-c0
-4
-    70.0    75.0    18.0
-    70.0    75.0    15.0
-    70.0    85.0    15.0
-    70.0    75.0    18.0
-f760 1
-    1.0    -0.0    -0.0
-c0
-4
-    70.0    75.0    18.0
-    70.0    85.0    15.0
-    70.0    85.0    18.0
-    70.0    75.0    18.0
-f761 1
-    -1.0    0.0    0.0
-c0
-4
-    50.0    95.0    15.0
-    50.0    85.0    18.0
-    50.0    95.0    18.0
-    50.0    95.0    15.0
-f762 1
-    -1.0    0.0    0.0
-c0
-4
-    50.0    85.0    15.0
-    50.0    85.0    18.0
-    50.0    95.0    15.0
-    50.0    85.0    15.0
-f763 1
-    -1.0    0.0    0.0
-c0
-4
-    50.0    75.0    15.0
-    50.0    75.0    18.0
-    50.0    85.0    18.0
-    50.0    75.0    15.0
-f764 1
-    -1.0    0.0    0.0
-c0
-4
-    50.0    85.0    15.0
-    50.0    75.0    15.0
-    50.0    85.0    18.0
-    50.0    85.0    15.0
-f765 1
-    0.0    -1.0    0.0
-c0
-4
-    70.0    75.0    18.0
-    60.0    75.0    15.0
-    70.0    75.0    15.0
-    70.0    75.0    18.0
-f766 1
-    0.0    -1.0    0.0
-c0
-4
-    50.0    75.0    18.0
-    50.0    75.0    15.0
-    60.0    75.0    15.0
-    50.0    75.0    18.0
-f767 1
-    0.0    -1.0    0.0
-c0
-4
-    70.0    75.0    18.0
-    60.0    75.0    18.0
-    60.0    75.0    15.0
-    70.0    75.0    18.0
-f768 1
-    0.0    -1.0    0.0
-c0
-4
-    60.0    75.0    18.0
-    50.0    75.0    18.0
-    60.0    75.0    15.0
-    60.0    75.0    18.0
-f769 1
-    1.0    -0.0    -0.0
-c0
-4
-    50.0    115.0    18.0
-    50.0    125.0    15.0
-    50.0    125.0    18.0
-    50.0    115.0    18.0
-f770 1
-    1.0    -0.0    -0.0
-c0
-4
-    50.0    115.0    18.0
-    50.0    115.0    15.0
-    50.0    125.0    15.0
-    50.0    115.0    18.0
-f771 1
-    1.0    -0.0    -0.0
-c0
-4
-    50.0    115.0    18.0
-    50.0    105.0    18.0
-    50.0    105.0    15.0
-    50.0    115.0    18.0
-f772 1
-    1.0    -0.0    -0.0
-c0
-4
-    50.0    115.0    18.0
-    50.0    105.0    15.0
-    50.0    115.0    15.0
-    50.0    115.0    18.0
-f773 1
-    -0.0    1.0    -0.0
-c0
-4
-    50.0    125.0    15.0
-    40.0    125.0    18.0
-    50.0    125.0    18.0
-    50.0    125.0    15.0
-f774 1
-    -0.0    1.0    -0.0
-c0
-4
-    50.0    125.0    15.0
-    40.0    125.0    15.0
-    40.0    125.0    18.0
-    50.0    125.0    15.0
-f775 1
-    -0.0    1.0    -0.0
-c0
-4
-    30.0    125.0    15.0
-    30.0    125.0    18.0
-    40.0    125.0    18.0
-    30.0    125.0    15.0
-f776 1
-    -0.0    1.0    -0.0
-c0
-4
-    30.0    125.0    15.0
-    40.0    125.0    18.0
-    40.0    125.0    15.0
-    30.0    125.0    15.0
-f777 1
-    0.0    -1.0    0.0
-c0
-4
-    40.0    105.0    18.0
-    50.0    105.0    15.0
-    50.0    105.0    18.0
-    40.0    105.0    18.0
-f778 1
-    0.0    -1.0    0.0
-c0
-4
-    40.0    105.0    18.0
-    40.0    105.0    15.0
-    50.0    105.0    15.0
-    40.0    105.0    18.0
-f779 1
-    0.0    -1.0    0.0
-c0
-4
-    30.0    105.0    18.0
-    30.0    105.0    15.0
-    40.0    105.0    15.0
-    30.0    105.0    18.0
-f780 1
-    0.0    -1.0    0.0
-c0
-4
-    40.0    105.0    18.0
-    30.0    105.0    18.0
-    40.0    105.0    15.0
-    40.0    105.0    18.0
-f781 1
-    -1.0    0.0    0.0
-c0
-4
-    30.0    125.0    18.0
-    30.0    125.0    15.0
-    30.0    115.0    15.0
-    30.0    125.0    18.0
-f782 1
-    -1.0    0.0    0.0
-c0
-4
-    30.0    105.0    18.0
-    30.0    115.0    15.0
-    30.0    105.0    15.0
-    30.0    105.0    18.0
-f783 1
-    -1.0    0.0    0.0
-c0
-4
-    30.0    125.0    18.0
-    30.0    115.0    15.0
-    30.0    115.0    18.0
-    30.0    125.0    18.0
-f784 1
-    -1.0    0.0    0.0
-c0
-4
-    30.0    105.0    18.0
-    30.0    115.0    18.0
-    30.0    115.0    15.0
-    30.0    105.0    18.0
-f785 1
-    1.0    -0.0    -0.0
-c0
-4
-    125.0    110.0    18.0
-    125.0    120.0    15.0
-    125.0    120.0    18.0
-    125.0    110.0    18.0
-f786 1
-    1.0    -0.0    -0.0
-c0
-4
-    125.0    110.0    18.0
-    125.0    110.0    15.0
-    125.0    120.0    15.0
-    125.0    110.0    18.0
-f787 1
-    1.0    -0.0    -0.0
-c0
-4
-    125.0    100.0    18.0
-    125.0    100.0    15.0
-    125.0    110.0    18.0
-    125.0    100.0    18.0
-f788 1
-    1.0    -0.0    -0.0
-c0
-4
-    125.0    110.0    18.0
-    125.0    100.0    15.0
-    125.0    110.0    15.0
-    125.0    110.0    18.0
-f789 1
-    -0.0    1.0    -0.0
-c0
-4
-    125.0    120.0    15.0
-    115.0    120.0    15.0
-    125.0    120.0    18.0
-    125.0    120.0    15.0
-f790 1
-    -0.0    1.0    -0.0
-c0
-4
-    105.0    120.0    15.0
-    105.0    120.0    18.0
-    115.0    120.0    15.0
-    105.0    120.0    15.0
-f791 1
-    -0.0    1.0    -0.0
-c0
-4
-    115.0    120.0    15.0
-    115.0    120.0    18.0
-    125.0    120.0    18.0
-    115.0    120.0    15.0
-f792 1
-    -0.0    1.0    -0.0
-c0
-4
-    115.0    120.0    15.0
-    105.0    120.0    18.0
-    115.0    120.0    18.0
-    115.0    120.0    15.0
-f793 1
-    0.0    -1.0    0.0
-c0
-4
-    125.0    100.0    18.0
-    115.0    100.0    15.0
-    125.0    100.0    15.0
-    125.0    100.0    18.0
-f794 1
-    0.0    -1.0    0.0
-c0
-4
-    105.0    100.0    18.0
-    105.0    100.0    15.0
-    115.0    100.0    15.0
-    105.0    100.0    18.0
-f795 1
-    0.0    -1.0    0.0
-c0
-4
-    125.0    100.0    18.0
-    115.0    100.0    18.0
-    115.0    100.0    15.0
-    125.0    100.0    18.0
-f796 1
-    0.0    -1.0    0.0
-c0
-4
-    115.0    100.0    18.0
-    105.0    100.0    18.0
-    115.0    100.0    15.0
-    115.0    100.0    18.0
-f797 1
-    -1.0    0.0    0.0
-c0
-4
-    105.0    120.0    15.0
-    105.0    110.0    15.0
-    105.0    120.0    18.0
-    105.0    120.0    15.0
-f798 1
-    -1.0    0.0    0.0
-c0
-4
-    105.0    100.0    15.0
-    105.0    100.0    18.0
-    105.0    110.0    18.0
-    105.0    100.0    15.0
-f799 1
-    -1.0    0.0    0.0
-c0
-4
-    105.0    110.0    15.0
-    105.0    100.0    15.0
-    105.0    110.0    18.0
-    105.0    110.0    15.0
-f800 1
-    -1.0    0.0    0.0
-c0
-4
-    105.0    110.0    15.0
-    105.0    110.0    18.0
-    105.0    120.0    18.0
-    105.0    110.0    15.0
-f801 1
-    1.0    -0.0    -0.0
-c0
-4
-    85.0    60.0    18.0
-    85.0    70.0    15.0
-    85.0    70.0    18.0
-    85.0    60.0    18.0
-f802 1
-    1.0    -0.0    -0.0
-c0
-4
-    85.0    60.0    18.0
-    85.0    60.0    15.0
-    85.0    70.0    15.0
-    85.0    60.0    18.0
-f803 1
-    1.0    -0.0    -0.0
-c0
-4
-    85.0    50.0    18.0
-    85.0    50.0    15.0
-    85.0    60.0    15.0
-    85.0    50.0    18.0
-f804 1
-    1.0    -0.0    -0.0
-c0
-4
-    85.0    60.0    18.0
-    85.0    50.0    18.0
-    85.0    60.0    15.0
-    85.0    60.0    18.0
-f805 1
-    -0.0    1.0    -0.0
-c0
-4
-    75.0    70.0    15.0
-    85.0    70.0    18.0
-    85.0    70.0    15.0
-    75.0    70.0    15.0
-f806 1
-    -0.0    1.0    -0.0
-c0
-4
-    65.0    70.0    15.0
-    65.0    70.0    18.0
-    75.0    70.0    18.0
-    65.0    70.0    15.0
-f807 1
-    -0.0    1.0    -0.0
-c0
-4
-    75.0    70.0    15.0
-    65.0    70.0    15.0
-    75.0    70.0    18.0
-    75.0    70.0    15.0
-f808 1
-    -0.0    1.0    -0.0
-c0
-4
-    75.0    70.0    15.0
-    75.0    70.0    18.0
-    85.0    70.0    18.0
-    75.0    70.0    15.0
-f809 1
-    0.0    -1.0    0.0
-c0
-4
-    85.0    50.0    18.0
-    75.0    50.0    15.0
-    85.0    50.0    15.0
-    85.0    50.0    18.0
-f810 1
-    0.0    -1.0    0.0
-c0
-4
-    65.0    50.0    18.0
-    65.0    50.0    15.0
-    75.0    50.0    18.0
-    65.0    50.0    18.0
-f811 1
-    0.0    -1.0    0.0
-c0
-4
-    75.0    50.0    18.0
-    65.0    50.0    15.0
-    75.0    50.0    15.0
-    75.0    50.0    18.0
-f812 1
-    0.0    -1.0    0.0
-c0
-4
-    85.0    50.0    18.0
-    75.0    50.0    18.0
-    75.0    50.0    15.0
-    85.0    50.0    18.0
-f813 1
-    -1.0    0.0    0.0
-c0
-4
-    65.0    70.0    15.0
-    65.0    60.0    18.0
-    65.0    70.0    18.0
-    65.0    70.0    15.0
-f814 1
-    -1.0    0.0    0.0
-c0
-4
-    65.0    70.0    15.0
-    65.0    60.0    15.0
-    65.0    60.0    18.0
-    65.0    70.0    15.0
-f815 1
-    -1.0    0.0    0.0
-c0
-4
-    65.0    50.0    15.0
-    65.0    50.0    18.0
-    65.0    60.0    15.0
-    65.0    50.0    15.0
-f816 1
-    -1.0    0.0    0.0
-c0
-4
-    65.0    60.0    15.0
-    65.0    50.0    18.0
-    65.0    60.0    18.0
-    65.0    60.0    15.0
-f817 1
-    -1.0    0.0    0.0
-c0
-4
-    95.0    35.0    15.0
-    95.0    35.0    18.0
-    95.0    45.0    18.0
-    95.0    35.0    15.0
-f818 1
-    -1.0    0.0    0.0
-c0
-4
-    95.0    45.0    15.0
-    95.0    35.0    15.0
-    95.0    45.0    18.0
-    95.0    45.0    15.0
-f819 1
-    -1.0    0.0    0.0
-c0
-4
-    95.0    45.0    15.0
-    95.0    55.0    18.0
-    95.0    55.0    15.0
-    95.0    45.0    15.0
-f820 1
-    -1.0    0.0    0.0
-c0
-4
-    95.0    45.0    15.0
-    95.0    45.0    18.0
-    95.0    55.0    18.0
-    95.0    45.0    15.0
-f821 1
-    -0.0    1.0    -0.0
-c0
-4
-    105.0    55.0    15.0
-    95.0    55.0    15.0
-    95.0    55.0    18.0
-    105.0    55.0    15.0
-f822 1
-    -0.0    1.0    -0.0
-c0
-4
-    115.0    55.0    15.0
-    105.0    55.0    18.0
-    115.0    55.0    18.0
-    115.0    55.0    15.0
-f823 1
-    -0.0    1.0    -0.0
-c0
-4
-    115.0    55.0    15.0
-    105.0    55.0    15.0
-    105.0    55.0    18.0
-    115.0    55.0    15.0
-f824 1
-    -0.0    1.0    -0.0
-c0
-4
-    105.0    55.0    15.0
-    95.0    55.0    18.0
-    105.0    55.0    18.0
-    105.0    55.0    15.0
-f825 1
-    0.0    -1.0    0.0
-c0
-4
-    95.0    35.0    18.0
-    95.0    35.0    15.0
-    105.0    35.0    15.0
-    95.0    35.0    18.0
-f826 1
-    0.0    -1.0    0.0
-c0
-4
-    115.0    35.0    18.0
-    105.0    35.0    15.0
-    115.0    35.0    15.0
-    115.0    35.0    18.0
-f827 1
-    0.0    -1.0    0.0
-c0
-4
-    105.0    35.0    18.0
-    95.0    35.0    18.0
-    105.0    35.0    15.0
-    105.0    35.0    18.0
-f828 1
-    0.0    -1.0    0.0
-c0
-4
-    105.0    35.0    18.0
-    105.0    35.0    15.0
-    115.0    35.0    18.0
-    105.0    35.0    18.0
-f829 1
-    1.0    -0.0    -0.0
-c0
-4
-    115.0    55.0    18.0
-    115.0    45.0    18.0
-    115.0    55.0    15.0
-    115.0    55.0    18.0
-f830 1
-    1.0    -0.0    -0.0
-c0
-4
-    115.0    45.0    18.0
-    115.0    45.0    15.0
-    115.0    55.0    15.0
-    115.0    45.0    18.0
-f831 1
-    1.0    -0.0    -0.0
-c0
-4
-    115.0    35.0    18.0
-    115.0    35.0    15.0
-    115.0    45.0    15.0
-    115.0    35.0    18.0
-f832 1
-    1.0    -0.0    -0.0
-c0
-4
-    115.0    45.0    18.0
-    115.0    35.0    18.0
-    115.0    45.0    15.0
-    115.0    45.0    18.0
-f833 1
-    1.0    -0.0    -0.0
-c0
-4
-    55.0    50.0    18.0
-    55.0    40.0    15.0
-    55.0    50.0    15.0
-    55.0    50.0    18.0
-f834 1
-    1.0    -0.0    -0.0
-c0
-4
-    55.0    40.0    18.0
-    55.0    30.0    18.0
-    55.0    30.0    15.0
-    55.0    40.0    18.0
-f835 1
-    1.0    -0.0    -0.0
-c0
-4
-    55.0    40.0    18.0
-    55.0    30.0    15.0
-    55.0    40.0    15.0
-    55.0    40.0    18.0
-f836 1
-    1.0    -0.0    -0.0
-c0
-4
-    55.0    50.0    18.0
-    55.0    40.0    18.0
-    55.0    40.0    15.0
-    55.0    50.0    18.0
-f837 1
-    -0.0    1.0    -0.0
-c0
-4
-    55.0    50.0    15.0
-    45.0    50.0    18.0
-    55.0    50.0    18.0
-    55.0    50.0    15.0
-f838 1
-    -0.0    1.0    -0.0
-c0
-4
-    55.0    50.0    15.0
-    45.0    50.0    15.0
-    45.0    50.0    18.0
-    55.0    50.0    15.0
-f839 1
-    -0.0    1.0    -0.0
-c0
-4
-    45.0    50.0    15.0
-    35.0    50.0    15.0
-    35.0    50.0    18.0
-    45.0    50.0    15.0
-f840 1
-    -0.0    1.0    -0.0
-c0
-4
-    45.0    50.0    15.0
-    35.0    50.0    18.0
-    45.0    50.0    18.0
-    45.0    50.0    15.0
-f841 1
-    0.0    -1.0    0.0
-c0
-4
-    45.0    30.0    18.0
-    55.0    30.0    15.0
-    55.0    30.0    18.0
-    45.0    30.0    18.0
-f842 1
-    0.0    -1.0    0.0
-c0
-4
-    45.0    30.0    18.0
-    45.0    30.0    15.0
-    55.0    30.0    15.0
-    45.0    30.0    18.0
-f843 1
-    0.0    -1.0    0.0
-c0
-4
-    35.0    30.0    18.0
-    35.0    30.0    15.0
-    45.0    30.0    15.0
-    35.0    30.0    18.0
-f844 1
-    0.0    -1.0    0.0
-c0
-4
-    35.0    30.0    18.0
-    45.0    30.0    15.0
-    45.0    30.0    18.0
-    35.0    30.0    18.0
-f845 1
-    -1.0    0.0    0.0
-c0
-4
-    35.0    40.0    15.0
-    35.0    50.0    18.0
-    35.0    50.0    15.0
-    35.0    40.0    15.0
-f846 1
-    -1.0    0.0    0.0
-c0
-4
-    35.0    40.0    15.0
-    35.0    30.0    15.0
-    35.0    30.0    18.0
-    35.0    40.0    15.0
-f847 1
-    -1.0    0.0    0.0
-c0
-4
-    35.0    40.0    15.0
-    35.0    40.0    18.0
-    35.0    50.0    18.0
-    35.0    40.0    15.0
-f848 1
-    -1.0    0.0    0.0
-c0
-4
-    35.0    40.0    15.0
-    35.0    30.0    18.0
-    35.0    40.0    18.0
-    35.0    40.0    15.0
-f849 1
-    1.0    -0.0    -0.0
-c0
-4
-    90.0    120.0    18.0
-    90.0    130.0    15.0
-    90.0    130.0    18.0
-    90.0    120.0    18.0
-f850 1
-    1.0    -0.0    -0.0
-c0
-4
-    90.0    120.0    18.0
-    90.0    120.0    15.0
-    90.0    130.0    15.0
-    90.0    120.0    18.0
-f851 1
-    1.0    -0.0    -0.0
-c0
-4
-    90.0    110.0    18.0
-    90.0    110.0    15.0
-    90.0    120.0    15.0
-    90.0    110.0    18.0
-f852 1
-    1.0    -0.0    -0.0
-c0
-4
-    90.0    120.0    18.0
-    90.0    110.0    18.0
-    90.0    120.0    15.0
-    90.0    120.0    18.0
-f853 1
-    -0.0    1.0    -0.0
-c0
-4
-    80.0    130.0    15.0
-    90.0    130.0    18.0
-    90.0    130.0    15.0
-    80.0    130.0    15.0
-f854 1
-    -0.0    1.0    -0.0
-c0
-4
-    70.0    130.0    15.0
-    70.0    130.0    18.0
-    80.0    130.0    18.0
-    70.0    130.0    15.0
-f855 1
-    -0.0    1.0    -0.0
-c0
-4
-    80.0    130.0    15.0
-    70.0    130.0    15.0
-    80.0    130.0    18.0
-    80.0    130.0    15.0
-f856 1
-    -0.0    1.0    -0.0
-c0
-4
-    80.0    130.0    15.0
-    80.0    130.0    18.0
-    90.0    130.0    18.0
-    80.0    130.0    15.0
-f857 1
-    -1.0    0.0    0.0
-c0
-4
-    70.0    120.0    15.0
-    70.0    130.0    18.0
-    70.0    130.0    15.0
-    70.0    120.0    15.0
-f858 1
-    -1.0    0.0    0.0
-c0
-4
-    70.0    110.0    15.0
-    70.0    110.0    18.0
-    70.0    120.0    18.0
-    70.0    110.0    15.0
-f859 1
-    -1.0    0.0    0.0
-c0
-4
-    70.0    120.0    15.0
-    70.0    110.0    15.0
-    70.0    120.0    18.0
-    70.0    120.0    15.0
-f860 1
-    -1.0    0.0    0.0
-c0
-4
-    70.0    120.0    15.0
-    70.0    120.0    18.0
-    70.0    130.0    18.0
-    70.0    120.0    15.0
-f861 1
-    0.0    -1.0    0.0
-c0
-4
-    90.0    110.0    18.0
-    80.0    110.0    15.0
-    90.0    110.0    15.0
-    90.0    110.0    18.0
-f862 1
-    0.0    -1.0    0.0
-c0
-4
-    70.0    110.0    18.0
-    70.0    110.0    15.0
-    80.0    110.0    18.0
-    70.0    110.0    18.0
-f863 1
-    0.0    -1.0    0.0
-c0
-4
-    80.0    110.0    18.0
-    70.0    110.0    15.0
-    80.0    110.0    15.0
-    80.0    110.0    18.0
-f864 1
-    0.0    -1.0    0.0
-c0
-4
-    90.0    110.0    18.0
-    80.0    110.0    18.0
-    80.0    110.0    15.0
-    90.0    110.0    18.0
-f865 1
-    -0.0    1.0    -0.0
-c0
-4
-    110.0    90.0    18.0
-    110.0    90.0    21.0
-    120.0    90.0    21.0
-    110.0    90.0    18.0
-f866 1
-    -0.0    1.0    -0.0
-c0
-4
-    110.0    90.0    18.0
-    120.0    90.0    21.0
-    120.0    90.0    18.0
-    110.0    90.0    18.0
-f867 1
-    -0.0    1.0    -0.0
-c0
-4
-    130.0    90.0    18.0
-    120.0    90.0    21.0
-    130.0    90.0    21.0
-    130.0    90.0    18.0
-f868 1
-    -0.0    1.0    -0.0
-c0
-4
-    120.0    90.0    18.0
-    120.0    90.0    21.0
-    130.0    90.0    18.0
-    120.0    90.0    18.0
-f869 1
-    1.0    -0.0    -0.0
-c0
-4
-    130.0    90.0    21.0
-    130.0    80.0    21.0
-    130.0    90.0    18.0
-    130.0    90.0    21.0
-f870 1
-    1.0    -0.0    -0.0
-c0
-4
-    130.0    80.0    21.0
-    130.0    80.0    18.0
-    130.0    90.0    18.0
-    130.0    80.0    21.0
-f871 1
-    1.0    -0.0    -0.0
-c0
-4
-    130.0    70.0    21.0
-    130.0    70.0    18.0
-    130.0    80.0    18.0
-    130.0    70.0    21.0
-f872 1
-    1.0    -0.0    -0.0
-c0
-4
-    130.0    80.0    21.0
-    130.0    70.0    21.0
-    130.0    80.0    18.0
-    130.0    80.0    21.0
-f873 1
-    -1.0    0.0    0.0
-c0
-4
-    110.0    90.0    18.0
-    110.0    80.0    18.0
-    110.0    90.0    21.0
-    110.0    90.0    18.0
-f874 1
-    -1.0    0.0    0.0
-c0
-4
-    110.0    70.0    18.0
-    110.0    70.0    21.0
-    110.0    80.0    21.0
-    110.0    70.0    18.0
-f875 1
-    -1.0    0.0    0.0
-c0
-4
-    110.0    70.0    18.0
-    110.0    80.0    21.0
-    110.0    80.0    18.0
-    110.0    70.0    18.0
-f876 1
-    -1.0    0.0    0.0
-c0
-4
-    110.0    80.0    18.0
-    110.0    80.0    21.0
-    110.0    90.0    21.0
-    110.0    80.0    18.0
-f877 1
-    0.0    -1.0    0.0
-c0
-4
-    130.0    70.0    21.0
-    120.0    70.0    18.0
-    130.0    70.0    18.0
-    130.0    70.0    21.0
-f878 1
-    0.0    -1.0    0.0
-c0
-4
-    120.0    70.0    21.0
-    110.0    70.0    21.0
-    110.0    70.0    18.0
-    120.0    70.0    21.0
-f879 1
-    0.0    -1.0    0.0
-c0
-4
-    120.0    70.0    21.0
-    110.0    70.0    18.0
-    120.0    70.0    18.0
-    120.0    70.0    21.0
-f880 1
-    0.0    -1.0    0.0
-c0
-4
-    120.0    70.0    21.0
-    120.0    70.0    18.0
-    130.0    70.0    21.0
-    120.0    70.0    21.0
-f881 1
-    -0.0    -0.0    1.0
-c0
-4
-    95.0    95.0    18.0
-    100.0    90.0    18.0
-    100.0    100.0    18.0
-    95.0    95.0    18.0
-f882 1
-    -0.0    -0.0    1.0
-c0
-4
-    95.0    95.0    18.0
-    100.0    100.0    18.0
-    90.0    100.0    18.0
-    95.0    95.0    18.0
-f883 1
-    -0.0    -0.0    1.0
-c0
-4
-    95.0    85.0    18.0
-    100.0    80.0    18.0
-    100.0    90.0    18.0
-    95.0    85.0    18.0
-f884 1
-    -0.0    -0.0    1.0
-c0
-4
-    95.0    85.0    18.0
-    90.0    80.0    18.0
-    100.0    80.0    18.0
-    95.0    85.0    18.0
-f885 1
-    -0.0    -0.0    1.0
-c0
-4
-    85.0    95.0    18.0
-    90.0    100.0    18.0
-    80.0    100.0    18.0
-    85.0    95.0    18.0
-f886 1
-    -0.0    -0.0    1.0
-c0
-4
-    85.0    95.0    18.0
-    80.0    100.0    18.0
-    80.0    90.0    18.0
-    85.0    95.0    18.0
-f887 1
-    -0.0    -0.0    1.0
-c0
-4
-    85.0    85.0    18.0
-    80.0    80.0    18.0
-    90.0    80.0    18.0
-    85.0    85.0    18.0
-f888 1
-    -0.0    -0.0    1.0
-c0
-4
-    85.0    85.0    18.0
-    80.0    90.0    18.0
-    80.0    80.0    18.0
-    85.0    85.0    18.0
-f889 1
-    -0.0    -0.0    1.0
-c0
-4
-    95.0    95.0    18.0
-    90.0    90.0    18.0
-    100.0    90.0    18.0
-    95.0    95.0    18.0
-f890 1
-    -0.0    -0.0    1.0
-c0
-4
-    95.0    85.0    18.0
-    100.0    90.0    18.0
-    90.0    90.0    18.0
-    95.0    85.0    18.0
-f891 1
-    -0.0    -0.0    1.0
-c0
-4
-    95.0    95.0    18.0
-    90.0    100.0    18.0
-    90.0    90.0    18.0
-    95.0    95.0    18.0
-f892 1
-    -0.0    -0.0    1.0
-c0
-4
-    85.0    95.0    18.0
-    90.0    90.0    18.0
-    90.0    100.0    18.0
-    85.0    95.0    18.0
-f893 1
-    -0.0    -0.0    1.0
-c0
-4
-    95.0    85.0    18.0
-    90.0    90.0    18.0
-    90.0    80.0    18.0
-    95.0    85.0    18.0
-f894 1
-    -0.0    -0.0    1.0
-c0
-4
-    85.0    85.0    18.0
-    90.0    80.0    18.0
-    90.0    90.0    18.0
-    85.0    85.0    18.0
-f895 1
-    -0.0    -0.0    1.0
-c0
-4
-    85.0    95.0    18.0
-    80.0    90.0    18.0
-    90.0    90.0    18.0
-    85.0    95.0    18.0
-f896 1
-    -0.0    -0.0    1.0
-c0
-4
-    85.0    85.0    18.0
-    90.0    90.0    18.0
-    80.0    90.0    18.0
-    85.0    85.0    18.0
-f897 1
-    -0.0    1.0    -0.0
-c0
-4
-    50.0    95.0    18.0
-    50.0    95.0    21.0
-    60.0    95.0    21.0
-    50.0    95.0    18.0
-f898 1
-    -0.0    1.0    -0.0
-c0
-4
-    60.0    95.0    18.0
-    50.0    95.0    18.0
-    60.0    95.0    21.0
-    60.0    95.0    18.0
-f899 1
-    -0.0    1.0    -0.0
-c0
-4
-    60.0    95.0    18.0
-    70.0    95.0    21.0
-    70.0    95.0    18.0
-    60.0    95.0    18.0
-f900 1
-    -0.0    1.0    -0.0
-c0
-4
-    60.0    95.0    18.0
-    60.0    95.0    21.0
-    70.0    95.0    21.0
-    60.0    95.0    18.0
-f901 1
-    1.0    -0.0    -0.0
-c0
-4
-    70.0    95.0    21.0
-    70.0    85.0    21.0
-    70.0    95.0    18.0
-    70.0    95.0    21.0
-f902 1
-    1.0    -0.0    -0.0
-c0
-4
-    70.0    85.0    21.0
-    70.0    85.0    18.0
-    70.0    95.0    18.0
-    70.0    85.0    21.0
-f903 1
-    1.0    -0.0    -0.0
-c0
-4
-    70.0    75.0    21.0
-    70.0    75.0    18.0
-    70.0    85.0    21.0
-    70.0    75.0    21.0
-f904 1
-    1.0    -0.0    -0.0
-c0
-4
-    70.0    85.0    21.0
-    70.0    75.0    18.0
-    70.0    85.0    18.0
-    70.0    85.0    21.0
-f905 1
-    -1.0    0.0    0.0
-c0
-4
-    50.0    95.0    18.0
-    50.0    85.0    21.0
-    50.0    95.0    21.0
-    50.0    95.0    18.0
-f906 1
-    -1.0    0.0    0.0
-c0
-4
-    50.0    95.0    18.0
-    50.0    85.0    18.0
-    50.0    85.0    21.0
-    50.0    95.0    18.0
-f907 1
-    -1.0    0.0    0.0
-c0
-4
-    50.0    85.0    18.0
-    50.0    75.0    18.0
-    50.0    75.0    21.0
-    50.0    85.0    18.0
-f908 1
-    -1.0    0.0    0.0
-c0
-4
-    50.0    85.0    18.0
-    50.0    75.0    21.0
-    50.0    85.0    21.0
-    50.0    85.0    18.0
-f909 1
-    0.0    -1.0    0.0
-c0
-4
-    70.0    75.0    21.0
-    60.0    75.0    18.0
-    70.0    75.0    18.0
-    70.0    75.0    21.0
-f910 1
-    0.0    -1.0    0.0
-c0
-4
-    60.0    75.0    21.0
-    50.0    75.0    21.0
-    50.0    75.0    18.0
-    60.0    75.0    21.0
-f911 1
-    0.0    -1.0    0.0
-c0
-4
-    60.0    75.0    21.0
-    50.0    75.0    18.0
-    60.0    75.0    18.0
-    60.0    75.0    21.0
-f912 1
-    0.0    -1.0    0.0
-c0
-4
-    60.0    75.0    21.0
-    60.0    75.0    18.0
-    70.0    75.0    21.0
-    60.0    75.0    21.0
-f913 1
-    1.0    -0.0    -0.0
-c0
-4
-    50.0    125.0    18.0
-    50.0    125.0    21.0
-    50.0    115.0    18.0
-    50.0    125.0    18.0
-f914 1
-    1.0    -0.0    -0.0
-c0
-4
-    50.0    105.0    18.0
-    50.0    115.0    18.0
-    50.0    105.0    21.0
-    50.0    105.0    18.0
-f915 1
-    1.0    -0.0    -0.0
-c0
-4
-    50.0    115.0    18.0
-    50.0    125.0    21.0
-    50.0    115.0    21.0
-    50.0    115.0    18.0
-f916 1
-    1.0    -0.0    -0.0
-c0
-4
-    50.0    115.0    18.0
-    50.0    115.0    21.0
-    50.0    105.0    21.0
-    50.0    115.0    18.0
-f917 1
-    -0.0    1.0    -0.0
-c0
-4
-    40.0    125.0    18.0
-    50.0    125.0    21.0
-    50.0    125.0    18.0
-    40.0    125.0    18.0
-f918 1
-    -0.0    1.0    -0.0
-c0
-4
-    30.0    125.0    18.0
-    30.0    125.0    21.0
-    40.0    125.0    21.0
-    30.0    125.0    18.0
-f919 1
-    -0.0    1.0    -0.0
-c0
-4
-    40.0    125.0    18.0
-    30.0    125.0    18.0
-    40.0    125.0    21.0
-    40.0    125.0    18.0
-f920 1
-    -0.0    1.0    -0.0
-c0
-4
-    40.0    125.0    18.0
-    40.0    125.0    21.0
-    50.0    125.0    21.0
-    40.0    125.0    18.0
-f921 1
-    0.0    -1.0    0.0
-c0
-4
-    50.0    105.0    18.0
-    50.0    105.0    21.0
-    40.0    105.0    21.0
-    50.0    105.0    18.0
-f922 1
-    0.0    -1.0    0.0
-c0
-4
-    40.0    105.0    18.0
-    50.0    105.0    18.0
-    40.0    105.0    21.0
-    40.0    105.0    18.0
-f923 1
-    0.0    -1.0    0.0
-c0
-4
-    30.0    105.0    18.0
-    40.0    105.0    21.0
-    30.0    105.0    21.0
-    30.0    105.0    18.0
-f924 1
-    0.0    -1.0    0.0
-c0
-4
-    30.0    105.0    18.0
-    40.0    105.0    18.0
-    40.0    105.0    21.0
-    30.0    105.0    18.0
-f925 1
-    -1.0    0.0    0.0
-c0
-4
-    30.0    125.0    21.0
-    30.0    125.0    18.0
-    30.0    115.0    18.0
-    30.0    125.0    21.0
-f926 1
-    -1.0    0.0    0.0
-c0
-4
-    30.0    105.0    21.0
-    30.0    115.0    18.0
-    30.0    105.0    18.0
-    30.0    105.0    21.0
-f927 1
-    -1.0    0.0    0.0
-c0
-4
-    30.0    115.0    21.0
-    30.0    125.0    21.0
-    30.0    115.0    18.0
-    30.0    115.0    21.0
-f928 1
-    -1.0    0.0    0.0
-c0
-4
-    30.0    115.0    21.0
-    30.0    115.0    18.0
-    30.0    105.0    21.0
-    30.0    115.0    21.0
-f929 1
-    1.0    -0.0    -0.0
-c0
-4
-    125.0    120.0    21.0
-    125.0    110.0    18.0
-    125.0    120.0    18.0
-    125.0    120.0    21.0
-f930 1
-    1.0    -0.0    -0.0
-c0
-4
-    125.0    100.0    21.0
-    125.0    100.0    18.0
-    125.0    110.0    18.0
-    125.0    100.0    21.0
-f931 1
-    1.0    -0.0    -0.0
-c0
-4
-    125.0    110.0    21.0
-    125.0    110.0    18.0
-    125.0    120.0    21.0
-    125.0    110.0    21.0
-f932 1
-    1.0    -0.0    -0.0
-c0
-4
-    125.0    110.0    21.0
-    125.0    100.0    21.0
-    125.0    110.0    18.0
-    125.0    110.0    21.0
-f933 1
-    -0.0    1.0    -0.0
-c0
-4
-    125.0    120.0    18.0
-    115.0    120.0    21.0
-    125.0    120.0    21.0
-    125.0    120.0    18.0
-f934 1
-    -0.0    1.0    -0.0
-c0
-4
-    115.0    120.0    18.0
-    115.0    120.0    21.0
-    125.0    120.0    18.0
-    115.0    120.0    18.0
-f935 1
-    -0.0    1.0    -0.0
-c0
-4
-    105.0    120.0    18.0
-    105.0    120.0    21.0
-    115.0    120.0    18.0
-    105.0    120.0    18.0
-f936 1
-    -0.0    1.0    -0.0
-c0
-4
-    115.0    120.0    18.0
-    105.0    120.0    21.0
-    115.0    120.0    21.0
-    115.0    120.0    18.0
-f937 1
-    0.0    -1.0    0.0
-c0
-4
-    115.0    100.0    21.0
-    125.0    100.0    18.0
-    125.0    100.0    21.0
-    115.0    100.0    21.0
-f938 1
-    0.0    -1.0    0.0
-c0
-4
-    115.0    100.0    21.0
-    115.0    100.0    18.0
-    125.0    100.0    18.0
-    115.0    100.0    21.0
-f939 1
-    0.0    -1.0    0.0
-c0
-4
-    105.0    100.0    21.0
-    105.0    100.0    18.0
-    115.0    100.0    18.0
-    105.0    100.0    21.0
-f940 1
-    0.0    -1.0    0.0
-c0
-4
-    115.0    100.0    21.0
-    105.0    100.0    21.0
-    115.0    100.0    18.0
-    115.0    100.0    21.0
-f941 1
-    -1.0    0.0    0.0
-c0
-4
-    105.0    110.0    18.0
-    105.0    120.0    21.0
-    105.0    120.0    18.0
-    105.0    110.0    18.0
-f942 1
-    -1.0    0.0    0.0
-c0
-4
-    105.0    100.0    18.0
-    105.0    100.0    21.0
-    105.0    110.0    21.0
-    105.0    100.0    18.0
-f943 1
-    -1.0    0.0    0.0
-c0
-4
-    105.0    110.0    18.0
-    105.0    100.0    18.0
-    105.0    110.0    21.0
-    105.0    110.0    18.0
-f944 1
-    -1.0    0.0    0.0
-c0
-4
-    105.0    110.0    18.0
-    105.0    110.0    21.0
-    105.0    120.0    21.0
-    105.0    110.0    18.0
-f945 1
-    1.0    -0.0    -0.0
-c0
-4
-    85.0    60.0    18.0
-    85.0    70.0    18.0
-    85.0    70.0    21.0
-    85.0    60.0    18.0
-f946 1
-    1.0    -0.0    -0.0
-c0
-4
-    85.0    50.0    18.0
-    85.0    60.0    21.0
-    85.0    50.0    21.0
-    85.0    50.0    18.0
-f947 1
-    1.0    -0.0    -0.0
-c0
-4
-    85.0    50.0    18.0
-    85.0    60.0    18.0
-    85.0    60.0    21.0
-    85.0    50.0    18.0
-f948 1
-    1.0    -0.0    -0.0
-c0
-4
-    85.0    60.0    18.0
-    85.0    70.0    21.0
-    85.0    60.0    21.0
-    85.0    60.0    18.0
-f949 1
-    -0.0    1.0    -0.0
-c0
-4
-    85.0    70.0    18.0
-    75.0    70.0    18.0
-    85.0    70.0    21.0
-    85.0    70.0    18.0
-f950 1
-    -0.0    1.0    -0.0
-c0
-4
-    65.0    70.0    18.0
-    65.0    70.0    21.0
-    75.0    70.0    21.0
-    65.0    70.0    18.0
-f951 1
-    -0.0    1.0    -0.0
-c0
-4
-    65.0    70.0    18.0
-    75.0    70.0    21.0
-    75.0    70.0    18.0
-    65.0    70.0    18.0
-f952 1
-    -0.0    1.0    -0.0
-c0
-4
-    75.0    70.0    18.0
-    75.0    70.0    21.0
-    85.0    70.0    21.0
-    75.0    70.0    18.0
-f953 1
-    0.0    -1.0    0.0
-c0
-4
-    85.0    50.0    21.0
-    75.0    50.0    18.0
-    85.0    50.0    18.0
-    85.0    50.0    21.0
-f954 1
-    0.0    -1.0    0.0
-c0
-4
-    65.0    50.0    21.0
-    65.0    50.0    18.0
-    75.0    50.0    18.0
-    65.0    50.0    21.0
-f955 1
-    0.0    -1.0    0.0
-c0
-4
-    75.0    50.0    21.0
-    75.0    50.0    18.0
-    85.0    50.0    21.0
-    75.0    50.0    21.0
-f956 1
-    0.0    -1.0    0.0
-c0
-4
-    75.0    50.0    21.0
-    65.0    50.0    21.0
-    75.0    50.0    18.0
-    75.0    50.0    21.0
-f957 1
-    -1.0    0.0    0.0
-c0
-4
-    65.0    70.0    21.0
-    65.0    70.0    18.0
-    65.0    60.0    18.0
-    65.0    70.0    21.0
-f958 1
-    -1.0    0.0    0.0
-c0
-4
-    65.0    50.0    21.0
-    65.0    60.0    18.0
-    65.0    50.0    18.0
-    65.0    50.0    21.0
-f959 1
-    -1.0    0.0    0.0
-c0
-4
-    65.0    60.0    21.0
-    65.0    70.0    21.0
-    65.0    60.0    18.0
-    65.0    60.0    21.0
-f960 1
-    -1.0    0.0    0.0
-c0
-4
-    65.0    60.0    21.0
-    65.0    60.0    18.0
-    65.0    50.0    21.0
-    65.0    60.0    21.0
-f961 1
-    -1.0    0.0    0.0
-c0
-4
-    95.0    45.0    21.0
-    95.0    35.0    18.0
-    95.0    35.0    21.0
-    95.0    45.0    21.0
-f962 1
-    -1.0    0.0    0.0
-c0
-4
-    95.0    45.0    21.0
-    95.0    45.0    18.0
-    95.0    35.0    18.0
-    95.0    45.0    21.0
-f963 1
-    -1.0    0.0    0.0
-c0
-4
-    95.0    45.0    21.0
-    95.0    55.0    21.0
-    95.0    55.0    18.0
-    95.0    45.0    21.0
-f964 1
-    -1.0    0.0    0.0
-c0
-4
-    95.0    45.0    21.0
-    95.0    55.0    18.0
-    95.0    45.0    18.0
-    95.0    45.0    21.0
-f965 1
-    -0.0    1.0    -0.0
-c0
-4
-    95.0    55.0    18.0
-    95.0    55.0    21.0
-    105.0    55.0    21.0
-    95.0    55.0    18.0
-f966 1
-    -0.0    1.0    -0.0
-c0
-4
-    105.0    55.0    18.0
-    95.0    55.0    18.0
-    105.0    55.0    21.0
-    105.0    55.0    18.0
-f967 1
-    -0.0    1.0    -0.0
-c0
-4
-    115.0    55.0    18.0
-    105.0    55.0    21.0
-    115.0    55.0    21.0
-    115.0    55.0    18.0
-f968 1
-    -0.0    1.0    -0.0
-c0
-4
-    105.0    55.0    18.0
-    105.0    55.0    21.0
-    115.0    55.0    18.0
-    105.0    55.0    18.0
-f969 1
-    0.0    -1.0    0.0
-c0
-4
-    95.0    35.0    21.0
-    95.0    35.0    18.0
-    105.0    35.0    21.0
-    95.0    35.0    21.0
-f970 1
-    0.0    -1.0    0.0
-c0
-4
-    105.0    35.0    21.0
-    95.0    35.0    18.0
-    105.0    35.0    18.0
-    105.0    35.0    21.0
-f971 1
-    0.0    -1.0    0.0
-c0
-4
-    105.0    35.0    21.0
-    115.0    35.0    18.0
-    115.0    35.0    21.0
-    105.0    35.0    21.0
-f972 1
-    0.0    -1.0    0.0
-c0
-4
-    105.0    35.0    21.0
-    105.0    35.0    18.0
-    115.0    35.0    18.0
-    105.0    35.0    21.0
-f973 1
-    1.0    -0.0    -0.0
-c0
-4
-    115.0    55.0    21.0
-    115.0    45.0    18.0
-    115.0    55.0    18.0
-    115.0    55.0    21.0
-f974 1
-    1.0    -0.0    -0.0
-c0
-4
-    115.0    45.0    21.0
-    115.0    35.0    21.0
-    115.0    35.0    18.0
-    115.0    45.0    21.0
-f975 1
-    1.0    -0.0    -0.0
-c0
-4
-    115.0    45.0    21.0
-    115.0    35.0    18.0
-    115.0    45.0    18.0
-    115.0    45.0    21.0
-f976 1
-    1.0    -0.0    -0.0
-c0
-4
-    115.0    45.0    21.0
-    115.0    45.0    18.0
-    115.0    55.0    21.0
-    115.0    45.0    21.0
-f977 1
-    -0.0    -0.0    1.0
-c0
-4
-    50.0    45.0    18.0
-    55.0    40.0    18.0
-    55.0    50.0    18.0
-    50.0    45.0    18.0
-f978 1
-    -0.0    -0.0    1.0
-c0
-4
-    50.0    45.0    18.0
-    55.0    50.0    18.0
-    45.0    50.0    18.0
-    50.0    45.0    18.0
-f979 1
-    -0.0    -0.0    1.0
-c0
-4
-    50.0    35.0    18.0
-    55.0    30.0    18.0
-    55.0    40.0    18.0
-    50.0    35.0    18.0
-f980 1
-    -0.0    -0.0    1.0
-c0
-4
-    50.0    35.0    18.0
-    45.0    30.0    18.0
-    55.0    30.0    18.0
-    50.0    35.0    18.0
-f981 1
-    -0.0    -0.0    1.0
-c0
-4
-    40.0    45.0    18.0
-    45.0    50.0    18.0
-    35.0    50.0    18.0
-    40.0    45.0    18.0
-f982 1
-    -0.0    -0.0    1.0
-c0
-4
-    40.0    45.0    18.0
-    35.0    50.0    18.0
-    35.0    40.0    18.0
-    40.0    45.0    18.0
-f983 1
-    -0.0    -0.0    1.0
-c0
-4
-    40.0    35.0    18.0
-    35.0    30.0    18.0
-    45.0    30.0    18.0
-    40.0    35.0    18.0
-f984 1
-    -0.0    -0.0    1.0
-c0
-4
-    40.0    35.0    18.0
-    35.0    40.0    18.0
-    35.0    30.0    18.0
-    40.0    35.0    18.0
-f985 1
-    -0.0    -0.0    1.0
-c0
-4
-    50.0    45.0    18.0
-    45.0    40.0    18.0
-    55.0    40.0    18.0
-    50.0    45.0    18.0
-f986 1
-    -0.0    -0.0    1.0
-c0
-4
-    50.0    35.0    18.0
-    55.0    40.0    18.0
-    45.0    40.0    18.0
-    50.0    35.0    18.0
-f987 1
-    -0.0    -0.0    1.0
-c0
-4
-    50.0    45.0    18.0
-    45.0    50.0    18.0
-    45.0    40.0    18.0
-    50.0    45.0    18.0
-f988 1
-    -0.0    -0.0    1.0
-c0
-4
-    40.0    45.0    18.0
-    45.0    40.0    18.0
-    45.0    50.0    18.0
-    40.0    45.0    18.0
-f989 1
-    -0.0    -0.0    1.0
-c0
-4
-    50.0    35.0    18.0
-    45.0    40.0    18.0
-    45.0    30.0    18.0
-    50.0    35.0    18.0
-f990 1
-    -0.0    -0.0    1.0
-c0
-4
-    40.0    35.0    18.0
-    45.0    30.0    18.0
-    45.0    40.0    18.0
-    40.0    35.0    18.0
-f991 1
-    -0.0    -0.0    1.0
-c0
-4
-    40.0    45.0    18.0
-    35.0    40.0    18.0
-    45.0    40.0    18.0
-    40.0    45.0    18.0
-f992 1
-    -0.0    -0.0    1.0
-c0
-4
-    40.0    35.0    18.0
-    45.0    40.0    18.0
-    35.0    40.0    18.0
-    40.0    35.0    18.0
-f993 1
-    1.0    -0.0    -0.0
-c0
-4
-    90.0    110.0    21.0
-    90.0    110.0    18.0
-    90.0    120.0    18.0
-    90.0    110.0    21.0
-f994 1
-    1.0    -0.0    -0.0
-c0
-4
-    90.0    130.0    21.0
-    90.0    120.0    18.0
-    90.0    130.0    18.0
-    90.0    130.0    21.0
-f995 1
-    1.0    -0.0    -0.0
-c0
-4
-    90.0    130.0    21.0
-    90.0    120.0    21.0
-    90.0    120.0    18.0
-    90.0    130.0    21.0
-f996 1
-    1.0    -0.0    -0.0
-c0
-4
-    90.0    110.0    21.0
-    90.0    120.0    18.0
-    90.0    120.0    21.0
-    90.0    110.0    21.0
-f997 1
-    -0.0    1.0    -0.0
-c0
-4
-    80.0    130.0    18.0
-    90.0    130.0    21.0
-    90.0    130.0    18.0
-    80.0    130.0    18.0
-f998 1
-    -0.0    1.0    -0.0
-c0
-4
-    70.0    130.0    18.0
-    70.0    130.0    21.0
-    80.0    130.0    21.0
-    70.0    130.0    18.0
-f999 1
-    -0.0    1.0    -0.0
-c0
-4
-    70.0    130.0    18.0
-    80.0    130.0    21.0
-    80.0    130.0    18.0
-    70.0    130.0    18.0
-f1000 1
-    -0.0    1.0    -0.0
-c0
-4
-    80.0    130.0    18.0
-    80.0    130.0    21.0
-    90.0    130.0    21.0
-    80.0    130.0    18.0
-f1001 1
-    -1.0    0.0    0.0
-c0
-4
-    70.0    130.0    18.0
-    70.0    120.0    18.0
-    70.0    130.0    21.0
-    70.0    130.0    18.0
-f1002 1
-    -1.0    0.0    0.0
-c0
-4
-    70.0    110.0    18.0
-    70.0    110.0    21.0
-    70.0    120.0    21.0
-    70.0    110.0    18.0
-f1003 1
-    -1.0    0.0    0.0
-c0
-4
-    70.0    110.0    18.0
-    70.0    120.0    21.0
-    70.0    120.0    18.0
-    70.0    110.0    18.0
-f1004 1
-    -1.0    0.0    0.0
-c0
-4
-    70.0    120.0    18.0
-    70.0    120.0    21.0
-    70.0    130.0    21.0
-    70.0    120.0    18.0
-f1005 1
-    0.0    -1.0    0.0
-c0
-4
-    90.0    110.0    21.0
-    80.0    110.0    21.0
-    90.0    110.0    18.0
-    90.0    110.0    21.0
-f1006 1
-    0.0    -1.0    0.0
-c0
-4
-    80.0    110.0    21.0
-    80.0    110.0    18.0
-    90.0    110.0    18.0
-    80.0    110.0    21.0
-f1007 1
-    0.0    -1.0    0.0
-c0
-4
-    70.0    110.0    21.0
-    70.0    110.0    18.0
-    80.0    110.0    18.0
-    70.0    110.0    21.0
-f1008 1
-    0.0    -1.0    0.0
-c0
-4
-    80.0    110.0    21.0
-    70.0    110.0    21.0
-    80.0    110.0    18.0
-    80.0    110.0    21.0
-f1009 1
-    -0.0    1.0    -0.0
-c0
-4
-    120.0    90.0    21.0
-    110.0    90.0    21.0
-    110.0    90.0    24.0
-    120.0    90.0    21.0
-f1010 1
-    -0.0    1.0    -0.0
-c0
-4
-    120.0    90.0    21.0
-    130.0    90.0    24.0
-    130.0    90.0    21.0
-    120.0    90.0    21.0
-f1011 1
-    -0.0    1.0    -0.0
-c0
-4
-    120.0    90.0    21.0
-    110.0    90.0    24.0
-    120.0    90.0    24.0
-    120.0    90.0    21.0
-f1012 1
-    -0.0    1.0    -0.0
-c0
-4
-    120.0    90.0    21.0
-    120.0    90.0    24.0
-    130.0    90.0    24.0
-    120.0    90.0    21.0
-f1013 1
-    1.0    -0.0    -0.0
-c0
-4
-    130.0    90.0    24.0
-    130.0    80.0    24.0
-    130.0    90.0    21.0
-    130.0    90.0    24.0
-f1014 1
-    1.0    -0.0    -0.0
-c0
-4
-    130.0    80.0    24.0
-    130.0    80.0    21.0
-    130.0    90.0    21.0
-    130.0    80.0    24.0
-f1015 1
-    1.0    -0.0    -0.0
-c0
-4
-    130.0    80.0    24.0
-    130.0    70.0    24.0
-    130.0    70.0    21.0
-    130.0    80.0    24.0
-f1016 1
-    1.0    -0.0    -0.0
-c0
-4
-    130.0    80.0    24.0
-    130.0    70.0    21.0
-    130.0    80.0    21.0
-    130.0    80.0    24.0
-f1017 1
-    -1.0    0.0    0.0
-c0
-4
-    110.0    90.0    21.0
-    110.0    80.0    24.0
-    110.0    90.0    24.0
-    110.0    90.0    21.0
-f1018 1
-    -1.0    0.0    0.0
-c0
-4
-    110.0    80.0    21.0
-    110.0    80.0    24.0
-    110.0    90.0    21.0
-    110.0    80.0    21.0
-f1019 1
-    -1.0    0.0    0.0
-c0
-4
-    110.0    80.0    21.0
-    110.0    70.0    21.0
-    110.0    70.0    24.0
-    110.0    80.0    21.0
-f1020 1
-    -1.0    0.0    0.0
-c0
-4
-    110.0    80.0    21.0
-    110.0    70.0    24.0
-    110.0    80.0    24.0
-    110.0    80.0    21.0
-f1021 1
-    0.0    -1.0    0.0
-c0
-4
-    130.0    70.0    24.0
-    120.0    70.0    21.0
-    130.0    70.0    21.0
-    130.0    70.0    24.0
-f1022 1
-    0.0    -1.0    0.0
-c0
-4
-    110.0    70.0    24.0
-    110.0    70.0    21.0
-    120.0    70.0    24.0
-    110.0    70.0    24.0
-f1023 1
-    0.0    -1.0    0.0
-c0
-4
-    120.0    70.0    24.0
-    110.0    70.0    21.0
-    120.0    70.0    21.0
-    120.0    70.0    24.0
-f1024 1
-    0.0    -1.0    0.0
-c0
-4
-    130.0    70.0    24.0
-    120.0    70.0    24.0
-    120.0    70.0    21.0
-    130.0    70.0    24.0
-f1025 1
-    -0.0    1.0    -0.0
-c0
-4
-    50.0    95.0    21.0
-    50.0    95.0    24.0
-    60.0    95.0    24.0
-    50.0    95.0    21.0
-f1026 1
-    -0.0    1.0    -0.0
-c0
-4
-    60.0    95.0    21.0
-    50.0    95.0    21.0
-    60.0    95.0    24.0
-    60.0    95.0    21.0
-f1027 1
-    -0.0    1.0    -0.0
-c0
-4
-    70.0    95.0    21.0
-    60.0    95.0    21.0
-    70.0    95.0    24.0
-    70.0    95.0    21.0
-f1028 1
-    -0.0    1.0    -0.0
-c0
-4
-    60.0    95.0    21.0
-    60.0    95.0    24.0
-    70.0    95.0    24.0
-    60.0    95.0    21.0
-f1029 1
-    1.0    -0.0    -0.0
-c0
-4
-    70.0    95.0    24.0
-    70.0    85.0    24.0
-    70.0    95.0    21.0
-    70.0    95.0    24.0
-f1030 1
-    1.0    -0.0    -0.0
-c0
-4
-    70.0    85.0    24.0
-    70.0    85.0    21.0
-    70.0    95.0    21.0
-    70.0    85.0    24.0
-f1031 1
-    1.0    -0.0    -0.0
-c0
-4
-    70.0    75.0    24.0
-    70.0    75.0    21.0
-    70.0    85.0    21.0
-    70.0    75.0    24.0
-f1032 1
-    1.0    -0.0    -0.0
-c0
-4
-    70.0    85.0    24.0
-    70.0    75.0    24.0
-    70.0    85.0    21.0
-    70.0    85.0    24.0
-f1033 1
-    -1.0    0.0    0.0
-c0
-4
-    50.0    85.0    21.0
-    50.0    95.0    24.0
-    50.0    95.0    21.0
-    50.0    85.0    21.0
-f1034 1
-    -1.0    0.0    0.0
-c0
-4
-    50.0    75.0    21.0
-    50.0    75.0    24.0
-    50.0    85.0    24.0
-    50.0    75.0    21.0
-f1035 1
-    -1.0    0.0    0.0
-c0
-4
-    50.0    85.0    21.0
-    50.0    75.0    21.0
-    50.0    85.0    24.0
-    50.0    85.0    21.0
-f1036 1
-    -1.0    0.0    0.0
-c0
-4
-    50.0    85.0    21.0
-    50.0    85.0    24.0
-    50.0    95.0    24.0
-    50.0    85.0    21.0
-f1037 1
-    0.0    -1.0    0.0
-c0
-4
-    60.0    75.0    21.0
-    70.0    75.0    21.0
-    70.0    75.0    24.0
-    60.0    75.0    21.0
-f1038 1
-    0.0    -1.0    0.0
-c0
-4
-    50.0    75.0    21.0
-    60.0    75.0    24.0
-    50.0    75.0    24.0
-    50.0    75.0    21.0
-f1039 1
-    0.0    -1.0    0.0
-c0
-4
-    50.0    75.0    21.0
-    60.0    75.0    21.0
-    60.0    75.0    24.0
-    50.0    75.0    21.0
-f1040 1
-    0.0    -1.0    0.0
-c0
-4
-    60.0    75.0    21.0
-    70.0    75.0    24.0
-    60.0    75.0    24.0
-    60.0    75.0    21.0
-f1041 1
-    1.0    -0.0    -0.0
-c0
-4
-    50.0    125.0    21.0
-    50.0    125.0    24.0
-    50.0    115.0    24.0
-    50.0    125.0    21.0
-f1042 1
-    1.0    -0.0    -0.0
-c0
-4
-    50.0    125.0    21.0
-    50.0    115.0    24.0
-    50.0    115.0    21.0
-    50.0    125.0    21.0
-f1043 1
-    1.0    -0.0    -0.0
-c0
-4
-    50.0    105.0    21.0
-    50.0    115.0    21.0
-    50.0    105.0    24.0
-    50.0    105.0    21.0
-f1044 1
-    1.0    -0.0    -0.0
-c0
-4
-    50.0    115.0    21.0
-    50.0    115.0    24.0
-    50.0    105.0    24.0
-    50.0    115.0    21.0
-f1045 1
-    -0.0    1.0    -0.0
-c0
-4
-    50.0    125.0    21.0
-    40.0    125.0    24.0
-    50.0    125.0    24.0
-    50.0    125.0    21.0
-f1046 1
-    -0.0    1.0    -0.0
-c0
-4
-    40.0    125.0    21.0
-    40.0    125.0    24.0
-    50.0    125.0    21.0
-    40.0    125.0    21.0
-f1047 1
-    -0.0    1.0    -0.0
-c0
-4
-    30.0    125.0    21.0
-    30.0    125.0    24.0
-    40.0    125.0    21.0
-    30.0    125.0    21.0
-f1048 1
-    -0.0    1.0    -0.0
-c0
-4
-    40.0    125.0    21.0
-    30.0    125.0    24.0
-    40.0    125.0    24.0
-    40.0    125.0    21.0
-f1049 1
-    0.0    -1.0    0.0
-c0
-4
-    50.0    105.0    24.0
-    40.0    105.0    21.0
-    50.0    105.0    21.0
-    50.0    105.0    24.0
-f1050 1
-    0.0    -1.0    0.0
-c0
-4
-    40.0    105.0    24.0
-    30.0    105.0    24.0
-    30.0    105.0    21.0
-    40.0    105.0    24.0
-f1051 1
-    0.0    -1.0    0.0
-c0
-4
-    40.0    105.0    24.0
-    30.0    105.0    21.0
-    40.0    105.0    21.0
-    40.0    105.0    24.0
-f1052 1
-    0.0    -1.0    0.0
-c0
-4
-    40.0    105.0    24.0
-    40.0    105.0    21.0
-    50.0    105.0    24.0
-    40.0    105.0    24.0
-f1053 1
-    -1.0    0.0    0.0
-c0
-4
-    30.0    115.0    21.0
-    30.0    125.0    24.0
-    30.0    125.0    21.0
-    30.0    115.0    21.0
-f1054 1
-    -1.0    0.0    0.0
-c0
-4
-    30.0    105.0    21.0
-    30.0    105.0    24.0
-    30.0    115.0    21.0
-    30.0    105.0    21.0
-f1055 1
-    -1.0    0.0    0.0
-c0
-4
-    30.0    115.0    21.0
-    30.0    115.0    24.0
-    30.0    125.0    24.0
-    30.0    115.0    21.0
-f1056 1
-    -1.0    0.0    0.0
-c0
-4
-    30.0    115.0    21.0
-    30.0    105.0    24.0
-    30.0    115.0    24.0
-    30.0    115.0    21.0
-f1057 1
-    1.0    -0.0    -0.0
-c0
-4
-    125.0    120.0    24.0
-    125.0    110.0    21.0
-    125.0    120.0    21.0
-    125.0    120.0    24.0
-f1058 1
-    1.0    -0.0    -0.0
-c0
-4
-    125.0    100.0    24.0
-    125.0    100.0    21.0
-    125.0    110.0    24.0
-    125.0    100.0    24.0
-f1059 1
-    1.0    -0.0    -0.0
-c0
-4
-    125.0    110.0    24.0
-    125.0    100.0    21.0
-    125.0    110.0    21.0
-    125.0    110.0    24.0
-f1060 1
-    1.0    -0.0    -0.0
-c0
-4
-    125.0    110.0    24.0
-    125.0    110.0    21.0
-    125.0    120.0    24.0
-    125.0    110.0    24.0
-f1061 1
-    -0.0    1.0    -0.0
-c0
-4
-    125.0    120.0    21.0
-    115.0    120.0    24.0
-    125.0    120.0    24.0
-    125.0    120.0    21.0
-f1062 1
-    -0.0    1.0    -0.0
-c0
-4
-    115.0    120.0    21.0
-    115.0    120.0    24.0
-    125.0    120.0    21.0
-    115.0    120.0    21.0
-f1063 1
-    -0.0    1.0    -0.0
-c0
-4
-    115.0    120.0    21.0
-    105.0    120.0    21.0
-    105.0    120.0    24.0
-    115.0    120.0    21.0
-f1064 1
-    -0.0    1.0    -0.0
-c0
-4
-    115.0    120.0    21.0
-    105.0    120.0    24.0
-    115.0    120.0    24.0
-    115.0    120.0    21.0
-f1065 1
-    0.0    -1.0    0.0
-c0
-4
-    115.0    100.0    24.0
-    125.0    100.0    21.0
-    125.0    100.0    24.0
-    115.0    100.0    24.0
-f1066 1
-    0.0    -1.0    0.0
-c0
-4
-    115.0    100.0    24.0
-    115.0    100.0    21.0
-    125.0    100.0    21.0
-    115.0    100.0    24.0
-f1067 1
-    0.0    -1.0    0.0
-c0
-4
-    115.0    100.0    24.0
-    105.0    100.0    24.0
-    105.0    100.0    21.0
-    115.0    100.0    24.0
-f1068 1
-    0.0    -1.0    0.0
-c0
-4
-    115.0    100.0    24.0
-    105.0    100.0    21.0
-    115.0    100.0    21.0
-    115.0    100.0    24.0
-f1069 1
-    -1.0    0.0    0.0
-c0
-4
-    105.0    120.0    21.0
-    105.0    110.0    24.0
-    105.0    120.0    24.0
-    105.0    120.0    21.0
-f1070 1
-    -1.0    0.0    0.0
-c0
-4
-    105.0    110.0    21.0
-    105.0    110.0    24.0
-    105.0    120.0    21.0
-    105.0    110.0    21.0
-f1071 1
-    -1.0    0.0    0.0
-c0
-4
-    105.0    100.0    21.0
-    105.0    100.0    24.0
-    105.0    110.0    24.0
-    105.0    100.0    21.0
-f1072 1
-    -1.0    0.0    0.0
-c0
-4
-    105.0    110.0    21.0
-    105.0    100.0    21.0
-    105.0    110.0    24.0
-    105.0    110.0    21.0
-f1073 1
-    1.0    -0.0    -0.0
-c0
-4
-    85.0    70.0    24.0
-    85.0    60.0    24.0
-    85.0    70.0    21.0
-    85.0    70.0    24.0
-f1074 1
-    1.0    -0.0    -0.0
-c0
-4
-    85.0    60.0    24.0
-    85.0    60.0    21.0
-    85.0    70.0    21.0
-    85.0    60.0    24.0
-f1075 1
-    1.0    -0.0    -0.0
-c0
-4
-    85.0    50.0    24.0
-    85.0    50.0    21.0
-    85.0    60.0    24.0
-    85.0    50.0    24.0
-f1076 1
-    1.0    -0.0    -0.0
-c0
-4
-    85.0    60.0    24.0
-    85.0    50.0    21.0
-    85.0    60.0    21.0
-    85.0    60.0    24.0
-f1077 1
-    -0.0    1.0    -0.0
-c0
-4
-    75.0    70.0    21.0
-    85.0    70.0    24.0
-    85.0    70.0    21.0
-    75.0    70.0    21.0
-f1078 1
-    -0.0    1.0    -0.0
-c0
-4
-    65.0    70.0    21.0
-    65.0    70.0    24.0
-    75.0    70.0    24.0
-    65.0    70.0    21.0
-f1079 1
-    -0.0    1.0    -0.0
-c0
-4
-    75.0    70.0    21.0
-    65.0    70.0    21.0
-    75.0    70.0    24.0
-    75.0    70.0    21.0
-f1080 1
-    -0.0    1.0    -0.0
-c0
-4
-    75.0    70.0    21.0
-    75.0    70.0    24.0
-    85.0    70.0    24.0
-    75.0    70.0    21.0
-f1081 1
-    0.0    -1.0    0.0
-c0
-4
-    85.0    50.0    24.0
-    75.0    50.0    21.0
-    85.0    50.0    21.0
-    85.0    50.0    24.0
-f1082 1
-    0.0    -1.0    0.0
-c0
-4
-    65.0    50.0    24.0
-    65.0    50.0    21.0
-    75.0    50.0    21.0
-    65.0    50.0    24.0
-f1083 1
-    0.0    -1.0    0.0
-c0
-4
-    75.0    50.0    24.0
-    75.0    50.0    21.0
-    85.0    50.0    24.0
-    75.0    50.0    24.0
-f1084 1
-    0.0    -1.0    0.0
-c0
-4
-    75.0    50.0    24.0
-    65.0    50.0    24.0
-    75.0    50.0    21.0
-    75.0    50.0    24.0
-f1085 1
-    -1.0    0.0    0.0
-c0
-4
-    65.0    70.0    21.0
-    65.0    60.0    21.0
-    65.0    70.0    24.0
-    65.0    70.0    21.0
-f1086 1
-    -1.0    0.0    0.0
-c0
-4
-    65.0    50.0    21.0
-    65.0    50.0    24.0
-    65.0    60.0    24.0
-    65.0    50.0    21.0
-f1087 1
-    -1.0    0.0    0.0
-c0
-4
-    65.0    60.0    21.0
-    65.0    50.0    21.0
-    65.0    60.0    24.0
-    65.0    60.0    21.0
-f1088 1
-    -1.0    0.0    0.0
-c0
-4
-    65.0    60.0    21.0
-    65.0    60.0    24.0
-    65.0    70.0    24.0
-    65.0    60.0    21.0
-f1089 1
-    -1.0    0.0    0.0
-c0
-4
-    95.0    45.0    21.0
-    95.0    55.0    24.0
-    95.0    55.0    21.0
-    95.0    45.0    21.0
-f1090 1
-    -1.0    0.0    0.0
-c0
-4
-    95.0    35.0    21.0
-    95.0    35.0    24.0
-    95.0    45.0    24.0
-    95.0    35.0    21.0
-f1091 1
-    -1.0    0.0    0.0
-c0
-4
-    95.0    35.0    21.0
-    95.0    45.0    24.0
-    95.0    45.0    21.0
-    95.0    35.0    21.0
-f1092 1
-    -1.0    0.0    0.0
-c0
-4
-    95.0    45.0    21.0
-    95.0    45.0    24.0
-    95.0    55.0    24.0
-    95.0    45.0    21.0
-f1093 1
-    -0.0    1.0    -0.0
-c0
-4
-    95.0    55.0    21.0
-    95.0    55.0    24.0
-    105.0    55.0    21.0
-    95.0    55.0    21.0
-f1094 1
-    -0.0    1.0    -0.0
-c0
-4
-    115.0    55.0    21.0
-    105.0    55.0    24.0
-    115.0    55.0    24.0
-    115.0    55.0    21.0
-f1095 1
-    -0.0    1.0    -0.0
-c0
-4
-    105.0    55.0    21.0
-    105.0    55.0    24.0
-    115.0    55.0    21.0
-    105.0    55.0    21.0
-f1096 1
-    -0.0    1.0    -0.0
-c0
-4
-    105.0    55.0    21.0
-    95.0    55.0    24.0
-    105.0    55.0    24.0
-    105.0    55.0    21.0
-f1097 1
-    0.0    -1.0    0.0
-c0
-4
-    95.0    35.0    24.0
-    95.0    35.0    21.0
-    105.0    35.0    21.0
-    95.0    35.0    24.0
-f1098 1
-    0.0    -1.0    0.0
-c0
-4
-    105.0    35.0    24.0
-    115.0    35.0    21.0
-    115.0    35.0    24.0
-    105.0    35.0    24.0
-f1099 1
-    0.0    -1.0    0.0
-c0
-4
-    105.0    35.0    24.0
-    105.0    35.0    21.0
-    115.0    35.0    21.0
-    105.0    35.0    24.0
-f1100 1
-    0.0    -1.0    0.0
-c0
-4
-    105.0    35.0    24.0
-    95.0    35.0    24.0
-    105.0    35.0    21.0
-    105.0    35.0    24.0
-f1101 1
-    -0.0    -0.0    1.0
-c0
-4
-    60.0    95.0    30.0
-    50.0    95.0    30.0
-    55.0    90.0    30.0
-    60.0    95.0    30.0
-f1102 1
-    -0.0    -0.0    1.0
-c0
-4
-    50.0    75.0    30.0
-    60.0    75.0    30.0
-    55.0    80.0    30.0
-    50.0    75.0    30.0
-f1103 1
-    -0.0    -0.0    1.0
-c0
-4
-    70.0    75.0    30.0
-    70.0    85.0    30.0
-    65.0    80.0    30.0
-    70.0    75.0    30.0
-f1104 1
-    -0.0    -0.0    1.0
-c0
-4
-    70.0    85.0    30.0
-    70.0    95.0    30.0
-    65.0    90.0    30.0
-    70.0    85.0    30.0
-f1105 1
-    -0.0    -0.0    1.0
-c0
-4
-    60.0    95.0    30.0
-    60.0    85.0    30.0
-    65.0    90.0    30.0
-    60.0    95.0    30.0
-f1106 1
-    -0.0    -0.0    1.0
-c0
-4
-    60.0    85.0    30.0
-    60.0    75.0    30.0
-    65.0    80.0    30.0
-    60.0    85.0    30.0
-f1107 1
-    -0.0    -0.0    1.0
-c0
-4
-    60.0    85.0    30.0
-    60.0    95.0    30.0
-    55.0    90.0    30.0
-    60.0    85.0    30.0
-f1108 1
-    -0.0    -0.0    1.0
-c0
-4
-    60.0    75.0    30.0
-    60.0    85.0    30.0
-    55.0    80.0    30.0
-    60.0    75.0    30.0
-f1109 1
-    -0.0    -0.0    1.0
-c0
-4
-    70.0    85.0    30.0
-    60.0    85.0    30.0
-    65.0    80.0    30.0
-    70.0    85.0    30.0
-f1110 1
-    -0.0    -0.0    1.0
-c0
-4
-    60.0    85.0    30.0
-    70.0    85.0    30.0
-    65.0    90.0    30.0
-    60.0    85.0    30.0
-f1111 1
-    -0.0    -0.0    1.0
-c0
-4
-    50.0    95.0    30.0
-    50.0    85.0    30.0
-    55.0    90.0    30.0
-    50.0    95.0    30.0
-f1112 1
-    -0.0    -0.0    1.0
-c0
-4
-    50.0    85.0    30.0
-    50.0    75.0    30.0
-    55.0    80.0    30.0
-    50.0    85.0    30.0
-f1113 1
-    -0.0    -0.0    1.0
-c0
-4
-    50.0    85.0    30.0
-    60.0    85.0    30.0
-    55.0    90.0    30.0
-    50.0    85.0    30.0
-f1114 1
-    -0.0    -0.0    1.0
-c0
-4
-    60.0    85.0    30.0
-    50.0    85.0    30.0
-    55.0    80.0    30.0
-    60.0    85.0    30.0
-f1115 1
-    -0.0    -0.0    1.0
-c0
-4
-    70.0    95.0    30.0
-    60.0    95.0    30.0
-    65.0    90.0    30.0
-    70.0    95.0    30.0
-f1116 1
-    -0.0    -0.0    1.0
-c0
-4
-    60.0    75.0    30.0
-    70.0    75.0    30.0
-    65.0    80.0    30.0
-    60.0    75.0    30.0
-f1117 1
-    1.0    -0.0    -0.0
-c0
-4
-    50.0    115.0    30.0
-    50.0    125.0    30.0
-    50.0    125.0    33.0
-    50.0    115.0    30.0
-f1118 1
-    1.0    -0.0    -0.0
-c0
-4
-    50.0    115.0    30.0
-    50.0    125.0    33.0
-    50.0    115.0    33.0
-    50.0    115.0    30.0
-f1119 1
-    1.0    -0.0    -0.0
-c0
-4
-    50.0    105.0    30.0
-    50.0    115.0    30.0
-    50.0    105.0    33.0
-    50.0    105.0    30.0
-f1120 1
-    1.0    -0.0    -0.0
-c0
-4
-    50.0    115.0    30.0
-    50.0    115.0    33.0
-    50.0    105.0    33.0
-    50.0    115.0    30.0
-f1121 1
-    -0.0    1.0    -0.0
-c0
-4
-    50.0    125.0    30.0
-    40.0    125.0    33.0
-    50.0    125.0    33.0
-    50.0    125.0    30.0
-f1122 1
-    -0.0    1.0    -0.0
-c0
-4
-    40.0    125.0    30.0
-    40.0    125.0    33.0
-    50.0    125.0    30.0
-    40.0    125.0    30.0
-f1123 1
-    -0.0    1.0    -0.0
-c0
-4
-    40.0    125.0    30.0
-    30.0    125.0    30.0
-    30.0    125.0    33.0
-    40.0    125.0    30.0
-f1124 1
-    -0.0    1.0    -0.0
-c0
-4
-    40.0    125.0    30.0
-    30.0    125.0    33.0
-    40.0    125.0    33.0
-    40.0    125.0    30.0
-f1125 1
-    0.0    -1.0    0.0
-c0
-4
-    50.0    105.0    33.0
-    40.0    105.0    30.0
-    50.0    105.0    30.0
-    50.0    105.0    33.0
-f1126 1
-    0.0    -1.0    0.0
-c0
-4
-    40.0    105.0    33.0
-    40.0    105.0    30.0
-    50.0    105.0    33.0
-    40.0    105.0    33.0
-f1127 1
-    0.0    -1.0    0.0
-c0
-4
-    40.0    105.0    33.0
-    30.0    105.0    33.0
-    30.0    105.0    30.0
-    40.0    105.0    33.0
-f1128 1
-    0.0    -1.0    0.0
-c0
-4
-    40.0    105.0    33.0
-    30.0    105.0    30.0
-    40.0    105.0    30.0
-    40.0    105.0    33.0
-f1129 1
-    -1.0    0.0    0.0
-c0
-4
-    30.0    125.0    30.0
-    30.0    115.0    33.0
-    30.0    125.0    33.0
-    30.0    125.0    30.0
-f1130 1
-    -1.0    0.0    0.0
-c0
-4
-    30.0    115.0    30.0
-    30.0    115.0    33.0
-    30.0    125.0    30.0
-    30.0    115.0    30.0
-f1131 1
-    -1.0    0.0    0.0
-c0
-4
-    30.0    105.0    30.0
-    30.0    105.0    33.0
-    30.0    115.0    33.0
-    30.0    105.0    30.0
-f1132 1
-    -1.0    0.0    0.0
-c0
-4
-    30.0    115.0    30.0
-    30.0    105.0    30.0
-    30.0    115.0    33.0
-    30.0    115.0    30.0
-f1133 1
-    -0.0    -0.0    1.0
-c0
-4
-    120.0    115.0    30.0
-    125.0    110.0    30.0
-    125.0    120.0    30.0
-    120.0    115.0    30.0
-f1134 1
-    -0.0    -0.0    1.0
-c0
-4
-    120.0    115.0    30.0
-    125.0    120.0    30.0
-    115.0    120.0    30.0
-    120.0    115.0    30.0
-f1135 1
-    -0.0    -0.0    1.0
-c0
-4
-    110.0    115.0    30.0
-    115.0    120.0    30.0
-    105.0    120.0    30.0
-    110.0    115.0    30.0
-f1136 1
-    -0.0    -0.0    1.0
-c0
-4
-    110.0    115.0    30.0
-    105.0    120.0    30.0
-    105.0    110.0    30.0
-    110.0    115.0    30.0
-f1137 1
-    -0.0    -0.0    1.0
-c0
-4
-    110.0    105.0    30.0
-    105.0    110.0    30.0
-    105.0    100.0    30.0
-    110.0    105.0    30.0
-f1138 1
-    -0.0    -0.0    1.0
-c0
-4
-    110.0    105.0    30.0
-    105.0    100.0    30.0
-    115.0    100.0    30.0
-    110.0    105.0    30.0
-f1139 1
-    -0.0    -0.0    1.0
-c0
-4
-    120.0    105.0    30.0
-    125.0    100.0    30.0
-    125.0    110.0    30.0
-    120.0    105.0    30.0
-f1140 1
-    -0.0    -0.0    1.0
-c0
-4
-    120.0    105.0    30.0
-    115.0    100.0    30.0
-    125.0    100.0    30.0
-    120.0    105.0    30.0
-f1141 1
-    -0.0    -0.0    1.0
-c0
-4
-    120.0    115.0    30.0
-    115.0    110.0    30.0
-    125.0    110.0    30.0
-    120.0    115.0    30.0
-f1142 1
-    -0.0    -0.0    1.0
-c0
-4
-    120.0    105.0    30.0
-    125.0    110.0    30.0
-    115.0    110.0    30.0
-    120.0    105.0    30.0
-f1143 1
-    -0.0    -0.0    1.0
-c0
-4
-    120.0    115.0    30.0
-    115.0    120.0    30.0
-    115.0    110.0    30.0
-    120.0    115.0    30.0
-f1144 1
-    -0.0    -0.0    1.0
-c0
-4
-    110.0    115.0    30.0
-    115.0    110.0    30.0
-    115.0    120.0    30.0
-    110.0    115.0    30.0
-f1145 1
-    -0.0    -0.0    1.0
-c0
-4
-    110.0    115.0    30.0
-    105.0    110.0    30.0
-    115.0    110.0    30.0
-    110.0    115.0    30.0
-f1146 1
-    -0.0    -0.0    1.0
-c0
-4
-    110.0    105.0    30.0
-    115.0    110.0    30.0
-    105.0    110.0    30.0
-    110.0    105.0    30.0
-f1147 1
-    -0.0    -0.0    1.0
-c0
-4
-    110.0    105.0    30.0
-    115.0    100.0    30.0
-    115.0    110.0    30.0
-    110.0    105.0    30.0
-f1148 1
-    -0.0    -0.0    1.0
-c0
-4
-    120.0    105.0    30.0
-    115.0    110.0    30.0
-    115.0    100.0    30.0
-    120.0    105.0    30.0
-f1149 1
-    -0.0    -0.0    1.0
-c0
-4
-    95.0    45.0    30.0
-    95.0    35.0    30.0
-    100.0    40.0    30.0
-    95.0    45.0    30.0
-f1150 1
-    -0.0    -0.0    1.0
-c0
-4
-    95.0    35.0    30.0
-    105.0    35.0    30.0
-    100.0    40.0    30.0
-    95.0    35.0    30.0
-f1151 1
-    -0.0    -0.0    1.0
-c0
-4
-    105.0    35.0    30.0
-    115.0    35.0    30.0
-    110.0    40.0    30.0
-    105.0    35.0    30.0
-f1152 1
-    -0.0    -0.0    1.0
-c0
-4
-    115.0    35.0    30.0
-    115.0    45.0    30.0
-    110.0    40.0    30.0
-    115.0    35.0    30.0
-f1153 1
-    -0.0    -0.0    1.0
-c0
-4
-    115.0    45.0    30.0
-    115.0    55.0    30.0
-    110.0    50.0    30.0
-    115.0    45.0    30.0
-f1154 1
-    -0.0    -0.0    1.0
-c0
-4
-    115.0    55.0    30.0
-    105.0    55.0    30.0
-    110.0    50.0    30.0
-    115.0    55.0    30.0
-f1155 1
-    -0.0    -0.0    1.0
-c0
-4
-    95.0    55.0    30.0
-    95.0    45.0    30.0
-    100.0    50.0    30.0
-    95.0    55.0    30.0
-f1156 1
-    -0.0    -0.0    1.0
-c0
-4
-    105.0    55.0    30.0
-    95.0    55.0    30.0
-    100.0    50.0    30.0
-    105.0    55.0    30.0
-f1157 1
-    -0.0    -0.0    1.0
-c0
-4
-    105.0    45.0    30.0
-    95.0    45.0    30.0
-    100.0    40.0    30.0
-    105.0    45.0    30.0
-f1158 1
-    -0.0    -0.0    1.0
-c0
-4
-    95.0    45.0    30.0
-    105.0    45.0    30.0
-    100.0    50.0    30.0
-    95.0    45.0    30.0
-f1159 1
-    -0.0    -0.0    1.0
-c0
-4
-    105.0    35.0    30.0
-    105.0    45.0    30.0
-    100.0    40.0    30.0
-    105.0    35.0    30.0
-f1160 1
-    -0.0    -0.0    1.0
-c0
-4
-    105.0    45.0    30.0
-    105.0    35.0    30.0
-    110.0    40.0    30.0
-    105.0    45.0    30.0
-f1161 1
-    -0.0    -0.0    1.0
-c0
-4
-    115.0    45.0    30.0
-    105.0    45.0    30.0
-    110.0    40.0    30.0
-    115.0    45.0    30.0
-f1162 1
-    -0.0    -0.0    1.0
-c0
-4
-    105.0    45.0    30.0
-    115.0    45.0    30.0
-    110.0    50.0    30.0
-    105.0    45.0    30.0
-f1163 1
-    -0.0    -0.0    1.0
-c0
-4
-    105.0    55.0    30.0
-    105.0    45.0    30.0
-    110.0    50.0    30.0
-    105.0    55.0    30.0
-f1164 1
-    -0.0    -0.0    1.0
-c0
-4
-    105.0    45.0    30.0
-    105.0    55.0    30.0
-    100.0    50.0    30.0
-    105.0    45.0    30.0
-f1165 1
-    1.0    -0.0    -0.0
-c0
-4
-    90.0    120.0    33.0
-    90.0    110.0    33.0
-    90.0    110.0    30.0
-    90.0    120.0    33.0
-f1166 1
-    1.0    -0.0    -0.0
-c0
-4
-    90.0    120.0    33.0
-    90.0    110.0    30.0
-    90.0    120.0    30.0
-    90.0    120.0    33.0
-f1167 1
-    1.0    -0.0    -0.0
-c0
-4
-    90.0    130.0    33.0
-    90.0    120.0    30.0
-    90.0    130.0    30.0
-    90.0    130.0    33.0
-f1168 1
-    1.0    -0.0    -0.0
-c0
-4
-    90.0    130.0    33.0
-    90.0    120.0    33.0
-    90.0    120.0    30.0
-    90.0    130.0    33.0
-f1169 1
-    -0.0    1.0    -0.0
-c0
-4
-    90.0    130.0    30.0
-    80.0    130.0    33.0
-    90.0    130.0    33.0
-    90.0    130.0    30.0
-f1170 1
-    -0.0    1.0    -0.0
-c0
-4
-    80.0    130.0    30.0
-    80.0    130.0    33.0
-    90.0    130.0    30.0
-    80.0    130.0    30.0
-f1171 1
-    -0.0    1.0    -0.0
-c0
-4
-    70.0    130.0    30.0
-    70.0    130.0    33.0
-    80.0    130.0    33.0
-    70.0    130.0    30.0
-f1172 1
-    -0.0    1.0    -0.0
-c0
-4
-    70.0    130.0    30.0
-    80.0    130.0    33.0
-    80.0    130.0    30.0
-    70.0    130.0    30.0
-f1173 1
-    -1.0    0.0    0.0
-c0
-4
-    70.0    130.0    30.0
-    70.0    120.0    33.0
-    70.0    130.0    33.0
-    70.0    130.0    30.0
-f1174 1
-    -1.0    0.0    0.0
-c0
-4
-    70.0    130.0    30.0
-    70.0    120.0    30.0
-    70.0    120.0    33.0
-    70.0    130.0    30.0
-f1175 1
-    -1.0    0.0    0.0
-c0
-4
-    70.0    110.0    30.0
-    70.0    110.0    33.0
-    70.0    120.0    30.0
-    70.0    110.0    30.0
-f1176 1
-    -1.0    0.0    0.0
-c0
-4
-    70.0    120.0    30.0
-    70.0    110.0    33.0
-    70.0    120.0    33.0
-    70.0    120.0    30.0
-f1177 1
-    0.0    -1.0    0.0
-c0
-4
-    90.0    110.0    33.0
-    80.0    110.0    30.0
-    90.0    110.0    30.0
-    90.0    110.0    33.0
-f1178 1
-    0.0    -1.0    0.0
-c0
-4
-    80.0    110.0    33.0
-    80.0    110.0    30.0
-    90.0    110.0    33.0
-    80.0    110.0    33.0
-f1179 1
-    0.0    -1.0    0.0
-c0
-4
-    80.0    110.0    33.0
-    70.0    110.0    33.0
-    70.0    110.0    30.0
-    80.0    110.0    33.0
-f1180 1
-    0.0    -1.0    0.0
-c0
-4
-    80.0    110.0    33.0
-    70.0    110.0    30.0
-    80.0    110.0    30.0
-    80.0    110.0    33.0
-f1181 1
-    -0.0    1.0    -0.0
-c0
-4
-    130.0    90.0    36.0
-    130.0    90.0    33.0
-    120.0    90.0    36.0
-    130.0    90.0    36.0
-f1182 1
-    -0.0    1.0    -0.0
-c0
-4
-    120.0    90.0    36.0
-    130.0    90.0    33.0
-    120.0    90.0    33.0
-    120.0    90.0    36.0
-f1183 1
-    -0.0    1.0    -0.0
-c0
-4
-    110.0    90.0    36.0
-    120.0    90.0    33.0
-    110.0    90.0    33.0
-    110.0    90.0    36.0
-f1184 1
-    -0.0    1.0    -0.0
-c0
-4
-    110.0    90.0    36.0
-    120.0    90.0    36.0
-    120.0    90.0    33.0
-    110.0    90.0    36.0
-f1185 1
-    1.0    -0.0    -0.0
-c0
-4
-    130.0    80.0    36.0
-    130.0    90.0    33.0
-    130.0    90.0    36.0
-    130.0    80.0    36.0
-f1186 1
-    1.0    -0.0    -0.0
-c0
-4
-    130.0    80.0    36.0
-    130.0    80.0    33.0
-    130.0    90.0    33.0
-    130.0    80.0    36.0
-f1187 1
-    1.0    -0.0    -0.0
-c0
-4
-    130.0    70.0    36.0
-    130.0    70.0    33.0
-    130.0    80.0    33.0
-    130.0    70.0    36.0
-f1188 1
-    1.0    -0.0    -0.0
-c0
-4
-    130.0    80.0    36.0
-    130.0    70.0    36.0
-    130.0    80.0    33.0
-    130.0    80.0    36.0
-f1189 1
-    -1.0    0.0    0.0
-c0
-4
-    110.0    80.0    33.0
-    110.0    90.0    36.0
-    110.0    90.0    33.0
-    110.0    80.0    33.0
-f1190 1
-    -1.0    0.0    0.0
-c0
-4
-    110.0    80.0    33.0
-    110.0    80.0    36.0
-    110.0    90.0    36.0
-    110.0    80.0    33.0
-f1191 1
-    -1.0    0.0    0.0
-c0
-4
-    110.0    70.0    33.0
-    110.0    70.0    36.0
-    110.0    80.0    36.0
-    110.0    70.0    33.0
-f1192 1
-    -1.0    0.0    0.0
-c0
-4
-    110.0    70.0    33.0
-    110.0    80.0    36.0
-    110.0    80.0    33.0
-    110.0    70.0    33.0
-f1193 1
-    0.0    -1.0    0.0
-c0
-4
-    130.0    70.0    36.0
-    120.0    70.0    33.0
-    130.0    70.0    33.0
-    130.0    70.0    36.0
-f1194 1
-    0.0    -1.0    0.0
-c0
-4
-    120.0    70.0    36.0
-    120.0    70.0    33.0
-    130.0    70.0    36.0
-    120.0    70.0    36.0
-f1195 1
-    0.0    -1.0    0.0
-c0
-4
-    120.0    70.0    36.0
-    110.0    70.0    36.0
-    110.0    70.0    33.0
-    120.0    70.0    36.0
-f1196 1
-    0.0    -1.0    0.0
-c0
-4
-    120.0    70.0    36.0
-    110.0    70.0    33.0
-    120.0    70.0    33.0
-    120.0    70.0    36.0
-f1197 1
-    1.0    -0.0    -0.0
-c0
-4
-    50.0    115.0    36.0
-    50.0    125.0    33.0
-    50.0    125.0    36.0
-    50.0    115.0    36.0
-f1198 1
-    1.0    -0.0    -0.0
-c0
-4
-    50.0    115.0    36.0
-    50.0    115.0    33.0
-    50.0    125.0    33.0
-    50.0    115.0    36.0
-f1199 1
-    1.0    -0.0    -0.0
-c0
-4
-    50.0    105.0    36.0
-    50.0    105.0    33.0
-    50.0    115.0    33.0
-    50.0    105.0    36.0
-f1200 1
-    1.0    -0.0    -0.0
-c0
-4
-    50.0    115.0    36.0
-    50.0    105.0    36.0
-    50.0    115.0    33.0
-    50.0    115.0    36.0
-f1201 1
-    -0.0    1.0    -0.0
-c0
-4
-    50.0    125.0    33.0
-    40.0    125.0    36.0
-    50.0    125.0    36.0
-    50.0    125.0    33.0
-f1202 1
-    -0.0    1.0    -0.0
-c0
-4
-    40.0    125.0    33.0
-    40.0    125.0    36.0
-    50.0    125.0    33.0
-    40.0    125.0    33.0
-f1203 1
-    -0.0    1.0    -0.0
-c0
-4
-    40.0    125.0    33.0
-    30.0    125.0    33.0
-    30.0    125.0    36.0
-    40.0    125.0    33.0
-f1204 1
-    -0.0    1.0    -0.0
-c0
-4
-    40.0    125.0    33.0
-    30.0    125.0    36.0
-    40.0    125.0    36.0
-    40.0    125.0    33.0
-f1205 1
-    0.0    -1.0    0.0
-c0
-4
-    40.0    105.0    36.0
-    50.0    105.0    33.0
-    50.0    105.0    36.0
-    40.0    105.0    36.0
-f1206 1
-    0.0    -1.0    0.0
-c0
-4
-    40.0    105.0    36.0
-    40.0    105.0    33.0
-    50.0    105.0    33.0
-    40.0    105.0    36.0
-f1207 1
-    0.0    -1.0    0.0
-c0
-4
-    30.0    105.0    36.0
-    30.0    105.0    33.0
-    40.0    105.0    36.0
-    30.0    105.0    36.0
-f1208 1
-    0.0    -1.0    0.0
-c0
-4
-    40.0    105.0    36.0
-    30.0    105.0    33.0
-    40.0    105.0    33.0
-    40.0    105.0    36.0
-f1209 1
-    -1.0    0.0    0.0
-c0
-4
-    30.0    125.0    33.0
-    30.0    115.0    33.0
-    30.0    125.0    36.0
-    30.0    125.0    33.0
-f1210 1
-    -1.0    0.0    0.0
-c0
-4
-    30.0    105.0    33.0
-    30.0    105.0    36.0
-    30.0    115.0    36.0
-    30.0    105.0    33.0
-f1211 1
-    -1.0    0.0    0.0
-c0
-4
-    30.0    105.0    33.0
-    30.0    115.0    36.0
-    30.0    115.0    33.0
-    30.0    105.0    33.0
-f1212 1
-    -1.0    0.0    0.0
-c0
-4
-    30.0    115.0    33.0
-    30.0    115.0    36.0
-    30.0    125.0    36.0
-    30.0    115.0    33.0
-f1213 1
-    1.0    -0.0    -0.0
-c0
-4
-    90.0    130.0    36.0
-    90.0    120.0    33.0
-    90.0    130.0    33.0
-    90.0    130.0    36.0
-f1214 1
-    1.0    -0.0    -0.0
-c0
-4
-    90.0    110.0    36.0
-    90.0    110.0    33.0
-    90.0    120.0    36.0
-    90.0    110.0    36.0
-f1215 1
-    1.0    -0.0    -0.0
-c0
-4
-    90.0    120.0    36.0
-    90.0    110.0    33.0
-    90.0    120.0    33.0
-    90.0    120.0    36.0
-f1216 1
-    1.0    -0.0    -0.0
-c0
-4
-    90.0    120.0    36.0
-    90.0    120.0    33.0
-    90.0    130.0    36.0
-    90.0    120.0    36.0
-f1217 1
-    -0.0    1.0    -0.0
-c0
-4
-    90.0    130.0    33.0
-    80.0    130.0    33.0
-    90.0    130.0    36.0
-    90.0    130.0    33.0
-f1218 1
-    -0.0    1.0    -0.0
-c0
-4
-    70.0    130.0    33.0
-    70.0    130.0    36.0
-    80.0    130.0    33.0
-    70.0    130.0    33.0
-f1219 1
-    -0.0    1.0    -0.0
-c0
-4
-    80.0    130.0    33.0
-    80.0    130.0    36.0
-    90.0    130.0    36.0
-    80.0    130.0    33.0
-f1220 1
-    -0.0    1.0    -0.0
-c0
-4
-    80.0    130.0    33.0
-    70.0    130.0    36.0
-    80.0    130.0    36.0
-    80.0    130.0    33.0
-f1221 1
-    -1.0    0.0    0.0
-c0
-4
-    70.0    120.0    33.0
-    70.0    130.0    36.0
-    70.0    130.0    33.0
-    70.0    120.0    33.0
-f1222 1
-    -1.0    0.0    0.0
-c0
-4
-    70.0    110.0    33.0
-    70.0    110.0    36.0
-    70.0    120.0    36.0
-    70.0    110.0    33.0
-f1223 1
-    -1.0    0.0    0.0
-c0
-4
-    70.0    120.0    33.0
-    70.0    110.0    33.0
-    70.0    120.0    36.0
-    70.0    120.0    33.0
-f1224 1
-    -1.0    0.0    0.0
-c0
-4
-    70.0    120.0    33.0
-    70.0    120.0    36.0
-    70.0    130.0    36.0
-    70.0    120.0    33.0
-f1225 1
-    0.0    -1.0    0.0
-c0
-4
-    80.0    110.0    36.0
-    90.0    110.0    33.0
-    90.0    110.0    36.0
-    80.0    110.0    36.0
-f1226 1
-    0.0    -1.0    0.0
-c0
-4
-    80.0    110.0    36.0
-    80.0    110.0    33.0
-    90.0    110.0    33.0
-    80.0    110.0    36.0
-f1227 1
-    0.0    -1.0    0.0
-c0
-4
-    70.0    110.0    36.0
-    70.0    110.0    33.0
-    80.0    110.0    33.0
-    70.0    110.0    36.0
-f1228 1
-    0.0    -1.0    0.0
-c0
-4
-    80.0    110.0    36.0
-    70.0    110.0    36.0
-    80.0    110.0    33.0
-    80.0    110.0    36.0
-f1229 1
-    -0.0    1.0    -0.0
-c0
-4
-    120.0    90.0    36.0
-    130.0    90.0    39.0
-    130.0    90.0    36.0
-    120.0    90.0    36.0
-f1230 1
-    -0.0    1.0    -0.0
-c0
-4
-    110.0    90.0    36.0
-    110.0    90.0    39.0
-    120.0    90.0    39.0
-    110.0    90.0    36.0
-f1231 1
-    -0.0    1.0    -0.0
-c0
-4
-    120.0    90.0    36.0
-    110.0    90.0    36.0
-    120.0    90.0    39.0
-    120.0    90.0    36.0
-f1232 1
-    -0.0    1.0    -0.0
-c0
-4
-    120.0    90.0    36.0
-    120.0    90.0    39.0
-    130.0    90.0    39.0
-    120.0    90.0    36.0
-f1233 1
-    1.0    -0.0    -0.0
-c0
-4
-    130.0    90.0    39.0
-    130.0    80.0    36.0
-    130.0    90.0    36.0
-    130.0    90.0    39.0
-f1234 1
-    1.0    -0.0    -0.0
-c0
-4
-    130.0    70.0    39.0
-    130.0    70.0    36.0
-    130.0    80.0    36.0
-    130.0    70.0    39.0
-f1235 1
-    1.0    -0.0    -0.0
-c0
-4
-    130.0    80.0    39.0
-    130.0    80.0    36.0
-    130.0    90.0    39.0
-    130.0    80.0    39.0
-f1236 1
-    1.0    -0.0    -0.0
-c0
-4
-    130.0    80.0    39.0
-    130.0    70.0    39.0
-    130.0    80.0    36.0
-    130.0    80.0    39.0
-f1237 1
-    -1.0    0.0    0.0
-c0
-4
-    110.0    80.0    36.0
-    110.0    90.0    39.0
-    110.0    90.0    36.0
-    110.0    80.0    36.0
-f1238 1
-    -1.0    0.0    0.0
-c0
-4
-    110.0    80.0    36.0
-    110.0    70.0    36.0
-    110.0    70.0    39.0
-    110.0    80.0    36.0
-f1239 1
-    -1.0    0.0    0.0
-c0
-4
-    110.0    80.0    36.0
-    110.0    80.0    39.0
-    110.0    90.0    39.0
-    110.0    80.0    36.0
-f1240 1
-    -1.0    0.0    0.0
-c0
-4
-    110.0    80.0    36.0
-    110.0    70.0    39.0
-    110.0    80.0    39.0
-    110.0    80.0    36.0
-f1241 1
-    0.0    -1.0    0.0
-c0
-4
-    120.0    70.0    39.0
-    130.0    70.0    36.0
-    130.0    70.0    39.0
-    120.0    70.0    39.0
-f1242 1
-    0.0    -1.0    0.0
-c0
-4
-    120.0    70.0    39.0
-    120.0    70.0    36.0
-    130.0    70.0    36.0
-    120.0    70.0    39.0
-f1243 1
-    0.0    -1.0    0.0
-c0
-4
-    110.0    70.0    39.0
-    110.0    70.0    36.0
-    120.0    70.0    39.0
-    110.0    70.0    39.0
-f1244 1
-    0.0    -1.0    0.0
-c0
-4
-    120.0    70.0    39.0
-    110.0    70.0    36.0
-    120.0    70.0    36.0
-    120.0    70.0    39.0
-f1245 1
-    1.0    -0.0    -0.0
-c0
-4
-    50.0    115.0    39.0
-    50.0    125.0    36.0
-    50.0    125.0    39.0
-    50.0    115.0    39.0
-f1246 1
-    1.0    -0.0    -0.0
-c0
-4
-    50.0    115.0    39.0
-    50.0    115.0    36.0
-    50.0    125.0    36.0
-    50.0    115.0    39.0
-f1247 1
-    1.0    -0.0    -0.0
-c0
-4
-    50.0    105.0    39.0
-    50.0    105.0    36.0
-    50.0    115.0    36.0
-    50.0    105.0    39.0
-f1248 1
-    1.0    -0.0    -0.0
-c0
-4
-    50.0    115.0    39.0
-    50.0    105.0    39.0
-    50.0    115.0    36.0
-    50.0    115.0    39.0
-f1249 1
-    -0.0    1.0    -0.0
-c0
-4
-    50.0    125.0    36.0
-    40.0    125.0    39.0
-    50.0    125.0    39.0
-    50.0    125.0    36.0
-f1250 1
-    -0.0    1.0    -0.0
-c0
-4
-    40.0    125.0    36.0
-    40.0    125.0    39.0
-    50.0    125.0    36.0
-    40.0    125.0    36.0
-f1251 1
-    -0.0    1.0    -0.0
-c0
-4
-    40.0    125.0    36.0
-    30.0    125.0    36.0
-    30.0    125.0    39.0
-    40.0    125.0    36.0
-f1252 1
-    -0.0    1.0    -0.0
-c0
-4
-    40.0    125.0    36.0
-    30.0    125.0    39.0
-    40.0    125.0    39.0
-    40.0    125.0    36.0
-f1253 1
-    0.0    -1.0    0.0
-c0
-4
-    50.0    105.0    39.0
-    40.0    105.0    36.0
-    50.0    105.0    36.0
-    50.0    105.0    39.0
-f1254 1
-    0.0    -1.0    0.0
-c0
-4
-    30.0    105.0    39.0
-    30.0    105.0    36.0
-    40.0    105.0    39.0
-    30.0    105.0    39.0
-f1255 1
-    0.0    -1.0    0.0
-c0
-4
-    40.0    105.0    39.0
-    30.0    105.0    36.0
-    40.0    105.0    36.0
-    40.0    105.0    39.0
-f1256 1
-    0.0    -1.0    0.0
-c0
-4
-    40.0    105.0    39.0
-    40.0    105.0    36.0
-    50.0    105.0    39.0
-    40.0    105.0    39.0
-f1257 1
-    -1.0    0.0    0.0
-c0
-4
-    30.0    125.0    39.0
-    30.0    125.0    36.0
-    30.0    115.0    36.0
-    30.0    125.0    39.0
-f1258 1
-    -1.0    0.0    0.0
-c0
-4
-    30.0    105.0    39.0
-    30.0    115.0    39.0
-    30.0    105.0    36.0
-    30.0    105.0    39.0
-f1259 1
-    -1.0    0.0    0.0
-c0
-4
-    30.0    115.0    39.0
-    30.0    115.0    36.0
-    30.0    105.0    36.0
-    30.0    115.0    39.0
-f1260 1
-    -1.0    0.0    0.0
-c0
-4
-    30.0    115.0    39.0
-    30.0    125.0    39.0
-    30.0    115.0    36.0
-    30.0    115.0    39.0
-f1261 1
-    -0.0    -0.0    1.0
-c0
-4
-    85.0    125.0    36.0
-    90.0    120.0    36.0
-    90.0    130.0    36.0
-    85.0    125.0    36.0
-f1262 1
-    -0.0    -0.0    1.0
-c0
-4
-    85.0    125.0    36.0
-    90.0    130.0    36.0
-    80.0    130.0    36.0
-    85.0    125.0    36.0
-f1263 1
-    -0.0    -0.0    1.0
-c0
-4
-    85.0    115.0    36.0
-    90.0    110.0    36.0
-    90.0    120.0    36.0
-    85.0    115.0    36.0
-f1264 1
-    -0.0    -0.0    1.0
-c0
-4
-    85.0    115.0    36.0
-    80.0    110.0    36.0
-    90.0    110.0    36.0
-    85.0    115.0    36.0
-f1265 1
-    -0.0    -0.0    1.0
-c0
-4
-    75.0    125.0    36.0
-    80.0    130.0    36.0
-    70.0    130.0    36.0
-    75.0    125.0    36.0
-f1266 1
-    -0.0    -0.0    1.0
-c0
-4
-    75.0    125.0    36.0
-    70.0    130.0    36.0
-    70.0    120.0    36.0
-    75.0    125.0    36.0
-f1267 1
-    -0.0    -0.0    1.0
-c0
-4
-    75.0    115.0    36.0
-    70.0    120.0    36.0
-    70.0    110.0    36.0
-    75.0    115.0    36.0
-f1268 1
-    -0.0    -0.0    1.0
-c0
-4
-    75.0    115.0    36.0
-    70.0    110.0    36.0
-    80.0    110.0    36.0
-    75.0    115.0    36.0
-f1269 1
-    -0.0    -0.0    1.0
-c0
-4
-    85.0    125.0    36.0
-    80.0    120.0    36.0
-    90.0    120.0    36.0
-    85.0    125.0    36.0
-f1270 1
-    -0.0    -0.0    1.0
-c0
-4
-    85.0    115.0    36.0
-    90.0    120.0    36.0
-    80.0    120.0    36.0
-    85.0    115.0    36.0
-f1271 1
-    -0.0    -0.0    1.0
-c0
-4
-    85.0    125.0    36.0
-    80.0    130.0    36.0
-    80.0    120.0    36.0
-    85.0    125.0    36.0
-f1272 1
-    -0.0    -0.0    1.0
-c0
-4
-    75.0    125.0    36.0
-    80.0    120.0    36.0
-    80.0    130.0    36.0
-    75.0    125.0    36.0
-f1273 1
-    -0.0    -0.0    1.0
-c0
-4
-    75.0    125.0    36.0
-    70.0    120.0    36.0
-    80.0    120.0    36.0
-    75.0    125.0    36.0
-f1274 1
-    -0.0    -0.0    1.0
-c0
-4
-    75.0    115.0    36.0
-    80.0    120.0    36.0
-    70.0    120.0    36.0
-    75.0    115.0    36.0
-f1275 1
-    -0.0    -0.0    1.0
-c0
-4
-    85.0    115.0    36.0
-    80.0    120.0    36.0
-    80.0    110.0    36.0
-    85.0    115.0    36.0
-f1276 1
-    -0.0    -0.0    1.0
-c0
-4
-    75.0    115.0    36.0
-    80.0    110.0    36.0
-    80.0    120.0    36.0
-    75.0    115.0    36.0
-f1277 1
-    -0.0    1.0    -0.0
-c0
-4
-    110.0    90.0    39.0
-    110.0    90.0    42.0
-    120.0    90.0    42.0
-    110.0    90.0    39.0
-f1278 1
-    -0.0    1.0    -0.0
-c0
-4
-    120.0    90.0    39.0
-    110.0    90.0    39.0
-    120.0    90.0    42.0
-    120.0    90.0    39.0
-f1279 1
-    -0.0    1.0    -0.0
-c0
-4
-    120.0    90.0    39.0
-    130.0    90.0    42.0
-    130.0    90.0    39.0
-    120.0    90.0    39.0
-f1280 1
-    -0.0    1.0    -0.0
-c0
-4
-    120.0    90.0    39.0
-    120.0    90.0    42.0
-    130.0    90.0    42.0
-    120.0    90.0    39.0
-f1281 1
-    1.0    -0.0    -0.0
-c0
-4
-    130.0    90.0    42.0
-    130.0    80.0    39.0
-    130.0    90.0    39.0
-    130.0    90.0    42.0
-f1282 1
-    1.0    -0.0    -0.0
-c0
-4
-    130.0    70.0    42.0
-    130.0    70.0    39.0
-    130.0    80.0    39.0
-    130.0    70.0    42.0
-f1283 1
-    1.0    -0.0    -0.0
-c0
-4
-    130.0    80.0    42.0
-    130.0    80.0    39.0
-    130.0    90.0    42.0
-    130.0    80.0    42.0
-f1284 1
-    1.0    -0.0    -0.0
-c0
-4
-    130.0    80.0    42.0
-    130.0    70.0    42.0
-    130.0    80.0    39.0
-    130.0    80.0    42.0
-f1285 1
-    -1.0    0.0    0.0
-c0
-4
-    110.0    90.0    42.0
-    110.0    90.0    39.0
-    110.0    80.0    39.0
-    110.0    90.0    42.0
-f1286 1
-    -1.0    0.0    0.0
-c0
-4
-    110.0    70.0    42.0
-    110.0    80.0    39.0
-    110.0    70.0    39.0
-    110.0    70.0    42.0
-f1287 1
-    -1.0    0.0    0.0
-c0
-4
-    110.0    90.0    42.0
-    110.0    80.0    39.0
-    110.0    80.0    42.0
-    110.0    90.0    42.0
-f1288 1
-    -1.0    0.0    0.0
-c0
-4
-    110.0    70.0    42.0
-    110.0    80.0    42.0
-    110.0    80.0    39.0
-    110.0    70.0    42.0
-f1289 1
-    0.0    -1.0    0.0
-c0
-4
-    120.0    70.0    42.0
-    130.0    70.0    39.0
-    130.0    70.0    42.0
-    120.0    70.0    42.0
-f1290 1
-    0.0    -1.0    0.0
-c0
-4
-    120.0    70.0    42.0
-    120.0    70.0    39.0
-    130.0    70.0    39.0
-    120.0    70.0    42.0
-f1291 1
-    0.0    -1.0    0.0
-c0
-4
-    110.0    70.0    42.0
-    110.0    70.0    39.0
-    120.0    70.0    42.0
-    110.0    70.0    42.0
-f1292 1
-    0.0    -1.0    0.0
-c0
-4
-    120.0    70.0    42.0
-    110.0    70.0    39.0
-    120.0    70.0    39.0
-    120.0    70.0    42.0
-f1293 1
-    1.0    -0.0    -0.0
-c0
-4
-    50.0    125.0    42.0
-    50.0    115.0    42.0
-    50.0    125.0    39.0
-    50.0    125.0    42.0
-f1294 1
-    1.0    -0.0    -0.0
-c0
-4
-    50.0    115.0    42.0
-    50.0    115.0    39.0
-    50.0    125.0    39.0
-    50.0    115.0    42.0
-f1295 1
-    1.0    -0.0    -0.0
-c0
-4
-    50.0    105.0    42.0
-    50.0    105.0    39.0
-    50.0    115.0    39.0
-    50.0    105.0    42.0
-f1296 1
-    1.0    -0.0    -0.0
-c0
-4
-    50.0    115.0    42.0
-    50.0    105.0    42.0
-    50.0    115.0    39.0
-    50.0    115.0    42.0
-f1297 1
-    -0.0    1.0    -0.0
-c0
-4
-    40.0    125.0    39.0
-    50.0    125.0    42.0
-    50.0    125.0    39.0
-    40.0    125.0    39.0
-f1298 1
-    -0.0    1.0    -0.0
-c0
-4
-    30.0    125.0    39.0
-    30.0    125.0    42.0
-    40.0    125.0    42.0
-    30.0    125.0    39.0
-f1299 1
-    -0.0    1.0    -0.0
-c0
-4
-    40.0    125.0    39.0
-    30.0    125.0    39.0
-    40.0    125.0    42.0
-    40.0    125.0    39.0
-f1300 1
-    -0.0    1.0    -0.0
-c0
-4
-    40.0    125.0    39.0
-    40.0    125.0    42.0
-    50.0    125.0    42.0
-    40.0    125.0    39.0
-f1301 1
-    0.0    -1.0    0.0
-c0
-4
-    40.0    105.0    42.0
-    50.0    105.0    39.0
-    50.0    105.0    42.0
-    40.0    105.0    42.0
-f1302 1
-    0.0    -1.0    0.0
-c0
-4
-    40.0    105.0    42.0
-    40.0    105.0    39.0
-    50.0    105.0    39.0
-    40.0    105.0    42.0
-f1303 1
-    0.0    -1.0    0.0
-c0
-4
-    30.0    105.0    42.0
-    30.0    105.0    39.0
-    40.0    105.0    42.0
-    30.0    105.0    42.0
-f1304 1
-    0.0    -1.0    0.0
-c0
-4
-    40.0    105.0    42.0
-    30.0    105.0    39.0
-    40.0    105.0    39.0
-    40.0    105.0    42.0
-f1305 1
-    -1.0    0.0    0.0
-c0
-4
-    30.0    125.0    39.0
-    30.0    115.0    42.0
-    30.0    125.0    42.0
-    30.0    125.0    39.0
-f1306 1
-    -1.0    0.0    0.0
-c0
-4
-    30.0    115.0    39.0
-    30.0    115.0    42.0
-    30.0    125.0    39.0
-    30.0    115.0    39.0
-f1307 1
-    -1.0    0.0    0.0
-c0
-4
-    30.0    115.0    39.0
-    30.0    105.0    39.0
-    30.0    105.0    42.0
-    30.0    115.0    39.0
-f1308 1
-    -1.0    0.0    0.0
-c0
-4
-    30.0    115.0    39.0
-    30.0    105.0    42.0
-    30.0    115.0    42.0
-    30.0    115.0    39.0
-f1309 1
-    -0.0    -0.0    1.0
-c0
-4
-    115.0    85.0    42.0
-    120.0    90.0    42.0
-    110.0    90.0    42.0
-    115.0    85.0    42.0
-f1310 1
-    -0.0    -0.0    1.0
-c0
-4
-    115.0    85.0    42.0
-    110.0    90.0    42.0
-    110.0    80.0    42.0
-    115.0    85.0    42.0
-f1311 1
-    -0.0    -0.0    1.0
-c0
-4
-    125.0    85.0    42.0
-    130.0    90.0    42.0
-    120.0    90.0    42.0
-    125.0    85.0    42.0
-f1312 1
-    -0.0    -0.0    1.0
-c0
-4
-    125.0    85.0    42.0
-    130.0    80.0    42.0
-    130.0    90.0    42.0
-    125.0    85.0    42.0
-f1313 1
-    -0.0    -0.0    1.0
-c0
-4
-    125.0    75.0    42.0
-    130.0    70.0    42.0
-    130.0    80.0    42.0
-    125.0    75.0    42.0
-f1314 1
-    -0.0    -0.0    1.0
-c0
-4
-    125.0    75.0    42.0
-    120.0    70.0    42.0
-    130.0    70.0    42.0
-    125.0    75.0    42.0
-f1315 1
-    -0.0    -0.0    1.0
-c0
-4
-    115.0    75.0    42.0
-    110.0    80.0    42.0
-    110.0    70.0    42.0
-    115.0    75.0    42.0
-f1316 1
-    -0.0    -0.0    1.0
-c0
-4
-    115.0    75.0    42.0
-    110.0    70.0    42.0
-    120.0    70.0    42.0
-    115.0    75.0    42.0
-f1317 1
-    -0.0    -0.0    1.0
-c0
-4
-    115.0    85.0    42.0
-    120.0    80.0    42.0
-    120.0    90.0    42.0
-    115.0    85.0    42.0
-f1318 1
-    -0.0    -0.0    1.0
-c0
-4
-    125.0    85.0    42.0
-    120.0    90.0    42.0
-    120.0    80.0    42.0
-    125.0    85.0    42.0
-f1319 1
-    -0.0    -0.0    1.0
-c0
-4
-    125.0    85.0    42.0
-    120.0    80.0    42.0
-    130.0    80.0    42.0
-    125.0    85.0    42.0
-f1320 1
-    -0.0    -0.0    1.0
-c0
-4
-    125.0    75.0    42.0
-    130.0    80.0    42.0
-    120.0    80.0    42.0
-    125.0    75.0    42.0
-f1321 1
-    -0.0    -0.0    1.0
-c0
-4
-    115.0    85.0    42.0
-    110.0    80.0    42.0
-    120.0    80.0    42.0
-    115.0    85.0    42.0
-f1322 1
-    -0.0    -0.0    1.0
-c0
-4
-    115.0    75.0    42.0
-    120.0    80.0    42.0
-    110.0    80.0    42.0
-    115.0    75.0    42.0
-f1323 1
-    -0.0    -0.0    1.0
-c0
-4
-    125.0    75.0    42.0
-    120.0    80.0    42.0
-    120.0    70.0    42.0
-    125.0    75.0    42.0
-f1324 1
-    -0.0    -0.0    1.0
-c0
-4
-    115.0    75.0    42.0
-    120.0    70.0    42.0
-    120.0    80.0    42.0
-    115.0    75.0    42.0
-f1325 1
-    -0.0    -0.0    1.0
-c0
-4
-    45.0    120.0    42.0
-    50.0    115.0    42.0
-    50.0    125.0    42.0
-    45.0    120.0    42.0
-f1326 1
-    -0.0    -0.0    1.0
-c0
-4
-    45.0    120.0    42.0
-    50.0    125.0    42.0
-    40.0    125.0    42.0
-    45.0    120.0    42.0
-f1327 1
-    -0.0    -0.0    1.0
-c0
-4
-    45.0    110.0    42.0
-    50.0    105.0    42.0
-    50.0    115.0    42.0
-    45.0    110.0    42.0
-f1328 1
-    -0.0    -0.0    1.0
-c0
-4
-    45.0    110.0    42.0
-    40.0    105.0    42.0
-    50.0    105.0    42.0
-    45.0    110.0    42.0
-f1329 1
-    -0.0    -0.0    1.0
-c0
-4
-    35.0    120.0    42.0
-    40.0    125.0    42.0
-    30.0    125.0    42.0
-    35.0    120.0    42.0
-f1330 1
-    -0.0    -0.0    1.0
-c0
-4
-    35.0    120.0    42.0
-    30.0    125.0    42.0
-    30.0    115.0    42.0
-    35.0    120.0    42.0
-f1331 1
-    -0.0    -0.0    1.0
-c0
-4
-    35.0    110.0    42.0
-    30.0    105.0    42.0
-    40.0    105.0    42.0
-    35.0    110.0    42.0
-f1332 1
-    -0.0    -0.0    1.0
-c0
-4
-    35.0    110.0    42.0
-    30.0    115.0    42.0
-    30.0    105.0    42.0
-    35.0    110.0    42.0
-f1333 1
-    -0.0    -0.0    1.0
-c0
-4
-    45.0    120.0    42.0
-    40.0    115.0    42.0
-    50.0    115.0    42.0
-    45.0    120.0    42.0
-f1334 1
-    -0.0    -0.0    1.0
-c0
-4
-    45.0    110.0    42.0
-    50.0    115.0    42.0
-    40.0    115.0    42.0
-    45.0    110.0    42.0
-f1335 1
-    -0.0    -0.0    1.0
-c0
-4
-    45.0    120.0    42.0
-    40.0    125.0    42.0
-    40.0    115.0    42.0
-    45.0    120.0    42.0
-f1336 1
-    -0.0    -0.0    1.0
-c0
-4
-    35.0    120.0    42.0
-    40.0    115.0    42.0
-    40.0    125.0    42.0
-    35.0    120.0    42.0
-f1337 1
-    -0.0    -0.0    1.0
-c0
-4
-    45.0    110.0    42.0
-    40.0    115.0    42.0
-    40.0    105.0    42.0
-    45.0    110.0    42.0
-f1338 1
-    -0.0    -0.0    1.0
-c0
-4
-    35.0    110.0    42.0
-    40.0    105.0    42.0
-    40.0    115.0    42.0
-    35.0    110.0    42.0
-f1339 1
-    -0.0    -0.0    1.0
-c0
-4
-    35.0    120.0    42.0
-    30.0    115.0    42.0
-    40.0    115.0    42.0
-    35.0    120.0    42.0
-f1340 1
-    -0.0    -0.0    1.0
-c0
-4
-    35.0    110.0    42.0
-    40.0    115.0    42.0
-    30.0    115.0    42.0
-    35.0    110.0    42.0
-f1341 1
-    1.0    -0.0    -0.0
-c0
-4
-    115.0    55.0    24.0
-    115.0    45.0    21.0
-    115.0    55.0    21.0
-    115.0    55.0    24.0
-f1342 1
-    1.0    -0.0    -0.0
-c0
-4
-    115.0    35.0    24.0
-    115.0    35.0    21.0
-    115.0    45.0    24.0
-    115.0    35.0    24.0
-f1343 1
-    1.0    -0.0    -0.0
-c0
-4
-    115.0    45.0    24.0
-    115.0    35.0    21.0
-    115.0    45.0    21.0
-    115.0    45.0    24.0
-f1344 1
-    1.0    -0.0    -0.0
-c0
-4
-    115.0    45.0    24.0
-    115.0    45.0    21.0
-    115.0    55.0    24.0
-    115.0    45.0    24.0
-f1345 1
-    1.0    -0.0    -0.0
-c0
-4
-    90.0    130.0    24.0
-    90.0    120.0    24.0
-    90.0    130.0    21.0
-    90.0    130.0    24.0
-f1346 1
-    1.0    -0.0    -0.0
-c0
-4
-    90.0    120.0    24.0
-    90.0    120.0    21.0
-    90.0    130.0    21.0
-    90.0    120.0    24.0
-f1347 1
-    1.0    -0.0    -0.0
-c0
-4
-    90.0    110.0    24.0
-    90.0    110.0    21.0
-    90.0    120.0    21.0
-    90.0    110.0    24.0
-f1348 1
-    1.0    -0.0    -0.0
-c0
-4
-    90.0    110.0    24.0
-    90.0    120.0    21.0
-    90.0    120.0    24.0
-    90.0    110.0    24.0
-f1349 1
-    -0.0    1.0    -0.0
-c0
-4
-    90.0    130.0    21.0
-    80.0    130.0    24.0
-    90.0    130.0    24.0
-    90.0    130.0    21.0
-f1350 1
-    -0.0    1.0    -0.0
-c0
-4
-    90.0    130.0    21.0
-    80.0    130.0    21.0
-    80.0    130.0    24.0
-    90.0    130.0    21.0
-f1351 1
-    -0.0    1.0    -0.0
-c0
-4
-    80.0    130.0    21.0
-    70.0    130.0    21.0
-    70.0    130.0    24.0
-    80.0    130.0    21.0
-f1352 1
-    -0.0    1.0    -0.0
-c0
-4
-    80.0    130.0    21.0
-    70.0    130.0    24.0
-    80.0    130.0    24.0
-    80.0    130.0    21.0
-f1353 1
-    -1.0    0.0    0.0
-c0
-4
-    70.0    130.0    21.0
-    70.0    120.0    24.0
-    70.0    130.0    24.0
-    70.0    130.0    21.0
-f1354 1
-    -1.0    0.0    0.0
-c0
-4
-    70.0    130.0    21.0
-    70.0    120.0    21.0
-    70.0    120.0    24.0
-    70.0    130.0    21.0
-f1355 1
-    -1.0    0.0    0.0
-c0
-4
-    70.0    110.0    21.0
-    70.0    110.0    24.0
-    70.0    120.0    21.0
-    70.0    110.0    21.0
-f1356 1
-    -1.0    0.0    0.0
-c0
-4
-    70.0    120.0    21.0
-    70.0    110.0    24.0
-    70.0    120.0    24.0
-    70.0    120.0    21.0
-f1357 1
-    0.0    -1.0    0.0
-c0
-4
-    90.0    110.0    24.0
-    80.0    110.0    21.0
-    90.0    110.0    21.0
-    90.0    110.0    24.0
-f1358 1
-    0.0    -1.0    0.0
-c0
-4
-    80.0    110.0    24.0
-    70.0    110.0    24.0
-    70.0    110.0    21.0
-    80.0    110.0    24.0
-f1359 1
-    0.0    -1.0    0.0
-c0
-4
-    80.0    110.0    24.0
-    70.0    110.0    21.0
-    80.0    110.0    21.0
-    80.0    110.0    24.0
-f1360 1
-    0.0    -1.0    0.0
-c0
-4
-    90.0    110.0    24.0
-    80.0    110.0    24.0
-    80.0    110.0    21.0
-    90.0    110.0    24.0
-f1361 1
-    -0.0    1.0    -0.0
-c0
-4
-    110.0    90.0    24.0
-    110.0    90.0    27.0
-    120.0    90.0    27.0
-    110.0    90.0    24.0
-f1362 1
-    -0.0    1.0    -0.0
-c0
-4
-    110.0    90.0    24.0
-    120.0    90.0    27.0
-    120.0    90.0    24.0
-    110.0    90.0    24.0
-f1363 1
-    -0.0    1.0    -0.0
-c0
-4
-    130.0    90.0    24.0
-    120.0    90.0    24.0
-    130.0    90.0    27.0
-    130.0    90.0    24.0
-f1364 1
-    -0.0    1.0    -0.0
-c0
-4
-    120.0    90.0    24.0
-    120.0    90.0    27.0
-    130.0    90.0    27.0
-    120.0    90.0    24.0
-f1365 1
-    1.0    -0.0    -0.0
-c0
-4
-    130.0    90.0    27.0
-    130.0    80.0    27.0
-    130.0    90.0    24.0
-    130.0    90.0    27.0
-f1366 1
-    1.0    -0.0    -0.0
-c0
-4
-    130.0    80.0    27.0
-    130.0    80.0    24.0
-    130.0    90.0    24.0
-    130.0    80.0    27.0
-f1367 1
-    1.0    -0.0    -0.0
-c0
-4
-    130.0    80.0    27.0
-    130.0    70.0    27.0
-    130.0    70.0    24.0
-    130.0    80.0    27.0
-f1368 1
-    1.0    -0.0    -0.0
-c0
-4
-    130.0    80.0    27.0
-    130.0    70.0    24.0
-    130.0    80.0    24.0
-    130.0    80.0    27.0
-f1369 1
-    -1.0    0.0    0.0
-c0
-4
-    110.0    90.0    24.0
-    110.0    80.0    24.0
-    110.0    90.0    27.0
-    110.0    90.0    24.0
-f1370 1
-    -1.0    0.0    0.0
-c0
-4
-    110.0    80.0    24.0
-    110.0    70.0    24.0
-    110.0    70.0    27.0
-    110.0    80.0    24.0
-f1371 1
-    -1.0    0.0    0.0
-c0
-4
-    110.0    80.0    24.0
-    110.0    80.0    27.0
-    110.0    90.0    27.0
-    110.0    80.0    24.0
-f1372 1
-    -1.0    0.0    0.0
-c0
-4
-    110.0    80.0    24.0
-    110.0    70.0    27.0
-    110.0    80.0    27.0
-    110.0    80.0    24.0
-f1373 1
-    0.0    -1.0    0.0
-c0
-4
-    130.0    70.0    27.0
-    120.0    70.0    24.0
-    130.0    70.0    24.0
-    130.0    70.0    27.0
-f1374 1
-    0.0    -1.0    0.0
-c0
-4
-    120.0    70.0    27.0
-    110.0    70.0    27.0
-    110.0    70.0    24.0
-    120.0    70.0    27.0
-f1375 1
-    0.0    -1.0    0.0
-c0
-4
-    120.0    70.0    27.0
-    110.0    70.0    24.0
-    120.0    70.0    24.0
-    120.0    70.0    27.0
-f1376 1
-    0.0    -1.0    0.0
-c0
-4
-    130.0    70.0    27.0
-    120.0    70.0    27.0
-    120.0    70.0    24.0
-    130.0    70.0    27.0
-f1377 1
-    -0.0    1.0    -0.0
-c0
-4
-    60.0    95.0    24.0
-    50.0    95.0    24.0
-    50.0    95.0    27.0
-    60.0    95.0    24.0
-f1378 1
-    -0.0    1.0    -0.0
-c0
-4
-    60.0    95.0    24.0
-    70.0    95.0    27.0
-    70.0    95.0    24.0
-    60.0    95.0    24.0
-f1379 1
-    -0.0    1.0    -0.0
-c0
-4
-    60.0    95.0    24.0
-    50.0    95.0    27.0
-    60.0    95.0    27.0
-    60.0    95.0    24.0
-f1380 1
-    -0.0    1.0    -0.0
-c0
-4
-    60.0    95.0    24.0
-    60.0    95.0    27.0
-    70.0    95.0    27.0
-    60.0    95.0    24.0
-f1381 1
-    1.0    -0.0    -0.0
-c0
-4
-    70.0    95.0    27.0
-    70.0    85.0    24.0
-    70.0    95.0    24.0
-    70.0    95.0    27.0
-f1382 1
-    1.0    -0.0    -0.0
-c0
-4
-    70.0    75.0    27.0
-    70.0    75.0    24.0
-    70.0    85.0    27.0
-    70.0    75.0    27.0
-f1383 1
-    1.0    -0.0    -0.0
-c0
-4
-    70.0    85.0    27.0
-    70.0    75.0    24.0
-    70.0    85.0    24.0
-    70.0    85.0    27.0
-f1384 1
-    1.0    -0.0    -0.0
-c0
-4
-    70.0    95.0    27.0
-    70.0    85.0    27.0
-    70.0    85.0    24.0
-    70.0    95.0    27.0
-f1385 1
-    -1.0    0.0    0.0
-c0
-4
-    50.0    95.0    24.0
-    50.0    85.0    27.0
-    50.0    95.0    27.0
-    50.0    95.0    24.0
-f1386 1
-    -1.0    0.0    0.0
-c0
-4
-    50.0    85.0    24.0
-    50.0    85.0    27.0
-    50.0    95.0    24.0
-    50.0    85.0    24.0
-f1387 1
-    -1.0    0.0    0.0
-c0
-4
-    50.0    75.0    24.0
-    50.0    75.0    27.0
-    50.0    85.0    27.0
-    50.0    75.0    24.0
-f1388 1
-    -1.0    0.0    0.0
-c0
-4
-    50.0    85.0    24.0
-    50.0    75.0    24.0
-    50.0    85.0    27.0
-    50.0    85.0    24.0
-f1389 1
-    0.0    -1.0    0.0
-c0
-4
-    70.0    75.0    27.0
-    60.0    75.0    24.0
-    70.0    75.0    24.0
-    70.0    75.0    27.0
-f1390 1
-    0.0    -1.0    0.0
-c0
-4
-    50.0    75.0    27.0
-    50.0    75.0    24.0
-    60.0    75.0    24.0
-    50.0    75.0    27.0
-f1391 1
-    0.0    -1.0    0.0
-c0
-4
-    60.0    75.0    27.0
-    60.0    75.0    24.0
-    70.0    75.0    27.0
-    60.0    75.0    27.0
-f1392 1
-    0.0    -1.0    0.0
-c0
-4
-    60.0    75.0    27.0
-    50.0    75.0    27.0
-    60.0    75.0    24.0
-    60.0    75.0    27.0
-f1393 1
-    1.0    -0.0    -0.0
-c0
-4
-    50.0    125.0    27.0
-    50.0    115.0    27.0
-    50.0    125.0    24.0
-    50.0    125.0    27.0
-f1394 1
-    1.0    -0.0    -0.0
-c0
-4
-    50.0    115.0    27.0
-    50.0    115.0    24.0
-    50.0    125.0    24.0
-    50.0    115.0    27.0
-f1395 1
-    1.0    -0.0    -0.0
-c0
-4
-    50.0    105.0    27.0
-    50.0    105.0    24.0
-    50.0    115.0    24.0
-    50.0    105.0    27.0
-f1396 1
-    1.0    -0.0    -0.0
-c0
-4
-    50.0    105.0    27.0
-    50.0    115.0    24.0
-    50.0    115.0    27.0
-    50.0    105.0    27.0
-f1397 1
-    -0.0    1.0    -0.0
-c0
-4
-    40.0    125.0    24.0
-    50.0    125.0    27.0
-    50.0    125.0    24.0
-    40.0    125.0    24.0
-f1398 1
-    -0.0    1.0    -0.0
-c0
-4
-    30.0    125.0    24.0
-    30.0    125.0    27.0
-    40.0    125.0    24.0
-    30.0    125.0    24.0
-f1399 1
-    -0.0    1.0    -0.0
-c0
-4
-    40.0    125.0    24.0
-    40.0    125.0    27.0
-    50.0    125.0    27.0
-    40.0    125.0    24.0
-f1400 1
-    -0.0    1.0    -0.0
-c0
-4
-    40.0    125.0    24.0
-    30.0    125.0    27.0
-    40.0    125.0    27.0
-    40.0    125.0    24.0
-f1401 1
-    0.0    -1.0    0.0
-c0
-4
-    40.0    105.0    27.0
-    50.0    105.0    24.0
-    50.0    105.0    27.0
-    40.0    105.0    27.0
-f1402 1
-    0.0    -1.0    0.0
-c0
-4
-    40.0    105.0    27.0
-    40.0    105.0    24.0
-    50.0    105.0    24.0
-    40.0    105.0    27.0
-f1403 1
-    0.0    -1.0    0.0
-c0
-4
-    40.0    105.0    27.0
-    30.0    105.0    27.0
-    30.0    105.0    24.0
-    40.0    105.0    27.0
-f1404 1
-    0.0    -1.0    0.0
-c0
-4
-    40.0    105.0    27.0
-    30.0    105.0    24.0
-    40.0    105.0    24.0
-    40.0    105.0    27.0
-f1405 1
-    -1.0    0.0    0.0
-c0
-4
-    30.0    125.0    24.0
-    30.0    115.0    27.0
-    30.0    125.0    27.0
-    30.0    125.0    24.0
-f1406 1
-    -1.0    0.0    0.0
-c0
-4
-    30.0    125.0    24.0
-    30.0    115.0    24.0
-    30.0    115.0    27.0
-    30.0    125.0    24.0
-f1407 1
-    -1.0    0.0    0.0
-c0
-4
-    30.0    105.0    24.0
-    30.0    105.0    27.0
-    30.0    115.0    27.0
-    30.0    105.0    24.0
-f1408 1
-    -1.0    0.0    0.0
-c0
-4
-    30.0    115.0    24.0
-    30.0    105.0    24.0
-    30.0    115.0    27.0
-    30.0    115.0    24.0
-f1409 1
-    1.0    -0.0    -0.0
-c0
-4
-    125.0    120.0    27.0
-    125.0    110.0    24.0
-    125.0    120.0    24.0
-    125.0    120.0    27.0
-f1410 1
-    1.0    -0.0    -0.0
-c0
-4
-    125.0    100.0    27.0
-    125.0    100.0    24.0
-    125.0    110.0    24.0
-    125.0    100.0    27.0
-f1411 1
-    1.0    -0.0    -0.0
-c0
-4
-    125.0    110.0    27.0
-    125.0    110.0    24.0
-    125.0    120.0    27.0
-    125.0    110.0    27.0
-f1412 1
-    1.0    -0.0    -0.0
-c0
-4
-    125.0    100.0    27.0
-    125.0    110.0    24.0
-    125.0    110.0    27.0
-    125.0    100.0    27.0
-f1413 1
-    -0.0    1.0    -0.0
-c0
-4
-    125.0    120.0    24.0
-    115.0    120.0    24.0
-    125.0    120.0    27.0
-    125.0    120.0    24.0
-f1414 1
-    -0.0    1.0    -0.0
-c0
-4
-    105.0    120.0    24.0
-    105.0    120.0    27.0
-    115.0    120.0    27.0
-    105.0    120.0    24.0
-f1415 1
-    -0.0    1.0    -0.0
-c0
-4
-    105.0    120.0    24.0
-    115.0    120.0    27.0
-    115.0    120.0    24.0
-    105.0    120.0    24.0
-f1416 1
-    -0.0    1.0    -0.0
-c0
-4
-    115.0    120.0    24.0
-    115.0    120.0    27.0
-    125.0    120.0    27.0
-    115.0    120.0    24.0
-f1417 1
-    0.0    -1.0    0.0
-c0
-4
-    115.0    100.0    27.0
-    125.0    100.0    24.0
-    125.0    100.0    27.0
-    115.0    100.0    27.0
-f1418 1
-    0.0    -1.0    0.0
-c0
-4
-    115.0    100.0    27.0
-    115.0    100.0    24.0
-    125.0    100.0    24.0
-    115.0    100.0    27.0
-f1419 1
-    0.0    -1.0    0.0
-c0
-4
-    105.0    100.0    27.0
-    105.0    100.0    24.0
-    115.0    100.0    24.0
-    105.0    100.0    27.0
-f1420 1
-    0.0    -1.0    0.0
-c0
-4
-    115.0    100.0    27.0
-    105.0    100.0    27.0
-    115.0    100.0    24.0
-    115.0    100.0    27.0
-f1421 1
-    -1.0    0.0    0.0
-c0
-4
-    105.0    120.0    24.0
-    105.0    110.0    27.0
-    105.0    120.0    27.0
-    105.0    120.0    24.0
-f1422 1
-    -1.0    0.0    0.0
-c0
-4
-    105.0    120.0    24.0
-    105.0    110.0    24.0
-    105.0    110.0    27.0
-    105.0    120.0    24.0
-f1423 1
-    -1.0    0.0    0.0
-c0
-4
-    105.0    100.0    24.0
-    105.0    100.0    27.0
-    105.0    110.0    24.0
-    105.0    100.0    24.0
-f1424 1
-    -1.0    0.0    0.0
-c0
-4
-    105.0    110.0    24.0
-    105.0    100.0    27.0
-    105.0    110.0    27.0
-    105.0    110.0    24.0
-f1425 1
-    -0.0    -0.0    1.0
-c0
-4
-    65.0    60.0    24.0
-    65.0    50.0    24.0
-    70.0    55.0    24.0
-    65.0    60.0    24.0
-f1426 1
-    -0.0    -0.0    1.0
-c0
-4
-    85.0    50.0    24.0
-    85.0    60.0    24.0
-    80.0    55.0    24.0
-    85.0    50.0    24.0
-f1427 1
-    -0.0    -0.0    1.0
-c0
-4
-    85.0    70.0    24.0
-    75.0    70.0    24.0
-    80.0    65.0    24.0
-    85.0    70.0    24.0
-f1428 1
-    -0.0    -0.0    1.0
-c0
-4
-    75.0    70.0    24.0
-    65.0    70.0    24.0
-    70.0    65.0    24.0
-    75.0    70.0    24.0
-f1429 1
-    -0.0    -0.0    1.0
-c0
-4
-    75.0    60.0    24.0
-    85.0    60.0    24.0
-    80.0    65.0    24.0
-    75.0    60.0    24.0
-f1430 1
-    -0.0    -0.0    1.0
-c0
-4
-    65.0    60.0    24.0
-    75.0    60.0    24.0
-    70.0    65.0    24.0
-    65.0    60.0    24.0
-f1431 1
-    -0.0    -0.0    1.0
-c0
-4
-    85.0    60.0    24.0
-    75.0    60.0    24.0
-    80.0    55.0    24.0
-    85.0    60.0    24.0
-f1432 1
-    -0.0    -0.0    1.0
-c0
-4
-    75.0    60.0    24.0
-    65.0    60.0    24.0
-    70.0    55.0    24.0
-    75.0    60.0    24.0
-f1433 1
-    -0.0    -0.0    1.0
-c0
-4
-    75.0    70.0    24.0
-    75.0    60.0    24.0
-    80.0    65.0    24.0
-    75.0    70.0    24.0
-f1434 1
-    -0.0    -0.0    1.0
-c0
-4
-    75.0    60.0    24.0
-    75.0    70.0    24.0
-    70.0    65.0    24.0
-    75.0    60.0    24.0
-f1435 1
-    -0.0    -0.0    1.0
-c0
-4
-    75.0    50.0    24.0
-    85.0    50.0    24.0
-    80.0    55.0    24.0
-    75.0    50.0    24.0
-f1436 1
-    -0.0    -0.0    1.0
-c0
-4
-    65.0    50.0    24.0
-    75.0    50.0    24.0
-    70.0    55.0    24.0
-    65.0    50.0    24.0
-f1437 1
-    -0.0    -0.0    1.0
-c0
-4
-    75.0    60.0    24.0
-    75.0    50.0    24.0
-    80.0    55.0    24.0
-    75.0    60.0    24.0
-f1438 1
-    -0.0    -0.0    1.0
-c0
-4
-    75.0    50.0    24.0
-    75.0    60.0    24.0
-    70.0    55.0    24.0
-    75.0    50.0    24.0
-f1439 1
-    -0.0    -0.0    1.0
-c0
-4
-    65.0    70.0    24.0
-    65.0    60.0    24.0
-    70.0    65.0    24.0
-    65.0    70.0    24.0
-f1440 1
-    -0.0    -0.0    1.0
-c0
-4
-    85.0    60.0    24.0
-    85.0    70.0    24.0
-    80.0    65.0    24.0
-    85.0    60.0    24.0
-f1441 1
-    -1.0    0.0    0.0
-c0
-4
-    95.0    35.0    24.0
-    95.0    35.0    27.0
-    95.0    45.0    27.0
-    95.0    35.0    24.0
-f1442 1
-    -1.0    0.0    0.0
-c0
-4
-    95.0    45.0    24.0
-    95.0    35.0    24.0
-    95.0    45.0    27.0
-    95.0    45.0    24.0
-f1443 1
-    -1.0    0.0    0.0
-c0
-4
-    95.0    45.0    24.0
-    95.0    55.0    27.0
-    95.0    55.0    24.0
-    95.0    45.0    24.0
-f1444 1
-    -1.0    0.0    0.0
-c0
-4
-    95.0    45.0    24.0
-    95.0    45.0    27.0
-    95.0    55.0    27.0
-    95.0    45.0    24.0
-f1445 1
-    -0.0    1.0    -0.0
-c0
-4
-    105.0    55.0    24.0
-    95.0    55.0    24.0
-    95.0    55.0    27.0
-    105.0    55.0    24.0
-f1446 1
-    -0.0    1.0    -0.0
-c0
-4
-    115.0    55.0    24.0
-    105.0    55.0    24.0
-    115.0    55.0    27.0
-    115.0    55.0    24.0
-f1447 1
-    -0.0    1.0    -0.0
-c0
-4
-    105.0    55.0    24.0
-    95.0    55.0    27.0
-    105.0    55.0    27.0
-    105.0    55.0    24.0
-f1448 1
-    -0.0    1.0    -0.0
-c0
-4
-    105.0    55.0    24.0
-    105.0    55.0    27.0
-    115.0    55.0    27.0
-    105.0    55.0    24.0
-f1449 1
-    0.0    -1.0    0.0
-c0
-4
-    95.0    35.0    27.0
-    95.0    35.0    24.0
-    105.0    35.0    27.0
-    95.0    35.0    27.0
-f1450 1
-    0.0    -1.0    0.0
-c0
-4
-    105.0    35.0    27.0
-    95.0    35.0    24.0
-    105.0    35.0    24.0
-    105.0    35.0    27.0
-f1451 1
-    0.0    -1.0    0.0
-c0
-4
-    115.0    35.0    27.0
-    105.0    35.0    24.0
-    115.0    35.0    24.0
-    115.0    35.0    27.0
-f1452 1
-    0.0    -1.0    0.0
-c0
-4
-    115.0    35.0    27.0
-    105.0    35.0    27.0
-    105.0    35.0    24.0
-    115.0    35.0    27.0
-f1453 1
-    1.0    -0.0    -0.0
-c0
-4
-    115.0    55.0    27.0
-    115.0    45.0    24.0
-    115.0    55.0    24.0
-    115.0    55.0    27.0
-f1454 1
-    1.0    -0.0    -0.0
-c0
-4
-    115.0    45.0    27.0
-    115.0    35.0    27.0
-    115.0    35.0    24.0
-    115.0    45.0    27.0
-f1455 1
-    1.0    -0.0    -0.0
-c0
-4
-    115.0    45.0    27.0
-    115.0    35.0    24.0
-    115.0    45.0    24.0
-    115.0    45.0    27.0
-f1456 1
-    1.0    -0.0    -0.0
-c0
-4
-    115.0    45.0    27.0
-    115.0    45.0    24.0
-    115.0    55.0    27.0
-    115.0    45.0    27.0
-f1457 1
-    1.0    -0.0    -0.0
-c0
-4
-    90.0    130.0    24.0
-    90.0    130.0    27.0
-    90.0    120.0    24.0
-    90.0    130.0    24.0
-f1458 1
-    1.0    -0.0    -0.0
-c0
-4
-    90.0    110.0    24.0
-    90.0    120.0    27.0
-    90.0    110.0    27.0
-    90.0    110.0    24.0
-f1459 1
-    1.0    -0.0    -0.0
-c0
-4
-    90.0    120.0    24.0
-    90.0    120.0    27.0
-    90.0    110.0    24.0
-    90.0    120.0    24.0
-f1460 1
-    1.0    -0.0    -0.0
-c0
-4
-    90.0    120.0    24.0
-    90.0    130.0    27.0
-    90.0    120.0    27.0
-    90.0    120.0    24.0
-f1461 1
-    -0.0    1.0    -0.0
-c0
-4
-    80.0    130.0    24.0
-    90.0    130.0    27.0
-    90.0    130.0    24.0
-    80.0    130.0    24.0
-f1462 1
-    -0.0    1.0    -0.0
-c0
-4
-    70.0    130.0    24.0
-    70.0    130.0    27.0
-    80.0    130.0    27.0
-    70.0    130.0    24.0
-f1463 1
-    -0.0    1.0    -0.0
-c0
-4
-    80.0    130.0    24.0
-    70.0    130.0    24.0
-    80.0    130.0    27.0
-    80.0    130.0    24.0
-f1464 1
-    -0.0    1.0    -0.0
-c0
-4
-    80.0    130.0    24.0
-    80.0    130.0    27.0
-    90.0    130.0    27.0
-    80.0    130.0    24.0
-f1465 1
-    -1.0    0.0    0.0
-c0
-4
-    70.0    120.0    24.0
-    70.0    130.0    27.0
-    70.0    130.0    24.0
-    70.0    120.0    24.0
-f1466 1
-    -1.0    0.0    0.0
-c0
-4
-    70.0    110.0    24.0
-    70.0    110.0    27.0
-    70.0    120.0    27.0
-    70.0    110.0    24.0
-f1467 1
-    -1.0    0.0    0.0
-c0
-4
-    70.0    120.0    24.0
-    70.0    110.0    24.0
-    70.0    120.0    27.0
-    70.0    120.0    24.0
-f1468 1
-    -1.0    0.0    0.0
-c0
-4
-    70.0    120.0    24.0
-    70.0    120.0    27.0
-    70.0    130.0    27.0
-    70.0    120.0    24.0
-f1469 1
-    0.0    -1.0    0.0
-c0
-4
-    90.0    110.0    27.0
-    80.0    110.0    27.0
-    90.0    110.0    24.0
-    90.0    110.0    27.0
-f1470 1
-    0.0    -1.0    0.0
-c0
-4
-    80.0    110.0    27.0
-    80.0    110.0    24.0
-    90.0    110.0    24.0
-    80.0    110.0    27.0
-f1471 1
-    0.0    -1.0    0.0
-c0
-4
-    70.0    110.0    27.0
-    70.0    110.0    24.0
-    80.0    110.0    24.0
-    70.0    110.0    27.0
-f1472 1
-    0.0    -1.0    0.0
-c0
-4
-    80.0    110.0    27.0
-    70.0    110.0    27.0
-    80.0    110.0    24.0
-    80.0    110.0    27.0
-f1473 1
-    -0.0    1.0    -0.0
-c0
-4
-    110.0    90.0    27.0
-    110.0    90.0    30.0
-    120.0    90.0    30.0
-    110.0    90.0    27.0
-f1474 1
-    -0.0    1.0    -0.0
-c0
-4
-    110.0    90.0    27.0
-    120.0    90.0    30.0
-    120.0    90.0    27.0
-    110.0    90.0    27.0
-f1475 1
-    -0.0    1.0    -0.0
-c0
-4
-    130.0    90.0    27.0
-    120.0    90.0    27.0
-    130.0    90.0    30.0
-    130.0    90.0    27.0
-f1476 1
-    -0.0    1.0    -0.0
-c0
-4
-    120.0    90.0    27.0
-    120.0    90.0    30.0
-    130.0    90.0    30.0
-    120.0    90.0    27.0
-f1477 1
-    1.0    -0.0    -0.0
-c0
-4
-    130.0    90.0    30.0
-    130.0    80.0    27.0
-    130.0    90.0    27.0
-    130.0    90.0    30.0
-f1478 1
-    1.0    -0.0    -0.0
-c0
-4
-    130.0    70.0    30.0
-    130.0    70.0    27.0
-    130.0    80.0    27.0
-    130.0    70.0    30.0
-f1479 1
-    1.0    -0.0    -0.0
-c0
-4
-    130.0    80.0    30.0
-    130.0    80.0    27.0
-    130.0    90.0    30.0
-    130.0    80.0    30.0
-f1480 1
-    1.0    -0.0    -0.0
-c0
-4
-    130.0    80.0    30.0
-    130.0    70.0    30.0
-    130.0    80.0    27.0
-    130.0    80.0    30.0
-f1481 1
-    -1.0    0.0    0.0
-c0
-4
-    110.0    80.0    27.0
-    110.0    90.0    30.0
-    110.0    90.0    27.0
-    110.0    80.0    27.0
-f1482 1
-    -1.0    0.0    0.0
-c0
-4
-    110.0    70.0    27.0
-    110.0    70.0    30.0
-    110.0    80.0    27.0
-    110.0    70.0    27.0
-f1483 1
-    -1.0    0.0    0.0
-c0
-4
-    110.0    80.0    27.0
-    110.0    80.0    30.0
-    110.0    90.0    30.0
-    110.0    80.0    27.0
-f1484 1
-    -1.0    0.0    0.0
-c0
-4
-    110.0    80.0    27.0
-    110.0    70.0    30.0
-    110.0    80.0    30.0
-    110.0    80.0    27.0
-f1485 1
-    0.0    -1.0    0.0
-c0
-4
-    130.0    70.0    30.0
-    120.0    70.0    27.0
-    130.0    70.0    27.0
-    130.0    70.0    30.0
-f1486 1
-    0.0    -1.0    0.0
-c0
-4
-    110.0    70.0    30.0
-    110.0    70.0    27.0
-    120.0    70.0    27.0
-    110.0    70.0    30.0
-f1487 1
-    0.0    -1.0    0.0
-c0
-4
-    130.0    70.0    30.0
-    120.0    70.0    30.0
-    120.0    70.0    27.0
-    130.0    70.0    30.0
-f1488 1
-    0.0    -1.0    0.0
-c0
-4
-    110.0    70.0    30.0
-    120.0    70.0    27.0
-    120.0    70.0    30.0
-    110.0    70.0    30.0
-f1489 1
-    -0.0    1.0    -0.0
-c0
-4
-    50.0    95.0    27.0
-    50.0    95.0    30.0
-    60.0    95.0    30.0
-    50.0    95.0    27.0
-f1490 1
-    -0.0    1.0    -0.0
-c0
-4
-    60.0    95.0    27.0
-    70.0    95.0    30.0
-    70.0    95.0    27.0
-    60.0    95.0    27.0
-f1491 1
-    -0.0    1.0    -0.0
-c0
-4
-    60.0    95.0    27.0
-    60.0    95.0    30.0
-    70.0    95.0    30.0
-    60.0    95.0    27.0
-f1492 1
-    -0.0    1.0    -0.0
-c0
-4
-    60.0    95.0    27.0
-    50.0    95.0    27.0
-    60.0    95.0    30.0
-    60.0    95.0    27.0
-f1493 1
-    1.0    -0.0    -0.0
-c0
-4
-    70.0    75.0    27.0
-    70.0    85.0    30.0
-    70.0    75.0    30.0
-    70.0    75.0    27.0
-f1494 1
-    1.0    -0.0    -0.0
-c0
-4
-    70.0    95.0    27.0
-    70.0    95.0    30.0
-    70.0    85.0    27.0
-    70.0    95.0    27.0
-f1495 1
-    1.0    -0.0    -0.0
-c0
-4
-    70.0    85.0    27.0
-    70.0    95.0    30.0
-    70.0    85.0    30.0
-    70.0    85.0    27.0
-f1496 1
-    1.0    -0.0    -0.0
-c0
-4
-    70.0    75.0    27.0
-    70.0    85.0    27.0
-    70.0    85.0    30.0
-    70.0    75.0    27.0
-f1497 1
-    -1.0    0.0    0.0
-c0
-4
-    50.0    95.0    30.0
-    50.0    95.0    27.0
-    50.0    85.0    27.0
-    50.0    95.0    30.0
-f1498 1
-    -1.0    0.0    0.0
-c0
-4
-    50.0    85.0    30.0
-    50.0    95.0    30.0
-    50.0    85.0    27.0
-    50.0    85.0    30.0
-f1499 1
-    -1.0    0.0    0.0
-c0
-4
-    50.0    75.0    30.0
-    50.0    85.0    27.0
-    50.0    75.0    27.0
-    50.0    75.0    30.0
-f1500 1
-    -1.0    0.0    0.0
-c0
-4
-    50.0    85.0    30.0
-    50.0    85.0    27.0
-    50.0    75.0    30.0
-    50.0    85.0    30.0
-f1501 1
-    0.0    -1.0    0.0
-c0
-4
-    50.0    75.0    30.0
-    50.0    75.0    27.0
-    60.0    75.0    27.0
-    50.0    75.0    30.0
-f1502 1
-    0.0    -1.0    0.0
-c0
-4
-    60.0    75.0    30.0
-    50.0    75.0    30.0
-    60.0    75.0    27.0
-    60.0    75.0    30.0
-f1503 1
-    0.0    -1.0    0.0
-c0
-4
-    60.0    75.0    30.0
-    70.0    75.0    27.0
-    70.0    75.0    30.0
-    60.0    75.0    30.0
-f1504 1
-    0.0    -1.0    0.0
-c0
-4
-    60.0    75.0    30.0
-    60.0    75.0    27.0
-    70.0    75.0    27.0
-    60.0    75.0    30.0
-f1505 1
-    1.0    -0.0    -0.0
-c0
-4
-    50.0    105.0    30.0
-    50.0    105.0    27.0
-    50.0    115.0    27.0
-    50.0    105.0    30.0
-f1506 1
-    1.0    -0.0    -0.0
-c0
-4
-    50.0    115.0    30.0
-    50.0    105.0    30.0
-    50.0    115.0    27.0
-    50.0    115.0    30.0
-f1507 1
-    1.0    -0.0    -0.0
-c0
-4
-    50.0    125.0    30.0
-    50.0    115.0    30.0
-    50.0    125.0    27.0
-    50.0    125.0    30.0
-f1508 1
-    1.0    -0.0    -0.0
-c0
-4
-    50.0    115.0    30.0
-    50.0    115.0    27.0
-    50.0    125.0    27.0
-    50.0    115.0    30.0
-f1509 1
-    -0.0    1.0    -0.0
-c0
-4
-    50.0    125.0    27.0
-    40.0    125.0    27.0
-    50.0    125.0    30.0
-    50.0    125.0    27.0
-f1510 1
-    -0.0    1.0    -0.0
-c0
-4
-    40.0    125.0    27.0
-    40.0    125.0    30.0
-    50.0    125.0    30.0
-    40.0    125.0    27.0
-f1511 1
-    -0.0    1.0    -0.0
-c0
-4
-    30.0    125.0    27.0
-    30.0    125.0    30.0
-    40.0    125.0    30.0
-    30.0    125.0    27.0
-f1512 1
-    -0.0    1.0    -0.0
-c0
-4
-    30.0    125.0    27.0
-    40.0    125.0    30.0
-    40.0    125.0    27.0
-    30.0    125.0    27.0
-f1513 1
-    0.0    -1.0    0.0
-c0
-4
-    50.0    105.0    30.0
-    40.0    105.0    30.0
-    50.0    105.0    27.0
-    50.0    105.0    30.0
-f1514 1
-    0.0    -1.0    0.0
-c0
-4
-    30.0    105.0    30.0
-    30.0    105.0    27.0
-    40.0    105.0    27.0
-    30.0    105.0    30.0
-f1515 1
-    0.0    -1.0    0.0
-c0
-4
-    30.0    105.0    30.0
-    40.0    105.0    27.0
-    40.0    105.0    30.0
-    30.0    105.0    30.0
-f1516 1
-    0.0    -1.0    0.0
-c0
-4
-    40.0    105.0    30.0
-    40.0    105.0    27.0
-    50.0    105.0    27.0
-    40.0    105.0    30.0
-f1517 1
-    -1.0    0.0    0.0
-c0
-4
-    30.0    125.0    27.0
-    30.0    115.0    27.0
-    30.0    125.0    30.0
-    30.0    125.0    27.0
-f1518 1
-    -1.0    0.0    0.0
-c0
-4
-    30.0    115.0    27.0
-    30.0    115.0    30.0
-    30.0    125.0    30.0
-    30.0    115.0    27.0
-f1519 1
-    -1.0    0.0    0.0
-c0
-4
-    30.0    105.0    27.0
-    30.0    105.0    30.0
-    30.0    115.0    27.0
-    30.0    105.0    27.0
-f1520 1
-    -1.0    0.0    0.0
-c0
-4
-    30.0    115.0    27.0
-    30.0    105.0    30.0
-    30.0    115.0    30.0
-    30.0    115.0    27.0
-f1521 1
-    1.0    -0.0    -0.0
-c0
-4
-    125.0    120.0    30.0
-    125.0    110.0    27.0
-    125.0    120.0    27.0
-    125.0    120.0    30.0
-f1522 1
-    1.0    -0.0    -0.0
-c0
-4
-    125.0    120.0    30.0
-    125.0    110.0    30.0
-    125.0    110.0    27.0
-    125.0    120.0    30.0
-f1523 1
-    1.0    -0.0    -0.0
-c0
-4
-    125.0    100.0    30.0
-    125.0    100.0    27.0
-    125.0    110.0    27.0
-    125.0    100.0    30.0
-f1524 1
-    1.0    -0.0    -0.0
-c0
-4
-    125.0    110.0    30.0
-    125.0    100.0    30.0
-    125.0    110.0    27.0
-    125.0    110.0    30.0
-f1525 1
-    -0.0    1.0    -0.0
-c0
-4
-    125.0    120.0    27.0
-    115.0    120.0    27.0
-    125.0    120.0    30.0
-    125.0    120.0    27.0
-f1526 1
-    -0.0    1.0    -0.0
-c0
-4
-    115.0    120.0    27.0
-    115.0    120.0    30.0
-    125.0    120.0    30.0
-    115.0    120.0    27.0
-f1527 1
-    -0.0    1.0    -0.0
-c0
-4
-    105.0    120.0    27.0
-    105.0    120.0    30.0
-    115.0    120.0    30.0
-    105.0    120.0    27.0
-f1528 1
-    -0.0    1.0    -0.0
-c0
-4
-    105.0    120.0    27.0
-    115.0    120.0    30.0
-    115.0    120.0    27.0
-    105.0    120.0    27.0
-f1529 1
-    0.0    -1.0    0.0
-c0
-4
-    105.0    100.0    30.0
-    105.0    100.0    27.0
-    115.0    100.0    27.0
-    105.0    100.0    30.0
-f1530 1
-    0.0    -1.0    0.0
-c0
-4
-    105.0    100.0    30.0
-    115.0    100.0    27.0
-    115.0    100.0    30.0
-    105.0    100.0    30.0
-f1531 1
-    0.0    -1.0    0.0
-c0
-4
-    115.0    100.0    30.0
-    125.0    100.0    27.0
-    125.0    100.0    30.0
-    115.0    100.0    30.0
-f1532 1
-    0.0    -1.0    0.0
-c0
-4
-    115.0    100.0    30.0
-    115.0    100.0    27.0
-    125.0    100.0    27.0
-    115.0    100.0    30.0
-f1533 1
-    -1.0    0.0    0.0
-c0
-4
-    105.0    110.0    30.0
-    105.0    120.0    30.0
-    105.0    120.0    27.0
-    105.0    110.0    30.0
-f1534 1
-    -1.0    0.0    0.0
-c0
-4
-    105.0    100.0    30.0
-    105.0    110.0    27.0
-    105.0    100.0    27.0
-    105.0    100.0    30.0
-f1535 1
-    -1.0    0.0    0.0
-c0
-4
-    105.0    110.0    30.0
-    105.0    110.0    27.0
-    105.0    100.0    30.0
-    105.0    110.0    30.0
-f1536 1
-    -1.0    0.0    0.0
-c0
-4
-    105.0    110.0    30.0
-    105.0    120.0    27.0
-    105.0    110.0    27.0
-    105.0    110.0    30.0
-f1537 1
-    -1.0    0.0    0.0
-c0
-4
-    95.0    35.0    27.0
-    95.0    35.0    30.0
-    95.0    45.0    30.0
-    95.0    35.0    27.0
-f1538 1
-    -1.0    0.0    0.0
-c0
-4
-    95.0    55.0    27.0
-    95.0    45.0    30.0
-    95.0    55.0    30.0
-    95.0    55.0    27.0
-f1539 1
-    -1.0    0.0    0.0
-c0
-4
-    95.0    35.0    27.0
-    95.0    45.0    30.0
-    95.0    45.0    27.0
-    95.0    35.0    27.0
-f1540 1
-    -1.0    0.0    0.0
-c0
-4
-    95.0    55.0    27.0
-    95.0    45.0    27.0
-    95.0    45.0    30.0
-    95.0    55.0    27.0
-f1541 1
-    -0.0    1.0    -0.0
-c0
-4
-    115.0    55.0    27.0
-    105.0    55.0    30.0
-    115.0    55.0    30.0
-    115.0    55.0    27.0
-f1542 1
-    -0.0    1.0    -0.0
-c0
-4
-    95.0    55.0    27.0
-    95.0    55.0    30.0
-    105.0    55.0    30.0
-    95.0    55.0    27.0
-f1543 1
-    -0.0    1.0    -0.0
-c0
-4
-    95.0    55.0    27.0
-    105.0    55.0    30.0
-    105.0    55.0    27.0
-    95.0    55.0    27.0
-f1544 1
-    -0.0    1.0    -0.0
-c0
-4
-    105.0    55.0    27.0
-    105.0    55.0    30.0
-    115.0    55.0    27.0
-    105.0    55.0    27.0
-f1545 1
-    0.0    -1.0    0.0
-c0
-4
-    95.0    35.0    30.0
-    95.0    35.0    27.0
-    105.0    35.0    27.0
-    95.0    35.0    30.0
-f1546 1
-    0.0    -1.0    0.0
-c0
-4
-    105.0    35.0    30.0
-    95.0    35.0    30.0
-    105.0    35.0    27.0
-    105.0    35.0    30.0
-f1547 1
-    0.0    -1.0    0.0
-c0
-4
-    105.0    35.0    30.0
-    115.0    35.0    27.0
-    115.0    35.0    30.0
-    105.0    35.0    30.0
-f1548 1
-    0.0    -1.0    0.0
-c0
-4
-    105.0    35.0    30.0
-    105.0    35.0    27.0
-    115.0    35.0    27.0
-    105.0    35.0    30.0
-f1549 1
-    1.0    -0.0    -0.0
-c0
-4
-    115.0    35.0    30.0
-    115.0    35.0    27.0
-    115.0    45.0    27.0
-    115.0    35.0    30.0
-f1550 1
-    1.0    -0.0    -0.0
-c0
-4
-    115.0    45.0    30.0
-    115.0    35.0    30.0
-    115.0    45.0    27.0
-    115.0    45.0    30.0
-f1551 1
-    1.0    -0.0    -0.0
-c0
-4
-    115.0    55.0    30.0
-    115.0    45.0    30.0
-    115.0    55.0    27.0
-    115.0    55.0    30.0
-f1552 1
-    1.0    -0.0    -0.0
-c0
-4
-    115.0    45.0    30.0
-    115.0    45.0    27.0
-    115.0    55.0    27.0
-    115.0    45.0    30.0
-f1553 1
-    -0.0    1.0    -0.0
-c0
-4
-    90.0    130.0    27.0
-    80.0    130.0    30.0
-    90.0    130.0    30.0
-    90.0    130.0    27.0
-f1554 1
-    -0.0    1.0    -0.0
-c0
-4
-    80.0    130.0    27.0
-    70.0    130.0    27.0
-    70.0    130.0    30.0
-    80.0    130.0    27.0
-f1555 1
-    -0.0    1.0    -0.0
-c0
-4
-    80.0    130.0    27.0
-    70.0    130.0    30.0
-    80.0    130.0    30.0
-    80.0    130.0    27.0
-f1556 1
-    -0.0    1.0    -0.0
-c0
-4
-    80.0    130.0    27.0
-    80.0    130.0    30.0
-    90.0    130.0    27.0
-    80.0    130.0    27.0
-f1557 1
-    -1.0    0.0    0.0
-c0
-4
-    70.0    130.0    27.0
-    70.0    120.0    30.0
-    70.0    130.0    30.0
-    70.0    130.0    27.0
-f1558 1
-    -1.0    0.0    0.0
-c0
-4
-    70.0    120.0    27.0
-    70.0    110.0    27.0
-    70.0    110.0    30.0
-    70.0    120.0    27.0
-f1559 1
-    -1.0    0.0    0.0
-c0
-4
-    70.0    120.0    27.0
-    70.0    110.0    30.0
-    70.0    120.0    30.0
-    70.0    120.0    27.0
-f1560 1
-    -1.0    0.0    0.0
-c0
-4
-    70.0    120.0    27.0
-    70.0    120.0    30.0
-    70.0    130.0    27.0
-    70.0    120.0    27.0
-f1561 1
-    0.0    -1.0    0.0
-c0
-4
-    90.0    110.0    30.0
-    80.0    110.0    27.0
-    90.0    110.0    27.0
-    90.0    110.0    30.0
-f1562 1
-    0.0    -1.0    0.0
-c0
-4
-    80.0    110.0    30.0
-    80.0    110.0    27.0
-    90.0    110.0    30.0
-    80.0    110.0    30.0
-f1563 1
-    0.0    -1.0    0.0
-c0
-4
-    70.0    110.0    30.0
-    70.0    110.0    27.0
-    80.0    110.0    30.0
-    70.0    110.0    30.0
-f1564 1
-    0.0    -1.0    0.0
-c0
-4
-    80.0    110.0    30.0
-    70.0    110.0    27.0
-    80.0    110.0    27.0
-    80.0    110.0    30.0
-f1565 1
-    -0.0    1.0    -0.0
-c0
-4
-    130.0    90.0    33.0
-    130.0    90.0    30.0
-    120.0    90.0    30.0
-    130.0    90.0    33.0
-f1566 1
-    -0.0    1.0    -0.0
-c0
-4
-    130.0    90.0    33.0
-    120.0    90.0    30.0
-    120.0    90.0    33.0
-    130.0    90.0    33.0
-f1567 1
-    -0.0    1.0    -0.0
-c0
-4
-    120.0    90.0    33.0
-    110.0    90.0    30.0
-    110.0    90.0    33.0
-    120.0    90.0    33.0
-f1568 1
-    -0.0    1.0    -0.0
-c0
-4
-    120.0    90.0    33.0
-    120.0    90.0    30.0
-    110.0    90.0    30.0
-    120.0    90.0    33.0
-f1569 1
-    1.0    -0.0    -0.0
-c0
-4
-    130.0    90.0    33.0
-    130.0    80.0    30.0
-    130.0    90.0    30.0
-    130.0    90.0    33.0
-f1570 1
-    1.0    -0.0    -0.0
-c0
-4
-    130.0    80.0    33.0
-    130.0    80.0    30.0
-    130.0    90.0    33.0
-    130.0    80.0    33.0
-f1571 1
-    1.0    -0.0    -0.0
-c0
-4
-    130.0    70.0    33.0
-    130.0    70.0    30.0
-    130.0    80.0    33.0
-    130.0    70.0    33.0
-f1572 1
-    1.0    -0.0    -0.0
-c0
-4
-    130.0    80.0    33.0
-    130.0    70.0    30.0
-    130.0    80.0    30.0
-    130.0    80.0    33.0
-f1573 1
-    -1.0    0.0    0.0
-c0
-4
-    110.0    90.0    30.0
-    110.0    80.0    30.0
-    110.0    90.0    33.0
-    110.0    90.0    30.0
-f1574 1
-    -1.0    0.0    0.0
-c0
-4
-    110.0    80.0    30.0
-    110.0    80.0    33.0
-    110.0    90.0    33.0
-    110.0    80.0    30.0
-f1575 1
-    -1.0    0.0    0.0
-c0
-4
-    110.0    70.0    30.0
-    110.0    70.0    33.0
-    110.0    80.0    30.0
-    110.0    70.0    30.0
-f1576 1
-    -1.0    0.0    0.0
-c0
-4
-    110.0    80.0    30.0
-    110.0    70.0    33.0
-    110.0    80.0    33.0
-    110.0    80.0    30.0
-f1577 1
-    0.0    -1.0    0.0
-c0
-4
-    130.0    70.0    33.0
-    120.0    70.0    30.0
-    130.0    70.0    30.0
-    130.0    70.0    33.0
-f1578 1
-    0.0    -1.0    0.0
-c0
-4
-    120.0    70.0    33.0
-    120.0    70.0    30.0
-    130.0    70.0    33.0
-    120.0    70.0    33.0
-f1579 1
-    0.0    -1.0    0.0
-c0
-4
-    110.0    70.0    33.0
-    110.0    70.0    30.0
-    120.0    70.0    33.0
-    110.0    70.0    33.0
-f1580 1
-    0.0    -1.0    0.0
-c0
-4
-    120.0    70.0    33.0
-    110.0    70.0    30.0
-    120.0    70.0    30.0
-    120.0    70.0    33.0
-f1581 1
-    1.0    -0.0    -0.0
-c0
-4
-    90.0    120.0    30.0
-    90.0    110.0    30.0
-    90.0    110.0    27.0
-    90.0    120.0    30.0
-f1582 1
-    1.0    -0.0    -0.0
-c0
-4
-    90.0    130.0    30.0
-    90.0    120.0    30.0
-    90.0    130.0    27.0
-    90.0    130.0    30.0
-f1583 1
-    1.0    -0.0    -0.0
-c0
-4
-    90.0    120.0    30.0
-    90.0    120.0    27.0
-    90.0    130.0    27.0
-    90.0    120.0    30.0
-f1584 1
-    1.0    -0.0    -0.0
-c0
-4
-    90.0    120.0    30.0
-    90.0    110.0    27.0
-    90.0    120.0    27.0
-    90.0    120.0    30.0
-f1585 1
-    -0.0    -0.0    1.0
-c0
-4
-    30.0    0.0    0.0
-    30.797655    13.397998    0.0
-    21.449462    8.542266    0.0
-    30.0    0.0    0.0
-f1586 1
-    -0.0    -0.0    1.0
-c0
-4
-    101.042621    24.545169    0.0
-    91.801498    18.472051    0.0
-    102.650243    11.159583    0.0
-    101.042621    24.545169    0.0
-f1587 1
-    -0.0    -0.0    1.0
-c0
-4
-    110.387488    17.936055    0.0
-    101.042621    24.545169    0.0
-    102.650243    11.159583    0.0
-    110.387488    17.936055    0.0
-f1588 1
-    -0.0    -0.0    1.0
-c0
-4
-    90.0    100.0    0.0
-    100.0    100.0    0.0
-    97.500000    107.500000    0.0
-    90.0    100.0    0.0
-f1589 1
-    -0.0    -0.0    1.0
-c0
-4
-    100.0    100.0    0.0
-    105.0    110.0    0.0
-    97.500000    107.500000    0.0
-    100.0    100.0    0.0
-f1590 1
-    -0.0    -0.0    1.0
-c0
-4
-    17.749079    92.099243    0.0
-    12.232570    82.226024    0.0
-    23.664088    84.058900    0.0
-    17.749079    92.099243    0.0
-f1591 1
-    -0.0    -0.0    1.0
-c0
-4
-    135.065020    31.189542    0.0
-    133.141953    44.214671    0.0
-    126.326511    36.142829    0.0
-    135.065020    31.189542    0.0
-f1592 1
-    -0.0    -0.0    1.0
-c0
-4
-    95.0    35.0    0.0
-    84.213733    35.434470    0.0
-    86.782127    26.827339    0.0
-    95.0    35.0    0.0
-f1593 1
-    -0.0    -0.0    1.0
-c0
-4
-    120.501368    12.594526    0.0
-    129.995007    19.974072    0.0
-    118.705376    23.433747    0.0
-    120.501368    12.594526    0.0
-f1594 1
-    -0.0    -0.0    1.0
-c0
-4
-    110.387488    17.936055    0.0
-    120.501368    12.594526    0.0
-    118.705376    23.433747    0.0
-    110.387488    17.936055    0.0
-f1595 1
-    -0.0    -0.0    1.0
-c0
-4
-    11.141130    27.339435    0.0
-    19.737974    18.747335    0.0
-    24.346784    28.582905    0.0
-    11.141130    27.339435    0.0
-f1596 1
-    -0.0    -0.0    1.0
-c0
-4
-    17.618236    37.301409    0.0
-    11.141130    27.339435    0.0
-    24.346784    28.582905    0.0
-    17.618236    37.301409    0.0
-f1597 1
-    -0.0    -0.0    1.0
-c0
-4
-    32.574652    137.979453    0.0
-    30.0    150.0    0.0
-    24.082854    140.812253    0.0
-    32.574652    137.979453    0.0
-f1598 1
-    -0.0    -0.0    1.0
-c0
-4
-    30.797655    13.397998    0.0
-    30.0    0.0    0.0
-    38.683175    8.600292    0.0
-    30.797655    13.397998    0.0
-f1599 1
-    -0.0    -0.0    1.0
-c0
-4
-    17.776928    57.199685    0.0
-    13.553571    46.519504    0.0
-    24.698162    46.228426    0.0
-    17.776928    57.199685    0.0
-f1600 1
-    -0.0    -0.0    1.0
-c0
-4
-    23.664088    84.058900    0.0
-    12.232570    82.226024    0.0
-    17.026202    75.715889    0.0
-    23.664088    84.058900    0.0
-f1601 1
-    -0.0    -0.0    1.0
-c0
-4
-    35.0    40.0    0.0
-    35.0    50.0    0.0
-    24.698162    46.228426    0.0
-    35.0    40.0    0.0
-f1602 1
-    -0.0    -0.0    1.0
-c0
-4
-    100.0    0.0    0.0
-    110.0    0.0    0.0
-    102.650243    11.159583    0.0
-    100.0    0.0    0.0
-f1603 1
-    -0.0    -0.0    1.0
-c0
-4
-    133.141953    44.214671    0.0
-    135.065020    31.189542    0.0
-    142.522557    36.662226    0.0
-    133.141953    44.214671    0.0
-f1604 1
-    -0.0    -0.0    1.0
-c0
-4
-    0.0    80.0    0.0
-    12.232570    82.226024    0.0
-    8.489054    90.208703    0.0
-    0.0    80.0    0.0
-f1605 1
-    -0.0    -0.0    1.0
-c0
-4
-    13.553571    46.519504    0.0
-    17.618236    37.301409    0.0
-    24.698162    46.228426    0.0
-    13.553571    46.519504    0.0
-f1606 1
-    -0.0    -0.0    1.0
-c0
-4
-    0.0    30.0    0.0
-    0.0    20.0    0.0
-    11.141130    27.339435    0.0
-    0.0    30.0    0.0
-f1607 1
-    -0.0    -0.0    1.0
-c0
-4
-    11.141130    27.339435    0.0
-    0.0    20.0    0.0
-    8.453767    18.603264    0.0
-    11.141130    27.339435    0.0
-f1608 1
-    -0.0    -0.0    1.0
-c0
-4
-    11.637552    100.043056    0.0
-    0.0    100.0    0.0
-    8.489054    90.208703    0.0
-    11.637552    100.043056    0.0
-f1609 1
-    -0.0    -0.0    1.0
-c0
-4
-    82.228317    12.202649    0.0
-    76.307072    21.678851    0.0
-    71.368107    10.929214    0.0
-    82.228317    12.202649    0.0
-f1610 1
-    -0.0    -0.0    1.0
-c0
-4
-    135.065020    31.189542    0.0
-    129.995007    19.974072    0.0
-    139.966069    21.307290    0.0
-    135.065020    31.189542    0.0
-f1611 1
-    -0.0    -0.0    1.0
-c0
-4
-    100.168579    127.017989    0.0
-    90.0    120.0    0.0
-    97.944763    115.752998    0.0
-    100.168579    127.017989    0.0
-f1612 1
-    -0.0    -0.0    1.0
-c0
-4
-    102.650243    11.159583    0.0
-    110.0    0.0    0.0
-    112.106845    8.928571    0.0
-    102.650243    11.159583    0.0
-f1613 1
-    -0.0    -0.0    1.0
-c0
-4
-    30.0    150.0    0.0
-    32.574652    137.979453    0.0
-    40.176600    142.679360    0.0
-    30.0    150.0    0.0
-f1614 1
-    -0.0    -0.0    1.0
-c0
-4
-    27.496602    64.142612    0.0
-    28.656469    55.006894    0.0
-    37.574633    57.439569    0.0
-    27.496602    64.142612    0.0
-f1615 1
-    -0.0    -0.0    1.0
-c0
-4
-    45.0    50.0    0.0
-    55.0    50.0    0.0
-    47.475722    59.210916    0.0
-    45.0    50.0    0.0
-f1616 1
-    -0.0    -0.0    1.0
-c0
-4
-    47.475722    59.210916    0.0
-    55.0    50.0    0.0
-    57.436460    57.330215    0.0
-    47.475722    59.210916    0.0
-f1617 1
-    -0.0    -0.0    1.0
-c0
-4
-    30.797655    13.397998    0.0
-    19.737974    18.747335    0.0
-    21.449462    8.542266    0.0
-    30.797655    13.397998    0.0
-f1618 1
-    -0.0    -0.0    1.0
-c0
-4
-    38.490982    77.052964    0.0
-    50.0    75.0    0.0
-    41.614281    85.335275    0.0
-    38.490982    77.052964    0.0
-f1619 1
-    -0.0    -0.0    1.0
-c0
-4
-    120.501368    12.594526    0.0
-    120.0    0.0    0.0
-    128.827884    8.499357    0.0
-    120.501368    12.594526    0.0
-f1620 1
-    -0.0    -0.0    1.0
-c0
-4
-    19.737974    18.747335    0.0
-    30.797655    13.397998    0.0
-    29.440043    22.121823    0.0
-    19.737974    18.747335    0.0
-f1621 1
-    -0.0    -0.0    1.0
-c0
-4
-    37.579518    66.137737    0.0
-    27.496602    64.142612    0.0
-    37.574633    57.439569    0.0
-    37.579518    66.137737    0.0
-f1622 1
-    -0.0    -0.0    1.0
-c0
-4
-    120.0    150.0    0.0
-    121.371320    137.852418    0.0
-    129.985889    141.546886    0.0
-    120.0    150.0    0.0
-f1623 1
-    -0.0    -0.0    1.0
-c0
-4
-    0.0    120.0    0.0
-    12.150022    121.378177    0.0
-    8.453205    129.986144    0.0
-    0.0    120.0    0.0
-f1624 1
-    -0.0    -0.0    1.0
-c0
-4
-    129.995007    19.974072    0.0
-    135.065020    31.189542    0.0
-    126.348396    27.940089    0.0
-    129.995007    19.974072    0.0
-f1625 1
-    -0.0    -0.0    1.0
-c0
-4
-    8.434218    64.420842    0.0
-    17.776928    57.199685    0.0
-    18.609188    66.430114    0.0
-    8.434218    64.420842    0.0
-f1626 1
-    -0.0    -0.0    1.0
-c0
-4
-    0.0    90.0    0.0
-    0.0    80.0    0.0
-    8.489054    90.208703    0.0
-    0.0    90.0    0.0
-f1627 1
-    -0.0    -0.0    1.0
-c0
-4
-    9.406682    140.593318    0.0
-    0.0    140.0    0.0
-    8.453205    129.986144    0.0
-    9.406682    140.593318    0.0
-f1628 1
-    -0.0    -0.0    1.0
-c0
-4
-    140.593318    140.593318    0.0
-    140.0    150.0    0.0
-    129.985889    141.546886    0.0
-    140.593318    140.593318    0.0
-f1629 1
-    -0.0    -0.0    1.0
-c0
-4
-    0.0    100.0    0.0
-    0.0    90.0    0.0
-    8.489054    90.208703    0.0
-    0.0    100.0    0.0
-f1630 1
-    -0.0    -0.0    1.0
-c0
-4
-    115.0    35.0    0.0
-    118.705376    23.433747    0.0
-    126.348396    27.940089    0.0
-    115.0    35.0    0.0
-f1631 1
-    -0.0    -0.0    1.0
-c0
-4
-    126.326511    36.142829    0.0
-    115.0    35.0    0.0
-    126.348396    27.940089    0.0
-    126.326511    36.142829    0.0
-f1632 1
-    -0.0    -0.0    1.0
-c0
-4
-    85.0    50.0    0.0
-    75.694641    41.999508    0.0
-    87.400546    42.309637    0.0
-    85.0    50.0    0.0
-f1633 1
-    -0.0    -0.0    1.0
-c0
-4
-    7.208772    53.848106    0.0
-    17.776928    57.199685    0.0
-    8.434218    64.420842    0.0
-    7.208772    53.848106    0.0
-f1634 1
-    -0.0    -0.0    1.0
-c0
-4
-    95.0    55.0    0.0
-    103.688299    63.561663    0.0
-    92.625170    63.055491    0.0
-    95.0    55.0    0.0
-f1635 1
-    -0.0    -0.0    1.0
-c0
-4
-    90.0    130.0    0.0
-    99.765812    138.114335    0.0
-    92.795371    142.967207    0.0
-    90.0    130.0    0.0
-f1636 1
-    -0.0    -0.0    1.0
-c0
-4
-    65.0    50.0    0.0
-    63.346444    41.653556    0.0
-    75.694641    41.999508    0.0
-    65.0    50.0    0.0
-f1637 1
-    -0.0    -0.0    1.0
-c0
-4
-    35.0    40.0    0.0
-    24.698162    46.228426    0.0
-    26.453683    37.295742    0.0
-    35.0    40.0    0.0
-f1638 1
-    -0.0    -0.0    1.0
-c0
-4
-    0.0    140.0    0.0
-    0.0    130.0    0.0
-    8.453205    129.986144    0.0
-    0.0    140.0    0.0
-f1639 1
-    -0.0    -0.0    1.0
-c0
-4
-    140.0    150.0    0.0
-    130.0    150.0    0.0
-    129.985889    141.546886    0.0
-    140.0    150.0    0.0
-f1640 1
-    -0.0    -0.0    1.0
-c0
-4
-    10.0    150.0    0.0
-    0.0    150.0    0.0
-    9.406682    140.593318    0.0
-    10.0    150.0    0.0
-f1641 1
-    -0.0    -0.0    1.0
-c0
-4
-    0.0    150.0    0.0
-    0.0    140.0    0.0
-    9.406682    140.593318    0.0
-    0.0    150.0    0.0
-f1642 1
-    -0.0    -0.0    1.0
-c0
-4
-    150.0    150.0    0.0
-    140.0    150.0    0.0
-    140.593318    140.593318    0.0
-    150.0    150.0    0.0
-f1643 1
-    -0.0    -0.0    1.0
-c0
-4
-    150.0    140.0    0.0
-    150.0    150.0    0.0
-    140.593318    140.593318    0.0
-    150.0    140.0    0.0
-f1644 1
-    -0.0    -0.0    1.0
-c0
-4
-    61.868040    15.728007    0.0
-    65.338108    25.773643    0.0
-    53.874411    19.953213    0.0
-    61.868040    15.728007    0.0
-f1645 1
-    -0.0    -0.0    1.0
-c0
-4
-    65.338108    25.773643    0.0
-    55.0    30.0    0.0
-    53.874411    19.953213    0.0
-    65.338108    25.773643    0.0
-f1646 1
-    -0.0    -0.0    1.0
-c0
-4
-    50.0    75.0    0.0
-    50.0    85.0    0.0
-    41.614281    85.335275    0.0
-    50.0    75.0    0.0
-f1647 1
-    -0.0    -0.0    1.0
-c0
-4
-    84.674521    140.538662    0.0
-    90.0    130.0    0.0
-    92.795371    142.967207    0.0
-    84.674521    140.538662    0.0
-f1648 1
-    -0.0    -0.0    1.0
-c0
-4
-    12.150022    121.378177    0.0
-    15.214875    110.231057    0.0
-    21.529103    118.051155    0.0
-    12.150022    121.378177    0.0
-f1649 1
-    -0.0    -0.0    1.0
-c0
-4
-    121.371320    137.852418    0.0
-    110.118172    134.825297    0.0
-    118.031198    128.477998    0.0
-    121.371320    137.852418    0.0
-f1650 1
-    -0.0    -0.0    1.0
-c0
-4
-    105.0    100.0    0.0
-    100.0    100.0    0.0
-    105.0    93.750000    0.0
-    105.0    100.0    0.0
-f1651 1
-    -0.0    -0.0    1.0
-c0
-4
-    130.0    90.0    0.0
-    140.416422    84.978258    0.0
-    140.370173    94.005807    0.0
-    130.0    90.0    0.0
-f1652 1
-    -0.0    -0.0    1.0
-c0
-4
-    150.0    60.0    0.0
-    140.595711    64.722816    0.0
-    141.662899    53.258805    0.0
-    150.0    60.0    0.0
-f1653 1
-    -0.0    -0.0    1.0
-c0
-4
-    50.0    95.0    0.0
-    50.0    105.0    0.0
-    41.444005    96.212097    0.0
-    50.0    95.0    0.0
-f1654 1
-    -0.0    -0.0    1.0
-c0
-4
-    50.0    105.0    0.0
-    40.0    105.0    0.0
-    41.444005    96.212097    0.0
-    50.0    105.0    0.0
-f1655 1
-    -0.0    -0.0    1.0
-c0
-4
-    65.338108    25.773643    0.0
-    76.307072    21.678851    0.0
-    76.527412    30.897697    0.0
-    65.338108    25.773643    0.0
-f1656 1
-    -0.0    -0.0    1.0
-c0
-4
-    71.368107    10.929214    0.0
-    76.307072    21.678851    0.0
-    68.720332    18.527429    0.0
-    71.368107    10.929214    0.0
-f1657 1
-    -0.0    -0.0    1.0
-c0
-4
-    110.118172    134.825297    0.0
-    99.765812    138.114335    0.0
-    100.168579    127.017989    0.0
-    110.118172    134.825297    0.0
-f1658 1
-    -0.0    -0.0    1.0
-c0
-4
-    75.0    50.0    0.0
-    65.0    50.0    0.0
-    75.694641    41.999508    0.0
-    75.0    50.0    0.0
-f1659 1
-    -0.0    -0.0    1.0
-c0
-4
-    120.0    0.0    0.0
-    130.0    0.0    0.0
-    128.827884    8.499357    0.0
-    120.0    0.0    0.0
-f1660 1
-    -0.0    -0.0    1.0
-c0
-4
-    130.0    90.0    0.0
-    140.370173    94.005807    0.0
-    133.160538    98.260036    0.0
-    130.0    90.0    0.0
-f1661 1
-    -0.0    -0.0    1.0
-c0
-4
-    103.688299    63.561663    0.0
-    98.014069    67.770563    0.0
-    92.625170    63.055491    0.0
-    103.688299    63.561663    0.0
-f1662 1
-    -0.0    -0.0    1.0
-c0
-4
-    140.595711    64.722816    0.0
-    136.734616    58.605627    0.0
-    141.662899    53.258805    0.0
-    140.595711    64.722816    0.0
-f1663 1
-    -0.0    -0.0    1.0
-c0
-4
-    103.688299    63.561663    0.0
-    105.0    55.0    0.0
-    113.510239    62.629064    0.0
-    103.688299    63.561663    0.0
-f1664 1
-    -0.0    -0.0    1.0
-c0
-4
-    105.0    55.0    0.0
-    115.0    55.0    0.0
-    113.510239    62.629064    0.0
-    105.0    55.0    0.0
-f1665 1
-    -0.0    -0.0    1.0
-c0
-4
-    120.0    0.0    0.0
-    120.501368    12.594526    0.0
-    112.106845    8.928571    0.0
-    120.0    0.0    0.0
-f1666 1
-    -0.0    -0.0    1.0
-c0
-4
-    90.0    130.0    0.0
-    90.0    120.0    0.0
-    100.168579    127.017989    0.0
-    90.0    130.0    0.0
-f1667 1
-    -0.0    -0.0    1.0
-c0
-4
-    17.618236    37.301409    0.0
-    13.553571    46.519504    0.0
-    8.115281    36.912919    0.0
-    17.618236    37.301409    0.0
-f1668 1
-    -0.0    -0.0    1.0
-c0
-4
-    130.0    150.0    0.0
-    120.0    150.0    0.0
-    129.985889    141.546886    0.0
-    130.0    150.0    0.0
-f1669 1
-    -0.0    -0.0    1.0
-c0
-4
-    0.0    130.0    0.0
-    0.0    120.0    0.0
-    8.453205    129.986144    0.0
-    0.0    130.0    0.0
-f1670 1
-    -0.0    -0.0    1.0
-c0
-4
-    84.213733    35.434470    0.0
-    95.0    35.0    0.0
-    87.400546    42.309637    0.0
-    84.213733    35.434470    0.0
-f1671 1
-    -0.0    -0.0    1.0
-c0
-4
-    100.0    100.0    0.0
-    100.0    90.0    0.0
-    105.0    93.750000    0.0
-    100.0    100.0    0.0
-f1672 1
-    -0.0    -0.0    1.0
-c0
-4
-    50.0    95.0    0.0
-    41.444005    96.212097    0.0
-    41.614281    85.335275    0.0
-    50.0    95.0    0.0
-f1673 1
-    -0.0    -0.0    1.0
-c0
-4
-    139.837376    101.822964    0.0
-    150.0    100.0    0.0
-    142.405411    108.529006    0.0
-    139.837376    101.822964    0.0
-f1674 1
-    -0.0    -0.0    1.0
-c0
-4
-    80.0    150.0    0.0
-    75.251757    140.264768    0.0
-    84.674521    140.538662    0.0
-    80.0    150.0    0.0
-f1675 1
-    -0.0    -0.0    1.0
-c0
-4
-    140.278895    75.280011    0.0
-    150.0    80.0    0.0
-    140.416422    84.978258    0.0
-    140.278895    75.280011    0.0
-f1676 1
-    -0.0    -0.0    1.0
-c0
-4
-    130.0    80.0    0.0
-    140.278895    75.280011    0.0
-    140.416422    84.978258    0.0
-    130.0    80.0    0.0
-f1677 1
-    -0.0    -0.0    1.0
-c0
-4
-    75.251757    140.264768    0.0
-    80.0    130.0    0.0
-    84.674521    140.538662    0.0
-    75.251757    140.264768    0.0
-f1678 1
-    -0.0    -0.0    1.0
-c0
-4
-    60.0    75.0    0.0
-    50.0    75.0    0.0
-    59.061005    69.124732    0.0
-    60.0    75.0    0.0
-f1679 1
-    -0.0    -0.0    1.0
-c0
-4
-    75.0    70.0    0.0
-    85.0    70.0    0.0
-    75.833333    75.833333    0.0
-    75.0    70.0    0.0
-f1680 1
-    -0.0    -0.0    1.0
-c0
-4
-    65.0    60.0    0.0
-    65.0    70.0    0.0
-    59.061005    69.124732    0.0
-    65.0    60.0    0.0
-f1681 1
-    -0.0    -0.0    1.0
-c0
-4
-    70.0    85.0    0.0
-    70.0    75.0    0.0
-    75.833333    75.833333    0.0
-    70.0    85.0    0.0
-f1682 1
-    -0.0    -0.0    1.0
-c0
-4
-    85.0    50.0    0.0
-    75.0    50.0    0.0
-    75.694641    41.999508    0.0
-    85.0    50.0    0.0
-f1683 1
-    -0.0    -0.0    1.0
-c0
-4
-    70.0    130.0    0.0
-    75.251757    140.264768    0.0
-    64.404075    140.267097    0.0
-    70.0    130.0    0.0
-f1684 1
-    -0.0    -0.0    1.0
-c0
-4
-    95.0    55.0    0.0
-    105.0    55.0    0.0
-    103.688299    63.561663    0.0
-    95.0    55.0    0.0
-f1685 1
-    -0.0    -0.0    1.0
-c0
-4
-    75.694641    41.999508    0.0
-    84.213733    35.434470    0.0
-    87.400546    42.309637    0.0
-    75.694641    41.999508    0.0
-f1686 1
-    -0.0    -0.0    1.0
-c0
-4
-    105.0    35.0    0.0
-    95.0    35.0    0.0
-    101.042621    24.545169    0.0
-    105.0    35.0    0.0
-f1687 1
-    -0.0    -0.0    1.0
-c0
-4
-    140.278895    75.280011    0.0
-    130.0    70.0    0.0
-    140.595711    64.722816    0.0
-    140.278895    75.280011    0.0
-f1688 1
-    -0.0    -0.0    1.0
-c0
-4
-    0.0    10.0    0.0
-    11.200980    11.200980    0.0
-    8.453767    18.603264    0.0
-    0.0    10.0    0.0
-f1689 1
-    -0.0    -0.0    1.0
-c0
-4
-    12.445968    70.136210    0.0
-    8.434218    64.420842    0.0
-    18.609188    66.430114    0.0
-    12.445968    70.136210    0.0
-f1690 1
-    -0.0    -0.0    1.0
-c0
-4
-    133.141953    44.214671    0.0
-    141.662899    53.258805    0.0
-    131.371369    53.404168    0.0
-    133.141953    44.214671    0.0
-f1691 1
-    -0.0    -0.0    1.0
-c0
-4
-    50.0    85.0    0.0
-    50.0    95.0    0.0
-    41.614281    85.335275    0.0
-    50.0    85.0    0.0
-f1692 1
-    -0.0    -0.0    1.0
-c0
-4
-    129.995007    19.974072    0.0
-    137.098136    13.050613    0.0
-    139.966069    21.307290    0.0
-    129.995007    19.974072    0.0
-f1693 1
-    -0.0    -0.0    1.0
-c0
-4
-    68.828810    35.228889    0.0
-    65.338108    25.773643    0.0
-    76.527412    30.897697    0.0
-    68.828810    35.228889    0.0
-f1694 1
-    -0.0    -0.0    1.0
-c0
-4
-    129.995007    19.974072    0.0
-    120.501368    12.594526    0.0
-    128.827884    8.499357    0.0
-    129.995007    19.974072    0.0
-f1695 1
-    -0.0    -0.0    1.0
-c0
-4
-    91.801498    18.472051    0.0
-    82.228317    12.202649    0.0
-    91.946676    7.843044    0.0
-    91.801498    18.472051    0.0
-f1696 1
-    -0.0    -0.0    1.0
-c0
-4
-    110.0    90.0    0.0
-    115.0    100.0    0.0
-    105.0    93.750000    0.0
-    110.0    90.0    0.0
-f1697 1
-    -0.0    -0.0    1.0
-c0
-4
-    137.098136    13.050613    0.0
-    129.995007    19.974072    0.0
-    128.827884    8.499357    0.0
-    137.098136    13.050613    0.0
-f1698 1
-    -0.0    -0.0    1.0
-c0
-4
-    105.0    120.0    0.0
-    100.168579    127.017989    0.0
-    97.944763    115.752998    0.0
-    105.0    120.0    0.0
-f1699 1
-    -0.0    -0.0    1.0
-c0
-4
-    130.0    70.0    0.0
-    120.0    70.0    0.0
-    123.797708    60.522478    0.0
-    130.0    70.0    0.0
-f1700 1
-    -0.0    -0.0    1.0
-c0
-4
-    20.0    0.0    0.0
-    30.0    0.0    0.0
-    21.449462    8.542266    0.0
-    20.0    0.0    0.0
-f1701 1
-    -0.0    -0.0    1.0
-c0
-4
-    60.288498    125.791351    0.0
-    57.486490    136.108877    0.0
-    51.719603    131.938064    0.0
-    60.288498    125.791351    0.0
-f1702 1
-    -0.0    -0.0    1.0
-c0
-4
-    150.0    100.0    0.0
-    139.837376    101.822964    0.0
-    140.370173    94.005807    0.0
-    150.0    100.0    0.0
-f1703 1
-    -0.0    -0.0    1.0
-c0
-4
-    17.749079    92.099243    0.0
-    23.664088    84.058900    0.0
-    27.585350    95.664236    0.0
-    17.749079    92.099243    0.0
-f1704 1
-    -0.0    -0.0    1.0
-c0
-4
-    38.490982    77.052964    0.0
-    37.579518    66.137737    0.0
-    45.306452    68.417906    0.0
-    38.490982    77.052964    0.0
-f1705 1
-    -0.0    -0.0    1.0
-c0
-4
-    50.0    75.0    0.0
-    38.490982    77.052964    0.0
-    45.306452    68.417906    0.0
-    50.0    75.0    0.0
-f1706 1
-    -0.0    -0.0    1.0
-c0
-4
-    101.042621    24.545169    0.0
-    95.0    35.0    0.0
-    93.929683    26.877764    0.0
-    101.042621    24.545169    0.0
-f1707 1
-    -0.0    -0.0    1.0
-c0
-4
-    57.486490    136.108877    0.0
-    60.288498    125.791351    0.0
-    63.067057    132.368281    0.0
-    57.486490    136.108877    0.0
-f1708 1
-    -0.0    -0.0    1.0
-c0
-4
-    0.0    20.0    0.0
-    0.0    10.0    0.0
-    8.453767    18.603264    0.0
-    0.0    20.0    0.0
-f1709 1
-    -0.0    -0.0    1.0
-c0
-4
-    133.141953    44.214671    0.0
-    143.679383    44.854083    0.0
-    141.662899    53.258805    0.0
-    133.141953    44.214671    0.0
-f1710 1
-    -0.0    -0.0    1.0
-c0
-4
-    143.679383    44.854083    0.0
-    133.141953    44.214671    0.0
-    142.522557    36.662226    0.0
-    143.679383    44.854083    0.0
-f1711 1
-    -0.0    -0.0    1.0
-c0
-4
-    48.411609    139.479843    0.0
-    50.0    150.0    0.0
-    40.176600    142.679360    0.0
-    48.411609    139.479843    0.0
-f1712 1
-    -0.0    -0.0    1.0
-c0
-4
-    90.0    150.0    0.0
-    80.0    150.0    0.0
-    84.674521    140.538662    0.0
-    90.0    150.0    0.0
-f1713 1
-    -0.0    -0.0    1.0
-c0
-4
-    150.0    80.0    0.0
-    150.0    90.0    0.0
-    140.416422    84.978258    0.0
-    150.0    80.0    0.0
-f1714 1
-    -0.0    -0.0    1.0
-c0
-4
-    130.0    90.0    0.0
-    130.0    80.0    0.0
-    140.416422    84.978258    0.0
-    130.0    90.0    0.0
-f1715 1
-    -0.0    -0.0    1.0
-c0
-4
-    80.0    130.0    0.0
-    90.0    130.0    0.0
-    84.674521    140.538662    0.0
-    80.0    130.0    0.0
-f1716 1
-    -0.0    -0.0    1.0
-c0
-4
-    40.0    150.0    0.0
-    30.0    150.0    0.0
-    40.176600    142.679360    0.0
-    40.0    150.0    0.0
-f1717 1
-    -0.0    -0.0    1.0
-c0
-4
-    19.737974    18.747335    0.0
-    11.200980    11.200980    0.0
-    21.449462    8.542266    0.0
-    19.737974    18.747335    0.0
-f1718 1
-    -0.0    -0.0    1.0
-c0
-4
-    121.371320    137.852418    0.0
-    120.0    150.0    0.0
-    113.757468    142.828093    0.0
-    121.371320    137.852418    0.0
-f1719 1
-    -0.0    -0.0    1.0
-c0
-4
-    12.150022    121.378177    0.0
-    0.0    120.0    0.0
-    7.113752    113.886231    0.0
-    12.150022    121.378177    0.0
-f1720 1
-    -0.0    -0.0    1.0
-c0
-4
-    95.0    55.0    0.0
-    85.0    60.0    0.0
-    85.0    50.0    0.0
-    95.0    55.0    0.0
-f1721 1
-    -0.0    -0.0    1.0
-c0
-4
-    80.0    90.0    0.0
-    80.0    100.0    0.0
-    70.0    95.0    0.0
-    80.0    90.0    0.0
-f1722 1
-    -0.0    -0.0    1.0
-c0
-4
-    90.0    80.0    0.0
-    80.0    80.0    0.0
-    85.0    70.0    0.0
-    90.0    80.0    0.0
-f1723 1
-    -0.0    -0.0    1.0
-c0
-4
-    80.0    90.0    0.0
-    70.0    95.0    0.0
-    70.0    85.0    0.0
-    80.0    90.0    0.0
-f1724 1
-    -0.0    -0.0    1.0
-c0
-4
-    130.0    90.0    0.0
-    125.0    100.0    0.0
-    120.0    90.0    0.0
-    130.0    90.0    0.0
-f1725 1
-    -0.0    -0.0    1.0
-c0
-4
-    120.0    90.0    0.0
-    115.0    100.0    0.0
-    110.0    90.0    0.0
-    120.0    90.0    0.0
-f1726 1
-    -0.0    -0.0    1.0
-c0
-4
-    80.0    80.0    0.0
-    80.0    90.0    0.0
-    70.0    85.0    0.0
-    80.0    80.0    0.0
-f1727 1
-    -0.0    -0.0    1.0
-c0
-4
-    120.0    90.0    0.0
-    125.0    100.0    0.0
-    115.0    100.0    0.0
-    120.0    90.0    0.0
-f1728 1
-    -0.0    -0.0    1.0
-c0
-4
-    95.0    45.0    0.0
-    95.0    55.0    0.0
-    85.0    50.0    0.0
-    95.0    45.0    0.0
-f1729 1
-    -0.0    -0.0    1.0
-c0
-4
-    130.0    80.0    0.0
-    130.0    70.0    0.0
-    140.278895    75.280011    0.0
-    130.0    80.0    0.0
-f1730 1
-    -0.0    -0.0    1.0
-c0
-4
-    70.0    130.0    0.0
-    80.0    130.0    0.0
-    75.251757    140.264768    0.0
-    70.0    130.0    0.0
-f1731 1
-    -0.0    -0.0    1.0
-c0
-4
-    80.0    150.0    0.0
-    70.0    150.0    0.0
-    75.251757    140.264768    0.0
-    80.0    150.0    0.0
-f1732 1
-    -0.0    -0.0    1.0
-c0
-4
-    150.0    70.0    0.0
-    150.0    80.0    0.0
-    140.278895    75.280011    0.0
-    150.0    70.0    0.0
-f1733 1
-    -0.0    -0.0    1.0
-c0
-4
-    110.118172    134.825297    0.0
-    121.371320    137.852418    0.0
-    113.757468    142.828093    0.0
-    110.118172    134.825297    0.0
-f1734 1
-    -0.0    -0.0    1.0
-c0
-4
-    15.214875    110.231057    0.0
-    12.150022    121.378177    0.0
-    7.113752    113.886231    0.0
-    15.214875    110.231057    0.0
-f1735 1
-    -0.0    -0.0    1.0
-c0
-4
-    137.002395    116.479211    0.0
-    141.600235    124.748677    0.0
-    132.662663    123.544063    0.0
-    137.002395    116.479211    0.0
-f1736 1
-    -0.0    -0.0    1.0
-c0
-4
-    32.574652    137.979453    0.0
-    24.082854    140.812253    0.0
-    25.639720    132.398004    0.0
-    32.574652    137.979453    0.0
-f1737 1
-    -0.0    -0.0    1.0
-c0
-4
-    50.0    125.0    0.0
-    60.288498    125.791351    0.0
-    51.719603    131.938064    0.0
-    50.0    125.0    0.0
-f1738 1
-    -0.0    -0.0    1.0
-c0
-4
-    140.595711    64.722816    0.0
-    130.0    70.0    0.0
-    132.024505    62.251771    0.0
-    140.595711    64.722816    0.0
-f1739 1
-    -0.0    -0.0    1.0
-c0
-4
-    99.765812    138.114335    0.0
-    90.0    130.0    0.0
-    100.168579    127.017989    0.0
-    99.765812    138.114335    0.0
-f1740 1
-    -0.0    -0.0    1.0
-c0
-4
-    70.0    130.0    0.0
-    64.404075    140.267097    0.0
-    63.067057    132.368281    0.0
-    70.0    130.0    0.0
-f1741 1
-    -0.0    -0.0    1.0
-c0
-4
-    30.0    0.0    0.0
-    40.0    0.0    0.0
-    38.683175    8.600292    0.0
-    30.0    0.0    0.0
-f1742 1
-    -0.0    -0.0    1.0
-c0
-4
-    13.553571    46.519504    0.0
-    17.776928    57.199685    0.0
-    7.208772    53.848106    0.0
-    13.553571    46.519504    0.0
-f1743 1
-    -0.0    -0.0    1.0
-c0
-4
-    7.208772    53.848106    0.0
-    0.0    50.0    0.0
-    5.590872    45.325790    0.0
-    7.208772    53.848106    0.0
-f1744 1
-    -0.0    -0.0    1.0
-c0
-4
-    37.690047    20.793319    0.0
-    30.797655    13.397998    0.0
-    38.683175    8.600292    0.0
-    37.690047    20.793319    0.0
-f1745 1
-    -0.0    -0.0    1.0
-c0
-4
-    45.618901    14.680422    0.0
-    37.690047    20.793319    0.0
-    38.683175    8.600292    0.0
-    45.618901    14.680422    0.0
-f1746 1
-    -0.0    -0.0    1.0
-c0
-4
-    123.797708    60.522478    0.0
-    115.0    55.0    0.0
-    123.928571    49.689451    0.0
-    123.797708    60.522478    0.0
-f1747 1
-    -0.0    -0.0    1.0
-c0
-4
-    50.0    150.0    0.0
-    40.0    150.0    0.0
-    40.176600    142.679360    0.0
-    50.0    150.0    0.0
-f1748 1
-    -0.0    -0.0    1.0
-c0
-4
-    150.0    120.0    0.0
-    150.0    130.0    0.0
-    141.600235    124.748677    0.0
-    150.0    120.0    0.0
-f1749 1
-    -0.0    -0.0    1.0
-c0
-4
-    30.0    150.0    0.0
-    20.0    150.0    0.0
-    24.082854    140.812253    0.0
-    30.0    150.0    0.0
-f1750 1
-    -0.0    -0.0    1.0
-c0
-4
-    45.0    30.0    0.0
-    35.0    30.0    0.0
-    37.690047    20.793319    0.0
-    45.0    30.0    0.0
-f1751 1
-    -0.0    -0.0    1.0
-c0
-4
-    110.0    0.0    0.0
-    120.0    0.0    0.0
-    112.106845    8.928571    0.0
-    110.0    0.0    0.0
-f1752 1
-    -0.0    -0.0    1.0
-c0
-4
-    120.501368    12.594526    0.0
-    110.387488    17.936055    0.0
-    112.106845    8.928571    0.0
-    120.501368    12.594526    0.0
-f1753 1
-    -0.0    -0.0    1.0
-c0
-4
-    17.776928    57.199685    0.0
-    24.698162    46.228426    0.0
-    28.656469    55.006894    0.0
-    17.776928    57.199685    0.0
-f1754 1
-    -0.0    -0.0    1.0
-c0
-4
-    110.118172    134.825297    0.0
-    100.168579    127.017989    0.0
-    109.663590    126.064257    0.0
-    110.118172    134.825297    0.0
-f1755 1
-    -0.0    -0.0    1.0
-c0
-4
-    132.981740    107.524243    0.0
-    125.0    100.0    0.0
-    133.160538    98.260036    0.0
-    132.981740    107.524243    0.0
-f1756 1
-    -0.0    -0.0    1.0
-c0
-4
-    37.579518    66.137737    0.0
-    38.490982    77.052964    0.0
-    32.329606    71.984818    0.0
-    37.579518    66.137737    0.0
-f1757 1
-    -0.0    -0.0    1.0
-c0
-4
-    50.0    0.0    0.0
-    60.0    0.0    0.0
-    54.348866    9.304473    0.0
-    50.0    0.0    0.0
-f1758 1
-    -0.0    -0.0    1.0
-c0
-4
-    55.0    30.0    0.0
-    45.0    30.0    0.0
-    46.090061    22.498280    0.0
-    55.0    30.0    0.0
-f1759 1
-    -0.0    -0.0    1.0
-c0
-4
-    53.874411    19.953213    0.0
-    55.0    30.0    0.0
-    46.090061    22.498280    0.0
-    53.874411    19.953213    0.0
-f1760 1
-    -0.0    -0.0    1.0
-c0
-4
-    76.307072    21.678851    0.0
-    86.782127    26.827339    0.0
-    76.527412    30.897697    0.0
-    76.307072    21.678851    0.0
-f1761 1
-    -0.0    -0.0    1.0
-c0
-4
-    86.782127    26.827339    0.0
-    84.213733    35.434470    0.0
-    76.527412    30.897697    0.0
-    86.782127    26.827339    0.0
-f1762 1
-    -0.0    -0.0    1.0
-c0
-4
-    123.797708    60.522478    0.0
-    120.0    70.0    0.0
-    113.510239    62.629064    0.0
-    123.797708    60.522478    0.0
-f1763 1
-    -0.0    -0.0    1.0
-c0
-4
-    38.490982    77.052964    0.0
-    34.178235    88.621671    0.0
-    30.785473    79.702511    0.0
-    38.490982    77.052964    0.0
-f1764 1
-    -0.0    -0.0    1.0
-c0
-4
-    13.553571    46.519504    0.0
-    7.208772    53.848106    0.0
-    5.590872    45.325790    0.0
-    13.553571    46.519504    0.0
-f1765 1
-    -0.0    -0.0    1.0
-c0
-4
-    34.178235    88.621671    0.0
-    38.490982    77.052964    0.0
-    41.614281    85.335275    0.0
-    34.178235    88.621671    0.0
-f1766 1
-    -0.0    -0.0    1.0
-c0
-4
-    24.698162    46.228426    0.0
-    17.618236    37.301409    0.0
-    26.453683    37.295742    0.0
-    24.698162    46.228426    0.0
-f1767 1
-    -0.0    -0.0    1.0
-c0
-4
-    85.0    70.0    0.0
-    80.0    80.0    0.0
-    75.833333    75.833333    0.0
-    85.0    70.0    0.0
-f1768 1
-    -0.0    -0.0    1.0
-c0
-4
-    53.803793    65.027847    0.0
-    65.0    60.0    0.0
-    59.061005    69.124732    0.0
-    53.803793    65.027847    0.0
-f1769 1
-    -0.0    -0.0    1.0
-c0
-4
-    80.0    80.0    0.0
-    70.0    85.0    0.0
-    75.833333    75.833333    0.0
-    80.0    80.0    0.0
-f1770 1
-    -0.0    -0.0    1.0
-c0
-4
-    50.0    75.0    0.0
-    53.803793    65.027847    0.0
-    59.061005    69.124732    0.0
-    50.0    75.0    0.0
-f1771 1
-    -0.0    -0.0    1.0
-c0
-4
-    32.574652    137.979453    0.0
-    25.639720    132.398004    0.0
-    34.726100    130.359560    0.0
-    32.574652    137.979453    0.0
-f1772 1
-    -0.0    -0.0    1.0
-c0
-4
-    137.002395    116.479211    0.0
-    132.662663    123.544063    0.0
-    130.389047    115.347617    0.0
-    137.002395    116.479211    0.0
-f1773 1
-    -0.0    -0.0    1.0
-c0
-4
-    76.307072    21.678851    0.0
-    82.228317    12.202649    0.0
-    83.844508    19.602749    0.0
-    76.307072    21.678851    0.0
-f1774 1
-    -0.0    -0.0    1.0
-c0
-4
-    0.0    30.0    0.0
-    11.141130    27.339435    0.0
-    8.115281    36.912919    0.0
-    0.0    30.0    0.0
-f1775 1
-    -0.0    -0.0    1.0
-c0
-4
-    24.346784    28.582905    0.0
-    35.0    30.0    0.0
-    26.453683    37.295742    0.0
-    24.346784    28.582905    0.0
-f1776 1
-    -0.0    -0.0    1.0
-c0
-4
-    15.214875    110.231057    0.0
-    11.637552    100.043056    0.0
-    21.080689    102.243806    0.0
-    15.214875    110.231057    0.0
-f1777 1
-    -0.0    -0.0    1.0
-c0
-4
-    70.0    120.0    0.0
-    70.0    130.0    0.0
-    60.288498    125.791351    0.0
-    70.0    120.0    0.0
-f1778 1
-    -0.0    -0.0    1.0
-c0
-4
-    50.0    115.0    0.0
-    50.0    105.0    0.0
-    58.558278    110.247453    0.0
-    50.0    115.0    0.0
-f1779 1
-    -0.0    -0.0    1.0
-c0
-4
-    25.219648    73.707572    0.0
-    23.664088    84.058900    0.0
-    17.026202    75.715889    0.0
-    25.219648    73.707572    0.0
-f1780 1
-    -0.0    -0.0    1.0
-c0
-4
-    65.0    50.0    0.0
-    55.0    50.0    0.0
-    63.346444    41.653556    0.0
-    65.0    50.0    0.0
-f1781 1
-    -0.0    -0.0    1.0
-c0
-4
-    55.0    50.0    0.0
-    55.0    40.0    0.0
-    63.346444    41.653556    0.0
-    55.0    50.0    0.0
-f1782 1
-    -0.0    -0.0    1.0
-c0
-4
-    19.737974    18.747335    0.0
-    11.141130    27.339435    0.0
-    8.453767    18.603264    0.0
-    19.737974    18.747335    0.0
-f1783 1
-    -0.0    -0.0    1.0
-c0
-4
-    21.529103    118.051155    0.0
-    15.214875    110.231057    0.0
-    23.565476    110.0    0.0
-    21.529103    118.051155    0.0
-f1784 1
-    -0.0    -0.0    1.0
-c0
-4
-    118.031198    128.477998    0.0
-    110.118172    134.825297    0.0
-    109.663590    126.064257    0.0
-    118.031198    128.477998    0.0
-f1785 1
-    -0.0    -0.0    1.0
-c0
-4
-    115.0    55.0    0.0
-    123.797708    60.522478    0.0
-    113.510239    62.629064    0.0
-    115.0    55.0    0.0
-f1786 1
-    -0.0    -0.0    1.0
-c0
-4
-    23.664088    84.058900    0.0
-    34.178235    88.621671    0.0
-    27.585350    95.664236    0.0
-    23.664088    84.058900    0.0
-f1787 1
-    -0.0    -0.0    1.0
-c0
-4
-    12.232570    82.226024    0.0
-    17.749079    92.099243    0.0
-    8.489054    90.208703    0.0
-    12.232570    82.226024    0.0
-f1788 1
-    -0.0    -0.0    1.0
-c0
-4
-    100.0    150.0    0.0
-    99.765812    138.114335    0.0
-    106.728290    143.153545    0.0
-    100.0    150.0    0.0
-f1789 1
-    -0.0    -0.0    1.0
-c0
-4
-    82.228317    12.202649    0.0
-    91.801498    18.472051    0.0
-    83.844508    19.602749    0.0
-    82.228317    12.202649    0.0
-f1790 1
-    -0.0    -0.0    1.0
-c0
-4
-    24.698162    46.228426    0.0
-    35.0    50.0    0.0
-    28.656469    55.006894    0.0
-    24.698162    46.228426    0.0
-f1791 1
-    -0.0    -0.0    1.0
-c0
-4
-    99.765812    138.114335    0.0
-    100.0    150.0    0.0
-    92.795371    142.967207    0.0
-    99.765812    138.114335    0.0
-f1792 1
-    -0.0    -0.0    1.0
-c0
-4
-    76.307072    21.678851    0.0
-    65.338108    25.773643    0.0
-    68.720332    18.527429    0.0
-    76.307072    21.678851    0.0
-f1793 1
-    -0.0    -0.0    1.0
-c0
-4
-    53.803793    65.027847    0.0
-    47.475722    59.210916    0.0
-    57.436460    57.330215    0.0
-    53.803793    65.027847    0.0
-f1794 1
-    -0.0    -0.0    1.0
-c0
-4
-    8.115281    36.912919    0.0
-    13.553571    46.519504    0.0
-    5.590872    45.325790    0.0
-    8.115281    36.912919    0.0
-f1795 1
-    -0.0    -0.0    1.0
-c0
-4
-    54.348866    9.304473    0.0
-    61.868040    15.728007    0.0
-    53.874411    19.953213    0.0
-    54.348866    9.304473    0.0
-f1796 1
-    -0.0    -0.0    1.0
-c0
-4
-    45.618901    14.680422    0.0
-    54.348866    9.304473    0.0
-    53.874411    19.953213    0.0
-    45.618901    14.680422    0.0
-f1797 1
-    -0.0    -0.0    1.0
-c0
-4
-    135.065020    31.189542    0.0
-    126.326511    36.142829    0.0
-    126.348396    27.940089    0.0
-    135.065020    31.189542    0.0
-f1798 1
-    -0.0    -0.0    1.0
-c0
-4
-    99.765812    138.114335    0.0
-    110.118172    134.825297    0.0
-    106.728290    143.153545    0.0
-    99.765812    138.114335    0.0
-f1799 1
-    -0.0    -0.0    1.0
-c0
-4
-    11.200980    11.200980    0.0
-    19.737974    18.747335    0.0
-    8.453767    18.603264    0.0
-    11.200980    11.200980    0.0
-f1800 1
-    -0.0    -0.0    1.0
-c0
-4
-    12.232570    82.226024    0.0
-    0.0    80.0    0.0
-    7.029187    74.646188    0.0
-    12.232570    82.226024    0.0
-f1801 1
-    -0.0    -0.0    1.0
-c0
-4
-    11.637552    100.043056    0.0
-    17.749079    92.099243    0.0
-    21.080689    102.243806    0.0
-    11.637552    100.043056    0.0
-f1802 1
-    -0.0    -0.0    1.0
-c0
-4
-    21.529103    118.051155    0.0
-    30.0    125.0    0.0
-    18.883944    126.925543    0.0
-    21.529103    118.051155    0.0
-f1803 1
-    -0.0    -0.0    1.0
-c0
-4
-    118.031198    128.477998    0.0
-    125.0    120.0    0.0
-    126.953827    131.020034    0.0
-    118.031198    128.477998    0.0
-f1804 1
-    -0.0    -0.0    1.0
-c0
-4
-    110.387488    17.936055    0.0
-    102.650243    11.159583    0.0
-    112.106845    8.928571    0.0
-    110.387488    17.936055    0.0
-f1805 1
-    -0.0    -0.0    1.0
-c0
-4
-    30.0    125.0    0.0
-    25.639720    132.398004    0.0
-    18.883944    126.925543    0.0
-    30.0    125.0    0.0
-f1806 1
-    -0.0    -0.0    1.0
-c0
-4
-    125.0    120.0    0.0
-    132.662663    123.544063    0.0
-    126.953827    131.020034    0.0
-    125.0    120.0    0.0
-f1807 1
-    -0.0    -0.0    1.0
-c0
-4
-    126.326511    36.142829    0.0
-    133.141953    44.214671    0.0
-    122.077185    42.369846    0.0
-    126.326511    36.142829    0.0
-f1808 1
-    -0.0    -0.0    1.0
-c0
-4
-    95.0    35.0    0.0
-    86.782127    26.827339    0.0
-    93.929683    26.877764    0.0
-    95.0    35.0    0.0
-f1809 1
-    -0.0    -0.0    1.0
-c0
-4
-    100.0    0.0    0.0
-    102.650243    11.159583    0.0
-    91.946676    7.843044    0.0
-    100.0    0.0    0.0
-f1810 1
-    -0.0    -0.0    1.0
-c0
-4
-    21.080689    102.243806    0.0
-    17.749079    92.099243    0.0
-    27.585350    95.664236    0.0
-    21.080689    102.243806    0.0
-f1811 1
-    -0.0    -0.0    1.0
-c0
-4
-    0.0    60.0    0.0
-    0.0    50.0    0.0
-    7.208772    53.848106    0.0
-    0.0    60.0    0.0
-f1812 1
-    -0.0    -0.0    1.0
-c0
-4
-    45.0    30.0    0.0
-    37.690047    20.793319    0.0
-    46.090061    22.498280    0.0
-    45.0    30.0    0.0
-f1813 1
-    -0.0    -0.0    1.0
-c0
-4
-    150.0    100.0    0.0
-    150.0    110.0    0.0
-    142.405411    108.529006    0.0
-    150.0    100.0    0.0
-f1814 1
-    -0.0    -0.0    1.0
-c0
-4
-    125.0    110.0    0.0
-    125.0    100.0    0.0
-    132.981740    107.524243    0.0
-    125.0    110.0    0.0
-f1815 1
-    -0.0    -0.0    1.0
-c0
-4
-    91.946676    7.843044    0.0
-    82.228317    12.202649    0.0
-    85.0    5.223980    0.0
-    91.946676    7.843044    0.0
-f1816 1
-    -0.0    -0.0    1.0
-c0
-4
-    130.0    70.0    0.0
-    123.797708    60.522478    0.0
-    132.024505    62.251771    0.0
-    130.0    70.0    0.0
-f1817 1
-    -0.0    -0.0    1.0
-c0
-4
-    40.0    125.0    0.0
-    50.0    125.0    0.0
-    42.411417    133.310248    0.0
-    40.0    125.0    0.0
-f1818 1
-    -0.0    -0.0    1.0
-c0
-4
-    25.219648    73.707572    0.0
-    17.026202    75.715889    0.0
-    18.609188    66.430114    0.0
-    25.219648    73.707572    0.0
-f1819 1
-    -0.0    -0.0    1.0
-c0
-4
-    35.0    30.0    0.0
-    35.0    40.0    0.0
-    26.453683    37.295742    0.0
-    35.0    30.0    0.0
-f1820 1
-    -0.0    -0.0    1.0
-c0
-4
-    63.346444    41.653556    0.0
-    68.828810    35.228889    0.0
-    75.694641    41.999508    0.0
-    63.346444    41.653556    0.0
-f1821 1
-    -0.0    -0.0    1.0
-c0
-4
-    86.782127    26.827339    0.0
-    91.801498    18.472051    0.0
-    93.929683    26.877764    0.0
-    86.782127    26.827339    0.0
-f1822 1
-    -0.0    -0.0    1.0
-c0
-4
-    11.141130    27.339435    0.0
-    17.618236    37.301409    0.0
-    8.115281    36.912919    0.0
-    11.141130    27.339435    0.0
-f1823 1
-    -0.0    -0.0    1.0
-c0
-4
-    115.0    55.0    0.0
-    115.0    45.0    0.0
-    123.928571    49.689451    0.0
-    115.0    55.0    0.0
-f1824 1
-    -0.0    -0.0    1.0
-c0
-4
-    48.411609    139.479843    0.0
-    57.486490    136.108877    0.0
-    56.060435    143.171163    0.0
-    48.411609    139.479843    0.0
-f1825 1
-    -0.0    -0.0    1.0
-c0
-4
-    50.0    150.0    0.0
-    48.411609    139.479843    0.0
-    56.060435    143.171163    0.0
-    50.0    150.0    0.0
-f1826 1
-    -0.0    -0.0    1.0
-c0
-4
-    75.251757    140.264768    0.0
-    70.0    150.0    0.0
-    64.404075    140.267097    0.0
-    75.251757    140.264768    0.0
-f1827 1
-    -0.0    -0.0    1.0
-c0
-4
-    53.803793    65.027847    0.0
-    50.0    75.0    0.0
-    45.306452    68.417906    0.0
-    53.803793    65.027847    0.0
-f1828 1
-    -0.0    -0.0    1.0
-c0
-4
-    27.496602    64.142612    0.0
-    25.219648    73.707572    0.0
-    18.609188    66.430114    0.0
-    27.496602    64.142612    0.0
-f1829 1
-    -0.0    -0.0    1.0
-c0
-4
-    17.749079    92.099243    0.0
-    11.637552    100.043056    0.0
-    8.489054    90.208703    0.0
-    17.749079    92.099243    0.0
-f1830 1
-    -0.0    -0.0    1.0
-c0
-4
-    118.705376    23.433747    0.0
-    115.0    35.0    0.0
-    110.0    27.157738    0.0
-    118.705376    23.433747    0.0
-f1831 1
-    -0.0    -0.0    1.0
-c0
-4
-    110.387488    17.936055    0.0
-    118.705376    23.433747    0.0
-    110.0    27.157738    0.0
-    110.387488    17.936055    0.0
-f1832 1
-    -0.0    -0.0    1.0
-c0
-4
-    42.411417    133.310248    0.0
-    50.0    125.0    0.0
-    51.719603    131.938064    0.0
-    42.411417    133.310248    0.0
-f1833 1
-    -0.0    -0.0    1.0
-c0
-4
-    90.0    110.0    0.0
-    90.0    100.0    0.0
-    97.500000    107.500000    0.0
-    90.0    110.0    0.0
-f1834 1
-    -0.0    -0.0    1.0
-c0
-4
-    57.486490    136.108877    0.0
-    48.411609    139.479843    0.0
-    51.719603    131.938064    0.0
-    57.486490    136.108877    0.0
-f1835 1
-    -0.0    -0.0    1.0
-c0
-4
-    54.348866    9.304473    0.0
-    60.0    0.0    0.0
-    63.566362    7.551356    0.0
-    54.348866    9.304473    0.0
-f1836 1
-    -0.0    -0.0    1.0
-c0
-4
-    105.0    35.0    0.0
-    101.042621    24.545169    0.0
-    110.0    27.157738    0.0
-    105.0    35.0    0.0
-f1837 1
-    -0.0    -0.0    1.0
-c0
-4
-    101.042621    24.545169    0.0
-    110.387488    17.936055    0.0
-    110.0    27.157738    0.0
-    101.042621    24.545169    0.0
-f1838 1
-    -0.0    -0.0    1.0
-c0
-4
-    150.0    70.0    0.0
-    140.278895    75.280011    0.0
-    140.595711    64.722816    0.0
-    150.0    70.0    0.0
-f1839 1
-    -0.0    -0.0    1.0
-c0
-4
-    91.801498    18.472051    0.0
-    101.042621    24.545169    0.0
-    93.929683    26.877764    0.0
-    91.801498    18.472051    0.0
-f1840 1
-    -0.0    -0.0    1.0
-c0
-4
-    150.0    120.0    0.0
-    141.600235    124.748677    0.0
-    144.201608    115.951379    0.0
-    150.0    120.0    0.0
-f1841 1
-    -0.0    -0.0    1.0
-c0
-4
-    102.916667    72.916667    0.0
-    100.0    80.0    0.0
-    92.736605    72.569745    0.0
-    102.916667    72.916667    0.0
-f1842 1
-    -0.0    -0.0    1.0
-c0
-4
-    24.346784    28.582905    0.0
-    19.737974    18.747335    0.0
-    29.440043    22.121823    0.0
-    24.346784    28.582905    0.0
-f1843 1
-    -0.0    -0.0    1.0
-c0
-4
-    91.801498    18.472051    0.0
-    86.782127    26.827339    0.0
-    83.844508    19.602749    0.0
-    91.801498    18.472051    0.0
-f1844 1
-    -0.0    -0.0    1.0
-c0
-4
-    11.200980    11.200980    0.0
-    0.0    10.0    0.0
-    6.674229    5.666961    0.0
-    11.200980    11.200980    0.0
-f1845 1
-    -0.0    -0.0    1.0
-c0
-4
-    115.0    35.0    0.0
-    126.326511    36.142829    0.0
-    122.077185    42.369846    0.0
-    115.0    35.0    0.0
-f1846 1
-    -0.0    -0.0    1.0
-c0
-4
-    141.662899    53.258805    0.0
-    136.734616    58.605627    0.0
-    131.371369    53.404168    0.0
-    141.662899    53.258805    0.0
-f1847 1
-    -0.0    -0.0    1.0
-c0
-4
-    139.837376    101.822964    0.0
-    132.981740    107.524243    0.0
-    133.160538    98.260036    0.0
-    139.837376    101.822964    0.0
-f1848 1
-    -0.0    -0.0    1.0
-c0
-4
-    92.736605    72.569745    0.0
-    85.0    70.0    0.0
-    92.625170    63.055491    0.0
-    92.736605    72.569745    0.0
-f1849 1
-    -0.0    -0.0    1.0
-c0
-4
-    139.966069    21.307290    0.0
-    150.0    20.0    0.0
-    143.510729    27.831812    0.0
-    139.966069    21.307290    0.0
-f1850 1
-    -0.0    -0.0    1.0
-c0
-4
-    90.0    0.0    0.0
-    100.0    0.0    0.0
-    91.946676    7.843044    0.0
-    90.0    0.0    0.0
-f1851 1
-    -0.0    -0.0    1.0
-c0
-4
-    86.782127    26.827339    0.0
-    76.307072    21.678851    0.0
-    83.844508    19.602749    0.0
-    86.782127    26.827339    0.0
-f1852 1
-    -0.0    -0.0    1.0
-c0
-4
-    35.0    30.0    0.0
-    24.346784    28.582905    0.0
-    29.440043    22.121823    0.0
-    35.0    30.0    0.0
-f1853 1
-    -0.0    -0.0    1.0
-c0
-4
-    141.600235    124.748677    0.0
-    137.002395    116.479211    0.0
-    144.201608    115.951379    0.0
-    141.600235    124.748677    0.0
-f1854 1
-    -0.0    -0.0    1.0
-c0
-4
-    27.496602    64.142612    0.0
-    17.776928    57.199685    0.0
-    28.656469    55.006894    0.0
-    27.496602    64.142612    0.0
-f1855 1
-    -0.0    -0.0    1.0
-c0
-4
-    133.141953    44.214671    0.0
-    123.928571    49.689451    0.0
-    122.077185    42.369846    0.0
-    133.141953    44.214671    0.0
-f1856 1
-    -0.0    -0.0    1.0
-c0
-4
-    70.0    150.0    0.0
-    60.0    150.0    0.0
-    64.404075    140.267097    0.0
-    70.0    150.0    0.0
-f1857 1
-    -0.0    -0.0    1.0
-c0
-4
-    64.404075    140.267097    0.0
-    60.0    150.0    0.0
-    56.060435    143.171163    0.0
-    64.404075    140.267097    0.0
-f1858 1
-    -0.0    -0.0    1.0
-c0
-4
-    0.0    40.0    0.0
-    0.0    30.0    0.0
-    8.115281    36.912919    0.0
-    0.0    40.0    0.0
-f1859 1
-    -0.0    -0.0    1.0
-c0
-4
-    58.558278    110.247453    0.0
-    70.0    110.0    0.0
-    62.717249    117.213871    0.0
-    58.558278    110.247453    0.0
-f1860 1
-    -0.0    -0.0    1.0
-c0
-4
-    150.0    60.0    0.0
-    150.0    70.0    0.0
-    140.595711    64.722816    0.0
-    150.0    60.0    0.0
-f1861 1
-    -0.0    -0.0    1.0
-c0
-4
-    150.0    20.0    0.0
-    150.0    30.0    0.0
-    143.510729    27.831812    0.0
-    150.0    20.0    0.0
-f1862 1
-    -0.0    -0.0    1.0
-c0
-4
-    70.0    0.0    0.0
-    71.368107    10.929214    0.0
-    63.566362    7.551356    0.0
-    70.0    0.0    0.0
-f1863 1
-    -0.0    -0.0    1.0
-c0
-4
-    30.0    115.0    0.0
-    30.0    125.0    0.0
-    21.529103    118.051155    0.0
-    30.0    115.0    0.0
-f1864 1
-    -0.0    -0.0    1.0
-c0
-4
-    115.0    120.0    0.0
-    125.0    120.0    0.0
-    118.031198    128.477998    0.0
-    115.0    120.0    0.0
-f1865 1
-    -0.0    -0.0    1.0
-c0
-4
-    140.416422    84.978258    0.0
-    150.0    90.0    0.0
-    140.370173    94.005807    0.0
-    140.416422    84.978258    0.0
-f1866 1
-    -0.0    -0.0    1.0
-c0
-4
-    17.066882    135.286602    0.0
-    9.406682    140.593318    0.0
-    8.453205    129.986144    0.0
-    17.066882    135.286602    0.0
-f1867 1
-    -0.0    -0.0    1.0
-c0
-4
-    135.286602    132.933118    0.0
-    140.593318    140.593318    0.0
-    129.985889    141.546886    0.0
-    135.286602    132.933118    0.0
-f1868 1
-    -0.0    -0.0    1.0
-c0
-4
-    28.656469    55.006894    0.0
-    35.0    50.0    0.0
-    37.574633    57.439569    0.0
-    28.656469    55.006894    0.0
-f1869 1
-    -0.0    -0.0    1.0
-c0
-4
-    125.0    100.0    0.0
-    130.0    90.0    0.0
-    133.160538    98.260036    0.0
-    125.0    100.0    0.0
-f1870 1
-    -0.0    -0.0    1.0
-c0
-4
-    47.475722    59.210916    0.0
-    53.803793    65.027847    0.0
-    45.306452    68.417906    0.0
-    47.475722    59.210916    0.0
-f1871 1
-    -0.0    -0.0    1.0
-c0
-4
-    102.650243    11.159583    0.0
-    91.801498    18.472051    0.0
-    91.946676    7.843044    0.0
-    102.650243    11.159583    0.0
-f1872 1
-    -0.0    -0.0    1.0
-c0
-4
-    0.0    100.0    0.0
-    11.637552    100.043056    0.0
-    6.793236    106.832069    0.0
-    0.0    100.0    0.0
-f1873 1
-    -0.0    -0.0    1.0
-c0
-4
-    85.0    60.0    0.0
-    95.0    55.0    0.0
-    92.625170    63.055491    0.0
-    85.0    60.0    0.0
-f1874 1
-    -0.0    -0.0    1.0
-c0
-4
-    90.0    80.0    0.0
-    85.0    70.0    0.0
-    92.736605    72.569745    0.0
-    90.0    80.0    0.0
-f1875 1
-    -0.0    -0.0    1.0
-c0
-4
-    118.705376    23.433747    0.0
-    129.995007    19.974072    0.0
-    126.348396    27.940089    0.0
-    118.705376    23.433747    0.0
-f1876 1
-    -0.0    -0.0    1.0
-c0
-4
-    50.0    115.0    0.0
-    58.558278    110.247453    0.0
-    56.115628    118.941932    0.0
-    50.0    115.0    0.0
-f1877 1
-    -0.0    -0.0    1.0
-c0
-4
-    17.618236    37.301409    0.0
-    24.346784    28.582905    0.0
-    26.453683    37.295742    0.0
-    17.618236    37.301409    0.0
-f1878 1
-    -0.0    -0.0    1.0
-c0
-4
-    95.0    45.0    0.0
-    85.0    50.0    0.0
-    87.400546    42.309637    0.0
-    95.0    45.0    0.0
-f1879 1
-    -0.0    -0.0    1.0
-c0
-4
-    85.0    70.0    0.0
-    85.0    60.0    0.0
-    92.625170    63.055491    0.0
-    85.0    70.0    0.0
-f1880 1
-    -0.0    -0.0    1.0
-c0
-4
-    100.0    80.0    0.0
-    90.0    80.0    0.0
-    92.736605    72.569745    0.0
-    100.0    80.0    0.0
-f1881 1
-    -0.0    -0.0    1.0
-c0
-4
-    57.486490    136.108877    0.0
-    64.404075    140.267097    0.0
-    56.060435    143.171163    0.0
-    57.486490    136.108877    0.0
-f1882 1
-    -0.0    -0.0    1.0
-c0
-4
-    95.0    35.0    0.0
-    95.0    45.0    0.0
-    87.400546    42.309637    0.0
-    95.0    35.0    0.0
-f1883 1
-    -0.0    -0.0    1.0
-c0
-4
-    70.0    95.0    0.0
-    80.0    100.0    0.0
-    72.556388    102.556388    0.0
-    70.0    95.0    0.0
-f1884 1
-    -0.0    -0.0    1.0
-c0
-4
-    65.0    50.0    0.0
-    65.0    60.0    0.0
-    57.436460    57.330215    0.0
-    65.0    50.0    0.0
-f1885 1
-    -0.0    -0.0    1.0
-c0
-4
-    55.0    50.0    0.0
-    65.0    50.0    0.0
-    57.436460    57.330215    0.0
-    55.0    50.0    0.0
-f1886 1
-    -0.0    -0.0    1.0
-c0
-4
-    65.0    60.0    0.0
-    53.803793    65.027847    0.0
-    57.436460    57.330215    0.0
-    65.0    60.0    0.0
-f1887 1
-    -0.0    -0.0    1.0
-c0
-4
-    21.449462    8.542266    0.0
-    11.200980    11.200980    0.0
-    15.0    5.128770    0.0
-    21.449462    8.542266    0.0
-f1888 1
-    -0.0    -0.0    1.0
-c0
-4
-    70.0    110.0    0.0
-    58.558278    110.247453    0.0
-    64.687500    102.708333    0.0
-    70.0    110.0    0.0
-f1889 1
-    -0.0    -0.0    1.0
-c0
-4
-    80.0    100.0    0.0
-    80.0    110.0    0.0
-    72.556388    102.556388    0.0
-    80.0    100.0    0.0
-f1890 1
-    -0.0    -0.0    1.0
-c0
-4
-    80.0    110.0    0.0
-    70.0    110.0    0.0
-    72.556388    102.556388    0.0
-    80.0    110.0    0.0
-f1891 1
-    -0.0    -0.0    1.0
-c0
-4
-    25.219648    73.707572    0.0
-    27.496602    64.142612    0.0
-    32.329606    71.984818    0.0
-    25.219648    73.707572    0.0
-f1892 1
-    -0.0    -0.0    1.0
-c0
-4
-    27.496602    64.142612    0.0
-    37.579518    66.137737    0.0
-    32.329606    71.984818    0.0
-    27.496602    64.142612    0.0
-f1893 1
-    -0.0    -0.0    1.0
-c0
-4
-    100.168579    127.017989    0.0
-    105.0    120.0    0.0
-    109.663590    126.064257    0.0
-    100.168579    127.017989    0.0
-f1894 1
-    -0.0    -0.0    1.0
-c0
-4
-    70.0    110.0    0.0
-    70.0    120.0    0.0
-    62.717249    117.213871    0.0
-    70.0    110.0    0.0
-f1895 1
-    -0.0    -0.0    1.0
-c0
-4
-    61.868040    15.728007    0.0
-    54.348866    9.304473    0.0
-    63.566362    7.551356    0.0
-    61.868040    15.728007    0.0
-f1896 1
-    -0.0    -0.0    1.0
-c0
-4
-    11.637552    100.043056    0.0
-    15.214875    110.231057    0.0
-    6.793236    106.832069    0.0
-    11.637552    100.043056    0.0
-f1897 1
-    -0.0    -0.0    1.0
-c0
-4
-    45.0    50.0    0.0
-    47.475722    59.210916    0.0
-    37.574633    57.439569    0.0
-    45.0    50.0    0.0
-f1898 1
-    -0.0    -0.0    1.0
-c0
-4
-    24.082854    140.812253    0.0
-    17.066882    135.286602    0.0
-    25.639720    132.398004    0.0
-    24.082854    140.812253    0.0
-f1899 1
-    -0.0    -0.0    1.0
-c0
-4
-    141.600235    124.748677    0.0
-    135.286602    132.933118    0.0
-    132.662663    123.544063    0.0
-    141.600235    124.748677    0.0
-f1900 1
-    -0.0    -0.0    1.0
-c0
-4
-    68.828810    35.228889    0.0
-    76.527412    30.897697    0.0
-    75.694641    41.999508    0.0
-    68.828810    35.228889    0.0
-f1901 1
-    -0.0    -0.0    1.0
-c0
-4
-    76.527412    30.897697    0.0
-    84.213733    35.434470    0.0
-    75.694641    41.999508    0.0
-    76.527412    30.897697    0.0
-f1902 1
-    -0.0    -0.0    1.0
-c0
-4
-    105.0    110.0    0.0
-    105.0    120.0    0.0
-    97.944763    115.752998    0.0
-    105.0    110.0    0.0
-f1903 1
-    -0.0    -0.0    1.0
-c0
-4
-    90.0    120.0    0.0
-    90.0    110.0    0.0
-    97.944763    115.752998    0.0
-    90.0    120.0    0.0
-f1904 1
-    -0.0    -0.0    1.0
-c0
-4
-    150.0    40.0    0.0
-    150.0    50.0    0.0
-    143.679383    44.854083    0.0
-    150.0    40.0    0.0
-f1905 1
-    -0.0    -0.0    1.0
-c0
-4
-    115.0    35.0    0.0
-    105.0    35.0    0.0
-    110.0    27.157738    0.0
-    115.0    35.0    0.0
-f1906 1
-    -0.0    -0.0    1.0
-c0
-4
-    150.0    90.0    0.0
-    150.0    100.0    0.0
-    140.370173    94.005807    0.0
-    150.0    90.0    0.0
-f1907 1
-    -0.0    -0.0    1.0
-c0
-4
-    150.0    50.0    0.0
-    150.0    60.0    0.0
-    141.662899    53.258805    0.0
-    150.0    50.0    0.0
-f1908 1
-    -0.0    -0.0    1.0
-c0
-4
-    150.0    30.0    0.0
-    150.0    40.0    0.0
-    142.522557    36.662226    0.0
-    150.0    30.0    0.0
-f1909 1
-    -0.0    -0.0    1.0
-c0
-4
-    71.368107    10.929214    0.0
-    70.0    0.0    0.0
-    77.305876    6.318889    0.0
-    71.368107    10.929214    0.0
-f1910 1
-    -0.0    -0.0    1.0
-c0
-4
-    20.0    150.0    0.0
-    10.0    150.0    0.0
-    16.580693    142.992343    0.0
-    20.0    150.0    0.0
-f1911 1
-    -0.0    -0.0    1.0
-c0
-4
-    150.0    130.0    0.0
-    150.0    140.0    0.0
-    142.856789    133.118980    0.0
-    150.0    130.0    0.0
-f1912 1
-    -0.0    -0.0    1.0
-c0
-4
-    60.0    0.0    0.0
-    70.0    0.0    0.0
-    63.566362    7.551356    0.0
-    60.0    0.0    0.0
-f1913 1
-    -0.0    -0.0    1.0
-c0
-4
-    0.0    120.0    0.0
-    0.0    110.0    0.0
-    7.113752    113.886231    0.0
-    0.0    120.0    0.0
-f1914 1
-    -0.0    -0.0    1.0
-c0
-4
-    120.0    150.0    0.0
-    110.0    150.0    0.0
-    113.757468    142.828093    0.0
-    120.0    150.0    0.0
-f1915 1
-    -0.0    -0.0    1.0
-c0
-4
-    35.0    50.0    0.0
-    45.0    50.0    0.0
-    37.574633    57.439569    0.0
-    35.0    50.0    0.0
-f1916 1
-    -0.0    -0.0    1.0
-c0
-4
-    41.444005    96.212097    0.0
-    34.178235    88.621671    0.0
-    41.614281    85.335275    0.0
-    41.444005    96.212097    0.0
-f1917 1
-    -0.0    -0.0    1.0
-c0
-4
-    60.0    95.0    0.0
-    70.0    95.0    0.0
-    64.687500    102.708333    0.0
-    60.0    95.0    0.0
-f1918 1
-    -0.0    -0.0    1.0
-c0
-4
-    37.690047    20.793319    0.0
-    35.0    30.0    0.0
-    29.440043    22.121823    0.0
-    37.690047    20.793319    0.0
-f1919 1
-    -0.0    -0.0    1.0
-c0
-4
-    115.0    45.0    0.0
-    115.0    35.0    0.0
-    122.077185    42.369846    0.0
-    115.0    45.0    0.0
-f1920 1
-    -0.0    -0.0    1.0
-c0
-4
-    71.368107    10.929214    0.0
-    61.868040    15.728007    0.0
-    63.566362    7.551356    0.0
-    71.368107    10.929214    0.0
-f1921 1
-    -0.0    -0.0    1.0
-c0
-4
-    17.026202    75.715889    0.0
-    12.445968    70.136210    0.0
-    18.609188    66.430114    0.0
-    17.026202    75.715889    0.0
-f1922 1
-    -0.0    -0.0    1.0
-c0
-4
-    17.066882    135.286602    0.0
-    24.082854    140.812253    0.0
-    16.580693    142.992343    0.0
-    17.066882    135.286602    0.0
-f1923 1
-    -0.0    -0.0    1.0
-c0
-4
-    135.286602    132.933118    0.0
-    141.600235    124.748677    0.0
-    142.856789    133.118980    0.0
-    135.286602    132.933118    0.0
-f1924 1
-    -0.0    -0.0    1.0
-c0
-4
-    7.029187    74.646188    0.0
-    0.0    70.0    0.0
-    8.434218    64.420842    0.0
-    7.029187    74.646188    0.0
-f1925 1
-    -0.0    -0.0    1.0
-c0
-4
-    30.0    115.0    0.0
-    21.529103    118.051155    0.0
-    23.565476    110.0    0.0
-    30.0    115.0    0.0
-f1926 1
-    -0.0    -0.0    1.0
-c0
-4
-    115.0    120.0    0.0
-    118.031198    128.477998    0.0
-    109.663590    126.064257    0.0
-    115.0    120.0    0.0
-f1927 1
-    -0.0    -0.0    1.0
-c0
-4
-    65.338108    25.773643    0.0
-    61.868040    15.728007    0.0
-    68.720332    18.527429    0.0
-    65.338108    25.773643    0.0
-f1928 1
-    -0.0    -0.0    1.0
-c0
-4
-    98.014069    67.770563    0.0
-    102.916667    72.916667    0.0
-    92.736605    72.569745    0.0
-    98.014069    67.770563    0.0
-f1929 1
-    -0.0    -0.0    1.0
-c0
-4
-    110.0    150.0    0.0
-    100.0    150.0    0.0
-    106.728290    143.153545    0.0
-    110.0    150.0    0.0
-f1930 1
-    -0.0    -0.0    1.0
-c0
-4
-    30.0    105.0    0.0
-    21.080689    102.243806    0.0
-    27.585350    95.664236    0.0
-    30.0    105.0    0.0
-f1931 1
-    -0.0    -0.0    1.0
-c0
-4
-    90.0    150.0    0.0
-    84.674521    140.538662    0.0
-    92.795371    142.967207    0.0
-    90.0    150.0    0.0
-f1932 1
-    -0.0    -0.0    1.0
-c0
-4
-    100.0    150.0    0.0
-    90.0    150.0    0.0
-    92.795371    142.967207    0.0
-    100.0    150.0    0.0
-f1933 1
-    -0.0    -0.0    1.0
-c0
-4
-    110.0    70.0    0.0
-    110.0    80.0    0.0
-    102.916667    72.916667    0.0
-    110.0    70.0    0.0
-f1934 1
-    -0.0    -0.0    1.0
-c0
-4
-    110.0    80.0    0.0
-    100.0    80.0    0.0
-    102.916667    72.916667    0.0
-    110.0    80.0    0.0
-f1935 1
-    -0.0    -0.0    1.0
-c0
-4
-    15.214875    110.231057    0.0
-    21.080689    102.243806    0.0
-    23.565476    110.0    0.0
-    15.214875    110.231057    0.0
-f1936 1
-    -0.0    -0.0    1.0
-c0
-4
-    82.228317    12.202649    0.0
-    71.368107    10.929214    0.0
-    77.305876    6.318889    0.0
-    82.228317    12.202649    0.0
-f1937 1
-    -0.0    -0.0    1.0
-c0
-4
-    50.0    95.0    0.0
-    60.0    95.0    0.0
-    57.064513    102.064513    0.0
-    50.0    95.0    0.0
-f1938 1
-    -0.0    -0.0    1.0
-c0
-4
-    50.0    105.0    0.0
-    50.0    95.0    0.0
-    57.064513    102.064513    0.0
-    50.0    105.0    0.0
-f1939 1
-    -0.0    -0.0    1.0
-c0
-4
-    65.338108    25.773643    0.0
-    68.828810    35.228889    0.0
-    61.715433    34.006010    0.0
-    65.338108    25.773643    0.0
-f1940 1
-    -0.0    -0.0    1.0
-c0
-4
-    55.0    30.0    0.0
-    65.338108    25.773643    0.0
-    61.715433    34.006010    0.0
-    55.0    30.0    0.0
-f1941 1
-    -0.0    -0.0    1.0
-c0
-4
-    140.370173    94.005807    0.0
-    139.837376    101.822964    0.0
-    133.160538    98.260036    0.0
-    140.370173    94.005807    0.0
-f1942 1
-    -0.0    -0.0    1.0
-c0
-4
-    34.178235    88.621671    0.0
-    23.664088    84.058900    0.0
-    30.785473    79.702511    0.0
-    34.178235    88.621671    0.0
-f1943 1
-    -0.0    -0.0    1.0
-c0
-4
-    61.868040    15.728007    0.0
-    71.368107    10.929214    0.0
-    68.720332    18.527429    0.0
-    61.868040    15.728007    0.0
-f1944 1
-    -0.0    -0.0    1.0
-c0
-4
-    10.0    150.0    0.0
-    9.406682    140.593318    0.0
-    16.580693    142.992343    0.0
-    10.0    150.0    0.0
-f1945 1
-    -0.0    -0.0    1.0
-c0
-4
-    150.0    140.0    0.0
-    140.593318    140.593318    0.0
-    142.856789    133.118980    0.0
-    150.0    140.0    0.0
-f1946 1
-    -0.0    -0.0    1.0
-c0
-4
-    24.082854    140.812253    0.0
-    20.0    150.0    0.0
-    16.580693    142.992343    0.0
-    24.082854    140.812253    0.0
-f1947 1
-    -0.0    -0.0    1.0
-c0
-4
-    141.600235    124.748677    0.0
-    150.0    130.0    0.0
-    142.856789    133.118980    0.0
-    141.600235    124.748677    0.0
-f1948 1
-    -0.0    -0.0    1.0
-c0
-4
-    17.776928    57.199685    0.0
-    27.496602    64.142612    0.0
-    18.609188    66.430114    0.0
-    17.776928    57.199685    0.0
-f1949 1
-    -0.0    -0.0    1.0
-c0
-4
-    136.734616    58.605627    0.0
-    140.595711    64.722816    0.0
-    132.024505    62.251771    0.0
-    136.734616    58.605627    0.0
-f1950 1
-    -0.0    -0.0    1.0
-c0
-4
-    12.445968    70.136210    0.0
-    7.029187    74.646188    0.0
-    8.434218    64.420842    0.0
-    12.445968    70.136210    0.0
-f1951 1
-    -0.0    -0.0    1.0
-c0
-4
-    0.0    110.0    0.0
-    0.0    100.0    0.0
-    6.793236    106.832069    0.0
-    0.0    110.0    0.0
-f1952 1
-    -0.0    -0.0    1.0
-c0
-4
-    123.797708    60.522478    0.0
-    131.371369    53.404168    0.0
-    132.024505    62.251771    0.0
-    123.797708    60.522478    0.0
-f1953 1
-    -0.0    -0.0    1.0
-c0
-4
-    90.0    110.0    0.0
-    97.500000    107.500000    0.0
-    97.944763    115.752998    0.0
-    90.0    110.0    0.0
-f1954 1
-    -0.0    -0.0    1.0
-c0
-4
-    97.500000    107.500000    0.0
-    105.0    110.0    0.0
-    97.944763    115.752998    0.0
-    97.500000    107.500000    0.0
-f1955 1
-    -0.0    -0.0    1.0
-c0
-4
-    60.288498    125.791351    0.0
-    70.0    130.0    0.0
-    63.067057    132.368281    0.0
-    60.288498    125.791351    0.0
-f1956 1
-    -0.0    -0.0    1.0
-c0
-4
-    58.558278    110.247453    0.0
-    50.0    105.0    0.0
-    57.064513    102.064513    0.0
-    58.558278    110.247453    0.0
-f1957 1
-    -0.0    -0.0    1.0
-c0
-4
-    70.0    120.0    0.0
-    60.288498    125.791351    0.0
-    62.717249    117.213871    0.0
-    70.0    120.0    0.0
-f1958 1
-    -0.0    -0.0    1.0
-c0
-4
-    98.014069    67.770563    0.0
-    92.736605    72.569745    0.0
-    92.625170    63.055491    0.0
-    98.014069    67.770563    0.0
-f1959 1
-    -0.0    -0.0    1.0
-c0
-4
-    34.178235    88.621671    0.0
-    41.444005    96.212097    0.0
-    34.624835    99.512377    0.0
-    34.178235    88.621671    0.0
-f1960 1
-    -0.0    -0.0    1.0
-c0
-4
-    7.029187    74.646188    0.0
-    12.445968    70.136210    0.0
-    17.026202    75.715889    0.0
-    7.029187    74.646188    0.0
-f1961 1
-    -0.0    -0.0    1.0
-c0
-4
-    12.232570    82.226024    0.0
-    7.029187    74.646188    0.0
-    17.026202    75.715889    0.0
-    12.232570    82.226024    0.0
-f1962 1
-    -0.0    -0.0    1.0
-c0
-4
-    21.080689    102.243806    0.0
-    30.0    105.0    0.0
-    23.565476    110.0    0.0
-    21.080689    102.243806    0.0
-f1963 1
-    -0.0    -0.0    1.0
-c0
-4
-    60.288498    125.791351    0.0
-    50.0    125.0    0.0
-    56.115628    118.941932    0.0
-    60.288498    125.791351    0.0
-f1964 1
-    -0.0    -0.0    1.0
-c0
-4
-    64.404075    140.267097    0.0
-    57.486490    136.108877    0.0
-    63.067057    132.368281    0.0
-    64.404075    140.267097    0.0
-f1965 1
-    -0.0    -0.0    1.0
-c0
-4
-    27.585350    95.664236    0.0
-    34.178235    88.621671    0.0
-    34.624835    99.512377    0.0
-    27.585350    95.664236    0.0
-f1966 1
-    -0.0    -0.0    1.0
-c0
-4
-    40.0    0.0    0.0
-    50.0    0.0    0.0
-    46.154019    6.786498    0.0
-    40.0    0.0    0.0
-f1967 1
-    -0.0    -0.0    1.0
-c0
-4
-    70.0    0.0    0.0
-    80.0    0.0    0.0
-    77.305876    6.318889    0.0
-    70.0    0.0    0.0
-f1968 1
-    -0.0    -0.0    1.0
-c0
-4
-    123.797708    60.522478    0.0
-    123.928571    49.689451    0.0
-    131.371369    53.404168    0.0
-    123.797708    60.522478    0.0
-f1969 1
-    -0.0    -0.0    1.0
-c0
-4
-    131.371369    53.404168    0.0
-    136.734616    58.605627    0.0
-    132.024505    62.251771    0.0
-    131.371369    53.404168    0.0
-f1970 1
-    -0.0    -0.0    1.0
-c0
-4
-    140.0    0.0    0.0
-    150.0    0.0    0.0
-    143.328458    6.671542    0.0
-    140.0    0.0    0.0
-f1971 1
-    -0.0    -0.0    1.0
-c0
-4
-    150.0    0.0    0.0
-    150.0    10.0    0.0
-    143.328458    6.671542    0.0
-    150.0    0.0    0.0
-f1972 1
-    -0.0    -0.0    1.0
-c0
-4
-    110.0    70.0    0.0
-    103.688299    63.561663    0.0
-    113.510239    62.629064    0.0
-    110.0    70.0    0.0
-f1973 1
-    -0.0    -0.0    1.0
-c0
-4
-    150.0    20.0    0.0
-    139.966069    21.307290    0.0
-    144.526192    14.793286    0.0
-    150.0    20.0    0.0
-f1974 1
-    -0.0    -0.0    1.0
-c0
-4
-    139.966069    21.307290    0.0
-    137.098136    13.050613    0.0
-    144.526192    14.793286    0.0
-    139.966069    21.307290    0.0
-f1975 1
-    -0.0    -0.0    1.0
-c0
-4
-    37.579518    66.137737    0.0
-    47.475722    59.210916    0.0
-    45.306452    68.417906    0.0
-    37.579518    66.137737    0.0
-f1976 1
-    -0.0    -0.0    1.0
-c0
-4
-    0.0    70.0    0.0
-    0.0    60.0    0.0
-    8.434218    64.420842    0.0
-    0.0    70.0    0.0
-f1977 1
-    -0.0    -0.0    1.0
-c0
-4
-    25.639720    132.398004    0.0
-    30.0    125.0    0.0
-    34.726100    130.359560    0.0
-    25.639720    132.398004    0.0
-f1978 1
-    -0.0    -0.0    1.0
-c0
-4
-    55.0    40.0    0.0
-    55.0    30.0    0.0
-    61.715433    34.006010    0.0
-    55.0    40.0    0.0
-f1979 1
-    -0.0    -0.0    1.0
-c0
-4
-    47.475722    59.210916    0.0
-    37.579518    66.137737    0.0
-    37.574633    57.439569    0.0
-    47.475722    59.210916    0.0
-f1980 1
-    -0.0    -0.0    1.0
-c0
-4
-    132.662663    123.544063    0.0
-    125.0    120.0    0.0
-    130.389047    115.347617    0.0
-    132.662663    123.544063    0.0
-f1981 1
-    -0.0    -0.0    1.0
-c0
-4
-    120.0    70.0    0.0
-    110.0    70.0    0.0
-    113.510239    62.629064    0.0
-    120.0    70.0    0.0
-f1982 1
-    -0.0    -0.0    1.0
-c0
-4
-    0.0    80.0    0.0
-    0.0    70.0    0.0
-    7.029187    74.646188    0.0
-    0.0    80.0    0.0
-f1983 1
-    -0.0    -0.0    1.0
-c0
-4
-    58.558278    110.247453    0.0
-    62.717249    117.213871    0.0
-    56.115628    118.941932    0.0
-    58.558278    110.247453    0.0
-f1984 1
-    -0.0    -0.0    1.0
-c0
-4
-    17.066882    135.286602    0.0
-    8.453205    129.986144    0.0
-    18.883944    126.925543    0.0
-    17.066882    135.286602    0.0
-f1985 1
-    -0.0    -0.0    1.0
-c0
-4
-    8.453205    129.986144    0.0
-    12.150022    121.378177    0.0
-    18.883944    126.925543    0.0
-    8.453205    129.986144    0.0
-f1986 1
-    -0.0    -0.0    1.0
-c0
-4
-    135.286602    132.933118    0.0
-    129.985889    141.546886    0.0
-    126.953827    131.020034    0.0
-    135.286602    132.933118    0.0
-f1987 1
-    -0.0    -0.0    1.0
-c0
-4
-    129.985889    141.546886    0.0
-    121.371320    137.852418    0.0
-    126.953827    131.020034    0.0
-    129.985889    141.546886    0.0
-f1988 1
-    -0.0    -0.0    1.0
-c0
-4
-    135.065020    31.189542    0.0
-    139.966069    21.307290    0.0
-    143.510729    27.831812    0.0
-    135.065020    31.189542    0.0
-f1989 1
-    -0.0    -0.0    1.0
-c0
-4
-    150.0    30.0    0.0
-    142.522557    36.662226    0.0
-    143.510729    27.831812    0.0
-    150.0    30.0    0.0
-f1990 1
-    -0.0    -0.0    1.0
-c0
-4
-    50.0    0.0    0.0
-    54.348866    9.304473    0.0
-    46.154019    6.786498    0.0
-    50.0    0.0    0.0
-f1991 1
-    -0.0    -0.0    1.0
-c0
-4
-    54.348866    9.304473    0.0
-    45.618901    14.680422    0.0
-    46.154019    6.786498    0.0
-    54.348866    9.304473    0.0
-f1992 1
-    -0.0    -0.0    1.0
-c0
-4
-    30.0    105.0    0.0
-    30.0    115.0    0.0
-    23.565476    110.0    0.0
-    30.0    105.0    0.0
-f1993 1
-    -0.0    -0.0    1.0
-c0
-4
-    105.0    120.0    0.0
-    115.0    120.0    0.0
-    109.663590    126.064257    0.0
-    105.0    120.0    0.0
-f1994 1
-    -0.0    -0.0    1.0
-c0
-4
-    30.797655    13.397998    0.0
-    37.690047    20.793319    0.0
-    29.440043    22.121823    0.0
-    30.797655    13.397998    0.0
-f1995 1
-    -0.0    -0.0    1.0
-c0
-4
-    0.0    10.0    0.0
-    0.0    0.0    0.0
-    6.674229    5.666961    0.0
-    0.0    10.0    0.0
-f1996 1
-    -0.0    -0.0    1.0
-c0
-4
-    0.0    0.0    0.0
-    10.0    0.0    0.0
-    6.674229    5.666961    0.0
-    0.0    0.0    0.0
-f1997 1
-    -0.0    -0.0    1.0
-c0
-4
-    60.0    150.0    0.0
-    50.0    150.0    0.0
-    56.060435    143.171163    0.0
-    60.0    150.0    0.0
-f1998 1
-    -0.0    -0.0    1.0
-c0
-4
-    123.928571    49.689451    0.0
-    133.141953    44.214671    0.0
-    131.371369    53.404168    0.0
-    123.928571    49.689451    0.0
-f1999 1
-    -0.0    -0.0    1.0
-c0
-4
-    20.0    0.0    0.0
-    21.449462    8.542266    0.0
-    15.0    5.128770    0.0
-    20.0    0.0    0.0
-f2000 1
-    -0.0    -0.0    1.0
-c0
-4
-    123.928571    49.689451    0.0
-    115.0    45.0    0.0
-    122.077185    42.369846    0.0
-    123.928571    49.689451    0.0
-f2001 1
-    -0.0    -0.0    1.0
-c0
-4
-    110.118172    134.825297    0.0
-    113.757468    142.828093    0.0
-    106.728290    143.153545    0.0
-    110.118172    134.825297    0.0
-f2002 1
-    -0.0    -0.0    1.0
-c0
-4
-    9.406682    140.593318    0.0
-    17.066882    135.286602    0.0
-    16.580693    142.992343    0.0
-    9.406682    140.593318    0.0
-f2003 1
-    -0.0    -0.0    1.0
-c0
-4
-    140.593318    140.593318    0.0
-    135.286602    132.933118    0.0
-    142.856789    133.118980    0.0
-    140.593318    140.593318    0.0
-f2004 1
-    -0.0    -0.0    1.0
-c0
-4
-    0.0    40.0    0.0
-    8.115281    36.912919    0.0
-    5.590872    45.325790    0.0
-    0.0    40.0    0.0
-f2005 1
-    -0.0    -0.0    1.0
-c0
-4
-    98.014069    67.770563    0.0
-    103.688299    63.561663    0.0
-    102.916667    72.916667    0.0
-    98.014069    67.770563    0.0
-f2006 1
-    -0.0    -0.0    1.0
-c0
-4
-    103.688299    63.561663    0.0
-    110.0    70.0    0.0
-    102.916667    72.916667    0.0
-    103.688299    63.561663    0.0
-f2007 1
-    -0.0    -0.0    1.0
-c0
-4
-    50.0    125.0    0.0
-    50.0    115.0    0.0
-    56.115628    118.941932    0.0
-    50.0    125.0    0.0
-f2008 1
-    -0.0    -0.0    1.0
-c0
-4
-    45.618901    14.680422    0.0
-    53.874411    19.953213    0.0
-    46.090061    22.498280    0.0
-    45.618901    14.680422    0.0
-f2009 1
-    -0.0    -0.0    1.0
-c0
-4
-    42.411417    133.310248    0.0
-    48.411609    139.479843    0.0
-    40.176600    142.679360    0.0
-    42.411417    133.310248    0.0
-f2010 1
-    -0.0    -0.0    1.0
-c0
-4
-    32.574652    137.979453    0.0
-    42.411417    133.310248    0.0
-    40.176600    142.679360    0.0
-    32.574652    137.979453    0.0
-f2011 1
-    -0.0    -0.0    1.0
-c0
-4
-    40.0    105.0    0.0
-    30.0    105.0    0.0
-    34.624835    99.512377    0.0
-    40.0    105.0    0.0
-f2012 1
-    -0.0    -0.0    1.0
-c0
-4
-    23.664088    84.058900    0.0
-    25.219648    73.707572    0.0
-    30.785473    79.702511    0.0
-    23.664088    84.058900    0.0
-f2013 1
-    -0.0    -0.0    1.0
-c0
-4
-    150.0    110.0    0.0
-    150.0    120.0    0.0
-    144.201608    115.951379    0.0
-    150.0    110.0    0.0
-f2014 1
-    -0.0    -0.0    1.0
-c0
-4
-    125.0    120.0    0.0
-    125.0    110.0    0.0
-    130.389047    115.347617    0.0
-    125.0    120.0    0.0
-f2015 1
-    -0.0    -0.0    1.0
-c0
-4
-    130.0    0.0    0.0
-    140.0    0.0    0.0
-    135.372795    5.376934    0.0
-    130.0    0.0    0.0
-f2016 1
-    -0.0    -0.0    1.0
-c0
-4
-    30.0    125.0    0.0
-    40.0    125.0    0.0
-    34.726100    130.359560    0.0
-    30.0    125.0    0.0
-f2017 1
-    -0.0    -0.0    1.0
-c0
-4
-    38.683175    8.600292    0.0
-    40.0    0.0    0.0
-    46.154019    6.786498    0.0
-    38.683175    8.600292    0.0
-f2018 1
-    -0.0    -0.0    1.0
-c0
-4
-    150.0    10.0    0.0
-    150.0    20.0    0.0
-    144.526192    14.793286    0.0
-    150.0    10.0    0.0
-f2019 1
-    -0.0    -0.0    1.0
-c0
-4
-    80.0    0.0    0.0
-    90.0    0.0    0.0
-    85.0    5.223980    0.0
-    80.0    0.0    0.0
-f2020 1
-    -0.0    -0.0    1.0
-c0
-4
-    0.0    50.0    0.0
-    0.0    40.0    0.0
-    5.590872    45.325790    0.0
-    0.0    50.0    0.0
-f2021 1
-    -0.0    -0.0    1.0
-c0
-4
-    10.0    0.0    0.0
-    20.0    0.0    0.0
-    15.0    5.128770    0.0
-    10.0    0.0    0.0
-f2022 1
-    -0.0    -0.0    1.0
-c0
-4
-    110.0    80.0    0.0
-    110.0    90.0    0.0
-    105.0    85.0    0.0
-    110.0    80.0    0.0
-f2023 1
-    -0.0    -0.0    1.0
-c0
-4
-    100.0    80.0    0.0
-    110.0    80.0    0.0
-    105.0    85.0    0.0
-    100.0    80.0    0.0
-f2024 1
-    -0.0    -0.0    1.0
-c0
-4
-    100.0    90.0    0.0
-    100.0    80.0    0.0
-    105.0    85.0    0.0
-    100.0    90.0    0.0
-f2025 1
-    -0.0    -0.0    1.0
-c0
-4
-    80.0    100.0    0.0
-    90.0    100.0    0.0
-    85.0    105.0    0.0
-    80.0    100.0    0.0
-f2026 1
-    -0.0    -0.0    1.0
-c0
-4
-    80.0    110.0    0.0
-    80.0    100.0    0.0
-    85.0    105.0    0.0
-    80.0    110.0    0.0
-f2027 1
-    -0.0    -0.0    1.0
-c0
-4
-    90.0    100.0    0.0
-    90.0    110.0    0.0
-    85.0    105.0    0.0
-    90.0    100.0    0.0
-f2028 1
-    -0.0    -0.0    1.0
-c0
-4
-    90.0    110.0    0.0
-    80.0    110.0    0.0
-    85.0    105.0    0.0
-    90.0    110.0    0.0
-f2029 1
-    -0.0    -0.0    1.0
-c0
-4
-    0.0    60.0    0.0
-    7.208772    53.848106    0.0
-    8.434218    64.420842    0.0
-    0.0    60.0    0.0
-f2030 1
-    -0.0    -0.0    1.0
-c0
-4
-    113.757468    142.828093    0.0
-    110.0    150.0    0.0
-    106.728290    143.153545    0.0
-    113.757468    142.828093    0.0
-f2031 1
-    -0.0    -0.0    1.0
-c0
-4
-    37.690047    20.793319    0.0
-    45.618901    14.680422    0.0
-    46.090061    22.498280    0.0
-    37.690047    20.793319    0.0
-f2032 1
-    -0.0    -0.0    1.0
-c0
-4
-    15.214875    110.231057    0.0
-    7.113752    113.886231    0.0
-    6.793236    106.832069    0.0
-    15.214875    110.231057    0.0
-f2033 1
-    -0.0    -0.0    1.0
-c0
-4
-    48.411609    139.479843    0.0
-    42.411417    133.310248    0.0
-    51.719603    131.938064    0.0
-    48.411609    139.479843    0.0
-f2034 1
-    -0.0    -0.0    1.0
-c0
-4
-    132.981740    107.524243    0.0
-    139.837376    101.822964    0.0
-    142.405411    108.529006    0.0
-    132.981740    107.524243    0.0
-f2035 1
-    -0.0    -0.0    1.0
-c0
-4
-    137.002395    116.479211    0.0
-    132.981740    107.524243    0.0
-    142.405411    108.529006    0.0
-    137.002395    116.479211    0.0
-f2036 1
-    -0.0    -0.0    1.0
-c0
-4
-    12.150022    121.378177    0.0
-    21.529103    118.051155    0.0
-    18.883944    126.925543    0.0
-    12.150022    121.378177    0.0
-f2037 1
-    -0.0    -0.0    1.0
-c0
-4
-    121.371320    137.852418    0.0
-    118.031198    128.477998    0.0
-    126.953827    131.020034    0.0
-    121.371320    137.852418    0.0
-f2038 1
-    -0.0    -0.0    1.0
-c0
-4
-    64.687500    102.708333    0.0
-    70.0    95.0    0.0
-    72.556388    102.556388    0.0
-    64.687500    102.708333    0.0
-f2039 1
-    -0.0    -0.0    1.0
-c0
-4
-    70.0    75.0    0.0
-    75.0    70.0    0.0
-    75.833333    75.833333    0.0
-    70.0    75.0    0.0
-f2040 1
-    -0.0    -0.0    1.0
-c0
-4
-    65.0    70.0    0.0
-    60.0    75.0    0.0
-    59.061005    69.124732    0.0
-    65.0    70.0    0.0
-f2041 1
-    -0.0    -0.0    1.0
-c0
-4
-    143.679383    44.854083    0.0
-    150.0    50.0    0.0
-    141.662899    53.258805    0.0
-    143.679383    44.854083    0.0
-f2042 1
-    -0.0    -0.0    1.0
-c0
-4
-    63.346444    41.653556    0.0
-    55.0    40.0    0.0
-    61.715433    34.006010    0.0
-    63.346444    41.653556    0.0
-f2043 1
-    -0.0    -0.0    1.0
-c0
-4
-    150.0    40.0    0.0
-    143.679383    44.854083    0.0
-    142.522557    36.662226    0.0
-    150.0    40.0    0.0
-f2044 1
-    -0.0    -0.0    1.0
-c0
-4
-    64.687500    102.708333    0.0
-    58.558278    110.247453    0.0
-    57.064513    102.064513    0.0
-    64.687500    102.708333    0.0
-f2045 1
-    -0.0    -0.0    1.0
-c0
-4
-    90.0    0.0    0.0
-    91.946676    7.843044    0.0
-    85.0    5.223980    0.0
-    90.0    0.0    0.0
-f2046 1
-    -0.0    -0.0    1.0
-c0
-4
-    70.0    110.0    0.0
-    64.687500    102.708333    0.0
-    72.556388    102.556388    0.0
-    70.0    110.0    0.0
-f2047 1
-    -0.0    -0.0    1.0
-c0
-4
-    41.444005    96.212097    0.0
-    40.0    105.0    0.0
-    34.624835    99.512377    0.0
-    41.444005    96.212097    0.0
-f2048 1
-    -0.0    -0.0    1.0
-c0
-4
-    60.0    95.0    0.0
-    64.687500    102.708333    0.0
-    57.064513    102.064513    0.0
-    60.0    95.0    0.0
-f2049 1
-    -0.0    -0.0    1.0
-c0
-4
-    7.113752    113.886231    0.0
-    0.0    110.0    0.0
-    6.793236    106.832069    0.0
-    7.113752    113.886231    0.0
-f2050 1
-    -0.0    -0.0    1.0
-c0
-4
-    110.0    90.0    0.0
-    105.0    93.750000    0.0
-    105.0    85.0    0.0
-    110.0    90.0    0.0
-f2051 1
-    -0.0    -0.0    1.0
-c0
-4
-    105.0    93.750000    0.0
-    100.0    90.0    0.0
-    105.0    85.0    0.0
-    105.0    93.750000    0.0
-f2052 1
-    -0.0    -0.0    1.0
-c0
-4
-    45.618901    14.680422    0.0
-    38.683175    8.600292    0.0
-    46.154019    6.786498    0.0
-    45.618901    14.680422    0.0
-f2053 1
-    -0.0    -0.0    1.0
-c0
-4
-    128.827884    8.499357    0.0
-    130.0    0.0    0.0
-    135.372795    5.376934    0.0
-    128.827884    8.499357    0.0
-f2054 1
-    -0.0    -0.0    1.0
-c0
-4
-    25.639720    132.398004    0.0
-    17.066882    135.286602    0.0
-    18.883944    126.925543    0.0
-    25.639720    132.398004    0.0
-f2055 1
-    -0.0    -0.0    1.0
-c0
-4
-    132.662663    123.544063    0.0
-    135.286602    132.933118    0.0
-    126.953827    131.020034    0.0
-    132.662663    123.544063    0.0
-f2056 1
-    -0.0    -0.0    1.0
-c0
-4
-    68.828810    35.228889    0.0
-    63.346444    41.653556    0.0
-    61.715433    34.006010    0.0
-    68.828810    35.228889    0.0
-f2057 1
-    -0.0    -0.0    1.0
-c0
-4
-    137.098136    13.050613    0.0
-    128.827884    8.499357    0.0
-    135.372795    5.376934    0.0
-    137.098136    13.050613    0.0
-f2058 1
-    -0.0    -0.0    1.0
-c0
-4
-    30.0    105.0    0.0
-    27.585350    95.664236    0.0
-    34.624835    99.512377    0.0
-    30.0    105.0    0.0
-f2059 1
-    -0.0    -0.0    1.0
-c0
-4
-    6.674229    5.666961    0.0
-    10.0    0.0    0.0
-    15.0    5.128770    0.0
-    6.674229    5.666961    0.0
-f2060 1
-    -0.0    -0.0    1.0
-c0
-4
-    11.200980    11.200980    0.0
-    6.674229    5.666961    0.0
-    15.0    5.128770    0.0
-    11.200980    11.200980    0.0
-f2061 1
-    -0.0    -0.0    1.0
-c0
-4
-    142.522557    36.662226    0.0
-    135.065020    31.189542    0.0
-    143.510729    27.831812    0.0
-    142.522557    36.662226    0.0
-f2062 1
-    -0.0    -0.0    1.0
-c0
-4
-    25.219648    73.707572    0.0
-    32.329606    71.984818    0.0
-    30.785473    79.702511    0.0
-    25.219648    73.707572    0.0
-f2063 1
-    -0.0    -0.0    1.0
-c0
-4
-    32.329606    71.984818    0.0
-    38.490982    77.052964    0.0
-    30.785473    79.702511    0.0
-    32.329606    71.984818    0.0
-f2064 1
-    -0.0    -0.0    1.0
-c0
-4
-    143.328458    6.671542    0.0
-    150.0    10.0    0.0
-    144.526192    14.793286    0.0
-    143.328458    6.671542    0.0
-f2065 1
-    -0.0    -0.0    1.0
-c0
-4
-    137.098136    13.050613    0.0
-    143.328458    6.671542    0.0
-    144.526192    14.793286    0.0
-    137.098136    13.050613    0.0
-f2066 1
-    -0.0    -0.0    1.0
-c0
-4
-    143.328458    6.671542    0.0
-    137.098136    13.050613    0.0
-    135.372795    5.376934    0.0
-    143.328458    6.671542    0.0
-f2067 1
-    -0.0    -0.0    1.0
-c0
-4
-    140.0    0.0    0.0
-    143.328458    6.671542    0.0
-    135.372795    5.376934    0.0
-    140.0    0.0    0.0
-f2068 1
-    -0.0    -0.0    1.0
-c0
-4
-    40.0    125.0    0.0
-    42.411417    133.310248    0.0
-    34.726100    130.359560    0.0
-    40.0    125.0    0.0
-f2069 1
-    -0.0    -0.0    1.0
-c0
-4
-    142.405411    108.529006    0.0
-    150.0    110.0    0.0
-    144.201608    115.951379    0.0
-    142.405411    108.529006    0.0
-f2070 1
-    -0.0    -0.0    1.0
-c0
-4
-    125.0    110.0    0.0
-    132.981740    107.524243    0.0
-    130.389047    115.347617    0.0
-    125.0    110.0    0.0
-f2071 1
-    -0.0    -0.0    1.0
-c0
-4
-    62.717249    117.213871    0.0
-    60.288498    125.791351    0.0
-    56.115628    118.941932    0.0
-    62.717249    117.213871    0.0
-f2072 1
-    -0.0    -0.0    1.0
-c0
-4
-    80.0    0.0    0.0
-    85.0    5.223980    0.0
-    77.305876    6.318889    0.0
-    80.0    0.0    0.0
-f2073 1
-    -0.0    -0.0    1.0
-c0
-4
-    85.0    5.223980    0.0
-    82.228317    12.202649    0.0
-    77.305876    6.318889    0.0
-    85.0    5.223980    0.0
-f2074 1
-    -0.0    -0.0    1.0
-c0
-4
-    42.411417    133.310248    0.0
-    32.574652    137.979453    0.0
-    34.726100    130.359560    0.0
-    42.411417    133.310248    0.0
-f2075 1
-    -0.0    -0.0    1.0
-c0
-4
-    132.981740    107.524243    0.0
-    137.002395    116.479211    0.0
-    130.389047    115.347617    0.0
-    132.981740    107.524243    0.0
-f2076 1
-    -0.0    -0.0    1.0
-c0
-4
-    137.002395    116.479211    0.0
-    142.405411    108.529006    0.0
-    144.201608    115.951379    0.0
-    137.002395    116.479211    0.0
-f2077 1
-    -0.0    -0.0    1.0
-c0
-4
-    105.0    100.0    0.0
-    105.0    110.0    0.0
-    100.0    100.0    0.0
-    105.0    100.0    0.0
-f2078 1
-    -0.0    -0.0    1.0
-c0
-4
-    65.0    70.0    0.0
-    70.0    75.0    0.0
-    60.0    75.0    0.0
-    65.0    70.0    0.0
-f2079 1
-    -0.0    -0.0    1.0
-c0
-4
-    75.0    70.0    0.0
-    70.0    75.0    0.0
-    65.0    70.0    0.0
-    75.0    70.0    0.0
-f2080 1
-    -0.0    -0.0    1.0
-c0
-4
-    115.0    100.0    0.0
-    105.0    100.0    0.0
-    105.0    93.750000    0.0
-    115.0    100.0    0.0
-""")
+        sio = AbstractGeoDataFrameDemos._dataset(
+            "GeoDataFrameDemos5", "cirSceneMesh1Corr.cir"
+        )
         return CirReader(sio).run()
 
     @staticmethod
     def cirSceneMasque2():
-        sio = StringIO("""370      370 
-     1      0
-     1      0
-     1      0
-     1      0
-     1      0
-f1    1
--0.0 -0.0 1.0 
-c0
-5
-    -30.0 -30.0 0.0 
-    -30.0 120.0 0.0 
-    120.0 120.0 0.0 
-    120.0 -30.0 0.0 
-    -30.0 -30.0 0.0 
-f2    1
--0.0 1.0 -0.0 
-c0
-5
-    60.0 60.0 0.0 
-    40.0 60.0 0.0 
-    40.0 60.0 3.0 
-    60.0 60.0 3.0 
-    60.0 60.0 0.0 
-f3    1
-1.0 -0.0 -0.0 
-c0
-5
-    60.0 60.0 0.0 
-    60.0 40.0 0.0 
-    60.0 40.0 3.0 
-    60.0 60.0 3.0 
-    60.0 60.0 0.0 
-f4    1
--1.0 0.0 0.0 
-c0
-5
-    40.0 40.0 0.0 
-    40.0 40.0 3.0 
-    40.0 60.0 3.0 
-    40.0 60.0 0.0 
-    40.0 40.0 0.0 
-f5    1
-0.0 -1.0 0.0 
-c0
-5
-    40.0 40.0 0.0 
-    40.0 40.0 3.0 
-    60.0 40.0 3.0 
-    60.0 40.0 0.0 
-    40.0 40.0 0.0 
-f6    1
-1.0 -0.0 -0.0 
-c0
-5
-    60.0 20.0 0.0 
-    60.0 0.0 0.0 
-    60.0 0.0 3.0 
-    60.0 20.0 3.0 
-    60.0 20.0 0.0 
-f7    1
--0.0 1.0 -0.0 
-c0
-5
-    60.0 20.0 0.0 
-    40.0 20.0 0.0 
-    40.0 20.0 3.0 
-    60.0 20.0 3.0 
-    60.0 20.0 0.0 
-f8    1
-0.0 -1.0 0.0 
-c0
-5
-    60.0 0.0 0.0 
-    40.0 0.0 0.0 
-    40.0 0.0 3.0 
-    60.0 0.0 3.0 
-    60.0 0.0 0.0 
-f9    1
--1.0 0.0 0.0 
-c0
-5
-    40.0 20.0 0.0 
-    40.0 0.0 0.0 
-    40.0 0.0 3.0 
-    40.0 20.0 3.0 
-    40.0 20.0 0.0 
-f10    1
-1.0 -0.0 -0.0 
-c0
-5
-    100.0 20.0 0.0 
-    100.0 0.0 0.0 
-    100.0 0.0 3.0 
-    100.0 20.0 3.0 
-    100.0 20.0 0.0 
-f11    1
--0.0 1.0 -0.0 
-c0
-5
-    100.0 20.0 0.0 
-    80.0 20.0 0.0 
-    80.0 20.0 3.0 
-    100.0 20.0 3.0 
-    100.0 20.0 0.0 
-f12    1
-0.0 -1.0 0.0 
-c0
-5
-    100.0 0.0 0.0 
-    80.0 0.0 0.0 
-    80.0 0.0 3.0 
-    100.0 0.0 3.0 
-    100.0 0.0 0.0 
-f13    1
--1.0 0.0 0.0 
-c0
-5
-    80.0 0.0 0.0 
-    80.0 0.0 3.0 
-    80.0 20.0 3.0 
-    80.0 20.0 0.0 
-    80.0 0.0 0.0 
-f14    1
--1.0 0.0 0.0 
-c0
-5
-    80.0 60.0 0.0 
-    80.0 40.0 0.0 
-    80.0 40.0 3.0 
-    80.0 60.0 3.0 
-    80.0 60.0 0.0 
-f15    1
--0.0 1.0 -0.0 
-c0
-5
-    80.0 60.0 0.0 
-    100.0 60.0 0.0 
-    100.0 60.0 3.0 
-    80.0 60.0 3.0 
-    80.0 60.0 0.0 
-f16    1
-0.0 -1.0 0.0 
-c0
-5
-    80.0 40.0 0.0 
-    100.0 40.0 0.0 
-    100.0 40.0 3.0 
-    80.0 40.0 3.0 
-    80.0 40.0 0.0 
-f17    1
-1.0 -0.0 -0.0 
-c0
-5
-    100.0 60.0 0.0 
-    100.0 40.0 0.0 
-    100.0 40.0 3.0 
-    100.0 60.0 3.0 
-    100.0 60.0 0.0 
-f18    1
--0.0 1.0 -0.0 
-c0
-5
-    40.0 100.0 0.0 
-    40.0 100.0 3.0 
-    60.0 100.0 3.0 
-    60.0 100.0 0.0 
-    40.0 100.0 0.0 
-f19    1
-1.0 -0.0 -0.0 
-c0
-5
-    60.0 100.0 0.0 
-    60.0 80.0 0.0 
-    60.0 80.0 3.0 
-    60.0 100.0 3.0 
-    60.0 100.0 0.0 
-f20    1
--1.0 0.0 0.0 
-c0
-5
-    40.0 100.0 0.0 
-    40.0 80.0 0.0 
-    40.0 80.0 3.0 
-    40.0 100.0 3.0 
-    40.0 100.0 0.0 
-f21    1
-0.0 -1.0 0.0 
-c0
-5
-    40.0 80.0 0.0 
-    40.0 80.0 3.0 
-    60.0 80.0 3.0 
-    60.0 80.0 0.0 
-    40.0 80.0 0.0 
-f22    1
--0.0 1.0 -0.0 
-c0
-5
-    100.0 100.0 0.0 
-    80.0 100.0 0.0 
-    80.0 100.0 3.0 
-    100.0 100.0 3.0 
-    100.0 100.0 0.0 
-f23    1
--1.0 0.0 0.0 
-c0
-5
-    80.0 100.0 3.0 
-    80.0 100.0 0.0 
-    80.0 80.0 0.0 
-    80.0 80.0 3.0 
-    80.0 100.0 3.0 
-f24    1
-0.0 -1.0 0.0 
-c0
-5
-    80.0 80.0 0.0 
-    100.0 80.0 0.0 
-    100.0 80.0 3.0 
-    80.0 80.0 3.0 
-    80.0 80.0 0.0 
-f25    1
-1.0 -0.0 -0.0 
-c0
-5
-    100.0 100.0 0.0 
-    100.0 80.0 0.0 
-    100.0 80.0 3.0 
-    100.0 100.0 3.0 
-    100.0 100.0 0.0 
-f26    1
--0.0 1.0 -0.0 
-c0
-5
-    20.0 60.0 0.0 
-    0.0 60.0 0.0 
-    0.0 60.0 3.0 
-    20.0 60.0 3.0 
-    20.0 60.0 0.0 
-f27    1
-1.0 -0.0 -0.0 
-c0
-5
-    20.0 60.0 0.0 
-    20.0 40.0 0.0 
-    20.0 40.0 3.0 
-    20.0 60.0 3.0 
-    20.0 60.0 0.0 
-f28    1
--1.0 0.0 0.0 
-c0
-5
-    0.0 60.0 0.0 
-    0.0 40.0 0.0 
-    0.0 40.0 3.0 
-    0.0 60.0 3.0 
-    0.0 60.0 0.0 
-f29    1
-0.0 -1.0 0.0 
-c0
-5
-    20.0 40.0 0.0 
-    0.0 40.0 0.0 
-    0.0 40.0 3.0 
-    20.0 40.0 3.0 
-    20.0 40.0 0.0 
-f30    1
--1.0 0.0 0.0 
-c0
-5
-    0.0 100.0 0.0 
-    0.0 80.0 0.0 
-    0.0 80.0 3.0 
-    0.0 100.0 3.0 
-    0.0 100.0 0.0 
-f31    1
--0.0 1.0 -0.0 
-c0
-5
-    0.0 100.0 0.0 
-    20.0 100.0 0.0 
-    20.0 100.0 3.0 
-    0.0 100.0 3.0 
-    0.0 100.0 0.0 
-f32    1
-0.0 -1.0 0.0 
-c0
-5
-    0.0 80.0 0.0 
-    0.0 80.0 3.0 
-    20.0 80.0 3.0 
-    20.0 80.0 0.0 
-    0.0 80.0 0.0 
-f33    1
-1.0 -0.0 -0.0 
-c0
-5
-    20.0 100.0 0.0 
-    20.0 80.0 0.0 
-    20.0 80.0 3.0 
-    20.0 100.0 3.0 
-    20.0 100.0 0.0 
-f34    1
--0.0 1.0 -0.0 
-c0
-5
-    20.0 20.0 0.0 
-    0.0 20.0 0.0 
-    0.0 20.0 3.0 
-    20.0 20.0 3.0 
-    20.0 20.0 0.0 
-f35    1
-1.0 -0.0 -0.0 
-c0
-5
-    20.0 20.0 0.0 
-    20.0 0.0 0.0 
-    20.0 0.0 3.0 
-    20.0 20.0 3.0 
-    20.0 20.0 0.0 
-f36    1
--1.0 0.0 0.0 
-c0
-5
-    0.0 20.0 0.0 
-    0.0 0.0 0.0 
-    0.0 0.0 3.0 
-    0.0 20.0 3.0 
-    0.0 20.0 0.0 
-f37    1
-0.0 -1.0 0.0 
-c0
-5
-    20.0 0.0 0.0 
-    0.0 0.0 0.0 
-    0.0 0.0 3.0 
-    20.0 0.0 3.0 
-    20.0 0.0 0.0 
-f38    1
--0.0 1.0 -0.0 
-c0
-5
-    60.0 60.0 3.0 
-    40.0 60.0 3.0 
-    40.0 60.0 6.0 
-    60.0 60.0 6.0 
-    60.0 60.0 3.0 
-f39    1
-1.0 -0.0 -0.0 
-c0
-5
-    60.0 60.0 3.0 
-    60.0 40.0 3.0 
-    60.0 40.0 6.0 
-    60.0 60.0 6.0 
-    60.0 60.0 3.0 
-f40    1
--1.0 0.0 0.0 
-c0
-5
-    40.0 60.0 3.0 
-    40.0 40.0 3.0 
-    40.0 40.0 6.0 
-    40.0 60.0 6.0 
-    40.0 60.0 3.0 
-f41    1
-0.0 -1.0 0.0 
-c0
-5
-    60.0 40.0 6.0 
-    40.0 40.0 6.0 
-    40.0 40.0 3.0 
-    60.0 40.0 3.0 
-    60.0 40.0 6.0 
-f42    1
-1.0 -0.0 -0.0 
-c0
-5
-    60.0 20.0 6.0 
-    60.0 20.0 3.0 
-    60.0 0.0 3.0 
-    60.0 0.0 6.0 
-    60.0 20.0 6.0 
-f43    1
--0.0 1.0 -0.0 
-c0
-5
-    60.0 20.0 3.0 
-    40.0 20.0 3.0 
-    40.0 20.0 6.0 
-    60.0 20.0 6.0 
-    60.0 20.0 3.0 
-f44    1
-0.0 -1.0 0.0 
-c0
-5
-    60.0 0.0 3.0 
-    40.0 0.0 3.0 
-    40.0 0.0 6.0 
-    60.0 0.0 6.0 
-    60.0 0.0 3.0 
-f45    1
--1.0 0.0 0.0 
-c0
-5
-    40.0 20.0 3.0 
-    40.0 0.0 3.0 
-    40.0 0.0 6.0 
-    40.0 20.0 6.0 
-    40.0 20.0 3.0 
-f46    1
-1.0 -0.0 -0.0 
-c0
-5
-    100.0 0.0 3.0 
-    100.0 20.0 3.0 
-    100.0 20.0 6.0 
-    100.0 0.0 6.0 
-    100.0 0.0 3.0 
-f47    1
--0.0 1.0 -0.0 
-c0
-5
-    80.0 20.0 3.0 
-    80.0 20.0 6.0 
-    100.0 20.0 6.0 
-    100.0 20.0 3.0 
-    80.0 20.0 3.0 
-f48    1
-0.0 -1.0 0.0 
-c0
-5
-    100.0 0.0 6.0 
-    100.0 0.0 3.0 
-    80.0 0.0 3.0 
-    80.0 0.0 6.0 
-    100.0 0.0 6.0 
-f49    1
--1.0 0.0 0.0 
-c0
-5
-    80.0 20.0 6.0 
-    80.0 20.0 3.0 
-    80.0 0.0 3.0 
-    80.0 0.0 6.0 
-    80.0 20.0 6.0 
-f50    1
--1.0 0.0 0.0 
-c0
-5
-    80.0 40.0 3.0 
-    80.0 60.0 3.0 
-    80.0 60.0 6.0 
-    80.0 40.0 6.0 
-    80.0 40.0 3.0 
-f51    1
--0.0 1.0 -0.0 
-c0
-5
-    80.0 60.0 3.0 
-    80.0 60.0 6.0 
-    100.0 60.0 6.0 
-    100.0 60.0 3.0 
-    80.0 60.0 3.0 
-f52    1
-0.0 -1.0 0.0 
-c0
-5
-    80.0 40.0 6.0 
-    80.0 40.0 3.0 
-    100.0 40.0 3.0 
-    100.0 40.0 6.0 
-    80.0 40.0 6.0 
-f53    1
-1.0 -0.0 -0.0 
-c0
-5
-    100.0 60.0 3.0 
-    100.0 40.0 3.0 
-    100.0 40.0 6.0 
-    100.0 60.0 6.0 
-    100.0 60.0 3.0 
-f54    1
--0.0 1.0 -0.0 
-c0
-5
-    60.0 100.0 3.0 
-    40.0 100.0 3.0 
-    40.0 100.0 6.0 
-    60.0 100.0 6.0 
-    60.0 100.0 3.0 
-f55    1
-1.0 -0.0 -0.0 
-c0
-5
-    60.0 100.0 3.0 
-    60.0 80.0 3.0 
-    60.0 80.0 6.0 
-    60.0 100.0 6.0 
-    60.0 100.0 3.0 
-f56    1
--1.0 0.0 0.0 
-c0
-5
-    40.0 100.0 3.0 
-    40.0 80.0 3.0 
-    40.0 80.0 6.0 
-    40.0 100.0 6.0 
-    40.0 100.0 3.0 
-f57    1
-0.0 -1.0 0.0 
-c0
-5
-    60.0 80.0 3.0 
-    40.0 80.0 3.0 
-    40.0 80.0 6.0 
-    60.0 80.0 6.0 
-    60.0 80.0 3.0 
-f58    1
--0.0 1.0 -0.0 
-c0
-5
-    100.0 100.0 3.0 
-    80.0 100.0 3.0 
-    80.0 100.0 6.0 
-    100.0 100.0 6.0 
-    100.0 100.0 3.0 
-f59    1
--1.0 0.0 0.0 
-c0
-5
-    80.0 100.0 6.0 
-    80.0 80.0 6.0 
-    80.0 80.0 3.0 
-    80.0 100.0 3.0 
-    80.0 100.0 6.0 
-f60    1
-0.0 -1.0 0.0 
-c0
-5
-    80.0 80.0 3.0 
-    100.0 80.0 3.0 
-    100.0 80.0 6.0 
-    80.0 80.0 6.0 
-    80.0 80.0 3.0 
-f61    1
-1.0 -0.0 -0.0 
-c0
-5
-    100.0 80.0 6.0 
-    100.0 80.0 3.0 
-    100.0 100.0 3.0 
-    100.0 100.0 6.0 
-    100.0 80.0 6.0 
-f62    1
--0.0 1.0 -0.0 
-c0
-5
-    20.0 60.0 3.0 
-    0.0 60.0 3.0 
-    0.0 60.0 6.0 
-    20.0 60.0 6.0 
-    20.0 60.0 3.0 
-f63    1
-1.0 -0.0 -0.0 
-c0
-5
-    20.0 60.0 3.0 
-    20.0 40.0 3.0 
-    20.0 40.0 6.0 
-    20.0 60.0 6.0 
-    20.0 60.0 3.0 
-f64    1
--1.0 0.0 0.0 
-c0
-5
-    0.0 60.0 3.0 
-    0.0 40.0 3.0 
-    0.0 40.0 6.0 
-    0.0 60.0 6.0 
-    0.0 60.0 3.0 
-f65    1
-0.0 -1.0 0.0 
-c0
-5
-    20.0 40.0 3.0 
-    0.0 40.0 3.0 
-    0.0 40.0 6.0 
-    20.0 40.0 6.0 
-    20.0 40.0 3.0 
-f66    1
--1.0 0.0 0.0 
-c0
-5
-    0.0 80.0 3.0 
-    0.0 100.0 3.0 
-    0.0 100.0 6.0 
-    0.0 80.0 6.0 
-    0.0 80.0 3.0 
-f67    1
--0.0 1.0 -0.0 
-c0
-5
-    0.0 100.0 3.0 
-    20.0 100.0 3.0 
-    20.0 100.0 6.0 
-    0.0 100.0 6.0 
-    0.0 100.0 3.0 
-f68    1
-0.0 -1.0 0.0 
-c0
-5
-    0.0 80.0 3.0 
-    20.0 80.0 3.0 
-    20.0 80.0 6.0 
-    0.0 80.0 6.0 
-    0.0 80.0 3.0 
-f69    1
-1.0 -0.0 -0.0 
-c0
-5
-    20.0 100.0 3.0 
-    20.0 80.0 3.0 
-    20.0 80.0 6.0 
-    20.0 100.0 6.0 
-    20.0 100.0 3.0 
-f70    1
--0.0 1.0 -0.0 
-c0
-5
-    0.0 20.0 6.0 
-    20.0 20.0 6.0 
-    20.0 20.0 3.0 
-    0.0 20.0 3.0 
-    0.0 20.0 6.0 
-f71    1
-1.0 -0.0 -0.0 
-c0
-5
-    20.0 20.0 3.0 
-    20.0 0.0 3.0 
-    20.0 0.0 6.0 
-    20.0 20.0 6.0 
-    20.0 20.0 3.0 
-f72    1
--1.0 0.0 0.0 
-c0
-5
-    0.0 20.0 3.0 
-    0.0 20.0 6.0 
-    0.0 0.0 6.0 
-    0.0 0.0 3.0 
-    0.0 20.0 3.0 
-f73    1
-0.0 -1.0 0.0 
-c0
-5
-    20.0 0.0 3.0 
-    0.0 0.0 3.0 
-    0.0 0.0 6.0 
-    20.0 0.0 6.0 
-    20.0 0.0 3.0 
-f74    1
--0.0 1.0 -0.0 
-c0
-5
-    40.0 60.0 6.0 
-    60.0 60.0 6.0 
-    60.0 60.0 9.0 
-    40.0 60.0 9.0 
-    40.0 60.0 6.0 
-f75    1
-1.0 -0.0 -0.0 
-c0
-5
-    60.0 60.0 6.0 
-    60.0 40.0 6.0 
-    60.0 40.0 9.0 
-    60.0 60.0 9.0 
-    60.0 60.0 6.0 
-f76    1
--1.0 0.0 0.0 
-c0
-5
-    40.0 60.0 6.0 
-    40.0 40.0 6.0 
-    40.0 40.0 9.0 
-    40.0 60.0 9.0 
-    40.0 60.0 6.0 
-f77    1
-0.0 -1.0 0.0 
-c0
-5
-    60.0 40.0 6.0 
-    40.0 40.0 6.0 
-    40.0 40.0 9.0 
-    60.0 40.0 9.0 
-    60.0 40.0 6.0 
-f78    1
-1.0 -0.0 -0.0 
-c0
-5
-    60.0 0.0 6.0 
-    60.0 20.0 6.0 
-    60.0 20.0 9.0 
-    60.0 0.0 9.0 
-    60.0 0.0 6.0 
-f79    1
--0.0 1.0 -0.0 
-c0
-5
-    60.0 20.0 6.0 
-    40.0 20.0 6.0 
-    40.0 20.0 9.0 
-    60.0 20.0 9.0 
-    60.0 20.0 6.0 
-f80    1
-0.0 -1.0 0.0 
-c0
-5
-    40.0 0.0 6.0 
-    60.0 0.0 6.0 
-    60.0 0.0 9.0 
-    40.0 0.0 9.0 
-    40.0 0.0 6.0 
-f81    1
--1.0 0.0 0.0 
-c0
-5
-    40.0 20.0 6.0 
-    40.0 0.0 6.0 
-    40.0 0.0 9.0 
-    40.0 20.0 9.0 
-    40.0 20.0 6.0 
-f82    1
-1.0 -0.0 -0.0 
-c0
-5
-    100.0 0.0 6.0 
-    100.0 20.0 6.0 
-    100.0 20.0 9.0 
-    100.0 0.0 9.0 
-    100.0 0.0 6.0 
-f83    1
--0.0 1.0 -0.0 
-c0
-5
-    80.0 20.0 6.0 
-    100.0 20.0 6.0 
-    100.0 20.0 9.0 
-    80.0 20.0 9.0 
-    80.0 20.0 6.0 
-f84    1
-0.0 -1.0 0.0 
-c0
-5
-    100.0 0.0 6.0 
-    80.0 0.0 6.0 
-    80.0 0.0 9.0 
-    100.0 0.0 9.0 
-    100.0 0.0 6.0 
-f85    1
--1.0 0.0 0.0 
-c0
-5
-    80.0 20.0 6.0 
-    80.0 0.0 6.0 
-    80.0 0.0 9.0 
-    80.0 20.0 9.0 
-    80.0 20.0 6.0 
-f86    1
--1.0 0.0 0.0 
-c0
-5
-    80.0 40.0 6.0 
-    80.0 60.0 6.0 
-    80.0 60.0 9.0 
-    80.0 40.0 9.0 
-    80.0 40.0 6.0 
-f87    1
--0.0 1.0 -0.0 
-c0
-5
-    80.0 60.0 6.0 
-    100.0 60.0 6.0 
-    100.0 60.0 9.0 
-    80.0 60.0 9.0 
-    80.0 60.0 6.0 
-f88    1
-0.0 -1.0 0.0 
-c0
-5
-    80.0 40.0 6.0 
-    100.0 40.0 6.0 
-    100.0 40.0 9.0 
-    80.0 40.0 9.0 
-    80.0 40.0 6.0 
-f89    1
-1.0 -0.0 -0.0 
-c0
-5
-    100.0 60.0 6.0 
-    100.0 40.0 6.0 
-    100.0 40.0 9.0 
-    100.0 60.0 9.0 
-    100.0 60.0 6.0 
-f90    1
--0.0 1.0 -0.0 
-c0
-5
-    40.0 100.0 6.0 
-    60.0 100.0 6.0 
-    60.0 100.0 9.0 
-    40.0 100.0 9.0 
-    40.0 100.0 6.0 
-f91    1
-1.0 -0.0 -0.0 
-c0
-5
-    60.0 100.0 6.0 
-    60.0 80.0 6.0 
-    60.0 80.0 9.0 
-    60.0 100.0 9.0 
-    60.0 100.0 6.0 
-f92    1
--1.0 0.0 0.0 
-c0
-5
-    40.0 100.0 6.0 
-    40.0 80.0 6.0 
-    40.0 80.0 9.0 
-    40.0 100.0 9.0 
-    40.0 100.0 6.0 
-f93    1
-0.0 -1.0 0.0 
-c0
-5
-    60.0 80.0 6.0 
-    40.0 80.0 6.0 
-    40.0 80.0 9.0 
-    60.0 80.0 9.0 
-    60.0 80.0 6.0 
-f94    1
--0.0 1.0 -0.0 
-c0
-5
-    80.0 100.0 6.0 
-    100.0 100.0 6.0 
-    100.0 100.0 9.0 
-    80.0 100.0 9.0 
-    80.0 100.0 6.0 
-f95    1
--1.0 0.0 0.0 
-c0
-5
-    80.0 100.0 6.0 
-    80.0 80.0 6.0 
-    80.0 80.0 9.0 
-    80.0 100.0 9.0 
-    80.0 100.0 6.0 
-f96    1
-0.0 -1.0 0.0 
-c0
-5
-    80.0 80.0 6.0 
-    100.0 80.0 6.0 
-    100.0 80.0 9.0 
-    80.0 80.0 9.0 
-    80.0 80.0 6.0 
-f97    1
-1.0 -0.0 -0.0 
-c0
-5
-    100.0 100.0 6.0 
-    100.0 80.0 6.0 
-    100.0 80.0 9.0 
-    100.0 100.0 9.0 
-    100.0 100.0 6.0 
-f98    1
--0.0 1.0 -0.0 
-c0
-5
-    20.0 60.0 6.0 
-    0.0 60.0 6.0 
-    0.0 60.0 9.0 
-    20.0 60.0 9.0 
-    20.0 60.0 6.0 
-f99    1
-1.0 -0.0 -0.0 
-c0
-5
-    20.0 60.0 6.0 
-    20.0 40.0 6.0 
-    20.0 40.0 9.0 
-    20.0 60.0 9.0 
-    20.0 60.0 6.0 
-f100    1
--1.0 0.0 0.0 
-c0
-5
-    0.0 60.0 6.0 
-    0.0 40.0 6.0 
-    0.0 40.0 9.0 
-    0.0 60.0 9.0 
-    0.0 60.0 6.0 
-f101    1
-0.0 -1.0 0.0 
-c0
-5
-    20.0 40.0 6.0 
-    0.0 40.0 6.0 
-    0.0 40.0 9.0 
-    20.0 40.0 9.0 
-    20.0 40.0 6.0 
-f102    1
--1.0 0.0 0.0 
-c0
-5
-    0.0 80.0 6.0 
-    0.0 100.0 6.0 
-    0.0 100.0 9.0 
-    0.0 80.0 9.0 
-    0.0 80.0 6.0 
-f103    1
--0.0 1.0 -0.0 
-c0
-5
-    0.0 100.0 6.0 
-    20.0 100.0 6.0 
-    20.0 100.0 9.0 
-    0.0 100.0 9.0 
-    0.0 100.0 6.0 
-f104    1
-0.0 -1.0 0.0 
-c0
-5
-    0.0 80.0 6.0 
-    20.0 80.0 6.0 
-    20.0 80.0 9.0 
-    0.0 80.0 9.0 
-    0.0 80.0 6.0 
-f105    1
-1.0 -0.0 -0.0 
-c0
-5
-    20.0 100.0 6.0 
-    20.0 80.0 6.0 
-    20.0 80.0 9.0 
-    20.0 100.0 9.0 
-    20.0 100.0 6.0 
-f106    1
--0.0 1.0 -0.0 
-c0
-5
-    0.0 20.0 6.0 
-    20.0 20.0 6.0 
-    20.0 20.0 9.0 
-    0.0 20.0 9.0 
-    0.0 20.0 6.0 
-f107    1
-1.0 -0.0 -0.0 
-c0
-5
-    20.0 20.0 9.0 
-    20.0 0.0 9.0 
-    20.0 0.0 6.0 
-    20.0 20.0 6.0 
-    20.0 20.0 9.0 
-f108    1
--1.0 0.0 0.0 
-c0
-5
-    0.0 20.0 6.0 
-    0.0 0.0 6.0 
-    0.0 0.0 9.0 
-    0.0 20.0 9.0 
-    0.0 20.0 6.0 
-f109    1
-0.0 -1.0 0.0 
-c0
-5
-    20.0 0.0 6.0 
-    0.0 0.0 6.0 
-    0.0 0.0 9.0 
-    20.0 0.0 9.0 
-    20.0 0.0 6.0 
-f110    1
--0.0 1.0 -0.0 
-c0
-5
-    40.0 60.0 12.0 
-    60.0 60.0 12.0 
-    60.0 60.0 9.0 
-    40.0 60.0 9.0 
-    40.0 60.0 12.0 
-f111    1
-1.0 -0.0 -0.0 
-c0
-5
-    60.0 60.0 9.0 
-    60.0 40.0 9.0 
-    60.0 40.0 12.0 
-    60.0 60.0 12.0 
-    60.0 60.0 9.0 
-f112    1
--1.0 0.0 0.0 
-c0
-5
-    40.0 60.0 9.0 
-    40.0 40.0 9.0 
-    40.0 40.0 12.0 
-    40.0 60.0 12.0 
-    40.0 60.0 9.0 
-f113    1
-0.0 -1.0 0.0 
-c0
-5
-    60.0 40.0 9.0 
-    40.0 40.0 9.0 
-    40.0 40.0 12.0 
-    60.0 40.0 12.0 
-    60.0 40.0 9.0 
-f114    1
-1.0 -0.0 -0.0 
-c0
-5
-    60.0 0.0 9.0 
-    60.0 20.0 9.0 
-    60.0 20.0 12.0 
-    60.0 0.0 12.0 
-    60.0 0.0 9.0 
-f115    1
--0.0 1.0 -0.0 
-c0
-5
-    60.0 20.0 9.0 
-    40.0 20.0 9.0 
-    40.0 20.0 12.0 
-    60.0 20.0 12.0 
-    60.0 20.0 9.0 
-f116    1
-0.0 -1.0 0.0 
-c0
-5
-    40.0 0.0 9.0 
-    40.0 0.0 12.0 
-    60.0 0.0 12.0 
-    60.0 0.0 9.0 
-    40.0 0.0 9.0 
-f117    1
--1.0 0.0 0.0 
-c0
-5
-    40.0 20.0 9.0 
-    40.0 0.0 9.0 
-    40.0 0.0 12.0 
-    40.0 20.0 12.0 
-    40.0 20.0 9.0 
-f118    1
-1.0 -0.0 -0.0 
-c0
-5
-    100.0 0.0 9.0 
-    100.0 20.0 9.0 
-    100.0 20.0 12.0 
-    100.0 0.0 12.0 
-    100.0 0.0 9.0 
-f119    1
--0.0 1.0 -0.0 
-c0
-5
-    100.0 20.0 9.0 
-    80.0 20.0 9.0 
-    80.0 20.0 12.0 
-    100.0 20.0 12.0 
-    100.0 20.0 9.0 
-f120    1
-0.0 -1.0 0.0 
-c0
-5
-    100.0 0.0 9.0 
-    80.0 0.0 9.0 
-    80.0 0.0 12.0 
-    100.0 0.0 12.0 
-    100.0 0.0 9.0 
-f121    1
--1.0 0.0 0.0 
-c0
-5
-    80.0 20.0 9.0 
-    80.0 0.0 9.0 
-    80.0 0.0 12.0 
-    80.0 20.0 12.0 
-    80.0 20.0 9.0 
-f122    1
--1.0 0.0 0.0 
-c0
-5
-    80.0 40.0 9.0 
-    80.0 60.0 9.0 
-    80.0 60.0 12.0 
-    80.0 40.0 12.0 
-    80.0 40.0 9.0 
-f123    1
--0.0 1.0 -0.0 
-c0
-5
-    80.0 60.0 9.0 
-    100.0 60.0 9.0 
-    100.0 60.0 12.0 
-    80.0 60.0 12.0 
-    80.0 60.0 9.0 
-f124    1
-0.0 -1.0 0.0 
-c0
-5
-    80.0 40.0 9.0 
-    80.0 40.0 12.0 
-    100.0 40.0 12.0 
-    100.0 40.0 9.0 
-    80.0 40.0 9.0 
-f125    1
-1.0 -0.0 -0.0 
-c0
-5
-    100.0 60.0 9.0 
-    100.0 40.0 9.0 
-    100.0 40.0 12.0 
-    100.0 60.0 12.0 
-    100.0 60.0 9.0 
-f126    1
--0.0 1.0 -0.0 
-c0
-5
-    40.0 100.0 9.0 
-    60.0 100.0 9.0 
-    60.0 100.0 12.0 
-    40.0 100.0 12.0 
-    40.0 100.0 9.0 
-f127    1
-1.0 -0.0 -0.0 
-c0
-5
-    60.0 80.0 12.0 
-    60.0 80.0 9.0 
-    60.0 100.0 9.0 
-    60.0 100.0 12.0 
-    60.0 80.0 12.0 
-f128    1
--1.0 0.0 0.0 
-c0
-5
-    40.0 100.0 9.0 
-    40.0 80.0 9.0 
-    40.0 80.0 12.0 
-    40.0 100.0 12.0 
-    40.0 100.0 9.0 
-f129    1
-0.0 -1.0 0.0 
-c0
-5
-    60.0 80.0 9.0 
-    40.0 80.0 9.0 
-    40.0 80.0 12.0 
-    60.0 80.0 12.0 
-    60.0 80.0 9.0 
-f130    1
--0.0 1.0 -0.0 
-c0
-5
-    80.0 100.0 9.0 
-    100.0 100.0 9.0 
-    100.0 100.0 12.0 
-    80.0 100.0 12.0 
-    80.0 100.0 9.0 
-f131    1
--1.0 0.0 0.0 
-c0
-5
-    80.0 100.0 9.0 
-    80.0 80.0 9.0 
-    80.0 80.0 12.0 
-    80.0 100.0 12.0 
-    80.0 100.0 9.0 
-f132    1
-0.0 -1.0 0.0 
-c0
-5
-    80.0 80.0 9.0 
-    100.0 80.0 9.0 
-    100.0 80.0 12.0 
-    80.0 80.0 12.0 
-    80.0 80.0 9.0 
-f133    1
-1.0 -0.0 -0.0 
-c0
-5
-    100.0 100.0 9.0 
-    100.0 80.0 9.0 
-    100.0 80.0 12.0 
-    100.0 100.0 12.0 
-    100.0 100.0 9.0 
-f134    1
--0.0 1.0 -0.0 
-c0
-5
-    0.0 60.0 9.0 
-    20.0 60.0 9.0 
-    20.0 60.0 12.0 
-    0.0 60.0 12.0 
-    0.0 60.0 9.0 
-f135    1
-1.0 -0.0 -0.0 
-c0
-5
-    20.0 60.0 9.0 
-    20.0 40.0 9.0 
-    20.0 40.0 12.0 
-    20.0 60.0 12.0 
-    20.0 60.0 9.0 
-f136    1
--1.0 0.0 0.0 
-c0
-5
-    0.0 60.0 9.0 
-    0.0 60.0 12.0 
-    0.0 40.0 12.0 
-    0.0 40.0 9.0 
-    0.0 60.0 9.0 
-f137    1
-0.0 -1.0 0.0 
-c0
-5
-    20.0 40.0 12.0 
-    0.0 40.0 12.0 
-    0.0 40.0 9.0 
-    20.0 40.0 9.0 
-    20.0 40.0 12.0 
-f138    1
--1.0 0.0 0.0 
-c0
-5
-    0.0 80.0 12.0 
-    0.0 100.0 12.0 
-    0.0 100.0 9.0 
-    0.0 80.0 9.0 
-    0.0 80.0 12.0 
-f139    1
--0.0 1.0 -0.0 
-c0
-5
-    0.0 100.0 9.0 
-    20.0 100.0 9.0 
-    20.0 100.0 12.0 
-    0.0 100.0 12.0 
-    0.0 100.0 9.0 
-f140    1
-0.0 -1.0 0.0 
-c0
-5
-    0.0 80.0 9.0 
-    20.0 80.0 9.0 
-    20.0 80.0 12.0 
-    0.0 80.0 12.0 
-    0.0 80.0 9.0 
-f141    1
-1.0 -0.0 -0.0 
-c0
-5
-    20.0 100.0 9.0 
-    20.0 80.0 9.0 
-    20.0 80.0 12.0 
-    20.0 100.0 12.0 
-    20.0 100.0 9.0 
-f142    1
--0.0 1.0 -0.0 
-c0
-5
-    0.0 20.0 9.0 
-    20.0 20.0 9.0 
-    20.0 20.0 12.0 
-    0.0 20.0 12.0 
-    0.0 20.0 9.0 
-f143    1
-1.0 -0.0 -0.0 
-c0
-5
-    20.0 20.0 9.0 
-    20.0 20.0 12.0 
-    20.0 0.0 12.0 
-    20.0 0.0 9.0 
-    20.0 20.0 9.0 
-f144    1
--1.0 0.0 0.0 
-c0
-5
-    0.0 20.0 9.0 
-    0.0 0.0 9.0 
-    0.0 0.0 12.0 
-    0.0 20.0 12.0 
-    0.0 20.0 9.0 
-f145    1
-0.0 -1.0 0.0 
-c0
-5
-    20.0 0.0 9.0 
-    0.0 0.0 9.0 
-    0.0 0.0 12.0 
-    20.0 0.0 12.0 
-    20.0 0.0 9.0 
-f146    1
--0.0 1.0 -0.0 
-c0
-5
-    60.0 60.0 12.0 
-    60.0 60.0 15.0 
-    40.0 60.0 15.0 
-    40.0 60.0 12.0 
-    60.0 60.0 12.0 
-f147    1
-1.0 -0.0 -0.0 
-c0
-5
-    60.0 60.0 15.0 
-    60.0 40.0 15.0 
-    60.0 40.0 12.0 
-    60.0 60.0 12.0 
-    60.0 60.0 15.0 
-f148    1
--1.0 0.0 0.0 
-c0
-5
-    40.0 60.0 12.0 
-    40.0 40.0 12.0 
-    40.0 40.0 15.0 
-    40.0 60.0 15.0 
-    40.0 60.0 12.0 
-f149    1
-0.0 -1.0 0.0 
-c0
-5
-    60.0 40.0 12.0 
-    60.0 40.0 15.0 
-    40.0 40.0 15.0 
-    40.0 40.0 12.0 
-    60.0 40.0 12.0 
-f150    1
-1.0 -0.0 -0.0 
-c0
-5
-    60.0 0.0 12.0 
-    60.0 20.0 12.0 
-    60.0 20.0 15.0 
-    60.0 0.0 15.0 
-    60.0 0.0 12.0 
-f151    1
--0.0 1.0 -0.0 
-c0
-5
-    60.0 20.0 15.0 
-    60.0 20.0 12.0 
-    40.0 20.0 12.0 
-    40.0 20.0 15.0 
-    60.0 20.0 15.0 
-f152    1
-0.0 -1.0 0.0 
-c0
-5
-    60.0 0.0 12.0 
-    40.0 0.0 12.0 
-    40.0 0.0 15.0 
-    60.0 0.0 15.0 
-    60.0 0.0 12.0 
-f153    1
--1.0 0.0 0.0 
-c0
-5
-    40.0 20.0 12.0 
-    40.0 0.0 12.0 
-    40.0 0.0 15.0 
-    40.0 20.0 15.0 
-    40.0 20.0 12.0 
-f154    1
-1.0 -0.0 -0.0 
-c0
-5
-    100.0 0.0 12.0 
-    100.0 20.0 12.0 
-    100.0 20.0 15.0 
-    100.0 0.0 15.0 
-    100.0 0.0 12.0 
-f155    1
--0.0 1.0 -0.0 
-c0
-5
-    100.0 20.0 12.0 
-    80.0 20.0 12.0 
-    80.0 20.0 15.0 
-    100.0 20.0 15.0 
-    100.0 20.0 12.0 
-f156    1
-0.0 -1.0 0.0 
-c0
-5
-    100.0 0.0 15.0 
-    80.0 0.0 15.0 
-    80.0 0.0 12.0 
-    100.0 0.0 12.0 
-    100.0 0.0 15.0 
-f157    1
--1.0 0.0 0.0 
-c0
-5
-    80.0 20.0 12.0 
-    80.0 0.0 12.0 
-    80.0 0.0 15.0 
-    80.0 20.0 15.0 
-    80.0 20.0 12.0 
-f158    1
--1.0 0.0 0.0 
-c0
-5
-    80.0 40.0 12.0 
-    80.0 60.0 12.0 
-    80.0 60.0 15.0 
-    80.0 40.0 15.0 
-    80.0 40.0 12.0 
-f159    1
--0.0 1.0 -0.0 
-c0
-5
-    80.0 60.0 12.0 
-    100.0 60.0 12.0 
-    100.0 60.0 15.0 
-    80.0 60.0 15.0 
-    80.0 60.0 12.0 
-f160    1
-0.0 -1.0 0.0 
-c0
-5
-    80.0 40.0 12.0 
-    100.0 40.0 12.0 
-    100.0 40.0 15.0 
-    80.0 40.0 15.0 
-    80.0 40.0 12.0 
-f161    1
-1.0 -0.0 -0.0 
-c0
-5
-    100.0 40.0 12.0 
-    100.0 40.0 15.0 
-    100.0 60.0 15.0 
-    100.0 60.0 12.0 
-    100.0 40.0 12.0 
-f162    1
--0.0 1.0 -0.0 
-c0
-5
-    40.0 100.0 12.0 
-    60.0 100.0 12.0 
-    60.0 100.0 15.0 
-    40.0 100.0 15.0 
-    40.0 100.0 12.0 
-f163    1
-1.0 -0.0 -0.0 
-c0
-5
-    60.0 100.0 12.0 
-    60.0 80.0 12.0 
-    60.0 80.0 15.0 
-    60.0 100.0 15.0 
-    60.0 100.0 12.0 
-f164    1
--1.0 0.0 0.0 
-c0
-5
-    40.0 100.0 12.0 
-    40.0 80.0 12.0 
-    40.0 80.0 15.0 
-    40.0 100.0 15.0 
-    40.0 100.0 12.0 
-f165    1
-0.0 -1.0 0.0 
-c0
-5
-    60.0 80.0 12.0 
-    40.0 80.0 12.0 
-    40.0 80.0 15.0 
-    60.0 80.0 15.0 
-    60.0 80.0 12.0 
-f166    1
--0.0 1.0 -0.0 
-c0
-5
-    80.0 100.0 15.0 
-    80.0 100.0 12.0 
-    100.0 100.0 12.0 
-    100.0 100.0 15.0 
-    80.0 100.0 15.0 
-f167    1
--1.0 0.0 0.0 
-c0
-5
-    80.0 80.0 12.0 
-    80.0 100.0 12.0 
-    80.0 100.0 15.0 
-    80.0 80.0 15.0 
-    80.0 80.0 12.0 
-f168    1
-0.0 -1.0 0.0 
-c0
-5
-    80.0 80.0 12.0 
-    100.0 80.0 12.0 
-    100.0 80.0 15.0 
-    80.0 80.0 15.0 
-    80.0 80.0 12.0 
-f169    1
-1.0 -0.0 -0.0 
-c0
-5
-    100.0 100.0 12.0 
-    100.0 80.0 12.0 
-    100.0 80.0 15.0 
-    100.0 100.0 15.0 
-    100.0 100.0 12.0 
-f170    1
--0.0 1.0 -0.0 
-c0
-5
-    0.0 60.0 12.0 
-    20.0 60.0 12.0 
-    20.0 60.0 15.0 
-    0.0 60.0 15.0 
-    0.0 60.0 12.0 
-f171    1
-1.0 -0.0 -0.0 
-c0
-5
-    20.0 60.0 12.0 
-    20.0 40.0 12.0 
-    20.0 40.0 15.0 
-    20.0 60.0 15.0 
-    20.0 60.0 12.0 
-f172    1
--1.0 0.0 0.0 
-c0
-5
-    0.0 60.0 12.0 
-    0.0 40.0 12.0 
-    0.0 40.0 15.0 
-    0.0 60.0 15.0 
-    0.0 60.0 12.0 
-f173    1
-0.0 -1.0 0.0 
-c0
-5
-    20.0 40.0 12.0 
-    0.0 40.0 12.0 
-    0.0 40.0 15.0 
-    20.0 40.0 15.0 
-    20.0 40.0 12.0 
-f174    1
--1.0 0.0 0.0 
-c0
-5
-    0.0 80.0 12.0 
-    0.0 100.0 12.0 
-    0.0 100.0 15.0 
-    0.0 80.0 15.0 
-    0.0 80.0 12.0 
-f175    1
--0.0 1.0 -0.0 
-c0
-5
-    20.0 100.0 12.0 
-    20.0 100.0 15.0 
-    0.0 100.0 15.0 
-    0.0 100.0 12.0 
-    20.0 100.0 12.0 
-f176    1
-0.0 -1.0 0.0 
-c0
-5
-    0.0 80.0 12.0 
-    20.0 80.0 12.0 
-    20.0 80.0 15.0 
-    0.0 80.0 15.0 
-    0.0 80.0 12.0 
-f177    1
-1.0 -0.0 -0.0 
-c0
-5
-    20.0 100.0 12.0 
-    20.0 80.0 12.0 
-    20.0 80.0 15.0 
-    20.0 100.0 15.0 
-    20.0 100.0 12.0 
-f178    1
--0.0 1.0 -0.0 
-c0
-5
-    0.0 20.0 12.0 
-    20.0 20.0 12.0 
-    20.0 20.0 15.0 
-    0.0 20.0 15.0 
-    0.0 20.0 12.0 
-f179    1
-1.0 -0.0 -0.0 
-c0
-5
-    20.0 20.0 12.0 
-    20.0 0.0 12.0 
-    20.0 0.0 15.0 
-    20.0 20.0 15.0 
-    20.0 20.0 12.0 
-f180    1
--1.0 0.0 0.0 
-c0
-5
-    0.0 20.0 12.0 
-    0.0 0.0 12.0 
-    0.0 0.0 15.0 
-    0.0 20.0 15.0 
-    0.0 20.0 12.0 
-f181    1
-0.0 -1.0 0.0 
-c0
-5
-    20.0 0.0 12.0 
-    0.0 0.0 12.0 
-    0.0 0.0 15.0 
-    20.0 0.0 15.0 
-    20.0 0.0 12.0 
-f182    1
--0.0 1.0 -0.0 
-c0
-5
-    40.0 60.0 15.0 
-    60.0 60.0 15.0 
-    60.0 60.0 18.0 
-    40.0 60.0 18.0 
-    40.0 60.0 15.0 
-f183    1
-1.0 -0.0 -0.0 
-c0
-5
-    60.0 60.0 15.0 
-    60.0 40.0 15.0 
-    60.0 40.0 18.0 
-    60.0 60.0 18.0 
-    60.0 60.0 15.0 
-f184    1
--1.0 0.0 0.0 
-c0
-5
-    40.0 60.0 15.0 
-    40.0 40.0 15.0 
-    40.0 40.0 18.0 
-    40.0 60.0 18.0 
-    40.0 60.0 15.0 
-f185    1
-0.0 -1.0 0.0 
-c0
-5
-    60.0 40.0 15.0 
-    40.0 40.0 15.0 
-    40.0 40.0 18.0 
-    60.0 40.0 18.0 
-    60.0 40.0 15.0 
-f186    1
-1.0 -0.0 -0.0 
-c0
-5
-    60.0 0.0 15.0 
-    60.0 20.0 15.0 
-    60.0 20.0 18.0 
-    60.0 0.0 18.0 
-    60.0 0.0 15.0 
-f187    1
--0.0 1.0 -0.0 
-c0
-5
-    60.0 20.0 15.0 
-    40.0 20.0 15.0 
-    40.0 20.0 18.0 
-    60.0 20.0 18.0 
-    60.0 20.0 15.0 
-f188    1
-0.0 -1.0 0.0 
-c0
-5
-    60.0 0.0 15.0 
-    40.0 0.0 15.0 
-    40.0 0.0 18.0 
-    60.0 0.0 18.0 
-    60.0 0.0 15.0 
-f189    1
--1.0 0.0 0.0 
-c0
-5
-    40.0 20.0 15.0 
-    40.0 0.0 15.0 
-    40.0 0.0 18.0 
-    40.0 20.0 18.0 
-    40.0 20.0 15.0 
-f190    1
-1.0 -0.0 -0.0 
-c0
-5
-    100.0 0.0 15.0 
-    100.0 20.0 15.0 
-    100.0 20.0 18.0 
-    100.0 0.0 18.0 
-    100.0 0.0 15.0 
-f191    1
--0.0 1.0 -0.0 
-c0
-5
-    100.0 20.0 15.0 
-    80.0 20.0 15.0 
-    80.0 20.0 18.0 
-    100.0 20.0 18.0 
-    100.0 20.0 15.0 
-f192    1
-0.0 -1.0 0.0 
-c0
-5
-    100.0 0.0 15.0 
-    80.0 0.0 15.0 
-    80.0 0.0 18.0 
-    100.0 0.0 18.0 
-    100.0 0.0 15.0 
-f193    1
--1.0 0.0 0.0 
-c0
-5
-    80.0 20.0 15.0 
-    80.0 0.0 15.0 
-    80.0 0.0 18.0 
-    80.0 20.0 18.0 
-    80.0 20.0 15.0 
-f194    1
--1.0 0.0 0.0 
-c0
-5
-    80.0 40.0 15.0 
-    80.0 60.0 15.0 
-    80.0 60.0 18.0 
-    80.0 40.0 18.0 
-    80.0 40.0 15.0 
-f195    1
--0.0 1.0 -0.0 
-c0
-5
-    80.0 60.0 18.0 
-    100.0 60.0 18.0 
-    100.0 60.0 15.0 
-    80.0 60.0 15.0 
-    80.0 60.0 18.0 
-f196    1
-0.0 -1.0 0.0 
-c0
-5
-    80.0 40.0 15.0 
-    100.0 40.0 15.0 
-    100.0 40.0 18.0 
-    80.0 40.0 18.0 
-    80.0 40.0 15.0 
-f197    1
-1.0 -0.0 -0.0 
-c0
-5
-    100.0 60.0 15.0 
-    100.0 40.0 15.0 
-    100.0 40.0 18.0 
-    100.0 60.0 18.0 
-    100.0 60.0 15.0 
-f198    1
--0.0 1.0 -0.0 
-c0
-5
-    40.0 100.0 15.0 
-    60.0 100.0 15.0 
-    60.0 100.0 18.0 
-    40.0 100.0 18.0 
-    40.0 100.0 15.0 
-f199    1
-1.0 -0.0 -0.0 
-c0
-5
-    60.0 100.0 15.0 
-    60.0 80.0 15.0 
-    60.0 80.0 18.0 
-    60.0 100.0 18.0 
-    60.0 100.0 15.0 
-f200    1
--1.0 0.0 0.0 
-c0
-5
-    40.0 80.0 15.0 
-    40.0 100.0 15.0 
-    40.0 100.0 18.0 
-    40.0 80.0 18.0 
-    40.0 80.0 15.0 
-f201    1
-0.0 -1.0 0.0 
-c0
-5
-    60.0 80.0 15.0 
-    40.0 80.0 15.0 
-    40.0 80.0 18.0 
-    60.0 80.0 18.0 
-    60.0 80.0 15.0 
-f202    1
--0.0 1.0 -0.0 
-c0
-5
-    80.0 100.0 15.0 
-    100.0 100.0 15.0 
-    100.0 100.0 18.0 
-    80.0 100.0 18.0 
-    80.0 100.0 15.0 
-f203    1
--1.0 0.0 0.0 
-c0
-5
-    80.0 100.0 15.0 
-    80.0 80.0 15.0 
-    80.0 80.0 18.0 
-    80.0 100.0 18.0 
-    80.0 100.0 15.0 
-f204    1
-0.0 -1.0 0.0 
-c0
-5
-    100.0 80.0 15.0 
-    80.0 80.0 15.0 
-    80.0 80.0 18.0 
-    100.0 80.0 18.0 
-    100.0 80.0 15.0 
-f205    1
-1.0 -0.0 -0.0 
-c0
-5
-    100.0 100.0 15.0 
-    100.0 80.0 15.0 
-    100.0 80.0 18.0 
-    100.0 100.0 18.0 
-    100.0 100.0 15.0 
-f206    1
--0.0 1.0 -0.0 
-c0
-5
-    0.0 60.0 15.0 
-    20.0 60.0 15.0 
-    20.0 60.0 18.0 
-    0.0 60.0 18.0 
-    0.0 60.0 15.0 
-f207    1
-1.0 -0.0 -0.0 
-c0
-5
-    20.0 60.0 15.0 
-    20.0 40.0 15.0 
-    20.0 40.0 18.0 
-    20.0 60.0 18.0 
-    20.0 60.0 15.0 
-f208    1
--1.0 0.0 0.0 
-c0
-5
-    0.0 60.0 15.0 
-    0.0 40.0 15.0 
-    0.0 40.0 18.0 
-    0.0 60.0 18.0 
-    0.0 60.0 15.0 
-f209    1
-0.0 -1.0 0.0 
-c0
-5
-    20.0 40.0 15.0 
-    0.0 40.0 15.0 
-    0.0 40.0 18.0 
-    20.0 40.0 18.0 
-    20.0 40.0 15.0 
-f210    1
--1.0 0.0 0.0 
-c0
-5
-    0.0 80.0 15.0 
-    0.0 100.0 15.0 
-    0.0 100.0 18.0 
-    0.0 80.0 18.0 
-    0.0 80.0 15.0 
-f211    1
--0.0 1.0 -0.0 
-c0
-5
-    0.0 100.0 15.0 
-    20.0 100.0 15.0 
-    20.0 100.0 18.0 
-    0.0 100.0 18.0 
-    0.0 100.0 15.0 
-f212    1
-0.0 -1.0 0.0 
-c0
-5
-    20.0 80.0 15.0 
-    20.0 80.0 18.0 
-    0.0 80.0 18.0 
-    0.0 80.0 15.0 
-    20.0 80.0 15.0 
-f213    1
-1.0 -0.0 -0.0 
-c0
-5
-    20.0 100.0 15.0 
-    20.0 100.0 18.0 
-    20.0 80.0 18.0 
-    20.0 80.0 15.0 
-    20.0 100.0 15.0 
-f214    1
--0.0 1.0 -0.0 
-c0
-5
-    0.0 20.0 18.0 
-    0.0 20.0 15.0 
-    20.0 20.0 15.0 
-    20.0 20.0 18.0 
-    0.0 20.0 18.0 
-f215    1
-1.0 -0.0 -0.0 
-c0
-5
-    20.0 0.0 18.0 
-    20.0 20.0 18.0 
-    20.0 20.0 15.0 
-    20.0 0.0 15.0 
-    20.0 0.0 18.0 
-f216    1
--1.0 0.0 0.0 
-c0
-5
-    0.0 20.0 15.0 
-    0.0 0.0 15.0 
-    0.0 0.0 18.0 
-    0.0 20.0 18.0 
-    0.0 20.0 15.0 
-f217    1
-0.0 -1.0 0.0 
-c0
-5
-    20.0 0.0 15.0 
-    0.0 0.0 15.0 
-    0.0 0.0 18.0 
-    20.0 0.0 18.0 
-    20.0 0.0 15.0 
-f218    1
--0.0 1.0 -0.0 
-c0
-5
-    40.0 60.0 18.0 
-    60.0 60.0 18.0 
-    60.0 60.0 21.0 
-    40.0 60.0 21.0 
-    40.0 60.0 18.0 
-f219    1
-1.0 -0.0 -0.0 
-c0
-5
-    60.0 60.0 18.0 
-    60.0 40.0 18.0 
-    60.0 40.0 21.0 
-    60.0 60.0 21.0 
-    60.0 60.0 18.0 
-f220    1
--1.0 0.0 0.0 
-c0
-5
-    40.0 60.0 18.0 
-    40.0 40.0 18.0 
-    40.0 40.0 21.0 
-    40.0 60.0 21.0 
-    40.0 60.0 18.0 
-f221    1
-0.0 -1.0 0.0 
-c0
-5
-    60.0 40.0 18.0 
-    40.0 40.0 18.0 
-    40.0 40.0 21.0 
-    60.0 40.0 21.0 
-    60.0 40.0 18.0 
-f222    1
-1.0 -0.0 -0.0 
-c0
-5
-    60.0 0.0 18.0 
-    60.0 20.0 18.0 
-    60.0 20.0 21.0 
-    60.0 0.0 21.0 
-    60.0 0.0 18.0 
-f223    1
--0.0 1.0 -0.0 
-c0
-5
-    60.0 20.0 18.0 
-    40.0 20.0 18.0 
-    40.0 20.0 21.0 
-    60.0 20.0 21.0 
-    60.0 20.0 18.0 
-f224    1
-0.0 -1.0 0.0 
-c0
-5
-    60.0 0.0 21.0 
-    40.0 0.0 21.0 
-    40.0 0.0 18.0 
-    60.0 0.0 18.0 
-    60.0 0.0 21.0 
-f225    1
--1.0 0.0 0.0 
-c0
-5
-    40.0 20.0 21.0 
-    40.0 0.0 21.0 
-    40.0 0.0 18.0 
-    40.0 20.0 18.0 
-    40.0 20.0 21.0 
-f226    1
-1.0 -0.0 -0.0 
-c0
-5
-    100.0 0.0 21.0 
-    100.0 20.0 21.0 
-    100.0 20.0 18.0 
-    100.0 0.0 18.0 
-    100.0 0.0 21.0 
-f227    1
--0.0 1.0 -0.0 
-c0
-5
-    100.0 20.0 18.0 
-    80.0 20.0 18.0 
-    80.0 20.0 21.0 
-    100.0 20.0 21.0 
-    100.0 20.0 18.0 
-f228    1
-0.0 -1.0 0.0 
-c0
-5
-    100.0 0.0 21.0 
-    100.0 0.0 18.0 
-    80.0 0.0 18.0 
-    80.0 0.0 21.0 
-    100.0 0.0 21.0 
-f229    1
--1.0 0.0 0.0 
-c0
-5
-    80.0 20.0 18.0 
-    80.0 0.0 18.0 
-    80.0 0.0 21.0 
-    80.0 20.0 21.0 
-    80.0 20.0 18.0 
-f230    1
--1.0 0.0 0.0 
-c0
-5
-    80.0 40.0 18.0 
-    80.0 60.0 18.0 
-    80.0 60.0 21.0 
-    80.0 40.0 21.0 
-    80.0 40.0 18.0 
-f231    1
--0.0 1.0 -0.0 
-c0
-5
-    80.0 60.0 18.0 
-    100.0 60.0 18.0 
-    100.0 60.0 21.0 
-    80.0 60.0 21.0 
-    80.0 60.0 18.0 
-f232    1
-0.0 -1.0 0.0 
-c0
-5
-    80.0 40.0 18.0 
-    100.0 40.0 18.0 
-    100.0 40.0 21.0 
-    80.0 40.0 21.0 
-    80.0 40.0 18.0 
-f233    1
-1.0 -0.0 -0.0 
-c0
-5
-    100.0 60.0 18.0 
-    100.0 60.0 21.0 
-    100.0 40.0 21.0 
-    100.0 40.0 18.0 
-    100.0 60.0 18.0 
-f234    1
--0.0 1.0 -0.0 
-c0
-5
-    40.0 100.0 21.0 
-    60.0 100.0 21.0 
-    60.0 100.0 18.0 
-    40.0 100.0 18.0 
-    40.0 100.0 21.0 
-f235    1
-1.0 -0.0 -0.0 
-c0
-5
-    60.0 100.0 18.0 
-    60.0 80.0 18.0 
-    60.0 80.0 21.0 
-    60.0 100.0 21.0 
-    60.0 100.0 18.0 
-f236    1
--1.0 0.0 0.0 
-c0
-5
-    40.0 100.0 18.0 
-    40.0 80.0 18.0 
-    40.0 80.0 21.0 
-    40.0 100.0 21.0 
-    40.0 100.0 18.0 
-f237    1
-0.0 -1.0 0.0 
-c0
-5
-    60.0 80.0 18.0 
-    40.0 80.0 18.0 
-    40.0 80.0 21.0 
-    60.0 80.0 21.0 
-    60.0 80.0 18.0 
-f238    1
--0.0 1.0 -0.0 
-c0
-5
-    80.0 100.0 21.0 
-    100.0 100.0 21.0 
-    100.0 100.0 18.0 
-    80.0 100.0 18.0 
-    80.0 100.0 21.0 
-f239    1
--1.0 0.0 0.0 
-c0
-5
-    80.0 100.0 18.0 
-    80.0 80.0 18.0 
-    80.0 80.0 21.0 
-    80.0 100.0 21.0 
-    80.0 100.0 18.0 
-f240    1
-0.0 -1.0 0.0 
-c0
-5
-    100.0 80.0 21.0 
-    100.0 80.0 18.0 
-    80.0 80.0 18.0 
-    80.0 80.0 21.0 
-    100.0 80.0 21.0 
-f241    1
-1.0 -0.0 -0.0 
-c0
-5
-    100.0 100.0 18.0 
-    100.0 80.0 18.0 
-    100.0 80.0 21.0 
-    100.0 100.0 21.0 
-    100.0 100.0 18.0 
-f242    1
--0.0 1.0 -0.0 
-c0
-5
-    0.0 60.0 18.0 
-    0.0 60.0 21.0 
-    20.0 60.0 21.0 
-    20.0 60.0 18.0 
-    0.0 60.0 18.0 
-f243    1
-1.0 -0.0 -0.0 
-c0
-5
-    20.0 40.0 21.0 
-    20.0 40.0 18.0 
-    20.0 60.0 18.0 
-    20.0 60.0 21.0 
-    20.0 40.0 21.0 
-f244    1
--1.0 0.0 0.0 
-c0
-5
-    0.0 60.0 18.0 
-    0.0 40.0 18.0 
-    0.0 40.0 21.0 
-    0.0 60.0 21.0 
-    0.0 60.0 18.0 
-f245    1
-0.0 -1.0 0.0 
-c0
-5
-    20.0 40.0 21.0 
-    0.0 40.0 21.0 
-    0.0 40.0 18.0 
-    20.0 40.0 18.0 
-    20.0 40.0 21.0 
-f246    1
--1.0 0.0 0.0 
-c0
-5
-    0.0 80.0 18.0 
-    0.0 100.0 18.0 
-    0.0 100.0 21.0 
-    0.0 80.0 21.0 
-    0.0 80.0 18.0 
-f247    1
--0.0 1.0 -0.0 
-c0
-5
-    0.0 100.0 18.0 
-    20.0 100.0 18.0 
-    20.0 100.0 21.0 
-    0.0 100.0 21.0 
-    0.0 100.0 18.0 
-f248    1
-0.0 -1.0 0.0 
-c0
-5
-    0.0 80.0 18.0 
-    20.0 80.0 18.0 
-    20.0 80.0 21.0 
-    0.0 80.0 21.0 
-    0.0 80.0 18.0 
-f249    1
-1.0 -0.0 -0.0 
-c0
-5
-    20.0 100.0 18.0 
-    20.0 80.0 18.0 
-    20.0 80.0 21.0 
-    20.0 100.0 21.0 
-    20.0 100.0 18.0 
-f250    1
--0.0 1.0 -0.0 
-c0
-5
-    0.0 20.0 18.0 
-    20.0 20.0 18.0 
-    20.0 20.0 21.0 
-    0.0 20.0 21.0 
-    0.0 20.0 18.0 
-f251    1
-1.0 -0.0 -0.0 
-c0
-5
-    20.0 20.0 18.0 
-    20.0 0.0 18.0 
-    20.0 0.0 21.0 
-    20.0 20.0 21.0 
-    20.0 20.0 18.0 
-f252    1
--1.0 0.0 0.0 
-c0
-5
-    0.0 20.0 18.0 
-    0.0 0.0 18.0 
-    0.0 0.0 21.0 
-    0.0 20.0 21.0 
-    0.0 20.0 18.0 
-f253    1
-0.0 -1.0 0.0 
-c0
-5
-    20.0 0.0 21.0 
-    0.0 0.0 21.0 
-    0.0 0.0 18.0 
-    20.0 0.0 18.0 
-    20.0 0.0 21.0 
-f254    1
--0.0 1.0 -0.0 
-c0
-5
-    40.0 60.0 21.0 
-    60.0 60.0 21.0 
-    60.0 60.0 24.0 
-    40.0 60.0 24.0 
-    40.0 60.0 21.0 
-f255    1
-1.0 -0.0 -0.0 
-c0
-5
-    60.0 40.0 24.0 
-    60.0 40.0 21.0 
-    60.0 60.0 21.0 
-    60.0 60.0 24.0 
-    60.0 40.0 24.0 
-f256    1
--1.0 0.0 0.0 
-c0
-5
-    40.0 60.0 24.0 
-    40.0 60.0 21.0 
-    40.0 40.0 21.0 
-    40.0 40.0 24.0 
-    40.0 60.0 24.0 
-f257    1
-0.0 -1.0 0.0 
-c0
-5
-    60.0 40.0 21.0 
-    40.0 40.0 21.0 
-    40.0 40.0 24.0 
-    60.0 40.0 24.0 
-    60.0 40.0 21.0 
-f258    1
-1.0 -0.0 -0.0 
-c0
-5
-    60.0 0.0 21.0 
-    60.0 20.0 21.0 
-    60.0 20.0 24.0 
-    60.0 0.0 24.0 
-    60.0 0.0 21.0 
-f259    1
--0.0 1.0 -0.0 
-c0
-5
-    60.0 20.0 21.0 
-    40.0 20.0 21.0 
-    40.0 20.0 24.0 
-    60.0 20.0 24.0 
-    60.0 20.0 21.0 
-f260    1
-0.0 -1.0 0.0 
-c0
-5
-    60.0 0.0 21.0 
-    40.0 0.0 21.0 
-    40.0 0.0 24.0 
-    60.0 0.0 24.0 
-    60.0 0.0 21.0 
-f261    1
--1.0 0.0 0.0 
-c0
-5
-    40.0 20.0 21.0 
-    40.0 0.0 21.0 
-    40.0 0.0 24.0 
-    40.0 20.0 24.0 
-    40.0 20.0 21.0 
-f262    1
-1.0 -0.0 -0.0 
-c0
-5
-    100.0 0.0 21.0 
-    100.0 20.0 21.0 
-    100.0 20.0 24.0 
-    100.0 0.0 24.0 
-    100.0 0.0 21.0 
-f263    1
--0.0 1.0 -0.0 
-c0
-5
-    100.0 20.0 21.0 
-    80.0 20.0 21.0 
-    80.0 20.0 24.0 
-    100.0 20.0 24.0 
-    100.0 20.0 21.0 
-f264    1
-0.0 -1.0 0.0 
-c0
-5
-    80.0 0.0 21.0 
-    100.0 0.0 21.0 
-    100.0 0.0 24.0 
-    80.0 0.0 24.0 
-    80.0 0.0 21.0 
-f265    1
--1.0 0.0 0.0 
-c0
-5
-    80.0 20.0 21.0 
-    80.0 0.0 21.0 
-    80.0 0.0 24.0 
-    80.0 20.0 24.0 
-    80.0 20.0 21.0 
-f266    1
--1.0 0.0 0.0 
-c0
-5
-    80.0 40.0 24.0 
-    80.0 40.0 21.0 
-    80.0 60.0 21.0 
-    80.0 60.0 24.0 
-    80.0 40.0 24.0 
-f267    1
--0.0 1.0 -0.0 
-c0
-5
-    80.0 60.0 21.0 
-    100.0 60.0 21.0 
-    100.0 60.0 24.0 
-    80.0 60.0 24.0 
-    80.0 60.0 21.0 
-f268    1
-0.0 -1.0 0.0 
-c0
-5
-    80.0 40.0 21.0 
-    100.0 40.0 21.0 
-    100.0 40.0 24.0 
-    80.0 40.0 24.0 
-    80.0 40.0 21.0 
-f269    1
-1.0 -0.0 -0.0 
-c0
-5
-    100.0 60.0 21.0 
-    100.0 40.0 21.0 
-    100.0 40.0 24.0 
-    100.0 60.0 24.0 
-    100.0 60.0 21.0 
-f270    1
--0.0 1.0 -0.0 
-c0
-5
-    40.0 100.0 21.0 
-    60.0 100.0 21.0 
-    60.0 100.0 24.0 
-    40.0 100.0 24.0 
-    40.0 100.0 21.0 
-f271    1
-1.0 -0.0 -0.0 
-c0
-5
-    60.0 100.0 21.0 
-    60.0 80.0 21.0 
-    60.0 80.0 24.0 
-    60.0 100.0 24.0 
-    60.0 100.0 21.0 
-f272    1
--1.0 0.0 0.0 
-c0
-5
-    40.0 100.0 21.0 
-    40.0 80.0 21.0 
-    40.0 80.0 24.0 
-    40.0 100.0 24.0 
-    40.0 100.0 21.0 
-f273    1
-0.0 -1.0 0.0 
-c0
-5
-    60.0 80.0 21.0 
-    40.0 80.0 21.0 
-    40.0 80.0 24.0 
-    60.0 80.0 24.0 
-    60.0 80.0 21.0 
-f274    1
--0.0 1.0 -0.0 
-c0
-5
-    80.0 100.0 21.0 
-    100.0 100.0 21.0 
-    100.0 100.0 24.0 
-    80.0 100.0 24.0 
-    80.0 100.0 21.0 
-f275    1
--1.0 0.0 0.0 
-c0
-5
-    80.0 100.0 21.0 
-    80.0 80.0 21.0 
-    80.0 80.0 24.0 
-    80.0 100.0 24.0 
-    80.0 100.0 21.0 
-f276    1
-0.0 -1.0 0.0 
-c0
-5
-    80.0 80.0 21.0 
-    100.0 80.0 21.0 
-    100.0 80.0 24.0 
-    80.0 80.0 24.0 
-    80.0 80.0 21.0 
-f277    1
-1.0 -0.0 -0.0 
-c0
-5
-    100.0 80.0 21.0 
-    100.0 100.0 21.0 
-    100.0 100.0 24.0 
-    100.0 80.0 24.0 
-    100.0 80.0 21.0 
-f278    1
--0.0 1.0 -0.0 
-c0
-5
-    0.0 60.0 21.0 
-    20.0 60.0 21.0 
-    20.0 60.0 24.0 
-    0.0 60.0 24.0 
-    0.0 60.0 21.0 
-f279    1
-1.0 -0.0 -0.0 
-c0
-5
-    20.0 60.0 21.0 
-    20.0 40.0 21.0 
-    20.0 40.0 24.0 
-    20.0 60.0 24.0 
-    20.0 60.0 21.0 
-f280    1
--1.0 0.0 0.0 
-c0
-5
-    0.0 40.0 21.0 
-    0.0 60.0 21.0 
-    0.0 60.0 24.0 
-    0.0 40.0 24.0 
-    0.0 40.0 21.0 
-f281    1
-0.0 -1.0 0.0 
-c0
-5
-    20.0 40.0 21.0 
-    0.0 40.0 21.0 
-    0.0 40.0 24.0 
-    20.0 40.0 24.0 
-    20.0 40.0 21.0 
-f282    1
--0.0 1.0 -0.0 
-c0
-5
-    80.0 100.0 24.0 
-    100.0 100.0 24.0 
-    100.0 100.0 27.0 
-    80.0 100.0 27.0 
-    80.0 100.0 24.0 
-f283    1
--1.0 0.0 0.0 
-c0
-5
-    80.0 100.0 24.0 
-    80.0 80.0 24.0 
-    80.0 80.0 27.0 
-    80.0 100.0 27.0 
-    80.0 100.0 24.0 
-f284    1
-0.0 -1.0 0.0 
-c0
-5
-    80.0 80.0 24.0 
-    100.0 80.0 24.0 
-    100.0 80.0 27.0 
-    80.0 80.0 27.0 
-    80.0 80.0 24.0 
-f285    1
-1.0 -0.0 -0.0 
-c0
-5
-    100.0 100.0 24.0 
-    100.0 80.0 24.0 
-    100.0 80.0 27.0 
-    100.0 100.0 27.0 
-    100.0 100.0 24.0 
-f286    1
--0.0 1.0 -0.0 
-c0
-5
-    0.0 60.0 24.0 
-    20.0 60.0 24.0 
-    20.0 60.0 27.0 
-    0.0 60.0 27.0 
-    0.0 60.0 24.0 
-f287    1
-1.0 -0.0 -0.0 
-c0
-5
-    20.0 60.0 27.0 
-    20.0 40.0 27.0 
-    20.0 40.0 24.0 
-    20.0 60.0 24.0 
-    20.0 60.0 27.0 
-f288    1
--1.0 0.0 0.0 
-c0
-5
-    0.0 60.0 24.0 
-    0.0 40.0 24.0 
-    0.0 40.0 27.0 
-    0.0 60.0 27.0 
-    0.0 60.0 24.0 
-f289    1
-0.0 -1.0 0.0 
-c0
-5
-    20.0 40.0 27.0 
-    0.0 40.0 27.0 
-    0.0 40.0 24.0 
-    20.0 40.0 24.0 
-    20.0 40.0 27.0 
-f290    1
--1.0 0.0 0.0 
-c0
-5
-    0.0 80.0 27.0 
-    0.0 80.0 24.0 
-    0.0 100.0 24.0 
-    0.0 100.0 27.0 
-    0.0 80.0 27.0 
-f291    1
--0.0 1.0 -0.0 
-c0
-5
-    0.0 100.0 24.0 
-    20.0 100.0 24.0 
-    20.0 100.0 27.0 
-    0.0 100.0 27.0 
-    0.0 100.0 24.0 
-f292    1
-0.0 -1.0 0.0 
-c0
-5
-    0.0 80.0 24.0 
-    20.0 80.0 24.0 
-    20.0 80.0 27.0 
-    0.0 80.0 27.0 
-    0.0 80.0 24.0 
-f293    1
-1.0 -0.0 -0.0 
-c0
-5
-    20.0 100.0 24.0 
-    20.0 80.0 24.0 
-    20.0 80.0 27.0 
-    20.0 100.0 27.0 
-    20.0 100.0 24.0 
-f294    1
--0.0 1.0 -0.0 
-c0
-5
-    0.0 20.0 24.0 
-    20.0 20.0 24.0 
-    20.0 20.0 27.0 
-    0.0 20.0 27.0 
-    0.0 20.0 24.0 
-f295    1
-1.0 -0.0 -0.0 
-c0
-5
-    20.0 20.0 24.0 
-    20.0 0.0 24.0 
-    20.0 0.0 27.0 
-    20.0 20.0 27.0 
-    20.0 20.0 24.0 
-f296    1
--1.0 0.0 0.0 
-c0
-5
-    0.0 20.0 24.0 
-    0.0 0.0 24.0 
-    0.0 0.0 27.0 
-    0.0 20.0 27.0 
-    0.0 20.0 24.0 
-f297    1
-0.0 -1.0 0.0 
-c0
-5
-    20.0 0.0 24.0 
-    0.0 0.0 24.0 
-    0.0 0.0 27.0 
-    20.0 0.0 27.0 
-    20.0 0.0 24.0 
-f298    1
--0.0 1.0 -0.0 
-c0
-5
-    60.0 60.0 27.0 
-    60.0 60.0 30.0 
-    40.0 60.0 30.0 
-    40.0 60.0 27.0 
-    60.0 60.0 27.0 
-f299    1
-1.0 -0.0 -0.0 
-c0
-5
-    60.0 60.0 30.0 
-    60.0 40.0 30.0 
-    60.0 40.0 27.0 
-    60.0 60.0 27.0 
-    60.0 60.0 30.0 
-f300    1
--1.0 0.0 0.0 
-c0
-5
-    40.0 60.0 30.0 
-    40.0 40.0 30.0 
-    40.0 40.0 27.0 
-    40.0 60.0 27.0 
-    40.0 60.0 30.0 
-f301    1
-0.0 -1.0 0.0 
-c0
-5
-    60.0 40.0 27.0 
-    40.0 40.0 27.0 
-    40.0 40.0 30.0 
-    60.0 40.0 30.0 
-    60.0 40.0 27.0 
-f302    1
-1.0 -0.0 -0.0 
-c0
-5
-    60.0 0.0 30.0 
-    60.0 20.0 30.0 
-    60.0 20.0 27.0 
-    60.0 0.0 27.0 
-    60.0 0.0 30.0 
-f303    1
--0.0 1.0 -0.0 
-c0
-5
-    60.0 20.0 27.0 
-    40.0 20.0 27.0 
-    40.0 20.0 30.0 
-    60.0 20.0 30.0 
-    60.0 20.0 27.0 
-f304    1
-0.0 -1.0 0.0 
-c0
-5
-    60.0 0.0 27.0 
-    40.0 0.0 27.0 
-    40.0 0.0 30.0 
-    60.0 0.0 30.0 
-    60.0 0.0 27.0 
-f305    1
--1.0 0.0 0.0 
-c0
-5
-    40.0 20.0 27.0 
-    40.0 0.0 27.0 
-    40.0 0.0 30.0 
-    40.0 20.0 30.0 
-    40.0 20.0 27.0 
-f306    1
-1.0 -0.0 -0.0 
-c0
-5
-    100.0 0.0 27.0 
-    100.0 20.0 27.0 
-    100.0 20.0 30.0 
-    100.0 0.0 30.0 
-    100.0 0.0 27.0 
-f307    1
--0.0 1.0 -0.0 
-c0
-5
-    100.0 20.0 27.0 
-    80.0 20.0 27.0 
-    80.0 20.0 30.0 
-    100.0 20.0 30.0 
-    100.0 20.0 27.0 
-f308    1
-0.0 -1.0 0.0 
-c0
-5
-    80.0 0.0 27.0 
-    80.0 0.0 30.0 
-    100.0 0.0 30.0 
-    100.0 0.0 27.0 
-    80.0 0.0 27.0 
-f309    1
--1.0 0.0 0.0 
-c0
-5
-    80.0 20.0 30.0 
-    80.0 0.0 30.0 
-    80.0 0.0 27.0 
-    80.0 20.0 27.0 
-    80.0 20.0 30.0 
-f310    1
--1.0 0.0 0.0 
-c0
-5
-    80.0 40.0 27.0 
-    80.0 60.0 27.0 
-    80.0 60.0 30.0 
-    80.0 40.0 30.0 
-    80.0 40.0 27.0 
-f311    1
--0.0 1.0 -0.0 
-c0
-5
-    80.0 60.0 27.0 
-    100.0 60.0 27.0 
-    100.0 60.0 30.0 
-    80.0 60.0 30.0 
-    80.0 60.0 27.0 
-f312    1
-0.0 -1.0 0.0 
-c0
-5
-    80.0 40.0 27.0 
-    100.0 40.0 27.0 
-    100.0 40.0 30.0 
-    80.0 40.0 30.0 
-    80.0 40.0 27.0 
-f313    1
-1.0 -0.0 -0.0 
-c0
-5
-    100.0 40.0 27.0 
-    100.0 60.0 27.0 
-    100.0 60.0 30.0 
-    100.0 40.0 30.0 
-    100.0 40.0 27.0 
-f314    1
--0.0 1.0 -0.0 
-c0
-5
-    40.0 100.0 30.0 
-    40.0 100.0 27.0 
-    60.0 100.0 27.0 
-    60.0 100.0 30.0 
-    40.0 100.0 30.0 
-f315    1
-1.0 -0.0 -0.0 
-c0
-5
-    60.0 100.0 27.0 
-    60.0 80.0 27.0 
-    60.0 80.0 30.0 
-    60.0 100.0 30.0 
-    60.0 100.0 27.0 
-f316    1
--1.0 0.0 0.0 
-c0
-5
-    40.0 100.0 27.0 
-    40.0 80.0 27.0 
-    40.0 80.0 30.0 
-    40.0 100.0 30.0 
-    40.0 100.0 27.0 
-f317    1
-0.0 -1.0 0.0 
-c0
-5
-    60.0 80.0 27.0 
-    40.0 80.0 27.0 
-    40.0 80.0 30.0 
-    60.0 80.0 30.0 
-    60.0 80.0 27.0 
-f318    1
--0.0 1.0 -0.0 
-c0
-5
-    100.0 100.0 30.0 
-    100.0 100.0 27.0 
-    80.0 100.0 27.0 
-    80.0 100.0 30.0 
-    100.0 100.0 30.0 
-f319    1
--1.0 0.0 0.0 
-c0
-5
-    80.0 100.0 27.0 
-    80.0 80.0 27.0 
-    80.0 80.0 30.0 
-    80.0 100.0 30.0 
-    80.0 100.0 27.0 
-f320    1
-0.0 -1.0 0.0 
-c0
-5
-    80.0 80.0 27.0 
-    100.0 80.0 27.0 
-    100.0 80.0 30.0 
-    80.0 80.0 30.0 
-    80.0 80.0 27.0 
-f321    1
-1.0 -0.0 -0.0 
-c0
-5
-    100.0 100.0 27.0 
-    100.0 80.0 27.0 
-    100.0 80.0 30.0 
-    100.0 100.0 30.0 
-    100.0 100.0 27.0 
-f322    1
--0.0 1.0 -0.0 
-c0
-5
-    0.0 60.0 27.0 
-    20.0 60.0 27.0 
-    20.0 60.0 30.0 
-    0.0 60.0 30.0 
-    0.0 60.0 27.0 
-f323    1
-1.0 -0.0 -0.0 
-c0
-5
-    20.0 60.0 27.0 
-    20.0 40.0 27.0 
-    20.0 40.0 30.0 
-    20.0 60.0 30.0 
-    20.0 60.0 27.0 
-f324    1
--1.0 0.0 0.0 
-c0
-5
-    0.0 60.0 27.0 
-    0.0 40.0 27.0 
-    0.0 40.0 30.0 
-    0.0 60.0 30.0 
-    0.0 60.0 27.0 
-f325    1
-0.0 -1.0 0.0 
-c0
-5
-    20.0 40.0 27.0 
-    0.0 40.0 27.0 
-    0.0 40.0 30.0 
-    20.0 40.0 30.0 
-    20.0 40.0 27.0 
-f326    1
--1.0 0.0 0.0 
-c0
-5
-    0.0 80.0 27.0 
-    0.0 100.0 27.0 
-    0.0 100.0 30.0 
-    0.0 80.0 30.0 
-    0.0 80.0 27.0 
-f327    1
--0.0 1.0 -0.0 
-c0
-5
-    0.0 100.0 27.0 
-    20.0 100.0 27.0 
-    20.0 100.0 30.0 
-    0.0 100.0 30.0 
-    0.0 100.0 27.0 
-f328    1
-0.0 -1.0 0.0 
-c0
-5
-    20.0 80.0 30.0 
-    20.0 80.0 27.0 
-    0.0 80.0 27.0 
-    0.0 80.0 30.0 
-    20.0 80.0 30.0 
-f329    1
-1.0 -0.0 -0.0 
-c0
-5
-    20.0 100.0 27.0 
-    20.0 80.0 27.0 
-    20.0 80.0 30.0 
-    20.0 100.0 30.0 
-    20.0 100.0 27.0 
-f330    1
--0.0 1.0 -0.0 
-c0
-5
-    0.0 20.0 27.0 
-    20.0 20.0 27.0 
-    20.0 20.0 30.0 
-    0.0 20.0 30.0 
-    0.0 20.0 27.0 
-f331    1
-1.0 -0.0 -0.0 
-c0
-5
-    20.0 20.0 27.0 
-    20.0 0.0 27.0 
-    20.0 0.0 30.0 
-    20.0 20.0 30.0 
-    20.0 20.0 27.0 
-f332    1
--1.0 0.0 0.0 
-c0
-5
-    0.0 20.0 27.0 
-    0.0 0.0 27.0 
-    0.0 0.0 30.0 
-    0.0 20.0 30.0 
-    0.0 20.0 27.0 
-f333    1
-0.0 -1.0 0.0 
-c0
-5
-    20.0 0.0 27.0 
-    0.0 0.0 27.0 
-    0.0 0.0 30.0 
-    20.0 0.0 30.0 
-    20.0 0.0 27.0 
-f334    1
--0.0 -0.0 1.0 
-c0
-5
-    60.0 60.0 30.0 
-    60.0 40.0 30.0 
-    40.0 40.0 30.0 
-    40.0 60.0 30.0 
-    60.0 60.0 30.0 
-f335    1
--0.0 -0.0 1.0 
-c0
-5
-    60.0 0.0 30.0 
-    60.0 20.0 30.0 
-    40.0 20.0 30.0 
-    40.0 0.0 30.0 
-    60.0 0.0 30.0 
-f336    1
--0.0 -0.0 1.0 
-c0
-5
-    100.0 0.0 30.0 
-    100.0 20.0 30.0 
-    80.0 20.0 30.0 
-    80.0 0.0 30.0 
-    100.0 0.0 30.0 
-f337    1
--0.0 -0.0 1.0 
-c0
-5
-    80.0 40.0 30.0 
-    80.0 60.0 30.0 
-    100.0 60.0 30.0 
-    100.0 40.0 30.0 
-    80.0 40.0 30.0 
-f338    1
--0.0 -0.0 1.0 
-c0
-5
-    40.0 100.0 30.0 
-    40.0 80.0 30.0 
-    60.0 80.0 30.0 
-    60.0 100.0 30.0 
-    40.0 100.0 30.0 
-f339    1
--0.0 -0.0 1.0 
-c0
-5
-    80.0 100.0 30.0 
-    100.0 100.0 30.0 
-    100.0 80.0 30.0 
-    80.0 80.0 30.0 
-    80.0 100.0 30.0 
-f340    1
--0.0 -0.0 1.0 
-c0
-5
-    0.0 60.0 30.0 
-    20.0 60.0 30.0 
-    20.0 40.0 30.0 
-    0.0 40.0 30.0 
-    0.0 60.0 30.0 
-f341    1
--0.0 -0.0 1.0 
-c0
-5
-    0.0 80.0 30.0 
-    0.0 100.0 30.0 
-    20.0 100.0 30.0 
-    20.0 80.0 30.0 
-    0.0 80.0 30.0 
-f342    1
--0.0 -0.0 1.0 
-c0
-5
-    20.0 20.0 30.0 
-    0.0 20.0 30.0 
-    0.0 0.0 30.0 
-    20.0 0.0 30.0 
-    20.0 20.0 30.0 
-f343    1
--1.0 0.0 0.0 
-c0
-5
-    0.0 80.0 21.0 
-    0.0 100.0 21.0 
-    0.0 100.0 24.0 
-    0.0 80.0 24.0 
-    0.0 80.0 21.0 
-f344    1
--0.0 1.0 -0.0 
-c0
-5
-    0.0 100.0 21.0 
-    20.0 100.0 21.0 
-    20.0 100.0 24.0 
-    0.0 100.0 24.0 
-    0.0 100.0 21.0 
-f345    1
-0.0 -1.0 0.0 
-c0
-5
-    0.0 80.0 21.0 
-    20.0 80.0 21.0 
-    20.0 80.0 24.0 
-    0.0 80.0 24.0 
-    0.0 80.0 21.0 
-f346    1
-1.0 -0.0 -0.0 
-c0
-5
-    20.0 100.0 21.0 
-    20.0 80.0 21.0 
-    20.0 80.0 24.0 
-    20.0 100.0 24.0 
-    20.0 100.0 21.0 
-f347    1
--0.0 1.0 -0.0 
-c0
-5
-    0.0 20.0 21.0 
-    20.0 20.0 21.0 
-    20.0 20.0 24.0 
-    0.0 20.0 24.0 
-    0.0 20.0 21.0 
-f348    1
-1.0 -0.0 -0.0 
-c0
-5
-    20.0 20.0 21.0 
-    20.0 0.0 21.0 
-    20.0 0.0 24.0 
-    20.0 20.0 24.0 
-    20.0 20.0 21.0 
-f349    1
--1.0 0.0 0.0 
-c0
-5
-    0.0 20.0 21.0 
-    0.0 0.0 21.0 
-    0.0 0.0 24.0 
-    0.0 20.0 24.0 
-    0.0 20.0 21.0 
-f350    1
-0.0 -1.0 0.0 
-c0
-5
-    20.0 0.0 21.0 
-    0.0 0.0 21.0 
-    0.0 0.0 24.0 
-    20.0 0.0 24.0 
-    20.0 0.0 21.0 
-f351    1
--0.0 1.0 -0.0 
-c0
-5
-    40.0 60.0 24.0 
-    60.0 60.0 24.0 
-    60.0 60.0 27.0 
-    40.0 60.0 27.0 
-    40.0 60.0 24.0 
-f352    1
-1.0 -0.0 -0.0 
-c0
-5
-    60.0 60.0 24.0 
-    60.0 40.0 24.0 
-    60.0 40.0 27.0 
-    60.0 60.0 27.0 
-    60.0 60.0 24.0 
-f353    1
--1.0 0.0 0.0 
-c0
-5
-    40.0 60.0 24.0 
-    40.0 40.0 24.0 
-    40.0 40.0 27.0 
-    40.0 60.0 27.0 
-    40.0 60.0 24.0 
-f354    1
-0.0 -1.0 0.0 
-c0
-5
-    60.0 40.0 24.0 
-    40.0 40.0 24.0 
-    40.0 40.0 27.0 
-    60.0 40.0 27.0 
-    60.0 40.0 24.0 
-f355    1
-1.0 -0.0 -0.0 
-c0
-5
-    60.0 0.0 24.0 
-    60.0 20.0 24.0 
-    60.0 20.0 27.0 
-    60.0 0.0 27.0 
-    60.0 0.0 24.0 
-f356    1
--0.0 1.0 -0.0 
-c0
-5
-    60.0 20.0 24.0 
-    40.0 20.0 24.0 
-    40.0 20.0 27.0 
-    60.0 20.0 27.0 
-    60.0 20.0 24.0 
-f357    1
-0.0 -1.0 0.0 
-c0
-5
-    60.0 0.0 24.0 
-    40.0 0.0 24.0 
-    40.0 0.0 27.0 
-    60.0 0.0 27.0 
-    60.0 0.0 24.0 
-f358    1
--1.0 0.0 0.0 
-c0
-5
-    40.0 20.0 24.0 
-    40.0 0.0 24.0 
-    40.0 0.0 27.0 
-    40.0 20.0 27.0 
-    40.0 20.0 24.0 
-f359    1
-1.0 -0.0 -0.0 
-c0
-5
-    100.0 0.0 24.0 
-    100.0 0.0 27.0 
-    100.0 20.0 27.0 
-    100.0 20.0 24.0 
-    100.0 0.0 24.0 
-f360    1
--0.0 1.0 -0.0 
-c0
-5
-    100.0 20.0 27.0 
-    80.0 20.0 27.0 
-    80.0 20.0 24.0 
-    100.0 20.0 24.0 
-    100.0 20.0 27.0 
-f361    1
-0.0 -1.0 0.0 
-c0
-5
-    100.0 0.0 24.0 
-    80.0 0.0 24.0 
-    80.0 0.0 27.0 
-    100.0 0.0 27.0 
-    100.0 0.0 24.0 
-f362    1
--1.0 0.0 0.0 
-c0
-5
-    80.0 20.0 24.0 
-    80.0 0.0 24.0 
-    80.0 0.0 27.0 
-    80.0 20.0 27.0 
-    80.0 20.0 24.0 
-f363    1
--1.0 0.0 0.0 
-c0
-5
-    80.0 40.0 24.0 
-    80.0 60.0 24.0 
-    80.0 60.0 27.0 
-    80.0 40.0 27.0 
-    80.0 40.0 24.0 
-f364    1
--0.0 1.0 -0.0 
-c0
-5
-    80.0 60.0 24.0 
-    100.0 60.0 24.0 
-    100.0 60.0 27.0 
-    80.0 60.0 27.0 
-    80.0 60.0 24.0 
-f365    1
-0.0 -1.0 0.0 
-c0
-5
-    80.0 40.0 24.0 
-    100.0 40.0 24.0 
-    100.0 40.0 27.0 
-    80.0 40.0 27.0 
-    80.0 40.0 24.0 
-f366    1
-1.0 -0.0 -0.0 
-c0
-5
-    100.0 40.0 27.0 
-    100.0 40.0 24.0 
-    100.0 60.0 24.0 
-    100.0 60.0 27.0 
-    100.0 40.0 27.0 
-f367    1
--0.0 1.0 -0.0 
-c0
-5
-    40.0 100.0 24.0 
-    60.0 100.0 24.0 
-    60.0 100.0 27.0 
-    40.0 100.0 27.0 
-    40.0 100.0 24.0 
-f368    1
-1.0 -0.0 -0.0 
-c0
-5
-    60.0 100.0 24.0 
-    60.0 80.0 24.0 
-    60.0 80.0 27.0 
-    60.0 100.0 27.0 
-    60.0 100.0 24.0 
-f369    1
--1.0 0.0 0.0 
-c0
-5
-    40.0 100.0 27.0 
-    40.0 80.0 27.0 
-    40.0 80.0 24.0 
-    40.0 100.0 24.0 
-    40.0 100.0 27.0 
-f370    1
-0.0 -1.0 0.0 
-c0
-5
-    60.0 80.0 24.0 
-    40.0 80.0 24.0 
-    40.0 80.0 27.0 
-    60.0 80.0 27.0 
-    60.0 80.0 24.0 
-""")
+        sio = AbstractGeoDataFrameDemos._dataset(
+            "GeoDataFrameDemos5", "cirSceneMasque2.cir"
+        )
         return CirReader(sio).run()
 
     @staticmethod
@@ -26805,3406 +95,9 @@ c0
 
         PUIS TRAITEMENT DES ORIENTATIONS DES FACES SOUS SketchUp
         '''
-        sio = StringIO("""370    370
-    99999    99999
-    99999    99999
-    99999    99999
-    99999    99999
-    99999    99999
-f1 1
-    -0.0    -0.0    1.0
-c9
-5
-    0.0    0.0    0.0
-    150.0    0.0    0.0
-    150.0    150.0    0.0
-    0.0    150.0    0.0
-    0.0    0.0    0.0
-t
-5
-    50.0    50.0    0.0
-    50.0    30.0    0.0
-    30.0    30.0    0.0
-    30.0    50.0    0.0
-    50.0    50.0    0.0
-t
-5
-    90.0    30.0    0.0
-    70.0    30.0    0.0
-    70.0    50.0    0.0
-    90.0    50.0    0.0
-    90.0    30.0    0.0
-t
-5
-    130.0    30.0    0.0
-    110.0    30.0    0.0
-    110.0    50.0    0.0
-    130.0    50.0    0.0
-    130.0    30.0    0.0
-t
-5
-    50.0    90.0    0.0
-    50.0    70.0    0.0
-    30.0    70.0    0.0
-    30.0    90.0    0.0
-    50.0    90.0    0.0
-t
-5
-    90.0    70.0    0.0
-    70.0    70.0    0.0
-    70.0    90.0    0.0
-    90.0    90.0    0.0
-    90.0    70.0    0.0
-t
-5
-    110.0    90.0    0.0
-    130.0    90.0    0.0
-    130.0    70.0    0.0
-    110.0    70.0    0.0
-    110.0    90.0    0.0
-t
-5
-    30.0    130.0    0.0
-    50.0    130.0    0.0
-    50.0    110.0    0.0
-    30.0    110.0    0.0
-    30.0    130.0    0.0
-t
-5
-    90.0    130.0    0.0
-    90.0    110.0    0.0
-    70.0    110.0    0.0
-    70.0    130.0    0.0
-    90.0    130.0    0.0
-t
-5
-    130.0    110.0    0.0
-    110.0    110.0    0.0
-    110.0    130.0    0.0
-    130.0    130.0    0.0
-    130.0    110.0    0.0
-f2 1
-    -0.0    1.0    -0.0
-c0
-5
-    90.0    90.0    0.0
-    70.0    90.0    0.0
-    70.0    90.0    3.0
-    90.0    90.0    3.0
-    90.0    90.0    0.0
-f3 1
-    1.0    -0.0    -0.0
-c0
-5
-    90.0    70.0    0.0
-    90.0    90.0    0.0
-    90.0    90.0    3.0
-    90.0    70.0    3.0
-    90.0    70.0    0.0
-f4 1
-    -1.0    0.0    0.0
-c0
-5
-    70.0    70.0    0.0
-    70.0    70.0    3.0
-    70.0    90.0    3.0
-    70.0    90.0    0.0
-    70.0    70.0    0.0
-f5 1
-    0.0    -1.0    0.0
-c0
-5
-    70.0    70.0    3.0
-    70.0    70.0    0.0
-    90.0    70.0    0.0
-    90.0    70.0    3.0
-    70.0    70.0    3.0
-f6 1
-    1.0    -0.0    -0.0
-c0
-5
-    90.0    30.0    0.0
-    90.0    50.0    0.0
-    90.0    50.0    3.0
-    90.0    30.0    3.0
-    90.0    30.0    0.0
-f7 1
-    -0.0    1.0    -0.0
-c0
-5
-    90.0    50.0    0.0
-    70.0    50.0    0.0
-    70.0    50.0    3.0
-    90.0    50.0    3.0
-    90.0    50.0    0.0
-f8 1
-    0.0    -1.0    0.0
-c0
-5
-    70.0    30.0    0.0
-    90.0    30.0    0.0
-    90.0    30.0    3.0
-    70.0    30.0    3.0
-    70.0    30.0    0.0
-f9 1
-    -1.0    0.0    0.0
-c0
-5
-    70.0    50.0    0.0
-    70.0    30.0    0.0
-    70.0    30.0    3.0
-    70.0    50.0    3.0
-    70.0    50.0    0.0
-f10 1
-    1.0    -0.0    -0.0
-c0
-5
-    130.0    30.0    0.0
-    130.0    50.0    0.0
-    130.0    50.0    3.0
-    130.0    30.0    3.0
-    130.0    30.0    0.0
-f11 1
-    -0.0    1.0    -0.0
-c0
-5
-    130.0    50.0    0.0
-    110.0    50.0    0.0
-    110.0    50.0    3.0
-    130.0    50.0    3.0
-    130.0    50.0    0.0
-f12 1
-    0.0    -1.0    0.0
-c0
-5
-    110.0    30.0    0.0
-    130.0    30.0    0.0
-    130.0    30.0    3.0
-    110.0    30.0    3.0
-    110.0    30.0    0.0
-f13 1
-    -1.0    0.0    0.0
-c0
-5
-    110.0    30.0    0.0
-    110.0    30.0    3.0
-    110.0    50.0    3.0
-    110.0    50.0    0.0
-    110.0    30.0    0.0
-f14 1
-    -1.0    0.0    0.0
-c0
-5
-    110.0    90.0    0.0
-    110.0    70.0    0.0
-    110.0    70.0    3.0
-    110.0    90.0    3.0
-    110.0    90.0    0.0
-f15 1
-    -0.0    1.0    -0.0
-c0
-5
-    130.0    90.0    0.0
-    110.0    90.0    0.0
-    110.0    90.0    3.0
-    130.0    90.0    3.0
-    130.0    90.0    0.0
-f16 1
-    0.0    -1.0    0.0
-c0
-5
-    110.0    70.0    0.0
-    130.0    70.0    0.0
-    130.0    70.0    3.0
-    110.0    70.0    3.0
-    110.0    70.0    0.0
-f17 1
-    1.0    -0.0    -0.0
-c0
-5
-    130.0    70.0    0.0
-    130.0    90.0    0.0
-    130.0    90.0    3.0
-    130.0    70.0    3.0
-    130.0    70.0    0.0
-f18 1
-    -0.0    1.0    -0.0
-c0
-5
-    70.0    130.0    0.0
-    70.0    130.0    3.0
-    90.0    130.0    3.0
-    90.0    130.0    0.0
-    70.0    130.0    0.0
-f19 1
-    1.0    -0.0    -0.0
-c0
-5
-    90.0    110.0    0.0
-    90.0    130.0    0.0
-    90.0    130.0    3.0
-    90.0    110.0    3.0
-    90.0    110.0    0.0
-f20 1
-    -1.0    0.0    0.0
-c0
-5
-    70.0    130.0    0.0
-    70.0    110.0    0.0
-    70.0    110.0    3.0
-    70.0    130.0    3.0
-    70.0    130.0    0.0
-f21 1
-    0.0    -1.0    0.0
-c0
-5
-    70.0    110.0    3.0
-    70.0    110.0    0.0
-    90.0    110.0    0.0
-    90.0    110.0    3.0
-    70.0    110.0    3.0
-f22 1
-    -0.0    1.0    -0.0
-c0
-5
-    130.0    130.0    0.0
-    110.0    130.0    0.0
-    110.0    130.0    3.0
-    130.0    130.0    3.0
-    130.0    130.0    0.0
-f23 1
-    -1.0    0.0    0.0
-c0
-5
-    110.0    130.0    3.0
-    110.0    130.0    0.0
-    110.0    110.0    0.0
-    110.0    110.0    3.0
-    110.0    130.0    3.0
-f24 1
-    0.0    -1.0    0.0
-c0
-5
-    110.0    110.0    0.0
-    130.0    110.0    0.0
-    130.0    110.0    3.0
-    110.0    110.0    3.0
-    110.0    110.0    0.0
-f25 1
-    1.0    -0.0    -0.0
-c0
-5
-    130.0    110.0    0.0
-    130.0    130.0    0.0
-    130.0    130.0    3.0
-    130.0    110.0    3.0
-    130.0    110.0    0.0
-f26 1
-    -0.0    1.0    -0.0
-c0
-5
-    50.0    90.0    0.0
-    30.0    90.0    0.0
-    30.0    90.0    3.0
-    50.0    90.0    3.0
-    50.0    90.0    0.0
-f27 1
-    1.0    -0.0    -0.0
-c0
-5
-    50.0    70.0    0.0
-    50.0    90.0    0.0
-    50.0    90.0    3.0
-    50.0    70.0    3.0
-    50.0    70.0    0.0
-f28 1
-    -1.0    0.0    0.0
-c0
-5
-    30.0    90.0    0.0
-    30.0    70.0    0.0
-    30.0    70.0    3.0
-    30.0    90.0    3.0
-    30.0    90.0    0.0
-f29 1
-    0.0    -1.0    0.0
-c0
-5
-    30.0    70.0    0.0
-    50.0    70.0    0.0
-    50.0    70.0    3.0
-    30.0    70.0    3.0
-    30.0    70.0    0.0
-f30 1
-    -1.0    0.0    0.0
-c0
-5
-    30.0    130.0    0.0
-    30.0    110.0    0.0
-    30.0    110.0    3.0
-    30.0    130.0    3.0
-    30.0    130.0    0.0
-f31 1
-    -0.0    1.0    -0.0
-c0
-5
-    50.0    130.0    0.0
-    30.0    130.0    0.0
-    30.0    130.0    3.0
-    50.0    130.0    3.0
-    50.0    130.0    0.0
-f32 1
-    0.0    -1.0    0.0
-c0
-5
-    30.0    110.0    3.0
-    30.0    110.0    0.0
-    50.0    110.0    0.0
-    50.0    110.0    3.0
-    30.0    110.0    3.0
-f33 1
-    1.0    -0.0    -0.0
-c0
-5
-    50.0    110.0    0.0
-    50.0    130.0    0.0
-    50.0    130.0    3.0
-    50.0    110.0    3.0
-    50.0    110.0    0.0
-f34 1
-    -0.0    1.0    -0.0
-c0
-5
-    50.0    50.0    0.0
-    30.0    50.0    0.0
-    30.0    50.0    3.0
-    50.0    50.0    3.0
-    50.0    50.0    0.0
-f35 1
-    1.0    -0.0    -0.0
-c0
-5
-    50.0    30.0    0.0
-    50.0    50.0    0.0
-    50.0    50.0    3.0
-    50.0    30.0    3.0
-    50.0    30.0    0.0
-f36 1
-    -1.0    0.0    0.0
-c0
-5
-    30.0    50.0    0.0
-    30.0    30.0    0.0
-    30.0    30.0    3.0
-    30.0    50.0    3.0
-    30.0    50.0    0.0
-f37 1
-    0.0    -1.0    0.0
-c0
-5
-    30.0    30.0    0.0
-    50.0    30.0    0.0
-    50.0    30.0    3.0
-    30.0    30.0    3.0
-    30.0    30.0    0.0
-f38 1
-    -0.0    1.0    -0.0
-c0
-5
-    90.0    90.0    3.0
-    70.0    90.0    3.0
-    70.0    90.0    6.0
-    90.0    90.0    6.0
-    90.0    90.0    3.0
-f39 1
-    1.0    -0.0    -0.0
-c0
-5
-    90.0    70.0    3.0
-    90.0    90.0    3.0
-    90.0    90.0    6.0
-    90.0    70.0    6.0
-    90.0    70.0    3.0
-f40 1
-    -1.0    0.0    0.0
-c0
-5
-    70.0    90.0    3.0
-    70.0    70.0    3.0
-    70.0    70.0    6.0
-    70.0    90.0    6.0
-    70.0    90.0    3.0
-f41 1
-    0.0    -1.0    0.0
-c0
-5
-    90.0    70.0    6.0
-    70.0    70.0    6.0
-    70.0    70.0    3.0
-    90.0    70.0    3.0
-    90.0    70.0    6.0
-f42 1
-    1.0    -0.0    -0.0
-c0
-5
-    90.0    50.0    3.0
-    90.0    50.0    6.0
-    90.0    30.0    6.0
-    90.0    30.0    3.0
-    90.0    50.0    3.0
-f43 1
-    -0.0    1.0    -0.0
-c0
-5
-    90.0    50.0    3.0
-    70.0    50.0    3.0
-    70.0    50.0    6.0
-    90.0    50.0    6.0
-    90.0    50.0    3.0
-f44 1
-    0.0    -1.0    0.0
-c0
-5
-    70.0    30.0    3.0
-    90.0    30.0    3.0
-    90.0    30.0    6.0
-    70.0    30.0    6.0
-    70.0    30.0    3.0
-f45 1
-    -1.0    0.0    0.0
-c0
-5
-    70.0    50.0    3.0
-    70.0    30.0    3.0
-    70.0    30.0    6.0
-    70.0    50.0    6.0
-    70.0    50.0    3.0
-f46 1
-    1.0    -0.0    -0.0
-c0
-5
-    130.0    30.0    3.0
-    130.0    50.0    3.0
-    130.0    50.0    6.0
-    130.0    30.0    6.0
-    130.0    30.0    3.0
-f47 1
-    -0.0    1.0    -0.0
-c0
-5
-    110.0    50.0    3.0
-    110.0    50.0    6.0
-    130.0    50.0    6.0
-    130.0    50.0    3.0
-    110.0    50.0    3.0
-f48 1
-    0.0    -1.0    0.0
-c0
-5
-    130.0    30.0    3.0
-    130.0    30.0    6.0
-    110.0    30.0    6.0
-    110.0    30.0    3.0
-    130.0    30.0    3.0
-f49 1
-    -1.0    0.0    0.0
-c0
-5
-    110.0    50.0    6.0
-    110.0    50.0    3.0
-    110.0    30.0    3.0
-    110.0    30.0    6.0
-    110.0    50.0    6.0
-f50 1
-    -1.0    0.0    0.0
-c0
-5
-    110.0    90.0    3.0
-    110.0    70.0    3.0
-    110.0    70.0    6.0
-    110.0    90.0    6.0
-    110.0    90.0    3.0
-f51 1
-    -0.0    1.0    -0.0
-c0
-5
-    110.0    90.0    3.0
-    110.0    90.0    6.0
-    130.0    90.0    6.0
-    130.0    90.0    3.0
-    110.0    90.0    3.0
-f52 1
-    0.0    -1.0    0.0
-c0
-5
-    110.0    70.0    6.0
-    110.0    70.0    3.0
-    130.0    70.0    3.0
-    130.0    70.0    6.0
-    110.0    70.0    6.0
-f53 1
-    1.0    -0.0    -0.0
-c0
-5
-    130.0    70.0    3.0
-    130.0    90.0    3.0
-    130.0    90.0    6.0
-    130.0    70.0    6.0
-    130.0    70.0    3.0
-f54 1
-    -0.0    1.0    -0.0
-c0
-5
-    90.0    130.0    3.0
-    70.0    130.0    3.0
-    70.0    130.0    6.0
-    90.0    130.0    6.0
-    90.0    130.0    3.0
-f55 1
-    1.0    -0.0    -0.0
-c0
-5
-    90.0    110.0    3.0
-    90.0    130.0    3.0
-    90.0    130.0    6.0
-    90.0    110.0    6.0
-    90.0    110.0    3.0
-f56 1
-    -1.0    0.0    0.0
-c0
-5
-    70.0    130.0    3.0
-    70.0    110.0    3.0
-    70.0    110.0    6.0
-    70.0    130.0    6.0
-    70.0    130.0    3.0
-f57 1
-    0.0    -1.0    0.0
-c0
-5
-    70.0    110.0    3.0
-    90.0    110.0    3.0
-    90.0    110.0    6.0
-    70.0    110.0    6.0
-    70.0    110.0    3.0
-f58 1
-    -0.0    1.0    -0.0
-c0
-5
-    130.0    130.0    3.0
-    110.0    130.0    3.0
-    110.0    130.0    6.0
-    130.0    130.0    6.0
-    130.0    130.0    3.0
-f59 1
-    -1.0    0.0    0.0
-c0
-5
-    110.0    110.0    6.0
-    110.0    130.0    6.0
-    110.0    130.0    3.0
-    110.0    110.0    3.0
-    110.0    110.0    6.0
-f60 1
-    0.0    -1.0    0.0
-c0
-5
-    110.0    110.0    3.0
-    130.0    110.0    3.0
-    130.0    110.0    6.0
-    110.0    110.0    6.0
-    110.0    110.0    3.0
-f61 1
-    1.0    -0.0    -0.0
-c0
-5
-    130.0    110.0    6.0
-    130.0    110.0    3.0
-    130.0    130.0    3.0
-    130.0    130.0    6.0
-    130.0    110.0    6.0
-f62 1
-    -0.0    1.0    -0.0
-c0
-5
-    50.0    90.0    3.0
-    30.0    90.0    3.0
-    30.0    90.0    6.0
-    50.0    90.0    6.0
-    50.0    90.0    3.0
-f63 1
-    1.0    -0.0    -0.0
-c0
-5
-    50.0    70.0    3.0
-    50.0    90.0    3.0
-    50.0    90.0    6.0
-    50.0    70.0    6.0
-    50.0    70.0    3.0
-f64 1
-    -1.0    0.0    0.0
-c0
-5
-    30.0    90.0    3.0
-    30.0    70.0    3.0
-    30.0    70.0    6.0
-    30.0    90.0    6.0
-    30.0    90.0    3.0
-f65 1
-    0.0    -1.0    0.0
-c0
-5
-    30.0    70.0    3.0
-    50.0    70.0    3.0
-    50.0    70.0    6.0
-    30.0    70.0    6.0
-    30.0    70.0    3.0
-f66 1
-    -1.0    0.0    0.0
-c0
-5
-    30.0    130.0    3.0
-    30.0    110.0    3.0
-    30.0    110.0    6.0
-    30.0    130.0    6.0
-    30.0    130.0    3.0
-f67 1
-    -0.0    1.0    -0.0
-c0
-5
-    50.0    130.0    3.0
-    30.0    130.0    3.0
-    30.0    130.0    6.0
-    50.0    130.0    6.0
-    50.0    130.0    3.0
-f68 1
-    0.0    -1.0    0.0
-c0
-5
-    30.0    110.0    3.0
-    50.0    110.0    3.0
-    50.0    110.0    6.0
-    30.0    110.0    6.0
-    30.0    110.0    3.0
-f69 1
-    1.0    -0.0    -0.0
-c0
-5
-    50.0    110.0    3.0
-    50.0    130.0    3.0
-    50.0    130.0    6.0
-    50.0    110.0    6.0
-    50.0    110.0    3.0
-f70 1
-    -0.0    1.0    -0.0
-c0
-5
-    30.0    50.0    6.0
-    50.0    50.0    6.0
-    50.0    50.0    3.0
-    30.0    50.0    3.0
-    30.0    50.0    6.0
-f71 1
-    1.0    -0.0    -0.0
-c0
-5
-    50.0    30.0    3.0
-    50.0    50.0    3.0
-    50.0    50.0    6.0
-    50.0    30.0    6.0
-    50.0    30.0    3.0
-f72 1
-    -1.0    0.0    0.0
-c0
-5
-    30.0    50.0    6.0
-    30.0    50.0    3.0
-    30.0    30.0    3.0
-    30.0    30.0    6.0
-    30.0    50.0    6.0
-f73 1
-    0.0    -1.0    0.0
-c0
-5
-    30.0    30.0    3.0
-    50.0    30.0    3.0
-    50.0    30.0    6.0
-    30.0    30.0    6.0
-    30.0    30.0    3.0
-f74 1
-    -0.0    1.0    -0.0
-c0
-5
-    90.0    90.0    6.0
-    70.0    90.0    6.0
-    70.0    90.0    9.0
-    90.0    90.0    9.0
-    90.0    90.0    6.0
-f75 1
-    1.0    -0.0    -0.0
-c0
-5
-    90.0    70.0    6.0
-    90.0    90.0    6.0
-    90.0    90.0    9.0
-    90.0    70.0    9.0
-    90.0    70.0    6.0
-f76 1
-    -1.0    0.0    0.0
-c0
-5
-    70.0    90.0    6.0
-    70.0    70.0    6.0
-    70.0    70.0    9.0
-    70.0    90.0    9.0
-    70.0    90.0    6.0
-f77 1
-    0.0    -1.0    0.0
-c0
-5
-    70.0    70.0    6.0
-    90.0    70.0    6.0
-    90.0    70.0    9.0
-    70.0    70.0    9.0
-    70.0    70.0    6.0
-f78 1
-    1.0    -0.0    -0.0
-c0
-5
-    90.0    30.0    6.0
-    90.0    50.0    6.0
-    90.0    50.0    9.0
-    90.0    30.0    9.0
-    90.0    30.0    6.0
-f79 1
-    -0.0    1.0    -0.0
-c0
-5
-    90.0    50.0    6.0
-    70.0    50.0    6.0
-    70.0    50.0    9.0
-    90.0    50.0    9.0
-    90.0    50.0    6.0
-f80 1
-    0.0    -1.0    0.0
-c0
-5
-    70.0    30.0    6.0
-    90.0    30.0    6.0
-    90.0    30.0    9.0
-    70.0    30.0    9.0
-    70.0    30.0    6.0
-f81 1
-    -1.0    0.0    0.0
-c0
-5
-    70.0    50.0    6.0
-    70.0    30.0    6.0
-    70.0    30.0    9.0
-    70.0    50.0    9.0
-    70.0    50.0    6.0
-f82 1
-    1.0    -0.0    -0.0
-c0
-5
-    130.0    30.0    6.0
-    130.0    50.0    6.0
-    130.0    50.0    9.0
-    130.0    30.0    9.0
-    130.0    30.0    6.0
-f83 1
-    -0.0    1.0    -0.0
-c0
-5
-    130.0    50.0    6.0
-    110.0    50.0    6.0
-    110.0    50.0    9.0
-    130.0    50.0    9.0
-    130.0    50.0    6.0
-f84 1
-    0.0    -1.0    0.0
-c0
-5
-    110.0    30.0    6.0
-    130.0    30.0    6.0
-    130.0    30.0    9.0
-    110.0    30.0    9.0
-    110.0    30.0    6.0
-f85 1
-    -1.0    0.0    0.0
-c0
-5
-    110.0    50.0    6.0
-    110.0    30.0    6.0
-    110.0    30.0    9.0
-    110.0    50.0    9.0
-    110.0    50.0    6.0
-f86 1
-    -1.0    0.0    0.0
-c0
-5
-    110.0    90.0    6.0
-    110.0    70.0    6.0
-    110.0    70.0    9.0
-    110.0    90.0    9.0
-    110.0    90.0    6.0
-f87 1
-    -0.0    1.0    -0.0
-c0
-5
-    130.0    90.0    6.0
-    110.0    90.0    6.0
-    110.0    90.0    9.0
-    130.0    90.0    9.0
-    130.0    90.0    6.0
-f88 1
-    0.0    -1.0    0.0
-c0
-5
-    110.0    70.0    6.0
-    130.0    70.0    6.0
-    130.0    70.0    9.0
-    110.0    70.0    9.0
-    110.0    70.0    6.0
-f89 1
-    1.0    -0.0    -0.0
-c0
-5
-    130.0    70.0    6.0
-    130.0    90.0    6.0
-    130.0    90.0    9.0
-    130.0    70.0    9.0
-    130.0    70.0    6.0
-f90 1
-    -0.0    1.0    -0.0
-c0
-5
-    90.0    130.0    6.0
-    70.0    130.0    6.0
-    70.0    130.0    9.0
-    90.0    130.0    9.0
-    90.0    130.0    6.0
-f91 1
-    1.0    -0.0    -0.0
-c0
-5
-    90.0    110.0    6.0
-    90.0    130.0    6.0
-    90.0    130.0    9.0
-    90.0    110.0    9.0
-    90.0    110.0    6.0
-f92 1
-    -1.0    0.0    0.0
-c0
-5
-    70.0    130.0    6.0
-    70.0    110.0    6.0
-    70.0    110.0    9.0
-    70.0    130.0    9.0
-    70.0    130.0    6.0
-f93 1
-    0.0    -1.0    0.0
-c0
-5
-    70.0    110.0    6.0
-    90.0    110.0    6.0
-    90.0    110.0    9.0
-    70.0    110.0    9.0
-    70.0    110.0    6.0
-f94 1
-    -0.0    1.0    -0.0
-c0
-5
-    130.0    130.0    6.0
-    110.0    130.0    6.0
-    110.0    130.0    9.0
-    130.0    130.0    9.0
-    130.0    130.0    6.0
-f95 1
-    -1.0    0.0    0.0
-c0
-5
-    110.0    130.0    6.0
-    110.0    110.0    6.0
-    110.0    110.0    9.0
-    110.0    130.0    9.0
-    110.0    130.0    6.0
-f96 1
-    0.0    -1.0    0.0
-c0
-5
-    110.0    110.0    6.0
-    130.0    110.0    6.0
-    130.0    110.0    9.0
-    110.0    110.0    9.0
-    110.0    110.0    6.0
-f97 1
-    1.0    -0.0    -0.0
-c0
-5
-    130.0    110.0    6.0
-    130.0    130.0    6.0
-    130.0    130.0    9.0
-    130.0    110.0    9.0
-    130.0    110.0    6.0
-f98 1
-    -0.0    1.0    -0.0
-c0
-5
-    50.0    90.0    6.0
-    30.0    90.0    6.0
-    30.0    90.0    9.0
-    50.0    90.0    9.0
-    50.0    90.0    6.0
-f99 1
-    1.0    -0.0    -0.0
-c0
-5
-    50.0    70.0    6.0
-    50.0    90.0    6.0
-    50.0    90.0    9.0
-    50.0    70.0    9.0
-    50.0    70.0    6.0
-f100 1
-    -1.0    0.0    0.0
-c0
-5
-    30.0    90.0    6.0
-    30.0    70.0    6.0
-    30.0    70.0    9.0
-    30.0    90.0    9.0
-    30.0    90.0    6.0
-f101 1
-    0.0    -1.0    0.0
-c0
-5
-    30.0    70.0    6.0
-    50.0    70.0    6.0
-    50.0    70.0    9.0
-    30.0    70.0    9.0
-    30.0    70.0    6.0
-f102 1
-    -1.0    0.0    0.0
-c0
-5
-    30.0    130.0    6.0
-    30.0    110.0    6.0
-    30.0    110.0    9.0
-    30.0    130.0    9.0
-    30.0    130.0    6.0
-f103 1
-    -0.0    1.0    -0.0
-c0
-5
-    50.0    130.0    6.0
-    30.0    130.0    6.0
-    30.0    130.0    9.0
-    50.0    130.0    9.0
-    50.0    130.0    6.0
-f104 1
-    0.0    -1.0    0.0
-c0
-5
-    30.0    110.0    6.0
-    50.0    110.0    6.0
-    50.0    110.0    9.0
-    30.0    110.0    9.0
-    30.0    110.0    6.0
-f105 1
-    1.0    -0.0    -0.0
-c0
-5
-    50.0    110.0    6.0
-    50.0    130.0    6.0
-    50.0    130.0    9.0
-    50.0    110.0    9.0
-    50.0    110.0    6.0
-f106 1
-    -0.0    1.0    -0.0
-c0
-5
-    50.0    50.0    6.0
-    30.0    50.0    6.0
-    30.0    50.0    9.0
-    50.0    50.0    9.0
-    50.0    50.0    6.0
-f107 1
-    1.0    -0.0    -0.0
-c0
-5
-    50.0    50.0    9.0
-    50.0    30.0    9.0
-    50.0    30.0    6.0
-    50.0    50.0    6.0
-    50.0    50.0    9.0
-f108 1
-    -1.0    0.0    0.0
-c0
-5
-    30.0    50.0    6.0
-    30.0    30.0    6.0
-    30.0    30.0    9.0
-    30.0    50.0    9.0
-    30.0    50.0    6.0
-f109 1
-    0.0    -1.0    0.0
-c0
-5
-    30.0    30.0    6.0
-    50.0    30.0    6.0
-    50.0    30.0    9.0
-    30.0    30.0    9.0
-    30.0    30.0    6.0
-f110 1
-    -0.0    1.0    -0.0
-c0
-5
-    70.0    90.0    12.0
-    90.0    90.0    12.0
-    90.0    90.0    9.0
-    70.0    90.0    9.0
-    70.0    90.0    12.0
-f111 1
-    1.0    -0.0    -0.0
-c0
-5
-    90.0    70.0    9.0
-    90.0    90.0    9.0
-    90.0    90.0    12.0
-    90.0    70.0    12.0
-    90.0    70.0    9.0
-f112 1
-    -1.0    0.0    0.0
-c0
-5
-    70.0    90.0    9.0
-    70.0    70.0    9.0
-    70.0    70.0    12.0
-    70.0    90.0    12.0
-    70.0    90.0    9.0
-f113 1
-    0.0    -1.0    0.0
-c0
-5
-    70.0    70.0    9.0
-    90.0    70.0    9.0
-    90.0    70.0    12.0
-    70.0    70.0    12.0
-    70.0    70.0    9.0
-f114 1
-    1.0    -0.0    -0.0
-c0
-5
-    90.0    30.0    9.0
-    90.0    50.0    9.0
-    90.0    50.0    12.0
-    90.0    30.0    12.0
-    90.0    30.0    9.0
-f115 1
-    -0.0    1.0    -0.0
-c0
-5
-    90.0    50.0    9.0
-    70.0    50.0    9.0
-    70.0    50.0    12.0
-    90.0    50.0    12.0
-    90.0    50.0    9.0
-f116 1
-    0.0    -1.0    0.0
-c0
-5
-    70.0    30.0    12.0
-    70.0    30.0    9.0
-    90.0    30.0    9.0
-    90.0    30.0    12.0
-    70.0    30.0    12.0
-f117 1
-    -1.0    0.0    0.0
-c0
-5
-    70.0    50.0    9.0
-    70.0    30.0    9.0
-    70.0    30.0    12.0
-    70.0    50.0    12.0
-    70.0    50.0    9.0
-f118 1
-    1.0    -0.0    -0.0
-c0
-5
-    130.0    30.0    9.0
-    130.0    50.0    9.0
-    130.0    50.0    12.0
-    130.0    30.0    12.0
-    130.0    30.0    9.0
-f119 1
-    -0.0    1.0    -0.0
-c0
-5
-    130.0    50.0    9.0
-    110.0    50.0    9.0
-    110.0    50.0    12.0
-    130.0    50.0    12.0
-    130.0    50.0    9.0
-f120 1
-    0.0    -1.0    0.0
-c0
-5
-    110.0    30.0    9.0
-    130.0    30.0    9.0
-    130.0    30.0    12.0
-    110.0    30.0    12.0
-    110.0    30.0    9.0
-f121 1
-    -1.0    0.0    0.0
-c0
-5
-    110.0    50.0    9.0
-    110.0    30.0    9.0
-    110.0    30.0    12.0
-    110.0    50.0    12.0
-    110.0    50.0    9.0
-f122 1
-    -1.0    0.0    0.0
-c0
-5
-    110.0    90.0    9.0
-    110.0    70.0    9.0
-    110.0    70.0    12.0
-    110.0    90.0    12.0
-    110.0    90.0    9.0
-f123 1
-    -0.0    1.0    -0.0
-c0
-5
-    130.0    90.0    9.0
-    110.0    90.0    9.0
-    110.0    90.0    12.0
-    130.0    90.0    12.0
-    130.0    90.0    9.0
-f124 1
-    0.0    -1.0    0.0
-c0
-5
-    110.0    70.0    12.0
-    110.0    70.0    9.0
-    130.0    70.0    9.0
-    130.0    70.0    12.0
-    110.0    70.0    12.0
-f125 1
-    1.0    -0.0    -0.0
-c0
-5
-    130.0    70.0    9.0
-    130.0    90.0    9.0
-    130.0    90.0    12.0
-    130.0    70.0    12.0
-    130.0    70.0    9.0
-f126 1
-    -0.0    1.0    -0.0
-c0
-5
-    90.0    130.0    9.0
-    70.0    130.0    9.0
-    70.0    130.0    12.0
-    90.0    130.0    12.0
-    90.0    130.0    9.0
-f127 1
-    1.0    -0.0    -0.0
-c0
-5
-    90.0    110.0    12.0
-    90.0    110.0    9.0
-    90.0    130.0    9.0
-    90.0    130.0    12.0
-    90.0    110.0    12.0
-f128 1
-    -1.0    0.0    0.0
-c0
-5
-    70.0    130.0    9.0
-    70.0    110.0    9.0
-    70.0    110.0    12.0
-    70.0    130.0    12.0
-    70.0    130.0    9.0
-f129 1
-    0.0    -1.0    0.0
-c0
-5
-    70.0    110.0    9.0
-    90.0    110.0    9.0
-    90.0    110.0    12.0
-    70.0    110.0    12.0
-    70.0    110.0    9.0
-f130 1
-    -0.0    1.0    -0.0
-c0
-5
-    130.0    130.0    9.0
-    110.0    130.0    9.0
-    110.0    130.0    12.0
-    130.0    130.0    12.0
-    130.0    130.0    9.0
-f131 1
-    -1.0    0.0    0.0
-c0
-5
-    110.0    130.0    9.0
-    110.0    110.0    9.0
-    110.0    110.0    12.0
-    110.0    130.0    12.0
-    110.0    130.0    9.0
-f132 1
-    0.0    -1.0    0.0
-c0
-5
-    110.0    110.0    9.0
-    130.0    110.0    9.0
-    130.0    110.0    12.0
-    110.0    110.0    12.0
-    110.0    110.0    9.0
-f133 1
-    1.0    -0.0    -0.0
-c0
-5
-    130.0    110.0    9.0
-    130.0    130.0    9.0
-    130.0    130.0    12.0
-    130.0    110.0    12.0
-    130.0    110.0    9.0
-f134 1
-    -0.0    1.0    -0.0
-c0
-5
-    50.0    90.0    9.0
-    30.0    90.0    9.0
-    30.0    90.0    12.0
-    50.0    90.0    12.0
-    50.0    90.0    9.0
-f135 1
-    1.0    -0.0    -0.0
-c0
-5
-    50.0    70.0    9.0
-    50.0    90.0    9.0
-    50.0    90.0    12.0
-    50.0    70.0    12.0
-    50.0    70.0    9.0
-f136 1
-    -1.0    0.0    0.0
-c0
-5
-    30.0    90.0    12.0
-    30.0    90.0    9.0
-    30.0    70.0    9.0
-    30.0    70.0    12.0
-    30.0    90.0    12.0
-f137 1
-    0.0    -1.0    0.0
-c0
-5
-    50.0    70.0    12.0
-    30.0    70.0    12.0
-    30.0    70.0    9.0
-    50.0    70.0    9.0
-    50.0    70.0    12.0
-f138 1
-    -1.0    0.0    0.0
-c0
-5
-    30.0    110.0    12.0
-    30.0    130.0    12.0
-    30.0    130.0    9.0
-    30.0    110.0    9.0
-    30.0    110.0    12.0
-f139 1
-    -0.0    1.0    -0.0
-c0
-5
-    50.0    130.0    9.0
-    30.0    130.0    9.0
-    30.0    130.0    12.0
-    50.0    130.0    12.0
-    50.0    130.0    9.0
-f140 1
-    0.0    -1.0    0.0
-c0
-5
-    30.0    110.0    9.0
-    50.0    110.0    9.0
-    50.0    110.0    12.0
-    30.0    110.0    12.0
-    30.0    110.0    9.0
-f141 1
-    1.0    -0.0    -0.0
-c0
-5
-    50.0    110.0    9.0
-    50.0    130.0    9.0
-    50.0    130.0    12.0
-    50.0    110.0    12.0
-    50.0    110.0    9.0
-f142 1
-    -0.0    1.0    -0.0
-c0
-5
-    50.0    50.0    9.0
-    30.0    50.0    9.0
-    30.0    50.0    12.0
-    50.0    50.0    12.0
-    50.0    50.0    9.0
-f143 1
-    1.0    -0.0    -0.0
-c0
-5
-    50.0    50.0    9.0
-    50.0    50.0    12.0
-    50.0    30.0    12.0
-    50.0    30.0    9.0
-    50.0    50.0    9.0
-f144 1
-    -1.0    0.0    0.0
-c0
-5
-    30.0    50.0    9.0
-    30.0    30.0    9.0
-    30.0    30.0    12.0
-    30.0    50.0    12.0
-    30.0    50.0    9.0
-f145 1
-    0.0    -1.0    0.0
-c0
-5
-    30.0    30.0    9.0
-    50.0    30.0    9.0
-    50.0    30.0    12.0
-    30.0    30.0    12.0
-    30.0    30.0    9.0
-f146 1
-    -0.0    1.0    -0.0
-c0
-5
-    90.0    90.0    15.0
-    90.0    90.0    12.0
-    70.0    90.0    12.0
-    70.0    90.0    15.0
-    90.0    90.0    15.0
-f147 1
-    1.0    -0.0    -0.0
-c0
-5
-    90.0    90.0    15.0
-    90.0    70.0    15.0
-    90.0    70.0    12.0
-    90.0    90.0    12.0
-    90.0    90.0    15.0
-f148 1
-    -1.0    0.0    0.0
-c0
-5
-    70.0    90.0    12.0
-    70.0    70.0    12.0
-    70.0    70.0    15.0
-    70.0    90.0    15.0
-    70.0    90.0    12.0
-f149 1
-    0.0    -1.0    0.0
-c0
-5
-    90.0    70.0    12.0
-    90.0    70.0    15.0
-    70.0    70.0    15.0
-    70.0    70.0    12.0
-    90.0    70.0    12.0
-f150 1
-    1.0    -0.0    -0.0
-c0
-5
-    90.0    30.0    12.0
-    90.0    50.0    12.0
-    90.0    50.0    15.0
-    90.0    30.0    15.0
-    90.0    30.0    12.0
-f151 1
-    -0.0    1.0    -0.0
-c0
-5
-    90.0    50.0    15.0
-    90.0    50.0    12.0
-    70.0    50.0    12.0
-    70.0    50.0    15.0
-    90.0    50.0    15.0
-f152 1
-    0.0    -1.0    0.0
-c0
-5
-    70.0    30.0    12.0
-    90.0    30.0    12.0
-    90.0    30.0    15.0
-    70.0    30.0    15.0
-    70.0    30.0    12.0
-f153 1
-    -1.0    0.0    0.0
-c0
-5
-    70.0    50.0    12.0
-    70.0    30.0    12.0
-    70.0    30.0    15.0
-    70.0    50.0    15.0
-    70.0    50.0    12.0
-f154 1
-    1.0    -0.0    -0.0
-c0
-5
-    130.0    30.0    12.0
-    130.0    50.0    12.0
-    130.0    50.0    15.0
-    130.0    30.0    15.0
-    130.0    30.0    12.0
-f155 1
-    -0.0    1.0    -0.0
-c0
-5
-    130.0    50.0    12.0
-    110.0    50.0    12.0
-    110.0    50.0    15.0
-    130.0    50.0    15.0
-    130.0    50.0    12.0
-f156 1
-    0.0    -1.0    0.0
-c0
-5
-    130.0    30.0    15.0
-    110.0    30.0    15.0
-    110.0    30.0    12.0
-    130.0    30.0    12.0
-    130.0    30.0    15.0
-f157 1
-    -1.0    0.0    0.0
-c0
-5
-    110.0    50.0    12.0
-    110.0    30.0    12.0
-    110.0    30.0    15.0
-    110.0    50.0    15.0
-    110.0    50.0    12.0
-f158 1
-    -1.0    0.0    0.0
-c0
-5
-    110.0    90.0    12.0
-    110.0    70.0    12.0
-    110.0    70.0    15.0
-    110.0    90.0    15.0
-    110.0    90.0    12.0
-f159 1
-    -0.0    1.0    -0.0
-c0
-5
-    130.0    90.0    12.0
-    110.0    90.0    12.0
-    110.0    90.0    15.0
-    130.0    90.0    15.0
-    130.0    90.0    12.0
-f160 1
-    0.0    -1.0    0.0
-c0
-5
-    110.0    70.0    12.0
-    130.0    70.0    12.0
-    130.0    70.0    15.0
-    110.0    70.0    15.0
-    110.0    70.0    12.0
-f161 1
-    1.0    -0.0    -0.0
-c0
-5
-    130.0    70.0    15.0
-    130.0    70.0    12.0
-    130.0    90.0    12.0
-    130.0    90.0    15.0
-    130.0    70.0    15.0
-f162 1
-    -0.0    1.0    -0.0
-c0
-5
-    90.0    130.0    12.0
-    70.0    130.0    12.0
-    70.0    130.0    15.0
-    90.0    130.0    15.0
-    90.0    130.0    12.0
-f163 1
-    1.0    -0.0    -0.0
-c0
-5
-    90.0    110.0    12.0
-    90.0    130.0    12.0
-    90.0    130.0    15.0
-    90.0    110.0    15.0
-    90.0    110.0    12.0
-f164 1
-    -1.0    0.0    0.0
-c0
-5
-    70.0    130.0    12.0
-    70.0    110.0    12.0
-    70.0    110.0    15.0
-    70.0    130.0    15.0
-    70.0    130.0    12.0
-f165 1
-    0.0    -1.0    0.0
-c0
-5
-    70.0    110.0    12.0
-    90.0    110.0    12.0
-    90.0    110.0    15.0
-    70.0    110.0    15.0
-    70.0    110.0    12.0
-f166 1
-    -0.0    1.0    -0.0
-c0
-5
-    110.0    130.0    12.0
-    110.0    130.0    15.0
-    130.0    130.0    15.0
-    130.0    130.0    12.0
-    110.0    130.0    12.0
-f167 1
-    -1.0    0.0    0.0
-c0
-5
-    110.0    130.0    12.0
-    110.0    110.0    12.0
-    110.0    110.0    15.0
-    110.0    130.0    15.0
-    110.0    130.0    12.0
-f168 1
-    0.0    -1.0    0.0
-c0
-5
-    110.0    110.0    12.0
-    130.0    110.0    12.0
-    130.0    110.0    15.0
-    110.0    110.0    15.0
-    110.0    110.0    12.0
-f169 1
-    1.0    -0.0    -0.0
-c0
-5
-    130.0    110.0    12.0
-    130.0    130.0    12.0
-    130.0    130.0    15.0
-    130.0    110.0    15.0
-    130.0    110.0    12.0
-f170 1
-    -0.0    1.0    -0.0
-c0
-5
-    50.0    90.0    12.0
-    30.0    90.0    12.0
-    30.0    90.0    15.0
-    50.0    90.0    15.0
-    50.0    90.0    12.0
-f171 1
-    1.0    -0.0    -0.0
-c0
-5
-    50.0    70.0    12.0
-    50.0    90.0    12.0
-    50.0    90.0    15.0
-    50.0    70.0    15.0
-    50.0    70.0    12.0
-f172 1
-    -1.0    0.0    0.0
-c0
-5
-    30.0    90.0    12.0
-    30.0    70.0    12.0
-    30.0    70.0    15.0
-    30.0    90.0    15.0
-    30.0    90.0    12.0
-f173 1
-    0.0    -1.0    0.0
-c0
-5
-    30.0    70.0    12.0
-    50.0    70.0    12.0
-    50.0    70.0    15.0
-    30.0    70.0    15.0
-    30.0    70.0    12.0
-f174 1
-    -1.0    0.0    0.0
-c0
-5
-    30.0    130.0    12.0
-    30.0    110.0    12.0
-    30.0    110.0    15.0
-    30.0    130.0    15.0
-    30.0    130.0    12.0
-f175 1
-    -0.0    1.0    -0.0
-c0
-5
-    50.0    130.0    15.0
-    50.0    130.0    12.0
-    30.0    130.0    12.0
-    30.0    130.0    15.0
-    50.0    130.0    15.0
-f176 1
-    0.0    -1.0    0.0
-c0
-5
-    30.0    110.0    12.0
-    50.0    110.0    12.0
-    50.0    110.0    15.0
-    30.0    110.0    15.0
-    30.0    110.0    12.0
-f177 1
-    1.0    -0.0    -0.0
-c0
-5
-    50.0    110.0    12.0
-    50.0    130.0    12.0
-    50.0    130.0    15.0
-    50.0    110.0    15.0
-    50.0    110.0    12.0
-f178 1
-    -0.0    1.0    -0.0
-c0
-5
-    50.0    50.0    12.0
-    30.0    50.0    12.0
-    30.0    50.0    15.0
-    50.0    50.0    15.0
-    50.0    50.0    12.0
-f179 1
-    1.0    -0.0    -0.0
-c0
-5
-    50.0    30.0    12.0
-    50.0    50.0    12.0
-    50.0    50.0    15.0
-    50.0    30.0    15.0
-    50.0    30.0    12.0
-f180 1
-    -1.0    0.0    0.0
-c0
-5
-    30.0    50.0    12.0
-    30.0    30.0    12.0
-    30.0    30.0    15.0
-    30.0    50.0    15.0
-    30.0    50.0    12.0
-f181 1
-    0.0    -1.0    0.0
-c0
-5
-    30.0    30.0    12.0
-    50.0    30.0    12.0
-    50.0    30.0    15.0
-    30.0    30.0    15.0
-    30.0    30.0    12.0
-f182 1
-    -0.0    1.0    -0.0
-c0
-5
-    90.0    90.0    15.0
-    70.0    90.0    15.0
-    70.0    90.0    18.0
-    90.0    90.0    18.0
-    90.0    90.0    15.0
-f183 1
-    1.0    -0.0    -0.0
-c0
-5
-    90.0    70.0    15.0
-    90.0    90.0    15.0
-    90.0    90.0    18.0
-    90.0    70.0    18.0
-    90.0    70.0    15.0
-f184 1
-    -1.0    0.0    0.0
-c0
-5
-    70.0    90.0    15.0
-    70.0    70.0    15.0
-    70.0    70.0    18.0
-    70.0    90.0    18.0
-    70.0    90.0    15.0
-f185 1
-    0.0    -1.0    0.0
-c0
-5
-    70.0    70.0    15.0
-    90.0    70.0    15.0
-    90.0    70.0    18.0
-    70.0    70.0    18.0
-    70.0    70.0    15.0
-f186 1
-    1.0    -0.0    -0.0
-c0
-5
-    90.0    30.0    15.0
-    90.0    50.0    15.0
-    90.0    50.0    18.0
-    90.0    30.0    18.0
-    90.0    30.0    15.0
-f187 1
-    -0.0    1.0    -0.0
-c0
-5
-    90.0    50.0    15.0
-    70.0    50.0    15.0
-    70.0    50.0    18.0
-    90.0    50.0    18.0
-    90.0    50.0    15.0
-f188 1
-    0.0    -1.0    0.0
-c0
-5
-    70.0    30.0    15.0
-    90.0    30.0    15.0
-    90.0    30.0    18.0
-    70.0    30.0    18.0
-    70.0    30.0    15.0
-f189 1
-    -1.0    0.0    0.0
-c0
-5
-    70.0    50.0    15.0
-    70.0    30.0    15.0
-    70.0    30.0    18.0
-    70.0    50.0    18.0
-    70.0    50.0    15.0
-f190 1
-    1.0    -0.0    -0.0
-c0
-5
-    130.0    30.0    15.0
-    130.0    50.0    15.0
-    130.0    50.0    18.0
-    130.0    30.0    18.0
-    130.0    30.0    15.0
-f191 1
-    -0.0    1.0    -0.0
-c0
-5
-    130.0    50.0    15.0
-    110.0    50.0    15.0
-    110.0    50.0    18.0
-    130.0    50.0    18.0
-    130.0    50.0    15.0
-f192 1
-    0.0    -1.0    0.0
-c0
-5
-    110.0    30.0    15.0
-    130.0    30.0    15.0
-    130.0    30.0    18.0
-    110.0    30.0    18.0
-    110.0    30.0    15.0
-f193 1
-    -1.0    0.0    0.0
-c0
-5
-    110.0    50.0    15.0
-    110.0    30.0    15.0
-    110.0    30.0    18.0
-    110.0    50.0    18.0
-    110.0    50.0    15.0
-f194 1
-    -1.0    0.0    0.0
-c0
-5
-    110.0    90.0    15.0
-    110.0    70.0    15.0
-    110.0    70.0    18.0
-    110.0    90.0    18.0
-    110.0    90.0    15.0
-f195 1
-    -0.0    1.0    -0.0
-c0
-5
-    110.0    90.0    18.0
-    130.0    90.0    18.0
-    130.0    90.0    15.0
-    110.0    90.0    15.0
-    110.0    90.0    18.0
-f196 1
-    0.0    -1.0    0.0
-c0
-5
-    110.0    70.0    15.0
-    130.0    70.0    15.0
-    130.0    70.0    18.0
-    110.0    70.0    18.0
-    110.0    70.0    15.0
-f197 1
-    1.0    -0.0    -0.0
-c0
-5
-    130.0    70.0    15.0
-    130.0    90.0    15.0
-    130.0    90.0    18.0
-    130.0    70.0    18.0
-    130.0    70.0    15.0
-f198 1
-    -0.0    1.0    -0.0
-c0
-5
-    90.0    130.0    15.0
-    70.0    130.0    15.0
-    70.0    130.0    18.0
-    90.0    130.0    18.0
-    90.0    130.0    15.0
-f199 1
-    1.0    -0.0    -0.0
-c0
-5
-    90.0    110.0    15.0
-    90.0    130.0    15.0
-    90.0    130.0    18.0
-    90.0    110.0    18.0
-    90.0    110.0    15.0
-f200 1
-    -1.0    0.0    0.0
-c0
-5
-    70.0    130.0    15.0
-    70.0    110.0    15.0
-    70.0    110.0    18.0
-    70.0    130.0    18.0
-    70.0    130.0    15.0
-f201 1
-    0.0    -1.0    0.0
-c0
-5
-    70.0    110.0    15.0
-    90.0    110.0    15.0
-    90.0    110.0    18.0
-    70.0    110.0    18.0
-    70.0    110.0    15.0
-f202 1
-    -0.0    1.0    -0.0
-c0
-5
-    130.0    130.0    15.0
-    110.0    130.0    15.0
-    110.0    130.0    18.0
-    130.0    130.0    18.0
-    130.0    130.0    15.0
-f203 1
-    -1.0    0.0    0.0
-c0
-5
-    110.0    130.0    15.0
-    110.0    110.0    15.0
-    110.0    110.0    18.0
-    110.0    130.0    18.0
-    110.0    130.0    15.0
-f204 1
-    0.0    -1.0    0.0
-c0
-5
-    110.0    110.0    15.0
-    130.0    110.0    15.0
-    130.0    110.0    18.0
-    110.0    110.0    18.0
-    110.0    110.0    15.0
-f205 1
-    1.0    -0.0    -0.0
-c0
-5
-    130.0    110.0    15.0
-    130.0    130.0    15.0
-    130.0    130.0    18.0
-    130.0    110.0    18.0
-    130.0    110.0    15.0
-f206 1
-    -0.0    1.0    -0.0
-c0
-5
-    50.0    90.0    15.0
-    30.0    90.0    15.0
-    30.0    90.0    18.0
-    50.0    90.0    18.0
-    50.0    90.0    15.0
-f207 1
-    1.0    -0.0    -0.0
-c0
-5
-    50.0    70.0    15.0
-    50.0    90.0    15.0
-    50.0    90.0    18.0
-    50.0    70.0    18.0
-    50.0    70.0    15.0
-f208 1
-    -1.0    0.0    0.0
-c0
-5
-    30.0    90.0    15.0
-    30.0    70.0    15.0
-    30.0    70.0    18.0
-    30.0    90.0    18.0
-    30.0    90.0    15.0
-f209 1
-    0.0    -1.0    0.0
-c0
-5
-    30.0    70.0    15.0
-    50.0    70.0    15.0
-    50.0    70.0    18.0
-    30.0    70.0    18.0
-    30.0    70.0    15.0
-f210 1
-    -1.0    0.0    0.0
-c0
-5
-    30.0    130.0    15.0
-    30.0    110.0    15.0
-    30.0    110.0    18.0
-    30.0    130.0    18.0
-    30.0    130.0    15.0
-f211 1
-    -0.0    1.0    -0.0
-c0
-5
-    50.0    130.0    15.0
-    30.0    130.0    15.0
-    30.0    130.0    18.0
-    50.0    130.0    18.0
-    50.0    130.0    15.0
-f212 1
-    0.0    -1.0    0.0
-c0
-5
-    50.0    110.0    15.0
-    50.0    110.0    18.0
-    30.0    110.0    18.0
-    30.0    110.0    15.0
-    50.0    110.0    15.0
-f213 1
-    1.0    -0.0    -0.0
-c0
-5
-    50.0    130.0    15.0
-    50.0    130.0    18.0
-    50.0    110.0    18.0
-    50.0    110.0    15.0
-    50.0    130.0    15.0
-f214 1
-    -0.0    1.0    -0.0
-c0
-5
-    30.0    50.0    15.0
-    30.0    50.0    18.0
-    50.0    50.0    18.0
-    50.0    50.0    15.0
-    30.0    50.0    15.0
-f215 1
-    1.0    -0.0    -0.0
-c0
-5
-    50.0    50.0    18.0
-    50.0    30.0    18.0
-    50.0    30.0    15.0
-    50.0    50.0    15.0
-    50.0    50.0    18.0
-f216 1
-    -1.0    0.0    0.0
-c0
-5
-    30.0    50.0    15.0
-    30.0    30.0    15.0
-    30.0    30.0    18.0
-    30.0    50.0    18.0
-    30.0    50.0    15.0
-f217 1
-    0.0    -1.0    0.0
-c0
-5
-    30.0    30.0    15.0
-    50.0    30.0    15.0
-    50.0    30.0    18.0
-    30.0    30.0    18.0
-    30.0    30.0    15.0
-f218 1
-    -0.0    1.0    -0.0
-c0
-5
-    90.0    90.0    18.0
-    70.0    90.0    18.0
-    70.0    90.0    21.0
-    90.0    90.0    21.0
-    90.0    90.0    18.0
-f219 1
-    1.0    -0.0    -0.0
-c0
-5
-    90.0    70.0    18.0
-    90.0    90.0    18.0
-    90.0    90.0    21.0
-    90.0    70.0    21.0
-    90.0    70.0    18.0
-f220 1
-    -1.0    0.0    0.0
-c0
-5
-    70.0    90.0    18.0
-    70.0    70.0    18.0
-    70.0    70.0    21.0
-    70.0    90.0    21.0
-    70.0    90.0    18.0
-f221 1
-    0.0    -1.0    0.0
-c0
-5
-    70.0    70.0    18.0
-    90.0    70.0    18.0
-    90.0    70.0    21.0
-    70.0    70.0    21.0
-    70.0    70.0    18.0
-f222 1
-    1.0    -0.0    -0.0
-c0
-5
-    90.0    30.0    18.0
-    90.0    50.0    18.0
-    90.0    50.0    21.0
-    90.0    30.0    21.0
-    90.0    30.0    18.0
-f223 1
-    -0.0    1.0    -0.0
-c0
-5
-    90.0    50.0    18.0
-    70.0    50.0    18.0
-    70.0    50.0    21.0
-    90.0    50.0    21.0
-    90.0    50.0    18.0
-f224 1
-    0.0    -1.0    0.0
-c0
-5
-    90.0    30.0    21.0
-    70.0    30.0    21.0
-    70.0    30.0    18.0
-    90.0    30.0    18.0
-    90.0    30.0    21.0
-f225 1
-    -1.0    0.0    0.0
-c0
-5
-    70.0    30.0    21.0
-    70.0    50.0    21.0
-    70.0    50.0    18.0
-    70.0    30.0    18.0
-    70.0    30.0    21.0
-f226 1
-    1.0    -0.0    -0.0
-c0
-5
-    130.0    50.0    21.0
-    130.0    30.0    21.0
-    130.0    30.0    18.0
-    130.0    50.0    18.0
-    130.0    50.0    21.0
-f227 1
-    -0.0    1.0    -0.0
-c0
-5
-    130.0    50.0    18.0
-    110.0    50.0    18.0
-    110.0    50.0    21.0
-    130.0    50.0    21.0
-    130.0    50.0    18.0
-f228 1
-    0.0    -1.0    0.0
-c0
-5
-    130.0    30.0    18.0
-    130.0    30.0    21.0
-    110.0    30.0    21.0
-    110.0    30.0    18.0
-    130.0    30.0    18.0
-f229 1
-    -1.0    0.0    0.0
-c0
-5
-    110.0    50.0    18.0
-    110.0    30.0    18.0
-    110.0    30.0    21.0
-    110.0    50.0    21.0
-    110.0    50.0    18.0
-f230 1
-    -1.0    0.0    0.0
-c0
-5
-    110.0    90.0    18.0
-    110.0    70.0    18.0
-    110.0    70.0    21.0
-    110.0    90.0    21.0
-    110.0    90.0    18.0
-f231 1
-    -0.0    1.0    -0.0
-c0
-5
-    130.0    90.0    18.0
-    110.0    90.0    18.0
-    110.0    90.0    21.0
-    130.0    90.0    21.0
-    130.0    90.0    18.0
-f232 1
-    0.0    -1.0    0.0
-c0
-5
-    110.0    70.0    18.0
-    130.0    70.0    18.0
-    130.0    70.0    21.0
-    110.0    70.0    21.0
-    110.0    70.0    18.0
-f233 1
-    1.0    -0.0    -0.0
-c0
-5
-    130.0    90.0    18.0
-    130.0    90.0    21.0
-    130.0    70.0    21.0
-    130.0    70.0    18.0
-    130.0    90.0    18.0
-f234 1
-    -0.0    1.0    -0.0
-c0
-5
-    70.0    130.0    21.0
-    90.0    130.0    21.0
-    90.0    130.0    18.0
-    70.0    130.0    18.0
-    70.0    130.0    21.0
-f235 1
-    1.0    -0.0    -0.0
-c0
-5
-    90.0    110.0    18.0
-    90.0    130.0    18.0
-    90.0    130.0    21.0
-    90.0    110.0    21.0
-    90.0    110.0    18.0
-f236 1
-    -1.0    0.0    0.0
-c0
-5
-    70.0    130.0    18.0
-    70.0    110.0    18.0
-    70.0    110.0    21.0
-    70.0    130.0    21.0
-    70.0    130.0    18.0
-f237 1
-    0.0    -1.0    0.0
-c0
-5
-    70.0    110.0    18.0
-    90.0    110.0    18.0
-    90.0    110.0    21.0
-    70.0    110.0    21.0
-    70.0    110.0    18.0
-f238 1
-    -0.0    1.0    -0.0
-c0
-5
-    110.0    130.0    21.0
-    130.0    130.0    21.0
-    130.0    130.0    18.0
-    110.0    130.0    18.0
-    110.0    130.0    21.0
-f239 1
-    -1.0    0.0    0.0
-c0
-5
-    110.0    130.0    18.0
-    110.0    110.0    18.0
-    110.0    110.0    21.0
-    110.0    130.0    21.0
-    110.0    130.0    18.0
-f240 1
-    0.0    -1.0    0.0
-c0
-5
-    130.0    110.0    18.0
-    130.0    110.0    21.0
-    110.0    110.0    21.0
-    110.0    110.0    18.0
-    130.0    110.0    18.0
-f241 1
-    1.0    -0.0    -0.0
-c0
-5
-    130.0    110.0    18.0
-    130.0    130.0    18.0
-    130.0    130.0    21.0
-    130.0    110.0    21.0
-    130.0    110.0    18.0
-f242 1
-    -0.0    1.0    -0.0
-c0
-5
-    30.0    90.0    18.0
-    30.0    90.0    21.0
-    50.0    90.0    21.0
-    50.0    90.0    18.0
-    30.0    90.0    18.0
-f243 1
-    1.0    -0.0    -0.0
-c0
-5
-    50.0    70.0    21.0
-    50.0    70.0    18.0
-    50.0    90.0    18.0
-    50.0    90.0    21.0
-    50.0    70.0    21.0
-f244 1
-    -1.0    0.0    0.0
-c0
-5
-    30.0    90.0    18.0
-    30.0    70.0    18.0
-    30.0    70.0    21.0
-    30.0    90.0    21.0
-    30.0    90.0    18.0
-f245 1
-    0.0    -1.0    0.0
-c0
-5
-    50.0    70.0    21.0
-    30.0    70.0    21.0
-    30.0    70.0    18.0
-    50.0    70.0    18.0
-    50.0    70.0    21.0
-f246 1
-    -1.0    0.0    0.0
-c0
-5
-    30.0    130.0    18.0
-    30.0    110.0    18.0
-    30.0    110.0    21.0
-    30.0    130.0    21.0
-    30.0    130.0    18.0
-f247 1
-    -0.0    1.0    -0.0
-c0
-5
-    50.0    130.0    18.0
-    30.0    130.0    18.0
-    30.0    130.0    21.0
-    50.0    130.0    21.0
-    50.0    130.0    18.0
-f248 1
-    0.0    -1.0    0.0
-c0
-5
-    30.0    110.0    18.0
-    50.0    110.0    18.0
-    50.0    110.0    21.0
-    30.0    110.0    21.0
-    30.0    110.0    18.0
-f249 1
-    1.0    -0.0    -0.0
-c0
-5
-    50.0    110.0    18.0
-    50.0    130.0    18.0
-    50.0    130.0    21.0
-    50.0    110.0    21.0
-    50.0    110.0    18.0
-f250 1
-    -0.0    1.0    -0.0
-c0
-5
-    50.0    50.0    18.0
-    30.0    50.0    18.0
-    30.0    50.0    21.0
-    50.0    50.0    21.0
-    50.0    50.0    18.0
-f251 1
-    1.0    -0.0    -0.0
-c0
-5
-    50.0    30.0    18.0
-    50.0    50.0    18.0
-    50.0    50.0    21.0
-    50.0    30.0    21.0
-    50.0    30.0    18.0
-f252 1
-    -1.0    0.0    0.0
-c0
-5
-    30.0    50.0    18.0
-    30.0    30.0    18.0
-    30.0    30.0    21.0
-    30.0    50.0    21.0
-    30.0    50.0    18.0
-f253 1
-    0.0    -1.0    0.0
-c0
-5
-    50.0    30.0    21.0
-    30.0    30.0    21.0
-    30.0    30.0    18.0
-    50.0    30.0    18.0
-    50.0    30.0    21.0
-f254 1
-    -0.0    1.0    -0.0
-c0
-5
-    90.0    90.0    21.0
-    70.0    90.0    21.0
-    70.0    90.0    24.0
-    90.0    90.0    24.0
-    90.0    90.0    21.0
-f255 1
-    1.0    -0.0    -0.0
-c0
-5
-    90.0    70.0    24.0
-    90.0    70.0    21.0
-    90.0    90.0    21.0
-    90.0    90.0    24.0
-    90.0    70.0    24.0
-f256 1
-    -1.0    0.0    0.0
-c0
-5
-    70.0    90.0    24.0
-    70.0    90.0    21.0
-    70.0    70.0    21.0
-    70.0    70.0    24.0
-    70.0    90.0    24.0
-f257 1
-    0.0    -1.0    0.0
-c0
-5
-    70.0    70.0    21.0
-    90.0    70.0    21.0
-    90.0    70.0    24.0
-    70.0    70.0    24.0
-    70.0    70.0    21.0
-f258 1
-    1.0    -0.0    -0.0
-c0
-5
-    90.0    30.0    21.0
-    90.0    50.0    21.0
-    90.0    50.0    24.0
-    90.0    30.0    24.0
-    90.0    30.0    21.0
-f259 1
-    -0.0    1.0    -0.0
-c0
-5
-    90.0    50.0    21.0
-    70.0    50.0    21.0
-    70.0    50.0    24.0
-    90.0    50.0    24.0
-    90.0    50.0    21.0
-f260 1
-    0.0    -1.0    0.0
-c0
-5
-    70.0    30.0    21.0
-    90.0    30.0    21.0
-    90.0    30.0    24.0
-    70.0    30.0    24.0
-    70.0    30.0    21.0
-f261 1
-    -1.0    0.0    0.0
-c0
-5
-    70.0    50.0    21.0
-    70.0    30.0    21.0
-    70.0    30.0    24.0
-    70.0    50.0    24.0
-    70.0    50.0    21.0
-f262 1
-    1.0    -0.0    -0.0
-c0
-5
-    130.0    30.0    21.0
-    130.0    50.0    21.0
-    130.0    50.0    24.0
-    130.0    30.0    24.0
-    130.0    30.0    21.0
-f263 1
-    -0.0    1.0    -0.0
-c0
-5
-    130.0    50.0    21.0
-    110.0    50.0    21.0
-    110.0    50.0    24.0
-    130.0    50.0    24.0
-    130.0    50.0    21.0
-f264 1
-    0.0    -1.0    0.0
-c0
-5
-    110.0    30.0    21.0
-    130.0    30.0    21.0
-    130.0    30.0    24.0
-    110.0    30.0    24.0
-    110.0    30.0    21.0
-f265 1
-    -1.0    0.0    0.0
-c0
-5
-    110.0    50.0    21.0
-    110.0    30.0    21.0
-    110.0    30.0    24.0
-    110.0    50.0    24.0
-    110.0    50.0    21.0
-f266 1
-    -1.0    0.0    0.0
-c0
-5
-    110.0    70.0    21.0
-    110.0    70.0    24.0
-    110.0    90.0    24.0
-    110.0    90.0    21.0
-    110.0    70.0    21.0
-f267 1
-    -0.0    1.0    -0.0
-c0
-5
-    130.0    90.0    21.0
-    110.0    90.0    21.0
-    110.0    90.0    24.0
-    130.0    90.0    24.0
-    130.0    90.0    21.0
-f268 1
-    0.0    -1.0    0.0
-c0
-5
-    110.0    70.0    21.0
-    130.0    70.0    21.0
-    130.0    70.0    24.0
-    110.0    70.0    24.0
-    110.0    70.0    21.0
-f269 1
-    1.0    -0.0    -0.0
-c0
-5
-    130.0    70.0    21.0
-    130.0    90.0    21.0
-    130.0    90.0    24.0
-    130.0    70.0    24.0
-    130.0    70.0    21.0
-f270 1
-    -0.0    1.0    -0.0
-c0
-5
-    90.0    130.0    21.0
-    70.0    130.0    21.0
-    70.0    130.0    24.0
-    90.0    130.0    24.0
-    90.0    130.0    21.0
-f271 1
-    1.0    -0.0    -0.0
-c0
-5
-    90.0    110.0    21.0
-    90.0    130.0    21.0
-    90.0    130.0    24.0
-    90.0    110.0    24.0
-    90.0    110.0    21.0
-f272 1
-    -1.0    0.0    0.0
-c0
-5
-    70.0    130.0    21.0
-    70.0    110.0    21.0
-    70.0    110.0    24.0
-    70.0    130.0    24.0
-    70.0    130.0    21.0
-f273 1
-    0.0    -1.0    0.0
-c0
-5
-    70.0    110.0    21.0
-    90.0    110.0    21.0
-    90.0    110.0    24.0
-    70.0    110.0    24.0
-    70.0    110.0    21.0
-f274 1
-    -0.0    1.0    -0.0
-c0
-5
-    130.0    130.0    21.0
-    110.0    130.0    21.0
-    110.0    130.0    24.0
-    130.0    130.0    24.0
-    130.0    130.0    21.0
-f275 1
-    -1.0    0.0    0.0
-c0
-5
-    110.0    130.0    21.0
-    110.0    110.0    21.0
-    110.0    110.0    24.0
-    110.0    130.0    24.0
-    110.0    130.0    21.0
-f276 1
-    0.0    -1.0    0.0
-c0
-5
-    110.0    110.0    21.0
-    130.0    110.0    21.0
-    130.0    110.0    24.0
-    110.0    110.0    24.0
-    110.0    110.0    21.0
-f277 1
-    1.0    -0.0    -0.0
-c0
-5
-    130.0    110.0    21.0
-    130.0    130.0    21.0
-    130.0    130.0    24.0
-    130.0    110.0    24.0
-    130.0    110.0    21.0
-f278 1
-    -0.0    1.0    -0.0
-c0
-5
-    50.0    90.0    21.0
-    30.0    90.0    21.0
-    30.0    90.0    24.0
-    50.0    90.0    24.0
-    50.0    90.0    21.0
-f279 1
-    1.0    -0.0    -0.0
-c0
-5
-    50.0    70.0    21.0
-    50.0    90.0    21.0
-    50.0    90.0    24.0
-    50.0    70.0    24.0
-    50.0    70.0    21.0
-f280 1
-    -1.0    0.0    0.0
-c0
-5
-    30.0    90.0    21.0
-    30.0    70.0    21.0
-    30.0    70.0    24.0
-    30.0    90.0    24.0
-    30.0    90.0    21.0
-f281 1
-    0.0    -1.0    0.0
-c0
-5
-    30.0    70.0    21.0
-    50.0    70.0    21.0
-    50.0    70.0    24.0
-    30.0    70.0    24.0
-    30.0    70.0    21.0
-f282 1
-    -0.0    1.0    -0.0
-c0
-5
-    130.0    130.0    24.0
-    110.0    130.0    24.0
-    110.0    130.0    27.0
-    130.0    130.0    27.0
-    130.0    130.0    24.0
-f283 1
-    -1.0    0.0    0.0
-c0
-5
-    110.0    130.0    24.0
-    110.0    110.0    24.0
-    110.0    110.0    27.0
-    110.0    130.0    27.0
-    110.0    130.0    24.0
-f284 1
-    0.0    -1.0    0.0
-c0
-5
-    110.0    110.0    24.0
-    130.0    110.0    24.0
-    130.0    110.0    27.0
-    110.0    110.0    27.0
-    110.0    110.0    24.0
-f285 1
-    1.0    -0.0    -0.0
-c0
-5
-    130.0    110.0    24.0
-    130.0    130.0    24.0
-    130.0    130.0    27.0
-    130.0    110.0    27.0
-    130.0    110.0    24.0
-f286 1
-    -0.0    1.0    -0.0
-c0
-5
-    50.0    90.0    24.0
-    30.0    90.0    24.0
-    30.0    90.0    27.0
-    50.0    90.0    27.0
-    50.0    90.0    24.0
-f287 1
-    1.0    -0.0    -0.0
-c0
-5
-    50.0    90.0    27.0
-    50.0    70.0    27.0
-    50.0    70.0    24.0
-    50.0    90.0    24.0
-    50.0    90.0    27.0
-f288 1
-    -1.0    0.0    0.0
-c0
-5
-    30.0    90.0    24.0
-    30.0    70.0    24.0
-    30.0    70.0    27.0
-    30.0    90.0    27.0
-    30.0    90.0    24.0
-f289 1
-    0.0    -1.0    0.0
-c0
-5
-    50.0    70.0    27.0
-    30.0    70.0    27.0
-    30.0    70.0    24.0
-    50.0    70.0    24.0
-    50.0    70.0    27.0
-f290 1
-    -1.0    0.0    0.0
-c0
-5
-    30.0    110.0    24.0
-    30.0    110.0    27.0
-    30.0    130.0    27.0
-    30.0    130.0    24.0
-    30.0    110.0    24.0
-f291 1
-    -0.0    1.0    -0.0
-c0
-5
-    50.0    130.0    24.0
-    30.0    130.0    24.0
-    30.0    130.0    27.0
-    50.0    130.0    27.0
-    50.0    130.0    24.0
-f292 1
-    0.0    -1.0    0.0
-c0
-5
-    30.0    110.0    24.0
-    50.0    110.0    24.0
-    50.0    110.0    27.0
-    30.0    110.0    27.0
-    30.0    110.0    24.0
-f293 1
-    1.0    -0.0    -0.0
-c0
-5
-    50.0    110.0    24.0
-    50.0    130.0    24.0
-    50.0    130.0    27.0
-    50.0    110.0    27.0
-    50.0    110.0    24.0
-f294 1
-    -0.0    1.0    -0.0
-c0
-5
-    50.0    50.0    24.0
-    30.0    50.0    24.0
-    30.0    50.0    27.0
-    50.0    50.0    27.0
-    50.0    50.0    24.0
-f295 1
-    1.0    -0.0    -0.0
-c0
-5
-    50.0    30.0    24.0
-    50.0    50.0    24.0
-    50.0    50.0    27.0
-    50.0    30.0    27.0
-    50.0    30.0    24.0
-f296 1
-    -1.0    0.0    0.0
-c0
-5
-    30.0    50.0    24.0
-    30.0    30.0    24.0
-    30.0    30.0    27.0
-    30.0    50.0    27.0
-    30.0    50.0    24.0
-f297 1
-    0.0    -1.0    0.0
-c0
-5
-    30.0    30.0    24.0
-    50.0    30.0    24.0
-    50.0    30.0    27.0
-    30.0    30.0    27.0
-    30.0    30.0    24.0
-f298 1
-    -0.0    1.0    -0.0
-c0
-5
-    90.0    90.0    30.0
-    90.0    90.0    27.0
-    70.0    90.0    27.0
-    70.0    90.0    30.0
-    90.0    90.0    30.0
-f299 1
-    1.0    -0.0    -0.0
-c0
-5
-    90.0    90.0    30.0
-    90.0    70.0    30.0
-    90.0    70.0    27.0
-    90.0    90.0    27.0
-    90.0    90.0    30.0
-f300 1
-    -1.0    0.0    0.0
-c0
-5
-    70.0    70.0    30.0
-    70.0    90.0    30.0
-    70.0    90.0    27.0
-    70.0    70.0    27.0
-    70.0    70.0    30.0
-f301 1
-    0.0    -1.0    0.0
-c0
-5
-    70.0    70.0    27.0
-    90.0    70.0    27.0
-    90.0    70.0    30.0
-    70.0    70.0    30.0
-    70.0    70.0    27.0
-f302 1
-    1.0    -0.0    -0.0
-c0
-5
-    90.0    50.0    30.0
-    90.0    30.0    30.0
-    90.0    30.0    27.0
-    90.0    50.0    27.0
-    90.0    50.0    30.0
-f303 1
-    -0.0    1.0    -0.0
-c0
-5
-    90.0    50.0    27.0
-    70.0    50.0    27.0
-    70.0    50.0    30.0
-    90.0    50.0    30.0
-    90.0    50.0    27.0
-f304 1
-    0.0    -1.0    0.0
-c0
-5
-    70.0    30.0    27.0
-    90.0    30.0    27.0
-    90.0    30.0    30.0
-    70.0    30.0    30.0
-    70.0    30.0    27.0
-f305 1
-    -1.0    0.0    0.0
-c0
-5
-    70.0    50.0    27.0
-    70.0    30.0    27.0
-    70.0    30.0    30.0
-    70.0    50.0    30.0
-    70.0    50.0    27.0
-f306 1
-    1.0    -0.0    -0.0
-c0
-5
-    130.0    30.0    27.0
-    130.0    50.0    27.0
-    130.0    50.0    30.0
-    130.0    30.0    30.0
-    130.0    30.0    27.0
-f307 1
-    -0.0    1.0    -0.0
-c0
-5
-    130.0    50.0    27.0
-    110.0    50.0    27.0
-    110.0    50.0    30.0
-    130.0    50.0    30.0
-    130.0    50.0    27.0
-f308 1
-    0.0    -1.0    0.0
-c0
-5
-    110.0    30.0    30.0
-    110.0    30.0    27.0
-    130.0    30.0    27.0
-    130.0    30.0    30.0
-    110.0    30.0    30.0
-f309 1
-    -1.0    0.0    0.0
-c0
-5
-    110.0    30.0    30.0
-    110.0    50.0    30.0
-    110.0    50.0    27.0
-    110.0    30.0    27.0
-    110.0    30.0    30.0
-f310 1
-    -1.0    0.0    0.0
-c0
-5
-    110.0    90.0    27.0
-    110.0    70.0    27.0
-    110.0    70.0    30.0
-    110.0    90.0    30.0
-    110.0    90.0    27.0
-f311 1
-    -0.0    1.0    -0.0
-c0
-5
-    130.0    90.0    27.0
-    110.0    90.0    27.0
-    110.0    90.0    30.0
-    130.0    90.0    30.0
-    130.0    90.0    27.0
-f312 1
-    0.0    -1.0    0.0
-c0
-5
-    110.0    70.0    27.0
-    130.0    70.0    27.0
-    130.0    70.0    30.0
-    110.0    70.0    30.0
-    110.0    70.0    27.0
-f313 1
-    1.0    -0.0    -0.0
-c0
-5
-    130.0    70.0    27.0
-    130.0    90.0    27.0
-    130.0    90.0    30.0
-    130.0    70.0    30.0
-    130.0    70.0    27.0
-f314 1
-    -0.0    1.0    -0.0
-c0
-5
-    70.0    130.0    27.0
-    70.0    130.0    30.0
-    90.0    130.0    30.0
-    90.0    130.0    27.0
-    70.0    130.0    27.0
-f315 1
-    1.0    -0.0    -0.0
-c0
-5
-    90.0    110.0    27.0
-    90.0    130.0    27.0
-    90.0    130.0    30.0
-    90.0    110.0    30.0
-    90.0    110.0    27.0
-f316 1
-    -1.0    0.0    0.0
-c0
-5
-    70.0    130.0    27.0
-    70.0    110.0    27.0
-    70.0    110.0    30.0
-    70.0    130.0    30.0
-    70.0    130.0    27.0
-f317 1
-    0.0    -1.0    0.0
-c0
-5
-    70.0    110.0    27.0
-    90.0    110.0    27.0
-    90.0    110.0    30.0
-    70.0    110.0    30.0
-    70.0    110.0    27.0
-f318 1
-    -0.0    1.0    -0.0
-c0
-5
-    130.0    130.0    30.0
-    130.0    130.0    27.0
-    110.0    130.0    27.0
-    110.0    130.0    30.0
-    130.0    130.0    30.0
-f319 1
-    -1.0    0.0    0.0
-c0
-5
-    110.0    130.0    27.0
-    110.0    110.0    27.0
-    110.0    110.0    30.0
-    110.0    130.0    30.0
-    110.0    130.0    27.0
-f320 1
-    0.0    -1.0    0.0
-c0
-5
-    110.0    110.0    27.0
-    130.0    110.0    27.0
-    130.0    110.0    30.0
-    110.0    110.0    30.0
-    110.0    110.0    27.0
-f321 1
-    1.0    -0.0    -0.0
-c0
-5
-    130.0    110.0    27.0
-    130.0    130.0    27.0
-    130.0    130.0    30.0
-    130.0    110.0    30.0
-    130.0    110.0    27.0
-f322 1
-    -0.0    1.0    -0.0
-c0
-5
-    50.0    90.0    27.0
-    30.0    90.0    27.0
-    30.0    90.0    30.0
-    50.0    90.0    30.0
-    50.0    90.0    27.0
-f323 1
-    1.0    -0.0    -0.0
-c0
-5
-    50.0    70.0    27.0
-    50.0    90.0    27.0
-    50.0    90.0    30.0
-    50.0    70.0    30.0
-    50.0    70.0    27.0
-f324 1
-    -1.0    0.0    0.0
-c0
-5
-    30.0    90.0    27.0
-    30.0    70.0    27.0
-    30.0    70.0    30.0
-    30.0    90.0    30.0
-    30.0    90.0    27.0
-f325 1
-    0.0    -1.0    0.0
-c0
-5
-    30.0    70.0    27.0
-    50.0    70.0    27.0
-    50.0    70.0    30.0
-    30.0    70.0    30.0
-    30.0    70.0    27.0
-f326 1
-    -1.0    0.0    0.0
-c0
-5
-    30.0    130.0    27.0
-    30.0    110.0    27.0
-    30.0    110.0    30.0
-    30.0    130.0    30.0
-    30.0    130.0    27.0
-f327 1
-    -0.0    1.0    -0.0
-c0
-5
-    50.0    130.0    27.0
-    30.0    130.0    27.0
-    30.0    130.0    30.0
-    50.0    130.0    30.0
-    50.0    130.0    27.0
-f328 1
-    0.0    -1.0    0.0
-c0
-5
-    50.0    110.0    27.0
-    50.0    110.0    30.0
-    30.0    110.0    30.0
-    30.0    110.0    27.0
-    50.0    110.0    27.0
-f329 1
-    1.0    -0.0    -0.0
-c0
-5
-    50.0    110.0    27.0
-    50.0    130.0    27.0
-    50.0    130.0    30.0
-    50.0    110.0    30.0
-    50.0    110.0    27.0
-f330 1
-    -0.0    1.0    -0.0
-c0
-5
-    50.0    50.0    27.0
-    30.0    50.0    27.0
-    30.0    50.0    30.0
-    50.0    50.0    30.0
-    50.0    50.0    27.0
-f331 1
-    1.0    -0.0    -0.0
-c0
-5
-    50.0    30.0    27.0
-    50.0    50.0    27.0
-    50.0    50.0    30.0
-    50.0    30.0    30.0
-    50.0    30.0    27.0
-f332 1
-    -1.0    0.0    0.0
-c0
-5
-    30.0    50.0    27.0
-    30.0    30.0    27.0
-    30.0    30.0    30.0
-    30.0    50.0    30.0
-    30.0    50.0    27.0
-f333 1
-    0.0    -1.0    0.0
-c0
-5
-    30.0    30.0    27.0
-    50.0    30.0    27.0
-    50.0    30.0    30.0
-    30.0    30.0    30.0
-    30.0    30.0    27.0
-f334 1
-    -0.0    -0.0    1.0
-c0
-5
-    70.0    90.0    30.0
-    70.0    70.0    30.0
-    90.0    70.0    30.0
-    90.0    90.0    30.0
-    70.0    90.0    30.0
-f335 1
-    -0.0    -0.0    1.0
-c0
-5
-    70.0    50.0    30.0
-    70.0    30.0    30.0
-    90.0    30.0    30.0
-    90.0    50.0    30.0
-    70.0    50.0    30.0
-f336 1
-    -0.0    -0.0    1.0
-c0
-5
-    110.0    50.0    30.0
-    110.0    30.0    30.0
-    130.0    30.0    30.0
-    130.0    50.0    30.0
-    110.0    50.0    30.0
-f337 1
-    -0.0    -0.0    1.0
-c0
-5
-    130.0    70.0    30.0
-    130.0    90.0    30.0
-    110.0    90.0    30.0
-    110.0    70.0    30.0
-    130.0    70.0    30.0
-f338 1
-    -0.0    -0.0    1.0
-c0
-5
-    90.0    110.0    30.0
-    90.0    130.0    30.0
-    70.0    130.0    30.0
-    70.0    110.0    30.0
-    90.0    110.0    30.0
-f339 1
-    -0.0    -0.0    1.0
-c0
-5
-    110.0    110.0    30.0
-    130.0    110.0    30.0
-    130.0    130.0    30.0
-    110.0    130.0    30.0
-    110.0    110.0    30.0
-f340 1
-    -0.0    -0.0    1.0
-c0
-5
-    30.0    70.0    30.0
-    50.0    70.0    30.0
-    50.0    90.0    30.0
-    30.0    90.0    30.0
-    30.0    70.0    30.0
-f341 1
-    -0.0    -0.0    1.0
-c0
-5
-    50.0    110.0    30.0
-    50.0    130.0    30.0
-    30.0    130.0    30.0
-    30.0    110.0    30.0
-    50.0    110.0    30.0
-f342 1
-    -0.0    -0.0    1.0
-c0
-5
-    30.0    30.0    30.0
-    50.0    30.0    30.0
-    50.0    50.0    30.0
-    30.0    50.0    30.0
-    30.0    30.0    30.0
-f343 1
-    -1.0    0.0    0.0
-c0
-5
-    30.0    130.0    21.0
-    30.0    110.0    21.0
-    30.0    110.0    24.0
-    30.0    130.0    24.0
-    30.0    130.0    21.0
-f344 1
-    -0.0    1.0    -0.0
-c0
-5
-    50.0    130.0    21.0
-    30.0    130.0    21.0
-    30.0    130.0    24.0
-    50.0    130.0    24.0
-    50.0    130.0    21.0
-f345 1
-    0.0    -1.0    0.0
-c0
-5
-    30.0    110.0    21.0
-    50.0    110.0    21.0
-    50.0    110.0    24.0
-    30.0    110.0    24.0
-    30.0    110.0    21.0
-f346 1
-    1.0    -0.0    -0.0
-c0
-5
-    50.0    110.0    21.0
-    50.0    130.0    21.0
-    50.0    130.0    24.0
-    50.0    110.0    24.0
-    50.0    110.0    21.0
-f347 1
-    -0.0    1.0    -0.0
-c0
-5
-    50.0    50.0    21.0
-    30.0    50.0    21.0
-    30.0    50.0    24.0
-    50.0    50.0    24.0
-    50.0    50.0    21.0
-f348 1
-    1.0    -0.0    -0.0
-c0
-5
-    50.0    30.0    21.0
-    50.0    50.0    21.0
-    50.0    50.0    24.0
-    50.0    30.0    24.0
-    50.0    30.0    21.0
-f349 1
-    -1.0    0.0    0.0
-c0
-5
-    30.0    50.0    21.0
-    30.0    30.0    21.0
-    30.0    30.0    24.0
-    30.0    50.0    24.0
-    30.0    50.0    21.0
-f350 1
-    0.0    -1.0    0.0
-c0
-5
-    30.0    30.0    21.0
-    50.0    30.0    21.0
-    50.0    30.0    24.0
-    30.0    30.0    24.0
-    30.0    30.0    21.0
-f351 1
-    -0.0    1.0    -0.0
-c0
-5
-    90.0    90.0    24.0
-    70.0    90.0    24.0
-    70.0    90.0    27.0
-    90.0    90.0    27.0
-    90.0    90.0    24.0
-f352 1
-    1.0    -0.0    -0.0
-c0
-5
-    90.0    70.0    24.0
-    90.0    90.0    24.0
-    90.0    90.0    27.0
-    90.0    70.0    27.0
-    90.0    70.0    24.0
-f353 1
-    -1.0    0.0    0.0
-c0
-5
-    70.0    90.0    24.0
-    70.0    70.0    24.0
-    70.0    70.0    27.0
-    70.0    90.0    27.0
-    70.0    90.0    24.0
-f354 1
-    0.0    -1.0    0.0
-c0
-5
-    70.0    70.0    24.0
-    90.0    70.0    24.0
-    90.0    70.0    27.0
-    70.0    70.0    27.0
-    70.0    70.0    24.0
-f355 1
-    1.0    -0.0    -0.0
-c0
-5
-    90.0    30.0    24.0
-    90.0    50.0    24.0
-    90.0    50.0    27.0
-    90.0    30.0    27.0
-    90.0    30.0    24.0
-f356 1
-    -0.0    1.0    -0.0
-c0
-5
-    90.0    50.0    24.0
-    70.0    50.0    24.0
-    70.0    50.0    27.0
-    90.0    50.0    27.0
-    90.0    50.0    24.0
-f357 1
-    0.0    -1.0    0.0
-c0
-5
-    70.0    30.0    24.0
-    90.0    30.0    24.0
-    90.0    30.0    27.0
-    70.0    30.0    27.0
-    70.0    30.0    24.0
-f358 1
-    -1.0    0.0    0.0
-c0
-5
-    70.0    50.0    24.0
-    70.0    30.0    24.0
-    70.0    30.0    27.0
-    70.0    50.0    27.0
-    70.0    50.0    24.0
-f359 1
-    1.0    -0.0    -0.0
-c0
-5
-    130.0    30.0    27.0
-    130.0    30.0    24.0
-    130.0    50.0    24.0
-    130.0    50.0    27.0
-    130.0    30.0    27.0
-f360 1
-    -0.0    1.0    -0.0
-c0
-5
-    110.0    50.0    27.0
-    130.0    50.0    27.0
-    130.0    50.0    24.0
-    110.0    50.0    24.0
-    110.0    50.0    27.0
-f361 1
-    0.0    -1.0    0.0
-c0
-5
-    110.0    30.0    24.0
-    130.0    30.0    24.0
-    130.0    30.0    27.0
-    110.0    30.0    27.0
-    110.0    30.0    24.0
-f362 1
-    -1.0    0.0    0.0
-c0
-5
-    110.0    50.0    24.0
-    110.0    30.0    24.0
-    110.0    30.0    27.0
-    110.0    50.0    27.0
-    110.0    50.0    24.0
-f363 1
-    -1.0    0.0    0.0
-c0
-5
-    110.0    90.0    24.0
-    110.0    70.0    24.0
-    110.0    70.0    27.0
-    110.0    90.0    27.0
-    110.0    90.0    24.0
-f364 1
-    -0.0    1.0    -0.0
-c0
-5
-    130.0    90.0    24.0
-    110.0    90.0    24.0
-    110.0    90.0    27.0
-    130.0    90.0    27.0
-    130.0    90.0    24.0
-f365 1
-    0.0    -1.0    0.0
-c0
-5
-    110.0    70.0    24.0
-    130.0    70.0    24.0
-    130.0    70.0    27.0
-    110.0    70.0    27.0
-    110.0    70.0    24.0
-f366 1
-    1.0    -0.0    -0.0
-c0
-5
-    130.0    70.0    27.0
-    130.0    70.0    24.0
-    130.0    90.0    24.0
-    130.0    90.0    27.0
-    130.0    70.0    27.0
-f367 1
-    -0.0    1.0    -0.0
-c0
-5
-    90.0    130.0    24.0
-    70.0    130.0    24.0
-    70.0    130.0    27.0
-    90.0    130.0    27.0
-    90.0    130.0    24.0
-f368 1
-    1.0    -0.0    -0.0
-c0
-5
-    90.0    110.0    24.0
-    90.0    130.0    24.0
-    90.0    130.0    27.0
-    90.0    110.0    27.0
-    90.0    110.0    24.0
-f369 1
-    -1.0    0.0    0.0
-c0
-5
-    70.0    110.0    27.0
-    70.0    130.0    27.0
-    70.0    130.0    24.0
-    70.0    110.0    24.0
-    70.0    110.0    27.0
-f370 1
-    0.0    -1.0    0.0
-c0
-5
-    70.0    110.0    24.0
-    90.0    110.0    24.0
-    90.0    110.0    27.0
-    70.0    110.0    27.0
-    70.0    110.0    24.0
-""")
+        sio = AbstractGeoDataFrameDemos._dataset(
+            "GeoDataFrameDemos5", "cirSceneMasque2Corr.cir"
+        )
         return CirReader(sio).run()
 
     @staticmethod
@@ -30222,16331 +115,7 @@ c0
         scene = ToUnstructuredGrid([gdfMesh, nvect]).run()
         scene.plot(show_edges=True)
         '''
-        sio = StringIO("""2040    2040
-    99999    99999
-    99999    99999
-    99999    99999
-    99999    99999
-    99999    99999
-f1 1
-    -0    -0    1
-c0
-4
-    50    130    0
-    60    125    0
-    60.0874    136.64    0
-    50    130    0
-f2 1
-    -0    0    1
-c0
-4
-    60.0874    136.64    0
-    60    125    0
-    70    130    0
-    60.0874    136.64    0
-f3 1
-    -0    -0    1
-c0
-4
-    90    130    0
-    100    125    0
-    100    136.71    0
-    90    130    0
-f4 1
-    -0    -0    1
-c0
-4
-    100    136.71    0
-    100    125    0
-    110    130    0
-    100    136.71    0
-f5 1
-    -0    0    1
-c0
-4
-    48.5347    12.6165    0
-    40.3815    8.46051    0
-    50    0    0
-    48.5347    12.6165    0
-f6 1
-    0    0    1
-c0
-4
-    0    50    0
-    8.46051    40.3815    0
-    12.6165    48.5347    0
-    0    50    0
-f7 1
-    0    0    1
-c0
-4
-    130    50    0
-    142.198    53.3717    0
-    136.779    60.0874    0
-    130    50    0
-f8 1
-    0    -0    1
-c0
-4
-    60.0874    136.64    0
-    53.4374    142.315    0
-    50    130    0
-    60.0874    136.64    0
-f9 1
-    0    0    1
-c0
-4
-    110    130    0
-    106.562    142.322    0
-    100    136.71    0
-    110    130    0
-f10 1
-    -0    -0    1
-c0
-4
-    136.849    100    0
-    142.04    106.719    0
-    130    110    0
-    136.849    100    0
-f11 1
-    0    0    1
-c0
-4
-    130    90    0
-    142.039    93.2787    0
-    136.849    100    0
-    130    90    0
-f12 1
-    0    -0    1
-c0
-4
-    100    136.71    0
-    93.4368    142.322    0
-    90    130    0
-    100    136.71    0
-f13 1
-    -0    0    1
-c0
-4
-    130    70    0
-    125.507    60.0237    0
-    136.779    60.0874    0
-    130    70    0
-f14 1
-    -0    -0    1
-c0
-4
-    136.779    60.0874    0
-    125.507    60.0237    0
-    130    50    0
-    136.779    60.0874    0
-f15 1
-    0    -0    1
-c0
-4
-    136.849    100    0
-    125.833    100    0
-    130    90    0
-    136.849    100    0
-f16 1
-    -0    0    1
-c0
-4
-    130    110    0
-    125.833    100    0
-    136.849    100    0
-    130    110    0
-f17 1
-    0    -0    1
-c0
-4
-    12.5316    71.9971    0
-    7.5551    78.9152    0
-    0    70    0
-    12.5316    71.9971    0
-f18 1
-    -0    -0    1
-c0
-4
-    70    0    0
-    78.9152    7.5551    0
-    71.9971    12.5316    0
-    70    0    0
-f19 1
-    -0    -0    1
-c0
-4
-    52.5192    20.8929    0
-    60.5599    25.2972    0
-    50    30    0
-    52.5192    20.8929    0
-f20 1
-    0    0    1
-c0
-4
-    30    50    0
-    25.2976    60.5765    0
-    20.8963    52.5197    0
-    30    50    0
-f21 1
-    -0    -0    1
-c0
-4
-    136.779    60.0874    0
-    142.212    66.9231    0
-    130    70    0
-    136.779    60.0874    0
-f22 1
-    0    0    1
-c0
-4
-    70    130    0
-    66.9231    142.212    0
-    60.0874    136.64    0
-    70    130    0
-f23 1
-    0    0    1
-c0
-4
-    90    70    0
-    93.5378    58.4488    0
-    97.7075    66.2605    0
-    90    70    0
-f24 1
-    0    0    1
-c0
-4
-    107.095    98.1372    0
-    98.1283    93.4109    0
-    110    90    0
-    107.095    98.1372    0
-f25 1
-    0    -0    1
-c0
-4
-    52.96    101.862    0
-    61.458    106.517    0
-    50    110    0
-    52.96    101.862    0
-f26 1
-    0    -0    1
-c0
-4
-    52.96    61.8623    0
-    61.4521    66.5088    0
-    50    70    0
-    52.96    61.8623    0
-f27 1
-    -0    -0    1
-c0
-4
-    12.5316    71.9971    0
-    21.681    75.9302    0
-    15    84.4444    0
-    12.5316    71.9971    0
-f28 1
-    0    -0    1
-c0
-4
-    84.4444    15    0
-    75.3012    21.6967    0
-    71.9971    12.5316    0
-    84.4444    15    0
-f29 1
-    -0    -0    1
-c0
-4
-    84.7454    59.4444    0
-    93.5378    58.4488    0
-    90    70    0
-    84.7454    59.4444    0
-f30 1
-    0    -0    1
-c0
-4
-    90    90    0
-    93.2809    102.201    0
-    84.7454    100.417    0
-    90    90    0
-f31 1
-    0    0    1
-c0
-4
-    110    90    0
-    98.1283    93.4109    0
-    99.5883    84.4792    0
-    110    90    0
-f32 1
-    -0    0    1
-c0
-4
-    50    70    0
-    61.4521    66.5088    0
-    60.4167    75.2546    0
-    50    70    0
-f33 1
-    -0    0    1
-c0
-4
-    50    110    0
-    61.458    106.517    0
-    60.4861    115.347    0
-    50    110    0
-f34 1
-    0    0    1
-c0
-4
-    98.1283    93.4109    0
-    93.2809    102.201    0
-    90    90    0
-    98.1283    93.4109    0
-f35 1
-    -0    0    1
-c0
-4
-    90    110    0
-    101.912    106.676    0
-    100.486    115.347    0
-    90    110    0
-f36 1
-    0    -0    1
-c0
-4
-    93.2809    102.201    0
-    101.912    106.676    0
-    90    110    0
-    93.2809    102.201    0
-f37 1
-    -0    0    1
-c0
-4
-    50    30    0
-    60.5599    25.2972    0
-    60.3009    34.9769    0
-    50    30    0
-f38 1
-    0    -0    1
-c0
-4
-    34.9769    60.4398    0
-    25.2976    60.5765    0
-    30    50    0
-    34.9769    60.4398    0
-f39 1
-    0    -0    1
-c0
-4
-    50    130    0
-    53.4374    142.315    0
-    44.7669    140.439    0
-    50    130    0
-f40 1
-    -0    -0    1
-c0
-4
-    140.439    44.7669    0
-    142.198    53.3717    0
-    130    50    0
-    140.439    44.7669    0
-f41 1
-    0    -0    1
-c0
-4
-    115.13    140.513    0
-    106.562    142.322    0
-    110    130    0
-    115.13    140.513    0
-f42 1
-    -0    0    1
-c0
-4
-    130    110    0
-    142.04    106.719    0
-    140.513    115.13    0
-    130    110    0
-f43 1
-    -0    -0    1
-c0
-4
-    140.5    84.8435    0
-    142.039    93.2787    0
-    130    90    0
-    140.5    84.8435    0
-f44 1
-    0    -0    1
-c0
-4
-    90    130    0
-    93.4368    142.322    0
-    84.8435    140.5    0
-    90    130    0
-f45 1
-    0    0    1
-c0
-4
-    130    130    0
-    142.696    132.108    0
-    138.009    138.009    0
-    130    130    0
-f46 1
-    0    -0    1
-c0
-4
-    138.009    138.009    0
-    132.108    142.696    0
-    130    130    0
-    138.009    138.009    0
-f47 1
-    -0    -0    1
-c0
-4
-    50    0    0
-    56.4764    7.25949    0
-    48.5347    12.6165    0
-    50    0    0
-f48 1
-    -0    -0    1
-c0
-4
-    12.6165    48.5347    0
-    7.25949    56.4764    0
-    0    50    0
-    12.6165    48.5347    0
-f49 1
-    -0    0    1
-c0
-4
-    130    30    0
-    140.227    24.3182    0
-    140    35    0
-    130    30    0
-f50 1
-    0    -0    1
-c0
-4
-    35    140    0
-    24.3182    140.227    0
-    30    130    0
-    35    140    0
-f51 1
-    0    0    1
-c0
-4
-    150    80    0
-    140.5    84.8435    0
-    140.369    75.4594    0
-    150    80    0
-f52 1
-    -0    -0    1
-c0
-4
-    75.4594    140.369    0
-    84.8435    140.5    0
-    80    150    0
-    75.4594    140.369    0
-f53 1
-    0    -0    1
-c0
-4
-    150    40    0
-    140.439    44.7669    0
-    140    35    0
-    150    40    0
-f54 1
-    -0    -0    1
-c0
-4
-    35    140    0
-    44.7669    140.439    0
-    40    150    0
-    35    140    0
-f55 1
-    -0    -0    1
-c0
-4
-    140.369    75.4594    0
-    140.5    84.8435    0
-    130    80    0
-    140.369    75.4594    0
-f56 1
-    0    -0    1
-c0
-4
-    80    130    0
-    84.8435    140.5    0
-    75.4594    140.369    0
-    80    130    0
-f57 1
-    0    -0    1
-c0
-4
-    40    130    0
-    44.7669    140.439    0
-    35    140    0
-    40    130    0
-f58 1
-    -0    -0    1
-c0
-4
-    140    35    0
-    140.439    44.7669    0
-    130    40    0
-    140    35    0
-f59 1
-    0    -0    1
-c0
-4
-    124.379    140.449    0
-    115.13    140.513    0
-    120    130    0
-    124.379    140.449    0
-f60 1
-    -0    0    1
-c0
-4
-    130    120    0
-    140.513    115.13    0
-    140.449    124.379    0
-    130    120    0
-f61 1
-    -0    -0    1
-c0
-4
-    100.446    73.9583    0
-    99.5883    84.4792    0
-    90    80    0
-    100.446    73.9583    0
-f62 1
-    -0    -0    1
-c0
-4
-    75.5556    99.5833    0
-    84.7454    100.417    0
-    80    110    0
-    75.5556    99.5833    0
-f63 1
-    -0    -0    1
-c0
-4
-    115.556    99.5833    0
-    125.833    100    0
-    120    110    0
-    115.556    99.5833    0
-f64 1
-    -0    -0    1
-c0
-4
-    100    125    0
-    100.486    115.347    0
-    110    120    0
-    100    125    0
-f65 1
-    0    -0    1
-c0
-4
-    80    50    0
-    84.7454    59.4444    0
-    75.5556    59.5833    0
-    80    50    0
-f66 1
-    -0    -0    1
-c0
-4
-    120    50    0
-    125.507    60.0237    0
-    114.384    60.1913    0
-    120    50    0
-f67 1
-    -0    0    1
-c0
-4
-    50    80    0
-    60.4167    75.2546    0
-    59.5833    84.4444    0
-    50    80    0
-f68 1
-    -0    0    1
-c0
-4
-    50    120    0
-    60.4861    115.347    0
-    60    125    0
-    50    120    0
-f69 1
-    -0    0    1
-c0
-4
-    50    40    0
-    60.3009    34.9769    0
-    59.5833    44.4444    0
-    50    40    0
-f70 1
-    -0    -0    1
-c0
-4
-    75.5556    59.5833    0
-    84.7454    59.4444    0
-    80    70    0
-    75.5556    59.5833    0
-f71 1
-    -0    -0    1
-c0
-4
-    114.384    60.1913    0
-    125.507    60.0237    0
-    120    70    0
-    114.384    60.1913    0
-f72 1
-    -0    -0    1
-c0
-4
-    99.7222    35.2778    0
-    100.255    44.6991    0
-    90    40    0
-    99.7222    35.2778    0
-f73 1
-    -0    -0    1
-c0
-4
-    59.5833    44.4444    0
-    60.3009    34.9769    0
-    70    40    0
-    59.5833    44.4444    0
-f74 1
-    -0    -0    1
-c0
-4
-    44.4444    100.417    0
-    34.9769    99.9346    0
-    40    90    0
-    44.4444    100.417    0
-f75 1
-    0    -0    1
-c0
-4
-    44.4444    60.4167    0
-    34.9769    60.4398    0
-    40    50    0
-    44.4444    60.4167    0
-f76 1
-    0    -0    1
-c0
-4
-    80    90    0
-    84.7454    100.417    0
-    75.5556    99.5833    0
-    80    90    0
-f77 1
-    0    0    1
-c0
-4
-    110    80    0
-    99.5883    84.4792    0
-    100.446    73.9583    0
-    110    80    0
-f78 1
-    0    -0    1
-c0
-4
-    120    90    0
-    125.833    100    0
-    115.556    99.5833    0
-    120    90    0
-f79 1
-    -0    0    1
-c0
-4
-    90    120    0
-    100.486    115.347    0
-    100    125    0
-    90    120    0
-f80 1
-    0    -0    1
-c0
-4
-    110    40    0
-    100.255    44.6991    0
-    99.7222    35.2778    0
-    110    40    0
-f81 1
-    0    0    1
-c0
-4
-    40    70    0
-    34.9769    60.4398    0
-    44.4444    60.4167    0
-    40    70    0
-f82 1
-    -0    -0    1
-c0
-4
-    59.5833    84.4444    0
-    60.4167    75.2546    0
-    70    80    0
-    59.5833    84.4444    0
-f83 1
-    0    0    1
-c0
-4
-    40    110    0
-    34.9769    99.9346    0
-    44.4444    100.417    0
-    40    110    0
-f84 1
-    -0    -0    1
-c0
-4
-    60    125    0
-    60.4861    115.347    0
-    70    120    0
-    60    125    0
-f85 1
-    0    0    1
-c0
-4
-    120    150    0
-    115.13    140.513    0
-    124.379    140.449    0
-    120    150    0
-f86 1
-    -0    -0    1
-c0
-4
-    140.449    124.379    0
-    140.513    115.13    0
-    150    120    0
-    140.449    124.379    0
-f87 1
-    -0    -0    1
-c0
-4
-    140.449    124.379    0
-    142.696    132.108    0
-    130    130    0
-    140.449    124.379    0
-f88 1
-    0    -0    1
-c0
-4
-    130    130    0
-    132.108    142.696    0
-    124.379    140.449    0
-    130    130    0
-f89 1
-    -0    -0    1
-c0
-4
-    48.5347    12.6165    0
-    56.4764    7.25949    0
-    59.1325    16.1864    0
-    48.5347    12.6165    0
-f90 1
-    -0    -0    1
-c0
-4
-    16.1864    59.1325    0
-    7.25949    56.4764    0
-    12.6165    48.5347    0
-    16.1864    59.1325    0
-f91 1
-    0    -0    1
-c0
-4
-    59.1325    16.1864    0
-    52.5192    20.8929    0
-    48.5347    12.6165    0
-    59.1325    16.1864    0
-f92 1
-    -0    -0    1
-c0
-4
-    12.6165    48.5347    0
-    20.8963    52.5197    0
-    16.1864    59.1325    0
-    12.6165    48.5347    0
-f93 1
-    -0    -0    1
-c0
-4
-    99.7222    35.2778    0
-    99.7346    25.5082    0
-    110    30    0
-    99.7222    35.2778    0
-f94 1
-    -0    -0    1
-c0
-4
-    99.7346    25.5082    0
-    108.315    20.8471    0
-    110    30    0
-    99.7346    25.5082    0
-f95 1
-    0    -0    1
-c0
-4
-    50    50    0
-    52.96    61.8623    0
-    44.4444    60.4167    0
-    50    50    0
-f96 1
-    -0    -0    1
-c0
-4
-    70    50    0
-    66.7954    58.7302    0
-    58.1372    52.9052    0
-    70    50    0
-f97 1
-    0    -0    1
-c0
-4
-    50    90    0
-    52.96    101.862    0
-    44.4444    100.417    0
-    50    90    0
-f98 1
-    -0    0    1
-c0
-4
-    70    110    0
-    66.7954    98.7302    0
-    75.5556    99.5833    0
-    70    110    0
-f99 1
-    0    0    1
-c0
-4
-    110    110    0
-    107.095    98.1372    0
-    115.556    99.5833    0
-    110    110    0
-f100 1
-    0    0    1
-c0
-4
-    58.1372    52.9052    0
-    52.96    61.8623    0
-    50    50    0
-    58.1372    52.9052    0
-f101 1
-    0    0    1
-c0
-4
-    58.1372    92.9052    0
-    52.96    101.862    0
-    50    90    0
-    58.1372    92.9052    0
-f102 1
-    -0    -0    1
-c0
-4
-    70    90    0
-    66.7954    98.7302    0
-    58.1372    92.9052    0
-    70    90    0
-f103 1
-    0    0    1
-c0
-4
-    70    50    0
-    58.1372    52.9052    0
-    59.5833    44.4444    0
-    70    50    0
-f104 1
-    -0    0    1
-c0
-4
-    70    70    0
-    66.7954    58.7302    0
-    75.5556    59.5833    0
-    70    70    0
-f105 1
-    0    0    1
-c0
-4
-    70    90    0
-    58.1372    92.9052    0
-    59.5833    84.4444    0
-    70    90    0
-f106 1
-    -0    0    1
-c0
-4
-    130    70    0
-    142.212    66.9231    0
-    140.369    75.4594    0
-    130    70    0
-f107 1
-    0    -0    1
-c0
-4
-    75.4594    140.369    0
-    66.9231    142.212    0
-    70    130    0
-    75.4594    140.369    0
-f108 1
-    0    0    1
-c0
-4
-    50    0    0
-    40.3815    8.46051    0
-    40    0    0
-    50    0    0
-f109 1
-    -0    -0    1
-c0
-4
-    0    40    0
-    8.46051    40.3815    0
-    0    50    0
-    0    40    0
-f110 1
-    -0    -0    1
-c0
-4
-    71.9971    12.5316    0
-    78.9152    7.5551    0
-    84.4444    15    0
-    71.9971    12.5316    0
-f111 1
-    -0    -0    1
-c0
-4
-    15    84.4444    0
-    7.5551    78.9152    0
-    12.5316    71.9971    0
-    15    84.4444    0
-f112 1
-    0    0    1
-c0
-4
-    30    150    0
-    24.3182    140.227    0
-    35    140    0
-    30    150    0
-f113 1
-    -0    -0    1
-c0
-4
-    140    35    0
-    140.227    24.3182    0
-    150    30    0
-    140    35    0
-f114 1
-    -0    -0    1
-c0
-4
-    70    110    0
-    61.458    106.517    0
-    66.7954    98.7302    0
-    70    110    0
-f115 1
-    -0    -0    1
-c0
-4
-    110    110    0
-    101.912    106.676    0
-    107.095    98.1372    0
-    110    110    0
-f116 1
-    -0    -0    1
-c0
-4
-    70    70    0
-    61.4521    66.5088    0
-    66.7954    58.7302    0
-    70    70    0
-f117 1
-    0    0    1
-c0
-4
-    125.149    20.3372    0
-    125    9.4261    0
-    134.681    15.2922    0
-    125.149    20.3372    0
-f118 1
-    0    0    1
-c0
-4
-    15.2922    134.681    0
-    9.4261    125    0
-    20.3372    125.149    0
-    15.2922    134.681    0
-f119 1
-    -0    -0    1
-c0
-4
-    0    70    0
-    7.94797    64.5733    0
-    12.5316    71.9971    0
-    0    70    0
-f120 1
-    -0    -0    1
-c0
-4
-    71.9971    12.5316    0
-    64.5733    7.94797    0
-    70    0    0
-    71.9971    12.5316    0
-f121 1
-    -0    -0    1
-c0
-4
-    60.0874    136.64    0
-    66.9231    142.212    0
-    60    150    0
-    60.0874    136.64    0
-f122 1
-    -0    -0    1
-c0
-4
-    150    60    0
-    142.212    66.9231    0
-    136.779    60.0874    0
-    150    60    0
-f123 1
-    0    0    1
-c0
-4
-    20.3372    125.149    0
-    9.4261    125    0
-    14.9425    116.125    0
-    20.3372    125.149    0
-f124 1
-    -0    -0    1
-c0
-4
-    116.125    14.9425    0
-    125    9.4261    0
-    125.149    20.3372    0
-    116.125    14.9425    0
-f125 1
-    -0    -0    1
-c0
-4
-    80    0    0
-    78.9152    7.5551    0
-    70    0    0
-    80    0    0
-f126 1
-    0    0    1
-c0
-4
-    0    70    0
-    7.5551    78.9152    0
-    0    80    0
-    0    70    0
-f127 1
-    0    0    1
-c0
-4
-    42.7065    20.245    0
-    40.3815    8.46051    0
-    48.5347    12.6165    0
-    42.7065    20.245    0
-f128 1
-    -0    0    1
-c0
-4
-    12.6165    48.5347    0
-    8.46051    40.3815    0
-    20.2619    42.7089    0
-    12.6165    48.5347    0
-f129 1
-    -0    -0    1
-c0
-4
-    33.7459    14.8874    0
-    40.3815    8.46051    0
-    42.7065    20.245    0
-    33.7459    14.8874    0
-f130 1
-    0    0    1
-c0
-4
-    20.2619    42.7089    0
-    8.46051    40.3815    0
-    15.0532    33.7696    0
-    20.2619    42.7089    0
-f131 1
-    0    0    1
-c0
-4
-    150    90    0
-    140.5    84.8435    0
-    150    80    0
-    150    90    0
-f132 1
-    -0    0    1
-c0
-4
-    80    150    0
-    84.8435    140.5    0
-    90    150    0
-    80    150    0
-f133 1
-    0    0    1
-c0
-4
-    150    50    0
-    140.439    44.7669    0
-    150    40    0
-    150    50    0
-f134 1
-    -0    0    1
-c0
-4
-    40    150    0
-    44.7669    140.439    0
-    50    150    0
-    40    150    0
-f135 1
-    0    0    1
-c0
-4
-    130    110    0
-    140.513    115.13    0
-    130    120    0
-    130    110    0
-f136 1
-    0    0    1
-c0
-4
-    120    130    0
-    115.13    140.513    0
-    110    130    0
-    120    130    0
-f137 1
-    0    0    1
-c0
-4
-    50    30    0
-    60.3009    34.9769    0
-    50    40    0
-    50    30    0
-f138 1
-    0    0    1
-c0
-4
-    40    50    0
-    34.9769    60.4398    0
-    30    50    0
-    40    50    0
-f139 1
-    0    0    1
-c0
-4
-    90    40    0
-    100.255    44.6991    0
-    90    50    0
-    90    40    0
-f140 1
-    0    0    1
-c0
-4
-    90    50    0
-    84.7454    59.4444    0
-    80    50    0
-    90    50    0
-f141 1
-    0    0    1
-c0
-4
-    110    50    0
-    100.255    44.6991    0
-    110    40    0
-    110    50    0
-f142 1
-    0    0    1
-c0
-4
-    130    50    0
-    125.507    60.0237    0
-    120    50    0
-    130    50    0
-f143 1
-    0    0    1
-c0
-4
-    50    70    0
-    60.4167    75.2546    0
-    50    80    0
-    50    70    0
-f144 1
-    0    0    1
-c0
-4
-    40    90    0
-    34.9769    99.9346    0
-    30    90    0
-    40    90    0
-f145 1
-    0    0    1
-c0
-4
-    90    80    0
-    99.5883    84.4792    0
-    90    90    0
-    90    80    0
-f146 1
-    0    0    1
-c0
-4
-    90    90    0
-    84.7454    100.417    0
-    80    90    0
-    90    90    0
-f147 1
-    0    0    1
-c0
-4
-    110    90    0
-    99.5883    84.4792    0
-    110    80    0
-    110    90    0
-f148 1
-    0    0    1
-c0
-4
-    130    90    0
-    125.833    100    0
-    120    90    0
-    130    90    0
-f149 1
-    0    0    1
-c0
-4
-    50    110    0
-    60.4861    115.347    0
-    50    120    0
-    50    110    0
-f150 1
-    -0    0    1
-c0
-4
-    80    110    0
-    84.7454    100.417    0
-    90    110    0
-    80    110    0
-f151 1
-    -0    0    1
-c0
-4
-    120    110    0
-    125.833    100    0
-    130    110    0
-    120    110    0
-f152 1
-    0    0    1
-c0
-4
-    110    120    0
-    100.486    115.347    0
-    110    110    0
-    110    120    0
-f153 1
-    0    0    1
-c0
-4
-    70    40    0
-    60.3009    34.9769    0
-    70    30    0
-    70    40    0
-f154 1
-    -0    0    1
-c0
-4
-    30    70    0
-    34.9769    60.4398    0
-    40    70    0
-    30    70    0
-f155 1
-    -0    0    1
-c0
-4
-    80    70    0
-    84.7454    59.4444    0
-    90    70    0
-    80    70    0
-f156 1
-    0    0    1
-c0
-4
-    70    80    0
-    60.4167    75.2546    0
-    70    70    0
-    70    80    0
-f157 1
-    -0    0    1
-c0
-4
-    120    70    0
-    125.507    60.0237    0
-    130    70    0
-    120    70    0
-f158 1
-    -0    0    1
-c0
-4
-    30    110    0
-    34.9769    99.9346    0
-    40    110    0
-    30    110    0
-f159 1
-    0    0    1
-c0
-4
-    90    110    0
-    100.486    115.347    0
-    90    120    0
-    90    110    0
-f160 1
-    0    0    1
-c0
-4
-    70    120    0
-    60.4861    115.347    0
-    70    110    0
-    70    120    0
-f161 1
-    0    0    1
-c0
-4
-    130    40    0
-    140.439    44.7669    0
-    130    50    0
-    130    40    0
-f162 1
-    0    0    1
-c0
-4
-    50    130    0
-    44.7669    140.439    0
-    40    130    0
-    50    130    0
-f163 1
-    -0    0    1
-c0
-4
-    110    150    0
-    115.13    140.513    0
-    120    150    0
-    110    150    0
-f164 1
-    0    0    1
-c0
-4
-    150    120    0
-    140.513    115.13    0
-    150    110    0
-    150    120    0
-f165 1
-    0    0    1
-c0
-4
-    130    80    0
-    140.5    84.8435    0
-    130    90    0
-    130    80    0
-f166 1
-    0    0    1
-c0
-4
-    90    130    0
-    84.8435    140.5    0
-    80    130    0
-    90    130    0
-f167 1
-    -0    -0    1
-c0
-4
-    136.779    60.0874    0
-    142.198    53.3717    0
-    150    60    0
-    136.779    60.0874    0
-f168 1
-    -0    0    1
-c0
-4
-    60    150    0
-    53.4374    142.315    0
-    60.0874    136.64    0
-    60    150    0
-f169 1
-    -0    -0    1
-c0
-4
-    100    136.71    0
-    106.562    142.322    0
-    100    150    0
-    100    136.71    0
-f170 1
-    -0    -0    1
-c0
-4
-    150    100    0
-    142.04    106.719    0
-    136.849    100    0
-    150    100    0
-f171 1
-    -0    0    1
-c0
-4
-    100    150    0
-    93.4368    142.322    0
-    100    136.71    0
-    100    150    0
-f172 1
-    -0    -0    1
-c0
-4
-    136.849    100    0
-    142.039    93.2787    0
-    150    100    0
-    136.849    100    0
-f173 1
-    0    0    1
-c0
-4
-    80    130    0
-    75.4594    140.369    0
-    70    130    0
-    80    130    0
-f174 1
-    0    0    1
-c0
-4
-    130    70    0
-    140.369    75.4594    0
-    130    80    0
-    130    70    0
-f175 1
-    0    0    1
-c0
-4
-    130    30    0
-    140    35    0
-    130    40    0
-    130    30    0
-f176 1
-    0    0    1
-c0
-4
-    40    130    0
-    35    140    0
-    30    130    0
-    40    130    0
-f177 1
-    -0    0    1
-c0
-4
-    150    10    0
-    141.25    8.75    0
-    150    0    0
-    150    10    0
-f178 1
-    -0    0    1
-c0
-4
-    0    150    0
-    8.75    141.25    0
-    10    150    0
-    0    150    0
-f179 1
-    -0    -0    1
-c0
-4
-    0    140    0
-    8.75    141.25    0
-    0    150    0
-    0    140    0
-f180 1
-    0    0    1
-c0
-4
-    150    0    0
-    141.25    8.75    0
-    140    0    0
-    150    0    0
-f181 1
-    0    0    1
-c0
-4
-    50    50    0
-    44.4444    60.4167    0
-    40    50    0
-    50    50    0
-f182 1
-    0    0    1
-c0
-4
-    50    40    0
-    59.5833    44.4444    0
-    50    50    0
-    50    40    0
-f183 1
-    0    0    1
-c0
-4
-    90    30    0
-    99.7222    35.2778    0
-    90    40    0
-    90    30    0
-f184 1
-    0    0    1
-c0
-4
-    70    50    0
-    59.5833    44.4444    0
-    70    40    0
-    70    50    0
-f185 1
-    0    0    1
-c0
-4
-    80    50    0
-    75.5556    59.5833    0
-    70    50    0
-    80    50    0
-f186 1
-    0    0    1
-c0
-4
-    110    40    0
-    99.7222    35.2778    0
-    110    30    0
-    110    40    0
-f187 1
-    0    0    1
-c0
-4
-    120    50    0
-    114.384    60.1913    0
-    110    50    0
-    120    50    0
-f188 1
-    0    0    1
-c0
-4
-    50    90    0
-    44.4444    100.417    0
-    40    90    0
-    50    90    0
-f189 1
-    0    0    1
-c0
-4
-    50    80    0
-    59.5833    84.4444    0
-    50    90    0
-    50    80    0
-f190 1
-    -0    0    1
-c0
-4
-    40    70    0
-    44.4444    60.4167    0
-    50    70    0
-    40    70    0
-f191 1
-    0    0    1
-c0
-4
-    90    70    0
-    100.446    73.9583    0
-    90    80    0
-    90    70    0
-f192 1
-    -0    0    1
-c0
-4
-    70    70    0
-    75.5556    59.5833    0
-    80    70    0
-    70    70    0
-f193 1
-    0    0    1
-c0
-4
-    70    90    0
-    59.5833    84.4444    0
-    70    80    0
-    70    90    0
-f194 1
-    0    0    1
-c0
-4
-    80    90    0
-    75.5556    99.5833    0
-    70    90    0
-    80    90    0
-f195 1
-    0    0    1
-c0
-4
-    120    90    0
-    115.556    99.5833    0
-    110    90    0
-    120    90    0
-f196 1
-    0    0    1
-c0
-4
-    110    80    0
-    100.446    73.9583    0
-    110    70    0
-    110    80    0
-f197 1
-    -0    0    1
-c0
-4
-    110    70    0
-    114.384    60.1913    0
-    120    70    0
-    110    70    0
-f198 1
-    0    0    1
-c0
-4
-    50    120    0
-    60    125    0
-    50    130    0
-    50    120    0
-f199 1
-    -0    0    1
-c0
-4
-    40    110    0
-    44.4444    100.417    0
-    50    110    0
-    40    110    0
-f200 1
-    0    0    1
-c0
-4
-    90    120    0
-    100    125    0
-    90    130    0
-    90    120    0
-f201 1
-    -0    0    1
-c0
-4
-    70    110    0
-    75.5556    99.5833    0
-    80    110    0
-    70    110    0
-f202 1
-    0    0    1
-c0
-4
-    70    130    0
-    60    125    0
-    70    120    0
-    70    130    0
-f203 1
-    -0    0    1
-c0
-4
-    110    110    0
-    115.556    99.5833    0
-    120    110    0
-    110    110    0
-f204 1
-    0    0    1
-c0
-4
-    110    130    0
-    100    125    0
-    110    120    0
-    110    130    0
-f205 1
-    0    0    1
-c0
-4
-    150    40    0
-    140    35    0
-    150    30    0
-    150    40    0
-f206 1
-    -0    0    1
-c0
-4
-    30    150    0
-    35    140    0
-    40    150    0
-    30    150    0
-f207 1
-    0    0    1
-c0
-4
-    150    130    0
-    140.449    124.379    0
-    150    120    0
-    150    130    0
-f208 1
-    -0    0    1
-c0
-4
-    120    150    0
-    124.379    140.449    0
-    130    150    0
-    120    150    0
-f209 1
-    0    0    1
-c0
-4
-    150    80    0
-    140.369    75.4594    0
-    150    70    0
-    150    80    0
-f210 1
-    -0    0    1
-c0
-4
-    70    150    0
-    75.4594    140.369    0
-    80    150    0
-    70    150    0
-f211 1
-    0    0    1
-c0
-4
-    130    120    0
-    140.449    124.379    0
-    130    130    0
-    130    120    0
-f212 1
-    0    0    1
-c0
-4
-    130    130    0
-    124.379    140.449    0
-    120    130    0
-    130    130    0
-f213 1
-    0    -0    1
-c0
-4
-    10.5097    92.293    0
-    7.43263    100    0
-    0    90    0
-    10.5097    92.293    0
-f214 1
-    0    0    1
-c0
-4
-    90    0    0
-    100    7.43263    0
-    92.1525    10.5637    0
-    90    0    0
-f215 1
-    -0    0    1
-c0
-4
-    108.169    10.9412    0
-    100    7.43263    0
-    110    0    0
-    108.169    10.9412    0
-f216 1
-    0    0    1
-c0
-4
-    0    110    0
-    7.43263    100    0
-    10.9205    108.217    0
-    0    110    0
-f217 1
-    0    0    1
-c0
-4
-    0    90    0
-    7.43263    100    0
-    0    100    0
-    0    90    0
-f218 1
-    -0    -0    1
-c0
-4
-    100    0    0
-    100    7.43263    0
-    90    0    0
-    100    0    0
-f219 1
-    0    0    1
-c0
-4
-    110    0    0
-    100    7.43263    0
-    100    0    0
-    110    0    0
-f220 1
-    -0    -0    1
-c0
-4
-    0    100    0
-    7.43263    100    0
-    0    110    0
-    0    100    0
-f221 1
-    0    0    1
-c0
-4
-    99.5741    15.748    0
-    91.4981    19.9291    0
-    92.1525    10.5637    0
-    99.5741    15.748    0
-f222 1
-    -0    0    1
-c0
-4
-    120    30    0
-    125.149    20.3372    0
-    130    30    0
-    120    30    0
-f223 1
-    0    0    1
-c0
-4
-    30    130    0
-    20.3372    125.149    0
-    30    120    0
-    30    130    0
-f224 1
-    0    0    1
-c0
-4
-    0    20    0
-    9.88636    25.3409    0
-    0    30    0
-    0    20    0
-f225 1
-    0    0    1
-c0
-4
-    30    0    0
-    25.3556    9.77441    0
-    20    0    0
-    30    0    0
-f226 1
-    -0    0    1
-c0
-4
-    20    150    0
-    24.3182    140.227    0
-    30    150    0
-    20    150    0
-f227 1
-    0    0    1
-c0
-4
-    150    30    0
-    140.227    24.3182    0
-    150    20    0
-    150    30    0
-f228 1
-    -0    -0    1
-c0
-4
-    16.1864    59.1325    0
-    18.9408    67.0349    0
-    7.94797    64.5733    0
-    16.1864    59.1325    0
-f229 1
-    0    -0    1
-c0
-4
-    64.5733    7.94797    0
-    67.0673    19.0852    0
-    59.1325    16.1864    0
-    64.5733    7.94797    0
-f230 1
-    -0    0    1
-c0
-4
-    30    110    0
-    25.3302    99.9621    0
-    34.9769    99.9346    0
-    30    110    0
-f231 1
-    -0    -0    1
-c0
-4
-    100.255    44.6991    0
-    100.219    53.4293    0
-    90    50    0
-    100.255    44.6991    0
-f232 1
-    -0    0    1
-c0
-4
-    40    30    0
-    42.7065    20.245    0
-    50    30    0
-    40    30    0
-f233 1
-    0    0    1
-c0
-4
-    30    50    0
-    20.2619    42.7089    0
-    30    40    0
-    30    50    0
-f234 1
-    0    0    1
-c0
-4
-    100.446    73.9583    0
-    105.01    64.6397    0
-    110    70    0
-    100.446    73.9583    0
-f235 1
-    0    0    1
-c0
-4
-    7.94797    64.5733    0
-    18.9408    67.0349    0
-    12.5316    71.9971    0
-    7.94797    64.5733    0
-f236 1
-    0    -0    1
-c0
-4
-    71.9971    12.5316    0
-    67.0673    19.0852    0
-    64.5733    7.94797    0
-    71.9971    12.5316    0
-f237 1
-    -0    -0    1
-c0
-4
-    20.5333    108.288    0
-    25.3302    99.9621    0
-    30    110    0
-    20.5333    108.288    0
-f238 1
-    -0    -0    1
-c0
-4
-    16.8829    16.7611    0
-    20.2998    26.7053    0
-    9.88636    25.3409    0
-    16.8829    16.7611    0
-f239 1
-    0    0    1
-c0
-4
-    9.88636    25.3409    0
-    20.2998    26.7053    0
-    15.0532    33.7696    0
-    9.88636    25.3409    0
-f240 1
-    0    0    1
-c0
-4
-    90    50    0
-    100.219    53.4293    0
-    93.5378    58.4488    0
-    90    50    0
-f241 1
-    0    0    1
-c0
-4
-    92.1525    10.5637    0
-    91.4981    19.9291    0
-    84.4444    15    0
-    92.1525    10.5637    0
-f242 1
-    0    0    1
-c0
-4
-    0    120    0
-    9.4261    125    0
-    0    130    0
-    0    120    0
-f243 1
-    0    0    1
-c0
-4
-    130    0    0
-    125    9.4261    0
-    120    0    0
-    130    0    0
-f244 1
-    -0    -0    1
-c0
-4
-    97.7075    66.2605    0
-    105.01    64.6397    0
-    100.446    73.9583    0
-    97.7075    66.2605    0
-f245 1
-    -0    -0    1
-c0
-4
-    42.7065    20.245    0
-    52.5192    20.8929    0
-    50    30    0
-    42.7065    20.245    0
-f246 1
-    0    -0    1
-c0
-4
-    30    50    0
-    20.8963    52.5197    0
-    20.2619    42.7089    0
-    30    50    0
-f247 1
-    0    -0    1
-c0
-4
-    15    84.4444    0
-    20.8471    91.685    0
-    10.5097    92.293    0
-    15    84.4444    0
-f248 1
-    -0    0    1
-c0
-4
-    10.5097    92.293    0
-    20.8471    91.685    0
-    15.6237    99.8651    0
-    10.5097    92.293    0
-f249 1
-    0    -0    1
-c0
-4
-    15.6237    99.8651    0
-    20.5333    108.288    0
-    10.9205    108.217    0
-    15.6237    99.8651    0
-f250 1
-    0    -0    1
-c0
-4
-    108.169    10.9412    0
-    108.315    20.8471    0
-    99.5741    15.748    0
-    108.169    10.9412    0
-f251 1
-    0    0    1
-c0
-4
-    10.9205    108.217    0
-    20.5333    108.288    0
-    14.9425    116.125    0
-    10.9205    108.217    0
-f252 1
-    0    0    1
-c0
-4
-    116.125    14.9425    0
-    108.315    20.8471    0
-    108.169    10.9412    0
-    116.125    14.9425    0
-f253 1
-    0    0    1
-c0
-4
-    132.108    142.696    0
-    143.176    143.176    0
-    140    150    0
-    132.108    142.696    0
-f254 1
-    0    -0    1
-c0
-4
-    150    140    0
-    143.176    143.176    0
-    142.696    132.108    0
-    150    140    0
-f255 1
-    -0    -0    1
-c0
-4
-    130    30    0
-    132.514    22.4869    0
-    140.227    24.3182    0
-    130    30    0
-f256 1
-    -0    0    1
-c0
-4
-    24.3182    140.227    0
-    22.4869    132.514    0
-    30    130    0
-    24.3182    140.227    0
-f257 1
-    -0    -0    1
-c0
-4
-    25.3556    9.77441    0
-    26.8356    20.2286    0
-    16.8829    16.7611    0
-    25.3556    9.77441    0
-f258 1
-    0    -0    1
-c0
-4
-    33.7459    14.8874    0
-    26.8356    20.2286    0
-    25.3556    9.77441    0
-    33.7459    14.8874    0
-f259 1
-    -0    -0    1
-c0
-4
-    20.2998    26.7053    0
-    26.8356    20.2286    0
-    30    30    0
-    20.2998    26.7053    0
-f260 1
-    -0    -0    1
-c0
-4
-    90    30    0
-    99.7346    25.5082    0
-    99.7222    35.2778    0
-    90    30    0
-f261 1
-    -0    -0    1
-c0
-4
-    138.009    138.009    0
-    143.176    143.176    0
-    132.108    142.696    0
-    138.009    138.009    0
-f262 1
-    0    -0    1
-c0
-4
-    142.696    132.108    0
-    143.176    143.176    0
-    138.009    138.009    0
-    142.696    132.108    0
-f263 1
-    -0    -0    1
-c0
-4
-    21.681    75.9302    0
-    23.5056    84.4119    0
-    15    84.4444    0
-    21.681    75.9302    0
-f264 1
-    0    0    1
-c0
-4
-    99.5741    15.748    0
-    108.315    20.8471    0
-    99.7346    25.5082    0
-    99.5741    15.748    0
-f265 1
-    0    -0    1
-c0
-4
-    59.1325    16.1864    0
-    60.5599    25.2972    0
-    52.5192    20.8929    0
-    59.1325    16.1864    0
-f266 1
-    0    -0    1
-c0
-4
-    20.8963    52.5197    0
-    25.2976    60.5765    0
-    16.1864    59.1325    0
-    20.8963    52.5197    0
-f267 1
-    0    -0    1
-c0
-4
-    34.9769    99.9346    0
-    25.3302    99.9621    0
-    30    90    0
-    34.9769    99.9346    0
-f268 1
-    -0    0    1
-c0
-4
-    9.4261    125    0
-    6.81576    115.316    0
-    14.9425    116.125    0
-    9.4261    125    0
-f269 1
-    -0    0    1
-c0
-4
-    116.125    14.9425    0
-    115.313    6.81727    0
-    125    9.4261    0
-    116.125    14.9425    0
-f270 1
-    -0    -0    1
-c0
-4
-    84.4444    15    0
-    84.2487    23.3252    0
-    75.3012    21.6967    0
-    84.4444    15    0
-f271 1
-    -0    -0    1
-c0
-4
-    20.3372    125.149    0
-    23.0133    116.045    0
-    30    120    0
-    20.3372    125.149    0
-f272 1
-    -0    0    1
-c0
-4
-    120    30    0
-    116.045    23.0133    0
-    125.149    20.3372    0
-    120    30    0
-f273 1
-    -0    -0    1
-c0
-4
-    125    9.4261    0
-    133.632    7.05895    0
-    134.681    15.2922    0
-    125    9.4261    0
-f274 1
-    -0    -0    1
-c0
-4
-    15.2922    134.681    0
-    7.05895    133.632    0
-    9.4261    125    0
-    15.2922    134.681    0
-f275 1
-    -0    0    1
-c0
-4
-    110    70    0
-    105.01    64.6397    0
-    114.384    60.1913    0
-    110    70    0
-f276 1
-    -0    -0    1
-c0
-4
-    0    120    0
-    6.81576    115.316    0
-    9.4261    125    0
-    0    120    0
-f277 1
-    -0    -0    1
-c0
-4
-    125    9.4261    0
-    115.313    6.81727    0
-    120    0    0
-    125    9.4261    0
-f278 1
-    0    -0    1
-c0
-4
-    10.25    10.25    0
-    7.60882    17.7362    0
-    0    10    0
-    10.25    10.25    0
-f279 1
-    0    0    1
-c0
-4
-    10    0    0
-    17.7362    7.60882    0
-    10.25    10.25    0
-    10    0    0
-f280 1
-    -0    -0    1
-c0
-4
-    60.1042    99.8958    0
-    61.458    106.517    0
-    52.96    101.862    0
-    60.1042    99.8958    0
-f281 1
-    -0    -0    1
-c0
-4
-    60.1042    59.8958    0
-    61.4521    66.5088    0
-    52.96    61.8623    0
-    60.1042    59.8958    0
-f282 1
-    0    0    1
-c0
-4
-    97.7075    66.2605    0
-    93.5378    58.4488    0
-    100.546    59.9362    0
-    97.7075    66.2605    0
-f283 1
-    -0    0    1
-c0
-4
-    100.104    100.104    0
-    98.1283    93.4109    0
-    107.095    98.1372    0
-    100.104    100.104    0
-f284 1
-    -0    -0    1
-c0
-4
-    0    50    0
-    7.25949    56.4764    0
-    0    60    0
-    0    50    0
-f285 1
-    -0    -0    1
-c0
-4
-    60    0    0
-    56.4764    7.25949    0
-    50    0    0
-    60    0    0
-f286 1
-    -0    -0    1
-c0
-4
-    16.8829    16.7611    0
-    17.7362    7.60882    0
-    25.3556    9.77441    0
-    16.8829    16.7611    0
-f287 1
-    -0    0    1
-c0
-4
-    9.88636    25.3409    0
-    7.60882    17.7362    0
-    16.8829    16.7611    0
-    9.88636    25.3409    0
-f288 1
-    0    0    1
-c0
-4
-    0    10    0
-    7.60882    17.7362    0
-    0    20    0
-    0    10    0
-f289 1
-    -0    -0    1
-c0
-4
-    20    0    0
-    17.7362    7.60882    0
-    10    0    0
-    20    0    0
-f290 1
-    -0    -0    1
-c0
-4
-    14.9425    116.125    0
-    23.0133    116.045    0
-    20.3372    125.149    0
-    14.9425    116.125    0
-f291 1
-    0    -0    1
-c0
-4
-    125.149    20.3372    0
-    116.045    23.0133    0
-    116.125    14.9425    0
-    125.149    20.3372    0
-f292 1
-    -0    -0    1
-c0
-4
-    70    30    0
-    75.3012    21.6967    0
-    80    30    0
-    70    30    0
-f293 1
-    -0    0    1
-c0
-4
-    30    80    0
-    21.681    75.9302    0
-    30    70    0
-    30    80    0
-f294 1
-    -0    0    1
-c0
-4
-    30    70    0
-    25.2976    60.5765    0
-    34.9769    60.4398    0
-    30    70    0
-f295 1
-    -0    -0    1
-c0
-4
-    60.3009    34.9769    0
-    60.5599    25.2972    0
-    70    30    0
-    60.3009    34.9769    0
-f296 1
-    -0    -0    1
-c0
-4
-    140.369    75.4594    0
-    142.212    66.9231    0
-    150    70    0
-    140.369    75.4594    0
-f297 1
-    -0    0    1
-c0
-4
-    70    150    0
-    66.9231    142.212    0
-    75.4594    140.369    0
-    70    150    0
-f298 1
-    -0    -0    1
-c0
-4
-    0    20    0
-    7.60882    17.7362    0
-    9.88636    25.3409    0
-    0    20    0
-f299 1
-    -0    -0    1
-c0
-4
-    25.3556    9.77441    0
-    17.7362    7.60882    0
-    20    0    0
-    25.3556    9.77441    0
-f300 1
-    0    0    1
-c0
-4
-    70    30    0
-    67.0673    19.0852    0
-    75.3012    21.6967    0
-    70    30    0
-f301 1
-    -0    0    1
-c0
-4
-    21.681    75.9302    0
-    18.9408    67.0349    0
-    30    70    0
-    21.681    75.9302    0
-f302 1
-    0    -0    1
-c0
-4
-    150    130    0
-    142.696    132.108    0
-    140.449    124.379    0
-    150    130    0
-f303 1
-    -0    -0    1
-c0
-4
-    124.379    140.449    0
-    132.108    142.696    0
-    130    150    0
-    124.379    140.449    0
-f304 1
-    -0    0    1
-c0
-4
-    60    150    0
-    66.9231    142.212    0
-    70    150    0
-    60    150    0
-f305 1
-    -0    0    1
-c0
-4
-    150    70    0
-    142.212    66.9231    0
-    150    60    0
-    150    70    0
-f306 1
-    -0    -0    1
-c0
-4
-    130    150    0
-    132.108    142.696    0
-    140    150    0
-    130    150    0
-f307 1
-    0    0    1
-c0
-4
-    150    140    0
-    142.696    132.108    0
-    150    130    0
-    150    140    0
-f308 1
-    -0    -0    1
-c0
-4
-    59.5833    44.4444    0
-    58.1372    52.9052    0
-    50    50    0
-    59.5833    44.4444    0
-f309 1
-    -0    -0    1
-c0
-4
-    75.5556    59.5833    0
-    66.7954    58.7302    0
-    70    50    0
-    75.5556    59.5833    0
-f310 1
-    -0    -0    1
-c0
-4
-    114.384    60.1913    0
-    106.975    57.4918    0
-    110    50    0
-    114.384    60.1913    0
-f311 1
-    -0    -0    1
-c0
-4
-    59.5833    84.4444    0
-    58.1372    92.9052    0
-    50    90    0
-    59.5833    84.4444    0
-f312 1
-    -0    -0    1
-c0
-4
-    44.4444    60.4167    0
-    52.96    61.8623    0
-    50    70    0
-    44.4444    60.4167    0
-f313 1
-    -0    -0    1
-c0
-4
-    90    70    0
-    97.7075    66.2605    0
-    100.446    73.9583    0
-    90    70    0
-f314 1
-    -0    -0    1
-c0
-4
-    75.5556    99.5833    0
-    66.7954    98.7302    0
-    70    90    0
-    75.5556    99.5833    0
-f315 1
-    -0    -0    1
-c0
-4
-    115.556    99.5833    0
-    107.095    98.1372    0
-    110    90    0
-    115.556    99.5833    0
-f316 1
-    -0    -0    1
-c0
-4
-    44.4444    100.417    0
-    52.96    101.862    0
-    50    110    0
-    44.4444    100.417    0
-f317 1
-    0    0    1
-c0
-4
-    60.1042    59.8958    0
-    52.96    61.8623    0
-    58.1372    52.9052    0
-    60.1042    59.8958    0
-f318 1
-    0    0    1
-c0
-4
-    58.1372    52.9052    0
-    66.7954    58.7302    0
-    60.1042    59.8958    0
-    58.1372    52.9052    0
-f319 1
-    0    0    1
-c0
-4
-    58.1372    92.9052    0
-    66.7954    98.7302    0
-    60.1042    99.8958    0
-    58.1372    92.9052    0
-f320 1
-    0    0    1
-c0
-4
-    60.1042    99.8958    0
-    52.96    101.862    0
-    58.1372    92.9052    0
-    60.1042    99.8958    0
-f321 1
-    0    0    1
-c0
-4
-    16.8829    16.7611    0
-    26.8356    20.2286    0
-    20.2998    26.7053    0
-    16.8829    16.7611    0
-f322 1
-    -0    -0    1
-c0
-4
-    26.8356    20.2286    0
-    34.7295    23.2432    0
-    30    30    0
-    26.8356    20.2286    0
-f323 1
-    -0    -0    1
-c0
-4
-    60.5599    25.2972    0
-    67.0673    19.0852    0
-    70    30    0
-    60.5599    25.2972    0
-f324 1
-    0    0    1
-c0
-4
-    30    70    0
-    18.9408    67.0349    0
-    25.2976    60.5765    0
-    30    70    0
-f325 1
-    -0    -0    1
-c0
-4
-    56.4764    7.25949    0
-    64.5733    7.94797    0
-    59.1325    16.1864    0
-    56.4764    7.25949    0
-f326 1
-    0    0    1
-c0
-4
-    16.1864    59.1325    0
-    7.94797    64.5733    0
-    7.25949    56.4764    0
-    16.1864    59.1325    0
-f327 1
-    -0    -0    1
-c0
-4
-    40    0    0
-    32.9998    7.12858    0
-    30    0    0
-    40    0    0
-f328 1
-    -0    -0    1
-c0
-4
-    0    30    0
-    7.14303    33.0003    0
-    0    40    0
-    0    30    0
-f329 1
-    0    0    1
-c0
-4
-    99.7346    25.5082    0
-    91.4981    19.9291    0
-    99.5741    15.748    0
-    99.7346    25.5082    0
-f330 1
-    0    0    1
-c0
-4
-    30    90    0
-    25.3302    99.9621    0
-    20.8471    91.685    0
-    30    90    0
-f331 1
-    -0    -0    1
-c0
-4
-    134.681    15.2922    0
-    132.514    22.4869    0
-    125.149    20.3372    0
-    134.681    15.2922    0
-f332 1
-    -0    -0    1
-c0
-4
-    20.3372    125.149    0
-    22.4869    132.514    0
-    15.2922    134.681    0
-    20.3372    125.149    0
-f333 1
-    -0    -0    1
-c0
-4
-    125.149    20.3372    0
-    132.514    22.4869    0
-    130    30    0
-    125.149    20.3372    0
-f334 1
-    0    -0    1
-c0
-4
-    30    130    0
-    22.4869    132.514    0
-    20.3372    125.149    0
-    30    130    0
-f335 1
-    -0    -0    1
-c0
-4
-    10.25    10.25    0
-    17.7362    7.60882    0
-    16.8829    16.7611    0
-    10.25    10.25    0
-f336 1
-    0    0    1
-c0
-4
-    16.8829    16.7611    0
-    7.60882    17.7362    0
-    10.25    10.25    0
-    16.8829    16.7611    0
-f337 1
-    -0    -0    1
-c0
-4
-    15.6237    99.8651    0
-    25.3302    99.9621    0
-    20.5333    108.288    0
-    15.6237    99.8651    0
-f338 1
-    -0    -0    1
-c0
-4
-    15.0532    33.7696    0
-    7.14303    33.0003    0
-    9.88636    25.3409    0
-    15.0532    33.7696    0
-f339 1
-    -0    -0    1
-c0
-4
-    25.3556    9.77441    0
-    32.9998    7.12858    0
-    33.7459    14.8874    0
-    25.3556    9.77441    0
-f340 1
-    -0    -0    1
-c0
-4
-    9.88636    25.3409    0
-    7.14303    33.0003    0
-    0    30    0
-    9.88636    25.3409    0
-f341 1
-    -0    -0    1
-c0
-4
-    30    0    0
-    32.9998    7.12858    0
-    25.3556    9.77441    0
-    30    0    0
-f342 1
-    -0    -0    1
-c0
-4
-    44.7669    140.439    0
-    53.4374    142.315    0
-    50    150    0
-    44.7669    140.439    0
-f343 1
-    0    -0    1
-c0
-4
-    150    50    0
-    142.198    53.3717    0
-    140.439    44.7669    0
-    150    50    0
-f344 1
-    -0    -0    1
-c0
-4
-    84.8435    140.5    0
-    93.4368    142.322    0
-    90    150    0
-    84.8435    140.5    0
-f345 1
-    0    -0    1
-c0
-4
-    150    90    0
-    142.039    93.2787    0
-    140.5    84.8435    0
-    150    90    0
-f346 1
-    -0    -0    1
-c0
-4
-    140.513    115.13    0
-    142.04    106.719    0
-    150    110    0
-    140.513    115.13    0
-f347 1
-    -0    0    1
-c0
-4
-    110    150    0
-    106.562    142.322    0
-    115.13    140.513    0
-    110    150    0
-f348 1
-    -0    -0    1
-c0
-4
-    80    30    0
-    84.2487    23.3252    0
-    90    30    0
-    80    30    0
-f349 1
-    0    -0    1
-c0
-4
-    110    50    0
-    100.219    53.4293    0
-    100.255    44.6991    0
-    110    50    0
-f350 1
-    -0    0    1
-c0
-4
-    150    110    0
-    142.04    106.719    0
-    150    100    0
-    150    110    0
-f351 1
-    -0    0    1
-c0
-4
-    100    150    0
-    106.562    142.322    0
-    110    150    0
-    100    150    0
-f352 1
-    -0    -0    1
-c0
-4
-    50    150    0
-    53.4374    142.315    0
-    60    150    0
-    50    150    0
-f353 1
-    0    0    1
-c0
-4
-    150    60    0
-    142.198    53.3717    0
-    150    50    0
-    150    60    0
-f354 1
-    0    0    1
-c0
-4
-    150    100    0
-    142.039    93.2787    0
-    150    90    0
-    150    100    0
-f355 1
-    -0    -0    1
-c0
-4
-    90    150    0
-    93.4368    142.322    0
-    100    150    0
-    90    150    0
-f356 1
-    -0    -0    1
-c0
-4
-    9.4261    125    0
-    7.05895    133.632    0
-    0    130    0
-    9.4261    125    0
-f357 1
-    -0    -0    1
-c0
-4
-    130    0    0
-    133.632    7.05895    0
-    125    9.4261    0
-    130    0    0
-f358 1
-    -0    -0    1
-c0
-4
-    70    0    0
-    64.5733    7.94797    0
-    60    0    0
-    70    0    0
-f359 1
-    -0    -0    1
-c0
-4
-    0    60    0
-    7.94797    64.5733    0
-    0    70    0
-    0    60    0
-f360 1
-    -0    -0    1
-c0
-4
-    100.486    115.347    0
-    101.912    106.676    0
-    110    110    0
-    100.486    115.347    0
-f361 1
-    0    0    1
-c0
-4
-    100.104    100.104    0
-    93.2809    102.201    0
-    98.1283    93.4109    0
-    100.104    100.104    0
-f362 1
-    -0    -0    1
-c0
-4
-    90    50    0
-    93.5378    58.4488    0
-    84.7454    59.4444    0
-    90    50    0
-f363 1
-    -0    -0    1
-c0
-4
-    99.5883    84.4792    0
-    98.1283    93.4109    0
-    90    90    0
-    99.5883    84.4792    0
-f364 1
-    -0    -0    1
-c0
-4
-    84.7454    100.417    0
-    93.2809    102.201    0
-    90    110    0
-    84.7454    100.417    0
-f365 1
-    -0    -0    1
-c0
-4
-    60.4861    115.347    0
-    61.458    106.517    0
-    70    110    0
-    60.4861    115.347    0
-f366 1
-    -0    -0    1
-c0
-4
-    60.4167    75.2546    0
-    61.4521    66.5088    0
-    70    70    0
-    60.4167    75.2546    0
-f367 1
-    -0    -0    1
-c0
-4
-    100.104    100.104    0
-    101.912    106.676    0
-    93.2809    102.201    0
-    100.104    100.104    0
-f368 1
-    -0    -0    1
-c0
-4
-    48.5347    12.6165    0
-    52.5192    20.8929    0
-    42.7065    20.245    0
-    48.5347    12.6165    0
-f369 1
-    0    -0    1
-c0
-4
-    20.2619    42.7089    0
-    20.8963    52.5197    0
-    12.6165    48.5347    0
-    20.2619    42.7089    0
-f370 1
-    -0    -0    1
-c0
-4
-    10    150    0
-    16.5625    142.812    0
-    20    150    0
-    10    150    0
-f371 1
-    -0    0    1
-c0
-4
-    150    20    0
-    142.812    16.5625    0
-    150    10    0
-    150    20    0
-f372 1
-    -0    -0    1
-c0
-4
-    0    130    0
-    7.05895    133.632    0
-    0    140    0
-    0    130    0
-f373 1
-    -0    -0    1
-c0
-4
-    140    0    0
-    133.632    7.05895    0
-    130    0    0
-    140    0    0
-f374 1
-    -0    0    1
-c0
-4
-    20    150    0
-    16.5625    142.812    0
-    24.3182    140.227    0
-    20    150    0
-f375 1
-    -0    -0    1
-c0
-4
-    140.227    24.3182    0
-    142.812    16.5625    0
-    150    20    0
-    140.227    24.3182    0
-f376 1
-    -0    -0    1
-c0
-4
-    134.681    15.2922    0
-    142.812    16.5625    0
-    140.227    24.3182    0
-    134.681    15.2922    0
-f377 1
-    0    -0    1
-c0
-4
-    24.3182    140.227    0
-    16.5625    142.812    0
-    15.2922    134.681    0
-    24.3182    140.227    0
-f378 1
-    -0    -0    1
-c0
-4
-    140.227    24.3182    0
-    132.514    22.4869    0
-    134.681    15.2922    0
-    140.227    24.3182    0
-f379 1
-    -0    -0    1
-c0
-4
-    15.2922    134.681    0
-    22.4869    132.514    0
-    24.3182    140.227    0
-    15.2922    134.681    0
-f380 1
-    0    0    1
-c0
-4
-    66.7954    58.7302    0
-    61.4521    66.5088    0
-    60.1042    59.8958    0
-    66.7954    58.7302    0
-f381 1
-    0    0    1
-c0
-4
-    66.7954    98.7302    0
-    61.458    106.517    0
-    60.1042    99.8958    0
-    66.7954    98.7302    0
-f382 1
-    0    0    1
-c0
-4
-    107.095    98.1372    0
-    101.912    106.676    0
-    100.104    100.104    0
-    107.095    98.1372    0
-f383 1
-    -0    0    1
-c0
-4
-    30    90    0
-    23.5056    84.4119    0
-    30    80    0
-    30    90    0
-f384 1
-    -0    -0    1
-c0
-4
-    110    30    0
-    116.045    23.0133    0
-    120    30    0
-    110    30    0
-f385 1
-    -0    0    1
-c0
-4
-    30    120    0
-    23.0133    116.045    0
-    30    110    0
-    30    120    0
-f386 1
-    -0    0    1
-c0
-4
-    0    40    0
-    7.14303    33.0003    0
-    8.46051    40.3815    0
-    0    40    0
-f387 1
-    -0    -0    1
-c0
-4
-    40.3815    8.46051    0
-    32.9998    7.12858    0
-    40    0    0
-    40.3815    8.46051    0
-f388 1
-    0    -0    1
-c0
-4
-    15.6237    99.8651    0
-    7.43263    100    0
-    10.5097    92.293    0
-    15.6237    99.8651    0
-f389 1
-    -0    -0    1
-c0
-4
-    92.1525    10.5637    0
-    100    7.43263    0
-    99.5741    15.748    0
-    92.1525    10.5637    0
-f390 1
-    -0    -0    1
-c0
-4
-    99.5741    15.748    0
-    100    7.43263    0
-    108.169    10.9412    0
-    99.5741    15.748    0
-f391 1
-    -0    0    1
-c0
-4
-    10.9205    108.217    0
-    7.43263    100    0
-    15.6237    99.8651    0
-    10.9205    108.217    0
-f392 1
-    -0    -0    1
-c0
-4
-    30    30    0
-    34.7295    23.2432    0
-    40    30    0
-    30    30    0
-f393 1
-    -0    0    1
-c0
-4
-    30    40    0
-    23.2432    34.7295    0
-    30    30    0
-    30    40    0
-f394 1
-    -0    0    1
-c0
-4
-    90    30    0
-    84.2487    23.3252    0
-    91.4981    19.9291    0
-    90    30    0
-f395 1
-    -0    -0    1
-c0
-4
-    14.9425    116.125    0
-    6.81576    115.316    0
-    10.9205    108.217    0
-    14.9425    116.125    0
-f396 1
-    -0    -0    1
-c0
-4
-    108.169    10.9412    0
-    115.313    6.81727    0
-    116.125    14.9425    0
-    108.169    10.9412    0
-f397 1
-    -0    -0    1
-c0
-4
-    10.9205    108.217    0
-    6.81576    115.316    0
-    0    110    0
-    10.9205    108.217    0
-f398 1
-    -0    -0    1
-c0
-4
-    110    0    0
-    115.313    6.81727    0
-    108.169    10.9412    0
-    110    0    0
-f399 1
-    -0    -0    1
-c0
-4
-    120    0    0
-    115.313    6.81727    0
-    110    0    0
-    120    0    0
-f400 1
-    -0    -0    1
-c0
-4
-    0    110    0
-    6.81576    115.316    0
-    0    120    0
-    0    110    0
-f401 1
-    -0    0    1
-c0
-4
-    150    150    0
-    143.176    143.176    0
-    150    140    0
-    150    150    0
-f402 1
-    -0    -0    1
-c0
-4
-    140    150    0
-    143.176    143.176    0
-    150    150    0
-    140    150    0
-f403 1
-    -0    -0    1
-c0
-4
-    90    30    0
-    91.4981    19.9291    0
-    99.7346    25.5082    0
-    90    30    0
-f404 1
-    0    -0    1
-c0
-4
-    60    0    0
-    64.5733    7.94797    0
-    56.4764    7.25949    0
-    60    0    0
-f405 1
-    0    -0    1
-c0
-4
-    7.25949    56.4764    0
-    7.94797    64.5733    0
-    0    60    0
-    7.25949    56.4764    0
-f406 1
-    0    -0    1
-c0
-4
-    30    80    0
-    23.5056    84.4119    0
-    21.681    75.9302    0
-    30    80    0
-f407 1
-    0    0    1
-c0
-4
-    114.384    60.1913    0
-    105.01    64.6397    0
-    106.975    57.4918    0
-    114.384    60.1913    0
-f408 1
-    -0    -0    1
-c0
-4
-    20.8471    91.685    0
-    25.3302    99.9621    0
-    15.6237    99.8651    0
-    20.8471    91.685    0
-f409 1
-    -0    -0    1
-c0
-4
-    0    80    0
-    6.47911    85.718    0
-    0    90    0
-    0    80    0
-f410 1
-    -0    -0    1
-c0
-4
-    90    0    0
-    85.7037    6.48462    0
-    80    0    0
-    90    0    0
-f411 1
-    -0    0    1
-c0
-4
-    10.5097    92.293    0
-    6.47911    85.718    0
-    15    84.4444    0
-    10.5097    92.293    0
-f412 1
-    -0    -0    1
-c0
-4
-    84.4444    15    0
-    85.7037    6.48462    0
-    92.1525    10.5637    0
-    84.4444    15    0
-f413 1
-    -0    -0    1
-c0
-4
-    8.75    141.25    0
-    16.5625    142.812    0
-    10    150    0
-    8.75    141.25    0
-f414 1
-    0    0    1
-c0
-4
-    150    10    0
-    142.812    16.5625    0
-    141.25    8.75    0
-    150    10    0
-f415 1
-    -0    0    1
-c0
-4
-    0    140    0
-    7.05895    133.632    0
-    8.75    141.25    0
-    0    140    0
-f416 1
-    -0    -0    1
-c0
-4
-    141.25    8.75    0
-    133.632    7.05895    0
-    140    0    0
-    141.25    8.75    0
-f417 1
-    -0    -0    1
-c0
-4
-    20.2998    26.7053    0
-    23.2432    34.7295    0
-    15.0532    33.7696    0
-    20.2998    26.7053    0
-f418 1
-    0    -0    1
-c0
-4
-    30    30    0
-    23.2432    34.7295    0
-    20.2998    26.7053    0
-    30    30    0
-f419 1
-    -0    -0    1
-c0
-4
-    20.8471    91.685    0
-    23.5056    84.4119    0
-    30    90    0
-    20.8471    91.685    0
-f420 1
-    -0    -0    1
-c0
-4
-    108.315    20.8471    0
-    116.045    23.0133    0
-    110    30    0
-    108.315    20.8471    0
-f421 1
-    0    -0    1
-c0
-4
-    30    110    0
-    23.0133    116.045    0
-    20.5333    108.288    0
-    30    110    0
-f422 1
-    -0    -0    1
-c0
-4
-    0    10    0
-    5.17789    5.17789    0
-    10.25    10.25    0
-    0    10    0
-f423 1
-    -0    -0    1
-c0
-4
-    10.25    10.25    0
-    5.17789    5.17789    0
-    10    0    0
-    10.25    10.25    0
-f424 1
-    -0    -0    1
-c0
-4
-    33.7459    14.8874    0
-    34.7295    23.2432    0
-    26.8356    20.2286    0
-    33.7459    14.8874    0
-f425 1
-    -0    -0    1
-c0
-4
-    20.2619    42.7089    0
-    23.2432    34.7295    0
-    30    40    0
-    20.2619    42.7089    0
-f426 1
-    -0    0    1
-c0
-4
-    40    30    0
-    34.7295    23.2432    0
-    42.7065    20.245    0
-    40    30    0
-f427 1
-    -0    -0    1
-c0
-4
-    15.0532    33.7696    0
-    23.2432    34.7295    0
-    20.2619    42.7089    0
-    15.0532    33.7696    0
-f428 1
-    0    -0    1
-c0
-4
-    42.7065    20.245    0
-    34.7295    23.2432    0
-    33.7459    14.8874    0
-    42.7065    20.245    0
-f429 1
-    -0    -0    1
-c0
-4
-    12.5316    71.9971    0
-    18.9408    67.0349    0
-    21.681    75.9302    0
-    12.5316    71.9971    0
-f430 1
-    -0    -0    1
-c0
-4
-    75.3012    21.6967    0
-    67.0673    19.0852    0
-    71.9971    12.5316    0
-    75.3012    21.6967    0
-f431 1
-    -0    -0    1
-c0
-4
-    75.3012    21.6967    0
-    84.2487    23.3252    0
-    80    30    0
-    75.3012    21.6967    0
-f432 1
-    -0    -0    1
-c0
-4
-    0    90    0
-    6.47911    85.718    0
-    10.5097    92.293    0
-    0    90    0
-f433 1
-    -0    -0    1
-c0
-4
-    92.1525    10.5637    0
-    85.7037    6.48462    0
-    90    0    0
-    92.1525    10.5637    0
-f434 1
-    -0    -0    1
-c0
-4
-    0    0    0
-    5.17789    5.17789    0
-    0    10    0
-    0    0    0
-f435 1
-    -0    -0    1
-c0
-4
-    10    0    0
-    5.17789    5.17789    0
-    0    0    0
-    10    0    0
-f436 1
-    -0    0    1
-c0
-4
-    93.5378    58.4488    0
-    100.219    53.4293    0
-    100.546    59.9362    0
-    93.5378    58.4488    0
-f437 1
-    -0    -0    1
-c0
-4
-    15    84.4444    0
-    23.5056    84.4119    0
-    20.8471    91.685    0
-    15    84.4444    0
-f438 1
-    -0    -0    1
-c0
-4
-    20.5333    108.288    0
-    23.0133    116.045    0
-    14.9425    116.125    0
-    20.5333    108.288    0
-f439 1
-    -0    -0    1
-c0
-4
-    116.125    14.9425    0
-    116.045    23.0133    0
-    108.315    20.8471    0
-    116.125    14.9425    0
-f440 1
-    -0    -0    1
-c0
-4
-    59.1325    16.1864    0
-    67.0673    19.0852    0
-    60.5599    25.2972    0
-    59.1325    16.1864    0
-f441 1
-    0    -0    1
-c0
-4
-    25.2976    60.5765    0
-    18.9408    67.0349    0
-    16.1864    59.1325    0
-    25.2976    60.5765    0
-f442 1
-    0    -0    1
-c0
-4
-    80    0    0
-    85.7037    6.48462    0
-    78.9152    7.5551    0
-    80    0    0
-f443 1
-    -0    -0    1
-c0
-4
-    7.5551    78.9152    0
-    6.47911    85.718    0
-    0    80    0
-    7.5551    78.9152    0
-f444 1
-    -0    0    1
-c0
-4
-    8.75    141.25    0
-    7.05895    133.632    0
-    15.2922    134.681    0
-    8.75    141.25    0
-f445 1
-    -0    0    1
-c0
-4
-    134.681    15.2922    0
-    133.632    7.05895    0
-    141.25    8.75    0
-    134.681    15.2922    0
-f446 1
-    -0    -0    1
-c0
-4
-    15.2922    134.681    0
-    16.5625    142.812    0
-    8.75    141.25    0
-    15.2922    134.681    0
-f447 1
-    -0    -0    1
-c0
-4
-    141.25    8.75    0
-    142.812    16.5625    0
-    134.681    15.2922    0
-    141.25    8.75    0
-f448 1
-    -0    -0    1
-c0
-4
-    78.9152    7.5551    0
-    85.7037    6.48462    0
-    84.4444    15    0
-    78.9152    7.5551    0
-f449 1
-    0    -0    1
-c0
-4
-    15    84.4444    0
-    6.47911    85.718    0
-    7.5551    78.9152    0
-    15    84.4444    0
-f450 1
-    0    -0    1
-c0
-4
-    91.4981    19.9291    0
-    84.2487    23.3252    0
-    84.4444    15    0
-    91.4981    19.9291    0
-f451 1
-    -0    0    1
-c0
-4
-    8.46051    40.3815    0
-    7.14303    33.0003    0
-    15.0532    33.7696    0
-    8.46051    40.3815    0
-f452 1
-    -0    0    1
-c0
-4
-    33.7459    14.8874    0
-    32.9998    7.12858    0
-    40.3815    8.46051    0
-    33.7459    14.8874    0
-f453 1
-    -0    0    1
-c0
-4
-    106.975    57.4918    0
-    100.219    53.4293    0
-    110    50    0
-    106.975    57.4918    0
-f454 1
-    -0    -0    1
-c0
-4
-    100.546    59.9362    0
-    105.01    64.6397    0
-    97.7075    66.2605    0
-    100.546    59.9362    0
-f455 1
-    -0    0    1
-c0
-4
-    100.546    59.9362    0
-    100.219    53.4293    0
-    106.975    57.4918    0
-    100.546    59.9362    0
-f456 1
-    0    0    1
-c0
-4
-    106.975    57.4918    0
-    105.01    64.6397    0
-    100.546    59.9362    0
-    106.975    57.4918    0
-f457 1
-    -0    1    -0
-c0
-4
-    70    90    0
-    70    90    3
-    80    90    3
-    70    90    0
-f458 1
-    0    1    0
-c0
-4
-    70    90    0
-    80    90    3
-    80    90    0
-    70    90    0
-f459 1
-    0    1    -0
-c0
-4
-    90    90    0
-    80    90    0
-    90    90    3
-    90    90    0
-f460 1
-    -0    1    -0
-c0
-4
-    80    90    0
-    80    90    3
-    90    90    3
-    80    90    0
-f461 1
-    1    -0    -0
-c0
-4
-    90    70    3
-    90    70    0
-    90    80    0
-    90    70    3
-f462 1
-    1    -0    0
-c0
-4
-    90    80    3
-    90    90    0
-    90    90    3
-    90    80    3
-f463 1
-    1    -0    -0
-c0
-4
-    90    80    3
-    90    80    0
-    90    90    0
-    90    80    3
-f464 1
-    1    -0    0
-c0
-4
-    90    70    3
-    90    80    0
-    90    80    3
-    90    70    3
-f465 1
-    -1    -0    -0
-c0
-4
-    70    70    0
-    70    70    3
-    70    80    0
-    70    70    0
-f466 1
-    -1    0    0
-c0
-4
-    70    90    0
-    70    80    3
-    70    90    3
-    70    90    0
-f467 1
-    -1    -0    -0
-c0
-4
-    70    90    0
-    70    80    0
-    70    80    3
-    70    90    0
-f468 1
-    -1    0    0
-c0
-4
-    70    80    0
-    70    70    3
-    70    80    3
-    70    80    0
-f469 1
-    0    -1    0
-c0
-4
-    80    70    3
-    90    70    0
-    90    70    3
-    80    70    3
-f470 1
-    -0    -1    -0
-c0
-4
-    80    70    3
-    80    70    0
-    90    70    0
-    80    70    3
-f471 1
-    0    -1    -0
-c0
-4
-    70    70    3
-    70    70    0
-    80    70    3
-    70    70    3
-f472 1
-    0    -1    -0
-c0
-4
-    80    70    3
-    70    70    0
-    80    70    0
-    80    70    3
-f473 1
-    1    0    -0
-c0
-4
-    90    40    3
-    90    30    3
-    90    30    0
-    90    40    3
-f474 1
-    1    0    0
-c0
-4
-    90    40    3
-    90    30    0
-    90    40    0
-    90    40    3
-f475 1
-    1    0    0
-c0
-4
-    90    50    3
-    90    40    0
-    90    50    0
-    90    50    3
-f476 1
-    1    -0    -0
-c0
-4
-    90    40    3
-    90    40    0
-    90    50    3
-    90    40    3
-f477 1
-    -0    1    -0
-c0
-4
-    70    50    0
-    70    50    3
-    80    50    3
-    70    50    0
-f478 1
-    0    1    0
-c0
-4
-    70    50    0
-    80    50    3
-    80    50    0
-    70    50    0
-f479 1
-    0    1    -0
-c0
-4
-    90    50    0
-    80    50    0
-    90    50    3
-    90    50    0
-f480 1
-    -0    1    -0
-c0
-4
-    80    50    0
-    80    50    3
-    90    50    3
-    80    50    0
-f481 1
-    0    -1    -0
-c0
-4
-    90    30    3
-    80    30    0
-    90    30    0
-    90    30    3
-f482 1
-    -0    -1    -0
-c0
-4
-    70    30    3
-    70    30    0
-    80    30    0
-    70    30    3
-f483 1
-    -0    -1    -0
-c0
-4
-    90    30    3
-    80    30    3
-    80    30    0
-    90    30    3
-f484 1
-    0    -1    0
-c0
-4
-    70    30    3
-    80    30    0
-    80    30    3
-    70    30    3
-f485 1
-    -1    -0    -0
-c0
-4
-    70    30    0
-    70    30    3
-    70    40    3
-    70    30    0
-f486 1
-    -1    0    0
-c0
-4
-    70    30    0
-    70    40    3
-    70    40    0
-    70    30    0
-f487 1
-    -1    0    0
-c0
-4
-    70    50    0
-    70    40    3
-    70    50    3
-    70    50    0
-f488 1
-    -1    -0    -0
-c0
-4
-    70    50    0
-    70    40    0
-    70    40    3
-    70    50    0
-f489 1
-    1    -0    -0
-c0
-4
-    130    30    3
-    130    30    0
-    130    40    3
-    130    30    3
-f490 1
-    1    0    0
-c0
-4
-    130    40    3
-    130    30    0
-    130    40    0
-    130    40    3
-f491 1
-    1    0    0
-c0
-4
-    130    50    3
-    130    40    0
-    130    50    0
-    130    50    3
-f492 1
-    1    0    -0
-c0
-4
-    130    50    3
-    130    40    3
-    130    40    0
-    130    50    3
-f493 1
-    -0    1    -0
-c0
-4
-    120    50    0
-    110    50    0
-    110    50    3
-    120    50    0
-f494 1
-    0    1    0
-c0
-4
-    120    50    0
-    130    50    3
-    130    50    0
-    120    50    0
-f495 1
-    -0    1    -0
-c0
-4
-    120    50    0
-    120    50    3
-    130    50    3
-    120    50    0
-f496 1
-    0    1    -0
-c0
-4
-    120    50    0
-    110    50    3
-    120    50    3
-    120    50    0
-f497 1
-    0    -1    -0
-c0
-4
-    130    30    3
-    120    30    0
-    130    30    0
-    130    30    3
-f498 1
-    -0    -1    -0
-c0
-4
-    110    30    3
-    110    30    0
-    120    30    0
-    110    30    3
-f499 1
-    0    -1    -0
-c0
-4
-    120    30    3
-    120    30    0
-    130    30    3
-    120    30    3
-f500 1
-    -0    -1    -0
-c0
-4
-    120    30    3
-    110    30    3
-    120    30    0
-    120    30    3
-f501 1
-    -1    -0    -0
-c0
-4
-    110    30    0
-    110    30    3
-    110    40    0
-    110    30    0
-f502 1
-    -1    0    0
-c0
-4
-    110    50    0
-    110    40    3
-    110    50    3
-    110    50    0
-f503 1
-    -1    -0    -0
-c0
-4
-    110    40    0
-    110    40    3
-    110    50    0
-    110    40    0
-f504 1
-    -1    0    0
-c0
-4
-    110    40    0
-    110    30    3
-    110    40    3
-    110    40    0
-f505 1
-    -1    0    0
-c0
-4
-    110    90    0
-    110    80    3
-    110    90    3
-    110    90    0
-f506 1
-    -1    -0    -0
-c0
-4
-    110    80    0
-    110    80    3
-    110    90    0
-    110    80    0
-f507 1
-    -1    -0    -0
-c0
-4
-    110    80    0
-    110    70    0
-    110    70    3
-    110    80    0
-f508 1
-    -1    0    0
-c0
-4
-    110    80    0
-    110    70    3
-    110    80    3
-    110    80    0
-f509 1
-    -0    1    -0
-c0
-4
-    110    90    0
-    110    90    3
-    120    90    0
-    110    90    0
-f510 1
-    0    1    -0
-c0
-4
-    130    90    0
-    120    90    3
-    130    90    3
-    130    90    0
-f511 1
-    -0    1    -0
-c0
-4
-    120    90    0
-    120    90    3
-    130    90    0
-    120    90    0
-f512 1
-    0    1    -0
-c0
-4
-    120    90    0
-    110    90    3
-    120    90    3
-    120    90    0
-f513 1
-    0    -1    -0
-c0
-4
-    130    70    3
-    120    70    0
-    130    70    0
-    130    70    3
-f514 1
-    0    -1    -0
-c0
-4
-    110    70    3
-    110    70    0
-    120    70    3
-    110    70    3
-f515 1
-    0    -1    -0
-c0
-4
-    120    70    3
-    110    70    0
-    120    70    0
-    120    70    3
-f516 1
-    -0    -1    -0
-c0
-4
-    130    70    3
-    120    70    3
-    120    70    0
-    130    70    3
-f517 1
-    1    -0    0
-c0
-4
-    130    80    3
-    130    90    0
-    130    90    3
-    130    80    3
-f518 1
-    1    -0    -0
-c0
-4
-    130    80    3
-    130    80    0
-    130    90    0
-    130    80    3
-f519 1
-    1    -0    -0
-c0
-4
-    130    70    3
-    130    70    0
-    130    80    0
-    130    70    3
-f520 1
-    1    0    0
-c0
-4
-    130    80    3
-    130    70    3
-    130    80    0
-    130    80    3
-f521 1
-    0    1    -0
-c0
-4
-    90    130    0
-    80    130    3
-    90    130    3
-    90    130    0
-f522 1
-    -0    1    -0
-c0
-4
-    90    130    0
-    80    130    0
-    80    130    3
-    90    130    0
-f523 1
-    -0    1    -0
-c0
-4
-    70    130    0
-    70    130    3
-    80    130    0
-    70    130    0
-f524 1
-    0    1    -0
-c0
-4
-    80    130    0
-    70    130    3
-    80    130    3
-    80    130    0
-f525 1
-    1    -0    0
-c0
-4
-    90    120    3
-    90    130    0
-    90    130    3
-    90    120    3
-f526 1
-    1    -0    -0
-c0
-4
-    90    120    3
-    90    120    0
-    90    130    0
-    90    120    3
-f527 1
-    1    -0    -0
-c0
-4
-    90    110    3
-    90    110    0
-    90    120    0
-    90    110    3
-f528 1
-    1    0    0
-c0
-4
-    90    120    3
-    90    110    3
-    90    120    0
-    90    120    3
-f529 1
-    -1    -0    -0
-c0
-4
-    70    110    0
-    70    110    3
-    70    120    3
-    70    110    0
-f530 1
-    -1    0    0
-c0
-4
-    70    110    0
-    70    120    3
-    70    120    0
-    70    110    0
-f531 1
-    -1    0    0
-c0
-4
-    70    120    0
-    70    130    3
-    70    130    0
-    70    120    0
-f532 1
-    -1    -0    -0
-c0
-4
-    70    120    0
-    70    120    3
-    70    130    3
-    70    120    0
-f533 1
-    0    -1    -0
-c0
-4
-    90    110    3
-    80    110    0
-    90    110    0
-    90    110    3
-f534 1
-    0    -1    -0
-c0
-4
-    70    110    3
-    70    110    0
-    80    110    3
-    70    110    3
-f535 1
-    0    -1    -0
-c0
-4
-    80    110    3
-    70    110    0
-    80    110    0
-    80    110    3
-f536 1
-    -0    -1    -0
-c0
-4
-    90    110    3
-    80    110    3
-    80    110    0
-    90    110    3
-f537 1
-    -0    1    -0
-c0
-4
-    110    130    0
-    110    130    3
-    120    130    3
-    110    130    0
-f538 1
-    0    1    0
-c0
-4
-    110    130    0
-    120    130    3
-    120    130    0
-    110    130    0
-f539 1
-    0    1    -0
-c0
-4
-    130    130    0
-    120    130    3
-    130    130    3
-    130    130    0
-f540 1
-    -0    1    -0
-c0
-4
-    120    130    0
-    120    130    3
-    130    130    0
-    120    130    0
-f541 1
-    -1    -0    0
-c0
-4
-    110    120    3
-    110    110    0
-    110    110    3
-    110    120    3
-f542 1
-    -1    -0    -0
-c0
-4
-    110    120    3
-    110    120    0
-    110    110    0
-    110    120    3
-f543 1
-    -1    0    -0
-c0
-4
-    110    120    3
-    110    130    3
-    110    130    0
-    110    120    3
-f544 1
-    -1    0    0
-c0
-4
-    110    120    3
-    110    130    0
-    110    120    0
-    110    120    3
-f545 1
-    0    -1    -0
-c0
-4
-    130    110    3
-    120    110    0
-    130    110    0
-    130    110    3
-f546 1
-    -0    -1    -0
-c0
-4
-    120    110    3
-    110    110    3
-    110    110    0
-    120    110    3
-f547 1
-    0    -1    -0
-c0
-4
-    120    110    3
-    110    110    0
-    120    110    0
-    120    110    3
-f548 1
-    0    -1    -0
-c0
-4
-    120    110    3
-    120    110    0
-    130    110    3
-    120    110    3
-f549 1
-    1    0    -0
-c0
-4
-    130    120    3
-    130    110    3
-    130    110    0
-    130    120    3
-f550 1
-    1    0    0
-c0
-4
-    130    120    3
-    130    110    0
-    130    120    0
-    130    120    3
-f551 1
-    1    0    0
-c0
-4
-    130    130    3
-    130    120    0
-    130    130    0
-    130    130    3
-f552 1
-    1    -0    -0
-c0
-4
-    130    120    3
-    130    120    0
-    130    130    3
-    130    120    3
-f553 1
-    0    1    -0
-c0
-4
-    50    90    0
-    40    90    3
-    50    90    3
-    50    90    0
-f554 1
-    -0    1    -0
-c0
-4
-    40    90    0
-    40    90    3
-    50    90    0
-    40    90    0
-f555 1
-    -0    1    -0
-c0
-4
-    40    90    0
-    30    90    0
-    30    90    3
-    40    90    0
-f556 1
-    0    1    -0
-c0
-4
-    40    90    0
-    30    90    3
-    40    90    3
-    40    90    0
-f557 1
-    1    0    0
-c0
-4
-    50    90    3
-    50    80    0
-    50    90    0
-    50    90    3
-f558 1
-    1    -0    -0
-c0
-4
-    50    70    3
-    50    70    0
-    50    80    3
-    50    70    3
-f559 1
-    1    0    0
-c0
-4
-    50    80    3
-    50    70    0
-    50    80    0
-    50    80    3
-f560 1
-    1    -0    -0
-c0
-4
-    50    80    3
-    50    80    0
-    50    90    3
-    50    80    3
-f561 1
-    -1    -0    -0
-c0
-4
-    30    70    0
-    30    70    3
-    30    80    3
-    30    70    0
-f562 1
-    -1    0    0
-c0
-4
-    30    70    0
-    30    80    3
-    30    80    0
-    30    70    0
-f563 1
-    -1    0    0
-c0
-4
-    30    90    0
-    30    80    3
-    30    90    3
-    30    90    0
-f564 1
-    -1    -0    -0
-c0
-4
-    30    90    0
-    30    80    0
-    30    80    3
-    30    90    0
-f565 1
-    -0    -1    -0
-c0
-4
-    50    70    3
-    40    70    3
-    50    70    0
-    50    70    3
-f566 1
-    -0    -1    -0
-c0
-4
-    40    70    3
-    40    70    0
-    50    70    0
-    40    70    3
-f567 1
-    0    -1    -0
-c0
-4
-    30    70    3
-    30    70    0
-    40    70    3
-    30    70    3
-f568 1
-    0    -1    -0
-c0
-4
-    40    70    3
-    30    70    0
-    40    70    0
-    40    70    3
-f569 1
-    -1    0    0
-c0
-4
-    30    120    0
-    30    130    3
-    30    130    0
-    30    120    0
-f570 1
-    -1    -0    -0
-c0
-4
-    30    110    0
-    30    110    3
-    30    120    0
-    30    110    0
-f571 1
-    -1    0    0
-c0
-4
-    30    120    0
-    30    110    3
-    30    120    3
-    30    120    0
-f572 1
-    -1    -0    -0
-c0
-4
-    30    120    0
-    30    120    3
-    30    130    3
-    30    120    0
-f573 1
-    -0    1    -0
-c0
-4
-    30    130    0
-    30    130    3
-    40    130    3
-    30    130    0
-f574 1
-    0    1    0
-c0
-4
-    30    130    0
-    40    130    3
-    40    130    0
-    30    130    0
-f575 1
-    0    1    -0
-c0
-4
-    50    130    0
-    40    130    3
-    50    130    3
-    50    130    0
-f576 1
-    -0    1    -0
-c0
-4
-    40    130    0
-    40    130    3
-    50    130    0
-    40    130    0
-f577 1
-    0    -1    0
-c0
-4
-    40    110    3
-    50    110    0
-    50    110    3
-    40    110    3
-f578 1
-    -0    -1    -0
-c0
-4
-    40    110    3
-    40    110    0
-    50    110    0
-    40    110    3
-f579 1
-    0    -1    -0
-c0
-4
-    30    110    3
-    30    110    0
-    40    110    3
-    30    110    3
-f580 1
-    0    -1    -0
-c0
-4
-    40    110    3
-    30    110    0
-    40    110    0
-    40    110    3
-f581 1
-    1    0    0
-c0
-4
-    50    130    3
-    50    120    0
-    50    130    0
-    50    130    3
-f582 1
-    1    0    -0
-c0
-4
-    50    120    3
-    50    110    3
-    50    110    0
-    50    120    3
-f583 1
-    1    0    0
-c0
-4
-    50    120    3
-    50    110    0
-    50    120    0
-    50    120    3
-f584 1
-    1    0    -0
-c0
-4
-    50    130    3
-    50    120    3
-    50    120    0
-    50    130    3
-f585 1
-    0    1    -0
-c0
-4
-    50    50    0
-    40    50    3
-    50    50    3
-    50    50    0
-f586 1
-    -0    1    -0
-c0
-4
-    40    50    0
-    40    50    3
-    50    50    0
-    40    50    0
-f587 1
-    -0    1    -0
-c0
-4
-    40    50    0
-    30    50    0
-    30    50    3
-    40    50    0
-f588 1
-    0    1    -0
-c0
-4
-    40    50    0
-    30    50    3
-    40    50    3
-    40    50    0
-f589 1
-    1    0    0
-c0
-4
-    50    50    3
-    50    40    3
-    50    50    0
-    50    50    3
-f590 1
-    1    -0    -0
-c0
-4
-    50    40    3
-    50    40    0
-    50    50    0
-    50    40    3
-f591 1
-    1    -0    -0
-c0
-4
-    50    30    3
-    50    30    0
-    50    40    0
-    50    30    3
-f592 1
-    1    -0    0
-c0
-4
-    50    30    3
-    50    40    0
-    50    40    3
-    50    30    3
-f593 1
-    -1    -0    -0
-c0
-4
-    30    30    0
-    30    30    3
-    30    40    3
-    30    30    0
-f594 1
-    -1    0    0
-c0
-4
-    30    40    0
-    30    30    0
-    30    40    3
-    30    40    0
-f595 1
-    -1    0    0
-c0
-4
-    30    50    0
-    30    40    3
-    30    50    3
-    30    50    0
-f596 1
-    -1    -0    -0
-c0
-4
-    30    40    0
-    30    40    3
-    30    50    0
-    30    40    0
-f597 1
-    0    -1    -0
-c0
-4
-    50    30    3
-    40    30    0
-    50    30    0
-    50    30    3
-f598 1
-    -0    -1    -0
-c0
-4
-    40    30    3
-    30    30    3
-    30    30    0
-    40    30    3
-f599 1
-    0    -1    -0
-c0
-4
-    40    30    3
-    30    30    0
-    40    30    0
-    40    30    3
-f600 1
-    -0    -1    -0
-c0
-4
-    50    30    3
-    40    30    3
-    40    30    0
-    50    30    3
-f601 1
-    -0    1    -0
-c0
-4
-    70    90    3
-    70    90    6
-    80    90    6
-    70    90    3
-f602 1
-    0    1    0
-c0
-4
-    70    90    3
-    80    90    6
-    80    90    3
-    70    90    3
-f603 1
-    0    1    -0
-c0
-4
-    90    90    3
-    80    90    3
-    90    90    6
-    90    90    3
-f604 1
-    -0    1    -0
-c0
-4
-    80    90    3
-    80    90    6
-    90    90    6
-    80    90    3
-f605 1
-    1    0    0
-c0
-4
-    90    90    6
-    90    80    3
-    90    90    3
-    90    90    6
-f606 1
-    1    -0    -0
-c0
-4
-    90    70    6
-    90    70    3
-    90    80    3
-    90    70    6
-f607 1
-    1    -0    -0
-c0
-4
-    90    80    6
-    90    80    3
-    90    90    6
-    90    80    6
-f608 1
-    1    0    0
-c0
-4
-    90    80    6
-    90    70    6
-    90    80    3
-    90    80    6
-f609 1
-    -1    0    0
-c0
-4
-    70    90    3
-    70    80    6
-    70    90    6
-    70    90    3
-f610 1
-    -1    -0    -0
-c0
-4
-    70    90    3
-    70    80    3
-    70    80    6
-    70    90    3
-f611 1
-    -1    -0    -0
-c0
-4
-    70    70    3
-    70    70    6
-    70    80    3
-    70    70    3
-f612 1
-    -1    0    0
-c0
-4
-    70    80    3
-    70    70    6
-    70    80    6
-    70    80    3
-f613 1
-    -0    -1    0
-c0
-4
-    90    70    3
-    90    70    6
-    80    70    6
-    90    70    3
-f614 1
-    0    -1    0
-c0
-4
-    90    70    3
-    80    70    6
-    80    70    3
-    90    70    3
-f615 1
-    0    -1    0
-c0
-4
-    70    70    3
-    80    70    6
-    70    70    6
-    70    70    3
-f616 1
-    -0    -1    0
-c0
-4
-    80    70    3
-    80    70    6
-    70    70    3
-    80    70    3
-f617 1
-    1    -0    -0
-c0
-4
-    90    50    3
-    90    50    6
-    90    40    6
-    90    50    3
-f618 1
-    1    0    0
-c0
-4
-    90    50    3
-    90    40    6
-    90    40    3
-    90    50    3
-f619 1
-    1    0    0
-c0
-4
-    90    30    3
-    90    40    3
-    90    30    6
-    90    30    3
-f620 1
-    1    -0    -0
-c0
-4
-    90    40    3
-    90    40    6
-    90    30    6
-    90    40    3
-f621 1
-    0    1    -0
-c0
-4
-    90    50    3
-    80    50    3
-    90    50    6
-    90    50    3
-f622 1
-    -0    1    -0
-c0
-4
-    70    50    3
-    70    50    6
-    80    50    3
-    70    50    3
-f623 1
-    -0    1    -0
-c0
-4
-    80    50    3
-    80    50    6
-    90    50    6
-    80    50    3
-f624 1
-    0    1    -0
-c0
-4
-    80    50    3
-    70    50    6
-    80    50    6
-    80    50    3
-f625 1
-    0    -1    -0
-c0
-4
-    90    30    6
-    80    30    3
-    90    30    3
-    90    30    6
-f626 1
-    0    -1    -0
-c0
-4
-    70    30    6
-    70    30    3
-    80    30    6
-    70    30    6
-f627 1
-    0    -1    -0
-c0
-4
-    80    30    6
-    70    30    3
-    80    30    3
-    80    30    6
-f628 1
-    -0    -1    -0
-c0
-4
-    90    30    6
-    80    30    6
-    80    30    3
-    90    30    6
-f629 1
-    -1    0    0
-c0
-4
-    70    40    3
-    70    50    6
-    70    50    3
-    70    40    3
-f630 1
-    -1    -0    -0
-c0
-4
-    70    30    3
-    70    30    6
-    70    40    6
-    70    30    3
-f631 1
-    -1    0    0
-c0
-4
-    70    40    3
-    70    30    3
-    70    40    6
-    70    40    3
-f632 1
-    -1    -0    -0
-c0
-4
-    70    40    3
-    70    40    6
-    70    50    6
-    70    40    3
-f633 1
-    1    0    0
-c0
-4
-    130    50    6
-    130    40    3
-    130    50    3
-    130    50    6
-f634 1
-    1    -0    -0
-c0
-4
-    130    30    6
-    130    30    3
-    130    40    3
-    130    30    6
-f635 1
-    1    0    -0
-c0
-4
-    130    50    6
-    130    40    6
-    130    40    3
-    130    50    6
-f636 1
-    1    -0    0
-c0
-4
-    130    30    6
-    130    40    3
-    130    40    6
-    130    30    6
-f637 1
-    0    1    -0
-c0
-4
-    130    50    3
-    120    50    6
-    130    50    6
-    130    50    3
-f638 1
-    -0    1    -0
-c0
-4
-    130    50    3
-    120    50    3
-    120    50    6
-    130    50    3
-f639 1
-    -0    1    -0
-c0
-4
-    120    50    3
-    110    50    3
-    110    50    6
-    120    50    3
-f640 1
-    0    1    -0
-c0
-4
-    120    50    3
-    110    50    6
-    120    50    6
-    120    50    3
-f641 1
-    -0    -1    0
-c0
-4
-    130    30    3
-    130    30    6
-    120    30    6
-    130    30    3
-f642 1
-    0    -1    0
-c0
-4
-    120    30    3
-    130    30    3
-    120    30    6
-    120    30    3
-f643 1
-    0    -1    0
-c0
-4
-    110    30    3
-    120    30    6
-    110    30    6
-    110    30    3
-f644 1
-    -0    -1    0
-c0
-4
-    120    30    3
-    120    30    6
-    110    30    3
-    120    30    3
-f645 1
-    -1    0    -0
-c0
-4
-    110    40    6
-    110    50    6
-    110    50    3
-    110    40    6
-f646 1
-    -1    0    0
-c0
-4
-    110    40    6
-    110    50    3
-    110    40    3
-    110    40    6
-f647 1
-    -1    0    0
-c0
-4
-    110    30    6
-    110    40    3
-    110    30    3
-    110    30    6
-f648 1
-    -1    -0    -0
-c0
-4
-    110    40    6
-    110    40    3
-    110    30    6
-    110    40    6
-f649 1
-    -1    -0    -0
-c0
-4
-    110    80    3
-    110    70    3
-    110    70    6
-    110    80    3
-f650 1
-    -1    0    0
-c0
-4
-    110    90    3
-    110    80    6
-    110    90    6
-    110    90    3
-f651 1
-    -1    -0    -0
-c0
-4
-    110    80    3
-    110    80    6
-    110    90    3
-    110    80    3
-f652 1
-    -1    0    0
-c0
-4
-    110    80    3
-    110    70    6
-    110    80    6
-    110    80    3
-f653 1
-    -0    1    -0
-c0
-4
-    110    90    3
-    110    90    6
-    120    90    6
-    110    90    3
-f654 1
-    0    1    0
-c0
-4
-    110    90    3
-    120    90    6
-    120    90    3
-    110    90    3
-f655 1
-    0    1    -0
-c0
-4
-    130    90    3
-    120    90    3
-    130    90    6
-    130    90    3
-f656 1
-    -0    1    -0
-c0
-4
-    120    90    3
-    120    90    6
-    130    90    6
-    120    90    3
-f657 1
-    -0    -1    -0
-c0
-4
-    120    70    6
-    110    70    6
-    110    70    3
-    120    70    6
-f658 1
-    0    -1    -0
-c0
-4
-    120    70    6
-    110    70    3
-    120    70    3
-    120    70    6
-f659 1
-    0    -1    -0
-c0
-4
-    130    70    6
-    120    70    3
-    130    70    3
-    130    70    6
-f660 1
-    0    -1    -0
-c0
-4
-    120    70    6
-    120    70    3
-    130    70    6
-    120    70    6
-f661 1
-    1    -0    0
-c0
-4
-    130    80    6
-    130    90    3
-    130    90    6
-    130    80    6
-f662 1
-    1    -0    -0
-c0
-4
-    130    80    6
-    130    80    3
-    130    90    3
-    130    80    6
-f663 1
-    1    0    -0
-c0
-4
-    130    80    6
-    130    70    6
-    130    70    3
-    130    80    6
-f664 1
-    1    0    0
-c0
-4
-    130    80    6
-    130    70    3
-    130    80    3
-    130    80    6
-f665 1
-    -0    1    -0
-c0
-4
-    70    130    3
-    70    130    6
-    80    130    3
-    70    130    3
-f666 1
-    0    1    -0
-c0
-4
-    90    130    3
-    80    130    6
-    90    130    6
-    90    130    3
-f667 1
-    -0    1    -0
-c0
-4
-    90    130    3
-    80    130    3
-    80    130    6
-    90    130    3
-f668 1
-    0    1    -0
-c0
-4
-    80    130    3
-    70    130    6
-    80    130    6
-    80    130    3
-f669 1
-    1    0    0
-c0
-4
-    90    130    6
-    90    120    3
-    90    130    3
-    90    130    6
-f670 1
-    1    -0    -0
-c0
-4
-    90    110    6
-    90    110    3
-    90    120    6
-    90    110    6
-f671 1
-    1    0    0
-c0
-4
-    90    120    6
-    90    110    3
-    90    120    3
-    90    120    6
-f672 1
-    1    -0    -0
-c0
-4
-    90    120    6
-    90    120    3
-    90    130    6
-    90    120    6
-f673 1
-    -1    0    0
-c0
-4
-    70    120    3
-    70    130    6
-    70    130    3
-    70    120    3
-f674 1
-    -1    -0    -0
-c0
-4
-    70    110    3
-    70    110    6
-    70    120    3
-    70    110    3
-f675 1
-    -1    -0    -0
-c0
-4
-    70    120    3
-    70    120    6
-    70    130    6
-    70    120    3
-f676 1
-    -1    0    0
-c0
-4
-    70    120    3
-    70    110    6
-    70    120    6
-    70    120    3
-f677 1
-    0    -1    0
-c0
-4
-    80    110    6
-    90    110    3
-    90    110    6
-    80    110    6
-f678 1
-    -0    -1    -0
-c0
-4
-    80    110    6
-    80    110    3
-    90    110    3
-    80    110    6
-f679 1
-    -0    -1    -0
-c0
-4
-    80    110    6
-    70    110    6
-    70    110    3
-    80    110    6
-f680 1
-    0    -1    -0
-c0
-4
-    80    110    6
-    70    110    3
-    80    110    3
-    80    110    6
-f681 1
-    -0    1    -0
-c0
-4
-    110    130    3
-    110    130    6
-    120    130    3
-    110    130    3
-f682 1
-    0    1    -0
-c0
-4
-    130    130    3
-    120    130    3
-    130    130    6
-    130    130    3
-f683 1
-    0    1    -0
-c0
-4
-    120    130    3
-    110    130    6
-    120    130    6
-    120    130    3
-f684 1
-    -0    1    -0
-c0
-4
-    120    130    3
-    120    130    6
-    130    130    6
-    120    130    3
-f685 1
-    -1    -0    -0
-c0
-4
-    110    130    6
-    110    130    3
-    110    120    3
-    110    130    6
-f686 1
-    -1    0    0
-c0
-4
-    110    110    6
-    110    120    3
-    110    110    3
-    110    110    6
-f687 1
-    -1    0    0
-c0
-4
-    110    120    6
-    110    130    6
-    110    120    3
-    110    120    6
-f688 1
-    -1    -0    -0
-c0
-4
-    110    120    6
-    110    120    3
-    110    110    6
-    110    120    6
-f689 1
-    -0    -1    -0
-c0
-4
-    120    110    6
-    110    110    6
-    110    110    3
-    120    110    6
-f690 1
-    0    -1    -0
-c0
-4
-    120    110    6
-    110    110    3
-    120    110    3
-    120    110    6
-f691 1
-    0    -1    0
-c0
-4
-    120    110    6
-    130    110    3
-    130    110    6
-    120    110    6
-f692 1
-    -0    -1    -0
-c0
-4
-    120    110    6
-    120    110    3
-    130    110    3
-    120    110    6
-f693 1
-    1    0    0
-c0
-4
-    130    130    6
-    130    120    3
-    130    130    3
-    130    130    6
-f694 1
-    1    0    -0
-c0
-4
-    130    120    6
-    130    110    6
-    130    110    3
-    130    120    6
-f695 1
-    1    0    0
-c0
-4
-    130    120    6
-    130    110    3
-    130    120    3
-    130    120    6
-f696 1
-    1    -0    -0
-c0
-4
-    130    120    6
-    130    120    3
-    130    130    6
-    130    120    6
-f697 1
-    -0    1    -0
-c0
-4
-    30    90    3
-    30    90    6
-    40    90    6
-    30    90    3
-f698 1
-    0    1    0
-c0
-4
-    30    90    3
-    40    90    6
-    40    90    3
-    30    90    3
-f699 1
-    0    1    -0
-c0
-4
-    50    90    3
-    40    90    6
-    50    90    6
-    50    90    3
-f700 1
-    -0    1    -0
-c0
-4
-    40    90    3
-    40    90    6
-    50    90    3
-    40    90    3
-f701 1
-    1    -0    0
-c0
-4
-    50    80    6
-    50    90    3
-    50    90    6
-    50    80    6
-f702 1
-    1    -0    -0
-c0
-4
-    50    80    6
-    50    80    3
-    50    90    3
-    50    80    6
-f703 1
-    1    -0    -0
-c0
-4
-    50    70    6
-    50    70    3
-    50    80    3
-    50    70    6
-f704 1
-    1    0    0
-c0
-4
-    50    80    6
-    50    70    6
-    50    80    3
-    50    80    6
-f705 1
-    -1    0    0
-c0
-4
-    30    90    3
-    30    80    6
-    30    90    6
-    30    90    3
-f706 1
-    -1    -0    -0
-c0
-4
-    30    80    3
-    30    80    6
-    30    90    3
-    30    80    3
-f707 1
-    -1    -0    -0
-c0
-4
-    30    70    3
-    30    70    6
-    30    80    3
-    30    70    3
-f708 1
-    -1    0    0
-c0
-4
-    30    80    3
-    30    70    6
-    30    80    6
-    30    80    3
-f709 1
-    0    -1    -0
-c0
-4
-    50    70    6
-    40    70    3
-    50    70    3
-    50    70    6
-f710 1
-    -0    -1    -0
-c0
-4
-    40    70    6
-    30    70    6
-    30    70    3
-    40    70    6
-f711 1
-    0    -1    -0
-c0
-4
-    40    70    6
-    30    70    3
-    40    70    3
-    40    70    6
-f712 1
-    -0    -1    -0
-c0
-4
-    50    70    6
-    40    70    6
-    40    70    3
-    50    70    6
-f713 1
-    -1    -0    -0
-c0
-4
-    30    120    3
-    30    110    3
-    30    110    6
-    30    120    3
-f714 1
-    -1    0    0
-c0
-4
-    30    120    3
-    30    130    6
-    30    130    3
-    30    120    3
-f715 1
-    -1    0    0
-c0
-4
-    30    120    3
-    30    110    6
-    30    120    6
-    30    120    3
-f716 1
-    -1    -0    -0
-c0
-4
-    30    120    3
-    30    120    6
-    30    130    6
-    30    120    3
-f717 1
-    -0    1    -0
-c0
-4
-    30    130    3
-    30    130    6
-    40    130    6
-    30    130    3
-f718 1
-    0    1    -0
-c0
-4
-    40    130    3
-    30    130    3
-    40    130    6
-    40    130    3
-f719 1
-    0    1    -0
-c0
-4
-    50    130    3
-    40    130    6
-    50    130    6
-    50    130    3
-f720 1
-    -0    1    -0
-c0
-4
-    40    130    3
-    40    130    6
-    50    130    3
-    40    130    3
-f721 1
-    -0    -1    -0
-c0
-4
-    30    110    6
-    30    110    3
-    40    110    3
-    30    110    6
-f722 1
-    -0    -1    -0
-c0
-4
-    50    110    6
-    40    110    6
-    50    110    3
-    50    110    6
-f723 1
-    -0    -1    -0
-c0
-4
-    40    110    6
-    40    110    3
-    50    110    3
-    40    110    6
-f724 1
-    0    -1    0
-c0
-4
-    30    110    6
-    40    110    3
-    40    110    6
-    30    110    6
-f725 1
-    1    -0    0
-c0
-4
-    50    120    6
-    50    130    3
-    50    130    6
-    50    120    6
-f726 1
-    1    -0    -0
-c0
-4
-    50    120    6
-    50    120    3
-    50    130    3
-    50    120    6
-f727 1
-    1    0    -0
-c0
-4
-    50    120    6
-    50    110    6
-    50    110    3
-    50    120    6
-f728 1
-    1    0    0
-c0
-4
-    50    120    6
-    50    110    3
-    50    120    3
-    50    120    6
-f729 1
-    -0    1    0
-c0
-4
-    30    50    6
-    40    50    6
-    30    50    3
-    30    50    6
-f730 1
-    -0    1    0
-c0
-4
-    40    50    6
-    40    50    3
-    30    50    3
-    40    50    6
-f731 1
-    -0    1    0
-c0
-4
-    50    50    6
-    50    50    3
-    40    50    3
-    50    50    6
-f732 1
-    0    1    0
-c0
-4
-    50    50    6
-    40    50    3
-    40    50    6
-    50    50    6
-f733 1
-    1    -0    0
-c0
-4
-    50    40    6
-    50    50    3
-    50    50    6
-    50    40    6
-f734 1
-    1    -0    -0
-c0
-4
-    50    40    6
-    50    40    3
-    50    50    3
-    50    40    6
-f735 1
-    1    -0    -0
-c0
-4
-    50    30    6
-    50    30    3
-    50    40    3
-    50    30    6
-f736 1
-    1    0    0
-c0
-4
-    50    40    6
-    50    30    6
-    50    40    3
-    50    40    6
-f737 1
-    -1    0    -0
-c0
-4
-    30    40    6
-    30    50    6
-    30    50    3
-    30    40    6
-f738 1
-    -1    0    0
-c0
-4
-    30    40    6
-    30    50    3
-    30    40    3
-    30    40    6
-f739 1
-    -1    0    0
-c0
-4
-    30    30    6
-    30    40    3
-    30    30    3
-    30    30    6
-f740 1
-    -1    0    -0
-c0
-4
-    30    30    6
-    30    40    6
-    30    40    3
-    30    30    6
-f741 1
-    -0    -1    -0
-c0
-4
-    50    30    6
-    40    30    6
-    50    30    3
-    50    30    6
-f742 1
-    -0    -1    -0
-c0
-4
-    40    30    6
-    40    30    3
-    50    30    3
-    40    30    6
-f743 1
-    -0    -1    -0
-c0
-4
-    30    30    6
-    30    30    3
-    40    30    3
-    30    30    6
-f744 1
-    -0    -1    -0
-c0
-4
-    40    30    6
-    30    30    6
-    40    30    3
-    40    30    6
-f745 1
-    -0    1    -0
-c0
-4
-    70    90    6
-    70    90    9
-    80    90    9
-    70    90    6
-f746 1
-    0    1    0
-c0
-4
-    70    90    6
-    80    90    9
-    80    90    6
-    70    90    6
-f747 1
-    0    1    0
-c0
-4
-    80    90    6
-    90    90    9
-    90    90    6
-    80    90    6
-f748 1
-    -0    1    -0
-c0
-4
-    80    90    6
-    80    90    9
-    90    90    9
-    80    90    6
-f749 1
-    1    -0    0
-c0
-4
-    90    80    9
-    90    90    6
-    90    90    9
-    90    80    9
-f750 1
-    1    -0    -0
-c0
-4
-    90    80    9
-    90    80    6
-    90    90    6
-    90    80    9
-f751 1
-    1    0    -0
-c0
-4
-    90    80    9
-    90    70    9
-    90    70    6
-    90    80    9
-f752 1
-    1    0    0
-c0
-4
-    90    80    9
-    90    70    6
-    90    80    6
-    90    80    9
-f753 1
-    -1    0    0
-c0
-4
-    70    90    6
-    70    80    9
-    70    90    9
-    70    90    6
-f754 1
-    -1    -0    -0
-c0
-4
-    70    90    6
-    70    80    6
-    70    80    9
-    70    90    6
-f755 1
-    -1    -0    -0
-c0
-4
-    70    70    6
-    70    70    9
-    70    80    9
-    70    70    6
-f756 1
-    -1    0    0
-c0
-4
-    70    70    6
-    70    80    9
-    70    80    6
-    70    70    6
-f757 1
-    0    -1    0
-c0
-4
-    80    70    9
-    90    70    6
-    90    70    9
-    80    70    9
-f758 1
-    -0    -1    -0
-c0
-4
-    80    70    9
-    80    70    6
-    90    70    6
-    80    70    9
-f759 1
-    -0    -1    -0
-c0
-4
-    70    70    9
-    70    70    6
-    80    70    6
-    70    70    9
-f760 1
-    -0    -1    -0
-c0
-4
-    80    70    9
-    70    70    9
-    80    70    6
-    80    70    9
-f761 1
-    1    0    0
-c0
-4
-    90    50    9
-    90    40    9
-    90    50    6
-    90    50    9
-f762 1
-    1    -0    -0
-c0
-4
-    90    40    9
-    90    40    6
-    90    50    6
-    90    40    9
-f763 1
-    1    -0    -0
-c0
-4
-    90    30    9
-    90    30    6
-    90    40    6
-    90    30    9
-f764 1
-    1    0    0
-c0
-4
-    90    40    9
-    90    30    9
-    90    40    6
-    90    40    9
-f765 1
-    0    1    -0
-c0
-4
-    90    50    6
-    80    50    6
-    90    50    9
-    90    50    6
-f766 1
-    -0    1    -0
-c0
-4
-    70    50    6
-    70    50    9
-    80    50    9
-    70    50    6
-f767 1
-    0    1    -0
-c0
-4
-    80    50    6
-    70    50    6
-    80    50    9
-    80    50    6
-f768 1
-    -0    1    -0
-c0
-4
-    80    50    6
-    80    50    9
-    90    50    9
-    80    50    6
-f769 1
-    0    -1    0
-c0
-4
-    80    30    9
-    90    30    6
-    90    30    9
-    80    30    9
-f770 1
-    -0    -1    -0
-c0
-4
-    80    30    9
-    80    30    6
-    90    30    6
-    80    30    9
-f771 1
-    -0    -1    -0
-c0
-4
-    70    30    9
-    70    30    6
-    80    30    6
-    70    30    9
-f772 1
-    -0    -1    -0
-c0
-4
-    80    30    9
-    70    30    9
-    80    30    6
-    80    30    9
-f773 1
-    -1    0    0
-c0
-4
-    70    40    6
-    70    50    9
-    70    50    6
-    70    40    6
-f774 1
-    -1    -0    -0
-c0
-4
-    70    30    6
-    70    30    9
-    70    40    6
-    70    30    6
-f775 1
-    -1    -0    -0
-c0
-4
-    70    40    6
-    70    40    9
-    70    50    9
-    70    40    6
-f776 1
-    -1    0    0
-c0
-4
-    70    40    6
-    70    30    9
-    70    40    9
-    70    40    6
-f777 1
-    1    0    0
-c0
-4
-    130    50    9
-    130    40    6
-    130    50    6
-    130    50    9
-f778 1
-    1    0    -0
-c0
-4
-    130    40    9
-    130    30    9
-    130    30    6
-    130    40    9
-f779 1
-    1    0    0
-c0
-4
-    130    40    9
-    130    30    6
-    130    40    6
-    130    40    9
-f780 1
-    1    -0    -0
-c0
-4
-    130    40    9
-    130    40    6
-    130    50    9
-    130    40    9
-f781 1
-    0    1    0
-c0
-4
-    120    50    6
-    130    50    9
-    130    50    6
-    120    50    6
-f782 1
-    -0    1    -0
-c0
-4
-    110    50    6
-    110    50    9
-    120    50    9
-    110    50    6
-f783 1
-    0    1    0
-c0
-4
-    110    50    6
-    120    50    9
-    120    50    6
-    110    50    6
-f784 1
-    -0    1    -0
-c0
-4
-    120    50    6
-    120    50    9
-    130    50    9
-    120    50    6
-f785 1
-    0    -1    -0
-c0
-4
-    130    30    9
-    120    30    6
-    130    30    6
-    130    30    9
-f786 1
-    0    -1    -0
-c0
-4
-    110    30    9
-    110    30    6
-    120    30    9
-    110    30    9
-f787 1
-    0    -1    -0
-c0
-4
-    120    30    9
-    110    30    6
-    120    30    6
-    120    30    9
-f788 1
-    -0    -1    -0
-c0
-4
-    130    30    9
-    120    30    9
-    120    30    6
-    130    30    9
-f789 1
-    -1    0    0
-c0
-4
-    110    50    6
-    110    40    9
-    110    50    9
-    110    50    6
-f790 1
-    -1    -0    -0
-c0
-4
-    110    50    6
-    110    40    6
-    110    40    9
-    110    50    6
-f791 1
-    -1    -0    -0
-c0
-4
-    110    30    6
-    110    30    9
-    110    40    6
-    110    30    6
-f792 1
-    -1    0    0
-c0
-4
-    110    40    6
-    110    30    9
-    110    40    9
-    110    40    6
-f793 1
-    -1    -0    -0
-c0
-4
-    110    80    6
-    110    70    6
-    110    70    9
-    110    80    6
-f794 1
-    -1    0    0
-c0
-4
-    110    90    6
-    110    80    9
-    110    90    9
-    110    90    6
-f795 1
-    -1    -0    -0
-c0
-4
-    110    90    6
-    110    80    6
-    110    80    9
-    110    90    6
-f796 1
-    -1    0    0
-c0
-4
-    110    80    6
-    110    70    9
-    110    80    9
-    110    80    6
-f797 1
-    -0    1    -0
-c0
-4
-    110    90    6
-    110    90    9
-    120    90    6
-    110    90    6
-f798 1
-    0    1    0
-c0
-4
-    120    90    6
-    130    90    9
-    130    90    6
-    120    90    6
-f799 1
-    0    1    -0
-c0
-4
-    120    90    6
-    110    90    9
-    120    90    9
-    120    90    6
-f800 1
-    -0    1    -0
-c0
-4
-    120    90    6
-    120    90    9
-    130    90    9
-    120    90    6
-f801 1
-    -0    -1    -0
-c0
-4
-    110    70    9
-    110    70    6
-    120    70    6
-    110    70    9
-f802 1
-    0    -1    -0
-c0
-4
-    130    70    9
-    120    70    6
-    130    70    6
-    130    70    9
-f803 1
-    0    -1    0
-c0
-4
-    110    70    9
-    120    70    6
-    120    70    9
-    110    70    9
-f804 1
-    -0    -1    -0
-c0
-4
-    130    70    9
-    120    70    9
-    120    70    6
-    130    70    9
-f805 1
-    1    0    0
-c0
-4
-    130    90    9
-    130    80    6
-    130    90    6
-    130    90    9
-f806 1
-    1    -0    -0
-c0
-4
-    130    70    9
-    130    70    6
-    130    80    6
-    130    70    9
-f807 1
-    1    -0    -0
-c0
-4
-    130    80    9
-    130    80    6
-    130    90    9
-    130    80    9
-f808 1
-    1    0    0
-c0
-4
-    130    80    9
-    130    70    9
-    130    80    6
-    130    80    9
-f809 1
-    -0    1    -0
-c0
-4
-    70    130    6
-    70    130    9
-    80    130    9
-    70    130    6
-f810 1
-    0    1    -0
-c0
-4
-    80    130    6
-    70    130    6
-    80    130    9
-    80    130    6
-f811 1
-    0    1    0
-c0
-4
-    80    130    6
-    90    130    9
-    90    130    6
-    80    130    6
-f812 1
-    -0    1    -0
-c0
-4
-    80    130    6
-    80    130    9
-    90    130    9
-    80    130    6
-f813 1
-    1    0    0
-c0
-4
-    90    130    9
-    90    120    9
-    90    130    6
-    90    130    9
-f814 1
-    1    -0    -0
-c0
-4
-    90    120    9
-    90    120    6
-    90    130    6
-    90    120    9
-f815 1
-    1    -0    -0
-c0
-4
-    90    110    9
-    90    110    6
-    90    120    9
-    90    110    9
-f816 1
-    1    0    0
-c0
-4
-    90    120    9
-    90    110    6
-    90    120    6
-    90    120    9
-f817 1
-    -1    0    0
-c0
-4
-    70    120    6
-    70    130    9
-    70    130    6
-    70    120    6
-f818 1
-    -1    -0    -0
-c0
-4
-    70    110    6
-    70    110    9
-    70    120    9
-    70    110    6
-f819 1
-    -1    0    0
-c0
-4
-    70    120    6
-    70    110    6
-    70    120    9
-    70    120    6
-f820 1
-    -1    -0    -0
-c0
-4
-    70    120    6
-    70    120    9
-    70    130    9
-    70    120    6
-f821 1
-    0    -1    -0
-c0
-4
-    90    110    9
-    80    110    6
-    90    110    6
-    90    110    9
-f822 1
-    -0    -1    -0
-c0
-4
-    70    110    9
-    70    110    6
-    80    110    6
-    70    110    9
-f823 1
-    -0    -1    -0
-c0
-4
-    90    110    9
-    80    110    9
-    80    110    6
-    90    110    9
-f824 1
-    0    -1    0
-c0
-4
-    70    110    9
-    80    110    6
-    80    110    9
-    70    110    9
-f825 1
-    -0    1    -0
-c0
-4
-    110    130    6
-    110    130    9
-    120    130    6
-    110    130    6
-f826 1
-    0    1    -0
-c0
-4
-    130    130    6
-    120    130    6
-    130    130    9
-    130    130    6
-f827 1
-    0    1    -0
-c0
-4
-    120    130    6
-    110    130    9
-    120    130    9
-    120    130    6
-f828 1
-    -0    1    -0
-c0
-4
-    120    130    6
-    120    130    9
-    130    130    9
-    120    130    6
-f829 1
-    -1    0    0
-c0
-4
-    110    130    6
-    110    120    9
-    110    130    9
-    110    130    6
-f830 1
-    -1    -0    -0
-c0
-4
-    110    120    6
-    110    120    9
-    110    130    6
-    110    120    6
-f831 1
-    -1    -0    -0
-c0
-4
-    110    110    6
-    110    110    9
-    110    120    9
-    110    110    6
-f832 1
-    -1    0    0
-c0
-4
-    110    120    6
-    110    110    6
-    110    120    9
-    110    120    6
-f833 1
-    0    -1    -0
-c0
-4
-    110    110    9
-    110    110    6
-    120    110    9
-    110    110    9
-f834 1
-    0    -1    -0
-c0
-4
-    120    110    9
-    110    110    6
-    120    110    6
-    120    110    9
-f835 1
-    0    -1    -0
-c0
-4
-    130    110    9
-    120    110    6
-    130    110    6
-    130    110    9
-f836 1
-    0    -1    -0
-c0
-4
-    120    110    9
-    120    110    6
-    130    110    9
-    120    110    9
-f837 1
-    1    0    0
-c0
-4
-    130    130    9
-    130    120    6
-    130    130    6
-    130    130    9
-f838 1
-    1    -0    -0
-c0
-4
-    130    110    9
-    130    110    6
-    130    120    9
-    130    110    9
-f839 1
-    1    0    0
-c0
-4
-    130    120    9
-    130    110    6
-    130    120    6
-    130    120    9
-f840 1
-    1    0    -0
-c0
-4
-    130    130    9
-    130    120    9
-    130    120    6
-    130    130    9
-f841 1
-    -0    1    -0
-c0
-4
-    30    90    6
-    30    90    9
-    40    90    6
-    30    90    6
-f842 1
-    0    1    -0
-c0
-4
-    50    90    6
-    40    90    6
-    50    90    9
-    50    90    6
-f843 1
-    0    1    -0
-c0
-4
-    40    90    6
-    30    90    9
-    40    90    9
-    40    90    6
-f844 1
-    -0    1    -0
-c0
-4
-    40    90    6
-    40    90    9
-    50    90    9
-    40    90    6
-f845 1
-    1    0    0
-c0
-4
-    50    90    9
-    50    80    6
-    50    90    6
-    50    90    9
-f846 1
-    1    0    -0
-c0
-4
-    50    80    9
-    50    70    9
-    50    70    6
-    50    80    9
-f847 1
-    1    0    0
-c0
-4
-    50    80    9
-    50    70    6
-    50    80    6
-    50    80    9
-f848 1
-    1    -0    -0
-c0
-4
-    50    80    9
-    50    80    6
-    50    90    9
-    50    80    9
-f849 1
-    -1    0    0
-c0
-4
-    30    90    6
-    30    80    9
-    30    90    9
-    30    90    6
-f850 1
-    -1    -0    -0
-c0
-4
-    30    80    6
-    30    80    9
-    30    90    6
-    30    80    6
-f851 1
-    -1    -0    -0
-c0
-4
-    30    80    6
-    30    70    6
-    30    70    9
-    30    80    6
-f852 1
-    -1    0    0
-c0
-4
-    30    80    6
-    30    70    9
-    30    80    9
-    30    80    6
-f853 1
-    0    -1    -0
-c0
-4
-    50    70    9
-    40    70    6
-    50    70    6
-    50    70    9
-f854 1
-    -0    -1    -0
-c0
-4
-    30    70    9
-    30    70    6
-    40    70    6
-    30    70    9
-f855 1
-    0    -1    -0
-c0
-4
-    40    70    9
-    40    70    6
-    50    70    9
-    40    70    9
-f856 1
-    -0    -1    -0
-c0
-4
-    40    70    9
-    30    70    9
-    40    70    6
-    40    70    9
-f857 1
-    -1    -0    -0
-c0
-4
-    30    110    6
-    30    110    9
-    30    120    6
-    30    110    6
-f858 1
-    -1    0    0
-c0
-4
-    30    130    6
-    30    120    6
-    30    130    9
-    30    130    6
-f859 1
-    -1    0    0
-c0
-4
-    30    120    6
-    30    110    9
-    30    120    9
-    30    120    6
-f860 1
-    -1    -0    -0
-c0
-4
-    30    120    6
-    30    120    9
-    30    130    9
-    30    120    6
-f861 1
-    -0    1    -0
-c0
-4
-    30    130    6
-    30    130    9
-    40    130    6
-    30    130    6
-f862 1
-    0    1    -0
-c0
-4
-    50    130    6
-    40    130    6
-    50    130    9
-    50    130    6
-f863 1
-    0    1    -0
-c0
-4
-    40    130    6
-    30    130    9
-    40    130    9
-    40    130    6
-f864 1
-    -0    1    -0
-c0
-4
-    40    130    6
-    40    130    9
-    50    130    9
-    40    130    6
-f865 1
-    -0    -1    -0
-c0
-4
-    30    110    9
-    30    110    6
-    40    110    6
-    30    110    9
-f866 1
-    0    -1    0
-c0
-4
-    40    110    9
-    50    110    6
-    50    110    9
-    40    110    9
-f867 1
-    -0    -1    -0
-c0
-4
-    40    110    9
-    40    110    6
-    50    110    6
-    40    110    9
-f868 1
-    -0    -1    -0
-c0
-4
-    40    110    9
-    30    110    9
-    40    110    6
-    40    110    9
-f869 1
-    1    0    0
-c0
-4
-    50    130    9
-    50    120    6
-    50    130    6
-    50    130    9
-f870 1
-    1    -0    -0
-c0
-4
-    50    110    9
-    50    110    6
-    50    120    6
-    50    110    9
-f871 1
-    1    -0    -0
-c0
-4
-    50    120    9
-    50    120    6
-    50    130    9
-    50    120    9
-f872 1
-    1    -0    0
-c0
-4
-    50    110    9
-    50    120    6
-    50    120    9
-    50    110    9
-f873 1
-    -0    1    -0
-c0
-4
-    30    50    6
-    30    50    9
-    40    50    9
-    30    50    6
-f874 1
-    0    1    0
-c0
-4
-    30    50    6
-    40    50    9
-    40    50    6
-    30    50    6
-f875 1
-    0    1    -0
-c0
-4
-    50    50    6
-    40    50    9
-    50    50    9
-    50    50    6
-f876 1
-    -0    1    -0
-c0
-4
-    50    50    6
-    40    50    6
-    40    50    9
-    50    50    6
-f877 1
-    1    -0    -0
-c0
-4
-    50    40    6
-    50    50    6
-    50    50    9
-    50    40    6
-f878 1
-    1    0    0
-c0
-4
-    50    30    6
-    50    40    9
-    50    30    9
-    50    30    6
-f879 1
-    1    -0    -0
-c0
-4
-    50    40    6
-    50    40    9
-    50    30    6
-    50    40    6
-f880 1
-    1    0    0
-c0
-4
-    50    40    6
-    50    50    9
-    50    40    9
-    50    40    6
-f881 1
-    -1    0    0
-c0
-4
-    30    40    6
-    30    50    9
-    30    50    6
-    30    40    6
-f882 1
-    -1    -0    -0
-c0
-4
-    30    30    6
-    30    30    9
-    30    40    9
-    30    30    6
-f883 1
-    -1    0    0
-c0
-4
-    30    40    6
-    30    30    6
-    30    40    9
-    30    40    6
-f884 1
-    -1    -0    -0
-c0
-4
-    30    40    6
-    30    40    9
-    30    50    9
-    30    40    6
-f885 1
-    0    -1    0
-c0
-4
-    40    30    9
-    50    30    6
-    50    30    9
-    40    30    9
-f886 1
-    -0    -1    -0
-c0
-4
-    40    30    9
-    40    30    6
-    50    30    6
-    40    30    9
-f887 1
-    -0    -1    -0
-c0
-4
-    30    30    9
-    30    30    6
-    40    30    6
-    30    30    9
-f888 1
-    -0    -1    -0
-c0
-4
-    40    30    9
-    30    30    9
-    40    30    6
-    40    30    9
-f889 1
-    0    1    0
-c0
-4
-    70    90    12
-    80    90    9
-    70    90    9
-    70    90    12
-f890 1
-    0    1    0
-c0
-4
-    90    90    12
-    90    90    9
-    80    90    12
-    90    90    12
-f891 1
-    0    1    0
-c0
-4
-    80    90    12
-    90    90    9
-    80    90    9
-    80    90    12
-f892 1
-    -0    1    -0
-c0
-4
-    70    90    12
-    80    90    12
-    80    90    9
-    70    90    12
-f893 1
-    1    -0    0
-c0
-4
-    90    80    12
-    90    90    9
-    90    90    12
-    90    80    12
-f894 1
-    1    -0    -0
-c0
-4
-    90    80    12
-    90    80    9
-    90    90    9
-    90    80    12
-f895 1
-    1    0    -0
-c0
-4
-    90    80    12
-    90    70    12
-    90    70    9
-    90    80    12
-f896 1
-    1    0    0
-c0
-4
-    90    80    12
-    90    70    9
-    90    80    9
-    90    80    12
-f897 1
-    -1    0    0
-c0
-4
-    70    90    9
-    70    80    9
-    70    90    12
-    70    90    9
-f898 1
-    -1    -0    -0
-c0
-4
-    70    70    9
-    70    70    12
-    70    80    12
-    70    70    9
-f899 1
-    -1    0    0
-c0
-4
-    70    70    9
-    70    80    12
-    70    80    9
-    70    70    9
-f900 1
-    -1    -0    -0
-c0
-4
-    70    80    9
-    70    80    12
-    70    90    12
-    70    80    9
-f901 1
-    -0    -1    -0
-c0
-4
-    90    70    12
-    80    70    12
-    90    70    9
-    90    70    12
-f902 1
-    -0    -1    -0
-c0
-4
-    80    70    12
-    80    70    9
-    90    70    9
-    80    70    12
-f903 1
-    0    -1    -0
-c0
-4
-    70    70    12
-    70    70    9
-    80    70    12
-    70    70    12
-f904 1
-    0    -1    -0
-c0
-4
-    80    70    12
-    70    70    9
-    80    70    9
-    80    70    12
-f905 1
-    1    0    0
-c0
-4
-    90    50    12
-    90    40    9
-    90    50    9
-    90    50    12
-f906 1
-    1    0    -0
-c0
-4
-    90    40    12
-    90    30    12
-    90    30    9
-    90    40    12
-f907 1
-    1    0    0
-c0
-4
-    90    40    12
-    90    30    9
-    90    40    9
-    90    40    12
-f908 1
-    1    0    -0
-c0
-4
-    90    50    12
-    90    40    12
-    90    40    9
-    90    50    12
-f909 1
-    0    1    -0
-c0
-4
-    90    50    9
-    80    50    12
-    90    50    12
-    90    50    9
-f910 1
-    -0    1    -0
-c0
-4
-    90    50    9
-    80    50    9
-    80    50    12
-    90    50    9
-f911 1
-    -0    1    -0
-c0
-4
-    70    50    9
-    70    50    12
-    80    50    9
-    70    50    9
-f912 1
-    0    1    -0
-c0
-4
-    80    50    9
-    70    50    12
-    80    50    12
-    80    50    9
-f913 1
-    0    -1    -0
-c0
-4
-    90    30    12
-    80    30    9
-    90    30    9
-    90    30    12
-f914 1
-    0    -1    -0
-c0
-4
-    70    30    12
-    70    30    9
-    80    30    12
-    70    30    12
-f915 1
-    0    -1    -0
-c0
-4
-    80    30    12
-    70    30    9
-    80    30    9
-    80    30    12
-f916 1
-    0    -1    -0
-c0
-4
-    80    30    12
-    80    30    9
-    90    30    12
-    80    30    12
-f917 1
-    -1    0    0
-c0
-4
-    70    50    9
-    70    40    12
-    70    50    12
-    70    50    9
-f918 1
-    -1    -0    -0
-c0
-4
-    70    50    9
-    70    40    9
-    70    40    12
-    70    50    9
-f919 1
-    -1    -0    -0
-c0
-4
-    70    30    9
-    70    30    12
-    70    40    12
-    70    30    9
-f920 1
-    -1    0    0
-c0
-4
-    70    30    9
-    70    40    12
-    70    40    9
-    70    30    9
-f921 1
-    1    -0    0
-c0
-4
-    130    40    12
-    130    50    9
-    130    50    12
-    130    40    12
-f922 1
-    1    -0    -0
-c0
-4
-    130    40    12
-    130    40    9
-    130    50    9
-    130    40    12
-f923 1
-    1    -0    -0
-c0
-4
-    130    30    12
-    130    30    9
-    130    40    9
-    130    30    12
-f924 1
-    1    0    0
-c0
-4
-    130    40    12
-    130    30    12
-    130    40    9
-    130    40    12
-f925 1
-    0    1    -0
-c0
-4
-    130    50    9
-    120    50    12
-    130    50    12
-    130    50    9
-f926 1
-    -0    1    -0
-c0
-4
-    120    50    9
-    120    50    12
-    130    50    9
-    120    50    9
-f927 1
-    -0    1    -0
-c0
-4
-    120    50    9
-    110    50    9
-    110    50    12
-    120    50    9
-f928 1
-    0    1    -0
-c0
-4
-    120    50    9
-    110    50    12
-    120    50    12
-    120    50    9
-f929 1
-    0    -1    -0
-c0
-4
-    130    30    12
-    120    30    9
-    130    30    9
-    130    30    12
-f930 1
-    -0    -1    -0
-c0
-4
-    110    30    12
-    110    30    9
-    120    30    9
-    110    30    12
-f931 1
-    -0    -1    -0
-c0
-4
-    130    30    12
-    120    30    12
-    120    30    9
-    130    30    12
-f932 1
-    -0    -1    -0
-c0
-4
-    120    30    12
-    110    30    12
-    120    30    9
-    120    30    12
-f933 1
-    -1    0    0
-c0
-4
-    110    50    9
-    110    40    12
-    110    50    12
-    110    50    9
-f934 1
-    -1    -0    -0
-c0
-4
-    110    40    9
-    110    40    12
-    110    50    9
-    110    40    9
-f935 1
-    -1    -0    -0
-c0
-4
-    110    40    9
-    110    30    9
-    110    30    12
-    110    40    9
-f936 1
-    -1    0    0
-c0
-4
-    110    40    9
-    110    30    12
-    110    40    12
-    110    40    9
-f937 1
-    -1    -0    -0
-c0
-4
-    110    70    9
-    110    70    12
-    110    80    12
-    110    70    9
-f938 1
-    -1    0    0
-c0
-4
-    110    80    9
-    110    70    9
-    110    80    12
-    110    80    9
-f939 1
-    -1    0    0
-c0
-4
-    110    90    9
-    110    80    12
-    110    90    12
-    110    90    9
-f940 1
-    -1    -0    -0
-c0
-4
-    110    90    9
-    110    80    9
-    110    80    12
-    110    90    9
-f941 1
-    -0    1    -0
-c0
-4
-    110    90    9
-    110    90    12
-    120    90    9
-    110    90    9
-f942 1
-    0    1    -0
-c0
-4
-    130    90    9
-    120    90    12
-    130    90    12
-    130    90    9
-f943 1
-    -0    1    -0
-c0
-4
-    130    90    9
-    120    90    9
-    120    90    12
-    130    90    9
-f944 1
-    0    1    -0
-c0
-4
-    120    90    9
-    110    90    12
-    120    90    12
-    120    90    9
-f945 1
-    -0    -1    -0
-c0
-4
-    120    70    12
-    110    70    12
-    110    70    9
-    120    70    12
-f946 1
-    0    -1    -0
-c0
-4
-    120    70    12
-    110    70    9
-    120    70    9
-    120    70    12
-f947 1
-    0    -1    -0
-c0
-4
-    130    70    12
-    120    70    9
-    130    70    9
-    130    70    12
-f948 1
-    -0    -1    -0
-c0
-4
-    130    70    12
-    120    70    12
-    120    70    9
-    130    70    12
-f949 1
-    1    0    0
-c0
-4
-    130    90    12
-    130    80    9
-    130    90    9
-    130    90    12
-f950 1
-    1    -0    -0
-c0
-4
-    130    70    12
-    130    70    9
-    130    80    9
-    130    70    12
-f951 1
-    1    0    -0
-c0
-4
-    130    90    12
-    130    80    12
-    130    80    9
-    130    90    12
-f952 1
-    1    0    0
-c0
-4
-    130    80    12
-    130    70    12
-    130    80    9
-    130    80    12
-f953 1
-    -0    1    -0
-c0
-4
-    80    130    9
-    70    130    9
-    70    130    12
-    80    130    9
-f954 1
-    0    1    -0
-c0
-4
-    90    130    9
-    80    130    12
-    90    130    12
-    90    130    9
-f955 1
-    -0    1    -0
-c0
-4
-    90    130    9
-    80    130    9
-    80    130    12
-    90    130    9
-f956 1
-    0    1    -0
-c0
-4
-    80    130    9
-    70    130    12
-    80    130    12
-    80    130    9
-f957 1
-    1    0    0
-c0
-4
-    90    130    12
-    90    120    9
-    90    130    9
-    90    130    12
-f958 1
-    1    0    -0
-c0
-4
-    90    120    12
-    90    110    12
-    90    110    9
-    90    120    12
-f959 1
-    1    0    0
-c0
-4
-    90    120    12
-    90    110    9
-    90    120    9
-    90    120    12
-f960 1
-    1    -0    -0
-c0
-4
-    90    120    12
-    90    120    9
-    90    130    12
-    90    120    12
-f961 1
-    -1    0    0
-c0
-4
-    70    130    9
-    70    120    12
-    70    130    12
-    70    130    9
-f962 1
-    -1    -0    -0
-c0
-4
-    70    130    9
-    70    120    9
-    70    120    12
-    70    130    9
-f963 1
-    -1    -0    -0
-c0
-4
-    70    110    9
-    70    110    12
-    70    120    9
-    70    110    9
-f964 1
-    -1    0    0
-c0
-4
-    70    120    9
-    70    110    12
-    70    120    12
-    70    120    9
-f965 1
-    0    -1    -0
-c0
-4
-    90    110    12
-    80    110    9
-    90    110    9
-    90    110    12
-f966 1
-    -0    -1    -0
-c0
-4
-    80    110    12
-    70    110    12
-    70    110    9
-    80    110    12
-f967 1
-    0    -1    -0
-c0
-4
-    80    110    12
-    70    110    9
-    80    110    9
-    80    110    12
-f968 1
-    0    -1    -0
-c0
-4
-    80    110    12
-    80    110    9
-    90    110    12
-    80    110    12
-f969 1
-    -0    1    -0
-c0
-4
-    120    130    9
-    110    130    9
-    110    130    12
-    120    130    9
-f970 1
-    0    1    0
-c0
-4
-    120    130    9
-    130    130    12
-    130    130    9
-    120    130    9
-f971 1
-    0    1    -0
-c0
-4
-    120    130    9
-    110    130    12
-    120    130    12
-    120    130    9
-f972 1
-    -0    1    -0
-c0
-4
-    120    130    9
-    120    130    12
-    130    130    12
-    120    130    9
-f973 1
-    -1    0    0
-c0
-4
-    110    130    9
-    110    120    12
-    110    130    12
-    110    130    9
-f974 1
-    -1    -0    -0
-c0
-4
-    110    130    9
-    110    120    9
-    110    120    12
-    110    130    9
-f975 1
-    -1    -0    -0
-c0
-4
-    110    110    9
-    110    110    12
-    110    120    12
-    110    110    9
-f976 1
-    -1    0    0
-c0
-4
-    110    120    9
-    110    110    9
-    110    120    12
-    110    120    9
-f977 1
-    -0    -1    -0
-c0
-4
-    120    110    12
-    110    110    12
-    110    110    9
-    120    110    12
-f978 1
-    0    -1    -0
-c0
-4
-    120    110    12
-    110    110    9
-    120    110    9
-    120    110    12
-f979 1
-    0    -1    -0
-c0
-4
-    130    110    12
-    120    110    9
-    130    110    9
-    130    110    12
-f980 1
-    0    -1    -0
-c0
-4
-    120    110    12
-    120    110    9
-    130    110    12
-    120    110    12
-f981 1
-    1    -0    0
-c0
-4
-    130    120    12
-    130    130    9
-    130    130    12
-    130    120    12
-f982 1
-    1    -0    -0
-c0
-4
-    130    120    12
-    130    120    9
-    130    130    9
-    130    120    12
-f983 1
-    1    -0    -0
-c0
-4
-    130    110    12
-    130    110    9
-    130    120    12
-    130    110    12
-f984 1
-    1    0    0
-c0
-4
-    130    120    12
-    130    110    9
-    130    120    9
-    130    120    12
-f985 1
-    -0    1    -0
-c0
-4
-    40    90    9
-    30    90    9
-    30    90    12
-    40    90    9
-f986 1
-    0    1    -0
-c0
-4
-    50    90    9
-    40    90    12
-    50    90    12
-    50    90    9
-f987 1
-    -0    1    -0
-c0
-4
-    50    90    9
-    40    90    9
-    40    90    12
-    50    90    9
-f988 1
-    0    1    -0
-c0
-4
-    40    90    9
-    30    90    12
-    40    90    12
-    40    90    9
-f989 1
-    1    -0    0
-c0
-4
-    50    80    12
-    50    90    9
-    50    90    12
-    50    80    12
-f990 1
-    1    -0    -0
-c0
-4
-    50    80    12
-    50    80    9
-    50    90    9
-    50    80    12
-f991 1
-    1    -0    -0
-c0
-4
-    50    70    12
-    50    70    9
-    50    80    12
-    50    70    12
-f992 1
-    1    0    0
-c0
-4
-    50    80    12
-    50    70    9
-    50    80    9
-    50    80    12
-f993 1
-    -1    -0    -0
-c0
-4
-    30    90    12
-    30    90    9
-    30    80    9
-    30    90    12
-f994 1
-    -1    0    0
-c0
-4
-    30    70    12
-    30    80    12
-    30    70    9
-    30    70    12
-f995 1
-    -1    -0    -0
-c0
-4
-    30    80    12
-    30    80    9
-    30    70    9
-    30    80    12
-f996 1
-    -1    -0    0
-c0
-4
-    30    90    12
-    30    80    9
-    30    80    12
-    30    90    12
-f997 1
-    -0    -1    0
-c0
-4
-    50    70    9
-    50    70    12
-    40    70    9
-    50    70    9
-f998 1
-    0    -1    0
-c0
-4
-    30    70    9
-    40    70    12
-    30    70    12
-    30    70    9
-f999 1
-    -0    -1    0
-c0
-4
-    40    70    9
-    40    70    12
-    30    70    9
-    40    70    9
-f1000 1
-    0    -1    0
-c0
-4
-    40    70    9
-    50    70    12
-    40    70    12
-    40    70    9
-f1001 1
-    -1    0    0
-c0
-4
-    30    110    12
-    30    120    9
-    30    110    9
-    30    110    12
-f1002 1
-    -1    -0    -0
-c0
-4
-    30    130    12
-    30    130    9
-    30    120    12
-    30    130    12
-f1003 1
-    -1    0    0
-c0
-4
-    30    120    12
-    30    130    9
-    30    120    9
-    30    120    12
-f1004 1
-    -1    0    -0
-c0
-4
-    30    110    12
-    30    120    12
-    30    120    9
-    30    110    12
-f1005 1
-    -0    1    -0
-c0
-4
-    30    130    9
-    30    130    12
-    40    130    9
-    30    130    9
-f1006 1
-    0    1    -0
-c0
-4
-    50    130    9
-    40    130    9
-    50    130    12
-    50    130    9
-f1007 1
-    0    1    -0
-c0
-4
-    40    130    9
-    30    130    12
-    40    130    12
-    40    130    9
-f1008 1
-    -0    1    -0
-c0
-4
-    40    130    9
-    40    130    12
-    50    130    12
-    40    130    9
-f1009 1
-    -0    -1    -0
-c0
-4
-    30    110    12
-    30    110    9
-    40    110    9
-    30    110    12
-f1010 1
-    0    -1    -0
-c0
-4
-    50    110    12
-    40    110    9
-    50    110    9
-    50    110    12
-f1011 1
-    0    -1    0
-c0
-4
-    30    110    12
-    40    110    9
-    40    110    12
-    30    110    12
-f1012 1
-    0    -1    -0
-c0
-4
-    40    110    12
-    40    110    9
-    50    110    12
-    40    110    12
-f1013 1
-    1    0    0
-c0
-4
-    50    130    12
-    50    120    12
-    50    130    9
-    50    130    12
-f1014 1
-    1    -0    -0
-c0
-4
-    50    120    12
-    50    120    9
-    50    130    9
-    50    120    12
-f1015 1
-    1    -0    -0
-c0
-4
-    50    110    12
-    50    110    9
-    50    120    9
-    50    110    12
-f1016 1
-    1    0    0
-c0
-4
-    50    120    12
-    50    110    12
-    50    120    9
-    50    120    12
-f1017 1
-    -0    1    -0
-c0
-4
-    40    50    9
-    30    50    9
-    30    50    12
-    40    50    9
-f1018 1
-    0    1    -0
-c0
-4
-    50    50    9
-    40    50    12
-    50    50    12
-    50    50    9
-f1019 1
-    -0    1    -0
-c0
-4
-    40    50    9
-    40    50    12
-    50    50    9
-    40    50    9
-f1020 1
-    0    1    -0
-c0
-4
-    40    50    9
-    30    50    12
-    40    50    12
-    40    50    9
-f1021 1
-    1    -0    -0
-c0
-4
-    50    50    9
-    50    50    12
-    50    40    12
-    50    50    9
-f1022 1
-    1    0    0
-c0
-4
-    50    40    9
-    50    50    9
-    50    40    12
-    50    40    9
-f1023 1
-    1    0    0
-c0
-4
-    50    40    9
-    50    30    12
-    50    30    9
-    50    40    9
-f1024 1
-    1    -0    -0
-c0
-4
-    50    40    9
-    50    40    12
-    50    30    12
-    50    40    9
-f1025 1
-    -1    0    0
-c0
-4
-    30    50    9
-    30    40    9
-    30    50    12
-    30    50    9
-f1026 1
-    -1    -0    -0
-c0
-4
-    30    30    9
-    30    30    12
-    30    40    9
-    30    30    9
-f1027 1
-    -1    -0    -0
-c0
-4
-    30    40    9
-    30    40    12
-    30    50    12
-    30    40    9
-f1028 1
-    -1    0    0
-c0
-4
-    30    40    9
-    30    30    12
-    30    40    12
-    30    40    9
-f1029 1
-    -0    -1    -0
-c0
-4
-    50    30    12
-    40    30    12
-    50    30    9
-    50    30    12
-f1030 1
-    -0    -1    -0
-c0
-4
-    40    30    12
-    40    30    9
-    50    30    9
-    40    30    12
-f1031 1
-    0    -1    -0
-c0
-4
-    30    30    12
-    30    30    9
-    40    30    12
-    30    30    12
-f1032 1
-    0    -1    -0
-c0
-4
-    40    30    12
-    30    30    9
-    40    30    9
-    40    30    12
-f1033 1
-    0    1    0
-c0
-4
-    70    90    15
-    80    90    12
-    70    90    12
-    70    90    15
-f1034 1
-    -0    1    0
-c0
-4
-    90    90    15
-    90    90    12
-    80    90    12
-    90    90    15
-f1035 1
-    -0    1    0
-c0
-4
-    80    90    15
-    90    90    15
-    80    90    12
-    80    90    15
-f1036 1
-    0    1    0
-c0
-4
-    80    90    15
-    80    90    12
-    70    90    15
-    80    90    15
-f1037 1
-    1    -0    -0
-c0
-4
-    90    80    12
-    90    90    12
-    90    90    15
-    90    80    12
-f1038 1
-    1    0    0
-c0
-4
-    90    80    12
-    90    70    15
-    90    70    12
-    90    80    12
-f1039 1
-    1    0    0
-c0
-4
-    90    80    12
-    90    90    15
-    90    80    15
-    90    80    12
-f1040 1
-    1    -0    -0
-c0
-4
-    90    80    12
-    90    80    15
-    90    70    15
-    90    80    12
-f1041 1
-    -1    0    0
-c0
-4
-    70    90    12
-    70    80    12
-    70    90    15
-    70    90    12
-f1042 1
-    -1    -0    -0
-c0
-4
-    70    70    12
-    70    70    15
-    70    80    15
-    70    70    12
-f1043 1
-    -1    0    0
-c0
-4
-    70    70    12
-    70    80    15
-    70    80    12
-    70    70    12
-f1044 1
-    -1    -0    -0
-c0
-4
-    70    80    12
-    70    80    15
-    70    90    15
-    70    80    12
-f1045 1
-    -0    -1    0
-c0
-4
-    90    70    12
-    90    70    15
-    80    70    12
-    90    70    12
-f1046 1
-    0    -1    0
-c0
-4
-    70    70    12
-    80    70    15
-    70    70    15
-    70    70    12
-f1047 1
-    -0    -1    -0
-c0
-4
-    70    70    12
-    80    70    12
-    80    70    15
-    70    70    12
-f1048 1
-    0    -1    0
-c0
-4
-    80    70    12
-    90    70    15
-    80    70    15
-    80    70    12
-f1049 1
-    1    0    0
-c0
-4
-    90    50    15
-    90    40    15
-    90    50    12
-    90    50    15
-f1050 1
-    1    -0    -0
-c0
-4
-    90    40    15
-    90    40    12
-    90    50    12
-    90    40    15
-f1051 1
-    1    -0    -0
-c0
-4
-    90    30    15
-    90    30    12
-    90    40    12
-    90    30    15
-f1052 1
-    1    0    0
-c0
-4
-    90    40    15
-    90    30    15
-    90    40    12
-    90    40    15
-f1053 1
-    -0    1    0
-c0
-4
-    90    50    15
-    90    50    12
-    80    50    12
-    90    50    15
-f1054 1
-    0    1    0
-c0
-4
-    80    50    15
-    70    50    12
-    70    50    15
-    80    50    15
-f1055 1
-    -0    1    0
-c0
-4
-    80    50    15
-    80    50    12
-    70    50    12
-    80    50    15
-f1056 1
-    0    1    0
-c0
-4
-    90    50    15
-    80    50    12
-    80    50    15
-    90    50    15
-f1057 1
-    0    -1    -0
-c0
-4
-    90    30    15
-    80    30    12
-    90    30    12
-    90    30    15
-f1058 1
-    -0    -1    -0
-c0
-4
-    80    30    15
-    70    30    15
-    70    30    12
-    80    30    15
-f1059 1
-    0    -1    -0
-c0
-4
-    80    30    15
-    70    30    12
-    80    30    12
-    80    30    15
-f1060 1
-    0    -1    -0
-c0
-4
-    80    30    15
-    80    30    12
-    90    30    15
-    80    30    15
-f1061 1
-    -1    0    0
-c0
-4
-    70    50    12
-    70    40    15
-    70    50    15
-    70    50    12
-f1062 1
-    -1    -0    -0
-c0
-4
-    70    40    12
-    70    40    15
-    70    50    12
-    70    40    12
-f1063 1
-    -1    -0    -0
-c0
-4
-    70    30    12
-    70    30    15
-    70    40    12
-    70    30    12
-f1064 1
-    -1    0    0
-c0
-4
-    70    40    12
-    70    30    15
-    70    40    15
-    70    40    12
-f1065 1
-    1    0    0
-c0
-4
-    130    50    15
-    130    40    12
-    130    50    12
-    130    50    15
-f1066 1
-    1    0    -0
-c0
-4
-    130    40    15
-    130    30    15
-    130    30    12
-    130    40    15
-f1067 1
-    1    0    0
-c0
-4
-    130    40    15
-    130    30    12
-    130    40    12
-    130    40    15
-f1068 1
-    1    0    -0
-c0
-4
-    130    50    15
-    130    40    15
-    130    40    12
-    130    50    15
-f1069 1
-    0    1    -0
-c0
-4
-    130    50    12
-    120    50    15
-    130    50    15
-    130    50    12
-f1070 1
-    -0    1    -0
-c0
-4
-    120    50    12
-    120    50    15
-    130    50    12
-    120    50    12
-f1071 1
-    -0    1    -0
-c0
-4
-    120    50    12
-    110    50    12
-    110    50    15
-    120    50    12
-f1072 1
-    0    1    -0
-c0
-4
-    120    50    12
-    110    50    15
-    120    50    15
-    120    50    12
-f1073 1
-    -0    -1    0
-c0
-4
-    130    30    12
-    130    30    15
-    120    30    15
-    130    30    12
-f1074 1
-    0    -1    0
-c0
-4
-    120    30    12
-    130    30    12
-    120    30    15
-    120    30    12
-f1075 1
-    0    -1    0
-c0
-4
-    110    30    12
-    120    30    15
-    110    30    15
-    110    30    12
-f1076 1
-    -0    -1    -0
-c0
-4
-    110    30    12
-    120    30    12
-    120    30    15
-    110    30    12
-f1077 1
-    -1    0    0
-c0
-4
-    110    50    12
-    110    40    15
-    110    50    15
-    110    50    12
-f1078 1
-    -1    -0    -0
-c0
-4
-    110    50    12
-    110    40    12
-    110    40    15
-    110    50    12
-f1079 1
-    -1    -0    -0
-c0
-4
-    110    30    12
-    110    30    15
-    110    40    12
-    110    30    12
-f1080 1
-    -1    0    0
-c0
-4
-    110    40    12
-    110    30    15
-    110    40    15
-    110    40    12
-f1081 1
-    -1    -0    -0
-c0
-4
-    110    70    12
-    110    70    15
-    110    80    15
-    110    70    12
-f1082 1
-    -1    0    0
-c0
-4
-    110    80    12
-    110    70    12
-    110    80    15
-    110    80    12
-f1083 1
-    -1    0    0
-c0
-4
-    110    90    12
-    110    80    15
-    110    90    15
-    110    90    12
-f1084 1
-    -1    -0    -0
-c0
-4
-    110    80    12
-    110    80    15
-    110    90    12
-    110    80    12
-f1085 1
-    -0    1    -0
-c0
-4
-    120    90    12
-    110    90    12
-    110    90    15
-    120    90    12
-f1086 1
-    0    1    -0
-c0
-4
-    130    90    12
-    120    90    15
-    130    90    15
-    130    90    12
-f1087 1
-    -0    1    -0
-c0
-4
-    120    90    12
-    120    90    15
-    130    90    12
-    120    90    12
-f1088 1
-    0    1    -0
-c0
-4
-    120    90    12
-    110    90    15
-    120    90    15
-    120    90    12
-f1089 1
-    -0    -1    -0
-c0
-4
-    120    70    15
-    110    70    15
-    110    70    12
-    120    70    15
-f1090 1
-    0    -1    -0
-c0
-4
-    120    70    15
-    110    70    12
-    120    70    12
-    120    70    15
-f1091 1
-    0    -1    -0
-c0
-4
-    130    70    15
-    120    70    12
-    130    70    12
-    130    70    15
-f1092 1
-    0    -1    -0
-c0
-4
-    120    70    15
-    120    70    12
-    130    70    15
-    120    70    15
-f1093 1
-    1    0    0
-c0
-4
-    130    90    15
-    130    80    15
-    130    90    12
-    130    90    15
-f1094 1
-    1    -0    -0
-c0
-4
-    130    80    15
-    130    80    12
-    130    90    12
-    130    80    15
-f1095 1
-    1    -0    -0
-c0
-4
-    130    70    15
-    130    70    12
-    130    80    12
-    130    70    15
-f1096 1
-    1    -0    0
-c0
-4
-    130    70    15
-    130    80    12
-    130    80    15
-    130    70    15
-f1097 1
-    -0    1    -0
-c0
-4
-    70    130    12
-    70    130    15
-    80    130    12
-    70    130    12
-f1098 1
-    0    1    0
-c0
-4
-    80    130    12
-    90    130    15
-    90    130    12
-    80    130    12
-f1099 1
-    0    1    -0
-c0
-4
-    80    130    12
-    70    130    15
-    80    130    15
-    80    130    12
-f1100 1
-    -0    1    -0
-c0
-4
-    80    130    12
-    80    130    15
-    90    130    15
-    80    130    12
-f1101 1
-    1    0    0
-c0
-4
-    90    130    15
-    90    120    15
-    90    130    12
-    90    130    15
-f1102 1
-    1    -0    -0
-c0
-4
-    90    120    15
-    90    120    12
-    90    130    12
-    90    120    15
-f1103 1
-    1    0    -0
-c0
-4
-    90    120    15
-    90    110    15
-    90    110    12
-    90    120    15
-f1104 1
-    1    0    0
-c0
-4
-    90    120    15
-    90    110    12
-    90    120    12
-    90    120    15
-f1105 1
-    -1    0    0
-c0
-4
-    70    130    12
-    70    120    12
-    70    130    15
-    70    130    12
-f1106 1
-    -1    -0    -0
-c0
-4
-    70    110    12
-    70    110    15
-    70    120    15
-    70    110    12
-f1107 1
-    -1    0    0
-c0
-4
-    70    120    12
-    70    110    12
-    70    120    15
-    70    120    12
-f1108 1
-    -1    -0    -0
-c0
-4
-    70    120    12
-    70    120    15
-    70    130    15
-    70    120    12
-f1109 1
-    0    -1    0
-c0
-4
-    80    110    15
-    90    110    12
-    90    110    15
-    80    110    15
-f1110 1
-    -0    -1    -0
-c0
-4
-    80    110    15
-    80    110    12
-    90    110    12
-    80    110    15
-f1111 1
-    -0    -1    -0
-c0
-4
-    70    110    15
-    70    110    12
-    80    110    12
-    70    110    15
-f1112 1
-    0    -1    0
-c0
-4
-    70    110    15
-    80    110    12
-    80    110    15
-    70    110    15
-f1113 1
-    -0    1    -0
-c0
-4
-    110    130    12
-    110    130    15
-    120    130    12
-    110    130    12
-f1114 1
-    0    1    -0
-c0
-4
-    130    130    12
-    120    130    12
-    130    130    15
-    130    130    12
-f1115 1
-    0    1    -0
-c0
-4
-    120    130    12
-    110    130    15
-    120    130    15
-    120    130    12
-f1116 1
-    -0    1    -0
-c0
-4
-    120    130    12
-    120    130    15
-    130    130    15
-    120    130    12
-f1117 1
-    -1    0    0
-c0
-4
-    110    130    12
-    110    120    15
-    110    130    15
-    110    130    12
-f1118 1
-    -1    -0    -0
-c0
-4
-    110    120    12
-    110    120    15
-    110    130    12
-    110    120    12
-f1119 1
-    -1    -0    -0
-c0
-4
-    110    110    12
-    110    110    15
-    110    120    15
-    110    110    12
-f1120 1
-    -1    0    0
-c0
-4
-    110    110    12
-    110    120    15
-    110    120    12
-    110    110    12
-f1121 1
-    -0    -1    -0
-c0
-4
-    120    110    15
-    110    110    15
-    110    110    12
-    120    110    15
-f1122 1
-    0    -1    -0
-c0
-4
-    120    110    15
-    110    110    12
-    120    110    12
-    120    110    15
-f1123 1
-    0    -1    0
-c0
-4
-    120    110    15
-    130    110    12
-    130    110    15
-    120    110    15
-f1124 1
-    -0    -1    -0
-c0
-4
-    120    110    15
-    120    110    12
-    130    110    12
-    120    110    15
-f1125 1
-    1    0    0
-c0
-4
-    130    130    15
-    130    120    15
-    130    130    12
-    130    130    15
-f1126 1
-    1    -0    -0
-c0
-4
-    130    120    15
-    130    120    12
-    130    130    12
-    130    120    15
-f1127 1
-    1    -0    -0
-c0
-4
-    130    110    15
-    130    110    12
-    130    120    12
-    130    110    15
-f1128 1
-    1    -0    0
-c0
-4
-    130    110    15
-    130    120    12
-    130    120    15
-    130    110    15
-f1129 1
-    -0    1    -0
-c0
-4
-    40    90    12
-    30    90    12
-    30    90    15
-    40    90    12
-f1130 1
-    0    1    0
-c0
-4
-    40    90    12
-    50    90    15
-    50    90    12
-    40    90    12
-f1131 1
-    0    1    -0
-c0
-4
-    40    90    12
-    30    90    15
-    40    90    15
-    40    90    12
-f1132 1
-    -0    1    -0
-c0
-4
-    40    90    12
-    40    90    15
-    50    90    15
-    40    90    12
-f1133 1
-    1    0    0
-c0
-4
-    50    90    15
-    50    80    12
-    50    90    12
-    50    90    15
-f1134 1
-    1    -0    -0
-c0
-4
-    50    70    15
-    50    70    12
-    50    80    12
-    50    70    15
-f1135 1
-    1    0    -0
-c0
-4
-    50    90    15
-    50    80    15
-    50    80    12
-    50    90    15
-f1136 1
-    1    0    0
-c0
-4
-    50    80    15
-    50    70    15
-    50    80    12
-    50    80    15
-f1137 1
-    -1    0    0
-c0
-4
-    30    90    12
-    30    80    15
-    30    90    15
-    30    90    12
-f1138 1
-    -1    -0    -0
-c0
-4
-    30    90    12
-    30    80    12
-    30    80    15
-    30    90    12
-f1139 1
-    -1    -0    -0
-c0
-4
-    30    70    12
-    30    70    15
-    30    80    15
-    30    70    12
-f1140 1
-    -1    0    0
-c0
-4
-    30    70    12
-    30    80    15
-    30    80    12
-    30    70    12
-f1141 1
-    0    -1    0
-c0
-4
-    40    70    15
-    50    70    12
-    50    70    15
-    40    70    15
-f1142 1
-    -0    -1    -0
-c0
-4
-    40    70    15
-    40    70    12
-    50    70    12
-    40    70    15
-f1143 1
-    -0    -1    -0
-c0
-4
-    40    70    15
-    30    70    15
-    30    70    12
-    40    70    15
-f1144 1
-    0    -1    -0
-c0
-4
-    40    70    15
-    30    70    12
-    40    70    12
-    40    70    15
-f1145 1
-    -1    -0    -0
-c0
-4
-    30    120    12
-    30    110    12
-    30    110    15
-    30    120    12
-f1146 1
-    -1    0    0
-c0
-4
-    30    130    12
-    30    120    15
-    30    130    15
-    30    130    12
-f1147 1
-    -1    -0    -0
-c0
-4
-    30    120    12
-    30    120    15
-    30    130    12
-    30    120    12
-f1148 1
-    -1    0    0
-c0
-4
-    30    120    12
-    30    110    15
-    30    120    15
-    30    120    12
-f1149 1
-    -0    1    0
-c0
-4
-    30    130    15
-    40    130    15
-    30    130    12
-    30    130    15
-f1150 1
-    -0    1    0
-c0
-4
-    40    130    15
-    40    130    12
-    30    130    12
-    40    130    15
-f1151 1
-    0    1    0
-c0
-4
-    50    130    15
-    50    130    12
-    40    130    15
-    50    130    15
-f1152 1
-    0    1    0
-c0
-4
-    40    130    15
-    50    130    12
-    40    130    12
-    40    130    15
-f1153 1
-    -0    -1    -0
-c0
-4
-    30    110    15
-    30    110    12
-    40    110    12
-    30    110    15
-f1154 1
-    0    -1    -0
-c0
-4
-    50    110    15
-    40    110    12
-    50    110    12
-    50    110    15
-f1155 1
-    -0    -1    -0
-c0
-4
-    40    110    15
-    30    110    15
-    40    110    12
-    40    110    15
-f1156 1
-    -0    -1    -0
-c0
-4
-    50    110    15
-    40    110    15
-    40    110    12
-    50    110    15
-f1157 1
-    1    0    0
-c0
-4
-    50    130    15
-    50    120    12
-    50    130    12
-    50    130    15
-f1158 1
-    1    -0    -0
-c0
-4
-    50    110    15
-    50    110    12
-    50    120    15
-    50    110    15
-f1159 1
-    1    0    0
-c0
-4
-    50    120    15
-    50    110    12
-    50    120    12
-    50    120    15
-f1160 1
-    1    0    -0
-c0
-4
-    50    130    15
-    50    120    15
-    50    120    12
-    50    130    15
-f1161 1
-    -0    1    -0
-c0
-4
-    30    50    12
-    30    50    15
-    40    50    15
-    30    50    12
-f1162 1
-    0    1    0
-c0
-4
-    30    50    12
-    40    50    15
-    40    50    12
-    30    50    12
-f1163 1
-    0    1    -0
-c0
-4
-    50    50    12
-    40    50    15
-    50    50    15
-    50    50    12
-f1164 1
-    -0    1    -0
-c0
-4
-    40    50    12
-    40    50    15
-    50    50    12
-    40    50    12
-f1165 1
-    1    0    0
-c0
-4
-    50    50    15
-    50    40    12
-    50    50    12
-    50    50    15
-f1166 1
-    1    0    -0
-c0
-4
-    50    40    15
-    50    30    15
-    50    30    12
-    50    40    15
-f1167 1
-    1    0    0
-c0
-4
-    50    40    15
-    50    30    12
-    50    40    12
-    50    40    15
-f1168 1
-    1    -0    -0
-c0
-4
-    50    40    15
-    50    40    12
-    50    50    15
-    50    40    15
-f1169 1
-    -1    0    0
-c0
-4
-    30    50    12
-    30    40    15
-    30    50    15
-    30    50    12
-f1170 1
-    -1    -0    -0
-c0
-4
-    30    50    12
-    30    40    12
-    30    40    15
-    30    50    12
-f1171 1
-    -1    -0    -0
-c0
-4
-    30    30    12
-    30    30    15
-    30    40    12
-    30    30    12
-f1172 1
-    -1    0    0
-c0
-4
-    30    40    12
-    30    30    15
-    30    40    15
-    30    40    12
-f1173 1
-    0    -1    -0
-c0
-4
-    50    30    15
-    40    30    12
-    50    30    12
-    50    30    15
-f1174 1
-    -0    -1    -0
-c0
-4
-    30    30    15
-    30    30    12
-    40    30    12
-    30    30    15
-f1175 1
-    0    -1    -0
-c0
-4
-    40    30    15
-    40    30    12
-    50    30    15
-    40    30    15
-f1176 1
-    -0    -1    -0
-c0
-4
-    40    30    15
-    30    30    15
-    40    30    12
-    40    30    15
-f1177 1
-    0    1    0
-c0
-4
-    80    90    15
-    90    90    18
-    90    90    15
-    80    90    15
-f1178 1
-    -0    1    -0
-c0
-4
-    70    90    15
-    70    90    18
-    80    90    15
-    70    90    15
-f1179 1
-    0    1    -0
-c0
-4
-    80    90    15
-    70    90    18
-    80    90    18
-    80    90    15
-f1180 1
-    -0    1    -0
-c0
-4
-    80    90    15
-    80    90    18
-    90    90    18
-    80    90    15
-f1181 1
-    1    0    0
-c0
-4
-    90    90    18
-    90    80    18
-    90    90    15
-    90    90    18
-f1182 1
-    1    -0    -0
-c0
-4
-    90    80    18
-    90    80    15
-    90    90    15
-    90    80    18
-f1183 1
-    1    -0    -0
-c0
-4
-    90    70    18
-    90    70    15
-    90    80    15
-    90    70    18
-f1184 1
-    1    -0    0
-c0
-4
-    90    70    18
-    90    80    15
-    90    80    18
-    90    70    18
-f1185 1
-    -1    0    0
-c0
-4
-    70    80    15
-    70    90    18
-    70    90    15
-    70    80    15
-f1186 1
-    -1    -0    -0
-c0
-4
-    70    70    15
-    70    70    18
-    70    80    18
-    70    70    15
-f1187 1
-    -1    0    0
-c0
-4
-    70    80    15
-    70    70    15
-    70    80    18
-    70    80    15
-f1188 1
-    -1    -0    -0
-c0
-4
-    70    80    15
-    70    80    18
-    70    90    18
-    70    80    15
-f1189 1
-    -0    -1    -0
-c0
-4
-    90    70    18
-    80    70    18
-    90    70    15
-    90    70    18
-f1190 1
-    -0    -1    -0
-c0
-4
-    80    70    18
-    80    70    15
-    90    70    15
-    80    70    18
-f1191 1
-    -0    -1    -0
-c0
-4
-    70    70    18
-    70    70    15
-    80    70    15
-    70    70    18
-f1192 1
-    -0    -1    -0
-c0
-4
-    80    70    18
-    70    70    18
-    80    70    15
-    80    70    18
-f1193 1
-    1    0    0
-c0
-4
-    90    50    18
-    90    40    15
-    90    50    15
-    90    50    18
-f1194 1
-    1    -0    -0
-c0
-4
-    90    30    18
-    90    30    15
-    90    40    15
-    90    30    18
-f1195 1
-    1    -0    -0
-c0
-4
-    90    40    18
-    90    40    15
-    90    50    18
-    90    40    18
-f1196 1
-    1    0    0
-c0
-4
-    90    40    18
-    90    30    18
-    90    40    15
-    90    40    18
-f1197 1
-    0    1    -0
-c0
-4
-    90    50    15
-    80    50    18
-    90    50    18
-    90    50    15
-f1198 1
-    -0    1    -0
-c0
-4
-    80    50    15
-    80    50    18
-    90    50    15
-    80    50    15
-f1199 1
-    -0    1    -0
-c0
-4
-    70    50    15
-    70    50    18
-    80    50    15
-    70    50    15
-f1200 1
-    0    1    -0
-c0
-4
-    80    50    15
-    70    50    18
-    80    50    18
-    80    50    15
-f1201 1
-    0    -1    -0
-c0
-4
-    90    30    18
-    80    30    15
-    90    30    15
-    90    30    18
-f1202 1
-    -0    -1    -0
-c0
-4
-    80    30    18
-    70    30    18
-    70    30    15
-    80    30    18
-f1203 1
-    0    -1    -0
-c0
-4
-    80    30    18
-    70    30    15
-    80    30    15
-    80    30    18
-f1204 1
-    -0    -1    -0
-c0
-4
-    90    30    18
-    80    30    18
-    80    30    15
-    90    30    18
-f1205 1
-    -1    0    0
-c0
-4
-    70    50    15
-    70    40    18
-    70    50    18
-    70    50    15
-f1206 1
-    -1    -0    -0
-c0
-4
-    70    50    15
-    70    40    15
-    70    40    18
-    70    50    15
-f1207 1
-    -1    -0    -0
-c0
-4
-    70    40    15
-    70    30    15
-    70    30    18
-    70    40    15
-f1208 1
-    -1    0    0
-c0
-4
-    70    40    15
-    70    30    18
-    70    40    18
-    70    40    15
-f1209 1
-    1    -0    0
-c0
-4
-    130    40    18
-    130    50    15
-    130    50    18
-    130    40    18
-f1210 1
-    1    -0    -0
-c0
-4
-    130    40    18
-    130    40    15
-    130    50    15
-    130    40    18
-f1211 1
-    1    -0    -0
-c0
-4
-    130    30    18
-    130    30    15
-    130    40    15
-    130    30    18
-f1212 1
-    1    -0    0
-c0
-4
-    130    30    18
-    130    40    15
-    130    40    18
-    130    30    18
-f1213 1
-    0    1    0
-c0
-4
-    120    50    15
-    130    50    18
-    130    50    15
-    120    50    15
-f1214 1
-    -0    1    -0
-c0
-4
-    120    50    15
-    110    50    15
-    110    50    18
-    120    50    15
-f1215 1
-    -0    1    -0
-c0
-4
-    120    50    15
-    120    50    18
-    130    50    18
-    120    50    15
-f1216 1
-    0    1    -0
-c0
-4
-    120    50    15
-    110    50    18
-    120    50    18
-    120    50    15
-f1217 1
-    0    -1    -0
-c0
-4
-    130    30    18
-    120    30    15
-    130    30    15
-    130    30    18
-f1218 1
-    -0    -1    -0
-c0
-4
-    110    30    18
-    110    30    15
-    120    30    15
-    110    30    18
-f1219 1
-    0    -1    -0
-c0
-4
-    120    30    18
-    120    30    15
-    130    30    18
-    120    30    18
-f1220 1
-    -0    -1    -0
-c0
-4
-    120    30    18
-    110    30    18
-    120    30    15
-    120    30    18
-f1221 1
-    -1    0    0
-c0
-4
-    110    40    15
-    110    50    18
-    110    50    15
-    110    40    15
-f1222 1
-    -1    -0    -0
-c0
-4
-    110    30    15
-    110    30    18
-    110    40    18
-    110    30    15
-f1223 1
-    -1    0    0
-c0
-4
-    110    40    15
-    110    30    15
-    110    40    18
-    110    40    15
-f1224 1
-    -1    -0    -0
-c0
-4
-    110    40    15
-    110    40    18
-    110    50    18
-    110    40    15
-f1225 1
-    -1    -0    -0
-c0
-4
-    110    70    15
-    110    70    18
-    110    80    18
-    110    70    15
-f1226 1
-    -1    0    0
-c0
-4
-    110    80    15
-    110    70    15
-    110    80    18
-    110    80    15
-f1227 1
-    -1    0    0
-c0
-4
-    110    80    15
-    110    90    18
-    110    90    15
-    110    80    15
-f1228 1
-    -1    -0    -0
-c0
-4
-    110    80    15
-    110    80    18
-    110    90    18
-    110    80    15
-f1229 1
-    -0    1    0
-c0
-4
-    110    90    18
-    120    90    18
-    110    90    15
-    110    90    18
-f1230 1
-    -0    1    0
-c0
-4
-    120    90    18
-    120    90    15
-    110    90    15
-    120    90    18
-f1231 1
-    -0    1    0
-c0
-4
-    130    90    18
-    130    90    15
-    120    90    15
-    130    90    18
-f1232 1
-    0    1    0
-c0
-4
-    130    90    18
-    120    90    15
-    120    90    18
-    130    90    18
-f1233 1
-    -0    -1    -0
-c0
-4
-    110    70    18
-    110    70    15
-    120    70    15
-    110    70    18
-f1234 1
-    0    -1    0
-c0
-4
-    120    70    18
-    130    70    15
-    130    70    18
-    120    70    18
-f1235 1
-    -0    -1    -0
-c0
-4
-    120    70    18
-    120    70    15
-    130    70    15
-    120    70    18
-f1236 1
-    -0    -1    -0
-c0
-4
-    120    70    18
-    110    70    18
-    120    70    15
-    120    70    18
-f1237 1
-    1    0    0
-c0
-4
-    130    90    18
-    130    80    18
-    130    90    15
-    130    90    18
-f1238 1
-    1    -0    -0
-c0
-4
-    130    80    18
-    130    80    15
-    130    90    15
-    130    80    18
-f1239 1
-    1    -0    -0
-c0
-4
-    130    70    18
-    130    70    15
-    130    80    15
-    130    70    18
-f1240 1
-    1    0    0
-c0
-4
-    130    80    18
-    130    70    18
-    130    80    15
-    130    80    18
-f1241 1
-    -0    1    -0
-c0
-4
-    70    130    15
-    70    130    18
-    80    130    18
-    70    130    15
-f1242 1
-    0    1    0
-c0
-4
-    70    130    15
-    80    130    18
-    80    130    15
-    70    130    15
-f1243 1
-    0    1    -0
-c0
-4
-    90    130    15
-    80    130    15
-    90    130    18
-    90    130    15
-f1244 1
-    -0    1    -0
-c0
-4
-    80    130    15
-    80    130    18
-    90    130    18
-    80    130    15
-f1245 1
-    1    0    0
-c0
-4
-    90    130    18
-    90    120    15
-    90    130    15
-    90    130    18
-f1246 1
-    1    0    -0
-c0
-4
-    90    120    18
-    90    110    18
-    90    110    15
-    90    120    18
-f1247 1
-    1    0    0
-c0
-4
-    90    120    18
-    90    110    15
-    90    120    15
-    90    120    18
-f1248 1
-    1    -0    -0
-c0
-4
-    90    120    18
-    90    120    15
-    90    130    18
-    90    120    18
-f1249 1
-    -1    0    0
-c0
-4
-    70    130    15
-    70    120    15
-    70    130    18
-    70    130    15
-f1250 1
-    -1    -0    -0
-c0
-4
-    70    110    15
-    70    110    18
-    70    120    18
-    70    110    15
-f1251 1
-    -1    0    0
-c0
-4
-    70    110    15
-    70    120    18
-    70    120    15
-    70    110    15
-f1252 1
-    -1    -0    -0
-c0
-4
-    70    120    15
-    70    120    18
-    70    130    18
-    70    120    15
-f1253 1
-    0    -1    -0
-c0
-4
-    90    110    18
-    80    110    15
-    90    110    15
-    90    110    18
-f1254 1
-    -0    -1    -0
-c0
-4
-    70    110    18
-    70    110    15
-    80    110    15
-    70    110    18
-f1255 1
-    0    -1    -0
-c0
-4
-    80    110    18
-    80    110    15
-    90    110    18
-    80    110    18
-f1256 1
-    -0    -1    -0
-c0
-4
-    80    110    18
-    70    110    18
-    80    110    15
-    80    110    18
-f1257 1
-    -0    1    -0
-c0
-4
-    110    130    15
-    110    130    18
-    120    130    18
-    110    130    15
-f1258 1
-    0    1    -0
-c0
-4
-    120    130    15
-    110    130    15
-    120    130    18
-    120    130    15
-f1259 1
-    0    1    0
-c0
-4
-    120    130    15
-    130    130    18
-    130    130    15
-    120    130    15
-f1260 1
-    -0    1    -0
-c0
-4
-    120    130    15
-    120    130    18
-    130    130    18
-    120    130    15
-f1261 1
-    -1    0    0
-c0
-4
-    110    130    15
-    110    120    18
-    110    130    18
-    110    130    15
-f1262 1
-    -1    -0    -0
-c0
-4
-    110    130    15
-    110    120    15
-    110    120    18
-    110    130    15
-f1263 1
-    -1    -0    -0
-c0
-4
-    110    110    15
-    110    110    18
-    110    120    15
-    110    110    15
-f1264 1
-    -1    0    0
-c0
-4
-    110    120    15
-    110    110    18
-    110    120    18
-    110    120    15
-f1265 1
-    0    -1    -0
-c0
-4
-    110    110    18
-    110    110    15
-    120    110    18
-    110    110    18
-f1266 1
-    0    -1    -0
-c0
-4
-    120    110    18
-    110    110    15
-    120    110    15
-    120    110    18
-f1267 1
-    0    -1    -0
-c0
-4
-    130    110    18
-    120    110    15
-    130    110    15
-    130    110    18
-f1268 1
-    -0    -1    -0
-c0
-4
-    130    110    18
-    120    110    18
-    120    110    15
-    130    110    18
-f1269 1
-    1    0    0
-c0
-4
-    130    130    18
-    130    120    18
-    130    130    15
-    130    130    18
-f1270 1
-    1    -0    -0
-c0
-4
-    130    120    18
-    130    120    15
-    130    130    15
-    130    120    18
-f1271 1
-    1    -0    -0
-c0
-4
-    130    110    18
-    130    110    15
-    130    120    15
-    130    110    18
-f1272 1
-    1    -0    0
-c0
-4
-    130    110    18
-    130    120    15
-    130    120    18
-    130    110    18
-f1273 1
-    -0    1    -0
-c0
-4
-    30    90    15
-    30    90    18
-    40    90    18
-    30    90    15
-f1274 1
-    0    1    -0
-c0
-4
-    40    90    15
-    30    90    15
-    40    90    18
-    40    90    15
-f1275 1
-    0    1    -0
-c0
-4
-    50    90    15
-    40    90    15
-    50    90    18
-    50    90    15
-f1276 1
-    -0    1    -0
-c0
-4
-    40    90    15
-    40    90    18
-    50    90    18
-    40    90    15
-f1277 1
-    1    0    0
-c0
-4
-    50    90    18
-    50    80    18
-    50    90    15
-    50    90    18
-f1278 1
-    1    -0    -0
-c0
-4
-    50    80    18
-    50    80    15
-    50    90    15
-    50    80    18
-f1279 1
-    1    -0    -0
-c0
-4
-    50    70    18
-    50    70    15
-    50    80    15
-    50    70    18
-f1280 1
-    1    -0    0
-c0
-4
-    50    70    18
-    50    80    15
-    50    80    18
-    50    70    18
-f1281 1
-    -1    0    0
-c0
-4
-    30    90    15
-    30    80    18
-    30    90    18
-    30    90    15
-f1282 1
-    -1    -0    -0
-c0
-4
-    30    90    15
-    30    80    15
-    30    80    18
-    30    90    15
-f1283 1
-    -1    -0    -0
-c0
-4
-    30    70    15
-    30    70    18
-    30    80    15
-    30    70    15
-f1284 1
-    -1    0    0
-c0
-4
-    30    80    15
-    30    70    18
-    30    80    18
-    30    80    15
-f1285 1
-    -0    -1    -0
-c0
-4
-    50    70    18
-    40    70    18
-    50    70    15
-    50    70    18
-f1286 1
-    -0    -1    -0
-c0
-4
-    40    70    18
-    40    70    15
-    50    70    15
-    40    70    18
-f1287 1
-    -0    -1    -0
-c0
-4
-    40    70    18
-    30    70    18
-    30    70    15
-    40    70    18
-f1288 1
-    0    -1    -0
-c0
-4
-    40    70    18
-    30    70    15
-    40    70    15
-    40    70    18
-f1289 1
-    -1    -0    -0
-c0
-4
-    30    110    15
-    30    110    18
-    30    120    18
-    30    110    15
-f1290 1
-    -1    0    0
-c0
-4
-    30    110    15
-    30    120    18
-    30    120    15
-    30    110    15
-f1291 1
-    -1    0    0
-c0
-4
-    30    130    15
-    30    120    15
-    30    130    18
-    30    130    15
-f1292 1
-    -1    -0    -0
-c0
-4
-    30    120    15
-    30    120    18
-    30    130    18
-    30    120    15
-f1293 1
-    -0    1    -0
-c0
-4
-    40    130    15
-    30    130    15
-    30    130    18
-    40    130    15
-f1294 1
-    0    1    -0
-c0
-4
-    50    130    15
-    40    130    18
-    50    130    18
-    50    130    15
-f1295 1
-    -0    1    -0
-c0
-4
-    50    130    15
-    40    130    15
-    40    130    18
-    50    130    15
-f1296 1
-    0    1    -0
-c0
-4
-    40    130    15
-    30    130    18
-    40    130    18
-    40    130    15
-f1297 1
-    0    -1    0
-c0
-4
-    40    110    15
-    30    110    18
-    30    110    15
-    40    110    15
-f1298 1
-    -0    -1    0
-c0
-4
-    50    110    15
-    50    110    18
-    40    110    18
-    50    110    15
-f1299 1
-    0    -1    0
-c0
-4
-    40    110    15
-    50    110    15
-    40    110    18
-    40    110    15
-f1300 1
-    -0    -1    0
-c0
-4
-    40    110    15
-    40    110    18
-    30    110    18
-    40    110    15
-f1301 1
-    1    -0    -0
-c0
-4
-    50    130    15
-    50    130    18
-    50    120    15
-    50    130    15
-f1302 1
-    1    0    0
-c0
-4
-    50    120    15
-    50    110    18
-    50    110    15
-    50    120    15
-f1303 1
-    1    0    0
-c0
-4
-    50    120    15
-    50    130    18
-    50    120    18
-    50    120    15
-f1304 1
-    1    -0    -0
-c0
-4
-    50    120    15
-    50    120    18
-    50    110    18
-    50    120    15
-f1305 1
-    -0    1    -0
-c0
-4
-    40    50    15
-    30    50    15
-    30    50    18
-    40    50    15
-f1306 1
-    0    1    -0
-c0
-4
-    50    50    15
-    40    50    18
-    50    50    18
-    50    50    15
-f1307 1
-    -0    1    -0
-c0
-4
-    40    50    15
-    40    50    18
-    50    50    15
-    40    50    15
-f1308 1
-    0    1    -0
-c0
-4
-    40    50    15
-    30    50    18
-    40    50    18
-    40    50    15
-f1309 1
-    1    -0    -0
-c0
-4
-    50    50    15
-    50    50    18
-    50    40    18
-    50    50    15
-f1310 1
-    1    0    0
-c0
-4
-    50    40    15
-    50    50    15
-    50    40    18
-    50    40    15
-f1311 1
-    1    0    0
-c0
-4
-    50    30    15
-    50    40    15
-    50    30    18
-    50    30    15
-f1312 1
-    1    -0    -0
-c0
-4
-    50    40    15
-    50    40    18
-    50    30    18
-    50    40    15
-f1313 1
-    -1    0    0
-c0
-4
-    30    50    15
-    30    40    18
-    30    50    18
-    30    50    15
-f1314 1
-    -1    -0    -0
-c0
-4
-    30    50    15
-    30    40    15
-    30    40    18
-    30    50    15
-f1315 1
-    -1    -0    -0
-c0
-4
-    30    30    15
-    30    30    18
-    30    40    15
-    30    30    15
-f1316 1
-    -1    0    0
-c0
-4
-    30    40    15
-    30    30    18
-    30    40    18
-    30    40    15
-f1317 1
-    0    -1    0
-c0
-4
-    40    30    18
-    50    30    15
-    50    30    18
-    40    30    18
-f1318 1
-    -0    -1    -0
-c0
-4
-    40    30    18
-    40    30    15
-    50    30    15
-    40    30    18
-f1319 1
-    -0    -1    -0
-c0
-4
-    30    30    18
-    30    30    15
-    40    30    15
-    30    30    18
-f1320 1
-    -0    -1    -0
-c0
-4
-    40    30    18
-    30    30    18
-    40    30    15
-    40    30    18
-f1321 1
-    -0    1    -0
-c0
-4
-    80    90    18
-    70    90    18
-    70    90    21
-    80    90    18
-f1322 1
-    0    1    -0
-c0
-4
-    90    90    18
-    80    90    21
-    90    90    21
-    90    90    18
-f1323 1
-    -0    1    -0
-c0
-4
-    80    90    18
-    80    90    21
-    90    90    18
-    80    90    18
-f1324 1
-    0    1    -0
-c0
-4
-    80    90    18
-    70    90    21
-    80    90    21
-    80    90    18
-f1325 1
-    1    0    0
-c0
-4
-    90    90    21
-    90    80    21
-    90    90    18
-    90    90    21
-f1326 1
-    1    -0    -0
-c0
-4
-    90    80    21
-    90    80    18
-    90    90    18
-    90    80    21
-f1327 1
-    1    -0    -0
-c0
-4
-    90    70    21
-    90    70    18
-    90    80    18
-    90    70    21
-f1328 1
-    1    -0    0
-c0
-4
-    90    70    21
-    90    80    18
-    90    80    21
-    90    70    21
-f1329 1
-    -1    0    0
-c0
-4
-    70    90    18
-    70    80    21
-    70    90    21
-    70    90    18
-f1330 1
-    -1    -0    -0
-c0
-4
-    70    80    18
-    70    80    21
-    70    90    18
-    70    80    18
-f1331 1
-    -1    -0    -0
-c0
-4
-    70    70    18
-    70    70    21
-    70    80    18
-    70    70    18
-f1332 1
-    -1    0    0
-c0
-4
-    70    80    18
-    70    70    21
-    70    80    21
-    70    80    18
-f1333 1
-    0    -1    0
-c0
-4
-    80    70    21
-    90    70    18
-    90    70    21
-    80    70    21
-f1334 1
-    -0    -1    -0
-c0
-4
-    80    70    21
-    80    70    18
-    90    70    18
-    80    70    21
-f1335 1
-    -0    -1    -0
-c0
-4
-    70    70    21
-    70    70    18
-    80    70    18
-    70    70    21
-f1336 1
-    0    -1    0
-c0
-4
-    70    70    21
-    80    70    18
-    80    70    21
-    70    70    21
-f1337 1
-    1    0    0
-c0
-4
-    90    50    21
-    90    40    21
-    90    50    18
-    90    50    21
-f1338 1
-    1    -0    -0
-c0
-4
-    90    40    21
-    90    40    18
-    90    50    18
-    90    40    21
-f1339 1
-    1    -0    -0
-c0
-4
-    90    30    21
-    90    30    18
-    90    40    18
-    90    30    21
-f1340 1
-    1    0    0
-c0
-4
-    90    40    21
-    90    30    21
-    90    40    18
-    90    40    21
-f1341 1
-    0    1    -0
-c0
-4
-    90    50    18
-    80    50    18
-    90    50    21
-    90    50    18
-f1342 1
-    -0    1    -0
-c0
-4
-    70    50    18
-    70    50    21
-    80    50    21
-    70    50    18
-f1343 1
-    0    1    -0
-c0
-4
-    80    50    18
-    70    50    18
-    80    50    21
-    80    50    18
-f1344 1
-    -0    1    -0
-c0
-4
-    80    50    18
-    80    50    21
-    90    50    21
-    80    50    18
-f1345 1
-    -0    -1    0
-c0
-4
-    90    30    18
-    90    30    21
-    80    30    21
-    90    30    18
-f1346 1
-    0    -1    0
-c0
-4
-    90    30    18
-    80    30    21
-    80    30    18
-    90    30    18
-f1347 1
-    0    -1    0
-c0
-4
-    70    30    18
-    80    30    18
-    70    30    21
-    70    30    18
-f1348 1
-    -0    -1    0
-c0
-4
-    80    30    18
-    80    30    21
-    70    30    21
-    80    30    18
-f1349 1
-    -1    0    -0
-c0
-4
-    70    40    21
-    70    50    21
-    70    50    18
-    70    40    21
-f1350 1
-    -1    0    0
-c0
-4
-    70    40    21
-    70    50    18
-    70    40    18
-    70    40    21
-f1351 1
-    -1    -0    0
-c0
-4
-    70    40    21
-    70    30    18
-    70    30    21
-    70    40    21
-f1352 1
-    -1    -0    -0
-c0
-4
-    70    40    21
-    70    40    18
-    70    30    18
-    70    40    21
-f1353 1
-    1    -0    -0
-c0
-4
-    130    50    18
-    130    50    21
-    130    40    18
-    130    50    18
-f1354 1
-    1    0    0
-c0
-4
-    130    40    18
-    130    30    21
-    130    30    18
-    130    40    18
-f1355 1
-    1    0    0
-c0
-4
-    130    40    18
-    130    50    21
-    130    40    21
-    130    40    18
-f1356 1
-    1    -0    -0
-c0
-4
-    130    40    18
-    130    40    21
-    130    30    21
-    130    40    18
-f1357 1
-    0    1    -0
-c0
-4
-    130    50    18
-    120    50    18
-    130    50    21
-    130    50    18
-f1358 1
-    -0    1    -0
-c0
-4
-    110    50    18
-    110    50    21
-    120    50    21
-    110    50    18
-f1359 1
-    0    1    -0
-c0
-4
-    120    50    18
-    110    50    18
-    120    50    21
-    120    50    18
-f1360 1
-    -0    1    -0
-c0
-4
-    120    50    18
-    120    50    21
-    130    50    21
-    120    50    18
-f1361 1
-    -0    -1    0
-c0
-4
-    130    30    18
-    130    30    21
-    120    30    18
-    130    30    18
-f1362 1
-    0    -1    0
-c0
-4
-    110    30    18
-    120    30    21
-    110    30    21
-    110    30    18
-f1363 1
-    -0    -1    -0
-c0
-4
-    110    30    18
-    120    30    18
-    120    30    21
-    110    30    18
-f1364 1
-    0    -1    0
-c0
-4
-    120    30    18
-    130    30    21
-    120    30    21
-    120    30    18
-f1365 1
-    -1    0    0
-c0
-4
-    110    50    18
-    110    40    21
-    110    50    21
-    110    50    18
-f1366 1
-    -1    -0    -0
-c0
-4
-    110    40    18
-    110    40    21
-    110    50    18
-    110    40    18
-f1367 1
-    -1    -0    -0
-c0
-4
-    110    30    18
-    110    30    21
-    110    40    18
-    110    30    18
-f1368 1
-    -1    0    0
-c0
-4
-    110    40    18
-    110    30    21
-    110    40    21
-    110    40    18
-f1369 1
-    -1    -0    -0
-c0
-4
-    110    70    18
-    110    70    21
-    110    80    18
-    110    70    18
-f1370 1
-    -1    0    0
-c0
-4
-    110    90    18
-    110    80    21
-    110    90    21
-    110    90    18
-f1371 1
-    -1    -0    -0
-c0
-4
-    110    90    18
-    110    80    18
-    110    80    21
-    110    90    18
-f1372 1
-    -1    0    0
-c0
-4
-    110    80    18
-    110    70    21
-    110    80    21
-    110    80    18
-f1373 1
-    -0    1    -0
-c0
-4
-    110    90    18
-    110    90    21
-    120    90    21
-    110    90    18
-f1374 1
-    0    1    0
-c0
-4
-    110    90    18
-    120    90    21
-    120    90    18
-    110    90    18
-f1375 1
-    0    1    -0
-c0
-4
-    130    90    18
-    120    90    18
-    130    90    21
-    130    90    18
-f1376 1
-    -0    1    -0
-c0
-4
-    120    90    18
-    120    90    21
-    130    90    21
-    120    90    18
-f1377 1
-    0    -1    -0
-c0
-4
-    110    70    21
-    110    70    18
-    120    70    21
-    110    70    21
-f1378 1
-    0    -1    -0
-c0
-4
-    120    70    21
-    110    70    18
-    120    70    18
-    120    70    21
-f1379 1
-    0    -1    0
-c0
-4
-    120    70    21
-    130    70    18
-    130    70    21
-    120    70    21
-f1380 1
-    -0    -1    -0
-c0
-4
-    120    70    21
-    120    70    18
-    130    70    18
-    120    70    21
-f1381 1
-    1    -0    -0
-c0
-4
-    130    90    18
-    130    90    21
-    130    80    21
-    130    90    18
-f1382 1
-    1    0    0
-c0
-4
-    130    90    18
-    130    80    21
-    130    80    18
-    130    90    18
-f1383 1
-    1    0    0
-c0
-4
-    130    70    18
-    130    80    18
-    130    70    21
-    130    70    18
-f1384 1
-    1    -0    -0
-c0
-4
-    130    80    18
-    130    80    21
-    130    70    21
-    130    80    18
-f1385 1
-    0    1    0
-c0
-4
-    80    130    21
-    70    130    18
-    70    130    21
-    80    130    21
-f1386 1
-    -0    1    0
-c0
-4
-    80    130    21
-    80    130    18
-    70    130    18
-    80    130    21
-f1387 1
-    -0    1    0
-c0
-4
-    90    130    21
-    90    130    18
-    80    130    18
-    90    130    21
-f1388 1
-    -0    1    0
-c0
-4
-    80    130    21
-    90    130    21
-    80    130    18
-    80    130    21
-f1389 1
-    1    0    0
-c0
-4
-    90    130    21
-    90    120    18
-    90    130    18
-    90    130    21
-f1390 1
-    1    -0    -0
-c0
-4
-    90    110    21
-    90    110    18
-    90    120    18
-    90    110    21
-f1391 1
-    1    -0    -0
-c0
-4
-    90    120    21
-    90    120    18
-    90    130    21
-    90    120    21
-f1392 1
-    1    -0    0
-c0
-4
-    90    110    21
-    90    120    18
-    90    120    21
-    90    110    21
-f1393 1
-    -1    0    0
-c0
-4
-    70    120    18
-    70    130    21
-    70    130    18
-    70    120    18
-f1394 1
-    -1    -0    -0
-c0
-4
-    70    110    18
-    70    110    21
-    70    120    21
-    70    110    18
-f1395 1
-    -1    0    0
-c0
-4
-    70    120    18
-    70    110    18
-    70    120    21
-    70    120    18
-f1396 1
-    -1    -0    -0
-c0
-4
-    70    120    18
-    70    120    21
-    70    130    21
-    70    120    18
-f1397 1
-    0    -1    0
-c0
-4
-    80    110    21
-    90    110    18
-    90    110    21
-    80    110    21
-f1398 1
-    -0    -1    -0
-c0
-4
-    80    110    21
-    80    110    18
-    90    110    18
-    80    110    21
-f1399 1
-    -0    -1    -0
-c0
-4
-    70    110    21
-    70    110    18
-    80    110    18
-    70    110    21
-f1400 1
-    -0    -1    -0
-c0
-4
-    80    110    21
-    70    110    21
-    80    110    18
-    80    110    21
-f1401 1
-    0    1    0
-c0
-4
-    110    130    21
-    120    130    18
-    110    130    18
-    110    130    21
-f1402 1
-    -0    1    -0
-c0
-4
-    120    130    21
-    130    130    21
-    130    130    18
-    120    130    21
-f1403 1
-    0    1    0
-c0
-4
-    120    130    21
-    130    130    18
-    120    130    18
-    120    130    21
-f1404 1
-    -0    1    -0
-c0
-4
-    110    130    21
-    120    130    21
-    120    130    18
-    110    130    21
-f1405 1
-    -1    0    0
-c0
-4
-    110    120    18
-    110    130    21
-    110    130    18
-    110    120    18
-f1406 1
-    -1    -0    -0
-c0
-4
-    110    110    18
-    110    110    21
-    110    120    18
-    110    110    18
-f1407 1
-    -1    -0    -0
-c0
-4
-    110    120    18
-    110    120    21
-    110    130    21
-    110    120    18
-f1408 1
-    -1    0    0
-c0
-4
-    110    120    18
-    110    110    21
-    110    120    21
-    110    120    18
-f1409 1
-    0    -1    0
-c0
-4
-    110    110    18
-    120    110    18
-    110    110    21
-    110    110    18
-f1410 1
-    -0    -1    0
-c0
-4
-    130    110    18
-    130    110    21
-    120    110    21
-    130    110    18
-f1411 1
-    0    -1    0
-c0
-4
-    130    110    18
-    120    110    21
-    120    110    18
-    130    110    18
-f1412 1
-    -0    -1    0
-c0
-4
-    120    110    18
-    120    110    21
-    110    110    21
-    120    110    18
-f1413 1
-    1    -0    0
-c0
-4
-    130    120    21
-    130    130    18
-    130    130    21
-    130    120    21
-f1414 1
-    1    -0    -0
-c0
-4
-    130    120    21
-    130    120    18
-    130    130    18
-    130    120    21
-f1415 1
-    1    -0    -0
-c0
-4
-    130    110    21
-    130    110    18
-    130    120    18
-    130    110    21
-f1416 1
-    1    0    0
-c0
-4
-    130    120    21
-    130    110    21
-    130    120    18
-    130    120    21
-f1417 1
-    -0    1    -0
-c0
-4
-    30    90    18
-    30    90    21
-    40    90    18
-    30    90    18
-f1418 1
-    0    1    -0
-c0
-4
-    50    90    18
-    40    90    21
-    50    90    21
-    50    90    18
-f1419 1
-    -0    1    -0
-c0
-4
-    50    90    18
-    40    90    18
-    40    90    21
-    50    90    18
-f1420 1
-    0    1    -0
-c0
-4
-    40    90    18
-    30    90    21
-    40    90    21
-    40    90    18
-f1421 1
-    1    -0    0
-c0
-4
-    50    80    21
-    50    90    18
-    50    90    21
-    50    80    21
-f1422 1
-    1    -0    -0
-c0
-4
-    50    80    21
-    50    80    18
-    50    90    18
-    50    80    21
-f1423 1
-    1    0    -0
-c0
-4
-    50    80    21
-    50    70    21
-    50    70    18
-    50    80    21
-f1424 1
-    1    0    0
-c0
-4
-    50    80    21
-    50    70    18
-    50    80    18
-    50    80    21
-f1425 1
-    -1    0    0
-c0
-4
-    30    80    18
-    30    90    21
-    30    90    18
-    30    80    18
-f1426 1
-    -1    -0    -0
-c0
-4
-    30    70    18
-    30    70    21
-    30    80    21
-    30    70    18
-f1427 1
-    -1    0    0
-c0
-4
-    30    80    18
-    30    70    18
-    30    80    21
-    30    80    18
-f1428 1
-    -1    -0    -0
-c0
-4
-    30    80    18
-    30    80    21
-    30    90    21
-    30    80    18
-f1429 1
-    -0    -1    0
-c0
-4
-    50    70    18
-    50    70    21
-    40    70    21
-    50    70    18
-f1430 1
-    0    -1    0
-c0
-4
-    40    70    18
-    50    70    18
-    40    70    21
-    40    70    18
-f1431 1
-    0    -1    0
-c0
-4
-    30    70    18
-    40    70    21
-    30    70    21
-    30    70    18
-f1432 1
-    -0    -1    0
-c0
-4
-    40    70    18
-    40    70    21
-    30    70    18
-    40    70    18
-f1433 1
-    -1    -0    -0
-c0
-4
-    30    110    18
-    30    110    21
-    30    120    21
-    30    110    18
-f1434 1
-    -1    0    0
-c0
-4
-    30    110    18
-    30    120    21
-    30    120    18
-    30    110    18
-f1435 1
-    -1    0    0
-c0
-4
-    30    120    18
-    30    130    21
-    30    130    18
-    30    120    18
-f1436 1
-    -1    -0    -0
-c0
-4
-    30    120    18
-    30    120    21
-    30    130    21
-    30    120    18
-f1437 1
-    -0    1    -0
-c0
-4
-    40    130    18
-    30    130    18
-    30    130    21
-    40    130    18
-f1438 1
-    0    1    -0
-c0
-4
-    50    130    18
-    40    130    21
-    50    130    21
-    50    130    18
-f1439 1
-    -0    1    -0
-c0
-4
-    50    130    18
-    40    130    18
-    40    130    21
-    50    130    18
-f1440 1
-    0    1    -0
-c0
-4
-    40    130    18
-    30    130    21
-    40    130    21
-    40    130    18
-f1441 1
-    -0    -1    -0
-c0
-4
-    40    110    21
-    30    110    21
-    30    110    18
-    40    110    21
-f1442 1
-    0    -1    -0
-c0
-4
-    40    110    21
-    30    110    18
-    40    110    18
-    40    110    21
-f1443 1
-    0    -1    -0
-c0
-4
-    50    110    21
-    40    110    18
-    50    110    18
-    50    110    21
-f1444 1
-    -0    -1    -0
-c0
-4
-    50    110    21
-    40    110    21
-    40    110    18
-    50    110    21
-f1445 1
-    1    0    0
-c0
-4
-    50    130    21
-    50    120    18
-    50    130    18
-    50    130    21
-f1446 1
-    1    -0    -0
-c0
-4
-    50    110    21
-    50    110    18
-    50    120    21
-    50    110    21
-f1447 1
-    1    0    0
-c0
-4
-    50    120    21
-    50    110    18
-    50    120    18
-    50    120    21
-f1448 1
-    1    -0    -0
-c0
-4
-    50    120    21
-    50    120    18
-    50    130    21
-    50    120    21
-f1449 1
-    -0    1    -0
-c0
-4
-    30    50    18
-    30    50    21
-    40    50    21
-    30    50    18
-f1450 1
-    0    1    -0
-c0
-4
-    40    50    18
-    30    50    18
-    40    50    21
-    40    50    18
-f1451 1
-    0    1    -0
-c0
-4
-    50    50    18
-    40    50    18
-    50    50    21
-    50    50    18
-f1452 1
-    -0    1    -0
-c0
-4
-    40    50    18
-    40    50    21
-    50    50    21
-    40    50    18
-f1453 1
-    1    0    0
-c0
-4
-    50    50    21
-    50    40    21
-    50    50    18
-    50    50    21
-f1454 1
-    1    -0    -0
-c0
-4
-    50    40    21
-    50    40    18
-    50    50    18
-    50    40    21
-f1455 1
-    1    -0    -0
-c0
-4
-    50    30    21
-    50    30    18
-    50    40    18
-    50    30    21
-f1456 1
-    1    0    0
-c0
-4
-    50    40    21
-    50    30    21
-    50    40    18
-    50    40    21
-f1457 1
-    -1    0    0
-c0
-4
-    30    40    18
-    30    50    21
-    30    50    18
-    30    40    18
-f1458 1
-    -1    -0    -0
-c0
-4
-    30    40    18
-    30    30    18
-    30    30    21
-    30    40    18
-f1459 1
-    -1    -0    -0
-c0
-4
-    30    40    18
-    30    40    21
-    30    50    21
-    30    40    18
-f1460 1
-    -1    0    0
-c0
-4
-    30    40    18
-    30    30    21
-    30    40    21
-    30    40    18
-f1461 1
-    -0    -1    0
-c0
-4
-    50    30    18
-    50    30    21
-    40    30    21
-    50    30    18
-f1462 1
-    0    -1    0
-c0
-4
-    50    30    18
-    40    30    21
-    40    30    18
-    50    30    18
-f1463 1
-    0    -1    0
-c0
-4
-    30    30    18
-    40    30    18
-    30    30    21
-    30    30    18
-f1464 1
-    -0    -1    0
-c0
-4
-    40    30    18
-    40    30    21
-    30    30    21
-    40    30    18
-f1465 1
-    -0    1    -0
-c0
-4
-    80    90    21
-    70    90    21
-    70    90    24
-    80    90    21
-f1466 1
-    0    1    -0
-c0
-4
-    90    90    21
-    80    90    24
-    90    90    24
-    90    90    21
-f1467 1
-    -0    1    -0
-c0
-4
-    90    90    21
-    80    90    21
-    80    90    24
-    90    90    21
-f1468 1
-    0    1    -0
-c0
-4
-    80    90    21
-    70    90    24
-    80    90    24
-    80    90    21
-f1469 1
-    1    0    0
-c0
-4
-    90    90    24
-    90    80    24
-    90    90    21
-    90    90    24
-f1470 1
-    1    -0    -0
-c0
-4
-    90    80    24
-    90    80    21
-    90    90    21
-    90    80    24
-f1471 1
-    1    -0    -0
-c0
-4
-    90    70    24
-    90    70    21
-    90    80    24
-    90    70    24
-f1472 1
-    1    0    0
-c0
-4
-    90    80    24
-    90    70    21
-    90    80    21
-    90    80    24
-f1473 1
-    -1    0    -0
-c0
-4
-    70    80    24
-    70    90    24
-    70    90    21
-    70    80    24
-f1474 1
-    -1    0    0
-c0
-4
-    70    80    24
-    70    90    21
-    70    80    21
-    70    80    24
-f1475 1
-    -1    0    0
-c0
-4
-    70    70    24
-    70    80    24
-    70    70    21
-    70    70    24
-f1476 1
-    -1    -0    -0
-c0
-4
-    70    80    24
-    70    80    21
-    70    70    21
-    70    80    24
-f1477 1
-    0    -1    -0
-c0
-4
-    90    70    24
-    80    70    21
-    90    70    21
-    90    70    24
-f1478 1
-    0    -1    -0
-c0
-4
-    70    70    24
-    70    70    21
-    80    70    24
-    70    70    24
-f1479 1
-    0    -1    -0
-c0
-4
-    80    70    24
-    70    70    21
-    80    70    21
-    80    70    24
-f1480 1
-    -0    -1    -0
-c0
-4
-    90    70    24
-    80    70    24
-    80    70    21
-    90    70    24
-f1481 1
-    1    0    0
-c0
-4
-    90    50    24
-    90    40    24
-    90    50    21
-    90    50    24
-f1482 1
-    1    -0    -0
-c0
-4
-    90    40    24
-    90    40    21
-    90    50    21
-    90    40    24
-f1483 1
-    1    -0    -0
-c0
-4
-    90    30    24
-    90    30    21
-    90    40    24
-    90    30    24
-f1484 1
-    1    0    0
-c0
-4
-    90    40    24
-    90    30    21
-    90    40    21
-    90    40    24
-f1485 1
-    0    1    -0
-c0
-4
-    90    50    21
-    80    50    21
-    90    50    24
-    90    50    21
-f1486 1
-    -0    1    -0
-c0
-4
-    70    50    21
-    70    50    24
-    80    50    24
-    70    50    21
-f1487 1
-    0    1    -0
-c0
-4
-    80    50    21
-    70    50    21
-    80    50    24
-    80    50    21
-f1488 1
-    -0    1    -0
-c0
-4
-    80    50    21
-    80    50    24
-    90    50    24
-    80    50    21
-f1489 1
-    0    -1    0
-c0
-4
-    80    30    24
-    90    30    21
-    90    30    24
-    80    30    24
-f1490 1
-    -0    -1    -0
-c0
-4
-    80    30    24
-    80    30    21
-    90    30    21
-    80    30    24
-f1491 1
-    -0    -1    -0
-c0
-4
-    70    30    24
-    70    30    21
-    80    30    21
-    70    30    24
-f1492 1
-    0    -1    0
-c0
-4
-    70    30    24
-    80    30    21
-    80    30    24
-    70    30    24
-f1493 1
-    -1    0    0
-c0
-4
-    70    40    21
-    70    50    24
-    70    50    21
-    70    40    21
-f1494 1
-    -1    -0    -0
-c0
-4
-    70    30    21
-    70    30    24
-    70    40    24
-    70    30    21
-f1495 1
-    -1    0    0
-c0
-4
-    70    40    21
-    70    30    21
-    70    40    24
-    70    40    21
-f1496 1
-    -1    -0    -0
-c0
-4
-    70    40    21
-    70    40    24
-    70    50    24
-    70    40    21
-f1497 1
-    1    0    0
-c0
-4
-    130    50    24
-    130    40    21
-    130    50    21
-    130    50    24
-f1498 1
-    1    0    -0
-c0
-4
-    130    40    24
-    130    30    24
-    130    30    21
-    130    40    24
-f1499 1
-    1    0    0
-c0
-4
-    130    40    24
-    130    30    21
-    130    40    21
-    130    40    24
-f1500 1
-    1    -0    -0
-c0
-4
-    130    40    24
-    130    40    21
-    130    50    24
-    130    40    24
-f1501 1
-    0    1    -0
-c0
-4
-    130    50    21
-    120    50    24
-    130    50    24
-    130    50    21
-f1502 1
-    -0    1    -0
-c0
-4
-    120    50    21
-    120    50    24
-    130    50    21
-    120    50    21
-f1503 1
-    -0    1    -0
-c0
-4
-    120    50    21
-    110    50    21
-    110    50    24
-    120    50    21
-f1504 1
-    0    1    -0
-c0
-4
-    120    50    21
-    110    50    24
-    120    50    24
-    120    50    21
-f1505 1
-    0    -1    -0
-c0
-4
-    130    30    24
-    120    30    21
-    130    30    21
-    130    30    24
-f1506 1
-    -0    -1    -0
-c0
-4
-    120    30    24
-    110    30    24
-    110    30    21
-    120    30    24
-f1507 1
-    0    -1    -0
-c0
-4
-    120    30    24
-    110    30    21
-    120    30    21
-    120    30    24
-f1508 1
-    -0    -1    -0
-c0
-4
-    130    30    24
-    120    30    24
-    120    30    21
-    130    30    24
-f1509 1
-    -1    0    0
-c0
-4
-    110    50    21
-    110    40    24
-    110    50    24
-    110    50    21
-f1510 1
-    -1    -0    -0
-c0
-4
-    110    50    21
-    110    40    21
-    110    40    24
-    110    50    21
-f1511 1
-    -1    -0    -0
-c0
-4
-    110    40    21
-    110    30    21
-    110    30    24
-    110    40    21
-f1512 1
-    -1    0    0
-c0
-4
-    110    40    21
-    110    30    24
-    110    40    24
-    110    40    21
-f1513 1
-    -1    -0    -0
-c0
-4
-    110    70    21
-    110    70    24
-    110    80    24
-    110    70    21
-f1514 1
-    -1    0    0
-c0
-4
-    110    70    21
-    110    80    24
-    110    80    21
-    110    70    21
-f1515 1
-    -1    0    0
-c0
-4
-    110    90    21
-    110    80    21
-    110    90    24
-    110    90    21
-f1516 1
-    -1    -0    -0
-c0
-4
-    110    80    21
-    110    80    24
-    110    90    24
-    110    80    21
-f1517 1
-    -0    1    -0
-c0
-4
-    110    90    21
-    110    90    24
-    120    90    21
-    110    90    21
-f1518 1
-    0    1    -0
-c0
-4
-    130    90    21
-    120    90    24
-    130    90    24
-    130    90    21
-f1519 1
-    -0    1    -0
-c0
-4
-    130    90    21
-    120    90    21
-    120    90    24
-    130    90    21
-f1520 1
-    0    1    -0
-c0
-4
-    120    90    21
-    110    90    24
-    120    90    24
-    120    90    21
-f1521 1
-    -0    -1    -0
-c0
-4
-    110    70    24
-    110    70    21
-    120    70    21
-    110    70    24
-f1522 1
-    -0    -1    -0
-c0
-4
-    130    70    24
-    120    70    24
-    130    70    21
-    130    70    24
-f1523 1
-    -0    -1    -0
-c0
-4
-    120    70    24
-    120    70    21
-    130    70    21
-    120    70    24
-f1524 1
-    -0    -1    -0
-c0
-4
-    120    70    24
-    110    70    24
-    120    70    21
-    120    70    24
-f1525 1
-    1    0    0
-c0
-4
-    130    90    24
-    130    80    21
-    130    90    21
-    130    90    24
-f1526 1
-    1    -0    -0
-c0
-4
-    130    70    24
-    130    70    21
-    130    80    24
-    130    70    24
-f1527 1
-    1    0    0
-c0
-4
-    130    80    24
-    130    70    21
-    130    80    21
-    130    80    24
-f1528 1
-    1    -0    -0
-c0
-4
-    130    80    24
-    130    80    21
-    130    90    24
-    130    80    24
-f1529 1
-    -0    1    -0
-c0
-4
-    70    130    21
-    70    130    24
-    80    130    24
-    70    130    21
-f1530 1
-    0    1    -0
-c0
-4
-    80    130    21
-    70    130    21
-    80    130    24
-    80    130    21
-f1531 1
-    0    1    -0
-c0
-4
-    90    130    21
-    80    130    21
-    90    130    24
-    90    130    21
-f1532 1
-    -0    1    -0
-c0
-4
-    80    130    21
-    80    130    24
-    90    130    24
-    80    130    21
-f1533 1
-    1    0    0
-c0
-4
-    90    130    24
-    90    120    21
-    90    130    21
-    90    130    24
-f1534 1
-    1    0    -0
-c0
-4
-    90    120    24
-    90    110    24
-    90    110    21
-    90    120    24
-f1535 1
-    1    0    0
-c0
-4
-    90    120    24
-    90    110    21
-    90    120    21
-    90    120    24
-f1536 1
-    1    -0    -0
-c0
-4
-    90    120    24
-    90    120    21
-    90    130    24
-    90    120    24
-f1537 1
-    -1    0    0
-c0
-4
-    70    130    21
-    70    120    24
-    70    130    24
-    70    130    21
-f1538 1
-    -1    -0    -0
-c0
-4
-    70    120    21
-    70    120    24
-    70    130    21
-    70    120    21
-f1539 1
-    -1    -0    -0
-c0
-4
-    70    120    21
-    70    110    21
-    70    110    24
-    70    120    21
-f1540 1
-    -1    0    0
-c0
-4
-    70    120    21
-    70    110    24
-    70    120    24
-    70    120    21
-f1541 1
-    0    -1    -0
-c0
-4
-    90    110    24
-    80    110    21
-    90    110    21
-    90    110    24
-f1542 1
-    0    -1    -0
-c0
-4
-    70    110    24
-    70    110    21
-    80    110    24
-    70    110    24
-f1543 1
-    0    -1    -0
-c0
-4
-    80    110    24
-    70    110    21
-    80    110    21
-    80    110    24
-f1544 1
-    -0    -1    -0
-c0
-4
-    90    110    24
-    80    110    24
-    80    110    21
-    90    110    24
-f1545 1
-    -0    1    -0
-c0
-4
-    110    130    21
-    110    130    24
-    120    130    24
-    110    130    21
-f1546 1
-    0    1    -0
-c0
-4
-    120    130    21
-    110    130    21
-    120    130    24
-    120    130    21
-f1547 1
-    0    1    0
-c0
-4
-    120    130    21
-    130    130    24
-    130    130    21
-    120    130    21
-f1548 1
-    -0    1    -0
-c0
-4
-    120    130    21
-    120    130    24
-    130    130    24
-    120    130    21
-f1549 1
-    -1    0    0
-c0
-4
-    110    130    21
-    110    120    21
-    110    130    24
-    110    130    21
-f1550 1
-    -1    -0    -0
-c0
-4
-    110    110    21
-    110    110    24
-    110    120    24
-    110    110    21
-f1551 1
-    -1    0    0
-c0
-4
-    110    110    21
-    110    120    24
-    110    120    21
-    110    110    21
-f1552 1
-    -1    -0    -0
-c0
-4
-    110    120    21
-    110    120    24
-    110    130    24
-    110    120    21
-f1553 1
-    -0    -1    -0
-c0
-4
-    120    110    24
-    110    110    24
-    110    110    21
-    120    110    24
-f1554 1
-    0    -1    -0
-c0
-4
-    120    110    24
-    110    110    21
-    120    110    21
-    120    110    24
-f1555 1
-    0    -1    -0
-c0
-4
-    130    110    24
-    120    110    21
-    130    110    21
-    130    110    24
-f1556 1
-    0    -1    -0
-c0
-4
-    120    110    24
-    120    110    21
-    130    110    24
-    120    110    24
-f1557 1
-    1    0    0
-c0
-4
-    130    130    24
-    130    120    21
-    130    130    21
-    130    130    24
-f1558 1
-    1    -0    -0
-c0
-4
-    130    110    24
-    130    110    21
-    130    120    24
-    130    110    24
-f1559 1
-    1    0    0
-c0
-4
-    130    120    24
-    130    110    21
-    130    120    21
-    130    120    24
-f1560 1
-    1    -0    -0
-c0
-4
-    130    120    24
-    130    120    21
-    130    130    24
-    130    120    24
-f1561 1
-    -0    1    -0
-c0
-4
-    30    90    21
-    30    90    24
-    40    90    24
-    30    90    21
-f1562 1
-    0    1    -0
-c0
-4
-    40    90    21
-    30    90    21
-    40    90    24
-    40    90    21
-f1563 1
-    0    1    -0
-c0
-4
-    50    90    21
-    40    90    24
-    50    90    24
-    50    90    21
-f1564 1
-    -0    1    -0
-c0
-4
-    40    90    21
-    40    90    24
-    50    90    21
-    40    90    21
-f1565 1
-    1    0    0
-c0
-4
-    50    90    24
-    50    80    21
-    50    90    21
-    50    90    24
-f1566 1
-    1    0    -0
-c0
-4
-    50    80    24
-    50    70    24
-    50    70    21
-    50    80    24
-f1567 1
-    1    0    0
-c0
-4
-    50    80    24
-    50    70    21
-    50    80    21
-    50    80    24
-f1568 1
-    1    0    -0
-c0
-4
-    50    90    24
-    50    80    24
-    50    80    21
-    50    90    24
-f1569 1
-    -1    0    0
-c0
-4
-    30    80    21
-    30    90    24
-    30    90    21
-    30    80    21
-f1570 1
-    -1    -0    -0
-c0
-4
-    30    80    21
-    30    70    21
-    30    70    24
-    30    80    21
-f1571 1
-    -1    -0    -0
-c0
-4
-    30    80    21
-    30    80    24
-    30    90    24
-    30    80    21
-f1572 1
-    -1    0    0
-c0
-4
-    30    80    21
-    30    70    24
-    30    80    24
-    30    80    21
-f1573 1
-    0    -1    -0
-c0
-4
-    50    70    24
-    40    70    21
-    50    70    21
-    50    70    24
-f1574 1
-    -0    -1    -0
-c0
-4
-    40    70    24
-    30    70    24
-    30    70    21
-    40    70    24
-f1575 1
-    0    -1    -0
-c0
-4
-    40    70    24
-    30    70    21
-    40    70    21
-    40    70    24
-f1576 1
-    0    -1    -0
-c0
-4
-    40    70    24
-    40    70    21
-    50    70    24
-    40    70    24
-f1577 1
-    -0    1    -0
-c0
-4
-    110    130    24
-    110    130    27
-    120    130    27
-    110    130    24
-f1578 1
-    0    1    0
-c0
-4
-    110    130    24
-    120    130    27
-    120    130    24
-    110    130    24
-f1579 1
-    0    1    0
-c0
-4
-    120    130    24
-    130    130    27
-    130    130    24
-    120    130    24
-f1580 1
-    -0    1    -0
-c0
-4
-    120    130    24
-    120    130    27
-    130    130    27
-    120    130    24
-f1581 1
-    -1    0    0
-c0
-4
-    110    130    24
-    110    120    27
-    110    130    27
-    110    130    24
-f1582 1
-    -1    -0    -0
-c0
-4
-    110    120    24
-    110    120    27
-    110    130    24
-    110    120    24
-f1583 1
-    -1    -0    -0
-c0
-4
-    110    110    24
-    110    110    27
-    110    120    27
-    110    110    24
-f1584 1
-    -1    0    0
-c0
-4
-    110    120    24
-    110    110    24
-    110    120    27
-    110    120    24
-f1585 1
-    -0    -1    -0
-c0
-4
-    120    110    27
-    110    110    27
-    110    110    24
-    120    110    27
-f1586 1
-    0    -1    -0
-c0
-4
-    120    110    27
-    110    110    24
-    120    110    24
-    120    110    27
-f1587 1
-    0    -1    -0
-c0
-4
-    130    110    27
-    120    110    24
-    130    110    24
-    130    110    27
-f1588 1
-    0    -1    -0
-c0
-4
-    120    110    27
-    120    110    24
-    130    110    27
-    120    110    27
-f1589 1
-    1    0    0
-c0
-4
-    130    130    27
-    130    120    24
-    130    130    24
-    130    130    27
-f1590 1
-    1    -0    -0
-c0
-4
-    130    110    27
-    130    110    24
-    130    120    24
-    130    110    27
-f1591 1
-    1    0    -0
-c0
-4
-    130    130    27
-    130    120    27
-    130    120    24
-    130    130    27
-f1592 1
-    1    -0    0
-c0
-4
-    130    110    27
-    130    120    24
-    130    120    27
-    130    110    27
-f1593 1
-    -0    1    -0
-c0
-4
-    30    90    24
-    30    90    27
-    40    90    24
-    30    90    24
-f1594 1
-    0    1    -0
-c0
-4
-    50    90    24
-    40    90    24
-    50    90    27
-    50    90    24
-f1595 1
-    0    1    -0
-c0
-4
-    40    90    24
-    30    90    27
-    40    90    27
-    40    90    24
-f1596 1
-    -0    1    -0
-c0
-4
-    40    90    24
-    40    90    27
-    50    90    27
-    40    90    24
-f1597 1
-    1    -0    -0
-c0
-4
-    50    90    24
-    50    90    27
-    50    80    27
-    50    90    24
-f1598 1
-    1    0    0
-c0
-4
-    50    80    24
-    50    90    24
-    50    80    27
-    50    80    24
-f1599 1
-    1    0    0
-c0
-4
-    50    70    24
-    50    80    24
-    50    70    27
-    50    70    24
-f1600 1
-    1    -0    -0
-c0
-4
-    50    80    24
-    50    80    27
-    50    70    27
-    50    80    24
-f1601 1
-    -1    0    0
-c0
-4
-    30    80    24
-    30    90    27
-    30    90    24
-    30    80    24
-f1602 1
-    -1    -0    -0
-c0
-4
-    30    70    24
-    30    70    27
-    30    80    27
-    30    70    24
-f1603 1
-    -1    0    0
-c0
-4
-    30    80    24
-    30    70    24
-    30    80    27
-    30    80    24
-f1604 1
-    -1    -0    -0
-c0
-4
-    30    80    24
-    30    80    27
-    30    90    27
-    30    80    24
-f1605 1
-    -0    -1    0
-c0
-4
-    50    70    24
-    50    70    27
-    40    70    27
-    50    70    24
-f1606 1
-    0    -1    0
-c0
-4
-    50    70    24
-    40    70    27
-    40    70    24
-    50    70    24
-f1607 1
-    0    -1    0
-c0
-4
-    30    70    24
-    40    70    27
-    30    70    27
-    30    70    24
-f1608 1
-    -0    -1    -0
-c0
-4
-    30    70    24
-    40    70    24
-    40    70    27
-    30    70    24
-f1609 1
-    -1    -0    -0
-c0
-4
-    30    120    24
-    30    110    24
-    30    110    27
-    30    120    24
-f1610 1
-    -1    0    0
-c0
-4
-    30    120    24
-    30    110    27
-    30    120    27
-    30    120    24
-f1611 1
-    -1    0    0
-c0
-4
-    30    130    24
-    30    120    27
-    30    130    27
-    30    130    24
-f1612 1
-    -1    -0    -0
-c0
-4
-    30    120    24
-    30    120    27
-    30    130    24
-    30    120    24
-f1613 1
-    -0    1    -0
-c0
-4
-    30    130    24
-    30    130    27
-    40    130    24
-    30    130    24
-f1614 1
-    0    1    -0
-c0
-4
-    40    130    24
-    30    130    27
-    40    130    27
-    40    130    24
-f1615 1
-    0    1    -0
-c0
-4
-    50    130    24
-    40    130    27
-    50    130    27
-    50    130    24
-f1616 1
-    -0    1    -0
-c0
-4
-    50    130    24
-    40    130    24
-    40    130    27
-    50    130    24
-f1617 1
-    -0    -1    -0
-c0
-4
-    30    110    27
-    30    110    24
-    40    110    24
-    30    110    27
-f1618 1
-    -0    -1    -0
-c0
-4
-    40    110    27
-    30    110    27
-    40    110    24
-    40    110    27
-f1619 1
-    -0    -1    -0
-c0
-4
-    50    110    27
-    40    110    27
-    50    110    24
-    50    110    27
-f1620 1
-    -0    -1    -0
-c0
-4
-    40    110    27
-    40    110    24
-    50    110    24
-    40    110    27
-f1621 1
-    1    0    0
-c0
-4
-    50    130    27
-    50    120    24
-    50    130    24
-    50    130    27
-f1622 1
-    1    -0    -0
-c0
-4
-    50    120    27
-    50    120    24
-    50    130    27
-    50    120    27
-f1623 1
-    1    -0    -0
-c0
-4
-    50    110    27
-    50    110    24
-    50    120    24
-    50    110    27
-f1624 1
-    1    0    0
-c0
-4
-    50    120    27
-    50    110    27
-    50    120    24
-    50    120    27
-f1625 1
-    0    1    0
-c0
-4
-    40    50    24
-    50    50    27
-    50    50    24
-    40    50    24
-f1626 1
-    -0    1    -0
-c0
-4
-    30    50    24
-    30    50    27
-    40    50    27
-    30    50    24
-f1627 1
-    0    1    -0
-c0
-4
-    40    50    24
-    30    50    24
-    40    50    27
-    40    50    24
-f1628 1
-    -0    1    -0
-c0
-4
-    40    50    24
-    40    50    27
-    50    50    27
-    40    50    24
-f1629 1
-    1    0    0
-c0
-4
-    50    50    27
-    50    40    24
-    50    50    24
-    50    50    27
-f1630 1
-    1    0    -0
-c0
-4
-    50    50    27
-    50    40    27
-    50    40    24
-    50    50    27
-f1631 1
-    1    -0    -0
-c0
-4
-    50    30    27
-    50    30    24
-    50    40    24
-    50    30    27
-f1632 1
-    1    -0    0
-c0
-4
-    50    30    27
-    50    40    24
-    50    40    27
-    50    30    27
-f1633 1
-    -1    0    0
-c0
-4
-    30    50    24
-    30    40    24
-    30    50    27
-    30    50    24
-f1634 1
-    -1    -0    -0
-c0
-4
-    30    40    24
-    30    40    27
-    30    50    27
-    30    40    24
-f1635 1
-    -1    -0    -0
-c0
-4
-    30    30    24
-    30    30    27
-    30    40    24
-    30    30    24
-f1636 1
-    -1    0    0
-c0
-4
-    30    40    24
-    30    30    27
-    30    40    27
-    30    40    24
-f1637 1
-    0    -1    -0
-c0
-4
-    50    30    27
-    40    30    24
-    50    30    24
-    50    30    27
-f1638 1
-    0    -1    -0
-c0
-4
-    40    30    27
-    40    30    24
-    50    30    27
-    40    30    27
-f1639 1
-    -0    -1    -0
-c0
-4
-    40    30    27
-    30    30    27
-    30    30    24
-    40    30    27
-f1640 1
-    0    -1    -0
-c0
-4
-    40    30    27
-    30    30    24
-    40    30    24
-    40    30    27
-f1641 1
-    0    1    0
-c0
-4
-    90    90    30
-    90    90    27
-    80    90    30
-    90    90    30
-f1642 1
-    0    1    0
-c0
-4
-    80    90    30
-    90    90    27
-    80    90    27
-    80    90    30
-f1643 1
-    0    1    0
-c0
-4
-    80    90    30
-    70    90    27
-    70    90    30
-    80    90    30
-f1644 1
-    -0    1    0
-c0
-4
-    80    90    30
-    80    90    27
-    70    90    27
-    80    90    30
-f1645 1
-    1    -0    -0
-c0
-4
-    90    80    27
-    90    90    27
-    90    90    30
-    90    80    27
-f1646 1
-    1    0    0
-c0
-4
-    90    80    27
-    90    90    30
-    90    80    30
-    90    80    27
-f1647 1
-    1    0    0
-c0
-4
-    90    70    27
-    90    80    27
-    90    70    30
-    90    70    27
-f1648 1
-    1    -0    -0
-c0
-4
-    90    80    27
-    90    80    30
-    90    70    30
-    90    80    27
-f1649 1
-    -1    -0    -0
-c0
-4
-    70    90    30
-    70    90    27
-    70    80    27
-    70    90    30
-f1650 1
-    -1    -0    0
-c0
-4
-    70    90    30
-    70    80    27
-    70    80    30
-    70    90    30
-f1651 1
-    -1    0    0
-c0
-4
-    70    70    30
-    70    80    30
-    70    70    27
-    70    70    30
-f1652 1
-    -1    -0    -0
-c0
-4
-    70    80    30
-    70    80    27
-    70    70    27
-    70    80    30
-f1653 1
-    0    -1    -0
-c0
-4
-    90    70    30
-    80    70    27
-    90    70    27
-    90    70    30
-f1654 1
-    -0    -1    -0
-c0
-4
-    90    70    30
-    80    70    30
-    80    70    27
-    90    70    30
-f1655 1
-    0    -1    -0
-c0
-4
-    70    70    30
-    70    70    27
-    80    70    30
-    70    70    30
-f1656 1
-    0    -1    -0
-c0
-4
-    80    70    30
-    70    70    27
-    80    70    27
-    80    70    30
-f1657 1
-    1    -0    -0
-c0
-4
-    90    40    27
-    90    50    27
-    90    50    30
-    90    40    27
-f1658 1
-    1    0    0
-c0
-4
-    90    40    27
-    90    50    30
-    90    40    30
-    90    40    27
-f1659 1
-    1    0    0
-c0
-4
-    90    30    27
-    90    40    30
-    90    30    30
-    90    30    27
-f1660 1
-    1    -0    -0
-c0
-4
-    90    40    27
-    90    40    30
-    90    30    27
-    90    40    27
-f1661 1
-    0    1    -0
-c0
-4
-    90    50    27
-    80    50    27
-    90    50    30
-    90    50    27
-f1662 1
-    -0    1    -0
-c0
-4
-    80    50    27
-    80    50    30
-    90    50    30
-    80    50    27
-f1663 1
-    -0    1    -0
-c0
-4
-    70    50    27
-    70    50    30
-    80    50    30
-    70    50    27
-f1664 1
-    0    1    0
-c0
-4
-    70    50    27
-    80    50    30
-    80    50    27
-    70    50    27
-f1665 1
-    -0    -1    -0
-c0
-4
-    90    30    30
-    80    30    30
-    90    30    27
-    90    30    30
-f1666 1
-    -0    -1    -0
-c0
-4
-    80    30    30
-    80    30    27
-    90    30    27
-    80    30    30
-f1667 1
-    -0    -1    -0
-c0
-4
-    70    30    30
-    70    30    27
-    80    30    27
-    70    30    30
-f1668 1
-    0    -1    0
-c0
-4
-    70    30    30
-    80    30    27
-    80    30    30
-    70    30    30
-f1669 1
-    -1    0    0
-c0
-4
-    70    40    27
-    70    50    30
-    70    50    27
-    70    40    27
-f1670 1
-    -1    -0    -0
-c0
-4
-    70    40    27
-    70    40    30
-    70    50    30
-    70    40    27
-f1671 1
-    -1    -0    -0
-c0
-4
-    70    30    27
-    70    30    30
-    70    40    30
-    70    30    27
-f1672 1
-    -1    0    0
-c0
-4
-    70    30    27
-    70    40    30
-    70    40    27
-    70    30    27
-f1673 1
-    1    -0    -0
-c0
-4
-    130    30    30
-    130    30    27
-    130    40    27
-    130    30    30
-f1674 1
-    1    -0    0
-c0
-4
-    130    40    30
-    130    50    27
-    130    50    30
-    130    40    30
-f1675 1
-    1    -0    -0
-c0
-4
-    130    40    30
-    130    40    27
-    130    50    27
-    130    40    30
-f1676 1
-    1    -0    0
-c0
-4
-    130    30    30
-    130    40    27
-    130    40    30
-    130    30    30
-f1677 1
-    0    1    -0
-c0
-4
-    130    50    27
-    120    50    27
-    130    50    30
-    130    50    27
-f1678 1
-    -0    1    -0
-c0
-4
-    120    50    27
-    120    50    30
-    130    50    30
-    120    50    27
-f1679 1
-    -0    1    -0
-c0
-4
-    110    50    27
-    110    50    30
-    120    50    27
-    110    50    27
-f1680 1
-    0    1    -0
-c0
-4
-    120    50    27
-    110    50    30
-    120    50    30
-    120    50    27
-f1681 1
-    0    -1    -0
-c0
-4
-    130    30    30
-    120    30    27
-    130    30    27
-    130    30    30
-f1682 1
-    0    -1    -0
-c0
-4
-    120    30    30
-    120    30    27
-    130    30    30
-    120    30    30
-f1683 1
-    -0    -1    -0
-c0
-4
-    120    30    30
-    110    30    30
-    110    30    27
-    120    30    30
-f1684 1
-    0    -1    -0
-c0
-4
-    120    30    30
-    110    30    27
-    120    30    27
-    120    30    30
-f1685 1
-    -1    -0    -0
-c0
-4
-    110    50    30
-    110    50    27
-    110    40    27
-    110    50    30
-f1686 1
-    -1    0    0
-c0
-4
-    110    40    30
-    110    50    30
-    110    40    27
-    110    40    30
-f1687 1
-    -1    -0    0
-c0
-4
-    110    40    30
-    110    30    27
-    110    30    30
-    110    40    30
-f1688 1
-    -1    -0    -0
-c0
-4
-    110    40    30
-    110    40    27
-    110    30    27
-    110    40    30
-f1689 1
-    -1    0    0
-c0
-4
-    110    90    27
-    110    80    27
-    110    90    30
-    110    90    27
-f1690 1
-    -1    -0    -0
-c0
-4
-    110    80    27
-    110    70    27
-    110    70    30
-    110    80    27
-f1691 1
-    -1    0    0
-c0
-4
-    110    80    27
-    110    70    30
-    110    80    30
-    110    80    27
-f1692 1
-    -1    -0    -0
-c0
-4
-    110    80    27
-    110    80    30
-    110    90    30
-    110    80    27
-f1693 1
-    -0    1    -0
-c0
-4
-    110    90    27
-    110    90    30
-    120    90    30
-    110    90    27
-f1694 1
-    0    1    -0
-c0
-4
-    120    90    27
-    110    90    27
-    120    90    30
-    120    90    27
-f1695 1
-    0    1    -0
-c0
-4
-    130    90    27
-    120    90    27
-    130    90    30
-    130    90    27
-f1696 1
-    -0    1    -0
-c0
-4
-    120    90    27
-    120    90    30
-    130    90    30
-    120    90    27
-f1697 1
-    -0    -1    -0
-c0
-4
-    110    70    30
-    110    70    27
-    120    70    27
-    110    70    30
-f1698 1
-    0    -1    0
-c0
-4
-    110    70    30
-    120    70    27
-    120    70    30
-    110    70    30
-f1699 1
-    0    -1    -0
-c0
-4
-    130    70    30
-    120    70    27
-    130    70    27
-    130    70    30
-f1700 1
-    0    -1    -0
-c0
-4
-    120    70    30
-    120    70    27
-    130    70    30
-    120    70    30
-f1701 1
-    1    0    0
-c0
-4
-    130    90    30
-    130    80    27
-    130    90    27
-    130    90    30
-f1702 1
-    1    -0    -0
-c0
-4
-    130    80    30
-    130    80    27
-    130    90    30
-    130    80    30
-f1703 1
-    1    -0    -0
-c0
-4
-    130    70    30
-    130    70    27
-    130    80    27
-    130    70    30
-f1704 1
-    1    -0    0
-c0
-4
-    130    70    30
-    130    80    27
-    130    80    30
-    130    70    30
-f1705 1
-    -0    1    -0
-c0
-4
-    70    130    27
-    70    130    30
-    80    130    30
-    70    130    27
-f1706 1
-    0    1    -0
-c0
-4
-    80    130    27
-    70    130    27
-    80    130    30
-    80    130    27
-f1707 1
-    0    1    0
-c0
-4
-    80    130    27
-    90    130    30
-    90    130    27
-    80    130    27
-f1708 1
-    -0    1    -0
-c0
-4
-    80    130    27
-    80    130    30
-    90    130    30
-    80    130    27
-f1709 1
-    1    0    0
-c0
-4
-    90    130    30
-    90    120    30
-    90    130    27
-    90    130    30
-f1710 1
-    1    -0    -0
-c0
-4
-    90    120    30
-    90    120    27
-    90    130    27
-    90    120    30
-f1711 1
-    1    -0    -0
-c0
-4
-    90    110    30
-    90    110    27
-    90    120    27
-    90    110    30
-f1712 1
-    1    0    0
-c0
-4
-    90    120    30
-    90    110    30
-    90    120    27
-    90    120    30
-f1713 1
-    -1    0    0
-c0
-4
-    70    120    27
-    70    130    30
-    70    130    27
-    70    120    27
-f1714 1
-    -1    -0    -0
-c0
-4
-    70    120    27
-    70    120    30
-    70    130    30
-    70    120    27
-f1715 1
-    -1    -0    -0
-c0
-4
-    70    110    27
-    70    110    30
-    70    120    30
-    70    110    27
-f1716 1
-    -1    0    0
-c0
-4
-    70    110    27
-    70    120    30
-    70    120    27
-    70    110    27
-f1717 1
-    -0    -1    -0
-c0
-4
-    90    110    30
-    80    110    30
-    90    110    27
-    90    110    30
-f1718 1
-    -0    -1    -0
-c0
-4
-    80    110    30
-    80    110    27
-    90    110    27
-    80    110    30
-f1719 1
-    0    -1    -0
-c0
-4
-    70    110    30
-    70    110    27
-    80    110    30
-    70    110    30
-f1720 1
-    0    -1    -0
-c0
-4
-    80    110    30
-    70    110    27
-    80    110    27
-    80    110    30
-f1721 1
-    -0    1    0
-c0
-4
-    110    130    30
-    120    130    30
-    110    130    27
-    110    130    30
-f1722 1
-    -0    1    0
-c0
-4
-    120    130    30
-    120    130    27
-    110    130    27
-    120    130    30
-f1723 1
-    -0    1    0
-c0
-4
-    130    130    30
-    130    130    27
-    120    130    27
-    130    130    30
-f1724 1
-    0    1    0
-c0
-4
-    130    130    30
-    120    130    27
-    120    130    30
-    130    130    30
-f1725 1
-    -1    0    0
-c0
-4
-    110    130    27
-    110    120    27
-    110    130    30
-    110    130    27
-f1726 1
-    -1    -0    -0
-c0
-4
-    110    110    27
-    110    110    30
-    110    120    30
-    110    110    27
-f1727 1
-    -1    0    0
-c0
-4
-    110    110    27
-    110    120    30
-    110    120    27
-    110    110    27
-f1728 1
-    -1    -0    -0
-c0
-4
-    110    120    27
-    110    120    30
-    110    130    30
-    110    120    27
-f1729 1
-    0    -1    -0
-c0
-4
-    110    110    30
-    110    110    27
-    120    110    30
-    110    110    30
-f1730 1
-    0    -1    -0
-c0
-4
-    120    110    30
-    110    110    27
-    120    110    27
-    120    110    30
-f1731 1
-    0    -1    -0
-c0
-4
-    130    110    30
-    120    110    27
-    130    110    27
-    130    110    30
-f1732 1
-    -0    -1    -0
-c0
-4
-    130    110    30
-    120    110    30
-    120    110    27
-    130    110    30
-f1733 1
-    1    0    0
-c0
-4
-    130    130    30
-    130    120    27
-    130    130    27
-    130    130    30
-f1734 1
-    1    -0    -0
-c0
-4
-    130    110    30
-    130    110    27
-    130    120    30
-    130    110    30
-f1735 1
-    1    0    0
-c0
-4
-    130    120    30
-    130    110    27
-    130    120    27
-    130    120    30
-f1736 1
-    1    -0    -0
-c0
-4
-    130    120    30
-    130    120    27
-    130    130    30
-    130    120    30
-f1737 1
-    -0    1    -0
-c0
-4
-    30    90    27
-    30    90    30
-    40    90    30
-    30    90    27
-f1738 1
-    0    1    -0
-c0
-4
-    40    90    27
-    30    90    27
-    40    90    30
-    40    90    27
-f1739 1
-    0    1    0
-c0
-4
-    40    90    27
-    50    90    30
-    50    90    27
-    40    90    27
-f1740 1
-    -0    1    -0
-c0
-4
-    40    90    27
-    40    90    30
-    50    90    30
-    40    90    27
-f1741 1
-    1    0    0
-c0
-4
-    50    90    30
-    50    80    30
-    50    90    27
-    50    90    30
-f1742 1
-    1    -0    -0
-c0
-4
-    50    80    30
-    50    80    27
-    50    90    27
-    50    80    30
-f1743 1
-    1    -0    -0
-c0
-4
-    50    70    30
-    50    70    27
-    50    80    27
-    50    70    30
-f1744 1
-    1    0    0
-c0
-4
-    50    80    30
-    50    70    30
-    50    80    27
-    50    80    30
-f1745 1
-    -1    0    0
-c0
-4
-    30    90    27
-    30    80    30
-    30    90    30
-    30    90    27
-f1746 1
-    -1    -0    -0
-c0
-4
-    30    90    27
-    30    80    27
-    30    80    30
-    30    90    27
-f1747 1
-    -1    -0    -0
-c0
-4
-    30    70    27
-    30    70    30
-    30    80    30
-    30    70    27
-f1748 1
-    -1    0    0
-c0
-4
-    30    70    27
-    30    80    30
-    30    80    27
-    30    70    27
-f1749 1
-    0    -1    -0
-c0
-4
-    50    70    30
-    40    70    27
-    50    70    27
-    50    70    30
-f1750 1
-    -0    -1    -0
-c0
-4
-    30    70    30
-    30    70    27
-    40    70    27
-    30    70    30
-f1751 1
-    0    -1    -0
-c0
-4
-    40    70    30
-    40    70    27
-    50    70    30
-    40    70    30
-f1752 1
-    -0    -1    -0
-c0
-4
-    40    70    30
-    30    70    30
-    40    70    27
-    40    70    30
-f1753 1
-    -1    -0    -0
-c0
-4
-    30    110    27
-    30    110    30
-    30    120    30
-    30    110    27
-f1754 1
-    -1    0    0
-c0
-4
-    30    120    27
-    30    110    27
-    30    120    30
-    30    120    27
-f1755 1
-    -1    0    0
-c0
-4
-    30    130    27
-    30    120    27
-    30    130    30
-    30    130    27
-f1756 1
-    -1    -0    -0
-c0
-4
-    30    120    27
-    30    120    30
-    30    130    30
-    30    120    27
-f1757 1
-    -0    1    -0
-c0
-4
-    30    130    27
-    30    130    30
-    40    130    30
-    30    130    27
-f1758 1
-    0    1    -0
-c0
-4
-    40    130    27
-    30    130    27
-    40    130    30
-    40    130    27
-f1759 1
-    0    1    -0
-c0
-4
-    50    130    27
-    40    130    30
-    50    130    30
-    50    130    27
-f1760 1
-    -0    1    -0
-c0
-4
-    50    130    27
-    40    130    27
-    40    130    30
-    50    130    27
-f1761 1
-    0    -1    0
-c0
-4
-    30    110    27
-    40    110    27
-    30    110    30
-    30    110    27
-f1762 1
-    -0    -1    0
-c0
-4
-    50    110    27
-    50    110    30
-    40    110    30
-    50    110    27
-f1763 1
-    0    -1    0
-c0
-4
-    50    110    27
-    40    110    30
-    40    110    27
-    50    110    27
-f1764 1
-    -0    -1    0
-c0
-4
-    40    110    27
-    40    110    30
-    30    110    30
-    40    110    27
-f1765 1
-    1    0    0
-c0
-4
-    50    130    30
-    50    120    30
-    50    130    27
-    50    130    30
-f1766 1
-    1    -0    -0
-c0
-4
-    50    120    30
-    50    120    27
-    50    130    27
-    50    120    30
-f1767 1
-    1    -0    -0
-c0
-4
-    50    110    30
-    50    110    27
-    50    120    30
-    50    110    30
-f1768 1
-    1    0    0
-c0
-4
-    50    120    30
-    50    110    27
-    50    120    27
-    50    120    30
-f1769 1
-    -0    1    -0
-c0
-4
-    40    50    27
-    30    50    27
-    30    50    30
-    40    50    27
-f1770 1
-    0    1    0
-c0
-4
-    40    50    27
-    50    50    30
-    50    50    27
-    40    50    27
-f1771 1
-    0    1    -0
-c0
-4
-    40    50    27
-    30    50    30
-    40    50    30
-    40    50    27
-f1772 1
-    -0    1    -0
-c0
-4
-    40    50    27
-    40    50    30
-    50    50    30
-    40    50    27
-f1773 1
-    1    0    0
-c0
-4
-    50    50    30
-    50    40    27
-    50    50    27
-    50    50    30
-f1774 1
-    1    -0    -0
-c0
-4
-    50    30    30
-    50    30    27
-    50    40    27
-    50    30    30
-f1775 1
-    1    -0    -0
-c0
-4
-    50    40    30
-    50    40    27
-    50    50    30
-    50    40    30
-f1776 1
-    1    -0    0
-c0
-4
-    50    30    30
-    50    40    27
-    50    40    30
-    50    30    30
-f1777 1
-    -1    0    0
-c0
-4
-    30    40    27
-    30    50    30
-    30    50    27
-    30    40    27
-f1778 1
-    -1    -0    -0
-c0
-4
-    30    30    27
-    30    30    30
-    30    40    30
-    30    30    27
-f1779 1
-    -1    0    0
-c0
-4
-    30    30    27
-    30    40    30
-    30    40    27
-    30    30    27
-f1780 1
-    -1    -0    -0
-c0
-4
-    30    40    27
-    30    40    30
-    30    50    30
-    30    40    27
-f1781 1
-    -0    -1    -0
-c0
-4
-    50    30    30
-    40    30    30
-    50    30    27
-    50    30    30
-f1782 1
-    -0    -1    -0
-c0
-4
-    40    30    30
-    40    30    27
-    50    30    27
-    40    30    30
-f1783 1
-    -0    -1    -0
-c0
-4
-    30    30    30
-    30    30    27
-    40    30    27
-    30    30    30
-f1784 1
-    0    -1    0
-c0
-4
-    30    30    30
-    40    30    27
-    40    30    30
-    30    30    30
-f1785 1
-    -0    -0    1
-c0
-4
-    80    90    30
-    85    85    30
-    90    90    30
-    80    90    30
-f1786 1
-    -0    0    1
-c0
-4
-    90    90    30
-    85    85    30
-    90    80    30
-    90    90    30
-f1787 1
-    -0    -0    1
-c0
-4
-    70    90    30
-    75    85    30
-    80    90    30
-    70    90    30
-f1788 1
-    -0    -0    1
-c0
-4
-    70    80    30
-    75    85    30
-    70    90    30
-    70    80    30
-f1789 1
-    -0    0    1
-c0
-4
-    90    80    30
-    85    75    30
-    90    70    30
-    90    80    30
-f1790 1
-    -0    -0    1
-c0
-4
-    90    70    30
-    85    75    30
-    80    70    30
-    90    70    30
-f1791 1
-    -0    -0    1
-c0
-4
-    70    70    30
-    75    75    30
-    70    80    30
-    70    70    30
-f1792 1
-    -0    -0    1
-c0
-4
-    80    70    30
-    75    75    30
-    70    70    30
-    80    70    30
-f1793 1
-    -0    -0    1
-c0
-4
-    80    80    30
-    85    85    30
-    80    90    30
-    80    80    30
-f1794 1
-    -0    0    1
-c0
-4
-    80    90    30
-    75    85    30
-    80    80    30
-    80    90    30
-f1795 1
-    -0    -0    1
-c0
-4
-    90    80    30
-    85    85    30
-    80    80    30
-    90    80    30
-f1796 1
-    -0    -0    1
-c0
-4
-    80    80    30
-    85    75    30
-    90    80    30
-    80    80    30
-f1797 1
-    -0    -0    1
-c0
-4
-    80    80    30
-    75    85    30
-    70    80    30
-    80    80    30
-f1798 1
-    -0    -0    1
-c0
-4
-    70    80    30
-    75    75    30
-    80    80    30
-    70    80    30
-f1799 1
-    -0    -0    1
-c0
-4
-    80    70    30
-    85    75    30
-    80    80    30
-    80    70    30
-f1800 1
-    -0    0    1
-c0
-4
-    80    80    30
-    75    75    30
-    80    70    30
-    80    80    30
-f1801 1
-    -0    0    1
-c0
-4
-    90    50    30
-    85    45    30
-    90    40    30
-    90    50    30
-f1802 1
-    -0    -0    1
-c0
-4
-    80    50    30
-    85    45    30
-    90    50    30
-    80    50    30
-f1803 1
-    -0    0    1
-c0
-4
-    90    40    30
-    85    35    30
-    90    30    30
-    90    40    30
-f1804 1
-    -0    -0    1
-c0
-4
-    90    30    30
-    85    35    30
-    80    30    30
-    90    30    30
-f1805 1
-    -0    -0    1
-c0
-4
-    70    50    30
-    75    45    30
-    80    50    30
-    70    50    30
-f1806 1
-    -0    -0    1
-c0
-4
-    70    40    30
-    75    45    30
-    70    50    30
-    70    40    30
-f1807 1
-    -0    -0    1
-c0
-4
-    80    30    30
-    75    35    30
-    70    30    30
-    80    30    30
-f1808 1
-    -0    -0    1
-c0
-4
-    70    30    30
-    75    35    30
-    70    40    30
-    70    30    30
-f1809 1
-    -0    -0    1
-c0
-4
-    90    40    30
-    85    45    30
-    80    40    30
-    90    40    30
-f1810 1
-    -0    -0    1
-c0
-4
-    80    40    30
-    85    35    30
-    90    40    30
-    80    40    30
-f1811 1
-    -0    -0    1
-c0
-4
-    80    40    30
-    85    45    30
-    80    50    30
-    80    40    30
-f1812 1
-    -0    0    1
-c0
-4
-    80    50    30
-    75    45    30
-    80    40    30
-    80    50    30
-f1813 1
-    -0    -0    1
-c0
-4
-    80    30    30
-    85    35    30
-    80    40    30
-    80    30    30
-f1814 1
-    -0    0    1
-c0
-4
-    80    40    30
-    75    35    30
-    80    30    30
-    80    40    30
-f1815 1
-    -0    -0    1
-c0
-4
-    80    40    30
-    75    45    30
-    70    40    30
-    80    40    30
-f1816 1
-    -0    -0    1
-c0
-4
-    70    40    30
-    75    35    30
-    80    40    30
-    70    40    30
-f1817 1
-    -0    0    1
-c0
-4
-    130    50    30
-    125    45    30
-    130    40    30
-    130    50    30
-f1818 1
-    -0    -0    1
-c0
-4
-    120    50    30
-    125    45    30
-    130    50    30
-    120    50    30
-f1819 1
-    -0    0    1
-c0
-4
-    130    40    30
-    125    35    30
-    130    30    30
-    130    40    30
-f1820 1
-    -0    -0    1
-c0
-4
-    130    30    30
-    125    35    30
-    120    30    30
-    130    30    30
-f1821 1
-    -0    -0    1
-c0
-4
-    110    50    30
-    115    45    30
-    120    50    30
-    110    50    30
-f1822 1
-    -0    -0    1
-c0
-4
-    110    40    30
-    115    45    30
-    110    50    30
-    110    40    30
-f1823 1
-    -0    -0    1
-c0
-4
-    120    30    30
-    115    35    30
-    110    30    30
-    120    30    30
-f1824 1
-    -0    -0    1
-c0
-4
-    110    30    30
-    115    35    30
-    110    40    30
-    110    30    30
-f1825 1
-    -0    -0    1
-c0
-4
-    130    40    30
-    125    45    30
-    120    40    30
-    130    40    30
-f1826 1
-    -0    -0    1
-c0
-4
-    120    40    30
-    125    35    30
-    130    40    30
-    120    40    30
-f1827 1
-    -0    -0    1
-c0
-4
-    120    40    30
-    125    45    30
-    120    50    30
-    120    40    30
-f1828 1
-    -0    0    1
-c0
-4
-    120    50    30
-    115    45    30
-    120    40    30
-    120    50    30
-f1829 1
-    -0    -0    1
-c0
-4
-    120    30    30
-    125    35    30
-    120    40    30
-    120    30    30
-f1830 1
-    -0    0    1
-c0
-4
-    120    40    30
-    115    35    30
-    120    30    30
-    120    40    30
-f1831 1
-    -0    -0    1
-c0
-4
-    120    40    30
-    115    45    30
-    110    40    30
-    120    40    30
-f1832 1
-    -0    -0    1
-c0
-4
-    110    40    30
-    115    35    30
-    120    40    30
-    110    40    30
-f1833 1
-    0    0    1
-c0
-4
-    110    80    30
-    110    70    30
-    115    75    30
-    110    80    30
-f1834 1
-    0    0    1
-c0
-4
-    110    70    30
-    120    70    30
-    115    75    30
-    110    70    30
-f1835 1
-    0    0    1
-c0
-4
-    110    90    30
-    110    80    30
-    115    85    30
-    110    90    30
-f1836 1
-    0    0    1
-c0
-4
-    120    90    30
-    110    90    30
-    115    85    30
-    120    90    30
-f1837 1
-    0    0    1
-c0
-4
-    130    90    30
-    120    90    30
-    125    85    30
-    130    90    30
-f1838 1
-    0    -0    1
-c0
-4
-    130    80    30
-    130    90    30
-    125    85    30
-    130    80    30
-f1839 1
-    0    0    1
-c0
-4
-    120    70    30
-    130    70    30
-    125    75    30
-    120    70    30
-f1840 1
-    0    -0    1
-c0
-4
-    130    70    30
-    130    80    30
-    125    75    30
-    130    70    30
-f1841 1
-    0    0    1
-c0
-4
-    120    80    30
-    110    80    30
-    115    75    30
-    120    80    30
-f1842 1
-    0    0    1
-c0
-4
-    110    80    30
-    120    80    30
-    115    85    30
-    110    80    30
-f1843 1
-    0    -0    1
-c0
-4
-    120    80    30
-    120    90    30
-    115    85    30
-    120    80    30
-f1844 1
-    0    0    1
-c0
-4
-    120    90    30
-    120    80    30
-    125    85    30
-    120    90    30
-f1845 1
-    0    -0    1
-c0
-4
-    120    70    30
-    120    80    30
-    115    75    30
-    120    70    30
-f1846 1
-    0    0    1
-c0
-4
-    120    80    30
-    120    70    30
-    125    75    30
-    120    80    30
-f1847 1
-    0    0    1
-c0
-4
-    120    80    30
-    130    80    30
-    125    85    30
-    120    80    30
-f1848 1
-    0    0    1
-c0
-4
-    130    80    30
-    120    80    30
-    125    75    30
-    130    80    30
-f1849 1
-    0    0    1
-c0
-4
-    80    130    30
-    70    130    30
-    75    125    30
-    80    130    30
-f1850 1
-    0    0    1
-c0
-4
-    70    130    30
-    70    120    30
-    75    125    30
-    70    130    30
-f1851 1
-    0    0    1
-c0
-4
-    90    130    30
-    80    130    30
-    85    125    30
-    90    130    30
-f1852 1
-    0    -0    1
-c0
-4
-    90    120    30
-    90    130    30
-    85    125    30
-    90    120    30
-f1853 1
-    0    -0    1
-c0
-4
-    90    110    30
-    90    120    30
-    85    115    30
-    90    110    30
-f1854 1
-    0    0    1
-c0
-4
-    80    110    30
-    90    110    30
-    85    115    30
-    80    110    30
-f1855 1
-    0    0    1
-c0
-4
-    70    120    30
-    70    110    30
-    75    115    30
-    70    120    30
-f1856 1
-    0    0    1
-c0
-4
-    70    110    30
-    80    110    30
-    75    115    30
-    70    110    30
-f1857 1
-    0    -0    1
-c0
-4
-    80    120    30
-    80    130    30
-    75    125    30
-    80    120    30
-f1858 1
-    0    0    1
-c0
-4
-    80    130    30
-    80    120    30
-    85    125    30
-    80    130    30
-f1859 1
-    0    0    1
-c0
-4
-    80    120    30
-    90    120    30
-    85    125    30
-    80    120    30
-f1860 1
-    0    0    1
-c0
-4
-    90    120    30
-    80    120    30
-    85    115    30
-    90    120    30
-f1861 1
-    0    0    1
-c0
-4
-    70    120    30
-    80    120    30
-    75    125    30
-    70    120    30
-f1862 1
-    0    0    1
-c0
-4
-    80    120    30
-    70    120    30
-    75    115    30
-    80    120    30
-f1863 1
-    0    0    1
-c0
-4
-    80    120    30
-    80    110    30
-    85    115    30
-    80    120    30
-f1864 1
-    0    -0    1
-c0
-4
-    80    110    30
-    80    120    30
-    75    115    30
-    80    110    30
-f1865 1
-    -0    -0    1
-c0
-4
-    120    130    30
-    125    125    30
-    130    130    30
-    120    130    30
-f1866 1
-    -0    0    1
-c0
-4
-    130    130    30
-    125    125    30
-    130    120    30
-    130    130    30
-f1867 1
-    -0    -0    1
-c0
-4
-    110    130    30
-    115    125    30
-    120    130    30
-    110    130    30
-f1868 1
-    -0    -0    1
-c0
-4
-    110    120    30
-    115    125    30
-    110    130    30
-    110    120    30
-f1869 1
-    -0    -0    1
-c0
-4
-    110    110    30
-    115    115    30
-    110    120    30
-    110    110    30
-f1870 1
-    -0    -0    1
-c0
-4
-    120    110    30
-    115    115    30
-    110    110    30
-    120    110    30
-f1871 1
-    -0    -0    1
-c0
-4
-    130    110    30
-    125    115    30
-    120    110    30
-    130    110    30
-f1872 1
-    -0    0    1
-c0
-4
-    130    120    30
-    125    115    30
-    130    110    30
-    130    120    30
-f1873 1
-    -0    -0    1
-c0
-4
-    120    120    30
-    125    125    30
-    120    130    30
-    120    120    30
-f1874 1
-    -0    0    1
-c0
-4
-    120    130    30
-    115    125    30
-    120    120    30
-    120    130    30
-f1875 1
-    -0    -0    1
-c0
-4
-    120    120    30
-    115    125    30
-    110    120    30
-    120    120    30
-f1876 1
-    -0    -0    1
-c0
-4
-    110    120    30
-    115    115    30
-    120    120    30
-    110    120    30
-f1877 1
-    -0    0    1
-c0
-4
-    120    120    30
-    115    115    30
-    120    110    30
-    120    120    30
-f1878 1
-    -0    -0    1
-c0
-4
-    120    110    30
-    125    115    30
-    120    120    30
-    120    110    30
-f1879 1
-    -0    -0    1
-c0
-4
-    130    120    30
-    125    125    30
-    120    120    30
-    130    120    30
-f1880 1
-    -0    -0    1
-c0
-4
-    120    120    30
-    125    115    30
-    130    120    30
-    120    120    30
-f1881 1
-    -0    -0    1
-c0
-4
-    30    90    30
-    35    85    30
-    40    90    30
-    30    90    30
-f1882 1
-    -0    -0    1
-c0
-4
-    30    80    30
-    35    85    30
-    30    90    30
-    30    80    30
-f1883 1
-    -0    -0    1
-c0
-4
-    40    90    30
-    45    85    30
-    50    90    30
-    40    90    30
-f1884 1
-    -0    0    1
-c0
-4
-    50    90    30
-    45    85    30
-    50    80    30
-    50    90    30
-f1885 1
-    -0    0    1
-c0
-4
-    50    80    30
-    45    75    30
-    50    70    30
-    50    80    30
-f1886 1
-    -0    -0    1
-c0
-4
-    50    70    30
-    45    75    30
-    40    70    30
-    50    70    30
-f1887 1
-    -0    -0    1
-c0
-4
-    30    70    30
-    35    75    30
-    30    80    30
-    30    70    30
-f1888 1
-    -0    -0    1
-c0
-4
-    40    70    30
-    35    75    30
-    30    70    30
-    40    70    30
-f1889 1
-    -0    0    1
-c0
-4
-    40    90    30
-    35    85    30
-    40    80    30
-    40    90    30
-f1890 1
-    -0    -0    1
-c0
-4
-    40    80    30
-    45    85    30
-    40    90    30
-    40    80    30
-f1891 1
-    -0    -0    1
-c0
-4
-    50    80    30
-    45    85    30
-    40    80    30
-    50    80    30
-f1892 1
-    -0    -0    1
-c0
-4
-    40    80    30
-    45    75    30
-    50    80    30
-    40    80    30
-f1893 1
-    -0    -0    1
-c0
-4
-    40    80    30
-    35    85    30
-    30    80    30
-    40    80    30
-f1894 1
-    -0    -0    1
-c0
-4
-    30    80    30
-    35    75    30
-    40    80    30
-    30    80    30
-f1895 1
-    -0    -0    1
-c0
-4
-    40    70    30
-    45    75    30
-    40    80    30
-    40    70    30
-f1896 1
-    -0    0    1
-c0
-4
-    40    80    30
-    35    75    30
-    40    70    30
-    40    80    30
-f1897 1
-    0    0    1
-c0
-4
-    30    120    30
-    30    110    30
-    35    115    30
-    30    120    30
-f1898 1
-    0    0    1
-c0
-4
-    30    110    30
-    40    110    30
-    35    115    30
-    30    110    30
-f1899 1
-    0    0    1
-c0
-4
-    30    130    30
-    30    120    30
-    35    125    30
-    30    130    30
-f1900 1
-    0    0    1
-c0
-4
-    40    130    30
-    30    130    30
-    35    125    30
-    40    130    30
-f1901 1
-    0    0    1
-c0
-4
-    50    130    30
-    40    130    30
-    45    125    30
-    50    130    30
-f1902 1
-    0    -0    1
-c0
-4
-    50    120    30
-    50    130    30
-    45    125    30
-    50    120    30
-f1903 1
-    0    0    1
-c0
-4
-    40    110    30
-    50    110    30
-    45    115    30
-    40    110    30
-f1904 1
-    0    -0    1
-c0
-4
-    50    110    30
-    50    120    30
-    45    115    30
-    50    110    30
-f1905 1
-    0    0    1
-c0
-4
-    40    120    30
-    30    120    30
-    35    115    30
-    40    120    30
-f1906 1
-    0    0    1
-c0
-4
-    30    120    30
-    40    120    30
-    35    125    30
-    30    120    30
-f1907 1
-    0    -0    1
-c0
-4
-    40    120    30
-    40    130    30
-    35    125    30
-    40    120    30
-f1908 1
-    0    0    1
-c0
-4
-    40    130    30
-    40    120    30
-    45    125    30
-    40    130    30
-f1909 1
-    0    -0    1
-c0
-4
-    40    110    30
-    40    120    30
-    35    115    30
-    40    110    30
-f1910 1
-    0    0    1
-c0
-4
-    40    120    30
-    40    110    30
-    45    115    30
-    40    120    30
-f1911 1
-    0    0    1
-c0
-4
-    40    120    30
-    50    120    30
-    45    125    30
-    40    120    30
-f1912 1
-    0    0    1
-c0
-4
-    50    120    30
-    40    120    30
-    45    115    30
-    50    120    30
-f1913 1
-    -0    -0    1
-c0
-4
-    30    50    30
-    35    45    30
-    40    50    30
-    30    50    30
-f1914 1
-    -0    -0    1
-c0
-4
-    30    40    30
-    35    45    30
-    30    50    30
-    30    40    30
-f1915 1
-    -0    -0    1
-c0
-4
-    40    50    30
-    45    45    30
-    50    50    30
-    40    50    30
-f1916 1
-    -0    0    1
-c0
-4
-    50    50    30
-    45    45    30
-    50    40    30
-    50    50    30
-f1917 1
-    -0    0    1
-c0
-4
-    50    40    30
-    45    35    30
-    50    30    30
-    50    40    30
-f1918 1
-    -0    -0    1
-c0
-4
-    50    30    30
-    45    35    30
-    40    30    30
-    50    30    30
-f1919 1
-    -0    -0    1
-c0
-4
-    30    30    30
-    35    35    30
-    30    40    30
-    30    30    30
-f1920 1
-    -0    -0    1
-c0
-4
-    40    30    30
-    35    35    30
-    30    30    30
-    40    30    30
-f1921 1
-    -0    0    1
-c0
-4
-    40    50    30
-    35    45    30
-    40    40    30
-    40    50    30
-f1922 1
-    -0    -0    1
-c0
-4
-    40    40    30
-    45    45    30
-    40    50    30
-    40    40    30
-f1923 1
-    -0    -0    1
-c0
-4
-    50    40    30
-    45    45    30
-    40    40    30
-    50    40    30
-f1924 1
-    -0    -0    1
-c0
-4
-    40    40    30
-    45    35    30
-    50    40    30
-    40    40    30
-f1925 1
-    -0    -0    1
-c0
-4
-    40    40    30
-    35    45    30
-    30    40    30
-    40    40    30
-f1926 1
-    -0    -0    1
-c0
-4
-    30    40    30
-    35    35    30
-    40    40    30
-    30    40    30
-f1927 1
-    -0    -0    1
-c0
-4
-    40    30    30
-    45    35    30
-    40    40    30
-    40    30    30
-f1928 1
-    -0    0    1
-c0
-4
-    40    40    30
-    35    35    30
-    40    30    30
-    40    40    30
-f1929 1
-    -1    -0    -0
-c0
-4
-    30    120    21
-    30    110    21
-    30    110    24
-    30    120    21
-f1930 1
-    -1    0    0
-c0
-4
-    30    130    21
-    30    120    24
-    30    130    24
-    30    130    21
-f1931 1
-    -1    -0    -0
-c0
-4
-    30    130    21
-    30    120    21
-    30    120    24
-    30    130    21
-f1932 1
-    -1    0    0
-c0
-4
-    30    120    21
-    30    110    24
-    30    120    24
-    30    120    21
-f1933 1
-    -0    1    -0
-c0
-4
-    30    130    21
-    30    130    24
-    40    130    21
-    30    130    21
-f1934 1
-    0    1    -0
-c0
-4
-    50    130    21
-    40    130    24
-    50    130    24
-    50    130    21
-f1935 1
-    -0    1    -0
-c0
-4
-    40    130    21
-    40    130    24
-    50    130    21
-    40    130    21
-f1936 1
-    0    1    -0
-c0
-4
-    40    130    21
-    30    130    24
-    40    130    24
-    40    130    21
-f1937 1
-    -0    -1    -0
-c0
-4
-    30    110    24
-    30    110    21
-    40    110    21
-    30    110    24
-f1938 1
-    0    -1    0
-c0
-4
-    40    110    24
-    50    110    21
-    50    110    24
-    40    110    24
-f1939 1
-    -0    -1    -0
-c0
-4
-    40    110    24
-    40    110    21
-    50    110    21
-    40    110    24
-f1940 1
-    -0    -1    -0
-c0
-4
-    40    110    24
-    30    110    24
-    40    110    21
-    40    110    24
-f1941 1
-    1    0    0
-c0
-4
-    50    130    24
-    50    120    24
-    50    130    21
-    50    130    24
-f1942 1
-    1    -0    -0
-c0
-4
-    50    120    24
-    50    120    21
-    50    130    21
-    50    120    24
-f1943 1
-    1    -0    -0
-c0
-4
-    50    110    24
-    50    110    21
-    50    120    24
-    50    110    24
-f1944 1
-    1    0    0
-c0
-4
-    50    120    24
-    50    110    21
-    50    120    21
-    50    120    24
-f1945 1
-    -0    1    -0
-c0
-4
-    40    50    21
-    30    50    21
-    30    50    24
-    40    50    21
-f1946 1
-    0    1    -0
-c0
-4
-    50    50    21
-    40    50    24
-    50    50    24
-    50    50    21
-f1947 1
-    -0    1    -0
-c0
-4
-    50    50    21
-    40    50    21
-    40    50    24
-    50    50    21
-f1948 1
-    0    1    -0
-c0
-4
-    40    50    21
-    30    50    24
-    40    50    24
-    40    50    21
-f1949 1
-    1    0    0
-c0
-4
-    50    50    24
-    50    40    21
-    50    50    21
-    50    50    24
-f1950 1
-    1    -0    -0
-c0
-4
-    50    30    24
-    50    30    21
-    50    40    24
-    50    30    24
-f1951 1
-    1    0    0
-c0
-4
-    50    40    24
-    50    30    21
-    50    40    21
-    50    40    24
-f1952 1
-    1    0    -0
-c0
-4
-    50    50    24
-    50    40    24
-    50    40    21
-    50    50    24
-f1953 1
-    -1    0    0
-c0
-4
-    30    50    21
-    30    40    21
-    30    50    24
-    30    50    21
-f1954 1
-    -1    -0    -0
-c0
-4
-    30    30    21
-    30    30    24
-    30    40    24
-    30    30    21
-f1955 1
-    -1    0    0
-c0
-4
-    30    40    21
-    30    30    21
-    30    40    24
-    30    40    21
-f1956 1
-    -1    -0    -0
-c0
-4
-    30    40    21
-    30    40    24
-    30    50    24
-    30    40    21
-f1957 1
-    0    -1    -0
-c0
-4
-    50    30    24
-    40    30    21
-    50    30    21
-    50    30    24
-f1958 1
-    -0    -1    -0
-c0
-4
-    30    30    24
-    30    30    21
-    40    30    21
-    30    30    24
-f1959 1
-    0    -1    -0
-c0
-4
-    40    30    24
-    40    30    21
-    50    30    24
-    40    30    24
-f1960 1
-    -0    -1    -0
-c0
-4
-    40    30    24
-    30    30    24
-    40    30    21
-    40    30    24
-f1961 1
-    -0    1    -0
-c0
-4
-    80    90    24
-    70    90    24
-    70    90    27
-    80    90    24
-f1962 1
-    0    1    -0
-c0
-4
-    90    90    24
-    80    90    27
-    90    90    27
-    90    90    24
-f1963 1
-    -0    1    -0
-c0
-4
-    80    90    24
-    80    90    27
-    90    90    24
-    80    90    24
-f1964 1
-    0    1    -0
-c0
-4
-    80    90    24
-    70    90    27
-    80    90    27
-    80    90    24
-f1965 1
-    1    0    0
-c0
-4
-    90    90    27
-    90    80    27
-    90    90    24
-    90    90    27
-f1966 1
-    1    -0    -0
-c0
-4
-    90    80    27
-    90    80    24
-    90    90    24
-    90    80    27
-f1967 1
-    1    -0    -0
-c0
-4
-    90    70    27
-    90    70    24
-    90    80    24
-    90    70    27
-f1968 1
-    1    0    0
-c0
-4
-    90    80    27
-    90    70    27
-    90    80    24
-    90    80    27
-f1969 1
-    -1    0    0
-c0
-4
-    70    80    24
-    70    90    27
-    70    90    24
-    70    80    24
-f1970 1
-    -1    -0    -0
-c0
-4
-    70    70    24
-    70    70    27
-    70    80    27
-    70    70    24
-f1971 1
-    -1    0    0
-c0
-4
-    70    80    24
-    70    70    24
-    70    80    27
-    70    80    24
-f1972 1
-    -1    -0    -0
-c0
-4
-    70    80    24
-    70    80    27
-    70    90    27
-    70    80    24
-f1973 1
-    0    -1    -0
-c0
-4
-    90    70    27
-    80    70    24
-    90    70    24
-    90    70    27
-f1974 1
-    -0    -1    -0
-c0
-4
-    80    70    27
-    70    70    27
-    70    70    24
-    80    70    27
-f1975 1
-    0    -1    -0
-c0
-4
-    80    70    27
-    70    70    24
-    80    70    24
-    80    70    27
-f1976 1
-    0    -1    -0
-c0
-4
-    80    70    27
-    80    70    24
-    90    70    27
-    80    70    27
-f1977 1
-    1    0    0
-c0
-4
-    90    50    27
-    90    40    24
-    90    50    24
-    90    50    27
-f1978 1
-    1    0    -0
-c0
-4
-    90    40    27
-    90    30    27
-    90    30    24
-    90    40    27
-f1979 1
-    1    0    0
-c0
-4
-    90    40    27
-    90    30    24
-    90    40    24
-    90    40    27
-f1980 1
-    1    -0    -0
-c0
-4
-    90    40    27
-    90    40    24
-    90    50    27
-    90    40    27
-f1981 1
-    0    1    -0
-c0
-4
-    90    50    24
-    80    50    24
-    90    50    27
-    90    50    24
-f1982 1
-    -0    1    -0
-c0
-4
-    70    50    24
-    70    50    27
-    80    50    24
-    70    50    24
-f1983 1
-    -0    1    -0
-c0
-4
-    80    50    24
-    80    50    27
-    90    50    27
-    80    50    24
-f1984 1
-    0    1    -0
-c0
-4
-    80    50    24
-    70    50    27
-    80    50    27
-    80    50    24
-f1985 1
-    0    -1    0
-c0
-4
-    80    30    27
-    90    30    24
-    90    30    27
-    80    30    27
-f1986 1
-    -0    -1    -0
-c0
-4
-    80    30    27
-    80    30    24
-    90    30    24
-    80    30    27
-f1987 1
-    -0    -1    -0
-c0
-4
-    70    30    27
-    70    30    24
-    80    30    24
-    70    30    27
-f1988 1
-    -0    -1    -0
-c0
-4
-    80    30    27
-    70    30    27
-    80    30    24
-    80    30    27
-f1989 1
-    -1    0    0
-c0
-4
-    70    40    24
-    70    50    27
-    70    50    24
-    70    40    24
-f1990 1
-    -1    -0    -0
-c0
-4
-    70    40    24
-    70    30    24
-    70    30    27
-    70    40    24
-f1991 1
-    -1    -0    -0
-c0
-4
-    70    40    24
-    70    40    27
-    70    50    27
-    70    40    24
-f1992 1
-    -1    0    0
-c0
-4
-    70    40    24
-    70    30    27
-    70    40    27
-    70    40    24
-f1993 1
-    1    0    0
-c0
-4
-    130    50    27
-    130    40    27
-    130    50    24
-    130    50    27
-f1994 1
-    1    -0    -0
-c0
-4
-    130    40    27
-    130    40    24
-    130    50    24
-    130    40    27
-f1995 1
-    1    -0    -0
-c0
-4
-    130    30    27
-    130    30    24
-    130    40    24
-    130    30    27
-f1996 1
-    1    -0    0
-c0
-4
-    130    30    27
-    130    40    24
-    130    40    27
-    130    30    27
-f1997 1
-    0    1    0
-c0
-4
-    130    50    27
-    130    50    24
-    120    50    27
-    130    50    27
-f1998 1
-    0    1    0
-c0
-4
-    120    50    27
-    130    50    24
-    120    50    24
-    120    50    27
-f1999 1
-    0    1    0
-c0
-4
-    110    50    27
-    120    50    24
-    110    50    24
-    110    50    27
-f2000 1
-    0    1    0
-c0
-4
-    120    50    27
-    120    50    24
-    110    50    27
-    120    50    27
-f2001 1
-    -0    -1    -0
-c0
-4
-    130    30    27
-    120    30    27
-    130    30    24
-    130    30    27
-f2002 1
-    -0    -1    -0
-c0
-4
-    120    30    27
-    120    30    24
-    130    30    24
-    120    30    27
-f2003 1
-    -0    -1    -0
-c0
-4
-    110    30    27
-    110    30    24
-    120    30    24
-    110    30    27
-f2004 1
-    0    -1    0
-c0
-4
-    110    30    27
-    120    30    24
-    120    30    27
-    110    30    27
-f2005 1
-    -1    0    0
-c0
-4
-    110    50    24
-    110    40    27
-    110    50    27
-    110    50    24
-f2006 1
-    -1    -0    -0
-c0
-4
-    110    50    24
-    110    40    24
-    110    40    27
-    110    50    24
-f2007 1
-    -1    -0    -0
-c0
-4
-    110    40    24
-    110    30    24
-    110    30    27
-    110    40    24
-f2008 1
-    -1    0    0
-c0
-4
-    110    40    24
-    110    30    27
-    110    40    27
-    110    40    24
-f2009 1
-    -1    -0    -0
-c0
-4
-    110    80    24
-    110    70    24
-    110    70    27
-    110    80    24
-f2010 1
-    -1    0    0
-c0
-4
-    110    90    24
-    110    80    27
-    110    90    27
-    110    90    24
-f2011 1
-    -1    -0    -0
-c0
-4
-    110    80    24
-    110    80    27
-    110    90    24
-    110    80    24
-f2012 1
-    -1    0    0
-c0
-4
-    110    80    24
-    110    70    27
-    110    80    27
-    110    80    24
-f2013 1
-    -0    1    -0
-c0
-4
-    110    90    24
-    110    90    27
-    120    90    27
-    110    90    24
-f2014 1
-    0    1    0
-c0
-4
-    110    90    24
-    120    90    27
-    120    90    24
-    110    90    24
-f2015 1
-    0    1    -0
-c0
-4
-    130    90    24
-    120    90    27
-    130    90    27
-    130    90    24
-f2016 1
-    -0    1    -0
-c0
-4
-    120    90    24
-    120    90    27
-    130    90    24
-    120    90    24
-f2017 1
-    -0    -1    -0
-c0
-4
-    110    70    27
-    110    70    24
-    120    70    24
-    110    70    27
-f2018 1
-    -0    -1    -0
-c0
-4
-    130    70    27
-    120    70    27
-    130    70    24
-    130    70    27
-f2019 1
-    -0    -1    -0
-c0
-4
-    120    70    27
-    120    70    24
-    130    70    24
-    120    70    27
-f2020 1
-    -0    -1    -0
-c0
-4
-    120    70    27
-    110    70    27
-    120    70    24
-    120    70    27
-f2021 1
-    1    0    0
-c0
-4
-    130    90    27
-    130    80    24
-    130    90    24
-    130    90    27
-f2022 1
-    1    -0    -0
-c0
-4
-    130    70    27
-    130    70    24
-    130    80    24
-    130    70    27
-f2023 1
-    1    -0    -0
-c0
-4
-    130    80    27
-    130    80    24
-    130    90    27
-    130    80    27
-f2024 1
-    1    0    0
-c0
-4
-    130    80    27
-    130    70    27
-    130    80    24
-    130    80    27
-f2025 1
-    -0    1    -0
-c0
-4
-    70    130    24
-    70    130    27
-    80    130    27
-    70    130    24
-f2026 1
-    0    1    0
-c0
-4
-    70    130    24
-    80    130    27
-    80    130    24
-    70    130    24
-f2027 1
-    0    1    -0
-c0
-4
-    90    130    24
-    80    130    24
-    90    130    27
-    90    130    24
-f2028 1
-    -0    1    -0
-c0
-4
-    80    130    24
-    80    130    27
-    90    130    27
-    80    130    24
-f2029 1
-    1    0    0
-c0
-4
-    90    130    27
-    90    120    24
-    90    130    24
-    90    130    27
-f2030 1
-    1    -0    -0
-c0
-4
-    90    110    27
-    90    110    24
-    90    120    27
-    90    110    27
-f2031 1
-    1    0    0
-c0
-4
-    90    120    27
-    90    110    24
-    90    120    24
-    90    120    27
-f2032 1
-    1    -0    -0
-c0
-4
-    90    120    27
-    90    120    24
-    90    130    27
-    90    120    27
-f2033 1
-    -1    -0    -0
-c0
-4
-    70    130    27
-    70    130    24
-    70    120    27
-    70    130    27
-f2034 1
-    -1    0    0
-c0
-4
-    70    120    27
-    70    130    24
-    70    120    24
-    70    120    27
-f2035 1
-    -1    0    0
-c0
-4
-    70    110    27
-    70    120    27
-    70    110    24
-    70    110    27
-f2036 1
-    -1    -0    -0
-c0
-4
-    70    120    27
-    70    120    24
-    70    110    24
-    70    120    27
-f2037 1
-    0    -1    -0
-c0
-4
-    90    110    27
-    80    110    24
-    90    110    24
-    90    110    27
-f2038 1
-    -0    -1    -0
-c0
-4
-    70    110    27
-    70    110    24
-    80    110    24
-    70    110    27
-f2039 1
-    0    -1    -0
-c0
-4
-    80    110    27
-    80    110    24
-    90    110    27
-    80    110    27
-f2040 1
-    0    -1    0
-c0
-4
-    70    110    27
-    80    110    24
-    80    110    27
-    70    110    27
-""")
+        sio = AbstractGeoDataFrameDemos._dataset(
+            "GeoDataFrameDemos5", "cirSceneMesh2Corr.cir"
+        )
         return CirReader(sio).run()
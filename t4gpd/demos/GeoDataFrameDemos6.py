@@ -64,88 +64,9 @@ BDT_3-0_SHP_LAMB93_D044-ED2021-12-15/BATI/BATIMENT.shp', bbox=roi)
         buildings = buildings[ buildings.area > 0 ]
         buildings.to_csv('/tmp/nizan-buildings.csv', sep=';', index=False)
         '''
-        _sio = StringIO("""ID;NATURE;USAGE1;USAGE2;LEGER;ETAT;DATE_CREAT;DATE_MAJ;DATE_APP;DATE_CONF;SOURCE;ID_SOURCE;PREC_PLANI;PREC_ALTI;NB_LOGTS;NB_ETAGES;MAT_MURS;MAT_TOITS;HAUTEUR;Z_MIN_SOL;Z_MIN_TOIT;Z_MAX_TOIT;Z_MAX_SOL;ORIGIN_BAT;APP_FF;geometry
-BATIMENT0000000302929688;Indifférenciée;Résidentiel;;Non;En service;2012-06-19 19:05:58;2019-03-15 08:35:34;1880-01-01;;;;3.0;2.5;4.0;2.0;20;20;6.2;7.0;13.2;16.0;7.5;Cadastre;A 1.0;POLYGON Z ((355813.5 6688388.6 13.2, 355813.3 6688396.8 13.2, 355816.2 6688396.9 13.2, 355816.1 6688394.4 13.2, 355818.1 6688394.3 13.2, 355818.1 6688395.2 13.2, 355820.2 6688395.1 13.2, 355820.2 6688393 13.2, 355826 6688392.6 13.2, 355826.2 6688391.6 13.2, 355826.5 6688388.6 13.2, 355823.6 6688388.4 13.2, 355813.5 6688388.6 13.2))
-BATIMENT0000000302929689;Indifférenciée;Résidentiel;Annexe;Non;En service;2012-06-19 19:05:58;2019-03-15 08:35:34;1900-01-01;;;;3.0;1.0;9.0;5.0;10;20;14.9;7.1;22.0;24.1;7.4;Cadastre;A 1.0;POLYGON Z ((355826.2 6688391.6 22, 355829.2 6688391.7 22, 355828.9 6688396 22, 355838 6688396.644247787 22, 355838 6688389.472413793 22, 355826.5 6688388.6 22, 355826.2 6688391.6 22))
-BATIMENT0000000302929682;Indifférenciée;Résidentiel;Annexe;Non;En service;2012-06-19 19:05:58;2019-03-15 08:35:34;1932-01-01;;;;3.0;1.0;6.0;4.0;20;20;9.6;6.5;16.2;19.0;7.4;Cadastre;C 0.2;POLYGON Z ((355736.8 6688397.4 16.2, 355736.9 6688400 16.2, 355746.9 6688399.8 16.2, 355749 6688399.8 16.2, 355764.4 6688399.5 16.2, 355776 6688399.3 16.2, 355776.2 6688396.6 16.2, 355736.8 6688397.4 16.2))
-BATIMENT0000000302929684;Indifférenciée;Résidentiel;Commercial et services;Non;En service;2012-06-19 19:05:58;2019-03-15 08:35:34;1850-01-01;;;;3.0;1.0;8.0;5.0;10;20;4.7;6.7;11.5;22.5;7.5;Cadastre;A 1.0;POLYGON Z ((355822.2 6688400.1 11.5, 355822.1 6688397.7 11.5, 355825.1 6688397.5 11.5, 355825.3 6688402 11.5, 355826.6 6688402 11.5, 355838 6688401.912977099 11.5, 355838 6688396.644247787 11.5, 355828.9 6688396 11.5, 355826 6688396.2 11.5, 355816.2 6688396.9 11.5, 355813.3 6688396.8 11.5, 355793.1 6688398.4 11.5, 355793.3 6688402 11.5, 355822.2 6688400.1 11.5))
-BATIMENT0000000302929814;Indifférenciée;Sportif;;Non;En service;2012-06-19 19:05:58;2018-09-18 13:45:18;;;;;3.0;1.0;;;;;5.9;6.8;12.7;16.4;7.3;Cadastre;;POLYGON Z ((355650.8 6688390.8 12.7, 355651.0129032258 6688404 12.7, 355657.35945945943 6688404 12.7, 355657 6688390.7 12.7, 355650.8 6688390.8 12.7))
-BATIMENT0000000302929680;Indifférenciée;Résidentiel;Annexe;Non;En service;2012-06-19 19:05:58;2019-03-15 08:35:34;1870-01-01;;;;3.0;1.0;10.0;3.0;10;10;4.7;6.3;11.1;18.6;7.4;Cadastre;A 1.0;POLYGON Z ((355776 6688399.3 11.1, 355764.4 6688399.5 11.1, 355764.6647058824 6688404 11.1, 355793.4 6688404 11.1, 355793.4 6688403.8 11.1, 355793.3 6688402 11.1, 355793.1 6688398.4 11.1, 355776 6688399.3 11.1))
-BATIMENT0000000302929686;Indifférenciée;Résidentiel;Annexe;Non;En service;2012-06-19 19:05:58;2019-03-15 08:35:34;1870-01-01;;;;3.0;2.5;1.0;2.0;10;10;8.3;7.0;15.3;16.6;7.0;Cadastre;A 1.0;POLYGON Z ((355736.9 6688400 15.3, 355737.11739130435 6688404 15.3, 355747.0657894737 6688404 15.3, 355746.9 6688399.8 15.3, 355736.9 6688400 15.3))
-BATIMENT0000000302929683;Indifférenciée;Indifférencié;;Oui;En service;2012-06-19 19:05:58;2018-09-18 13:45:18;;;;;3.0;1.0;;;;;4.7;7.0;11.7;15.6;7.2;Cadastre;;POLYGON Z ((355793.4 6688404 11.7, 355795.8 6688404 11.7, 355795.8 6688403.7 11.7, 355793.4 6688403.8 11.7, 355793.4 6688404 11.7))
-BATIMENT0000000302929825;Indifférenciée;Indifférencié;;Oui;En service;2012-06-19 19:05:58;2018-09-18 13:45:21;;;;;3.0;2.5;;;;;6.4;6.3;12.7;18.0;7.6;Cadastre;;POLYGON Z ((355716 6688402 12.7, 355704 6688402.4 12.7, 355669.2 6688403.6 12.7, 355669.2133333334 6688404 12.7, 355716.1142857143 6688404 12.7, 355716 6688402 12.7))
-BATIMENT0000000302929685;Indifférenciée;Résidentiel;Commercial et services;Non;En service;2012-06-19 19:05:58;2019-03-15 08:35:34;1800-01-01;;;;3.0;2.5;10.0;5.0;10;29;11.5;7.0;18.5;22.3;7.3;Cadastre;A 1.0;POLYGON Z ((355826.6 6688402 18.5, 355826.6625 6688404 18.5, 355838 6688404 18.5, 355838 6688401.912977099 18.5, 355826.6 6688402 18.5))
-BATIMENT0000000302929918;Industriel, agricole ou commercial;Industriel;Commercial et services;Non;En service;2012-06-19 19:05:58;2019-03-15 08:35:34;;;;;3.0;2.5;0.0;1.0;;;5.5;7.8;13.3;15.4;8.5;Cadastre;B 0.5;POLYGON Z ((355661 6688249.4 13.3, 355658.290174472 6688204 13.3, 355638 6688204 13.3, 355638 6688239.569354839 13.3, 355661 6688249.4 13.3))
-BATIMENT0000000302929902;Indifférenciée;Commercial et services;;Non;En service;2012-06-19 19:05:58;2019-07-01 11:21:06;;;;;3.0;2.5;;;;;4.6;7.1;11.7;12.2;7.9;Cadastre;;POLYGON Z ((355704.3 6688214.9 11.7, 355718 6688214.3 11.7, 355717.6 6688207.5 11.7, 355739.9 6688206.2 11.7, 355740.4 6688213.8 11.7, 355760.2 6688212.9 11.7, 355763 6688204.9 11.7, 355763.2880000001 6688204 11.7, 355703.6588235294 6688204 11.7, 355704.3 6688214.9 11.7))
-BATIMENT0000000029191872;Eglise;Religieux;;Non;En service;2006-10-04 09:41:10;2012-06-19 19:05:58;;;;;2.5;1.5;;;;;12.0;7.0;;;;Imagerie aérienne;;POLYGON Z ((355810.2 6688204.2 19, 355809.9 6688205.5 12.3, 355805.84117647103 6688204 12.3, 355805.24230769224 6688204 12.296153846150393, 355803.8 6688209 12.2, 355808.8 6688210.8 18.9, 355805.2 6688221.3 18.7, 355800.9 6688219.8 18.8, 355800.2 6688222.5 18.8, 355806.7 6688224.7 19, 355813.5 6688205.2 19, 355810.2 6688204.2 19))
-BATIMENT0000000029192327;Eglise;Religieux;;Non;En service;2006-10-04 09:41:10;2012-06-19 19:05:58;;;;;2.5;1.5;;;;;13.3;7.0;;;;Imagerie aérienne;;POLYGON Z ((355832.5 6688230.7 20.3, 355828.3 6688228.8 20.2, 355833.4 6688212.2 12.7, 355832 6688211.6 12.7, 355825.6 6688230.8 12.7, 355831.2 6688234 12.7, 355832.5 6688230.7 20.3))
-BATIMENT0000000302929394;Indifférenciée;Indifférencié;;Non;En service;2012-06-19 19:05:58;2018-09-18 13:45:21;;;;;3.0;2.5;;;;;7.9;7.0;14.9;19.1;7.8;Cadastre;;POLYGON Z ((355832.2 6688218.6 14.9, 355838 6688220.550442478 14.9, 355838 6688214.861538461 14.9, 355833.9 6688213.6 14.9, 355832.2 6688218.6 14.9))
-BATIMENT0000000302929877;Indifférenciée;Commercial et services;;Non;En service;2012-06-19 19:05:58;2019-07-01 11:21:06;;;;;3.0;2.5;;;;;3.7;7.0;10.7;11.3;8.0;Cadastre;;POLYGON Z ((355757.6 6688222.2 10.7, 355757.9 6688221.5 10.7, 355747.6 6688217.8 10.7, 355742.2 6688233.3 10.7, 355752.5 6688236.9 10.7, 355757.6 6688222.2 10.7))
-BATIMENT0000000029191864;Eglise;Religieux;;Non;En service;2006-10-04 09:41:10;2012-06-19 19:05:58;;;;;2.5;1.5;;;;;19.6;7.0;;;;Imagerie aérienne;;POLYGON Z ((355812 6688260.3 22.6, 355815.3 6688251.2 22.8, 355818.5 6688252.5 24, 355819 6688249.8 24, 355824.6 6688251.4 24, 355831.2 6688234 24.1, 355825.6 6688230.8 24.2, 355832 6688211.6 23.9, 355813.5 6688205.2 24.2, 355806.7 6688224.7 24.2, 355800.2 6688222.5 24.3, 355798.7 6688228.1 26.6, 355794.4 6688241.4 24.1, 355800.1 6688243.5 24, 355799.5 6688245.7 23.8, 355803 6688247.2 22.4, 355799.5 6688256.1 22.3, 355812 6688260.3 22.6))
-BATIMENT0000000029191869;Eglise;Religieux;;Non;En service;2006-10-04 09:41:10;2012-06-19 19:05:58;;;;;2.5;1.5;;;;;6.5;7.0;;;;Imagerie aérienne;;POLYGON Z ((355794.3 6688226.4 13.3, 355789.2 6688241.2 13.4, 355791.9 6688242.4 13.5, 355788.4 6688252.3 13.3, 355799.5 6688256.1 13.3, 355803 6688247.2 13.3, 355799.5 6688245.7 13.3, 355800.1 6688243.5 13.3, 355794.4 6688241.4 13.3, 355798.7 6688228.1 13.3, 355794.3 6688226.4 13.3))
-BATIMENT0000000302929870;Indifférenciée;Commercial et services;;Non;En service;2012-06-19 19:05:58;2019-07-01 11:21:06;;;;;3.0;1.0;;;;;7.1;7.0;14.2;19.7;7.4;Cadastre;;POLYGON Z ((355688.8 6688253.2 14.2, 355688.8 6688249.5 14.2, 355735.1 6688247 14.2, 355735.3 6688244.1 14.2, 355740.7 6688243.8 14.2, 355740.7 6688237.6 14.2, 355734.9 6688237.9 14.2, 355734.9 6688237.2 14.2, 355686.2 6688240 14.2, 355685.8 6688233.3 14.2, 355682.2 6688233.5 14.2, 355683.4 6688253.5 14.2, 355688.8 6688253.2 14.2))
-BATIMENT0000000302929869;Indifférenciée;Commercial et services;;Non;En service;2012-06-19 19:05:58;2019-07-01 11:21:06;;;;;3.0;1.0;;;;;3.2;7.1;10.4;14.7;7.7;Cadastre;;POLYGON Z ((355682.2 6688233.5 10.4, 355679.5 6688233.6 10.4, 355680.5 6688253.5 10.4, 355683.4 6688253.5 10.4, 355682.2 6688233.5 10.4))
-BATIMENT0000000302929871;Indifférenciée;Commercial et services;;Non;En service;2012-06-19 19:05:58;2019-07-01 11:21:06;;;;;3.0;2.5;;;;;3.4;7.0;10.4;11.2;7.3;Cadastre;;POLYGON Z ((355734.9 6688248.5 10.4, 355735.1 6688252.7 10.4, 355741.6 6688252.3 10.4, 355741.4 6688248 10.4, 355734.9 6688248.5 10.4))
-BATIMENT0000000029192488;Eglise;Religieux;;Non;En service;2006-10-04 09:41:10;2012-06-19 19:05:58;;;;;2.5;1.5;;;;;12.8;7.0;;;;Imagerie aérienne;;POLYGON Z ((355823.4 6688264.2 14.5, 355825.5 6688256.7 14.4, 355823 6688255.5 19.8, 355824.6 6688251.4 14.5, 355819 6688249.8 14.5, 355818.5 6688252.5 14.5, 355815.3 6688251.2 14.5, 355812 6688260.3 14.5, 355823.4 6688264.2 14.5))
-BATIMENT0000000302929612;Indifférenciée;Indifférencié;;Non;En service;2012-06-19 19:05:58;2018-09-18 13:45:18;;;;;3.0;1.0;;;;;1.6;7.2;8.8;11.9;7.6;Cadastre;;POLYGON Z ((355836.7 6688268.5 8.8, 355835.1 6688272.1 8.8, 355835.6 6688272.3 8.8, 355838 6688273.188888889 8.8, 355838 6688268.948809524 8.8, 355836.7 6688268.5 8.8))
-BATIMENT0000000302930005;Indifférenciée;Indifférencié;;Non;En service;2012-06-19 19:05:58;2018-09-18 13:45:21;;;;;3.0;2.5;;;;;4.0;6.5;10.5;11.5;7.7;Cadastre;;POLYGON Z ((355734.7 6688283.6 10.5, 355740.5 6688268.2 10.5, 355732.9 6688265.3 10.5, 355730 6688272.8 10.5, 355704 6688262.2 10.5, 355693.7 6688263.1 10.5, 355709.6 6688269.6 10.5, 355712.9 6688270.6 10.5, 355716.7 6688272.1 10.5, 355715.3 6688275.8 10.5, 355734.7 6688283.6 10.5))
-BATIMENT0000000302929613;Indifférenciée;Indifférencié;;Oui;En service;2012-06-19 19:05:58;2018-09-18 13:45:21;;;;;3.0;2.5;;;;;5.0;7.0;12.0;17.2;7.5;Cadastre;;POLYGON Z ((355834.5 6688274.9 12, 355838 6688276.275 12, 355838 6688273.188888889 12, 355835.6 6688272.3 12, 355834.5 6688274.9 12))
-BATIMENT0000000302929597;Indifférenciée;Résidentiel;;Non;En service;2012-06-19 19:05:58;2019-03-15 08:35:34;1960-01-01;;;;3.0;2.5;4.0;3.0;20;20;5.3;6.6;11.9;19.0;7.5;Cadastre;A 1.0;POLYGON Z ((355639.8 6688285.7 11.9, 355640.7 6688276.7 11.9, 355641.3 6688271.1 11.9, 355638 6688269.765957447 11.9, 355638 6688285.516326531 11.9, 355639.8 6688285.7 11.9))
-BATIMENT0000000302929615;Indifférenciée;Annexe;;Non;En service;2012-06-19 19:05:58;2019-03-15 08:35:34;;;;;3.0;2.5;0.0;1.0;01;02;4.8;7.0;11.8;;;Cadastre;A 1.0;POLYGON Z ((355831.2 6688283.3 11.8, 355833.4 6688283.9 11.8, 355837.5 6688285 11.8, 355838 6688283.409090909 11.8, 355838 6688276.275 11.8, 355834.5 6688274.9 11.8, 355831.2 6688283.3 11.8))
-BATIMENT0000002011295446;Indifférenciée;Indifférencié;;Non;En service;2018-06-04 12:14:25;;;2017-07-01;;;2.5;1.5;;;;;12.0;6.1;;;;Imagerie aérienne;;POLYGON Z ((355650.9 6688287.1 18.1, 355662.8 6688288.2 16.6, 355679.3 6688289.6 16.6, 355680.3 6688278.1 16.6, 355680.2 6688274 11.3, 355667.1 6688272.6 11.3, 355666.6 6688276.6 15.9, 355663.8 6688276.4 15.9, 355663.6 6688274.8 11.2, 355652.3 6688273.7 10.9, 355652 6688276.3 15.5, 355651.7 6688277.9 17.2, 355640.7 6688276.7 11.9, 355639.8 6688285.7 11.9, 355650.9 6688287.1 18.1))
-BATIMENT0000002275362861;Indifférenciée;Indifférencié;;Non;En service;2021-12-05 17:02:40;;;2020-06-22;;;2.5;1.5;;;;;16.8;7.6;;;;Imagerie aérienne;;POLYGON Z ((355823.1 6688288.5 18.6, 355821.6 6688295 21.7, 355821.3 6688296 21.7, 355814.7 6688295.2 24.3, 355815.7 6688290.9 24.4, 355816.5 6688287 13.1, 355785.4 6688276.9 18.8, 355786.4 6688274.5 18.9, 355784.9 6688274.2 21.7, 355786.3 6688270.5 22.3, 355787.5 6688267.2 18.5, 355773.2 6688262.3 19.1, 355772.2 6688265.4 21.3, 355764.9 6688285.7 21, 355761.7 6688295.5 16, 355776.9 6688296.9 24.3, 355813.6 6688300.4 24.3, 355820.3 6688301.5 21.5, 355820.2 6688302.2 21.7, 355836.9 6688303.7 21.7, 355837 6688302.9 21.7, 355838 6688302.940404041 21.40707070707117, 355838 6688292.5636363635 19.083766233763516, 355823.1 6688288.5 18.6))
-BATIMENT0000002011293389;Indifférenciée;Commercial et services;;Non;En service;2018-06-04 12:14:25;2019-03-15 08:35:34;2015-01-01;2017-07-01;;;2.5;1.5;0.0;5.0;;;16.6;7.1;;;;Imagerie aérienne;C 0.1;POLYGON Z ((355695.8 6688291.3 21.8, 355699.6 6688280.7 20.8, 355686.5 6688276.1 23.7, 355682.7 6688286.1 23.7, 355695.8 6688291.3 21.8))
-BATIMENT0000000302929614;Indifférenciée;Résidentiel;Commercial et services;Non;En service;2012-06-19 19:05:58;2019-03-15 08:35:34;1900-01-01;;;;3.0;2.5;2.0;2.0;20;20;7.3;7.1;14.4;20.8;7.6;Cadastre;A 1.0;POLYGON Z ((355837.5 6688285 14.4, 355838 6688285.160714285 14.4, 355838 6688283.409090909 14.4, 355837.5 6688285 14.4))
-BATIMENT0000000302929816;Indifférenciée;Commercial et services;;Oui;En service;2012-06-19 19:05:58;2019-07-01 11:21:06;;;;;3.0;2.5;;;;;12.9;6.3;19.2;19.7;7.2;Cadastre;;POLYGON Z ((355657.4 6688309.5 19.2, 355659.6 6688308.5 19.2, 355660.9 6688307.9 19.2, 355659.6 6688307.8 19.2, 355657.6 6688307.4 19.2, 355657.4 6688309.5 19.2))
-BATIMENT0000000302929821;Indifférenciée;Indifférencié;;Oui;En service;2012-06-19 19:05:58;2018-09-18 13:45:21;;;;;3.0;2.5;;;;;12.8;6.3;19.1;21.4;7.4;Cadastre;;POLYGON Z ((355638.3 6688305.6 19.1, 355638 6688305.569662921 19.1, 355638 6688313.9399999995 19.1, 355638.3 6688305.6 19.1))
-BATIMENT0000000302929835;Indifférenciée;Résidentiel;Annexe;Non;En service;2012-06-19 19:05:58;2019-03-15 08:35:34;1860-01-01;;;;3.0;2.5;5.0;2.0;10;20;7.2;6.6;13.8;17.1;8.1;Cadastre;A 0.3;POLYGON Z ((355693.1 6688319 13.8, 355698.4 6688319.9 13.8, 355702.3 6688320.4 13.8, 355702.1 6688311.8 13.8, 355682 6688309.9 13.8, 355682.2 6688317.4 13.8, 355691.3 6688318.7 13.8, 355693.1 6688319 13.8))
-BATIMENT0000000302929832;Indifférenciée;Résidentiel;;Non;En service;2012-06-19 19:05:58;2019-03-15 08:35:34;1930-01-01;;;;3.0;2.5;1.0;2.0;10;20;7.5;6.5;14.0;17.1;7.6;Cadastre;A 0.9;POLYGON Z ((355682.2 6688317.4 14, 355682 6688309.9 14, 355673.7 6688309.1 14, 355672.8 6688319.3 14, 355672.7 6688320.9 14, 355676.8 6688321.1 14, 355680.6 6688321.3 14, 355682.3 6688321.4 14, 355682.2 6688317.4 14))
-BATIMENT0000000302929818;Indifférenciée;Commercial et services;;Non;En service;2012-06-19 19:05:58;2019-07-01 11:21:06;1930-01-01;;;;3.0;1.0;0.0;1.0;;;5.3;7.1;12.5;16.1;7.5;Cadastre;A 1.0;POLYGON Z ((355673.7 6688309.1 12.5, 355666.6 6688308.5 12.5, 355666.9 6688320.6 12.5, 355667 6688322.3 12.5, 355667 6688323.4 12.5, 355669.6 6688323.5 12.5, 355669.7 6688321.9 12.5, 355669.9 6688319 12.5, 355672.8 6688319.3 12.5, 355673.7 6688309.1 12.5))
-BATIMENT0000000302929839;Indifférenciée;Commercial et services;;Non;En service;2012-06-19 19:05:58;2019-03-15 08:35:34;2012-01-01;;;;3.0;2.5;0.0;1.0;;;7.7;6.3;14.0;17.0;7.5;Cadastre;C 0.4;POLYGON Z ((355712 6688329.6 14, 355711 6688312.7 14, 355702.1 6688311.8 14, 355702.3 6688320.4 14, 355698.4 6688319.9 14, 355698.4 6688321.4 14, 355701.6 6688322.1 14, 355701.5 6688329.1 14, 355701.4 6688330.7 14, 355712 6688329.6 14))
-BATIMENT0000000302929815;Indifférenciée;Commercial et services;;Oui;En service;2012-06-19 19:05:58;2019-07-01 11:21:06;;;;;3.0;2.5;;;;;10.4;6.3;16.7;;;Cadastre;;POLYGON Z ((355661.7 6688322.6 16.7, 355667 6688322.3 16.7, 355666.9 6688320.6 16.7, 355660.8 6688320.8 16.7, 355659.2 6688320.9 16.7, 355660.8 6688322 16.7, 355661.7 6688322.6 16.7))
-BATIMENT0000000302929831;Indifférenciée;Commercial et services;;Oui;En service;2012-06-19 19:05:58;2019-07-01 11:21:06;;;;;3.0;1.0;;;;;2.7;7.1;9.9;11.5;7.5;Cadastre;;POLYGON Z ((355672.4 6688323.6 9.9, 355672.6 6688322.1 9.9, 355669.7 6688321.9 9.9, 355669.6 6688323.5 9.9, 355672.4 6688323.6 9.9))
-BATIMENT0000000302929413;Indifférenciée;Annexe;;Non;En service;2012-06-19 19:05:58;2019-03-15 08:35:34;;;;;3.0;1.0;0.0;1.0;00;00;3.2;7.3;10.5;11.0;7.7;Cadastre;A 1.0;POLYGON Z ((355778 6688326.2 10.5, 355792.6 6688328 10.5, 355793.5 6688319.9 10.5, 355778.8 6688318.6 10.5, 355778 6688326.2 10.5))
-BATIMENT0000000302929833;Indifférenciée;Commercial et services;;Oui;En service;2012-06-19 19:05:58;2019-07-01 11:21:06;;;;;3.0;2.5;;;;;4.5;6.3;10.8;14.7;7.4;Cadastre;;POLYGON Z ((355682.3 6688321.4 10.8, 355680.6 6688321.3 10.8, 355680.6 6688326 10.8, 355682.4 6688326 10.8, 355682.3 6688321.4 10.8))
-BATIMENT0000000302929838;Indifférenciée;Indifférencié;;Non;En service;2012-06-19 19:05:58;2018-09-18 13:45:21;;;;;3.0;2.5;;;;;5.5;6.3;11.8;13.9;8.1;Cadastre;;POLYGON Z ((355691.3 6688318.7 11.8, 355690.5 6688323.5 11.8, 355691 6688324 11.8, 355691 6688331.8 11.8, 355693.4 6688331.5 11.8, 355695.3 6688331.3 11.8, 355695.3 6688329.6 11.8, 355695.1 6688321.1 11.8, 355693 6688320.9 11.8, 355693.1 6688319 11.8, 355691.3 6688318.7 11.8))
-BATIMENT0000000302929414;Indifférenciée;Résidentiel;Annexe;Non;En service;2012-06-19 19:05:58;2019-03-15 08:35:34;1996-01-01;;;;3.0;2.5;12.0;3.0;00;00;7.1;7.0;14.1;15.0;7.6;Cadastre;A 1.0;POLYGON Z ((355792.6 6688328 14.1, 355811.1 6688330.7 14.1, 355811.1 6688329.9 14.1, 355811.8 6688321.6 14.1, 355793.5 6688319.9 14.1, 355792.6 6688328 14.1))
-BATIMENT0000000302929418;Indifférenciée;Résidentiel;Commercial et services;Non;En service;2012-06-19 19:05:58;2019-03-15 08:35:34;1900-01-01;;;;3.0;2.5;6.0;4.0;10;20;10.3;7.0;17.3;20.7;7.9;Cadastre;A 1.0;POLYGON Z ((355828.2 6688328.1 17.3, 355833.8 6688329.5 17.3, 355838 6688330.118604652 17.3, 355838 6688324.023529411 17.3, 355829 6688323.2 17.3, 355828.2 6688328.1 17.3))
-BATIMENT0000000302929417;Indifférenciée;Résidentiel;Annexe;Non;En service;2012-06-19 19:05:58;2019-03-15 08:35:34;1984-01-01;;;;3.0;2.5;8.0;2.0;20;20;7.6;7.0;14.6;16.8;7.9;Cadastre;A 1.0;POLYGON Z ((355811.1 6688329.9 14.6, 355816 6688330.2 14.6, 355816.2 6688328.6 14.6, 355818.2 6688328.9 14.6, 355817.4 6688333.7 14.6, 355827.2 6688335 14.6, 355827.5 6688332.8 14.6, 355828.2 6688328.1 14.6, 355829 6688323.2 14.6, 355811.8 6688321.6 14.6, 355811.1 6688329.9 14.6))
-BATIMENT0000000302929834;Indifférenciée;Indifférencié;;Oui;En service;2012-06-19 19:05:58;2018-09-18 13:45:21;;;;;3.0;2.5;;;;;4.1;6.3;10.4;14.4;8.1;Cadastre;;POLYGON Z ((355682.3 6688321.4 10.4, 355682.4 6688326 10.4, 355682.6 6688332.7 10.4, 355682.8 6688340.2 10.4, 355686.9 6688340.6 10.4, 355691.1 6688340.9 10.4, 355691 6688339.5 10.4, 355691 6688331.8 10.4, 355691 6688324 10.4, 355690.5 6688323.5 10.4, 355691.3 6688318.7 10.4, 355682.2 6688317.4 10.4, 355682.3 6688321.4 10.4))
-BATIMENT0000000302929921;Indifférenciée;Résidentiel;Commercial et services;Non;En service;2012-06-19 19:05:58;2019-03-15 08:35:34;1935-01-01;;;;3.0;2.5;38.0;4.0;20;20;14.9;6.0;20.9;24.2;7.5;Cadastre;A 1.0;POLYGON Z ((355733.3 6688338.8 20.9, 355737.3 6688342.3 20.9, 355764.2 6688344.5 20.9, 355766.5 6688317.4 20.9, 355736.1 6688314.6 20.9, 355732.4 6688318.1 20.9, 355733.3 6688338.8 20.9), (355741.8 6688321.2 20.9, 355748.1 6688321.7 20.9, 355751.2 6688321.9 20.9, 355757 6688322.5 20.9, 355755.9 6688334.7 20.9, 355747.7 6688334.1 20.9, 355742.2 6688333.7 20.9, 355741.8 6688321.2 20.9))
-BATIMENT0000000302929840;Indifférenciée;Indifférencié;;Oui;En service;2012-06-19 19:05:58;2018-09-18 13:45:18;;;;;3.0;1.0;;;;;3.5;6.6;10.2;11.2;7.2;Cadastre;;POLYGON Z ((355698.1 6688331 10.2, 355700.9 6688330.7 10.2, 355701.4 6688330.7 10.2, 355701.5 6688329.1 10.2, 355695.3 6688329.6 10.2, 355695.3 6688331.3 10.2, 355698.1 6688331 10.2))
-BATIMENT0000000302929829;Indifférenciée;Commercial et services;;Oui;En service;2012-06-19 19:05:58;2019-07-01 11:21:06;;;;;3.0;1.0;;;;;3.0;6.7;9.7;15.4;7.5;Cadastre;;POLYGON Z ((355672.6 6688322.1 9.7, 355672.4 6688323.6 9.7, 355669.6 6688323.5 9.7, 355667 6688323.4 9.7, 355667.2 6688331.9 9.7, 355667.4 6688339 9.7, 355682.8 6688340.2 9.7, 355682.6 6688332.7 9.7, 355673.3 6688331.8 9.7, 355673.1 6688323.4 9.7, 355676.6 6688323.1 9.7, 355676.8 6688321.1 9.7, 355672.7 6688320.9 9.7, 355672.6 6688322.1 9.7))
-BATIMENT0000000302929841;Indifférenciée;Indifférencié;;Oui;En service;2012-06-19 19:05:58;2018-09-18 13:45:18;;;;;3.0;1.0;;;;;3.7;6.5;10.2;11.1;7.1;Cadastre;;POLYGON Z ((355695.3 6688331.3 10.2, 355693.4 6688331.5 10.2, 355693.5 6688334.2 10.2, 355698.2 6688333.9 10.2, 355698.1 6688331 10.2, 355695.3 6688331.3 10.2))
-BATIMENT0000000302929817;Indifférenciée;Indifférencié;;Oui;En service;2012-06-19 19:05:58;2018-09-18 13:45:18;;;;;3.0;1.0;;;;;3.0;7.1;10.1;13.5;7.5;Cadastre;;POLYGON Z ((355641.9 6688323.1 10.1, 355638 6688322.555813953 10.1, 355638 6688343.042105263 10.1, 355639.2 6688343.2 10.1, 355641.9 6688323.1 10.1))
-BATIMENT0000000302929419;Indifférenciée;Résidentiel;Commercial et services;Non;En service;2012-06-19 19:05:58;2019-03-15 08:35:34;1870-01-01;;;;3.0;1.0;7.0;4.0;10;20;12.8;7.3;20.2;22.0;7.8;Cadastre;A 1.0;POLYGON Z ((355827.2 6688335 20.2, 355838 6688336.07434555 20.2, 355838 6688330.118604652 20.2, 355833.8 6688329.5 20.2, 355832.5 6688333.5 20.2, 355827.5 6688332.8 20.2, 355827.2 6688335 20.2))
-BATIMENT0000000302929842;Indifférenciée;Résidentiel;;Non;En service;2012-06-19 19:05:58;2019-03-15 08:35:34;1890-01-01;;;;3.0;2.5;5.0;3.0;20;20;8.6;6.4;15.0;20.2;7.3;Cadastre;A 1.0;POLYGON Z ((355701.6 6688339.4 15, 355701.7 6688341.7 15, 355712.7 6688342.6 15, 355712 6688329.6 15, 355701.4 6688330.7 15, 355700.9 6688330.7 15, 355701.6 6688339.4 15))
-BATIMENT0000000302929812;Indifférenciée;Commercial et services;;Non;En service;2012-06-19 19:05:58;2019-07-01 11:21:06;;;;;3.0;2.5;;;;;11.1;6.3;17.4;19.4;7.4;Cadastre;;POLYGON Z ((355648.6 6688319.8 17.4, 355649.6 6688367.9 17.4, 355650.8 6688367.8 17.4, 355650.8 6688364.5 17.4, 355657.8 6688364.5 17.4, 355657.6 6688357.8 17.4, 355657.1 6688321 17.4, 355659.2 6688320.9 17.4, 355660.8 6688320.8 17.4, 355666.9 6688320.6 17.4, 355666.6 6688308.5 17.4, 355660.9 6688307.9 17.4, 355659.6 6688308.5 17.4, 355657.4 6688309.5 17.4, 355657.6 6688307.4 17.4, 355656.8 6688307.3 17.4, 355638.3 6688305.6 17.4, 355638 6688313.9399999995 17.4, 355638 6688319.505555555 17.4, 355648.6 6688319.8 17.4))
-BATIMENT0000000302929416;Indifférenciée;Résidentiel;Annexe;Non;En service;2012-06-19 19:05:58;2019-03-15 08:35:34;1880-01-01;;;;3.0;1.0;9.0;5.0;10;20;13.5;7.1;20.7;24.3;7.8;Cadastre;A 1.0;POLYGON Z ((355813.8 6688338 20.7, 355825 6688339.3 20.7, 355836.3 6688340.9 20.7, 355837.5 6688340.7 20.7, 355838 6688340.76 20.7, 355838 6688336.07434555 20.7, 355827.2 6688335 20.7, 355817.4 6688333.7 20.7, 355814.5 6688333.4 20.7, 355813.8 6688338 20.7))
-BATIMENT0000000302929415;Indifférenciée;Résidentiel;;Non;En service;2012-06-19 19:05:58;2019-03-15 08:35:34;1963-01-01;;;;3.0;1.0;12.0;3.0;00;00;4.5;7.2;11.8;17.1;7.7;Cadastre;A 1.0;POLYGON Z ((355777.3 6688332.6 11.8, 355792.6 6688334.8 11.8, 355800.4 6688335.9 11.8, 355804.9 6688336.9 11.8, 355804.5 6688342.4 11.8, 355804.2 6688347.7 11.8, 355812.3 6688348.3 11.8, 355813.3 6688341.7 11.8, 355813.4 6688340.9 11.8, 355813.8 6688338 11.8, 355814.5 6688333.4 11.8, 355777.7 6688328.1 11.8, 355777.3 6688332.6 11.8))
-BATIMENT0000000302929424;Indifférenciée;Résidentiel;Annexe;Non;En service;2012-06-19 19:05:58;2019-03-15 08:35:34;1900-01-01;;;;3.0;2.5;7.0;2.0;00;00;6.1;7.0;13.1;15.9;7.8;Cadastre;A 1.0;POLYGON Z ((355770.2 6688345 13.1, 355791.6 6688346.7 13.1, 355792.5 6688336.7 13.1, 355792.6 6688334.8 13.1, 355777.3 6688332.6 13.1, 355770 6688331.7 13.1, 355770.2 6688345 13.1))
-BATIMENT0000000302929420;Indifférenciée;Indifférencié;;Non;En service;2012-06-19 19:05:58;2018-09-18 13:45:18;;;;;3.0;1.0;;;;;2.1;7.0;9.2;18.2;7.4;Cadastre;;POLYGON Z ((355825 6688339.3 9.2, 355813.8 6688338 9.2, 355813.4 6688340.9 9.2, 355820.5 6688341.5 9.2, 355824.5 6688341.2 9.2, 355825 6688339.3 9.2))
-BATIMENT0000000302929836;Indifférenciée;Indifférencié;;Oui;En service;2012-06-19 19:05:58;2018-09-18 13:45:18;;;;;3.0;1.0;;;;;5.3;6.6;12.0;12.1;6.9;Cadastre;;POLYGON Z ((355692.2 6688341 12, 355692.2 6688339.6 12, 355691 6688339.5 12, 355691.1 6688340.9 12, 355692.2 6688341 12))
-BATIMENT0000000302929843;Indifférenciée;Indifférencié;;Oui;En service;2012-06-19 19:05:58;2018-09-18 13:45:18;;;;;3.0;1.0;;;;;10.8;6.6;17.5;19.5;7.2;Cadastre;;POLYGON Z ((355699.4 6688339.5 17.5, 355699.4 6688341.6 17.5, 355701.7 6688341.7 17.5, 355701.6 6688339.4 17.5, 355699.4 6688339.5 17.5))
-BATIMENT0000000302929423;Indifférenciée;Résidentiel;;Non;En service;2012-06-19 19:05:58;2019-03-15 08:35:34;1920-01-01;;;;3.0;1.0;1.0;1.0;50;10;3.8;7.3;11.1;16.2;7.8;Cadastre;A 1.0;POLYGON Z ((355792.6 6688334.8 11.1, 355792.5 6688336.7 11.1, 355791.6 6688346.7 11.1, 355804.2 6688347.7 11.1, 355804.5 6688342.4 11.1, 355801 6688342.2 11.1, 355800.4 6688335.9 11.1, 355792.6 6688334.8 11.1))
-BATIMENT0000000302929421;Indifférenciée;Indifférencié;;Non;En service;2012-06-19 19:05:58;2018-09-18 13:45:18;;;;;3.0;1.0;;;;;4.2;7.0;11.2;12.0;7.5;Cadastre;;POLYGON Z ((355823.2 6688342.9 11.2, 355822.7 6688344.3 11.2, 355824.1 6688344.5 11.2, 355824.1 6688343.8 11.2, 355824.2 6688343.1 11.2, 355823.2 6688342.9 11.2))
-BATIMENT0000000302929422;Indifférenciée;Résidentiel;Annexe;Non;En service;2012-06-19 19:05:58;2019-03-15 08:35:34;1948-01-01;;;;3.0;2.5;2.0;2.0;10;10;7.1;7.0;14.1;14.6;7.7;Cadastre;A 1.0;POLYGON Z ((355812.3 6688348.3 14.1, 355819.7 6688348.9 14.1, 355821.4 6688344 14.1, 355818.5 6688343.5 14.1, 355818.6 6688342 14.1, 355813.3 6688341.7 14.1, 355812.3 6688348.3 14.1))
-BATIMENT0000000302929425;Indifférenciée;Résidentiel;Annexe;Non;En service;2012-06-19 19:05:58;2019-03-15 08:35:34;;;;;3.0;2.5;14.0;4.0;10;20;10.1;7.0;17.1;21.2;8.0;Cadastre;A 1.0;POLYGON Z ((355824.5 6688341.2 17.1, 355824.2 6688343.1 17.1, 355824.1 6688343.8 17.1, 355826.5 6688344.2 17.1, 355826.6 6688345.9 17.1, 355829.7 6688346.7 17.1, 355829.4 6688347.8 17.1, 355823.7 6688346.9 17.1, 355823 6688349.1 17.1, 355822.7 6688350.6 17.1, 355838 6688353.784615384 17.1, 355838 6688342.15319149 17.1, 355836.3 6688341.9 17.1, 355836.3 6688340.9 17.1, 355825 6688339.3 17.1, 355824.5 6688341.2 17.1))
-BATIMENT0000000302929837;Indifférenciée;Résidentiel;Commercial et services;Non;En service;2012-06-19 19:05:58;2019-03-15 08:35:34;;;;;3.0;1.0;39.0;7.0;00;00;7.8;6.8;14.7;30.5;7.3;Cadastre;A 1.0;POLYGON Z ((355687 6688343.8 14.7, 355693.9 6688344.4 14.7, 355695.2 6688369.4 14.7, 355714.1 6688368.7 14.7, 355712.7 6688342.6 14.7, 355701.7 6688341.7 14.7, 355699.4 6688341.6 14.7, 355692.2 6688341 14.7, 355691.1 6688340.9 14.7, 355686.9 6688340.6 14.7, 355687 6688343.8 14.7))
-BATIMENT0000000302929694;Indifférenciée;Résidentiel;Annexe;Non;En service;2012-06-19 19:05:58;2019-03-15 08:35:34;1948-01-01;;;;3.0;2.5;24.0;4.0;20;20;11.3;7.0;18.3;20.9;8.0;Cadastre;A 1.0;POLYGON Z ((355808.9 6688365.7 18.3, 355813.8 6688366.4 18.3, 355838 6688369.599322034 18.3, 355838 6688359.687603306 18.3, 355832.1 6688359.2 18.3, 355821.6 6688358.4 18.3, 355809.7 6688357.4 18.3, 355808.9 6688365.7 18.3), (355824.3 6688364.7 18.3, 355824.2 6688366.1 18.3, 355820.4 6688365.7 18.3, 355820.4 6688364.2 18.3, 355824.3 6688364.7 18.3), (355833.7 6688364.9 18.3, 355833.6 6688366.1 18.3, 355831.2 6688366 18.3, 355831.3 6688364.7 18.3, 355833.7 6688364.9 18.3))
-BATIMENT0000000302929904;Indifférenciée;Commercial et services;;Non;En service;2012-06-19 19:05:58;2019-03-15 08:35:34;;;;;3.0;2.5;0.0;1.0;;;9.3;6.0;15.3;20.0;7.6;Cadastre;A 1.0;POLYGON Z ((355781 6688375.4 15.3, 355801.1 6688377.3 15.3, 355802.9 6688357.8 15.3, 355795.7 6688357.2 15.3, 355795.3 6688361.6 15.3, 355788.7 6688361 15.3, 355789.1 6688356.7 15.3, 355782.5 6688356.1 15.3, 355781 6688375.4 15.3))
-BATIMENT0000000302929820;Indifférenciée;Commercial et services;;Non;En service;2012-06-19 19:05:58;2019-07-01 11:21:06;;;;;3.0;1.0;;;;;3.3;6.7;10.0;14.1;7.1;Cadastre;;POLYGON Z ((355650.8 6688367.8 10, 355649.6 6688367.9 10, 355647.6 6688367.8 10, 355647.8 6688372.9 10, 355650.8 6688372.9 10, 355650.8 6688367.8 10))
-BATIMENT0000000302929827;Indifférenciée;Sportif;;Non;En service;2012-06-19 19:05:58;2018-09-18 13:45:21;;;;;3.0;2.5;;;;;6.3;6.3;12.6;17.1;7.6;Cadastre;;POLYGON Z ((355660.7 6688367.6 12.6, 355660.7 6688371.7 12.6, 355662.2 6688371.7 12.6, 355662.4 6688375.6 12.6, 355668.5 6688375.5 12.6, 355668.3 6688370.2 12.6, 355668.2 6688367.5 12.6, 355660.7 6688367.6 12.6))
-BATIMENT0000000302929811;Indifférenciée;Sportif;;Non;En service;2012-06-19 19:05:58;2018-09-18 13:45:18;;;;;3.0;1.0;;;;;4.3;6.9;11.2;16.6;7.3;Cadastre;;POLYGON Z ((355650.8 6688367.8 11.2, 355650.8 6688372.9 11.2, 355650.8 6688375.6 11.2, 355650.9 6688382.6 11.2, 355656.8 6688382.5 11.2, 355656.5 6688371.9 11.2, 355660.7 6688371.7 11.2, 355660.7 6688367.6 11.2, 355657.8 6688367.6 11.2, 355657.8 6688364.5 11.2, 355650.8 6688364.5 11.2, 355650.8 6688367.8 11.2))
-BATIMENT0000000302929690;Indifférenciée;Résidentiel;Annexe;Non;En service;2012-06-19 19:05:58;2019-03-15 08:35:34;;;;;3.0;2.5;29.0;4.0;20;20;13.5;6.2;19.7;22.4;7.5;Cadastre;C 0.8;POLYGON Z ((355734.6 6688355.4 19.7, 355735.5 6688371.3 19.7, 355744.6 6688370.9 19.7, 355744.1 6688361.8 19.7, 355769.8 6688363.8 19.7, 355768.1 6688386 19.7, 355747.4 6688386.6 19.7, 355745.3 6688385.2 19.7, 355744.9 6688378.8 19.7, 355735.9 6688379.2 19.7, 355736.7 6688395.7 19.7, 355776.3 6688395 19.7, 355776.8 6688388.7 19.7, 355779.6 6688354.9 19.7, 355738.1 6688351.5 19.7, 355734.6 6688355.4 19.7))
-BATIMENT0000000302929693;Indifférenciée;Résidentiel;Annexe;Non;En service;2012-06-19 19:05:58;2019-03-15 08:35:34;1880-01-01;;;;3.0;1.0;13.0;4.0;20;20;6.1;7.3;13.4;20.6;7.6;Cadastre;A 1.0;POLYGON Z ((355813.1 6688372 13.4, 355830.9 6688374.6 13.4, 355830.8 6688376 13.4, 355828.7 6688375.8 13.4, 355827.9 6688375.7 13.4, 355827.7 6688376.5 13.4, 355828.3 6688377.5 13.4, 355812.7 6688375.3 13.4, 355811.9 6688381.4 13.4, 355813.4 6688381.5 13.4, 355831.4 6688382.5 13.4, 355838 6688382.88076923 13.4, 355838 6688369.599322034 13.4, 355813.8 6688366.4 13.4, 355813.1 6688372 13.4))
-BATIMENT0000000302929695;Indifférenciée;Indifférencié;;Oui;En service;2012-06-19 19:05:58;2018-09-18 13:45:18;;;;;3.0;1.0;;;;;2.7;7.3;10.0;12.4;7.5;Cadastre;;POLYGON Z ((355811.9 6688381.4 10, 355811.4 6688384.9 10, 355813.1 6688385 10, 355813.4 6688381.5 10, 355811.9 6688381.4 10))
-BATIMENT0000000302929809;Indifférenciée;Commercial et services;;Non;En service;2012-06-19 19:05:58;2019-07-01 11:21:06;;;;;3.0;1.0;0.0;1.0;;;8.7;6.6;15.3;22.0;8.1;Cadastre;C 0.1;MULTIPOLYGON Z (((355650.8 6688390.8 15.3, 355650.9 6688382.6 15.3, 355650.8 6688375.6 15.3, 355645 6688375.8 15.3, 355645.17247706425 6688404 15.3, 355651.0129032258 6688404 15.3, 355650.8 6688390.8 15.3)), ((355639.2 6688343.2 15.3, 355638 6688343.042105263 15.3, 355638 6688352 15.3, 355639.2 6688343.2 15.3)))
-BATIMENT0000000302929691;Indifférenciée;Commercial et services;Résidentiel;Non;En service;2012-06-19 19:05:58;2019-03-15 08:35:34;1800-01-01;;;;3.0;2.5;3.0;4.0;;;9.0;7.0;16.0;21.7;7.5;Cadastre;A 1.0;POLYGON Z ((355826.5 6688388.6 16, 355838 6688389.472413793 16, 355838 6688382.88076923 16, 355831.4 6688382.5 16, 355831.1 6688384 16, 355823.9 6688383.8 16, 355823.9 6688384.8 16, 355823.6 6688388.4 16, 355826.5 6688388.6 16))
-BATIMENT0000000302929826;Indifférenciée;Commercial et services;;Non;En service;2012-06-19 19:05:58;2019-07-01 11:21:06;;;;;3.0;2.5;;;;;5.5;6.3;11.8;13.7;7.4;Cadastre;;POLYGON Z ((355714.2 6688370.5 11.8, 355702.3 6688371.1 11.8, 355704 6688402.4 11.8, 355716 6688402 11.8, 355714.2 6688370.5 11.8))
-BATIMENT0000000302929810;Indifférenciée;Sportif;;Non;En service;2012-06-19 19:05:58;2018-09-18 13:45:21;;;;;3.0;2.5;;;;;7.6;6.3;13.9;17.2;7.2;Cadastre;;POLYGON Z ((355650.9 6688382.6 13.9, 355650.8 6688390.8 13.9, 355657 6688390.7 13.9, 355656.8 6688382.5 13.9, 355650.9 6688382.6 13.9))
-BATIMENT0000000302929692;Indifférenciée;Indifférencié;;Oui;En service;2012-06-19 19:05:58;2018-09-18 13:45:18;;;;;3.0;1.0;;;;;2.6;7.2;9.9;13.0;7.5;Cadastre;;POLYGON Z ((355811 6688388.6 9.9, 355813.5 6688388.6 9.9, 355823.6 6688388.4 9.9, 355823.9 6688384.8 9.9, 355813.1 6688385 9.9, 355811.4 6688384.9 9.9, 355811 6688388.6 9.9))
-BATIMENT0000000302929828;Indifférenciée;Sportif;;Non;En service;2012-06-19 19:05:58;2018-09-18 13:45:18;;;;;3.0;1.0;;;;;9.7;6.8;16.5;17.6;7.4;Cadastre;;POLYGON Z ((355662.2 6688371.7 16.5, 355660.7 6688371.7 16.5, 355656.5 6688371.9 16.5, 355656.8 6688382.5 16.5, 355657 6688390.7 16.5, 355657.35945945943 6688404 16.5, 355663.1517647059 6688404 16.5, 355662.4 6688375.6 16.5, 355662.2 6688371.7 16.5))
-BATIMENT0000000302929824;Indifférenciée;Sportif;;Non;En service;2012-06-19 19:05:58;2018-09-18 13:45:18;;;MSS;MSS:71963;3.0;1.0;;;;;9.0;7.0;16.1;17.6;7.6;Cadastre;;POLYGON Z ((355662.4 6688375.6 16.1, 355663.1517647059 6688404 16.1, 355669.2133333334 6688404 16.1, 355669.2 6688403.6 16.1, 355668.5 6688375.5 16.1, 355662.4 6688375.6 16.1))
-""")
+        _sio = AbstractGeoDataFrameDemos._dataset(
+            "GeoDataFrameDemos6", "nizanDistrictInNantesBuildings.csv"
+        )
         return GeoDataFrameLib.read_csv(_sio)
 
     @staticmethod
@@ -164,26 +85,9 @@ TRANSPORT/TRONCON_DE_ROUTE.shp', bbox=roi)
         roads = roads[ roads.length > 0 ]
         roads.to_csv('/tmp/nizan-roads.csv', sep=';', index=False)
         '''
-        _sio = StringIO("""ID;NATURE;NOM_1_G;NOM_1_D;NOM_2_G;NOM_2_D;IMPORTANCE;FICTIF;POS_SOL;ETAT;DATE_CREAT;DATE_MAJ;DATE_APP;DATE_CONF;SOURCE;ID_SOURCE;PREC_PLANI;PREC_ALTI;NB_VOIES;LARGEUR;IT_VERT;PRIVE;SENS;CYCLABLE;BUS;URBAIN;VIT_MOY_VL;ACCES_VL;ACCES_PED;FERMETURE;NAT_RESTR;RESTR_H;RESTR_P;RESTR_PPE;RESTR_LAR;RESTR_LON;RESTR_MAT;BORNEDEB_G;BORNEDEB_D;BORNEFIN_G;BORNEFIN_D;INSEECOM_G;INSEECOM_D;TYP_ADRES;ALIAS_G;ALIAS_D;C_POSTAL_G;C_POSTAL_D;DATE_SERV;ID_VOIE_G;ID_VOIE_D;ID_RN;ID_ITI;NUMERO;NUM_EUROP;CL_ADMIN;GESTION;TOPONYME;ITI_CYCL;VOIE_VERTE;NATURE_ITI;NOM_ITI;geometry
-TRONROUT0000002223008770;Route à 1 chaussée;R PAUL NIZAN;R PAUL NIZAN;;;5;Non;0;En service;2021-02-16 12:55:59;;;;;;2.5;1.5;1.0;4.0;Non;Non;Sens direct;;Sens direct;Oui;0;Restreint aux ayants droit;;;;;;;;;Non;;;;;44109;44109;Classique;;;;;;44109#0A3;44109#0A3;;;;;;;;;;;;LINESTRING Z (355717.6 6688299.2 7.1, 355713.4 6688295.4 7.2, 355711.8 6688292.2 7.2, 355709.7 6688288.2 7.3, 355707.1 6688283.9 7.2, 355704 6688280 7.2, 355700.4 6688276.4 7.1, 355696 6688273.3 7.1, 355690.8 6688270.8 7, 355684.8 6688269.1 7, 355678.1 6688268.1 7, 355670.9 6688267.4 6.9, 355663.1 6688266.8 7, 355655 6688265.8 7, 355646.5 6688264.3 7.1, 355638 6688262.1 7.1)
-TRONROUT0000000326049883;Piste cyclable;;;;;6;Non;0;En service;2013-09-05 19:16:07;2021-02-16 12:55:59;;;;;5.0;2.5;;;Non;Non;Sans objet;;;Oui;0;Physiquement impossible;;;;;;;;;Non;;;;;44109;44109;Classique;;;;;;;;;;;;;;;;;;;LINESTRING Z (355638 6688257.690434783 7.27130434782536, 355646.2 6688260.4 7.2, 355653.8 6688261.8 7.2, 355667.1 6688263.4 7.1, 355682.5 6688264 7.1, 355692.9 6688267.6 7, 355705.6 6688274.1 7, 355719.6 6688283.1 7, 355729.2 6688289.2 7, 355738.8 6688304 7)
-TRONROUT0000000029474087;Route à 1 chaussée;BD BABIN CHEVAYE;BD BABIN CHEVAYE;;;4;Non;0;En service;2006-10-04 09:41:10;2021-02-16 12:55:59;;;;;2.5;1.5;2.0;7.0;Non;Non;Double sens;;;Oui;40;Libre;;;;;;;;;Non;34;19;18;1;44109;44109;Classique;;;44200;44200;;441090496;441090496;;;;;;;;;;;;LINESTRING Z (355638 6688295.739158767 6.9, 355715.9 6688302.8 6.9)
-TRONROUT0000002223008767;Rond-point;BD BABIN CHEVAYE;BD BABIN CHEVAYE;;;4;Non;0;En service;2021-02-16 12:55:59;;;;;;3.0;2.5;1.0;4.0;Non;Non;Sens direct;;;Oui;25;Libre;;;;;;;;;Non;;;;;44109;44109;Classique;;;44200;44200;;441090496;441090496;;;;;;;;;;;;LINESTRING Z (355715.9 6688302.8 6.9, 355716.6 6688300.2 7, 355717.6 6688299.2 7.1)
-TRONROUT0000002223008768;Rond-point;BD BABIN CHEVAYE;BD BABIN CHEVAYE;;;4;Non;0;En service;2021-02-16 12:55:59;;;;;;3.0;2.5;1.0;4.0;Non;Non;Sens direct;;;Oui;25;Libre;;;;;;;;;Non;;;;;44109;44109;Classique;;;44200;44200;;441090496;441090496;;;;;;;;;;;;LINESTRING Z (355722.6 6688310.4 7, 355722.4 6688310.3 7, 355719 6688309.4 7, 355716.6 6688307 7, 355715.7 6688303.6 7, 355715.9 6688302.8 6.9)
-TRONROUT0000002223008769;Route à 1 chaussée;R CONAN MERIADEC;R CONAN MERIADEC;;;5;Non;0;En service;2021-02-16 12:55:59;;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;8;;8;;44109;44109;Classique;;;44200;44200;;441092104;441092104;;;;;;;;;;;;LINESTRING Z (355722.6 6688310.4 7, 355723.8 6688346.4 7)
-TRONROUT0000002223008766;Rond-point;BD BABIN CHEVAYE;BD BABIN CHEVAYE;;;4;Non;0;En service;2021-02-16 12:55:59;;;;;;3.0;2.5;1.0;4.0;Non;Non;Sens direct;;;Oui;25;Libre;;;;;;;;;Non;;;;;44109;44109;Classique;;;44200;44200;;441090496;441090496;;;;;;;;;;;;LINESTRING Z (355717.6 6688299.2 7.1, 355719 6688297.8 7.1, 355722.4 6688296.9 7.1, 355725.8 6688297.8 7.1, 355728.2 6688300.2 7.1, 355729.1 6688303.6 7)
-TRONROUT0000002223008765;Rond-point;BD BABIN CHEVAYE;BD BABIN CHEVAYE;;;4;Non;0;En service;2021-02-16 12:55:59;;;;;;3.0;2.5;1.0;4.0;Non;Non;Sens direct;;;Oui;25;Libre;;;;;;;;;Non;;;;;44109;44109;Classique;;;44200;44200;;441090496;441090496;;;;;;;;;;;;LINESTRING Z (355729.1 6688303.6 7, 355728.2 6688307 7, 355725.8 6688309.4 7, 355722.6 6688310.4 7)
-TRONROUT0000000029473536;Route à 1 chaussée;R CONAN MERIADEC;R CONAN MERIADEC;;;5;Non;0;En service;2006-10-04 09:41:10;2011-09-06 08:54:31;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;6;3;6;1;44109;44109;Classique;;;44200;44200;;441092104;441092104;;;;;;;;;;;;LINESTRING Z (355723.8 6688346.4 7, 355725.1 6688370 6.9, 355726.8 6688400.8 6.6, 355726.97518248175 6688404 6.5766423357653805)
-TRONROUT0000000029473843;Route à 1 chaussée;BD BABIN CHEVAYE;BD BABIN CHEVAYE;;;4;Non;0;En service;2006-10-04 09:41:10;2021-02-16 12:55:59;;;;;2.5;1.5;4.0;14.0;Non;Non;Double sens;;;Oui;40;Libre;;;;;;;;;Non;;;;;44109;44109;Classique;;;44200;44200;;441090496;441090496;;;;;;;;;;;;LINESTRING Z (355738.8 6688304 7.2, 355729.1 6688303.6 7)
-TRONROUT0000000029475026;Route à 1 chaussée;R MICHEL ROCHER;R MICHEL ROCHER;;;5;Non;0;En service;2006-10-04 09:41:10;2011-09-06 08:54:31;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;;;;;44109;44109;Classique;;;44200;44200;;441095644;441095644;;;;;;;;;;;;LINESTRING Z (355723.8 6688346.4 7, 355766.6 6688348.9 7)
-TRONROUT0000000029475199;Route à 1 chaussée;BD BABIN CHEVAYE;BD BABIN CHEVAYE;;;4;Non;0;En service;2006-10-04 09:41:10;2021-02-16 12:55:59;;;;;2.5;1.5;4.0;14.0;Non;Non;Double sens;;;Oui;40;Libre;;;;;;;;;Non;;16;;16;44109;44109;Classique;;;44200;44200;;441090496;441090496;;;;;;;;;;;;LINESTRING Z (355756.5 6688306.3 7.5, 355738.8 6688304 7.2)
-TRONROUT0000000029475188;Sentier;;;;;6;Non;0;En service;2006-10-04 09:41:10;2021-02-16 12:55:59;;;;;2.5;1.5;;;Non;Non;Sans objet;;;Oui;0;Physiquement impossible;;;;;;;;;Non;;;;;44109;44109;Classique;;;;;;;;;;;;;;;;;;;LINESTRING Z (355770.587279152 6688204 7.838162544172444, 355760.4 6688235 7.4, 355759 6688243.9 7.4, 355759.1 6688254.2 7.4, 355760.4 6688264.9 7.4, 355754.2 6688271 7.4, 355749.9 6688274.4 7.4, 355745.2 6688280.3 7.4, 355739.4 6688293.8 7.4, 355738.8 6688304 7.4)
-TRONROUT0000002101117880;Route à 1 chaussée;BD BABIN CHEVAYE;BD BABIN CHEVAYE;;;4;Non;0;En service;2018-10-16 14:02:14;;;;;;2.5;1.5;4.0;14.0;Non;Non;Double sens;;;Oui;40;Libre;;;;;;;;;Non;;;;;44109;44109;Classique;;;44200;44200;;441090496;441090496;;;;;;;;;;;;LINESTRING Z (355769.3 6688307.3 8.6, 355756.5 6688306.3 7.5)
-TRONROUT0000002101117879;Sentier;ALL HELENE DE CHAPPOTIN;ALL HELENE DE CHAPPOTIN;;;6;Non;0;En service;2018-10-16 14:02:14;2018-12-18 17:14:54;;;;;5.0;9999.0;;;Non;Non;Sans objet;;;Oui;0;Physiquement impossible;Libre;;;;;;;;Non;1;;11;;44109;44109;Classique;;;44200;44200;;44109#0S0;44109#0S0;;;;;;;;;;;;LINESTRING Z (355756.5 6688306.3 -1000, 355775.2 6688250 -1000)
-TRONROUT0000000029475119;Sentier;ALL DE LA RAFFINERIE DE SUCRE;ALL DE LA RAFFINERIE DE SUCRE;;;6;Non;0;En service;2006-10-04 09:41:10;2021-09-30 14:14:09;;;Nantes Métropole;;2.5;1.5;;;Non;Non;Sans objet;;;Oui;0;Physiquement impossible;;;;;;;;;Non;;;;;44109;44109;Classique;;;;;;44109#0UR;44109#0UR;;;;;;;;;;;;LINESTRING Z (355769.3 6688307.3 8.6, 355766.6 6688348.9 7)
-TRONROUT0000000029474536;Route à 1 chaussée;R MICHEL ROCHER;R MICHEL ROCHER;;;5;Non;0;En service;2006-10-04 09:41:10;2011-09-06 08:54:31;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;14;17;8;7;44109;44109;Classique;;;44200;44200;;441095644;441095644;;;;;;;;;;;;LINESTRING Z (355766.6 6688348.9 7, 355784 6688350.2 7, 355829 6688355.8 7, 355838 6688357.508333334 7)
-TRONROUT0000000295264879;Route à 1 chaussée;BD BABIN CHEVAYE;BD BABIN CHEVAYE;;;4;Non;0;En service;2012-02-08 10:00:49;2013-11-29 11:54:12;;;;;2.5;1.5;4.0;14.0;Non;Non;Double sens;;;Oui;40;Libre;;;;;;;;;Non;14;;10;;44109;44109;Classique;;;44200;44200;;441090496;441090496;;;;;;;;;;;;LINESTRING Z (355769.3 6688307.3 8.6, 355838 6688313.1434482755 7.889310344827865)
-""")
+        _sio = AbstractGeoDataFrameDemos._dataset(
+            "GeoDataFrameDemos6", "nizanDistrictInNantesRoads.csv"
+        )
         return GeoDataFrameLib.read_csv(_sio)
 
     @staticmethod
@@ -198,111 +102,9 @@ TRONROUT0000000295264879;Route à 1 chaussée;BD BABIN CHEVAYE;BD BABIN CHEVAYE;
         trees = clip(trees, roi)
         trees.to_csv('/tmp/nizan-trees.csv', sep=';', index=False)
         '''
-        _sio = StringIO("""genre;espece;hauteurFut;hauteur;DIAMETRE;MI_PRINX;geometry
-Gleditsia;triacanthos;< 5,5 m;0-5 m;8.0;6501666;POINT (355805.0549675051 6688318.586884873)
-Gleditsia;triacanthos;< 5,5 m;0-5 m;7.0;6501667;POINT (355814.8946148888 6688319.415756748)
-Gleditsia;triacanthos;< 5,5 m;0-5 m;7.0;6501668;POINT (355824.6544073759 6688320.255274177)
-Gleditsia;triacanthos;< 5,5 m;0-5 m;7.0;6501669;POINT (355834.27332972066 6688320.976031774)
-Acer;cappadocicum;< 5,5 m;11-15 m;28.0;6503600;POINT (355715.3207703097 6688323.5575109115)
-Acer;cappadocicum;< 5,5 m;6-10 m;19.0;6503601;POINT (355726.2176980704 6688324.147907491)
-Acer;cappadocicum;< 5,5 m;11-15 m;30.0;6503602;POINT (355726.2973228005 6688333.8800854245)
-Acer;cappadocicum;< 5,5 m;11-15 m;27.0;6503599;POINT (355715.75410506193 6688334.995537564)
-Acer;cappadocicum;< 5,5 m;11-15 m;27.0;6503598;POINT (355715.931235183 6688341.988935511)
-Acer;cappadocicum;< 5,5 m;6-10 m;26.0;6503586;POINT (355726.70833977754 6688342.590304631)
-Acer;cappadocicum;< 5,5 m;6-10 m;31.0;6503597;POINT (355716.694000186 6688352.165196266)
-Acer;cappadocicum;< 5,5 m;6-10 m;29.0;6503587;POINT (355728.1104867202 6688360.075948182)
-Acer;cappadocicum;< 5,5 m;6-10 m;31.0;6503596;POINT (355717.34286509303 6688360.633647388)
-Acer;cappadocicum;< 5,5 m;6-10 m;23.0;6503588;POINT (355728.3259577364 6688371.755579971)
-EMPLACEMENT CONSERVE;VIDE;Z.N.R.;Z.N.R;0.0;6503603;POINT (355717.55555656337 6688371.973552147)
-Tilia;platyphyllos;< 5,5 m;6-10 m;55.0;183169;POINT (355677.2549863036 6688374.739288855)
-Tilia;platyphyllos;< 5,5 m;6-10 m;36.0;183170;POINT (355682.5673878351 6688374.8995814035)
-Tilia;platyphyllos;< 5,5 m;6-10 m;31.0;183171;POINT (355688.69629657315 6688374.951657427)
-Tilia;platyphyllos;< 5,5 m;6-10 m;41.0;183172;POINT (355694.7225476688 6688375.004572836)
-Acer;cappadocicum;< 5,5 m;0-5 m;4.0;6503583;POINT (355718.8784428712 6688377.328781654)
-Tilia;platyphyllos;< 5,5 m;6-10 m;26.0;183168;POINT (355682.60749587195 6688379.801816689)
-Acer;cappadocicum;< 5,5 m;6-10 m;29.0;6503594;POINT (355729.33470111573 6688380.241073878)
-EMPLACEMENT CONSERVE;VIDE;Z.N.R.;Z.N.R;0.0;6503605;POINT (355718.1927758368 6688381.461347693)
-Acer;cappadocicum;< 5,5 m;0-5 m;4.0;6503585;POINT (355719.3146313733 6688384.230127808)
-Tilia;platyphyllos;< 5,5 m;6-10 m;42.0;183167;POINT (355682.7487716521 6688384.6010337835)
-Tilia;platyphyllos;< 5,5 m;6-10 m;45.0;183166;POINT (355682.8923733591 6688389.604613833)
-Acer;cappadocicum;< 5,5 m;11-15 m;32.0;6503589;POINT (355729.51478182705 6688392.480582955)
-EMPLACEMENT CONSERVE;VIDE;Z.N.R.;Z.N.R;0.0;6503584;POINT (355718.88410622923 6688392.677427223)
-Tilia;platyphyllos;< 5,5 m;6-10 m;37.0;183165;POINT (355683.0231605903 6688394.400662236)
-Tilia;platyphyllos;< 5,5 m;6-10 m;37.0;183164;POINT (355683.1774330067 6688399.509600538)
-Tilia;platyphyllos;< 5,5 m;6-10 m;60.0;183163;POINT (355677.6635266499 6688399.6568776015)
-Acer;cappadocicum;< 5,5 m;6-10 m;30.0;6503590;POINT (355729.95493901585 6688402.309739751)
-EMPLACEMENT CONSERVE;VIDE;Z.N.R.;Z.N.R;0.0;6503582;POINT (355719.406162045 6688402.745737602)
-Acer;platanoïdes;< 5,5 m;0-5 m;17.0;181593;POINT (355775.51289034035 6688207.151716119)
-Betula;utilis;< 5,5 m;6-10 m;15.0;181570;POINT (355672.15822491713 6688207.35700876)
-Betula;utilis;< 5,5 m;6-10 m;16.0;181569;POINT (355672.43002445175 6688212.124565747)
-Tilia;cordata;< 5,5 m;6-10 m;26.0;181579;POINT (355695.01001326356 6688213.684337442)
-Liriodendron;tulipifera;< 5,5 m;11-15 m;55.0;181589;POINT (355733.2914553996 6688214.883999338)
-Liriodendron;tulipifera;< 5,5 m;11-15 m;51.0;181588;POINT (355726.48805434164 6688215.114070994)
-Betula;utilis;< 5,5 m;6-10 m;16.0;181568;POINT (355672.8196346794 6688217.064949152)
-Liriodendron;tulipifera;< 5,5 m;11-15 m;53.0;181587;POINT (355737.7715730859 6688222.175824912)
-Zelkova;carpinifolia;< 5,5 m;0-5 m;23.0;181592;POINT (355767.87786201906 6688226.582265305)
-Betula;utilis;< 5,5 m;6-10 m;20.0;181567;POINT (355673.35166513035 6688232.299419492)
-Acer;pseudoplatanus;< 5,5 m;6-10 m;27.0;181591;POINT (355763.7131747567 6688236.504109779)
-Betula;utilis;< 5,5 m;6-10 m;20.0;181566;POINT (355673.68480731745 6688237.531216055)
-Zelkova;carpinifolia;< 5,5 m;6-10 m;20.0;181590;POINT (355765.5458697859 6688240.153028211)
-Betula;utilis;< 5,5 m;6-10 m;20.0;181565;POINT (355673.8411657968 6688242.415576921)
-Populus;nigra;< 5,5 m;16-20 m;65.0;181617;POINT (355777.0848185769 6688244.946267115)
-Populus;nigra;< 5,5 m;16-20 m;59.0;181616;POINT (355778.84404741187 6688245.610117596)
-Zelkova;carpinifolia;< 5,5 m;6-10 m;24.0;181599;POINT (355753.6140158635 6688246.241458648)
-Acer;platanoïdes;< 5,5 m;6-10 m;20.0;181600;POINT (355746.8704162512 6688246.587552012)
-Acer;pseudoplatanus;< 5,5 m;0-5 m;14.0;181598;POINT (355766.23978100065 6688246.720121178)
-Populus;nigra;< 5,5 m;16-20 m;68.0;181615;POINT (355780.4515190953 6688246.987291304)
-Populus;nigra;< 5,5 m;16-20 m;38.0;181613;POINT (355776.08861332905 6688247.308059891)
-Betula;utilis;< 5,5 m;6-10 m;20.0;181564;POINT (355673.9994253074 6688247.532292799)
-Populus;nigra;< 5,5 m;16-20 m;43.0;181614;POINT (355778.56785787013 6688248.218571226)
-Betula;utilis;< 5,5 m;6-10 m;20.0;181563;POINT (355674.2755061621 6688252.823136814)
-Acer;pseudoplatanus;< 5,5 m;6-10 m;20.0;181597;POINT (355760.84271571465 6688255.31379671)
-Populus;nigra;< 5,5 m;21-30 m;83.0;181610;POINT (355700.80091988534 6688260.341511899)
-Populus;nigra;< 5,5 m;21-30 m;75.0;181612;POINT (355691.3788287381 6688260.360625401)
-Pinus;nigra;< 5,5 m;0-5 m;12.0;181601;POINT (355751.42070418235 6688260.697610541)
-Populus;nigra;< 5,5 m;21-30 m;66.0;181611;POINT (355695.9215685857 6688261.079823263)
-Acer;pseudoplatanus;< 5,5 m;0-5 m;12.0;181608;POINT (355764.9035761936 6688261.15494494)
-Acer;platanoïdes;< 5,5 m;6-10 m;20.0;181609;POINT (355752.9450757376 6688263.986500051)
-Acer;pseudoplatanus;< 5,5 m;0-5 m;11.0;181607;POINT (355754.4782748142 6688273.629382824)
-Acer;pseudoplatanus;< 5,5 m;0-5 m;11.0;181606;POINT (355750.57107173186 6688279.535685407)
-Acer;negundo;< 5,5 m;0-5 m;21.0;181605;POINT (355739.0890697893 6688283.700939201)
-Acer;negundo;< 5,5 m;0-5 m;25.0;181604;POINT (355743.4577002329 6688284.479490597)
-Acer;negundo;< 5,5 m;0-5 m;15.0;181602;POINT (355759.3544846715 6688286.733743003)
-Acer;negundo;< 5,5 m;0-5 m;12.0;181603;POINT (355753.316653321 6688288.062779174)
-Gleditsia;triacanthos;< 5,5 m;6-10 m;7.0;6501684;POINT (355641.9273716849 6688292.211176784)
-Gleditsia;triacanthos;< 5,5 m;0-5 m;7.0;6501683;POINT (355651.65906807204 6688293.280755528)
-EMPLACEMENT CONSERVE;VIDE;Z.N.R.;Z.N.R;0.0;6501682;POINT (355661.8584302864 6688294.106686899)
-EMPLACEMENT CONSERVE;VIDE;Z.N.R.;Z.N.R;0.0;6501681;POINT (355672.0578742548 6688294.942610181)
-EMPLACEMENT CONSERVE;VIDE;Z.N.R.;Z.N.R;0.0;6501680;POINT (355682.45805910515 6688295.886810971)
-EMPLACEMENT CONSERVE;VIDE;Z.N.R.;Z.N.R;0.0;6501679;POINT (355702.518197299 6688297.681338772)
-EMPLACEMENT CONSERVE;VIDE;Z.N.R.;Z.N.R;0.0;6501678;POINT (355716.4901332141 6688299.155921279)
-EMPLACEMENT CONSERVE;VIDE;Z.N.R.;Z.N.R;0.0;6501677;POINT (355726.46172134037 6688300.233530673)
-EMPLACEMENT CONSERVE;VIDE;Z.N.R.;Z.N.R;0.0;6501676;POINT (355736.43028471246 6688300.94143716)
-Gleditsia;triacanthos;< 5,5 m;0-5 m;7.0;6501675;POINT (355746.06116107904 6688301.901920753)
-Gleditsia;triacanthos;< 5,5 m;0-5 m;7.0;6501674;POINT (355756.16068426985 6688302.738660558)
-Gleditsia;triacanthos;< 5,5 m;6-10 m;7.0;6501673;POINT (355766.2111463121 6688303.685720488)
-Gleditsia;triacanthos;< 5,5 m;0-5 m;7.0;6501655;POINT (355647.26878012647 6688303.848893488)
-Gleditsia;triacanthos;< 5,5 m;0-5 m;7.0;6501672;POINT (355775.9618459179 6688304.6352314865)
-Gleditsia;triacanthos;< 5,5 m;0-5 m;7.0;6501656;POINT (355661.1500515687 6688305.234284172)
-Gleditsia;triacanthos;< 5,5 m;0-5 m;7.0;6501671;POINT (355786.06316763046 6688305.691794438)
-Gleditsia;triacanthos;< 5,5 m;0-5 m;8.0;6501657;POINT (355671.54639419704 6688305.708862586)
-Gleditsia;triacanthos;< 5,5 m;6-10 m;8.0;6501704;POINT (355796.213141748 6688306.588077296)
-Gleditsia;triacanthos;< 5,5 m;0-5 m;8.0;6501658;POINT (355681.7686018688 6688306.884349408)
-Gleditsia;triacanthos;< 5,5 m;6-10 m;7.0;6501659;POINT (355691.60645069706 6688307.493398691)
-Gleditsia;triacanthos;< 5,5 m;0-5 m;7.0;6501670;POINT (355806.0859536073 6688307.806390845)
-Gleditsia;triacanthos;< 5,5 m;0-5 m;6.0;6501703;POINT (355816.7628920304 6688308.378600206)
-Gleditsia;triacanthos;< 5,5 m;0-5 m;7.0;6501660;POINT (355701.44797828543 6688308.552086519)
-Gleditsia;triacanthos;> 5,5 m;6-10 m;9.0;6501719;POINT (355710.1686760104 6688309.410093781)
-Gleditsia;triacanthos;< 5,5 m;0-5 m;7.0;6501701;POINT (355735.9496803617 6688311.817356599)
-Gleditsia;triacanthos;< 5,5 m;0-5 m;8.0;6501661;POINT (355745.7114348215 6688312.89668174)
-Gleditsia;triacanthos;< 5,5 m;6-10 m;8.0;6501705;POINT (355755.25123798806 6688313.718013122)
-Acer;cappadocicum;< 5,5 m;6-10 m;28.0;6503581;POINT (355714.8060720432 6688314.388478353)
-Gleditsia;triacanthos;< 5,5 m;6-10 m;8.0;6501662;POINT (355765.39162879594 6688314.6643377915)
-Acer;cappadocicum;< 5,5 m;6-10 m;27.0;6503604;POINT (355725.5570425641 6688315.459714944)
-Gleditsia;triacanthos;< 5,5 m;6-10 m;8.0;6501663;POINT (355775.3541241526 6688315.851940342)
-EMPLACEMENT CONSERVE;VIDE;Z.N.R.;Z.N.R;0.0;6501664;POINT (355785.114815878 6688316.801369663)
-Gleditsia;triacanthos;< 5,5 m;0-5 m;6.0;6501665;POINT (355795.1733080387 6688317.508540522)
-""")
+        _sio = AbstractGeoDataFrameDemos._dataset(
+            "GeoDataFrameDemos6", "nizanDistrictInNantesTrees.csv"
+        )
         trees = GeoDataFrameLib.read_csv(_sio)
         # DELETE SOME TREES
         IDS = [6501680, 6501679, 6501678, 6501677, 6501676,
@@ -453,28 +255,9 @@ NA;NA;NA;NA;NA;9999994;POINT (355682.97153285 6688288.47887796)
         sidewalks = sidewalks[ sidewalks.length > 0 ]
         sidewalks.to_csv('/tmp/nizan-sidewalks.csv', sep=';', index=False)
         '''
-        _sio = StringIO("""ECHELLE;PROVENAN;VISIBLE;geometry
-N;TOPO;O;LINESTRING (355638 6688260.017744874, 355641.9828752697 6688261.2141836155, 355638 6688259.588122488)
-O;ORTHO2008;O;LINESTRING (355710.4917249362 6688296.457614553, 355697.9389098046 6688295.001405932, 355677.1353964157 6688295.17151343, 355669.234866885 6688294.406726022, 355657.9557876079 6688293.5196749, 355649.55115776573 6688292.209414311, 355638 6688291.623174625)
-N;TOPO;O;LINESTRING (355638 6688264.262614875, 355642.818130013 6688265.594121395, 355646.94271549786 6688266.519688407, 355651.7159687681 6688267.340024981, 355658.6486560974 6688268.282601071, 355666.7702376029 6688269.1954704365, 355683.99352384225 6688271.123113719, 355687.437176314 6688271.874381087, 355690.1025909483 6688272.771908927, 355692.45939556573 6688273.811857155, 355694.1155282419 6688274.707645135, 355696.23481191474 6688276.029329381, 355697.32934428623 6688276.679893574, 355699.23854900384 6688277.973317701, 355700.5462668406 6688279.031836828, 355701.7346519536 6688280.161280184, 355703.12704795203 6688281.79867987, 355704.47111854877 6688283.636327451, 355705.8574464774 6688285.753423353, 355707.11485835246 6688287.991485036, 355707.957935134 6688289.663354369, 355709.08741195913 6688292.14228547, 355710.4917249362 6688296.457614553)
-O;ORTHO2008;O;LINESTRING (355638 6688297.905713186, 355653.796372867 6688299.32942999, 355709.5295757108 6688304.659444613, 355712.06321306474 6688305.328219364, 355714.4334433021 6688306.787748632, 355715.1137037825 6688308.101214377, 355716.1101138591 6688308.972418958, 355716.65463590616 6688312.015720913)
-N;TOPO;O;LINESTRING (355638 6688256.378396951, 355640.72253903374 6688257.39730934, 355644.7399911136 6688258.663501993, 355647.4135175581 6688259.331132886, 355652.14811049297 6688260.311667741, 355657.1806673678 6688261.06992817, 355661.26136052335 6688261.516207462, 355667.6911737769 6688262.063189941, 355682.6100682805 6688263.250235452, 355685.9308727646 6688263.642772388, 355687.64254341496 6688263.998503826, 355691.4605626442 6688265.316290328, 355694.84097405395 6688266.887471024, 355698.2639697966 6688268.778067899, 355701.9306177518 6688271.136326409, 355705.7299422746 6688273.833249703, 355710.79423681105 6688277.249292003, 355717.816061487 6688281.758510543, 355733.96900251193 6688292.098713638, 355735.05264356156 6688292.639447876, 355735.7940195876 6688292.873209019, 355736.38445163966 6688292.978300126, 355741.2384591195 6688293.897902591, 355759.28320315725 6688297.297738726, 355835.7863909261 6688304.466434411, 355835.98003802146 6688302.4863086, 355838 6688302.678525408)
-N;TOPO;O;LINESTRING (355709.4343703331 6688301.572498132, 355709.76676214073 6688299.451341067, 355697.96637785604 6688298.35870747, 355692.3666244686 6688299.11397316, 355692.15186718677 6688299.735272713, 355692.2329483397 6688299.874506645, 355709.4343703331 6688301.572498132)
-N;TOPO;O;LINESTRING (355704.0635165822 6688276.5648732, 355707.5316123675 6688280.303739213, 355709.5127051059 6688283.055500564, 355711.50041961385 6688286.616611412, 355712.2121278361 6688288.109687453, 355713.5266941406 6688291.226633888, 355714.1100585614 6688292.910619504, 355715.5084223365 6688295.277432947, 355716.21743280586 6688296.440774031)
-N;ORTHO2008;O;LINESTRING (355721.99418677646 6688404, 355720.65116520907 6688380.342677042, 355718.4662725854 6688341.689033872, 355716.90195585234 6688319.038522822, 355716.65463590616 6688312.015720913)
-N;ORTHO2012;O;LINESTRING (355723.5119496293 6688303.745701431, 355723.5025297997 6688303.81572692, 355723.49310996995 6688303.885752407, 355723.47369805875 6688303.955859601, 355723.45436789794 6688304.0359587595, 355723.4248821552 6688304.096155687, 355723.3954781625 6688304.166344582, 355723.3560820886 6688304.236615183, 355723.3166042645 6688304.296893812, 355723.2671343589 6688304.357254146, 355723.2175827033 6688304.407622513, 355723.16803104745 6688304.457990879, 355723.1084873103 6688304.508440949, 355723.0488618228 6688304.54889905, 355722.98923633556 6688304.58935715, 355722.9196187668 6688304.629896955, 355722.8599115293 6688304.660363088, 355722.7902122102 6688304.690910924, 355722.7104390595 6688304.711548491, 355722.6405762404 6688304.722112395, 355722.57071342075 6688304.73267629, 355722.4908585197 6688304.743321889, 355722.42091395037 6688304.743893823, 355722.34089554887 6688304.734555484, 355722.270869229 6688304.725135443, 355722.200842909 6688304.715715402, 355722.13073483907 6688304.696303396, 355722.0605450186 6688304.666899414, 355721.9903551982 6688304.637495436, 355721.92008362757 6688304.598099488, 355721.85980413825 6688304.558621832, 355721.7995246492 6688304.519144186, 355721.7391634099 6688304.469674565, 355721.68879425194 6688304.420123241, 355721.63842509367 6688304.370571913, 355721.5879741855 6688304.311028619, 355721.54751535866 6688304.251403623, 355721.5069747816 6688304.181786656, 355721.47642628563 6688304.112087983, 355721.4459595402 6688304.052381281, 355721.4253213756 6688303.972608937, 355721.40476496133 6688303.90282856, 355721.39420062845 6688303.832966483, 355721.38363629556 6688303.763104405, 355721.3829822936 6688303.683168651, 355721.38241004193 6688303.613224865, 355721.39174812153 6688303.533207409, 355721.40116795135 6688303.463181923, 355721.42057986266 6688303.393074731, 355721.4399917738 6688303.32296754, 355721.46939576627 6688303.252778643, 355721.49879975896 6688303.18258975, 355721.5382775832 6688303.122311121, 355721.57767365704 6688303.052040519, 355721.6271435626 6688302.991680184, 355721.6766952183 6688302.941311819, 355721.72624687414 6688302.890943455, 355721.7857906112 6688302.840493383, 355721.8454160984 6688302.800035281, 355721.90504158585 6688302.75957718, 355721.97465915466 6688302.719037376, 355722.0443584737 6688302.688489542, 355722.11413954274 6688302.667933673, 355722.1839206119 6688302.647377807, 355722.2537016812 6688302.626821942, 355722.32356450066 6688302.616258044, 355722.40341940144 6688302.605612442, 355722.4733639711 6688302.605040515, 355722.5533823722 6688302.614378848, 355722.6234086922 6688302.62379889, 355722.6935167623 6688302.643210899, 355722.7736169136 6688302.662541203, 355722.84372498374 6688302.681953214, 355722.9039227228 6688302.711438896, 355722.97419429314 6688302.750834842, 355723.0344737825 6688302.790312496, 355723.09475327155 6688302.829790146, 355723.1551145111 6688302.879259768, 355723.2054836691 6688302.928811092, 355723.2558528273 6688302.978362419, 355723.3063037354 6688303.037905711, 355723.3468443124 6688303.107522676, 355723.38730313943 6688303.1671476755, 355723.4178516352 6688303.236846348, 355723.44840013096 6688303.306545018, 355723.4689565453 6688303.376325394, 355723.4895129597 6688303.446105769, 355723.5000772929 6688303.51596785, 355723.5107233759 6688303.595821897, 355723.51129562757 6688303.66576568, 355723.5119496293 6688303.745701431)
-N;ORTHO2008;O;LINESTRING (355730.87068735814 6688404, 355728.08262018533 6688355.530146885, 355728.1444082819 6688353.311276034, 355728.97246159543 6688351.925521129, 355730.4816114568 6688350.734049749, 355735.82565831504 6688350.480506816)
-N;TOPO;O;LINESTRING (355731.8822519658 6688305.745734392, 355750.7635699303 6688307.57987872, 355750.97250438604 6688307.46825127, 355751.007649443 6688306.878398268, 355750.86710630095 6688306.799606372, 355742.4697892646 6688303.940427556, 355739.65988889 6688303.703595242, 355731.94134230126 6688303.197128633, 355731.74097307207 6688305.577014776)
-N;ORTHO2008;O;LINESTRING (355725.77174691047 6688312.470781203, 355726.8170291634 6688336.414586605, 355727.2450165593 6688338.649437874, 355728.9672144843 6688341.513235381, 355731.2898551052 6688343.262940359, 355764.97384196974 6688346.734749771, 355800.94004777377 6688349.458434421)
-N;TOPO;O;LINESTRING (355824.5153493464 6688308.225895474, 355824.680573465 6688306.435862214, 355758.98789990507 6688300.28795207, 355737.9208875157 6688296.343248337, 355734.30712437484 6688295.563394067, 355705.41316474916 6688277.862872756)
-O;ORTHO2008;O;LINESTRING (355838 6688207.810953548, 355826.7476728598 6688204)
-O;TOPO;O;LINESTRING (355824.5153493464 6688308.225895474, 355824.48717161437 6688308.445963925, 355761.274577953 6688302.527590232, 355757.95352817245 6688302.105077462, 355747.94534199126 6688300.2183638485, 355737.9389543262 6688298.551473507, 355733.2584909853 6688298.080120657, 355716.4301277717 6688296.78877716, 355716.21743280586 6688296.440774031)
-O;ORTHO2008;O;LINESTRING (355725.77174691047 6688312.470781203, 355726.0715279049 6688311.249228145, 355726.7647605844 6688310.484119201, 355727.75620245136 6688309.52671173, 355729.03314511385 6688309.266454375, 355764.8610146103 6688312.181130282, 355813.6711136441 6688316.5185241625, 355838 6688318.598026717)
-N;ORTHO2008;N;LINESTRING (355735.82565831504 6688350.480506816, 355798.8402282752 6688355.401238989, 355838 6688359.863964783)
-N;ORTHO2008;N;LINESTRING (355800.94004777377 6688349.458434421, 355838 6688355.312091491)
-O;TOPO;O;LINESTRING (355824.48717161437 6688308.445963925, 355838 6688308.606342289)
-N;TOPO;O;LINESTRING (355838 6688313.658252633, 355833.3759439519 6688313.96915823, 355833.2166429035 6688314.040409296, 355833.12530589884 6688315.090383173, 355833.2165426406 6688315.249519348, 355833.2866507115 6688315.2689313525, 355838 6688315.603573753)
-""")
+        _sio = AbstractGeoDataFrameDemos._dataset(
+            "GeoDataFrameDemos6", "nizanDistrictInNantesSidewalks.csv"
+        )
         return GeoDataFrameLib.read_csv(_sio)
 
     @staticmethod
@@ -512,10 +295,9 @@ N;TOPO;O;LINESTRING (355838 6688313.658252633, 355833.3759439519 6688313.9691582
         streetlight = clip(streetlight, roi)
         streetlight.to_csv('/tmp/nizan-streetlight.csv', sep=';', index=False)
         '''
-        _sio = StringIO("""objectid;gid;theme;dalle;ligne;block;date;geometry
-14715;14337;T14-ECLAIRAGE;43-50-14-C;ByBlock;T14_357;20220609;MULTILINESTRING ((355719.9680773116 6688388.8907357175, 355719.995282432 6688388.8893248355, 355720.0222610611 6688388.885548267, 355720.0488078755 6688388.879434752, 355720.0747208379 6688388.871030821, 355720.0998027347 6688388.860400429, 355720.12386267795 6688388.847624484, 355720.1467175568 6688388.832800216, 355720.1681934319 6688388.81604045, 355720.1881268588 6688388.797472733, 355720.2063661318 6688388.777238378, 355720.2227724392 6688388.7554913815, 355720.2372209194 6688388.732397255, 355720.2496016104 6688388.708131749, 355720.25982028793 6688388.682879551, 355720.2677991814 6688388.6568328375, 355720.27347756684 6688388.63018984, 355720.276812228 6688388.6031533275, 355720.27777778613 6688388.575929074), (355720.27777778613 6688388.575929074, 355720.2777777864 6688388.575929066, 355720.2763668937 6688388.548724252, 355720.2725902873 6688388.521745926, 355720.2664767094 6688388.495199411, 355720.2580726882 6688388.46928674, 355720.24744218355 6688388.444205126, 355720.2346660997 6688388.420145453, 355720.2198416706 6688388.397290834, 355720.2030817186 6688388.375815199, 355720.184513798 6688388.355881999, 355720.16427922115 6688388.337642935, 355720.14253198553 6688388.321236817, 355720.1194376008 6688388.306788502, 355720.09517182916 6688388.294407955, 355720.06991934765 6688388.284189393, 355720.0438723432 6688388.276210594, 355720.017229049 6688388.27053228, 355719.99019223655 6688388.267197658, 355719.96296767273 6688388.266232118), (355719.96296767273 6688388.266232118, 355719.93576255225 6688388.267642995, 355719.9087839231 6688388.271419565, 355719.8822371088 6688388.277533081, 355719.85632414644 6688388.285937013, 355719.8312422495 6688388.296567404, 355719.8071823062 6688388.309343348, 355719.7843274271 6688388.324167616, 355719.762851552 6688388.340927382, 355719.74291812535 6688388.3594951015, 355719.72467885213 6688388.3797294535, 355719.7082725448 6688388.40147645, 355719.69382406445 6688388.424570581, 355719.6814433734 6688388.448836082, 355719.67122469575 6688388.474088281, 355719.66324580234 6688388.500134997, 355719.6575674169 6688388.526777993, 355719.6542327557 6688388.553814505, 355719.65326719714 6688388.581038766, 355719.6532671972 6688388.581038767), (355719.6532671972 6688388.581038767, 355719.65467809 6688388.60824358, 355719.6584546963 6688388.635221907, 355719.66456827417 6688388.6617684215, 355719.6729722954 6688388.687681094, 355719.6836028 6688388.712762708, 355719.69637888373 6688388.73682238, 355719.71120331297 6688388.759677, 355719.72796326486 6688388.781152633, 355719.7465311855 6688388.801085831, 355719.76676576276 6688388.819324898, 355719.7885129983 6688388.8357310165, 355719.8116073831 6688388.850179331, 355719.835873155 6688388.86255988, 355719.8611256365 6688388.872778441, 355719.887172641 6688388.880757238, 355719.9138159354 6688388.886435555, 355719.9408527474 6688388.8897701735, 355719.9680773116 6688388.8907357175), (355719.9680773116 6688388.8907357175, 355719.9706321312 6688389.202987521), (355720.2018272328 6688388.810906629, 355720.3592305431 6688388.965755118), (355720.27777429315 6688388.5759291025, 355720.27777778613 6688388.575929074), (355720.27777778613 6688388.575929074, 355720.59002609417 6688388.5733742835), (355719.96296767273 6688388.266232118, 355719.9476387628 6688386.392721313), (355719.34101889026 6688388.583593557, 355719.6532671972 6688388.581038767), (355719.6532671972 6688388.581038767, 355719.6532706913 6688388.581038738), (355719.73339959315 6688388.814688875, 355719.57855110214 6688388.972092183), (355759.3096963815 6688245.470221025, 355759.3368989987 6688245.468806725, 355759.36387486476 6688245.4650271665, 355759.39041871147 6688245.458911116, 355759.4163285586 6688245.450505106, 355759.44140725053 6688245.439873108, 355759.46546395525 6688245.427096015, 355759.4883156181 6688245.41227106, 355759.5097883536 6688245.395511041, 355759.52971876936 6688245.3769435, 355759.54795520863 6688245.356709719, 355759.5643589043 6688245.334963662, 355759.57880503585 6688245.311870804, 355759.5911836785 6688245.287606864, 355759.60140063893 6688245.262356475, 355759.6093781733 6688245.236311773, 355759.61505557806 6688245.2096709395, 355759.6183896522 6688245.1826367, 355759.6193550254 6688245.155414757, 355759.6179443521 6688245.1282122545, 355759.61416836653 6688245.101236187, 355759.6080558014 6688245.074691822, 355759.59965316893 6688245.048781141, 355759.58902440744 6688245.023701311, 355759.57625039434 6688244.999643169, 355759.5614283313 6688244.976789784, 355759.5446710035 6688244.955315052, 355759.5261059233 6688244.935382378, 355759.50587435754 6688244.917143441, 355759.48413025466 6688244.900737024, 355759.46103907237 6688244.8862879705, 355759.43677651824 6688244.873906225, 355759.411527214 6688244.863686008, 355759.38548328914 6688244.855705085, 355759.35884292005 6688244.850024184, 355759.33180882136 6688244.846686538, 355759.3045867039 6688244.845717539), (355759.3045867039 6688244.845717539, 355759.2773790901 6688244.847125006, 355759.2503977073 6688244.850898591, 355759.2238479346 6688244.857009568, 355759.1979318668 6688244.865411423, 355759.17284677405 6688244.876040199, 355759.1487836017 6688244.888814999, 355759.12592551607 6688244.903638572, 355759.1044465106 6688244.920398088, 355759.08451008156 6688244.938965977, 355759.06626798277 6688244.959200899, 355759.04985907127 6688244.98094883, 355759.03540824994 6688245.00404422, 355759.0230255173 6688245.028311278, 355759.0128051291 6688245.053565281, 355759.0048248822 6688245.079614, 355758.9991455213 6688245.106259154, 355758.9958102772 6688245.133297926, 355758.9948445372 6688245.160524489), (355758.9948445372 6688245.160524489, 355758.99484453717 6688245.160524491, 355758.9962556525 6688245.187731612, 355759.0000328821 6688245.214712188, 355759.006147474 6688245.241260843, 355759.0145528843 6688245.267175497, 355759.0251851322 6688245.292258885, 355759.03796328587 6688245.316320077, 355759.0527900793 6688245.33917592, 355759.06955265265 6688245.360652439, 355759.08812341053 6688245.380586158, 355759.1083609948 6688245.398825344, 355759.1301113583 6688245.415231157, 355759.15320894006 6688245.429678725, 355759.1774779231 6688245.442058067, 355759.2027335748 6688245.4522749605, 355759.22878365155 6688245.460251628, 355759.25542986277 6688245.465927357, 355759.2824693799 6688245.469258941, 355759.3096963815 6688245.470221025), (355759.3096963815 6688245.470221025, 355759.3122512204 6688245.782472769), (355759.54334637756 6688245.390291966, 355759.7007496684 6688245.545140419), (355759.61939328525 6688245.155414446, 355759.9316450274 6688245.152859605), (355759.3045867039 6688244.845717539, 355759.2892576787 6688242.97220709), (355758.6826380582 6688245.163078956, 355758.9948445372 6688245.160524489), (355758.9948445372 6688245.160524489, 355758.9948898005 6688245.160524119), (355759.07501870213 6688245.394174207, 355758.9201702501 6688245.551577495), (355764.5705097591 6688225.145468115, 355764.59770848014 6688225.14405463, 355764.6246805303 6688225.140276189, 355764.6512206647 6688225.134161545, 355764.6771269247 6688225.125757225, 355764.7022021757 6688225.115127185, 355764.72625560657 6688225.102352316, 355764.7491041812 6688225.087529826, 355764.77057403256 6688225.070772507, 355764.7905017847 6688225.052207878, 355764.8087357964 6688225.031977202, 355764.82513731567 6688225.010234433, 355764.83958153374 6688224.987145017, 355764.8519585367 6688224.962884656, 355764.86217414157 6688224.9376379615, 355764.8701506119 6688224.911597047, 355764.8758272506 6688224.884960075, 355764.8791608608 6688224.857929739, 355764.8801260753 6688224.830711728, 355764.8787155492 6688224.803513156, 355764.8749400165 6688224.776540997, 355764.8688282067 6688224.750000496, 355764.86042662786 6688224.724093609, 355764.84979921253 6688224.69901748, 355764.8370268304 6688224.674962928, 355764.8222066732 6688224.652112991, 355764.80545151635 6688224.630641557, 355764.7868888581 6688224.610712002, 355764.7666599526 6688224.592475992, 355764.74491873203 6688224.576072284, 355764.72183063754 6688224.56162571, 355764.6975713592 6688224.549246201, 355764.6723254989 6688224.539027961, 355764.64628516615 6688224.5310487375, 355764.6196485161 6688224.52536926, 355764.5926182416 6688224.522032741, 355764.56540003075 6688224.52106457), (355764.56540003075 6688224.52106457, 355764.5381972303 6688224.522472477, 355764.511220676 6688224.52624604, 355764.48467570357 6688224.532356542, 355764.45876436477 6688224.540757471, 355764.43368388776 6688224.551384878, 355764.4096251765 6688224.564157875, 355764.3867713581 6688224.578979234, 355764.36529638804 6688224.595736147, 355764.3453637261 6688224.6143010575, 355764.3271250933 6688224.634532662, 355764.3107193162 6688224.656276963, 355764.2962712692 6688224.679368447, 355764.28389092674 6688224.703631352, 355764.2736725235 6688224.728880998, 355764.2656938386 6688224.754925193, 355764.26001560286 6688224.781565693, 355764.2566810372 6688224.808599727, 355764.2557155232 6688224.835821512, 355764.2571264103 6688224.863023857, 355764.2609029589 6688224.889999693, 355764.2670164234 6688224.9165437, 355764.27542027016 6688224.9424538305, 355764.2860505318 6688224.967532862, 355764.29882629466 6688224.991589908, 355764.31365031365 6688225.014441848, 355764.3304097533 6688225.035914742, 355764.3489770467 6688225.05584515, 355764.3692108661 6688225.074081365, 355764.3909571982 6688225.09048458, 355764.4140505172 6688225.104929938, 355764.43831504456 6688225.117307488, 355764.46356608736 6688225.127523016, 355764.48961144267 6688225.135498763, 355764.5162528624 6688225.141174019, 355764.54328756075 6688225.144505589, 355764.5705097591 6688225.145468115), (355764.5705097591 6688225.145468115, 355764.5730646004 6688225.457719848), (355764.80415970273 6688225.065638981, 355764.9615629903 6688225.220487424), (355764.88020660594 6688224.83076146, 355765.19245833997 6688224.828206618), (355764.56540003075 6688224.52106457, 355764.5500709897 6688222.647554167), (355763.9434514499 6688224.83832606, 355764.2557031839 6688224.835771223), (355764.33583203965 6688225.069521221, 355764.18098359305 6688225.226924509), (355771.5705956073 6688204.9031470185, 355771.59780216415 6688204.901738106, 355771.6247823798 6688204.897963259, 355771.6513308989 6688204.891851211, 355771.6772456507 6688204.883448477, 355771.7023293893 6688204.872819018, 355771.72639119334 6688204.860043734, 355771.74924792023 6688204.84521987, 355771.770725599 6688204.828460247, 355771.79066075594 6688204.809892432, 355771.80890165723 6688204.789657752, 355771.8253094651 6688204.767910221, 355771.83975929406 6688204.744815365, 355771.8521411613 6688204.720548966, 355771.8623608238 6688204.695295729, 355771.8703404967 6688204.669247861, 355771.87601944327 6688204.642603622, 355771.8793544393 6688204.61556581, 355771.880320101 6688204.588340223), (355771.880320101 6688204.588340223, 355771.88032010105 6688204.588340221, 355771.8789090788 6688204.561134079, 355771.87513211183 6688204.53415446, 355771.8690179482 6688204.507606712, 355771.8606131247 6688204.4816929, 355771.849981614 6688204.456610268, 355771.83720433543 6688204.4325497225, 355771.82237854204 6688204.409694398, 355771.80561707786 6688204.3882182585, 355771.7870475204 6688204.368284762, 355771.76681120886 6688204.350045627, 355771.7450621692 6688204.333639689, 355771.7219659408 6688204.319191808, 355771.69769831747 6688204.306811959, 355771.6724440083 6688204.2965943655, 355771.64639523264 6688204.288616798, 355771.6197502572 6688204.282939977, 355771.5927118861 6688204.279607111, 355771.56548591796 6688204.278643566), (355771.56548591796 6688204.278643566, 355771.5382822456 6688204.2800564235, 355771.5113052145 6688204.283834717, 355771.4847601163 6688204.2899496965, 355771.45884895534 6688204.298354829, 355771.4337689118 6688204.308986147, 355771.4097108411 6688204.321762755, 355771.38685782166 6688204.336587417, 355771.3653837621 6688204.353347329, 355771.3454520765 6688204.371914943, 355771.32721444225 6688204.392148965, 355771.310809645 6688204.413895414, 355771.2963625233 6688204.436988809, 355771.283983017 6688204.4612534065, 355771.273765333 6688204.48650456, 355771.26578722615 6688204.51255011, 355771.2601094086 6688204.539191853, 355771.25677508785 6688204.5662270505, 355771.2558096378 6688204.593449969, 355771.2572204048 6688204.620653443, 355771.26099665376 6688204.647630463, 355771.2671096475 6688204.6741757365, 355771.2755128671 6688204.700087251, 355771.2861423658 6688204.725167834, 355771.2989172539 6688204.749226619, 355771.31374031666 6688204.772080522, 355771.33049875277 6688204.793555632, 355771.34906503296 6688204.8134885235, 355771.3692978704 6688204.831727512, 355771.3910432959 6688204.8481338, 355771.41413583024 6688204.862582538, 355771.43839974265 6688204.874963773, 355771.4636503876 6688204.885183285, 355771.489695612 6688204.893163311, 355771.5163372154 6688204.898843116, 355771.54337245855 6688204.9021794805, 355771.5705956073 6688204.9031470185), (355771.5705956073 6688204.9031470185, 355771.57315045217 6688205.215398745), (355771.8042455438 6688204.823317882, 355771.9616488291 6688204.978166322), (355771.88029248844 6688204.588340449, 355771.880320101 6688204.588340223), (355771.880320101 6688204.588340223, 355772.19254421414 6688204.585785607), (355771.56548591796 6688204.278643566, 355771.5632060564 6688204), (355770.9435373113 6688204.596004983, 355771.2557890369 6688204.593450137), (355771.3359179389 6688204.827100206, 355771.1810694983 6688204.984503494), (355666.2703650565 6688293.7866761815, 355666.29756582074 6688293.785265489, 355666.32454012707 6688293.781489489, 355666.35108268453 6688293.77537692, 355666.37699148833 6688293.766974299, 355666.40206935717 6688293.7563455785, 355666.4261254326 6688293.743571644, 355666.44897663407 6688293.728749721, 355666.4704490497 6688293.711992607, 355666.49037926155 6688293.6934278365, 355666.508615589 6688293.6731966995, 355666.5250192419 6688293.651453164, 355666.53946537944 6688293.628362715, 355666.55184405675 6688293.604101081, 355666.56206106546 6688293.578852911, 355666.5700386476 6688293.552810356, 355666.57571608917 6688293.526171617, 355666.5790501811 6688293.499139431, 355666.5800155492 6688293.471919527, 355666.57860484626 6688293.44471907, 355666.57482880866 6688293.417745069, 355666.56871617434 6688293.391202812, 355666.56031346426 6688293.365294302, 355666.54968462774 6688293.340216717, 355666.5369105572 6688293.316160915, 355666.52208847034 6688293.293309974, 355666.50533117284 6688293.271837802, 355666.4867661973 6688293.251907818, 355666.46653483505 6688293.2336717, 355666.4447910584 6688293.217268237, 355666.4217003509 6688293.202822265, 355666.3974384465 6688293.190443733, 355666.3721899933 6688293.180226843, 355666.3461471471 6688293.172249355, 355666.3195081098 6688293.166571984, 355666.29247562046 6688293.163237935, 355666.2652554123 6688293.162272582), (355666.2652554123 6688293.162272582, 355666.238054648 6688293.163683271, 355666.21108034207 6688293.167459273, 355666.18453778455 6688293.173571845, 355666.15862898063 6688293.181974463, 355666.1335511122 6688293.192603187, 355666.1094950368 6688293.205377118, 355666.0866438353 6688293.22019904, 355666.0651714198 6688293.236956156, 355666.04524120776 6688293.255520922, 355666.0270048804 6688293.27575206, 355666.01060122764 6688293.297495599, 355665.99615509046 6688293.320586048, 355665.98377641273 6688293.344847681, 355665.973559404 6688293.370095852, 355665.9655818219 6688293.396138406, 355665.95990438026 6688293.422777144, 355665.9565702884 6688293.449809329, 355665.9556049202 6688293.47702923, 355665.9570156232 6688293.50422969, 355665.9607916607 6688293.531203691, 355665.96690429497 6688293.557745949, 355665.9753070052 6688293.583654459, 355665.9859358416 6688293.608732044, 355665.9987099123 6688293.632787846, 355666.0135319989 6688293.655638789, 355666.0302892963 6688293.677110958, 355666.04885427165 6688293.6970409425, 355666.06908563414 6688293.715277061, 355666.09082941053 6688293.731680525, 355666.113920118 6688293.746126495, 355666.1381820225 6688293.75850503, 355666.1634304756 6688293.768721919, 355666.18947332184 6688293.776699406, 355666.2161123592 6688293.782376778, 355666.24314484873 6688293.785710828, 355666.2703650565 6688293.7866761815), (355666.2703650565 6688293.7866761815, 355666.27291985566 6688294.098927942), (355666.50411494466 6688293.706847114, 355666.6615182247 6688293.861695597), (355666.58006197197 6688293.471969543, 355666.89231373236 6688293.469414745), (355666.2652554123 6688293.162272582, 355666.24992662447 6688291.288762023), (355665.6433067364 6688293.479534017, 355665.9555584969 6688293.4769792175), (355666.03568732756 6688293.710729249, 355665.88083883945 6688293.868132528), (355648.3378953453 6688292.245285479, 355648.36509869713 6688292.2438721815, 355648.3920753742 6688292.240093506, 355648.418620092 6688292.233978201, 355648.4445308542 6688292.225572804, 355648.4696104871 6688292.214941276, 355648.493668143 6688292.202164525, 355648.5165207508 6688292.187339772, 355648.53799440886 6688292.170579828, 355648.55792570976 6688292.152012243, 355648.5761629825 6688292.131778296, 355648.59256744676 6688292.110031966, 355648.6070142699 6688292.086938737, 355648.6193935161 6688292.062674342, 355648.6296109831 6688292.037423422, 355648.63758891926 6688292.011378132, 355648.6432666151 6688291.984736668, 355648.6466008648 6688291.957701762, 355648.64756629587 6688291.930479141, 355648.646155562 6688291.903275964, 355648.64237939817 6688291.876299234, 355648.6362665394 6688291.849754237, 355648.6278635034 6688291.8238429725, 355648.6172342343 6688291.7987626195, 355648.6044596175 6688291.77470403, 355648.5896368639 6688291.751850279, 355648.57287876983 6688291.73037528, 355648.55431285925 6688291.71044245, 355648.53408041334 6688291.692203473, 355648.5123353942 6688291.675797141, 355648.4892432749 6688291.661348301, 355648.46497977915 6688291.648966904, 355648.4397295445 6688291.638747168, 355648.41368471755 6688291.630766862, 355648.3870434915 6688291.625086719, 355648.36000859685 6688291.621749952, 355648.33278576174 6688291.62078196), (355648.33278576174 6688291.62078196, 355648.3055788761 6688291.622190425, 355648.2785982972 6688291.625964881, 355648.25204938836 6688291.632076598, 355648.2261342271 6688291.640479055, 355648.2010500669 6688291.651108302, 355648.17698783695 6688291.663883433, 355648.154130687 6688291.6787072085, 355648.1326525945 6688291.695466795, 355648.1127170407 6688291.71403463, 355648.09447576536 6688291.73426938, 355648.07806761225 6688291.756017035, 355648.0636174727 6688291.779112056, 355648.0512353339 6688291.803378658, 355648.0410154423 6688291.828632131, 355648.0330355877 6688291.8546802625, 355648.02735650865 6688291.881324785, 355648.02402143134 6688291.908362891, 355648.02305574104 6688291.935588779), (355648.02305574104 6688291.935588779, 355648.02305574086 6688291.935588784, 355648.02446678776 6688291.962795231, 355648.0282438313 6688291.989775146, 355648.0343581231 6688292.016323178, 355648.0427631238 6688292.04223725, 355648.0533948588 6688292.0673201205, 355648.0661724038 6688292.091380869, 355648.08099850296 6688292.114236356, 355648.09776030685 6688292.135712617, 355648.11633023276 6688292.155646188, 355648.1365669351 6688292.173885339, 355648.1583163822 6688292.190291248, 355648.1814130271 6688292.204739035, 355648.20568106975 6688292.2171187345, 355648.2309357935 6688292.227336118, 355648.25698497123 6688292.235313414, 355648.2836303295 6688292.240989906, 355648.3106690559 6688292.244322383, 355648.3378953453 6688292.245285479), (355648.3378953453 6688292.245285479, 355648.34045012953 6688292.557537238), (355648.57154531276 6688292.165456371, 355648.7289485884 6688292.320304854), (355648.64759231295 6688291.930478928, 355648.95984407247 6688291.927924138), (355648.33278576174 6688291.62078196, 355648.3174570182 6688289.7472714055), (355647.71083703474 6688291.9381433, 355648.02305574104 6688291.935588779), (355648.02305574104 6688291.935588779, 355648.02308879414 6688291.935588509), (355648.10321765736 6688292.169238621, 355647.94836917333 6688292.326641896), (355753.81859965704 6688314.810617781, 355753.845804775 6688314.809206897, 355753.8727834016 6688314.8054303285, 355753.8993302132 6688314.799316814, 355753.9252431731 6688314.7909128815, 355753.9503250673 6688314.780282491, 355753.974385008 6688314.767506545, 355753.99723988434 6688314.75268228, 355754.01871575665 6688314.735922512, 355754.0386491811 6688314.717354796, 355754.0568884516 6688314.697120442, 355754.0732947571 6688314.675373448, 355754.087743235 6688314.652279323, 355754.10012392426 6688314.628013823, 355754.1103425996 6688314.602761622, 355754.1183214915 6688314.5767149115, 355754.1239998751 6688314.550071915, 355754.1273345353 6688314.523035407, 355754.1283000926 6688314.4958111495, 355754.1283000925 6688314.495811147), (355754.1283000925 6688314.495811147, 355754.1268891987 6688314.468606336, 355754.1231125916 6688314.441628014, 355754.11699901335 6688314.415081499, 355754.1085949921 6688314.389168832, 355754.0979644872 6688314.364087219, 355754.0851884035 6688314.340027553, 355754.0703639748 6688314.317172933, 355754.05360402376 6688314.295697306, 355754.03503610386 6688314.275764108, 355754.01480152796 6688314.257525043, 355753.9930542934 6688314.241118925, 355753.96995991014 6688314.226670614, 355753.9456941402 6688314.214290068, 355753.9204416607 6688314.2040715115, 355753.8943946582 6688314.1960927155, 355753.8677513661 6688314.190414398, 355753.84071455593 6688314.18707978, 355753.8134899943 6688314.1861142395), (355753.8134899943 6688314.1861142395, 355753.7862848765 6688314.187525122, 355753.7593062499 6688314.191301691, 355753.7327594381 6688314.197415207, 355753.7068464784 6688314.205819138, 355753.681764584 6688314.216449529, 355753.6577046433 6688314.2292254735, 355753.6348497671 6688314.244049741, 355753.61337389477 6688314.260809509, 355753.59344047034 6688314.279377224, 355753.57520119974 6688314.299611577, 355753.55879489455 6688314.321358572, 355753.5443464164 6688314.344452699, 355753.5319657273 6688314.3687181985, 355753.5217470516 6688314.393970398, 355753.5137681599 6688314.42001711, 355753.50808977615 6688314.446660105, 355753.50475511595 6688314.473696614, 355753.50378955866 6688314.50092087, 355753.5037895587 6688314.500920871), (355753.5037895587 6688314.500920871, 355753.5052004525 6688314.528125685, 355753.5089770596 6688314.555104007, 355753.5150906378 6688314.581650519, 355753.5234946592 6688314.607563189, 355753.53412516386 6688314.6326448005, 355753.5469012477 6688314.6567044705, 355753.5617256764 6688314.679559087, 355753.5784856274 6688314.701034717, 355753.59705354756 6688314.720967913, 355753.61728812335 6688314.739206975, 355753.6390353577 6688314.755613094, 355753.66212974093 6688314.770061404, 355753.6863955111 6688314.782441952, 355753.7116479906 6688314.792660508, 355753.73769499327 6688314.800639307, 355753.7643382852 6688314.806317622, 355753.79137509543 6688314.809652239, 355753.81859965704 6688314.810617781), (355753.81859965704 6688314.810617781, 355753.82115449215 6688315.122869552), (355754.0523495517 6688314.7307886835, 355754.20975285483 6688314.885637152), (355754.12829660036 6688314.495811176, 355754.1283000925 6688314.495811147), (355754.1283000925 6688314.495811147, 355754.4405483714 6688314.493256341), (355753.8134899943 6688314.1861142395, 355753.7981609912 6688312.312603617), (355753.19154128747 6688314.503475675, 355753.5037895587 6688314.500920871), (355753.5037895587 6688314.500920871, 355753.50379305845 6688314.500920842), (355753.58392195706 6688314.734570953, 355753.4290734889 6688314.8919742545), (355680.818392162 6688262.710168953, 355680.84559727967 6688262.70875807, 355680.87257590616 6688262.704981502, 355680.899122718 6688262.69886799, 355680.92503567797 6688262.69046406, 355680.9501175729 6688262.679833673, 355680.9741775143 6688262.667057731, 355680.99703239114 6688262.652233466, 355681.01850826485 6688262.635473701, 355681.03844169027 6688262.61690599, 355681.0566809625 6688262.59667164, 355681.07308726927 6688262.57492465, 355681.08753574884 6688262.551830526, 355681.0999164398 6688262.527565026, 355681.1101351172 6688262.50231283, 355681.11811401084 6688262.47626612, 355681.12379239703 6688262.449623128, 355681.12712705927 6688262.422586624, 355681.12809261866 6688262.395362371), (355681.12809261866 6688262.395362371, 355681.1280926188 6688262.395362367, 355681.126681727 6688262.368157555, 355681.1229051223 6688262.341179235, 355681.1167915462 6688262.314632722, 355681.108387527 6688262.288720056, 355681.0977570244 6688262.263638447, 355681.0849809428 6688262.239578775, 355681.07015651633 6688262.21672416, 355681.0533965673 6688262.19524853, 355681.0348286492 6688262.175315333, 355681.01459407515 6688262.157076271, 355680.9928468423 6688262.1406701505, 355680.9697524604 6688262.126221838, 355680.94548669196 6688262.1138412915, 355680.9202342134 6688262.103622735, 355680.8941872119 6688262.095643936, 355680.8675439208 6688262.089965618, 355680.84050711145 6688262.086630999, 355680.8132825502 6688262.085665457), (355680.8132825502 6688262.085665457, 355680.7860774326 6688262.087076336, 355680.75909880595 6688262.090852901, 355680.73255199427 6688262.096966416, 355680.70663903415 6688262.1053703455, 355680.6815571393 6688262.1160007315, 355680.657497198 6688262.128776674, 355680.63464232086 6688262.14360094, 355680.6131664474 6688262.160360702, 355680.59323302185 6688262.178928416, 355680.57499374973 6688262.199162765, 355680.5585874428 6688262.220909756, 355680.5441389632 6688262.244003882, 355680.5317582722 6688262.268269379, 355680.52153959486 6688262.293521576, 355680.5135607011 6688262.319568285, 355680.50788231497 6688262.346211276, 355680.50454765273 6688262.373247784, 355680.5035820932 6688262.400472038, 355680.5035820933 6688262.400472039), (355680.5035820933 6688262.400472039, 355680.5049929848 6688262.427676849, 355680.50876958977 6688262.45465517, 355680.51488316566 6688262.481201682, 355680.52328718494 6688262.50711435, 355680.5339176875 6688262.532195959, 355680.546693769 6688262.556255629, 355680.5615181957 6688262.579110246, 355680.5782781449 6688262.600585878, 355680.59684606286 6688262.620519073, 355680.6170806369 6688262.638758136, 355680.6388278696 6688262.655164253, 355680.6619222514 6688262.669612564, 355680.68618802004 6688262.681993112, 355680.7114404984 6688262.692211671, 355680.73748749995 6688262.70019047, 355680.7641307912 6688262.705868786, 355680.79116760095 6688262.709203408, 355680.818392162 6688262.710168953), (355680.818392162 6688262.710168953, 355680.82094696787 6688263.022420702), (355681.05204212456 6688262.6303398395, 355681.2094453942 6688262.785188312), (355681.128089104 6688262.3953623995, 355681.12809261866 6688262.395362371), (355681.12809261866 6688262.395362371, 355681.4403408518 6688262.392807596), (355680.8132825502 6688262.085665457, 355680.79795372236 6688260.212154972), (355680.19133386045 6688262.403026817, 355680.5035820933 6688262.400472039), (355680.5035820933 6688262.400472039, 355680.50358560827 6688262.4004720105), (355680.58371447923 6688262.634122112, 355680.42886600806 6688262.791525384), (355700.5155082421 6688269.58161021, 355700.54271335946 6688269.580199327, 355700.569691986 6688269.57642276, 355700.59623879765 6688269.570309248, 355700.62215175753 6688269.561905317, 355700.6472336519 6688269.551274928, 355700.67129359284 6688269.5384989865, 355700.69414846966 6688269.523674721, 355700.71562434273 6688269.506914957, 355700.7355577675 6688269.4883472435, 355700.7537970393 6688269.4681128925, 355700.77020334546 6688269.446365901, 355700.7846518245 6688269.423271777, 355700.7970325147 6688269.399006276, 355700.80725119135 6688269.373754081, 355700.8152300846 6688269.347707371, 355700.8209084697 6688269.321064376, 355700.82424313127 6688269.294027871, 355700.8252086899 6688269.266803618), (355700.8252086899 6688269.266803618, 355700.82520869 6688269.266803614, 355700.82379779767 6688269.239598804, 355700.820021192 6688269.212620481, 355700.8139076154 6688269.18607397, 355700.80550359574 6688269.160161303, 355700.7948730925 6688269.135079693, 355700.78209701047 6688269.111020025, 355700.7672725831 6688269.088165407, 355700.7505126335 6688269.066689775, 355700.73194471514 6688269.046756582, 355700.71171014046 6688269.028517515, 355700.68996290746 6688269.012111401, 355700.66686852544 6688268.99766309, 355700.6426027564 6688268.98528254, 355700.6173502778 6688268.975063984, 355700.5913032759 6688268.967085184, 355700.5646599847 6688268.961406867, 355700.53762317525 6688268.958072249, 355700.5103986143 6688268.957106707), (355700.5103986143 6688268.957106707, 355700.4831934969 6688268.95851759, 355700.45621487027 6688268.962294157, 355700.4296680587 6688268.96840767, 355700.40375509876 6688268.976811598, 355700.37867320416 6688268.987441988, 355700.3546132633 6688269.00021793, 355700.3317583865 6688269.015042197, 355700.31028251344 6688269.0318019595, 355700.29034908843 6688269.050369673, 355700.272109817 6688269.070604024, 355700.2557035106 6688269.092351015, 355700.24125503143 6688269.115445142, 355700.2288743415 6688269.139710641, 355700.21865566453 6688269.164962836, 355700.21067677136 6688269.191009547, 355700.20499838603 6688269.217652538, 355700.2016637245 6688269.244689045, 355700.2006981659 6688269.271913301), (355700.2006981659 6688269.271913301, 355700.20069816586 6688269.271913303, 355700.2021090581 6688269.299118112, 355700.2058856635 6688269.326096433, 355700.21199924033 6688269.352642945, 355700.22040326026 6688269.378555615, 355700.23103376327 6688269.403637225, 355700.2438098452 6688269.427696892, 355700.2586342726 6688269.450551511, 355700.27539422223 6688269.472027137, 355700.2939621408 6688269.491960335, 355700.3141967153 6688269.510199399, 355700.33594394854 6688269.526605516, 355700.35903833073 6688269.54105383, 355700.38330409967 6688269.553434374, 355700.4085565783 6688269.563652933, 355700.4346035801 6688269.571631731, 355700.4612468714 6688269.577310049, 355700.4882836808 6688269.580644665, 355700.5155082421 6688269.58161021), (355700.5155082421 6688269.58161021, 355700.518063056 6688269.893861962), (355700.74915820506 6688269.501781089, 355700.90656148776 6688269.656629556), (355700.82520517916 6688269.266803646, 355700.8252086899 6688269.266803618), (355700.8252086899 6688269.266803618, 355701.13745693024 6688269.26424883), (355700.5103986143 6688268.957106707, 355700.49506973824 6688267.0835962035), (355699.8884499259 6688269.274468084, 355700.2006981659 6688269.271913301), (355700.2006981659 6688269.271913301, 355700.20070167707 6688269.271913272), (355700.28083056223 6688269.505563372, 355700.1259820935 6688269.662966655), (355708.33404085384 6688282.718201334, 355708.3612480109 6688282.716793242, 355708.38822888944 6688282.713019111, 355708.41477811977 6688282.706907669, 355708.44069361896 6688282.698505435, 355708.4657781264 6688282.687876362, 355708.4898407076 6688282.6751013575, 355708.51269820606 6688282.660277656, 355708.5341766385 6688282.643518094, 355708.55411251826 6688282.624950238, 355708.57235410024 6688282.604715423, 355708.5887625356 6688282.582967668, 355708.60321292904 6688282.559872507, 355708.61559528887 6688282.535605737, 355708.6258153649 6688282.510352064, 355708.63379536534 6688282.484303712, 355708.6394745493 6688282.457658956, 355708.64280968835 6688282.430620599, 355708.6437753968 6688282.403394458), (355708.6437753968 6688282.403394458, 355708.6437753969 6688282.403394455, 355708.6423643241 6688282.3761877585, 355708.6385872108 6688282.349207596, 355708.63247280684 6688282.32265933, 355708.62406765315 6688282.296745043, 355708.6134357269 6688282.27166198, 355708.6006579546 6688282.247601066, 355708.5858315966 6688282.224745446, 355708.5690695056 6688282.203269087, 355708.5504992694 6688282.183335461, 355708.53026223835 6688282.165096298, 355708.5085124496 6688282.148690426, 355708.48541545536 6688282.13424272, 355708.46114706184 6688282.121863153, 355708.43589199224 6688282.111645952, 355708.40984247974 6688282.103668892, 355708.3831968037 6688282.097992686, 355708.35615778225 6688282.094660539, 355708.32893122756 6688282.09369782), (355708.32893122756 6688282.09369782, 355708.30172814976 6688282.095111491, 355708.27475177514 6688282.098890498, 355708.2482073818 6688282.10500608, 355708.22229696094 6688282.113411704, 355708.19721767906 6688282.124043408, 355708.17316037783 6688282.136820288, 355708.15030812233 6688282.151645117, 355708.1288348084 6688282.168405089, 355708.10890383756 6688282.186972658, 355708.0906668761 6688282.207206545, 355708.0742626984 6688282.228952772, 355708.0598161332 6688282.252045864, 355708.04743711255 6688282.276310091, 355708.03721983434 6688282.301560812, 355708.02924204845 6688282.327605882, 355708.02356446156 6688282.354247113, 355708.0202302774 6688282.381281771, 355708.01926486817 6688282.40850414, 355708.0206755799 6688282.435707067, 355708.02445167763 6688282.46268355, 355708.0305644271 6688282.489228311, 355708.03896731307 6688282.515139355, 355708.04959639336 6688282.540219517, 355708.0623707852 6688282.564277939, 355708.07719328196 6688282.587131554, 355708.0939510904 6688282.608606454, 355708.1125166916 6688282.628539225, 355708.1327488099 6688282.646778187, 355708.1544934875 6688282.66318455, 355708.17758525786 6688282.67763347, 355708.2018484027 6688282.690014997, 355708.2270982908 6688282.700234912, 355708.2531427817 6688282.708215449, 355708.2797836884 6688282.713895877, 355708.3068182861 6688282.717232966, 355708.33404085384 6688282.718201334), (355708.33404085384 6688282.718201334, 355708.33659567084 6688283.030453093), (355708.56779078813 6688282.638272336, 355708.72519407497 6688282.793120804), (355708.6437378012 6688282.403394765, 355708.6437753968 6688282.403394458), (355708.6437753968 6688282.403394458, 355708.95598955796 6688282.400839948), (355708.32893122756 6688282.09369782, 355708.3136023263 6688280.220187283), (355707.706982531 6688282.41105921, 355708.0192342878 6688282.408504394), (355708.0993631689 6688282.642154495, 355707.94451469905 6688282.7995577855), (355731.12570262176 6688298.061293946, 355731.15291023673 6688298.05988648, 355731.17989162105 6688298.056112894, 355731.2064413947 6688298.050001918, 355731.2323574641 6688298.041600066, 355731.2574425582 6688298.030971287, 355731.28150573204 6688298.018196489, 355731.30436381913 6688298.003372914, 355731.325842826 6688297.986613398, 355731.3457792567 6688297.968045509, 355731.36402135715 6688297.9478105875, 355731.3804302704 6688297.926062659, 355731.3948810931 6688297.902967266, 355731.40726382757 6688297.878700208, 355731.41748421703 6688297.853446202, 355731.4254644657 6688297.8273974825, 355731.4311438281 6688297.800752326, 355731.4344790738 6688297.773713556, 355731.43544481526 6688297.746486988, 355731.43403370114 6688297.719279866, 355731.43025647284 6688297.692299289, 355731.4241418822 6688297.66575063, 355731.4157364731 6688297.639835978, 355731.4051042262 6688297.614752587, 355731.3923260735 6688297.590691391, 355731.3774992808 6688297.567835548, 355731.36073670833 6688297.546359026, 355731.3421659506 6688297.526425304, 355731.3219283672 6688297.508186121, 355731.3001780036 6688297.491780301, 355731.27708042215 6688297.477332732, 355731.2528114389 6688297.464953386, 355731.2275557869 6688297.454736492, 355731.20150570985 6688297.446759823, 355731.1748594979 6688297.441084089, 355731.1478199795 6688297.437752502, 355731.1205929772 6688297.436790418), (355731.1205929772 6688297.436790418, 355731.09339035786 6688297.438204715, 355731.0664144896 6688297.441984269, 355731.03987064055 6688297.448100319, 355731.01396079065 6688297.456506327, 355730.98888209654 6688297.467138327, 355730.9648253889 6688297.479915417, 355730.94197372335 6688297.494740374, 355730.9205009852 6688297.511500391, 355730.9005705667 6688297.530067933, 355730.882334125 6688297.550301716, 355730.8659304266 6688297.572047773, 355730.8514842925 6688297.595140632, 355730.83910564746 6688297.619404573, 355730.82888868474 6688297.644654963, 355730.82091114833 6688297.670699667, 355730.81523374154 6688297.697340501, 355730.81189966557 6688297.724374747, 355730.8109342908 6688297.75159669, 355730.81234496296 6688297.778799196, 355730.8161209472 6688297.805775263, 355730.82223351154 6688297.832319631, 355730.8306361434 6688297.858230315, 355730.84126490453 6688297.883310148, 355730.8540389174 6688297.907368291, 355730.86886098067 6688297.9302216815, 355730.8856183086 6688297.951696416, 355730.9041833894 6688297.971629089, 355730.92441495584 6688297.98986803, 355730.9461590597 6688298.006274449, 355730.9692502433 6688298.020723505, 355730.9935127982 6688298.033105249, 355731.0187621043 6688298.04332547, 355731.0448060307 6688298.051306395, 355731.0714464018 6688298.056987298, 355731.0984805023 6688298.060324945, 355731.12570262176 6688298.061293946), (355731.12570262176 6688298.061293946, 355731.1282574476 6688298.373545708), (355731.3594525587 6688297.981364936, 355731.51685585367 6688298.136213406), (355731.43549948116 6688297.746487401, 355731.74775124463 6688297.743932578), (355731.1205929772 6688297.436790418, 355731.10536394274 6688295.563279885), (355730.498644276 6688297.754151831, 355730.81089603965 6688297.751597008), (355730.89102492953 6688297.985247109, 355730.7361764606 6688298.142650403), (355724.60141622793 6688285.403413668, 355724.62862134527 6688285.402002786, 355724.65559997136 6688285.398226216, 355724.68214678287 6688285.392112705, 355724.70805974223 6688285.383708772, 355724.7331416364 6688285.373078383, 355724.7572015768 6688285.360302439, 355724.78005645314 6688285.345478174, 355724.8015323256 6688285.328718409, 355724.8214657499 6688285.310150694, 355724.8397050206 6688285.289916342, 355724.8561113262 6688285.268169349, 355724.8705598045 6688285.245075223, 355724.88294049393 6688285.220809725, 355724.8931591698 6688285.195557526, 355724.90113806195 6688285.169510814, 355724.9068164465 6688285.142867821, 355724.9101511071 6688285.115831316, 355724.911116665 6688285.08860706), (355724.911116665 6688285.08860706, 355724.91111666505 6688285.088607059, 355724.9097057718 6688285.061402246, 355724.90592916554 6688285.034423925, 355724.8998155881 6688285.007877412, 355724.8914115676 6688284.981964746, 355724.8807810635 6688284.956883132, 355724.8680049808 6688284.932823463, 355724.85318055295 6688284.909968848, 355724.8364206027 6688284.88849322, 355724.8178526834 6688284.868560022, 355724.7976181086 6688284.8503209585, 355724.77587087505 6688284.833914843, 355724.75277649274 6688284.819466532, 355724.7285107233 6688284.807085984, 355724.7032582445 6688284.796867427, 355724.6772112428 6688284.78888863, 355724.65056795144 6688284.783210313, 355724.6235311421 6688284.779875698, 355724.596306581 6688284.778910155), (355724.596306581 6688284.778910155, 355724.56910146365 6688284.780321037, 355724.54212283733 6688284.784097605, 355724.51557602576 6688284.790211116, 355724.4896630664 6688284.798615049, 355724.46458117245 6688284.809245438, 355724.4405212319 6688284.822021383, 355724.4176663559 6688284.836845651, 355724.39619048324 6688284.853605414, 355724.376257059 6688284.872173129, 355724.3580177879 6688284.89240748, 355724.3416114828 6688284.914154475, 355724.3271630044 6688284.9372486, 355724.3147823148 6688284.9615140995, 355724.3045636388 6688284.9867662955, 355724.2965847465 6688285.012813006, 355724.29090636194 6688285.039455999, 355724.28757170134 6688285.066492506, 355724.28660614335 6688285.093716763, 355724.2866061434 6688285.093716764), (355724.2866061434 6688285.093716764, 355724.2880170367 6688285.120921576, 355724.2917936429 6688285.1478999, 355724.2979072202 6688285.174446409, 355724.3063112409 6688285.200359078, 355724.316941745 6688285.225440689, 355724.32971782784 6688285.2495003585, 355724.3445422557 6688285.272354974, 355724.36130220577 6688285.293830604, 355724.3798701249 6688285.313763802, 355724.40010469995 6688285.332002864, 355724.42185193364 6688285.34840898, 355724.444946316 6688285.362857292, 355724.4692120853 6688285.375237838, 355724.49446456414 6688285.385456396, 355724.52051156585 6688285.393435191, 355724.54715485754 6688285.399113511, 355724.57419166685 6688285.402448126, 355724.60141622793 6688285.403413668), (355724.60141622793 6688285.403413668, 355724.60397104407 6688285.715665428), (355724.8351661543 6688285.323484666, 355724.9925694452 6688285.478333132), (355724.91111316264 6688285.088607089, 355724.911116665 6688285.08860706), (355724.911116665 6688285.08860706, 355725.2233649207 6688285.086052263), (355724.596306581 6688284.778910155, 355724.5809776468 6688282.9053996075), (355723.97435788816 6688285.096271556, 355724.2866061434 6688285.093716764), (355724.2866061434 6688285.093716764, 355724.28660964634 6688285.093716735), (355724.3667385331 6688285.327366835, 355724.21189006564 6688285.484770126), (355682.4380502114 6688295.315567371, 355682.46525532904 6688295.314156486, 355682.4922339563 6688295.31037992, 355682.5187807685 6688295.304266405, 355682.54469372885 6688295.295862476, 355682.5697756241 6688295.285232089, 355682.59383556555 6688295.272456147, 355682.6166904429 6688295.25763188, 355682.63816631655 6688295.240872116, 355682.65809974214 6688295.2223044, 355682.6763390144 6688295.202070052, 355682.6927453212 6688295.180323058, 355682.707193801 6688295.157228934, 355682.7195744919 6688295.132963436, 355682.7297931694 6688295.107711239, 355682.7377720634 6688295.081664529, 355682.7434504492 6688295.055021535, 355682.74678511155 6688295.027985028, 355682.74775067077 6688295.000760775), (355682.74775067077 6688295.000760775, 355682.7477506709 6688295.000760772, 355682.74633977946 6688294.97355596, 355682.74256317434 6688294.9465776365, 355682.7364495984 6688294.920031126, 355682.7280455791 6688294.894118456, 355682.7174150766 6688294.869036846, 355682.70463899506 6688294.844977176, 355682.68981456826 6688294.822122558, 355682.6730546193 6688294.80064693, 355682.654486701 6688294.7807137305, 355682.63425212674 6688294.762474668, 355682.61250489386 6688294.746068547, 355682.5894105119 6688294.7316202335, 355682.5651447431 6688294.719239687, 355682.5398922643 6688294.709021126, 355682.5138452625 6688294.701042327, 355682.48720197077 6688294.695364009, 355682.4601651611 6688294.692029391, 355682.4329405994 6688294.691063845), (355682.4329405994 6688294.691063845, 355682.4057354808 6688294.692474726, 355682.378756853 6688294.696251294, 355682.3522100398 6688294.702364804, 355682.3262970786 6688294.710768734, 355682.3012151825 6688294.721399124, 355682.2771552398 6688294.734175064, 355682.2543003615 6688294.74899933, 355682.23282448685 6688294.765759096, 355682.2128910604 6688294.784326808, 355682.1946517871 6688294.804561158, 355682.1782454795 6688294.82630815, 355682.16379699885 6688294.849402275, 355682.1514163074 6688294.873667775, 355682.1411976292 6688294.898919972, 355682.13321873493 6688294.924966683, 355682.12754034885 6688294.951609679, 355682.12420568644 6688294.978646185, 355682.12324012676 6688295.00587044, 355682.123240127 6688295.005870445), (355682.123240127 6688295.005870445, 355682.12465101836 6688295.033075254, 355682.1284276235 6688295.060053578, 355682.1345411998 6688295.086600091, 355682.1429452196 6688295.112512762, 355682.1535757226 6688295.137594373, 355682.1663518047 6688295.16165404, 355682.1811762321 6688295.184508658, 355682.1979361823 6688295.20598429, 355682.21650410135 6688295.225917487, 355682.2367386763 6688295.244156552, 355682.2584859104 6688295.260562672, 355682.2815802933 6688295.275010984, 355682.30584606325 6688295.28739153, 355682.3310985429 6688295.297610089, 355682.35714554583 6688295.305588889, 355682.3837888383 6688295.311267206, 355682.41082564904 6688295.314601824, 355682.4380502114 6688295.315567371), (355682.4380502114 6688295.315567371, 355682.4406050172 6688295.627819132), (355682.671800106 6688295.235738299, 355682.82920338237 6688295.390586777), (355682.74774716666 6688295.000760804, 355682.74775067077 6688295.000760775), (355682.74775067077 6688295.000760775, 355683.0599989283 6688294.998206), (355682.4329405994 6688294.691063845, 355682.4176117259 6688292.817653203), (355681.81099188264 6688295.008425219, 355682.123240127 6688295.005870445), (355682.123240127 6688295.005870445, 355682.12324364414 6688295.005870416), (355682.2033724799 6688295.239620441, 355682.048524002 6688295.397023726), (355668.23643363646 6688272.544644928, 355668.2636362557 6688272.5432306295, 355668.29061212396 6688272.539451075, 355668.3171559732 6688272.533335026, 355668.3430658235 6688272.524929022, 355668.3681445182 6688272.5142970225, 355668.3922012262 6688272.501519934, 355668.4150528926 6688272.48669498, 355668.43652563175 6688272.469934966, 355668.4564560512 6688272.451367428, 355668.47469249414 6688272.431133647, 355668.49109619367 6688272.40938759, 355668.5055423291 6688272.386294733, 355668.51792097546 6688272.362030794, 355668.5281379399 6688272.336780406, 355668.53611547814 6688272.310735703, 355668.5417928864 6688272.284094873, 355668.5451269641 6688272.257060629, 355668.546092341 6688272.229838689, 355668.5446816709 6688272.202636187, 355668.54090568837 6688272.175660115, 355668.53479312593 6688272.149115748, 355668.5263904961 6688272.123205068, 355668.51576173696 6688272.098125235, 355668.50298772595 6688272.074067091, 355668.4881656645 6688272.0512137, 355668.47140833846 6688272.029738965, 355668.4528432591 6688272.009806289, 355668.43261169444 6688271.991567351, 355668.4108675921 6688271.97516093, 355668.38777640986 6688271.960711875, 355668.36351385573 6688271.948330126, 355668.3382645509 6688271.9381099045, 355668.31222062535 6688271.930128979, 355668.28558025474 6688271.924448076, 355668.2585461546 6688271.921110423, 355668.23132403556 6688271.920141424), (355668.23132403556 6688271.920141424, 355668.2041164196 6688271.921548886, 355668.1771350341 6688271.925322467, 355668.15058525914 6688271.931433441, 355668.1246691884 6688271.939835294, 355668.0995840924 6688271.950464068, 355668.07552091696 6688271.963238865, 355668.05266282783 6688271.978062437, 355668.0311838188 6688271.994821951, 355668.01124738605 6688272.013389837, 355667.99300528347 6688272.033624757, 355667.97659636795 6688272.055372683, 355667.96214554296 6688272.078468077, 355667.94976280635 6688272.102735132, 355667.9395424142 6688272.127989134, 355667.9315621637 6688272.154037854, 355667.9258827989 6688272.180683008, 355667.9225475512 6688272.207721777, 355667.9215818078 6688272.2349483445), (355667.9215818078 6688272.2349483445, 355667.9215818077 6688272.234948346, 355667.92299292015 6688272.262155469, 355667.92677014665 6688272.289136042, 355667.9328847357 6688272.315684703, 355667.9412901434 6688272.341599354, 355667.951922389 6688272.366682748, 355667.9647005405 6688272.390743939, 355667.97952733206 6688272.413599785, 355667.99628990405 6688272.435076309, 355668.0148606609 6688272.4550100295, 355668.03509824426 6688272.473249219, 355668.0568486072 6688272.489655036, 355668.0799461888 6688272.504102605, 355668.104215172 6688272.516481953, 355668.12947082426 6688272.526698847, 355668.15552090184 6688272.534675519, 355668.1821671142 6688272.540351252, 355668.20920663327 6688272.543682841, 355668.23643363646 6688272.544644928), (355668.23643363646 6688272.544644928, 355668.23898842937 6688272.856896677), (355668.47018351784 6688272.464815863, 355668.62758679397 6688272.619664339), (355668.5461305877 6688272.22983838, 355668.8583823393 6688272.227283577), (355668.23132403556 6688271.920141424, 355668.21599519445 6688270.046730839), (355667.60937533266 6688272.237502776, 355667.9215818078 6688272.2349483445), (355667.9215818078 6688272.2349483445, 355667.9216270842 6688272.234947974), (355668.0017559062 6688272.468697997, 355667.84690743056 6688272.626101274), (355688.2960049436 6688275.39246672, 355688.3232100615 6688275.391055838, 355688.3501886884 6688275.387279273, 355688.3767355005 6688275.381165757, 355688.4026484609 6688275.372761829, 355688.427730356 6688275.362131442, 355688.45179029746 6688275.349355499, 355688.47464517475 6688275.334531235, 355688.4961210483 6688275.31777147, 355688.5160544739 6688275.299203757, 355688.53429374594 6688275.278969405, 355688.5507000528 6688275.257222414, 355688.5651485324 6688275.234128288, 355688.5775292232 6688275.209862792, 355688.5877479008 6688275.184610594, 355688.59572679445 6688275.158563884, 355688.6014051802 6688275.131920893, 355688.6047398421 6688275.104884384, 355688.6057054014 6688275.077660133), (355688.6057054014 6688275.077660133, 355688.6057054015 6688275.077660129, 355688.6042945095 6688275.050455317, 355688.60051790427 6688275.023476994, 355688.59440432803 6688274.996930483, 355688.58600030845 6688274.971017814, 355688.5753698055 6688274.945936205, 355688.5625937236 6688274.921876536, 355688.5477692965 6688274.899021918, 355688.5310093472 6688274.877546291, 355688.5124414288 6688274.857613092, 355688.492206854 6688274.839374026, 355688.4704596212 6688274.822967911, 355688.44736523874 6688274.808519596, 355688.4230994698 6688274.796139049, 355688.3978469911 6688274.785920492, 355688.3717999892 6688274.777941693, 355688.3451566976 6688274.772263375, 355688.3181198878 6688274.768928756, 355688.29089532624 6688274.767963213), (355688.29089532624 6688274.767963213, 355688.2636902085 6688274.769374097, 355688.2367115817 6688274.773150664, 355688.21016476944 6688274.779264175, 355688.184251809 6688274.787668102, 355688.15916991414 6688274.798298494, 355688.13510997244 6688274.811074435, 355688.11225509515 6688274.8258986985, 355688.0907792216 6688274.842658465, 355688.07084579614 6688274.861226179, 355688.05260652397 6688274.88146053, 355688.0362002171 6688274.903207519, 355688.02175173745 6688274.926301644, 355688.00937104673 6688274.950567145, 355687.9991523691 6688274.97581934, 355687.9911734754 6688275.001866051, 355687.98549508967 6688275.028509043, 355687.9821604276 6688275.055545549, 355687.9811948683 6688275.082769805), (355687.9811948683 6688275.082769805, 355687.98260576016 6688275.109974616, 355687.98638236534 6688275.136952938, 355687.99249594175 6688275.163499451, 355688.0008999611 6688275.189412119, 355688.01153046417 6688275.214493731, 355688.02430654597 6688275.238553398, 355688.0391309731 6688275.261408016, 355688.05589092255 6688275.282883645, 355688.074458841 6688275.302816841, 355688.0946934155 6688275.321055907, 355688.11644064885 6688275.337462025, 355688.13953503076 6688275.351910336, 355688.1638008 6688275.364290884, 355688.18905327894 6688275.374509443, 355688.2151002808 6688275.382488241, 355688.2417435724 6688275.388166559, 355688.2687803822 6688275.391501178, 355688.2960049436 6688275.39246672), (355688.2960049436 6688275.39246672, 355688.2985597525 6688275.704718475), (355688.5296549097 6688275.312637604, 355688.6870581909 6688275.467486077), (355688.6057018882 6688275.077660162, 355688.6057054014 6688275.077660133), (355688.6057054014 6688275.077660133, 355688.9179536415 6688275.075105353), (355688.29089532624 6688274.767963213, 355688.2755664813 6688272.894452698), (355687.66894662846 6688275.0853245845, 355687.9811948683 6688275.082769805), (355687.9811948683 6688275.082769805, 355687.98119838175 6688275.082769776), (355688.06132725603 6688275.316419879, 355687.9064787837 6688275.473823161), (355758.23936172965 6688287.336488565, 355758.2665668468 6688287.3350776825, 355758.2935454726 6688287.33130111, 355758.3200922837 6688287.3251875965, 355758.3460052426 6688287.316783663, 355758.3710871364 6688287.306153273, 355758.395147076 6688287.29337733, 355758.41800195136 6688287.27855306, 355758.43947782303 6688287.261793296, 355758.4594112466 6688287.24322558, 355758.4776505163 6688287.222991225, 355758.49405682075 6688287.201244232, 355758.5085052979 6688287.178150105, 355758.5208859863 6688287.153884607, 355758.531104661 6688287.128632409, 355758.53908355226 6688287.102585697, 355758.54476193525 6688287.075942701, 355758.54809659463 6688287.048906195, 355758.5490621515 6688287.02168194), (355758.5490621515 6688287.02168194, 355758.5476512573 6688286.994477127, 355758.54387464956 6688286.967498803, 355758.53776107106 6688286.9409522945, 355758.5293570494 6688286.915039626, 355758.5187265443 6688286.889958014, 355758.50595046027 6688286.8658983465, 355758.4911260315 6688286.84304373, 355758.4743660805 6688286.821568102, 355758.45579816046 6688286.801634903, 355758.4355635848 6688286.783395844, 355758.4138163507 6688286.766989726, 355758.39072196773 6688286.752541416, 355758.36645619787 6688286.740160871, 355758.34120371874 6688286.729942314, 355758.3151567168 6688286.721963519, 355758.2885134253 6688286.716285204, 355758.2614766158 6688286.712950586, 355758.23425205477 6688286.711985047), (355758.23425205477 6688286.711985047, 355758.2070469376 6688286.71339593, 355758.18006831175 6688286.717172498, 355758.15352150076 6688286.723286016, 355758.1276085418 6688286.731689948, 355758.1025266482 6688286.742320338, 355758.07846670825 6688286.755096282, 355758.05561183294 6688286.769920551, 355758.03413596115 6688286.786680315, 355758.0142025379 6688286.80524803, 355757.995963268 6688286.825482385, 355757.9795569633 6688286.8472293755, 355757.96510848636 6688286.870323505, 355757.95272779797 6688286.894589004, 355757.9425091233 6688286.919841204, 355757.934530232 6688286.945887913, 355757.92885184876 6688286.972530907, 355757.92551718943 6688286.999567415, 355757.92455163266 6688287.026791671, 355757.9245516327 6688287.026791672), (355757.9245516327 6688287.026791672, 355757.9259625268 6688287.053996484, 355757.9297391346 6688287.080974808, 355757.9358527132 6688287.107521317, 355757.94425673474 6688287.133433987, 355757.9548872397 6688287.158515596, 355757.96766332374 6688287.182575264, 355757.98248775245 6688287.205429879, 355757.99924770347 6688287.226905508, 355758.0178156236 6688287.246838705, 355758.03805019945 6688287.265077769, 355758.05979743355 6688287.281483885, 355758.0828918165 6688287.295932195, 355758.1071575862 6688287.30831274, 355758.13241006556 6688287.318531296, 355758.15845706756 6688287.326510092, 355758.185100359 6688287.332188407, 355758.2121371687 6688287.335523026, 355758.23936172965 6688287.336488565), (355758.23936172965 6688287.336488565, 355758.2419165672 6688287.648740325), (355758.47301169334 6688287.256659427, 355758.630414992 6688287.411507886), (355758.5490586519 6688287.021681969, 355758.5490621515 6688287.02168194), (355758.5490621515 6688287.02168194, 355758.86131041154 6688287.019127134), (355758.23425205477 6688286.711985047, 355758.2189230373 6688284.838474492), (355757.61230337294 6688287.02934648, 355757.9245516327 6688287.026791672), (355757.9245516327 6688287.026791672, 355757.9245551326 6688287.026791643), (355758.0046840375 6688287.260441738, 355757.84983557626 6688287.417845037), (355760.20978163125 6688266.187384869, 355760.2369887867 6688266.185976773, 355760.2639696637 6688266.182202642, 355760.2905188925 6688266.176091198, 355760.3164343895 6688266.16768896, 355760.34151889506 6688266.157059888, 355760.36558147386 6688266.144284878, 355760.38843896997 6688266.129461175, 355760.4099173999 6688266.112701612, 355760.42985327734 6688266.094133756, 355760.4480948567 6688266.073898939, 355760.46450328967 6688266.052151183, 355760.47895368055 6688266.029056022, 355760.49133603775 6688266.004789251, 355760.5015561112 6688265.979535577, 355760.5095361093 6688265.953487227, 355760.5152152904 6688265.926842468, 355760.51855042734 6688265.8998041125, 355760.5195161333 6688265.8725779755), (355760.5195161333 6688265.8725779755, 355760.51951613347 6688265.87257797, 355760.5181050585 6688265.845371272, 355760.51432794315 6688265.818391111, 355760.5082135373 6688265.791842847, 355760.499808382 6688265.76592856, 355760.4891764541 6688265.740845498, 355760.4763986806 6688265.716784586, 355760.46157232113 6688265.693928967, 355760.4448102294 6688265.672452612, 355760.4262399924 6688265.652518987, 355760.4060029607 6688265.634279825, 355760.3842531717 6688265.617873955, 355760.36115617724 6688265.603426252, 355760.33688778395 6688265.591046685, 355760.31163271493 6688265.580829489, 355760.2855832027 6688265.572852431, 355760.2589375273 6688265.567176224, 355760.2318985072 6688265.563844083, 355760.20467195363 6688265.562881365), (355760.20467195363 6688265.562881365, 355760.17746887705 6688265.564295037, 355760.150492504 6688265.568074045, 355760.1239481124 6688265.574189631, 355760.09803769365 6688265.582595258, 355760.0729584137 6688265.5932269655, 355760.0489011146 6688265.606003847, 355760.0260488613 6688265.620828677, 355760.0045755496 6688265.637588647, 355759.98464458133 6688265.65615622, 355759.9664076224 6688265.676390108, 355759.9500034473 6688265.698136338, 355759.93555688456 6688265.721229428, 355759.92317786627 6688265.745493654, 355759.91296059097 6688265.770744377, 355759.9049828073 6688265.796789449, 355759.8993052227 6688265.823430678, 355759.8959710411 6688265.850465337, 355759.89500563405 6688265.877687701, 355759.896416348 6688265.904890629, 355759.90019244794 6688265.931867114, 355759.9063051993 6688265.958411874, 355759.91470808705 6688265.984322919, 355759.92533716874 6688266.009403077, 355759.9381115621 6688266.033461498, 355759.95293405995 6688266.056315111, 355759.9696918697 6688266.07779001, 355759.98825747176 6688266.097722778, 355760.0084895903 6688266.115961739, 355760.0302342686 6688266.1323681, 355760.0533260388 6688266.146817017, 355760.07758918375 6688266.159198545, 355760.1028390715 6688266.169418455, 355760.1288835617 6688266.177398987, 355760.1555244679 6688266.183079412, 355760.18255906465 6688266.186416501, 355760.20978163125 6688266.187384869), (355760.20978163125 6688266.187384869, 355760.2123364699 6688266.49963662), (355760.44343158795 6688266.10755573, 355760.6008348828 6688266.262404185), (355760.51947854337 6688265.872578283, 355760.5195161333 6688265.8725779755), (355760.5195161333 6688265.8725779755, 355760.83173029433 6688265.870023445), (355760.20467195363 6688265.562881365, 355760.18934292864 6688263.689370863), (355759.58272329066 6688265.880242795, 355759.8949750415 6688265.877687955), (355759.9751039378 6688266.11133805, 355759.82025548164 6688266.268741346), (355718.2891638371 6688358.251136055, 355718.31636895635 6688358.249725173, 355718.3433475846 6688358.245948604, 355718.3698943981 6688358.239835092, 355718.3958073596 6688358.231431159, 355718.42088925553 6688358.2208007695, 355718.44494919805 6688358.208024825, 355718.467804076 6688358.1932005575, 355718.4892799501 6688358.17644079, 355718.5092133763 6688358.1578730745, 355718.5274526486 6688358.13763872, 355718.54385895556 6688358.115891726, 355718.55830743525 6688358.092797599, 355718.5706881258 6688358.068532095, 355718.580906803 6688358.043279898, 355718.58888569626 6688358.017233184, 355718.59456408146 6688357.990590188, 355718.5978987428 6688357.963553679, 355718.598864301 6688357.9363294225), (355718.598864301 6688357.9363294225, 355718.59886430105 6688357.936329421, 355718.5974534082 6688357.9091246035, 355718.59367680195 6688357.882146278, 355718.58756322425 6688357.855599764, 355718.57915920333 6688357.829687093, 355718.5685286991 6688357.804605481, 355718.5557526156 6688357.780545809, 355718.5409281869 6688357.75769119, 355718.52416823595 6688357.73621556, 355718.5056003157 6688357.716282358, 355718.4853657395 6688357.698043296, 355718.4636185045 6688357.681637174, 355718.4405241209 6688357.667188865, 355718.41625834984 6688357.654808314, 355718.3910058694 6688357.644589758, 355718.3649588659 6688357.636610958, 355718.33831557253 6688357.630932641, 355718.31127876113 6688357.627598021, 355718.2840541983 6688357.626632479), (355718.2840541983 6688357.626632479, 355718.256849079 6688357.628043362, 355718.22987045074 6688357.631819931, 355718.20332363737 6688357.637933445, 355718.1774106759 6688357.646337377, 355718.1523287798 6688357.656967767, 355718.1282688374 6688357.669743711, 355718.1054139591 6688357.684567975, 355718.0839380849 6688357.701327744, 355718.064004659 6688357.719895461, 355718.0457653866 6688357.7401298145, 355718.0293590793 6688357.7618768085, 355718.0149105998 6688357.784970935, 355718.0025299091 6688357.809236438, 355717.99231123197 6688357.834488639, 355717.9843323388 6688357.8605353525, 355717.9786539534 6688357.887178346, 355717.9753192925 6688357.914214858, 355717.9743537339 6688357.941439114), (355717.9743537339 6688357.941439114, 355717.9743537338 6688357.9414391145, 355717.9757646266 6688357.968643929, 355717.9795412329 6688357.995622256, 355717.9856548106 6688358.02216877, 355717.9940588315 6688358.048081444, 355718.0046893357 6688358.073163054, 355718.01746541914 6688358.097222724, 355718.0322898478 6688358.120077345, 355718.04904979904 6688358.1415529745, 355718.0676177191 6688358.161486174, 355718.0878522956 6688358.17972524, 355718.10959953035 6688358.196131359, 355718.1326939142 6688358.210579673, 355718.15695968515 6688358.222960222, 355718.1822121656 6688358.233178778, 355718.20825916936 6688358.241157577, 355718.23490246275 6688358.246835895, 355718.26193927403 6688358.250170513, 355718.2891638371 6688358.251136055), (355718.2891638371 6688358.251136055, 355718.29171864915 6688358.563387843), (355718.52281381935 6688358.171306923, 355718.6802171233 6688358.326155408), (355718.5988608059 6688357.936329451, 355718.598864301 6688357.9363294225), (355718.598864301 6688357.9363294225, 355718.9111125942 6688357.933774632), (355718.2840541983 6688357.626632479, 355718.268725289 6688355.753121753), (355717.66210544115 6688357.943993904, 355717.9743537339 6688357.941439114), (355717.9743537339 6688357.941439114, 355717.9743572294 6688357.941439085), (355718.0544861205 6688358.175089213, 355717.8996376362 6688358.332492518), (355717.0007400754 6688330.662180106, 355717.02794663614 6688330.660771196, 355717.054926856 6688330.656996352, 355717.08147537924 6688330.650884304, 355717.10739013535 6688330.64248157, 355717.1324738784 6688330.631852111, 355717.156535687 6688330.619076829, 355717.179392418 6688330.6042529605, 355717.2008701016 6688330.58749334, 355717.2208052624 6688330.568925521, 355717.2390461682 6688330.5486908415, 355717.25545398024 6688330.526943306, 355717.26990381285 6688330.503848447, 355717.2822856839 6688330.479582047, 355717.29250535 6688330.454328806, 355717.300485026 6688330.428280934, 355717.3061639754 6688330.40163669, 355717.30949897435 6688330.374598877, 355717.3104646385 6688330.347373284), (355717.3104646385 6688330.347373284, 355717.30905361834 6688330.320167139, 355717.30527665286 6688330.293187512, 355717.2991624906 6688330.26663976, 355717.29075766815 6688330.240725943, 355717.28012615757 6688330.2156433035, 355717.2673488794 6688330.191582754, 355717.25252308586 6688330.168727426, 355717.23576162104 6688330.147251279, 355717.2171920627 6688330.127317779, 355717.19695574994 6688330.109078645, 355717.1752067083 6688330.092672696, 355717.152110478 6688330.078224813, 355717.12784285215 6688330.06584496, 355717.1025885402 6688330.055627362, 355717.0765397616 6688330.0476497905, 355717.0498947832 6688330.04197297, 355717.0228564087 6688330.038640099, 355716.9956304365 6688330.037676553), (355716.9956304365 6688330.037676553, 355716.96842676 6688330.039089406, 355716.941449725 6688330.0428677, 355716.9149046224 6688330.048982676, 355716.88899345713 6688330.057387807, 355716.8639134092 6688330.068019126, 355716.83985533385 6688330.080795732, 355716.81700231036 6688330.095620399, 355716.795528246 6688330.112380308, 355716.7755965563 6688330.130947926, 355716.7573589177 6688330.151181949, 355716.74095411657 6688330.172928405, 355716.7265069908 6688330.196021799, 355716.71412748087 6688330.220286399, 355716.7039097933 6688330.245537557, 355716.6959316829 6688330.271583107, 355716.6902538624 6688330.298224855, 355716.686919539 6688330.325260057, 355716.6859540866 6688330.35248298, 355716.68736485165 6688330.37968646, 355716.69114109874 6688330.406663484, 355716.69725409127 6688330.433208758, 355716.7056573102 6688330.459120283, 355716.71628680796 6688330.484200868, 355716.72906169604 6688330.508259658, 355716.7438847592 6688330.531113569, 355716.760643196 6688330.552588683, 355716.77920947707 6688330.5725215785, 355716.79944231565 6688330.590760569, 355716.821187743 6688330.607166863, 355716.8442802796 6688330.621615607, 355716.8685441943 6688330.633996844, 355716.8937948423 6688330.644216363, 355716.9198400695 6688330.652196391, 355716.94648167613 6688330.657876197, 355716.97351692274 6688330.661212566, 355717.0007400754 6688330.662180106), (355717.0007400754 6688330.662180106, 355717.00329494075 6688330.974331961), (355717.2343901022 6688330.582251054, 355717.39179340046 6688330.737099533), (355717.3104370328 6688330.347373511, 355717.3104646385 6688330.347373284), (355717.3104646385 6688330.347373284, 355717.6226888095 6688330.3448186945), (355716.9956304365 6688330.037676553, 355716.9803015271 6688328.164165896), (355716.3736817025 6688330.355037965, 355716.6859334792 6688330.352483148), (355716.76606237504 6688330.586133264, 355716.61121389637 6688330.743536563), (355826.7655334581 6688310.233906057, 355826.7927385745 6688310.232495173, 355826.8197171996 6688310.2287186, 355826.8462640095 6688310.222605083, 355826.87217696715 6688310.214201149, 355826.8972588594 6688310.203570756, 355826.92131879757 6688310.190794808, 355826.9441736713 6688310.175970539, 355826.96564954106 6688310.15921077, 355826.9855829626 6688310.140643053, 355827.0038222303 6688310.120408695, 355827.0202285329 6688310.098661701, 355827.0346770079 6688310.075567573, 355827.047057694 6688310.05130207, 355827.0572763666 6688310.026049869, 355827.0652552556 6688310.000003158, 355827.0709336367 6688309.973360163, 355827.0742682936 6688309.946323654, 355827.0752338483 6688309.919099396, 355827.0752338483 6688309.919099395), (355827.0752338483 6688309.919099395, 355827.0738229517 6688309.891894584, 355827.0700463422 6688309.864916259, 355827.0639327616 6688309.838369747, 355827.0555287381 6688309.812457079, 355827.0448982314 6688309.78737547, 355827.03212214605 6688309.7633158015, 355827.017297716 6688309.740461187, 355827.00053776347 6688309.7189855585, 355826.9819698424 6688309.699052364, 355826.96173526585 6688309.680813302, 355826.93998803064 6688309.664407186, 355826.9168936472 6688309.649958878, 355826.89262787695 6688309.637578333, 355826.8673753976 6688309.627359779, 355826.8413283958 6688309.619380985, 355826.8146851043 6688309.61370267, 355826.78764829505 6688309.610368054, 355826.76042373467 6688309.609402516), (355826.76042373467 6688309.609402516, 355826.7332186185 6688309.6108134035, 355826.70623999345 6688309.614589978, 355826.6796931836 6688309.620703492, 355826.6537802259 6688309.629107427, 355826.6286983336 6688309.639737819, 355826.6046383955 6688309.652513767, 355826.5817835217 6688309.667338035, 355826.56030765205 6688309.684097807, 355826.5403742306 6688309.702665524, 355826.5221349625 6688309.7228998775, 355826.5057286601 6688309.7446468705, 355826.49128018506 6688309.767741, 355826.47889949894 6688309.792006503, 355826.4686808263 6688309.8172587035, 355826.4607019373 6688309.8433054155, 355826.4550235564 6688309.869948412, 355826.45168889925 6688309.89698492, 355826.4507233446 6688309.9242091775, 355826.45072334475 6688309.924209181), (355826.45072334475 6688309.924209181, 355826.4521342411 6688309.95141399, 355826.45591085055 6688309.978392314, 355826.4620244312 6688310.004938827, 355826.4704284545 6688310.030851493, 355826.4810589613 6688310.055933104, 355826.4938350468 6688310.079992772, 355826.5086594769 6688310.102847388, 355826.5254194293 6688310.124323016, 355826.5439873504 6688310.144256211, 355826.5642219269 6688310.162495273, 355826.58596916206 6688310.178901388, 355826.6090635456 6688310.193349698, 355826.63332931575 6688310.205730241, 355826.65858179505 6688310.215948796, 355826.6846287971 6688310.22392759, 355826.7112720885 6688310.229605904, 355826.7383088976 6688310.23294052, 355826.7655334581 6688310.233906057), (355826.7655334581 6688310.233906057, 355826.7680883235 6688310.5461578285), (355826.999183423 6688310.154076892, 355827.1565867411 6688310.308925344), (355827.0752303708 6688309.919099424, 355827.0752338483 6688309.919099395), (355827.0752338483 6688309.919099395, 355827.38748214126 6688309.916544556), (355826.76042373467 6688309.609402516, 355826.74509454955 6688307.735891895), (355826.13847505907 6688309.926764015, 355826.45072334475 6688309.924209181), (355826.45072334475 6688309.924209181, 355826.4507268296 6688309.924209152), (355826.5308557508 6688310.15785925, 355826.3760072982 6688310.315262569), (355697.72683616314 6688294.884121106, 355697.7540412337 6688294.882710157, 355697.78101980843 6688294.878933532, 355697.8075665643 6688294.87281997, 355697.8334794656 6688294.864416001, 355697.85856130015 6688294.853785584, 355697.8826211802 6688294.841009619, 355697.90547599667 6688294.82618534, 355697.92695181066 6688294.809425569, 355697.94688517915 6688294.790857859, 355697.9651243975 6688294.770623518, 355697.9815306548 6688294.748876546, 355697.9959790896 6688294.725782441, 355698.0083597414 6688294.701516974, 355698.01857838593 6688294.6762648085, 355698.02655725385 6688294.650218137, 355698.0322356207 6688294.623575184, 355698.035570271 6688294.596538717, 355698.0365358268 6688294.569314509), (355698.0365358268 6688294.569314509, 355698.03653582686 6688294.569314507, 355698.03512493876 6688294.542109739, 355698.0313483451 6688294.51513146, 355698.0252347876 6688294.488584987, 355698.0168307941 6688294.4626723565, 355698.00620032405 6688294.437590778, 355697.9934242809 6688294.413531137, 355697.9785998984 6688294.390676544, 355697.9618399985 6688294.369200931, 355697.9432721335 6688294.349267743, 355697.9230376159 6688294.331028682, 355697.9012904415 6688294.314622558, 355697.87819611985 6688294.300174231, 355697.8539304116 6688294.287793661, 355697.82867799274 6688294.277575071, 355697.8026310488 6688294.269596232, 355697.77598781255 6688294.263917866, 355697.7489510538 6688294.260583188, 355697.7217265386 6688294.259617581), (355697.7217265386 6688294.259617581, 355697.6945213732 6688294.261028396, 355697.6675426939 6688294.264804909, 355697.64099582547 6688294.270918376, 355697.6150828061 6688294.279322264, 355697.59000085015 6688294.28995262, 355697.5659408473 6688294.302728542, 355697.54308590916 6688294.317552794, 355697.5216099763 6688294.334312556, 355697.5016764936 6688294.352880271, 355697.483437168 6688294.373114636, 355697.46703081194 6688294.394861645, 355697.452582288 6688294.417955795, 355697.44020155846 6688294.442221325, 355697.429982849 6688294.467473554, 355697.42200392974 6688294.493520305, 355697.41632552556 6688294.520163338, 355697.4129908529 6688294.547199891, 355697.41202529025 6688294.57442419, 355697.4120252903 6688294.574424191), (355697.4120252903 6688294.574424191, 355697.41343618673 6688294.601629046, 355697.4172128041 6688294.628607413, 355697.4233264 6688294.6551539665, 355697.43173044606 6688294.6810666695, 355697.44236098236 6688294.706148316, 355697.4551371037 6688294.730208012, 355697.46996157616 6688294.753062653, 355697.4867215756 6688294.774538302, 355697.5052895484 6688294.79447151, 355697.5255241802 6688294.812710576, 355697.5472714732 6688294.829116689, 355697.57036591624 6688294.843564986, 355697.5946317466 6688294.855945513, 355697.6198842859 6688294.866164037, 355697.64593134646 6688294.874142796, 355697.6725746937 6688294.879821065, 355697.6996115551 6688294.883155626, 355697.72683616314 6688294.884121106), (355697.72683616314 6688294.884121106, 355697.7293909679 6688295.1963728685), (355697.96058604884 6688294.804292029, 355698.11798933585 6688294.959140505), (355698.03653311246 6688294.569314531, 355698.0365358268 6688294.569314509), (355698.0365358268 6688294.569314509, 355698.34878487396 6688294.566759724), (355697.7217265386 6688294.259617581, 355697.7063976726 6688292.3861070145), (355697.0997778278 6688294.5769789675, 355697.4120252903 6688294.574424191), (355697.4120252903 6688294.574424191, 355697.41202958935 6688294.574424156), (355697.4921584684 6688294.808074265, 355697.3373099935 6688294.965477546), (355715.72846844123 6688296.605298747, 355715.75567355915 6688296.603887865, 355715.782652186 6688296.600111297, 355715.8091989979 6688296.593997783, 355715.83511195815 6688296.585593853, 355715.86019385303 6688296.574963466, 355715.88425379415 6688296.56218752, 355715.90710867115 6688296.547363255, 355715.9285845444 6688296.530603489, 355715.94851796946 6688296.512035774, 355715.96675724135 6688296.491801425, 355715.9831635475 6688296.470054432, 355715.99761202675 6688296.446960305, 355716.009992717 6688296.422694807, 355716.0202113936 6688296.397442607, 355716.02819028683 6688296.371395897, 355716.0338686721 6688296.344752904, 355716.0372033333 6688296.317716396, 355716.0381688921 6688296.29049214, 355716.038168892 6688296.290492138), (355716.038168892 6688296.290492138, 355716.03675799957 6688296.263287327, 355716.0329813937 6688296.236309005, 355716.02686781663 6688296.209762491, 355716.0184637968 6688296.183849824, 355716.00783329294 6688296.15876821, 355715.9950572108 6688296.134708543, 355715.9802327832 6688296.111853925, 355715.9634728331 6688296.090378294, 355715.944904914 6688296.070445098, 355715.92467033915 6688296.052206035, 355715.9029231056 6688296.035799917, 355715.87982872315 6688296.021351604, 355715.85556295386 6688296.008971057, 355715.83031047473 6688295.998752498, 355715.8042634726 6688295.990773701, 355715.7776201809 6688295.985095383, 355715.7505833708 6688295.981760764, 355715.7233588094 6688295.980795221), (355715.7233588094 6688295.980795221, 355715.6961536916 6688295.982206105, 355715.6691750649 6688295.985982673, 355715.6426282527 6688295.992096188, 355715.61671529256 6688296.000500116, 355715.59163339785 6688296.011130504, 355715.56757345644 6688296.023906447, 355715.5447185796 6688296.038730713, 355715.5232427064 6688296.05549048, 355715.50330928114 6688296.074058195, 355715.4850700093 6688296.094292546, 355715.4686637029 6688296.116039536, 355715.45421522396 6688296.139133663, 355715.44183453376 6688296.163399164, 355715.43161585694 6688296.188651361, 355715.42363696377 6688296.2146980725, 355715.41795857844 6688296.241341065, 355715.41462391726 6688296.268377572, 355715.4136583585 6688296.29560183, 355715.4136583587 6688296.295601834), (355715.4136583587 6688296.295601834, 355715.41506925086 6688296.322806641, 355715.4188458567 6688296.349784964, 355715.4249594337 6688296.376331476, 355715.4333634537 6688296.402244147, 355715.4439939574 6688296.427325758, 355715.45677003975 6688296.451385425, 355715.47159446747 6688296.474240044, 355715.48835441744 6688296.495715672, 355715.5069223363 6688296.515648871, 355715.52715691115 6688296.533887933, 355715.5489041447 6688296.550294053, 355715.5719985274 6688296.564742366, 355715.5962642968 6688296.577122913, 355715.62151677575 6688296.58734147, 355715.64756377804 6688296.595320268, 355715.67420706974 6688296.600998586, 355715.7012438797 6688296.604333202, 355715.72846844123 6688296.605298747), (355715.72846844123 6688296.605298747, 355715.731023261 6688296.917550512), (355715.9622183334 6688296.5254696645, 355716.11962162465 6688296.680318137), (355716.03816538415 6688296.290492167, 355716.038168892 6688296.290492138), (355716.038168892 6688296.290492138, 355716.3504171468 6688296.287937348), (355715.7233588094 6688295.980795221, 355715.7080298457 6688294.107384571), (355715.1014100965 6688296.298156625, 355715.4136583587 6688296.295601834), (355715.4136583587 6688296.295601834, 355715.4136618591 6688296.295601805), (355715.49379070563 6688296.5293518305, 355715.33894223406 6688296.686755122), (355699.9036358749 6688309.197086761, 355699.93083871255 6688309.195672761, 355699.95781482145 6688309.191893466, 355699.9843589289 6688309.185777634, 355700.01026905025 6688309.17737181, 355700.035348024 6688309.166739949, 355700.05940501374 6688309.153962959, 355700.0822569597 6688309.1391380625, 355700.1037299717 6688309.12237807, 355700.12366065255 6688309.1038105115, 355700.1418973416 6688309.08357668, 355700.1583012677 6688309.061830541, 355700.1727476069 6688309.038737573, 355700.1851264307 6688309.014473495, 355700.1953435435 6688308.989222948, 355700.2033211988 6688308.963178071, 355700.2089986916 6688308.936537048, 355700.2123328193 6688308.909502609, 355700.21329821064 6688308.8822804615, 355700.2118875205 6688308.855077758, 355700.20811148273 6688308.828101492, 355700.2019988308 6688308.801556936, 355700.19359607884 6688308.775646081, 355700.1829671666 6688308.750566093, 355700.1701929739 6688308.726507814, 355700.1553707056 6688308.703654319, 355700.1386131499 6688308.682179505, 355700.1200478219 6688308.662246782, 355700.099815994 6688308.644007832, 355700.0780716178 6688308.627601438, 355700.05498015595 6688308.613152448, 355700.0307173208 6688308.600770803, 355700.00546773884 6688308.590550729, 355699.979423544 6688308.582569986, 355699.9527829185 6688308.576889308, 355699.9257485818 6688308.573551924, 355699.89852624916 6688308.572583225), (355699.89852624916 6688308.572583225, 355699.8713188504 6688308.573990987, 355699.8443377047 6688308.577764827, 355699.81778818736 6688308.583876024, 355699.7918723874 6688308.59227806, 355699.76678757 6688308.602906975, 355699.7427246758 6688308.615681871, 355699.7198668669 6688308.630505506, 355699.69838813104 6688308.647265045, 355699.6784519602 6688308.665832916, 355699.66021010454 6688308.686067787, 355699.6438014168 6688308.707815635, 355699.6293507966 6688308.730910918, 355699.61696823896 6688308.755177842, 355699.6067479971 6688308.78043169, 355699.5987678652 6688308.806480234, 355699.5930885868 6688308.833125202, 355699.589753391 6688308.860163777, 355699.5887876649 6688308.887390141), (355699.5887876649 6688308.887390141, 355699.5887876648 6688308.887390145, 355699.5901987588 6688308.914597069, 355699.59397593216 6688308.941577446, 355699.60009043396 6688308.96812592, 355699.6084957221 6688308.994040402, 355699.6191278168 6688309.019123636, 355699.63190578966 6688309.0431846995, 355699.6467323763 6688309.0660404395, 355699.663494721 6688309.087516883, 355699.68206523155 6688309.10745056, 355699.7023025539 6688309.1256897375, 355699.7240526456 6688309.142095581, 355699.7471499496 6688309.156543217, 355699.77141865395 6688309.168922669, 355699.7966740307 6688309.179139707, 355699.82272384135 6688309.187116564, 355699.84936980007 6688309.192792522, 355699.87640908343 6688309.196124371, 355699.9036358749 6688309.197086761), (355699.9036358749 6688309.197086761, 355699.9061906877 6688309.509338527), (355700.13738581823 6688309.11715776, 355700.2947891011 6688309.272006239), (355700.2133328295 6688308.882280177, 355700.525584597 6688308.879725366), (355699.89852624916 6688308.572583225, 355699.8831973796 6688306.699072624), (355699.276577527 6688308.889944612, 355699.5887876649 6688308.887390141), (355699.5887876649 6688308.887390141, 355699.58882929455 6688308.8873898005), (355699.668958183 6688309.121039914, 355699.51410970546 6688309.278443201), (355678.8947018784 6688307.265398097, 355678.9219059776 6688307.263985826, 355678.94888347917 6688307.260208039, 355678.975429083 6688307.25409349, 355679.0013407745 6688307.245688713, 355679.0264213645 6688307.23505767, 355679.0504799871 6688307.222281257, 355679.0733335547 6688307.207456712, 355679.0948081497 6688307.190696842, 355679.1147403494 6688307.172129201, 355679.13297846727 6688307.151895082, 355679.14938371093 6688307.130148473, 355679.1638312347 6688307.107054865, 355679.17621109163 6688307.082790001, 355679.1864290703 6688307.05753854, 355679.1944074113 6688307.03149265, 355679.2000853987 6688307.004850537, 355679.20341982297 6688306.977814956, 355679.204385308 6688306.950591642, 355679.20297450724 6688306.9233877715, 355679.19919815665 6688306.896410368, 355679.19308499445 6688306.86986473, 355679.1846815423 6688306.843952874, 355679.1740517512 6688306.818871986, 355679.16127651435 6688306.794812938, 355679.14645305305 6688306.771958822, 355679.12969417416 6688306.750483555, 355679.11112741433 6688306.730550571, 355679.090894068 6688306.712311557, 355679.06914811226 6688306.695905314, 355679.0460550358 6688306.681456695, 355679.0217905784 6688306.669075658, 355678.99653939455 6688306.65885642, 355678.9704936475 6688306.650876751, 355678.9438515477 6688306.645197379, 355678.9168158431 6688306.6418615235, 355678.88959227747 6688306.640894564), (355678.88959227747 6688306.640894564, 355678.86238817754 6688306.642306838, 355678.8354106747 6688306.646084625, 355678.8088650696 6688306.652199171, 355678.7829533766 6688306.660603948, 355678.7578727853 6688306.671234991, 355678.7338141614 6688306.684011402, 355678.7109605924 6688306.6988359485, 355678.689485996 6688306.715595815, 355678.66955379525 6688306.734163459, 355678.6513156761 6688306.7543975795, 355678.63491043146 6688306.776144189, 355678.6204629068 6688306.799237798, 355678.6080830486 6688306.82350266, 355678.597865069 6688306.848754121, 355678.58988672745 6688306.874800013, 355678.58420873963 6688306.901442125, 355678.58087431535 6688306.928477708, 355678.5799088301 6688306.955701023, 355678.5813196309 6688306.982904893, 355678.58509598195 6688307.0098823, 355678.5912091446 6688307.036427938, 355678.59961259726 6688307.062339798, 355678.61024238914 6688307.087420684, 355678.6230176266 6688307.111479732, 355678.63784108916 6688307.134333851, 355678.65459996916 6688307.1558091175, 355678.6731667302 6688307.175742101, 355678.69340007775 6688307.193981117, 355678.7151460347 6688307.21038736, 355678.7382391127 6688307.224835976, 355678.7625035714 6688307.237217012, 355678.7877547567 6688307.247436251, 355678.81380050495 6688307.255415918, 355678.84044260613 6688307.261095288, 355678.867478312 6688307.264431147, 355678.8947018784 6688307.265398097), (355678.8947018784 6688307.265398097, 355678.89725668245 6688307.5776498625), (355679.12835185544 6688307.185568981, 355679.2857551407 6688307.3404174615), (355679.20439884794 6688306.950591531, 355679.5166506143 6688306.948036727), (355678.88959227747 6688306.640894564, 355678.8742634526 6688304.76738397), (355678.2676435491 6688306.958255937, 355678.5798953154 6688306.955701133), (355678.6600241897 6688307.1893512495, 355678.50517570844 6688307.346754534), (355658.2419043864 6688305.288308418, 355658.26910848555 6688305.286896142, 355658.2960859875 6688305.283118356, 355658.3226315915 6688305.27700381, 355658.3485432835 6688305.268599033, 355658.37362387375 6688305.257967988, 355658.3976824964 6688305.245191575, 355658.4205360646 6688305.230367031, 355658.44201066013 6688305.213607164, 355658.4619428601 6688305.195039521, 355658.48018097866 6688305.174805405, 355658.4965862225 6688305.153058795, 355658.5110337468 6688305.129965187, 355658.5234136042 6688305.105700324, 355658.53363158356 6688305.080448865, 355658.54160992516 6688305.054402975, 355658.54728791286 6688305.027760862, 355658.55062233715 6688305.000725278, 355658.5515878229 6688304.973501966, 355658.5501770225 6688304.946298096, 355658.5464006722 6688304.919320691, 355658.5402875102 6688304.892775053, 355658.5318840585 6688304.866863197, 355658.5212542676 6688304.841782309, 355658.5084790315 6688304.817723263, 355658.49365557014 6688304.794869144, 355658.47689669154 6688304.77339388, 355658.4583299318 6688304.753460894, 355658.4380965856 6688304.7352218805, 355658.4163506301 6688304.718815637, 355658.39325755375 6688304.70436702, 355658.36899309634 6688304.691985981, 355658.3437419124 6688304.681766743, 355658.31769616547 6688304.673787074, 355658.29105406546 6688304.6681077, 355658.26401836076 6688304.664771843, 355658.23679479485 6688304.663804885), (355658.23679479485 6688304.663804885, 355658.2095906946 6688304.665217159, 355658.18261319137 6688304.668994944, 355658.1560675864 6688304.675109493, 355658.130155893 6688304.683514268, 355658.1050753014 6688304.694145312, 355658.08101667685 6688304.706921722, 355658.0581631076 6688304.721746267, 355658.03668851074 6688304.738506133, 355658.01675630955 6688304.757073776, 355657.9985181896 6688304.777307894, 355657.98211294465 6688304.7990545025, 355657.96766541933 6688304.82214811, 355657.9552855611 6688304.846412977, 355657.94506758096 6688304.8716644365, 355657.9370892389 6688304.897710329, 355657.93141125055 6688304.924352441, 355657.9280768258 6688304.951388023, 355657.9271113402 6688304.978611338, 355657.9285221407 6688305.005815208, 355657.9322984912 6688305.032792613, 355657.93841165345 6688305.059338253, 355657.9468151059 6688305.08525011, 355657.95744489745 6688305.110330999, 355657.97022013454 6688305.134390047, 355657.98504359694 6688305.1572441645, 355658.00180247665 6688305.178719429, 355658.02036923746 6688305.198652417, 355658.04060258507 6688305.216891432, 355658.0623485418 6688305.233297674, 355658.0854416197 6688305.247746291, 355658.1097060784 6688305.260127329, 355658.13495726377 6688305.270346567, 355658.16100301215 6688305.278326234, 355658.18764511356 6688305.284005607, 355658.21468081954 6688305.287341463, 355658.2419043864 6688305.288308418), (355658.2419043864 6688305.288308418, 355658.2444591818 6688305.600560182), (355658.47555436444 6688305.208479305, 355658.6329576449 6688305.363327788), (355658.5516013557 6688304.973501856, 355658.86385312065 6688304.970947059), (355658.23679479485 6688304.663804885, 355658.2214659827 6688302.790394218), (355657.6148460604 6688304.981166236, 355657.92709782557 6688304.978611443), (355658.0072266547 6688305.212361476, 355657.85237816983 6688305.369764756), (355640.94996244414 6688303.660480214, 355640.9771675635 6688303.659069336, 355641.00414619205 6688303.655292769, 355641.0306930061 6688303.649179258, 355641.05660596833 6688303.640775331, 355641.08168786555 6688303.6301449435, 355641.10574780917 6688303.617369004, 355641.12860268884 6688303.60254474, 355641.15007856494 6688303.585784975, 355641.17001199274 6688303.567217262, 355641.18825126777 6688303.546982915, 355641.20465757704 6688303.525235924, 355641.21910605923 6688303.502141799, 355641.23148675245 6688303.477876299, 355641.24170543224 6688303.452624102, 355641.2496843284 6688303.426577393, 355641.2553627164 6688303.399934397, 355641.25869738084 6688303.372897893, 355641.25966294203 6688303.345673636), (355641.25966294203 6688303.345673636, 355641.2596629421 6688303.345673635, 355641.2582520524 6688303.318468824, 355641.25447544904 6688303.291490499, 355641.24836187443 6688303.264943986, 355641.2399578564 6688303.239031317, 355641.2293273549 6688303.213949705, 355641.2165512744 6688303.1898900345, 355641.2017268483 6688303.167035415, 355641.18496689945 6688303.145559784, 355641.1663989816 6688303.1256265845, 355641.14616440743 6688303.1073875185, 355641.1244171745 6688303.090981397, 355641.101322792 6688303.076533081, 355641.0770570226 6688303.064152532, 355641.0518045434 6688303.053933973, 355641.02575754066 6688303.045955172, 355640.9991142483 6688303.040276852, 355640.97207743744 6688303.036942231, 355640.9448528745 6688303.035976685), (355640.9448528745 6688303.035976685, 355640.9176477553 6688303.037387568, 355640.8906691268 6688303.04116413, 355640.8641223128 6688303.0472776415, 355640.8382093506 6688303.055681568, 355640.8131274534 6688303.066311955, 355640.78906750993 6688303.079087898, 355640.76621263026 6688303.093912161, 355640.74473675416 6688303.1106719235, 355640.72480332636 6688303.1292396365, 355640.70656405156 6688303.149473987, 355640.69015774224 6688303.171220975, 355640.6757092601 6688303.1943151, 355640.66332856694 6688303.2185806, 355640.65310988727 6688303.243832799, 355640.64513099106 6688303.269879508, 355640.63945260283 6688303.2965225, 355640.6361179385 6688303.323559006, 355640.63515237725 6688303.350783262, 355640.63515237736 6688303.350783265), (355640.63515237736 6688303.350783265, 355640.63656326703 6688303.377988076, 355640.6403398702 6688303.404966399, 355640.6464534449 6688303.4315129155, 355640.6548574627 6688303.457425583, 355640.66548796435 6688303.482507196, 355640.6782640449 6688303.506566865, 355640.693088471 6688303.529421486, 355640.70984841953 6688303.550897117, 355640.7284163372 6688303.570830313, 355640.74865091173 6688303.589069383, 355640.77039814455 6688303.605475502, 355640.79349252675 6688303.619923816, 355640.8177582962 6688303.632304366, 355640.84301077534 6688303.6425229255, 355640.86905777786 6688303.650501727, 355640.8957010705 6688303.656180048, 355640.9227378812 6688303.659514668, 355640.94996244414 6688303.660480214), (355640.94996244414 6688303.660480214, 355640.95251723257 6688303.972731977), (355641.18361246906 6688303.580551188, 355641.3410157454 6688303.7353996765), (355641.2596594271 6688303.3456736645, 355641.25966294203 6688303.345673636), (355641.25966294203 6688303.345673636, 355641.5719111911 6688303.343118875), (355640.9448528745 6688303.035976685, 355640.92952415097 6688301.162466106), (355640.32290413504 6688303.353338026, 355640.63515237736 6688303.350783265), (355640.63515237736 6688303.350783265, 355640.63515589887 6688303.350783236), (355640.715184839 6688303.584433308, 355640.56033635116 6688303.741836581), (355770.8817654819 6688315.695531956, 355770.90897059935 6688315.694121077, 355770.93594922515 6688315.690344501, 355770.96249603643 6688315.684230989, 355770.98840899527 6688315.675827053, 355771.0134908889 6688315.665196664, 355771.0375508285 6688315.652420716, 355771.06040570396 6688315.63759645, 355771.0818815754 6688315.620836681, 355771.1018149988 6688315.602268964, 355771.1200542681 6688315.582034609, 355771.1364605726 6688315.560287618, 355771.1509090495 6688315.537193489, 355771.1632897375 6688315.512927988, 355771.17350841203 6688315.487675789, 355771.1814873027 6688315.461629077, 355771.1871656857 6688315.434986083, 355771.1905003445 6688315.407949572, 355771.191465901 6688315.380725317, 355771.1914659008 6688315.380725313), (355771.1914659008 6688315.380725313, 355771.1900550061 6688315.3535205005, 355771.1862783984 6688315.32654218, 355771.18016481906 6688315.2999956645, 355771.1717607969 6688315.274082997, 355771.16113029147 6688315.249001386, 355771.1483542073 6688315.224941717, 355771.133529778 6688315.202087101, 355771.1167698264 6688315.180611472, 355771.0982019061 6688315.160678273, 355771.07796733 6688315.142439211, 355771.0562200954 6688315.126033095, 355771.0331257121 6688315.111584783, 355771.00885994226 6688315.099204239, 355770.98360746267 6688315.088985683, 355770.95756046014 6688315.0810068855, 355770.93091716856 6688315.075328573, 355770.90388035873 6688315.071993954, 355770.87665579765 6688315.071028414), (355770.87665579765 6688315.071028414, 355770.8494506804 6688315.072439299, 355770.8224720544 6688315.076215869, 355770.79592524306 6688315.082329385, 355770.77001228416 6688315.090733318, 355770.74493039073 6688315.10136371, 355770.7208704508 6688315.114139656, 355770.69801557553 6688315.128963923, 355770.67653970374 6688315.145723689, 355770.6566062806 6688315.164291408, 355770.6383670108 6688315.184525762, 355770.62196070637 6688315.206272752, 355770.60751222936 6688315.229366884, 355770.5951315413 6688315.2536323825, 355770.5849128668 6688315.278884584, 355770.57693397615 6688315.304931297, 355770.57125559304 6688315.331574289, 355770.5679209343 6688315.3586108005, 355770.56695537764 6688315.385835053, 355770.5669553779 6688315.385835058), (355770.5669553779 6688315.385835058, 355770.5683662725 6688315.413039871, 355770.5721428805 6688315.440018195, 355770.5782564597 6688315.466564706, 355770.5866604817 6688315.492477375, 355770.5972909872 6688315.517558985, 355770.6100670713 6688315.5416186545, 355770.62489150086 6688315.564473272, 355770.6416514524 6688315.585948901, 355770.6602193728 6688315.605882096, 355770.6804539489 6688315.62412116, 355770.7022011837 6688315.640527277, 355770.72529556707 6688315.6549755875, 355770.749561337 6688315.667356132, 355770.7748138168 6688315.67757469, 355770.8008608191 6688315.685553486, 355770.82750411093 6688315.691231802, 355770.85454092076 6688315.6945664175, 355770.8817654819 6688315.695531956), (355770.8817654819 6688315.695531956, 355770.88432032405 6688316.007783729), (355771.1154154534 6688315.615702811, 355771.2729186823 6688315.770551322), (355771.19146241137 6688315.380725342, 355771.1914659008 6688315.380725313), (355771.1914659008 6688315.380725313, 355771.5037141831 6688315.378170505), (355770.87665579765 6688315.071028414, 355770.8613267521 6688313.197517786), (355770.2547070965 6688315.388389867, 355770.5669553779 6688315.385835058), (355770.5669553779 6688315.385835058, 355770.56695886824 6688315.385835029), (355770.64708777954 6688315.619485132, 355770.4922393147 6688315.776888439), (355788.1277065687 6688317.406969369, 355788.15491312783 6688317.405560456, 355788.1818933461 6688317.401785608, 355788.20844186755 6688317.395673559, 355788.23435662163 6688317.387270824, 355788.25944036245 6688317.376641361, 355788.283502169 6688317.36386608, 355788.30635889777 6688317.349042209, 355788.32783657865 6688317.332282584, 355788.3477717373 6688317.313714769, 355788.36601264036 6688317.293480086, 355788.3824204497 6688317.271732552, 355788.39687028 6688317.24863769, 355788.4092521484 6688317.22437129, 355788.4194718118 6688317.199118048, 355788.4274514849 6688317.173070174, 355788.4331304323 6688317.146425932, 355788.4364654285 6688317.1193881165, 355788.4374310907 6688317.092162526, 355788.4374310904 6688317.092162522), (355788.4374310904 6688317.092162522, 355788.43602006807 6688317.06495638, 355788.4322431005 6688317.037976753, 355788.42612893623 6688317.0114290025, 355788.417724112 6688316.985515188, 355788.40709259995 6688316.960432548, 355788.3943153204 6688316.936372, 355788.3794895255 6688316.913516672, 355788.36272805976 6688316.892040527, 355788.34415850043 6688316.872107028, 355788.3239221874 6688316.853867898, 355788.30217314564 6688316.837461954, 355788.279076915 6688316.823014071, 355788.25480928924 6688316.810634217, 355788.2295549777 6688316.800416623, 355788.20350619993 6688316.792439057, 355788.176861222 6688316.786762235, 355788.14982284827 6688316.783429368, 355788.1225968776 6688316.782465823), (355788.1225968776 6688316.782465823, 355788.09539320256 6688316.78387868, 355788.0684161691 6688316.787656974, 355788.04187106836 6688316.793771955, 355788.01595990494 6688316.802177086, 355787.99087985884 6688316.812808407, 355787.9668217862 6688316.825585018, 355787.9439687647 6688316.840409684, 355787.9224947031 6688316.857169596, 355787.90256301535 6688316.8757372135, 355787.88432537933 6688316.895971237, 355787.8679205808 6688316.917717692, 355787.8534734576 6688316.94081109, 355787.8410939503 6688316.965075689, 355787.8308762654 6688316.990326848, 355787.82289815764 6688317.016372399, 355787.8172203397 6688317.043014146, 355787.81388601864 6688317.070049348, 355787.81292056845 6688317.097272273, 355787.81433133583 6688317.124475751, 355787.8181075849 6688317.151452774, 355787.82422057935 6688317.177998049, 355787.83262380003 6688317.203909569, 355787.84325329977 6688317.228990158, 355787.8560281892 6688317.253048943, 355787.87085125345 6688317.275902852, 355787.8876096912 6688317.297377966, 355787.9061759729 6688317.3173108585, 355787.92640881246 6688317.33554985, 355787.9481542402 6688317.351956142, 355787.9712467767 6688317.366404881, 355787.99551069137 6688317.37878612, 355788.02076133894 6688317.389005635, 355788.0468065657 6688317.396985659, 355788.07344817155 6688317.402665467, 355788.1004834171 6688317.406001832, 355788.1277065687 6688317.406969369), (355788.1277065687 6688317.406969369, 355788.1302614178 6688317.719221142), (355788.36135653907 6688317.327140212, 355788.51875985035 6688317.481988681), (355788.43740349216 6688317.092162747, 355788.4374310904 6688317.092162522), (355788.4374310904 6688317.092162522, 355788.74965526495 6688317.089607897), (355788.1225968776 6688316.782465823, 355788.1072677819 6688314.908955189), (355787.50064817397 6688317.0998272905, 355787.8128999466 6688317.097272444), (355787.89302886376 6688317.330922549, 355787.7381804019 6688317.48832586), (355812.49293407553 6688319.614772657, 355812.52013912535 6688319.613361676, 355812.54711767676 6688319.6095850235, 355812.5736644076 6688319.603471439, 355812.59957728215 6688319.595067448, 355812.6246590889 6688319.584437013, 355812.6487189409 6688319.571661036, 355812.67157372914 6688319.5568367485, 355812.693049515 6688319.54007697, 355812.7129828562 6688319.521509257, 355812.7312220487 6688319.501274918, 355812.74762828165 6688319.479527947, 355812.7620766941 6688319.456433853, 355812.7744573257 6688319.432168392, 355812.7846759526 6688319.406916241, 355812.79265480535 6688319.380869581, 355812.7983331605 6688319.354226642, 355812.8016678022 6688319.327190196, 355812.80263335194 6688319.299966005), (355812.80263335194 6688319.299966005, 355812.8026333521 6688319.299966, 355812.80122246203 6688319.272761249, 355812.7974458693 6688319.245782988, 355812.7913323157 6688319.219236529, 355812.7829283298 6688319.193323917, 355812.77229786996 6688319.168242354, 355812.75952183997 6688319.144182726, 355812.74469747295 6688319.121328141, 355812.72793759126 6688319.09985254, 355812.709369746 6688319.079919355, 355812.6891352499 6688319.061680297, 355812.6673880989 6688319.045274175, 355812.6442938007 6688319.030825843, 355812.6200281169 6688319.018445269, 355812.59477572213 6688319.0082266675, 355812.56872880243 6688319.000247817, 355812.54208558897 6688318.994569433, 355812.51504885225 6688318.9912347365, 355812.48782435694 6688318.990269109), (355812.48782435694 6688318.990269109, 355812.460619173 6688318.991679898, 355812.4336404738 6688318.995456394, 355812.40709358396 6688319.001569841, 355812.3811805423 6688319.00997372, 355812.356098564 6688319.02060407, 355812.33203853853 6688319.033379987, 355812.30918357824 6688319.048204236, 355812.2877076239 6688319.064963999, 355812.26777412114 6688319.083531722, 355812.249534777 6688319.103766091, 355812.2331284041 6688319.125513113, 355812.2186798657 6688319.148607274, 355812.2062991246 6688319.172872819, 355812.19608040544 6688319.198125067, 355812.1881014801 6688319.224171835, 355812.18242307246 6688319.25081489, 355812.1790883992 6688319.277851456, 355812.1781228395 6688319.305075778, 355812.17812283966 6688319.3050757805), (355812.17812283966 6688319.3050757805, 355812.17953374167 6688319.3322806535, 355812.18331036775 6688319.359259037, 355812.1894239755 6688319.385805607, 355812.1978280361 6688319.4117183285, 355812.2084585894 6688319.436799986, 355812.2212347302 6688319.4608596945, 355812.2360592241 6688319.483714346, 355812.2528192468 6688319.505189997, 355812.27138724417 6688319.525123206, 355812.2916219018 6688319.543362271, 355812.31336922094 6688319.55976838, 355812.33646369056 6688319.57421667, 355812.3607295471 6688319.586597183, 355812.3859821119 6688319.596815691, 355812.41202919674 6688319.604794429, 355812.43867256714 6688319.6104726745, 355812.46570944914 6688319.613807208, 355812.49293407553 6688319.614772657), (355812.49293407553 6688319.614772657, 355812.49548893486 6688319.927024431), (355812.72658404463 6688319.534943497, 355812.8839873615 6688319.689791953), (355812.8026309903 6688319.299966024, 355812.80263335194 6688319.299966005), (355812.80263335194 6688319.299966005, 355813.11488276464 6688319.297411168), (355812.48782435694 6688318.990269109, 355812.4724952084 6688317.116758465), (355811.865875668 6688319.3076306, 355812.17812283966 6688319.3050757805), (355812.17812283966 6688319.3050757805, 355812.17812744225 6688319.305075743), (355812.2581564452 6688319.538725801, 355812.1033079878 6688319.69612912), (355829.9128791595 6688321.23296335, 355829.94008529576 6688321.231553859, 355829.96706504683 6688321.227778505, 355829.9936130663 6688321.221666025, 355830.01952729345 6688321.213262935, 355830.044610492 6688321.202633202, 355830.06867175014 6688321.189857721, 355830.0915279347 6688321.175033735, 355830.1130050838 6688321.158274066, 355830.13293973246 6688321.139706276, 355830.1511801552 6688321.119471688, 355830.16758752184 6688321.09772431, 355830.182036954 6688321.074629666, 355830.19441847404 6688321.050363525, 355830.20463784604 6688321.025110587, 355830.2126172881 6688320.999063053, 355830.218296068 6688320.972419174, 355830.22163096373 6688320.945381743, 355830.2225965926 6688320.918156543), (355830.2225965926 6688320.918156543, 355830.2225965927 6688320.918156541, 355830.22118560557 6688320.890950784, 355830.21740874177 6688320.863971542, 355830.2112947471 6688320.8374241525, 355830.20289015624 6688320.8115106765, 355830.1922589374 6688320.786428338, 355830.1794820064 6688320.762368045, 355830.1646566103 6688320.739512928, 355830.1478955871 6688320.718036936, 355830.1293265066 6688320.698103526, 355830.1090907015 6688320.679864416, 355830.0873421886 6688320.663458425, 355830.0642464984 6688320.649010416, 355830.03997941583 6688320.636630363, 355830.01472564065 6688320.626412487, 355829.9886773829 6688320.618434561, 355829.9620328989 6688320.612757305, 355829.93499498384 6688320.609423928, 355829.90776942647 6688320.608459799), (355829.90776942647 6688320.608459799, 355829.8805653298 6688320.60987208, 355829.8535878307 6688320.613649872, 355829.82704223006 6688320.619764428, 355829.8011305418 6688320.628169209, 355829.77604995604 6688320.6388002625, 355829.7519913378 6688320.651576678, 355829.7291377751 6688320.66640123, 355829.70766318485 6688320.683161101, 355829.68773099076 6688320.701728748, 355829.66949287814 6688320.72196287, 355829.65308764036 6688320.743709486, 355829.63864012255 6688320.766803095, 355829.62626027165 6688320.7910679635, 355829.61604229885 6688320.8163194265, 355829.6080639637 6688320.842365321, 355829.6023859823 6688320.869007433, 355829.59905156435 6688320.8960430175, 355829.59808608476 6688320.923266331, 355829.5994968914 6688320.950470204, 355829.60327324766 6688320.977447606, 355829.6093864149 6688321.003993241, 355829.617789872 6688321.029905102, 355829.6284196675 6688321.054985982, 355829.6411949084 6688321.079045033, 355829.6560183738 6688321.101899144, 355829.67277725606 6688321.123374409, 355829.6913440189 6688321.143307391, 355829.7115773675 6688321.161546401, 355829.73332332534 6688321.177952639, 355829.75641640334 6688321.192401251, 355829.78068086156 6688321.204782286, 355829.805932046 6688321.21500152, 355829.8319777927 6688321.222981181, 355829.8586198923 6688321.22866055, 355829.88565559563 6688321.231996401, 355829.9128791595 6688321.23296335), (355829.9128791595 6688321.23296335, 355829.9154340185 6688321.545215125), (355830.1465291659 6688321.153034264, 355830.30393248686 6688321.307882718), (355830.2225760683 6688320.91815671, 355830.2225965926 6688320.918156543), (355830.2225965926 6688320.918156543, 355830.5348278434 6688320.915601843), (355829.90776942647 6688320.608459799, 355829.8924402349 6688318.734949153), (355829.2858207428 6688320.925821305, 355829.59807251795 6688320.92326644), (355829.6782014411 6688321.156916545, 355829.52335298643 6688321.314319862), (355752.9558790761 6688302.614363762, 355752.98308419355 6688302.612952881, 355753.0100628197 6688302.609176309, 355753.03660963115 6688302.603062795, 355753.0625225904 6688302.594658861, 355753.08760448423 6688302.584028472, 355753.1116644244 6688302.571252527, 355753.1345193002 6688302.556428259, 355753.1559951721 6688302.539668491, 355753.1759285959 6688302.521100778, 355753.19416786614 6688302.500866425, 355753.21057417087 6688302.479119429, 355753.2250226484 6688302.456025302, 355753.2374033369 6688302.431759802, 355753.24762201216 6688302.406507604, 355753.25560090336 6688302.38046089, 355753.26127928693 6688302.353817899, 355753.26461394655 6688302.326781389, 355753.2655795036 6688302.299557134, 355753.26557950355 6688302.299557132), (355753.26557950355 6688302.299557132, 355753.2641686096 6688302.272352319, 355753.26039200195 6688302.245373995, 355753.2542784237 6688302.218827485, 355753.245874402 6688302.192914817, 355753.23524389707 6688302.167833205, 355753.22246781335 6688302.143773537, 355753.2076433844 6688302.120918919, 355753.1908834334 6688302.099443291, 355753.17231551325 6688302.079510092, 355753.1520809376 6688302.061271032, 355753.13033370336 6688302.044864913, 355753.10723932035 6688302.030416605, 355753.0829735506 6688302.018036058, 355753.0577210712 6688302.0078175, 355753.0316740688 6688301.999838704, 355753.005030777 6688301.99416039, 355752.9779939674 6688301.990825771, 355752.95076940616 6688301.989860231), (355752.95076940616 6688301.989860231, 355752.9235642887 6688301.991271115, 355752.8965856626 6688301.995047685, 355752.87003885105 6688302.001161198, 355752.8441258918 6688302.00956513, 355752.8190439981 6688302.020195521, 355752.79498405795 6688302.032971468, 355752.7721291821 6688302.047795733, 355752.7506533102 6688302.064555502, 355752.7307198866 6688302.083123218, 355752.7124806162 6688302.103357569, 355752.6960743115 6688302.125104563, 355752.6816258339 6688302.148198689, 355752.6692451454 6688302.17246419, 355752.65902647015 6688302.19771639, 355752.6510475788 6688302.223763101, 355752.64536919526 6688302.250406095, 355752.6420345356 6688302.277442603, 355752.6410689786 6688302.30466686), (355752.6410689786 6688302.30466686, 355752.64247987256 6688302.3318716725, 355752.6462564801 6688302.358849996, 355752.6523700584 6688302.3853965085, 355752.6607740802 6688302.411309177, 355752.671404585 6688302.436390787, 355752.6841806688 6688302.4604504565, 355752.6990050976 6688302.483305073, 355752.7157650487 6688302.504780703, 355752.7343329688 6688302.524713899, 355752.7545675445 6688302.542952961, 355752.7763147787 6688302.559359079, 355752.7994091618 6688302.57380739, 355752.82367493154 6688302.586187935, 355752.84892741084 6688302.5964064915, 355752.87497441325 6688302.6043852875, 355752.9016177052 6688302.610063605, 355752.9286545147 6688302.613398221, 355752.9558790761 6688302.614363762), (355752.9558790761 6688302.614363762, 355752.9584339111 6688302.92661553), (355753.18952904496 6688302.534534618, 355753.3469323455 6688302.689383088), (355753.26557600696 6688302.299557161, 355753.26557950355 6688302.299557132), (355753.26557950355 6688302.299557132, 355753.57782777277 6688302.297002324), (355752.95076940616 6688301.989860231, 355752.9354404035 6688300.1163496375), (355752.3288207094 6688302.307221663, 355752.6410689786 6688302.30466686), (355752.6410689786 6688302.30466686, 355752.64107247523 6688302.304666831), (355752.72120137996 6688302.538316935, 355752.5663529067 6688302.695720233), (355772.3402105639 6688304.983056678, 355772.36741423886 6688304.981643822, 355772.3943912725 6688304.97786553, 355772.42093637295 6688304.971750548, 355772.4468475364 6688304.963345416, 355772.47192758246 6688304.952714096, 355772.49598565523 6688304.939937486, 355772.51883867686 6688304.925112822, 355772.5403127385 6688304.908352911, 355772.5602444261 6688304.889785294, 355772.578482062 6688304.8695512675, 355772.5948868607 6688304.847804814, 355772.60933398403 6688304.824711419, 355772.62171349133 6688304.800446818, 355772.6319311765 6688304.775195662, 355772.6399092842 6688304.749150108, 355772.64558710257 6688304.722508361, 355772.6489214236 6688304.695473159, 355772.6498868743 6688304.668250239, 355772.6484761071 6688304.641046761, 355772.64469985804 6688304.614069735, 355772.6385868638 6688304.587524461, 355772.63018364337 6688304.561612939, 355772.6195541442 6688304.536532357, 355772.60677925486 6688304.512473567, 355772.5919561909 6688304.48961966, 355772.5751977535 6688304.468144547, 355772.5566314716 6688304.448211652, 355772.5363986327 6688304.4299726635, 355772.5146532053 6688304.413566372, 355772.4915606689 6688304.399117635, 355772.46729675453 6688304.386736395, 355772.4420461071 6688304.376516879, 355772.4160008805 6688304.368536854, 355772.38935927494 6688304.362857049, 355772.3623240293 6688304.359520683, 355772.335100878 6688304.358553143), (355772.335100878 6688304.358553143, 355772.3078972023 6688304.359966001, 355772.28092016815 6688304.363744294, 355772.25437506643 6688304.369859271, 355772.2284639022 6688304.378264402, 355772.2033838553 6688304.388895724, 355772.1793257815 6688304.401672333, 355772.1564727589 6688304.416496998, 355772.1349986961 6688304.433256908, 355772.1150670077 6688304.451824527, 355772.0968293709 6688304.472058552, 355772.0804245711 6688304.493805005, 355772.0659774472 6688304.516898403, 355772.0535979391 6688304.541163001, 355772.04338025354 6688304.56641416, 355772.0354021452 6688304.592459712, 355772.02972432674 6688304.619101461, 355772.02639000537 6688304.646136663, 355772.0254245548 6688304.673359585, 355772.0268353219 6688304.700563067, 355772.0306115712 6688304.727540088, 355772.03672456584 6688304.754085363, 355772.0451277866 6688304.779996885, 355772.05575728643 6688304.805077471, 355772.06853217626 6688304.829136259, 355772.0833552408 6688304.851990166, 355772.1001136794 6688304.87346528, 355772.1186799619 6688304.893398174, 355772.13891280175 6688304.911637165, 355772.16065823025 6688304.928043453, 355772.18375076755 6688304.942492196, 355772.2080146831 6688304.954873434, 355772.2332653314 6688304.96509295, 355772.2593105589 6688304.973072972, 355772.2859521655 6688304.978752777, 355772.3129874118 6688304.982089141, 355772.3402105639 6688304.983056678), (355772.3402105639 6688304.983056678, 355772.342765407 6688305.2953084465), (355772.5738605777 6688304.903127611, 355772.7312638829 6688305.057976072), (355772.6499074882 6688304.668250071, 355772.9621592554 6688304.665695229), (355772.335100878 6688304.358553143, 355772.3197718276 6688302.485042543), (355771.7131521864 6688304.675914596, 355772.0254039538 6688304.6733597545), (355772.1055328647 6688304.90700986, 355771.9506844025 6688305.064413166), (355792.5825699668 6688306.886813712, 355792.6097730429 6688306.885400036, 355792.63674941513 6688306.8816210255, 355792.6632938055 6688306.875505439, 355792.6892042234 6688306.8670998085, 355792.71428350196 6688306.856468099, 355792.73834079975 6688306.843691219, 355792.761193051 6688306.828866383, 355792.7826663613 6688306.812106413, 355792.8025973278 6688306.793538837, 355792.8208342851 6688306.773304946, 355792.8372384587 6688306.751558718, 355792.85168501927 6688306.728465623, 355792.86406403634 6688306.7042013975, 355792.8742813098 6688306.67895067, 355792.882259092 6688306.6529056, 355792.8879366751 6688306.626264371, 355792.8912708553 6688306.599229709, 355792.89223626134 6688306.572007344, 355792.89082554646 6688306.544804417, 355792.8870494455 6688306.517827933, 355792.88093669346 6688306.491283173, 355792.87253380526 6688306.465372128, 355792.8619047229 6688306.440291969, 355792.84913032915 6688306.416233546, 355792.8343078313 6688306.393379933, 355792.81755002163 6688306.371905036, 355792.7989844196 6688306.351972266, 355792.77875230106 6688306.333733307, 355792.7570076234 6688306.317326945, 355792.73391585326 6688306.302878026, 355792.7096527091 6688306.290496503, 355792.68440282164 6688306.280276588, 355792.65835833206 6688306.272296057, 355792.6317174264 6688306.266615631, 355792.6046828301 6688306.26327854, 355792.5774602643 6688306.262310177), (355792.5774602643 6688306.262310177, 355792.550253107 6688306.263718272, 355792.5232722284 6688306.267492402, 355792.49672299786 6688306.273603847, 355792.470807499 6688306.282006082, 355792.44572299224 6688306.292635159, 355792.4216604118 6688306.305410167, 355792.39880291425 6688306.320233871, 355792.37732448324 6688306.336993437, 355792.3573886048 6688306.3555612955, 355792.3391470245 6688306.375796112, 355792.32273859106 6688306.397543874, 355792.3082881996 6688306.420639037, 355792.2959058422 6688306.444905812, 355792.28568576864 6688306.470159487, 355792.277705771 6688306.49620784, 355792.27202658996 6688306.522852601, 355792.2686914541 6688306.549890955, 355792.26772574877 6688306.577117102), (355792.26772574877 6688306.577117102, 355792.26772574877 6688306.577117103, 355792.2691368248 6688306.6043238025, 355792.27291394176 6688306.631303968, 355792.27902834903 6688306.6578522315, 355792.28743350646 6688306.683766523, 355792.29806543613 6688306.708849587, 355792.310843212 6688306.7329105, 355792.3256695738 6688306.755766121, 355792.34243166784 6688306.777242478, 355792.3610019074 6688306.797176101, 355792.38123894145 6688306.815415263, 355792.40298873314 6688306.831821135, 355792.42608573014 6688306.846268838, 355792.4503541259 6688306.858648401, 355792.47560919734 6688306.868865596, 355792.501658712 6688306.876842656, 355792.52830438927 6688306.882518858, 355792.5553434115 6688306.885850998, 355792.5825699668 6688306.886813712), (355792.5825699668 6688306.886813712, 355792.58512481814 6688307.199065482), (355792.81621997204 6688306.80688464, 355792.9736232819 6688306.961733097), (355792.892266884 6688306.572007093, 355793.2045186524 6688306.569452241), (355792.5774602643 6688306.262310177, 355792.5621311637 6688304.3887995705), (355791.9555115787 6688306.579671644, 355792.26772574877 6688306.577117102), (355792.26772574877 6688306.577117102, 355792.267763347 6688306.577116795), (355792.3477923428 6688306.810766851, 355792.192943884 6688306.9681701595), (355811.4146118757 6688308.668521366, 355811.44181699224 6688308.667110481, 355811.46879561746 6688308.663333908, 355811.4953424279 6688308.657220392, 355811.5212553859 6688308.648816457, 355811.5463372785 6688308.6381860655, 355811.5703972171 6688308.625410117, 355811.5932520913 6688308.610585851, 355811.6147279616 6688308.59382608, 355811.63466138346 6688308.575258362, 355811.6529006521 6688308.55502401, 355811.66930695507 6688308.533277014, 355811.68375543057 6688308.510182885, 355811.6961361173 6688308.485917385, 355811.70635479054 6688308.460665186, 355811.71433368005 6688308.434618474, 355811.72001206136 6688308.407975476, 355811.7233467192 6688308.380938968, 355811.7243122745 6688308.353714711, 355811.72431227437 6688308.353714708), (355811.72431227437 6688308.353714708, 355811.7229013785 6688308.326509898, 355811.71912476956 6688308.299531575, 355811.71301118954 6688308.2729850635, 355811.70460716647 6688308.247072395, 355811.6939766602 6688308.221990785, 355811.6812005751 6688308.197931116, 355811.66637614527 6688308.175076501, 355811.64961619314 6688308.153600872, 355811.63104827236 6688308.133667677, 355811.61081369594 6688308.115428616, 355811.58906646114 6688308.099022498, 355811.56597207766 6688308.084574189, 355811.5417063077 6688308.072193645, 355811.51645382843 6688308.061975091, 355811.4904068262 6688308.053996295, 355811.46376353485 6688308.048317981, 355811.4367267256 6688308.044983365, 355811.409502165 6688308.044017826), (355811.409502165 6688308.044017826, 355811.3822970483 6688308.045428711, 355811.355318423 6688308.049205284, 355811.32877161284 6688308.0553188, 355811.3028586547 6688308.063722733, 355811.2777767623 6688308.074353128, 355811.25371682347 6688308.087129072, 355811.23086194927 6688308.101953341, 355811.2093860791 6688308.118713111, 355811.18945265684 6688308.137280827, 355811.17121338827 6688308.157515182, 355811.1548070855 6688308.179262178, 355811.1403586098 6688308.202356305, 355811.1279779232 6688308.226621808, 355811.1177592499 6688308.251874008, 355811.1097803603 6688308.277920717, 355811.10410197877 6688308.304563713, 355811.10076732084 6688308.331600221, 355811.0998017657 6688308.3588244775, 355811.0998017657 6688308.358824478), (355811.0998017657 6688308.358824478, 355811.1012126618 6688308.386029294, 355811.1049892706 6688308.413007614, 355811.11110285064 6688308.439554128, 355811.1195068737 6688308.4654667955, 355811.13013738027 6688308.490548408, 355811.14291346504 6688308.514608074, 355811.1577378949 6688308.53746269, 355811.1744978471 6688308.55893832, 355811.19306576776 6688308.578871514, 355811.2133003442 6688308.597110575, 355811.2350475789 6688308.613516692, 355811.25814196264 6688308.627965, 355811.2824077328 6688308.640345546, 355811.30766021204 6688308.6505641015, 355811.33370721416 6688308.658542896, 355811.3603505058 6688308.6642212095, 355811.3873873151 6688308.667555826, 355811.4146118757 6688308.668521366), (355811.4146118757 6688308.668521366, 355811.4171667348 6688308.980773135), (355811.6483617633 6688308.588692251, 355811.8057650777 6688308.743540704), (355811.7243087861 6688308.353714737, 355811.72431227437 6688308.353714708), (355811.72431227437 6688308.353714708, 355812.0365605558 6688308.351159879), (355811.409502165 6688308.044017826, 355811.3941729647 6688306.170607133), (355810.7875534775 6688308.3613793105, 355811.0998017657 6688308.358824478), (355811.0998017657 6688308.358824478, 355811.099805247 6688308.35882445), (355811.179934125 6688308.592574477, 355811.0250856696 6688308.749977786), (355802.496344259 6688304.066310059, 355802.5235511419 6688304.064901593, 355802.5505317171 6688304.06112713, 355802.57708062197 6688304.055015408, 355802.60299577896 6688304.046612943, 355802.6280799341 6688304.035983689, 355802.65214215894 6688304.023208554, 355802.67499930336 6688304.008384775, 355802.6964773901 6688303.991625182, 355802.71641293773 6688303.973057342, 355802.7346542069 6688303.952822586, 355802.7510623536 6688303.9310749285, 355802.7655124869 6688303.907979907, 355802.7778946193 6688303.883713301, 355802.7881145042 6688303.858459826, 355802.7960943525 6688303.832411693, 355802.8017734254 6688303.805767168, 355802.805108497 6688303.77872906, 355802.80607418163 6688303.751503167), (355802.80607418163 6688303.751503167, 355802.80466312944 6688303.724296722, 355802.80088608054 6688303.697316807, 355802.79477178404 6688303.670768776, 355802.78636677895 6688303.644854704, 355802.7757350404 6688303.619771834, 355802.76295749174 6688303.595711091, 355802.74813138956 6688303.572855605, 355802.7313695833 6688303.551379345, 355802.7127996556 6688303.531445781, 355802.69256295176 6688303.513206632, 355802.6708135039 6688303.49680073, 355802.64771685825 6688303.482352945, 355802.6234488157 6688303.469973249, 355802.59819409274 6688303.4597558705, 355802.5721449161 6688303.4517785795, 355802.5454995595 6688303.446102092, 355802.51846083504 6688303.4427696215, 355802.4912345482 6688303.441806526), (355802.4912345482 6688303.441806526, 355802.46403119795 6688303.443219828, 355802.4370545231 6688303.44699851, 355802.4105098075 6688303.4531138195, 355802.3845990487 6688303.461519224, 355802.3595194189 6688303.472150753, 355802.33546176634 6688303.484927511, 355802.31260916265 6688303.499752269, 355802.29113550857 6688303.516512212, 355802.27120421233 6688303.535079809, 355802.2529669446 6688303.5553137595, 355802.23656248546 6688303.577060091, 355802.22211566765 6688303.600153326, 355802.2097364268 6688303.624417727, 355802.1995189651 6688303.649668647, 355802.1915410344 6688303.67571394, 355802.1858633441 6688303.702355405, 355802.18252910016 6688303.729390313, 355802.1815636745 6688303.756612934, 355802.1829744141 6688303.783816116, 355802.1867505833 6688303.810792848, 355802.19286344707 6688303.837337844, 355802.20126648823 6688303.863249106, 355802.2118957622 6688303.88832946, 355802.22467038344 6688303.912388047, 355802.23949314124 6688303.935241798, 355802.256251239 6688303.956716792, 355802.27481715294 6688303.976649621, 355802.295049602 6688303.9948885925, 355802.3167946233 6688304.01129492, 355802.33988674486 6688304.025743757, 355802.36415024224 6688304.038125149, 355802.38940047775 6688304.048344879, 355802.41544530523 6688304.056325179, 355802.44208653155 6688304.06200532, 355802.4691214252 6688304.065342078, 355802.496344259 6688304.066310059), (355802.496344259 6688304.066310059, 355802.4988991073 6688304.378561831), (355802.7299942167 6688303.986480907, 355802.88739752845 6688304.141329363), (355802.8060411711 6688303.751503437, 355802.80607418163 6688303.751503167), (355802.80607418163 6688303.751503167, 355803.1182929386 6688303.748948587), (355802.4912345482 6688303.441806526, 355802.4759054227 6688301.568295925), (355801.8692858686 6688303.759168001, 355802.1815376362 6688303.756613149), (355802.26166654914 6688303.990263252, 355802.1068180929 6688304.147666557), (355762.73921472626 6688300.323777604, 355762.76641984296 6688300.32236672, 355762.79339846846 6688300.318590148, 355762.81994527904 6688300.312476635, 355762.84585823736 6688300.304072701, 355762.87094013044 6688300.293442309, 355762.8950000697 6688300.280666366, 355762.91785494465 6688300.265842098, 355762.9393308154 6688300.24908233, 355762.9592642383 6688300.230514612, 355762.9775035078 6688300.210280261, 355762.99390981166 6688300.188533265, 355763.00835828827 6688300.16543914, 355763.02073897625 6688300.141173639, 355763.0309576505 6688300.11592144, 355763.0389365414 6688300.089874731, 355763.0446149242 6688300.063231735, 355763.0479495832 6688300.036195227, 355763.04891514 6688300.008970972), (355763.04891514 6688300.008970972, 355763.0475042456 6688299.981766161, 355763.0437276379 6688299.954787837, 355763.03761405917 6688299.928241324, 355763.0292100375 6688299.902328656, 355763.0185795327 6688299.877247046, 355763.00580344914 6688299.8531873785, 355762.9909790207 6688299.830332762, 355762.9742190699 6688299.808857134, 355762.95565115014 6688299.788923935, 355762.93541657494 6688299.770684876, 355762.9136693411 6688299.754278759, 355762.8905749586 6688299.739830447, 355762.86630918947 6688299.727449902, 355762.8410567104 6688299.717231344, 355762.8150097089 6688299.709252548, 355762.78836641787 6688299.703574233, 355762.76132960874 6688299.700239616, 355762.73410504824 6688299.699274074), (355762.73410504824 6688299.699274074, 355762.70689993154 6688299.700684959, 355762.6799213059 6688299.70446153, 355762.65337449533 6688299.710575046, 355762.627461537 6688299.718978979, 355762.60237964406 6688299.729609368, 355762.5783197048 6688299.742385314, 355762.5554648298 6688299.757209581, 355762.53398895886 6688299.77396935, 355762.51405553595 6688299.792537065, 355762.4958162665 6688299.812771416, 355762.4794099627 6688299.834518413, 355762.464961486 6688299.85761254, 355762.4525807981 6688299.881878039, 355762.4423621236 6688299.907130239, 355762.4343832328 6688299.93317695, 355762.4287048499 6688299.959819944, 355762.4253701908 6688299.98685645, 355762.424404634 6688300.014080705, 355762.42440463405 6688300.014080707), (355762.42440463405 6688300.014080707, 355762.42581552843 6688300.0412855195, 355762.429592136 6688300.068263841, 355762.43570571474 6688300.094810354, 355762.4441097363 6688300.12072302, 355762.4547402412 6688300.145804632, 355762.4675163248 6688300.1698643, 355762.48234075354 6688300.192718917, 355762.4991007041 6688300.214194543, 355762.51766862406 6688300.234127745, 355762.5379031991 6688300.252366804, 355762.559650433 6688300.2687729215, 355762.58274481545 6688300.28322123, 355762.60701058496 6688300.295601777, 355762.6322630637 6688300.305820334, 355762.6583100657 6688300.313799133, 355762.68495335657 6688300.319477445, 355762.71199016564 6688300.322812063, 355762.73921472626 6688300.323777604), (355762.73921472626 6688300.323777604, 355762.7417695654 6688300.636029369), (355762.972964608 6688300.243948507, 355763.1303679105 6688300.398796973), (355763.0489116524 6688300.008971001, 355763.04891514 6688300.008970972), (355763.04891514 6688300.008970972, 355763.3611634176 6688300.006416166), (355762.73410504824 6688299.699274074, 355762.71877597534 6688297.825863409), (355762.11215635703 6688300.016635517, 355762.42440463405 6688300.014080707), (355762.42440463405 6688300.014080707, 355762.4244081221 6688300.014080678), (355762.50453697646 6688300.247830701, 355762.3496885133 6688300.405234004), (355647.73684549547 6688269.846201548, 355647.76404857356 6688269.844787882, 355647.79102494806 6688269.841008875, 355647.8175693411 6688269.834893293, 355647.8434797624 6688269.82648767, 355647.8685590446 6688269.815855966, 355647.8926163464 6688269.803079089, 355647.9154686022 6688269.788254261, 355647.936941917 6688269.771494292, 355647.9568728888 6688269.752926723, 355647.97510985116 6688269.732692839, 355647.99151402985 6688269.710946613, 355648.00596059643 6688269.687853524, 355648.01833961863 6688269.663589301, 355648.02855689806 6688269.638338579, 355648.0365346855 6688269.612293509, 355648.0422122743 6688269.5856522815, 355648.04554645985 6688269.5586176235, 355648.046511871 6688269.531395258, 355648.0451011614 6688269.504192333, 355648.04132506537 6688269.477215849, 355648.03521231766 6688269.450671088, 355648.0268094338 6688269.424760044, 355648.01618035533 6688269.399679883, 355648.0034059653 6688269.375621459, 355647.9885834707 6688269.352767846, 355647.9718256639 6688269.331292946, 355647.95326006436 6688269.311360175, 355647.9330279478 6688269.293121209, 355647.91128327156 6688269.2767148465, 355647.8881915026 6688269.262265924, 355647.86392835906 6688269.249884397, 355647.838678472 6688269.239664476, 355647.8126339822 6688269.231683942, 355647.78599307616 6688269.226003514, 355647.75895847875 6688269.222666417, 355647.7317359115 6688269.2216980485), (355647.7317359115 6688269.2216980485, 355647.7045287534 6688269.2231061375, 355647.6775478741 6688269.226880268, 355647.6509986421 6688269.232991706, 355647.62508314144 6688269.24139394, 355647.5999986322 6688269.252023009, 355647.5759360492 6688269.264798013, 355647.55307854863 6688269.27962171, 355647.53160011413 6688269.29638127, 355647.5116642323 6688269.314949124, 355647.4934226482 6688269.33518394, 355647.4770142107 6688269.356931695, 355647.462563815 6688269.380026853, 355647.45018145285 6688269.404293625, 355647.4399613745 6688269.429547293, 355647.4319813718 6688269.455595643, 355647.42630218586 6688269.482240401, 355647.42296704464 6688269.509278757, 355647.4220013345 6688269.536504895), (355647.4220013345 6688269.536504895, 355647.4220013343 6688269.5365049, 355647.4234124052 6688269.563711597, 355647.4271895167 6688269.590691759, 355647.4333039192 6688269.617240024, 355647.4417090715 6688269.643154314, 355647.45234099653 6688269.668237375, 355647.465118768 6688269.692298292, 355647.4799451253 6688269.715153916, 355647.49670721556 6688269.736630274, 355647.51527745114 6688269.756563898, 355647.53551448183 6688269.774803063, 355647.5572642705 6688269.791208938, 355647.58036126464 6688269.805656643, 355647.60462965834 6688269.818036212, 355647.6298847281 6688269.828253413, 355647.65593424137 6688269.836230478, 355647.682579918 6688269.841906684, 355647.70961893984 6688269.845238829, 355647.73684549547 6688269.846201548), (355647.73684549547 6688269.846201548, 355647.73940027994 6688270.158453298), (355647.9704954559 6688269.766372447, 355648.1278987271 6688269.921220926), (355648.0465424537 6688269.531395007, 355648.35879420367 6688269.528840218), (355647.7317359115 6688269.2216980485, 355647.7164071667 6688267.348187551), (355647.10978720326 6688269.539059382, 355647.4220013345 6688269.536504895), (355647.4220013345 6688269.536504895, 355647.42203895334 6688269.536504588), (355647.50216781435 6688269.770154696, 355647.34731933515 6688269.927557963), (355660.67742492637 6688261.086631759, 355660.7046286012 6688261.085218906, 355660.73160563497 6688261.081440615, 355660.758150736 6688261.075325637, 355660.78406190034 6688261.066920511, 355660.8091419473 6688261.056289193, 355660.83320002153 6688261.043512588, 355660.85605304484 6688261.028687926, 355660.8775271087 6688261.011928019, 355660.8974587987 6688260.993360408, 355660.91569643735 6688260.973126388, 355660.93210123904 6688260.951379939, 355660.9465483655 6688260.928286547, 355660.95892787614 6688260.904021948, 355660.96914556494 6688260.878770796, 355660.97712367657 6688260.852725249, 355660.9828014987 6688260.826083503, 355660.9861358239 6688260.799048302, 355660.9871012789 6688260.771825385, 355660.98569051607 6688260.744621909, 355660.9819142713 6688260.717644887, 355660.9758012815 6688260.691099616, 355660.9673980654 6688260.665188095, 355660.95676857047 6688260.640107512, 355660.9439936855 6688260.6160487225, 355660.9291706255 6688260.593194815, 355660.9124121919 6688260.571719702, 355660.89384591393 6688260.551786805, 355660.8736130784 6688260.533547813, 355660.851867654 6688260.517141519, 355660.8287751206 6688260.502692778, 355660.80451120867 6688260.490311536, 355660.77926056343 6688260.480092019, 355660.7532153383 6688260.472111986, 355660.7265737342 6688260.4664321765, 355660.69953848957 6688260.463095807, 355660.67231533874 6688260.462128265), (355660.67231533874 6688260.462128265, 355660.645108778 6688260.463537171, 355660.6181285579 6688260.467312012, 355660.59158003435 6688260.473424057, 355660.5656652774 6688260.481826785, 355660.5405815335 6688260.4924562415, 355660.51651972387 6688260.505231523, 355660.4936629913 6688260.520055386, 355660.47218530637 6688260.536815005, 355660.4522501432 6688260.555382815, 355660.43400923593 6688260.575617494, 355660.417601422 6688260.5973650245, 355660.4031515872 6688260.620459883, 355660.3907697141 6688260.644726281, 355660.38055004564 6688260.669979519, 355660.37257036724 6688260.696027387, 355660.36689141544 6688260.722671627, 355660.36355641414 6688260.74970944, 355660.3625907477 6688260.776935032, 355660.36259074777 6688260.7769350335), (355660.36259074777 6688260.7769350335, 355660.3640017659 6688260.804141174, 355660.367778729 6688260.831120798, 355660.3738928893 6688260.857668551, 355660.3822977098 6688260.883582367, 355660.39292921836 6688260.908665004, 355660.40570649476 6688260.932725554, 355660.42053228663 6688260.955580881, 355660.43729374977 6688260.977057024, 355660.455863307 6688260.996990527, 355660.47609961854 6688261.015229663, 355660.49784865865 6688261.031635606, 355660.520944888 6688261.046083492, 355660.545212513 6688261.058463345, 355660.5704668241 6688261.068680945, 355660.5965156022 6688261.076658514, 355660.6231605803 6688261.082335341, 355660.6501989546 6688261.08566821, 355660.67742492637 6688261.086631759), (355660.67742492637 6688261.086631759, 355660.6799797697 6688261.398783587), (355660.91107493604 6688261.006702729, 355661.0684782083 6688261.161551209), (355660.9871218756 6688260.771825217, 355661.2993736224 6688260.769270421), (355660.67231533874 6688260.462128265, 355660.6569865533 6688258.588617788), (355660.0503666354 6688260.779489607, 355660.36259074777 6688260.7769350335), (355660.36259074777 6688260.7769350335, 355660.3626183819 6688260.776934807), (355660.44274725387 6688261.010584911, 355660.2878987791 6688261.167988184), (355639.692508832 6688256.242080018, 355639.71971395006 6688256.240669136, 355639.74669257726 6688256.236892571, 355639.77323939 6688256.23077906, 355639.7991523508 6688256.222375132, 355639.8242342468 6688256.211744748, 355639.8482941892 6688256.198968806, 355639.8711490674 6688256.1841445435, 355639.89262494224 6688256.16738478, 355639.9125583692 6688256.148817073, 355639.9307976426 6688256.128582721, 355639.94720395096 6688256.106835733, 355639.961652432 6688256.083741607, 355639.9740331244 6688256.059476109, 355639.98425180354 6688256.034223916, 355639.9922306986 6688256.008177204, 355639.99790908623 6688255.981534214, 355640.0012437499 6688255.95449771, 355640.0022093108 6688255.927273454), (355640.0022093108 6688255.927273454, 355640.00079842086 6688255.900068643, 355639.99702181725 6688255.873090321, 355639.99090824265 6688255.846543811, 355639.98250422475 6688255.820631143, 355639.97187372344 6688255.795549531, 355639.9590976429 6688255.771489863, 355639.94427321723 6688255.748635245, 355639.9275132693 6688255.727159617, 355639.90894535166 6688255.707226417, 355639.8887107783 6688255.688987353, 355639.86696354614 6688255.672581236, 355639.8438691648 6688255.658132919, 355639.81960339646 6688255.645752371, 355639.7943509182 6688255.635533813, 355639.7683039167 6688255.627555012, 355639.7416606252 6688255.621876692, 355639.71462381585 6688255.618542075, 355639.68739925424 6688255.61757653), (355639.68739925424 6688255.61757653, 355639.66019413614 6688255.618987408, 355639.63321550895 6688255.622763972, 355639.6066686962 6688255.628877483, 355639.5807557351 6688255.63728141, 355639.5556738395 6688255.647911796, 355639.53161389695 6688255.660687737, 355639.5087590186 6688255.675512, 355639.4872831441 6688255.692271763, 355639.46734971704 6688255.710839474, 355639.4491104437 6688255.731073824, 355639.4327041352 6688255.752820811, 355639.4182556541 6688255.775914937, 355639.40587496164 6688255.800180432, 355639.39565628243 6688255.825432627, 355639.3876773872 6688255.851479338, 355639.38199899986 6688255.87812233, 355639.3786643362 6688255.9051588345, 355639.3776987751 6688255.932383088, 355639.3776987752 6688255.93238309), (355639.3776987752 6688255.93238309, 355639.379109665 6688255.959587899, 355639.3828862686 6688255.986566222, 355639.38899984333 6688256.013112735, 355639.39740386105 6688256.0390254, 355639.4080343624 6688256.064107013, 355639.42081044294 6688256.088166681, 355639.4356348687 6688256.1110213, 355639.45239481685 6688256.132496927, 355639.47096273425 6688256.152430128, 355639.49119730765 6688256.170669191, 355639.5129445398 6688256.187075309, 355639.53603892116 6688256.201523623, 355639.5603046895 6688256.21390417, 355639.5855571679 6688256.22412273, 355639.6116041694 6688256.23210153, 355639.63824746065 6688256.23777985, 355639.6652842704 6688256.241114471, 355639.692508832 6688256.242080018), (355639.692508832 6688256.242080018, 355639.695063621 6688256.554331761), (355639.9261587963 6688256.162250915, 355640.08356206305 6688256.317099395), (355640.0022057873 6688255.927273483, 355640.0022093108 6688255.927273454), (355640.0022093108 6688255.927273454, 355640.3144575318 6688255.924718699), (355639.68739925424 6688255.61757653, 355639.6720705278 6688253.744066066), (355639.0654505545 6688255.934937847, 355639.3776987752 6688255.93238309), (355639.3776987752 6688255.93238309, 355639.3777022988 6688255.932383061), (355639.4578311635 6688256.16603316, 355639.3029826857 6688256.323436427))
-14717;14339;T14-ECLAIRAGE;43-50-14-C;ByBlock;T14_351;20220609;MULTILINESTRING ((355714.7032199655 6688308.750128276, 355714.71953856887 6688308.749279324, 355714.7357210833 6688308.747011357, 355714.7516443502 6688308.743341637, 355714.7671871837 6688308.738298094, 355714.78223129327 6688308.731919109, 355714.7966621845 6688308.724253233, 355714.81037002953 6688308.715358806, 355714.82325050334 6688308.705303525, 355714.8352055775 6688308.694163909, 355714.8461442672 6688308.6820247425, 355714.8559833221 6688308.668978411, 355714.8646478608 6688308.655124202, 355714.8720719412 6688308.640567557, 355714.8781990621 6688308.625419265, 355714.88298259146 6688308.609794606, 355714.886386124 6688308.593812496, 355714.8883837571 6688308.577594568, 355714.88896028744 6688308.561264255, 355714.88811132725 6688308.544945836, 355714.88584333746 6688308.5287635, 355714.8821735793 6688308.512840416, 355714.8771299812 6688308.497297756, 355714.87075092824 6688308.482253817, 355714.8630849691 6688308.467823087, 355714.8541904465 6688308.4541154, 355714.8441350525 6688308.441235072, 355714.83299531514 6688308.429280131, 355714.8208560144 6688308.41834157, 355714.8078095378 6688308.408502627, 355714.793955177 6688308.39983819, 355714.7793983717 6688308.392414194, 355714.7642499083 6688308.386287145, 355714.74862507556 6688308.381503672, 355714.732642788 6688308.378100181, 355714.71642468043 6688308.376102571, 355714.70009418245 6688308.37552605, 355714.6837755791 6688308.376375005, 355714.6675930647 6688308.378642972, 355714.6516697977 6688308.382312692, 355714.6361269644 6688308.387356234, 355714.62108285504 6688308.393735221, 355714.6066519637 6688308.401401097, 355714.5929441186 6688308.410295522, 355714.580063645 6688308.420350806, 355714.5681085708 6688308.431490421, 355714.5571698811 6688308.443629586, 355714.54733082646 6688308.456675918, 355714.5386662875 6688308.470530127, 355714.531242207 6688308.48508677, 355714.5251150865 6688308.500235064, 355714.52033155697 6688308.515859721, 355714.51692802453 6688308.531841833, 355714.51493039116 6688308.548059756, 355714.514353861 6688308.5643900735, 355714.51520282123 6688308.580708493, 355714.5174708109 6688308.596890826, 355714.5211405692 6688308.612813914, 355714.5261841672 6688308.628356572, 355714.53256321995 6688308.643400511, 355714.54022917897 6688308.6578312395, 355714.5491237021 6688308.671538929, 355714.55917909567 6688308.684419256, 355714.57031883334 6688308.696374196, 355714.58245813387 6688308.70731276, 355714.5955046106 6688308.717151704, 355714.60935897124 6688308.725816142, 355714.62391577655 6688308.733240135, 355714.63906424 6688308.739367185, 355714.6546890725 6688308.744150658, 355714.67067136016 6688308.747554148, 355714.68688946776 6688308.749551757, 355714.7032199655 6688308.750128276), (355714.7032199655 6688308.750128276, 355714.72157468734 6688310.99834099, 355714.72411321494 6688311.047313822, 355714.73091040703 6688311.095879051, 355714.74191453203 6688311.143667061, 355714.75704184227 6688311.190314161, 355714.7761772083 6688311.235465327, 355714.79917499766 6688311.278776935, 355714.8258601826 6688311.319919355, 355714.8560296715 6688311.358579468, 355714.88945385494 6688311.394463045, 355714.9258783526 6688311.427296982, 355714.96502595104 6688311.456831398, 355715.0065987114 6688311.482841519, 355715.05028023775 6688311.505129381, 355715.09573808603 6688311.523525372, 355715.14262629155 6688311.537889476, 355715.19058800524 6688311.54811238, 355715.23925820715 6688311.554116276, 355715.2882664853 6688311.5558554735, 355715.33723522146 6688311.553312034, 355715.3857959418 6688311.546510429, 355715.4335790718 6688311.53550242, 355715.4802209552 6688311.5203717835, 355715.52536662144 6688311.501233673, 355715.56867248646 6688311.478233742, 355715.6098089689 6688311.451547029, 355715.64846299717 6688311.421376641, 355715.68434039206 6688311.387952186, 355715.71716810693 6688311.351528043, 355715.74669630436 6688311.312381422, 355715.7727002585 6688311.27081025, 355715.7949820647 6688311.227130908, 355715.81337214564 6688311.181675817, 355715.82773054315 6688311.134790919, 355715.83794798126 6688311.086833032, 355715.8439467 6688311.038167144, 355715.8456810455 6688310.989163629), (355715.8456810455 6688310.989163629, 355715.8620041917 6688310.988318841, 355715.8781915946 6688310.986054628, 355715.8941200585 6688310.9823882235, 355715.9096683581 6688310.977347528, 355715.9247181616 6688310.970970904, 355715.9391549308 6688310.963306887, 355715.9528687927 6688310.954413795, 355715.9657553775 6688310.944359319, 355715.97771660966 6688310.933219976, 355715.9886614576 6688310.921080543, 355715.998506624 6688310.90803341, 355716.0071771812 6688310.894177871, 355716.0146071412 6688310.879619377, 355716.0207399576 6688310.864468726, 355716.0255289558 6688310.848841225, 355716.02893768856 6688310.832855805, 355716.03094021336 6688310.816634127, 355716.03152129013 6688310.800299654, 355716.03067649604 6688310.783976687, 355716.0284122611 6688310.767789467, 355716.0247458167 6688310.751861183, 355716.0197050674 6688310.736313059, 355716.0133283761 6688310.7212634245, 355716.0056642731 6688310.70682682, 355715.9967710871 6688310.693113115, 355715.9867165003 6688310.680226673, 355715.97557703475 6688310.6682655765, 355715.963437468 6688310.657320855, 355715.9503901894 6688310.647475801, 355715.9365344971 6688310.638805342, 355715.92197584093 6688310.631375469, 355715.90682502114 6688310.625242727, 355715.8911973445 6688310.620453782, 355715.87521174754 6688310.617045091, 355715.8589898896 6688310.615042591, 355715.8426552295 6688310.614461524), (355715.8426552295 6688310.614461524, 355715.8263320834 6688310.615306311, 355715.8101446805 6688310.617570526, 355715.79421621625 6688310.62123693, 355715.77866791666 6688310.626277625, 355715.7636181134 6688310.63265425, 355715.749181344 6688310.640318266, 355715.7354674818 6688310.649211356, 355715.72258089704 6688310.659265833, 355715.7106196649 6688310.670405176, 355715.699674817 6688310.682544608, 355715.6898296507 6688310.695591743, 355715.68115909304 6688310.7094472805, 355715.67372913315 6688310.7240057755, 355715.66759631684 6688310.739156427, 355715.6628073189 6688310.75478393, 355715.65939858573 6688310.7707693465, 355715.6573960608 6688310.7869910225, 355715.6568149843 6688310.803325501, 355715.65765977814 6688310.819648464, 355715.65992401313 6688310.835835684, 355715.6635904575 6688310.851763969, 355715.6686312068 6688310.867312093, 355715.67500789824 6688310.882361729, 355715.6826720012 6688310.896798334, 355715.6915651873 6688310.91051204, 355715.7016197738 6688310.923398478, 355715.71275923966 6688310.935359573, 355715.7248988068 6688310.946304298, 355715.73794608505 6688310.956149352, 355715.75180177763 6688310.964819809, 355715.7663604337 6688310.972249682, 355715.7815112537 6688310.978382427, 355715.7971389301 6688310.983171369, 355715.81312452734 6688310.986580061, 355715.8293463852 6688310.988582563, 355715.8456810455 6688310.989163629), (355715.8426552295 6688310.614461524, 355715.84104240336 6688310.427110427), (355715.7491295862 6688310.615218049, 355715.6536913513 6688310.4286233345), (355715.9364806382 6688310.613705141, 355716.0283934553 6688310.425597521), (355731.588097556 6688310.137660144, 355731.60442070203 6688310.136815355, 355731.6206081053 6688310.134551143, 355731.63653656933 6688310.130884739, 355731.652084869 6688310.12584404, 355731.6671346723 6688310.119467418, 355731.6815714416 6688310.1118033985, 355731.69528530404 6688310.10291031, 355731.7081718883 6688310.092855833, 355731.72013312083 6688310.08171649, 355731.7310779688 6688310.069577058, 355731.740923135 6688310.056529923, 355731.7495936925 6688310.042674386, 355731.75702365243 6688310.02811589, 355731.7631564688 6688310.012965239, 355731.76794546685 6688309.997337738, 355731.77135419974 6688309.981352319, 355731.77335672465 6688309.965130641, 355731.77393780125 6688309.948796166, 355731.77309300733 6688309.932473203, 355731.7708287723 6688309.916285982, 355731.76716232806 6688309.900357696, 355731.7621215787 6688309.884809572, 355731.75574488734 6688309.86975994, 355731.7480807842 6688309.855323333, 355731.739187598 6688309.841609626, 355731.7291330113 6688309.828723188, 355731.7179935455 6688309.816762091, 355731.70585397875 6688309.805817369, 355731.6928067002 6688309.795972316, 355731.6789510077 6688309.787301858, 355731.6643923514 6688309.779871983, 355731.6492415316 6688309.773739238, 355731.63361385505 6688309.7689502975, 355731.6176282577 6688309.765541606, 355731.6014064 6688309.7635391075, 355731.58507173974 6688309.762958042, 355731.56874859333 6688309.7638028255, 355731.55256119027 6688309.76606704, 355731.5366327264 6688309.769733446, 355731.5210844265 6688309.77477414, 355731.50603462296 6688309.781150763, 355731.49159785383 6688309.788814784, 355731.4778839914 6688309.7977078715, 355731.4649974067 6688309.807762347, 355731.4530361745 6688309.8189016925, 355731.4420913266 6688309.831041125, 355731.43224616005 6688309.844088258, 355731.42357560294 6688309.857943797, 355731.41614564275 6688309.872502292, 355731.4100128262 6688309.887652942, 355731.40522382833 6688309.9032804435, 355731.4018150954 6688309.919265862, 355731.39981257037 6688309.935487538, 355731.3992314937 6688309.951822014, 355731.4000762877 6688309.968144977, 355731.40234052273 6688309.984332201, 355731.40600696695 6688310.000260484, 355731.41104771645 6688310.015808607, 355731.4174244081 6688310.030858243, 355731.425088511 6688310.045294848, 355731.43398169725 6688310.059008556, 355731.444036284 6688310.071894995, 355731.45517574984 6688310.083856092, 355731.46731531643 6688310.094800811, 355731.4803625951 6688310.104645867, 355731.4942182878 6688310.1133163255, 355731.5087769439 6688310.120746197, 355731.52392776386 6688310.126878944, 355731.5395554405 6688310.131667884, 355731.5555410379 6688310.135076577, 355731.57176289556 6688310.137079075, 355731.588097556 6688310.137660144), (355731.588097556 6688310.137660144, 355731.606452328 6688312.385872863, 355731.60899502283 6688312.43484115, 355731.61579597107 6688312.483401493, 355731.62680341175 6688312.531184307, 355731.64193357184 6688312.577825937, 355731.66107130086 6688312.622971415, 355731.6840709476 6688312.666277142, 355731.7107574705 6688312.707413548, 355731.7409277679 6688312.746067549, 355731.7743522237 6688312.781944966, 355731.8107764562 6688312.814772745, 355731.84992325335 6688312.844301048, 355731.89149468305 6688312.870305148, 355731.9351743593 6688312.892587135, 355731.9806298517 6688312.910977427, 355732.02751521376 6688312.925336062, 355732.07547361817 6688312.935553764, 355732.1241400698 6688312.941552767, 355732.1731441859 6688312.943287418, 355732.2221087559 6688312.94074852, 355732.27066572144 6688312.933951802, 355732.31844553724 6688312.922948988, 355732.36508457176 6688312.907823818, 355732.4102278764 6688312.888691402, 355732.45353188517 6688312.865697347, 355732.49466703046 6688312.839016653, 355732.5333202506 6688312.808852371, 355732.5691973733 6688312.775434071, 355732.6020253532 6688312.739016085, 355732.6315543519 6688312.6998755755, 355732.6575596366 6688312.658310421, 355732.6798432928 6688312.614636959, 355732.698235729 6688312.569187562, 355732.71259696875 6688312.52230813, 355732.7228177154 6688312.474355444, 355732.7288201828 6688312.425694448, 355732.7305586894 6688312.3766954765), (355732.7305586894 6688312.3766954765, 355732.7468818356 6688312.375850688, 355732.7630692388 6688312.373586475, 355732.77899770264 6688312.369920069, 355732.79454600235 6688312.3648793725, 355732.809595806 6688312.358502751, 355732.8240325751 6688312.350838732, 355732.8377464375 6688312.341945644, 355732.8506330222 6688312.331891166, 355732.8625942545 6688312.3207518235, 355732.8735391022 6688312.3086123895, 355732.8833842688 6688312.295565258, 355732.892054826 6688312.281709718, 355732.89948478603 6688312.2671512235, 355732.9056176025 6688312.252000573, 355732.91040660045 6688312.23637307, 355732.91381533333 6688312.220387652, 355732.91581785824 6688312.204165973, 355732.91639893485 6688312.187831499, 355732.91555414087 6688312.171508535, 355732.91328990576 6688312.155321313, 355732.9096234615 6688312.139393029, 355732.9045827119 6688312.123844901, 355732.8982060206 6688312.10879527, 355732.8905419175 6688312.094358665, 355732.8816487313 6688312.080644958, 355732.87159414444 6688312.067758518, 355732.8604546787 6688312.055797424, 355732.8483151118 6688312.044852701, 355732.83526783326 6688312.035007647, 355732.82141214074 6688312.026337189, 355732.8068534843 6688312.018907314, 355732.7917026645 6688312.012774568, 355732.7760749879 6688312.007985629, 355732.7600893908 6688312.004576938, 355732.7438675329 6688312.002574437, 355732.7275328724 6688312.001993371), (355732.7275328724 6688312.001993371, 355732.7112097263 6688312.002838159, 355732.6950223234 6688312.005102371, 355732.67909385933 6688312.008768778, 355732.66354555945 6688312.013809472, 355732.64849575626 6688312.020186097, 355732.63405898714 6688312.027850116, 355732.62034512474 6688312.036743205, 355732.60745854035 6688312.0467976825, 355732.5954973078 6688312.057937023, 355732.58455245994 6688312.0700764535, 355732.5747072934 6688312.083123589, 355732.5660367364 6688312.09697913, 355732.55860677635 6688312.111537623, 355732.5524739599 6688312.126688274, 355732.54768496164 6688312.142315775, 355732.5442762291 6688312.158301196, 355732.5422737041 6688312.174522871, 355732.5416926277 6688312.19085735, 355732.54253742134 6688312.207180312, 355732.5448016567 6688312.223367535, 355732.54846810095 6688312.23929582, 355732.5535088502 6688312.254843941, 355732.55988554185 6688312.269893577, 355732.56754964485 6688312.284330183, 355732.576442831 6688312.298043889, 355732.58649741765 6688312.310930328, 355732.59763688344 6688312.3228914235, 355732.6097764503 6688312.333836148, 355732.62282372895 6688312.3436812, 355732.63667942147 6688312.352351658, 355732.6512380776 6688312.359781533, 355732.66638889746 6688312.365914279, 355732.6820165741 6688312.3707032185, 355732.69800217106 6688312.374111909, 355732.714224029 6688312.376114408, 355732.7305586894 6688312.3766954765), (355732.7275328724 6688312.001993371, 355732.7260199565 6688311.8146423185), (355732.6340072216 6688312.0027498985, 355732.5386689041 6688311.816155231), (355732.821358274 6688312.001236985, 355732.9133710091 6688311.81312941))
-""")
+        _sio = AbstractGeoDataFrameDemos._dataset(
+            "GeoDataFrameDemos6", "nizanDistrictInNantesStreetLight.csv"
+        )
         return GeoDataFrameLib.read_csv(_sio)
 
     @staticmethod
@@ -527,13 +309,9 @@ N;TOPO;O;LINESTRING (355838 6688313.658252633, 355833.3759439519 6688313.9691582
         streetsanitation = clip(streetsanitation, roi)
         streetsanitation.to_csv('/tmp/nizan-streetsanitation.csv', sep=';', index=False)
         '''
-        _sio = StringIO("""objectid;gid;theme;dalle;ligne;block;date;geometry
-25274;24897;T17-ASSAINISSEMENT;43-50-14-C;ByBlock;T17_255;20220609;MULTILINESTRING ((355725.9572515609 6688323.321448903, 355725.96466494334 6688323.502007998), (355725.96466494334 6688323.502007998, 355725.9720742305 6688323.682467347), (355725.9720742305 6688323.682467347, 355725.97578288417 6688323.772794691), (355725.97578288417 6688323.772794691, 355725.97948761325 6688323.863026448), (355725.97948761325 6688323.863026448, 355725.98319217196 6688323.953254056), (355725.98319217196 6688323.953254056, 355725.9868969003 6688324.043485795, 355726.28636333137 6688324.031232857, 355726.28267123795 6688323.941004737), (355726.28267123795 6688323.941004737, 355726.2752828005 6688323.760444622), (355726.2752828005 6688323.760444622, 355726.2715907068 6688323.670216494), (355726.2715907068 6688323.670216494, 355726.2642063511 6688323.489756129), (355726.2642063511 6688323.489756129, 355726.2568179135 6688323.309196009, 355725.9572515609 6688323.321448903), (355725.9610071585 6688323.411778475, 355726.26047363516 6688323.399425619), (355726.26422922546 6688323.489755193, 355726.2642063511 6688323.489756129), (355726.2642063511 6688323.489756129, 355725.96466494334 6688323.502007998), (355725.96466494334 6688323.502007998, 355725.9646628728 6688323.502008082), (355725.9684185162 6688323.592237737, 355726.2678849472 6688323.579984799), (355726.2716405833 6688323.670214455, 355726.2715907068 6688323.670216494), (355726.2715907068 6688323.670216494, 355725.9720742305 6688323.682467347), (355725.97572990647 6688323.772796876, 355725.97578288417 6688323.772794691), (355725.97578288417 6688323.772794691, 355726.2752828005 6688323.760444622), (355726.2752828005 6688323.760444622, 355726.27529630496 6688323.760444065), (355726.2789519734 6688323.8507735925, 355725.97948761325 6688323.863026448), (355725.97948761325 6688323.863026448, 355725.9794855425 6688323.863026532), (355725.9831412642 6688323.953256139, 355725.98319217196 6688323.953254056), (355725.98319217196 6688323.953254056, 355726.28267123795 6688323.941004737), (355726.28267123795 6688323.941004737, 355726.28270761715 6688323.941003249), (355762.66181272164 6688219.956738217, 355762.6028639634 6688219.940835556), (355762.6028639634 6688219.940835556, 355762.5439152121 6688219.924932898), (355762.5439152121 6688219.924932898, 355762.48496645334 6688219.909030237), (355762.48496645334 6688219.909030237, 355762.42601769435 6688219.893127576), (355762.42601769435 6688219.893127576, 355762.3670689366 6688219.877224917), (355762.3670689366 6688219.877224917, 355762.30812017736 6688219.861322256), (355762.30812017736 6688219.861322256, 355762.1902477394 6688219.8295237, 355762.0861540409 6688220.215367761, 355762.14510280057 6688220.231270422), (355762.14510280057 6688220.231270422, 355762.20405155956 6688220.247173083), (355762.20405155956 6688220.247173083, 355762.263000317 6688220.263075744), (355762.263000317 6688220.263075744, 355762.321949075 6688220.278978405), (355762.321949075 6688220.278978405, 355762.3808978336 6688220.294881065), (355762.3808978336 6688220.294881065, 355762.43984659284 6688220.310783726), (355762.43984659284 6688220.310783726, 355762.4987953508 6688220.326686386), (355762.4987953508 6688220.326686386, 355762.5577190309 6688220.342582282, 355762.66181272164 6688219.956738217), (355762.6028671036 6688219.940823914, 355762.6028639634 6688219.940835556), (355762.6028639634 6688219.940835556, 355762.4987953508 6688220.326686386), (355762.4987953508 6688220.326686386, 355762.4987733671 6688220.326767894), (355762.43982774904 6688220.310853592, 355762.43984659284 6688220.310783726), (355762.43984659284 6688220.310783726, 355762.5439152121 6688219.924932898), (355762.5439152121 6688219.924932898, 355762.54392149305 6688219.92490961), (355762.4849758752 6688219.908995304, 355762.48496645334 6688219.909030237), (355762.48496645334 6688219.909030237, 355762.3808978336 6688220.294881065), (355762.3808978336 6688220.294881065, 355762.38088213094 6688220.294939285), (355762.32193651295 6688220.27902498, 355762.321949075 6688220.278978405), (355762.321949075 6688220.278978405, 355762.42601769435 6688219.893127576), (355762.42601769435 6688219.893127576, 355762.42603025713 6688219.893080998), (355762.3670846391 6688219.877166697, 355762.3670689366 6688219.877224917), (355762.3670689366 6688219.877224917, 355762.263000317 6688220.263075744), (355762.263000317 6688220.263075744, 355762.2629908951 6688220.263110677), (355762.20404527715 6688220.247196376, 355762.20405155956 6688220.247173083), (355762.20405155956 6688220.247173083, 355762.30812017736 6688219.861322256), (355762.30812017736 6688219.861322256, 355762.30813902104 6688219.86125239), (355762.2491933573 6688219.845438006, 355762.14510280057 6688220.231270422), (355762.14510280057 6688220.231270422, 355762.1450996589 6688220.2312820675), (355740.2579682825 6688237.5002548825, 355740.3264057957 6688237.520365433), (355740.3264057957 6688237.520365433, 355740.3948432996 6688237.54047598), (355740.3948432996 6688237.54047598, 355740.4631888192 6688237.560559498), (355740.4631888192 6688237.560559498, 355740.5316263248 6688237.580670047), (355740.5316263248 6688237.580670047, 355740.8052573854 6688237.661077281, 355740.96607978275 6688237.113788181, 355740.8976422721 6688237.093677632), (355740.8976422721 6688237.093677632, 355740.82929675694 6688237.073594116), (355740.82929675694 6688237.073594116, 355740.76085924427 6688237.053483566), (355740.76085924427 6688237.053483566, 355740.6924217419 6688237.03337302), (355740.6924217419 6688237.03337302, 355740.623984236 6688237.013262472), (355740.623984236 6688237.013262472, 355740.41879068036 6688236.952965787, 355740.2579682825 6688237.5002548825), (355740.3264043989 6688237.520370186, 355740.3264057957 6688237.520365433), (355740.3264057957 6688237.520365433, 355740.4872267966 6688236.973081086), (355740.55556298356 6688236.993196343, 355740.3948432996 6688237.54047598), (355740.3948432996 6688237.54047598, 355740.3948405077 6688237.540485487), (355740.46317670215 6688237.560600741, 355740.4631888192 6688237.560559498), (355740.4631888192 6688237.560559498, 355740.623984236 6688237.013262472), (355740.623984236 6688237.013262472, 355740.62399914564 6688237.013211724), (355740.6924352545 6688237.033327027, 355740.6924217419 6688237.03337302), (355740.6924217419 6688237.03337302, 355740.5316263248 6688237.580670047), (355740.5316263248 6688237.580670047, 355740.5316128111 6688237.580716043), (355740.6000489657 6688237.600731423, 355740.76085924427 6688237.053483566), (355740.76085924427 6688237.053483566, 355740.76087136334 6688237.0534423245), (355740.8293074795 6688237.073557626, 355740.82929675694 6688237.073594116), (355740.82929675694 6688237.073594116, 355740.6684850819 6688237.620846723), (355740.7369211908 6688237.640962022, 355740.8976422721 6688237.093677632), (355740.8976422721 6688237.093677632, 355740.89764366654 6688237.093672884), (355732.4873030876 6688237.222215052, 355732.55654901237 6688237.219246462), (355732.55654901237 6688237.219246462, 355732.6256952077 6688237.216282147), (355732.6256952077 6688237.216282147, 355732.7640873277 6688237.210349242), (355732.7640873277 6688237.210349242, 355732.8332335232 6688237.207384927), (355732.8332335232 6688237.207384927, 355733.04077183857 6688237.198487707, 355733.01704445307 6688236.645118873, 355732.87865237205 6688236.651052859), (355732.87865237205 6688236.651052859, 355732.8095062073 6688236.654017713), (355732.8095062073 6688236.654017713, 355732.6711141262 6688236.659951698), (355732.6711141262 6688236.659951698, 355732.6019679615 6688236.662916552), (355732.6019679615 6688236.662916552, 355732.53282178915 6688236.665881407), (355732.53282178915 6688236.665881407, 355732.463675617 6688236.668846262, 355732.4873030876 6688237.222215052), (355732.5565491281 6688237.21924916, 355732.55654901237 6688237.219246462), (355732.55654901237 6688237.219246462, 355732.53282178915 6688236.665881407), (355732.53282178915 6688236.665881407, 355732.5328217429 6688236.665880328), (355732.60196786874 6688236.662914389, 355732.6019679615 6688236.662916552), (355732.6019679615 6688236.662916552, 355732.6256952077 6688237.216282147), (355732.6256952077 6688237.216282147, 355732.62569525396 6688237.216283226), (355732.6948413798 6688237.213317286, 355732.6711141262 6688236.659951698), (355732.6711141262 6688236.659951698, 355732.6711139872 6688236.659948456), (355732.740360035 6688236.656982568, 355732.7640873277 6688237.210349242), (355732.7640873277 6688237.210349242, 355732.7640874203 6688237.210351401), (355732.8332335464 6688237.207385469, 355732.8332335232 6688237.207384927), (355732.8332335232 6688237.207384927, 355732.8095062073 6688236.654017713), (355732.8095062073 6688236.654017713, 355732.8095061609 6688236.654016631), (355732.87865227944 6688236.651050698, 355732.87865237205 6688236.651052859), (355732.87865237205 6688236.651052859, 355732.9023796722 6688237.204419528), (355732.97152579826 6688237.201453597, 355732.9478983272 6688236.648084806), (355719.4311860069 6688237.978226257, 355719.504628315 6688237.971042118), (355719.504628315 6688237.971042118, 355719.5780706231 6688237.9638579795), (355719.5780706231 6688237.9638579795, 355719.7985062601 6688237.942294931), (355719.7985062601 6688237.942294931, 355720.0188429278 6688237.920741563, 355719.9612583153 6688237.333084596, 355719.8878172191 6688237.340281103), (355719.8878172191 6688237.340281103, 355719.74092527607 6688237.354675071), (355719.74092527607 6688237.354675071, 355719.66748417256 6688237.361871579), (355719.66748417256 6688237.361871579, 355719.5204932848 6688237.376275243), (355719.5204932848 6688237.376275243, 355719.4470521887 6688237.38347175), (355719.4470521887 6688237.38347175, 355719.37360134907 6688237.390669211, 355719.4311860069 6688237.978226257), (355719.50463062036 6688237.971065645, 355719.504628315 6688237.971042118), (355719.504628315 6688237.971042118, 355719.4470521887 6688237.38347175), (355719.4470521887 6688237.38347175, 355719.4470460082 6688237.383408677), (355719.52049062174 6688237.376248066, 355719.5204932848 6688237.376275243), (355719.5204932848 6688237.376275243, 355719.5780706231 6688237.9638579795), (355719.5780706231 6688237.9638579795, 355719.57807523373 6688237.963905032), (355719.65151989314 6688237.9566445025, 355719.59403514944 6688237.3690875), (355719.6674798085 6688237.361826966, 355719.66748417256 6688237.361871579), (355719.66748417256 6688237.361871579, 355719.7249645064 6688237.949483887), (355719.7985090417 6688237.942323318, 355719.7985062601 6688237.942294931), (355719.7985062601 6688237.942294931, 355719.74092527607 6688237.354675071), (355719.74092527607 6688237.354675071, 355719.74092442205 6688237.354666356), (355719.8143690354 6688237.34750574, 355719.871953701 6688237.935062788), (355719.94539831433 6688237.927902173, 355719.8878172191 6688237.340281103), (355719.8878172191 6688237.340281103, 355719.8878137019 6688237.34024521), (355694.6023950123 6688239.122829869, 355694.7374872711 6688239.120543209), (355694.7374872711 6688239.120543209, 355694.80493437685 6688239.119401555), (355694.80493437685 6688239.119401555, 355694.94002663135 6688239.117114893), (355694.94002663135 6688239.117114893, 355695.00757363247 6688239.1159715485), (355695.00757363247 6688239.1159715485, 355695.0751206265 6688239.114828204), (355695.0751206265 6688239.114828204, 355695.14266762807 6688239.113684858, 355695.133522566 6688238.573512169, 355694.9308833135 6688238.576942176), (355694.9308833135 6688238.576942176, 355694.72834394587 6688238.580370491), (355694.72834394587 6688238.580370491, 355694.6607969522 6688238.581513837), (355694.6607969522 6688238.581513837, 355694.59324995073 6688238.582657183, 355694.6023950123 6688239.122829869), (355694.66994158726 6688239.121661773, 355694.6607969522 6688238.581513837), (355694.6607969522 6688238.581513837, 355694.66079653305 6688238.58148908), (355694.7283431078 6688238.580320979, 355694.72834394587 6688238.580370491), (355694.72834394587 6688238.580370491, 355694.7374872711 6688239.120543209), (355694.7374872711 6688239.120543209, 355694.7374881239 6688239.120593592), (355694.80493477685 6688239.119425443, 355694.80493437685 6688239.119401555), (355694.80493437685 6688239.119401555, 355694.7958896443 6688238.579252799), (355694.8634362192 6688238.578084695, 355694.8724813592 6688239.118257343), (355694.94002788846 6688239.117189163, 355694.94002663135 6688239.117114893), (355694.94002663135 6688239.117114893, 355694.9308833135 6688238.576942176), (355694.9308833135 6688238.576942176, 355694.93088287977 6688238.576916551), (355694.9984294088 6688238.57584837, 355695.00757363247 6688239.1159715485), (355695.00757363247 6688239.1159715485, 355695.0075744707 6688239.11602106), (355695.07512104564 6688239.114852962, 355695.0751206265 6688239.114828204), (355695.0751206265 6688239.114828204, 355695.0659759836 6688238.574680267), (355685.874870303 6688239.551286532, 355686.0048675183 6688239.539807891), (355686.0048675183 6688239.539807891, 355686.06992009416 6688239.534063805), (355686.06992009416 6688239.534063805, 355686.2649698775 6688239.516841078), (355686.2649698775 6688239.516841078, 355686.32992331573 6688239.511105746), (355686.32992331573 6688239.511105746, 355686.394975891 6688239.50536166, 355686.3490510647 6688238.985156154, 355686.0889486983 6688239.008122967), (355686.0889486983 6688239.008122967, 355685.828945477 6688239.0310810255, 355685.874870303 6688239.551286532), (355685.9398210674 6688239.545520913, 355685.8938961956 6688239.025415329), (355685.95894687437 6688239.01964976, 355686.0048675183 6688239.539807891), (355686.0048675183 6688239.539807891, 355686.0048717003 6688239.539855261), (355686.0699223793 6688239.534089689, 355686.06992009416 6688239.534063805), (355686.06992009416 6688239.534063805, 355686.0239975531 6688239.013884187), (355686.08894830995 6688239.008118568, 355686.0889486983 6688239.008122967), (355686.0889486983 6688239.008122967, 355686.134873136 6688239.528324071), (355686.1999238149 6688239.522558501, 355686.1539989428 6688239.002452914), (355686.21904962166 6688238.996687347, 355686.2649698775 6688239.516841078), (355686.2649698775 6688239.516841078, 355686.2649744479 6688239.516892849), (355686.32992521237 6688239.51112723, 355686.32992331573 6688239.511105746), (355686.32992331573 6688239.511105746, 355686.2840003861 6688238.990921728), (355680.66899576667 6688241.804699811, 355680.7267499654 6688241.79960775), (355680.7267499654 6688241.79960775, 355680.7845041638 6688241.794515689), (355680.7845041638 6688241.794515689, 355680.8423575024 6688241.789414886), (355680.8423575024 6688241.789414886, 355680.9001204865 6688241.784322051), (355680.9001204865 6688241.784322051, 355680.95787467744 6688241.77922999), (355680.95787467744 6688241.77922999, 355681.0157280235 6688241.774129188), (355681.0157280235 6688241.774129188, 355681.07348221494 6688241.7690371275), (355681.07348221494 6688241.7690371275, 355681.13124519883 6688241.7639442915, 355681.09048972087 6688241.301594939, 355680.62824028893 6688241.342350462, 355680.66899576667 6688241.804699811), (355680.7267519566 6688241.799630339, 355680.7267499654 6688241.79960775), (355680.7267499654 6688241.79960775, 355680.6859964789 6688241.3372809915), (355680.74375266884 6688241.33221152, 355680.7845041638 6688241.794515689), (355680.7845041638 6688241.794515689, 355680.7845081465 6688241.794560871), (355680.84236425086 6688241.789491445, 355680.8423575024 6688241.789414886), (355680.8423575024 6688241.789414886, 355680.80160877295 6688241.32714209), (355680.8593650088 6688241.321972702, 355680.9001204865 6688241.784322051), (355680.9001204865 6688241.784322051, 355680.90012048656 6688241.784322051), (355680.957876669 6688241.779252584, 355680.95787467744 6688241.77922999), (355680.95787467744 6688241.77922999, 355680.91712119855 6688241.316903229), (355680.9749773028 6688241.3118338, 355681.0157280235 6688241.774129188), (355681.0157280235 6688241.774129188, 355681.01573278074 6688241.774183156), (355681.0734889631 6688241.769113682, 355681.07348221494 6688241.7690371275), (355681.07348221494 6688241.7690371275, 355681.0327334927 6688241.30676433), (355681.35933882877 6688254.685926674, 355681.41529392824 6688254.684916572), (355681.41529392824 6688254.684916572, 355681.52740572067 6688254.682892727), (355681.52740572067 6688254.682892727, 355681.583360812 6688254.6818826245), (355681.583360812 6688254.6818826245, 355681.69537272956 6688254.679860583), (355681.69537272956 6688254.679860583, 355681.7514277038 6688254.678848677), (355681.7514277038 6688254.678848677, 355681.80738463614 6688254.677838542, 355681.79939642944 6688254.229792782, 355681.74334144546 6688254.230804456), (355681.74334144546 6688254.230804456, 355681.6313295251 6688254.232826035), (355681.6313295251 6688254.232826035, 355681.57527454867 6688254.233837708), (355681.57527454867 6688254.233837708, 355681.4632626208 6688254.235859286), (355681.4632626208 6688254.235859286, 355681.4073075117 6688254.236869157), (355681.4073075117 6688254.236869157, 355681.35125070036 6688254.237880864, 355681.35933882877 6688254.685926674), (355681.4152945794 6688254.684953104, 355681.41529392824 6688254.684916572), (355681.41529392824 6688254.684916572, 355681.4073075117 6688254.236869157), (355681.4073075117 6688254.236869157, 355681.4073064113 6688254.236807423), (355681.4632621617 6688254.235833854, 355681.4632626208 6688254.235859286), (355681.4632626208 6688254.235859286, 355681.4713502903 6688254.683879662), (355681.5274059628 6688254.68290614, 355681.52740572067 6688254.682892727), (355681.52740572067 6688254.682892727, 355681.5193178343 6688254.23486033), (355681.5752736306 6688254.233786841, 355681.57527454867 6688254.233837708), (355681.57527454867 6688254.233837708, 355681.583360812 6688254.6818826245), (355681.583360812 6688254.6818826245, 355681.5833617134 6688254.681932569), (355681.63941742416 6688254.680859126, 355681.6313295251 6688254.232826035), (355681.6313295251 6688254.232826035, 355681.6313292955 6688254.232813317), (355681.6873849681 6688254.231839795, 355681.69537272956 6688254.679860583), (355681.69537272956 6688254.679860583, 355681.69537317485 6688254.679885559), (355681.75142884726 6688254.678912032, 355681.7514277038 6688254.678848677), (355681.7514277038 6688254.678848677, 355681.74334144546 6688254.230804456), (355681.74334144546 6688254.230804456, 355681.7433407569 6688254.230766305), (355671.6541953567 6688241.808164097, 355671.84954293823 6688241.800159018), (355671.84954293823 6688241.800159018, 355671.94716479216 6688241.796158606), (355671.94716479216 6688241.796158606, 355672.0448905197 6688241.792153939), (355672.0448905197 6688241.792153939, 355672.1425123739 6688241.788153527), (355672.1425123739 6688241.788153527, 355672.33785994886 6688241.780148448), (355672.33785994886 6688241.780148448, 355672.43548593 6688241.776147868, 355672.4035695731 6688240.994957262, 355672.3058474618 6688240.998949285), (355672.3058474618 6688240.998949285, 355672.11059861 6688241.006925349), (355672.11059861 6688241.006925349, 355671.81752790435 6688241.018897511), (355671.81752790435 6688241.018897511, 355671.62227905396 6688241.0268735755, 355671.6541953567 6688241.808164097), (355671.75191915233 6688241.804112134, 355671.7199028819 6688241.022921487), (355671.81752675556 6688241.018869477, 355671.81752790435 6688241.018897511), (355671.81752790435 6688241.018897511, 355671.84954293823 6688241.800159018), (355671.84954293823 6688241.800159018, 355671.84954298043 6688241.800160048), (355671.94716680853 6688241.796207965, 355671.94716479216 6688241.796158606), (355671.94716479216 6688241.796158606, 355671.91525049804 6688241.014917443), (355672.012874326 6688241.010965357, 355672.0448905197 6688241.792153939), (355672.0448905197 6688241.792153939, 355672.04489060433 6688241.792156004), (355672.1425144324 6688241.788203917, 355672.1425123739 6688241.788153527), (355672.1425123739 6688241.788153527, 355672.11059861 6688241.006925349), (355672.11059861 6688241.006925349, 355672.11059812165 6688241.006913394), (355672.2082219496 6688241.00296131, 355672.24013830605 6688241.784151911), (355672.3378620562 6688241.780199873, 355672.33785994886 6688241.780148448), (355672.33785994886 6688241.780148448, 355672.3058474618 6688240.998949285), (355672.3058474618 6688240.998949285, 355672.3058458234 6688240.998909302), (355700.6574000579 6688215.036446736, 355700.71795126185 6688215.0324436715), (355700.71795126185 6688215.0324436715, 355700.83925924567 6688215.024423952), (355700.83925924567 6688215.024423952, 355700.89981044317 6688215.0204208875), (355700.89981044317 6688215.0204208875, 355701.0210189425 6688215.012407745), (355701.0210189425 6688215.012407745, 355701.14222744945 6688215.004394602, 355701.11027523165 6688214.519567258, 355701.04962449626 6688214.523576071), (355701.04962449626 6688214.523576071, 355700.9889737599 6688214.527584884), (355700.9889737599 6688214.527584884, 355700.9284158798 6688214.53158756), (355700.9284158798 6688214.53158756, 355700.8677651437 6688214.535596373), (355700.8677651437 6688214.535596373, 355700.746556535 6688214.543607861), (355700.746556535 6688214.543607861, 355700.686005271 6688214.547610099), (355700.686005271 6688214.547610099, 355700.62534792593 6688214.551619349, 355700.6574000579 6688215.036446736), (355700.71795350185 6688215.032477668, 355700.71795126185 6688215.0324436715), (355700.71795126185 6688215.0324436715, 355700.686005271 6688214.547610099), (355700.686005271 6688214.547610099, 355700.6860013376 6688214.5475504035), (355700.74655478145 6688214.543581336, 355700.746556535 6688214.543607861), (355700.746556535 6688214.543607861, 355700.77860692097 6688215.028408725), (355700.8392602867 6688215.024439699, 355700.83925924567 6688215.024423952), (355700.83925924567 6688215.024423952, 355700.8072081473 6688214.539612311), (355700.867761637 6688214.535543319, 355700.8677651437 6688214.535596373), (355700.8677651437 6688214.535596373, 355700.89981044317 6688215.0204208875), (355700.89981044317 6688215.0204208875, 355700.89981373085 6688215.0204706285), (355700.96046714246 6688215.016401689, 355700.9284158798 6688214.53158756), (355700.9284158798 6688214.53158756, 355700.9284150028 6688214.531574295), (355700.98896849994 6688214.527505305, 355700.9889737599 6688214.527584884), (355700.9889737599 6688214.527584884, 355701.0210189425 6688215.012407745), (355701.0210189425 6688215.012407745, 355701.0210205865 6688215.012432617), (355701.0816739979 6688215.008363672, 355701.04962449626 6688214.523576071), (355701.04962449626 6688214.523576071, 355701.0496218658 6688214.523536282), (355734.84455711115 6688378.287623091, 355734.87426053616 6688379.040036925), (355734.87426053616 6688379.040036925, 355734.8792150187 6688379.1655383175), (355734.8792150187 6688379.1655383175, 355734.88416556374 6688379.29093997, 355734.7643590683 6688379.295681262, 355734.75445487944 6688379.044774188), (355734.75445487944 6688379.044774188, 355734.7495048328 6688378.919372527), (355734.7495048328 6688378.919372527, 355734.74455478607 6688378.793970865), (355734.74455478607 6688378.793970865, 355734.7396047396 6688378.668569208), (355734.7396047396 6688378.668569208, 355734.73465469293 6688378.543167548), (355734.73465469293 6688378.543167548, 355734.7297046463 6688378.417765887), (355734.7297046463 6688378.417765887, 355734.7247506617 6688378.292264466, 355734.84455711115 6688378.287623091), (355734.84949567856 6688378.413025204, 355734.7297046463 6688378.417765887), (355734.7297046463 6688378.417765887, 355734.72968919075 6688378.417766499), (355734.73462776555 6688378.543168614, 355734.73465469293 6688378.543167548), (355734.73465469293 6688378.543167548, 355734.8544342533 6688378.538427319), (355734.8593728284 6688378.663829432, 355734.7396047396 6688378.668569208), (355734.7396047396 6688378.668569208, 355734.739566333 6688378.668570728), (355734.74450490775 6688378.793972839, 355734.74455478607 6688378.793970865), (355734.74455478607 6688378.793970865, 355734.8643113956 6688378.789231545), (355734.86924997054 6688378.914633661, 355734.7495048328 6688378.919372527), (355734.7495048328 6688378.919372527, 355734.7494434753 6688378.919374955), (355734.75438205 6688379.044777067, 355734.75445487944 6688379.044774188), (355734.75445487944 6688379.044774188, 355734.87426053616 6688379.040036925), (355734.87426053616 6688379.040036925, 355734.87428845983 6688379.040035821), (355734.8792269889 6688379.165537854, 355734.8792150187 6688379.1655383175), (355734.8792150187 6688379.1655383175, 355734.7594205467 6688379.170179229), (355710.04043772037 6688280.624356069, 355710.5704577737 6688280.9659262085, 355710.6787482976 6688280.797910053, 355710.6125077595 6688280.755233991), (355710.6125077595 6688280.755233991, 355710.47995605675 6688280.669836366), (355710.47995605675 6688280.669836366, 355710.41371551127 6688280.627160299), (355710.41371551127 6688280.627160299, 355710.3474749657 6688280.584484233), (355710.3474749657 6688280.584484233, 355710.2812344266 6688280.541808169), (355710.2812344266 6688280.541808169, 355710.21492328384 6688280.49908662), (355710.21492328384 6688280.49908662, 355710.14872819115 6688280.456439837, 355710.04043772037 6688280.624356069), (355710.10676516657 6688280.667052371, 355710.21492328384 6688280.49908662), (355710.21492328384 6688280.49908662, 355710.21495576866 6688280.499036172), (355710.2812832148 6688280.541732473, 355710.2812344266 6688280.541808169), (355710.2812344266 6688280.541808169, 355710.17299269076 6688280.709748627), (355710.2392202152 6688280.752444884, 355710.3474749657 6688280.584484233), (355710.3474749657 6688280.584484233, 355710.34751073923 6688280.584428729), (355710.413738271 6688280.627124987, 355710.41371551127 6688280.627160299), (355710.41371551127 6688280.627160299, 355710.30544774694 6688280.795141137), (355710.3717751932 6688280.837837442, 355710.47995605675 6688280.669836366), (355710.47995605675 6688280.669836366, 355710.4799657954 6688280.669821242), (355710.54619331966 6688280.712517496, 355710.43800271756 6688280.880533697), (355710.5042302494 6688280.923229952, 355710.6125077595 6688280.755233991), (355710.6125077595 6688280.755233991, 355710.6125207734 6688280.7552138), (355670.1101410833 6688264.901609093, 355670.01641731494 6688264.89369935), (355670.01641731494 6688264.89369935, 355669.92269354756 6688264.885789607), (355669.92269354756 6688264.885789607, 355669.73515512876 6688264.869962451), (355669.73515512876 6688264.869962451, 355669.64143136103 6688264.862052709), (355669.64143136103 6688264.862052709, 355669.3601691668 6688264.838315809, 355669.33505226247 6688265.137065659, 355669.42877707706 6688265.144963003), (355669.42877707706 6688265.144963003, 355669.61621837673 6688265.160756988), (355669.61621837673 6688265.160756988, 355669.7100423878 6688265.16866269), (355669.7100423878 6688265.16866269, 355669.89748370455 6688265.184456677), (355669.89748370455 6688265.184456677, 355670.0850242251 6688265.200259022, 355670.1101410833 6688264.901609093), (355670.01641958486 6688264.893672466, 355670.01641731494 6688264.89369935), (355670.01641731494 6688264.89369935, 355669.9912028046 6688265.192322347), (355669.8974812601 6688265.184485637, 355669.89748370455 6688265.184456677), (355669.89748370455 6688265.184456677, 355669.92269354756 6688264.885789607), (355669.92269354756 6688264.885789607, 355669.9226980862 6688264.885735837), (355669.8289765418 6688264.877899128, 355669.8037597615 6688265.176549007), (355669.71003821713 6688265.168712297, 355669.7100423878 6688265.16866269), (355669.7100423878 6688265.16866269, 355669.73515512876 6688264.869962451), (355669.6414336303 6688264.862025823, 355669.64143136103 6688264.862052709), (355669.64143136103 6688264.862052709, 355669.61621837673 6688265.160756988), (355669.61621837673 6688265.160756988, 355669.61621680396 6688265.160775621), (355669.5224953055 6688265.152838996, 355669.54771208577 6688264.854189113), (355669.45399058727 6688264.846252483, 355669.42877707706 6688265.144963003), (355669.42877707706 6688265.144963003, 355669.4287737611 6688265.145002288), (355757.97207755875 6688266.823351214, 355757.9125232596 6688266.814671133), (355757.9125232596 6688266.814671133, 355757.7933310225 6688266.79729878), (355757.7933310225 6688266.79729878, 355757.7337767147 6688266.788618697), (355757.7337767147 6688266.788618697, 355757.61468232574 6688266.771260605), (355757.61468232574 6688266.771260605, 355757.5550301782 6688266.762566263), (355757.5550301782 6688266.762566263, 355757.4954900869 6688266.753888252, 355757.42602712207 6688267.230475727, 355757.48558142653 6688267.239155808), (355757.48558142653 6688267.239155808, 355757.6047736672 6688267.256528161), (355757.6047736672 6688267.256528161, 355757.7835202124 6688267.2825805945), (355757.7835202124 6688267.2825805945, 355757.9026146015 6688267.299938685, 355757.97207755875 6688266.823351214), (355757.912529126 6688266.814630883, 355757.9125232596 6688266.814671133), (355757.9125232596 6688266.814671133, 355757.8430661613 6688267.291218359), (355757.78351768287 6688267.28259795, 355757.7835202124 6688267.2825805945), (355757.7835202124 6688267.2825805945, 355757.85298064037 6688266.806010476), (355757.7933322857 6688266.7972901, 355757.7933310225 6688266.79729878), (355757.7933310225 6688266.79729878, 355757.7239692427 6688267.273877617), (355757.66432088823 6688267.265157246, 355757.7337767147 6688266.788618697), (355757.7337767147 6688266.788618697, 355757.73378384573 6688266.788569771), (355757.6742353674 6688266.779949364, 355757.6047736672 6688267.256528161), (355757.6047736672 6688267.256528161, 355757.6047724025 6688267.256536838), (355757.5452239623 6688267.247816507, 355757.61468232574 6688266.771260605), (355757.61468232574 6688266.771260605, 355757.61468692723 6688266.771229034), (355757.5550385727 6688266.762508656, 355757.5550301782 6688266.762566263), (355757.5550301782 6688266.762566263, 355757.48558142653 6688267.239155808), (355757.48558142653 6688267.239155808, 355757.48557556194 6688267.239196054), (355718.12073741725 6688324.353732091, 355718.1172602651 6688324.2585074175), (355718.1172602651 6688324.2585074175, 355718.1137794698 6688324.163182971), (355718.1137794698 6688324.163182971, 355718.1068213877 6688323.9726301655), (355718.1068213877 6688323.9726301655, 355718.103344236 6688323.877405502), (355718.103344236 6688323.877405502, 355718.0998670835 6688323.782180819), (355718.0998670835 6688323.782180819, 355718.0929090021 6688323.591628031, 355717.79334324435 6688323.602581955, 355717.7968203961 6688323.697806618), (355717.7968203961 6688323.697806618, 355717.8002975484 6688323.793031299), (355717.8002975484 6688323.793031299, 355717.81073642534 6688324.07890854), (355717.81073642534 6688324.07890854, 355717.81421357713 6688324.174133206), (355717.81421357713 6688324.174133206, 355717.82117165916 6688324.364686012, 355718.12073741725 6688324.353732091), (355718.11728382856 6688324.2585065635, 355718.1172602651 6688324.2585074175), (355718.1172602651 6688324.2585074175, 355717.81771811645 6688324.269360569), (355717.814164606 6688324.174134996, 355717.81421357713 6688324.174133206), (355717.81421357713 6688324.174133206, 355718.1137794698 6688324.163182971), (355718.1137794698 6688324.163182971, 355718.1138302858 6688324.163181114), (355718.1102767753 6688324.067955542, 355717.81073642534 6688324.07890854), (355717.81073642534 6688324.07890854, 355717.8107110174 6688324.07890947), (355717.8072574747 6688323.983584022, 355718.1068213877 6688323.9726301655), (355718.1068213877 6688323.9726301655, 355718.10682323255 6688323.972630098), (355718.10336964385 6688323.877404572, 355718.103344236 6688323.877405502), (355718.103344236 6688323.877405502, 355717.8038038861 6688323.888358496), (355717.80025042145 6688323.793033006, 355717.8002975484 6688323.793031299), (355717.8002975484 6688323.793031299, 355718.0998670835 6688323.782180819), (355718.0998670835 6688323.782180819, 355718.0999160553 6688323.782179045), (355718.0963625907 6688323.686853552, 355717.7968203961 6688323.697806618), (355717.7968203961 6688323.697806618, 355717.7967968328 6688323.69780748), (355761.7806199789 6688311.145994248, 355761.68669490743 6688311.132505729), (355761.68669490743 6688311.132505729, 355761.4987608959 6688311.105516647), (355761.4987608959 6688311.105516647, 355761.4047379358 6688311.092014071), (355761.4047379358 6688311.092014071, 355761.2168039157 6688311.065024987), (355761.2168039157 6688311.065024987, 355761.1228788367 6688311.051536467), (355761.1228788367 6688311.051536467, 355761.02886990295 6688311.038035905, 355760.9862679118 6688311.334779364, 355761.26812699507 6688311.375256964), (355761.26812699507 6688311.375256964, 355761.73801799555 6688311.442737706, 355761.7806199789 6688311.145994248), (355761.6867011993 6688311.132462006, 355761.68669490743 6688311.132505729), (355761.68669490743 6688311.132505729, 355761.6439992941 6688311.429205418), (355761.55008050706 6688311.4156731805, 355761.5926824521 6688311.119029641), (355761.49876366527 6688311.105497402, 355761.4987608959 6688311.105516647), (355761.4987608959 6688311.105516647, 355761.4560617599 6688311.402240817), (355761.36214297276 6688311.388708575, 355761.4047379358 6688311.092014071), (355761.4047379358 6688311.092014071, 355761.40474496374 6688311.0919651175), (355761.3108261311 6688311.078532795, 355761.26812699507 6688311.375256964), (355761.26812699507 6688311.375256964, 355761.2681242256 6688311.37527621), (355761.17420544615 6688311.361743971, 355761.2168039157 6688311.065024987), (355761.2168039157 6688311.065024987, 355761.2168074296 6688311.065000511), (355761.12288865016 6688311.051468272, 355761.1228788367 6688311.051536467), (355761.1228788367 6688311.051536467, 355761.0801867447 6688311.348211686), (355743.96641123825 6688313.190795596, 355743.9674028841 6688313.155023965), (355743.9674028841 6688313.155023965, 355743.9683945298 6688313.11925234), (355743.9683945298 6688313.11925234, 355743.97136662365 6688313.012040025), (355743.97136662365 6688313.012040025, 355743.9723555015 6688312.976368244), (355743.9723555015 6688312.976368244, 355743.9733471473 6688312.940596615), (355743.9733471473 6688312.940596615, 355743.9743359497 6688312.9049275555, 355743.6884679556 6688312.896902927, 355743.6835153377 6688313.075558662), (355743.6835153377 6688313.075558662, 355743.68054324406 6688313.182770965, 355743.96641123825 6688313.190795596), (355743.96742682566 6688313.155024629, 355743.9674028841 6688313.155023965), (355743.9674028841 6688313.155023965, 355743.68155878584 6688313.147099925), (355743.6825743733 6688313.11132896, 355743.9683945298 6688313.11925234), (355743.9683945298 6688313.11925234, 355743.96844241326 6688313.119253667), (355743.9693580331 6688313.083582577, 355743.6835153377 6688313.075558662), (355743.6835153377 6688313.075558662, 355743.683490039 6688313.075557952), (355743.6845055732 6688313.039886907, 355743.9703736131 6688313.047811615), (355743.9713892007 6688313.0120406505, 355743.97136662365 6688313.012040025), (355743.97136662365 6688313.012040025, 355743.6855211609 6688313.004115946), (355743.68653670244 6688312.9684449, 355743.9723555015 6688312.976368244), (355743.9723555015 6688312.976368244, 355743.9724047423 6688312.976369609), (355743.9734203298 6688312.940598643, 355743.9733471473 6688312.940596615), (355743.9733471473 6688312.940596615, 355743.68755229004 6688312.932673939), (355755.0730789396 6688313.97885713, 355754.9593704768 6688313.975733835), (355754.9593704768 6688313.975733835, 355754.9214019969 6688313.974690934), (355754.9214019969 6688313.974690934, 355754.7697250539 6688313.970524737, 355754.7614925798 6688314.273878673, 355754.79936390684 6688314.274919243), (355754.79936390684 6688314.274919243, 355754.8373323687 6688314.275962481), (355754.8373323687 6688314.275962481, 355754.87520101515 6688314.277002977), (355754.87520101515 6688314.277002977, 355754.91306963784 6688314.278043473), (355754.91306963784 6688314.278043473, 355754.9889094431 6688314.280127281), (355754.9889094431 6688314.280127281, 355755.026877921 6688314.28117052), (355755.026877921 6688314.28117052, 355755.0647465513 6688314.282211016, 355755.0730789396 6688313.97885713), (355755.0352096516 6688313.977840583, 355755.026877921 6688314.28117052), (355755.026877921 6688314.28117052, 355755.02687726315 6688314.281194471), (355754.9889080533 6688314.280177878, 355754.9889094431 6688314.280127281), (355754.9889094431 6688314.280127281, 355754.9972404416 6688313.976823993), (355754.95937119937 6688313.975707527, 355754.9593704768 6688313.975733835), (355754.9593704768 6688313.975733835, 355754.95103881083 6688314.279061411), (355754.9130696008 6688314.27804482, 355754.91306963784 6688314.278043473), (355754.91306963784 6688314.278043473, 355754.9214019969 6688313.974690934), (355754.9214019969 6688313.974690934, 355754.9214019969 6688313.974690933), (355754.8835327088 6688313.973674388, 355754.87520101515 6688314.277002977), (355754.87520101515 6688314.277002977, 355754.8752003203 6688314.277028274), (355754.8373310322 6688314.27601173, 355754.8373323687 6688314.275962481), (355754.8373323687 6688314.275962481, 355754.84556349885 6688313.972657799), (355754.8076942107 6688313.971641249, 355754.79936390684 6688314.274919243), (355754.79936390684 6688314.274919243, 355754.7993618222 6688314.274995138), (355664.85287794523 6688294.265044193, 355664.7601523857 6688294.257046358), (355664.7601523857 6688294.257046358, 355664.667426826 6688294.249048524), (355664.667426826 6688294.249048524, 355664.5747097942 6688294.241051424), (355664.5747097942 6688294.241051424, 355664.4818850632 6688294.233045035), (355664.4818850632 6688294.233045035, 355664.38915951835 6688294.225047202), (355664.38915951835 6688294.225047202, 355664.2964424641 6688294.217050101), (355664.2964424641 6688294.217050101, 355664.203716917 6688294.209052267), (355664.203716917 6688294.209052267, 355664.11099985737 6688294.201055165, 355664.085183557 6688294.499704786, 355664.36345116695 6688294.523702919), (355664.36345116695 6688294.523702919, 355664.8271615671 6688294.5636938615, 355664.85287794523 6688294.265044193), (355664.7601556927 6688294.257008102, 355664.7601523857 6688294.257046358), (355664.7601523857 6688294.257046358, 355664.7343393924 6688294.555657718), (355664.6416171398 6688294.547621629, 355664.667426826 6688294.249048524), (355664.667426826 6688294.249048524, 355664.6674334399 6688294.248972012), (355664.5747111415 6688294.241035838, 355664.5747097942 6688294.241051424), (355664.5747097942 6688294.241051424, 355664.5488948338 6688294.539685453), (355664.4561725811 6688294.531649363, 355664.4818850632 6688294.233045035), (355664.4818850632 6688294.233045035, 355664.48188896704 6688294.232999699), (355664.38916671445 6688294.2249636045, 355664.38915951835 6688294.225047202), (355664.38915951835 6688294.225047202, 355664.36345116695 6688294.523702919), (355664.36345116695 6688294.523702919, 355664.3634502827 6688294.523713191), (355664.27072803007 6688294.515677096, 355664.2964424641 6688294.217050101), (355664.2964424641 6688294.217050101, 355664.29644441605 6688294.217027432), (355664.2037221633 6688294.208991341, 355664.203716917 6688294.209052267), (355664.203716917 6688294.209052267, 355664.17800577724 6688294.507641003), (355666.4964270398 6688300.237227483, 355666.31487361516 6688300.214733046), (355666.31487361516 6688300.214733046, 355666.2241521872 6688300.203492676), (355666.2241521872 6688300.203492676, 355666.13343076716 6688300.192252308), (355666.13343076716 6688300.192252308, 355666.0426109345 6688300.180999747), (355666.0426109345 6688300.180999747, 355665.9518894955 6688300.169759376), (355665.9518894955 6688300.169759376, 355665.8611680755 6688300.158519008), (355665.8611680755 6688300.158519008, 355665.77034823335 6688300.147266446, 355665.733541264 6688300.44471199, 355666.0965367834 6688300.4896932375), (355666.0965367834 6688300.4896932375, 355666.187258023 6688300.500935124), (355666.187258023 6688300.500935124, 355666.2779792624 6688300.512177011), (355666.2779792624 6688300.512177011, 355666.3687989066 6688300.5234310925), (355666.3687989066 6688300.5234310925, 355666.4595201489 6688300.534672979, 355666.4964270398 6688300.237227483), (355666.4056047368 6688300.225994815, 355666.3687989066 6688300.5234310925), (355666.3687989066 6688300.5234310925, 355666.3687977602 6688300.523440356), (355666.27797545714 6688300.51220769, 355666.2779792624 6688300.512177011), (355666.2779792624 6688300.512177011, 355666.31487361516 6688300.214733046), (355666.31487361516 6688300.214733046, 355666.3148823939 6688300.214662271), (355666.2241600051 6688300.203429648, 355666.2241521872 6688300.203492676), (355666.2241521872 6688300.203492676, 355666.187258023 6688300.500935124), (355666.187258023 6688300.500935124, 355666.1872530685 6688300.500975068), (355666.0965306798 6688300.489742445, 355666.0965367834 6688300.4896932375), (355666.0965367834 6688300.4896932375, 355666.13343076716 6688300.192252308), (355666.13343076716 6688300.192252308, 355666.13343762414 6688300.192197027), (355666.04261531355 6688300.180964359, 355666.0426109345 6688300.180999747), (355666.0426109345 6688300.180999747, 355666.0058083369 6688300.4784099), (355665.91498603387 6688300.467177233, 355665.9518894955 6688300.169759376), (355665.9518894955 6688300.169759376, 355665.95189292496 6688300.169731737), (355665.8611705439 6688300.158499115, 355665.8611680755 6688300.158519008), (355665.8611680755 6688300.158519008, 355665.82426364516 6688300.455944612), (355665.5587107227 6688300.161557997, 355665.469181625 6688300.148572758), (355665.469181625 6688300.148572758, 355665.29023543606 6688300.122618527), (355665.29023543606 6688300.122618527, 355665.02177427796 6688300.083681107), (355665.02177427796 6688300.083681107, 355664.8427302233 6688300.057712681, 355664.79972851544 6688300.354455946, 355665.24724259303 6688300.4193006195), (355665.24724259303 6688300.4193006195, 355665.51570906845 6688300.458201341, 355665.5587107227 6688300.161557997), (355665.4691882056 6688300.148527362, 355665.469181625 6688300.148572758), (355665.469181625 6688300.148572758, 355665.42618654366 6688300.445170705), (355665.33666398074 6688300.432239992, 355665.3796656426 6688300.135596647), (355665.2902430398 6688300.1225660555, 355665.29023543606 6688300.122618527), (355665.29023543606 6688300.122618527, 355665.24724259303 6688300.4193006195), (355665.24724259303 6688300.4193006195, 355665.247241332 6688300.419309321), (355665.15771881473 6688300.406278684, 355665.2007204693 6688300.109635342), (355665.11119790626 6688300.096704622, 355665.0681962444 6688300.3933479665), (355664.9787736489 6688300.380317376, 355665.02177427796 6688300.083681107), (355665.02177427796 6688300.083681107, 355665.02177530347 6688300.083674032), (355664.9322527405 6688300.070743318, 355664.8892510785 6688300.367386661), (355641.49218732107 6688297.863559075, 355641.3985658159 6688297.854726692), (355641.3985658159 6688297.854726692, 355641.21122377727 6688297.837052585), (355641.21122377727 6688297.837052585, 355641.117602279 6688297.828220203), (355641.117602279 6688297.828220203, 355640.9302602412 6688297.8105460955), (355640.9302602412 6688297.8105460955, 355640.83663874224 6688297.801713713), (355640.83663874224 6688297.801713713, 355640.7429182017 6688297.792871987, 355640.71480386355 6688298.09122079, 355640.8084335088 6688298.100066427), (355640.8084335088 6688298.100066427, 355640.90215285454 6688298.108920539), (355640.90215285454 6688298.108920539, 355640.9957731856 6688298.117765295), (355640.9957731856 6688298.117765295, 355641.0893935346 6688298.126610055), (355641.0893935346 6688298.126610055, 355641.1831128924 6688298.135464167), (355641.1831128924 6688298.135464167, 355641.276733223 6688298.144308925), (355641.276733223 6688298.144308925, 355641.37035356055 6688298.153153683), (355641.37035356055 6688298.153153683, 355641.46407293 6688298.162007797, 355641.49218732107 6688297.863559075), (355641.3985661454 6688297.854723207, 355641.3985658159 6688297.854726692), (355641.3985658159 6688297.854726692, 355641.37035356055 6688298.153153683), (355641.37035356055 6688298.153153683, 355641.3703518399 6688298.153171883), (355641.2767306714 6688298.144336011, 355641.276733223 6688298.144308925), (355641.276733223 6688298.144308925, 355641.30484506267 6688297.845887293), (355641.21122388676 6688297.837051422, 355641.21122377727 6688297.837052585), (355641.21122377727 6688297.837052585, 355641.1831128924 6688298.135464167), (355641.1831128924 6688298.135464167, 355641.18310950324 6688298.135500145), (355641.089388413 6688298.126664231, 355641.0893935346 6688298.126610055), (355641.0893935346 6688298.126610055, 355641.117602279 6688297.828220203), (355641.117602279 6688297.828220203, 355641.1176027185 6688297.828215553), (355641.02388162835 6688297.819379639, 355640.9957731856 6688298.117765295), (355640.9957731856 6688298.117765295, 355640.9957672447 6688298.117828362), (355640.9021460763 6688298.108992493, 355640.90215285454 6688298.108920539), (355640.90215285454 6688298.108920539, 355640.9302602412 6688297.8105460955), (355640.9302602412 6688297.8105460955, 355640.9302604601 6688297.810543771), (355640.8366392918 6688297.8017079, 355640.83663874224 6688297.801713713), (355640.83663874224 6688297.801713713, 355640.8084335088 6688298.100066427), (355640.8084335088 6688298.100066427, 355640.8084249862 6688298.100156578), (355640.66198529146 6688297.7875391375, 355640.56815821386 6688297.779269096), (355640.56815821386 6688297.779269096, 355640.4742406653 6688297.77099108), (355640.4742406653 6688297.77099108, 355640.2864960389 6688297.754443023), (355640.2864960389 6688297.754443023, 355640.1926776525 6688297.746173748), (355640.1926776525 6688297.746173748, 355640.0987514127 6688297.737894966), (355640.0987514127 6688297.737894966, 355640.00493301963 6688297.72962569), (355640.00493301963 6688297.72962569, 355639.9110154778 6688297.721347675, 355639.8846996114 6688298.0198971415, 355639.97862584464 6688298.028175923), (355639.97862584464 6688298.028175923, 355640.07244423777 6688298.0364451995), (355640.07244423777 6688298.0364451995, 355640.26018886385 6688298.052993257), (355640.26018886385 6688298.052993257, 355640.3541064062 6688298.061271273), (355640.3541064062 6688298.061271273, 355640.4479334902 6688298.069541315), (355640.4479334902 6688298.069541315, 355640.54185103206 6688298.07781933), (355640.54185103206 6688298.07781933, 355640.6356694255 6688298.086088606, 355640.66198529146 6688297.7875391375), (355640.5681640579 6688297.779202774, 355640.56815821386 6688297.779269096), (355640.56815821386 6688297.779269096, 355640.54185103206 6688298.07781933), (355640.54185103206 6688298.07781933, 355640.54184813873 6688298.077852165), (355640.4479269376 6688298.069615678, 355640.4479334902 6688298.069541315), (355640.4479334902 6688298.069541315, 355640.4742406653 6688297.77099108), (355640.4742406653 6688297.77099108, 355640.47424284945 6688297.770966293), (355640.3804215702 6688297.762729851, 355640.3541064062 6688298.061271273), (355640.3541064062 6688298.061271273, 355640.3541056967 6688298.061279321), (355640.2601844955 6688298.053042832, 355640.26018886385 6688298.052993257), (355640.26018886385 6688298.052993257, 355640.2864960389 6688297.754443023), (355640.2864960389 6688297.754443023, 355640.28650040744 6688297.754393446), (355640.1926791282 6688297.746157006, 355640.1926776525 6688297.746173748), (355640.1926776525 6688297.746173748, 355640.1663632546 6688298.044706473), (355640.0724420535 6688298.036469988, 355640.07244423777 6688298.0364451995), (355640.07244423777 6688298.0364451995, 355640.0987514127 6688297.737894966), (355640.0987514127 6688297.737894966, 355640.0987579655 6688297.737820601), (355640.0049366789 6688297.729584162, 355640.00493301963 6688297.72962569), (355640.00493301963 6688297.72962569, 355639.97862584464 6688298.028175923), (355639.97862584464 6688298.028175923, 355639.9786207668 6688298.02823355), (355690.74444579525 6688295.467653984, 355690.652017449 6688295.469758216), (355690.652017449 6688295.469758216, 355690.5594915651 6688295.471864669), (355690.5594915651 6688295.471864669, 355690.46696335776 6688295.473971173), (355690.46696335776 6688295.473971173, 355690.37443747325 6688295.476077626), (355690.37443747325 6688295.476077626, 355690.2820091275 6688295.478181858), (355690.2820091275 6688295.478181858, 355690.18948324304 6688295.48028831), (355690.18948324304 6688295.48028831, 355690.09695503593 6688295.482394815), (355690.09695503593 6688295.482394815, 355690.0044291513 6688295.484501268, 355689.99767193146 6688295.184837528, 355690.09010027733 6688295.1827332955), (355690.09010027733 6688295.1827332955, 355690.1826261544 6688295.180626843), (355690.1826261544 6688295.180626843, 355690.27515436895 6688295.178520338), (355690.27515436895 6688295.178520338, 355690.3676802533 6688295.176413885), (355690.3676802533 6688295.176413885, 355690.4601085917 6688295.174309653), (355690.4601085917 6688295.174309653, 355690.5526344761 6688295.172203201), (355690.5526344761 6688295.172203201, 355690.73768856766 6688295.167990243, 355690.74444579525 6688295.467653984), (355690.65201863146 6688295.469809889, 355690.652017449 6688295.469758216), (355690.652017449 6688295.469758216, 355690.64516148943 6688295.170146102), (355690.55263444956 6688295.172202041, 355690.5526344761 6688295.172203201), (355690.5526344761 6688295.172203201, 355690.5594915651 6688295.471864669), (355690.5594915651 6688295.471864669, 355690.55949159164 6688295.471865827), (355690.46696451324 6688295.474021685, 355690.46696335776 6688295.473971173), (355690.46696335776 6688295.473971173, 355690.4601085917 6688295.174309653), (355690.4601085917 6688295.174309653, 355690.4601074097 6688295.17425798), (355690.3676802533 6688295.176413884, 355690.3676802533 6688295.176413885), (355690.3676802533 6688295.176413885, 355690.37443747325 6688295.476077626), (355690.37443747325 6688295.476077626, 355690.3744374733 6688295.476077627), (355690.2820103096 6688295.478233533, 355690.2820091275 6688295.478181858), (355690.2820091275 6688295.478181858, 355690.27515436895 6688295.178520338), (355690.27515436895 6688295.178520338, 355690.27515321336 6688295.178469821), (355690.1826261278 6688295.180625682, 355690.1826261544 6688295.180626843), (355690.1826261544 6688295.180626843, 355690.18948324304 6688295.48028831), (355690.18948324304 6688295.48028831, 355690.1894832696 6688295.48028947), (355690.0969561914 6688295.482445329, 355690.09695503593 6688295.482394815), (355690.09695503593 6688295.482394815, 355690.09010027733 6688295.1827332955), (355690.09010027733 6688295.1827332955, 355690.09009909537 6688295.182681624), (355689.1185744794 6688302.382185689, 355689.02624870086 6688302.373787265), (355689.02624870086 6688302.373787265, 355688.8416061317 6688302.356991236), (355688.8416061317 6688302.356991236, 355688.7492803525 6688302.348592812), (355688.7492803525 6688302.348592812, 355688.56463779183 6688302.331796783), (355688.56463779183 6688302.331796783, 355688.4723120253 6688302.323398361), (355688.4723120253 6688302.323398361, 355688.3799952142 6688302.315000753, 355688.3528799993 6688302.613549857, 355688.6298480379 6688302.638747675), (355688.6298480379 6688302.638747675, 355688.90671698545 6688302.663936479), (355688.90671698545 6688302.663936479, 355689.09135935054 6688302.680734752, 355689.1185744794 6688302.382185689), (355689.0262520885 6688302.373750104, 355689.02624870086 6688302.373787265), (355689.02624870086 6688302.373787265, 355688.9990369594 6688302.6722991625), (355688.90671452257 6688302.663963497, 355688.90671698545 6688302.663936479), (355688.90671698545 6688302.663936479, 355688.9339296517 6688302.365414437), (355688.8416072608 6688302.3569788495, 355688.8416061317 6688302.356991236), (355688.8416061317 6688302.356991236, 355688.81439213164 6688302.655527909), (355688.72206974064 6688302.647092321, 355688.7492803525 6688302.348592812), (355688.7492803525 6688302.348592812, 355688.74928486964 6688302.348543259), (355688.6569624329 6688302.3402075935, 355688.6298480379 6688302.638747675), (355688.6298480379 6688302.638747675, 355688.6298472182 6688302.638756701), (355688.53752482706 6688302.6303211115, 355688.56463779183 6688302.331796783), (355688.56463779183 6688302.331796783, 355688.5646400421 6688302.331772007), (355688.4723176511 6688302.323336419, 355688.4723120253 6688302.323398361), (355688.4723120253 6688302.323398361, 355688.4452024361 6688302.621885523), (355676.2992437669 6688309.078360105, 355675.1101309443 6688308.9886363195), (355675.1101309443 6688308.9886363195, 355674.8128794448 6688308.966207388), (355674.8128794448 6688308.966207388, 355674.5156279459 6688308.943778456), (355674.5156279459 6688308.943778456, 355674.21827709756 6688308.921342028), (355674.21827709756 6688308.921342028, 355673.9210255888 6688308.898913097, 355673.9134859392 6688308.99853007, 355674.50809590373 6688309.043394131), (355674.50809590373 6688309.043394131, 355674.8053474736 6688309.065822131), (355674.8053474736 6688309.065822131, 355675.10259904363 6688309.088250131), (355675.10259904363 6688309.088250131, 355675.399949938 6688309.110685625), (355675.399949938 6688309.110685625, 355675.6972015435 6688309.133113628), (355675.6972015435 6688309.133113628, 355675.9944531124 6688309.155541629), (355675.9944531124 6688309.155541629, 355676.2918040394 6688309.177977125, 355676.2992437669 6688309.078360105), (355676.0019914693 6688309.055941732, 355675.9944531124 6688309.155541629), (355675.9944531124 6688309.155541629, 355675.9944518198 6688309.155558707), (355675.6971995223 6688309.133140333, 355675.6972015435 6688309.133113628), (355675.6972015435 6688309.133113628, 355675.7047391717 6688309.033523357), (355675.4073869522 6688309.011104933, 355675.399949938 6688309.110685625), (355675.399949938 6688309.110685625, 355675.39994722465 6688309.110721957), (355675.10259500536 6688309.08830354, 355675.10259904363 6688309.088250131), (355675.10259904363 6688309.088250131, 355675.1101309443 6688308.9886363195), (355675.1101309443 6688308.9886363195, 355675.1101347005 6688308.988586641), (355674.81288240285 6688308.966168266, 355674.8128794448 6688308.966207388), (355674.8128794448 6688308.966207388, 355674.8053474736 6688309.065822131), (355674.8053474736 6688309.065822131, 355674.8053427077 6688309.065885162), (355674.5080904102 6688309.043466786, 355674.50809590373 6688309.043394131), (355674.50809590373 6688309.043394131, 355674.5156279459 6688308.943778456), (355674.5156279459 6688308.943778456, 355674.5156301056 6688308.9437498925), (355674.2182778862 6688308.921331469, 355674.21827709756 6688308.921342028), (355674.21827709756 6688308.921342028, 355674.2108381584 6688309.02094849), (355664.86472640384 6688308.315926638, 355664.3951264094 6688308.271101114), (355664.3951264094 6688308.271101114, 355663.92541799025 6688308.22626524), (355663.92541799025 6688308.22626524, 355663.4558179934 6688308.181439716), (355663.4558179934 6688308.181439716, 355662.9861095785 6688308.1366038425), (355662.9861095785 6688308.1366038425, 355662.04680116655 6688308.046942445), (355662.04680116655 6688308.046942445, 355661.10759176675 6688307.957290499, 355661.1265678178 6688307.758358095, 355661.5961678193 6688307.803183619), (355661.5961678193 6688307.803183619, 355662.06587622984 6688307.848019492), (355662.06587622984 6688307.848019492, 355662.53547623253 6688307.892845017), (355662.53547623253 6688307.892845017, 355663.0051846489 6688307.93768089), (355663.0051846489 6688307.93768089, 355663.47478464775 6688307.982506414), (355663.47478464775 6688307.982506414, 355664.8837024537 6688308.116994232, 355664.86472640384 6688308.315926638), (355664.39512202266 6688308.271147102, 355664.3951264094 6688308.271101114), (355664.3951264094 6688308.271101114, 355664.41409807274 6688308.072214691), (355663.94439381576 6688308.027335188, 355663.92541799025 6688308.22626524), (355663.92541799025 6688308.22626524, 355663.92541776557 6688308.226267596), (355663.4558133847 6688308.181488055, 355663.4558179934 6688308.181439716), (355663.4558179934 6688308.181439716, 355663.47478464775 6688307.982506414), (355663.47478464775 6688307.982506414, 355663.47478948056 6688307.982455725), (355663.0051850998 6688307.937676188, 355663.0051846489 6688307.93768089), (355663.0051846489 6688307.93768089, 355662.9861095785 6688308.1366038425), (355662.9861095785 6688308.1366038425, 355662.98610912747 6688308.136608547), (355662.5165047925 6688308.09172909, 355662.53547623253 6688307.892845017), (355662.53547623253 6688307.892845017, 355662.5354808431 6688307.892796682), (355662.065876455 6688307.848017144, 355662.06587622984 6688307.848019492), (355662.06587622984 6688307.848019492, 355662.04680116655 6688308.046942445), (355662.04680116655 6688308.046942445, 355662.0468004898 6688308.046949502), (355661.57719614747 6688308.0020700395, 355661.5961678193 6688307.803183619), (355661.5961678193 6688307.803183619, 355661.5961722057 6688307.803137635), (355660.8317243598 6688307.93058535, 355660.3946182483 6688308.036973493), (355660.3946182483 6688308.036973493, 355659.9575121436 6688308.143361635), (355659.9575121436 6688308.143361635, 355659.0833229431 6688308.356132316), (355659.0833229431 6688308.356132316, 355658.6462168313 6688308.46252046), (355658.6462168313 6688308.46252046, 355658.2091107344 6688308.568908599), (355658.2091107344 6688308.568908599, 355657.3348272048 6688308.781702241, 355657.287653904 6688308.5875357, 355657.7247600158 6688308.481147557), (355657.7247600158 6688308.481147557, 355658.1618661146 6688308.374759417), (355658.1618661146 6688308.374759417, 355659.036055321 6688308.161988732), (355659.036055321 6688308.161988732, 355659.47316143237 6688308.05560059), (355659.47316143237 6688308.05560059, 355660.78455105826 6688307.736418809, 355660.8317243598 6688307.93058535), (355660.39462468907 6688308.036999947, 355660.3946182483 6688308.036973493), (355660.3946182483 6688308.036973493, 355660.3473514731 6688307.842833361), (355659.91025180987 6688307.949247959, 355659.9575121436 6688308.143361635), (355659.9575121436 6688308.143361635, 355659.9575250256 6688308.143414545), (355659.5204254078 6688308.249729225, 355659.47316143237 6688308.05560059), (355659.47316143237 6688308.05560059, 355659.4731521921 6688308.055562637), (355659.036052521 6688308.161977232, 355659.036055321 6688308.161988732), (355659.036055321 6688308.161988732, 355659.0833229431 6688308.356132316), (355659.0833229431 6688308.356132316, 355659.0833257442 6688308.356143822), (355658.646226073 6688308.4625584185, 355658.6462168313 6688308.46252046), (355658.6462168313 6688308.46252046, 355658.5989528573 6688308.268391829), (355658.16185323935 6688308.374706507, 355658.1618661146 6688308.374759417), (355658.1618661146 6688308.374759417, 355658.2091107344 6688308.568908599), (355658.2091107344 6688308.568908599, 355658.20912640897 6688308.568973013), (355657.7720267907 6688308.675287691, 355657.7247600158 6688308.481147557), (355657.7247600158 6688308.481147557, 355657.72475357546 6688308.481121104), (355747.8973995596 6688315.965681122, 355748.2086416828 6688315.989980492), (355748.2086416828 6688315.989980492, 355748.51988379 6688316.014279861), (355748.51988379 6688316.014279861, 355749.45360245364 6688316.087177371), (355749.45360245364 6688316.087177371, 355749.7648445725 6688316.111476741), (355749.7648445725 6688316.111476741, 355750.3872218021 6688316.160067126, 355750.4028006833 6688315.960833397, 355750.09155855986 6688315.936534027), (355750.09155855986 6688315.936534027, 355748.84659778926 6688315.839337149), (355748.84659778926 6688315.839337149, 355747.91297844157 6688315.766447393, 355747.8973995596 6688315.965681122), (355748.2086398167 6688315.990004358, 355748.2086416828 6688315.989980492), (355748.2086416828 6688315.989980492, 355748.2242186986 6688315.790770631), (355748.53535904124 6688315.81509382, 355748.51988379 6688316.014279861), (355748.51988379 6688316.014279861, 355748.51988008135 6688316.014327596), (355748.83112038445 6688316.0385509115, 355748.84659778926 6688315.839337149), (355748.84659778926 6688315.839337149, 355748.8465993441 6688315.8393171355), (355749.15783960134 6688315.863640373, 355749.14236064156 6688316.062874146), (355749.4536008988 6688316.087197383, 355749.45360245364 6688316.087177371), (355749.45360245364 6688316.087177371, 355749.46907985845 6688315.887963607), (355749.78032012307 6688315.912286843, 355749.7648445725 6688316.111476741), (355749.7648445725 6688316.111476741, 355749.76484116353 6688316.111520618), (355750.07598154474 6688316.135743891, 355750.09155855986 6688315.936534027), (355750.09155855986 6688315.936534027, 355750.09156042605 6688315.936510161), (355817.3003175491 6688322.400950482, 355817.67010748695 6688322.431206182), (355817.67010748695 6688322.431206182, 355818.03999668645 6688322.461470002), (355818.03999668645 6688322.461470002, 355818.28649290995 6688322.481637982, 355818.2783537627 6688322.581254688, 355817.9085638252 6688322.550998989), (355817.9085638252 6688322.550998989, 355817.53867462534 6688322.520735168), (355817.53867462534 6688322.520735168, 355817.29217839433 6688322.5005671885, 355817.3003175491 6688322.400950482), (355817.423514502 6688322.411098836, 355817.41537539294 6688322.51061562), (355817.5386722678 6688322.520764022, 355817.53867462534 6688322.520735168), (355817.53867462534 6688322.520735168, 355817.546811415 6688322.421147316), (355817.6701083356 6688322.431195795, 355817.67010748695 6688322.431206182), (355817.67010748695 6688322.431206182, 355817.6619691809 6688322.530812501), (355817.7852661014 6688322.54086098, 355817.79340521037 6688322.441344193), (355817.9167021235 6688322.451392673, 355817.9085638252 6688322.550998989), (355817.9085638252 6688322.550998989, 355817.9085629762 6688322.551009379), (355818.03185988934 6688322.561057856, 355818.03999668645 6688322.461470002), (355818.03999668645 6688322.461470002, 355818.0399990439 6688322.461441149), (355818.16319599684 6688322.471589502, 355818.15505688795 6688322.5711062895), (355763.15550908115 6688300.919692437, 355762.8718408181 6688300.898839426), (355762.8718408181 6688300.898839426, 355762.77732027235 6688300.891891035), (355762.77732027235 6688300.891891035, 355762.6827997074 6688300.884942643), (355762.6827997074 6688300.884942643, 355762.58827916667 6688300.877994252), (355762.58827916667 6688300.877994252, 355762.493659249 6688300.871038556), (355762.493659249 6688300.871038556, 355762.3991386973 6688300.864090165, 355762.3772191834 6688301.163041336, 355762.84992853604 6688301.1977911275), (355762.84992853604 6688301.1977911275, 355762.9444490914 6688301.204739519), (355762.9444490914 6688301.204739519, 355763.0390690158 6688301.211695215), (355763.0390690158 6688301.211695215, 355763.13358956017 6688301.218643606, 355763.15550908115 6688300.919692437), (355763.0609877514 6688300.912754655, 355763.0390690158 6688301.211695215), (355763.0390690158 6688301.211695215, 355763.0390682378 6688301.211705826), (355762.9444469937 6688301.204767998, 355762.9444490914 6688301.204739519), (355762.9444490914 6688301.204739519, 355762.966466429 6688300.905816874), (355762.87184523814 6688300.898779123, 355762.8718408181 6688300.898839426), (355762.8718408181 6688300.898839426, 355762.84992853604 6688301.1977911275), (355762.84992853604 6688301.1977911275, 355762.8499256712 6688301.197830213), (355762.7554043947 6688301.190792511, 355762.77732027235 6688300.891891035), (355762.77732027235 6688300.891891035, 355762.77732391586 6688300.891841343), (355762.6828025861 6688300.884903559, 355762.6827997074 6688300.884942643), (355762.6827997074 6688300.884942643, 355762.6607831504 6688301.183854685), (355762.5662618281 6688301.176916901, 355762.58827916667 6688300.877994252), (355762.58827916667 6688300.877994252, 355762.58828126383 6688300.87796578), (355762.49366002687 6688300.871027947, 355762.493659249 6688300.871038556), (355762.493659249 6688300.871038556, 355762.4717405058 6688301.169979118))
-25279;24902;T17-ASSAINISSEMENT;43-50-14-C;ByBlock;T17_252;20220609;MULTILINESTRING ((355721.8062904658 6688347.702473212, 355721.8485745989 6688347.8201815635), (355721.8485745989 6688347.8201815635, 355721.94719811325 6688348.094724528, 355722.0413133295 6688347.818605781), (355722.0413133295 6688347.818605781, 355722.081671569 6688347.7002012655), (355721.846604308 6688347.820197672, 355721.8485745989 6688347.8201815635), (355721.8485745989 6688347.8201815635, 355722.0413133295 6688347.818605781), (355722.0413133295 6688347.818605781, 355722.0433479067 6688347.818589146), (355721.94776157185 6688348.173461897, 355721.9751821229 6688348.172038474, 355722.0023742958 6688348.168230822, 355722.02913117374 6688348.162067912, 355722.0552491527 6688348.1535966415, 355722.0805294894 6688348.142881473, 355722.10477981507 6688348.130003938, 355722.12781559874 6688348.115062033, 355722.14946155134 6688348.0981694525, 355722.16955295944 6688348.079454741, 355722.1879369391 6688348.059060308, 355722.20447359886 6688348.037141344, 355722.2190371038 6688348.013864635, 355722.2315166346 6688347.989407309, 355722.2418172289 6688347.963955472, 355722.249860505 6688347.937702791, 355722.25558525854 6688347.910849042, 355722.25894792675 6688347.883598562, 355722.2599229224 6688347.856158714, 355722.258502826 6688347.8287382955, 355722.25469844346 6688347.801545965, 355722.2485387244 6688347.774788638, 355722.24007054063 6688347.748669924, 355722.2293583299 6688347.723388568, 355722.216483606 6688347.699136948, 355722.20154433855 6688347.67609961, 355722.18465420674 6688347.654451846, 355722.1659417344 6688347.634358391, 355722.1455493129 6688347.615972141, 355722.12363211694 6688347.599433004, 355722.1003569238 6688347.584866834, 355722.0759008443 6688347.572384473, 355722.0504499749 6688347.562080902, 355722.0241979826 6688347.554034527, 355721.9973446299 6688347.548306578, 355721.9700942552 6688347.544940638, 355721.942654218 6688347.543962322, 355721.9152290868 6688347.545379476, 355721.8880318563 6688347.549181649, 355721.8612695464 6688347.555339909, 355721.83514586504 6688347.563807371, 355721.8098596606 6688347.574519589, 355721.7856034057 6688347.587395016, 355721.7625617342 6688347.602335655, 355721.74091003387 6688347.619227777, 355721.7208131128 6688347.637942804, 355721.70242394466 6688347.658338281, 355721.6858825033 6688347.680258964, 355721.671314699 6688347.703537994, 355721.6588314184 6688347.7279981775, 355721.6485276816 6688347.753453329, 355721.6404819185 6688347.77970969, 355721.6347553717 6688347.806567403, 355721.6313916302 6688347.833822034, 355721.63041629817 6688347.861266122, 355721.63183679973 6688347.888690774, 355721.6356423224 6688347.9158872375, 355721.64180389897 6688347.942648499, 355721.6502746293 6688347.968770856, 355721.6609900358 6688347.994055472, 355721.6738685552 6688348.0183098875, 355721.68881215906 6688348.041349481, 355721.70570709987 6688348.062998881, 355721.7244247771 6688348.083093299, 355721.7448227159 6688348.101479776, 355721.7667456514 6688348.118018362, 355721.790026711 6688348.1325831665, 355721.81448868464 6688348.145063326, 355721.83994537324 6688348.155363849, 355721.86620300537 6688348.163406322, 355721.89306171425 6688348.169129534, 355721.92031705694 6688348.172489919, 355721.94776157185 6688348.173461897), (355722.77639398456 6688348.840509002, 355722.81867811613 6688348.958217346), (355722.81867811613 6688348.958217346, 355722.91730163275 6688349.232760312, 355723.01141684945 6688348.956641566), (355723.01141684945 6688348.956641566, 355723.0517750883 6688348.838237054), (355722.81670781947 6688348.958233455, 355722.81867811613 6688348.958217346), (355722.81867811613 6688348.958217346, 355723.01141684945 6688348.956641566), (355723.01141684945 6688348.956641566, 355723.0134514261 6688348.956624932), (355722.9179650134 6688349.311497733, 355722.9453862174 6688349.310071108, 355722.97257875244 6688349.306260141, 355722.9993356872 6688349.300093831, 355723.02545340493 6688349.291619103, 355723.0507331535 6688349.280900447, 355723.07498255756 6688349.268019432, 355723.0980170828 6688349.25307408, 355723.11966143973 6688349.236178127, 355723.1397509176 6688349.217460144, 355723.1581326383 6688349.197062573, 355723.1746667199 6688349.175140639, 355723.1892273402 6688349.15186116, 355723.2017036949 6688349.127401296, 355723.2120008405 6688349.101947177, 355723.22004041757 6688349.07569251, 355723.22576124594 6688349.048837085, 355723.2291197907 6688349.021585275, 355723.23009049403 6688348.994144454, 355723.2286659687 6688348.966723446, 355723.2248570556 6688348.939530925, 355723.21869273967 6688348.912773816, 355723.2102199307 6688348.8866557395, 355723.1995031057 6688348.861375453, 355723.1866238176 6688348.837125331, 355723.17168007646 6688348.814089916, 355723.1547856019 6688348.792444504, 355723.1360689584 6688348.772353814, 355723.1156725775 6688348.753970735, 355723.0937516719 6688348.737435154, 355723.0704730572 6688348.72287291, 355723.04601388006 6688348.710394817, 355723.02056027186 6688348.700095834, 355722.9943059307 6688348.692054332, 355722.96745064785 6688348.686331505, 355722.94019878906 6688348.682970907, 355722.9127577367 6688348.681998108, 355722.88533363503 6688348.68342077, 355722.8581379005 6688348.6872282745, 355722.8313775294 6688348.6933916425, 355722.8052562042 6688348.70186396, 355722.7799727439 6688348.712580749, 355722.75571958936 6688348.725460432, 355722.7326813397 6688348.740404981, 355722.7110333472 6688348.757300645, 355722.69094038266 6688348.776018834, 355722.67255537986 6688348.796417063, 355722.65601827385 6688348.8183400845, 355722.6414549347 6688348.841621034, 355722.62897620845 6688348.866082706, 355722.61867707537 6688348.89153892, 355722.61063592555 6688348.917795918, 355722.6049139633 6688348.944653847, 355722.60155474016 6688348.971908286, 355722.60058382445 6688348.999351787, 355722.60200860625 6688349.026775473, 355722.605818241 6688349.053970608, 355722.61198373226 6688349.080730206, 355722.62045815226 6688349.106850582, 355722.63117699925 6688349.132132934, 355722.6440586883 6688349.156384825, 355722.65900517267 6688349.179421664, 355722.6759026891 6688349.201068113, 355722.6946226246 6688349.221159409, 355722.71502249566 6688349.239542631, 355722.73694703134 6688349.256077862, 355722.7602293567 6688349.270639242, 355722.7846922616 6688349.283115943, 355722.81014955055 6688349.293412998, 355722.8364074588 6688349.301452032, 355722.8632661286 6688349.30717186, 355722.89052112936 6688349.310528945, 355722.9179650134 6688349.311497733), (355723.7657629416 6688378.597497068, 355723.80801128584 6688378.715105792), (355723.80801128584 6688378.715105792, 355723.90667059476 6688378.989748398, 355724.000890128 6688378.713528866), (355724.000890128 6688378.713528866, 355724.0412439705 6688378.595225166), (355723.8060768236 6688378.715121607, 355723.80801128584 6688378.715105792), (355723.80801128584 6688378.715105792, 355724.000890128 6688378.713528866), (355724.000890128 6688378.713528866, 355724.0028204307 6688378.713513085), (355723.90733396803 6688379.068485816, 355723.9347541 6688379.067061821, 355723.96194581024 6688379.063253667, 355723.9887021914 6688379.057090333, 355724.01481964847 6688379.048618712, 355724.0400994484 6688379.037903271, 355724.0643492317 6688379.025025544, 355724.08738447673 6688379.010083522, 355724.10902990354 6688378.9931908995, 355724.1291208073 6688378.974476217, 355724.1475043121 6688378.954081879, 355724.1640405344 6688378.932163069, 355724.1786036463 6688378.908886575, 355724.1910828341 6688378.88442951, 355724.20138314104 6688378.858977973, 355724.2094261897 6688378.832725629, 355724.21515077935 6688378.805872243, 355724.2185133498 6688378.778622141, 355724.21948831517 6688378.751182681, 355724.21806825587 6688378.72376265, 355724.2142639783 6688378.696570697, 355724.2081044294 6688378.669813728, 355724.19963647897 6688378.643695346, 355724.1889245612 6688378.618414289, 355724.17605018505 6688378.594162924, 355724.16111131455 6688378.571125789, 355724.14422162296 6688378.549478177, 355724.12550962745 6688378.529384808, 355724.10511771106 6688378.510998577, 355724.0832010407 6688378.49445939, 355724.05992638436 6688378.479893096, 355724.0354708445 6688378.46741053, 355724.0100205078 6688378.457106681, 355723.9837690318 6688378.449059947, 355723.9569161689 6688378.443331563, 355723.92966624856 6688378.439965113, 355723.9022266212 6688378.438986215, 355723.8748010697 6688378.440402794, 355723.84760337527 6688378.44420447, 355723.82084056665 6688378.450362301, 355723.79471636185 6688378.458829415, 355723.76942961913 6688378.469541362, 355723.7451728201 6688378.482416595, 355723.72213060845 6688378.497357121, 355723.7004783805 6688378.514249199, 355723.6803809537 6688378.5329642575, 355723.661991309 6688378.553359828, 355723.645449429 6688378.575280667, 355723.6308812301 6688378.598559913, 355723.6183976054 6688378.623020359, 355723.60809358023 6688378.648475818, 355723.6000475886 6688378.674732518, 355723.5943208769 6688378.701590595, 355723.59095703677 6688378.728845605, 355723.5899816734 6688378.756290084, 355723.5914022118 6688378.783715123, 355723.59520783875 6688378.810911969, 355723.60136958543 6688378.83767359, 355723.6098405491 6688378.863796282, 355723.62055624847 6688378.8890812, 355723.6334351157 6688378.91333587, 355723.64837911696 6688378.93637567, 355723.6652744988 6688378.958025223, 355723.6839926533 6688378.978119731, 355723.70439109777 6688378.996506229, 355723.72631455946 6688379.013044765, 355723.7495961572 6688379.027609445, 355723.7740586715 6688379.040089405, 355723.79951589357 6688379.0503896475, 355723.8257740432 6688379.058431766, 355723.8526332436 6688379.064154544, 355723.8798890419 6688379.067514419, 355723.90733396803 6688379.068485816), (355699.68885713234 6688370.819871103, 355699.74251590914 6688370.969354581), (355699.74251590914 6688370.969354581, 355699.86768592475 6688371.318055212, 355699.9873206184 6688370.967312448), (355699.9873206184 6688370.967312448, 355700.0385791313 6688370.817033696), (355699.7400477146 6688370.969375171, 355699.74251590914 6688370.969354581), (355699.74251590914 6688370.969354581, 355699.9873206184 6688370.967312448), (355699.9873206184 6688370.967312448, 355699.98984916747 6688370.967291355), (355699.8685394358 6688371.417975805, 355699.903361958 6688371.416170322, 355699.93789461197 6688371.411336772, 355699.9718745834 6688371.403511932, 355700.00504326535 6688371.392755355, 355700.03714822466 6688371.379148904, 355700.067945124 6688371.362796136, 355700.09719958086 6688371.343821501, 355700.124688952 6688371.322369408, 355700.1502040271 6688371.298603121, 355700.1735506219 6688371.272703515, 355700.194551055 6688371.244867701, 355700.2130455009 6688371.215307526, 355700.22889320616 6688371.1842479585, 355700.24197356036 6688371.151925383, 355700.2521870147 6688371.1185857905, 355700.2594558383 6688371.084482913, 355700.263724712 6688371.049876299, 355700.2649611464 6688371.015029319, 355700.2631557318 6688370.980207183, 355700.2583222088 6688370.945674907, 355700.25049736275 6688370.9116953, 355700.2397407456 6688370.878526966, 355700.2261342216 6688370.846422341, 355700.2097813439 6688370.815625752, 355700.1908065677 6688370.786371583, 355700.16935430234 6688370.758882476, 355700.14558781136 6688370.733367637, 355700.119687972 6688370.710021248, 355700.09185189736 6688370.689020994, 355700.0622914358 6688370.670526694, 355700.0312315598 6688370.654679105, 355699.9989086528 6688370.641598827, 355699.9655687115 6688370.6313854195, 355699.93146547175 6688370.624116608, 355699.8968584794 6688370.619847711, 355699.8620111136 6688370.618611218, 355699.82718848385 6688370.620416549, 355699.7926557117 6688370.625249974, 355699.75867561286 6688370.6330747055, 355699.72550679743 6688370.643831193, 355699.6934017007 6688370.657437572, 355699.6626046625 6688370.673790295, 355699.6333500677 6688370.692764899, 355699.60586056206 6688370.714216981, 355699.5803453575 6688370.737983273, 355699.5569986412 6688370.763882905, 355699.53599809634 6688370.79171876, 355699.51750354975 6688370.821278989, 355699.5016557566 6688370.852338621, 355699.48857532867 6688370.884661277, 355699.478361816 6688370.918000955, 355699.4710929502 6688370.952103925, 355699.46682405163 6688370.986710637, 355699.4655876092 6688371.021557715, 355699.4673930332 6688371.05637995, 355699.4722265831 6688371.090912325, 355699.48005147255 6688371.124892023, 355699.4908081493 6688371.158060443, 355699.5044147482 6688371.190165147, 355699.52076771477 6688371.220961799, 355699.5397425925 6688371.250216022, 355699.5611949707 6688371.2777051665, 355699.58496158355 6688371.303220029, 355699.61086155195 6688371.32656642, 355699.63869776094 6688371.347566662, 355699.66825836006 6688371.366060929, 355699.6993183743 6688371.381908471, 355699.7316414175 6688371.394988674, 355699.7649814909 6688371.405201992, 355699.7990848561 6688371.412470694, 355699.8336919649 6688371.41673946, 355699.8685394358 6688371.417975805), (355740.833108207 6688287.024059636, 355740.87535139394 6688287.141767441), (355740.87535139394 6688287.141767441, 355740.97391588736 6688287.416410787, 355741.0681115163 6688287.14019148), (355741.0681115163 6688287.14019148, 355741.1084892884 6688287.021787682), (355740.87332212017 6688287.141784032, 355740.87535139394 6688287.141767441), (355740.87535139394 6688287.141767441, 355741.0681115163 6688287.14019148), (355741.0681115163 6688287.14019148, 355741.0700657108 6688287.140175503), (355740.9745793161 6688287.49504828, 355741.0020021556 6688287.493627988, 355741.0291968556 6688287.489823073, 355741.0559564482 6688287.48366249, 355741.0820772765 6688287.475193123, 355741.10736054525 6688287.46447943, 355741.1316138337 6688287.451602949, 355741.1546525592 6688287.436661675, 355741.17630138394 6688287.419769325, 355741.19639554684 6688287.40105446, 355741.2147821191 6688287.380659504, 355741.2313211676 6688287.35873968, 355741.2458868209 6688287.335461816, 355741.258368225 6688287.31100306, 355741.26867038896 6688287.285549567, 355741.2767149074 6688287.25929505, 355741.2824405562 6688287.232439319, 355741.28580376034 6688287.205186768, 355741.28677892307 6688287.177744802, 355741.28535862314 6688287.150322266, 355741.2815536703 6688287.123127874, 355741.2753930222 6688287.096368583, 355741.2669235649 6688287.07024805, 355741.25620975613 6688287.044965066, 355741.2433331346 6688287.020712053, 355741.2283916991 6688286.997673586, 355741.21149916307 6688286.976025008, 355741.192784089 6688286.955931075, 355741.1723889097 6688286.937544713, 355741.15046884486 6688286.921005853, 355741.1271907192 6688286.906440368, 355741.1027316938 6688286.893959108, 355741.07727791596 6688286.883657063, 355741.051023105 6688286.87561264, 355741.0241670756 6688286.86988706, 355740.9969142184 6688286.8665239, 355740.9694719437 6688286.865548753, 355740.94204910414 6688286.866969042, 355740.9148544044 6688286.870773958, 355740.8880948117 6688286.87693454, 355740.86197398376 6688286.88540391, 355740.8366907149 6688286.8961176025, 355740.81243742676 6688286.908994083, 355740.78939870105 6688286.923935356, 355740.76774987625 6688286.940827704, 355740.74765571376 6688286.9595425725, 355740.7292691414 6688286.979937527, 355740.71273009287 6688287.001857351, 355740.6981644397 6688287.025135217, 355740.6856830357 6688287.04959397, 355740.6753808715 6688287.075047464, 355740.66733635333 6688287.101301981, 355740.6616107044 6688287.128157711, 355740.6582475005 6688287.155410265, 355740.65727233764 6688287.182852232, 355740.65869263746 6688287.210274763, 355740.6624975903 6688287.237469157, 355740.6686582384 6688287.264228448, 355740.6771276958 6688287.290348982, 355740.68784150435 6688287.315631965, 355740.7007181258 6688287.339884979, 355740.7156595611 6688287.362923442, 355740.73255209695 6688287.384572022, 355740.75126717106 6688287.404665956, 355740.7716623504 6688287.423052319, 355740.79358241515 6688287.439591178, 355740.81686054077 6688287.454156664, 355740.84131956624 6688287.466637923, 355740.86677334376 6688287.476939967, 355740.8930281546 6688287.484984391, 355740.919884184 6688287.490709972, 355740.94713704154 6688287.494073131, 355740.9745793161 6688287.49504828), (355669.83468002337 6688270.313260065, 355669.8769641402 6688270.430968394), (355669.8769641402 6688270.430968394, 355669.97558763094 6688270.7055113455, 355670.06970314647 6688270.429391778), (355670.06970314647 6688270.429391778, 355670.1100610973 6688270.310988135), (355669.8749938463 6688270.430984511, 355669.8769641402 6688270.430968394), (355669.8769641402 6688270.430968394, 355670.06970314647 6688270.429391778), (355670.06970314647 6688270.429391778, 355670.0716375099 6688270.429375955), (355669.9761510847 6688270.784248711, 355670.0035718766 6688270.782825623, 355670.0307643162 6688270.779018263, 355670.0575214806 6688270.772855601, 355670.0836397602 6688270.764384534, 355670.1089204068 6688270.753669521, 355670.1331710456 6688270.740792103, 355670.15620714077 6688270.725850267, 355670.17785339727 6688270.708957713, 355670.19794509705 6688270.690242988, 355670.2163293516 6688270.669848506, 355670.2328662646 6688270.647929452, 355670.2474299978 6688270.624652625, 355670.25990972784 6688270.600195155, 355670.27021048946 6688270.574743141, 355670.2782538983 6688270.54849027, 355670.2839787478 6688270.521636315, 355670.28734147456 6688270.494385617, 355670.2883164897 6688270.466945548, 355670.2868963736 6688270.439524909, 355670.2830919328 6688270.412332362, 355670.2769321175 6688270.385574829, 355670.2684638011 6688270.359455925, 355670.2577514236 6688270.334174398, 355670.2448765013 6688270.309922634, 355670.2299370067 6688270.286885176, 355670.21304662264 6688270.2652373295, 355670.19433387724 6688270.245143823, 355670.1739411661 6688270.226757561, 355670.15202366863 6688270.210218452, 355670.12874816754 6688270.195652357, 355670.1042917782 6688270.183170112, 355670.0788406029 6688270.1728667, 355670.0525883142 6688270.16482053, 355670.0257346796 6688270.15909283, 355669.99848404335 6688270.155727181, 355669.971043771 6688270.1547492, 355669.94361888303 6688270.156166683, 355669.9164219209 6688270.159969147, 355669.8896598984 6688270.166127649, 355669.8635365191 6688270.174595309, 355669.83825062495 6688270.185307678, 355669.8139946839 6688270.198183216, 355669.79095332365 6688270.213123919, 355669.7693019269 6688270.230016064, 355669.74920529703 6688270.248731071, 355669.73081640253 6688270.26912649, 355669.7142752134 6688270.291047078, 355669.6997076352 6688270.314325981, 355669.68722455186 6688270.33878601, 355669.6769209803 6688270.364240985, 355669.6688753471 6688270.390497149, 355669.6631488935 6688270.417354646, 355669.65978520724 6688270.444609055, 355669.6588098913 6688270.47205292, 355669.6602303696 6688270.4994773455, 355669.6640358302 6688270.526673585, 355669.6701973065 6688270.553434636, 355669.6786679002 6688270.579556799, 355669.68938313576 6688270.604841239, 355669.70226145245 6688270.629095503, 355669.71720482485 6688270.652134978, 355669.73409950937 6688270.67378429, 355669.7528169096 6688270.693878657, 355669.7732145547 6688270.712265121, 355669.7951371846 6688270.728803736, 355669.81841793255 6688270.743368614, 355669.84287959285 6688270.755848894, 355669.86833597184 6688270.766149574, 355669.8945933044 6688270.774192253, 355669.9214517287 6688270.7799157165, 355669.9487068077 6688270.783276399, 355669.9761510847 6688270.784248711), (355659.4228858268 6688295.419532479, 355659.46515919594 6688295.537240909), (355659.46515919594 6688295.537240909, 355659.5637933871 6688295.8118836945, 355659.65791889763 6688295.535664969), (355659.65791889763 6688295.535664969, 355659.69826690975 6688295.417260549), (355659.46319964936 6688295.53725693, 355659.46515919594 6688295.537240909), (355659.46515919594 6688295.537240909, 355659.65791889763 6688295.535664969), (355659.65791889763 6688295.535664969, 355659.65994324104 6688295.535648419), (355659.5643568854 6688295.890521141, 355659.59177972627 6688295.889100852, 355659.61897442787 6688295.885295941, 355659.6457340222 6688295.879135358, 355659.6718548527 6688295.870665996, 355659.69713812385 6688295.8599523045, 355659.72139141476 6688295.8470758265, 355659.7444301431 6688295.832134557, 355659.7660789706 6688295.81524221, 355659.78617313615 6688295.796527343, 355659.8045597115 6688295.776132389, 355659.82109876344 6688295.75421257, 355659.83566441986 6688295.7309347065, 355659.8481458272 6688295.706475953, 355659.8584479943 6688295.681022459, 355659.86649251584 6688295.654767942, 355659.872218168 6688295.627912212, 355659.87558137486 6688295.60065966, 355659.8765565407 6688295.57321769, 355659.87513624394 6688295.5457951585, 355659.87133129383 6688295.518600766, 355659.8651706481 6688295.4918414755, 355659.85670119326 6688295.465720939, 355659.84598738694 6688295.440437954, 355659.8331107677 6688295.41618494, 355659.818169334 6688295.393146474, 355659.80127679976 6688295.371497892, 355659.78256172675 6688295.351403954, 355659.7621665486 6688295.333017591, 355659.7402464847 6688295.316478731, 355659.71696835954 6688295.301913243, 355659.6925093345 6688295.28943198, 355659.6670555567 6688295.279129934, 355659.64080074534 6688295.271085507, 355659.61394471524 6688295.265359925, 355659.586691857 6688295.261996761, 355659.5592495813 6688295.26102161, 355659.5318267405 6688295.262441899, 355659.5046320386 6688295.266246808, 355659.4778724444 6688295.272407389, 355659.4517516139 6688295.280876753, 355659.4264683427 6688295.291590445, 355659.4022150518 6688295.304466923, 355659.37917632324 6688295.319408192, 355659.35752749577 6688295.336300541, 355659.3374333301 6688295.355015406, 355659.31904675486 6688295.375410361, 355659.30250770284 6688295.397330178, 355659.2879420466 6688295.420608045, 355659.2754606392 6688295.445066797, 355659.2651584717 6688295.47052029, 355659.25711395015 6688295.496774807, 355659.25138829794 6688295.523630534, 355659.24802509113 6688295.550883088, 355659.2470499251 6688295.5783250565, 355659.2484702219 6688295.605747589, 355659.25227517216 6688295.632941984, 355659.2584358177 6688295.659701275, 355659.26690527267 6688295.685821812, 355659.27761907893 6688295.7111047935, 355659.2904956984 6688295.735357809, 355659.3054371322 6688295.758396277, 355659.32232966635 6688295.780044857, 355659.34104473935 6688295.800138792, 355659.3614399174 6688295.818525157, 355659.38335998164 6688295.835064018, 355659.40663810645 6688295.8496295065, 355659.4310971319 6688295.862110771, 355659.4565509095 6688295.872412816, 355659.48280572105 6688295.880457242, 355659.50966175116 6688295.886182826, 355659.5369146096 6688295.889545988, 355659.5643568854 6688295.890521141), (355743.0455833044 6688310.929379742, 355743.1126536772 6688311.116134452), (355743.1126536772 6688311.116134452, 355743.2692192482 6688311.552084883, 355743.41869553085 6688311.113630434), (355743.41869553085 6688311.113630434, 355743.48273579066 6688310.925782995), (355743.10954660433 6688311.116159874, 355743.1126536772 6688311.116134452), (355743.1126536772 6688311.116134452, 355743.41869553085 6688311.113630434), (355743.41869553085 6688311.113630434, 355743.4217983737 6688311.113605047), (355743.270261168 6688311.676985603, 355743.31379147765 6688311.67472863, 355743.356959407 6688311.668686197, 355743.39943639026 6688311.658904288, 355743.4408991222 6688311.64545736, 355743.4810320155 6688311.62844776, 355743.51952960575 6688311.608004952, 355743.5560988754 6688311.584284539, 355743.5904614836 6688311.557467059, 355743.62235588534 6688311.527756629, 355743.65153932176 6688311.495379388, 355743.6777896684 6688311.460581768, 355743.70090712496 6688311.4236286245, 355743.72071573714 6688311.384801223, 355743.7370647347 6688311.344395084, 355743.74982968066 6688311.302717762, 355743.75891341665 6688311.260086471, 355743.764246803 6688311.216825691, 355743.76578924607 6688311.173264696, 355743.7635290054 6688311.129735042, 355743.75748328463 6688311.086568047, 355743.74769809964 6688311.044092272, 355743.73424792883 6688311.002631012, 355743.7172351457 6688310.962499844, 355743.69678924046 6688310.924004215, 355743.67306583293 6688310.887437134, 355743.6462454904 6688310.853076921, 355743.61653235106 6688310.821185103, 355743.584152571 6688310.7920044195, 355743.5493526039 6688310.765756975, 355743.51239732344 6688310.742642544, 355743.4735680083 6688310.722837063, 355743.4331602013 6688310.706491279, 355743.39148145943 6688310.693729597, 355743.34884901304 6688310.684649156, 355743.30558735214 6688310.6793190725, 355743.2620257549 6688310.677779912, 355743.21849991387 6688310.680042992, 355743.1753369189 6688310.686090769, 355743.1328652346 6688310.695877212, 355743.09140806604 6688310.709327853, 355743.0512808973 6688310.726340338, 355743.0127890909 6688310.746785194, 355742.9762255651 6688310.770506845, 355742.9418685637 6688310.797324771, 355742.90997953975 6688310.8270348925, 355742.8808011646 6688310.859411115, 355742.8545554821 6688310.8942070585, 355742.831442219 6688310.931157936, 355742.81163726444 6688310.9699825505, 355742.79529133165 6688311.010385455, 355742.782528811 6688311.052059185, 355742.7734468244 6688311.094686612, 355742.768114484 6688311.13794334, 355742.7665723686 6688311.1815002, 355742.7688322134 6688311.225025722, 355742.7748768214 6688311.268188687, 355742.78466019366 6688311.310660625, 355742.79810788 6688311.352118331, 355742.8151175452 6688311.392246321, 355742.83555974753 6688311.43073922, 355742.85927892465 6688311.467304106, 355742.8860945761 6688311.501662723, 355742.9158026381 6688311.533553604, 355742.94817703596 6688311.5627340665, 355742.98297140445 6688311.588982048, 355743.0199209624 6688311.61209781, 355743.05874452804 6688311.631905436, 355743.09914665914 6688311.6482542, 355743.1408198999 6688311.661019685, 355743.18344712217 6688311.670104749, 355743.22670393804 6688311.675440255, 355743.270261168 6688311.676985603), (355719.7275373691 6688318.718369677, 355719.7698107474 6688318.836078104), (355719.7698107474 6688318.836078104, 355719.8684449651 6688319.110720894, 355719.96266449697 6688318.834501381), (355719.96266449697 6688318.834501381, 355720.00301833777 6688318.716197692), (355719.76785120217 6688318.836094124, 355719.7698107474 6688318.836078104), (355719.7698107474 6688318.836078104, 355719.96266449697 6688318.834501381), (355719.96266449697 6688318.834501381, 355719.96459480084 6688318.8344856), (355719.8691083456 6688319.18945831, 355719.89653118583 6688319.188038021, 355719.92372588656 6688319.184233105, 355719.95048548 6688319.178072522, 355719.9766063092 6688319.169603155, 355720.00188957894 6688319.158889464, 355720.0261428681 6688319.1460129805, 355720.04918159486 6688319.131071711, 355720.0708304202 6688319.114179358, 355720.09092458396 6688319.09546449, 355720.1093111569 6688319.075069535, 355720.12585020665 6688319.053149712, 355720.140415861 6688319.029871846, 355720.15289726586 6688319.00541309, 355720.16319943086 6688318.979959598, 355720.1712439499 6688318.953705077, 355720.1769695998 6688318.926849348, 355720.1803328048 6688318.899596795, 355720.18130796833 6688318.872154826, 355720.17988766934 6688318.844732293, 355720.17608271714 6688318.817537898, 355720.1699220698 6688318.790778607, 355720.1614526131 6688318.76465807, 355720.1507388049 6688318.739375086, 355720.13786218414 6688318.715122071, 355720.1229207492 6688318.692083607, 355720.10602821334 6688318.670435025, 355720.08731313964 6688318.650341091, 355720.0669179605 6688318.631954728, 355720.0449978959 6688318.6154158665, 355720.0217197701 6688318.600850378, 355719.99726074457 6688318.588369116, 355719.9718069668 6688318.578067072, 355719.9455521555 6688318.570022646, 355719.91869612556 6688318.564297065, 355719.8914432674 6688318.560933902, 355719.8640009922 6688318.559958755, 355719.83657815115 6688318.561379042, 355719.80938344967 6688318.565183955, 355719.78262385534 6688318.571344539, 355719.75650302524 6688318.579813903, 355719.7312197545 6688318.590527597, 355719.7069664642 6688318.603404077, 355719.68392773677 6688318.618345351, 355719.6622789103 6688318.635237702, 355719.6421847456 6688318.653952569, 355719.6237981717 6688318.6743475245, 355719.60725912097 6688318.696267347, 355719.5926934663 6688318.7195452135, 355719.5802120606 6688318.744003968, 355719.5699098951 6688318.769457463, 355719.56186537526 6688318.795711983, 355719.55613972514 6688318.8225677125, 355719.55277652014 6688318.849820269, 355719.55180135625 6688318.877262235, 355719.55322165537 6688318.904684769, 355719.5570266078 6688318.931879166, 355719.5631872557 6688318.958638459, 355719.5716567128 6688318.984758995, 355719.58237052127 6688319.01004198, 355719.5952471429 6688319.034294995, 355719.6101885783 6688319.05733346, 355719.6270811149 6688319.078982041, 355719.6457961896 6688319.099075977, 355719.6661913698 6688319.117462341, 355719.68811143545 6688319.134001203, 355719.711389562 6688319.148566689, 355719.73584858875 6688319.16104795, 355719.7613023673 6688319.171349994, 355719.78755717975 6688319.17939442, 355719.8144132106 6688319.185119999, 355719.8416660696 6688319.18848316, 355719.8691083456 6688319.18945831), (355721.38141488744 6688323.739017796, 355721.4236691251 6688323.856726375), (355721.4236691251 6688323.856726375, 355721.52222261636 6688324.131269051, 355721.6164079606 6688323.855149748), (355721.6164079606 6688323.855149748, 355721.65679598175 6688323.736745846), (355721.42172872834 6688323.856742248, 355721.4236691251 6688323.856726375), (355721.4236691251 6688323.856726375, 355721.6164079606 6688323.855149748), (355721.6164079606 6688323.855149748, 355721.61837239907 6688323.855133679), (355721.5228859896 6688324.210006463, 355721.5503063213 6688324.208582745, 355721.5774982526 6688324.20477483, 355721.6042548711 6688324.198611699, 355721.63037257723 6688324.190140248, 355721.65565263346 6688324.179424936, 355721.67990267597 6688324.166547302, 355721.7029381784 6688324.151605336, 355721.7245838561 6688324.134712734, 355721.74467500113 6688324.115998041, 355721.763058733 6688324.095603658, 355721.7795951642 6688324.073684775, 355721.7941584638 6688324.050408177, 355721.80663781543 6688324.025950988, 355721.8169382597 6688324.00049931, 355721.824981417 6688323.9742468055, 355721.83070608485 6688323.947393248, 355721.8340687018 6688323.920142964, 355721.8350436813 6688323.89270332, 355721.8336236041 6688323.8652831055, 355721.8298192763 6688323.838090971, 355721.8236596459 6688323.811333833, 355721.81519158336 6688323.785215291, 355721.80447952537 6688323.759934094, 355721.791604983 6688323.735682611, 355721.7766659224 6688323.712645378, 355721.7597760202 6688323.690997695, 355721.7410637964 6688323.670904284, 355721.7206716386 6688323.652518046, 355721.69875471666 6688323.635978884, 355721.6754798037 6688323.62141265, 355721.6510240058 6688323.608930184, 355721.62557341467 6688323.598626467, 355721.59932169213 6688323.590579908, 355721.5724685951 6688323.584851732, 355721.5452184578 6688323.581485524, 355721.5177786349 6688323.580506906, 355721.4903532862 6688323.581923764, 355721.4631558154 6688323.585725681, 355721.43639324675 6688323.591883714, 355721.410269294 6688323.600350997, 355721.38498281036 6688323.61106307, 355721.36072627344 6688323.6239384, 355721.3376843216 6688323.638878976, 355721.31603234774 6688323.655771077, 355721.2959351643 6688323.674486118, 355721.2775457491 6688323.694881645, 355721.2610040803 6688323.716802407, 355721.24643607106 6688323.740081547, 355721.2339526119 6688323.764541865, 355721.22364872554 6688323.789997175, 355721.21560284414 6688323.816253711, 355721.2098762118 6688323.843111613, 355721.20651241945 6688323.87036644, 355721.2055370714 6688323.897810732, 355721.2069575922 6688323.925235584, 355721.21076316905 6688323.952432243, 355721.2169248343 6688323.979193692, 355721.2253956857 6688324.00531622, 355721.2361112445 6688324.030600991, 355721.24898994464 6688324.054855539, 355721.2639337551 6688324.07789524, 355721.2808289248 6688324.099544715, 355721.29954685003 6688324.119639179, 355721.3199450513 6688324.1380256675, 355721.34186826 6688324.154564224, 355721.36514959903 6688324.169128967, 355721.3896118531 6688324.181609019, 355721.4150688186 6688324.191909397, 355721.44132671895 6688324.199951685, 355721.4681856828 6688324.20567467, 355721.49544126185 6688324.209034788, 355721.5228859896 6688324.210006463), (355733.40203145496 6688388.710238085, 355733.4443048406 6688388.827946528), (355733.4443048406 6688388.827946528, 355733.5429390692 6688389.102589338, 355733.6370645664 6688388.826370573), (355733.6370645664 6688388.826370573, 355733.67741257336 6688388.707966134), (355733.44234529336 6688388.8279625485, 355733.4443048406 6688388.827946528), (355733.4443048406 6688388.827946528, 355733.6370645664 6688388.826370573), (355733.6370645664 6688388.826370573, 355733.6390889105 6688388.826354022), (355733.54350257455 6688389.181226796, 355733.57092536933 6688389.179806444, 355733.5981200196 6688389.176001472, 355733.62487955857 6688389.169840837, 355733.6510003305 6688389.161371432, 355733.6762835412 6688389.150657709, 355733.7005367705 6688389.137781204, 355733.7235754377 6688389.122839917, 355733.74522420525 6688389.105947561, 355733.765318313 6688389.087232694, 355733.7837048335 6688389.066837748, 355733.8002438346 6688389.044917939, 355733.81480944494 6688389.021640093, 355733.8272908117 6688388.997181366, 355733.8375929447 6688388.971727904, 355733.84563743835 6688388.945473419, 355733.8513630698 6688388.918617728, 355733.85472626326 6688388.891365215, 355733.85570142337 6688388.863923289, 355733.85428112815 6688388.836500797, 355733.8504761869 6688388.809306439, 355733.8443155579 6688388.782547186, 355733.8358461266 6688388.756426686, 355733.82513235044 6688388.731143732, 355733.8122557676 6688388.706890745, 355733.7973143762 6688388.683852302, 355733.78042188875 6688388.662203737, 355733.76170686714 6688388.6421098085, 355733.7413117432 6688388.623723445, 355733.71939173614 6688388.607184578, 355733.6961136695 6688388.592619075, 355733.6716547029 6688388.58013779, 355733.6462009836 6688388.569835713, 355733.6199462285 6688388.561791248, 355733.5930902522 6688388.556065617, 355733.56583744363 6688388.552702397, 355733.53839521285 6688388.551727184, 355733.51097232295 6688388.553147404, 355733.4837775676 6688388.556952265, 355733.4570179159 6688388.563112801, 355733.4308970257 6688388.571582127, 355733.40561369323 6688388.582295793, 355733.3813603405 6688388.5951722525, 355733.35832155106 6688388.610113515, 355733.3366726644 6688388.62700586, 355733.31657844194 6688388.645720734, 355733.2981918139 6688388.666115704, 355733.2816527132 6688388.688035545, 355733.2670870136 6688388.71131344, 355733.2546055688 6688388.735772227, 355733.2443033707 6688388.761225757, 355733.23625882535 6688388.787480318, 355733.2305331567 6688388.814336091, 355733.22716994083 6688388.841588691, 355733.2261947737 6688388.869030706, 355733.22761507734 6688388.896453285, 355733.23142004217 6688388.923647728, 355733.2375807099 6688388.950407063, 355733.246050194 6688388.976527638, 355733.2567640364 6688389.00181066, 355733.2696406981 6688389.026063705, 355733.28458217974 6688389.049102198, 355733.3014747671 6688389.070750797, 355733.3201898966 6688389.090844744, 355733.34058513504 6688389.109231111, 355733.3625052614 6688389.125769967, 355733.3857834499 6688389.14033544, 355733.4102425389 6688389.152816681, 355733.43569637934 6688389.163118696, 355733.46195125126 6688389.1711630775, 355733.4888073393 6688389.176888612, 355733.516060251 6688389.180251717, 355733.54350257455 6688389.181226796), (355834.0964104162 6688311.254650246, 355834.138683813 6688311.372358661), (355834.138683813 6688311.372358661, 355834.23731807916 6688311.64700144, 355834.3314438155 6688311.370781831), (355834.3314438155 6688311.370781831, 355834.37179150805 6688311.252378254), (355834.1367242746 6688311.372374691, 355834.138683813 6688311.372358661), (355834.138683813 6688311.372358661, 355834.3314438155 6688311.370781831), (355834.3314438155 6688311.370781831, 355834.3333679434 6688311.370766091), (355834.23788158817 6688311.725638894, 355834.2653034029 6688311.7242172, 355834.2924969713 6688311.7204110585, 355834.31925534835 6688311.71424943, 355834.3453749002 6688311.705779208, 355834.3706568554 6688311.695064851, 355834.39490881644 6688311.682187895, 355834.4179462237 6688311.667246338, 355834.439593761 6688311.6503538815, 355834.4596866888 6688311.631639082, 355834.4780720983 6688311.611244357, 355834.494610075 6688311.589324916, 355834.50917476404 6688311.566047566, 355834.52165532677 6688311.541589447, 355834.53195678507 6688311.516136691, 355834.54000074393 6688311.489882996, 355834.5457259887 6688311.463028149, 355834.5490889493 6688311.435776522, 355834.5500640337 6688311.408335502, 355834.548643821 6688311.380913914, 355834.54483911954 6688311.353720442, 355834.53867888346 6688311.32696203, 355834.53020999214 6688311.300842309, 355834.5194968952 6688311.275560058, 355834.5066211194 6688311.251307667, 355834.49168065086 6688311.228269709, 355834.4747891874 6688311.206621496, 355834.45607527456 6688311.186527778, 355834.43568132684 6688311.1681414675, 355834.4137625433 6688311.151602489, 355834.3904857279 6688311.1370367, 355834.3660280191 6688311.124554952, 355834.34057554137 6688311.1142522255, 355834.3143219907 6688311.106206935, 355834.2874671583 6688311.1004802985, 355834.2602154118 6688311.0971158985, 355834.2327741387 6688311.096139338, 355834.2053523231 6688311.097561032, 355834.1781587533 6688311.101367172, 355834.15140037506 6688311.107528796, 355834.1252808218 6688311.115999019, 355834.0999988653 6688311.126713375, 355834.07574690285 6688311.1395903295, 355834.05270949425 6688311.154531887, 355834.03106195544 6688311.171424344, 355834.0109690266 6688311.190139145, 355833.9925836157 6688311.210533867, 355833.9760456378 6688311.23245331, 355833.9614809479 6688311.2557306625, 355833.94900038425 6688311.28018878, 355833.9386989252 6688311.305641537, 355833.9306549656 6688311.331895234, 355833.92492972047 6688311.358750081, 355833.9215667595 6688311.386001709, 355833.92059167504 6688311.41344273, 355833.9220118877 6688311.440864317, 355833.9258165894 6688311.468057791, 355833.931976826 6688311.494816202, 355833.9404457178 6688311.520935925, 355833.9511588156 6688311.546218179, 355833.96403459227 6688311.57047057, 355833.97897506185 6688311.59350853, 355833.99586652627 6688311.615156741, 355834.0145804404 6688311.6352504585, 355834.03497438965 6688311.65363677, 355834.0568931745 6688311.670175751, 355834.0801699912 6688311.684741537, 355834.10462770157 6688311.697223285, 355834.13008018036 6688311.707526008, 355834.1563337325 6688311.7155713, 355834.18318856606 6688311.721297935, 355834.21044031385 6688311.724662332, 355834.23788158817 6688311.725638894), (355810.8651016018 6688396.929179315, 355810.91879064543 6688397.078663538), (355810.91879064543 6688397.078663538, 355811.0440303889 6688397.427363467, 355811.1635613691 6688397.076719558), (355811.1635613691 6688397.076719558, 355811.2148236153 6688396.926341854), (355810.91629220056 6688397.078683381, 355810.91879064543 6688397.078663538), (355810.91879064543 6688397.078663538, 355811.1635613691 6688397.076719558), (355811.1635613691 6688397.076719558, 355811.16609361814 6688397.076699447), (355811.0448839144 6688397.52728406, 355811.07970648917 6688397.525478648, 355811.11423920025 6688397.520645154, 355811.1482192332 6688397.512820364, 355811.1813879794 6688397.502063825, 355811.2134930044 6688397.488457405, 355811.2442899697 6688397.472104655, 355811.2735444918 6688397.453130029, 355811.30103392614 6688397.431677937, 355811.3265490619 6688397.407911644, 355811.349895713 6688397.382012022, 355811.37089619716 6688397.354176182, 355811.38939068856 6688397.324615975, 355811.4052384327 6688397.293556372, 355811.4183188187 6688397.2612337535, 355811.4285322968 6688397.2278941125, 355811.43580113637 6688397.193791189, 355811.44007001724 6688397.159184525, 355811.4413064505 6688397.124337494, 355811.4395010263 6688397.089515306, 355811.4346674848 6688397.054982979, 355811.4268426124 6688397.021003327, 355811.4160859608 6688396.987834951, 355811.402479395 6688396.955730286, 355811.3861264689 6688396.924933664, 355811.36715163843 6688396.895679473, 355811.3456993133 6688396.868190348, 355811.3219327583 6688396.842675499, 355811.296032852 6688396.819329115, 355811.2681967077 6688396.798328869, 355811.2386361758 6688396.779834588, 355811.2075762292 6688396.763987025, 355811.1752532535 6688396.750906791, 355811.1419132454 6688396.740693431, 355811.10780994315 6688396.733424681, 355811.0732028931 6688396.729155853, 355811.03835547576 6688396.727919442, 355811.0035329009 6688396.7297248505, 355810.96900018974 6688396.734558344, 355810.93502015696 6688396.7423831355, 355810.9018514107 6688396.753139672, 355810.8697463858 6688396.7667460935, 355810.83894942055 6688396.783098843, 355810.80969489826 6688396.802073467, 355810.78220546397 6688396.82352556, 355810.7566903284 6688396.847291855, 355810.7333436773 6688396.873191476, 355810.7123431932 6688396.901027317, 355810.6938487017 6688396.930587523, 355810.6780009576 6688396.961647126, 355810.6649205715 6688396.993969744, 355810.6547070934 6688397.027309385, 355810.6474382537 6688397.061412307, 355810.64316937304 6688397.096018976, 355810.64193293964 6688397.130866004, 355810.6437383638 6688397.165688192, 355810.6485719053 6688397.200220518, 355810.65639677754 6688397.23420017, 355810.6671534292 6688397.267368548, 355810.6807599949 6688397.299473212, 355810.69711292075 6688397.330269831, 355810.7160877515 6688397.359524025, 355810.7375400766 6688397.387013149, 355810.76130663144 6688397.412527996, 355810.7872065379 6688397.435874384, 355810.8150426821 6688397.4568746295, 355810.844603214 6688397.4753689105, 355810.87566316064 6688397.491216473, 355810.90798613644 6688397.504296707, 355810.9413261444 6688397.514510067, 355810.975429447 6688397.52177882, 355811.0100364971 6688397.526047646, 355811.0448839144 6688397.52728406), (355776.3372339733 6688397.892785012, 355776.3908872249 6688398.042169603), (355776.3908872249 6688398.042169603, 355776.5161627372 6688398.390969173, 355776.63570401457 6688398.040225269), (355776.63570401457 6688398.040225269, 355776.68695603224 6688397.889847649), (355776.38842461095 6688398.04218916, 355776.3908872249 6688398.042169603), (355776.3908872249 6688398.042169603, 355776.63570401457 6688398.040225269), (355776.63570401457 6688398.040225269, 355776.63822602836 6688398.040205239), (355776.5170162582 6688398.490889765, 355776.5518388338 6688398.489084356, 355776.5863715458 6688398.484250864, 355776.6203515797 6688398.476426074, 355776.65352032677 6688398.465669537, 355776.685625353 6688398.452063117, 355776.71642231965 6688398.435710368, 355776.7456768434 6688398.416735749, 355776.7731662793 6688398.395283655, 355776.7986814163 6688398.37151736, 355776.8220280688 6688398.34561774, 355776.84302855475 6688398.317781904, 355776.86152304773 6688398.288221696, 355776.8773707936 6688398.257162093, 355776.8904511813 6688398.224839477, 355776.9006646611 6688398.191499837, 355776.9079335024 6688398.157396913, 355776.91220238496 6688398.122790247, 355776.9134388198 6688398.087943217, 355776.91163339705 6688398.053121029, 355776.9067998574 6688398.018588705, 355776.89897498634 6688397.984609049, 355776.88821833616 6688397.951440675, 355776.8746117715 6688397.919336007, 355776.8582588465 6688397.888539388, 355776.8392840169 6688397.859285191, 355776.8178316927 6688397.831796067, 355776.79406513844 6688397.806281219, 355776.7681652327 6688397.782934831, 355776.740329089 6688397.761934582, 355776.7107685573 6688397.743440302, 355776.67970861116 6688397.72759274, 355776.6473856353 6688397.714512503, 355776.61404562736 6688397.704299143, 355776.5799423246 6688397.697030389, 355776.54533527413 6688397.692761561, 355776.51048785605 6688397.691525145, 355776.4756652807 6688397.693330555, 355776.44113256864 6688397.698164046, 355776.4071525348 6688397.705988836, 355776.37398378784 6688397.716745374, 355776.34187876154 6688397.730351792, 355776.3110817949 6688397.74670454, 355776.28182727133 6688397.765679163, 355776.2543378352 6688397.787131253, 355776.22882269806 6688397.810897547, 355776.2054760457 6688397.8367971685, 355776.18447555986 6688397.864633007, 355776.1659810668 6688397.894193212, 355776.1501333208 6688397.925252815, 355776.13705293345 6688397.957575436, 355776.1268394534 6688397.990915072, 355776.1195706121 6688398.025017997, 355776.1153017295 6688398.059624662, 355776.11406529445 6688398.094471691, 355776.1158707173 6688398.1292938795, 355776.12070425693 6688398.163826205, 355776.1285291279 6688398.197805859, 355776.1392857781 6688398.230974236, 355776.1528923427 6688398.263078902, 355776.1692452677 6688398.293875523, 355776.1882200972 6688398.323129716, 355776.2096724215 6688398.350618843, 355776.2334389755 6688398.376133689, 355776.2593388813 6688398.399480077, 355776.28717502503 6688398.420480323, 355776.3167355569 6688398.438974608, 355776.34779550316 6688398.4548221715, 355776.38011847896 6688398.467902407, 355776.4134584871 6688398.478115767, 355776.4475617897 6688398.485384521, 355776.4821688402 6688398.489653347, 355776.5170162582 6688398.490889765), (355671.55895352387 6688300.0842707055, 355671.61264217924 6688300.233753925), (355671.61264217924 6688300.233753925, 355671.7378822051 6688300.582454821, 355671.8574470383 6688300.231711796), (355671.8574470383 6688300.231711796, 355671.9086754893 6688300.081433311), (355671.61014408903 6688300.2337747635, 355671.61264217924 6688300.233753925), (355671.61264217924 6688300.233753925, 355671.8574470383 6688300.231711796), (355671.8574470383 6688300.231711796, 355671.8599455179 6688300.2316909535), (355671.7387357128 6688300.682375402, 355671.7735566558 6688300.6805677675, 355671.8080875654 6688300.675732327, 355671.84206566407 6688300.667905886, 355671.87523238023 6688300.657147999, 355671.9073353168 6688300.643540534, 355671.9381301726 6688300.627187042, 355671.9673826004 6688300.608211974, 355671.99486999057 6688300.5867597265, 355672.020383166 6688300.562993551, 355672.0437279729 6688300.53709431, 355672.06472675846 6688300.50925909, 355672.0832197233 6688300.479699718, 355672.0990661368 6688300.448641138, 355672.11214540876 6688300.416319707, 355672.1223580067 6688300.382981386, 355672.1296262131 6688300.3488798775, 355672.1338947175 6688300.314274696, 355672.13513103704 6688300.2794291815, 355672.13332576305 6688300.244608507, 355672.12849263375 6688300.2100776555, 355672.12066842895 6688300.1760994075, 355672.10991269036 6688300.142932334, 355672.0963072682 6688300.110828828, 355672.0799557001 6688300.080033208, 355672.0609824193 6688300.050779819, 355672.03953181184 6688300.023291277, 355672.01576711587 6688299.997776772, 355671.98986917903 6688299.974430464, 355671.96203508315 6688299.953430022, 355671.9324766444 6688299.934935251, 355671.9014188006 6688299.919086903, 355671.86909790017 6688299.90600558, 355671.83575990336 6688299.895790828, 355671.8016585104 6688299.888520381, 355671.7670532309 6688299.88424957, 355671.73220740934 6688299.883010893, 355671.6973864648 6688299.884818526, 355671.66285555303 6688299.889653965, 355671.62887745205 6688299.897480401, 355671.5957107339 6688299.908238288, 355671.563607795 6688299.921845752, 355671.53281293705 6688299.938199245, 355671.50356050686 6688299.95717431, 355671.47607311426 6688299.978626557, 355671.4505599365 6688300.002392733, 355671.4272151276 6688300.028291977, 355671.4062163402 6688300.056127197, 355671.3877233736 6688300.085686568, 355671.37187695876 6688300.11674515, 355671.35879768565 6688300.149066583, 355671.34858508676 6688300.182404905, 355671.34131687944 6688300.216506412, 355671.33704837447 6688300.251111598, 355671.33581205487 6688300.285957114, 355671.337617329 6688300.320777789, 355671.3424504588 6688300.355308643, 355671.35027466423 6688300.389286892, 355671.3610304039 6688300.42245397, 355671.37463582685 6688300.454557471, 355671.39098739694 6688300.485353096, 355671.4099606792 6688300.514606486, 355671.43141128856 6688300.542095028, 355671.4551759869 6688300.567609536, 355671.4810739257 6688300.590955842, 355671.5089080237 6688300.611956284, 355671.53846646496 6688300.630451054, 355671.56952431117 6688300.6462994, 355671.6018452136 6688300.659380724, 355671.6351832128 6688300.669595475, 355671.66928460804 6688300.676865919, 355671.70388988935 6688300.681136729, 355671.7387357128 6688300.682375402), (355638.5573866138 6688297.089032075, 355638.61107525846 6688297.238515291), (355638.61107525846 6688297.238515291, 355638.73631526466 6688297.587216194, 355638.8558801124 6688297.236473175), (355638.8558801124 6688297.236473175, 355638.90710856963 6688297.086194693), (355638.60857717204 6688297.23853613, 355638.61107525846 6688297.238515291), (355638.61107525846 6688297.238515291, 355638.8558801124 6688297.236473175), (355638.8558801124 6688297.236473175, 355638.8583785996 6688297.236452333), (355638.737168768 6688297.687136771, 355638.77198884665 6688297.685323857, 355638.8065184431 6688297.680483292, 355638.84049479885 6688297.672651909, 355638.87365936505 6688297.661889307, 355638.9057597701 6688297.648277379, 355638.9365517407 6688297.631919712, 355638.96580096026 6688297.61294078, 355638.99328485184 6688297.5914850095, 355639.01879427186 6688297.567715666, 355639.04213510227 6688297.541813636, 355639.0631297271 6688297.513976013, 355639.0816183841 6688297.4844146455, 355639.097460381 6688297.453354475, 355639.1105351649 6688297.421031863, 355639.12074324145 6688297.387692772, 355639.1280069305 6688297.353590907, 355639.13227095816 6688297.3189857695, 355639.1335028757 6688297.284140688, 355639.1316933091 6688297.2493208265, 355639.1268560286 6688297.214791152, 355639.1190278445 6688297.180814426, 355639.1082683263 6688297.147649196, 355639.09465935064 6688297.115547842, 355639.0783044771 6688297.084754641, 355639.05932816095 6688297.055503923, 355639.03787480586 6688297.028018275, 355639.0141076646 6688297.002506854, 355638.988207597 6688296.979163789, 355638.96037169476 6688296.95816672, 355638.93081177905 6688296.939675423, 355638.8997527915 6688296.923830613, 355638.8674310804 6688296.910752863, 355638.8340926036 6688296.900541687, 355638.79999105586 6688296.893274796, 355638.7653859384 6688296.889007482, 355638.7305405849 6688296.887772221, 355638.6957158897 6688296.889578821, 355638.66118119576 6688296.89441387, 355638.62719936477 6688296.902240564, 355638.5940290515 6688296.912999334, 355638.5619227326 6688296.926608282, 355638.5311247866 6688296.94296383, 355638.5018696334 6688296.961941486, 355638.4743799497 6688296.983396797, 355638.44886497414 6688297.007166459, 355638.4255189152 6688297.033069545, 355638.4045194719 6688297.060908892, 355638.38602648256 6688297.090472607, 355638.3701807075 6688297.121535656, 355638.35710275715 6688297.153861607, 355638.34689217526 6688297.187204411, 355638.3396266794 6688297.221310269, 355638.33536157146 6688297.255919593, 355638.33412931545 6688297.290768946, 355638.33593929105 6688297.325593074, 355638.3407777211 6688297.360126911, 355638.3486077779 6688297.394107603, 355638.3593698627 6688297.4272765, 355638.37298205984 6688297.459381142, 355638.38934075873 6688297.490177159, 355638.40832144517 6688297.5194301475, 355638.42977964657 6688297.546917445, 355638.4535520334 6688297.572429836, 355638.47945766075 6688297.595773126, 355638.5072993472 6688297.616769639, 355638.53686517454 6688297.635259561, 355638.5679301017 6688297.6511021545, 355638.6002576761 6688297.664176829, 355638.63360183587 6688297.6743840715, 355638.66770878027 6688297.681646188, 355638.702318903 6688297.685907899, 355638.737168768 6688297.687136771), (355699.3378576065 6688295.95680286, 355699.3915163791 6688296.106286324), (355699.3915163791 6688296.106286324, 355699.51668638346 6688296.454986917, 355699.6363210631 6688296.104244188), (355699.6363210631 6688296.104244188, 355699.6875795704 6688295.953965451), (355699.3890481842 6688296.106306913, 355699.3915163791 6688296.106286324), (355699.3915163791 6688296.106286324, 355699.6363210631 6688296.104244188), (355699.6363210631 6688296.104244188, 355699.6388496124 6688296.104223096), (355699.51753989497 6688296.554907502, 355699.5523592048 6688296.553097631, 355699.58688831184 6688296.548260244, 355699.620864474 6688296.540432144, 355699.65402915736 6688296.529672898, 355699.68613000214 6688296.516064379, 355699.7169227445 6688296.499710139, 355699.7461730733 6688296.480734617, 355699.77365841484 6688296.459282207, 355699.7991696251 6688296.435516145, 355699.8225125821 6688296.409617274, 355699.8435096631 6688296.381782665, 355699.86200109497 6688296.35222412, 355699.87784617126 6688296.321166557, 355699.8909243225 6688296.288846305, 355699.9011360334 6688296.255509297, 355699.9084036 6688296.2214092035, 355699.912671721 6688296.186805496, 355699.9139079197 6688296.151961492, 355699.9121027892 6688296.117142328, 355699.90727006545 6688296.08261295, 355699.89944652154 6688296.0486361, 355699.88869168976 6688296.015470323, 355699.87508740555 6688295.983367983, 355699.858737189 6688295.952573359, 355699.8397654528 6688295.923320774, 355699.8183165584 6688295.895832814, 355699.79455371643 6688295.870318653, 355699.76865774515 6688295.846972428, 355699.7408256939 6688295.825971787, 355699.7112693454 6688295.8074765345, 355699.68021360156 6688295.791627402, 355699.64789477474 6688295.778544991, 355699.6145587878 6688295.768328852, 355699.5804593036 6688295.761056719, 355699.5458557946 6688295.756783929, 355699.5110115693 6688295.7555429945, 355699.4761857322 6688295.757343934, 355699.4416494182 6688295.762173522, 355699.407665515 6688295.769994993, 355699.37449270574 6688295.780748812, 355699.34238349914 6688295.79435312, 355699.3115823081 6688295.810704364, 355699.282323589 6688295.829678079, 355699.2548300575 6688295.851129837, 355699.2293109916 6688295.874896352, 355699.20596064086 6688295.900796713, 355699.18495674676 6688295.928633769, 355699.1664591885 6688295.958195622, 355699.15060876886 6688295.989257256, 355699.1375261398 6688296.021582229, 355699.12731088547 6688296.054924485, 355699.1200407635 6688296.089030229, 355699.11577111355 6688296.123639846, 355699.11453443597 6688296.158489894, 355699.11634014384 6688296.193315093, 355699.12117449276 6688296.227850359, 355699.12900068396 6688296.261832811, 355699.13975914463 6688296.29500378, 355699.15336798254 6688296.327110765, 355699.1697236084 6688296.357909374, 355699.1887015238 6688296.387165171, 355699.210157271 6688296.414655463, 355699.2339275297 6688296.440170994, 355699.25983136316 6688296.463517542, 355699.2876715927 6688296.4845173955, 355699.3172363009 6688296.503010706, 355699.34830044326 6688296.518856702, 355699.3806275621 6688296.531934767, 355699.4139715857 6688296.54214535, 355699.4480787015 6688296.549410729, 355699.48268928897 6688296.5536756, 355699.51753989497 6688296.554907502), (355716.4104375656 6688304.210137111, 355716.464126227 6688304.359620325), (355716.464126227 6688304.359620325, 355716.5893662706 6688304.708321221, 355716.70893108845 6688304.357578185), (355716.70893108845 6688304.357578185, 355716.760159534 6688304.2072996935), (355716.46162814007 6688304.359641165, 355716.464126227 6688304.359620325), (355716.464126227 6688304.359620325, 355716.70893108845 6688304.357578185), (355716.70893108845 6688304.357578185, 355716.7114295713 6688304.357557343), (355716.59011986974 6688304.808241754, 355716.6249423898 6688304.806436275, 355716.65947504085 6688304.80160272, 355716.69345501007 6688304.793777881, 355716.7266236893 6688304.783021303, 355716.758728646 6688304.769414855, 355716.78952554264 6688304.753062084, 355716.8187799967 6688304.73408745, 355716.8462693653 6688304.712635358, 355716.87178443774 6688304.688869073, 355716.8951310299 6688304.662969468, 355716.91613146086 6688304.635133655, 355716.9346259043 6688304.605573484, 355716.9504736072 6688304.574513918, 355716.9635539596 6688304.542191343, 355716.9737674118 6688304.5088517545, 355716.98103623383 6688304.474748879, 355716.98530510586 6688304.440142267, 355716.98654153885 6688304.40529529, 355716.9847361232 6688304.370473159, 355716.97990259907 6688304.3359408835, 355716.9720777525 6688304.30196128, 355716.961321135 6688304.268792953, 355716.9477146106 6688304.236688327, 355716.931361733 6688304.205891742, 355716.9123869569 6688304.176637577, 355716.8909346918 6688304.149148472, 355716.86716820166 6688304.123633637, 355716.84126836335 6688304.100287251, 355716.81343228964 6688304.079287002, 355716.78387182957 6688304.060792703, 355716.752811955 6688304.044945114, 355716.7204890496 6688304.0318648415, 355716.6871491104 6688304.0216514375, 355716.65304587263 6688304.014382626, 355716.6184388824 6688304.010113731, 355716.583591519 6688304.008877241, 355716.5487688916 6688304.010682574, 355716.51423612185 6688304.015515996, 355716.48025602585 6688304.023340728, 355716.44708721305 6688304.03409722, 355716.41498211905 6688304.0477036005, 355716.38418508373 6688304.06405632, 355716.3549304914 6688304.083030924, 355716.32744098833 6688304.104483002, 355716.30192578677 6688304.128249296, 355716.2785790731 6688304.154148926, 355716.25757853023 6688304.181984778, 355716.2390839861 6688304.211545006, 355716.22323619534 6688304.242604639, 355716.21015576937 6688304.27492729, 355716.1999422588 6688304.308266967, 355716.19267339475 6688304.342369933, 355716.1884044979 6688304.376976644, 355716.1871680567 6688304.411823717, 355716.1889734819 6688304.446645951, 355716.1938070326 6688304.48117832, 355716.2016319227 6688304.515158017, 355716.21238859976 6688304.548326429, 355716.2259951992 6688304.580431133, 355716.2423481655 6688304.6112277815, 355716.261323043 6688304.640482, 355716.28277542075 6688304.6679711435, 355716.3065420328 6688304.6934859995, 355716.3324420003 6688304.716832389, 355716.3602782084 6688304.737832629, 355716.3898388061 6688304.756326895, 355716.42089881864 6688304.772174433, 355716.45322185993 6688304.785254633, 355716.4865619318 6688304.7954679495, 355716.52066529484 6688304.802736648, 355716.55527240137 6688304.807005413, 355716.59011986974 6688304.808241754), (355722.82432333083 6688305.281821315, 355722.8779873119 6688305.431205803), (355722.8779873119 6688305.431205803, 355723.003252086 6688305.779905503, 355723.12278308463 6688305.429261654), (355723.12278308463 6688305.429261654, 355723.1740453381 6688305.278883977), (355722.87551395234 6688305.431225446, 355722.8779873119 6688305.431205803), (355722.8779873119 6688305.431205803, 355723.12278308463 6688305.429261654), (355723.12278308463 6688305.429261654, 355723.1253153382 6688305.429241543), (355723.0041056004 6688305.879826082, 355723.0389279858 6688305.878016321, 355723.0734601297 6688305.873178511, 355723.10743922036 6688305.865349465, 355723.1406066578 6688305.854588776, 355723.17271001695 6688305.840978334, 355723.20350497245 6688305.824621724, 355723.2327571552 6688305.805643426, 355723.26024393924 6688305.784187881, 355723.2857561333 6688305.760418376, 355723.30909957417 6688305.734515814, 355723.3300966042 6688305.706677329, 355723.34858742333 6688305.677114784, 355723.36443130503 6688305.646053171, 355723.377507668 6688305.613728888, 355723.38771699346 6688305.5803879425, 355723.3949815815 6688305.546284078, 355723.3992461452 6688305.511676846, 355723.400478228 6688305.476829629, 355723.39866845316 6688305.442007634, 355723.39383059414 6688305.4074758785, 355723.38600147015 6688305.373497169, 355723.37524066545 6688305.340330108, 355723.361630076 6688305.308227111, 355723.3452732872 6688305.277432505, 355723.3262947835 6688305.248180655, 355723.3048390031 6688305.2206941815, 355723.28106923733 6688305.195182279, 355723.2551663883 6688305.171839104, 355723.2273275926 6688305.150842315, 355723.1977647201 6688305.132351709, 355723.1667027624 6688305.116508009, 355723.1343781193 6688305.1034317985, 355723.1010368013 6688305.093222595, 355723.06693255575 6688305.085958095, 355723.0323249364 6688305.081693583, 355722.9974773285 6688305.0804615235, 355722.96265494305 6688305.082271284, 355722.9281227995 6688305.087109096, 355722.89414370834 6688305.094938136, 355722.86097627104 6688305.105698827, 355722.82887291204 6688305.119309272, 355722.7980779567 6688305.1356658805, 355722.7688257735 6688305.154644178, 355722.74133898935 6688305.17609972, 355722.7158267956 6688305.199869226, 355722.69248335453 6688305.2257717885, 355722.6714863247 6688305.253610276, 355722.6529955057 6688305.28317282, 355722.6371516237 6688305.314234433, 355722.6240752607 6688305.346558715, 355722.61386593565 6688305.379899662, 355722.6066013473 6688305.414003526, 355722.60233678354 6688305.4486107575, 355722.60110470076 6688305.483457975, 355722.6029144754 6688305.518279971, 355722.6077523343 6688305.552811724, 355722.6155814584 6688305.586790433, 355722.6263422631 6688305.619957496, 355722.6399528524 6688305.652060493, 355722.65630964155 6688305.682855101, 355722.67528814496 6688305.712106951, 355722.69674392557 6688305.739593421, 355722.72051369137 6688305.765105326, 355722.74641654035 6688305.788448501, 355722.7742553361 6688305.809445289, 355722.80381820846 6688305.827935895, 355722.8348801664 6688305.8437795965, 355722.8672048093 6688305.856855804, 355722.9005461274 6688305.86706501, 355722.9346503732 6688305.874329511, 355722.96925799234 6688305.878594019, 355723.0041056004 6688305.879826082), (355719.96671846195 6688308.3081941195, 355720.0203772376 6688308.45767758), (355720.0203772376 6688308.45767758, 355720.1455472556 6688308.806378186, 355720.26518192847 6688308.455635442), (355720.26518192847 6688308.455635442, 355720.3164404323 6688308.3053567), (355720.0179090446 6688308.45769817, 355720.0203772376 6688308.45767758), (355720.0203772376 6688308.45767758, 355720.26518192847 6688308.455635442), (355720.26518192847 6688308.455635442, 355720.26771047735 6688308.45561435), (355720.1464007697 6688308.906298765, 355720.1812233434 6688308.904493359, 355720.21575605415 6688308.899659869, 355720.24973608693 6688308.891835082, 355720.2829048333 6688308.881078552, 355720.3150098589 6688308.867472138, 355720.34580682486 6688308.851119389, 355720.3750613485 6688308.832144772, 355720.4025507847 6688308.810692687, 355720.42806592217 6688308.786926397, 355720.4514125752 6688308.761026779, 355720.4724130621 6688308.733190946, 355720.4909075564 6688308.703630748, 355720.50675530324 6688308.672571148, 355720.51983569266 6688308.640248536, 355720.5300491742 6688308.606908902, 355720.5373180176 6688308.572805982, 355720.54158690234 6688308.538199321, 355720.54282333935 6688308.503352295, 355720.5410179192 6688308.468530114, 355720.536184382 6688308.433997791, 355720.52835951373 6688308.40001814, 355720.5176028663 6688308.366849765, 355720.5039963047 6688308.334745104, 355720.4876433825 6688308.303948485, 355720.46866855596 6688308.274694295, 355720.44721623434 6688308.24720517, 355720.4234496835 6688308.221690324, 355720.3975497804 6688308.198343937, 355720.3697136395 6688308.177343692, 355720.3401531106 6688308.158849411, 355720.30909316696 6688308.143001846, 355720.2767701937 6688308.12992161, 355720.24343018787 6688308.1197082475, 355720.2093268874 6688308.112439493, 355720.1747198387 6688308.108170661, 355720.13987242273 6688308.106934246, 355720.1050498489 6688308.108739652, 355720.0705171383 6688308.113573141, 355720.0365371055 6688308.121397928, 355720.00336835906 6688308.132154459, 355719.9712633337 6688308.145760876, 355719.9404663675 6688308.16211362, 355719.91121184407 6688308.18108824, 355719.8837224079 6688308.202540326, 355719.8582072705 6688308.226306615, 355719.8348606173 6688308.2522062315, 355719.8138601303 6688308.2800420625, 355719.7953656362 6688308.309602263, 355719.77951788926 6688308.340661864, 355719.7664374999 6688308.372984476, 355719.7562240183 6688308.406324109, 355719.7489551748 6688308.4404270295, 355719.74468629016 6688308.475033689, 355719.74344985286 6688308.509880714, 355719.7452552731 6688308.544702898, 355719.75008881034 6688308.579235219, 355719.7579136786 6688308.613214874, 355719.7686703259 6688308.646383245, 355719.78227688756 6688308.678487907, 355719.7986298096 6688308.709284525, 355719.81760463596 6688308.738538714, 355719.8390569578 6688308.766027842, 355719.8628235087 6688308.791542689, 355719.8887234119 6688308.814889076, 355719.9165595526 6688308.83588932, 355719.9461200817 6688308.854383604, 355719.9771800253 6688308.8702311665, 355720.00950299844 6688308.8833114, 355720.0428430042 6688308.893524762, 355720.0769463049 6688308.900793518, 355720.11155335355 6688308.9050623495, 355720.1464007697 6688308.906298765), (355761.4247723567 6688305.543006374, 355761.47846102965 6688305.692489586), (355761.47846102965 6688305.692489586, 355761.6037010996 6688306.041190475, 355761.7232658936 6688305.690447427), (355761.7232658936 6688305.690447427, 355761.7744943266 6688305.540168937), (355761.4759629477 6688305.692510425, 355761.47846102965 6688305.692489586), (355761.47846102965 6688305.692489586, 355761.7232658936 6688305.690447427), (355761.7232658936 6688305.690447427, 355761.7257643799 6688305.690426585), (355761.6044546972 6688306.141111012, 355761.6392756377 6688306.139303369, 355761.67380654457 6688306.134467927, 355761.70778464014 6688306.12664148, 355761.7409513525 6688306.115883589, 355761.7730542853 6688306.102276118, 355761.803849137 6688306.085922625, 355761.8331015601 6688306.0669475505, 355761.8605889461 6688306.045495301, 355761.886102117 6688306.021729124, 355761.909446919 6688305.9958298765, 355761.93044569984 6688305.9679946555, 355761.9489386596 6688305.938435281, 355761.9647850684 6688305.907376702, 355761.97786433547 6688305.875055266, 355761.98807692894 6688305.841716945, 355761.99534513114 6688305.8076154385, 355761.9996136315 6688305.773010258, 355762.00084994675 6688305.738164742, 355761.99904466944 6688305.703344068, 355761.99421153666 6688305.668813217, 355761.9863873287 6688305.634834969, 355761.97563158744 6688305.601667895, 355761.9620261632 6688305.569564395, 355761.94567459245 6688305.538768773, 355761.92670131003 6688305.509515385, 355761.90525070153 6688305.482026848, 355761.8814860047 6688305.456512346, 355761.8555880673 6688305.433166042, 355761.8277539714 6688305.412165598, 355761.79819553276 6688305.393670835, 355761.76713768963 6688305.377822489, 355761.7348167901 6688305.364741164, 355761.70147879445 6688305.354526418, 355761.6673774031 6688305.347255973, 355761.6327721259 6688305.342985165, 355761.5979263061 6688305.34174649, 355761.563102101 6688305.343549666, 355761.52856758895 6688305.348381205, 355761.49458562135 6688305.356204336, 355761.4614148443 6688305.366959518, 355761.4293077288 6688305.380564879, 355761.39850865124 6688305.396916877, 355761.36925203097 6688305.415891044, 355761.34176054836 6688305.437342968, 355761.3162434483 6688305.461109376, 355761.29289494763 6688305.487009361, 355761.27189275884 6688305.514845808, 355761.25339673454 6688305.544406839, 355761.2375476529 6688305.575467454, 355761.2244661459 6688305.607791249, 355761.2142517803 6688305.641132199, 355761.20698229986 6688305.675236531, 355761.20271303476 6688305.709844669, 355761.2014764796 6688305.744693205, 355761.203282046 6688305.779516897, 355761.2081159917 6688305.814050694, 355761.21594152384 6688305.848031743, 355761.2266990803 6688305.881201416, 355761.24030678236 6688305.913307238, 355761.2566610584 6688305.944104852, 355761.275637432 6688305.973359848, 355761.29709146835 6688306.000849553, 355761.320859875 6688306.02636474, 355761.346761745 6688306.049711206, 355761.3745999321 6688306.070711257, 355761.40416255203 6688306.089205049, 355761.43522459635 6688306.105051827, 355761.4675496434 6688306.118130974, 355761.50089165906 6688306.128342945, 355761.5349968679 6688306.135610009, 355761.5696056862 6688306.139876856, 355761.6044546972 6688306.141111012), (355758.4226611394 6688304.035634316, 355758.47632513125 6688304.185018805), (355758.47632513125 6688304.185018805, 355758.6015899258 6688304.533718496, 355758.72112090705 6688304.183074642), (355758.72112090705 6688304.183074642, 355758.77238315437 6688304.03269696), (355758.47385176807 6688304.185038448, 355758.47632513125 6688304.185018805), (355758.47632513125 6688304.185018805, 355758.72112090705 6688304.183074642), (355758.72112090705 6688304.183074642, 355758.7236531541 6688304.183054531), (355758.60244344495 6688304.633639078, 355758.6372616631 6688304.631833857, 355758.6717900513 6688304.627000934, 355758.7057658267 6688304.6191770835, 355758.73893041414 6688304.608421861, 355758.77103141026 6688304.594817109, 355758.8018245078 6688304.5784663735, 355758.83107535215 6688304.559494091, 355758.858561327 6688304.538044655, 355758.88407324743 6688304.514281311, 355758.9074169523 6688304.488384902, 355758.92841478187 6688304.460552523, 355758.9469069304 6688304.430995999, 355758.96275266097 6688304.399940265, 355758.9758313779 6688304.367621678, 355758.9860435446 6688304.334286198, 355758.9933114406 6688304.300187535, 355758.99757975177 6688304.265585192, 355758.99881599494 6688304.230742523, 355758.9970107608 6688304.195924696, 355758.9921777883 6688304.1613966925, 355758.9843538596 6688304.1274213, 355758.97359851934 6688304.094257085, 355758.9599936223 6688304.06215645, 355758.94364270964 6688304.031363701, 355758.9246702218 6688304.002113188, 355758.90322055103 6688303.974627523, 355758.87945694226 6688303.949115893, 355758.8535602507 6688303.925772454, 355758.8257275661 6688303.904774866, 355758.79617071187 6688303.886282931, 355758.76511463284 6688303.870437379, 355758.7327956859 6688303.857358818, 355758.69945983676 6688303.847146772, 355758.6653607915 6688303.839878962, 355758.6307580646 6688303.835610706, 355758.5959150038 6688303.834374482, 355758.56109678553 6688303.8361797035, 355758.52656839765 6688303.841012627, 355758.492592622 6688303.848836474, 355758.45942803466 6688303.859591698, 355758.42732703855 6688303.873196452, 355758.3965339412 6688303.889547187, 355758.36728309665 6688303.908519466, 355758.3397971218 6688303.929968903, 355758.3142852013 6688303.953732251, 355758.29094149615 6688303.979628654, 355758.26994366664 6688304.007461034, 355758.2514515184 6688304.0370175615, 355758.2356057878 6688304.068073294, 355758.2225270708 6688304.1003918825, 355758.212314904 6688304.133727361, 355758.20504700806 6688304.167826027, 355758.2007786965 6688304.202428363, 355758.1995424535 6688304.237271036, 355758.2013476876 6688304.272088863, 355758.20618066005 6688304.306616867, 355758.21400458866 6688304.340592258, 355758.224759929 6688304.373756475, 355758.2383648262 6688304.4058571085, 355758.2547157387 6688304.436649858, 355758.2736882264 6688304.465900373, 355758.2951378972 6688304.493386036, 355758.31890150625 6688304.5188976675, 355758.3447981976 6688304.542241106, 355758.3726308824 6688304.563238695, 355758.4021877368 6688304.581730631, 355758.4332438153 6688304.597576178, 355758.46556276275 6688304.610654744, 355758.4988986118 6688304.620866789, 355758.5329976571 6688304.628134598, 355758.5676003842 6688304.632402857, 355758.60244344495 6688304.633639078), (355811.8046637648 6688310.493942126, 355811.8583170207 6688310.643326697), (355811.8583170207 6688310.643326697, 355811.98359254265 6688310.99212622, 355812.10315765615 6688310.641382159), (355812.10315765615 6688310.641382159, 355812.15438573813 6688310.491104666), (355811.8558544119 6688310.643346255, 355811.8583170207 6688310.643326697), (355811.8583170207 6688310.643326697, 355812.10315765615 6688310.641382159), (355812.10315765615 6688310.641382159, 355812.1056558009 6688310.641362319), (355811.9843461471 6688311.09204676, 355812.0191661387 6688311.09023782, 355812.053695998 6688311.085401244, 355812.0876729678 6688311.077573832, 355812.1208384987 6688311.066815149, 355812.15294021566 6688311.053207067, 355812.18373383855 6688311.036853133, 355812.2129850413 6688311.017877796, 355812.2404712358 6688310.99642545, 355812.2659832639 6688310.9726593355, 355812.28932699 6688310.946760302, 355812.310324779 6688310.918925433, 355812.3288168471 6688310.889366542, 355812.3446624774 6688310.85830855, 355812.35774109204 6688310.825987802, 355812.3679531684 6688310.79265024, 355812.375220997 6688310.758549551, 355812.3794892731 6688310.723945228, 355812.3807255167 6688310.689100591, 355812.37892032025 6688310.654280788, 355812.3740874216 6688310.619750796, 355812.366263596 6688310.585773362, 355812.35550837964 6688310.552607042, 355812.3419036149 6688310.520504218, 355812.3255528281 6688310.489709176, 355812.3065804414 6688310.460456256, 355812.28513082647 6688310.432968056, 355812.2613672054 6688310.407453752, 355812.2354704087 6688310.384107497, 355812.2076374996 6688310.363106942, 355812.1780802743 6688310.344611896, 355812.1470236505 6688310.3287630975, 355812.11470395495 6688310.315681146, 355812.0813671266 6688310.305465593, 355812.04726684396 6688310.298194172, 355812.01266259485 6688310.293922215, 355811.9778177028 6688310.292682232, 355811.9429925508 6688310.294484111, 355811.9084569936 6688310.299314521, 355811.87447390344 6688310.307136691, 355811.8413019478 6688310.317891084, 355811.8091936199 6688310.331495838, 355811.77839331736 6688310.3478474, 355811.7491354808 6688310.366821309, 355811.7216428109 6688310.3882731395, 355811.6961245722 6688310.4120396115, 355811.6727750005 6688310.43793982, 355811.6517718244 6688310.46577662, 355811.63327491283 6688310.495338134, 355811.61742505827 6688310.526399345, 355811.6043429033 6688310.558723827, 355811.5941280253 6688310.592065536, 355811.5868581764 6688310.62617069, 355811.5825886919 6688310.660779692, 355811.5813520692 6688310.695629105, 355811.583157722 6688310.730453673, 355811.5879919057 6688310.764988323, 355811.59581782453 6688310.79897019, 355811.60657590977 6688310.832140612, 355811.6201842752 6688310.864247112, 355811.63653933833 6688310.895045301, 355811.65551661054 6688310.924300761, 355811.6769716433 6688310.951790807, 355811.70074112836 6688310.977306191, 355811.7266441407 6688311.0006527025, 355811.7544835161 6688311.021652637, 355811.7840473503 6688311.040146142, 355811.8151106149 6688311.055992466, 355811.8474368658 6688311.069070979, 355811.8807800483 6688311.079282141, 355811.9148863647 6688311.08654822, 355811.9494962103 6688311.090813916, 355811.9843461471 6688311.09204676), (355692.5645381659 6688269.627728347, 355692.6182268219 6688269.777211553), (355692.6182268219 6688269.777211553, 355692.7434668551 6688270.125912435, 355692.86303167406 6688269.775169417), (355692.86303167406 6688269.775169417, 355692.91426011757 6688269.62489094), (355692.61572873354 6688269.777232392, 355692.6182268219 6688269.777211553), (355692.6182268219 6688269.777211553, 355692.86303167406 6688269.775169417), (355692.86303167406 6688269.775169417, 355692.8655301527 6688269.775148575), (355692.74432036583 6688270.225833015, 355692.77914293844 6688270.224027607, 355692.81367564783 6688270.219194116, 355692.84765567933 6688270.211369332, 355692.8808244245 6688270.200612801, 355692.91292944894 6688270.187006386, 355692.9437264143 6688270.170653645, 355692.9729809368 6688270.151679025, 355693.00047037203 6688270.130226942, 355693.02598550875 6688270.106460652, 355693.0493321617 6688270.080561039, 355693.0703326481 6688270.052725208, 355693.088827142 6688270.02316501, 355693.1046748893 6688269.992105416, 355693.1177552785 6688269.959782803, 355693.1279687604 6688269.926443174, 355693.13523760426 6688269.892340255, 355693.1395064894 6688269.857733596, 355693.1407429274 6688269.822886572, 355693.1389375084 6688269.788064394, 355693.1341039719 6688269.753532072, 355693.1262791047 6688269.719552424, 355693.1155224589 6688269.686384054, 355693.1019158988 6688269.654279393, 355693.0855629782 6688269.623482777, 355693.0665881533 6688269.594228585, 355693.0451358336 6688269.566739464, 355693.02136928414 6688269.5412246175, 355692.99546938314 6688269.517878232, 355692.96763324394 6688269.496877984, 355692.9380727166 6688269.478383701, 355692.9070127748 6688269.4625361385, 355692.8746898032 6688269.449455902, 355692.8413497994 6688269.439242543, 355692.8072465004 6688269.431973783, 355692.77263945324 6688269.427704954, 355692.7377920386 6688269.426468538, 355692.702969466 6688269.428273941, 355692.66843675653 6688269.43310743, 355692.634456725 6688269.440932216, 355692.60128797963 6688269.451688747, 355692.56918295537 6688269.465295163, 355692.53838599 6688269.481647904, 355692.5091314674 6688269.500622523, 355692.4816420321 6688269.522074607, 355692.4561268953 6688269.545840895, 355692.43278024247 6688269.571740508, 355692.411779756 6688269.59957634, 355692.3932852619 6688269.629136538, 355692.3774375149 6688269.660196134, 355692.36435712536 6688269.692518745, 355692.35414364346 6688269.725858375, 355692.3468747996 6688269.759961291, 355692.3426059142 6688269.794567951, 355692.3413694763 6688269.829414977, 355692.34317489533 6688269.864237155, 355692.3480084317 6688269.8987694755, 355692.3558332987 6688269.932749123, 355692.36658994464 6688269.965917495, 355692.380196505 6688269.998022157, 355692.3965494252 6688270.02881877, 355692.41552425036 6688270.058072963, 355692.4369765702 6688270.085562086, 355692.4607431196 6688270.1110769315, 355692.4866430208 6688270.134423317, 355692.51447916 6688270.155423563, 355692.5440396872 6688270.173917845, 355692.575099629 6688270.189765409, 355692.60742260073 6688270.202845645, 355692.6407626049 6688270.213059007, 355692.6748659038 6688270.220327763, 355692.7094729509 6688270.224596594, 355692.74432036583 6688270.225833015), (355668.7935196528 6688263.970549177, 355668.84720830317 6688264.12003239), (355668.84720830317 6688264.12003239, 355668.97244831745 6688264.468733269, 355669.09201315005 6688264.117990262), (355669.09201315005 6688264.117990262, 355669.14324160136 6688263.967711784), (355668.8447102153 6688264.120053228, 355668.84720830317 6688264.12003239), (355668.84720830317 6688264.12003239, 355669.09201315005 6688264.117990262), (355669.09201315005 6688264.117990262, 355669.0945116323 6688264.11796942), (355668.9732019105 6688264.568653799, 355669.0080233277 6688264.566846813, 355669.04255476163 6688264.562011944, 355669.0765334229 6688264.554185985, 355669.10970072984 6688264.543428494, 355669.1418042747 6688264.529821336, 355669.172599745 6688264.513468064, 355669.2018527828 6688264.494493129, 355669.2293407689 6688264.473040929, 355669.25485451566 6688264.449274722, 355669.2781998605 6688264.423375372, 355669.2991991417 6688264.395539976, 355669.3176925519 6688264.365980365, 355669.33353935415 6688264.334921491, 355669.3466189519 6688264.302599715, 355669.35683180764 6688264.269261015, 355669.3641002 6688264.235159098, 355669.3683688157 6688264.200553488, 355669.3696051699 6688264.165707532, 355669.36779985396 6688264.130886422, 355669.3629666066 6688264.096355145, 355669.3551422091 6688264.062376488, 355669.3443862068 6688264.029209036, 355669.33078045363 6688263.997105197, 355669.3144284917 6688263.966309287, 355669.2954547615 6688263.937055663, 355669.27400365565 6688263.909566955, 355669.2502384201 6688263.884052349, 355669.2243399115 6688263.860706019, 355669.1965052209 6688263.839705635, 355669.16694617405 6688263.821211008, 355669.1358877196 6688263.80536289, 355669.10356621613 6688263.792281882, 355669.07022763503 6688263.7820675345, 355669.0361256875 6688263.774797582, 355669.0015198934 6688263.770527348, 355668.96667360817 6688263.769289329, 355668.9318498785 6688263.771093151, 355668.89731589146 6688263.7759252535, 355668.8633344876 6688263.783748864, 355668.83016430185 6688263.794504434, 355668.798057795 6688263.8081101, 355668.7672593315 6688263.82446231, 355668.7380033212 6688263.843436606, 355668.7105124335 6688263.864888576, 355668.68499590387 6688263.888654942, 355668.66164793994 6688263.914554821, 355668.6406462448 6688263.942391083, 355668.6221506642 6688263.971951867, 355668.6063019689 6688264.003012183, 355668.59322078485 6688264.035335631, 355668.58300667384 6688264.06867619, 355668.5757373759 6688264.102780107, 355668.57146821864 6688264.137387814, 355668.57023169467 6688264.17223591, 355668.5720372151 6688264.207059158, 355668.57687103824 6688264.241592522, 355668.5846963733 6688264.275573163, 355668.5954536616 6688264.308742454, 355668.60906102817 6688264.340847939, 355668.62541490607 6688264.371645261, 355668.64439082565 6688264.400900021, 355668.6658443589 6688264.428389557, 355668.689612222 6688264.4539046455, 355668.71551351604 6688264.477251092, 355668.74335110415 6688264.498251199, 355668.7729131124 6688264.516745136, 355668.80397454253 6688264.532592144, 355668.8362989833 6688264.545671611, 355668.8696404116 6688264.555883989, 355668.90374506306 6688264.563151549, 355668.9383533648 6688264.567418979, 355668.9732019105 6688264.568653799), (355649.18992541573 6688261.251633026, 355649.2436140607 6688261.401116235), (355649.2436140607 6688261.401116235, 355649.3688540666 6688261.74981712, 355649.4884189044 6688261.399074111), (355649.4884189044 6688261.399074111, 355649.5396473551 6688261.248795641), (355649.24111597403 6688261.4011370735, 355649.2436140607 6688261.401116235), (355649.2436140607 6688261.401116235, 355649.4884189044 6688261.399074111), (355649.4884189044 6688261.399074111, 355649.4909173897 6688261.399053269), (355649.3697075715 6688261.849737696, 355649.40453245246 6688261.847935446, 355649.4390677111 6688261.843104721, 355649.4730504807 6688261.835282283, 355649.5062221002 6688261.82452767, 355649.5383300826 6688261.810922746, 355649.56913003686 6688261.794571066, 355649.59838752786 6688261.775597088, 355649.6258798613 6688261.7541452395, 355649.6513977777 6688261.7303787945, 355649.6747470467 6688261.704478653, 355649.69574994466 6688261.676641961, 355649.7142466071 6688261.647080594, 355649.73009624577 6688261.616019558, 355649.7431782208 6688261.58369528, 355649.75339295814 6688261.550353795, 355649.7606627081 6688261.516248882, 355649.76493213617 6688261.481640131, 355649.7661687456 6688261.446790971, 355649.7643631245 6688261.411966658, 355649.75952901586 6688261.377432256, 355649.75170321495 6688261.343450626, 355649.7409452878 6688261.310280419, 355649.72733711905 6688261.278174115, 355649.7109822878 6688261.247376088, 355649.69200527953 6688261.218120763, 355649.67055053817 6688261.190630813, 355649.6467813676 6688261.165115481, 355649.62087868777 6688261.141768982, 355649.5930396576 6688261.120769011, 355649.5634761753 6688261.102275415, 355649.5324132645 6688261.086428958, 355649.50008736126 6688261.073350259, 355649.46674451604 6688261.06313886, 355649.4326385187 6688261.055872487, 355649.3980289683 6688261.051606455, 355649.3631792971 6688261.050373228, 355649.3283590311 6688261.052181789, 355649.29382886796 6688261.0570180295, 355649.25985157123 6688261.064845158, 355649.2266856972 6688261.075603605, 355649.19458362646 6688261.089211503, 355649.1637896456 6688261.105565303, 355649.1345380865 6688261.124540555, 355649.1070515441 6688261.1459928695, 355649.08153918147 6688261.169758993, 355649.0581951397 6688261.195658079, 355649.03719705925 6688261.223493047, 355649.01870472793 6688261.253052073, 355649.0028588669 6688261.284110229, 355648.9897800575 6688261.316431168, 355648.9795678257 6688261.349768947, 355648.9722998828 6688261.383869867, 355648.96803153516 6688261.418474434, 355648.96679526404 6688261.453319319, 355648.9686004768 6688261.488139369, 355648.9734334364 6688261.522669607, 355648.981257366 6688261.5566472765, 355648.99201272713 6688261.589813811, 355649.00561767607 6688261.62191683, 355649.02196868317 6688261.65271204, 355649.04094132246 6688261.681965096, 355649.06239121914 6688261.709453397, 355649.08615514555 6688261.734967757, 355649.1120522671 6688261.758314031, 355649.13988551457 6688261.779314555, 355649.1694430867 6688261.797809525, 355649.20050005964 6688261.8136582, 355649.23282010056 6688261.826739976, 355649.2661572639 6688261.836955303, 355649.3002578658 6688261.84422645, 355649.33486241126 6688261.848498081, 355649.3697075715 6688261.849737696), (355639.3096910876 6688261.091530762, 355639.3633797329 6688261.241013971), (355639.3633797329 6688261.241013971, 355639.48861973925 6688261.589714855, 355639.6081845794 6688261.238971854), (355639.6081845794 6688261.238971854, 355639.6594130341 6688261.088693378), (355639.36088165146 6688261.2410348095, 355639.3633797329 6688261.241013971), (355639.3633797329 6688261.241013971, 355639.6081845794 6688261.238971854), (355639.6081845794 6688261.238971854, 355639.61068306695 6688261.238951012), (355639.48947324284 6688261.6896354295, 355639.524295817 6688261.687830027, 355639.55882852816 6688261.682996541, 355639.592808562 6688261.675171759, 355639.6259773095 6688261.664415231, 355639.6580823366 6688261.6508088205, 355639.6888793046 6688261.634456081, 355639.71813383023 6688261.615481466, 355639.7456232686 6688261.594029385, 355639.77113840857 6688261.570263101, 355639.79448506463 6688261.544363486, 355639.8154855544 6688261.516527657, 355639.8339800517 6688261.48696746, 355639.84982780216 6688261.455907866, 355639.86290819483 6688261.423585256, 355639.87312168 6688261.390245627, 355639.8803905269 6688261.356142712, 355639.884659415 6688261.321536051, 355639.8858958559 6688261.286689028, 355639.8840904393 6688261.251866846, 355639.87925690546 6688261.217334526, 355639.8714320407 6688261.183354879, 355639.8606753968 6688261.150186507, 355639.8470688384 6688261.118081844, 355639.8307159195 6688261.087285227, 355639.8117410959 6688261.058031037, 355639.7902887772 6688261.03054191, 355639.76652222866 6688261.005027062, 355639.74062232825 6688260.981680676, 355639.7127861895 6688260.960680432, 355639.6832256624 6688260.942186146, 355639.6521657202 6688260.9263385795, 355639.61984274816 6688260.913258341, 355639.5865027433 6688260.903044976, 355639.5523994434 6688260.895776218, 355639.51779239526 6688260.891507386, 355639.48294497916 6688260.890270965, 355639.44812240486 6688260.892076365, 355639.41358969355 6688260.896909851, 355639.3796096601 6688260.904734637, 355639.34644091234 6688260.915491164, 355639.31433588534 6688260.929097574, 355639.28353891725 6688260.945450315, 355639.2542843917 6688260.964424928, 355639.22679495334 6688260.985877009, 355639.2012798132 6688261.009643295, 355639.17793315736 6688261.035542909, 355639.1569326673 6688261.063378737, 355639.1384381699 6688261.092938933, 355639.1225904196 6688261.123998529, 355639.10951002676 6688261.156321137, 355639.09929654177 6688261.189660769, 355639.09202769474 6688261.223763684, 355639.0877588065 6688261.258370342, 355639.0865223657 6688261.2932173675, 355639.0883277821 6688261.328039546, 355639.0931613157 6688261.362571864, 355639.10098618077 6688261.396551517, 355639.1117428245 6688261.429719887, 355639.12534938287 6688261.461824549, 355639.14170230174 6688261.4926211685, 355639.1606771253 6688261.521875358, 355639.182129444 6688261.549364481, 355639.2058959926 6688261.5748793315, 355639.2317958933 6688261.598225718, 355639.25963203213 6688261.619225964, 355639.2891925594 6688261.6377202505, 355639.3202525016 6688261.653567814, 355639.35257547355 6688261.666648053, 355639.3859154785 6688261.676861417, 355639.4200187783 6688261.684130176, 355639.45462582674 6688261.68839901, 355639.48947324284 6688261.6896354295))
-25272;24895;T17-ASSAINISSEMENT;43-50-14-C;ByBlock;T17_251;20220609;MULTILINESTRING ((355701.6769458914 6688216.8681508675, 355702.12428207794 6688216.882244681, 355702.15236978093 6688215.987572264, 355701.2576974091 6688215.95938464, 355701.22950978315 6688216.85405701, 355701.6769458914 6688216.8681508675), (355701.67867016414 6688216.812196362, 355701.7179954884 6688216.812009672, 355701.757123002 6688216.808065932, 355701.7956945797 6688216.800401233, 355701.83335718495 6688216.789085734, 355701.86148989847 6688216.7774274405, 355701.88857642934 6688216.763510408, 355701.9144357901 6688216.747427627, 355701.93889519235 6688216.729286561, 355701.961791203 6688216.709208421, 355701.9832677902 6688216.687619051, 355702.0029093104 6688216.664347744, 355702.0205845228 6688216.639549998, 355702.0361753238 6688216.613391505, 355702.0495775391 6688216.5860470515, 355702.06325327023 6688216.549163638, 355702.07334177307 6688216.51114217, 355702.0797507098 6688216.472330645, 355702.0824214205 6688216.4330843035, 355702.08223126485 6688216.393783878, 355702.0782863578 6688216.35468146, 355702.07062280556 6688216.316134966, 355702.05931075144 6688216.278497199, 355702.0476360048 6688216.250341412, 355702.0337006287 6688216.223233205, 355702.0175977376 6688216.197353718, 355701.99943492905 6688216.172875868, 355701.9793335645 6688216.149963215, 355701.9577442642 6688216.128486713, 355701.9344729924 6688216.108845235, 355701.9096752441 6688216.091170021, 355701.8835167156 6688216.07557918, 355701.85617219453 6688216.062176884, 355701.8193136671 6688216.048504881, 355701.78131729946 6688216.038417629, 355701.7425308655 6688216.032007463, 355701.70330936834 6688216.029333045, 355701.66398404416 6688216.02951973, 355701.6248565305 6688216.033463469, 355701.58628495253 6688216.041128164, 355701.5486223476 6688216.052443667, 355701.52048634953 6688216.064121808, 355701.4933981663 6688216.078058892, 355701.46753879666 6688216.094161791, 355701.4430810282 6688216.112322909, 355701.4201882836 6688216.132420899, 355701.3986918479 6688216.154006987, 355701.379030277 6688216.177276642, 355701.3613349461 6688216.20207438, 355701.34572409285 6688216.228234506, 355701.33230202575 6688216.255582225, 355701.31865476497 6688216.292444378, 355701.3085925706 6688216.330441965, 355701.3022075393 6688216.369227201, 355701.2995581118 6688216.408445098, 355701.2997446619 6688216.447770398, 355701.30368835607 6688216.486897903, 355701.3113530985 6688216.525469493, 355701.32266873505 6688216.563132123, 355701.33432691725 6688216.59126478, 355701.3482438952 6688216.618351282, 355701.3643266768 6688216.644210645, 355701.3824677992 6688216.668670075, 355701.4025460456 6688216.691566141, 355701.4241519102 6688216.713065777, 355701.4474415807 6688216.732728958, 355701.47225943825 6688216.7504242975, 355701.49843965267 6688216.766033554, 355701.5258072919 6688216.7794524385, 355701.56266942504 6688216.7930995785, 355701.60066700587 6688216.803161737, 355701.63945224986 6688216.80954681, 355701.67867016414 6688216.812196362), (355702.72064034967 6688236.6571212, 355703.16509397025 6688236.638240032, 355703.127431596 6688235.749232925, 355702.2383245728 6688235.786895251, 355702.2760868145 6688236.676002323, 355702.72064034967 6688236.6571212), (355702.71826771763 6688236.601564491, 355702.7572261127 6688236.5984813105, 355702.79571158916 6688236.591689396, 355702.833371898 6688236.581250904, 355702.8698623435 6688236.567261388, 355702.8969145403 6688236.553629814, 355702.92276300176 6688236.537834342, 355702.9472350129 6688236.519980516, 355702.97016705613 6688236.500187634, 355702.9914059041 6688236.478587943, 355703.01111469814 6688236.455604882, 355703.02888050745 6688236.431088929, 355703.0445846241 6688236.405203892, 355703.05812211643 6688236.37812273, 355703.0694025289 6688236.350026398, 355703.0802301412 6688236.312476075, 355703.0874198331 6688236.274062917, 355703.0909057998 6688236.235138511, 355703.0906561349 6688236.196059131, 355703.0875979488 6688236.157104351, 355703.0808311707 6688236.118620094, 355703.07041773456 6688236.08095859, 355703.0564529528 6688236.044464549, 355703.0428214914 6688236.017412395, 355703.0270260757 6688235.991563953, 355703.0091722489 6688235.967091942, 355702.9893793081 6688235.944159879, 355702.96777950786 6688235.922920993, 355702.9447965257 6688235.903212261, 355702.9202806087 6688235.885446485, 355702.8943955692 6688235.869742366, 355702.8673143678 6688235.8562048385, 355702.83921795845 6688235.84492436, 355702.80166766676 6688235.834096856, 355702.76325452153 6688235.826907201, 355702.72433011053 6688235.823421202, 355702.68525070086 6688235.823670756, 355702.6462710457 6688235.826725468, 355702.60776168597 6688235.833491076, 355702.5700750894 6688235.843905659, 355702.5335561918 6688235.857873894, 355702.5065238437 6688235.871508752, 355702.48069543304 6688235.887305875, 355702.45624354045 6688235.905159708, 355702.43333154934 6688235.924950962, 355702.412112553 6688235.946547384, 355702.3924037589 6688235.969530443, 355702.3746379496 6688235.9940463975, 355702.35893383273 6688236.019931435, 355702.3453963407 6688236.047012596, 355702.33411592816 6688236.07510893, 355702.32326345413 6688236.112655638, 355702.3160486677 6688236.151067574, 355702.312537604 6688236.189993159, 355702.3127624001 6688236.22907615, 355702.31584545114 6688236.268034544, 355702.3226373244 6688236.306520013, 355702.333075856 6688236.344180323, 355702.347065504 6688236.3806707775, 355702.360696965 6688236.407722931, 355702.3764923807 6688236.433571373, 355702.39434620744 6688236.458043384, 355702.41413914826 6688236.480975447, 355702.43573894893 6688236.502214335, 355702.45872193086 6688236.521923064, 355702.48323784804 6688236.539688843, 355702.5091228876 6688236.555392963, 355702.5362040889 6688236.568930488, 355702.5643004982 6688236.580210968, 355702.6018471861 6688236.591063336, 355702.64025911986 6688236.598278085, 355702.6791847233 6688236.601789182, 355702.71826771763 6688236.601564491), (355684.8440877901 6688236.510443058, 355685.19112185924 6688236.485821825, 355685.1418793935 6688235.791753689, 355684.447811256 6688235.840996158, 355684.4970537211 6688236.535064296, 355684.8440877901 6688236.510443058), (355684.84101013 6688236.467076292, 355684.8713883381 6688236.463815043, 355684.9013158779 6688236.457665789, 355684.93051883014 6688236.448684817, 355684.9587299067 6688236.436954323, 355684.9795768134 6688236.425701383, 355684.99943499186 6688236.412783405, 355685.0181717535 6688236.398286706, 355685.0356619028 6688236.382308148, 355685.0517885741 6688236.3649544995, 355685.06668373453 6688236.346537975, 355685.0800249652 6688236.326966445, 355685.09172312217 6688236.306370679, 355685.1017000411 6688236.284888303, 355685.1098890578 6688236.262662851, 355685.1175304586 6688236.233078763, 355685.12230978854 6688236.202899861, 355685.1241833037 6688236.17240236, 355685.12313385715 6688236.141865418, 355685.1198727101 6688236.111487227, 355685.1137234916 6688236.081559688, 355685.1047424848 6688236.052356731, 355685.0930118908 6688236.024145645, 355685.0817590406 6688236.003298765, 355685.0688411076 6688235.983440599, 355685.0543444075 6688235.964703836, 355685.0383658061 6688235.947213672, 355685.0210120702 6688235.931086974, 355685.00259560574 6688235.916191858, 355684.98302410316 6688235.902850651, 355684.9624283373 6688235.891152493, 355684.9409459269 6688235.881175551, 355684.91872041463 6688235.87298649, 355684.88913635735 6688235.865345171, 355684.85895746615 6688235.860565866, 355684.8284599629 6688235.858692326, 355684.7979229851 6688235.859741693, 355684.76754477894 6688235.863002943, 355684.7376172406 6688235.869152193, 355684.7084142903 6688235.878133167, 355684.6802032158 6688235.8898636615, 355684.6593563079 6688235.901116599, 355684.63949812774 6688235.914034577, 355684.6207613645 6688235.928531276, 355684.6032712137 6688235.944509833, 355684.5871445409 6688235.961863482, 355684.57224938046 6688235.980280008, 355684.55890814966 6688235.99985154, 355684.54720999254 6688236.020447301, 355684.53723307373 6688236.041929682, 355684.5290440571 6688236.064155132, 355684.52140265744 6688236.093739213, 355684.5166233275 6688236.123918111, 355684.51474981173 6688236.154415607, 355684.5157992579 6688236.184952568, 355684.51906040945 6688236.215330778, 355684.52520963 6688236.245258309, 355684.5341906377 6688236.274461259, 355684.5459212315 6688236.302672337, 355684.55717408156 6688236.323519215, 355684.5700920146 6688236.34337738, 355684.58458871464 6688236.362114144, 355684.6005673162 6688236.379604311, 355684.6179210521 6688236.395731009, 355684.63633751485 6688236.410626122, 355684.6559090158 6688236.42396733, 355684.67650478013 6688236.435665487, 355684.69798718934 6688236.445642429, 355684.7202127001 6688236.453831489, 355684.74979675777 6688236.461472811, 355684.7799756487 6688236.466252114, 355684.81047315197 6688236.468125654, 355684.84101013 6688236.467076292), (355680.6771868247 6688236.793106929, 355681.0543965964 6688236.768899203, 355681.00578125136 6688236.014579482, 355680.25156145357 6688236.063194874, 355680.30007692147 6688236.8174146265, 355680.6771868247 6688236.793106929), (355680.6742108258 6688236.745943244, 355680.70723974524 6688236.742609445, 355680.7397989327 6688236.736134674, 355680.77159038204 6688236.726578193, 355680.8023231133 6688236.714027471, 355680.8250179289 6688236.701958758, 355680.8466512145 6688236.688076807, 355680.8670784203 6688236.672474377, 355680.8861630553 6688236.655255719, 355680.9037776 6688236.636535887, 355680.920096575 6688236.616662438, 355680.93473786913 6688236.595522565, 355680.94760365196 6688236.57325752, 355680.9586079566 6688236.550016075, 355680.96767725394 6688236.525953518, 355680.976190928 6688236.493855741, 355680.98159832717 6688236.461091297, 355680.98384995875 6688236.427960071, 355680.98292521405 6688236.394765302, 355680.9795915236 6688236.361736372, 355680.9731167903 6688236.329177192, 355680.96356027457 6688236.297385745, 355680.95100944524 6688236.266653011, 355680.93894411233 6688236.243938381, 355680.9250638613 6688236.222285059, 355680.9094614386 6688236.201837734, 355680.8922410979 6688236.182733032, 355680.8735179032 6688236.165098605, 355680.85362139076 6688236.14879625, 355680.8324598474 6688236.1341733765, 355680.81017467304 6688236.121327705, 355680.7869147737 6688236.110345058, 355680.76283557044 6688236.101298828, 355680.7307626831 6688236.092788848, 355680.6980233408 6688236.087382689, 355680.6649172008 6688236.08512984, 355680.6317472768 6688236.086050911, 355680.5987183556 6688236.08938471, 355680.56615916645 6688236.095859482, 355680.53436771507 6688236.105415961, 355680.5036349822 6688236.117966686, 355680.48092031915 6688236.130032112, 355680.4592669843 6688236.14391241, 355680.4388196615 6688236.159514831, 355680.4197149756 6688236.176735122, 355680.40208058094 6688236.19545822, 355680.3857616058 6688236.21533167, 355680.3711203116 6688236.236471542, 355680.3582545289 6688236.258736586, 355680.3472502245 6688236.281978034, 355680.3381809269 6688236.306040589, 355680.3296672535 6688236.338138366, 355680.3242598543 6688236.370902806, 355680.3220082222 6688236.404034031, 355680.3229329667 6688236.437228805, 355680.3262666529 6688236.470257707, 355680.332741386 6688236.502816896, 355680.3422979034 6688236.534608354, 355680.3548487354 6688236.565341095, 355680.3669339155 6688236.588059014, 355680.38083421567 6688236.609713985, 355680.39645675546 6688236.63016132, 355680.413697147 6688236.64926439, 355680.4324401917 6688236.666895547, 355680.4523135729 6688236.68321447, 355680.4734534145 6688236.697855738, 355680.495718463 6688236.710721523, 355680.51895994507 6688236.721725849, 355680.5430225645 6688236.730795199, 355680.5751239216 6688236.73928392, 355680.6078895717 6688236.744666197, 355680.64101961756 6688236.746892765, 355680.6742108258 6688236.745943244), (355665.85844735004 6688291.92557388, 355665.723557735 6688291.919816635, 355665.7118433551 6688292.189695701, 355665.98172246874 6688292.201310155, 355665.99343684124 6688291.931431094, 355665.85844735004 6688291.92557388), (355665.857740176 6688291.9424600685, 355665.84586965403 6688291.942388721, 355665.8340466396 6688291.943452041, 355665.82237934537 6688291.945640297, 355665.81097455975 6688291.948933459, 355665.8024354316 6688291.952353336, 355665.79420415167 6688291.956459207, 355665.78633571975 6688291.961223635, 355665.77888271166 6688291.966614789, 355665.7718949268 6688291.972596639, 355665.7653437544 6688291.9790371945, 355665.7593405027 6688291.985991287, 355665.75392528396 6688291.993412454, 355665.7491342824 6688292.001251105, 355665.74499950977 6688292.009454865, 355665.7407550286 6688292.020517106, 355665.7375870992 6688292.031934324, 355665.73552471696 6688292.043602017, 355665.7345867588 6688292.055413382, 355665.73449050466 6688292.067280271, 355665.7355287149 6688292.079102077, 355665.7376918875 6688292.09077057, 355665.74096022337 6688292.102178954, 355665.74438006984 6688292.110718061, 355665.74848592613 6688292.118949335, 355665.75325035624 6688292.126817766, 355665.7586415258 6688292.134270784, 355665.7646234116 6688292.141258587, 355665.7710639455 6688292.147809733, 355665.77801802865 6688292.153812972, 355665.78543919517 6688292.159228191, 355665.79327785753 6688292.164019206, 355665.8014816386 6688292.168154001, 355665.8125651267 6688292.172426915, 355665.82400621887 6688292.175621142, 355665.8357001967 6688292.177707443, 355665.8475400277 6688292.17866672, 355665.8594105492 6688292.178738069, 355665.871233564 6688292.177674749, 355665.8829008583 6688292.175486497, 355665.894305644 6688292.172193334, 355665.90282492334 6688292.168770173, 355665.9110361527 6688292.164662647, 355665.91888446617 6688292.15989821, 355665.9263174221 6688292.154508692, 355665.93328535504 6688292.148530105, 355665.9398563761 6688292.142092833, 355665.9458796785 6688292.135140392, 355665.95131501585 6688292.127719236, 355665.95612606953 6688292.11987895, 355665.96028069383 6688292.111671924, 355665.96452517377 6688292.100609686, 355665.96769310284 6688292.089192474, 355665.9697554853 6688292.077524782, 355665.97069344507 6688292.065713408, 355665.97078969824 6688292.053846505, 355665.9697514875 6688292.042024706, 355665.9675883149 6688292.030356215, 355665.9643199802 6688292.018947839, 355665.9609001337 6688292.010408727, 355665.9567942779 6688292.002177456, 355665.9520298474 6688291.994309025, 355665.9466386778 6688291.986856004, 355665.9406567923 6688291.979868205, 355665.9342162581 6688291.973317056, 355665.9272621748 6688291.9673138205, 355665.9198410083 6688291.961898603, 355665.9120023462 6688291.957107588, 355665.903798565 6688291.95297279, 355665.89271507686 6688291.948699878, 355665.881273985 6688291.945505652, 355665.86958000733 6688291.94341935, 355665.857740176 6688291.9424600685), (355733.9459615788 6688368.499528323, 355733.95217829186 6688368.670394712, 355734.29411095055 6688368.657861463, 355734.28147774126 6688368.316028672, 355733.9396449973 6688368.328561972, 355733.9459615788 6688368.499528323), (355733.9672449458 6688368.49873871, 355733.96834655217 6688368.513724164, 355733.9708751548 6688368.52853577, 355733.97480760975 6688368.543037961, 355733.9801079235 6688368.5570979975, 355733.98529611557 6688368.567520291, 355733.99131821946 6688368.577484027, 355733.9981339962 6688368.586922626, 355734.00569790317 6688368.595773021, 355734.0139593997 6688368.603976077, 355734.0227494599 6688368.611609335, 355734.03213360277 6688368.618499174, 355734.0420491248 6688368.6245995555, 355734.05242977146 6688368.629869722, 355734.06320618046 6688368.634274455, 355734.0776189082 6688368.638522451, 355734.0923716244 6688368.641373725, 355734.1073293007 6688368.642802189, 355734.1223550323 6688368.642794764, 355734.1373404941 6688368.641693106, 355734.1521521016 6688368.639164488, 355734.16665428807 6688368.63523205, 355734.18071431795 6688368.629931789, 355734.1911366296 6688368.624743553, 355734.2011003731 6688368.618721428, 355734.2105389723 6688368.611905651, 355734.2193893605 6688368.604341766, 355734.2275924004 6688368.596080312, 355734.23522568366 6688368.587290223, 355734.2421155347 6688368.577906065, 355734.24821591703 6688368.567990543, 355734.25348606874 6688368.55760991, 355734.2578907762 6688368.546833532, 355734.2621388114 6688368.532420799, 355734.26499010256 6688368.517668085, 355734.2664185531 6688368.502710419, 355734.26641108724 6688368.487684675, 355734.2653094804 6688368.47269922, 355734.2627808777 6688368.457887611, 355734.2588484233 6688368.443385422, 355734.2535481096 6688368.429325387, 355734.24835991766 6688368.418903091, 355734.242337814 6688368.40893936, 355734.23552203726 6688368.399500758, 355734.2279581301 6688368.390650364, 355734.2196966334 6688368.382447309, 355734.21090657316 6688368.374814051, 355734.2015224303 6688368.367924213, 355734.1916069081 6688368.36182383, 355734.18122626154 6688368.356553664, 355734.17044985265 6688368.3521489315, 355734.1560371233 6688368.347900938, 355734.1412844053 6688368.345049661, 355734.1263267271 6688368.343621196, 355734.1113009936 6688368.343628621, 355734.0963155317 6688368.3447302785, 355734.08150392375 6688368.347258897, 355734.0670017376 6688368.351191336, 355734.05294170784 6688368.356491599, 355734.0425193975 6688368.361679835, 355734.0325556556 6688368.367701959, 355734.0231170578 6688368.374517737, 355734.0142666713 6688368.38208162, 355734.0060636327 6688368.390343075, 355733.9984303496 6688368.399133164, 355733.9915404984 6688368.408517323, 355733.9854401162 6688368.418432844, 355733.98016996443 6688368.428813477, 355733.9757652571 6688368.439589856, 355733.9715172197 6688368.454002596, 355733.9686659277 6688368.468755322, 355733.96723747853 6688368.483712999, 355733.9672449458 6688368.49873871), (355641.64775213314 6688291.780689092, 355641.93550743145 6688291.813095147, 355642.0003194936 6688291.237684475, 355641.4249088266 6688291.172872411, 355641.3600967567 6688291.748283082, 355641.64775213314 6688291.780689092), (355641.6518653424 6688291.7447197065, 355641.6772263386 6688291.746645905, 355641.7026553374 6688291.746139804, 355641.72791959246 6688291.743206036, 355641.7527878662 6688291.737871452, 355641.7715306765 6688291.731816937, 355641.7897163604 6688291.724251858, 355641.80722340447 6688291.7152267685, 355641.8239348292 6688291.704801973, 355641.83973897126 6688291.693047127, 355641.85472334875 6688291.680253133, 355641.8686127097 6688291.66627806, 355641.8813142476 6688291.651215285, 355641.8927430931 6688291.635165453, 355641.90282287996 6688291.618235805, 355641.9135558116 6688291.595167434, 355641.92203516845 6688291.571178996, 355641.9281833404 6688291.546490044, 355641.93194405414 6688291.521326563, 355641.93387033866 6688291.49596559, 355641.9333642665 6688291.4705366, 355641.9304304697 6688291.445272337, 355641.92509580083 6688291.420404037, 355641.9190413477 6688291.401661276, 355641.9114763019 6688291.383475617, 355641.9024512125 6688291.365968574, 355641.89202638355 6688291.349257124, 355641.8802714726 6688291.333452937, 355641.8674775206 6688291.318468623, 355641.85350246617 6688291.304579293, 355641.838439689 6688291.291877754, 355641.8223898366 6688291.280448876, 355641.80546015187 6688291.270369024, 355641.78239179036 6688291.259636178, 355641.75840335456 6688291.25115685, 355641.7337144052 6688291.245008649, 355641.7085509156 6688291.2412478505, 355641.68318991724 6688291.239321651, 355641.65776091686 6688291.239827756, 355641.6324966598 6688291.242761525, 355641.60762838426 6688291.248096107, 355641.5888855756 6688291.254150626, 355641.570699893 6688291.261715702, 355641.55319285067 6688291.27074079, 355641.5364814276 6688291.28116559, 355641.5206772867 6688291.292920435, 355641.50569290784 6688291.305714426, 355641.49180354556 6688291.319689498, 355641.479102006 6688291.334752274, 355641.4676731593 6688291.350802107, 355641.4575933707 6688291.367731751, 355641.44686044 6688291.390800119, 355641.4383810838 6688291.414788557, 355641.43223291193 6688291.439477505, 355641.4284721964 6688291.464640992, 355641.42654591164 6688291.490001975, 355641.42705198436 6688291.515430963, 355641.4299857811 6688291.540695223, 355641.4353204496 6688291.565563519, 355641.44137490273 6688291.58430628, 355641.44893994863 6688291.602491941, 355641.4579650381 6688291.619998986, 355641.46838986693 6688291.636710433, 355641.48014477786 6688291.652514619, 355641.49293873017 6688291.667498936, 355641.50691378437 6688291.681388265, 355641.52197656134 6688291.694089801, 355641.5380264139 6688291.705518681, 355641.55495609867 6688291.715598533, 355641.57802446187 6688291.726331378, 355641.60201289976 6688291.734810709, 355641.6267018508 6688291.740958907, 355641.6518653424 6688291.7447197065), (355734.98690595094 6688399.530123714, 355735.02178154886 6688399.958897282, 355735.87932868185 6688399.889146081, 355735.8095774392 6688399.031698868, 355734.9520303072 6688399.101450068, 355734.98690595094 6688399.530123714), (355735.0405650569 6688399.525851724, 355735.04497287754 6688399.563377502, 355735.052946556 6688399.600310332, 355735.06441311043 6688399.636312169, 355735.07926759013 6688399.6710535055, 355735.0934662454 6688399.696649743, 355735.10970804794 6688399.721000806, 355735.1278844716 6688399.743943979, 355735.14787406405 6688399.765325966, 355735.1695432566 6688399.785003887, 355735.19247156486 6688399.803194581, 355735.2168090053 6688399.819451855, 355735.24239295843 6688399.8336670855, 355735.2690524744 6688399.845745287, 355735.2966094176 6688399.855605751, 355735.3332964912 6688399.8646833375, 355735.37068314623 6688399.870213573, 355735.4084271899 6688399.872145841, 355735.44618315826 6688399.87046245, 355735.4837125512 6688399.866029643, 355735.52064659575 6688399.858030831, 355735.556647243 6688399.846539224, 355735.5913849874 6688399.831659998, 355735.61699782213 6688399.817484365, 355735.641367297 6688399.80126421, 355735.66433057986 6688399.783107915, 355735.68573423417 6688399.763136796, 355735.70543524454 6688399.741484292, 355735.72362927604 6688399.718536058, 355735.7398882311 6688399.694178532, 355735.7541034701 6688399.668574461, 355735.76618000993 6688399.64189493, 355735.77603715693 6688399.614318208, 355735.7850899767 6688399.577627505, 355735.7905951491 6688399.540239633, 355735.7925022863 6688399.502496795, 355735.7907939316 6688399.464744426, 355735.7863861105 6688399.427218644, 355735.778412432 6688399.390285817, 355735.7669458777 6688399.354283977, 355735.7520913983 6688399.319542643, 355735.7378960275 6688399.293926556, 355735.7216558774 6688399.269555445, 355735.7034794627 6688399.246592148, 355735.6834882363 6688399.225190111, 355735.6618157774 6688399.205492339, 355735.63888746925 6688399.187301646, 355735.6145500285 6688399.171044371, 355735.5889660758 6688399.15682914, 355735.56230655994 6688399.144750944, 355735.5347496165 6688399.134890475, 355735.49805893714 6688399.125837751, 355735.4606710688 6688399.12033261, 355735.4229282157 6688399.118425441, 355735.3851758302 6688399.120133697, 355735.3476464373 6688399.124566506, 355735.3107123929 6688399.132565318, 355735.27471174573 6688399.144056927, 355735.23997400125 6688399.15893615, 355735.21436116664 6688399.173111786, 355735.1899916916 6688399.189331938, 355735.1670284089 6688399.207488234, 355735.14562475454 6688399.227459354, 355735.12592374417 6688399.249111856, 355735.1077297143 6688399.272060089, 355735.09147076117 6688399.296417617, 355735.0772555235 6688399.322021686, 355735.065178985 6688399.3487012135, 355735.05532183923 6688399.376277937, 355735.0462690164 6688399.412968647, 355735.040763842 6688399.450356525, 355735.0388567038 6688399.488099368, 355735.0405650569 6688399.525851724), (355761.3021536163 6688312.342719093, 355761.5838130612 6688312.376721034, 355761.65181703697 6688311.813202297, 355761.08839817985 6688311.745298288, 355761.02039424947 6688312.308717105, 355761.3021536163 6688312.342719093), (355761.3063663683 6688312.307549113, 355761.3312225077 6688312.309630572, 355761.35616379644 6688312.309327263, 355761.38096195296 6688312.306641967, 355761.4053900049 6688312.301599258, 355761.4238056708 6688312.295796481, 355761.4416858645 6688312.2885090215, 355761.4589111132 6688312.2797855735, 355761.4753663208 6688312.2696844265, 355761.49094153574 6688312.258273075, 355761.5057212853 6688312.245853058, 355761.5194372459 6688312.232267422, 355761.53199777054 6688312.217606943, 355761.54331893113 6688312.201969583, 355761.55332508154 6688312.185459824, 355761.5640284078 6688312.162945663, 355761.57253125584 6688312.13951172, 355761.5787558011 6688312.11537249, 355761.58264507115 6688312.090748912, 355761.58472661267 6688312.065892814, 355761.5844233337 6688312.040951527, 355761.58173800836 6688312.016153358, 355761.5766952141 6688311.991725274, 355761.5708925009 6688311.973309656, 355761.56360507425 6688311.955429487, 355761.55488162744 6688311.938204238, 355761.54478044953 6688311.921749009, 355761.53336903534 6688311.906173748, 355761.5209490555 6688311.891394062, 355761.5073634375 6688311.877678134, 355761.49270295835 6688311.865117609, 355761.47706557746 6688311.853796417, 355761.46055578167 6688311.843790203, 355761.4380416268 6688311.833086958, 355761.4146076907 6688311.824584139, 355761.3904684589 6688311.818359565, 355761.3658448725 6688311.814470209, 355761.34098873305 6688311.812388753, 355761.3160474442 6688311.812692061, 355761.291249288 6688311.815377361, 355761.26682123606 6688311.820420069, 355761.2484088545 6688311.826202998, 355761.23053031316 6688311.833470405, 355761.2133050735 6688311.842173733, 355761.1968482321 6688311.852254828, 355761.1812697511 6688311.86364633, 355761.1664867171 6688311.876086193, 355761.152769104 6688311.889691883, 355761.14020857034 6688311.904372478, 355761.12888904364 6688311.920029891, 355761.11888615944 6688311.936559498, 355761.10818283225 6688311.959073663, 355761.0996799836 6688311.982507605, 355761.0934554384 6688312.006646838, 355761.08956616966 6688312.03127041, 355761.0874882336 6688312.056101668, 355761.0877927272 6688312.081017852, 355761.0904768624 6688312.105790918, 355761.09551607264 6688312.130194126, 355761.1013155013 6688312.148629593, 355761.1086012756 6688312.166529812, 355761.11732471327 6688312.18377518, 355761.1274275249 6688312.200250462, 355761.1388422056 6688312.215845576, 355761.15126218525 6688312.23062526, 355761.1648478035 6688312.244341189, 355761.17950828245 6688312.256901715, 355761.19514566334 6688312.268222908, 355761.21165545913 6688312.278229121, 355761.23416961386 6688312.288932364, 355761.2576035503 6688312.297435188, 355761.28174278245 6688312.303659761, 355761.3063663683 6688312.307549113), (355817.8581217985 6688354.368674192, 355817.9048906357 6688353.918754958, 355817.0049522954 6688353.825117313, 355816.9113146066 6688354.725155581, 355817.8113529155 6688354.818693346, 355817.8581217985 6688354.368674192), (355817.80186939327 6688354.3628530605, 355817.8045472589 6688354.323206972, 355817.8034242163 6688354.283486395, 355817.7985105425 6688354.244054904, 355817.78985121154 6688354.205273406, 355817.7801464513 6688354.176056959, 355817.76808785286 6688354.147730735, 355817.7537559907 6688354.120484012, 355817.7372466278 6688354.094498844, 355817.7186700779 6688354.069948862, 355817.6984546015 6688354.0467013, 355817.67640791496 6688354.025182465, 355817.65267733193 6688354.00553615, 355817.62742141646 6688353.987893624, 355817.60080892534 6688353.972372776, 355817.56463493925 6688353.955905998, 355817.52705291274 6688353.942971346, 355817.4884068261 6688353.933687204, 355817.4490503994 6688353.928138556, 355817.4094006517 6688353.925485689, 355817.3696788537 6688353.926633876, 355817.33024856943 6688353.931572599, 355817.29147069587 6688353.9402566645, 355817.26225417736 6688353.949961524, 355817.23392792064 6688353.962020173, 355817.20668119774 6688353.976352036, 355817.18069606647 6688353.992861347, 355817.1561461555 6688354.011437798, 355817.13290177815 6688354.031633487, 355817.11138454947 6688354.053660154, 355817.0917382443 6688354.077370619, 355817.0740941357 6688354.102606449, 355817.058570119 6688354.129199027, 355817.04210320726 6688354.165373029, 355817.02916850906 6688354.202955063, 355817.0198844129 6688354.241601148, 355817.01433589525 6688354.280957554, 355817.01167928777 6688354.320632119, 355817.0128262125 6688354.360379004, 355817.01776617224 6688354.399834394, 355817.0264539529 6688354.438637174, 355817.03615871316 6688354.4678536225, 355817.0482173114 6688354.496179846, 355817.0625491735 6688354.523426569, 355817.07905853627 6688354.5494117355, 355817.09763508645 6688354.573961719, 355817.1178339988 6688354.59718615, 355817.13986228674 6688354.61868328, 355817.16357276053 6688354.638309468, 355817.18880699005 6688354.655933578, 355817.21539636306 6688354.671437838, 355817.25157034927 6688354.687904617, 355817.28915237583 6688354.700839272, 355817.32779846236 6688354.710123411, 355817.36715488904 6688354.715672057, 355817.4068258948 6688354.7183533935, 355817.4465715749 6688354.717231519, 355817.4860281451 6688354.712316699, 355817.5248344688 6688354.703653918, 355817.55405427207 6688354.6939292075, 355817.58238218114 6688354.68185051, 355817.609628913 6688354.667498527, 355817.6356124104 6688354.6509691635, 355817.6601590551 6688354.632372862, 355817.68340343225 6688354.612177172, 355817.7049206611 6688354.590150506, 355817.724566966 6688354.566440041, 355817.7422110748 6688354.541204209, 355817.7577350916 6688354.514611633, 355817.77417713695 6688354.478434033, 355817.78708673915 6688354.440850792, 355817.7963457392 6688354.402205903, 355817.80186939327 6688354.3628530605), (355777.6667029046 6688350.917310543, 355777.6929834574 6688350.477573788, 355776.813609922 6688350.424912799, 355776.76094893203 6688351.304286338, 355777.6403224683 6688351.356947328, 355777.6667029046 6688350.917310543), (355777.6117483181 6688350.91398801, 355777.61266183964 6688350.875304583, 355777.6098745217 6688350.836710888, 355777.6034118757 6688350.798560164, 355777.59333305317 6688350.761201592, 355777.5826341543 6688350.7331868885, 355777.5696828902 6688350.706139598, 355777.554565799 6688350.680240435, 355777.5373838919 6688350.655662469, 355777.51825197536 6688350.632569913, 355777.4976215307 6688350.6108442405, 355777.475285561 6688350.59087611, 355777.451393313 6688350.572798949, 355777.42610443087 6688350.556733538, 355777.399587892 6688350.5427872315, 355777.363683266 6688350.528314267, 355777.3265598956 6688350.517338568, 355777.28855756373 6688350.509960591, 355777.25002409733 6688350.506247865, 355777.2113406411 6688350.505334475, 355777.17274693557 6688350.508121836, 355777.13459621987 6688350.514584439, 355777.09723767923 6688350.524663129, 355777.06922619755 6688350.535342283, 355777.04218052485 6688350.548273551, 355777.0162813752 6688350.563370522, 355776.9917018025 6688350.580532326, 355776.9686060432 6688350.599644288, 355776.94687699905 6688350.620294645, 355776.9269071734 6688350.642650697, 355776.9088300006 6688350.666563062, 355776.8927662695 6688350.691871959, 355776.8788233154 6688350.718408282, 355776.864353833 6688350.754288066, 355776.853379305 6688350.791386355, 355776.84600017837 6688350.829363592, 355776.8422839936 6688350.8678721655, 355776.84137047204 6688350.906555598, 355776.84415779053 6688350.945149292, 355776.85062043654 6688350.9833000135, 355776.86069925857 6688351.020658581, 355776.8713981573 6688351.048673283, 355776.8843494218 6688351.0757205775, 355776.8994665128 6688351.101619738, 355776.91664842 6688351.126197705, 355776.93578033627 6688351.149290261, 355776.95640749624 6688351.17103578, 355776.97874181333 6688351.19102396, 355777.0026340525 6688351.209121244, 355777.0279245686 6688351.225206705, 355777.0544443738 6688351.239172864, 355777.0903489999 6688351.253645827, 355777.12747237034 6688351.264621528, 355777.16547470225 6688351.271999504, 355777.20400816866 6688351.275712232, 355777.242691625 6688351.276625622, 355777.2812853305 6688351.273838258, 355777.31943604606 6688351.2673756555, 355777.35679458687 6688351.257296965, 355777.384789504 6688351.246594679, 355777.4118167786 6688351.23364171, 355777.437695819 6688351.218524609, 355777.46225370566 6688351.201344387, 355777.4853263468 6688351.182215837, 355777.5070752396 6688351.1615687655, 355777.5270651161 6688351.139214367, 355777.54516240733 6688351.115302012, 355777.5612461908 6688351.089991481, 355777.57520899654 6688351.063451889, 355777.58967847744 6688351.02757211, 355777.6006530047 6688350.990473826, 355777.60803213133 6688350.952496596, 355777.6117483181 6688350.91398801), (355811.65305032016 6688316.460806839, 355811.35210315953 6688316.433590659, 355811.2975708323 6688317.035584848, 355811.89956502285 6688317.090117178, 355811.9540973496 6688316.488122988, 355811.65305032016 6688316.460806839), (355811.6496357864 6688316.498475186, 355811.62313676934 6688316.497044007, 355811.5966222611 6688316.498151609, 355811.57033494365 6688316.501787856, 355811.54451541865 6688316.507919469, 355811.5250887639 6688316.514656116, 355811.50627723255 6688316.522956897, 355811.48820651957 6688316.532766343, 355811.47099737084 6688316.544018916, 355811.4547647752 6688316.556639424, 355811.4394076999 6688316.570330165, 355811.42522012803 6688316.585229434, 355811.412296858 6688316.601237673, 355811.4007242411 6688316.618247917, 355811.39057960414 6688316.636146507, 355811.3799186275 6688316.660469255, 355811.3716307664 6688316.685699457, 355811.3657918776 6688316.711606183, 355811.3624554044 6688316.737952306, 355811.36102052993 6688316.7644761745, 355811.36212689104 6688316.791015764, 355811.3657643601 6688316.817328181, 355811.3718996442 6688316.84317259, 355811.37863622315 6688316.862599198, 355811.38693696924 6688316.881410708, 355811.396746418 6688316.899481421, 355811.40799902397 6688316.9166905945, 355811.42061959865 6688316.932923237, 355811.4343334306 6688316.9482636815, 355811.4492543794 6688316.962432824, 355811.46528274537 6688316.975335986, 355811.4823114291 6688316.98688695, 355811.50022664684 6688316.997008533, 355811.5245209149 6688317.007690679, 355811.54972480296 6688317.01600239, 355811.57560762495 6688317.021867592, 355811.6019324812 6688317.025232604, 355811.6284563606 6688317.026667386, 355811.6549959614 6688317.025560997, 355811.68130837294 6688317.02192356, 355811.7071527635 6688317.015788365, 355811.7265827024 6688317.009031871, 355811.74539588636 6688317.000711039, 355811.7634666086 6688316.99088147, 355811.78067412315 6688316.979608848, 355811.7969034527 6688316.966968488, 355811.81224068045 6688316.953274464, 355811.8264082033 6688316.938373544, 355811.8393113562 6688316.9223652985, 355811.85086392233 6688316.905356686, 355811.8609887093 6688316.887461362, 355811.8716745451 6688316.863142229, 355811.87998749764 6688316.837913245, 355811.8858514804 6688316.812005337, 355811.8892128234 6688316.78565561, 355811.89064409205 6688316.7591566015, 355811.88953651726 6688316.732642106, 355811.88590023865 6688316.706354785, 355811.87976853776 6688316.680535244, 355811.8730153948 6688316.661085502, 355811.8646962505 6688316.642252291, 355811.8548666923 6688316.624161449, 355811.84359240014 6688316.606933859, 355811.8309487071 6688316.590684631, 355811.81725472363 6688316.575347467, 355811.8023538256 6688316.561179981, 355811.78634557803 6688316.548276826, 355811.76933694666 6688316.536724231, 355811.75144158077 6688316.526599382, 355811.72711884504 6688316.515938495, 355811.701888651 6688316.507650665, 355811.6759819251 6688316.5018117465, 355811.6496357864 6688316.498475186), (355762.7239650429 6688302.422294464, 355763.0097212136 6688302.456298281, 355763.077728848 6688301.884785936, 355762.50621655287 6688301.816678381, 355762.4382088722 6688302.3882906465, 355762.7239650429 6688302.422294464), (355762.7281780769 6688302.386524964, 355762.7533646536 6688302.388603569, 355762.778634595 6688302.388265845, 355762.8037566112 6688302.385514882, 355762.8285007655 6688302.380375863, 355762.8471974496 6688302.374476841, 355762.86534986214 6688302.367070511, 355762.88283671136 6688302.358206357, 355762.89954115264 6688302.347943604, 355762.9153515699 6688302.336350833, 355762.93030638725 6688302.323735473, 355762.94418087706 6688302.309940849, 355762.95688233123 6688302.295059135, 355762.9683258816 6688302.279189768, 355762.97843506356 6688302.26243878, 355762.98926346353 6688302.239587346, 355762.99785858195 6688302.215805723, 355763.0041417504 6688302.191311584, 355763.0080554589 6688302.166329123, 355763.0101377533 6688302.14111773, 355763.00980127166 6688302.115822696, 355763.00704908994 6688302.09067557, 355763.00190639845 6688302.065906515, 355762.9960041593 6688302.047229729, 355762.9885962076 6688302.029097387, 355762.97973204264 6688302.011630655, 355762.9694708935 6688301.99494624, 355762.95788132376 6688301.979155626, 355762.9452461554 6688301.964197591, 355762.9314315004 6688301.950321481, 355762.91652966687 6688301.937620017, 355762.9006402268 6688301.92617807, 355762.8838693511 6688301.916072089, 355762.8610179239 6688301.905243777, 355762.83723630663 6688301.896648688, 355762.81274216773 6688301.890365491, 355762.7877596968 6688301.886451699, 355762.7625731199 6688301.884373096, 355762.73730317847 6688301.8847108185, 355762.7121811625 6688301.887461782, 355762.68743700825 6688301.892600805, 355762.6687403225 6688301.898499821, 355762.6505879087 6688301.905906151, 355762.633101058 6688301.914770307, 355762.61639661534 6688301.925033059, 355762.60058619647 6688301.93662583, 355762.5856280959 6688301.949261036, 355762.57175195555 6688301.9630757095, 355762.5590504934 6688301.977977541, 355762.54760857875 6688301.993866962, 355762.53750266443 6688302.0106378, 355762.52667426487 6688302.033489233, 355762.51807914645 6688302.057270855, 355762.51179597824 6688302.081764992, 355762.50788226916 6688302.106747459, 355762.50580357923 6688302.131934016, 355762.5061412764 6688302.157203949, 355762.5088922681 6688302.182325969, 355762.51403137494 6688302.207070144, 355762.5199336141 6688302.225746932, 355762.52734156564 6688302.2438792735, 355762.53620573034 6688302.261346005, 355762.5464668798 6688302.27803042, 355762.5580564499 6688302.293821036, 355762.5706883326 6688302.308798919, 355762.5845013338 6688302.32269508, 355762.5994031565 6688302.33541666, 355762.615294229 6688302.346878662, 355762.63206836925 6688302.357004491, 355762.654923404 6688302.3678079415, 355762.67870623636 6688302.376377936, 355762.7031991869 6688302.382636036, 355762.7281780769 6688302.386524964), (355761.8632856029 6688302.350057665, 355762.1598400659 6688302.368978483, 355762.19748180755 6688301.775969388, 355761.60457267996 6688301.738227771, 355761.566831016 6688302.331236817, 355761.8632856029 6688302.350057665), (355761.8657006681 6688302.312988383, 355761.8917712988 6688302.313697389, 355761.91779037047 6688302.311911857, 355761.94351973676 6688302.307648127, 355761.9687239021 6688302.300945221, 355761.9876440656 6688302.2938188845, 355762.0059189718 6688302.285171087, 355762.0234265107 6688302.275059608, 355762.0400496998 6688302.263552012, 355762.0556774657 6688302.250725191, 355762.07039268094 6688302.2368466705, 355762.083925202 6688302.221812674, 355762.09618460713 6688302.20572366, 355762.1070889805 6688302.188687129, 355762.1165654615 6688302.170816922, 355762.12641600036 6688302.1466559, 355762.13391258905 6688302.121664132, 355762.1389866127 6688302.09607036, 355762.1415916306 6688302.07010883, 355762.14230433374 6688302.044013382, 355762.14052004437 6688302.017969215, 355762.1362550918 6688301.992214737, 355762.1295485131 6688301.96698568, 355762.1223991152 6688301.948082121, 355762.11372964864 6688301.929825634, 355762.1035980423 6688301.912338205, 355762.0920719936 6688301.895736679, 355762.0792285186 6688301.880131989, 355762.0653731746 6688301.865400269, 355762.05036090396 6688301.851849378, 355762.03429201647 6688301.839569866, 355762.017273882 6688301.828643777, 355761.99942021386 6688301.81914412, 355761.97525559436 6688301.809318528, 355761.9502626132 6688301.801847059, 355761.9246700265 6688301.796798104, 355761.8987120775 6688301.794217869, 355761.87261658476 6688301.793505254, 355761.84657242015 6688301.795289575, 355761.82081796014 6688301.799554497, 355761.7955889291 6688301.806260983, 355761.77666876547 6688301.813387319, 355761.7583938593 6688301.822035121, 355761.7408863204 6688301.832146598, 355761.7242631313 6688301.843654196, 355761.70863536565 6688301.856481019, 355761.6939201505 6688301.870359538, 355761.6803876294 6688301.885393533, 355761.66812822415 6688301.901482542, 355761.6572238508 6688301.918519074, 355761.6477473698 6688301.936389282, 355761.63789683057 6688301.9605503045, 355761.6304002421 6688301.985542077, 355761.62532621843 6688302.011135849, 355761.6227212004 6688302.037097371, 355761.6220084956 6688302.063192834, 355761.6237927836 6688302.089236998, 355761.6280577339 6688302.114991468, 355761.63476431055 6688302.140220524, 355761.6419137101 6688302.159124083, 355761.650583178 6688302.177380571, 355761.6607147861 6688302.194868001, 355761.6722408361 6688302.211469527, 355761.6850843125 6688302.227074216, 355761.69894293905 6688302.241786088, 355761.7139568606 6688302.255316925, 355761.7300257561 6688302.267576323, 355761.7470422552 6688302.278482362, 355761.7648926554 6688302.287962166, 355761.7890785335 6688302.297816228, 355761.8140953958 6688302.305314002, 355761.8397142688 6688302.310386864, 355761.8657006681 6688302.312988383), (355812.8633641166 6688307.120621647, 355813.1483217559 6688307.152826515, 355813.2126315718 6688306.5829111915, 355812.6427162935 6688306.518501454, 355812.57840647723 6688307.088416778, 355812.8633641166 6688307.120621647), (355812.8673772589 6688307.084951976, 355812.8924860142 6688307.086866974, 355812.91766285646 6688307.086373827, 355812.9426773474 6688307.083477052, 355812.9673005349 6688307.0782031575, 355812.98586813523 6688307.072221604, 355813.0038851539 6688307.064743555, 355813.0212312044 6688307.055818981, 355813.0377903829 6688307.045507509, 355813.0534520439 6688307.033878046, 355813.0682943382 6688307.021203284, 355813.0820518291 6688307.007358644, 355813.09463259083 6688306.992436637, 355813.10595256096 6688306.976536967, 355813.1159361013 6688306.959765876, 355813.126586845 6688306.936914069, 355813.13500508596 6688306.913149053, 355813.14111377375 6688306.888688349, 355813.14485699893 6688306.863755816, 355813.1467720819 6688306.838647067, 355813.1462789626 6688306.813470235, 355813.1433821573 6688306.788455741, 355813.13810817944 6688306.763832531, 355813.132126688 6688306.745264981, 355813.12464867043 6688306.727247986, 355813.1157240946 6688306.709901935, 355813.105412593 6688306.693342737, 355813.0937830659 6688306.677681033, 355813.0811083427 6688306.6628388, 355813.06726372364 6688306.64908134, 355813.0523417167 6688306.636500579, 355813.03644202894 6688306.625180577, 355813.0196708994 6688306.615196973, 355812.9968190934 6688306.60454631, 355812.9730540755 6688306.596128096, 355812.9485933619 6688306.590019381, 355812.9236608362 6688306.586276073, 355812.89855207875 6688306.584361073, 355812.8733752347 6688306.584854218, 355812.84836074215 6688306.587750996, 355812.82373755256 6688306.593024887, 355812.8051666695 6688306.599026292, 355812.78714799974 6688306.606524389, 355812.76980194176 6688306.615469085, 355812.75324439857 6688306.625800607, 355812.73758600536 6688306.637449923, 355812.7227437109 6688306.650124686, 355812.7089862202 6688306.663969324, 355812.69640545844 6688306.678891332, 355812.6850854884 6688306.694791002, 355812.675101948 6688306.711562093, 355812.66445480945 6688306.734389037, 355812.65603778156 6688306.758128959, 355812.6499279035 6688306.782564571, 355812.646181096 6688306.8074722355, 355812.6442660113 6688306.832580974, 355812.64475912804 6688306.857757805, 355812.64765593153 6688306.882772304, 355812.652929908 6688306.907395515, 355812.65890811506 6688306.925982915, 355812.6663844801 6688306.944019958, 355812.6753090467 6688306.961386128, 355812.68562218244 6688306.977965381, 355812.6972549758 6688306.9936469365, 355812.70992970024 6688307.008489168, 355812.72377432085 6688307.022246629, 355812.7386963292 6688307.034827392, 355812.7545960188 6688307.046147394, 355812.7713671498 6688307.056130997, 355812.7942225617 6688307.066756794, 355812.81798879296 6688307.075149913, 355812.8424483164 6688307.081233537, 355812.8673772589 6688307.084951976))
-25280;24903;T17-ASSAINISSEMENT;43-50-14-C;Continu;T17_254;20220609;MULTILINESTRING ((355776.361421819 6688354.023231702, 355776.3826755146 6688354.057092535, 355776.4065888068 6688354.088711323, 355776.4329753093 6688354.117841621, 355776.4616293585 6688354.144256376, 355776.4923276178 6688354.167749707, 355776.524830816 6688354.188138501, 355776.55888561485 6688354.20526384, 355776.5942265826 6688354.218992246, 355776.63057826215 6688354.229216718, 355776.66765731864 6688354.235857561, 355776.70517474844 6688354.2388630165, 355776.7428381304 6688354.238209656, 355776.7803539064 6688354.233902574, 355776.8174296688 6688354.225975344, 355776.8537764387 6688354.214489748, 355776.88911091996 6688354.199535308, 355776.92315770674 6688354.181228587, 355776.95565142867 6688354.159712271, 355776.9863388214 6688354.13515406, 355777.01498069946 6688354.107745374, 355777.04135382007 6688354.077699837, 355776.361421819 6688354.023231702), (355777.88877931697 6688347.745445589, 355777.8679164002 6688347.711549651, 355777.8444269824 6688347.679898469, 355777.81849414605 6688347.650738742, 355777.7903200192 6688347.624297742, 355777.7601241978 6688347.600781565, 355777.72814203624 6688347.580373498, 355777.6946228122 6688347.563232607, 355777.6598277836 6688347.549492495, 355777.6240281514 6688347.539260254, 355777.58750294783 6688347.53261564, 355777.55053686013 6688347.529610439, 355777.5134180114 6688347.530268075, 355777.4764357159 6688347.534583421, 355777.43987822375 6688347.542522848, 355777.4040304732 6688347.554024467, 355777.3691718715 6688347.568998637, 355777.33557411574 6688347.587328642, 355777.3034990757 6688347.608871611, 355777.2731967526 6688347.633459639, 355777.2449033309 6688347.660901074, 355777.2188393372 6688347.690982034, 355777.88877931697 6688347.745445589), (355641.1247782954 6688291.980389788, 355641.1600357569 6688291.975095351, 355641.19880043325 6688291.97077873, 355641.2407701821 6688291.967473563, 355641.2856178805 6688291.965205613, 355641.33299397334 6688291.9639925575, 355641.38252919883 6688291.963843853, 355641.4338374664 6688291.964760655, 355641.4865188658 6688291.96673582, 355641.54016278416 6688291.969753955, 355641.5943511067 6688291.973791533, 355641.648661475 6688291.978817084, 355641.70267058007 6688291.984791436, 355641.7559574603 6688291.99166803, 355641.808106784 6688291.999393264, 355641.8587120851 6688292.00790692, 355641.90737893264 6688292.017142648, 355641.9537280045 6688292.027028463, 355641.99739804363 6688292.037487305, 355642.0380486739 6688292.04843766, 355642.075363054 6688292.059794177, 355642.1090503453 6688292.071468339, 355641.1247782954 6688291.980389788), (355727.13654054323 6688339.833401492, 355727.1433316409 6688339.794050497, 355727.14929472643 6688339.750695127, 355727.1543833223 6688339.703673308, 355727.1585577662 6688339.653351535, 355727.16178552184 6688339.600122033, 355727.16404143063 6688339.5443996815, 355727.16530791053 6688339.486618806, 355727.165575089 6688339.427229755, 355727.1648408845 6688339.3666954255, 355727.163111019 6688339.30548764, 355727.16039897624 6688339.244083471, 355727.1567258937 6688339.182961511, 355727.15212040104 6688339.122598168, 355727.1466183944 6688339.063463926, 355727.14026275807 6688339.006019694, 355727.13310302916 6688338.950713206, 355727.12519501284 6688338.897975535, 355727.1166003463 6688338.848217739, 355727.1073860186 6688338.8018276375, 355727.09762384876 6688338.759166808, 355727.08738992526 6688338.720567757, 355727.13654054323 6688339.833401492), (355811.29984638357 6688316.212143579, 355811.33405776747 6688316.223768604, 355811.3719462223 6688316.235070332, 355811.4132164356 6688316.245960679, 355811.45754673594 6688316.2563547585, 355811.5045916018 6688316.26617156, 355811.55398435256 6688316.275334566, 355811.6053400083 6688316.28377236, 355811.65825828945 6688316.2914191745, 355811.71232673683 6688316.298215407, 355811.7671239267 6688316.304108086, 355811.8222227552 6688316.309051288, 355811.8771937673 6688316.313006475, 355811.9316085049 6688316.315942826, 355811.98504284467 6688316.317837452, 355812.0370803054 6688316.318675587, 355812.0873152934 6688316.318450696, 355812.1353562634 6688316.317164534, 355812.180828772 6688316.3148271255, 355812.223378394 6688316.311456689, 355812.2626734865 6688316.30707949, 355812.2984077731 6688316.301729651, 355811.29984638357 6688316.212143579), (355761.2784688446 6688302.533043458, 355761.3142242036 6688302.527565474, 355761.3535482093 6688302.523047264, 355761.39613436 6688302.519524047, 355761.4416507277 6688302.51702328, 355761.48974254634 6688302.515564459, 355761.54003497487 6688302.51515895, 355761.5921360214 6688302.515809916, 355761.64563959645 6688302.517512284, 355761.70012867876 6688302.520252784, 355761.755178566 6688302.524010054, 355761.81036018475 6688302.528754812, 355761.865243435 6688302.534450074, 355761.91940054216 6688302.541051449, 355761.97240939154 6688302.548507488, 355762.02385681774 6688302.556760074, 355762.0733418264 6688302.565744884, 355762.12047871784 6688302.575391888, 355762.1649000947 6688302.585625894, 355762.2062597254 6688302.59636714, 355762.2442352414 6688302.607531902, 355762.27853065176 6688302.619033155), (355762.27853065176 6688302.619033155, 355761.2784688446 6688302.533043458), (355762.27853065176 6688302.619033155, 355762.3137112678 6688302.613644748, 355762.35239490436 6688302.609224959, 355762.39428005076 6688302.6058082385, 355762.43904024304 6688302.603421213, 355762.48632660887 6688302.6020824965, 355762.5357705856 6688302.601802514, 355762.58698679367 6688302.602583452, 355762.63957604056 6688302.604419223, 355762.69312843133 6688302.607295519, 355762.7472265649 6688302.611189918, 355762.80144878593 6688302.616072074, 355762.8553724722 6688302.621903925, 355762.90857732814 6688302.628640022, 355762.96064866096 6688302.63622786, 355763.011180613 6688302.644608298, 355763.0597793248 6688302.653716017, 355763.1060660055 6688302.6634800285, 355763.14967988356 6688302.673824228, 355763.1902810218 6688302.6846679915, 355763.2275529634 6688302.695926798, 355763.26120520185 6688302.707512897, 355762.27853065176 6688302.619033155), (355812.3481925424 6688307.301840806, 355812.38375384005 6688307.2968034735, 355812.42284381564 6688307.292769651, 355812.46515779203 6688307.289770782, 355812.5103659626 6688307.287830236, 355812.5581159628 6688307.286963144, 355812.60803561675 6688307.287176261, 355812.6597358372 6688307.288467926, 355812.7128136595 6688307.290828073, 355812.7668553801 6688307.294238305, 355812.8214397844 6688307.298672044, 355812.87614142644 6688307.304094725, 355812.9305339478 6688307.3104640925, 355812.984193398 6688307.317730496, 355813.0367015416 6688307.325837301, 355813.08764911623 6688307.334721319, 355813.1366390228 6688307.344313307, 355813.18328942085 6688307.354538501, 355813.2272367049 6688307.365317205, 355813.26813833864 6688307.376565407, 355813.30567552376 6688307.388195436, 355813.33955568477 6688307.40011664, 355812.3481925424 6688307.301840806))
-25270;24893;T17-ASSAINISSEMENT;43-50-14-C;ByBlock;T17_254;20220609;MULTILINESTRING ((355776.361421819 6688354.023231702, 355776.3826755146 6688354.057092535, 355776.4065888068 6688354.088711323, 355776.4329753093 6688354.117841621, 355776.4616293585 6688354.144256376, 355776.4923276178 6688354.167749707, 355776.524830816 6688354.188138501, 355776.55888561485 6688354.20526384, 355776.5942265826 6688354.218992246, 355776.63057826215 6688354.229216718, 355776.66765731864 6688354.235857561, 355776.70517474844 6688354.2388630165, 355776.7428381304 6688354.238209656, 355776.7803539064 6688354.233902574, 355776.8174296688 6688354.225975344, 355776.8537764387 6688354.214489748, 355776.88911091996 6688354.199535308, 355776.92315770674 6688354.181228587, 355776.95565142867 6688354.159712271, 355776.9863388214 6688354.13515406, 355777.01498069946 6688354.107745374, 355777.04135382007 6688354.077699837), (355777.04135382007 6688354.077699837, 355776.361421819 6688354.023231702), (355776.361421819 6688354.023231702, 355776.3014262251 6688354.772705628, 355776.98145819455 6688354.827073891, 355777.0263799137 6688354.265043351), (355777.0263799137 6688354.265043351, 355777.04135382007 6688354.077699837), (355777.0263799137 6688354.265043351, 355776.34644786664 6688354.210675135), (355777.88877931697 6688347.745445589, 355777.8679164002 6688347.711549651, 355777.8444269824 6688347.679898469, 355777.81849414605 6688347.650738742, 355777.7903200192 6688347.624297742, 355777.7601241978 6688347.600781565, 355777.72814203624 6688347.580373498, 355777.6946228122 6688347.563232607, 355777.6598277836 6688347.549492495, 355777.6240281514 6688347.539260254, 355777.58750294783 6688347.53261564, 355777.55053686013 6688347.529610439, 355777.5134180114 6688347.530268075, 355777.4764357159 6688347.534583421, 355777.43987822375 6688347.542522848, 355777.4040304732 6688347.554024467, 355777.3691718715 6688347.568998637, 355777.33557411574 6688347.587328642, 355777.3034990757 6688347.608871611, 355777.2731967526 6688347.633459639, 355777.2449033309 6688347.660901074, 355777.2188393372 6688347.690982034), (355777.2188393372 6688347.690982034, 355777.88877931697 6688347.745445589), (355777.88877931697 6688347.745445589, 355777.9040094947 6688347.557798916), (355777.9040094947 6688347.557798916, 355777.9496745563 6688346.995172724, 355777.27973453864 6688346.94080908, 355777.2188393372 6688347.690982034), (355777.2188393372 6688347.690982034, 355777.2341131002 6688347.503438817, 355777.9040094947 6688347.557798916), (355777.9040094947 6688347.557798916, 355777.9040531258 6688347.557802456), (355641.1247782954 6688291.980389788, 355641.1600357569 6688291.975095351, 355641.19880043325 6688291.97077873, 355641.2407701821 6688291.967473563, 355641.2856178805 6688291.965205613, 355641.33299397334 6688291.9639925575, 355641.38252919883 6688291.963843853, 355641.4338374664 6688291.964760655, 355641.4865188658 6688291.96673582, 355641.54016278416 6688291.969753955, 355641.5943511067 6688291.973791533, 355641.648661475 6688291.978817084, 355641.70267058007 6688291.984791436, 355641.7559574603 6688291.99166803, 355641.808106784 6688291.999393264, 355641.8587120851 6688292.00790692, 355641.90737893264 6688292.017142648, 355641.9537280045 6688292.027028463, 355641.99739804363 6688292.037487305, 355642.0380486739 6688292.04843766, 355642.075363054 6688292.059794177, 355642.1090503453 6688292.071468339), (355642.1090503453 6688292.071468339, 355641.1247782954 6688291.980389788), (355641.1247782954 6688291.980389788, 355641.14315483463 6688291.781457113, 355642.12752679887 6688291.872535712, 355642.1090503453 6688292.071468339), (355642.1090503453 6688292.071468339, 355642.11366947397 6688292.021710207, 355641.1293974238 6688291.930631651), (355727.13654054323 6688339.833401492, 355727.1433316409 6688339.794050497, 355727.14929472643 6688339.750695127, 355727.1543833223 6688339.703673308, 355727.1585577662 6688339.653351535, 355727.16178552184 6688339.600122033, 355727.16404143063 6688339.5443996815, 355727.16530791053 6688339.486618806, 355727.165575089 6688339.427229755, 355727.1648408845 6688339.3666954255, 355727.163111019 6688339.30548764, 355727.16039897624 6688339.244083471, 355727.1567258937 6688339.182961511, 355727.15212040104 6688339.122598168, 355727.1466183944 6688339.063463926, 355727.14026275807 6688339.006019694, 355727.13310302916 6688338.950713206, 355727.12519501284 6688338.897975535, 355727.1166003463 6688338.848217739, 355727.1073860186 6688338.8018276375, 355727.09762384876 6688338.759166808, 355727.08738992526 6688338.720567757), (355727.08738992526 6688338.720567757, 355727.13654054323 6688339.833401492), (355727.13654054323 6688339.833401492, 355727.18650044024 6688339.831198979), (355727.18650044024 6688339.831198979, 355727.3361851321 6688339.824600037, 355727.2870345067 6688338.71176631, 355727.08738992526 6688338.720567757), (355727.08738992526 6688338.720567757, 355727.137251102 6688338.718392353, 355727.18650044024 6688339.831198979), (355727.18650044024 6688339.831198979, 355727.1865016419 6688339.83122613), (355811.29984638357 6688316.212143579, 355811.33405776747 6688316.223768604, 355811.3719462223 6688316.235070332, 355811.4132164356 6688316.245960679, 355811.45754673594 6688316.2563547585, 355811.5045916018 6688316.26617156, 355811.55398435256 6688316.275334566, 355811.6053400083 6688316.28377236, 355811.65825828945 6688316.2914191745, 355811.71232673683 6688316.298215407, 355811.7671239267 6688316.304108086, 355811.8222227552 6688316.309051288, 355811.8771937673 6688316.313006475, 355811.9316085049 6688316.315942826, 355811.98504284467 6688316.317837452, 355812.0370803054 6688316.318675587, 355812.0873152934 6688316.318450696, 355812.1353562634 6688316.317164534, 355812.180828772 6688316.3148271255, 355812.223378394 6688316.311456689, 355812.2626734865 6688316.30707949, 355812.2984077731 6688316.301729651), (355812.2984077731 6688316.301729651, 355811.29984638357 6688316.212143579), (355811.29984638357 6688316.212143579, 355811.2820693735 6688316.411176463, 355812.280530834 6688316.500762491, 355812.29393893527 6688316.351483441), (355812.29393893527 6688316.351483441, 355812.2984077731 6688316.301729651), (355812.2984077731 6688316.301729651, 355812.29398849944 6688316.351487888, 355812.29393893527 6688316.351483441), (355812.29393893527 6688316.351483441, 355811.2954271098 6688316.261901814), (355761.2784688446 6688302.533043458, 355761.3142242036 6688302.527565474, 355761.3535482093 6688302.523047264, 355761.39613436 6688302.519524047, 355761.4416507277 6688302.51702328, 355761.48974254634 6688302.515564459, 355761.54003497487 6688302.51515895, 355761.5921360214 6688302.515809916, 355761.64563959645 6688302.517512284, 355761.70012867876 6688302.520252784, 355761.755178566 6688302.524010054, 355761.81036018475 6688302.528754812, 355761.865243435 6688302.534450074, 355761.91940054216 6688302.541051449, 355761.97240939154 6688302.548507488, 355762.02385681774 6688302.556760074, 355762.0733418264 6688302.565744884, 355762.12047871784 6688302.575391888, 355762.1649000947 6688302.585625894, 355762.2062597254 6688302.59636714, 355762.2442352414 6688302.607531902, 355762.27853065176 6688302.619033155), (355762.27853065176 6688302.619033155, 355761.2784688446 6688302.533043458), (355761.2784688446 6688302.533043458, 355761.29564639664 6688302.333910384, 355762.29570820375 6688302.419900085, 355762.2828316395 6688302.569173379), (355762.2828316395 6688302.569173379, 355762.27853065176 6688302.619033155), (355762.27853065176 6688302.619033155, 355762.28285005275 6688302.56917496, 355762.2828316395 6688302.569173379), (355762.2828316395 6688302.569173379, 355761.2827881997 6688302.483285178), (355762.27853065176 6688302.619033155, 355762.3137112678 6688302.613644748, 355762.35239490436 6688302.609224959, 355762.39428005076 6688302.6058082385, 355762.43904024304 6688302.603421213, 355762.48632660887 6688302.6020824965, 355762.5357705856 6688302.601802514, 355762.58698679367 6688302.602583452, 355762.63957604056 6688302.604419223, 355762.69312843133 6688302.607295519, 355762.7472265649 6688302.611189918, 355762.80144878593 6688302.616072074, 355762.8553724722 6688302.621903925, 355762.90857732814 6688302.628640022, 355762.96064866096 6688302.63622786, 355763.011180613 6688302.644608298, 355763.0597793248 6688302.653716017, 355763.1060660055 6688302.6634800285, 355763.14967988356 6688302.673824228, 355763.1902810218 6688302.6846679915, 355763.2275529634 6688302.695926798, 355763.26120520185 6688302.707512897), (355763.26120520185 6688302.707512897, 355762.27853065176 6688302.619033155), (355762.27853065176 6688302.619033155, 355762.2965075637 6688302.419900451, 355763.2790821532 6688302.508480063, 355763.26120520185 6688302.707512897), (355763.26120520185 6688302.707512897, 355763.26562447875 6688302.657754663, 355762.2830498506 6688302.569274969), (355812.3481925424 6688307.301840806, 355812.38375384005 6688307.2968034735, 355812.42284381564 6688307.292769651, 355812.46515779203 6688307.289770782, 355812.5103659626 6688307.287830236, 355812.5581159628 6688307.286963144, 355812.60803561675 6688307.287176261, 355812.6597358372 6688307.288467926, 355812.7128136595 6688307.290828073, 355812.7668553801 6688307.294238305, 355812.8214397844 6688307.298672044, 355812.87614142644 6688307.304094725, 355812.9305339478 6688307.3104640925, 355812.984193398 6688307.317730496, 355813.0367015416 6688307.325837301, 355813.08764911623 6688307.334721319, 355813.1366390228 6688307.344313307, 355813.18328942085 6688307.354538501, 355813.2272367049 6688307.365317205, 355813.26813833864 6688307.376565407, 355813.30567552376 6688307.388195436, 355813.33955568477 6688307.40011664), (355813.33955568477 6688307.40011664, 355812.3481925424 6688307.301840806), (355812.3481925424 6688307.301840806, 355812.3531138514 6688307.252083045), (355812.3531138514 6688307.252083045, 355812.3678679918 6688307.102908713, 355813.3593310099 6688307.201284513, 355813.33955568477 6688307.40011664), (355813.33955568477 6688307.40011664, 355813.3444745071 6688307.350458558, 355812.3531138514 6688307.252083045), (355812.3531138514 6688307.252083045, 355812.3531114182 6688307.252082804))
-""")
+        _sio = AbstractGeoDataFrameDemos._dataset(
+            "GeoDataFrameDemos6", "nizanDistrictInNantesStreetSanitation.csv"
+        )
         return GeoDataFrameLib.read_csv(_sio)
         
     @staticmethod
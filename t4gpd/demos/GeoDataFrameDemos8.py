@@ -20,7 +20,6 @@ GNU General Public License for more details.
 You should have received a copy of the GNU General Public License
 along with t4gpd.  If not, see <https://www.gnu.org/licenses/>.
 '''
-from io import StringIO
 
 from t4gpd.commons.GeoDataFrameLib import GeoDataFrameLib
 from t4gpd.demos.AbstractGeoDataFrameDemos import AbstractGeoDataFrameDemos
@@ -39,1395 +38,9 @@ class GeoDataFrameDemos8(AbstractGeoDataFrameDemos):
         # SOURCE:
         # https://geoservices.ign.fr/bdtopo
         '''
-        _sio = StringIO("""ID;geometry
-BATIMENT0000000234797471;POLYGON Z ((1037373.3 6778402.2 204.1, 1037376.3 6778400 204.1, 1037376.1 6778399.7 204.1, 1037374.2 6778397.1 204.1, 1037374 6778396.9 204.1, 1037371.1 6778399.1 204.1, 1037373.3 6778402.2 204.1))
-BATIMENT0000000234797470;POLYGON Z ((1037375.7 6778396 -1000, 1037374.2 6778397.1 -1000, 1037376.1 6778399.7 -1000, 1037377.7 6778398.6 -1000, 1037375.7 6778396 -1000))
-BATIMENT0000000234797474;POLYGON Z ((1037472.6 6778392.1 210.1, 1037473.3 6778386.7 210.1, 1037470.8 6778383.6 210.1, 1037476.1 6778379.5 210.1, 1037469.7 6778371 210.1, 1037469.9 6778370.9 210.1, 1037469.9 6778367.1 210.1, 1037467.3 6778363.8 210.1, 1037463.7 6778362.7 210.1, 1037459.9 6778365.6 210.1, 1037459.7 6778365.4 210.1, 1037459.2 6778365.8 210.1, 1037455.6 6778361.1 210.1, 1037456.1 6778360.7 210.1, 1037455.5 6778360 210.1, 1037455 6778360.4 210.1, 1037451.3 6778355.5 210.1, 1037451.8 6778355.1 210.1, 1037451.1 6778354.3 210.1, 1037450.6 6778354.6 210.1, 1037447 6778349.8 210.1, 1037449.5 6778347.8 210.1, 1037445.2 6778342.2 210.1, 1037442.5 6778344.1 210.1, 1037442.3 6778343.9 210.1, 1037441.3 6778344.6 210.1, 1037441.5 6778344.8 210.1, 1037437.8 6778347.4 210.1, 1037437.6 6778347.2 210.1, 1037436.3 6778348.1 210.1, 1037436.5 6778348.4 210.1, 1037432.1 6778351.6 210.1, 1037431.9 6778351.5 210.1, 1037430.4 6778352.6 210.1, 1037430.6 6778352.8 210.1, 1037427.1 6778355.4 210.1, 1037427 6778355.2 210.1, 1037425.8 6778356.2 210.1, 1037426 6778356.5 210.1, 1037423.5 6778358.5 210.1, 1037427.9 6778364.3 210.1, 1037430.6 6778362.2 210.1, 1037434.3 6778367.1 210.1, 1037433.8 6778367.5 210.1, 1037434.5 6778368.4 210.1, 1037435 6778368 210.1, 1037438.6 6778372.7 210.1, 1037438 6778373.1 210.1, 1037438.6 6778373.9 210.1, 1037439.2 6778373.5 210.1, 1037442.7 6778378.3 210.1, 1037442.1 6778378.8 210.1, 1037442.2 6778379 210.1, 1037438.3 6778381.9 210.1, 1037438.5 6778385.8 210.1, 1037440.7 6778388.8 210.1, 1037444.4 6778389.8 210.1, 1037444.6 6778389.7 210.1, 1037451 6778398.2 210.1, 1037456.5 6778394.3 210.1, 1037459.1 6778397.6 210.1, 1037464.1 6778398.4 210.1, 1037472.6 6778392.1 210.1))
-BATIMENT0000000234797491;POLYGON Z ((1037404.8 6778419.8 201, 1037406.5 6778422.2 201, 1037418.2 6778413.5 201, 1037417.3 6778412.2 201, 1037416.4 6778410.9 201, 1037415 6778409.1 201, 1037409.1 6778413.5 201, 1037403.2 6778417.8 201, 1037404.8 6778419.8 201))
-BATIMENT0000000234797521;POLYGON Z ((1037483.1 6778523 201.2, 1037486.8 6778527.8 201.2, 1037487.2 6778527.5 201.2, 1037487 6778527.2 201.2, 1037486.9 6778527.1 201.2, 1037483.7 6778522.6 201.2, 1037483.1 6778523 201.2))
-BATIMENT0000000234797523;POLYGON Z ((1037487.2 6778527.5 201.2, 1037486.8 6778527.8 201.2, 1037480.4 6778532.8 201.2, 1037481.1 6778533.8 201.2, 1037487.1 6778529 201.2, 1037487.9 6778528.4 201.2, 1037487.2 6778527.5 201.2))
-BATIMENT0000000234797526;POLYGON Z ((1037494.9 6778514.2 200.9, 1037498.7 6778511.3 200.9, 1037496.6 6778508.5 200.9, 1037492.7 6778511.4 200.9, 1037494.9 6778514.2 200.9))
-BATIMENT0000000234797533;POLYGON Z ((1037499.3 6778515 201.2, 1037503.9 6778521.1 201.2, 1037504.2 6778521.5 201.2, 1037505.6 6778520.4 201.2, 1037500.7 6778514 201.2, 1037499.3 6778515 201.2))
-BATIMENT0000000234797561;POLYGON Z ((1037500.4 6778427 200.9, 1037497.8 6778423.4 200.9, 1037495.3 6778425.3 200.9, 1037495.5 6778425.6 200.9, 1037497.9 6778428.8 200.9, 1037500.4 6778427 200.9))
-BATIMENT0000000234797562;POLYGON Z ((1037497.9 6778428.8 200.5, 1037495.5 6778425.6 200.5, 1037495.3 6778425.3 200.5, 1037487.4 6778431.2 200.5, 1037490 6778434.7 200.5, 1037497.9 6778428.8 200.5))
-BATIMENT0000000234797675;POLYGON Z ((1037595.7 6778351.4 201.3, 1037595.9 6778351.7 201.3, 1037600.8 6778348.1 201.3, 1037598.8 6778345.5 201.3, 1037594 6778349.1 201.3, 1037595.7 6778351.4 201.3))
-BATIMENT0000000234797677;POLYGON Z ((1037591.7 6778341.1 201.1, 1037591.4 6778340.5 201.1, 1037589.9 6778338.6 201.1, 1037587.5 6778340.4 201.1, 1037589.3 6778342.8 201.1, 1037591.7 6778341.1 201.1))
-BATIMENT0000000234797684;POLYGON Z ((1037597.4 6778360.3 201.5, 1037600.6 6778357.9 201.5, 1037598.6 6778355.3 201.5, 1037597 6778356.4 201.5, 1037595.4 6778357.7 201.5, 1037597.2 6778360.1 201.5, 1037597.4 6778360.3 201.5))
-BATIMENT0000000234797704;POLYGON Z ((1037260.7 6778456.2 202.9, 1037259.8 6778455 202.9, 1037255 6778458.6 202.9, 1037256.1 6778460.2 202.9, 1037261 6778456.6 202.9, 1037260.7 6778456.2 202.9))
-BATIMENT0000000234797728;POLYGON Z ((1037568.4 6778513.9 200.6, 1037566.2 6778511 200.6, 1037558.1 6778517.1 200.6, 1037560.2 6778519.9 200.6, 1037568.4 6778513.9 200.6))
-BATIMENT0000000234797757;POLYGON Z ((1037209.3 6778384.8 202.7, 1037208.9 6778385 202.7, 1037210.7 6778387.3 202.7, 1037211 6778387.1 202.7, 1037209.3 6778384.8 202.7))
-BATIMENT0000000234797904;POLYGON Z ((1037609 6778237.3 203.4, 1037606.6 6778234.1 203.4, 1037604.7 6778235.6 203.4, 1037611.6 6778245.2 203.4, 1037613.6 6778243.6 203.4, 1037609 6778237.3 203.4))
-BATIMENT0000000234798004;POLYGON Z ((1037640.5 6778198.2 200.6, 1037633.8 6778203.1 200.6, 1037640.9 6778212.8 200.6, 1037654.1 6778203.1 200.6, 1037647.1 6778193.5 200.6, 1037640.5 6778198.2 200.6))
-BATIMENT0000000234798019;POLYGON Z ((1037481 6778177.8 -1000, 1037479.6 6778176 -1000, 1037478.8 6778176.6 -1000, 1037480.1 6778178.4 -1000, 1037481 6778177.8 -1000))
-BATIMENT0000000234798033;POLYGON Z ((1037490.1 6778186.2 202.2, 1037490.8 6778187.1 202.2, 1037492.1 6778186.2 202.2, 1037491.4 6778185.3 202.2, 1037490.1 6778186.2 202.2))
-BATIMENT0000000234798051;POLYGON Z ((1037551.3 6778213.5 202.5, 1037549.4 6778210.8 202.5, 1037546.5 6778212.9 202.5, 1037548.4 6778215.6 202.5, 1037551.3 6778213.5 202.5))
-BATIMENT0000000234798057;POLYGON Z ((1037574.4 6778199.9 200, 1037571.4 6778202.2 200, 1037572.1 6778203.3 200, 1037574.5 6778206.5 200, 1037577.6 6778204.2 200, 1037576.5 6778202.8 200, 1037574.5 6778200 200, 1037574.4 6778199.9 200))
-BATIMENT0000000234798061;POLYGON Z ((1037574.5 6778200 200.1, 1037576.5 6778202.8 200.1, 1037579.6 6778200.6 200.1, 1037577.6 6778197.8 200.1, 1037576.1 6778198.9 200.1, 1037574.5 6778200 200.1))
-BATIMENT0000000234798062;POLYGON Z ((1037581.4 6778203 200.1, 1037579.6 6778200.6 200.1, 1037576.5 6778202.8 200.1, 1037577.6 6778204.2 200.1, 1037578.3 6778205.3 200.1, 1037581.4 6778203 200.1))
-BATIMENT0000000234798584;POLYGON Z ((1037209.9 6778139.3 -1000, 1037208.9 6778137.9 -1000, 1037206.7 6778139.4 -1000, 1037207.7 6778140.9 -1000, 1037209.9 6778139.3 -1000))
-BATIMENT0000000234798063;POLYGON Z ((1037571.2 6778215.3 200.1, 1037580.6 6778208.4 200.1, 1037580 6778207.6 200.1, 1037578.3 6778205.3 200.1, 1037577.6 6778204.2 200.1, 1037574.5 6778206.5 200.1, 1037573.2 6778207.5 200.1, 1037571.7 6778208.6 200.1, 1037568.8 6778210.7 200.1, 1037568.1 6778211.2 200.1, 1037571.2 6778215.3 200.1))
-BATIMENT0000000234798064;POLYGON Z ((1037573.2 6778207.5 200, 1037574.5 6778206.5 200, 1037572.1 6778203.3 200, 1037569.3 6778205.4 200, 1037571.7 6778208.6 200, 1037573.2 6778207.5 200))
-BATIMENT0000000234798065;POLYGON Z ((1037583.1 6778205.3 200.1, 1037581.4 6778203 200.1, 1037578.3 6778205.3 200.1, 1037580 6778207.6 200.1, 1037583.1 6778205.3 200.1))
-BATIMENT0000000234798072;POLYGON Z ((1037559.9 6778212.2 199.9, 1037561.8 6778214.8 199.9, 1037564.9 6778212.4 199.9, 1037563.1 6778209.9 199.9, 1037559.9 6778212.2 199.9))
-BATIMENT0000000234798074;POLYGON Z ((1037568.8 6778210.7 199.9, 1037571.7 6778208.6 199.9, 1037569.3 6778205.4 199.9, 1037566.4 6778207.5 199.9, 1037568.8 6778210.7 199.9))
-BATIMENT0000000234798075;POLYGON Z ((1037566.6 6778214.7 200, 1037565.5 6778213.1 200, 1037564.9 6778212.4 200, 1037561.8 6778214.8 200, 1037563.5 6778217 200, 1037566.6 6778214.7 200))
-BATIMENT0000000234798077;POLYGON Z ((1037592.5 6778114.4 199.8, 1037594 6778116.3 199.8, 1037595 6778117.8 199.8, 1037597.9 6778115.6 199.8, 1037595.4 6778112.2 199.8, 1037592.5 6778114.4 199.8))
-BATIMENT0000000234798085;POLYGON Z ((1037589.7 6778110.5 199.8, 1037590.4 6778111.4 199.8, 1037595.1 6778108.1 199.8, 1037594.3 6778107 199.8, 1037589.7 6778110.5 199.8))
-BATIMENT0000000234798107;POLYGON Z ((1037647.3 6778311.9 200.9, 1037644.2 6778314.3 200.9, 1037646.8 6778317.7 200.9, 1037648.2 6778319.6 200.9, 1037651.4 6778317.2 200.9, 1037648 6778312.8 200.9, 1037647.3 6778311.9 200.9))
-BATIMENT0000000234798108;POLYGON Z ((1037631.4 6778295 202.6, 1037634.8 6778299.5 202.6, 1037636.7 6778298.1 202.6, 1037635 6778295.8 202.6, 1037634.1 6778294.7 202.6, 1037633.3 6778293.6 202.6, 1037631.4 6778295 202.6))
-BATIMENT0000000234798113;POLYGON Z ((1037629.2 6778327.7 203.1, 1037636.3 6778322.3 203.1, 1037635.7 6778321.5 203.1, 1037634.2 6778319.5 203.1, 1037633.1 6778320.3 203.1, 1037627.1 6778324.8 203.1, 1037629.2 6778327.7 203.1))
-BATIMENT0000000234798117;POLYGON Z ((1037644.7 6778322.2 200.8, 1037643.1 6778323.4 200.8, 1037646.3 6778327.6 200.8, 1037647.3 6778326.9 200.8, 1037649.8 6778325 200.8, 1037646.6 6778320.8 200.8, 1037644.7 6778322.2 200.8))
-BATIMENT0000000234798119;POLYGON Z ((1037648.2 6778319.6 200.8, 1037646.6 6778320.8 200.8, 1037649.8 6778325 200.8, 1037654.6 6778321.5 200.8, 1037653 6778319.4 200.8, 1037651.8 6778317.8 200.8, 1037651.4 6778317.2 200.8, 1037648.2 6778319.6 200.8))
-BATIMENT0000000234798131;POLYGON Z ((1037568.4 6778130.8 200.6, 1037573.1 6778127.3 200.6, 1037571.4 6778124.8 200.6, 1037567.7 6778127.5 200.6, 1037566.5 6778128.4 200.6, 1037568.4 6778130.8 200.6))
-BATIMENT0000000234798136;POLYGON Z ((1037575 6778122.1 200.6, 1037576.8 6778124.6 200.6, 1037579.9 6778122.3 200.6, 1037578.2 6778119.8 200.6, 1037575 6778122.1 200.6))
-BATIMENT0000000234798177;POLYGON Z ((1037367.6 6778348.2 203.1, 1037364 6778343.5 203.1, 1037363.2 6778342.5 203.1, 1037359.4 6778345.4 203.1, 1037363.8 6778351.2 203.1, 1037367.6 6778348.2 203.1))
-BATIMENT0000000234798236;POLYGON Z ((1037399.8 6778070.7 203.2, 1037399 6778069.7 203.2, 1037397.3 6778071 203.2, 1037400.8 6778075.8 203.2, 1037402.4 6778074.6 203.2, 1037399.8 6778070.7 203.2))
-BATIMENT0000000234798609;POLYGON Z ((1037265.8 6778278.3 200.3, 1037268.4 6778276.3 200.3, 1037265 6778271.7 200.3, 1037262.3 6778273.7 200.3, 1037265.8 6778278.3 200.3))
-BATIMENT0000000234798258;POLYGON Z ((1037392.9 6778081.4 203.4, 1037392.4 6778080.5 203.4, 1037391.8 6778079.8 203.4, 1037390.3 6778080.8 203.4, 1037391.6 6778082.6 203.4, 1037393.1 6778081.6 203.4, 1037392.9 6778081.4 203.4))
-BATIMENT0000000234798439;POLYGON Z ((1037613.2 6778172.3 200.7, 1037615.1 6778170.9 200.7, 1037613.2 6778168.2 200.7, 1037611.3 6778169.6 200.7, 1037613.2 6778172.3 200.7))
-BATIMENT0000000234798418;POLYGON Z ((1037645.9 6778181 201, 1037649 6778178.7 201, 1037643.7 6778171.1 201, 1037642.6 6778171.8 201, 1037640.3 6778173.5 201, 1037645.9 6778181 201))
-BATIMENT0000000234798428;POLYGON Z ((1037631.4 6778168.8 200.6, 1037632.3 6778170.1 200.6, 1037635.8 6778167.5 200.6, 1037633.1 6778163.8 200.6, 1037633.2 6778163.7 200.6, 1037633.1 6778163.5 200.6, 1037632.8 6778163.1 200.6, 1037629.1 6778165.8 200.6, 1037631.4 6778168.8 200.6))
-BATIMENT0000000234798419;POLYGON Z ((1037641.6 6778168.2 198.7, 1037643.2 6778170.5 198.7, 1037645 6778169.2 198.7, 1037643.3 6778167 198.7, 1037641.6 6778168.2 198.7))
-BATIMENT0000000234798429;POLYGON Z ((1037627.8 6778164.8 200.7, 1037628.7 6778166.1 200.7, 1037629.1 6778165.8 200.7, 1037632.8 6778163.1 200.7, 1037633.1 6778163.5 200.7, 1037633.4 6778163.3 200.7, 1037631.1 6778160.2 200.7, 1037629.3 6778161.5 200.7, 1037629 6778161.1 200.7, 1037626.5 6778163 200.7, 1037626.8 6778163.5 200.7, 1037627.8 6778164.8 200.7))
-BATIMENT0000000234798434;POLYGON Z ((1037609.5 6778180.3 200.7, 1037614.1 6778176.9 200.7, 1037615.4 6778176 200.7, 1037619.9 6778172.6 200.7, 1037621.1 6778171.8 200.7, 1037623.3 6778170.2 200.7, 1037625.1 6778168.8 200.7, 1037628.7 6778166.1 200.7, 1037627.8 6778164.8 200.7, 1037626.8 6778163.5 200.7, 1037618.6 6778169.5 200.7, 1037617.4 6778170.4 200.7, 1037615.7 6778171.6 200.7, 1037615.1 6778170.9 200.7, 1037613.2 6778172.3 200.7, 1037606.1 6778177.4 200.7, 1037608.7 6778181 200.7, 1037609.5 6778180.3 200.7))
-BATIMENT0000000234798435;POLYGON Z ((1037636 6778161.7 200.7, 1037636.7 6778162.7 200.7, 1037639.2 6778160.9 200.7, 1037638.5 6778159.9 200.7, 1037636 6778161.7 200.7))
-BATIMENT0000000234798440;POLYGON Z ((1037605 6778168.5 201.1, 1037607.7 6778172.3 201.1, 1037611.3 6778169.6 201.1, 1037613.2 6778168.2 201.1, 1037612.1 6778166.7 201.1, 1037610.5 6778164.5 201.1, 1037605.7 6778168 201.1, 1037605 6778168.5 201.1))
-BATIMENT0000000234798442;POLYGON Z ((1037621.1 6778171.8 200.6, 1037619.9 6778172.6 200.6, 1037621.8 6778175.2 200.6, 1037622.2 6778175.7 200.6, 1037625.5 6778173.2 200.6, 1037623.3 6778170.2 200.6, 1037621.1 6778171.8 200.6))
-BATIMENT0000000234798450;POLYGON Z ((1037528.4 6778249.2 204.8, 1037528 6778248.7 204.8, 1037527.2 6778249.3 204.8, 1037527.6 6778249.8 204.8, 1037528.4 6778249.2 204.8))
-BATIMENT0000000234798615;POLYGON Z ((1037288 6778270.4 203, 1037289.5 6778272.4 203, 1037295.8 6778267.7 203, 1037294.4 6778265.6 203, 1037288 6778270.4 203))
-BATIMENT0000000234798506;POLYGON Z ((1037345.2 6778150 203.3, 1037349 6778147 203.3, 1037347.3 6778144.7 203.3, 1037343.4 6778147.6 203.3, 1037345.2 6778150 203.3))
-BATIMENT0000000234798509;POLYGON Z ((1037349.3 6778132.9 201.1, 1037347.6 6778130.6 201.1, 1037347.2 6778130.2 201.1, 1037344.3 6778132.4 201.1, 1037346.7 6778135.6 201.1, 1037349.6 6778133.4 201.1, 1037349.3 6778132.9 201.1))
-BATIMENT0000000234798511;POLYGON Z ((1037347.5 6778144.5 203.2, 1037347.3 6778144.7 203.2, 1037349 6778147 203.2, 1037351.4 6778145.2 203.2, 1037349.6 6778142.9 203.2, 1037347.5 6778144.5 203.2))
-BATIMENT0000000234798523;POLYGON Z ((1037160.4 6778150.2 207, 1037158.9 6778150 207, 1037158.5 6778153.2 207, 1037159.9 6778153.4 207, 1037160.4 6778150.2 207))
-BATIMENT0000000234798542;POLYGON Z ((1037309.8 6778320.3 201.2, 1037306.7 6778316.2 201.2, 1037303.1 6778319.8 201.2, 1037305.7 6778323.3 201.2, 1037309.8 6778320.3 201.2))
-BATIMENT0000000234798543;POLYGON Z ((1037309.3 6778314.2 200.9, 1037306.7 6778316.2 200.9, 1037309.8 6778320.3 200.9, 1037312.4 6778318.5 200.9, 1037309.3 6778314.2 200.9))
-BATIMENT0000000234798544;POLYGON Z ((1037305.7 6778323.3 201.1, 1037303.1 6778319.8 201.1, 1037301.3 6778317.5 201.1, 1037297.7 6778320.2 201.1, 1037302.2 6778326.2 201.1, 1037305.8 6778323.5 201.1, 1037305.7 6778323.3 201.1))
-BATIMENT0000000234798546;POLYGON Z ((1037315.1 6778316.5 200.9, 1037312.1 6778312.5 200.9, 1037311.9 6778312.2 200.9, 1037309.3 6778314.2 200.9, 1037312.4 6778318.5 200.9, 1037315.1 6778316.5 200.9))
-BATIMENT0000000234798549;POLYGON Z ((1037301.3 6778317.5 201.4, 1037298.8 6778314.1 201.4, 1037295.2 6778316.8 201.4, 1037297.7 6778320.2 201.4, 1037301.3 6778317.5 201.4))
-BATIMENT0000000234798550;POLYGON Z ((1037295.2 6778316.8 201.7, 1037298.8 6778314.1 201.7, 1037296.1 6778310.5 201.7, 1037292.5 6778313.2 201.7, 1037295.2 6778316.8 201.7))
-BATIMENT0000000234798565;POLYGON Z ((1037201.6 6778133.2 201.5, 1037200.8 6778132.2 201.5, 1037198.4 6778133.9 201.5, 1037199.2 6778134.9 201.5, 1037201.6 6778133.2 201.5))
-BATIMENT0000000234798627;POLYGON Z ((1037277.2 6778167.3 199.7, 1037271.8 6778171.3 199.7, 1037288.8 6778193.9 199.7, 1037294.1 6778189.9 199.7, 1037277.2 6778167.3 199.7))
-BATIMENT0000000234798628;POLYGON Z ((1037288.8 6778193.9 199.7, 1037290.7 6778196.4 199.7, 1037296 6778192.3 199.7, 1037294.1 6778189.9 199.7, 1037288.8 6778193.9 199.7))
-BATIMENT0000000234798679;POLYGON Z ((1037250 6778348.8 200.9, 1037250.9 6778350.1 200.9, 1037251.9 6778349.3 200.9, 1037251 6778348.1 200.9, 1037250 6778348.8 200.9))
-BATIMENT0000000234798657;POLYGON Z ((1037257.6 6778339.5 201, 1037259.3 6778341.7 201, 1037263.5 6778347.4 201, 1037267.2 6778352.3 201, 1037267.7 6778353 201, 1037270.7 6778350.7 201, 1037274 6778355.2 201, 1037276.7 6778353.3 201, 1037276.5 6778353 201, 1037282.1 6778348.9 201, 1037277.5 6778342.9 201, 1037272.2 6778335.8 201, 1037268.8 6778331.1 201, 1037257.7 6778339.3 201, 1037257.6 6778339.5 201))
-BATIMENT0000000234798658;POLYGON Z ((1037268.7 6778354.3 201, 1037271.5 6778358.1 201, 1037271.8 6778358.5 201, 1037274.8 6778356.2 201, 1037274 6778355.2 201, 1037270.7 6778350.7 201, 1037267.7 6778353 201, 1037268.7 6778354.3 201))
-BATIMENT0000000234798659;POLYGON Z ((1037276.7 6778358.8 201, 1037274.8 6778356.2 201, 1037271.8 6778358.5 201, 1037273 6778360.2 201, 1037273.7 6778361.1 201, 1037276.7 6778358.8 201))
-BATIMENT0000000234798665;POLYGON Z ((1037279.1 6778362.2 201.3, 1037276.7 6778358.8 201.3, 1037273.7 6778361.1 201.3, 1037276 6778364.3 201.3, 1037276.1 6778364.4 201.3, 1037279.1 6778362.2 201.3))
-BATIMENT0000000234798668;POLYGON Z ((1037259.5 6778358 201, 1037261.5 6778360.9 201, 1037261.9 6778360.7 201, 1037264.4 6778358.8 201, 1037262.3 6778355.8 201, 1037259.5 6778358 201))
-BATIMENT0000000234798676;POLYGON Z ((1037256.6 6778364.5 200.9, 1037261.5 6778360.9 200.9, 1037259.5 6778358 200.9, 1037257.8 6778359.2 200.9, 1037256.5 6778360.2 200.9, 1037254.6 6778361.7 200.9, 1037256.6 6778364.5 200.9))
-BATIMENT0000000234798677;POLYGON Z ((1037254.4 6778370.9 200.8, 1037264.4 6778363.6 200.8, 1037266.7 6778361.9 200.8, 1037264.4 6778358.8 200.8, 1037261.9 6778360.7 200.8, 1037261.5 6778360.9 200.8, 1037256.6 6778364.5 200.8, 1037254.2 6778366.3 200.8, 1037252.1 6778367.8 200.8, 1037254.4 6778370.9 200.8))
-BATIMENT0000000234798728;POLYGON Z ((1037210 6778241.5 200.3, 1037207.8 6778243.1 200.3, 1037212 6778248.8 200.3, 1037213.7 6778247.6 200.3, 1037214.2 6778247.2 200.3, 1037210 6778241.5 200.3))
-BATIMENT0000000234798751;POLYGON Z ((1037291.8 6778145.6 204.5, 1037298.5 6778140.5 204.5, 1037298.2 6778140.1 204.5, 1037298.5 6778139.9 204.5, 1037294.2 6778134.1 204.5, 1037287.1 6778139.4 204.5, 1037291.8 6778145.6 204.5))
-BATIMENT0000000234798775;POLYGON Z ((1037230.8 6778217.9 202.7, 1037233.8 6778221.9 202.7, 1037238.1 6778218.7 202.7, 1037235 6778214.7 202.7, 1037230.8 6778217.9 202.7))
-BATIMENT0000000234798798;POLYGON Z ((1037297.5 6778026.2 206.9, 1037296.7 6778025.1 206.9, 1037293.7 6778027.4 206.9, 1037294.5 6778028.5 206.9, 1037297.5 6778026.2 206.9))
-BATIMENT0000000234798817;POLYGON Z ((1037325.5 6778295.1 200.5, 1037323.4 6778292.3 200.5, 1037319.2 6778295.4 200.5, 1037321.3 6778298.3 200.5, 1037325.5 6778295.1 200.5))
-BATIMENT0000000234798819;POLYGON Z ((1037314.8 6778289.3 200.5, 1037317 6778292.3 200.5, 1037321.2 6778289.2 200.5, 1037319 6778286.2 200.5, 1037314.8 6778289.3 200.5))
-BATIMENT0000000234798820;POLYGON Z ((1037312.8 6778286.4 200.4, 1037314.8 6778289.3 200.4, 1037319 6778286.2 200.4, 1037317 6778283.3 200.4, 1037312.8 6778286.4 200.4))
-BATIMENT0000000234798833;POLYGON Z ((1037347.3 6778210 200.3, 1037344.7 6778212 200.3, 1037348.3 6778216.8 200.3, 1037350.9 6778214.8 200.3, 1037347.3 6778210 200.3))
-BATIMENT0000000234798859;POLYGON Z ((1037192 6778194.6 -1000, 1037191.1 6778195.3 -1000, 1037192 6778196.4 -1000, 1037192.9 6778195.7 -1000, 1037192 6778194.6 -1000))
-BATIMENT0000000234798866;POLYGON Z ((1037150.9 6778332.4 -1000, 1037151.6 6778333.4 -1000, 1037152 6778331.6 -1000, 1037150.9 6778332.4 -1000))
-BATIMENT0000000234798876;POLYGON Z ((1037431.1 6778516.9 -1000, 1037429.9 6778517.7 -1000, 1037430.8 6778518.9 -1000, 1037432 6778518.1 -1000, 1037431.1 6778516.9 -1000))
-BATIMENT0000000234798888;POLYGON Z ((1037208.3 6778377 204.7, 1037211.2 6778374.9 204.7, 1037205.3 6778367.2 204.7, 1037202.5 6778369.3 204.7, 1037208.3 6778377 204.7))
-BATIMENT0000000234798890;POLYGON Z ((1037502.5 6778525.2 201.1, 1037507.4 6778531.5 201.2, 1037511.7 6778528.4 201.1, 1037505.6 6778520.4 201.1, 1037504.2 6778521.5 201.1, 1037503.9 6778521.1 201.1, 1037501 6778523.3 201.1, 1037502.5 6778525.2 201.1))
-BATIMENT0000000234798894;POLYGON Z ((1037539.7 6778067.5 200.3, 1037540.1 6778068 200.3, 1037543.2 6778065.6 200.3, 1037543.9 6778066.6 200.3, 1037544.1 6778066.4 200.3, 1037540 6778061 200.3, 1037534.6 6778065.1 200.3, 1037537.7 6778069 200.3, 1037539.7 6778067.5 200.3))
-BATIMENT0000000234798895;POLYGON Z ((1037297.5 6778152.6 204.5, 1037304 6778147.7 204.5, 1037298.5 6778140.5 204.5, 1037291.8 6778145.6 204.5, 1037297.5 6778152.6 204.5))
-BATIMENT0000000234798896;POLYGON Z ((1037264.1 6778096.3 199.5, 1037261.9 6778092.6 199.5, 1037253.9 6778098 200.2, 1037257 6778102.2 199.5, 1037264.1 6778096.3 199.5))
-BATIMENT0000000234798899;POLYGON Z ((1037568.7 6778195.7 202.4, 1037563.6 6778188.1 202.4, 1037557.4 6778192.7 202.4, 1037562.5 6778200.5 202.4, 1037568.7 6778195.7 202.4))
-BATIMENT0000000234798900;POLYGON Z ((1037607.4 6778248.2 203.4, 1037611.6 6778245.2 203.4, 1037604.7 6778235.6 203.4, 1037600.4 6778238.8 203.4, 1037607.4 6778248.2 203.4))
-BATIMENT0000000234798905;POLYGON Z ((1037373.8 6778423.2 204.1, 1037383.5 6778416.1 204.1, 1037383.4 6778415.8 204.1, 1037375.3 6778403.9 204.1, 1037377.7 6778401.9 204.1, 1037376.3 6778400 204.1, 1037373.3 6778402.2 204.1, 1037371.1 6778399.1 204.1, 1037370.4 6778398.3 204.1, 1037360.8 6778405.4 204.1, 1037373.8 6778423.2 204.1))
-BATIMENT0000000234798904;POLYGON Z ((1037383.4 6778415.8 204.1, 1037385.9 6778413.9 204.1, 1037388.2 6778412.2 204.1, 1037378 6778398.4 204.1, 1037377.7 6778398.6 204.1, 1037376.1 6778399.7 204.1, 1037376.3 6778400 204.1, 1037377.7 6778401.9 204.1, 1037375.3 6778403.9 204.1, 1037383.4 6778415.8 204.1))
-BATIMENT0000000234798901;POLYGON Z ((1037630 6778317.7 203, 1037630.8 6778317.2 203, 1037633.1 6778320.3 203, 1037634.2 6778319.5 203, 1037635.7 6778321.5 203, 1037637 6778320.6 203, 1037634.1 6778316.4 203, 1037634.4 6778316.1 203, 1037634 6778315.5 203, 1037640.5 6778309.8 203, 1037638 6778306.3 203, 1037637.3 6778306.8 203, 1037627.5 6778314.1 203, 1037627.4 6778314.2 203, 1037630 6778317.7 203))
-BATIMENT0000000234797844;POLYGON Z ((1037205 6778460.7 207.4, 1037204.7 6778460.2 207.4, 1037203.8 6778459.1 207.4, 1037199.6 6778462.2 207.4, 1037195.4 6778465.4 207.4, 1037196.6 6778467 207.4, 1037205 6778460.7 207.4))
-BATIMENT0000000234797845;POLYGON Z ((1037174.5 6778437.5 -1000, 1037182.8 6778430.9 -1000, 1037181.8 6778429.6 -1000, 1037173.7 6778436.4 -1000, 1037174.5 6778437.5 -1000))
-BATIMENT0000000234797849;POLYGON Z ((1037173.2 6778438.6 -1000, 1037175.9 6778442.1 -1000, 1037179.3 6778446.7 -1000, 1037180.8 6778448.8 -1000, 1037182.2 6778447.7 -1000, 1037174.5 6778437.5 -1000, 1037173.2 6778438.6 -1000))
-BATIMENT0000000234797850;POLYGON Z ((1037207.8 6778464.5 -1000, 1037207.7 6778464.4 -1000, 1037205 6778460.7 -1000, 1037196.6 6778467 -1000, 1037197.2 6778467.9 -1000, 1037202.7 6778463.4 -1000, 1037205.6 6778467 -1000, 1037208.1 6778465.1 -1000, 1037207.8 6778464.5 -1000))
-BATIMENT0000000234797846;POLYGON Z ((1037173.1 6778465.9 207.3, 1037178.6 6778461.7 207.3, 1037173.5 6778454.8 207.3, 1037168 6778459.1 207.3, 1037165.4 6778455.5 207.3, 1037164.7 6778456 207.3, 1037162.7 6778457.5 207.3, 1037163.1 6778458.1 207.3, 1037164.4 6778460.1 207.3, 1037163.8 6778460.5 207.3, 1037166 6778463.4 207.3, 1037168.2 6778466.3 207.3, 1037170 6778468.7 207.3, 1037170.6 6778468.4 207.3, 1037170.8 6778468.2 207.3, 1037172.8 6778471 207.3, 1037175.5 6778469 207.3, 1037173.1 6778465.9 207.3))
-BATIMENT0000000234797847;POLYGON Z ((1037182.9 6778458.4 207.3, 1037181.8 6778457.1 207.3, 1037177.5 6778451.5 207.3, 1037173.5 6778454.8 207.3, 1037178.6 6778461.7 207.3, 1037182.9 6778458.4 207.3))
-BATIMENT0000000234797848;POLYGON Z ((1037182.2 6778447.7 206.9, 1037180.8 6778448.8 206.9, 1037177.5 6778451.5 206.9, 1037181.8 6778457.1 206.9, 1037182.9 6778458.4 206.9, 1037187.5 6778454.9 206.9, 1037195.4 6778465.4 206.9, 1037199.6 6778462.2 206.9, 1037203.8 6778459.1 206.9, 1037199.8 6778453.8 206.9, 1037199.1 6778452.9 206.9, 1037197.9 6778451.4 206.9, 1037198 6778451.2 206.9, 1037195.3 6778447.8 206.9, 1037195.4 6778447.6 206.9, 1037191.7 6778442.6 206.9, 1037191.3 6778442.1 206.9, 1037191 6778442.2 206.9, 1037189.7 6778440.4 206.9, 1037189.9 6778440.2 206.9, 1037188.5 6778438.3 206.9, 1037188.3 6778438.4 206.9, 1037184 6778432.7 206.9, 1037184.1 6778432.5 206.9, 1037182.8 6778430.9 206.9, 1037174.5 6778437.5 206.9, 1037182.2 6778447.7 206.9))
-BATIMENT0000000047948503;POLYGON Z ((1037283.3 6778410.9 204.1, 1037295.1 6778426.4 204.1, 1037300.8 6778423.3 204.1, 1037308.5 6778432.3 204.1, 1037338.6 6778410.3 204.4, 1037330 6778399.4 203.7, 1037305.2 6778420.2 203.7, 1037292.6 6778404.5 203.7, 1037283.3 6778410.9 204.1))
-BATIMENT0000000047948520;POLYGON Z ((1037150.8 6778389.1 206.3, 1037160.5 6778382.4 206.5, 1037139.4 6778352.3 206.6, 1037129.5 6778360.2 206.6, 1037150.8 6778389.1 206.3))
-BATIMENT0000000047950990;POLYGON Z ((1037334.6 6777982.2 207.2, 1037328.1 6777986.9 207.2, 1037325 6777983.7 207.2, 1037319 6777988.8 207.2, 1037334 6778009.1 207.2, 1037341.6 6778003.6 207.2, 1037335.2 6777994.2 207.2, 1037338.3 6777990.7 207.2, 1037345.1 6777995.7 207.2, 1037349.2 6777996.6 207.2, 1037350.3 6777990.7 207.2, 1037354 6777987.1 207.3, 1037351.6 6777984.9 207.3, 1037352.2 6777982.1 207.4, 1037343.4 6777975.6 207.2, 1037342.5 6777977.2 207.2, 1037338.2 6777972.2 207.2, 1037333 6777976.7 206.9, 1037334.6 6777982.2 207.2))
-BATIMENT0000000234798347;POLYGON Z ((1037491.7 6778046.1 205.1, 1037471.6 6778018.8 205.1, 1037464 6778024.6 205.1, 1037484.1 6778051.8 205.1, 1037491.7 6778046.1 205.1))
-BATIMENT0000000234798211;POLYGON Z ((1037420.9 6778038.4 201.6, 1037424.6 6778035.7 201.6, 1037428.7 6778032.6 201.6, 1037421.1 6778022.4 201.6, 1037413.3 6778028.2 201.6, 1037420.9 6778038.4 201.6))
-BATIMENT0000000234797447;POLYGON Z ((1037559.2 6778323.1 205.6, 1037579 6778308.7 205.6, 1037569.7 6778295.9 205.6, 1037561.4 6778302 205.6, 1037561.2 6778301.9 205.6, 1037558.3 6778304 205.6, 1037558.4 6778304.2 205.6, 1037550 6778310.4 205.6, 1037559.2 6778323.1 205.6))
-BATIMENT0000000234797390;POLYGON Z ((1037375.5 6778002.4 210.1, 1037377.8 6777988.2 210.1, 1037363.4 6777986.1 210.1, 1037361.6 6778000.3 210.1, 1037375.5 6778002.4 210.1))
-BATIMENT0000000234797405;POLYGON Z ((1037389.2 6777981.8 198.6, 1037390.1 6777976.2 198.6, 1037382.8 6777974.9 198.6, 1037381.8 6777980.5 198.6, 1037389.2 6777981.8 198.6))
-BATIMENT0000000234797473;POLYGON Z ((1037633.1 6778354.7 200.2, 1037625.4 6778344.3 200.2, 1037619 6778349 200.2, 1037620 6778350.4 200.2, 1037623.4 6778355 200.2, 1037626.7 6778359.4 200.2, 1037633.1 6778354.7 200.2))
-BATIMENT0000000234797476;POLYGON Z ((1037406.6 6778372.9 204.5, 1037399 6778378.6 204.5, 1037400.4 6778380.5 204.5, 1037404.7 6778386.3 204.5, 1037408.6 6778391.6 204.5, 1037416.2 6778386 204.5, 1037406.6 6778372.9 204.5))
-BATIMENT0000000234797477;POLYGON Z ((1037386.2 6778439.9 205.6, 1037393.8 6778434.3 205.6, 1037391.9 6778431.7 205.6, 1037394.3 6778429.8 205.6, 1037389.8 6778423.5 205.6, 1037379.5 6778431 205.6, 1037386.2 6778439.9 205.6))
-BATIMENT0000000234797479;POLYGON Z ((1037412 6778428.4 203, 1037409.5 6778430.3 203, 1037413.5 6778435.6 203, 1037415.8 6778433.9 203, 1037412 6778428.4 203))
-BATIMENT0000000234797480;POLYGON Z ((1037422.6 6778418.5 202.9, 1037422.4 6778418.2 202.9, 1037412.4 6778425.6 202.9, 1037410.8 6778426.8 202.9, 1037412 6778428.4 202.9, 1037415.8 6778433.9 202.9, 1037416.1 6778434.2 202.9, 1037427.7 6778425.5 202.9, 1037422.6 6778418.5 202.9))
-BATIMENT0000000234797481;POLYGON Z ((1037406.3 6778426.3 206.2, 1037398.3 6778432.3 206.2, 1037399.4 6778433.9 206.2, 1037397.1 6778435.6 206.2, 1037403.1 6778443.8 206.2, 1037413.5 6778436.2 206.2, 1037413.6 6778436.1 206.2, 1037408.7 6778429.7 206.2, 1037408.9 6778429.5 206.2, 1037406.3 6778426.3 206.2))
-BATIMENT0000000234797482;POLYGON Z ((1037386.2 6778439.9 206.6, 1037387.4 6778441.5 206.6, 1037387.2 6778441.8 206.6, 1037393.9 6778450.6 206.6, 1037403.1 6778443.8 206.6, 1037397.1 6778435.6 206.6, 1037395.6 6778436.7 206.6, 1037393.8 6778434.3 206.6, 1037386.2 6778439.9 206.6))
-BATIMENT0000000234797483;POLYGON Z ((1037420.5 6778404.1 202.9, 1037426.3 6778412.1 202.9, 1037427.1 6778411.5 202.9, 1037428.1 6778413 202.9, 1037424.5 6778415.7 202.9, 1037425.1 6778416.5 202.9, 1037422.6 6778418.5 202.9, 1037427.7 6778425.5 202.9, 1037438.9 6778417.1 202.9, 1037426.2 6778399.9 202.9, 1037420.5 6778404.1 202.9))
-BATIMENT0000000234797484;POLYGON Z ((1037582.3 6778380.2 204.8, 1037590.3 6778374.2 204.8, 1037584.3 6778366.1 204.8, 1037577.9 6778371 204.8, 1037576.3 6778372.2 204.8, 1037582.3 6778380.2 204.8))
-BATIMENT0000000234797485;POLYGON Z ((1037577.9 6778371 202.5, 1037584.3 6778366.1 202.5, 1037577.3 6778356.5 202.5, 1037569.1 6778362.5 202.5, 1037576.3 6778372.2 202.5, 1037577.9 6778371 202.5))
-BATIMENT0000000234797486;POLYGON Z ((1037588.1 6778388.1 203.4, 1037596.2 6778382.1 203.4, 1037590.3 6778374.2 203.4, 1037582.3 6778380.2 203.4, 1037588.1 6778388.1 203.4))
-BATIMENT0000000234797487;POLYGON Z ((1037595.8 6778491.2 201.7, 1037633.6 6778463.4 201.7, 1037647.4 6778453.2 201.7, 1037677 6778431.4 201.7, 1037675.9 6778430 201.7, 1037674.7 6778428.3 201.7, 1037672.4 6778425.1 201.7, 1037670.2 6778422.2 201.7, 1037589.1 6778482.1 201.7, 1037595.8 6778491.2 201.7))
-BATIMENT0000000234797488;POLYGON Z ((1037677 6778431.4 197.4, 1037677.9 6778430.7 197.4, 1037676.9 6778429.2 197.4, 1037675.9 6778430 197.4, 1037677 6778431.4 197.4))
-BATIMENT0000000234797496;POLYGON Z ((1037401.8 6778395.2 200.3, 1037391.5 6778403.1 200.3, 1037394.8 6778407.5 200.3, 1037395.1 6778407.9 200.3, 1037395.6 6778407.4 200.3, 1037405.7 6778399.9 200.3, 1037401.8 6778395.2 200.3))
-BATIMENT0000000234797497;POLYGON Z ((1037382.4 6778495.4 199.5, 1037353.6 6778516.5 199.5, 1037360.5 6778525.9 199.5, 1037384.8 6778508.1 199.5, 1037389.4 6778504.7 199.5, 1037382.4 6778495.4 199.5))
-BATIMENT0000000234797498;POLYGON Z ((1037384.8 6778508.1 199.6, 1037386.6 6778510.5 199.6, 1037391.1 6778507.1 199.6, 1037389.4 6778504.7 199.6, 1037384.8 6778508.1 199.6))
-BATIMENT0000000234797499;POLYGON Z ((1037389.4 6778504.7 199.6, 1037391.1 6778507.1 199.6, 1037395.7 6778503.8 199.6, 1037393.9 6778501.4 199.6, 1037389.4 6778504.7 199.6))
-BATIMENT0000000234797500;POLYGON Z ((1037386.6 6778510.5 199.5, 1037388.4 6778512.9 199.5, 1037392.9 6778509.4 199.5, 1037391.1 6778507.1 199.5, 1037386.6 6778510.5 199.5))
-BATIMENT0000000234797501;POLYGON Z ((1037391.1 6778507.1 199.6, 1037392.9 6778509.4 199.6, 1037397.3 6778506 199.6, 1037395.7 6778503.8 199.6, 1037391.1 6778507.1 199.6))
-BATIMENT0000000234797502;POLYGON Z ((1037392.9 6778509.4 199.5, 1037394.5 6778511.8 199.5, 1037394.9 6778511.5 199.5, 1037399.1 6778508.5 199.5, 1037397.3 6778506 199.5, 1037392.9 6778509.4 199.5))
-BATIMENT0000000234797503;POLYGON Z ((1037394.9 6778511.5 199.5, 1037396.6 6778513.8 199.5, 1037400.7 6778510.7 199.5, 1037399.1 6778508.5 199.5, 1037394.9 6778511.5 199.5))
-BATIMENT0000000234797504;POLYGON Z ((1037390 6778515.1 199.5, 1037391.7 6778517.4 199.5, 1037396.6 6778513.8 199.5, 1037394.9 6778511.5 199.5, 1037394.5 6778511.8 199.5, 1037390 6778515.1 199.5))
-BATIMENT0000000234797505;POLYGON Z ((1037388.4 6778512.9 199.5, 1037390 6778515.1 199.5, 1037394.5 6778511.8 199.5, 1037392.9 6778509.4 199.5, 1037388.4 6778512.9 199.5))
-BATIMENT0000000234797506;POLYGON Z ((1037391.7 6778517.4 199.5, 1037393.5 6778519.8 199.5, 1037398.4 6778516.2 199.5, 1037396.6 6778513.8 199.5, 1037391.7 6778517.4 199.5))
-BATIMENT0000000234797507;POLYGON Z ((1037400.7 6778510.7 199.5, 1037396.6 6778513.8 199.5, 1037398.4 6778516.2 199.5, 1037402.5 6778513.1 199.5, 1037400.7 6778510.7 199.5))
-BATIMENT0000000234797508;POLYGON Z ((1037398.4 6778516.2 199.5, 1037393.5 6778519.8 199.5, 1037395.2 6778522.1 199.5, 1037400.1 6778518.6 199.5, 1037398.4 6778516.2 199.5))
-BATIMENT0000000234797509;POLYGON Z ((1037402.5 6778513.1 199.5, 1037398.4 6778516.2 199.5, 1037400.1 6778518.6 199.5, 1037404.4 6778515.6 199.5, 1037402.5 6778513.1 199.5))
-BATIMENT0000000234797510;POLYGON Z ((1037404.4 6778515.6 199.5, 1037400.1 6778518.6 199.5, 1037395.2 6778522.1 199.5, 1037400.4 6778529.3 199.5, 1037409.6 6778522.6 199.5, 1037404.4 6778515.6 199.5))
-BATIMENT0000000234797511;POLYGON Z ((1037462.8 6778521.8 198.2, 1037465.2 6778520 198.2, 1037465.5 6778519.8 198.2, 1037464.1 6778518 198.2, 1037461.4 6778520 198.2, 1037462.8 6778521.8 198.2))
-BATIMENT0000000234797512;POLYGON Z ((1037461.7 6778522.7 198.2, 1037461.5 6778522.8 198.2, 1037463.7 6778525.9 198.2, 1037466.2 6778524 198.2, 1037467.6 6778525.8 198.2, 1037469 6778524.7 198.2, 1037468.1 6778523.5 198.2, 1037465.2 6778520 198.2, 1037462.8 6778521.8 198.2, 1037461.7 6778522.7 198.2))
-BATIMENT0000000234797534;POLYGON Z ((1037503.2 6778507.9 201.2, 1037498.7 6778511.3 201.2, 1037500.7 6778514 201.2, 1037505.6 6778520.4 201.2, 1037512.4 6778515.6 201.2, 1037505.4 6778506.3 201.2, 1037503.2 6778507.9 201.2))
-BATIMENT0000000234797514;POLYGON Z ((1037461.5 6778522.8 200.9, 1037461.7 6778522.7 200.9, 1037462.8 6778521.8 200.9, 1037461.4 6778520 200.9, 1037461 6778519.4 200.9, 1037459.6 6778520.4 200.9, 1037457.8 6778518 200.9, 1037461.4 6778515.4 200.9, 1037459.3 6778512.4 200.9, 1037447 6778521.5 200.9, 1037452.8 6778529.4 200.9, 1037461.5 6778522.8 200.9))
-BATIMENT0000000234797515;POLYGON Z ((1037461.4 6778534.3 200.8, 1037466.8 6778530.1 200.8, 1037463.7 6778525.9 200.8, 1037461.5 6778522.8 200.8, 1037452.8 6778529.4 200.8, 1037458.2 6778536.7 200.8, 1037461.4 6778534.3 200.8))
-BATIMENT0000000234797516;POLYGON Z ((1037467.6 6778525.8 197.8, 1037469.4 6778528.1 197.8, 1037470.9 6778526.9 197.8, 1037469 6778524.7 197.8, 1037467.6 6778525.8 197.8))
-BATIMENT0000000234797517;POLYGON Z ((1037469.4 6778533.5 197.9, 1037471.1 6778532.2 197.9, 1037472.6 6778531.1 197.9, 1037475.7 6778528.7 197.9, 1037476.7 6778527.9 197.9, 1037477.2 6778527.5 197.9, 1037474.9 6778524.4 197.9, 1037468.1 6778531.7 197.9, 1037469.3 6778533.4 197.9, 1037469.4 6778533.5 197.9))
-BATIMENT0000000234797518;POLYGON Z ((1037468.3 6778491.4 201.9, 1037468.1 6778491.1 201.9, 1037459.4 6778497.6 201.9, 1037460.5 6778499.1 201.9, 1037458.9 6778500.2 201.9, 1037461.1 6778503.1 201.9, 1037454.2 6778508.3 201.9, 1037457.8 6778513.2 201.9, 1037463.4 6778509 201.9, 1037462.2 6778507.4 201.9, 1037471.8 6778500.4 201.9, 1037473 6778501.9 201.9, 1037474.6 6778500.7 201.9, 1037474.9 6778500.5 201.9, 1037473.3 6778498.3 201.9, 1037468.3 6778491.4 201.9))
-BATIMENT0000000234797522;POLYGON Z ((1037483.7 6778522.6 201.1, 1037486.9 6778527.1 201.1, 1037487 6778527.2 201.1, 1037496.3 6778520.3 201.1, 1037494.8 6778518.3 201.1, 1037492.8 6778515.7 201.1, 1037483.7 6778522.6 201.1))
-BATIMENT0000000234797524;POLYGON Z ((1037475.8 6778511.9 201, 1037480.2 6778517.9 201, 1037482.5 6778521 201, 1037483.7 6778522.6 201, 1037492.8 6778515.7 201, 1037493.4 6778515.3 201, 1037494.9 6778514.2 201, 1037492.7 6778511.4 201, 1037485.6 6778516.7 201, 1037479.8 6778508.8 201, 1037475.8 6778511.9 201))
-BATIMENT0000000234797527;POLYGON Z ((1037462.1 6778542.1 200.8, 1037464.6 6778542.5 200.8, 1037475.2 6778534.5 200.8, 1037472.6 6778531.1 200.8, 1037471.1 6778532.2 200.8, 1037469.4 6778533.5 200.8, 1037469.3 6778533.4 200.8, 1037462.7 6778538.4 200.8, 1037460.6 6778540.1 200.8, 1037462.1 6778542.1 200.8))
-BATIMENT0000000234797528;POLYGON Z ((1037462.7 6778538.4 200.8, 1037469.3 6778533.4 200.8, 1037468.1 6778531.7 200.8, 1037466.8 6778530.1 200.8, 1037461.4 6778534.3 200.8, 1037458.2 6778536.7 200.8, 1037460.6 6778540.1 200.8, 1037462.7 6778538.4 200.8))
-BATIMENT0000000234797531;POLYGON Z ((1037507.4 6778531.5 201.2, 1037502.5 6778525.2 201.2, 1037494.9 6778530.9 201.2, 1037491.5 6778533.4 201.2, 1037496.2 6778539.8 201.2, 1037507.4 6778531.5 201.2))
-BATIMENT0000000234797532;POLYGON Z ((1037505.6 6778520.4 201.1, 1037511.7 6778528.4 201.1, 1037518.3 6778523.6 201.1, 1037512.4 6778515.6 201.1, 1037505.6 6778520.4 201.1))
-BATIMENT0000000234797535;POLYGON Z ((1037491.9 6778500.2 201.1, 1037493.9 6778502.9 201.1, 1037493 6778503.6 201.1, 1037496.6 6778508.5 201.1, 1037498.7 6778511.3 201.1, 1037503.2 6778507.9 201.1, 1037505.4 6778506.3 201.1, 1037497.7 6778495.9 201.1, 1037491.9 6778500.2 201.1))
-BATIMENT0000000234797536;POLYGON Z ((1037489 6778497.5 201.9, 1037491.4 6778500.6 201.9, 1037491.9 6778500.2 201.9, 1037497.7 6778495.9 201.9, 1037495.5 6778492.9 201.9, 1037489 6778497.5 201.9))
-BATIMENT0000000234797537;POLYGON Z ((1037490.2 6778485.9 201.4, 1037484.9 6778478.7 201.4, 1037474.6 6778486.3 201.4, 1037474.8 6778486.6 201.4, 1037479.8 6778493.5 201.4, 1037490.2 6778485.9 201.4))
-BATIMENT0000000234797539;POLYGON Z ((1037479.8 6778493.5 201.8, 1037474.8 6778486.6 201.8, 1037468.3 6778491.4 201.8, 1037473.3 6778498.3 201.8, 1037479.8 6778493.5 201.8))
-BATIMENT0000000234797543;POLYGON Z ((1037471 6778418.2 201.2, 1037478.7 6778412.4 201.2, 1037481.2 6778410.6 201.2, 1037480.7 6778409.8 201.2, 1037475.4 6778402.8 201.2, 1037465.1 6778410.4 201.2, 1037471 6778418.2 201.2))
-BATIMENT0000000234797545;POLYGON Z ((1037488.1 6778411 200.8, 1037485 6778406.7 200.8, 1037480.7 6778409.8 200.8, 1037481.2 6778410.6 200.8, 1037483.9 6778414.2 200.8, 1037488.1 6778411 200.8))
-BATIMENT0000000234797546;POLYGON Z ((1037477.9 6778427.4 201.2, 1037482.1 6778424.2 201.2, 1037487 6778420.6 201.2, 1037488.1 6778419.8 201.2, 1037485.8 6778416.7 201.2, 1037483.3 6778418.6 201.2, 1037475.5 6778424.3 201.2, 1037477.9 6778427.4 201.2))
-BATIMENT0000000234797547;POLYGON Z ((1037485.8 6778416.7 200.6, 1037485 6778415.7 200.6, 1037482.5 6778417.5 200.6, 1037483.3 6778418.6 200.6, 1037485.8 6778416.7 200.6))
-BATIMENT0000000234797552;POLYGON Z ((1037504.2 6778398.9 206.2, 1037496.3 6778404.9 206.2, 1037500.5 6778410.7 206.2, 1037503.2 6778408.7 206.2, 1037508.5 6778404.7 206.2, 1037504.2 6778398.9 206.2))
-BATIMENT0000000234797554;POLYGON Z ((1037495.8 6778387.6 204.8, 1037488.8 6778392.8 204.8, 1037491 6778395.8 204.8, 1037489.7 6778396.8 204.8, 1037495.8 6778405.3 204.8, 1037496.3 6778404.9 204.8, 1037504.2 6778398.9 204.8, 1037495.8 6778387.6 204.8))
-BATIMENT0000000234797557;POLYGON Z ((1037508.5 6778404.7 206, 1037503.2 6778408.7 206, 1037500.5 6778410.7 206, 1037499.2 6778411.6 206, 1037501.7 6778415 206, 1037505.3 6778419.9 206, 1037506.9 6778422.2 206, 1037509.1 6778420.6 206, 1037516.4 6778415.3 206, 1037508.5 6778404.7 206))
-BATIMENT0000000234797559;POLYGON Z ((1037519.8 6778439.8 206.4, 1037529.3 6778432.7 206.4, 1037516.4 6778415.3 206.4, 1037509.1 6778420.6 206.4, 1037506.9 6778422.2 206.4, 1037506.8 6778422.3 206.4, 1037514.7 6778432.5 206.4, 1037519.8 6778439.8 206.4))
-BATIMENT0000000234797565;POLYGON Z ((1037566 6778436.2 201.5, 1037568.3 6778439.3 201.5, 1037569.7 6778441.2 201.5, 1037574.3 6778437.7 201.5, 1037574.9 6778437.3 201.5, 1037577.4 6778435.5 201.5, 1037573.8 6778430.4 201.5, 1037566 6778436.2 201.5))
-BATIMENT0000000234797568;POLYGON Z ((1037573.8 6778430.4 201.5, 1037577.4 6778435.5 201.5, 1037579.8 6778433.6 201.5, 1037581.9 6778432.1 201.5, 1037578.2 6778427.1 201.5, 1037573.8 6778430.4 201.5))
-BATIMENT0000000234797570;POLYGON Z ((1037568.8 6778441.9 204, 1037569.7 6778441.2 204, 1037568.3 6778439.3 204, 1037566.5 6778440.5 204, 1037568.1 6778442.4 204, 1037568.8 6778441.9 204))
-BATIMENT0000000234797572;POLYGON Z ((1037568.1 6778442.4 202, 1037566.5 6778440.5 202, 1037565 6778441.7 202, 1037566.5 6778443.6 202, 1037568.1 6778442.4 202))
-BATIMENT0000000234797573;POLYGON Z ((1037565.6 6778444.3 206.6, 1037566.5 6778443.6 206.6, 1037565 6778441.7 206.6, 1037562.7 6778438.6 206.6, 1037553.6 6778426.4 206.6, 1037544.2 6778433.4 206.6, 1037557 6778450.7 206.6, 1037565.6 6778444.3 206.6))
-BATIMENT0000000234797579;POLYGON Z ((1037569.7 6778467.8 205.3, 1037576.4 6778463.1 205.3, 1037577.8 6778462.1 205.3, 1037577.2 6778461.2 205.3, 1037572.8 6778455.2 205.3, 1037568.5 6778458.3 205.3, 1037564.8 6778461.1 205.3, 1037569.7 6778467.8 205.3))
-BATIMENT0000000234797581;POLYGON Z ((1037577.2 6778461.2 203.1, 1037578.1 6778460.5 203.1, 1037573.7 6778454.5 203.1, 1037573.3 6778454.8 203.1, 1037572.8 6778455.2 203.1, 1037577.2 6778461.2 203.1))
-BATIMENT0000000234797584;POLYGON Z ((1037577.6 6778478.4 204.2, 1037585.5 6778472.5 204.2, 1037581 6778466.4 204.2, 1037579.7 6778467.3 204.2, 1037576.4 6778463.1 204.2, 1037569.7 6778467.8 204.2, 1037577.6 6778478.4 204.2))
-BATIMENT0000000234797588;POLYGON Z ((1037598.9 6778462.6 200.8, 1037596.1 6778458.4 200.8, 1037585.5 6778442.8 200.8, 1037577.5 6778448.6 200.8, 1037579 6778450.5 200.8, 1037579.4 6778450.3 200.8, 1037581.3 6778452.9 200.8, 1037581.8 6778453.6 200.8, 1037583 6778455.3 200.8, 1037584.5 6778457.3 200.8, 1037586.7 6778460.8 200.8, 1037591.4 6778468.2 200.8, 1037598.9 6778462.6 200.8))
-BATIMENT0000000234797597;POLYGON Z ((1037443.5 6778439.8 205.2, 1037442.6 6778440.5 205.2, 1037443.5 6778441.6 205.2, 1037444.4 6778441 205.2, 1037443.5 6778439.8 205.2))
-BATIMENT0000000234797600;POLYGON Z ((1037446.6 6778427.3 203.6, 1037443.9 6778427 203.6, 1037435.3 6778433.4 203.6, 1037441.4 6778441.4 203.6, 1037442.6 6778440.5 203.6, 1037443.5 6778439.8 203.6, 1037444.4 6778441 203.6, 1037447.2 6778444.9 203.6, 1037450.3 6778448.9 203.6, 1037451.4 6778448 203.6, 1037458.2 6778443 203.6, 1037446.6 6778427.3 203.6))
-BATIMENT0000000234797602;POLYGON Z ((1037435.6 6778454.4 201.6, 1037433 6778456.2 201.6, 1037434.2 6778457.8 201.6, 1037429.9 6778461 201.6, 1037430.2 6778461.4 201.6, 1037431.3 6778462.9 201.6, 1037435.8 6778459.5 201.6, 1037438.1 6778457.9 201.6, 1037435.6 6778454.4 201.6))
-BATIMENT0000000234797604;POLYGON Z ((1037458.2 6778443 205, 1037451.4 6778448 205, 1037455.3 6778453.3 205, 1037459.2 6778458.6 205, 1037466 6778453.4 205, 1037458.2 6778443 205))
-BATIMENT0000000234797606;POLYGON Z ((1037422.7 6778447.7 205.6, 1037416.6 6778452.1 205.6, 1037423.5 6778461.7 205.6, 1037430.8 6778456.3 205.6, 1037428.1 6778452.6 205.6, 1037432.2 6778449.6 205.6, 1037425.7 6778440.5 205.6, 1037420.3 6778444.5 205.6, 1037422.7 6778447.7 205.6))
-BATIMENT0000000234797608;POLYGON Z ((1037452.4 6778477.9 199.2, 1037451.6 6778477 199.2, 1037452.7 6778476.2 199.2, 1037449.8 6778472.2 199.2, 1037446.8 6778474.3 199.2, 1037447.8 6778475.6 199.2, 1037450.5 6778479.3 199.2, 1037452.4 6778477.9 199.2))
-BATIMENT0000000234797609;POLYGON Z ((1037443.8 6778470.2 199.2, 1037445.8 6778472.9 199.2, 1037446.8 6778474.3 199.2, 1037449.8 6778472.2 199.2, 1037446.7 6778468 199.2, 1037443.8 6778470.2 199.2))
-BATIMENT0000000234797610;POLYGON Z ((1037450.5 6778479.3 202.8, 1037447.8 6778475.6 202.8, 1037445.9 6778477.1 202.8, 1037448.6 6778480.8 202.8, 1037444.8 6778483.7 202.8, 1037450.8 6778491.9 202.8, 1037456.6 6778487.6 202.8, 1037450.5 6778479.3 202.8))
-BATIMENT0000000234797611;POLYGON Z ((1037453.4 6778477.1 202.3, 1037452.7 6778476.2 202.3, 1037451.6 6778477 202.3, 1037452.4 6778477.9 202.3, 1037453.4 6778477.1 202.3))
-BATIMENT0000000234797614;POLYGON Z ((1037430.2 6778461.4 201.5, 1037429 6778462.3 201.5, 1037430.1 6778463.7 201.5, 1037431.3 6778462.9 201.5, 1037430.2 6778461.4 201.5))
-BATIMENT0000000234797615;POLYGON Z ((1037431.3 6778462.9 201.4, 1037430.1 6778463.7 201.4, 1037428.4 6778465 201.4, 1037424.5 6778467.9 201.4, 1037426.4 6778470.4 201.4, 1037427.4 6778470.5 201.4, 1037435.4 6778464.6 201.4, 1037436.7 6778466.3 201.4, 1037439.3 6778464.3 201.4, 1037435.8 6778459.5 201.4, 1037431.3 6778462.9 201.4))
-BATIMENT0000000234797616;POLYGON Z ((1037424.5 6778467.9 199.8, 1037428.4 6778465 199.8, 1037426 6778461.8 199.8, 1037424.5 6778462.9 199.8, 1037424 6778462.3 199.8, 1037421.7 6778464.1 199.8, 1037424.5 6778467.9 199.8))
-BATIMENT0000000234797619;POLYGON Z ((1037541 6778493.6 202.4, 1037539.9 6778492.1 202.4, 1037538.5 6778493.1 202.4, 1037539.6 6778494.6 202.4, 1037541 6778493.6 202.4))
-BATIMENT0000000234797620;POLYGON Z ((1037546.6 6778490.5 204.8, 1037541.5 6778494.3 204.8, 1037541 6778493.6 204.8, 1037539.6 6778494.6 204.8, 1037540.1 6778495.3 204.8, 1037541.2 6778496.7 204.8, 1037547.7 6778491.9 204.8, 1037546.6 6778490.5 204.8))
-BATIMENT0000000234797621;POLYGON Z ((1037552.3 6778498.3 202, 1037548.3 6778492.8 202, 1037547.7 6778491.9 202, 1037541.2 6778496.7 202, 1037545.9 6778503 202, 1037552.3 6778498.3 202))
-BATIMENT0000000234797624;POLYGON Z ((1037536.8 6778499.9 202, 1037535.8 6778498.5 202, 1037532.2 6778501.1 202, 1037533.2 6778502.5 202, 1037536.8 6778499.9 202))
-BATIMENT0000000234797625;POLYGON Z ((1037543.3 6778505 202, 1037538.7 6778498.5 202, 1037536.8 6778499.9 202, 1037533.2 6778502.5 202, 1037533.4 6778502.7 202, 1037538 6778508.9 202, 1037543.3 6778505 202))
-BATIMENT0000000234797627;POLYGON Z ((1037554.4 6778488.1 204.6, 1037553.8 6778487.3 204.6, 1037553.2 6778486.4 204.6, 1037551.2 6778487.9 204.6, 1037550.6 6778487 204.6, 1037549 6778488.1 204.6, 1037546.3 6778490.1 204.6, 1037546.6 6778490.5 204.6, 1037547.7 6778491.9 204.6, 1037548.3 6778492.8 204.6, 1037552.3 6778498.3 204.6, 1037558.5 6778493.7 204.6, 1037554.4 6778488.1 204.6))
-BATIMENT0000000234797629;POLYGON Z ((1037568.5 6778486.2 202, 1037564.4 6778480.8 202, 1037560.4 6778483.7 202, 1037557.2 6778486.1 202, 1037556.2 6778486.9 202, 1037554.4 6778488.1 202, 1037558.5 6778493.7 202, 1037568.5 6778486.2 202))
-BATIMENT0000000234797634;POLYGON Z ((1037557.2 6778486.1 201.9, 1037553.5 6778481.2 201.9, 1037552.5 6778482 201.9, 1037556.2 6778486.9 201.9, 1037557.2 6778486.1 201.9))
-BATIMENT0000000234797635;POLYGON Z ((1037555.7 6778469 205, 1037549.2 6778473.9 205, 1037551.1 6778476.5 205, 1037550.3 6778477.1 205, 1037553.5 6778481.2 205, 1037556.6 6778478.9 205, 1037560.4 6778483.7 205, 1037564.4 6778480.8 205, 1037555.7 6778469 205))
-BATIMENT0000000234797636;POLYGON Z ((1037533.4 6778502.7 199.8, 1037533.2 6778502.5 199.8, 1037526.3 6778507.6 199.8, 1037527.7 6778509.5 199.8, 1037524.2 6778512 199.8, 1037527.6 6778516.6 199.8, 1037538 6778508.9 199.8, 1037533.4 6778502.7 199.8))
-BATIMENT0000000234797640;POLYGON Z ((1037546.9 6778480.8 201.9, 1037548.1 6778482.4 201.9, 1037549 6778481.8 201.9, 1037549.8 6778483 201.9, 1037550.3 6778482.5 201.9, 1037548.3 6778479.7 201.9, 1037546.9 6778480.8 201.9))
-BATIMENT0000000234797641;POLYGON Z ((1037545.9 6778476.4 202, 1037544.7 6778477.3 202, 1037541.5 6778479.8 202, 1037539.8 6778481.1 202, 1037541.8 6778483.9 202, 1037542.2 6778484.4 202, 1037546.3 6778481.2 202, 1037546.9 6778480.8 202, 1037548.3 6778479.7 202, 1037546.8 6778477.7 202, 1037545.9 6778476.4 202))
-BATIMENT0000000234797642;POLYGON Z ((1037553.5 6778481.2 201.9, 1037550.3 6778477.1 201.9, 1037549.3 6778477.9 201.9, 1037552.5 6778482 201.9, 1037553.5 6778481.2 201.9))
-BATIMENT0000000234797643;POLYGON Z ((1037545.1 6778475.5 204.1, 1037544 6778476.3 204.1, 1037544.7 6778477.3 204.1, 1037545.9 6778476.4 204.1, 1037545.1 6778475.5 204.1))
-BATIMENT0000000234797644;POLYGON Z ((1037546.9 6778475.6 202, 1037545.9 6778476.4 202, 1037546.8 6778477.7 202, 1037548.3 6778476.6 202, 1037547.3 6778475.3 202, 1037546.9 6778475.6 202))
-BATIMENT0000000234797645;POLYGON Z ((1037541.8 6778471 203, 1037545.1 6778475.5 203, 1037546.2 6778474.6 203, 1037542.9 6778470.2 203, 1037541.8 6778471 203))
-BATIMENT0000000234797646;POLYGON Z ((1037548 6778474.9 202, 1037547.3 6778475.3 202, 1037548.3 6778476.6 202, 1037549.3 6778477.9 202, 1037550.3 6778477.1 202, 1037551.1 6778476.5 202, 1037549.2 6778473.9 202, 1037548 6778474.9 202))
-BATIMENT0000000234797647;POLYGON Z ((1037551.6 6778463.6 204.6, 1037542.9 6778470.2 204.6, 1037546.2 6778474.6 204.6, 1037546.9 6778475.6 204.6, 1037547.3 6778475.3 204.6, 1037548 6778474.9 204.6, 1037549.2 6778473.9 204.6, 1037555.7 6778469 204.6, 1037551.6 6778463.6 204.6))
-BATIMENT0000000234797648;POLYGON Z ((1037546.2 6778474.6 202, 1037545.1 6778475.5 202, 1037545.9 6778476.4 202, 1037546.9 6778475.6 202, 1037546.2 6778474.6 202))
-BATIMENT0000000234797650;POLYGON Z ((1037544.1 6778453.5 204.6, 1037537.4 6778458.6 204.6, 1037536.1 6778459.6 204.6, 1037535.5 6778460.1 204.6, 1037542.9 6778470.2 204.6, 1037551.6 6778463.6 204.6, 1037544.1 6778453.5 204.6))
-BATIMENT0000000234797651;POLYGON Z ((1037535.6 6778442.1 205, 1037534.1 6778442 205, 1037528.1 6778446.4 205, 1037528.2 6778446.5 205, 1037531.2 6778450.5 205, 1037531.8 6778451.3 205, 1037536.8 6778457.8 205, 1037537.4 6778458.6 205, 1037544.1 6778453.5 205, 1037535.6 6778442.1 205))
-BATIMENT0000000234797653;POLYGON Z ((1037531.2 6778450.5 202, 1037528.3 6778452.7 202, 1037529 6778453.5 202, 1037531.8 6778451.3 202, 1037531.2 6778450.5 202))
-BATIMENT0000000234797654;POLYGON Z ((1037536.1 6778459.6 204.2, 1037537.4 6778458.6 204.2, 1037536.8 6778457.8 204.2, 1037535.5 6778458.7 204.2, 1037536.1 6778459.6 204.2))
-BATIMENT0000000234797656;POLYGON Z ((1037531.1 6778456.9 202, 1037525 6778448.7 202, 1037514.4 6778456.6 202, 1037518.2 6778461.7 202, 1037520.5 6778464.8 202, 1037531.1 6778456.9 202))
-BATIMENT0000000234797657;POLYGON Z ((1037521.3 6778465.9 200.6, 1037520.5 6778464.8 200.6, 1037518.2 6778461.7 200.6, 1037513.7 6778465.1 200.6, 1037517.4 6778470 200.6, 1037521.9 6778466.6 200.6, 1037521.3 6778465.9 200.6))
-BATIMENT0000000234797659;POLYGON Z ((1037371.3 6778381.8 204.8, 1037379 6778375.9 204.8, 1037372.9 6778368 204.8, 1037368.7 6778371.1 204.8, 1037365.2 6778373.8 204.8, 1037371.3 6778381.8 204.8))
-BATIMENT0000000234797660;POLYGON Z ((1037368.7 6778371.1 203.8, 1037367.8 6778370 203.8, 1037364.3 6778372.6 203.8, 1037365.2 6778373.8 203.8, 1037368.7 6778371.1 203.8))
-BATIMENT0000000234797661;POLYGON Z ((1037584 6778403.1 204.4, 1037572.5 6778411.6 204.4, 1037579.5 6778420.9 204.4, 1037590.9 6778412.5 204.4, 1037584 6778403.1 204.4))
-BATIMENT0000000234797664;POLYGON Z ((1037611.8 6778344.1 198.8, 1037610.1 6778345.3 198.8, 1037609.7 6778344.7 198.8, 1037607.1 6778346.6 198.8, 1037609.5 6778349.8 198.8, 1037612.3 6778347.7 198.8, 1037613.7 6778346.6 198.8, 1037611.8 6778344.1 198.8))
-BATIMENT0000000234797666;POLYGON Z ((1037616.1 6778353 199.2, 1037612.3 6778347.7 199.2, 1037609.5 6778349.8 199.2, 1037613.3 6778355 199.2, 1037616.1 6778353 199.2))
-BATIMENT0000000234797668;POLYGON Z ((1037609.9 6778359.6 205.8, 1037604.7 6778363.5 205.8, 1037610.6 6778371.4 205.8, 1037614.8 6778368.3 205.8, 1037616.6 6778366.9 205.8, 1037610.7 6778359 205.8, 1037609.9 6778359.6 205.8))
-BATIMENT0000000234797669;POLYGON Z ((1037601.2 6778371.7 202.5, 1037604.3 6778376.1 202.5, 1037610.6 6778371.4 202.5, 1037604.7 6778363.5 202.5, 1037598.5 6778368.1 202.5, 1037601.2 6778371.7 202.5))
-BATIMENT0000000234797670;POLYGON Z ((1037597.8 6778374.2 202.4, 1037601.2 6778371.7 202.4, 1037598.5 6778368.1 202.4, 1037595.1 6778370.6 202.4, 1037597.8 6778374.2 202.4))
-BATIMENT0000000234797671;POLYGON Z ((1037604.3 6778376.1 202.6, 1037601.2 6778371.7 202.6, 1037597.8 6778374.2 202.6, 1037601 6778378.6 202.6, 1037604.3 6778376.1 202.6))
-BATIMENT0000000234797672;POLYGON Z ((1037591.5 6778345.7 200, 1037594 6778349.1 200, 1037598.8 6778345.5 200, 1037595.6 6778341 200, 1037590.7 6778344.7 200, 1037591.5 6778345.7 200))
-BATIMENT0000000234797676;POLYGON Z ((1037591.5 6778345.7 199, 1037587.4 6778348.8 199, 1037592.4 6778355.6 199, 1037596.5 6778352.5 199, 1037595.9 6778351.7 199, 1037595.7 6778351.4 199, 1037594 6778349.1 199, 1037591.5 6778345.7 199))
-BATIMENT0000000234797680;POLYGON Z ((1037594 6778362.4 201, 1037597.2 6778360.1 201, 1037595.4 6778357.7 201, 1037594.4 6778358.4 201, 1037592.3 6778360 201, 1037594 6778362.4 201))
-BATIMENT0000000234797685;POLYGON Z ((1037632.2 6778420.7 201.7, 1037624.2 6778410.1 201.7, 1037611.4 6778419.2 201.7, 1037628.4 6778442.2 201.7, 1037653.8 6778423.6 201.7, 1037651.1 6778419.9 201.7, 1037646.3 6778413.4 201.7, 1037644.8 6778411.4 201.7, 1037632.2 6778420.7 201.7))
-BATIMENT0000000234797686;POLYGON Z ((1037639.1 6778388.5 203.5, 1037640 6778389.6 203.5, 1037652.3 6778380.1 203.5, 1037639.8 6778363.4 203.5, 1037594.9 6778396.9 203.5, 1037611.4 6778419.2 203.5, 1037624.2 6778410.1 203.5, 1037619.2 6778403.5 203.5, 1037632 6778393.8 203.5, 1037639.1 6778388.5 203.5))
-BATIMENT0000000234797687;POLYGON Z ((1037651.1 6778419.9 202, 1037653.8 6778423.6 202, 1037656.6 6778421.5 202, 1037658.4 6778420.2 202, 1037661.4 6778399.6 202, 1037658.5 6778401.3 202, 1037657.4 6778401.5 202, 1037657 6778401.6 202, 1037656.6 6778401.7 202, 1037656.2 6778401.9 202, 1037656 6778402.1 202, 1037655.7 6778402.3 202, 1037655.4 6778402.7 202, 1037655 6778403.1 202, 1037654.8 6778403.4 202, 1037654.7 6778403.6 202, 1037649.9 6778403 202, 1037648.7 6778410.5 202, 1037649.4 6778411.3 202, 1037646.3 6778413.4 202, 1037651.1 6778419.9 202))
-BATIMENT0000000234797689;POLYGON Z ((1037389.1 6778465.8 206.6, 1037388.2 6778466.5 206.6, 1037382.4 6778470.7 206.6, 1037415.9 6778516.1 206.6, 1037422.4 6778511.3 206.6, 1037422.5 6778511.2 206.6, 1037389.1 6778465.8 206.6))
-BATIMENT0000000234797690;POLYGON Z ((1037241.6 6778447.8 203.8, 1037241.2 6778447.1 203.8, 1037239.3 6778448.4 203.8, 1037239.1 6778448.6 203.8, 1037239.6 6778449.3 203.8, 1037241.6 6778447.8 203.8))
-BATIMENT0000000234797692;POLYGON Z ((1037244.5 6778451.7 205, 1037241.6 6778447.8 205, 1037239.6 6778449.3 205, 1037237.8 6778450.6 205, 1037233.2 6778453.9 205, 1037239.1 6778462.1 205, 1037247.5 6778456 205, 1037244.5 6778451.7 205))
-BATIMENT0000000234797695;POLYGON Z ((1037239.1 6778462.1 206.2, 1037245.8 6778471.1 206.2, 1037251.7 6778466.8 206.2, 1037250.7 6778465.5 206.2, 1037252.5 6778464.2 206.2, 1037251.3 6778462.6 206.2, 1037253.3 6778461.1 206.2, 1037248.8 6778455 206.2, 1037247.5 6778456 206.2, 1037239.1 6778462.1 206.2))
-BATIMENT0000000234797696;POLYGON Z ((1037249.3 6778475.9 202.8, 1037257.6 6778469.8 202.8, 1037253.1 6778463.8 202.8, 1037252.5 6778464.2 202.8, 1037250.7 6778465.5 202.8, 1037251.7 6778466.8 202.8, 1037245.8 6778471.1 202.8, 1037249.3 6778475.9 202.8))
-BATIMENT0000000234797698;POLYGON Z ((1037266.1 6778463.4 202.8, 1037261 6778456.6 202.8, 1037256.1 6778460.2 202.8, 1037252.4 6778462.9 202.8, 1037253.1 6778463.8 202.8, 1037257.6 6778469.8 202.8, 1037266.1 6778463.4 202.8))
-BATIMENT0000000234797703;POLYGON Z ((1037284.1 6778432.8 206.2, 1037284.2 6778433 206.2, 1037281.4 6778435 206.2, 1037281.7 6778435.5 206.2, 1037282.4 6778436.5 206.2, 1037272.2 6778444 206.2, 1037271.4 6778443 206.2, 1037270.8 6778442.1 206.2, 1037269.2 6778443.3 206.2, 1037276.3 6778453 206.2, 1037277.7 6778454.9 206.2, 1037293.1 6778443.5 206.2, 1037293.6 6778440.8 206.2, 1037286.4 6778431.2 206.2, 1037284.1 6778432.8 206.2))
-BATIMENT0000000234797707;POLYGON Z ((1037236.3 6778434.8 202.6, 1037233.6 6778436.8 202.6, 1037232.3 6778437.8 202.6, 1037233.7 6778439.6 202.6, 1037235.5 6778438.2 202.6, 1037237 6778437.1 202.6, 1037237.7 6778436.6 202.6, 1037236.3 6778434.8 202.6))
-BATIMENT0000000234797708;POLYGON Z ((1037219.3 6778434.8 202.8, 1037224.3 6778441.8 202.8, 1037232.6 6778435.5 202.8, 1037233.3 6778434.9 202.8, 1037228.3 6778428 202.8, 1037219.3 6778434.8 202.8))
-BATIMENT0000000234797709;POLYGON Z ((1037228.3 6778428 202.8, 1037233.3 6778434.9 202.8, 1037235.3 6778433.4 202.8, 1037235.4 6778433.5 202.8, 1037241.5 6778429 202.8, 1037236.3 6778422.1 202.8, 1037228.3 6778428 202.8))
-BATIMENT0000000234797710;POLYGON Z ((1037233 6778436 200.8, 1037235.8 6778434 200.8, 1037235.4 6778433.5 200.8, 1037235.3 6778433.4 200.8, 1037233.3 6778434.9 200.8, 1037232.6 6778435.5 200.8, 1037233 6778436 200.8))
-BATIMENT0000000234797712;POLYGON Z ((1037236.3 6778422.1 205.6, 1037241.5 6778429 205.6, 1037243.3 6778431.2 205.6, 1037253.9 6778423.3 205.6, 1037255.3 6778422.4 205.6, 1037254.3 6778421.1 205.6, 1037253.7 6778420.3 205.6, 1037249.6 6778414.6 205.6, 1037248.4 6778413 205.6, 1037236.3 6778422.1 205.6))
-BATIMENT0000000234797713;POLYGON Z ((1037260.4 6778419.8 202.8, 1037261 6778419.3 202.8, 1037260.9 6778419.1 202.8, 1037260.6 6778419.3 202.8, 1037255.6 6778422.9 202.8, 1037260.2 6778429.1 202.8, 1037264.8 6778425.7 202.8, 1037260.4 6778419.8 202.8))
-BATIMENT0000000234797714;POLYGON Z ((1037254.5 6778408.5 203.1, 1037248.4 6778413 203.1, 1037249.6 6778414.6 203.1, 1037253.7 6778420.3 203.1, 1037254.3 6778421.1 203.1, 1037259.3 6778417.4 203.1, 1037260.5 6778416.5 203.1, 1037259.9 6778415.7 203.1, 1037254.5 6778408.5 203.1))
-BATIMENT0000000234797716;POLYGON Z ((1037264.2 6778401.2 203.1, 1037254.5 6778408.5 203.1, 1037259.9 6778415.7 203.1, 1037260.5 6778416.5 203.1, 1037262 6778415.4 203.1, 1037261.9 6778415.2 203.1, 1037270.1 6778409.2 203.1, 1037264.2 6778401.2 203.1))
-BATIMENT0000000234797717;POLYGON Z ((1037279 6778421.2 205.1, 1037270.2 6778409.4 205.1, 1037262 6778415.4 205.1, 1037271.3 6778427.5 205.1, 1037279.4 6778421.8 205.1, 1037279 6778421.2 205.1))
-BATIMENT0000000234797721;POLYGON Z ((1037270.1 6778409.2 203, 1037261.9 6778415.2 203, 1037262 6778415.4 203, 1037270.2 6778409.4 203, 1037270.1 6778409.2 203))
-BATIMENT0000000234797722;POLYGON Z ((1037279.4 6778421.8 202.6, 1037271.3 6778427.5 202.6, 1037268 6778429.9 202.6, 1037271.6 6778435.1 202.6, 1037283.1 6778426.8 202.6, 1037279.4 6778421.8 202.6))
-BATIMENT0000000234797723;POLYGON Z ((1037235.8 6778434 199.6, 1037233 6778436 199.6, 1037233.6 6778436.8 199.6, 1037236.3 6778434.8 199.6, 1037235.8 6778434 199.6))
-BATIMENT0000000234797724;POLYGON Z ((1037653 6778356.2 201.5, 1037651.2 6778357.5 201.5, 1037656 6778364.2 201.5, 1037664.2 6778358.3 201.5, 1037657.3 6778348.8 201.5, 1037650.9 6778353.4 201.5, 1037653 6778356.2 201.5))
-BATIMENT0000000234797725;POLYGON Z ((1037693.4 6778381.4 199.5, 1037691.8 6778392.7 199.5, 1037693.6 6778393 199.5, 1037698 6778393.7 199.5, 1037699.9 6778382 199.5, 1037695.3 6778381.3 199.5, 1037693.4 6778381.4 199.5))
-BATIMENT0000000234797729;POLYGON Z ((1037558.1 6778517.1 200.6, 1037566.2 6778511 200.6, 1037567.2 6778510.2 200.6, 1037561.7 6778502.9 200.6, 1037552.6 6778509.8 200.6, 1037558.1 6778517.1 200.6))
-BATIMENT0000000234797730;POLYGON Z ((1037540.2 6778519.2 200.6, 1037545.7 6778526.4 200.6, 1037558.1 6778517.1 200.6, 1037552.6 6778509.8 200.6, 1037540.2 6778519.2 200.6))
-BATIMENT0000000234797732;POLYGON Z ((1037204.7 6778415.2 200.4, 1037211.6 6778410.3 200.4, 1037214.3 6778408.4 200.4, 1037212.1 6778405.4 200.4, 1037202.7 6778412.3 200.4, 1037204.7 6778415.2 200.4))
-BATIMENT0000000234797733;POLYGON Z ((1037215.2 6778371.1 201.4, 1037216.7 6778370.1 201.4, 1037221.5 6778365.8 201.4, 1037216.4 6778358.9 201.4, 1037209.7 6778363.9 201.4, 1037215.2 6778371.1 201.4))
-BATIMENT0000000234797734;POLYGON Z ((1037215.6 6778371.7 200.2, 1037218.3 6778375.2 200.2, 1037219.3 6778376.5 200.2, 1037220.7 6778375.4 200.2, 1037216.7 6778370.1 200.2, 1037215.2 6778371.1 200.2, 1037215.6 6778371.7 200.2))
-BATIMENT0000000234797735;POLYGON Z ((1037205.3 6778367.2 206.3, 1037211.2 6778374.9 206.3, 1037215.6 6778371.7 206.3, 1037215.2 6778371.1 206.3, 1037209.7 6778363.9 206.3, 1037205.3 6778367.2 206.3))
-BATIMENT0000000234797740;POLYGON Z ((1037233.3 6778375.7 201.4, 1037231.6 6778377 201.4, 1037231 6778377.5 201.4, 1037232.1 6778378.8 201.4, 1037234.4 6778377.3 201.4, 1037233.3 6778375.7 201.4))
-BATIMENT0000000234797742;POLYGON Z ((1037242.3 6778371.9 201.5, 1037240.4 6778373.4 201.5, 1037239.2 6778374.2 201.5, 1037237.7 6778375.2 201.5, 1037237.2 6778375.5 201.5, 1037234.4 6778377.3 201.5, 1037232.1 6778378.8 201.5, 1037234.3 6778381.7 201.5, 1037236.8 6778379.9 201.5, 1037238.6 6778378.8 201.5, 1037239.5 6778378.2 201.5, 1037243.8 6778384 201.5, 1037244.5 6778383.6 201.5, 1037248.6 6778380.5 201.5, 1037242.3 6778371.9 201.5))
-BATIMENT0000000234797743;POLYGON Z ((1037231.7 6778357.5 201.5, 1037229 6778359.6 201.5, 1037224.6 6778363.1 201.5, 1037227.6 6778367 201.5, 1037229.3 6778369.2 201.5, 1037229.6 6778369 201.5, 1037235.4 6778364.8 201.5, 1037236.5 6778364 201.5, 1037231.7 6778357.5 201.5))
-BATIMENT0000000234797748;POLYGON Z ((1037233.3 6778395.1 205, 1037231.8 6778396.3 205, 1037224.9 6778401.4 205, 1037222.7 6778403.1 205, 1037226 6778407.8 205, 1037229.6 6778412.7 205, 1037240.4 6778404.5 205, 1037234.7 6778397 205, 1037233.3 6778395.1 205))
-BATIMENT0000000234797749;POLYGON Z ((1037240.4 6778404.5 201.7, 1037257.1 6778392 201.7, 1037251.6 6778384.5 201.7, 1037247.4 6778387.6 201.7, 1037234.7 6778397 201.7, 1037240.4 6778404.5 201.7))
-BATIMENT0000000234797750;POLYGON Z ((1037229.4 6778354.3 198.2, 1037226.6 6778356.3 198.2, 1037229 6778359.6 198.2, 1037231.7 6778357.5 198.2, 1037229.4 6778354.3 198.2))
-BATIMENT0000000234797753;POLYGON Z ((1037213.5 6778390.6 201.2, 1037210.3 6778393 201.2, 1037214.4 6778398.4 201.2, 1037214.8 6778398.1 201.2, 1037217.6 6778396.1 201.2, 1037213.5 6778390.6 201.2))
-BATIMENT0000000234797755;POLYGON Z ((1037218.3 6778413.5 203, 1037216.9 6778411.6 203, 1037214.5 6778408.3 203, 1037214.3 6778408.4 203, 1037211.6 6778410.3 203, 1037204.7 6778415.2 203, 1037212.2 6778425.4 203, 1037221.8 6778418.3 203, 1037218.3 6778413.5 203))
-BATIMENT0000000234797758;POLYGON Z ((1037218.8 6778397.8 200, 1037218.1 6778396.9 200, 1037217.6 6778396.1 200, 1037214.8 6778398.1 200, 1037218.6 6778403.2 200, 1037221.4 6778401.4 200, 1037218.8 6778397.8 200))
-BATIMENT0000000234797760;POLYGON Z ((1037197.7 6778405.6 202.6, 1037202.7 6778412.3 202.6, 1037212.1 6778405.4 202.6, 1037210.6 6778403.4 202.6, 1037207.9 6778400 202.6, 1037205.2 6778396.4 202.6, 1037202 6778398.6 202.6, 1037202.3 6778399 202.6, 1037199.4 6778401 202.6, 1037196.1 6778403.4 202.6, 1037197.7 6778405.6 202.6))
-BATIMENT0000000234797761;POLYGON Z ((1037196.1 6778403.4 202.6, 1037199.4 6778401 202.6, 1037202.3 6778399 202.6, 1037202 6778398.6 202.6, 1037197.8 6778392.7 202.6, 1037202.3 6778389.3 202.6, 1037200.4 6778386.7 202.6, 1037196.4 6778389.6 202.6, 1037196.2 6778389.3 202.6, 1037189.4 6778394.3 202.6, 1037196.1 6778403.4 202.6))
-BATIMENT0000000234797768;POLYGON Z ((1037538.6 6778426.6 205.5, 1037548.6 6778419.1 205.5, 1037540.8 6778408.1 205.5, 1037536.1 6778401.4 205.5, 1037534.5 6778402.5 205.5, 1037525.6 6778409 205.5, 1037538.6 6778426.6 205.5))
-BATIMENT0000000234797769;POLYGON Z ((1037525.6 6778409 205.2, 1037534.5 6778402.5 205.2, 1037532.8 6778400.3 205.2, 1037532.1 6778399.3 205.2, 1037529 6778395.1 205.2, 1037527.1 6778392.5 205.2, 1037518.3 6778399 205.2, 1037525.6 6778409 205.2))
-BATIMENT0000000234797771;POLYGON Z ((1037556.6 6778398 199.2, 1037543.4 6778380.4 199.2, 1037542.4 6778381.2 199.2, 1037540.2 6778382.8 199.2, 1037539 6778383.7 199.2, 1037538.7 6778383.9 199.2, 1037540.6 6778386.5 199.2, 1037545.9 6778393.6 199.2, 1037546.2 6778394 199.2, 1037549.9 6778398.9 199.2, 1037551.1 6778400.4 199.2, 1037551.8 6778401.5 199.2, 1037556.6 6778398 199.2))
-BATIMENT0000000234797773;POLYGON Z ((1037558.2 6778400 203.2, 1037557.5 6778399 203.2, 1037553.7 6778401.9 203.2, 1037552.7 6778402.6 203.2, 1037553.4 6778403.5 203.2, 1037558.2 6778400 203.2))
-BATIMENT0000000234797774;POLYGON Z ((1037533.3 6778370.5 203.2, 1037535.7 6778368.7 203.2, 1037544 6778379.9 203.2, 1037548.4 6778376.7 203.2, 1037545.5 6778372.8 203.2, 1037542.4 6778368.5 203.2, 1037535.5 6778359.2 203.2, 1037528.6 6778364.3 203.2, 1037533.3 6778370.5 203.2))
-BATIMENT0000000234797775;POLYGON Z ((1037559.1 6778411.3 203.7, 1037579.2 6778396.2 203.7, 1037573.7 6778388.7 203.7, 1037573.5 6778388.8 203.7, 1037569.4 6778391.8 203.7, 1037565.6 6778394.6 203.7, 1037563.5 6778396.2 203.7, 1037558.2 6778400 203.7, 1037553.4 6778403.5 203.7, 1037559.1 6778411.3 203.7))
-BATIMENT0000000234797778;POLYGON Z ((1037518.3 6778399 203.1, 1037527.1 6778392.5 203.1, 1037525.6 6778390.5 203.1, 1037521.2 6778384.6 203.1, 1037512.4 6778391 203.1, 1037518.3 6778399 203.1))
-BATIMENT0000000234797779;POLYGON Z ((1037525.6 6778390.5 202.8, 1037526.3 6778390 202.8, 1037526.1 6778389.4 202.8, 1037526.4 6778389.2 202.8, 1037525.7 6778388.4 202.8, 1037522.3 6778383.8 202.8, 1037521.2 6778384.6 202.8, 1037525.6 6778390.5 202.8))
-BATIMENT0000000234797780;POLYGON Z ((1037521 6778370.1 203.3, 1037524.8 6778375.3 203.3, 1037525.4 6778376.2 203.3, 1037533.3 6778370.5 203.3, 1037528.6 6778364.3 203.3, 1037520.9 6778370 203.3, 1037521 6778370.1 203.3))
-BATIMENT0000000234797781;POLYGON Z ((1037522.3 6778383.8 203, 1037519.3 6778379.5 203, 1037518.1 6778380.3 203, 1037521.2 6778384.6 203, 1037522.3 6778383.8 203))
-BATIMENT0000000234797782;POLYGON Z ((1037521.2 6778384.6 203.3, 1037518.1 6778380.3 203.3, 1037519.3 6778379.5 203.3, 1037524.8 6778375.3 203.3, 1037521 6778370.1 203.3, 1037520.9 6778370 203.3, 1037505.4 6778381.5 203.3, 1037512.4 6778391 203.3, 1037521.2 6778384.6 203.3))
-BATIMENT0000000234797789;POLYGON Z ((1037546.1 6778351.4 203.6, 1037535.5 6778359.2 203.6, 1037542.4 6778368.5 203.6, 1037546.9 6778365.1 203.6, 1037549.2 6778363.4 203.6, 1037552.4 6778367.6 203.6, 1037550.6 6778369 203.6, 1037553.5 6778372.9 203.6, 1037559 6778368.8 203.6, 1037546.1 6778351.4 203.6))
-BATIMENT0000000234797790;POLYGON Z ((1037559 6778368.8 206.2, 1037553.5 6778372.9 206.2, 1037551.4 6778374.5 206.2, 1037551 6778374.8 206.2, 1037563.9 6778392.3 206.2, 1037567.7 6778389.5 206.2, 1037569.4 6778391.8 206.2, 1037573.5 6778388.8 206.2, 1037573.7 6778388.7 206.2, 1037559 6778368.8 206.2))
-BATIMENT0000000234797793;POLYGON Z ((1037420.5 6778486.2 204.2, 1037428.9 6778479.8 204.2, 1037424.1 6778473.2 204.2, 1037423.2 6778472 204.2, 1037420.8 6778468.7 204.2, 1037412.2 6778474.9 204.2, 1037420.5 6778486.2 204.2))
-BATIMENT0000000234797794;POLYGON Z ((1037424.1 6778473.2 203.5, 1037425.1 6778472.5 203.5, 1037424.2 6778471.4 203.5, 1037423.2 6778472 203.5, 1037424.1 6778473.2 203.5))
-BATIMENT0000000234797796;POLYGON Z ((1037443.1 6778495.8 201.7, 1037436 6778486.2 201.7, 1037428.7 6778491.5 201.7, 1037435.8 6778501.2 201.7, 1037443.1 6778495.8 201.7))
-BATIMENT0000000234797797;POLYGON Z ((1037525.9 6778499 204, 1037519.7 6778490.9 204, 1037512.5 6778496.1 204, 1037514.2 6778498.2 204, 1037514.6 6778498.7 204, 1037516.7 6778501.6 204, 1037518.8 6778504.6 204, 1037525.9 6778499 204))
-BATIMENT0000000234797799;POLYGON Z ((1037512.5 6778496.1 203, 1037519.7 6778490.9 203, 1037513.6 6778482.6 203, 1037506.2 6778487.9 203, 1037512.5 6778496.1 203))
-BATIMENT0000000234797800;POLYGON Z ((1037493.3 6778470.7 205.7, 1037506.2 6778487.9 205.7, 1037513.6 6778482.6 205.7, 1037516 6778480.8 205.7, 1037508.5 6778470.8 205.7, 1037510.2 6778469.6 205.7, 1037507.9 6778466.6 205.7, 1037506.2 6778467.8 205.7, 1037502.9 6778463.5 205.7, 1037493.3 6778470.7 205.7))
-BATIMENT0000000234797801;POLYGON Z ((1037327.2 6778513.4 204.7, 1037332 6778520.1 204.7, 1037377.9 6778486.1 204.7, 1037373.1 6778479.3 204.7, 1037327.2 6778513.4 204.7))
-BATIMENT0000000234797804;POLYGON Z ((1037640.9 6778350 204.4, 1037648.8 6778344.1 204.4, 1037646.6 6778341.2 204.4, 1037641.3 6778333.8 204.4, 1037633.3 6778339.7 204.4, 1037640.9 6778350 204.4))
-BATIMENT0000000234797807;POLYGON Z ((1037300 6778375 203.6, 1037306.4 6778383.9 203.6, 1037318.6 6778375.1 203.6, 1037325 6778384.1 203.6, 1037328.7 6778389.1 203.6, 1037334 6778385.2 203.6, 1037317 6778362.1 203.6, 1037299.9 6778374.8 203.6, 1037300 6778375 203.6))
-BATIMENT0000000234797812;POLYGON Z ((1037222.6 6778476 206.4, 1037224.9 6778479.3 206.4, 1037223.9 6778480.1 206.4, 1037235 6778495.6 206.4, 1037236.1 6778494.8 206.4, 1037242.8 6778489.9 206.4, 1037218.1 6778455.6 206.4, 1037211.3 6778460.3 206.4, 1037222.6 6778476 206.4))
-BATIMENT0000000234797813;POLYGON Z ((1037330.1 6778492.5 198.7, 1037332.5 6778490.8 198.7, 1037329.5 6778486.6 198.7, 1037327.2 6778488.3 198.7, 1037330.1 6778492.5 198.7))
-BATIMENT0000000234797814;POLYGON Z ((1037332.5 6778490.8 198.7, 1037334.7 6778489.2 198.7, 1037331.9 6778485 198.7, 1037329.5 6778486.6 198.7, 1037332.5 6778490.8 198.7))
-BATIMENT0000000234797815;POLYGON Z ((1037330.1 6778492.5 198.7, 1037327.2 6778488.3 198.7, 1037325.1 6778489.9 198.7, 1037328 6778494.1 198.7, 1037330.1 6778492.5 198.7))
-BATIMENT0000000234797816;POLYGON Z ((1037335.5 6778488.6 198.7, 1037336.9 6778487.6 198.7, 1037334.1 6778483.3 198.7, 1037331.9 6778485 198.7, 1037334.7 6778489.2 198.7, 1037335.5 6778488.6 198.7))
-BATIMENT0000000234797817;POLYGON Z ((1037328 6778494.1 198.7, 1037325.1 6778489.9 198.7, 1037323 6778491.4 198.7, 1037325.9 6778495.6 198.7, 1037328 6778494.1 198.7))
-BATIMENT0000000234797818;POLYGON Z ((1037339.2 6778485.9 198.7, 1037336.4 6778481.6 198.7, 1037334.1 6778483.3 198.7, 1037336.9 6778487.6 198.7, 1037339.2 6778485.9 198.7))
-BATIMENT0000000234797819;POLYGON Z ((1037324.7 6778496.5 198.7, 1037325.9 6778495.6 198.7, 1037323 6778491.4 198.7, 1037320.7 6778493.2 198.7, 1037323.6 6778497.3 198.7, 1037324.7 6778496.5 198.7))
-BATIMENT0000000234797820;POLYGON Z ((1037321.5 6778498.9 198.7, 1037323.6 6778497.3 198.7, 1037320.7 6778493.2 198.7, 1037318.5 6778494.7 198.7, 1037321.5 6778498.9 198.7))
-BATIMENT0000000234797821;POLYGON Z ((1037341.4 6778484.2 198.7, 1037338.6 6778480 198.7, 1037336.4 6778481.6 198.7, 1037339.2 6778485.9 198.7, 1037341.4 6778484.2 198.7))
-BATIMENT0000000234797822;POLYGON Z ((1037319.2 6778500.6 198.7, 1037321.5 6778498.9 198.7, 1037318.5 6778494.7 198.7, 1037317.6 6778495.4 198.7, 1037317.5 6778495.2 198.7, 1037316.2 6778496.2 198.7, 1037319.2 6778500.6 198.7))
-BATIMENT0000000234797823;POLYGON Z ((1037317.9 6778501.6 198.7, 1037319.2 6778500.6 198.7, 1037316.2 6778496.2 198.7, 1037314.7 6778497.2 198.7, 1037317.9 6778501.6 198.7))
-BATIMENT0000000234797824;POLYGON Z ((1037343.7 6778482.6 198.7, 1037340.7 6778478.4 198.7, 1037338.6 6778480 198.7, 1037341.4 6778484.2 198.7, 1037343.7 6778482.6 198.7))
-BATIMENT0000000234797825;POLYGON Z ((1037345.9 6778480.9 198.7, 1037342.9 6778476.8 198.7, 1037340.7 6778478.4 198.7, 1037343.7 6778482.6 198.7, 1037345.9 6778480.9 198.7))
-BATIMENT0000000234797826;POLYGON Z ((1037342.9 6778476.8 198.7, 1037345.9 6778480.9 198.7, 1037348.1 6778479.3 198.7, 1037345.2 6778475.1 198.7, 1037342.9 6778476.8 198.7))
-BATIMENT0000000234797827;POLYGON Z ((1037345.2 6778475.1 198.7, 1037348.1 6778479.3 198.7, 1037350.3 6778477.6 198.7, 1037349.7 6778476.8 198.7, 1037347.8 6778474.2 198.7, 1037347.3 6778473.6 198.7, 1037345.2 6778475.1 198.7))
-BATIMENT0000000234797828;POLYGON Z ((1037346 6778471.8 198.9, 1037346.9 6778473 198.9, 1037347.3 6778473.6 198.9, 1037347.8 6778474.2 198.9, 1037352.8 6778470.5 198.9, 1037350.9 6778468.1 198.9, 1037346 6778471.8 198.9))
-BATIMENT0000000234797829;POLYGON Z ((1037347.8 6778474.2 198.8, 1037349.7 6778476.8 198.8, 1037352.2 6778474.9 198.8, 1037354.7 6778473 198.8, 1037352.8 6778470.5 198.8, 1037347.8 6778474.2 198.8))
-BATIMENT0000000234797830;POLYGON Z ((1037349.7 6778476.8 198.6, 1037350.3 6778477.6 198.6, 1037350.5 6778477.8 198.6, 1037353.3 6778481.7 198.6, 1037356 6778479.7 198.6, 1037352.2 6778474.9 198.6, 1037349.7 6778476.8 198.6))
-BATIMENT0000000234797831;POLYGON Z ((1037352.2 6778474.9 198.8, 1037356 6778479.7 198.8, 1037358.4 6778478 198.8, 1037354.7 6778473 198.8, 1037352.2 6778474.9 198.8))
-BATIMENT0000000234797832;POLYGON Z ((1037358.4 6778478 198.8, 1037360.2 6778476.6 198.8, 1037360.9 6778476.1 198.8, 1037357.1 6778471.2 198.8, 1037354.7 6778473 198.8, 1037358.4 6778478 198.8))
-BATIMENT0000000234797833;POLYGON Z ((1037345.6 6778471.3 198.9, 1037346 6778471.8 198.9, 1037350.9 6778468.1 198.9, 1037349.2 6778465.7 198.9, 1037344.2 6778469.4 198.9, 1037345.6 6778471.3 198.9))
-BATIMENT0000000234797834;POLYGON Z ((1037342.3 6778467 198.9, 1037344.2 6778469.4 198.9, 1037349.2 6778465.7 198.9, 1037347.3 6778463.2 198.9, 1037342.3 6778467 198.9))
-BATIMENT0000000234797835;POLYGON Z ((1037342.3 6778467 198.9, 1037347.3 6778463.2 198.9, 1037345.5 6778460.7 198.9, 1037340.5 6778464.4 198.9, 1037342.3 6778467 198.9))
-BATIMENT0000000234797836;POLYGON Z ((1037360.9 6778476.1 198.8, 1037363.3 6778474.3 198.8, 1037359.5 6778469.4 198.8, 1037357.1 6778471.2 198.8, 1037360.9 6778476.1 198.8))
-BATIMENT0000000234797837;POLYGON Z ((1037338.6 6778462 198.9, 1037340.5 6778464.4 198.9, 1037345.5 6778460.7 198.9, 1037343.6 6778458.2 198.9, 1037338.6 6778462 198.9))
-BATIMENT0000000234797838;POLYGON Z ((1037336.9 6778459.6 198.9, 1037338.6 6778462 198.9, 1037343.6 6778458.2 198.9, 1037341.8 6778455.9 198.9, 1037336.9 6778459.6 198.9))
-BATIMENT0000000234797839;POLYGON Z ((1037363.3 6778474.3 198.8, 1037365.7 6778472.5 198.8, 1037361.9 6778467.6 198.8, 1037359.5 6778469.4 198.8, 1037363.3 6778474.3 198.8))
-BATIMENT0000000234797840;POLYGON Z ((1037336.9 6778459.6 198.9, 1037341.8 6778455.9 198.9, 1037339.9 6778453.3 198.9, 1037335.1 6778456.9 198.9, 1037334.9 6778457.1 198.9, 1037336.9 6778459.6 198.9))
-BATIMENT0000000234797841;POLYGON Z ((1037368.2 6778470.7 198.9, 1037364.4 6778465.7 198.9, 1037361.9 6778467.6 198.9, 1037365.7 6778472.5 198.9, 1037368.2 6778470.7 198.9))
-BATIMENT0000000234797842;POLYGON Z ((1037368.2 6778470.7 198.9, 1037370.5 6778468.9 198.9, 1037366.8 6778463.9 198.9, 1037364.4 6778465.7 198.9, 1037368.2 6778470.7 198.9))
-BATIMENT0000000234797843;POLYGON Z ((1037372.9 6778467.1 198.9, 1037369.2 6778462.1 198.9, 1037366.8 6778463.9 198.9, 1037370.5 6778468.9 198.9, 1037372.9 6778467.1 198.9))
-BATIMENT0000000234797854;POLYGON Z ((1037274 6778470.6 200.4, 1037283.2 6778483 200.4, 1037286.6 6778487.7 200.4, 1037293.9 6778482.3 200.4, 1037281.2 6778465.2 200.4, 1037274 6778470.6 200.4))
-BATIMENT0000000234797855;POLYGON Z ((1037297.9 6778486.9 200.6, 1037294.4 6778482.2 200.6, 1037287.5 6778487.7 200.6, 1037290.6 6778491.4 200.6, 1037290 6778491.9 200.6, 1037290.4 6778492.5 200.6, 1037290.8 6778492.2 200.6, 1037297.9 6778486.9 200.6))
-BATIMENT0000000234797857;POLYGON Z ((1037282.8 6778514.9 200.6, 1037290.1 6778509.4 200.6, 1037281.6 6778498.3 200.6, 1037274.3 6778503.8 200.6, 1037282.8 6778514.9 200.6))
-BATIMENT0000000234797860;POLYGON Z ((1037457.5 6778563.2 201.3, 1037459 6778551.8 201.3, 1037453.6 6778551 201.3, 1037452.1 6778562.6 201.3, 1037457.5 6778563.2 201.3))
-BATIMENT0000000234797861;POLYGON Z ((1037354.2 6778412.4 211.1, 1037346.5 6778418.1 211.1, 1037346.4 6778418.2 211.1, 1037347.2 6778419.2 211.1, 1037331.2 6778430.8 211.1, 1037330.5 6778429.9 211.1, 1037323.9 6778434.8 211.1, 1037322.9 6778435.6 211.1, 1037326.1 6778440.1 211.1, 1037326.6 6778439.7 211.1, 1037332.4 6778447.4 211.1, 1037336.5 6778444.4 211.1, 1037337.1 6778445.2 211.1, 1037340 6778443 211.1, 1037337.3 6778439.3 211.1, 1037353.5 6778427.3 211.1, 1037356.3 6778431 211.1, 1037359.3 6778428.8 211.1, 1037358.7 6778428.1 211.1, 1037362.8 6778425 211.1, 1037357.1 6778417.3 211.1, 1037357.5 6778417 211.1, 1037354.2 6778412.4 211.1))
-BATIMENT0000000234797862;POLYGON Z ((1037244 6778508.1 202.9, 1037252.1 6778502.1 202.9, 1037248.2 6778496.9 202.9, 1037247.6 6778497.4 202.9, 1037245.3 6778494.3 202.9, 1037237.8 6778499.7 202.9, 1037244 6778508.1 202.9))
-BATIMENT0000000234797863;POLYGON Z ((1037343.5 6778472.1 198.9, 1037340.8 6778468.5 198.9, 1037311.4 6778490.3 198.9, 1037314.2 6778493.9 198.9, 1037343.5 6778472.1 198.9))
-BATIMENT0000000234797864;POLYGON Z ((1037314 6778509.4 201.2, 1037310.8 6778499.8 201.2, 1037297.4 6778504.3 201.2, 1037300.5 6778513.9 201.2, 1037314 6778509.4 201.2))
-BATIMENT0000000234797867;POLYGON Z ((1037172.9 6778409.1 206.1, 1037184.2 6778424.3 206.1, 1037190.9 6778419.3 206.1, 1037166.1 6778385.5 206.1, 1037159.2 6778390.6 206.1, 1037158.1 6778391.4 206.1, 1037169.5 6778406.9 206.1, 1037170.7 6778406.1 206.1, 1037172.9 6778409.1 206.1))
-BATIMENT0000000234797869;POLYGON Z ((1037306.5 6778463.5 206.8, 1037313.5 6778458.3 206.8, 1037315.2 6778457.1 206.8, 1037319.7 6778453.7 206.8, 1037315.1 6778447.4 206.8, 1037301.7 6778457.3 206.8, 1037306.5 6778463.5 206.8))
-BATIMENT0000000234797871;POLYGON Z ((1037288.6 6778467 206.9, 1037293.4 6778473.3 206.9, 1037298 6778469.8 206.9, 1037299.6 6778468.6 206.9, 1037306.5 6778463.5 206.9, 1037301.7 6778457.3 206.9, 1037288.6 6778467 206.9))
-BATIMENT0000000234797877;POLYGON Z ((1037390.6 6778201.6 204.6, 1037385.6 6778205.4 204.6, 1037373.7 6778189.1 204.6, 1037366.3 6778194.7 204.6, 1037381.6 6778215.2 204.6, 1037386.1 6778211.8 204.6, 1037389.2 6778216 204.6, 1037396.9 6778210.3 204.6, 1037390.6 6778201.6 204.6))
-BATIMENT0000000234797879;POLYGON Z ((1037414 6778197.6 204.1, 1037407.5 6778188.8 204.1, 1037390.6 6778201.6 204.1, 1037396.9 6778210.3 204.1, 1037414 6778197.6 204.1))
-BATIMENT0000000234797880;POLYGON Z ((1037425.6 6778188.9 204.5, 1037412.9 6778171.9 204.5, 1037408 6778175.5 204.5, 1037414.1 6778183.8 204.5, 1037407.5 6778188.8 204.5, 1037414 6778197.6 204.5, 1037425.6 6778188.9 204.5))
-BATIMENT0000000234797881;POLYGON Z ((1037389.7 6778165.1 201.6, 1037384.7 6778168.8 201.6, 1037387.2 6778172.1 201.6, 1037392.1 6778168.3 201.6, 1037389.7 6778165.1 201.6))
-BATIMENT0000000234797882;POLYGON Z ((1037397.6 6778151.6 203.5, 1037389.4 6778158 203.5, 1037388.7 6778158.5 203.5, 1037387.9 6778159.1 203.5, 1037386.2 6778160.5 203.5, 1037387.2 6778161.8 203.5, 1037389.1 6778164.4 203.5, 1037389.7 6778165.1 203.5, 1037392.1 6778168.3 203.5, 1037392.4 6778168.2 203.5, 1037393.8 6778170.1 203.5, 1037405.2 6778161.6 203.5, 1037397.6 6778151.6 203.5))
-BATIMENT0000000234797883;POLYGON Z ((1037405.2 6778161.6 203.5, 1037393.8 6778170.1 203.5, 1037401.4 6778180.4 203.5, 1037408 6778175.5 203.5, 1037412.9 6778171.9 203.5, 1037405.2 6778161.6 203.5))
-BATIMENT0000000234797884;POLYGON Z ((1037388 6778157.4 203.8, 1037387.2 6778158.1 203.8, 1037387.9 6778159.1 203.8, 1037388.7 6778158.5 203.8, 1037388 6778157.4 203.8))
-BATIMENT0000000234797886;POLYGON Z ((1037386.3 6778153.8 205.8, 1037385.7 6778154.3 205.8, 1037388 6778157.4 205.8, 1037388.7 6778158.5 205.8, 1037389.4 6778158 205.8, 1037386.3 6778153.8 205.8))
-BATIMENT0000000234797887;POLYGON Z ((1037392 6778144.1 205, 1037380.4 6778152.8 205, 1037383 6778156.3 205, 1037385.7 6778154.3 205, 1037386.3 6778153.8 205, 1037389.4 6778158 205, 1037397.6 6778151.6 205, 1037392 6778144.1 205))
-BATIMENT0000000234797889;POLYGON Z ((1037588.4 6778279.2 203.3, 1037596.1 6778273.4 203.3, 1037597.1 6778272.6 203.3, 1037598 6778271.9 203.3, 1037596.3 6778269.6 203.3, 1037591.3 6778262.9 203.3, 1037590 6778261.1 203.3, 1037589.5 6778260.5 203.3, 1037587.1 6778257.3 203.3, 1037582 6778260.9 203.3, 1037581 6778261.7 203.3, 1037579.5 6778262.8 203.3, 1037577.3 6778264.4 203.3, 1037588.4 6778279.2 203.3))
-BATIMENT0000000234797891;POLYGON Z ((1037580.4 6778241.5 203.5, 1037570.8 6778248.5 203.5, 1037567.3 6778251.1 203.5, 1037571.8 6778257.1 203.5, 1037577.3 6778264.4 203.5, 1037579.5 6778262.8 203.5, 1037581 6778261.7 203.5, 1037582 6778260.9 203.5, 1037581.2 6778259.8 203.5, 1037577.9 6778255.4 203.5, 1037578.8 6778254.8 203.5, 1037581.3 6778252.9 203.5, 1037582 6778254 203.5, 1037585.3 6778251.6 203.5, 1037584.5 6778250.6 203.5, 1037584.9 6778250.3 203.5, 1037584.8 6778250.1 203.5, 1037592.8 6778244.6 203.5, 1037593.6 6778245.6 203.5, 1037596.6 6778243.4 203.5, 1037595.8 6778242.4 203.5, 1037595.4 6778241.8 203.5, 1037590.6 6778235.3 203.5, 1037589.9 6778234.5 203.5, 1037580.4 6778241.5 203.5))
-BATIMENT0000000234797892;POLYGON Z ((1037598.4 6778276.4 208.2, 1037599.5 6778275.7 208.2, 1037597.1 6778272.6 208.2, 1037596.1 6778273.4 208.2, 1037598.4 6778276.4 208.2))
-BATIMENT0000000234797895;POLYGON Z ((1037593.1 6778285.5 208.2, 1037600.9 6778279.7 208.2, 1037598.4 6778276.4 208.2, 1037596.1 6778273.4 208.2, 1037588.4 6778279.2 208.2, 1037593.1 6778285.5 208.2))
-BATIMENT0000000234797899;POLYGON Z ((1037586.3 6778256.2 203.4, 1037582.1 6778259.2 203.4, 1037581.2 6778259.8 203.4, 1037582 6778260.9 203.4, 1037587.1 6778257.3 203.4, 1037586.3 6778256.2 203.4))
-BATIMENT0000000234797901;POLYGON Z ((1037596.6 6778243.4 203.5, 1037593.6 6778245.6 203.5, 1037595.9 6778248.8 203.5, 1037598.9 6778246.6 203.5, 1037596.6 6778243.4 203.5))
-BATIMENT0000000234797903;POLYGON Z ((1037590.6 6778235.3 203.6, 1037595.4 6778241.8 203.6, 1037599.2 6778238.9 203.6, 1037600.1 6778238.3 203.6, 1037603.4 6778235.8 203.6, 1037602.8 6778234.3 203.6, 1037601.8 6778233 203.6, 1037602.2 6778232.6 203.6, 1037598.8 6778228 203.6, 1037589.9 6778234.5 203.6, 1037590.6 6778235.3 203.6))
-BATIMENT0000000234797907;POLYGON Z ((1037601.9 6778278.9 207.6, 1037599.5 6778275.7 207.6, 1037598.4 6778276.4 207.6, 1037600.9 6778279.7 207.6, 1037601.9 6778278.9 207.6))
-BATIMENT0000000234797909;POLYGON Z ((1037601.9 6778280.6 203.1, 1037604.2 6778283.7 203.1, 1037605 6778283.1 203.1, 1037602.7 6778280 203.1, 1037601.9 6778280.6 203.1))
-BATIMENT0000000234797910;POLYGON Z ((1037602.7 6778280 203.1, 1037605.6 6778277.8 203.1, 1037604.8 6778276.7 203.1, 1037601.9 6778278.9 203.1, 1037602.7 6778280 203.1))
-BATIMENT0000000234797911;POLYGON Z ((1037607.3 6778282.4 205.1, 1037606.8 6778281.8 205.1, 1037605 6778283.1 205.1, 1037604.2 6778283.7 205.1, 1037601.9 6778280.6 205.1, 1037602.7 6778280 205.1, 1037601.9 6778278.9 205.1, 1037600.9 6778279.7 205.1, 1037593.1 6778285.5 205.1, 1037601.1 6778296.2 205.1, 1037611.7 6778288.3 205.1, 1037607.3 6778282.4 205.1))
-BATIMENT0000000234797913;POLYGON Z ((1037634.6 6778271.3 203.1, 1037630.3 6778265.4 203.1, 1037627.8 6778262 203.1, 1037625.4 6778258.9 203.1, 1037623.8 6778256.7 203.1, 1037621.8 6778254 203.1, 1037616.9 6778257.7 203.1, 1037610.6 6778262.4 203.1, 1037613.3 6778265.9 203.1, 1037616.4 6778270 203.1, 1037618.8 6778273.1 203.1, 1037623.6 6778279.5 203.1, 1037634.6 6778271.3 203.1))
-BATIMENT0000000234797919;POLYGON Z ((1037629.6 6778255.6 203.3, 1037630.6 6778254.8 203.3, 1037629.7 6778253.6 203.3, 1037628.7 6778254.4 203.3, 1037629.6 6778255.6 203.3))
-BATIMENT0000000234797920;POLYGON Z ((1037623.2 6778252.9 203.2, 1037624.9 6778251.7 203.2, 1037625.5 6778251.2 203.2, 1037626.1 6778250.8 203.2, 1037633 6778245.6 203.2, 1037625.2 6778235.1 203.2, 1037619.3 6778239.5 203.2, 1037615.3 6778242.4 203.2, 1037618.7 6778246.9 203.2, 1037621.2 6778250.2 203.2, 1037623.2 6778252.9 203.2))
-BATIMENT0000000234797922;POLYGON Z ((1037633 6778245.6 203.2, 1037626.1 6778250.8 203.2, 1037628.7 6778254.4 203.2, 1037629.7 6778253.6 203.2, 1037630.6 6778254.8 203.2, 1037633 6778258.2 203.2, 1037639.1 6778253.8 203.2, 1037633 6778245.6 203.2))
-BATIMENT0000000234797925;POLYGON Z ((1037610.7 6778230.6 205.6, 1037609.8 6778229.3 205.6, 1037607.6 6778230.9 205.6, 1037607.8 6778231.2 205.6, 1037605.6 6778232.8 205.6, 1037606.2 6778233.7 205.6, 1037606.4 6778233.8 205.6, 1037610.7 6778230.6 205.6))
-BATIMENT0000000234797928;POLYGON Z ((1037600.9 6778226.5 203.6, 1037605.6 6778232.8 203.6, 1037607.8 6778231.2 203.6, 1037607.6 6778230.9 203.6, 1037609.8 6778229.3 203.6, 1037610.7 6778230.6 203.6, 1037611.5 6778231.6 203.6, 1037611.8 6778231.5 203.6, 1037612.8 6778230.7 203.6, 1037614.8 6778229.3 203.6, 1037608.6 6778220.8 203.6, 1037600.9 6778226.5 203.6))
-BATIMENT0000000234797929;POLYGON Z ((1037612.5 6778218 203.4, 1037608.6 6778220.8 203.4, 1037614.8 6778229.3 203.4, 1037612.8 6778230.7 203.4, 1037614.6 6778233.1 203.4, 1037619.3 6778239.5 203.4, 1037625.2 6778235.1 203.4, 1037612.5 6778218 203.4))
-BATIMENT0000000234797930;POLYGON Z ((1037633 6778258.2 203.3, 1037632 6778259 203.3, 1037634.5 6778262.3 203.3, 1037635.5 6778261.6 203.3, 1037633 6778258.2 203.3))
-BATIMENT0000000234797931;POLYGON Z ((1037645.9 6778262.9 203.1, 1037639.1 6778253.8 203.1, 1037633 6778258.2 203.1, 1037635.5 6778261.6 203.1, 1037636.9 6778260.5 203.1, 1037641.3 6778266.3 203.1, 1037645.9 6778262.9 203.1))
-BATIMENT0000000234797935;POLYGON Z ((1037611.8 6778231.5 203.5, 1037613.6 6778233.9 203.5, 1037614.6 6778233.1 203.5, 1037612.8 6778230.7 203.5, 1037611.8 6778231.5 203.5))
-BATIMENT0000000234797944;POLYGON Z ((1037539.7 6778103.9 201.7, 1037550.2 6778096.1 201.7, 1037545.2 6778089.1 201.7, 1037543.9 6778090.1 201.7, 1037534.6 6778097.1 201.7, 1037539.7 6778103.9 201.7))
-BATIMENT0000000234797947;POLYGON Z ((1037572.1 6778079.7 203, 1037567 6778072.9 203, 1037560.6 6778077.6 203, 1037555.3 6778081.6 203, 1037560.4 6778088.4 203, 1037572.1 6778079.7 203))
-BATIMENT0000000234797948;POLYGON Z ((1037558.9 6778064.7 198.5, 1037562.6 6778062.3 198.5, 1037563 6778062 198.5, 1037559.7 6778057.2 198.5, 1037551.3 6778062.8 198.5, 1037554.5 6778067.7 198.5, 1037558.9 6778064.7 198.5))
-BATIMENT0000000234797950;POLYGON Z ((1037573.6 6778054.2 200.3, 1037564.4 6778061 200.3, 1037570 6778068.6 200.3, 1037571.7 6778071 200.3, 1037572.3 6778071.8 200.3, 1037581.5 6778065.1 200.3, 1037573.6 6778054.2 200.3))
-BATIMENT0000000234797951;POLYGON Z ((1037565.6 6778043.4 200.4, 1037556.5 6778050.2 200.4, 1037564.4 6778061 200.4, 1037573.6 6778054.2 200.4, 1037565.6 6778043.4 200.4))
-BATIMENT0000000234797958;POLYGON Z ((1037545.3 6778068.4 200.4, 1037547.9 6778066.5 200.4, 1037546.5 6778064.6 200.4, 1037544.1 6778066.4 200.4, 1037543.9 6778066.6 200.4, 1037545.3 6778068.4 200.4))
-BATIMENT0000000234797959;POLYGON Z ((1037546.5 6778064.6 199.2, 1037548.9 6778062.8 199.2, 1037544.8 6778057.4 199.2, 1037540 6778061 199.2, 1037544.1 6778066.4 199.2, 1037546.5 6778064.6 199.2))
-BATIMENT0000000234797962;POLYGON Z ((1037534.8 6778080 201.6, 1037527.7 6778070.5 201.6, 1037526 6778071.7 201.6, 1037519.5 6778076.6 201.6, 1037526.5 6778086.1 201.6, 1037534.8 6778080 201.6))
-BATIMENT0000000234797963;POLYGON Z ((1037528.7 6778066.6 201.9, 1037534.3 6778062.5 201.9, 1037523.9 6778048.7 201.9, 1037522 6778050.1 201.9, 1037518.5 6778052.8 201.9, 1037514.4 6778055.9 201.9, 1037524.5 6778069.7 201.9, 1037528.7 6778066.6 201.9))
-BATIMENT0000000234797964;POLYGON Z ((1037561.6 6778068.6 198.2, 1037565.1 6778065.9 198.2, 1037562.6 6778062.3 198.2, 1037558.9 6778064.7 198.2, 1037561.6 6778068.6 198.2))
-BATIMENT0000000234797966;POLYGON Z ((1037542.4 6778046.1 199, 1037546.9 6778046.7 199, 1037547.1 6778045.7 199, 1037542.6 6778045.1 199, 1037542.4 6778046.1 199))
-BATIMENT0000000234797967;POLYGON Z ((1037514.4 6778055.9 199.8, 1037518.5 6778052.8 199.8, 1037516.7 6778050.3 199.8, 1037512.6 6778053.5 199.8, 1037514.4 6778055.9 199.8))
-BATIMENT0000000234797969;POLYGON Z ((1037537 6778034.9 201.2, 1037535.7 6778044.1 201.2, 1037542.6 6778045.1 201.2, 1037547.1 6778045.7 201.2, 1037549.8 6778046.1 201.2, 1037551.1 6778037.1 201.2, 1037537 6778034.9 201.2))
-BATIMENT0000000234797970;POLYGON Z ((1037535.5 6778128.8 203.3, 1037536.4 6778128.1 203.3, 1037540.1 6778133 203.3, 1037546.9 6778127.8 203.3, 1037539.3 6778117.5 203.3, 1037531.5 6778123.3 203.3, 1037535.5 6778128.8 203.3))
-BATIMENT0000000234797972;POLYGON Z ((1037546.9 6778127.8 205.3, 1037540.1 6778133 205.3, 1037539 6778133.8 205.3, 1037540.9 6778136.3 205.3, 1037544.9 6778141.5 205.3, 1037546.6 6778143.8 205.3, 1037554.4 6778137.9 205.3, 1037546.9 6778127.8 205.3))
-BATIMENT0000000234797982;POLYGON Z ((1037569.5 6778158.3 202.6, 1037561.9 6778148 202.6, 1037558 6778150.9 202.6, 1037552.9 6778154.7 202.6, 1037552 6778155.4 202.6, 1037549.3 6778157.3 202.6, 1037549.2 6778157.4 202.6, 1037545.1 6778160.5 202.6, 1037545.8 6778161.3 202.6, 1037546.9 6778162.5 202.6, 1037557 6778155.1 202.6, 1037557.8 6778156 202.6, 1037547.6 6778163.4 202.6, 1037548.9 6778164.8 202.6, 1037553.6 6778170.2 202.6, 1037569.5 6778158.3 202.6))
-BATIMENT0000000234797983;POLYGON Z ((1037516.6 6778145 205.5, 1037517.8 6778146.7 205.5, 1037521 6778144.3 205.5, 1037528.2 6778138.9 205.5, 1037522 6778130.4 205.5, 1037511.6 6778138.1 205.5, 1037516.6 6778145 205.5))
-BATIMENT0000000234797986;POLYGON Z ((1037549.2 6778157.4 200, 1037549.3 6778157.3 200, 1037547.3 6778154.6 200, 1037542.1 6778158.4 200, 1037544.4 6778160.9 200, 1037545.1 6778160.5 200, 1037549.2 6778157.4 200))
-BATIMENT0000000234797988;POLYGON Z ((1037539 6778166.3 203.2, 1037545.8 6778161.3 203.2, 1037545.1 6778160.5 203.2, 1037544.4 6778160.9 203.2, 1037538.2 6778165.5 203.2, 1037539 6778166.3 203.2))
-BATIMENT0000000234797989;POLYGON Z ((1037536.4 6778171.8 205.1, 1037541.9 6778178.8 205.1, 1037553.6 6778170.2 205.1, 1037548.9 6778164.8 205.1, 1037547.6 6778163.4 205.1, 1037546.9 6778162.5 205.1, 1037545.8 6778161.3 205.1, 1037539 6778166.3 205.1, 1037534.6 6778169.5 205.1, 1037536.4 6778171.8 205.1))
-BATIMENT0000000234797991;POLYGON Z ((1037503.7 6778144.1 207.8, 1037508.7 6778150.7 207.8, 1037511.4 6778148.7 207.8, 1037516.6 6778145 207.8, 1037511.6 6778138.1 207.8, 1037503.7 6778144.1 207.8))
-BATIMENT0000000234797994;POLYGON Z ((1037524.5 6778191.7 203, 1037538.8 6778181.1 203, 1037533.6 6778174.3 203, 1037527.4 6778178.8 203, 1037526.5 6778177.6 203, 1037530.3 6778174.7 203, 1037530.6 6778174.9 203, 1037532.7 6778173.3 203, 1037531 6778171.1 203, 1037524.6 6778175.8 203, 1037516.9 6778181.5 203, 1037524.5 6778191.7 203))
-BATIMENT0000000234798000;POLYGON Z ((1037517.2 6778165.7 208.3, 1037517.7 6778165.3 208.3, 1037511.6 6778157.1 208.3, 1037511.2 6778156.6 208.3, 1037511.1 6778156.5 208.3, 1037502.8 6778162.6 208.3, 1037509.3 6778171.3 208.3, 1037517.2 6778165.7 208.3))
-BATIMENT0000000234798001;POLYGON Z ((1037511.1 6778156.5 208.4, 1037509.9 6778154.9 208.4, 1037508.2 6778152.6 208.4, 1037508.9 6778151 208.4, 1037508.7 6778150.7 208.4, 1037503.7 6778144.1 208.4, 1037494.3 6778151.1 208.4, 1037502.8 6778162.6 208.4, 1037511.1 6778156.5 208.4))
-BATIMENT0000000234798002;POLYGON Z ((1037516.9 6778181.5 205.2, 1037524.6 6778175.8 205.2, 1037518.6 6778167.6 205.2, 1037517.2 6778165.7 205.2, 1037509.3 6778171.3 205.2, 1037516.9 6778181.5 205.2))
-BATIMENT0000000234798003;POLYGON Z ((1037644.1 6778242.6 200.3, 1037644.3 6778242.9 200.3, 1037645.7 6778241.8 200.3, 1037647.1 6778240.7 200.3, 1037647 6778240.5 200.3, 1037647.2 6778240.3 200.3, 1037647.6 6778240 200.3, 1037647.8 6778240.2 200.3, 1037649.1 6778239.2 200.3, 1037649.4 6778239 200.3, 1037647.1 6778236 200.3, 1037641 6778227.6 200.3, 1037639.9 6778226.1 200.3, 1037638.8 6778224.5 200.3, 1037637.8 6778223.2 200.3, 1037635.6 6778220.2 200.3, 1037633.9 6778217.9 200.3, 1037626.8 6778208.2 200.3, 1037621.4 6778212.2 200.3, 1037635.6 6778231.6 200.3, 1037643.8 6778242.9 200.3, 1037644.1 6778242.6 200.3))
-BATIMENT0000000234798006;POLYGON Z ((1037655.6 6778258.1 204.5, 1037655.4 6778257.8 204.5, 1037658.2 6778255.7 204.5, 1037658.3 6778255.9 204.5, 1037659 6778255.5 204.5, 1037658.8 6778255.2 204.5, 1037661.4 6778253.2 204.5, 1037661.7 6778253.5 204.5, 1037662.3 6778253 204.5, 1037662.1 6778252.7 204.5, 1037664.8 6778250.6 204.5, 1037665 6778250.9 204.5, 1037665.7 6778250.4 204.5, 1037665.5 6778250.1 204.5, 1037668.2 6778248.1 204.5, 1037668.4 6778248.3 204.5, 1037669 6778247.9 204.5, 1037668.8 6778247.6 204.5, 1037671.6 6778245.5 204.5, 1037671.8 6778245.8 204.5, 1037672.3 6778245.3 204.5, 1037672.2 6778245 204.5, 1037674.8 6778243.1 204.5, 1037675 6778243.3 204.5, 1037675.7 6778242.7 204.5, 1037675.6 6778242.5 204.5, 1037678.2 6778240.5 204.5, 1037678.4 6778240.7 204.5, 1037679 6778240.3 204.5, 1037678.8 6778240.1 204.5, 1037681.7 6778237.9 204.5, 1037681.8 6778238.1 204.5, 1037682.4 6778237.7 204.5, 1037682.2 6778237.4 204.5, 1037684.9 6778235.4 204.5, 1037685.1 6778235.7 204.5, 1037685.8 6778235.2 204.5, 1037685.6 6778234.9 204.5, 1037688.5 6778232.7 204.5, 1037688.7 6778232.9 204.5, 1037689.3 6778232.5 204.5, 1037681.1 6778221.3 204.5, 1037678.5 6778217.9 204.5, 1037677.9 6778217 204.5, 1037677.2 6778217.5 204.5, 1037677.4 6778217.8 204.5, 1037674.4 6778219.9 204.5, 1037674.3 6778219.7 204.5, 1037673.7 6778220.1 204.5, 1037673.9 6778220.4 204.5, 1037671.2 6778222.5 204.5, 1037671 6778222.2 204.5, 1037670.3 6778222.7 204.5, 1037670.5 6778223 204.5, 1037667.8 6778225.1 204.5, 1037667.6 6778224.8 204.5, 1037667 6778225.3 204.5, 1037667.2 6778225.5 204.5, 1037664.5 6778227.5 204.5, 1037664.4 6778227.3 204.5, 1037663.7 6778227.8 204.5, 1037663.9 6778228 204.5, 1037661.1 6778230.1 204.5, 1037660.9 6778229.8 204.5, 1037660.3 6778230.4 204.5, 1037660.4 6778230.6 204.5, 1037657.7 6778232.7 204.5, 1037657.5 6778232.4 204.5, 1037656.9 6778232.9 204.5, 1037657.1 6778233.2 204.5, 1037654.5 6778235.1 204.5, 1037654.2 6778235 204.5, 1037653.6 6778235.5 204.5, 1037653.8 6778235.7 204.5, 1037651.1 6778237.7 204.5, 1037650.9 6778237.5 204.5, 1037650.3 6778238 204.5, 1037650.4 6778238.3 204.5, 1037649.4 6778239 204.5, 1037649.1 6778239.2 204.5, 1037647.8 6778240.2 204.5, 1037647.6 6778240 204.5, 1037647.2 6778240.3 204.5, 1037647 6778240.5 204.5, 1037647.1 6778240.7 204.5, 1037645.7 6778241.8 204.5, 1037644.3 6778242.9 204.5, 1037644.1 6778242.6 204.5, 1037643.8 6778242.9 204.5, 1037643.6 6778243.1 204.5, 1037644.8 6778244.8 204.5, 1037647.4 6778248.2 204.5, 1037649.9 6778251.6 204.5, 1037652.4 6778255 204.5, 1037655 6778258.5 204.5, 1037655.6 6778258.1 204.5))
-BATIMENT0000000234798013;POLYGON Z ((1037463.7 6778186.6 204.7, 1037467.5 6778183.9 204.7, 1037472.4 6778180.4 204.7, 1037473 6778181.2 204.7, 1037475.4 6778179.4 204.7, 1037474.9 6778178.7 204.7, 1037468.8 6778170.5 204.7, 1037457.7 6778178.6 204.7, 1037463.7 6778186.6 204.7))
-BATIMENT0000000234798016;POLYGON Z ((1037458.7 6778194.4 205, 1037458.4 6778194 205, 1037456.6 6778191.7 205, 1037463.7 6778186.6 205, 1037457.7 6778178.6 205, 1037440.7 6778191.1 205, 1037448.7 6778201.9 205, 1037458.7 6778194.4 205))
-BATIMENT0000000234798020;POLYGON Z ((1037477.7 6778173.5 202.6, 1037480.8 6778171.2 202.6, 1037480.3 6778170.5 202.6, 1037477.2 6778172.8 202.6, 1037477.7 6778173.5 202.6))
-BATIMENT0000000234798023;POLYGON Z ((1037476.4 6778173.4 205.2, 1037477.2 6778172.8 205.2, 1037480.3 6778170.5 205.2, 1037480.8 6778171.2 205.2, 1037484.1 6778175.5 205.2, 1037485.7 6778174.3 205.2, 1037493.8 6778168.2 205.2, 1037486 6778157.9 205.2, 1037472.2 6778167.9 205.2, 1037476.4 6778173.4 205.2))
-BATIMENT0000000234798025;POLYGON Z ((1037493.8 6778168.2 204.2, 1037485.7 6778174.3 204.2, 1037488.5 6778178.2 204.2, 1037493 6778184.2 204.2, 1037501.3 6778178.2 204.2, 1037493.8 6778168.2 204.2))
-BATIMENT0000000234798027;POLYGON Z ((1037505.1 6778183.2 202, 1037496.4 6778189.6 202, 1037493.5 6778191.7 202, 1037491 6778193.5 202, 1037487.5 6778196.1 202, 1037488.5 6778197.5 202, 1037491.1 6778195.6 202, 1037495.5 6778201.3 202, 1037502.8 6778195.8 202, 1037501.4 6778194 202, 1037509 6778188.4 202, 1037505.1 6778183.2 202))
-BATIMENT0000000234798028;POLYGON Z ((1037516.4 6778198.2 202.1, 1037509 6778188.4 202.1, 1037501.4 6778194 202.1, 1037502.8 6778195.8 202.1, 1037495.5 6778201.3 202.1, 1037491.1 6778195.6 202.1, 1037488.5 6778197.5 202.1, 1037492.2 6778202.4 202.1, 1037498.7 6778211.4 202.1, 1037516.4 6778198.2 202.1))
-BATIMENT0000000234798031;POLYGON Z ((1037501.3 6778178.2 204.5, 1037493 6778184.2 204.5, 1037492.5 6778184.5 204.5, 1037496.4 6778189.6 204.5, 1037505.1 6778183.2 204.5, 1037501.3 6778178.2 204.5))
-BATIMENT0000000234798036;POLYGON Z ((1037488.8 6778218.8 205.6, 1037482.3 6778209.6 205.6, 1037478.4 6778212.5 205.6, 1037473.6 6778216 205.6, 1037473.8 6778216.2 205.6, 1037472.4 6778217.3 205.6, 1037475.1 6778221.1 205.6, 1037478.8 6778226.3 205.6, 1037488.8 6778218.8 205.6))
-BATIMENT0000000234798045;POLYGON Z ((1037482.3 6778209.6 202.6, 1037481.6 6778208.6 202.6, 1037477.7 6778211.4 202.6, 1037478.4 6778212.5 202.6, 1037482.3 6778209.6 202.6))
-BATIMENT0000000234798046;POLYGON Z ((1037471.2 6778232 205.3, 1037478.8 6778226.3 205.3, 1037475.1 6778221.1 205.3, 1037472.4 6778217.3 205.3, 1037472.3 6778217.1 205.3, 1037472.1 6778217.2 205.3, 1037470.5 6778215.2 205.3, 1037466.7 6778217.9 205.3, 1037465.1 6778215.7 205.3, 1037461.2 6778218.6 205.3, 1037471.2 6778232 205.3))
-BATIMENT0000000234798048;POLYGON Z ((1037541.6 6778192.6 202.8, 1037547.3 6778200.3 202.8, 1037556.1 6778193.7 202.8, 1037550.4 6778186 202.8, 1037541.6 6778192.6 202.8))
-BATIMENT0000000234798049;POLYGON Z ((1037530.3 6778201.1 202.8, 1037543.7 6778219.2 202.8, 1037548.4 6778215.6 202.8, 1037546.5 6778212.9 202.8, 1037541.1 6778205.6 202.8, 1037547.6 6778200.8 202.8, 1037547.3 6778200.3 202.8, 1037541.6 6778192.6 202.8, 1037530.3 6778201.1 202.8))
-BATIMENT0000000234798050;POLYGON Z ((1037550.4 6778186 204.8, 1037556.1 6778193.7 204.8, 1037557.4 6778192.7 204.8, 1037563.6 6778188.1 204.8, 1037566.5 6778186 204.8, 1037560.8 6778178.3 204.8, 1037550.4 6778186 204.8))
-BATIMENT0000000234798052;POLYGON Z ((1037551.9 6778230.3 202.9, 1037559.5 6778224.7 202.9, 1037551.3 6778213.5 202.9, 1037548.4 6778215.6 202.9, 1037543.7 6778219.2 202.9, 1037551.9 6778230.3 202.9))
-BATIMENT0000000234798053;POLYGON Z ((1037575.1 6778167.5 203.1, 1037560.8 6778178.3 203.1, 1037566.5 6778186 203.1, 1037573.3 6778180.9 203.1, 1037582.7 6778193.6 203.1, 1037581.2 6778194.8 203.1, 1037581.3 6778195 203.1, 1037587.7 6778190.3 203.1, 1037590.4 6778188.2 203.1, 1037575.1 6778167.5 203.1))
-BATIMENT0000000234798054;POLYGON Z ((1037587.7 6778190.3 204.6, 1037581.3 6778195 204.6, 1037587.1 6778202.9 204.6, 1037596.3 6778196.1 204.6, 1037590.4 6778188.2 204.6, 1037587.7 6778190.3 204.6))
-BATIMENT0000000234798058;POLYGON Z ((1037560.6 6778242.1 203.1, 1037577.6 6778229.6 203.1, 1037572.3 6778222.3 203.1, 1037568.2 6778225.4 203.1, 1037562.9 6778229.3 203.1, 1037559.5 6778224.7 203.1, 1037551.9 6778230.3 203.1, 1037560.6 6778242.1 203.1))
-BATIMENT0000000234798059;POLYGON Z ((1037591.9 6778219.1 203.1, 1037586.5 6778211.8 203.1, 1037576 6778219.6 203.1, 1037572.3 6778222.3 203.1, 1037577.6 6778229.6 203.1, 1037591.9 6778219.1 203.1))
-BATIMENT0000000234798066;POLYGON Z ((1037584.3 6778204.4 200.2, 1037583.1 6778205.3 200.2, 1037580 6778207.6 200.2, 1037580.6 6778208.4 200.2, 1037582.2 6778210.5 200.2, 1037584.4 6778208.9 200.2, 1037586.5 6778207.3 200.2, 1037584.3 6778204.4 200.2))
-BATIMENT0000000234798068;POLYGON Z ((1037605.7 6778208.9 203.1, 1037600.3 6778201.5 203.1, 1037586.5 6778211.8 203.1, 1037591.9 6778219.1 203.1, 1037605.7 6778208.9 203.1))
-BATIMENT0000000234798069;POLYGON Z ((1037576 6778219.6 199.7, 1037574.9 6778218.1 199.7, 1037573.8 6778218.9 199.7, 1037571.2 6778215.3 199.7, 1037568.1 6778211.2 199.7, 1037565.5 6778213.1 199.7, 1037566.6 6778214.7 199.7, 1037568.9 6778217.8 199.7, 1037570.6 6778220.1 199.7, 1037571.1 6778220.8 199.7, 1037572.3 6778222.3 199.7, 1037576 6778219.6 199.7))
-BATIMENT0000000234798070;POLYGON Z ((1037564.7 6778220.9 200.1, 1037568.9 6778217.8 200.1, 1037566.6 6778214.7 200.1, 1037563.5 6778217 200.1, 1037562.2 6778218 200.1, 1037564.5 6778221.1 200.1, 1037564.7 6778220.9 200.1))
-BATIMENT0000000234798073;POLYGON Z ((1037560.6 6778206.6 199.9, 1037563.1 6778209.9 199.9, 1037564.9 6778212.4 199.9, 1037565.5 6778213.1 199.9, 1037568.1 6778211.2 199.9, 1037568.8 6778210.7 199.9, 1037566.4 6778207.5 199.9, 1037563.9 6778204.1 199.9, 1037560.6 6778206.6 199.9))
-BATIMENT0000000234798076;POLYGON Z ((1037590.9 6778118.6 200.1, 1037594 6778122.8 200.1, 1037597.1 6778120.5 200.1, 1037595 6778117.8 200.1, 1037594 6778116.3 200.1, 1037590.9 6778118.6 200.1))
-BATIMENT0000000234798080;POLYGON Z ((1037599.7 6778124.1 205.6, 1037598.2 6778122.1 205.6, 1037595.2 6778124.4 205.6, 1037592.9 6778126 205.6, 1037600.1 6778135.6 205.6, 1037605.3 6778131.7 205.6, 1037599.7 6778124.1 205.6))
-BATIMENT0000000234798081;POLYGON Z ((1037596.8 6778110.4 200, 1037595.1 6778108.1 200, 1037590.4 6778111.4 200, 1037592 6778113.6 200, 1037596.8 6778110.4 200))
-BATIMENT0000000234798083;POLYGON Z ((1037612.9 6778126.2 204.4, 1037608.9 6778121 204.4, 1037607.2 6778118.6 204.4, 1037602.5 6778122.1 204.4, 1037599.7 6778124.1 204.4, 1037605.3 6778131.7 204.4, 1037612.9 6778126.2 204.4))
-BATIMENT0000000234798084;POLYGON Z ((1037593.6 6778106 199.8, 1037588.7 6778109.6 199.8, 1037588.9 6778109.9 199.8, 1037589.5 6778110.6 199.8, 1037589.7 6778110.5 199.8, 1037594.3 6778107 199.8, 1037593.6 6778106 199.8))
-BATIMENT0000000234798086;POLYGON Z ((1037592.1 6778103.9 199.7, 1037587.1 6778107.4 199.7, 1037587.2 6778107.6 199.7, 1037588.7 6778109.6 199.7, 1037593.6 6778106 199.7, 1037592.1 6778103.9 199.7))
-BATIMENT0000000234798087;POLYGON Z ((1037611.5 6778115.3 202.3, 1037609.4 6778116.9 202.3, 1037611.2 6778119.4 202.3, 1037608.9 6778121 202.3, 1037612.9 6778126.2 202.3, 1037622.4 6778119.1 202.3, 1037616.8 6778111.5 202.3, 1037611.5 6778115.3 202.3))
-BATIMENT0000000234798088;POLYGON Z ((1037592 6778103.8 199.5, 1037590.4 6778101.6 199.5, 1037585.5 6778105.1 199.5, 1037587.1 6778107.4 199.5, 1037592.1 6778103.9 199.5, 1037592 6778103.8 199.5))
-BATIMENT0000000234798089;POLYGON Z ((1037592.9 6778126 205.6, 1037590.6 6778127.7 205.6, 1037587.8 6778129.8 205.6, 1037595.1 6778139.3 205.6, 1037600.1 6778135.6 205.6, 1037592.9 6778126 205.6))
-BATIMENT0000000234798091;POLYGON Z ((1037611.2 6778119.4 200.2, 1037609.4 6778116.9 200.2, 1037611.5 6778115.3 200.2, 1037607 6778109.1 200.2, 1037602.7 6778112.3 200.2, 1037605.5 6778115.9 200.2, 1037607.4 6778118.4 200.2, 1037607.2 6778118.6 200.2, 1037608.9 6778121 200.2, 1037611.2 6778119.4 200.2))
-BATIMENT0000000234798092;POLYGON Z ((1037584 6778103.1 199.3, 1037585.5 6778105.1 199.3, 1037590.4 6778101.6 199.3, 1037588.9 6778099.5 199.3, 1037584 6778103.1 199.3))
-BATIMENT0000000234798093;POLYGON Z ((1037582.3 6778100.7 199.2, 1037583.9 6778102.9 199.2, 1037584 6778103.1 199.2, 1037588.9 6778099.5 199.2, 1037587.3 6778097.3 199.2, 1037582.3 6778100.7 199.2))
-BATIMENT0000000234798094;POLYGON Z ((1037587.8 6778129.8 204.8, 1037570.2 6778142.9 204.8, 1037577.3 6778152.6 204.8, 1037595.1 6778139.3 204.8, 1037587.8 6778129.8 204.8))
-BATIMENT0000000234798095;POLYGON Z ((1037585.6 6778122.1 199.4, 1037582.9 6778124.5 199.4, 1037586.4 6778128.2 199.4, 1037589.1 6778126 199.4, 1037585.6 6778122.1 199.4))
-BATIMENT0000000234798097;POLYGON Z ((1037606.7 6778097.8 200.9, 1037602.6 6778100.9 200.9, 1037605.5 6778104.9 200.9, 1037609.7 6778101.9 200.9, 1037606.7 6778097.8 200.9))
-BATIMENT0000000234798098;POLYGON Z ((1037601.7 6778091 201.5, 1037594.3 6778096.2 201.5, 1037599.4 6778103.2 201.5, 1037602.6 6778100.9 201.5, 1037606.7 6778097.8 201.5, 1037601.7 6778091 201.5))
-BATIMENT0000000234798099;POLYGON Z ((1037597 6778084.7 201.8, 1037589.8 6778089.9 201.8, 1037594.3 6778096.2 201.8, 1037601.7 6778091 201.8, 1037597 6778084.7 201.8))
-BATIMENT0000000234798100;POLYGON Z ((1037597 6778084.7 201.9, 1037592.3 6778078.3 201.9, 1037585.2 6778083.5 201.9, 1037589.8 6778089.9 201.9, 1037597 6778084.7 201.9))
-BATIMENT0000000234798104;POLYGON Z ((1037671.3 6778295.6 205.5, 1037663.4 6778285.2 205.5, 1037652 6778293.9 205.5, 1037647.1 6778297.7 205.5, 1037647 6778297.8 205.5, 1037640.4 6778302.8 205.5, 1037641.2 6778303.9 205.5, 1037643.8 6778307.3 205.5, 1037647.3 6778311.9 205.5, 1037648 6778312.8 205.5, 1037671.3 6778295.6 205.5))
-BATIMENT0000000234798106;POLYGON Z ((1037627.1 6778324.8 206, 1037633.1 6778320.3 206, 1037630.8 6778317.2 206, 1037630 6778317.7 206, 1037627.4 6778314.2 206, 1037627.5 6778314.1 206, 1037622.6 6778307.6 206, 1037620.2 6778304.3 206, 1037612.2 6778310.3 206, 1037624.3 6778326.9 206, 1037627.1 6778324.8 206))
-BATIMENT0000000234798109;POLYGON Z ((1037640.2 6778278.1 202.3, 1037628.3 6778287 202.3, 1037629.8 6778288.9 202.3, 1037633.3 6778293.6 202.3, 1037634.1 6778294.7 202.3, 1037644.5 6778287.1 202.3, 1037646.1 6778285.9 202.3, 1037645.4 6778285 202.3, 1037645.2 6778284.8 202.3, 1037640.2 6778278.1 202.3))
-BATIMENT0000000234798111;POLYGON Z ((1037651.6 6778269.5 204.6, 1037640.2 6778278.1 204.6, 1037645.2 6778284.8 204.6, 1037645.4 6778285 204.6, 1037646.1 6778285.9 204.6, 1037646.3 6778286.3 204.6, 1037651.5 6778282.4 204.6, 1037652.2 6778283.4 204.6, 1037651.1 6778284.2 204.6, 1037652.9 6778286.7 204.6, 1037648.8 6778289.7 204.6, 1037649.5 6778290.6 204.6, 1037652 6778293.9 204.6, 1037663.4 6778285.2 204.6, 1037651.6 6778269.5 204.6))
-BATIMENT0000000234798122;POLYGON Z ((1037650.2 6778330.9 200.8, 1037657.5 6778325.3 200.8, 1037655.5 6778322.6 200.8, 1037654.6 6778321.5 200.8, 1037649.8 6778325 200.8, 1037647.3 6778326.9 200.8, 1037650.2 6778330.9 200.8))
-BATIMENT0000000234798124;POLYGON Z ((1037662.4 6778307.9 199.1, 1037659.9 6778323.9 199.1, 1037660.5 6778324.8 199.1, 1037658.3 6778326.4 199.1, 1037661.1 6778329.9 199.1, 1037662.2 6778331.4 199.1, 1037670.2 6778325.5 199.1, 1037661.4 6778324.2 199.1, 1037663.9 6778307 199.1, 1037672.9 6778308.2 199.1, 1037674.2 6778299.5 199.1, 1037674 6778299.1 199.1, 1037662.4 6778307.9 199.1))
-BATIMENT0000000234798126;POLYGON Z ((1037672.9 6778308.2 201.6, 1037663.9 6778307 201.6, 1037661.4 6778324.2 201.6, 1037670.2 6778325.5 201.6, 1037672.9 6778308.2 201.6))
-BATIMENT0000000234798128;POLYGON Z ((1037564.2 6778100.1 201.1, 1037557.1 6778105.2 201.1, 1037563.9 6778114.1 201.1, 1037570.7 6778109.2 201.1, 1037569.8 6778108 201.1, 1037564.2 6778100.1 201.1))
-BATIMENT0000000234798130;POLYGON Z ((1037547 6778112.7 200.8, 1037553.6 6778121.6 200.8, 1037560 6778117 200.8, 1037563.9 6778114.1 200.8, 1037557.1 6778105.2 200.8, 1037547 6778112.7 200.8))
-BATIMENT0000000234798133;POLYGON Z ((1037564.2 6778100.1 205.8, 1037569.8 6778108 205.8, 1037578.7 6778101.5 205.8, 1037573.1 6778093.4 205.8, 1037564.2 6778100.1 205.8))
-BATIMENT0000000234798135;POLYGON Z ((1037575.4 6778091.7 201.9, 1037580.8 6778099.5 201.9, 1037585.6 6778096 201.9, 1037587.6 6778094.5 201.9, 1037582 6778086.9 201.9, 1037575.4 6778091.7 201.9))
-BATIMENT0000000234798137;POLYGON Z ((1037487.8 6778340.6 206.3, 1037487.7 6778340.3 206.3, 1037481.3 6778332 206.3, 1037480.1 6778330.3 206.3, 1037490.3 6778322.6 206.3, 1037484.2 6778314.4 206.3, 1037465.7 6778328.1 206.3, 1037479.5 6778346.7 206.3, 1037487.8 6778340.6 206.3))
-BATIMENT0000000234798141;POLYGON Z ((1037490.3 6778322.6 205.4, 1037490.6 6778323 205.4, 1037493.8 6778320.6 205.4, 1037499.5 6778316.2 205.4, 1037502.4 6778314 205.4, 1037501.9 6778313.3 205.4, 1037496.1 6778305.6 205.4, 1037484.2 6778314.4 205.4, 1037490.3 6778322.6 205.4))
-BATIMENT0000000234798144;POLYGON Z ((1037503.3 6778328 202.7, 1037500.7 6778330 202.7, 1037499.9 6778330.6 202.7, 1037500 6778330.7 202.7, 1037504 6778336.2 202.7, 1037507.5 6778333.7 202.7, 1037506.1 6778331.8 202.7, 1037503.3 6778328 202.7))
-BATIMENT0000000234798150;POLYGON Z ((1037506.4 6778297.9 203.3, 1037496.1 6778305.6 203.3, 1037501.9 6778313.3 203.3, 1037505.6 6778310.6 203.3, 1037506.7 6778312.1 203.3, 1037513.2 6778307.2 203.3, 1037506.4 6778297.9 203.3))
-BATIMENT0000000234798152;POLYGON Z ((1037513.2 6778307.2 205, 1037506.7 6778312.1 205, 1037510.7 6778317.4 205, 1037513.1 6778320.5 205, 1037519.6 6778315.6 205, 1037513.2 6778307.2 205))
-BATIMENT0000000234798153;POLYGON Z ((1037519.6 6778315.6 202.9, 1037513.1 6778320.5 202.9, 1037509.5 6778323.3 202.9, 1037512.3 6778327.1 202.9, 1037513.8 6778329 202.9, 1037515.6 6778331.4 202.9, 1037517.5 6778333.9 202.9, 1037519.7 6778332.2 202.9, 1037520.1 6778331.9 202.9, 1037527.5 6778326.4 202.9, 1037519.6 6778315.6 202.9))
-BATIMENT0000000234798157;POLYGON Z ((1037527.5 6778326.4 205.3, 1037520.1 6778331.9 205.3, 1037519.7 6778332.2 205.3, 1037521.9 6778335.2 205.3, 1037523.1 6778336.8 205.3, 1037526.5 6778334.2 205.3, 1037528.8 6778337.2 205.3, 1037533.3 6778334.1 205.3, 1037527.5 6778326.4 205.3))
-BATIMENT0000000234798161;POLYGON Z ((1037511.6 6778342.2 199.9, 1037509.7 6778339.7 199.9, 1037507.6 6778341.2 199.9, 1037506.2 6778342.3 199.9, 1037501.6 6778345.7 199.9, 1037503.5 6778348.3 199.9, 1037511.6 6778342.2 199.9))
-BATIMENT0000000234798163;POLYGON Z ((1037523 6778341.2 202.8, 1037524.2 6778340.3 202.8, 1037522.7 6778338.3 202.8, 1037520.9 6778336 202.8, 1037519.8 6778336.9 202.8, 1037520.1 6778337.3 202.8, 1037523 6778341.2 202.8))
-BATIMENT0000000234798164;POLYGON Z ((1037521.9 6778335.2 202.9, 1037520.9 6778336 202.9, 1037522.7 6778338.3 202.9, 1037523.7 6778337.6 202.9, 1037523.1 6778336.8 202.9, 1037521.9 6778335.2 202.9))
-BATIMENT0000000234798166;POLYGON Z ((1037540.3 6778343.5 202.9, 1037533.3 6778334.1 202.9, 1037528.8 6778337.2 202.9, 1037525.1 6778339.8 202.9, 1037526.1 6778341.1 202.9, 1037527 6778342.3 202.9, 1037525.1 6778343.8 202.9, 1037530.3 6778350.8 202.9, 1037540.3 6778343.5 202.9))
-BATIMENT0000000234798167;POLYGON Z ((1037524.6 6778343.1 202.8, 1037525.1 6778343.8 202.8, 1037527 6778342.3 202.8, 1037526.1 6778341.1 202.8, 1037519.6 6778345.9 202.8, 1037519.7 6778346 202.8, 1037520.1 6778346.5 202.8, 1037524.6 6778343.1 202.8))
-BATIMENT0000000234798168;POLYGON Z ((1037497.5 6778343 200.7, 1037500.7 6778340.6 200.7, 1037498.1 6778337.1 200.7, 1037481.5 6778349.4 200.7, 1037484.1 6778353 200.7, 1037497.5 6778343 200.7))
-BATIMENT0000000234798171;POLYGON Z ((1037525.8 6778354.1 202.9, 1037525.7 6778354 202.9, 1037520.1 6778346.5 202.9, 1037508.4 6778355.4 202.9, 1037508.6 6778355.7 202.9, 1037513.8 6778363 202.9, 1037525.8 6778354.1 202.9))
-BATIMENT0000000234798172;POLYGON Z ((1037364.2 6778334.2 204.9, 1037368.6 6778340.1 204.9, 1037375.7 6778349.8 204.9, 1037384.4 6778343.3 204.9, 1037369.3 6778323 204.9, 1037360.7 6778329.4 204.9, 1037364.2 6778334.2 204.9))
-BATIMENT0000000234798174;POLYGON Z ((1037399.7 6778363.8 204.8, 1037384.4 6778343.3 204.8, 1037375.7 6778349.8 204.8, 1037375 6778350.4 204.8, 1037381.3 6778358.9 204.8, 1037381.8 6778358.5 204.8, 1037385.9 6778363.9 204.8, 1037381.2 6778367.5 204.8, 1037386.1 6778374 204.8, 1037399.7 6778363.8 204.8))
-BATIMENT0000000234798178;POLYGON Z ((1037341.7 6778343.6 205, 1037348.2 6778352.2 205, 1037351.1 6778350 205, 1037358.7 6778344.4 205, 1037356.5 6778341.5 205, 1037355.8 6778340.6 205, 1037352.2 6778335.8 205, 1037341.7 6778343.6 205))
-BATIMENT0000000234798179;POLYGON Z ((1037359.7 6778361.7 203.1, 1037351.1 6778350 203.1, 1037348.2 6778352.2 203.1, 1037353.4 6778359.6 203.1, 1037356.6 6778364 203.1, 1037359.7 6778361.7 203.1))
-BATIMENT0000000234798180;POLYGON Z ((1037324.6 6778356.3 205, 1037331 6778364.9 205, 1037344.1 6778355.2 205, 1037348.2 6778352.2 205, 1037341.7 6778343.6 205, 1037324.6 6778356.3 205))
-BATIMENT0000000234798185;POLYGON Z ((1037672 6778269.6 202, 1037681.3 6778262.5 202, 1037677.9 6778258 202, 1037674.4 6778253.4 202, 1037674.2 6778253.1 202, 1037666.9 6778258.8 202, 1037666.7 6778258.5 202, 1037664.6 6778260 202, 1037672 6778269.6 202))
-BATIMENT0000000234798186;POLYGON Z ((1037681.3 6778251.7 202, 1037679.6 6778249.5 202, 1037674.4 6778253.4 202, 1037677.9 6778258 202, 1037683 6778254.1 202, 1037681.3 6778251.7 202))
-BATIMENT0000000234798187;POLYGON Z ((1037670.1 6778187.9 200, 1037674.2 6778193.6 200, 1037683.7 6778186.6 200, 1037679.4 6778181.2 200, 1037670.1 6778187.9 200))
-BATIMENT0000000234798188;POLYGON Z ((1037367.7 6778175.6 202.9, 1037378.9 6778167.4 202.9, 1037371.9 6778158.2 202.9, 1037360.8 6778166.5 202.9, 1037367.7 6778175.6 202.9))
-BATIMENT0000000234798189;POLYGON Z ((1037685.3 6778363.8 208, 1037686.7 6778354.3 208, 1037686.9 6778353 208, 1037689.7 6778334.2 208, 1037690.3 6778330.3 208, 1037690.8 6778327.3 208, 1037691.4 6778323.4 208, 1037692.8 6778314 208, 1037693 6778312.6 208, 1037695.8 6778293.8 208, 1037696 6778292.6 208, 1037698.8 6778273.8 208, 1037699 6778272.3 208, 1037700.5 6778262.8 208, 1037692.2 6778261.7 208, 1037676.9 6778362.6 208, 1037685.3 6778363.8 208))
-BATIMENT0000000234798198;POLYGON Z ((1037673.6 6778380.5 205.9, 1037675.6 6778380.9 205.9, 1037684.3 6778382.1 205.9, 1037686.9 6778382.4 205.9, 1037689.7 6778364.4 205.9, 1037685.3 6778363.8 205.9, 1037676.9 6778362.6 205.9, 1037676.3 6778362.5 205.9, 1037673.6 6778380.5 205.9))
-BATIMENT0000000234798204;POLYGON Z ((1037671.1 6778411.4 207.4, 1037679.8 6778412.7 207.4, 1037684.3 6778382.1 207.4, 1037675.6 6778380.9 207.4, 1037671.1 6778411.4 207.4))
-BATIMENT0000000234798205;POLYGON Z ((1037620 6778097.3 201.6, 1037620.5 6778096.9 201.6, 1037621.7 6778097.3 201.6, 1037623.3 6778096.2 201.6, 1037623.6 6778094.7 201.6, 1037627.2 6778092.1 201.6, 1037620.8 6778083.4 201.6, 1037613.5 6778088.6 201.6, 1037616.1 6778092.1 201.6, 1037620 6778097.3 201.6))
-BATIMENT0000000234798206;POLYGON Z ((1037614.9 6778092.9 203.8, 1037616.1 6778092.1 203.8, 1037613.5 6778088.6 203.8, 1037612.6 6778089.4 203.8, 1037612.1 6778091.1 203.8, 1037613.4 6778092.9 203.8, 1037614.9 6778092.9 203.8))
-BATIMENT0000000234798213;POLYGON Z ((1037335.4 6778050.7 205.5, 1037348.7 6778068.6 205.5, 1037368.5 6778053.9 205.5, 1037372.2 6778051.1 205.5, 1037392.4 6778036.2 205.5, 1037386.1 6778027.7 205.5, 1037385.2 6778026.3 205.5, 1037378.9 6778017.7 205.5, 1037371.3 6778023.4 205.5, 1037376.9 6778031.3 205.5, 1037366.3 6778039.2 205.5, 1037359.2 6778044.5 205.5, 1037348.7 6778052.4 205.5, 1037343.2 6778044.9 205.5, 1037335.4 6778050.7 205.5))
-BATIMENT0000000234798224;POLYGON Z ((1037377.5 6778083.3 203.4, 1037373.3 6778086.4 203.4, 1037374 6778087.3 203.4, 1037378.2 6778084.3 203.4, 1037377.5 6778083.3 203.4))
-BATIMENT0000000234798225;POLYGON Z ((1037387.6 6778073.8 203.4, 1037383.3 6778067.6 203.4, 1037372.1 6778075.8 203.4, 1037376.5 6778082 203.4, 1037377 6778082.7 203.4, 1037377.2 6778082.9 203.4, 1037386.8 6778075.8 203.4, 1037388.4 6778078.2 203.4, 1037388.8 6778077.9 203.4, 1037390 6778077 203.4, 1037389.7 6778076.6 203.4, 1037389.5 6778076.3 203.4, 1037387.8 6778073.9 203.4, 1037387.6 6778073.8 203.4))
-BATIMENT0000000234798226;POLYGON Z ((1037376.1 6778090 203.4, 1037374 6778087.3 203.4, 1037373.3 6778086.4 203.4, 1037377.5 6778083.3 203.4, 1037377.2 6778082.9 203.4, 1037377 6778082.7 203.4, 1037376.5 6778082 203.4, 1037372.1 6778075.8 203.4, 1037360.5 6778084.4 203.4, 1037368.6 6778095.3 203.4, 1037376.1 6778090 203.4))
-BATIMENT0000000234798228;POLYGON Z ((1037383.3 6778067.6 203.3, 1037387.6 6778073.8 203.3, 1037387.8 6778073.9 203.3, 1037389.5 6778076.3 203.3, 1037389.7 6778076.6 203.3, 1037397.3 6778071 203.3, 1037399 6778069.7 203.3, 1037397.5 6778067.5 203.3, 1037396.6 6778066.2 203.3, 1037395.9 6778065.2 203.3, 1037392.7 6778060.7 203.3, 1037383.3 6778067.6 203.3))
-BATIMENT0000000234798232;POLYGON Z ((1037388.8 6778077.9 200.6, 1037388.4 6778078.2 200.6, 1037390.3 6778080.8 200.6, 1037391.8 6778079.8 200.6, 1037390 6778077 200.6, 1037388.8 6778077.9 200.6))
-BATIMENT0000000234798233;POLYGON Z ((1037397.5 6778067.5 203.2, 1037399.9 6778065.7 203.2, 1037399 6778064.5 203.2, 1037396.6 6778066.2 203.2, 1037397.5 6778067.5 203.2))
-BATIMENT0000000234798235;POLYGON Z ((1037405.8 6778051 203.3, 1037392.7 6778060.7 203.3, 1037395.9 6778065.2 203.3, 1037396.6 6778066.2 203.3, 1037399 6778064.5 203.3, 1037402.4 6778062 203.3, 1037405.8 6778066.4 203.3, 1037413.3 6778061.1 203.3, 1037405.8 6778051 203.3))
-BATIMENT0000000234798246;POLYGON Z ((1037399.8 6778103.1 200.6, 1037403.6 6778100.3 200.6, 1037406.1 6778098.4 200.6, 1037403.7 6778095.3 200.6, 1037400.2 6778098 200.6, 1037398.1 6778099.5 200.6, 1037397.4 6778100 200.6, 1037399.8 6778103.1 200.6))
-BATIMENT0000000234798256;POLYGON Z ((1037414.1 6778076 203.1, 1037413.2 6778076.7 203.1, 1037413.6 6778077.4 203.1, 1037417.5 6778082.8 203.1, 1037418.6 6778082 203.1, 1037414.1 6778076 203.1))
-BATIMENT0000000234798257;POLYGON Z ((1037406.1 6778098.4 203.3, 1037407.3 6778100 203.3, 1037407.8 6778100.6 203.3, 1037411.5 6778098 203.3, 1037407.4 6778092.6 203.3, 1037403.7 6778095.3 203.3, 1037406.1 6778098.4 203.3))
-BATIMENT0000000234798261;POLYGON Z ((1037422.4 6778096.7 203.1, 1037421.1 6778095 203.1, 1037420.3 6778095.6 203.1, 1037419.6 6778096.1 203.1, 1037420.2 6778096.8 203.1, 1037421 6778097.8 203.1, 1037422.4 6778096.7 203.1))
-BATIMENT0000000234798262;POLYGON Z ((1037421 6778097.8 203.1, 1037420.2 6778096.8 203.1, 1037410.5 6778104.1 203.1, 1037410.8 6778104.5 203.1, 1037411.2 6778105.1 203.1, 1037421 6778097.8 203.1))
-BATIMENT0000000234798263;POLYGON Z ((1037389.8 6778110.9 201.6, 1037395.6 6778106.6 201.6, 1037395.5 6778106.3 201.6, 1037393.1 6778103.2 201.6, 1037388.7 6778106.5 201.6, 1037388.8 6778106.7 201.6, 1037388.7 6778106.8 201.6, 1037387.3 6778107.8 201.6, 1037389.8 6778110.9 201.6))
-BATIMENT0000000234798266;POLYGON Z ((1037381.3 6778112.2 203.3, 1037387.3 6778107.8 203.3, 1037384.9 6778104.6 203.3, 1037378.9 6778096.7 203.3, 1037376.3 6778098.6 203.3, 1037372.9 6778100.9 203.3, 1037381.3 6778112.2 203.3))
-BATIMENT0000000234798267;POLYGON Z ((1037418.9 6778068.6 203.2, 1037414.1 6778072 203.2, 1037411.4 6778073.8 203.2, 1037411.2 6778074 203.2, 1037413.2 6778076.7 203.2, 1037414.1 6778076 203.2, 1037418.6 6778082 203.2, 1037419.7 6778083.5 203.2, 1037421 6778082.5 203.2, 1037426.3 6778078.5 203.2, 1037418.9 6778068.6 203.2))
-BATIMENT0000000234798268;POLYGON Z ((1037421 6778082.5 203.3, 1037419.7 6778083.5 203.3, 1037418.8 6778084.2 203.3, 1037421 6778087.2 203.3, 1037424.1 6778091.4 203.3, 1037431.7 6778085.7 203.3, 1037426.3 6778078.5 203.3, 1037421 6778082.5 203.3))
-BATIMENT0000000234798271;POLYGON Z ((1037407.4 6778092.6 206.2, 1037401.4 6778085 206.2, 1037397.7 6778087.6 206.2, 1037403.7 6778095.3 206.2, 1037407.4 6778092.6 206.2))
-BATIMENT0000000234798274;POLYGON Z ((1037411.2 6778105.1 203.1, 1037410.8 6778104.5 203.1, 1037404.7 6778109 203.1, 1037405.5 6778110 203.1, 1037411.6 6778105.5 203.1, 1037411.2 6778105.1 203.1))
-BATIMENT0000000234798276;POLYGON Z ((1037405.5 6778110 203.1, 1037404.7 6778109 203.1, 1037401.7 6778111.3 203.1, 1037402.4 6778112.2 203.1, 1037405.5 6778110 203.1))
-BATIMENT0000000234798278;POLYGON Z ((1037417.1 6778112.6 204.9, 1037411.6 6778105.5 204.9, 1037405.5 6778110 204.9, 1037402.4 6778112.2 204.9, 1037400.9 6778113.3 204.9, 1037401.7 6778114.4 204.9, 1037406.5 6778120.5 204.9, 1037417.1 6778112.6 204.9))
-BATIMENT0000000234798279;POLYGON Z ((1037402.4 6778112.2 203.1, 1037401.7 6778111.3 203.1, 1037400.3 6778109.5 203.1, 1037398.8 6778110.6 203.1, 1037399.8 6778112 203.1, 1037400.7 6778113 203.1, 1037400.9 6778113.3 203.1, 1037402.4 6778112.2 203.1))
-BATIMENT0000000234798281;POLYGON Z ((1037424.1 6778091.4 203.3, 1037428 6778096.6 203.3, 1037431.8 6778101.6 203.3, 1037439.3 6778095.9 203.3, 1037431.7 6778085.7 203.3, 1037424.1 6778091.4 203.3))
-BATIMENT0000000234798282;POLYGON Z ((1037424.1 6778091.4 201.8, 1037421 6778087.2 201.8, 1037420 6778088.1 201.8, 1037423 6778092.2 201.8, 1037424.1 6778091.4 201.8))
-BATIMENT0000000234798284;POLYGON Z ((1037421.1 6778109.6 205.3, 1037428.3 6778104.2 205.3, 1037425.9 6778101.1 205.3, 1037424.4 6778099.3 205.3, 1037422.4 6778096.7 205.3, 1037421 6778097.8 205.3, 1037411.2 6778105.1 205.3, 1037411.6 6778105.5 205.3, 1037417.1 6778112.6 205.3, 1037421.1 6778109.6 205.3))
-BATIMENT0000000234798285;POLYGON Z ((1037394.3 6778129.6 202.9, 1037406.5 6778120.5 202.9, 1037401.7 6778114.4 202.9, 1037400.9 6778113.3 202.9, 1037400.7 6778113 202.9, 1037393.4 6778118.6 202.9, 1037392.6 6778117.5 202.9, 1037387.9 6778121 202.9, 1037394.3 6778129.6 202.9))
-BATIMENT0000000234798287;POLYGON Z ((1037482 6778120 202.6, 1037482.8 6778119.4 202.6, 1037478.5 6778114 202.6, 1037478.2 6778114.3 202.6, 1037477.7 6778114.6 202.6, 1037482 6778120 202.6))
-BATIMENT0000000234798289;POLYGON Z ((1037488.7 6778129.6 202.5, 1037487.9 6778128.5 202.5, 1037484.4 6778123.9 202.5, 1037485.6 6778123 202.5, 1037482.8 6778119.4 202.5, 1037482 6778120 202.5, 1037477.7 6778114.6 202.5, 1037473.7 6778117.4 202.5, 1037470.6 6778119.5 202.5, 1037482 6778134.7 202.5, 1037488.7 6778129.6 202.5))
-BATIMENT0000000234798290;POLYGON Z ((1037473.7 6778117.4 204.4, 1037477.7 6778114.6 204.4, 1037478.2 6778114.3 204.4, 1037476.3 6778111.8 204.4, 1037475.1 6778110.3 204.4, 1037474.2 6778110.9 204.4, 1037471.6 6778107.4 204.4, 1037470.7 6778106.2 204.4, 1037471.5 6778105.6 204.4, 1037474.4 6778103.5 204.4, 1037472.4 6778100.9 204.4, 1037470.9 6778102.1 204.4, 1037469 6778103.5 204.4, 1037462.3 6778108.4 204.4, 1037470.6 6778119.5 204.4, 1037473.7 6778117.4 204.4))
-BATIMENT0000000234798292;POLYGON Z ((1037469 6778103.5 204.5, 1037467.1 6778101.1 204.5, 1037467.7 6778100.6 204.5, 1037466.2 6778098.4 204.5, 1037461.2 6778091.4 204.5, 1037453.7 6778097 204.5, 1037462.3 6778108.4 204.5, 1037469 6778103.5 204.5))
-BATIMENT0000000234798294;POLYGON Z ((1037472.5 6778106.8 202, 1037471.6 6778107.4 202, 1037474.2 6778110.9 202, 1037475.1 6778110.3 202, 1037472.5 6778106.8 202))
-BATIMENT0000000234798295;POLYGON Z ((1037471.5 6778105.6 201.9, 1037470.7 6778106.2 201.9, 1037471.6 6778107.4 201.9, 1037472.5 6778106.8 201.9, 1037471.5 6778105.6 201.9))
-BATIMENT0000000234798296;POLYGON Z ((1037499.3 6778121.5 202.6, 1037493.9 6778125.6 202.6, 1037488.7 6778129.6 202.6, 1037482 6778134.7 202.6, 1037487.5 6778142 202.6, 1037505 6778128.9 202.6, 1037499.3 6778121.5 202.6))
-BATIMENT0000000234798298;POLYGON Z ((1037485.6 6778123 202.2, 1037484.4 6778123.9 202.2, 1037487.9 6778128.5 202.2, 1037488.1 6778128.3 202.2, 1037489.2 6778127.5 202.2, 1037485.6 6778123 202.2))
-BATIMENT0000000234798299;POLYGON Z ((1037509.3 6778125.7 204.8, 1037508.2 6778124.3 204.8, 1037503.2 6778117.8 204.8, 1037498.9 6778121.1 204.8, 1037499.3 6778121.5 204.8, 1037505 6778128.9 204.8, 1037509.3 6778125.7 204.8))
-BATIMENT0000000234798300;POLYGON Z ((1037498.9 6778121.1 202.3, 1037498.6 6778120.7 202.3, 1037493.3 6778124.8 202.3, 1037493.9 6778125.6 202.3, 1037499.3 6778121.5 202.3, 1037498.9 6778121.1 202.3))
-BATIMENT0000000234798301;POLYGON Z ((1037496.3 6778117.8 199.4, 1037492.4 6778112.8 199.4, 1037487.7 6778106.8 199.4, 1037484.4 6778109.4 199.4, 1037488.2 6778114.1 199.4, 1037489.1 6778115.1 199.4, 1037487.6 6778116.2 199.4, 1037487.1 6778116.6 199.4, 1037491.9 6778122.6 199.4, 1037493.6 6778121.5 199.4, 1037497.3 6778119 199.4, 1037496.3 6778117.8 199.4))
-BATIMENT0000000234798304;POLYGON Z ((1037476.7 6778097.7 201.5, 1037474.8 6778095.2 201.5, 1037473.4 6778096.3 201.5, 1037475.3 6778098.8 201.5, 1037476.7 6778097.7 201.5))
-BATIMENT0000000234798305;POLYGON Z ((1037474.8 6778095.2 201.5, 1037476 6778094.3 201.5, 1037475.4 6778093.4 201.5, 1037472.7 6778095.4 201.5, 1037473.4 6778096.3 201.5, 1037474.8 6778095.2 201.5))
-BATIMENT0000000234798306;POLYGON Z ((1037466.7 6778087.4 203.8, 1037471.8 6778094.2 203.8, 1037472.7 6778095.4 203.8, 1037475.4 6778093.4 203.8, 1037477 6778092.2 203.8, 1037476.1 6778090.8 203.8, 1037471.2 6778084.1 203.8, 1037466.7 6778087.4 203.8))
-BATIMENT0000000234798310;POLYGON Z ((1037476.1 6778090.8 201.5, 1037479.1 6778088.6 201.5, 1037478.5 6778087.8 201.5, 1037483.3 6778084.3 201.5, 1037478.8 6778078.5 201.5, 1037471.2 6778084.1 201.5, 1037476.1 6778090.8 201.5))
-BATIMENT0000000234798311;POLYGON Z ((1037484.6 6778093.5 201.3, 1037481.3 6778089.2 201.3, 1037480.4 6778089.9 201.3, 1037477.2 6778092.4 201.3, 1037479.6 6778095.6 201.3, 1037480.3 6778096.7 201.3, 1037484.6 6778093.5 201.3))
-BATIMENT0000000234798312;POLYGON Z ((1037483.3 6778084.3 201.4, 1037486.1 6778082.3 201.4, 1037481.6 6778076.4 201.4, 1037478.8 6778078.5 201.4, 1037483.3 6778084.3 201.4))
-BATIMENT0000000234798314;POLYGON Z ((1037514.9 6778121.5 204.4, 1037509.2 6778113.7 204.4, 1037508.6 6778112.8 204.4, 1037504.1 6778116.3 204.4, 1037504.4 6778116.8 204.4, 1037503.2 6778117.8 204.4, 1037508.2 6778124.3 204.4, 1037509.3 6778125.7 204.4, 1037514.9 6778121.5 204.4))
-BATIMENT0000000234798315;POLYGON Z ((1037514.9 6778121.5 202.1, 1037519.2 6778118.3 202.1, 1037516 6778113.8 202.1, 1037513.6 6778110.5 202.1, 1037511.5 6778112 202.1, 1037509.2 6778113.7 202.1, 1037514.9 6778121.5 202.1))
-BATIMENT0000000234798318;POLYGON Z ((1037522 6778116.2 202.1, 1037518.8 6778111.8 202.1, 1037516 6778113.8 202.1, 1037519.2 6778118.3 202.1, 1037522 6778116.2 202.1))
-BATIMENT0000000234798320;POLYGON Z ((1037486.9 6778083.3 201.4, 1037494.2 6778077.9 201.4, 1037489.1 6778070.9 201.4, 1037481.6 6778076.4 201.4, 1037486.1 6778082.3 201.4, 1037486.9 6778083.3 201.4))
-BATIMENT0000000234798323;POLYGON Z ((1037506.1 6778103.3 204.5, 1037507.5 6778102.2 204.5, 1037512.7 6778098.4 204.5, 1037513.1 6778099 204.5, 1037521 6778093.1 204.5, 1037518.1 6778089.3 204.5, 1037509.2 6778096 204.5, 1037503.7 6778100.1 204.5, 1037500.9 6778102.2 204.5, 1037501.2 6778102.6 204.5, 1037501.3 6778102.9 204.5, 1037503 6778105.2 204.5, 1037503.2 6778105.4 204.5, 1037506.1 6778103.3 204.5))
-BATIMENT0000000234798324;POLYGON Z ((1037489.1 6778115.1 198.2, 1037488.2 6778114.1 198.2, 1037486.8 6778115.2 198.2, 1037487.6 6778116.2 198.2, 1037489.1 6778115.1 198.2))
-BATIMENT0000000234798329;POLYGON Z ((1037532.3 6778108.5 202.1, 1037524.1 6778097.4 202.1, 1037516.8 6778102.8 202.1, 1037521.1 6778108.4 202.1, 1037518 6778110.8 202.1, 1037518.8 6778111.8 202.1, 1037522 6778116.2 202.1, 1037532.3 6778108.5 202.1))
-BATIMENT0000000234798332;POLYGON Z ((1037494.2 6778077.9 201.3, 1037499.4 6778073.9 201.3, 1037494.5 6778066.9 201.3, 1037489.1 6778070.9 201.3, 1037494.2 6778077.9 201.3))
-BATIMENT0000000234798333;POLYGON Z ((1037497.7 6778097.8 202.2, 1037500.4 6778095.8 202.2, 1037495.9 6778090 202.2, 1037493.5 6778091.8 202.2, 1037495.6 6778094.7 202.2, 1037496.6 6778096.2 202.2, 1037497.7 6778097.8 202.2))
-BATIMENT0000000234798334;POLYGON Z ((1037501.4 6778085.7 206.2, 1037509.2 6778096 206.2, 1037518.1 6778089.3 206.2, 1037510.4 6778078.9 206.2, 1037503.6 6778084 206.2, 1037501.4 6778085.7 206.2))
-BATIMENT0000000234798336;POLYGON Z ((1037489.8 6778105.8 200.8, 1037493.2 6778110.2 200.8, 1037496.2 6778107.9 200.8, 1037492.9 6778103.5 200.8, 1037489.8 6778105.8 200.8))
-BATIMENT0000000234798337;POLYGON Z ((1037505.6 6778072.4 201.4, 1037499 6778063.5 201.4, 1037494.5 6778066.9 201.4, 1037499.4 6778073.9 201.4, 1037500.9 6778075.9 201.4, 1037505.6 6778072.4 201.4))
-BATIMENT0000000234798338;POLYGON Z ((1037510.4 6778078.9 201.5, 1037505.6 6778072.4 201.5, 1037500.9 6778075.9 201.5, 1037498.8 6778077.5 201.5, 1037503.6 6778084 201.5, 1037510.4 6778078.9 201.5))
-BATIMENT0000000234798339;POLYGON Z ((1037591.9 6778048.1 208.6, 1037583.8 6778036.8 208.6, 1037586.1 6778035 208.6, 1037582.8 6778030.4 208.6, 1037580.1 6778032.3 208.6, 1037579.8 6778032 208.6, 1037576.6 6778034.4 208.6, 1037576.9 6778034.7 208.6, 1037573 6778037.6 208.6, 1037577.8 6778044.1 208.6, 1037577.4 6778044.4 208.6, 1037579.5 6778047.1 208.6, 1037579.8 6778046.9 208.6, 1037584.5 6778053.4 208.6, 1037591.9 6778048.1 208.6))
-BATIMENT0000000234798341;POLYGON Z ((1037545.4 6778003 198.7, 1037545 6778002.9 198.7, 1037544 6778010.7 198.7, 1037547.2 6778011.1 198.7, 1037548.4 6778003.4 198.7, 1037545.4 6778003 198.7))
-BATIMENT0000000234798343;POLYGON Z ((1037538.4 6778002 199.1, 1037538 6778004.4 199.1, 1037537.2 6778009.7 199.1, 1037540.6 6778010.2 199.1, 1037541.8 6778002.5 199.1, 1037538.4 6778002 199.1))
-BATIMENT0000000234798344;POLYGON Z ((1037538 6778004.4 199.2, 1037535.1 6778003.9 199.2, 1037534.3 6778009.3 199.2, 1037537.2 6778009.7 199.2, 1037538 6778004.4 199.2))
-BATIMENT0000000234798348;POLYGON Z ((1037501.4 6778038.8 204.8, 1037491.7 6778046.1 204.8, 1037484.1 6778051.8 204.8, 1037483.7 6778052.1 204.8, 1037489.2 6778059.5 204.8, 1037507 6778046.1 204.8, 1037501.4 6778038.8 204.8))
-BATIMENT0000000234798349;POLYGON Z ((1037334.1 6778186.5 204.9, 1037336.6 6778189.9 204.9, 1037337.7 6778189 204.9, 1037335.2 6778185.6 204.9, 1037334.1 6778186.5 204.9))
-BATIMENT0000000234798350;POLYGON Z ((1037342.1 6778180.6 204.9, 1037335.2 6778185.6 204.9, 1037337.7 6778189 204.9, 1037343.5 6778196.8 204.9, 1037350.4 6778191.6 204.9, 1037342.1 6778180.6 204.9))
-BATIMENT0000000234798351;POLYGON Z ((1037350.4 6778191.6 204.9, 1037343.5 6778196.8 204.9, 1037343 6778197.2 204.9, 1037348.3 6778204 204.9, 1037355.6 6778198.6 204.9, 1037350.4 6778191.6 204.9))
-BATIMENT0000000234798398;POLYGON Z ((1037464.6 6778153.1 205.5, 1037462.3 6778150 205.5, 1037461.8 6778149.3 205.5, 1037451.1 6778157.2 205.5, 1037456.4 6778164.3 205.5, 1037467.1 6778156.4 205.5, 1037464.6 6778153.1 205.5))
-BATIMENT0000000234798355;POLYGON Z ((1037422.3 6778129.2 202.6, 1037423.2 6778130.5 202.6, 1037426.9 6778127.8 202.6, 1037425.9 6778126.5 202.6, 1037422.3 6778129.2 202.6))
-BATIMENT0000000234798360;POLYGON Z ((1037425.9 6778126.5 202.6, 1037426.9 6778127.8 202.6, 1037428.2 6778126.8 202.6, 1037427.3 6778125.5 202.6, 1037425.9 6778126.5 202.6))
-BATIMENT0000000234798361;POLYGON Z ((1037413 6778126.6 205, 1037417.6 6778132.7 205, 1037421.4 6778129.9 205, 1037422.3 6778129.2 205, 1037425.9 6778126.5 205, 1037427.3 6778125.5 205, 1037426.8 6778124.9 205, 1037422.7 6778119.4 205, 1037413 6778126.6 205))
-BATIMENT0000000234798362;POLYGON Z ((1037445.1 6778102.8 202.5, 1037434.6 6778110.6 202.5, 1037438.4 6778115.6 202.5, 1037439.4 6778114.9 202.5, 1037441.3 6778117.3 202.5, 1037442.5 6778118.8 202.5, 1037443.7 6778117.9 202.5, 1037444.1 6778117.5 202.5, 1037443.9 6778117.2 202.5, 1037451 6778111.9 202.5, 1037451.6 6778111.5 202.5, 1037445.1 6778102.8 202.5))
-BATIMENT0000000234798363;POLYGON Z ((1037440.3 6778118.1 202.5, 1037441.3 6778117.3 202.5, 1037439.4 6778114.9 202.5, 1037438.4 6778115.6 202.5, 1037440.3 6778118.1 202.5))
-BATIMENT0000000234798364;POLYGON Z ((1037451.6 6778111.5 205.8, 1037451 6778111.9 205.8, 1037443.9 6778117.2 205.8, 1037444.1 6778117.5 205.8, 1037448.9 6778124.1 205.8, 1037450.1 6778125.7 205.8, 1037451.1 6778125 205.8, 1037451.9 6778124.4 205.8, 1037457.9 6778119.9 205.8, 1037451.6 6778111.5 205.8))
-BATIMENT0000000234798367;POLYGON Z ((1037441.3 6778117.3 202.5, 1037440.3 6778118.1 202.5, 1037441.5 6778119.6 202.5, 1037442.5 6778118.8 202.5, 1037441.3 6778117.3 202.5))
-BATIMENT0000000234798369;POLYGON Z ((1037457.9 6778119.9 205, 1037451.9 6778124.4 205, 1037451.1 6778125 205, 1037458.3 6778134.5 205, 1037459.1 6778135.5 205, 1037460 6778134.9 205, 1037464.1 6778131.9 205, 1037465.8 6778130.6 205, 1037457.9 6778119.9 205))
-BATIMENT0000000234798374;POLYGON Z ((1037423.2 6778130.5 202.6, 1037422.3 6778129.2 202.6, 1037421.4 6778129.9 202.6, 1037425.4 6778135.2 202.6, 1037426.3 6778134.6 202.6, 1037423.2 6778130.5 202.6))
-BATIMENT0000000234798378;POLYGON Z ((1037459.4 6778146.2 202.6, 1037457.8 6778144 202.6, 1037457.2 6778143.1 202.6, 1037456.3 6778143.8 202.6, 1037460.1 6778148.8 202.6, 1037451.7 6778155.1 202.6, 1037448 6778150 202.6, 1037446.6 6778151 202.6, 1037450.5 6778156.3 202.6, 1037451.1 6778157.2 202.6, 1037461.8 6778149.3 202.6, 1037461.5 6778148.9 202.6, 1037460.2 6778147.2 202.6, 1037459.4 6778146.2 202.6))
-BATIMENT0000000234798380;POLYGON Z ((1037464.1 6778131.9 205, 1037460 6778134.9 205, 1037459.1 6778135.5 205, 1037458.2 6778136.2 205, 1037464.2 6778144.2 205, 1037464.6 6778143.9 205, 1037465.4 6778143.3 205, 1037466.4 6778142.6 205, 1037471.8 6778138.6 205, 1037465.8 6778130.6 205, 1037464.1 6778131.9 205))
-BATIMENT0000000234798384;POLYGON Z ((1037421.5 6778147 202.7, 1037422.4 6778146.3 202.7, 1037426.2 6778143.5 202.7, 1037429.8 6778140.9 202.7, 1037427.4 6778137.8 202.7, 1037423.7 6778140.7 202.7, 1037419 6778144.3 202.7, 1037421.2 6778147.2 202.7, 1037421.5 6778147 202.7))
-BATIMENT0000000234798388;POLYGON Z ((1037420.5 6778164.1 207, 1037427.9 6778158.7 207, 1037429.2 6778157.7 207, 1037421.5 6778147 207, 1037421.2 6778147.2 207, 1037412.7 6778153.5 207, 1037420.5 6778164.1 207))
-BATIMENT0000000234798389;POLYGON Z ((1037458.2 6778136.2 202.6, 1037459.1 6778135.5 202.6, 1037458.3 6778134.5 202.6, 1037457.1 6778135.4 202.6, 1037457.9 6778136.4 202.6, 1037458.2 6778136.2 202.6))
-BATIMENT0000000234798390;POLYGON Z ((1037466 6778145.7 202.7, 1037466.8 6778146.7 202.7, 1037468.5 6778145.4 202.7, 1037467.3 6778143.8 202.7, 1037466.3 6778144.5 202.7, 1037465.4 6778143.3 202.7, 1037464.6 6778143.9 202.7, 1037466 6778145.7 202.7))
-BATIMENT0000000234798392;POLYGON Z ((1037433.3 6778181.3 204.8, 1037445 6778172.7 204.8, 1037439.3 6778165.2 204.8, 1037437.5 6778166.5 204.8, 1037435.2 6778168.2 204.8, 1037434.3 6778167 204.8, 1037429.6 6778160.9 204.8, 1037427.9 6778158.7 204.8, 1037420.5 6778164.1 204.8, 1037433.3 6778181.3 204.8))
-BATIMENT0000000234798395;POLYGON Z ((1037466.4 6778142.6 205.2, 1037467.3 6778143.8 205.2, 1037468.5 6778145.4 205.2, 1037466.8 6778146.7 205.2, 1037462.3 6778150 205.2, 1037464.6 6778153.1 205.2, 1037467.1 6778156.4 205.2, 1037478.7 6778147.9 205.2, 1037471.8 6778138.6 205.2, 1037466.4 6778142.6 205.2))
-BATIMENT0000000234798399;POLYGON Z ((1037466.8 6778146.7 202.7, 1037466 6778145.7 202.7, 1037461.5 6778148.9 202.7, 1037461.8 6778149.3 202.7, 1037462.3 6778150 202.7, 1037466.8 6778146.7 202.7))
-BATIMENT0000000234798401;POLYGON Z ((1037439 6778164.8 202.6, 1037437.8 6778163.2 202.6, 1037436 6778164.5 202.6, 1037436.6 6778165.4 202.6, 1037437.5 6778166.5 202.6, 1037439.3 6778165.2 202.6, 1037439 6778164.8 202.6))
-BATIMENT0000000234798406;POLYGON Z ((1037421.2 6778147.2 205.3, 1037419 6778144.3 205.3, 1037413.9 6778137.6 205.3, 1037405.5 6778143.9 205.3, 1037412.7 6778153.5 205.3, 1037421.2 6778147.2 205.3))
-BATIMENT0000000234798407;POLYGON Z ((1037413.9 6778137.6 202.9, 1037412.8 6778136.2 202.9, 1037404.5 6778142.5 202.9, 1037405.5 6778143.9 202.9, 1037413.9 6778137.6 202.9))
-BATIMENT0000000234798409;POLYGON Z ((1037399.9 6778136.3 199.2, 1037403.4 6778141 199.2, 1037411.8 6778134.6 199.2, 1037408.3 6778130 199.2, 1037399.9 6778136.3 199.2))
-BATIMENT0000000234798410;POLYGON Z ((1037576.3 6778326.7 203.2, 1037582.2 6778334.7 203.2, 1037588.1 6778330.3 203.2, 1037591.9 6778327.5 203.2, 1037591.2 6778326.5 203.2, 1037586 6778319.5 203.2, 1037576.3 6778326.7 203.2))
-BATIMENT0000000234798411;POLYGON Z ((1037591.2 6778326.5 205.4, 1037599 6778320.7 205.4, 1037600.9 6778323.2 205.4, 1037598.6 6778324.8 205.4, 1037603.5 6778331.2 205.4, 1037610.8 6778326 205.4, 1037598.9 6778310 205.4, 1037586 6778319.5 205.4, 1037591.2 6778326.5 205.4))
-BATIMENT0000000234798412;POLYGON Z ((1037565.2 6778334.9 203.2, 1037571.1 6778342.9 203.2, 1037582.2 6778334.7 203.2, 1037576.3 6778326.7 203.2, 1037565.2 6778334.9 203.2))
-BATIMENT0000000234798413;POLYGON Z ((1037589.3 6778331.9 202.5, 1037593.2 6778329.1 202.5, 1037591.9 6778327.5 202.5, 1037588.1 6778330.3 202.5, 1037589.3 6778331.9 202.5))
-BATIMENT0000000234798414;POLYGON Z ((1037603.5 6778331.2 204.8, 1037602.7 6778331.8 204.8, 1037609.8 6778341.4 204.8, 1037617.8 6778335.5 204.8, 1037610.8 6778326 204.8, 1037603.5 6778331.2 204.8))
-BATIMENT0000000234798416;POLYGON Z ((1037554 6778343.3 205.4, 1037562.2 6778354.6 205.4, 1037570.4 6778348.6 205.4, 1037568 6778345.4 205.4, 1037571.3 6778343.1 205.4, 1037571.1 6778342.9 205.4, 1037565.2 6778334.9 205.4, 1037554 6778343.3 205.4))
-BATIMENT0000000234798420;POLYGON Z ((1037642.6 6778171.8 200.7, 1037643.7 6778171.1 200.7, 1037643.2 6778170.5 200.7, 1037641.6 6778168.2 200.7, 1037640.6 6778169 200.7, 1037642.6 6778171.8 200.7))
-BATIMENT0000000234798421;POLYGON Z ((1037627.5 6778183 204.2, 1037632.9 6778190.5 204.2, 1037645.9 6778181 204.2, 1037640.3 6778173.5 204.2, 1037627.5 6778183 204.2))
-BATIMENT0000000234798422;POLYGON Z ((1037638.3 6778170.7 200.6, 1037640.3 6778173.5 200.6, 1037642.6 6778171.8 200.6, 1037640.6 6778169 200.6, 1037640.3 6778168.7 200.6, 1037640.2 6778168.7 200.6, 1037638.1 6778165.8 200.6, 1037635.8 6778167.5 200.6, 1037638.3 6778170.7 200.6))
-BATIMENT0000000234798423;POLYGON Z ((1037627.5 6778183 205, 1037626.9 6778182.2 205, 1037619 6778188.1 205, 1037620.7 6778190.4 205, 1037618.2 6778192.2 205, 1037618 6778192.3 205, 1037622.3 6778198.3 205, 1037632.9 6778190.5 205, 1037627.5 6778183 205))
-BATIMENT0000000234798424;POLYGON Z ((1037614.5 6778204 204.4, 1037622.3 6778198.3 204.4, 1037618 6778192.3 204.4, 1037618.2 6778192.2 204.4, 1037615.8 6778188.9 204.4, 1037607.8 6778195 204.4, 1037614.5 6778204 204.4))
-BATIMENT0000000234798425;POLYGON Z ((1037644.7 6778166 201.6, 1037652.3 6778176.3 201.6, 1037659.6 6778170.9 201.6, 1037652 6778160.6 201.6, 1037644.7 6778166 201.6))
-BATIMENT0000000234798426;POLYGON Z ((1037646.8 6778154 204.1, 1037639.7 6778159.2 204.1, 1037644.7 6778166 204.1, 1037652 6778160.6 204.1, 1037647 6778153.8 204.1, 1037646.8 6778154 204.1))
-BATIMENT0000000234798427;POLYGON Z ((1037633.1 6778163.8 200.6, 1037635.8 6778167.5 200.6, 1037638.1 6778165.8 200.6, 1037638.7 6778165.4 200.6, 1037636.7 6778162.7 200.6, 1037636 6778161.7 200.6, 1037633.2 6778163.7 200.6, 1037633.1 6778163.8 200.6))
-BATIMENT0000000234798430;POLYGON Z ((1037625.1 6778168.8 200.6, 1037623.3 6778170.2 200.6, 1037625.5 6778173.2 200.6, 1037631.4 6778168.8 200.6, 1037629.1 6778165.8 200.6, 1037628.7 6778166.1 200.6, 1037625.1 6778168.8 200.6))
-BATIMENT0000000234798431;POLYGON Z ((1037642.4 6778147.5 204.1, 1037635.1 6778152.9 204.1, 1037636.4 6778154.7 204.1, 1037639.6 6778159.1 204.1, 1037639.7 6778159.2 204.1, 1037646.8 6778154 204.1, 1037647 6778153.8 204.1, 1037642.4 6778147.5 204.1))
-BATIMENT0000000234798432;POLYGON Z ((1037607.8 6778195 205.1, 1037615.8 6778188.9 205.1, 1037609.5 6778180.3 205.1, 1037608.7 6778181 205.1, 1037601.4 6778186.3 205.1, 1037607.8 6778195 205.1))
-BATIMENT0000000234798735;POLYGON Z ((1037141.5 6778134.6 200.2, 1037141.1 6778137.4 200.2, 1037143.7 6778137.7 200.2, 1037144 6778134.8 200.2, 1037141.5 6778134.6 200.2))
-BATIMENT0000000234798433;POLYGON Z ((1037608.7 6778181 202.7, 1037606.1 6778177.4 202.7, 1037601.5 6778171.1 202.7, 1037598.9 6778167.7 202.7, 1037603.1 6778164.6 202.7, 1037605.7 6778168 202.7, 1037610.5 6778164.5 202.7, 1037609.2 6778162.9 202.7, 1037607.1 6778159.9 202.7, 1037606.1 6778158.7 202.7, 1037600.2 6778150.7 202.7, 1037583.9 6778162.8 202.7, 1037599.8 6778184.3 202.7, 1037601.4 6778186.3 202.7, 1037608.7 6778181 202.7))
-BATIMENT0000000234798438;POLYGON Z ((1037619.9 6778172.6 200.6, 1037615.4 6778176 200.6, 1037617.3 6778178.4 200.6, 1037621.8 6778175.2 200.6, 1037619.9 6778172.6 200.6))
-BATIMENT0000000234798443;POLYGON Z ((1037615 6778164.6 198.6, 1037612.1 6778166.7 198.6, 1037613.2 6778168.2 198.6, 1037615.1 6778170.9 198.6, 1037615.7 6778171.6 198.6, 1037617.4 6778170.4 198.6, 1037618.6 6778169.5 198.6, 1037615 6778164.6 198.6))
-BATIMENT0000000234798445;POLYGON Z ((1037629 6778129.2 205.2, 1037611.3 6778142.4 205.2, 1037617.2 6778150.5 205.2, 1037626.6 6778143.6 205.2, 1037633.9 6778153.8 205.2, 1037635.1 6778152.9 205.2, 1037642.4 6778147.5 205.2, 1037629 6778129.2 205.2))
-BATIMENT0000000234798446;POLYGON Z ((1037606.1 6778158.7 204.6, 1037608.3 6778157 204.6, 1037609.2 6778158.4 204.6, 1037615.9 6778153.5 204.6, 1037614.9 6778152.2 204.6, 1037617.2 6778150.5 204.6, 1037611.3 6778142.4 204.6, 1037600.2 6778150.7 204.6, 1037606.1 6778158.7 204.6))
-BATIMENT0000000234798448;POLYGON Z ((1037621.8 6778175.2 200.5, 1037617.3 6778178.4 200.5, 1037619.5 6778181.5 200.5, 1037624 6778178.2 200.5, 1037622.2 6778175.7 200.5, 1037621.8 6778175.2 200.5))
-BATIMENT0000000234798449;POLYGON Z ((1037531.8 6778250 202.8, 1037530.2 6778247.9 202.8, 1037528.4 6778249.2 202.8, 1037527.6 6778249.8 202.8, 1037528.5 6778251.1 202.8, 1037529.1 6778251.9 202.8, 1037531.8 6778250 202.8))
-BATIMENT0000000234798452;POLYGON Z ((1037553 6778247.9 204.8, 1037546.6 6778239.2 204.8, 1037539.2 6778244.6 204.8, 1037537.8 6778245.6 204.8, 1037531.8 6778250 204.8, 1037529.1 6778251.9 204.8, 1037535.6 6778260.8 204.8, 1037553 6778247.9 204.8))
-BATIMENT0000000234798453;POLYGON Z ((1037535.6 6778260.8 204.7, 1037529.1 6778251.9 204.7, 1037528.5 6778251.1 204.7, 1037517.9 6778258.9 204.7, 1037521.7 6778264.1 204.7, 1037522.4 6778265 204.7, 1037525 6778268.6 204.7, 1037535.6 6778260.8 204.7))
-BATIMENT0000000234798461;POLYGON Z ((1037513.1 6778245.5 203, 1037520.5 6778240 203, 1037517.2 6778235.5 203, 1037515.7 6778233.4 203, 1037515.1 6778232.6 203, 1037511.9 6778228.3 203, 1037501.3 6778236.2 203, 1037505.9 6778242.5 203, 1037509.9 6778247.9 203, 1037513.1 6778245.5 203))
-BATIMENT0000000234798464;POLYGON Z ((1037487.4 6778233.2 204.9, 1037493 6778240.9 204.9, 1037497.3 6778237.6 204.9, 1037500.5 6778235.2 204.9, 1037494.9 6778227.6 204.9, 1037487.4 6778233.2 204.9))
-BATIMENT0000000234798465;POLYGON Z ((1037477.8 6778240.3 204.9, 1037488.7 6778255.1 204.9, 1037493 6778251.9 204.9, 1037492.4 6778251 204.9, 1037493.6 6778250.1 204.9, 1037497.4 6778247.3 204.9, 1037497.5 6778247.1 204.9, 1037496.3 6778245.5 204.9, 1037495.7 6778244.7 204.9, 1037493.6 6778241.7 204.9, 1037493 6778240.9 204.9, 1037487.4 6778233.2 204.9, 1037477.8 6778240.3 204.9))
-BATIMENT0000000234798466;POLYGON Z ((1037493.6 6778241.7 204.9, 1037497.9 6778238.5 204.9, 1037497.3 6778237.6 204.9, 1037493 6778240.9 204.9, 1037493.6 6778241.7 204.9))
-BATIMENT0000000234798467;POLYGON Z ((1037523.2 6778221.1 204.9, 1037524.5 6778220.1 204.9, 1037523.5 6778218.7 204.9, 1037522.2 6778219.7 204.9, 1037523.2 6778221.1 204.9))
-BATIMENT0000000234798468;POLYGON Z ((1037508 6778265 204.7, 1037508.1 6778264.9 204.7, 1037506.1 6778262.1 204.7, 1037504 6778259.3 204.7, 1037505.1 6778258.6 204.7, 1037501.8 6778254 204.7, 1037500.8 6778254.7 204.7, 1037496.9 6778257.7 204.7, 1037492.9 6778260.7 204.7, 1037500.4 6778270.8 204.7, 1037508 6778265 204.7))
-BATIMENT0000000234798469;POLYGON Z ((1037496.9 6778257.7 204.8, 1037500.8 6778254.7 204.8, 1037501.8 6778254 204.8, 1037499.9 6778251.5 204.8, 1037497.8 6778248.6 204.8, 1037498.3 6778248.2 204.8, 1037498.1 6778248.3 204.8, 1037498 6778248.4 204.8, 1037497.9 6778248.4 204.8, 1037497.8 6778248.4 204.8, 1037497.7 6778248.4 204.8, 1037497.6 6778248.3 204.8, 1037497.6 6778248.2 204.8, 1037497.4 6778248 204.8, 1037497.3 6778247.9 204.8, 1037497.3 6778247.8 204.8, 1037497.3 6778247.7 204.8, 1037497.3 6778247.6 204.8, 1037497.3 6778247.5 204.8, 1037497.4 6778247.3 204.8, 1037493.6 6778250.1 204.8, 1037492.4 6778251 204.8, 1037493 6778251.9 204.8, 1037488.7 6778255.1 204.8, 1037489.9 6778256.7 204.8, 1037492.9 6778260.7 204.8, 1037496.9 6778257.7 204.8))
-BATIMENT0000000234798470;POLYGON Z ((1037524.4 6778245.4 204.8, 1037532.9 6778239 204.8, 1037536.6 6778244 204.8, 1037538 6778243 204.8, 1037539.2 6778244.6 204.8, 1037546.6 6778239.2 204.8, 1037537.8 6778227.2 204.8, 1037531.2 6778232.1 204.8, 1037520.5 6778240 204.8, 1037524.4 6778245.4 204.8))
-BATIMENT0000000234798472;POLYGON Z ((1037513.4 6778266.9 204.7, 1037511.8 6778264.7 204.7, 1037511.8 6778265.2 204.7, 1037509.4 6778264.8 204.7, 1037511.8 6778268.1 204.7, 1037513.4 6778266.9 204.7))
-BATIMENT0000000234798479;POLYGON Z ((1037515.4 6778224.7 204.9, 1037522.2 6778219.7 204.9, 1037523.5 6778218.7 204.9, 1037524.5 6778220.1 204.9, 1037523.2 6778221.1 204.9, 1037523.4 6778221.3 204.9, 1037528 6778227.7 204.9, 1037531.2 6778232.1 204.9, 1037537.8 6778227.2 204.9, 1037522.8 6778206.9 204.9, 1037509.5 6778216.8 204.9, 1037515.4 6778224.7 204.9))
-BATIMENT0000000234798483;POLYGON Z ((1037595.8 6778067.6 201.8, 1037603 6778062.4 201.8, 1037600.6 6778059 201.8, 1037595.2 6778051.5 201.8, 1037587.9 6778056.7 201.8, 1037595.8 6778067.6 201.8))
-BATIMENT0000000234798484;POLYGON Z ((1037603 6778062.4 201.1, 1037604.8 6778061.1 201.1, 1037602.4 6778057.8 201.1, 1037600.6 6778059 201.1, 1037603 6778062.4 201.1))
-BATIMENT0000000234798485;POLYGON Z ((1037610.8 6778071.3 201.5, 1037610 6778070.2 201.5, 1037601.7 6778076.2 201.5, 1037602.5 6778077.3 201.5, 1037610.8 6778071.3 201.5))
-BATIMENT0000000234798486;POLYGON Z ((1037610.6 6778088.1 201.5, 1037614.7 6778085 201.5, 1037613.6 6778083.4 201.5, 1037617.9 6778080.5 201.5, 1037611 6778071.2 201.5, 1037610.8 6778071.3 201.5, 1037602.5 6778077.3 201.5, 1037610.6 6778088.1 201.5))
-BATIMENT0000000234798488;POLYGON Z ((1037345.1 6778105.1 205.5, 1037349.8 6778101.7 205.5, 1037353.4 6778106.6 205.5, 1037360.7 6778101.1 205.5, 1037352.6 6778090.3 205.5, 1037340.7 6778099.2 205.5, 1037345.1 6778105.1 205.5))
-BATIMENT0000000234798490;POLYGON Z ((1037330.2 6778107 205.4, 1037334 6778112.1 205.4, 1037335.6 6778114.2 205.4, 1037343.5 6778108.4 205.4, 1037346.1 6778106.4 205.4, 1037345.4 6778105.5 205.4, 1037345.1 6778105.1 205.4, 1037340.7 6778099.2 205.4, 1037330.2 6778107 205.4))
-BATIMENT0000000234798491;POLYGON Z ((1037353.4 6778106.6 203.4, 1037353.5 6778106.7 203.4, 1037352.9 6778107.1 203.4, 1037351.1 6778108.5 203.4, 1037358.4 6778118.5 203.4, 1037360 6778117.3 203.4, 1037361 6778116.5 203.4, 1037366.2 6778112.6 203.4, 1037368.2 6778111.1 203.4, 1037360.7 6778101.1 203.4, 1037353.4 6778106.6 203.4))
-BATIMENT0000000234798492;POLYGON Z ((1037366.2 6778112.6 205.4, 1037361 6778116.5 205.4, 1037363 6778119.1 205.4, 1037369.5 6778127.9 205.4, 1037376.7 6778122.4 205.4, 1037368.2 6778111.1 205.4, 1037366.2 6778112.6 205.4))
-BATIMENT0000000234798495;POLYGON Z ((1037369.5 6778127.9 203.4, 1037372.4 6778131.8 203.4, 1037377.1 6778138.1 203.4, 1037379.1 6778140.8 203.4, 1037386.4 6778135.3 203.4, 1037376.7 6778122.4 203.4, 1037369.5 6778127.9 203.4))
-BATIMENT0000000234798496;POLYGON Z ((1037312 6778120.7 203.2, 1037320.1 6778131.7 203.2, 1037327.2 6778126.3 203.2, 1037327.4 6778126.2 203.2, 1037323 6778120.3 203.2, 1037330.9 6778114.5 203.2, 1037334 6778112.1 203.2, 1037330.2 6778107 203.2, 1037312 6778120.7 203.2))
-BATIMENT0000000234798497;POLYGON Z ((1037325 6778138.3 205.2, 1037332.1 6778132.9 205.2, 1037327.4 6778126.5 205.2, 1037327.2 6778126.3 205.2, 1037320.1 6778131.7 205.2, 1037325 6778138.3 205.2))
-BATIMENT0000000234798498;POLYGON Z ((1037370.3 6778133.9 198.9, 1037370 6778133.6 198.9, 1037367 6778129.7 198.9, 1037364.3 6778131.7 198.9, 1037367.2 6778135.6 198.9, 1037367.5 6778135.9 198.9, 1037370.3 6778133.9 198.9))
-BATIMENT0000000234798499;POLYGON Z ((1037377.1 6778138.1 201.4, 1037375.5 6778139.2 201.4, 1037377.6 6778141.9 201.4, 1037379.1 6778140.8 201.4, 1037377.1 6778138.1 201.4))
-BATIMENT0000000234798500;POLYGON Z ((1037338.9 6778141.5 205.1, 1037332.3 6778132.7 205.1, 1037332.1 6778132.9 205.1, 1037325 6778138.3 205.1, 1037331.6 6778147.1 205.1, 1037338.9 6778141.5 205.1))
-BATIMENT0000000234798501;POLYGON Z ((1037337.8 6778151.9 203.2, 1037343.4 6778147.6 203.2, 1037338.9 6778141.5 203.2, 1037331.6 6778147.1 203.2, 1037336.1 6778153.2 203.2, 1037337.8 6778151.9 203.2))
-BATIMENT0000000234798502;POLYGON Z ((1037360 6778117.3 203.2, 1037362 6778119.9 203.2, 1037363 6778119.1 203.2, 1037361 6778116.5 203.2, 1037360 6778117.3 203.2))
-BATIMENT0000000234798505;POLYGON Z ((1037345.6 6778166.1 202.9, 1037353 6778160.5 202.9, 1037347.6 6778153.2 202.9, 1037345.9 6778151 202.9, 1037345.2 6778150 202.9, 1037343.4 6778147.6 202.9, 1037337.8 6778151.9 202.9, 1037336.1 6778153.2 202.9, 1037345.6 6778166.1 202.9))
-BATIMENT0000000234798507;POLYGON Z ((1037358.3 6778136.3 199.5, 1037353.5 6778129.9 199.5, 1037349.3 6778132.9 199.5, 1037349.6 6778133.4 199.5, 1037351.1 6778135.3 199.5, 1037353.1 6778133.8 199.5, 1037356.2 6778137.9 199.5, 1037358.3 6778136.3 199.5))
-BATIMENT0000000234798508;POLYGON Z ((1037358 6778140.4 199, 1037361.7 6778137.7 199, 1037359.7 6778135.2 199, 1037358.3 6778136.3 199, 1037356.2 6778137.9 199, 1037358 6778140.4 199))
-BATIMENT0000000234798512;POLYGON Z ((1037347.2 6778130.2 199.6, 1037347.6 6778130.6 199.6, 1037351.8 6778127.5 199.6, 1037349.9 6778124.9 199.6, 1037345.7 6778128.1 199.6, 1037347.2 6778130.2 199.6))
-BATIMENT0000000234798514;POLYGON Z ((1037349.6 6778133.4 199.7, 1037346.7 6778135.6 199.7, 1037348.6 6778138.3 199.7, 1037351.6 6778136.1 199.7, 1037351.1 6778135.3 199.7, 1037349.6 6778133.4 199.7))
-BATIMENT0000000234798515;POLYGON Z ((1037351.6 6778136.1 199.9, 1037348.6 6778138.3 199.9, 1037349.6 6778139.7 199.9, 1037352.6 6778137.4 199.9, 1037351.6 6778136.1 199.9))
-BATIMENT0000000234798516;POLYGON Z ((1037356.2 6778137.9 199.8, 1037353.1 6778133.8 199.8, 1037351.1 6778135.3 199.8, 1037351.6 6778136.1 199.8, 1037352.6 6778137.4 199.8, 1037354.2 6778139.5 199.8, 1037356.2 6778137.9 199.8))
-BATIMENT0000000234798519;POLYGON Z ((1037352.6 6778137.4 200, 1037349.6 6778139.7 200, 1037351.2 6778141.8 200, 1037354.2 6778139.5 200, 1037352.6 6778137.4 200))
-BATIMENT0000000234798522;POLYGON Z ((1037371.4 6778146.6 202.9, 1037366.7 6778140.3 202.9, 1037361 6778144.5 202.9, 1037361.9 6778145.6 202.9, 1037365.8 6778150.9 202.9, 1037371.4 6778146.6 202.9))
-BATIMENT0000000234798524;POLYGON Z ((1037168.7 6778153.1 207.4, 1037169.1 6778153.1 207.4, 1037169.6 6778150.3 207.4, 1037169.2 6778150.2 207.4, 1037170.6 6778141 207.4, 1037161.9 6778139.6 207.4, 1037160.8 6778147.2 207.4, 1037160.4 6778150.2 207.4, 1037159.9 6778153.4 207.4, 1037159 6778159.3 207.4, 1037167.6 6778160.5 207.4, 1037168.7 6778153.1 207.4))
-BATIMENT0000000234798526;POLYGON Z ((1037165.9 6778172.6 209.2, 1037166.2 6778172.7 209.2, 1037166.7 6778169.7 209.2, 1037166.3 6778169.7 209.2, 1037167.6 6778160.5 209.2, 1037159 6778159.3 209.2, 1037157.9 6778166.6 209.2, 1037157.5 6778169.7 209.2, 1037157 6778172.7 209.2, 1037155.9 6778180.3 209.2, 1037164.5 6778181.5 209.2, 1037165.9 6778172.6 209.2))
-BATIMENT0000000234798527;POLYGON Z ((1037162.9 6778192 209.2, 1037163.2 6778192.1 209.2, 1037163.6 6778189.4 209.2, 1037163.3 6778189.3 209.2, 1037164.5 6778181.5 209.2, 1037155.9 6778180.3 209.2, 1037155 6778186.2 209.2, 1037154.6 6778189.2 209.2, 1037154.2 6778192.2 209.2, 1037153.9 6778194 209.2, 1037153 6778200 209.2, 1037161.6 6778201.3 209.2, 1037162.9 6778192 209.2))
-BATIMENT0000000234798529;POLYGON Z ((1037153 6778200 206.5, 1037149 6778199.3 206.5, 1037147.4 6778210 206.5, 1037160.7 6778212.3 206.5, 1037162.3 6778201.5 206.5, 1037161.6 6778201.3 206.5, 1037153 6778200 206.5))
-BATIMENT0000000234798534;POLYGON Z ((1037147.4 6778210 208.1, 1037142.1 6778245.1 208.1, 1037155.3 6778247.5 208.1, 1037160.7 6778212.3 208.1, 1037147.4 6778210 208.1))
-BATIMENT0000000234798535;POLYGON Z ((1037152.9 6778262.8 208.1, 1037155.3 6778247.5 208.1, 1037142.1 6778245.1 208.1, 1037139.7 6778260.8 208.1, 1037152.9 6778262.8 208.1))
-BATIMENT0000000234798536;POLYGON Z ((1037152.9 6778262.8 204.9, 1037139.7 6778260.8 204.9, 1037136.9 6778279 204.9, 1037150.2 6778281 204.9, 1037152.9 6778262.8 204.9))
-BATIMENT0000000234798537;POLYGON Z ((1037150.2 6778281 204.8, 1037136.9 6778279 204.8, 1037132.6 6778307.5 204.8, 1037140.9 6778308.6 204.8, 1037145.9 6778309.2 204.8, 1037150.2 6778281 204.8))
-BATIMENT0000000234798539;POLYGON Z ((1037128.4 6778310.3 208.6, 1037127.1 6778310.2 208.6, 1037125.5 6778321.1 208.6, 1037126.8 6778321.3 208.6, 1037125.8 6778327.8 208.6, 1037124.5 6778327.6 208.6, 1037123.8 6778332.2 208.6, 1037125.2 6778335.2 208.6, 1037130 6778331.7 208.6, 1037136.3 6778338.3 208.6, 1037138.6 6778322.7 208.6, 1037129 6778321.4 208.6, 1037131.1 6778307.3 208.6, 1037128.9 6778307 208.6, 1037128.4 6778310.3 208.6))
-BATIMENT0000000234798545;POLYGON Z ((1037307.3 6778322.3 200.9, 1037305.8 6778323.5 200.9, 1037302.2 6778326.2 200.9, 1037304.7 6778329.5 200.9, 1037309.8 6778325.6 200.9, 1037307.3 6778322.3 200.9))
-BATIMENT0000000234798551;POLYGON Z ((1037311.3 6778327.6 198.8, 1037309.8 6778325.6 198.8, 1037304.7 6778329.5 198.8, 1037306.2 6778331.5 198.8, 1037311.3 6778327.6 198.8))
-BATIMENT0000000234798552;POLYGON Z ((1037287.3 6778306.3 202.9, 1037292.5 6778313.2 202.9, 1037296.1 6778310.5 202.9, 1037303.1 6778305.2 202.9, 1037298.2 6778298.3 202.9, 1037287.3 6778306.3 202.9))
-BATIMENT0000000234798553;POLYGON Z ((1037321.5 6778312 199.8, 1037323.7 6778314.8 199.8, 1037331.8 6778308.7 199.8, 1037329.7 6778305.9 199.8, 1037327.3 6778307.7 199.8, 1037321.5 6778312 199.8))
-BATIMENT0000000234798554;POLYGON Z ((1037298.2 6778298.3 202.9, 1037303.1 6778305.2 202.9, 1037314.1 6778297.1 202.9, 1037309 6778290.2 202.9, 1037298.2 6778298.3 202.9))
-BATIMENT0000000234798557;POLYGON Z ((1037656.3 6778137.1 200.8, 1037652.3 6778131.6 200.8, 1037647.4 6778135.3 200.8, 1037651.4 6778140.8 200.8, 1037650.9 6778141 200.8, 1037653.9 6778145 200.8, 1037654.3 6778144.8 200.8, 1037658.3 6778150.2 200.8, 1037663.3 6778146.6 200.8, 1037659.3 6778141.1 200.8, 1037659.7 6778140.8 200.8, 1037658.9 6778139.7 200.8, 1037656.8 6778136.8 200.8, 1037656.3 6778137.1 200.8))
-BATIMENT0000000234798560;POLYGON Z ((1037196.6 6778123.4 201.8, 1037190.7 6778127.7 201.8, 1037196.6 6778135.7 201.8, 1037197.1 6778136.4 201.8, 1037199.2 6778134.9 201.8, 1037198.4 6778133.9 201.8, 1037200.8 6778132.2 201.8, 1037201.6 6778133.2 201.8, 1037208.4 6778128.3 201.8, 1037203.9 6778122.2 201.8, 1037202 6778119.5 201.8, 1037196.6 6778123.4 201.8))
-BATIMENT0000000234798562;POLYGON Z ((1037203.8 6778141.4 201.4, 1037201.3 6778138.4 201.4, 1037201.7 6778138 201.4, 1037199.2 6778134.9 201.4, 1037197.1 6778136.4 201.4, 1037201.9 6778142.8 201.4, 1037203.8 6778141.4 201.4))
-BATIMENT0000000234798563;POLYGON Z ((1037190.7 6778127.7 204.2, 1037185.1 6778131.8 204.2, 1037189 6778136.9 204.2, 1037191.1 6778139.7 204.2, 1037196.6 6778135.7 204.2, 1037190.7 6778127.7 204.2))
-BATIMENT0000000234798566;POLYGON Z ((1037183 6778133.3 202.2, 1037180.9 6778147 202.2, 1037188.5 6778148.8 202.2, 1037192.4 6778141.5 202.2, 1037192.3 6778141.3 202.2, 1037191.1 6778139.7 202.2, 1037189 6778136.9 202.2, 1037185.1 6778131.8 202.2, 1037183 6778133.3 202.2))
-BATIMENT0000000234798568;POLYGON Z ((1037212.6 6778181 202.6, 1037208.7 6778175.8 202.6, 1037207.8 6778174.7 202.6, 1037205.8 6778176.3 202.6, 1037201.3 6778179.8 202.6, 1037201.1 6778179.6 202.6, 1037197 6778182.8 202.6, 1037202 6778189.5 202.6, 1037212.9 6778181.4 202.6, 1037212.6 6778181 202.6))
-BATIMENT0000000234798571;POLYGON Z ((1037218.8 6778165.3 202, 1037210.4 6778171.6 202, 1037208 6778173.4 202, 1037207.3 6778173.9 202, 1037207.8 6778174.7 202, 1037208.7 6778175.8 202, 1037212.6 6778181 202, 1037212.9 6778181.4 202, 1037224.3 6778172.9 202, 1037218.8 6778165.3 202))
-BATIMENT0000000234798577;POLYGON Z ((1037229.3 6778142.2 203.2, 1037233.7 6778138.9 203.2, 1037232.2 6778136.8 203.2, 1037223.2 6778124.6 203.2, 1037216.5 6778129.5 203.2, 1037217.5 6778130.9 203.2, 1037217.2 6778131.2 203.2, 1037219.7 6778134.5 203.2, 1037226.7 6778144 203.2, 1037229.3 6778142.2 203.2))
-BATIMENT0000000234798587;POLYGON Z ((1037229.2 6778156.4 202.8, 1037229.7 6778157.2 202.8, 1037235.2 6778164.8 202.8, 1037246.6 6778156.3 202.8, 1037239.3 6778146.5 202.8, 1037234.9 6778149.7 202.8, 1037232.7 6778151.4 202.8, 1037232.9 6778151.9 202.8, 1037231.5 6778152.9 202.8, 1037227.5 6778147.4 202.8, 1037224.4 6778149.6 202.8, 1037229.2 6778156.4 202.8))
-BATIMENT0000000234798588;POLYGON Z ((1037189.2 6778172.1 204.3, 1037195.9 6778166.9 204.3, 1037188.2 6778156.5 204.3, 1037181.4 6778161.4 204.3, 1037189.2 6778172.1 204.3))
-BATIMENT0000000234798590;POLYGON Z ((1037195.9 6778181.2 201.8, 1037197.3 6778180.2 201.8, 1037200.7 6778177.6 201.8, 1037200.6 6778177.4 201.8, 1037201.6 6778175.6 201.8, 1037201.7 6778175.3 201.8, 1037199.9 6778172.6 201.8, 1037195.9 6778166.9 201.8, 1037189.2 6778172.1 201.8, 1037195.9 6778181.2 201.8))
-BATIMENT0000000234798591;POLYGON Z ((1037229.7 6778157.2 202.2, 1037220.5 6778164.1 202.2, 1037220 6778164.4 202.2, 1037218.8 6778165.3 202.2, 1037224.3 6778172.9 202.2, 1037229.6 6778169 202.2, 1037235.2 6778164.8 202.2, 1037229.7 6778157.2 202.2))
-BATIMENT0000000234798596;POLYGON Z ((1037220 6778164.4 199.2, 1037219.4 6778163.6 199.2, 1037219.9 6778163.2 199.2, 1037218.7 6778161.6 199.2, 1037217.1 6778162.8 199.2, 1037218.8 6778165.3 199.2, 1037220 6778164.4 199.2))
-BATIMENT0000000234798599;POLYGON Z ((1037207.3 6778173.9 202.4, 1037206.7 6778173.3 202.4, 1037206.2 6778172.5 202.4, 1037204.2 6778174.1 202.4, 1037205.8 6778176.3 202.4, 1037207.8 6778174.7 202.4, 1037207.3 6778173.9 202.4))
-BATIMENT0000000234798600;POLYGON Z ((1037201.7 6778175.3 201.8, 1037201.6 6778173 201.8, 1037202.3 6778172.5 201.8, 1037201.4 6778171.4 201.8, 1037199.9 6778172.6 201.8, 1037201.7 6778175.3 201.8))
-BATIMENT0000000234798602;POLYGON Z ((1037208 6778173.4 201, 1037207.4 6778172.7 201, 1037206.7 6778173.3 201, 1037207.3 6778173.9 201, 1037208 6778173.4 201))
-BATIMENT0000000234798603;POLYGON Z ((1037362.8 6778222 205.4, 1037335.4 6778242.4 205.4, 1037341.5 6778250.6 205.4, 1037369 6778230.2 205.4, 1037362.8 6778222 205.4))
-BATIMENT0000000234798613;POLYGON Z ((1037279.5 6778296.7 205.8, 1037311.8 6778272.8 205.8, 1037304.7 6778263.1 205.8, 1037303.7 6778261.8 205.8, 1037302.3 6778262.8 205.8, 1037298.4 6778265.7 205.8, 1037295.8 6778267.7 205.8, 1037289.5 6778272.4 205.8, 1037289.1 6778272.7 205.8, 1037287 6778274.2 205.8, 1037277 6778281.7 205.8, 1037271.4 6778285.9 205.8, 1037279.5 6778296.7 205.8))
-BATIMENT0000000234798617;POLYGON Z ((1037288 6778270.4 204.5, 1037285.5 6778272.3 204.5, 1037287 6778274.2 204.5, 1037289.1 6778272.7 204.5, 1037289.5 6778272.4 204.5, 1037288 6778270.4 204.5))
-BATIMENT0000000234798618;POLYGON Z ((1037297 6778263.7 204.5, 1037294.4 6778265.6 204.5, 1037295.8 6778267.7 204.5, 1037298.4 6778265.7 204.5, 1037297 6778263.7 204.5))
-BATIMENT0000000234798620;POLYGON Z ((1037315.3 6778250.7 202.9, 1037303.1 6778234.5 202.9, 1037292.1 6778242.8 202.9, 1037298.5 6778251.3 202.9, 1037301.4 6778255.2 202.9, 1037304.2 6778258.8 202.9, 1037305.7 6778257.8 202.9, 1037315.3 6778250.7 202.9))
-BATIMENT0000000234798622;POLYGON Z ((1037255.8 6778245 200.4, 1037263 6778254.6 200.4, 1037273.9 6778246.5 200.4, 1037266.7 6778236.8 200.4, 1037255.8 6778245 200.4))
-BATIMENT0000000234798623;POLYGON Z ((1037269.9 6778263.7 201.7, 1037267.4 6778260.5 201.7, 1037266.2 6778261.4 201.7, 1037264.2 6778258.7 201.7, 1037265.4 6778257.8 201.7, 1037263 6778254.6 201.7, 1037253.4 6778261.8 201.7, 1037260.4 6778271 201.7, 1037269.9 6778263.7 201.7))
-BATIMENT0000000234798624;POLYGON Z ((1037246.2 6778252.1 204.4, 1037253.4 6778261.8 204.4, 1037263 6778254.6 204.4, 1037255.8 6778245 204.4, 1037246.2 6778252.1 204.4))
-BATIMENT0000000234798626;POLYGON Z ((1037566.9 6778022.1 200.7, 1037555.1 6778020.4 200.7, 1037553.8 6778029.2 200.7, 1037565.4 6778030.9 200.7, 1037566.9 6778022.1 200.7))
-BATIMENT0000000234798632;POLYGON Z ((1037194.2 6778291.5 205.1, 1037227.4 6778335.8 205.1, 1037235.7 6778329.7 205.1, 1037224.7 6778315.2 205.1, 1037223.2 6778316.2 205.1, 1037220.2 6778312.3 205.1, 1037202.1 6778288.1 205.1, 1037200.9 6778286.5 205.1, 1037194.2 6778291.5 205.1))
-BATIMENT0000000234798634;POLYGON Z ((1037233.9 6778264.8 201.9, 1037202.1 6778288.1 201.9, 1037220.2 6778312.3 201.9, 1037221.1 6778311.6 201.9, 1037221.6 6778312.2 201.9, 1037225.4 6778309.4 201.9, 1037225 6778308.8 201.9, 1037234.3 6778301.8 201.9, 1037251.9 6778288.7 201.9, 1037233.9 6778264.8 201.9))
-BATIMENT0000000234798636;POLYGON Z ((1037257.6 6778282.2 206.2, 1037239.4 6778257.9 206.2, 1037232.6 6778263 206.2, 1037233.9 6778264.8 206.2, 1037251.9 6778288.7 206.2, 1037255 6778292.6 206.2, 1037261.7 6778287.7 206.2, 1037257.6 6778282.2 206.2))
-BATIMENT0000000234798637;POLYGON Z ((1037294 6778083.3 203.2, 1037294.3 6778083.2 203.2, 1037287.7 6778074.2 203.2, 1037288.3 6778073.8 203.2, 1037286.4 6778071.3 203.2, 1037286 6778071.6 203.2, 1037282.5 6778066.9 203.2, 1037283 6778066.4 203.2, 1037279.7 6778062.1 203.2, 1037271.7 6778068 203.2, 1037286.9 6778088.5 203.2, 1037294 6778083.3 203.2))
-BATIMENT0000000234798639;POLYGON Z ((1037298.5 6778089.4 203.3, 1037296.8 6778087.1 203.3, 1037294 6778083.3 203.3, 1037286.9 6778088.5 203.3, 1037291.3 6778094.5 203.3, 1037298.5 6778089.4 203.3))
-BATIMENT0000000234798640;POLYGON Z ((1037302.9 6778095.3 203.3, 1037300.2 6778091.7 203.3, 1037298.5 6778089.4 203.3, 1037291.3 6778094.5 203.3, 1037295.9 6778100.6 203.3, 1037302.9 6778095.3 203.3))
-BATIMENT0000000234798642;POLYGON Z ((1037311.3 6778096.1 199.1, 1037307.9 6778098.7 199.1, 1037310 6778101.4 199.1, 1037310.1 6778101.3 199.1, 1037313.3 6778098.8 199.1, 1037311.3 6778096.1 199.1))
-BATIMENT0000000234798644;POLYGON Z ((1037299.3 6778105.2 203.4, 1037305 6778100.9 203.4, 1037306.3 6778099.9 203.4, 1037302.9 6778095.3 203.4, 1037295.9 6778100.6 203.4, 1037299.3 6778105.2 203.4))
-BATIMENT0000000234798646;POLYGON Z ((1037308.3 6778105.2 203.5, 1037307.5 6778104.1 203.5, 1037305 6778100.9 203.5, 1037299.3 6778105.2 203.5, 1037305.2 6778113.1 203.5, 1037311 6778108.8 203.5, 1037308.3 6778105.2 203.5))
-BATIMENT0000000234798648;POLYGON Z ((1037269.3 6778318.6 204.4, 1037276.8 6778329.2 204.4, 1037283 6778324.6 204.4, 1037287.3 6778321.4 204.4, 1037279.8 6778310.9 204.4, 1037279.6 6778311 204.4, 1037269.3 6778318.6 204.4))
-BATIMENT0000000234798651;POLYGON Z ((1037252 6778331.4 201.5, 1037257.7 6778339.3 201.5, 1037268.8 6778331.1 201.5, 1037267 6778328.8 201.5, 1037262.9 6778323.3 201.5, 1037252 6778331.4 201.5))
-BATIMENT0000000234798654;POLYGON Z ((1037275.5 6778333.4 199.1, 1037271.9 6778329.6 199.1, 1037268.8 6778331.1 199.1, 1037272.2 6778335.8 199.1, 1037275.5 6778333.4 199.1))
-BATIMENT0000000234798655;POLYGON Z ((1037257.6 6778339.5 201, 1037255 6778341.3 201, 1037256 6778342.7 201, 1037256.7 6778343.7 201, 1037257.4 6778343.1 201, 1037259.3 6778341.7 201, 1037257.6 6778339.5 201))
-BATIMENT0000000234798656;POLYGON Z ((1037240.7 6778339.8 201.1, 1037244.1 6778344.5 201.1, 1037248 6778341.5 201.1, 1037250.3 6778344.8 201.1, 1037255 6778341.3 201.1, 1037257.6 6778339.5 201.1, 1037257.7 6778339.3 201.1, 1037252 6778331.4 201.1, 1037240.7 6778339.8 201.1))
-BATIMENT0000000234798660;POLYGON Z ((1037256 6778342.7 201, 1037255.1 6778343.4 201, 1037255.8 6778344.4 201, 1037256.7 6778343.7 201, 1037256 6778342.7 201))
-BATIMENT0000000234798661;POLYGON Z ((1037257.4 6778343.1 200.9, 1037256.7 6778343.7 200.9, 1037255.8 6778344.4 200.9, 1037254.9 6778345.1 200.9, 1037262.7 6778355.5 200.9, 1037264.4 6778354.3 200.9, 1037267.2 6778352.3 200.9, 1037263.5 6778347.4 200.9, 1037259.3 6778341.7 200.9, 1037257.4 6778343.1 200.9))
-BATIMENT0000000234798662;POLYGON Z ((1037234.6 6778344.3 200.9, 1037242.3 6778354.7 200.9, 1037247.5 6778350.7 200.9, 1037245.7 6778348.2 200.9, 1037250.3 6778344.8 200.9, 1037248 6778341.5 200.9, 1037244.1 6778344.5 200.9, 1037240.7 6778339.8 200.9, 1037234.6 6778344.3 200.9))
-BATIMENT0000000234798663;POLYGON Z ((1037287.7 6778347.2 200.9, 1037281.9 6778339.7 200.9, 1037277.5 6778342.9 200.9, 1037282.1 6778348.9 200.9, 1037283.3 6778350.5 200.9, 1037287.7 6778347.2 200.9))
-BATIMENT0000000234798667;POLYGON Z ((1037283.8 6778371.2 204.8, 1037293.7 6778363.9 204.8, 1037287.6 6778355.9 204.8, 1037279.1 6778362.2 204.8, 1037276.1 6778364.4 204.8, 1037282.1 6778372.5 204.8, 1037283.8 6778371.2 204.8))
-BATIMENT0000000234798670;POLYGON Z ((1037250.1 6778365.1 204.7, 1037254.6 6778361.7 204.7, 1037256.5 6778360.2 204.7, 1037257.8 6778359.2 204.7, 1037250.9 6778350.1 204.7, 1037250 6778348.8 204.7, 1037249.9 6778348.9 204.7, 1037248.8 6778349.7 204.7, 1037247.5 6778350.7 204.7, 1037242.3 6778354.7 204.7, 1037250.1 6778365.1 204.7))
-BATIMENT0000000234798671;POLYGON Z ((1037302.8 6778357.2 204.8, 1037297.5 6778350 204.8, 1037296.9 6778349.1 204.8, 1037287.6 6778355.9 204.8, 1037293.7 6778363.9 204.8, 1037302.8 6778357.2 204.8))
-BATIMENT0000000234798672;POLYGON Z ((1037310.1 6778351.8 204, 1037304.7 6778344.6 204, 1037297.5 6778350 204, 1037302.8 6778357.2 204, 1037310.1 6778351.8 204))
-BATIMENT0000000234798673;POLYGON Z ((1037276.1 6778364.4 204.8, 1037276 6778364.3 204.8, 1037274.3 6778365.7 204.8, 1037268.4 6778370.1 204.8, 1037270 6778372.1 204.8, 1037274.5 6778378.1 204.8, 1037282.1 6778372.5 204.8, 1037276.1 6778364.4 204.8))
-BATIMENT0000000234798674;POLYGON Z ((1037270 6778372.1 204, 1037267.2 6778374.2 204, 1037264.6 6778370.7 204, 1037257.9 6778375.6 204, 1037265 6778385.2 204, 1037274.5 6778378.1 204, 1037270 6778372.1 204))
-BATIMENT0000000234798678;POLYGON Z ((1037252.1 6778367.8 200.7, 1037254.2 6778366.3 200.7, 1037256.6 6778364.5 200.7, 1037254.6 6778361.7 200.7, 1037250.1 6778365.1 200.7, 1037252.1 6778367.8 200.7))
-BATIMENT0000000234798682;POLYGON Z ((1037262.3 6778117.5 200.4, 1037266.2 6778114.6 200.4, 1037266.1 6778114.4 200.4, 1037262.1 6778109 200.4, 1037258.1 6778112 200.4, 1037263.8 6778119.9 200.4, 1037263.9 6778119.8 200.4, 1037262.3 6778117.5 200.4))
-BATIMENT0000000234798683;POLYGON Z ((1037266.8 6778123.8 199.5, 1037271.7 6778120.1 199.5, 1037269 6778116.7 199.5, 1037268.4 6778117.1 199.5, 1037264.2 6778120.2 199.5, 1037266.8 6778123.8 199.5))
-BATIMENT0000000234798684;POLYGON Z ((1037268.4 6778117.1 199.4, 1037266.3 6778114.2 199.4, 1037266.1 6778114.4 199.4, 1037266.2 6778114.6 199.4, 1037262.3 6778117.5 199.4, 1037263.9 6778119.8 199.4, 1037264.2 6778120.2 199.4, 1037268.4 6778117.1 199.4))
-BATIMENT0000000234798685;POLYGON Z ((1037270.8 6778084.9 204.6, 1037263.5 6778090.4 204.6, 1037263.3 6778090.6 204.6, 1037271.4 6778101.6 204.6, 1037278.9 6778096 204.6, 1037270.8 6778084.9 204.6))
-BATIMENT0000000234798686;POLYGON Z ((1037279.4 6778108.5 204.6, 1037282.9 6778105.9 204.6, 1037285.1 6778104.3 204.6, 1037278.9 6778096 204.6, 1037271.4 6778101.6 204.6, 1037277.5 6778109.9 204.6, 1037279.4 6778108.5 204.6))
-BATIMENT0000000234798687;POLYGON Z ((1037263.4 6778075 204.4, 1037256.2 6778080.3 204.4, 1037258.5 6778083.5 204.4, 1037260.4 6778086.1 204.4, 1037263.5 6778090.4 204.4, 1037270.8 6778084.9 204.4, 1037263.4 6778075 204.4))
-BATIMENT0000000234798688;POLYGON Z ((1037282.9 6778105.9 202.2, 1037279.4 6778108.5 202.2, 1037285.2 6778116.3 202.2, 1037290.9 6778112.1 202.2, 1037285.1 6778104.3 202.2, 1037282.9 6778105.9 202.2))
-BATIMENT0000000234798691;POLYGON Z ((1037285.2 6778116.3 202.4, 1037287 6778118.6 202.4, 1037291.2 6778124.3 202.4, 1037296.8 6778120.1 202.4, 1037290.9 6778112.1 202.4, 1037285.2 6778116.3 202.4))
-BATIMENT0000000234798700;POLYGON Z ((1037184 6778279.2 200.6, 1037192.3 6778273 200.6, 1037187.1 6778266.4 200.6, 1037178.9 6778272.4 200.6, 1037184 6778279.2 200.6))
-BATIMENT0000000234798703;POLYGON Z ((1037182.4 6778312.2 203.7, 1037190.3 6778306.3 203.7, 1037185.1 6778299.2 203.7, 1037181.3 6778294 203.7, 1037181 6778294.3 203.7, 1037173.5 6778299.8 203.7, 1037174.9 6778301.8 203.7, 1037180.9 6778310.2 203.7, 1037182.4 6778312.2 203.7))
-BATIMENT0000000234798706;POLYGON Z ((1037332.4 6778272.8 205.2, 1037324.5 6778278.7 205.2, 1037335.6 6778294.1 205.2, 1037343.7 6778288.1 205.2, 1037332.4 6778272.8 205.2))
-BATIMENT0000000234798707;POLYGON Z ((1037343.7 6778288.1 205.2, 1037335.6 6778294.1 205.2, 1037343.2 6778304 205.2, 1037347.2 6778309.5 205.2, 1037347.4 6778309.3 205.2, 1037355.1 6778303.5 205.2, 1037343.7 6778288.1 205.2))
-BATIMENT0000000234798708;POLYGON Z ((1037344.1 6778311.7 201.8, 1037347.2 6778309.5 201.8, 1037343.2 6778304 201.8, 1037342.7 6778304.6 201.8, 1037342.3 6778305.2 201.8, 1037342.1 6778305.8 201.8, 1037341.9 6778306.2 201.8, 1037341.8 6778306.6 201.8, 1037341.7 6778307.2 201.8, 1037341.5 6778307.8 201.8, 1037341.5 6778308.5 201.8, 1037343.9 6778311.5 201.8, 1037344.1 6778311.7 201.8))
-BATIMENT0000000234798709;POLYGON Z ((1037362.6 6778313.7 204.5, 1037355.1 6778303.5 204.5, 1037347.4 6778309.3 204.5, 1037351.6 6778314.9 204.5, 1037345 6778319.8 204.5, 1037344.6 6778319.3 204.5, 1037341.6 6778321.4 204.5, 1037345.4 6778326.5 204.5, 1037362.6 6778313.7 204.5))
-BATIMENT0000000234798710;POLYGON Z ((1037337.3 6778332.5 205, 1037345.4 6778326.5 205, 1037341.6 6778321.4 205, 1037337.5 6778315.8 205, 1037337.3 6778316 205, 1037333.9 6778318.4 205, 1037335.4 6778320.3 205, 1037328 6778325.8 205, 1037329.6 6778328 205, 1037334.5 6778334.6 205, 1037337.3 6778332.5 205))
-BATIMENT0000000234798711;POLYGON Z ((1037329.6 6778328 204.2, 1037326 6778330.7 204.2, 1037323.9 6778332.3 204.2, 1037325.5 6778334.5 204.2, 1037328.7 6778338.9 204.2, 1037334.5 6778334.6 204.2, 1037329.6 6778328 204.2))
-BATIMENT0000000234798712;POLYGON Z ((1037326 6778330.7 202.2, 1037324.1 6778328.1 202.2, 1037322 6778329.7 202.2, 1037322.7 6778330.6 202.2, 1037323.9 6778332.3 202.2, 1037326 6778330.7 202.2))
-BATIMENT0000000234798713;POLYGON Z ((1037325.5 6778334.5 205, 1037323.9 6778332.3 205, 1037322.7 6778330.6 205, 1037318.2 6778334.1 205, 1037317.3 6778334.7 205, 1037323.4 6778342.9 205, 1037328.7 6778338.9 205, 1037325.5 6778334.5 205))
-BATIMENT0000000234798715;POLYGON Z ((1037322.7 6778330.6 202.2, 1037322 6778329.7 202.2, 1037317.5 6778333.1 202.2, 1037318.2 6778334.1 202.2, 1037322.7 6778330.6 202.2))
-BATIMENT0000000234798716;POLYGON Z ((1037317.3 6778334.7 202.2, 1037318.2 6778334.1 202.2, 1037317.5 6778333.1 202.2, 1037314.5 6778335.3 202.2, 1037315.2 6778336.3 202.2, 1037317.3 6778334.7 202.2))
-BATIMENT0000000234798717;POLYGON Z ((1037317.3 6778334.7 202.2, 1037315.2 6778336.3 202.2, 1037311.7 6778338.9 202.2, 1037317.8 6778347.1 202.2, 1037323.4 6778342.9 202.2, 1037317.3 6778334.7 202.2))
-BATIMENT0000000234798719;POLYGON Z ((1037207.1 6778228.3 201.8, 1037213.9 6778222.7 201.8, 1037208.9 6778216 201.8, 1037208.7 6778215.8 201.8, 1037201.7 6778221 201.8, 1037202 6778221.5 201.8, 1037207.1 6778228.3 201.8))
-BATIMENT0000000234798723;POLYGON Z ((1037205.9 6778229.2 202.1, 1037204.2 6778230.6 202.1, 1037206.3 6778233.5 202.1, 1037210 6778230.4 202.1, 1037213.2 6778234.5 202.1, 1037219.3 6778229.9 202.1, 1037213.9 6778222.7 202.1, 1037207.1 6778228.3 202.1, 1037205.9 6778229.2 202.1))
-BATIMENT0000000234798724;POLYGON Z ((1037210 6778241.5 201.1, 1037214.8 6778237.9 201.1, 1037212.6 6778234.9 201.1, 1037209.3 6778237.4 201.1, 1037205.6 6778240.1 201.1, 1037207.8 6778243.1 201.1, 1037210 6778241.5 201.1))
-BATIMENT0000000234798725;POLYGON Z ((1037219.3 6778229.9 200, 1037213.2 6778234.5 200, 1037212.6 6778234.9 200, 1037214.8 6778237.9 200, 1037218.7 6778243.1 200, 1037225.5 6778238.2 200, 1037219.3 6778229.9 200))
-BATIMENT0000000234798726;POLYGON Z ((1037200.7 6778233.5 201.3, 1037205.6 6778240.1 201.3, 1037209.3 6778237.4 201.3, 1037206.3 6778233.5 201.3, 1037204.2 6778230.6 201.3, 1037200.7 6778233.5 201.3))
-BATIMENT0000000234798727;POLYGON Z ((1037233.7 6778249.1 202.5, 1037225.9 6778238.7 202.5, 1037217.7 6778244.6 202.5, 1037225.5 6778255.1 202.5, 1037233.7 6778249.1 202.5))
-BATIMENT0000000234798729;POLYGON Z ((1037212.7 6778251.4 200.1, 1037215.2 6778249.6 200.1, 1037213.7 6778247.6 200.1, 1037212 6778248.8 200.1, 1037211.2 6778249.4 200.1, 1037212.7 6778251.4 200.1))
-BATIMENT0000000234798730;POLYGON Z ((1037220 6778256 200.1, 1037215.2 6778249.6 200.1, 1037212.7 6778251.4 200.1, 1037217.6 6778257.8 200.1, 1037220 6778256 200.1))
-BATIMENT0000000234798731;POLYGON Z ((1037215.2 6778259.6 200.1, 1037217.6 6778257.8 200.1, 1037212.7 6778251.4 200.1, 1037211.2 6778249.4 200.1, 1037208.7 6778251.2 200.1, 1037215.2 6778259.6 200.1))
-BATIMENT0000000234798733;POLYGON Z ((1037143.6 6778138.7 -1000, 1037143.7 6778137.7 -1000, 1037141.1 6778137.4 -1000, 1037140.7 6778140.3 -1000, 1037143.3 6778140.7 -1000, 1037143.6 6778138.7 -1000))
-BATIMENT0000000234798737;POLYGON Z ((1037140.7 6778140.3 -1000, 1037140.2 6778143.3 -1000, 1037141.6 6778143.5 -1000, 1037143 6778143.7 -1000, 1037143.3 6778140.7 -1000, 1037140.7 6778140.3 -1000))
-BATIMENT0000000234798739;POLYGON Z ((1037141.6 6778143.5 -1000, 1037141.2 6778146.4 -1000, 1037142.9 6778146.7 -1000, 1037143 6778145.7 -1000, 1037142.7 6778145.6 -1000, 1037143 6778143.7 -1000, 1037141.6 6778143.5 -1000))
-BATIMENT0000000234798741;POLYGON Z ((1037141.2 6778146.4 -1000, 1037140.9 6778149.3 -1000, 1037142.5 6778149.6 -1000, 1037142.9 6778146.7 -1000, 1037141.2 6778146.4 -1000))
-BATIMENT0000000234798744;POLYGON Z ((1037140.9 6778158.8 198.6, 1037146.8 6778159.6 198.6, 1037147.1 6778156.7 198.6, 1037145.7 6778156.5 198.6, 1037141.3 6778155.9 198.6, 1037140.9 6778158.8 198.6))
-BATIMENT0000000234798745;POLYGON Z ((1037140.4 6778153.8 198.5, 1037140.2 6778155.7 198.5, 1037140.2 6778155.8 198.5, 1037141.3 6778155.9 198.5, 1037145.7 6778156.5 198.5, 1037146 6778154.7 198.5, 1037140.4 6778153.8 198.5))
-BATIMENT0000000234798746;POLYGON Z ((1037142.3 6778150.6 198.8, 1037142.5 6778149.6 198.8, 1037140.9 6778149.3 198.8, 1037140.8 6778150.3 198.8, 1037142.3 6778150.6 198.8))
-BATIMENT0000000234798747;POLYGON Z ((1037146.4 6778162.5 198.6, 1037146.8 6778159.6 198.6, 1037140.9 6778158.8 198.6, 1037140.6 6778161.7 198.6, 1037146.4 6778162.5 198.6))
-BATIMENT0000000234798748;POLYGON Z ((1037146.4 6778162.5 198.9, 1037140.6 6778161.7 198.9, 1037140.2 6778164.7 198.9, 1037141.6 6778164.9 198.9, 1037143 6778165.1 198.9, 1037146 6778165.5 198.9, 1037146.4 6778162.5 198.9))
-BATIMENT0000000234798749;POLYGON Z ((1037290.1 6778326.3 202, 1037282.7 6778331.6 202, 1037289.2 6778340.4 202, 1037296.6 6778335.1 202, 1037290.1 6778326.3 202))
-BATIMENT0000000234798750;POLYGON Z ((1037334.6 6778174.2 204.5, 1037322.7 6778158.2 204.5, 1037323 6778158 204.5, 1037317.5 6778150.8 204.5, 1037317.3 6778150.9 204.5, 1037305.3 6778135 204.5, 1037298.5 6778139.9 204.5, 1037298.2 6778140.1 204.5, 1037298.5 6778140.5 204.5, 1037304 6778147.7 204.5, 1037322.4 6778172.4 204.5, 1037320.3 6778174 204.5, 1037325.6 6778181 204.5, 1037334.6 6778174.2 204.5))
-BATIMENT0000000234798754;POLYGON Z ((1037228.4 6778089 209.6, 1037223.3 6778082 209.6, 1037218.2 6778085.8 209.6, 1037215.3 6778087.9 209.6, 1037212.3 6778090.2 209.6, 1037209.9 6778091.9 209.6, 1037206.9 6778094.2 209.6, 1037212 6778101.1 209.6, 1037228.4 6778089 209.6))
-BATIMENT0000000234798756;POLYGON Z ((1037244 6778077.5 209.4, 1037238.9 6778070.6 209.4, 1037233.4 6778074.6 209.4, 1037230.4 6778076.9 209.4, 1037227.4 6778079 209.4, 1037223.3 6778082 209.4, 1037228.4 6778089 209.4, 1037244 6778077.5 209.4))
-BATIMENT0000000234798763;POLYGON Z ((1037253.5 6778136.6 205, 1037252.8 6778135.7 205, 1037250.8 6778137.2 205, 1037251.4 6778138.1 205, 1037253.5 6778136.6 205))
-BATIMENT0000000234798764;POLYGON Z ((1037260.4 6778142.6 203.4, 1037258.2 6778139.5 203.4, 1037255.1 6778135.4 203.4, 1037253.5 6778136.6 203.4, 1037251.4 6778138.1 203.4, 1037247.6 6778141 203.4, 1037256 6778152.3 203.4, 1037263.5 6778146.8 203.4, 1037260.4 6778142.6 203.4))
-BATIMENT0000000234798767;POLYGON Z ((1037190.1 6778220.5 201.1, 1037196.6 6778215.5 201.1, 1037191.9 6778209.8 201.1, 1037185.5 6778214.5 201.1, 1037187.7 6778217.4 201.1, 1037190.1 6778220.5 201.1))
-BATIMENT0000000234798770;POLYGON Z ((1037203.7 6778210.1 201.1, 1037199.3 6778204.2 201.1, 1037191.9 6778209.8 201.1, 1037196.6 6778215.5 201.1, 1037203.7 6778210.1 201.1))
-BATIMENT0000000234798771;POLYGON Z ((1037243.4 6778090.8 200.9, 1037235.5 6778096.6 200.9, 1037241.1 6778104.4 200.9, 1037249 6778098.5 200.9, 1037243.4 6778090.8 200.9))
-BATIMENT0000000234798772;POLYGON Z ((1037252.1 6778096.2 200.9, 1037246.5 6778088.5 200.9, 1037243.4 6778090.8 200.9, 1037249 6778098.5 200.9, 1037252.1 6778096.2 200.9))
-BATIMENT0000000234798778;POLYGON Z ((1037232.9 6778209.7 202.8, 1037225.4 6778199.5 202.8, 1037222.5 6778195.6 202.8, 1037211.7 6778203.7 202.8, 1037222.2 6778217.6 202.8, 1037232.9 6778209.7 202.8))
-BATIMENT0000000234798779;POLYGON Z ((1037222.5 6778195.6 206, 1037218.4 6778190.2 206, 1037207.6 6778198.2 206, 1037211.7 6778203.7 206, 1037222.5 6778195.6 206))
-BATIMENT0000000234798780;POLYGON Z ((1037218.4 6778190.2 202.7, 1037222.5 6778195.6 202.7, 1037225.4 6778199.5 202.7, 1037236.5 6778191.1 202.7, 1037229.7 6778181.8 202.7, 1037218.4 6778190.2 202.7))
-BATIMENT0000000234798782;POLYGON Z ((1037310.9 6778081.4 199.5, 1037308.8 6778078.5 199.5, 1037304.6 6778081.6 199.5, 1037306.5 6778084.2 199.5, 1037306.7 6778084.5 199.5, 1037310.9 6778081.4 199.5))
-BATIMENT0000000234798784;POLYGON Z ((1037308.8 6778078.5 201.9, 1037313 6778075.4 201.9, 1037305.1 6778064.7 201.9, 1037300.8 6778067.8 201.9, 1037306.3 6778075.1 201.9, 1037308.8 6778078.5 201.9))
-BATIMENT0000000234798785;POLYGON Z ((1037311.1 6778081.7 199.6, 1037310.9 6778081.4 199.6, 1037306.7 6778084.5 199.6, 1037308.6 6778087.1 199.6, 1037312.8 6778084 199.6, 1037311.1 6778081.7 199.6))
-BATIMENT0000000234798791;POLYGON Z ((1037322.6 6778092.7 202.6, 1037321 6778090.5 202.6, 1037315.6 6778094.6 202.6, 1037321.1 6778102 202.6, 1037326.5 6778098 202.6, 1037322.6 6778092.7 202.6))
-BATIMENT0000000234798794;POLYGON Z ((1037347 6778082.7 202.5, 1037336.2 6778068.2 202.5, 1037329 6778073.6 202.5, 1037328.2 6778074.2 202.5, 1037335 6778083.4 202.5, 1037338.9 6778088.7 202.5, 1037347 6778082.7 202.5))
-BATIMENT0000000234798795;POLYGON Z ((1037329.3 6778058.9 202.4, 1037321.2 6778064.9 202.4, 1037328.2 6778074.2 202.4, 1037329 6778073.6 202.4, 1037336.2 6778068.2 202.4, 1037329.3 6778058.9 202.4))
-BATIMENT0000000234798829;POLYGON Z ((1037339.1 6778212.2 199.3, 1037335.1 6778215.1 199.3, 1037336.5 6778216.9 199.3, 1037337.1 6778217.7 199.3, 1037339.6 6778215.8 199.3, 1037341 6778214.8 199.3, 1037339.1 6778212.2 199.3))
-BATIMENT0000000234798797;POLYGON Z ((1037310.8 6778026.9 209.6, 1037305.7 6778020.1 209.6, 1037300.5 6778024 209.6, 1037297.5 6778026.2 209.6, 1037294.5 6778028.5 209.6, 1037289.2 6778032.4 209.6, 1037294.3 6778039.2 209.6, 1037310.8 6778026.9 209.6))
-BATIMENT0000000234798799;POLYGON Z ((1037326.4 6778015.3 209.6, 1037324.6 6778012.9 209.6, 1037321.4 6778008.5 209.6, 1037321.3 6778008.4 209.6, 1037316 6778012.4 209.6, 1037312.8 6778014.7 209.6, 1037309.8 6778017 209.6, 1037305.7 6778020.1 209.6, 1037310.8 6778026.9 209.6, 1037326.4 6778015.3 209.6))
-BATIMENT0000000234798800;POLYGON Z ((1037289.2 6778032.4 209.3, 1037285.2 6778035.5 209.3, 1037282.2 6778037.8 209.3, 1037279.1 6778040 209.3, 1037273.7 6778044.1 209.3, 1037278.6 6778050.8 209.3, 1037294.3 6778039.2 209.3, 1037289.2 6778032.4 209.3))
-BATIMENT0000000234798810;POLYGON Z ((1037239 6778060.4 207.5, 1037240.3 6778059.4 207.5, 1037240.3 6778059.1 207.5, 1037246.6 6778054.5 207.5, 1037246.8 6778054.6 207.5, 1037248.2 6778053.5 207.5, 1037248.2 6778053.3 207.5, 1037250.3 6778051.7 207.5, 1037250.5 6778051.9 207.5, 1037255.8 6778048 207.5, 1037255.7 6778047.8 207.5, 1037257.7 6778046.3 207.5, 1037257.9 6778046.5 207.5, 1037259.3 6778045.4 207.5, 1037259.2 6778045.1 207.5, 1037265.3 6778040.7 207.5, 1037265.5 6778040.8 207.5, 1037268.7 6778038.5 207.5, 1037258.7 6778024 207.5, 1037256.9 6778025.3 207.5, 1037260.6 6778030.5 207.5, 1037250.1 6778038.6 207.5, 1037244 6778030.2 207.5, 1037237.3 6778035.3 207.5, 1037243.4 6778043.6 207.5, 1037232.9 6778051.5 207.5, 1037229.2 6778046.5 207.5, 1037227.4 6778047.7 207.5, 1037237.4 6778061.5 207.5, 1037239 6778060.4 207.5))
-BATIMENT0000000234798812;POLYGON Z ((1037267.5 6778185.9 205, 1037258.6 6778192.5 205, 1037266.9 6778203.8 205, 1037275.9 6778197 205, 1037267.5 6778185.9 205))
-BATIMENT0000000234798814;POLYGON Z ((1037265.9 6778184.3 204.5, 1037251.5 6778164.9 204.5, 1037243 6778171.2 204.5, 1037248.3 6778178.5 204.5, 1037257.3 6778190.7 204.5, 1037265.9 6778184.3 204.5))
-BATIMENT0000000234798816;POLYGON Z ((1037328 6778298.7 200.6, 1037325.5 6778295.1 200.6, 1037321.3 6778298.3 200.6, 1037323.9 6778301.8 200.6, 1037328 6778298.7 200.6))
-BATIMENT0000000234798818;POLYGON Z ((1037317 6778292.3 200.5, 1037319.2 6778295.4 200.5, 1037323.4 6778292.3 200.5, 1037321.2 6778289.2 200.5, 1037317 6778292.3 200.5))
-BATIMENT0000000234798822;POLYGON Z ((1037322.7 6778205.9 200.2, 1037320.4 6778207.6 200.2, 1037324 6778212.5 200.2, 1037325 6778211.7 200.2, 1037326.4 6778210.7 200.2, 1037322.7 6778205.9 200.2))
-BATIMENT0000000234798827;POLYGON Z ((1037337.2 6778209.5 199.1, 1037333.2 6778212.5 199.1, 1037334.8 6778214.7 199.1, 1037335.1 6778215.1 199.1, 1037339.1 6778212.2 199.1, 1037337.2 6778209.5 199.1))
-BATIMENT0000000234798835;POLYGON Z ((1037338.2 6778219.2 198.7, 1037333.3 6778222.8 198.7, 1037335.1 6778225.3 198.7, 1037340 6778221.7 198.7, 1037338.2 6778219.2 198.7))
-BATIMENT0000000234798840;POLYGON Z ((1037291.8 6778064.7 203.4, 1037295.7 6778061.8 203.4, 1037291 6778055.4 203.4, 1037287.1 6778058.3 203.4, 1037291.8 6778064.7 203.4))
-BATIMENT0000000234798842;POLYGON Z ((1037313.5 6778038.8 202.7, 1037303.6 6778046.1 202.7, 1037309.1 6778053.3 202.7, 1037318.9 6778045.9 202.7, 1037313.5 6778038.8 202.7))
-BATIMENT0000000234798845;POLYGON Z ((1037301.3 6778211.8 204.4, 1037309.8 6778223.1 204.4, 1037313.1 6778220.6 204.4, 1037313.9 6778220.1 204.4, 1037317.4 6778217.4 204.4, 1037318 6778216.9 204.4, 1037309.6 6778205.7 204.4, 1037301.3 6778211.8 204.4))
-BATIMENT0000000234798847;POLYGON Z ((1037486.8 6778545.9 199.8, 1037480 6778536.3 199.8, 1037473.9 6778540.8 199.8, 1037476.8 6778544.4 199.8, 1037486.8 6778545.9 199.8))
-BATIMENT0000000234798852;POLYGON Z ((1037171.9 6778241.9 198.6, 1037172.3 6778239.1 198.6, 1037172.7 6778236.3 198.6, 1037166.7 6778235.5 198.6, 1037166.3 6778238.3 198.6, 1037165.9 6778241.1 198.6, 1037171.9 6778241.9 198.6))
-BATIMENT0000000234798856;POLYGON Z ((1037280 6778127.2 198.8, 1037276.3 6778122.1 198.8, 1037272.1 6778125.1 198.8, 1037275.9 6778130.2 198.8, 1037280 6778127.2 198.8))
-BATIMENT0000000234798857;POLYGON Z ((1037255.5 6778124.8 199.1, 1037252.2 6778127.2 199.1, 1037252.9 6778128 199.1, 1037255.5 6778131.1 199.1, 1037262.9 6778125.5 199.1, 1037260 6778121.5 199.1, 1037255.5 6778124.8 199.1))
-BATIMENT0000000234798863;POLYGON Z ((1037326.7 6778246 199, 1037329.7 6778243.7 199, 1037325.4 6778238.1 199, 1037322.5 6778240.3 199, 1037326.7 6778246 199))
-BATIMENT0000000234798864;POLYGON Z ((1037703.5 6778253.2 198.7, 1037692.7 6778251.7 198.7, 1037692.3 6778254.6 198.7, 1037703.1 6778256.2 198.7, 1037703.5 6778253.2 198.7))
-BATIMENT0000000234798867;POLYGON Z ((1037156.7 6778335.9 199.3, 1037153.1 6778330.8 199.3, 1037152 6778331.6 199.3, 1037151.6 6778333.4 199.3, 1037150.9 6778332.4 199.3, 1037148.6 6778334.1 199.3, 1037150.9 6778337.1 199.3, 1037152.3 6778339.1 199.3, 1037154.5 6778337.5 199.3, 1037156.7 6778335.9 199.3))
-BATIMENT0000000234798870;POLYGON Z ((1037155.2 6778329.3 198.9, 1037153.1 6778330.8 198.9, 1037156.7 6778335.9 198.9, 1037158.8 6778334.4 198.9, 1037155.2 6778329.3 198.9))
-BATIMENT0000000234798871;POLYGON Z ((1037155 6778329.1 198.9, 1037155.2 6778329.3 198.9, 1037158.8 6778334.4 198.9, 1037160.9 6778332.9 198.9, 1037157.1 6778327.6 198.9, 1037155 6778329.1 198.9))
-BATIMENT0000000234798875;POLYGON Z ((1037294 6778346.6 199.3, 1037301.2 6778341.3 199.3, 1037298.9 6778338.2 199.3, 1037291.7 6778343.5 199.3, 1037294 6778346.6 199.3))
-BATIMENT0000000234798889;POLYGON Z ((1037449.8 6778472.2 203, 1037461.2 6778463.7 203, 1037464.3 6778467.3 203, 1037463 6778468.5 203, 1037464.4 6778470.1 203, 1037453.8 6778477.9 203, 1037453.4 6778477.1 202.3, 1037452.4 6778477.9 203, 1037450.5 6778479.3 203, 1037456.6 6778487.6 202.8, 1037479.3 6778470.8 203, 1037466 6778453.4 203, 1037459.2 6778458.6 203, 1037455.3 6778461.5 203, 1037447.2 6778467.6 203, 1037446.7 6778468 203, 1037449.8 6778472.2 203))
-BATIMENT0000000234798898;POLYGON Z ((1037278 6778252.1 201.2, 1037282.9 6778248.4 201.2, 1037291.4 6778241.9 201.2, 1037280 6778227 201.2, 1037266.7 6778236.8 201.2, 1037273.9 6778246.5 201.2, 1037278 6778252.1 201.2))
-BATIMENT0000000234798902;POLYGON Z ((1037598.6 6778355.3 201.6, 1037600.6 6778357.9 201.6, 1037601.7 6778359.5 201.6, 1037604.7 6778363.5 201.6, 1037609.9 6778359.6 201.6, 1037601.2 6778347.7 201.6, 1037600.8 6778348.1 201.6, 1037595.9 6778351.7 201.6, 1037596.5 6778352.5 201.6, 1037598.6 6778355.3 201.6))
-BATIMENT0000000234798906;POLYGON Z ((1037522.4 6778265 204.7, 1037521.7 6778264.1 204.7, 1037518.6 6778266.4 204.7, 1037513.4 6778270.2 204.7, 1037511.8 6778268.1 204.7, 1037509.4 6778264.8 204.7, 1037508.9 6778264.3 204.7, 1037508.4 6778264.6 204.7, 1037508.1 6778264.9 204.7, 1037508 6778265 204.7, 1037500.4 6778270.8 204.7, 1037508 6778281.1 204.7, 1037525 6778268.6 204.7, 1037522.4 6778265 204.7))
-BATIMENT0000000358876674;POLYGON Z ((1037406.9 6778011.9 200.4, 1037402.9 6778015 200.4, 1037402.3 6778014.2 200.4, 1037396 6778019.2 200.4, 1037406.5 6778033.1 200.4, 1037409.2 6778031.3 200.4, 1037413.3 6778028.2 200.4, 1037417.2 6778025.3 200.4, 1037406.9 6778011.9 200.4))
-BATIMENT0000000234798843;POLYGON Z ((1037323.6 6778225.5 204.4, 1037317.4 6778217.4 204.4, 1037313.9 6778220.1 204.4, 1037313.1 6778220.6 204.4, 1037309.8 6778223.1 204.4, 1037316 6778231.3 204.4, 1037318.8 6778229.1 204.4, 1037319.1 6778229.5 204.4, 1037321.1 6778228 204.4, 1037320.8 6778227.6 204.4, 1037323.6 6778225.5 204.4))
-BATIMENT0000000234797389;POLYGON Z ((1037389.7 6777989.9 210, 1037377.8 6777988.2 210, 1037375.5 6778002.4 210, 1037387.6 6778004.2 210, 1037389.7 6777989.9 210))
-BATIMENT0000000234797478;POLYGON Z ((1037411.2 6778424 198.4, 1037409.9 6778425 198.4, 1037410.3 6778425.7 198.4, 1037410.1 6778425.9 198.4, 1037410.8 6778426.8 198.4, 1037412.4 6778425.6 198.4, 1037411.2 6778424 198.4))
-BATIMENT0000000234797693;POLYGON Z ((1037248.8 6778455 200.6, 1037249.5 6778454.5 200.6, 1037249.7 6778454.4 200.6, 1037248.8 6778453.2 200.6, 1037246.6 6778450.2 200.6, 1037244.5 6778451.7 200.6, 1037247.5 6778456 200.6, 1037248.8 6778455 200.6))
-BATIMENT0000000234797745;POLYGON Z ((1037227.6 6778367 200.4, 1037225.3 6778368.7 200.4, 1037226.9 6778371 200.4, 1037227.1 6778370.8 200.4, 1037228.8 6778369.6 200.4, 1037229.3 6778369.2 200.4, 1037227.6 6778367 200.4))
-BATIMENT0000000234797746;POLYGON Z ((1037223.9 6778369.8 198.9, 1037225.4 6778372 198.9, 1037226.9 6778371 198.9, 1037225.3 6778368.7 198.9, 1037223.9 6778369.8 198.9))
-BATIMENT0000000234797759;POLYGON Z ((1037214.5 6778408.3 201.2, 1037216.9 6778411.6 201.2, 1037219.5 6778409.7 201.2, 1037217.1 6778406.5 201.2, 1037214.5 6778408.3 201.2))
-BATIMENT0000000234797762;POLYGON Z ((1037210.6 6778403.4 200, 1037212 6778402.4 200, 1037209.3 6778399 200, 1037207.9 6778400 200, 1037210.6 6778403.4 200))
-BATIMENT0000000234797809;POLYGON Z ((1037221.5 6778476.8 202.6, 1037219.2 6778478.4 202.6, 1037221.6 6778481.7 202.6, 1037223.9 6778480.1 202.6, 1037224.9 6778479.3 202.6, 1037222.6 6778476 202.6, 1037221.5 6778476.8 202.6))
-BATIMENT0000000234797865;POLYGON Z ((1037169.5 6778406.9 202.2, 1037167.2 6778408.5 202.2, 1037169.5 6778411.6 202.2, 1037171.8 6778409.9 202.2, 1037172.9 6778409.1 202.2, 1037170.7 6778406.1 202.2, 1037169.5 6778406.9 202.2))
-BATIMENT0000000234797868;POLYGON Z ((1037172.9 6778409.1 204.4, 1037171.8 6778409.9 204.4, 1037183 6778425.2 204.4, 1037184.2 6778424.3 204.4, 1037172.9 6778409.1 204.4))
-BATIMENT0000000234797870;POLYGON Z ((1037298.4 6778470.2 203.2, 1037299.9 6778469.1 203.2, 1037299.6 6778468.6 203.2, 1037298 6778469.8 203.2, 1037298.4 6778470.2 203.2))
-BATIMENT0000000234798181;POLYGON Z ((1037370.7 6778360.8 198.6, 1037367.4 6778356.6 198.6, 1037364.9 6778358.5 198.6, 1037368.1 6778362.8 198.6, 1037370.7 6778360.8 198.6))
-BATIMENT0000000234798547;POLYGON Z ((1037317.9 6778314.7 199.4, 1037314.9 6778310.5 199.4, 1037312.1 6778312.5 199.4, 1037315.1 6778316.5 199.4, 1037315.2 6778316.7 199.4, 1037317.9 6778314.7 199.4))
-BATIMENT0000000234798548;POLYGON Z ((1037324.7 6778316.2 199.5, 1037323.7 6778314.8 199.5, 1037321.5 6778312 199.5, 1037321.3 6778312.1 199.5, 1037321.1 6778312.3 199.5, 1037319.1 6778313.8 199.5, 1037322.3 6778318 199.5, 1037324.7 6778316.2 199.5))
-BATIMENT0000000234798633;POLYGON Z ((1037224.9 6778312.6 199, 1037225.2 6778310.8 199, 1037225.4 6778309.4 199, 1037221.6 6778312.2 199, 1037224.9 6778312.6 199))
-BATIMENT0000000234798698;POLYGON Z ((1037192.3 6778273 200.4, 1037192.5 6778272.8 200.4, 1037195.5 6778270.5 200.4, 1037191 6778264.5 200.4, 1037190.6 6778263.9 200.4, 1037187.1 6778266.4 200.4, 1037192.3 6778273 200.4))
-BATIMENT0000000234798699;POLYGON Z ((1037187.5 6778238.4 201.1, 1037185.8 6778235.9 201.1, 1037183.1 6778237.7 201.1, 1037184.9 6778240.2 201.1, 1037186 6778239.5 201.1, 1037187.5 6778238.4 201.1))
-BATIMENT0000000234798701;POLYGON Z ((1037195.5 6778270.5 200.6, 1037192.5 6778272.8 200.6, 1037195.8 6778277.2 200.6, 1037198.8 6778275 200.6, 1037195.5 6778270.5 200.6))
-BATIMENT0000000234798714;POLYGON Z ((1037337.5 6778315.8 199.6, 1037343.9 6778311.5 199.6, 1037341.5 6778308.5 199.6, 1037335.3 6778313.3 199.6, 1037337.3 6778316 199.6, 1037337.5 6778315.8 199.6))
-BATIMENT0000000234798872;POLYGON Z ((1037159.3 6778326.1 198.8, 1037157.1 6778327.6 198.8, 1037160.9 6778332.9 198.8, 1037163.1 6778331.3 198.8, 1037159.3 6778326.1 198.8))
-BATIMENT0000000234798874;POLYGON Z ((1037298 6778404.1 197.6, 1037294.8 6778399.7 197.6, 1037291.7 6778402 197.6, 1037294.9 6778406.4 197.6, 1037298 6778404.1 197.6))
-BATIMENT0000000234798877;POLYGON Z ((1037431.3 6778530 201.4, 1037434.9 6778527.5 201.4, 1037432.5 6778524.3 201.4, 1037429 6778526.9 201.4, 1037431.3 6778530 201.4))
-BATIMENT0000000234797888;POLYGON Z ((1037384.8 6778163.8 200, 1037386.6 6778166.3 200, 1037389.1 6778164.4 200, 1037387.2 6778161.8 200, 1037384.8 6778163.8 200))
-BATIMENT0000000234798803;POLYGON Z ((1037328.2 6778010.3 203.3, 1037325 6778005.9 203.3, 1037321.4 6778008.5 203.3, 1037324.6 6778012.9 203.3, 1037328.2 6778010.3 203.3))
-BATIMENT0000000234798251;POLYGON Z ((1037404.8 6778101.9 199.2, 1037407.2 6778104.9 199.2, 1037409.7 6778103.1 199.2, 1037409.1 6778102.2 199.2, 1037407.8 6778100.6 199.2, 1037407.3 6778100 199.2, 1037404.8 6778101.9 199.2))
-BATIMENT0000000234798260;POLYGON Z ((1037420.4 6778094.1 201.8, 1037419.1 6778092.4 201.8, 1037418.3 6778092.9 201.8, 1037420.3 6778095.6 201.8, 1037421.1 6778095 201.8, 1037420.4 6778094.1 201.8))
-BATIMENT0000000234798252;POLYGON Z ((1037403.6 6778100.3 199.1, 1037404.8 6778101.9 199.1, 1037407.3 6778100 199.1, 1037406.1 6778098.4 199.1, 1037403.6 6778100.3 199.1))
-BATIMENT0000000234798375;POLYGON Z ((1037412.7 6778126.8 201.6, 1037417.3 6778132.9 201.6, 1037421.4 6778138.3 201.6, 1037421.7 6778138 201.6, 1037417.6 6778132.7 201.6, 1037413 6778126.6 201.6, 1037412.7 6778126.8 201.6))
-BATIMENT0000000234798489;POLYGON Z ((1037346.1 6778106.4 201.8, 1037343.5 6778108.4 201.8, 1037344.1 6778109.2 201.8, 1037346.7 6778107.3 201.8, 1037346.1 6778106.4 201.8))
-BATIMENT0000000234798494;POLYGON Z ((1037367 6778129.7 202.2, 1037370 6778133.6 202.2, 1037372.4 6778131.8 202.2, 1037369.5 6778127.9 202.2, 1037367 6778129.7 202.2))
-BATIMENT0000000234798503;POLYGON Z ((1037364.3 6778131.7 198.7, 1037362.1 6778133.5 198.7, 1037365 6778137.3 198.7, 1037367.2 6778135.6 198.7, 1037364.3 6778131.7 198.7))
-BATIMENT0000000234798504;POLYGON Z ((1037361.7 6778137.7 198.8, 1037362.7 6778139 198.8, 1037365 6778137.3 198.8, 1037362.1 6778133.5 198.8, 1037360.8 6778134.4 198.8, 1037359.7 6778135.2 198.8, 1037361.7 6778137.7 198.8))
-BATIMENT0000000234798530;POLYGON Z ((1037154.6 6778189.2 207.5, 1037155 6778186.2 207.5, 1037153.7 6778186 207.5, 1037153.2 6778189 207.5, 1037154.6 6778189.2 207.5))
-BATIMENT0000000234798531;POLYGON Z ((1037154.6 6778189.2 207.8, 1037153.2 6778189 207.8, 1037152.8 6778192 207.8, 1037154.2 6778192.2 207.8, 1037154.6 6778189.2 207.8))
-BATIMENT0000000234798532;POLYGON Z ((1037157.5 6778169.7 207.8, 1037157.9 6778166.6 207.8, 1037156.6 6778166.4 207.8, 1037156.1 6778169.5 207.8, 1037157.5 6778169.7 207.8))
-BATIMENT0000000234798558;POLYGON Z ((1037207.4 6778116.5 198.6, 1037202.9 6778119.8 198.6, 1037204.5 6778121.9 198.6, 1037208.9 6778118.6 198.6, 1037207.4 6778116.5 198.6))
-BATIMENT0000000234798570;POLYGON Z ((1037214 6778143.9 203.6, 1037212.2 6778145.3 203.6, 1037214.9 6778149 203.6, 1037216.8 6778147.7 203.6, 1037214 6778143.9 203.6))
-BATIMENT0000000234798574;POLYGON Z ((1037222.7 6778144.9 203.4, 1037224.3 6778143.7 203.4, 1037223.6 6778142.7 203.4, 1037221.9 6778143.9 203.4, 1037222.7 6778144.9 203.4))
-BATIMENT0000000234798576;POLYGON Z ((1037195.5 6778148.7 199.4, 1037196.7 6778150.5 199.4, 1037197.3 6778150.1 199.4, 1037198.4 6778149.3 199.4, 1037197 6778147.5 199.4, 1037195.5 6778148.7 199.4))
-BATIMENT0000000234798581;POLYGON Z ((1037191.7 6778151.4 199.4, 1037193 6778153.2 199.4, 1037196.7 6778150.5 199.4, 1037195.5 6778148.7 199.4, 1037191.7 6778151.4 199.4))
-BATIMENT0000000234798585;POLYGON Z ((1037196.7 6778150.5 198.8, 1037193 6778153.2 198.8, 1037192.5 6778153.5 198.8, 1037193.5 6778154.8 198.8, 1037198.3 6778151.4 198.8, 1037197.3 6778150.1 198.8, 1037196.7 6778150.5 198.8))
-BATIMENT0000000234798597;POLYGON Z ((1037219 6778152.5 199.2, 1037220.9 6778151 199.2, 1037221.3 6778150.7 199.2, 1037220.5 6778149.7 199.2, 1037213.8 6778154.7 199.2, 1037214.6 6778155.8 199.2, 1037219 6778152.5 199.2))
-BATIMENT0000000234798641;POLYGON Z ((1037302.9 6778095.3 201.6, 1037306.3 6778099.9 201.6, 1037307.2 6778099.2 201.6, 1037303.9 6778094.6 201.6, 1037302.9 6778095.3 201.6))
-BATIMENT0000000234798645;POLYGON Z ((1037307.5 6778104.1 199.8, 1037308.4 6778103.3 199.8, 1037310.5 6778101.7 199.8, 1037310.1 6778101.3 199.8, 1037310 6778101.4 199.8, 1037307.9 6778098.7 199.8, 1037307.2 6778099.2 199.8, 1037306.3 6778099.9 199.8, 1037305 6778100.9 199.8, 1037307.5 6778104.1 199.8))
-BATIMENT0000000234798692;POLYGON Z ((1037282 6778118.6 199.6, 1037283.8 6778121 199.6, 1037287 6778118.6 199.6, 1037285.2 6778116.3 199.6, 1037282 6778118.6 199.6))
-BATIMENT0000000234798693;POLYGON Z ((1037280.4 6778119.8 198.8, 1037282.1 6778122.2 198.8, 1037283.8 6778121 198.8, 1037282 6778118.6 198.8, 1037280.4 6778119.8 198.8))
-BATIMENT0000000234798755;POLYGON Z ((1037202.1 6778092.6 203.4, 1037204.5 6778095.9 203.4, 1037206.9 6778094.2 203.4, 1037209.9 6778091.9 203.4, 1037207.5 6778088.6 203.4, 1037202.1 6778092.6 203.4))
-BATIMENT0000000234798765;POLYGON Z ((1037262 6778141.4 201.6, 1037259.8 6778138.4 201.6, 1037258.2 6778139.5 201.6, 1037260.4 6778142.6 201.6, 1037262 6778141.4 201.6))
-BATIMENT0000000234798781;POLYGON Z ((1037304.6 6778081.6 199.3, 1037308.8 6778078.5 199.3, 1037306.3 6778075.1 199.3, 1037302 6778078.2 199.3, 1037304.6 6778081.6 199.3))
-BATIMENT0000000234798796;POLYGON Z ((1037299.7 6778022.8 208.2, 1037296.7 6778025.1 208.2, 1037297.5 6778026.2 208.2, 1037300.5 6778024 208.2, 1037299.7 6778022.8 208.2))
-BATIMENT0000000234798808;POLYGON Z ((1037229.3 6778031.5 207.2, 1037232.7 6778028.9 207.2, 1037239.3 6778023.7 207.2, 1037241.8 6778021.8 207.2, 1037240.9 6778020.6 207.2, 1037240.3 6778019.8 207.2, 1037238.1 6778021.5 207.2, 1037237.5 6778020.8 207.2, 1037235.5 6778022.6 207.2, 1037235.7 6778023.3 207.2, 1037231.7 6778026.3 207.2, 1037231.2 6778025.7 207.2, 1037229.2 6778027.2 207.2, 1037229.8 6778028.1 207.2, 1037228.3 6778029 207.2, 1037229 6778029.8 207.2, 1037228.4 6778030.3 207.2, 1037229.3 6778031.5 207.2))
-BATIMENT0000000234798850;POLYGON Z ((1037167.1 6778232.8 198.4, 1037166.7 6778235.5 198.4, 1037172.7 6778236.3 198.4, 1037173.1 6778233.7 198.4, 1037167.1 6778232.8 198.4))
-BATIMENT0000000234798851;POLYGON Z ((1037167.1 6778232.8 198.4, 1037173.1 6778233.7 198.4, 1037173.3 6778232.2 198.4, 1037172.1 6778230.4 198.4, 1037167.5 6778230.1 198.4, 1037167.1 6778232.8 198.4))
-BATIMENT0000000234797691;POLYGON Z ((1037237.8 6778450.6 201.2, 1037239.6 6778449.3 201.2, 1037239.1 6778448.6 201.2, 1037239.3 6778448.4 201.2, 1037237.1 6778447.3 201.2, 1037236 6778448.1 201.2, 1037237.8 6778450.6 201.2))
-BATIMENT0000000234797694;POLYGON Z ((1037232 6778452.3 200.6, 1037233.2 6778453.9 200.6, 1037237.8 6778450.6 200.6, 1037236 6778448.1 200.6, 1037231.4 6778451.5 200.6, 1037232 6778452.3 200.6))
-BATIMENT0000000234797697;POLYGON Z ((1037249.7 6778454.4 201.4, 1037250.5 6778453.8 201.4, 1037249.7 6778452.6 201.4, 1037248.8 6778453.2 201.4, 1037249.7 6778454.4 201.4))
-BATIMENT0000000234797751;POLYGON Z ((1037226 6778407.8 200.2, 1037218.3 6778413.5 200.2, 1037221.8 6778418.3 200.2, 1037221.8 6778418.6 200.2, 1037229.6 6778412.7 200.2, 1037226 6778407.8 200.2))
-BATIMENT0000000234797859;POLYGON Z ((1037283.8 6778529.4 207.8, 1037281.7 6778529.1 207.8, 1037280.8 6778535.7 207.8, 1037282.8 6778536 207.8, 1037283.8 6778529.4 207.8))
-BATIMENT0000000234797872;POLYGON Z ((1037313.5 6778458.3 203.6, 1037313.9 6778458.8 203.6, 1037315.6 6778457.5 203.6, 1037315.2 6778457.1 203.6, 1037313.5 6778458.3 203.6))
-BATIMENT0000000234798616;POLYGON Z ((1037281.3 6778278.2 202.2, 1037279.8 6778276.1 202.2, 1037275.7 6778279.2 202.2, 1037277.2 6778281.3 202.2, 1037281.3 6778278.2 202.2))
-BATIMENT0000000234798635;POLYGON Z ((1037225 6778308.8 200.2, 1037225.4 6778309.4 200.2, 1037225.2 6778310.8 200.2, 1037235.4 6778303.2 200.2, 1037234.3 6778301.8 200.2, 1037225 6778308.8 200.2))
-BATIMENT0000000234798649;POLYGON Z ((1037287.3 6778321.4 199.3, 1037283 6778324.6 199.3, 1037284.6 6778326.7 199.3, 1037289 6778323.5 199.3, 1037287.3 6778321.4 199.3))
-BATIMENT0000000234798853;POLYGON Z ((1037163.6 6778323 204.6, 1037161.4 6778324.5 204.6, 1037165.2 6778329.8 204.6, 1037167.4 6778328.1 204.6, 1037163.6 6778323 204.6))
-BATIMENT0000000234798865;POLYGON Z ((1037161.4 6778324.5 199.4, 1037159.3 6778326.1 199.4, 1037163.1 6778331.3 199.4, 1037165.2 6778329.8 199.4, 1037161.4 6778324.5 199.4))
-BATIMENT0000000234797885;POLYGON Z ((1037386.2 6778160.5 203.2, 1037387.9 6778159.1 203.2, 1037387.2 6778158.1 203.2, 1037387.1 6778157.9 203.2, 1037385.3 6778159.3 203.2, 1037386.2 6778160.5 203.2))
-BATIMENT0000000234798214;POLYGON Z ((1037369.6 6778055.4 200.2, 1037373.3 6778052.6 200.2, 1037372.2 6778051.1 200.2, 1037368.5 6778053.9 200.2, 1037369.6 6778055.4 200.2))
-BATIMENT0000000234798216;POLYGON Z ((1037385.2 6778026.3 203.6, 1037386.1 6778027.7 203.6, 1037387.7 6778026.5 203.6, 1037386.7 6778025.2 203.6, 1037385.2 6778026.3 203.6))
-BATIMENT0000000234798223;POLYGON Z ((1037362.4 6778009.8 198.4, 1037358 6778009.1 198.4, 1037361.7 6778014.2 198.4, 1037362.4 6778009.8 198.4))
-BATIMENT0000000234798234;POLYGON Z ((1037405.8 6778066.4 201.6, 1037402.4 6778062 201.6, 1037399 6778064.5 201.6, 1037399.9 6778065.7 201.6, 1037402.2 6778064 201.6, 1037409 6778072.8 201.6, 1037410.1 6778072 201.6, 1037405.8 6778066.4 201.6))
-BATIMENT0000000234798518;POLYGON Z ((1037348.7 6778152.3 200, 1037347 6778150.2 200, 1037345.9 6778151 200, 1037347.6 6778153.2 200, 1037348.7 6778152.3 200))
-BATIMENT0000000234798525;POLYGON Z ((1037159.4 6778146.9 207, 1037158.9 6778150 207, 1037160.4 6778150.2 207, 1037160.8 6778147.2 207, 1037159.4 6778146.9 207))
-BATIMENT0000000234798528;POLYGON Z ((1037153.9 6778194 201.9, 1037149.3 6778193.3 201.9, 1037148.5 6778198.6 201.9, 1037149.1 6778198.7 201.9, 1037149 6778199.3 201.9, 1037153 6778200 201.9, 1037153.9 6778194 201.9))
-BATIMENT0000000234798533;POLYGON Z ((1037157.5 6778169.7 208.1, 1037156.1 6778169.5 208.1, 1037155.7 6778172.5 208.1, 1037157 6778172.7 208.1, 1037157.5 6778169.7 208.1))
-BATIMENT0000000234798559;POLYGON Z ((1037210.5 6778120.7 198.9, 1037208.9 6778118.6 198.9, 1037204.5 6778121.9 198.9, 1037206 6778124.1 198.9, 1037210.5 6778120.7 198.9))
-BATIMENT0000000234798561;POLYGON Z ((1037209.1 6778128.2 199.1, 1037213.6 6778124.9 199.1, 1037212 6778122.8 199.1, 1037207.5 6778126.1 199.1, 1037209.1 6778128.2 199.1))
-BATIMENT0000000234798564;POLYGON Z ((1037212 6778122.8 199, 1037210.5 6778120.7 199, 1037206 6778124.1 199, 1037207.5 6778126.1 199, 1037212 6778122.8 199))
-BATIMENT0000000234798569;POLYGON Z ((1037207.7 6778140.9 199.2, 1037206.7 6778139.4 199.2, 1037203.8 6778141.4 199.2, 1037201.9 6778142.8 199.2, 1037202.8 6778144.1 199.2, 1037203.8 6778145.5 199.2, 1037208.7 6778142.1 199.2, 1037207.7 6778140.9 199.2))
-BATIMENT0000000234798575;POLYGON Z ((1037199.9 6778172.6 199.2, 1037201.4 6778171.4 199.2, 1037197.3 6778165.9 199.2, 1037195.9 6778166.9 199.2, 1037199.9 6778172.6 199.2))
-BATIMENT0000000234798579;POLYGON Z ((1037221.3 6778146 202.6, 1037222.7 6778144.9 202.6, 1037221.9 6778143.9 202.6, 1037220.6 6778144.9 202.6, 1037221.3 6778146 202.6))
-BATIMENT0000000234798734;POLYGON Z ((1037143.7 6778137.7 201, 1037147.2 6778138.2 201, 1037147.6 6778135.3 201, 1037144 6778134.8 201, 1037143.7 6778137.7 201))
-BATIMENT0000000234798582;POLYGON Z ((1037191 6778156.6 199.2, 1037193.5 6778154.8 199.2, 1037192.5 6778153.5 199.2, 1037192 6778153.8 199.2, 1037191.7 6778154 199.2, 1037190.8 6778154.7 199.2, 1037190 6778155.3 199.2, 1037191 6778156.6 199.2))
-BATIMENT0000000234798586;POLYGON Z ((1037191.7 6778154 199.7, 1037192 6778153.8 199.7, 1037192.5 6778153.5 199.7, 1037193 6778153.2 199.7, 1037191.7 6778151.4 199.7, 1037189.5 6778153 199.7, 1037190.7 6778154.6 199.7, 1037190.8 6778154.7 199.7, 1037191.7 6778154 199.7))
-BATIMENT0000000234798589;POLYGON Z ((1037201.4 6778171.4 199.8, 1037202.3 6778172.5 199.8, 1037202.7 6778172.2 199.8, 1037204.7 6778170.6 199.8, 1037199.7 6778164 199.8, 1037197.3 6778165.9 199.8, 1037201.4 6778171.4 199.8))
-BATIMENT0000000234798592;POLYGON Z ((1037223.8 6778148.8 201.2, 1037221.3 6778150.7 201.2, 1037220.9 6778151 201.2, 1037222 6778152.6 201.2, 1037226.1 6778158.6 201.2, 1037229.2 6778156.4 201.2, 1037224.4 6778149.6 201.2, 1037223.8 6778148.8 201.2))
-BATIMENT0000000234798593;POLYGON Z ((1037220.5 6778164.1 199.3, 1037219.9 6778163.2 199.3, 1037219.4 6778163.6 199.3, 1037220 6778164.4 199.3, 1037220.5 6778164.1 199.3))
-BATIMENT0000000234798594;POLYGON Z ((1037220 6778154 199.2, 1037222 6778152.6 199.2, 1037220.9 6778151 199.2, 1037219 6778152.5 199.2, 1037220 6778154 199.2))
-BATIMENT0000000234798805;POLYGON Z ((1037282.2 6778037.8 208, 1037281.3 6778036.7 208, 1037278.3 6778038.9 208, 1037279.1 6778040 208, 1037282.2 6778037.8 208))
-BATIMENT0000000234798601;POLYGON Z ((1037202.7 6778172.2 201.6, 1037204.2 6778174.1 201.6, 1037206.2 6778172.5 201.6, 1037205.1 6778171.1 201.6, 1037204.7 6778170.6 201.6, 1037202.7 6778172.2 201.6))
-BATIMENT0000000234798647;POLYGON Z ((1037309.2 6778104.5 200.6, 1037308.4 6778103.3 200.6, 1037307.5 6778104.1 200.6, 1037308.3 6778105.2 200.6, 1037309.2 6778104.5 200.6))
-BATIMENT0000000234798787;POLYGON Z ((1037317.8 6778086.2 199.2, 1037321.4 6778083.5 199.2, 1037319.4 6778080.9 199.2, 1037317.9 6778082 199.2, 1037315.8 6778083.6 199.2, 1037317.2 6778085.4 199.2, 1037317.8 6778086.2 199.2))
-BATIMENT0000000234798801;POLYGON Z ((1037315.1 6778011.2 208, 1037312 6778013.6 208, 1037312.8 6778014.7 208, 1037316 6778012.4 208, 1037315.1 6778011.2 208))
-BATIMENT0000000234798802;POLYGON Z ((1037312.8 6778014.7 208.2, 1037312 6778013.6 208.2, 1037309 6778015.9 208.2, 1037309.8 6778017 208.2, 1037312.8 6778014.7 208.2))
-BATIMENT0000000234798804;POLYGON Z ((1037284.4 6778034.3 208.6, 1037281.3 6778036.7 208.6, 1037282.2 6778037.8 208.6, 1037285.2 6778035.5 208.6, 1037284.4 6778034.3 208.6))
-BATIMENT0000000234798815;POLYGON Z ((1037243 6778171.2 202.4, 1037240 6778173.5 202.4, 1037245.4 6778180.6 202.4, 1037248.3 6778178.5 202.4, 1037243 6778171.2 202.4))
-BATIMENT0000000234798860;POLYGON Z ((1037194.5 6778226.4 198.5, 1037191.8 6778228.5 198.5, 1037194.4 6778232.1 198.5, 1037197.2 6778230.1 198.5, 1037194.6 6778226.6 198.5, 1037194.5 6778226.4 198.5))
-BATIMENT0000000234798862;POLYGON Z ((1037303.6 6778193.8 199.2, 1037302.1 6778191.8 199.2, 1037299 6778194.1 199.2, 1037300.6 6778196.1 199.2, 1037303.6 6778193.8 199.2))
-BATIMENT0000000234797914;POLYGON Z ((1037606.7 6778257.1 205.1, 1037605.4 6778258.1 205.1, 1037609.4 6778263.3 205.1, 1037610.6 6778262.4 205.1, 1037606.7 6778257.1 205.1))
-BATIMENT0000000234797915;POLYGON Z ((1037604 6778275 201.7, 1037605.1 6778274.3 201.7, 1037604 6778272.9 201.7, 1037603 6778273.7 201.7, 1037604 6778275 201.7))
-BATIMENT0000000234797916;POLYGON Z ((1037612.3 6778280.7 202.3, 1037609.6 6778282.7 202.3, 1037608.6 6778281.4 202.3, 1037607.3 6778282.4 202.3, 1037611.7 6778288.3 202.3, 1037615.6 6778285.4 202.3, 1037612.3 6778280.7 202.3))
-BATIMENT0000000234797921;POLYGON Z ((1037628.4 6778256.6 198.2, 1037626.8 6778254.3 198.2, 1037623.8 6778256.7 198.2, 1037625.4 6778258.9 198.2, 1037628.4 6778256.6 198.2))
-BATIMENT0000000234797926;POLYGON Z ((1037630.7 6778259.9 199.6, 1037632 6778259 199.6, 1037633 6778258.2 199.6, 1037630.6 6778254.8 199.6, 1037629.6 6778255.6 199.6, 1037628.4 6778256.6 199.6, 1037625.4 6778258.9 199.6, 1037627.8 6778262 199.6, 1037630.7 6778259.9 199.6))
-BATIMENT0000000234798009;POLYGON Z ((1037684.4 6778218.9 200, 1037681.2 6778214.5 200, 1037677.9 6778217 200, 1037678.5 6778217.9 200, 1037681.1 6778221.3 200, 1037684.4 6778218.9 200))
-BATIMENT0000000234798010;POLYGON Z ((1037684.6 6778219.1 200.1, 1037684.9 6778218.9 200.1, 1037681.5 6778214.3 200.1, 1037681.2 6778214.5 200.1, 1037684.4 6778218.9 200.1, 1037684.6 6778219.1 200.1))
-BATIMENT0000000234798011;POLYGON Z ((1037681.5 6778214.3 200.2, 1037684.9 6778218.9 200.2, 1037688.6 6778216.1 200.2, 1037684.2 6778210.1 200.2, 1037684 6778209.8 200.2, 1037682.8 6778210.7 200.2, 1037680.9 6778212.1 200.2, 1037680 6778212.8 200.2, 1037681.2 6778214.5 200.2, 1037681.5 6778214.3 200.2))
-BATIMENT0000000234798024;POLYGON Z ((1037484.1 6778175.5 198.8, 1037481 6778177.8 198.8, 1037483.1 6778180.6 198.8, 1037483.8 6778181.5 198.8, 1037487 6778179.2 198.8, 1037488.5 6778178.2 198.8, 1037485.7 6778174.3 198.8, 1037484.1 6778175.5 198.8))
-BATIMENT0000000234798055;POLYGON Z ((1037555 6778210.8 199.6, 1037553 6778208.1 199.6, 1037549.4 6778210.8 199.6, 1037551.3 6778213.5 199.6, 1037555 6778210.8 199.6))
-BATIMENT0000000234798056;POLYGON Z ((1037574.2 6778196.4 198.8, 1037575 6778197.5 198.8, 1037576.1 6778198.9 198.8, 1037577.6 6778197.8 198.8, 1037580.3 6778195.8 198.8, 1037577.2 6778191.6 198.8, 1037573 6778194.7 198.8, 1037574.2 6778196.4 198.8))
-BATIMENT0000000234798060;POLYGON Z ((1037572.3 6778222.3 199.6, 1037571.1 6778220.8 199.6, 1037570.6 6778220.1 199.6, 1037566.6 6778223.2 199.6, 1037568.2 6778225.4 199.6, 1037572.3 6778222.3 199.6))
-BATIMENT0000000234798067;POLYGON Z ((1037566.6 6778223.2 199.6, 1037570.6 6778220.1 199.6, 1037568.9 6778217.8 199.6, 1037564.7 6778220.9 199.6, 1037566.6 6778223.2 199.6))
-BATIMENT0000000234798878;POLYGON Z ((1037583.3 6778347.1 199.1, 1037581.3 6778344.4 199.1, 1037578.7 6778346.3 199.1, 1037580.7 6778349 199.1, 1037583.3 6778347.1 199.1))
-BATIMENT0000000234798118;POLYGON Z ((1037646.8 6778317.7 199.4, 1037643.3 6778320.3 199.4, 1037644.7 6778322.2 199.4, 1037646.6 6778320.8 199.4, 1037648.2 6778319.6 199.4, 1037646.8 6778317.7 199.4))
-BATIMENT0000000234798121;POLYGON Z ((1037643.1 6778323.4 199.8, 1037644.7 6778322.2 199.8, 1037643.3 6778320.3 199.8, 1037639 6778323.5 199.8, 1037640.4 6778325.4 199.8, 1037643.1 6778323.4 199.8))
-BATIMENT0000000234798125;POLYGON Z ((1037662.2 6778331.4 198.4, 1037661.1 6778329.9 198.4, 1037659.1 6778331.4 198.4, 1037660.2 6778332.9 198.4, 1037662.2 6778331.4 198.4))
-BATIMENT0000000234798456;POLYGON Z ((1037511.8 6778264.7 206.5, 1037512.2 6778262.4 206.5, 1037511.9 6778262 206.5, 1037510.6 6778263 206.5, 1037511.8 6778264.7 206.5))
-BATIMENT0000000234798879;POLYGON Z ((1037580.2 6778349.4 199.6, 1037580.7 6778349 199.6, 1037578.7 6778346.3 199.6, 1037576 6778348.3 199.6, 1037578 6778351 199.6, 1037580.2 6778349.4 199.6))
-BATIMENT0000000234798269;POLYGON Z ((1037418.6 6778082 200.4, 1037417.5 6778082.8 200.4, 1037415.2 6778084.5 200.4, 1037416.3 6778086 200.4, 1037417.8 6778084.9 200.4, 1037418.8 6778084.2 200.4, 1037419.7 6778083.5 200.4, 1037418.6 6778082 200.4))
-BATIMENT0000000234798273;POLYGON Z ((1037416.3 6778086 199.8, 1037415.2 6778084.5 199.8, 1037413.8 6778085.6 199.8, 1037414.9 6778087 199.8, 1037416.3 6778086 199.8))
-BATIMENT0000000234798280;POLYGON Z ((1037427 6778097.4 202.5, 1037423 6778092.2 202.5, 1037420.4 6778094.1 202.5, 1037421.1 6778095 202.5, 1037422.4 6778096.7 202.5, 1037424.4 6778099.3 202.5, 1037427 6778097.4 202.5))
-BATIMENT0000000234797472;POLYGON Z ((1037620 6778350.4 200.2, 1037619 6778351.2 200.2, 1037622.4 6778355.8 200.2, 1037623.4 6778355 200.2, 1037620 6778350.4 200.2))
-BATIMENT0000000234797475;POLYGON Z ((1037400.4 6778380.5 198.8, 1037398.2 6778382.3 198.8, 1037402.4 6778388 198.8, 1037404.7 6778386.3 198.8, 1037400.4 6778380.5 198.8))
-BATIMENT0000000234797494;POLYGON Z ((1037415 6778409.1 198.3, 1037416.4 6778410.9 198.3, 1037417.3 6778412.2 198.3, 1037419.5 6778410.5 198.3, 1037417.4 6778407.4 198.3, 1037415 6778409.1 198.3))
-BATIMENT0000000234797513;POLYGON Z ((1037465.5 6778519.8 197.4, 1037470.2 6778516.2 197.4, 1037467.3 6778512.2 197.4, 1037462.5 6778515.8 197.4, 1037464.1 6778518 197.4, 1037465.5 6778519.8 197.4))
-BATIMENT0000000234797538;POLYGON Z ((1037477.5 6778519.8 198.4, 1037479.9 6778523 198.4, 1037482.5 6778521 198.4, 1037480.2 6778517.9 198.4, 1037477.5 6778519.8 198.4))
-BATIMENT0000000234797551;POLYGON Z ((1037498.1 6778412.5 200, 1037496.7 6778413.5 200, 1037494.5 6778415.1 200, 1037492.6 6778416.5 200, 1037490.1 6778418.3 200, 1037492.7 6778421.8 200, 1037501.7 6778415 200, 1037499.2 6778411.6 200, 1037498.1 6778412.5 200))
-BATIMENT0000000234797555;POLYGON Z ((1037496.7 6778413.5 202, 1037498.1 6778412.5 202, 1037496.3 6778410 202, 1037492.8 6778412.7 202, 1037494.5 6778415.1 202, 1037496.7 6778413.5 202))
-BATIMENT0000000234797596;POLYGON Z ((1037435.8 6778445.6 201.4, 1037439.5 6778450.5 201.4, 1037447.2 6778444.9 201.4, 1037444.4 6778441 201.4, 1037443.5 6778441.6 201.4, 1037442.6 6778440.5 201.4, 1037441.4 6778441.4 201.4, 1037435.8 6778445.6 201.4))
-BATIMENT0000000234797649;POLYGON Z ((1037535.5 6778460.1 203, 1037534.4 6778460.9 203, 1037541.8 6778471 203, 1037542.9 6778470.2 203, 1037535.5 6778460.1 203))
-BATIMENT0000000234797617;POLYGON Z ((1037438.1 6778474.5 198.8, 1037438.8 6778475.4 198.8, 1037441.5 6778473.5 198.8, 1037440.8 6778472.5 198.8, 1037438.1 6778474.5 198.8))
-BATIMENT0000000234797631;POLYGON Z ((1037527.7 6778490.4 200.8, 1037525.4 6778492.1 200.8, 1037529 6778496.9 200.8, 1037532.5 6778494.2 200.8, 1037528.8 6778489.5 200.8, 1037527.7 6778490.4 200.8))
-BATIMENT0000000234797663;POLYGON Z ((1037603.8 6778342.1 199.5, 1037606.4 6778340.2 199.5, 1037603.8 6778336.8 199.5, 1037601.2 6778338.7 199.5, 1037603.6 6778341.9 199.5, 1037603.8 6778342.1 199.5))
-BATIMENT0000000234797655;POLYGON Z ((1037535.5 6778460.1 202.5, 1037536.1 6778459.6 202.5, 1037535.5 6778458.7 202.5, 1037534.9 6778458 202.5, 1037533.1 6778459.2 202.5, 1037534.4 6778460.9 202.5, 1037535.5 6778460.1 202.5))
-BATIMENT0000000234797662;POLYGON Z ((1037607.1 6778346.6 199.5, 1037609.7 6778344.7 199.5, 1037606.4 6778340.2 199.5, 1037603.8 6778342.1 199.5, 1037607.1 6778346.6 199.5))
-BATIMENT0000000234797665;POLYGON Z ((1037603.8 6778336.8 199.5, 1037601.3 6778333.4 199.5, 1037598.7 6778335.3 199.5, 1037601.2 6778338.7 199.5, 1037603.8 6778336.8 199.5))
-BATIMENT0000000234797678;POLYGON Z ((1037589.2 6778342.9 200.2, 1037589.3 6778342.8 200.2, 1037587.5 6778340.4 200.2, 1037587.4 6778340.3 200.2, 1037587.3 6778340.1 200.2, 1037585 6778341.8 200.2, 1037586.9 6778344.5 200.2, 1037589.2 6778342.9 200.2))
-BATIMENT0000000234797683;POLYGON Z ((1037587.3 6778340.1 199.6, 1037585.2 6778337.3 199.6, 1037582.9 6778339 199.6, 1037585 6778341.8 199.6, 1037587.3 6778340.1 199.6))
-BATIMENT0000000234797764;POLYGON Z ((1037539.7 6778398.7 203, 1037537.4 6778395.5 203, 1037534.3 6778397.8 203, 1037535 6778398.7 203, 1037536.6 6778400.9 203, 1037539.7 6778398.7 203))
-BATIMENT0000000234797772;POLYGON Z ((1037536 6778389.8 199, 1037540.6 6778386.5 199, 1037538.7 6778383.9 199, 1037536.3 6778385.7 199, 1037534.1 6778387.3 199, 1037536 6778389.8 199))
-BATIMENT0000000234797776;POLYGON Z ((1037529 6778395.1 199.4, 1037536 6778389.8 199.4, 1037534.1 6778387.3 199.4, 1037527.1 6778392.5 199.4, 1037529 6778395.1 199.4))
-BATIMENT0000000234797784;POLYGON Z ((1037538.3 6778380.1 199.7, 1037536.7 6778381.3 199.7, 1037538.7 6778383.9 199.7, 1037539 6778383.7 199.7, 1037540.2 6778382.8 199.7, 1037538.3 6778380.1 199.7))
-BATIMENT0000000234797798;POLYGON Z ((1037519 6778504.9 202, 1037526.3 6778499.5 202, 1037525.9 6778499 202, 1037518.8 6778504.6 202, 1037519 6778504.9 202))
-BATIMENT0000000234797805;POLYGON Z ((1037650.9 6778339.2 200, 1037649.4 6778339.1 200, 1037646.6 6778341.2 200, 1037648.8 6778344.1 200, 1037652.5 6778341.3 200, 1037650.9 6778339.2 200))
-BATIMENT0000000234798160;POLYGON Z ((1037512.2 6778343.1 199.9, 1037514.9 6778341.1 199.9, 1037515 6778341 199.9, 1037512.5 6778337.6 199.9, 1037511.1 6778338.6 199.9, 1037509.7 6778339.7 199.9, 1037511.6 6778342.2 199.9, 1037512.2 6778343.1 199.9))
-BATIMENT0000000234798415;POLYGON Z ((1037553.7 6778343.3 202.2, 1037562.1 6778354.7 202.2, 1037562.2 6778354.6 202.2, 1037554 6778343.3 202.2, 1037565.2 6778334.9 202.2, 1037553.7 6778343.3 202.2))
-BATIMENT0000000234797968;POLYGON Z ((1037516.7 6778050.3 199.8, 1037518.5 6778052.8 199.8, 1037522 6778050.1 199.8, 1037520.2 6778047.7 199.8, 1037516.7 6778050.3 199.8))
-BATIMENT0000000234797960;POLYGON Z ((1037570 6778068.6 197.6, 1037569.3 6778069.2 197.6, 1037571 6778071.5 197.6, 1037571.7 6778071 197.6, 1037570 6778068.6 197.6))
-BATIMENT0000000234797961;POLYGON Z ((1037544.5 6778048.3 199.5, 1037540.7 6778051.1 199.5, 1037542.4 6778053.5 199.5, 1037546.3 6778050.7 199.5, 1037544.5 6778048.3 199.5))
-BATIMENT0000000234798090;POLYGON Z ((1037590.6 6778127.7 201.1, 1037589.1 6778126 201.1, 1037586.4 6778128.2 201.1, 1037587.8 6778129.8 201.1, 1037590.6 6778127.7 201.1))
-BATIMENT0000000234798096;POLYGON Z ((1037604.4 6778105.7 199, 1037602.3 6778107.2 199, 1037600.1 6778108.8 199, 1037602.7 6778112.3 199, 1037607 6778109.1 199, 1037604.4 6778105.7 199))
-BATIMENT0000000234798288;POLYGON Z ((1037479.9 6778112.9 201.2, 1037478 6778110.5 201.2, 1037476.3 6778111.8 201.2, 1037478.2 6778114.3 201.2, 1037478.5 6778114 201.2, 1037479.9 6778112.9 201.2))
-BATIMENT0000000234798319;POLYGON Z ((1037487.6 6778084.2 198.1, 1037488.8 6778083.3 198.1, 1037488.9 6778083.5 198.1, 1037494.9 6778078.9 198.1, 1037494.2 6778077.9 198.1, 1037486.9 6778083.3 198.1, 1037487.6 6778084.2 198.1))
-BATIMENT0000000234798331;POLYGON Z ((1037489.5 6778084.2 199.5, 1037488.9 6778083.5 199.5, 1037488.8 6778083.3 199.5, 1037487.6 6778084.2 199.5, 1037488.3 6778085.1 199.5, 1037489.5 6778084.2 199.5))
-BATIMENT0000000234798335;POLYGON Z ((1037495.9 6778100.6 201.6, 1037498.4 6778098.7 201.6, 1037497.7 6778097.8 201.6, 1037496.6 6778096.2 201.6, 1037492.7 6778099.1 201.6, 1037494.6 6778101.5 201.6, 1037495.9 6778100.6 201.6))
-BATIMENT0000000234798436;POLYGON Z ((1037634.1 6778156.5 199, 1037635.1 6778155.7 199, 1037633.8 6778153.9 199, 1037632.7 6778154.7 199, 1037634.1 6778156.5 199))
-BATIMENT0000000234798437;POLYGON Z ((1037607.1 6778159.9 200.8, 1037609.2 6778158.4 200.8, 1037608.3 6778157 200.8, 1037606.1 6778158.7 200.8, 1037607.1 6778159.9 200.8))
-BATIMENT0000000234798447;POLYGON Z ((1037614.9 6778152.2 199.2, 1037615.9 6778153.5 199.2, 1037618.2 6778151.8 199.2, 1037617.2 6778150.5 199.2, 1037614.9 6778152.2 199.2))
-BATIMENT0000000234797520;POLYGON Z ((1037487.9 6778528.4 197.3, 1037487.1 6778529 197.3, 1037488.6 6778531.1 197.3, 1037489.5 6778530.5 197.3, 1037487.9 6778528.4 197.3))
-BATIMENT0000000234798210;POLYGON Z ((1037438.6 6778054.9 208.4, 1037424.6 6778035.7 208.4, 1037420.9 6778038.4 208.4, 1037413.3 6778028.2 208.4, 1037409.2 6778031.3 208.4, 1037431 6778060.5 208.4, 1037433.7 6778058.6 208.4, 1037438.6 6778054.9 208.4))
-BATIMENT0000000234797763;POLYGON Z ((1037205 6778379.5 207, 1037208.3 6778377 207, 1037202.5 6778369.3 207, 1037199.2 6778371.7 207, 1037205 6778379.5 207))
-BATIMENT0000000234797802;POLYGON Z ((1037384.4 6778459.4 207.8, 1037371.3 6778442.3 207.8, 1037365 6778447.1 207.8, 1037377.9 6778464.4 207.8, 1037384.4 6778459.4 207.8))
-BATIMENT0000000234798176;POLYGON Z ((1037355.8 6778340.6 204.8, 1037364.2 6778334.2 204.8, 1037360.7 6778329.4 204.8, 1037352.2 6778335.8 204.8, 1037355.8 6778340.6 204.8))
-BATIMENT0000000234798538;POLYGON Z ((1037140.9 6778308.6 209.4, 1037132.6 6778307.5 209.4, 1037131.1 6778307.3 209.4, 1037129 6778321.4 209.4, 1037138.6 6778322.7 209.4, 1037140.9 6778308.6 209.4))
-BATIMENT0000000234798540;POLYGON Z ((1037131.8 6778344.9 209.4, 1037132 6778343.4 209.4, 1037135.4 6778343.9 209.4, 1037136.3 6778338.3 209.4, 1037130 6778331.7 209.4, 1037125.2 6778335.2 209.4, 1037131.6 6778344.9 209.4, 1037131.8 6778344.9 209.4))
-BATIMENT0000000234798605;POLYGON Z ((1037272.6 6778266.1 199.5, 1037270.1 6778267.9 199.5, 1037273.5 6778272.5 199.5, 1037276 6778270.7 199.5, 1037272.6 6778266.1 199.5))
-BATIMENT0000000234798607;POLYGON Z ((1037272.6 6778266.1 199.5, 1037276 6778270.7 199.5, 1037278.6 6778268.8 199.5, 1037275.1 6778264.2 199.5, 1037272.6 6778266.1 199.5))
-BATIMENT0000000234798619;POLYGON Z ((1037298.5 6778251.3 203.3, 1037296.2 6778253 203.3, 1037299.2 6778257 203.3, 1037301.4 6778255.2 203.3, 1037298.5 6778251.3 203.3))
-BATIMENT0000000234798652;POLYGON Z ((1037267 6778328.8 199, 1037268.6 6778326 199, 1037265.8 6778321.2 199, 1037262.9 6778323.3 199, 1037267 6778328.8 199))
-BATIMENT0000000234798653;POLYGON Z ((1037268.8 6778331.1 198.3, 1037271.9 6778329.6 198.3, 1037268.6 6778326 198.3, 1037267 6778328.8 198.3, 1037268.8 6778331.1 198.3))
-BATIMENT0000000234798209;POLYGON Z ((1037461.5 6778079.3 204.7, 1037465 6778076.8 204.7, 1037462.6 6778073.4 204.7, 1037458 6778067.1 204.7, 1037453.8 6778070.1 204.7, 1037441.4 6778052.9 204.7, 1037438.6 6778054.9 204.7, 1037433.7 6778058.6 204.7, 1037451.2 6778083.1 204.7, 1037454.2 6778081 204.7, 1037456 6778083.4 204.7, 1037461.5 6778079.3 204.7))
-BATIMENT0000000234798675;POLYGON Z ((1037268.4 6778370.1 202.8, 1037267.5 6778368.5 202.8, 1037264.6 6778370.7 202.8, 1037267.2 6778374.2 202.8, 1037270 6778372.1 202.8, 1037268.4 6778370.1 202.8))
-BATIMENT0000000234798705;POLYGON Z ((1037188.2 6778296.9 200.5, 1037184.4 6778291.8 200.5, 1037181.3 6778294 200.5, 1037185.1 6778299.2 200.5, 1037188.2 6778296.9 200.5))
-BATIMENT0000000234798218;POLYGON Z ((1037334.6 6778036.6 209.2, 1037339.5 6778033 209.2, 1037332.7 6778023.5 209.2, 1037327.7 6778027.2 209.2, 1037334.6 6778036.6 209.2))
-BATIMENT0000000234798231;POLYGON Z ((1037385.4 6778087 200.8, 1037387.3 6778085.6 200.8, 1037383.3 6778080.1 200.8, 1037381.3 6778081.6 200.8, 1037381.5 6778081.9 200.8, 1037383.1 6778084 200.8, 1037384.7 6778086.1 200.8, 1037385.4 6778087 200.8))
-BATIMENT0000000234798241;POLYGON Z ((1037385.4 6778087 200.1, 1037384.7 6778086.1 200.1, 1037381.9 6778088.2 200.1, 1037385.1 6778092.4 200.1, 1037388 6778090.4 200.1, 1037385.4 6778087 200.1))
-BATIMENT0000000234798249;POLYGON Z ((1037388.7 6778106.8 205.3, 1037388.8 6778106.7 205.3, 1037388.7 6778106.5 205.3, 1037393.1 6778103.2 205.3, 1037395.1 6778101.8 205.3, 1037397.4 6778100 205.3, 1037398.1 6778099.5 205.3, 1037395.8 6778096.4 205.3, 1037384.9 6778104.6 205.3, 1037387.3 6778107.8 205.3, 1037388.7 6778106.8 205.3))
-BATIMENT0000000234798250;POLYGON Z ((1037395.5 6778106.3 200.6, 1037399.8 6778103.1 200.6, 1037397.4 6778100 200.6, 1037395.1 6778101.8 200.6, 1037393.1 6778103.2 200.6, 1037395.5 6778106.3 200.6))
-BATIMENT0000000234798264;POLYGON Z ((1037378.9 6778096.7 205.6, 1037380.4 6778095.7 205.6, 1037379.4 6778094.3 205.6, 1037378 6778092.5 205.6, 1037374.2 6778095.4 205.6, 1037376.3 6778098.6 205.6, 1037378.9 6778096.7 205.6))
-BATIMENT0000000234798353;POLYGON Z ((1037422.7 6778119.4 205, 1037426.8 6778124.9 205, 1037435.7 6778118.2 205, 1037431.5 6778112.8 205, 1037422.7 6778119.4 205))
-BATIMENT0000000234798358;POLYGON Z ((1037437.1 6778123.2 200.3, 1037436 6778124 200.3, 1037435.9 6778124.1 200.3, 1037436.8 6778125.3 200.3, 1037438 6778127 200.3, 1037441.4 6778124.6 200.3, 1037440.1 6778122.9 200.3, 1037439.1 6778121.6 200.3, 1037438.6 6778121.9 200.3, 1037437.1 6778123.2 200.3))
-BATIMENT0000000234798371;POLYGON Z ((1037442.4 6778136.4 204.9, 1037443.1 6778137.3 204.9, 1037447.9 6778143.7 204.9, 1037453.3 6778139.7 204.9, 1037454.2 6778139.1 204.9, 1037450.3 6778133.8 204.9, 1037446.4 6778128.5 204.9, 1037443.4 6778130.7 204.9, 1037440 6778133.3 204.9, 1037442.4 6778136.4 204.9))
-BATIMENT0000000234798813;POLYGON Z ((1037266.2 6778184.1 205.3, 1037265.9 6778184.3 205.3, 1037257.3 6778190.7 205.3, 1037258.6 6778192.5 205.3, 1037267.5 6778185.9 205.3, 1037266.2 6778184.1 205.3))
-BATIMENT0000000234798510;POLYGON Z ((1037342.5 6778129.9 199.7, 1037344.3 6778132.4 199.7, 1037347.2 6778130.2 199.7, 1037345.7 6778128.1 199.7, 1037345.4 6778127.7 199.7, 1037342.5 6778129.9 199.7))
-BATIMENT0000000234798556;POLYGON Z ((1037242 6778118.5 204.5, 1037242.4 6778118.2 204.5, 1037234 6778106.8 204.5, 1037229.7 6778101 204.5, 1037222.6 6778106.2 204.5, 1037235.3 6778123.4 204.5, 1037242 6778118.5 204.5))
-BATIMENT0000000234798583;POLYGON Z ((1037179.1 6778158.4 204.6, 1037181.4 6778161.4 204.6, 1037188.2 6778156.5 204.6, 1037190 6778155.3 204.6, 1037187.7 6778152.1 204.6, 1037188 6778151 204.6, 1037188.5 6778148.8 204.6, 1037180.9 6778147 204.6, 1037179.1 6778158.4 204.6))
-BATIMENT0000000234798595;POLYGON Z ((1037206.2 6778172.5 199.4, 1037206.7 6778173.3 199.4, 1037207.4 6778172.7 199.4, 1037208 6778173.4 199.4, 1037210.4 6778171.6 199.4, 1037208.1 6778168.7 199.4, 1037205.1 6778171.1 199.4, 1037206.2 6778172.5 199.4))
-BATIMENT0000000234798680;POLYGON Z ((1037257 6778102.2 199.5, 1037253.9 6778098 199.5, 1037250.1 6778100.9 199.5, 1037253.1 6778105.1 199.5, 1037257 6778102.2 199.5))
-BATIMENT0000000234798758;POLYGON Z ((1037230.4 6778076.9 208.9, 1037229.6 6778075.7 208.9, 1037226.6 6778078 208.9, 1037227.4 6778079 208.9, 1037230.4 6778076.9 208.9))
-BATIMENT0000000234798769;POLYGON Z ((1037198.9 6778218.3 200.2, 1037206.4 6778212.7 200.2, 1037204.2 6778209.8 200.2, 1037203.7 6778210.1 200.2, 1037196.6 6778215.5 200.2, 1037198.9 6778218.3 200.2))
-BATIMENT0000000234798773;POLYGON Z ((1037235 6778214.7 199.6, 1037238.1 6778218.7 199.6, 1037238.6 6778218.3 199.6, 1037235.6 6778214.2 199.6, 1037235 6778214.7 199.6))
-BATIMENT0000000234798738;POLYGON Z ((1037142.7 6778145.6 198.6, 1037143 6778145.7 198.6, 1037142.9 6778146.7 198.6, 1037147.1 6778147.3 198.6, 1037147.6 6778144.4 198.6, 1037146.2 6778144.2 198.6, 1037143 6778143.7 198.6, 1037142.7 6778145.6 198.6))
-BATIMENT0000000234798788;POLYGON Z ((1037314.7 6778087.3 200, 1037316.9 6778090.2 200, 1037319.3 6778088.3 200, 1037317.8 6778086.2 200, 1037317.2 6778085.4 200, 1037314.7 6778087.3 200))
-BATIMENT0000000234798789;POLYGON Z ((1037319.3 6778088.3 201.2, 1037319.7 6778088.8 201.2, 1037323.4 6778086.1 201.2, 1037321.4 6778083.5 201.2, 1037317.8 6778086.2 201.2, 1037319.3 6778088.3 201.2))
-BATIMENT0000000234798811;POLYGON Z ((1037234 6778037.8 206.7, 1037237.3 6778035.3 206.7, 1037232.7 6778028.9 206.7, 1037229.3 6778031.5 206.7, 1037234 6778037.8 206.7))
-BATIMENT0000000234798821;POLYGON Z ((1037320.4 6778207.6 200, 1037317.7 6778209.6 200, 1037321.4 6778214.4 200, 1037321.5 6778214.3 200, 1037324 6778212.5 200, 1037320.4 6778207.6 200))
-BATIMENT0000000234798825;POLYGON Z ((1037326.7 6778213.9 199.1, 1037328.3 6778216.1 199.1, 1037333.2 6778212.5 199.1, 1037331.5 6778210.2 199.1, 1037326.7 6778213.9 199.1))
-BATIMENT0000000234798826;POLYGON Z ((1037328.3 6778216.1 199.2, 1037330 6778218.4 199.2, 1037334.8 6778214.7 199.2, 1037333.2 6778212.5 199.2, 1037328.3 6778216.1 199.2))
-BATIMENT0000000234798828;POLYGON Z ((1037335.1 6778215.1 199.3, 1037334.8 6778214.7 199.3, 1037330 6778218.4 199.3, 1037331.7 6778220.6 199.3, 1037336.5 6778216.9 199.3, 1037335.1 6778215.1 199.3))
-BATIMENT0000000234798830;POLYGON Z ((1037340.7 6778222.6 199.5, 1037343.2 6778220.7 199.5, 1037339.6 6778215.8 199.5, 1037337.1 6778217.7 199.5, 1037338.2 6778219.2 199.5, 1037340 6778221.7 199.5, 1037340.7 6778222.6 199.5))
-BATIMENT0000000234798837;POLYGON Z ((1037352.5 6778206.1 199.5, 1037349.9 6778208.1 199.5, 1037353.5 6778212.9 199.5, 1037356.1 6778210.9 199.5, 1037352.5 6778206.1 199.5))
-BATIMENT0000000234798838;POLYGON Z ((1037355.1 6778204.2 199.5, 1037352.5 6778206.1 199.5, 1037356.1 6778210.9 199.5, 1037358.7 6778209 199.5, 1037355.1 6778204.2 199.5))
-BATIMENT0000000234798839;POLYGON Z ((1037356.8 6778202.9 199.5, 1037355.1 6778204.2 199.5, 1037358.7 6778209 199.5, 1037361.2 6778207.1 199.5, 1037357.6 6778202.3 199.5, 1037356.8 6778202.9 199.5))
-BATIMENT0000000234798604;POLYGON Z ((1037267.5 6778269.8 199.4, 1037270.9 6778274.4 199.4, 1037273.5 6778272.5 199.4, 1037270.1 6778267.9 199.4, 1037267.5 6778269.8 199.4))
-BATIMENT0000000234797718;POLYGON Z ((1037272.2 6778444 206, 1037282.4 6778436.5 206, 1037281.7 6778435.5 206, 1037271.4 6778443 206, 1037272.2 6778444 206))
-BATIMENT0000000234797737;POLYGON Z ((1037225 6778384.1 199.1, 1037226.6 6778386.2 199.1, 1037229.7 6778390.4 199.1, 1037236.8 6778384.9 199.1, 1037234.3 6778381.7 199.1, 1037232.1 6778378.8 199.1, 1037231.3 6778379.4 199.1, 1037228.1 6778381.7 199.1, 1037225 6778384.1 199.1))
-BATIMENT0000000234798612;POLYGON Z ((1037288.1 6778255.5 200.1, 1037282.9 6778248.4 200.1, 1037278 6778252.1 200.1, 1037282.8 6778258.5 200.1, 1037283.3 6778259.2 200.1, 1037288.1 6778255.5 200.1))
-BATIMENT0000000234797744;POLYGON Z ((1037236.5 6778364 204.9, 1037235.4 6778364.8 204.9, 1037229.6 6778369 204.9, 1037229.3 6778369.2 204.9, 1037228.8 6778369.6 204.9, 1037233.3 6778375.7 204.9, 1037234.4 6778377.3 204.9, 1037237.2 6778375.5 204.9, 1037237.7 6778375.2 204.9, 1037239.2 6778374.2 204.9, 1037240.4 6778373.4 204.9, 1037242.3 6778371.9 204.9, 1037236.5 6778364 204.9))
-BATIMENT0000000234797806;POLYGON Z ((1037297.1 6778377.2 201.8, 1037297.3 6778377.5 201.8, 1037289.5 6778383.1 201.8, 1037297.4 6778394.1 201.8, 1037308.2 6778386.3 201.8, 1037306.4 6778383.9 201.8, 1037300 6778375 201.8, 1037297.1 6778377.2 201.8))
-BATIMENT0000000234798606;POLYGON Z ((1037268.4 6778276.3 199.4, 1037270.9 6778274.4 199.4, 1037267.5 6778269.8 199.4, 1037265 6778271.7 199.4, 1037268.4 6778276.3 199.4))
-BATIMENT0000000234798608;POLYGON Z ((1037277.6 6778262.3 199.5, 1037275.1 6778264.2 199.5, 1037278.6 6778268.8 199.5, 1037281.1 6778266.9 199.5, 1037277.6 6778262.3 199.5))
-BATIMENT0000000234798610;POLYGON Z ((1037280.1 6778260.4 199.5, 1037277.6 6778262.3 199.5, 1037281.1 6778266.9 199.5, 1037283.6 6778265.1 199.5, 1037280.1 6778260.4 199.5))
-BATIMENT0000000234798611;POLYGON Z ((1037283.3 6778259.2 199.5, 1037282.8 6778258.5 199.5, 1037280.1 6778260.4 199.5, 1037283.6 6778265.1 199.5, 1037286.3 6778263.1 199.5, 1037283.3 6778259.2 199.5))
-BATIMENT0000000234798625;POLYGON Z ((1037265.4 6778257.8 204.7, 1037264.2 6778258.7 204.7, 1037266.2 6778261.4 204.7, 1037267.4 6778260.5 204.7, 1037265.4 6778257.8 204.7))
-BATIMENT0000000234798664;POLYGON Z ((1037273 6778360.2 202.5, 1037271.8 6778358.5 202.5, 1037271.5 6778358.1 202.5, 1037269.7 6778359.4 202.5, 1037271.3 6778361.5 202.5, 1037273 6778360.2 202.5))
-BATIMENT0000000234798666;POLYGON Z ((1037276 6778364.3 202.8, 1037273.7 6778361.1 202.8, 1037273 6778360.2 202.8, 1037271.3 6778361.5 202.8, 1037274.3 6778365.7 202.8, 1037276 6778364.3 202.8))
-BATIMENT0000000234798702;POLYGON Z ((1037174.9 6778301.8 208.4, 1037165 6778309.2 208.4, 1037171 6778317.5 208.4, 1037180.9 6778310.2 208.4, 1037174.9 6778301.8 208.4))
-BATIMENT0000000234798704;POLYGON Z ((1037181.3 6778294 200.5, 1037184.4 6778291.8 200.5, 1037182.4 6778289.1 200.5, 1037179 6778291.6 200.5, 1037181 6778294.3 200.5, 1037181.3 6778294 200.5))
-BATIMENT0000000234798277;POLYGON Z ((1037393.4 6778118.6 205.4, 1037400.7 6778113 205.4, 1037399.8 6778112 205.4, 1037392.6 6778117.5 205.4, 1037393.4 6778118.6 205.4))
-BATIMENT0000000234798513;POLYGON Z ((1037353.5 6778129.9 199.5, 1037351.8 6778127.5 199.5, 1037347.6 6778130.6 199.5, 1037349.3 6778132.9 199.5, 1037353.5 6778129.9 199.5))
-BATIMENT0000000234798517;POLYGON Z ((1037340.1 6778126.8 199.2, 1037342.5 6778129.9 199.2, 1037345.4 6778127.7 199.2, 1037343.1 6778124.6 199.2, 1037340.1 6778126.8 199.2))
-BATIMENT0000000234798555;POLYGON Z ((1037250.7 6778130 204.6, 1037242 6778118.5 204.6, 1037235.3 6778123.4 204.6, 1037243.9 6778134.9 204.6, 1037250.7 6778130 204.6))
-BATIMENT0000000234798598;POLYGON Z ((1037199.7 6778164 199.4, 1037204.7 6778170.6 199.4, 1037205.1 6778171.1 199.4, 1037208.1 6778168.7 199.4, 1037202.8 6778161.6 199.4, 1037199.7 6778164 199.4))
-BATIMENT0000000234798752;POLYGON Z ((1037194.2 6778108.9 209.8, 1037195.6 6778107.9 209.8, 1037193.4 6778104.2 209.8, 1037191.3 6778105.6 209.8, 1037193.7 6778109.3 209.8, 1037194.2 6778108.9 209.8))
-BATIMENT0000000234798753;POLYGON Z ((1037195.6 6778107.9 209.6, 1037194.2 6778108.9 209.6, 1037196.7 6778112.4 209.6, 1037212 6778101.1 209.6, 1037206.9 6778094.2 209.6, 1037204.5 6778095.9 209.6, 1037203.1 6778097 209.6, 1037200.1 6778099.2 209.6, 1037197.1 6778101.4 209.6, 1037195.3 6778102.8 209.6, 1037193.4 6778104.2 209.6, 1037195.6 6778107.9 209.6))
-BATIMENT0000000234798757;POLYGON Z ((1037232.6 6778073.5 208.9, 1037229.6 6778075.7 208.9, 1037230.4 6778076.9 208.9, 1037233.4 6778074.6 208.9, 1037232.6 6778073.5 208.9))
-BATIMENT0000000234798759;POLYGON Z ((1037200.1 6778099.2 208.8, 1037203.1 6778097 208.8, 1037202.3 6778095.8 208.8, 1037199.2 6778098.1 208.8, 1037200.1 6778099.2 208.8))
-BATIMENT0000000234798760;POLYGON Z ((1037200.1 6778099.2 208.8, 1037199.2 6778098.1 208.8, 1037196.2 6778100.3 208.8, 1037197.1 6778101.4 208.8, 1037200.1 6778099.2 208.8))
-BATIMENT0000000234798761;POLYGON Z ((1037215.3 6778087.9 208.8, 1037218.2 6778085.8 208.8, 1037217.3 6778084.6 208.8, 1037214.4 6778086.8 208.8, 1037215.3 6778087.9 208.8))
-BATIMENT0000000234798762;POLYGON Z ((1037215.3 6778087.9 208.8, 1037214.4 6778086.8 208.8, 1037211.5 6778089 208.8, 1037212.3 6778090.2 208.8, 1037215.3 6778087.9 208.8))
-BATIMENT0000000234797924;POLYGON Z ((1037616.4 6778270 200.6, 1037608.6 6778275.8 200.6, 1037610.9 6778278.9 200.6, 1037618.8 6778273.1 200.6, 1037616.4 6778270 200.6))
-BATIMENT0000000234798790;POLYGON Z ((1037326.2 6778090 201.4, 1037323.4 6778086.1 201.4, 1037319.7 6778088.8 201.4, 1037321 6778090.5 201.4, 1037322.6 6778092.7 201.4, 1037326.2 6778090 201.4))
-BATIMENT0000000234798823;POLYGON Z ((1037326.4 6778210.7 199.1, 1037325 6778211.7 199.1, 1037326.7 6778213.9 199.1, 1037331.5 6778210.2 199.1, 1037329.9 6778208.1 199.1, 1037326.4 6778210.7 199.1))
-BATIMENT0000000234798831;POLYGON Z ((1037337.1 6778217.7 199.3, 1037336.5 6778216.9 199.3, 1037331.7 6778220.6 199.3, 1037333.3 6778222.8 199.3, 1037338.2 6778219.2 199.3, 1037337.1 6778217.7 199.3))
-BATIMENT0000000234798834;POLYGON Z ((1037345.9 6778218.6 199.5, 1037342.2 6778213.9 199.5, 1037341 6778214.8 199.5, 1037339.6 6778215.8 199.5, 1037343.2 6778220.7 199.5, 1037345.9 6778218.6 199.5))
-BATIMENT0000000234798836;POLYGON Z ((1037349.2 6778208.6 199.6, 1037347.3 6778210 199.6, 1037350.9 6778214.8 199.6, 1037353.5 6778212.9 199.6, 1037349.9 6778208.1 199.6, 1037349.2 6778208.6 199.6))
-BATIMENT0000000234797890;POLYGON Z ((1037582.1 6778259.2 207.8, 1037578.8 6778254.8 207.8, 1037577.9 6778255.4 207.8, 1037581.2 6778259.8 207.8, 1037582.1 6778259.2 207.8))
-BATIMENT0000000234797894;POLYGON Z ((1037599.5 6778275.7 207.9, 1037602.7 6778273.3 207.9, 1037600.4 6778270.1 207.9, 1037598 6778271.9 207.9, 1037597.1 6778272.6 207.9, 1037599.5 6778275.7 207.9))
-BATIMENT0000000234797898;POLYGON Z ((1037595.9 6778248.8 201.4, 1037587.6 6778254.8 201.4, 1037587.9 6778255.1 201.4, 1037591.4 6778260.1 201.4, 1037598.7 6778254.7 201.4, 1037599 6778254.5 201.4, 1037602.7 6778251.7 201.4, 1037598.9 6778246.6 201.4, 1037595.9 6778248.8 201.4))
-BATIMENT0000000234797918;POLYGON Z ((1037626.8 6778254.3 199.4, 1037624.9 6778251.7 199.4, 1037623.2 6778252.9 199.4, 1037621.8 6778254 199.4, 1037623.8 6778256.7 199.4, 1037626.8 6778254.3 199.4))
-BATIMENT0000000234797937;POLYGON Z ((1037614.6 6778233.1 200.6, 1037613.6 6778233.9 200.6, 1037612 6778235.1 200.6, 1037609 6778237.3 200.6, 1037613.6 6778243.6 200.6, 1037615.3 6778242.4 200.6, 1037619.3 6778239.5 200.6, 1037614.6 6778233.1 200.6))
-BATIMENT0000000234797939;POLYGON Z ((1037613.6 6778233.9 201.8, 1037611.8 6778231.5 201.8, 1037611.5 6778231.6 201.8, 1037610.2 6778232.6 201.8, 1037612 6778235.1 201.8, 1037613.6 6778233.9 201.8))
-BATIMENT0000000234798008;POLYGON Z ((1037650.4 6778238.3 199.9, 1037650.3 6778238 199.9, 1037650.9 6778237.5 199.9, 1037651.1 6778237.7 199.9, 1037653.8 6778235.7 199.9, 1037653.6 6778235.5 199.9, 1037654.2 6778235 199.9, 1037654.5 6778235.1 199.9, 1037657.1 6778233.2 199.9, 1037656.9 6778232.9 199.9, 1037657.5 6778232.4 199.9, 1037655.6 6778229.7 199.9, 1037653 6778231.6 199.9, 1037647.1 6778236 199.9, 1037649.4 6778239 199.9, 1037650.4 6778238.3 199.9))
-BATIMENT0000000234798012;POLYGON Z ((1037467.5 6778183.9 200.6, 1037468.2 6778184.8 200.6, 1037473 6778181.2 200.6, 1037472.4 6778180.4 200.6, 1037467.5 6778183.9 200.6))
-BATIMENT0000000234798018;POLYGON Z ((1037477.7 6778173.5 200.4, 1037477.2 6778172.8 200.4, 1037476.4 6778173.4 200.4, 1037478.8 6778176.6 200.4, 1037479.6 6778176 200.4, 1037477.7 6778173.5 200.4))
-BATIMENT0000000234798021;POLYGON Z ((1037478.8 6778183.9 201.2, 1037478.4 6778183.3 201.2, 1037475.8 6778185.2 201.2, 1037474.3 6778186.3 201.2, 1037479.8 6778193.8 201.2, 1037483.2 6778191.2 201.2, 1037483.6 6778190.9 201.2, 1037483.8 6778190.8 201.2, 1037483.9 6778190.7 201.2, 1037478.8 6778183.9 201.2))
-BATIMENT0000000234798039;POLYGON Z ((1037476.7 6778202.4 200.3, 1037479.5 6778206.5 200.3, 1037479.9 6778206.2 200.3, 1037482.3 6778204.4 200.3, 1037479.1 6778200.1 200.3, 1037476.4 6778202.1 200.3, 1037476.7 6778202.4 200.3))
-BATIMENT0000000234798044;POLYGON Z ((1037498.7 6778211.4 207.1, 1037492.2 6778202.4 207.1, 1037488 6778205.5 207.1, 1037482.3 6778209.6 207.1, 1037488.8 6778218.8 207.1, 1037498.7 6778211.4 207.1))
-BATIMENT0000000234798102;POLYGON Z ((1037627.5 6778314.1 207.1, 1037637.3 6778306.8 207.1, 1037635.4 6778304.2 207.1, 1037632.5 6778300.3 207.1, 1037622.6 6778307.6 207.1, 1037627.5 6778314.1 207.1))
-BATIMENT0000000234798105;POLYGON Z ((1037644.5 6778294.3 199.4, 1037637.7 6778299.3 199.4, 1037639.3 6778301.4 199.4, 1037639.9 6778302.2 199.4, 1037640.3 6778302.7 199.4, 1037640.4 6778302.8 199.4, 1037647 6778297.8 199.4, 1037644.5 6778294.3 199.4))
-BATIMENT0000000234798112;POLYGON Z ((1037649.5 6778290.6 199.8, 1037647.9 6778291.7 199.8, 1037644.5 6778294.3 199.8, 1037647 6778297.8 199.8, 1037647.1 6778297.7 199.8, 1037652 6778293.9 199.8, 1037649.5 6778290.6 199.8))
-BATIMENT0000000234798114;POLYGON Z ((1037626.4 6778329.7 200.2, 1037629.2 6778327.7 200.2, 1037627.1 6778324.8 200.2, 1037624.3 6778326.9 200.2, 1037626.4 6778329.7 200.2))
-BATIMENT0000000234798115;POLYGON Z ((1037648.8 6778289.7 200, 1037646.3 6778286.3 200, 1037646.1 6778285.9 200, 1037644.5 6778287.1 200, 1037647.9 6778291.7 200, 1037649.5 6778290.6 200, 1037648.8 6778289.7 200))
-BATIMENT0000000234798123;POLYGON Z ((1037654.6 6778321.5 198.7, 1037655.5 6778322.6 198.7, 1037656.5 6778321.8 198.7, 1037654 6778318.6 198.7, 1037653 6778319.4 198.7, 1037654.6 6778321.5 198.7))
-BATIMENT0000000234798138;POLYGON Z ((1037500.7 6778330 205.3, 1037495 6778322.2 205.3, 1037493.8 6778320.6 205.3, 1037490.6 6778323 205.3, 1037491.5 6778324.2 205.3, 1037492 6778324.9 205.3, 1037497.5 6778332.4 205.3, 1037499.9 6778330.6 205.3, 1037500.7 6778330 205.3))
-BATIMENT0000000234798146;POLYGON Z ((1037505.4 6778318 205, 1037504.4 6778316.7 205, 1037502.4 6778314 205, 1037499.5 6778316.2 205, 1037500.7 6778317.8 205, 1037502.5 6778320.2 205, 1037505.4 6778318 205))
-BATIMENT0000000234798194;POLYGON Z ((1037696 6778292.6 199, 1037695.8 6778293.8 199, 1037700.9 6778294.6 199, 1037701.1 6778293.4 199, 1037696 6778292.6 199))
-BATIMENT0000000234798149;POLYGON Z ((1037507.1 6778320.1 204.9, 1037506 6778318.7 204.9, 1037505.4 6778318 204.9, 1037502.5 6778320.2 204.9, 1037506.5 6778325.6 204.9, 1037509.5 6778323.3 204.9, 1037507.1 6778320.1 204.9))
-BATIMENT0000000234798151;POLYGON Z ((1037510.7 6778317.4 205.2, 1037507.1 6778320.1 205.2, 1037509.5 6778323.3 205.2, 1037513.1 6778320.5 205.2, 1037510.7 6778317.4 205.2))
-BATIMENT0000000234798190;POLYGON Z ((1037691.4 6778323.4 199.1, 1037690.8 6778327.3 199.1, 1037695.9 6778328.1 199.1, 1037696.5 6778324.1 199.1, 1037691.4 6778323.4 199.1))
-BATIMENT0000000234798169;POLYGON Z ((1037509.5 6778323.3 199.4, 1037506.5 6778325.6 199.4, 1037505 6778326.8 199.4, 1037503.3 6778328 199.4, 1037506.1 6778331.8 199.4, 1037512.3 6778327.1 199.4, 1037509.5 6778323.3 199.4))
-BATIMENT0000000234798191;POLYGON Z ((1037691.4 6778323.4 199.2, 1037696.5 6778324.1 199.2, 1037697.9 6778314.8 199.2, 1037692.8 6778314 199.2, 1037691.4 6778323.4 199.2))
-BATIMENT0000000234798192;POLYGON Z ((1037693 6778312.6 199.2, 1037692.8 6778314 199.2, 1037697.9 6778314.8 199.2, 1037698.1 6778313.4 199.2, 1037693 6778312.6 199.2))
-BATIMENT0000000234798193;POLYGON Z ((1037693 6778312.6 199.2, 1037698.1 6778313.4 199.2, 1037700.9 6778294.6 199.2, 1037695.8 6778293.8 199.2, 1037693 6778312.6 199.2))
-BATIMENT0000000234798195;POLYGON Z ((1037696 6778292.6 199.2, 1037701.1 6778293.4 199.2, 1037703.9 6778274.6 199.2, 1037698.8 6778273.8 199.2, 1037696 6778292.6 199.2))
-BATIMENT0000000234798196;POLYGON Z ((1037699 6778272.3 199.3, 1037698.8 6778273.8 199.3, 1037703.9 6778274.6 199.3, 1037704.1 6778273.1 199.3, 1037699 6778272.3 199.3))
-BATIMENT0000000234798197;POLYGON Z ((1037699 6778272.3 199.4, 1037704.1 6778273.1 199.4, 1037705.5 6778263.6 199.4, 1037700.5 6778262.8 199.4, 1037699 6778272.3 199.4))
-BATIMENT0000000234798199;POLYGON Z ((1037690.3 6778330.3 199, 1037689.7 6778334.2 199, 1037694.9 6778335 199, 1037695.5 6778331.1 199, 1037690.3 6778330.3 199))
-BATIMENT0000000234798200;POLYGON Z ((1037690.3 6778330.3 198.8, 1037695.5 6778331.1 198.8, 1037695.9 6778328.1 198.8, 1037690.8 6778327.3 198.8, 1037690.3 6778330.3 198.8))
-BATIMENT0000000234798202;POLYGON Z ((1037686.9 6778353 199, 1037692.1 6778353.9 199, 1037694.9 6778335 199, 1037689.7 6778334.2 199, 1037686.9 6778353 199))
-BATIMENT0000000234798451;POLYGON Z ((1037511.6 6778250.3 203.4, 1037515.4 6778255.6 203.4, 1037516.7 6778257.3 203.4, 1037517.2 6778258 203.4, 1037517.9 6778258.9 203.4, 1037528.5 6778251.1 203.4, 1037527.6 6778249.8 203.4, 1037527.2 6778249.3 203.4, 1037524.4 6778245.4 203.4, 1037520.5 6778240 203.4, 1037513.1 6778245.5 203.4, 1037509.9 6778247.9 203.4, 1037511.6 6778250.3 203.4))
-BATIMENT0000000234798460;POLYGON Z ((1037505.9 6778242.5 203.4, 1037505.6 6778242.7 203.4, 1037502.6 6778244.9 203.4, 1037504.8 6778247.8 203.4, 1037505.1 6778247.6 203.4, 1037507 6778250.1 203.4, 1037509.9 6778247.9 203.4, 1037505.9 6778242.5 203.4))
-BATIMENT0000000234798471;POLYGON Z ((1037531.2 6778232.1 203.4, 1037528 6778227.7 203.4, 1037521.1 6778232.7 203.4, 1037517.2 6778235.5 203.4, 1037520.5 6778240 203.4, 1037531.2 6778232.1 203.4))
-BATIMENT0000000234798832;POLYGON Z ((1037342.2 6778213.9 199.5, 1037345.9 6778218.6 199.5, 1037348.3 6778216.8 199.5, 1037344.7 6778212 199.5, 1037342.2 6778213.9 199.5))
-BATIMENT0000000234798275;POLYGON Z ((1037410.8 6778104.5 201.4, 1037410.5 6778104.1 201.4, 1037409.7 6778103.1 201.4, 1037407.2 6778104.9 201.4, 1037403.6 6778107.7 201.4, 1037404.7 6778109 201.4, 1037410.8 6778104.5 201.4))
-BATIMENT0000000234798352;POLYGON Z ((1037426.8 6778124.9 204.6, 1037427.3 6778125.5 204.6, 1037428.2 6778126.8 204.6, 1037429.8 6778128.9 204.6, 1037431.9 6778127.2 204.6, 1037435 6778124.8 204.6, 1037435.9 6778124.1 204.6, 1037436 6778124 204.6, 1037437.1 6778123.2 204.6, 1037438.6 6778121.9 204.6, 1037435.7 6778118.2 204.6, 1037426.8 6778124.9 204.6))
-BATIMENT0000000234798356;POLYGON Z ((1037431.3 6778130.8 199.6, 1037433.2 6778133.4 199.6, 1037435.6 6778136.6 199.6, 1037435.8 6778136.4 199.6, 1037437.2 6778135.4 199.6, 1037437.8 6778135 199.6, 1037431.9 6778127.2 199.6, 1037429.8 6778128.9 199.6, 1037431.3 6778130.8 199.6))
-BATIMENT0000000234798382;POLYGON Z ((1037437.2 6778135.4 205.7, 1037435.8 6778136.4 205.7, 1037435.6 6778136.6 205.7, 1037432.7 6778138.7 205.7, 1037435 6778141.7 205.7, 1037442.4 6778136.4 205.7, 1037440 6778133.3 205.7, 1037437.8 6778135 205.7, 1037437.2 6778135.4 205.7))
-BATIMENT0000000234798383;POLYGON Z ((1037429.8 6778140.9 205.8, 1037426.2 6778143.5 205.8, 1037428.4 6778146.6 205.8, 1037435 6778141.7 205.8, 1037432.7 6778138.7 205.8, 1037429.8 6778140.9 205.8))
-BATIMENT0000000234798386;POLYGON Z ((1037422.4 6778146.3 205.8, 1037424.6 6778149.3 205.8, 1037428.4 6778146.6 205.8, 1037426.2 6778143.5 205.8, 1037422.4 6778146.3 205.8))
-BATIMENT0000000234798387;POLYGON Z ((1037429.2 6778157.7 206.2, 1037430.3 6778156.9 206.2, 1037425.4 6778150.3 206.2, 1037424.6 6778149.3 206.2, 1037422.4 6778146.3 206.2, 1037421.5 6778147 206.2, 1037429.2 6778157.7 206.2))
-BATIMENT0000000234797525;POLYGON Z ((1037494.9 6778514.2 202.9, 1037493.4 6778515.3 202.9, 1037492.8 6778515.7 202.9, 1037494.8 6778518.3 202.9, 1037499.3 6778515 202.9, 1037500.7 6778514 202.9, 1037498.7 6778511.3 202.9, 1037494.9 6778514.2 202.9))
-BATIMENT0000000234797550;POLYGON Z ((1037488.1 6778411 199.1, 1037489.3 6778410.2 199.1, 1037491.3 6778408.6 199.1, 1037488.2 6778404.3 199.1, 1037488 6778404.5 199.1, 1037485 6778406.7 199.1, 1037488.1 6778411 199.1))
-BATIMENT0000000234797556;POLYGON Z ((1037493.9 6778406.7 199.3, 1037490.5 6778402 199.3, 1037487.7 6778404 199.3, 1037488 6778404.5 199.3, 1037488.2 6778404.3 199.3, 1037491.3 6778408.6 199.3, 1037493.9 6778406.7 199.3))
-BATIMENT0000000234797577;POLYGON Z ((1037573.3 6778454.8 203.4, 1037573.7 6778454.5 203.4, 1037574.7 6778453.7 203.4, 1037573.5 6778452.1 203.4, 1037572.1 6778453.1 203.4, 1037573.3 6778454.8 203.4))
-BATIMENT0000000234797578;POLYGON Z ((1037564.8 6778461.1 205.9, 1037568.5 6778458.3 205.9, 1037572.8 6778455.2 205.9, 1037573.3 6778454.8 205.9, 1037572.1 6778453.1 205.9, 1037565.6 6778444.3 205.9, 1037557 6778450.7 205.9, 1037564.8 6778461.1 205.9))
-BATIMENT0000000234797618;POLYGON Z ((1037538.7 6778498.5 204, 1037541.2 6778496.7 204, 1037540.1 6778495.3 204, 1037535.8 6778498.5 204, 1037536.8 6778499.9 204, 1037538.7 6778498.5 204))
-BATIMENT0000000234797626;POLYGON Z ((1037528.8 6778489.5 198.8, 1037532.5 6778494.2 198.8, 1037532.6 6778494.4 198.8, 1037537 6778491.1 198.8, 1037535.3 6778488.9 198.8, 1037533.3 6778486.1 198.8, 1037528.8 6778489.5 198.8))
-BATIMENT0000000234797630;POLYGON Z ((1037546.8 6778481.9 199.8, 1037542.7 6778485.1 199.8, 1037543.7 6778486.5 199.8, 1037546.4 6778484.5 199.8, 1037549 6778488.1 199.8, 1037550.6 6778487 199.8, 1037546.8 6778481.9 199.8))
-BATIMENT0000000234797633;POLYGON Z ((1037556.6 6778478.9 206.4, 1037553.5 6778481.2 206.4, 1037557.2 6778486.1 206.4, 1037560.4 6778483.7 206.4, 1037556.6 6778478.9 206.4))
-BATIMENT0000000234797637;POLYGON Z ((1037533.3 6778486.1 199.6, 1037535.3 6778488.9 199.6, 1037539.5 6778485.7 199.6, 1037537.4 6778482.9 199.6, 1037536.9 6778483.4 199.6, 1037535.3 6778484.5 199.6, 1037533.3 6778486.1 199.6))
-BATIMENT0000000234797638;POLYGON Z ((1037542.7 6778485.1 200, 1037546.8 6778481.9 200, 1037546.3 6778481.2 200, 1037542.2 6778484.4 200, 1037542.7 6778485.1 200))
-BATIMENT0000000234797652;POLYGON Z ((1037525.3 6778448.6 204.1, 1037528.3 6778452.7 204.1, 1037531.2 6778450.5 204.1, 1037528.2 6778446.5 204.1, 1037525.3 6778448.6 204.1))
-BATIMENT0000000234797667;POLYGON Z ((1037610.7 6778359 205.5, 1037616.6 6778366.9 205.5, 1037620.2 6778364.3 205.5, 1037615.5 6778357.9 205.5, 1037614.3 6778356.3 205.5, 1037610.7 6778359 205.5))
-BATIMENT0000000234797673;POLYGON Z ((1037587.4 6778348.8 199.9, 1037591.5 6778345.7 199.9, 1037590.7 6778344.7 199.9, 1037590 6778343.8 199.9, 1037589.3 6778342.8 199.9, 1037589.2 6778342.9 199.9, 1037586.9 6778344.5 199.9, 1037585.2 6778345.8 199.9, 1037587.4 6778348.8 199.9))
-BATIMENT0000000234797674;POLYGON Z ((1037590 6778343.8 199.9, 1037590.7 6778344.7 199.9, 1037595.6 6778341 199.9, 1037593.9 6778338.7 199.9, 1037591.4 6778340.5 199.9, 1037591.7 6778341.1 199.9, 1037589.3 6778342.8 199.9, 1037590 6778343.8 199.9))
-BATIMENT0000000234797679;POLYGON Z ((1037595.4 6778357.7 200, 1037597 6778356.4 200, 1037598.6 6778355.3 200, 1037596.5 6778352.5 200, 1037592.4 6778355.6 200, 1037594.4 6778358.4 200, 1037595.4 6778357.7 200))
-BATIMENT0000000234797681;POLYGON Z ((1037597.4 6778360.3 200, 1037598.5 6778361.9 200, 1037601.7 6778359.5 200, 1037600.6 6778357.9 200, 1037597.4 6778360.3 200))
-BATIMENT0000000234797682;POLYGON Z ((1037589.9 6778338.6 199.9, 1037587.7 6778335.5 199.9, 1037585.2 6778337.3 199.9, 1037587.3 6778340.1 199.9, 1037587.4 6778340.3 199.9, 1037587.5 6778340.4 199.9, 1037589.9 6778338.6 199.9))
-BATIMENT0000000234797688;POLYGON Z ((1037644.5 6778395.7 199.3, 1037656.9 6778386.4 199.3, 1037652.3 6778380.1 199.3, 1037640 6778389.6 199.3, 1037644.5 6778395.7 199.3))
-BATIMENT0000000234797727;POLYGON Z ((1037573.3 6778510.2 198.5, 1037571 6778507.1 198.5, 1037570.5 6778507.5 198.5, 1037570.6 6778507.7 198.5, 1037567.2 6778510.2 198.5, 1037566.2 6778511 198.5, 1037568.4 6778513.9 198.5, 1037573.3 6778510.2 198.5))
-BATIMENT0000000234797765;POLYGON Z ((1037535 6778398.7 205.2, 1037534.3 6778397.8 205.2, 1037532.1 6778399.3 205.2, 1037532.8 6778400.3 205.2, 1037535 6778398.7 205.2))
-BATIMENT0000000234797766;POLYGON Z ((1037543.6 6778406.1 200.4, 1037541.5 6778403.3 200.4, 1037544.9 6778400.7 200.4, 1037542.1 6778396.9 200.4, 1037539.7 6778398.7 200.4, 1037536.6 6778400.9 200.4, 1037536.1 6778401.4 200.4, 1037540.8 6778408.1 200.4, 1037543.6 6778406.1 200.4))
-BATIMENT0000000234797786;POLYGON Z ((1037569.4 6778391.8 206.6, 1037567.7 6778389.5 206.6, 1037563.9 6778392.3 206.6, 1037565.6 6778394.6 206.6, 1037569.4 6778391.8 206.6))
-BATIMENT0000000234797788;POLYGON Z ((1037548.4 6778370.5 205.3, 1037545.5 6778372.8 205.3, 1037548.4 6778376.7 205.3, 1037551 6778374.8 205.3, 1037551.4 6778374.5 205.3, 1037548.4 6778370.5 205.3))
-BATIMENT0000000234797791;POLYGON Z ((1037552.4 6778367.6 206.4, 1037549.2 6778363.4 206.4, 1037546.9 6778365.1 206.4, 1037550.1 6778369.3 206.4, 1037550.6 6778369 206.4, 1037552.4 6778367.6 206.4))
-BATIMENT0000000234797792;POLYGON Z ((1037550.6 6778369 205.6, 1037550.1 6778369.3 205.6, 1037548.4 6778370.5 205.6, 1037551.4 6778374.5 205.6, 1037553.5 6778372.9 205.6, 1037550.6 6778369 205.6))
-BATIMENT0000000234797795;POLYGON Z ((1037501.2 6778372.4 207.4, 1037509.4 6778366.3 207.4, 1037499 6778352.3 207.4, 1037499.5 6778351.9 207.4, 1037497.5 6778349.3 207.4, 1037487.1 6778357 207.4, 1037498.4 6778372.2 207.4, 1037501.2 6778372.4 207.4))
-BATIMENT0000000234798162;POLYGON Z ((1037500.2 6778346.6 200.8, 1037501.6 6778345.7 200.8, 1037506.2 6778342.3 200.8, 1037507.6 6778341.2 200.8, 1037505.6 6778338.4 200.8, 1037504.9 6778337.5 200.8, 1037500.7 6778340.6 200.8, 1037497.5 6778343 200.8, 1037500.2 6778346.6 200.8))
-BATIMENT0000000234798201;POLYGON Z ((1037692.1 6778353.9 198.9, 1037686.9 6778353 198.9, 1037686.7 6778354.3 198.9, 1037691.9 6778355.2 198.9, 1037692.1 6778353.9 198.9))
-BATIMENT0000000234798203;POLYGON Z ((1037691.9 6778355.2 199.2, 1037686.7 6778354.3 199.2, 1037685.3 6778363.8 199.2, 1037689.7 6778364.4 199.2, 1037690.5 6778364.5 199.2, 1037691.9 6778355.2 199.2))
-BATIMENT0000000234797952;POLYGON Z ((1037547.9 6778066.5 204.2, 1037550.7 6778064.3 204.2, 1037549.4 6778062.5 204.2, 1037548.9 6778062.8 204.2, 1037546.5 6778064.6 204.2, 1037547.9 6778066.5 204.2))
-BATIMENT0000000234797956;POLYGON Z ((1037539.7 6778067.5 198.8, 1037537.7 6778069 198.8, 1037540.9 6778073.3 198.8, 1037542.9 6778071.7 198.8, 1037542.2 6778070.7 198.8, 1037540.1 6778068 198.8, 1037539.7 6778067.5 198.8))
-BATIMENT0000000234797976;POLYGON Z ((1037532.1 6778144.4 199.9, 1037528.7 6778146.8 199.9, 1037533.5 6778153.4 199.9, 1037536.4 6778151.4 199.9, 1037536.9 6778151 199.9, 1037532.1 6778144.4 199.9))
-BATIMENT0000000234797980;POLYGON Z ((1037533.5 6778153.4 199.8, 1037530.4 6778155.6 199.8, 1037532.5 6778158.3 199.8, 1037538.3 6778154.1 199.8, 1037536.4 6778151.4 199.8, 1037533.5 6778153.4 199.8))
-BATIMENT0000000234797984;POLYGON Z ((1037529.4 6778162.8 204.1, 1037534.1 6778168.8 204.1, 1037534.6 6778169.5 204.1, 1037539 6778166.3 204.1, 1037538.2 6778165.5 204.1, 1037532.5 6778158.3 204.1, 1037530.4 6778155.6 204.1, 1037530 6778155.9 204.1, 1037529.6 6778156.1 204.1, 1037526.2 6778158.4 204.1, 1037526.6 6778158.9 204.1, 1037526.4 6778159.1 204.1, 1037529.4 6778162.8 204.1))
-BATIMENT0000000234797992;POLYGON Z ((1037541.9 6778178.8 205, 1037536.4 6778171.8 205, 1037534.6 6778169.5 205, 1037534.1 6778168.8 205, 1037531 6778171.1 205, 1037532.7 6778173.3 205, 1037533.6 6778174.3 205, 1037538.8 6778181.1 205, 1037541.9 6778178.8 205))
-BATIMENT0000000234797998;POLYGON Z ((1037520.6 6778150.6 200.6, 1037519.7 6778149.3 200.6, 1037519 6778148.4 200.6, 1037513.9 6778152 200.6, 1037515.6 6778154.3 200.6, 1037520.6 6778150.6 200.6))
-BATIMENT0000000234798017;POLYGON Z ((1037475.4 6778179.4 204.4, 1037476.5 6778180.8 204.4, 1037480.1 6778178.4 204.4, 1037478.8 6778176.6 204.4, 1037476.4 6778173.4 204.4, 1037472.2 6778167.9 204.4, 1037468.8 6778170.5 204.4, 1037474.9 6778178.7 204.4, 1037475.4 6778179.4 204.4))
-BATIMENT0000000234798079;POLYGON Z ((1037597.1 6778120.5 202.5, 1037594 6778122.8 202.5, 1037595.2 6778124.4 202.5, 1037598.2 6778122.1 202.5, 1037597.1 6778120.5 202.5))
-BATIMENT0000000234798134;POLYGON Z ((1037575.4 6778091.7 205.2, 1037573.1 6778093.4 205.2, 1037578.7 6778101.5 205.2, 1037581 6778099.8 205.2, 1037580.8 6778099.5 205.2, 1037575.4 6778091.7 205.2))
-BATIMENT0000000234798309;POLYGON Z ((1037466.2 6778098.4 204.3, 1037471.8 6778094.2 204.3, 1037466.7 6778087.4 204.3, 1037461.2 6778091.4 204.3, 1037466.2 6778098.4 204.3))
-BATIMENT0000000234798325;POLYGON Z ((1037498.2 6778116.3 199.6, 1037498.9 6778115.8 199.6, 1037495.1 6778110.8 199.6, 1037492.4 6778112.8 199.6, 1037496.3 6778117.8 199.6, 1037498.2 6778116.3 199.6))
-BATIMENT0000000234798328;POLYGON Z ((1037513.1 6778099 204.5, 1037516.1 6778103.3 204.5, 1037516.8 6778102.8 204.5, 1037524.1 6778097.4 204.5, 1037521 6778093.1 204.5, 1037513.1 6778099 204.5))
-BATIMENT0000000234798394;POLYGON Z ((1037451.1 6778157.2 205.6, 1037450.5 6778156.3 205.6, 1037447.6 6778158.4 205.6, 1037445 6778160.3 205.6, 1037450.9 6778168.4 205.6, 1037456.4 6778164.3 205.6, 1037451.1 6778157.2 205.6))
-BATIMENT0000000234798408;POLYGON Z ((1037450.9 6778168.4 205.2, 1037445 6778160.3 205.2, 1037441.6 6778162.8 205.2, 1037439 6778164.8 205.2, 1037439.3 6778165.2 205.2, 1037445 6778172.7 205.2, 1037450.9 6778168.4 205.2))
-BATIMENT0000000234798441;POLYGON Z ((1037603.1 6778164.6 199, 1037598.9 6778167.7 199, 1037601.5 6778171.1 199, 1037605 6778168.5 199, 1037605.7 6778168 199, 1037603.1 6778164.6 199))
-BATIMENT0000000234797519;POLYGON Z ((1037486.8 6778527.8 197.3, 1037483.1 6778523 197.3, 1037481.8 6778524 197.3, 1037480 6778525.3 197.3, 1037477.2 6778527.5 197.3, 1037476.7 6778527.9 197.3, 1037480.4 6778532.8 197.3, 1037486.8 6778527.8 197.3))
-BATIMENT0000000234797598;POLYGON Z ((1037442.2 6778454.9 201.9, 1037439.1 6778450.8 201.9, 1037435.1 6778453.8 201.9, 1037435.6 6778454.4 201.9, 1037438.1 6778457.9 201.9, 1037439.4 6778456.9 201.9, 1037442.2 6778454.9 201.9))
-BATIMENT0000000234797599;POLYGON Z ((1037447.2 6778444.9 202.1, 1037439.5 6778450.5 202.1, 1037439.1 6778450.8 202.1, 1037442.2 6778454.9 202.1, 1037445 6778452.7 202.1, 1037450.3 6778448.9 202.1, 1037447.2 6778444.9 202.1))
-BATIMENT0000000234797603;POLYGON Z ((1037438.1 6778457.9 201.4, 1037435.8 6778459.5 201.4, 1037439.3 6778464.3 201.4, 1037443.8 6778470.2 201.4, 1037446.7 6778468 201.4, 1037447.2 6778467.6 201.4, 1037439.4 6778456.9 201.4, 1037438.1 6778457.9 201.4))
-BATIMENT0000000234797607;POLYGON Z ((1037441.9 6778471.6 201.4, 1037443.9 6778474.3 201.4, 1037445.8 6778472.9 201.4, 1037443.8 6778470.2 201.4, 1037441.9 6778471.6 201.4))
-BATIMENT0000000234797612;POLYGON Z ((1037441.6 6778471.9 201.4, 1037440.8 6778472.5 201.4, 1037441.5 6778473.5 201.4, 1037444.7 6778478 201.4, 1037445.9 6778477.1 201.4, 1037443.9 6778474.3 201.4, 1037441.9 6778471.6 201.4, 1037441.6 6778471.9 201.4))
-BATIMENT0000000234797613;POLYGON Z ((1037443.9 6778474.3 201.4, 1037445.9 6778477.1 201.4, 1037447.8 6778475.6 201.4, 1037446.8 6778474.3 201.4, 1037445.8 6778472.9 201.4, 1037443.9 6778474.3 201.4))
-BATIMENT0000000234797699;POLYGON Z ((1037262.3 6778446.3 202.8, 1037256.5 6778450.6 202.8, 1037259.8 6778455 202.8, 1037260.7 6778456.2 202.8, 1037261 6778456.6 202.8, 1037266.1 6778463.4 202.8, 1037271.6 6778459.4 202.8, 1037262.3 6778446.3 202.8))
-BATIMENT0000000234797700;POLYGON Z ((1037248.4 6778449.2 202.6, 1037251.4 6778453.1 202.6, 1037255.9 6778449.8 202.6, 1037255.5 6778449.3 202.6, 1037253 6778445.9 202.6, 1037248.4 6778449.2 202.6))
-BATIMENT0000000234797702;POLYGON Z ((1037262.3 6778446.3 202.8, 1037271.6 6778459.4 202.8, 1037277.7 6778454.9 202.8, 1037276.3 6778453 202.8, 1037269.2 6778443.3 202.8, 1037268.2 6778442 202.8, 1037262.3 6778446.3 202.8))
-BATIMENT0000000234797711;POLYGON Z ((1037243.3 6778431.2 202.8, 1037243.8 6778431.9 202.8, 1037244 6778432.1 202.8, 1037244.2 6778432.4 202.8, 1037254.7 6778424.5 202.8, 1037253.9 6778423.3 202.8, 1037243.3 6778431.2 202.8))
-BATIMENT0000000234797719;POLYGON Z ((1037268 6778429.9 202.7, 1037264.8 6778425.7 202.7, 1037260.2 6778429.1 202.7, 1037263.2 6778433.2 202.7, 1037268 6778429.9 202.7))
-BATIMENT0000000234797720;POLYGON Z ((1037268 6778429.9 202.7, 1037263.2 6778433.2 202.7, 1037262.2 6778433.9 202.7, 1037266.1 6778439.1 202.7, 1037271.6 6778435.1 202.7, 1037268 6778429.9 202.7))
-BATIMENT0000000234797736;POLYGON Z ((1037219.3 6778376.5 201.7, 1037221.5 6778379.4 201.7, 1037222.8 6778381.1 201.7, 1037224.5 6778383.4 201.7, 1037225 6778384.1 201.7, 1037228.1 6778381.7 201.7, 1037222.5 6778374.1 201.7, 1037220.7 6778375.4 201.7, 1037219.3 6778376.5 201.7))
-BATIMENT0000000234797738;POLYGON Z ((1037224.5 6778383.4 202, 1037221.7 6778385.5 202, 1037223.9 6778388.4 202, 1037225.2 6778387.3 202, 1037226.6 6778386.2 202, 1037225 6778384.1 202, 1037224.5 6778383.4 202))
-BATIMENT0000000234797739;POLYGON Z ((1037227.1 6778370.8 201.5, 1037231.6 6778377 201.5, 1037233.3 6778375.7 201.5, 1037228.8 6778369.6 201.5, 1037227.1 6778370.8 201.5))
-BATIMENT0000000234797741;POLYGON Z ((1037230.2 6778391.1 201.7, 1037229.7 6778390.4 201.7, 1037226.6 6778386.2 201.7, 1037225.2 6778387.3 201.7, 1037231.8 6778396.3 201.7, 1037233.3 6778395.1 201.7, 1037230.2 6778391.1 201.7))
-BATIMENT0000000234797747;POLYGON Z ((1037251.6 6778384.5 201.7, 1037248.6 6778380.5 201.7, 1037244.5 6778383.6 201.7, 1037247.4 6778387.6 201.7, 1037251.6 6778384.5 201.7))
-BATIMENT0000000234797808;POLYGON Z ((1037320 6778387.8 203.7, 1037323.7 6778392.8 203.7, 1037328.7 6778389.1 203.7, 1037325 6778384.1 203.7, 1037320 6778387.8 203.7))
-BATIMENT0000000234797811;POLYGON Z ((1037210.2 6778461.1 204.4, 1037221.5 6778476.8 204.4, 1037222.6 6778476 204.4, 1037211.3 6778460.3 204.4, 1037210.2 6778461.1 204.4))
-BATIMENT0000000234797851;POLYGON Z ((1037283.2 6778483 200.5, 1037272.2 6778491.1 200.5, 1037263.1 6778497.9 200.5, 1037267 6778503.2 200.5, 1037286.8 6778488.1 200.5, 1037286.6 6778487.7 200.5, 1037283.2 6778483 200.5))
-BATIMENT0000000234797853;POLYGON Z ((1037255.5 6778488.4 200.5, 1037256.2 6778489.3 200.5, 1037256.6 6778489 200.5, 1037263.1 6778497.9 200.5, 1037272.2 6778491.1 200.5, 1037263.2 6778478.6 200.5, 1037253.5 6778485.8 200.5, 1037255.5 6778488.4 200.5))
-BATIMENT0000000234797858;POLYGON Z ((1037282.4 6778538.9 205.7, 1037308.3 6778542.8 205.7, 1037308.5 6778542.4 205.7, 1037451.9 6778563.6 205.7, 1037452.1 6778562.6 205.7, 1037453.6 6778551 205.7, 1037453.7 6778550.2 205.7, 1037310.4 6778529 205.7, 1037310.5 6778528.5 205.7, 1037284.5 6778524.7 205.7, 1037283.8 6778529.4 205.7, 1037282.8 6778536 205.7, 1037282.4 6778538.9 205.7))
-BATIMENT0000000234798175;POLYGON Z ((1037375 6778350.4 203, 1037375.7 6778349.8 203, 1037368.6 6778340.1 203, 1037367.3 6778341 203, 1037364 6778343.5 203, 1037367.6 6778348.2 203, 1037363.8 6778351.2 203, 1037367.4 6778356 203, 1037375 6778350.4 203))
-BATIMENT0000000234798182;POLYGON Z ((1037345.4 6778357 202.4, 1037344.1 6778355.2 202.4, 1037331 6778364.9 202.4, 1037332.3 6778366.6 202.4, 1037345.4 6778357 202.4))
-BATIMENT0000000234798183;POLYGON Z ((1037353.4 6778359.6 203.1, 1037349.5 6778362.5 203.1, 1037349.7 6778362.8 203.1, 1037349.3 6778363 203.1, 1037352.1 6778366.7 203.1, 1037352.4 6778366.4 203.1, 1037352.7 6778366.9 203.1, 1037356.6 6778364 203.1, 1037353.4 6778359.6 203.1))
-BATIMENT0000000234798184;POLYGON Z ((1037344.1 6778355.2 203.1, 1037345.4 6778357 203.1, 1037349.5 6778362.5 203.1, 1037353.4 6778359.6 203.1, 1037348.2 6778352.2 203.1, 1037344.1 6778355.2 203.1))
-BATIMENT0000000234798614;POLYGON Z ((1037277 6778281.7 203.7, 1037275 6778279 203.7, 1037269.5 6778283.2 203.7, 1037271.4 6778285.9 203.7, 1037277 6778281.7 203.7))
-BATIMENT0000000234798541;POLYGON Z ((1037131.6 6778344.9 206.2, 1037125.2 6778335.2 206.2, 1037129.2 6778344.5 206.2, 1037131.6 6778344.9 206.2))
-BATIMENT0000000234797878;POLYGON Z ((1037407.5 6778188.8 201.9, 1037401.4 6778180.4 201.9, 1037393.8 6778170.1 201.9, 1037392.4 6778168.2 201.9, 1037392.1 6778168.3 201.9, 1037387.2 6778172.1 201.9, 1037386.4 6778172.7 201.9, 1037375.4 6778181 201.9, 1037390.6 6778201.6 201.9, 1037407.5 6778188.8 201.9))
-BATIMENT0000000234798212;POLYGON Z ((1037366.3 6778039.2 205.5, 1037360.6 6778031.5 205.5, 1037353.6 6778036.8 205.5, 1037359.2 6778044.5 205.5, 1037366.3 6778039.2 205.5))
-BATIMENT0000000234798219;POLYGON Z ((1037358 6778009.1 207.2, 1037353.2 6778008.4 207.2, 1037348.9 6778011.6 207.2, 1037355.7 6778020.8 207.2, 1037361.3 6778016.7 207.2, 1037361.7 6778014.2 207.2, 1037358 6778009.1 207.2))
-BATIMENT0000000234798222;POLYGON Z ((1037345.7 6778013.9 206.8, 1037352.7 6778023.3 206.8, 1037355.9 6778021 206.8, 1037355.7 6778020.8 206.8, 1037348.9 6778011.6 206.8, 1037345.7 6778013.9 206.8))
-BATIMENT0000000234798237;POLYGON Z ((1037413.3 6778061.1 203.2, 1037405.8 6778066.4 203.2, 1037410.1 6778072 203.2, 1037411.4 6778073.8 203.2, 1037414.1 6778072 203.2, 1037418.9 6778068.6 203.2, 1037413.3 6778061.1 203.2))
-BATIMENT0000000234798239;POLYGON Z ((1037405 6778078.3 203.2, 1037403.7 6778076.5 203.2, 1037402.4 6778074.6 203.2, 1037400.8 6778075.8 203.2, 1037400.4 6778076.1 203.2, 1037403 6778079.8 203.2, 1037404.7 6778078.6 203.2, 1037405 6778078.3 203.2))
-BATIMENT0000000234798243;POLYGON Z ((1037390.1 6778088.9 203.3, 1037389 6778089.7 203.3, 1037388.5 6778090 203.3, 1037388 6778090.4 203.3, 1037385.1 6778092.4 203.3, 1037381.3 6778095 203.3, 1037380.5 6778095.6 203.3, 1037382.9 6778098.7 203.3, 1037392.3 6778091.9 203.3, 1037390.1 6778088.9 203.3))
-BATIMENT0000000234798244;POLYGON Z ((1037395.8 6778096.4 203.3, 1037395.1 6778095.5 203.3, 1037385.9 6778102.6 203.3, 1037382.9 6778098.7 203.3, 1037380.5 6778095.6 203.3, 1037380.4 6778095.7 203.3, 1037378.9 6778096.7 203.3, 1037384.9 6778104.6 203.3, 1037395.8 6778096.4 203.3))
-BATIMENT0000000234798247;POLYGON Z ((1037401.4 6778085 203.3, 1037402.2 6778084.4 203.3, 1037400.2 6778081.8 203.3, 1037397.9 6778083.4 203.3, 1037395.7 6778085 203.3, 1037397.7 6778087.6 203.3, 1037401.4 6778085 203.3))
-BATIMENT0000000234798248;POLYGON Z ((1037397.9 6778083.4 203.3, 1037400.2 6778081.8 203.3, 1037402.4 6778080.2 203.3, 1037403 6778079.8 203.3, 1037400.4 6778076.1 203.3, 1037392.9 6778081.4 203.3, 1037393.1 6778081.6 203.3, 1037395.7 6778085 203.3, 1037397.9 6778083.4 203.3))
-BATIMENT0000000234798255;POLYGON Z ((1037408.6 6778091.7 203.3, 1037404.1 6778086 203.3, 1037407.9 6778083.2 203.3, 1037407 6778081.9 203.3, 1037406.6 6778081.4 203.3, 1037402.2 6778084.4 203.3, 1037401.4 6778085 203.3, 1037407.4 6778092.6 203.3, 1037408.6 6778091.7 203.3))
-BATIMENT0000000234798365;POLYGON Z ((1037443.7 6778117.9 202.5, 1037442.5 6778118.8 202.5, 1037441.5 6778119.6 202.5, 1037440.4 6778120.5 202.5, 1037441.4 6778121.8 202.5, 1037444.3 6778119.3 202.5, 1037447.6 6778123.9 202.5, 1037445.5 6778125.5 202.5, 1037446 6778126.2 202.5, 1037448.9 6778124.1 202.5, 1037444.1 6778117.5 202.5, 1037443.7 6778117.9 202.5))
-BATIMENT0000000234798366;POLYGON Z ((1037446 6778126.2 202.5, 1037447.3 6778127.9 202.5, 1037449.9 6778125.9 202.5, 1037450.1 6778125.7 202.5, 1037448.9 6778124.1 202.5, 1037446 6778126.2 202.5))
-BATIMENT0000000234798377;POLYGON Z ((1037454.3 6778139.2 202.6, 1037455.3 6778140.6 202.6, 1037457.9 6778138.6 202.6, 1037458.5 6778138.2 202.6, 1037463.4 6778144.8 202.6, 1037464.2 6778144.2 202.6, 1037458.2 6778136.2 202.6, 1037457.9 6778136.4 202.6, 1037454.2 6778139.1 202.6, 1037454.3 6778139.2 202.6))
-BATIMENT0000000234798379;POLYGON Z ((1037447.3 6778144.2 202.5, 1037443.6 6778147 202.5, 1037445.8 6778149.9 202.5, 1037446.6 6778151 202.5, 1037448 6778150 202.5, 1037456.3 6778143.8 202.5, 1037457.2 6778143.1 202.5, 1037455.3 6778140.6 202.5, 1037454.3 6778139.2 202.5, 1037454.2 6778139.1 202.5, 1037453.3 6778139.7 202.5, 1037447.9 6778143.7 202.5, 1037447.3 6778144.2 202.5))
-BATIMENT0000000234798381;POLYGON Z ((1037425.4 6778150.3 202.6, 1037443.1 6778137.3 202.6, 1037442.4 6778136.4 202.6, 1037435 6778141.7 202.6, 1037428.4 6778146.6 202.6, 1037424.6 6778149.3 202.6, 1037425.4 6778150.3 202.6))
-BATIMENT0000000234798385;POLYGON Z ((1037433.2 6778133.4 202.6, 1037427.4 6778137.8 202.6, 1037429.8 6778140.9 202.6, 1037432.7 6778138.7 202.6, 1037435.6 6778136.6 202.6, 1037433.2 6778133.4 202.6))
-BATIMENT0000000234798397;POLYGON Z ((1037443 6778152.1 202.5, 1037446.5 6778156.8 202.5, 1037447.6 6778158.4 202.5, 1037450.5 6778156.3 202.5, 1037446.6 6778151 202.5, 1037445.8 6778149.9 202.5, 1037443 6778152.1 202.5))
-BATIMENT0000000234798404;POLYGON Z ((1037447.6 6778158.4 202.6, 1037446.5 6778156.8 202.6, 1037443.8 6778158.8 202.6, 1037445 6778160.3 202.6, 1037447.6 6778158.4 202.6))
-BATIMENT0000000234798520;POLYGON Z ((1037359.9 6778147.1 202.9, 1037354.2 6778139.5 202.9, 1037351.2 6778141.8 202.9, 1037349.6 6778142.9 202.9, 1037351.4 6778145.2 202.9, 1037359.4 6778155.7 202.9, 1037363.8 6778152.4 202.9, 1037359.9 6778147.1 202.9))
-BATIMENT0000000234798521;POLYGON Z ((1037365.8 6778150.9 202.9, 1037361.9 6778145.6 202.9, 1037359.9 6778147.1 202.9, 1037363.8 6778152.4 202.9, 1037365.8 6778150.9 202.9))
-BATIMENT0000000234798578;POLYGON Z ((1037231.2 6778144.8 202.9, 1037235.7 6778141.6 202.9, 1037233.7 6778138.9 202.9, 1037229.3 6778142.2 202.9, 1037231.2 6778144.8 202.9))
-BATIMENT0000000234798580;POLYGON Z ((1037231.2 6778144.8 202.8, 1037234.9 6778149.7 202.8, 1037239.3 6778146.5 202.8, 1037235.7 6778141.6 202.8, 1037231.2 6778144.8 202.8))
-BATIMENT0000000234798630;POLYGON Z ((1037317.3 6778182.1 200.5, 1037314.6 6778184.1 200.5, 1037317.4 6778187.9 200.5, 1037320.2 6778185.8 200.5, 1037317.3 6778182.1 200.5))
-BATIMENT0000000234798681;POLYGON Z ((1037257 6778102.2 200.4, 1037253.1 6778105.1 200.4, 1037258.1 6778112 200.4, 1037262.1 6778109 200.4, 1037257 6778102.2 200.4))
-BATIMENT0000000234798689;POLYGON Z ((1037253.9 6778082 202.4, 1037256.2 6778085.2 202.4, 1037256.9 6778084.7 202.4, 1037258.5 6778083.5 202.4, 1037256.2 6778080.3 202.4, 1037253.9 6778082 202.4))
-BATIMENT0000000234798690;POLYGON Z ((1037258.5 6778083.5 202.8, 1037256.9 6778084.7 202.8, 1037258.7 6778087.3 202.8, 1037260.4 6778086.1 202.8, 1037258.5 6778083.5 202.8))
-BATIMENT0000000234798774;POLYGON Z ((1037228.4 6778226 202.7, 1037233.8 6778221.9 202.7, 1037230.8 6778217.9 202.7, 1037235 6778214.7 202.7, 1037232.6 6778211.7 202.7, 1037223.1 6778218.9 202.7, 1037228.4 6778226 202.7))
-BATIMENT0000000234798776;POLYGON Z ((1037223.1 6778218.9 202.7, 1037232.6 6778211.7 202.7, 1037235 6778214.7 202.7, 1037235.6 6778214.2 202.7, 1037232.6 6778210.2 202.7, 1037222.3 6778217.7 202.7, 1037223.1 6778218.9 202.7))
-BATIMENT0000000234798786;POLYGON Z ((1037317.9 6778082 201.8, 1037315.4 6778078.6 201.8, 1037311.1 6778081.7 201.8, 1037312.8 6778084 201.8, 1037313.7 6778085.2 201.8, 1037315.8 6778083.6 201.8, 1037317.9 6778082 201.8))
-BATIMENT0000000234798793;POLYGON Z ((1037335 6778083.4 202.7, 1037326.2 6778090 202.7, 1037330.2 6778095.2 202.7, 1037338.9 6778088.7 202.7, 1037335 6778083.4 202.7))
-BATIMENT0000000234798807;POLYGON Z ((1037232.7 6778028.9 207.5, 1037237.3 6778035.3 207.5, 1037244 6778030.2 207.5, 1037239.3 6778023.7 207.5, 1037232.7 6778028.9 207.5))
-BATIMENT0000000234798841;POLYGON Z ((1037309.9 6778054.4 202.6, 1037309.1 6778053.3 202.6, 1037303.6 6778046.1 202.6, 1037291 6778055.4 202.6, 1037295.7 6778061.8 202.6, 1037297.2 6778063.9 202.6, 1037309.9 6778054.4 202.6))
-BATIMENT0000000234798846;POLYGON Z ((1037261.7 6778159.1 203.1, 1037266.9 6778166.1 203.1, 1037286.3 6778151.6 203.1, 1037281.1 6778144.6 203.1, 1037261.7 6778159.1 203.1))
-BATIMENT0000000234797701;POLYGON Z ((1037241.3 6778439.8 202.6, 1037248.4 6778449.2 202.6, 1037253 6778445.9 202.6, 1037253.7 6778445.4 202.6, 1037246.6 6778435.7 202.6, 1037241.3 6778439.8 202.6))
-BATIMENT0000000234797705;POLYGON Z ((1037229.5 6778448.9 202.6, 1037239.8 6778440.9 202.6, 1037237 6778437.1 202.6, 1037235.5 6778438.2 202.6, 1037233.7 6778439.6 202.6, 1037227 6778444.8 202.6, 1037226.7 6778445.1 202.6, 1037229.5 6778448.9 202.6))
-BATIMENT0000000234797706;POLYGON Z ((1037244 6778432.1 202.7, 1037243.8 6778431.9 202.7, 1037237.7 6778436.6 202.7, 1037237 6778437.1 202.7, 1037239.8 6778440.9 202.7, 1037241.3 6778439.8 202.7, 1037246.6 6778435.7 202.7, 1037244.2 6778432.4 202.7, 1037244 6778432.1 202.7))
-BATIMENT0000000234797752;POLYGON Z ((1037218.1 6778396.9 202.5, 1037218.8 6778397.8 202.5, 1037221.4 6778401.4 202.5, 1037222.7 6778403.1 202.5, 1037224.9 6778401.4 202.5, 1037220.3 6778395.2 202.5, 1037218.1 6778396.9 202.5))
-BATIMENT0000000234797754;POLYGON Z ((1037211 6778387.1 202.5, 1037213.5 6778390.6 202.5, 1037217.6 6778396.1 202.5, 1037218.1 6778396.9 202.5, 1037220.3 6778395.2 202.5, 1037222.1 6778393.7 202.5, 1037214.9 6778384.2 202.5, 1037211 6778387.1 202.5))
-BATIMENT0000000234797756;POLYGON Z ((1037210.7 6778387.3 202.7, 1037208.9 6778385 202.7, 1037206 6778387.1 202.7, 1037210.3 6778393 202.7, 1037213.5 6778390.6 202.7, 1037211 6778387.1 202.7, 1037210.7 6778387.3 202.7))
-BATIMENT0000000234797852;POLYGON Z ((1037274.3 6778503.8 200.6, 1037281.6 6778498.3 200.6, 1037290 6778491.9 200.6, 1037286.8 6778488.1 200.6, 1037267 6778503.2 200.6, 1037269.9 6778507.2 200.6, 1037274.3 6778503.8 200.6))
-BATIMENT0000000234798215;POLYGON Z ((1037355.7 6778020.8 206, 1037355.9 6778021 206, 1037352.7 6778023.3 206, 1037339.5 6778033 206, 1037334.6 6778036.6 206, 1037333.2 6778037.6 206, 1037338.4 6778044.6 206, 1037333.5 6778048.2 206, 1037335.2 6778050.5 206, 1037335.4 6778050.7 206, 1037343.2 6778044.9 206, 1037342.8 6778044.4 206, 1037342.6 6778044.5 206, 1037338.5 6778039.2 206, 1037338.7 6778037.8 206, 1037339.7 6778038 206, 1037340.2 6778035.3 206, 1037339.4 6778035 206, 1037360.9 6778018.8 206, 1037361.3 6778016.7 206, 1037355.7 6778020.8 206))
-BATIMENT0000000234798217;POLYGON Z ((1037332.7 6778023.5 206.3, 1037339.5 6778033 206.3, 1037352.7 6778023.3 206.3, 1037345.7 6778013.9 206.3, 1037332.7 6778023.5 206.3))
-BATIMENT0000000234798220;POLYGON Z ((1037333.2 6778037.6 205.9, 1037334.6 6778036.6 205.9, 1037327.7 6778027.2 205.9, 1037321.4 6778031.9 205.9, 1037328.3 6778041.2 205.9, 1037333.2 6778037.6 205.9))
-BATIMENT0000000234798221;POLYGON Z ((1037333.5 6778048.2 205.8, 1037338.4 6778044.6 205.8, 1037333.2 6778037.6 205.8, 1037328.3 6778041.2 205.8, 1037333.5 6778048.2 205.8))
-BATIMENT0000000234798229;POLYGON Z ((1037376.3 6778098.6 203.4, 1037374.2 6778095.4 203.4, 1037378 6778092.5 203.4, 1037376.1 6778090 203.4, 1037368.6 6778095.3 203.4, 1037372.9 6778100.9 203.4, 1037376.3 6778098.6 203.4))
-BATIMENT0000000234798240;POLYGON Z ((1037393.2 6778086.7 203.3, 1037390.7 6778083.2 203.3, 1037387.3 6778085.6 203.3, 1037385.4 6778087 203.3, 1037388 6778090.4 203.3, 1037388.5 6778090 203.3, 1037389 6778089.7 203.3, 1037390.1 6778088.9 203.3, 1037393.2 6778086.7 203.3))
-BATIMENT0000000234798242;POLYGON Z ((1037395.7 6778085 203.3, 1037393.1 6778081.6 203.3, 1037391.6 6778082.6 203.3, 1037390.7 6778083.2 203.3, 1037393.2 6778086.7 203.3, 1037395.7 6778085 203.3))
-BATIMENT0000000234798245;POLYGON Z ((1037397.7 6778087.6 203.3, 1037395.7 6778085 203.3, 1037393.2 6778086.7 203.3, 1037390.1 6778088.9 203.3, 1037392.3 6778091.9 203.3, 1037395.1 6778095.5 203.3, 1037395.8 6778096.4 203.3, 1037398.1 6778099.5 203.3, 1037400.2 6778098 203.3, 1037403.7 6778095.3 203.3, 1037397.7 6778087.6 203.3))
-BATIMENT0000000234798265;POLYGON Z ((1037380.5 6778095.6 203.3, 1037381.3 6778095 203.3, 1037380.3 6778093.7 203.3, 1037379.4 6778094.3 203.3, 1037380.4 6778095.7 203.3, 1037380.5 6778095.6 203.3))
-BATIMENT0000000234798270;POLYGON Z ((1037402.2 6778084.4 203.2, 1037406.6 6778081.4 203.2, 1037404.7 6778078.6 203.2, 1037403 6778079.8 203.2, 1037402.4 6778080.2 203.2, 1037400.2 6778081.8 203.2, 1037402.2 6778084.4 203.2))
-BATIMENT0000000234798487;POLYGON Z ((1037346.1 6778106.4 203.4, 1037347 6778105.7 203.4, 1037346.3 6778104.8 203.4, 1037345.4 6778105.5 203.4, 1037346.1 6778106.4 203.4))
-BATIMENT0000000234798493;POLYGON Z ((1037330.9 6778114.5 203.4, 1037332.4 6778116.6 203.4, 1037335.4 6778114.3 203.4, 1037335.6 6778114.2 203.4, 1037334 6778112.1 203.4, 1037330.9 6778114.5 203.4))
-BATIMENT0000000234798567;POLYGON Z ((1037202.8 6778144.1 201.4, 1037201.9 6778142.8 201.4, 1037197.1 6778136.4 201.4, 1037196.6 6778135.7 201.4, 1037191.1 6778139.7 201.4, 1037192.3 6778141.3 201.4, 1037195.7 6778138.7 201.4, 1037201.9 6778146.9 201.4, 1037203.8 6778145.5 201.4, 1037202.8 6778144.1 201.4))
-BATIMENT0000000234798572;POLYGON Z ((1037215.2 6778137.6 203.3, 1037209.5 6778141.6 203.3, 1037212.2 6778145.3 203.3, 1037214 6778143.9 203.3, 1037216.8 6778147.7 203.3, 1037220.6 6778144.9 203.3, 1037215.2 6778137.6 203.3))
-BATIMENT0000000234798573;POLYGON Z ((1037221.9 6778143.9 203.2, 1037223.6 6778142.7 203.2, 1037224.3 6778143.7 203.2, 1037225.3 6778145.1 203.2, 1037226.7 6778144 203.2, 1037219.7 6778134.5 203.2, 1037215.2 6778137.6 203.2, 1037220.6 6778144.9 203.2, 1037221.9 6778143.9 203.2))
-BATIMENT0000000234798621;POLYGON Z ((1037291.1 6778218.6 201.7, 1037280 6778226.9 201.7, 1037291.4 6778241.9 201.7, 1037292.1 6778242.8 201.7, 1037303.1 6778234.5 201.7, 1037291.1 6778218.6 201.7))
-BATIMENT0000000234798629;POLYGON Z ((1037317.4 6778187.9 200.6, 1037314.6 6778184.1 200.6, 1037312.2 6778180.9 200.6, 1037305.9 6778185.6 200.6, 1037308.2 6778188.9 200.6, 1037311 6778192.6 200.6, 1037317.4 6778187.9 200.6))
-BATIMENT0000000234798631;POLYGON Z ((1037311 6778192.6 200.8, 1037308.2 6778188.9 200.8, 1037305.4 6778191 200.8, 1037308.2 6778194.8 200.8, 1037311 6778192.6 200.8))
-BATIMENT0000000234798638;POLYGON Z ((1037296.8 6778087.1 203.3, 1037297.7 6778086.4 203.3, 1037294.9 6778082.7 203.3, 1037294.3 6778083.2 203.3, 1037294 6778083.3 203.3, 1037296.8 6778087.1 203.3))
-BATIMENT0000000234798643;POLYGON Z ((1037301.2 6778091 203.4, 1037300.2 6778091.7 203.4, 1037302.9 6778095.3 203.4, 1037303.9 6778094.6 203.4, 1037301.2 6778091 203.4))
-BATIMENT0000000234798777;POLYGON Z ((1037241.3 6778243.4 202.6, 1037251.6 6778235.7 202.6, 1037238.6 6778218.3 202.6, 1037238.1 6778218.7 202.6, 1037240.3 6778221.6 202.6, 1037230.5 6778228.9 202.6, 1037241.3 6778243.4 202.6))
-BATIMENT0000000234798783;POLYGON Z ((1037315.4 6778078.6 201.8, 1037313 6778075.4 201.8, 1037308.8 6778078.5 201.8, 1037310.9 6778081.4 201.8, 1037311.1 6778081.7 201.8, 1037315.4 6778078.6 201.8))
-BATIMENT0000000234798792;POLYGON Z ((1037326.2 6778090 202.7, 1037322.6 6778092.7 202.7, 1037326.5 6778098 202.7, 1037330.2 6778095.2 202.7, 1037326.2 6778090 202.7))
-BATIMENT0000000234798824;POLYGON Z ((1037326.3 6778203.2 200.5, 1037322.7 6778205.9 200.5, 1037326.4 6778210.7 200.5, 1037329.9 6778208.1 200.5, 1037326.3 6778203.2 200.5))
-BATIMENT0000000234797902;POLYGON Z ((1037595.8 6778242.4 203.5, 1037596.6 6778243.4 203.5, 1037598.9 6778246.6 203.5, 1037602.7 6778251.7 203.5, 1037606.5 6778249 203.5, 1037599.2 6778238.9 203.5, 1037595.4 6778241.8 203.5, 1037595.8 6778242.4 203.5))
-BATIMENT0000000234797893;POLYGON Z ((1037600.4 6778270.1 203.1, 1037601.7 6778269.1 203.1, 1037606.1 6778265.8 203.1, 1037605 6778264.4 203.1, 1037600.7 6778267.7 203.1, 1037600 6778266.8 203.1, 1037596.3 6778269.6 203.1, 1037598 6778271.9 203.1, 1037600.4 6778270.1 203.1))
-BATIMENT0000000234797896;POLYGON Z ((1037591.4 6778260.1 203.4, 1037587.9 6778255.1 203.4, 1037586.3 6778256.2 203.4, 1037587.1 6778257.3 203.4, 1037589.5 6778260.5 203.4, 1037590 6778261.1 203.4, 1037591.4 6778260.1 203.4))
-BATIMENT0000000234797897;POLYGON Z ((1037598.7 6778254.7 203.4, 1037591.4 6778260.1 203.4, 1037590 6778261.1 203.4, 1037591.3 6778262.9 203.4, 1037600.4 6778256.2 203.4, 1037599 6778254.5 203.4, 1037598.7 6778254.7 203.4))
-BATIMENT0000000234797900;POLYGON Z ((1037592.8 6778244.6 203.5, 1037584.8 6778250.1 203.5, 1037584.9 6778250.3 203.5, 1037584.5 6778250.6 203.5, 1037585.3 6778251.6 203.5, 1037593.6 6778245.6 203.5, 1037592.8 6778244.6 203.5))
-BATIMENT0000000234797905;POLYGON Z ((1037604.7 6778235.6 203.5, 1037606.6 6778234.1 203.5, 1037606.4 6778233.8 203.5, 1037606.2 6778233.7 203.5, 1037603.4 6778235.8 203.5, 1037600.1 6778238.3 203.5, 1037600.4 6778238.8 203.5, 1037604.7 6778235.6 203.5))
-BATIMENT0000000234797906;POLYGON Z ((1037602.2 6778232.6 203.6, 1037601.8 6778233 203.6, 1037602.8 6778234.3 203.6, 1037603.4 6778235.8 203.6, 1037606.2 6778233.7 203.6, 1037605.6 6778232.8 203.6, 1037600.9 6778226.5 203.6, 1037598.8 6778228 203.6, 1037602.2 6778232.6 203.6))
-BATIMENT0000000234797908;POLYGON Z ((1037604.8 6778276.7 203.1, 1037605.1 6778276.5 203.1, 1037604 6778275 203.1, 1037603 6778273.7 203.1, 1037602.7 6778273.3 203.1, 1037599.5 6778275.7 203.1, 1037601.9 6778278.9 203.1, 1037604.8 6778276.7 203.1))
-BATIMENT0000000234797912;POLYGON Z ((1037610.6 6778262.4 203.1, 1037609.4 6778263.3 203.1, 1037607.7 6778264.6 203.1, 1037606.1 6778265.8 203.1, 1037601.7 6778269.1 203.1, 1037600.4 6778270.1 203.1, 1037602.7 6778273.3 203.1, 1037603 6778273.7 203.1, 1037604 6778272.9 203.1, 1037613.3 6778265.9 203.1, 1037610.6 6778262.4 203.1))
-BATIMENT0000000234797917;POLYGON Z ((1037623.6 6778279.5 203.1, 1037618.8 6778273.1 203.1, 1037610.9 6778278.9 203.1, 1037612.3 6778280.7 203.1, 1037615.6 6778285.4 203.1, 1037623.6 6778279.5 203.1))
-BATIMENT0000000234797923;POLYGON Z ((1037621.8 6778254 203.2, 1037623.2 6778252.9 203.2, 1037621.2 6778250.2 203.2, 1037614.9 6778254.9 203.2, 1037616.9 6778257.7 203.2, 1037621.8 6778254 203.2))
-BATIMENT0000000234797927;POLYGON Z ((1037633.2 6778263.3 203.2, 1037630.7 6778259.9 203.2, 1037627.8 6778262 203.2, 1037630.3 6778265.4 203.2, 1037633.2 6778263.3 203.2))
-BATIMENT0000000234797932;POLYGON Z ((1037605.4 6778255.4 203.4, 1037604.7 6778254.4 203.4, 1037602.7 6778251.7 203.4, 1037599 6778254.5 203.4, 1037600.4 6778256.2 203.4, 1037603.1 6778259.8 203.4, 1037605.4 6778258.1 203.4, 1037606.7 6778257.1 203.4, 1037605.4 6778255.4 203.4))
-BATIMENT0000000234797933;POLYGON Z ((1037604.7 6778254.4 203.5, 1037609.2 6778251 203.5, 1037607.2 6778248.4 203.5, 1037606.5 6778249 203.5, 1037602.7 6778251.7 203.5, 1037604.7 6778254.4 203.5))
-BATIMENT0000000234797934;POLYGON Z ((1037607.2 6778248.4 203.4, 1037607.4 6778248.2 203.4, 1037600.4 6778238.8 203.4, 1037600.1 6778238.3 203.4, 1037599.2 6778238.9 203.4, 1037606.5 6778249 203.4, 1037607.2 6778248.4 203.4))
-BATIMENT0000000234797938;POLYGON Z ((1037641.3 6778266.3 203.1, 1037636.9 6778260.5 203.1, 1037635.5 6778261.6 203.1, 1037634.5 6778262.3 203.1, 1037633.2 6778263.3 203.1, 1037630.3 6778265.4 203.1, 1037634.6 6778271.3 203.1, 1037641.3 6778266.3 203.1))
-BATIMENT0000000234798005;POLYGON Z ((1037626.8 6778208.2 200.3, 1037633.9 6778217.9 200.3, 1037640.9 6778212.8 200.3, 1037633.8 6778203.1 200.3, 1037626.8 6778208.2 200.3))
-BATIMENT0000000234798014;POLYGON Z ((1037473 6778181.2 202.7, 1037475.8 6778185.2 202.7, 1037478.4 6778183.3 202.7, 1037476.9 6778181.4 202.7, 1037476.5 6778180.8 202.7, 1037475.4 6778179.4 202.7, 1037473 6778181.2 202.7))
-BATIMENT0000000234798026;POLYGON Z ((1037483.8 6778190.8 202.3, 1037483.6 6778190.9 202.3, 1037486.4 6778194.5 202.3, 1037487.1 6778195.5 202.3, 1037487.5 6778196.1 202.3, 1037491 6778193.5 202.3, 1037487.2 6778188.4 202.3, 1037486 6778189.1 202.3, 1037485.7 6778189.4 202.3, 1037483.9 6778190.7 202.3, 1037483.8 6778190.8 202.3))
-BATIMENT0000000234798029;POLYGON Z ((1037482 6778197.9 202.5, 1037484.1 6778200.6 202.5, 1037488.5 6778197.5 202.5, 1037487.5 6778196.1 202.5, 1037487.1 6778195.5 202.5, 1037486.4 6778194.5 202.5, 1037482 6778197.9 202.5))
-BATIMENT0000000234798030;POLYGON Z ((1037488.5 6778197.5 202.5, 1037484.1 6778200.6 202.5, 1037488 6778205.5 202.5, 1037492.2 6778202.4 202.5, 1037488.5 6778197.5 202.5))
-BATIMENT0000000234798032;POLYGON Z ((1037492.5 6778184.5 202.1, 1037491.4 6778185.3 202.1, 1037492.1 6778186.2 202.1, 1037494 6778188.7 202.1, 1037492.3 6778190 202.1, 1037493.5 6778191.7 202.1, 1037496.4 6778189.6 202.1, 1037492.5 6778184.5 202.1))
-BATIMENT0000000234798034;POLYGON Z ((1037459.3 6778193.9 202.5, 1037461.9 6778197.3 202.5, 1037468 6778192.6 202.5, 1037465.3 6778189.1 202.5, 1037458.4 6778194 202.5, 1037458.7 6778194.4 202.5, 1037459.3 6778193.9 202.5))
-BATIMENT0000000234798037;POLYGON Z ((1037483.2 6778191.2 202.5, 1037479.8 6778193.8 202.5, 1037476 6778196.6 202.5, 1037473.7 6778198.3 202.5, 1037476.4 6778202.1 202.5, 1037479.1 6778200.1 202.5, 1037482 6778197.9 202.5, 1037486.4 6778194.5 202.5, 1037483.6 6778190.9 202.5, 1037483.2 6778191.2 202.5))
-BATIMENT0000000234798038;POLYGON Z ((1037472 6778205.3 202.5, 1037473.4 6778207.3 202.5, 1037474.3 6778206.6 202.5, 1037474.7 6778206.9 202.5, 1037477.7 6778211.4 202.5, 1037481.6 6778208.6 202.5, 1037479.9 6778206.2 202.5, 1037479.5 6778206.5 202.5, 1037476.7 6778202.4 202.5, 1037476.4 6778202.1 202.5, 1037473.7 6778198.3 202.5, 1037473 6778198.8 202.5, 1037471.9 6778199.6 202.5, 1037469.3 6778201.6 202.5, 1037472 6778205.3 202.5))
-BATIMENT0000000234798040;POLYGON Z ((1037466.7 6778217.9 202.6, 1037470.5 6778215.2 202.6, 1037472.1 6778217.2 202.6, 1037472.3 6778217.1 202.6, 1037472.4 6778217.3 202.6, 1037473.8 6778216.2 202.6, 1037473.6 6778216 202.6, 1037472.6 6778213.6 202.6, 1037471.5 6778211 202.6, 1037465.1 6778215.7 202.6, 1037466.7 6778217.9 202.6))
-BATIMENT0000000234798043;POLYGON Z ((1037471.5 6778211 202.6, 1037472.6 6778213.6 202.6, 1037473.6 6778216 202.6, 1037478.4 6778212.5 202.6, 1037477.7 6778211.4 202.6, 1037475.5 6778213.1 202.6, 1037471.8 6778208.2 202.6, 1037470.2 6778209.3 202.6, 1037471.5 6778211 202.6))
-BATIMENT0000000234798142;POLYGON Z ((1037489.2 6778339.1 203.3, 1037483 6778330.8 203.3, 1037481.3 6778332 203.3, 1037487.7 6778340.3 203.3, 1037489.2 6778339.1 203.3))
-BATIMENT0000000234798071;POLYGON Z ((1037556.3 6778209.8 199.9, 1037558.7 6778213.1 199.9, 1037559.9 6778212.2 199.9, 1037563.1 6778209.9 199.9, 1037560.6 6778206.6 199.9, 1037556.3 6778209.8 199.9))
-BATIMENT0000000234798101;POLYGON Z ((1037635.4 6778304.2 202.3, 1037637.3 6778306.8 202.3, 1037638 6778306.3 202.3, 1037641.2 6778303.9 202.3, 1037640.4 6778302.8 202.3, 1037640.3 6778302.7 202.3, 1037639.9 6778302.2 202.3, 1037639.3 6778301.4 202.3, 1037635.4 6778304.2 202.3))
-BATIMENT0000000234798103;POLYGON Z ((1037638 6778306.3 202.1, 1037640.5 6778309.8 202.1, 1037643.8 6778307.3 202.1, 1037641.2 6778303.9 202.1, 1037638 6778306.3 202.1))
-BATIMENT0000000234798116;POLYGON Z ((1037620.2 6778304.3 203.1, 1037623.1 6778302.1 203.1, 1037617.8 6778294.9 203.1, 1037606.8 6778303.1 203.1, 1037612.2 6778310.3 203.1, 1037620.2 6778304.3 203.1))
-BATIMENT0000000234798120;POLYGON Z ((1037624.9 6778289.5 202.3, 1037629.2 6778295 202.3, 1037631 6778295.3 202.3, 1037631.4 6778295 202.3, 1037633.3 6778293.6 202.3, 1037629.8 6778288.9 202.3, 1037628.3 6778287 202.3, 1037624.9 6778289.5 202.3))
-BATIMENT0000000234798139;POLYGON Z ((1037480.1 6778330.3 203, 1037481.3 6778332 203, 1037483 6778330.8 203, 1037489.7 6778325.7 203, 1037491.5 6778324.2 203, 1037490.6 6778323 203, 1037490.3 6778322.6 203, 1037480.1 6778330.3 203))
-BATIMENT0000000234798140;POLYGON Z ((1037497.5 6778332.4 202.7, 1037492 6778324.9 202.7, 1037491.5 6778324.2 202.7, 1037489.7 6778325.7 202.7, 1037495.7 6778333.8 202.7, 1037497.5 6778332.4 202.7))
-BATIMENT0000000234798143;POLYGON Z ((1037500.7 6778317.8 203, 1037499.5 6778316.2 203, 1037493.8 6778320.6 203, 1037495 6778322.2 203, 1037500.7 6778317.8 203))
-BATIMENT0000000234798145;POLYGON Z ((1037500.7 6778340.6 202.6, 1037504.9 6778337.5 202.6, 1037504 6778336.2 202.6, 1037500 6778330.7 202.6, 1037499.9 6778330.6 202.6, 1037497.5 6778332.4 202.6, 1037495.7 6778333.8 202.6, 1037498.1 6778337.1 202.6, 1037500.7 6778340.6 202.6))
-BATIMENT0000000234798147;POLYGON Z ((1037504.9 6778314.6 203, 1037507.3 6778317.7 203, 1037506 6778318.7 203, 1037507.1 6778320.1 203, 1037510.7 6778317.4 203, 1037506.7 6778312.1 203, 1037504.9 6778314.6 203))
-BATIMENT0000000234798148;POLYGON Z ((1037505.6 6778310.6 203.1, 1037501.9 6778313.3 203.1, 1037502.4 6778314 203.1, 1037504.4 6778316.7 203.1, 1037505.4 6778318 203.1, 1037506 6778318.7 203.1, 1037507.3 6778317.7 203.1, 1037504.9 6778314.6 203.1, 1037506.7 6778312.1 203.1, 1037505.6 6778310.6 203.1))
-BATIMENT0000000234798155;POLYGON Z ((1037515.6 6778331.4 202.8, 1037509.2 6778336.1 202.8, 1037511.1 6778338.6 202.8, 1037512.5 6778337.6 202.8, 1037513.7 6778336.8 202.8, 1037515.2 6778335.6 202.8, 1037517.5 6778333.9 202.8, 1037515.6 6778331.4 202.8))
-BATIMENT0000000234798156;POLYGON Z ((1037517.5 6778333.9 202.9, 1037519.8 6778336.9 202.9, 1037520.9 6778336 202.9, 1037521.9 6778335.2 202.9, 1037519.7 6778332.2 202.9, 1037517.5 6778333.9 202.9))
-BATIMENT0000000234798158;POLYGON Z ((1037511.1 6778338.6 202.7, 1037509.2 6778336.1 202.7, 1037507.5 6778333.7 202.7, 1037504 6778336.2 202.7, 1037504.9 6778337.5 202.7, 1037505.6 6778338.4 202.7, 1037507.6 6778341.2 202.7, 1037509.7 6778339.7 202.7, 1037511.1 6778338.6 202.7))
-BATIMENT0000000234798159;POLYGON Z ((1037517.7 6778339 202.8, 1037515.2 6778335.6 202.8, 1037513.7 6778336.8 202.8, 1037512.5 6778337.6 202.8, 1037515 6778341 202.8, 1037517.7 6778339 202.8))
-BATIMENT0000000234798165;POLYGON Z ((1037526.5 6778334.2 202.9, 1037523.1 6778336.8 202.9, 1037523.7 6778337.6 202.9, 1037522.7 6778338.3 202.9, 1037524.2 6778340.3 202.9, 1037525.1 6778339.8 202.9, 1037528.8 6778337.2 202.9, 1037526.5 6778334.2 202.9))
-BATIMENT0000000234798417;POLYGON Z ((1037573.7 6778346.3 202.6, 1037571.3 6778343.1 202.6, 1037568 6778345.4 202.6, 1037570.4 6778348.6 202.6, 1037573.7 6778346.3 202.6))
-BATIMENT0000000234798454;POLYGON Z ((1037508.4 6778264.6 204.7, 1037508.9 6778264.3 204.7, 1037510.6 6778263 204.7, 1037511.9 6778262 204.7, 1037513.4 6778260.9 204.7, 1037513.1 6778260.5 204.7, 1037511.6 6778258.4 204.7, 1037511.3 6778258.1 204.7, 1037508 6778260.6 204.7, 1037506.1 6778262.1 204.7, 1037508.1 6778264.9 204.7, 1037508.4 6778264.6 204.7))
-BATIMENT0000000234798455;POLYGON Z ((1037511.6 6778258.4 204.8, 1037513.1 6778260.5 204.8, 1037513.4 6778260.9 204.8, 1037514.1 6778260.4 204.8, 1037517.2 6778258 204.8, 1037516.7 6778257.3 204.8, 1037515.4 6778255.6 204.8, 1037511.6 6778258.4 204.8))
-BATIMENT0000000234798457;POLYGON Z ((1037517.9 6778258.9 204.7, 1037517.2 6778258 204.7, 1037514.1 6778260.4 204.7, 1037517 6778264.2 204.7, 1037518.6 6778266.4 204.7, 1037521.7 6778264.1 204.7, 1037517.9 6778258.9 204.7))
-BATIMENT0000000234798458;POLYGON Z ((1037513.4 6778260.9 204.7, 1037511.9 6778262 204.7, 1037512.2 6778262.4 204.7, 1037511.8 6778264.7 204.7, 1037513.4 6778266.9 204.7, 1037517 6778264.2 204.7, 1037514.1 6778260.4 204.7, 1037513.4 6778260.9 204.7))
-BATIMENT0000000234798459;POLYGON Z ((1037538 6778243 204.8, 1037536.6 6778244 204.8, 1037537.8 6778245.6 204.8, 1037539.2 6778244.6 204.8, 1037538 6778243 204.8))
-BATIMENT0000000234798462;POLYGON Z ((1037505.1 6778247.6 204.8, 1037504.8 6778247.8 204.8, 1037499.9 6778251.5 204.8, 1037501.8 6778254 204.8, 1037507 6778250.1 204.8, 1037505.1 6778247.6 204.8))
-BATIMENT0000000234798473;POLYGON Z ((1037511.8 6778265.2 204.7, 1037511.8 6778264.7 204.7, 1037510.6 6778263 204.7, 1037508.9 6778264.3 204.7, 1037509.4 6778264.8 204.7, 1037511.8 6778265.2 204.7))
-BATIMENT0000000234798474;POLYGON Z ((1037517 6778264.2 204.7, 1037513.4 6778266.9 204.7, 1037511.8 6778268.1 204.7, 1037513.4 6778270.2 204.7, 1037518.6 6778266.4 204.7, 1037517 6778264.2 204.7))
-BATIMENT0000000234798475;POLYGON Z ((1037511.5 6778227.6 205, 1037515.4 6778224.7 205, 1037509.5 6778216.8 205, 1037505.7 6778219.6 205, 1037511.5 6778227.6 205))
-BATIMENT0000000234798476;POLYGON Z ((1037494.9 6778227.6 205, 1037500.5 6778235.2 205, 1037501.3 6778236.2 205, 1037511.9 6778228.3 205, 1037511.5 6778227.6 205, 1037505.7 6778219.6 205, 1037494.9 6778227.6 205))
-BATIMENT0000000234798480;POLYGON Z ((1037516.6 6778226.3 204.9, 1037523.4 6778221.3 204.9, 1037523.2 6778221.1 204.9, 1037522.2 6778219.7 204.9, 1037515.4 6778224.7 204.9, 1037516.6 6778226.3 204.9))
-BATIMENT0000000234798481;POLYGON Z ((1037511.9 6778228.3 204.9, 1037515.1 6778232.6 204.9, 1037515.7 6778233.4 204.9, 1037519.6 6778230.6 204.9, 1037516.6 6778226.3 204.9, 1037515.4 6778224.7 204.9, 1037511.5 6778227.6 204.9, 1037511.9 6778228.3 204.9))
-BATIMENT0000000234798482;POLYGON Z ((1037521.1 6778232.7 204.9, 1037519.6 6778230.6 204.9, 1037515.7 6778233.4 204.9, 1037517.2 6778235.5 204.9, 1037521.1 6778232.7 204.9))
-BATIMENT0000000234798238;POLYGON Z ((1037410.1 6778072 203.1, 1037409 6778072.8 203.1, 1037405.7 6778075.1 203.1, 1037407 6778077 203.1, 1037411.2 6778074 203.1, 1037411.4 6778073.8 203.1, 1037410.1 6778072 203.1))
-BATIMENT0000000234798253;POLYGON Z ((1037413.6 6778077.4 203.1, 1037413.2 6778076.7 203.1, 1037411.2 6778074 203.1, 1037407 6778077 203.1, 1037405 6778078.3 203.1, 1037404.7 6778078.6 203.1, 1037406.6 6778081.4 203.1, 1037407 6778081.9 203.1, 1037413.6 6778077.4 203.1))
-BATIMENT0000000234798259;POLYGON Z ((1037411.5 6778098 203.3, 1037418.3 6778092.9 203.3, 1037419.1 6778092.4 203.3, 1037414.9 6778087 203.3, 1037414.9 6778087.1 203.3, 1037414.2 6778087.6 203.3, 1037412.2 6778089 203.3, 1037410.8 6778090 203.3, 1037408.6 6778091.7 203.3, 1037407.4 6778092.6 203.3, 1037411.5 6778098 203.3))
-BATIMENT0000000234798272;POLYGON Z ((1037413.8 6778085.6 203.3, 1037413 6778086.2 203.3, 1037414.2 6778087.6 203.3, 1037414.9 6778087.1 203.3, 1037414.9 6778087 203.3, 1037413.8 6778085.6 203.3))
-BATIMENT0000000234798283;POLYGON Z ((1037427 6778097.4 203.1, 1037428 6778096.6 203.1, 1037424.1 6778091.4 203.1, 1037423 6778092.2 203.1, 1037427 6778097.4 203.1))
-BATIMENT0000000234798286;POLYGON Z ((1037431.8 6778101.6 203.1, 1037428 6778096.6 203.1, 1037427 6778097.4 203.1, 1037424.4 6778099.3 203.1, 1037425.9 6778101.1 203.1, 1037428.3 6778104.2 203.1, 1037431.8 6778101.6 203.1))
-BATIMENT0000000234798354;POLYGON Z ((1037431.5 6778112.8 202.5, 1037435.7 6778118.2 202.5, 1037438.6 6778121.9 202.5, 1037439.1 6778121.6 202.5, 1037440.4 6778120.5 202.5, 1037441.5 6778119.6 202.5, 1037440.3 6778118.1 202.5, 1037438.4 6778115.6 202.5, 1037434.6 6778110.6 202.5, 1037431.5 6778112.8 202.5))
-BATIMENT0000000234798357;POLYGON Z ((1037435 6778124.8 202.5, 1037435.9 6778126.1 202.5, 1037436.8 6778125.3 202.5, 1037435.9 6778124.1 202.5, 1037435 6778124.8 202.5))
-BATIMENT0000000234798373;POLYGON Z ((1037425.4 6778135.2 202.7, 1037421.4 6778129.9 202.7, 1037417.6 6778132.7 202.7, 1037421.7 6778138 202.7, 1037425.4 6778135.2 202.7))
-BATIMENT0000000234798391;POLYGON Z ((1037430.9 6778160 202.5, 1037431.4 6778160.7 202.5, 1037434.3 6778158.6 202.5, 1037432 6778155.6 202.5, 1037430.3 6778156.9 202.5, 1037429.2 6778157.7 202.5, 1037430.9 6778160 202.5))
-BATIMENT0000000234798393;POLYGON Z ((1037429.6 6778160.9 202.5, 1037430.9 6778160 202.5, 1037429.2 6778157.7 202.5, 1037427.9 6778158.7 202.5, 1037429.6 6778160.9 202.5))
-BATIMENT0000000234798396;POLYGON Z ((1037440.5 6778149.3 202.5, 1037438.1 6778151 202.5, 1037440.4 6778154.1 202.5, 1037443 6778152.1 202.5, 1037445.8 6778149.9 202.5, 1037443.6 6778147 202.5, 1037440.5 6778149.3 202.5))
-BATIMENT0000000234798402;POLYGON Z ((1037434.3 6778167 202.6, 1037435.2 6778168.2 202.6, 1037437.5 6778166.5 202.6, 1037436.6 6778165.4 202.6, 1037434.3 6778167 202.6))
-BATIMENT0000000234798403;POLYGON Z ((1037439 6778164.8 202.6, 1037441.6 6778162.8 202.6, 1037440.5 6778161.2 202.6, 1037437.8 6778163.2 202.6, 1037439 6778164.8 202.6))
-BATIMENT0000000234798405;POLYGON Z ((1037434.3 6778158.6 202.5, 1037440.4 6778154.1 202.5, 1037438.1 6778151 202.5, 1037432 6778155.6 202.5, 1037434.3 6778158.6 202.5))
-BATIMENT0000000234798254;POLYGON Z ((1037407 6778077 203.1, 1037405.7 6778075.1 203.1, 1037403.7 6778076.5 203.1, 1037405 6778078.3 203.1, 1037407 6778077 203.1))
-BATIMENT0000000234797489;POLYGON Z ((1037672.4 6778425.1 201.7, 1037674.7 6778428.3 201.7, 1037677.5 6778426.2 201.7, 1037675.4 6778423.1 201.7, 1037672.4 6778425.1 201.7))
-BATIMENT0000000234797567;POLYGON Z ((1037579.8 6778433.6 201.1, 1037577.4 6778435.5 201.1, 1037574.9 6778437.3 201.1, 1037574.3 6778437.7 201.1, 1037577.4 6778441.8 201.1, 1037582.9 6778437.8 201.1, 1037579.8 6778433.6 201.1))
-BATIMENT0000000234797544;POLYGON Z ((1037482.5 6778417.5 200.7, 1037485 6778415.7 200.7, 1037484.7 6778415.3 200.7, 1037483.9 6778414.2 200.7, 1037481.2 6778410.6 200.7, 1037478.7 6778412.4 200.7, 1037482.5 6778417.5 200.7))
-BATIMENT0000000234797548;POLYGON Z ((1037484.7 6778427.7 201.5, 1037489.6 6778424.1 201.5, 1037487 6778420.6 201.5, 1037482.1 6778424.2 201.5, 1037484.7 6778427.7 201.5))
-BATIMENT0000000234797549;POLYGON Z ((1037489.6 6778424.1 201.6, 1037492.7 6778421.8 201.6, 1037490.1 6778418.3 201.6, 1037488.1 6778419.8 201.6, 1037487 6778420.6 201.6, 1037489.6 6778424.1 201.6))
-BATIMENT0000000234797553;POLYGON Z ((1037496.3 6778404.9 203.2, 1037495.8 6778405.3 203.2, 1037493.9 6778406.7 203.2, 1037496.3 6778410 203.2, 1037498.1 6778412.5 203.2, 1037499.2 6778411.6 203.2, 1037500.5 6778410.7 203.2, 1037496.3 6778404.9 203.2))
-BATIMENT0000000234797558;POLYGON Z ((1037487.5 6778393.8 202.5, 1037489.7 6778396.8 202.5, 1037491 6778395.8 202.5, 1037488.8 6778392.8 202.5, 1037487.5 6778393.8 202.5))
-BATIMENT0000000234797582;POLYGON Z ((1037579.7 6778467.3 201.1, 1037581 6778466.4 201.1, 1037578.4 6778462.9 201.1, 1037577.8 6778462.1 201.1, 1037576.4 6778463.1 201.1, 1037579.7 6778467.3 201.1))
-BATIMENT0000000234797560;POLYGON Z ((1037505.3 6778419.9 201.8, 1037499.1 6778424.6 201.8, 1037500.7 6778426.8 201.8, 1037501.9 6778425.9 201.8, 1037505.6 6778423.1 201.8, 1037506.8 6778422.3 201.8, 1037506.9 6778422.2 201.8, 1037505.3 6778419.9 201.8))
-BATIMENT0000000234797563;POLYGON Z ((1037519.8 6778439.8 203.9, 1037514.7 6778432.5 203.9, 1037511.9 6778434.6 203.9, 1037509.6 6778431.6 203.9, 1037501.1 6778437.9 203.9, 1037508.8 6778448 203.9, 1037519.8 6778439.8 203.9))
-BATIMENT0000000234797564;POLYGON Z ((1037570.7 6778425.8 201.7, 1037574.9 6778422.6 201.7, 1037569.2 6778414.8 201.7, 1037564.9 6778418 201.7, 1037570.7 6778425.8 201.7))
-BATIMENT0000000234797566;POLYGON Z ((1037565 6778441.7 202.1, 1037566.5 6778440.5 202.1, 1037568.3 6778439.3 202.1, 1037566 6778436.2 202.1, 1037562.7 6778438.6 202.1, 1037565 6778441.7 202.1))
-BATIMENT0000000234797569;POLYGON Z ((1037577.4 6778441.8 201.2, 1037574.3 6778437.7 201.2, 1037569.7 6778441.2 201.2, 1037568.8 6778441.9 201.2, 1037571.7 6778446 201.2, 1037577.4 6778441.8 201.2))
-BATIMENT0000000234797571;POLYGON Z ((1037572.1 6778453.1 201.3, 1037573.5 6778452.1 201.3, 1037570 6778447.3 201.3, 1037571.7 6778446 201.3, 1037568.8 6778441.9 201.3, 1037568.1 6778442.4 201.3, 1037566.5 6778443.6 201.3, 1037565.6 6778444.3 201.3, 1037572.1 6778453.1 201.3))
-BATIMENT0000000234797574;POLYGON Z ((1037588.8 6778426.9 201.1, 1037581.9 6778432.1 201.1, 1037579.8 6778433.6 201.1, 1037582.9 6778437.8 201.1, 1037591.5 6778431.4 201.1, 1037591.6 6778430.7 201.1, 1037591.5 6778430.5 201.1, 1037588.8 6778426.9 201.1))
-BATIMENT0000000234797575;POLYGON Z ((1037585.2 6778422.1 201.7, 1037578.2 6778427.1 201.7, 1037581.9 6778432.1 201.7, 1037588.8 6778426.9 201.7, 1037585.2 6778422.1 201.7))
-BATIMENT0000000234797576;POLYGON Z ((1037597.6 6778420.2 200.8, 1037588.8 6778426.9 200.8, 1037591.5 6778430.5 200.8, 1037600.3 6778423.9 200.8, 1037597.6 6778420.2 200.8))
-BATIMENT0000000234797580;POLYGON Z ((1037577.8 6778462.1 201, 1037581 6778459.8 201, 1037580.4 6778458.8 201, 1037578.1 6778460.5 201, 1037577.2 6778461.2 201, 1037577.8 6778462.1 201))
-BATIMENT0000000234797583;POLYGON Z ((1037581 6778459.8 201, 1037577.8 6778462.1 201, 1037578.4 6778462.9 201, 1037581.6 6778460.6 201, 1037581 6778459.8 201))
-BATIMENT0000000234797585;POLYGON Z ((1037584.5 6778457.3 201, 1037583 6778455.3 201, 1037580.2 6778457.4 201, 1037579.7 6778457.8 201, 1037580.4 6778458.8 201, 1037581 6778459.8 201, 1037584.5 6778457.3 201))
-BATIMENT0000000234797586;POLYGON Z ((1037581.8 6778453.6 201, 1037581.3 6778452.9 201, 1037578.5 6778455 201, 1037580.2 6778457.4 201, 1037583 6778455.3 201, 1037581.8 6778453.6 201))
-BATIMENT0000000234797587;POLYGON Z ((1037591.4 6778468.2 200.9, 1037586.7 6778460.8 200.9, 1037584.5 6778457.3 200.9, 1037581 6778459.8 200.9, 1037581.6 6778460.6 200.9, 1037588.3 6778470.4 200.9, 1037591.4 6778468.2 200.9))
-BATIMENT0000000234797589;POLYGON Z ((1037606.9 6778456.8 200.7, 1037604 6778452.8 200.7, 1037596.1 6778458.4 200.7, 1037598.9 6778462.6 200.7, 1037606.9 6778456.8 200.7))
-BATIMENT0000000234797590;POLYGON Z ((1037618.4 6778448.4 200.6, 1037602.6 6778426.9 200.6, 1037596.6 6778431.7 200.6, 1037596.7 6778433 200.6, 1037597.7 6778434.3 200.6, 1037606.2 6778445.5 200.6, 1037601.3 6778449 200.6, 1037601.5 6778449.3 200.6, 1037604 6778452.8 200.6, 1037606.9 6778456.8 200.6, 1037618.4 6778448.4 200.6))
-BATIMENT0000000234797591;POLYGON Z ((1037601.3 6778449 200.6, 1037606.2 6778445.5 200.6, 1037597.7 6778434.3 200.6, 1037592 6778438.7 200.6, 1037600.8 6778449.7 200.6, 1037601.5 6778449.3 200.6, 1037601.3 6778449 200.6))
-BATIMENT0000000234797592;POLYGON Z ((1037579.4 6778450.3 201, 1037579 6778450.5 201, 1037576.6 6778452.3 201, 1037578.5 6778455 201, 1037581.3 6778452.9 201, 1037579.4 6778450.3 201))
-BATIMENT0000000234797605;POLYGON Z ((1037455.3 6778453.3 201.8, 1037451.6 6778456.2 201.8, 1037455.3 6778461.5 201.8, 1037459.2 6778458.6 201.8, 1037455.3 6778453.3 201.8))
-BATIMENT0000000234797601;POLYGON Z ((1037432.2 6778449.6 203.3, 1037435.1 6778453.8 203.3, 1037439.1 6778450.8 203.3, 1037439.5 6778450.5 203.3, 1037435.8 6778445.6 203.3, 1037441.4 6778441.4 203.3, 1037435.3 6778433.4 203.3, 1037425.7 6778440.5 203.3, 1037432.2 6778449.6 203.3))
-BATIMENT0000000234797622;POLYGON Z ((1037535.8 6778498.5 202, 1037532.6 6778494.4 202, 1037532.5 6778494.2 202, 1037529 6778496.9 202, 1037529.7 6778497.9 202, 1037532.2 6778501.1 202, 1037535.8 6778498.5 202))
-BATIMENT0000000234797623;POLYGON Z ((1037545.9 6778503 202, 1037541.2 6778496.7 202, 1037538.7 6778498.5 202, 1037543.3 6778505 202, 1037545.9 6778503 202))
-BATIMENT0000000234797632;POLYGON Z ((1037550.3 6778482.5 201.9, 1037549.8 6778483 201.9, 1037549 6778481.8 201.9, 1037548.1 6778482.4 201.9, 1037546.9 6778480.8 201.9, 1037546.3 6778481.2 201.9, 1037546.8 6778481.9 201.9, 1037550.6 6778487 201.9, 1037551.2 6778487.9 201.9, 1037553.2 6778486.4 201.9, 1037550.3 6778482.5 201.9))
-BATIMENT0000000234797639;POLYGON Z ((1037539.5 6778485.7 202, 1037541.8 6778483.9 202, 1037539.8 6778481.1 202, 1037537.4 6778482.9 202, 1037539.5 6778485.7 202))
-BATIMENT0000000234797658;POLYGON Z ((1037521.9 6778466.6 202, 1037517.4 6778470 202, 1037522.9 6778477.5 202, 1037527.5 6778474.1 202, 1037523.6 6778468.9 202, 1037521.9 6778466.6 202))
-BATIMENT0000000234797726;POLYGON Z ((1037567.2 6778510.2 200.7, 1037570.6 6778507.7 200.7, 1037570.5 6778507.5 200.7, 1037565.1 6778500.4 200.7, 1037561.7 6778502.9 200.7, 1037567.2 6778510.2 200.7))
-BATIMENT0000000234797731;POLYGON Z ((1037542.3 6778528.9 200.6, 1037545.7 6778526.4 200.6, 1037540.2 6778519.2 200.6, 1037536.8 6778521.7 200.6, 1037542.3 6778528.9 200.6))
-BATIMENT0000000234797767;POLYGON Z ((1037536.1 6778401.4 202.9, 1037536.6 6778400.9 202.9, 1037535 6778398.7 202.9, 1037532.8 6778400.3 202.9, 1037534.5 6778402.5 202.9, 1037536.1 6778401.4 202.9))
-BATIMENT0000000234797770;POLYGON Z ((1037559.1 6778411.3 203.6, 1037553.4 6778403.5 203.6, 1037552.7 6778402.6 203.6, 1037551.8 6778401.5 203.6, 1037551.1 6778400.4 203.6, 1037543.6 6778406.1 203.6, 1037540.8 6778408.1 203.6, 1037548.6 6778419.1 203.6, 1037559.1 6778411.3 203.6))
-BATIMENT0000000234797777;POLYGON Z ((1037527.1 6778392.5 202.8, 1037534.1 6778387.3 202.8, 1037536.3 6778385.7 202.8, 1037534.5 6778383.2 202.8, 1037526.4 6778389.2 202.8, 1037526.1 6778389.4 202.8, 1037526.3 6778390 202.8, 1037525.6 6778390.5 202.8, 1037527.1 6778392.5 202.8))
-BATIMENT0000000234797783;POLYGON Z ((1037536 6778380.3 202.8, 1037533.7 6778382.1 202.8, 1037533.9 6778382.4 202.8, 1037534.5 6778383.2 202.8, 1037536.3 6778385.7 202.8, 1037538.7 6778383.9 202.8, 1037536.7 6778381.3 202.8, 1037536 6778380.3 202.8))
-BATIMENT0000000234797785;POLYGON Z ((1037545.5 6778372.8 203.3, 1037548.4 6778370.5 203.3, 1037550.1 6778369.3 203.3, 1037546.9 6778365.1 203.3, 1037542.4 6778368.5 203.3, 1037545.5 6778372.8 203.3))
-BATIMENT0000000234797787;POLYGON Z ((1037534.5 6778383.2 202.8, 1037533.9 6778382.4 202.8, 1037525.7 6778388.4 202.8, 1037526.4 6778389.2 202.8, 1037534.5 6778383.2 202.8))
-BATIMENT0000000234798154;POLYGON Z ((1037515.2 6778335.6 202.8, 1037517.7 6778339 202.8, 1037520.1 6778337.3 202.8, 1037519.8 6778336.9 202.8, 1037517.5 6778333.9 202.8, 1037515.2 6778335.6 202.8))
-BATIMENT0000000234798170;POLYGON Z ((1037530.3 6778350.8 202.9, 1037525.1 6778343.8 202.9, 1037524.6 6778343.1 202.9, 1037520.1 6778346.5 202.9, 1037525.7 6778354 202.9, 1037525.8 6778354.1 202.9, 1037530.3 6778350.8 202.9))
-BATIMENT0000000234798173;POLYGON Z ((1037356.5 6778341.5 201.5, 1037363.5 6778336.1 201.5, 1037367.3 6778341 201.5, 1037368.6 6778340.1 201.5, 1037364.2 6778334.2 201.5, 1037355.8 6778340.6 201.5, 1037356.5 6778341.5 201.5))
-BATIMENT0000000234797940;POLYGON Z ((1037543.9 6778090.1 201.3, 1037545.2 6778089.1 201.3, 1037548.2 6778086.9 201.3, 1037546.8 6778085 201.3, 1037542.4 6778088.2 201.3, 1037543.9 6778090.1 201.3))
-BATIMENT0000000234797941;POLYGON Z ((1037560.4 6778088.4 201.2, 1037555.3 6778081.6 201.2, 1037548.2 6778086.9 201.2, 1037545.2 6778089.1 201.2, 1037550.2 6778096.1 201.2, 1037560.4 6778088.4 201.2))
-BATIMENT0000000234797942;POLYGON Z ((1037544.8 6778057.4 200.7, 1037545.2 6778057.2 200.7, 1037542.6 6778053.7 200.7, 1037537.3 6778057.6 200.7, 1037540 6778061 200.7, 1037544.8 6778057.4 200.7))
-BATIMENT0000000234797943;POLYGON Z ((1037534.6 6778097.1 201.6, 1037543.9 6778090.1 201.6, 1037542.4 6778088.2 201.6, 1037533.1 6778095.1 201.6, 1037534.6 6778097.1 201.6))
-BATIMENT0000000234797945;POLYGON Z ((1037552.1 6778077.5 201.1, 1037548.9 6778079.9 201.1, 1037550.6 6778082.2 201.1, 1037546.8 6778085 201.1, 1037548.2 6778086.9 201.1, 1037555.3 6778081.6 201.1, 1037552.1 6778077.5 201.1))
-BATIMENT0000000234797949;POLYGON Z ((1037546.2 6778069.6 200.4, 1037547.3 6778071 200.4, 1037552.7 6778067 200.4, 1037550.7 6778064.3 200.4, 1037547.9 6778066.5 200.4, 1037545.3 6778068.4 200.4, 1037546.2 6778069.6 200.4))
-BATIMENT0000000234797954;POLYGON Z ((1037544.1 6778073.4 200.2, 1037547.3 6778071 200.2, 1037546.2 6778069.6 200.2, 1037545.3 6778068.4 200.2, 1037542.2 6778070.7 200.2, 1037542.9 6778071.7 200.2, 1037544.1 6778073.4 200.2))
-BATIMENT0000000234797955;POLYGON Z ((1037548.9 6778079.9 200.2, 1037552.1 6778077.5 200.2, 1037548.3 6778072.4 200.2, 1037547.3 6778071 200.2, 1037544.1 6778073.4 200.2, 1037548.9 6778079.9 200.2))
-BATIMENT0000000234797957;POLYGON Z ((1037542.2 6778070.7 200.2, 1037545.3 6778068.4 200.2, 1037543.9 6778066.6 200.2, 1037543.2 6778065.6 200.2, 1037540.1 6778068 200.2, 1037542.2 6778070.7 200.2))
-BATIMENT0000000234797965;POLYGON Z ((1037536.4 6778056.5 200.7, 1037537.3 6778057.6 200.7, 1037542.6 6778053.7 200.7, 1037542.4 6778053.5 200.7, 1037540.7 6778051.1 200.7, 1037535.3 6778055 200.7, 1037536.4 6778056.5 200.7))
-BATIMENT0000000234797971;POLYGON Z ((1037540.9 6778138.8 202.5, 1037539.7 6778137.2 202.5, 1037540.9 6778136.3 202.5, 1037539 6778133.8 202.5, 1037535.7 6778136.3 202.5, 1037534.8 6778137 202.5, 1037534.6 6778137.2 202.5, 1037535.4 6778138.3 202.5, 1037534.2 6778139.2 202.5, 1037536.4 6778142.2 202.5, 1037540.9 6778138.8 202.5))
-BATIMENT0000000234797974;POLYGON Z ((1037540.8 6778148.1 201.9, 1037536.4 6778142.2 201.9, 1037534.2 6778139.2 201.9, 1037533.4 6778138.1 201.9, 1037529.7 6778141 201.9, 1037532.1 6778144.4 201.9, 1037536.9 6778151 201.9, 1037540.8 6778148.1 201.9))
-BATIMENT0000000234797975;POLYGON Z ((1037534.2 6778139.2 202.6, 1037535.4 6778138.3 202.6, 1037534.6 6778137.2 202.6, 1037533.4 6778138.1 202.6, 1037534.2 6778139.2 202.6))
-BATIMENT0000000234797978;POLYGON Z ((1037546.6 6778143.8 201.8, 1037544.7 6778145.2 201.8, 1037540.8 6778148.1 201.8, 1037536.9 6778151 201.8, 1037536.4 6778151.4 201.8, 1037538.3 6778154.1 201.8, 1037539.2 6778155.3 201.8, 1037548.3 6778148.4 201.8, 1037557.2 6778141.7 201.8, 1037554.4 6778137.9 201.8, 1037546.6 6778143.8 201.8))
-BATIMENT0000000234797979;POLYGON Z ((1037548.3 6778148.4 202.3, 1037552.9 6778154.7 202.3, 1037558 6778150.9 202.3, 1037561.9 6778148 202.3, 1037557.2 6778141.7 202.3, 1037548.3 6778148.4 202.3))
-BATIMENT0000000234797981;POLYGON Z ((1037540.9 6778136.3 202.5, 1037539.7 6778137.2 202.5, 1037540.9 6778138.8 202.5, 1037543.7 6778142.5 202.5, 1037544.9 6778141.5 202.5, 1037540.9 6778136.3 202.5))
-BATIMENT0000000234797985;POLYGON Z ((1037529.6 6778156.1 201.7, 1037527.4 6778153 201.7, 1037524.1 6778155.5 201.7, 1037526.2 6778158.4 201.7, 1037529.6 6778156.1 201.7))
-BATIMENT0000000234797987;POLYGON Z ((1037511.4 6778148.7 202.6, 1037513.9 6778152 202.6, 1037519 6778148.4 202.6, 1037517.8 6778146.7 202.6, 1037516.6 6778145 202.6, 1037511.4 6778148.7 202.6))
-BATIMENT0000000234797990;POLYGON Z ((1037557.8 6778156 201.8, 1037557 6778155.1 201.8, 1037546.9 6778162.5 201.8, 1037547.6 6778163.4 201.8, 1037557.8 6778156 201.8))
-BATIMENT0000000234797993;POLYGON Z ((1037526.4 6778165.1 202.1, 1037531 6778171.1 202.1, 1037534.1 6778168.8 202.1, 1037529.4 6778162.8 202.1, 1037526.4 6778165.1 202.1))
-BATIMENT0000000234797995;POLYGON Z ((1037526.6 6778158.9 202.1, 1037526.2 6778158.4 202.1, 1037524.1 6778155.5 202.1, 1037520.6 6778150.6 202.1, 1037515.6 6778154.3 202.1, 1037514.2 6778155.2 202.1, 1037520.4 6778163.4 202.1, 1037521.7 6778162.5 202.1, 1037526.4 6778159.1 202.1, 1037526.6 6778158.9 202.1))
-BATIMENT0000000234797996;POLYGON Z ((1037519 6778148.4 201.9, 1037519.7 6778149.3 201.9, 1037520.6 6778150.6 201.9, 1037524.1 6778155.5 201.9, 1037527.4 6778153 201.9, 1037521 6778144.3 201.9, 1037517.8 6778146.7 201.9, 1037519 6778148.4 201.9))
-BATIMENT0000000234797997;POLYGON Z ((1037518.6 6778167.6 202.3, 1037523.1 6778164.4 202.3, 1037521.7 6778162.5 202.3, 1037520.4 6778163.4 202.3, 1037517.7 6778165.3 202.3, 1037517.2 6778165.7 202.3, 1037518.6 6778167.6 202.3))
-BATIMENT0000000234797999;POLYGON Z ((1037520.4 6778163.4 202.5, 1037514.2 6778155.2 202.5, 1037511.6 6778157.1 202.5, 1037517.7 6778165.3 202.5, 1037520.4 6778163.4 202.5))
-BATIMENT0000000234798078;POLYGON Z ((1037602.5 6778122.1 199.9, 1037600.6 6778119.5 199.9, 1037597.9 6778115.6 199.9, 1037595 6778117.8 199.9, 1037597.1 6778120.5 199.9, 1037598.2 6778122.1 199.9, 1037599.7 6778124.1 199.9, 1037602.5 6778122.1 199.9))
-BATIMENT0000000234798082;POLYGON Z ((1037607.2 6778118.6 200.2, 1037607.4 6778118.4 200.2, 1037605.5 6778115.9 200.2, 1037600.6 6778119.5 200.2, 1037602.5 6778122.1 200.2, 1037607.2 6778118.6 200.2))
-BATIMENT0000000234798132;POLYGON Z ((1037575 6778122.1 200.6, 1037572.1 6778124.2 200.6, 1037571.4 6778124.8 200.6, 1037573.1 6778127.3 200.6, 1037576.8 6778124.6 200.6, 1037575 6778122.1 200.6))
-BATIMENT0000000234798291;POLYGON Z ((1037475.3 6778098.8 201.7, 1037473.4 6778096.3 201.7, 1037467.7 6778100.6 201.7, 1037467.1 6778101.1 201.7, 1037469 6778103.5 201.7, 1037470.9 6778102.1 201.7, 1037472.4 6778100.9 201.7, 1037475.3 6778098.8 201.7))
-BATIMENT0000000234798293;POLYGON Z ((1037475.3 6778098.8 201.5, 1037472.4 6778100.9 201.5, 1037474.4 6778103.5 201.5, 1037477.2 6778101.5 201.5, 1037475.3 6778098.8 201.5))
-BATIMENT0000000234798346;POLYGON Z ((1037532.9 6778005.7 199.4, 1037533.2 6778003.6 199.4, 1037531.6 6778003.3 199.4, 1037531.3 6778005.5 199.4, 1037532.9 6778005.7 199.4))
-BATIMENT0000000234798297;POLYGON Z ((1037493.9 6778125.6 202.3, 1037493.3 6778124.8 202.3, 1037492.7 6778124 202.3, 1037491 6778125 202.3, 1037489.2 6778127.5 202.3, 1037488.1 6778128.3 202.3, 1037487.9 6778128.5 202.3, 1037488.7 6778129.6 202.3, 1037493.9 6778125.6 202.3))
-BATIMENT0000000234798302;POLYGON Z ((1037503.2 6778117.8 202.3, 1037502.8 6778117.4 202.3, 1037502.2 6778116.5 202.3, 1037499.9 6778118.3 202.3, 1037498.2 6778116.3 202.3, 1037496.3 6778117.8 202.3, 1037497.3 6778119 202.3, 1037498.6 6778120.7 202.3, 1037498.9 6778121.1 202.3, 1037503.2 6778117.8 202.3))
-BATIMENT0000000234798303;POLYGON Z ((1037491.7 6778122.8 202.2, 1037490.1 6778123.8 202.2, 1037491 6778125 202.2, 1037492.7 6778124 202.2, 1037491.7 6778122.8 202.2))
-BATIMENT0000000234798307;POLYGON Z ((1037481.6 6778098.5 201.4, 1037480.6 6778097 201.4, 1037480.3 6778096.7 201.4, 1037479.6 6778095.6 201.4, 1037476.7 6778097.7 201.4, 1037475.3 6778098.8 201.4, 1037477.2 6778101.5 201.4, 1037479.9 6778099.5 201.4, 1037481.5 6778101.7 201.4, 1037483.1 6778100.5 201.4, 1037481.6 6778098.5 201.4))
-BATIMENT0000000234798313;POLYGON Z ((1037504.4 6778116.8 202.1, 1037504.1 6778116.3 202.1, 1037508.6 6778112.8 202.1, 1037506.7 6778110.2 202.1, 1037505.8 6778110.8 202.1, 1037504.1 6778112 202.1, 1037505.5 6778114 202.1, 1037502.2 6778116.5 202.1, 1037502.8 6778117.4 202.1, 1037503.2 6778117.8 202.1, 1037504.4 6778116.8 202.1))
-BATIMENT0000000234798316;POLYGON Z ((1037506.1 6778109.4 202.1, 1037505.2 6778110 202.1, 1037505.8 6778110.8 202.1, 1037506.7 6778110.2 202.1, 1037506.1 6778109.4 202.1))
-BATIMENT0000000234798317;POLYGON Z ((1037509.2 6778113.7 202.1, 1037511.5 6778112 202.1, 1037509 6778108.7 202.1, 1037510 6778108 202.1, 1037506.7 6778104 202.1, 1037506.1 6778103.3 202.1, 1037503.2 6778105.4 202.1, 1037506.1 6778109.4 202.1, 1037506.7 6778110.2 202.1, 1037508.6 6778112.8 202.1, 1037509.2 6778113.7 202.1))
-BATIMENT0000000234798326;POLYGON Z ((1037477 6778092.2 201.4, 1037477.2 6778092.4 201.4, 1037480.4 6778089.9 201.4, 1037479.3 6778088.4 201.4, 1037479.1 6778088.6 201.4, 1037476.1 6778090.8 201.4, 1037477 6778092.2 201.4))
-BATIMENT0000000234798327;POLYGON Z ((1037506.7 6778104 202.2, 1037508.1 6778103 202.2, 1037507.5 6778102.2 202.2, 1037506.1 6778103.3 202.2, 1037506.7 6778104 202.2))
-BATIMENT0000000234798330;POLYGON Z ((1037503.7 6778100.1 202.2, 1037500.4 6778095.8 202.2, 1037497.7 6778097.8 202.2, 1037498.4 6778098.7 202.2, 1037500.9 6778102.2 202.2, 1037503.7 6778100.1 202.2))
-BATIMENT0000000234798340;POLYGON Z ((1037548.4 6778003.4 198.7, 1037547.2 6778011.1 198.7, 1037550.4 6778011.6 198.7, 1037551.5 6778003.8 198.7, 1037548.4 6778003.4 198.7))
-BATIMENT0000000234798342;POLYGON Z ((1037545 6778002.9 198.8, 1037541.8 6778002.5 198.8, 1037540.6 6778010.2 198.8, 1037544 6778010.7 198.8, 1037545 6778002.9 198.8))
-BATIMENT0000000234798345;POLYGON Z ((1037533.2 6778003.6 199.3, 1037532.9 6778005.7 199.3, 1037531.3 6778005.5 199.3, 1037530.8 6778008.8 199.3, 1037534.3 6778009.3 199.3, 1037535.1 6778003.9 199.3, 1037533.2 6778003.6 199.3))
-BATIMENT0000000234798368;POLYGON Z ((1037446.4 6778128.5 202.5, 1037450.3 6778133.8 202.5, 1037453.9 6778131.1 202.5, 1037449.9 6778125.9 202.5, 1037447.3 6778127.9 202.5, 1037446.4 6778128.5 202.5))
-BATIMENT0000000234798372;POLYGON Z ((1037457.9 6778136.4 202.5, 1037457.1 6778135.4 202.5, 1037453.9 6778131.1 202.5, 1037450.3 6778133.8 202.5, 1037454.2 6778139.1 202.5, 1037457.9 6778136.4 202.5))
-BATIMENT0000000234798376;POLYGON Z ((1037457.2 6778143.1 202.6, 1037457.8 6778144 202.6, 1037460.6 6778142 202.6, 1037457.9 6778138.6 202.6, 1037455.3 6778140.6 202.6, 1037457.2 6778143.1 202.6))
-BATIMENT0000000234798444;POLYGON Z ((1037633.9 6778153.8 201, 1037633.8 6778153.9 201, 1037635.1 6778155.7 201, 1037636.4 6778154.7 201, 1037635.1 6778152.9 201, 1037633.9 6778153.8 201))
-BATIMENT0000000234798359;POLYGON Z ((1037439.1 6778121.6 202.5, 1037440.1 6778122.9 202.5, 1037441.4 6778121.8 202.5, 1037440.4 6778120.5 202.5, 1037439.1 6778121.6 202.5))
-BATIMENT0000000234798400;POLYGON Z ((1037443.8 6778158.8 202.6, 1037440.5 6778161.2 202.6, 1037441.6 6778162.8 202.6, 1037445 6778160.3 202.6, 1037443.8 6778158.8 202.6))
-BATIMENT0000000234797529;POLYGON Z ((1037494.9 6778530.9 201.2, 1037492.8 6778528.1 201.2, 1037489.5 6778530.5 201.2, 1037491.5 6778533.4 201.2, 1037494.9 6778530.9 201.2))
-BATIMENT0000000234797595;POLYGON Z ((1037500.4 6778570.2 201.2, 1037534.4 6778544.9 201.2, 1037524.2 6778531.2 201.2, 1037490.4 6778556.7 201.2, 1037500.4 6778570.2 201.2))
-BATIMENT0000000234797530;POLYGON Z ((1037502.5 6778525.2 201.2, 1037501 6778523.3 201.2, 1037500.3 6778522.5 201.2, 1037492.8 6778528.1 201.2, 1037494.9 6778530.9 201.2, 1037502.5 6778525.2 201.2))
-BATIMENT0000000234798893;POLYGON Z ((1037464 6778024.6 201.8, 1037471.6 6778018.8 201.8, 1037469.7 6778015.2 201.8, 1037471 6778006.5 201.8, 1037464.8 6778005.4 201.8, 1037463.1 6778016.2 201.8, 1037460 6778019.3 201.8, 1037464 6778024.6 201.8))
-BATIMENT0000000234798897;POLYGON Z ((1037242.4 6778118.2 201.1, 1037242 6778118.5 201.1, 1037250.7 6778130 201.1, 1037252.9 6778128 201.1, 1037252.2 6778127.2 201.1, 1037255.5 6778124.8 201.1, 1037253.2 6778121.2 201.1, 1037250.4 6778123.4 201.1, 1037236.1 6778105.1 201.1, 1037234 6778106.8 201.1, 1037242.4 6778118.2 201.1))
-BATIMENT0000000234798891;POLYGON Z ((1037504 6778259.3 204.8, 1037506.1 6778262.1 204.8, 1037508 6778260.6 204.8, 1037504.4 6778255.6 204.8, 1037511.6 6778250.3 204.8, 1037509.9 6778247.9 204.8, 1037507 6778250.1 204.8, 1037501.8 6778254 204.8, 1037505.1 6778258.6 204.8, 1037504 6778259.3 204.8))
-BATIMENT0000000234798892;POLYGON Z ((1037483.9 6778190.7 202.6, 1037485.7 6778189.4 202.6, 1037486 6778189.1 202.6, 1037487.2 6778188.4 202.6, 1037490.1 6778186.2 202.6, 1037491.4 6778185.3 202.6, 1037492.5 6778184.5 202.6, 1037493 6778184.2 202.6, 1037488.5 6778178.2 202.6, 1037487 6778179.2 202.6, 1037483.8 6778181.5 202.6, 1037483.1 6778180.6 202.6, 1037479.9 6778183.1 202.6, 1037478.8 6778183.9 202.6, 1037483.9 6778190.7 202.6))
-BATIMENT0000000234798848;POLYGON Z ((1037247.3 6778014.2 201.4, 1037244.6 6778016.2 201.4, 1037248.2 6778021.7 201.4, 1037251 6778019.6 201.4, 1037247.3 6778014.2 201.4))
-BATIMENT0000000234798881;POLYGON Z ((1037303.5 6778555.4 200.2, 1037305.5 6778555.7 200.2, 1037305.9 6778552.8 200.2, 1037303.9 6778552.5 200.2, 1037303.5 6778555.4 200.2))
-BATIMENT0000000234798732;POLYGON Z ((1037146.7 6778141.2 198.8, 1037147.2 6778138.2 198.8, 1037143.7 6778137.7 198.8, 1037143.6 6778138.7 198.8, 1037143.3 6778140.7 198.8, 1037146.7 6778141.2 198.8))
-BATIMENT0000000234798806;POLYGON Z ((1037239.3 6778023.7 201.5, 1037244 6778030.2 201.5, 1037246.7 6778028.1 201.5, 1037243.5 6778023.9 201.5, 1037241.8 6778021.8 201.5, 1037239.3 6778023.7 201.5))
-BATIMENT0000000234798809;POLYGON Z ((1037241.8 6778021.8 201.4, 1037243.5 6778023.9 201.4, 1037245.6 6778022.5 201.4, 1037243 6778019 201.4, 1037240.9 6778020.6 201.4, 1037241.8 6778021.8 201.4))
-BATIMENT0000000234798880;POLYGON Z ((1037305.5 6778555.7 200, 1037315.6 6778557.2 200, 1037316.1 6778553 200, 1037306.2 6778551.6 200, 1037305.9 6778552.8 200, 1037305.5 6778555.7 200))
-BATIMENT0000000234798736;POLYGON Z ((1037143 6778143.7 198.6, 1037146.2 6778144.2 198.6, 1037146.7 6778141.2 198.6, 1037143.3 6778140.7 198.6, 1037143 6778143.7 198.6))
-BATIMENT0000000234798882;POLYGON Z ((1037386.8 6778562.2 199.2, 1037386.1 6778567.5 199.2, 1037397.1 6778568.9 199.2, 1037397.7 6778563.6 199.2, 1037386.8 6778562.2 199.2))
-BATIMENT0000000234798740;POLYGON Z ((1037142.5 6778149.6 198.6, 1037146.7 6778150.3 198.6, 1037147.1 6778147.3 198.6, 1037142.9 6778146.7 198.6, 1037142.5 6778149.6 198.6))
-BATIMENT0000000234798743;POLYGON Z ((1037146.2 6778153.3 198.5, 1037140.5 6778152.3 198.5, 1037140.4 6778153.8 198.5, 1037146 6778154.7 198.5, 1037146.2 6778153.3 198.5))
-BATIMENT0000000234798742;POLYGON Z ((1037146.2 6778153.3 198.6, 1037146.7 6778150.3 198.6, 1037142.5 6778149.6 198.6, 1037142.3 6778150.6 198.6, 1037140.8 6778150.3 198.6, 1037140.6 6778152 198.6, 1037140.5 6778152.3 198.6, 1037146.2 6778153.3 198.6))
-BATIMENT0000000234798047;POLYGON Z ((1037462.5 6778198 202.5, 1037462.9 6778198.5 202.5, 1037466.8 6778203.5 202.5, 1037469.3 6778201.6 202.5, 1037471.9 6778199.6 202.5, 1037473 6778198.8 202.5, 1037468 6778192.6 202.5, 1037461.9 6778197.3 202.5, 1037462.5 6778198 202.5))
-BATIMENT0000000234798696;POLYGON Z ((1037184.9 6778240.2 202.5, 1037184.7 6778240.3 202.5, 1037185.3 6778241.1 202.5, 1037186.8 6778240.1 202.5, 1037187.3 6778240.4 202.5, 1037188.6 6778239.1 202.5, 1037187.5 6778238.4 202.5, 1037186 6778239.5 202.5, 1037184.9 6778240.2 202.5))
-BATIMENT0000000234798766;POLYGON Z ((1037185.5 6778214.5 200.2, 1037172.3 6778224.4 200.2, 1037177.1 6778230.4 200.2, 1037189.3 6778221.1 200.2, 1037190.1 6778220.5 200.2, 1037187.7 6778217.4 200.2, 1037185.5 6778214.5 200.2))
-BATIMENT0000000234798721;POLYGON Z ((1037205.9 6778229.2 202.4, 1037207.1 6778228.3 202.4, 1037202 6778221.5 202.4, 1037201.7 6778221 202.4, 1037201.3 6778221.3 202.4, 1037200.4 6778221.9 202.4, 1037200.8 6778222.4 202.4, 1037205.9 6778229.2 202.4))
-BATIMENT0000000234797946;POLYGON Z ((1037560.6 6778077.6 203.4, 1037553.7 6778068.3 203.4, 1037552.7 6778067 203.4, 1037547.3 6778071 203.4, 1037548.3 6778072.4 203.4, 1037552.1 6778077.5 203.4, 1037555.3 6778081.6 203.4, 1037560.6 6778077.6 203.4))
-BATIMENT0000000234798129;POLYGON Z ((1037560 6778117 200.7, 1037567.7 6778127.5 200.7, 1037571.4 6778124.8 200.7, 1037572.1 6778124.2 200.7, 1037575 6778122.1 200.7, 1037578.2 6778119.8 200.7, 1037576.1 6778116.8 200.7, 1037570.7 6778109.2 200.7, 1037563.9 6778114.1 200.7, 1037560 6778117 200.7))
-BATIMENT0000000234798321;POLYGON Z ((1037503 6778105.2 202.8, 1037501.3 6778102.9 202.8, 1037501.2 6778102.6 202.8, 1037500.9 6778102.2 202.8, 1037498.4 6778098.7 202.8, 1037495.9 6778100.6 202.8, 1037494.6 6778101.5 202.8, 1037493 6778102.7 202.8, 1037492.5 6778103.1 202.8, 1037492.9 6778103.5 202.8, 1037496.2 6778107.9 202.8, 1037497.5 6778109.5 202.8, 1037497.6 6778109.4 202.8, 1037503 6778105.2 202.8))
-BATIMENT0000000234798463;POLYGON Z ((1037501.9 6778245.5 204.8, 1037502.6 6778244.9 204.8, 1037505.6 6778242.7 204.8, 1037505.9 6778242.5 204.8, 1037501.3 6778236.2 204.8, 1037500.5 6778235.2 204.8, 1037497.3 6778237.6 204.8, 1037497.9 6778238.5 204.8, 1037500 6778241.4 204.8, 1037495.7 6778244.7 204.8, 1037496.3 6778245.5 204.8, 1037497.5 6778247.1 204.8, 1037497.4 6778247.3 204.8, 1037497.3 6778247.5 204.8, 1037497.3 6778247.6 204.8, 1037497.3 6778247.7 204.8, 1037497.3 6778247.8 204.8, 1037497.3 6778247.9 204.8, 1037497.4 6778248 204.8, 1037497.6 6778248.2 204.8, 1037497.6 6778248.3 204.8, 1037497.7 6778248.4 204.8, 1037497.8 6778248.4 204.8, 1037497.9 6778248.4 204.8, 1037498 6778248.4 204.8, 1037498.1 6778248.3 204.8, 1037498.3 6778248.2 204.8, 1037498.5 6778248.1 204.8, 1037498.5 6778248 204.8, 1037498.6 6778247.9 204.8, 1037501.9 6778245.5 204.8))
-BATIMENT0000000234797973;POLYGON Z ((1037531.2 6778132.1 203, 1037535.5 6778128.8 203, 1037531.5 6778123.3 203, 1037522 6778130.4 203, 1037528.2 6778138.9 203, 1037529.7 6778141 203, 1037533.4 6778138.1 203, 1037534.6 6778137.2 203, 1037534.8 6778137 203, 1037535.7 6778136.3 203, 1037535.1 6778135.6 203, 1037534.3 6778136.3 203, 1037531.2 6778132.1 203))
-BATIMENT0000000234798042;POLYGON Z ((1037464.3 6778205.4 202.6, 1037468.3 6778210.8 202.6, 1037470.2 6778209.3 202.6, 1037471.8 6778208.2 202.6, 1037470.5 6778206.4 202.6, 1037472 6778205.3 202.6, 1037469.3 6778201.6 202.6, 1037466.8 6778203.5 202.6, 1037466.1 6778204 202.6, 1037464.3 6778205.4 202.6))
-CONSLINE0000002012151576;POLYGON Z ((1037278.5515612008 6777994.734134427 0, 1037278.6319661256 6777994.674996011 0, 1037278.7060752116 6777994.608136849 0, 1037278.7731501617 6777994.534223011 0, 1037278.8325227546 6777994.4539908515 0, 1037278.8836015025 6777994.368239666 0, 1037278.9258775434 6777994.277823735 0, 1037278.9589297106 6777994.183643809 0, 1037278.9824287281 6777994.086638137 0, 1037278.9961404919 6777993.987773119 0, 1037278.999928401 6777993.888033679 0, 1037278.9937547192 6777993.78841345 0, 1037278.9776809504 6777993.689904881 0, 1037278.9518672266 6777993.593489343 0, 1037278.9165707119 6777993.500127358 0, 1037278.8721430411 6777993.410749026 0, 1037274.6715607215 6777985.922754455 0, 1037324.1538950498 6777943.156585266 0, 1037324.2250843063 6777943.088660112 0, 1037324.2892534874 6777943.014067532 0, 1037324.345781324 6777942.933529711 0, 1037324.3941205282 6777942.847826396 0, 1037324.433803093 6777942.757787344 0, 1037324.4644448219 6777942.66428429 0, 1037324.4857490499 6777942.568222504 0, 1037324.497509515 6777942.470532032 0, 1037324.4996123555 6777942.372158688 0, 1037324.4920372122 6777942.274054895 0, 1037324.4748574258 6777942.17717047 0, 1037324.4482393264 6777942.082443423 0, 1037324.4124406233 6777941.990790874 0, 1037324.3678079102 6777941.90310018 0, 1037324.3147733094 6777941.82022034 0, 1037324.2538502878 6777941.742953774 0, 1037324.1856286859 6777941.672048557 0, 1037316.2462503064 6777934.194261943 0, 1037328.2413372676 6777918.692918793 0, 1037349.1929549008 6777926.456241398 0, 1037347.7106024696 6777936.554767335 0, 1037347.7010717063 6777936.653715402 0, 1037347.7014119081 6777936.753120832 0, 1037347.7116197136 6777936.852001347 0, 1037347.7315942534 6777936.949379851 0, 1037347.7611381485 6777937.044294096 0, 1037347.7999594589 6777937.135806178 0, 1037347.8476745698 6777937.223011818 0, 1037347.9038119816 6777937.305049287 0, 1037347.9678169695 6777937.381107928 0, 1037348.0390570645 6777937.450436164 0, 1037348.1168283038 6777937.512348923 0, 1037348.2003621864 6777937.566234412 0, 1037348.2888332679 6777937.611560157 0, 1037348.3813673161 6777937.647878269 0, 1037348.4770499509 6777937.67482987 0, 1037411.056238326 6777951.9871048145 0, 1037410.6014421282 6777960.446314093 0, 1037410.6010036042 6777960.54479064 0, 1037410.6102531702 6777960.642832815 0, 1037410.6291011254 6777960.739489823 0, 1037410.6573646856 6777960.833824301 0, 1037410.6947697558 6777960.92492141 0, 1037410.7409535884 6777961.011897707 0, 1037410.7954683007 6777961.093909711 0, 1037410.8577852187 6777961.170162084 0, 1037410.927300004 6777961.239915343 0, 1037411.0033385146 6777961.302493036 0, 1037411.0851633423 6777961.357288293 0, 1037411.1719809647 6777961.403769719 0, 1037411.2629494397 6777961.441486548 0, 1037411.3571865712 6777961.470073007 0, 1037411.4537784645 6777961.48925187 0, 1037521.0537784644 6777977.68925187 0, 1037521.151690483 6777977.698832414 0, 1037521.2500700676 6777977.698745708 0, 1037521.3479650465 6777977.688992592 0, 1037521.4444279384 6777977.66966746 0, 1037521.5385251221 6777977.640957354 0, 1037521.6293458735 6777977.603140145 0, 1037521.7160111794 6777977.556581848 0, 1037521.797682245 6777977.501733081 0, 1037521.8735686131 6777977.439124701 0, 1037521.9429358136 6777977.369362664 0, 1037522.0051124725 6777977.293122169 0, 1037522.05949681 6777977.2111411095 0, 1037522.1055624643 6777977.124212946 0, 1037522.142863587 6777977.033179016 0, 1037522.1710391571 6777976.938920395 0, 1037522.189816476 6777976.842349373 0, 1037522.1990138064 6777976.744400614 0, 1037522.5534937348 6777968.768602226 0, 1037589.2307427692 6777973.397598836 0, 1037589.3308966315 6777973.399522586 0, 1037589.4307404616 6777973.391416629 0, 1037589.5292723769 6777973.373362306 0, 1037589.6255036594 6777973.345540781 0, 1037589.7184686762 6777973.30823123 0, 1037589.8072345705 6777973.261808036 0, 1037589.890910621 6777973.206737032 0, 1037589.9686571808 6777973.143570827 0, 1037590.039694102 6777973.072943264 0, 1037590.1033085651 6777972.995563053 0, 1037590.1588622308 6777972.912206667 0, 1037590.2057976461 6777972.823710544 0, 1037590.2436438376 6777972.730962698 0, 1037590.2720210381 6777972.634893809 0, 1037590.2906444963 6777972.536467879 0, 1037590.2993273353 6777972.436672563 0, 1037590.6624580284 6777962.541361173 0, 1037610.4459499624 6777963.373377189 0, 1037616.9728203724 6777977.622178788 0, 1037609.6588605972 6777983.732575563 0, 1037609.5883120507 6777983.797504261 0, 1037609.5243059326 6777983.868890886 0, 1037609.4674306407 6777983.946079192 0, 1037609.4182090203 6777984.0283595985 0, 1037609.3770935574 6777984.114975718 0, 1037609.3444622195 6777984.205131301 0, 1037609.3206149812 6777984.297997562 0, 1037609.3057710662 6777984.392720798 0, 1037609.300066932 6777984.488430235 0, 1037609.3035550159 6777984.58424603 0, 1037609.3162032524 6777984.679287366 0, 1037609.3378953685 6777984.7726805415 0, 1037609.368431952 6777984.863567011 0, 1037609.4075322854 6777984.95111127 0, 1037609.4548369258 6777985.034508538 0, 1037644.1800577057 6778039.941908917 0, 1037639.1094501878 6778046.487602258 0, 1037639.0532615718 6778046.567990569 0, 1037639.0052181064 6778046.653496514 0, 1037638.9657819429 6778046.743297572 0, 1037638.935332435 6778046.836529909 0, 1037638.9141624897 6778046.93229668 0, 1037638.9024757504 6778047.029676664 0, 1037638.900384637 6778047.127733119 0, 1037638.9079092646 6778047.225522797 0, 1037638.9249772506 6778047.322105016 0, 1037638.9514244106 6778047.416550708 0, 1037638.9869963374 6778047.507951359 0, 1037639.0313508494 6778047.595427747 0, 1037639.0840612808 6778047.678138397 0, 1037665.0541592595 6778084.330276676 0, 1037644.1629036183 6778102.050538158 0, 1037639.4 6778095.7 0, 1037639.3373374972 6778095.624475451 0, 1037639.2675740311 6778095.555456574 0, 1037639.1913814623 6778095.493608057 0, 1037639.1094935666 6778095.439525534 0, 1037639.0226989693 6778095.393729852 0, 1037638.93183355 6778095.356662046 0, 1037638.8377723922 6778095.328679101 0, 1037638.7414213562 6778095.310050506 0, 1037638.6437083553 6778095.300955666 0, 1037638.545574419 6778095.30148217 0, 1037638.4479646308 6778095.311624946 0, 1037638.3518190264 6778095.331286314 0, 1037638.2580635403 6778095.360276924 0, 1037638.1676010893 6778095.398317582 0, 1037638.0813028762 6778095.445041934 0, 1037638 6778095.5 0, 1037637.9244754517 6778095.562662503 0, 1037637.8554565741 6778095.632425969 0, 1037637.7936080567 6778095.7086185375 0, 1037637.7395255346 6778095.790506433 0, 1037637.6937298519 6778095.877301031 0, 1037637.6566620462 6778095.96816645 0, 1037637.6286791007 6778096.062227608 0, 1037637.6100505063 6778096.158578644 0, 1037637.6009556667 6778096.256291645 0, 1037637.6014821703 6778096.354425581 0, 1037637.6116249464 6778096.452035369 0, 1037637.6312863146 6778096.548180973 0, 1037637.6602769251 6778096.64193646 0, 1037637.6983175825 6778096.73239891 0, 1037637.7450419344 6778096.818697124 0, 1037637.7999999999 6778096.899999999 0, 1037643.2 6778104.1 0, 1037643.2611456519 6778104.173865159 0, 1037643.3290849609 6778104.2415342275 0, 1037643.4031932345 6778104.302384998 0, 1037643.4827890584 6778104.355857956 0, 1037643.5671405606 6778104.401461428 0, 1037643.6554721416 6778104.4387760945 0, 1037643.7469716053 6778104.467458853 0, 1037643.8407976278 6778104.4872459695 0, 1037643.9360874927 6778104.497955506 0, 1037644.0319650236 6778104.499488988 0, 1037644.127548641 6778104.491832317 0, 1037644.2219594672 6778104.475055893 0, 1037644.3143294089 6778104.449313975 0, 1037644.4038091382 6778104.414843255 0, 1037644.4895759019 6778104.371960685 0, 1037644.5708410874 6778104.321060566 0, 1037644.6468574734 6778104.262610916 0, 1037667.0468574734 6778085.262610916 0, 1037667.119009066 6778085.195000693 0, 1037667.1841309109 6778085.120595451 0, 1037667.2415863122 6778085.040122652 0, 1037667.2908135285 6778084.9543690765 0, 1037667.3313312659 6778084.864173137 0, 1037667.3627433825 6778084.770416678 0, 1037667.3847427622 6778084.6740163565 0, 1037667.3971143172 6778084.575914679 0, 1037667.3997370909 6778084.477070783 0, 1037667.3925854407 6778084.378451067 0, 1037667.3757292877 6778084.281019733 0, 1037667.349333435 6778084.1857293695 0, 1037667.3136559542 6778084.093511627 0, 1037667.2690456641 6778084.005268119 0, 1037667.2159387192 6778083.921861603 0, 1037641.1443853851 6778047.126537275 0, 1037646.1905498123 6778040.6123977415 0, 1037646.2487538995 6778040.528788066 0, 1037646.2981493693 6778040.439690472 0, 1037646.3382235811 6778040.34602964 0, 1037646.368560633 6778040.248777612 0, 1037646.3888456782 6778040.148943697 0, 1037646.3988681925 6778040.047564 0, 1037646.3985241593 6778039.94569067 0, 1037646.3878171492 6778039.8443809785 0, 1037646.3668582825 6778039.7446863465 0, 1037646.3358650765 6778039.647641434 0, 1037646.2951591879 6778039.554253403 0, 1037646.2451630742 6778039.465491462 0, 1037611.613368102 6777984.7058156505 0, 1037618.8411394028 6777978.667424438 0, 1037618.9147852665 6777978.599343995 0, 1037618.9812413484 6777978.524229089 0, 1037619.0398391894 6777978.442835275 0, 1037619.0899893736 6777978.355981266 0, 1037619.1311874574 6777978.2645406965 0, 1037619.1630190433 6777978.169433336 0, 1037619.185163948 6777978.071615837 0, 1037619.1973994238 6777977.972072112 0, 1037619.1996023979 6777977.87180344 0, 1037619.1917507115 6777977.771818386 0, 1037619.1739233419 6777977.673122668 0, 1037619.1462996088 6777977.576709032 0, 1037619.1091573698 6777977.483547269 0, 1037612.0091573698 6777961.983547269 0, 1037611.9630750617 6777961.894924325 0, 1037611.9083813312 6777961.811340827 0, 1037611.845621891 6777961.733630736 0, 1037611.7754229297 6777961.662569417 0, 1037611.6984848649 6777961.598865888 0, 1037611.6155753543 6777961.543155759 0, 1037611.5275216362 6777961.495994884 0, 1037611.435202276 6777961.4578538155 0, 1037611.3395383997 6777961.42911311 0, 1037611.2414845038 6777961.41005953 0, 1037611.1420189315 6777961.400883186 0, 1037589.7420189314 6777960.500883185 0, 1037589.6435521484 6777960.501594451 0, 1037589.5456326958 6777960.51198647 0, 1037589.4492100214 6777960.5319584785 0, 1037589.3552190602 6777960.5613168245 0, 1037589.2645711685 6777960.599776843 0, 1037589.1781452877 6777960.646965616 0, 1037589.0967794213 6777960.7024255935 0, 1037589.0212625104 6777960.765619023 0, 1037588.9523267829 6777960.835933166 0, 1037588.8906406544 6777960.912686243 0, 1037588.8368022466 6777960.995134039 0, 1037588.7913335885 6777961.0824771235 0, 1037588.7546755536 6777961.173868598 0, 1037588.7271835861 6777961.268422313 0, 1037588.7091242541 6777961.365221455 0, 1037588.7006726647 6777961.463327438 0, 1037588.3385618828 6777971.3308462445 0, 1037521.6692572308 6777966.702401165 0, 1037521.5695865431 6777966.7004625965 0, 1037521.4702181044 6777966.708457435 0, 1037521.3721394388 6777966.726306227 0, 1037521.2763252524 6777966.753831591 0, 1037521.1837277468 6777966.790759982 0, 1037521.0952671566 6777966.836724403 0, 1037521.0118226034 6777966.891268061 0, 1037520.9342233597 6777966.953848899 0, 1037520.8632406067 6777967.023844991 0, 1037520.7995797717 6777967.100560714 0, 1037520.7438735161 6777967.183233666 0, 1037520.696675449 6777967.271042245 0, 1037520.6584546248 6777967.3631138075 0, 1037520.6295908825 6777967.458533347 0, 1037520.6103710699 6777967.556352582 0, 1037520.6009861935 6777967.655599386 0, 1037520.2501798564 6777975.54874197 0, 1037412.6474677842 6777959.643961536 0, 1037413.0985578718 6777951.253685907 0, 1037413.098929985 6777951.153751917 0, 1037413.0893258434 6777951.054279804 0, 1037413.0698413631 6777950.95626299 0, 1037413.0406711345 6777950.860680362 0, 1037413.0021064789 6777950.7684865 0, 1037412.9545325392 6777950.680602138 0, 1037412.8984244337 6777950.597904972 0, 1037412.8343425104 6777950.521220893 0, 1037412.762926752 6777950.45131574 0, 1037412.6848903833 6777950.388887653 0, 1037412.6010127489 6777950.334560097 0, 1037412.5121315297 6777950.2888756385 0, 1037412.4191343775 6777950.2522905255 0, 1037412.3229500491 6777950.22517013 0, 1037349.8235749475 6777935.931149011 0, 1037351.2893975304 6777925.945232665 0, 1037351.2988248661 6777925.848465319 0, 1037351.298810516 6777925.751239839 0, 1037351.2893546158 6777925.654475279 0, 1037351.2705465503 6777925.559086335 0, 1037351.2425641081 6777925.465974698 0, 1037351.2056718015 6777925.376020533 0, 1037351.1602183658 6777925.290074159 0, 1037351.1066334632 6777925.208948009 0, 1037351.0454236206 6777925.133408952 0, 1037350.977167442 6777925.064171041 0, 1037350.902510139 6777925.001888772 0, 1037350.8221574317 6777924.947150882 0, 1037350.7368688779 6777924.900474801 0, 1037350.6474506925 6777924.862301745 0, 1037328.2474506925 6777916.562301746 0, 1037328.1545508604 6777916.532940612 0, 1037328.0592347159 6777916.512759247 0, 1037327.9624070429 6777916.501949219 0, 1037327.8649869738 6777916.500613144 0, 1037327.7678992645 6777916.5087637035 0, 1037327.6720655153 6777916.526323529 0, 1037327.578395424 6777916.553125934 0, 1037327.4877781495 6777916.588916499 0, 1037327.4010738725 6777916.6333554825 0, 1037327.3191056292 6777916.68602105 0, 1037327.2426514996 6777916.746413277 0, 1037327.172437221 6777916.813958892 0, 1037327.1091292995 6777916.88801672 0, 1037314.1091292995 6777933.68801672 0, 1037314.0529075782 6777933.768554397 0, 1037314.0048579265 6777933.854219035 0, 1037313.9654438888 6777933.944184212 0, 1037313.9350457002 6777934.037582014 0, 1037313.913956618 6777934.133511415 0, 1037313.902380093 6777934.231046964 0, 1037313.9004278061 6777934.329247717 0, 1037313.9081185912 6777934.427166312 0, 1037313.925378254 6777934.523858108 0, 1037313.9520402872 6777934.618390299 0, 1037313.9878474766 6777934.709850917 0, 1037314.0324543832 6777934.797357621 0, 1037314.0854306753 6777934.880066216 0, 1037314.1462652801 6777934.957178798 0, 1037314.2143713142 6777935.027951444 0, 1037322.0076139475 6777942.368098576 0, 1037272.7461049502 6777984.943414735 0, 1037272.6753483136 6777985.010884673 0, 1037272.611518401 6777985.084941655 0, 1037272.5552253427 6777985.164877791 0, 1037272.5070072273 6777985.249928997 0, 1037272.4673249567 6777985.339282294 0, 1037272.4365578417 6777985.432083582 0, 1037272.4149999757 6777985.5274458 0, 1037272.4028574239 6777985.624457411 0, 1037272.400246253 6777985.72219111 0, 1037272.4071914227 6777985.819712692 0, 1037272.4236265458 6777985.916089976 0, 1037272.4493945243 6777986.010401723 0, 1037272.48424905 6777986.101746434 0, 1037272.5278569589 6777986.189250975 0, 1037276.6730802025 6777993.578561975 0, 1037246.7484387993 6778013.365865573 0, 1037246.6693352461 6778013.42394461 0, 1037246.5963053392 6778013.489497485 0, 1037246.5300523966 6778013.561892887 0, 1037246.4712144703 6778013.6404336095 0, 1037246.4203582017 6778013.724363262 0, 1037246.3779733644 6778013.812873556 0, 1037246.3444681478 6778013.9051120905 0, 1037246.3201652252 6778014.000190556 0, 1037246.3052986471 6778014.097193296 0, 1037246.3000115869 6778014.19518612 0, 1037246.3043549616 6778014.293225305 0, 1037246.3182869424 6778014.390366679 0, 1037246.3416733566 6778014.485674718 0, 1037246.3742889802 6778014.578231554 0, 1037246.415819707 6778014.667145812 0, 1037246.4658655733 6778014.751561201 0, 1037246.5239446101 6778014.830664754 0, 1037246.5894974847 6778014.903694661 0, 1037246.6618928869 6778014.9699476035 0, 1037246.7404336092 6778015.02878553 0, 1037246.8243632619 6778015.0796417985 0, 1037246.9128735565 6778015.122026635 0, 1037247.0051120903 6778015.1555318525 0, 1037247.1001905558 6778015.179834775 0, 1037247.1971932955 6778015.194701353 0, 1037247.29518612 6778015.199988414 0, 1037247.3932253048 6778015.195645039 0, 1037247.4903666788 6778015.181713058 0, 1037247.5856747178 6778015.1583266435 0, 1037247.678231553 6778015.12571102 0, 1037247.7671458117 6778015.084180294 0, 1037247.8515612008 6778015.034134427 0, 1037278.5515612008 6777994.734134427 0))
-CONSLINE0000002012151577;POLYGON Z ((1037650.3305817978 6778109.836345258 0, 1037670.9055178701 6778095.8416815335 0, 1037703.1259567053 6778135.23313267 0, 1037703.1917692595 6778135.305981033 0, 1037703.2644078665 6778135.372025025 0, 1037703.3431724224 6778135.430628105 0, 1037703.4273037807 6778135.481225444 0, 1037703.5159910683 6778135.523329378 0, 1037703.6083795017 6778135.5565341 0, 1037703.7035786249 6778135.5805195775 0, 1037703.8006708919 6778135.595054636 0, 1037703.8987205103 6778135.599999181 0, 1037703.9967824607 6778135.595305558 0, 1037704.0939116047 6778135.581019006 0, 1037704.1891717945 6778135.557277218 0, 1037704.2816448956 6778135.524309024 0, 1037704.3704396358 6778135.482432178 0, 1037704.4547001962 6778135.432050294 0, 1037710.0302255993 6778131.71503336 0, 1037752.9521698151 6778180.063890062 0, 1037753.0190203506 6778180.13230234 0, 1037753.0921013284 6778180.1940146135 0, 1037753.1707441134 6778180.248462261 0, 1037753.2542291842 6778180.2951471275 0, 1037753.3417927165 6778180.333642085 0, 1037753.4326335711 6778180.3635949325 0, 1037753.5259206237 6778180.384731624 0, 1037753.6208003691 6778180.396858776 0, 1037753.7164047306 6778180.399865434 0, 1037753.8118590012 6778180.393724089 0, 1037753.9062898478 6778180.3784909295 0, 1037753.9988333002 6778180.354305328 0, 1037754.0886426569 6778180.321388564 0, 1037754.174896231 6778180.280041801 0, 1037754.2568048683 6778180.230643328 0, 1037762.7754288365 6778174.520356932 0, 1037779.3687239833 6778186.639055634 0, 1037771.1048806335 6778206.045159681 0, 1037761.9148617827 6778204.023355533 0, 1037761.8187352938 6778204.007074056 0, 1037761.7214801799 6778204.000230726 0, 1037761.6240208885 6778204.002890591 0, 1037761.527283808 6778204.015028368 0, 1037761.4321884621 6778204.036528682 0, 1037761.3396387688 6778204.067187166 0, 1037761.250514449 6778204.106712398 0, 1037761.1656626639 6778204.154728676 0, 1037761.0858899626 6778204.210779586 0, 1037761.0119546158 6778204.274332343 0, 1037760.9445594077 6778204.344782852 0, 1037760.8843449556 6778204.421461455 0, 1037760.8318836215 6778204.503639291 0, 1037760.7876740708 6778204.590535228 0, 1037760.7521365323 6778204.681323288 0, 1037760.7256088043 6778204.775140493 0, 1037745.9143491023 6778268.957265869 0, 1037739.1525588331 6778268.60138217 0, 1037739.0550083459 6778268.601012637 0, 1037738.9578860097 6778268.610149701 0, 1037738.8621160636 6778268.628706412 0, 1037738.7686098767 6778268.656506181 0, 1037738.6782572758 6778268.693284458 0, 1037738.5919180774 6778268.738691251 0, 1037738.5104139056 6778268.792294461 0, 1037738.4345203731 6778268.853583986 0, 1037738.3649597004 6778268.921976579 0, 1037738.3023938434 6778268.9968214035 0, 1037738.2474181933 6778269.0774062155 0, 1037738.2005559112 6778269.162964153 0, 1037738.1622529496 6778269.252681026 0, 1037738.1328738085 6778269.345703067 0, 1037738.1126980666 6778269.441145058 0, 1037720.9126980667 6778376.341145058 0, 1037720.9016929877 6778376.441835501 0, 1037720.900930216 6778376.543122693 0, 1037720.9104175777 6778376.64396746 0, 1037720.9300577355 6778376.743335167 0, 1037720.9596491877 6778376.840206334 0, 1037720.9988883357 6778376.933587095 0, 1037721.0473725982 6778377.022519391 0, 1037721.1046045426 6778377.106090807 0, 1037721.1699969874 6778377.183443927 0, 1037721.2428790275 6778377.253785133 0, 1037721.3225029164 6778377.316392748 0, 1037721.408051739 6778377.370624436 0, 1037721.4986477919 6778377.415923798 0, 1037721.5933615888 6778377.451826079 0, 1037721.6912213967 6778377.477962932 0, 1037729.7253509209 6778379.193114178 0, 1037723.9039480278 6778444.511227996 0, 1037723.9000619738 6778444.611133003 0, 1037723.9061714122 6778444.710926724 0, 1037723.9222152723 6778444.809611607 0, 1037723.9480331779 6778444.906201191 0, 1037723.9833670503 6778444.999729953 0, 1037724.0278636883 6778445.08926297 0, 1037724.0810782983 6778445.173905259 0, 1037724.1424789412 6778445.252810727 0, 1037724.2114518494 6778445.325190626 0, 1037724.287307562 6778445.390321438 0, 1037724.3692878166 6778445.447552109 0, 1037724.4565731295 6778445.496310554 0, 1037724.5482909871 6778445.5361093795 0, 1037724.6435245674 6778445.566550749 0, 1037724.7413219046 6778445.587330371 0, 1037735.2065839688 6778447.269247489 0, 1037737.8199259494 6778466.962645985 0, 1037721.3126079604 6778476.316792846 0, 1037716.5890831291 6778467.142254231 0, 1037716.5401843216 6778467.057699063 0, 1037716.4832695929 6778466.97831781 0, 1037716.4188819478 6778466.904867821 0, 1037716.3476356873 6778466.838049859 0, 1037716.2702105488 6778466.778501412 0, 1037716.1873452197 6778466.726790611 0, 1037716.0998302909 6778466.683410812 0, 1037716.0085007133 6778466.648775889 0, 1037715.9142278322 6778466.62321628 0, 1037715.8179110743 6778466.606975841 0, 1037715.7204693657 6778466.600209519 0, 1037715.6228323657 6778466.602981867 0, 1037715.5259315965 6778466.615266436 0, 1037715.4306915565 6778466.6369460225 0, 1037715.3380208994 6778466.667813789 0, 1037715.2488037654 6778466.707575236 0, 1037715.1638913456 6778466.755851014 0, 1037658.9655803496 6778502.446708173 0, 1037652.4153829846 6778493.221078081 0, 1037652.353183584 6778493.142189626 0, 1037652.2833829387 6778493.069939894 0, 1037652.2066854876 6778493.00505804 0, 1037652.1238652732 6778492.948198863 0, 1037652.0357581299 6778492.899936195 0, 1037651.9432532485 6778492.86075711 0, 1037651.8472842025 6778492.831057007 0, 1037651.7488195263 6778492.811135626 0, 1037651.6488529404 6778492.801194018 0, 1037651.5483933233 6778492.801332512 0, 1037651.4484545286 6778492.811549713 0, 1037651.3500451542 6778492.831742506 0, 1037651.2541583625 6778492.8617071025 0, 1037651.1617618578 6778492.901141095 0, 1037651.07378812 6778492.94964651 0, 1037650.9911249932 6778493.006733824 0, 1037610.474591067 6778524.105380929 0, 1037592.8284709514 6778501.697609354 0, 1037602.2536241984 6778494.842952447 0, 1037607.8514118198 6778501.163035246 0, 1037607.9200052952 6778501.233217022 0, 1037607.9951474913 6778501.296337518 0, 1037608.0761147477 6778501.351788849 0, 1037608.1621273055 6778501.399036987 0, 1037608.2523568167 6778501.437626908 0, 1037608.3459343218 6778501.467186968 0, 1037608.4419586182 6778501.48743249 0, 1037608.5395049396 6778501.498168496 0, 1037608.6376338614 6778501.499291595 0, 1037608.7354003487 6778501.49079097 0, 1037608.8318628564 6778501.472748485 0, 1037608.9260923982 6778501.445337902 0, 1037609.017181492 6778501.408823197 0, 1037609.1042528998 6778501.363556027 0, 1037609.1864680767 6778501.309972342 0, 1037609.2630352452 6778501.24858818 0, 1037609.333217022 6778501.179994705 0, 1037609.3963375181 6778501.104852509 0, 1037609.4517888485 6778501.023885252 0, 1037609.4990369866 6778500.937872695 0, 1037609.5376269072 6778500.847643184 0, 1037609.567186968 6778500.754065678 0, 1037609.5874324896 6778500.658041382 0, 1037609.5981684966 6778500.560495061 0, 1037609.5992915953 6778500.462366139 0, 1037609.5907909697 6778500.364599652 0, 1037609.5727484854 6778500.268137144 0, 1037609.5453379013 6778500.173907602 0, 1037609.5088231966 6778500.082818508 0, 1037609.4635560277 6778499.995747101 0, 1037609.4099723421 6778499.913531924 0, 1037609.3485881801 6778499.836964754 0, 1037603.1485881802 6778492.836964754 0, 1037603.0798918074 6778492.766687563 0, 1037603.0046289886 6778492.703492758 0, 1037602.9235266173 6778492.64799068 0, 1037602.8373679868 6778492.600717372 0, 1037602.7469852231 6778492.562129404 0, 1037602.6532512503 6778492.53259946 0, 1037602.5570713576 6778492.512412744 0, 1037602.4593744581 6778492.501764219 0, 1037602.3611041155 6778492.500756731 0, 1037602.2632094322 6778492.50940001 0, 1037602.1666358827 6778492.527610578 0, 1037602.0723161813 6778492.555212555 0, 1037601.981161275 6778492.591939362 0, 1037601.8940515444 6778492.637436287 0, 1037601.8118283023 6778492.691263916 0, 1037590.8118283023 6778500.691263916 0, 1037590.7336049431 6778500.754401161 0, 1037590.6621156432 6778500.825072837 0, 1037590.5980828163 6778500.90256479 0, 1037590.5421535276 6778500.986093949 0, 1037590.494892954 6778501.0748162335 0, 1037590.4567786732 6778501.167835088 0, 1037590.428195838 6778501.264210537 0, 1037590.4094332837 6778501.362968688 0, 1037590.4006806099 6778501.463111567 0, 1037590.402026264 6778501.563627212 0, 1037590.413456648 6778501.663499892 0, 1037590.4348562555 6778501.7617203705 0, 1037590.4660088391 6778501.857296112 0, 1037590.5065995955 6778501.949261302 0, 1037590.5562183467 6778502.036686614 0, 1037590.6143636854 6778502.118688597 0, 1037609.5143636854 6778526.118688597 0, 1037609.5782508582 6778526.192154734 0, 1037609.648979379 6778526.259060045 0, 1037609.7258788227 6778526.3187703425 0, 1037609.8082202717 6778526.370719644 0, 1037609.895223224 6778526.41441553 0, 1037609.9860629922 6778526.449443813 0, 1037610.0798785206 6778526.475472467 0, 1037610.175780546 6778526.492254769 0, 1037610.2728600283 6778526.499631643 0, 1037610.3701967662 6778526.497533164 0, 1037610.4668681199 6778526.485979225 0, 1037610.5619577566 6778526.465079341 0, 1037610.6545643366 6778526.435031621 0, 1037610.7438100566 6778526.396120881 0, 1037610.8288489701 6778526.348715952 0, 1037610.9088750068 6778526.293266176 0, 1037651.3855070631 6778495.225245929 0, 1037657.8846170154 6778504.378921919 0, 1037657.9473288989 6778504.458396699 0, 1037658.0177549247 6778504.531123558 0, 1037658.0951732945 6778504.596357116 0, 1037658.1787905461 6778504.653428793 0, 1037658.2677496844 6778504.701753661 0, 1037658.3611389652 6778504.740836436 0, 1037658.45800124 6778504.770276559 0, 1037658.5573437652 6778504.789772296 0, 1037658.6581483771 6778504.799123837 0, 1037658.7593819271 6778504.798235336 0, 1037658.8600068706 6778504.787115901 0, 1037658.9589919002 6778504.765879493 0, 1037659.0553225164 6778504.7347437665 0, 1037659.1480114246 6778504.694027831 0, 1037659.2361086543 6778504.644148986 0, 1037715.3120138351 6778469.031030257 0, 1037720.0109168709 6778478.157745769 0, 1037720.061427417 6778478.244789889 0, 1037720.1204310214 6778478.32631638 0, 1037720.1873300959 6778478.401499542 0, 1037720.2614470869 6778478.469577922 0, 1037720.342031338 6778478.52986202 0, 1037720.4282666926 6778478.581741281 0, 1037720.519279759 6778478.624690272 0, 1037720.614148758 6778478.658274004 0, 1037720.7119128566 6778478.682152344 0, 1037720.8115819007 6778478.696083451 0, 1037720.9121464427 6778478.699926229 0, 1037721.0125879657 6778478.693641761 0, 1037721.1118891984 6778478.6772936955 0, 1037721.2090444185 6778478.651047605 0, 1037721.3030696387 6778478.61516931 0, 1037721.393012572 6778478.570022186 0, 1037739.393012572 6778468.370022186 0, 1037739.4765341317 6778468.317073066 0, 1037739.5544174989 6778468.256133412 0, 1037739.625901016 6778468.187799182 0, 1037739.6902856132 6778468.1127386475 0, 1037739.7469416435 6778468.031685859 0, 1037739.7953150417 6778467.9454334695 0, 1037739.8349327421 6778467.854824982 0, 1037739.8654073048 6778467.760746498 0, 1037739.8864407052 6778467.664118052 0, 1037739.8978272479 6778467.565884622 0, 1037739.8994555786 6778467.467006875 0, 1037739.8913097734 6778467.368451783 0, 1037737.0913097734 6778446.268451784 0, 1037737.0735854547 6778446.171677066 0, 1037737.0464373183 6778446.0771124 0, 1037737.0101281442 6778445.985673123 0, 1037736.9650093871 6778445.898244322 0, 1037736.9115177739 6778445.815672264 0, 1037736.8501710764 6778445.738756206 0, 1037736.7815630999 6778445.668240654 0, 1037736.7063579351 6778445.604808166 0, 1037736.6252835303 6778445.549072734 0, 1037736.539124645 6778445.50157385 0, 1037736.4487152536 6778445.462771282 0, 1037736.354930474 6778445.433040615 0, 1037736.2586780954 6778445.412669629 0, 1037725.978779327 6778443.76054304 0, 1037731.7960519723 6778378.488772004 0, 1037731.7999700855 6778378.392265126 0, 1037731.7945595486 6778378.295830406 0, 1037731.7798708364 6778378.200367478 0, 1037731.7560409786 6778378.106766907 0, 1037731.7232922823 6778378.015901886 0, 1037731.6819302579 6778377.92862009 0, 1037731.6323407686 6778377.845735763 0, 1037731.5749864314 6778377.768022128 0, 1037731.5104023007 6778377.69620417 0, 1037731.4391908774 6778377.630951873 0, 1037731.3620164876 6778377.572873971 0, 1037731.279599086 6778377.52251227 0, 1037731.1927075386 6778377.48033659 0, 1037731.1021524504 6778377.446740383 0, 1037731.0087786034 6778377.422037069 0, 1037723.038286028 6778375.720471238 0, 1037739.9445884065 6778270.645836106 0, 1037746.6474411668 6778270.99861783 0, 1037746.7471551979 6778270.998887575 0, 1037746.8464003666 6778270.98922542 0, 1037746.9441898824 6778270.969727437 0, 1037747.0395514276 6778270.940587491 0, 1037747.1315368264 6778270.902095321 0, 1037747.2192314713 6778270.854633652 0, 1037747.3017634182 6778270.798674394 0, 1037747.378312055 6778270.734773949 0, 1037747.4481162617 6778270.663567674 0, 1037747.5104819777 6778270.585763573 0, 1037747.5647891033 6778270.502135247 0, 1037747.6104976648 6778270.413514211 0, 1037747.6471531837 6778270.320781618 0, 1037747.6743911956 6778270.224859507 0, 1037762.4518244427 6778206.189315436 0, 1037771.4851382172 6778208.176644467 0, 1037771.5826327632 6778208.193088582 0, 1037771.6812746437 6778208.199824666 0, 1037771.7800995759 6778208.196786867 0, 1037771.8781414869 6778208.184004883 0, 1037771.9744419588 6778208.161603667 0, 1037772.0680595972 6778208.129802201 0, 1037772.1580792338 6778208.088911366 0, 1037772.2436208733 6778208.039330892 0, 1037772.3238482949 6778207.9815454595 0, 1037772.397977228 6778207.916119955 0, 1037772.4652830183 6778207.843693951 0, 1037772.5251077112 6778207.764975456 0, 1037772.5768664851 6778207.680733988 0, 1037772.6200533668 6778207.59179306 0, 1037781.5200533668 6778186.69179306 0, 1037781.5533407528 6778186.601896355 0, 1037781.5778674446 6778186.5092253825 0, 1037781.5934080551 6778186.41463174 0, 1037781.5998197744 6778186.318984693 0, 1037781.5970436822 6778186.2231631875 0, 1037781.5851052892 6778186.128047771 0, 1037781.564114303 6778186.034512503 0, 1037781.5342636196 6778185.943416925 0, 1037781.4958275508 6778185.855598155 0, 1037781.4491593036 6778185.771863202 0, 1037781.3946877343 6778185.692981545 0, 1037781.3329134079 6778185.619678064 0, 1037781.2644039973 6778185.55262638 0, 1037781.1897890677 6778185.492442661 0, 1037763.3897890678 6778172.492442661 0, 1037763.3046875156 6778172.436697902 0, 1037763.2143625726 6778172.389888107 0, 1037763.1197490797 6778172.352497743 0, 1037763.021826263 6778172.324913794 0, 1037762.9216075994 6778172.307421745 0, 1037762.8201303273 6778172.300202635 0, 1037762.7184447113 6778172.3033311805 0, 1037762.6176031723 6778172.316775002 0, 1037762.5186493952 6778172.340394958 0, 1037762.4226075273 6778172.373946588 0, 1037762.330471578 6778172.417082642 0, 1037762.2431951317 6778172.469356672 0, 1037753.8682952931 6778178.08330052 0, 1037710.9478301848 6778129.7361099385 0, 1037710.8811032346 6778129.6678126035 0, 1037710.808166658 6778129.60619063 0, 1037710.7296854189 6778129.551805826 0, 1037710.6463750316 6778129.505154018 0, 1037710.5589950378 6778129.466660532 0, 1037710.468342082 6778129.436676313 0, 1037710.3752426482 6778129.415474727 0, 1037710.2805455253 6778129.403249069 0, 1037710.1851140676 6778129.400110802 0, 1037710.0898183254 6778129.406088537 0, 1037709.9955271106 6778129.421127773 0, 1037709.9031000778 6778129.445091399 0, 1037709.8133798849 6778129.477760939 0, 1037709.7271845122 6778129.5188385425 0, 1037709.6452998038 6778129.567949706 0, 1037704.0998686458 6778133.264903811 0, 1037671.8740432947 6778093.86686733 0, 1037671.8077930255 6778093.79358013 0, 1037671.7346346171 6778093.727187666 0, 1037671.6552821039 6778093.668337938 0, 1037671.5705099753 6778093.617605325 0, 1037671.4811456166 6778093.575484982 0, 1037671.3880612341 6778093.542388009 0, 1037671.2921653417 6778093.518637436 0, 1037671.194393894 6778093.504465072 0, 1037671.0957011515 6778093.50000924 0, 1037670.9970503661 6778093.50531343 0, 1037670.8994043807 6778093.520325872 0, 1037670.803716231 6778093.544900043 0, 1037670.710919844 6778093.578796096 0, 1037670.6219209229 6778093.621683203 0, 1037670.5375881069 6778093.67314278 0, 1037648.337588107 6778108.773142779 0, 1037648.2569144996 6778108.834205615 0, 1037648.1828240947 6778108.903107813 0, 1037648.1160753483 6778108.979144026 0, 1037648.057351561 6778109.06153588 0, 1037648.0072538821 6778109.149439938 0, 1037647.9662951569 6778109.241956335 0, 1037647.9348946754 6778109.338137989 0, 1037647.9133738816 6778109.437000299 0, 1037647.9019530815 6778109.53753122 0, 1037647.9007491887 6778109.638701629 0, 1037647.9097745274 6778109.739475853 0, 1037647.9289367063 6778109.838822275 0, 1037647.9580395636 6778109.935723899 0, 1037647.9967851767 6778110.029188749 0, 1037648.0447769103 6778110.118260037 0, 1037648.1015234778 6778110.202025949 0, 1037657.6015234778 6778122.80202595 0, 1037657.6643772225 6778122.877391416 0, 1037657.7343154167 6778122.946233232 0, 1037657.8106645172 6778123.007888414 0, 1037657.8926892406 6778123.061763189 0, 1037657.979599644 6778123.1073387135 0, 1037658.0705587326 6778123.144176071 0, 1037658.1646905207 6778123.171920495 0, 1037658.2610884678 6778123.190304794 0, 1037658.3588242087 6778123.199151917 0, 1037658.4569564952 6778123.198376661 0, 1037658.5545402593 6778123.187986492 0, 1037658.6506357164 6778123.168081473 0, 1037658.7443174145 6778123.138853299 0, 1037658.8346831476 6778123.100583456 0, 1037658.9208626444 6778123.053640502 0, 1037659.0020259493 6778122.998476522 0, 1037659.0773914151 6778122.935622778 0, 1037659.1462332313 6778122.865684584 0, 1037659.2078884136 6778122.789335483 0, 1037659.2617631888 6778122.707310759 0, 1037659.3073387133 6778122.620400356 0, 1037659.3441760701 6778122.529441267 0, 1037659.3719204952 6778122.43530948 0, 1037659.3903047947 6778122.338911532 0, 1037659.3991519175 6778122.241175791 0, 1037659.3983766612 6778122.143043505 0, 1037659.387986492 6778122.045459741 0, 1037659.3680814727 6778121.949364284 0, 1037659.3388532996 6778121.855682585 0, 1037659.3005834561 6778121.765316852 0, 1037659.2536405014 6778121.679137356 0, 1037659.1984765222 6778121.597974051 0, 1037650.3305817978 6778109.836345258 0))
-CONSLINE0000002012151578;POLYGON Z ((1037576.8313791254 6778513.579258917 0, 1037583.2733485008 6778508.989355737 0, 1037599.9165649939 6778531.897153718 0, 1037561.993771054 6778560.804709823 0, 1037561.9164280272 6778560.870116887 0, 1037561.8460984677 6778560.943012572 0, 1037561.7835039591 6778561.022648967 0, 1037561.7292867225 6778561.108208999 0, 1037561.6840030283 6778561.1988148205 0, 1037561.6481174887 6778561.293536813 0, 1037561.6219982901 6778561.3914031265 0, 1037561.6059134162 6778561.49140965 0, 1037561.6000278984 6778561.592530313 0, 1037561.6044021223 6778561.693727615 0, 1037561.618991208 6778561.793963269 0, 1037561.6436454713 6778561.892208856 0, 1037561.6781119587 6778561.98745637 0, 1037561.7220370431 6778562.078728572 0, 1037561.7749700516 6778562.165089006 0, 1037566.2755955555 6778568.736002242 0, 1037517.8377225021 6778611.550741356 0, 1037517.7650995523 6778611.621824998 0, 1037517.7000659027 6778611.699912139 0, 1037517.6432931543 6778611.784196374 0, 1037517.5953675978 6778611.873807301 0, 1037517.5567841595 6778611.967819509 0, 1037517.5279412896 6778612.065262139 0, 1037517.5091368477 6778612.165128901 0, 1037517.500565027 6778612.266388473 0, 1037517.5023143484 6778612.36799515 0, 1037517.5143667466 6778612.468899644 0, 1037517.536597757 6778612.568059916 0, 1037517.5687778003 6778612.664451937 0, 1037517.610574554 6778612.757080273 0, 1037517.6615563837 6778612.844988351 0, 1037523.7698052579 6778622.2422943115 0, 1037512.086019055 6778636.986119758 0, 1037492.6386400993 6778628.8907993315 0, 1037494.5812797808 6778618.99258762 0, 1037494.5952318009 6778618.897538004 0, 1037494.5999987387 6778618.801588203 0, 1037494.5955366 6778618.705623742 0, 1037494.5818865661 6778618.610530289 0, 1037494.5591746144 6778618.517185469 0, 1037494.5276103555 6778618.4264507685 0, 1037494.4874850988 6778618.339163587 0, 1037494.4391691637 6778618.256129505 0, 1037494.3831084624 6778618.178114853 0, 1037494.3198203839 6778618.105839633 0, 1037494.2498890196 6778618.03997088 0, 1037494.1739597721 6778617.9811165035 0, 1037494.0927333992 6778617.929819675 0, 1037494.0069595464 6778617.886553817 0, 1037493.9174298279 6778617.851718236 0, 1037493.8249705216 6778617.825634429 0, 1037430.5336860897 6778603.212358149 0, 1037430.8991330732 6778594.441630545 0, 1037430.8983695204 6778594.342918472 0, 1037430.8878771999 6778594.24476264 0, 1037430.8677583556 6778594.148119542 0, 1037430.8382090388 6778594.053930933 0, 1037430.7995171974 6778593.963114647 0, 1037430.7520598702 6778593.87655566 0, 1037430.6962995124 6778593.795097457 0, 1037430.6327794896 6778593.7195338225 0, 1037430.5621187825 6778593.650601096 0, 1037430.4850059556 6778593.588971005 0, 1037430.4021924466 6778593.535244112 0, 1037430.3144852449 6778593.489943968 0, 1037430.222739027 6778593.453512007 0, 1037430.1278478282 6778593.426303247 0, 1037430.0307363305 6778593.408582827 0, 1037320.8307363305 6778579.008582827 0, 1037320.7300925285 6778579.000452883 0, 1037320.629141925 6778579.002513592 0, 1037320.5289137388 6778579.0147439465 0, 1037320.4304298233 6778579.037019253 0, 1037320.334694249 6778579.069112408 0, 1037320.2426830656 6778579.110696215 0, 1037320.1553343522 6778579.161346715 0, 1037320.0735386526 6778579.220547512 0, 1037319.9981298962 6778579.287695039 0, 1037319.9298768956 6778579.362104707 0, 1037319.8694755086 6778579.443017892 0, 1037319.8175415439 6778579.529609659 0, 1037319.774604482 6778579.620997183 0, 1037319.7411020781 6778579.716248743 0, 1037319.7173758983 6778579.814393225 0, 1037318.1837032471 6778587.933836672 0, 1037253.1771592682 6778582.902981221 0, 1037253.0766546169 6778582.900272541 0, 1037252.9763859528 6778582.907669628 0, 1037252.8773668441 6778582.925097709 0, 1037252.7805982275 6778582.952380611 0, 1037252.6870582907 6778582.9892425435 0, 1037252.5976925843 6778583.035310889 0, 1037252.5134044633 6778583.090119963 0, 1037252.4350459562 6778583.153115726 0, 1037252.3634091516 6778583.2236613855 0, 1037252.2992181915 6778583.301043829 0, 1037252.243121952 6778583.384480834 0, 1037252.1956874831 6778583.473128975 0, 1037252.1573942769 6778583.566092152 0, 1037252.1286294213 6778583.662430644 0, 1037252.1096836866 6778583.761170611 0, 1037250.720306498 6778593.672061222 0, 1037231.3426204157 6778595.340952847 0, 1037223.5229780115 6778576.536574684 0, 1037231.096864313 6778570.902342191 0, 1037231.1731187577 6778570.839534406 0, 1037231.2428038607 6778570.769509092 0, 1037231.3052395263 6778570.692949665 0, 1037231.3598164098 6778570.610603311 0, 1037231.406001865 6778570.523273694 0, 1037231.4433451423 6778570.431813113 0, 1037231.4714817877 6778570.337114183 0, 1037231.4901372001 6778570.240101123 0, 1037231.499129311 6778570.141720738 0, 1037231.498370361 6778570.042933177 0, 1037231.4878677576 6778569.944702564 0, 1037231.4677240012 6778569.847987584 0, 1037231.438135686 6778569.753732135 0, 1037231.3993915811 6778569.662856106 0, 1037231.3518698115 6778569.576246409 0, 1037197.744212011 6778514.914379457 0, 1037202.8421026428 6778509.270286257 0, 1037202.9028782989 6778509.196142967 0, 1037202.9562747745 6778509.116520581 0, 1037203.0018013074 6778509.032150902 0, 1037203.0390394675 6778508.943809363 0, 1037203.0676470023 6778508.8523079045 0, 1037203.0873609826 6778508.758487508 0, 1037203.0980002189 6778508.663210466 0, 1037203.0994669271 6778508.5673524635 0, 1037203.0917476268 6778508.4717945205 0, 1037203.0749132652 6778508.377414903 0, 1037203.0491185656 6778508.285081045 0, 1037203.0146006047 6778508.195641577 0, 1037202.9716766338 6778508.109918531 0, 1037202.9207411632 6778508.028699778 0, 1037181.6207411633 6778477.428699778 0, 1037181.5592451665 6778477.349195285 0, 1037181.4900787268 6778477.27626569 0, 1037181.4139406136 6778477.210647782 0, 1037175.1139406136 6778472.310647782 0, 1037175.0336142746 6778472.254272026 0, 1037174.9481489385 6778472.206041092 0, 1037174.8583676831 6778472.166419471 0, 1037174.7651351511 6778472.135788741 0, 1037174.6693492227 6778472.114443893 0, 1037174.5719323686 6778472.102590487 0, 1037174.4738227664 6778472.100342683 0, 1037174.3759652654 6778472.107722123 0, 1037174.2793022867 6778472.124657742 0, 1037174.1847647476 6778472.1509864405 0, 1037174.0932630963 6778472.186454658 0, 1037174.0056785437 6778472.230720817 0, 1037173.922854577 6778472.283358609 0, 1037173.8455888361 6778472.343861105 0, 1037173.7746254326 6778472.411645631 0, 1037173.7106477827 6778472.486059386 0, 1037173.654272026 6778472.566385725 0, 1037173.6060410922 6778472.651851061 0, 1037173.5664194713 6778472.741632316 0, 1037173.5357887412 6778472.834864848 0, 1037173.5144438926 6778472.930650777 0, 1037173.5025904882 6778473.028067631 0, 1037173.5003426825 6778473.126177233 0, 1037173.5077221233 6778473.224034734 0, 1037173.5246577425 6778473.320697713 0, 1037173.5509864407 6778473.415235252 0, 1037173.5864546584 6778473.506736903 0, 1037173.6307208171 6778473.594321456 0, 1037173.6833586096 6778473.677145422 0, 1037173.743861105 6778473.754411164 0, 1037173.8116456312 6778473.825374567 0, 1037173.8860593864 6778473.889352217 0, 1037180.0660886524 6778478.696041646 0, 1037200.8253947796 6778508.519270167 0, 1037195.7578973572 6778514.129713742 0, 1037195.6953337777 6778514.206272562 0, 1037195.6406361762 6778514.288635337 0, 1037195.5943392465 6778514.375996934 0, 1037195.5568955622 6778514.467503354 0, 1037195.5286711523 6778514.562260079 0, 1037195.5099419232 6778514.659340821 0, 1037195.5008909616 6778514.75779657 0, 1037195.501606745 6778514.8566648755 0, 1037195.5120822758 6778514.954979258 0, 1037195.5322151514 6778515.051778646 0, 1037195.5618085635 6778515.146116785 0, 1037195.6005732232 6778515.237071474 0, 1037195.6481301885 6778515.323753591 0, 1037229.168713423 6778569.843996322 0, 1037221.703135687 6778575.397657809 0, 1037221.624580694 6778575.462566097 0, 1037221.5530392367 6778575.535131879 0, 1037221.4892541997 6778575.6146016335 0, 1037221.433887925 6778575.700150149 0, 1037221.3875153346 6778575.790889092 0, 1037221.3506179602 6778575.885876231 0, 1037221.323578943 6778575.984125223 0, 1037221.3066790557 6778576.084615853 0, 1037221.3000937861 6778576.186304628 0, 1037221.3038915154 6778576.288135616 0, 1037221.3180328081 6778576.389051406 0, 1037221.3423708215 6778576.488004091 0, 1037221.3766528303 6778576.58396615 0, 1037229.7766528302 6778596.78396615 0, 1037229.8182384545 6778596.871695428 0, 1037229.8681353783 6778596.954978605 0, 1037229.9258732839 6778597.033030669 0, 1037229.9909079454 6778597.105115918 0, 1037230.0626263602 6778597.170554894 0, 1037230.1403525254 6778597.228730779 0, 1037230.2233538104 6778597.279095223 0, 1037230.3108478624 6778597.321173498 0, 1037230.402009981 6778597.354568986 0, 1037230.495980891 6778597.378966906 0, 1037230.5918748424 6778597.39413729 0, 1037230.6887879589 6778597.399937144 0, 1037230.7858067577 6778597.396311799 0, 1037251.6858067578 6778595.596311798 0, 1037251.7810234784 6778595.583478774 0, 1037251.8745691874 6778595.561567346 0, 1037251.9655803728 6778595.530779775 0, 1037252.0532169187 6778595.4914002605 0, 1037252.1366698598 6778595.443792309 0, 1037252.2151688494 6778595.388395387 0, 1037252.2879892706 6778595.325720858 0, 1037252.3544589245 6778595.256347264 0, 1037252.4139642357 6778595.180914988 0, 1037252.465955916 6778595.100120337 0, 1037252.5099540347 6778595.01470912 0, 1037252.5455524494 6778594.925469761 0, 1037252.5724225541 6778594.8332260195 0, 1037252.5903163133 6778594.738829389 0, 1037253.9598437841 6778584.969533432 0, 1037318.9228407318 6778589.99701878 0, 1037319.0201854617 6778589.999796253 0, 1037319.1173387587 6778589.993091947 0, 1037319.2133792486 6778589.976969445 0, 1037319.3073961115 6778589.951581647 0, 1037319.3984977187 6778589.917169323 0, 1037319.4858200887 6778589.8740588315 0, 1037319.5685350815 6778589.822659018 0, 1037319.645858252 6778589.763457346 0, 1037319.7170562895 6778589.697015263 0, 1037319.7814539727 6778589.62396289 0, 1037319.8384405723 6778589.544993034 0, 1037319.887475644 6778589.460854621 0, 1037319.9280941533 6778589.372345596 0, 1037319.9599108861 6778589.280305353 0, 1037319.9826241017 6778589.185606775 0, 1037321.5070565279 6778581.115082165 0, 1037428.8628038206 6778595.271884006 0, 1037428.5008669269 6778603.958369455 0, 1037428.5016425462 6778604.057292184 0, 1037428.5121883986 6778604.155654233 0, 1037428.5324012795 6778604.252493002 0, 1037428.5620833792 6778604.346860797 0, 1037428.6009442197 6778604.437834105 0, 1037428.6486034967 6778604.524522634 0, 1037428.704594802 6778604.606078024 0, 1037428.7683701873 6778604.681702147 0, 1037428.8393055272 6778604.750654923 0, 1037428.9167066264 6778604.812261559 0, 1037428.9998160142 6778604.865919153 0, 1037429.0878203564 6778604.911102597 0, 1037429.1798584154 6778604.947369709 0, 1037429.2750294784 6778604.974365571 0, 1037492.4324067003 6778619.556724118 0, 1037490.5187202191 6778629.307412379 0, 1037490.5045978568 6778629.404216007 0, 1037490.5000018746 6778629.501936324 0, 1037490.504976258 6778629.59963811 0, 1037490.5194734002 6778629.6963863205 0, 1037490.5433545578 6778629.791255039 0, 1037490.5763911791 6778629.883336335 0, 1037490.618267091 6778629.971748956 0, 1037490.668581525 6778630.055646758 0, 1037490.7268529525 6778630.134226807 0, 1037490.7925236938 6778630.206737063 0, 1037490.8649652544 6778630.272483574 0, 1037490.9434843413 6778630.330837121 0, 1037491.0273294962 6778630.381239238 0, 1037491.1156982892 6778630.423207558 0, 1037512.0156982893 6778639.123207558 0, 1037512.1094263672 6778639.156852635 0, 1037512.2060360477 6778639.181008657 0, 1037512.3045692578 6778639.195436073 0, 1037512.4040488491 6778639.199991804 0, 1037512.5034882884 6778639.194630672 0, 1037512.60190144 6778639.179405845 0, 1037512.6983123464 6778639.1544683045 0, 1037512.791764906 6778639.120065356 0, 1037512.8813323551 6778639.076538171 0, 1037512.9661264583 6778639.024318405 0, 1037513.0453063172 6778638.963923921 0, 1037513.1180867095 6778638.895953646 0, 1037513.1837458765 6778638.821081638 0, 1037525.7837458765 6778622.921081638 0, 1037525.8396066602 6778622.84319486 0, 1037525.8877541645 6778622.760317872 0, 1037525.927746069 6778622.673212046 0, 1037525.9592149769 6778622.582677605 0, 1037525.9818717905 6778622.489546266 0, 1037525.9955083665 6778622.394673609 0, 1037525.9999994289 6778622.298931206 0, 1037525.9953037191 6778622.203198622 0, 1037525.9814643757 6778622.108355331 0, 1037525.9586085377 6778622.015272637 0, 1037525.9269461764 6778621.924805669 0, 1037525.8867681671 6778621.837785528 0, 1037525.8384436163 6778621.755011649 0, 1037519.8084506871 6778612.4780994505 0, 1037568.2622774979 6778569.649258644 0, 1037568.3313867683 6778569.581962899 0, 1037568.3936906247 6778569.50832162 0, 1037568.4486093419 6778569.429020024 0, 1037568.4956319114 6778569.344795997 0, 1037568.5343207975 6778569.25643323 0, 1037568.5643160074 6778569.1647539195 0, 1037568.5853384415 6778569.070611125 0, 1037568.5971924899 6778568.974880826 0, 1037568.5997678532 6778568.878453775 0, 1037568.5930405678 6778568.782227208 0, 1037568.5770732301 6778568.687096494 0, 1037568.5520144129 6778568.593946806 0, 1037568.5180972839 6778568.5036448855 0, 1037568.4756374354 6778568.417030972 0, 1037568.4250299484 6778568.334910994 0, 1037563.9621342575 6778561.8190832855 0, 1037601.906228946 6778532.895290176 0, 1037601.9802088686 6778532.833018346 0, 1037602.0478282874 6778532.763892199 0, 1037602.108454906 6778532.688558123 0, 1037602.1615218166 6778532.607720552 0, 1037602.2065328005 6778532.5221353825 0, 1037602.2430669684 6778532.432602906 0, 1037602.2707826964 6778532.339960323 0, 1037602.28942082 6778532.245073915 0, 1037602.2988070577 6778532.148830949 0, 1037602.2988536403 6778532.052131375 0, 1037602.2895601327 6778531.955879411 0, 1037602.2710134363 6778531.860975091 0, 1037602.2433869777 6778531.768305848 0, 1037602.206939087 6778531.678738213 0, 1037602.1620105813 6778531.593109718 0, 1037602.1090215786 6778531.512221057 0, 1037584.3090215785 6778507.012221057 0, 1037584.2478971792 6778506.93618541 0, 1037584.1796545848 6778506.866467693 0, 1037584.104943302 6778506.803731451 0, 1037584.0244744036 6778506.748573785 0, 1037583.9390137615 6778506.701519662 0, 1037583.8493747568 6778506.6630169265 0, 1037583.7564105388 6778506.633432033 0, 1037583.6610059048 6778506.613046557 0, 1037583.5640688791 6778506.6020545205 0, 1037583.4665220708 6778506.600560542 0, 1037583.3692938923 6778506.608578841 0, 1037583.2733097238 6778506.626033101 0, 1037583.1794831054 6778506.6527572 0, 1037583.0887070424 6778506.688496789 0, 1037583.001845506 6778506.732911711 0, 1037582.9197252108 6778506.785579243 0, 1037574.9197252108 6778512.485579243 0, 1037574.841821932 6778512.5471377075 0, 1037574.770407213 6778512.616118164 0, 1037574.7061850864 6778512.691840578 0, 1037574.6497886773 6778512.773558449 0, 1037574.6017739621 6778512.860466173 0, 1037574.5626142875 6778512.951706982 0, 1037574.5326957037 6778513.046381392 0, 1037574.5123131592 6778513.143556066 0, 1037574.5016675924 6778513.2422730215 0, 1037574.5008639514 6778513.341559071 0, 1037574.5099101587 6778513.440435416 0, 1037574.5287170333 6778513.537927297 0, 1037574.5570991705 6778513.633073604 0, 1037574.5947767686 6778513.724936349 0, 1037574.641378388 6778513.8126099175 0, 1037578.641378388 6778520.512609918 0, 1037578.695757444 6778520.594301196 0, 1037578.7578817955 6778520.670269028 0, 1037578.8271531509 6778520.739781804 0, 1037578.9029043893 6778520.802170076 0, 1037578.9844059849 6778520.856833013 0, 1037579.0708730326 6778520.903244179 0, 1037579.1614728076 6778520.940956609 0, 1037579.2553327845 6778520.969607113 0, 1037579.3515490405 6778520.98891977 0, 1037579.4491949604 6778520.99870859 0, 1037579.5473301606 6778520.9988793 0, 1037579.6450095454 6778520.989430256 0, 1037579.7412924091 6778520.970452458 0, 1037579.835251495 6778520.942128672 0, 1037579.9259819257 6778520.904731672 0, 1037580.0126099176 6778520.858621612 0, 1037580.0943011957 6778520.804242556 0, 1037580.1702690285 6778520.742118205 0, 1037580.239781804 6778520.672846849 0, 1037580.3021700765 6778520.597095611 0, 1037580.3568330127 6778520.515594015 0, 1037580.4032441784 6778520.429126968 0, 1037580.440956609 6778520.338527192 0, 1037580.469607113 6778520.244667215 0, 1037580.4889197706 6778520.1484509595 0, 1037580.49870859 6778520.05080504 0, 1037580.4988793 6778519.952669839 0, 1037580.4894302561 6778519.854990454 0, 1037580.470452458 6778519.758707591 0, 1037580.4421286723 6778519.664748505 0, 1037580.4047316724 6778519.574018074 0, 1037580.358621612 6778519.487390082 0, 1037576.8313791254 6778513.579258917 0))
-CONSLINE0000002012151579;POLYGON Z ((1037164.0504457243 6778452.833757833 0, 1037154.300732898 6778439.800978443 0, 1037154.2636660847 6778439.754388576 0, 1037136.7636660847 6778419.054388576 0, 1037136.6985503266 6778418.984439072 0, 1037136.6270547118 6778418.9210247835 0, 1037136.5498322095 6778418.864724871 0, 1037136.4675880923 6778418.816053522 0, 1037136.3810734954 6778418.775455252 0, 1037136.2910785561 6778418.743300845 0, 1037136.1984251979 6778418.719883966 0, 1037136.1039596234 6778418.7054184815 0, 1037136.008544586 6778418.700036506 0, 1037135.913051511 6778418.703787192 0, 1037135.8183525362 6778418.716636283 0, 1037135.7253125467 6778418.738466432 0, 1037135.6347812765 6778418.769078261 0, 1037135.5475855469 6778418.808192194 0, 1037135.4645217162 6778418.855451004 0, 1037135.3863484062 6778418.910423075 0, 1037135.3137795731 6778418.972606348 0, 1037130.7539295444 6778423.274351658 0, 1037085.3392124991 6778373.426527742 0, 1037085.2681453392 6778373.355969217 0, 1037085.1903773186 6778373.2928726105 0, 1037085.1066883763 6778373.237870723 0, 1037085.0179178326 6778373.19151517 0, 1037084.9249559714 6778373.154270854 0, 1037084.8287351115 6778373.1265113 0, 1037084.7302202566 6778373.108514909 0, 1037084.6303994167 6778373.100462168 0, 1037084.5302736996 6778373.10243384 0, 1037084.4308472708 6778373.114410149 0, 1037084.3331172825 6778373.136270984 0, 1037084.2380638736 6778373.167797103 0, 1037084.1466403389 6778373.208672328 0, 1037084.0597635695 6778373.258486721 0, 1037083.9783048566 6778373.316740688 0, 1037083.9030811532 6778373.382850001 0, 1037083.8348468815 6778373.456151644 0, 1037077.5177520056 6778380.963423816 0, 1037060.2745435308 6778369.160585929 0, 1037069.5586820968 6778349.942419097 0, 1037079.9904709111 6778352.177802415 0, 1037080.087164739 6778352.19361371 0, 1037080.1849417506 6778352.199886618 0, 1037080.2828633169 6778352.196560922 0, 1037080.3799894208 6778352.183668546 0, 1037080.4753876813 6778352.161333254 0, 1037080.5681423045 6778352.1297694575 0, 1037080.6573628745 6778352.089280159 0, 1037080.7421929012 6778352.040254043 0, 1037080.8218180422 6778351.983161747 0, 1037080.8954739206 6778351.918551338 0, 1037080.9624534628 6778351.847043057 0, 1037081.0221136854 6778351.76932336 0, 1037081.0738818686 6778351.686138334 0, 1037081.117261054 6778351.598286529 0, 1037081.1518348143 6778351.506611295 0, 1037081.1772712523 6778351.411992687 0, 1037095.0961714638 6778287.2468498675 0, 1037103.04327331 6778287.698389745 0, 1037103.1421710816 6778287.699110405 0, 1037103.2406563658 6778287.690058476 0, 1037103.3377658494 6778287.671322501 0, 1037103.4325496766 6778287.64308574 0, 1037103.5240807396 6778287.605624385 0, 1037103.6114637463 6778287.559304857 0, 1037103.6938439786 6778287.504580219 0, 1037103.7704156516 6778287.441985751 0, 1037103.8404297956 6778287.372133706 0, 1037103.903201582 6778287.295707326 0, 1037103.9581170221 6778287.213454162 0, 1037104.0046389718 6778287.1261787545 0, 1037104.0423123867 6778287.03473477 0, 1037104.0707687723 6778286.940016647 0, 1037104.0897297882 6778286.842950853 0, 1037119.7897297883 6778178.142950852 0, 1037119.7988802658 6778178.047309775 0, 1037119.7988101324 6778177.951231983 0, 1037119.7895200357 6778177.855604366 0, 1037119.771095732 6778177.761309658 0, 1037119.743707295 6778177.669218287 0, 1037119.707607546 6778177.580180345 0, 1037119.6631297199 6778177.495017736 0, 1037119.6106843891 6778177.4145165915 0, 1037119.5507556738 6778177.339420014 0, 1037119.4838967725 6778177.270421214 0, 1037119.4107248564 6778177.208157118 0, 1037119.3319153716 6778177.153202482 0, 1037119.2481958041 6778177.106064588 0, 1037119.1603389649 6778177.067178564 0, 1037119.0691558558 6778177.036903366 0, 1037118.9754881833 6778177.015518462 0, 1037118.8802005887 6778177.003221256 0, 1037111.1788382775 6778176.383571414 0, 1037116.5966275836 6778110.58205766 0, 1037116.5998236738 6778110.481221788 0, 1037116.5928434704 6778110.380577041 0, 1037116.5757580185 6778110.281147791 0, 1037116.5487412154 6778110.183946039 0, 1037116.5120680403 6778110.089961112 0, 1037116.4661117563 6778110.0001495965 0, 1037116.4113401104 6778109.915425603 0, 1037116.3483105731 6778109.836651459 0, 1037116.2776646648 6778109.764628936 0, 1037116.2001214257 6778109.7000910835 0, 1037116.1164700977 6778109.643694775 0, 1037116.0275620915 6778109.596014016 0, 1037115.9343023205 6778109.557534108 0, 1037115.8376399911 6778109.528646699 0, 1037115.7385589407 6778109.509645811 0, 1037115.6380676253 6778109.500724834 0, 1037105.9633736797 6778109.132165065 0, 1037102.4153659268 6778085.976746045 0, 1037120.0850681645 6778079.963496593 0, 1037127.4443109172 6778088.454930538 0, 1037127.5145107235 6778088.528082723 0, 1037127.5917568487 6778088.59375076 0, 1037127.6752552605 6778088.65125963 0, 1037127.7641476572 6778088.700018186 0, 1037127.8575202912 6778088.739525225 0, 1037127.9544133615 6778088.769374645 0, 1037128.0538308794 6778088.789259616 0, 1037128.154750907 6778088.798975735 0, 1037128.2561360615 6778088.798423128 0, 1037128.3569441792 6778088.787607475 0, 1037128.4561390276 6778088.766639953 0, 1037128.5527009576 6778088.735736093 0, 1037128.6456373846 6778088.695213562 0, 1037128.7339929914 6778088.645488903 0, 1037183.1529085668 6778054.2756474875 0, 1037189.1875967631 6778060.401770353 0, 1037189.2577975685 6778060.466535086 0, 1037189.3338569447 6778060.524307007 0, 1037189.4150810309 6778060.574559085 0, 1037189.5007288505 6778060.616832891 0, 1037189.5900190703 6778060.650742775 0, 1037189.6821371296 6778060.67597939 0, 1037189.7762426698 6778060.6923125135 0, 1037189.8714772015 6778060.699593143 0, 1037189.9669719359 6778060.69775486 0, 1037190.0618557107 6778060.686814435 0, 1037190.1552629367 6778060.666871673 0, 1037190.246341495 6778060.638108506 0, 1037190.3342605102 6778060.600787328 0, 1037190.4182179302 6778060.555248605 0, 1037190.4974478433 6778060.501907772 0, 1037220.6974478433 6778038.001907772 0, 1037220.7392726553 6778037.968980151 0, 1037229.0392726554 6778031.068980151 0, 1037229.1115676182 6778031.002617624 0, 1037229.1770097958 6778030.929488504 0, 1037229.2349689443 6778030.850297067 0, 1037229.2848868856 6778030.765805968 0, 1037229.3262828822 6778030.676828903 0, 1037229.3587582684 6778030.584222769 0, 1037229.3820002885 6778030.488879415 0, 1037229.3957851088 6778030.391717049 0, 1037229.3999799743 6778030.2936713975 0, 1037229.3945444858 6778030.195686694 0, 1037229.3795309904 6778030.098706585 0, 1037229.355084076 6778030.003665041 0, 1037229.3214391799 6778029.9114773655 0, 1037229.2789203209 6778029.823031374 0, 1037229.2279369787 6778029.739178852 0, 1037229.1689801507 6778029.660727344 0, 1037229.1026176235 6778029.588432382 0, 1037229.0294885045 6778029.522990204 0, 1037228.9502970671 6778029.465031056 0, 1037228.8658059682 6778029.415113115 0, 1037228.776828903 6778029.373717118 0, 1037228.6842227696 6778029.341241731 0, 1037228.5888794155 6778029.317999711 0, 1037228.4917170495 6778029.304214891 0, 1037228.393671398 6778029.300020026 0, 1037228.2956866946 6778029.305455514 0, 1037228.1987065852 6778029.32046901 0, 1037228.1036650415 6778029.344915924 0, 1037228.0114773654 6778029.37856082 0, 1037227.9230313747 6778029.421079679 0, 1037227.8391788525 6778029.472063021 0, 1037227.7607273447 6778029.531019849 0, 1037219.4812014021 6778036.413999247 0, 1037190.001092452 6778058.377656577 0, 1037184.0124032369 6778052.298229647 0, 1037183.9411861919 6778052.232614655 0, 1037183.8639566192 6778052.174195585 0, 1037183.7814387156 6778052.123520244 0, 1037183.6944062675 6778052.081063824 0, 1037183.6036753949 6778052.047224447 0, 1037183.5100968991 6778052.022319432 0, 1037183.4145482838 6778052.006582318 0, 1037183.317925527 6778052.0001606755 0, 1037183.2211346789 6778052.00311472 0, 1037183.1250833664 6778052.015416753 0, 1037183.0306722812 6778052.036951413 0, 1037182.9387867344 6778052.067516768 0, 1037182.8502883547 6778052.1068262 0, 1037182.7660070086 6778052.154511097 0, 1037128.3927450472 6778086.495518651 0, 1037121.1556890828 6778078.145069461 0, 1037121.0874547731 6778078.073772808 0, 1037121.0125252494 6778078.009548977 0, 1037120.9316302602 6778077.953023456 0, 1037120.8455576528 6778077.904746752 0, 1037120.7551456997 6778077.865189039 0, 1037120.6612749352 6778077.834735576 0, 1037120.5648595791 6778077.813682952 0, 1037120.4668386334 6778077.802236201 0, 1037120.3681667374 6778077.800506807 0, 1037120.2698048698 6778077.808511609 0, 1037120.17271099 6778077.826172651 0, 1037120.0778307081 6778077.853317927 0, 1037100.9778307081 6778084.353317927 0, 1037100.885266388 6778084.390057127 0, 1037100.7968153633 6778084.43582107 0, 1037100.7133548849 6778084.490155874 0, 1037100.6357127071 6778084.552522647 0, 1037100.5646588791 6778084.622302843 0, 1037100.500898107 6778084.698804387 0, 1037100.4450627654 6778084.781268543 0, 1037100.3977066249 6778084.868877436 0, 1037100.3592993598 6778084.960762169 0, 1037100.3302218907 6778085.056011437 0, 1037100.3107626054 6778085.153680565 0, 1037100.3011144997 6778085.252800877 0, 1037100.3013732627 6778085.352389307 0, 1037100.311536328 6778085.451458143 0, 1037104.111536328 6778110.251458143 0, 1037104.1312518198 6778110.348046293 0, 1037104.1603815784 6778110.442223934 0, 1037104.1986425219 6778110.533075855 0, 1037104.2456628312 6778110.619719157 0, 1037104.3009855647 6778110.701311843 0, 1037104.3640730975 6778110.777060997 0, 1037104.4343123466 6778110.846230492 0, 1037104.5110207293 6778110.908148142 0, 1037104.5934527955 6778110.96221223 0, 1037104.6808074729 6778111.007897365 0, 1037104.7722358512 6778111.044759579 0, 1037104.866849432 6778111.072440647 0, 1037104.9637287633 6778111.090671564 0, 1037105.0619323746 6778111.099275165 0, 1037114.5176161076 6778111.459491689 0, 1037109.1033724163 6778177.217942339 0, 1037109.1001302662 6778177.316140491 0, 1037109.106540247 6778177.414182832 0, 1037109.1225404808 6778177.511122922 0, 1037109.147976511 6778177.60602496 0, 1037109.1826027939 6778177.697972821 0, 1037109.2260850684 6778177.786078895 0, 1037109.2780035833 6778177.869492661 0, 1037109.337857149 6778177.947408893 0, 1037109.4050679756 6778178.019075435 0, 1037109.4789872512 6778178.083800463 0, 1037109.558901404 6778178.14095916 0, 1037109.6440389919 6778178.189999752 0, 1037109.7335781484 6778178.230448831 0, 1037109.8266545176 6778178.261915925 0, 1037109.9223695968 6778178.284097271 0, 1037110.0197994113 6778178.296778744 0, 1037117.6579936515 6778178.911346097 0, 1037102.2413369995 6778285.649599477 0, 1037094.3567266901 6778285.201610255 0, 1037094.2557758758 6778285.200978366 0, 1037094.15527577 6778285.21052797 0, 1037094.0562506164 6778285.230161747 0, 1037093.9597096265 6778285.259679597 0, 1037093.8666366944 6778285.29878069 0, 1037093.7779803697 6778285.347066529 0, 1037093.6946441905 6778285.404045012 0, 1037093.6174774745 6778285.469135442 0, 1037093.5472666639 6778285.541674454 0, 1037093.4847273096 6778285.6209227685 0, 1037093.4304967793 6778285.706072729 0, 1037093.3851277616 6778285.796256533 0, 1037093.3490826335 6778285.890555074 0, 1037093.3227287477 6778285.988007314 0, 1037079.4341878411 6778350.01319589 0, 1037069.2095290888 6778347.822197585 0, 1037069.1157007753 6778347.806715886 0, 1037069.0208261295 6778347.800216887 0, 1037068.9257631438 6778347.802759362 0, 1037068.8313715145 6778347.814320318 0, 1037068.7385048658 6778347.834795206 0, 1037068.6480030316 6778347.86399886 0, 1037068.5606844592 6778347.90166718 0, 1037068.4773388086 6778347.947459514 0, 1037068.3987198106 6778348.000961744 0, 1037068.3255384512 6778348.061690025 0, 1037068.2584565413 6778348.129095164 0, 1037068.1980807318 6778348.202567588 0, 1037068.1449570273 6778348.281442853 0, 1037068.0995658486 6778348.365007656 0, 1037058.0995658486 6778369.065007656 0, 1037058.0601343086 6778369.158455739 0, 1037058.0303715339 6778369.255417421 0, 1037058.0105837061 6778369.35489522 0, 1037058.00097439 6778369.455865768 0, 1037058.0016424404 6778369.557290343 0, 1037058.0125809851 6778369.658125549 0, 1037058.0336774949 6778369.757334055 0, 1037058.0647149415 6778369.853895267 0, 1037058.105374031 6778369.946815819 0, 1037058.1552364872 6778370.035139802 0, 1037058.2137893555 6778370.117958593 0, 1037058.2804302798 6778370.194420203 0, 1037058.3544736989 6778370.263738041 0, 1037058.435157899 6778370.325199007 0, 1037077.135157899 6778383.125199007 0, 1037077.2186971011 6778383.176554345 0, 1037077.3068645932 6778383.219480588 0, 1037077.3988125417 6778383.25356495 0, 1037077.4936567597 6778383.278479671 0, 1037077.5904852092 6778383.293985166 0, 1037077.6883667716 6778383.299932332 0, 1037077.7863602008 6778383.296263979 0, 1037077.883523176 6778383.283015383 0, 1037077.9789213612 6778383.260313946 0, 1037078.0716373913 6778383.228377966 0, 1037078.1607796936 6778383.187514548 0, 1037078.2454910605 6778383.13811664 0, 1037078.3249568931 6778383.080659261 0, 1037078.3984130347 6778383.01569493 0, 1037078.4651531185 6778382.943848356 0, 1037084.629885394 6778375.617644782 0, 1037129.9607875008 6778425.3734722575 0, 1037130.0311661649 6778425.443411932 0, 1037130.1081293069 6778425.506032929 0, 1037130.190919247 6778425.560718762 0, 1037130.2787209417 6778425.606931064 0, 1037130.3706700086 6778425.644214889 0, 1037130.465861235 6778425.672203188 0, 1037130.5633574909 6778425.690620424 0, 1037130.6621989532 6778425.699285286 0, 1037130.7614125559 6778425.698112468 0, 1037130.8600215696 6778425.687113518 0, 1037130.9570552168 6778425.666396718 0, 1037131.0515582286 6778425.6361660175 0, 1037131.1426002501 6778425.59671903 0, 1037131.2292849985 6778425.5484441 0, 1037131.3107590871 6778425.49181648 0, 1037131.3862204269 6778425.4273936525 0, 1037135.9180963585 6778421.152039 0, 1037152.7171067512 6778441.022868436 0, 1037162.4992671021 6778454.099021558 0, 1037162.552184731 6778454.163906864 0, 1037162.6103448276 6778454.224137931 0, 1037164.7103448276 6778456.224137931 0, 1037164.7846436349 6778456.288249037 0, 1037164.8648686605 6778456.344768873 0, 1037164.9502472933 6778456.393153124 0, 1037165.0399572906 6778456.432935822 0, 1037165.133134696 6778456.463733838 0, 1037165.2288821603 6778456.48525057 0, 1037165.3262775828 6778456.4972788 0, 1037165.4243829924 6778456.499702691 0, 1037165.5222535806 6778456.492498898 0, 1037165.6189467999 6778456.475736798 0, 1037165.7135314419 6778456.44957782 0, 1037165.8050966047 6778456.414273887 0, 1037165.8927604657 6778456.370164998 0, 1037165.9756787741 6778456.3176759435 0, 1037166.0530529812 6778456.257312223 0, 1037166.124137931 6778456.189655173 0, 1037166.1882490368 6778456.115356365 0, 1037166.2447688734 6778456.03513134 0, 1037166.293153124 6778455.949752707 0, 1037166.3329358217 6778455.860042709 0, 1037166.3637338375 6778455.766865304 0, 1037166.3852505697 6778455.671117839 0, 1037166.3972788001 6778455.5737224175 0, 1037166.3997026907 6778455.475617007 0, 1037166.3924988977 6778455.377746419 0, 1037166.3757367979 6778455.2810532 0, 1037166.3495778193 6778455.186468558 0, 1037166.3142738873 6778455.0949033955 0, 1037166.2701649979 6778455.0072395345 0, 1037166.2176759439 6778454.924321226 0, 1037166.1573122235 6778454.846947019 0, 1037166.0896551724 6778454.775862069 0, 1037164.0504457243 6778452.833757833 0))
-""")
+        _sio = AbstractGeoDataFrameDemos._dataset(
+            "GeoDataFrameDemos8", "neufBrisachBuildingsAndWalls.csv"
+        )
         return GeoDataFrameLib.read_csv(_sio)
 
     @staticmethod
@@ -1436,140 +49,9 @@ CONSLINE0000002012151579;POLYGON Z ((1037164.0504457243 6778452.833757833 0, 103
         # SOURCE:
         # https://geoservices.ign.fr/bdtopo
         '''
-        _sio = StringIO("""ID;NATURE;NOM_1_G;NOM_1_D;NOM_2_G;NOM_2_D;IMPORTANCE;FICTIF;POS_SOL;ETAT;DATE_CREAT;DATE_MAJ;DATE_APP;DATE_CONF;SOURCE;ID_SOURCE;PREC_PLANI;PREC_ALTI;NB_VOIES;LARGEUR;IT_VERT;PRIVE;SENS;CYCLABLE;BUS;URBAIN;VIT_MOY_VL;ACCES_VL;ACCES_PED;FERMETURE;NAT_RESTR;RESTR_H;RESTR_P;RESTR_PPE;RESTR_LAR;RESTR_LON;RESTR_MAT;BORNEDEB_G;BORNEDEB_D;BORNEFIN_G;BORNEFIN_D;INSEECOM_G;INSEECOM_D;TYP_ADRES;ALIAS_G;ALIAS_D;C_POSTAL_G;C_POSTAL_D;DATE_SERV;ID_VOIE_G;ID_VOIE_D;ID_RN;ID_ITI;NUMERO;NUM_EUROP;CL_ADMIN;GESTION;TOPONYME;ITI_CYCL;VOIE_VERTE;NATURE_ITI;NOM_ITI;geometry
-TRONROUT0000000048146779;Route a 1 chaussee;R GENERAL DERMONCOURT;R GENERAL DERMONCOURT;;;5;Non;0;En service;2006-12-18 14:21:51;2021-01-27 14:53:27;;;SDIS68;SDIS68:4679474;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;2A;;2A;;68231;68231;Classique;;;68600;68600;;682310180;682310180;;;;;;;;;;;;LINESTRING Z (1037585.3 6778398.3 197.1, 1037535.6 6778435.3 196.8)
-TRONROUT0000000048146782;Route a 1 chaussee;R VAUBAN;R VAUBAN;;;5;Non;0;En service;2006-12-18 14:21:51;2021-01-27 14:53:27;;;SDIS68;SDIS68:4680358;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;;;;;68231;68231;Classique;;;68600;68600;;682310620;682310620;;;;;;;;;;;;LINESTRING Z (1037641.1 6778357.1 195.8, 1037667.9 6778392.8 196.1)
-TRONROUT0000000048146788;Route a 1 chaussee;R DE L HOTEL DE VILLE;R DE L HOTEL DE VILLE;;;5;Non;0;En service;2006-12-18 14:21:51;2021-01-27 14:53:27;;;SDIS68;SDIS68:4679770;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;2;1A;2;1;68231;68231;Classique;;;68600;68600;;682310240;682310240;;;;;;;;;;;;LINESTRING Z (1037546.4 6778343.9 196.1, 1037495.7 6778380 196.8)
-TRONROUT0000000048146820;Route a 1 chaussee;R DES DEPORTES;R DES DEPORTES;;;5;Non;0;En service;2006-12-18 14:21:51;2021-01-27 14:53:27;;;SDIS68;SDIS68:4680363;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;;5;;1;68231;68231;Classique;;;68600;68600;;682310150;682310150;;;;;;;;;;;;LINESTRING Z (1037675.2 6778335.4 196.3, 1037667.9 6778392.8 196.1)
-TRONROUT0000000048148803;Route a 1 chaussee;R DU SOLEIL;R DU SOLEIL;;;5;Non;0;En service;2006-12-18 14:21:51;2021-01-27 14:53:27;;;SDIS68;SDIS68:4680212;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;1;2;3;4;68231;68231;Classique;;;68600;68600;;682310460;682310460;;;;;;;;;;;;LINESTRING Z (1037576.1 6778162.6 196.5, 1037612.5 6778211.2 196.9)
-TRONROUT0000000048148829;Route a 1 chaussee;R DES CAPUCINS;R DES CAPUCINS;;;5;Non;0;En service;2006-12-18 14:21:51;2021-01-27 14:53:27;;;SDIS68;SDIS68:4679782;2.5;1.5;2.0;4.0;Non;Non;Sens inverse;;;Oui;30;Libre;;;;;;;;;Non;12;9;12;3;68231;68231;Classique;;;68600;68600;;682310120;682310120;;;;;;;;;;;;LINESTRING Z (1037500.5 6778058 195.6, 1037446.8 6778097 195.6)
-TRONROUT0000000048148836;Route a 1 chaussee;R ST LOUIS;R ST LOUIS;;;5;Non;0;En service;2006-12-18 14:21:51;2021-01-27 14:53:27;;;SDIS68;SDIS68:4679783;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;6;5;2;1;68231;68231;Classique;;;68600;68600;;682310540;682310540;;;;;;;;;;;;LINESTRING Z (1037487 6778149.8 195.7, 1037433 6778190.3 196)
-TRONROUT0000000048148875;Route a 1 chaussee;R XAVIER JOURDAIN;R XAVIER JOURDAIN;;;5;Non;0;En service;2006-12-18 14:21:51;2021-01-27 14:53:27;;;SDIS68;SDIS68:4679805;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;4;5;2;1;68231;68231;Classique;;;68600;68600;;682310660;682310660;;;;;;;;;;;;LINESTRING Z (1037353 6778083.4 196.3, 1037303.7 6778122.3 196.2)
-TRONROUT0000000245944602;Route a 1 chaussee;R DES DEPORTES;R DES DEPORTES;;;5;Non;0;En service;2010-12-03 16:05:51;2021-01-27 14:53:27;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Non;35;Libre;;;;;;;;;Non;;;;;68231;68231;;;;68600;68600;;682310150;682310150;;;;;;;;;;;;LINESTRING Z (1037666.9 6778171 196.2, 1037672.4 6778168.7 196.2, 1037676.6 6778168.4 197.3)
-TRONROUT0000000048146864;Route a 1 chaussee;R DU 28 RIF;R DU 28 RIF;;;5;Non;0;En service;2006-12-18 14:21:51;2021-01-27 14:53:27;;;SDIS68;SDIS68:4679777;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;;12;;12;68231;68231;Classique;;;68600;68600;;682310680;682310680;;;;;;;;;;;;LINESTRING Z (1037224.6 6778344.6 196.4, 1037178.6 6778380.4 195.8, 1037175.5 6778384 195.8)
-TRONROUT0000000048146861;Route a 1 chaussee;PL DE LA PORTE DE COLMAR;PL DE LA PORTE DE COLMAR;;;5;Non;0;En service;2006-12-18 14:21:51;2021-01-27 14:53:27;;;SDIS68;SDIS68:4679796;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;1;4;3;6;68231;68231;Classique;;;68600;68600;;682310360;682310360;;;;;;;;;;;;LINESTRING Z (1037175.5 6778384 195.8, 1037176.8 6778387.3 195.8, 1037179.6 6778391.7 195.8, 1037201.8 6778424.4 196.2, 1037209 6778434.7 195.9)
-TRONROUT0000000048146794;Route a 1 chaussee;CITE SUZONNI;CITE SUZONNI;;;5;Non;0;En service;2006-12-18 14:21:51;2021-01-27 14:53:27;;;SDIS68;SDIS68:4679748;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;;;;;68231;68231;Classique;;;68600;68600;;682310565;682310565;;;;;;;;;;;;LINESTRING Z (1037393.6 6778538.6 195.4, 1037421.5 6778542.8 195.3, 1037458.5 6778547.3 195.4)
-TRONROUT0000000048148798;Route a 1 chaussee;R DU MARCHE;R DU MARCHE;;;5;Non;0;En service;2006-12-18 14:21:51;2021-01-27 14:53:27;;;SDIS68;SDIS68:4680218;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;7;14;7;18;68231;68231;Classique;;;68600;68600;;682310260;682310260;;;;;;;;;;;;LINESTRING Z (1037612.5 6778211.2 196.9, 1037666.9 6778171 196.2)
-TRONROUT0000000048148822;Route a 1 chaussee;PL D ARMES GENERAL DE GAULLE;PL D ARMES GENERAL DE GAULLE;;;4;Non;0;En service;2006-12-18 14:21:51;2021-01-27 14:53:27;;;SDIS68;SDIS68:4698516;2.5;1.5;2.0;5.5;Non;Non;Sens direct;;;Oui;40;Libre;;;;;;;;;Non;;6;;6;68231;68231;Classique;;;68600;68600;;682310040;682310040;;;;;;;;;;;;LINESTRING Z (1037338.1 6778266.1 196.2, 1037339.1 6778263 196.2, 1037342.7 6778259.2 196.2, 1037360.9 6778245.5 196.7, 1037384.2 6778227.5 196.4)
-TRONROUT0000000048148827;Route a 1 chaussee;PL DE LA PORTE DE BALE;PL DE LA PORTE DE BALE;;;5;Non;0;En service;2006-12-18 14:21:51;2021-01-27 14:53:27;;;SDIS68;SDIS68:4680214;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;6;1;2;1;68231;68231;Classique;;;68600;68600;;682310320;682310320;;;;;;;;;;;;LINESTRING Z (1037628.3 6778121.4 196.1, 1037666.9 6778171 196.2)
-TRONROUT0000000048148848;Route a 1 chaussee;PL DE LA PORTE DE BALE;PL DE LA PORTE DE BALE;;;5;Non;0;En service;2006-12-18 14:21:51;2011-09-07 09:05:54;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;;;;;68231;68231;Classique;;;68600;68600;;682310320;682310320;;;;;;;;;;;;LINESTRING Z (1037532.4 6778032.1 195.6, 1037533.2 6778018.3 197.5, 1037531.1 6778013.2 197.4, 1037524.8 6778009.8 197.4, 1037505.8 6778006.2 197.4, 1037458.3 6778001.4 197.3)
-TRONROUT0000000048148857;Route a 1 chaussee;R SONNIER;R SONNIER;;;5;Non;0;En service;2006-12-18 14:21:51;2021-01-27 14:53:27;;;SDIS68;SDIS68:4679751;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;10;;4;;68231;68231;Classique;;;68600;68600;;682310480;682310480;;;;;;;;;;;;LINESTRING Z (1037197.4 6778198.8 196, 1037237.8 6778251.5 195.9)
-TRONROUT0000000048148858;Route a 1 chaussee;R DU 28 RIF;R DU 28 RIF;;;5;Non;0;En service;2006-12-18 14:21:51;2021-01-27 14:53:27;;;SDIS68;SDIS68:4679775;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;;2;;4;68231;68231;Classique;;;68600;68600;;682310680;682310680;;;;;;;;;;;;LINESTRING Z (1037330.7 6778266.1 196.4, 1037278.1 6778305.8 196.4)
-TRONROUT0000000048148837;Route a 1 chaussee;R D ANGOULEME;R D ANGOULEME;;;5;Non;0;En service;2006-12-18 14:21:51;2021-01-27 14:53:27;;;SDIS68;SDIS68:4679778;2.5;1.5;2.0;4.0;Non;Non;Sens direct;;;Oui;30;Libre;;;;;;;;;Non;4;3;2;1;68231;68231;Classique;;;68600;68600;;682310020;682310020;;;;;;;;;;;;LINESTRING Z (1037487 6778149.8 195.7, 1037523.3 6778201.3 196.5)
-TRONROUT0000000048148849;Route a 1 chaussee;PL DE LA PORTE DE BALE;PL DE LA PORTE DE BALE;;;5;Non;0;En service;2006-12-18 14:21:51;2021-01-27 14:53:27;;;SDIS68;SDIS68:4679472;2.5;1.5;2.0;4.0;Non;Non;Sens inverse;;;Oui;30;Libre;;;;;;;;;Non;7;12;11;14;68231;68231;Classique;;;68600;68600;;682310320;682310320;;;;;;;;;;;;LINESTRING Z (1037591 6778070.9 196.1, 1037571.3 6778042.6 195.8, 1037568.5 6778039.6 195.8, 1037565 6778037.1 195.8, 1037560.1 6778035.2 195.8, 1037535.2 6778031.3 195.6, 1037532.4 6778032.1 195.6)
-TRONROUT0000000048148851;Route a 1 chaussee;R D ANGOULEME;R D ANGOULEME;;;5;Non;0;En service;2006-12-18 14:21:51;2021-01-27 14:53:27;;;SDIS68;SDIS68:4679780;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;11;14;13;18;68231;68231;Classique;;;68600;68600;;682310020;682310020;;;;;;;;;;;;LINESTRING Z (1037446.8 6778097 195.6, 1037407.9 6778043.6 196.3)
-TRONROUT0000000048148876;Route a 1 chaussee;R DE L ARSENAL;R DE L ARSENAL;;;5;Non;0;En service;2006-12-18 14:21:51;2021-01-27 14:53:27;;;SDIS68;SDIS68:4679760;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;6;;6;;68231;68231;Classique;;;68600;68600;;682310060;682310060;;;;;;;;;;;;LINESTRING Z (1037215.2 6778104.7 196.6, 1037253.2 6778157.8 195.3)
-TRONROUT0000000048148877;Route a 1 chaussee;R SALIN DE NIAR;R SALIN DE NIAR;;;5;Non;0;En service;2006-12-18 14:21:51;2021-01-27 14:53:27;;;SDIS68;SDIS68:4679794;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;;2;;2;68231;68231;Classique;;;68600;68600;;682310440;682310440;;;;;;;;;;;;LINESTRING Z (1037291.5 6778212.5 196.3, 1037237.8 6778251.5 195.9)
-TRONROUT0000000048146829;Route a 1 chaussee;R MARECHAL FOCH;R MARECHAL FOCH;;;5;Non;0;En service;2006-12-18 14:21:51;2021-01-27 14:53:27;;;SDIS68;SDIS68:4680357;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;13;;15;;68231;68231;Classique;;;68600;68600;;682310280;682310280;;;;;;;;;;;;LINESTRING Z (1037585.3 6778398.3 197.1, 1037626.4 6778449.8 196.1)
-TRONROUT0000000048146843;Route a 1 chaussee;CITE SUZONNI;CITE SUZONNI;;;5;Non;0;En service;2006-12-18 14:21:51;2021-01-27 14:53:27;;;SDIS68;SDIS68:4679748;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;1;;21;;68231;68231;Classique;;;68600;68600;;682310565;682310565;;;;;;;;;;;;LINESTRING Z (1037304.7 6778523.4 195.2, 1037339.2 6778530.3 195.6, 1037393.6 6778538.6 195.4)
-TRONROUT0000000048146845;Route a 1 chaussee;PL DE LA PORTE DE COLMAR;PL DE LA PORTE DE COLMAR;;;5;Non;0;En service;2006-12-18 14:21:51;2021-01-27 14:53:27;;;SDIS68;SDIS68:4679797;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;5;8;9;12;68231;68231;Classique;;;68600;68600;;682310360;682310360;;;;;;;;;;;;LINESTRING Z (1037209 6778434.7 195.9, 1037248.6 6778487.1 195.6)
-TRONROUT0000000048148864;Route a 1 chaussee;R DE LAUBANIE;R DE LAUBANIE;;;5;Non;0;En service;2006-12-18 14:21:51;2021-01-27 14:53:27;;;SDIS68;SDIS68:4679735;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;7;;7B;;68231;68231;Classique;;;68600;68600;;682310145;682310145;;;;;;;;;;;;LINESTRING Z (1037166.7 6778221.4 196.3, 1037161.1 6778259.7 195.8)
-TRONROUT0000000048148868;Route a 1 chaussee;R DE BELFORT;R DE BELFORT;;;5;Non;0;En service;2006-12-18 14:21:51;2021-01-27 14:53:27;;;SDIS68;SDIS68:4679785;2.5;1.5;2.0;4.0;Non;Non;Sens direct;;;Oui;30;Libre;;;;;;;;;Non;1;2;7;10;68231;68231;Classique;;;68600;68600;;682310100;682310100;;;;;;;;;;;;LINESTRING Z (1037265.9 6778068 196.2, 1037303.7 6778122.3 196.2)
-TRONROUT0000000048148869;Route a 1 chaussee;PL DE LA PORTE DE BELFORT;PL DE LA PORTE DE BELFORT;;;5;Non;0;En service;2006-12-18 14:21:51;2021-01-27 14:53:27;;;SDIS68;SDIS68:4679790;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;7;4;13;6;68231;68231;Classique;;;68600;68600;;682310340;682310340;;;;;;;;;;;;LINESTRING Z (1037265.9 6778068 196.2, 1037225.8 6778096.9 196.6, 1037215.2 6778104.7 196.6)
-TRONROUT0000000048148878;Route a 1 chaussee;R DES TISSERANDS;R DES TISSERANDS;;;5;Non;0;En service;2006-12-18 14:21:51;2021-01-27 14:53:27;;;SDIS68;SDIS68:4679772;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;;;;;68231;68231;Classique;;;68600;68600;;682310600;682310600;;;;;;;;;;;;LINESTRING Z (1037161.1 6778259.7 195.8, 1037187.5 6778291.1 195.9)
-TRONROUT0000000048146827;Route a 1 chaussee;PL DE LA PORTE DE STRASBOURG;PL DE LA PORTE DE STRASBOURG;;;5;Non;0;En service;2006-12-18 14:21:51;2021-01-27 14:53:27;;;SDIS68;SDIS68:4679479;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;3;5;3;14;68231;68231;Lineaire;;;68600;68600;;682310380;682310380;;;;;;;;;;;;LINESTRING Z (1037527.1 6778524.3 195.4, 1037576.3 6778487.2 196.1)
-TRONROUT0000000048148821;Route a 1 chaussee;PL D ARMES GENERAL DE GAULLE;PL D ARMES GENERAL DE GAULLE;;;4;Non;0;En service;2006-12-18 14:21:51;2021-01-27 14:53:27;;;SDIS68;SDIS68:4698517;2.5;1.5;2.0;5.5;Non;Non;Sens direct;;;Oui;40;Libre;;;;;;;;;Non;;8;;10;68231;68231;Classique;;;68600;68600;;682310040;682310040;;;;;;;;;;;;LINESTRING Z (1037384.2 6778227.5 196.4, 1037421.1 6778200.8 196.5, 1037427.4 6778198 196.5, 1037431.5 6778198 196.5, 1037432.4 6778198.2 196.5)
-TRONROUT0000000048148839;Route a 1 chaussee;R D ANGOULEME;R D ANGOULEME;;;5;Non;0;En service;2006-12-18 14:21:51;2021-01-27 14:53:27;;;SDIS68;SDIS68:4679779;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;12;9;6;5;68231;68231;Classique;;;68600;68600;;682310020;682310020;;;;;;;;;;;;LINESTRING Z (1037446.8 6778097 195.6, 1037487 6778149.8 195.7)
-TRONROUT0000000048148856;Route a 1 chaussee;R DU 28 RIF;R DU 28 RIF;;;5;Non;0;En service;2006-12-18 14:21:51;2021-01-27 14:53:27;;;SDIS68;SDIS68:4679776;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;1;6;1;10;68231;68231;Classique;;;68600;68600;;682310680;682310680;;;;;;;;;;;;LINESTRING Z (1037278.1 6778305.8 196.4, 1037224.6 6778344.6 196.4)
-TRONROUT0000000048148880;Route a 1 chaussee;R MICHEL MARSAL;R MICHEL MARSAL;;;5;Non;0;En service;2006-12-18 14:21:51;2021-01-27 14:53:27;;;SDIS68;SDIS68:4679798;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;1;;1;;68231;68231;Classique;;;68600;68600;;682310300;682310300;;;;;;;;;;;;LINESTRING Z (1037303.7 6778122.3 196.2, 1037253.2 6778157.8 195.3)
-TRONROUT0000000048148911;Route a 1 chaussee;R GENERAL HERR;R GENERAL HERR;;;5;Non;0;En service;2006-12-18 14:21:51;2021-01-27 14:53:27;;;SDIS68;SDIS68:4679766;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;16;;16;;68231;68231;Classique;;;68600;68600;;682310220;682310220;;;;;;;;;;;;LINESTRING Z (1037314.5 6778031.8 196.6, 1037353 6778083.4 196.3)
-TRONROUT0000000048146792;Route a 1 chaussee;R ST JEAN;R ST JEAN;;;5;Non;0;En service;2006-12-18 14:21:51;2021-01-27 14:53:27;;;SDIS68;SDIS68:4679803;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;7;6;13;6;68231;68231;Classique;;;68600;68600;;682310520;682310520;;;;;;;;;;;;LINESTRING Z (1037486.9 6778472.2 196.7, 1037527.1 6778524.3 195.4)
-TRONROUT0000000048146826;Route a 1 chaussee;R DU TEMPLE;R DU TEMPLE;;;5;Non;0;En service;2006-12-18 14:21:51;2021-01-27 14:53:27;;;SDIS68;SDIS68:4679755;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;;;;;68231;68231;;;;68600;68600;;682310580;682310580;;;;;;;;;;;;LINESTRING Z (1037354 6778406.8 195.5, 1037393 6778458.6 195.9)
-TRONROUT0000000048146778;Route a 1 chaussee;R ST CHARLES;R ST CHARLES;;;5;Non;0;En service;2006-12-18 14:21:51;2021-01-27 14:53:27;;;SDIS68;SDIS68:4679806;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;1;6;3;6;68231;68231;Classique;;;68600;68600;;682310500;682310500;;;;;;;;;;;;LINESTRING Z (1037486.9 6778472.2 196.7, 1037433.7 6778511.9 195.4)
-TRONROUT0000000048146789;Route a 1 chaussee;R ST JEAN;R ST JEAN;;;5;Non;0;En service;2006-12-18 14:21:51;2021-01-27 14:53:27;;;SDIS68;SDIS68:4679801;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;1;;1;;68231;68231;Classique;;;68600;68600;;682310520;682310520;;;;;;;;;;;;LINESTRING Z (1037410.4 6778357.7 196.5, 1037410.6 6778368.8 196.5, 1037447.4 6778418.9 196.9)
-TRONROUT0000000048146791;Route a 1 chaussee;R DES VOSGES;R DES VOSGES;;;5;Non;0;En service;2006-12-18 14:21:51;2021-01-27 14:53:27;;;SDIS68;SDIS68:4679746;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;1;2;1;2;68231;68231;Classique;;;68600;68600;;682310640;682310640;;;;;;;;;;;;LINESTRING Z (1037410.4 6778357.7 196.5, 1037404.6 6778366.3 196.5, 1037354 6778406.8 195.5)
-TRONROUT0000000048146865;Route a 1 chaussee;R DE L ABBE SOEHNLIN;R DE L ABBE SOEHNLIN;;;5;Non;0;En service;2006-12-18 14:21:51;2021-01-27 14:53:27;;;SDIS68;SDIS68:4679811;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;1;2;1;2;68231;68231;Classique;;;68600;68600;;682310005;682310005;;;;;;;;;;;;LINESTRING Z (1037263.8 6778395.2 196.2, 1037301.7 6778445.3 196.1)
-TRONROUT0000000048148830;Route a 1 chaussee;R DE BELFORT;R DE BELFORT;;;5;Non;0;En service;2006-12-18 14:21:51;2021-01-27 14:53:27;;;SDIS68;SDIS68:4679787;2.5;1.5;2.0;4.0;Non;Non;Sens direct;;;Oui;30;Libre;;;;;;;;;Non;11;20;13;22;68231;68231;Classique;;;68600;68600;;682310100;682310100;;;;;;;;;;;;LINESTRING Z (1037343.1 6778174.1 196.4, 1037384.2 6778227.5 196.4)
-TRONROUT0000000048148833;Route a 1 chaussee;R DU SOLEIL;R DU SOLEIL;;;5;Non;0;En service;2006-12-18 14:21:51;2021-01-27 14:53:27;;;SDIS68;SDIS68:4680211;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;5;6;9;6;68231;68231;Classique;;;68600;68600;;682310460;682310460;;;;;;;;;;;;LINESTRING Z (1037612.5 6778211.2 196.9, 1037653.3 6778266.5 196.8)
-TRONROUT0000000048148840;Route a 1 chaussee;R DE L HOTEL DE VILLE;R DE L HOTEL DE VILLE;;;5;Non;0;En service;2006-12-18 14:21:51;2021-01-27 14:53:27;;;SDIS68;SDIS68:4680208;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;8;13;6;11;68231;68231;Classique;;;68600;68600;;682310240;682310240;;;;;;;;;;;;LINESTRING Z (1037653.3 6778266.5 196.8, 1037600.1 6778304.5 196.3)
-TRONROUT0000000048148853;Route a 1 chaussee;R MICHEL MARSAL;R MICHEL MARSAL;;;5;Non;0;En service;2006-12-18 14:21:51;2021-01-27 14:53:27;;;SDIS68;SDIS68:4679800;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;;4;;10;68231;68231;Classique;;;68600;68600;;682310300;682310300;;;;;;;;;;;;LINESTRING Z (1037197.4 6778198.8 196, 1037166.7 6778221.4 196.3)
-TRONROUT0000000048148854;Route a 1 chaussee;R DE L ARSENAL;R DE L ARSENAL;;;5;Non;0;En service;2006-12-18 14:21:51;2021-01-27 14:53:27;;;SDIS68;SDIS68:4679762;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;2;3;2;1;68231;68231;Classique;;;68600;68600;;682310060;682310060;;;;;;;;;;;;LINESTRING Z (1037291.5 6778212.5 196.3, 1037327.4 6778259.2 195.2, 1037330.7 6778266.1 196.4)
-TRONROUT0000000048148859;Route a 1 chaussee;R SALIN DE NIAR;R SALIN DE NIAR;;;5;Non;0;En service;2006-12-18 14:21:51;2021-01-27 14:53:27;;;SDIS68;SDIS68:4679793;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;1;;1;;68231;68231;Classique;;;68600;68600;;682310440;682310440;;;;;;;;;;;;LINESTRING Z (1037237.8 6778251.5 195.9, 1037187.5 6778291.1 195.9)
-TRONROUT0000000048148863;Route a 1 chaussee;R DE LAUBANIE;R DE LAUBANIE;;;5;Non;0;En service;2006-12-18 14:21:51;2021-01-27 14:53:27;;;SDIS68;SDIS68:4679736;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;1;;5;;68231;68231;Classique;;;68600;68600;;682310145;682310145;;;;;;;;;;;;LINESTRING Z (1037174.1 6778166 196.4, 1037167.6 6778215.3 196.4, 1037166.7 6778221.4 196.3)
-TRONROUT0000000048148874;Route a 1 chaussee;R SONNIER;R SONNIER;;;5;Non;0;En service;2006-12-18 14:21:51;2021-01-27 14:53:27;;;SDIS68;SDIS68:4679749;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;2;;2;;68231;68231;Classique;;;68600;68600;;682310480;682310480;;;;;;;;;;;;LINESTRING Z (1037278.1 6778305.8 196.4, 1037315.4 6778355.8 196.4)
-TRONROUT0000000048148879;Route a 1 chaussee;R MICHEL MARSAL;R MICHEL MARSAL;;;5;Non;0;En service;2006-12-18 14:21:51;2021-01-27 14:53:27;;;SDIS68;SDIS68:4679799;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;3;2;7;2;68231;68231;Classique;;;68600;68600;;682310300;682310300;;;;;;;;;;;;LINESTRING Z (1037253.2 6778157.8 195.3, 1037197.4 6778198.8 196)
-TRONROUT0000000048146860;Route a 1 chaussee;R DU TEMPLE;R DU TEMPLE;;;5;Non;0;En service;2006-12-18 14:21:51;2021-01-27 14:53:27;;;SDIS68;SDIS68:4679756;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;1A;;1A;;68231;68231;Classique;;;68600;68600;;682310580;682310580;;;;;;;;;;;;LINESTRING Z (1037315.4 6778355.8 196.4, 1037354 6778406.8 195.5)
-TRONROUT0000000048146863;Route a 1 chaussee;R DE L EGLISE;R DE L EGLISE;;;5;Non;0;En service;2006-12-18 14:21:51;2021-01-27 14:53:27;;;SDIS68;SDIS68:4679757;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;;10;;14;68231;68231;Classique;;;68600;68600;;682310160;682310160;;;;;;;;;;;;LINESTRING Z (1037393 6778458.6 195.9, 1037313.9 6778515.6 195.3, 1037304.7 6778523.4 195.2)
-TRONROUT0000000048146867;Route a 1 chaussee;R DES VOSGES;R DES VOSGES;;;5;Non;0;En service;2006-12-18 14:21:51;2021-01-27 14:53:27;;;SDIS68;SDIS68:4679744;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;5;8;11;12;68231;68231;Classique;;;68600;68600;;682310640;682310640;;;;;;;;;;;;LINESTRING Z (1037301.7 6778445.3 196.1, 1037265 6778471.9 196.1, 1037248.6 6778487.1 195.6)
-TRONROUT0000000048148872;Route a 1 chaussee;R SONNIER;R SONNIER;;;5;Non;0;En service;2006-12-18 14:21:51;2021-01-27 14:53:27;;;SDIS68;SDIS68:4679750;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;2B;3;2A;1;68231;68231;Classique;;;68600;68600;;682310480;682310480;;;;;;;;;;;;LINESTRING Z (1037237.8 6778251.5 195.9, 1037278.1 6778305.8 196.4)
-TRONROUT0000000048146868;Route a 1 chaussee;R DES TISSERANDS;R DES TISSERANDS;;;5;Non;0;En service;2006-12-18 14:21:51;2021-01-27 14:53:27;;;SDIS68;SDIS68:4679774;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;8;5;2;1;68231;68231;Classique;;;68600;68600;;682310600;682310600;;;;;;;;;;;;LINESTRING Z (1037224.6 6778344.6 196.4, 1037243.6 6778368.9 195.4, 1037263.8 6778395.2 196.2)
-TRONROUT0000000048148823;Route a 1 chaussee;PL D ARMES GENERAL DE GAULLE;PL D ARMES GENERAL DE GAULLE;;;4;Non;0;En service;2006-12-18 14:21:51;2021-01-27 14:53:27;;;SDIS68;SDIS68:4698515;2.5;1.5;2.0;5.5;Non;Non;Sens direct;;;Oui;40;Libre;;;;;;;;;Non;;2;;4;68231;68231;Classique;;;68600;68600;;682310040;682310040;;;;;;;;;;;;LINESTRING Z (1037369.4 6778315.6 196.4, 1037340.8 6778276.2 196.2, 1037338.8 6778271.9 196.2, 1037338.1 6778266.1 196.2)
-TRONROUT0000000048148865;Route a 1 chaussee;R DE LAUBANIE;R DE LAUBANIE;;;5;Non;0;En service;2006-12-18 14:21:51;2021-01-27 14:53:27;;;SDIS68;SDIS68:4679737;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;1;;1;;68231;68231;Classique;;;68600;68600;;682310145;682310145;;;;;;;;;;;;LINESTRING Z (1037183 6778128.1 196.4, 1037180.1 6778131.3 196.4, 1037178.2 6778134.4 196.4, 1037176.8 6778145.3 196.4, 1037174.1 6778166 196.4)
-TRONROUT0000000048148797;Route a 1 chaussee;R DU SOLEIL;R DU SOLEIL;;;5;Non;0;En service;2006-12-18 14:21:51;2021-01-27 14:53:27;;;SDIS68;SDIS68:4680210;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;11;;11;;68231;68231;Classique;;;68600;68600;;682310460;682310460;;;;;;;;;;;;LINESTRING Z (1037653.3 6778266.5 196.8, 1037673.1 6778289.3 196.8, 1037681.2 6778296.3 196)
-TRONROUT0000000048148826;Route a 1 chaussee;R DES DEPORTES;R DES DEPORTES;;;5;Non;0;En service;2006-12-18 14:21:51;2021-01-27 14:53:27;;;SDIS68;SDIS68:4680220;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;;15;;15;68231;68231;Classique;;;68600;68600;;682310150;682310150;;;;;;;;;;;;LINESTRING Z (1037692 6778238.5 196.1, 1037690.7 6778244 196.1, 1037681.2 6778296.3 196)
-TRONROUT0000000048148813;Route a 1 chaussee;R DE BALE;R DE BALE;;;4;Non;0;En service;2006-12-18 14:21:51;2021-01-27 14:53:27;;;CEA/SDIS68;SDIS68:4698577;2.5;1.5;2.0;5.5;Non;Non;Double sens;;;Oui;40;Libre;;;;;;;;;Non;;;;;68231;68231;;;;68600;68600;;682310080;682310080;ROUTNOMM0000000049124547;;D468;;Departementale;Collectivite europeenne d'Alsace;;;;;;LINESTRING Z (1037671.0124324576 6778087.930576844 196.0027051652445, 1037628.3 6778121.4 196.1)
-TRONROUT0000000048148835;Route a 1 chaussee;R ROUGET DE LISLE;R ROUGET DE LISLE;;;5;Non;0;En service;2006-12-18 14:21:51;2021-01-27 14:53:27;;;SDIS68/SDIS68;SDIS68:4679485/SDIS68:4679485;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;4;1;4;1;68231;68231;Classique;;;68600;68600;;682310420;682310420;;;;;;;;;;;;LINESTRING Z (1037539.2 6778112.1 195.5, 1037576.1 6778162.6 196.5)
-TRONROUT0000000048148838;Route a 1 chaussee;R ROUGET DE LISLE;R ROUGET DE LISLE;;;5;Non;0;En service;2006-12-18 14:21:51;2021-01-27 14:53:27;;;SDIS68/SDIS68;SDIS68:4679485/SDIS68:4679808;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;12;3;6;3;68231;68231;Classique;;;68600;68600;;682310420;682310420;;;;;;;;;;;;LINESTRING Z (1037500.5 6778058 195.6, 1037539.2 6778112.1 195.5)
-TRONROUT0000000048146803;Route a 1 chaussee;R DE STRASBOURG;R DE STRASBOURG;;;4;Non;1;En service;2006-12-18 14:21:51;2021-01-27 14:53:27;;;CEA/SDIS68;SDIS68:4698552;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;40;Libre;;;;;;;;;Non;;;;;68231;68231;;;;68600;68600;;682310560;682310560;ROUTNOMM0000000049124547;;D468;;Departementale;Collectivite europeenne d'Alsace;;;;;;LINESTRING Z (1037607.1 6778531.1 196.1, 1037607.412007324 6778531.533637297 196.1)
-TRONROUT0000002207112010;Route a 1 chaussee;R DE LAUBANIE;R DE LAUBANIE;;;5;Non;0;En service;2020-07-07 17:18:49;2021-01-27 14:53:27;;;SDIS68/SDIS68;SDIS68:4679734/SDIS68:4679734;3.0;9999.0;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;Libre;;;;;;;;;;;;;68231;68231;Classique;;;68600;68600;;682310145;682310145;;;;;;;;;;;;LINESTRING Z (1037144.3 6778346.1 195.8, 1037138.4 6778347.1 -1000, 1037133.5 6778348.6 -1000, 1037120.1 6778354.9 -1000)
-TRONROUT0000000048146815;Route a 1 chaussee;PL D ARMES GENERAL DE GAULLE;PL D ARMES GENERAL DE GAULLE;;;4;Non;0;En service;2006-12-18 14:21:51;2021-01-27 14:53:27;;;SDIS68;SDIS68:4698534;2.5;1.5;2.0;5.5;Non;Non;Sens direct;;;Oui;40;Libre;;;;;;;;;Non;;;;;68231;68231;;;;68600;68600;;682310040;682310040;ROUTNOMM0000000048263005;;D290;;Departementale;Collectivite europeenne d'Alsace;;;;;;LINESTRING Z (1037456.8 6778327.6 197, 1037424.3 6778349.8 196.5, 1037415.5 6778355.9 196.5, 1037410.4 6778357.7 196.5)
-TRONROUT0000000048146804;Route a 1 chaussee;R DE STRASBOURG;R DE STRASBOURG;;;4;Non;0;En service;2006-12-18 14:21:51;2021-01-27 14:53:27;;;CEA/SDIS68;SDIS68:4698555;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;40;Libre;;;;;;;;;Non;;19;;19;68231;68231;Classique;;;68600;68600;;682310560;682310560;ROUTNOMM0000000049124547;;D468;;Departementale;Collectivite europeenne d'Alsace;;;;;;LINESTRING Z (1037456.8 6778327.6 197, 1037495.7 6778380 196.8)
-TRONROUT0000000048146854;Route a 1 chaussee;R DE COLMAR;R DE COLMAR;;;4;Non;0;En service;2006-12-18 14:21:51;2021-01-27 14:53:27;;;SDIS68;SDIS68:4698561;2.5;1.5;2.0;5.5;Non;Non;Double sens;;;Oui;40;Libre;;;;;;;;;Non;14;11;6;9;68231;68231;Classique;;;68600;68600;;682310140;682310140;ROUTNOMM0000000048263005;;D290;;Departementale;Collectivite europeenne d'Alsace;;;;;;LINESTRING Z (1037315.4 6778355.8 196.4, 1037263.8 6778395.2 196.2)
-TRONROUT0000000048146859;Route a 1 chaussee;R DE COLMAR;R DE COLMAR;;;4;Non;0;En service;2006-12-18 14:21:51;2021-01-27 14:53:27;;;SDIS68;SDIS68:4698575;2.5;1.5;2.0;5.5;Non;Non;Double sens;;;Oui;40;Libre;;;;3.1;;;;;Non;1;;1;;68231;68231;Classique;;;68600;68600;;682310140;682310140;ROUTNOMM0000000048263005;;D290;;Departementale;Collectivite europeenne d'Alsace;;;;;;LINESTRING Z (1037209 6778434.7 195.9, 1037166.9410163813 6778465.741254425 195.9)
-TRONROUT0000000048148819;Route a 1 chaussee;PL D ARMES GENERAL DE GAULLE;PL D ARMES GENERAL DE GAULLE;;;4;Non;0;En service;2006-12-18 14:21:51;2021-01-27 14:53:27;;;SDIS68;SDIS68:4698535;2.5;1.5;2.0;5.5;Non;Non;Sens direct;;;Oui;40;Libre;;;;;;;;;Non;;30;;32;68231;68231;Classique;;;68600;68600;;682310040;682310040;ROUTNOMM0000000048263005;;D290;;Departementale;Collectivite europeenne d'Alsace;;;;;;LINESTRING Z (1037410.4 6778357.7 196.5, 1037407 6778358 196.5, 1037403.3 6778357.2 196.5, 1037400.9 6778354.7 196.5, 1037381 6778329.3 196.5, 1037369.4 6778315.6 196.4)
-TRONROUT0000000048148861;Route a 1 chaussee;R DE COLMAR;R DE COLMAR;;;4;Non;0;En service;2006-12-18 14:21:51;2021-01-27 14:53:27;;;SDIS68;SDIS68:4698560;2.5;1.5;2.0;5.5;Non;Non;Double sens;;;Oui;40;Libre;;;;;;;;;Non;24;15;16;13;68231;68231;Classique;;;68600;68600;;682310140;682310140;ROUTNOMM0000000048263005;;D290;;Departementale;Collectivite europeenne d'Alsace;;;;;;LINESTRING Z (1037369.4 6778315.6 196.4, 1037315.4 6778355.8 196.4)
-TRONROUT0000000048146805;Route a 1 chaussee;R DE STRASBOURG;R DE STRASBOURG;;;4;Non;0;En service;2006-12-18 14:21:51;2021-01-27 14:53:27;;;CEA/SDIS68;SDIS68:4698553;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;40;Libre;;;;;;;;;Non;8;9;2;3;68231;68231;Classique;;;68600;68600;;682310560;682310560;ROUTNOMM0000000049124547;;D468;;Departementale;Collectivite europeenne d'Alsace;;;;;;LINESTRING Z (1037535.6 6778435.3 196.8, 1037576.3 6778487.2 196.1)
-TRONROUT0000000048146806;Route a 1 chaussee;R DE STRASBOURG;R DE STRASBOURG;;;4;Non;0;En service;2006-12-18 14:21:51;2021-01-27 14:53:27;;;CEA/SDIS68;SDIS68:4698552;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;40;Libre;;;;;;;;;Non;;;;;68231;68231;;;;68600;68600;;682310560;682310560;ROUTNOMM0000000049124547;;D468;;Departementale;Collectivite europeenne d'Alsace;;;;;;LINESTRING Z (1037576.3 6778487.2 196.1, 1037607.1 6778531.1 196.1)
-TRONROUT0000000048146807;Route a 1 chaussee;R DE STRASBOURG;R DE STRASBOURG;;;4;Non;0;En service;2006-12-18 14:21:51;2021-01-27 14:53:27;;;CEA/SDIS68;SDIS68:4698554;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;40;Libre;;;;;;;;;Non;14;17;10;11;68231;68231;Classique;;;68600;68600;;682310560;682310560;ROUTNOMM0000000049124547;;D468;;Departementale;Collectivite europeenne d'Alsace;;;;;;LINESTRING Z (1037495.7 6778380 196.8, 1037535.6 6778435.3 196.8)
-TRONROUT0000000048148810;Route a 1 chaussee;PL D ARMES GENERAL DE GAULLE;PL D ARMES GENERAL DE GAULLE;;;4;Non;0;En service;2006-12-18 14:21:51;2021-01-27 14:53:27;;;CEA/SDIS68;SDIS68:4698541;2.5;1.5;2.0;5.5;Non;Non;Sens direct;;;Oui;40;Libre;;;;;;;;;Non;;22;;24;68231;68231;Classique;;;68600;68600;;682310040;682310040;ROUTNOMM0000000049124547;;D468;;Departementale;Collectivite europeenne d'Alsace;;;;;;LINESTRING Z (1037498.9 6778288.1 196.6, 1037497.6 6778292.1 196.6, 1037495.2 6778295.6 196.6, 1037490.2 6778300.9 196.6, 1037475.3 6778311.8 196.6, 1037456.8 6778327.6 197)
-TRONROUT0000000048148811;Route a 1 chaussee;PL D ARMES GENERAL DE GAULLE;PL D ARMES GENERAL DE GAULLE;;;4;Non;0;En service;2006-12-18 14:21:51;2021-01-27 14:53:27;;;CEA/SDIS68;SDIS68:4698540;2.5;1.5;2.0;5.5;Non;Non;Sens direct;;;Oui;40;Libre;;;;;;;;;Non;;18;;20;68231;68231;Classique;;;68600;68600;;682310040;682310040;ROUTNOMM0000000049124547;;D468;;Departementale;Collectivite europeenne d'Alsace;;;;;;LINESTRING Z (1037469.9 6778239.4 196.5, 1037498.3 6778278.5 196.6, 1037499.1 6778282.9 196.6, 1037498.9 6778288.1 196.6)
-TRONROUT0000000048148812;Route a 1 chaussee;R DE BALE;R DE BALE;;;4;Non;0;En service;2006-12-18 14:21:51;2021-01-27 14:53:27;;;CEA/SDIS68;SDIS68:4698564;2.5;1.5;2.0;5.5;Non;Non;Double sens;;;Oui;40;Libre;;;;;;;;;Non;17;14;19;20;68231;68231;Classique;;;68600;68600;;682310080;682310080;ROUTNOMM0000000049124547;;D468;;Departementale;Collectivite europeenne d'Alsace;;;;;;LINESTRING Z (1037523.3 6778201.3 196.5, 1037469.9 6778239.4 196.5)
-TRONROUT0000000048148814;Route a 1 chaussee;R DE BALE;R DE BALE;;;4;Non;0;En service;2006-12-18 14:21:51;2021-01-27 14:53:27;;;CEA/SDIS68;SDIS68:4698565;2.5;1.5;2.0;5.5;Non;Non;Double sens;;;Oui;40;Libre;;;;;;;;;Non;11;8;15;12;68231;68231;Classique;;;68600;68600;;682310080;682310080;ROUTNOMM0000000049124547;;D468;;Departementale;Collectivite europeenne d'Alsace;;;;;;LINESTRING Z (1037576.1 6778162.6 196.5, 1037523.3 6778201.3 196.5)
-TRONROUT0000000048148815;Route a 1 chaussee;R DE BALE;R DE BALE;;;4;Non;0;En service;2006-12-18 14:21:51;2021-01-27 14:53:27;;;CEA/SDIS68;SDIS68:4698566;2.5;1.5;2.0;5.5;Non;Non;Double sens;;;Oui;40;Libre;;;;;;;;;Non;1;2;9;6;68231;68231;Classique;;;68600;68600;;682310080;682310080;ROUTNOMM0000000049124547;;D468;;Departementale;Collectivite europeenne d'Alsace;;;;;;LINESTRING Z (1037628.3 6778121.4 196.1, 1037576.1 6778162.6 196.5)
-TRONROUT0000002222575436;Route a 1 chaussee;R DES DEPORTES;R DES DEPORTES;;;5;Non;0;En service;2021-01-27 14:53:27;;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;;;;;68231;68231;;;;68600;68600;;682310150;682310150;;;;;;;;;;;;LINESTRING Z (1037676.6 6778168.4 197.3, 1037679.1 6778170.4 196.2, 1037688.7 6778184.7 196.1, 1037695.9 6778196.1 196.1, 1037698.2 6778203.3 196.1, 1037698.2 6778210.7 196.1, 1037696.7 6778217.8 196.1, 1037692 6778238.5 196.1)
-TRONROUT0000000048146783;Route a 1 chaussee;R GENERAL DERMONCOURT;R GENERAL DERMONCOURT;;;5;Non;0;En service;2006-12-18 14:21:51;2021-01-27 14:53:27;;;SDIS68;SDIS68:4680354;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;13;3;13;3;68231;68231;Lineaire;;;68600;68600;;682310180;682310180;;;;;;;;;;;;LINESTRING Z (1037675.2 6778335.4 196.3, 1037641.1 6778357.1 195.8)
-TRONROUT0000000048146824;Route a 1 chaussee;R DU TEMPLE;R DU TEMPLE;;;5;Non;0;En service;2006-12-18 14:21:51;2021-01-27 14:53:27;;;SDIS68;SDIS68:4679753;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;;10;;14;68231;68231;Classique;;;68600;68600;;682310580;682310580;;;;;;;;;;;;LINESTRING Z (1037433.7 6778511.9 195.4, 1037458.5 6778547.3 195.4)
-TRONROUT0000000048146838;Route a 1 chaussee;PL DE LA PORTE DE COLMAR;PL DE LA PORTE DE COLMAR;;;5;Non;0;En service;2006-12-18 14:21:51;2011-09-07 09:05:54;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;11;14;11;14;68231;68231;Classique;;;68600;68600;;682310360;682310360;;;;;;;;;;;;LINESTRING Z (1037248.6 6778487.1 195.6, 1037265.5 6778510.4 195.5, 1037269.1 6778513.7 195.5, 1037272.6 6778515.7 195.5, 1037280.2 6778519.1 195.2)
-TRONROUT0000000048146828;Route a 1 chaussee;R GENERAL DERMONCOURT;R GENERAL DERMONCOURT;;;5;Non;0;En service;2006-12-18 14:21:51;2021-01-27 14:53:27;;;SDIS68;SDIS68:4680355;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;2;1;6;1;68231;68231;Classique;;;68600;68600;;682310180;682310180;;;;;;;;;;;;LINESTRING Z (1037641.1 6778357.1 195.8, 1037607.7 6778381 195.8, 1037585.3 6778398.3 197.1)
-TRONROUT0000000048148793;Route a 1 chaussee;R GENERAL HERR;R GENERAL HERR;;;5;Non;0;En service;2006-12-18 14:21:51;2021-01-27 14:53:27;;;SDIS68;SDIS68:4679764;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;8;5;2;1;68231;68231;Classique;;;68600;68600;;682310220;682310220;;;;;;;;;;;;LINESTRING Z (1037393.3 6778137 196.2, 1037433 6778190.3 196)
-TRONROUT0000000048148806;Route a 1 chaussee;R ST LOUIS;R ST LOUIS;;;5;Non;0;En service;2006-12-18 14:21:51;2021-01-27 14:53:27;;;SDIS68;SDIS68:4679480;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;16;13D;16;11;68231;68231;Classique;;;68600;68600;;682310540;682310540;;;;;;;;;;;;LINESTRING Z (1037591 6778070.9 196.1, 1037539.2 6778112.1 195.5)
-TRONROUT0000000048148824;Route a 1 chaussee;R DES DEPORTES;R DES DEPORTES;;;5;Non;0;En service;2006-12-18 14:21:51;2021-01-27 14:53:27;;;SDIS68;SDIS68:4680221;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;;13;;7;68231;68231;Classique;;;68600;68600;;682310150;682310150;;;;;;;;;;;;LINESTRING Z (1037681.2 6778296.3 196, 1037675.2 6778335.4 196.3)
-TRONROUT0000000048148832;Route a 1 chaussee;R DES CAPUCINS;R DES CAPUCINS;;;5;Non;0;En service;2006-12-18 14:21:51;2021-01-27 14:53:27;;;SDIS68;SDIS68:4679809;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;2;;2;;68231;68231;Classique;;;68600;68600;;682310120;682310120;;;;;;;;;;;;LINESTRING Z (1037393.3 6778137 196.2, 1037343.1 6778174.1 196.4)
-TRONROUT0000000048148908;Route a 1 chaussee;PL DE LA PORTE DE BELFORT;PL DE LA PORTE DE BELFORT;;;5;Non;0;En service;2006-12-18 14:21:51;2021-01-27 14:53:27;;;SDIS68;SDIS68:4679791;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;1;;5;;68231;68231;Classique;;;68600;68600;;682310340;682310340;;;;;;;;;;;;LINESTRING Z (1037314.5 6778031.8 196.6, 1037265.9 6778068 196.2)
-TRONROUT0000000048146846;Sentier;;;;;6;Non;0;En service;2006-12-18 14:21:51;2012-02-01 09:33:08;;;;;2.5;1.5;;;Non;Non;Sans objet;;;Oui;0;Physiquement impossible;;;;;;;;;Non;;;;;68231;68231;Classique;;;68600;68600;;;;;;;;;;;;;;;LINESTRING Z (1037193.3 6778470.6 201.2, 1037217.9 6778503 200.3, 1037222 6778506.8 200.3, 1037229.3 6778510.4 199.5, 1037243.9 6778518.5 197.8, 1037259.3 6778526.1 196.5, 1037265.9 6778527.8 196.2, 1037271.1 6778527.5 196.2, 1037275.7 6778524.5 195.2, 1037280.2 6778519.1 195.2)
-TRONROUT0000000048146777;Route a 1 chaussee;R DE L EGLISE;R DE L EGLISE;;;5;Non;0;En service;2006-12-18 14:21:51;2021-01-27 14:53:27;;;SDIS68;SDIS68:4679758;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;1;6;3;8;68231;68231;Classique;;;68600;68600;;682310160;682310160;;;;;;;;;;;;LINESTRING Z (1037447.4 6778418.9 196.9, 1037393 6778458.6 195.9)
-TRONROUT0000000048146790;Route a 1 chaussee;R ST JEAN;R ST JEAN;;;5;Non;0;En service;2006-12-18 14:21:51;2021-01-27 14:53:27;;;SDIS68;SDIS68:4679802;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;3;;5;;68231;68231;Classique;;;68600;68600;;682310520;682310520;;;;;;;;;;;;LINESTRING Z (1037447.4 6778418.9 196.9, 1037486.9 6778472.2 196.7)
-TRONROUT0000000048146819;Route a 1 chaussee;R DES DEPORTES;R DES DEPORTES;;;5;Non;0;En service;2006-12-18 14:21:51;2021-01-27 14:53:27;;;SDIS68;SDIS68:4680352;2.5;1.5;2.0;4.0;Non;Non;Sens inverse;;;Oui;30;Libre;;;;;;;;;Non;2;;2;;68231;68231;Classique;;;68600;68600;;682310150;682310150;;;;;;;;;;;;LINESTRING Z (1037667.9 6778392.8 196.1, 1037664.9 6778411.8 196.1, 1037662.7 6778419.5 196.1, 1037660.1 6778425 196.2, 1037652.4 6778432.2 196.2, 1037626.4 6778449.8 196.1)
-TRONROUT0000000048148870;Route a 1 chaussee;R SALIN DE NIAR;R SALIN DE NIAR;;;5;Non;0;En service;2006-12-18 14:21:51;2021-01-27 14:53:27;;;SDIS68;SDIS68:4679795;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;;;;;68231;68231;Classique;;;68600;68600;;682310440;682310440;;;;;;;;;;;;LINESTRING Z (1037343.1 6778174.1 196.4, 1037291.5 6778212.5 196.3)
-TRONROUT0000000048148801;Route a 1 chaussee;PL D ARMES GENERAL DE GAULLE;PL D ARMES GENERAL DE GAULLE;;;5;Non;0;En service;2006-12-18 14:21:51;2021-01-27 14:53:27;;;SDIS68;SDIS68:4679768;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;;;;;68231;68231;Classique;;;68600;68600;;682310040;682310040;;;;;;;;;;;;LINESTRING Z (1037498.9 6778288.1 196.6, 1037507.8 6778290.7 196.8)
-TRONROUT0000000048148809;Route a 1 chaussee;R DU MARCHE;R DU MARCHE;;;5;Non;0;En service;2006-12-18 14:21:51;2021-01-27 14:53:27;;;SDIS68;SDIS68:4679792;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;;2;;6;68231;68231;Classique;;;68600;68600;;682310260;682310260;;;;;;;;;;;;LINESTRING Z (1037507.8 6778290.7 196.8, 1037559.4 6778250.5 197.2)
-TRONROUT0000000048148871;Route a 1 chaussee;R DES TISSERANDS;R DES TISSERANDS;;;5;Non;0;En service;2006-12-18 14:21:51;2021-01-27 14:53:27;;;SDIS68;SDIS68:4679773;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;12;11;10A;7;68231;68231;Classique;;;68600;68600;;682310600;682310600;;;;;;;;;;;;LINESTRING Z (1037187.5 6778291.1 195.9, 1037214.6 6778330.2 196, 1037224.6 6778344.6 196.4)
-TRONROUT0000000048148873;Route a 1 chaussee;R SONNIER;R SONNIER;;;5;Non;0;En service;2006-12-18 14:21:51;2021-01-27 14:53:27;;;SDIS68;SDIS68:4679752;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;;9;;5;68231;68231;Classique;;;68600;68600;;682310480;682310480;;;;;;;;;;;;LINESTRING Z (1037174.1 6778166 196.4, 1037197.4 6778198.8 196)
-TRONROUT0000000048146866;Route a 1 chaussee;R DES VOSGES;R DES VOSGES;;;5;Non;0;En service;2006-12-18 14:21:51;2021-01-27 14:53:27;;;SDIS68;SDIS68:4679745;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;1A;;3;;68231;68231;Classique;;;68600;68600;;682310640;682310640;;;;;;;;;;;;LINESTRING Z (1037354 6778406.8 195.5, 1037301.7 6778445.3 196.1)
-TRONROUT0000000048146785;Route a 1 chaussee;R ST CHARLES;R ST CHARLES;;;5;Non;0;En service;2006-12-18 14:21:51;2011-09-07 09:05:54;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;;;;;68231;68231;Classique;;;68600;68600;;682310500;682310500;;;;;;;;;;;;LINESTRING Z (1037433.7 6778511.9 195.4, 1037414.5 6778524.9 195.5, 1037393.6 6778538.6 195.4)
-TRONROUT0000000048146780;Route a 1 chaussee;R ST CHARLES;R ST CHARLES;;;5;Non;0;En service;2006-12-18 14:21:51;2021-01-27 14:53:27;;;SDIS68;SDIS68:4679807;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;;2;;4;68231;68231;Classique;;;68600;68600;;682310500;682310500;;;;;;;;;;;;LINESTRING Z (1037535.6 6778435.3 196.8, 1037486.9 6778472.2 196.7)
-TRONROUT0000000048148796;Route a 1 chaussee;R VAUBAN;R VAUBAN;;;5;Non;0;En service;2006-12-18 14:21:51;2021-01-27 14:53:27;;;SDIS68;SDIS68:4680164;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;1A;8A;5;10;68231;68231;Classique;;;68600;68600;;682310620;682310620;;;;;;;;;;;;LINESTRING Z (1037600.1 6778304.5 196.3, 1037641.1 6778357.1 195.8)
-TRONROUT0000000048148850;Route a 1 chaussee;PL DE LA PORTE DE BALE;PL DE LA PORTE DE BALE;;;5;Non;0;En service;2006-12-18 14:21:51;2021-01-27 14:53:27;;;SDIS68;SDIS68:4679781;2.5;1.5;2.0;4.0;Non;Non;Sens inverse;;;Oui;30;Libre;;;;;;;;;Non;;;;;68231;68231;;;;68600;68600;;682310320;682310320;;;;;;;;;;;;LINESTRING Z (1037532.4 6778032.1 195.6, 1037529 6778034.3 195.6, 1037500.5 6778058 195.6)
-TRONROUT0000000048148831;Route a 1 chaussee;R DE L HOTEL DE VILLE;R DE L HOTEL DE VILLE;;;5;Non;0;En service;2006-12-18 14:21:51;2021-01-27 14:53:27;;;SDIS68;SDIS68:4680209;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;15;;10;;68231;68231;Classique;;;68600;68600;;682310240;682310240;;;;;;;;;;;;LINESTRING Z (1037692 6778238.5 196.1, 1037653.3 6778266.5 196.8)
-TRONROUT0000000048146821;Route a 1 chaussee;PL DE LA PORTE DE STRASBOURG;PL DE LA PORTE DE STRASBOURG;;;5;Non;0;En service;2006-12-18 14:21:51;2011-09-07 09:05:54;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;;2;;2;68231;68231;Classique;;;68600;68600;;682310380;682310380;;;;;;;;;;;;LINESTRING Z (1037458.5 6778547.3 195.4, 1037474 6778549.2 195.5, 1037481.9 6778549.9 195.5, 1037486.6 6778549.7 195.5, 1037491.4 6778548.6 195.5, 1037501.7 6778541.8 195.4, 1037527.1 6778524.3 195.4)
-TRONROUT0000000048146825;Route a 1 chaussee;R DU TEMPLE;R DU TEMPLE;;;5;Non;0;En service;2006-12-18 14:21:51;2021-01-27 14:53:27;;;SDIS68;SDIS68:4679754;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;3;6;7A;8;68231;68231;Classique;;;68600;68600;;682310580;682310580;;;;;;;;;;;;LINESTRING Z (1037393 6778458.6 195.9, 1037433.7 6778511.9 195.4)
-TRONROUT0000000048148799;Route a 1 chaussee;R MARECHAL FOCH;R MARECHAL FOCH;;;5;Non;0;En service;2006-12-18 14:21:51;2021-01-27 14:53:27;;;SDIS68;SDIS68:4679767;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;1;;9;;68231;68231;Classique;;;68600;68600;;682310280;682310280;;;;;;;;;;;;LINESTRING Z (1037507.8 6778290.7 196.8, 1037546.4 6778343.9 196.1)
-TRONROUT0000000048148804;Route a 1 chaussee;R VAUBAN;R VAUBAN;;;5;Non;0;En service;2006-12-18 14:21:51;2021-01-27 14:53:27;;;SDIS68;SDIS68:4679478;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;;4;;8;68231;68231;Classique;;;68600;68600;;682310620;682310620;;;;;;;;;;;;LINESTRING Z (1037559.4 6778250.5 197.2, 1037600.1 6778304.5 196.3)
-TRONROUT0000000048148834;Route a 1 chaussee;R VAUBAN;R VAUBAN;;;5;Non;0;En service;2006-12-18 14:21:51;2021-01-27 14:53:27;;;SDIS68;SDIS68:4679771;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;1;2;1;2A;68231;68231;Classique;;;68600;68600;;682310620;682310620;;;;;;;;;;;;LINESTRING Z (1037523.3 6778201.3 196.5, 1037559.4 6778250.5 197.2)
-TRONROUT0000000245944549;Route a 1 chaussee;;;;;5;Non;0;En service;2010-12-03 16:05:51;2015-01-27 12:58:09;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Non;35;Libre;;;;;;;;;Non;;;;;68231;68231;Classique;;;68600;68600;;;;;;;;;;;;;;;LINESTRING Z (1037676.6 6778168.4 197.3, 1037678.6 6778164.5 197.2, 1037679 6778161.4 197.2, 1037678.2 6778159.1 197, 1037673.1 6778152.5 196.5, 1037665.5 6778142.3 196.8, 1037658.1 6778132.4 196, 1037651.9 6778124.9 196.9, 1037645.1 6778116.7 196.9)
-TRONROUT0000000048146844;Route a 1 chaussee;CITE SUZONNI;CITE SUZONNI;;;5;Non;0;En service;2006-12-18 14:21:51;2013-05-02 16:29:39;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;;;;;68231;68231;Classique;;;68600;68600;;682310565;682310565;;;;;;;;;;;;LINESTRING Z (1037280.2 6778519.1 195.2, 1037294.7 6778521.4 195.2, 1037304.7 6778523.4 195.2)
-TRONROUT0000000048146823;Route a 1 chaussee;PL DE LA PORTE DE STRASBOURG;PL DE LA PORTE DE STRASBOURG;;;5;Non;0;En service;2006-12-18 14:21:51;2021-01-27 14:53:27;;;SDIS68;SDIS68:4680360;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;16;7;16;7;68231;68231;Classique;;;68600;68600;;682310380;682310380;;;;;;;;;;;;LINESTRING Z (1037626.4 6778449.8 196.1, 1037591.5 6778475.3 196.1, 1037576.3 6778487.2 196.1)
-TRONROUT0000000048148800;Route a 1 chaussee;R DU MARCHE;R DU MARCHE;;;5;Non;0;En service;2006-12-18 14:21:51;2021-01-27 14:53:27;;;SDIS68;SDIS68:4679481;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;1;8;5;12;68231;68231;Classique;;;68600;68600;;682310260;682310260;;;;;;;;;;;;LINESTRING Z (1037559.4 6778250.5 197.2, 1037612.5 6778211.2 196.9)
-TRONROUT0000000048148802;Route a 1 chaussee;R DE L HOTEL DE VILLE;R DE L HOTEL DE VILLE;;;5;Non;0;En service;2006-12-18 14:21:51;2021-01-27 14:53:27;;;SDIS68;SDIS68:4679477;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;4;9;4;3;68231;68231;Classique;;;68600;68600;;682310240;682310240;;;;;;;;;;;;LINESTRING Z (1037600.1 6778304.5 196.3, 1037546.4 6778343.9 196.1)
-TRONROUT0000000048148828;Route a 1 chaussee;PL DE LA PORTE DE BALE;PL DE LA PORTE DE BALE;;;5;Non;0;En service;2006-12-18 14:21:51;2021-01-27 14:53:27;;;SDIS68;SDIS68:4680213;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;3;6A;5;6A;68231;68231;Classique;;;68600;68600;;682310320;682310320;;;;;;;;;;;;LINESTRING Z (1037628.3 6778121.4 196.1, 1037592.7 6778073.4 196.1, 1037591 6778070.9 196.1)
-TRONROUT0000000048148907;Route a 1 chaussee;R D ANGOULEME;R D ANGOULEME;;;5;Non;0;En service;2006-12-18 14:21:51;2011-09-07 09:05:54;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;15;;15;;68231;68231;Classique;;;68600;68600;;682310020;682310020;;;;;;;;;;;;LINESTRING Z (1037407.9 6778043.6 196.3, 1037391.3 6778020.7 196.5, 1037389 6778018.2 196.5, 1037383.5 6778012.1 196.5, 1037379.4 6778008.9 196.5, 1037370.8 6778006.5 196.4, 1037362.1 6778005.8 196.5, 1037355.5 6778005.5 196.5, 1037348.6 6778007.4 196.5, 1037345.2 6778009.4 196.5, 1037314.5 6778031.8 196.6)
-TRONROUT0000000048148866;Route a 1 chaussee;R DE BELFORT;R DE BELFORT;;;5;Non;0;En service;2006-12-18 14:21:51;2021-01-27 14:53:27;;;SDIS68;SDIS68:4679786;2.5;1.5;2.0;4.0;Non;Non;Sens direct;;;Oui;30;Libre;;;;;;;;;Non;9;12;9;18;68231;68231;Classique;;;68600;68600;;682310100;682310100;;;;;;;;;;;;LINESTRING Z (1037303.7 6778122.3 196.2, 1037343.1 6778174.1 196.4)
-TRONROUT0000000323347734;Route a 1 chaussee;R DE LAUBANIE;R DE LAUBANIE;;;5;Non;0;En service;2013-06-20 18:00:06;2021-01-27 14:53:27;;;SDIS68;SDIS68:4679734;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;9;2;19;6;68231;68231;Classique;;;68600;68600;;682310145;682310145;;;;;;;;;;;;LINESTRING Z (1037161.1 6778259.7 195.8, 1037155.4 6778297.1 195.8, 1037148.2 6778330.9 195.8, 1037145.7 6778341 195.8, 1037144.3 6778346.1 195.8)
-TRONROUT0000000048146787;Route a 1 chaussee;R MARECHAL FOCH;R MARECHAL FOCH;;;5;Non;0;En service;2006-12-18 14:21:51;2021-01-27 14:53:27;;;SDIS68;SDIS68:4679475;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;9A;2;11;4;68231;68231;Classique;;;68600;68600;;682310280;682310280;;;;;;;;;;;;LINESTRING Z (1037546.4 6778343.9 196.1, 1037585.3 6778398.3 197.1)
-TRONROUT0000000048146830;Route a 1 chaussee;R DE L EGLISE;R DE L EGLISE;;;5;Non;0;En service;2006-12-18 14:21:51;2021-01-27 14:53:27;;;SDIS68;SDIS68:4679759;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;;2;;4;68231;68231;Classique;;;68600;68600;;682310160;682310160;;;;;;;;;;;;LINESTRING Z (1037495.7 6778380 196.8, 1037447.4 6778418.9 196.9)
-TRONROUT0000000048148794;Route a 1 chaussee;PL D ARMES GENERAL DE GAULLE;PL D ARMES GENERAL DE GAULLE;;;5;Non;0;En service;2006-12-18 14:21:51;2013-05-02 16:44:02;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;;;;;68231;68231;Classique;;;68600;68600;;682310040;682310040;;;;;;;;;;;;LINESTRING Z (1037338.1 6778266.1 196.2, 1037330.7 6778266.1 196.4)
-TRONROUT0000000048148795;Route a 1 chaussee;PL D ARMES GENERAL DE GAULLE;PL D ARMES GENERAL DE GAULLE;;;5;Non;0;En service;2006-12-18 14:21:51;2021-01-27 14:53:27;;;SDIS68;SDIS68:4679763;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;;;;;68231;68231;Classique;;;68600;68600;;682310040;682310040;;;;;;;;;;;;LINESTRING Z (1037433 6778190.3 196, 1037432.4 6778198.2 196.5)
-TRONROUT0000000048148805;Route a 1 chaussee;R ST LOUIS;R ST LOUIS;;;5;Non;0;En service;2006-12-18 14:21:51;2021-01-27 14:53:27;;;SDIS68;SDIS68:4679784;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;14;9;8;7;68231;68231;Classique;;;68600;68600;;682310540;682310540;;;;;;;;;;;;LINESTRING Z (1037539.2 6778112.1 195.5, 1037487 6778149.8 195.7)
-TRONROUT0000000048148807;Route a 1 chaussee;R GENERAL HERR;R GENERAL HERR;;;5;Non;0;En service;2006-12-18 14:21:51;2021-01-27 14:53:27;;;SDIS68;SDIS68:4679765;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;14;9;10;7;68231;68231;Classique;;;68600;68600;;682310220;682310220;;;;;;;;;;;;LINESTRING Z (1037353 6778083.4 196.3, 1037393.3 6778137 196.2)
-TRONROUT0000000048148808;Route a 1 chaussee;R DES CAPUCINS;R DES CAPUCINS;;;5;Non;0;En service;2006-12-18 14:21:51;2021-01-27 14:53:27;;;SDIS68;SDIS68:4679810;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;10;1B;4;1;68231;68231;Classique;;;68600;68600;;682310120;682310120;;;;;;;;;;;;LINESTRING Z (1037446.8 6778097 195.6, 1037393.3 6778137 196.2)
-TRONROUT0000000048148820;Route a 1 chaussee;PL D ARMES GENERAL DE GAULLE;PL D ARMES GENERAL DE GAULLE;;;4;Non;0;En service;2006-12-18 14:21:51;2021-01-27 14:53:27;;;SDIS68;SDIS68:4698518;2.5;1.5;2.0;5.5;Non;Non;Sens direct;;;Oui;40;Libre;;;;;;;;;Non;;12;;16;68231;68231;Classique;;;68600;68600;;682310040;682310040;;;;;;;;;;;;LINESTRING Z (1037432.4 6778198.2 196.5, 1037437.1 6778199.2 196.5, 1037441.3 6778202.7 196.5, 1037452.5 6778217.5 196.5, 1037469.9 6778239.4 196.5)
-TRONROUT0000000048148860;Sentier;;;;;6;Non;0;En service;2006-12-18 14:21:51;2012-02-01 09:33:08;;;;;2.5;1.5;;;Non;Non;Sans objet;;;Oui;0;Physiquement impossible;;;;;;;;;Non;;;;;68231;68231;Classique;;;68600;68600;;;;;;;;;;;;;;;LINESTRING Z (1037219.6 6778053.4 200.9, 1037214.2 6778062.7 200.4, 1037208.5 6778072.4 200.4, 1037203.5 6778077.1 200.4, 1037197.6 6778081.2 200.4, 1037190.3 6778081.5 200.4, 1037180.8 6778083.1 200.4, 1037169.3 6778089.1 200.4, 1037144.2 6778103.9 200.4, 1037138.6 6778109 200.4, 1037137.1 6778113.1 200.4, 1037136.9 6778116.6 200.4, 1037137.9 6778119.7 200.3, 1037139.9 6778122.8 200.1, 1037143.5 6778125 199.2, 1037148.5 6778126.1 199.2, 1037155.5 6778124.8 198.1, 1037165.5 6778124.1 197.3, 1037172.1 6778124.7 197, 1037178 6778126.1 197, 1037183 6778128.1 196.4)
-TRONROUT0000000048148867;Route a 1 chaussee;PL DE LA PORTE DE BELFORT;PL DE LA PORTE DE BELFORT;;;5;Non;0;En service;2006-12-18 14:21:51;2011-09-07 09:05:54;;;;;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;;8;;12;68231;68231;Classique;;;68600;68600;;682310340;682310340;;;;;;;;;;;;LINESTRING Z (1037215.2 6778104.7 196.6, 1037183 6778128.1 196.4)
-TRONROUT0000000048148852;Route a 1 chaussee;R XAVIER JOURDAIN;R XAVIER JOURDAIN;;;5;Non;0;En service;2006-12-18 14:21:51;2021-01-27 14:53:27;;;SDIS68;SDIS68:4679804;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;6;11;6;7;68231;68231;Classique;;;68600;68600;;682310660;682310660;;;;;;;;;;;;LINESTRING Z (1037407.9 6778043.6 196.3, 1037353 6778083.4 196.3)
-TRONROUT0000000048148855;Route a 1 chaussee;R DE L ARSENAL;R DE L ARSENAL;;;5;Non;0;En service;2006-12-18 14:21:51;2021-01-27 14:53:27;;;SDIS68;SDIS68:4679761;2.5;1.5;2.0;4.0;Non;Non;Double sens;;;Oui;30;Libre;;;;;;;;;Non;4;;2A;;68231;68231;Classique;;;68600;68600;;682310060;682310060;;;;;;;;;;;;LINESTRING Z (1037253.2 6778157.8 195.3, 1037291.5 6778212.5 196.3)
-TRONROUT0000000048146858;Route a 1 chaussee;R DE COLMAR;R DE COLMAR;;;4;Non;0;En service;2006-12-18 14:21:51;2021-01-27 14:53:27;;;SDIS68;SDIS68:4698562;2.5;1.5;2.0;5.5;Non;Non;Double sens;;;Oui;40;Libre;;;;;;;;;Non;6;7;2;1;68231;68231;Classique;;;68600;68600;;682310140;682310140;ROUTNOMM0000000048263005;;D290;;Departementale;Collectivite europeenne d'Alsace;;;;;;LINESTRING Z (1037263.8 6778395.2 196.2, 1037209 6778434.7 195.9)
-TRONROUT0000000048148862;Sentier;;;;;6;Non;0;En service;2006-12-18 14:21:51;2020-10-15 16:48:30;;;;;2.5;1.5;;;Non;Non;Sans objet;;;Oui;0;Physiquement impossible;;;;;;;;;Non;;;;;68231;68231;Classique;;;68600;68600;;;;;;;;;;;;;;;LINESTRING Z (1037144.3 6778346.1 195.8, 1037147.9 6778353.9 195.8, 1037151 6778359.7 195.8, 1037164.3 6778378.7 195.8, 1037168.9 6778381.8 195.8, 1037175.5 6778384 195.8)
-""")
+        _sio = AbstractGeoDataFrameDemos._dataset(
+            "GeoDataFrameDemos8", "neufBrisachRoads.csv"
+        )
         return GeoDataFrameLib.read_csv(_sio)
 
     @staticmethod
@@ -46,9 +46,9 @@ BDT_3-3_SHP_LAMB93_D044-ED2022-12-15/ADMINISTRATIF/EPCI.shp")
         nm.reset_index(drop=True, inplace=True)
         nm.to_csv('/tmp/nm.csv', sep=';', index=False)
         '''
-        _sio = StringIO("""ID;CODE_SIREN;NATURE;NOM;DATE_CREAT;DATE_MAJ;DATE_APP;DATE_CONF;ID_AUT_ADM;geometry
-EPCI____0000002150236923;244400404;Métropole;Nantes Métropole;2018-11-24 00:00:00;2021-09-17 09:06:57;;;SURFACTI0000000327188495;POLYGON ((343723.7 6680956.2, 343677.5 6680965.2, 343644.6 6680970.6, 343619.3 6680977.3, 343590.9 6680985.3, 343563.6 6680994.2, 343549.1 6680997.2, 343537.3 6680998.6, 343523.6 6680998.9, 343518.9 6680999.1, 343512 6680998.5, 343496 6680997.3, 343461.9 6680990.9, 343420.1 6680974.7, 343293.4 6680938.9, 343176.2 6680907.2, 343145.6 6680898.5, 343126.2 6680892.9, 343097 6680878.2, 343067.7 6680858.9, 343007.9 6680813.8, 342971.6 6680786.3, 342969.1 6680783.8, 342950.2 6680765.9, 342931.7 6680744.7, 342915.8 6680731.1, 342888.1 6680721.6, 342852.9 6680714.2, 342816.1 6680702.6, 342780.2 6680685.9, 342766.2 6680676.1, 342749.4 6680664.4, 342728.1 6680639.4, 342718.6 6680621.6, 342710.9 6680607.5, 342687.5 6680573.4, 342660.8 6680549.3, 342616.3 6680525, 342608.3 6680521.2, 342600.5 6680517.4, 342554.7 6680495.4, 342539.3 6680488, 342493.5 6680474.7, 342454.8 6680463, 342442.3 6680459.2, 342414.8 6680444.5, 342371.6 6680419.3, 342324 6680391.7, 342297.6 6680379.6, 342270.5 6680373.9, 342246.4 6680372.6, 342220.9 6680374.7, 342171.3 6680385.6, 342119.5 6680393.2, 342087.9 6680392.8, 342060.9 6680381.7, 342043.6 6680368.7, 342021.2 6680340.4, 342008.8 6680326.6, 341990.9 6680306.7, 341988.1 6680298.2, 341971 6680278, 341955 6680262.7, 341940.7 6680256.2, 341928.5 6680271.9, 341914 6680309.1, 341907.9 6680320.7, 341879.6 6680375.4, 341872.4 6680389.2, 341849.4 6680433.2, 341828.7 6680474.6, 341821.5 6680484.5, 341800.4 6680513.8, 341796.5 6680519.2, 341784.5 6680533.8, 341740.9 6680587.2, 341697.3 6680634.5, 341692.7 6680640.3, 341691.2 6680642.1, 341645.8 6680696.5, 341613.4 6680740.3, 341568.7 6680815.1, 341563.5 6680824, 341546 6680845.2, 341540.3 6680850.2, 341515 6680872.2, 341506.1 6680880.4, 341471 6680910.5, 341438.2 6680931.6, 341418.6 6680941.6, 341392.9 6680957.7, 341381.3 6680971, 341365.4 6680988.4, 341343.8 6681001.9, 341324.2 6681011.3, 341298.4 6681019.8, 341285.7 6681026.2, 341253.2 6681055, 341252 6681056.1, 341226 6681068.7, 341201 6681081.7, 341186.2 6681093.6, 341176.9 6681108.4, 341168.5 6681127.9, 341160.8 6681150, 341154.4 6681168.7, 341144 6681184.6, 341138.3 6681190.9, 341126.1 6681204.2, 341120.7 6681209.7, 341117.5 6681213, 341105.6 6681225.1, 341087.1 6681249, 341077.4 6681270.4, 341067.1 6681289.4, 341057.6 6681299, 341040.6 6681310, 341004.7 6681329.3, 340987.4 6681335.5, 340965.8 6681338.6, 340958.3 6681339.7, 341076.9 6681446.4, 341082.1 6681461.7, 341091.2 6681471.6, 341138.8 6681504.2, 341146.7 6681512.4, 341151.8 6681519.9, 341160.5 6681533.2, 341165.6 6681539.1, 341168 6681554.9, 341174.4 6681579.8, 341185.7 6681617.7, 341186.9 6681626.7, 341187.1 6681637.1, 341193.9 6681657.8, 341206.7 6681682.2, 341219.6 6681704.1, 341236.6 6681740.8, 341241.3 6681763.4, 341243.6 6681788.1, 341241.4 6681795, 341219.1 6681807.9, 341317.5 6681937, 341305 6681943.2, 341286.6 6681954, 341279.9 6681960.5, 341276.5 6681966.4, 341292.7 6681973.8, 341324 6681989, 341352.1 6682000, 341365.6 6682004.9, 341377.2 6682010.2, 341386.6 6682014.8, 341400.1 6682018.9, 341427.3 6682024.4, 341480 6682037.6, 341528.5 6682053.5, 341556 6682063.6, 341561.4 6682065.7, 341565.1 6682067, 341573.8 6682073.6, 341598 6682092.1, 341611.4 6682102.7, 341629.4 6682120.7, 341657.9 6682152.3, 341676.7 6682176.2, 341680.6 6682181.6, 341686.8 6682190.2, 341702.4 6682207.2, 341713.8 6682218.3, 341735 6682236.7, 341766.6 6682271.6, 341806.7 6682317.1, 341809.7 6682320.6, 341836.6 6682352.2, 341840.5 6682359.7, 341841 6682361, 341847.5 6682372.4, 341860.8 6682391.9, 341895.1 6682430.8, 341947.4 6682484.2, 341993.9 6682529, 341995.6 6682530.4, 342047.1 6682573.9, 342092.3 6682604, 342138.7 6682630.2, 342176.2 6682647, 342204.6 6682659.8, 342268.3 6682694.6, 342355.7 6682741, 342402.3 6682767.4, 342415.5 6682779.9, 342425.5 6682792.7, 342437.4 6682802.6, 342445 6682809.5, 342450.5 6682817.4, 342459.9 6682828, 342487.8 6682852.4, 342526 6682878.6, 342576.5 6682905.6, 342603.8 6682922.9, 342643.5 6682953.7, 342686.7 6682988.6, 342714.2 6683018.3, 342717.1 6683023, 342721.8 6683025.3, 342737.3 6683043.8, 342775.6 6683088.3, 342800.6 6683111.7, 342815.7 6683122.2, 342824.9 6683125.8, 342833.5 6683126.8, 342844.6 6683124.9, 342852.2 6683122.8, 342853.1 6683125.9, 342856.4 6683129.8, 342866.4 6683137.4, 342892.1 6683165.8, 342928.7 6683209, 342968 6683256.3, 342979.5 6683272.4, 342994.8 6683296.6, 343014.1 6683323, 343045.2 6683362.2, 343047.2 6683364.7, 343013.5 6683383.2, 342999 6683390.8, 342986.1 6683394.8, 342961.3 6683398.1, 342876.2 6683403.8, 342813.4 6683411.9, 342798 6683416.7, 342693.3 6683423.9, 342655.2 6683426.5, 342629.4 6683430.8, 342583.9 6683440.4, 342549.4 6683449.3, 342532.2 6683450.6, 342522.9 6683451.1, 342509.8 6683451.7, 342494.8 6683453, 342485 6683455.5, 342470.5 6683459.1, 342455.6 6683464.5, 342451.4 6683465.9, 342426.9 6683480.2, 342401.3 6683493.1, 342385.1 6683499.7, 342356.4 6683508.8, 342333.1 6683514.5, 342318.3 6683515.9, 342300.9 6683515, 342281.3 6683512.5, 342262.4 6683511.4, 342242.1 6683513.6, 342228.7 6683516.1, 342202.4 6683524.9, 342177.7 6683532, 342161.9 6683536.1, 342134.3 6683539.8, 342126 6683543.1, 342117.5 6683543.6, 342064.1 6683541.8, 342035.5 6683543.2, 341964.8 6683553.6, 341905 6683566, 341883 6683572.6, 341861.2 6683583.5, 341789.7 6683626.6, 341706 6683680.5, 341685 6683699, 341664 6683700, 341568.5 6683708.2, 341457.1 6683717, 341376.3 6683723.3, 341338.5 6683725.9, 341321.1 6683723.8, 341268.3 6683702.9, 341227.5 6683683, 341193 6683666.1, 341176.4 6683657.9, 341081.4 6683601.7, 341058.3 6683588.1, 340968.5 6683535.8, 340924.7 6683510.5, 340915.8 6683506.1, 340907.3 6683506.5, 340898.9 6683510.5, 340871.2 6683532.7, 340865.1 6683561.9, 340858 6683583.3, 340844.2 6683617.5, 340837.9 6683639.4, 340836.7 6683671.8, 340837.9 6683702.7, 340839.9 6683714, 340847.7 6683758.6, 340863.2 6683806.8, 340871.7 6683830.7, 340873.1 6683847, 340872 6683850.5, 340870.3 6683856.1, 340856.9 6683865.8, 340839.5 6683875.4, 340817.4 6683889.6, 340791.9 6683912.1, 340782.4 6683921.2, 340747.6 6683954.5, 340721.2 6683978.8, 340694.6 6683998.4, 340664.9 6684012.9, 340620.2 6684044.7, 340551.6 6684103.1, 340534.6 6684119.2, 340527 6684127.2, 340516.1 6684139.9, 340510.5 6684147.4, 340507.3 6684153.2, 340496.6 6684184.1, 340491 6684197.9, 340484.8 6684210.8, 340477.3 6684224.3, 340439.7 6684272.5, 340424.6 6684292.8, 340411.7 6684312.3, 340383.2 6684350.4, 340352.8 6684387.4, 340322.7 6684425.5, 340305.1 6684449.1, 340296.7 6684462, 340286.4 6684483.8, 340280.4 6684499.1, 340276.7 6684510.3, 340273.4 6684523.6, 340270.1 6684542.8, 340266.7 6684552.9, 340245.8 6684589.8, 340239.9 6684598.6, 340228.7 6684612.7, 340219.9 6684621.5, 340208.2 6684631.1, 340198.8 6684635.4, 340191.3 6684638, 340176.9 6684641.5, 340147.3 6684645.9, 340108.8 6684654.9, 340079.2 6684665, 340061.8 6684670.3, 340034.8 6684680.7, 339989.7 6684700.2, 339985.4 6684702.4, 339980.7 6684706, 339975.7 6684711.9, 339970.7 6684719.4, 339966.6 6684729.6, 339963.5 6684742, 339962.7 6684752.5, 339964.1 6684804, 339960.4 6684860.4, 339957.5 6684880.5, 339953.3 6684897.6, 339948.2 6684912.4, 339941.5 6684922.2, 339932.4 6684930.9, 339927 6684934.6, 339916.8 6684938.6, 339902.2 6684942.4, 339878.6 6684947.2, 339852.9 6684952.2, 339830.3 6684953.5, 339726 6684940.7, 339695.9 6684937.5, 339683.5 6684936.9, 339676.6 6684937.2, 339670.5 6684938.4, 339657.6 6684941.7, 339643.5 6684947.5, 339631.2 6684954.8, 339617.2 6684965.2, 339606.9 6684973.8, 339597.4 6684983.6, 339587.7 6684996.7, 339572.2 6685023.9, 339515.2 6685116.5, 339482.4 6685160.5, 339466.4 6685179.1, 339446.2 6685197.7, 339418.7 6685214.2, 339400.6 6685221.1, 339387.8 6685224.2, 339353 6685229.3, 339305.6 6685229.4, 339240.8 6685231.8, 339198 6685232, 339169.1 6685227.7, 339153.3 6685224.5, 339125.8 6685216.8, 339106.1 6685208.3, 339068.1 6685198.1, 339054.3 6685195, 339044.9 6685194.2, 339015.5 6685195.2, 339002 6685197.4, 338971.9 6685204.9, 338953 6685208.8, 338943.5 6685211.6, 338911.1 6685225.2, 338848.9 6685256.7, 338809.6 6685273.5, 338779.8 6685287.2, 338742.3 6685302.1, 338710.3 6685316.3, 338687.7 6685325.3, 338694.7 6685346.2, 338732.8 6685465, 338747.2 6685494.1, 338798.8 6685586.5, 338835.5 6685652.6, 338899.9 6685714.2, 338955.9 6685749, 338970.1 6685753.5, 338990 6685764.3, 339007.7 6685777, 339027.7 6685799.3, 339046.8 6685822.4, 339060.6 6685847.4, 339090.6 6685904.4, 339102.9 6685929.5, 339117.8 6685939.2, 339137 6685945.4, 339152.2 6685959.3, 339172.5 6685967.2, 339192.9 6685977.7, 339212.9 6685991.8, 339231.7 6685999.8, 339252.1 6686009.6, 339271.9 6686021.3, 339289.5 6686035.4, 339299.4 6686051.2, 339310.9 6686076.7, 339310.3 6686086.8, 339313.6 6686105.1, 339319.2 6686129.5, 339321.8 6686144.3, 339322.9 6686150.6, 339329.3 6686173.8, 339339.3 6686192, 339350.9 6686206.3, 339358.4 6686214.3, 339373.4 6686221.5, 339391.2 6686224.9, 339404.3 6686236.9, 339415.3 6686257, 339425.2 6686281.9, 339435.4 6686310.3, 339442.8 6686338.3, 339453 6686361.7, 339462.3 6686383.1, 339484.6 6686455.1, 339485.5 6686460.7, 339454.5 6686476.7, 339460.4 6686495.6, 339463.7 6686514, 339452.1 6686517.3, 339462.4 6686559.9, 339458.9 6686574.9, 339456.9 6686583.7, 339469.4 6686628.7, 339479.1 6686657.2, 339506 6686748.4, 339519.8 6686790, 339452.1 6686781.7, 339402.5 6686777.5, 339392.7 6686777.5, 339348.6 6686777.5, 339307.6 6686781.1, 339267.8 6686787, 339234.8 6686793.9, 339190.3 6686803.5, 339101 6686823, 339052.7 6686832.5, 338953.2 6686855.4, 338821 6686884.3, 338720.2 6686905.9, 338686.6 6686912.4, 338642.7 6686919.8, 338559.8 6686934.7, 338466.3 6686950.2, 338468.7 6686962.9, 338471.9 6686971.3, 338424.5 6686996.6, 338380.6 6687023.1, 338372.9 6687027.6, 338338 6687048.6, 338295.8 6687074, 338271.1 6687088.6, 338257.2 6687096.7, 338228.1 6687115.4, 338206.6 6687133.4, 338193.3 6687145.6, 338181 6687158.5, 338168.8 6687176.2, 338140 6687214.1, 338109.3 6687258.9, 338049.1 6687341.9, 338033.6 6687353.6, 337987.5 6687388.6, 337921.7 6687438.5, 337846.3 6687426.9, 337747.5 6687417.9, 337669.1 6687411.1, 337516.5 6687393, 337484.1 6687389.4, 337467.9 6687387.5, 337435.5 6687385.6, 337393.1 6687383.1, 337336.9 6687379.7, 337289 6687376.9, 337282 6687375.8, 337262.1 6687372.7, 337151.2 6687355.7, 337110.1 6687347.6, 337077.1 6687340.9, 337011.3 6687325.6, 336994.6 6687323.1, 336973.1 6687319.6, 336959.8 6687323.2, 336950.2 6687327.9, 336943.4 6687333.9, 336884.4 6687426, 336827.4 6687514.1, 336789.6 6687572.6, 336787.3 6687576, 336747.6 6687635.8, 336742.4 6687643.7, 336727.7 6687666, 336679.6 6687738.4, 336645.1 6687799.5, 336591.3 6687877, 336572.4 6687904.2, 336513 6687987.3, 336496.7 6688010.2, 336486.2 6688016, 336453 6688035.3, 336444.1 6688040.5, 336400.2 6688065.9, 336383.8 6688073.8, 336365.1 6688081.5, 336347.8 6688086.7, 336327.3 6688090.9, 336297.4 6688096.2, 336280.5 6688095.3, 336261.8 6688092, 336256.7 6688091, 336251.8 6688089.7, 336246.6 6688088.1, 336241.2 6688087.7, 336229.7 6688088.4, 336223.4 6688090, 336213.6 6688093.4, 336203.2 6688098.2, 336200 6688099.8, 336187 6688106.1, 336173.3 6688111.4, 336155.9 6688117.7, 336145.1 6688120.8, 336129.5 6688125.2, 336116.5 6688128.2, 336101.6 6688131.7, 336093.2 6688133.6, 336019.3 6688151, 335950.3 6688170.1, 335951.6 6688137.6, 335954.3 6688117.2, 335958.8 6688064, 335963.3 6688014.8, 335964.5 6688001.8, 335968.5 6687956.3, 335969.1 6687949.8, 335974.7 6687888.3, 335977.4 6687862.6, 335979.1 6687846.4, 335980.5 6687837.1, 335983.5 6687824.5, 335988.2 6687809.9, 335995 6687793.6, 335996.9 6687788.9, 336002.9 6687774.2, 336005 6687766.1, 336007.1 6687749.4, 336006.4 6687735.8, 336004.1 6687719.6, 335992.9 6687673.4, 335955.3 6687512.1, 335953.7 6687494.7, 335797.8 6687501, 335710 6687504.7, 335654.6 6687507.1, 335602.9 6687509, 335596.4 6687520.6, 335556.9 6687576.7, 335526.4 6687620.5, 335512.2 6687639.4, 335504.6 6687648, 335482.2 6687668.7, 335463.8 6687683.8, 335428.9 6687710.4, 335404.4 6687728.3, 335377.5 6687748.1, 335356.7 6687763.5, 335347.2 6687769.6, 335319.9 6687785.8, 335304.9 6687793.8, 335303.6 6687794.5, 335230.5 6687833.1, 335223 6687838.6, 335213.7 6687827.6, 335198.4 6687823.5, 335192.7 6687823.5, 335174.9 6687825.9, 335144.9 6687831.9, 335115.4 6687839.9, 335087.2 6687846.2, 335036.5 6687860.7, 335004.5 6687869.1, 334970.6 6687874.9, 334924.7 6687885.7, 334937.6 6687926.3, 334942.5 6687937.2, 334952.3 6687965.9, 334930 6687973.4, 334864.9 6687992.9, 334867.7 6688000.5, 334879.9 6688031.5, 334887.7 6688054.2, 334883.1 6688060.7, 334882.3 6688065.4, 334879.5 6688082.4, 334876.7 6688104.8, 334876.4 6688111.4, 334947 6688117.9, 334954 6688118.5, 334959.7 6688142.3, 334961 6688148.2, 334961.7 6688148.4, 335010.1 6688158.8, 335012.6 6688166.4, 335013.9 6688173.9, 335016.5 6688200.5, 335018.9 6688204.5, 335028.3 6688208.1, 335050.3 6688212.9, 335062.3 6688216.5, 335073.9 6688220.4, 335082.4 6688224.5, 335081.7 6688243.8, 335078.9 6688322.8, 335096.6 6688318.1, 335103.3 6688317.8, 335110.3 6688318.4, 335122.3 6688320.5, 335138.2 6688324.3, 335136.6 6688369.2, 335135 6688417.4, 335136.9 6688448.1, 335137.9 6688459.5, 335076.7 6688467, 335077.4 6688481, 335081.9 6688512.5, 335086 6688531, 335088.3 6688555.2, 335098 6688551.9, 335121.3 6688547.5, 335137.9 6688546.3, 335153.8 6688601.2, 335155.3 6688604.8, 335158.9 6688612.9, 335169 6688641.2, 335219.1 6688712.6, 335215.8 6688721.6, 335202.5 6688788.6, 335197 6688813.1, 335197.2 6688822.4, 335205 6688826.1, 335215.4 6688829.9, 335223.6 6688831.8, 335228.6 6688832.3, 335222.8 6688838.4, 335209.3 6688845.2, 335201.3 6688847.6, 335210.9 6688857.5, 335234.7 6688885.3, 335290 6688959.1, 335291.9 6688960.9, 335304 6688975.8, 335342.9 6689093.8, 335348.5 6689104, 335372.3 6689147.8, 335394.3 6689184.8, 335405.8 6689204.1, 335411.6 6689211, 335431.3 6689240, 335456.3 6689258.2, 335472.1 6689274.5, 335480.2 6689286.5, 335488.6 6689301.2, 335505.1 6689335.6, 335522.7 6689366.5, 335532.3 6689391.7, 335534.2 6689397.2, 335544.2 6689425.2, 335550.7 6689446.4, 335568.6 6689484.6, 335561 6689488.5, 335537.9 6689493.4, 335508.2 6689499.1, 335480.8 6689502.6, 335458 6689510.1, 335431.5 6689522, 335383.9 6689556.1, 335294.5 6689615.5, 335287 6689618.5, 335274.7 6689630.3, 335263.8 6689637.1, 335249.9 6689647.2, 335214.3 6689673, 335163.6 6689700.1, 335157.6 6689700.9, 335149.5 6689697.1, 335154.3 6689727.2, 335170.1 6689791.4, 335144.4 6689797.3, 335069.2 6689812.7, 335058 6689814.8, 335044.3 6689819.1, 335030.2 6689825.6, 334973.1 6689839.7, 334920.6 6689850.7, 334908.8 6689767.3, 334907.1 6689759.5, 334804.7 6689810, 334788.1 6689818.2, 334778.2 6689823.1, 334771.8 6689811.9, 334755 6689782.5, 334748.5 6689794.6, 334743.6 6689803.4, 334723.1 6689841.4, 334716.4 6689849.8, 334707.4 6689863.8, 334696.2 6689882, 334689.7 6689895.4, 334686 6689901.9, 334679.7 6689912.9, 334677 6689917.5, 334621.7 6690037.3, 334605 6690074.6, 334573.8 6690147.5, 334547 6690219.2, 334540.1 6690238.9, 334535.4 6690255, 334531.5 6690295.8, 334531.1 6690315.1, 334532.2 6690332.1, 334535.2 6690344.5, 334542.5 6690365.3, 334543.5 6690373.5, 334542.3 6690380.3, 334539 6690387.6, 334533.1 6690398.6, 334511.6 6690433.8, 334477.3 6690488.9, 334460.7 6690514.1, 334418.3 6690570.8, 334368.7 6690633.7, 334328.7 6690685.8, 334316 6690700, 334305.1 6690710.9, 334294.9 6690719.5, 334257.5 6690746.9, 334227.4 6690766.7, 334224.4 6690768.6, 334115.9 6690842.8, 334023.3 6690906.3, 334012 6690913.9, 334008.6 6690916, 334004.2 6690918.7, 333998.8 6690922, 333989.4 6690930.9, 333971.9 6690950, 333944.2 6690977.2, 333913.5 6691005.1, 333889.3 6691024.5, 333856.3 6691049.1, 333741.7 6691131.1, 333730.1 6691140, 333726.9 6691143.1, 333670.6 6691199, 333656.9 6691211, 333648.6 6691217, 333638.6 6691221, 333626.5 6691221.2, 333595.2 6691215.7, 333582.9 6691216, 333574.1 6691218.8, 333566 6691224.1, 333558.3 6691231.8, 333551.9 6691240.1, 333548.8 6691244.5, 333547.4 6691246.5, 333537.2 6691263.4, 333529 6691273.6, 333521 6691282, 333447.1 6691343.7, 333354.5 6691419, 333292.3 6691468.2, 333284.1 6691474.8, 333251.9 6691503.7, 333161.8 6691582.5, 333146.1 6691597.4, 333130.7 6691613.8, 333086.6 6691667.4, 333081.3 6691673.8, 333075.2 6691680.5, 333062.4 6691692, 333049.4 6691702.4, 333030.7 6691715.8, 333001 6691735.2, 332944.4 6691771.4, 332917.3 6691789.4, 332853.7 6691831.2, 332756.1 6691896.1, 332689.4 6691938, 332628.1 6691978.3, 332571.2 6692014.6, 332557.8 6692023.2, 332501.4 6692066.4, 332481.8 6692080.6, 332464.2 6692091.3, 332460.5 6692093.5, 332456.3 6692096, 332442.6 6692104.3, 332415.6 6692118.8, 332354.3 6692148.8, 332303.1 6692175.3, 332284.3 6692186.9, 332250.1 6692210.1, 332220.3 6692231.8, 332217.5 6692233.9, 332198.4 6692249.1, 332121.6 6692315.2, 332142.9 6692356.2, 332145.3 6692360.6, 332147.6 6692365.2, 332160.9 6692368.3, 332176.6 6692374, 332200.2 6692384.9, 332211.3 6692386.4, 332222 6692387, 332227 6692388, 332230.3 6692389.8, 332230.6 6692394.4, 332232.9 6692400.2, 332240.8 6692403.4, 332249.7 6692401.7, 332256 6692399.1, 332266 6692398.5, 332277.8 6692395.4, 332286.3 6692390.7, 332296.9 6692380.5, 332306.2 6692377.8, 332314.2 6692377, 332320 6692381.1, 332323.9 6692390.3, 332326.9 6692400.6, 332331.6 6692411.3, 332382 6692474.8, 332381.5 6692479.7, 332376.5 6692482.2, 332369.7 6692483.1, 332368.1 6692483.3, 332361 6692488.4, 332353.7 6692491.4, 332350 6692495.8, 332342.1 6692508.2, 332336.9 6692511.9, 332329 6692523, 332317.7 6692531.4, 332312.7 6692540, 332307.1 6692545.5, 332294.3 6692555.4, 332287.8 6692562.9, 332282.9 6692571.7, 332279.7 6692586.8, 332275.6 6692593.1, 332259.1 6692613.4, 332254.9 6692622.3, 332253.5 6692631.8, 332246.7 6692645.4, 332246.4 6692650, 332246.3 6692653.2, 332239.2 6692662.6, 332232.3 6692681.2, 332222.2 6692698.5, 332219.8 6692705.6, 332222 6692713.6, 332222.5 6692720.9, 332219.4 6692728.9, 332216.3 6692734.9, 332210.3 6692737.2, 332204.2 6692742.2, 332199.5 6692751.5, 332196 6692760, 332195.7 6692768.8, 332194 6692780.4, 332190.9 6692785.6, 332198.2 6692789.7, 332197.1 6692801.6, 332201.2 6692828.1, 332199.9 6692840.4, 332194.8 6692853.5, 332203.6 6692857.8, 332206.1 6692861.2, 332219.7 6692868.5, 332224.2 6692875.7, 332229.4 6692883.9, 332253 6692921.2, 332271.7 6692950.7, 332268.1 6692953.7, 332058.1 6693127.5, 332056.9 6693143.1, 332056.8 6693144, 332059.6 6693191.3, 332059.6 6693272.4, 332060.4 6693300.5, 332062.9 6693327.9, 332063.5 6693332.5, 332070.6 6693356.8, 332078.6 6693366.9, 332084.8 6693378.2, 332084.9 6693388.2, 332089.7 6693394.1, 332093.8 6693396.9, 332098.3 6693406.3, 332102.3 6693414.3, 332213.8 6693640.8, 332029.2 6693738, 331774.7 6693872, 331521.3 6694005.3, 331469.8 6694062.4, 331443.1 6694091.9, 331432.8 6694103.4, 331416.8 6694121.1, 331407.9 6694131, 331330.2 6694217, 331292.6 6694284.3, 331271.2 6694364.1, 331267.1 6694379, 331248.6 6694448, 331209.7 6694518.5, 331078.5 6694756.1, 331049.7 6694822.6, 331049.1 6694823.9, 331017.7 6694896.5, 330981.7 6694991.3, 330915.7 6695087.1, 330911.3 6695093.5, 330870.3 6695145.3, 330792 6695234, 330702.1 6695334, 330686.8 6695347.8, 330620.7 6695407.5, 330600.1 6695426, 330558.2 6695463.8, 330504.7 6695512.3, 330393.7 6695612.9, 330373.8 6695625.7, 330191.3 6695743.4, 330184.9 6695757.9, 330155.4 6695840.9, 330140.2 6695883.9, 330131.3 6695923.5, 330128 6695933.3, 330125.1 6695937.9, 330116.3 6695947.4, 330112.2 6695950.3, 330090.3 6695966.5, 330082.4 6695971.2, 330076.2 6695973.5, 330070.3 6695977.6, 330066.3 6695982.8, 330063.3 6695988.3, 330056.2 6696010.8, 330049.9 6696020.6, 330043.2 6696026.4, 330027.8 6696041.8, 330017 6696053.5, 330006 6696067.9, 329995.8 6696075.9, 329990.6 6696080.9, 329979.9 6696098.1, 329971.2 6696107.6, 329953.4 6696133.5, 329931.6 6696162.7, 329923.2 6696175.8, 329917.3 6696191.8, 329912.8 6696200.4, 329903.7 6696214.9, 329897.8 6696227.1, 329891.4 6696242.4, 329874.3 6696278.5, 329871.1 6696286.6, 329861.8 6696315, 329847.1 6696350.3, 329832 6696377.1, 329823.7 6696396.9, 329814.6 6696415.9, 329790.1 6696455.4, 329781.4 6696471.9, 329772.7 6696484.5, 329764.3 6696498.5, 329762.7 6696501.6, 329756 6696514.5, 329734.7 6696550.1, 329711.9 6696579.4, 329693.5 6696606, 329658.1 6696660.9, 329636 6696693.7, 329564.6 6696810.1, 329551.1 6696828.3, 329548.2 6696833.4, 329546.2 6696836.8, 329527 6696852.9, 329505 6696886.8, 329487.6 6696909.3, 329469.1 6696935.7, 329452.4 6696957.2, 329443.2 6696968.6, 329430.6 6696983.4, 329398.6 6697023.3, 329362.5 6697070.8, 329332.4 6697101.1, 329261.1 6697165.4, 329232.9 6697197.1, 329208.5 6697222.5, 329099.9 6697314.6, 329064.5 6697348.9, 329060.4 6697354.3, 329034.1 6697378.1, 329000.4 6697410.1, 328974.9 6697431.8, 328966.5 6697438, 328949.9 6697447.3, 328945 6697451.9, 328938.6 6697455.8, 328926.6 6697466.5, 328886.7 6697502.1, 328885.7 6697503, 328796.9 6697574, 328743.5 6697612.5, 328727.2 6697622.7, 328713.4 6697636.7, 328652.9 6697679.4, 328642.6 6697685, 328636 6697689.9, 328629.4 6697693.5, 328625.4 6697697.4, 328621.6 6697699.9, 328608.9 6697707.4, 328600.7 6697713.1, 328581 6697724.3, 328547.7 6697742.1, 328537.5 6697747.1, 328528 6697750.9, 328519.7 6697756.2, 328506.3 6697767.8, 328501.3 6697769.4, 328490.7 6697774.9, 328483.7 6697779.4, 328482.3 6697780.1, 328472.7 6697785.4, 328455.9 6697791.6, 328448.3 6697796.8, 328441 6697803.7, 328434.1 6697808.8, 328404.7 6697823.1, 328398.4 6697827.3, 328390.1 6697839.8, 328387.3 6697848, 328378.3 6697865.3, 328372.1 6697872.1, 328362.6 6697877.2, 328342.7 6697894.1, 328327.8 6697906.7, 328327.6 6697908.9, 328323.8 6697913.7, 328314.4 6697920.9, 328290.8 6697938.2, 328268.9 6697963.5, 328218.5 6698022, 328213.5 6698027.8, 328186.7 6698117.6, 328185 6698123.1, 328186 6698129.9, 328185.8 6698135.5, 328246.6 6698335.5, 328307.3 6698535.5, 328398.5 6698799.3, 328820.2 6698685.2, 329045 6698598.7, 329242 6698495, 329439.1 6698384.4, 329902 6698106.9, 330527.7 6697634.3, 330746.2 6697450.4, 330964.5 6697266.6, 331033 6697154.6, 331101.7 6697042.6, 331170.2 6696930.6, 331210.4 6696864.9, 331266.6 6696788.8, 331419.2 6696581.8, 331528.8 6696432.9, 331727 6696193.2, 331747.6 6696168.4, 331846.9 6696048.3, 331863.3 6696028.4, 331876.4 6696014.8, 331978.9 6695908.8, 332032.6 6695853.2, 332056.9 6695828, 332100.3 6695786.2, 332114.8 6695768.2, 332136 6695739.4, 332163.3 6695639.5, 332189.4 6695544.1, 332267.9 6695474.2, 332395.9 6695359.8, 332523.8 6695245.3, 332542.6 6695228.5, 332651.8 6695130.8, 332691.1 6695095.5, 332879 6694928.1, 332940.3 6694875, 333098.8 6694737.8, 333203.5 6694651.2, 333306.4 6694573.1, 333336.6 6694550.6, 333369.6 6694537, 333389.7 6694530.9, 333426.6 6694526.7, 333457.9 6694526.8, 333462.8 6694527.8, 333504.4 6694536.1, 333566.4 6694560.3, 333611.5 6694574.2, 333640.5 6694577.7, 333670.6 6694573.8, 333706.9 6694572.6, 333768.1 6694444.3, 333829.4 6694316.1, 333890.6 6694187.9, 333845.4 6693921.1, 334133.8 6694031.7, 334162.7 6694042.7, 334217.4 6694019.3, 334239.1 6694010, 334288.9 6693988.6, 334312.6 6693978.4, 334331.5 6693970.4, 334343.9 6693965, 334393.4 6693943.8, 334409.2 6693936.9, 334417.4 6693932.3, 334445.2 6693915.4, 334478.9 6693895.9, 334509.3 6693881.6, 334540.8 6693870.8, 334548.5 6693868.7, 334571.5 6693858.6, 334581.7 6693853.1, 334592.3 6693849.9, 334612.3 6693842.3, 334622.2 6693837.6, 334637.1 6693827.7, 334652.8 6693819.5, 334676.2 6693810.3, 334688.2 6693804.9, 334697.4 6693799.4, 334722.5 6693788.4, 334735.8 6693782.3, 334779.3 6693766.4, 334792.1 6693763.3, 334814.6 6693761.2, 334820.6 6693759.8, 334836.7 6693752.4, 334847.1 6693749.9, 334859.7 6693748.6, 334871.7 6693748.6, 334885.6 6693750.1, 334897.1 6693752.7, 334912.3 6693759.2, 334920.4 6693763.7, 334935.4 6693768.2, 334943.7 6693771.5, 334954.7 6693775.1, 334983.1 6693815.5, 334996.5 6693818.5, 335010.4 6693816.1, 335022.4 6693805.8, 335038.3 6693787, 335052.9 6693772, 335064.9 6693761.1, 335069.9 6693749.6, 335068.2 6693736.4, 335062.3 6693715, 335051.6 6693699.9, 335039.1 6693687.2, 335029.1 6693672.4, 335025.9 6693661.1, 335033.6 6693644, 335045.6 6693626.7, 335057.1 6693605.1, 335068.6 6693589.5, 335085.3 6693573.7, 335099.6 6693561.9, 335112.5 6693560.3, 335125.4 6693565.6, 335145.1 6693587.3, 335153.3 6693602.1, 335156.3 6693601.4, 335165.3 6693600.9, 335183.7 6693599.4, 335190.4 6693598, 335196.9 6693593.6, 335211.1 6693571.7, 335215.9 6693563.1, 335219.8 6693554.2, 335225.3 6693546.1, 335236.2 6693536.7, 335237.8 6693529.5, 335240.3 6693522.3, 335245.8 6693514.3, 335249.7 6693504.4, 335264.6 6693481.8, 335266.2 6693477.9, 335269.6 6693463.9, 335269.6 6693456.9, 335278.3 6693418.6, 335280.6 6693412.1, 335287 6693403.8, 335287.1 6693391.1, 335289.9 6693382.5, 335298.8 6693369.6, 335314.1 6693352.2, 335322 6693333.5, 335325.8 6693325.9, 335328.8 6693317.5, 335337.6 6693302.6, 335342.3 6693296.1, 335355.7 6693283.5, 335377.9 6693258.2, 335403.3 6693231.2, 335414.5 6693216.9, 335421.4 6693209.7, 335428 6693204.3, 335449.3 6693182.7, 335466.4 6693170.3, 335474.8 6693165, 335487.8 6693158.9, 335513.2 6693144.8, 335518.8 6693140.7, 335524.3 6693135.1, 335538.2 6693123.8, 335547 6693115.3, 335569.6 6693097.7, 335575 6693091.8, 335585.1 6693078.6, 335636.8 6693026.2, 335644.6 6693019.1, 335651 6693011.8, 335657.1 6693006.1, 335670.3 6692996.4, 335679.6 6692991.7, 335691.7 6692982.5, 335727.2 6692964.8, 335750.5 6692951.6, 335769 6692945.7, 335776.2 6692942.6, 335813.3 6692920.2, 335821.9 6692916.7, 335831.4 6692914.4, 335854.1 6692909.2, 335875.5 6692906.7, 335890.3 6692903.1, 335912.2 6692902.5, 335930.8 6692900.7, 336004.4 6692894.9, 336014.8 6692893, 336040.1 6692886.6, 336051.3 6692877.7, 336060.3 6692873.3, 336067.7 6692868.7, 336091.7 6692849.1, 336107.1 6692832.3, 336114.7 6692826, 336130.1 6692810.3, 336140.2 6692802, 336143.7 6692799.1, 336166.1 6692775.5, 336180.5 6692756.4, 336186.1 6692750.3, 336197.2 6692741, 336208.2 6692730.7, 336229.7 6692707, 336240.2 6692690.7, 336249.3 6692681.7, 336256.4 6692673.4, 336260.8 6692663.8, 336266.3 6692656.2, 336274.1 6692649.1, 336282.9 6692643.3, 336288.9 6692635.6, 336301 6692624.4, 336305.5 6692617.9, 336313 6692612.6, 336314.3 6692612.9, 336316.1 6692605.6, 336320.7 6692597.3, 336328.7 6692589.3, 336337.9 6692574.5, 336340.9 6692570, 336345.3 6692558.1, 336350.6 6692552.1, 336357.7 6692547.1, 336398.5 6692483.5, 336418.9 6692450.6, 336433.8 6692427.8, 336444 6692408.6, 336451.1 6692398.8, 336457.4 6692380.4, 336473.1 6692365.4, 336509.6 6692293.4, 336516.9 6692279.7, 336531.8 6692257, 336555 6692228.1, 336563.4 6692220.4, 336600.2 6692186.6, 336647 6692155.3, 336656.1 6692149.9, 336674 6692139.2, 336702.3 6692124, 336733.9 6692111.6, 336752.1 6692105.4, 336763.6 6692101.1, 336795.2 6692087.3, 336820.8 6692081.4, 336846.2 6692077, 336971 6692039.7, 336987.2 6692034.8, 337052 6692017.9, 337083.9 6692011.7, 337114.8 6692007.2, 337137.1 6691996.5, 337150.9 6691990.8, 337161.1 6691986.7, 337179.6 6691982.7, 337216.6 6691980.4, 337261.6 6691969, 337273.3 6691966.2, 337298.8 6691958.8, 337329.8 6691941.8, 337342.9 6691932.7, 337354.7 6691923.3, 337370.4 6691915.1, 337394.6 6691904.7, 337427.2 6691890.9, 337434.8 6691887.1, 337443.1 6691882.7, 337446.9 6691880.7, 337451.4 6691876.6, 337460.9 6691867.9, 337478.8 6691859.9, 337496.8 6691854.9, 337587.6 6691832, 337606 6691821.2, 337630 6691808.9, 337650.2 6691803.3, 337665 6691800.9, 337676.5 6691796.3, 337752.7 6691761.5, 337754.6 6691781, 337753.9 6691800.4, 337746.6 6691818.5, 337739.9 6691828, 337732.8 6691841.5, 337726.5 6691848, 337723.3 6691855.8, 337723.1 6691888.2, 337737.8 6692006.5, 337740.7 6692017.4, 337746.4 6692016.4, 337751.4 6692013.3, 337769.9 6691999.4, 337782.2 6691987.9, 337789.5 6691977.3, 337802.3 6691963.6, 337815.1 6691943.3, 337829.6 6691927.8, 337836.5 6691917.2, 337846.8 6691899.2, 337885.3 6691849.3, 337937.7 6691788.6, 337968.7 6691757.5, 337979.4 6691749.2, 337981.1 6691777.3, 337988.4 6691803.4, 337985.5 6691816.8, 337985.8 6691823.6, 337987.3 6691831, 337999 6691864.1, 338005.6 6691869.9, 338010.9 6691877.7, 338010.8 6691895.3, 338008.7 6691913.1, 338004.9 6691932.6, 337999 6691954, 337997.6 6691963.3, 337998 6691971.9, 337992.3 6691989.8, 337991.9 6691996.6, 337996 6692006.7, 338011.8 6692029.3, 338071 6691955.4, 338095.3 6691920.3, 338129.8 6691890.5, 338151.5 6691869.2, 338155.9 6691864.8, 338178.6 6691835.6, 338205.4 6691787.8, 338235.2 6691739, 338246.3 6691726.3, 338302.1 6691689.7, 338349.6 6691665.7, 338416.7 6691631.4, 338419.3 6691629.6, 338508.8 6691694.9, 338535.7 6691661, 338568 6691628.2, 338613 6691588.4, 338620.7 6691598.6, 338623 6691601.6, 338623.4 6691602.2, 338625.1 6691604.1, 338666.6 6691654.5, 338760 6691772.4, 338877.3 6691676.4, 338939.2 6691754.3, 339059.3 6691665.8, 339066.1 6691674.3, 339184.3 6691582.8, 339207.8 6691611, 339199.3 6691631, 339189.4 6691664.7, 339177.3 6691707.3, 339177.3 6691719.8, 339189 6691759.5, 339193.4 6691778.7, 339193.6 6691787.3, 339185.9 6691809.3, 339182.9 6691817.9, 339165.6 6691870.1, 339158 6691886.3, 339301.4 6692035.2, 339332.2 6692067.2, 339406.8 6692144.7, 339454.8 6692194.6, 339511.6 6692253.1, 339523.9 6692265.4, 339596.7 6692339.4, 339612.5 6692356.5, 339688.1 6692433.9, 339750.1 6692496.6, 339803.1 6692549.8, 339827.3 6692574.1, 339855.2 6692607.3, 339859.8 6692608.4, 339866 6692607.8, 339870.7 6692606.4, 339907.6 6692589.6, 339931.2 6692580.9, 339934.9 6692580.7, 339942.6 6692580.7, 339948.1 6692581, 339954.9 6692581.6, 339987.2 6692588.8, 340002.1 6692592.1, 340059 6692604.1, 340080.5 6692611.5, 340110.7 6692625.2, 340128.8 6692631.9, 340138.1 6692634.7, 340147.4 6692636.5, 340155.2 6692637.1, 340162.1 6692638.7, 340180.7 6692644.6, 340193.5 6692649.6, 340209.1 6692657.1, 340215.9 6692662.7, 340227.9 6692670.1, 340236.1 6692673.7, 340284.8 6692691.7, 340296.2 6692698.3, 340322.2 6692716, 340329.1 6692720.1, 340337.7 6692723.8, 340383.6 6692726.1, 340385.7 6692720.4, 340387.9 6692717.3, 340397.9 6692708.2, 340408.5 6692704.9, 340415.3 6692702.2, 340420.7 6692699.1, 340428.6 6692698.3, 340432.5 6692706, 340437.8 6692710.9, 340442.9 6692713.1, 340452 6692710.9, 340458 6692706.6, 340464.3 6692700.1, 340477.3 6692692.1, 340508.8 6692676.5, 340553.3 6692656.2, 340570.3 6692650.2, 340593.3 6692648.2, 340607.4 6692645.7, 340617 6692642.5, 340638.1 6692633, 340643.3 6692630.6, 340673.7 6692619.8, 340686.9 6692617.1, 340692.9 6692616.7, 340701.9 6692617.2, 340721.6 6692615.8, 340749.9 6692612.7, 340757.3 6692610.4, 340759.6 6692610.2, 340818.9 6692654.3, 340842.6 6692669.5, 340865.6 6692685.4, 340881.7 6692694.4, 340894.8 6692700.7, 340904.6 6692706.4, 340919.4 6692718.1, 340940.2 6692741.4, 340960.5 6692764.8, 340983.1 6692793.9, 341000.2 6692813.1, 341004.1 6692818, 341009.6 6692827.2, 341039.5 6692828.1, 341044 6692829.3, 341047.9 6692833.6, 341053.1 6692839, 341083.6 6692869.9, 341093.4 6692878.6, 341102.2 6692883.2, 341109.2 6692887.3, 341115.1 6692887.9, 341123.8 6692886.9, 341146.4 6692883.9, 341166.6 6692880.4, 341235.8 6692865.1, 341239.3 6692862.9, 341241 6692858.6, 341243.6 6692854.9, 341273.5 6692824.6, 341327.9 6692760.1, 341333.4 6692754.4, 341340.4 6692752.6, 341345.1 6692751.3, 341369 6692729, 341372.8 6692726.7, 341375.9 6692727.7, 341383.7 6692735.1, 341386.6 6692735.4, 341389.3 6692734.5, 341395.9 6692729.4, 341404.5 6692729.1, 341418.7 6692729.6, 341425 6692733.6, 341427.7 6692738, 341435 6692757.7, 341436.1 6692759.9, 341457.8 6692788.1, 341470.4 6692816.9, 341505 6692818.2, 341570.2 6692822.1, 341611.5 6692825.1, 341635.2 6692825.1, 341634.6 6692833.8, 341632.4 6692840, 341618.6 6692868.9, 341616.3 6692875.7, 341615 6692882.1, 341614.5 6692893.8, 341617.4 6692919.5, 341620.7 6692928.4, 341633.8 6692953.3, 341634.3 6692959.6, 341630.7 6692964.9, 341610.7 6692979, 341609.2 6692989.2, 341614.1 6692990.2, 341618.4 6692993.3, 341622.1 6692998.2, 341625.6 6693004.5, 341629.7 6693014.4, 341636.2 6693032.8, 341642.1 6693051.5, 341645.6 6693068.9, 341647.1 6693084, 341648.5 6693101.8, 341650 6693107.7, 341667.9 6693136.5, 341679.4 6693150.4, 341682.7 6693157.5, 341686.7 6693163.5, 341695.2 6693170, 341710.9 6693176.2, 341725.3 6693180.7, 341732.5 6693185, 341753.1 6693203.4, 341764.1 6693210.5, 341786.4 6693228.5, 341805.9 6693244.2, 341809.3 6693253.2, 341809.5 6693261.6, 341808.5 6693267.3, 341808.2 6693273.5, 341811.4 6693286.3, 341814.3 6693304.1, 341817.5 6693307, 341822.6 6693309.1, 341828 6693309, 341833.2 6693307, 341838.7 6693306.1, 341844.3 6693310, 341852.8 6693317.7, 341879.6 6693345.3, 341885.8 6693350.5, 341899.8 6693359.2, 341907.4 6693367.3, 341913.6 6693378.2, 341924.2 6693381, 341928.9 6693382.3, 341949.5 6693403.9, 341949.3 6693425.3, 341952.3 6693430.9, 341957.8 6693431.5, 341965 6693448.9, 341963.6 6693482.6, 341992.3 6693509.7, 342001.5 6693522.8, 342007.8 6693534.3, 342006.3 6693573, 342019.6 6693596.9, 342023.4 6693615.3, 342030.1 6693648.5, 342073.1 6693736.7, 342078.4 6693739.9, 342083.6 6693743, 342102.9 6693775.6, 342133.6 6693824, 342143.5 6693846.5, 342137.1 6693865.4, 342135 6693869.5, 342137.4 6693869.9, 342145.4 6693873.1, 342144.5 6693878.4, 342143.7 6693883.1, 342137 6693901.1, 342133.1 6693912.8, 342130.2 6693930.8, 342134.2 6693947.5, 342135.6 6693960.3, 342128.3 6693989.9, 342133.1 6694027.2, 342136.2 6694043.8, 342137.9 6694059.4, 342137.2 6694062.9, 342133.7 6694078.5, 342130.5 6694089.6, 342128.6 6694096.2, 342127.8 6694108.5, 342130.8 6694123.5, 342133.2 6694145.4, 342133.8 6694164.1, 342132.2 6694179.4, 342122.9 6694187.8, 342117.6 6694198.1, 342112.1 6694217.3, 342114.3 6694231.6, 342131.7 6694265, 342148 6694283.3, 342165.8 6694309.3, 342182.4 6694347.7, 342192.1 6694361.7, 342202.3 6694378.4, 342207.7 6694390.2, 342205.3 6694400.1, 342214.5 6694418.3, 342220.1 6694430.8, 342214.5 6694435.5, 342211.8 6694439.8, 342222.9 6694457.5, 342237 6694484.9, 342260.1 6694493.9, 342283 6694508.5, 342291.2 6694513.8, 342304.4 6694534.6, 342317 6694561.5, 342330 6694574.4, 342342.9 6694581.9, 342350.5 6694594.5, 342360.5 6694607.4, 342405.8 6694626.4, 342415.1 6694631.2, 342419.2 6694632.4, 342434.5 6694636.5, 342456 6694639.1, 342511.4 6694641.1, 342523.7 6694645.4, 342548.1 6694667, 342563.5 6694677.4, 342567.6 6694678.1, 342611.8 6694773.2, 342625.4 6694785.9, 342629.4 6694788.5, 342648.4 6694797, 342665 6694801.6, 342676.8 6694806.5, 342686.5 6694810.2, 342692 6694813.2, 342705.1 6694816.7, 342713.3 6694810.7, 342718.9 6694813.1, 342727.1 6694820.4, 342732.9 6694828.5, 342752.8 6694853.1, 342767.4 6694867.1, 342777.3 6694883.5, 342780 6694888, 342798 6694958, 342803.2 6694984.4, 342836.5 6694971.9, 342883.7 6695046.5, 342883.9 6695064.3, 342856.9 6695074.9, 342888.8 6695148.4, 342904.1 6695155.7, 342933.9 6695194.2, 342951.4 6695248.8, 342964 6695283.2, 342989.1 6695356.4, 343017.1 6695349, 343033.2 6695332.4, 343030.3 6695370.7, 343024.8 6695385.7, 343029.4 6695411.9, 343072.1 6695446.5, 343060.4 6695462.5, 343127.3 6695543.2, 343117.9 6695555.8, 343148.4 6695659.7, 343149.1 6695664.1, 343155.6 6695663.5, 343187 6695770.5, 343201.3 6695819.7, 343215.2 6695866.6, 343224.6 6695898.5, 343244.7 6695966.7, 343259.7 6696018, 343289.4 6696118.5, 343307.8 6696179.7, 343318.1 6696213.6, 343362.6 6696357.3, 343381.9 6696415.9, 343383.9 6696423.3, 343403.8 6696502.2, 343419.3 6696564.1, 343422.8 6696577.8, 343434.4 6696622.5, 343439.8 6696643.7, 343441.9 6696651.4, 343448 6696675.1, 343482.2 6696771.4, 343508.9 6696870.2, 343551 6697016.6, 343528.4 6697048.8, 343504.7 6697082.2, 343478.2 6697110.7, 343478 6697154.4, 343464.6 6697205.7, 343455.5 6697240.9, 343440.4 6697273.3, 343443.3 6697321.3, 343451 6697402.5, 343458.6 6697480.4, 343465.3 6697510.5, 343466.1 6697517.9, 343464 6697532.9, 343458.9 6697562.7, 343454.6 6697595.4, 343454.2 6697603, 343455.1 6697615.6, 343459.9 6697639.2, 343487.7 6697655.9, 343575.5 6697820.7, 343586.7 6697841.6, 343606.5 6697878.7, 343689 6698033.7, 343709.7 6698032.1, 343724.5 6698028.5, 343746.1 6698019.4, 343794.6 6697999.1, 343813 6697990.6, 343827.8 6697981.4, 343829.2 6697971.5, 343832.6 6697962.9, 343836.8 6697955.4, 343847.5 6697947.1, 343899 6697910.9, 343908.6 6697923.8, 343962.1 6697885.8, 343990.9 6697865.3, 344005.7 6697854.8, 344060.4 6697815.9, 344077.1 6697803.9, 344122.2 6697771.9, 344135.7 6697762.3, 344157.3 6697746.9, 344243.4 6697685.7, 344260 6697673.1, 344285.1 6697656.3, 344298.5 6697650.2, 344314 6697647.2, 344321.7 6697646.5, 344558.3 6697624.5, 344568.5 6697624.7, 344577.8 6697632.7, 344589.8 6697642.2, 344642.8 6697677.9, 344712 6697719, 344730.3 6697729.4, 344769.4 6697751.4, 344796.7 6697766.5, 344824 6697780.6, 344842.6 6697791.3, 344862.7 6697802.9, 344936.7 6697844.7, 344946.5 6697849.7, 344959.8 6697856.5, 344982.3 6697868.4, 345011.8 6697881.6, 345025.8 6697886.9, 345042.3 6697891.5, 345086 6697905.6, 345107.7 6697910.8, 345127.5 6697914.5, 345154.8 6697916.3, 345159.7 6697916.1, 345209.3 6697912.6, 345476.1 6697892.3, 345533.2 6697886, 345554 6697881.3, 345576 6697923.4, 345589.2 6697951.5, 345603.2 6697973.2, 345618.5 6697989.2, 345651.3 6698007, 345666.6 6698020.5, 345679.8 6698033.9, 345686.8 6698044.6, 345703 6698059.9, 345720.1 6698081.3, 345736 6698113.4, 345762 6698140.9, 345774.6 6698134.5, 345782.9 6698131.6, 345789.9 6698127.1, 345801.4 6698115.5, 345806.9 6698111.1, 345828.8 6698113.9, 345832.3 6698112.9, 345849.7 6698110.3, 345864.1 6698110.2, 345874.2 6698105.9, 345878 6698107.8, 345881.9 6698105.4, 345887.9 6698100.2, 345898.9 6698087.6, 345906.6 6698082, 345917.1 6698083.6, 345933 6698094.8, 345949.5 6698120, 345958.4 6698117.2, 345962.5 6698115.9, 345982.8 6698153.6, 345991.6 6698167.3, 346009.7 6698195.9, 346024.9 6698214, 346042.9 6698234, 346058 6698253.8, 346073.9 6698274.6, 346092.3 6698292.2, 346116.8 6698300.9, 346123.2 6698303.2, 346138.3 6698316.6, 346155.3 6698330, 346173.2 6698339.9, 346202 6698358.7, 346211.4 6698371.2, 346223 6698389.1, 346234.9 6698401.7, 346240.4 6698405.4, 346260.6 6698418.2, 346270.3 6698428.5, 346279.4 6698443.6, 346287.2 6698456.3, 346298.4 6698472.2, 346300.9 6698477.3, 346306.3 6698488.2, 346315.7 6698504.9, 346316.2 6698515.4, 346307.1 6698525.3, 346303 6698535.6, 346308 6698543.5, 346343.7 6698559, 346350.7 6698571.3, 346360.4 6698585.1, 346372 6698595.4, 346382.2 6698607.5, 346394.8 6698619.3, 346423.7 6698643.3, 346447 6698659.7, 346461.8 6698672.3, 346479.2 6698689.6, 346493.6 6698719, 346518.6 6698744, 346544.9 6698781.9, 346573.9 6698825.8, 346585.9 6698842, 346599.3 6698857.2, 346614.6 6698869.2, 346631.2 6698885.9, 346650.2 6698907.6, 346667.9 6698924.6, 346671.8 6698927, 346687.4 6698936.6, 346751.7 6698955.1, 346768.4 6698959.5, 346780.5 6698962.5, 346813 6698986.7, 346820.3 6698999.7, 346833.3 6699012.9, 346843.5 6699019.8, 346858.9 6699029, 346870.6 6699040.1, 346882.5 6699052.9, 346892 6699068.3, 346901.7 6699082.2, 346908.8 6699095.1, 346912.1 6699106.4, 346913.3 6699110.5, 346921.2 6699120.6, 346931.4 6699131.8, 346937.7 6699138.1, 346942.9 6699141.3, 346963.6 6699153.3, 346973.2 6699158.9, 346976.5 6699161.7, 346981 6699165.5, 346991.6 6699188.2, 346994.1 6699199.2, 346997.4 6699208, 347011 6699225.3, 347018.7 6699231.3, 347022.1 6699232.3, 347028.3 6699234.2, 347056.5 6699232.9, 347071.8 6699233.2, 347082.1 6699237.7, 347083.6 6699239.1, 347101.1 6699254.6, 347114.1 6699264.9, 347129 6699271.9, 347142.6 6699277, 347159.1 6699279.4, 347179.2 6699280.7, 347219.6 6699317.5, 347263.6 6699360.6, 347330 6699445.9, 347351.2 6699495.3, 347421.2 6699461.7, 347440.3 6699466.2, 347444.6 6699466, 347511.4 6699426.1, 347552 6699413.6, 347569.4 6699401.3, 347572.2 6699401, 347571.9 6699397.5, 347571.2 6699382, 347574.7 6699365, 347582.3 6699339.8, 347587.8 6699315.5, 347675.1 6699156.1, 347685.6 6699164.4, 347732.7 6699201.6, 347823.6 6699047.5, 347850.4 6699000.5, 347857.3 6699012.9, 347855 6699042.8, 347855.5 6699066.1, 347849.8 6699082, 347853 6699105.9, 347898.3 6699264.9, 347916.4 6699336.7, 347917.3 6699357.5, 347944.7 6699387.1, 347952.9 6699396.9, 347973.5 6699421.8, 347987.4 6699438.6, 348007.1 6699462.8, 348135 6699622.9, 348155.1 6699648.5, 348159.7 6699654.4, 348231.4 6699744.2, 348292.2 6699817.8, 348311.8 6699842.9, 348352.3 6699894.4, 348434.1 6699997, 348460.2 6700026.1, 348476.8 6700040.9, 348482.4 6700042.5, 348488.5 6700033.8, 348553.6 6699992.6, 348578.5 6699976.9, 348632.6 6699942.6, 348656.2 6699930.2, 348657.6 6699927, 348672.3 6699918.9, 348744.3 6699877.2, 348747.8 6699873.8, 348759 6699865.2, 348779 6699857.9, 348802.5 6699856.5, 348826.7 6699859.4, 348832.4 6699860.9, 348838.8 6699862.5, 348847.9 6699866.9, 348883.9 6699909.1, 348913.8 6699960.9, 348922.5 6699972.9, 348953.3 6700015.5, 348976.2 6700010.6, 349051 6700011.4, 349097.5 6700012.1, 349171.8 6700015.8, 349242.7 6700032.7, 349259.1 6700051.8, 349338.1 6700041.8, 349330.6 6700113.2, 349328 6700146.5, 349413 6700231.3, 349421.4 6700237.9, 349454.5 6700198, 349482.5 6700168.2, 349491.7 6700159.3, 349507.3 6700146.5, 349512.6 6700142.2, 349546.9 6700119, 349580.2 6700098.7, 349611.4 6700079.7, 349677.5 6700039.8, 349699.3 6700025, 349854.5 6699922.2, 349877.2 6699907.1, 349897.6 6699893.6, 349937.3 6699867.3, 349991.5 6699854.6, 350009.4 6699846.7, 350064.3 6699817.8, 350081.5 6699808.8, 350103.2 6699794.7, 350125.3 6699776.8, 350164.1 6699744.8, 350205.4 6699709.2, 350230.6 6699685.4, 350283.6 6699635.1, 350294.3 6699624.5, 350343.2 6699576.1, 350370.6 6699549.6, 350389.5 6699533.3, 350414 6699514.2, 350451.7 6699487.8, 350468.7 6699476.7, 350495.1 6699459.6, 350523 6699441.7, 350553.4 6699422, 350600.3 6699391.5, 350717.9 6699303.3, 350751.8 6699276.2, 350783.8 6699249.8, 350810.2 6699226.2, 350837.3 6699200.9, 350933.6 6699111.3, 350968.8 6699082.8, 350975.4 6699076.6, 350988.7 6699066.1, 351040 6699028.1, 351060.5 6699013, 351066.3 6699008.6, 351101.6 6698983.5, 351112.6 6698975.5, 351139.5 6698956, 351158.2 6698941.1, 351173.7 6698926.6, 351187 6698911.3, 351236 6698857.5, 351254.7 6698840.4, 351266.2 6698831.4, 351275.1 6698825.7, 351309.8 6698800.7, 351360.2 6698765.9, 351453 6698701.2, 351490.2 6698675.2, 351509.9 6698662.3, 351542.5 6698637.9, 351602.1 6698590.3, 351650.1 6698522.6, 351656.9 6698511.4, 351678.9 6698475.8, 351769.6 6698292.6, 351779.7 6698269.1, 351865.7 6698134.9, 351873.8 6698138.5, 351891.2 6698091.9, 351912.2 6698033.6, 351923.7 6698000.9, 351932.9 6697977.3, 351936 6697970.4, 351948.8 6697941.2, 351960.6 6697918.2, 352042.9 6697775, 352102.9 6697670.1, 352128.2 6697625.8, 352150.3 6697583.9, 352167.1 6697544.8, 352173.3 6697527.6, 352182.2 6697502.5, 352189.8 6697468.5, 352195.3 6697430.9, 352206.1 6697339.4, 352222.7 6697199.7, 352227 6697169.3, 352228.1 6697161.2, 352233 6697127.8, 352241 6697100, 352243.6 6697091.2, 352246.6 6697080.9, 352263 6697042.3, 352268.4 6697034.2, 352294.4 6696999.9, 352309.2 6696982.9, 352355 6696934.5, 352357.5 6696931.9, 352416.2 6696870.4, 352509.7 6696770.8, 352540.8 6696737.6, 352551.4 6696724.4, 352567.6 6696704.4, 352589.4 6696672.8, 352594.4 6696661.4, 352598.1 6696652.7, 352608.2 6696633.5, 352658.8 6696540.7, 352659.7 6696539.2, 352685.4 6696492, 352727.9 6696413.4, 352742.5 6696384.1, 352758.6 6696355.3, 352769.8 6696326.5, 352777.9 6696310.8, 352780.4 6696305.9, 352800.6 6696267.2, 352835.9 6696198.8, 352935.5 6696005.7, 352950.1 6696015.6, 352957.5 6696021.1, 352967.2 6696027.2, 353050.9 6696073.8, 353068.8 6696078.2, 353097.8 6696086.8, 353116.1 6696094.8, 353179 6696122.9, 353202.5 6696130.5, 353225.7 6696133.3, 353256.1 6696131.9, 353294.4 6696122.7, 353321.1 6696114.2, 353368.3 6696097.3, 353408 6696078, 353415.3 6696068.9, 353417.3 6696065.5, 353420.8 6696061.7, 353425.2 6696057, 353435.3 6696046.7, 353446.4 6696035.7, 353452.4 6696030.8, 353461.3 6696023.1, 353469.1 6696017.3, 353473.6 6696013.6, 353480 6696007.4, 353487.4 6696000.2, 353493.7 6695994.4, 353499.7 6695988.5, 353504.5 6695982.9, 353512.4 6695974.9, 353517.4 6695969.1, 353525.3 6695964.7, 353534.3 6695958.8, 353543.7 6695953.8, 353552.1 6695948.8, 353560.9 6695944.5, 353580.6 6695950.7, 353580.6 6695934.6, 353582.1 6695916.8, 353583.8 6695892.9, 353597.5 6695898.3, 353606.6 6695902.8, 353616.6 6695906.2, 353632.2 6695908.1, 353633.3 6695911.6, 353635.7 6695928.6, 353635.2 6695934.4, 353628.8 6695971.7, 353620.1 6696064.6, 353609.1 6696170, 353597.3 6696205.8, 353590.1 6696233.6, 353564.9 6696313, 353542 6696400.2, 353537.8 6696414.1, 353534.1 6696426.5, 353530.3 6696451.2, 353526.7 6696460.7, 353524.3 6696480.2, 353520.8 6696520.7, 353516.8 6696606.3, 353516.8 6696608.6, 353523.2 6696685.6, 353526.3 6696723, 353526.4 6696734.6, 353526.7 6696788.7, 353523.1 6696843.3, 353520.2 6696891.3, 353516.6 6696945, 353509.2 6697048.3, 353503.3 6697107.1, 353501.9 6697119.4, 353497.7 6697143.8, 353495.1 6697158.9, 353491.2 6697182.1, 353489.7 6697187, 353489.5 6697187.6, 353484.3 6697204.8, 353479 6697225.8, 353475.9 6697252.2, 353475.2 6697281.7, 353475.7 6697312.8, 353477.9 6697338.7, 353480.3 6697357, 353492.8 6697451.5, 353494.8 6697465.1, 353498.1 6697481.6, 353500.2 6697491, 353501.9 6697497.1, 353503.2 6697502.2, 353525.6 6697536.9, 353548.5 6697575.1, 353562.1 6697601.3, 353565.1 6697609.6, 353569.4 6697621.1, 353577.2 6697646.4, 353584.8 6697675.6, 353592 6697707.3, 353601.2 6697759, 353604.7 6697787.9, 353606.1 6697803.5, 353607.9 6697819, 353610 6697880.5, 353612.9 6697894.4, 353615.2 6697900.9, 353622.9 6697914.9, 353631.3 6697933.7, 353640.2 6697948.1, 353645.2 6697954.9, 353654.9 6697973.8, 353657.7 6697979.6, 353662.9 6697997.3, 353668.1 6698020.5, 353671.9 6698042.6, 353673.9 6698058.7, 353674.9 6698073.5, 353670.6 6698093.9, 353667.5 6698105, 353664.3 6698123.6, 353663.7 6698141.9, 353664.9 6698156.5, 353666.4 6698164.4, 353667.4 6698169.2, 353670.3 6698174.6, 353691 6698209.7, 353697.2 6698218.4, 353733.1 6698268.6, 353736.4 6698280.6, 353750.1 6698305.6, 353759 6698326, 353761.3 6698336.1, 353762.5 6698352.8, 353762.1 6698356.1, 353761.5 6698362.4, 353758.8 6698371.6, 353755.6 6698380.9, 353751.7 6698388.5, 353733.6 6698411.2, 353700.3 6698445.7, 353694 6698455.7, 353688.9 6698470.2, 353686.6 6698480.2, 353684.4 6698511.5, 353682.2 6698592.6, 353681 6698616.8, 353679.2 6698632.2, 353675.9 6698655.4, 353672.4 6698672.8, 353671.4 6698683.3, 353668.8 6698708.9, 353668.8 6698723, 353671.5 6698736.9, 353676.9 6698751, 353692.7 6698783.4, 353718.3 6698837.7, 353732.9 6698858.3, 353761.2 6698895.9, 353825.1 6698969.9, 353848.2 6698996.1, 353905.4 6699062, 353949.1 6699111.8, 353963.5 6699126.8, 354078.8 6699245.7, 354100.4 6699266.2, 354102.7 6699270.6, 354137.5 6699301.2, 354161.6 6699321, 354173.8 6699334.8, 354180.5 6699345.2, 354189.7 6699362.2, 354195.5 6699373.6, 354203.1 6699392.9, 354221.1 6699450.9, 354238 6699492.6, 354241.7 6699501.8, 354244.6 6699509.4, 354248.2 6699518.1, 354255.8 6699540.7, 354264.9 6699563.4, 354278.2 6699598, 354285.6 6699620, 354288.4 6699637.6, 354288.7 6699647.4, 354288 6699656.8, 354286.3 6699666.4, 354282.9 6699676, 354278.5 6699685.1, 354272.7 6699694.2, 354254.9 6699714.8, 354252.9 6699717.3, 354243.3 6699728.8, 354233.1 6699742.5, 354224.9 6699758.4, 354216.3 6699778.5, 354192.5 6699784.8, 354152.4 6699796.2, 354125.8 6699805.4, 354108.2 6699815.2, 354097.7 6699828.6, 354095.5 6699843.2, 354101.3 6699856, 354098.9 6699872.2, 354085.9 6699892.1, 354072.3 6699910.2, 354073.9 6699920, 354089.1 6699930, 354092.7 6699943.7, 354091.7 6699958.6, 354097.5 6699969.8, 354105.7 6699977.5, 354103.3 6700013.4, 354103.1 6700032.2, 354101.8 6700050.7, 354107.7 6700067.3, 354109.3 6700087.5, 354106 6700093.2, 354104.6 6700095.7, 354091.9 6700101.3, 354092.3 6700111.6, 354096.9 6700129, 354097.3 6700140.5, 354095.8 6700153.6, 354094 6700161.8, 354090.1 6700164.5, 354086.5 6700166.8, 354079.4 6700163.7, 354064.3 6700153.6, 354049.1 6700149.7, 354037.6 6700143.8, 354035.9 6700144.3, 354027.1 6700146.8, 354022.8 6700155.9, 354020.2 6700161.1, 354011.1 6700169.5, 353996.8 6700176.8, 353985.7 6700180.7, 353972 6700174.5, 353960.8 6700172.3, 353954.7 6700179.8, 353945.7 6700188, 353933 6700183.1, 353920 6700176.3, 353908 6700181.6, 353901.6 6700193.3, 353895.1 6700201.1, 353861 6700212.8, 353848.5 6700220.8, 353849.5 6700235.2, 353856.4 6700246, 353867.9 6700248.3, 353882.7 6700252.8, 353887.3 6700261, 353875.3 6700269.8, 353859.3 6700280.4, 353842.9 6700288.7, 353839.4 6700303.6, 353840.9 6700319.3, 353859.3 6700342.7, 353851.1 6700347.4, 353844.5 6700344.4, 353829.1 6700346.7, 353810.9 6700356.8, 353783.7 6700374.5, 353746.9 6700397.6, 353712.7 6700416.3, 353689.2 6700425.2, 353682.5 6700434.1, 353679.3 6700445.7, 353672.8 6700450.8, 353667.2 6700449.5, 353665.4 6700458.8, 353628.5 6700487.2, 353627.3 6700488.7, 353626.4 6700491.5, 353628 6700496.1, 353637.7 6700499.1, 353660.1 6700502.1, 353704.6 6700511, 353732.6 6700546.1, 353746.1 6700570.2, 353746.6 6700574.7, 353749.8 6700603.9, 353750.9 6700614.5, 353754.2 6700627.8, 353764.8 6700648.3, 353772.4 6700677, 353776.8 6700697.1, 353779.7 6700720.5, 353780.1 6700746.2, 353786.2 6700770.9, 353788.5 6700784.3, 353790.2 6700793.9, 353795.9 6700823.2, 353793.8 6700837.5, 353794.2 6700857.3, 353786.7 6700898.1, 353787.9 6700904.6, 353785.9 6700914.7, 353771.3 6700988.4, 353762 6701035.1, 353754.3 6701056.5, 353739.6 6701071, 353737.8 6701093.7, 353739.1 6701119, 353736.5 6701133.1, 353734 6701146.6, 353721.9 6701186.5, 353711.3 6701219.4, 353701.8 6701257.3, 353689.6 6701293.9, 353678.2 6701313.2, 353657.1 6701345.8, 353649.6 6701359.1, 353644.2 6701368.9, 353619.8 6701421.9, 353610 6701441.3, 353623 6701447.8, 353613.4 6701463.5, 353604.2 6701489.9, 353601.6 6701511.9, 353600.5 6701521.2, 353599.3 6701557.4, 353589.6 6701586.2, 353576.7 6701603, 353568.6 6701619.5, 353553.4 6701641.5, 353547.8 6701647.2, 353541.6 6701654, 353503.8 6701685.8, 353484 6701699.7, 353459.7 6701720.3, 353458.5 6701721.6, 353445.7 6701734.6, 353436.1 6701755, 353416.2 6701781.4, 353411.3 6701787, 353357.2 6701849.8, 353311 6701906.6, 353302.4 6701917.2, 353267.5 6701951.8, 353271.4 6701972.2, 353283.9 6701999.8, 353295.3 6702017.8, 353300.4 6702025.7, 353309.7 6702050.1, 353320.3 6702107.6, 353326.4 6702130.7, 353352.2 6702153.2, 353355.8 6702156.2, 353351.9 6702163.3, 353260.4 6702300.4, 353243.9 6702325.1, 353193.1 6702400.9, 353112.3 6702515.7, 353060.4 6702589.6, 352985.8 6702695.9, 353103.9 6702846.9, 353154.8 6702906.9, 353172.3 6702916.7, 353180.9 6702930.4, 353212.7 6702969.5, 353221 6702981.4, 353222.8 6702999.7, 353240.7 6703007.9, 353325.8 6703080.8, 353380.2 6703126.8, 353457.6 6703190.3, 353536.2 6703264.7, 353619.6 6703339, 353640.8 6703357.7, 353705.9 6703410.8, 353745.9 6703446, 353809.6 6703502.1, 353860.6 6703548.1, 353874 6703560, 353926.8 6703607.2, 354006.8 6703676, 354030.4 6703696.8, 354080.1 6703742.4, 354139.5 6703791.9, 354194.3 6703840, 354253.4 6703894.8, 354324.2 6703957.3, 354337 6703968.4, 354399.9 6704022.9, 354412.7 6704035.7, 354429.6 6704050.4, 354468.2 6704083, 354512.5 6704123.8, 354550 6704159, 354577.7 6704185.9, 354598 6704211.4, 354615 6704232.1, 354622 6704238, 354631.5 6704243, 354639.3 6704245, 354648.4 6704249.9, 354661.8 6704260.2, 354691 6704286.6, 354719.7 6704309.6, 354742.8 6704328.5, 354763.4 6704347.9, 354776.3 6704361.7, 354792 6704380.2, 354805.8 6704398.6, 354815.9 6704414.7, 354821.2 6704424.2, 354825.5 6704434.6, 354828.5 6704444.2, 354832.2 6704457.3, 354838.4 6704487.6, 354844 6704516.4, 354851.5 6704550.6, 354858.6 6704583.1, 354865.9 6704611.4, 354872.7 6704640.5, 354875.4 6704650.5, 354878.6 6704657.5, 354886 6704674.8, 354886.3 6704688.7, 354889 6704717, 354893.3 6704750.1, 354894.6 6704766, 354895 6704772, 354899.6 6704771.2, 354902.6 6704768, 354905.6 6704762, 354915.4 6704753.9, 354931.9 6704747.8, 354950.7 6704744.8, 354967.2 6704739.8, 354989.8 6704729.9, 355003.2 6704726.9, 355015 6704724.6, 355022 6704723, 355027.4 6704721.8, 355036.6 6704719.5, 355042.5 6704716.7, 355047.6 6704712.3, 355051.4 6704706.2, 355053.6 6704698.8, 355054.9 6704690.1, 355056.1 6704683.2, 355060.3 6704677.3, 355070.6 6704671.3, 355099.1 6704662.8, 355126.4 6704654.8, 355149.5 6704647, 355170.8 6704638.9, 355192.5 6704630.3, 355217.8 6704618.5, 355233.4 6704609.8, 355256.6 6704597.2, 355286 6704583.7, 355306 6704574.2, 355324.1 6704566.6, 355338.9 6704561, 355351.9 6704557.8, 355361.2 6704557.3, 355370.2 6704556.5, 355376.9 6704553.4, 355381.4 6704549.6, 355386.6 6704546.5, 355393.6 6704544.6, 355400.3 6704542, 355407.9 6704537.5, 355412.6 6704532.4, 355415.4 6704527.3, 355419.1 6704521.1, 355425.8 6704517.5, 355432.4 6704515.6, 355438.5 6704513.7, 355443.1 6704511.2, 355447.7 6704506.2, 355452.1 6704499.5, 355453.8 6704491.9, 355453 6704485.3, 355448.7 6704478.8, 355442.9 6704473.9, 355437.9 6704467.7, 355435.4 6704457.3, 355436.4 6704441.4, 355441.2 6704423, 355448.8 6704403.1, 355459.8 6704376.8, 355467.5 6704357.5, 355471.4 6704340.4, 355475.8 6704314.2, 355481.1 6704283.1, 355489.8 6704249.2, 355500.5 6704214, 355517.3 6704177.4, 355520.3 6704172.3, 355521.1 6704167.6, 355520.5 6704162.7, 355520.3 6704157.3, 355523.5 6704150.4, 355532.7 6704140.5, 355559.4 6704121.5, 355573.9 6704112.8, 355584.3 6704108.4, 355588.1 6704107.6, 355592.3 6704107.3, 355596.8 6704106.6, 355602.3 6704102.4, 355609.7 6704096, 355620.8 6704089.6, 355639.2 6704088.3, 355642.9 6704089.8, 355646.3 6704089.6, 355650.3 6704087.2, 355655.7 6704070, 355656.1 6704061.5, 355653.3 6704053.5, 355651.9 6704043.7, 355651.9 6704030, 355652.1 6704014.7, 355649.8 6704001, 355646.6 6703991.7, 355644.4 6703969.4, 355645.4 6703957.9, 355644.2 6703950.2, 355639.7 6703945.5, 355634.3 6703942.6, 355628.6 6703940.7, 355623.4 6703935.1, 355621 6703927.4, 355621.3 6703916.4, 355624.1 6703905.5, 355627.2 6703898.6, 355630 6703890.2, 355631.9 6703883.3, 355632.6 6703877.1, 355631.8 6703871.9, 355627.8 6703862.3, 355625.5 6703855.9, 355625.6 6703849.6, 355627.3 6703843.8, 355631 6703836.4, 355632.3 6703830.8, 355631 6703822.4, 355626.1 6703812.6, 355616.8 6703804, 355608 6703797.3, 355603.1 6703789.2, 355605 6703780.1, 355612.3 6703771.4, 355623.1 6703757.6, 355629.1 6703743.4, 355634.1 6703730.3, 355637.8 6703727.9, 355648.6 6703721.9, 355657.6 6703716.3, 355663.6 6703710.5, 355666 6703703.4, 355665.8 6703696.4, 355663.2 6703690.4, 355659.7 6703683.9, 355657.7 6703675.6, 355658 6703669.3, 355657.6 6703662, 355657.7 6703655.6, 355659.5 6703651.3, 355664.7 6703650.1, 355670.5 6703650.5, 355677.9 6703651.3, 355684.9 6703650.9, 355689.4 6703648.3, 355690.6 6703641.3, 355690.5 6703631.1, 355690.5 6703618.8, 355690.6 6703608, 355689.8 6703597, 355689.8 6703586.8, 355692 6703577.6, 355699.2 6703567.6, 355718.4 6703546.5, 355724.3 6703538.6, 355729.9 6703529.9, 355737.4 6703521.6, 355746.2 6703516.3, 355754.4 6703508.7, 355760 6703503.4, 355768.9 6703499.4, 355780.2 6703497, 355790.6 6703496.6, 355799.7 6703495.3, 355808.4 6703492.5, 355817.1 6703489.2, 355823.3 6703484.1, 355826.7 6703475.8, 355827.2 6703466, 355827 6703455.3, 355828.3 6703442.2, 355831 6703426.3, 355833.5 6703411.1, 355836.6 6703395.1, 355839.8 6703381.4, 355844 6703372.2, 355849.9 6703364.7, 355853.9 6703354.7, 355856.8 6703343.6, 355859.6 6703332.4, 355865 6703322.5, 355873.3 6703311.8, 355881.4 6703302.9, 355894.1 6703296.7, 355937.8 6703288.2, 355949.2 6703285.2, 355959.3 6703276.1, 355969.7 6703268.7, 355981.3 6703262.7, 355993.5 6703254.5, 356008.2 6703236.9, 356013.9 6703224.7, 356016 6703219.9, 356026.5 6703196.3, 356031.4 6703183.6, 356031.4 6703171.7, 356029 6703160.7, 356027.6 6703153.2, 356026.4 6703139, 356026.7 6703128.6, 356027.8 6703119.7, 356031.5 6703107.9, 356036.8 6703098.7, 356044.1 6703083.9, 356048.4 6703077.3, 356064.1 6703064.7, 356071.4 6703057.3, 356075.1 6703048, 356081.1 6703042.9, 356089.4 6703038.5, 356148.9 6703025, 356184.5 6703014.9, 356218.6 6703007.9, 356235.4 6703007.5, 356260.3 6703011.5, 356277 6703010.5, 356287.8 6703009.7, 356302.3 6703005.4, 356305 6703005.2, 356317.2 6703003.9, 356323.5 6703000.6, 356327.4 6702996.6, 356334.2 6702987.4, 356337.8 6702980.4, 356339.4 6702974.3, 356340 6702968.9, 356339.5 6702960.1, 356334.6 6702930, 356332.7 6702899.7, 356332.6 6702891.5, 356334.1 6702873.3, 356333.6 6702863.1, 356334.3 6702853.8, 356336 6702845.6, 356338.5 6702841, 356345 6702830, 356348.5 6702821.4, 356355.9 6702784.5, 356356.9 6702779, 356363.7 6702757.6, 356367.1 6702739.8, 356371.5 6702726, 356373.4 6702722.1, 356376 6702716.4, 356378.3 6702704.9, 356381.6 6702697.1, 356387.6 6702686.8, 356391.1 6702681, 356406.8 6702665.7, 356425.4 6702656.8, 356434.7 6702649.2, 356436 6702647.2, 356443.4 6702636.3, 356448.9 6702632, 356456.5 6702628.9, 356462.2 6702627.5, 356475.8 6702624.6, 356490.4 6702620, 356495.2 6702619.2, 356507.2 6702618.7, 356517 6702617.1, 356541.7 6702608.5, 356548.3 6702605.5, 356555.9 6702604.2, 356564.8 6702602.8, 356577.3 6702593.6, 356591.5 6702586.6, 356611.2 6702580.1, 356631.4 6702571.3, 356644.7 6702563.5, 356650.6 6702560.1, 356663.3 6702555.8, 356671.2 6702550, 356678.1 6702540.7, 356687.7 6702535.7, 356705 6702531.7, 356724.2 6702525.7, 356735.4 6702521.4, 356740.1 6702519.6, 356757.9 6702510.4, 356768.2 6702504.4, 356783.1 6702493.2, 356795.1 6702481, 356799.4 6702470, 356808.5 6702456.3, 356814.1 6702443.2, 356822.4 6702419.4, 356831.7 6702401.8, 356840 6702378.3, 356845.9 6702359.7, 356848.3 6702342.9, 356846.9 6702325.5, 356847.1 6702306.2, 356849.5 6702288.1, 356850.1 6702255.9, 356850.2 6702249.7, 356846.2 6702234.9, 356846.8 6702221.5, 356852.9 6702192.4, 356857.2 6702150.5, 356858.6 6702141.2, 356864.2 6702116, 356863.8 6702103, 356864.4 6702088, 356864.5 6702054.5, 356862.7 6702024.3, 356863.5 6702012.2, 356867.1 6701997.4, 356869.4 6701990.6, 356877.2 6701979.5, 356885.3 6701970.2, 356907.2 6701951.2, 356930.3 6701934.6, 356937.8 6701926.1, 356945.7 6701913.5, 356958.5 6701899.7, 356972.9 6701888.8, 356992.3 6701878.1, 357004.3 6701867.5, 357015.7 6701859.9, 357026.3 6701849.5, 357033.4 6701844.1, 357039.2 6701836.9, 357051.3 6701817, 357078 6701740.1, 357086.4 6701699.2, 357094.1 6701673.5, 357104.4 6701643.5, 357120.2 6701592.8, 357125.4 6701578.4, 357135 6701556, 357143.5 6701532.3, 357151.1 6701508.7, 357157.4 6701486.3, 357161.3 6701476.1, 357163.4 6701466.6, 357166.4 6701449.4, 357168 6701425.8, 357167.3 6701388.6, 357168.6 6701357.1, 357162.8 6701334.4, 357161.6 6701317.9, 357162.1 6701276.9, 357163.7 6701237.2, 357165.9 6701206.9, 357168 6701193.9, 357168.4 6701181.5, 357171.4 6701166.6, 357175.8 6701155, 357182.9 6701143.3, 357193.6 6701131.2, 357198.4 6701126.8, 357201.3 6701123.4, 357204.2 6701118.1, 357209.5 6701101.6, 357224 6701072.1, 357223.9 6701068.3, 357222.5 6701064.2, 357218.8 6701059.6, 357206 6701055.9, 357200.1 6701055.1, 357197.1 6701053.5, 357193.1 6701045.5, 357190.9 6701034.8, 357188.5 6701017.1, 357189.7 6701008.4, 357199.2 6700989.5, 357203.1 6700974.8, 357208.5 6700958.8, 357213 6700940, 357216.7 6700928.2, 357217.9 6700917.1, 357218 6700907.5, 357224.4 6700881, 357225.3 6700874.4, 357224.6 6700867, 357221.9 6700853.7, 357217.5 6700839.7, 357208.2 6700823.6, 357199.4 6700810.5, 357190 6700800.5, 357166.9 6700779.4, 357155.1 6700766.4, 357144.7 6700755.7, 357131.6 6700745, 357128.1 6700743.2, 357057.6 6700730.5, 357049.7 6700727.3, 357038.7 6700718.3, 357029.6 6700707.9, 357024.9 6700697.4, 357021.7 6700681.7, 357019.2 6700664, 357019.7 6700644.7, 357024.8 6700617.1, 357026.4 6700609.4, 357028.5 6700603.4, 357030 6700600.4, 357031.8 6700598.8, 357039.9 6700594.2, 357042.8 6700592.6, 357048.2 6700587.5, 357051.8 6700582.1, 357054.4 6700576.5, 357056 6700570.4, 357057 6700557.8, 357056.1 6700546.7, 357047.9 6700499.6, 357047.7 6700487.9, 357048.5 6700485.2, 357053.8 6700476.1, 357066.3 6700463.6, 357080.1 6700452.6, 357090.3 6700445.5, 357105.2 6700437.6, 357115.9 6700433.1, 357131.5 6700427.9, 357155.2 6700421.7, 357221.3 6700413.1, 357255 6700407.3, 357291.5 6700403, 357316.6 6700399.1, 357339.8 6700391.5, 357372.1 6700372.3, 357393.5 6700360.8, 357407.1 6700352.5, 357411.2 6700350, 357422.2 6700334.6, 357432.3 6700314.1, 357450.1 6700285.5, 357469.1 6700262.4, 357479.5 6700250.8, 357485.1 6700245.5, 357494 6700239.4, 357522.4 6700222.1, 357556.5 6700196.1, 357603.2 6700164.4, 357633.8 6700133.1, 357642.8 6700121.6, 357657.2 6700098.8, 357663.8 6700081.9, 357674.4 6700059.4, 357689 6700022.4, 357698.8 6700003.5, 357710.6 6699980.3, 357736.7 6699917.7, 357757.3 6699880.2, 357775.9 6699839.1, 357806.8 6699793.3, 357811.6 6699814, 357816.9 6699831.1, 357830 6699857.4, 357847.4 6699896, 357859.8 6699914.3, 357874.3 6699933.5, 357903.4 6699962.2, 357978.3 6700045.8, 357994.6 6700069.7, 358010.7 6700098, 358043.1 6700151.3, 358052.4 6700164.9, 358077.9 6700192.9, 358109 6700221.3, 358121.1 6700235.1, 358145.7 6700258, 358166.4 6700281.7, 358185.7 6700306.8, 358218.3 6700353.1, 358256 6700419.8, 358283.1 6700463.1, 358296.3 6700494.1, 358307.3 6700523.9, 358312.9 6700551.6, 358322.1 6700633.4, 358329.1 6700685.6, 358333.4 6700723.9, 358335.9 6700756.7, 358369.9 6701017.2, 358323.4 6701156.4, 358276.7 6701295.7, 358230.2 6701435, 358442.9 6701490.9, 358531.5 6701511.4, 358621.5 6701522.2, 358698.2 6701531, 358720.2 6701532.4, 358742.1 6701526.4, 358790.3 6701511.7, 358812.1 6701502.5, 358847.6 6701478.3, 358867.8 6701470.5, 358891.1 6701469.3, 358906.4 6701467.2, 358921.9 6701458.5, 358930 6701451.1, 358970.9 6701413.5, 359026.8 6701356.5, 359056.5 6701329.2, 359078.7 6701313.2, 359088.7 6701298.4, 359107 6701270, 359138.6 6701228.9, 359167.8 6701196.8, 359189.5 6701181.3, 359208.8 6701174.9, 359230.2 6701171.7, 359251.5 6701166, 359283.9 6701150.5, 359307.6 6701144.8, 359327.6 6701143.6, 359367.9 6701142.8, 359385.4 6701133, 359396.4 6701129.8, 359407.3 6701130.9, 359422.3 6701136.7, 359438.4 6701143.8, 359460.7 6701150, 359467.2 6701150.7, 359482.3 6701155.3, 359488.2 6701156.5, 359494.8 6701156.6, 359500.5 6701154.5, 359507 6701153.6, 359511.6 6701156.1, 359516.6 6701161.4, 359523.5 6701162.7, 359535.6 6701159.5, 359553.1 6701170.2, 359630.2 6701217.5, 359701.5 6701248.4, 359804.9 6701288.1, 359936.7 6701362.4, 360082.8 6701444.8, 360112.4 6701441.4, 360229.7 6701427.6, 360358.9 6701407.6, 360384.6 6701389.5, 360505.2 6701344.9, 360556.5 6701304.2, 360631.8 6701246.9, 360626.9 6701239.3, 360605.9 6701217.6, 360594.1 6701181.2, 360586.5 6701157.5, 360585 6701149, 360576.4 6701145.6, 360591.2 6701145.1, 360627.2 6701138.7, 360651.6 6701147, 360661.5 6701148, 360688.5 6701140.8, 360756 6701107.1, 360775.3 6701069.7, 360779.8 6701065.5, 360787.5 6701047.7, 360790.6 6701023.8, 360794.5 6701021, 360839.3 6701033.8, 360879.2 6701005.1, 360887.2 6700994.2, 360897 6700974.5, 360920 6700930.1, 360926.5 6700921, 360938.6 6700912.1, 360941.5 6700912.8, 360943.8 6700931.9, 360967.5 6700931.6, 360980.8 6700942.5, 360990.9 6700937.1, 361025.5 6700908.2, 361072.5 6700877.8, 361168.8 6700845.6, 361191 6700844.6, 361212 6700841.5, 361228.6 6700833.4, 361242.1 6700828.8, 361267.1 6700814.9, 361284.1 6700803.5, 361296.5 6700796.9, 361305.6 6700793.4, 361321.4 6700785.9, 361328.5 6700777.5, 361332.3 6700776.3, 361335.6 6700775.1, 361342.2 6700776.6, 361347.2 6700774.7, 361355.3 6700770, 361360.6 6700768, 361381.7 6700762.3, 361389 6700760.8, 361397.4 6700757.6, 361411 6700748, 361417.5 6700743.1, 361423.8 6700740, 361444.3 6700732.4, 361448.1 6700731.3, 361455.1 6700729.4, 361486.1 6700724.6, 361509.5 6700723.7, 361533.3 6700724.9, 361542.2 6700726.8, 361547.7 6700729.7, 361549.2 6700730.5, 361561.5 6700737.8, 361579 6700747, 361583.8 6700750.9, 361592.7 6700761.7, 361598.3 6700764.3, 361606.9 6700766.8, 361632.4 6700771.8, 361653.4 6700779.6, 361659.4 6700783.8, 361662 6700789.5, 361665.5 6700793.9, 361671.7 6700796.5, 361681 6700797.7, 361689.3 6700795.2, 361698.5 6700794.7, 361707.8 6700795.1, 361720.5 6700792.6, 361726 6700791.7, 361748.3 6700789.8, 361758.4 6700787.6, 361805.1 6700774.8, 361819.4 6700773.8, 361841.2 6700776.3, 361850.9 6700774.8, 361888 6700761.4, 361883 6700843.3, 361881.6 6700874.8, 361897.6 6700867.5, 361931.7 6700846, 361958.7 6700831.9, 361967.3 6700827.5, 361984.5 6700823.9, 361995.3 6700823, 362008.3 6700823.1, 362018.3 6700823.9, 362028 6700826, 362036.4 6700827.9, 362045.3 6700830.8, 362060.8 6700837.5, 362071.9 6700841.9, 362081 6700843.5, 362090.6 6700843.5, 362098.7 6700842.5, 362113.5 6700837.2, 362123.8 6700831.4, 362128.3 6700828.8, 362141.2 6700818.9, 362157.7 6700836, 362167.2 6700842.5, 362179.1 6700846.2, 362196.1 6700846.4, 362205.2 6700847.8, 362249.5 6700862.6, 362256 6700863.6, 362263.9 6700862.8, 362321.2 6700866.5, 362368.8 6700893.5, 362372.5 6700895.6, 362391 6700932.1, 362454.5 6701040.1, 362462.6 6701064, 362465.2 6701073.7, 362466.4 6701082.1, 362466.8 6701099.7, 362470 6701156.8, 362475.1 6701203.2, 362477.3 6701232.8, 362480 6701253.8, 362485.6 6701282.5, 362491.4 6701271.6, 362497.2 6701264.4, 362505.6 6701256.7, 362514.8 6701268.1, 362519.1 6701271.6, 362523.7 6701273.1, 362534.5 6701275.1, 362536.2 6701283.5, 362542.4 6701296.9, 362560.2 6701314.7, 362585.2 6701323.7, 362592.6 6701324.6, 362627.5 6701328.5, 362640 6701329.9, 362689 6701330.8, 362707.5 6701332.7, 362734.5 6701339.7, 362752.1 6701343.8, 362770.3 6701343.2, 362788.7 6701341.3, 362817.1 6701333.1, 362858.2 6701319.3, 362877 6701306.9, 362900.8 6701291.1, 362920.2 6701268.5, 362967.7 6701269.6, 362983.3 6701268.9, 362993.5 6701269.5, 362998.5 6701273.7, 363002.1 6701276.6, 363006.9 6701284.5, 363015.4 6701286, 363081.1 6701289, 363112.9 6701290.9, 363131.4 6701294.8, 363150.1 6701297.8, 363183.7 6701302.1, 363209.8 6701301.6, 363234 6701301.2, 363246.6 6701298.4, 363282.6 6701292.4, 363322.7 6701283.9, 363342.6 6701280.8, 363351.5 6701280.2, 363436.7 6701274.8, 363448 6701274.1, 363468.3 6701277, 363487.1 6701281.1, 363498.2 6701287.1, 363508.2 6701294.6, 363515.5 6701301.4, 363523.6 6701310.5, 363529 6701319.8, 363533.2 6701330.7, 363535.1 6701344.4, 363537.7 6701359.7, 363550.1 6701348.7, 363554.1 6701346.6, 363558.8 6701345.8, 363561.6 6701346.5, 363575.4 6701356.5, 363599.3 6701364.7, 363620.6 6701374.7, 363633.6 6701378.4, 363643.9 6701372.8, 363643 6701382.8, 363690.5 6701389.4, 363692.2 6701365.5, 363826.2 6701386, 363955.1 6701404.2, 363966.2 6701404.2, 363976.9 6701418.2, 363999.6 6701437.8, 364059.1 6701480.8, 364092.9 6701504.3, 364081.3 6701530.5, 364131.7 6701609.4, 364135.5 6701618.8, 364165.6 6701670.4, 364200.7 6701727.4, 364204.5 6701730.7, 364216.1 6701763.2, 364262.9 6701822.4, 364275.8 6701838.6, 364268.4 6701850, 364251.1 6701876.4, 364349.2 6702008.9, 364365.4 6702024.6, 364368.8 6702028.6, 364380.9 6702039.5, 364388.6 6702024.9, 364391.8 6702021.4, 364394.7 6702024.6, 364403.1 6702028.6, 364461.4 6702064.5, 364505.3 6702095.7, 364537.3 6702125.4, 364567.9 6702158.1, 364571.6 6702162.3, 364608.1 6702202.7, 364616.8 6702213.1, 364621.7 6702219, 364643.2 6702246.5, 364653.1 6702256.2, 364639.7 6702267.8, 364621.1 6702289.4, 364611.1 6702303.3, 364604.1 6702313.4, 364590.1 6702337.6, 364582.7 6702359.9, 364581.1 6702371, 364579.5 6702381.8, 364579.6 6702404.4, 364580.6 6702415, 364581.3 6702422.3, 364586.3 6702447.1, 364592.1 6702470.1, 364591.1 6702481.3, 364590.4 6702487.8, 364585 6702510.4, 364580.3 6702542.5, 364625.6 6702562.3, 364636.6 6702564.5, 364658.2 6702584.5, 364669.8 6702593.9, 364685.3 6702599, 364704 6702601.8, 364725.8 6702609.6, 364731.6 6702612.7, 364740.5 6702617.8, 364746.3 6702617.4, 364757.6 6702615.9, 364766.4 6702618.9, 364776.6 6702626.9, 364781 6702634, 364792.2 6702638.2, 364807.8 6702638.8, 364826 6702641.7, 364840.6 6702640.5, 364853.9 6702636.6, 364874.9 6702628.8, 364899.9 6702624.4, 364919 6702621.6, 364939.2 6702620, 364958.2 6702624.4, 364979.6 6702627.1, 364997.9 6702630.1, 365018.8 6702631.6, 365038.3 6702632.6, 365053.4 6702633.9, 365064.6 6702638, 365072.2 6702645.5, 365078.5 6702651.3, 365085.3 6702651.8, 365098 6702647.8, 365109.9 6702644.4, 365112.9 6702660.5, 365120.1 6702673.7, 365134 6702685.6, 365152.2 6702699, 365165.5 6702706.8, 365172.8 6702709.5, 365192.1 6702724.8, 365221.7 6702748.2, 365231.7 6702756.9, 365237.4 6702760.5, 365242.5 6702756.8, 365259.6 6702746.4, 365269.4 6702767.4, 365272.5 6702774.7, 365275.5 6702783.8, 365276.6 6702787.9, 365278.6 6702794, 365280.6 6702800.5, 365283.7 6702807.3, 365286.6 6702814.5, 365289.3 6702820.9, 365292.3 6702827.3, 365296.7 6702835.8, 365311.3 6702855, 365334.2 6702886.8, 365339.9 6702894.6, 365352 6702910.7, 365354.8 6702914.4, 365404.9 6702972.4, 365411.1 6702980.5, 365414.7 6702985.7, 365417.3 6702990.8, 365420.2 6703000.5, 365421.1 6703000.3, 365458.6 6702992.9, 365486.7 6702987.4, 365493.5 6702986, 365535.7 6702977.9, 365544.7 6702976.2, 365571.7 6702971.1, 365606.3 6702964.5, 365615.4 6702963.4, 365625.8 6702961, 365631.2 6702959.9, 365637 6702958.8, 365647.4 6702957.1, 365658.4 6702955.6, 365668.7 6702954.8, 365684.8 6702954, 365693.4 6702953.5, 365717.7 6702952.8, 365741 6702951.8, 365757.3 6702951.2, 365769.6 6702950.7, 365806.4 6702950.2, 365828.7 6702949.9, 365889.7 6702947.9, 365966.3 6702946.5, 366011.2 6702945.7, 366021.8 6702945.5, 366084.9 6702944, 366101.1 6702943.8, 366138.9 6702943.4, 366152 6702943.2, 366210 6702941.9, 366226.6 6702941.6, 366241.1 6702941.5, 366290.4 6702941.7, 366296.7 6702941.6, 366341.4 6702940.5, 366404.2 6702938.2, 366441.9 6702937, 366470.3 6702936.2, 366556.7 6702933.2, 366618 6702931.2, 366683.8 6702929.1, 366749.2 6702927.7, 366830.7 6702924.9, 366858 6702924.2, 366882.2 6702923.7, 366914.4 6702924, 366975.2 6702923, 367015.7 6702922.2, 367028.8 6702921.8, 367037.5 6702921.2, 367046.3 6702920.2, 367050.5 6702919.2, 367053.3 6702918.1, 367066.7 6702921.4, 367069.7 6702921.8, 367074 6702922.2, 367082.1 6702922.8, 367088.6 6702922.9, 367103.5 6702922.7, 367114 6702922.8, 367140.2 6702922.1, 367154.2 6702921.4, 367165.5 6702920.9, 367167 6702920.9, 367176.1 6702921.2, 367189.3 6702922.3, 367200.4 6702924.6, 367212.2 6702927.9, 367318.8 6702953.4, 367382.6 6702969.4, 367454.2 6702987.9, 367469.3 6702991.6, 367477.1 6702993.5, 367479.8 6702984.1, 367482.6 6702987.4, 367493.7 6702999.4, 367496.3 6702997.6, 367498.3 6702996.9, 367501.4 6702996.3, 367507.7 6702996.2, 367515.5 6702996.9, 367546.3 6703002.6, 367604.3 6703014.4, 367618 6703016.3, 367661.1 6703022.2, 367685.8 6703025.9, 367703.3 6703028.1, 367692.2 6703000.3, 367681.2 6702966.8, 367664.6 6702907, 367659.2 6702884.7, 367648.6 6702841.2, 367646.5 6702827.3, 367644.9 6702815.3, 367644 6702804.3, 367643.9 6702801.4, 367643.2 6702782.4, 367643.4 6702771.5, 367643.6 6702757.9, 367643.9 6702744.8, 367644.3 6702719.4, 367645 6702692.7, 367645.2 6702669.9, 367645.6 6702663.8, 367646.4 6702656.4, 367647.6 6702650.6, 367649.9 6702642.6, 367650.6 6702640.4, 367652.2 6702635.7, 367655.3 6702627.9, 367658.1 6702621.4, 367662.7 6702612.6, 367678.8 6702586.6, 367697.9 6702556.4, 367717.4 6702528.8, 367735.2 6702503.2, 367711.5 6702478.7, 367714.8 6702420.7, 367723 6702337.2, 367723.7 6702329.5, 367724.1 6702321.7, 367724.4 6702314, 367724.5 6702306.6, 367724.4 6702299.1, 367724.1 6702291.8, 367723.5 6702285, 367722.7 6702277.2, 367718.3 6702238.5, 367712.5 6702188.3, 367711.8 6702178.9, 367710.7 6702171, 367709.3 6702161.8, 367708.1 6702154.5, 367706.2 6702147, 367704.4 6702139.8, 367702.3 6702131.5, 367692.1 6702086.3, 367691.1 6702081.9, 367683.9 6702048.7, 367679.5 6702028.3, 367670.2 6701976.3, 367668.5 6701967, 367666.9 6701958.3, 367665.6 6701949.8, 367664.2 6701940.7, 367663 6701932.6, 367661.6 6701924, 367660.3 6701916.5, 367659.6 6701908.9, 367659 6701899.8, 367658.4 6701891.5, 367658.2 6701881.8, 367657.8 6701873.2, 367657.4 6701865.7, 367656.8 6701857.1, 367655.6 6701849.4, 367651.6 6701804, 367648.7 6701762.3, 367648.5 6701756.4, 367648.4 6701750.9, 367647.8 6701744.1, 367646.9 6701738.3, 367646.1 6701733.2, 367645.5 6701728.7, 367644.8 6701722.4, 367643.7 6701715.6, 367642.9 6701709.9, 367641.7 6701704.7, 367640.4 6701700.3, 367638.9 6701695.2, 367637.3 6701690.5, 367635.5 6701684.8, 367634.6 6701682.6, 367813 6701588.6, 367867.7 6701533.7, 367907.5 6701451.6, 367861.2 6701373.3, 367871.3 6701368.6, 367876.1 6701366.5, 367905.4 6701353.3, 367906 6701353, 367905.9 6701338, 367902.4 6701335.4, 367877.9 6701317.7, 367849.3 6701297.1, 367848.4 6701295.9, 367844.2 6701287.5, 367836.9 6701279.6, 367827.8 6701273.8, 367820.1 6701268.6, 367814.4 6701262.7, 367806.7 6701245.1, 367804.8 6701240.8, 367800.6 6701231.3, 367795.2 6701222, 367792.2 6701216.8, 367788.5 6701211.5, 367782.1 6701201.8, 367776.3 6701191.6, 367769.8 6701181.6, 367765.2 6701173.8, 367759.5 6701164.4, 367755.1 6701153.1, 367752.8 6701143.5, 367750.9 6701132.4, 367748.3 6701116.8, 367745.7 6701107.2, 367743.5 6701093.4, 367742.2 6701079.9, 367741.3 6701067.6, 367741.2 6701051.1, 367741.5 6701039.3, 367741.2 6701031.3, 367740.8 6701023.7, 367740.2 6701015.2, 367738.9 6701004.4, 367741.6 6700993.5, 367745.1 6700983.8, 367748.7 6700972.6, 367752.7 6700963.3, 367756.4 6700953.8, 367756.7 6700943.6, 367757.1 6700932.6, 367758.3 6700920.6, 367760.2 6700905.4, 367759.9 6700893.1, 367761.8 6700880.3, 367763.5 6700869.1, 367767.3 6700857.8, 367772.2 6700846.6, 367776.8 6700837.4, 367782.4 6700827.4, 367789.1 6700816.7, 367794.5 6700806.6, 367798.2 6700800.2, 367801.7 6700795.2, 367804.8 6700792.8, 367809.4 6700789.2, 367818 6700782.4, 367824.5 6700776.4, 367829.6 6700773.6, 367836.8 6700768.8, 367846.2 6700762.7, 367855 6700758.8, 367862.6 6700754.5, 367871.7 6700749.1, 367885.6 6700742.6, 367897.5 6700737.2, 367911.3 6700732.1, 367925.5 6700728.5, 367937.5 6700724.3, 367944.8 6700721.6, 367948.2 6700720.4, 367957.7 6700715.6, 367962.7 6700712, 367966.4 6700708.1, 367968.9 6700703.9, 367970 6700700.5, 367970.6 6700695.6, 367970.6 6700691.9, 367969.5 6700686, 367966 6700675.2, 367961.5 6700663.8, 367958.1 6700654.6, 367955.1 6700645.5, 367952.9 6700642.1, 367947.5 6700634, 367943.9 6700628.4, 367937.1 6700617.3, 367933.5 6700612.5, 367925.9 6700603.7, 367918 6700595.3, 367910.5 6700587.2, 367903.2 6700579, 367896.5 6700572, 367890.9 6700563.9, 367885.7 6700554.9, 367881.5 6700546.4, 367876.5 6700536, 367870.3 6700523.4, 367862.4 6700509.2, 367857 6700496.6, 367852.2 6700484.4, 367847.3 6700475.1, 367841.7 6700466.4, 367837.1 6700456.8, 367831.9 6700444.1, 367828.2 6700432.9, 367825.3 6700424.2, 367825 6700419.6, 367824.9 6700409.9, 367825 6700405.7, 367826.4 6700401.8, 367833 6700393.1, 367863.4 6700373.4, 367865.4 6700372.1, 367867 6700371.1, 367871.6 6700368.4, 367877.2 6700364.8, 367882.3 6700360.2, 367890.6 6700349.9, 367895 6700339, 367898.7 6700330.9, 367903.3 6700320.8, 367904.9 6700308.5, 367904.6 6700297.8, 367907.1 6700284.4, 367913 6700268.9, 367921.6 6700250.6, 367928.8 6700233.3, 367933.1 6700215.4, 367934.5 6700198.6, 367932.7 6700178.9, 367930.4 6700167.2, 367927.1 6700153.3, 367923.6 6700140.7, 367919.3 6700128.6, 367915.3 6700113.9, 367913 6700099.9, 367913.4 6700082.5, 367918.3 6700068.4, 367926.8 6700057.6, 367958 6700071.9, 367993.6 6700083.1, 368075 6700090.8, 368092.8 6700102.9, 368095.1 6700068.3, 368095.9 6700060.4, 368096.5 6700054.3, 368097.5 6700047.6, 368098.5 6700041.8, 368100.1 6700034.6, 368101.8 6700028.8, 368105.6 6700023.2, 368110.5 6700017.5, 368118.9 6700010.5, 368133.1 6699999.7, 368148.6 6699986.8, 368159.8 6699974.4, 368166.4 6699967.5, 368174.2 6699960.2, 368186.5 6699951.5, 368201.8 6699941.7, 368214.7 6699933.8, 368217.5 6699931.9, 368220 6699929.6, 368222.3 6699926.7, 368223.6 6699924.1, 368224.6 6699921, 368225.1 6699917.9, 368225.4 6699914.2, 368225.5 6699910.3, 368225.5 6699906.6, 368221 6699867.9, 368220.3 6699859.8, 368220.2 6699852.5, 368220.8 6699846.6, 368222.1 6699841.1, 368223.8 6699836.6, 368226.3 6699831.4, 368228.4 6699826.7, 368230.7 6699822.2, 368233 6699817, 368235.4 6699813, 368237.6 6699809.3, 368239.8 6699806, 368242.3 6699802.6, 368245.2 6699798.2, 368247.7 6699794.8, 368250.7 6699791.3, 368253.3 6699787.7, 368256.4 6699784, 368260 6699780.5, 368271.8 6699771.2, 368301.8 6699744.9, 368317.2 6699732.5, 368320.4 6699729.3, 368323.5 6699725.6, 368326.3 6699721.7, 368329 6699718.1, 368331.9 6699713.9, 368334.6 6699710.1, 368336.7 6699706.5, 368337.5 6699705, 368338.9 6699702.9, 368340.2 6699700, 368341.5 6699696.7, 368346.9 6699680.2, 368358.1 6699644.4, 368362.6 6699626.3, 368363.3 6699621.6, 368363.9 6699617.2, 368364.1 6699613.3, 368364.2 6699609.9, 368364.3 6699605.6, 368364.1 6699600.7, 368363.8 6699596.4, 368363.4 6699590.3, 368362.8 6699585, 368359.3 6699554.3, 368352.3 6699492.6, 368350.1 6699477.5, 368348 6699466.7, 368346.5 6699460.4, 368344.1 6699451.6, 368343.4 6699449.2, 368341.6 6699442.5, 368340.5 6699437, 368340.3 6699430.1, 368340.4 6699423, 368341.2 6699415.7, 368342.7 6699406.9, 368343.8 6699401.7, 368345.3 6699397, 368346.6 6699393.1, 368348.1 6699388.1, 368349.5 6699382.6, 368350 6699380.6, 368350.4 6699378.3, 368356.4 6699357.8, 368395.5 6699244, 368396.2 6699242.2, 368400.4 6699232.2, 368426.8 6699168.6, 368454.3 6699098, 368470.9 6699056.7, 368478.1 6699039.5, 368486.5 6699026.9, 368495.9 6699040.5, 368524.5 6699082.1, 368597.4 6699187.8, 368613 6699210.2, 368621.5 6699222.4, 368680.5 6699307, 368728.6 6699376.7, 368735.5 6699386.5, 368786.7 6699461, 368792.8 6699469.7, 368797.7 6699448.4, 368823.3 6699400.4, 368851.5 6699349.2, 368873.5 6699306.9, 368898.7 6699259.9, 368899.1 6699259.2, 368916 6699227.3, 368929.2 6699202.7, 368942.5 6699178.5, 368949.4 6699168.2, 368956.5 6699157.8, 368961.9 6699149.9, 368969.7 6699138.7, 368987.1 6699114.1, 369022.9 6699063.5, 369042.2 6699034.8, 369049.1 6699022.4, 369054.8 6699014.4, 369066.3 6699012.6, 369076.2 6699012, 369084.8 6699011, 369105.7 6699009.3, 369122.7 6699008.5, 369135.1 6699008.2, 369150.9 6699009.6, 369169.2 6699012.1, 369182.5 6699013.6, 369216.9 6699021.2, 369233.7 6699026.9, 369262.4 6699034.7, 369290.2 6699042, 369315.4 6699047.2, 369315.9 6699047.2, 369330.5 6699049.5, 369331.5 6699049.6, 369359.2 6699053.2, 369391.5 6699056.9, 369409.1 6699061.5, 369415.4 6699062.8, 369426.7 6699067, 369445.5 6699073.4, 369464 6699080.2, 369519.2 6699099.2, 369556.1 6699111.5, 369593.1 6699125.9, 369601.7 6699129.8, 369610.1 6699135, 369615.2 6699138.8, 369620.8 6699143.6, 369627.7 6699151.8, 369634.2 6699160.7, 369639.8 6699169.2, 369649.3 6699183.9, 369688.9 6699240.8, 369725 6699273.7, 369737 6699283.7, 369745.9 6699288.2, 369749.3 6699290.1, 369751.4 6699291.3, 369758.1 6699292.8, 369763.9 6699293.6, 369769.5 6699293.7, 369775 6699293.5, 369782.1 6699291.4, 369789.2 6699289.8, 369800.6 6699284.4, 369803.9 6699282.5, 369794.5 6699242.9, 369813.7 6699233.8, 369817.4 6699232.1, 369823.3 6699229, 369831.1 6699225.8, 369841.2 6699221.3, 369852 6699215.6, 369862.7 6699208.5, 369872.6 6699201.8, 369881.8 6699198.2, 369887.8 6699197.5, 369897.3 6699198.1, 369904.9 6699199.1, 369917.5 6699196.3, 369923.7 6699194.9, 369934.3 6699195.2, 369947.8 6699197.4, 369962.2 6699200.4, 369977.9 6699205.3, 369996.4 6699210.5, 370004.6 6699211.4, 370013.8 6699211.1, 370027.9 6699211.3, 370044.9 6699211.7, 370054.2 6699214, 370064.8 6699215.1, 370078.2 6699213.2, 370090.6 6699207, 370108.1 6699191.7, 370120.8 6699184.2, 370131 6699172.8, 370142.8 6699158.3, 370146.4 6699141.1, 370155.5 6699125.3, 370167.1 6699110.3, 370175.9 6699096, 370186.5 6699084.9, 370198.2 6699073.5, 370212.3 6699061.7, 370223.8 6699048.2, 370236.1 6699038.3, 370246.8 6699031.8, 370258.4 6699025.1, 370268.9 6699022.8, 370283.5 6699022.4, 370295.8 6699023.4, 370307.7 6699025.6, 370319.7 6699027.9, 370324.8 6699029, 370335.1 6699030.1, 370346.4 6699028.3, 370357.5 6699024.5, 370368.6 6699017.3, 370377.5 6699009.6, 370385.8 6699000.1, 370395.8 6698984.4, 370401.5 6698973.7, 370404.3 6698958.5, 370405.4 6698940.5, 370405.1 6698924.6, 370404.8 6698910.1, 370405.3 6698901.9, 370407.1 6698889.8, 370412.5 6698875.2, 370417.9 6698865.9, 370427 6698854.8, 370442.2 6698838.1, 370458.8 6698821.6, 370479.6 6698809.1, 370510.6 6698790, 370516.5 6698786.3, 370527.9 6698778.5, 370546.2 6698764.7, 370561.4 6698754.3, 370590.8 6698727.9, 370609 6698714.6, 370629.5 6698697.7, 370646.9 6698683.2, 370668.6 6698658.4, 370686.1 6698640.7, 370699.9 6698630.3, 370711.6 6698624.1, 370717.2 6698615.4, 370722.9 6698606.8, 370725.3 6698603.2, 370736.3 6698586.8, 370763.3 6698551.2, 370760.9 6698549, 370752.7 6698541.8, 370746.4 6698533, 370740 6698521.5, 370737.3 6698510.1, 370733.7 6698495.6, 370730 6698479.2, 370725.1 6698465.1, 370717.6 6698450.3, 370711.3 6698438.8, 370704.8 6698425.7, 370698.9 6698412.3, 370694.7 6698400.3, 370693.1 6698396.9, 370690.4 6698385.8, 370690.1 6698381.6, 370689.7 6698378.9, 370689.7 6698375.7, 370689.9 6698372.4, 370689.6 6698367.1, 370685.9 6698361.3, 370685.7 6698361, 370684.5 6698350.1, 370684.4 6698346.3, 370684.1 6698343.1, 370684.3 6698339.9, 370684.8 6698336.5, 370684.9 6698332.2, 370684.8 6698330.4, 370684.9 6698329, 370686.3 6698320.7, 370705.4 6698310.5, 370744 6698238.3, 370755.6 6698160.2, 370714.5 6698143.1, 370429.7 6698097, 370157.4 6698006.9, 369858 6697854.9, 369733.2 6697752.2, 369606.6 6697637.4, 369405.6 6697505.7, 369403.6 6697504.4, 369397.2 6697500.1, 369235.8 6697383.1, 369090 6697277.2, 369049.7 6697242, 369033.6 6697227.8, 369017.8 6697193.8, 369005.3 6697166.5, 368972.3 6697154.1, 368886.8 6697113.9, 368877.3 6697108.6, 368866.5 6697102.5, 368783.2 6697055.4, 368766.6 6697045.5, 368762.3 6697043, 368676.4 6696992.2, 368550.2 6696915.2, 368546.6 6696912.6, 368533 6696903.2, 368425.6 6696827.5, 368313.5 6696732.9, 367975.1 6696485.9, 367893.6 6696426.5, 367842.7 6696389.9, 367683 6696288.3, 367512.9 6696190.2, 367445.6 6696149.1, 367395.4 6696097.8, 367270.7 6695952.9, 367165.7 6695893, 367050.2 6695837.2, 367045.8 6695832.8, 367039.2 6695827.1, 367028.3 6695817.8, 367019.1 6695808.4, 367016.6 6695805.8, 366989.7 6695773.6, 366976.6 6695754.5, 366964.9 6695736.7, 366949.5 6695714.1, 366931.7 6695693.1, 366912.3 6695672.8, 366890.4 6695653.5, 366845 6695609.6, 366822.1 6695589.1, 366789.4 6695557.9, 366767.6 6695537.9, 366748.3 6695517.6, 366728.2 6695496.9, 366704.3 6695468.5, 366683.6 6695442.4, 366656.6 6695411.4, 366634.6 6695387.2, 366607.8 6695359.5, 366588 6695338.6, 366569 6695317.8, 366550.8 6695297, 366534.8 6695278.5, 366520 6695255, 366507.3 6695231, 366494.1 6695205.2, 366479.9 6695167.1, 366469.1 6695139.3, 366455.1 6695106.3, 366431.7 6695048.6, 366418.2 6695025, 366405.8 6695004, 366396.2 6694986.9, 366391.6 6694978.1, 366381.4 6694958.2, 366370.8 6694938.7, 366358.2 6694910.5, 366344.6 6694881.8, 366332.5 6694850.1, 366318.2 6694817.3, 366300.8 6694780.4, 366284.6 6694752.3, 366264.8 6694720.9, 366221.3 6694665.5, 366191.8 6694635.1, 366170.3 6694609.4, 366149.9 6694580.5, 366128.6 6694554, 366116 6694532.6, 366110.4 6694522.8, 366095.5 6694498.6, 366082.1 6694474, 366032.3 6694426.6, 365980.5 6694388, 365918.8 6694322.9, 365810.3 6694242.6, 365720 6694206.1, 365615.7 6694163.9, 365598.7 6694157.1, 365453.1 6694092.5, 365250.5 6693991, 365239.7 6693985.6, 365230.7 6693982.3, 365096.9 6693934.5, 365014.1 6693904.7, 364962.9 6693870.1, 364952.3 6693863, 364912.7 6693836.3, 364900 6693827.7, 364893 6693823.1, 364859.6 6693800.6, 364816.2 6693771.4, 364814.1 6693769.9, 364724.4 6693706, 364723.1 6693705.1, 364706.6 6693693.3, 364655.8 6693657.2, 364626 6693635.3, 364492.8 6693537.9, 364459.5 6693513.6, 364354.6 6693442, 364095.1 6693148.8, 363801.5 6692832.8, 363789.4 6692817.3, 363657.5 6692720.5, 363597.7 6692651.5, 363511.2 6692564.8, 363387.4 6692448.4, 363359.9 6692426.6, 363131.4 6692193.6, 363007.2 6692103.6, 362976.9 6692094, 362894.1 6692033.5, 362721.3 6691902.1, 362871.1 6691766.5, 362900.8 6691726.1, 362913.4 6691709, 362935.3 6691679.3, 362957.3 6691649.7, 362987.7 6691609, 363019.4 6691558.5, 363070.5 6691461.4, 363075.6 6691451.6, 363098.9 6691458, 363134.5 6691390, 363139.9 6691375.9, 363147.6 6691390.3, 363153.7 6691399.1, 363160.9 6691388.1, 363234 6691318.9, 363272.9 6691279.7, 363289.7 6691262.8, 363289 6691241.1, 363349.3 6691202.5, 363376.1 6691148, 363418 6691058.8, 363423.1 6691050.4, 363480.4 6690942.4, 363510.8 6690893, 363558.4 6690803.7, 363614.6 6690699, 363613.1 6690692, 363617.3 6690689.4, 363681.3 6690569.6, 363706.5 6690526.7, 363745.4 6690447.1, 363760.2 6690418.6, 363783.3 6690372.5, 363791.9 6690355.3, 363801.7 6690335.5, 363810.9 6690326.3, 363815.3 6690318, 363835.7 6690279.9, 363901 6690157.5, 363907.7 6690145, 363934 6690095.7, 363938.3 6690085.1, 363982.4 6689979.2, 364042.2 6689873.1, 364060.7 6689852.3, 364080.8 6689816.1, 364082.9 6689810, 364082.6 6689803.2, 364075.3 6689786, 364073.5 6689778.5, 364073.9 6689774.1, 364076.6 6689770, 364105.9 6689755.5, 364103.6 6689739.5, 364101.7 6689727, 364101 6689717.8, 364100.5 6689707.5, 364100.8 6689699.5, 364101.8 6689691.8, 364104.1 6689678.3, 364106 6689665.3, 364107.4 6689651.2, 364108.5 6689641.2, 364109 6689629.4, 364109.4 6689612.1, 364109.7 6689597.3, 364109.7 6689596.6, 364123.7 6689548.8, 364126.6 6689519.6, 364129.6 6689493.1, 364134.1 6689469.7, 364138.5 6689456.5, 364143.9 6689443.3, 364145.5 6689430.1, 364144.1 6689418.8, 364137.7 6689390.3, 364130.3 6689359.2, 364125.5 6689324.8, 364125 6689320.8, 364122.8 6689317.8, 364115.1 6689307.8, 364068.3 6689275.5, 364070.1 6689264.2, 364069 6689236.5, 364067.8 6689219.4, 364065.9 6689201.8, 364064.3 6689187.7, 364061.1 6689137, 364060.7 6689112.8, 364061.4 6689105.7, 364061.7 6689099.6, 364060.4 6689095.7, 364058.5 6689089.4, 364056.2 6689071, 364055.5 6689050.7, 364054.4 6688998.3, 364049.8 6688954.4, 364044.7 6688955.7, 364035.3 6688959.5, 364024 6688965.7, 363990.4 6688988.8, 363940 6689023.7, 363927.1 6689032.3, 363920.9 6689037.3, 363915.1 6689042.1, 363909.2 6689048.8, 363904.3 6689054, 363899.3 6689060.9, 363894 6689069.7, 363888.5 6689081.5, 363882.3 6689093.4, 363878.1 6689101.8, 363876.9 6689104.3, 363870.5 6689122.7, 363862.3 6689140.7, 363855.1 6689152.1, 363844.9 6689162.7, 363835 6689171.6, 363825.4 6689178.1, 363816 6689183.5, 363808.1 6689186.7, 363802.7 6689173.3, 363766.6 6689108.4, 363758.3 6689092.7, 363751 6689080.7, 363745.8 6689073.7, 363740.6 6689067.1, 363734.2 6689061.7, 363723 6689050.5, 363711.5 6689042, 363702.8 6689033.4, 363699 6689025.1, 363697.9 6689020.8, 363689.4 6689007.5, 363673.8 6688981.8, 363666.7 6688967, 363665.7 6688961.7, 363665.3 6688953.6, 363665.8 6688950.5, 363669.8 6688937.9, 363636.7 6688887.4, 363618 6688856.5, 363694.1 6688811.9, 363703.9 6688710.7, 363707 6688677.8, 363697.2 6688678.1, 363677.1 6688674.8, 363660.2 6688667.2, 363635.2 6688652.3, 363614.6 6688640.9, 363608.4 6688636.1, 363583.6 6688612.7, 363558.3 6688586.7, 363548.2 6688573.8, 363537.2 6688563.1, 363528.9 6688557.6, 363507.1 6688540, 363483.8 6688526.7, 363479.7 6688525.3, 363468.2 6688522.7, 363442.3 6688520.4, 363437.4 6688519.3, 363429.5 6688516.2, 363425.5 6688514.2, 363414.9 6688506.6, 363409.9 6688499.9, 363405.2 6688490.6, 363395.2 6688473.1, 363391.2 6688462.5, 363390 6688457.5, 363389.4 6688453.3, 363390.3 6688437.3, 363390 6688431.6, 363388.5 6688426.5, 363379.9 6688412, 363372.4 6688404.1, 363365.9 6688395.2, 363362.6 6688389.9, 363358.8 6688380.2, 363353.2 6688371.2, 363352.1 6688368.3, 363355.5 6688348.4, 363355.1 6688314.5, 363355.7 6688308.8, 363357.1 6688302.8, 363360.2 6688299.2, 363378.7 6688284.8, 363383.7 6688279.7, 363393.2 6688267.8, 363400 6688261.7, 363430.3 6688235.8, 363445.4 6688221.8, 363455.2 6688214.1, 363456.2 6688209.5, 363455.6 6688205, 363450.6 6688187.5, 363444.1 6688135.7, 363442.2 6688100.7, 363441.3 6688078.2, 363443.8 6688010.7, 363443.9 6687970.1, 363445.2 6687953.5, 363447 6687891, 363447.2 6687830.5, 363445.5 6687820.9, 363442.8 6687823.1, 363440.3 6687823.6, 363436.8 6687823.2, 363432 6687824.4, 363443.9 6687753.5, 363417.5 6687722.8, 363419.9 6687692.5, 363416.8 6687687.8, 363417.4 6687657.4, 363419.4 6687642.5, 363417.7 6687634.9, 363417.5 6687626.8, 363423 6687621.7, 363425.4 6687616.5, 363422.1 6687608.3, 363421.4 6687602.8, 363424.7 6687591.5, 363426.4 6687572.9, 363442.4 6687560.8, 363448.7 6687557.5, 363453.3 6687550.1, 363462.5 6687525.6, 363463.5 6687518.6, 363459.8 6687508.9, 363454.8 6687501.2, 363450.5 6687496.9, 363448.5 6687489.6, 363453.5 6687456.6, 363448.9 6687442.2, 363483.8 6687419.7, 363446.9 6687331.7, 363454.3 6687323.9, 363469.8 6687336.7, 363484.1 6687329.6, 363493.4 6687327, 363496.9 6687314.6, 363476.4 6687221.7, 363456.7 6687152.6, 363471 6687056.5, 363483.6 6687048.4, 363488.1 6687027, 363519.7 6687022.9, 363511.5 6686946.5, 363538.1 6686875.7, 363538 6686874.2, 363533.7 6686867.1, 363523 6686853.7, 363514.5 6686845.2, 363499 6686832.7, 363487.3 6686821.5, 363502.4 6686796.7, 363444.7 6686724.9, 363431.2 6686709.5, 363422.2 6686685.6, 363420.5 6686666.7, 363417.9 6686648, 363418 6686628.2, 363423.7 6686610, 363434.5 6686590.7, 363443.8 6686583.3, 363447.4 6686580.2, 363467.5 6686567.3, 363479.6 6686554.2, 363481.1 6686546.7, 363488.7 6686538.5, 363503 6686520.3, 363519.4 6686492.7, 363526.6 6686479.9, 363529.9 6686474, 363544.4 6686447.3, 363553.3 6686431, 363554.7 6686428.4, 363573.2 6686394.8, 363569.1 6686340, 363567.4 6686317.2, 363567.3 6686315.4, 363559 6686313, 363551.1 6686307.6, 363545 6686298.7, 363543.2 6686287.5, 363550.2 6686220.3, 363554.1 6686172.3, 363556.2 6686164.7, 363562.5 6686156, 363557.3 6686116.2, 363556.7 6686112.3, 363553.1 6686084.6, 363551.9 6686076.3, 363540.9 6685992.4, 363527.2 6685889.4, 363513.4 6685786.9, 363507 6685788.5, 363488.7 6685797.3, 363478.9 6685803.5, 363475.9 6685785.6, 363474.7 6685768.7, 363477.1 6685755.9, 363485.6 6685726.5, 363513.3 6685636.6, 363518.5 6685619.6, 363523 6685600.8, 363526.2 6685590.8, 363530.1 6685578.8, 363530.4 6685562.5, 363612.3 6685552.6, 363677.7 6685544.7, 363682 6685544.2, 363714.1 6685541.4, 363766.2 6685535, 363806.2 6685529.3, 363868.5 6685518.8, 363924.4 6685507.1, 363984.1 6685493.8, 364004.1 6685489, 364043.7 6685484.6, 364053.2 6685481.4, 364069.9 6685475.7, 364083.1 6685473.3, 364120.4 6685466.3, 364167.1 6685457.8, 364217.2 6685449, 364225.3 6685447.9, 364262.6 6685442.3, 364284.9 6685439.8, 364296.9 6685438.2, 364350.1 6685431.5, 364408.5 6685424, 364424.4 6685421.7, 364481.2 6685415, 364497.2 6685412.5, 364524.7 6685408.8, 364540.8 6685406.8, 364561.5 6685403.2, 364576.4 6685400.1, 364587.8 6685396.6, 364612.8 6685389, 364631.6 6685382.9, 364665.9 6685371.6, 364698.1 6685361, 364728.9 6685351.4, 364777.5 6685335.4, 364799.6 6685328.4, 364813.1 6685324.2, 364828.7 6685318.6, 364872.3 6685304.5, 364916.5 6685290.3, 364954.8 6685277.4, 364992.7 6685264.7, 365029.2 6685252.4, 365048.8 6685245.7, 365063.6 6685239.7, 365141.7 6685212.2, 365198.9 6685191.7, 365216.3 6685185.5, 365302.9 6685155.2, 365377.1 6685128.3, 365416.9 6685114.8, 365454.9 6685101.1, 365561.9 6685064.3, 365637.8 6685039, 365683.4 6685023.8, 365707.5 6685014.6, 365728.8 6685005, 365752.2 6684993.5, 365764.3 6684987.2, 365775.8 6684982.2, 365789.5 6684974.5, 365810.1 6684963.1, 365830.1 6684955, 365857.2 6684947.2, 365866.6 6684945.3, 365879.9 6684942.3, 365891 6684935, 365892.3 6684926.7, 365895.6 6684907, 365896.7 6684900.4, 365894.4 6684890.1, 365883.9 6684850.7, 365882.4 6684845, 365931.4 6684746.2, 365975.4 6684631, 365990.2 6684605.9, 366004.9 6684565.8, 365936.8 6684513.5, 365918.8 6684471.5, 365884.7 6684430.9, 365871.3 6684413.5, 365864.3 6684405.6, 365856.1 6684396.9, 365837.1 6684384, 365867.7 6684364.8, 365871.2 6684327.6, 365777.6 6684260.8, 365761 6684279.1, 365687.1 6684271.7, 365661.3 6684253.3, 365642.3 6684265.4, 365634.1 6684253.1, 365631.5 6684249.3, 365628.9 6684245.5, 365628.2 6684244.5, 365620.3 6684232.9, 365609 6684214.1, 365587.4 6684183, 365570.3 6684152.2, 365564.1 6684130.5, 365561.9 6684122.6, 365560.4 6684116.7, 365558.2 6684108.2, 365553.4 6684088.3, 365552 6684081.4, 365548.2 6684079.8, 365536.9 6684071.6, 365526.5 6684066.9, 365512.3 6684062.7, 365496.2 6684062.5, 365485.7 6684064.1, 365477.4 6684065.6, 365469 6684065.7, 365460 6684064.6, 365452.6 6684054.9, 365451.8 6684044.4, 365452 6684036.7, 365449.9 6684025.5, 365442.9 6684009.1, 365434 6684004.2, 365427.9 6684004, 365420.3 6684006.4, 365413.6 6684009.8, 365404.6 6684012.1, 365379.6 6684005.3, 365368.1 6683998.2, 365362 6683993.7, 365352.4 6683986.7, 365336 6683970.5, 365330.4 6683964.1, 365312.4 6683939.1, 365293.7 6683919.2, 365281.5 6683907.3, 365274.7 6683898.6, 365269.2 6683891.9, 365260.1 6683887.1, 365236.7 6683879.2, 365213.1 6683871.8, 365205.9 6683867.9, 365190.4 6683857.8, 365180.2 6683850.4, 365173.8 6683844.2, 365165.2 6683836.6, 365158.5 6683830.9, 365144.6 6683818.3, 365131.3 6683807.8, 365126.2 6683804.2, 365120.5 6683796.8, 365114 6683793.5, 365099.5 6683777.9, 365089 6683754.4, 365077.8 6683733.2, 365062 6683710.7, 365040.6 6683683.2, 365026 6683660.5, 365013.5 6683640.9, 365003.5 6683625.2, 364979.9 6683601.4, 364965.7 6683586.8, 364949 6683550.6, 364923.8 6683488.1, 364917.7 6683474.6, 364917.1 6683473.1, 364913.2 6683468.2, 364869.1 6683413.4, 364842.9 6683398.2, 364830.8 6683385.2, 364824.5 6683376.5, 364813.1 6683352.9, 364809.1 6683343.5, 364798.9 6683323.6, 364788.6 6683305.4, 364765.2 6683290.8, 364756.1 6683284.9, 364747.7 6683276.3, 364738.5 6683250.5, 364736 6683242.2, 364734.4 6683235.7, 364731.4 6683221.8, 364727 6683208.8, 364724.9 6683201.5, 364723.5 6683195.9, 364723 6683188.3, 364722 6683181.1, 364720.7 6683174.7, 364719.6 6683170.3, 364718.5 6683164.1, 364715.1 6683157.2, 364712.9 6683152, 364711.2 6683144.6, 364710.9 6683139.5, 364713.6 6683124, 364713.5 6683113.9, 364711.3 6683105.4, 364709.5 6683095.2, 364707.2 6683074.1, 364707.3 6683054, 364707.5 6683032.1, 364700.5 6683001.9, 364694.1 6682985, 364688.5 6682974.3, 364683.4 6682959.8, 364676 6682942.5, 364668.6 6682924.3, 364663.2 6682915.3, 364658.5 6682901.4, 364657.5 6682889.8, 364655.1 6682882.5, 364652.3 6682873, 364651.8 6682859.6, 364651.7 6682845.5, 364644.2 6682826.9, 364631.1 6682791.5, 364620 6682767, 364614.1 6682753.3, 364611.2 6682746.5, 364608.3 6682735.7, 364612.6 6682723.2, 364617.7 6682715.6, 364616.9 6682705.9, 364616.4 6682703.2, 364612.9 6682685.9, 364611.1 6682678.2, 364608.4 6682673.8, 364605.7 6682669.1, 364606.2 6682658.2, 364608.6 6682647.6, 364609 6682632, 364600.4 6682612.4, 364586.3 6682588.5, 364561.6 6682587.6, 364545.4 6682570.5, 364531.4 6682548.5, 364510.7 6682531.8, 364507.6 6682518.3, 364493.6 6682514.7, 364487 6682520.8, 364480.5 6682525.7, 364466.5 6682528.1, 364447 6682528.3, 364437.8 6682525.1, 364423 6682527.3, 364380.2 6682497.6, 364368.1 6682449.9, 364335.7 6682417.1, 364322.2 6682410.8, 364309.6 6682409.9, 364269.1 6682417.1, 364243 6682420.2, 364225.4 6682401.3, 364213.7 6682375.2, 364211.9 6682351.4, 364216.9 6682325.4, 364218.2 6682303.4, 364220.1 6682283.7, 364218.9 6682266.4, 364214.2 6682254.6, 364203.1 6682245.3, 364190.5 6682241.5, 364179.2 6682243.2, 364171.6 6682240.8, 364167.6 6682231.2, 364168.4 6682216.5, 364173 6682202.3, 364175.3 6682189.8, 364174 6682180.1, 364166.6 6682172.4, 364155.6 6682169.6, 364145.3 6682165.6, 364136.3 6682158.7, 364131.2 6682147.5, 364130.5 6682135.9, 364131.7 6682124.4, 364130.8 6682116, 364123.5 6682109, 364115 6682104.6, 364107.5 6682105, 364102.4 6682104.6, 364098.1 6682097.1, 364091.4 6682091.9, 364084.9 6682089.8, 364078.7 6682091.8, 364073.8 6682101.2, 364071.5 6682111.4, 364067.5 6682119.8, 364060.5 6682126, 364053.7 6682126.4, 364032.4 6682103.9, 364004.4 6682074.5, 363990.9 6682060.3, 363967.8 6682090.9, 363941.1 6682146.3, 363926.8 6682179.6, 363889.7 6682196.9, 363794.1 6682065.9, 363758.3 6682033.3, 363709.8 6681989.1, 363608.5 6681904.7, 363570.3 6681884.7, 363564.8 6681881.7, 363529.2 6681876.9, 363490.3 6681903.3, 363473.1 6681913.1, 363409.6 6681949.2, 363389.9 6681956.8, 363386.8 6681957.5, 363375.5 6681924.2, 363365.4 6681888.4, 363358.4 6681861.6, 363349.2 6681794.9, 363347.8 6681770.1, 363350.4 6681731.6, 363349.6 6681715.6, 363347.5 6681703.5, 363341.3 6681686.2, 363330.7 6681664, 363314.9 6681632.2, 363304 6681612.1, 363271.2 6681615.5, 363259.9 6681613.8, 363245.9 6681609.9, 363227.6 6681600.4, 363195.2 6681577.4, 363165.4 6681561.6, 363139.7 6681551.1, 363119.5 6681540.9, 363112.7 6681534.6, 363105.7 6681526.4, 363101.5 6681516.5, 363097.5 6681500.7, 363095.8 6681481, 363095.3 6681460.9, 363097.9 6681444.7, 363107.3 6681419.8, 363138.4 6681362.9, 363172.3 6681311.6, 363194.5 6681281.8, 363227.3 6681254.2, 363253.4 6681234.2, 363271.1 6681219.6, 363293.3 6681195.2, 363305.9 6681185.4, 363316.9 6681180.2, 363330.3 6681177.9, 363345.2 6681176.1, 363367.2 6681178.8, 363399.1 6681185.1, 363432.3 6681188.2, 363452.4 6681186.8, 363483.5 6681159.4, 363480.6 6681124.5, 363473.2 6681082.3, 363477.7 6681061.7, 363498.4 6681047.1, 363547.6 6681052.4, 363594.5 6681050.4, 363629.6 6681036.9, 363661.8 6681031.3, 363698.6 6681053.4, 363708.9 6681041.6, 363712.9 6681034.6, 363718.5 6681033.3, 363727.6 6681024.5, 363729.5 6681021.6, 363727.8 6681017.5, 363728.2 6681013.6, 363725.2 6681009.7, 363726 6681004.5, 363722.8 6680998.5, 363722.2 6680992.4, 363720.4 6680983.3, 363721.5 6680974, 363719.9 6680971.3, 363719.3 6680964.9, 363716.1 6680958.6, 363708.9 6680941.2, 363707.2 6680940.1, 363704.5 6680940.8, 363700.3 6680933.1, 363697.1 6680933.4, 363690.2 6680919.6, 363686.6 6680903.1, 363686.2 6680898.5, 363687.7 6680888.8, 363685.2 6680883.9, 363680.8 6680880.6, 363674.1 6680871.3, 363676.1 6680862.2, 363668.4 6680849.1, 363667.6 6680841, 363665.4 6680836.8, 363657.2 6680824.5, 363655.4 6680820.6, 363655.5 6680815.8, 363656.5 6680812.3, 363649.9 6680789.9, 363646.5 6680765.9, 363645.5 6680740.2, 363643.6 6680731.9, 363640.6 6680711.5, 363644.1 6680676, 363657 6680664.8, 363661.6 6680664.2, 363662.1 6680641.5, 363666.2 6680570.7, 363667.6 6680550.6, 363669.4 6680543, 363669.4 6680538.2, 363668.4 6680528.8, 363663.4 6680527.1, 363653.1 6680528.9, 363648.1 6680528.9, 363643.4 6680527, 363647.2 6680517, 363650.5 6680494, 363654.1 6680479.6, 363658.2 6680466.8, 363666.3 6680434.7, 363669.2 6680425.6, 363669.3 6680419.5, 363672.8 6680416.3, 363673.3 6680412.2, 363669.9 6680404, 363669.9 6680401.8, 363670.5 6680400.3, 363673.1 6680397.3, 363679.2 6680398.6, 363684.6 6680396.3, 363692.6 6680397.6, 363693.7 6680397.3, 363696.1 6680390.4, 363689.7 6680376.2, 363690 6680371.6, 363687.4 6680367.9, 363686.7 6680362.2, 363679 6680349.9, 363674.8 6680341.1, 363664.9 6680327.7, 363662.7 6680325.2, 363658.2 6680322.3, 363654 6680314.3, 363650.7 6680310, 363643.8 6680303.7, 363637.8 6680296.2, 363628.6 6680291, 363624.6 6680285.3, 363612.5 6680278.5, 363605.5 6680273.3, 363591.9 6680261.9, 363587.4 6680259.5, 363582.5 6680255.6, 363579.9 6680253, 363576.5 6680245.7, 363573.4 6680240.6, 363569.8 6680236.9, 363560.7 6680228.9, 363554.9 6680221.3, 363546.6 6680212.8, 363538.8 6680201.6, 363534.7 6680196.7, 363519.9 6680179.9, 363512.2 6680174.2, 363508.8 6680166.9, 363502.2 6680165.6, 363497 6680159, 363492.2 6680154.2, 363485.6 6680152.4, 363479.7 6680147.3, 363473 6680142.8, 363466.3 6680139.3, 363463.3 6680134.5, 363458.2 6680129.6, 363450.2 6680123.5, 363446.1 6680117.5, 363438.8 6680112.1, 363425.3 6680103.3, 363412.1 6680096.4, 363409 6680093.3, 363405.1 6680085.2, 363405.6 6680081.3, 363401.1 6680075.1, 363396.7 6680071.4, 363391.1 6680067.9, 363384.9 6680067, 363378.6 6680064.5, 363377.4 6680063.4, 363374.3 6680057.8, 363361.7 6680053.7, 363354.5 6680048.7, 363342.6 6680039.3, 363333.9 6680033.9, 363323.7 6680029.2, 363319.1 6680025.5, 363313.8 6680022.6, 363304.3 6680013.9, 363301 6680011.8, 363288.4 6679999.9, 363275 6679988.6, 363272.7 6679983, 363270.3 6679981, 363261.9 6679972, 363253.5 6679964.6, 363236.2 6679951.4, 363212.5 6679936.4, 363186.5 6679921.1, 363159.9 6679909.3, 363160.9 6679907.6, 363149.4 6679894.5, 363142.5 6679884.7, 363135.1 6679875.7, 363105.7 6679868.2, 363093.2 6679860.2, 363078.8 6679848.9, 363054.7 6679821.7, 363042.6 6679809.2, 363036.5 6679800.6, 363024.5 6679786.5, 363021 6679767.2, 363017.5 6679754.9, 363044.3 6679725.3, 362986.9 6679626, 362987.3 6679613.9, 362883.4 6679598.7, 362805.3 6679592.7, 362770.7 6679588.5, 362716.5 6679572.8, 362681 6679568.7, 362641.6 6679566.7, 362679.2 6679497.7, 362696.7 6679461.7, 362709.8 6679431.8, 362722.1 6679394.5, 362767.8 6679224.6, 362771.1 6679208.7, 362795.4 6679122.7, 362765.8 6679114, 362712.5 6679097, 362692.9 6679088.8, 362659.1 6679028.5, 362644.8 6678999.7, 362605.1 6678897.1, 362567.1 6678899.5, 362548 6678875.7, 362538.2 6678857.3, 362531.8 6678827.8, 362543.9 6678794, 362530.6 6678760.5, 362482.8 6678681.7, 362447.6 6678636.5, 362441 6678624, 362432.6 6678598.1, 362391.1 6678536.6, 362381.1 6678525.7, 362332.3 6678508.1, 362316.1 6678501.6, 362293.7 6678485.4, 362266.1 6678514.3, 362208.7 6678561, 362189.2 6678576, 362168.9 6678585.9, 362157.5 6678590.2, 362144 6678589.4, 362123.4 6678581.8, 362095.2 6678563.4, 362087.7 6678561.7, 362069.6 6678562.3, 362050.2 6678566.4, 361991.5 6678572.2, 361975.3 6678570.6, 361967.8 6678567.6, 361936.3 6678548.3, 361919.4 6678537.4, 361904 6678548.1, 361893.8 6678562.6, 361876.3 6678608.4, 361835.9 6678676.5, 361812.4 6678714.1, 361769.4 6678748.1, 361759.3 6678754.4, 361749.8 6678734.7, 361748.4 6678730.5, 361748.2 6678710.1, 361720.6 6678696.7, 361703.3 6678687, 361689.3 6678662.3, 361690.1 6678659.4, 361681.1 6678653.3, 361655.5 6678634.3, 361630.9 6678644.5, 361601.7 6678533.2, 361620.6 6678522, 361610.3 6678481.8, 361607.8 6678480.7, 361604.3 6678474.2, 361600.6 6678462.2, 361596.3 6678453.3, 361587 6678460.6, 361513.8 6678442.2, 361420.5 6678412, 361415.4 6678410.1, 361412.2 6678408.4, 361427.2 6678337.3, 361313.3 6678356, 361313.3 6678345.4, 361309.3 6678257.4, 361171.9 6678268.9, 361180 6678211.4, 361003.1 6678222.2, 360987.2 6678222.4, 360968.5 6678136.1, 360861.9 6678216.7, 360830.8 6678241.3, 360808.7 6678255, 360778.5 6678267.7, 360775.1 6678268.8, 360762.1 6678263.9, 360743.2 6678302.5, 360739.2 6678313.6, 360734.7 6678331.2, 360730.1 6678347.3, 360724.2 6678362.6, 360720 6678371.9, 360713.7 6678382.8, 360695.2 6678413.5, 360661.3 6678471, 360659.7 6678474.1, 360658 6678479.4, 360653.8 6678479, 360647.1 6678478.3, 360641 6678476.5, 360635.6 6678474, 360619.8 6678465, 360568.9 6678434.6, 360509.7 6678550.2, 360460.4 6678625.6, 360455.5 6678640.6, 360475.6 6678660.4, 360566 6678714.7, 360566.2 6678734.6, 360526.5 6678774.9, 360481.6 6678785.3, 360423.1 6678811, 360410.7 6678817.3, 360362.6 6678855.1, 360348.7 6678872.4, 360339.4 6678889.7, 360338 6678905.3, 360292.9 6678916.7, 360228.6 6678997.2, 360194.1 6679062.4, 360191.1 6679239, 360181.7 6679268.8, 360131 6679280.1, 360085.1 6679277.4, 360014.2 6679263.8, 359993.4 6679264.1, 359952.8 6679275.7, 359932.2 6679284.5, 359914.2 6679298.7, 359898.6 6679318, 359862.2 6679362.1, 359834.4 6679397.1, 359804.3 6679432.2, 359781.5 6679469.1, 359761 6679500.7, 359757.6 6679515.9, 359759 6679526.6, 359759.7 6679532.3, 359759.8 6679537.9, 359759.5 6679544.5, 359756.2 6679550.6, 359749.1 6679562.2, 359728.6 6679584.3, 359706.3 6679606.2, 359683.6 6679637.5, 359659.6 6679672.2, 359643.7 6679699.6, 359621.4 6679745.1, 359601 6679793.4, 359593.2 6679811.8, 359589.6 6679824.6, 359585.5 6679846.6, 359576.5 6679890.2, 359575.6 6679894.1, 359563.7 6679910.3, 359540.5 6679944.8, 359536.8 6679948.6, 359524 6679950.1, 359476.8 6679932.3, 359465.5 6679929.4, 359457.1 6679928.6, 359446.7 6679929.9, 359425.8 6679933.8, 359415.9 6679936.4, 359402 6679940, 359395.4 6679941.3, 359391.4 6679941.6, 359386.3 6679940.8, 359382 6679939, 359379 6679937.3, 359375.8 6679935.6, 359372.2 6679934.2, 359368.9 6679933.2, 359366 6679932.8, 359360.7 6679934.6, 359357.4 6679936.5, 359354 6679939.7, 359352.3 6679942.8, 359351.2 6679946.7, 359350.4 6679949.6, 359350.1 6679953.3, 359350 6679956.8, 359348.7 6679961, 359346.4 6679964.1, 359340.5 6679967.7, 359327.4 6679973.3, 359319.9 6679974.2, 359310.5 6679974.6, 359305.9 6679974.8, 359302 6679974.9, 359298.4 6679973.9, 359295 6679972.2, 359291.2 6679969.6, 359287.1 6679965.5, 359283.9 6679962.2, 359281.1 6679959.5, 359276.6 6679954.1, 359272.5 6679950.6, 359267.5 6679948.6, 359261.2 6679947.3, 359252.2 6679946.2, 359245.6 6679945.5, 359240.8 6679945.5, 359236.4 6679946.5, 359228 6679950.3, 359214.5 6679958.3, 359209.5 6679961.6, 359206.4 6679963.4, 359203.3 6679965, 359199 6679965.6, 359192.4 6679965.9, 359185 6679965.2, 359178.7 6679964.1, 359174.2 6679961.7, 359156.4 6679952.4, 359151.2 6679949.1, 359144.9 6679945.6, 359140.7 6679943, 359136.5 6679941.1, 359132.6 6679940.1, 359125.9 6679940.1, 359107.7 6679943.9, 359082.8 6679948.6, 359071.7 6679948.8, 359060 6679948, 359054.2 6679949.2, 359046.9 6679949.9, 359032.1 6679951.5, 359007.5 6679953.5, 358972.7 6679958.5, 358947.4 6679961.9, 358933.8 6679964, 358928.5 6679964.7, 358925.7 6679965.1, 358923.5 6679964.9, 358920 6679964.5, 358914.7 6679962, 358912.8 6679960.6, 358909.9 6679957.5, 358903.8 6679953.3, 358900.8 6679952.6, 358898.3 6679952.7, 358896.7 6679952.9, 358894.1 6679955.4, 358892.6 6679958.2, 358891.8 6679960.8, 358891.2 6679963.2, 358889.8 6679965.6, 358885 6679971, 358874.3 6679972.8, 358853.9 6679973.6, 358818.8 6679973.6, 358793.6 6679974.7, 358759.5 6679973.8, 358736.8 6679972.3, 358713 6679968.9, 358686.7 6679963.5, 358656.4 6679958, 358632.5 6679944.6, 358562.6 6679945.1, 358477.5 6679930.9, 358455 6679919.8, 358437.4 6679911.2, 358429.3 6679887.6, 358422 6679866.4, 358409.4 6679844.8, 358398.9 6679805.5, 358397.7 6679798.4, 358392.2 6679792.6, 358390.7 6679790, 358389.4 6679787.6, 358389.1 6679785.4, 358389.6 6679783, 358389.9 6679778.8, 358389.2 6679774.3, 358388.1 6679771.5, 358384.8 6679767.3, 358383.1 6679763.4, 358383.4 6679759.7, 358384.7 6679755.2, 358385.7 6679746, 358387.7 6679736.1, 358389.8 6679730.9, 358390.6 6679723.6, 358390.2 6679712.6, 358391.3 6679689, 358390.4 6679668, 358390.6 6679644.1, 358392.6 6679627.9, 358391.2 6679587.5, 358387.4 6679548.9, 358386.2 6679511.7, 358382.5 6679481.4, 358382.7 6679478.3, 358383.5 6679474.3, 358384 6679469.7, 358383 6679460.8, 358382.2 6679445.4, 358380.1 6679434.9, 358374.4 6679425.2, 358361.7 6679413.9, 358332.6 6679390.1, 358280.5 6679357.8, 358242.3 6679338.4, 358214.7 6679330.8, 358195.1 6679328.6, 358176 6679320.4, 358160.6 6679314.2, 358149.5 6679311, 358139.9 6679307.2, 358128 6679297.1, 358119 6679292.6, 358114.1 6679288.8, 358089.4 6679266.1, 358081.9 6679255.2, 358076.9 6679237, 358075.5 6679226.1, 358073.7 6679222.3, 358070.9 6679219.7, 358063.5 6679219.1, 358026.9 6679215.9, 357984.5 6679216.1, 357978.7 6679217, 357972.8 6679220.9, 357962.4 6679229.7, 357955.8 6679239, 357945.9 6679256.9, 357940.7 6679262.2, 357933.9 6679264.6, 357918.5 6679266.6, 357905.7 6679265.3, 357890.8 6679264.4, 357881 6679263.2, 357866 6679265.2, 357851.8 6679266.4, 357838.3 6679266.7, 357830.4 6679266.5, 357814.2 6679266.9, 357807.8 6679265.5, 357802.8 6679263.3, 357798.5 6679263.1, 357791.7 6679266.9, 357782.5 6679272.2, 357763.2 6679280.6, 357753.8 6679281.9, 357747.3 6679282.2, 357741.3 6679286.3, 357735.7 6679291.1, 357726.5 6679295.7, 357716.7 6679298.4, 357708 6679301.9, 357698.9 6679306.7, 357691.6 6679310.9, 357682.5 6679312.4, 357670 6679313.5, 357659.5 6679313.1, 357647.1 6679310, 357638 6679306.1, 357629 6679302, 357608.6 6679296.1, 357588.1 6679293.2, 357583.2 6679291.3, 357577.8 6679283.3, 357570.9 6679262, 357563.4 6679244, 357552.3 6679223.1, 357544 6679210.2, 357535.2 6679198.8, 357533.4 6679195.2, 357534.4 6679190.8, 357536.1 6679185.7, 357536.1 6679181.8, 357534.6 6679177.8, 357532.4 6679175.6, 357529.5 6679172.5, 357526.9 6679164.1, 357521.8 6679151.7, 357514.7 6679144.4, 357490.7 6679124.2, 357462.1 6679101.7, 357438.2 6679082.6, 357426.9 6679070.7, 357424.1 6679066.7, 357422.8 6679062.1, 357420.7 6679060.9, 357414.5 6679059.4, 357406.2 6679056.3, 357404.1 6679050.3, 357398 6679030, 357393.5 6679017.5, 357389.4 6679010.3, 357387.8 6679005.8, 357387.1 6679000.6, 357387 6678995.3, 357388.9 6678989.7, 357393.5 6678980.2, 357401.7 6678967.7, 357406.4 6678957.8, 357408.8 6678954.1, 357412 6678952.8, 357415.1 6678949.9, 357415.5 6678943.4, 357412.4 6678936.9, 357410.5 6678932.8, 357407.8 6678930.9, 357405.5 6678929.1, 357401.5 6678923.1, 357396.6 6678911.4, 357394.8 6678904.5, 357389.5 6678897, 357385.6 6678892.1, 357382.4 6678885.8, 357379.4 6678880, 357376.5 6678874.6, 357373.9 6678871.2, 357372.2 6678869, 357369.7 6678866.3, 357365.1 6678865.5, 357359.8 6678867.3, 357352.6 6678870.2, 357349.2 6678870.4, 357345.8 6678869, 357340.8 6678866.3, 357332.8 6678863.7, 357328.3 6678862.6, 357324.1 6678859.7, 357319.4 6678857.2, 357313.7 6678854.2, 357307.8 6678850.7, 357302.8 6678851, 357298.9 6678852.5, 357295 6678854.5, 357292 6678855.2, 357287.1 6678855.9, 357283.1 6678854.7, 357280.5 6678851.2, 357280.2 6678849.6, 357279.3 6678843.8, 357277.2 6678836.7, 357275.5 6678830.3, 357275.3 6678826.6, 357272.8 6678821.8, 357270.1 6678819, 357263.1 6678814.5, 357259.8 6678810.1, 357257.9 6678800.2, 357256.1 6678791.3, 357254.1 6678786.4, 357252.7 6678782.6, 357253.1 6678774.6, 357255.9 6678768.7, 357256.9 6678765.2, 357257.8 6678762, 357258.3 6678758.1, 357255.4 6678754.6, 357248.5 6678750.1, 357245.1 6678746.8, 357240.4 6678741.5, 357234.6 6678736.3, 357230.9 6678732.5, 357226.2 6678729.1, 357224.3 6678724.9, 357223.5 6678719.1, 357222.8 6678715.4, 357222.1 6678712.3, 357219.1 6678707.7, 357215.7 6678703.8, 357213 6678700.6, 357209.5 6678698.2, 357205.5 6678695.8, 357202.2 6678692.8, 357199.9 6678688.2, 357198.2 6678680.7, 357196.7 6678673.6, 357195.5 6678669.3, 357193.4 6678666.2, 357188.2 6678663.4, 357184 6678661.2, 357169.5 6678656.4, 357146.6 6678643, 357134.8 6678640.5, 357128.9 6678636.4, 357121.4 6678628.8, 357113.4 6678618.8, 357088.8 6678591.2, 357072.5 6678579.3, 357063.5 6678580.4, 357035.9 6678584.3, 357014.5 6678584.9, 356995.4 6678583.4, 356985.1 6678581.7, 356977.9 6678581.1, 356968.7 6678582.9, 356960 6678588, 356939.1 6678602.7, 356916.1 6678619.5, 356910.5 6678620.9, 356904.3 6678621, 356898.3 6678619.7, 356895.7 6678619.5, 356892.4 6678620, 356889.7 6678620.9, 356860.1 6678623, 356843 6678624.1, 356847.1 6678510.3, 356836.8 6678475.4, 356811.5 6678440.6, 356785.2 6678420.4, 356783.9 6678423.7, 356784.3 6678433.5, 356786 6678443, 356788.6 6678453, 356791.8 6678465, 356793.6 6678475, 356793.5 6678483.3, 356791.9 6678491.3, 356789.9 6678500.9, 356788.9 6678512.9, 356789 6678523, 356788.8 6678530.7, 356788 6678539.3, 356785.8 6678546.6, 356782.4 6678553.3, 356777.2 6678561.7, 356774.3 6678565.4, 356764.8 6678577.9, 356755.2 6678588.2, 356749.2 6678594.8, 356743.4 6678603.4, 356739.3 6678613.1, 356735.2 6678623.8, 356733.1 6678634.6, 356732.2 6678644.7, 356730.3 6678651.6, 356726.1 6678662, 356721.2 6678670.6, 356716.8 6678677.5, 356713.5 6678686, 356710.6 6678694.1, 356706.5 6678701.7, 356702.8 6678712, 356699.8 6678721.9, 356696.9 6678729.3, 356692 6678741, 356682.9 6678759.5, 356673.5 6678775.8, 356661.7 6678796.2, 356651.1 6678813.2, 356638.5 6678831.5, 356616.5 6678866.3, 356612.9 6678871.8, 356597.1 6678895.3, 356592.9 6678901.4, 356588.9 6678907.6, 356584.8 6678914.4, 356581.2 6678919.3, 356577.6 6678924.7, 356573.2 6678930.5, 356569.2 6678935.7, 356565.1 6678939.6, 356560.5 6678943.5, 356556.7 6678946.6, 356553.5 6678950.4, 356550.8 6678956.1, 356548.9 6678962.8, 356547.5 6678970.2, 356545.5 6678977, 356543.2 6678984.7, 356540.4 6678992.9, 356536.8 6679000.6, 356532.1 6679008.7, 356526.2 6679016.5, 356519.9 6679022.2, 356512.6 6679026.4, 356504.7 6679030.1, 356496.3 6679033.1, 356488 6679034.6, 356480.6 6679036.3, 356474.2 6679039, 356468.9 6679042.4, 356462.7 6679046.1, 356454.8 6679050.3, 356447.2 6679054.2, 356439 6679058.4, 356428.8 6679063.2, 356419.4 6679068.5, 356408.8 6679073.7, 356399.9 6679079.1, 356391.2 6679084.3, 356383.7 6679090, 356375.7 6679097.5, 356358.4 6679115.9, 356333.4 6679142.2, 356310 6679164.7, 356286.2 6679188.1, 356275.2 6679198.5, 356265 6679208.1, 356255.9 6679216.5, 356245.9 6679224.8, 356234.6 6679234.2, 356224.8 6679241, 356200.5 6679256.9, 356181.5 6679267.2, 356162.6 6679276.5, 356151.4 6679280.9, 356143 6679283.5, 356133.2 6679285.4, 356119.4 6679286.1, 356109 6679286.6, 356100.8 6679287, 356094 6679288.3, 356088.4 6679290.3, 356083.5 6679293.4, 356079 6679297.6, 356074.3 6679304.6, 356070.5 6679311.2, 356065.9 6679317.4, 356060.5 6679321.8, 356054.8 6679324.8, 356047.1 6679327.5, 356039.6 6679329.4, 356012.4 6679334.3, 355973.9 6679351.1, 355934.5 6679343.2, 355893.1 6679342.7, 355896.1 6679371.3, 355905.9 6679385.1, 355932.5 6679386.1, 355946.8 6679468.9, 355960 6679532.5, 355964.2 6679538.2, 355973.3 6679549.5, 355980.2 6679562.4, 355986.5 6679577.8, 355991.5 6679593.2, 355994.7 6679607.8, 355998.4 6679618, 356008.8 6679631.4, 356021.7 6679645.2, 356032.8 6679660.3, 356033.2 6679665.5, 356032 6679672.6, 356027.3 6679690.7, 356019.2 6679711.3, 356015.1 6679721.5, 356013.4 6679726.5, 356014.2 6679732, 356020.1 6679749.5, 356026.3 6679772.8, 356029.9 6679787.3, 356036 6679820.9, 356045.1 6679866.6, 356052.5 6679898.7, 356059.1 6679926.6, 356064.5 6679957.8, 356067.7 6679979.4, 356071.7 6680003.3, 356076.9 6680021.7, 356080.5 6680047.6, 356082.4 6680064.3, 356083.4 6680077.8, 356083.4 6680102.7, 356082.7 6680122, 356084.2 6680141.2, 356088.8 6680169.5, 356095.7 6680192.4, 356101 6680210.7, 356105.4 6680221.4, 356108.1 6680225.5, 356108.9 6680230.2, 356110.1 6680236.1, 356119.8 6680253, 356127.3 6680266.8, 356134.4 6680283.1, 356140.5 6680297.6, 356147 6680307.9, 356144 6680310.8, 356126.1 6680325.5, 356115.7 6680334.9, 356096.1 6680351, 356075.1 6680370.2, 356053.3 6680390.4, 356040.2 6680404.6, 356024.1 6680421.1, 356016.1 6680429.1, 355993.3 6680454.3, 355972.4 6680478.6, 355958.3 6680494.3, 355955.1 6680496.8, 355936.6 6680521.5, 355924.2 6680548.3, 355920.2 6680559.6, 355914.3 6680580.4, 355905.9 6680605.4, 355893.5 6680646, 355887.4 6680669.5, 355876.9 6680708.9, 355868.3 6680744.8, 355864.9 6680762.7, 355860.3 6680781.4, 355855.5 6680800.2, 355849.6 6680816, 355836.3 6680841.1, 355817.5 6680881.6, 355812.7 6680891.2, 355795.2 6680926, 355793.9 6680928.5, 355773.9 6680968.5, 355749.5 6681018.7, 355732.7 6681054.5, 355720.8 6681073.5, 355706.4 6681095.1, 355695.3 6681110, 355666.1 6681147.8, 355632.6 6681195.4, 355620.6 6681214.4, 355615.7 6681224.4, 355610.3 6681222, 355593.4 6681215.4, 355564.6 6681207.3, 355557.1 6681226.5, 355534.7 6681276.8, 355529.9 6681287.4, 355511.4 6681328.7, 355505 6681343.4, 355493.3 6681370.6, 355489.9 6681376.9, 355483.2 6681389.7, 355464.6 6681419.5, 355443.2 6681454.7, 355432.5 6681472, 355413.2 6681504.7, 355400.4 6681525.7, 355389.6 6681541.2, 355380.1 6681552.5, 355368.2 6681564.6, 355355.4 6681575.1, 355350.5 6681578.5, 355343.7 6681583.1, 355352.6 6681600.3, 355353.8 6681603.5, 355354.3 6681606, 355354 6681608.5, 355352.6 6681616, 355352.5 6681617.5, 355353.4 6681619.9, 355354.7 6681622.9, 355357.1 6681625.8, 355359.4 6681627.6, 355361.3 6681628.7, 355362.9 6681630, 355363.8 6681631.6, 355364.5 6681633.9, 355365 6681637.7, 355365.5 6681639, 355368.4 6681639.7, 355370 6681639.7, 355373.2 6681639.9, 355374.5 6681640.4, 355376 6681640.9, 355379.8 6681641.8, 355381.5 6681642.6, 355385.1 6681644.8, 355386.7 6681646.9, 355387.8 6681648.7, 355388.1 6681651.4, 355389 6681654.5, 355391.8 6681658.2, 355392.5 6681659.5, 355393.7 6681661.6, 355394.7 6681663.1, 355396.2 6681664.9, 355398.1 6681666.7, 355399.6 6681667.3, 355401.4 6681667.7, 355403.9 6681667.5, 355405.5 6681667.4, 355408.5 6681668.7, 355410.3 6681668.7, 355411.4 6681669.4, 355412 6681671.1, 355412.1 6681673.4, 355411.8 6681676.2, 355412.4 6681680.3, 355412.6 6681685, 355413.3 6681688.2, 355417 6681692.6, 355419.4 6681693.8, 355421 6681695.7, 355422.3 6681703.4, 355424.7 6681706.2, 355427.3 6681707.8, 355429.6 6681710.3, 355431.1 6681713.3, 355430.8 6681717.1, 355430.3 6681721.7, 355430.5 6681728, 355431.5 6681734.2, 355433 6681738.8, 355434.9 6681742.3, 355437.2 6681744.2, 355438.9 6681746.4, 355440 6681749.6, 355440.2 6681752.9, 355440.4 6681755.8, 355441.3 6681758.2, 355442.6 6681761.1, 355443.7 6681764, 355445.1 6681768.1, 355445.4 6681771.4, 355445.4 6681774.8, 355445 6681778.7, 355444.8 6681782, 355445.2 6681790.2, 355445.9 6681807.3, 355447.7 6681822.3, 355448.8 6681828.7, 355452.4 6681843.1, 355460.1 6681855.4, 355471.4 6681866.4, 355485 6681880, 355496.3 6681891.5, 355507.4 6681902.2, 355522.4 6681911.6, 355540.2 6681929.8, 355559.4 6681950.1, 355572.2 6681960.3, 355573.8 6681973.4, 355570.8 6681992, 355563.8 6682015.1, 355553.8 6682044.5, 355545.8 6682072.8, 355536 6682102, 355523.1 6682131.4, 355513.2 6682157.1, 355498.7 6682183.4, 355487.5 6682208.8, 355483.4 6682217.4, 355363.3 6682194.7, 355353.4 6682204.7, 355260.9 6682505.3, 355236.2 6682540.5, 355158.5 6682607, 355111.3 6682639.1, 355058.7 6682674, 354953.1 6682742.6, 354837.7 6682795.7, 354824.7 6682761, 354804.2 6682699.8, 354784.8 6682641.2, 354713 6682713.8, 354677.5 6682694.8, 354618.4 6682662.5, 354583.5 6682642.4, 354573.2 6682636.4, 354555.8 6682624.2, 354549.9 6682620.2, 354535.4 6682610.3, 354512.7 6682592.7, 354486.3 6682571.7, 354451.9 6682539.6, 354417 6682508.4, 354402.9 6682497.5, 354397.2 6682495.1, 354390.6 6682495.4, 354382.3 6682498.5, 354376.1 6682503.7, 354368.8 6682512.7, 354362.1 6682516, 354354.8 6682517, 354336.5 6682514.7, 354307.8 6682511.6, 354266.7 6682506.1, 354225.9 6682501.6, 354204.4 6682497.8, 354188.1 6682496.1, 354163.1 6682490.5, 354118.2 6682479.9, 354086.5 6682473.8, 354049.3 6682467.2, 354012.3 6682461.7, 353987.1 6682456.5, 353965.8 6682450.6, 353943.1 6682442.4, 353927.6 6682436.2, 353910 6682429.6, 353850.5 6682405.2, 353758.6 6682368.6, 353754.3 6682366.6, 353750.3 6682368.3, 353663 6682347.9, 353625.8 6682365.4, 353542.7 6682391.1, 353423.8 6682434.4, 353415.1 6682364.5, 353401 6682335.2, 353393.9 6682326.1, 353389.8 6682323.5, 353387.4 6682321.6, 353385.6 6682318.1, 353383.5 6682314.4, 353376.4 6682304.5, 353370.6 6682298.1, 353367.4 6682292.9, 353366.8 6682286.5, 353370.8 6682279.4, 353372.3 6682274.6, 353374.4 6682265.8, 353376 6682261.2, 353379 6682250, 353382 6682240.1, 353384.3 6682233.2, 353385.7 6682225.8, 353386.5 6682222.9, 353389.7 6682221.3, 353392.2 6682219.4, 353394.5 6682217.5, 353396 6682214.6, 353397.1 6682205.3, 353397.1 6682199.7, 353397.1 6682195.1, 353398.5 6682191.9, 353398.8 6682188.2, 353398.1 6682184.1, 353396.9 6682179.9, 353395.4 6682175.7, 353394.3 6682171.2, 353393.4 6682166.8, 353393.6 6682163.8, 353394.8 6682159, 353395.1 6682153.4, 353396.1 6682148.9, 353396.9 6682145, 353397.4 6682141.7, 353398.5 6682137.4, 353397.7 6682128.4, 353397.2 6682124.6, 353393.7 6682116.3, 353392.2 6682114.2, 353390.6 6682112.3, 353388.2 6682109, 353386.7 6682104.8, 353385.9 6682100.2, 353386.1 6682095.4, 353388.6 6682085.1, 353389.5 6682081.1, 353390.3 6682077.2, 353391.9 6682072.7, 353392.4 6682068.7, 353393 6682064.7, 353392.9 6682060, 353392.7 6682055.2, 353390.6 6682044.6, 353388.7 6682040.3, 353387 6682034.6, 353383.7 6682029.2, 353379.6 6682025.5, 353376.5 6682022.4, 353373 6682018.7, 353370.4 6682015.1, 353369.1 6682010.8, 353367.2 6682004.2, 353366.7 6681997.4, 353367.8 6681992, 353369.5 6681981, 353371.2 6681975.6, 353372.4 6681971.6, 353372.6 6681967.2, 353372.6 6681961.8, 353372.6 6681957, 353372.8 6681950.1, 353372.5 6681945.5, 353372.1 6681938.6, 353371.8 6681931.9, 353371.5 6681925.4, 353371 6681919.4, 353370.2 6681911.8, 353370.3 6681905.1, 353370.5 6681899.2, 353368.2 6681887.3, 353366.7 6681881.9, 353364.9 6681873, 353365.5 6681868.5, 353366 6681863.7, 353367.1 6681858.6, 353368.5 6681854.3, 353370.5 6681846.5, 353370.2 6681842.5, 353369.6 6681838.9, 353368.1 6681835.3, 353363.2 6681828.8, 353360.6 6681826.6, 353358.2 6681825.6, 353356.6 6681824.2, 353356.1 6681821.7, 353356 6681818.4, 353356.5 6681815.9, 353289.2 6681764.2, 353268 6681777.4, 353261.8 6681781, 353256 6681784.9, 353251 6681788.1, 353245.8 6681791.3, 353240.6 6681794.8, 353234 6681798.8, 353219.7 6681807.5, 353214 6681809.7, 353209.1 6681811.6, 353204.7 6681815.2, 353199.8 6681819.6, 353194.8 6681823.4, 353187.8 6681828.3, 353181.7 6681831.2, 353176.7 6681833.9, 353172.3 6681836.8, 353161.1 6681844, 353157.3 6681846.6, 353152.5 6681850.7, 353139.2 6681859.5, 353135.1 6681862.7, 353131.9 6681866.3, 353127.3 6681870, 353123.2 6681872.9, 353119.6 6681876.4, 353118 6681880.5, 353117.1 6681884.5, 353116.3 6681887.7, 353114.9 6681892.7, 353113.2 6681897, 353111.6 6681902.6, 353106.6 6681914.3, 353102.1 6681919.8, 353098.5 6681924.8, 353095.7 6681929.6, 353092.1 6681934.7, 353089.6 6681939.2, 353085.4 6681944.8, 353082.4 6681948.2, 353079.7 6681952.2, 353076.8 6681956.8, 353074 6681961.7, 353070.5 6681967, 353067.4 6681971.6, 353064.2 6681975.7, 353062.1 6681979.7, 353059.3 6681983.6, 353056.3 6681986.8, 353054.2 6681989.5, 353051.8 6681994.3, 353050.2 6681997.6, 353050.2 6682000, 353050.5 6682003.9, 353050.5 6682007.4, 352944 6682069.6, 352939.2 6682084.6, 352949.5 6682124.5, 352949.7 6682154.5, 352904.9 6682174.8, 352770.4 6682215.9, 352494.8 6682123.2, 352528.6 6681978, 352566.5 6681722.9, 352561.2 6681688, 352491.1 6681663.6, 352341.1 6681659.8, 352266.1 6681650.4, 352240.7 6681575, 352239.3 6681553, 352232 6681512.5, 352226.6 6681477.4, 352215.5 6681419.6, 352204.6 6681363.9, 352198.6 6681333.7, 352191.5 6681296.6, 352187.7 6681274.5, 352182.2 6681241.1, 352178.3 6681212.8, 352172 6681167.2, 352172 6681160.1, 352173.1 6681153.4, 352175.4 6681148.5, 352189 6681123.1, 352195.2 6681111, 352197.7 6681103, 352199.1 6681093.7, 352199.5 6681084.9, 352200 6681075.2, 352200.1 6681067.9, 352200.4 6681061.5, 352200.9 6681056.3, 352201.9 6681051.5, 352190.2 6681059.6, 352185.3 6681059.7, 352183.3 6681056.1, 352181.5 6681052.1, 352179.1 6681046, 352176.2 6681038.6, 352172 6681028.9, 352167.1 6681020.1, 352153.9 6681003.9, 352132.2 6680982.6, 352104.1 6680953.1, 352077.7 6680928, 352035.2 6680889.3, 352015.3 6680870.1, 351997 6680853.9, 351969.7 6680828.7, 351899.2 6680777, 351864.1 6680750.3, 351853.7 6680738.2, 351845.3 6680731.9, 351832 6680721, 351815.6 6680706.5, 351793.3 6680682.9, 351774.7 6680660.2, 351766.6 6680651, 351738.2 6680620.9, 351716.4 6680597.4, 351699.2 6680581.3, 351685.7 6680570.8, 351671.8 6680559.4, 351653.4 6680543.7, 351621.8 6680512.1, 351591.9 6680476.6, 351611.2 6680463.5, 351607.8 6680456.6, 351582 6680407.9, 351573.2 6680397.2, 351562.3 6680388.6, 351545 6680374.7, 351533.7 6680366.4, 351522.1 6680358.4, 351522.2 6680346.1, 351521.5 6680318.2, 351517.9 6680271.3, 351515.5 6680231.6, 351512.8 6680197.1, 351511 6680176.3, 351510.4 6680170.5, 351509.4 6680166.9, 351508.8 6680165, 351505 6680156.9, 351498.2 6680150, 351486.1 6680141.1, 351474.7 6680135.9, 351443.1 6680128.6, 351394.6 6680119.9, 351387.2 6680117.9, 351378.9 6680115.8, 351379.7 6680091.7, 351377.1 6680059.6, 351374 6680037.4, 351369.4 6680016.8, 351364.4 6679997.1, 351357.6 6679981.6, 351344 6679959, 351315.6 6679923.4, 351281.8 6679879.1, 351270 6679863.8, 351211.7 6679789.2, 351182.9 6679750.6, 351167.4 6679728.3, 351165.4 6679722.5, 351164.8 6679716.9, 351165.1 6679710.6, 351167.1 6679705, 351185.7 6679677.7, 351223.5 6679625.2, 351239.7 6679601.6, 351243.3 6679594.5, 351243.9 6679589.5, 351243.6 6679582.9, 351220.1 6679591.4, 351175.3 6679607.1, 351144.3 6679617.6, 351112.9 6679627.8, 351092 6679633.4, 351065.7 6679637.7, 351033.8 6679641.7, 350997.3 6679644.7, 350974 6679646.6, 350942.9 6679648.4, 350940.1 6679627.5, 350938.7 6679607.1, 350938 6679573.4, 350937.4 6679550.5, 350937 6679526.4, 350938.8 6679505.8, 350941.6 6679490, 350946.3 6679473.5, 350947.3 6679470, 350957 6679443.7, 350965.7 6679422.5, 350973.8 6679406.9, 350975.5 6679397.7, 350975 6679387.1, 350974 6679374.8, 350974.9 6679367.5, 350976 6679360.1, 350967 6679357.5, 350942.2 6679353.1, 350926.3 6679349.9, 350913.8 6679344.2, 350895 6679335.5, 350869 6679322.7, 350854.4 6679318.1, 350840.6 6679316.1, 350832.3 6679316.4, 350831.6 6679313.1, 350829.6 6679309.3, 350825.4 6679303.8, 350816.8 6679296.3, 350805.3 6679284.2, 350798.7 6679273.8, 350778 6679233, 350760.1 6679195.7, 350745.7 6679164.5, 350741.2 6679153.6, 350740.3 6679139.2, 350740.7 6679127.5, 350742.1 6679112.1, 350741.4 6679093.8, 350740.8 6679074.1, 350742.5 6679057.3, 350744 6679038.6, 350743.9 6679023.1, 350775.5 6678989.6, 350774.6 6678884.7, 350793.7 6678779.6, 350810.5 6678726, 350791 6678715, 350789.2 6678712, 350788.3 6678708.2, 350789.8 6678704.7, 350792.7 6678699.8, 350710.7 6678629.8, 350706.7 6678610.5, 350705 6678602, 350701.8 6678585.4, 350676.8 6678588.7, 350621.6 6678600.5, 350613.8 6678602.4, 350557.9 6678616.1, 350535.3 6678621, 350522.3 6678623.8, 350485.7 6678630, 350452.3 6678630.1, 350441.4 6678629.3, 350377.2 6678624.2, 350358.6 6678622.8, 350330.7 6678615.9, 350287.6 6678604.3, 350281.6 6678602.6, 350227.1 6678586.4, 350222 6678584.8, 350172.5 6678572, 350137.9 6678564.3, 350104.2 6678553.3, 350081 6678540.4, 350071.8 6678535.3, 350044.4 6678508.8, 350039.3 6678503.9, 349986.5 6678441, 349968.3 6678419.3, 349859.2 6678310.8, 349780.1 6678247.5, 349721.7 6678196.6, 349683.1 6678182, 349658.7 6678167.4, 349631.9 6678151.2, 349587.5 6678117.4, 349534.2 6678052.7, 349511.8 6678023.7, 349426.3 6677963.7, 349349.4 6677908, 349252.6 6677849, 349133.8 6677791.3, 349017.9 6677722.5, 348932.7 6677639.5, 348847.8 6677566.8, 348781.8 6677515.8, 348579.4 6677395.7, 348258.3 6677276.5, 348133.1 6677232.5, 348043.9 6677328.2, 347934.9 6677440.7, 347825.9 6677553.1, 347716.9 6677665.6, 347692.2 6677700.8, 347712.4 6677725.6, 347830 6677855.2, 347947.6 6677984.6, 348065.2 6678114.1, 348084.4 6678127.2, 348092.6 6678136.1, 348097.6 6678143.1, 348102.2 6678148.9, 348108.6 6678154.7, 348248.2 6678297, 348385.5 6678439.6, 348522.9 6678582.2, 348675.1 6678752, 348685.1 6678756.9, 348741.7 6678781.7, 348747 6678786.7, 348753.1 6678794.1, 348775.8 6678830.1, 348784.3 6678847.2, 348790.6 6678855.2, 348870.7 6678924.3, 348885.1 6678937.7, 348890.8 6678945.3, 348896.8 6678955.4, 348943.9 6679040.2, 348974.4 6679093.8, 348980.3 6679107.3, 349057.9 6679133.6, 349118.2 6679178, 349123.3 6679188, 349053.7 6679256.3, 349041.6 6679292.1, 349036.3 6679302.7, 349031 6679312.3, 349024.4 6679319.1, 349016.7 6679325.9, 349009.2 6679332.8, 349003.2 6679341.6, 348994.6 6679364.6, 348991.5 6679372.9, 348939.8 6679359.4, 348904.7 6679334.7, 348834.1 6679260.3, 348773.5 6679175.8, 348699.2 6679106.3, 348702 6679102, 348705.1 6679095.4, 348702.6 6679089.1, 348692.8 6679077.6, 348681.9 6679067.9, 348669.6 6679059.8, 348660.1 6679056.1, 348655.6 6679056.3, 348649.6 6679056.6, 348637.5 6679059.9, 348618.3 6679062.8, 348598.4 6679064, 348564.9 6679066.9, 348540.9 6679068.6, 348496.2 6679070.9, 348460.3 6679074.8, 348375.8 6679079.6, 348329.1 6679079, 348295.3 6679076.3, 348244.8 6679068.9, 348231.5 6679064.7, 348219.2 6679061.8, 348210.8 6679059.7, 348202.2 6679059.2, 348197 6679060.3, 348193.8 6679062.7, 348191.6 6679067, 348077.8 6679036.6, 348032.8 6679032, 348032.7 6679092, 348022.2 6679117.4, 348011.2 6679148.1, 347980.5 6679233, 347970.3 6679260.2, 347844.7 6679243.4, 347784.9 6679263.9, 347785.2 6679303.8, 347760.8 6679374, 347736.1 6679409.2, 347686.4 6679434.5, 347611.4 6679435.2, 347467.6 6679429.2, 347410.1 6679373.3, 347405.1 6679355.4, 347388.3 6679332.6, 347352.9 6679319.7, 347331.6 6679303.2, 347304.5 6679305.6, 347264.3 6679281.5, 347250.8 6679276.7, 347247 6679268.1, 347241.1 6679258.9, 347236.1 6679252, 347231 6679246.6, 347225.8 6679244.7, 347221 6679244.5, 347215.7 6679246.8, 347212.5 6679251.4, 347211.2 6679258.5, 347211.9 6679265.2, 347212.1 6679271.4, 347210.4 6679276.8, 347206.3 6679279.1, 347200 6679279.6, 347191.3 6679280.2, 347182.2 6679280.7, 347173 6679282, 347166.2 6679285.3, 347161.5 6679290.2, 347159.1 6679295.8, 347130.9 6679329.2, 347101.1 6679349.4, 347081.1 6679344.6, 347041.1 6679339.9, 347011.2 6679355.1, 346896.3 6679356.1, 346871.5 6679376.3, 346881.8 6679411.1, 346922.2 6679460.8, 346957.7 6679535.4, 346968.4 6679620.3, 346953.6 6679640.4, 346928.6 6679635.6, 346894 6679685.8, 346889.2 6679710.9, 346909.4 6679730.7, 346924.6 6679760.5, 346904.9 6679800.7, 346855.5 6679861, 346803.6 6679889.9, 346801 6679884.9, 346724.2 6679687.2, 346683.7 6679627.6, 346648.7 6679627.9, 346588.9 6679643.4, 346549.3 6679688.7, 346309.5 6679690.6, 346289.6 6679700.8, 346254.9 6679741, 346278.2 6679789.7, 346269 6679804.1, 346264.6 6679811.5, 346262.7 6679818.1, 346263.9 6679826, 346272.3 6679837.3, 346279.7 6679844.8, 346288 6679854.7, 346292.2 6679859.6, 346292.6 6679864.3, 346291.9 6679868.8, 346288.5 6679874, 346277 6679883.4, 346262.8 6679898.3, 346257.2 6679906, 346253.4 6679914.2, 346252.6 6679924.9, 346254.7 6679938, 346253.3 6679948.8, 346248.6 6679960.4, 346243.3 6679971.3, 346237.1 6679979.5, 346228 6679989.7, 346219.5 6679998.5, 346208.5 6680010.5, 346198.7 6680024.8, 346187.6 6680035.2, 346174.3 6680045, 346168.2 6680050, 346166.5 6680055.4, 346166.6 6680057.5, 346112.5 6680037, 346087.8 6680077.1, 346078.1 6680107.2, 346151 6680119.1, 346155.6 6680129.5, 346160.3 6680138.8, 346163.3 6680147.8, 346165.4 6680158.1, 346166.7 6680174.3, 346168 6680191.7, 346169.1 6680209.1, 346170.1 6680224.3, 346171.2 6680235.2, 346172.7 6680246, 346174.3 6680253.8, 346176.4 6680261, 346177.3 6680267.4, 346176.7 6680269.4, 346175.6 6680273.4, 346173.8 6680280, 346173.5 6680286.8, 346174 6680294, 346173.5 6680299.5, 346169.8 6680303.4, 346167.7 6680308.6, 346166.9 6680316.3, 346166.9 6680327.2, 346167.4 6680336.4, 346168.5 6680344.3, 346169 6680352.8, 346168.7 6680361.5, 346168 6680368.4, 346166.5 6680372, 346165 6680375.6, 346165.9 6680380.5, 346167.6 6680384.8, 346167.5 6680388.6, 346165.6 6680393.1, 346164.2 6680398.4, 346162.9 6680403.8, 346162.8 6680407, 346164.4 6680407.7, 346166.3 6680407.9, 346166.5 6680410.9, 346163.4 6680417.6, 346158.2 6680425.7, 346149.8 6680435.2, 346139.9 6680447.2, 346122.4 6680468, 346111.4 6680485.5, 346102.5 6680498.8, 346095.2 6680510.3, 346087.2 6680518.3, 346080.4 6680524.9, 346074.7 6680532.5, 346068.8 6680542.1, 346059.6 6680561.8, 346049.2 6680578.2, 346044.4 6680585.5, 346039.1 6680591.5, 346031.5 6680596.8, 346021.9 6680602.5, 346012.9 6680609.2, 346004.4 6680616.5, 345996.2 6680622.4, 345986.5 6680628.1, 345977.6 6680635, 345970.9 6680642.8, 345967.6 6680650.1, 345967.1 6680659.4, 345966.5 6680667.4, 345959.7 6680678.1, 345956.4 6680685.4, 345954.1 6680692.7, 345952.8 6680700.3, 345951.4 6680719.1, 345950.7 6680730, 345950.2 6680740.1, 345950.3 6680748.5, 345949.7 6680756.7, 345948 6680764.9, 345946 6680773.4, 345945 6680780.4, 345944.7 6680787.5, 345945.4 6680794.1, 345945.7 6680799.8, 345945 6680806.2, 345944.6 6680812.1, 345945.3 6680817.4, 345947.6 6680823.5, 345951 6680830.2, 345954.2 6680838.6, 345956.2 6680847.1, 345957 6680855, 345957.7 6680864.9, 345958.7 6680873, 345959.3 6680881.6, 345961.4 6680890, 345964.5 6680897.8, 345935.1 6680952.7, 345880.1 6680953.2, 345813.9 6680896.1, 345807.4 6680897.4, 345800.4 6680897.4, 345794.2 6680896, 345788.3 6680893.2, 345782.7 6680889.2, 345776.7 6680883.9, 345770.8 6680876.8, 345764.2 6680869.2, 345755 6680861.3, 345742.9 6680850.4, 345727 6680840, 345713.3 6680831.4, 345697.9 6680823, 345685.6 6680817.7, 345671.3 6680812.7, 345643.2 6680802.8, 345620.5 6680795.1, 345595.7 6680787.6, 345576 6680784.2, 345559.5 6680780.8, 345539.2 6680778, 345499.7 6680774.5, 345479 6680772.7, 345462.3 6680772.2, 345445.1 6680773.6, 345428.8 6680778, 345413 6680783.7, 345398.7 6680789.6, 345385.3 6680797.6, 345372 6680806.9, 345359.7 6680817, 345348.4 6680827.7, 345331.5 6680846.1, 345304.4 6680872.7, 345268.5 6680907.8, 345235.5 6680943.6, 345200.4 6680977.7, 345165.5 6681007.8, 345129.3 6681036.8, 345113.7 6681049.3, 345098.9 6681057.6, 345084.9 6681063.6, 345072.5 6681067.5, 345059 6681069.3, 345051.2 6681069.9, 345034.4 6681071.1, 345030 6681070.8, 345019.4 6681070.1, 344996.6 6681066.3, 344970.2 6681059.5, 344946.9 6681051.8, 344927 6681043.8, 344866.9 6681016, 344732.7 6680955.7, 344691.8 6680938.4, 344642.4 6680806.3, 344617 6680793.6, 344572.5 6680808.4, 344524.4 6680788.6, 344441.8 6680823.8, 344414.3 6680812.7, 344387 6680806.1, 344364.1 6680803.2, 344336 6680803.6, 344301.7 6680805.7, 344267.7 6680808.6, 344235.1 6680811.3, 344191.5 6680818.7, 344139.5 6680828.8, 344118 6680834.5, 344104.3 6680841.4, 344092.8 6680844.5, 344083.5 6680844.7, 344073.1 6680843.7, 344063.1 6680843.8, 344037.8 6680852.4, 344030.1 6680855.6, 343949.4 6680888.4, 343876.3 6680914.6, 343837.5 6680927.9, 343801.8 6680937.9, 343763.8 6680947.1, 343723.7 6680956.2))
-""")
+        _sio = AbstractGeoDataFrameDemos._dataset(
+            "GeoDataFrameDemosA", "nantesMetropole.csv"
+        )
         return GeoDataFrameLib.read_csv(_sio)
 
     @staticmethod
@@ -65,9 +65,9 @@ BDT_3-3_SHP_LAMB93_D044-ED2022-12-15/ADMINISTRATIF/COMMUNE.shp")
         nantes.reset_index(drop=True, inplace=True)
         nantes.to_csv('/tmp/nantes.csv', sep=';', index=False)
         '''
-        _sio = StringIO("""ID;INSEE_COM;INSEE_ARR;INSEE_COL;INSEE_DEP;INSEE_REG;POPULATION;SURFACE_HA;DATE_CREAT;DATE_MAJ;DATE_APP;DATE_CONF;CODE_POST;NOM;CL_ARROND;CL_COLLTER;CL_DEPART;CL_REGION;CAPITALE;DATE_RCT;RECENSEUR;SIREN_EPCI;ID_CH_LIEU;ID_AUT_ADM;CODE_SIREN;geometry
-COMMUNE_0000000009746105;44109;2;44D;44;52;318808;6519;2006-08-02 08:36:54;2022-05-16 17:06:46;;;44000;Nantes;Oui;Oui;Oui;Oui;Non;2019-01-01;INSEE;244400404;PAIHABIT0000000028860908;SURFACTI0000000028746068;214401093;POLYGON ((361276.9 6690456.9, 361281.4 6690442.5, 361115.3 6690288.1, 360878.4 6690129.7, 360358.4 6689951.9, 360104.2 6689863.3, 359746.2 6689691.9, 359368.3 6689559.1, 359154.4 6689513.1, 358952.6 6689440, 358752.4 6689367.4, 358597.1 6689107.5, 358488 6688996.7, 358378.8 6688885.8, 358195.7 6688718.9, 358012.5 6688551.9, 357829.3 6688385, 357710.3 6688305.9, 357635 6688255.8, 357503.3 6688167.3, 357371.6 6688078.8, 357239.8 6687990.3, 357245.4 6687981.5, 357298 6687899.3, 357307 6687885.3, 357310.4 6687880, 357318.6 6687867.2, 357345 6687836.3, 357356.4 6687822.2, 357367.4 6687803.5, 357376 6687787.4, 357387.7 6687766.2, 357395.5 6687751.8, 357403.1 6687740, 357426.9 6687704.7, 357433.1 6687695.4, 357460.8 6687652.4, 357484 6687620.8, 357503.2 6687596.1, 357471.6 6687578.7, 357458.4 6687572.3, 357435.6 6687560.8, 357403.1 6687546.5, 357394.9 6687542.9, 357384.7 6687538.3, 357370.3 6687530.6, 357364.3 6687525.3, 357359.8 6687521.1, 357357.6 6687517.8, 357350.2 6687509.3, 357349.9 6687503.5, 357352 6687497.9, 357349.9 6687483.1, 357349.1 6687469.3, 357347.7 6687458.2, 357343.8 6687443.8, 357339.2 6687434.4, 357330.1 6687424.7, 357315.5 6687414.3, 357263.6 6687383.5, 357235.4 6687365.7, 357210.7 6687347.3, 357198.6 6687339.4, 357188.1 6687332.6, 357174.6 6687319.8, 357166.5 6687306.8, 357157.1 6687283, 357148.3 6687250.5, 357151 6687244.4, 357155.9 6687241.6, 357212.7 6687215, 357249.9 6687199.6, 357335 6687168.1, 357370.8 6687155.2, 357381.6 6687152.1, 357387.4 6687150.3, 357397.6 6687148.9, 357418.2 6687148.7, 357435.5 6687150.5, 357481.6 6687155.6, 357546.4 6687162.7, 357626.1 6687169.7, 357626.5 6687169.8, 357626.1 6687167, 357624.4 6687156.4, 357592.8 6687078.7, 357573.4 6687028.5, 357557.4 6686989, 357553.3 6686974.9, 357552 6686964.4, 357551.4 6686959.7, 357547 6686922.5, 357547.1 6686911.1, 357551.8 6686866.4, 357552 6686858.2, 357546.4 6686799.2, 357544.8 6686783.3, 357532.3 6686667.4, 357578 6686641.1, 357610.2 6686622.5, 357621.6 6686617.2, 357640.2 6686608.5, 357705.9 6686570.7, 357773.9 6686532.6, 357815.1 6686509.4, 357947.6 6686434.2, 357978.6 6686418.4, 358028.7 6686397.5, 358047.1 6686391.5, 358060 6686388.3, 358086.6 6686382.8, 358093 6686381.9, 358187 6686367.3, 358210.8 6686363.6, 358263.1 6686355.5, 358266.2 6686354.9, 358405.5 6686333.2, 358408.8 6686332.7, 358473.7 6686322.6, 358472.1 6686310.4, 358466.6 6686282.6, 358456.3 6686247, 358455.1 6686238.1, 358456.2 6686232.7, 358463.5 6686220.3, 358469.2 6686206.3, 358473.3 6686195.9, 358475.7 6686178, 358476.3 6686156.1, 358477.2 6686149.7, 358499.5 6686147.4, 358494.2 6686120.9, 358510.3 6686108.7, 358520.6 6686110.3, 358527.6 6686129.3, 358560.7 6686122, 358581.8 6686129.3, 358580.4 6686117.5, 358553.4 6686063.1, 358536.7 6686078.4, 358501.1 6686104.6, 358489.7 6686104.1, 358484.8 6686092.1, 358477.2 6686081.1, 358455.7 6686060.5, 358445.9 6686070, 358425.9 6686092.7, 358382.4 6686137.1, 358370.7 6686147.3, 358350.5 6686133.1, 358350 6686132.7, 358318 6686110.2, 358277.4 6686081.6, 358269.2 6686075.8, 358261.6 6686070.3, 358225.4 6686045, 358203.1 6686029.3, 358160.7 6685981, 358147.5 6685965.9, 358170.6 6685942, 358133.2 6685906.5, 358128.5 6685916.4, 358128.2 6685903.2, 358110.7 6685867.1, 358096.4 6685856.2, 358092.7 6685852.1, 358090.9 6685848.2, 358090.7 6685839.1, 358092.2 6685828.8, 358093.9 6685811.7, 358096.3 6685795.8, 358096.5 6685785.4, 358097 6685770.8, 358097.3 6685768.1, 358103.2 6685756.5, 358103.9 6685747.4, 358102.8 6685732.4, 358097.6 6685713.2, 358094 6685707.5, 358091.5 6685706.2, 358118.3 6685693.4, 358119.6 6685689.6, 358119.3 6685684.6, 358115.3 6685676.5, 358104.7 6685660, 358102.3 6685652.2, 358081.5 6685613.9, 358071.9 6685593, 358060 6685571.1, 358051.9 6685553.1, 358047.4 6685541.1, 358041.9 6685530.1, 358039.7 6685518.1, 358040.3 6685513.4, 358042.4 6685508.5, 358049.3 6685499.2, 358054.9 6685493.7, 358070.4 6685482.6, 358067.8 6685477.5, 358063.9 6685472.3, 358055.1 6685455.9, 358039.2 6685426.2, 358037.5 6685423.1, 358029.7 6685408.3, 358025.8 6685401, 358014.8 6685380.4, 357965.8 6685392.9, 357840.4 6685424.5, 357737.3 6685450.2, 357483.1 6685527.7, 357359.6 6685563.4, 357303.7 6685583, 357216.4 6685618.7, 357167.7 6685641.9, 357115.2 6685669.3, 357045.5 6685711.7, 357037.6 6685716.6, 357005.6 6685740.3, 356949.6 6685802.8, 356904.1 6685873.3, 356879.6 6685913.7, 356852.9 6685955.3, 356828.3 6686002.3, 356796.8 6686068.7, 356792.6 6686077.5, 356783.3 6686112.5, 356774.6 6686151.5, 356761.3 6686220.2, 356752.8 6686265.2, 356746.8 6686312.4, 356716.1 6686405.5, 356699.9 6686445.2, 356683.4 6686479.3, 356666.5 6686506.3, 356623.3 6686573.3, 356602.8 6686603.7, 356584.6 6686632.7, 356555 6686669.7, 356553 6686672.3, 356527.4 6686702.9, 356508.7 6686720.5, 356425.4 6686790.2, 356374.1 6686826.8, 356334.7 6686858.6, 356308.2 6686881.6, 356289 6686904, 356274.4 6686923.4, 356245.8 6686964.2, 356206.2 6687016.2, 356184.1 6687051.2, 356142.8 6687095.4, 356139.2 6687098.1, 356135.2 6687101.4, 356126.6 6687108.1, 356116.1 6687089.9, 356107.6 6687075.4, 356105.9 6687072.4, 356105 6687070.9, 356103.4 6687068.1, 356096.9 6687054.8, 356088.6 6687052.8, 356061.4 6687046.5, 356050.1 6687041.9, 356040 6687041.3, 356008.5 6687032.5, 355926.2 6687009.3, 355923.9 6687013.3, 355918.5 6687022.9, 355897.8 6687060.6, 355877.6 6687094, 355871.9 6687104.7, 355855.6 6687137, 355839.8 6687145.9, 355823.3 6687152, 355822.2 6687172, 355819.1 6687203.2, 355814.9 6687232.4, 355804.6 6687293.3, 355801.5 6687306, 355802.7 6687307.2, 355828.8 6687333.5, 355843 6687347.8, 355863.5 6687368.5, 355843.9 6687438.2, 355747.7 6687445.2, 355744.5 6687445.5, 355740.6 6687445.8, 355737.3 6687446, 355562.1 6687457.9, 355386.8 6687469.9, 355211.6 6687481.8, 355085 6687485.9, 354830.8 6687498.3, 354690.2 6687506.1, 354549.5 6687514, 354408.8 6687521.7, 354127.8 6687540.4, 353969.6 6687537.7, 353887.2 6687535.6, 353683.9 6687530.7, 353584.1 6687528.3, 353561.2 6687522.6, 353528.6 6687511.6, 353507 6687503, 353413.9 6687461.6, 353337.7 6687432.4, 353280.3 6687406.8, 353233.3 6687387.3, 352924.8 6687275.2, 352724.9 6687201.2, 352524.8 6687127.2, 352324.8 6687053.2, 352190.5 6687034.8, 352199.2 6686944.1, 352208.3 6686940.3, 352224.8 6686933.2, 352248.2 6686923.4, 352230 6686868, 352226.1 6686856.1, 352205.9 6686794.2, 352187.3 6686780.6, 352118.1 6686730, 352094.8 6686712.9, 352052.5 6686681.9, 352048.7 6686679.2, 352042.1 6686674.4, 352011.5 6686651.9, 351950.1 6686607, 351875.7 6686521.6, 351803 6686438.2, 351780.7 6686412.5, 351739.7 6686365.4, 351643.1 6686320.8, 351597.9 6686299.7, 351525.9 6686266.5, 351516.1 6686263.1, 351499.2 6686257.5, 351454.8 6686246.7, 351360.4 6686223.6, 351284.5 6686205.1, 351279.2 6686203.8, 351265.3 6686207.5, 351259.9 6686209, 351259.5 6686209.1, 351223.7 6686218.8, 351161.6 6686235.5, 351119.2 6686246.9, 351081.1 6686257.1, 351040.6 6686267.5, 350878.2 6686323.3, 350822 6686350.5, 350720.9 6686399.4, 350466.4 6686519.5, 350320.8 6686535, 350289.8 6686568.4, 350275.6 6686584.4, 350265.1 6686594.4, 350259 6686598.9, 350251.1 6686602.3, 350240.6 6686604.9, 350228.2 6686605.5, 350202.6 6686604.4, 350192.2 6686602.7, 350159.7 6686594.2, 350147.2 6686589.5, 350137.3 6686593.4, 350096.3 6686605.7, 350064.6 6686625.6, 350035.5 6686646.9, 350028.4 6686651.2, 350014 6686657.9, 350006.8 6686660.6, 349989.3 6686660.5, 349976.3 6686673.1, 349959 6686685.6, 349940 6686698.1, 349900 6686704.6, 349879 6686710.5, 349866.4 6686716.5, 349816 6686745, 349802.9 6686751.1, 349789.3 6686756.3, 349765.2 6686768.3, 349758.8 6686771.4, 349747.1 6686774.9, 349715.2 6686783, 349703.3 6686785.4, 349670.6 6686789.1, 349659.4 6686784.3, 349654.7 6686783.2, 349645.5 6686782.4, 349640.1 6686782.9, 349632.5 6686784.3, 349609.7 6686791.4, 349495.2 6686811.1, 349470.6 6686815.3, 349191.2 6686863, 349155 6686869.2, 349122.4 6686894.2, 349104.4 6686906.3, 349095.6 6686910.6, 349078.6 6686917.6, 349073.3 6686918.3, 349069.7 6686917.8, 349063.9 6686916.4, 349047.3 6686910.3, 349035.7 6686906.8, 349025.3 6686906.3, 349014.1 6686908, 349007.8 6686910.3, 348991.8 6686918.5, 348964.7 6686930.6, 348956.3 6686934.2, 348945.6 6686937.4, 348927.5 6686939.7, 348891.1 6686941.9, 348884.2 6686942.8, 348881.3 6686943.7, 348876.5 6686947, 348863.9 6686959.6, 348852.1 6686967.9, 348837.2 6686973.4, 348819.6 6686978.1, 348807.7 6686985.6, 348801.2 6686993.1, 348789.2 6687009.9, 348776.5 6687023.2, 348749.4 6687054.4, 348738.5 6687093, 348816.8 6687098.3, 349007.5 6687166.5, 349038.7 6687187.6, 349137.8 6687229.8, 349212.9 6687223.8, 349456.3 6687249.6, 349751.8 6687246.2, 349885.2 6687229.6, 350003.5 6687233.3, 350121.8 6687236.9, 350240.2 6687240.6, 350423 6687226.1, 350471.3 6687219.2, 350472.1 6687239, 350471.3 6687259.5, 350471.5 6687308.7, 350472.4 6687331.1, 350472.9 6687337.5, 350475.8 6687360.8, 350482 6687404.2, 350481.2 6687415.2, 350499.1 6687449.5, 350501.8 6687456.8, 350509.9 6687480.1, 350514.1 6687491.5, 350516.5 6687497.4, 350520.2 6687506.4, 350522.8 6687512.5, 350524.6 6687515.9, 350527 6687520.3, 350545.2 6687542.8, 350562.8 6687565.6, 350574.3 6687582.6, 350577 6687584.2, 350581.1 6687586.6, 350590.8 6687598.4, 350583.4 6687621.3, 350570.3 6687662.3, 350568.1 6687672, 350568 6687676.1, 350568.9 6687680.1, 350570.4 6687682.8, 350575.3 6687690.1, 350582 6687700.7, 350584.3 6687706.5, 350586.2 6687714, 350593.3 6687753.2, 350594.6 6687764.1, 350598.7 6687783.1, 350601.4 6687791.2, 350587.5 6687809.3, 350571.7 6687827, 350577.3 6687845.7, 350605.1 6687927.3, 350613.5 6687951.8, 350616.1 6687959.1, 350634.8 6687959.5, 350649.8 6687959.8, 350685.8 6687960.5, 350687.2 6687967.8, 350687.7 6687986, 350687 6688009.2, 350685.8 6688043.1, 350685.8 6688066, 350686.4 6688068.7, 350688.1 6688077, 350718.7 6688222.8, 350721.7 6688225.8, 350724 6688230.7, 350725 6688245.3, 350732.8 6688256.1, 350762.6 6688297.2, 350772.7 6688311.1, 350782.3 6688324.3, 350842.6 6688408.3, 350862.1 6688435.4, 350862.5 6688454.7, 350863.2 6688460.5, 350870.8 6688502.2, 350893.2 6688535.4, 350966.3 6688643.9, 351012.6 6688712.7, 351017.5 6688720.1, 351021.3 6688726, 351041.4 6688756.5, 351045 6688762.1, 351051.1 6688773.8, 351070.9 6688796.7, 351065.5 6688805, 351130.8 6688883.1, 351136 6688889.4, 351164.1 6688925.3, 351237.4 6689040.3, 351278.5 6689099.7, 351289.3 6689112.4, 351291.7 6689119.4, 351299 6689134.5, 351301.4 6689139, 351318.9 6689172.8, 351353.2 6689231.6, 351361.2 6689245.9, 351418.1 6689346.9, 351433.8 6689378, 351441.3 6689392.7, 351466.6 6689438.8, 351496.8 6689474.8, 351501.2 6689479.7, 351577.4 6689563.8, 351610 6689601.3, 351655 6689658.9, 351672.7 6689688, 351682.9 6689704.9, 351697.1 6689733.7, 351710.2 6689765, 351738.3 6689831.4, 351766.1 6689898.4, 351769.3 6689906.5, 351773.6 6689917.6, 351778.7 6689930.9, 351800.3 6690011.4, 351826.7 6690108.9, 351842.3 6690166.1, 351835.4 6690167.4, 351827.8 6690170.4, 351817.8 6690176.3, 351808.2 6690183.4, 351794.7 6690200.2, 351790.5 6690208.5, 351787.7 6690216.8, 351786 6690224.2, 351785 6690231.7, 351785 6690239.5, 351785.6 6690247.2, 351786.7 6690252.6, 351793.2 6690268.1, 351801.5 6690284.8, 351805.8 6690294, 351808.5 6690297.6, 351813.3 6690301.9, 351819.1 6690306.1, 351832.5 6690312.4, 351839.4 6690314.4, 351854.4 6690316.9, 351868.5 6690317.6, 351874.2 6690315.6, 351889.1 6690401, 351890.6 6690408.7, 351893.6 6690434, 351894 6690455.5, 351891.9 6690489.4, 351879.5 6690560.1, 351875.2 6690588.7, 351874.7 6690609.1, 351875.5 6690619.7, 351876.5 6690626.8, 351878.4 6690633.6, 351885.9 6690657.3, 351895.4 6690678.9, 351899.9 6690687.3, 351908.1 6690700, 351915.3 6690710.4, 351919.4 6690714.6, 351957.9 6690753.7, 352005.4 6690802, 352007.8 6690804.2, 352068.5 6690861.2, 352087.4 6690877.4, 352119 6690905.9, 352153.5 6690936.8, 352173.3 6690956, 352188.4 6690972.1, 352223.6 6691012, 352276.3 6691074, 352289.1 6691088, 352297 6691095.1, 352297.8 6691095.9, 352320.6 6691112.6, 352352.8 6691132.2, 352361.4 6691137.4, 352363.7 6691138.8, 352371.3 6691143.7, 352377.9 6691148, 352417.1 6691172.7, 352425.9 6691179.1, 352436.4 6691184.5, 352462.8 6691200.1, 352554 6691254, 352577.3 6691267.8, 352599.8 6691282.6, 352642.3 6691310.7, 352732.4 6691369.6, 352758.5 6691321.6, 352760.7 6691323.2, 352871.6 6691401.7, 352899.1 6691374.8, 352922.2 6691398.1, 352950.7 6691425.6, 352991.7 6691464.8, 353036.7 6691411.6, 353074.5 6691375.1, 353120.7 6691427.8, 353144.9 6691454.6, 353166.3 6691478.3, 353209.4 6691524.3, 353213.4 6691528.5, 353264.5 6691583.7, 353269.6 6691589.2, 353299.4 6691627.2, 353332.7 6691670.1, 353336.2 6691674.8, 353342.3 6691682.6, 353354.4 6691702.3, 353356 6691704.8, 353408.3 6691790.8, 353333.3 6691881, 353251.9 6691979.2, 353238 6691996.8, 353205.9 6692027.3, 353162.7 6692062.6, 353117.6 6692099.8, 353074.3 6692135.6, 353012.7 6692186.5, 353004.8 6692193, 353051.3 6692272.3, 353064.8 6692294.5, 353071.1 6692304.1, 353078.9 6692314.2, 353108.4 6692356.8, 353122.1 6692374.4, 353139.3 6692392.7, 353160.7 6692410.9, 353182 6692427.9, 353193.6 6692437.7, 353209.1 6692448.3, 353222.1 6692458.2, 353234.3 6692471.1, 353240.6 6692479.3, 353247 6692489.2, 353261.2 6692521.1, 353266.1 6692530.9, 353270.8 6692538.9, 353280.1 6692550.2, 353284.9 6692553.7, 353294.5 6692557.9, 353315.1 6692567.6, 353320.9 6692571.8, 353326.2 6692578, 353330.1 6692584.1, 353338.3 6692581.7, 353344.5 6692576.8, 353347.2 6692573.3, 353347.8 6692569.1, 353371.1 6692582.3, 353385.6 6692585.1, 353401 6692589.3, 353431.2 6692601.3, 353436.2 6692604.5, 353466.3 6692616.3, 353475.1 6692621.1, 353489.7 6692626.4, 353490.4 6692626.6, 353499.3 6692633.2, 353510.6 6692644.3, 353519.3 6692649.1, 353523.2 6692649.8, 353529.7 6692647.9, 353535.2 6692650.1, 353549.2 6692657.5, 353555.1 6692665.9, 353562.2 6692673.6, 353568.6 6692675.2, 353575.7 6692675, 353586.4 6692675.2, 353589.9 6692677.2, 353587.3 6692680.9, 353587.7 6692684.9, 353590.8 6692688, 353594.3 6692688.8, 353596.4 6692690.5, 353598.5 6692696.6, 353602.6 6692703.4, 353607.1 6692706.2, 353612 6692708.1, 353623.9 6692715.8, 353630.2 6692718.8, 353636.9 6692720.3, 353651.4 6692721.5, 353652.7 6692719.5, 353677.2 6692730.9, 353683 6692734.1, 353693 6692740, 353698.2 6692745.8, 353702.9 6692745.6, 353708.9 6692745.1, 353721.7 6692764, 353735.2 6692775.3, 353739.4 6692776.7, 353747.8 6692779.8, 353761.3 6692788.1, 353767.8 6692791.2, 353777.9 6692792.2, 353778.5 6692794, 353780.8 6692795.5, 353793 6692801, 353795.8 6692804.3, 353799.6 6692806.1, 353808.7 6692807.7, 353815.8 6692815.7, 353825.2 6692822.5, 353847.9 6692846.9, 353866.3 6692867.8, 353901.8 6692896.4, 353911.5 6692908, 353912.4 6692912.7, 353921.7 6692928.1, 353922.8 6692934.2, 353926.1 6692944.7, 353926.9 6692949.1, 353924 6692974.8, 353922.4 6692979.1, 353916.3 6692997.8, 353919.7 6693033.4, 353928.4 6693027.9, 353947.5 6693015, 353964.3 6693016.6, 353963.6 6693024.5, 353962.1 6693033.6, 353962.8 6693039.1, 353964 6693059.1, 353965.9 6693071.6, 353980.2 6693133.4, 354002.8 6693241.3, 354030.1 6693367.4, 354035.9 6693394.6, 354044.1 6693434, 354061.7 6693517, 354067.9 6693546.2, 354075.5 6693582.3, 354083.8 6693627.3, 354090.1 6693669.5, 354090.3 6693674.3, 354090.4 6693678, 354090.4 6693689.6, 354088.1 6693708.6, 354084.8 6693745.3, 354083.2 6693767.7, 354081.4 6693780, 354077.1 6693797.8, 354068.9 6693815.6, 354047 6693858.4, 353995.2 6693957.6, 353994.1 6693959.7, 353949.7 6694046.2, 353858.4 6694226.4, 353839.6 6694261.2, 353790 6694353.5, 353786.6 6694360, 353722.8 6694474.1, 353716.6 6694487, 353699.7 6694522, 353648.3 6694628.2, 353646.7 6694631.5, 353641.9 6694651.9, 353637.4 6694665.6, 353633.1 6694675.8, 353612.6 6694715.2, 353611.6 6694717.1, 353567.9 6694805.7, 353560.8 6694822.8, 353540.2 6694874.8, 353529.3 6694897.8, 353486.6 6694977.9, 353476.5 6694996.7, 353463 6695021.9, 353455.5 6695036, 353417.9 6695106.2, 353405.6 6695129.2, 353399.4 6695140.9, 353396.8 6695145.6, 353393.2 6695152.3, 353388.9 6695160.3, 353377.6 6695181.3, 353347.7 6695237.4, 353341.4 6695249.2, 353326.9 6695276.2, 353204.6 6695504.7, 353189.4 6695497.2, 353113.1 6695649.4, 353090.1 6695693.2, 353074.2 6695724.3, 353062.3 6695747.7, 353039.6 6695788.8, 352998.1 6695868.2, 352994.5 6695875, 352988.8 6695885.7, 352926.5 6696001.3, 352935.5 6696005.7, 352950.1 6696015.6, 352957.5 6696021.1, 352967.2 6696027.2, 353050.9 6696073.8, 353068.8 6696078.2, 353097.8 6696086.8, 353116.1 6696094.8, 353179 6696122.9, 353202.5 6696130.5, 353225.7 6696133.3, 353256.1 6696131.9, 353294.4 6696122.7, 353321.1 6696114.2, 353368.3 6696097.3, 353408 6696078, 353415.3 6696068.9, 353417.3 6696065.5, 353420.8 6696061.7, 353425.2 6696057, 353435.3 6696046.7, 353446.4 6696035.7, 353452.4 6696030.8, 353461.3 6696023.1, 353469.1 6696017.3, 353473.6 6696013.6, 353480 6696007.4, 353487.4 6696000.2, 353493.7 6695994.4, 353499.7 6695988.5, 353504.5 6695982.9, 353512.4 6695974.9, 353517.4 6695969.1, 353525.3 6695964.7, 353534.3 6695958.8, 353543.7 6695953.8, 353552.1 6695948.8, 353560.9 6695944.5, 353580.6 6695950.7, 353580.6 6695934.6, 353582.1 6695916.8, 353583.8 6695892.9, 353597.5 6695898.3, 353606.6 6695902.8, 353616.6 6695906.2, 353632.2 6695908.1, 353635.4 6695907.2, 353638.4 6695906, 353643.4 6695904.9, 353647 6695905, 353658 6695905.9, 353663.8 6695907.6, 353670.4 6695909.3, 353684.6 6695912.9, 353689.3 6695915.1, 353698.5 6695918.5, 353707.5 6695919.1, 353718 6695919.2, 353731.7 6695918.6, 353736.7 6695918, 353747.2 6695916.4, 353760.3 6695914.6, 353773.1 6695913.4, 353781.1 6695913, 353790 6695909.8, 353795.5 6695906.9, 353804.9 6695899.4, 353810.8 6695892.4, 353821.6 6695883.4, 353832.2 6695874.6, 353845.3 6695870.4, 353855.3 6695866.8, 353862.8 6695864.1, 353869.5 6695860.8, 353876.6 6695857.3, 353884.2 6695854.2, 353892.8 6695852.2, 353905 6695849.5, 353917.2 6695847.8, 353922.3 6695845.9, 353941.4 6695844.3, 353958.7 6695840.5, 353969.2 6695836.2, 353979.8 6695830.5, 353991.2 6695823.5, 354010.8 6695809.9, 354014.6 6695808.5, 354019.7 6695807.4, 354027.4 6695807.3, 354036.1 6695803.8, 354043.5 6695801.8, 354046.9 6695799, 354050.7 6695794.4, 354065.6 6695786.4, 354077.6 6695788.8, 354087.1 6695788.7, 354098.8 6695786.6, 354113.6 6695779.1, 354120 6695773.7, 354129.3 6695767.9, 354133.8 6695765.9, 354142.7 6695763.2, 354171.1 6695757.4, 354193.8 6695758, 354217.1 6695761.1, 354220 6695759.6, 354228.4 6695760.7, 354254.1 6695758.8, 354312.5 6695755.6, 354330 6695756.3, 354360.5 6695756.1, 354387.6 6695759.1, 354410.5 6695756.2, 354413.8 6695755.7, 354420 6695753.6, 354437.8 6695754.1, 354444.1 6695752.9, 354457.1 6695749, 354479.8 6695739.7, 354492.7 6695738.1, 354506.9 6695735, 354532.2 6695732.6, 354547.5 6695727.1, 354552 6695723.5, 354572.2 6695722.7, 354650.8 6695724.8, 354676.2 6695724.4, 354697.5 6695725.3, 354713.8 6695727.2, 354727.4 6695729.2, 354734.4 6695730.8, 354740.2 6695730.5, 354761 6695726.6, 354770.2 6695724.3, 354780 6695720, 354822.8 6695695.5, 354848 6695679.9, 354865.1 6695674.9, 354865.3 6695683.5, 354864.9 6695687.8, 354863.6 6695696.6, 354864.4 6695701.7, 354865.1 6695702.5, 354867.4 6695702.8, 354870 6695702, 354888 6695689.6, 354908.8 6695679.1, 354913.9 6695674.5, 354914 6695671.8, 354906 6695660.9, 354905 6695657.3, 354905.1 6695654.8, 354905.6 6695653.1, 354908.3 6695652.7, 354913.1 6695652.3, 354923.3 6695653.6, 354936.5 6695651.7, 354938.3 6695651.3, 354941.1 6695649.2, 354941.5 6695647.8, 354940.9 6695644.2, 354936.7 6695630.3, 354939.2 6695627.4, 354956.2 6695602.7, 354967.9 6695589.2, 354975.7 6695581.2, 354983 6695572.2, 355006 6695548.4, 355022.4 6695532.9, 355028.7 6695526, 355047.9 6695511.9, 355054 6695505.2, 355068 6695489.9, 355078.2 6695470.3, 355087.9 6695455.9, 355091.8 6695452.1, 355095.9 6695450.4, 355100.8 6695449.6, 355106.5 6695449.2, 355132.8 6695450.5, 355155.6 6695446, 355181.4 6695448.5, 355198.6 6695451.3, 355208.9 6695464.1, 355218.4 6695470.8, 355223.9 6695472.2, 355233.9 6695473.2, 355242.6 6695475, 355246.7 6695475.2, 355272.3 6695464.4, 355276.9 6695463.5, 355286.9 6695460.2, 355301.8 6695458.2, 355307.6 6695459.5, 355324.4 6695457.3, 355330.1 6695457.6, 355360.2 6695458.5, 355375.7 6695457.3, 355410.7 6695469.2, 355417.5 6695470.2, 355430.7 6695472.3, 355454.9 6695478.8, 355479.1 6695483.4, 355479.5 6695482.5, 355485.5 6695470.7, 355490.3 6695461.2, 355500.6 6695440.9, 355510.2 6695430.4, 355529.5 6695419.8, 355531.9 6695417.6, 355533.6 6695413.9, 355537.2 6695402.3, 355545.8 6695383.6, 355549.3 6695373.6, 355552.1 6695354.4, 355553 6695339.2, 355554.7 6695317, 355555.5 6695294.3, 355554.5 6695278.9, 355551.4 6695257.5, 355551.7 6695238, 355549.8 6695233.2, 355544 6695224.7, 355536.6 6695213.2, 355533 6695205.7, 355517.3 6695186, 355508.7 6695171.8, 355505.6 6695167.7, 355504.6 6695165.4, 355505.1 6695155.3, 355509.9 6695147.5, 355512.3 6695146.3, 355519 6695145.5, 355524 6695145.5, 355527 6695144.8, 355530.8 6695140.9, 355531.3 6695138.7, 355530.6 6695133.8, 355528.4 6695127.6, 355526.3 6695123.2, 355521.5 6695118.3, 355499.7 6695108.8, 355496.4 6695105.7, 355494.4 6695102, 355490 6695086.4, 355486.7 6695079.3, 355485.7 6695073.6, 355483.8 6695048.6, 355483.8 6695039.7, 355487.3 6695034.1, 355496.3 6695026.4, 355519.9 6695010.4, 355522.6 6695003, 355514.8 6694998, 355509.6 6694995.7, 355506.4 6694992.7, 355504.5 6694989.5, 355503.5 6694982.6, 355503.8 6694977.3, 355504.8 6694973.6, 355508.8 6694964.7, 355508.8 6694946.3, 355509.9 6694939.4, 355510.9 6694936.7, 355512.9 6694933.3, 355515 6694931.1, 355519.2 6694928.3, 355540.1 6694926.7, 355550.6 6694925.1, 355555.7 6694923.3, 355558.1 6694921.8, 355564 6694909.6, 355567.3 6694907.6, 355575.8 6694906.1, 355579.3 6694904.6, 355581.3 6694902.1, 355581.7 6694897.3, 355582.7 6694891.6, 355584.3 6694887.5, 355588 6694880.4, 355591.1 6694877.4, 355594.1 6694875.8, 355601.9 6694873.8, 355614.4 6694872.8, 355621.2 6694871, 355626.3 6694867.6, 355629.3 6694864.4, 355636 6694854.2, 355637.7 6694852, 355640.5 6694850, 355643.5 6694848.7, 355658.2 6694847.7, 355674.9 6694845.9, 355679 6694844.2, 355686.5 6694839, 355701.5 6694826.5, 355705.1 6694824.9, 355713 6694823.8, 355726.2 6694824, 355732.3 6694823.2, 355739.6 6694818.7, 355741.7 6694816.9, 355755.8 6694799.3, 355759.8 6694787.7, 355763.8 6694775.8, 355765.9 6694764.6, 355765.7 6694753.1, 355767.5 6694744.9, 355768.6 6694741.3, 355774.2 6694731.3, 355776.6 6694722.8, 355779.5 6694694.8, 355783.1 6694679.4, 355784.3 6694659.6, 355782.5 6694647.7, 355774.1 6694609.4, 355771 6694603, 355768.7 6694601, 355767.2 6694598, 355764.6 6694588.7, 355763.5 6694561.2, 355761 6694547.9, 355756.3 6694534.6, 355754.8 6694528.5, 355751.9 6694511.1, 355752.6 6694501.3, 355754.4 6694496.1, 355757.4 6694490, 355761.1 6694484.9, 355769.2 6694475.4, 355782.2 6694457.9, 355790.9 6694442.9, 355800.1 6694387.2, 355801.6 6694378.4, 355811 6694345.5, 355816.4 6694326.6, 355859 6694177.9, 355905.2 6694159.1, 355976.3 6694089.5, 355979.5 6694086.5, 356007.5 6694059.1, 356012.1 6694057.9, 356016.4 6694058.4, 356033.1 6694069, 356037.9 6694068.4, 356041.6 6694066.1, 356046.6 6694060.4, 356049.6 6694049.6, 356050.5 6694045.6, 356049.3 6694039, 356045.3 6694028.8, 356040.5 6694019.4, 356032.9 6694011.9, 356030.8 6694003.5, 356030.3 6693992.2, 356032.3 6693978.8, 356036.5 6693966.9, 356045.4 6693955.4, 356058.4 6693946.9, 356069.2 6693941.4, 356083.5 6693940.3, 356097.7 6693941.5, 356113.5 6693941.7, 356126.1 6693938.3, 356133.1 6693931.1, 356137.2 6693922.5, 356148.2 6693910.3, 356165.2 6693902.7, 356182 6693902.1, 356198.4 6693905.6, 356215.3 6693911.7, 356227.1 6693917.9, 356241 6693919.1, 356255.2 6693914.9, 356269.7 6693909.5, 356286.5 6693905.7, 356302.6 6693908.3, 356317.2 6693913.6, 356335.2 6693916.5, 356354.8 6693911.3, 356369.1 6693905.5, 356426.7 6693900.7, 356441 6693898.7, 356454.7 6693893.2, 356469.8 6693882.5, 356486.2 6693874.8, 356499.7 6693869.9, 356511.5 6693863.9, 356530.1 6693850.6, 356554.6 6693819.8, 356580.2 6693799.6, 356600.6 6693785.3, 356608.7 6693774, 356613.7 6693771, 356658.8 6693748.2, 356716.9 6693724.9, 356741.2 6693723, 356787.7 6693727.8, 356812.6 6693727.4, 356828.9 6693725.2, 356845 6693721.6, 356899.5 6693709.4, 356905.8 6693708, 356927.3 6693787.5, 356929.6 6693792.8, 356943.1 6693824.4, 356945.2 6693829.2, 356962 6693867.9, 357059.8 6693986.8, 357138.8 6694103.7, 357164.7 6694192.6, 357114.9 6694410.2, 357093 6694505.7, 357087.6 6694639, 357082.2 6694772.3, 357081 6694801.4, 357076.7 6694905.6, 357219.7 6695177.5, 357355.3 6695369.4, 357490.8 6695561.2, 357626.4 6695753.1, 357758.1 6695939.4, 357762 6695944.9, 357816.2 6696022.6, 357850.1 6696063.5, 357938.7 6696166.8, 357964.6 6696258.7, 357985.3 6696322.5, 357989.4 6696339.7, 358000.4 6696387.3, 358011.9 6696443.7, 358020.3 6696494.3, 358024.1 6696550.1, 358023.8 6696595.6, 358025.9 6696647.4, 358024.8 6696720, 358022.2 6696766, 358013.1 6696837.5, 358005.6 6696886.9, 357999 6696935.1, 357985.3 6697012.6, 357978 6697042.2, 357967.4 6697075.7, 357955.7 6697100.6, 357942.5 6697122.6, 357802 6697370.1, 357617.4 6697697.3, 357569.2 6697740.4, 357581 6697962.4, 357605 6698019.7, 357622.6 6698060.4, 357666.1 6698128.2, 357798.2 6698103.8, 357936.8 6698078.9, 358056 6698057.6, 358097.6 6698042, 358119.9 6698033, 358145.9 6698024.4, 358169.5 6698024.7, 358188.1 6698031.9, 358200.8 6698040, 358209.9 6698045.7, 358239 6698058.1, 358262.3 6698074.4, 358294.6 6698089.6, 358319.8 6698112.5, 358357.4 6698146.5, 358383.2 6698157.3, 358387.6 6698159.2, 358412.1 6698166.3, 358426.4 6698168.1, 358441 6698166.3, 358455.4 6698165, 358472.7 6698166.8, 358529.7 6698168.6, 358538.1 6698168.9, 358552.4 6698168, 358596.6 6698165.5, 358607.9 6698164.8, 358628.3 6698156.4, 358661.4 6698120.2, 358669.8 6698113.9, 358702.1 6698089.8, 358731.5 6698074.9, 358744 6698068.6, 358777.5 6698052.4, 358809.3 6698035.8, 358848.9 6698008.9, 358884.4 6697983.8, 358914 6697969.6, 358949.1 6697961.5, 358990.2 6697954.3, 359029.1 6697949.7, 359040.9 6697955.2, 359088.5 6697965.5, 359123.3 6697976.5, 359150.6 6697980.9, 359178.7 6697989.7, 359190.9 6697995.5, 359206.7 6698002.9, 359241.6 6698021.3, 359275.6 6698041.1, 359367.1 6698086.7, 359383.6 6698095, 359395.4 6698064.7, 359430.2 6697974, 359454.7 6697910.6, 359462.2 6697885.3, 359465.6 6697856.5, 359466 6697833.2, 359464.2 6697807.7, 359463.6 6697768.4, 359465.5 6697760.1, 359465.2 6697755.8, 359467.2 6697720.1, 359469.5 6697690.6, 359464.7 6697657.8, 359462.4 6697644.5, 359460 6697631.8, 359460 6697611.4, 359460.9 6697589.5, 359460.8 6697529.4, 359461.4 6697522.5, 359463.9 6697509.7, 359463.7 6697499.2, 359465.4 6697482.6, 359465.5 6697466.4, 359464 6697453.7, 359463.6 6697451.1, 359457.9 6697437.1, 359454.2 6697426.2, 359452.5 6697412, 359452.7 6697401.4, 359456.3 6697350.9, 359456.1 6697334.3, 359456.9 6697328.2, 359459.4 6697311.8, 359459.7 6697306.3, 359459.1 6697296.5, 359456.3 6697276.9, 359455.2 6697270.5, 359451.8 6697258.6, 359442 6697234.1, 359431.3 6697208.6, 359424.7 6697195.4, 359417.5 6697178.3, 359416.7 6697174.7, 359416.8 6697173.2, 359419.5 6697171.2, 359429.7 6697165.3, 359415.9 6697121.2, 359410.3 6697110.6, 359400.4 6697078.4, 359398.6 6697072.3, 359388.4 6697048.9, 359381.3 6697030.4, 359367 6696995, 359357.3 6696973.4, 359343.5 6696947.4, 359333.8 6696927.4, 359267.1 6696867.7, 359273.1 6696860.7, 359282.8 6696847, 359268.1 6696797.4, 359247.4 6696727.6, 359242.6 6696711.2, 359246.5 6696688.2, 359248.2 6696677.9, 359255.6 6696633.9, 359270.6 6696545.4, 359285.2 6696510.2, 359317.7 6696433.3, 359355.5 6696331.8, 359368.8 6696325.2, 359349.2 6696287, 359341.1 6696266.6, 359334.6 6696245.3, 359292.8 6696086.8, 359282.5 6696045.4, 359277.6 6696025.6, 359274.5 6696008.6, 359272.5 6695996.2, 359269 6695962.7, 359267.2 6695930, 359266.6 6695920.2, 359262.5 6695867.7, 359258.2 6695815.8, 359257.9 6695806.4, 359328.8 6695788, 359389.8 6695772.2, 359468.9 6695751.1, 359555.3 6695729, 359580.9 6695721.6, 359617.6 6695704.6, 359645.2 6695689.4, 359662.8 6695678.7, 359681.7 6695665.5, 359753.2 6695619.2, 359763.5 6695612.5, 359814.2 6695576.4, 360010.9 6695450.3, 360005.7 6695441, 359994.3 6695424, 359968.3 6695382.7, 359878.2 6695244, 359847 6695190.7, 359830.9 6695159.6, 359826.7 6695148.4, 359790.5 6695061.5, 359784.4 6695044.9, 359764.4 6694995.1, 359731.9 6694914.7, 359720.3 6694886.5, 359709.6 6694865.3, 359704.9 6694857.1, 359700 6694850.9, 359694.9 6694844.7, 359685.7 6694835.4, 359633.5 6694788.7, 359477 6694649.4, 359455.8 6694630.3, 359416.8 6694594.6, 359399.6 6694576.3, 359386.9 6694559.1, 359377.4 6694542.3, 359372.2 6694531.1, 359370.2 6694526.5, 359351.2 6694491.6, 359348.7 6694486.6, 359293.6 6694378.1, 359284.8 6694360.7, 359394.9 6694313.3, 359423.4 6694300.6, 359444 6694291.9, 359405.9 6694207.8, 359384 6694159.7, 359417.6 6694094.6, 359428.5 6694067.7, 359418.7 6694061.5, 359417 6694049.4, 359407.9 6694042, 359427.4 6694001.2, 359428.2 6693999.4, 359448.1 6693916, 359451.4 6693902.2, 359480.2 6693917.1, 359493.7 6693925.3, 359485.7 6693939.6, 359549.1 6693972.2, 359730.5 6694055.2, 359751.6 6694050.8, 359836.8 6694089.1, 359851.1 6694096.5, 359887.6 6694116.8, 359922.2 6694136.5, 359954.9 6694154.7, 360033.4 6694200.1, 360053.2 6694211.9, 360141.8 6694263.8, 360176.3 6694284.7, 360219.4 6694309, 360271.1 6694335.3, 360289.8 6694310.3, 360310.9 6694272.5, 360317.5 6694255.1, 360329.7 6694229, 360330.5 6694224.8, 360333.4 6694203, 360337.4 6694181.3, 360338 6694172.9, 360336.3 6694151.9, 360335.9 6694137.9, 360335.4 6694123.6, 360335 6694098, 360327.1 6694066.2, 360324.3 6694049.5, 360318.6 6693989.6, 360320.1 6693983.1, 360309.8 6693915.1, 360277.7 6693914.4, 360279.5 6693910.3, 360279.4 6693903.5, 360269.3 6693876.3, 360266.1 6693865.6, 360264.6 6693860.2, 360264 6693854.7, 360203.5 6693793.5, 360160.1 6693749.6, 360143.1 6693755, 360141.3 6693743.7, 360135 6693737, 360132.6 6693730.5, 360132.3 6693724.5, 360132.9 6693718.2, 360131 6693701, 360125.7 6693696.8, 360123.3 6693691.6, 360122.4 6693675.6, 360123 6693666.5, 360120.9 6693658, 360117.4 6693646.7, 360098.4 6693601.1, 360095.8 6693596.7, 360094.6 6693592, 360092.4 6693578.1, 360092.1 6693560.8, 360097.3 6693532.7, 360097.7 6693525.9, 360096.8 6693523.7, 360093.2 6693519.1, 360082.3 6693514.1, 360080.1 6693511.8, 360079.4 6693502.1, 360080.9 6693485.7, 360080.8 6693467.8, 360080.8 6693467.1, 360086.4 6693440.2, 360087.5 6693430.2, 360090.3 6693415.9, 360089.8 6693406.3, 360092.7 6693384.5, 360095.6 6693374.7, 360098.3 6693370.1, 360102.7 6693364.7, 360104.6 6693358, 360109.9 6693321.8, 360109 6693292.8, 360112.3 6693277.7, 360115.4 6693271.8, 360121.5 6693251.6, 360124 6693245, 360134.3 6693224.4, 360135 6693203.5, 360137.2 6693190.7, 360139.8 6693177.4, 360143 6693168.4, 360145.2 6693164.1, 360144.2 6693159, 360139.2 6693150.7, 360142.5 6693142.5, 360146.7 6693135.8, 360149.4 6693117.1, 360156.7 6693102.4, 360159.2 6693099.6, 360163 6693093.1, 360171 6693068.8, 360176.4 6693058, 360180.7 6693052.2, 360186.8 6693048.1, 360193.2 6693045.2, 360203.8 6693042.1, 360237.4 6693034.6, 360260 6693029.5, 360297.4 6693024.6, 360308.9 6693021.7, 360325.1 6693014.1, 360333.3 6692998.3, 360338.1 6692985.1, 360356.5 6692927.3, 360366.7 6692900.6, 360381.1 6692870, 360388.2 6692850, 360394.4 6692824.5, 360393 6692819.3, 360389.3 6692811.7, 360378.1 6692794.8, 360374.2 6692790, 360370.9 6692783.6, 360371.8 6692775.8, 360375.9 6692763.9, 360378.3 6692759.4, 360396.4 6692729.2, 360412 6692706, 360426.2 6692688.4, 360435.7 6692680.5, 360444.8 6692665.6, 360447.6 6692664, 360452.4 6692664.3, 360456.7 6692665.9, 360458.3 6692665.8, 360463.7 6692658, 360469.6 6692648.8, 360480.1 6692630.3, 360484.6 6692618.6, 360500 6692585.1, 360528.5 6692539.7, 360544.2 6692521.4, 360562.6 6692504.5, 360563.5 6692503.9, 360571.9 6692498, 360577.8 6692493.2, 360590.4 6692477.2, 360598.9 6692470.2, 360622.1 6692441.2, 360645.4 6692408, 360652.8 6692398.6, 360660.9 6692392.2, 360680.3 6692380.1, 360692.4 6692374.3, 360702.1 6692368.8, 360709.8 6692363.5, 360731.3 6692351.3, 360754 6692340.5, 360763.2 6692335.3, 360771.1 6692330, 360780.3 6692321.9, 360786.5 6692314.4, 360787.7 6692311.9, 360791.1 6692305.2, 360793.8 6692302.1, 360798.5 6692296.5, 360811.1 6692287.8, 360814.3 6692281.5, 360814.3 6692280, 360814 6692272, 360812.8 6692263.7, 360811.5 6692256.9, 360808 6692237.3, 360806.2 6692225.8, 360806.4 6692214.7, 360805.9 6692198.7, 360803 6692184.8, 360801.1 6692167.7, 360801.6 6692151.5, 360803.2 6692135.6, 360805.2 6692122.4, 360807.8 6692110.2, 360812.4 6692096.6, 360814.7 6692084.9, 360817.2 6692061.4, 360817.4 6692048.9, 360814.2 6692036.6, 360797.8 6691990.2, 360782.5 6691951.6, 360736.8 6691905, 360745.4 6691825.6, 360762.2 6691671.4, 360715.8 6691583.1, 360705.7 6691544.2, 360709 6691532.8, 360715.3 6691524.4, 360721 6691516, 360727 6691507, 360744.7 6691484.1, 360757.2 6691442.1, 360761.7 6691429.7, 360760.5 6691424.3, 360768.2 6691414.5, 360793.5 6691398.5, 360798.4 6691365.4, 360792 6691329.9, 360798.8 6691296.4, 360802.2 6691263.4, 360797.9 6691215.2, 360799.8 6691193.8, 360879.5 6691053.5, 360891.2 6691035.9, 360976.4 6690908.5, 361061.6 6690781, 361146.8 6690653.6, 361157 6690638.4, 361261.6 6690481.9, 361276.9 6690456.9))
-""")
+        _sio = AbstractGeoDataFrameDemos._dataset(
+            "GeoDataFrameDemosA", "villeDeNantes.csv"
+        )
         return GeoDataFrameLib.read_csv(_sio)
 
     @staticmethod
@@ -82,9 +82,9 @@ COMMUNE_0000000009746105;44109;2;44D;44;52;318808;6519;2006-08-02 08:36:54;2022-
         ile = ile[["geometry"]].dissolve()
         ile.to_csv('/tmp/ile.csv', sep=';', index=False)
         '''
-        _sio = StringIO("""geometry
-POLYGON Z ((355743.6363166183 6687586.56967093 0, 355742.26960689086 6687586.850647845 0, 355740.91288923577 6687587.131543047 0, 355739.54617950687 6687587.412519955 0, 355738.53902113193 6687587.670571438 0, 355737.55233674776 6687587.988411233 0, 355736.5661422078 6687588.366202758 0, 355735.61025045 6687588.783716979 0, 355734.6846614742 6687589.240953893 0, 355734.0389321894 6687589.705894917 0, 355733.44357147376 6687590.220387173 0, 355732.8885056138 6687590.774520418 0, 355732.37381624983 6687591.3782866 0, 355731.90933217393 6687592.011620109 0, 355731.50520874065 6687592.69442314 0, 355731.1512089547 6687593.396801539 0, 355730.85740653006 6687594.128665552 0, 355730.6137277531 6687594.880104934 0, 355730.3641389389 6687596.131223799 0, 355730.1446896251 6687597.402081445 0, 355729.97520067764 6687598.672530555 0, 355729.8457616636 6687599.952644784 0, 355729.74638050975 6687601.242505843 0, 355729.9021078367 6687603.179801294 0, 355730.0978034578 6687605.116769917 0, 355730.3534515198 6687607.05324829 0, 355730.6489045948 6687608.969415918 0, 355731.00439175195 6687610.895085255 0, 355731.68811589794 6687613.857303303 0, 355732.42180041486 6687616.819112815 0, 355733.19537158904 6687619.770603544 0, 355733.9988373476 6687622.711857203 0, 355734.83219769015 6687625.642873786 0, 355735.5293747411 6687627.805571996 0, 355736.19657557394 6687629.968515337 0, 355736.8537843356 6687632.131540391 0, 355737.4810985197 6687634.304802531 0, 355738.0984206325 6687636.478146386 0, 355738.24108545133 6687636.816728963 0, 355738.3437819751 6687637.155638374 0, 355738.41650227795 6687637.494792913 0, 355738.4594096411 6687637.854176488 0, 355738.4722591425 6687638.203813236 0, 355738.45521406305 6687638.563687061 0, 355738.4081111219 6687638.91381406 0, 355738.3600284912 6687639.144037588 0, 355738.0458337042 6687639.826105259 0, 355737.6715231927 6687640.488679273 0, 355737.24692574865 6687641.111694005 0, 355736.7720413723 6687641.695149456 0, 355736.2369596302 6687642.249119291 0, 355735.6714118216 6687642.7433825135 0, 355735.05557708064 6687643.198086458 0, 355733.70016559697 6687643.638852921 0, 355732.3344354754 6687644.039733266 0, 355730.9483130018 6687644.390817249 0, 355729.55170860945 6687644.682031202 0, 355728.1247197916 6687644.923530501 0, 355725.9259737113 6687644.88155463 0, 355723.7162558701 6687644.7197569925 0, 355721.5254608498 6687644.427900512 0, 355719.3535070107 6687643.995993232 0, 355717.2104680674 6687643.433945393 0, 355715.10600953316 6687642.701707478 0, 355712.98173013574 6687641.989616887 0, 355710.8574507415 6687641.277526293 0, 355708.7333346319 6687640.585419612 0, 355706.599308092 6687639.903386589 0, 355704.17698094517 6687639.40357831 0, 355701.7349145752 6687638.933909315 0, 355699.29301148845 6687638.484224224 0, 355696.8414428924 6687638.074588666 0, 355694.3899559391 6687637.674945058 0, 355688.38431144133 6687637.674091938 0, 355683.296223282 6687637.455890574 0, 355681.60865611845 6687636.3804943925 0, 355679.95065697876 6687635.254893309 0, 355678.3421283704 6687634.068931954 0, 355676.7732414998 6687632.842675943 0, 355675.2538251606 6687631.556059662 0, 355674.25718061876 6687630.65488082 0, 355673.3300723934 6687629.703170244 0, 355672.4723372044 6687628.680944025 0, 355671.68421997176 6687627.6181780305 0, 355670.97554948874 6687626.494806637 0, 355669.98786769033 6687624.244550406 0, 355669.0300804763 6687621.984057094 0, 355668.09227741376 6687619.723400376 0, 355667.1743768618 6687617.452588287 0, 355666.2863708943 6687615.171539128 0, 355660.30880407523 6687606.376948237 0, 355640.2038192271 6687601.535048594 0, 355610.75596915727 6687597.958669998 0, 355554.5258701523 6687596.619805398 0, 355517.1081858046 6687599.693734101 0, 355492.2215707212 6687595.450519911 0, 355460.7318626689 6687596.357537053 0, 355460.489210665 6687592.342487318 0, 355444.35666598513 6687593.043985071 0, 355439.25555425615 6687608.354423531 0, 355394.76530989946 6687610.486919659 0, 355394.27037157194 6687595.162285497 0, 355386.5894879547 6687595.594819906 0, 355386.60494972195 6687596.264199106 0, 354856.28195769736 6687625.831965668 0, 354852.4264868766 6687626.043357847 0, 354837.74385372957 6687626.8628966 0, 354833.74865714676 6687627.095416457 0, 354591.235488729 6687640.629815371 0, 354292.6900519527 6687657.470200896 0, 354033.4540659952 6687671.620870579 0, 353894.1135060278 6687679.964798517 0, 353893.61406562367 6687679.988867157 0, 353893.1250254022 6687680.062813841 0, 353892.6463037414 6687680.176646618 0, 353892.1778190194 6687680.320373542 0, 353891.7197344798 6687680.513978505 0, 353891.2818789514 6687680.737395916 0, 353890.8643340569 6687681.00061773 0, 353890.4670997957 6687681.303643945 0, 353890.1000866187 6687681.63640091 0, 353889.7632129043 6687681.988896688 0, 353889.4466498232 6687682.381196863 0, 353889.18021035066 6687682.793072459 0, 353888.9926463772 6687683.074399184 0, 353888.82522979326 6687683.375546411 0, 353888.687952672 6687683.696432448 0, 353888.58065176953 6687684.017073399 0, 353888.49349825695 6687684.357534857 0, 353888.44631303626 6687684.697669535 0, 353888.4191119616 6687685.037640824 0, 353888.41189503286 6687685.377448721 0, 353888.44472801813 6687685.7269217875 0, 353888.5073739783 6687686.056165871 0, 353888.590085707 6687686.395238518 0, 353888.70261041087 6687686.714082184 0, 353888.84511133394 6687687.032680767 0, 353889.00743315916 6687687.331132063 0, 353889.1996495816 6687687.619346323 0, 353889.41168690665 6687687.887413306 0, 353889.6536188292 6687688.145243259 0, 353890.7683708486 6687688.825619478 0, 353891.89303332084 6687689.495922059 0, 353893.02752462396 6687690.146159052 0, 353894.1620159284 6687690.796396041 0, 353895.31632813683 6687691.426485748 0, 353888.3628356173 6687708.730590094 0, 353882.62704588723 6687706.289324624 0, 353884.0201619948 6687701.901169373 0, 353884.0288481186 6687701.741216521 0, 353884.02762379113 6687701.591337312 0, 353884.0064153171 6687701.441621493 0, 353883.9752147701 6687701.291987368 0, 353883.9241116986 6687701.152508581 0, 353883.8830007002 6687701.012948098 0, 353883.82190555555 6687700.873551006 0, 353883.74090788636 6687700.74430925 0, 353883.6499997659 6687700.625141135 0, 353883.5490995724 6687700.506054718 0, 353883.4482810004 6687700.396960244 0, 353883.3276415262 6687700.308013057 0, 353883.1970099785 6687700.219147564 0, 353883.0665416749 6687700.150265968 0, 353882.9361549927 6687700.091376315 0, 353882.7561344324 6687700.072862929 0, 353882.5762771155 6687700.074333434 0, 353882.39650142053 6687700.085795888 0, 353882.2268810422 6687700.117160537 0, 353882.0574239076 6687700.168509087 0, 353881.8880483947 6687700.229849579 0, 353881.72874657705 6687700.301100329 0, 353881.5796000759 6687700.392253275 0, 353881.42054312327 6687700.493479862 0, 353881.29154401214 6687700.604453313 0, 353881.1727002177 6687700.735328966 0, 353881.0538564231 6687700.866204614 0, 353880.9551600187 6687701.016900774 0, 353880.86645568727 6687701.167515236 0, 353880.78782505065 6687701.328039948 0, 353880.7292601823 6687701.49839322 0, 353877.10521036707 6687711.690512328 0, 353877.05590297474 6687711.77085638 0, 353877.01666927745 6687711.861110684 0, 353876.9875092754 6687711.961275243 0, 353876.9582676512 6687712.051447852 0, 353876.9390997223 6687712.151530716 0, 353876.9399159398 6687712.2514501875 0, 353876.9407321573 6687712.351369659 0, 353876.95154044824 6687712.451207439 0, 353876.962348739 6687712.551045216 0, 353876.9930595547 6687712.640727659 0, 353877.0238519922 6687712.740402048 0, 353877.06455488096 6687712.830002793 0, 353877.11516822147 6687712.909529898 0, 353877.17585525697 6687712.998967256 0, 353877.236379049 6687713.068420719 0, 353877.30697653606 6687713.147784435 0, 353877.37741077965 6687713.207164257 0, 353877.4578370964 6687713.266462382 0, 353877.54817386495 6687713.3156868685 0, 353877.6285185601 6687713.364993045 0, 353877.72876578016 6687713.40414389 0, 353877.81893930485 6687713.433384478 0, 353877.9190232813 6687713.452551425 0, 353878.019025636 6687713.461726427 0, 353878.11902799073 6687713.470901429 0, 353878.2189487237 6687713.47008448 0, 353878.3490905418 6687713.498998292 0, 353878.4791507381 6687713.517920156 0, 353878.619121386 6687713.526768376 0, 353878.759010412 6687713.5256246505 0, 353878.8887441213 6687713.504578726 0, 353879.0284699038 6687713.483451106 0, 353879.1580403694 6687713.442421283 0, 353879.2776187618 6687713.401473159 0, 353879.4070259841 6687713.340459447 0, 353879.52635951096 6687713.269535476 0, 353879.63561934297 6687713.188701257 0, 353879.74487917474 6687713.107867036 0, 353879.8439836898 6687713.007130614 0, 353879.93309613166 6687712.90647589 0, 353880.0121348783 6687712.795910914 0, 353880.0810999297 6687712.675435681 0, 353880.14007290825 6687712.555042149 0, 353880.18905381305 6687712.434730306 0, 353880.23795309616 6687712.304426516 0, 353881.729813039 6687708.994666311 0, 353887.3360323166 6687711.476961614 0, 353879.01033952663 6687732.059870096 0, 353877.9792786577 6687731.838469846 0, 353876.95820986276 6687731.616987901 0, 353875.92706737336 6687731.385595707 0, 353874.91590903135 6687731.154040123 0, 353873.9047506898 6687730.922484536 0, 353873.49458594754 6687730.865882331 0, 353873.0848293136 6687730.859239858 0, 353872.67523592326 6687730.87258128 0, 353872.27596109314 6687730.925808801 0, 353871.87693112815 6687731.009012165 0, 353871.48813810153 6687731.122109672 0, 353871.10966363497 6687731.275093275 0, 353870.74134448526 6687731.44797908 0, 353870.3932543474 6687731.650677339 0, 353870.0653932213 6687731.8831880465 0, 353869.74776903365 6687732.145592906 0, 353869.4602843096 6687732.427736576 0, 353869.1930285971 6687732.739692697 0, 353868.94592027477 6687733.071469323 0, 353868.800446742 6687733.612259899 0, 353868.6950231248 6687734.162715647 0, 353868.6296494233 6687734.722836567 0, 353868.61431771045 6687735.292540957 0, 353868.6488647437 6687735.851844927 0, 353868.72338007094 6687736.410822121 0, 353868.8677582914 6687736.959235509 0, 353869.04203111085 6687737.497411863 0, 353869.25610898144 6687738.015277546 0, 353869.51998397656 6687738.512750863 0, 353869.82366402255 6687738.989913503 0, 353870.16714912007 6687739.446765476 0, 353994.6753195592 6687972.615910731 0, 354054.9809937789 6688084.919615472 0, 354135.04526558117 6688234.224373125 0, 354147.4268580324 6688228.187523098 0, 354163.44901877525 6688257.964463458 0, 354164.1371314296 6688265.123551687 0, 354170.51000275067 6688272.146228923 0, 354171.1177021925 6688273.140523284 0, 354169.2914697436 6688281.988937236 0, 354170.252243607 6688283.390042695 0, 354180.4413457931 6688301.283476653 0, 354184.92621813633 6688302.276050014 0, 354192.02514084254 6688310.102194421 0, 354190.95979717735 6688317.905154499 0, 354196.86496975424 6688332.496075714 0, 354200.7278912725 6688342.966745904 0, 354209.93311882217 6688349.306753629 0, 354212.8499892298 6688349.18297967 0, 354212.5742791124 6688350.903965944 0, 354218.9874842325 6688355.528083266 0, 354243.21838558133 6688374.885551528 0, 354259.1325205445 6688409.779606485 0, 354263.6943158698 6688420.174615419 0, 354299.2611627646 6688438.819862053 0, 354408.8885112863 6688498.289050405 0, 354409.7215707615 6688496.293705905 0, 354446.87640558544 6688516.055137348 0, 354448.1547191128 6688517.183846025 0, 354456.1363985052 6688524.203364685 0, 354600.965718833 6688602.910352406 0, 354569.14061655477 6688660.538255989 0, 354576.8258608636 6688664.302601099 0, 354576.8750504816 6688664.217119585 0, 354585.9040102707 6688668.545197055 0, 354622.6822115439 6688601.963367627 0, 354634.00559858483 6688608.266073665 0, 354633.62596224534 6688609.49827141 0, 354633.2563997346 6688610.74037942 0, 354632.906821389 6688611.982324048 0, 354632.57722720766 6688613.2241052855 0, 354632.26761719113 6688614.465723133 0, 354632.1617098849 6688614.956228046 0, 354632.09577090835 6688615.446406177 0, 354632.0797923443 6688615.936175841 0, 354632.0938717745 6688616.435692383 0, 354632.1578298703 6688616.924808489 0, 354632.26167454896 6688617.403605854 0, 354632.40548755764 6688617.882076441 0, 354632.5891054023 6688618.34023632 0, 354632.80261774757 6688618.7881591525 0, 354633.05585318204 6688619.205779314 0, 354633.3489751993 6688619.61308073 0, 354633.6718282235 6688619.990161172 0, 354634.02441225434 6688620.3370206375 0, 354634.39673520945 6688620.65374082 0, 354634.80878125335 6688620.940158326 0, 354636.0842337403 6688621.719148356 0, 354637.41890300007 6688622.407720538 0, 354638.80279695004 6688623.005956565 0, 354640.22584176064 6688623.503946165 0, 354641.6779636024 6688623.891779066 0, 354787.81950097816 6688667.563858181 0, 354787.7107514292 6688666.485542801 0, 354798.83008425235 6688669.832097407 0, 354895.56886905734 6688667.262468552 0, 354910.418078421 6688662.374573304 0, 354910.7370075855 6688662.272039361 0, 354910.98109980737 6688655.465059141 0, 354917.1516918494 6688656.084114358 0, 354925.8689946703 6688654.084262252 0, 354927.8955449159 6688651.399659383 0, 355057.0676958657 6688608.1446274 0, 355149.1334269772 6688586.467294332 0, 355251.64619639656 6688565.354055494 0, 355382.09198881465 6688533.650048227 0, 355382.18167230615 6688533.61933702 0, 355374.76152867783 6688611.112954326 0, 355393.6521979737 6688606.761587768 0, 355401.4750678267 6688528.415302634 0, 355403.2507972165 6688528.051041047 0, 355677.388930623 6688464.174923152 0, 355678.6437636834 6688463.655038132 0, 355679.91874440707 6688463.154973642 0, 355681.2038807127 6688462.67481139 0, 355682.4892622682 6688462.224625046 0, 355683.7848811555 6688461.804332906 0, 355685.2680605943 6688461.102713252 0, 355686.6903065395 6688460.281680173 0, 355688.03171657753 6688459.351389045 0, 355689.30228279036 6688458.311758165 0, 355690.4721924326 6688457.183016586 0, 355691.3646127863 6688456.33633784 0, 355692.1766059841 6688455.430360906 0, 355692.9281561892 6688454.464922361 0, 355693.5993609887 6688453.450177596 0, 355694.1902203823 6688452.386126601 0, 355694.56346122944 6688451.593656262 0, 355694.92670999456 6688450.801267626 0, 355695.2798849275 6688449.99896872 0, 355695.64313369215 6688449.206580084 0, 355695.9963086248 6688448.40428118 0, 355717.6602975346 6688442.26153421 0, 355737.55551340047 6688442.218766595 0, 355759.60992577963 6688447.154662688 0, 355762.45702269376 6688451.937841735 0, 355772.9483892235 6688456.6984855095 0, 355787.4762963213 6688451.623344307 0, 355848.16942447546 6688462.268857796 0, 355848.4696774344 6688462.326358498 0, 355848.3817924636 6688462.576893109 0, 355824.2397332579 6688524.918524536 0, 355822.58614238194 6688529.218888092 0, 355839.3802687399 6688536.096398623 0, 355842.8795227225 6688537.5367038855 0, 355845.9777036647 6688538.810413781 0, 355860.706430647 6688544.845445665 0, 355863.2977609304 6688537.909349854 0, 355886.6096591715 6688475.474577633 0, 355890.43930581614 6688476.992122161 0, 355908.61348384747 6688483.998243779 0, 355916.4838243182 6688466.416790938 0, 355969.7388541837 6688486.4062841935 0, 356057.2550594503 6688519.345880473 0, 356055.35869744385 6688524.507597173 0, 356420.7510253469 6688669.530780223 0, 356385.70624089724 6688741.5645335065 0, 356381.3721649768 6688750.45345682 0, 356392.33111736755 6688754.960461062 0, 356396.2314449012 6688756.567361469 0, 356399.33970008115 6688757.850981446 0, 356401.1244222206 6688758.585835968 0, 356404.151787743 6688752.425596958 0, 356440.8424407236 6688677.590435707 0, 356545.07479116303 6688718.867098398 0, 356582.4403011132 6688732.6212043185 0, 356625.7396368713 6688746.146919928 0, 356635.8582100341 6688749.311787657 0, 356691.26995781675 6688765.426477817 0, 356701.86618898454 6688768.347615886 0, 356742.29276555014 6688778.839071555 0, 356747.22777343105 6688779.8879149025 0, 356763.19122465554 6688782.94503084 0, 356780.56584866496 6688786.270401136 0, 356824.4493955574 6688794.255410044 0, 356883.0967263448 6688802.789195959 0, 356882.92275512905 6688803.510089256 0, 356883.35323222476 6688803.606495547 0, 356871.04286988033 6688850.10302806 0, 356870.853265567 6688850.13455647 0, 356870.6637430071 6688850.176076857 0, 356870.4842942843 6688850.227507524 0, 356870.29493523214 6688850.289011872 0, 356870.1256420994 6688850.360344786 0, 356869.94652039156 6688850.451743367 0, 356869.7773907663 6688850.543060238 0, 356869.61833497806 6688850.644287382 0, 356869.4694347798 6688850.765416773 0, 356869.3205345819 6688850.88654617 0, 356869.1717161375 6688851.017667542 0, 356869.0429636126 6688851.158617475 0, 356868.9242031707 6688851.299485701 0, 356868.80560623633 6688851.460337887 0, 356868.6970013848 6688851.621108366 0, 356868.60838069906 6688851.781715423 0, 356868.5198417668 6688851.95231446 0, 356868.4313845887 6688852.1329054795 0, 356868.37290365907 6688852.313251371 0, 356868.32441481226 6688852.493515552 0, 356868.2955013625 6688852.623656417 0, 356868.27600771945 6688852.683771716 0, 356868.24758479215 6688852.873864459 0, 356868.2191618649 6688853.063957203 0, 356868.21072310343 6688853.253886529 0, 356868.2123581787 6688853.453726127 0, 356868.22390358296 6688853.643492035 0, 356868.2454410703 6688853.833176234 0, 356868.2869627233 6688854.022697015 0, 356868.32848437625 6688854.212217795 0, 356868.3899084413 6688854.391583177 0, 356868.45133250626 6688854.570948559 0, 356868.5327407373 6688854.750150529 0, 356868.6240592971 6688854.919278801 0, 356868.7053857745 6688855.088488791 0, 356868.8265988293 6688855.2473799605 0, 356868.93773804756 6688855.396360859 0, 356869.06886143156 6688855.545178339 0, 356869.19990306214 6688855.684003842 0, 356869.34085502155 6688855.812755654 0, 356869.4917173103 6688855.931433778 0, 356857.9660236911 6688899.403770715 0, 356864.9010834657 6688900.636112042 0, 356880.2622307549 6688903.35840349 0, 356881.2409369726 6688899.623142261 0, 356891.1031122216 6688861.680349755 0, 356891.29288004304 6688861.668805299 0, 356891.4923946859 6688861.627203195 0, 356891.68183549226 6688861.575690825 0, 356891.8612842154 6688861.52426016 0, 356892.0405694311 6688861.452845536 0, 356892.2197728927 6688861.371438931 0, 356892.3988946007 6688861.280040347 0, 356892.557950389 6688861.178813201 0, 356892.7169244234 6688861.067594075 0, 356892.87581670383 6688860.946382969 0, 356893.0146430647 6688860.815343298 0, 356893.1533876717 6688860.674311649 0, 356893.28205844184 6688860.523369728 0, 356893.40073712927 6688860.37250952 0, 356893.50934197986 6688860.21173904 0, 356893.60787299374 6688860.041058288 0, 356893.69641192467 6688859.870459245 0, 356893.7748770187 6688859.689949929 0, 356893.8433500301 6688859.509522324 0, 356893.90174920455 6688859.319184449 0, 356893.930826161 6688859.209027541 0, 356893.95023805 6688859.138920262 0, 356893.968587139 6688858.938917242 0, 356894.00700214755 6688858.748742784 0, 356894.01544090774 6688858.558813456 0, 356894.01380583085 6688858.358973855 0, 356894.00226042507 6688858.1692079455 0, 356893.96065701667 6688857.96969518 0, 356893.9391195279 6688857.780010977 0, 356893.8876057904 6688857.590571902 0, 356893.8260999701 6688857.401214536 0, 356893.7546838208 6688857.221930863 0, 356893.6732755885 6688857.042728893 0, 356893.5819570272 6688856.873600616 0, 356893.48072813667 6688856.714546026 0, 356893.3695071636 6688856.555573149 0, 356893.2482941074 6688856.3966819765 0, 356893.117252476 6688856.257856476 0, 356892.97621876176 6688856.119112683 0, 356892.82527471834 6688855.99044258 0, 356892.674412429 6688855.871764458 0, 356905.8667482226 6688806.030474199 0, 356934.97060604644 6688809.080060489 0, 356989.05635146756 6688814.573409424 0, 356989.10040750465 6688815.072681597 0, 356996.7885415916 6688916.8948637135 0, 357006.5747968671 6688917.304477114 0, 356998.8214596387 6688816.062401247 0, 356998.7874774371 6688815.573039342 0, 356999.25751409755 6688815.619158868 0, 357093.39695083804 6688825.111782335 0, 357299.72670562984 6688848.246239318 0, 357338.32310654985 6688852.447287857 0, 357369.6604139157 6688857.337235521 0, 357577.0631241609 6688889.476258798 0, 357587.9490629177 6688891.165927301 0, 357593.3559882544 6688892.4907036405 0, 357657.89280346525 6688908.81054223 0, 357846.7786646496 6688972.66776489 0, 357875.0905729932 6688983.957761353 0, 357999.4965900273 6689033.573038963 0, 358040.42861100804 6689048.437123448 0, 358120.18389341614 6689068.359755235 0, 358256.27486375516 6689093.967144207 0, 358256.975290691 6689094.081327855 0, 358267.16243861103 6689095.856649408 0, 358299.392933967 6689103.657135808 0, 358334.04008861206 6689113.706191257 0, 358396.7211865782 6689140.153761331 0, 358418.09030533984 6689146.823969804 0, 358458.8950836992 6689159.570646617 0, 358473.70300703024 6689160.628676243 0, 358479.74725991115 6689153.134712565 0, 358478.14850912726 6689137.269451166 0, 358411.9549581902 6689058.918760512 0, 358365.5503592435 6689000.511464137 0, 358339.3087383555 6688974.785137466 0, 358335.91884110146 6688972.054887715 0, 358327.0321887367 6688966.791486711 0, 358304.2630590193 6688958.7738396255 0, 358275.00301108113 6688950.069709367 0, 358239.3659175567 6688944.825228451 0, 358201.3382009886 6688920.973985371 0, 358171.30418007047 6688900.724673067 0, 358133.48907527886 6688849.1220860155 0, 358109.42538210476 6688813.565163203 0, 358081.2991500188 6688790.772109342 0, 358058.5025208748 6688786.721660632 0, 358050.84870279016 6688784.356040399 0, 358040.718927567 6688779.8222777285 0, 358033.6449022783 6688771.376381599 0, 358028.36384600855 6688759.788121245 0, 358025.9960806468 6688746.417328148 0, 358022.87447653845 6688733.732200823 0, 358020.5933098367 6688729.723817056 0, 357974.38038822374 6688670.315709316 0, 357952.7250105412 6688642.09369139 0, 357930.0594695973 6688612.540920319 0, 357904.3254783265 6688581.68422215 0, 357873.3751905642 6688541.047408263 0, 357836.9110696247 6688517.772955697 0, 357759.98357561755 6688485.616198518 0, 357752.7239356595 6688478.910544733 0, 357741.86842610856 6688468.726878365 0, 357729.4728457695 6688457.17682136 0, 357715.0397980168 6688444.534243168 0, 357700.4989631396 6688432.152355584 0, 357680.012584186 6688414.9027082315 0, 357664.56845619075 6688402.038568545 0, 357647.1268291968 6688388.081580892 0, 357645.18560354516 6688386.53860328 0, 357630.85294992174 6688375.174264227 0, 357621.51070623973 6688367.966025503 0, 357611.1751587519 6688360.266277808 0, 357600.7458400514 6688352.097642539 0, 357588.34916208545 6688342.85589804 0, 357576.394588437 6688333.910317483 0, 357558.90478251583 6688321.392666325 0, 357555.55771633657 6688319.011810907 0, 357552.22072399914 6688316.640865761 0, 357548.8936419919 6688314.259846924 0, 357545.55648615235 6688311.868917827 0, 357542.2193303176 6688309.477988735 0, 357537.05282396305 6688305.782990802 0, 357531.8664969693 6688302.10814028 0, 357526.660349336 6688298.4534371635 0, 357521.43446281884 6688294.828873435 0, 357516.1888374178 6688291.234449091 0, 357509.8173132276 6688286.819842753 0, 357503.4358787286 6688282.415310128 0, 357497.02463151456 6688278.031006634 0, 357490.623621665 6688273.676597379 0, 357484.19271734456 6688269.33242527 0, 357478.2649325804 6688265.413822448 0, 357472.30733509804 6688261.515448744 0, 357466.3399908153 6688257.647132713 0, 357460.3529076507 6688253.808956064 0, 357454.32610144245 6688250.001082235 0, 357447.6367929515 6688245.828898498 0, 357440.93765590724 6688241.676780454 0, 357434.23843712424 6688237.514670443 0, 357427.5492921942 6688233.362470711 0, 357420.8702211169 6688229.220181255 0, 357420.8501551995 6688229.210352708 0, 357415.1150815548 6688225.639916658 0, 357409.3798444116 6688222.049496663 0, 357403.6444437698 6688218.439092718 0, 357397.9289455469 6688214.818533373 0, 357392.3407282188 6688210.877168417 0, 357392.14997937414 6688210.768809273 0, 357358.71580084314 6688190.197577071 0, 357336.00745035725 6688176.17374534 0, 357293.10099742503 6688152.042655801 0, 357289.6176396921 6688150.102591794 0, 357197.1029111187 6688102.244964373 0, 357192.0953614387 6688099.657850781 0, 357191.91468644206 6688099.559401902 0, 357184.4585227662 6688095.703262017 0, 357055.4495206047 6688031.876062018 0, 357049.0181087167 6688028.691041568 0, 356922.16730109823 6687966.055302802 0, 356811.8547169149 6687913.21700257 0, 356811.6540577791 6687913.1187171275 0, 356871.808374547 6687789.517439076 0, 356862.66831031657 6687785.035542448 0, 356853.207273258 6687780.406381138 0, 356792.9456591665 6687904.328298513 0, 356772.15778163273 6687894.195886465 0, 356751.340173243 6687884.093695495 0, 356730.5228102363 6687874.021480458 0, 356709.69578228606 6687863.989315041 0, 356688.839105231 6687853.997362665 0, 356663.36702310777 6687841.714869221 0, 356637.91517058696 6687829.462188286 0, 356612.4534896753 6687817.229573029 0, 356586.9818986199 6687805.007031481 0, 356561.5405292448 6687792.814220725 0, 356561.50039742055 6687792.794563638 0, 356541.4579030988 6687783.385518847 0, 356521.3161421118 6687774.057226954 0, 356501.11540978774 6687764.849328978 0, 356480.8656982043 6687755.761743197 0, 356460.566925607 6687746.784477632 0, 356444.94645357877 6687740.456973722 0, 356429.3063244583 6687734.16960109 0, 356413.6464564927 6687727.912367759 0, 356397.97700526577 6687721.70517596 0, 356382.6286904266 6687715.6652328065 0, 356382.2978072726 6687715.528041751 0, 356361.42456319276 6687707.175017413 0, 356340.2404202229 6687698.684638545 0, 356319.0462035264 6687690.184349372 0, 356297.8520686866 6687681.694052114 0, 356276.6678442793 6687673.193681126 0, 356260.5465426793 6687666.720382976 0, 356245.1270574956 6687660.531132037 0, 356229.7174826953 6687654.331807394 0, 356214.4183113328 6687648.191535697 0, 356255.6029444045 6687544.810762616 0, 356245.668957993 6687540.994876499 0, 356203.96141939994 6687643.980214876 0, 356199.34969361394 6687642.139312321 0, 356199.25951964525 6687642.110071821 0, 356203.2552708838 6687632.164697452 0, 356240.6368530516 6687539.06748065 0, 356233.1187943676 6687536.191129659 0, 356220.9356936215 6687532.283717296 0, 356220.40706221416 6687533.627052077 0, 356188.43178003374 6687613.299930156 0, 356187.9812889232 6687614.422788188 0, 356178.8833343364 6687637.1005130755 0, 356178.58969557594 6687637.85236239 0, 356178.17928572383 6687637.765784783 0, 356177.7692024565 6687637.719175071 0, 356177.3594457738 6687637.712533252 0, 356176.9500156754 6687637.745859322 0, 356176.5408305157 6687637.809161315 0, 356176.14188236813 6687637.902357512 0, 356175.7432608051 6687638.035521603 0, 356175.46462577686 6687638.177697133 0, 356175.36535820516 6687638.25845003 0, 356175.35552942334 6687638.278515687 0, 356175.3356269213 6687638.288671083 0, 356175.32579813944 6687638.308736739 0, 356175.30589563755 6687638.318892135 0, 356175.29606685566 6687638.338957792 0, 356175.2761643536 6687638.349113187 0, 356175.2663355717 6687638.369178845 0, 356175.2465147158 6687638.389326211 0, 356175.22669386 6687638.409473582 0, 356175.2068730039 6687638.429620948 0, 356175.1870521482 6687638.449768319 0, 356175.16723129223 6687638.469915686 0, 356175.1574025103 6687638.489981342 0, 356175.1375000084 6687638.50013674 0, 356175.1276712266 6687638.520202396 0, 356175.1077687244 6687638.53035779 0, 356175.09793994256 6687638.550423446 0, 356175.0881111609 6687638.570489108 0, 356174.95083479944 6687638.891376199 0, 356174.5568670641 6687639.594082756 0, 356174.5073965703 6687639.654443149 0, 356174.42876631534 6687639.814968406 0, 356174.42892960756 6687639.834952353 0, 356174.4191008257 6687639.85501801 0, 356174.4092720438 6687639.875083667 0, 356174.39944326185 6687639.895149323 0, 356174.38961448014 6687639.915214982 0, 356174.37978569826 6687639.935280638 0, 356174.36995691614 6687639.955346294 0, 356174.36012813443 6687639.9754119525 0, 356174.3502993525 6687639.99547761 0, 356174.35046264465 6687640.015461555 0, 356174.3406338627 6687640.035527211 0, 356174.3308050811 6687640.055592872 0, 356174.3209762992 6687640.075658529 0, 356174.31114751735 6687640.095724185 0, 356174.3013187354 6687640.115789843 0, 356174.3014820277 6687640.135773788 0, 356174.23292549263 6687640.306209306 0, 356174.174279386 6687640.466571147 0, 356174.16445060406 6687640.486636803 0, 356174.154621822 6687640.5067024585 0, 356174.14479304035 6687640.526768116 0, 356174.1349642584 6687640.546833772 0, 356174.12513547647 6687640.566899429 0, 356174.1153066947 6687640.586965088 0, 356174.1154699868 6687640.606949033 0, 356174.0956491309 6687640.627096402 0, 356174.095812423 6687640.647080346 0, 356174.0859836413 6687640.667146007 0, 356174.0761548593 6687640.687211662 0, 356174.0663260775 6687640.70727732 0, 356174.0564972955 6687640.727342976 0, 356174.0466685137 6687640.747408635 0, 356174.0368397316 6687640.76747429 0, 356174.01701887586 6687640.78762166 0, 356173.9482174025 6687640.92808126 0, 356173.9383886208 6687640.94814692 0, 356173.92855983874 6687640.968212574 0, 356173.91873105697 6687640.988278234 0, 356173.908902275 6687641.00834389 0, 356173.8990734932 6687641.028409548 0, 356173.8892447113 6687641.048475204 0, 356173.87941592926 6687641.068540861 0, 356173.8695871473 6687641.088606519 0, 356173.8597583655 6687641.108672175 0, 356173.84992958355 6687641.1287378315 0, 356173.8401008018 6687641.148803491 0, 356173.83027201984 6687641.168869147 0, 356173.82044323784 6687641.188934803 0, 356173.8206065301 6687641.20891875 0, 356173.80078567413 6687641.229066119 0, 356173.80103061243 6687641.259042039 0, 356173.79120183055 6687641.279107695 0, 356173.7713809746 6687641.299255064 0, 356173.77162591275 6687641.329230982 0, 356173.7718708512 6687641.359206903 0, 356173.76204206917 6687641.379272558 0, 356173.73320896336 6687641.519405313 0, 356173.7333724664 6687641.539389246 0, 356173.72354389017 6687641.559454893 0, 356173.7237073932 6687641.579438827 0, 356173.7238708962 6687641.599422759 0, 356173.71404232 6687641.619488404 0, 356173.70421374385 6687641.639554053 0, 356173.70437724673 6687641.659537984 0, 356173.69454867055 6687641.679603629 0, 356173.6947121736 6687641.699587565 0, 356173.68488359725 6687641.71965321 0, 356173.67505502095 6687641.739718854 0, 356173.66522644483 6687641.759784501 0, 356173.65539786854 6687641.779850146 0, 356173.64556929236 6687641.799915792 0, 356173.6357407161 6687641.819981436 0, 356173.6259121398 6687641.840047082 0, 356173.61608356354 6687641.860112728 0, 356173.59626290784 6687641.880260082 0, 356173.5270541164 6687641.970759764 0, 356173.4577635736 6687642.051267482 0, 356173.3884730305 6687642.131775197 0, 356165.58186174417 6687639.407667908 0, 356165.37145666644 6687639.339440026 0, 356160.92045495077 6687649.818144036 0, 356148.3952844057 6687645.6337291 0, 356125.2498815026 6687638.028743616 0, 356090.8090681865 6687626.309241861 0, 356081.19169414224 6687623.330145619 0, 356064.3409066832 6687619.291027236 0, 356063.28388827055 6687622.007672458 0, 356038.1112175496 6687613.330080426 0, 356038.84249813756 6687611.105737624 0, 356022.2060035185 6687608.83356112 0, 356019.55524647946 6687608.505495984 0, 356018.3430585663 6687613.022082443 0, 356008.4056044393 6687619.788412391 0, 356007.7194170936 6687620.193728704 0, 356007.43062667805 6687620.316001801 0, 356007.12128060986 6687620.368494613 0, 356006.8216816851 6687620.390929848 0, 356006.29226506414 6687620.415244422 0, 356005.9923395652 6687620.39771183 0, 356005.4724251569 6687620.3619929515 0, 356000.71399368736 6687620.131104362 0, 355997.1333206257 6687619.730702595 0, 355997.0932706874 6687619.72103748 0, 355997.0432286754 6687619.711454076 0, 355996.9932683067 6687619.711862629 0, 355996.9432262947 6687619.702279225 0, 355996.89318428276 6687619.692695822 0, 355996.84322391415 6687619.693104373 0, 355996.79318190203 6687619.683520967 0, 355996.74313989014 6687619.6739375675 0, 355996.69317952154 6687619.674346119 0, 355996.6431375094 6687619.664762713 0, 355996.5930954974 6687619.65517931 0, 355996.55312720255 6687619.655506154 0, 355996.5030851905 6687619.645922748 0, 355996.4530431785 6687619.636339344 0, 355996.40300116653 6687619.626755941 0, 355996.3530407979 6687619.627164493 0, 355996.30299878586 6687619.617581087 0, 355996.25295677385 6687619.607997684 0, 355996.2029147619 6687619.598414282 0, 355996.1529543934 6687619.598822835 0, 355996.10291238123 6687619.589239428 0, 355996.06286244304 6687619.579574315 0, 355996.0128204309 6687619.56999091 0, 355995.9627784188 6687619.5604075035 0, 355995.9128180503 6687619.560816059 0, 355995.86277603824 6687619.551232654 0, 355995.8127340262 6687619.541649248 0, 355995.7626920144 6687619.532065848 0, 355995.71265000233 6687619.522482442 0, 355995.66260799015 6687619.512899036 0, 355995.61264762166 6687619.513307591 0, 355995.57259768335 6687619.503642475 0, 355995.5225556714 6687619.494059071 0, 355995.47251365945 6687619.484475667 0, 355995.4224716472 6687619.4748922605 0, 355995.3724296354 6687619.465308859 0, 355995.3223876234 6687619.455725454 0, 355995.2724272549 6687619.456134008 0, 355995.2223852427 6687619.4465506 0, 355995.17234323075 6687619.4369672 0, 355995.13229329255 6687619.427302085 0, 355995.08225128055 6687619.41771868 0, 355995.0322092685 6687619.4081352735 0, 355994.97217518295 6687619.3986335825 0, 355994.9321252446 6687619.388968468 0, 355994.8821648759 6687619.389377019 0, 355994.8321228639 6687619.379793613 0, 355994.78208085214 6687619.370210213 0, 355994.7220467664 6687619.360708518 0, 355994.6919889018 6687619.350961694 0, 355994.64194688975 6687619.3413782865 0, 355994.5919048778 6687619.331794883 0, 355994.5418628659 6687619.322211481 0, 355994.4918208539 6687619.312628076 0, 355994.44186048507 6687619.313036626 0, 355994.39181847335 6687619.303453224 0, 355994.3417764613 6687619.2938698195 0, 355994.29173444933 6687619.284286415 0, 355994.2516845111 6687619.274621302 0, 355994.2016424991 6687619.265037896 0, 355994.151600487 6687619.255454491 0, 355994.10155847506 6687619.245871086 0, 355994.0515164631 6687619.236287684 0, 355994.00155609444 6687619.236696233 0, 355993.95151408267 6687619.227112833 0, 355993.90147207066 6687619.217529427 0, 355993.85143005865 6687619.207946023 0, 355993.81138012046 6687619.198280908 0, 355993.7613381083 6687619.188697502 0, 355993.7112960965 6687619.1791141 0, 355993.66133572796 6687619.179522652 0, 355993.6112937159 6687619.169939249 0, 355993.56125170394 6687619.160355844 0, 355993.51120969205 6687619.150772441 0, 355993.46116768004 6687619.141189033 0, 355993.4211993853 6687619.141515879 0, 355991.24153937877 6687618.989465507 0, 355990.7018041116 6687618.973893957 0, 355990.3821393965 6687618.986500653 0, 355990.08254047204 6687619.008935884 0, 355989.7630390433 6687619.041526489 0, 355989.46344011865 6687619.063961716 0, 355989.1639228376 6687619.096388903 0, 355988.86440555635 6687619.1288160905 0, 355988.5249199804 6687619.161570119 0, 355988.2254026991 6687619.193997305 0, 355987.92588541785 6687619.226424492 0, 355987.62644978 6687619.268843633 0, 355987.32693249854 6687619.301270817 0, 355986.9976022828 6687619.353927048 0, 355986.65819835 6687619.396673032 0, 355986.35876271204 6687619.439092174 0, 355986.0593270741 6687619.481511319 0, 355985.759891436 6687619.523930461 0, 355978.52225109993 6687620.3925190475 0, 355975.4866201279 6687620.657165977 0, 355975.09701089625 6687620.6703446405 0, 355974.797330328 6687620.682787908 0, 355974.4874943995 6687620.675328972 0, 355974.1876505449 6687620.667788328 0, 355973.8776513302 6687620.640345479 0, 355973.57772583235 6687620.622812877 0, 355973.2677266175 6687620.595370027 0, 355972.96780111984 6687620.577837426 0, 355972.6578019051 6687620.550394577 0, 355972.34788433363 6687620.532943685 0, 355972.0478771928 6687620.505419126 0, 355971.74787005194 6687620.477894565 0, 355971.44786291104 6687620.450370008 0, 355970.60779393086 6687620.367306066 0, 355970.30770514684 6687620.329789549 0, 355966.1768149064 6687619.853946124 0, 355966.12677289493 6687619.844362721 0, 355966.0767308832 6687619.834779317 0, 355966.0267705148 6687619.835187868 0, 355965.9767285032 6687619.825604463 0, 355965.9266864916 6687619.816021058 0, 355965.87672612304 6687619.816429609 0, 355965.82668411115 6687619.8068462 0, 355965.77664209966 6687619.797262799 0, 355965.7266817313 6687619.797671351 0, 355965.67663971963 6687619.7880879445 0, 355965.626597708 6687619.77850454 0, 355965.57655569643 6687619.768921137 0, 355965.5265953278 6687619.769329685 0, 355965.47655331646 6687619.759746284 0, 355965.4265113046 6687619.750162874 0, 355965.37655093614 6687619.750571426 0, 355965.3265089247 6687619.7409880245 0, 355965.276466913 6687619.731404617 0, 355965.22642490134 6687619.721821213 0, 355965.17646453285 6687619.722229763 0, 355965.12642252113 6687619.712646358 0, 355965.0763805097 6687619.703062955 0, 355965.0363305718 6687619.69339784 0, 355964.98628856015 6687619.683814433 0, 355964.9363281917 6687619.684222985 0, 355964.88628617994 6687619.67463958 0, 355964.83624416834 6687619.665056173 0, 355964.7862021567 6687619.655472767 0, 355964.7361601452 6687619.645889362 0, 355964.68619977665 6687619.646297913 0, 355964.63615776517 6687619.636714511 0, 355964.5861157535 6687619.6271311045 0, 355964.5360737419 6687619.617547699 0, 355964.4860317303 6687619.607964293 0, 355964.43607136194 6687619.608372848 0, 355964.3860293504 6687619.598789443 0, 355964.3359873385 6687619.589206033 0, 355964.285945327 6687619.579622629 0, 355964.23590331554 6687619.570039225 0, 355964.18586130394 6687619.5604558205 0, 355964.13590093533 6687619.560864371 0, 355964.08585892397 6687619.551280968 0, 355964.0458089861 6687619.541615852 0, 355963.99576697435 6687619.532032445 0, 355963.9457249627 6687619.52244904 0, 355963.8956829512 6687619.512865636 0, 355963.8457225829 6687619.51327419 0, 355963.7956805712 6687619.503690781 0, 355963.74563855963 6687619.494107377 0, 355963.69559654803 6687619.4845239725 0, 355963.6455545364 6687619.4749405645 0, 355963.59551252483 6687619.46535716 0, 355963.5454705133 6687619.455773755 0, 355963.49551014486 6687619.4561823085 0, 355963.4454681332 6687619.446598903 0, 355963.39542612166 6687619.437015497 0, 355963.34538411006 6687619.42743209 0, 355963.2953420986 6687619.417848686 0, 355963.24530008703 6687619.408265282 0, 355963.2053317922 6687619.408592122 0, 355963.1552897805 6687619.3990087155 0, 355963.1052477692 6687619.389425313 0, 355963.0552057575 6687619.379841907 0, 355962.9951716724 6687619.370340212 0, 355962.9551217344 6687619.3606750965 0, 355962.9051613659 6687619.361083647 0, 355962.8551193543 6687619.351500242 0, 355962.80507734284 6687619.341916837 0, 355962.74504325754 6687619.332415142 0, 355962.7049933197 6687619.322750027 0, 355962.6550329513 6687619.32315858 0, 355962.60499093967 6687619.313575173 0, 355962.55494892824 6687619.3039917685 0, 355962.49491484294 6687619.294490073 0, 355962.454864905 6687619.284824958 0, 355962.40482289344 6687619.275241552 0, 355960.0237702045 6687618.934978159 0, 355959.2300877011 6687620.8600523975 0, 355957.74233007827 6687621.002122667 0, 355956.2208406551 6687620.684808052 0, 355954.3804213049 6687620.4700277345 0, 355949.0282937264 6687619.734370079 0, 355944.2072972781 6687619.184228948 0, 355915.43611668824 6687618.929866378 0, 355907.62185691914 6687617.714711405 0, 355903.70700511424 6687617.996540603 0, 355879.0932303407 6687619.017213972 0, 355845.12254315766 6687613.469307534 0, 355819.21250689944 6687611.163043643 0, 355810.31277144677 6687614.0737255355 0, 355786.4588026388 6687615.138147129 0, 355786.5029166696 6687613.1992174275 0, 355786.66401036 6687607.232303881 0, 355786.64394457196 6687607.222475344 0, 355786.6537733628 6687607.202409723 0, 355786.26310280245 6687607.085692905 0, 355785.6319693492 6687606.891001464 0, 355784.99100710516 6687606.716375636 0, 355784.36970244313 6687606.501618572 0, 355783.76797372225 6687606.23673831 0, 355783.19581301545 6687605.9216531385 0, 355782.643309891 6687605.5664367275 0, 355782.13036685454 6687605.160933702 0, 355781.64707347355 6687604.715217725 0, 355781.19351138966 6687604.239280754 0, 355780.4647750024 6687603.106080847 0, 355779.7956644922 6687601.932422862 0, 355779.17635106784 6687600.73837242 0, 355778.61666352046 6687599.503863905 0, 355778.116765132 6687598.248881225 0, 355777.6879542353 6687597.133213962 0, 355777.24915126595 6687596.01762841 0, 355776.81034829776 6687594.902042859 0, 355776.361553257 6687593.78653902 0, 355775.90284778527 6687592.681108848 0, 355775.45617541723 6687591.825395855 0, 355774.94987717527 6687591.010140943 0, 355774.373960986 6687590.235425821 0, 355773.7385005638 6687589.51116073 0, 355773.05348798196 6687588.837263961 0, 355772.3090128086 6687588.223809181 0, 355771.52497754904 6687587.660641018 0, 355770.7614162838 6687587.15726117 0, 355769.9483845 6687586.714241602 0, 355769.1058663441 6687586.331418895 0, 355768.24393553025 6687586.018703295 0, 355767.3525999852 6687585.776176512 0, 355766.44185178186 6687585.603756833 0, 355765.5315934255 6687585.491288889 0, 355764.60208569275 6687585.4689119635 0, 355763.6523488906 6687585.41672259 0, 355762.7027753704 6687585.384517121 0, 355761.7434547006 6687585.382369234 0, 355760.794289386 6687585.400123546 0, 355759.8452873535 6687585.437861767 0, 355756.88828680996 6687585.541983275 0, 355752.6730198099 6687585.7463277 0, 355746.03049542755 6687586.070446934 0, 355744.993034272 6687586.288775724 0, 355743.6363166183 6687586.56967093 0))
-""")
+        _sio = AbstractGeoDataFrameDemos._dataset(
+            "GeoDataFrameDemosA", "ileDeNantes.csv"
+        )
         return GeoDataFrameLib.read_csv(_sio)
 
     @staticmethod
@@ -98,68 +98,56 @@ POLYGON Z ((355743.6363166183 6687586.56967093 0, 355742.26960689086 6687586.850
         quartiers = quartiers.loc[quartiers[quartiers.libcom == "Nantes"].index]
         quartiers.to_csv('/tmp/quartiers.csv', sep=';', index=False)
         '''
-        _sio = StringIO("""libcom;nom;idobj;codcom;geometry
-Nantes;Nantes Nord;8;440109.0;POLYGON ((-1.58660822980291 47.2740751281635, -1.58631628137684 47.2739194594528, -1.58616755607559 47.2738359144829, -1.58609965755434 47.2737977136917, -1.58569346219178 47.273573146117, -1.58569332321395 47.2735730696616, -1.58548254359793 47.2734576595402, -1.58538838322165 47.2734136638544, -1.58536737167375 47.2734038465434, -1.58535698451368 47.273398993078, -1.58533066626009 47.2733866958702, -1.58530807667134 47.2733761413232, -1.58526914489177 47.2733579503668, -1.58525086571817 47.2733583712011, -1.58516602340278 47.2733603220973, -1.58513569108598 47.2733610199579, -1.58499549949972 47.2733442639437, -1.58491579413228 47.2733347426575, -1.58483658113948 47.2733252809776, -1.58483656416776 47.2733252068645, -1.58483446650576 47.2733160039558, -1.58483444287001 47.2733158985706, -1.58480172485437 47.2732157251541, -1.58480161336556 47.2732153835843, -1.58478973686306 47.2731790182246, -1.5847835744373 47.273160153804, -1.58464525714605 47.2727578799895, -1.58462339156159 47.2726942893549, -1.58420084172183 47.2727609710171, -1.58416677432257 47.2727345751373, -1.58405783988033 47.2727777444292, -1.5840555328011 47.2727872563317, -1.58405208978225 47.2728014595067, -1.58405062592904 47.2728074938513, -1.58404943200956 47.2728124190137, -1.58404855388177 47.2728160448394, -1.58404709492423 47.2728220591648, -1.58404563368696 47.2728281546786, -1.58396047500186 47.272840509515, -1.5839603716968 47.2728405244468, -1.58395998595205 47.2728405803754, -1.58396000129392 47.2728406509492, -1.58396059450686 47.2728433900158, -1.58396290398265 47.2728540406386, -1.58398347900847 47.272948944973, -1.58391111174879 47.2729572367908, -1.58383074028961 47.2729725156945, -1.58381255855848 47.2729759744737, -1.58344777410062 47.2730453628749, -1.58305790217301 47.273131820028, -1.58305052892064 47.2731329861925, -1.58304418617095 47.2731339887308, -1.583029144415 47.2731363670679, -1.58300955725202 47.2731394645389, -1.58300096667341 47.2731408233985, -1.58297908588658 47.2731442835185, -1.58296189937102 47.2731470005449, -1.58288007791534 47.273134126402, -1.58286168704475 47.2731312326284, -1.58285617364896 47.2731303647922, -1.58277548087492 47.2731176672527, -1.58276276426239 47.273116756738, -1.58276268696402 47.2731167508083, -1.58239168935474 47.2730901632701, -1.58218180535751 47.2730764708408, -1.58217080660888 47.2730757531093, -1.58215285797396 47.273074582488, -1.58208559937786 47.273070194068, -1.58205278991937 47.2730629639175, -1.58204093035846 47.2730603503651, -1.581900171854 47.2730292860576, -1.58180809149689 47.2730086526173, -1.58163840388694 47.2729706293476, -1.58148210798225 47.2729356062287, -1.58145638465952 47.2729298416345, -1.58145629153493 47.2729298210162, -1.58142861213772 47.2729236180442, -1.5812310540368 47.272879348372, -1.58117570489848 47.2728669455367, -1.58115931929109 47.2728632741593, -1.58098877658431 47.2728091565041, -1.58093812988361 47.2727925176376, -1.58075382305467 47.2727319683078, -1.58072092474778 47.2727211604398, -1.5805020817324 47.2726699901267, -1.58044895016248 47.2726575670892, -1.58031472885423 47.2726255196109, -1.58031462175779 47.2726255058559, -1.58025206366912 47.2726174203233, -1.58023319593273 47.2726149812624, -1.58019011287271 47.2726004781795, -1.58014844243098 47.2726039404021, -1.58001102767692 47.2725872976081, -1.57993010503829 47.2725774961503, -1.57986577516492 47.2725769022845, -1.57979972809568 47.2725762920853, -1.57970613106578 47.2725563220652, -1.57965769443101 47.2725565394239, -1.57948529197394 47.2725364986508, -1.57940655286277 47.2725273460391, -1.57923127341914 47.272502789742, -1.57919962949461 47.272490443813, -1.57917919336123 47.2724780461497, -1.57912616105321 47.272445875923, -1.57906456244529 47.2724085088243, -1.57903007274086 47.2723907796124, -1.57899173159551 47.2723775289652, -1.57893036292241 47.272361297364, -1.57877599995245 47.2723204700699, -1.57876889717128 47.2723185912564, -1.57872702025986 47.2723075150756, -1.57855970383452 47.2722698985081, -1.57823538696508 47.2721969832419, -1.5781803705317 47.2721846135284, -1.57810451834195 47.2721675597766, -1.57806376605695 47.272158397526, -1.57799447770935 47.2721716991769, -1.57795245487539 47.2721730147595, -1.57782494466197 47.2721770080077, -1.57768193788204 47.2721181849286, -1.57746763522938 47.2720354383129, -1.5773331055185 47.2720017778248, -1.57727567633927 47.2719874087484, -1.57722125489015 47.2719737921423, -1.57718777181939 47.2720108979831, -1.57660772091023 47.2720226361283, -1.57627722681547 47.2720266908442, -1.57623218477426 47.2720217256273, -1.57618434116561 47.2720165114747, -1.57610723340971 47.2720066051033, -1.57599421444984 47.2719993895313, -1.57579270407671 47.2719779113032, -1.57579241414371 47.271977880492, -1.57579171802522 47.271977806376, -1.57579036047816 47.2719776612686, -1.57578852728889 47.271977465709, -1.57578680103918 47.2719772821124, -1.57578543681805 47.2719771363695, -1.57578362101228 47.2719769428212, -1.5757828434083 47.2719768602342, -1.57578215528335 47.271976786701, -1.57578003619653 47.2719765610705, -1.5756341264142 47.2719610081745, -1.575489567365 47.2719534254301, -1.57542037740239 47.2719622810953, -1.57527192855263 47.2719812796577, -1.57509683592092 47.2720049912581, -1.5749364067754 47.2720267161107, -1.57470278588824 47.2720583526663, -1.57458457712602 47.2720616144877, -1.57447406981329 47.2720588380117, -1.57438330734436 47.2720565571567, -1.57428757129652 47.2720555436917, -1.57417221847796 47.2720543230433, -1.57403532748583 47.2720502233139, -1.57390343789823 47.2720462740656, -1.57373750475028 47.2720395394602, -1.57359076364526 47.2720342938294, -1.57352190512615 47.2720283584145, -1.57333207100011 47.2720119935894, -1.57326318980065 47.2720060553198, -1.57306578685222 47.2719982287647, -1.57297447824937 47.2720002387235, -1.57269541251551 47.2719278988597, -1.57253382057691 47.2719270180661, -1.5723785890165 47.2719261724346, -1.57228925980491 47.2719142265822, -1.57226749887855 47.2719042016178, -1.57225666881177 47.271899213261, -1.57224122377182 47.2718920980824, -1.57222047741263 47.2718825409671, -1.57219132670601 47.2718635116852, -1.5721664817087 47.2718472937212, -1.57216633954098 47.2718472723428, -1.57213855928448 47.2718430499712, -1.57209364412012 47.2718362236989, -1.57203891714732 47.2718310112612, -1.57203034113652 47.2718313523083, -1.57200734828399 47.2718331776614, -1.57197901163619 47.2718354281705, -1.57196669868312 47.2718364062025, -1.57187270600474 47.2718438194507, -1.57186071072057 47.2718447659161, -1.57181379752483 47.2718287901858, -1.57177773370608 47.2718291943532, -1.57177472082057 47.2718292285595, -1.57174118591211 47.2718296051395, -1.5715499205065 47.271839132642, -1.57144523793157 47.2718443466761, -1.57134241061355 47.2718459726575, -1.57127621594844 47.2718470196499, -1.57125358435171 47.2718473779559, -1.57119732918635 47.2718482675839, -1.57115587485339 47.2718489228278, -1.57106143358113 47.2718504160685, -1.57096915053076 47.2718507556518, -1.57096665445819 47.2718507647839, -1.57096654060552 47.2718507648051, -1.57084316585002 47.2718420474695, -1.57074783168601 47.2718353113041, -1.57069803420835 47.271832896523, -1.5706148629018 47.2718288628988, -1.57059773995136 47.2718280325234, -1.57058975445017 47.2718283896343, -1.57056063997836 47.2718296912475, -1.57053215066379 47.2718309652972, -1.57050687267007 47.2718320954569, -1.57029751353086 47.2718434115464, -1.57029742520888 47.2718434159585, -1.57015298373497 47.2718512239258, -1.57015259101953 47.2718512449431, -1.57013792549767 47.2718520378635, -1.57012749261186 47.271852601258, -1.57010763105816 47.2718536746095, -1.57009861613882 47.2718541618124, -1.57009827876057 47.2718541797288, -1.5700846569601 47.2718549167366, -1.57000793951924 47.2718566209692, -1.56990481843621 47.2718589115198, -1.56982478450073 47.2718642553345, -1.5697143035444 47.2718835144129, -1.56955659530291 47.2719117374212, -1.56947934622116 47.2719255620336, -1.56936856069181 47.2719351012898, -1.56926569152625 47.2719348978922, -1.56921522814578 47.2719347976583, -1.56917637063321 47.2719324673503, -1.56911618416154 47.2719247231347, -1.56908833323093 47.271921139902, -1.56903937825863 47.2719148415387, -1.56903916810972 47.2719148147485, -1.5690390034364 47.2719147933596, -1.56900033606408 47.2719098179974, -1.56891040382098 47.2718954606234, -1.56886384182402 47.271883444398, -1.56882125612158 47.2718724541475, -1.56881610061539 47.2718711235975, -1.56878339543622 47.2718626835887, -1.56874550364841 47.2718529052433, -1.56870441783734 47.2718400306761, -1.56867651053457 47.2718264521897, -1.56865549151236 47.2718204987695, -1.56865168012207 47.2718194193622, -1.56858249944677 47.2718048849827, -1.56852616432528 47.271793049739, -1.56831200239925 47.2716837012711, -1.56830817009713 47.2716817450398, -1.5683013983228 47.2716782863823, -1.56824192220011 47.2716479182176, -1.56813826987265 47.2715970713691, -1.56808763692916 47.2715747542538, -1.56800983750754 47.2715514278336, -1.56795814106512 47.2715359271788, -1.56791811429926 47.2715325859593, -1.56791212323304 47.2715320860178, -1.56789797430607 47.2715309055071, -1.56787384466834 47.271528891581, -1.5678493350034 47.2715268458932, -1.56784254523317 47.2715262794649, -1.56783469802488 47.271525624394, -1.56783453265008 47.2715256102399, -1.56783161941319 47.2715254322368, -1.56783130402385 47.2715254132301, -1.56781576761485 47.2715244635447, -1.56777818897624 47.2715276857329, -1.56777660403876 47.2715278216903, -1.5677519253446 47.2715360152681, -1.56773991811628 47.2715400019945, -1.56772170720428 47.2715576656669, -1.56771122875904 47.2715713277307, -1.56770352669386 47.2715880332387, -1.56765253745475 47.2717174705581, -1.56763921446996 47.2717489066282, -1.56763336355633 47.271759411297, -1.56759411265383 47.2717486935992, -1.56756883553855 47.2717417909261, -1.56752640202769 47.2717172258298, -1.56751130279213 47.2717084842881, -1.56750714025253 47.2716960697989, -1.56750596610454 47.2716925671249, -1.56749439851455 47.2716750052534, -1.56748496438466 47.2716717153953, -1.56746503181225 47.2716647661701, -1.56744799912878 47.271658827174, -1.56742125862477 47.2716418680804, -1.56739004864923 47.271623734934, -1.5673493792394 47.2716037762565, -1.56730749917159 47.2715832231972, -1.5673069878195 47.271582972289, -1.567262265796 47.2715770898248, -1.56720709804934 47.2715590073087, -1.56720703280401 47.2715589720556, -1.5672069605767 47.2715589325745, -1.56720442036092 47.2715575467186, -1.56711742601488 47.2715100929666, -1.56707390814663 47.2714863556268, -1.56706656992702 47.2714810604924, -1.56705550951383 47.2714745057463, -1.56705462939469 47.2714739838465, -1.5670537675057 47.2714734738375, -1.56704020901646 47.2714654378456, -1.56702251753908 47.2714490202721, -1.56700883915098 47.2714315422088, -1.5669979622732 47.2714143132856, -1.5669979327801 47.2714142009223, -1.56699361196968 47.2713975459575, -1.56699781041022 47.2713862960024, -1.5670230400357 47.2713849901171, -1.56702772953911 47.2713847470626, -1.56705818156981 47.2713755178397, -1.56708323183386 47.2713665932995, -1.56708350923756 47.2713664318008, -1.56711487745822 47.2713481257179, -1.56711390157832 47.2713331481309, -1.56711320285535 47.2713224216011, -1.56711035107097 47.2713046035686, -1.5671067923677 47.2712878047968, -1.56705259528306 47.2712578796255, -1.56705252553073 47.271257853562, -1.56703587241922 47.2712516146944, -1.56703571918178 47.2712515568056, -1.5670186734754 47.2712451704374, -1.56697547847704 47.2712481532258, -1.56697496127097 47.2712481890895, -1.56697482048263 47.2712481991875, -1.56697425453667 47.2712482378884, -1.56697254629772 47.2712483562063, -1.56692403169385 47.2712517061757, -1.56692311175943 47.2712517697508, -1.5669191806367 47.2712520412456, -1.56683126390829 47.2712581115288, -1.56674762769751 47.2712697145928, -1.56674753215297 47.2712697273987, -1.56666978190017 47.271261552372, -1.56664110101283 47.2712477887945, -1.56659729612228 47.2712267668047, -1.5665830698212 47.2711936318255, -1.56657247619114 47.2711596316967, -1.56657593306074 47.2711320117219, -1.56658685541544 47.2711049962843, -1.56659954162396 47.271086200637, -1.56660432072648 47.271077090204, -1.56660443403706 47.2710767441972, -1.56661386312903 47.2710478768974, -1.56660049507621 47.2709988733078, -1.56659984277877 47.2709964843472, -1.56659936613558 47.2709947389827, -1.56659803181804 47.2709898460037, -1.56659792470363 47.2709897547448, -1.56659435020358 47.2709867276598, -1.56659296981137 47.2709855588356, -1.56656805365714 47.2709644551604, -1.56649473090517 47.2709399749993, -1.56642796075396 47.2709299715448, -1.56641533843158 47.2709280805514, -1.56641470796533 47.2709279379938, -1.56640666174227 47.2709261184411, -1.56638415266525 47.2709210293701, -1.5663441848876 47.2708980176069, -1.56633656649841 47.2708940851656, -1.56629122192038 47.2708577708809, -1.56621851482345 47.270784878596, -1.56619232009058 47.2707542012923, -1.56617872370982 47.2707439437731, -1.56615113188015 47.2707231283043, -1.56610186509704 47.2707028285793, -1.56608689469179 47.2707027022967, -1.56608050227067 47.2706991716843, -1.56606305721459 47.2707087851406, -1.56605336604838 47.2707110334523, -1.56601030890952 47.2707210243534, -1.56597146652285 47.270730037784, -1.56596026447422 47.270732637139, -1.56595389241071 47.2707341156643, -1.56594680740145 47.2707340879807, -1.56589622866154 47.2707338936029, -1.56589390191481 47.2707338850894, -1.56589374572017 47.2707337309021, -1.56589138891504 47.270731410534, -1.56587173288189 47.2707120522395, -1.56586830892956 47.2707086803526, -1.56586991092015 47.2707050836321, -1.56587419299773 47.2706954712513, -1.56587459503027 47.2706949876289, -1.56588976949647 47.2706767393112, -1.56589639673348 47.2706687710558, -1.56592672286725 47.2706323023482, -1.56592712023727 47.2706318261195, -1.56587863596825 47.2706098733002, -1.56574445416222 47.2705672661737, -1.56563437994249 47.2705171228067, -1.56560378679794 47.2704722867297, -1.56559289478187 47.2704563252016, -1.56555423591372 47.2704377485398, -1.5655480295105 47.2704347655725, -1.56553002350395 47.2704261130981, -1.56547511768369 47.2703997286662, -1.56544763600696 47.2703977374386, -1.56543112306871 47.2703965414867, -1.56539559014789 47.2703939679987, -1.56538543962201 47.2703827022218, -1.56533092404519 47.2703221958137, -1.56532965927308 47.2703210007589, -1.56522878401458 47.270225603122, -1.56519967757443 47.270187201932, -1.56517784213276 47.2701718497328, -1.56513877806305 47.2701454677441, -1.56511922424881 47.2701394825681, -1.56510401950569 47.2701348285805, -1.5650887481158 47.2701301538096, -1.56501933463051 47.2701002913382, -1.5649101515912 47.2700651598227, -1.56490997525965 47.2700650641022, -1.56490737861845 47.2700636516065, -1.56490490974573 47.2700623088262, -1.56490458066608 47.270062129965, -1.56488011295944 47.2700488249401, -1.56485797798918 47.2700367879019, -1.56485780297718 47.270036692129, -1.56480789078565 47.2699980356879, -1.56475696728922 47.2699104912765, -1.56473885164602 47.2698640864039, -1.56473881608945 47.2698639959065, -1.5647109096962 47.2698195097932, -1.56465536703683 47.2697967266399, -1.56461637434244 47.2697807327981, -1.56457930537725 47.2697112011792, -1.56457821517461 47.2697097874345, -1.56450893534117 47.2696199784011, -1.56450210843608 47.2696111279223, -1.56449979266445 47.2696081264934, -1.5644995840998 47.2696078554425, -1.56449859965699 47.2696065789662, -1.5644985042911 47.2696064548006, -1.56445197190877 47.2695461338709, -1.56437808254389 47.2695258198865, -1.5642769181952 47.269500821876, -1.56419781066143 47.2694944139153, -1.56418360273409 47.2694932632477, -1.56405269627039 47.2694734105378, -1.56405234157753 47.2694734579586, -1.56402115421416 47.2694776362757, -1.56399645507397 47.2694844737691, -1.5639163138433 47.2695132456663, -1.56391614408814 47.2695132884481, -1.56391605855089 47.2695133098652, -1.56388806785264 47.2695204041539, -1.56377708253142 47.2695538244664, -1.56377688030869 47.2695539054807, -1.56366855099711 47.2695973284433, -1.56354983520809 47.2696316870445, -1.56353621251581 47.2696342768316, -1.56353600279507 47.269634316694, -1.5634426280313 47.2696520708499, -1.56344254869438 47.2696521028334, -1.5633009625742 47.2697090559184, -1.56316797896166 47.2697551681108, -1.5631613476637 47.2697574677351, -1.5631527377504 47.2697604532141, -1.56312958859426 47.2697684805748, -1.56303444659973 47.2697730588145, -1.56303410643977 47.2697730750189, -1.56303371886023 47.2697730940065, -1.56303334571669 47.2697731115199, -1.56299533058605 47.2697883166068, -1.56296888689945 47.2697930740604, -1.56295955473656 47.2697947528063, -1.56295808281402 47.2697950175717, -1.56295208700257 47.2697960971435, -1.5629143686291 47.2698028834511, -1.56288594097961 47.2698048803597, -1.56288403820707 47.269805014449, -1.56287015403117 47.2698059899051, -1.56280738998436 47.2698148767294, -1.56280572887853 47.2698151120574, -1.56280384020691 47.2698153798448, -1.56276007832474 47.2698253164109, -1.56272540260909 47.2698269629441, -1.56269116438958 47.26983299022, -1.56266454764633 47.2698376751758, -1.56263998758297 47.2698419982691, -1.56261767855211 47.2698459256571, -1.56249874417782 47.2698700187151, -1.56246166921687 47.2698781201254, -1.56244533441008 47.2698816896449, -1.56243854229765 47.26988067517, -1.56243634706367 47.2698803468961, -1.56238673276189 47.2698729321196, -1.56229751973147 47.2698483591627, -1.56210025100391 47.2698095121008, -1.56205680022703 47.2698099910512, -1.56203107998477 47.2698102746079, -1.56201380723317 47.2698172674999, -1.56201354694916 47.2698172580049, -1.56200697698067 47.2698170285313, -1.56199212819994 47.2698165103419, -1.5619763632248 47.2698159600252, -1.56195342198207 47.2698170505773, -1.56193534811416 47.2698162359527, -1.56191977213548 47.269816763916, -1.56186515953076 47.2698123360628, -1.56179396072666 47.2698065641494, -1.56179366211657 47.2698065399554, -1.56178729294556 47.2698064755068, -1.56176106775457 47.2698062113666, -1.56173946715577 47.2697997698147, -1.56166360769885 47.2698089972131, -1.56142392509278 47.2698035495252, -1.56133451017076 47.269818549742, -1.56133387457033 47.2698186560561, -1.56126962886221 47.26982282696, -1.56119062940274 47.2698334635448, -1.56116715452427 47.269836624139, -1.56072748309648 47.2699259721425, -1.5607205043948 47.2699275708563, -1.56024890532803 47.2700356038735, -1.56024285700929 47.2700371224011, -1.55974075066925 47.270163166446, -1.55948551398367 47.270234291471, -1.55948443033818 47.2702353652678, -1.55947196841154 47.2702477139296, -1.55934793066722 47.2702883630909, -1.55925331445535 47.2703193699067, -1.55917376493568 47.2703411766684, -1.5591537666357 47.2703520292342, -1.55905446850738 47.2704059185002, -1.55901879211576 47.2704252644752, -1.55898883604759 47.2703531443483, -1.55898859594204 47.2703525663746, -1.55898794409338 47.2703509982376, -1.55898742732327 47.2703497554354, -1.5589860048927 47.2703463301223, -1.55898308180308 47.2703392924733, -1.55897777276333 47.2703265123325, -1.55897637593426 47.2703226282624, -1.55895452479214 47.2702618789628, -1.55895020578301 47.27024986962, -1.55894822692207 47.2702443668876, -1.55894783598175 47.2702432794853, -1.5589420663379 47.2702272368266, -1.55893657667964 47.2702119751021, -1.55893106456912 47.2701966520941, -1.55892965040258 47.2701927200537, -1.55891183291021 47.2700230701343, -1.55890834867409 47.2699898958845, -1.55890818235439 47.2699883084939, -1.55880259616102 47.2699069842437, -1.55880217313318 47.269906697359, -1.55877880478968 47.2698908272242, -1.55874674206835 47.2698690547543, -1.55874440045106 47.2698674644154, -1.55872599521839 47.2698549665904, -1.55855031037922 47.2697341076767, -1.5585488981351 47.2697331364592, -1.5585266298429 47.2697101024364, -1.5585256595939 47.2697090983749, -1.55852515808431 47.2697080027408, -1.55852087890894 47.2696986535552, -1.55852058911158 47.2696980207839, -1.55851732907029 47.269690896468, -1.5584987026755 47.2696501986093, -1.55849393834575 47.2696397900839, -1.55849309328022 47.2696379439682, -1.55849190270304 47.2695421312733, -1.5584918631903 47.2695389782081, -1.55849160962373 47.2695185214497, -1.55849563846922 47.2694792851722, -1.55849572508209 47.2694784410433, -1.5584779865775 47.2694561906421, -1.55847742010439 47.2694554805367, -1.55847206338327 47.2694487610363, -1.55846487801341 47.2694397469432, -1.5584634162714 47.269438769578, -1.55842162921336 47.269410825554, -1.55838495410787 47.2693906541599, -1.5583845164067 47.2693899173228, -1.55837366285444 47.2693716388381, -1.55837361803514 47.2693714090412, -1.55837357785281 47.2693712024882, -1.55837354524066 47.2693710379852, -1.55837350227871 47.2693708144222, -1.55837166128198 47.2693613838759, -1.55837089857339 47.2693574836679, -1.558365038592 47.2693274663333, -1.5583647066943 47.26932576927, -1.5583668662616 47.2692489128235, -1.55836008818616 47.269235376345, -1.55835821535561 47.2692316372921, -1.55835509539385 47.2692254066824, -1.55832020858784 47.2691557327896, -1.55831900469021 47.2691533287237, -1.55829740908781 47.2691101994539, -1.55828788730259 47.2690020174662, -1.55828783825729 47.2690014598489, -1.55828890665231 47.268856165651, -1.55829197048306 47.2688111125138, -1.55829259952641 47.2688018651615, -1.55833814917142 47.2687437695104, -1.55833887966659 47.2687428385788, -1.55835405995999 47.2687234755749, -1.55835537885946 47.2687217941522, -1.55835435678031 47.2687190395714, -1.55831600310359 47.2686156735208, -1.55831511521473 47.2686132803528, -1.55831375432085 47.2686025449477, -1.5583133974395 47.2685997360582, -1.55831175206096 47.2685867592676, -1.55830646892505 47.2685450889968, -1.55830615668341 47.2685426315552, -1.55827418541945 47.268488921578, -1.55827394262718 47.2684885131101, -1.55827231297915 47.2684857745093, -1.55827167899103 47.268484708456, -1.55813376066943 47.2683727571379, -1.55813155131175 47.2683709633109, -1.55812894059272 47.268364634113, -1.55812881032771 47.2683643184983, -1.55812515098247 47.2683554502243, -1.5581223584192 47.2683486822085, -1.55812041621628 47.2683439772575, -1.55811885784052 47.2683401996031, -1.55812671393843 47.2683113738833, -1.55812752188161 47.2683084088793, -1.5581294962351 47.268306157227, -1.55813240296204 47.2683028431937, -1.55813733220296 47.2682972215344, -1.55814280907502 47.2682909762495, -1.55814561318823 47.2682877780166, -1.55815039222256 47.2682842374672, -1.55822653722103 47.2682278310882, -1.55825196867785 47.268208992434, -1.55825678007892 47.2682054280696, -1.55828136153787 47.2681817465405, -1.55829013385981 47.2681624835331, -1.55829101092011 47.2681605583204, -1.55829399623925 47.2681540018331, -1.55829521647368 47.268151322337, -1.55829534358862 47.2681510442738, -1.55829538254031 47.2681509580291, -1.5582959766016 47.2681496549603, -1.55829707415276 47.2681472434398, -1.55828012467781 47.268119093993, -1.55827778538243 47.2681152094411, -1.55825743353717 47.2681050468197, -1.55825057173427 47.2681016209164, -1.55824472766829 47.2680987025074, -1.55822215365069 47.2680874313738, -1.55818807676307 47.268070415185, -1.55818416461436 47.2680684618058, -1.55816309810942 47.2680511387996, -1.55815589408959 47.2680452142876, -1.55812509460431 47.2680198873556, -1.55812165145899 47.2680170566629, -1.55812182628019 47.2680153250909, -1.55812266057507 47.2680070373454, -1.55812353689702 47.2679983280368, -1.55812415567524 47.2679921780555, -1.55812924188255 47.267977315145, -1.55812974700249 47.2679758389946, -1.55813177697319 47.2679699060834, -1.55813240166423 47.2679680791826, -1.5581345334653 47.2679618511896, -1.55813475680044 47.2679614909187, -1.55813797743274 47.2679563073409, -1.55815172174695 47.2679341809525, -1.55815570904881 47.2679277622505, -1.55816451179319 47.2679212607461, -1.55823892767605 47.2678662961161, -1.55828527330074 47.2678320660594, -1.55829403742075 47.2678255931071, -1.55830423038249 47.267813634575, -1.5583047874222 47.2678129817415, -1.55830547915865 47.2678121703859, -1.55831143523884 47.2678051834334, -1.5583120823879 47.2678044234042, -1.55832314404475 47.26778298635, -1.55836605791482 47.2676998256629, -1.55837606023689 47.2676804426865, -1.55841826645609 47.2675986517186, -1.55842234394836 47.2675907507785, -1.55842597519917 47.2675837145349, -1.55842688019382 47.2675819612174, -1.55843083160808 47.2675743040587, -1.55843141970386 47.2675731634171, -1.55846848374655 47.2675341508082, -1.55847598739252 47.267526252774, -1.5584804380297 47.2675244444632, -1.55848899268795 47.2675209695368, -1.55849921676113 47.2675168156875, -1.55852534114505 47.2675062023434, -1.55854296342228 47.2674990438192, -1.55854504737601 47.2674981970794, -1.55854912445717 47.2674965405405, -1.55855766497859 47.2674930706745, -1.55856029264595 47.2674920032386, -1.55856457625806 47.2674915225109, -1.55864462516675 47.2674825426986, -1.55866217140707 47.2674805746106, -1.55866624492988 47.2674759996539, -1.55867279287505 47.2674686441002, -1.55867431336716 47.2674669366563, -1.55868757127956 47.2674520461176, -1.5586974295769 47.2674409739477, -1.55870632283572 47.2674309843813, -1.55870645325232 47.2674308377423, -1.55871398074551 47.2674223836876, -1.55874970614006 47.2673603252146, -1.55875202152086 47.2673067956396, -1.55875236448635 47.2672988778824, -1.55875285225234 47.2672875943055, -1.55875469483227 47.2672449818798, -1.55875474893879 47.2672437425696, -1.55875477552454 47.2672431251857, -1.55875481713219 47.2672421729104, -1.55872403369842 47.2671366496688, -1.55872333679178 47.2671342606438, -1.55872259500288 47.2671317184152, -1.55869613252096 47.2671242418906, -1.55868623906908 47.2671214462395, -1.5586081243533 47.2671298339946, -1.55851140301974 47.2671402192005, -1.55848266220301 47.2671433051663, -1.55843662688889 47.2671452207002, -1.5584139945763 47.2671373786833, -1.55840115735201 47.2671329309422, -1.55839624154539 47.2671307110068, -1.55839406034608 47.2671297252271, -1.55836958170092 47.2671186693226, -1.55835971006659 47.2671142103115, -1.55834591779139 47.2670984478982, -1.5583440965144 47.2670933768278, -1.55832610550432 47.2670432772637, -1.55832134732129 47.2670285289552, -1.55832088089811 47.2670270850188, -1.55831959668307 47.2669941199644, -1.55831943714091 47.2669900282403, -1.55831920443689 47.2669840606936, -1.55831911076872 47.2669816513518, -1.55833719002188 47.2669376832875, -1.55834302366615 47.2669314788029, -1.55836473218851 47.2669083878051, -1.55837665540776 47.2669022797537, -1.55839275850332 47.2668940308213, -1.55840381254607 47.2668903729911, -1.55840396313572 47.2668903228676, -1.55840419740347 47.2668902450972, -1.55860838060808 47.2668226763443, -1.55861628714918 47.2668189459708, -1.55873960167561 47.2667607632508, -1.55873994395562 47.2667606019026, -1.55874243326094 47.2667574233417, -1.55876142357026 47.2667331686452, -1.55875270343382 47.2666132778946, -1.55875243104554 47.2666095384563, -1.55877468678297 47.2665818942016, -1.55878749897708 47.2665723934741, -1.55881153131184 47.2665545724722, -1.55882115757186 47.2665476895326, -1.55886329881095 47.266517558158, -1.55886512131985 47.2665121569734, -1.55888882340523 47.2664418979424, -1.55889296861631 47.2664296087985, -1.55889317987579 47.266426942273, -1.55889729759958 47.2663748153448, -1.55890266902262 47.2663068213671, -1.55890351619517 47.2662961029181, -1.55890541978288 47.2662931494189, -1.55897360681051 47.2661873902463, -1.55897487231598 47.2661854261924, -1.5589767877049 47.2661824560045, -1.55897674259038 47.2661800420328, -1.55897669105521 47.2661773210519, -1.55897664153217 47.2661747009107, -1.55897652545185 47.2661684728332, -1.5589763413414 47.2661586350757, -1.55897626735178 47.2661547237746, -1.55897555584871 47.2661526281763, -1.55897262104656 47.2661439816873, -1.55897177143941 47.2661414788772, -1.55896316908509 47.2661161369139, -1.5589597105104 47.2661135735757, -1.55894553265415 47.2661030644276, -1.55893171534811 47.2660928239145, -1.55892104981768 47.2660849183213, -1.55891648112753 47.2660826855457, -1.55884548162143 47.2660479978794, -1.55884263557663 47.266046822219, -1.55875573601226 47.2660109187612, -1.55843542579643 47.2658455661987, -1.55843429711789 47.2658449838124, -1.55840442272895 47.2658161611074, -1.55840046635471 47.265812343385, -1.55840008688395 47.265811977281, -1.55839303139494 47.2658051710647, -1.55839054400674 47.2657822924948, -1.55840265849307 47.2657663263825, -1.55840767373325 47.2657597173224, -1.55843828924638 47.2657384996273, -1.55848235851496 47.2657198120554, -1.55848272541941 47.2657197064984, -1.55857446884012 47.2656932723729, -1.55860361058884 47.2656752677067, -1.55860439133752 47.2656747853114, -1.55862150994906 47.2656497461242, -1.55862427339042 47.2656457033818, -1.55862643993551 47.2656263337325, -1.55862779043125 47.2656142572415, -1.55862872688299 47.2656058807313, -1.55862997276551 47.2655947473005, -1.55862789918746 47.2655797366571, -1.55862703078229 47.2655734564167, -1.55862656495501 47.2655700859763, -1.55862475833799 47.2655570191607, -1.5586170386345 47.2655383064676, -1.55861574237742 47.2655351626876, -1.55861086874704 47.2655233492354, -1.55860972644697 47.2655205814025, -1.55857535521114 47.265490379122, -1.558568152604 47.2654840500087, -1.55856772030062 47.2654836697811, -1.55856453552132 47.2654808712099, -1.55856106026465 47.2654778183429, -1.55855280944448 47.2654664487779, -1.55854979759757 47.2654622989569, -1.55854760209747 47.2654592737337, -1.55854110117071 47.2654503163147, -1.55854195590283 47.26544485169, -1.55854257362551 47.2654409021467, -1.5585464061809 47.2654164060415, -1.55855004819595 47.2654038827599, -1.55855197492631 47.2653972555988, -1.55856097213032 47.2653663193053, -1.55856583843849 47.2653495872471, -1.55856776252071 47.2653212282567, -1.55856882382419 47.2653055868987, -1.55856528735846 47.265294316926, -1.55856406220496 47.2652904107265, -1.55856080730624 47.2652800333584, -1.55855972223787 47.2652765730383, -1.5585317755491 47.265228695656, -1.55852786366862 47.2652219945621, -1.55852389127041 47.265215189542, -1.55851905434822 47.2652038972501, -1.55850850030449 47.2651792561934, -1.55850222105739 47.2651645979424, -1.55848353174345 47.2651522411489, -1.55847728090479 47.2651481080348, -1.55846840632337 47.2651422407866, -1.55845447322981 47.2651389340236, -1.55843489775838 47.2651342885522, -1.55842341887473 47.2651356691317, -1.55841526926284 47.2651366491736, -1.55835526893589 47.2651438671332, -1.5583390640769 47.2651458162561, -1.55829977835134 47.2651505422058, -1.55822062901586 47.2651600629328, -1.55821994242447 47.2651601451227, -1.55821719885099 47.2651604755737, -1.55820023668977 47.2651625159778, -1.55817931217998 47.2651622923274, -1.55816716261754 47.2651621622545, -1.55815347349557 47.2651620157346, -1.55808883969336 47.265161323896, -1.55806959915559 47.2651611181547, -1.55801157396683 47.2651475168637, -1.55799763496986 47.2651442490264, -1.55795826165472 47.265135019007, -1.55794762138404 47.2651325250406, -1.55792636255252 47.2651228714223, -1.55790881256742 47.2651149017138, -1.55790055612974 47.2651111526518, -1.5578980798737 47.2651100280865, -1.55789577163355 47.2651089797575, -1.55788907830407 47.2651059400314, -1.55788137687994 47.2651024428864, -1.55786529172769 47.2650919299506, -1.55786207111421 47.2650898257032, -1.55785266986743 47.2650836810392, -1.55784592291573 47.2650792720135, -1.55779010460576 47.2650427915388, -1.55777622643345 47.2650337210993, -1.55776373923822 47.2650255605508, -1.55771487580668 47.265000048703, -1.55771374382396 47.2649994583319, -1.55770841333199 47.2649966745293, -1.55769861572312 47.2649915592687, -1.55767789830837 47.2649885105851, -1.55765424227104 47.264985028756, -1.55762105512759 47.2649856417021, -1.55758617893265 47.2649862855615, -1.55757026821891 47.2649809972635, -1.55755566003044 47.2649761420967, -1.55754707213254 47.264966012185, -1.55754423213641 47.2649626628836, -1.55754009947176 47.2649577888667, -1.55753905417358 47.2649565562011, -1.55753755103392 47.2649547839272, -1.5575383453179 47.2649424078271, -1.55754503886901 47.2649329191361, -1.55754599386996 47.2649315648156, -1.55754679542726 47.2649304283293, -1.55755109471761 47.2649243315637, -1.55755527865008 47.264914364786, -1.55755789679481 47.2649081283275, -1.55755912060726 47.2649052126141, -1.55755989801834 47.2649033607372, -1.55755998813881 47.2649031454136, -1.55756275044186 47.2648965671418, -1.5575623542654 47.264891132298, -1.55755975157572 47.2648553910634, -1.55755896129855 47.2648445456223, -1.5575439807994 47.2648280517241, -1.55754270944449 47.264826652313, -1.55754248291266 47.2648264026881, -1.55753557934798 47.2648188010696, -1.55741618126719 47.2647450004778, -1.55740420376068 47.264737597308, -1.55739690652123 47.2647329595787, -1.55739619121515 47.2647325049656, -1.55737556918564 47.2647193992534, -1.55736602939937 47.2647133357359, -1.55736298902106 47.2647114036427, -1.55735656662879 47.2647073214262, -1.55735269057775 47.2647048583955, -1.5573378870129 47.2647025456497, -1.55730047557798 47.2646967004409, -1.55729387202771 47.264695668304, -1.55729268469211 47.2646954829002, -1.55728747377643 47.2646946685757, -1.55727720494941 47.2646930644967, -1.5572593129075 47.2646902686649, -1.55721665818028 47.2646911676299, -1.55720313983914 47.2646914530507, -1.55719544717686 47.2646916156472, -1.55718801082809 47.2646917725874, -1.55718161959911 47.2646919070172, -1.55716932982409 47.2646969599283, -1.55716317538719 47.2646994908167, -1.5571619951584 47.2646999764241, -1.55716056807894 47.2647005628252, -1.55715534073062 47.2647027127529, -1.55714498562882 47.2647069699137, -1.55713434540395 47.2647113447024, -1.55709919857077 47.264725796275, -1.55708776173708 47.2647304990896, -1.55704244869608 47.2647394868168, -1.5570413527357 47.2647397041689, -1.55704066416134 47.2647398404945, -1.55703001570257 47.2647419530223, -1.55702814788966 47.2647423235171, -1.55702652893888 47.2647420597076, -1.55700899824739 47.2647392017557, -1.55700073970645 47.2647378558601, -1.55699568415247 47.2647370317594, -1.55699418468739 47.2647367875416, -1.55699045681841 47.2647361802276, -1.55697834417464 47.2647342058896, -1.55695948268678 47.2647238533559, -1.55695188950852 47.2647196859741, -1.55694921307214 47.2647182170084, -1.55694340320417 47.264715027774, -1.55693945451698 47.264712860456, -1.55693811550909 47.2647107473733, -1.55693604659099 47.2647074828286, -1.55693278869232 47.2647023425417, -1.55687353009991 47.2646088308038, -1.55686921466663 47.2646020204115, -1.55681758432491 47.2645617169665, -1.55680893411372 47.2645571229233, -1.55674696669108 47.2645242106737, -1.55674024261071 47.2645206395748, -1.55670785772074 47.2645034397334, -1.55670062056757 47.2644995961239, -1.55669902168816 47.2644987467227, -1.55667786815159 47.2644978849229, -1.55666213149823 47.264497243614, -1.55658441135509 47.2644940772531, -1.5565773128179 47.2644937882529, -1.55656897895624 47.2644934491011, -1.55630745326659 47.2645006948383, -1.55630506301968 47.264500760744, -1.55630213267403 47.2645008417494, -1.55624814406438 47.2645023373641, -1.55624751682017 47.2645023550167, -1.5562460602606 47.2645023956278, -1.55624425240428 47.2645024456575, -1.55615913991229 47.2644902775174, -1.55614950874146 47.2644889003656, -1.55606359011905 47.2644377011147, -1.55596115382601 47.2643744514292, -1.55596058047599 47.2643742479854, -1.55595862832437 47.2643735549442, -1.55586307574252 47.2643396368616, -1.55585486577933 47.2643367220093, -1.55582231962823 47.2643251689941, -1.55582122530174 47.2643250339534, -1.55577802601039 47.2643197168034, -1.55576735330018 47.2643184034256, -1.55566625521225 47.2643059583913, -1.5555836612358 47.2642957913165, -1.55529183691741 47.2642846121098, -1.55526918196819 47.2642837446756, -1.55516358081308 47.2641772785157, -1.5551613974311 47.2641738193442, -1.55507539180903 47.2640375938629, -1.55507544182164 47.2640332253203, -1.55507545140053 47.2640324085759, -1.55507545752859 47.2640318920229, -1.55507619142675 47.2639679999622, -1.55508035660761 47.2639614625826, -1.55509927424627 47.2639317689467, -1.55510192568935 47.2639276063853, -1.55510221973332 47.263927144201, -1.5551030611455 47.2639258232374, -1.55510738981402 47.2639190306842, -1.55511659879395 47.2639045749144, -1.55512062735689 47.2638982510925, -1.55513967806174 47.2638683494352, -1.55514533616146 47.2638625530394, -1.55523892006557 47.2637666773661, -1.55525761022839 47.2637475288655, -1.55525746938979 47.2637460521944, -1.55525701204476 47.2637412613331, -1.55525689195439 47.2637400118093, -1.55525678238501 47.2637388853145, -1.55525140605099 47.263682717817, -1.55524599001509 47.2636767015748, -1.55520551427861 47.2636317447753, -1.55520061321839 47.2636263019262, -1.55517544924906 47.2635983505768, -1.55514633938076 47.2635660178213, -1.55514346695344 47.263562828341, -1.55501254717457 47.2634481745148, -1.55501124084194 47.2634422008568, -1.55500260331729 47.2634027052346, -1.55500175579334 47.263398830899, -1.5549983196427 47.2633831200268, -1.55499254023322 47.2633566928306, -1.55497803802859 47.2632903760197, -1.55497798787558 47.2632901455322, -1.55491181450857 47.2631980296759, -1.55483443141868 47.2630903108985, -1.55480245373409 47.2630457957729, -1.55473743787549 47.2629552901269, -1.55473719542576 47.2629536156432, -1.55472862234582 47.262894467028, -1.55472581658441 47.2628751052864, -1.55475188007738 47.2628161340782, -1.55481445478658 47.2627301934676, -1.55489251608604 47.2626229849417, -1.55499279521571 47.2624852599092, -1.55499684278538 47.262479701238, -1.55500011780549 47.2624338234769, -1.55500400970443 47.2623793088884, -1.55500375331767 47.2623781990239, -1.55497855674593 47.2622689458208, -1.55497799817261 47.2622677848561, -1.55496841376384 47.262247847428, -1.55496627892183 47.2622434068734, -1.5549611946161 47.262232831603, -1.55495336996734 47.262216554852, -1.55492865305326 47.2621651382343, -1.55490098170406 47.2621075744776, -1.55490047146263 47.2621065143189, -1.5548921527504 47.2620123222032, -1.55489173668269 47.2620108618441, -1.55485733754651 47.2618899855042, -1.55485965552863 47.2618843079496, -1.55486003868217 47.2618833709772, -1.55487079889837 47.2618570137418, -1.55488452306007 47.2618512491423, -1.55498566685336 47.2618087603173, -1.55499309538546 47.2618023558258, -1.55504506889365 47.26175754343, -1.55510731980554 47.2617038717436, -1.55511843293447 47.2616942900463, -1.55511828294939 47.2616938517646, -1.55511759818847 47.2616918497005, -1.55511607558266 47.2616874020071, -1.55511582336223 47.2616866659198, -1.5551135047079 47.2616798898813, -1.55511258916252 47.2616772166583, -1.55511212171564 47.2616758520465, -1.55507820478496 47.2615767633292, -1.55507341829585 47.2615708933399, -1.55505432087284 47.2615474700272, -1.55504519001678 47.2615362720885, -1.5550379562712 47.2615274003116, -1.55503621875628 47.2615252687625, -1.55502513894966 47.2615116800353, -1.55502112725034 47.2615067597008, -1.55501819944491 47.2614997014375, -1.55500096865157 47.2614581702236, -1.55497813919381 47.2614031430435, -1.55494076654386 47.2613130613234, -1.5549372057602 47.2613084916542, -1.55486449462973 47.2612151643542, -1.55485850021907 47.2612127365362, -1.55484111075278 47.2612056944654, -1.55479331062879 47.2611863369401, -1.55479246881181 47.2611859963552, -1.55475768712681 47.2611719104993, -1.5546994533801 47.2611572473306, -1.55458886631356 47.2611294017314, -1.55458744309673 47.2611282831351, -1.55457353038771 47.2611173503278, -1.55453405416251 47.2610863301818, -1.55453295311869 47.2610854655347, -1.55451550732485 47.2610717568657, -1.55448570512577 47.2610188737978, -1.55448583241459 47.2610174675978, -1.55448709001123 47.2610035828124, -1.55448715082904 47.2610029163176, -1.5544874031244 47.2610001391495, -1.55448774093724 47.2609964115734, -1.55449014450073 47.2609698907965, -1.55449023267039 47.2609689249653, -1.55449054109298 47.2609655193329, -1.55449116367907 47.2609643485093, -1.55452512784369 47.2609004787282, -1.55453102078751 47.2608893973057, -1.55453070576833 47.2608881897453, -1.55451528131742 47.2608290296443, -1.55451524188257 47.2608288780257, -1.5545152124983 47.2608287665568, -1.55451506882968 47.2608282162922, -1.55450651886028 47.2608116105351, -1.55450496655388 47.2608085949042, -1.55448909013721 47.2607777578735, -1.55448856320089 47.2607767344176, -1.55444576395574 47.2607328363376, -1.55441984618128 47.2606940965501, -1.55441328886935 47.2606842941703, -1.55441141739141 47.2606768020775, -1.55440962585773 47.2606696257941, -1.55440121284559 47.2606359349119, -1.55441557490924 47.2605987294392, -1.55441562476364 47.2605986004137, -1.55443967838279 47.2605614749819, -1.55443971233789 47.2605614231768, -1.55445667347335 47.260531736826, -1.55446078124927 47.2605245457545, -1.55446200391863 47.2605226221918, -1.55448726270874 47.2604828584313, -1.55448957311303 47.2604713179491, -1.55449075960689 47.260465395089, -1.55449097294535 47.2604643296862, -1.55448653340315 47.2604492947102, -1.55448650184163 47.260449188734, -1.55448451968366 47.2604471984272, -1.55447665655593 47.2604393066895, -1.55447271732938 47.2604365793646, -1.55439095143757 47.2603905083493, -1.55438210600229 47.2603855245193, -1.55434228128527 47.2603630845635, -1.55431975838092 47.2603456898429, -1.554309880753 47.2603380608296, -1.5543030005077 47.2603327477328, -1.55430288427861 47.2603326577261, -1.55419639400634 47.2601909044287, -1.55419210313561 47.2601838776283, -1.55419085809105 47.2601818391898, -1.55419069949768 47.2601815787581, -1.55414986884081 47.2599878680752, -1.55413324992521 47.2599090300421, -1.55405619158279 47.2598886581127, -1.55405321914043 47.2598878721119, -1.55405313100451 47.2598878629889, -1.55403067532815 47.2598856503087, -1.55403039369522 47.2598856227211, -1.5540301829037 47.2598855103298, -1.5540300150774 47.2598854205651, -1.55402976961929 47.2598852897239, -1.5539881479254 47.2598631118846, -1.55398726458695 47.2598626413843, -1.55398588483678 47.2598613030022, -1.55397673063699 47.259852427063, -1.55393831920571 47.259815112977, -1.55393823687731 47.2598150324397, -1.55393689302447 47.2598137268753, -1.55393413300847 47.2598106879023, -1.5538980635358 47.2597709796988, -1.55389612764367 47.2597688487864, -1.55389315231842 47.2597640342337, -1.55387351672212 47.2597322575827, -1.55386877641495 47.2597245862956, -1.55386870118516 47.2597244649291, -1.55386844156258 47.2597240445058, -1.55386694224353 47.2597216169665, -1.55386567150379 47.2597162428989, -1.55386533196196 47.2597148101415, -1.55385117404666 47.2596549546358, -1.55385110974108 47.2596546823586, -1.55385103492494 47.2596543645434, -1.55385015597511 47.2596506473307, -1.55384965713535 47.2596423034071, -1.55384961388361 47.2596415806643, -1.55384433808498 47.2595534321343, -1.55384433350722 47.2595533476155, -1.55384431716413 47.2595530635264, -1.55384398154898 47.259547449671, -1.55384437342671 47.2595474044103, -1.55384515974364 47.2595473128864, -1.55384371018629 47.2595355888883, -1.55384363339793 47.2595349692945, -1.55383959419986 47.2595022872972, -1.55383538763314 47.2594682666403, -1.55383442976689 47.2594605139797, -1.55382601147546 47.2594476577052, -1.55381659444365 47.259433274947, -1.55381631589493 47.259432849867, -1.55381596885186 47.2594323202739, -1.55381114008559 47.2594249453361, -1.55380778905448 47.2594200861963, -1.55369904257674 47.2592624144947, -1.55369884916891 47.2592621338162, -1.5536920882577 47.2592523304593, -1.55368820635944 47.2592304216693, -1.55368815757734 47.2592301451728, -1.55368814175628 47.2592300529899, -1.55368594898718 47.2592176700207, -1.55367443402423 47.259152652114, -1.55366558133824 47.2590966682385, -1.55366348914818 47.259083433382, -1.55365908993859 47.2590723191213, -1.55365386708784 47.259059125394, -1.5536494416738 47.2590563911759, -1.55364460417777 47.2590534038646, -1.55363938236322 47.2590501785794, -1.55362494106828 47.2590412597777, -1.55362067348271 47.2590404493876, -1.55358744114868 47.2590341411243, -1.55358324889158 47.2590333448688, -1.55356682042517 47.2590302265482, -1.5535134929804 47.2590226067634, -1.5534901831594 47.2590164045747, -1.55347535437793 47.259012459667, -1.55346839296674 47.2590106071305, -1.55344844110789 47.259001572316, -1.55344058068973 47.2589980127324, -1.55343163063013 47.2589932411311, -1.55342185960549 47.2589880316956, -1.55340814480371 47.2589762304159, -1.55340732706766 47.2589742354141, -1.55340136766237 47.2589596859194, -1.55339543326619 47.2589451967062, -1.55339534312795 47.2589448389499, -1.55339398484305 47.2589394773574, -1.55339280011438 47.2589347991053, -1.55338644247669 47.2589096904871, -1.55338608047419 47.2589085676837, -1.55338436252729 47.2589032410635, -1.55337401725129 47.2588711665939, -1.55336762462054 47.2588574326036, -1.55335858431387 47.2588380087504, -1.5533539006172 47.2588279473817, -1.55335384230765 47.2588278226415, -1.5533538067636 47.258827747459, -1.55335358963297 47.2588272821003, -1.55333744589194 47.2588117610249, -1.5533368516946 47.2588111889597, -1.55333633695492 47.2588106948427, -1.55332676746219 47.2588014938087, -1.55332657871714 47.2588013760377, -1.55330703339608 47.2587891524478, -1.55330519464691 47.258788002543, -1.55329854577693 47.2587838444061, -1.55329836114273 47.2587837282743, -1.55329805770889 47.258783538456, -1.55329614490411 47.2587823428273, -1.55328606350502 47.2587787045196, -1.55327621161873 47.258775149929, -1.5532725188681 47.2587738175655, -1.55326903695395 47.2587717929415, -1.55326180118387 47.2587699818985, -1.55325854850794 47.2587691682352, -1.55325126813427 47.2587673463436, -1.55323360202389 47.2587629245084, -1.55322255266407 47.2587583207534, -1.55321205088028 47.2587539449013, -1.55320225861742 47.258749864424, -1.55318995899568 47.258744739819, -1.55317952523049 47.2587341601409, -1.55317840660348 47.2587272662534, -1.5531854771711 47.2587000443255, -1.55318620462018 47.2586983350229, -1.55319182670256 47.2586851216615, -1.55319561713362 47.2586762149613, -1.55319819936193 47.2586677751171, -1.55320161760723 47.2586566043669, -1.55320393340279 47.2586527281578, -1.55320678715014 47.2586479142556, -1.55320727875764 47.258647084724, -1.55320747777786 47.2586467497535, -1.553208706329 47.2586446781957, -1.55321503847165 47.2586339966301, -1.55321643289246 47.2586328592133, -1.55321888256483 47.2586308591241, -1.55322252872992 47.2586278835406, -1.55322403939162 47.2586266505114, -1.55323372082449 47.2586187494103, -1.55324915920052 47.2586042614387, -1.55324125910494 47.2585898149466, -1.55323551110668 47.2585793019515, -1.55322276594357 47.2585661611054, -1.55320967398217 47.2585526636584, -1.55320522099482 47.258550612624, -1.55320050625428 47.2585484413038, -1.5531910630462 47.2585440928994, -1.55316751548982 47.2585332478736, -1.55314683376319 47.2585280128839, -1.55313925394267 47.2585260938196, -1.55313817577629 47.2585258211561, -1.55309703279733 47.258515406405, -1.55307652444687 47.2585156222853, -1.55307639882764 47.2585156236571, -1.55307609599185 47.2585156266425, -1.55307535942483 47.2585156341941, -1.55307358616985 47.2585156530761, -1.55305516841978 47.2585158465104, -1.55304101791781 47.2585159952545, -1.5530402721173 47.2585160031716, -1.55303997587679 47.2585160058957, -1.55300103123167 47.2585164150249, -1.55298040368595 47.2585173114082, -1.55297910485697 47.2585173682631, -1.55296154844001 47.2585181312772, -1.5529076713731 47.2585204735521, -1.55288697790719 47.2585200101198, -1.55287085679021 47.258519649406, -1.55283646094259 47.2585188790183, -1.55282662748643 47.2585169329636, -1.5528191783874 47.2585154592332, -1.55279472538775 47.2585106204539, -1.55278573696968 47.2585061107342, -1.55277993001359 47.2585025418577, -1.55277887672036 47.2585018942639, -1.55277463702717 47.2584992878188, -1.5527464837147 47.2584819851978, -1.55273408806261 47.2584720805993, -1.55267088813353 47.2584215805666, -1.55261519008503 47.258377073698, -1.55258951386556 47.2583565570476, -1.5525772731136 47.2583472563197, -1.55249886621853 47.2582876819889, -1.5524263646144 47.2582325934968, -1.5524261820227 47.2582324547562, -1.55242599229858 47.2582323099907, -1.55240578843897 47.2582169595203, -1.55239707130726 47.2582089789408, -1.55238814463505 47.2582008075247, -1.55230875931476 47.2581281361136, -1.55229408062515 47.2581146987149, -1.5522872924843 47.2581082582386, -1.55216445188054 47.2579917193584, -1.55212946887129 47.2579585310069, -1.55212067163376 47.2579501850465, -1.5521204737482 47.2579452514466, -1.55212004778358 47.2579345816932, -1.55211885051899 47.2579056535829, -1.55211716328708 47.2579016448906, -1.55210627812124 47.2578762208494, -1.55210623020013 47.2578761092132, -1.55210313492902 47.2578688809161, -1.55209873320696 47.2578667935717, -1.55209649717533 47.257865733271, -1.55206630470653 47.2578514180958, -1.55205824710767 47.2578475923127, -1.55205071641039 47.2578440159811, -1.5520463602679 47.257843360423, -1.55196678512017 47.2578313911173, -1.55196384797699 47.2578309235478, -1.55189227289349 47.2578195195059, -1.55188842461097 47.2578189060029, -1.55188673755388 47.2578183844196, -1.55182329974538 47.2577987575486, -1.55182181110354 47.2577982965876, -1.55180714572977 47.2577892413831, -1.55178464481192 47.2577753495987, -1.55165867602797 47.257698251156, -1.55148266910772 47.2576148442752, -1.55139104188426 47.2575617055645, -1.55130799687496 47.2575238153579, -1.55125770835976 47.2575094045877, -1.55122826190947 47.2575009661416, -1.55121655335906 47.2574976110554, -1.55114518645034 47.2574988150245, -1.55109196749928 47.2575079505805, -1.55105765872673 47.2575230953334, -1.55100218243394 47.2575476383099, -1.55098205833774 47.2575590253227, -1.55091759545024 47.2575955000417, -1.55088335411823 47.2576129848333, -1.55085571103349 47.2576271447492, -1.55085019689289 47.2576281010449, -1.55080993381267 47.2576350844584, -1.55078697536025 47.2576337434996, -1.5507363763369 47.2576307883041, -1.55068867836821 47.2576193410403, -1.55068859515932 47.2576192965783, -1.55064193261444 47.2575942499994, -1.55063089524974 47.2575827929501, -1.55061144029688 47.2575626585311, -1.55059488846751 47.2575253790713, -1.55059866359506 47.2574735085661, -1.5506004504049 47.2574711851649, -1.55066782018206 47.2573819878422, -1.55066786897025 47.2573819237372, -1.55069509531457 47.2573574785026, -1.55069737064658 47.257355435812, -1.55072342442738 47.2573319677929, -1.55072920972523 47.2573268729939, -1.5507930189447 47.257238745548, -1.55090630195119 47.2571146890774, -1.55091106586886 47.2571060664959, -1.55093541768896 47.2570619954039, -1.55094489583916 47.2570412560769, -1.55093836056061 47.2569879916505, -1.55093107603479 47.2569631403998, -1.55090992864987 47.2569123467686, -1.55085653837193 47.2567955203061, -1.55082630681862 47.2567514838965, -1.55076106933787 47.25666639339, -1.5507269378885 47.2566355767939, -1.55072189788477 47.2566323523017, -1.55070455947329 47.2566244579538, -1.55070435155497 47.2566243634647, -1.55067273737029 47.2566099699935, -1.55061338984081 47.2565953797157, -1.55045786778573 47.2565627012443, -1.55040135483655 47.2565534050188, -1.55029902545138 47.2565376328453, -1.55024551955431 47.25653348151, -1.55024519976594 47.2565334563255, -1.55018880505966 47.256530192442, -1.55014011905626 47.2565304078237, -1.54993159887995 47.2565357791721, -1.54974694614868 47.2565422778012, -1.54974686568786 47.2565422809862, -1.5497064082573 47.2565381156736, -1.54967532361374 47.2565336694398, -1.54964249507316 47.2565196508535, -1.54963556249093 47.2565159605944, -1.54957571072029 47.2564784126496, -1.54955441759815 47.2564584409451, -1.54950803076503 47.2564096373341, -1.54949305368503 47.2563892354005, -1.54947381739676 47.2563608023827, -1.549431775873 47.256288489217, -1.54941088624035 47.2562763407667, -1.54939634451062 47.2562700718831, -1.54933737378973 47.2562446497009, -1.54931382619463 47.2562370216485, -1.54923631686524 47.2562143191395, -1.54921353307904 47.2562109859371, -1.54914981823019 47.2562041367239, -1.54912845161576 47.256203450602, -1.54907157049399 47.2562027770723, -1.54901279489045 47.2562020811808, -1.54899470894974 47.2562026167836, -1.54876842447286 47.2562138252095, -1.54875686918878 47.2562164450765, -1.54851898072214 47.2562855099224, -1.54840022355689 47.2563113845508, -1.54827948948646 47.2563280563419, -1.54827657996244 47.2563280813717, -1.54819128221055 47.2563195627323, -1.54803128993726 47.2562903017854, -1.54803114967637 47.2562902866111, -1.54792984964786 47.2562790526446, -1.54788116911375 47.2562736541481, -1.547880975402 47.2562736329791, -1.54749362796438 47.2562554396656, -1.54749336414348 47.2562554654218, -1.54742392499954 47.256262162137, -1.54742374510441 47.2562622098023, -1.54742365709699 47.2562622331077, -1.5473342170122 47.2562858717252, -1.54733403579776 47.2562859194425, -1.54733371356904 47.2562860051772, -1.54733346293501 47.2562861079026, -1.54732260129581 47.2562905599698, -1.54727185962345 47.2563113600319, -1.54727160774678 47.2563114637074, -1.54727126885899 47.2563116023625, -1.54726875358921 47.2563126335726, -1.54726855565526 47.2563127179938, -1.54715096984608 47.2563629294875, -1.54715038116603 47.2563631807456, -1.54709688468594 47.2563817884004, -1.54709601190635 47.2563820914454, -1.54709576434072 47.2563821526, -1.54707632658354 47.2563869313136, -1.54701294083874 47.2564025133374, -1.54701242366684 47.2564026410236, -1.54701214234289 47.256402709821, -1.54701170545005 47.2564027856739, -1.54694753259292 47.2564138907895, -1.54694667052486 47.2564140402292, -1.54694631099851 47.2564140301235, -1.54689917335008 47.2564126754086, -1.54689882229048 47.2564126559572, -1.54687368340868 47.2564112527257, -1.54687357300953 47.2564112462803, -1.54681792151895 47.2564081405793, -1.54681758305263 47.256408098103, -1.54668174363535 47.2563911812896, -1.54668129385048 47.256391121591, -1.5464788129494 47.2563643376148, -1.54647869580196 47.2563643296339, -1.54647827764192 47.2563642993196, -1.54634644468015 47.2563547961534, -1.54634598213302 47.2563547730007, -1.54589629497741 47.2563326840734, -1.54589560419477 47.2563326384089, -1.54582802142315 47.2563281488485, -1.54568887352126 47.2563189054142, -1.54566401933597 47.2563172545839, -1.54559079040851 47.2563123898831, -1.54558936089971 47.2563122950402, -1.54558857200614 47.2563122163105, -1.54550107078946 47.2563034746764, -1.54522210592203 47.2562756053497, -1.54522201918915 47.2562755970657, -1.54522040664989 47.2562754355694, -1.54521955970986 47.2562752969596, -1.54495880039899 47.2562325279767, -1.54495791479883 47.2562323395334, -1.54478505466965 47.2561956068069, -1.54478478257413 47.2561955355696, -1.54478409892277 47.2561953562597, -1.5446979169405 47.2561727369017, -1.54467280290361 47.2561661457133, -1.54463440686849 47.256156068179, -1.54463288924913 47.256155669547, -1.54463192727217 47.2561552994039, -1.54452574109345 47.2561144026699, -1.54452480497909 47.256114009878, -1.544482534915 47.2560962642747, -1.54436154210657 47.2560454699119, -1.54435979062934 47.2560447345159, -1.54435894130012 47.2560443040511, -1.5442741374028 47.2560013263293, -1.54427374177885 47.256001125717, -1.54421149623711 47.2559695798425, -1.54420970623871 47.2559686720629, -1.54420959738048 47.2559686060841, -1.54420894547332 47.2559682092616, -1.54420886871425 47.2559681627382, -1.54412497694308 47.2559171474442, -1.54391273739945 47.2557795667795, -1.54391178362835 47.2557790133914, -1.54385331307368 47.2557450465272, -1.54350043220027 47.2555400520131, -1.54349941160239 47.2555394598148, -1.54322872038611 47.2553822091127, -1.54322654119237 47.255380942764, -1.54322617232289 47.2553807609141, -1.54322577026559 47.2553805623549, -1.54322530601947 47.2553803329148, -1.54315166185775 47.2553439938262, -1.54314422337884 47.2553403231959, -1.54309891279168 47.2553179640467, -1.54309802028058 47.2553175235665, -1.54309653371803 47.2553167902961, -1.54309525787929 47.2553162622472, -1.54302334627303 47.2552865035126, -1.54302080700567 47.2552854532302, -1.54301938038459 47.2552849572712, -1.54295496567771 47.2552625800887, -1.54295234161173 47.2552616683156, -1.54295223457705 47.2552616392071, -1.54295144042878 47.2552614210037, -1.54295086034995 47.2552612610172, -1.54288853605781 47.2552441372432, -1.5419759543649 47.2549933974171, -1.54197267208921 47.2549924954148, -1.54197186531891 47.2549923308662, -1.54197091047293 47.254992137028, -1.54182365215142 47.2549621572659, -1.5418227134407 47.254961966393, -1.54182254512091 47.2549619324969, -1.54182192831126 47.2549618072956, -1.54182102590253 47.2549616230978, -1.54175347770899 47.2549478714862, -1.54174990864122 47.2549471448034, -1.54174809177186 47.2549468678897, -1.54168819047338 47.2549377428523, -1.54157883581984 47.2549210837916, -1.54157519541314 47.2549205293214, -1.54157336245392 47.2549206846476, -1.54148937073289 47.2549278005842, -1.54140500716722 47.2549349482715, -1.54136371097455 47.2549384470023, -1.54135780473456 47.2549389470879, -1.54109414835901 47.2549612846842, -1.54109087264684 47.2549615618827, -1.54105281124613 47.2549668501428, -1.54091744111538 47.2549872462174, -1.5409167701963 47.254987417795, -1.54085682173265 47.2550027065435, -1.54085640004035 47.2550027898821, -1.54073954879544 47.2550258114279, -1.54073882143131 47.2550258176377, -1.54056160413784 47.2550273656893, -1.54022418689957 47.2550303122538, -1.54021874072743 47.2550300768646, -1.54007408273989 47.2550113725276, -1.53974378313463 47.2549681276856, -1.53920012676564 47.254896947199, -1.5394760870427 47.2529458690558, -1.53979020615937 47.2518045303569, -1.53979084063264 47.2518023472615, -1.53979174669513 47.2518002453457, -1.53990631378026 47.2515248446663, -1.53990721983349 47.2515227427495, -1.53990825653574 47.2515206365727, -1.54010146206061 47.2511092942998, -1.54173988851251 47.2489974557735, -1.54465438741146 47.2469140747514, -1.54465665197011 47.2469124669042, -1.54465755775772 47.2469103649475, -1.54595521870618 47.2436976852313, -1.54677865851155 47.242289324116, -1.54677982670783 47.2422872135525, -1.54678303887262 47.2422877361157, -1.54876702145472 47.2426113590045, -1.54919534900917 47.2426724092005, -1.54959991782908 47.2429405741813, -1.55001720841912 47.2430116611122, -1.55067968397188 47.2429379254043, -1.55109810813314 47.242918555012, -1.55140989068647 47.2429422134256, -1.55309055129333 47.2427664403516, -1.55393200440556 47.2426151128867, -1.554545355759 47.2424236816928, -1.55482899835016 47.2424231279191, -1.55483233838274 47.2424231018473, -1.55483668821845 47.2424227690304, -1.55502146525668 47.2424187134395, -1.55575723755902 47.2421900497514, -1.55628066264099 47.2421070768639, -1.55628367035356 47.2421066151934, -1.55628689408551 47.2421067766075, -1.55654613980403 47.2421158380141, -1.55670861394858 47.2421220982969, -1.55710192565419 47.2421526982407, -1.55751779307725 47.2423255815903, -1.55819389984253 47.2423822428122, -1.55909442212041 47.2424669419969, -1.55978994622807 47.2425455900629, -1.55990649742494 47.2425751561315, -1.56041074403256 47.2426773679464, -1.56101032820293 47.2428948045128, -1.56145067517323 47.2432759185303, -1.56216322175336 47.2437529358502, -1.56244544712845 47.2438312530468, -1.56266646013398 47.2438408639188, -1.56367113962583 47.2437098229093, -1.56422444680394 47.2438003548016, -1.56439400827172 47.2437282014831, -1.56457982276258 47.2436763396645, -1.56458280507434 47.2436755192575, -1.5645859257062 47.2436747843644, -1.56473580857192 47.2436379648774, -1.56484705376508 47.2436342096769, -1.56495136336231 47.243646555501, -1.56514017136995 47.2437064397432, -1.56526907283251 47.2437310514021, -1.56538283054514 47.2437353379949, -1.56551558890456 47.2437221996284, -1.56566877550524 47.2436845015506, -1.56579029727317 47.2436478749246, -1.56586972274294 47.243645187533, -1.56604202566384 47.2436501648605, -1.56618586190489 47.2436583573307, -1.56678632729609 47.2436401965674, -1.56689251206529 47.2436127349137, -1.56702242402782 47.2435606011399, -1.56709221800586 47.243558238934, -1.5672051773202 47.24357828286, -1.56728209066525 47.2435864874449, -1.56759820473032 47.2435974926728, -1.56771657876736 47.2436065448782, -1.56777195655645 47.2436241248967, -1.56794377009678 47.2437093670573, -1.56799931282601 47.2437291931118, -1.56834582689152 47.2437217835194, -1.56840026122849 47.2437264252259, -1.5684689160377 47.2437501297285, -1.5685149847567 47.2437724380283, -1.56871514106345 47.2438545572557, -1.56886289604626 47.2439145828538, -1.56899248586677 47.2440337682267, -1.56912063819799 47.2440879725592, -1.569224751277 47.244162535591, -1.56944213409786 47.244261363083, -1.56954211088459 47.2443209341873, -1.5696734452231 47.2444205150112, -1.56976408628274 47.2445713715919, -1.56988197487001 47.2446606883922, -1.57002010190676 47.244721038761, -1.57015695886154 47.2448074617621, -1.57025806956155 47.2448408748281, -1.57052880289617 47.2448425110353, -1.57066614020479 47.2449354922495, -1.5707436607548 47.2449501582386, -1.57079920449765 47.2449699829876, -1.57087672294822 47.2450280630026, -1.57097575384714 47.2452068248983, -1.57134764437952 47.2451573863308, -1.57224007957755 47.245127142532, -1.57236618335529 47.2451532211504, -1.57251018186669 47.2451635620472, -1.57259530559115 47.2451519398036, -1.57277791602723 47.2451241329644, -1.57292048375498 47.245114886714, -1.57306464085836 47.2451273832009, -1.57333727318132 47.2451983917473, -1.57352145240674 47.2452354703443, -1.573655157574 47.2452352605512, -1.57376037174753 47.2452560111274, -1.57376359074439 47.2452566227906, -1.57376655223098 47.2452573330095, -1.57377907194735 47.2452603308868, -1.57420026051861 47.2453750271596, -1.57440058466757 47.2454755052357, -1.57489378531555 47.2456217123005, -1.57519294586183 47.2458112476651, -1.57540610703054 47.245947946554, -1.57573656265845 47.2462054107061, -1.57612180562077 47.2466187251183, -1.57644345892958 47.2467883093645, -1.57662855285934 47.2468648926932, -1.57721594967294 47.2471520512088, -1.57732335967899 47.2471548598892, -1.57733484951359 47.2472008080339, -1.57733680416136 47.2472174002245, -1.57732373391587 47.2472322480743, -1.57732233660058 47.2472338355749, -1.57733247130567 47.2473394894386, -1.57733335973992 47.2473649123678, -1.57733467794156 47.2474026089598, -1.57733468007955 47.2474026800602, -1.57733468749628 47.2474029050358, -1.57733469009703 47.2474029815242, -1.5773346942261 47.2474031066104, -1.57733470532357 47.2474034206466, -1.57733471098076 47.2474035943304, -1.5773347154183 47.2474037230086, -1.57733655767252 47.24745637744, -1.57733198088367 47.2475047677197, -1.57733058369589 47.24751917313, -1.57733057761259 47.2475192409535, -1.57732785629563 47.2475322348456, -1.57732147540468 47.24756225811, -1.5773138147496 47.2475983029292, -1.57730644424675 47.2476326574711, -1.57730546983895 47.2476391219107, -1.57729540131502 47.2477059048855, -1.57729149160174 47.2477220097954, -1.57727317068872 47.2477983404568, -1.57726366474733 47.2478376909549, -1.5772632136092 47.2478395561455, -1.57724519568178 47.2479147934285, -1.57722236022278 47.2480063519859, -1.57721625882691 47.2480308341546, -1.57720634096939 47.2480709669701, -1.57719807877125 47.2481041856039, -1.57718332942975 47.2481573963488, -1.57712566068547 47.2484134383714, -1.5770891111679 47.2485656453526, -1.57701866976882 47.2488594107157, -1.5769613956076 47.2490984964723, -1.57694814970901 47.2491538098741, -1.57684465361585 47.249585164067, -1.5768441041052 47.2495874557797, -1.57684408156298 47.2495875476869, -1.57684339461662 47.2495904116542, -1.57675781552054 47.2499467740405, -1.57675549564988 47.2499564179068, -1.57675011189525 47.249978798951, -1.57670979615953 47.25016575723, -1.57670715244547 47.250178117239, -1.57667601157768 47.2503224493266, -1.57666891318926 47.2503554205873, -1.57666679240271 47.2503652718799, -1.57665078232563 47.2504396387444, -1.57664177204165 47.2504814888157, -1.57662605799063 47.2505544805451, -1.57662295077031 47.2505689170804, -1.57662142021528 47.2505760262999, -1.57662140334092 47.2505761071682, -1.57661892680206 47.2505876098929, -1.57661887649508 47.2505878407713, -1.57660904029456 47.2506335569321, -1.57659466309235 47.2507003590416, -1.57659422470348 47.2507023886168, -1.57658074473328 47.2507648000598, -1.57655983589911 47.2508618683129, -1.57654902783962 47.2509116780343, -1.57654215232096 47.2509471841562, -1.57653777862062 47.2509678147, -1.57653452404073 47.2509831707952, -1.57652611138549 47.2510208106168, -1.57652579308007 47.2510222199701, -1.57651643156939 47.2510637271757, -1.57650352553978 47.2511183862573, -1.57649226932809 47.2511660611268, -1.57648635988422 47.2511915997439, -1.57647943351796 47.251221538292, -1.57643352881025 47.2514112419334, -1.57641395289857 47.2514945605962, -1.57638674921771 47.2516123340074, -1.57637886314975 47.2516514846746, -1.57637085289515 47.2516907303939, -1.5763218571284 47.2519322791302, -1.57631191014771 47.2519813336448, -1.57620642568591 47.2525050977578, -1.57620454640217 47.2525141572745, -1.57620236327218 47.2525246868401, -1.57620081077071 47.2525321735721, -1.5761984065007 47.2525449358127, -1.57619008381099 47.2525890985285, -1.57617505698413 47.2526961146221, -1.57616619977172 47.2527619741364, -1.57615284790936 47.2528612661331, -1.5761605543937 47.2530190017887, -1.57616716214991 47.2531542685657, -1.576188068953 47.2534824209853, -1.57619224722968 47.253535688751, -1.57624216626605 47.2538410599899, -1.57637851091784 47.2541834484327, -1.576426958844 47.2543051521752, -1.57645040325285 47.2543640459446, -1.57661408196427 47.2545208042456, -1.5766644733255 47.2545785988032, -1.57668029356595 47.2545967419589, -1.57673161016567 47.2546548907172, -1.57675102163784 47.2546768925599, -1.57677193153171 47.2547005918393, -1.57685560583341 47.2547964688397, -1.57692089484778 47.2548724431763, -1.57694245913678 47.2548969949243, -1.576991837184 47.2549541394861, -1.57703854803359 47.2550079661376, -1.57707960582018 47.2550560707626, -1.57711025822425 47.2550908933215, -1.57715692925761 47.2551473346556, -1.57719267575934 47.2551890728705, -1.57723492016032 47.2552386620311, -1.57726083931289 47.2552681467252, -1.57726089359274 47.2552682085402, -1.5772877266921 47.2552987336235, -1.57731581233499 47.2553314056551, -1.57736816861509 47.2553923962301, -1.57744577372378 47.2554807652802, -1.57750023354738 47.2555429290359, -1.57775158245147 47.2558298292034, -1.57786077250893 47.2559546052307, -1.57788776452866 47.2559855545835, -1.57788791139743 47.2559857235436, -1.57790246811078 47.2560024138801, -1.57792522225278 47.256028757189, -1.57792928595198 47.2560334611717, -1.57793936808553 47.2560451322891, -1.57794929893431 47.2560566292151, -1.57794964578939 47.2560570307984, -1.57799137280352 47.2561052031078, -1.5780145726251 47.256131849435, -1.57808358731692 47.2562110962267, -1.57810587406885 47.2562363416818, -1.57815734097945 47.2562946623319, -1.57821248181275 47.2563576619142, -1.57821252151573 47.2563577080901, -1.5782561096318 47.2564075101317, -1.57827162247816 47.2564258059168, -1.57827569751946 47.2564306103587, -1.57827599940044 47.2564309659752, -1.57828644536153 47.2564432497277, -1.57828677322254 47.2564436304407, -1.57830011605096 47.2564590985625, -1.57839168904473 47.2565636726131, -1.57839935918217 47.2565721778593, -1.57841114585212 47.2565852462023, -1.57843230882956 47.2566108409353, -1.57845132114407 47.2566338334081, -1.57851360119238 47.2567048961049, -1.57856181634609 47.2567599121132, -1.57864272093044 47.2568527454675, -1.5786648041025 47.2568770942547, -1.57871832297206 47.256936237637, -1.57871929270973 47.2569373262596, -1.57871967965912 47.2569377938249, -1.57876848520932 47.2569947001396, -1.57878374399122 47.2570124842613, -1.57881646050299 47.2570506149819, -1.57882276017461 47.2570579565372, -1.57887782103146 47.2571164959757, -1.5789165904346 47.2571584638342, -1.57894699665832 47.2571913791861, -1.57897705409884 47.2572239164555, -1.5790037147121 47.2572553833971, -1.57907425089495 47.2573399782723, -1.57914751953057 47.2574272729236, -1.57918336722261 47.25746998246, -1.57946477181598 47.2578058678331, -1.57954888996362 47.2579018660715, -1.57964322242349 47.2580095209726, -1.58021624140449 47.2586643925916, -1.58073607954534 47.2592628018086, -1.58109161065223 47.2596720604292, -1.58112441746486 47.2597072467643, -1.58124518517437 47.2598494902114, -1.58148420944768 47.2601249633188, -1.58158443050718 47.2602404648881, -1.58195159385118 47.2606635758372, -1.58218021744787 47.2609232716521, -1.58220922516388 47.2609562213018, -1.58225232023393 47.2610051730803, -1.5824052672533 47.261179833216, -1.58259521144596 47.2613968108839, -1.58272041359442 47.2615289643157, -1.58278101991475 47.2616011001113, -1.58283131112644 47.2616609571697, -1.58283292381956 47.2616628860707, -1.58288380647616 47.2617215544276, -1.58295959371219 47.2618089466677, -1.58304852637598 47.2619117080675, -1.58304898786593 47.261912241131, -1.58306323441398 47.2619287035966, -1.58308261910681 47.261951101184, -1.5831635196396 47.2620437473043, -1.58316356214384 47.2620437951691, -1.58320460758545 47.2620889807402, -1.58332845326171 47.2622253155651, -1.58338953041863 47.2622972277718, -1.58369666880784 47.2626588369603, -1.58379518089038 47.2627726398334, -1.58379542785344 47.262772925541, -1.58379549548907 47.2627730039415, -1.5839579249996 47.2629606454891, -1.58398988884296 47.2629975723053, -1.58412466626499 47.2631532168347, -1.58426416676391 47.2633144524296, -1.58433997977091 47.2634018906354, -1.58434805979294 47.2634112136052, -1.58437061977994 47.2634373022715, -1.5843852728846 47.2634542493886, -1.58439979039067 47.263470882027, -1.58440790161676 47.2634804596568, -1.58445452492166 47.2635342611375, -1.58445461311423 47.2635343630471, -1.58447471282854 47.2635575492047, -1.58447478480997 47.263557631937, -1.58451298602652 47.2636017032712, -1.5848637078532 47.2640039226049, -1.58499190239479 47.2641507404977, -1.58512086153087 47.2643003121257, -1.58522732530822 47.2644236555679, -1.58524776300189 47.2644473462546, -1.58535764565283 47.2645747234443, -1.58538332728591 47.2646044945086, -1.58555785647369 47.2648066825108, -1.58568495231806 47.2649540085425, -1.5858164241509 47.2651064123124, -1.58583149091356 47.2651238789186, -1.5858481587451 47.2651431982602, -1.58585904190025 47.2651555991575, -1.58596702216968 47.265278573356, -1.58656760418431 47.2659688956275, -1.58764707749227 47.2672100373596, -1.58941089231176 47.2692108141588, -1.58941094413598 47.2692108778692, -1.58954738778477 47.2691523342671, -1.58961583612817 47.2691229655014, -1.58962140272851 47.2691292779494, -1.58962477286936 47.2691330991753, -1.59000916551589 47.2695689195931, -1.59007385794828 47.2696422676793, -1.59046946058813 47.270090790593, -1.5904695017861 47.2700908385078, -1.59109350992077 47.2708116533711, -1.59111250551828 47.2708335904837, -1.5911125540107 47.2708336462167, -1.59171656993769 47.2715284123198, -1.59201689184255 47.2718708728423, -1.59239905400806 47.2723066476746, -1.59243155911497 47.2723437130901, -1.59245990592448 47.2723760354736, -1.59252385457312 47.2724489534571, -1.59253190087138 47.2724581286101, -1.59257478709265 47.2725070314055, -1.59262557128763 47.2725649386467, -1.59268351850826 47.2726303892838, -1.59268356001984 47.2726304407898, -1.59269278752652 47.2726416295365, -1.59272505717895 47.2726807497582, -1.59273763072202 47.2726959966994, -1.59278439876933 47.2727486262485, -1.59278449258046 47.2727487315326, -1.59278614207162 47.2727505876605, -1.59280112181388 47.272767437926, -1.59335461326062 47.2733958495643, -1.59339698183508 47.2734439518913, -1.59328988646858 47.2734840064928, -1.59326082691262 47.2734510162131, -1.59318189521447 47.273532618372, -1.59312419691857 47.2735922687028, -1.59285855635267 47.27370983992, -1.59281940861823 47.2736949985647, -1.59281403769216 47.2736971982159, -1.59275793264068 47.2737202302525, -1.59271725358413 47.2737369286438, -1.5920795780879 47.2739956047898, -1.59192426017216 47.2740576738045, -1.59159571208294 47.2741889918102, -1.59159563912093 47.2741890208556, -1.59159550647189 47.2741890639987, -1.59158870527557 47.2741912756539, -1.59153158363372 47.2742098530241, -1.59153149476105 47.2742098818037, -1.59153136762187 47.27420992743, -1.59148243048481 47.2742271506805, -1.59140189163148 47.2742528833573, -1.59125911532566 47.2742961828303, -1.59115941600636 47.2743264181751, -1.59115647428445 47.2743273105798, -1.59100988975331 47.2743747094591, -1.59086904814209 47.2744170526073, -1.59086841827063 47.2744172408546, -1.59084960252896 47.2744228994794, -1.59078594033302 47.2744424638956, -1.59069548583127 47.2744702418615, -1.59049661225435 47.274528647703, -1.59041265314103 47.2745550613644, -1.59030109854573 47.2745901566435, -1.59009874749126 47.274647227322, -1.59009867647006 47.2746472481791, -1.58983886998963 47.2747252159718, -1.58983315568494 47.2747262451554, -1.58982479092092 47.2747277522947, -1.58980655785077 47.274735872674, -1.58979280459891 47.2747409298394, -1.58978857656715 47.2747420447632, -1.58978443026685 47.2747431402046, -1.58976777356781 47.2747450639573, -1.58975801089744 47.274746911639, -1.58975512928729 47.2747474573915, -1.58974952494892 47.2747485182243, -1.58972737915407 47.2747496599882, -1.58926119661731 47.2747613845642, -1.58925285901852 47.2747615939148, -1.58901908730752 47.2747674727215, -1.5890189802779 47.2747674751913, -1.5890141864135 47.2747674475669, -1.58901394270761 47.274767446481, -1.58899354988479 47.2747673287032, -1.58896204329045 47.2747657018536, -1.58893412986859 47.2747626754695, -1.58891605691298 47.2747575361498, -1.5873135806334 47.2744262718708, -1.58731347733963 47.2744262408498, -1.58727852160188 47.2744157700598, -1.58725948906203 47.2744093856326, -1.58725883329742 47.2744091658006, -1.58725853335306 47.2744090651323, -1.58725781077046 47.2744088227359, -1.58719711959165 47.2743884665913, -1.58711573973957 47.2743521504423, -1.58710950282437 47.2743488336874, -1.58701638947965 47.2742993675213, -1.58701631878545 47.274299330694, -1.58693149829478 47.274254268807, -1.58691443352108 47.2742467497509, -1.5867797741503 47.2741743584278, -1.58675408858507 47.2741605152492, -1.58665422523718 47.2741003825459, -1.58664363517734 47.2740940063403, -1.58660822980291 47.2740751281635))
-Nantes;Ile de Nantes;6;440109.0;POLYGON ((-1.51850796339839 47.2105452693035, -1.52092933454047 47.2085456247575, -1.52093835295129 47.2085246382627, -1.52094059928679 47.2085194111117, -1.5226322864962 47.2072219546304, -1.52394536199526 47.2063899539058, -1.52394542344465 47.2063899145415, -1.52394780539811 47.2063883790078, -1.52509366536991 47.2058775627872, -1.52509748922934 47.2058758802993, -1.52527891047912 47.2057950242131, -1.52767272033937 47.2047276963074, -1.52767276617799 47.2047276755777, -1.53014936642966 47.2036233466533, -1.53014934460378 47.2036233231857, -1.53042220079054 47.2035017054882, -1.5304248847319 47.2035004444293, -1.53042771446365 47.2034993587315, -1.5349321496625 47.2016816060381, -1.53410723932868 47.2007202863366, -1.53426522229266 47.2006443662805, -1.53410722749692 47.2004569289358, -1.53425734004281 47.2004000978587, -1.53441175747656 47.200574595531, -1.53450669909487 47.2005315063549, -1.53536114810711 47.2015320919299, -1.53536215573207 47.2015332289199, -1.53545738425385 47.2014940923614, -1.5429476489634 47.1991905195449, -1.54351794462172 47.2000992881092, -1.54363339944733 47.2000676600002, -1.54385940059507 47.2000096112382, -1.54395450330092 47.2001493466919, -1.54404319696959 47.2002243594551, -1.54420702675651 47.2001782210241, -1.5440059310743 47.1999654976002, -1.54414600940499 47.1999271852287, -1.54352089253646 47.1990243184186, -1.54514110187669 47.1985986717037, -1.54630520609587 47.1983546377178, -1.54843594831824 47.1980910622054, -1.54843604915506 47.1980912834793, -1.54843672754062 47.1980914251046, -1.54843968322645 47.1980920405823, -1.54963866676179 47.1980799460682, -1.54964482111226 47.1980792516469, -1.54970867500314 47.1980792442499, -1.55445731918734 47.1980312623575, -1.5544574169183 47.1980312611837, -1.55481428916242 47.198028364333, -1.55498271772527 47.1980272985699, -1.55498439712367 47.1980272878076, -1.55511964708251 47.1980264316575, -1.55512377212375 47.1980267753014, -1.55512404111255 47.198026797969, -1.55512421828169 47.1980267981484, -1.55559463909481 47.1980282900556, -1.55727158163155 47.1980335927698, -1.55727304819607 47.198033597631, -1.55727377020219 47.1980335996081, -1.55747857070136 47.1980342456061, -1.55759701299241 47.1980346187182, -1.55759706592572 47.1980346193202, -1.56172765922293 47.1980483550928, -1.56202533564716 47.1980493224209, -1.56317641441114 47.1980535876361, -1.56381673498584 47.1980541770355, -1.56543523642843 47.1980577695007, -1.56618989040867 47.1980602841978, -1.56618994861236 47.1980602845861, -1.56718611113839 47.1980617501731, -1.56774096886901 47.1980647262851, -1.56774102180236 47.1980647268824, -1.56909322877616 47.1980683177651, -1.56981594891531 47.1980694681974, -1.5698160401352 47.1980694681709, -1.57061414019 47.1980717554522, -1.57061430278921 47.1980717552866, -1.57085304765502 47.1980718857444, -1.57086068877738 47.1980718040975, -1.57098183054146 47.1980705087776, -1.57120249575172 47.1980681495508, -1.57120267671977 47.1980681477519, -1.57144248934519 47.1980621791427, -1.57157087048264 47.1980589837918, -1.5721418442977 47.1980431850068, -1.57274376410093 47.1980137157507, -1.57274428275826 47.1980136896863, -1.57364816796465 47.1979682079882, -1.5737846146539 47.1979613412817, -1.57396418068232 47.1979523050881, -1.57396488969958 47.1979522480057, -1.57399672896553 47.1979497053726, -1.57403301547342 47.1979468062315, -1.5741268785873 47.197939308151, -1.57412844504319 47.1979391826643, -1.57425524521132 47.1979246160269, -1.57436501046981 47.1979120057321, -1.5743657844644 47.1979118892895, -1.5746897607121 47.1978632926152, -1.57469052780928 47.1978631728408, -1.5747577679604 47.1978526945684, -1.57483383376408 47.1978408400294, -1.57564682735078 47.1977141380061, -1.57670577108132 47.1975505513957, -1.57724997604524 47.1974643634153, -1.57725019647503 47.1974643284952, -1.5775232026812 47.1974135251071, -1.57762018510451 47.1974020890138, -1.57782361803753 47.1973678456848, -1.57801091220262 47.1973396521068, -1.57826917950174 47.1972988961201, -1.57827333254159 47.1973010733515, -1.57262778126583 47.2046486851936, -1.57216913795212 47.2051406184923, -1.57120495066092 47.2059748428046, -1.57102211257743 47.2060846220816, -1.56930345586724 47.2071162595749, -1.56930104912896 47.2071176925586, -1.56929822131414 47.2071187791599, -1.56757319037793 47.207768531584, -1.5672411808612 47.2078937153647, -1.56606051433375 47.2083383809204, -1.56570134591442 47.2084736669433, -1.56325067140343 47.2091354892502, -1.56202743844932 47.2091689464892, -1.56115270026708 47.2089639031319, -1.56114937090982 47.2089635659109, -1.55008589842703 47.2076801122133, -1.54890172147651 47.2079015276162, -1.54889859011067 47.2079020832761, -1.54889574783538 47.2079029897154, -1.53871131640603 47.2112353132873, -1.53870898852592 47.21123602162, -1.53496124381681 47.2118417565214, -1.53383885512533 47.211917909738, -1.53383569677711 47.2119181056119, -1.53383240663451 47.2119183066888, -1.53296676230089 47.2119714188783, -1.52986265388467 47.2123175076385, -1.52672501715899 47.2128148667369, -1.52589899701078 47.2130399759218, -1.52589601728691 47.2130407970762, -1.52589303616871 47.2130416173843, -1.52039461927971 47.2145618704863, -1.52039163799212 47.2145626906515, -1.52038879487827 47.2145635963845, -1.51865662426963 47.2151140261878, -1.51491498099189 47.2164481536026, -1.51158324456134 47.2167751005581, -1.51263882217809 47.2155439437627, -1.51264154830332 47.2155407631753, -1.51264407595157 47.2155378156482, -1.51436115635316 47.2135349816522, -1.51437769734269 47.2135179323593, -1.51505532654995 47.2129955633259, -1.51565665590562 47.2125320009252, -1.51565670084295 47.2125319694236, -1.51565687438255 47.2125318481666, -1.51565708424214 47.2125317029552, -1.51596769792292 47.2123152317798, -1.51598030206173 47.2123063563747, -1.51605759452887 47.2122524977027, -1.51606983367212 47.2122439970597, -1.51850792264655 47.2105453033449, -1.51850796339839 47.2105452693035))
-Nantes;Nantes Erdre;9;440109.0;POLYGON ((-1.52077853895932 47.2958289377023, -1.52075523284183 47.2958242429532, -1.52055491660987 47.2958297730376, -1.52035861504341 47.2958399394028, -1.52017975889214 47.2958492009181, -1.52009922649892 47.2958432570627, -1.52000610052331 47.2958363825946, -1.51972469279277 47.29576652942, -1.51959891989884 47.2956984867846, -1.51948122278594 47.2956167355481, -1.51918246513568 47.2954092190171, -1.51892557127868 47.2952942493347, -1.51892549088199 47.2952942227591, -1.51852915080825 47.2951629535161, -1.51835936496313 47.2951130392234, -1.51834658797246 47.2951094927896, -1.51820066762478 47.2950689945556, -1.51805490240767 47.2950368759658, -1.51789351789712 47.294996992894, -1.51743851931614 47.294868265546, -1.51712215213645 47.2947453551723, -1.51710126707254 47.2947345943934, -1.51708573622988 47.294726592245, -1.51708088053551 47.2947240897491, -1.51682593662037 47.2946132739441, -1.51674792587024 47.2945787651991, -1.51669382109977 47.2945548301521, -1.51660686757226 47.2945163646492, -1.51649998268285 47.2944715068037, -1.51649936196752 47.2944712464509, -1.51649886896449 47.2944710396503, -1.51649873023518 47.2944709811245, -1.5164985063898 47.2944708871964, -1.51638521801017 47.2944233415273, -1.51596902113053 47.2942601073435, -1.51581928945217 47.2942168437512, -1.515770256039 47.2942026764056, -1.51540189569578 47.2941857854892, -1.51492970887862 47.294164131646, -1.51429080350601 47.2941326241393, -1.51413164721228 47.2941768039108, -1.51388876719964 47.2942378746929, -1.5134983004498 47.2943123951699, -1.51313295214502 47.2944192668084, -1.5127029445816 47.2944726300084, -1.51239274381013 47.2945332752156, -1.51216326379328 47.2946133679518, -1.51187857980493 47.2947704128598, -1.51181536681731 47.2947971751677, -1.51168578024044 47.2948520391316, -1.51150866386771 47.2948718718729, -1.51136488418961 47.2949273885561, -1.51130346675041 47.2949511040431, -1.51062511047085 47.2952496353428, -1.5103713422623 47.2953651869865, -1.50999791820789 47.2955019184924, -1.50989607455785 47.2955410517183, -1.50981655273074 47.2955716509345, -1.50971060641658 47.2956123864839, -1.50970927936743 47.2956108545068, -1.5097079640957 47.2956093364844, -1.50969509257593 47.2955949741801, -1.50965236356449 47.2955470929211, -1.50959492668502 47.2954428433553, -1.50952572863016 47.2953338802661, -1.50952569657349 47.2953338301644, -1.50929217552849 47.2949629318872, -1.50911963219468 47.294685221047, -1.50901247599359 47.2945127510478, -1.50875045538611 47.2941180106463, -1.50858874780739 47.293786464231, -1.50847483661755 47.2935563919549, -1.50845849623704 47.2931867103379, -1.50840095058551 47.2927848778381, -1.50839563627478 47.292747769204, -1.50837921445459 47.2926331021404, -1.50835253345643 47.2924467955748, -1.50831268331405 47.2922557954516, -1.50828454881352 47.2921209458406, -1.50828089788098 47.2920707764857, -1.50827403686588 47.2919764726945, -1.50829463961369 47.2918115853606, -1.50831998005694 47.2916596249569, -1.50833433955727 47.2915735122551, -1.50832859966948 47.2912117026222, -1.50832097237347 47.2911205635247, -1.5083173407285 47.2910771745359, -1.50831239119294 47.2910093382673, -1.50829689773556 47.2908764114959, -1.5082833776188 47.2907167414599, -1.50825958861206 47.2905468382061, -1.5082592665169 47.2905445982625, -1.50825349162242 47.2905045486918, -1.50825321112251 47.2905027999798, -1.50825316665927 47.2905025251072, -1.50825295565699 47.2905012061643, -1.50825293107888 47.2905010566561, -1.50826371027414 47.2904767929463, -1.50827273235036 47.2904564887476, -1.5082921438911 47.2904449164248, -1.50829130809838 47.29041480801, -1.50829130483961 47.2904146756867, -1.50828560320116 47.2903989509904, -1.50828555491347 47.2903988186301, -1.50827699616061 47.2903755012394, -1.50828212339282 47.2903444670965, -1.50828706509055 47.2903145574997, -1.50828206532591 47.2902664583983, -1.50827951737998 47.2902410591899, -1.50827312687487 47.2902183091519, -1.50826757481464 47.2901985482951, -1.50825792946918 47.2901592541246, -1.50825787066089 47.2901590131523, -1.50825452405583 47.2901335028868, -1.50825450797842 47.290133375571, -1.50825231496303 47.2901014858624, -1.50824992151948 47.2900666972946, -1.50824965160462 47.2900543133378, -1.50824946244715 47.2900456357464, -1.50824579378178 47.2900085644036, -1.50823822030137 47.2899331965657, -1.50823160505873 47.2899019892785, -1.50823092283625 47.2898972477816, -1.50823031662282 47.2898930286044, -1.50823327654224 47.2898387130609, -1.50823328358753 47.289838592948, -1.50823328737909 47.2898385126079, -1.50823368719173 47.2898311760858, -1.5082378285544 47.2897549670109, -1.50823864009676 47.2897395276253, -1.50823866444857 47.2897390175901, -1.50823873598331 47.2897374695235, -1.50823876150861 47.2897369107868, -1.50823887421833 47.2897344726927, -1.50823800440375 47.2897252009731, -1.50823751038064 47.2897199295028, -1.50822999868123 47.2896437266894, -1.50823160852371 47.289641891265, -1.50823439233352 47.2896387186505, -1.50823482960428 47.2896382212625, -1.50823482649221 47.2896381375889, -1.50823482452084 47.289638067386, -1.50823355277225 47.2895965537254, -1.50823241281356 47.2895565026728, -1.50822242265635 47.2894901281083, -1.50822378224353 47.289476469295, -1.50822081246219 47.2894351393265, -1.50821689700964 47.28936230865, -1.50821382710481 47.2893510760339, -1.50821132045168 47.2893418036006, -1.50821120788413 47.2893411466586, -1.50820292989774 47.289292756169, -1.50820341240627 47.2892484066855, -1.50820319485938 47.2892458373722, -1.50820297898536 47.289243287816, -1.50820297343453 47.2892432222586, -1.50819897516851 47.2891960011363, -1.50819705565052 47.2891733308305, -1.50819616592361 47.289162822779, -1.50819581614645 47.2891586917615, -1.50818746656983 47.2890647715334, -1.50818745863471 47.289064693455, -1.50818679978023 47.2890580381591, -1.50818595854689 47.2890495573214, -1.50818507979414 47.2890406959185, -1.50818492535405 47.2890391377879, -1.50818383626227 47.2890281518969, -1.50817914358617 47.2889821131099, -1.50817832519899 47.2889489873623, -1.50817817807124 47.288947202787, -1.50817733506736 47.2889370118675, -1.50817480263576 47.2889063986968, -1.50817276970923 47.2888818100414, -1.50817034529478 47.2888374267316, -1.50816867940065 47.2888069129456, -1.50816677640991 47.2887594132642, -1.50816535833753 47.2887565378062, -1.50816436084259 47.2887545162553, -1.50816389880115 47.2887535792768, -1.50816381494683 47.2887528860691, -1.50815324168155 47.2886652484662, -1.50813594759068 47.2886330361378, -1.50815552753731 47.2885671243186, -1.50813892064269 47.2885633602412, -1.5081013583456 47.2885607779797, -1.50803089890303 47.2885559711763, -1.50803269345085 47.2884113759567, -1.50802513471089 47.2883705853645, -1.50801377368861 47.2883082839998, -1.50801376377111 47.2883082294259, -1.50801375524942 47.2883081756982, -1.50800433949925 47.2882469685187, -1.5080043483638 47.2882469168126, -1.50801290914205 47.2881995989528, -1.50801448280334 47.2881790839344, -1.50801801442409 47.2881707461497, -1.50801811717349 47.2881705051519, -1.5080710569581 47.2880464867091, -1.50807427996027 47.2880415578947, -1.50808846232646 47.2880198629551, -1.50809040143686 47.2880168964477, -1.5081051685971 47.2879942415135, -1.50816534182028 47.2878806968431, -1.50816537172616 47.2878806434112, -1.50822667647706 47.2877730524855, -1.50807226283412 47.2877135104632, -1.50810603069878 47.2876181221835, -1.50811531345995 47.2876104581824, -1.50812789853195 47.2875721514143, -1.50814784788714 47.2875114204115, -1.50814788711343 47.2875113206618, -1.5082355091839 47.2872846192282, -1.5082358172464 47.2872554138339, -1.50823596633607 47.2872513722837, -1.50823637999243 47.2872401643953, -1.50823581568256 47.2872272747799, -1.50823581299971 47.2872272118131, -1.50823603200494 47.2872270770841, -1.50825267752121 47.2872168196174, -1.50824775530314 47.2871383527918, -1.50824109786955 47.287031571591, -1.5083758828815 47.2870876479622, -1.50842818330096 47.2871094749637, -1.50846657502814 47.2870858947372, -1.5084993164615 47.2870659599101, -1.50850089476024 47.2870251715456, -1.50851136314068 47.2869924142333, -1.5085450662449 47.2869072072173, -1.50854538338725 47.2868859305086, -1.50860727729458 47.2866754583465, -1.5086376885942 47.2865732580834, -1.50869100277716 47.2864209655394, -1.50869133667489 47.2864192477026, -1.50869202006317 47.2864157303249, -1.50870262128351 47.2863611340413, -1.50872314760824 47.2862902310668, -1.50875435936171 47.286182413885, -1.50879398985094 47.2861031013549, -1.50885854974885 47.2859896886897, -1.50891087460328 47.2858977694731, -1.50899792017966 47.2857477853416, -1.50902624425594 47.2856989815376, -1.50903764037067 47.2856793445977, -1.50905663468238 47.2856516401691, -1.50907140864547 47.2856355830258, -1.50913681782067 47.2855745416143, -1.50922808544609 47.2854779768287, -1.50922957792778 47.2854768370734, -1.50935098950504 47.285379720948, -1.50936364513089 47.2853696737941, -1.50936585046194 47.2853675230618, -1.50936817204587 47.2853652596475, -1.50942118119308 47.2853132099829, -1.50944295157324 47.2852918335761, -1.5094492107716 47.2852856872979, -1.50945447981475 47.2852805142131, -1.50950705640253 47.2852267361682, -1.50950728799469 47.2852265000274, -1.50950744399705 47.2852263407351, -1.50950834206422 47.2852254216095, -1.50950987927115 47.2852238250762, -1.50951077627336 47.2852228933779, -1.50957320843928 47.285150164919, -1.50957329032355 47.2851500842195, -1.50957336241017 47.2851500129145, -1.50968368595296 47.2850412231343, -1.50968526050664 47.2850399269786, -1.50968532611939 47.285039873047, -1.50968690440411 47.2850385740418, -1.50968838027452 47.2850373322135, -1.5097830721414 47.2849576746997, -1.50981464773319 47.2849324537413, -1.50982190577702 47.2849266575137, -1.50982478188117 47.2849243597283, -1.50983262776845 47.2849180935366, -1.50991087774861 47.2848555929525, -1.50992271468618 47.2848461382733, -1.50992445481611 47.2848447491217, -1.50992495707252 47.2848443473882, -1.5099491150295 47.2848254785091, -1.50996345874333 47.2848142748307, -1.51003724086899 47.2847583106347, -1.51007000205715 47.2847330512087, -1.51015457783182 47.2846678407356, -1.51025026800263 47.2846063318225, -1.51026921364077 47.2845920246732, -1.51028764897347 47.2845781024516, -1.51030627232271 47.2845640395001, -1.5103066817263 47.2845637297074, -1.51033969684893 47.2845387665847, -1.51034098856299 47.2845377896641, -1.51034106077327 47.2845377354733, -1.51034410342829 47.2845354347449, -1.51016635889078 47.2843973399277, -1.51020562388619 47.2843746275816, -1.51020713106515 47.2843737557419, -1.5102088988563 47.2843727403286, -1.51021066664739 47.2843717249153, -1.51022368688627 47.2843607343863, -1.51022843223303 47.2843567279079, -1.51023810592555 47.2843485618064, -1.51024908714802 47.2843392929206, -1.51024918354729 47.2843392116513, -1.51024927131683 47.2843391379286, -1.51025489412673 47.2843343915284, -1.51026059226811 47.2843295809033, -1.51026591343194 47.2843111587803, -1.51032816962226 47.2840956360005, -1.5106138645154 47.2831070824544, -1.51048381550052 47.2827863706322, -1.51046007779548 47.28272810306, -1.51045521617792 47.2827160406265, -1.51033826966721 47.282428063704, -1.5103056134027 47.2823473498282, -1.51020757423451 47.2821059335454, -1.51017391933835 47.2820229918146, -1.51008424648537 47.2818019881479, -1.51001850941337 47.2816402183192, -1.50998165807038 47.2815883324957, -1.50994699730446 47.2815395323785, -1.50992971057827 47.2815151941272, -1.50992966241584 47.2815151257357, -1.50982665890843 47.2813701303848, -1.50982653718336 47.2813699594577, -1.50981256811143 47.2813504143118, -1.50981247790259 47.2813502872001, -1.50978395912414 47.2813101564591, -1.50972274871048 47.2812240217021, -1.50972267661978 47.2812239209108, -1.50964178199582 47.2811098665578, -1.50962587680635 47.2810875014088, -1.50962570088181 47.2810872533163, -1.50961953730404 47.2810785748267, -1.50960089179988 47.2810522751168, -1.50960078509825 47.281052125225, -1.50958348343804 47.2810277631889, -1.50956826981689 47.2810063404216, -1.50954667485828 47.280975965677, -1.50954663583169 47.2809759113436, -1.50954654407628 47.2809757815893, -1.50951536070632 47.2809319177986, -1.50944289136792 47.2808297869437, -1.50935694325955 47.280708702532, -1.50935689819414 47.280708639425, -1.50931992488718 47.2806566581959, -1.50916863706612 47.2804461632028, -1.50915107545638 47.2804217130944, -1.50915103039146 47.2804216499873, -1.50913081149551 47.2803934945192, -1.50912119162594 47.2803801166087, -1.50908203698628 47.2803256673323, -1.50905801771268 47.2802921898184, -1.50890327855392 47.2800768742053, -1.50890323643318 47.2800768145869, -1.50889123872764 47.2800601059823, -1.50886004892532 47.2800166693864, -1.50875980337313 47.2798771091505, -1.50868864220697 47.2797780405733, -1.50860640201028 47.2796636788708, -1.50878417237233 47.2794066725988, -1.5089531110804 47.2791126195015, -1.50897019525514 47.2790245865503, -1.50901717796098 47.2787824942749, -1.50919210292655 47.278180771404, -1.50923623568255 47.278030555299, -1.50942149989276 47.2773999528099, -1.50954067564511 47.2769733258743, -1.50958507840998 47.2767925494418, -1.50959227944603 47.2766535369691, -1.50960430312011 47.2764214425735, -1.50960431870382 47.2764211419188, -1.50960432574425 47.2764210218054, -1.50960448754865 47.2764155371861, -1.50961395575045 47.2760953364821, -1.50963266355062 47.2754626522738, -1.50963266403804 47.2754625954897, -1.50963397859845 47.2749684773974, -1.50908367784767 47.2748931968414, -1.50850726032382 47.2748143434369, -1.5084510041439 47.2748066379698, -1.50753372269494 47.2746883454016, -1.50667873276853 47.2745770649485, -1.50627128403994 47.2745228442594, -1.50622180194141 47.2745159093205, -1.50622160904358 47.2745158826414, -1.50622095120682 47.2745157903883, -1.50621705376791 47.2745152439368, -1.50600198444318 47.2744851023064, -1.50570212488577 47.2744412607683, -1.50551598557208 47.2744115226143, -1.50530351460807 47.2743678588599, -1.50509383297388 47.2743227338905, -1.50478865039976 47.27423476707, -1.50457743911551 47.2741652832414, -1.50430067316997 47.2740642182032, -1.50358326719906 47.2737824569888, -1.50348311406968 47.2737402364187, -1.50338750511629 47.2736999317719, -1.50283607800827 47.2734818551651, -1.50283550565579 47.2734816306985, -1.50230440203327 47.2732734536754, -1.50224504309967 47.2732500276053, -1.50149241948548 47.2729529984483, -1.5008513130979 47.2726999735593, -1.49992814312057 47.2723356168372, -1.49946185095999 47.2721455486941, -1.49946128059224 47.272145316025, -1.49944257320798 47.2721376956195, -1.49943662447132 47.2721352730966, -1.49950025641407 47.2720586869932, -1.49963177101694 47.2719003962572, -1.50008951847783 47.2713532186397, -1.50039589093451 47.2709792840645, -1.5010161611675 47.2702266103018, -1.50122888643073 47.2699508587532, -1.50124390528723 47.2699307220395, -1.50124404440328 47.2699305354864, -1.50124481133116 47.2699295071209, -1.50141972672613 47.2696949734708, -1.50157662053319 47.2694431200523, -1.50187170915296 47.2688607666682, -1.50194325409381 47.2687127192848, -1.50210192080226 47.2683931200881, -1.50231636997023 47.2679611536771, -1.50253597479189 47.267518795924, -1.50262278441481 47.2673456691161, -1.50273270012642 47.2671264578051, -1.50273284501247 47.2671261674051, -1.50280057528358 47.2669909713611, -1.5029130509744 47.2667963603574, -1.50300519700483 47.2666712922743, -1.50314896306776 47.2665351909004, -1.50331262453655 47.2664167792734, -1.50352296782762 47.2662719252167, -1.50372464800246 47.2661330379501, -1.50391131710196 47.2660096702662, -1.50445589702381 47.2656420059656, -1.50488225626253 47.265354151786, -1.5054508915234 47.2649737053745, -1.50601271674462 47.2645942453623, -1.50652723981451 47.2642497441561, -1.50653211018519 47.2642464825079, -1.50659488443097 47.2642044509514, -1.50659534289241 47.264204143747, -1.50678826494461 47.264035356903, -1.5069606267424 47.2638845557676, -1.50721953586214 47.2635176432492, -1.50721970257522 47.2635174078502, -1.50736645404445 47.2633090465596, -1.50743370077921 47.2632135682019, -1.50746407819395 47.263147749549, -1.50746423710525 47.2631474063314, -1.50753658507246 47.2630357273158, -1.50760818076297 47.2629292082236, -1.50775541420409 47.2626958119834, -1.50784754442376 47.2625497646226, -1.50793714777102 47.2624120895499, -1.50806381109848 47.2622227680047, -1.50809333427155 47.2621738661943, -1.50810130699083 47.262160658826, -1.5081475486584 47.2620860796214, -1.50818713925283 47.2620222303521, -1.50804547711088 47.262004913262, -1.50785682901702 47.2619818536816, -1.50785452603592 47.261981572768, -1.50785308472981 47.2619812139128, -1.50756653393081 47.2619098800258, -1.50756572095227 47.2619096731311, -1.50721374742169 47.2618199691837, -1.50708211429824 47.2617864211373, -1.5070345164173 47.2617743979541, -1.50700374335036 47.2617666239132, -1.50695693397328 47.2617547995468, -1.50675508724048 47.2617038118811, -1.5066383711679 47.2616743287414, -1.50604980882401 47.2615256514654, -1.50604963842731 47.2615256085881, -1.50604124906494 47.2615234893448, -1.50609782251212 47.2614188404281, -1.50609813042954 47.2614182715192, -1.50638616271295 47.2608850116059, -1.50645221527831 47.2607626963961, -1.50655403108164 47.260574151484, -1.50659261723339 47.2605027067911, -1.50662268975108 47.2604470269644, -1.50665409364148 47.260394256626, -1.50666440596135 47.2603769128883, -1.50673232648545 47.2602629723077, -1.50671100334089 47.2602374125409, -1.50653864095189 47.2600308009369, -1.5064713359757 47.2599501841393, -1.5064674022205 47.2599455502695, -1.50646089882134 47.2599378887536, -1.50630837006885 47.2597575005563, -1.50625515485183 47.2596945663976, -1.50610445205082 47.2595163148229, -1.50604419786438 47.2594450444467, -1.50603911531049 47.2594390328675, -1.50621276500059 47.2593702343046, -1.50616214847807 47.2592568863322, -1.50631616914775 47.2591954346359, -1.50631574028743 47.2591948865009, -1.50631527891164 47.2591942981931, -1.50631482929721 47.2591937706945, -1.50621141142398 47.2590723345052, -1.50620133685788 47.2590605051385, -1.5060681557988 47.2589041195216, -1.50595952556071 47.2587765622224, -1.50589292521156 47.2586119385152, -1.50582631922499 47.2584472275993, -1.50582551787882 47.2584451388807, -1.50578573852616 47.2583414151863, -1.50578526430874 47.2583401741309, -1.50577655694383 47.2583173570988, -1.50577621392084 47.2583164623036, -1.50572661742202 47.2581869529096, -1.50570419349435 47.2581362027034, -1.50570408384715 47.2581359547121, -1.50563173368125 47.2579727132069, -1.50578770765396 47.2578794835446, -1.50591263867886 47.2578322717805, -1.50718155615764 47.2573534548134, -1.50718438921961 47.257352369702, -1.50718722096236 47.2573512846424, -1.50853894774853 47.2568101596185, -1.50854178075403 47.2568090744736, -1.50854448045668 47.2568079936565, -1.51007033393814 47.256188633568, -1.51007315927716 47.2561874585799, -1.51007570808554 47.2561861124331, -1.5117432980462 47.2552812711349, -1.51274373397379 47.2548120664479, -1.51334470444903 47.2544648045926, -1.51334724680388 47.2544633685158, -1.51334965718124 47.2544619367204, -1.51449786671923 47.2537967560293, -1.51450040901129 47.2537953199267, -1.5145028194035 47.253793889005, -1.51544424752994 47.2532279177719, -1.5154457668303 47.2532269660508, -1.51553576137058 47.2531706419039, -1.51559622397949 47.2531377309912, -1.51695320157624 47.2523489169729, -1.51716932139264 47.252187054614, -1.517171455032 47.2521854515961, -1.51717357483885 47.2521836698143, -1.51933098046367 47.2503006799283, -1.5193754992735 47.2502048575251, -1.51937653551812 47.2502027524826, -1.51937852328228 47.2502009758459, -1.52093650611187 47.2488138708223, -1.52120985001843 47.2486637841041, -1.52121242533728 47.2486623366238, -1.52121405595231 47.2486603757708, -1.52136426865239 47.2484881581634, -1.52143564745264 47.2484259763339, -1.52145670970552 47.2484072465766, -1.52147323226802 47.248392467205, -1.52161222015154 47.2483136950229, -1.52161463467155 47.248312270979, -1.52161663081353 47.2483105011758, -1.52272878745223 47.2473291193816, -1.52273078254379 47.2473274315924, -1.52273274622077 47.2473256387159, -1.52463042164303 47.2456420064649, -1.52463241661133 47.2456403186419, -1.52463453583264 47.2456385358218, -1.52552536489036 47.2448559678371, -1.52552735980095 47.2448542799983, -1.52552961083755 47.2448524919677, -1.52629286332195 47.2441844836076, -1.52629485615584 47.2441828030435, -1.52629697346533 47.2441810301745, -1.52712843590225 47.2434766797398, -1.52713043063425 47.2434749909746, -1.52713241150274 47.2434731234464, -1.52741508622156 47.2432045336065, -1.5274169414324 47.2432027602275, -1.52741906046382 47.2432009773549, -1.52824781933209 47.2424784380465, -1.52824981406764 47.2424767501595, -1.5282519330424 47.2424749672713, -1.52843608265071 47.2423164046116, -1.52843807597922 47.2423147158752, -1.5284400643901 47.2423129381284, -1.52919920815833 47.2416431606911, -1.52920120283246 47.2416414727872, -1.52920318987412 47.2416396950789, -1.52940437401571 47.2414615019084, -1.52940636735796 47.2414598140529, -1.5294084876487 47.241458031989, -1.5302874608628 47.2406909726925, -1.530289455467 47.2406892847694, -1.53029144243693 47.2406875070419, -1.53061826465169 47.2403988741173, -1.53103269315395 47.239833049672, -1.5310341396745 47.2398311094261, -1.53103558627129 47.2398291700782, -1.53243248411448 47.2379634221091, -1.53243379859834 47.2379614861482, -1.53243551020608 47.2379595372247, -1.53289303545885 47.2374141448835, -1.53289462009942 47.2374122901653, -1.53289633035412 47.2374103412868, -1.53333068780908 47.2369085960977, -1.53333227241942 47.2369067413733, -1.53333385210438 47.2369047976385, -1.53417104937487 47.2359247848839, -1.53417263392668 47.2359229301474, -1.53417421223344 47.2359209864527, -1.53471939454989 47.2352789735126, -1.53472097906346 47.2352771187683, -1.53472255725474 47.2352751741677, -1.53582243886421 47.2339788409975, -1.53586885856711 47.2338875755244, -1.53587986844742 47.233886214557, -1.53589655152208 47.2338572833672, -1.53599038988904 47.2338712446584, -1.53602017078444 47.2338497094216, -1.53604382609007 47.2338531482978, -1.53608671966474 47.2338629657827, -1.53615602143252 47.2338722568806, -1.53636286502385 47.2338992491663, -1.53687935607056 47.2339687052865, -1.53720590743594 47.2340138809722, -1.53753135673262 47.2340597786777, -1.53782393878176 47.2341010158572, -1.53805960973816 47.2341342570392, -1.53820696659136 47.2341549744289, -1.54099260121149 47.2345466122408, -1.54123481858591 47.2345807074415, -1.54124403742948 47.2345820190235, -1.54127142633793 47.2345858715344, -1.54132472508617 47.2345932655658, -1.54134649361386 47.2345962265072, -1.54138576501344 47.234601661019, -1.54146470485693 47.2346125161106, -1.54338954486683 47.2348786693205, -1.54343936873781 47.2348855492427, -1.54348945639841 47.2348924196129, -1.54351951561698 47.2348966318495, -1.54355291211841 47.2349012725606, -1.54363519514412 47.2349126445518, -1.54383303350366 47.2349401222095, -1.5455995409572 47.2351852673856, -1.54572230474941 47.2352023006908, -1.54577053217283 47.2352090526663, -1.54581194183915 47.2352147741396, -1.54586268975055 47.2352216218816, -1.54588070666433 47.2352238969389, -1.54593582056948 47.2352307782436, -1.54602683773096 47.2352422138603, -1.5468952691381 47.2353444668927, -1.5469698376294 47.2353551957419, -1.54709839081535 47.2354246315592, -1.54712054884935 47.2354365839754, -1.54717007176265 47.2354575227535, -1.54719529576625 47.2354552323024, -1.54741275005638 47.2354359290501, -1.54768836338017 47.2354034978905, -1.54785126586618 47.2352848857814, -1.54863721987703 47.2350307161217, -1.54871649629021 47.2353172038741, -1.54876488783931 47.2355031406465, -1.54876633642551 47.2355050620376, -1.54987189742889 47.2370143620592, -1.54985715287139 47.2379946108323, -1.54764685821579 47.2403796652229, -1.54678073233336 47.2422851115767, -1.54677982670783 47.2422872135525, -1.54677865851155 47.242289324116, -1.54595521870618 47.2436976852313, -1.54465755775772 47.2469103649475, -1.54465665197011 47.2469124669042, -1.54465438741146 47.2469140747514, -1.54173988851251 47.2489974557735, -1.54010146206061 47.2511092942998, -1.53990825653574 47.2515206365727, -1.53990721983349 47.2515227427495, -1.53990631378026 47.2515248446663, -1.53979174669513 47.2518002453457, -1.53979084063264 47.2518023472615, -1.53979020615937 47.2518045303569, -1.5394760870427 47.2529458690558, -1.53920012676564 47.254896947199, -1.5391904833416 47.2549743251297, -1.53917891604508 47.2550671330387, -1.53915264739589 47.2552778976537, -1.53915104331422 47.2552904946975, -1.53914982957601 47.255300030755, -1.53910221642035 47.2556739203227, -1.53909548822825 47.2556881524073, -1.53907563964491 47.2557223654603, -1.53906936620477 47.2557326149363, -1.53903482535331 47.2557776802502, -1.53903458450211 47.2557779600788, -1.5389063248312 47.255961073899, -1.53884593927746 47.256025901727, -1.53877455476359 47.2561076531824, -1.53842361210626 47.2565089650725, -1.53789672292071 47.2569516426565, -1.53728954198415 47.2575161559067, -1.53673369748568 47.2582656096361, -1.53646406785972 47.2585092623159, -1.53646401339471 47.2585093221329, -1.53635210945307 47.2586306377466, -1.53607783677066 47.2594229455985, -1.53630681344237 47.2599405748884, -1.53631793387587 47.2599854004351, -1.53643660098307 47.2604637403444, -1.53645376099534 47.2605240608161, -1.5364724933234 47.2605899129719, -1.53678462537994 47.2610534402862, -1.53682857979023 47.2611438381834, -1.53682877235229 47.2611442342552, -1.53682886848045 47.261144430495, -1.5368289103501 47.2611445180467, -1.53682904509772 47.2611447947581, -1.53684287537546 47.2611732366845, -1.53729609736011 47.2622209309707, -1.53774256878233 47.2648269035615, -1.53775229449145 47.2648820254273, -1.53775857488194 47.2649433185468, -1.537761921177 47.2649974388668, -1.53776628343082 47.2650679912352, -1.53776655469683 47.265139015953, -1.53776686610696 47.26522062736, -1.53776715363846 47.2652957431152, -1.53776553323481 47.2653448108511, -1.53776478418465 47.265367467664, -1.53776201268833 47.2654513786049, -1.53775941054678 47.26548349934, -1.53775652877023 47.265519081245, -1.53754125194942 47.266771710061, -1.53752297035125 47.2668780809632, -1.53749979321053 47.2669960406959, -1.5374671192734 47.2671252797901, -1.53742633912701 47.2672634916177, -1.53738878056111 47.2673835507129, -1.53733323820649 47.267524054424, -1.53726384684411 47.267686909242, -1.53719554090065 47.2678180816119, -1.53718221551152 47.2678436711884, -1.53716637243582 47.267874095156, -1.53713483636136 47.2679346542286, -1.53706856638422 47.2680440461027, -1.53700338824164 47.2681444708173, -1.53693478652017 47.2682404343263, -1.53686143196956 47.2683288417068, -1.53683413298694 47.2683591139975, -1.53674314022063 47.2684600175196, -1.53667770909631 47.268524862241, -1.53661386354879 47.2685821827409, -1.53642927966144 47.2687383030746, -1.53445588202097 47.2703487511028, -1.53212613341508 47.272254965317, -1.53211817241059 47.2722630479679, -1.53210822268638 47.2722731498685, -1.53199449242256 47.2723710734066, -1.53162982791724 47.2726891902688, -1.53136941592558 47.2729131824038, -1.5309811547255 47.2732527689276, -1.53086054459606 47.2733616847368, -1.53072267771183 47.2734834003982, -1.53072262720432 47.2734834447378, -1.53057350669755 47.273619790628, -1.53044040893548 47.2737577593564, -1.53033811152816 47.2738687461728, -1.53017300830975 47.2740498256067, -1.53001079580774 47.2742277345112, -1.52989646507524 47.2743746943561, -1.52987792727774 47.2743982869462, -1.52978510649544 47.274516415419, -1.52968370428111 47.2746454628517, -1.52967942747284 47.2746510601413, -1.52961439786217 47.2747361758319, -1.52952180856859 47.27485736658, -1.52938706541409 47.2750352257386, -1.52935131431163 47.2750858374671, -1.52933861724668 47.2751038107112, -1.52925035048142 47.2752256841926, -1.52913231334136 47.2753773862079, -1.52911154561361 47.2754040642571, -1.52908904238185 47.2754360844801, -1.52904635293221 47.2754968268228, -1.52895739967171 47.2756137722106, -1.52858980224531 47.2760971545693, -1.52836615702991 47.276398533647, -1.52836436934973 47.2764009431629, -1.52828417719054 47.2765090063503, -1.5281886303919 47.2766377602346, -1.52814832022475 47.2766920804145, -1.52805930615493 47.2768120313913, -1.52790488056215 47.2770234037659, -1.52783089078021 47.2771246780229, -1.52773253912274 47.2772684460346, -1.52770611444488 47.2773070744994, -1.52770596130185 47.2773072976812, -1.52770559037999 47.2773078402986, -1.52769838552116 47.2773207998857, -1.5276833142904 47.2773479083537, -1.52758348407552 47.2775441246907, -1.52747438021742 47.277744939151, -1.52735779802192 47.2779537635471, -1.52735729828783 47.2779546599384, -1.52735703635935 47.2779551297835, -1.52735690531876 47.277955363808, -1.52735653079087 47.277956035415, -1.52735631244074 47.2779564260545, -1.5272993377964 47.2780584796864, -1.52724112760283 47.2781627444286, -1.52720924645713 47.2782245074051, -1.5271264255113 47.2783849533509, -1.52707095398906 47.2785044657197, -1.52706237205576 47.2785229569066, -1.52692006985052 47.2788295445564, -1.52688245657554 47.2789493304526, -1.52684347873943 47.2791153998401, -1.52680287088126 47.2793152233487, -1.52677152834126 47.2795321649981, -1.52670311964193 47.2799080697919, -1.52665139585272 47.2802154709827, -1.52659445623931 47.2805004603646, -1.52656720642219 47.2806985882498, -1.52655364257813 47.281021056386, -1.52655331251991 47.2810289183551, -1.52654251555205 47.2812508194776, -1.52654252303199 47.2812510165113, -1.52655207971142 47.2814853311002, -1.52655392686081 47.2815306132324, -1.52655875821774 47.2816490713408, -1.52656260256159 47.2816771154138, -1.52658246514312 47.2818220392168, -1.52660300716011 47.2819502345593, -1.52661602485063 47.2820314718504, -1.52666515438823 47.2823290441919, -1.52669235465524 47.2825097964867, -1.52669764104791 47.2825449272476, -1.5267041043209 47.282587874171, -1.52671322639131 47.2826484840734, -1.52671323622865 47.2826485530664, -1.5267613546791 47.2829591401632, -1.52676144706773 47.2829595104587, -1.5267893180949 47.2830707642094, -1.52682897391504 47.2832290560617, -1.52684493137525 47.2832927496546, -1.52684497719392 47.2832928992259, -1.52684513349667 47.2832934138751, -1.52684578342197 47.2832955607022, -1.52688764943078 47.2834338831495, -1.52695615590775 47.2836653607676, -1.527000232172 47.283814286133, -1.52702978136297 47.2839111895628, -1.5270401293799 47.2839451254014, -1.52712710356235 47.2842303484064, -1.52723508219694 47.284551248368, -1.52723536373158 47.2845520833628, -1.52723568390952 47.2845528744873, -1.52731530163168 47.2847492460426, -1.52731562173554 47.2847500362688, -1.52735549085586 47.2848381509689, -1.5273731811583 47.2848772499338, -1.52756781665257 47.2853177654056, -1.52773036853887 47.2856803512389, -1.52776930523246 47.2857672014349, -1.52779077632374 47.2858181930168, -1.5278076346141 47.2858582293337, -1.52786698312198 47.2859239213262, -1.52789022802183 47.2859496769605, -1.52825662498105 47.2863653178309, -1.52825672450232 47.2863654292456, -1.52880938720512 47.2869885174247, -1.5288094604517 47.2869886001393, -1.52885921897715 47.2870443145702, -1.52891219609317 47.2871036325486, -1.52893448995426 47.2871285946956, -1.5289472088932 47.2871428366695, -1.52921951746569 47.2874477369975, -1.5292195642831 47.2874477892162, -1.52970206252893 47.287988028085, -1.53008433815581 47.2884200421991, -1.53011317635344 47.2884526313984, -1.53034492032152 47.2887156195494, -1.5306177153096 47.2890215467292, -1.53073945862776 47.289158073919, -1.53147864135756 47.2899917024318, -1.53150857885582 47.290026388901, -1.53201314186541 47.2906109906785, -1.53208468689044 47.2906938832048, -1.53212907813248 47.2907449747411, -1.53229595565772 47.2909370391666, -1.53242053254198 47.2910820284213, -1.53242310791929 47.2910850256199, -1.53252353307603 47.2912443821838, -1.53252799339504 47.2912514598095, -1.53263169947641 47.2914129152812, -1.53263654065168 47.291420452744, -1.53278401222002 47.2916515252522, -1.53310228137943 47.2921496031532, -1.53318455094648 47.2922774625033, -1.53331492704217 47.2924819066295, -1.53333390054483 47.2932739871384, -1.5333194652181 47.2934419699876, -1.53316773357849 47.2941408525617, -1.53315899075348 47.2941629654381, -1.53310856093328 47.2942905052264, -1.53304320450133 47.2944188666185, -1.53296653571337 47.2945528097222, -1.53286792933854 47.2946950959518, -1.53275396899348 47.2948577199775, -1.53269434309248 47.2949491828231, -1.53245955121131 47.2949794519122, -1.53240246850538 47.2949868110669, -1.53240233749948 47.2949868279427, -1.53239840343814 47.2949873352708, -1.53198830781879 47.2949581303473, -1.53142500956443 47.2949180128943, -1.53105574451639 47.2948914210964, -1.53090326156579 47.2948804404266, -1.53072460390357 47.2948675739158, -1.53052066980357 47.2948523733851, -1.5300460327217 47.2948169916277, -1.52970200037584 47.2947926968732, -1.52963252795959 47.294787248615, -1.52950773620096 47.2947774606567, -1.52918565024591 47.2947558141934, -1.52910696242078 47.294750783459, -1.5290289456946 47.2947457947257, -1.52895540607597 47.2947410927894, -1.52855325977226 47.2947108833916, -1.52827909679922 47.2946911130645, -1.52804487702766 47.2946742225945, -1.52779736650535 47.2946480145897, -1.52759353503789 47.2946292773304, -1.5272229447289 47.2945932259034, -1.52708884642103 47.2945784107456, -1.52703421068602 47.2945693017409, -1.52703330923959 47.2945691516061, -1.52703272752612 47.2945690546632, -1.52703159902999 47.2945688666107, -1.52703121479193 47.2945688024422, -1.52687927791343 47.2945434712026, -1.52662844414724 47.2945016512759, -1.52634342861537 47.2944502445536, -1.52613928855718 47.2944247600249, -1.52596432368084 47.294412092324, -1.52578154477964 47.2944042370142, -1.52561780404543 47.2944177077772, -1.52544927108542 47.2944465042916, -1.52532464497587 47.2944963693751, -1.52530760814157 47.2945031667192, -1.5252697576801 47.2945190724803, -1.52513588532705 47.2945520912961, -1.52500039960157 47.2945848130053, -1.52484151930031 47.2946321506443, -1.52469052990912 47.2946944051759, -1.52450026991937 47.2947979399983, -1.5243627324015 47.2948673237366, -1.52430574239508 47.2948921138662, -1.52420946809445 47.2949339920466, -1.52412059697192 47.2949791254362, -1.52408209179037 47.2949986805005, -1.52406600303318 47.2950068504803, -1.52393831863122 47.2950854043208, -1.52392377649001 47.2950943505122, -1.52374639152143 47.2951982804181, -1.52352259871876 47.2953747610806, -1.52330306757921 47.2955407171397, -1.52315292361221 47.2956132521861, -1.52315281926165 47.2956133022424, -1.52293952895758 47.2956626928476, -1.52272647197198 47.2957120279147, -1.52272314555382 47.2957127984445, -1.52272301957121 47.295712827726, -1.5226435395584 47.2957380759736, -1.52254659384894 47.2957688710725, -1.52239954174254 47.2957668137991, -1.52223314702394 47.2957585599091, -1.52216040576505 47.2957549512128, -1.52193691286245 47.2957589621076, -1.5217982885778 47.2957844147371, -1.52166563158546 47.2957937689908, -1.5216654472391 47.2957937816438, -1.52155450877887 47.2957975119181, -1.52138499035765 47.2958131858421, -1.52120836053505 47.2958340947295, -1.52120053192765 47.2958348917067, -1.52113544454734 47.29584151281, -1.52098750220324 47.2958565615261, -1.52088324115998 47.2958500263071, -1.52077853895932 47.2958289377023))
-Nantes;Dervallières - Zola;3;440109.0;POLYGON ((-1.59460425528411 47.2266725203502, -1.5944842894967 47.2266673588976, -1.59387828864814 47.2267630197059, -1.59387514890523 47.2267634867878, -1.59387201048055 47.2267639538169, -1.59333999445676 47.2268456008879, -1.59288065257044 47.2268636101464, -1.59276959224846 47.2268781060265, -1.59261629760373 47.226936910539, -1.59242393225942 47.2269661105707, -1.59202083405579 47.227083567476, -1.59188622679585 47.2271358325556, -1.59172841688859 47.2271817350697, -1.59136676854564 47.2273133676535, -1.5910272684369 47.2274142929159, -1.59091801300676 47.2274298880329, -1.59081441017524 47.2274251049996, -1.59067546581773 47.2273543511179, -1.5906091403516 47.2273373938457, -1.59042415981799 47.2273530212472, -1.59032390731847 47.227335820142, -1.59019721218231 47.2272967156472, -1.59013291357715 47.2272560719846, -1.59001506030727 47.2271008311669, -1.5899853114036 47.2269858108377, -1.59000348369077 47.2268832211224, -1.59003032430526 47.2264052530135, -1.59000191716755 47.2262514913724, -1.58996370443898 47.2262003320655, -1.58989941649962 47.2261662929354, -1.58947001622014 47.2259757869691, -1.58929449518875 47.2259219810564, -1.58906304457497 47.2259018314711, -1.58888925617198 47.2258769638358, -1.58874446585816 47.2258180321999, -1.58844486882583 47.2257751125955, -1.58831182925188 47.2257549204389, -1.58814394170551 47.225771766517, -1.58802800258785 47.2257694896081, -1.5877846407742 47.2257023282185, -1.58778169432216 47.225701536694, -1.58777882157552 47.2257006025557, -1.58768724144898 47.2256701240116, -1.58750447123228 47.2255836771728, -1.58707655563201 47.2254495363615, -1.5868839389797 47.2252890675788, -1.58662757533613 47.2247799386066, -1.58637739447215 47.2244315068847, -1.58606403317396 47.2241301681326, -1.5850177797292 47.2233714356289, -1.58493403298576 47.2233481683465, -1.58483358365264 47.2233001604573, -1.58476826426103 47.2232692416179, -1.58464366840454 47.2232665771689, -1.58461196899134 47.2232399896104, -1.5845338795981 47.2230796822526, -1.58444015633566 47.2229734355168, -1.58433390893966 47.2228893220405, -1.58398940759793 47.2227184677711, -1.58376314291953 47.2226726605994, -1.5824784801389 47.2226075578973, -1.58227807726002 47.2225771087644, -1.58212633751823 47.2224674898615, -1.58212398140707 47.2224658537563, -1.5821220220136 47.2224641243307, -1.58197702351523 47.2223298554687, -1.58197448305133 47.222289249063, -1.58204256050802 47.2222273666837, -1.58206084949775 47.2221898238595, -1.58208248504081 47.2221429275495, -1.58207338338501 47.2221151008624, -1.5820471931784 47.2220810913593, -1.58201039751486 47.222034443592, -1.582003592412 47.2220138998269, -1.58200608708477 47.2219998360789, -1.58203267155562 47.221959213096, -1.5820817458868 47.2219000549346, -1.58209992092811 47.2218755914944, -1.58210419517939 47.2218488243329, -1.58208458241381 47.2218160275334, -1.58203932673965 47.2217684206019, -1.58200273804114 47.2217238704343, -1.58196050659321 47.2216918425676, -1.58192783867977 47.2216808746765, -1.58183206796288 47.2216821693407, -1.58171119605882 47.2217068429387, -1.58167434601122 47.2217089877953, -1.58153091448674 47.2216902886267, -1.5813262108049 47.2216618901181, -1.5811556986477 47.2216073799363, -1.58024248479995 47.2214575920983, -1.58000042320027 47.2215586359708, -1.57998946853497 47.2216011834834, -1.57992481282093 47.221649335194, -1.57976597835084 47.2216372375882, -1.57948328318979 47.2215596444549, -1.57933887482141 47.2215672041878, -1.57910721457434 47.2215800084024, -1.57901037709085 47.2216108566684, -1.57892956661176 47.2215699518614, -1.57885120911306 47.2214277738766, -1.57876303609084 47.2212871441414, -1.57860230045477 47.2211428596296, -1.57860142490275 47.2210908385415, -1.5786492838637 47.2210314789968, -1.57876177071557 47.2209460948959, -1.57886446940098 47.2208251347509, -1.57889743063188 47.220690391726, -1.57887852574082 47.2205603701015, -1.57883243558747 47.2204916818622, -1.57867840833752 47.2203936488829, -1.57853114015105 47.2203063179577, -1.57827281242031 47.2202157996474, -1.57807752940829 47.2200644141809, -1.57802191320347 47.2200417690174, -1.57757617196042 47.2198946805269, -1.57736227899697 47.2197885504016, -1.57702911523342 47.2196143811579, -1.57689517417731 47.2195521721391, -1.57679766238367 47.2195348642684, -1.57669814732215 47.2194904764064, -1.57654941252891 47.2194500384161, -1.57635881316952 47.219473995864, -1.57631452515994 47.2194515518434, -1.57632033245255 47.2194031842695, -1.57635894241869 47.2193340903034, -1.5763614458534 47.219286770774, -1.57633204329736 47.2192529196806, -1.57627980886038 47.2192175579796, -1.57624291765321 47.2191193755248, -1.57603993746169 47.2190492799192, -1.57593476626084 47.2191209409872, -1.57579628626757 47.2190193475073, -1.57565003001874 47.2191417076198, -1.57558671903672 47.2191262504204, -1.57541556334587 47.2189341111843, -1.57534134480499 47.2189458480157, -1.57526196285308 47.2189980547284, -1.57520139659449 47.2189826907346, -1.57507092682798 47.2189147898438, -1.57500881385726 47.2189203619806, -1.57495924171046 47.2189725578627, -1.57499275022574 47.2190817947675, -1.5748961404636 47.219076120306, -1.57465256093037 47.2188828775254, -1.57464385207038 47.2187850832824, -1.57473019664641 47.2186502969745, -1.57470465222506 47.2186173100701, -1.57448683334499 47.2185686594981, -1.5744720957436 47.2183904408571, -1.57431460411164 47.2183614269094, -1.57416321079723 47.2183045091797, -1.57415862689466 47.2183032463958, -1.57415442243702 47.2183009646876, -1.57404204000212 47.2182387617302, -1.5738739434241 47.2181155400125, -1.57380339321335 47.2180150002331, -1.57373709982436 47.2179610402339, -1.57359620245883 47.2179035173142, -1.57356104285041 47.2178686189181, -1.57357907847714 47.2177535923257, -1.57351911245438 47.2176168388156, -1.57370450355059 47.2173841147655, -1.57375323244556 47.2170530302092, -1.5737813350383 47.2169681026548, -1.57386415492654 47.216888559715, -1.57393524581784 47.2168558123674, -1.57406861559909 47.2168332214761, -1.57435786458157 47.2166839653474, -1.57443228732808 47.2163320797849, -1.57449550063844 47.2162257970895, -1.57450494852786 47.2161524406961, -1.57410453989685 47.2159091609257, -1.57393009887803 47.2158093907138, -1.57357173983304 47.2155304599448, -1.57343260849023 47.2152990179882, -1.5731530471869 47.2152498920182, -1.57302978760262 47.2151661862741, -1.57298678482606 47.2150306899427, -1.57308143774857 47.2148728357915, -1.5730784538369 47.2148363659314, -1.5729836588692 47.2147423590439, -1.5729814977376 47.2147407222178, -1.57298240940809 47.214740512006, -1.57289385609623 47.2145508502285, -1.57290500806921 47.2145319104432, -1.57291190374471 47.2145142899243, -1.57294268811916 47.21446689058, -1.57285565143007 47.2144785660596, -1.57282812538942 47.214476173979, -1.5727903553772 47.2144728705891, -1.57224863531306 47.2144228892942, -1.57224743444274 47.214422749678, -1.57225131129609 47.2143853299526, -1.57225159595271 47.2143819872989, -1.57224280555614 47.2143322070655, -1.57169863351322 47.2128286723198, -1.57170106597219 47.2128275987066, -1.57171279723172 47.2128217071464, -1.57171406978443 47.2128210329344, -1.57172700215133 47.2128134797095, -1.57173893727098 47.2128049686791, -1.57175036058425 47.2127948533613, -1.57175932965561 47.2127855421977, -1.57177031198879 47.2127712093212, -1.57177508207285 47.2127623113141, -1.57178053874654 47.2127501465637, -1.57178397799488 47.2127375106611, -1.57178592076133 47.2127242945611, -1.57178565540247 47.2127098021201, -1.57178185727257 47.2126921874806, -1.57174938668163 47.2126023189022, -1.57174212642141 47.212587973368, -1.57173344108553 47.2125758390658, -1.57171838868257 47.2125597762861, -1.57170968205918 47.2125527763259, -1.57169837171516 47.2125445130679, -1.57168261809783 47.2125351399396, -1.57166674502415 47.2125277512541, -1.57165178207193 47.2125219546008, -1.57163663958831 47.2125173338031, -1.57161915054024 47.2125131533362, -1.5716119254075 47.2125119568684, -1.57160241912428 47.212510297942, -1.57158577198948 47.2125086106041, -1.57158364947551 47.2125085022654, -1.57139320037287 47.2120020159116, -1.57138059359788 47.2119687576072, -1.57138040936227 47.21196804317, -1.57136940379222 47.2119368026375, -1.5711914579332 47.211431333048, -1.57100854677591 47.2109211679932, -1.57098273719154 47.2108500776979, -1.57062530070128 47.2098738664592, -1.57060516787924 47.2098189769783, -1.57059664955069 47.209821787707, -1.57057956053587 47.2098266903762, -1.57057280255501 47.2098282704375, -1.57056123115977 47.2098309143325, -1.5705441296969 47.2098338360005, -1.57054072702069 47.2098343111417, -1.57052527318332 47.2098362760536, -1.57050701856496 47.2098378856743, -1.57050662305432 47.2098378996139, -1.57048750444951 47.2098385470165, -1.57046884056172 47.2098381896271, -1.57045065293493 47.2098370942115, -1.57043201612732 47.2098352939987, -1.57041342561618 47.2098323214278, -1.57039570710998 47.209828599586, -1.57037860047409 47.2098242253312, -1.5703612904886 47.2098188670702, -1.57034485757144 47.2098128494462, -1.57032888692086 47.2098059150379, -1.57031432709141 47.2097983928363, -1.57030012318346 47.2097903176174, -1.57028636108797 47.209781056103, -1.57027431444921 47.2097717371264, -1.5702630180015 47.2097618521451, -1.57025272534711 47.2097512126507, -1.57024358484964 47.2097400839661, -1.57023635032116 47.2097297012172, -1.57023515758615 47.2097278500958, -1.57022865542835 47.209716631726, -1.5702232939853 47.2097047444045, -1.57021909231655 47.2096924567981, -1.57021619005737 47.2096798552604, -1.57021461272303 47.209667299211, -1.57021434117535 47.2096545190853, -1.57021540723164 47.2096419632596, -1.57021778537482 47.2096292723144, -1.57022163313612 47.2096168031183, -1.57022656885035 47.2096047465728, -1.57023283718086 47.2095928253176, -1.57023817280504 47.209584447313, -1.57024187331057 47.2095790079514, -1.57024211789718 47.2095787296931, -1.57024912937195 47.2095697551515, -1.57025867190893 47.2095592543552, -1.57026942787903 47.2095490720069, -1.57027615459083 47.2095434401162, -1.56984701510913 47.2094118033589, -1.56939512303226 47.2092726506944, -1.56929303914132 47.2092412531884, -1.56926926277928 47.2092342228505, -1.56873576035433 47.2090761266722, -1.56839583220442 47.2089877575993, -1.56810335778526 47.2089121019237, -1.56807325874699 47.2088618716061, -1.56806633482598 47.2088503076753, -1.5680272031485 47.2087849821461, -1.56799454894952 47.2087305156294, -1.56798887001618 47.2087215216261, -1.56790803829125 47.2087422731112, -1.56781590455658 47.2087693527971, -1.56765928011923 47.2088183421783, -1.56763201748956 47.208826921831, -1.56740238738633 47.2088952262201, -1.56675953348695 47.2090898426883, -1.56651289045404 47.2088269981902, -1.56653236404945 47.2088130985795, -1.5660780843348 47.2083346339063, -1.56606051433375 47.2083383809204, -1.5672411808612 47.2078937153647, -1.56757319037793 47.207768531584, -1.56929822131414 47.2071187791599, -1.56930104912896 47.2071176925586, -1.56930345586724 47.2071162595749, -1.57102211257743 47.2060846220816, -1.57244451825921 47.2071180274036, -1.57259466125682 47.2070057524974, -1.57259679018472 47.2070041493848, -1.5725999621829 47.2070041321029, -1.57353929251031 47.2069912710987, -1.57354299053359 47.2069912355427, -1.5738992522681 47.2069287088929, -1.57573366767909 47.206607114754, -1.57573679349547 47.206606559471, -1.57573992569971 47.2066060940427, -1.57617215403922 47.2065418088463, -1.57654857571321 47.2065195790245, -1.57696560924381 47.206530498729, -1.5774289342705 47.2065922936069, -1.57780538787735 47.2066687343776, -1.57780847560665 47.206669352878, -1.57781156848673 47.2066700621833, -1.57909860446635 47.20695595619, -1.57910169443622 47.2069566619736, -1.57910478308828 47.2069573678097, -1.58230941757787 47.2076718574345, -1.58231250894934 47.2076725630791, -1.58231284470178 47.2076730849316, -1.58610991817458 47.2085046173932, -1.58611300693171 47.2085053221428, -1.5861145878517 47.2085056996405, -1.58718130024706 47.2088067296075, -1.58718426629749 47.2088075293411, -1.58718712110685 47.2088086038482, -1.58849496396112 47.2093141527764, -1.58849781874668 47.2093152263528, -1.58850066588216 47.2093162110258, -1.58936288753933 47.2095993870539, -1.59034028262248 47.2098452169708, -1.59130785570004 47.2099534757211, -1.59227926903431 47.2099825147237, -1.59306342311854 47.209927498978, -1.59391995415732 47.2098374940887, -1.59624297087996 47.209584863198, -1.59624611601457 47.2095844859029, -1.59624929968602 47.2095846477281, -1.59669645965681 47.2096115409756, -1.59669951147143 47.2096117071655, -1.59670268229875 47.2096116892714, -1.59802492506645 47.2095942982994, -1.59823412623568 47.2096063413547, -1.5982373112323 47.209606503072, -1.59824050133735 47.2096067546953, -1.59897884322795 47.2096604461911, -1.59898203465746 47.209660697741, -1.59898522476925 47.2096609493437, -1.59975429619588 47.2097154786511, -1.60027547823575 47.2097818928381, -1.60027855067791 47.2097823284397, -1.60028174855053 47.2097826698067, -1.60353162015518 47.2101213345298, -1.60353481806892 47.2101216758063, -1.60353801466485 47.2101220171356, -1.60788695446229 47.2105941172999, -1.60804322752213 47.2106214642645, -1.60888900144541 47.2107891395624, -1.60888782218813 47.2107910711197, -1.6088858982654 47.210793658838, -1.60888410620422 47.210796242165, -1.6088824460047 47.2107988211008, -1.60888078448706 47.2108014000895, -1.60887912428723 47.2108039790253, -1.60887746408713 47.210806557961, -1.60887330582427 47.2108129155005, -1.60887177096368 47.2108153992943, -1.60887023618056 47.2108178839861, -1.60886858242379 47.2108205527743, -1.60886704632251 47.210823037519, -1.60886385770409 47.2108281901009, -1.60886232292024 47.2108306747925, -1.60886053730085 47.2108333479718, -1.60884817689918 47.2108557483121, -1.60882633551478 47.2108965775601, -1.60880552958384 47.2109371012186, -1.60878101379133 47.2109846880039, -1.60881318053782 47.2110050237213, -1.6088474749656 47.211025556986, -1.60886871373218 47.2110375292099, -1.60889628346813 47.2110528887331, -1.60892043211157 47.2110720575929, -1.60894669139533 47.2110929556768, -1.60915945587536 47.2111496223909, -1.60939285569961 47.2111771753934, -1.60939285988979 47.2111772085664, -1.60939912634119 47.2112344147223, -1.60942265365371 47.2114500150804, -1.60942267251236 47.2114501873371, -1.60917872809682 47.2117796036964, -1.60917867786991 47.2117796651858, -1.60913112807918 47.2118378342283, -1.60909435316627 47.2118923285784, -1.60904450184144 47.2119661981274, -1.60877614078098 47.2123376007609, -1.60875618171738 47.2123652549367, -1.60874932974363 47.2123747212755, -1.6087194492309 47.2124161100863, -1.60856590683814 47.2126287169116, -1.60786027351782 47.2136053627221, -1.60786024840275 47.2136053934665, -1.6077379444943 47.21375310262, -1.60761215165727 47.2139050255185, -1.6076120139863 47.2139051770222, -1.6076115260914 47.2139057138355, -1.60747627281089 47.2140546072155, -1.6074752143818 47.2140557729156, -1.60747386788246 47.214057094351, -1.60742032545658 47.2141124945653, -1.6072842605473 47.2142532777911, -1.60721918323899 47.2143206118021, -1.607172437681 47.214359319152, -1.60717240434717 47.2143593466215, -1.60717235744731 47.2143593854486, -1.60715783381818 47.214371323904, -1.60715667310282 47.2143722778879, -1.60715607417886 47.2143727695919, -1.60715534571815 47.2143733692193, -1.60715338855629 47.2143749778224, -1.60715326630639 47.2143750782445, -1.60644517097338 47.2149599350472, -1.60644508329567 47.2149600070484, -1.60640932668664 47.2149896135891, -1.60640855285878 47.2149902546795, -1.60638588144696 47.2150090267519, -1.60638584074769 47.2150090608243, -1.606202282713 47.2151606910067, -1.60620219394941 47.2151607657546, -1.60619692030994 47.2151652269088, -1.60619627206468 47.215165775553, -1.60619624369131 47.2151657992187, -1.60604595817693 47.2152939335876, -1.60603886504383 47.2152999446276, -1.60603880697883 47.2152999920119, -1.60603676269387 47.215301725737, -1.60582907837891 47.2154777111703, -1.6057492899151 47.2155523240265, -1.60572910844937 47.2155711965873, -1.60570945199129 47.2155901913654, -1.60561199851852 47.2156887530677, -1.60560073829364 47.2157001414057, -1.60560071759483 47.2157001620602, -1.60541750630979 47.2159048522298, -1.60537761268914 47.2159528591467, -1.60521204906208 47.2161685123928, -1.60521201456398 47.2161685570295, -1.60504712757201 47.2164276514495, -1.60504280426051 47.2164343209001, -1.60504275604054 47.2164343904168, -1.60503725345276 47.2164423587938, -1.60502119268466 47.2164656206297, -1.60502117500916 47.2164656456684, -1.60498180887206 47.2165412052004, -1.60498178639044 47.2165412511573, -1.60496950330127 47.2165661880584, -1.60489856171539 47.2167102165342, -1.60489854148184 47.2167102578954, -1.60484448277292 47.2168185562413, -1.604844420754 47.2168186803777, -1.60484433741622 47.2168188486221, -1.60480023960603 47.21690718988, -1.60480022611693 47.2169072174541, -1.6047285732336 47.2170471246897, -1.60472846454442 47.2170473363026, -1.60472825631395 47.2170477429416, -1.60471409074149 47.2170754027375, -1.60466761234398 47.2171661534169, -1.60466758970681 47.2171661975777, -1.60459071640692 47.2173202748734, -1.60459070059177 47.2173203061452, -1.6045906870249 47.2173203328213, -1.60455308400863 47.2173936876273, -1.60448663280822 47.2175233189101, -1.60448657350097 47.2175234361792, -1.60416420962729 47.2181185650724, -1.60410968643231 47.2182239380697, -1.60410967239988 47.2182239746766, -1.60406480309819 47.2183428917685, -1.60401403353146 47.2185114765408, -1.60394254902406 47.218748842858, -1.60376137967586 47.219350408213, -1.60374513687181 47.2194043165581, -1.60366884851761 47.2196573399228, -1.60364065992498 47.2197518182411, -1.6036270070474 47.2197975758529, -1.603596739369 47.2198990183431, -1.60356679548531 47.2199918665936, -1.60356678525124 47.2199919012459, -1.60348447301764 47.2202669401899, -1.60348445968224 47.2202669848787, -1.60343774044696 47.2204226196677, -1.60350133865971 47.2204469362179, -1.60354278459746 47.2204649885412, -1.60355838887858 47.2204717855208, -1.60356287752828 47.2204737412334, -1.60356290908499 47.2204737543863, -1.60362178605383 47.2205029395593, -1.60363552146162 47.2205095834573, -1.60364864403575 47.2205159311231, -1.60368180780528 47.2205319711366, -1.6036818849528 47.2205320144513, -1.60373838697648 47.2205640224155, -1.60373841752537 47.2205640392131, -1.603791546243 47.2205986820377, -1.60384091177144 47.2206358942559, -1.60388521577314 47.2206725956653, -1.60388524027453 47.2206726190131, -1.60390127730428 47.2206878717178, -1.60392584890854 47.2207112432659, -1.60396228688198 47.2207517774286, -1.60396230471552 47.2207518001425, -1.60399449898016 47.2207940033972, -1.60402184942441 47.2208349166861, -1.60403864366373 47.2208646026995, -1.60404556276181 47.2208768349709, -1.60406541452086 47.220919762746, -1.6040756011418 47.2209474081414, -1.60408147628961 47.2209633497664, -1.60409316474364 47.2210067764303, -1.60409778931398 47.2210287213523, -1.60410234351745 47.2210503338829, -1.60410235251249 47.2210503767755, -1.60410505286422 47.2210691620526, -1.60410864900658 47.2210941844816, -1.60411258138185 47.2211381851757, -1.6041125788239 47.221138216817, -1.60411079350129 47.2211664299726, -1.60411079094333 47.2211664616139, -1.60410521688431 47.2211999359234, -1.60410498431986 47.2212018375717, -1.60410105791082 47.2212259653265, -1.60410100759697 47.2212262710167, -1.6041008356464 47.2212273276997, -1.60410059476163 47.2212281528581, -1.60408726126809 47.2212738256175, -1.60408724366844 47.2212738668729, -1.60408396833746 47.2212813205658, -1.6040592999376 47.2213374734063, -1.60395231511888 47.2214498956537, -1.60395052283522 47.2214517787218, -1.60391382886304 47.2214877962171, -1.60391362393922 47.2214879963671, -1.60391357765114 47.2214880423768, -1.60385043877775 47.2215533821878, -1.60381135585868 47.2215847735984, -1.60378133360746 47.2216062523353, -1.60376975046213 47.2216145557993, -1.60372799168382 47.2216412758608, -1.60372791647449 47.2216413239307, -1.60372774481104 47.2216414344387, -1.6037258809368 47.2216426265195, -1.60369106747391 47.2216622242741, -1.60365495135872 47.2216805225686, -1.60365492460891 47.221680534454, -1.60365035767548 47.2216826206413, -1.60364296580373 47.2216859969015, -1.60362859439269 47.2216925616833, -1.60361754034743 47.2216976112014, -1.60361750080416 47.2216976281051, -1.6035616369848 47.2217211179809, -1.60350365557067 47.2217420046984, -1.60350360400917 47.2217420202816, -1.60349147775477 47.2217456971216, -1.60344372660394 47.2217601742078, -1.60344366193876 47.2217601912172, -1.60338208665437 47.2217755323208, -1.60338205160798 47.2217755400331, -1.603379519042 47.2217760803748, -1.60337855666223 47.2217762856507, -1.60337178643075 47.2217777320375, -1.6033177032645 47.2217892801389, -1.60331766953624 47.2217892877984, -1.60328729212975 47.221794380031, -1.60325228626455 47.2218003714305, -1.60325221842028 47.2218003822595, -1.60321691231799 47.2218048727223, -1.60321520496723 47.2218050898312, -1.60319281851211 47.2218079379178, -1.60318603683198 47.2218087999337, -1.60311914513477 47.2218147229289, -1.60311908341582 47.2218147281057, -1.60311894509086 47.2218147345504, -1.60305176629333 47.2218178764821, -1.60305170651271 47.2218178734712, -1.60278309699182 47.2218048568564, -1.60278306380617 47.2218048554829, -1.60274503373597 47.222030743282, -1.60274317619033 47.2220417138991, -1.60274316510233 47.2220417769703, -1.60274315610789 47.2220418336499, -1.6027409159875 47.222055060199, -1.60265956021111 47.2225375381659, -1.60263615127638 47.2226938246737, -1.60262638894112 47.2228182044785, -1.60262943617902 47.2229745319773, -1.6026446395457 47.2230862834859, -1.60265350885809 47.2231599007844, -1.60267294756485 47.223262482324, -1.60269399101547 47.2233454113107, -1.60269399892427 47.2233454416314, -1.60273590350532 47.2234860534027, -1.60273645859954 47.2234879171741, -1.60278089838575 47.2236150017622, -1.60280969360922 47.2237018787295, -1.60280970407699 47.2237019080465, -1.60286243993294 47.2238516825279, -1.60289993080517 47.2239627066883, -1.60289994135047 47.2239627369033, -1.60292349787008 47.2240364045078, -1.60292350880321 47.2240364392128, -1.60295368411984 47.2241347670731, -1.60295369489783 47.2241347999821, -1.60296363234613 47.224165709786, -1.60297013578686 47.224185940324, -1.60298894936166 47.2242444602575, -1.60298895851143 47.2242445049461, -1.60299426863931 47.2242708297257, -1.60300047967758 47.2243013991069, -1.60300403875291 47.2243181067158, -1.60300541898897 47.2243325592133, -1.60301057515114 47.2243892083284, -1.60300702593202 47.2244782514348, -1.60300702430375 47.2244782938521, -1.60299985192944 47.2245484169966, -1.60299701397147 47.2245630385313, -1.6029969919502 47.224563151151, -1.60297174828164 47.2246902153201, -1.60296457761665 47.2247137444481, -1.60294217122993 47.2247872633719, -1.60290475503901 47.2248729710894, -1.60290473301733 47.2248730224338, -1.60288035987053 47.2249172170635, -1.60284995025672 47.2249723569143, -1.60279133679199 47.2250579678298, -1.60274083401634 47.2251256821421, -1.60271937825738 47.2251514124085, -1.60270317980561 47.2251706242674, -1.60270315227829 47.2251706578102, -1.60269349337375 47.2251821924254, -1.60266471684777 47.2252165566592, -1.60266468807971 47.2252165911529, -1.60262152585274 47.2252621166466, -1.6025470957588 47.2253345720004, -1.60254706985979 47.2253345937636, -1.60253844695594 47.2253417507312, -1.60251402062951 47.2253620257387, -1.60249319363616 47.2253791918833, -1.60247758703944 47.2253920542277, -1.60225455204372 47.2255651927677, -1.60225434624561 47.225565352399, -1.60225408469431 47.2255655557149, -1.6022536223076 47.2255659148588, -1.60225306942858 47.2255663443102, -1.60224880357531 47.2255696546777, -1.60224708786664 47.2255709867692, -1.60224633298899 47.2255715738974, -1.60224477469178 47.2255727834395, -1.60224415357513 47.2255732651856, -1.60223622080542 47.2255794230844, -1.60223593542251 47.2255796465787, -1.6022358962118 47.2255796775858, -1.60210390171669 47.2256831252034, -1.60203864212282 47.2257329000391, -1.60199853618684 47.2257634899906, -1.60168201103966 47.2260118998051, -1.60155387568437 47.2261105743829, -1.60153383795808 47.2261255510134, -1.60151948204207 47.2261362806527, -1.60150864027101 47.2261443842691, -1.60148203839377 47.2261642667863, -1.60147106114141 47.226172471343, -1.6014273907025 47.2262051114943, -1.60142411608035 47.2262074936301, -1.60139041472724 47.226232011501, -1.60135880665848 47.226254989323, -1.60135876059709 47.2262550227067, -1.60129942327986 47.2262981029618, -1.60124044080184 47.2263405291841, -1.60124039598094 47.226340561617, -1.6011806089216 47.2263835061791, -1.60115614582826 47.2264010754084, -1.60115607107489 47.2264011288646, -1.60115591288323 47.2264012424325, -1.60115587798808 47.226401267259, -1.60115579959009 47.2264013244655, -1.60113123551692 47.2264189653164, -1.60112097073014 47.2264263375114, -1.60112094583823 47.2264263556295, -1.60106190979968 47.2264689154541, -1.60100110759126 47.2265122551565, -1.60092746900209 47.2265647609224, -1.60086711672829 47.2266067412289, -1.60084347807008 47.2266231825196, -1.60084002271916 47.2266255862929, -1.60080773011232 47.226648048445, -1.60076867262742 47.226675214969, -1.60074855301061 47.2266892093659, -1.60069305590973 47.2267278115076, -1.6006419388329 47.2267633672762, -1.60063537239844 47.2267679339426, -1.60062790759297 47.2267731268124, -1.600579190092 47.2268070131162, -1.60056141513686 47.2268193762873, -1.60055692777708 47.2268224981126, -1.60052573678542 47.2268441933694, -1.60051809592884 47.2268495077222, -1.60051109521461 47.2268543765222, -1.60050155641167 47.2268610122121, -1.60046577928822 47.2268858963062, -1.60045510612667 47.226893320833, -1.60044454897149 47.2269006641189, -1.6004304764823 47.2269104523129, -1.60043025679352 47.2269106043868, -1.60041668098369 47.2269200473887, -1.60040468874416 47.2269283888968, -1.60039258793589 47.2269368059386, -1.60038952306826 47.2269389372436, -1.60036435807842 47.2269564415779, -1.6003469461741 47.2269685522804, -1.60031981255676 47.2269874713306, -1.60031966847516 47.2269875721673, -1.60031963226096 47.2269875970463, -1.600319572395 47.2269876390924, -1.60031228945178 47.2269927174244, -1.60031032294759 47.2269940874609, -1.60028354803504 47.2270127564972, -1.6000783839243 47.2271558057349, -1.60007786366098 47.2271561689887, -1.60006178535755 47.2271673791995, -1.60005554793314 47.2271717281024, -1.59999065699213 47.2272169723172, -1.59995211443846 47.2272438457729, -1.59995201711659 47.2272439136485, -1.59994114304095 47.2272514948489, -1.59994010375127 47.2272522204045, -1.59993991275222 47.2272523524053, -1.59993724644147 47.2272542127242, -1.5999091710305 47.2272737870847, -1.59989264350136 47.2272853108197, -1.59988266159251 47.2272922705704, -1.59984955284143 47.227315355322, -1.59981203330887 47.2273415155357, -1.59979959583301 47.2273501874839, -1.59979235761347 47.2273552333501, -1.59979231085226 47.2273552663107, -1.59979228278 47.2273552859074, -1.59972992557645 47.227398763257, -1.59969430491855 47.2274235984617, -1.59967023467843 47.2274403811577, -1.59965341631901 47.2274521075331, -1.59961774076331 47.2274769818544, -1.59960942079196 47.2274827828943, -1.59960937348761 47.2274828172281, -1.59958484521241 47.2275008842942, -1.59957034283104 47.2275115654545, -1.59955013777215 47.2275264470171, -1.59949025652398 47.2275705531702, -1.59943400272859 47.2276134219076, -1.59943396926626 47.2276134480278, -1.59943392587771 47.2276134817542, -1.59937656234539 47.2276571959739, -1.59931946639885 47.2277021420677, -1.59926681671875 47.2277435890925, -1.59926190528746 47.2277475392826, -1.59924932531045 47.2277576586332, -1.59921660380758 47.2277839806538, -1.59921651974391 47.227784048899, -1.59921424994512 47.2277859365762, -1.5992128316408 47.2277871143341, -1.59917471103251 47.2278187951039, -1.5991426791213 47.2278454138875, -1.5991365087967 47.2278505422043, -1.59913494740949 47.2278518401298, -1.59912708479181 47.2278583743383, -1.59909981862137 47.2278810334389, -1.5990968316675 47.2278835783452, -1.59908518668235 47.2278934962401, -1.59907908085907 47.2278986976635, -1.59906166528946 47.2279135323248, -1.59904509260225 47.2279276493001, -1.59899348897071 47.2279716044204, -1.59893988481167 47.2280187141678, -1.59893982695896 47.2280187642424, -1.59892552307039 47.2280313350845, -1.59890899362781 47.2280458621094, -1.5988884076564 47.2280639531966, -1.59883743216748 47.2281087522008, -1.59878936948309 47.2281509907773, -1.59873327687715 47.2282009848912, -1.59867145196261 47.2282560883738, -1.59867141822773 47.2282561190101, -1.59858956680294 47.2283284958587, -1.59855599956433 47.2283581783868, -1.59848747850551 47.2284187685454, -1.59847835749069 47.2284268335882, -1.59847830956362 47.2284268760563, -1.5984780869903 47.2284270714944, -1.59841558356327 47.228482189812, -1.5984080514898 47.228488831479, -1.59837772410116 47.2285155746168, -1.59836307669808 47.2285284907333, -1.5983177699164 47.2285684425981, -1.59827545169798 47.2286057607377, -1.59826761961751 47.2286126667114, -1.59821577393989 47.2286583851071, -1.59815892528666 47.2287064663796, -1.5981050602831 47.2287520258536, -1.59804633435194 47.2287957064316, -1.59798982600079 47.228837737505, -1.59792713924505 47.2288799302387, -1.59792498509468 47.2288813807286, -1.59786857589146 47.2289193492038, -1.59786855084235 47.2289193655251, -1.59775610146095 47.2289882193712, -1.59775596954593 47.2289883003436, -1.59775542052258 47.2289886142748, -1.59775538077764 47.2289886365909, -1.59772255922158 47.2290073897167, -1.59765061031428 47.2290483963369, -1.59762263041442 47.2290643438088, -1.59762257364684 47.2290643758171, -1.597594595687 47.2290793644319, -1.59754971364563 47.2291034098268, -1.59753385775647 47.2291119047251, -1.59749978522452 47.2291301586263, -1.59749172570692 47.2291344757665, -1.59748798176292 47.2291364818752, -1.59748298722637 47.2291391570914, -1.59742701221152 47.229169144915, -1.59741395069352 47.2291761429678, -1.59741347654422 47.2291763971313, -1.59741128149007 47.2291775730599, -1.59740804329165 47.2291793079684, -1.59740667140685 47.2291800432043, -1.59740474564981 47.2291810745416, -1.5973458888878 47.2292126058981, -1.597278644422 47.2292486305786, -1.59713400761828 47.2293216391908, -1.5971339721771 47.2293216577301, -1.59704080652066 47.2293692615682, -1.59696410070133 47.2294084553791, -1.59686750728999 47.2292674372254, -1.59686062306018 47.2291654476669, -1.59683178319455 47.2290745299444, -1.596776465005 47.2289981972961, -1.59670695956572 47.2289371446074, -1.5965564281215 47.2288438280104, -1.59644105166143 47.2287978649437, -1.59617259271396 47.2287327212068, -1.59605262322134 47.2287252112796, -1.59592439629451 47.2286840682227, -1.59579138315297 47.2286001151069, -1.59568540976665 47.2285001803922, -1.59561765195276 47.2283891803974, -1.59567413397419 47.2280990408296, -1.59568505081458 47.2279533854478, -1.59566872931109 47.2275573172484, -1.59566243014212 47.2272732125833, -1.59563088174062 47.2271388293848, -1.59557115722063 47.2270386239846, -1.59546038984538 47.2269831889677, -1.594763649145 47.2267062661824, -1.59460425528411 47.2266725203502))
-Nantes;Centre Ville;1;440109.0;POLYGON ((-1.55052496477627 47.2209242970431, -1.55012569944798 47.2204363526157, -1.55012410515378 47.2204344244062, -1.55012251093624 47.2204324970947, -1.54980022759316 47.2200396791837, -1.54979863332257 47.2200377509695, -1.54979703912863 47.2200358236533, -1.54957314851928 47.2197599277209, -1.54957155434189 47.2197580004014, -1.54956996008787 47.2197560721839, -1.54937823430905 47.2195243969383, -1.549376640069 47.219522468718, -1.54937504590579 47.2195205413957, -1.54908294373937 47.2191645326271, -1.54908134952073 47.2191626044025, -1.54907975537893 47.219160677076, -1.54864033388663 47.2186218413413, -1.54863873977681 47.2186199140084, -1.54863714559059 47.2186179857774, -1.54791422680669 47.2177302331743, -1.54791263274982 47.217728305831, -1.54791103861645 47.2177263775895, -1.54773526915715 47.2175121752342, -1.54773367511315 47.2175102478882, -1.54773208099277 47.2175083196442, -1.54728131386488 47.2169530193458, -1.54727971985408 47.2169510919933, -1.54727799396133 47.2169491689613, -1.54693287942798 47.2165581034203, -1.54693115356043 47.2165561803829, -1.54692955949753 47.2165542521274, -1.54680328159461 47.2164116958056, -1.54680155573647 47.2164097727662, -1.54680218950233 47.2164075896131, -1.54692372862181 47.2159762184849, -1.54692570595792 47.2159692118718, -1.54692633978996 47.2159670296158, -1.54692474574483 47.2159651013598, -1.54662555378626 47.2155952357683, -1.54661062316456 47.2155770143038, -1.54660996917193 47.2155772077933, -1.54638937100942 47.2156568674857, -1.54580860975461 47.2158798025793, -1.54568234602978 47.2158358090067, -1.54555698077377 47.2158050660105, -1.54553130058857 47.2157987017406, -1.54543060888039 47.2157744735552, -1.54495032247097 47.2156572224576, -1.54433338620185 47.2155256620465, -1.54415504113799 47.2154633950271, -1.54397718492329 47.2153622930816, -1.54232529305071 47.2140648996348, -1.54105800059255 47.2130721244339, -1.54092711371807 47.2129696169419, -1.54067739906981 47.2127741049798, -1.53892292594884 47.2113958131015, -1.53871436674081 47.2112372823018, -1.53871212651952 47.2112355560946, -1.53871131640603 47.2112353132873, -1.54889574783538 47.2079029897154, -1.54889859011067 47.2079020832761, -1.54890172147651 47.2079015276162, -1.55008589842703 47.2076801122133, -1.56114937090982 47.2089635659109, -1.56115270026708 47.2089639031319, -1.56202743844932 47.2091689464892, -1.56325067140343 47.2091354892502, -1.56570134591442 47.2084736669433, -1.56606051433375 47.2083383809204, -1.5660780843348 47.2083346339063, -1.56653236404945 47.2088130985795, -1.56651289045404 47.2088269981902, -1.56675953348695 47.2090898426883, -1.56740238738633 47.2088952262201, -1.56763201748956 47.208826921831, -1.56765928011923 47.2088183421783, -1.56781590455658 47.2087693527971, -1.56790803829125 47.2087422731112, -1.56798887001618 47.2087215216261, -1.56799454894952 47.2087305156294, -1.5680272031485 47.2087849821461, -1.56806633482598 47.2088503076753, -1.56807325874699 47.2088618716061, -1.56810335778526 47.2089121019237, -1.56839583220442 47.2089877575993, -1.56873576035433 47.2090761266722, -1.56926926277928 47.2092342228505, -1.56929303914132 47.2092412531884, -1.56939512303226 47.2092726506944, -1.56984701510913 47.2094118033589, -1.57027615459083 47.2095434401162, -1.57026942787903 47.2095490720069, -1.57025867190893 47.2095592543552, -1.57024912937195 47.2095697551515, -1.57024211789718 47.2095787296931, -1.57024187331057 47.2095790079514, -1.57023817280504 47.209584447313, -1.57023283718086 47.2095928253176, -1.57022656885035 47.2096047465728, -1.57022163313612 47.2096168031183, -1.57021778537482 47.2096292723144, -1.57021540723164 47.2096419632596, -1.57021434117535 47.2096545190853, -1.57021461272303 47.209667299211, -1.57021619005737 47.2096798552604, -1.57021909231655 47.2096924567981, -1.5702232939853 47.2097047444045, -1.57022865542835 47.209716631726, -1.57023515758615 47.2097278500958, -1.57023635032116 47.2097297012172, -1.57024358484964 47.2097400839661, -1.57025272534711 47.2097512126507, -1.5702630180015 47.2097618521451, -1.57027431444921 47.2097717371264, -1.57028636108797 47.209781056103, -1.57030012318346 47.2097903176174, -1.57031432709141 47.2097983928363, -1.57032888692086 47.2098059150379, -1.57034485757144 47.2098128494462, -1.5703612904886 47.2098188670702, -1.57037860047409 47.2098242253312, -1.57039570710998 47.209828599586, -1.57041342561618 47.2098323214278, -1.57043201612732 47.2098352939987, -1.57045065293493 47.2098370942115, -1.57046884056172 47.2098381896271, -1.57048750444951 47.2098385470165, -1.57050662305432 47.2098378996139, -1.57050701856496 47.2098378856743, -1.57052527318332 47.2098362760536, -1.57054072702069 47.2098343111417, -1.5705441296969 47.2098338360005, -1.57056123115977 47.2098309143325, -1.57057280255501 47.2098282704375, -1.57057956053587 47.2098266903762, -1.57059664955069 47.209821787707, -1.57060516787924 47.2098189769783, -1.57062530070128 47.2098738664592, -1.57098273719154 47.2108500776979, -1.57100854677591 47.2109211679932, -1.5711914579332 47.211431333048, -1.57136940379222 47.2119368026375, -1.57138040936227 47.21196804317, -1.57138059359788 47.2119687576072, -1.57139320037287 47.2120020159116, -1.57158364947551 47.2125085022654, -1.57158577198948 47.2125086106041, -1.57160241912428 47.212510297942, -1.5716119254075 47.2125119568684, -1.57161915054024 47.2125131533362, -1.57163663958831 47.2125173338031, -1.57165178207193 47.2125219546008, -1.57166674502415 47.2125277512541, -1.57168261809783 47.2125351399396, -1.57169837171516 47.2125445130679, -1.57170968205918 47.2125527763259, -1.57171838868257 47.2125597762861, -1.57173344108553 47.2125758390658, -1.57174212642141 47.212587973368, -1.57174938668163 47.2126023189022, -1.57178185727257 47.2126921874806, -1.57178565540247 47.2127098021201, -1.57178592076133 47.2127242945611, -1.57178397799488 47.2127375106611, -1.57178053874654 47.2127501465637, -1.57177508207285 47.2127623113141, -1.57177031198879 47.2127712093212, -1.57175932965561 47.2127855421977, -1.57175036058425 47.2127948533613, -1.57173893727098 47.2128049686791, -1.57172700215133 47.2128134797095, -1.57171406978443 47.2128210329344, -1.57171279723172 47.2128217071464, -1.57170106597219 47.2128275987066, -1.57169863351322 47.2128286723198, -1.57224280555614 47.2143322070655, -1.57225159595271 47.2143819872989, -1.57225131129609 47.2143853299526, -1.57224743444274 47.214422749678, -1.57224863531306 47.2144228892942, -1.5727903553772 47.2144728705891, -1.57282812538942 47.214476173979, -1.57285565143007 47.2144785660596, -1.5728470476543 47.2145358826328, -1.5728469184721 47.2145367510189, -1.5728446797688 47.214552003667, -1.572841932742 47.2145701185866, -1.57284156378955 47.214578522406, -1.57282483192772 47.2146367933789, -1.5728239575891 47.2146403685674, -1.57281214745554 47.2146617656837, -1.57279581479637 47.2146823958303, -1.57244813384158 47.2150388478715, -1.57236470612376 47.215123815175, -1.57233542014547 47.2151536294162, -1.57233517686214 47.215153907626, -1.57228198170111 47.2152090445558, -1.57223592427621 47.2152569994642, -1.57216830726392 47.2153266647321, -1.57214891067318 47.2153416434787, -1.57214001480185 47.215346538213, -1.57211966507242 47.2153574964025, -1.57208222408346 47.2153679527772, -1.57204216199075 47.2153732745651, -1.57073849469392 47.2155110553557, -1.5707094296284 47.2155167247474, -1.57068013200361 47.2155264537697, -1.57067975052982 47.2155266473668, -1.57065375564488 47.2155381561424, -1.57065260719214 47.2155387361927, -1.57065132810373 47.2155393196399, -1.56958274300215 47.2160762299731, -1.56954886043555 47.2160919693326, -1.56951665279586 47.2161053091297, -1.56937921607003 47.2161548205843, -1.56937895231353 47.216154829276, -1.5688711295935 47.2163314582525, -1.56881543402435 47.2163508188557, -1.56874201324996 47.2163754629652, -1.56832021147645 47.2165172005647, -1.56831930884681 47.2165175013873, -1.56777814427374 47.216706465422, -1.56766537303093 47.2167435751597, -1.56766304810105 47.2167443785799, -1.56742484417822 47.2168324399747, -1.56737182996765 47.2168519581186, -1.56733433307459 47.2168555001715, -1.56723464323369 47.2169070400177, -1.56723337052689 47.2169077141795, -1.56714039308735 47.2169596799357, -1.56713912667596 47.2169604430533, -1.56712153818817 47.2169712165954, -1.56647279797585 47.2173674208732, -1.56643356253038 47.2173913565684, -1.56640408813009 47.2174095571279, -1.5661743659998 47.2175514479786, -1.56567151374387 47.2178618254187, -1.56566582184804 47.2178653505501, -1.56561762333339 47.2178950838777, -1.56559299821986 47.2179036634101, -1.56553414989716 47.2179197063993, -1.56544548872875 47.2179438736794, -1.56382380387469 47.2183663267373, -1.5635935248595 47.21842635828, -1.563487269353 47.2184540011074, -1.56339859287361 47.2184761858657, -1.56336437189592 47.2184909446167, -1.56333216995513 47.2185134697469, -1.56331115242066 47.2185334554792, -1.56329898875634 47.218531615776, -1.56329173709383 47.2185028593636, -1.56328787222367 47.2184933524353, -1.5632705650948 47.2184517856985, -1.56324513999558 47.2184130140624, -1.56323828842401 47.218402529183, -1.56319155559948 47.2183580856991, -1.56314271059278 47.218320918542, -1.56263587325505 47.21799814547, -1.56263476600922 47.2179974622849, -1.56247276728886 47.2178896353891, -1.56241121874104 47.217848664536, -1.56240636618311 47.2178455872807, -1.56238003586212 47.2178289134907, -1.56233148203776 47.2178628909564, -1.5622793873598 47.2178990590101, -1.56109502644546 47.2187212654789, -1.56096245118707 47.2188232025263, -1.5609246468918 47.2188523119258, -1.56084665430067 47.218892327141, -1.56076056944047 47.2189373897944, -1.560743393687 47.2189484180151, -1.56068340659693 47.2189906168968, -1.56058946914875 47.2190567502743, -1.56036377976704 47.2192216396681, -1.56022770239333 47.2193209016372, -1.56018500120218 47.21935720116, -1.55929827031343 47.2199810828987, -1.55929675910359 47.2199821250617, -1.55925695085328 47.2200073387309, -1.55925479424074 47.2200085822229, -1.55921079328643 47.2200324962513, -1.55920939480005 47.2200332636153, -1.55919221985116 47.2200406899357, -1.55916583106333 47.2200522998572, -1.5591645517412 47.2200528831759, -1.5591214926513 47.2200679382313, -1.55911826067401 47.2200689486763, -1.55907328972214 47.2200813664576, -1.55907333759329 47.2200801940578, -1.55907192556455 47.220069884111, -1.55906960443331 47.2200597850587, -1.5590661014248 47.2200498158183, -1.55906154470322 47.220039882096, -1.55905582014672 47.2200302578435, -1.55904932473983 47.2200209300063, -1.55904369753983 47.220014454759, -1.55904168058315 47.2200121812045, -1.55903366760394 47.2200038056708, -1.55902392750666 47.2199953085642, -1.55901344829044 47.2199875562503, -1.55901011888893 47.2199854167883, -1.55900956596607 47.2199850756013, -1.5590028957592 47.2199806169143, -1.55899089897201 47.2199738169022, -1.55897855880792 47.2199677495784, -1.55896559869008 47.2199622430021, -1.55895201861836 47.2199572971731, -1.55893782510743 47.2199530037424, -1.5589220744589 47.2199491226357, -1.55890804386005 47.2199470745276, -1.55890337594061 47.2199465119134, -1.55888114986719 47.2199444710178, -1.55885529544365 47.219945254839, -1.55882829155367 47.2199484189697, -1.55880147943451 47.219952387353, -1.55875509872453 47.2199617900949, -1.55868317942389 47.2199762892344, -1.55865733358818 47.2199844587994, -1.55863631291994 47.2199935451732, -1.55861762648193 47.2200056151756, -1.55860405522989 47.2200171523612, -1.55859099728703 47.2200320941662, -1.55858119612136 47.2200481871409, -1.55857515961155 47.2200633431568, -1.55857276891921 47.2200704493228, -1.55857278164047 47.2200706290333, -1.5585679924983 47.2200847506641, -1.55856436438196 47.2201093724213, -1.55856427143715 47.2201335132632, -1.55856457632412 47.2201522372591, -1.55856577748081 47.2201614742849, -1.55856673734778 47.2201655847477, -1.55854783448206 47.2202636774413, -1.55848853517064 47.2202972046089, -1.55845859452584 47.2203054222004, -1.55718890696782 47.2206450898374, -1.55688835489224 47.2207243238259, -1.55649177684577 47.2208320189577, -1.5562329797018 47.2206692688785, -1.55618656009464 47.2207090248083, -1.55592881530089 47.22088786692, -1.55577052241076 47.2210181362149, -1.55574629598836 47.2210303930071, -1.55569925914224 47.2210435094814, -1.55569325961147 47.2210428112262, -1.55566542349393 47.2210163712364, -1.55564752175546 47.220995629382, -1.55563292047847 47.2209784690484, -1.55527600202558 47.2205572021415, -1.55522708618465 47.2205808301065, -1.55518621155745 47.220600493392, -1.55515190095484 47.2205631926073, -1.55514309349967 47.2205711460715, -1.55512559001213 47.2205867782562, -1.55491943035937 47.2205405976801, -1.5547922277131 47.2206020844881, -1.55457843260485 47.2207217965325, -1.5543290078582 47.2206333022327, -1.55298146859513 47.2213428475389, -1.55286946823517 47.2215317160425, -1.55275184270279 47.2217123075424, -1.55276226514388 47.2221540094223, -1.55286937676814 47.2227345753645, -1.55250411004335 47.2228349846982, -1.55253038258306 47.2229254274918, -1.55246074366691 47.2229313791617, -1.55245759116272 47.2229316663002, -1.55245443990003 47.2229319524883, -1.55219074190901 47.2229564295947, -1.55218824245701 47.2229566043414, -1.55218599495781 47.222954788546, -1.5516633266658 47.222319156064, -1.55166173233648 47.2223172287748, -1.5516601379305 47.2223153005875, -1.55113484744398 47.2216743509667, -1.55113325315291 47.2216724236699, -1.55113165878538 47.2216704954749, -1.55097160222373 47.2214745917478, -1.55097000794452 47.2214726644485, -1.55096841358886 47.2214707362513, -1.55052815334645 47.2209281525524, -1.55052655909968 47.2209262252468, -1.55052496477627 47.2209242970431))
-Nantes;Bellevue - Chantenay - Sainte Anne;2;440109.0;POLYGON ((-1.59624929968602 47.2095846477281, -1.59624611601457 47.2095844859029, -1.59624297087996 47.209584863198, -1.59391995415732 47.2098374940887, -1.59306342311854 47.209927498978, -1.59227926903431 47.2099825147237, -1.59130785570004 47.2099534757211, -1.59034028262248 47.2098452169708, -1.58936288753933 47.2095993870539, -1.58850066588216 47.2093162110258, -1.58849781874668 47.2093152263528, -1.58849496396112 47.2093141527764, -1.58718712110685 47.2088086038482, -1.58718426629749 47.2088075293411, -1.58718130024706 47.2088067296075, -1.5861145878517 47.2085056996405, -1.58611300693171 47.2085053221428, -1.58610991817458 47.2085046173932, -1.58231284470178 47.2076730849316, -1.58231250894934 47.2076725630791, -1.58230941757787 47.2076718574345, -1.57910478308828 47.2069573678097, -1.57910169443622 47.2069566619736, -1.57909860446635 47.20695595619, -1.57781156848673 47.2066700621833, -1.57780847560665 47.206669352878, -1.57780538787735 47.2066687343776, -1.5774289342705 47.2065922936069, -1.57696560924381 47.206530498729, -1.57654857571321 47.2065195790245, -1.57617215403922 47.2065418088463, -1.57573992569971 47.2066060940427, -1.57573679349547 47.206606559471, -1.57573366767909 47.206607114754, -1.5738992522681 47.2069287088929, -1.57354299053359 47.2069912355427, -1.57353929251031 47.2069912710987, -1.5725999621829 47.2070041321029, -1.57259679018472 47.2070041493848, -1.57259466125682 47.2070057524974, -1.57244451825921 47.2071180274036, -1.57102211257743 47.2060846220816, -1.57120495066092 47.2059748428046, -1.57216913795212 47.2051406184923, -1.57262778126583 47.2046486851936, -1.57827333254159 47.1973010733515, -1.57827339052738 47.1973010404019, -1.57827386239639 47.1973007773877, -1.57827554010304 47.1972998382233, -1.57827610778814 47.1972995209268, -1.57839801765664 47.1972791739705, -1.57855489953182 47.1972529897727, -1.57916238846146 47.1971329744914, -1.57939788846479 47.197085581818, -1.57947623935226 47.1970698141263, -1.57963068529384 47.1970374899944, -1.57963156453915 47.19703730624, -1.57996018098139 47.1969675181555, -1.5802476505016 47.1969036076531, -1.58049288539274 47.1968490858697, -1.58049413853287 47.1968488069932, -1.5804970068823 47.1968468002481, -1.58079469007915 47.1967786042971, -1.58079477301228 47.1967785847683, -1.58110939355569 47.1967054031082, -1.58110950880962 47.1967053750806, -1.58137336859832 47.1966418847267, -1.58151202998431 47.1966065294085, -1.58163146169141 47.1965760773776, -1.58186247383765 47.196515134845, -1.58212973549923 47.1964452659036, -1.58212981432455 47.1964452447355, -1.58238446408089 47.1963772482169, -1.58238461010497 47.1963772090477, -1.58260898595586 47.196316688424, -1.58262738782942 47.1963117250211, -1.58284577314266 47.196252820817, -1.58287481399207 47.1962449879937, -1.5828820237848 47.1962430430632, -1.58307355897009 47.1961886245049, -1.58326407240839 47.1961333507098, -1.58331151794543 47.1961191592443, -1.58355123789136 47.1960474551134, -1.583771723187 47.1959809815905, -1.58387609647562 47.195949290115, -1.58450945972743 47.1957569758994, -1.58474549861036 47.1956836238542, -1.58494699150386 47.1956210080198, -1.58494708544194 47.1956209781363, -1.58495980049255 47.1956169326042, -1.5850709482638 47.1955815713758, -1.58528728792944 47.195512742684, -1.58537468323101 47.1954849376073, -1.58544915753312 47.1954612430465, -1.58568124413129 47.1953874025476, -1.58590325378249 47.1953114401086, -1.58590457526664 47.1953109881323, -1.58606791551512 47.1952687795501, -1.5862162748475 47.1952276197531, -1.58622625052018 47.1952221750659, -1.58921702406683 47.1943125691319, -1.58921867572337 47.1943120678721, -1.5928889710883 47.1931979320201, -1.59383385260893 47.1929133111729, -1.59440326515691 47.1927757222276, -1.59463329780022 47.1927344360721, -1.59550346842778 47.192598148751, -1.59556460453903 47.1925885735491, -1.59593960346046 47.1925467076202, -1.59630439588934 47.1925045282195, -1.59630377346476 47.1925032267093, -1.59602371474403 47.1919174410808, -1.59601902690877 47.1919076345766, -1.59591608763594 47.1916923171491, -1.59590218096382 47.1916674626696, -1.5959021129343 47.1916673942057, -1.59590078240482 47.1916660669775, -1.59589870974845 47.1916639972116, -1.59531927923732 47.1916157722976, -1.59531898631882 47.1916157479792, -1.59541119472475 47.1913403726271, -1.59552335686475 47.1910050856266, -1.5955283028709 47.190990379777, -1.59552953085099 47.190986681128, -1.59559190333856 47.1907987810726, -1.59559715940989 47.1907830715854, -1.59577246629446 47.1902678306347, -1.59602425847196 47.1901416839813, -1.59604828863903 47.1901290984389, -1.59643276699552 47.1899282491228, -1.59665530285895 47.1898119960836, -1.59683139070121 47.1897200069274, -1.59684962723954 47.1897104340369, -1.5969854812884 47.1896394837465, -1.5972176407552 47.1895033990655, -1.59721929471843 47.1895024209019, -1.59722254615121 47.189500499277, -1.59773313043353 47.1892007953754, -1.59773879520455 47.189197504702, -1.59782024074314 47.1891501781304, -1.59782079234167 47.189149845153, -1.59782199984497 47.189149116448, -1.59782257236572 47.1891487808304, -1.59789561071024 47.18910597841, -1.59790857531879 47.1890984304407, -1.59816146949659 47.1889516792755, -1.59816160549623 47.1889516008376, -1.59828844871928 47.1888631371796, -1.59828854721324 47.1888630683541, -1.59828871204119 47.1888629563212, -1.59829641276943 47.1888577070445, -1.59837898946705 47.1888005126132, -1.59840780912152 47.1887806149833, -1.59848040450365 47.1887303083231, -1.5984840234185 47.1887278204569, -1.5984842754252 47.188727646359, -1.59868609781903 47.1885879320444, -1.59870497233922 47.1885748657939, -1.59900144746213 47.188369624497, -1.59901018852913 47.1883636873873, -1.5990852048518 47.1883117604188, -1.59908586725039 47.1883113022462, -1.59908659202968 47.1883108010243, -1.5990871533017 47.1883104117837, -1.59908910338055 47.1883090360499, -1.5990902684684 47.1883082144128, -1.59935983776549 47.1881201646704, -1.59935989278509 47.1881201129047, -1.6009926632621 47.186593211953, -1.60099368331294 47.1865922573359, -1.60100120909288 47.186585216243, -1.60112206778546 47.1864721415962, -1.60112309999782 47.1864711594569, -1.60112414445319 47.1864701660135, -1.60112436165098 47.1864699563587, -1.60122980639315 47.1863680695159, -1.60123088540223 47.1863670936096, -1.60126092840889 47.1863399209924, -1.60127294836154 47.1863290502108, -1.60127394825553 47.1863281225311, -1.60149018969198 47.1861274003821, -1.60271005568201 47.1855298033883, -1.60271011573199 47.1855297793535, -1.60271107320015 47.1855294174584, -1.60271140723314 47.1855292905231, -1.60271181301616 47.1855291372816, -1.60271215224055 47.185529009237, -1.60271253369359 47.1855288650811, -1.60271354237856 47.185528484011, -1.60271406074563 47.1855282875068, -1.60271440252702 47.1855281584585, -1.60271458941802 47.1855280878861, -1.6027149286424 47.1855279598415, -1.60271581567771 47.1855276241997, -1.60279632338015 47.1854971920174, -1.60279646928208 47.1854971366053, -1.60398489866237 47.1850975872483, -1.60407899622415 47.1850707622305, -1.60407907107238 47.1850707412058, -1.60407921728214 47.185070704703, -1.60524643395581 47.1847764623984, -1.60586776288613 47.1846508806895, -1.60586784478426 47.1846508647873, -1.6065432539065 47.1845150927712, -1.60691361190663 47.1844753985081, -1.60709514209432 47.184455942487, -1.60709678307597 47.1844557666821, -1.60710417729487 47.1844549742651, -1.60779329944162 47.1843811115245, -1.60801563650004 47.1844042651883, -1.60802214623067 47.1844050004732, -1.60802858390232 47.1844057278372, -1.60803461052864 47.1844064248455, -1.60924085479804 47.1845459257336, -1.61072668709874 47.1848124527632, -1.61204113410861 47.1851239590664, -1.61261174820732 47.1852671190941, -1.61263847103411 47.1852737876041, -1.61286262853157 47.1853300238221, -1.61290636730573 47.1853419260723, -1.61290647013146 47.185341953479, -1.61351245341245 47.1854986355344, -1.61378770715335 47.1855800922503, -1.61387278219741 47.1856052677254, -1.61387463928847 47.1856058175513, -1.61387832627511 47.185606923703, -1.61388020297233 47.1856074862575, -1.61587895394921 47.186210084791, -1.61628541347759 47.1863307981965, -1.61710129198526 47.1865391225331, -1.61714250914733 47.1865495396017, -1.61736892115427 47.1866073852601, -1.61737405878955 47.1866087104948, -1.61770914450147 47.1866942637623, -1.6177453715188 47.1867035296947, -1.61782931751542 47.1867250234574, -1.61785704385519 47.18673228843, -1.61807960734751 47.1867902749655, -1.61809504958522 47.1867942980581, -1.61828664652561 47.1868442160934, -1.61849254832917 47.1869011069542, -1.61849305752901 47.1869012477667, -1.61849314284772 47.1869012713674, -1.61851661563864 47.1869077566531, -1.6185403173468 47.1869143057142, -1.61888726156052 47.1869477431752, -1.61929263349696 47.1869607201252, -1.61952844754813 47.1869652872515, -1.61988360905386 47.1869710634916, -1.62045966957652 47.1869804308607, -1.62055455869195 47.1870532068152, -1.62066441289053 47.187137461661, -1.62066928990076 47.1871454971175, -1.62067811862136 47.1871600418256, -1.62069738276201 47.1871961431032, -1.62071356286071 47.1872074749234, -1.62078792003457 47.1872265609262, -1.62082000063035 47.1872535648073, -1.6209474339291 47.1873665722408, -1.62110489598444 47.1874859400651, -1.6212114199298 47.1875658805657, -1.62121148069497 47.1875659258789, -1.62121156695994 47.1875659908915, -1.62122421728432 47.1875754840829, -1.62127451812273 47.187624925854, -1.62129282398028 47.1876366081614, -1.62148780106984 47.1876871095081, -1.62148795117552 47.1876871485207, -1.62152109768532 47.1876943313868, -1.62152133481324 47.1876943831159, -1.62152146275357 47.1876944104051, -1.62152170522831 47.18769446282, -1.62153717719839 47.1876978156373, -1.62155246729477 47.1877011289167, -1.62157833623721 47.1877020626084, -1.62157846881888 47.1877020671826, -1.621658220633 47.1876884930912, -1.62165885505797 47.1876883855439, -1.62165906480249 47.1876883500648, -1.62175383479911 47.1876722202658, -1.62175393513868 47.1876722036099, -1.62181387916059 47.1876643993895, -1.62181406217617 47.1876643757999, -1.62187614500282 47.1876653903603, -1.62196674628836 47.187668687123, -1.62200236603416 47.187673581425, -1.62204684459952 47.1876796932596, -1.62224540708012 47.1876753019087, -1.62230383893964 47.1876732192044, -1.62230391402331 47.1876732161807, -1.62234616407527 47.1876634947275, -1.62238214267558 47.187651539605, -1.62238226601966 47.1876514985928, -1.62246543978172 47.1876204114919, -1.62246551268648 47.1876203833243, -1.62250765602491 47.1876021549597, -1.62255419554562 47.1875820319853, -1.62262134687349 47.1875686078124, -1.62265898809334 47.1875636675989, -1.62268572000853 47.1875609689843, -1.62269254889816 47.1875605137351, -1.62269938832559 47.1875600580611, -1.62269946751655 47.1875600566741, -1.62279608520618 47.187558145263, -1.62279620012423 47.1875581595585, -1.62282658001928 47.1875633430355, -1.62283099952208 47.1875640968068, -1.62283615163125 47.1875649760663, -1.62284352961045 47.1875662351662, -1.62286784230504 47.1875703824863, -1.62287768893738 47.1875720621093, -1.62288816216796 47.1875738489609, -1.62290785008897 47.1875772075169, -1.62291529378438 47.1875784774825, -1.62295670239819 47.1875855425483, -1.62295997742971 47.1875861009072, -1.62296023253318 47.1875861465026, -1.62307747645684 47.1876117499842, -1.62315933235887 47.1876296268483, -1.62315947649606 47.1876296579891, -1.62323813550303 47.1876556863024, -1.62325966735941 47.1876637410997, -1.62328076345169 47.1876716332197, -1.62329436643815 47.187675931574, -1.62329443982698 47.1876759547507, -1.62329458118018 47.1876759995203, -1.62330804824042 47.1876802546872, -1.62332202168521 47.1876839163386, -1.62333580433985 47.1876875271, -1.62334254923772 47.1876888783524, -1.62334966005715 47.1876903031759, -1.62334976962878 47.187690316785, -1.62346768179457 47.1877049577819, -1.62353429723124 47.1877132294879, -1.62355871318359 47.187720991437, -1.62355884500493 47.1877210329857, -1.62355894017063 47.1877210633952, -1.62356690998479 47.187723598938, -1.62357602713528 47.1877265000797, -1.62372742911731 47.1877861944876, -1.62398215018175 47.187876488504, -1.62403894665131 47.1878951237619, -1.62407663434534 47.1879074918893, -1.62409257219879 47.1879146608047, -1.62409596837214 47.1879161892729, -1.62409604540829 47.1879162240169, -1.62412941062259 47.1879312299462, -1.62412956058732 47.1879312977972, -1.62434210974017 47.1880463021044, -1.6243655819788 47.1880590022484, -1.62441554303589 47.1880860345865, -1.62443666274124 47.1880945761704, -1.62444936997009 47.1880997160932, -1.6245009166824 47.1881166468436, -1.6247159303776 47.1881416068741, -1.6248117364377 47.1881614392046, -1.62482000439697 47.1881630362923, -1.62482829110981 47.1881646362284, -1.62483242508983 47.1881654347717, -1.62483883242603 47.1881666724819, -1.62485382358779 47.1881695675417, -1.62486766104381 47.188172664079, -1.62488148106554 47.1881757577126, -1.62488812595137 47.1881776770145, -1.6248883279856 47.1881777355576, -1.62488854358182 47.1881777980599, -1.62489568739261 47.188179861264, -1.62490241880026 47.1881820771548, -1.62490285697469 47.1881822217029, -1.62490296306938 47.1881822561766, -1.62490951228026 47.1881844136258, -1.62491586828882 47.18818650767, -1.62492374829869 47.1881891035134, -1.62493787901412 47.1881951096858, -1.62501098667074 47.1882348747579, -1.62516625301376 47.188336478176, -1.62529494568333 47.1883888944488, -1.62544893332143 47.1884516076574, -1.62549428362439 47.1884682623253, -1.6255225018324 47.1884796508967, -1.62552946256789 47.1884818124554, -1.62553662975925 47.1884840377843, -1.62558542534658 47.1884903618109, -1.62575007869057 47.188500486571, -1.62594805089915 47.188516748584, -1.6261548209495 47.1885314779048, -1.62615491548845 47.1885314858092, -1.62615511348236 47.1885315129735, -1.62624932840111 47.1885442623238, -1.62625117024789 47.1885445115957, -1.62625135886525 47.1885445373355, -1.62625171866387 47.1885445859133, -1.62625185644601 47.1885446046906, -1.6262520039942 47.1885446293822, -1.62630326841367 47.1885532479073, -1.62631937372841 47.1885559554995, -1.62632323710736 47.1885566053978, -1.62634464649196 47.1885602048944, -1.62636020183692 47.1885628202039, -1.62636305640131 47.1885632998967, -1.62636552597606 47.1885637149058, -1.62637254033448 47.1885648938248, -1.62638619212205 47.1885671884556, -1.62640546865068 47.1885704296492, -1.62642423000189 47.1885735834686, -1.62642439653729 47.1885736137026, -1.62642453587714 47.1885736504396, -1.6265043509522 47.1885947278902, -1.62667393129687 47.1886822859941, -1.62667401283271 47.188682326863, -1.62670720256641 47.1886976572617, -1.6269231560141 47.188758157434, -1.62707108934322 47.1887982338387, -1.62708529239162 47.1888024021458, -1.62708842295537 47.1888033203593, -1.62709934617925 47.1888065260048, -1.62709943840281 47.1888065529255, -1.62709954070414 47.1888065893525, -1.62711229875391 47.1888111060698, -1.62712047998675 47.1888140023197, -1.62712064087865 47.1888140589131, -1.62714171656894 47.1888215204457, -1.62715592406734 47.1888276142802, -1.62716230703409 47.1888303523289, -1.62717006018821 47.1888336776486, -1.62717013304208 47.1888337098557, -1.62717026836737 47.188833776491, -1.62720840824249 47.1888527117766, -1.62724224376421 47.1888695100714, -1.62724240257403 47.1888695883757, -1.62724261253805 47.1888696925528, -1.627242681596 47.1888697267153, -1.62732939214042 47.1889097873082, -1.62736175499405 47.1889247399491, -1.62748521905871 47.1889839330269, -1.62780761988405 47.1890585241763, -1.62808154435424 47.1891377381554, -1.62808165285367 47.1891377698261, -1.62817021879934 47.1891559179151, -1.62832375126664 47.1891747878002, -1.62908710083826 47.1892686043556, -1.62908719305614 47.1892686159558, -1.62912478178779 47.1892679209972, -1.62917813911244 47.189266932527, -1.62925547317706 47.189255968451, -1.62926222977033 47.1892544037375, -1.62926554716741 47.1892536355514, -1.6292656495967 47.1892536124967, -1.62927281443344 47.189251953821, -1.62928145395222 47.1892499536169, -1.62928205264251 47.1892498150282, -1.62930870462307 47.1892436442563, -1.62930877907755 47.1892436187253, -1.62942496633134 47.18920354719, -1.62942503769105 47.1892035316962, -1.62945253170294 47.1891989147231, -1.62946507745558 47.1891968083253, -1.62946522211585 47.1891967844683, -1.62946529720126 47.18919678144, -1.62954787727369 47.1891996569273, -1.62954798467549 47.1891996607057, -1.62986914712654 47.1892379688535, -1.629869227255 47.1892379782374, -1.62996016322643 47.1892486671349, -1.62996909523567 47.1892497171266, -1.62998418001835 47.18925149036, -1.62999882672954 47.1892532118744, -1.6300012787879 47.1892535004546, -1.63000542160548 47.1892539875712, -1.63004311016669 47.1892584175279, -1.63005196205066 47.1892594581294, -1.63005765273015 47.1892601270155, -1.63007207378441 47.1892618224788, -1.63007227945296 47.1892618466236, -1.63007252921565 47.1892618761988, -1.6300726173259 47.1892618861617, -1.63008049426126 47.1892628119937, -1.63008736021271 47.1892636191048, -1.6301066666339 47.1892658888724, -1.63010946454806 47.1892662175675, -1.63011586972207 47.1892669702716, -1.63016377377134 47.1892726011522, -1.63020715172494 47.1892776999888, -1.63021915141527 47.1892791101255, -1.63023474635644 47.1892809429487, -1.63024873066628 47.1892825866205, -1.63026269630107 47.1892842283407, -1.63027671935972 47.189285876754, -1.63029080387194 47.1892875325993, -1.63029587755128 47.1892881290404, -1.63031910239097 47.1892908588859, -1.63033013651336 47.1892921556698, -1.63033352206657 47.1892925534715, -1.63034836245756 47.1892942977678, -1.6304172424552 47.1893023949537, -1.63041735993572 47.1893024082372, -1.63041760435159 47.1893024371263, -1.63041769246198 47.1893024470889, -1.63041795392475 47.1893024743891, -1.63042133968147 47.1893028136064, -1.63046516272847 47.1893072068286, -1.63049552667615 47.1893102506027, -1.63052425048283 47.1893131307445, -1.63052955784151 47.1893136627797, -1.63054576664338 47.189315287868, -1.6305537796799 47.1893160910306, -1.63056794955767 47.1893175118078, -1.63058362629295 47.189319083561, -1.63058437573047 47.1893191587603, -1.63059138468808 47.1893198618494, -1.63060134203294 47.1893208605172, -1.63063377963947 47.1893241125681, -1.63063401831867 47.1893241362813, -1.63064817882381 47.1893255556246, -1.63066229004424 47.1893269706465, -1.63067654788225 47.1893283995768, -1.63070581710646 47.189331334267, -1.63071028436363 47.1893317821372, -1.63072133646064 47.1893328898225, -1.63072730925853 47.1893334887211, -1.63073129512767 47.1893338884259, -1.63075076036634 47.1893358398885, -1.6307752875483 47.1893382981284, -1.63077537558085 47.1893383071928, -1.63077548724668 47.1893383144026, -1.63078450387546 47.189338861691, -1.6307948294949 47.1893394886366, -1.63083459694042 47.1893419015411, -1.63085373050571 47.189343062557, -1.63086435377251 47.1893437072257, -1.63089677508332 47.189345674846, -1.63091105681455 47.1893465413781, -1.63111613338292 47.1893589846273, -1.6320539713999 47.1894061973453, -1.6320557332468 47.1894062857485, -1.63207307979948 47.1894071591242, -1.6321001690511 47.1894085224484, -1.63210025002965 47.1894085263896, -1.63216857399543 47.1894119653947, -1.63217911602052 47.1894124960741, -1.63217951169233 47.1894125161521, -1.63218768642906 47.189412927893, -1.63219482285647 47.1894132869154, -1.63220657444755 47.1894138787184, -1.63224481520369 47.1894158039593, -1.63226393027459 47.1894167663386, -1.6322829152379 47.1894177222507, -1.63230203031018 47.1894186846237, -1.63232114538315 47.1894196469935, -1.63234012895321 47.1894206020513, -1.63239744759858 47.1894234875014, -1.63241645906851 47.1894244441241, -1.63243557546281 47.1894254064217, -1.63244460392815 47.1894258611878, -1.63245461219661 47.189426364722, -1.6324686780018 47.1894270730669, -1.63247377640471 47.1894273295893, -1.63251188699378 47.1894292473795, -1.63253107111931 47.1894302132358, -1.63253558136184 47.1894304403257, -1.63255008925848 47.1894311704686, -1.63259169704843 47.1894332642906, -1.63261527983178 47.1894344509104, -1.6326230376704 47.1894348415984, -1.63264644253443 47.189436019172, -1.6326595098651 47.1894366767767, -1.63266352749448 47.1894368786864, -1.63266544734872 47.1894369751214, -1.63270378639733 47.1894389052551, -1.63272298641526 47.1894398713394, -1.63274210677255 47.1894408334266, -1.63276138777061 47.1894418034452, -1.63278729407031 47.1894431071179, -1.63279545951733 47.1894435182897, -1.63281037502687 47.1894442688951, -1.63281666045012 47.1894445856298, -1.63282543932131 47.1894450279117, -1.63284051283727 47.1894457865541, -1.63284334879814 47.1894459289157, -1.63285561417273 47.189446545874, -1.63287071155668 47.1894473053514, -1.63288574129131 47.1894480621505, -1.63294644033585 47.1894511172778, -1.63296150990341 47.1894518760639, -1.63296169844062 47.1894518855757, -1.63297705875701 47.1894526587575, -1.63298831379894 47.1894532254663, -1.63299246022195 47.1894534338809, -1.63300318948332 47.1894539740497, -1.63303469208696 47.1894555591264, -1.6330398516367 47.1894558194639, -1.6330463149055 47.1894561443271, -1.63307570516688 47.1894576236118, -1.6331081372101 47.1894592558603, -1.63310833636367 47.1894592658446, -1.63311093341967 47.189459260144, -1.63314121952005 47.1894591974582, -1.63331531403378 47.1894588368731, -1.63331544220097 47.1894588362053, -1.63334078797663 47.1894568975704, -1.63337454199638 47.1894543149444, -1.63340624224509 47.1894518900045, -1.63343482631144 47.1894497034852, -1.63343759845286 47.1894494915592, -1.63345329495872 47.1894482911399, -1.63347030198522 47.1894469900575, -1.63348449355545 47.1894459044505, -1.63349592352248 47.1894450303439, -1.63351560420296 47.1894435249073, -1.63352373675047 47.1894429028535, -1.63353129411895 47.1894423247432, -1.63439294106402 47.1893764125584, -1.63513878909735 47.1894139659374, -1.63587558516413 47.1893899828773, -1.63590017569224 47.1893898196755, -1.63590230540127 47.1893898057527, -1.63592880099711 47.1893896295845, -1.63592892521227 47.1893896290734, -1.63592902447701 47.1893896304711, -1.63594237566782 47.1893897661963, -1.63594716655527 47.1893898151079, -1.63595006940261 47.189389844753, -1.63595562635479 47.1893899014734, -1.63614410733629 47.1894009325514, -1.6361641464326 47.1894021065782, -1.63616424205774 47.1894021117273, -1.63622034003822 47.1894130628903, -1.63622602015989 47.1894141716555, -1.63623506218188 47.1894159376318, -1.63625819558706 47.1894204542341, -1.63626437999545 47.189421661579, -1.63626628817233 47.1894220341735, -1.63627878207346 47.1894244735474, -1.63629320430249 47.1894272892057, -1.63630161153503 47.1894289303269, -1.63630754849131 47.1894300890905, -1.636312930091 47.1894311396206, -1.63632179053858 47.1894328696697, -1.6363789026581 47.189444020399, -1.63638531569386 47.1894452725711, -1.63639295243807 47.1894467636788, -1.63639315277256 47.189446802446, -1.6364181526889 47.18945168338, -1.63642160596435 47.1894523576213, -1.63643573774233 47.1894551165079, -1.63645742427594 47.1894593508842, -1.6364600935728 47.1894598720581, -1.63646590413514 47.1894610061817, -1.63647410569658 47.189462607838, -1.63648185001418 47.1894641198266, -1.63648833567134 47.1894653861815, -1.63650251318072 47.1894681540265, -1.63651657103325 47.189470898768, -1.63651667325461 47.1894709189697, -1.63652332832604 47.1894722181295, -1.63653070150373 47.1894736576961, -1.63653574157427 47.1894746418103, -1.63654484135286 47.1894764180459, -1.63655559116405 47.1894785169217, -1.63655887100033 47.1894791576137, -1.63657301627762 47.1894819195432, -1.63657310772657 47.1894819374766, -1.63658030746428 47.1894833434948, -1.63658715892185 47.1894846815774, -1.63662971171262 47.1894929896605, -1.63664364046466 47.1894957089631, -1.63664411654169 47.1894958023745, -1.6366507756493 47.1894971022653, -1.63665798616366 47.1894985105469, -1.63670040180306 47.1895067917038, -1.63671457259175 47.1895095579928, -1.63672583205034 47.1895117561174, -1.63672856319668 47.1895122892052, -1.63673112493011 47.1895127894862, -1.63674279854522 47.1895150682022, -1.6367504272495 47.1895165578094, -1.63675680806334 47.189517804054, -1.63677989583219 47.1895223115846, -1.63678504882778 47.1895233172596, -1.63679909058969 47.1895260590131, -1.63681738705688 47.1895296309581, -1.63682733407554 47.1895315729998, -1.6368388020164 47.1895338122544, -1.63685562065722 47.1895370960526, -1.63686548831931 47.1895390223729, -1.63686973767767 47.1895398518791, -1.63688376596301 47.1895425905624, -1.63689789918422 47.1895453502369, -1.63690635357383 47.1895470011251, -1.63691091494554 47.1895478919189, -1.6369120216342 47.1895481076414, -1.63692610370842 47.1895508567627, -1.63693339623122 47.1895522806386, -1.63696820610146 47.1895590765849, -1.63699659353862 47.1895646189594, -1.63701581521872 47.1895683715732, -1.63701910576046 47.1895690136222, -1.63702485721486 47.1895701365893, -1.63704177399225 47.1895734389251, -1.63705296357358 47.189575623621, -1.63706723933325 47.1895784108592, -1.63708135102824 47.1895811659746, -1.63708463893703 47.1895818081282, -1.63708778161212 47.1895824219057, -1.6370965129959 47.1895841264722, -1.63710944399144 47.1895866508308, -1.63712371301442 47.1895894365321, -1.63713469955419 47.1895915816625, -1.6371377292361 47.1895921729693, -1.63714757273892 47.1895940948353, -1.6371659956542 47.1895976913559, -1.63717487367214 47.1895994251373, -1.63719402004784 47.1896031627417, -1.63720815461822 47.1896059223248, -1.63721617596005 47.1896074879559, -1.63722229725008 47.1896086833827, -1.63723638206883 47.1896114332576, -1.63728027301137 47.1896200015444, -1.63730231865578 47.1896243050643, -1.63730303676578 47.1896244454667, -1.63730982773227 47.1896257715333, -1.63734603625391 47.1896328406799, -1.63735718951248 47.1896350178033, -1.63738935575058 47.1896412977434, -1.63740423666126 47.1896442028725, -1.63740932109331 47.1896451950699, -1.63741237906905 47.1896457924356, -1.63741356915136 47.1896460246092, -1.63742045692008 47.1896473692871, -1.63747845431042 47.189658691885, -1.63750043008236 47.1896629819707, -1.63750800504424 47.1896644610846, -1.63752244088811 47.1896672796482, -1.63754445836195 47.1896715779534, -1.63756639244975 47.1896758597985, -1.63758852827259 47.1896801812492, -1.63759461051897 47.1896813683218, -1.63761058737385 47.1896844868717, -1.63765465598839 47.1896930901953, -1.6376805356015 47.1896981425832, -1.63769902446317 47.1897017516761, -1.63770435504547 47.1897027924896, -1.63771165969962 47.1897042185311, -1.63771180493408 47.1897042469064, -1.63772122626016 47.189706086657, -1.63773938032902 47.1897096308714, -1.637743703649 47.1897104744798, -1.63775131760665 47.189711961014, -1.63776638145621 47.1897149019609, -1.63778969391174 47.189719452483, -1.63778978807411 47.189719471207, -1.63781602537371 47.1897245929192, -1.63784286113171 47.1897298319239, -1.63784904018643 47.1897310376005, -1.63785025453036 47.1897312750974, -1.63785040914213 47.1897313048959, -1.63788629093549 47.1897379896776, -1.63789841500711 47.1897402482772, -1.63793454132256 47.1897469781339, -1.63797994044677 47.1897554356616, -1.63800254391481 47.1897596462238, -1.63800585747863 47.1897602638857, -1.63802329042351 47.1897635109825, -1.63803584447327 47.1897658495174, -1.6380451132471 47.1897675764562, -1.63806704891294 47.1897716625983, -1.63850909573322 47.1898540104411, -1.6385341670281 47.1898587952282, -1.63854105080214 47.1898601084626, -1.63855415038013 47.1898626087298, -1.638571793392 47.1898659752187, -1.63857346429059 47.1898662942849, -1.63861148994517 47.1898735509444, -1.63863036296631 47.1898771524783, -1.63864134672621 47.1898792489204, -1.63864569803949 47.1898800796498, -1.63864903976028 47.1898807168821, -1.63864913384525 47.1898807347074, -1.6386679732362 47.1898843294841, -1.63867655883911 47.1898859677347, -1.63868676155738 47.1898879146069, -1.63870552709652 47.1898914961417, -1.63871563704921 47.1898934251329, -1.63872450901794 47.1898951184917, -1.63873543357463 47.1898972028993, -1.63874320194437 47.1898986858333, -1.63875557156826 47.1899010461632, -1.63878073699226 47.1899058487216, -1.63878595801537 47.1899068452527, -1.63879310530215 47.1899082091008, -1.63879949711863 47.189909428658, -1.63881341798858 47.1899120849451, -1.63881826127758 47.1899130093296, -1.63882167833293 47.1899136615354, -1.63883705636153 47.1899165959576, -1.63885546293993 47.1899201081695, -1.63885578557296 47.1899201699254, -1.63889342550872 47.18992735287, -1.63893093912961 47.1899345120711, -1.63896711921513 47.1899414160634, -1.63896845136524 47.1899416704152, -1.63898719407955 47.1899452474211, -1.63899668978671 47.1899470597338, -1.63901546334933 47.1899506417965, -1.63903671304573 47.1899546969083, -1.63905311541801 47.1899578269036, -1.63907187286827 47.1899614060039, -1.63912810501223 47.189972136802, -1.63914691222778 47.1899757255941, -1.63914882377163 47.189976090797, -1.63916562675607 47.189979297403, -1.63918436546682 47.1899828736384, -1.63920330715319 47.1899864885266, -1.63923830573978 47.1899931671428, -1.63924547591232 47.1899945354455, -1.63924770195333 47.189994960027, -1.63925404271798 47.1899961699084, -1.63926287573814 47.1899978557897, -1.63926544588063 47.1899983457638, -1.63928047846132 47.1900012138891, -1.63928964481175 47.1900029628932, -1.63929807049216 47.1900045706157, -1.63930670588903 47.1900062185231, -1.6393187193714 47.1900085111848, -1.63935291415321 47.1900150366201, -1.63935537951735 47.1900155073974, -1.63937916182263 47.1900200458267, -1.63942585131036 47.1900289552856, -1.63944603373333 47.1900328065492, -1.63946104618347 47.1900356709595, -1.63947688672761 47.1900386938404, -1.63948539844468 47.1900403178972, -1.63950391399646 47.1900438508359, -1.6395139420115 47.1900457641471, -1.63953149105883 47.1900491126639, -1.63954896888569 47.1900524478363, -1.63954909257659 47.1900524716733, -1.63956682987759 47.1900558567317, -1.63958446906517 47.1900592232246, -1.63961993151007 47.190065990215, -1.63964174991964 47.1900701537976, -1.63965577301896 47.1900728292835, -1.6396615210006 47.1900739261302, -1.63967439748163 47.1900763830254, -1.63968403304644 47.1900782220711, -1.6396942156881 47.1900801651625, -1.63973196884585 47.190087370299, -1.63973205650125 47.1900873901855, -1.63976917631098 47.190095900527, -1.63977930869734 47.1900982232195, -1.63979043652889 47.1901007742135, -1.63983514611725 47.1901110233326, -1.6398353902507 47.1901110792475, -1.63983553060866 47.190111112323, -1.6398356887165 47.1901111518901, -1.63986289486202 47.190118151611, -1.63986341685331 47.1901182864082, -1.63986530718077 47.1901187723086, -1.63987754052465 47.1901219202186, -1.63988447862558 47.1901237051781, -1.64004108169719 47.1901639953063, -1.64012683985942 47.190186216523, -1.64076405328809 47.1903753697034, -1.64121983476931 47.1905574444995, -1.64173376022276 47.1908607135734, -1.6417417290903 47.1908945454264, -1.64179958592786 47.1911629081792, -1.64066997955048 47.1912721097354, -1.63822136366507 47.1920198977397, -1.63687079624276 47.1924323214143, -1.63634132518095 47.1925939917501, -1.63516492963471 47.1926527010428, -1.63512070121026 47.1926549077463, -1.6351204156537 47.1926549228811, -1.63512020239614 47.1926549332943, -1.6351201036716 47.1926549381818, -1.63318369350028 47.1927515468249, -1.62768833774297 47.1930255343271, -1.6245653514231 47.193181121365, -1.62190749989474 47.1933134682038, -1.62072515510731 47.1933003960211, -1.62072424996183 47.1933003855966, -1.62071626143462 47.1933002971389, -1.61899235688386 47.1932812221491, -1.61899308150559 47.1932878036355, -1.61899856035895 47.1933375910394, -1.61909410825195 47.1942058187254, -1.61910234800489 47.1942826449807, -1.61910664217103 47.1943202617109, -1.61911221363454 47.194369101002, -1.61911340218078 47.1943807948173, -1.61911401958342 47.1943868858999, -1.61911593231443 47.1944097506399, -1.61911778997735 47.194431948962, -1.61913492036764 47.1946480699896, -1.61912583410824 47.1946683423119, -1.61906124585402 47.1948124544487, -1.61895875331533 47.1950411391474, -1.61869883008532 47.1956210769367, -1.61867132897502 47.1956165135083, -1.61866917795278 47.195621321933, -1.61866624494428 47.1956278784579, -1.61865668755073 47.1956492483236, -1.61865516903923 47.1956526435713, -1.61862452187615 47.1957171525164, -1.61861147022597 47.195740476016, -1.61860733526599 47.1957522668573, -1.61859202794445 47.1957965186677, -1.61859199511265 47.1957966128043, -1.61848385970823 47.196108041498, -1.61842755890682 47.1961693300169, -1.61820769149611 47.1964434618719, -1.6182072715209 47.1964439860984, -1.61804104560275 47.196651216722, -1.61801846806327 47.1966601277915, -1.61792160443595 47.1966899864021, -1.61791433921574 47.1967328116121, -1.61790751359566 47.1968157875592, -1.61791249043339 47.196832391493, -1.61791494297252 47.1968405615371, -1.61793364479191 47.1969131326678, -1.61793384403025 47.1969139068274, -1.61793385815116 47.1969139630301, -1.61793872420629 47.1969380975915, -1.61794185290886 47.1969574359781, -1.61794327072512 47.1969613817311, -1.61794859645584 47.1969761973201, -1.6179532936345 47.1969892656852, -1.61795334024774 47.1969893917695, -1.61795340484794 47.1969895423617, -1.61796089995295 47.1970064784364, -1.6179651454931 47.1970160713177, -1.61796518155349 47.1970161518693, -1.61797168737206 47.1970286861065, -1.61802028104983 47.1970981967051, -1.61806852379947 47.1971675159478, -1.61809587486989 47.1972068148342, -1.61809592472322 47.1972068867208, -1.61809598086179 47.1972069853882, -1.61810852465313 47.197229031383, -1.61810855590177 47.1972290868967, -1.61811179739486 47.1972359852569, -1.6181175414156 47.1972519662862, -1.61812093780806 47.1972644859234, -1.61812288760427 47.1972716741399, -1.61812957023003 47.1972963114392, -1.61812958551316 47.1972963657928, -1.61813659888391 47.1973336631698, -1.61813664040957 47.1973338831755, -1.61813987772375 47.1973511004536, -1.61814430167739 47.1973838846428, -1.61814430033455 47.1973840676247, -1.61814396393589 47.1973966878562, -1.61814377875565 47.1974036492653, -1.61814377552916 47.1974037494197, -1.61811225509333 47.1974603751045, -1.61811220241932 47.1974604691378, -1.6181054476224 47.1974726050306, -1.61809552317589 47.1974847188385, -1.61802986922397 47.1975571066571, -1.61801897815066 47.197571417527, -1.61800885869751 47.1975847151341, -1.61798888987035 47.1976151625912, -1.61797739506203 47.1976339528885, -1.61797244152251 47.1976420495766, -1.61795466508848 47.1976779984972, -1.61794100962407 47.1977123290418, -1.61794093473328 47.1977125176854, -1.61792665262885 47.1977484215611, -1.61792247582601 47.1977748491647, -1.61792246723844 47.1977749026763, -1.61792245773068 47.1977749913687, -1.61791793943299 47.1978170806909, -1.61791792961419 47.1978171657913, -1.61791710631817 47.1978571906995, -1.61791562461999 47.1979291436094, -1.61791464738701 47.1979765675126, -1.61791421996889 47.1979972834753, -1.61790465838954 47.1980822708091, -1.61789580714777 47.1981448168638, -1.61788932013428 47.1981906619451, -1.61788924741974 47.1981908757324, -1.61788626130983 47.1981996159759, -1.61788624745199 47.1981996696995, -1.61787458661611 47.1982455408611, -1.61786088140792 47.1982994547615, -1.61785302728628 47.1983303511486, -1.6178529394903 47.1983309557283, -1.61785082917825 47.1983456423891, -1.61785079846858 47.1983458526846, -1.61785123602968 47.1983585409018, -1.61785137923271 47.1983590190441, -1.61785375333891 47.1983669696667, -1.61785377397417 47.1983670400253, -1.61785379639351 47.198367115719, -1.61785383688659 47.1983672474562, -1.61786219642931 47.1983779796882, -1.61786588043345 47.1983827047725, -1.61786593540215 47.1983827746513, -1.61786600688529 47.1983828672949, -1.61808915325933 47.1984894404817, -1.6180896729969 47.1984897322646, -1.61809813220665 47.1984944995511, -1.6180992441591 47.1984951261585, -1.61809932896053 47.1984951741113, -1.61812041247069 47.1985050493733, -1.61813675471577 47.1985166481599, -1.61814633621112 47.1985218253653, -1.6181560966118 47.1985270990025, -1.61815628528236 47.19852720135, -1.61820793518756 47.1985612803081, -1.618208053014 47.1985613584716, -1.61820820618485 47.1985614478291, -1.61821216133911 47.1985637460885, -1.61823220004757 47.1985753881076, -1.61823227663309 47.1985754327863, -1.61823687122632 47.1985800311186, -1.618240672585 47.1985838359319, -1.61824932514923 47.198595202457, -1.61825500138795 47.1986057875865, -1.61825779373168 47.1986136051342, -1.61825860027767 47.1986178349969, -1.6182602154653 47.1986263036491, -1.61826016974458 47.1986319897659, -1.61826010436055 47.1986401817929, -1.61826010322498 47.1986402755552, -1.61825685675887 47.1986506960611, -1.61825683925976 47.1986507535357, -1.61825679582074 47.1986508931548, -1.61825379256591 47.1986605343188, -1.61822543765542 47.1987309585941, -1.61821645928403 47.1987532521656, -1.61821325176413 47.1987600765272, -1.61820867978163 47.1987698015186, -1.61820865522818 47.1987698538702, -1.61819025448501 47.1988048556118, -1.61817498307373 47.1988298704931, -1.61815304215814 47.1988713215837, -1.61811097357979 47.1989441853029, -1.61808118146018 47.1990021994145, -1.61806707342127 47.1990296725983, -1.61806527428753 47.1990335999666, -1.61806123917122 47.1990424103425, -1.61804172883636 47.1990850143913, -1.61802938779161 47.1991150757027, -1.61802099701392 47.1991355604934, -1.61801159751887 47.1991585044684, -1.61800039971583 47.1991889126783, -1.61798933874348 47.1992189468239, -1.61792910188588 47.1994380246258, -1.61789468826215 47.199590248479, -1.61788705432597 47.1996416464232, -1.61788483282965 47.1996566069859, -1.61786319076965 47.1997333068545, -1.61786314222263 47.1997334791191, -1.61785557669262 47.1997602899095, -1.61783894142048 47.1998192453524, -1.61783141551003 47.1998459184768, -1.6178145194276 47.1998455788975, -1.61766978131597 47.1998426667394, -1.61752230024238 47.1998396989128, -1.61748927459109 47.1998366945783, -1.61732847961611 47.1998220607923, -1.61714051603998 47.1998049545595, -1.61712949667574 47.1998060780575, -1.61706099752585 47.1998131040896, -1.61703931111954 47.1998153278893, -1.61701553737895 47.1998446332088, -1.61697659159115 47.1998926431632, -1.6169711823296 47.1999036047567, -1.61697002083827 47.1999059340043, -1.61694673699494 47.1999526130394, -1.61694670291383 47.1999526928074, -1.6169304555201 47.1999904678507, -1.61692089349664 47.2000175435739, -1.61690712875822 47.2000691519047, -1.61688514707199 47.2001435655158, -1.61687449906748 47.2001916665983, -1.61687041142515 47.200222415914, -1.61686839042142 47.2002376188917, -1.61686833008459 47.2002380673728, -1.6168660970901 47.2002642004582, -1.61686511105726 47.2002864103826, -1.61686424059978 47.2003069008263, -1.61686421538533 47.200418100134, -1.61686421334344 47.2004194816341, -1.61686407860478 47.200515807841, -1.61686786220247 47.2006419549601, -1.61687616663771 47.2007440054408, -1.6168786830776 47.2007806942993, -1.61687868743506 47.2007807599059, -1.61688626817957 47.2008298391762, -1.61688628665789 47.2008299609855, -1.61688632609814 47.2008302180212, -1.61689071914624 47.2008586951976, -1.61688855324239 47.2008821059992, -1.61688852341071 47.2008824334045, -1.61688819524618 47.2008859735869, -1.61688103935403 47.2009423263644, -1.61687912699877 47.2009797997692, -1.61687760831672 47.2010111297231, -1.61687617024386 47.2011136449586, -1.61692879051317 47.2011181972481, -1.61693080527599 47.2011187289906, -1.61693239922752 47.201119149696, -1.61693369142583 47.2011194906215, -1.61693501470628 47.2011198393082, -1.6169351967298 47.2011341598058, -1.61693694311424 47.2012322216085, -1.61693416732138 47.2013773190207, -1.61692541223429 47.2015129436925, -1.61691520135766 47.2016121738724, -1.61691471414689 47.2016169009176, -1.61690448016553 47.2016789662103, -1.61688446575777 47.2017745535825, -1.61684633202217 47.2019404738936, -1.61680060922157 47.202156038379, -1.6167660442356 47.2023860514782, -1.61676152303311 47.2024264421621, -1.61675985047846 47.2024413797016, -1.61675687662409 47.2024679372464, -1.61673775517358 47.2025006265051, -1.61671991568263 47.2025281927077, -1.61668425331814 47.2025761407042, -1.61655544623811 47.2027422500411, -1.61650725778874 47.2027978763384, -1.61650720378122 47.2027979397861, -1.61650523866998 47.2028002580823, -1.61650299523045 47.2028029047636, -1.61649896187395 47.2028076635491, -1.61649827566168 47.2028084733123, -1.61648964733001 47.2028186514572, -1.61648960649487 47.2028186990562, -1.61646462082829 47.2028459217553, -1.61646321923483 47.2028474487376, -1.61642737257402 47.2028865063856, -1.61639995342123 47.2029163806848, -1.61625940196733 47.2030538655569, -1.61609920537362 47.2032081069779, -1.61601444559373 47.2032897155885, -1.61597282630164 47.2033331214576, -1.61590728066574 47.2034014833108, -1.61590722022417 47.203401548819, -1.61578114326737 47.2035379770925, -1.61570415451224 47.2036232658834, -1.61568325037995 47.2036450257164, -1.61564824560849 47.2036814639147, -1.61549305061224 47.2038331441291, -1.61537021151602 47.2039575991935, -1.61537014828236 47.2039576630114, -1.61531338010893 47.2040149852566, -1.61528730142678 47.2040423642208, -1.61513476065785 47.2042025374421, -1.61513443705026 47.2042028775556, -1.6151342915974 47.2042030302844, -1.6151341837282 47.2042031436555, -1.61513390374874 47.2042034378606, -1.61513377046221 47.2042035783858, -1.61513371954984 47.204203631796, -1.61513349040512 47.2042038716928, -1.61496427491178 47.2043815531814, -1.61493931577659 47.2045343723102, -1.61493922420707 47.204534933783, -1.61492728328577 47.2046080492797, -1.6149272475839 47.2046081867835, -1.6149271200309 47.2046086686019, -1.61492697776408 47.2046092095844, -1.61492359139418 47.2046220893094, -1.61492178297064 47.2046289699449, -1.61492129862845 47.2046308141768, -1.61492004424759 47.2046355864546, -1.6149184286614 47.2046417312356, -1.61491762183621 47.2046447995322, -1.61491537940658 47.2046533268335, -1.61491526889176 47.2046537457899, -1.61491516039064 47.2046541574564, -1.61491210540414 47.2046657785158, -1.61490967423938 47.2046750279896, -1.61490921250942 47.2046767821019, -1.61490884549593 47.2046781791688, -1.61490854307162 47.2046793294366, -1.61490838198544 47.2046799432649, -1.6149044428021 47.2046949303958, -1.61490350757034 47.2046984859515, -1.61490345001513 47.2046986459606, -1.61490248226347 47.2047013215295, -1.61489764203412 47.2047147129498, -1.61489177982576 47.2047309326048, -1.61488678288249 47.2047447592553, -1.61488671672854 47.2047449421379, -1.61488664933458 47.2047451259714, -1.61488543257297 47.2047479647385, -1.61488259286719 47.20475458675, -1.61487740214261 47.2047666937445, -1.61486916509147 47.2047859077457, -1.61486831990204 47.2047876313127, -1.61486549604212 47.2047933822063, -1.61486536448703 47.2047936497192, -1.6148650980456 47.2047941920879, -1.61486185705163 47.2048007914792, -1.614859172415 47.204806256529, -1.61485894874056 47.2048067124737, -1.61485673306895 47.2048112251162, -1.61485650025181 47.2048116976484, -1.61485613270358 47.2048124468324, -1.61485444418117 47.2048158848802, -1.6148515391998 47.2048217985317, -1.61484796884992 47.2048290689763, -1.61484643868805 47.2048321825644, -1.61484614588902 47.2048327106733, -1.61484565737371 47.2048335899746, -1.614843941333 47.2048366794943, -1.61484170369264 47.2048407091188, -1.6148414462244 47.2048411718283, -1.61483878987825 47.2048459553961, -1.61483848778097 47.2048464982967, -1.61483801530399 47.2048473490186, -1.61483650171928 47.2048500735582, -1.61483375960123 47.2048550119611, -1.61482796970174 47.2048654363159, -1.61482650415397 47.2048680742195, -1.61482503070337 47.2048707277597, -1.61482245772318 47.2048753592918, -1.61482218320904 47.2048758542256, -1.61482213400877 47.2048759427104, -1.6148213492841 47.2048773565653, -1.61482111017848 47.2048777869976, -1.61482023038455 47.2048793704793, -1.61482018226885 47.2048794562171, -1.61482014112669 47.2048795308613, -1.61481793300145 47.2048831528945, -1.6148173910816 47.204884041551, -1.61481723712204 47.2048842946453, -1.61481666157413 47.2048852378193, -1.61481388130965 47.2048897965816, -1.61481378747692 47.2048899499385, -1.61480827328165 47.2048989917088, -1.61480674019169 47.2049015061701, -1.61480513186512 47.2049041444051, -1.61479819344062 47.204915522345, -1.61479814020953 47.2049156100907, -1.61479808814063 47.2049156959874, -1.61479803134495 47.2049157883819, -1.61479753343524 47.2049166049822, -1.61479728572028 47.2049170123314, -1.61479721032836 47.2049171343092, -1.61479714221745 47.2049172334663, -1.61479655758004 47.2049180868937, -1.61479550437993 47.2049196223763, -1.61479332413495 47.2049228026414, -1.61479002381835 47.2049276165953, -1.61478695820828 47.204932086801, -1.61478455480002 47.2049355914266, -1.61478044435703 47.2049415868659, -1.6147718571104 47.2049541115127, -1.61477176559864 47.2049542458528, -1.61477173266652 47.2049542931334, -1.6147500586981 47.2049819274463, -1.6147499817484 47.2049820161452, -1.61474966186039 47.2049823840424, -1.61474946348043 47.2049826127894, -1.61474910748095 47.2049830217872, -1.61474526781801 47.2049874401985, -1.61474461479076 47.2049881909433, -1.6147425873611 47.2049905243221, -1.6147402640657 47.204993197599, -1.61473932245714 47.2049942807402, -1.61473727689352 47.2049966337712, -1.6147361056754 47.2049979820582, -1.6147332905358 47.2050012211801, -1.61472826392061 47.2050070047301, -1.61472522505959 47.2050105006509, -1.61471803028474 47.2050187791283, -1.61471215225761 47.2050255421692, -1.61471110603327 47.205026745759, -1.61471084868105 47.2050270417566, -1.61470918561763 47.2050289558885, -1.61470624780429 47.2050323360088, -1.61470199207771 47.2050372334138, -1.61470014853348 47.2050393539462, -1.61469729371338 47.2050426388167, -1.61469376067944 47.2050467042796, -1.61468879899428 47.2050524131285, -1.61468565442874 47.2050560322439, -1.61468475846093 47.2050570621865, -1.61468462982353 47.2050572106343, -1.61468285602114 47.2050592508673, -1.61468114002822 47.2050612256985, -1.61468039687562 47.2050620809904, -1.61467805559586 47.2050647757142, -1.61467718489031 47.2050657767067, -1.61362428801146 47.2062886779408, -1.61353221672667 47.2063956129261, -1.61304776366656 47.2069582619274, -1.61304971238275 47.2069594497074, -1.61295168805814 47.2070829812481, -1.61264534415263 47.2074294577822, -1.61234849373213 47.2077651909468, -1.6120644023521 47.2080913616954, -1.6119993146873 47.2081660895211, -1.61196087965802 47.2082102181646, -1.61196080262127 47.2082103059635, -1.61170832163387 47.2085001796489, -1.61170826273208 47.2085002477959, -1.61169555868222 47.2085148325339, -1.61169505724149 47.208515410463, -1.61141516473027 47.2088380061829, -1.61141309756008 47.208840387943, -1.61141305431336 47.2088404383399, -1.61120011930257 47.2090872928438, -1.61075033906148 47.2096077070918, -1.61058427592491 47.2097998467029, -1.61041000015095 47.2100004050515, -1.61033725848043 47.2100858613043, -1.6099629641351 47.2105189472368, -1.60967908343127 47.2108474127006, -1.60954814313155 47.2109982698739, -1.60939285569961 47.2111771753934, -1.60915945587536 47.2111496223909, -1.60894669139533 47.2110929556768, -1.60892043211157 47.2110720575929, -1.60889628346813 47.2110528887331, -1.60886871373218 47.2110375292099, -1.6088474749656 47.211025556986, -1.60881318053782 47.2110050237213, -1.60878101379133 47.2109846880039, -1.60880552958384 47.2109371012186, -1.60882633551478 47.2108965775601, -1.60884817689918 47.2108557483121, -1.60886053730085 47.2108333479718, -1.60886232292024 47.2108306747925, -1.60886385770409 47.2108281901009, -1.60886704632251 47.210823037519, -1.60886858242379 47.2108205527743, -1.60887023618056 47.2108178839861, -1.60887177096368 47.2108153992943, -1.60887330582427 47.2108129155005, -1.60887746408713 47.210806557961, -1.60887912428723 47.2108039790253, -1.60888078448706 47.2108014000895, -1.6088824460047 47.2107988211008, -1.60888410620422 47.210796242165, -1.6088858982654 47.210793658838, -1.60888782218813 47.2107910711197, -1.60888900144541 47.2107891395624, -1.60804322752213 47.2106214642645, -1.60788695446229 47.2105941172999, -1.60353801466485 47.2101220171356, -1.60353481806892 47.2101216758063, -1.60353162015518 47.2101213345298, -1.60028174855053 47.2097826698067, -1.60027855067791 47.2097823284397, -1.60027547823575 47.2097818928381, -1.59975429619588 47.2097154786511, -1.59898522476925 47.2096609493437, -1.59898203465746 47.209660697741, -1.59897884322795 47.2096604461911, -1.59824050133735 47.2096067546953, -1.5982373112323 47.209606503072, -1.59823412623568 47.2096063413547, -1.59802492506645 47.2095942982994, -1.59670268229875 47.2096116892714, -1.59669951147143 47.2096117071655, -1.59669645965681 47.2096115409756, -1.59624929968602 47.2095846477281))
-Nantes;Hauts Pavés - Saint Félix;4;440109.0;POLYGON ((-1.55001720841912 47.2430116611122, -1.54959991782908 47.2429405741813, -1.54919534900917 47.2426724092005, -1.54876702145472 47.2426113590045, -1.54678303887262 47.2422877361157, -1.54677982670783 47.2422872135525, -1.54678073233336 47.2422851115767, -1.54764685821579 47.2403796652229, -1.54985715287139 47.2379946108323, -1.54987189742889 47.2370143620592, -1.54876633642551 47.2355050620376, -1.54876488783931 47.2355031406465, -1.54871649629021 47.2353172038741, -1.54863721987703 47.2350307161217, -1.54824607365439 47.2335322059495, -1.54817062831309 47.2330522567115, -1.54821852950404 47.2325956231701, -1.54849862616533 47.2319932722395, -1.54906140098563 47.2313814843104, -1.55236647842323 47.2284852540636, -1.55220104000158 47.2279827625616, -1.55231494874548 47.2279127208654, -1.5528733353403 47.228094825544, -1.55389461437574 47.2273291980947, -1.55351887356923 47.2255491676066, -1.55325724039635 47.2254221729216, -1.55323625027588 47.2253389384915, -1.55342257384395 47.225152065371, -1.55338103882442 47.2249008267108, -1.55338061225532 47.2248985891364, -1.55338019203861 47.2248964414175, -1.55316291715296 47.2239227542877, -1.55312600721823 47.2237569233052, -1.55296815904991 47.2230495422913, -1.55293268854731 47.2228907789852, -1.55253038258306 47.2229254274918, -1.55250411004335 47.2228349846982, -1.55286937676814 47.2227345753645, -1.55276226514388 47.2221540094223, -1.55275184270279 47.2217123075424, -1.55286946823517 47.2215317160425, -1.55298146859513 47.2213428475389, -1.5543290078582 47.2206333022327, -1.55457843260485 47.2207217965325, -1.5547922277131 47.2206020844881, -1.55491943035937 47.2205405976801, -1.55512559001213 47.2205867782562, -1.55514309349967 47.2205711460715, -1.55515190095484 47.2205631926073, -1.55518621155745 47.220600493392, -1.55522708618465 47.2205808301065, -1.55527600202558 47.2205572021415, -1.55563292047847 47.2209784690484, -1.55564752175546 47.220995629382, -1.55566542349393 47.2210163712364, -1.55569325961147 47.2210428112262, -1.55569925914224 47.2210435094814, -1.55574629598836 47.2210303930071, -1.55577052241076 47.2210181362149, -1.55592881530089 47.22088786692, -1.55618656009464 47.2207090248083, -1.5562329797018 47.2206692688785, -1.55649177684577 47.2208320189577, -1.55688835489224 47.2207243238259, -1.55718890696782 47.2206450898374, -1.55845859452584 47.2203054222004, -1.55848853517064 47.2202972046089, -1.55854783448206 47.2202636774413, -1.55856673734778 47.2201655847477, -1.55856577748081 47.2201614742849, -1.55856457632412 47.2201522372591, -1.55856427143715 47.2201335132632, -1.55856436438196 47.2201093724213, -1.5585679924983 47.2200847506641, -1.55857278164047 47.2200706290333, -1.55857276891921 47.2200704493228, -1.55857515961155 47.2200633431568, -1.55858119612136 47.2200481871409, -1.55859099728703 47.2200320941662, -1.55860405522989 47.2200171523612, -1.55861762648193 47.2200056151756, -1.55863631291994 47.2199935451732, -1.55865733358818 47.2199844587994, -1.55868317942389 47.2199762892344, -1.55875509872453 47.2199617900949, -1.55880147943451 47.219952387353, -1.55882829155367 47.2199484189697, -1.55885529544365 47.219945254839, -1.55888114986719 47.2199444710178, -1.55890337594061 47.2199465119134, -1.55890804386005 47.2199470745276, -1.5589220744589 47.2199491226357, -1.55893782510743 47.2199530037424, -1.55895201861836 47.2199572971731, -1.55896559869008 47.2199622430021, -1.55897855880792 47.2199677495784, -1.55899089897201 47.2199738169022, -1.5590028957592 47.2199806169143, -1.55900956596607 47.2199850756013, -1.55901011888893 47.2199854167883, -1.55901344829044 47.2199875562503, -1.55902392750666 47.2199953085642, -1.55903366760394 47.2200038056708, -1.55904168058315 47.2200121812045, -1.55904369753983 47.220014454759, -1.55904932473983 47.2200209300063, -1.55905582014672 47.2200302578435, -1.55906154470322 47.220039882096, -1.5590661014248 47.2200498158183, -1.55906960443331 47.2200597850587, -1.55907192556455 47.220069884111, -1.55907333759329 47.2200801940578, -1.55907328972214 47.2200813664576, -1.55911826067401 47.2200689486763, -1.5591214926513 47.2200679382313, -1.5591645517412 47.2200528831759, -1.55916583106333 47.2200522998572, -1.55919221985116 47.2200406899357, -1.55920939480005 47.2200332636153, -1.55921079328643 47.2200324962513, -1.55925479424074 47.2200085822229, -1.55925695085328 47.2200073387309, -1.55929675910359 47.2199821250617, -1.55929827031343 47.2199810828987, -1.56018500120218 47.21935720116, -1.56022770239333 47.2193209016372, -1.56036377976704 47.2192216396681, -1.56058946914875 47.2190567502743, -1.56068340659693 47.2189906168968, -1.560743393687 47.2189484180151, -1.56076056944047 47.2189373897944, -1.56084665430067 47.218892327141, -1.5609246468918 47.2188523119258, -1.56096245118707 47.2188232025263, -1.56109502644546 47.2187212654789, -1.5622793873598 47.2178990590101, -1.56233148203776 47.2178628909564, -1.56238003586212 47.2178289134907, -1.56240636494188 47.2178455882311, -1.56241121874104 47.217848664536, -1.56247276728886 47.2178896353891, -1.56263476600922 47.2179974622849, -1.56263587325505 47.21799814547, -1.56314271059278 47.218320918542, -1.56319155559948 47.2183580856991, -1.56323828842401 47.218402529183, -1.56324514387291 47.2184130130073, -1.5632705650948 47.2184517856985, -1.56328787222367 47.2184933524353, -1.56329173709383 47.2185028593636, -1.56329898875634 47.218531615776, -1.56331115242066 47.2185334554792, -1.56333216995513 47.2185134697469, -1.56336437189592 47.2184909446167, -1.56339859287361 47.2184761858657, -1.563487269353 47.2184540011074, -1.5635935248595 47.21842635828, -1.56382380387469 47.2183663267373, -1.56544548872875 47.2179438736794, -1.56553414989716 47.2179197063993, -1.56559299821986 47.2179036634101, -1.56561762333339 47.2178950838777, -1.56566582184804 47.2178653505501, -1.56567151374387 47.2178618254187, -1.5661743659998 47.2175514479786, -1.56640408813009 47.2174095571279, -1.56643356253038 47.2173913565684, -1.56647279797585 47.2173674208732, -1.56712153818817 47.2169712165954, -1.56713912667596 47.2169604430533, -1.56714039308735 47.2169596799357, -1.56723337052689 47.2169077141795, -1.56723464323369 47.2169070400177, -1.56733433307459 47.2168555001715, -1.56737182996765 47.2168519581186, -1.56742484417822 47.2168324399747, -1.56766304810105 47.2167443785799, -1.56766537303093 47.2167435751597, -1.56777814427374 47.216706465422, -1.56831930884681 47.2165175013873, -1.56832021147645 47.2165172005647, -1.56874201324996 47.2163754629652, -1.56881543402435 47.2163508188557, -1.5688711295935 47.2163314582525, -1.56937895231353 47.216154829276, -1.56937921607003 47.2161548205843, -1.56951665279586 47.2161053091297, -1.56954886043555 47.2160919693326, -1.56958274300215 47.2160762299731, -1.57065132810373 47.2155393196399, -1.57065260719214 47.2155387361927, -1.57065375564488 47.2155381561424, -1.57067975052982 47.2155266473668, -1.57068013200361 47.2155264537697, -1.5707094296284 47.2155167247474, -1.57073849469392 47.2155110553557, -1.57204216199075 47.2153732745651, -1.57208222408346 47.2153679527772, -1.57211966507242 47.2153574964025, -1.57214001480185 47.215346538213, -1.57214891067318 47.2153416434787, -1.57216830726392 47.2153266647321, -1.57223592427621 47.2152569994642, -1.57228198170111 47.2152090445558, -1.57233517686214 47.215153907626, -1.57233542014547 47.2151536294162, -1.57236470612376 47.215123815175, -1.57244813384158 47.2150388478715, -1.57279581479637 47.2146823958303, -1.57281214745554 47.2146617656837, -1.5728239575891 47.2146403685674, -1.57282483192772 47.2146367933789, -1.57284156378955 47.214578522406, -1.572841932742 47.2145701185866, -1.5728446797688 47.214552003667, -1.57284691715411 47.2145367510713, -1.5728470476543 47.2145358826328, -1.57285565143007 47.2144785660596, -1.57294268811916 47.21446689058, -1.57291190374471 47.2145142899243, -1.57290500806921 47.2145319104432, -1.57289385609623 47.2145508502285, -1.57298240940809 47.214740512006, -1.5729814977376 47.2147407222178, -1.5729836588692 47.2147423590439, -1.5730784538369 47.2148363659314, -1.57308143774857 47.2148728357915, -1.57298678482606 47.2150306899427, -1.57302978760262 47.2151661862741, -1.5731530471869 47.2152498920182, -1.57343260849023 47.2152990179882, -1.57357173983304 47.2155304599448, -1.57393009887803 47.2158093907138, -1.57410453989685 47.2159091609257, -1.57450494852786 47.2161524406961, -1.57449550063844 47.2162257970895, -1.57443228732808 47.2163320797849, -1.57435786458157 47.2166839653474, -1.57406861559909 47.2168332214761, -1.57393524581784 47.2168558123674, -1.57386415492654 47.216888559715, -1.5737813350383 47.2169681026548, -1.57375323244556 47.2170530302092, -1.57370450355059 47.2173841147655, -1.57351911245438 47.2176168388156, -1.57357907847714 47.2177535923257, -1.57356104285041 47.2178686189181, -1.57359620245883 47.2179035173142, -1.57373709982436 47.2179610402339, -1.57380339321335 47.2180150002331, -1.5738739434241 47.2181155400125, -1.57404204000212 47.2182387617302, -1.57415442243702 47.2183009646876, -1.57415862689466 47.2183032463958, -1.57416321079723 47.2183045091797, -1.57431460411164 47.2183614269094, -1.5744720957436 47.2183904408571, -1.57448683334499 47.2185686594981, -1.57470465222506 47.2186173100701, -1.57473019664641 47.2186502969745, -1.57464385207038 47.2187850832824, -1.57465256093037 47.2188828775254, -1.5748961404636 47.219076120306, -1.57499275022574 47.2190817947675, -1.57495924171046 47.2189725578627, -1.57500881385726 47.2189203619806, -1.57507092682798 47.2189147898438, -1.57520139659449 47.2189826907346, -1.57526196285308 47.2189980547284, -1.57534134480499 47.2189458480157, -1.57541556334587 47.2189341111843, -1.57558671903672 47.2191262504204, -1.57565003001874 47.2191417076198, -1.57579628626757 47.2190193475073, -1.57593476626084 47.2191209409872, -1.57603993746169 47.2190492799192, -1.57624291765321 47.2191193755248, -1.57627980886038 47.2192175579796, -1.57633204329736 47.2192529196806, -1.5763614458534 47.219286770774, -1.57635894241869 47.2193340903034, -1.57632033245255 47.2194031842695, -1.57631452515994 47.2194515518434, -1.57635881316952 47.219473995864, -1.57654941252891 47.2194500384161, -1.57669814732215 47.2194904764064, -1.57679766238367 47.2195348642684, -1.57689517417731 47.2195521721391, -1.57702911523342 47.2196143811579, -1.57736227899697 47.2197885504016, -1.57757617196042 47.2198946805269, -1.57802191320347 47.2200417690174, -1.57807752940829 47.2200644141809, -1.57827281242031 47.2202157996474, -1.57853114015105 47.2203063179577, -1.57867840833752 47.2203936488829, -1.57883243558747 47.2204916818622, -1.57887852574082 47.2205603701015, -1.57889743063188 47.220690391726, -1.57886446940098 47.2208251347509, -1.57876177071557 47.2209460948959, -1.5786492838637 47.2210314789968, -1.57860142490275 47.2210908385415, -1.57860230045477 47.2211428596296, -1.57876303609084 47.2212871441414, -1.57885120911306 47.2214277738766, -1.57892956661176 47.2215699518614, -1.57901037709085 47.2216108566684, -1.57910721457434 47.2215800084024, -1.57933887482141 47.2215672041878, -1.57948328318979 47.2215596444549, -1.57976597835084 47.2216372375882, -1.57992481282093 47.221649335194, -1.57998946853497 47.2216011834834, -1.58000042320027 47.2215586359708, -1.58024248479995 47.2214575920983, -1.5811556986477 47.2216073799363, -1.5813262108049 47.2216618901181, -1.58153091448674 47.2216902886267, -1.58167434601122 47.2217089877953, -1.58171119605882 47.2217068429387, -1.58183206796288 47.2216821693407, -1.58192783867977 47.2216808746765, -1.58196050659321 47.2216918425676, -1.58200273804114 47.2217238704343, -1.58203932673965 47.2217684206019, -1.58208458241381 47.2218160275334, -1.58210419517939 47.2218488243329, -1.58209992092811 47.2218755914944, -1.5820817458868 47.2219000549346, -1.58203267155562 47.221959213096, -1.58200608708477 47.2219998360789, -1.582003592412 47.2220138998269, -1.58201039751486 47.222034443592, -1.5820471931784 47.2220810913593, -1.58207338338501 47.2221151008624, -1.58208248504081 47.2221429275495, -1.58206084949775 47.2221898238595, -1.58204256050802 47.2222273666837, -1.58197448305133 47.222289249063, -1.58197702351523 47.2223298554687, -1.5821220220136 47.2224641243307, -1.58212398140707 47.2224658537563, -1.58212633751823 47.2224674898615, -1.58227807726002 47.2225771087644, -1.5824784801389 47.2226075578973, -1.58376314291953 47.2226726605994, -1.58398940759793 47.2227184677711, -1.58433390893966 47.2228893220405, -1.58444015633566 47.2229734355168, -1.5845338795981 47.2230796822526, -1.58461196899134 47.2232399896104, -1.58464366840454 47.2232665771689, -1.58476826426103 47.2232692416179, -1.58483358365264 47.2233001604573, -1.58450710658548 47.2238974157914, -1.5845059312428 47.2238994369987, -1.58450476215032 47.2239015462638, -1.58365166099956 47.2253919561803, -1.58365048690972 47.2253939773256, -1.58364932054162 47.2253960882721, -1.58307754116793 47.226409536104, -1.58307636703396 47.2264115572429, -1.58307519930264 47.2264136682356, -1.58295583954644 47.2266235352011, -1.58257521182726 47.2270608810826, -1.58249883015883 47.2271192308794, -1.58249657522347 47.2271209283823, -1.58249444454926 47.2271225326211, -1.58214520142011 47.227390920811, -1.58159171920633 47.2276907200735, -1.58151287450882 47.2277175733155, -1.58151004379169 47.2277185746903, -1.58150721183342 47.2277195770156, -1.5809087155689 47.2279304245795, -1.58090587381977 47.2279314209718, -1.58090286948645 47.2279319724013, -1.57999068371915 47.2281087573325, -1.57998768987332 47.2281094002303, -1.57998455764563 47.2281099567342, -1.57902807759955 47.2282946614232, -1.57902495050585 47.2282953087054, -1.57902195016473 47.2282958608261, -1.57823008386915 47.2284480373137, -1.57822695168049 47.2284485946677, -1.57822395000407 47.2284491468201, -1.57706413629903 47.2286687509573, -1.57706100400803 47.2286693073815, -1.57705800362556 47.2286698594509, -1.57533070823905 47.2289985493274, -1.57532757583353 47.2289991048063, -1.57532457409625 47.228999656883, -1.57401922633251 47.2292545686232, -1.5740161003632 47.2292552148186, -1.5740130999162 47.2292557668085, -1.57340158632286 47.2293756729849, -1.57339846033888 47.2293763191635, -1.57339532796822 47.2293768754877, -1.57252341541345 47.2295378091417, -1.57252041493522 47.2295383610926, -1.57251771020526 47.229539353616, -1.57226970408423 47.2296309127127, -1.5722668701474 47.2296319103723, -1.57226433048481 47.2296333468615, -1.57103851323645 47.2303126320335, -1.57103596720257 47.2303139795389, -1.57103342755139 47.2303154168987, -1.5701607670505 47.2308060477704, -1.57015822742943 47.2308074860086, -1.57015568773112 47.2308089233488, -1.56987249275437 47.2309668114298, -1.56986994658284 47.2309681580112, -1.56986740686912 47.230969595345, -1.56851544873106 47.2317462087603, -1.5685130409376 47.2317476426171, -1.56851050115034 47.2317490799207, -1.56596103677606 47.2332035718834, -1.56595862869444 47.2332050038901, -1.56574293655006 47.2332882323045, -1.56574010595739 47.2332893188639, -1.56495655524014 47.2335790951426, -1.56495372461603 47.2335801816824, -1.56495089399181 47.2335812682222, -1.56451386005508 47.2337572775082, -1.56451116265308 47.2337583596445, -1.5645083320104 47.2337594461734, -1.56335293746742 47.2341851931775, -1.5633501080969 47.2341862796254, -1.56335013301817 47.2341884403198, -1.56338090074372 47.2360581136936, -1.56338093335629 47.2360603641893, -1.56338095827958 47.2360625248827, -1.56338191454874 47.2363477380853, -1.56338194584289 47.2363499886332, -1.56338197076646 47.2363521493265, -1.56338016988513 47.2368172314146, -1.56338020249803 47.2368194819099, -1.5633794295491 47.2368215796802, -1.56326733704134 47.2371343044856, -1.56312721292237 47.2373273756461, -1.56292927785533 47.2375274452259, -1.56292743039241 47.2375293090346, -1.56292570849088 47.2375310786502, -1.56180406043575 47.2386696562247, -1.56180222616836 47.2386715050706, -1.56180087943071 47.2386729750308, -1.5615815276733 47.2389125563661, -1.56157982183051 47.2389144064166, -1.561577975201 47.23891617285, -1.56093589454136 47.239554196665, -1.56082054779287 47.2396312712499, -1.56081829528313 47.2396328717628, -1.56081603516464 47.2396343833714, -1.56067912943885 47.2397240851924, -1.56039710849024 47.239858190042, -1.56004605066876 47.2399814007849, -1.5600432132395 47.2399823973474, -1.56004036944455 47.2399833040551, -1.55879718706474 47.2403934394775, -1.5587942189698 47.2403944402906, -1.55879137645042 47.240395346915, -1.55860267517256 47.2404571106489, -1.55859970319142 47.2404581125119, -1.55859685554448 47.2404590211368, -1.55817858301915 47.2405972507015, -1.55817819356288 47.2405973535554, -1.55810280727866 47.2406303038805, -1.55803948576792 47.2406445765987, -1.55803896444828 47.240644684683, -1.5570095701346 47.2409858359786, -1.55700672988109 47.2409868316726, -1.55700344431711 47.2409871223681, -1.55667049954799 47.241014201992, -1.55666734592108 47.2410144883466, -1.55666710677021 47.2410166585994, -1.55659146616771 47.2415642827517, -1.55654613980403 47.2421158380141, -1.55628689408551 47.2421067766075, -1.55628367035356 47.2421066151934, -1.55628066264099 47.2421070768639, -1.55575723755902 47.2421900497514, -1.55502146525668 47.2424187134395, -1.55483668821845 47.2424227690304, -1.55483233838274 47.2424231018473, -1.55482899835016 47.2424231279191, -1.554545355759 47.2424236816928, -1.55393200440556 47.2426151128867, -1.55309055129333 47.2427664403516, -1.55140989068647 47.2429422134256, -1.55109810813314 47.242918555012, -1.55067968397188 47.2429379254043, -1.55001720841912 47.2430116611122))
-Nantes;Nantes Sud;11;440109.0;POLYGON ((-1.52769982017493 47.2012134300016, -1.52698062398377 47.2005882107763, -1.52662289141387 47.20027721608, -1.52680337207501 47.2001786112994, -1.52689763760142 47.2001271096369, -1.52689769825732 47.2001270766093, -1.52807678688395 47.1996965503792, -1.52845059355904 47.1995275457325, -1.52853396975054 47.1992903425291, -1.52853096425412 47.1989061565037, -1.52868264496645 47.1986949118074, -1.52978654052854 47.1981463868951, -1.53061633349961 47.1977340485558, -1.53085178341517 47.1975270636715, -1.53105801286499 47.1969891020753, -1.53105804848702 47.1969890078598, -1.5306179435243 47.1968667151414, -1.5306158814761 47.1968661423432, -1.53061542246033 47.1968660144849, -1.5306131383798 47.1968653801657, -1.53061120625163 47.1968648427883, -1.53009660944906 47.1967218483821, -1.53009650973672 47.1967218261857, -1.52936470052924 47.196557718227, -1.52936457943141 47.1965576932695, -1.52936400222153 47.1965575745747, -1.52782955044488 47.1962415882213, -1.5278294185794 47.1962415609837, -1.52782934466496 47.1962415467786, -1.52752331382585 47.1962244223569, -1.52718062970509 47.196258299057, -1.52718046716577 47.1962583153781, -1.52530634625074 47.1964488923611, -1.52463374040491 47.1965172807553, -1.52463360801582 47.1965172940824, -1.52462689694735 47.1965161168746, -1.5246950314055 47.1963702532632, -1.52503945948538 47.1956603392736, -1.52514572775886 47.195440262986, -1.52525082466785 47.195222610624, -1.52528411996712 47.1951536565251, -1.52533409085499 47.1950501670316, -1.52533427515825 47.1950497840246, -1.5254895812524 47.1947067024134, -1.52552008165108 47.1946393253132, -1.52551973503723 47.1946286650136, -1.52551962072901 47.1946251364612, -1.525518458313 47.1945893426007, -1.52551845112192 47.194589117619, -1.52551844214651 47.1945888404462, -1.52551363572329 47.1944402648175, -1.52551373654988 47.1944372152582, -1.52551378300753 47.1944357996628, -1.52551814051502 47.194303836967, -1.52551912668635 47.1942739846999, -1.52552104780651 47.1942158266021, -1.52552111705116 47.1942137135885, -1.52552000421236 47.1942085745561, -1.52547565002664 47.1940036431185, -1.52540817945324 47.1936919137205, -1.52540762527646 47.1936893549281, -1.52540739804045 47.1936862714455, -1.52540699427748 47.1936807800789, -1.5254066978847 47.193676756813, -1.52540083043696 47.1935970189713, -1.52540070960329 47.1935953765955, -1.52542769615022 47.1931357683926, -1.52542779729927 47.1931340469834, -1.52543461701734 47.1930193722612, -1.52543471589918 47.1930177176198, -1.52543500780415 47.1930147389196, -1.52553813362585 47.1919634542289, -1.52553778979436 47.191963343437, -1.5255356085297 47.1919626400971, -1.52526240709726 47.1918745292786, -1.52449574809462 47.1916272683529, -1.5243970017908 47.1915991725652, -1.52432954179762 47.1915799355301, -1.52404955237862 47.1914861767453, -1.52404246671588 47.1914837546078, -1.52326108143355 47.1912166536128, -1.5221813175964 47.1908664224152, -1.52217378854208 47.1908637419113, -1.52161568796954 47.1906650603538, -1.52161325505635 47.1906641938523, -1.52119537488115 47.1905153978026, -1.52113606172739 47.1904942783905, -1.52112903923693 47.1904918653089, -1.51994559864846 47.1900852229233, -1.51994041026133 47.1900837377303, -1.51984176698781 47.1900554972078, -1.5198412887755 47.1900553601537, -1.51938121800784 47.1899233577288, -1.51937756571975 47.1899225292774, -1.51932209780942 47.1899099437875, -1.51930334976055 47.1899056900243, -1.51921586830501 47.1898858408214, -1.5189981953544 47.1898364522321, -1.51880804299012 47.1897933073019, -1.51873485570133 47.1897767011232, -1.51872638299243 47.1897752974064, -1.51827126978586 47.1896998873873, -1.51792003709604 47.1896559429059, -1.51791790895228 47.1896556770537, -1.51720536923113 47.1896109130433, -1.51667748621243 47.189572395069, -1.51571714103639 47.1895061052891, -1.51468233439953 47.1894658030944, -1.51467968727169 47.1894655738132, -1.51374545887831 47.189384697738, -1.51372431454619 47.1893831864111, -1.51283183754985 47.189328440786, -1.51282659588781 47.1893258535863, -1.51283119028181 47.1892999154597, -1.51288134397486 47.1890168025157, -1.51288335577787 47.1890093347871, -1.51293128220907 47.1888727341237, -1.51301977693087 47.188568951889, -1.51301480749027 47.1885505206855, -1.51300707243375 47.188521865832, -1.51299760283367 47.1885105487631, -1.51296962819535 47.1884771202148, -1.51271652180733 47.1881746701689, -1.51267905770514 47.1880442467912, -1.5126736472916 47.1879365853765, -1.51268544080888 47.1877806900251, -1.51268527768823 47.1877805585767, -1.51268520386725 47.1877804984051, -1.51268501521069 47.1877803463353, -1.51262912100656 47.187777407679, -1.5126200869377 47.1877768617761, -1.51257927232363 47.1877732014307, -1.51249437334686 47.1877655866409, -1.51248831586861 47.1877650408512, -1.51248579195741 47.1877648138878, -1.51244281846169 47.1877609446194, -1.5124426492569 47.1877609287446, -1.51243097070334 47.1877598866823, -1.51242204624433 47.1877590895665, -1.51240388835553 47.1877574678324, -1.51239535545735 47.1877567057812, -1.51239447115385 47.1877566270107, -1.5123315367709 47.18775171233, -1.51234083592259 47.187721233583, -1.51235254295418 47.1876828597628, -1.51236317417465 47.1876430496024, -1.51236320716459 47.1876429239602, -1.51237763866286 47.187588881846, -1.51238135516331 47.1875749406233, -1.51240291636925 47.1875376994992, -1.5124091413373 47.1875269124681, -1.51237258645654 47.1874886977073, -1.51232157459016 47.1874712519541, -1.51225395721505 47.1874502059614, -1.51219693284658 47.1874323540523, -1.51219125783451 47.1874321103849, -1.51218573809292 47.1874318741295, -1.51216403576406 47.1874309440353, -1.51211867370927 47.187432007203, -1.5120393712371 47.1874541420385, -1.51200431877404 47.1875256064667, -1.5119551620413 47.1876180133978, -1.51195065541311 47.1876222858239, -1.51195054287469 47.1876223929675, -1.51194942083478 47.187623457063, -1.51189038227699 47.187616828393, -1.51181995746439 47.1876089091046, -1.51181002506411 47.1876079461201, -1.51178739901304 47.1876057529412, -1.51176774610664 47.1876038474711, -1.51155031149874 47.1875819370475, -1.5115451325777 47.1875738842489, -1.51153767004127 47.1875622566218, -1.51131933656359 47.1876324470478, -1.51130821377811 47.1876360225506, -1.5112986364652 47.1876391021055, -1.51125715523346 47.1876524388211, -1.51125702529327 47.1876524808709, -1.51123669735867 47.1876346216728, -1.51123660598434 47.187634541466, -1.51123665270562 47.1876344531287, -1.51124115948501 47.1876258836075, -1.51124233126655 47.187623657009, -1.5112424132062 47.1876235006098, -1.51127340217932 47.1875770102426, -1.51127394412124 47.1875761978197, -1.51127410959209 47.1875759507356, -1.51127439105225 47.187575527893, -1.51133906323016 47.1874785072423, -1.51133911364916 47.1874784313745, -1.51134562838592 47.1874685520944, -1.51134762109961 47.187465530039, -1.51134921441393 47.187463114771, -1.51134937142196 47.1874628770298, -1.51135491096615 47.1874549075618, -1.51135497341944 47.1874548177052, -1.51136713043087 47.1874371991913, -1.511374358745 47.1874267242012, -1.51137439175782 47.1874266769501, -1.51137446951399 47.1874265648667, -1.51137457546924 47.1874264111278, -1.51137465555629 47.1874262953486, -1.51137471800952 47.187426205492, -1.51137479211743 47.1874260971563, -1.51137484276407 47.1874260239826, -1.51137493939551 47.187425885027, -1.5113749747393 47.18742583408, -1.51137501474486 47.1874257757414, -1.51137506772248 47.1874256988719, -1.51137516187104 47.1874255618159, -1.5113853125626 47.1874108514566, -1.51138552447287 47.1874105439787, -1.51138607898023 47.1874096769982, -1.51139317655148 47.1873985782101, -1.51140399445378 47.1873816610786, -1.51140420228615 47.1873813366409, -1.51143134735642 47.1873397224109, -1.51143139653363 47.1873396474929, -1.51148878395731 47.1872519091486, -1.51158946891966 47.1870979725559, -1.51159830103195 47.187086770436, -1.51159877969436 47.1870861632351, -1.51161029553852 47.1870705612149, -1.51161551205044 47.187063492865, -1.51161930556543 47.1870583528324, -1.51161953203981 47.1870580456826, -1.5116199019247 47.1870582464962, -1.51173925824542 47.1871229489322, -1.51178796048658 47.1871493493639, -1.51191263939881 47.1872169375446, -1.51191306463855 47.1872171677185, -1.51191364071426 47.1872174153908, -1.51212596927845 47.1873085969194, -1.5121629422781 47.1873244744231, -1.51233853589019 47.1873998804551, -1.51233997462001 47.1874004978863, -1.51234058647017 47.1874007621714, -1.51234102749558 47.1874010070411, -1.51234125215024 47.1874011315658, -1.51235375390035 47.1874080783144, -1.51235898976378 47.1874103963414, -1.51235946625803 47.1874106073788, -1.51236003891761 47.1874108614908, -1.51236048242787 47.1874110576059, -1.51236067261521 47.1874108996537, -1.51242962214987 47.1873536898934, -1.51248929880908 47.187304174686, -1.51251841106525 47.187271763681, -1.51251914070546 47.1872710141548, -1.51252008225441 47.1872698165839, -1.51256236336789 47.1872160041568, -1.51256241586185 47.1872159372173, -1.51261710952864 47.1871463306035, -1.51264858435127 47.1871232571053, -1.51265005911305 47.1871221755311, -1.51268269632102 47.1870982498824, -1.51272060036385 47.1870706183734, -1.51274422712387 47.1870533939603, -1.51274872762741 47.1870501128979, -1.51274880357948 47.1870500576508, -1.51279738539689 47.1870146402131, -1.51279745879019 47.1870145859676, -1.51285992666352 47.1869690443759, -1.51285998746511 47.1869690131518, -1.51287158282957 47.1869749484535, -1.51289970813813 47.1869933252848, -1.51310515081146 47.1871275577979, -1.51320121091743 47.1871903219891, -1.51327499585595 47.1872345397166, -1.51339088011726 47.187304306711, -1.51339136337694 47.1873045976722, -1.51339146509044 47.1873046594498, -1.5133918508166 47.187304891172, -1.51340298398054 47.1873115951763, -1.51341215641846 47.1873171048873, -1.51346802181909 47.1873506711057, -1.51352915198819 47.1873874578958, -1.51355732032872 47.1874044164327, -1.51355884388433 47.187405333268, -1.51359321391002 47.1874260260956, -1.51364907401377 47.1874596987667, -1.51365585790441 47.1874637687872, -1.51365597897339 47.1874638406162, -1.51367273452874 47.1874738988981, -1.51370309558064 47.1874921678154, -1.51370318057473 47.1874922194376, -1.51375615030594 47.187524050429, -1.51390336040096 47.1876126930686, -1.5139047693581 47.1876116618215, -1.51390484406848 47.1876116075235, -1.5139062231566 47.1876105981752, -1.51400651912698 47.1876712588219, -1.51405443809288 47.1877001913834, -1.51423526915419 47.1876011797278, -1.5142353613698 47.1876011292465, -1.51444325613369 47.1874872992093, -1.51455991360827 47.1874234560298, -1.51473417918664 47.1873280842868, -1.51491317924899 47.1872301274243, -1.51492556485303 47.187223422984, -1.51492940651688 47.1872212291886, -1.51494674627656 47.187211326668, -1.51494682073195 47.187211284994, -1.51495305180805 47.1872077447483, -1.51521099295975 47.1870867690347, -1.5152117529642 47.1870863787175, -1.5152199147947 47.1870814767028, -1.51522272969569 47.1870797855262, -1.51522387048622 47.1870791000023, -1.51522395355461 47.187079050781, -1.5152388393781 47.1870716541608, -1.51523892057194 47.1870716140238, -1.51524470427926 47.1870687383159, -1.51525426758701 47.1870639821058, -1.51529783599058 47.1870368585374, -1.51531396579388 47.1870291057132, -1.51561301810032 47.186856683477, -1.51592049171786 47.1866791534735, -1.515931326672 47.1866728703419, -1.51598021946897 47.1866446359577, -1.51602607792151 47.1866179518071, -1.51612145530207 47.1865624535009, -1.51612155480993 47.1865623955226, -1.51624021156769 47.1864886160544, -1.51641503061789 47.1863756833714, -1.51660911407948 47.1862420790251, -1.51667875853294 47.1861798923178, -1.51667952534232 47.1861792079777, -1.51667968437764 47.1861790413318, -1.51672875929586 47.1861275999252, -1.51675758251651 47.1860973850475, -1.51680886575487 47.1860380589597, -1.51684466982598 47.185995742089, -1.51685373607273 47.1859851033705, -1.5168538070273 47.1859850203843, -1.51686065422304 47.1859769117504, -1.51682204799759 47.1859502278544, -1.51679490882595 47.1859315040802, -1.51672521251565 47.1858834216245, -1.51672505253302 47.1858833116834, -1.51669108251724 47.1858598693299, -1.51653878655839 47.1857548518152, -1.51667290617492 47.1856670376159, -1.51667865283722 47.1856626810457, -1.51670579755315 47.1856421014376, -1.5168338666762 47.1855450081503, -1.51691261647752 47.1854854130017, -1.5169493732434 47.1854574754934, -1.51696234326101 47.1854483149537, -1.51697978807305 47.1854352776795, -1.51698986283721 47.1854277475491, -1.51700510243589 47.1854163576809, -1.51700650128092 47.1854184084028, -1.51706774083134 47.1855083225506, -1.51707096812621 47.1855058527996, -1.51707501622118 47.1855037111704, -1.51709763502632 47.185489404316, -1.51712256208116 47.185473637013, -1.51716634093022 47.1854443418194, -1.51716579990926 47.185414538127, -1.51717393512739 47.1853810581796, -1.51718150915202 47.1853651763326, -1.51719523709958 47.1853363870468, -1.51719526073269 47.1853363383607, -1.51722183894496 47.1852919803902, -1.51723451827424 47.1852708183641, -1.51731885403708 47.1851326949007, -1.51743246846217 47.1849466199469, -1.51753723279707 47.1847750370555, -1.51753255721099 47.1846511454845, -1.51753180539433 47.1846308418147, -1.51753039585778 47.1845927348099, -1.51752865783437 47.1845457851418, -1.51752666395301 47.1844941438261, -1.51748869489458 47.1844328335942, -1.51744349425478 47.1843597292925, -1.51744328899455 47.1843593967712, -1.51744309911234 47.1843590897754, -1.51741227843557 47.1843092434668, -1.51737154311729 47.1842433565771, -1.51737142850456 47.1842431736679, -1.51736665104857 47.1842355297014, -1.51731930871362 47.1841587306159, -1.51732069387002 47.18415702987, -1.5173215833306 47.1841559370231, -1.51732685949406 47.1841492886165, -1.51732774317758 47.1841481743715, -1.51733471861734 47.1841393830516, -1.51726357931705 47.1840045111641, -1.51723521821557 47.1839507421311, -1.51723458485096 47.1839495055773, -1.51722669015982 47.1839344532499, -1.51722644900055 47.18393399329, -1.51722638913516 47.1839338794096, -1.51718354610181 47.1838540198259, -1.51718351273626 47.1838539535597, -1.51717689207452 47.1838409920022, -1.51716992129352 47.1838273450029, -1.51716073702884 47.1838000430908, -1.51715987286579 47.1837929587476, -1.51715805306914 47.1837730268947, -1.51715824283548 47.1837715218693, -1.51715915965936 47.1837642430896, -1.51715924793832 47.1837636467197, -1.51715946422881 47.1837621739896, -1.51715974717197 47.1837602553162, -1.51717422286008 47.1837227413765, -1.51717838923075 47.1837119458338, -1.51721636989745 47.1836157499698, -1.51725302825483 47.1835226697214, -1.51724296956742 47.1835189279347, -1.51724284536257 47.1835188814626, -1.51723539723117 47.1835161109949, -1.51721931505967 47.1835101283572, -1.51713430549488 47.1834785047998, -1.51709276083214 47.1834630196915, -1.51705624253469 47.1834494091919, -1.51704778406951 47.1834463036339, -1.51703851122182 47.1834428985355, -1.51704048061923 47.1834316767556, -1.51704061418476 47.1834309128091, -1.51704073984888 47.1834301960284, -1.51704671625976 47.1834071550728, -1.51705070373047 47.183391780193, -1.51706180285882 47.1833652118326, -1.517087459406 47.1833201404307, -1.51711268592408 47.1832879260115, -1.51712240386857 47.1832755153482, -1.51714418920006 47.1832487066323, -1.51714093636478 47.1832475794753, -1.51713765348566 47.1832464408859, -1.51713735079074 47.1832463311557, -1.51713538353952 47.183245621053, -1.51713315447955 47.1832448158301, -1.51715224851116 47.1832236995837, -1.51717557117011 47.1831885433335, -1.51721781685634 47.1831275830378, -1.51733356248475 47.1829605589236, -1.5174085285933 47.1828523802446, -1.51745692820534 47.1827742773928, -1.51745983034619 47.182769593005, -1.51752216414506 47.1826690036384, -1.51753234388556 47.1826525749595, -1.51756301247713 47.1826030846899, -1.51780211605344 47.1822172312916, -1.51789215426209 47.1820278466735, -1.51789222819427 47.1820276896823, -1.51798564101759 47.1818312024382, -1.51773355045818 47.1817119839089, -1.51761686119041 47.1816567989228, -1.51755857858293 47.1816292354842, -1.51756782598987 47.1816120217218, -1.51760345891669 47.1815478722246, -1.51760349100785 47.1815478141948, -1.51772677314536 47.1813248848985, -1.5177731145143 47.1812410852442, -1.51779992606935 47.181192582858, -1.51788141469277 47.1810451671671, -1.51789571014072 47.1810251415912, -1.51789828516883 47.1810227605518, -1.51791311390422 47.1810090484212, -1.51792602183782 47.1809991693114, -1.51793585997572 47.1809952237662, -1.51794072089889 47.1809932744569, -1.51794590399222 47.1809903384215, -1.51794732907431 47.1809895317431, -1.51794919671928 47.1809884733686, -1.51795610624253 47.1809845593047, -1.51795794120015 47.180983739195, -1.51796488360176 47.1809806347888, -1.51797113069354 47.1809778406848, -1.5179798072576 47.1809694797198, -1.51798634944305 47.1809577787504, -1.51800220953316 47.1809202732075, -1.51800944154867 47.1809031720701, -1.51802180455187 47.1808739362362, -1.51812585000897 47.1805919161862, -1.51812586938341 47.1805918640631, -1.51812617362496 47.1805910402327, -1.51812626501871 47.1805910582603, -1.51830587916448 47.1806259371614, -1.51830595708235 47.1806259521152, -1.51834409049789 47.1806320612413, -1.51835954860061 47.1806345379166, -1.51837166938982 47.1806364800903, -1.51837187302453 47.1806365126213, -1.51865701203178 47.1806748451925, -1.51878570466793 47.1806916498543, -1.51878945044283 47.1806921385253, -1.51940564103364 47.1807725985591, -1.51951084805946 47.180786747303, -1.51964560864731 47.180803426515, -1.52000844861996 47.1808424804531, -1.52002684098841 47.1808444602037, -1.52005218351176 47.18084718804, -1.52039090584093 47.1808836440283, -1.52039112312996 47.1808836661063, -1.520695799692 47.1809148861737, -1.52094463662165 47.1809427490506, -1.52103353395388 47.1809540805982, -1.52115091799458 47.180969043932, -1.52218238251933 47.1811105124085, -1.52218249499051 47.1811105296025, -1.52226135647104 47.1811225592985, -1.52249781246744 47.1811586270003, -1.52263619250552 47.1811797348469, -1.52266973613276 47.1811848511498, -1.52267014581764 47.1811849133986, -1.52291277687182 47.1812272317916, -1.52302160048837 47.1812462123366, -1.52302168909829 47.181246228668, -1.52359707101527 47.1813527450378, -1.523994445973 47.1814256570497, -1.52399456680557 47.1814256793187, -1.52401547324755 47.1814295759262, -1.52403234722769 47.1814327214034, -1.52437433190674 47.1814964638471, -1.52460998444835 47.1815387565016, -1.52476918581402 47.1815673290116, -1.52482665572322 47.1815776430973, -1.52482673085753 47.1815776563544, -1.52492138943791 47.1815934703964, -1.52493718979513 47.1815961102254, -1.52495438031488 47.1815989817836, -1.52495502647967 47.1815990896661, -1.5252092439059 47.1816388957432, -1.52547771585501 47.1816809361301, -1.52547870572341 47.1816810917301, -1.52547953486105 47.1816812221303, -1.52596251581997 47.1817583201609, -1.52596281473747 47.1817583696459, -1.5261405111402 47.1817876139434, -1.52668599171123 47.1818785544893, -1.52693858646819 47.1819225657333, -1.52712237474884 47.1819501355876, -1.52712265183112 47.1819501769203, -1.52714970273247 47.1819551299509, -1.52719468783765 47.1819633672965, -1.52722468016161 47.1819688593625, -1.52729648669855 47.1819802638079, -1.52729786388455 47.1819810276515, -1.52730416167349 47.1819845195545, -1.5273050590234 47.1819850175888, -1.52730619489809 47.1819856476816, -1.52731720708523 47.1819874596603, -1.52768966408704 47.1820487335555, -1.52818355118493 47.1821542425699, -1.52818527139967 47.1821546099176, -1.52839926027014 47.1822046464612, -1.52840273574265 47.1822055915182, -1.52867009038706 47.1822782743155, -1.5288241040061 47.1823201439509, -1.52882675968592 47.1823208663413, -1.52961438830347 47.1825474001739, -1.53003201662921 47.1826733764175, -1.53089919111789 47.1829556019336, -1.53100667613043 47.1829924610109, -1.53117771208113 47.1830511129233, -1.53123197233056 47.1830715903099, -1.53123369415315 47.1830722404854, -1.53127838062187 47.1830926425715, -1.53129554573091 47.1831017865416, -1.5316958907778 47.1833145273139, -1.53170151033616 47.1833175132398, -1.53170680515272 47.1833204570219, -1.53204972224292 47.1835111226152, -1.53210809210946 47.1835435765265, -1.53212481249659 47.1835552609315, -1.53215722780471 47.1835753173554, -1.53220544282121 47.1836051500165, -1.5322724386482 47.1836500565968, -1.53230465701494 47.1836716516731, -1.53235323902961 47.1837042153388, -1.53237016327985 47.1837155600689, -1.53244903403647 47.1837684253246, -1.53245084054075 47.1837696362075, -1.5324524335901 47.1837709014738, -1.53252879032099 47.1838315250288, -1.53253917881865 47.1838400831206, -1.53257973062808 47.1838734864257, -1.53259956248344 47.1838898226552, -1.53263385328552 47.183919193118, -1.53263405706518 47.1839193670863, -1.53269219950341 47.183972126257, -1.53311839741376 47.1843729396481, -1.5331186655462 47.1843732020821, -1.53334879074066 47.184598748694, -1.53342230716198 47.1846753192774, -1.53358147242057 47.1848380712828, -1.5339255423157 47.1851898910191, -1.53395411150161 47.1852191032908, -1.5339547209718 47.18521977394, -1.5341566442608 47.1854418845625, -1.53420051617399 47.185490142787, -1.53420100866524 47.1854906810936, -1.53430740022505 47.1856069241149, -1.53445158338032 47.1857644586495, -1.53451541171791 47.1858341974066, -1.53461548842071 47.185943539677, -1.53461941224835 47.1859478269305, -1.5346202372976 47.1859548587126, -1.53462037036532 47.1859559888019, -1.53462698271263 47.1859601220866, -1.53463057720722 47.1859623697165, -1.53463165624491 47.1859630443386, -1.53463669536868 47.1859661936339, -1.53463921500717 47.1859677691795, -1.53464227459512 47.1859714363992, -1.53480223761057 47.1861628094264, -1.53483208951402 47.186200740035, -1.53483255313155 47.1862013272367, -1.5348339510288 47.1862030939698, -1.53495094562148 47.1863682348721, -1.5349523209166 47.1863702331707, -1.53495246253151 47.1863704375246, -1.5349784312409 47.1864085062024, -1.53505691679695 47.1865419172168, -1.53505770779178 47.1865436655757, -1.53505788666961 47.1865440594839, -1.53510558570172 47.1866494741751, -1.53510648518571 47.1866517057255, -1.53512171067712 47.1866894905964, -1.53512206436605 47.1866903704823, -1.53512266638361 47.1866918704038, -1.53522594757771 47.1869906452326, -1.53526902700224 47.1871152666567, -1.53530408022602 47.1872243328673, -1.53530519790303 47.187227809182, -1.53530568847367 47.1872293351318, -1.53535682581496 47.1874281628377, -1.53535724901209 47.1874297824573, -1.5354296677248 47.1877065983723, -1.53543048457421 47.1877098009336, -1.53544600540008 47.1877706729972, -1.53546247350417 47.187835255175, -1.53546315179709 47.187837916262, -1.535463378022 47.1878388047878, -1.53552306047665 47.1880215261066, -1.53552427963901 47.1880250452655, -1.53554025104304 47.1880711598366, -1.53554415235122 47.1880824240284, -1.53554663113596 47.1880895805892, -1.5355471358314 47.1880910393011, -1.53554793630737 47.1880933495497, -1.5356332290713 47.1883101807544, -1.53563330824364 47.1883103812675, -1.53566209731695 47.1883835782814, -1.53573234167308 47.1885539970925, -1.53573610680165 47.1885631302268, -1.5357383683651 47.188568617578, -1.53585090145091 47.1888054771262, -1.53592471888986 47.188939883118, -1.53592663296761 47.1889432576753, -1.53596012633997 47.1890023156949, -1.53597129699976 47.1890220122675, -1.53600292115455 47.18907777144, -1.53601907082603 47.189106247707, -1.53602143591183 47.1891104181062, -1.53602395728906 47.1891145300674, -1.53604080308016 47.1891420056701, -1.53606187085847 47.189176368902, -1.53611046405665 47.1892556250662, -1.53619849510587 47.1893992043964, -1.5362358166398 47.1894600763064, -1.53623622634537 47.1894607440272, -1.53623751554597 47.1894628475369, -1.53629147291406 47.1895362248412, -1.53629286835014 47.1895380231952, -1.5364117219431 47.1896912323218, -1.53641230327629 47.189691913083, -1.53641266292462 47.1896923340865, -1.53644339276706 47.1897283031884, -1.53649646332587 47.1897904223634, -1.53649689610071 47.1897909260782, -1.53649803618469 47.1897922551529, -1.53654326115906 47.1898406574224, -1.53654387229917 47.1898413000613, -1.53666243269691 47.1899658818859, -1.53666257316296 47.1899660259121, -1.53678539263377 47.1900917062104, -1.53680113500999 47.1901078159962, -1.53680570719945 47.1901126803808, -1.53687360029082 47.1901849173943, -1.53687764354069 47.1901892196897, -1.53687903429465 47.1901906983434, -1.53693035971024 47.1902301271193, -1.53694083633751 47.1902381749935, -1.53694137304169 47.1902386106234, -1.53713522082156 47.1903960186138, -1.53713545669786 47.1903962120315, -1.53734966201952 47.1905720817436, -1.53734997902457 47.1905723431387, -1.53735636510349 47.1905776142761, -1.53754128947912 47.1907302265637, -1.53754158403237 47.1907304726265, -1.53754153258081 47.1907306602805, -1.53754110651606 47.1907321936216, -1.53754051653168 47.190734317335, -1.53753957854763 47.1907376955765, -1.5375384987517 47.1907415822202, -1.53753844730021 47.1907417698742, -1.53762716265316 47.1908088168646, -1.53774117909911 47.190901355104, -1.53774961455082 47.190907998637, -1.53787346653451 47.1910055462749, -1.53821353539907 47.1912733860476, -1.53822074640577 47.1912789047635, -1.53827690374825 47.1913218886349, -1.53830577346001 47.1913439849933, -1.53832068635645 47.1913554003796, -1.53842689868491 47.1914366948331, -1.53843329813101 47.1914415301727, -1.53845280592988 47.1914562708483, -1.53847646981989 47.1914741514317, -1.53848657901871 47.1914817902051, -1.5385789490337 47.1915515853918, -1.53861715953609 47.191580457866, -1.53863079202466 47.1915907587561, -1.53863597659905 47.1915946761706, -1.53875117652665 47.1916746409621, -1.53875424719378 47.1916767533079, -1.53875626019072 47.1916781334522, -1.5388491561594 47.1917418443509, -1.53891929411325 47.1917899483094, -1.53901340200809 47.1918544906153, -1.53901799345018 47.1918574177628, -1.53913018560333 47.1919289589958, -1.53915254500909 47.1919432173723, -1.53929234953069 47.1920323647503, -1.53929588293968 47.1920346173737, -1.53961498004303 47.1922110239382, -1.53962976842964 47.192219199342, -1.53963159986396 47.1922201541386, -1.53975738566388 47.1922857355162, -1.53976698825023 47.1922907414716, -1.53992282453424 47.1923719897294, -1.54018639642147 47.1925094072658, -1.5402432076296 47.1925354540225, -1.54045464528137 47.1926387341699, -1.54080004814918 47.192821866311, -1.54080043181707 47.1928220718976, -1.54115255293343 47.1930103960182, -1.5411544669518 47.1930114196114, -1.54141594264385 47.1931512638678, -1.54166937626117 47.1932894199528, -1.54185469287464 47.1933904413115, -1.54185760829107 47.1933920938705, -1.54208596606918 47.1935215402601, -1.54209317754962 47.1935256278372, -1.54233575632398 47.193687143434, -1.54249222687029 47.1937906126714, -1.54289400824178 47.1940829708509, -1.54315555602029 47.1942715773892, -1.54338004743071 47.1944317343349, -1.5433853055346 47.1944355297057, -1.54375528852101 47.1947026133727, -1.5437612002911 47.1947070361344, -1.54383605112812 47.1947630325781, -1.54384229286081 47.1947681162787, -1.54402337206786 47.1949156020103, -1.5440267315847 47.1949183380525, -1.54403770226065 47.194927273175, -1.54404654359557 47.1949344742137, -1.54420552899322 47.1950639639265, -1.54422938552842 47.1950755445333, -1.54426938388234 47.1950950463854, -1.54428202141564 47.1951011239838, -1.54429915826023 47.1951093662725, -1.54433626843119 47.19512728841, -1.5443377339121 47.1951279954118, -1.54434732544903 47.1951326275105, -1.54434934242159 47.1951336010253, -1.5443516907369 47.195130581385, -1.54456975342798 47.1948501388979, -1.54469286136111 47.194692734504, -1.54469370182554 47.1946916604927, -1.54469396878856 47.1946913183294, -1.54491094512499 47.1946403448539, -1.54491105527639 47.1946403188674, -1.54494297590626 47.1946328197255, -1.5449430614077 47.1946327992202, -1.54497402490415 47.1946251910867, -1.54497411683996 47.1946251685245, -1.54497420358238 47.1946251470689, -1.54518610227271 47.1945730774293, -1.5454173493003 47.194517370492, -1.54587587817363 47.1944069105259, -1.546230471893 47.1943208982673, -1.54630780619493 47.1943021390196, -1.54656399857742 47.1942399939031, -1.54665616796075 47.1942180454814, -1.54670483099274 47.1942064577665, -1.54677242195671 47.194190361995, -1.54677259039838 47.194190321984, -1.54700419481853 47.1941351679433, -1.54700516523639 47.1941349366772, -1.54700523358914 47.1941350096602, -1.54700544290623 47.1941352320448, -1.54702449547685 47.1941555553593, -1.54703556609487 47.1941673642858, -1.5470577930397 47.1941910724532, -1.54710588967582 47.1942423741003, -1.54713597064389 47.1942744593332, -1.54716601681282 47.1943065080926, -1.54717696975176 47.1943181919139, -1.54717719362323 47.1943184299411, -1.54717807599139 47.1943194762813, -1.54717819799175 47.1943196048081, -1.54722496997767 47.1943691972795, -1.54722501797215 47.1943692485419, -1.54759550160976 47.1947623999343, -1.54759579573768 47.1947627487133, -1.54766250188112 47.1948334538268, -1.54781407941838 47.1949943798034, -1.54781468703023 47.1949950252323, -1.54782578742462 47.1950073807684, -1.54782606502687 47.1950076752359, -1.54783631750198 47.1950185514554, -1.54783648904832 47.1950187338855, -1.54783692511437 47.1950191968842, -1.54799118813873 47.1951828456551, -1.54799554652907 47.1951874486945, -1.54814642383257 47.1953491616458, -1.54814758505604 47.1953503771475, -1.54819470609558 47.1954002897543, -1.54819560123488 47.1954012373648, -1.54819670423053 47.1954024056137, -1.54819751367552 47.1954025033006, -1.54821947711193 47.1954051410553, -1.54822902703563 47.1954062882325, -1.54841388152158 47.1954284928611, -1.54842265314207 47.1954800572054, -1.54842270321714 47.1954803498732, -1.54842289472488 47.1954814794432, -1.54842296439401 47.1954817848508, -1.54843530131298 47.1955355029799, -1.5484353228325 47.1955357553295, -1.54843533960395 47.1955359520006, -1.54843535195088 47.1955360037738, -1.54844770058678 47.1955880607552, -1.54846196429428 47.1956481884864, -1.54846217040871 47.1956490552647, -1.54846256410442 47.1956505714953, -1.54846342251936 47.1956544058031, -1.54846349318452 47.1956547228852, -1.54846362294954 47.1956552989378, -1.54846384474926 47.1956562876409, -1.54846836325785 47.1956754015505, -1.54852964248229 47.1959346109099, -1.54853501681643 47.1959573420683, -1.54853977543962 47.1959774727875, -1.5485398874059 47.1959779486247, -1.54854675499798 47.1960069975321, -1.54855454875421 47.1960399618622, -1.54855456742808 47.1960400413181, -1.54855524803637 47.1960429221235, -1.54855602012206 47.1960457749754, -1.54860235877483 47.1962419053454, -1.54860318447597 47.1962453868259, -1.54860645664726 47.1962589535309, -1.54860815400225 47.1962664553163, -1.54861294582671 47.1962869902018, -1.54861391860068 47.1962906460702, -1.54861631408916 47.1962988933183, -1.54861634212364 47.1962989895237, -1.54861878403068 47.1963073935219, -1.54868006577406 47.1964570670721, -1.54871783045969 47.1965495529907, -1.54871820148951 47.1965504312561, -1.5487189901673 47.1965523003764, -1.54880525945339 47.19676332386, -1.54882325903405 47.1968073517958, -1.54882346606738 47.1968078572059, -1.54882430115586 47.1968098983944, -1.5488246988302 47.1968108720189, -1.54882473230426 47.1968109544927, -1.548135697895 47.1974341340337, -1.5481359401609 47.1974346650813, -1.5481360604819 47.1974349288351, -1.54823760840459 47.1976571091346, -1.54842901798659 47.1980758986468, -1.54842904226898 47.1980759508482, -1.54842906678103 47.1980760057438, -1.54843453914584 47.1980879786874, -1.54843578097695 47.1980906966911, -1.54843594831824 47.1980910622054, -1.54630520609587 47.1983546377178, -1.54514110187669 47.1985986717037, -1.54352089253646 47.1990243184186, -1.54414600940499 47.1999271852287, -1.5440059310743 47.1999654976002, -1.54420702675651 47.2001782210241, -1.54404319696959 47.2002243594551, -1.54395450330092 47.2001493466919, -1.54385940059507 47.2000096112382, -1.54363339944733 47.2000676600002, -1.54351794462172 47.2000992881092, -1.5429476489634 47.1991905195449, -1.53545738425385 47.2014940923614, -1.53536215573207 47.2015332289199, -1.53536114810711 47.2015320919299, -1.53450669909487 47.2005315063549, -1.53441175747656 47.200574595531, -1.53425734004281 47.2004000978587, -1.53410722749692 47.2004569289358, -1.53426522229266 47.2006443662805, -1.53410723932868 47.2007202863366, -1.5349321496625 47.2016816060381, -1.53042771446365 47.2034993587315, -1.5304248847319 47.2035004444293, -1.53042220079054 47.2035017054882, -1.53014936503561 47.2036233458072, -1.52933696118566 47.2027398276553, -1.52920881040992 47.2026003993821, -1.52920876691245 47.2026003542427, -1.52909405374003 47.2025164129761, -1.52862655109191 47.2021743220073, -1.52850682945646 47.2020417447612, -1.52850670400923 47.2020416064401, -1.52841786548945 47.201943229074, -1.52841779839349 47.2019431551301, -1.52804883731062 47.2015380687417, -1.52803309160861 47.2015234221264, -1.52786406160506 47.2013661976535, -1.52769987877451 47.2012134817544, -1.52769982017493 47.2012134300016))
-Nantes;Doulon - Bottière;10;440109.0;POLYGON ((-1.4940689469221 47.2603075287597, -1.49413905663852 47.2599399634397, -1.49415079662306 47.2597528137755, -1.49415597641745 47.2595914160038, -1.49418242192557 47.2594342343213, -1.49420014322695 47.2592740617307, -1.4942057179408 47.2591769808154, -1.49420552480396 47.2591756170058, -1.49420351624051 47.259161518801, -1.49420344740056 47.2591610322356, -1.49420060859701 47.2591415008707, -1.49419519469738 47.2590334110703, -1.49418485852573 47.2589469536262, -1.49418571043111 47.258902141146, -1.49419302589996 47.2588570732457, -1.49420386943881 47.2587973635906, -1.49421501970616 47.2587177256678, -1.49423405250794 47.258678312183, -1.49424143446555 47.2586630259814, -1.49424419911055 47.2586572981884, -1.49425796134025 47.258640769591, -1.49428089525717 47.258613226852, -1.49428289483546 47.2586108240228, -1.49432628759362 47.2585902049318, -1.49447354474814 47.258541017633, -1.49465645510922 47.2584798939896, -1.49465905409605 47.2584789958544, -1.49466003916885 47.2584786554914, -1.49466057025632 47.2584784716386, -1.49471325415666 47.2584621257592, -1.49471639463996 47.2584611514857, -1.494717060158 47.2584609452564, -1.49471769398742 47.258459798694, -1.49486348204254 47.2581960745015, -1.49486495294148 47.2581934139172, -1.49486579443738 47.2581914032579, -1.49486648709867 47.2581897462149, -1.49486652889076 47.2581896454677, -1.49486656311586 47.2581895648391, -1.49486720750997 47.2581880259159, -1.49488705078373 47.2581405948022, -1.49494359014948 47.2580054481808, -1.49494594605533 47.2579985163602, -1.49495864674224 47.2579611596009, -1.49496775011712 47.2579583582186, -1.4949679010442 47.2579583117702, -1.49497940504466 47.257954771373, -1.49499748143751 47.2579492079408, -1.49499865663389 47.2579488466239, -1.49500057093921 47.2579482572763, -1.49500242612182 47.2579460574036, -1.49500333212844 47.2579449839905, -1.49503685877656 47.257905226082, -1.49503706690403 47.2579049791708, -1.49503711380323 47.2579049232751, -1.49510660325867 47.2578225189676, -1.49514791146567 47.2577735347379, -1.49514915306773 47.2577720625596, -1.49515058373735 47.2577707136363, -1.49517425452017 47.2577484002543, -1.49519703885309 47.2577269216456, -1.49519831381381 47.2577257193711, -1.49519990025816 47.2577247265676, -1.49520801115422 47.257719652845, -1.49522894317517 47.257706556838, -1.49529863075986 47.2576629590667, -1.49529989615095 47.2576621139718, -1.49541464992314 47.257585528531, -1.4954154330079 47.2575849590904, -1.49552354905626 47.2575063003713, -1.49558567892475 47.2574610995323, -1.49558597566955 47.257460883393, -1.49562015492619 47.257429197285, -1.49562052812216 47.2574288520116, -1.49564980245353 47.2574017123984, -1.49568618955053 47.2573749712479, -1.49571085613932 47.257355256996, -1.49571124548078 47.2573549462308, -1.4958292667925 47.2572606210425, -1.49594762572399 47.2571575984084, -1.49605450194179 47.2570690817195, -1.49613578577934 47.2569862513573, -1.49614717054115 47.2569734916782, -1.49616444110712 47.2569541351019, -1.49625478826526 47.2568783385318, -1.49631806348894 47.2568847834807, -1.49640454659004 47.2569215861763, -1.49647696896333 47.2569360527661, -1.49653392827667 47.2569115691217, -1.49656461965644 47.2568737867321, -1.49656481906518 47.256866584225, -1.49656579696281 47.2568313013701, -1.49654718458825 47.2568004953336, -1.49651970407362 47.256764987763, -1.4965155243583 47.2567327133782, -1.49651960216149 47.2567104813775, -1.49653053106762 47.2566737406144, -1.49653475590944 47.2566438738585, -1.49653940019879 47.2566110425303, -1.49655556076512 47.2565874124835, -1.4965639025754 47.2565752151033, -1.49660025323846 47.2565480227276, -1.49663840543415 47.2565155347995, -1.49664153959677 47.2564833932615, -1.49664486069564 47.2564493270223, -1.49664992696983 47.2564215591708, -1.49664781576141 47.2563400960425, -1.49663426823497 47.2562516954989, -1.49663816597387 47.2562082324043, -1.49663818771898 47.2562079882761, -1.49663820455113 47.2562077956986, -1.49663823034507 47.2562075054596, -1.49663916826783 47.2561970420716, -1.49664026594276 47.2561847865966, -1.49664737713337 47.2561326073839, -1.4966489497266 47.2561253673715, -1.49664935111189 47.2561235216808, -1.49665786201502 47.2560843517101, -1.496705900202 47.2559808372878, -1.49677342560576 47.2558588993812, -1.49688123858792 47.2556874505012, -1.49689039180717 47.2556688916174, -1.4968992566146 47.2556249332199, -1.49694145818638 47.2555925146804, -1.49696562006896 47.2555739542414, -1.49696932237456 47.2555195873099, -1.49696934019118 47.2555193280177, -1.49696935938769 47.2555190380366, -1.49696939142735 47.2555185709515, -1.49696939640092 47.2555184887633, -1.49697259132681 47.2554715634519, -1.49697389162191 47.2554524432151, -1.49694165263998 47.2553370196125, -1.49691885105327 47.2551609488725, -1.49692392137583 47.2551360857463, -1.49693448166078 47.2550842914324, -1.49693538072103 47.2550501631464, -1.49693538367846 47.2550500413919, -1.49693538519508 47.2550499809636, -1.49693576788919 47.2550354333045, -1.49693649451315 47.2550078072779, -1.49689937329066 47.2549678105505, -1.49690701176972 47.2549234514079, -1.49702165197888 47.2548909440418, -1.49708452377467 47.2548675811271, -1.49710765662003 47.2548468524822, -1.49712288356127 47.2547544418903, -1.49712460015969 47.2547281349717, -1.49712550161765 47.2547143247759, -1.49712749930652 47.2546837125565, -1.49712625148676 47.2546493465949, -1.49712549940283 47.254628646058, -1.4971445891119 47.254599246418, -1.49705869510364 47.2544470896819, -1.49704966382934 47.2544310443278, -1.49704637154021 47.254424368577, -1.49704477839911 47.2544211412563, -1.49704008777536 47.2544116333223, -1.49702598305991 47.2543830495344, -1.49702523915249 47.2543815423873, -1.49701351546305 47.2543579003842, -1.497006260634 47.2543432713172, -1.49698353408411 47.254301908595, -1.49698343258105 47.2543017251525, -1.49698338727983 47.2543016431293, -1.49693481571751 47.2542133433848, -1.4969502415194 47.2541609333958, -1.49695575154723 47.254066287313, -1.49695144978845 47.2540512102214, -1.49694804700369 47.2540392893994, -1.49691532011479 47.2540215581725, -1.49686228826712 47.2539953389852, -1.49684915598166 47.2539730216304, -1.49684606751336 47.253967772338, -1.49685193403261 47.2538851878987, -1.49686128312114 47.2538414826369, -1.4968696793879 47.253802230594, -1.49685381398837 47.2537332459802, -1.49684061851497 47.2536758720757, -1.49680969122476 47.2535625361588, -1.49680076916963 47.253529844519, -1.49677468897739 47.2535020986741, -1.49676645441273 47.2534933420883, -1.49669795845829 47.2534892642627, -1.49665644180497 47.2534598931916, -1.4966551170994 47.2534316527243, -1.49669523556151 47.2533566483887, -1.49668510848014 47.2533119039759, -1.49668512610154 47.2532635198544, -1.49667932666062 47.2532607229027, -1.49664842957197 47.2532458339549, -1.4966298097255 47.2532368619672, -1.49662650045367 47.2532352677717, -1.49660960277425 47.2531808751312, -1.49666374582044 47.2531387502593, -1.49666513959548 47.2531359782264, -1.49667201671296 47.2531223009562, -1.49665644364356 47.2530961478927, -1.49662059169135 47.2530958377181, -1.49659420341131 47.2530956104946, -1.49655470366026 47.2530729164011, -1.49655681721421 47.2529662429354, -1.4965913044614 47.2529217352955, -1.49653421702904 47.2528615265878, -1.49645667842354 47.2527816655198, -1.49645396946954 47.2527622516197, -1.49645065137011 47.2527384735422, -1.49643254226411 47.2527042203119, -1.4964446018264 47.2526746452861, -1.49642395698262 47.2526056241586, -1.49643528615938 47.2525564334821, -1.49636014296289 47.252495306543, -1.49635444109445 47.252490669465, -1.49634560886893 47.2524612792574, -1.49635042985619 47.252389820193, -1.49635706962891 47.2523509063046, -1.4963501527611 47.2523182443144, -1.4963319916687 47.252232502027, -1.49622436032912 47.2522194121046, -1.49622263520881 47.2522176460005, -1.49622088407351 47.2522158538832, -1.496208589074 47.2522034501709, -1.49612937396771 47.2521789785609, -1.49610798702337 47.2521701733213, -1.49610794324105 47.252170109259, -1.49610010096908 47.2521587369202, -1.49608819952735 47.2521414774756, -1.49608808334055 47.2521413081224, -1.49608467760344 47.2521348530354, -1.49608461940455 47.2521347435846, -1.49608459273814 47.2521346941702, -1.49608137619762 47.2521285993014, -1.49607827945148 47.2521227322114, -1.49607815965784 47.2521225044324, -1.49607825287209 47.2521222133578, -1.49609728171178 47.2520628489362, -1.49609743472345 47.2520623726136, -1.4960973852774 47.2520620375632, -1.49609650098041 47.2520560118398, -1.49609632385047 47.2520557475596, -1.49607276901703 47.2520207017755, -1.49607149468027 47.2520188045052, -1.49607077439705 47.2520177334281, -1.4960593834687 47.251987814383, -1.49605811399741 47.2519809720782, -1.49605806556575 47.2519807117735, -1.49605786416877 47.2519796267047, -1.49605744165348 47.251977348314, -1.49606209562466 47.2519274294794, -1.49605939893242 47.2519115146881, -1.49605870802852 47.2519074357296, -1.49605866831364 47.2519072003128, -1.49603827649819 47.2518819583179, -1.49603585552808 47.2518782813208, -1.49602173243856 47.2518568361051, -1.49599464157164 47.2518180704338, -1.49597800437993 47.2517981327727, -1.4959772536548 47.2517972340814, -1.49597663094123 47.2517964880623, -1.49597447265249 47.251793900944, -1.49591774511197 47.2517363818953, -1.49591733363365 47.2517338264568, -1.49591731186676 47.2517336939561, -1.49591690590603 47.2517311725408, -1.49590363336782 47.2516487313587, -1.49590362202974 47.25164865972, -1.49590328594823 47.2516465743719, -1.4959056343435 47.251645078703, -1.49590570215742 47.2516450355038, -1.49597731861424 47.2515994143454, -1.49597882807337 47.2515984524654, -1.49598089511233 47.2515971353925, -1.49598192076639 47.2515951760787, -1.49598909653702 47.251581462832, -1.49600247264372 47.2515559008806, -1.49600255698524 47.2515557399012, -1.49600323055007 47.2515544539136, -1.49600356152921 47.2515527776671, -1.49600496568449 47.2515456748917, -1.49600545638364 47.2515431940857, -1.49600751138561 47.2515126589302, -1.49600059373491 47.2515052798158, -1.49599805911751 47.251502576771, -1.49598117993078 47.2514860274364, -1.49597948678827 47.2514847340196, -1.49596641525303 47.2514747456882, -1.49594636743714 47.2514594276686, -1.49594628254061 47.2514593625115, -1.49592621490686 47.2514440290456, -1.49590478374127 47.251427654167, -1.49590470596998 47.2514275950384, -1.49590461820826 47.2514275272903, -1.4959036648209 47.2514267987117, -1.49590315740493 47.2514255841524, -1.49590287736493 47.2514249157318, -1.49590090282071 47.2514201931955, -1.49586918326039 47.2513443519465, -1.49586879554252 47.2513434895119, -1.49585877771871 47.2513211835889, -1.49579727656419 47.2511842471749, -1.4957971624901 47.2511839930421, -1.49579689337194 47.2511837206466, -1.49577401335933 47.2511605708271, -1.49573983101413 47.2511224429267, -1.49573871829011 47.2511200140321, -1.49573867464638 47.2511199202303, -1.49573756014884 47.2511174859988, -1.49568335454599 47.2510647355654, -1.49565001453304 47.2510196980437, -1.49563914314037 47.2510050121542, -1.49560937178981 47.2509422947074, -1.49559804147475 47.2508864254411, -1.49558904703173 47.2508801988664, -1.49547328917992 47.2508005699316, -1.49533288023681 47.2506779817873, -1.49533230027273 47.2506774755688, -1.49528075378128 47.2506324707207, -1.49526752437445 47.250620920707, -1.49526743747913 47.2506208475184, -1.49523499759454 47.2506183599851, -1.49516683483513 47.250613134868, -1.49501917350441 47.2506018150829, -1.4950190614258 47.2506018041491, -1.49487961479704 47.2505878292313, -1.49485192643006 47.2505850539396, -1.49485156211802 47.2505850177304, -1.49485039573128 47.2505849011634, -1.49484976980171 47.2505848382441, -1.49484874217531 47.2505847351717, -1.49467125105962 47.250566947191, -1.49467104062237 47.2505669310932, -1.49454680495303 47.2505576886701, -1.49445473384286 47.2505508392208, -1.49432402377229 47.2505411145165, -1.49432355899453 47.2505410795314, -1.49429514364399 47.2505393957498, -1.49421037628318 47.2505343715964, -1.49420998130215 47.250534348298, -1.49420957325671 47.2505342642405, -1.49415108220062 47.2505223188859, -1.4941509488991 47.2505222916616, -1.49415073758448 47.2505222494674, -1.49415015478452 47.2505222272061, -1.49413868375411 47.2505218098865, -1.49400921180919 47.2505170983855, -1.49400871007043 47.2505170801619, -1.49400861080286 47.250517064221, -1.4940081629313 47.2505169943346, -1.49396946172639 47.2505109489511, -1.49396931693339 47.2505109266811, -1.49396903936919 47.250510883473, -1.49392023947239 47.2505032606121, -1.49391967092755 47.2505031720172, -1.49391917170661 47.2505031365753, -1.49385310274194 47.2504984451207, -1.49385288439157 47.2504984293309, -1.49385257691521 47.2504984080158, -1.49385203105099 47.2504983059193, -1.49371669180748 47.2504730872735, -1.49370540011375 47.2504709833844, -1.49370521190321 47.2504709483952, -1.49370469031055 47.2504708516563, -1.49370444227519 47.2504708604536, -1.49370418888826 47.2504708685591, -1.49370406615171 47.2504708724572, -1.49364503393235 47.250472827435, -1.49364474493426 47.2504728369328, -1.49364438603263 47.2504728491639, -1.49364372673744 47.2504730182057, -1.49361020818992 47.2504816352081, -1.49348751597053 47.2505131748655, -1.49348688779869 47.2505133363823, -1.49348664800788 47.2505129565141, -1.49348661753948 47.2505129090499, -1.49344335498525 47.2504446303928, -1.4934269608389 47.2504187550503, -1.49342620975772 47.2504175689308, -1.49342570612138 47.2504167749946, -1.49329898219343 47.2502167666846, -1.49329866408308 47.2502162583282, -1.49324707288965 47.2501339771066, -1.49324058578413 47.2501236310503, -1.49310603584221 47.2499090408719, -1.49310565606158 47.2499083817515, -1.49288614284488 47.2495280812925, -1.49283529339586 47.2494399863324, -1.49283484861099 47.2494392153221, -1.49260298716611 47.2490229947857, -1.49260244433675 47.2490220338868, -1.49245694176793 47.2487644048275, -1.49243186361006 47.2487200022378, -1.4924312648265 47.2487189426105, -1.49239031139988 47.2486501760178, -1.49237839893188 47.2486301721553, -1.49237834806426 47.2486300867441, -1.49237777777333 47.2486291296209, -1.4923792178325 47.2486284435107, -1.49244135810437 47.2485988241177, -1.49262433386418 47.2485116105173, -1.49262571288201 47.2485109538208, -1.49262707514116 47.2485100355806, -1.49263512859431 47.2485046083222, -1.49279056475213 47.2483998504017, -1.49279096792802 47.2483995787482, -1.49279189818578 47.2483989513067, -1.49279261566717 47.2483984682387, -1.4927923982861 47.2483982127361, -1.49279138157763 47.2483970144722, -1.49277335725434 47.2483757737012, -1.49268418933325 47.2482706930503, -1.49262688137526 47.2482031569616, -1.49261874350895 47.2481935674009, -1.49260764067158 47.2481804824321, -1.49258222495462 47.2481505311277, -1.49258164457752 47.2481499879711, -1.49254933305947 47.2481197638163, -1.49254875415337 47.2481192224042, -1.49251974167794 47.2480949647228, -1.4924542842196 47.2480402335731, -1.49230241764065 47.2479132524844, -1.49230010287747 47.2479113165596, -1.49222993395357 47.247852646371, -1.49222697295765 47.2478501707622, -1.49217947997838 47.2478104592658, -1.49208451061201 47.2477283424036, -1.49203033221539 47.2476814956471, -1.49189327766096 47.2475698102998, -1.49184875230304 47.2475335264259, -1.49184867076869 47.2475334539266, -1.49183945293363 47.2475252400504, -1.491831593556 47.2475183390326, -1.49181473765868 47.2475034164149, -1.49177954308837 47.2474722586674, -1.49171446196197 47.2474266200155, -1.49163033228281 47.2473676247756, -1.49160970983898 47.247353587287, -1.49160952175693 47.2473534594841, -1.49160141511425 47.2473479412812, -1.49159369205246 47.247342656769, -1.49155152608897 47.2473337627878, -1.4915107346435 47.2473427454975, -1.49148519506621 47.2473537450724, -1.49145511388832 47.2473547405432, -1.49142401061483 47.2473405486058, -1.49138822369032 47.2473162680094, -1.49134763200025 47.2472742447596, -1.49130312669444 47.2472326024095, -1.49123458061443 47.2471684675056, -1.49117315472154 47.2470990563089, -1.49111153482996 47.2470273099978, -1.49105113964932 47.2469362284284, -1.49101815746671 47.2468864877479, -1.49101461953968 47.2468811531759, -1.49099738886605 47.2468551687832, -1.49095173972404 47.2467955036396, -1.49078047049355 47.2466018083815, -1.49065952159387 47.2464902131869, -1.49062884554045 47.2464214012812, -1.49051777269359 47.2463139251655, -1.49045185531201 47.2462705486004, -1.49037572729147 47.2462204537754, -1.49015461078858 47.2460381644467, -1.49008061827307 47.2459969962654, -1.48997696409008 47.2459916755609, -1.4899541208067 47.2459859896893, -1.48989855743708 47.2459311256758, -1.48980662995952 47.2459079568553, -1.48972300011986 47.2458670730858, -1.48967391455338 47.2458121369987, -1.48962831156752 47.2457859868555, -1.48962824911826 47.2457859523533, -1.48958320410541 47.2457609904719, -1.48954934912377 47.2457360914732, -1.48932917084586 47.2455813868076, -1.48932910470013 47.2455813398352, -1.48932892120186 47.245581250594, -1.48928657230077 47.2455605983055, -1.48926701160201 47.2455510592312, -1.48923793227564 47.2455325537751, -1.48922691684927 47.2455101863512, -1.48922276400748 47.2454860208971, -1.48922270562368 47.2454859718194, -1.48921388515331 47.2454784918882, -1.48921250447956 47.2454773222319, -1.48920273198663 47.2454759911461, -1.48918954515346 47.2454765062898, -1.48916043808013 47.2454734085332, -1.4891354307461 47.2454624017972, -1.48909204772511 47.245402613259, -1.48906237991569 47.2453617276583, -1.48904513568485 47.2453219470496, -1.48900377709513 47.2452912140555, -1.48896570077519 47.2452758522695, -1.48894913423849 47.2452456861469, -1.48892728277956 47.2452297788569, -1.48887913788319 47.2452174233246, -1.4888783188192 47.2452173129572, -1.48883752035641 47.2452118407972, -1.48882978063551 47.2452070739587, -1.48881826162088 47.2451999778279, -1.48881850527753 47.2451761830468, -1.48881365736313 47.2451703409529, -1.48879597614016 47.2451490411927, -1.48876163134085 47.2451292978656, -1.48875190337949 47.2451253529329, -1.48868833043285 47.2450916149525, -1.48866204863852 47.2450811985199, -1.48863427461883 47.2450467829982, -1.48863422629975 47.2450467434384, -1.48860931989143 47.2450261394425, -1.48860369639671 47.2450214881556, -1.48856616228684 47.2450047526308, -1.48846261181993 47.2450069050982, -1.48844475712879 47.2450032739584, -1.48842061036212 47.2449983640413, -1.4883504828823 47.2449701078428, -1.48828062919892 47.2449403100691, -1.48822039839941 47.244913288201, -1.48818801284612 47.2448916670449, -1.48808589260139 47.244868443624, -1.48805333276835 47.2448557493849, -1.48804656279504 47.2448502256062, -1.4880386563225 47.24484377581, -1.48803841054686 47.2448435754701, -1.48803827132042 47.2448434619724, -1.48798471362099 47.2447997744111, -1.48793885755485 47.2447910224178, -1.487886726048 47.2447776535594, -1.48784189450823 47.2447661566408, -1.48773975569592 47.2447128403318, -1.48763356692926 47.2446396793532, -1.48759692290458 47.2446570585038, -1.48758994383204 47.2446580852055, -1.48757274712747 47.2446606155767, -1.48754854147693 47.2446505097746, -1.48754847157129 47.2446504809687, -1.48752115525188 47.2446410823026, -1.4875208950428 47.2446409933513, -1.48745745063736 47.2446191666691, -1.48739256028871 47.2446049785381, -1.4873515018013 47.2445960020333, -1.48732564397754 47.2445766296954, -1.48732559038468 47.2445765903411, -1.48728371386761 47.2445452183602, -1.48723902431944 47.2445367863648, -1.48723214593892 47.2445354889758, -1.48721447530472 47.244532155013, -1.48714955311977 47.2445185608684, -1.48711260430308 47.2445024336624, -1.4870498717905 47.2444676708973, -1.48702118058071 47.2444490596718, -1.48693110496728 47.2444006787118, -1.48693104165627 47.244400649648, -1.48693049462189 47.2444004070074, -1.48691653458154 47.2443942187376, -1.48688546102485 47.2443724550134, -1.48687264159066 47.244356917327, -1.4868148184988 47.2443045261359, -1.48681477266804 47.2443044846762, -1.48678750530836 47.2442839247523, -1.48678746946725 47.2442834990663, -1.4867874296942 47.2442830266806, -1.48678564008194 47.2442130869852, -1.48675575715253 47.2442097684601, -1.48672380549168 47.2442062216485, -1.48658498530712 47.244209117945, -1.48658092189405 47.2442088495081, -1.48657942642187 47.2442087511178, -1.48655381819472 47.2442070631858, -1.4864879941034 47.2442027240793, -1.48644014243352 47.2441875620581, -1.48641747648942 47.2441776346918, -1.48641331986326 47.2441486930023, -1.48641634388653 47.2441299048239, -1.48642244045004 47.244092024729, -1.48643045159012 47.2440556223486, -1.4864380404423 47.2440211349112, -1.48645034045755 47.2438937923271, -1.48646945388613 47.2437595125415, -1.48646946310005 47.24375944911, -1.48648850099082 47.2436256876479, -1.48650431268707 47.2434991981566, -1.48650919586813 47.2433764691294, -1.48651446904708 47.2431074859502, -1.48651861272725 47.2429681159324, -1.48650434326753 47.242885058918, -1.48649146886172 47.2428378081973, -1.48646394276931 47.2427367950627, -1.48635114150205 47.242451429761, -1.48629593557038 47.2423174403697, -1.48624254934534 47.2421956338427, -1.48621592555951 47.2420978327274, -1.48621502199413 47.2420179453563, -1.48622593320058 47.2419547468103, -1.48623218759755 47.2419185229283, -1.48626521107677 47.2418204645225, -1.48632672488601 47.2416836300438, -1.4863870390907 47.2415561238045, -1.4864460084837 47.2414267751706, -1.48650335904904 47.2413049961332, -1.48656812607438 47.2411674667944, -1.48665637392985 47.2410417529479, -1.4867179525096 47.240981142326, -1.48680525844304 47.240902408507, -1.48691286706079 47.2408227899171, -1.48693979041762 47.2408051687473, -1.4869399522128 47.2408050633166, -1.48719619256509 47.2406365659301, -1.48719506864944 47.2406328183064, -1.48718727630783 47.2406068793474, -1.48715023584756 47.2404835653654, -1.48711497957116 47.2403524013485, -1.48703822422874 47.2400881564137, -1.48692067084377 47.2396630470428, -1.48685782201002 47.2394241156937, -1.48683941358996 47.2393597624847, -1.48678976589422 47.2391861994795, -1.48675472919161 47.2390571198856, -1.48674680922427 47.2390279467019, -1.48675858847751 47.238954141484, -1.48667434298024 47.2386543262365, -1.48666751898122 47.238610983078, -1.48666748608535 47.2386011631872, -1.4866750724669 47.2385687003514, -1.48667870772655 47.2385623007807, -1.48671478533983 47.2384987951477, -1.48671632236125 47.2384960888179, -1.48673569421955 47.2384653282296, -1.48673962870132 47.2384592458463, -1.48683215514555 47.2383162261109, -1.48683536113468 47.2383110452642, -1.48695501587382 47.2381177078801, -1.48698497532711 47.2380726805118, -1.48702611124801 47.2380108558514, -1.48703039187697 47.2380044229535, -1.48703158507673 47.2380026301694, -1.48711033695307 47.2378930535124, -1.48717068138675 47.2377937131892, -1.48717122173469 47.2377928243991, -1.48726851692072 47.2375971079785, -1.48727472945268 47.23757974406, -1.48727476735338 47.2375796128321, -1.4873019830572 47.2374870453558, -1.48730205485652 47.2374866253767, -1.48730227157292 47.237485365388, -1.48730239670526 47.2374846360762, -1.48731257477199 47.2374253421155, -1.48731314630994 47.2374220112271, -1.48731376741863 47.2374183891733, -1.48731414273911 47.2374162003398, -1.48731519726045 47.2374020130484, -1.48731497182086 47.2374011424515, -1.48730677488692 47.2373695446357, -1.48730529929552 47.23736605042, -1.48729316777773 47.2373373264641, -1.48728662103087 47.2373218241006, -1.48728562447357 47.2373194626874, -1.4872710990588 47.2373009282177, -1.48727090373047 47.2373007295112, -1.4872507070202 47.237280280195, -1.48723968083099 47.2372718807584, -1.48723401319277 47.2372674167675, -1.4871883219036 47.2372322591231, -1.48714347476918 47.2371976992136, -1.4870996263304 47.2371640013126, -1.48709874060974 47.2371632862491, -1.48709865405008 47.2371632166464, -1.4870983488487 47.237162969971, -1.48705291266555 47.2371249947196, -1.48705222534559 47.237124420577, -1.48705122912902 47.2371235872887, -1.48702975625719 47.2371056403684, -1.48702966894163 47.2371055617849, -1.48702952279971 47.2371054287341, -1.48702946985265 47.2371053812453, -1.48700086389278 47.2370814498531, -1.48700078136479 47.237081380994, -1.48697271563333 47.2370579105473, -1.48684895564879 47.2369544159166, -1.48675679669394 47.2368773477371, -1.48666488139605 47.2366891095398, -1.48655533896939 47.2365287696759, -1.48649331796802 47.2364122443978, -1.48642773666483 47.236289032846, -1.48632637513392 47.2362258643291, -1.48604610571015 47.2361338204182, -1.48603193996502 47.2361154006195, -1.48602040809235 47.2361004063972, -1.48597039862504 47.235879819215, -1.48595917783032 47.2358303260952, -1.4859735170822 47.2357382229509, -1.48601706976012 47.2355059473394, -1.48589225303092 47.2351907791548, -1.48588088579704 47.2351615801364, -1.48587653299064 47.2351503989668, -1.4858571473973 47.2351006056171, -1.48583114910475 47.2349598875668, -1.48583036966135 47.2349477343319, -1.48582773714248 47.2349067260229, -1.48582520245031 47.234867225815, -1.48586014004654 47.2346379004496, -1.48585349219647 47.2343168542642, -1.48585258769442 47.2343155380412, -1.48584236551423 47.2343009792296, -1.48584062886205 47.2342992693118, -1.48583198158952 47.2342907543587, -1.48581052997706 47.2342691275409, -1.48581029867842 47.2342688941958, -1.48579555738499 47.2342693282897, -1.48579156027271 47.2342694456074, -1.48575645861771 47.2342343245599, -1.48568825256356 47.2341658065101, -1.48554044296631 47.2340174974458, -1.48495960826095 47.2334346882571, -1.48495412180061 47.2334292259726, -1.48488737912309 47.2333592087484, -1.48488483904864 47.2333567066438, -1.48484295262911 47.2333154412166, -1.48484107232818 47.2333134539715, -1.48479881180696 47.233268779238, -1.48464344985375 47.2331077036345, -1.4845118401318 47.2329974402862, -1.48451140470548 47.2329970761487, -1.4844970805882 47.2329850749773, -1.48445046951754 47.2329460256566, -1.48445012211116 47.2329457328684, -1.48435139537386 47.2328631159487, -1.48416918603678 47.2327106364839, -1.48397153528536 47.2325452341459, -1.4837296931498 47.2323428490561, -1.48339484647941 47.232062628661, -1.48339459885725 47.2320624211773, -1.48339007464051 47.2320579998035, -1.48286230593658 47.2315421750089, -1.48241928445407 47.2311091714052, -1.48236529615064 47.2310564766433, -1.48236265039572 47.2310538948186, -1.48115507405406 47.2299430089518, -1.48114733539188 47.2299359224157, -1.48084697944923 47.2296594905257, -1.48083708958637 47.2296504155229, -1.48081185442238 47.2296271622589, -1.48076953776887 47.2295882108389, -1.48076374567456 47.2295828792373, -1.48075568976905 47.2295754635639, -1.48075551054628 47.2295752984588, -1.48074332249733 47.229564060527, -1.48073701561203 47.2295582696582, -1.47948577524383 47.2284062387314, -1.47895668950804 47.2279190851869, -1.4789564285077 47.2279188439777, -1.47884386229888 47.2278151830174, -1.4809654368962 47.2263503003168, -1.48096561443918 47.2263501780602, -1.48096570132883 47.2263501260155, -1.48096577820013 47.2263500806689, -1.48137322364697 47.2261075581699, -1.48191374082898 47.2257858212138, -1.48309853354661 47.2251891515319, -1.48386454808458 47.2248826810612, -1.48386706118198 47.2248816756319, -1.48386869138464 47.2248810236286, -1.4838720707671 47.2248796717286, -1.48387551798039 47.2248782928531, -1.48388083466849 47.2248761661357, -1.48438349002302 47.2246750578003, -1.48471254876146 47.2245738900074, -1.48545915329104 47.2243443451418, -1.4864157722955 47.2240502209716, -1.48909672806776 47.2232538487132, -1.49107689225877 47.2227808025126, -1.49178963426011 47.222628501683, -1.49351248037174 47.2220781627221, -1.49469165061193 47.2216865168734, -1.49566410110591 47.2213635168602, -1.49704454726753 47.2208675206381, -1.49734506230946 47.2207503342171, -1.49866694997487 47.2202346238369, -1.50058414215265 47.2197635118464, -1.50246079651399 47.2191651068921, -1.50292690126635 47.2190255391685, -1.50350818644934 47.2188514802127, -1.50614873731496 47.218377675361, -1.5079716314381 47.2179095036461, -1.50799169309693 47.2179033036678, -1.50801142870943 47.2178972047852, -1.50803524343687 47.2178898456199, -1.5115322770607 47.2168090969932, -1.51153366114777 47.2168086686903, -1.51153397173917 47.2168085726926, -1.51153541361813 47.2168077177267, -1.51156016444011 47.2167930369602, -1.51158324456134 47.2167751005581, -1.51491498099189 47.2164481536026, -1.51545367183233 47.2176733348478, -1.51555776520114 47.2179257340892, -1.515558080597 47.2179264443306, -1.51555809449105 47.2179266239941, -1.51555840359895 47.2179272443777, -1.51563991662425 47.2180844777002, -1.51559172129631 47.2181476934242, -1.51557558392005 47.2182063247861, -1.51557896485288 47.2182734912033, -1.5156055451197 47.2183140331963, -1.51563940112399 47.2183611713441, -1.51567051114855 47.2183748416598, -1.51569105481365 47.2185183045043, -1.51573203004102 47.2186503208606, -1.51622199518168 47.219711701418, -1.51659957903363 47.2205088643907, -1.51669270943563 47.2207006541854, -1.51712983516395 47.2214063381216, -1.51733775786673 47.2216262995219, -1.51756595440832 47.2219257908847, -1.51774421602652 47.2221178900254, -1.51788449701289 47.2222643480095, -1.51799408690683 47.2223835335624, -1.51835291571919 47.2227215321721, -1.51842641394952 47.2228040073581, -1.51848578097843 47.2228481355641, -1.51855573262536 47.222910734272, -1.51862980571724 47.2229736447636, -1.5187215089095 47.223039027949, -1.51880238066304 47.2231027025901, -1.51883157093809 47.2231280252893, -1.51889725462739 47.2231680699396, -1.51915055314352 47.2233532406438, -1.51938745484559 47.2235181543171, -1.51952854192376 47.223624847039, -1.51962830840053 47.2236975252961, -1.51984204652066 47.2238528550075, -1.51988617541825 47.2238873155969, -1.51992648258534 47.2239146082208, -1.52001650061407 47.2239749126966, -1.52011202880864 47.2240419690061, -1.52031978490016 47.2241949761401, -1.52033998703355 47.2242129437164, -1.52037946125508 47.2242470196489, -1.52046113839681 47.2242979657548, -1.52056010318503 47.2243649964178, -1.52065686320681 47.2244344429897, -1.52095661379121 47.2246530914935, -1.52129257017602 47.2249025907901, -1.52135930147862 47.2249461115462, -1.52141881064832 47.2249958184263, -1.5214826761586 47.225032589513, -1.52163274935074 47.2251317736807, -1.52220639840392 47.225553178566, -1.52231413126954 47.2256262187161, -1.52240536499854 47.2256996317153, -1.52244482100643 47.2257242493981, -1.52248441665148 47.2257489534783, -1.52257978969875 47.2258541105368, -1.52257994188739 47.2258542829532, -1.522593863687 47.2258695816388, -1.52264810697498 47.2258609205993, -1.522683098444 47.2258602899024, -1.5227421616645 47.2258634464669, -1.52283543652316 47.2258826598099, -1.52287061369963 47.2259011168395, -1.52291832589421 47.2259265392185, -1.52297678585352 47.2259634908512, -1.52300482094506 47.2259983993381, -1.52302987656841 47.226037819566, -1.52303143324723 47.2260850526956, -1.52302449371056 47.2261226619316, -1.52299366003102 47.226173591536, -1.52307838024105 47.2262098434393, -1.52312481494057 47.2262340482664, -1.52316108668058 47.2262530081575, -1.52324297668049 47.2262958400432, -1.52333538284897 47.2263671410099, -1.52349191415583 47.2264751143657, -1.52408161695411 47.2269023672197, -1.52476339629156 47.227390661007, -1.5249932674004 47.2275566098817, -1.52534803394078 47.2278133950707, -1.52548879498912 47.2279134263336, -1.5255681224564 47.2279683218569, -1.52565272871413 47.2280267325209, -1.5257648600669 47.2281019644626, -1.52587187228923 47.2281795289803, -1.52616690557057 47.2284018355986, -1.52623425523936 47.2284537993589, -1.526264906056 47.22847727065, -1.52630938363023 47.2285091049588, -1.52637964345587 47.228559259097, -1.52734454887638 47.2292488976326, -1.52755787206055 47.2294015268416, -1.52767642749384 47.2294868984949, -1.52818189454031 47.2298508474697, -1.52820742319195 47.2298692661491, -1.52829193324754 47.2299299297038, -1.5283429615212 47.2299664077363, -1.52847513498962 47.2300608696285, -1.52910918661263 47.23051885594, -1.52925415889907 47.2306238765047, -1.52933243597953 47.2306806060208, -1.53046008956133 47.2314913967246, -1.53062347171073 47.2316095786239, -1.53075294301549 47.2317031382646, -1.53077888806965 47.2317218121317, -1.53079691556319 47.2317370588649, -1.53078739748926 47.2317736756135, -1.53078886276459 47.2317774986742, -1.53078935213556 47.2317787426549, -1.5308019702831 47.2318106542025, -1.530837474146 47.2318390050604, -1.53088562430578 47.2318520708247, -1.53092901631372 47.2318560190212, -1.53096928957997 47.2318479133309, -1.53103609248185 47.2319068279803, -1.53143853066908 47.2321966718006, -1.53160944246378 47.2323201834539, -1.53166804115962 47.2323625301884, -1.53175537952398 47.2324256190858, -1.53218062630669 47.2327327090602, -1.5323379794265 47.2328460464711, -1.53254285855613 47.2329912037068, -1.53278346695381 47.2331348923767, -1.53289696266761 47.2331939497549, -1.53304395086723 47.2332644922622, -1.53325069904071 47.2333677952916, -1.53323766900871 47.2333960628993, -1.5332274012267 47.2334186538789, -1.53325999622938 47.2334561086973, -1.53330306868 47.2334830339119, -1.5333290325726 47.2334909893458, -1.53336703662773 47.2334953880632, -1.53337293483073 47.2334946498314, -1.53342682609195 47.2334883378976, -1.53346957609097 47.2334651067027, -1.53354667604857 47.2334907999262, -1.5336842965536 47.2335213962148, -1.53383846389656 47.2335650381328, -1.53400508295327 47.2336107825966, -1.53424563947267 47.2336659343526, -1.53452090967914 47.2337146957168, -1.53474621826304 47.2337454997851, -1.53565552238786 47.2338669091154, -1.53581382553117 47.2338945572077, -1.53584007703994 47.2338991695266, -1.53584749959432 47.2338902740709, -1.53587256694616 47.233860250474, -1.53589188827996 47.2338312304419, -1.53602017078444 47.2338497094216, -1.53599038988904 47.2338712446584, -1.53589655152208 47.2338572833672, -1.53587986844742 47.233886214557, -1.53586885856711 47.2338875755244, -1.53582243886421 47.2339788409975, -1.53472255725474 47.2352751741677, -1.53472097906346 47.2352771187683, -1.53471939454989 47.2352789735126, -1.53417421223344 47.2359209864527, -1.53417263392668 47.2359229301474, -1.53417104937487 47.2359247848839, -1.53333385210438 47.2369047976385, -1.53333227241942 47.2369067413733, -1.53333068780908 47.2369085960977, -1.53289633035412 47.2374103412868, -1.53289462009942 47.2374122901653, -1.53289303545885 47.2374141448835, -1.53243551020608 47.2379595372247, -1.53243379859834 47.2379614861482, -1.53243248411448 47.2379634221091, -1.53103558627129 47.2398291700782, -1.5310341396745 47.2398311094261, -1.53103269315395 47.239833049672, -1.53061826465169 47.2403988741173, -1.53029144243693 47.2406875070419, -1.530289455467 47.2406892847694, -1.5302874608628 47.2406909726925, -1.5294084876487 47.241458031989, -1.52940636735796 47.2414598140529, -1.52940437401571 47.2414615019084, -1.52920318987412 47.2416396950789, -1.52920120283246 47.2416414727872, -1.52919920815833 47.2416431606911, -1.5284400643901 47.2423129381284, -1.52843807597922 47.2423147158752, -1.52843608265071 47.2423164046116, -1.5282519330424 47.2424749672713, -1.52824981406764 47.2424767501595, -1.52824781933209 47.2424784380465, -1.52741906046382 47.2432009773549, -1.5274169414324 47.2432027602275, -1.52741508622156 47.2432045336065, -1.52713241150274 47.2434731234464, -1.52713043063425 47.2434749909746, -1.52712843590225 47.2434766797398, -1.52629697346533 47.2441810301745, -1.52629485615584 47.2441828030435, -1.52629286332195 47.2441844836076, -1.52552961083755 47.2448524919677, -1.52552735980095 47.2448542799983, -1.52552536489036 47.2448559678371, -1.52463453583264 47.2456385358218, -1.52463241661133 47.2456403186419, -1.52463042164303 47.2456420064649, -1.52273274622077 47.2473256387159, -1.52273078254379 47.2473274315924, -1.52272878745223 47.2473291193816, -1.52161663081353 47.2483105011758, -1.52161463467155 47.248312270979, -1.52161222015154 47.2483136950229, -1.52147323226802 47.248392467205, -1.52145670970552 47.2484072465766, -1.52143564745264 47.2484259763339, -1.52136426865239 47.2484881581634, -1.52121405595231 47.2486603757708, -1.52121242533728 47.2486623366238, -1.52120985001843 47.2486637841041, -1.52093650611187 47.2488138708223, -1.51937852328228 47.2502009758459, -1.51937653551812 47.2502027524826, -1.5193754992735 47.2502048575251, -1.51933098046367 47.2503006799283, -1.51717357483885 47.2521836698143, -1.517171455032 47.2521854515961, -1.51716932139264 47.252187054614, -1.51695320157624 47.2523489169729, -1.51559622397949 47.2531377309912, -1.51553576137058 47.2531706419039, -1.5154457668303 47.2532269660508, -1.51544424752994 47.2532279177719, -1.5145028194035 47.253793889005, -1.51450040901129 47.2537953199267, -1.51449786671923 47.2537967560293, -1.51334965718124 47.2544619367204, -1.51334724680388 47.2544633685158, -1.51334470444903 47.2544648045926, -1.51274373397379 47.2548120664479, -1.5117432980462 47.2552812711349, -1.51007570808554 47.2561861124331, -1.51007315927716 47.2561874585799, -1.51007033393814 47.256188633568, -1.50854448045668 47.2568079936565, -1.50854178075403 47.2568090744736, -1.50853894774853 47.2568101596185, -1.50718722096236 47.2573512846424, -1.50718438921961 47.257352369702, -1.50718155615764 47.2573534548134, -1.50591263867886 47.2578322717805, -1.50578770765396 47.2578794835446, -1.50563173624356 47.2579727122054, -1.5053786431366 47.258073218308, -1.50509073265024 47.2581875497442, -1.50509397356569 47.2581910989339, -1.50521266800494 47.2583210791035, -1.50520995138938 47.2583221650045, -1.50509322076447 47.2583688184533, -1.50497070580179 47.2584177825696, -1.50496874035767 47.258418595745, -1.50485852447224 47.2584641799739, -1.50474880589411 47.2585095589866, -1.50474701942508 47.2585102975662, -1.50467885315572 47.2585384907951, -1.50443860821272 47.258637854087, -1.50443513994036 47.2586391135896, -1.50425870152677 47.2587031640043, -1.50415174348614 47.2587419918492, -1.50414668654529 47.2587437938456, -1.50385996648345 47.2588459609143, -1.50385556066125 47.2588475121263, -1.50384565777178 47.2588509978979, -1.50366668392513 47.258914004183, -1.50355497610684 47.2589533301975, -1.50355119105813 47.2589546786708, -1.50339900086765 47.2590089078729, -1.50327698717195 47.2590517486343, -1.50308389165974 47.2591195474639, -1.50301234590847 47.2591446679628, -1.50295503806113 47.2591647894646, -1.50295339305634 47.2591653701983, -1.50263118394759 47.2592792023459, -1.50245128318797 47.2593412644105, -1.50241052410283 47.2593553249097, -1.50216541376456 47.2594398814507, -1.50216358762914 47.2594405116153, -1.50208547727733 47.2594934880944, -1.50208473132377 47.2594940579296, -1.50207510476416 47.2594484914157, -1.50207215769187 47.2594345417538, -1.50207191386611 47.2594346008604, -1.50200704448582 47.2594502470664, -1.50200696592611 47.2594502258154, -1.50200599241417 47.2594499666042, -1.50200473320033 47.2594496311829, -1.50197549629033 47.259441841661, -1.50184295082558 47.2594935017179, -1.50184288032131 47.259493528807, -1.50182615925996 47.2595015036562, -1.50181407668538 47.2595072650144, -1.50179968507354 47.2595141286608, -1.50179949169619 47.2595142209312, -1.50179924232532 47.2595143397224, -1.50172584412313 47.2595494711919, -1.5016429292654 47.2595891236562, -1.50164256417643 47.2595892983376, -1.50162239482315 47.259598943556, -1.50160804413151 47.2596058064748, -1.50159360567765 47.259612711573, -1.50158260446398 47.2596179728325, -1.50157720061458 47.2596198063153, -1.50157771892056 47.2596165423078, -1.50157037864592 47.2596192202044, -1.50156400513313 47.2596215448792, -1.50150464334312 47.2596431994137, -1.50144809079323 47.2596638293564, -1.50142608530258 47.2596718570115, -1.5013328368504 47.2597038911364, -1.50129758839841 47.2597163072871, -1.50126236826851 47.2597287142078, -1.50124861849045 47.2597335577652, -1.50124736663998 47.2597339987351, -1.50123342035039 47.2597396807355, -1.5012327520747 47.2597399952344, -1.50122576153962 47.259743288331, -1.50121772474829 47.2597470747148, -1.50121089077668 47.2597502941023, -1.50120966560615 47.2597508628743, -1.50120335274182 47.2597537960513, -1.50119869039438 47.2597559626927, -1.50119690995138 47.2597567892784, -1.50119140576459 47.2597593465941, -1.50118845640756 47.2597605775632, -1.50118133162326 47.259763550642, -1.50117997392932 47.259764117395, -1.50117507112018 47.2597661637033, -1.50112882091267 47.2597854655934, -1.50111802318495 47.259789971883, -1.50111660221118 47.259790478942, -1.50110942001368 47.2597930388894, -1.5011038246358 47.2597950339246, -1.50099954201805 47.2598322113252, -1.50075403243482 47.2599197365881, -1.50075377750887 47.2599198366727, -1.50071214773112 47.2599362435688, -1.50071231758268 47.2599366874332, -1.50071240636793 47.2599367983876, -1.50071305441718 47.2599376073669, -1.50073436303375 47.2599642066849, -1.50070828676405 47.2599742154658, -1.50046111100659 47.2600690874151, -1.50046092130836 47.2600691606174, -1.50043332323462 47.2600401467592, -1.50043229360672 47.26003892563, -1.50018567421337 47.2601462210904, -1.50015054560974 47.2601615037547, -1.50007012053851 47.2601980805218, -1.49998142714623 47.2602370532843, -1.49988730689302 47.2602775899633, -1.49976807114635 47.2603294715709, -1.4997076616823 47.2603554433121, -1.49963484764514 47.2603881176955, -1.4994342925792 47.2604762363848, -1.49942094246622 47.2604821020497, -1.49931899351692 47.2605268956768, -1.49916327200872 47.2605949816008, -1.49897228293618 47.2606795849161, -1.49865100611855 47.2608200148012, -1.498584966962 47.2608492670227, -1.49858445409143 47.2608494943307, -1.49858409429054 47.2608496534772, -1.49858385827972 47.2608497582225, -1.49853099068011 47.2608731761662, -1.49849905546056 47.2608873214588, -1.49831259202633 47.2609738188456, -1.49813840249171 47.2610567721161, -1.49803106481456 47.2611053930047, -1.49800776870304 47.2611164880039, -1.49792754724697 47.2611546941525, -1.49792719099039 47.2611548639704, -1.49792695946526 47.261154974846, -1.497926057368 47.2611554047947, -1.49792574437167 47.2611555539983, -1.49786183729506 47.2611859891881, -1.49744022115592 47.2613796277423, -1.49744010768957 47.261379679035, -1.4971461238478 47.2615128626939, -1.49690370882706 47.2616265122073, -1.4967844145638 47.2616824401752, -1.49662178026663 47.2617602310568, -1.49528472630393 47.2623997465916, -1.4951603203677 47.2622799735279, -1.49516025694137 47.2622799120354, -1.4950271377562 47.2621516756542, -1.49500783095677 47.2621330585684, -1.49500533511352 47.2621317145234, -1.49493956834623 47.2620958124169, -1.4948647130581 47.2620195375079, -1.49477810855818 47.2619312923245, -1.49469081348732 47.2618357217205, -1.49459232376077 47.2617278960287, -1.49450815851075 47.2616318263025, -1.49450565987234 47.261628974041, -1.49450562038946 47.2616289296324, -1.49428061598478 47.2612994820994, -1.49426259977224 47.2611047550314, -1.49421692668003 47.2609951992475, -1.4942166661537 47.2609945742106, -1.49421642539736 47.260993995254, -1.49418689952542 47.2609231730372, -1.49417648080803 47.2608981831813, -1.49412961232478 47.2607128735618, -1.49407561616072 47.2604007070357, -1.4940689469221 47.2603075287597))
-Nantes;Breil - Barberie;7;440109.0;POLYGON ((-1.57440058466757 47.2454755052357, -1.57420026051861 47.2453750271596, -1.57377907194735 47.2452603308868, -1.57376655223098 47.2452573330095, -1.57376359074439 47.2452566227906, -1.57376037174753 47.2452560111274, -1.573655157574 47.2452352605512, -1.57352145240674 47.2452354703443, -1.57333727318132 47.2451983917473, -1.57306464085836 47.2451273832009, -1.57292048375498 47.245114886714, -1.57277791602723 47.2451241329644, -1.57259530559115 47.2451519398036, -1.57251018186669 47.2451635620472, -1.57236618335529 47.2451532211504, -1.57224007957755 47.245127142532, -1.57134764437952 47.2451573863308, -1.57097575384714 47.2452068248983, -1.57087672294822 47.2450280630026, -1.57079920449765 47.2449699829876, -1.5707436607548 47.2449501582386, -1.57066614020479 47.2449354922495, -1.57052880289617 47.2448425110353, -1.57025806956155 47.2448408748281, -1.57015695886154 47.2448074617621, -1.57002010190676 47.244721038761, -1.56988197487001 47.2446606883922, -1.56976408628274 47.2445713715919, -1.5696734452231 47.2444205150112, -1.56954211088459 47.2443209341873, -1.56944213409786 47.244261363083, -1.569224751277 47.244162535591, -1.56912063819799 47.2440879725592, -1.56899248586677 47.2440337682267, -1.56886289604626 47.2439145828538, -1.56871514106345 47.2438545572557, -1.5685149847567 47.2437724380283, -1.5684689160377 47.2437501297285, -1.56840026122849 47.2437264252259, -1.56834582689152 47.2437217835194, -1.56799931282601 47.2437291931118, -1.56794377009678 47.2437093670573, -1.56777195655645 47.2436241248967, -1.56771657876736 47.2436065448782, -1.56759820473032 47.2435974926728, -1.56728209066525 47.2435864874449, -1.5672051773202 47.24357828286, -1.56709221800586 47.243558238934, -1.56702242402782 47.2435606011399, -1.56689251206529 47.2436127349137, -1.56678632729609 47.2436401965674, -1.56618586190489 47.2436583573307, -1.56604202566384 47.2436501648605, -1.56586972274294 47.243645187533, -1.56579029727317 47.2436478749246, -1.56566877550524 47.2436845015506, -1.56551558890456 47.2437221996284, -1.56538283054514 47.2437353379949, -1.56526907283251 47.2437310514021, -1.56514017136995 47.2437064397432, -1.56495136336231 47.243646555501, -1.56484705376508 47.2436342096769, -1.56473580857192 47.2436379648774, -1.5645859257062 47.2436747843644, -1.56458280507434 47.2436755192575, -1.56457982276258 47.2436763396645, -1.56439400827172 47.2437282014831, -1.56422444680394 47.2438003548016, -1.56367113962583 47.2437098229093, -1.56266646013398 47.2438408639188, -1.56244544712845 47.2438312530468, -1.56216322175336 47.2437529358502, -1.56145067517323 47.2432759185303, -1.56101032820293 47.2428948045128, -1.56041074403256 47.2426773679464, -1.55990649742494 47.2425751561315, -1.55978994622807 47.2425455900629, -1.55909442212041 47.2424669419969, -1.55819389984253 47.2423822428122, -1.55751779307725 47.2423255815903, -1.55710192565419 47.2421526982407, -1.55670861394858 47.2421220982969, -1.55654613980403 47.2421158380141, -1.55659146616771 47.2415642827517, -1.55666710677021 47.2410166585994, -1.55666734592108 47.2410144883466, -1.55667049954799 47.241014201992, -1.55700344431711 47.2409871223681, -1.55700672988109 47.2409868316726, -1.5570095701346 47.2409858359786, -1.55803896444828 47.240644684683, -1.55803948576792 47.2406445765987, -1.55810280727866 47.2406303038805, -1.55817819356288 47.2405973535554, -1.55817858301915 47.2405972507015, -1.55859685554448 47.2404590211368, -1.55859970319142 47.2404581125119, -1.55860267517256 47.2404571106489, -1.55879137645042 47.240395346915, -1.5587942189698 47.2403944402906, -1.55879718706474 47.2403934394775, -1.56004036944455 47.2399833040551, -1.5600432132395 47.2399823973474, -1.56004605066876 47.2399814007849, -1.56039710849024 47.239858190042, -1.56067912943885 47.2397240851924, -1.56081603516464 47.2396343833714, -1.56081829528313 47.2396328717628, -1.56082054779287 47.2396312712499, -1.56093589454136 47.239554196665, -1.561577975201 47.23891617285, -1.56157982183051 47.2389144064166, -1.5615815276733 47.2389125563661, -1.56180087943071 47.2386729750308, -1.56180222616836 47.2386715050706, -1.56180406043575 47.2386696562247, -1.56292570849088 47.2375310786502, -1.56292743039241 47.2375293090346, -1.56292927785533 47.2375274452259, -1.56312721292237 47.2373273756461, -1.56326733704134 47.2371343044856, -1.5633794295491 47.2368215796802, -1.56338020249803 47.2368194819099, -1.56338016988513 47.2368172314146, -1.56338197076646 47.2363521493265, -1.56338194584289 47.2363499886332, -1.56338191454874 47.2363477380853, -1.56338095827958 47.2360625248827, -1.56338093335629 47.2360603641893, -1.56338090074372 47.2360581136936, -1.56335013301817 47.2341884403198, -1.5633501080969 47.2341862796254, -1.56335293746742 47.2341851931775, -1.5645083320104 47.2337594461734, -1.56451116265308 47.2337583596445, -1.56451386005508 47.2337572775082, -1.56495089399181 47.2335812682222, -1.56495372461603 47.2335801816824, -1.56495655524014 47.2335790951426, -1.56574010595739 47.2332893188639, -1.56574293655006 47.2332882323045, -1.56595862869444 47.2332050038901, -1.56596103677606 47.2332035718834, -1.56851050115034 47.2317490799207, -1.5685130409376 47.2317476426171, -1.56851544873106 47.2317462087603, -1.56986740686912 47.230969595345, -1.56986994658284 47.2309681580112, -1.56987249275437 47.2309668114298, -1.57015568773112 47.2308089233488, -1.57015822742943 47.2308074860086, -1.5701607670505 47.2308060477704, -1.57103342755139 47.2303154168987, -1.57103596720257 47.2303139795389, -1.57103851323645 47.2303126320335, -1.57226433048481 47.2296333468615, -1.5722668701474 47.2296319103723, -1.57226970408423 47.2296309127127, -1.57251771020526 47.229539353616, -1.57252041493522 47.2295383610926, -1.57252341541345 47.2295378091417, -1.57339532796822 47.2293768754877, -1.57339846033888 47.2293763191635, -1.57340158632286 47.2293756729849, -1.5740130999162 47.2292557668085, -1.5740161003632 47.2292552148186, -1.57401922633251 47.2292545686232, -1.57532457409625 47.228999656883, -1.57532757583353 47.2289991048063, -1.57533070823905 47.2289985493274, -1.57705800362556 47.2286698594509, -1.57706100400803 47.2286693073815, -1.57706413629903 47.2286687509573, -1.57822395000407 47.2284491468201, -1.57822695168049 47.2284485946677, -1.57823008386915 47.2284480373137, -1.57902195016473 47.2282958608261, -1.57902495050585 47.2282953087054, -1.57902807759955 47.2282946614232, -1.57998455764563 47.2281099567342, -1.57998768987332 47.2281094002303, -1.57999068371915 47.2281087573325, -1.58090286948645 47.2279319724013, -1.58090587381977 47.2279314209718, -1.5809087155689 47.2279304245795, -1.58150721183342 47.2277195770156, -1.58151004379169 47.2277185746903, -1.58151287450882 47.2277175733155, -1.58159171920633 47.2276907200735, -1.58214520142011 47.227390920811, -1.58249444454926 47.2271225326211, -1.58249657522347 47.2271209283823, -1.58249883015883 47.2271192308794, -1.58257521182726 47.2270608810826, -1.58295583954644 47.2266235352011, -1.58307519930264 47.2264136682356, -1.58307636703396 47.2264115572429, -1.58307754116793 47.226409536104, -1.58364932054162 47.2253960882721, -1.58365048690972 47.2253939773256, -1.58365166099956 47.2253919561803, -1.58450476215032 47.2239015462638, -1.5845059312428 47.2238994369987, -1.58450710658548 47.2238974157914, -1.58483358365264 47.2233001604573, -1.58493403298576 47.2233481683465, -1.5850177797292 47.2233714356289, -1.58606403317396 47.2241301681326, -1.58637739447215 47.2244315068847, -1.58662757533613 47.2247799386066, -1.5868839389797 47.2252890675788, -1.58707655563201 47.2254495363615, -1.58750447123228 47.2255836771728, -1.58768724144898 47.2256701240116, -1.58777882157552 47.2257006025557, -1.58778169432216 47.225701536694, -1.5877846407742 47.2257023282185, -1.58802800258785 47.2257694896081, -1.58814394170551 47.225771766517, -1.58831182925188 47.2257549204389, -1.58844486882583 47.2257751125955, -1.58874446585816 47.2258180321999, -1.58888925617198 47.2258769638358, -1.58906304457497 47.2259018314711, -1.58929449518875 47.2259219810564, -1.58947001622014 47.2259757869691, -1.58989941649962 47.2261662929354, -1.58996370443898 47.2262003320655, -1.59000191716755 47.2262514913724, -1.59003032430526 47.2264052530135, -1.59000348369077 47.2268832211224, -1.5899853114036 47.2269858108377, -1.59001506030727 47.2271008311669, -1.59013291357715 47.2272560719846, -1.59019721218231 47.2272967156472, -1.59032390731847 47.227335820142, -1.59042415981799 47.2273530212472, -1.5906091403516 47.2273373938457, -1.59067546581773 47.2273543511179, -1.59081441017524 47.2274251049996, -1.59091801300676 47.2274298880329, -1.5910272684369 47.2274142929159, -1.59136676854564 47.2273133676535, -1.59172841688859 47.2271817350697, -1.59188622679585 47.2271358325556, -1.59202083405579 47.227083567476, -1.59242393225942 47.2269661105707, -1.59261629760373 47.226936910539, -1.59276959224846 47.2268781060265, -1.59288065257044 47.2268636101464, -1.59333999445676 47.2268456008879, -1.59387201048055 47.2267639538169, -1.59387514890523 47.2267634867878, -1.59387828864814 47.2267630197059, -1.5944842894967 47.2266673588976, -1.59460425528411 47.2266725203502, -1.594763649145 47.2267062661824, -1.59546038984538 47.2269831889677, -1.59557115722063 47.2270386239846, -1.59563088174062 47.2271388293848, -1.59566243014212 47.2272732125833, -1.59566872931109 47.2275573172484, -1.59568505081458 47.2279533854478, -1.59567413397419 47.2280990408296, -1.59561765195276 47.2283891803974, -1.59568540976665 47.2285001803922, -1.59579138315297 47.2286001151069, -1.59592439629451 47.2286840682227, -1.59605262322134 47.2287252112796, -1.59617259271396 47.2287327212068, -1.59644105166143 47.2287978649437, -1.5965564281215 47.2288438280104, -1.59670695956572 47.2289371446074, -1.596776465005 47.2289981972961, -1.59683178319455 47.2290745299444, -1.59686062306018 47.2291654476669, -1.59686750728999 47.2292674372254, -1.59696409946045 47.2294084563299, -1.5969359214252 47.2294174478385, -1.59693091330721 47.2294190458552, -1.5969270291248 47.2294202853122, -1.59692677033962 47.2294203677561, -1.59692655917027 47.229420434778, -1.59692644842857 47.2294204698469, -1.59692633256842 47.2294205069229, -1.59692614590492 47.2294205666564, -1.5969260467957 47.2294205985566, -1.59692590387057 47.2294206439244, -1.59692578932876 47.2294206809477, -1.5969254726135 47.2294207819295, -1.59692520351407 47.2294208674893, -1.5969240602681 47.2294212322281, -1.59692022345869 47.2294225454817, -1.59690825548144 47.2294266405184, -1.59688307244421 47.2294337766433, -1.59688154971226 47.2294345422384, -1.59632533164706 47.229714259351, -1.59620187602807 47.2297706517381, -1.59599615783421 47.2298648058894, -1.59562138582861 47.2300363320515, -1.59449383815285 47.2305523771789, -1.59444393943415 47.2305750981297, -1.59259186931622 47.2315082617621, -1.59241818240175 47.2316006832794, -1.5923529251041 47.2316354061821, -1.591982599245 47.2312540880482, -1.59183884179687 47.2313359778723, -1.59179661526434 47.2313591568633, -1.59179475842001 47.2313601763332, -1.59162929211592 47.2314511335635, -1.59142301582357 47.2315643549111, -1.59135013284324 47.2316043929959, -1.59126133443562 47.2316531769711, -1.59113678063162 47.2317215018642, -1.59091497073926 47.2318432717467, -1.59065134421499 47.2319880717446, -1.59057094476791 47.2319854264613, -1.59053734956221 47.2319658003963, -1.59048778520422 47.2319368481108, -1.59035698209884 47.2318604345688, -1.59025653644841 47.2318016417134, -1.59025641653148 47.2318017393177, -1.59015260434047 47.2318867137641, -1.58994269642148 47.2320530617783, -1.59000079000316 47.2320855229917, -1.58979230440239 47.2323008938116, -1.58978710355091 47.2323062657759, -1.58976368721625 47.2323304558801, -1.58975125917754 47.2323432938085, -1.58954665230953 47.2325374541355, -1.58954610202443 47.2325379771284, -1.58954595161524 47.2325381201037, -1.58954579507801 47.2325382687304, -1.58954360867573 47.2325403474977, -1.58949124349299 47.2325901308398, -1.5894660519473 47.2326140800113, -1.58944246718034 47.2326365016084, -1.58944242195657 47.2326365448655, -1.5894198475214 47.2326580403188, -1.58929436868719 47.232777131615, -1.58921213865602 47.2327210649629, -1.58919042588804 47.2327062604772, -1.58917243335738 47.2326939926397, -1.58913119624734 47.2326658767522, -1.5888798096648 47.2324924330238, -1.58887971685193 47.2324923691491, -1.58887873212153 47.2324916876075, -1.5885089559886 47.2322364012024, -1.58850797111304 47.2322357178617, -1.58850079892719 47.2322307779787, -1.58822529427229 47.2320716549942, -1.58816460451168 47.232036683441, -1.5880564479643 47.2319741652145, -1.58805378606053 47.2319726261259, -1.58805071555156 47.2319707663466, -1.58799416545123 47.2319377929117, -1.58796928867821 47.2319593629, -1.58796090902041 47.2319666287731, -1.58792587852535 47.2319970015532, -1.58789393675835 47.2320246972683, -1.58786441391015 47.2320502950414, -1.58756439771272 47.2323056596972, -1.58747458424251 47.232382079793, -1.58742572183228 47.2324236556608, -1.5874143504656 47.2324330530936, -1.58731641834711 47.2325139837171, -1.58715823471098 47.2326481651601, -1.58710438434578 47.2326941986017, -1.58710433625135 47.2326942392691, -1.58707643308238 47.2327180979026, -1.5870506579997 47.2327401369527, -1.58696815298222 47.2328083099209, -1.58686804556529 47.2328948470521, -1.5867580542198 47.2329925918206, -1.58674281288538 47.2329999585349, -1.58667729515241 47.2330549278414, -1.58659483553804 47.2331236393412, -1.58651241310855 47.2331928007353, -1.58632664184692 47.2333492570095, -1.58632659126897 47.2333492995779, -1.58624691523445 47.2334152396369, -1.58614972157369 47.2334956755624, -1.58614966595369 47.2334957210352, -1.58602830121878 47.2335981541454, -1.58600843990229 47.2336153000073, -1.58595355009259 47.2336626826998, -1.58582992455981 47.2337659870594, -1.58568436626529 47.2338876172743, -1.58568428116529 47.2338876891541, -1.58555099897452 47.2339997200247, -1.58538830129618 47.2341553445776, -1.58535874367814 47.2341839174917, -1.58533271318364 47.2342085551237, -1.58532852432468 47.2342125186102, -1.58530425097939 47.2342363751416, -1.58528096729023 47.234259279362, -1.58526784048317 47.2342721932867, -1.58526558640242 47.2342744107284, -1.58521661822987 47.2343218702474, -1.58521193522682 47.2343275484044, -1.58520847171736 47.2343317469562, -1.58503371638232 47.2344979434702, -1.58503366882546 47.2344979904228, -1.58496174290645 47.234567767865, -1.58493543975945 47.2345932849236, -1.58483968788061 47.234686175474, -1.58475614906872 47.2347670040281, -1.58469100755719 47.2348473110073, -1.58469095968548 47.2348473696865, -1.58465696062332 47.234888914222, -1.58457664801464 47.2349872761659, -1.58448496963959 47.2351026680538, -1.58448484937985 47.2351028080163, -1.58448352659957 47.2351043485021, -1.58444237928903 47.2351537086206, -1.58444228579525 47.2351538213834, -1.58443519703944 47.2351623249047, -1.58441545566801 47.2351864761444, -1.58437055770597 47.2352414059575, -1.58430372976287 47.2353212077622, -1.58427490826467 47.2353570453, -1.58427461070744 47.2353574158073, -1.5842679355763 47.2353657144833, -1.58426612129276 47.2353679702201, -1.58424631965326 47.2353925914946, -1.58424615717964 47.2353927944154, -1.58424601969047 47.2353929648011, -1.58421399039251 47.2354316696328, -1.58419171509553 47.2354585873587, -1.58412823085287 47.2355372626162, -1.58411846085108 47.2355491260342, -1.58406761780466 47.2356108672696, -1.58404734248128 47.2356351055145, -1.58400921495576 47.2356809604536, -1.5839329765513 47.2357728507395, -1.58393946898274 47.2357891915937, -1.58394428815503 47.2358013217308, -1.58398578186952 47.2358321495986, -1.58398584126229 47.2358321940856, -1.58403916290572 47.2358722376395, -1.58420000606506 47.2359887296652, -1.58420771261219 47.235994436048, -1.58422166871553 47.2360047679689, -1.58424497764377 47.2360220264373, -1.58424550334435 47.2360224163587, -1.58434391970397 47.2360932754322, -1.58434460374185 47.2360937680672, -1.584344964835 47.2360940284916, -1.58434505795769 47.236094095962, -1.58434563902565 47.2360945143108, -1.5843862588267 47.2361237594629, -1.58455563237438 47.2362471184899, -1.58458260005629 47.2362668575801, -1.5846731011282 47.2363330807582, -1.58484819034431 47.2364613475394, -1.58490121277235 47.2364994202782, -1.58494591995404 47.2365316172134, -1.58496961774314 47.2365486843202, -1.58500581137664 47.2365754071446, -1.58503827814703 47.2365993780762, -1.5850907098099 47.2366382852954, -1.58519032463649 47.2367104529392, -1.58528855926233 47.2367819529143, -1.5854554298455 47.236891532945, -1.58549404350272 47.2368682773227, -1.58589712445214 47.2371618510738, -1.58596802581391 47.2372134902411, -1.58597042554817 47.237215239891, -1.58603536086578 47.237262613501, -1.58629893929147 47.2375335041652, -1.58637571814765 47.2375788351345, -1.58642664215041 47.2376089019106, -1.58661730286041 47.2377214694251, -1.58720631606323 47.2380171878017, -1.58780639038143 47.2383184548941, -1.58792699369662 47.2383798351645, -1.58815508524505 47.2384959229583, -1.58824761690861 47.2385410670597, -1.58830346991542 47.2385689340121, -1.58845635253788 47.2386450073928, -1.5885557721862 47.2386948321998, -1.58862020761556 47.2387271311491, -1.5888759406152 47.2388544244355, -1.58904238088456 47.2389373454802, -1.58911342567688 47.2389726241281, -1.58914908251198 47.2389903031219, -1.58919266771476 47.2390124421273, -1.58919390853619 47.2390130692877, -1.58920704511254 47.2390197172897, -1.58924137252968 47.2390370916228, -1.5892525669973 47.2390427584077, -1.58944178434249 47.2391412591567, -1.5893938506059 47.2392053501811, -1.58929296162085 47.2393397700526, -1.58926402693826 47.2393781832917, -1.58926399256647 47.2393782297192, -1.58922765240034 47.2394265218686, -1.58867653805296 47.2401588819278, -1.58864827302968 47.2401902847545, -1.58856254292121 47.240285529837, -1.58843177385282 47.2404341204622, -1.58838177264488 47.240489547507, -1.58829517519332 47.2405856406678, -1.5882696733042 47.2406139801595, -1.58822925642506 47.2406588943108, -1.58820593529966 47.2406848092681, -1.5881163149564 47.2407841731938, -1.58795641695781 47.2409217570599, -1.58790604862117 47.2409650463825, -1.58781017563086 47.2410474452204, -1.58774320075589 47.2410994082413, -1.58772604097168 47.2411120887309, -1.58771028934926 47.2411237280994, -1.5876806273113 47.2411456474565, -1.58767877995476 47.2411470124813, -1.58767842044483 47.2411472782402, -1.58767736177577 47.2411480603065, -1.58767564878919 47.2411493262526, -1.58767153738825 47.2411523648929, -1.58766843353076 47.2411546577496, -1.58766134891709 47.2411598930195, -1.58742903856391 47.241304783481, -1.58718303940147 47.2414582405293, -1.58708056077286 47.2415097291203, -1.58702927802976 47.2415346776462, -1.58697159828816 47.2415627370791, -1.58673641374159 47.2416711546131, -1.58669856852135 47.2417003288375, -1.58666914888351 47.241722859077, -1.5866100672623 47.2417819844242, -1.5864764069572 47.2419155494882, -1.58636311068442 47.2420857797112, -1.58628816045804 47.2422296118342, -1.58627510600143 47.2422547326732, -1.58626306055246 47.2422777407276, -1.58625250519934 47.2422980761413, -1.58620619954545 47.2423642640568, -1.58614856087257 47.2424432447201, -1.58607991999242 47.2425205054559, -1.58603468497536 47.2425575182911, -1.58599413241248 47.2425907002119, -1.58574213205447 47.2426929391798, -1.58552631661331 47.2427804865938, -1.58551971084766 47.242786709121, -1.58551542100909 47.2427907523009, -1.58551533534873 47.2427908332131, -1.58549706100746 47.2428080569442, -1.58549616862586 47.2428089269659, -1.58549611128551 47.2428089833196, -1.5854952298445 47.2428098420917, -1.5854818269259 47.2428078539075, -1.585481840312 47.2428077173087, -1.58548189697268 47.24280713024, -1.58546822982306 47.2428066844522, -1.58531420981453 47.242827319404, -1.58531411168804 47.2428273323307, -1.58531400440827 47.2428273465237, -1.58530253833219 47.2428291376939, -1.58530238427621 47.2428291618634, -1.58526145895754 47.2428356446566, -1.58526108297074 47.2428357038137, -1.58526092635473 47.2428357289863, -1.5852286310399 47.2428408455521, -1.58517317958989 47.2428496173389, -1.58517301901767 47.2428496426693, -1.58514325374956 47.2428543455729, -1.5851168529059 47.2428631187018, -1.58509390998789 47.2428707437197, -1.58502335474728 47.2428941913448, -1.5849146447929 47.242930319566, -1.58482901662999 47.2429587766312, -1.58479875651284 47.2429688327369, -1.5847591085977 47.2429786146266, -1.58463572609818 47.2430132735238, -1.5845814648123 47.2430256081932, -1.58455922034967 47.2430306641582, -1.58451360240864 47.2430410337777, -1.58447246224538 47.2430415614414, -1.58440376268995 47.2430424425347, -1.58436490798719 47.2430429123167, -1.58423762752225 47.2430876364669, -1.58418047468607 47.2431155958489, -1.58413033338749 47.2431401252687, -1.58401758166036 47.2431907618835, -1.58393954340327 47.2432310891725, -1.58390659819368 47.2432481130384, -1.583860744726 47.243271807174, -1.58384816961439 47.2432772431869, -1.58384805223647 47.2432772938249, -1.58384467023044 47.2432787560446, -1.58383637565337 47.2432823308533, -1.58381490177561 47.243288978788, -1.58378391991203 47.243298570507, -1.58378174435172 47.2432992754406, -1.58377370771764 47.243301880295, -1.58375717604672 47.243307237144, -1.58374079634504 47.2433125455771, -1.58361390132898 47.2433432885371, -1.58356581945277 47.243354968914, -1.58352811944282 47.243364127498, -1.58348830807109 47.2433737992074, -1.58337994913906 47.2434001080472, -1.58336504322099 47.2434037681173, -1.5833351112677 47.2434200606767, -1.58331884211621 47.2434289167282, -1.58325697337816 47.2434625927999, -1.58313904254332 47.2435268603846, -1.58307891956187 47.2435598981329, -1.58301332939463 47.2435959400688, -1.58298270718863 47.2436122095967, -1.58295813155361 47.2436141809755, -1.58292580700825 47.2436167957098, -1.58291859683234 47.2436173797375, -1.58283551785251 47.243622405283, -1.58277427938425 47.2436262587508, -1.58276905589933 47.2436265878226, -1.5827270350311 47.243751893007, -1.58272063906618 47.2437510514668, -1.58270965384608 47.2437496054036, -1.58269130240888 47.2437471906928, -1.58265864222672 47.2437336252799, -1.5826495116683 47.2437309581593, -1.5826354555285 47.2437268529029, -1.58263014036464 47.2437253005479, -1.58262023597954 47.2437224516295, -1.58257349302808 47.2437435990665, -1.58247585547618 47.2437836706619, -1.5824234445073 47.2438051801369, -1.58242076021879 47.2438062783814, -1.58241992208635 47.2438073030022, -1.58237160647415 47.2438698360561, -1.58236776887642 47.2438748027065, -1.58232691793545 47.2438967963721, -1.58220341384409 47.2439254191648, -1.5821919935429 47.2439311008846, -1.58214774742546 47.243953590307, -1.58208662680152 47.2439845019587, -1.58197148313758 47.244042709916, -1.58195663996584 47.2440762797922, -1.58185656686161 47.2441589351086, -1.58178043147713 47.2442214426859, -1.58177784753147 47.2442237083265, -1.58177514004469 47.2442245371531, -1.58175245026209 47.2442315629561, -1.58141141235155 47.2443371680216, -1.58133937254886 47.2443595938252, -1.58128172517148 47.2443625634923, -1.5812808188339 47.2443626104401, -1.58127115847323 47.2443631082243, -1.58126204483159 47.2443635779031, -1.58125565702165 47.2443639244882, -1.58123701781579 47.2443649361326, -1.58122411773708 47.2443657207661, -1.58122133478246 47.2443663029867, -1.58122124898365 47.2443663208248, -1.58122115278969 47.2443663408795, -1.58121826852056 47.244366945161, -1.58113436990582 47.2443853381881, -1.58113189525961 47.2443857972812, -1.58090929758358 47.2444792826595, -1.58089756377389 47.2444859688345, -1.58086488389449 47.2445044823872, -1.58086135364554 47.2445065154035, -1.58084696766518 47.2445146589322, -1.58083125194104 47.244521972404, -1.58081850203152 47.2445279061205, -1.58078640651734 47.2445428433684, -1.58072044778854 47.2446021511104, -1.58058413623987 47.2446357889481, -1.58057614553151 47.2446382700866, -1.58054758773567 47.2446469676862, -1.5805165722103 47.2446564138329, -1.58020194076137 47.244841513277, -1.57989669580917 47.2450203805947, -1.57989373628931 47.2450183701855, -1.57989205847289 47.2450172314042, -1.57988541726363 47.2450200191392, -1.57987204646905 47.2450256440855, -1.57987196981598 47.2450256759754, -1.57986128079737 47.2450301722035, -1.57986317540741 47.2450320628612, -1.57986325209137 47.2450321391005, -1.57986518864911 47.2450340713384, -1.57959759914884 47.2452015250211, -1.57959294503914 47.2452012599615, -1.57946173003543 47.2451941444068, -1.57946070944021 47.2451920305843, -1.57946068053258 47.2451919713636, -1.5794596375394 47.2451898124784, -1.57941433974337 47.24519089683, -1.57938616638412 47.2451909391918, -1.57933232065628 47.2451911017406, -1.57930229606881 47.2452020299807, -1.57929582346454 47.2452054714559, -1.57927243093124 47.2452179087295, -1.57915596998001 47.2452947275751, -1.57907125915835 47.2453406335742, -1.5790396618094 47.2453568362901, -1.57901372079862 47.2453701382782, -1.57895575327283 47.2454023642089, -1.57890830186555 47.2454399380121, -1.57882763657916 47.2455128944777, -1.57871425748674 47.2456132894546, -1.57857433674269 47.2457281662009, -1.57850526830129 47.2458025327854, -1.57844388939761 47.2458686174432, -1.57838518160556 47.2459230392258, -1.57838512558008 47.2459230802046, -1.57835143428186 47.2459479841094, -1.57831637676191 47.2459738975855, -1.57825623857389 47.2460131371376, -1.57825458711902 47.2460142148518, -1.57825122151262 47.2460164106236, -1.5781783184959 47.2460616805433, -1.57810150336866 47.2461093788047, -1.57807063259687 47.2461285483805, -1.57807057106451 47.2461285868753, -1.57798496624903 47.2461764189675, -1.57793551096214 47.2462138027156, -1.57789810186038 47.2462527799384, -1.57787831747822 47.246284597847, -1.57785869237055 47.2463161598054, -1.57782407400792 47.2463753002172, -1.57780378725948 47.2464598326253, -1.57779628207642 47.2464911045769, -1.57778597225906 47.2465340599783, -1.5777805038966 47.2465850358921, -1.57777849291501 47.2466037855659, -1.57777847795791 47.2466039195222, -1.57777891204667 47.2466478796418, -1.57777891429616 47.2466480444506, -1.57777901128264 47.2466578759205, -1.57778726005541 47.2466810511954, -1.57778728794477 47.2466811293798, -1.57778730878456 47.2466811871201, -1.57779498196168 47.2467027453512, -1.57779682032773 47.2467079092177, -1.57779684465375 47.246707976731, -1.57780639672175 47.2467348161567, -1.57781996927992 47.2467520024962, -1.57782005688478 47.246752113444, -1.57782761578524 47.2467615440288, -1.57784701318952 47.2467855511066, -1.57787056605049 47.2468147991442, -1.57788443149429 47.2468575889296, -1.57788515959312 47.2468599027428, -1.57793750301115 47.2469485566805, -1.57747385883848 47.2469962259557, -1.57737806577333 47.2470060744718, -1.5774014969884 47.2471003613644, -1.57740152532547 47.2471004755744, -1.57741236450431 47.2471573491413, -1.57732336239371 47.2471548606821, -1.57721594967294 47.2471520512088, -1.57662855285934 47.2468648926932, -1.57644345892958 47.2467883093645, -1.57612180562077 47.2466187251183, -1.57573656265845 47.2462054107061, -1.57540610703054 47.245947946554, -1.57519294586183 47.2458112476651, -1.57489378531555 47.2456217123005, -1.57440058466757 47.2454755052357))
-Nantes;Malakoff - Saint-Donatien;5;440109.0;POLYGON ((-1.53602017078444 47.2338497094216, -1.53589188827996 47.2338312304419, -1.53587256694616 47.233860250474, -1.53584749959432 47.2338902740709, -1.53584007703994 47.2338991695266, -1.53581382553117 47.2338945572077, -1.53565552238786 47.2338669091154, -1.53474621826304 47.2337454997851, -1.53452090967914 47.2337146957168, -1.53424563947267 47.2336659343526, -1.53400508295327 47.2336107825966, -1.53383846389656 47.2335650381328, -1.5336842965536 47.2335213962148, -1.53354667604857 47.2334907999262, -1.53346957609097 47.2334651067027, -1.53342682609195 47.2334883378976, -1.53337293483073 47.2334946498314, -1.53336703662773 47.2334953880632, -1.5333290325726 47.2334909893458, -1.53330306868 47.2334830339119, -1.53325999622938 47.2334561086973, -1.5332274012267 47.2334186538789, -1.53323766900871 47.2333960628993, -1.53325069904071 47.2333677952916, -1.53304395086723 47.2332644922622, -1.53289696266761 47.2331939497549, -1.53278346695381 47.2331348923767, -1.53254285855613 47.2329912037068, -1.5323379794265 47.2328460464711, -1.53218062630669 47.2327327090602, -1.53175537952398 47.2324256190858, -1.53166804115962 47.2323625301884, -1.53160944246378 47.2323201834539, -1.53143853066908 47.2321966718006, -1.53103609248185 47.2319068279803, -1.53096928957997 47.2318479133309, -1.53092901631372 47.2318560190212, -1.53088562430578 47.2318520708247, -1.530837474146 47.2318390050604, -1.5308019702831 47.2318106542025, -1.53078886276459 47.2317774986742, -1.53078739748926 47.2317736756135, -1.53079691556319 47.2317370588649, -1.53077888806965 47.2317218121317, -1.53075294301549 47.2317031382646, -1.53062347171073 47.2316095786239, -1.53046008956133 47.2314913967246, -1.52933243597953 47.2306806060208, -1.52925415889907 47.2306238765047, -1.52910918661263 47.23051885594, -1.52847513498962 47.2300608696285, -1.5283429615212 47.2299664077363, -1.52829193324754 47.2299299297038, -1.52820742319195 47.2298692661491, -1.52818189454031 47.2298508474697, -1.52767642749384 47.2294868984949, -1.52755787206055 47.2294015268416, -1.52734454887638 47.2292488976326, -1.52637964345587 47.228559259097, -1.52630938363023 47.2285091049588, -1.526264906056 47.22847727065, -1.52623425523936 47.2284537993589, -1.52616690557057 47.2284018355986, -1.52587187228923 47.2281795289803, -1.5257648600669 47.2281019644626, -1.52565272871413 47.2280267325209, -1.5255681224564 47.2279683218569, -1.52548879498912 47.2279134263336, -1.52534803394078 47.2278133950707, -1.5249932674004 47.2275566098817, -1.52476339629156 47.227390661007, -1.52408161695411 47.2269023672197, -1.52349191415583 47.2264751143657, -1.52333538284897 47.2263671410099, -1.52324297668049 47.2262958400432, -1.52316108668058 47.2262530081575, -1.52312481494057 47.2262340482664, -1.52307838024105 47.2262098434393, -1.52299366003102 47.226173591536, -1.52302449371056 47.2261226619316, -1.52303143324723 47.2260850526956, -1.52302987656841 47.226037819566, -1.52300482094506 47.2259983993381, -1.52297678585352 47.2259634908512, -1.52291832589421 47.2259265392185, -1.52287061369963 47.2259011168395, -1.52283543652316 47.2258826598099, -1.5227421616645 47.2258634464669, -1.522683098444 47.2258602899024, -1.52264810697498 47.2258609205993, -1.522593863687 47.2258695816388, -1.52257978969875 47.2258541105368, -1.52248441665148 47.2257489534783, -1.52244482100643 47.2257242493981, -1.52240536499854 47.2256996317153, -1.52231413126954 47.2256262187161, -1.52220639840392 47.225553178566, -1.52163274935074 47.2251317736807, -1.5214826761586 47.225032589513, -1.52141881064832 47.2249958184263, -1.52135930147862 47.2249461115462, -1.52129257017602 47.2249025907901, -1.52095661379121 47.2246530914935, -1.52065686320681 47.2244344429897, -1.52056010318503 47.2243649964178, -1.52046113839681 47.2242979657548, -1.52037946125508 47.2242470196489, -1.52033998703355 47.2242129437164, -1.52031978490016 47.2241949761401, -1.52011202880864 47.2240419690061, -1.52001650061407 47.2239749126966, -1.51992648258534 47.2239146082208, -1.51988617541825 47.2238873155969, -1.51984204652066 47.2238528550075, -1.51962830840053 47.2236975252961, -1.51952854192376 47.223624847039, -1.51938745484559 47.2235181543171, -1.51915055314352 47.2233532406438, -1.51889725462739 47.2231680699396, -1.51883157093809 47.2231280252893, -1.51880238066304 47.2231027025901, -1.5187215089095 47.223039027949, -1.51862980571724 47.2229736447636, -1.51855573262536 47.222910734272, -1.51848578097843 47.2228481355641, -1.51842641394952 47.2228040073581, -1.51835291571919 47.2227215321721, -1.51799408690683 47.2223835335624, -1.51788449701289 47.2222643480095, -1.51774421602652 47.2221178900254, -1.51756595440832 47.2219257908847, -1.51733775786673 47.2216262995219, -1.51712983516395 47.2214063381216, -1.51669270943563 47.2207006541854, -1.51659957903363 47.2205088643907, -1.51622199518168 47.219711701418, -1.51573203004102 47.2186503208606, -1.51569105481365 47.2185183045043, -1.51567051114855 47.2183748416598, -1.51563940112399 47.2183611713441, -1.5156055451197 47.2183140331963, -1.51557896485288 47.2182734912033, -1.51557558392005 47.2182063247861, -1.51559172129631 47.2181476934242, -1.51563991662425 47.2180844777002, -1.51555840359895 47.2179272443777, -1.51555809449105 47.2179266239941, -1.515558080597 47.2179264443306, -1.51555776520114 47.2179257340892, -1.51545367183233 47.2176733348478, -1.51491498099189 47.2164481536026, -1.51865662426963 47.2151140261878, -1.52038879487827 47.2145635963845, -1.52039163799212 47.2145626906515, -1.52039461927971 47.2145618704863, -1.52589303616871 47.2130416173843, -1.52589601728691 47.2130407970762, -1.52589899701078 47.2130399759218, -1.52672501715899 47.2128148667369, -1.52986265388467 47.2123175076385, -1.53296676230089 47.2119714188783, -1.53383240663451 47.2119183066888, -1.53383569677711 47.2119181056119, -1.53383885512533 47.211917909738, -1.53496124381681 47.2118417565214, -1.53870898852592 47.21123602162, -1.53871131640603 47.2112353132873, -1.53871212651952 47.2112355560946, -1.53871436674081 47.2112372823018, -1.53892292594884 47.2113958131015, -1.54067739906981 47.2127741049798, -1.54092711371807 47.2129696169419, -1.54105800059255 47.2130721244339, -1.54232529305071 47.2140648996348, -1.54397718492329 47.2153622930816, -1.54415504113799 47.2154633950271, -1.54433338620185 47.2155256620465, -1.54495032247097 47.2156572224576, -1.54543060888039 47.2157744735552, -1.54553130058857 47.2157987017406, -1.54555698077377 47.2158050660105, -1.54568234602978 47.2158358090067, -1.54580860975461 47.2158798025793, -1.54638937100942 47.2156568674857, -1.54660996917193 47.2155772077933, -1.54661061882763 47.2155770099702, -1.54662555378626 47.2155952357683, -1.54692474574483 47.2159651013598, -1.54692633978996 47.2159670296158, -1.54692570595792 47.2159692118718, -1.54692373001644 47.2159762193307, -1.54680218950233 47.2164075896131, -1.54680155573647 47.2164097727662, -1.54680328159461 47.2164116958056, -1.54692955949753 47.2165542521274, -1.54693115356043 47.2165561803829, -1.54693287942798 47.2165581034203, -1.54727799396133 47.2169491689613, -1.54727971985408 47.2169510919933, -1.54728131386488 47.2169530193458, -1.54773208099277 47.2175083196442, -1.54773367511315 47.2175102478882, -1.54773526915715 47.2175121752342, -1.54791103861645 47.2177263775895, -1.54791263274982 47.217728305831, -1.54791422680669 47.2177302331743, -1.54863714559059 47.2186179857774, -1.54863873977681 47.2186199140084, -1.54864033388663 47.2186218413413, -1.54907975537893 47.219160677076, -1.54908134952073 47.2191626044025, -1.54908294373937 47.2191645326271, -1.54937504590579 47.2195205413957, -1.549376640069 47.219522468718, -1.54937823430905 47.2195243969383, -1.54956996008787 47.2197560721839, -1.54957155434189 47.2197580004014, -1.54957314851928 47.2197599277209, -1.54979703912863 47.2200358236533, -1.54979863332257 47.2200377509695, -1.54980022759316 47.2200396791837, -1.55012251093624 47.2204324970947, -1.55012410515378 47.2204344244062, -1.55012569944798 47.2204363526157, -1.55052496477627 47.2209242970431, -1.55052655909968 47.2209262252468, -1.55052815334645 47.2209281525524, -1.55096841358886 47.2214707362513, -1.55097000794452 47.2214726644485, -1.55097160222373 47.2214745917478, -1.55113165878538 47.2216704954749, -1.55113325315291 47.2216724236699, -1.55113484744398 47.2216743509667, -1.5516601379305 47.2223153005875, -1.55166173233648 47.2223172287748, -1.5516633266658 47.222319156064, -1.55218599495781 47.222954788546, -1.55218824245701 47.2229566043414, -1.55219074190901 47.2229564295947, -1.55245443990003 47.2229319524883, -1.55245759116272 47.2229316663002, -1.55246074366691 47.2229313791617, -1.55253038258306 47.2229254274918, -1.55293268854731 47.2228907789852, -1.55296815904991 47.2230495422913, -1.55312600721823 47.2237569233052, -1.55316291715296 47.2239227542877, -1.55338019203861 47.2248964414175, -1.55338061225532 47.2248985891364, -1.55338103882442 47.2249008267108, -1.55342257384395 47.225152065371, -1.55323625027588 47.2253389384915, -1.55325724039635 47.2254221729216, -1.55351887356923 47.2255491676066, -1.55389461437574 47.2273291980947, -1.5528733353403 47.228094825544, -1.55231494874548 47.2279127208654, -1.55220104000158 47.2279827625616, -1.55236647842323 47.2284852540636, -1.54906140098563 47.2313814843104, -1.54849862616533 47.2319932722395, -1.54821852950404 47.2325956231701, -1.54817062831309 47.2330522567115, -1.54824607365439 47.2335322059495, -1.54863721987703 47.2350307161217, -1.54785126586618 47.2352848857814, -1.54768836338017 47.2354034978905, -1.54741275005638 47.2354359290501, -1.54719529576625 47.2354552323024, -1.54717007176265 47.2354575227535, -1.54712054884935 47.2354365839754, -1.54709839081535 47.2354246315592, -1.5469698376294 47.2353551957419, -1.5468952691381 47.2353444668927, -1.54602683773096 47.2352422138603, -1.54593582056948 47.2352307782436, -1.54588070666433 47.2352238969389, -1.54586268975055 47.2352216218816, -1.54581194183915 47.2352147741396, -1.54577053217283 47.2352090526663, -1.54572230474941 47.2352023006908, -1.5455995409572 47.2351852673856, -1.54383303350366 47.2349401222095, -1.54363519514412 47.2349126445518, -1.54355291211841 47.2349012725606, -1.54351951561698 47.2348966318495, -1.54348945639841 47.2348924196129, -1.54343936873781 47.2348855492427, -1.54338954486683 47.2348786693205, -1.54146470485693 47.2346125161106, -1.54138576501344 47.234601661019, -1.54134649361386 47.2345962265072, -1.54132472508617 47.2345932655658, -1.54127142633793 47.2345858715344, -1.54124403742948 47.2345820190235, -1.54123481858591 47.2345807074415, -1.54099260121149 47.2345466122408, -1.53820696659136 47.2341549744289, -1.53805960973816 47.2341342570392, -1.53782393878176 47.2341010158572, -1.53753135673262 47.2340597786777, -1.53720590743594 47.2340138809722, -1.53687935607056 47.2339687052865, -1.53636286502385 47.2338992491663, -1.53615602143252 47.2338722568806, -1.53608671966474 47.2338629657827, -1.53604382609007 47.2338531482978, -1.53602017078444 47.2338497094216))
-""")
+        _sio = AbstractGeoDataFrameDemos._dataset(
+            "GeoDataFrameDemosA", "quartiersDeNantes.csv"
+        )
         return GeoDataFrameLib.read_csv(_sio, crs="epsg:4326").to_crs("epsg:2154")
 
     @staticmethod
     def intraBoulevardsNantes():
-        _sio = StringIO("""geometry
-POLYGON ((354936.6045667171 6688809.471226954, 354934.30148275825 6688808.890498861, 354932.6011936936 6688808.704547742, 354930.7026979257 6688808.720069877, 354928.4053363169 6688808.838779505, 354927.9081846024 6688809.142623298, 354924.2299158947 6688811.471003105, 354922.34858716594 6688813.584838381, 354921.1699741583 6688816.09263368, 354921.1920460673 6688818.79046489, 354921.91519874457 6688821.682416781, 354861.6903548104 6688849.9543409245, 354860.59531304863 6688850.462925709, 354824.8259190258 6688863.246168128, 354817.0541659793 6688866.007720839, 354806.17832733406 6688867.995241325, 354792.76522911084 6688865.20704105, 354789.054261274 6688863.538633481, 354778.0237310386 6688858.832352841, 354755.95040856174 6688847.92099654, 354733.19398985826 6688839.01375213, 354716.2525987862 6688832.457197184, 354645.58360878046 6688805.555230511, 354583.9385583068 6688782.376686059, 354566.3018093283 6688776.325447514, 354540.44866335066 6688767.543446945, 354526.21903230296 6688762.66346844, 354503.0711060948 6688754.758687421, 354431.19979955297 6688727.466842844, 354341.1627132725 6688690.530736077, 354277.97798158246 6688662.368461232, 354242.78070054855 6688647.3674963005, 354218.60577398125 6688636.073616306, 354159.61526658776 6688607.577272106, 354155.1032978312 6688605.715560456, 354145.67885957926 6688601.895485176, 354125.4705208431 6688586.871903231, 354105.9689851338 6688572.741879635, 354105.08195951534 6688574.248025938, 354100.41020438034 6688577.284008914, 354096.81877688604 6688578.012854888, 354090.71706699784 6688577.263329436, 354086.8095279781 6688575.996233963, 354084.3926267951 6688573.7176887905, 354083.88893541304 6688573.2221752945, 354082.15513095306 6688568.939519648, 354081.9168690431 6688564.2449319735, 354082.77610128745 6688559.34151911, 354082.97185567225 6688558.840287262, 354082.55582333036 6688556.845162785, 354082.5255775915 6688553.148137383, 354081.89744181867 6688549.655852661, 354080.3724709961 6688546.470678945, 354077.542807312 6688542.596687834, 354071.5984316321 6688536.649709254, 354059.92260120844 6688526.352832034, 354053.9831302983 6688521.005371176, 354050.16815511783 6688518.838182489, 354049.36306637997 6688518.145280557, 354046.68809281377 6688520.965085911, 354043.00655395794 6688522.893783932, 354038.8156015725 6688523.627531267, 354034.61320487235 6688522.962404183, 354030.9006028764 6688521.094157356, 354028.382963499 6688518.716509645, 354027.8784546833 6688518.121076588, 354025.9497133851 6688514.439572646, 354025.2159347037 6688510.248667841, 354025.8818649825 6688506.146245945, 354013.5958830232 6688494.555315754, 354001.8062354568 6688482.560622807, 353988.1697836815 6688464.685378342, 353970.6094442527 6688443.544647167, 353938.89506584074 6688402.33452704, 353935.0588372288 6688397.569429426, 353907.6990935922 6688363.418474812, 353900.2199386221 6688353.087289608, 353897.0717115936 6688346.917599818, 353888.1225474317 6688327.904848264, 353871.10061828507 6688287.074246118, 353865.850159487 6688268.231109284, 353857.66213481105 6688232.324599921, 353847.30037578836 6688199.433650862, 353816.9632069947 6688131.132271401, 353787.0526983389 6688066.124974676, 353773.0470044458 6688039.759028135, 353757.44748251437 6688014.005670375, 353740.657085564 6687989.261311865, 353723.48580678384 6687966.818371224, 353705.2243912231 6687945.48353224, 353695.34959085344 6687935.4717168445, 353688.2970962711 6687928.43461396, 353670.6638163491 6687910.592058185, 353645.69544601155 6687887.813161186, 353629.9073349557 6687875.651314956, 353594.0345186726 6687851.362750375, 353575.3527918894 6687839.72419278, 353503.30311797594 6687802.840916902, 353490.9679067365 6687797.445824008, 353483.8433357656 6687793.806805106, 353468.5876410418 6687785.637661355, 353447.72006189387 6687775.515875696, 353413.2395943489 6687762.6075259205, 353381.4765755734 6687752.075186027, 353380.47491974215 6687751.783596775, 353366.04879058787 6687747.304937102, 353260.66856236756 6687715.890341618, 353247.64948613005 6687712.39943909, 353234.931804484 6687709.105924662, 353222.9021419166 6687704.407819759, 353213.18697918236 6687701.6893148385, 353173.0036911917 6687687.928250918, 353137.14311209787 6687677.329481775, 353113.39660936076 6687669.529531448, 353109.4939881891 6687668.861954308, 353091.58451081114 6687666.11051476, 353047.5810347137 6687661.7737337705, 353020.38545967813 6687659.897619541, 353004.187693147 6687658.731002742, 352974.290994402 6687656.477265946, 352944.5949534238 6687654.321814226, 352891.6952704711 6687649.658053731, 352845.69583060604 6687645.637362963, 352832.09600340994 6687644.449505605, 352819.6026491523 6687644.151937224, 352819.9513779076 6687650.14465134, 352817.5883733679 6687654.460791037, 352814.6013612052 6687655.784249591, 352811.1106648914 6687656.612195435, 352809.46097918757 6687662.621247024, 352808.6877289047 6687665.825203212, 352808.29865543544 6687667.127423074, 352807.04457203497 6687672.633610136, 352805.78722418495 6687677.740119556, 352804.33574763255 6687683.547698629, 352770.06101200957 6687805.937580948, 352766.99412505777 6687821.950828016, 352764.4004589281 6687846.953559424, 352764.4977309174 6687858.8439771095, 352766.0249558169 6687874.519899071, 352770.2048882602 6687896.869188141, 352773.2064029347 6687909.535273371, 352778.28071826114 6687931.27769459, 352795.7180742506 6688010.676374509, 352814.722088612 6688098.356125883, 352837.1381251731 6688187.806662916, 352847.81497127755 6688234.7846158985, 352856.100453618 6688270.390533871, 352865.64138760814 6688312.881097535, 352881.8126700187 6688384.096207296, 352889.6976524431 6688419.605478118, 352909.19473672425 6688506.481822927, 352911.56975284824 6688515.855471895, 352919.213206022 6688546.270484489, 352925.7387296631 6688574.396333689, 352928.4274044617 6688585.466164951, 352972.59499980835 6688780.860591433, 352975.1287913353 6688797.42763409, 352979.1207201101 6688796.795444137, 352980.5220640191 6688797.08376739, 352982.9267033473 6688797.863520267, 352986.1437880453 6688800.235451531, 352987.2543610728 6688801.625340353, 352988.4681246122 6688803.4140906, 352989.6974191236 6688807.1013124455, 352989.710497836 6688808.70002537, 352989.8284018984 6688810.897438833, 352988.5596755954 6688814.605081085, 352986.0861773593 6688817.623088211, 352982.9091461915 6688820.147215239, 353005.11943352735 6688921.091014824, 353007.69756160583 6688930.8627121765, 353022.003246869 6688993.899161162, 353037.8289982633 6689059.521270895, 353055.26554974774 6689138.820115881, 353060.67478071136 6689164.8566543665, 353074.9763810046 6689227.393519349, 353086.7662597475 6689276.061167031, 353095.16965173243 6689313.864534649, 353099.9670968917 6689338.407184132, 353106.3303836058 6689371.130989896, 353106.63995523815 6689372.327574783, 353109.36214573844 6689387.49411833, 353105.4879252901 6689402.514730908, 353104.438658778 6689408.618811628, 353097.56171302346 6689435.255419311, 353077.761499281 6689506.7646453045, 353066.9702786357 6689543.525806056, 353056.41077894386 6689584.18219872, 353043.89455038327 6689629.950827961, 353021.3603092124 6689709.276658458, 353019.4182940922 6689716.187447804, 353011.0809529513 6689747.532532057, 353001.875385897 6689782.681913329, 353001.6156769367 6689787.58042539, 353000.6867665132 6689796.181681038, 353000.3016011289 6689810.174512948, 353001.13346936455 6689826.355775814, 353003.03667479806 6689839.130787078, 353009.3541860682 6689866.259105358, 353017.62760883657 6689888.175268172, 353040.2138475101 6689937.354250871, 353094.1560853013 6690057.224628861, 353113.5916466972 6690099.934162221, 353122.44661266217 6690119.647197621, 353143.2367311065 6690169.140653399, 353150.8624021946 6690185.1664636, 353187.86955859757 6690262.606671921, 353195.13170816517 6690270.841199404, 353206.62077942165 6690282.738451774, 353211.82729158626 6690283.994936943, 353215.6577994591 6690288.060607456, 353217.6987232592 6690293.240095812, 353217.84360267915 6690298.734861343, 353215.9089445136 6690306.544931079, 353216.94392546633 6690323.124247108, 353219.2124836044 6690331.699371282, 353222.88402119826 6690340.762659574, 353236.4285358098 6690371.82897416, 353240.8052416592 6690381.585983473, 353253.6315095765 6690410.359863799, 353258.00576324185 6690419.817114457, 353272.65513023565 6690451.573885494, 353284.4568495494 6690477.258424892, 353335.4417272173 6690589.85842151, 353350.9068114903 6690623.607058887, 353353.96002351516 6690630.3770971475, 353392.7524929974 6690718.394949761, 353394.59602787823 6690723.875833147, 353401.0220273381 6690727.620511767, 353405.7559111506 6690732.178432572, 353408.97545036726 6690734.850129658, 353410.7002634037 6690738.033676308, 353410.1260785256 6690741.136088033, 353409.33897291584 6690742.641417686, 353410.0613073121 6690745.433452768, 353409.4068199655 6690750.9347545495, 353416.5320718577 6690766.864739115, 353443.430646198 6690805.716101968, 353451.4085925799 6690815.94331244, 353464.4169159823 6690830.326315301, 353485.66452923435 6690850.237851719, 353496.72530970414 6690858.641188941, 353530.46630490816 6690878.850313774, 353553.0416942163 6690890.057399657, 353576.5950391969 6690898.658404956, 353589.4192462512 6690902.750492385, 353603.5358854522 6690906.032604287, 353642.7759938236 6690914.405462117, 353682.8211916432 6690923.471223652, 353718.6599027081 6690931.372250608, 353783.62545889354 6690945.130709889, 353867.40557227377 6690962.332730134, 353872.1108463514 6690963.393460327, 354003.96498216985 6690993.892443482, 354017.0775084161 6690996.583201958, 354041.505619718 6691002.179259917, 354106.4809878848 6691017.13674784, 354153.03003843577 6691027.248529748, 354153.63119873987 6691027.443468728, 354216.2002916762 6691041.421358309, 354218.1725509543 6691038.207589619, 354221.15301126376 6691036.084770916, 354225.0376644107 6691034.554120015, 354227.0368998373 6691034.637704397, 354228.53571331245 6691034.625452837, 354231.84209501324 6691035.697617101, 354234.6554119016 6691037.573223554, 354236.27621768886 6691040.257989595, 354237.1992121083 6691043.1483126255, 354251.17568525096 6691053.726199304, 354270.10060003237 6691070.658931216, 354336.4612123112 6691120.579360364, 354406.3329550543 6691172.169841822, 354429.85995508346 6691189.764443042, 354525.77143877395 6691260.727668131, 354526.3587021717 6691259.223970092, 354531.22539762367 6691255.5868342295, 354536.7316744757 6691256.840869095, 354538.45975874335 6691260.424097568, 354540.0903745172 6691264.307902307, 354538.51943398936 6691267.718244861, 354654.8669162649 6691357.100758912, 354724.7746377531 6691413.087726465, 354725.0760354303 6691413.28511581, 354726.7828656357 6691414.27042897, 354730.7059402968 6691417.4360095505, 354738.54227993713 6691422.568132555, 354740.326141749 6691420.754873157, 354743.1173874066 6691419.9326444, 354745.9217126723 6691420.709133233, 354747.9364803719 6691422.691194535, 354748.24441785645 6691423.687942677, 354750.3378521001 6691423.071271102, 354749.7211596541 6691420.977854964, 354750.49682013295 6691418.073645042, 354752.4788888026 6691416.058912346, 354755.37005536194 6691415.235866768, 354757.57322021906 6691415.817416585, 354758.27430153516 6691416.011538787, 354760.28906923905 6691417.993600074, 354761.1121433182 6691420.884741451, 354760.4347688055 6691423.588294913, 354765.26612393215 6691427.845642802, 354819.54732488864 6691454.781801173, 354852.9664992385 6691472.295545355, 354935.0443288821 6691513.493833311, 354936.2204903441 6691510.686275509, 354938.8094417542 6691509.56592035, 354940.8054075448 6691509.249824886, 354943.6056455188 6691509.5267142765, 354945.3108408724 6691510.312187731, 354947.81785596657 6691511.390886441, 354949.8407986587 6691514.372146623, 354955.01951895474 6691512.231356104, 354968.3549672978 6691505.527194267, 355026.915537026 6691481.465827636, 355045.15037964564 6691475.121320881, 355118.65984531835 6691446.141274078, 355135.29431802424 6691439.609994788, 355230.8176336135 6691402.056154084, 355243.66410375317 6691396.655030665, 355279.4130859282 6691381.373809333, 355294.5569192753 6691375.8539783405, 355296.84774271125 6691374.9359124135, 355307.90626370546 6691370.848449401, 355325.65539796837 6691366.206659311, 355354.2852835878 6691360.17687584, 355399.915620607 6691355.706867721, 355426.78780447063 6691354.687779677, 355436.8830860017 6691355.004958621, 355437.7570317684 6691351.900090606, 355440.03150521306 6691348.983626625, 355444.50423858844 6691346.049192181, 355447.1988330664 6691345.627457978, 355451.49543202826 6691345.592333882, 355453.19899241335 6691346.177966927, 355454.5053216653 6691347.06662699, 355456.41444634343 6691348.350065568, 355488.1564084258 6691356.2845579125, 355529.03695310483 6691369.740231104, 355549.801513281 6691379.463213864, 355588.6294994811 6691398.531554648, 355606.0000191452 6691408.6819898365, 355634.31423805316 6691425.138262466, 355662.0256617714 6691441.199756751, 355712.52704277553 6691470.265254293, 355780.80843908247 6691510.676959888, 355786.9363149207 6691514.623928571, 355810.83521282225 6691528.817985816, 355827.49647734285 6691537.775100844, 355859.0762056351 6691550.307541585, 355883.01371173776 6691557.006787653, 355899.0296705143 6691560.373287814, 355916.53872042266 6691563.028095454, 355939.646611481 6691566.036838443, 355986.04425023735 6691569.85445126, 356005.53046313155 6691569.895002432, 356006.3028524683 6691566.591109625, 356008.87954081624 6691563.971952777, 356012.3694151069 6691563.044083025, 356013.07049651846 6691563.238204829, 356015.8740046516 6691563.91477211, 356018.4932037341 6691566.491451913, 356019.42110494437 6691569.981297889, 356024.2230313266 6691570.641527829, 356026.0240602885 6691570.926584032, 356027.9241926479 6691571.110903425, 356055.43432658014 6691574.783142253, 356085.8454370868 6691578.831371182, 356087.546545145 6691579.117244198, 356098.95060941356 6691580.622839916, 356114.45633620064 6691582.694463435, 356126.4607434826 6691584.29507769, 356149.57435745565 6691588.003257569, 356159.05539888 6691586.526775162, 356170.6233341889 6691583.634259009, 356259.98487962113 6691562.418744469, 356273.9435589207 6691558.6073423745, 356347.2260115353 6691538.5225382345, 356450.03354832926 6691511.900969075, 356513.3467986083 6691494.6956018265, 356613.3614522749 6691468.696409347, 356705.68709960405 6691443.359630018, 356856.6501477631 6691403.353848627, 356934.024444783 6691382.635987745, 357012.5994267087 6691362.108157525, 357105.3329266768 6691337.767273778, 357128.4606181547 6691330.983020098, 357141.11460076267 6691326.482786628, 357146.494796118 6691324.540190932, 357176.16821405065 6691311.706817351, 357188.79358228005 6691303.7093836535, 357196.94294859265 6691298.246713013, 357201.71299030446 6691295.010058949, 357204.5132282148 6691295.286943806, 357218.10673841427 6691283.484380436, 357248.0817331319 6691258.6573379, 357261.75717778533 6691244.655717092, 357311.0436054233 6691186.295268956, 357319.9498256507 6691175.630221899, 357324.4053884034 6691170.597458296, 357374.5829263432 6691111.230453826, 357373.48052626394 6691110.839760795, 357371.96536172146 6691108.853615961, 357372.03585064283 6691105.255679519, 357373.12435228715 6691103.94773281, 357374.0154648032 6691102.941180038, 357377.0049161362 6691101.917470433, 357379.80842411175 6691102.594034546, 357562.5193589389 6690888.056439592, 357616.35798840004 6690824.262712308, 357704.7387086624 6690719.816165183, 357720.95976794435 6690699.398415366, 357750.8513617919 6690664.379516628, 357752.93089630373 6690662.064199234, 357823.10439597873 6690579.550530954, 357863.1799190145 6690531.258034985, 357922.4618604821 6690461.024472055, 357923.45452867396 6690460.216941583, 357934.2739578765 6690451.334923397, 357943.84101721604 6690448.1589653995, 357942.8001123169 6690443.07121756, 357943.1531942447 6690437.372510902, 357947.06418423547 6690426.848231031, 357950.1331163472 6690423.325702774, 357955.0104350566 6690420.9875068115, 357961.3939250253 6690419.536334438, 357962.8951908602 6690419.8238382265, 357964.5447914032 6690413.81474969, 357969.17566672247 6690405.782749467, 357979.17120145535 6690393.909668176, 358050.0269667921 6690309.2919426225, 358120.78444277705 6690224.874868332, 358132.37543999735 6690212.5890318435, 358135.8358794124 6690208.064034856, 358142.1637736263 6690199.818303183, 358149.19111388037 6690191.566851747, 358151.96273568727 6690188.346533972, 358161.9599042585 6690176.673290513, 358178.39061071427 6690157.45293766, 358191.3576074027 6690142.357901848, 358214.5158908471 6690114.888547797, 358236.67660042434 6690087.627204205, 358254.5709629921 6690064.0980347525, 358258.2279734884 6690059.171723207, 358274.52523711073 6690035.855467194, 358291.96840804274 6690006.034607937, 358300.83946589276 6689991.072992564, 358303.8912280005 6689985.452143883, 358309.99475218524 6689974.210446504, 358310.8809586171 6689972.604373004, 358317.0819508683 6689961.062098598, 358321.1182050384 6689953.634519334, 358326.61239295895 6689941.198685177, 358354.80047427997 6689844.538958707, 358361.7936504129 6689819.899816317, 358375.63266165974 6689764.826992184, 358385.90868471924 6689726.171274825, 358391.14334667806 6689706.442919404, 358411.007392109 6689630.536085982, 358422.21885122504 6689584.078443544, 358416.9217620576 6689559.539813902, 358413.3098950071 6689557.770672772, 358410.89380779496 6689555.592045984, 358408.8675929614 6689552.211111338, 358406.74391003826 6689549.130753674, 358405.11656101834 6689545.646630478, 358404.2656864155 6689539.358211849, 358406.5877513876 6689530.04604611, 358409.6370601517 6689524.125438028, 358411.9033538256 6689520.209765901, 358409.52586864267 6689510.53632707, 358406.8780539795 6689504.462457385, 358392.75750446465 6689488.489751075, 358386.0202934357 6689483.3486645445, 358371.1371686041 6689471.878892691, 358325.33534676407 6689443.174819501, 358321.490117343 6689437.310596127, 358206.67459032725 6689376.394995655, 358204.4238304855 6689382.209145074, 358202.5351454107 6689383.423709951, 358200.24514180655 6689384.441703616, 358198.1443513717 6689384.159104118, 358195.53578094294 6689382.881391276, 358193.5193773717 6689380.699496315, 358192.7061118049 6689379.007395061, 358192.28517140896 6689376.412746006, 358192.8626218616 6689373.710005504, 358195.3352980087 6689370.592059429, 358135.62976568064 6689340.203014359, 358127.30853824504 6689336.873561238, 358118.3853330502 6689333.249251308, 358099.2342287559 6689325.311815071, 358047.3207116012 6689306.850237437, 358022.6633329447 6689297.658785466, 358022.3774691585 6689299.3598751165, 358020.9072715916 6689302.869328627, 358017.930085685 6689305.391840379, 358013.73504551884 6689305.626000287, 358010.1231789509 6689303.856859423, 358006.7029783459 6689301.0868853275, 358005.871726307 6689297.196546637, 358006.8398669693 6689293.391419229, 358007.72607337736 6689291.785346623, 357953.26139413635 6689266.849403954, 357820.52716910065 6689214.27432091, 357782.13730594964 6689199.8990624705, 357737.23214958614 6689183.078920714, 357710.0816570954 6689174.507415176, 357705.97182176413 6689172.942199698, 357704.8128323002 6689177.848078748, 357702.8381248766 6689180.762097509, 357699.2573259857 6689182.78991155, 357695.36777138885 6689183.72105843, 357691.25957117707 6689182.355682621, 357685.2316184381 6689178.407915756, 357683.4134218724 6689176.024547315, 357682.80081585294 6689174.430732241, 357682.9834887205 6689172.330780808, 357683.2603594894 6689169.530573196, 357683.54458831815 6689167.629644369, 357687.5029963672 6689162.900725502, 357610.90758067503 6689132.250095304, 357567.20556385245 6689115.919746239, 357566.73620934464 6689119.620866478, 357565.4617652385 6689122.629084734, 357563.0800163502 6689124.647092809, 357558.88088856835 6689124.381652448, 357557.0716852641 6689123.09740257, 357554.9594492207 6689121.415924648, 357554.2436522049 6689119.423247437, 357554.2199430151 6689116.525571678, 357555.0013234177 6689114.320797909, 357556.1872925116 6689112.712274767, 357507.7086974753 6689098.819223517, 357463.15971760004 6689088.891097746, 357420.7336021253 6689081.943407006, 357363.01142358914 6689074.121535319, 357293.00470550446 6689067.099605048, 357230.1841122544 6689059.01964214, 357199.9802236671 6689055.869133109, 357169.3766517905 6689052.721891951, 357165.18161184585 6689052.956049799, 357103.55253079784 6689056.158034235, 357059.5119691031 6689059.51596713, 357043.5336285393 6689060.745819748, 357036.44415453525 6689061.403352078, 357018.5632303801 6689062.149130001, 357013.36325926625 6689061.692019526, 357008.0699076517 6689062.035084653, 357003.0763185399 6689062.375698493, 356988.8802021362 6689061.592446527, 356961.48308998835 6689059.51817229, 356946.89383058 6689059.537546794, 356930.9081321002 6689059.868119733, 356898.75733191165 6689063.028894476, 356849.31123428093 6689065.231904809, 356836.30844514223 6689063.7394077815, 356833.24114810204 6689067.461769971, 356831.25335937133 6689068.777068961, 356827.85932112066 6689069.204528733, 356824.36372696125 6689069.432965957, 356820.7584015346 6689068.463182572, 356818.2497526885 6689067.184651946, 356807.30751295725 6689073.269718391, 356802.0395048886 6689076.710296638, 356801.06972780824 6689080.315580368, 356797.9065975528 6689084.538358516, 356794.822949745 6689086.262324431, 356792.02925401984 6689086.784801457, 356790.23149651097 6689086.899428538, 356787.42390268965 6689085.723268856, 356784.70805435715 6689083.547094057, 356782.186324955 6689080.669846479, 356780.5426271735 6689075.187330366, 356741.2073368793 6689079.60596765, 356728.33308221435 6689081.609845576, 356656.5723898922 6689104.480246812, 356625.71547244006 6689119.221905818, 356616.9633152787 6689124.289796718, 356607.9459140479 6689121.36573783, 356602.4519030682 6689121.610515488, 356597.56886251934 6689123.249267939, 356593.1936014429 6689125.883133062, 356590.5178121227 6689128.603028039, 356585.8887524497 6689124.643820671, 356535.6904333656 6689095.975687292, 356528.45852689655 6689091.438204668, 356504.2517062872 6689076.247466573, 356496.81914070516 6689071.611698334, 356477.338030559 6689059.979671383, 356467.1953396197 6689053.867166793, 356463.2779889185 6689051.401037138, 356457.1517520273 6689047.653925399, 356459.22801638825 6689044.938933222, 356477.5204348243 6689021.206710081, 356534.4813105388 6688948.194324149, 356536.0023787641 6688938.688872052, 356531.53882495343 6688930.531400858, 356522.4010653241 6688925.110165644, 356504.1451667828 6688916.665769912, 356450.30455500976 6688894.722501433, 356381.31948957365 6688866.008144145, 356376.7296715891 6688866.845086789, 356376.21698708425 6688865.250455817, 356374.403696751 6688863.4666070305, 356371.8000325273 6688862.78841209, 356369.2078136139 6688863.509093859, 356368.9113212133 6688863.9112240765, 356357.998060881 6688849.111421146, 356352.7572140799 6688843.658321032, 356321.8720509822 6688830.520725568, 356282.63459797803 6688810.256722862, 356278.52067612257 6688808.191907098, 356251.174436039 6688800.121622235, 356250.3456387545 6688796.531047535, 356249.52419913706 6688793.839750616, 356248.21296560287 6688792.351575976, 356245.00405386515 6688790.9788450375, 356244.1023138629 6688790.686439231, 356226.7489742488 6688782.634369163, 356145.12156784773 6688747.628095884, 356126.4651703732 6688739.08704864, 355999.7237902358 6688686.163131741, 355928.0367830073 6688656.971234455, 355917.9104444489 6688652.857126599, 355888.9589332025 6688644.000554712, 355852.21032785735 6688634.808032152, 355840.3050347745 6688633.106703876, 355818.4830550446 6688628.488669959, 355801.4768949889 6688626.2294916315, 355793.08027582645 6688625.898443083, 355772.6947928928 6688625.865277051, 355769.09846076195 6688625.994609686, 355718.0503651217 6688627.8109846655, 355696.78276227973 6688629.883484561, 355672.12766141543 6688633.182799181, 355619.24074733857 6688642.308831948, 355409.372752782 6688688.69191563, 355376.055603961 6688695.859250668, 355372.5640974981 6688696.587283273, 355221.84777775983 6688730.095809473, 355144.74468084495 6688747.314000128, 355138.56757418765 6688749.562885483, 355129.9243287151 6688755.729062717, 355128.2068724998 6688753.444798547, 355125.2985411945 6688752.169534861, 355123.59579969937 6688751.68382497, 355121.09696151817 6688751.604329579, 355119.6988874117 6688751.715686861, 355116.71107238263 6688752.939232178, 355114.1327504699 6688755.358545782, 355112.55036689877 6688757.370010944, 355111.67969138 6688760.874552538, 355107.7835965646 6688761.006334055, 355082.5224291355 6688763.511179881, 355039.61369666667 6688770.856852925, 354984.2671790964 6688784.699503631, 354964.24113348516 6688791.958009317, 354952.88939793507 6688796.847286848, 354948.2217307108 6688800.382872423, 354936.6045667171 6688809.471226954))
-""")
+        _sio = AbstractGeoDataFrameDemos._dataset(
+            "GeoDataFrameDemosA", "intraBoulevardsNantes.csv"
+        )
         return GeoDataFrameLib.read_csv(_sio)
 
     @staticmethod
     def intraPeripheriqueNantes():
-        _sio = StringIO("""geometry
-POLYGON ((356389.5 6683116.3, 356362.5 6683112.6, 356312.1 6683108.2, 356264.2 6683103.7, 356223 6683101.6, 356179.4 6683100.9, 356134.6 6683100.3, 356101.6 6683100.6, 356094.5 6683100.6, 356083.5 6683100.9, 356083.2 6683100.9, 356078.1 6683101, 356068.6 6683101.1, 356040.8 6683101.9, 356008 6683103.9, 355961.4 6683107.3, 355918 6683111.1, 355877.8 6683115.9, 355843.7 6683120, 355813.7 6683123.8, 355784.5 6683128.5, 355761.8 6683132.2, 355747.3 6683134.9, 355737.8 6683136.7, 355688 6683146.5, 355622.1 6683161.4, 355562.8 6683176.3, 355513.8 6683190.3, 355466.6 6683204.7, 355429.5 6683217.1, 355394.3 6683228.2, 355379.5 6683233.3, 355289.5 6683266.9, 355136.9 6683332.1, 355081.3 6683355.9, 355081.1 6683356, 355078.1 6683357.4, 354813.9 6683472.1, 354799.9 6683478.4, 354708.8 6683519.8, 354664.6 6683539.8, 354618.8 6683561.4, 354505.2 6683616.6, 354423.1 6683659.7, 354383.2 6683681.6, 354282.7 6683738.2, 354213 6683781.3, 354076.5 6683870.4, 353968.5 6683944.3, 353881.6 6684005.1, 353830.5 6684043.2, 353822.4 6684048.3, 353815.2 6684054.2, 353615 6684194.6, 353565.2 6684229.5, 353500.5 6684274.5, 353486.5 6684283.5, 353454.5 6684304.3, 353416.4 6684328.1, 353379.7 6684349.3, 353379.2 6684349.5, 353379 6684349.6, 353328.4 6684377, 353284.1 6684398.5, 353283.5 6684398.8, 353283 6684399.1, 353249.6 6684414.1, 353194.9 6684437.1, 353126.7 6684462, 353048.3 6684487.9, 353043.3 6684489.7, 353017.7 6684497.9, 352939.4 6684521.8, 352886.7 6684539.8, 352835.2 6684560, 352794.4 6684576.6, 352746.5 6684597.3, 352714.2 6684612.8, 352688 6684625.7, 352651.9 6684645.3, 352614.4 6684666.7, 352568.9 6684694.5, 352529.8 6684719.5, 352501 6684738.9, 352470.5 6684760.7, 352452.3 6684774.8, 352427.8 6684794.1, 352370.6 6684845, 352323.2 6684888.8, 352304.1 6684909.4, 352221.1 6684991.4, 352192.1 6685019.8, 352155.8 6685055.4, 352088.6 6685121.9, 352010.8 6685198.9, 351884.6 6685321.8, 351826.8 6685373.6, 351769.1 6685422.2, 351738.7 6685445.7, 351737 6685447.2, 351716.1 6685463.6, 351669.5 6685497.9, 351624.4 6685528.6, 351568.2 6685565.2, 351530.4 6685588.5, 351488.7 6685612, 351444.7 6685636.4, 351400.5 6685659.1, 351398.7 6685659.9, 351374 6685672.4, 351323.5 6685695.4, 351277.6 6685714.9, 351266 6685721.1, 351241.21984726447 6685734.764484223, 351238.73263200646 6685730.522026966, 351228.1 6685734.8, 351227 6685735.3, 351107.2 6685781.4, 351070.4 6685796.4, 351028.5 6685817.5, 350981.6 6685848.5, 350969.1 6685858.9, 350948.3 6685876.2, 350937 6685889.5, 350916.1 6685913.7, 350892.7 6685944.3, 350870.9 6685981.2, 350858.7 6686006.1, 350850.9 6686022.4, 350847.8 6686031.1, 350838.8 6686056, 350837.6 6686059.6, 350831.7 6686086, 350826.4 6686118.4, 350824.5 6686141.4, 350823.9 6686149.3, 350822.9 6686174.6, 350822.9 6686180.9, 350823.2 6686193.1, 350823.7 6686206.4, 350824.3 6686219.6, 350824.7 6686232.3, 350825.6 6686245.8, 350828.3 6686287.6, 350830.9 6686324, 350833.9 6686361.5, 350834.7 6686374.1, 350835.5 6686388.9, 350837.6 6686426.5, 350840.1 6686464, 350842.8 6686502.5, 350845.4 6686541, 350847.8 6686579.6, 350850.5 6686618.1, 350852.8 6686656.7, 350855.3 6686695, 350858 6686736.8, 350861.5 6686784.8, 350864.5 6686832.2, 350867 6686871.2, 350869.2 6686909.4, 350871.9 6686948.3, 350874.7 6686987.6, 350876.9 6687024.5, 350879.5 6687062.3, 350881 6687087.6, 350882.8 6687114, 350885.5 6687154.2, 350888.4 6687192.5, 350891.6 6687243.4, 350893.3 6687280, 350895.8 6687310.2, 350895.2 6687343.6, 350894.2 6687358.2, 350893.8 6687361.4, 350893.7 6687363.2, 350893.4 6687368.1, 350893.3 6687369.8, 350893.1 6687371.2, 350892.6 6687377.2, 350892.5 6687379.3, 350892.4 6687380.2, 350891.8 6687387.4, 350891.7 6687388.9, 350891.7 6687389.2, 350891.1 6687398, 350888.9 6687413.2, 350885.3 6687438, 350884.9 6687441.1, 350883.7 6687450, 350881.7 6687463.9, 350874.5 6687498.4, 350873.3 6687504, 350872.4 6687508.4, 350871.1 6687515.1, 350870.9 6687515.7, 350870.2 6687519.2, 350869.9 6687520.6, 350864.1 6687540.4, 350849.3 6687591.6, 350824.9 6687655.6, 350824.8 6687656.3, 350823.4 6687659.2, 350800.1 6687710.2, 350780.3 6687748.9, 350780 6687749.3, 350779.1 6687751.3, 350778.3 6687752.8, 350757.1 6687788.9, 350754.4 6687793, 350748.5 6687801.7, 350747.7 6687802.9, 350733.5 6687821.2, 350697.3 6687871.7, 350659.8 6687914.4, 350639.7 6687935.3, 350618.8 6687957.1, 350592.3 6687981.6, 350537.6 6688026.6, 350518.1 6688043, 350483.6 6688074.7, 350459.9 6688100.4, 350459.3 6688101, 350455.6 6688105.1, 350435.9 6688125.8, 350403.5 6688162.8, 350399.8 6688168, 350376.3 6688199.8, 350352.9 6688234.3, 350345 6688245.9, 350317 6688294.4, 350314.9 6688298.2, 350312.3 6688302.5, 350312.2 6688302.9, 350308.4 6688309.9, 350233.2 6688456.9, 350158.1 6688604, 350083 6688751, 350060.2 6688800.6, 350042.9 6688843.4, 350038.4 6688856, 350029.1 6688882.4, 350016.2 6688926.6, 350009.3 6688958.5, 350002.1 6688996.6, 350001.3 6689002.4, 349996.7 6689037.2, 349992.5 6689089.9, 349991.6 6689125.6, 349992 6689152.3, 349995.8 6689202.1, 349996.1 6689205.6, 350000.8 6689241.4, 350009.1 6689287.8, 350013.4 6689308.2, 350025 6689355.1, 350029.9 6689371.7, 350032.8 6689381.7, 350036.1 6689393, 350094.2 6689589.5, 350098.2 6689604.8, 350101.4 6689617.8, 350102 6689619.9, 350102.7 6689623.5, 350104.3 6689630.1, 350110.4 6689646.3, 350142.3 6689744.4, 350159.3 6689792.1, 350184.5 6689855, 350201.8 6689895.7, 350207.9 6689907.9, 350222.1 6689938.5, 350229.5 6689953.9, 350315.8 6690129.4, 350327.1 6690154.4, 350327.6 6690155.5, 350329.2 6690158.9, 350331.3 6690163.2, 350331.5 6690163.6, 350358.2 6690217.6, 350379.7 6690265.5, 350388.5 6690288.1, 350414.9 6690363.4, 350417 6690367.3, 350429.9 6690403.8, 350441.3 6690436.4, 350449.5 6690466, 350459.6 6690501.1, 350474.9 6690549.7, 350490.3 6690592.9, 350497.5 6690616.4, 350504.2 6690641.9, 350506.2 6690662.8, 350505.8 6690681.6, 350502.5 6690698.6, 350499.9 6690708.4, 350499.6 6690709.7, 350498.8 6690717.5, 350499.7 6690726.8, 350501.7 6690736.3, 350509.8 6690742, 350515.1 6690747.5, 350522.4 6690757.5, 350526.8 6690767.9, 350528.4 6690773.6, 350529.5 6690783.4, 350529.2 6690787.9, 350528.8 6690789.5, 350525.8 6690802.4, 350524.1 6690807.3, 350519.6 6690814.5, 350511.8 6690824.2, 350510.1 6690826.3, 350505.8 6690830.1, 350505.5 6690839.7, 350505.3 6690857.7, 350506.3 6690882.4, 350506 6690907.8, 350504.8 6690929.5, 350502.7 6690948.4, 350499.9 6690966, 350497.7 6690990.6, 350495.9 6691020.1, 350495.9 6691021.9, 350495.8 6691032.1, 350495.8 6691041, 350495.7 6691046.9, 350496.1 6691137, 350493.9 6691164.6, 350491.8 6691187.2, 350489.4 6691197, 350488 6691203.9, 350484.7 6691221.3, 350478.6 6691252.8, 350469.1 6691288.1, 350454.6 6691332.4, 350438.9 6691371.6, 350425 6691400.7, 350401.4 6691443.5, 350363.7 6691510.1, 350357.4 6691521.2, 350339.7 6691552.9, 350320.5 6691592.2, 350308 6691622.2, 350295.6 6691654.7, 350288.1 6691680.4, 350282.7 6691700.2, 350278.4 6691718.5, 350275.7 6691735.2, 350272.7 6691753.3, 350271.9 6691758.7, 350269.6 6691777.4, 350267.7 6691800, 350267.6 6691802.2, 350266.3 6691824.1, 350266.6 6691845.3, 350267.2 6691867.6, 350268.4 6691892.4, 350270.6 6691910.9, 350273.6 6691931, 350277.3 6691953.3, 350282.6 6691975.6, 350289.1 6692002.3, 350295.4 6692023, 350306.6 6692054.7, 350321.2 6692089.9, 350329.6 6692109.5, 350338.5 6692130.5, 350353.1 6692164.6, 350365.3 6692195.4, 350375.9 6692223.6, 350387.1 6692255.6, 350399.3 6692292.1, 350408 6692317.8, 350420 6692355.9, 350431.5 6692393.4, 350439.3 6692420, 350443.8 6692436.3, 350447.3 6692449.4, 350458.5 6692490.1, 350469 6692530.9, 350479.6 6692567.7, 350488.2 6692600.4, 350500.9 6692643.4, 350507.7 6692668.4, 350525.8 6692734.7, 350541.7 6692789.5, 350558.8 6692850.5, 350568 6692881.9, 350578.3 6692916.7, 350591.3 6692962.8, 350598.9 6692989.7, 350611 6693031.9, 350617.2 6693053.2, 350634.6 6693120.5, 350659.2 6693204.2, 350679.1 6693275.6, 350694.4 6693328.5, 350706.7 6693382.3, 350716.5 6693437.6, 350721.6 6693493.8, 350721.7 6693494.7, 350725.2 6693555.4, 350724.3 6693609.8, 350723.5 6693621.6, 350721.3 6693653.4, 350718.6 6693674.1, 350715.4 6693698.3, 350710.7 6693723.4, 350709.8 6693728.3, 350706.1 6693748.3, 350697.7 6693785.5, 350694.5 6693799.4, 350681.6 6693847.2, 350662 6693922.2, 350651 6693962.5, 350649.6 6693968, 350640.2 6694017.5, 350634.7 6694063.1, 350632.9 6694108.9, 350634.6 6694157.3, 350639.6 6694203.3, 350650.1 6694255.4, 350663.3 6694300.8, 350669.2 6694316.3, 350672.5 6694324.9, 350682.1 6694350.3, 350684.7 6694355.6, 350703.8 6694394.2, 350711.1 6694406.4, 350727.1 6694433, 350752 6694469, 350779.2 6694502.5, 350810.2 6694535.5, 350845.8 6694568.5, 350871.3 6694588.2, 350881.9 6694589.1, 350918 6694596.1, 350929.2 6694598.2, 350931.8 6694598.8, 350968.4 6694606.7, 350986.8 6694613.4, 351004.7 6694620, 351051.4 6694639.5, 351090.6 6694658.7, 351129.5 6694679, 351168.6 6694697.6, 351213.8 6694716.3, 351253 6694729.5, 351284.2 6694747.5, 351288 6694748.6, 351411 6694790.6, 351491 6694819.2, 351500.1 6694822.8, 351521.5 6694831.1, 351595.9 6694860, 351672.4 6694888.2, 351716.9 6694903.6, 351792.2 6694926.8, 351841.2 6694939.1, 351855.7 6694942.8, 351862.5 6694944.4, 351864 6694944.7, 351865.6 6694945.1, 351867.9 6694945.7, 351892.5 6694951.3, 351926.6 6694958, 351974.3 6694965.7, 351974.6 6694965.7, 351999.4 6694968.7, 352026.4 6694973.2, 352106.8 6694981.2, 352189.5 6694986.8, 352274.7 6694991.1, 352364.3 6694993.1, 352393.6 6694993.7, 352498.9 6694996.2, 352534.7 6694997.1, 352548.3 6694997.4, 352594.6 6694998.5, 352645 6695000.3, 352692.2 6695002.8, 352745.9 6695006.5, 352807 6695010.6, 352849.2 6695014.2, 352936 6695016.7, 352985.3 6695023.9, 353001.4 6695026.3, 353042.6 6695034, 353101.5 6695045.7, 353173 6695062.7, 353304.5 6695098.7, 353333.33387808467 6695107.3180748485, 353343.3098948428 6695110.299777791, 353367.4 6695117.5, 353417.3 6695132.9, 353486.7 6695153.5, 353534.1 6695166.5, 353582.4 6695179, 353676.7 6695205.4, 353751.9 6695224.7, 353799.9 6695236.6, 353831.1 6695243.9, 353920.8 6695269.2, 353946.8 6695274.6, 353991.6 6695285.5, 354045.7 6695292.3, 354105.4 6695298.6, 354165.7 6695303.3, 354237.6 6695305.2, 354303.8 6695305.9, 354360.1 6695303, 354386 6695301.9, 354432.7 6695298.2, 354459.2 6695295.7, 354482.7 6695293.8, 354493.7 6695292.7, 354562.3 6695283.2, 354592.5 6695278.1, 354621.2 6695273.7, 354653.9 6695268.5, 354683.3 6695263.8, 354719.7 6695256.8, 354805.4 6695242.9, 354875.3 6695234.7, 354895 6695231.5, 354946.5 6695228.1, 355012.2 6695228.9, 355073.3 6695235.5, 355090.3 6695238.2, 355105.8 6695241.6, 355121 6695243.7, 355167.5 6695252.9, 355192.3 6695258.5, 355199.8 6695261, 355213.1 6695261, 355241.7 6695257.8, 355250.9 6695256.8, 355259.8 6695254.7, 355270.5 6695250.6, 355288.1 6695241, 355304.9 6695226.1, 355322.2 6695204.8, 355337.1 6695174.9, 355345.1 6695154.8, 355361.9 6695109.6, 355362.5 6695107.9, 355368.4 6695088.4, 355375.7 6695064.4, 355382.1 6695046.1, 355387.7 6695025.2, 355388.3 6695023.6, 355399.8 6694989.5, 355410.4 6694961.7, 355422 6694927.1, 355430.7 6694906.8, 355439.5 6694881.4, 355458.6 6694836.7, 355465.3 6694823.3, 355472.7 6694805, 355478.8 6694792.4, 355489.6 6694770.7, 355506.2 6694736.1, 355518.9 6694709.4, 355532.2 6694683.6, 355548.3 6694651.6, 355566.5 6694609.5, 355578.5 6694585.7, 355583.7 6694570.6, 355591.5 6694542.7, 355597.8 6694498.6, 355598.6 6694485.8, 355596.9 6694469.5, 355594.8 6694427.8, 355593.9 6694391.3, 355593.9 6694389.7, 355593.7 6694375, 355597 6694347.2, 355599.4 6694331.7, 355603.8 6694311.8, 355608.1 6694296.4, 355614.1 6694279.9, 355624.9 6694255.4, 355638.3 6694231.9, 355656.4 6694206.6, 355657.7 6694204.9, 355663.8 6694197.1, 355664.9 6694195.7, 355674.3 6694184, 355688.2 6694170.1, 355710.8 6694149.5, 355720.9 6694142.1, 355726.9 6694137.8, 355732 6694134.7, 355742.1 6694128.7, 355743.7 6694127.9, 355755.8 6694122, 355767.3 6694114.8, 355784.6 6694107.1, 355801.2 6694100.7, 355819 6694095.3, 355828 6694093.1, 355859.8 6694086.5, 355890.3 6694080.3, 355890.8 6694080.2, 355892 6694080.1, 355910.5 6694075.9, 355918.5 6694074.4, 355927.6 6694073.2, 355952.3 6694068.5, 356005.2 6694055.5, 356011 6694054, 356048.7 6694045.4, 356132.2 6694026.4, 356179.6 6694017.2, 356251.5 6694004.7, 356267.8 6694002, 356268.5 6694001.9, 356345.3 6693988, 356363.8 6693985.2, 356382.1 6693982.4, 356390.7 6693981.3, 356419.3 6693975.5, 356456.4 6693968.2, 356465 6693966.5, 356502 6693960.3, 356533 6693955, 356552.4 6693950.6, 356567.4 6693945.7, 356590.4 6693938.3, 356603.5 6693934.8, 356615.3 6693932.1, 356629.7 6693929.6, 356654.1 6693925.3, 356705.6 6693916.4, 356729.7 6693911.9, 356753.4 6693906.1, 356766.4 6693901.8, 356787.9 6693894.3, 356802.7 6693888.3, 356835.9 6693873.4, 356886.2 6693850.4, 356931.9 6693829.5, 356986.8 6693804.7, 357026.7 6693786.4, 357041.5 6693781.1, 357069.5 6693769.3, 357102.7 6693758.1, 357157.8 6693743.5, 357196.1 6693735.7, 357210.4 6693733.2, 357345 6693714.7, 357492.6 6693697.5, 357544.2 6693689.5, 357580.5 6693683.4, 357625.2 6693675.7, 357679.4 6693666.2, 357766.9 6693651.9, 357846.1 6693638.3, 357857.6 6693634.6, 357865.8 6693633.3, 358001.7 6693610.4, 358030.8 6693605, 358060.2 6693598.7, 358093.3 6693591, 358122.5 6693581.7, 358162.1 6693565.1, 358223.1 6693536.1, 358292.3 6693502.1, 358308.8 6693494, 358375.4 6693459.9, 358384.8 6693455.9, 358418.2 6693437.5, 358454.8 6693423.5, 358467.7 6693419.9, 358486.2 6693415.8, 358494.6 6693414.1, 358522.3 6693411.2, 358524.6 6693411, 358528 6693410.5, 358531.2 6693410.3, 358550.4 6693409.3, 358573.2 6693408.3, 358589.3 6693407.5, 358597.6 6693406.9, 358616.3 6693405.5, 358636.2 6693403.5, 358658.1 6693399.8, 358664.2 6693398.6, 358669.5 6693397, 358681.2 6693393.5, 358689.5 6693391.1, 358711.4 6693384.4, 358729.2 6693376.6, 358743.5 6693368.5, 358754.7 6693362, 358768.7 6693352.9, 358784.4 6693339.9, 358837.4 6693296.9, 358899.1 6693253.6, 358909.7 6693251.9, 358918.3 6693245.2, 358919.4 6693244.3, 358964.5 6693207.3, 359038.7 6693152, 359098.2 6693105.6, 359137 6693075.3, 359219.6 6693010.7, 359232.1 6693000.9, 359233.4 6692999.8, 359234.4 6692999, 359240.6 6692994.4, 359346.4 6692911.4, 359386.6 6692880.2, 359402 6692868.2, 359488.1 6692799.6, 359540.4 6692760.2, 359552.9 6692751.1, 359634 6692693.2, 359713 6692641, 359738.4 6692624.2, 359743.5 6692620.8, 359749.8 6692616.6, 359750.5 6692616.2, 359756.2 6692612.5, 359762.3 6692608.4, 359765.6 6692606.3, 359767.6 6692605.1, 359858.5 6692545.3, 359913.8 6692508.7, 359983.7 6692459.7, 360035 6692421.9, 360109.1 6692364.1, 360128.9 6692347.5, 360144.3 6692334.8, 360145.8 6692333.6, 360149.9 6692330, 360152.6 6692327.9, 360156.7 6692324.4, 360181.9 6692304, 360198.1 6692290.6, 360205.6 6692284.4, 360249.1 6692248.5, 360284.7 6692217.8, 360326.2 6692182.2, 360369.2 6692146, 360410.3 6692111.1, 360446.9 6692080, 360484.9 6692047.2, 360516.6 6692019.9, 360549.8 6691992.3, 360588.9 6691958.9, 360626.5 6691926.7, 360667.1 6691892.2, 360717.9 6691849.1, 360779.4 6691796.6, 360786.5 6691787.7, 360811 6691767, 360867.2 6691719.8, 360878.6 6691710.3, 360895.3 6691696.2, 360908 6691685.5, 360929.8 6691666.8, 360931.4 6691665.4, 360942.2 6691656.2, 360958.2 6691642.6, 361011.9 6691597.1, 361085.6 6691537.8, 361123 6691507.8, 361175.5 6691461.9, 361186.8 6691451.6, 361204.5 6691435.1, 361225.5 6691414.7, 361308.3 6691334.2, 361366.1 6691277.6, 361421.3 6691224.1, 361432.8 6691213, 361550.4 6691100.7, 361558.3 6691093.1, 361612.2 6691041.5, 361621.2 6691032.8, 361622.5 6691031.4, 361623.7 6691030.3, 361640.6 6691016.7, 361657.7 6691001.8, 361686.6 6690972.9, 361784.6 6690881.1, 361797.6 6690866.9, 361808.5 6690856.5, 361819.3 6690846.2, 361830.1 6690835.9, 361841 6690825.5, 361851.6 6690815.3, 361862.1 6690805.2, 361872.3 6690795.4, 361882.3 6690786, 361891.6 6690777.1, 361902.1 6690766.8, 361911.9 6690756.8, 361921 6690746, 361929.5 6690735.5, 361937.8 6690725.5, 361948.5 6690709.4, 361956 6690697.2, 361962.6 6690684.9, 361968.2 6690672.2, 361973.1 6690659.1, 361977.1 6690645.7, 361980 6690632, 361982.1 6690618.1, 361983.3 6690603.8, 361983.6 6690589.3, 361983.1 6690574.6, 361983.1 6690560.1, 361983.9 6690546, 361985 6690537.5, 361985.9 6690532.1, 361989 6690518.4, 361993.9 6690504.9, 362000.2 6690491.6, 362008.2 6690478.8, 362017.8 6690466.8, 362028.2 6690454.5, 362037.2 6690448.7, 362041.6068047337 6690446.251775148, 362041.6 6690446, 362041.6 6690436.1, 362041.7 6690432.8, 362041.4 6690419.2, 362040.6 6690405.6, 362039.2 6690391.6, 362037.3 6690377.4, 362034.9 6690363.2, 362031.8 6690348.9, 362028.4 6690334.5, 362024.6 6690320.1, 362020.4 6690305.5, 362015.4 6690291, 362009.9 6690276.6, 362003.8 6690262.2, 361997.1 6690247.6, 361989.9 6690233.2, 361982 6690218.8, 361977.3 6690210.9, 361973.6 6690204.8, 361969.4 6690198.1, 361920.1 6690196.7, 361908.4 6690192, 361897.9 6690185, 361888.9 6690177.2, 361880.9 6690167.2, 361873.9 6690155.9, 361868.1 6690142.5, 361862.8 6690128.3, 361857.1 6690113.4, 361851.4 6690097.6, 361845.3 6690081.3, 361838.5 6690064.7, 361830.4 6690048.1, 361820.5 6690031.7, 361808.6 6690015.3, 361795.6 6689998.5, 361782.1 6689981.4, 361768.9 6689964, 361755.6 6689945.9, 361742.3 6689926.9, 361729.1 6689906.9, 361715.8 6689886.2, 361683.4 6689834.4, 361615.2 6689727.9, 361527.3 6689595.5, 361446.1 6689482.8, 361370.2 6689376.2, 361316.2 6689298.7, 361315.8 6689298.1, 361311.5 6689292, 361309.6 6689289.3, 361303.6 6689280.6, 361300.8 6689276.6, 361298.8 6689273.8, 361298.5 6689273.4, 361222.9 6689168.4, 361217.8 6689161.4, 361211.4 6689152.6, 361206.6 6689145.9, 361203.1 6689140.7, 361175.6 6689100.4, 361121.4 6689026.3, 361074.7 6688968.5, 361031.7 6688931.2, 361021.8 6688922.7, 360961.5 6688883.6, 360891.8 6688845.2, 360845.2 6688807.5, 360835.4 6688799.7, 360834.8 6688799.1, 360798.6 6688760.5, 360792.9 6688754.4, 360780.1 6688737.9, 360779 6688736.6, 360769.2 6688724, 360765.8 6688719.3, 360749.5 6688687.3, 360730.4 6688649.9, 360706.2 6688586.5, 360693.3 6688540.7, 360689.3 6688521.3, 360687.8 6688507.5, 360687 6688495, 360685.4 6688466.9, 360684.5 6688448, 360684.9 6688442.9, 360685.2 6688438.8, 360689 6688398.3, 360690.1 6688384.9, 360696.6 6688352.2, 360707.1 6688313.4, 360712.3 6688293.2, 360722.9 6688246.1, 360730.3 6688217.5, 360739 6688179, 360746 6688144.1, 360752.1 6688109.3, 360755.5 6688086.9, 360758.4 6688064.7, 360760.9 6688036.5, 360763.6 6687991.6, 360763.9 6687970.5, 360762.2 6687913, 360757.5 6687849.9, 360751.5 6687787.2, 360750.5 6687778.9, 360745.4 6687725.1, 360743.3 6687702.7, 360736.7 6687641.2, 360730 6687583.8, 360724 6687540, 360714 6687478.4, 360705.1 6687431.4, 360690.1 6687366.3, 360689.7 6687364.7, 360684.5 6687344, 360664.5 6687270, 360642.2 6687200.1, 360611.5 6687114.8, 360586.5 6687053.6, 360557 6686987.7, 360532.1 6686936.6, 360510.4 6686895.4, 360498.9 6686874, 360483.5 6686846.8, 360461.9 6686809.1, 360439.3 6686771.8, 360415.9 6686732, 360393.6 6686699.5, 360351.8 6686642.8, 360320.2 6686602.7, 360318.1 6686600.1, 360306.7 6686585.7, 360287.5 6686562.3, 360284.7 6686558.8, 360276.2 6686548.6, 360258.1 6686525.6, 360250 6686515.5, 360205 6686459.8, 360183.1 6686432.6, 360176.4 6686424.1, 360172.3 6686420.7, 360168.6 6686416.7, 360163.8 6686409.9, 360159.6 6686403.6, 360156.9 6686400.8, 360154.2 6686397.1, 360142.4 6686385.5, 360116.8 6686356.4, 360084.4 6686316.7, 360072.7 6686302.4, 360014.6 6686232, 359977.2 6686186.2, 359974.6 6686183.1, 359959.7 6686164.6, 359954.7 6686158.5, 359936.3 6686135.8, 359934.3 6686133.3, 359926.8 6686124.7, 359919.9 6686116.8, 359915.7 6686111.8, 359907.7 6686102.6, 359891.5 6686083.7, 359889.4 6686081.3, 359886.9 6686078.5, 359869.9 6686058.9, 359863.9 6686052, 359850.1 6686037.1, 359848.5 6686035.3, 359844.7 6686031.1, 359838.6 6686024.7, 359819.8 6686005.1, 359790.6 6685974, 359753.7 6685938, 359740.4 6685925.3, 359720.4 6685906.2, 359715.6 6685901.8, 359709.4 6685896.1, 359690.5 6685878.5, 359661 6685852.3, 359620.9 6685816.6, 359569.8 6685771.5, 359545.3 6685749.6, 359524.5 6685730.9, 359496.1 6685705.2, 359478 6685688.7, 359451.2 6685663.5, 359420.5 6685633.2, 359390.3 6685601.7, 359370 6685580.2, 359355.9 6685565.3, 359346 6685554.6, 359337.8 6685544.5, 359333.9 6685539.6, 359325 6685528.7, 359295.5 6685492.5, 359267.3 6685454.7, 359265.4 6685452.1, 359233.3 6685408.2, 359198.9 6685358.1, 359170 6685316.1, 359153.6 6685292, 359130.9 6685260.1, 359115.1 6685237.7, 359076.4 6685185, 359058.3 6685161.9, 359025.7 6685122.1, 358992.6 6685085.7, 358974 6685066.9, 358962 6685053.9, 358960.7 6685052.7, 358916.3 6685009.5, 358879.3 6684977.9, 358846.7 6684950.7, 358815 6684926.1, 358787.2 6684906.4, 358766 6684891.2, 358763.5 6684889.3, 358758.2 6684886.3, 358749.4 6684880.1, 358736.7 6684871.5, 358726.6 6684864.6, 358692.8 6684843.4, 358662.9 6684823.7, 358659.9 6684821.7, 358628.4 6684801.9, 358598.9 6684784.7, 358568.5 6684765.8, 358539.6 6684750.7, 358523 6684741.3, 358490.3 6684722.6, 358450.9 6684699.8, 358431.6 6684688.4, 358371 6684649.1, 358361 6684642.4, 358332.3 6684622.6, 358327.3 6684619.1, 358272.7 6684581.5, 358254.4 6684566.7, 358240.3 6684556.4, 358235 6684552.4, 358233.9 6684551.5, 358231.7 6684549.9, 358228.3 6684547.5, 358223.2 6684543.9, 358211.6 6684535, 358168.3 6684500.8, 358139.2 6684475.9, 358110.2 6684449.9, 358060.3 6684402.8, 358057.6 6684400.3, 358042.3 6684384.9, 358021.1 6684363.8, 357976.8 6684315.7, 357948.4 6684284.5, 357917.4 6684248, 357870.7 6684188.7, 357853.7 6684165.9, 357840.8 6684147.8, 357827.9 6684130.2, 357800.5 6684089.6, 357757.6 6684028.7, 357737.7 6684001.1, 357708 6683954.6, 357690.6 6683932.5, 357676 6683910.1, 357671.5 6683903.1, 357642.3 6683862.2, 357626.8 6683840.6, 357563 6683760.1, 357562 6683758.9, 357555.9 6683751.3, 357498.7 6683687.7, 357498.3 6683687.2, 357465.8 6683653.1, 357426.8 6683614.9, 357394.4 6683584.2, 357364.9 6683557.6, 357327.3 6683525.6, 357279.6 6683487, 357277.1 6683485.2, 357222.9 6683444.4, 357215.4 6683438.9, 357175.9 6683412, 357122.5 6683377.9, 357096.1 6683361.7, 357047.1 6683333.2, 356995.6 6683306, 356935.1 6683276, 356872.8 6683248.2, 356816.2 6683224.5, 356756.8 6683203, 356706 6683185.5, 356634.6 6683164.6, 356607.7 6683158.3, 356596.2 6683155.4, 356582.2 6683151.9, 356567.3 6683148.2, 356511.3 6683136.3, 356461.5 6683126.9, 356408.4 6683118.8, 356389.5 6683116.3))
-""")
+        _sio = AbstractGeoDataFrameDemos._dataset(
+            "GeoDataFrameDemosA", "intraPeripheriqueNantes.csv"
+        )
         return GeoDataFrameLib.read_csv(_sio)
 
     @staticmethod
     def psmv():
-        _sio = StringIO("""geometry
-POLYGON ((355953.13724598865 6690121.022695063, 355991.1256333038 6690062.449445751, 355995.75711670384 6690055.308554656, 355995.7600164053 6690055.304159484, 355996.28986012575 6690054.506037854, 356019.7988701737 6690019.075525806, 356022.0712293572 6690015.65089435, 356022.0748289555 6690015.645500298, 356022.11022520554 6690015.592158997, 356005.985362746 6689995.958908279, 356002.6832348582 6689991.938297648, 355962.89210702555 6689942.005637332, 355962.894106764 6689942.002740554, 355962.897706324 6689941.99744642, 355984.89499625727 6689909.888801831, 355985.29254512186 6689909.3092456395, 356012.4964337797 6689862.034169074, 356012.4921380284 6689862.032368538, 356012.4830474187 6689862.027668118, 356007.94509280287 6689859.778880569, 356002.49607080274 6689857.0787351625, 356002.504371832 6689857.062052253, 356046.2009743332 6689769.714360653, 356046.7752141979 6689769.938345243, 356055.5130873548 6689774.446056351, 356055.5128968025 6689774.425772427, 356055.511193729 6689774.217137876, 356057.4397012718 6689775.212428277, 356057.6953370728 6689775.344540122, 356057.6994330783 6689775.346140717, 356058.34251309576 6689775.581048133, 356060.4513796609 6689776.352099802, 356063.600528829 6689769.457335752, 356063.6752366606 6689769.310287133, 356067.8813765881 6689761.033608357, 356074.59787897783 6689747.816915635, 356074.6421836203 6689747.729705418, 356074.33539691987 6689747.579384667, 356068.94060576195 6689744.937018979, 356068.89495240117 6689744.914615918, 356069.1851697178 6689744.371981219, 356073.90165051847 6689735.5544673735, 356074.98401494115 6689733.530975475, 356076.4493402314 6689730.271743638, 356082.58920300467 6689716.615437525, 356082.62981205876 6689716.5250281645, 356077.9174980815 6689714.273863539, 356087.15411484987 6689695.766741474, 356087.1553150887 6689695.764144097, 356097.72068848537 6689671.982134404, 356103.5819750972 6689646.747828164, 356105.2342129853 6689647.283657878, 356105.30374726193 6689647.306171785, 356120.10596658516 6689651.421071826, 356120.1080667015 6689651.417175893, 356120.3314973611 6689650.961441398, 356120.33469742077 6689650.955747401, 356133.8810361542 6689627.9538819995, 356136.75696858263 6689629.64754931, 356136.97754332947 6689629.75556424, 356136.9869337415 6689629.760164871, 356136.9894339425 6689629.755369838, 356137.0994492473 6689629.5304994285, 356137.10545008944 6689629.518211971, 356138.1128891933 6689627.461312558, 356156.81139568595 6689590.1015497865, 356090.89526863064 6689551.372629867, 356096.76962981635 6689537.30433357, 356104.1729489059 6689519.574756076, 356115.9346736425 6689491.407594926, 356152.6563903446 6689402.55304465, 356154.1037400987 6689399.050999388, 356154.868172348 6689397.212914834, 356156.3492222055 6689393.651932012, 356156.34452755324 6689393.648432655, 356156.2811993762 6689393.601840799, 356155.8885450072 6689393.312291839, 356150.5736251839 6689391.253299587, 356148.65179828776 6689390.508813091, 356088.2305832188 6689365.588211044, 356055.0987467865 6689346.053511086, 356051.3025082173 6689343.794773176, 356051.0458820438 6689343.643676103, 356050.7273219714 6689343.456079762, 356033.33460281853 6689330.54720554, 355997.5291990086 6689305.996878781, 355884.3568540695 6689228.501521939, 355848.1188011855 6689203.741860638, 355833.66265734896 6689193.864612579, 355833.0774073696 6689193.464763239, 355823.74167659937 6689187.086071666, 355793.290599759 6689166.280408039, 355683.6851686518 6689090.930761163, 355636.65132815146 6689065.327617719, 355616.41543021175 6689054.731690446, 355616.2991275425 6689054.503718975, 355608.8150849961 6689049.298639054, 355608.80989065464 6689049.295339303, 355584.2258060896 6689033.807419972, 355542.1869925586 6689007.321668036, 355541.7247948669 6689007.030488332, 355539.78706092876 6689008.0766648445, 355537.25645306625 6689006.6090749, 355537.2522559076 6689006.610172102, 355423.00897567946 6689032.381399032, 355420.3544187758 6689032.980003403, 355343.3786302797 6689013.803976844, 355314.41056831443 6688998.93084721, 355314.40697205457 6688998.928947073, 355247.7142494402 6688962.841824844, 355247.71065318043 6688962.839924705, 355210.8879659003 6688939.900822326, 355204.5314136748 6688934.290980047, 355198.5491112956 6688929.011346115, 355152.5158863203 6688899.736768604, 355134.0119835535 6688890.9581764545, 355114.6184520325 6688881.176076219, 355070.4606209468 6688858.902869763, 355048.0228260048 6688847.58519552, 355038.2485613102 6688842.284635904, 355028.4784307177 6688837.556021644, 355018.7058598738 6688832.4841801, 355018.7025632895 6688832.482479939, 355009.3928189595 6688827.637569818, 355000.6605053792 6688823.246562634, 355000.65610989806 6688823.244362369, 354991.8020521226 6688818.508274596, 354984.0207884285 6688814.751298184, 354983.6413754219 6688814.568070106, 354976.75112047064 6688811.421016211, 354976.7465250999 6688811.418915774, 354976.4882902891 6688811.290299782, 354969.7344257684 6688807.927280868, 354961.8027673912 6688803.985182945, 354959.6556384986 6688802.989591037, 354957.4357831941 6688801.960192694, 354955.90353433567 6688801.245858818, 354955.02242631116 6688800.835081833, 354951.5808150143 6688799.220489185, 354949.506018216 6688798.247112769, 354946.6526068306 6688796.916863421, 354945.70316796476 6688796.474280417, 354942.2708426019 6688794.874280358, 354942.26584768883 6688794.871879981, 354936.9347171086 6688792.01121363, 354936.1714145495 6688791.601589836, 354935.0598519163 6688791.057113658, 354934.553469962 6688790.809278786, 354933.4127372281 6688790.250400696, 354933.4091396399 6688790.25139825, 354929.7824740037 6688791.253032369, 354913.0623970145 6688795.8709636, 354892.40556223143 6688801.57621754, 354892.40106536075 6688801.577214675, 354847.83540585096 6688811.213542309, 354846.1366433227 6688811.471056014, 354846.07298967964 6688811.480719048, 354807.9542569724 6688817.25938628, 354805.9532146112 6688817.562724379, 354805.52842401894 6688817.62717768, 354793.4098505944 6688817.7261281395, 354789.61636398773 6688817.757159576, 354773.22753523407 6688815.601446227, 354729.3837709283 6688798.107951934, 354720.2505360865 6688794.463861299, 354719.24382444494 6688794.061819328, 354719.2498283393 6688794.042937161, 354721.25272341433 6688787.749181466, 354721.24403187144 6688787.745880109, 354708.5064599406 6688783.045075638, 354708.47721989715 6688782.965425771, 354707.92116184725 6688781.447082, 354707.9197646155 6688781.443484232, 354705.3775255957 6688775.5020576455, 354705.23648971657 6688775.172455879, 354697.2994944921 6688772.193783992, 354694.7863342977 6688771.250281518, 354673.730745119 6688763.411656471, 354659.12010875036 6688757.972079754, 354607.19234983117 6688738.638831105, 354593.38773314375 6688733.499184632, 354591.55977480765 6688733.972066406, 354584.7053307435 6688735.745298257, 354584.36180365516 6688735.748137985, 354563.39597909705 6688728.053037063, 354563.0035586203 6688727.908971557, 354558.28776917275 6688725.199864944, 354558.2539054499 6688725.17976541, 354558.19057348405 6688725.141766613, 354556.21669390355 6688723.957504003, 354544.3941872231 6688719.7056598095, 354544.3899914043 6688719.70385932, 354544.2754823749 6688719.704805885, 354524.9232934976 6688712.612065528, 354474.004327562 6688693.949837616, 354474.0003313959 6688693.948436898, 354392.92014754575 6688662.899115741, 354392.91265693004 6688662.8917182, 354392.8048916831 6688662.785853127, 354392.6904825856 6688662.78679972, 354391.53139943694 6688662.370698504, 354391.4753535246 6688662.350388927, 354390.50878496474 6688662.003221275, 354388.53184264543 6688663.134508303, 354372.70241115935 6688672.193091418, 354356.2096341773 6688681.631265939, 354353.0142146553 6688683.522685258, 354344.246625395 6688688.712506702, 354339.55280764506 6688691.460752295, 354335.59060294955 6688693.780676543, 354334.43271527684 6688694.458602393, 354261.7551447005 6688737.011876769, 354261.413510715 6688737.243634488, 354260.10441406595 6688745.153717488, 354254.3913872626 6688780.096294945, 354251.783826016 6688796.044764371, 354244.61045158206 6688839.919142923, 354242.22373557964 6688854.516693421, 354242.0610550558 6688855.190780527, 354242.0022898072 6688855.434359067, 354242.01877039723 6688855.447955802, 354242.0260618129 6688855.453954371, 354242.1543108457 6688855.559529159, 354358.9922710264 6688951.788519611, 354545.1834786871 6689033.127693225, 354726.0821138283 6689112.154842791, 354716.86998442875 6689133.638369244, 354716.88813985174 6689133.703825379, 354742.4663373369 6689225.702503903, 354743.00250127964 6689263.782579436, 354743.0127596541 6689264.507805766, 354743.0096582687 6689264.516197647, 354740.7272248794 6689270.722798302, 354740.441895666 6689271.498748279, 354740.4368934056 6689271.512335141, 354663.67480631097 6689320.4517083615, 354628.9555880234 6689342.4233192885, 354627.57018952793 6689343.3000829285, 354600.79275573633 6689358.055300244, 354600.78705884865 6689358.0583951585, 354649.9853156427 6689368.303454132, 354681.86545568635 6689374.911446362, 354779.344402945 6689493.291383237, 354780.9385118068 6689492.247947974, 354786.5208087882 6689488.882297588, 354791.85852329346 6689489.600379052, 354792.13668433955 6689489.63777712, 354799.1272165261 6689490.49650626, 354799.3562348153 6689490.494613051, 354945.0492182174 6689521.977479444, 354945.35294572264 6689522.0435663285, 354947.97943026596 6689521.220329543, 354948.0938394981 6689521.219382871, 354956.65900109056 6689518.630782313, 354996.5195014726 6689465.141739691, 354999.5774488811 6689461.038316127, 355001.3424326292 6689461.493464186, 355003.0189971275 6689461.92628942, 355007.8344977712 6689463.145629769, 355007.8375949802 6689463.146330634, 355011.1630408685 6689463.805632857, 355017.2303265431 6689463.7560599055, 355017.232423492 6689463.759058476, 355082.66546648956 6689555.608996896, 355119.96092603303 6689595.477349134, 355119.9658197001 6689595.482647159, 355119.9702139478 6689595.487545273, 355099.7531367539 6689614.191751013, 355099.74763880007 6689614.196844421, 355099.7450397714 6689614.199241322, 355112.5729179315 6689626.385920353, 355119.9368351429 6689633.382526283, 355125.8390640913 6689638.971282929, 355126.5637713295 6689639.657468894, 355159.9689207045 6689671.288401958, 355159.97291586845 6689671.292000928, 355174.2608777798 6689682.508823414, 355190.46953606186 6689690.61910353, 355206.51604209165 6689693.4633055935, 355206.5206378733 6689693.464506744, 355206.7331366991 6689695.058234246, 355207.61838215607 6689701.698249203, 355207.62442305987 6689701.816457777, 355209.9203796513 6689745.183053925, 355212.77956293477 6689800.798551418, 355214.86822945526 6689804.2159875855, 355217.6304811209 6689806.061485546, 355217.74605358904 6689806.138677108, 355221.6380674128 6689806.1062900815, 355221.97671728925 6689806.063379776, 355222.3314547998 6689806.019477647, 355225.5267936207 6689805.617065524, 355232.9574791674 6689804.297029285, 355233.37161302404 6689804.158030192, 355244.14618840703 6689800.542058598, 355258.1089256575 6689799.970425003, 355269.8756611278 6689796.8972760765, 355290.4015512362 6689786.99788737, 355295.0773415491 6689784.784897274, 355295.1233533151 6689784.897228889, 355295.1966128673 6689785.076020065, 355295.5446453817 6689785.925902658, 355297.0052651077 6689789.229141215, 355297.4110205679 6689790.146696393, 355297.877877469 6689791.1728930585, 355300.43280138815 6689795.617324726, 355301.01276857004 6689796.6426739935, 355303.91057337873 6689800.969356914, 355304.49099263165 6689801.880497398, 355305.61240999924 6689803.599442607, 355307.2681258114 6689806.1370807905, 355307.37636331376 6689806.303198124, 355307.38884483714 6689806.321789038, 355307.69471721386 6689806.722410254, 355308.0832737874 6689807.231782778, 355311.3213665108 6689811.212197841, 355311.7451737976 6689811.767749758, 355312.01569545653 6689812.122391379, 355312.49456785835 6689812.658384161, 355315.3665039378 6689815.872941346, 355315.9582320969 6689816.745118078, 355316.0617795735 6689816.897644084, 355316.97188679274 6689817.916350225, 355319.4124881737 6689820.64819401, 355320.2203796585 6689821.442931676, 355322.0862342775 6689823.531524133, 355322.11309905455 6689823.561612494, 355323.57108830684 6689825.193481606, 355324.3742377973 6689825.870111193, 355324.3782329628 6689825.873710162, 355327.9577601546 6689829.622466572, 355328.7656515738 6689830.417404074, 355328.7684479644 6689830.42040297, 355332.3456782281 6689834.166560394, 355332.4150961724 6689834.224845823, 355333.1523235356 6689834.846289118, 355336.2962282116 6689837.657592456, 355336.9577295966 6689838.249224743, 355337.09126295435 6689838.380481461, 355337.7660205705 6689839.04446219, 355341.5718261789 6689842.447797678, 355342.2402350069 6689843.011255581, 355342.3715795135 6689843.12202762, 355342.3790707918 6689843.128026276, 355342.38226700836 6689843.130725594, 355346.2996327952 6689846.6451238, 355347.7148827825 6689848.001193039, 355350.8002671572 6689850.958553145, 355351.60371613805 6689851.6358823115, 355351.6070122309 6689851.638681598, 355355.30040183075 6689855.272282024, 355355.3028986003 6689855.274981021, 355355.9938841504 6689856.067866499, 355359.6870740941 6689859.70116708, 355360.00617578725 6689860.0150634665, 355360.49496566335 6689860.4959047455, 355364.1875085375 6689864.015095934, 355364.88069125346 6689864.810380513, 355368.410934499 6689868.174820499, 355368.4165276166 6689868.180118844, 355368.57043764106 6689868.326872573, 355368.57293454825 6689868.329271807, 355369.3761319891 6689869.119410984, 355369.38072616846 6689869.124109349, 355372.8446980738 6689872.759103375, 355373.76824531663 6689873.6676035, 355373.7707421778 6689873.670102648, 355377.2317701771 6689877.1880885465, 355377.48208604765 6689877.3726563975, 355378.15322425956 6689877.867470236, 355381.8458671325 6689881.38686132, 355382.6525125282 6689882.066590041, 355386.3466494651 6689885.814299916, 355390.6178661375 6689890.129722388, 355391.6556229237 6689891.037175763, 355395.2325105338 6689894.442404667, 355395.92599288566 6689895.2380890725, 355399.6168903306 6689898.64197138, 355399.7609198928 6689898.763340796, 355400.42423475 6689899.322699624, 355403.3698153922 6689902.31386864, 355403.70009831 6689902.649352965, 355404.00301582675 6689902.956946952, 355404.81090748956 6689903.751684621, 355404.81380394025 6689903.7543838015, 355408.50315120834 6689907.270476003, 355412.4426874242 6689911.24801543, 355412.8899239563 6689911.699461056, 355412.89292014594 6689911.702559964, 355447.75409019727 6689947.133234532, 355449.01717882836 6689947.580457912, 355449.02027594834 6689947.581358616, 355450.27912056475 6689947.913971343, 355482.466907219 6689936.087961677, 355519.2198613167 6689922.507442904, 355519.6407552395 6689922.443786717, 355520.02027923753 6689922.386406552, 355520.0233762201 6689922.387607016, 355521.05380242306 6689922.721014182, 355523.1867696119 6689923.884266139, 355539.4073925535 6689932.7248655865, 355618.11102403374 6689975.620500225, 355630.3928373908 6689983.914227398, 355647.9271406827 6689995.754938324, 355647.9309365101 6689995.757438076, 355678.43116130005 6690015.997904905, 355730.1374122277 6690039.043960542, 355748.233415961 6690047.079158462, 355791.1506996402 6690066.135858302, 355791.15529598214 6690066.135860408, 355791.26510896144 6690066.134911507, 355793.8711703274 6690067.363427874, 355794.29064556846 6690067.561262632, 355794.3687671722 6690067.596570327, 355798.4210855724 6690059.208108546, 355801.80379120953 6690052.88309652, 355801.8768670317 6690052.808889123, 355801.91705425957 6690052.766940952, 355826.99410669087 6690067.331037997, 355827.2127834421 6690067.438152935, 355827.22397200594 6690067.44365368, 355827.75542942365 6690067.703989975, 355827.91366788157 6690067.781500787, 355828.60326387367 6690068.119247923, 355840.67386254395 6690074.202736244, 355851.0190013822 6690079.269842946, 355872.16357248236 6690089.284559427, 355872.16616986325 6690089.285759664, 355882.5083687467 6690094.009737957, 355899.96488461696 6690100.7362820115, 355900.07949391817 6690100.735035528, 355953.0209430607 6690120.794723303, 355953.13494983065 6690121.018297514, 355953.13724598865 6690121.022695063))
-""")
+        _sio = AbstractGeoDataFrameDemos._dataset("GeoDataFrameDemosA", "psmv.csv")
         return GeoDataFrameLib.read_csv(_sio)
 
     @staticmethod
     def concession_amenagement_pirmil():
-        _sio = StringIO("""geometry
-POLYGON ((355431.6778576305 6687461.410516325, 355983.2246907706 6687456.906818316, 356403.2185818162 6687519.427384447, 356430.58363998967 6687444.260490481, 356429.4771995338 6687443.37020472, 356423.9327581397 6687437.420007362, 356420.80348131125 6687433.548503355, 356419.286762001 6687431.362548624, 356415.84467641445 6687425.894806012, 356412.8948369017 6687419.523722581, 356411.2651446497 6687415.739897383, 356409.12933535594 6687411.160808686, 356410.91235472984 6687409.247681609, 356412.7944760598 6687407.233820687, 356413.5872917516 6687406.427949943, 356410.8601344622 6687402.852935943, 356409.344231144 6687400.766899156, 356406.093822066 6687394.298345769, 356404.7573560376 6687389.712729612, 356404.03263654583 6687386.620986313, 356403.61093452666 6687383.926466799, 356403.18760062644 6687381.032111488, 356403.0501494304 6687376.436704078, 356403.5195491092 6687372.735662124, 356404.0896826265 6687369.133722138, 356404.27727930737 6687367.633321784, 356405.0562239747 6687365.128846804, 356406.62064083165 6687360.919240032, 356407.11125497316 6687359.816063453, 356407.40366519766 6687358.91435455, 356407.9917494123 6687357.510608338, 356408.678935583 6687356.006128286, 356409.9615494386 6687353.997163098, 356411.14506133273 6687352.08893175, 356412.6250631521 6687349.778580991, 356414.1107765612 6687348.16765551, 356417.97738474293 6687344.438871585, 356449.1215084171 6687316.005818715, 356472.341554666 6687296.131062294, 356482.8634959825 6687287.551550995, 356484.37205577217 6687288.738326481, 356494.80305449304 6687281.258727884, 356518.6470853051 6687264.376612102, 356558.1153960432 6687239.672713935, 356580.7143457969 6687229.395785454, 356582.6580345716 6687222.684967855, 356603.1281466619 6687220.919010526, 356604.23985389725 6687210.21800512, 356595.2419033686 6687197.40121801, 356590.20276328793 6687192.146367923, 356583.9776638992 6687188.499995475, 356570.1273542963 6687168.828040349, 356582.31273841613 6687131.4566759365, 356597.66448754974 6687090.262322465, 356605.3646179842 6687066.517325068, 356593.2223335194 6687060.221311952, 356589.93157122587 6687061.047581539, 356541.30205409875 6687028.469605593, 356503.07623741444 6686997.305538005, 356446.74636211776 6687049.626372101, 356410.84640043834 6687021.840742226, 356395.7648860731 6687010.472578512, 356376.86854215956 6686996.93722737, 356387.629855447 6686980.961348644, 356284.6983684404 6686918.649594091, 356133.2254133939 6687103.747659907, 356105.262964927 6687056.811617164, 355946.9627396397 6687005.444042997, 355845.9233057335 6686991.280425688, 355502.928276479 6686886.762238462, 355403.34966308955 6686855.69941723, 355299.7376766441 6686844.654425898, 355112.9585717134 6686842.18253737, 354719.60206485004 6686909.046206275, 354286.7779689328 6686976.231990002, 354211.1075169108 6686972.852818446, 354103.69581655704 6686973.729770571, 354016.17061341426 6686962.553337162, 353665.08648288524 6686834.118835831, 353353.8060187043 6686697.565198022, 353038.52727955946 6686560.844295401, 352914.9040458886 6686522.083551834, 352859.1527548786 6686510.64766136, 352855.7400619779 6686582.221447554, 352992.5520836375 6686779.954322678, 352747.4809534721 6686968.913686361, 352726.6968182781 6687054.618737745, 352689.88259089115 6687184.121669875, 353351.3451503461 6687436.5271269325, 353837.82630216924 6687540.374119003, 354005.6863530004 6687550.994624812, 354700.67323706247 6687503.451994516, 355431.6778576305 6687461.410516325))
-""")
+        _sio = AbstractGeoDataFrameDemos._dataset(
+            "GeoDataFrameDemosA", "concession_amenagement_pirmil.csv"
+        )
         return GeoDataFrameLib.read_csv(_sio)
 
     @staticmethod
     def zac_basse_ile():
-        _sio = StringIO("""geometry
-POLYGON ((354045.2057136142 6687544.776428829, 354395.7772455063 6687524.727189757, 354932.38406008406 6687489.469229989, 354931.71499796014 6687358.573522243, 354931.4931348307 6687355.877370833, 354930.55346935923 6687338.698020275, 354934.2899780038 6687331.273094982, 354934.9861399334 6687330.86771263, 354935.1484476336 6687326.269858072, 354953.4432116799 6687327.319576061, 354953.4574674914 6687316.827381918, 354950.85144404595 6687315.849414602, 354948.74501005653 6687314.867368134, 354946.03580541373 6687313.490545089, 354942.9204025878 6687311.317642248, 354940.1006743006 6687308.642702484, 354937.5717255842 6687304.866218473, 354935.6471791858 6687301.68434682, 354934.0109648731 6687297.101177278, 354933.1798044746 6687293.210906327, 354932.8004865596 6687271.230603158, 354932.70829800086 6687259.9398822365, 354930.9740159051 6687145.440519067, 354931.0502747614 6687142.542084869, 354931.91363920504 6687138.13835593, 354933.5787941378 6687134.0278539965, 354935.8475354595 6687130.412046473, 354937.8254972581 6687127.897783045, 354941.9934940222 6687124.366392642, 354945.8723429214 6687122.136382073, 354949.2581290699 6687120.709793633, 354954.9493688147 6687120.163701939, 354973.033688425 6687119.916118619, 354991.9165352144 6687119.562090509, 355001.90669109253 6687119.28067139, 355022.4889576088 6687119.012691521, 355032.9795187042 6687118.827110855, 355041.5691926549 6687118.357277393, 355066.84515182336 6687117.751198841, 355066.7333818893 6687104.062450263, 355063.4238544489 6687102.590604867, 355060.3027410264 6687099.718277578, 355059.2839821629 6687097.328407041, 355058.640419647 6687091.937737011, 355057.87851589214 6687047.57746625, 355056.84863147105 6686982.634932935, 355056.7115705681 6686965.848732078, 355060.18993150466 6686963.522066893, 355057.95502575603 6686959.043711599, 355053.5023469127 6686952.185276117, 355049.8653277787 6686947.318671154, 355046.6320593098 6686942.948392145, 355043.90980190045 6686939.972883985, 355042.79928369226 6686938.583008173, 355037.7585195533 6686933.128317805, 355030.5130358254 6686926.892232999, 355025.8841807727 6686922.933047164, 355017.4437620212 6686917.206341668, 355010.1163090005 6686913.169265528, 355002.49318162375 6686909.634226151, 354995.2770682345 6686906.995184117, 354987.2640595072 6686904.662422286, 354978.85382687644 6686902.6326773185, 354972.94969906076 6686901.581715044, 354966.0480243363 6686900.738746781, 354956.05297517113 6686900.420658541, 354951.25854963216 6686900.659654154, 354936.4804965557 6686901.979411343, 354926.4026619507 6686903.760413683, 354902.2584365939 6686908.354229789, 354853.8692517615 6686917.442758639, 354837.8077669063 6686920.6715596905, 354768.17034143116 6686934.130405341, 354719.03359700495 6686937.329486291, 354709.94433497067 6686937.803396674, 354698.4586759097 6686938.496722183, 354661.2015511765 6686940.299787166, 354620.89755265333 6686948.323048249, 354532.00779298315 6686965.836128036, 354475.1435333772 6686977.192178584, 354341.2626029106 6687003.865939464, 354318.00784563925 6687007.253388387, 354298.7449081605 6687010.008698523, 354280.87837338133 6687012.452833879, 354270.3976027409 6687013.837422821, 354258.31896202854 6687015.334981971, 354234.55564157356 6687017.627411798, 354220.37464677845 6687018.64251256, 354206.08965524175 6687019.158839627, 354194.29934722884 6687019.255100787, 354151.81712370896 6687017.503528123, 354139.5215160428 6687016.904442596, 354119.82138150075 6687015.0667914795, 354107.31941204215 6687013.669994291, 354102.51845999534 6687013.1096438505, 354094.81417956087 6687011.873525538, 354083.709428735 6687010.2654717015, 354058.9905599472 6687005.670907748, 354032.4617492068 6686999.692176981, 354026.953214635 6686998.138357988, 354009.6307153859 6686993.783180533, 354004.0222630105 6686992.230177212, 353995.40811723913 6686989.702467983, 353989.5981976672 6686987.951260405, 353983.8873802177 6686986.099319188, 353972.66639684833 6686982.493723034, 353961.2423148099 6686978.490086872, 353943.97941333643 6687030.391926795, 353916.57630308013 6687113.153309669, 353925.1912652244 6687115.780937572, 353943.5129444439 6687120.127959129, 353962.23755830183 6687124.871388912, 353975.84678272356 6687127.258393073, 353987.25699826 6687129.563425857, 353991.8589306716 6687130.22532618, 354005.8661951989 6687132.40923128, 354024.87424796826 6687135.15185554, 354036.3770397274 6687136.55681132, 354045.37780589116 6687137.4825716475, 354042.5197645915 6687154.593000468, 354030.10431447695 6687212.750518406, 354045.01899848547 6687215.926260216, 354047.7901995954 6687224.896843651, 354046.56797387614 6687258.781240989, 354052.6654119845 6687259.031233276, 354075.4006115835 6687265.440635632, 354070.3859806579 6687287.664824972, 354065.74246945744 6687306.388625673, 354065.4492418849 6687307.19041603, 354062.5096242923 6687314.309058638, 354085.796202257 6687314.8184113735, 354094.1636212958 6687323.843230601, 354090.32763703325 6687368.041198747, 354086.3427888076 6687406.244910619, 354077.04634586244 6687405.821187012, 354066.25276604074 6687405.609535532, 354022.10168888426 6687395.278070878, 354020.39819016407 6687394.692431409, 354015.90677952656 6687395.328647816, 354014.4561407626 6687401.236039727, 354012.3240233643 6687409.347335573, 354008.5406155699 6687423.267737089, 353995.8462688179 6687545.179412562, 354001.7430566856 6687545.331118831, 354045.2057136142 6687544.776428829))
-""")
+        _sio = AbstractGeoDataFrameDemos._dataset(
+            "GeoDataFrameDemosA", "zac_basse_ile.csv"
+        )
         return GeoDataFrameLib.read_csv(_sio)
 
     @staticmethod
     def zac_pirmil():
-        _sio = StringIO("""geometry
-POLYGON ((356286.4165545622 6686921.033751919, 356247.6208158905 6686966.916143827, 356133.2449955078 6687106.145688945, 355858.8254668136 6687372.087431616, 355841.6373179666 6687445.372563629, 355840.04559615185 6687458.475679088, 355991.30825020705 6687455.64171485, 356155.8853447109 6687480.278188855, 356401.9016982685 6687517.239797665, 356419.75140605343 6687476.025036102, 356422.57885436545 6687467.408433841, 356426.4784735096 6687455.485565395, 356430.48372208345 6687444.261306425, 356428.4690451 6687442.27926721, 356425.34547984507 6687439.107188521, 356421.91481740715 6687435.038296535, 356418.8838266114 6687430.966140782, 356417.76841081167 6687428.976758089, 356415.6415768369 6687425.496766285, 356413.0979364776 6687419.921762307, 356409.12933535594 6687411.160808686, 356413.48737384833 6687406.428765883, 356411.1631519381 6687403.25015972, 356409.8503481911 6687401.562162652, 356408.3295492271 6687398.876618465, 356407.61870072776 6687397.483479451, 356406.3992873626 6687394.9953232445, 356405.2732643736 6687391.707007901, 356404.8629855284 6687390.411338968, 356404.238183938 6687387.318779728, 356403.7214596639 6687385.224583547, 356403.40457119397 6687383.128755486, 356403.1900484498 6687381.331865184, 356403.0615726071 6687377.835554663, 356403.1435398018 6687375.63654495, 356403.23040264315 6687374.037042629, 356403.6104916562 6687371.635749302, 356403.8931105908 6687369.535025613, 356404.1822570549 6687368.233645114, 356404.567241712 6687366.431859183, 356405.0529602091 6687364.729175213, 356406.2283127062 6687361.821764879, 356407.1071752654 6687359.3164739655, 356408.38489347656 6687356.70800139, 356408.7772215989 6687355.805476549, 356410.0598354541 6687353.79651136, 356412.5275930794 6687350.079150624, 356414.407266489 6687347.765536098, 356416.5883254721 6687345.649309536, 356418.2738746684 6687344.036752169, 356420.15681182937 6687342.122809228, 356421.3460352966 6687340.914003162, 356422.5368906471 6687339.905032884, 356427.00055833766 6687335.871599604, 356436.9180972245 6687326.697476745, 356438.7043802123 6687325.184021325, 356441.18356092 6687322.865511132, 356443.86176146776 6687320.445451154, 356448.3262449704 6687316.511935749, 356451.69815914927 6687313.386738888, 356454.0798697516 6687311.368798318, 356456.95790604356 6687308.94710644, 356458.8424749879 6687307.2329992745, 356460.7286758191 6687305.718727895, 356465.2930771157 6687301.784396524, 356470.4529060218 6687297.3455799995, 356474.32440957235 6687294.216303385, 356477.2032617365 6687291.894529386, 356483.0625158234 6687287.450001206, 356484.3745036156 6687289.038080157, 356490.63098139816 6687284.290534485, 356494.3050969206 6687281.462643411, 356497.2863147619 6687279.439807107, 356499.7695750239 6687277.62088633, 356503.6443422444 6687274.891281237, 356527.19106700557 6687258.311366888, 356534.3451736117 6687253.356641754, 356538.71708229155 6687250.323203164, 356540.10777325276 6687249.312600938, 356547.45926768583 6687244.056490187, 356548.9498765248 6687243.045071999, 356557.70919684984 6687238.876634641, 356557.78953185177 6687236.477789361, 356563.3686146498 6687234.433738159, 356569.3457370838 6687232.186587338, 356573.7290689838 6687230.551999108, 356579.71027116146 6687228.804437682, 356579.33136981394 6687219.114850451, 356580.5303844875 6687219.10505898, 356580.63601406576 6687219.803668236, 356587.3280647966 6687219.449245523, 356587.3239850161 6687218.949656084, 356588.42308180046 6687218.940680564, 356588.5262635146 6687219.3395361565, 356594.52052092983 6687219.190660872, 356594.51562518993 6687218.591153547, 356596.0135775756 6687218.478996306, 356596.01847331604 6687219.07850363, 356601.91199688445 6687218.83052638, 356601.75822581974 6687212.236761793, 356601.2586363746 6687212.240841581, 356601.250476803 6687211.241662714, 356601.7500662476 6687211.237582925, 356601.74435454723 6687210.538157718, 356602.4437797694 6687210.532446016, 356602.44051594025 6687210.1327744685, 356589.00782842055 6687192.655748829, 356582.60166024254 6687191.309119641, 356576.62164553173 6687180.965801028, 356573.89122438885 6687176.991116463, 356568.32556853734 6687168.443056009, 356573.4955593634 6687153.012456445, 356576.3319813469 6687145.494952596, 356579.9457155533 6687135.273138348, 356584.44483938254 6687123.345376605, 356589.72372321214 6687109.013058202, 356592.9492090725 6687100.193358314, 356596.75135535916 6687088.571062167, 356603.57343980594 6687067.431273197, 356592.2378419743 6687062.027993275, 356591.24437489966 6687062.735577975, 356590.7464174264 6687062.939493511, 356589.9470744069 6687062.946021168, 356589.44585310604 6687062.750265203, 356564.25060028414 6687048.766732002, 356560.4357699848 6687046.59954507, 356554.40316352824 6687042.052280162, 356545.2543360493 6687035.232198739, 356529.8722506846 6687023.766566382, 356526.8559475598 6687021.492933907, 356503.19818594813 6687000.002504538, 356447.54978485405 6687050.1194339, 356446.55713366205 6687050.92693635, 356408.37782754825 6687025.458184181, 356410.05521688156 6687022.846448487, 356399.6001145238 6687015.137712614, 356374.3689634917 6686996.757790153, 356385.7330477946 6686981.176687277, 356341.9371299541 6686953.155762926, 356328.89558714436 6686946.867091465, 356286.4165545622 6686921.033751919))
-""")
+        _sio = AbstractGeoDataFrameDemos._dataset(
+            "GeoDataFrameDemosA", "zac_pirmil.csv"
+        )
         return GeoDataFrameLib.read_csv(_sio)
 
     @staticmethod
     def trentemoult():
-        _sio = StringIO("""geometry
-POLYGON Z ((353464 6687090.2 5.3, 353429.4 6687084.1 5.5, 353369.7 6687073.5 5.2, 353339.3 6687064 5.3, 353241.6 6687033.6 5.3, 353173.8 6687013.1 5.6, 353168.8 6687012.4 5.5, 353157.1 6687010.7 5.5, 353132.1 6687057.3 5.1, 353114.4 6687087.8 5.2, 353106.5 6687101.7 5.1, 353102.5 6687110.3 5.2, 353096.9 6687122.7 5.2, 353092 6687133.6 5.2, 353090.7 6687141.4 5.2, 353090.7 6687149.4 5.2, 353091.5 6687156.1 5.2, 353094.4 6687165.5 5.2, 353100.7 6687178.4 5.2, 353106.7 6687186.9 5.2, 353116.2 6687194.2 5.1, 353157 6687219.2 5.2, 353161 6687221.7 5.1, 353175.8 6687230.1 5.8, 353191.7 6687239.1 5.5, 353202.8 6687245.6 5.4, 353208.6 6687249.7 5.1, 353225.9 6687263.6 5.3, 353236 6687270.3 5.3, 353240.7 6687272.1 5.1, 353243.6 6687273.3 5.3, 353260.2 6687276.5 5.3, 353269.5 6687277.2 5.3, 353279.8 6687277.3 5.5, 353309.3 6687277.3 5.5, 353321.2 6687277.3 5.5, 353336.1 6687277.3 5.6, 353356.2 6687277.3 5.4, 353368.7 6687277.3 5.3, 353372.5 6687276.7 5.3, 353383.7 6687272.6 5.3, 353418.3 6687259.1 5.8, 353439.3 6687250.9 5.9, 353514.8 6687223.8 5.5, 353524.9 6687219.8 5.5, 353531.4 6687216.8 5.6, 353539.9 6687214.9 5.6, 353547.9 6687213.9 5.6, 353558.4 6687214 5.6, 353573.2 6687217 5.7, 353575 6687217.4 5.4, 353621.6 6687228.2 5.7, 353627 6687229.4 5.8, 353656.6 6687236.4 4.7, 353697.7 6687246.2 4.5, 353704.6 6687247.8 5, 353711.2 6687249.3 5.5, 353719.9 6687217.5 5.4, 353708.3 6687211 5.5, 353686.2 6687196.4 5.4, 353580.4 6687129.7 5.7, 353567.5 6687119.9 5.7, 353551 6687109.1 5.7, 353547.3 6687107.4 5.6, 353541.1 6687104.6 5.6, 353532.8 6687102.4 5.7, 353493.9 6687095.5 5.4, 353464 6687090.2 5.3))
-""")
+        _sio = AbstractGeoDataFrameDemos._dataset(
+            "GeoDataFrameDemosA", "trentemoult.csv"
+        )
         return GeoDataFrameLib.read_csv(_sio)
 
     @staticmethod
@@ -169,21 +157,9 @@ POLYGON Z ((353464 6687090.2 5.3, 353429.4 6687084.1 5.5, 353369.7 6687073.5 5.2
 3.0;POLYGON ((358758.48222130956 6691980.06583943, 358753.84402312007 6691974.811795482, 358754.1650114316 6691974.49462846, 358753.6480949497 6691973.948994398, 358755.3041421976 6691972.388672419, 358755.696615823 6691972.800291101, 358757.0942048301 6691971.56543506, 358757.36223559844 6691971.843038353, 358757.821716916 6691971.402702094, 358758.64495427633 6691972.312092201, 358758.8459773527 6691972.082351541, 358762.1197817392 6691975.700766918, 358761.9091861357 6691975.911362523, 358762.3878125076 6691976.476141639, 358761.87089602556 6691976.868615266, 358761.99533888226 6691977.00263065, 358761.4879949279 6691977.404676802, 358761.94747624506 6691977.931165809, 358759.28631361504 6691979.989259213, 358759.01828284666 6691979.644648225, 358758.48222130956 6691980.06583943))
 """)
         else:
-            _sio = StringIO("""geometry
-LINESTRING (358753.84402311995 6691974.8117954815, 358754.1650114316 6691974.49462846, 358753.6480949497 6691973.948994398, 358755.3041421977 6691972.388672421, 358755.696615823 6691972.800291101, 358757.0942048301 6691971.56543506, 358757.36223559856 6691971.843038354, 358757.821716916 6691971.402702094, 358758.64495427633 6691972.312092201, 358758.8459773527 6691972.082351542, 358762.1197817392 6691975.700766918, 358761.90918613557 6691975.911362523, 358762.3878125076 6691976.476141639, 358761.87089602556 6691976.868615266, 358761.99533888226 6691977.00263065, 358761.4879949278 6691977.404676802, 358761.94747624506 6691977.93116581, 358759.28631361504 6691979.989259213, 358759.01828284666 6691979.644648225, 358758.48222130956 6691980.06583943, 358758.48222130956 6691980.06583943, 358758.48222130956 6691980.06583943, 358758.48222130956 6691980.06583943, 358758.48222130956 6691980.06583943)
-LINESTRING (358759.31981746113 6691977.553050979, 358759.7697262507 6691978.02210482, 358757.9880395818 6691978.714916493, 358757.2389893102 6691977.906037925, 358757.7786405427 6691977.457325703, 358758.2381218599 6691977.9455246)
-LINESTRING (358755.2467070336 6691974.00642956, 358755.7109746151 6691974.480269673, 358755.61046307645 6691974.757872966, 358756.9027542814 6691976.174607028, 358756.1752421959 6691976.787248787, 358754.7967982438 6691975.265216917)
-LINESTRING (358760.38715427055 6691976.370843836, 358760.87535317044 6691976.868615266, 358761.35996236955 6691975.443505238, 358759.8570755627 6691973.792244256, 358759.05178669223 6691974.609498788, 358760.46852075396 6691976.15546197)
-LINESTRING (358758.20940427715 6691973.125757032, 358757.0176246107 6691973.585238352, 358756.52942571096 6691973.058749342, 358757.80257186113 6691972.627985608, 358757.6012919845 6691972.403997232, 358758.3769235079 6691972.1685042875, 358759.2732622434 6691973.164129775, 358758.6928169133 6691973.666604837, 358758.20940427715 6691973.125757032)
-LINESTRING (358754.7967982439 6691975.265216917, 358755.2467070336 6691974.00642956)
-LINESTRING (358758.23812185996 6691977.9455246, 358759.31981746113 6691977.553050979)
-LINESTRING (358760.38715427055 6691976.370843836, 358760.468520754 6691976.15546197)
-LINESTRING (358757.6012919845 6691972.403997232, 358755.58630745346 6691973.022992514, 358755.2467070336 6691974.00642956)
-LINESTRING (358756.17524219595 6691976.787248787, 358757.2389893102 6691977.906037925)
-LINESTRING (358759.7697262507 6691978.02210482, 358760.57347725285 6691977.701877929, 358760.8753531705 6691976.868615266)
-LINESTRING (358759.2732622434 6691973.164129775, 358759.85707556264 6691973.792244256)
-LINESTRING (358758.48222130956 6691980.06583943, 358753.84402312007 6691974.811795482)
-""")
+            _sio = AbstractGeoDataFrameDemos._dataset(
+                "GeoDataFrameDemosA", "bottiere_chenaie_pergola.csv"
+            )
         return GeoDataFrameLib.read_csv(_sio)
 
     @staticmethod
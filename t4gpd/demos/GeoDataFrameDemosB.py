@@ -60,10 +60,8 @@ BDT_3-0_SHP_LAMB93_D075-ED2021-12-15/ADMINISTRATIF/COMMUNE.shp")
         paris.reset_index(drop=True, inplace=True)
         paris.to_csv('/tmp/paris.csv', sep=';', index=False)
         """
-        _sio = StringIO(
-            """ID;INSEE_COM;INSEE_ARR;INSEE_COL;INSEE_DEP;INSEE_REG;POPULATION;SURFACE_HA;DATE_CREAT;DATE_MAJ;DATE_APP;DATE_CONF;CODE_POST;NOM;CL_ARROND;CL_COLLTER;CL_DEPART;CL_REGION;CAPITALE;DATE_RCT;RECENSEUR;SIREN_EPCI;ID_CH_LIEU;ID_AUT_ADM;CODE_SIREN;geometry
-COMMUNE_0000000009736048;75056;1;75C;75;11;2175601;10540;2006-08-02 08:36:54;2021-10-14 15:50:58;;;;Paris;Oui;Oui;Oui;Oui;Oui;2018-01-01;INSEE;200054781;PAIHABIT0000000244242163;SURFACTI0000000000143052;217500016;POLYGON ((653313.8 6857558.1, 653249.3 6857530.8, 653085.9 6857524.9, 653054.6 6857523.9, 653045.7 6857523.6, 653043.4 6857523.5, 653016.4 6857522.5, 653001.7 6857522.3, 652962.4 6857521, 652927.6 6857519.9, 652889 6857518.8, 652818.7 6857516.4, 652776.7 6857515, 652768.7 6857514.8, 652751 6857513.9, 652735.9 6857512.8, 652728 6857512.2, 652700.1 6857510.2, 652667.7 6857549.6, 652618.9 6857609.8, 652560 6857675.3, 652520.1 6857720, 652519.3 6857720.9, 652504.7 6857737.2, 652496.2 6857746.6, 652448.4 6857804.5, 652364.3 6857739.7, 652336.6 6857721, 652307.8 6857701.5, 652200.1 6857630.1, 652180.4 6857618.1, 652174.1 6857613.9, 652168.4 6857609.9, 652127.5 6857580.6, 652063.3 6857535.3, 652053.1 6857529.3, 652044.3 6857526.2, 652031.9 6857523.9, 652023.2 6857522.8, 652016.5 6857522.9, 652004 6857523.8, 651990.4 6857525.8, 651978.8 6857528.2, 651943.3 6857533.7, 651931 6857534.8, 651917.4 6857535.5, 651903.1 6857535.2, 651885.4 6857533.6, 651870.5 6857531.1, 651864.4 6857529.8, 651856 6857527.5, 651863.6 6857482.4, 651862.4 6857477, 651854.8 6857481.7, 651846.4 6857486.6, 651832.3 6857494.6, 651822.5 6857500.1, 651812.5 6857505.6, 651799.3 6857514.4, 651787.6 6857520.4, 651778.3 6857526, 651768 6857531.5, 651757.5 6857536, 651747.5 6857539.5, 651696.9 6857554.8, 651668.5 6857562.5, 651660.1 6857564.1, 651612.1 6857567.8, 651574.1 6857569.4, 651560 6857571.1, 651503 6857577.1, 651437.1 6857583.1, 651390.3 6857586.9, 651353.8 6857590.6, 651336.6 6857592.1, 651298.1 6857595.8, 651292.5 6857596.3, 651283.8 6857597, 651267.4 6857598.6, 651250.6 6857600.2, 651212.3 6857603.9, 651180.4 6857607.2, 651164.9 6857608.7, 651075.1 6857618, 650960.3 6857642.4, 650949.4 6857644.6, 650942.2 6857645.8, 650984.7 6857782.9, 650834.8 6857835, 650753 6857863.1, 650479.6 6857957, 650475.3 6857958.5, 650362.6 6857996.9, 650194 6858054.5, 650148.5 6858070.3, 650116.1 6858081.6, 649678.2 6858232.2, 649643.8 6858244, 649497.5 6858294, 649458.5 6858307.4, 649273.1 6858370.9, 649219.4 6858389.2, 649217 6858390, 649117.7 6858424, 649110.7 6858426.5, 649048.7 6858448.5, 648970.5 6858476.2, 648906 6858499.1, 648901.3 6858500.7, 648892.8 6858503.8, 648841.5 6858522, 648795.1 6858537.1, 648778.9 6858542.3, 648763.5 6858547.3, 648762 6858547.8, 648744.9 6858553.4, 648704.6 6858567.5, 648621.3 6858596, 648386.6 6858676.9, 648044.2 6858795, 648036.8 6858797.6, 647894 6858893.1, 647833.6 6858932, 647635.5 6859058.1, 647491.4 6859152.7, 647488.8 6859154.5, 647408.7 6859209.6, 647341.9 6859249.9, 647175.4 6859343.3, 647142.8 6859361.6, 647085.8 6859395.6, 647081.9 6859398.2, 647077.6 6859401, 647060.9 6859379.2, 646873.1 6859151.8, 646799.4 6859063.9, 646797.3 6859065.1, 646662.9 6858945.4, 646659.7 6858939.5, 646651.8 6858935.5, 646634.4 6858919.9, 646623.5 6858910.2, 646617.9 6858901.2, 646613.5 6858897.1, 646489.1 6858895.1, 646248.8 6858891.1, 646234.2 6858906, 646216.8 6859302.4, 646387.5 6859448.2, 646408.6 6859465.1, 646405.6 6859469.1, 646275.8 6859623.9, 646253 6859641.6, 646230 6859642.6, 646047.4 6859604.8, 645885.5 6859571.4, 645790.3 6859588.6, 645783.9 6859589.8, 645571.2 6859629.4, 645460.7 6859650.7, 645427.2 6859655.7, 645336.8 6859673, 645325.1 6859675.2, 645319.9 6859685.3, 645311.1 6859702.2, 645302.5 6859717, 645209.8 6859883.8, 645209.3 6859884.8, 645206.2 6859890.4, 645126.3 6860035.8, 645120.2 6860047.7, 645114.7 6860058.4, 645099 6860086.9, 645093.2 6860100.7, 645092.1 6860103.4, 645077.2 6860123.7, 645051.2 6860484, 645050.6 6860491.9, 645046.2 6860557.5, 645045.4 6860559.6, 645045.3 6860576.4, 645084.5 6860696.6, 645097.6 6860731.7, 645130.7 6860831.4, 645140.6 6860864.1, 645090.5 6860866.6, 645015.1 6860870.3, 645003.5 6860871.4, 644996.7 6860873.2, 644949.3 6860893.1, 644895.4 6860914.8, 644837.6 6860937.9, 644805.7 6860950.9, 644783.5 6860959.7, 644744.6 6860975.4, 644722.6 6860984.3, 644701.4 6860992.7, 644661.8 6861008.7, 644631.1 6861021.3, 644464.4 6861086.9, 644422.3 6861104.2, 644400.6 6861112.7, 644391.3 6861125.6, 644371.2 6861149.3, 644357 6861166.2, 644351.4 6861174.9, 644343.5 6861186.9, 644339.3 6861196.7, 644265.7 6861298.4, 644242.8 6861327, 644230 6861340.2, 644212.7 6861356.3, 644198.3 6861365.4, 644169.6 6861380.1, 644154 6861386, 644067.1 6861415.2, 644041.4 6861423.8, 644037.9 6861425, 643912.4 6861468.8, 643827.2 6861499.8, 643759.8 6861524.3, 643731.8 6861533.1, 643666.2 6861556.7, 643610.6 6861574.3, 643499 6861611.5, 643441.7 6861629.7, 643304.5 6861677.6, 643249.1 6861697, 643222.8 6861714, 643199.3 6861722.3, 643075.6 6861777.1, 643075.7 6861801.7, 643078.1 6861853.4, 643081 6861951.8, 643085 6862019.3, 643092.3 6862070.2, 643100.8 6862112.8, 643161.8 6862332.1, 643188.5 6862430.7, 643211 6862498.4, 643246.1 6862599.1, 643288.3 6862718.3, 643302.6 6862761, 643316.3 6862810.3, 643345.8 6862922.8, 643375.6 6863042.4, 643383.9 6863069, 643393.6 6863093.2, 643486 6863256.2, 643499.6 6863280.3, 643528.2 6863328, 643563.9 6863391.7, 643617.2 6863463.3, 643644 6863500.9, 643676.4 6863524.6, 643727.6 6863557.5, 643789.1 6863591.7, 643821.8 6863607.6, 643927.2 6863659.9, 643943.2 6863666.8, 644006.8 6863692.3, 644064.2 6863714, 644108.7 6863732.7, 644137.7 6863745.5, 644196 6863774.1, 644223.1 6863788.5, 644251.1 6863805.9, 644279 6863824.4, 644323 6863858.3, 644344.6 6863876.8, 644390.4 6863919.9, 644454.7 6863990.6, 644476 6864017.3, 644495.2 6864042.9, 644545.8 6864119.8, 644635.7 6864251.4, 644674.5 6864310.1, 644676.4 6864312.8, 644716.2 6864286.7, 644727 6864281, 644736.9 6864276.9, 645342.3 6864042, 645386 6864061.9, 645434.8 6864205.6, 645616.6 6864740.7, 645645.4 6864734.4, 645841.7 6864695.7, 646066.4 6864651.4, 646515.8 6864559.6, 647009 6864458.8, 647155 6864520.1, 647162.7 6864521.8, 647181.1 6864524.9, 647190.2 6864524.4, 647191 6864529.2, 647193.4 6864544.7, 647235.8 6864805.8, 647243.3 6864860.5, 647246.2 6864879.2, 647264 6864992.9, 647272.7 6865012.7, 647279.7 6865020.4, 647533.8 6865299.8, 647528.1 6865307.1, 647615.7 6865408.1, 647724.4 6865487.6, 647840.6 6865572.6, 647976.5 6865671.9, 648022.2 6865709.9, 648058 6865726.7, 648068.7 6865728.6, 648137.1 6865740.8, 648139.8 6865741.3, 648154 6865744, 648234.8 6865757.2, 648273.7 6865764.5, 648302.3 6865771.2, 648306.2 6865771.1, 648340.3 6865795.4, 648348 6865801.3, 648477 6865900.7, 648478.1 6865901.5, 648491.9 6865912, 648526.3 6865937.9, 648534.8 6865943.6, 648573.1 6865973.6, 648645.4 6866023.6, 648717.7 6866073.7, 648805.8 6866137.2, 648809.8 6866140.8, 648919.2 6866217.1, 648923.7 6866220.3, 648928.2 6866223.8, 648950.5 6866239.5, 648952.8 6866241.2, 649096 6866344, 649241.5 6866445.1, 649314.3 6866485.7, 649377.6 6866521, 649461.5 6866567.8, 649582.7 6866632.8, 649592.5 6866639.1, 649787.9 6866727.7, 650039.2 6866841.6, 650140.2 6866932.1, 650171 6866958.7, 650180.6 6866966.9, 650185.3 6866967.1, 650246.4 6866969.7, 650281 6866971.1, 650300.8 6866971.7, 650308.2 6866967.8, 650336 6866968.4, 650374.7 6866969.2, 650388.5 6866969.2, 650576.8 6866983.3, 650628 6866985.4, 650681.3 6866986.4, 650708.4 6866987, 650715.9 6866987.1, 650724.8 6866987.3, 650730.1 6866987.4, 650758.7 6866988, 650788.6 6866988.5, 650807.3 6866989, 650833.9 6866989.4, 650862.9 6866990, 650868.5 6866990.1, 650872 6866990.2, 650892.9 6866990.6, 650913 6866991, 650954.6 6866991.8, 650968 6866992.1, 650978.7 6866992.3, 650984.9 6866992.5, 650994.1 6866992.6, 651007.6 6866992.9, 651028.5 6866993.3, 651220.2 6866998, 651229.9 6866998.3, 651236.1 6866998.5, 651256.9 6866998.9, 651261.3 6866999, 651268.8 6866999.2, 651288.9 6866999.7, 651295.8 6866999.8, 651334.7 6867000.8, 651374.8 6867001.8, 651380.1 6867001.9, 651413 6867002.6, 651425.4 6867002.9, 651432.8 6867003.1, 651435.2 6867003.2, 651446.7 6867003.7, 651456.9 6867003.8, 651464.2 6867004, 651513.9 6867005.1, 651516.9 6867005.2, 651598.6 6867007, 651612 6867007.1, 651617.7 6867007.1, 651668.2 6867008.1, 651670.1 6867008.2, 651675.1 6867008.5, 651716.8 6867009.5, 651773.8 6867010.6, 651785.9 6867010.8, 651850.6 6867012.3, 651855.1 6867012.2, 651862 6867012.2, 651890.8 6867013, 651893.5 6867013.1, 651902.4 6867013.4, 651912.8 6867013.6, 651916.7 6867013.6, 651918.1 6867013.6, 651945.8 6867014.4, 651980.9 6867015, 651995 6867015.4, 652012.5 6867015.7, 652034.4 6867016.3, 652101.9 6867017.8, 652181.1 6867019.4, 652207.7 6867020, 652224 6867020.3, 652489.4 6867026.2, 652494.1 6867026.3, 652526.1 6867027, 652531.3 6867027.1, 652539.6 6867027.3, 652557.5 6867027.6, 652567.4 6867027.8, 652580 6867028.1, 652591.7 6867028.4, 652605.7 6867028.7, 652617.7 6867029, 652623.6 6867029.1, 652627.8 6867029.2, 652634.7 6867029.4, 652643.5 6867029.5, 652647.7 6867029.7, 652653.2 6867029.7, 652661 6867029.9, 652672.1 6867030.2, 652679.6 6867030.3, 652688.8 6867030.5, 652703.2 6867030.8, 652713.8 6867031.1, 652718.8 6867031.2, 652732.8 6867031.4, 652754 6867032, 652773.1 6867032.4, 652792 6867032.7, 652807.8 6867033.1, 652813.9 6867033.3, 652819.1 6867033.4, 652824.3 6867033.5, 652838.7 6867033.9, 652852.1 6867034.1, 652865.2 6867034.4, 652877.7 6867034.7, 652891.5 6867035, 652909 6867035.4, 652915.6 6867035.5, 652965.3 6867036.7, 652967.1 6867036.7, 652973.3 6867036.8, 652977.3 6867036.9, 652986.8 6867037.1, 652994.4 6867037.3, 653000.9 6867037.5, 653006.6 6867037.5, 653011.4 6867037.7, 653014.9 6867037.8, 653017.4 6867037.8, 653020.2 6867037.9, 653030 6867038.1, 653038.2 6867038.3, 653042.1 6867038.3, 653166.3 6867041.2, 653250.1 6867043.1, 653258.5 6867043.2, 653346 6867045.2, 653358.1 6867045.5, 653375.9 6867045.8, 653473.5 6867048.1, 653494 6867048.5, 653534.9 6867049.6, 653549 6867050, 653582.8 6867050.8, 653644.1 6867052.4, 653665.9 6867053, 653691.3 6867053.5, 653723.5 6867054.1, 653733.3 6867054.3, 653737.3 6867054, 653743.4 6867053.7, 653749.4 6867053.7, 653798.1 6867055.1, 653810.6 6867055.3, 653813.7 6867055.3, 653815.7 6867055.4, 653837.3 6867055.8, 653854.4 6867056.2, 653885.7 6867057, 653935.9 6867058.2, 653950.2 6867058.5, 653950.6 6867058.5, 653951.9 6867058.6, 653963.1 6867058.9, 653967.2 6867058.9, 653973.8 6867059.1, 654004.5 6867059.8, 654013.6 6867060.1, 654098.2 6867062, 654207.1 6867064.7, 654296.5 6867066.8, 654300.5 6867066.9, 654354.1 6867068.2, 654359 6867068.3, 654387.7 6867069, 654407 6867069.4, 654453.8 6867070.6, 654454.6 6867070.6, 654532 6867072.5, 654537.9 6867072.6, 654568.1 6867073.3, 654574.1 6867073.4, 654575.7 6867073.5, 654579.8 6867073.6, 654593.6 6867074, 654608.4 6867074.2, 654619.8 6867074.5, 654623.1 6867074.6, 654649.5 6867075.3, 654674.6 6867075.9, 654683.2 6867076.1, 654695.5 6867076.3, 654703.4 6867076.5, 654711.7 6867076.8, 654739.7 6867077.4, 654753.1 6867077.7, 654765.5 6867078, 654771.6 6867078.2, 654777.3 6867078.3, 654785.9 6867078.5, 654793.7 6867078.7, 654796.7 6867078.8, 654809.9 6867079.1, 654814.2 6867079, 654830 6867078.8, 654880.6 6867080.9, 654905.6 6867072.8, 654918.9 6867068.5, 654946.9 6867059.6, 654957.5 6867056.2, 655147.9 6866993.7, 655226.9 6866970.1, 655231.8 6866968.5, 655238.1 6866966.6, 655328.1 6866941.7, 655341.9 6866939.4, 655354.3 6866928.6, 655359.4 6866925.1, 655363.4 6866921.5, 655368.1 6866917, 655371.9 6866913.2, 655377.8 6866909.1, 655381.4 6866905.3, 655385.9 6866901.3, 655389.6 6866897.9, 655402.7 6866886.7, 655410 6866880.6, 655424.2 6866867.5, 655441 6866853, 655454.2 6866841.3, 655459.1 6866837.2, 655473 6866825.3, 655479.3 6866820.4, 655484.1 6866816.5, 655531 6866774.5, 655563.4 6866746.2, 655600.7 6866713.9, 655618.1 6866698.8, 655649.1 6866671.8, 655682.8 6866642.9, 655689.5 6866632.3, 655689.7 6866631.9, 655693.7 6866619.7, 655696.9 6866612, 655697.1 6866611.4, 655700.3 6866602.5, 655702.1 6866597.6, 655702.7 6866595.6, 655705.9 6866587.3, 655706 6866587, 655707.9 6866581.9, 655710.7 6866574.2, 655712.6 6866569, 655714.8 6866562.9, 655714.9 6866561.8, 655716.4 6866558.4, 655718.6 6866553.4, 655756.2 6866449.5, 655767.8 6866417.8, 655768 6866417.3, 655770.5 6866410.4, 655775.4 6866396.9, 655783.5 6866374.9, 655785.2 6866370.7, 655789.8 6866358.9, 655792.5 6866352.6, 655803.1 6866324.9, 655817.4 6866288.4, 655833.1 6866247.8, 655837.3 6866234.9, 655844.5 6866195.5, 655852.4 6866153.3, 655860.7 6866114.9, 655877.3 6866016, 655914.4 6865752.2, 655914.6 6865751.1, 655923.7 6865686.5, 655926.4 6865670, 655938.1 6865572.7, 655938.7 6865569.7, 655939.8 6865558.7, 655940 6865550.7, 655941.5 6865458.1, 655941.6 6865449.1, 655941.7 6865438.6, 655942.2 6865413, 655942.5 6865396.3, 655942.8 6865371.4, 655943.1 6865355, 655943.4 6865336.1, 655943.3 6865335.5, 655943.8 6865315.6, 655944 6865298, 655944.2 6865287.5, 655944.4 6865279.9, 655944.6 6865262.1, 655945.1 6865234.9, 655945.4 6865219.7, 655945.6 6865206.1, 655947.7 6865200, 655961.1 6865162.6, 655962.5 6865158.8, 655963.3 6865156.5, 655965.1 6865151.4, 655976.8 6865118.6, 655981.1 6865106.9, 655984.8 6865096.4, 655991.7 6865077, 655996.8 6865062.7, 656007 6865034.3, 656035 6864997.8, 656036.2 6864995.8, 656041.5 6864988.4, 656070.4 6864951.3, 656072.5 6864948.7, 656096.8 6864916.8, 656108.7 6864901.2, 656125.5 6864889.8, 656146.5 6864875.4, 656162.7 6864864.3, 656184.1 6864849.6, 656190.6 6864845.2, 656210.7 6864831.5, 656221.1 6864824.2, 656229.2 6864818.8, 656234.6 6864815, 656251.7 6864803.3, 656253.7 6864802, 656265.4 6864793.9, 656269.4 6864791.2, 656288.1 6864778.5, 656332.6 6864748, 656408.4 6864718.3, 656492.5 6864691.8, 656503.9 6864688.2, 656515.6 6864684.5, 656522.7 6864682.2, 656540 6864676.9, 656572.6 6864666.7, 656588.1 6864661.7, 656603.6 6864656.9, 656609 6864655.2, 656615.3 6864653.3, 656682.6 6864632.7, 656686.6 6864624.5, 656723.8 6864552.6, 656778.2 6864447.1, 656788.2 6864429.6, 656848.1 6864316.8, 656888.6 6864240.5, 656906.3 6864207.1, 656921.5 6864126.1, 656925.1 6864106.3, 656932.2 6864068.8, 656940.7 6864023.3, 656955.4 6863945, 656975.3 6863839.3, 656990.5 6863761.1, 656990.7 6863757.3, 656991.3 6863747.6, 656991.4 6863743.2, 656993.4 6863702.4, 656993.9 6863696.9, 656994.3 6863692.3, 656995.2 6863663.2, 656999.6 6863588.7, 657001.3 6863572.7, 657002.6 6863548.4, 657002.9 6863544.5, 657004.9 6863502.8, 657008.2 6863451.5, 657008.7 6863445, 657009.1 6863439.3, 657009.1 6863438, 657008.9 6863430.8, 657009.4 6863422.8, 657010.6 6863402.7, 657009.5 6863213.3, 657010.7 6863166.6, 657011.4 6863135.7, 657011.5 6863135.3, 657011.7 6863130.4, 657011.7 6863128.8, 657011.5 6863125.3, 657012.4 6863099.1, 657012.2 6863092.1, 657012.1 6863082.4, 657012.1 6863077.2, 657011.5 6863058.9, 657011.4 6863050, 657009.1 6862976.6, 657008.8 6862954, 657008.5 6862931.4, 657006.5 6862901.9, 657008.8 6862874.4, 657009.4 6862868.1, 657010.6 6862853.3, 657011.2 6862846.9, 657016.2 6862789.5, 657016.9 6862779.6, 657017.7 6862767.8, 657017.9 6862765.5, 657019 6862752.9, 657026.1 6862633.1, 657026 6862631.9, 657027.4 6862611.1, 657033.9 6862449.9, 657037.2 6862404.6, 657056.6 6862233.4, 657057.3 6862227, 657059.2 6862208.2, 657060.1 6862197.8, 657061.8 6862183.4, 657067.8 6862127.3, 657073.4 6862074, 657085 6861953.2, 657085.3 6861950, 657096.6 6861841, 657102.2 6861792, 657102.4 6861789.9, 657105.7 6861765.1, 657107 6861752.9, 657107.4 6861749.7, 657109.7 6861728.3, 657134.9 6861503.4, 657144.8 6861416.1, 657144.9 6861415.3, 657145.6 6861408.2, 657145.9 6861405.6, 657149 6861375.1, 657156.5 6861302.2, 657159.6 6861273.3, 657164 6861233.9, 657164.7 6861226.8, 657165.1 6861223.6, 657165.5 6861220, 657165.6 6861219.1, 657165.8 6861216.9, 657165.8 6861215.2, 657166 6861213.4, 657166.7 6861207.3, 657167 6861204.9, 657167.8 6861197.5, 657168.1 6861194.8, 657169.1 6861179.5, 657169.3 6861120.1, 657148.5 6860960, 657144.1 6860924.3, 657140.8 6860897.4, 657139.8 6860889.4, 657139.2 6860883.5, 657137.2 6860867.5, 657135.4 6860852.9, 657131.5 6860822.3, 657131.1 6860818.8, 657125.5 6860774.8, 657123.9 6860758.5, 657122.7 6860749.4, 657121.5 6860742.7, 657115.9 6860708.7, 657112 6860690.8, 657110.2 6860682.5, 657088.2 6860581.4, 657086 6860571.2, 657081 6860547.6, 657080.7 6860546.8, 657078 6860533.5, 657076 6860523.8, 657074 6860514.5, 657073 6860509.6, 657070.7 6860498.7, 657058.9 6860441.9, 657054 6860418.1, 657008.3 6860208.2, 656992.9 6860127.3, 656991.1 6860118.9, 656957.2 6859962.8, 656956.8 6859961.3, 656928.9 6859844.8, 656914.8 6859786, 656902.3 6859734, 656856.4 6859547.8, 656799.1 6859480.4, 656810.6 6859477.6, 656826.4 6859474, 656843.9 6859470.1, 656859.9 6859466.8, 656880.8 6859463.1, 656892.2 6859461.8, 656907.8 6859460.2, 656923.6 6859458.5, 656948.2 6859456.4, 656978.7 6859454.9, 656999.2 6859455.1, 657014 6859455.5, 657031 6859456.3, 657050.5 6859457.9, 657070.2 6859460.1, 657092.5 6859463.2, 657113.2 6859467.2, 657129.1 6859470.7, 657146 6859475.6, 657165 6859481.3, 657176.2 6859485.2, 657204.8 6859496.2, 657229.9 6859506.1, 657278.5 6859529, 657295.3 6859536.8, 657378.1 6859576.5, 657411 6859593.1, 657442.4 6859608.5, 657454.5 6859614.7, 657471.8 6859623.7, 657488.4 6859632.5, 657493.5 6859634.9, 657500.9 6859638.6, 657549.5 6859664.2, 657576.2 6859678.4, 657583.6 6859682.4, 657573 6859708.4, 657559.3 6859743.8, 657551.3 6859765.9, 657543.8 6859789.3, 657538.6 6859813.4, 657536 6859827.1, 657534 6859840.8, 657530.7 6859870.9, 657520.6 6859945.7, 657508.9 6860015.9, 657507.9 6860022, 657507.1 6860026.9, 657497.8 6860075.7, 657486.5 6860115.6, 657482.7 6860128.8, 657475.1 6860154.4, 657471.7 6860165.4, 657468.6 6860175.5, 657465.2 6860185.5, 657459.3 6860199.5, 657452.8 6860213.4, 657446.9 6860224.3, 657440.4 6860234.5, 657432.2 6860244.9, 657414.5 6860271.2, 657410 6860279.5, 657404.3 6860292.8, 657397.4 6860312.2, 657392.5 6860338.7, 657390.6 6860350.2, 657387.2 6860373.2, 657386.4 6860380.1, 657385.7 6860389.1, 657384.8 6860409.3, 657384.7 6860424.4, 657384.9 6860428.9, 657385.9 6860433.3, 657387.4 6860437.7, 657391.2 6860446.4, 657393.3 6860450.4, 657401.7 6860463, 657413 6860477.8, 657416.7 6860484.6, 657419.6 6860490.7, 657421.5 6860495.8, 657422.5 6860500.6, 657422.8 6860505.3, 657422.9 6860515.1, 657422.9 6860522.5, 657422.6 6860535.2, 657437.1 6860547.5, 657441.4 6860551.1, 657452.3 6860558.9, 657507 6860598.2, 657539.8 6860621.9, 657558.4 6860635, 657569.3 6860643.2, 657574.8 6860639.3, 657581.8 6860633.7, 657588.6 6860627.9, 657596.8 6860619.9, 657604.1 6860611.1, 657612.1 6860600.7, 657619.3 6860589.6, 657627.9 6860576, 657636 6860559.9, 657642.4 6860546.6, 657645.9 6860539.1, 657649 6860532.4, 657650.5 6860529.2, 657656.1 6860516.1, 657664 6860495.9, 657673.4 6860472.8, 657682.8 6860454.7, 657688.5 6860444.2, 657694.1 6860434.8, 657699.5 6860426, 657705.5 6860416.5, 657711.3 6860407.8, 657716.7 6860399.8, 657721.6 6860392.9, 657727.1 6860386.2, 657732.3 6860380.4, 657739.6 6860374.1, 657750.7 6860365.3, 657754.6 6860363, 657759.3 6860360.6, 657764.4 6860358.1, 657773 6860354.8, 657779.3 6860352.6, 657786 6860350.8, 657792.6 6860349.2, 657798.8 6860348.1, 657805.5 6860347.2, 657811.9 6860346.4, 657819 6860345.4, 657858.5 6860338.4, 657967.4 6860323.9, 657987.3 6860321.4, 658028 6860316.4, 658036.4 6860315.1, 658044.2 6860314, 658212 6860289.6, 658217.8 6860288.9, 658277.5 6860281.2, 658330 6860273.4, 658336.3 6860272.7, 658347.5 6860271.5, 658378.9 6860267.8, 658418.4 6860260.9, 658425 6860259.9, 658426.2 6860267.2, 658427.6 6860277.5, 658434.3 6860276.7, 658470.1 6860272.1, 658571.9 6860257.8, 658588.8 6860255.8, 658692 6860241, 658699.5 6860289.1, 658719.6 6860432.2, 658747 6860626.7, 658748.4 6860636.3, 658750.4 6860650.5, 658751.8 6860659.9, 658767.5 6860657.5, 658782.7 6860655, 658799.9 6860652.4, 658811.1 6860650.7, 658864 6860643.2, 658880.5 6860641.1, 658901.1 6860638.5, 658914.1 6860636.8, 658926 6860635.2, 658939.6 6860633.6, 658944 6860662, 658945.2 6860671, 658945.8 6860674.8, 658946.4 6860679.7, 658947 6860683.8, 658953.5 6860683.2, 658960.6 6860682.3, 658965.5 6860723.7, 658952.1 6860723.3, 658958.3 6860803, 658965.5 6860802, 659037.1 6860797.1, 659069.2 6860795.8, 659206.1 6860791.6, 659217.2 6860791.3, 659263.7 6860790.2, 659390.3 6860781.9, 659378.7 6860689.2, 659413.3 6860685.9, 659449 6860681, 659478.1 6860676.9, 659508.6 6860672.2, 659536.8 6860667.3, 659568.8 6860661.4, 659600.8 6860655.3, 659634.9 6860648.4, 659662.7 6860642.6, 659695.1 6860635.2, 659772.2 6860615.4, 659798.8 6860609.3, 659827.5 6860602.6, 659892.2 6860589.3, 659952.4 6860579.4, 660014.3 6860568.2, 660108.7 6860549, 660132.3 6860543.9, 660210.3 6860525.8, 660248.9 6860516.3, 660266.8 6860511.9, 660319.7 6860495.7, 660359 6860483.8, 660442.1 6860456.2, 660475.5 6860443, 660499.6 6860432.7, 660530 6860418.8, 660547.3 6860410.3, 660563.9 6860401.4, 660576.7 6860394.3, 660587.3 6860387.9, 660601.4 6860378.3, 660625.8 6860363.3, 660642 6860353.1, 660674.1 6860329, 660695.8 6860311, 660710.5 6860298.4, 660726.8 6860283.9, 660752.7 6860257.9, 660763.8 6860245.8, 660770.6 6860237.7, 660784.8 6860220.1, 660797.7 6860202.4, 660812 6860183.2, 660818.6 6860173.9, 660838.4 6860142.7, 660853.1 6860118.3, 660874.1 6860081.6, 660893 6860044, 660902.4 6860026.2, 660924.3 6859988.3, 660936.3 6859967.9, 660945.5 6859953.5, 660953.5 6859942.1, 660957.3 6859937.3, 660991.6 6859892.4, 661000.8 6859880.1, 661012.6 6859864.1, 661018.1 6859856.4, 661024 6859848, 661041.7 6859823.9, 661058.9 6859797, 661066.2 6859782.7, 661072.6 6859768, 661082.8 6859741.2, 661085.1 6859733.2, 661086.2 6859724.7, 661085.2 6859713.4, 661085.2 6859707.8, 661085.3 6859699.1, 661084.5 6859657.9, 661080.9 6859625.1, 661076 6859590.9, 661067.3 6859553.4, 661061.9 6859532.2, 661059.9 6859526, 661058.8 6859522.5, 661057.8 6859519, 661058.2 6859516.1, 661059 6859512.7, 661058.7 6859510.5, 661056.9 6859508.6, 661054.8 6859506.8, 661052.3 6859505.1, 661051.4 6859503.3, 661046 6859490.8, 661036.5 6859471.6, 661022.8 6859449.4, 661013.8 6859435.9, 661003.8 6859423.3, 660993.6 6859412.7, 660983.8 6859403.8, 660966.3 6859390.1, 660955 6859382, 660945.2 6859375, 660939.3 6859370.4, 660930.3 6859364.2, 660922.3 6859359.1, 660898.5 6859342.7, 660883.6 6859331.6, 660869.7 6859320.3, 660842.4 6859295.1, 660838.7 6859291, 660820.5 6859270.2, 660804.1 6859248.7, 660787.1 6859223.1, 660772.6 6859197, 660768.7 6859188.2, 660768.2 6859185, 660768.8 6859182.1, 660769.3 6859178.9, 660769.1 6859177.2, 660767.6 6859174.8, 660765.5 6859173.3, 660763.5 6859172.2, 660761.7 6859170.8, 660757.6 6859162.1, 660751.8 6859145.6, 660746.1 6859128.6, 660741.3 6859112.3, 660736.5 6859097, 660731.4 6859078.7, 660728.4 6859065.4, 660727.7 6859062.7, 660725.9 6859054.5, 660721.6 6859033.3, 660717.9 6859015.9, 660710.8 6858980.5, 660708.2 6858966.1, 660705.7 6858951.6, 660702.9 6858935.3, 660701.1 6858920.1, 660700.4 6858913.7, 660698.8 6858899.7, 660697.4 6858883.8, 660695.4 6858852.9, 660695.5 6858833, 660697.1 6858784.3, 660697.7 6858769, 660698 6858765, 660698.7 6858751.5, 660704.7 6858749.6, 660713 6858747.2, 660721.4 6858744.6, 660730.4 6858742.1, 660740.6 6858756.1, 660752.2 6858747.2, 660755.3 6858744.8, 660809.8 6858717.9, 660788.4 6858638.4, 660780.9 6858612.1, 660776.1 6858595.6, 660774.7 6858589.8, 660760.9 6858532.8, 660758.9 6858524.5, 660745 6858457.2, 660735.4 6858454.8, 660743.3 6858426.7, 660738.9 6858411.2, 660734.8 6858396.4, 660732.6 6858388.3, 660730 6858378.8, 660727.8 6858369.7, 660724.7 6858360.3, 660724.1 6858357.8, 660648 6858160.2, 660646.4 6858153.8, 660641.9 6858140.4, 660636.3 6858123.9, 660631.2 6858109.2, 660627.4 6858096.9, 660625.4 6858090.9, 660601.4 6858032.3, 660586 6857992, 660583.1 6857984.4, 660561.3 6857924.5, 660554.9 6857875.9, 660548.2 6857834.7, 660535.8 6857821.1, 660539.7 6857814.4, 660544.8 6857805.4, 660547.9 6857800.3, 660529.9 6857788.1, 660437.9 6857722.7, 660388.1 6857686.6, 660315.1 6857636.4, 660283.7 6857613.7, 660305.2 6857556, 660283.7 6857572.7, 660254.2 6857577.1, 660205.5 6857575.8, 660048.8 6857583.8, 659988.8 6857583.5, 659969.1 6857585, 659958.4 6857585.8, 659956.5 6857585.8, 659936.4 6857587.4, 659922.8 6857588.5, 659913.3 6857589.1, 659906.3 6857589.6, 659867.7 6857592.5, 659858.9 6857594.4, 659855.3 6857595.1, 659834.7 6857601, 659814.9 6857607.4, 659812.6 6857608.2, 659799.8 6857611.7, 659787.7 6857616.4, 659779.2 6857619.7, 659711.1 6857645.8, 659705.6 6857647.6, 659673.9 6857658.3, 659655.7 6857663.4, 659627.2 6857669.9, 659602.8 6857675.1, 659596.7 6857676.2, 659590.6 6857677.2, 659572.4 6857679, 659536.6 6857681.7, 659496.3 6857684.1, 659452.3 6857686.2, 659436.7 6857686.2, 659424.6 6857685.6, 659373.1 6857683.1, 659366.5 6857682.8, 659318 6857683, 659226.6 6857680.2, 659187.5 6857678, 659154.5 6857680.1, 659077.8 6857681.7, 659051.3 6857682.2, 659034.5 6857683.7, 659016.8 6857686.8, 658955 6857703.9, 658890.9 6857722.8, 658876.2 6857725.7, 658870.1 6857726.5, 658860.8 6857726.6, 658836.8 6857725.5, 658766.8 6857720.7, 658702.8 6857716, 658693.7 6857715.4, 658684.6 6857715.1, 658685.1 6857720.5, 658690.6 6857787.3, 658693.7 6857818.9, 658692.9 6857820.1, 658692.1 6857821.1, 658689.7 6857823.9, 658686.6 6857827.4, 658678.7 6857833.3, 658655.9 6857847.4, 658625 6857862.4, 658620.1 6857864.5, 658612.5 6857867.5, 658590.2 6857873.2, 658527.3 6857879.8, 658507.6 6857882.3, 658497.8 6857876.5, 658489.4 6857870, 658475.1 6857856.9, 658471.1 6857852.8, 658467.1 6857848.4, 658451.6 6857832.3, 658460.8 6857909.5, 658462.9 6857937, 658449.8 6857952.5, 658389.5 6858016.3, 658375.9 6858030.2, 658331.2 6858078.9, 658361.5 6858108.4, 658342.9 6858131.6, 658310.4 6858100.6, 658184.4 6858233.8, 658179.9 6858238.7, 658177.5 6858241.4, 658196.6 6858272.4, 658192 6858275.1, 658170.4 6858287, 658151.7 6858297.3, 658140.5 6858303.4, 658128.3 6858309.6, 658105 6858320.1, 658094.1 6858324.8, 658060.5 6858337.4, 658027.6 6858348.3, 658001.2 6858356.4, 657985.3 6858360.5, 657961.8 6858366.4, 657929.7 6858373.3, 657899.8 6858379, 657874.7 6858382.7, 657833.4 6858387, 657819.5 6858388.4, 657793.9 6858389.7, 657772.3 6858390.2, 657758.8 6858390.5, 657748.7 6858390.2, 657735.2 6858389.7, 657702.3 6858388.9, 657683.3 6858387.9, 657670.4 6858387.5, 657663.2 6858387, 657641.6 6858385.6, 657634.1 6858385.1, 657628.4 6858384.7, 657551.1 6858377.3, 657543.2 6858377.1, 657524.4 6858377, 657466.8 6858376.7, 657441.2 6858378.3, 657414.3 6858380.7, 657398.3 6858384.1, 657372.1 6858389.4, 657361.5 6858392.1, 657337.5 6858399.2, 657314.7 6858407.2, 657287.6 6858418.3, 657275.5 6858423.3, 657261.2 6858428.8, 657253.2 6858432, 657231.4 6858438.7, 657206.9 6858445.5, 657187.1 6858450, 657161.6 6858455.5, 657141.1 6858458.4, 657122.2 6858460.4, 657098.8 6858461.3, 657072.8 6858461.7, 657068.8 6858461.6, 657056.6 6858461.4, 657046 6858460.6, 657007.3 6858457.8, 656961.3 6858455.5, 656911.8 6858455.3, 656876 6858457.7, 656864.1 6858458.9, 656861.1 6858459.2, 656825.3 6858463.5, 656812.5 6858465.5, 656799.4 6858468.5, 656783.7 6858472.4, 656767.2 6858476.4, 656750.2 6858481.2, 656744 6858483.4, 656730.3 6858488, 656716.7 6858492.7, 656703.5 6858497.9, 656691.4 6858503.3, 656680.5 6858508.8, 656670.5 6858515.1, 656664.1 6858518.9, 656658.1 6858522.2, 656638.4 6858534.3, 656623.5 6858544.7, 656587 6858574.4, 656558.6 6858599.6, 656544 6858613.1, 656528.7 6858627.9, 656516.4 6858639.8, 656507.8 6858648.7, 656503.7 6858653.5, 656497.6 6858660, 656457 6858705.5, 656432.2 6858733.9, 656429.2 6858737.4, 656421 6858747.4, 656410.2 6858761.1, 656378.8 6858801.7, 656346.8 6858839.4, 656345 6858841.5, 656338.8 6858848.5, 656330 6858858.2, 656325 6858863.2, 656319 6858869.5, 656314.2 6858874.1, 656305.8 6858881.4, 656280.9 6858902.3, 656250.2 6858927.6, 656245.1 6858932.5, 656232.9 6858943.2, 656226.4 6858947.6, 656213.7 6858956.2, 656198.1 6858964.5, 656188.5 6858969.4, 656164 6858983.2, 656150.1 6858990.3, 656134.7 6858996.9, 656117.6 6859003, 656063.9 6858978.1, 656028.4 6858961.1, 656002.8 6858948.9, 655958.1 6858926, 655936.2 6858915.6, 655913.3 6858906, 655903.9 6858901.9, 655894.2 6858897.6, 655886.4 6858894.9, 655880 6858892.9, 655872.6 6858890.4, 655865.2 6858887.9, 655853.4 6858884, 655846.1 6858881.6, 655837 6858878.7, 655828.8 6858875.9, 655821.6 6858873.5, 655819.9 6858872.9, 655814.4 6858871.2, 655809 6858869.3, 655797.7 6858865.3, 655720.3 6858835.3, 655636.6 6858799.6, 655617.4 6858795, 655597.8 6858790.7, 655536.1 6858779.4, 655510.5 6858764.3, 655419.7 6858704.3, 655376.5 6858676.4, 655366.9 6858670.7, 655354.5 6858663.2, 655352.1 6858661.7, 655337.7 6858652.5, 655329.4 6858647.3, 655312.5 6858636.6, 655291.3 6858623.2, 655286.1 6858619.6, 655285.2 6858619, 655221.2 6858576.5, 655174.9 6858538.2, 655127.3 6858512, 655117.7 6858507.2, 655060.5 6858479.1, 655007.6 6858451, 654990.3 6858441.6, 654863.7 6858361, 654817.4 6858336.6, 654813 6858334.1, 654775 6858313.8, 654724.5 6858287.3, 654722 6858286, 654710.1 6858280, 654590.8 6858216.5, 654534.6 6858138, 654439.6 6858091.2, 654410.5 6858078.6, 654322.1 6858037.3, 654222 6857986.8, 654188.9 6857968.9, 654172 6857960.8, 654165.6 6857958, 654162 6857956.4, 654159.6 6857955.9, 654153.5 6857953, 654079.2 6857917, 654068.8 6857912.5, 654054.8 6857906.9, 654048.6 6857903.7, 654044.8 6857901.6, 654039.7 6857898.5, 654036.9 6857898.4, 654034.2 6857897.9, 654014.1 6857887.7, 654001.1 6857881.7, 653961.4 6857864.1, 653954.4 6857860.7, 653942.4 6857855, 653937.5 6857852.7, 653933.2 6857850.7, 653888.9 6857828.5, 653887.3 6857827.7, 653880.3 6857824.3, 653851.3 6857810, 653811.6 6857791.1, 653801.7 6857786.5, 653788.4 6857780.5, 653767.3 6857771.8, 653703 6857742, 653662.3 6857721.8, 653626.1 6857704.7, 653580 6857682.4, 653556.8 6857671.1, 653527.4 6857656.8, 653514.5 6857651, 653498.7 6857643.5, 653419.7 6857607.4, 653374.6 6857587.9, 653327 6857564.6, 653313.8 6857558.1))
-"""
+        _sio = AbstractGeoDataFrameDemos._dataset(
+            "GeoDataFrameDemosB", "villeDeParis.csv"
         )
         return GeoDataFrameLib.read_csv(_sio)
 
@@ -79,29 +77,8 @@ BDTOPO_3-0_TOUSTHEMES_SHP_LAMB93_D075_2021-12-15/BDTOPO/1_DONNEES_LIVRAISON_2021
 BDT_3-0_SHP_LAMB93_D075-ED2021-12-15/ADMINISTRATIF/ARRONDISSEMENT_MUNICIPAL.shp")
         paris.to_csv('/tmp/paris.csv', sep=';', index=False)
         """
-        _sio = StringIO(
-            """ID;INSEE_ARM;INSEE_COM;NOM;DATE_CREAT;DATE_MAJ;DATE_APP;DATE_CONF;CODE_POST;ID_CH_LIEU;ID_AUT_ADM;POPULATION;geometry
-ARR_MUNI0000000009736540;75115;75056;Paris 15e Arrondissement;2006-08-02 08:36:54;2021-01-06 10:08:45;;;75015;PAIHABIT0000000000148294;SURFACTI0000000000143181;232144;POLYGON ((649855.9 6860974.6, 649856.6 6860973.6, 649865.8 6860960.2, 649875.5 6860949.1, 649940.6 6860897.1, 649967 6860875.8, 649983.1 6860863.2, 650010.4 6860841.1, 650032.9 6860823.6, 650087.7 6860783.8, 650104.3 6860776, 650135.9 6860761.3, 650189.4 6860733.9, 650307.8 6860672.7, 650328.8 6860662.2, 650341.4 6860656, 650365 6860644, 650409.6 6860621.3, 650434.7 6860609.1, 650405.2 6860569.4, 650394.5 6860557.8, 650323.3 6860472.4, 650294.1 6860437.2, 650286.9 6860428, 650280.1 6860419.3, 650276.5 6860414.2, 650229.2 6860359.9, 650210.8 6860337.4, 650205.3 6860330.5, 650204 6860328.9, 650201.8 6860323.9, 650200.2 6860319.8, 650199.5 6860315.7, 650211.4 6860271.7, 650220.4 6860238.1, 650225.2 6860220.4, 650225.5 6860219.2, 650222 6860215.6, 650214.3 6860206.9, 650192.7 6860183.7, 650174.2 6860198.4, 650161.1 6860208.6, 650145.1 6860220.8, 650082.1 6860269.4, 650072.9 6860257.6, 650042.8 6860219.6, 649990.3 6860152.2, 649977.6 6860136.2, 649955.2 6860108, 649942.6 6860092.1, 649927.6 6860073.6, 649924.5 6860069.9, 649915.6 6860059.1, 649911.7 6860054.3, 649897.2 6860036.8, 649888.2 6860026, 649871.5 6860005.9, 649871.3 6860005.6, 649860.3 6859992.4, 649854 6859984.9, 649845.9 6859975.1, 649791.1 6859906.4, 649772.8 6859883.5, 649707.6 6859801.6, 649573.6 6859652.5, 649564.5 6859641.7, 649563.6 6859640.7, 649559.7 6859636, 649558.5 6859634.6, 649554.8 6859630.2, 649554.1 6859629.4, 649499.7 6859565.1, 649487 6859550.1, 649406.9 6859453.1, 649398.9 6859443.3, 649391.6 6859434.5, 649318.6 6859347.1, 649136.8 6859125.5, 649132.3 6859113.7, 649124.5 6859093.6, 649121.5 6859086.1, 649073.3 6859027.5, 649067.7 6859020.8, 649052.1 6859001.9, 649046.3 6858994.3, 649039.6 6858985.6, 648985.2 6858915.4, 648958.6 6858882.8, 648952.5 6858875.5, 648947.5 6858869.2, 648943.2 6858863.8, 648902.6 6858814.4, 648704.6 6858567.5, 648621.3 6858596, 648386.6 6858676.9, 648044.2 6858795, 648036.8 6858797.6, 647894 6858893.1, 647833.6 6858932, 647635.5 6859058.1, 647491.4 6859152.7, 647488.8 6859154.5, 647408.7 6859209.6, 647341.9 6859249.9, 647175.4 6859343.3, 647142.8 6859361.6, 647085.8 6859395.6, 647081.9 6859398.2, 647077.6 6859401, 647060.9 6859379.2, 646873.1 6859151.8, 646799.4 6859063.9, 646797.3 6859065.1, 646662.9 6858945.4, 646659.7 6858939.5, 646651.8 6858935.5, 646634.4 6858919.9, 646623.5 6858910.2, 646617.9 6858901.2, 646613.5 6858897.1, 646489.1 6858895.1, 646248.8 6858891.1, 646234.2 6858906, 646216.8 6859302.4, 646387.5 6859448.2, 646408.6 6859465.1, 646405.6 6859469.1, 646275.8 6859623.9, 646253 6859641.6, 646230 6859642.6, 646047.4 6859604.8, 645885.5 6859571.4, 645942.5 6859650.5, 645953.4 6859664.8, 645953.7 6859665.2, 645965.3 6859680.4, 645978.4 6859697.5, 646055.3 6859797.2, 646126.4 6859893.3, 646179.1 6859973.6, 646294.6 6860155.8, 646301.8 6860167.1, 646309.9 6860179.8, 646330.9 6860212.4, 646513.1 6860496.9, 646564.1 6860573.6, 646719.3 6860814.9, 646754.9 6860867.9, 646809.8 6860954.9, 646827.2 6860981.6, 646828.7 6860983.9, 646830.1 6860985.8, 646872.8 6861043.9, 646945 6861139, 646976.7 6861176.1, 647018.6 6861225, 647133.7 6861340.7, 647143.1 6861350.3, 647170.6 6861379.4, 647171.7 6861380.5, 647182.8 6861391.1, 647207.3 6861416.5, 647242.6 6861455, 647247.1 6861460.3, 647255.4 6861468.9, 647376 6861594.9, 647382.4 6861601.4, 647386.6 6861606, 647495.2 6861719.8, 647547.4 6861774.4, 647603.8 6861833.6, 647706.8 6861941.6, 647712.4 6861947.4, 647721.2 6861957.3, 647722.7 6861958.9, 647726.5 6861962.9, 647731.8 6861968.3, 647736.9 6861973.8, 647740.1 6861977.2, 647745.8 6861983, 647752.9 6861991.6, 647763.4 6862004.3, 647773.3 6862023.9, 647786.6 6862092.8, 647796.7 6862122.3, 647829.5 6862174.1, 647873.6 6862236.6, 647884.6 6862250.7, 647937.4 6862210.7, 647953.4 6862197.5, 647973.3 6862180.4, 647981.1 6862173.7, 647982.1 6862172.7, 647994.6 6862160.1, 648047.1 6862109.2, 648120.4 6862035.3, 648200.3 6861957, 648298.3 6861860.5, 648306.7 6861852.4, 648327.7 6861832.2, 648389.6 6861770.8, 648413 6861747.7, 648443.4 6861716.5, 648484.1 6861677, 648513.7 6861646.9, 648575.5 6861585.9, 648583.4 6861578.5, 648653.8 6861508, 648674 6861487.7, 648678 6861483.8, 648681.5 6861480.7, 648700.6 6861464.3, 648723.7 6861451.4, 648784.5 6861391, 648900.6 6861276.7, 648910.2 6861267.5, 648923.6 6861253.9, 648965.9 6861212.1, 649060.9 6861118.4, 649067.8 6861111.9, 649073.9 6861105.5, 649082.1 6861097.1, 649091.3 6861088, 649098 6861081.6, 649169.4 6861010.6, 649233.1 6861043.4, 649275.8 6861059.2, 649330.9 6861078.4, 649382.9 6861095.7, 649388.2 6861097.6, 649400.7 6861102.3, 649448.7 6861055.7, 649454.6 6861049.9, 649455 6861049.5, 649462.7 6861042.1, 649463.4 6861041.3, 649501.1 6861004.6, 649508.2 6860997.7, 649517 6860989.2, 649626.9 6860882.3, 649635.1 6860874.2, 649648.3 6860881, 649654.7 6860883.8, 649674.3 6860892.6, 649756.3 6860931, 649831.4 6860964.3, 649855.9 6860974.6))
-ARR_MUNI0000000009736042;75110;75056;Paris 10e Arrondissement;2006-08-02 08:36:54;2021-01-06 10:08:45;;;75010;PAIHABIT0000000000148230;SURFACTI0000000000142921;88557;POLYGON ((653412 6865115.2, 653452.7 6865110.6, 653455.4 6865110.3, 653530.8 6865103, 653568.1 6865098.9, 653579.6 6865097.6, 653614.1 6865093.8, 653619.6 6865093.2, 653633.8 6865091.8, 653644.3 6865090.7, 653651.2 6865089.9, 653657.2 6865089, 653660.9 6865088.6, 653669.5 6865087, 653673 6865086, 653676.8 6865084.8, 653680 6865083.6, 653683.5 6865082, 653686.3 6865080.7, 653689.3 6865079.5, 653691.8 6865078, 653694.7 6865076, 653697.5 6865073.7, 653702.1 6865069.5, 653702.8 6865068.8, 653705.3 6865066.3, 653705.7 6865065.9, 653713.3 6865057.9, 653720.1 6865045, 653727.1 6865031.8, 653736.2 6865014.3, 653740.5 6865005.8, 653743.7 6865000.7, 653747.5 6864995.4, 653754.9 6864987, 653758.7 6864983.2, 653759.8 6864982.3, 653766.1 6864976.4, 653775.3 6864969, 653778.4 6864966.6, 653781.3 6864963.7, 653785.1 6864960.2, 653788.5 6864957.3, 653790.9 6864954.9, 653794.6 6864950.3, 653798.4 6864945.7, 653800.7 6864942.4, 653804.4 6864936.5, 653808.9 6864928.2, 653810.5 6864925, 653813 6864915.6, 653814.4 6864907.2, 653814.7 6864900.8, 653814.4 6864891.1, 653814.2 6864882.6, 653813.7 6864845.1, 653813.7 6864844.8, 653814.6 6864792.5, 653814.6 6864781.8, 653814.8 6864768.8, 653814.6 6864681.3, 653814.7 6864648.9, 653815.2 6864569.1, 653815.5 6864469.6, 653815.5 6864462, 653815.5 6864455.6, 653815.4 6864443.7, 653815.3 6864403, 653829.2 6864383.7, 653836 6864374.3, 653842.5 6864365.3, 653963.2 6864198.2, 653964.1 6864197, 653999.6 6864147.7, 654033.7 6864100.4, 654050.7 6864076.9, 654104.7 6864002.2, 654123.2 6863976.6, 654160 6863925.7, 654163.7 6863920.6, 654184 6863892.5, 654295.2 6863738.4, 654288.9 6863734.6, 654245 6863710.3, 654233.1 6863704, 654220.2 6863697.6, 654218.4 6863696.7, 654208.5 6863691.6, 654205.3 6863690, 654160.6 6863666.7, 654154 6863663.2, 654130.1 6863650.8, 654128.3 6863649.9, 654109.6 6863640, 654101.4 6863635.4, 654091 6863628.3, 654090.2 6863627.8, 654058.9 6863607.5, 654044.5 6863598.9, 654033.3 6863593.1, 653999.9 6863576.4, 653900.3 6863531.9, 653881.9 6863523.2, 653863.6 6863514.3, 653792.3 6863482.7, 653739.4 6863457.8, 653652.9 6863408.7, 653629.4 6863395.5, 653627.2 6863394.1, 653610.6 6863384.8, 653594.9 6863378.2, 653586.3 6863374.5, 653582 6863372.7, 653570.4 6863368, 653528.8 6863351.9, 653500.8 6863339.2, 653463.9 6863321.2, 653449.3 6863312, 653428.8 6863300.3, 653394.3 6863280.7, 653381.7 6863273.9, 653370.9 6863267.2, 653335.2 6863242.1, 653329 6863247.1, 653328 6863247.8, 653322.7 6863252.1, 653315.7 6863257.7, 653311.5 6863260.9, 653302.6 6863268.1, 653292.8 6863275.8, 653260.4 6863283.7, 653243.9 6863287.7, 653214.1 6863293.7, 653117.3 6863316.4, 653031 6863336.3, 653016.5 6863339.7, 652998.1 6863343.9, 652985 6863347.1, 652955.8 6863354.2, 652916.5 6863363.4, 652795.3 6863392.5, 652770.4 6863399.9, 652758.2 6863403.8, 652741.1 6863409.2, 652740.2 6863409.5, 652729.1 6863413.2, 652717.2 6863417.5, 652697.7 6863425.3, 652682.7 6863430.9, 652644.1 6863444.6, 652631.2 6863448.8, 652597.6 6863460.5, 652579.5 6863467, 652539.5 6863481.3, 652514.8 6863489.9, 652486.6 6863499.7, 652469.9 6863505.5, 652390.2 6863532.2, 652378.6 6863535.9, 652355.1 6863543.3, 652326.9 6863552.8, 652301.2 6863561.3, 652287.9 6863565.7, 652254.2 6863576.9, 652224.5 6863586.3, 652193.8 6863596, 652167.8 6863604.3, 652166.8 6863674.8, 652167 6863751.4, 652166.9 6863756.8, 652166.9 6863802.9, 652167.8 6863868.8, 652168.5 6863909, 652169.6 6863974.7, 652172.5 6864002.6, 652181.6 6864068.9, 652189.9 6864137.4, 652195.1 6864170.9, 652201.5 6864194.2, 652204.6 6864203.9, 652224.3 6864253.7, 652228.1 6864263.5, 652241.4 6864297.8, 652252.8 6864328.6, 652253.1 6864336.4, 652260.3 6864353.2, 652263.3 6864364.2, 652264.4 6864403.9, 652266.4 6864442.1, 652267.8 6864465.7, 652269.1 6864482.1, 652273.2 6864513, 652276.9 6864539.2, 652280.6 6864552.6, 652293.9 6864602.8, 652294.3 6864604.3, 652314.8 6864691.3, 652318.8 6864710.1, 652318 6864760.6, 652308.2 6864906.4, 652308 6864908, 652305.4 6864968.2, 652302.9 6865025.7, 652294.1 6865040.5, 652293.9 6865040.8, 652293.2 6865053, 652297 6865053.6, 652313.5 6865055.9, 652317.6 6865056.5, 652338.3 6865058.4, 652413.3 6865065.7, 652423.7 6865066.8, 652425.8 6865067, 652580.7 6865082.7, 652728.6 6865097.1, 652760.4 6865100.2, 652791.6 6865103.2, 652808.9 6865105, 652818 6865105.9, 652827.8 6865106.9, 652832.2 6865107.4, 652834 6865107.6, 652845 6865108.8, 652846.7 6865108.8, 652853.1 6865109.5, 652855.2 6865109.8, 652857.5 6865110, 652858.4 6865110, 652861.9 6865110.4, 652862.5 6865110.5, 652878.7 6865112.2, 652881.3 6865112.5, 652889.8 6865113.3, 652891.5 6865113.5, 652902.9 6865114.7, 652906.5 6865115, 652912.4 6865115.6, 652914.3 6865115.9, 652917.9 6865116.2, 652919.1 6865116.3, 652924.1 6865116.9, 652927.2 6865117.2, 652933.7 6865117.8, 652938.4 6865118.3, 652941.7 6865118.6, 652945.7 6865119.1, 652984.3 6865122.8, 652988.9 6865123.1, 652994 6865123.2, 653018 6865123.2, 653037.5 6865123.2, 653055.5 6865123.1, 653059.3 6865123, 653134.3 6865121.8, 653175.9 6865121.6, 653176.4 6865121.6, 653219.4 6865121, 653249.3 6865120.7, 653254.4 6865120.6, 653262.4 6865120.4, 653274.7 6865120.1, 653276 6865120.1, 653288.4 6865119.8, 653296.9 6865119.7, 653307.1 6865119.5, 653309.9 6865119.4, 653317.5 6865119.3, 653344 6865119.1, 653360.7 6865118.7, 653380.1 6865118.1, 653392.6 6865117.3, 653412 6865115.2))
-ARR_MUNI0000000009736043;75109;75056;Paris 9e Arrondissement;2006-08-02 08:36:54;2021-01-06 10:08:45;;;75009;PAIHABIT0000000000148231;SURFACTI0000000000142929;59835;POLYGON ((650550.8 6863494.3, 650557.4 6863551.2, 650566.5 6863603.9, 650603.6 6863810.9, 650606.9 6863829.8, 650607.6 6863838.1, 650606.6 6863840.8, 650604.2 6863843.3, 650600.3 6863846.4, 650596.5 6863848.1, 650614.7 6863888.7, 650629.5 6863921.8, 650635.9 6863944.6, 650638.2 6863961.1, 650637.4 6863967.4, 650636.6 6863975.1, 650635.6 6863983.8, 650632.1 6864005.4, 650618.7 6864077.6, 650618.3 6864080.3, 650615.7 6864100.1, 650612.4 6864126, 650611.2 6864136.3, 650611.5 6864146.5, 650613.5 6864157.3, 650616.9 6864163.6, 650624.7 6864181.7, 650627.5 6864193.8, 650629.5 6864228.4, 650633.2 6864331.6, 650633.6 6864339.6, 650637.6 6864413.3, 650637.7 6864420.3, 650639.6 6864509.9, 650642.4 6864607.8, 650642.4 6864610.1, 650642.6 6864613.8, 650646.7 6864701.3, 650647.5 6864741.7, 650649.3 6864794, 650655.6 6864972.4, 650656.7 6865007.3, 650656.9 6865008.9, 650656.8 6865011.3, 650657.6 6865036.7, 650670.4 6865040.6, 650676.6 6865042.4, 650686.4 6865045.3, 650700.1 6865049.3, 650709.8 6865052.2, 650728 6865064.1, 650752.3 6865087, 650832.9 6865161.4, 650840 6865157.9, 650933.3 6865117.6, 651019.7 6865085.1, 651034.8 6865079.4, 651044.5 6865075.8, 651047.9 6865074.6, 651055.8 6865070.9, 651066.9 6865065.9, 651080.3 6865059.8, 651227 6864993.3, 651312.9 6864954.2, 651375 6864925.9, 651389.9 6864919.3, 651407.2 6864911.5, 651422.1 6864907.9, 651434.5 6864904.9, 651436.5 6864904.5, 651443.5 6864902.8, 651564.6 6864874.1, 651578.7 6864870.7, 651583 6864869.7, 651741.6 6864915.2, 651807.1 6864934, 651883.9 6864956.1, 651927.6 6864968.7, 652088.5 6865015.1, 652105.5 6865020, 652117.2 6865021.9, 652129.9 6865023.9, 652152.6 6865028, 652251.3 6865045.9, 652256.9 6865046.9, 652279.5 6865050.9, 652293.2 6865053, 652293.9 6865040.8, 652294.1 6865040.5, 652302.9 6865025.7, 652305.4 6864968.2, 652308 6864908, 652308.2 6864906.4, 652318 6864760.6, 652318.8 6864710.1, 652314.8 6864691.3, 652294.3 6864604.3, 652293.9 6864602.8, 652280.6 6864552.6, 652276.9 6864539.2, 652273.2 6864513, 652269.1 6864482.1, 652267.8 6864465.7, 652266.4 6864442.1, 652264.4 6864403.9, 652263.3 6864364.2, 652260.3 6864353.2, 652253.1 6864336.4, 652252.8 6864328.6, 652241.4 6864297.8, 652228.1 6864263.5, 652224.3 6864253.7, 652204.6 6864203.9, 652201.5 6864194.2, 652195.1 6864170.9, 652189.9 6864137.4, 652181.6 6864068.9, 652172.5 6864002.6, 652169.6 6863974.7, 652168.5 6863909, 652167.8 6863868.8, 652166.9 6863802.9, 652166.9 6863756.8, 652167 6863751.4, 652166.8 6863674.8, 652167.8 6863604.3, 652102.7 6863620.2, 652081.3 6863625.9, 652027.2 6863639.5, 652007.3 6863645, 651835.8 6863689.5, 651811.5 6863695.9, 651725.5 6863718.2, 651706.9 6863723.2, 651591.2 6863751.9, 651560.7 6863744.6, 651517.5 6863734.3, 651464.1 6863721.8, 651444.1 6863716.9, 651422.4 6863711.5, 651376.7 6863700.1, 651374.7 6863699.6, 651367.4 6863697.7, 651356.4 6863694.9, 651288.8 6863678.1, 651203.2 6863654.9, 651190.6 6863651.8, 651158.5 6863643.9, 651038.5 6863614.2, 651005.9 6863607.1, 650856.1 6863569.5, 650851.1 6863568.3, 650787.8 6863551.4, 650780.1 6863549.4, 650706 6863531.3, 650599 6863506.2, 650550.8 6863494.3))
-ARR_MUNI0000000009736542;75107;75056;Paris 7e Arrondissement;2006-08-02 08:36:54;2021-01-06 10:08:45;;;75007;PAIHABIT0000000000148268;SURFACTI0000002203142180;50196;POLYGON ((648773.3 6862833.6, 648773.8 6862834.3, 648817 6862836.5, 649112.7 6862838.5, 649349.5 6862840.1, 649408.2 6862840.5, 649553.9 6862841.5, 649619.2 6862843.8, 649639.6 6862844.6, 649660.3 6862845.3, 649779.3 6862849.5, 650016.3 6862848, 650085.9 6862814.3, 650181.1 6862768.3, 650257 6862731.7, 650494.3 6862616.9, 650544.3 6862592.7, 650696 6862519.4, 650833.2 6862444.5, 650835.1 6862443.5, 650838.1 6862441.7, 650841.2 6862440.1, 650842.8 6862439.3, 650932 6862390.5, 651056.7 6862351.2, 651034.4 6862292.2, 651033.3 6862289.3, 651021.9 6862262, 651049.1 6862249.4, 651081.7 6862234.8, 651042.2 6862160.3, 651007.6 6862096.8, 650962.2 6862016.1, 650938.4 6861970.2, 650895.4 6861882.9, 650892.5 6861876.7, 650872.2 6861812.1, 650866.8 6861799.5, 650828.2 6861708.5, 650815.3 6861677.4, 650808.9 6861661.5, 650799.9 6861639.2, 650792.2 6861619, 650787.7 6861608.8, 650737.5 6861544.4, 650736.2 6861541.1, 650737.2 6861523.5, 650679 6861511, 650635.5 6861501.7, 650601.7 6861492.8, 650605.4 6861472.1, 650606.1 6861468.4, 650599.1 6861463.6, 650586.2 6861455.5, 650520.7 6861415.3, 650487.4 6861394.3, 650439.6 6861364.7, 650405.8 6861344.8, 650394.6 6861336.8, 650341.2 6861299.1, 650315.9 6861281.5, 650253.6 6861234.2, 650238.7 6861222.9, 650155.8 6861158.5, 650139.4 6861145.8, 650112.5 6861124.9, 650080 6861100.9, 650064.5 6861089.6, 650055.6 6861083.5, 650031.2 6861069.5, 649965.8 6861032.7, 649890.8 6860991.5, 649872.8 6860982, 649855.9 6860974.6, 649831.4 6860964.3, 649756.3 6860931, 649674.3 6860892.6, 649654.7 6860883.8, 649648.3 6860881, 649635.1 6860874.2, 649626.9 6860882.3, 649517 6860989.2, 649508.2 6860997.7, 649501.1 6861004.6, 649463.4 6861041.3, 649462.7 6861042.1, 649455 6861049.5, 649454.6 6861049.9, 649448.7 6861055.7, 649400.7 6861102.3, 649388.2 6861097.6, 649382.9 6861095.7, 649330.9 6861078.4, 649275.8 6861059.2, 649233.1 6861043.4, 649169.4 6861010.6, 649098 6861081.6, 649091.3 6861088, 649082.1 6861097.1, 649073.9 6861105.5, 649067.8 6861111.9, 649060.9 6861118.4, 648965.9 6861212.1, 648923.6 6861253.9, 648910.2 6861267.5, 648900.6 6861276.7, 648784.5 6861391, 648723.7 6861451.4, 648700.6 6861464.3, 648681.5 6861480.7, 648678 6861483.8, 648674 6861487.7, 648653.8 6861508, 648583.4 6861578.5, 648575.5 6861585.9, 648513.7 6861646.9, 648484.1 6861677, 648443.4 6861716.5, 648413 6861747.7, 648389.6 6861770.8, 648327.7 6861832.2, 648306.7 6861852.4, 648298.3 6861860.5, 648200.3 6861957, 648120.4 6862035.3, 648047.1 6862109.2, 647994.6 6862160.1, 647982.1 6862172.7, 647981.1 6862173.7, 647973.3 6862180.4, 647953.4 6862197.5, 647937.4 6862210.7, 647884.6 6862250.7, 647942.4 6862322.2, 647962.8 6862351.8, 648043.6 6862447.8, 648070.1 6862479.3, 648180.7 6862588.7, 648234.8 6862630, 648267.5 6862657.9, 648311.4 6862684.3, 648415.4 6862739.3, 648465.6 6862763.3, 648542 6862796.5, 648588.6 6862811.6, 648656.3 6862822.4, 648746.5 6862832.8, 648773.3 6862833.6))
-ARR_MUNI0000000009736543;75106;75056;Paris 6e Arrondissement;2006-08-02 08:36:54;2021-01-06 10:08:45;;;75006;PAIHABIT0000000000148284;SURFACTI0000000000143125;40525;POLYGON ((651056.7 6862351.2, 651091.4 6862340.2, 651196.9 6862306.8, 651310.8 6862270.1, 651393.1 6862238.7, 651404.7 6862234.3, 651487 6862161.4, 651615.6 6862050.7, 651630.8 6862034.8, 651633.6 6862031.8, 651636.6 6862028.6, 651673.8 6861989.4, 651702.1 6861945.2, 651756.4 6861874.8, 651787.2 6861844.4, 651873.3 6861782.5, 651911.6 6861760.6, 651893.1 6861735, 651887.6 6861726.9, 651885.4 6861723.9, 651874.2 6861688.3, 651862.6 6861651.4, 651851 6861614.5, 651850.7 6861613.6, 651818.4 6861510.4, 651810.8 6861486.3, 651803 6861461.3, 651798.8 6861450.7, 651792.8 6861434.9, 651789.2 6861424.3, 651772.1 6861377.9, 651761.2 6861345.9, 651697.9 6861187.5, 651693.7 6861176.9, 651688.5 6861164.1, 651673.6 6861127.7, 651661.3 6861096.4, 651650.6 6861069.6, 651642.6 6861049.7, 651640.1 6861043.7, 651627.6 6861012.2, 651611.5 6860971.7, 651600.1 6860942.7, 651582.8 6860896, 651487.5 6860633.9, 651463.8 6860571.7, 651428.7 6860476.5, 651395.4 6860393.4, 651373.7 6860337.1, 651357.9 6860295.9, 651350.2 6860289.8, 651344.8 6860285.8, 651337.8 6860283.2, 651331.3 6860281.7, 651322.2 6860281.8, 651320.3 6860250, 651320.2 6860248.9, 651317.8 6860210.8, 651312.8 6860162.4, 651233 6860201.2, 651181.6 6860227.5, 651141.4 6860248.4, 651090.8 6860273.9, 650923.3 6860358.8, 650814 6860415.3, 650807.6 6860418.6, 650795.2 6860425.1, 650752.3 6860448.2, 650729.3 6860460.6, 650683.6 6860483.7, 650640.6 6860505.3, 650562.1 6860546.1, 650497 6860578.4, 650479.4 6860587.3, 650465.3 6860594.2, 650434.7 6860609.1, 650409.6 6860621.3, 650365 6860644, 650341.4 6860656, 650328.8 6860662.2, 650307.8 6860672.7, 650189.4 6860733.9, 650135.9 6860761.3, 650104.3 6860776, 650087.7 6860783.8, 650032.9 6860823.6, 650010.4 6860841.1, 649983.1 6860863.2, 649967 6860875.8, 649940.6 6860897.1, 649875.5 6860949.1, 649865.8 6860960.2, 649856.6 6860973.6, 649855.9 6860974.6, 649872.8 6860982, 649890.8 6860991.5, 649965.8 6861032.7, 650031.2 6861069.5, 650055.6 6861083.5, 650064.5 6861089.6, 650080 6861100.9, 650112.5 6861124.9, 650139.4 6861145.8, 650155.8 6861158.5, 650238.7 6861222.9, 650253.6 6861234.2, 650315.9 6861281.5, 650341.2 6861299.1, 650394.6 6861336.8, 650405.8 6861344.8, 650439.6 6861364.7, 650487.4 6861394.3, 650520.7 6861415.3, 650586.2 6861455.5, 650599.1 6861463.6, 650606.1 6861468.4, 650605.4 6861472.1, 650601.7 6861492.8, 650635.5 6861501.7, 650679 6861511, 650737.2 6861523.5, 650736.2 6861541.1, 650737.5 6861544.4, 650787.7 6861608.8, 650792.2 6861619, 650799.9 6861639.2, 650808.9 6861661.5, 650815.3 6861677.4, 650828.2 6861708.5, 650866.8 6861799.5, 650872.2 6861812.1, 650892.5 6861876.7, 650895.4 6861882.9, 650938.4 6861970.2, 650962.2 6862016.1, 651007.6 6862096.8, 651042.2 6862160.3, 651081.7 6862234.8, 651049.1 6862249.4, 651021.9 6862262, 651033.3 6862289.3, 651034.4 6862292.2, 651056.7 6862351.2))
-ARR_MUNI0000000009736544;75105;75056;Paris 5e Arrondissement;2006-08-02 08:36:54;2021-01-06 10:08:45;;;75005;PAIHABIT0000000000148276;SURFACTI0000000000143156;58379;POLYGON ((651312.8 6860162.4, 651317.8 6860210.8, 651320.2 6860248.9, 651320.3 6860250, 651322.2 6860281.8, 651331.3 6860281.7, 651337.8 6860283.2, 651344.8 6860285.8, 651350.2 6860289.8, 651357.9 6860295.9, 651373.7 6860337.1, 651395.4 6860393.4, 651428.7 6860476.5, 651463.8 6860571.7, 651487.5 6860633.9, 651582.8 6860896, 651600.1 6860942.7, 651611.5 6860971.7, 651627.6 6861012.2, 651640.1 6861043.7, 651642.6 6861049.7, 651650.6 6861069.6, 651661.3 6861096.4, 651673.6 6861127.7, 651688.5 6861164.1, 651693.7 6861176.9, 651697.9 6861187.5, 651761.2 6861345.9, 651772.1 6861377.9, 651789.2 6861424.3, 651792.8 6861434.9, 651798.8 6861450.7, 651803 6861461.3, 651810.8 6861486.3, 651818.4 6861510.4, 651850.7 6861613.6, 651851 6861614.5, 651862.6 6861651.4, 651874.2 6861688.3, 651885.4 6861723.9, 651887.6 6861726.9, 651893.1 6861735, 651911.6 6861760.6, 651966.6 6861729.1, 652025.9 6861699.8, 652044.1 6861690.9, 652060.6 6861682.7, 652080.6 6861670, 652103.7 6861655.1, 652190.9 6861594.7, 652232.1 6861566.1, 652298.6 6861533.6, 652304.1 6861530.9, 652394.5 6861489.7, 652420.3 6861481.3, 652544.5 6861441.4, 652591.4 6861428.9, 652639.8 6861409.6, 652705.9 6861376.4, 652901.6 6861279.7, 652933.4 6861263.9, 652984.1 6861233.5, 653030.9 6861198.2, 653036.3 6861194, 653111.7 6861135.5, 653199.3 6861052.1, 653216.1 6861033.1, 653358.9 6860870, 653477.6 6860733.6, 653456.8 6860714.9, 653419.6 6860683.4, 653414.4 6860679.1, 653406.6 6860672.5, 653406 6860671.3, 653400.1 6860659.4, 653397 6860653.3, 653394.8 6860648.7, 653394.3 6860647.8, 653391.5 6860642.4, 653389.8 6860639.2, 653365.5 6860594.5, 653361.5 6860587.7, 653354.1 6860573.6, 653334.4 6860536.5, 653327.5 6860522.3, 653319.8 6860505.3, 653311.6 6860488.1, 653294.5 6860454.6, 653290.1 6860445.8, 653285.8 6860437.2, 653275.2 6860415, 653261.5 6860388.3, 653238 6860338.6, 653222.6 6860308.3, 653216.5 6860298.5, 653211.9 6860290, 653198.4 6860262.9, 653188.9 6860244.9, 653171 6860210.8, 653170.9 6860210.6, 653162.3 6860194.4, 653156.5 6860182.8, 653154.4 6860177.2, 653084.8 6860144.9, 653010.9 6860110.7, 652964.2 6860088.4, 652921.2 6860067.8, 652864.5 6860040.7, 652808.6 6860013.9, 652806.5 6860012.9, 652727.8 6859975, 652681.4 6859953.2, 652614.1 6859921.6, 652513.2 6859874.2, 652486.3 6859861.5, 652426.8 6859834.4, 652395.6 6859838.8, 652378.9 6859840.4, 652350.3 6859844.3, 652340.1 6859844.8, 652225.6 6859865.2, 652221.4 6859865.9, 652215.4 6859866.9, 652205.8 6859868.7, 652086.6 6859890.7, 652078.8 6859892.2, 652070.3 6859894.2, 652022.2 6859910.5, 651961.5 6859930.3, 651960.7 6859930.6, 651886.2 6859955, 651847.6 6859967.2, 651765.5 6859993, 651754.3 6859996.5, 651710 6860011.4, 651661.7 6860027.4, 651592 6860050.9, 651562.1 6860061.1, 651535.2 6860070.7, 651535 6860070.8, 651435.6 6860111.3, 651425.1 6860115.7, 651404.7 6860124.2, 651378.3 6860135.1, 651356.8 6860144, 651320.1 6860159.5, 651312.8 6860162.4))
-ARR_MUNI0000000009736541;75114;75056;Paris 14e Arrondissement;2006-08-02 08:36:54;2021-06-21 11:00:40;;;75014;PAIHABIT0000000000148303;SURFACTI0000000000143219;136596;POLYGON ((651710 6860011.4, 651709.7 6860007.2, 651709 6860001.4, 651707.7 6859989.6, 651706.9 6859980.3, 651703.3 6859944.4, 651702 6859931, 651697.7 6859888.5, 651695.7 6859868.6, 651693.6 6859847.7, 651693.1 6859843.1, 651691.2 6859824.5, 651681.7 6859731, 651676.9 6859683.2, 651676.4 6859678.3, 651670.1 6859619.8, 651644.8 6859428.1, 651640.9 6859403.8, 651637.9 6859379.8, 651634.8 6859347.2, 651632.2 6859309.4, 651629.7 6859303.6, 651635.8 6859283.1, 651642.4 6859260.9, 651641.9 6859249.9, 651641.4 6859222.6, 651641.6 6859188.2, 651642.1 6859149.8, 651643.6 6859114.8, 651644.9 6859088, 651648.2 6859020.2, 651651 6858999.7, 651653.9 6858983, 651658.5 6858952.6, 651665.1 6858900.9, 651667.5 6858826.4, 651662.8 6858693.8, 651677.7 6858689, 651676.9 6858685.4, 651673.6 6858670.2, 651671.1 6858660.4, 651661.1 6858561.4, 651662.2 6858543.7, 651657.4 6858486, 651650.5 6858399.8, 651650.6 6858390.4, 651652.5 6858370.6, 651664 6858309.3, 651669.4 6858271, 651674.2 6858253.4, 651690.3 6858211.4, 651692.1 6858206.4, 651713.3 6858157.2, 651723.7 6858135, 651725.2 6858132.7, 651730.7 6858124.1, 651735.9 6858116.9, 651748.1 6858101.5, 651757.7 6858090.3, 651774.5 6858072, 651788.7 6858056.2, 651800.3 6858043.3, 651808 6858034.6, 651814.2 6858026.8, 651820 6858018.1, 651845.3 6857973.5, 651858.5 6857950.2, 651860.8 6857947, 651864.3 6857942.1, 651871.8 6857930.1, 651876.6 6857921.9, 651877.1 6857913.6, 651876.1 6857903.5, 651876 6857903, 651875 6857895.8, 651873.5 6857886.4, 651864.6 6857847.2, 651854.3 6857799.8, 651848.6 6857768.7, 651842.4 6857731.4, 651841 6857722.9, 651838.3 6857699.3, 651838 6857693, 651836.2 6857670.3, 651833.7 6857637.8, 651831.9 6857606.4, 651831.2 6857593.3, 651830.9 6857589.3, 651830.2 6857581.7, 651829.8 6857575.4, 651829.3 6857569.9, 651828.8 6857562.8, 651827.5 6857546.8, 651827.1 6857542.5, 651825.4 6857527.3, 651822.5 6857500.1, 651812.5 6857505.6, 651799.3 6857514.4, 651787.6 6857520.4, 651778.3 6857526, 651768 6857531.5, 651757.5 6857536, 651747.5 6857539.5, 651696.9 6857554.8, 651668.5 6857562.5, 651660.1 6857564.1, 651612.1 6857567.8, 651574.1 6857569.4, 651560 6857571.1, 651503 6857577.1, 651437.1 6857583.1, 651390.3 6857586.9, 651353.8 6857590.6, 651336.6 6857592.1, 651298.1 6857595.8, 651292.5 6857596.3, 651283.8 6857597, 651267.4 6857598.6, 651250.6 6857600.2, 651212.3 6857603.9, 651180.4 6857607.2, 651164.9 6857608.7, 651075.1 6857618, 650960.3 6857642.4, 650949.4 6857644.6, 650942.2 6857645.8, 650984.7 6857782.9, 650834.8 6857835, 650753 6857863.1, 650479.6 6857957, 650475.3 6857958.5, 650362.6 6857996.9, 650194 6858054.5, 650148.5 6858070.3, 650116.1 6858081.6, 649678.2 6858232.2, 649643.8 6858244, 649497.5 6858294, 649458.5 6858307.4, 649273.1 6858370.9, 649219.4 6858389.2, 649217 6858390, 649117.7 6858424, 649110.7 6858426.5, 649048.7 6858448.5, 648970.5 6858476.2, 648906 6858499.1, 648901.3 6858500.7, 648892.8 6858503.8, 648841.5 6858522, 648795.1 6858537.1, 648778.9 6858542.3, 648763.5 6858547.3, 648762 6858547.8, 648744.9 6858553.4, 648704.6 6858567.5, 648902.6 6858814.4, 648943.2 6858863.8, 648947.5 6858869.2, 648952.5 6858875.5, 648958.6 6858882.8, 648985.2 6858915.4, 649039.6 6858985.6, 649046.3 6858994.3, 649052.1 6859001.9, 649067.7 6859020.8, 649073.3 6859027.5, 649121.5 6859086.1, 649124.5 6859093.6, 649132.3 6859113.7, 649136.8 6859125.5, 649318.6 6859347.1, 649391.6 6859434.5, 649398.9 6859443.3, 649406.9 6859453.1, 649487 6859550.1, 649499.7 6859565.1, 649554.1 6859629.4, 649554.8 6859630.2, 649558.5 6859634.6, 649559.7 6859636, 649563.6 6859640.7, 649564.5 6859641.7, 649573.6 6859652.5, 649707.6 6859801.6, 649772.8 6859883.5, 649791.1 6859906.4, 649845.9 6859975.1, 649854 6859984.9, 649860.3 6859992.4, 649871.3 6860005.6, 649871.5 6860005.9, 649888.2 6860026, 649897.2 6860036.8, 649911.7 6860054.3, 649915.6 6860059.1, 649924.5 6860069.9, 649927.6 6860073.6, 649942.6 6860092.1, 649955.2 6860108, 649977.6 6860136.2, 649990.3 6860152.2, 650042.8 6860219.6, 650072.9 6860257.6, 650082.1 6860269.4, 650145.1 6860220.8, 650161.1 6860208.6, 650174.2 6860198.4, 650192.7 6860183.7, 650214.3 6860206.9, 650222 6860215.6, 650225.5 6860219.2, 650225.2 6860220.4, 650220.4 6860238.1, 650211.4 6860271.7, 650199.5 6860315.7, 650200.2 6860319.8, 650201.8 6860323.9, 650204 6860328.9, 650205.3 6860330.5, 650210.8 6860337.4, 650229.2 6860359.9, 650276.5 6860414.2, 650280.1 6860419.3, 650286.9 6860428, 650294.1 6860437.2, 650323.3 6860472.4, 650394.5 6860557.8, 650405.2 6860569.4, 650434.7 6860609.1, 650465.3 6860594.2, 650479.4 6860587.3, 650497 6860578.4, 650562.1 6860546.1, 650640.6 6860505.3, 650683.6 6860483.7, 650729.3 6860460.6, 650752.3 6860448.2, 650795.2 6860425.1, 650807.6 6860418.6, 650814 6860415.3, 650923.3 6860358.8, 651090.8 6860273.9, 651141.4 6860248.4, 651181.6 6860227.5, 651233 6860201.2, 651312.8 6860162.4, 651320.1 6860159.5, 651356.8 6860144, 651378.3 6860135.1, 651404.7 6860124.2, 651425.1 6860115.7, 651435.6 6860111.3, 651535 6860070.8, 651535.2 6860070.7, 651562.1 6860061.1, 651592 6860050.9, 651661.7 6860027.4, 651710 6860011.4))
-ARR_MUNI0000000009736044;75108;75056;Paris 8e Arrondissement;2006-08-02 08:36:54;2021-01-06 10:08:45;;;75008;PAIHABIT0000000000148225;SURFACTI0000000000142902;36222;POLYGON ((650657.6 6865036.7, 650656.8 6865011.3, 650656.9 6865008.9, 650656.7 6865007.3, 650655.6 6864972.4, 650649.3 6864794, 650647.5 6864741.7, 650646.7 6864701.3, 650642.6 6864613.8, 650642.4 6864610.1, 650642.4 6864607.8, 650639.6 6864509.9, 650637.7 6864420.3, 650637.6 6864413.3, 650633.6 6864339.6, 650633.2 6864331.6, 650629.5 6864228.4, 650627.5 6864193.8, 650624.7 6864181.7, 650616.9 6864163.6, 650613.5 6864157.3, 650611.5 6864146.5, 650611.2 6864136.3, 650612.4 6864126, 650615.7 6864100.1, 650618.3 6864080.3, 650618.7 6864077.6, 650632.1 6864005.4, 650635.6 6863983.8, 650636.6 6863975.1, 650637.4 6863967.4, 650638.2 6863961.1, 650635.9 6863944.6, 650629.5 6863921.8, 650614.7 6863888.7, 650596.5 6863848.1, 650600.3 6863846.4, 650604.2 6863843.3, 650606.6 6863840.8, 650607.6 6863838.1, 650606.9 6863829.8, 650603.6 6863810.9, 650566.5 6863603.9, 650557.4 6863551.2, 650550.8 6863494.3, 650536.5 6863491, 650509.6 6863483.5, 650497.3 6863478.5, 650508.5 6863431.9, 650453.6 6863314.2, 650379.2 6863156.8, 650376.3 6863150.7, 650370.5 6863139.4, 650363.4 6863125.4, 650359.9 6863117.7, 650304.1 6863008.4, 650295.5 6862992.8, 650288 6862979.1, 650230.4 6862868.5, 650221 6862849.5, 650219.4 6862846.4, 650216.2 6862839.8, 650212.2 6862831.5, 650210.6 6862828.3, 650181.1 6862768.3, 650085.9 6862814.3, 650016.3 6862848, 649779.3 6862849.5, 649660.3 6862845.3, 649639.6 6862844.6, 649619.2 6862843.8, 649553.9 6862841.5, 649408.2 6862840.5, 649349.5 6862840.1, 649112.7 6862838.5, 648817 6862836.5, 648773.8 6862834.3, 648773.3 6862833.6, 648768.5 6862911.4, 648768 6862919.2, 648767.6 6862927.2, 648766.8 6862944.3, 648749.3 6862954.8, 648719.8 6862972.5, 648708 6862979.4, 648680.9 6862996.3, 648669.2 6863002.6, 648653.2 6863001.3, 648635.7 6863000.6, 648636.4 6863018.1, 648637 6863031.1, 648636 6863061.8, 648632.2 6863080.2, 648631.8 6863082.8, 648623.4 6863126.4, 648614.9 6863171, 648613.2 6863180.5, 648610.3 6863195.9, 648598.3 6863257.9, 648595 6863275.3, 648586 6863320.5, 648575.5 6863372.9, 648570.6 6863395.7, 648567.8 6863407.9, 648564.6 6863415.9, 648525.9 6863517.3, 648524.2 6863521.7, 648522.7 6863525.7, 648521.4 6863529, 648506.3 6863568.5, 648474.5 6863651.9, 648469.9 6863663.9, 648460.4 6863682.9, 648456.9 6863689.5, 648453.1 6863696.5, 648449.4 6863703.4, 648386.8 6863818.7, 648376.7 6863837.7, 648355 6863879.3, 648354.7 6863880.3, 648340.9 6863905.7, 648328.6 6863928.1, 648299.1 6863969.6, 648291.6 6863980.7, 648301.3 6864001, 648303.6 6864005.8, 648305.4 6864009.6, 648311.4 6864022, 648311.9 6864022.9, 648315.4 6864030.6, 648320 6864039.5, 648330.8 6864062.6, 648343.9 6864088.4, 648365.7 6864131.3, 648376.3 6864153, 648379.2 6864158.9, 648382.3 6864165.4, 648404.7 6864211, 648408.2 6864218.1, 648428.4 6864259.6, 648430.5 6864263.9, 648451.8 6864307.3, 648501.1 6864408.2, 648506.5 6864420.5, 648512.4 6864431.9, 648515.1 6864437, 648524.9 6864457.2, 648554.2 6864466.9, 648583.9 6864476.2, 648707 6864515.2, 648722.2 6864520.1, 648732.5 6864523.3, 648790.3 6864541.5, 648839.5 6864557, 648891.7 6864573.3, 648895.6 6864574.6, 649027.8 6864616.1, 649060.3 6864626.8, 649184.4 6864666, 649268.8 6864693.4, 649282.6 6864698, 649294.1 6864702.2, 649306.3 6864707.8, 649313.4 6864712.4, 649328.7 6864715.6, 649332.9 6864716.5, 649343.7 6864718.4, 649356.2 6864719.5, 649368.7 6864720.2, 649383.8 6864721.3, 649409.3 6864726.3, 649522.1 6864745.4, 649557.6 6864751.5, 649583.4 6864756.4, 649624.2 6864763, 649700.3 6864775.7, 649703 6864776.2, 649757.7 6864785.6, 649771.9 6864787.6, 649787.9 6864790.4, 649805.5 6864793.8, 649872 6864808.4, 650040.3 6864853.2, 650163.8 6864889.9, 650167.1 6864890.9, 650167.6 6864891.1, 650172.6 6864892.6, 650173.9 6864892.9, 650179.6 6864894.6, 650186.2 6864896.6, 650192.7 6864898.6, 650199.6 6864900.6, 650205.6 6864902.4, 650206.4 6864902.7, 650374.9 6864952.7, 650438.7 6864971.7, 650439.5 6864971.9, 650445 6864973.5, 650526.7 6864997.8, 650624.1 6865026.8, 650634.2 6865029.8, 650640.5 6865031.6, 650650.5 6865034.7, 650657.6 6865036.7))
-ARR_MUNI0000000009736545;75104;75056;Paris 4e Arrondissement;2006-08-02 08:36:54;2021-01-06 10:08:45;;;75004;PAIHABIT0000000000148249;SURFACTI0000000000143051;28763;POLYGON ((653663.6 6861937.2, 653680.4 6861827.1, 653693.7 6861740.8, 653696.7 6861719.7, 653704.6 6861664.6, 653705.2 6861660.9, 653706.4 6861652.4, 653707.7 6861643.4, 653705 6861635.1, 653701.5 6861624.2, 653696.3 6861607.8, 653691.9 6861594.1, 653688.8 6861584.5, 653671.1 6861529.6, 653670.3 6861527.2, 653669.2 6861523.6, 653667.8 6861519.3, 653667.3 6861517.7, 653667.1 6861517, 653666.2 6861514.2, 653664.6 6861509.3, 653664.2 6861508.3, 653620.8 6861373.2, 653619.4 6861368.7, 653568.2 6861201.9, 653549 6861139.5, 653543.2 6861120.4, 653539.8 6861109.1, 653530.7 6861079.7, 653506.6 6861001, 653505.8 6860993.8, 653490.7 6860981.2, 653490.2 6860980.7, 653484.7 6860976, 653476.9 6860969.4, 653476.1 6860968.8, 653475.5 6860968.3, 653458 6860953.5, 653454.4 6860950.4, 653453.8 6860949.9, 653444.7 6860942.3, 653444.1 6860941.8, 653436.6 6860935.5, 653436.3 6860935.2, 653431.6 6860931.2, 653428.3 6860928.6, 653427.2 6860927.6, 653421.3 6860922.5, 653420.2 6860921.6, 653358.9 6860870, 653216.1 6861033.1, 653199.3 6861052.1, 653111.7 6861135.5, 653036.3 6861194, 653030.9 6861198.2, 652984.1 6861233.5, 652933.4 6861263.9, 652901.6 6861279.7, 652705.9 6861376.4, 652639.8 6861409.6, 652591.4 6861428.9, 652544.5 6861441.4, 652420.3 6861481.3, 652394.5 6861489.7, 652304.1 6861530.9, 652298.6 6861533.6, 652232.1 6861566.1, 652190.9 6861594.7, 652103.7 6861655.1, 652080.6 6861670, 652060.6 6861682.7, 652044.1 6861690.9, 652025.9 6861699.8, 651966.6 6861729.1, 651911.6 6861760.6, 651927.1 6861781.9, 651932 6861789.1, 651932.7 6861790.2, 652000.9 6861889.8, 652003.8 6861895.2, 652010.5 6861907.9, 652016.9 6861920.6, 652048.7 6861993.1, 652052.1 6862002, 652072.1 6862050.8, 652090.4 6862095.3, 652093.3 6862102.5, 652096.5 6862109.6, 652112.2 6862102.8, 652126.1 6862116.2, 652130.3 6862122.4, 652146.1 6862163.4, 652151.1 6862176.8, 652163 6862208.4, 652175.5 6862241.6, 652179 6862250.8, 652181.1 6862256.6, 652188 6862274.8, 652221.3 6862363.3, 652244 6862423.6, 652265.2 6862478.8, 652290.7 6862546.9, 652293.6 6862554.6, 652324.6 6862635.3, 652377.3 6862616.1, 652433.4 6862596.3, 652440 6862594, 652463.3 6862585.6, 652500.6 6862572.1, 652557.8 6862551.3, 652568.6 6862547.4, 652688.9 6862486.3, 652773.9 6862443, 652805.5 6862426.9, 652814.4 6862419.8, 652825.5 6862411, 652845.2 6862389, 652901.5 6862322.8, 652917.2 6862304.4, 652953.1 6862262.2, 652961.8 6862254.4, 652994.8 6862224.4, 652996.4 6862223, 653090.8 6862155.4, 653098.8 6862149.7, 653171.6 6862101.1, 653251.5 6862062.3, 653357.7 6862012.2, 653366.2 6862008.9, 653386.5 6862001.5, 653403.6 6861995, 653463.9 6861981.1, 653525.5 6861966.9, 653544.7 6861962.6, 653578.6 6861953.1, 653648 6861935.1, 653663.6 6861937.2))
-ARR_MUNI0000000009736047;75101;75056;Paris 1er Arrondissement;2006-08-02 08:36:54;2021-01-06 10:08:45;;;75001;PAIHABIT0000000000148249;SURFACTI0000000000143023;16093;POLYGON ((651911.6 6861760.6, 651873.3 6861782.5, 651787.2 6861844.4, 651756.4 6861874.8, 651702.1 6861945.2, 651673.8 6861989.4, 651636.6 6862028.6, 651633.6 6862031.8, 651630.8 6862034.8, 651615.6 6862050.7, 651487 6862161.4, 651404.7 6862234.3, 651393.1 6862238.7, 651310.8 6862270.1, 651196.9 6862306.8, 651091.4 6862340.2, 651056.7 6862351.2, 650932 6862390.5, 650842.8 6862439.3, 650841.2 6862440.1, 650838.1 6862441.7, 650835.1 6862443.5, 650833.2 6862444.5, 650696 6862519.4, 650544.3 6862592.7, 650494.3 6862616.9, 650257 6862731.7, 650181.1 6862768.3, 650210.6 6862828.3, 650212.2 6862831.5, 650216.2 6862839.8, 650219.4 6862846.4, 650221 6862849.5, 650230.4 6862868.5, 650288 6862979.1, 650295.5 6862992.8, 650304.1 6863008.4, 650359.9 6863117.7, 650363.4 6863125.4, 650370.5 6863139.4, 650376.3 6863150.7, 650379.2 6863156.8, 650453.6 6863314.2, 650508.5 6863431.9, 650497.3 6863478.5, 650509.6 6863483.5, 650536.5 6863491, 650550.8 6863494.3, 650599 6863506.2, 650706 6863531.3, 650718.1 6863518.9, 650724.3 6863512.3, 650808.6 6863417.1, 650859.2 6863361.9, 650872.1 6863351.6, 650882.4 6863345.1, 650928.3 6863327, 650977.6 6863310.1, 651018.8 6863295.1, 651119 6863259.3, 651188 6863233.6, 651224.5 6863220, 651234.8 6863216.2, 651280.9 6863199.3, 651318.5 6863186.3, 651331 6863181.9, 651391 6863161.2, 651485.3 6863126.1, 651514.4 6863115.2, 651529 6863109.8, 651541.6 6863105.1, 651561.7 6863097.8, 651565.3 6863096.4, 651616.2 6863078.7, 651637.3 6863071.2, 651647.5 6863067.7, 651658.8 6863063.4, 651662.5 6863061.9, 651670.6 6863058.7, 651680.5 6863054.8, 651688.7 6863051.4, 651701 6863046.6, 651741.2 6863030.9, 651769.9 6863019.9, 651808.1 6863006.5, 651879.4 6862979.6, 651946.5 6862954.2, 651947.7 6862953.8, 651954.9 6862951.2, 651958.1 6862949.9, 651967.4 6862946.5, 651976.9 6862943.1, 652071.4 6862908.3, 652138.8 6862882.8, 652197 6862861.5, 652242.2 6862844.3, 652314 6862818.5, 652377.9 6862794.6, 652383.9 6862792.3, 652364.5 6862739.4, 652345.4 6862689.3, 652326.4 6862640, 652324.6 6862635.3, 652293.6 6862554.6, 652290.7 6862546.9, 652265.2 6862478.8, 652244 6862423.6, 652221.3 6862363.3, 652188 6862274.8, 652181.1 6862256.6, 652179 6862250.8, 652175.5 6862241.6, 652163 6862208.4, 652151.1 6862176.8, 652146.1 6862163.4, 652130.3 6862122.4, 652126.1 6862116.2, 652112.2 6862102.8, 652096.5 6862109.6, 652093.3 6862102.5, 652090.4 6862095.3, 652072.1 6862050.8, 652052.1 6862002, 652048.7 6861993.1, 652016.9 6861920.6, 652010.5 6861907.9, 652003.8 6861895.2, 652000.9 6861889.8, 651932.7 6861790.2, 651932 6861789.1, 651927.1 6861781.9, 651911.6 6861760.6))
-ARR_MUNI0000000009736033;75120;75056;Paris 20e Arrondissement;2006-08-02 08:36:54;2021-01-06 10:08:45;;;75020;PAIHABIT0000000000148247;SURFACTI0000000000142982;195600;POLYGON ((657169.1 6861179.5, 657169.3 6861120.1, 657148.5 6860960, 657144.1 6860924.3, 657140.8 6860897.4, 657139.8 6860889.4, 657131.4 6860890.3, 657110.1 6860893.3, 657090.1 6860896.2, 657083.2 6860897.1, 657081.3 6860897.4, 657059.4 6860900.5, 657054 6860901.2, 657053.5 6860901.3, 657046.8 6860902.1, 657043.8 6860902.5, 657033.9 6860904.1, 657029.6 6860904.6, 657024 6860905.3, 657021.1 6860905.8, 657014.1 6860906.8, 657011.6 6860907.2, 657006.7 6860907.8, 657003 6860908.3, 656995 6860909.5, 656993.9 6860909.6, 656991.2 6860910, 656984.1 6860911, 656982.9 6860911.1, 656978.8 6860911.6, 656967.8 6860913.2, 656930.1 6860918.5, 656918.1 6860920.4, 656859.3 6860929.6, 656808 6860937.8, 656780.4 6860939.2, 656779.5 6860939.2, 656760.3 6860942.1, 656742.8 6860944.6, 656682.7 6860953.4, 656654.4 6860957.3, 656622.3 6860961.5, 656533.6 6860973.3, 656452.9 6860984.1, 656440.8 6860986, 656430.5 6860987.2, 656423.3 6860988.1, 656419.7 6860988.5, 656222.4 6861016.9, 655904.5 6861062.7, 655909.1 6861096, 655914.2 6861136.8, 655914.4 6861148, 655914.4 6861148.5, 655912 6861157.2, 655892 6861250.6, 655879.6 6861312, 655878.1 6861317.9, 655861.9 6861392.2, 655857.4 6861410, 655853.9 6861419.3, 655853.2 6861421.2, 655758.8 6861607.9, 655758.4 6861608.7, 655681.7 6861757.5, 655561.2 6862001.8, 655500.5 6862051.5, 655426.5 6862112.2, 655409.1 6862126.4, 655405.1 6862128.9, 655402.4 6862130.6, 655249.4 6862200.8, 655243.8 6862203.3, 655235.3 6862207, 655230.7 6862208.9, 655222.3 6862212.4, 655216.4 6862216.6, 655212.8 6862219.9, 655210.8 6862222.5, 655210.1 6862223.4, 655206.4 6862230.4, 655204.5 6862237.9, 655202.9 6862243.8, 655173.8 6862337.5, 655163 6862371.5, 655161.1 6862377.5, 655122.5 6862502.3, 655109.6 6862544.6, 655060.1 6862704.6, 655055.5 6862715, 655052.4 6862721.9, 655042.7 6862736, 654960.2 6862849.8, 654896.9 6862933.6, 654875.9 6862962.7, 654860.4 6862983.9, 654832.7 6863021.9, 654804 6863060, 654783.4 6863087.4, 654780.1 6863091.7, 654769.8 6863112, 654758.8 6863136.4, 654748.4 6863163.7, 654743 6863177.4, 654742.4 6863178.9, 654735.9 6863193.4, 654692 6863244.4, 654636.7 6863308.7, 654565 6863391.4, 654561.8 6863395.2, 654559 6863398.5, 654461.5 6863516.3, 654395.7 6863596, 654363.9 6863637.6, 654303 6863727.4, 654295.2 6863738.4, 654305.1 6863745.1, 654316 6863751.8, 654335 6863760.2, 654349.1 6863766.1, 654383 6863778.8, 654413 6863790.2, 654416.3 6863791.6, 654427 6863795.8, 654438.2 6863800.1, 654443.7 6863802.2, 654466.2 6863811.2, 654510.8 6863826.5, 654563.7 6863840.9, 654663.4 6863871.1, 654704.3 6863882.4, 654714.1 6863885.1, 654719.3 6863886.5, 654745.6 6863892.6, 654749.8 6863893.6, 654755.5 6863894.8, 654835 6863909.6, 654852 6863913.4, 654868.6 6863917.5, 654878.4 6863920.3, 654887.6 6863923.6, 654894.7 6863927.4, 654918.9 6863943.3, 654919.1 6863943.4, 654935.5 6863956.7, 654941.5 6863961.4, 654985.5 6863994.4, 655000.5 6864003.4, 655017.9 6864013.3, 655024.2 6864016.6, 655030.5 6864019.3, 655039.9 6864021, 655071.1 6864023.3, 655094.8 6864025.7, 655098.3 6864025.9, 655129.8 6864028.5, 655147.8 6864033.8, 655179.3 6864053, 655205.8 6864072.4, 655232.5 6864093, 655292.2 6864107.7, 655356.5 6864109.4, 655360.2 6864109.4, 655410.4 6864109.2, 655412.8 6864109.2, 655419.5 6864109.3, 655424.6 6864109.3, 655430.2 6864108.4, 655448.4 6864104.9, 655454.1 6864103.7, 655494.6 6864097.5, 655518.8 6864094.6, 655549 6864091.8, 655607 6864086.3, 655641.6 6864083.8, 655643.6 6864083.7, 655652.2 6864084.4, 655676.1 6864087.2, 655813.1 6864103.4, 655819.6 6864104.1, 655839.7 6864106.1, 655880.7 6864106.6, 655907.1 6864107.4, 655916.3 6864108.7, 655934.1 6864113.9, 656179.8 6864162.8, 656180.5 6864163.1, 656260 6864196.9, 656266.9 6864200, 656315.2 6864221.3, 656332.8 6864229.4, 656369 6864246.6, 656378.1 6864250.8, 656434.3 6864274, 656445.5 6864278.6, 656476.3 6864284.9, 656496.2 6864292.4, 656542.4 6864318.3, 656549.6 6864322, 656556.5 6864325.5, 656563.8 6864329.2, 656570.8 6864332.6, 656575.8 6864335.1, 656587.6 6864341.1, 656600.2 6864346.5, 656609.5 6864350.8, 656616.4 6864354, 656625 6864357.9, 656633.7 6864362, 656642.6 6864366.1, 656664.7 6864376.5, 656678.5 6864382.9, 656685.4 6864386.1, 656690.3 6864388.6, 656694.9 6864390.5, 656722.3 6864404.6, 656779.5 6864427.5, 656783.8 6864428.5, 656788.2 6864429.6, 656848.1 6864316.8, 656888.6 6864240.5, 656906.3 6864207.1, 656921.5 6864126.1, 656925.1 6864106.3, 656932.2 6864068.8, 656940.7 6864023.3, 656955.4 6863945, 656975.3 6863839.3, 656990.5 6863761.1, 656990.7 6863757.3, 656991.3 6863747.6, 656991.4 6863743.2, 656993.4 6863702.4, 656993.9 6863696.9, 656994.3 6863692.3, 656995.2 6863663.2, 656999.6 6863588.7, 657001.3 6863572.7, 657002.6 6863548.4, 657002.9 6863544.5, 657004.9 6863502.8, 657008.2 6863451.5, 657008.7 6863445, 657009.1 6863439.3, 657009.1 6863438, 657008.9 6863430.8, 657009.4 6863422.8, 657010.6 6863402.7, 657009.5 6863213.3, 657010.7 6863166.6, 657011.4 6863135.7, 657011.5 6863135.3, 657011.7 6863130.4, 657011.7 6863128.8, 657011.5 6863125.3, 657012.4 6863099.1, 657012.2 6863092.1, 657012.1 6863082.4, 657012.1 6863077.2, 657011.5 6863058.9, 657011.4 6863050, 657009.1 6862976.6, 657008.8 6862954, 657008.5 6862931.4, 657006.5 6862901.9, 657008.8 6862874.4, 657009.4 6862868.1, 657010.6 6862853.3, 657011.2 6862846.9, 657016.2 6862789.5, 657016.9 6862779.6, 657017.7 6862767.8, 657017.9 6862765.5, 657019 6862752.9, 657026.1 6862633.1, 657026 6862631.9, 657027.4 6862611.1, 657033.9 6862449.9, 657037.2 6862404.6, 657056.6 6862233.4, 657057.3 6862227, 657059.2 6862208.2, 657060.1 6862197.8, 657061.8 6862183.4, 657067.8 6862127.3, 657073.4 6862074, 657085 6861953.2, 657085.3 6861950, 657096.6 6861841, 657102.2 6861792, 657102.4 6861789.9, 657105.7 6861765.1, 657107 6861752.9, 657107.4 6861749.7, 657109.7 6861728.3, 657134.9 6861503.4, 657144.8 6861416.1, 657144.9 6861415.3, 657145.6 6861408.2, 657145.9 6861405.6, 657149 6861375.1, 657156.5 6861302.2, 657159.6 6861273.3, 657164 6861233.9, 657164.7 6861226.8, 657165.1 6861223.6, 657165.5 6861220, 657165.6 6861219.1, 657165.8 6861216.9, 657165.8 6861215.2, 657166 6861213.4, 657166.7 6861207.3, 657167 6861204.9, 657167.8 6861197.5, 657168.1 6861194.8, 657169.1 6861179.5))
-ARR_MUNI0000000009736045;75103;75056;Paris 3e Arrondissement;2006-08-02 08:36:54;2021-01-06 10:08:45;;;75003;PAIHABIT0000000000148249;SURFACTI0000000000142987;34020;POLYGON ((652324.6 6862635.3, 652326.4 6862640, 652345.4 6862689.3, 652364.5 6862739.4, 652383.9 6862792.3, 652414.5 6862876.8, 652425.6 6862906, 652459.7 6862996.8, 652502.3 6863106.4, 652535.1 6863194.7, 652542 6863212.7, 652551.8 6863237.9, 652560.2 6863259.8, 652571.6 6863290.6, 652583.3 6863322.1, 652591.5 6863344.2, 652604.5 6863378.4, 652615.1 6863404.7, 652615.8 6863406.7, 652631.2 6863448.8, 652644.1 6863444.6, 652682.7 6863430.9, 652697.7 6863425.3, 652717.2 6863417.5, 652729.1 6863413.2, 652740.2 6863409.5, 652741.1 6863409.2, 652758.2 6863403.8, 652770.4 6863399.9, 652795.3 6863392.5, 652916.5 6863363.4, 652955.8 6863354.2, 652985 6863347.1, 652998.1 6863343.9, 653016.5 6863339.7, 653031 6863336.3, 653117.3 6863316.4, 653214.1 6863293.7, 653243.9 6863287.7, 653260.4 6863283.7, 653292.8 6863275.8, 653302.6 6863268.1, 653311.5 6863260.9, 653315.7 6863257.7, 653322.7 6863252.1, 653328 6863247.8, 653329 6863247.1, 653335.2 6863242.1, 653338.6 6863239.6, 653338.9 6863239.4, 653344.6 6863235.2, 653348 6863232.6, 653352.2 6863229.6, 653355.9 6863226.9, 653364.9 6863220.2, 653366.9 6863218.8, 653382.7 6863172.9, 653390.2 6863152.7, 653401.5 6863118.5, 653406.4 6863100.5, 653408.7 6863091.8, 653422.3 6863056.1, 653430.8 6863034.1, 653439.9 6863011.2, 653447.2 6862993.4, 653461.9 6862954.4, 653473.9 6862923.7, 653477.4 6862914.7, 653515.5 6862817.4, 653537.8 6862760.8, 653542.2 6862746.7, 653545.3 6862726.9, 653552 6862679.6, 653566.6 6862585, 653570.7 6862557.6, 653577.3 6862514.5, 653582.6 6862479, 653592.1 6862415.8, 653602.4 6862346.2, 653606.1 6862321.6, 653617.9 6862244.8, 653633.7 6862137.3, 653645.4 6862063.9, 653663.6 6861937.2, 653648 6861935.1, 653578.6 6861953.1, 653544.7 6861962.6, 653525.5 6861966.9, 653463.9 6861981.1, 653403.6 6861995, 653386.5 6862001.5, 653366.2 6862008.9, 653357.7 6862012.2, 653251.5 6862062.3, 653171.6 6862101.1, 653098.8 6862149.7, 653090.8 6862155.4, 652996.4 6862223, 652994.8 6862224.4, 652961.8 6862254.4, 652953.1 6862262.2, 652917.2 6862304.4, 652901.5 6862322.8, 652845.2 6862389, 652825.5 6862411, 652814.4 6862419.8, 652805.5 6862426.9, 652773.9 6862443, 652688.9 6862486.3, 652568.6 6862547.4, 652557.8 6862551.3, 652500.6 6862572.1, 652463.3 6862585.6, 652440 6862594, 652433.4 6862596.3, 652377.3 6862616.1, 652324.6 6862635.3))
-ARR_MUNI0000000009736034;75119;75056;Paris 19e Arrondissement;2006-08-02 08:36:54;2021-01-06 10:08:45;;;75019;PAIHABIT0000000000148221;SURFACTI0000000000142822;185513;POLYGON ((654295.2 6863738.4, 654184 6863892.5, 654163.7 6863920.6, 654160 6863925.7, 654123.2 6863976.6, 654104.7 6864002.2, 654050.7 6864076.9, 654033.7 6864100.4, 653999.6 6864147.7, 653964.1 6864197, 653963.2 6864198.2, 653842.5 6864365.3, 653836 6864374.3, 653829.2 6864383.7, 653815.3 6864403, 653815.4 6864443.7, 653815.5 6864455.6, 653815.5 6864462, 653815.5 6864469.6, 653815.2 6864569.1, 653814.7 6864648.9, 653814.6 6864681.3, 653814.8 6864768.8, 653814.6 6864781.8, 653814.6 6864792.5, 653813.7 6864844.8, 653813.7 6864845.1, 653814.2 6864882.6, 653814.4 6864891.1, 653814.7 6864900.8, 653814.4 6864907.2, 653813 6864915.6, 653810.5 6864925, 653808.9 6864928.2, 653804.4 6864936.5, 653800.7 6864942.4, 653798.4 6864945.7, 653794.6 6864950.3, 653790.9 6864954.9, 653788.5 6864957.3, 653785.1 6864960.2, 653781.3 6864963.7, 653778.4 6864966.6, 653775.3 6864969, 653766.1 6864976.4, 653759.8 6864982.3, 653758.7 6864983.2, 653754.9 6864987, 653747.5 6864995.4, 653743.7 6865000.7, 653740.5 6865005.8, 653736.2 6865014.3, 653727.1 6865031.8, 653720.1 6865045, 653713.3 6865057.9, 653705.7 6865065.9, 653705.3 6865066.3, 653702.8 6865068.8, 653702.1 6865069.5, 653697.5 6865073.7, 653694.7 6865076, 653691.8 6865078, 653689.3 6865079.5, 653686.3 6865080.7, 653683.5 6865082, 653680 6865083.6, 653676.8 6865084.8, 653673 6865086, 653669.5 6865087, 653660.9 6865088.6, 653657.2 6865089, 653651.2 6865089.9, 653644.3 6865090.7, 653633.8 6865091.8, 653619.6 6865093.2, 653614.1 6865093.8, 653579.6 6865097.6, 653568.1 6865098.9, 653530.8 6865103, 653455.4 6865110.3, 653452.7 6865110.6, 653412 6865115.2, 653418.5 6865127.7, 653468.2 6865206.4, 653469.7 6865208.5, 653493.3 6865245.5, 653548.7 6865338.8, 653559.9 6865358.3, 653564.3 6865367.3, 653570.6 6865390.2, 653586.7 6865443.6, 653592.2 6865461.8, 653598.6 6865487.6, 653601.8 6865502.4, 653606.9 6865521.8, 653613.4 6865544.5, 653624.6 6865587, 653632.8 6865612.4, 653648 6865658.9, 653661 6865696.1, 653664 6865700.9, 653666.8 6865705.6, 653667.1 6865706.4, 653668 6865709.4, 653713.1 6865853.7, 653719.1 6865874.6, 653744.7 6865962.5, 653745.4 6865965, 653747.2 6865971, 653749 6865977.1, 653773.6 6866062, 653798.6 6866141.8, 653809.1 6866179.1, 653810.8 6866183.9, 653820.3 6866203.4, 653840.8 6866239, 653842.2 6866241.7, 653845.4 6866247.9, 653855.7 6866261.2, 653940.8 6866337.2, 653908.3 6866375.8, 653902.7 6866382.5, 653902.8 6866387.8, 653899.7 6866397.1, 653896.2 6866404.4, 653844.3 6866469.4, 653842.6 6866473.6, 653841.4 6866478.7, 653840.2 6866489.9, 653839 6866502, 653837 6866557.6, 653837 6866560.4, 653836.9 6866568, 653836.7 6866578.9, 653836.5 6866585.5, 653835.9 6866625.1, 653835.1 6866683.6, 653835.1 6866687.9, 653835.4 6866703.8, 653835.6 6866707.6, 653836.1 6866719.1, 653836.4 6866729.9, 653835 6866778.1, 653833.9 6866817.4, 653833.4 6866832.9, 653833.1 6866840.2, 653832.3 6866879.2, 653838.5 6866918.3, 653838.5 6866932.3, 653838.7 6866944.8, 653838.9 6866955.2, 653831.9 6866973.7, 653828.2 6867002.9, 653827.6 6867014.1, 653827.4 6867023.4, 653828.3 6867031.5, 653831.8 6867043.1, 653833.5 6867047, 653837.3 6867055.8, 653854.4 6867056.2, 653885.7 6867057, 653935.9 6867058.2, 653950.2 6867058.5, 653950.6 6867058.5, 653951.9 6867058.6, 653963.1 6867058.9, 653967.2 6867058.9, 653973.8 6867059.1, 654004.5 6867059.8, 654013.6 6867060.1, 654098.2 6867062, 654207.1 6867064.7, 654296.5 6867066.8, 654300.5 6867066.9, 654354.1 6867068.2, 654359 6867068.3, 654387.7 6867069, 654407 6867069.4, 654453.8 6867070.6, 654454.6 6867070.6, 654532 6867072.5, 654537.9 6867072.6, 654568.1 6867073.3, 654574.1 6867073.4, 654575.7 6867073.5, 654579.8 6867073.6, 654593.6 6867074, 654608.4 6867074.2, 654619.8 6867074.5, 654623.1 6867074.6, 654649.5 6867075.3, 654674.6 6867075.9, 654683.2 6867076.1, 654695.5 6867076.3, 654703.4 6867076.5, 654711.7 6867076.8, 654739.7 6867077.4, 654753.1 6867077.7, 654765.5 6867078, 654771.6 6867078.2, 654777.3 6867078.3, 654785.9 6867078.5, 654793.7 6867078.7, 654796.7 6867078.8, 654809.9 6867079.1, 654814.2 6867079, 654830 6867078.8, 654880.6 6867080.9, 654905.6 6867072.8, 654918.9 6867068.5, 654946.9 6867059.6, 654957.5 6867056.2, 655147.9 6866993.7, 655226.9 6866970.1, 655231.8 6866968.5, 655238.1 6866966.6, 655328.1 6866941.7, 655341.9 6866939.4, 655354.3 6866928.6, 655359.4 6866925.1, 655363.4 6866921.5, 655368.1 6866917, 655371.9 6866913.2, 655377.8 6866909.1, 655381.4 6866905.3, 655385.9 6866901.3, 655389.6 6866897.9, 655402.7 6866886.7, 655410 6866880.6, 655424.2 6866867.5, 655441 6866853, 655454.2 6866841.3, 655459.1 6866837.2, 655473 6866825.3, 655479.3 6866820.4, 655484.1 6866816.5, 655531 6866774.5, 655563.4 6866746.2, 655600.7 6866713.9, 655618.1 6866698.8, 655649.1 6866671.8, 655682.8 6866642.9, 655689.5 6866632.3, 655689.7 6866631.9, 655693.7 6866619.7, 655696.9 6866612, 655697.1 6866611.4, 655700.3 6866602.5, 655702.1 6866597.6, 655702.7 6866595.6, 655705.9 6866587.3, 655706 6866587, 655707.9 6866581.9, 655710.7 6866574.2, 655712.6 6866569, 655714.8 6866562.9, 655714.9 6866561.8, 655716.4 6866558.4, 655718.6 6866553.4, 655756.2 6866449.5, 655767.8 6866417.8, 655768 6866417.3, 655770.5 6866410.4, 655775.4 6866396.9, 655783.5 6866374.9, 655785.2 6866370.7, 655789.8 6866358.9, 655792.5 6866352.6, 655803.1 6866324.9, 655817.4 6866288.4, 655833.1 6866247.8, 655837.3 6866234.9, 655844.5 6866195.5, 655852.4 6866153.3, 655860.7 6866114.9, 655877.3 6866016, 655914.4 6865752.2, 655914.6 6865751.1, 655923.7 6865686.5, 655926.4 6865670, 655938.1 6865572.7, 655938.7 6865569.7, 655939.8 6865558.7, 655940 6865550.7, 655941.5 6865458.1, 655941.6 6865449.1, 655941.7 6865438.6, 655942.2 6865413, 655942.5 6865396.3, 655942.8 6865371.4, 655943.1 6865355, 655943.4 6865336.1, 655943.3 6865335.5, 655943.8 6865315.6, 655944 6865298, 655944.2 6865287.5, 655944.4 6865279.9, 655944.6 6865262.1, 655945.1 6865234.9, 655945.4 6865219.7, 655945.6 6865206.1, 655947.7 6865200, 655961.1 6865162.6, 655962.5 6865158.8, 655963.3 6865156.5, 655965.1 6865151.4, 655976.8 6865118.6, 655981.1 6865106.9, 655984.8 6865096.4, 655991.7 6865077, 655996.8 6865062.7, 656007 6865034.3, 656035 6864997.8, 656036.2 6864995.8, 656041.5 6864988.4, 656070.4 6864951.3, 656072.5 6864948.7, 656096.8 6864916.8, 656108.7 6864901.2, 656125.5 6864889.8, 656146.5 6864875.4, 656162.7 6864864.3, 656184.1 6864849.6, 656190.6 6864845.2, 656210.7 6864831.5, 656221.1 6864824.2, 656229.2 6864818.8, 656234.6 6864815, 656251.7 6864803.3, 656253.7 6864802, 656265.4 6864793.9, 656269.4 6864791.2, 656288.1 6864778.5, 656332.6 6864748, 656408.4 6864718.3, 656492.5 6864691.8, 656503.9 6864688.2, 656515.6 6864684.5, 656522.7 6864682.2, 656540 6864676.9, 656572.6 6864666.7, 656588.1 6864661.7, 656603.6 6864656.9, 656609 6864655.2, 656615.3 6864653.3, 656682.6 6864632.7, 656686.6 6864624.5, 656723.8 6864552.6, 656778.2 6864447.1, 656788.2 6864429.6, 656783.8 6864428.5, 656779.5 6864427.5, 656722.3 6864404.6, 656694.9 6864390.5, 656690.3 6864388.6, 656685.4 6864386.1, 656678.5 6864382.9, 656664.7 6864376.5, 656642.6 6864366.1, 656633.7 6864362, 656625 6864357.9, 656616.4 6864354, 656609.5 6864350.8, 656600.2 6864346.5, 656587.6 6864341.1, 656575.8 6864335.1, 656570.8 6864332.6, 656563.8 6864329.2, 656556.5 6864325.5, 656549.6 6864322, 656542.4 6864318.3, 656496.2 6864292.4, 656476.3 6864284.9, 656445.5 6864278.6, 656434.3 6864274, 656378.1 6864250.8, 656369 6864246.6, 656332.8 6864229.4, 656315.2 6864221.3, 656266.9 6864200, 656260 6864196.9, 656180.5 6864163.1, 656179.8 6864162.8, 655934.1 6864113.9, 655916.3 6864108.7, 655907.1 6864107.4, 655880.7 6864106.6, 655839.7 6864106.1, 655819.6 6864104.1, 655813.1 6864103.4, 655676.1 6864087.2, 655652.2 6864084.4, 655643.6 6864083.7, 655641.6 6864083.8, 655607 6864086.3, 655549 6864091.8, 655518.8 6864094.6, 655494.6 6864097.5, 655454.1 6864103.7, 655448.4 6864104.9, 655430.2 6864108.4, 655424.6 6864109.3, 655419.5 6864109.3, 655412.8 6864109.2, 655410.4 6864109.2, 655360.2 6864109.4, 655356.5 6864109.4, 655292.2 6864107.7, 655232.5 6864093, 655205.8 6864072.4, 655179.3 6864053, 655147.8 6864033.8, 655129.8 6864028.5, 655098.3 6864025.9, 655094.8 6864025.7, 655071.1 6864023.3, 655039.9 6864021, 655030.5 6864019.3, 655024.2 6864016.6, 655017.9 6864013.3, 655000.5 6864003.4, 654985.5 6863994.4, 654941.5 6863961.4, 654935.5 6863956.7, 654919.1 6863943.4, 654918.9 6863943.3, 654894.7 6863927.4, 654887.6 6863923.6, 654878.4 6863920.3, 654868.6 6863917.5, 654852 6863913.4, 654835 6863909.6, 654755.5 6863894.8, 654749.8 6863893.6, 654745.6 6863892.6, 654719.3 6863886.5, 654714.1 6863885.1, 654704.3 6863882.4, 654663.4 6863871.1, 654563.7 6863840.9, 654510.8 6863826.5, 654466.2 6863811.2, 654443.7 6863802.2, 654438.2 6863800.1, 654427 6863795.8, 654416.3 6863791.6, 654413 6863790.2, 654383 6863778.8, 654349.1 6863766.1, 654335 6863760.2, 654316 6863751.8, 654305.1 6863745.1, 654295.2 6863738.4))
-ARR_MUNI0000000009736040;75118;75056;Paris 18e Arrondissement;2006-08-02 08:36:54;2021-01-06 10:08:45;;;75018;PAIHABIT0000000000148213;SURFACTI0000000000142804;193665;POLYGON ((652293.2 6865053, 652279.5 6865050.9, 652256.9 6865046.9, 652251.3 6865045.9, 652152.6 6865028, 652129.9 6865023.9, 652117.2 6865021.9, 652105.5 6865020, 652088.5 6865015.1, 651927.6 6864968.7, 651883.9 6864956.1, 651807.1 6864934, 651741.6 6864915.2, 651583 6864869.7, 651578.7 6864870.7, 651564.6 6864874.1, 651443.5 6864902.8, 651436.5 6864904.5, 651434.5 6864904.9, 651422.1 6864907.9, 651407.2 6864911.5, 651389.9 6864919.3, 651375 6864925.9, 651312.9 6864954.2, 651227 6864993.3, 651080.3 6865059.8, 651066.9 6865065.9, 651055.8 6865070.9, 651047.9 6865074.6, 651044.5 6865075.8, 651034.8 6865079.4, 651019.7 6865085.1, 650933.3 6865117.6, 650840 6865157.9, 650832.9 6865161.4, 650752.3 6865087, 650728 6865064.1, 650709.8 6865052.2, 650700.1 6865049.3, 650686.4 6865045.3, 650676.6 6865042.4, 650674.4 6865051, 650672.2 6865060.5, 650671.5 6865063.3, 650666.3 6865081.2, 650662.5 6865093.9, 650643.7 6865157, 650630.1 6865202.5, 650627 6865213.6, 650616 6865249.8, 650602.4 6865297.7, 650601.9 6865299.5, 650586.4 6865352.2, 650575.9 6865387.8, 650570.4 6865403.2, 650556.8 6865448.7, 650547.2 6865482.2, 650546.4 6865488.3, 650549.3 6865500.8, 650559.5 6865544.1, 650569.4 6865584.8, 650573 6865600.8, 650587.4 6865665.6, 650598.8 6865717.8, 650603.6 6865737.4, 650612.9 6865777.2, 650621.6 6865813.8, 650625.4 6865830.7, 650627.5 6865840.1, 650643.9 6865913.4, 650650.5 6865943.4, 650686.7 6866099.9, 650687.3 6866102.3, 650687.6 6866103.6, 650696.7 6866142.8, 650712.7 6866213, 650736.9 6866315.8, 650743.7 6866347.2, 650748.9 6866369.6, 650751.8 6866381.1, 650757.8 6866405.4, 650761.2 6866419.9, 650768.9 6866451.8, 650779.7 6866498.8, 650802.1 6866599.2, 650804.6 6866610.2, 650805 6866612, 650806.7 6866619.2, 650807.5 6866622.9, 650813 6866646.7, 650816.7 6866663.7, 650824.5 6866696, 650836 6866745.6, 650837.3 6866750.9, 650841.1 6866766.3, 650870.5 6866896.9, 650877.4 6866926.2, 650883 6866949.9, 650890.4 6866980.7, 650892.9 6866990.6, 650913 6866991, 650954.6 6866991.8, 650968 6866992.1, 650978.7 6866992.3, 650984.9 6866992.5, 650994.1 6866992.6, 651007.6 6866992.9, 651028.5 6866993.3, 651220.2 6866998, 651229.9 6866998.3, 651236.1 6866998.5, 651256.9 6866998.9, 651261.3 6866999, 651268.8 6866999.2, 651288.9 6866999.7, 651295.8 6866999.8, 651334.7 6867000.8, 651374.8 6867001.8, 651380.1 6867001.9, 651413 6867002.6, 651425.4 6867002.9, 651432.8 6867003.1, 651435.2 6867003.2, 651446.7 6867003.7, 651456.9 6867003.8, 651464.2 6867004, 651513.9 6867005.1, 651516.9 6867005.2, 651598.6 6867007, 651612 6867007.1, 651617.7 6867007.1, 651668.2 6867008.1, 651670.1 6867008.2, 651675.1 6867008.5, 651716.8 6867009.5, 651773.8 6867010.6, 651785.9 6867010.8, 651850.6 6867012.3, 651855.1 6867012.2, 651862 6867012.2, 651890.8 6867013, 651893.5 6867013.1, 651902.4 6867013.4, 651912.8 6867013.6, 651916.7 6867013.6, 651918.1 6867013.6, 651945.8 6867014.4, 651980.9 6867015, 651995 6867015.4, 652012.5 6867015.7, 652034.4 6867016.3, 652101.9 6867017.8, 652181.1 6867019.4, 652207.7 6867020, 652224 6867020.3, 652489.4 6867026.2, 652494.1 6867026.3, 652526.1 6867027, 652531.3 6867027.1, 652539.6 6867027.3, 652557.5 6867027.6, 652567.4 6867027.8, 652580 6867028.1, 652591.7 6867028.4, 652605.7 6867028.7, 652617.7 6867029, 652623.6 6867029.1, 652627.8 6867029.2, 652634.7 6867029.4, 652643.5 6867029.5, 652647.7 6867029.7, 652653.2 6867029.7, 652661 6867029.9, 652672.1 6867030.2, 652679.6 6867030.3, 652688.8 6867030.5, 652703.2 6867030.8, 652713.8 6867031.1, 652718.8 6867031.2, 652732.8 6867031.4, 652754 6867032, 652773.1 6867032.4, 652792 6867032.7, 652807.8 6867033.1, 652813.9 6867033.3, 652819.1 6867033.4, 652824.3 6867033.5, 652838.7 6867033.9, 652852.1 6867034.1, 652865.2 6867034.4, 652877.7 6867034.7, 652891.5 6867035, 652909 6867035.4, 652915.6 6867035.5, 652965.3 6867036.7, 652967.1 6867036.7, 652973.3 6867036.8, 652977.3 6867036.9, 652986.8 6867037.1, 652994.4 6867037.3, 653000.9 6867037.5, 653006.6 6867037.5, 653011.4 6867037.7, 653014.9 6867037.8, 653017.4 6867037.8, 653020.2 6867037.9, 653030 6867038.1, 653038.2 6867038.3, 653042.1 6867038.3, 653166.3 6867041.2, 653250.1 6867043.1, 653258.5 6867043.2, 653346 6867045.2, 653358.1 6867045.5, 653375.9 6867045.8, 653473.5 6867048.1, 653494 6867048.5, 653534.9 6867049.6, 653549 6867050, 653582.8 6867050.8, 653644.1 6867052.4, 653665.9 6867053, 653691.3 6867053.5, 653723.5 6867054.1, 653733.3 6867054.3, 653737.3 6867054, 653743.4 6867053.7, 653749.4 6867053.7, 653798.1 6867055.1, 653810.6 6867055.3, 653813.7 6867055.3, 653815.7 6867055.4, 653837.3 6867055.8, 653833.5 6867047, 653831.8 6867043.1, 653828.3 6867031.5, 653827.4 6867023.4, 653827.6 6867014.1, 653828.2 6867002.9, 653831.9 6866973.7, 653838.9 6866955.2, 653838.7 6866944.8, 653838.5 6866932.3, 653838.5 6866918.3, 653832.3 6866879.2, 653833.1 6866840.2, 653833.4 6866832.9, 653833.9 6866817.4, 653835 6866778.1, 653836.4 6866729.9, 653836.1 6866719.1, 653835.6 6866707.6, 653835.4 6866703.8, 653835.1 6866687.9, 653835.1 6866683.6, 653835.9 6866625.1, 653836.5 6866585.5, 653836.7 6866578.9, 653836.9 6866568, 653837 6866560.4, 653837 6866557.6, 653839 6866502, 653840.2 6866489.9, 653841.4 6866478.7, 653842.6 6866473.6, 653844.3 6866469.4, 653896.2 6866404.4, 653899.7 6866397.1, 653902.8 6866387.8, 653902.7 6866382.5, 653908.3 6866375.8, 653940.8 6866337.2, 653855.7 6866261.2, 653845.4 6866247.9, 653842.2 6866241.7, 653840.8 6866239, 653820.3 6866203.4, 653810.8 6866183.9, 653809.1 6866179.1, 653798.6 6866141.8, 653773.6 6866062, 653749 6865977.1, 653747.2 6865971, 653745.4 6865965, 653744.7 6865962.5, 653719.1 6865874.6, 653713.1 6865853.7, 653668 6865709.4, 653667.1 6865706.4, 653666.8 6865705.6, 653664 6865700.9, 653661 6865696.1, 653648 6865658.9, 653632.8 6865612.4, 653624.6 6865587, 653613.4 6865544.5, 653606.9 6865521.8, 653601.8 6865502.4, 653598.6 6865487.6, 653592.2 6865461.8, 653586.7 6865443.6, 653570.6 6865390.2, 653564.3 6865367.3, 653559.9 6865358.3, 653548.7 6865338.8, 653493.3 6865245.5, 653469.7 6865208.5, 653468.2 6865206.4, 653418.5 6865127.7, 653412 6865115.2, 653392.6 6865117.3, 653380.1 6865118.1, 653360.7 6865118.7, 653344 6865119.1, 653317.5 6865119.3, 653309.9 6865119.4, 653307.1 6865119.5, 653296.9 6865119.7, 653288.4 6865119.8, 653276 6865120.1, 653274.7 6865120.1, 653262.4 6865120.4, 653254.4 6865120.6, 653249.3 6865120.7, 653219.4 6865121, 653176.4 6865121.6, 653175.9 6865121.6, 653134.3 6865121.8, 653059.3 6865123, 653055.5 6865123.1, 653037.5 6865123.2, 653018 6865123.2, 652994 6865123.2, 652988.9 6865123.1, 652984.3 6865122.8, 652945.7 6865119.1, 652941.7 6865118.6, 652938.4 6865118.3, 652933.7 6865117.8, 652927.2 6865117.2, 652924.1 6865116.9, 652919.1 6865116.3, 652917.9 6865116.2, 652914.3 6865115.9, 652912.4 6865115.6, 652906.5 6865115, 652902.9 6865114.7, 652891.5 6865113.5, 652889.8 6865113.3, 652881.3 6865112.5, 652878.7 6865112.2, 652862.5 6865110.5, 652861.9 6865110.4, 652858.4 6865110, 652857.5 6865110, 652855.2 6865109.8, 652853.1 6865109.5, 652846.7 6865108.8, 652845 6865108.8, 652834 6865107.6, 652832.2 6865107.4, 652827.8 6865106.9, 652818 6865105.9, 652808.9 6865105, 652791.6 6865103.2, 652760.4 6865100.2, 652728.6 6865097.1, 652580.7 6865082.7, 652425.8 6865067, 652423.7 6865066.8, 652413.3 6865065.7, 652338.3 6865058.4, 652317.6 6865056.5, 652313.5 6865055.9, 652297 6865053.6, 652293.2 6865053))
-ARR_MUNI0000000009736041;75117;75056;Paris 17e Arrondissement;2006-08-02 08:36:54;2021-01-06 10:08:45;;;75017;PAIHABIT0000000000148216;SURFACTI0000000000142844;165859;POLYGON ((650676.6 6865042.4, 650670.4 6865040.6, 650657.6 6865036.7, 650650.5 6865034.7, 650640.5 6865031.6, 650634.2 6865029.8, 650624.1 6865026.8, 650526.7 6864997.8, 650445 6864973.5, 650439.5 6864971.9, 650438.7 6864971.7, 650374.9 6864952.7, 650206.4 6864902.7, 650205.6 6864902.4, 650199.6 6864900.6, 650192.7 6864898.6, 650186.2 6864896.6, 650179.6 6864894.6, 650173.9 6864892.9, 650172.6 6864892.6, 650167.6 6864891.1, 650167.1 6864890.9, 650163.8 6864889.9, 650040.3 6864853.2, 649872 6864808.4, 649805.5 6864793.8, 649787.9 6864790.4, 649771.9 6864787.6, 649757.7 6864785.6, 649703 6864776.2, 649700.3 6864775.7, 649624.2 6864763, 649583.4 6864756.4, 649557.6 6864751.5, 649522.1 6864745.4, 649409.3 6864726.3, 649383.8 6864721.3, 649368.7 6864720.2, 649356.2 6864719.5, 649343.7 6864718.4, 649332.9 6864716.5, 649328.7 6864715.6, 649313.4 6864712.4, 649306.3 6864707.8, 649294.1 6864702.2, 649282.6 6864698, 649268.8 6864693.4, 649184.4 6864666, 649060.3 6864626.8, 649027.8 6864616.1, 648895.6 6864574.6, 648891.7 6864573.3, 648839.5 6864557, 648790.3 6864541.5, 648732.5 6864523.3, 648722.2 6864520.1, 648707 6864515.2, 648583.9 6864476.2, 648554.2 6864466.9, 648524.9 6864457.2, 648515.1 6864437, 648512.4 6864431.9, 648506.5 6864420.5, 648501.1 6864408.2, 648451.8 6864307.3, 648430.5 6864263.9, 648428.4 6864259.6, 648408.2 6864218.1, 648404.7 6864211, 648382.3 6864165.4, 648379.2 6864158.9, 648376.3 6864153, 648365.7 6864131.3, 648343.9 6864088.4, 648330.8 6864062.6, 648320 6864039.5, 648315.4 6864030.6, 648311.9 6864022.9, 648311.4 6864022, 648305.4 6864009.6, 648303.6 6864005.8, 648301.3 6864001, 648291.6 6863980.7, 648282.6 6863985.3, 648251.3 6864001.1, 648234.4 6864010.4, 648210.3 6864021.9, 648187.4 6864033.1, 648143.1 6864054.7, 648109.6 6864071.1, 648050.3 6864100.2, 648013.2 6864118.5, 648011.4 6864119.3, 648007.9 6864121, 647990 6864129.8, 647957.3 6864145.8, 647881.6 6864183.1, 647846.7 6864200.4, 647719.9 6864263, 647592.8 6864325.6, 647523.2 6864360, 647515.5 6864363.7, 647498.6 6864372, 647495.6 6864373.5, 647469.8 6864386.2, 647458.5 6864392, 647458.1 6864392.2, 647443.2 6864399.4, 647394.9 6864423.2, 647387 6864427.1, 647367.2 6864436.8, 647342.2 6864449.1, 647340.4 6864450, 647287 6864476.4, 647277.6 6864481.4, 647276.7 6864481.8, 647263.9 6864487.8, 647255.4 6864492, 647240 6864499.6, 647227.9 6864505.6, 647220.4 6864509.4, 647218 6864510.6, 647201.5 6864518.7, 647190.2 6864524.4, 647191 6864529.2, 647193.4 6864544.7, 647235.8 6864805.8, 647243.3 6864860.5, 647246.2 6864879.2, 647264 6864992.9, 647272.7 6865012.7, 647279.7 6865020.4, 647533.8 6865299.8, 647528.1 6865307.1, 647615.7 6865408.1, 647724.4 6865487.6, 647840.6 6865572.6, 647976.5 6865671.9, 648022.2 6865709.9, 648058 6865726.7, 648068.7 6865728.6, 648137.1 6865740.8, 648139.8 6865741.3, 648154 6865744, 648234.8 6865757.2, 648273.7 6865764.5, 648302.3 6865771.2, 648306.2 6865771.1, 648340.3 6865795.4, 648348 6865801.3, 648477 6865900.7, 648478.1 6865901.5, 648491.9 6865912, 648526.3 6865937.9, 648534.8 6865943.6, 648573.1 6865973.6, 648645.4 6866023.6, 648717.7 6866073.7, 648805.8 6866137.2, 648809.8 6866140.8, 648919.2 6866217.1, 648923.7 6866220.3, 648928.2 6866223.8, 648950.5 6866239.5, 648952.8 6866241.2, 649096 6866344, 649241.5 6866445.1, 649314.3 6866485.7, 649377.6 6866521, 649461.5 6866567.8, 649582.7 6866632.8, 649592.5 6866639.1, 649787.9 6866727.7, 650039.2 6866841.6, 650140.2 6866932.1, 650171 6866958.7, 650180.6 6866966.9, 650185.3 6866967.1, 650246.4 6866969.7, 650281 6866971.1, 650300.8 6866971.7, 650308.2 6866967.8, 650336 6866968.4, 650374.7 6866969.2, 650388.5 6866969.2, 650576.8 6866983.3, 650628 6866985.4, 650681.3 6866986.4, 650708.4 6866987, 650715.9 6866987.1, 650724.8 6866987.3, 650730.1 6866987.4, 650758.7 6866988, 650788.6 6866988.5, 650807.3 6866989, 650833.9 6866989.4, 650862.9 6866990, 650868.5 6866990.1, 650872 6866990.2, 650892.9 6866990.6, 650890.4 6866980.7, 650883 6866949.9, 650877.4 6866926.2, 650870.5 6866896.9, 650841.1 6866766.3, 650837.3 6866750.9, 650836 6866745.6, 650824.5 6866696, 650816.7 6866663.7, 650813 6866646.7, 650807.5 6866622.9, 650806.7 6866619.2, 650805 6866612, 650804.6 6866610.2, 650802.1 6866599.2, 650779.7 6866498.8, 650768.9 6866451.8, 650761.2 6866419.9, 650757.8 6866405.4, 650751.8 6866381.1, 650748.9 6866369.6, 650743.7 6866347.2, 650736.9 6866315.8, 650712.7 6866213, 650696.7 6866142.8, 650687.6 6866103.6, 650687.3 6866102.3, 650686.7 6866099.9, 650650.5 6865943.4, 650643.9 6865913.4, 650627.5 6865840.1, 650625.4 6865830.7, 650621.6 6865813.8, 650612.9 6865777.2, 650603.6 6865737.4, 650598.8 6865717.8, 650587.4 6865665.6, 650573 6865600.8, 650569.4 6865584.8, 650559.5 6865544.1, 650549.3 6865500.8, 650546.4 6865488.3, 650547.2 6865482.2, 650556.8 6865448.7, 650570.4 6865403.2, 650575.9 6865387.8, 650586.4 6865352.2, 650601.9 6865299.5, 650602.4 6865297.7, 650616 6865249.8, 650627 6865213.6, 650630.1 6865202.5, 650643.7 6865157, 650662.5 6865093.9, 650666.3 6865081.2, 650671.5 6865063.3, 650672.2 6865060.5, 650674.4 6865051, 650676.6 6865042.4))
-ARR_MUNI0000000009736553;75116;75056;Paris 16e Arrondissement;2006-08-02 08:36:54;2021-01-06 10:08:45;;;75016;PAIHABIT0000000000148260;SURFACTI0000000000143013;166014;POLYGON ((647190.2 6864524.4, 647201.5 6864518.7, 647218 6864510.6, 647220.4 6864509.4, 647227.9 6864505.6, 647240 6864499.6, 647255.4 6864492, 647263.9 6864487.8, 647276.7 6864481.8, 647277.6 6864481.4, 647287 6864476.4, 647340.4 6864450, 647342.2 6864449.1, 647367.2 6864436.8, 647387 6864427.1, 647394.9 6864423.2, 647443.2 6864399.4, 647458.1 6864392.2, 647458.5 6864392, 647469.8 6864386.2, 647495.6 6864373.5, 647498.6 6864372, 647515.5 6864363.7, 647523.2 6864360, 647592.8 6864325.6, 647719.9 6864263, 647846.7 6864200.4, 647881.6 6864183.1, 647957.3 6864145.8, 647990 6864129.8, 648007.9 6864121, 648011.4 6864119.3, 648013.2 6864118.5, 648050.3 6864100.2, 648109.6 6864071.1, 648143.1 6864054.7, 648187.4 6864033.1, 648210.3 6864021.9, 648234.4 6864010.4, 648251.3 6864001.1, 648282.6 6863985.3, 648291.6 6863980.7, 648299.1 6863969.6, 648328.6 6863928.1, 648340.9 6863905.7, 648354.7 6863880.3, 648355 6863879.3, 648376.7 6863837.7, 648386.8 6863818.7, 648449.4 6863703.4, 648453.1 6863696.5, 648456.9 6863689.5, 648460.4 6863682.9, 648469.9 6863663.9, 648474.5 6863651.9, 648506.3 6863568.5, 648521.4 6863529, 648522.7 6863525.7, 648524.2 6863521.7, 648525.9 6863517.3, 648564.6 6863415.9, 648567.8 6863407.9, 648570.6 6863395.7, 648575.5 6863372.9, 648586 6863320.5, 648595 6863275.3, 648598.3 6863257.9, 648610.3 6863195.9, 648613.2 6863180.5, 648614.9 6863171, 648623.4 6863126.4, 648631.8 6863082.8, 648632.2 6863080.2, 648636 6863061.8, 648637 6863031.1, 648636.4 6863018.1, 648635.7 6863000.6, 648653.2 6863001.3, 648669.2 6863002.6, 648680.9 6862996.3, 648708 6862979.4, 648719.8 6862972.5, 648749.3 6862954.8, 648766.8 6862944.3, 648767.6 6862927.2, 648768 6862919.2, 648768.5 6862911.4, 648773.3 6862833.6, 648746.5 6862832.8, 648656.3 6862822.4, 648588.6 6862811.6, 648542 6862796.5, 648465.6 6862763.3, 648415.4 6862739.3, 648311.4 6862684.3, 648267.5 6862657.9, 648234.8 6862630, 648180.7 6862588.7, 648070.1 6862479.3, 648043.6 6862447.8, 647962.8 6862351.8, 647942.4 6862322.2, 647884.6 6862250.7, 647873.6 6862236.6, 647829.5 6862174.1, 647796.7 6862122.3, 647786.6 6862092.8, 647773.3 6862023.9, 647763.4 6862004.3, 647752.9 6861991.6, 647745.8 6861983, 647740.1 6861977.2, 647736.9 6861973.8, 647731.8 6861968.3, 647726.5 6861962.9, 647722.7 6861958.9, 647721.2 6861957.3, 647712.4 6861947.4, 647706.8 6861941.6, 647603.8 6861833.6, 647547.4 6861774.4, 647495.2 6861719.8, 647386.6 6861606, 647382.4 6861601.4, 647376 6861594.9, 647255.4 6861468.9, 647247.1 6861460.3, 647242.6 6861455, 647207.3 6861416.5, 647182.8 6861391.1, 647171.7 6861380.5, 647170.6 6861379.4, 647143.1 6861350.3, 647133.7 6861340.7, 647018.6 6861225, 646976.7 6861176.1, 646945 6861139, 646872.8 6861043.9, 646830.1 6860985.8, 646828.7 6860983.9, 646827.2 6860981.6, 646809.8 6860954.9, 646754.9 6860867.9, 646719.3 6860814.9, 646564.1 6860573.6, 646513.1 6860496.9, 646330.9 6860212.4, 646309.9 6860179.8, 646301.8 6860167.1, 646294.6 6860155.8, 646179.1 6859973.6, 646126.4 6859893.3, 646055.3 6859797.2, 645978.4 6859697.5, 645965.3 6859680.4, 645953.7 6859665.2, 645953.4 6859664.8, 645942.5 6859650.5, 645885.5 6859571.4, 645790.3 6859588.6, 645783.9 6859589.8, 645571.2 6859629.4, 645460.7 6859650.7, 645427.2 6859655.7, 645336.8 6859673, 645325.1 6859675.2, 645319.9 6859685.3, 645311.1 6859702.2, 645302.5 6859717, 645209.8 6859883.8, 645209.3 6859884.8, 645206.2 6859890.4, 645126.3 6860035.8, 645120.2 6860047.7, 645114.7 6860058.4, 645099 6860086.9, 645093.2 6860100.7, 645092.1 6860103.4, 645077.2 6860123.7, 645051.2 6860484, 645050.6 6860491.9, 645046.2 6860557.5, 645045.4 6860559.6, 645045.3 6860576.4, 645084.5 6860696.6, 645097.6 6860731.7, 645130.7 6860831.4, 645140.6 6860864.1, 645090.5 6860866.6, 645015.1 6860870.3, 645003.5 6860871.4, 644996.7 6860873.2, 644949.3 6860893.1, 644895.4 6860914.8, 644837.6 6860937.9, 644805.7 6860950.9, 644783.5 6860959.7, 644744.6 6860975.4, 644722.6 6860984.3, 644701.4 6860992.7, 644661.8 6861008.7, 644631.1 6861021.3, 644464.4 6861086.9, 644422.3 6861104.2, 644400.6 6861112.7, 644391.3 6861125.6, 644371.2 6861149.3, 644357 6861166.2, 644351.4 6861174.9, 644343.5 6861186.9, 644339.3 6861196.7, 644265.7 6861298.4, 644242.8 6861327, 644230 6861340.2, 644212.7 6861356.3, 644198.3 6861365.4, 644169.6 6861380.1, 644154 6861386, 644067.1 6861415.2, 644041.4 6861423.8, 644037.9 6861425, 643912.4 6861468.8, 643827.2 6861499.8, 643759.8 6861524.3, 643731.8 6861533.1, 643666.2 6861556.7, 643610.6 6861574.3, 643499 6861611.5, 643441.7 6861629.7, 643304.5 6861677.6, 643249.1 6861697, 643222.8 6861714, 643199.3 6861722.3, 643075.6 6861777.1, 643075.7 6861801.7, 643078.1 6861853.4, 643081 6861951.8, 643085 6862019.3, 643092.3 6862070.2, 643100.8 6862112.8, 643161.8 6862332.1, 643188.5 6862430.7, 643211 6862498.4, 643246.1 6862599.1, 643288.3 6862718.3, 643302.6 6862761, 643316.3 6862810.3, 643345.8 6862922.8, 643375.6 6863042.4, 643383.9 6863069, 643393.6 6863093.2, 643486 6863256.2, 643499.6 6863280.3, 643528.2 6863328, 643563.9 6863391.7, 643617.2 6863463.3, 643644 6863500.9, 643676.4 6863524.6, 643727.6 6863557.5, 643789.1 6863591.7, 643821.8 6863607.6, 643927.2 6863659.9, 643943.2 6863666.8, 644006.8 6863692.3, 644064.2 6863714, 644108.7 6863732.7, 644137.7 6863745.5, 644196 6863774.1, 644223.1 6863788.5, 644251.1 6863805.9, 644279 6863824.4, 644323 6863858.3, 644344.6 6863876.8, 644390.4 6863919.9, 644454.7 6863990.6, 644476 6864017.3, 644495.2 6864042.9, 644545.8 6864119.8, 644635.7 6864251.4, 644674.5 6864310.1, 644676.4 6864312.8, 644716.2 6864286.7, 644727 6864281, 644736.9 6864276.9, 645342.3 6864042, 645386 6864061.9, 645434.8 6864205.6, 645616.6 6864740.7, 645645.4 6864734.4, 645841.7 6864695.7, 646066.4 6864651.4, 646515.8 6864559.6, 647009 6864458.8, 647155 6864520.1, 647162.7 6864521.8, 647181.1 6864524.9, 647190.2 6864524.4))
-ARR_MUNI0000000009736531;75113;75056;Paris 13e Arrondissement;2006-08-02 08:36:54;2021-01-06 10:08:45;;;75013;PAIHABIT0000000000148290;SURFACTI0000000000143218;180632;POLYGON ((653313.8 6857558.1, 653249.3 6857530.8, 653085.9 6857524.9, 653054.6 6857523.9, 653045.7 6857523.6, 653043.4 6857523.5, 653016.4 6857522.5, 653001.7 6857522.3, 652962.4 6857521, 652927.6 6857519.9, 652889 6857518.8, 652818.7 6857516.4, 652776.7 6857515, 652768.7 6857514.8, 652751 6857513.9, 652735.9 6857512.8, 652728 6857512.2, 652700.1 6857510.2, 652667.7 6857549.6, 652618.9 6857609.8, 652560 6857675.3, 652520.1 6857720, 652519.3 6857720.9, 652504.7 6857737.2, 652496.2 6857746.6, 652448.4 6857804.5, 652364.3 6857739.7, 652336.6 6857721, 652307.8 6857701.5, 652200.1 6857630.1, 652180.4 6857618.1, 652174.1 6857613.9, 652168.4 6857609.9, 652127.5 6857580.6, 652063.3 6857535.3, 652053.1 6857529.3, 652044.3 6857526.2, 652031.9 6857523.9, 652023.2 6857522.8, 652016.5 6857522.9, 652004 6857523.8, 651990.4 6857525.8, 651978.8 6857528.2, 651943.3 6857533.7, 651931 6857534.8, 651917.4 6857535.5, 651903.1 6857535.2, 651885.4 6857533.6, 651870.5 6857531.1, 651864.4 6857529.8, 651856 6857527.5, 651863.6 6857482.4, 651862.4 6857477, 651854.8 6857481.7, 651846.4 6857486.6, 651832.3 6857494.6, 651822.5 6857500.1, 651825.4 6857527.3, 651827.1 6857542.5, 651827.5 6857546.8, 651828.8 6857562.8, 651829.3 6857569.9, 651829.8 6857575.4, 651830.2 6857581.7, 651830.9 6857589.3, 651831.2 6857593.3, 651831.9 6857606.4, 651833.7 6857637.8, 651836.2 6857670.3, 651838 6857693, 651838.3 6857699.3, 651841 6857722.9, 651842.4 6857731.4, 651848.6 6857768.7, 651854.3 6857799.8, 651864.6 6857847.2, 651873.5 6857886.4, 651875 6857895.8, 651876 6857903, 651876.1 6857903.5, 651877.1 6857913.6, 651876.6 6857921.9, 651871.8 6857930.1, 651864.3 6857942.1, 651860.8 6857947, 651858.5 6857950.2, 651845.3 6857973.5, 651820 6858018.1, 651814.2 6858026.8, 651808 6858034.6, 651800.3 6858043.3, 651788.7 6858056.2, 651774.5 6858072, 651757.7 6858090.3, 651748.1 6858101.5, 651735.9 6858116.9, 651730.7 6858124.1, 651725.2 6858132.7, 651723.7 6858135, 651713.3 6858157.2, 651692.1 6858206.4, 651690.3 6858211.4, 651674.2 6858253.4, 651669.4 6858271, 651664 6858309.3, 651652.5 6858370.6, 651650.6 6858390.4, 651650.5 6858399.8, 651657.4 6858486, 651662.2 6858543.7, 651661.1 6858561.4, 651671.1 6858660.4, 651673.6 6858670.2, 651676.9 6858685.4, 651677.7 6858689, 651662.8 6858693.8, 651667.5 6858826.4, 651665.1 6858900.9, 651658.5 6858952.6, 651653.9 6858983, 651651 6858999.7, 651648.2 6859020.2, 651644.9 6859088, 651643.6 6859114.8, 651642.1 6859149.8, 651641.6 6859188.2, 651641.4 6859222.6, 651641.9 6859249.9, 651642.4 6859260.9, 651635.8 6859283.1, 651629.7 6859303.6, 651632.2 6859309.4, 651634.8 6859347.2, 651637.9 6859379.8, 651640.9 6859403.8, 651644.8 6859428.1, 651670.1 6859619.8, 651676.4 6859678.3, 651676.9 6859683.2, 651681.7 6859731, 651691.2 6859824.5, 651693.1 6859843.1, 651693.6 6859847.7, 651695.7 6859868.6, 651697.7 6859888.5, 651702 6859931, 651703.3 6859944.4, 651706.9 6859980.3, 651707.7 6859989.6, 651709 6860001.4, 651709.7 6860007.2, 651710 6860011.4, 651754.3 6859996.5, 651765.5 6859993, 651847.6 6859967.2, 651886.2 6859955, 651960.7 6859930.6, 651961.5 6859930.3, 652022.2 6859910.5, 652070.3 6859894.2, 652078.8 6859892.2, 652086.6 6859890.7, 652205.8 6859868.7, 652215.4 6859866.9, 652221.4 6859865.9, 652225.6 6859865.2, 652340.1 6859844.8, 652350.3 6859844.3, 652378.9 6859840.4, 652395.6 6859838.8, 652426.8 6859834.4, 652486.3 6859861.5, 652513.2 6859874.2, 652614.1 6859921.6, 652681.4 6859953.2, 652727.8 6859975, 652806.5 6860012.9, 652808.6 6860013.9, 652864.5 6860040.7, 652921.2 6860067.8, 652964.2 6860088.4, 653010.9 6860110.7, 653084.8 6860144.9, 653154.4 6860177.2, 653156.5 6860182.8, 653162.3 6860194.4, 653170.9 6860210.6, 653171 6860210.8, 653188.9 6860244.9, 653198.4 6860262.9, 653211.9 6860290, 653216.5 6860298.5, 653222.6 6860308.3, 653238 6860338.6, 653261.5 6860388.3, 653275.2 6860415, 653285.8 6860437.2, 653290.1 6860445.8, 653294.5 6860454.6, 653311.6 6860488.1, 653319.8 6860505.3, 653327.5 6860522.3, 653334.4 6860536.5, 653354.1 6860573.6, 653361.5 6860587.7, 653365.5 6860594.5, 653389.8 6860639.2, 653391.5 6860642.4, 653394.3 6860647.8, 653394.8 6860648.7, 653397 6860653.3, 653400.1 6860659.4, 653406 6860671.3, 653406.6 6860672.5, 653414.4 6860679.1, 653419.6 6860683.4, 653456.8 6860714.9, 653477.6 6860733.6, 653611.8 6860578.8, 653693.2 6860484.8, 653704.5 6860471.8, 653888.6 6860259.3, 653940.4 6860197.4, 653975 6860156.2, 654020.3 6860102.2, 654109.9 6859968.3, 654115.5 6859959.7, 654121.8 6859950.2, 654148.8 6859909.9, 654161.4 6859893.4, 654369.4 6859620.7, 654454.4 6859515.6, 654561.4 6859383.7, 654665.3 6859258.1, 654779.5 6859120.2, 654801.8 6859093.3, 654987.8 6858847.8, 654996 6858836.7, 655004.7 6858825, 655008.6 6858820.3, 655064.6 6858748.9, 655107.6 6858694.3, 655119.3 6858682.2, 655119.5 6858681.9, 655126.1 6858675, 655133.4 6858667.5, 655134.4 6858666.5, 655134.7 6858666.2, 655141.1 6858659.5, 655149.3 6858651, 655149.7 6858650.6, 655221.2 6858576.5, 655174.9 6858538.2, 655127.3 6858512, 655117.7 6858507.2, 655060.5 6858479.1, 655007.6 6858451, 654990.3 6858441.6, 654863.7 6858361, 654817.4 6858336.6, 654813 6858334.1, 654775 6858313.8, 654724.5 6858287.3, 654722 6858286, 654710.1 6858280, 654590.8 6858216.5, 654534.6 6858138, 654439.6 6858091.2, 654410.5 6858078.6, 654322.1 6858037.3, 654222 6857986.8, 654188.9 6857968.9, 654172 6857960.8, 654165.6 6857958, 654162 6857956.4, 654159.6 6857955.9, 654153.5 6857953, 654079.2 6857917, 654068.8 6857912.5, 654054.8 6857906.9, 654048.6 6857903.7, 654044.8 6857901.6, 654039.7 6857898.5, 654036.9 6857898.4, 654034.2 6857897.9, 654014.1 6857887.7, 654001.1 6857881.7, 653961.4 6857864.1, 653954.4 6857860.7, 653942.4 6857855, 653937.5 6857852.7, 653933.2 6857850.7, 653888.9 6857828.5, 653887.3 6857827.7, 653880.3 6857824.3, 653851.3 6857810, 653811.6 6857791.1, 653801.7 6857786.5, 653788.4 6857780.5, 653767.3 6857771.8, 653703 6857742, 653662.3 6857721.8, 653626.1 6857704.7, 653580 6857682.4, 653556.8 6857671.1, 653527.4 6857656.8, 653514.5 6857651, 653498.7 6857643.5, 653419.7 6857607.4, 653374.6 6857587.9, 653327 6857564.6, 653313.8 6857558.1))
-ARR_MUNI0000000009736046;75102;75056;Paris 2e Arrondissement;2006-08-02 08:36:54;2021-01-06 10:08:45;;;75002;PAIHABIT0000000000148249;SURFACTI0000000000142990;21420;POLYGON ((652167.8 6863604.3, 652193.8 6863596, 652224.5 6863586.3, 652254.2 6863576.9, 652287.9 6863565.7, 652301.2 6863561.3, 652326.9 6863552.8, 652355.1 6863543.3, 652378.6 6863535.9, 652390.2 6863532.2, 652469.9 6863505.5, 652486.6 6863499.7, 652514.8 6863489.9, 652539.5 6863481.3, 652579.5 6863467, 652597.6 6863460.5, 652631.2 6863448.8, 652615.8 6863406.7, 652615.1 6863404.7, 652604.5 6863378.4, 652591.5 6863344.2, 652583.3 6863322.1, 652571.6 6863290.6, 652560.2 6863259.8, 652551.8 6863237.9, 652542 6863212.7, 652535.1 6863194.7, 652502.3 6863106.4, 652459.7 6862996.8, 652425.6 6862906, 652414.5 6862876.8, 652383.9 6862792.3, 652377.9 6862794.6, 652314 6862818.5, 652242.2 6862844.3, 652197 6862861.5, 652138.8 6862882.8, 652071.4 6862908.3, 651976.9 6862943.1, 651967.4 6862946.5, 651958.1 6862949.9, 651954.9 6862951.2, 651947.7 6862953.8, 651946.5 6862954.2, 651879.4 6862979.6, 651808.1 6863006.5, 651769.9 6863019.9, 651741.2 6863030.9, 651701 6863046.6, 651688.7 6863051.4, 651680.5 6863054.8, 651670.6 6863058.7, 651662.5 6863061.9, 651658.8 6863063.4, 651647.5 6863067.7, 651637.3 6863071.2, 651616.2 6863078.7, 651565.3 6863096.4, 651561.7 6863097.8, 651541.6 6863105.1, 651529 6863109.8, 651514.4 6863115.2, 651485.3 6863126.1, 651391 6863161.2, 651331 6863181.9, 651318.5 6863186.3, 651280.9 6863199.3, 651234.8 6863216.2, 651224.5 6863220, 651188 6863233.6, 651119 6863259.3, 651018.8 6863295.1, 650977.6 6863310.1, 650928.3 6863327, 650882.4 6863345.1, 650872.1 6863351.6, 650859.2 6863361.9, 650808.6 6863417.1, 650724.3 6863512.3, 650718.1 6863518.9, 650706 6863531.3, 650780.1 6863549.4, 650787.8 6863551.4, 650851.1 6863568.3, 650856.1 6863569.5, 651005.9 6863607.1, 651038.5 6863614.2, 651158.5 6863643.9, 651190.6 6863651.8, 651203.2 6863654.9, 651288.8 6863678.1, 651356.4 6863694.9, 651367.4 6863697.7, 651374.7 6863699.6, 651376.7 6863700.1, 651422.4 6863711.5, 651444.1 6863716.9, 651464.1 6863721.8, 651517.5 6863734.3, 651560.7 6863744.6, 651591.2 6863751.9, 651706.9 6863723.2, 651725.5 6863718.2, 651811.5 6863695.9, 651835.8 6863689.5, 652007.3 6863645, 652027.2 6863639.5, 652081.3 6863625.9, 652102.7 6863620.2, 652167.8 6863604.3))
-ARR_MUNI0000000009736532;75112;75056;Paris 12e Arrondissement;2006-08-02 08:36:54;2021-01-06 10:08:45;;;75012;PAIHABIT0000002000206141;SURFACTI0000000000143192;139665;POLYGON ((660776.1 6858595.6, 660774.7 6858589.8, 660760.9 6858532.8, 660758.9 6858524.5, 660745 6858457.2, 660735.4 6858454.8, 660743.3 6858426.7, 660738.9 6858411.2, 660734.8 6858396.4, 660732.6 6858388.3, 660730 6858378.8, 660727.8 6858369.7, 660724.7 6858360.3, 660724.1 6858357.8, 660648 6858160.2, 660646.4 6858153.8, 660641.9 6858140.4, 660636.3 6858123.9, 660631.2 6858109.2, 660627.4 6858096.9, 660625.4 6858090.9, 660601.4 6858032.3, 660586 6857992, 660583.1 6857984.4, 660561.3 6857924.5, 660554.9 6857875.9, 660548.2 6857834.7, 660535.8 6857821.1, 660539.7 6857814.4, 660544.8 6857805.4, 660547.9 6857800.3, 660529.9 6857788.1, 660437.9 6857722.7, 660388.1 6857686.6, 660315.1 6857636.4, 660283.7 6857613.7, 660305.2 6857556, 660283.7 6857572.7, 660254.2 6857577.1, 660205.5 6857575.8, 660048.8 6857583.8, 659988.8 6857583.5, 659969.1 6857585, 659958.4 6857585.8, 659956.5 6857585.8, 659936.4 6857587.4, 659922.8 6857588.5, 659913.3 6857589.1, 659906.3 6857589.6, 659867.7 6857592.5, 659858.9 6857594.4, 659855.3 6857595.1, 659834.7 6857601, 659814.9 6857607.4, 659812.6 6857608.2, 659799.8 6857611.7, 659787.7 6857616.4, 659779.2 6857619.7, 659711.1 6857645.8, 659705.6 6857647.6, 659673.9 6857658.3, 659655.7 6857663.4, 659627.2 6857669.9, 659602.8 6857675.1, 659596.7 6857676.2, 659590.6 6857677.2, 659572.4 6857679, 659536.6 6857681.7, 659496.3 6857684.1, 659452.3 6857686.2, 659436.7 6857686.2, 659424.6 6857685.6, 659373.1 6857683.1, 659366.5 6857682.8, 659318 6857683, 659226.6 6857680.2, 659187.5 6857678, 659154.5 6857680.1, 659077.8 6857681.7, 659051.3 6857682.2, 659034.5 6857683.7, 659016.8 6857686.8, 658955 6857703.9, 658890.9 6857722.8, 658876.2 6857725.7, 658870.1 6857726.5, 658860.8 6857726.6, 658836.8 6857725.5, 658766.8 6857720.7, 658702.8 6857716, 658693.7 6857715.4, 658684.6 6857715.1, 658685.1 6857720.5, 658690.6 6857787.3, 658693.7 6857818.9, 658692.9 6857820.1, 658692.1 6857821.1, 658689.7 6857823.9, 658686.6 6857827.4, 658678.7 6857833.3, 658655.9 6857847.4, 658625 6857862.4, 658620.1 6857864.5, 658612.5 6857867.5, 658590.2 6857873.2, 658527.3 6857879.8, 658507.6 6857882.3, 658497.8 6857876.5, 658489.4 6857870, 658475.1 6857856.9, 658471.1 6857852.8, 658467.1 6857848.4, 658451.6 6857832.3, 658460.8 6857909.5, 658462.9 6857937, 658449.8 6857952.5, 658389.5 6858016.3, 658375.9 6858030.2, 658331.2 6858078.9, 658361.5 6858108.4, 658342.9 6858131.6, 658310.4 6858100.6, 658184.4 6858233.8, 658179.9 6858238.7, 658177.5 6858241.4, 658196.6 6858272.4, 658192 6858275.1, 658170.4 6858287, 658151.7 6858297.3, 658140.5 6858303.4, 658128.3 6858309.6, 658105 6858320.1, 658094.1 6858324.8, 658060.5 6858337.4, 658027.6 6858348.3, 658001.2 6858356.4, 657985.3 6858360.5, 657961.8 6858366.4, 657929.7 6858373.3, 657899.8 6858379, 657874.7 6858382.7, 657833.4 6858387, 657819.5 6858388.4, 657793.9 6858389.7, 657772.3 6858390.2, 657758.8 6858390.5, 657748.7 6858390.2, 657735.2 6858389.7, 657702.3 6858388.9, 657683.3 6858387.9, 657670.4 6858387.5, 657663.2 6858387, 657641.6 6858385.6, 657634.1 6858385.1, 657628.4 6858384.7, 657551.1 6858377.3, 657543.2 6858377.1, 657524.4 6858377, 657466.8 6858376.7, 657441.2 6858378.3, 657414.3 6858380.7, 657398.3 6858384.1, 657372.1 6858389.4, 657361.5 6858392.1, 657337.5 6858399.2, 657314.7 6858407.2, 657287.6 6858418.3, 657275.5 6858423.3, 657261.2 6858428.8, 657253.2 6858432, 657231.4 6858438.7, 657206.9 6858445.5, 657187.1 6858450, 657161.6 6858455.5, 657141.1 6858458.4, 657122.2 6858460.4, 657098.8 6858461.3, 657072.8 6858461.7, 657068.8 6858461.6, 657056.6 6858461.4, 657046 6858460.6, 657007.3 6858457.8, 656961.3 6858455.5, 656911.8 6858455.3, 656876 6858457.7, 656864.1 6858458.9, 656861.1 6858459.2, 656825.3 6858463.5, 656812.5 6858465.5, 656799.4 6858468.5, 656783.7 6858472.4, 656767.2 6858476.4, 656750.2 6858481.2, 656744 6858483.4, 656730.3 6858488, 656716.7 6858492.7, 656703.5 6858497.9, 656691.4 6858503.3, 656680.5 6858508.8, 656670.5 6858515.1, 656664.1 6858518.9, 656658.1 6858522.2, 656638.4 6858534.3, 656623.5 6858544.7, 656587 6858574.4, 656558.6 6858599.6, 656544 6858613.1, 656528.7 6858627.9, 656516.4 6858639.8, 656507.8 6858648.7, 656503.7 6858653.5, 656497.6 6858660, 656457 6858705.5, 656432.2 6858733.9, 656429.2 6858737.4, 656421 6858747.4, 656410.2 6858761.1, 656378.8 6858801.7, 656346.8 6858839.4, 656345 6858841.5, 656338.8 6858848.5, 656330 6858858.2, 656325 6858863.2, 656319 6858869.5, 656314.2 6858874.1, 656305.8 6858881.4, 656280.9 6858902.3, 656250.2 6858927.6, 656245.1 6858932.5, 656232.9 6858943.2, 656226.4 6858947.6, 656213.7 6858956.2, 656198.1 6858964.5, 656188.5 6858969.4, 656164 6858983.2, 656150.1 6858990.3, 656134.7 6858996.9, 656117.6 6859003, 656063.9 6858978.1, 656028.4 6858961.1, 656002.8 6858948.9, 655958.1 6858926, 655936.2 6858915.6, 655913.3 6858906, 655903.9 6858901.9, 655894.2 6858897.6, 655886.4 6858894.9, 655880 6858892.9, 655872.6 6858890.4, 655865.2 6858887.9, 655853.4 6858884, 655846.1 6858881.6, 655837 6858878.7, 655828.8 6858875.9, 655821.6 6858873.5, 655819.9 6858872.9, 655814.4 6858871.2, 655809 6858869.3, 655797.7 6858865.3, 655720.3 6858835.3, 655636.6 6858799.6, 655617.4 6858795, 655597.8 6858790.7, 655536.1 6858779.4, 655510.5 6858764.3, 655419.7 6858704.3, 655376.5 6858676.4, 655366.9 6858670.7, 655354.5 6858663.2, 655352.1 6858661.7, 655337.7 6858652.5, 655329.4 6858647.3, 655312.5 6858636.6, 655291.3 6858623.2, 655286.1 6858619.6, 655285.2 6858619, 655221.2 6858576.5, 655149.7 6858650.6, 655149.3 6858651, 655141.1 6858659.5, 655134.7 6858666.2, 655134.4 6858666.5, 655133.4 6858667.5, 655126.1 6858675, 655119.5 6858681.9, 655119.3 6858682.2, 655107.6 6858694.3, 655064.6 6858748.9, 655008.6 6858820.3, 655004.7 6858825, 654996 6858836.7, 654987.8 6858847.8, 654801.8 6859093.3, 654779.5 6859120.2, 654665.3 6859258.1, 654561.4 6859383.7, 654454.4 6859515.6, 654369.4 6859620.7, 654161.4 6859893.4, 654148.8 6859909.9, 654121.8 6859950.2, 654115.5 6859959.7, 654109.9 6859968.3, 654020.3 6860102.2, 653975 6860156.2, 653940.4 6860197.4, 653888.6 6860259.3, 653704.5 6860471.8, 653693.2 6860484.8, 653611.8 6860578.8, 653477.6 6860733.6, 653358.9 6860870, 653420.2 6860921.6, 653421.3 6860922.5, 653427.2 6860927.6, 653428.3 6860928.6, 653431.6 6860931.2, 653436.3 6860935.2, 653436.6 6860935.5, 653444.1 6860941.8, 653444.7 6860942.3, 653453.8 6860949.9, 653454.4 6860950.4, 653458 6860953.5, 653475.5 6860968.3, 653476.1 6860968.8, 653476.9 6860969.4, 653484.7 6860976, 653490.2 6860980.7, 653490.7 6860981.2, 653505.8 6860993.8, 653506.6 6861001, 653530.7 6861079.7, 653539.8 6861109.1, 653543.2 6861120.4, 653549 6861139.5, 653568.2 6861201.9, 653619.4 6861368.7, 653620.8 6861373.2, 653664.2 6861508.3, 653664.6 6861509.3, 653666.2 6861514.2, 653667.1 6861517, 653667.3 6861517.7, 653667.8 6861519.3, 653669.2 6861523.6, 653670.3 6861527.2, 653671.1 6861529.6, 653688.8 6861584.5, 653691.9 6861594.1, 653696.3 6861607.8, 653701.5 6861624.2, 653705 6861635.1, 653707.7 6861643.4, 653715.5 6861644.5, 653717.3 6861644.8, 653729.9 6861646.7, 653788.8 6861655.6, 653790.8 6861654.4, 653807 6861645.1, 653844.4 6861608.4, 653860.9 6861593.3, 653863.4 6861591.5, 653897.5 6861566.4, 653918.9 6861554.3, 653941.3 6861543.8, 653943.8 6861542.8, 653962.6 6861534.9, 653983.5 6861525.6, 654005.6 6861516.1, 654024.6 6861508.1, 654043.2 6861500.2, 654050.6 6861497, 654098.4 6861478.3, 654121.1 6861468.9, 654127.7 6861466.3, 654144.2 6861459.9, 654164.9 6861451.9, 654173.6 6861448.5, 654221.1 6861432.2, 654266.3 6861414.9, 654300.5 6861401.7, 654312.5 6861397.1, 654330.3 6861390.2, 654342.7 6861385.3, 654397.6 6861364.1, 654415.5 6861357.2, 654422.5 6861355.1, 654458.5 6861347.1, 654474.5 6861343.4, 654508.2 6861336.3, 654511.8 6861335.6, 654605.4 6861329.9, 654608 6861329.6, 654611.5 6861329.1, 654634.6 6861323.9, 654713.4 6861314.7, 654719.9 6861313.9, 654728.1 6861312.8, 654743.1 6861311, 654769.6 6861307.8, 654776.2 6861306.6, 654789.1 6861304.4, 654807.2 6861301.1, 654830.2 6861296.6, 654848.5 6861291.7, 655040.5 6861245.1, 655199.3 6861206.9, 655243.9 6861196.2, 655251 6861194.5, 655287.5 6861185.8, 655371 6861165.8, 655380.7 6861163.5, 655455.7 6861145.4, 655486.6 6861138.7, 655545.8 6861125.1, 655553.9 6861123.1, 655592.1 6861114.5, 655627.3 6861106.3, 655672.6 6861095.6, 655713.4 6861089.8, 655728.2 6861087.6, 655744.1 6861085.2, 655786.8 6861078.8, 655836.1 6861072.8, 655904.5 6861062.7, 656222.4 6861016.9, 656419.7 6860988.5, 656423.3 6860988.1, 656430.5 6860987.2, 656440.8 6860986, 656452.9 6860984.1, 656533.6 6860973.3, 656622.3 6860961.5, 656654.4 6860957.3, 656682.7 6860953.4, 656742.8 6860944.6, 656760.3 6860942.1, 656779.5 6860939.2, 656780.4 6860939.2, 656808 6860937.8, 656859.3 6860929.6, 656918.1 6860920.4, 656930.1 6860918.5, 656967.8 6860913.2, 656978.8 6860911.6, 656982.9 6860911.1, 656984.1 6860911, 656991.2 6860910, 656993.9 6860909.6, 656995 6860909.5, 657003 6860908.3, 657006.7 6860907.8, 657011.6 6860907.2, 657014.1 6860906.8, 657021.1 6860905.8, 657024 6860905.3, 657029.6 6860904.6, 657033.9 6860904.1, 657043.8 6860902.5, 657046.8 6860902.1, 657053.5 6860901.3, 657054 6860901.2, 657059.4 6860900.5, 657081.3 6860897.4, 657083.2 6860897.1, 657090.1 6860896.2, 657110.1 6860893.3, 657131.4 6860890.3, 657139.8 6860889.4, 657139.2 6860883.5, 657137.2 6860867.5, 657135.4 6860852.9, 657131.5 6860822.3, 657131.1 6860818.8, 657125.5 6860774.8, 657123.9 6860758.5, 657122.7 6860749.4, 657121.5 6860742.7, 657115.9 6860708.7, 657112 6860690.8, 657110.2 6860682.5, 657088.2 6860581.4, 657086 6860571.2, 657081 6860547.6, 657080.7 6860546.8, 657078 6860533.5, 657076 6860523.8, 657074 6860514.5, 657073 6860509.6, 657070.7 6860498.7, 657058.9 6860441.9, 657054 6860418.1, 657008.3 6860208.2, 656992.9 6860127.3, 656991.1 6860118.9, 656957.2 6859962.8, 656956.8 6859961.3, 656928.9 6859844.8, 656914.8 6859786, 656902.3 6859734, 656856.4 6859547.8, 656799.1 6859480.4, 656810.6 6859477.6, 656826.4 6859474, 656843.9 6859470.1, 656859.9 6859466.8, 656880.8 6859463.1, 656892.2 6859461.8, 656907.8 6859460.2, 656923.6 6859458.5, 656948.2 6859456.4, 656978.7 6859454.9, 656999.2 6859455.1, 657014 6859455.5, 657031 6859456.3, 657050.5 6859457.9, 657070.2 6859460.1, 657092.5 6859463.2, 657113.2 6859467.2, 657129.1 6859470.7, 657146 6859475.6, 657165 6859481.3, 657176.2 6859485.2, 657204.8 6859496.2, 657229.9 6859506.1, 657278.5 6859529, 657295.3 6859536.8, 657378.1 6859576.5, 657411 6859593.1, 657442.4 6859608.5, 657454.5 6859614.7, 657471.8 6859623.7, 657488.4 6859632.5, 657493.5 6859634.9, 657500.9 6859638.6, 657549.5 6859664.2, 657576.2 6859678.4, 657583.6 6859682.4, 657573 6859708.4, 657559.3 6859743.8, 657551.3 6859765.9, 657543.8 6859789.3, 657538.6 6859813.4, 657536 6859827.1, 657534 6859840.8, 657530.7 6859870.9, 657520.6 6859945.7, 657508.9 6860015.9, 657507.9 6860022, 657507.1 6860026.9, 657497.8 6860075.7, 657486.5 6860115.6, 657482.7 6860128.8, 657475.1 6860154.4, 657471.7 6860165.4, 657468.6 6860175.5, 657465.2 6860185.5, 657459.3 6860199.5, 657452.8 6860213.4, 657446.9 6860224.3, 657440.4 6860234.5, 657432.2 6860244.9, 657414.5 6860271.2, 657410 6860279.5, 657404.3 6860292.8, 657397.4 6860312.2, 657392.5 6860338.7, 657390.6 6860350.2, 657387.2 6860373.2, 657386.4 6860380.1, 657385.7 6860389.1, 657384.8 6860409.3, 657384.7 6860424.4, 657384.9 6860428.9, 657385.9 6860433.3, 657387.4 6860437.7, 657391.2 6860446.4, 657393.3 6860450.4, 657401.7 6860463, 657413 6860477.8, 657416.7 6860484.6, 657419.6 6860490.7, 657421.5 6860495.8, 657422.5 6860500.6, 657422.8 6860505.3, 657422.9 6860515.1, 657422.9 6860522.5, 657422.6 6860535.2, 657437.1 6860547.5, 657441.4 6860551.1, 657452.3 6860558.9, 657507 6860598.2, 657539.8 6860621.9, 657558.4 6860635, 657569.3 6860643.2, 657574.8 6860639.3, 657581.8 6860633.7, 657588.6 6860627.9, 657596.8 6860619.9, 657604.1 6860611.1, 657612.1 6860600.7, 657619.3 6860589.6, 657627.9 6860576, 657636 6860559.9, 657642.4 6860546.6, 657645.9 6860539.1, 657649 6860532.4, 657650.5 6860529.2, 657656.1 6860516.1, 657664 6860495.9, 657673.4 6860472.8, 657682.8 6860454.7, 657688.5 6860444.2, 657694.1 6860434.8, 657699.5 6860426, 657705.5 6860416.5, 657711.3 6860407.8, 657716.7 6860399.8, 657721.6 6860392.9, 657727.1 6860386.2, 657732.3 6860380.4, 657739.6 6860374.1, 657750.7 6860365.3, 657754.6 6860363, 657759.3 6860360.6, 657764.4 6860358.1, 657773 6860354.8, 657779.3 6860352.6, 657786 6860350.8, 657792.6 6860349.2, 657798.8 6860348.1, 657805.5 6860347.2, 657811.9 6860346.4, 657819 6860345.4, 657858.5 6860338.4, 657967.4 6860323.9, 657987.3 6860321.4, 658028 6860316.4, 658036.4 6860315.1, 658044.2 6860314, 658212 6860289.6, 658217.8 6860288.9, 658277.5 6860281.2, 658330 6860273.4, 658336.3 6860272.7, 658347.5 6860271.5, 658378.9 6860267.8, 658418.4 6860260.9, 658425 6860259.9, 658426.2 6860267.2, 658427.6 6860277.5, 658434.3 6860276.7, 658470.1 6860272.1, 658571.9 6860257.8, 658588.8 6860255.8, 658692 6860241, 658699.5 6860289.1, 658719.6 6860432.2, 658747 6860626.7, 658748.4 6860636.3, 658750.4 6860650.5, 658751.8 6860659.9, 658767.5 6860657.5, 658782.7 6860655, 658799.9 6860652.4, 658811.1 6860650.7, 658864 6860643.2, 658880.5 6860641.1, 658901.1 6860638.5, 658914.1 6860636.8, 658926 6860635.2, 658939.6 6860633.6, 658944 6860662, 658945.2 6860671, 658945.8 6860674.8, 658946.4 6860679.7, 658947 6860683.8, 658953.5 6860683.2, 658960.6 6860682.3, 658965.5 6860723.7, 658952.1 6860723.3, 658958.3 6860803, 658965.5 6860802, 659037.1 6860797.1, 659069.2 6860795.8, 659206.1 6860791.6, 659217.2 6860791.3, 659263.7 6860790.2, 659390.3 6860781.9, 659378.7 6860689.2, 659413.3 6860685.9, 659449 6860681, 659478.1 6860676.9, 659508.6 6860672.2, 659536.8 6860667.3, 659568.8 6860661.4, 659600.8 6860655.3, 659634.9 6860648.4, 659662.7 6860642.6, 659695.1 6860635.2, 659772.2 6860615.4, 659798.8 6860609.3, 659827.5 6860602.6, 659892.2 6860589.3, 659952.4 6860579.4, 660014.3 6860568.2, 660108.7 6860549, 660132.3 6860543.9, 660210.3 6860525.8, 660248.9 6860516.3, 660266.8 6860511.9, 660319.7 6860495.7, 660359 6860483.8, 660442.1 6860456.2, 660475.5 6860443, 660499.6 6860432.7, 660530 6860418.8, 660547.3 6860410.3, 660563.9 6860401.4, 660576.7 6860394.3, 660587.3 6860387.9, 660601.4 6860378.3, 660625.8 6860363.3, 660642 6860353.1, 660674.1 6860329, 660695.8 6860311, 660710.5 6860298.4, 660726.8 6860283.9, 660752.7 6860257.9, 660763.8 6860245.8, 660770.6 6860237.7, 660784.8 6860220.1, 660797.7 6860202.4, 660812 6860183.2, 660818.6 6860173.9, 660838.4 6860142.7, 660853.1 6860118.3, 660874.1 6860081.6, 660893 6860044, 660902.4 6860026.2, 660924.3 6859988.3, 660936.3 6859967.9, 660945.5 6859953.5, 660953.5 6859942.1, 660957.3 6859937.3, 660991.6 6859892.4, 661000.8 6859880.1, 661012.6 6859864.1, 661018.1 6859856.4, 661024 6859848, 661041.7 6859823.9, 661058.9 6859797, 661066.2 6859782.7, 661072.6 6859768, 661082.8 6859741.2, 661085.1 6859733.2, 661086.2 6859724.7, 661085.2 6859713.4, 661085.2 6859707.8, 661085.3 6859699.1, 661084.5 6859657.9, 661080.9 6859625.1, 661076 6859590.9, 661067.3 6859553.4, 661061.9 6859532.2, 661059.9 6859526, 661058.8 6859522.5, 661057.8 6859519, 661058.2 6859516.1, 661059 6859512.7, 661058.7 6859510.5, 661056.9 6859508.6, 661054.8 6859506.8, 661052.3 6859505.1, 661051.4 6859503.3, 661046 6859490.8, 661036.5 6859471.6, 661022.8 6859449.4, 661013.8 6859435.9, 661003.8 6859423.3, 660993.6 6859412.7, 660983.8 6859403.8, 660966.3 6859390.1, 660955 6859382, 660945.2 6859375, 660939.3 6859370.4, 660930.3 6859364.2, 660922.3 6859359.1, 660898.5 6859342.7, 660883.6 6859331.6, 660869.7 6859320.3, 660842.4 6859295.1, 660838.7 6859291, 660820.5 6859270.2, 660804.1 6859248.7, 660787.1 6859223.1, 660772.6 6859197, 660768.7 6859188.2, 660768.2 6859185, 660768.8 6859182.1, 660769.3 6859178.9, 660769.1 6859177.2, 660767.6 6859174.8, 660765.5 6859173.3, 660763.5 6859172.2, 660761.7 6859170.8, 660757.6 6859162.1, 660751.8 6859145.6, 660746.1 6859128.6, 660741.3 6859112.3, 660736.5 6859097, 660731.4 6859078.7, 660728.4 6859065.4, 660727.7 6859062.7, 660725.9 6859054.5, 660721.6 6859033.3, 660717.9 6859015.9, 660710.8 6858980.5, 660708.2 6858966.1, 660705.7 6858951.6, 660702.9 6858935.3, 660701.1 6858920.1, 660700.4 6858913.7, 660698.8 6858899.7, 660697.4 6858883.8, 660695.4 6858852.9, 660695.5 6858833, 660697.1 6858784.3, 660697.7 6858769, 660698 6858765, 660698.7 6858751.5, 660704.7 6858749.6, 660713 6858747.2, 660721.4 6858744.6, 660730.4 6858742.1, 660740.6 6858756.1, 660752.2 6858747.2, 660755.3 6858744.8, 660809.8 6858717.9, 660788.4 6858638.4, 660780.9 6858612.1, 660776.1 6858595.6))
-ARR_MUNI0000000009736035;75111;75056;Paris 11e Arrondissement;2006-08-02 08:36:54;2021-01-06 10:08:45;;;75011;PAIHABIT0000000000148262;SURFACTI0000000000143046;145903;POLYGON ((654295.2 6863738.4, 654303 6863727.4, 654363.9 6863637.6, 654395.7 6863596, 654461.5 6863516.3, 654559 6863398.5, 654561.8 6863395.2, 654565 6863391.4, 654636.7 6863308.7, 654692 6863244.4, 654735.9 6863193.4, 654742.4 6863178.9, 654743 6863177.4, 654748.4 6863163.7, 654758.8 6863136.4, 654769.8 6863112, 654780.1 6863091.7, 654783.4 6863087.4, 654804 6863060, 654832.7 6863021.9, 654860.4 6862983.9, 654875.9 6862962.7, 654896.9 6862933.6, 654960.2 6862849.8, 655042.7 6862736, 655052.4 6862721.9, 655055.5 6862715, 655060.1 6862704.6, 655109.6 6862544.6, 655122.5 6862502.3, 655161.1 6862377.5, 655163 6862371.5, 655173.8 6862337.5, 655202.9 6862243.8, 655204.5 6862237.9, 655206.4 6862230.4, 655210.1 6862223.4, 655210.8 6862222.5, 655212.8 6862219.9, 655216.4 6862216.6, 655222.3 6862212.4, 655230.7 6862208.9, 655235.3 6862207, 655243.8 6862203.3, 655249.4 6862200.8, 655402.4 6862130.6, 655405.1 6862128.9, 655409.1 6862126.4, 655426.5 6862112.2, 655500.5 6862051.5, 655561.2 6862001.8, 655681.7 6861757.5, 655758.4 6861608.7, 655758.8 6861607.9, 655853.2 6861421.2, 655853.9 6861419.3, 655857.4 6861410, 655861.9 6861392.2, 655878.1 6861317.9, 655879.6 6861312, 655892 6861250.6, 655912 6861157.2, 655914.4 6861148.5, 655914.4 6861148, 655914.2 6861136.8, 655909.1 6861096, 655904.5 6861062.7, 655836.1 6861072.8, 655786.8 6861078.8, 655744.1 6861085.2, 655728.2 6861087.6, 655713.4 6861089.8, 655672.6 6861095.6, 655627.3 6861106.3, 655592.1 6861114.5, 655553.9 6861123.1, 655545.8 6861125.1, 655486.6 6861138.7, 655455.7 6861145.4, 655380.7 6861163.5, 655371 6861165.8, 655287.5 6861185.8, 655251 6861194.5, 655243.9 6861196.2, 655199.3 6861206.9, 655040.5 6861245.1, 654848.5 6861291.7, 654830.2 6861296.6, 654807.2 6861301.1, 654789.1 6861304.4, 654776.2 6861306.6, 654769.6 6861307.8, 654743.1 6861311, 654728.1 6861312.8, 654719.9 6861313.9, 654713.4 6861314.7, 654634.6 6861323.9, 654611.5 6861329.1, 654608 6861329.6, 654605.4 6861329.9, 654511.8 6861335.6, 654508.2 6861336.3, 654474.5 6861343.4, 654458.5 6861347.1, 654422.5 6861355.1, 654415.5 6861357.2, 654397.6 6861364.1, 654342.7 6861385.3, 654330.3 6861390.2, 654312.5 6861397.1, 654300.5 6861401.7, 654266.3 6861414.9, 654221.1 6861432.2, 654173.6 6861448.5, 654164.9 6861451.9, 654144.2 6861459.9, 654127.7 6861466.3, 654121.1 6861468.9, 654098.4 6861478.3, 654050.6 6861497, 654043.2 6861500.2, 654024.6 6861508.1, 654005.6 6861516.1, 653983.5 6861525.6, 653962.6 6861534.9, 653943.8 6861542.8, 653941.3 6861543.8, 653918.9 6861554.3, 653897.5 6861566.4, 653863.4 6861591.5, 653860.9 6861593.3, 653844.4 6861608.4, 653807 6861645.1, 653790.8 6861654.4, 653788.8 6861655.6, 653729.9 6861646.7, 653717.3 6861644.8, 653715.5 6861644.5, 653707.7 6861643.4, 653706.4 6861652.4, 653705.2 6861660.9, 653704.6 6861664.6, 653696.7 6861719.7, 653693.7 6861740.8, 653680.4 6861827.1, 653663.6 6861937.2, 653645.4 6862063.9, 653633.7 6862137.3, 653617.9 6862244.8, 653606.1 6862321.6, 653602.4 6862346.2, 653592.1 6862415.8, 653582.6 6862479, 653577.3 6862514.5, 653570.7 6862557.6, 653566.6 6862585, 653552 6862679.6, 653545.3 6862726.9, 653542.2 6862746.7, 653537.8 6862760.8, 653515.5 6862817.4, 653477.4 6862914.7, 653473.9 6862923.7, 653461.9 6862954.4, 653447.2 6862993.4, 653439.9 6863011.2, 653430.8 6863034.1, 653422.3 6863056.1, 653408.7 6863091.8, 653406.4 6863100.5, 653401.5 6863118.5, 653390.2 6863152.7, 653382.7 6863172.9, 653366.9 6863218.8, 653364.9 6863220.2, 653355.9 6863226.9, 653352.2 6863229.6, 653348 6863232.6, 653344.6 6863235.2, 653338.9 6863239.4, 653338.6 6863239.6, 653335.2 6863242.1, 653370.9 6863267.2, 653381.7 6863273.9, 653394.3 6863280.7, 653428.8 6863300.3, 653449.3 6863312, 653463.9 6863321.2, 653500.8 6863339.2, 653528.8 6863351.9, 653570.4 6863368, 653582 6863372.7, 653586.3 6863374.5, 653594.9 6863378.2, 653610.6 6863384.8, 653627.2 6863394.1, 653629.4 6863395.5, 653652.9 6863408.7, 653739.4 6863457.8, 653792.3 6863482.7, 653863.6 6863514.3, 653881.9 6863523.2, 653900.3 6863531.9, 653999.9 6863576.4, 654033.3 6863593.1, 654044.5 6863598.9, 654058.9 6863607.5, 654090.2 6863627.8, 654091 6863628.3, 654101.4 6863635.4, 654109.6 6863640, 654128.3 6863649.9, 654130.1 6863650.8, 654154 6863663.2, 654160.6 6863666.7, 654205.3 6863690, 654208.5 6863691.6, 654218.4 6863696.7, 654220.2 6863697.6, 654233.1 6863704, 654245 6863710.3, 654288.9 6863734.6, 654295.2 6863738.4))
-"""
+        _sio = AbstractGeoDataFrameDemos._dataset(
+            "GeoDataFrameDemosB", "arrondissementsDeParis.csv"
         )
         return GeoDataFrameLib.read_csv(_sio)
 
@@ -122,10 +99,8 @@ BDT_3-3_SHP_LAMB93_D075-ED2022-12-15/TRANSPORT/TRONCON_DE_ROUTE.shp")
 
         intraPeriph.to_csv("/tmp/intraPeriph.csv", index=False)
         """
-        _sio = StringIO(
-            """geometry
-POLYGON Z ((649224.1 6866383.6 34.4, 649259.3 6866404.7 35.1, 649305.5 6866430.5 36, 649391.2 6866478.6 37.8, 649442.4 6866507.2 37.9, 649449.1 6866511 37.9, 649458.4 6866516.2 37.9, 649467 6866521.1 38, 649479.3 6866528.4 38.1, 649508.6 6866544.5 38.4, 649604.2 6866597.9 39.3, 649610 6866601.2 39.3, 649615.6 6866604.3 39.3, 649645.1 6866620.6 39.3, 649653.7 6866625.3 39.3, 649658.2 6866627.8 39.3, 649661.9 6866629.8 39.3, 649669.3 6866633.9 39.4, 649681.8 6866640.8 39.4, 649737.8 6866671.5 39.4, 649752.4 6866679.6 39.4, 649803.3 6866702.4 39.4, 649865.2 6866730.1 39.4, 649878.1 6866735.9 39.4, 649896.7 6866744.3 39.4, 649973.7 6866778.8 39.4, 649997.4 6866789.4 39.4, 650009.9 6866795.1 39.4, 650035.4 6866806.5 39.4, 650058.6 6866816.8 39.4, 650070.9 6866822.2 39.4, 650093.8 6866832.4 39.4, 650111 6866839.8 39.4, 650166.5 6866864.2 39.4, 650238.6 6866895.8 39.4, 650276.5 6866910.1 39.4, 650294.7 6866915.7 39.4, 650301.1 6866917.3 39.4, 650311 6866919.5 39.4, 650346.9 6866925.9 40.5, 650379.6 6866929.6 41.6, 650404.1 6866930.9 43.2, 650412.8 6866931.1 43.4, 650467.7 6866932.4 44.7, 650493.1 6866932.9 44.9, 650551.8 6866934.2 45.2, 650611.2 6866935.7 45.7, 650647.7 6866936.4 45.8, 650729.8 6866938.4 46.2, 650794 6866939.7 46.3, 650847.8 6866940.9 46.4, 650856.5 6866941.1 46.3, 650868 6866941.5 46.2, 650881.1 6866941.8 46.2, 650915 6866942.7 46, 650973 6866943.9 46.3, 651069.4 6866946.1 47.2, 651131.5 6866947.5 47.8, 651162.9 6866948.1 48.3, 651194.2 6866948.8 49, 651228 6866949.8 48.7, 651242.6 6866950 48.7, 651306.9 6866951.7 49.5, 651350 6866952.6 49, 651480.3 6866955.5 50.4, 651596.6 6866957.9 50.4, 651640.4 6866959.2 50.3, 651667.7 6866959.8 50.1, 651674.4 6866960 49.3, 651699.8 6866960.6 50.9, 651801.7 6866963 51.4, 651872.1 6866964.6 52.3, 651963.6 6866966.8 50.9, 652018.9 6866968.1 50.3, 652073.6 6866969.4 47.5, 652127.6 6866970.7 47.7, 652166.6 6866971.6 47.7, 652181.6 6866971.9 49, 652249.4 6866973.5 49.7, 652335.1 6866975.1 50.6, 652421.4 6866977.4 51.6, 652451.1 6866978.3 52.3, 652479.2 6866978.9 52.9, 652497.5 6866979.5 53.4, 652525.4 6866980 52.9, 652537.7 6866980 53.2, 652546.1 6866979.8 53.7, 652564.3 6866979.4 54, 652574.6 6866979 54.8, 652587.3 6866978.6 54.8, 652598.4 6866977.9 54.3, 652612.8 6866977 55.4, 652625.1 6866975.9 55.4, 652633.4 6866975.1 55.5, 652642.1 6866974.2 55.9, 652653.3 6866972.9 55.5, 652683.7 6866969.3 55.2, 652694.5 6866968.1 55.2, 652703.3 6866967.1 55.4, 652713 6866966.1 55.4, 652733.7 6866963.7 55, 652746.9 6866962.2 55.6, 652767.2 6866959.9 55.6, 652786.7 6866957.4 55.5, 652805.4 6866955 54.7, 652825.7 6866952.5 55.1, 652841.2 6866950.7 54.5, 652855.8 6866949.4 54.7, 652872.4 6866947.9 55.1, 652885.4 6866946.9 55.1, 652904.1 6866945.7 54.8, 652925 6866944.9 54.5, 652949.4 6866944.3 54, 652970.5 6866943.9 53.7, 653017.3 6866942.7 53, 653032.6 6866942.4 52.9, 653072.2 6866941.1 52.3, 653093.6 6866940.6 51.9, 653204.7 6866938 49.8, 653257.8 6866936.5 49, 653282.3 6866935.4 48.7, 653321.5 6866934.7 47.7, 653367.5 6866932.9 46.6, 653417.2 6866931.4 46.1, 653444.7 6866928.3 45.9, 653453.6 6866927.7 45.7, 653492.4 6866926.8 45.6, 653512.9 6866926.3 45.6, 653542.5 6866926.7 44.6, 653559.3 6866928.5 44.1, 653600.7 6866927.5 43, 653646.4 6866926.7 41.9, 653727.7 6866924.7 39.6, 653822.7 6866922.3 37.2, 653839.1 6866921.9 37.6, 653946.3 6866919 40.6, 653962.3 6866918.2 40.2, 653976.8 6866917.3 40, 653997.6 6866915.3 40.9, 654018.4 6866912.8 41.9, 654052.9 6866907.8 43, 654146.1 6866893.4 43.7, 654229.3 6866880.7 44.5, 654267.3 6866875 44.5, 654280.1 6866873.2 44.2, 654312 6866869 45.3, 654341 6866866.7 46.7, 654354.9 6866865.9 47.3, 654369.5 6866865.1 48.1, 654390 6866864.6 49.1, 654485 6866865.1 49.6, 654532.2 6866865.6 50.4, 654549.3 6866865.7 50.6, 654564.4 6866865.7 50.9, 654580.7 6866866 51.3, 654612.1 6866866.1 51.3, 654623.2 6866866.2 51.2, 654642.6 6866866.3 52.1, 654653.6 6866866.6 52.8, 654669.1 6866866.8 52.8, 654687 6866867.2 52.9, 654713.9 6866868.5 53.9, 654740.2 6866870 55.3, 654822.6 6866876 56.1, 654834.8 6866877 56.5, 654853.8 6866878.6 57, 654882.9 6866880.6 57, 654899.9 6866882 56.7, 654915.5 6866883.1 56.5, 654934.6 6866884.6 56.6, 654954.3 6866886.2 56.5, 655035.3 6866891.8 56.1, 655073.9 6866893 55.5, 655129 6866892.2 55.5, 655162.7 6866890.2 55.1, 655172.2 6866889.3 54.9, 655192.2 6866887.3 55.1, 655204 6866886.1 55, 655221.6 6866883.6 54.9, 655240.7 6866880.4 54.8, 655259.2 6866876.6 54.3, 655274.2 6866873.3 54.3, 655293.3 6866868 54.3, 655311.9 6866862.3 54.3, 655325.4 6866857 54.3, 655341.1 6866850.7 54.3, 655363.4 6866840.7 54.3, 655385.4 6866828.4 55.7, 655401.1 6866818.3 57.4, 655412 6866810.6 57.8, 655423.5 6866801.5 57.6, 655435.3 6866791.6 57.4, 655444.2 6866783.4 58.4, 655457.9 6866770 58.4, 655489.1 6866733.3 58.8, 655493.1 6866728.2 58.9, 655505.1 6866710.7 59.6, 655513 6866696.8 60, 655521.2 6866680.5 59.4, 655525.9 6866670.9 59.4, 655530.2 6866661.7 59.6, 655534.2 6866651.3 59.6, 655537.4 6866642.7 59.8, 655541.1 6866632.4 60.5, 655543.2 6866626.7 60.6, 655545.8 6866618.8 61, 655556.1 6866577.8 61.3, 655558.8 6866565.6 61.6, 655560.7 6866556.4 60.8, 655563.2 6866544 61.8, 655573.3 6866493.4 60.5, 655580.7 6866455.4 60.8, 655589.6 6866410.6 60.5, 655594 6866388.1 60.5, 655608.7 6866314.1 60.8, 655613.8 6866289.1 60.5, 655616.8 6866272.8 60.5, 655620 6866251.8 60.5, 655632.2 6866185.8 61.5, 655655.5 6866052.3 63.6, 655658.5 6866035 63.6, 655663 6866009.7 63, 655665.7 6865994.9 64.1, 655667.6 6865982.8 64.1, 655672.2 6865956.7 64.2, 655674.3 6865943.1 64.4, 655683.5 6865892.3 64.8, 655687.7 6865868.1 65, 655696 6865822.1 65.2, 655703.2 6865781.9 65.4, 655706.3 6865763.3 65.4, 655710.3 6865741.1 65.4, 655713 6865725.9 65.5, 655726.4 6865650.5 65.4, 655730 6865630.1 65.4, 655735.1 6865601.3 65.3, 655739.8 6865575.3 65.3, 655749.3 6865523.5 65.3, 655766.8 6865424.2 65.6, 655778.5 6865356.6 65.7, 655781.5 6865342.5 65.9, 655784 6865329.4 66.2, 655790.1 6865304.5 65.8, 655791 6865300.6 65.9, 655793.2 6865292.2 66, 655793.5 6865291.1 66, 655794.7 6865286.6 66.2, 655796.5 6865280.1 66.2, 655798.5 6865273.1 66.2, 655800.5 6865266.2 66.3, 655807.3 6865249.5 66.4, 655816.8 6865225.8 66.8, 655822.2 6865213.1 66.8, 655822.5 6865212.5 66.8, 655843 6865172 67, 655867.9 6865130.7 68.1, 655886.2 6865103.7 68.7, 655904.5 6865079.8 70.3, 655925.5 6865054.3 73.8, 655935.6 6865042.2 75.5, 656022.9 6864932.9 76.7, 656026 6864929 77.9, 656030.4 6864923.6 79.6, 656059.6 6864888.1 81.5, 656082.3 6864860.6 83.1, 656135 6864800 83.2, 656143.2 6864792.8 83.3, 656162.6 6864776.6 84.2, 656172.5 6864768.9 84.8, 656191.9 6864755.1 85.5, 656215 6864740.9 86.2, 656235.9 6864729.5 87.3, 656262.8 6864717.3 88.7, 656292.2 6864705.2 90.1, 656318.3 6864694.8 91.7, 656354.9 6864678.6 92.4, 656383.7 6864665.9 94.4, 656405.5 6864654.5 95, 656427.7 6864641.1 95.6, 656450.2 6864626.9 96.9, 656471.8 6864610.9 98.2, 656490.7 6864595 98.6, 656508.7 6864576 99.8, 656524.9 6864557.1 101.2, 656543.4 6864533.5 101.8, 656560.5 6864509 102.7, 656569.6 6864493.1 102.7, 656578.9 6864475.3 102.7, 656589.4 6864452.4 102.7, 656625.8 6864358.2 102.9, 656632 6864343 102.9, 656642.4 6864317.1 102.9, 656653.5 6864288.3 102.9, 656663.8 6864260 104.2, 656679.1 6864217.5 106.8, 656695 6864178.7 111.2, 656705.7 6864152.4 112.3, 656715.2 6864126.8 112.8, 656719.8 6864115.3 113, 656724.2 6864105 113, 656729.7 6864091.6 112.9, 656739.4 6864069.2 112.8, 656744.6 6864059.1 112.8, 656774.4 6864003.4 112.7, 656792.2 6863970.6 112.6, 656807.3 6863944.2 112.6, 656830.5 6863904.1 112.3, 656854.9 6863858.7 111.8, 656871.8 6863825.5 109.6, 656888.1 6863793 108.1, 656901.4 6863765.8 105.3, 656912.9 6863739.2 104.3, 656922.7 6863712.7 103.3, 656931.9 6863687.4 103.1, 656937.5 6863668.1 102.6, 656942.4 6863648.7 101.6, 656947.1 6863625.9 100.8, 656951.4 6863601.5 99, 656954.7 6863577.3 97.9, 656957.8 6863549.7 97.5, 656959.6 6863521 96.3, 656959.9 6863500.9 94.1, 656959.1 6863433.9 92.5, 656958.5 6863396.1 91.8, 656957.7 6863360.9 88.8, 656957.3 6863329.3 88.5, 656956.9 6863303.6 86.7, 656954.8 6863195.5 85.8, 656954.6 6863176.6 81.2, 656953.3 6863116.5 79.1, 656952.3 6863062.5 78.1, 656951.7 6863025 77.6, 656951.4 6863006.1 75.2, 656951.3 6862980.5 74.8, 656951.8 6862948.6 74.4, 656952.4 6862921.1 73.4, 656954.7 6862875.9 71.9, 656956.5 6862851.6 71.6, 656961.5 6862797.3 71.1, 656964.6 6862765.3 69.7, 656968.6 6862723.9 68, 656973.7 6862673.6 67.5, 656974.6 6862663.4 66.5, 656989.4 6862514.8 65.7, 656992.7 6862482.3 65.4, 656994 6862469.2 65.4, 656999.2 6862416.2 65.4, 657006.3 6862343.3 63.6, 657012.5 6862256.6 61.6, 657012.8 6862206.9 60.9, 657012.3 6862195.1 60.5, 657008.6 6862134 60.1, 656999.2 6862012.3 58.5, 656997.2 6861984.9 59, 656995.3 6861959.2 58.1, 656992 6861919.3 57.6, 656988 6861869.4 55, 656986.2 6861809.3 53.9, 656986.7 6861784.8 54.3, 656988.8 6861756.6 54.9, 656992.1 6861726.6 54.9, 656996.5 6861699.1 54.3, 656999.6 6861680.4 54, 657011.3 6861633.5 53.4, 657018 6861611.5 52.8, 657024.7 6861591.9 52.3, 657040.2 6861551.8 52.3, 657046.8 6861534.6 53.5, 657053.7 6861516.6 53.5, 657063.1 6861492 52.3, 657075.2 6861452.6 53.1, 657078.8 6861436.7 53.4, 657081.7 6861420.8 53.8, 657084.7 6861400.4 51.2, 657086.3 6861377.5 50.3, 657086.8 6861356.7 49.7, 657085 6861330.6 49, 657082 6861306.8 48.4, 657069.3 6861218.1 47.4, 657062.4 6861164.5 45.4, 657059.3 6861142.4 45.4, 657056.2 6861118.1 45.4, 657045.4 6861048.5 46, 657032.9 6860962.7 46.2, 657024 6860905.3 46.5, 657022.2 6860888.7 46.6, 657014.4 6860833.4 47.1, 657002.9 6860755.3 46.1, 656985 6860634.3 45.1, 656976 6860569.2 44.2, 656972.5 6860529.8 44.1, 656969.3 6860483.1 44.3, 656965.5 6860421 45.7, 656961.3 6860371 46.5, 656956.9 6860301.5 48.8, 656956.2 6860290.1 48.8, 656955.2 6860277 48.8, 656952.5 6860233.9 48.6, 656945.6 6860182.1 48.6, 656935.9 6860123 48.4, 656927.1 6860079.1 49.4, 656893.4 6859915.5 50.1, 656891.6 6859907.7 50.1, 656881.7 6859866 50.1, 656870.1 6859816.3 50.1, 656865.6 6859794.6 49.7, 656859.4 6859768.5 49.1, 656851.1 6859739.2 48.7, 656844.2 6859718 48.1, 656843.6 6859716.1 48.1, 656838 6859701.4 47.4, 656829.2 6859678.9 46.1, 656809 6859643 45, 656795.4 6859623.4 43.9, 656779.7 6859603.1 42.8, 656763.1 6859584.8 42.1, 656745.9 6859567.3 41.6, 656716.2 6859542.7 40, 656530.6 6859439.9 40.4, 656482.1 6859411.1 40.3, 656452.6 6859390 40.3, 656429.2 6859371.1 40.3, 656365.7 6859316.3 41.3, 656215.9 6859189.6 42, 656183.3 6859160.6 42.2, 656159.1 6859137.5 42, 656120.3 6859099.1 41.4, 656070.9 6859048.1 40.8, 656018 6858996.4 41.7, 655988.5 6858973.4 44.3, 655947.7 6858949.3 45.2, 655916.8 6858936 46.6, 655882.8 6858923.4 48.3, 655877.3 6858921.5 48.5, 655854.7 6858914.1 49, 655850.3 6858912.6 48.6, 655842.2 6858910 48.5, 655834.6 6858907.4 48.7, 655825.5 6858904.3 48.9, 655817.2 6858901.6 49, 655808.7 6858898.8 49.1, 655805.2 6858897.5 49.1, 655798.7 6858895.4 49.1, 655794.1 6858893.8 49.1, 655786.2 6858891.1 49.3, 655769.2 6858885.4 49.4, 655755.5 6858880.8 49.5, 655743.2 6858876.7 49.5, 655731.2 6858872.7 49.5, 655718.8 6858868.5 49, 655712.4 6858866.3 48.9, 655705.7 6858864 49.1, 655699.8 6858862 49.1, 655693.2 6858859.8 49.1, 655682.7 6858856.3 48.9, 655673.9 6858853.2 49.2, 655665 6858850.2 49.1, 655652.8 6858846.2 49, 655647.4 6858844.3 49.1, 655641 6858842.1 49, 655629.1 6858838.2 48.6, 655624.4 6858836.8 48.8, 655610.3 6858832.5 48.7, 655607.1 6858831.7 48.7, 655587.3 6858826.6 48.6, 655564.6 6858821.8 47.9, 655557.9 6858820.6 47.9, 655540.4 6858817.6 48.2, 655498.7 6858810.5 46.7, 655461.8 6858804.2 45.3, 655451.9 6858802.4 45.3, 655440 6858800.3 44.8, 655432.1 6858799 44.4, 655422.8 6858797.3 44.1, 655415.8 6858796.2 44, 655407.4 6858794.7 43.4, 655398.6 6858793 43.5, 655389.2 6858790.6 43.5, 655381.5 6858788.7 43.5, 655373.1 6858786.6 43, 655361.7 6858783.5 42.9, 655349.2 6858779.2 42.7, 655336.3 6858774.5 42.5, 655322 6858769.1 42.3, 655305.4 6858762.5 42.3, 655287.6 6858754.5 42.2, 655272.5 6858747 42.5, 655260.2 6858740.8 42.5, 655251.4 6858736.2 42.7, 655241.6 6858731.3 42.8, 655232.2 6858726.5 43.1, 655220.8 6858720.6 43.4, 655214.8 6858717.7 43.5, 655211.7 6858716.1 43.5, 655208 6858714.4 43.5, 655202.4 6858712 43.5, 655192.1 6858707.3 43.7, 655173.5 6858698.9 44.3, 655126.1 6858675 44.3, 655099.6 6858661.7 43.2, 655088.8 6858655.8 43.9, 655079.9 6858651.1 43.6, 655041.5 6858630.3 43.1, 655015 6858616.8 42.7, 654989.3 6858602.9 41.7, 654920.5 6858568.5 39.5, 654904.9 6858559.8 40.2, 654887.3 6858550.2 41.4, 654863.3 6858534.7 41.6, 654843.7 6858521.3 41.7, 654798.6 6858489.1 43.5, 654793.6 6858485.6 43.6, 654780.4 6858474.5 44.1, 654767 6858462.6 44.2, 654744.5 6858442.8 45, 654718.2 6858419.7 46.9, 654701.1 6858404.3 46.9, 654689.5 6858393.9 46.9, 654667.1 6858373.7 47.5, 654656.8 6858364.6 47.8, 654640.8 6858350.2 47.3, 654607.6 6858320.6 48.3, 654585.3 6858301 47.4, 654561.9 6858279.9 47.3, 654538.2 6858258.9 47.3, 654523.2 6858245.4 47.4, 654505.9 6858230 47.4, 654488.3 6858214.2 47.2, 654464.2 6858192.8 46.7, 654443.3 6858174.2 46.6, 654428.2 6858160.7 46.7, 654416.8 6858150.6 46.1, 654400.5 6858136.9 46.2, 654388.9 6858128.2 46.3, 654381.9 6858122.9 46.1, 654360.1 6858107.9 46, 654340.9 6858096.6 46.2, 654323.6 6858087 46.5, 654292.6 6858069.9 47.5, 654256.8 6858052.5 47.6, 654230.7 6858039.8 48.5, 654189.7 6858020.8 50.6, 654143.1 6857998.4 52.4, 654065.7 6857960.8 54.3, 654001.4 6857929.1 58.5, 653947 6857902.6 57.8, 653898.4 6857878.8 58.1, 653842.7 6857851.6 58.6, 653829.5 6857845.2 58.6, 653782.3 6857822.4 58.6, 653778.4 6857820.5 58.8, 653748.1 6857805.9 58.8, 653746.1 6857805 58.8, 653717 6857791 58.5, 653679.6 6857772.6 57.8, 653641.4 6857754.1 56.6, 653595.3 6857731.5 55.5, 653549.1 6857708.7 54, 653513 6857690.6 53.2, 653474.1 6857671.2 53, 653443.3 6857654.2 53, 653424.3 6857642.6 53.1, 653401.5 6857628.3 52.4, 653375.1 6857610.9 52.4, 653349.1 6857593.3 52.4, 653333.1 6857582.6 53.4, 653324.4 6857576.8 54, 653304.2 6857564.3 54.2, 653290.9 6857556.1 54.5, 653277.9 6857549.5 53.9, 653260.2 6857543 54, 653246.9 6857538.7 54.2, 653232.3 6857535.2 54.4, 653218.5 6857532.2 54.5, 653206.9 6857530.7 54.8, 653185.1 6857528.3 53.5, 653151.5 6857527.3 55.1, 653104 6857531.3 53.9, 653042.6 6857537.9 53.7, 652976.7 6857545.6 51.5, 652929.5 6857550.9 53.4, 652887.8 6857555.1 53.2, 652856.9 6857557.4 53.2, 652835.2 6857559.8 53.1, 652823.8 6857561.1 53, 652794.2 6857566.2 52.1, 652776.8 6857570 52.1, 652757.4 6857576.6 50.6, 652745.7 6857581 50.5, 652732 6857588.1 50.3, 652724.2 6857592.2 49, 652716.1 6857596.7 50, 652705.6 6857602.6 50, 652689.3 6857614.7 49.7, 652675 6857625.8 49.3, 652673.8 6857626.7 48.6, 652664 6857635.5 48.7, 652647.6 6857649.3 48.7, 652618.8 6857675.2 48.8, 652587.2 6857699.9 49, 652569.5 6857712 49, 652568.5 6857712.5 49.2, 652540.9 6857724.2 49.6, 652516.3 6857733.7 50, 652504.7 6857737.2 50.2, 652495.6 6857739 50.1, 652480.9 6857742.2 49.9, 652467.1 6857744.5 49.9, 652452 6857745.8 49.9, 652428.9 6857746.1 50.3, 652409 6857745.3 50.7, 652386.6 6857742.4 52, 652364.3 6857739.7 52.7, 652343.9 6857734.6 53.5, 652323.6 6857728.4 54.1, 652301.5 6857720.8 55.2, 652282.7 6857713.2 55.9, 652262.3 6857704.3 56.5, 652244.9 6857695.3 56.6, 652220.9 6857682.8 58.1, 652197.2 6857668.6 58.9, 652174 6857654.4 59.8, 652162.1 6857646.4 60.1, 652156.7 6857642.6 61.4, 652152.7 6857639.7 61.4, 652140.2 6857631.1 61.4, 652121 6857619.8 61.8, 652110.8 6857613.8 62.7, 652102.5 6857608.7 63.5, 652087.7 6857600.6 63.5, 652075.8 6857594.8 63.7, 652049.3 6857583.8 63.9, 652029.2 6857577.7 64.4, 652006.8 6857573.2 64.6, 651993.8 6857571.7 64.6, 651986.7 6857570.8 65.1, 651978.2 6857570.5 65.8, 651962 6857570.5 65.8, 651939.6 6857571.9 66.7, 651919.7 6857573.4 66.7, 651897 6857575.7 67.2, 651871.2 6857577.7 67.7, 651858.8 6857578.9 68, 651830.2 6857581.7 68.2, 651804.6 6857584.6 68.9, 651781 6857586.9 68.4, 651741.7 6857591 68.4, 651714.9 6857592.1 68.6, 651690.2 6857594.6 68.6, 651659.2 6857597.5 69.2, 651641.6 6857599.1 69.5, 651624.5 6857600.7 70.2, 651577.7 6857605 70.8, 651560.6 6857606.3 71.6, 651453.7 6857615.8 73.8, 651432.7 6857617.7 74.3, 651410.8 6857619.5 74.8, 651392.3 6857620.4 75.2, 651365.4 6857621 75.7, 651326.1 6857621.4 76.5, 651299 6857621.6 76.7, 651288.3 6857621.9 76.9, 651276 6857622.4 77.2, 651262.9 6857624.1 76.9, 651251.1 6857626 76.7, 651238.5 6857628.9 76.7, 651227.4 6857632.3 76.2, 651214.1 6857637.2 75.6, 651202.3 6857642.6 74.5, 651189.5 6857649.6 74.3, 651178.1 6857657.3 75.4, 651168 6857665.2 74.9, 651156.7 6857675.2 76.1, 651139 6857692.8 75.9, 651113.1 6857720.8 78.5, 651084.2 6857751.3 78.6, 651064.4 6857770.2 78.4, 651053.5 6857780.4 78.3, 651044 6857788 79, 651034.7 6857795.1 79.8, 651028.8 6857799.4 80.4, 651022.2 6857803.6 81.2, 651011.7 6857810 80.5, 651004 6857814.3 80.2, 650998 6857817.5 81.1, 650990.6 6857820.8 82.3, 650983.2 6857824 82.1, 650971.5 6857828.7 82, 650946.9 6857837.8 81.5, 650921 6857846.8 81.1, 650877.5 6857861.1 80.1, 650814.7 6857880.5 78.5, 650792.1 6857887.8 78, 650723.9 6857911 76.3, 650665.8 6857932.2 73.3, 650643.9 6857940.5 72.2, 650606.1 6857953.5 70.4, 650514.6 6857985.2 67.6, 650454 6858006.3 64, 650417.1 6858019.5 63.1, 650355.5 6858040.5 63.7, 650277.1 6858067 60.6, 650250.3 6858075.5 58.6, 650222.3 6858083.1 56.6, 650189.2 6858090.8 58.4, 650108.2 6858116.1 61.1, 650025.5 6858144.9 68.1, 649978.7 6858160.8 67.4, 649835.7 6858211.6 65.8, 649821.9 6858217.9 64.5, 649774.7 6858239.2 63, 649752.3 6858248.3 62.3, 649724.3 6858258 61.5, 649640.1 6858287.8 61.4, 649503.7 6858335.1 64.3, 649440.5 6858357 65.2, 649360.6 6858385.1 59.4, 649200.2 6858440.2 60.6, 649164.9 6858452.4 63, 648963.1 6858522.5 60.9, 648928.7 6858534.9 60.1, 648734.7 6858604.4 55.8, 648573.6 6858657.3 52.3, 648532.3 6858671.7 56.5, 648494.4 6858684.8 58.1, 648380 6858725.2 58.6, 648356 6858733.2 58.6, 648285.2 6858757.4 57.8, 648211.9 6858783.6 49.6, 648168.8 6858798.3 49.6, 648141.3 6858807.3 49.4, 648105.2 6858821 49.4, 648058 6858840.8 49.5, 648008.4 6858864.5 51.9, 647967.1 6858887.1 54.1, 647932.1 6858908.4 54.1, 647924.3 6858913.8 54.4, 647906.5 6858925.6 53.1, 647878.3 6858945.5 53.4, 647802.3 6858998.7 55.8, 647760 6859027 53.7, 647708.3 6859062.8 52.3, 647640.2 6859110.1 51.9, 647570.6 6859157.2 48.4, 647505.1 6859199.7 46.9, 647441.7 6859240.3 44.7, 647369.9 6859285.3 41.7, 647264.8 6859352.4 40.3, 647197.6 6859394.4 39.5, 647133.7 6859434.7 38.5, 647090.7 6859462.4 39.7, 647043.9 6859491.2 39.8, 646967.6 6859539.2 40.4, 646961.8 6859543 40.4, 646937.8 6859558.1 40.4, 646917 6859571.2 40.4, 646905.2 6859578.5 40.3, 646895 6859584.9 40.1, 646841.7 6859618.3 39, 646818.7 6859631.3 38.5, 646806.6 6859638 38.1, 646802.3 6859640 38.1, 646786.1 6859648 37.9, 646767.8 6859656.4 37.8, 646746.9 6859665.6 37.1, 646730.9 6859672 36.7, 646723 6859674.7 36.6, 646709 6859679.9 36.5, 646687.8 6859687.6 36.4, 646664.3 6859695.4 35.9, 646642.6 6859702.4 37.2, 646611.6 6859711.5 37.2, 646596.1 6859715.4 37.4, 646590.6 6859716.6 37.4, 646570.8 6859720.9 37.5, 646550.1 6859724.7 37.7, 646532.2 6859727 37.7, 646514.8 6859728.4 38, 646492.6 6859729.9 38.5, 646462.9 6859730.5 40.2, 646443.6 6859729.9 40.2, 646428.9 6859728.9 40.2, 646413.6 6859727.4 40.2, 646403.3 6859726.1 40.2, 646387.8 6859723.5 41.5, 646376.6 6859721.5 42.4, 646261.1 6859696.6 43.7, 646235.1 6859690.9 43.6, 646217.7 6859687.3 43.8, 646205.2 6859684.6 43.5, 646192.7 6859682.6 43.4, 646176.5 6859680.7 43.2, 646151.3 6859678.6 43.2, 646132.3 6859677.7 43.8, 646114.6 6859677.5 43.1, 646097.2 6859678.1 42.6, 646073 6859680 42.4, 646052.3 6859682.1 42.4, 645972.9 6859690.3 42.7, 645769.6 6859709.7 38.1, 645765.5 6859710 38.1, 645753.6 6859711.2 37.5, 645722 6859714.6 36.8, 645693.5 6859719.3 36.3, 645679 6859722.3 35.6, 645654.2 6859728.5 34.4, 645637.2 6859733.4 33.5, 645620.6 6859738.1 32.8, 645609.2 6859742.6 32.7, 645589.8 6859750.7 32.7, 645566.5 6859761.1 30.8, 645546.5 6859771.2 29, 645528.3 6859781 27.4, 645506.3 6859795 27.4, 645490.5 6859806 27.4, 645479 6859814.1 27.4, 645474.7 6859817.7 27.4, 645473.5 6859818.6 27.4, 645469.9 6859821.5 27.4, 645458.8 6859830.8 27.4, 645447.2 6859840.3 27.4, 645415 6859867.4 27.4, 645379.8 6859904.3 31.2, 645362.8 6859925.2 31.8, 645353.8 6859937.2 31.8, 645345.1 6859949.6 31.9, 645337.9 6859960.1 31.9, 645329.4 6859974 31.9, 645318.4 6859993.5 31.9, 645312.4 6860004.5 31.8, 645307.8 6860013.3 31.8, 645300.7 6860028.6 31.8, 645288.3 6860056.3 32.3, 645282.3 6860072.3 32.6, 645277.2 6860088.7 33, 645271.6 6860112.3 32.5, 645269 6860125.7 31.7, 645263.5 6860157.4 32.1, 645260.7 6860180.4 32, 645258 6860207.1 31.9, 645254.6 6860241.1 30.9, 645253.6 6860257.7 30.6, 645253.5 6860293.8 29, 645255.7 6860323.5 28.9, 645262.1 6860374 28.8, 645269.9 6860436.8 28.8, 645281.7 6860530.8 28.8, 645288.6 6860587.5 28.8, 645294.1 6860616.6 28.8, 645302.1 6860658.7 28.9, 645324.6 6860773.8 28.9, 645328.1 6860794.1 28.9, 645331.2 6860819.1 29.1, 645334.9 6860865.7 29.4, 645334.3 6860888.3 31.7, 645333.6 6860897.9 31.8, 645331.3 6860918 29.8, 645328.9 6860936.4 29.8, 645326.3 6860953 29.8, 645322.7 6860969.6 29.8, 645314.7 6860999.9 29.8, 645302.8 6861032.3 29.8, 645299.3 6861040 29.4, 645295 6861049.3 29.4, 645286.8 6861066.2 29.4, 645274.8 6861087 29.4, 645263.3 6861103.9 29.4, 645247.1 6861127.4 30.1, 645221.4 6861162.6 31.1, 645191.4 6861210.3 35.1, 645177.7 6861237.4 36, 645159.2 6861280.7 39.5, 645147.7 6861314.7 41.6, 645140.8 6861337.8 42.5, 645136 6861360.2 43.4, 645132.2 6861381.3 42.6, 645127.7 6861415.3 41.8, 645126.7 6861442.1 42.2, 645126.8 6861473.8 42.1, 645128.3 6861498.5 41.1, 645133.2 6861546.4 42.3, 645136.3 6861567.6 42.4, 645138.3 6861580.7 42.4, 645139.9 6861587.5 42.4, 645143.8 6861600.2 42.4, 645147.2 6861611 42.4, 645155.6 6861632.5 42.4, 645160.6 6861645.1 42.4, 645172 6861671.4 42.4, 645178.9 6861685.7 42.4, 645186.1 6861699.7 42.4, 645205.7 6861729.8 42.4, 645211.1 6861737.3 42.4, 645233.5 6861766.4 42.4, 645251.5 6861788.6 42.4, 645259.3 6861797.2 42.4, 645266.7 6861805.5 42.4, 645276.1 6861816.3 42.4, 645279.2 6861819.4 42.4, 645325.3 6861866 42.4, 645378.1 6861921.1 40.9, 645470.4 6862013.9 40.1, 645520.5 6862062.9 40.1, 645584.6 6862129.3 40.1, 645648.7 6862191 40.1, 645668.9 6862208 40.1, 645692.1 6862226.2 40.1, 645708.1 6862238.5 40.1, 645723.6 6862249.3 40.1, 645753.1 6862268.2 40.1, 645777.8 6862283.7 40.1, 645806.5 6862302.5 40.2, 645837.2 6862324.4 43, 645855.1 6862338.6 43.7, 645869.1 6862351.1 44.4, 645883.9 6862365.6 45.2, 645895.1 6862377.6 45.9, 645908.1 6862392.7 46.4, 645926.3 6862416.6 47, 645938.5 6862435.8 47, 645946.1 6862446.8 46.7, 645954.3 6862460 46.4, 645960.2 6862471.5 46.4, 645964.6 6862480.1 44.8, 645975 6862503.7 44.8, 645979.2 6862514.1 44.8, 645983.9 6862525.1 44.8, 645989.8 6862540.5 44.7, 645999.2 6862564.5 44.6, 646016.8 6862610.7 43.7, 646025.1 6862631.2 43.4, 646053 6862700.3 42.5, 646062.6 6862723.6 42.2, 646077.3 6862754.1 42.2, 646092.4 6862782.3 42.2, 646105.3 6862804.4 42.2, 646135.6 6862844.9 42.2, 646155.5 6862869.9 42.2, 646196.1 6862915.6 41.9, 646231.5 6862955.3 42.5, 646244.4 6862973.3 42, 646264.5 6863002.3 43.3, 646276 6863020.5 44.1, 646290.8 6863045.2 45.2, 646302.3 6863066 45.1, 646313.3 6863087.6 45.1, 646318.8 6863098.8 45.1, 646325.2 6863112.7 45.1, 646337.5 6863140.7 44.6, 646351.8 6863173 44, 646360.9 6863193.8 43.6, 646371.3 6863217.7 43.1, 646381 6863239.9 42.8, 646394 6863267.7 42.8, 646409 6863298.2 43.2, 646423.7 6863325.9 43, 646438.2 6863354.7 42.1, 646451.5 6863378.9 41.5, 646491.9 6863440.1 41.4, 646543 6863510.1 40.3, 646549.6 6863518.1 40.4, 646563.7 6863536.8 41.1, 646597.3 6863579.5 41.1, 646623.3 6863611.8 41.2, 646646.4 6863641.2 41.2, 646669.2 6863673.9 41.2, 646708.7 6863729.8 41.2, 646722.2 6863749.1 41.2, 646734.6 6863768.4 41.2, 646746.3 6863790.5 41, 646757.2 6863814.5 40.7, 646770.6 6863842.3 40.5, 646788.4 6863876.8 40.3, 646812.8 6863919.9 40.5, 646843.3 6863972.3 40.6, 646881.3 6864037.3 40.6, 646902.5 6864073.8 40.1, 646914.1 6864093.6 37.9, 646924.2 6864109.9 37.9, 646931.8 6864121.4 37.9, 646940.2 6864133.7 34.4, 646953.3 6864150.5 34.6, 646962.1 6864161.2 34.7, 646971.8 6864172 35, 646995.2 6864195.8 35, 647045.3 6864242.3 32.5, 647094.4 6864286.8 32.3, 647125.7 6864315.4 32.1, 647150.3 6864337.5 31.8, 647165.3 6864353.2 31.8, 647176.6 6864366.6 31.8, 647193 6864387.8 31.9, 647215.2 6864419.5 33, 647223.9 6864433 33, 647233.4 6864449.5 32.7, 647255.4 6864492 32.3, 647281.1 6864539.9 31.7, 647284.5 6864546.5 31.7, 647289.2 6864556.9 31.6, 647297.2 6864575.6 31.6, 647297.9 6864578.6 31.6, 647306.5 6864603 31.5, 647312.5 6864622.1 31.4, 647321.8 6864654.4 30.9, 647325.5 6864668.4 30.8, 647329.2 6864682.5 30.6, 647333 6864696 30.5, 647341.9 6864727.2 30.4, 647350.4 6864752.9 30.4, 647367.6 6864794.9 30.3, 647406.1 6864874.3 29.2, 647415.6 6864896.1 28, 647437.8 6864945.4 28, 647453.9 6864972.2 28, 647473.7 6864999.1 28.1, 647489.3 6865017.9 27.5, 647499.6 6865029.4 26.2, 647509.8 6865039.6 26.5, 647514.9 6865044.8 26.5, 647526 6865055.7 26.5, 647537.8 6865067.2 26.5, 647593.5 6865124.2 26.5, 647602.6 6865132.8 26.5, 647620.2 6865149.3 26.5, 647654.1 6865178.1 26.5, 647655.3 6865179.2 26.5, 647660.7 6865183.9 27.1, 647668.3 6865191 28, 647675.5 6865197.5 28.5, 647698.1 6865218.5 28.8, 647808.5 6865320.1 28, 647823.3 6865334.1 28.7, 648047.4 6865540.2 30.4, 648047.9 6865540.5 30.1, 648070.2 6865558 30.7, 648088.8 6865571.6 30.7, 648103.3 6865580.9 30.9, 648126.6 6865593.9 30.9, 648170.5 6865614.3 30.5, 648174.9 6865616.2 30.5, 648185.9 6865620.8 30.5, 648280.2 6865655.1 30.5, 648299.3 6865662.4 30.5, 648363.1 6865686.5 30.5, 648374.2 6865692.2 30.5, 648381.3 6865695.8 30.5, 648416.5 6865713.3 30.5, 648447 6865729.7 30.5, 648477.5 6865746.9 30.5, 648495.5 6865757.6 30.5, 648512.7 6865769.1 30.5, 648537.7 6865785.7 30.5, 648565 6865807.1 28.9, 648589.8 6865827.5 28.9, 648609.5 6865843.7 27.4, 648630.4 6865860.9 27.4, 648631.1 6865861.4 27.4, 648631.4 6865861.6 27.4, 648634.1 6865863.8 26.6, 648636.2 6865865.9 26.4, 648642.7 6865872.6 26.3, 648665.9 6865893 26.7, 648687.3 6865912.8 27.6, 648759.9 6865981.5 28.7, 648837.6 6866053.6 30, 648859.8 6866073.2 30.3, 648874.7 6866085.6 30.5, 648930.9 6866129.9 33.2, 648965.2 6866159.7 30.7, 649057.3 6866244.1 30.8, 649104 6866288.5 31.5, 649148.3 6866327.5 32.8, 649156.4 6866334 32.8, 649175.5 6866349.3 33.2, 649193.3 6866362.2 33.5, 649208.9 6866373.3 33.5, 649224.1 6866383.6 34.4))
-"""
+        _sio = AbstractGeoDataFrameDemos._dataset(
+            "GeoDataFrameDemosB", "intraPeripherique.csv"
         )
         return GeoDataFrameLib.read_csv(_sio)
 
@@ -168,47 +143,8 @@ BDTOPO_3-4_TOUSTHEMES_SHP_LAMB93_D075_2024-12-15/BDTOPO/\
 BATI/BATIMENT.shp", bbox=roi)
         paris.to_csv('/tmp/paris.csv', sep=';', index=False)
         """
-        _sio = StringIO(
-            """ID;NATURE;USAGE1;USAGE2;LEGER;ETAT;DATE_CREAT;DATE_MAJ;DATE_APP;DATE_CONF;SOURCE;ID_SOURCE;ACQU_PLANI;ACQU_ALTI;PREC_PLANI;PREC_ALTI;NB_LOGTS;NB_ETAGES;MAT_MURS;MAT_TOITS;HAUTEUR;Z_MIN_SOL;Z_MIN_TOIT;Z_MAX_TOIT;Z_MAX_SOL;ORIGIN_BAT;APP_FF;IDS_RNB;geometry
-BATIMENT0000000245185710;Indifférenciée;Résidentiel;Annexe;Non;En service;2010-11-23 09:19:21;2019-03-15 13:40:14;2006/01/01;;;;BDParcellaire recalée;Interpolation bâti BDTopo;3.0;2.5;22.0;5.0;00;00;15.6;34.9;50.5;;;Cadastre;A 1.0;QCK7FS5XAEXM;POLYGON Z ((653394 6862044.8 50.5, 653400.5 6862043.5 50.5, 653400.8 6862043.4 50.5, 653400.6 6862042.8 50.5, 653403.7 6862042 50.5, 653399.6 6862026.2 50.5, 653399.8 6862026.2 50.5, 653399.7 6862025.6 50.5, 653399.4 6862025.6 50.5, 653398.8 6862023.2 50.5, 653399 6862023 50.5, 653398.9 6862022.6 50.5, 653398.7 6862022.5 50.5, 653398.5 6862022 50.5, 653420.7 6862016.6 50.5, 653420.7 6862016.9 50.5, 653420.5 6862017.1 50.5, 653421.4 6862020.9 50.5, 653421.7 6862020.9 50.5, 653422.9 6862025.8 50.5, 653421.7 6862026.2 50.5, 653422.1 6862028.2 50.5, 653421.3 6862029 50.5, 653421.8 6862030.7 50.5, 653422.8 6862030.9 50.5, 653423.3 6862032.7 50.5, 653424.6 6862032.4 50.5, 653425.1 6862034.7 50.5, 653428.8 6862033.8 50.5, 653429.8 6862032.4 50.5, 653425 6862013.6 50.5, 653423.9 6862013.8 50.5, 653423 6862010.2 50.5, 653423.8 6862009.9 50.5, 653424.3 6862011.9 50.5, 653424.8 6862012.1 50.5, 653426.8 6862011.7 50.5, 653424.5 6862002.6 50.5, 653423.4 6861998.1 50.5, 653401 6862003.8 50.5, 653392.6 6862006 50.5, 653394.9 6862019.4 50.5, 653395.5 6862022.6 50.5, 653395.5 6862022.9 50.5, 653397 6862030.2 50.5, 653392.3 6862031.4 50.5, 653391.1 6862031.7 50.5, 653394 6862044.8 50.5))
-BATIMENT0000000245185711;Indifférenciée;Résidentiel;Annexe;Non;En service;2010-11-23 09:19:21;2019-03-15 13:40:14;1800/01/01;;;;BDParcellaire recalée;Interpolation bâti BDTopo;3.0;2.5;4.0;7.0;10;30;15.3;34.9;50.2;;;Cadastre;C 0.7;WCEHHSR46398;POLYGON Z ((653435.1 6862012.9 50.2, 653439.2 6862011.9 50.2, 653437.2 6862004.3 50.2, 653436 6861999.6 50.2, 653434.8 6861995.2 50.2, 653423.4 6861998.1 50.2, 653424.5 6862002.6 50.2, 653426.8 6862011.7 50.2, 653428 6862016.9 50.2, 653429.7 6862016.4 50.2, 653429.2 6862014.3 50.2, 653435.1 6862012.9 50.2))
-BATIMENT0000000245185713;Indifférenciée;Résidentiel;;Non;En service;2010-11-23 09:19:21;2019-03-15 13:40:14;1715/01/01;;;;BDParcellaire recalée;Interpolation bâti BDTopo;3.0;2.5;1.0;1.0;00;00;15.7;34.9;50.6;;;Cadastre;C 0.8;H1BHVWE1RQQJ;POLYGON Z ((653437.2 6862004.3 50.6, 653442.3 6862002.9 50.6, 653454.9 6861999.6 50.6, 653460.5 6861998.1 50.6, 653459.2 6861993.3 50.6, 653458.1 6861989.1 50.6, 653434.8 6861995.2 50.6, 653436 6861999.6 50.6, 653437.2 6862004.3 50.6))
-BATIMENT0000000245185714;Indifférenciée;Résidentiel;Commercial et services;Non;En service;2010-11-23 09:19:21;2019-03-15 13:40:14;1650/01/01;;;;BDParcellaire recalée;Interpolation bâti BDTopo;3.0;2.5;1.0;6.0;10;20;16.1;35.0;51.1;;;Cadastre;C 0.8;XJA6AFRSCMB5;POLYGON Z ((653461.4 6862000.9 51.1, 653466.9 6861999.5 51.1, 653469.6 6861998.8 51.1, 653471.1 6861998.4 51.1, 653474.9 6861997.5 51.1, 653475.7 6862000.2 51.1, 653475.8 6862000.2 51.1, 653476.7 6862004.8 51.1, 653480 6862004.3 51.1, 653479.1 6862000.2 51.1, 653484.2 6861998.9 51.1, 653484.4 6861999.7 51.1, 653491.5 6861997.8 51.1, 653491.3 6861997.1 51.1, 653496 6861995.9 51.1, 653497 6862000.2 51.1, 653500 6861999.4 51.1, 653496.3 6861984.4 51.1, 653495.1 6861979.8 51.1, 653466.4 6861987 51.1, 653463.8 6861987.6 51.1, 653458.1 6861989.1 51.1, 653459.2 6861993.3 51.1, 653460.5 6861998.1 51.1, 653461.2 6862000.9 51.1, 653461.4 6862000.9 51.1))
-BATIMENT0000000245185715;Indifférenciée;Résidentiel;Commercial et services;Non;En service;2010-11-23 09:19:21;2019-02-28 17:35:49;1880/01/01;;;;BDParcellaire recalée;Interpolation bâti BDTopo;3.0;2.5;15.0;5.0;00;00;15.9;34.9;50.8;;;Cadastre;A 1.0;DR6W2P9RXX1G/M1J4DP9BG695;POLYGON Z ((653495.1 6861979.8 50.8, 653496.3 6861984.4 50.8, 653500 6861999.4 50.8, 653500.4 6862000.7 50.8, 653501.1 6862003.5 50.8, 653508.6 6862033.4 50.8, 653510.7 6862042 50.8, 653525.3 6862038.2 50.8, 653533.7 6862036 50.8, 653532 6862029 50.8, 653531.8 6862028 50.8, 653530.9 6862024.7 50.8, 653529.7 6862020 50.8, 653527.9 6862012.9 50.8, 653525.8 6862013.4 50.8, 653525.6 6862012.7 50.8, 653526.7 6862012.1 50.8, 653526.5 6862011.4 50.8, 653527.4 6862011.1 50.8, 653526.3 6862006.5 50.8, 653519.1 6861978.6 50.8, 653517.9 6861974 50.8, 653495.1 6861979.8 50.8), (653518.1 6861996.9 50.8, 653520.9 6862007.9 50.8, 653508.6 6862011 50.8, 653505.6 6861999.4 50.8, 653505.4 6861998.5 50.8, 653505 6861996.9 50.8, 653504.8 6861996 50.8, 653504.2 6861993.8 50.8, 653516.4 6861990.7 50.8, 653517 6861993.2 50.8, 653517.3 6861994 50.8, 653517.8 6861996.1 50.8, 653518.1 6861996.9 50.8), (653522.7 6862014.6 50.8, 653527 6862032.5 50.8, 653514.9 6862035.5 50.8, 653511.5 6862021.8 50.8, 653517.9 6862020.2 50.8, 653516.8 6862016 50.8, 653522.7 6862014.6 50.8))
-BATIMENT0000000245185716;Indifférenciée;Résidentiel;Commercial et services;Non;En service;2010-11-23 09:19:21;2019-03-15 13:40:14;1610/01/01;;;;BDParcellaire recalée;Interpolation bâti BDTopo;3.0;2.5;20.0;6.0;00;00;16.5;35.0;51.5;;;Cadastre;A 1.0;T5QJ7WHKBKCB;POLYGON Z ((653537.1 6861969.1 51.5, 653526.5 6861971.8 51.5, 653517.9 6861974 51.5, 653519.1 6861978.6 51.5, 653526.3 6862006.5 51.5, 653546.8 6862001.8 51.5, 653549.2 6862001.3 51.5, 653548.7 6861999.4 51.5, 653551.2 6861998.7 51.5, 653550.9 6861997.8 51.5, 653548.7 6861988.8 51.5, 653547.9 6861985.5 51.5, 653547.3 6861983.3 51.5, 653545.1 6861974.7 51.5, 653543.3 6861967.6 51.5, 653537.1 6861969.1 51.5), (653540.7 6861978 51.5, 653545.5 6861997.1 51.5, 653544.5 6861997.5 51.5, 653544.2 6861996.4 51.5, 653542.5 6861995.3 51.5, 653534.1 6861997.5 51.5, 653533 6861999.3 51.5, 653533.4 6862000.7 51.5, 653532.2 6862001 51.5, 653531.8 6861999.3 51.5, 653528.1 6861985 51.5, 653529.5 6861984.6 51.5, 653529 6861982.7 51.5, 653529.9 6861981.9 51.5, 653532.1 6861981.3 51.5, 653531.9 6861980.1 51.5, 653540.7 6861978 51.5), (653524.1 6861988.7 51.5, 653524.1 6861989 51.5, 653524.1 6861989.3 51.5, 653524.1 6861989.7 51.5, 653524.2 6861990 51.5, 653524.6 6861991.2 51.5, 653524.4 6861991.3 51.5, 653524.5 6861991.6 51.5, 653523.9 6861991.7 51.5, 653523.1 6861990.3 51.5, 653522.7 6861989.1 51.5, 653523 6861989 51.5, 653524.1 6861988.7 51.5))
-BATIMENT0000000245185831;Indifférenciée;Résidentiel;Commercial et services;Non;En service;2010-11-23 09:19:21;2019-02-28 17:35:49;1679/01/01;;;;BDParcellaire recalée;Interpolation bâti BDTopo;3.0;2.5;8.0;6.0;26;30;16.2;35.0;51.2;;;Cadastre;C 0.8;53F8XG6RXQA5;POLYGON Z ((653379.7 6862022.8 51.2, 653384.9 6862021.7 51.2, 653390.1 6862020.5 51.2, 653394.9 6862019.4 51.2, 653392.6 6862006 51.2, 653378.1 6862009.5 51.2, 653379.7 6862022.8 51.2))
-BATIMENT0000000245185832;Indifférenciée;Résidentiel;Commercial et services;Non;En service;2010-11-23 09:19:21;2019-03-15 13:40:14;1870/01/01;;;;BDParcellaire recalée;Interpolation bâti BDTopo;3.0;2.5;6.0;5.0;10;30;16.3;34.9;51.2;;;Cadastre;A 1.0;7G7KGR5EVDH8;POLYGON Z ((653380.2 6862029 51.2, 653379.7 6862022.8 51.2, 653378.1 6862009.5 51.2, 653371.6 6862011.1 51.2, 653372.5 6862029.5 51.2, 653380.2 6862029 51.2))
-BATIMENT0000000245197440;Indifférenciée;Commercial et services;;Non;En service;2010-11-23 09:27:02;2019-01-17 20:08:39;;;;;BDParcellaire recalée;Interpolation bâti BDTopo;3.0;2.5;;;;;16.1;34.2;50.3;;;Cadastre;;1GQBEGJGXFAA;POLYGON Z ((653521.5 6861784.3 50.3, 653501.3 6861788.7 50.3, 653478.3 6861793.7 50.3, 653478.2 6861793.4 50.3, 653471.3 6861795.1 50.3, 653471.9 6861800 50.3, 653472.5 6861802 50.3, 653473.9 6861807.2 50.3, 653477.8 6861821.1 50.3, 653480.9 6861831.4 50.3, 653482.3 6861836.2 50.3, 653489.9 6861834.2 50.3, 653497.6 6861832.2 50.3, 653497.4 6861831.7 50.3, 653529 6861822.9 50.3, 653540.1 6861819.9 50.3, 653548.1 6861817.6 50.3, 653544.7 6861804.4 50.3, 653543.3 6861799.2 50.3, 653539.5 6861800.2 50.3, 653537.9 6861794.5 50.3, 653541.7 6861793.3 50.3, 653541.1 6861790.7 50.3, 653539.5 6861784.7 50.3, 653539 6861782.9 50.3, 653538.4 6861780.7 50.3, 653521.5 6861784.3 50.3), (653510.1 6861824.7 50.3, 653500.6 6861790.9 50.3, 653505.9 6861789.6 50.3, 653506.2 6861790.9 50.3, 653519.1 6861788.1 50.3, 653518.8 6861786.7 50.3, 653523.7 6861785.5 50.3, 653523.9 6861786 50.3, 653523.7 6861786.2 50.3, 653532.7 6861818.1 50.3, 653532.9 6861818.1 50.3, 653533.6 6861820.8 50.3, 653529.8 6861821.9 50.3, 653529.5 6861820.8 50.3, 653526.4 6861821.6 50.3, 653526 6861820.1 50.3, 653510.1 6861824.7 50.3), (653492.7 6861794.4 50.3, 653500.3 6861821.9 50.3, 653485.8 6861825.7 50.3, 653478.4 6861797.8 50.3, 653492.7 6861794.4 50.3))
-BATIMENT0000000245197445;Indifférenciée;Résidentiel;Annexe;Non;En service;2010-11-23 09:27:02;2019-03-15 13:40:14;1885/01/01;;;;BDParcellaire recalée;Interpolation bâti BDTopo;3.0;2.5;25.0;4.0;29;30;17.0;34.2;51.2;;;Cadastre;A 0.2;BAQ4RZAY6EC7;POLYGON Z ((653533 6861837.7 51.2, 653537.4 6861836.5 51.2, 653546.2 6861834.2 51.2, 653569.2 6861828 51.2, 653569.1 6861822.9 51.2, 653556.8 6861825.9 51.2, 653556.7 6861825.5 51.2, 653553.4 6861826.3 51.2, 653550.8 6861816.9 51.2, 653554.1 6861815.9 51.2, 653552.4 6861809.5 51.2, 653565.7 6861806.2 51.2, 653565.7 6861807.6 51.2, 653568.7 6861807.5 51.2, 653568.4 6861798.4 51.2, 653544.7 6861804.4 51.2, 653548.1 6861817.6 51.2, 653540.1 6861819.9 51.2, 653540.6 6861821.9 51.2, 653541.7 6861822.1 51.2, 653543.2 6861821.8 51.2, 653544.8 6861827.8 51.2, 653533.5 6861830.9 51.2, 653532.9 6861829 51.2, 653530.8 6861829.6 51.2, 653533 6861837.7 51.2))
-BATIMENT0000000245197683;Indifférenciée;Commercial et services;;Non;En service;2010-11-23 09:27:02;2019-03-15 13:40:14;;;;;BDParcellaire recalée;Interpolation bâti BDTopo;3.0;2.5;0.0;1.0;;;15.1;34.2;49.3;;;Cadastre;C 0.1;59TDDJDYQ8NX;POLYGON Z ((653348.5 6861826.2 49.3, 653350.7 6861832.1 49.3, 653355.5 6861848.3 49.3, 653370.5 6861844.1 49.3, 653365.7 6861826.5 49.3, 653363.3 6861819.9 49.3, 653361.5 6861820.6 49.3, 653353.2 6861824.2 49.3, 653350.3 6861825.4 49.3, 653348.5 6861826.2 49.3))
-BATIMENT0000000245197685;Indifférenciée;Résidentiel;Commercial et services;Non;En service;2010-11-23 09:27:02;2019-02-28 17:35:49;1760/01/01;;;;BDParcellaire recalée;Interpolation bâti BDTopo;3.0;2.5;5.0;4.0;14;30;16.8;34.2;51.0;;;Cadastre;C 0.3;HBZ6DEHQGFQ3;POLYGON Z ((653363.3 6861819.9 51, 653365.7 6861826.5 51, 653370.5 6861844.1 51, 653372.8 6861852.6 51, 653373.6 6861855.9 51, 653378.4 6861854.5 51, 653373.6 6861836.9 51, 653373.5 6861836.8 51, 653373 6861834.8 51, 653385.8 6861831.4 51, 653386.3 6861833.6 51, 653391.8 6861832.1 51, 653388 6861817.5 51, 653378 6861821.8 51, 653375 6861814.8 51, 653363.3 6861819.9 51), (653368.7 6861820 51, 653372.1 6861818.7 51, 653373 6861821.1 51, 653369.7 6861822.4 51, 653368.7 6861820 51))
-BATIMENT0000000245197686;Indifférenciée;Résidentiel;Commercial et services;Non;En service;2010-11-23 09:27:02;2019-02-28 17:35:49;1760/01/01;;;;BDParcellaire recalée;Interpolation bâti BDTopo;3.0;2.5;13.0;5.0;14;30;15.8;34.2;50.0;;;Cadastre;C 0.6;JFKQZFR7WQ2C;POLYGON Z ((653376.1 6861864.3 50, 653398.9 6861858.3 50, 653397.7 6861853.9 50, 653391.8 6861832.1 50, 653386.3 6861833.6 50, 653385.7 6861833.8 50, 653390.3 6861851.3 50, 653378.4 6861854.5 50, 653373.6 6861855.9 50, 653374.8 6861860 50, 653376.1 6861864.3 50))
-BATIMENT0000000245197687;Indifférenciée;Résidentiel;Annexe;Non;En service;2010-11-23 09:27:02;2019-03-15 13:40:14;1620/01/01;;;;BDParcellaire recalée;Interpolation bâti BDTopo;3.0;2.5;6.0;5.0;14;29;18.3;34.2;52.5;;;Cadastre;C 0.8;SA5G9CYP4FGE;POLYGON Z ((653361.1 6861868.5 52.5, 653376.1 6861864.3 52.5, 653374.8 6861860 52.5, 653373.6 6861855.9 52.5, 653372.8 6861852.6 52.5, 653365.7 6861854.5 52.5, 653365.4 6861853.6 52.5, 653361.4 6861854.8 52.5, 653361.6 6861855.7 52.5, 653359.1 6861856.3 52.5, 653359.5 6861854.8 52.5, 653358.6 6861851.4 52.5, 653356.5 6861852 52.5, 653356.7 6861852.5 52.5, 653359.5 6861862.1 52.5, 653360 6861863.9 52.5, 653361.1 6861868.5 52.5))
-BATIMENT0000000245197694;Indifférenciée;Résidentiel;Commercial et services;Non;En service;2010-11-23 09:27:02;2019-02-28 17:35:49;1880/01/01;;;;BDParcellaire recalée;Interpolation bâti BDTopo;3.0;2.5;16.0;5.0;24;23;15.3;34.2;49.5;;;Cadastre;C 1.0;4P5FYBZCVMVT;POLYGON Z ((653316 6861909.8 49.5, 653336.5 6861904.4 49.5, 653359.4 6861898.4 49.5, 653363.7 6861897.3 49.5, 653368.3 6861896.1 49.5, 653361.9 6861871.9 49.5, 653361.1 6861868.5 49.5, 653356.6 6861869.7 49.5, 653352 6861871 49.5, 653353.4 6861876.5 49.5, 653357.4 6861891.2 49.5, 653355.1 6861891.8 49.5, 653351 6861892.9 49.5, 653351 6861893 49.5, 653350.6 6861893.1 49.5, 653341.6 6861895.4 49.5, 653338.4 6861896.3 49.5, 653338.3 6861896.2 49.5, 653332.1 6861897.8 49.5, 653328 6861898.9 49.5, 653315.1 6861902.4 49.5, 653315 6861902.3 49.5, 653312.5 6861902.9 49.5, 653316 6861909.8 49.5))
-BATIMENT0000000245197695;Indifférenciée;Commercial et services;;Non;En service;2010-11-23 09:27:02;2022-09-26 14:57:56;;;;;BDParcellaire recalée;Interpolation bâti BDTopo;3.0;2.5;;;;;10.4;34.1;44.5;;;Cadastre;;YYJMHC5F9HYJ;POLYGON Z ((653333.1 6861876 44.5, 653352 6861871 44.5, 653356.6 6861869.7 44.5, 653361.1 6861868.5 44.5, 653360 6861863.9 44.5, 653359.5 6861862.1 44.5, 653352.7 6861863.9 44.5, 653352.9 6861865.2 44.5, 653337 6861869.4 44.5, 653336.6 6861868.2 44.5, 653330.1 6861869.9 44.5, 653331.3 6861872.5 44.5, 653332.3 6861874.5 44.5, 653333.1 6861876 44.5))
-BATIMENT0000000245197697;Indifférenciée;Résidentiel;;Non;En service;2010-11-23 09:27:02;2019-03-15 13:40:14;1650/01/01;;;;BDParcellaire recalée;Interpolation bâti BDTopo;3.0;2.5;15.0;5.0;20;12;13.3;34.2;47.5;;;Cadastre;A 1.0;635F6H798G94;POLYGON Z ((653394.8 6861814.6 47.5, 653388 6861817.5 47.5, 653391.8 6861832.1 47.5, 653397.7 6861853.9 47.5, 653398.9 6861858.3 47.5, 653421.4 6861852.3 47.5, 653420.3 6861848.3 47.5, 653420.2 6861847.9 47.5, 653418.1 6861840.3 47.5, 653418.7 6861840.1 47.5, 653410.7 6861809.9 47.5, 653394.8 6861814.6 47.5), (653394.4 6861821.3 47.5, 653407.3 6861817.8 47.5, 653412.6 6861838.4 47.5, 653399.5 6861841.9 47.5, 653394.4 6861821.3 47.5))
-BATIMENT0000000245197698;Indifférenciée;Résidentiel;Annexe;Non;En service;2010-11-23 09:27:02;2019-03-15 13:40:14;1610/01/01;;;;BDParcellaire recalée;Interpolation bâti BDTopo;3.0;2.5;5.0;4.0;40;20;14.6;34.2;48.8;;;Cadastre;A 1.0;TRYDV25XZEZE;POLYGON Z ((653421.4 6861852.3 48.8, 653427.6 6861850.7 48.8, 653430.3 6861850 48.8, 653436.3 6861848.3 48.8, 653435.3 6861844.4 48.8, 653435.2 6861844 48.8, 653433.2 6861836.3 48.8, 653432.4 6861836.5 48.8, 653427 6861837.9 48.8, 653424.2 6861838.7 48.8, 653418.7 6861840.1 48.8, 653418.1 6861840.3 48.8, 653420.2 6861847.9 48.8, 653420.3 6861848.3 48.8, 653421.4 6861852.3 48.8))
-BATIMENT0000000245197703;Indifférenciée;Résidentiel;Annexe;Non;En service;2010-11-23 09:27:02;2019-03-15 19:18:06;1650/01/01;;;;BDParcellaire recalée;Interpolation bâti BDTopo;3.0;2.5;11.0;5.0;10;20;15.6;34.3;49.9;;;Cadastre;C 0.7;BMVR2CGR23EF;POLYGON Z ((653359.4 6861898.4 49.9, 653336.5 6861904.4 49.9, 653337.7 6861909.3 49.9, 653349.9 6861906.1 49.9, 653350.9 6861905.9 49.9, 653352.8 6861905.4 49.9, 653357.6 6861904.2 49.9, 653359 6861909.7 49.9, 653353.4 6861911.1 49.9, 653354.3 6861914.8 49.9, 653362.9 6861912.5 49.9, 653367.6 6861911.2 49.9, 653372 6861910 49.9, 653368.3 6861896.1 49.9, 653363.7 6861897.3 49.9, 653359.4 6861898.4 49.9))
-BATIMENT0000000245197709;Indifférenciée;Résidentiel;Commercial et services;Non;En service;2010-11-23 09:27:02;2019-02-28 17:35:49;1700/01/01;;;;BDParcellaire recalée;Interpolation bâti BDTopo;3.0;2.5;7.0;6.0;14;23;14.9;34.2;49.1;;;Cadastre;C 0.2;MSX7Q86PQF76;POLYGON Z ((653436.3 6861848.3 49.1, 653451.5 6861844.3 49.1, 653450.3 6861839.7 49.1, 653446.3 6861825.2 49.1, 653443.2 6861826.1 49.1, 653444.2 6861829.9 49.1, 653435.8 6861832.2 49.1, 653431.6 6861833.3 49.1, 653432.4 6861836.5 49.1, 653433.2 6861836.3 49.1, 653435.2 6861844 49.1, 653435.3 6861844.4 49.1, 653436.3 6861848.3 49.1))
-BATIMENT0000000245197711;Indifférenciée;Résidentiel;Annexe;Non;En service;2010-11-23 09:27:02;2019-03-15 13:40:14;;;;;BDParcellaire recalée;Interpolation bâti BDTopo;3.0;2.5;3.0;5.0;00;00;15.0;34.2;49.2;;;Cadastre;C 1.0;P5KVGR57QTDR;POLYGON Z ((653451.5 6861844.3 49.2, 653466.9 6861840.2 49.2, 653465.6 6861835.6 49.2, 653462.6 6861825.2 49.2, 653461.6 6861821.3 49.2, 653459.4 6861821.9 49.2, 653460.4 6861825.8 49.2, 653449.6 6861828.7 49.2, 653447.6 6861820.9 49.2, 653445.3 6861821.4 49.2, 653446.3 6861825.2 49.2, 653450.3 6861839.7 49.2, 653451.5 6861844.3 49.2))
-BATIMENT0000000245197715;Indifférenciée;Commercial et services;;Non;En service;2010-11-23 09:27:02;2019-03-15 13:40:14;;;;;BDParcellaire recalée;Interpolation bâti BDTopo;3.0;2.5;0.0;1.0;;;14.9;34.4;49.3;;;Cadastre;C 0.8;PNTHZQKQCZNR;POLYGON Z ((653379.5 6861937.9 49.3, 653372 6861910 49.3, 653367.6 6861911.2 49.3, 653362.9 6861912.5 49.3, 653354.3 6861914.8 49.3, 653354 6861914.9 49.3, 653356.1 6861922.8 49.3, 653365 6861920.4 49.3, 653368.9 6861935 49.3, 653360 6861937.3 49.3, 653361.4 6861942.5 49.3, 653375 6861939 49.3, 653379.5 6861937.9 49.3))
-BATIMENT0000000245197717;Indifférenciée;Résidentiel;Commercial et services;Non;En service;2010-11-23 09:27:02;2019-03-15 13:40:14;1600/01/01;;;;BDParcellaire recalée;Interpolation bâti BDTopo;3.0;2.5;18.0;6.0;19;20;14.0;34.7;48.7;;;Cadastre;A 1.0;SD64CYF3EBT4;POLYGON Z ((653340.7 6861963.3 48.7, 653353.2 6861959.9 48.7, 653378.7 6861953 48.7, 653383.1 6861951.8 48.7, 653379.5 6861937.9 48.7, 653375 6861939 48.7, 653361.4 6861942.5 48.7, 653359.9 6861942.9 48.7, 653360.3 6861944.4 48.7, 653363.1 6861943.7 48.7, 653365.1 6861951.5 48.7, 653354 6861954.4 48.7, 653352.5 6861954.8 48.7, 653351.5 6861955.1 48.7, 653347.4 6861956.2 48.7, 653345.6 6861949.1 48.7, 653353.5 6861947.1 48.7, 653353.6 6861947.3 48.7, 653356.4 6861946.5 48.7, 653357.2 6861946.4 48.7, 653359.4 6861945.7 48.7, 653358.8 6861943.2 48.7, 653334.5 6861949.4 48.7, 653340.7 6861963.3 48.7))
-BATIMENT0000000245197721;Indifférenciée;Résidentiel;Annexe;Non;En service;2010-11-23 09:27:02;2019-03-15 13:40:14;1610/01/01;;;;BDParcellaire recalée;Interpolation bâti BDTopo;3.0;2.5;7.0;5.0;19;03;15.4;34.2;49.6;;;Cadastre;C 0.7;WZ5449RH2HFR;POLYGON Z ((653466.9 6861840.2 49.6, 653482.3 6861836.2 49.6, 653480.9 6861831.4 49.6, 653477.8 6861821.1 49.6, 653470.7 6861823 49.6, 653464.9 6861824.6 49.6, 653462.6 6861825.2 49.6, 653465.6 6861835.6 49.6, 653466.9 6861840.2 49.6))
-BATIMENT0000000245197726;Indifférenciée;Résidentiel;;Non;En service;2010-11-23 09:27:02;2021-03-15 17:55:12;;;;;BDParcellaire recalée;Interpolation bâti BDTopo;3.0;2.5;;;;;15.0;34.2;49.2;;;Cadastre;;45KWK46EDX7W;POLYGON Z ((653529 6861822.9 49.2, 653497.4 6861831.7 49.2, 653497.6 6861832.2 49.2, 653501.2 6861846.2 49.2, 653505.5 6861845 49.2, 653518 6861841.7 49.2, 653528.5 6861838.9 49.2, 653533 6861837.7 49.2, 653530.8 6861829.6 49.2, 653529 6861822.9 49.2), (653514.1 6861831.4 49.2, 653525.3 6861828.4 49.2, 653526.9 6861834.3 49.2, 653516.5 6861837.1 49.2, 653516.7 6861837.8 49.2, 653509.5 6861839.9 49.2, 653507.7 6861832.6 49.2, 653514 6861831 49.2, 653514.1 6861831.4 49.2))
-BATIMENT0000000245197727;Indifférenciée;Résidentiel;Annexe;Non;En service;2010-11-23 09:27:02;2019-03-15 13:40:14;1979/01/01;;;;BDParcellaire recalée;Interpolation bâti BDTopo;3.0;2.5;10.0;8.0;26;23;15.1;34.2;49.3;;;Cadastre;C 0.5;55WZ9V83ZZMB;POLYGON Z ((653504.8 6861860.4 49.3, 653509.1 6861859.2 49.3, 653521.9 6861855.7 49.3, 653520.8 6861851.7 49.3, 653519.8 6861848.3 49.3, 653520.7 6861848.1 49.3, 653521.1 6861847.5 49.3, 653520.7 6861846.2 49.3, 653519.9 6861845.8 49.3, 653519.2 6861846 49.3, 653518.7 6861844.5 49.3, 653518 6861841.7 49.3, 653505.5 6861845 49.3, 653501.2 6861846.2 49.3, 653504.8 6861860.4 49.3))
-BATIMENT0000000245197730;Indifférenciée;Commercial et services;;Non;En service;2010-11-23 09:27:02;2019-01-17 20:08:39;;;;;BDParcellaire recalée;Interpolation bâti BDTopo;3.0;2.5;;;;;15.0;34.2;49.2;;;Cadastre;;FX66H9RVPDXT;POLYGON Z ((653510.3 6861881.5 49.2, 653514.5 6861880.4 49.2, 653524.9 6861877.5 49.2, 653523.9 6861874.2 49.2, 653518.6 6861875.7 49.2, 653517.7 6861872.6 49.2, 653518.2 6861872.4 49.2, 653517.8 6861871.2 49.2, 653517.3 6861871.4 49.2, 653516.8 6861869.5 49.2, 653517.4 6861869.3 49.2, 653517 6861867.9 49.2, 653517.4 6861867.7 49.2, 653516.7 6861864.9 49.2, 653543 6861857.6 49.2, 653546.7 6861871.9 49.2, 653550.4 6861870.8 49.2, 653545.9 6861856.7 49.2, 653560.7 6861852.6 49.2, 653561.2 6861867.9 49.2, 653570 6861865.6 49.2, 653569.4 6861843.3 49.2, 653569.4 6861842.7 49.2, 653563.4 6861844.4 49.2, 653560.7 6861845.1 49.2, 653553 6861847.2 49.2, 653552 6861847.4 49.2, 653550 6861848 49.2, 653521.9 6861855.7 49.2, 653509.1 6861859.2 49.2, 653504.8 6861860.4 49.2, 653510.3 6861881.5 49.2))
-BATIMENT0000000245197731;Indifférenciée;Résidentiel;Commercial et services;Non;En service;2010-11-23 09:27:02;2019-05-06 19:20:22;;;;;BDParcellaire recalée;Interpolation bâti BDTopo;3.0;2.5;1.0;1.0;;;14.8;34.4;49.2;;;Cadastre;C 0.8;DZJH9NBR3GR1;POLYGON Z ((653388.8 6861972.9 49.2, 653383.1 6861951.8 49.2, 653378.7 6861953 49.2, 653353.2 6861959.9 49.2, 653354.4 6861965.2 49.2, 653357.6 6861964.3 49.2, 653358.2 6861966.4 49.2, 653358.7 6861966.3 49.2, 653373.4 6861962.4 49.2, 653375.9 6861961.8 49.2, 653376.6 6861964.3 49.2, 653378.4 6861971.5 49.2, 653379.5 6861975.4 49.2, 653384.3 6861974.1 49.2, 653388.8 6861972.9 49.2))
-BATIMENT0000000245197732;Indifférenciée;Résidentiel;Commercial et services;Non;En service;2010-11-23 09:27:02;2019-05-06 19:20:22;1606/01/01;;;;BDParcellaire recalée;Interpolation bâti BDTopo;3.0;2.5;1.0;4.0;;;14.9;34.2;49.1;;;Cadastre;C 0.8;2MAF6ZBCBBKA;POLYGON Z ((653385.4 6861997.1 49.1, 653390.6 6861995.6 49.1, 653394.6 6861994.6 49.1, 653388.8 6861972.9 49.1, 653384.3 6861974.1 49.1, 653379.5 6861975.4 49.1, 653375.7 6861976.4 49.1, 653377.5 6861983.5 49.1, 653381.4 6861982.5 49.1, 653382.2 6861985.3 49.1, 653379.2 6861986.2 49.1, 653379.7 6861988.2 49.1, 653380 6861989.5 49.1, 653382 6861989 49.1, 653382.7 6861991.6 49.1, 653383.7 6861991.3 49.1, 653384 6861992.3 49.1, 653385.4 6861997.1 49.1))
-BATIMENT0000000245197734;Indifférenciée;Résidentiel;Commercial et services;Non;En service;2010-11-23 09:27:02;2019-05-06 19:20:22;1920/01/01;;;;BDParcellaire recalée;Interpolation bâti BDTopo;3.0;2.5;8.0;7.0;;;20.4;34.2;54.6;;;Cadastre;A 1.0;AVRC6SA85QVG;POLYGON Z ((653368.9 6862001 54.6, 653380 6861998.4 54.6, 653377.5 6861988.9 54.6, 653372.1 6861990.2 54.6, 653369.6 6861988 54.6, 653369 6861985.7 54.6, 653370.8 6861983.7 54.6, 653372 6861984.9 54.6, 653377.5 6861983.5 54.6, 653375.7 6861976.4 54.6, 653361.7 6861980.1 54.6, 653349.6 6861983.3 54.6, 653368.9 6862001 54.6))
-BATIMENT0000000245197735;Indifférenciée;Indifférencié;;Non;En service;2010-11-23 09:27:02;;;;;;BDParcellaire recalée;Interpolation bâti BDTopo;3.0;2.5;;;;;16.2;34.2;50.4;;;Cadastre;;N71HCX1KHESF;POLYGON Z ((653360.7 6861976.3 50.4, 653361.7 6861980.1 50.4, 653375.7 6861976.4 50.4, 653379.5 6861975.4 50.4, 653378.4 6861971.5 50.4, 653360.7 6861976.3 50.4))
-BATIMENT0000000245197736;Indifférenciée;Religieux;;Non;En service;2010-11-23 09:27:02;;;;;;BDParcellaire recalée;Interpolation bâti BDTopo;3.0;2.5;;;;;10.4;34.2;44.6;;;Cadastre;;85M2H4B2Z6X5;POLYGON Z ((653515.8 6861902.8 44.6, 653519.9 6861901.7 44.6, 653540.3 6861896.3 44.6, 653545.5 6861894.9 44.6, 653552.4 6861893.1 44.6, 653570.7 6861888.2 44.6, 653570.5 6861883.5 44.6, 653570.3 6861883.5 44.6, 653569.9 6861870.6 44.6, 653570.1 6861870.6 44.6, 653570 6861865.6 44.6, 653561.2 6861867.9 44.6, 653550.4 6861870.8 44.6, 653546.7 6861871.9 44.6, 653524.9 6861877.5 44.6, 653514.5 6861880.4 44.6, 653510.3 6861881.5 44.6, 653515.8 6861902.8 44.6))
-BATIMENT0000000245197737;Indifférenciée;Résidentiel;Annexe;Non;En service;2010-11-23 09:27:02;2019-03-15 13:40:14;1612/01/01;;;;BDParcellaire recalée;Interpolation bâti BDTopo;3.0;2.5;16.0;5.0;19;23;16.1;34.2;50.3;;;Cadastre;A 1.0;W33EJK79MVWY;POLYGON Z ((653519.4 6861917 50.3, 653523.5 6861915.8 50.3, 653549.1 6861908.7 50.3, 653553.3 6861907.5 50.3, 653552.3 6861903.8 50.3, 653554.7 6861903 50.3, 653553.3 6861896.7 50.3, 653552.4 6861893.1 50.3, 653545.5 6861894.9 50.3, 653547.9 6861904.1 50.3, 653531.2 6861908.8 50.3, 653529.6 6861902.5 50.3, 653541.1 6861899.5 50.3, 653540.3 6861896.3 50.3, 653519.9 6861901.7 50.3, 653515.8 6861902.8 50.3, 653519.4 6861917 50.3))
-BATIMENT0000000245197738;Indifférenciée;Indifférencié;;Non;En service;2010-11-23 09:27:02;2022-07-30 23:16:38;;;;;BDParcellaire recalée;Pas de Z;3.0;9999.0;;;;;;34.2;;;;Cadastre;;JFWMVNS3AR9P;POLYGON Z ((653377.5 6861988.9 -1000, 653380 6861998.4 -1000, 653385.4 6861997.1 -1000, 653384 6861992.3 -1000, 653383.7 6861991.3 -1000, 653382.7 6861991.6 -1000, 653382 6861989 -1000, 653380 6861989.5 -1000, 653379.7 6861988.2 -1000, 653377.5 6861988.9 -1000))
-BATIMENT0000000245197740;Indifférenciée;Résidentiel;Annexe;Non;En service;2010-11-23 09:27:02;2019-03-15 13:40:14;1700/01/01;;;;BDParcellaire recalée;Interpolation bâti BDTopo;3.0;2.5;14.0;6.0;24;10;16.1;34.2;50.3;;;Cadastre;B 0.5;C2Q7298GJ5D1;POLYGON Z ((653523 6861931 50.3, 653527.1 6861929.9 50.3, 653550.5 6861923.5 50.3, 653553.2 6861922.7 50.3, 653556.4 6861921.8 50.3, 653555 6861916.5 50.3, 653544.5 6861919.2 50.3, 653544.3 6861920.6 50.3, 653538.6 6861922.5 50.3, 653536.8 6861915.9 50.3, 653543 6861914.2 50.3, 653542.9 6861913.7 50.3, 653548.3 6861912.2 50.3, 653548.2 6861911.9 50.3, 653549.9 6861911.3 50.3, 653549.1 6861908.7 50.3, 653523.5 6861915.8 50.3, 653519.4 6861917 50.3, 653523 6861931 50.3))
-BATIMENT0000000245197741;Indifférenciée;Résidentiel;Commercial et services;Non;En service;2010-11-23 09:27:02;2019-02-28 17:35:49;1600/01/01;;;;BDParcellaire recalée;Interpolation bâti BDTopo;3.0;2.5;8.0;4.0;90;23;15.7;34.2;49.9;;;Cadastre;C 0.9;S3W2Y38G68Y9;POLYGON Z ((653526.6 6861944.9 49.9, 653530.7 6861943.9 49.9, 653551 6861938.7 49.9, 653550.3 6861935.8 49.9, 653545.1 6861937.2 49.9, 653544.7 6861935.8 49.9, 653541.5 6861936.6 49.9, 653540.1 6861932.1 49.9, 653543.5 6861931.1 49.9, 653543.1 6861929.5 49.9, 653551.5 6861927.1 49.9, 653550.5 6861923.5 49.9, 653527.1 6861929.9 49.9, 653523 6861931 49.9, 653526.6 6861944.9 49.9))
-BATIMENT0000000245197745;Indifférenciée;Résidentiel;Annexe;Non;En service;2010-11-23 09:27:02;2019-03-15 13:40:14;1600/01/01;;;;BDParcellaire recalée;Interpolation bâti BDTopo;3.0;2.5;8.0;5.0;12;24;15.6;34.2;49.8;;;Cadastre;A 1.0;NNPZ1Z7VVQJX;POLYGON Z ((653549.7 6861955 49.8, 653548.3 6861949.8 49.8, 653548.2 6861949.6 49.8, 653542.3 6861951.2 49.8, 653540.8 6861945.4 49.8, 653549.6 6861943.1 49.8, 653551.1 6861949.1 49.8, 653555.8 6861948 49.8, 653559.5 6861947.1 49.8, 653557.5 6861938.8 49.8, 653557 6861937.1 49.8, 653551 6861938.7 49.8, 653530.7 6861943.9 49.8, 653526.6 6861944.9 49.8, 653530.4 6861959.8 49.8, 653534.8 6861958.7 49.8, 653549.7 6861955 49.8))
-BATIMENT0000000245197823;Indifférenciée;Résidentiel;Commercial et services;Non;En service;2010-11-23 09:27:02;2019-02-28 17:35:49;1900/01/01;;;;BDParcellaire recalée;Interpolation bâti BDTopo;3.0;2.5;29.0;7.0;00;00;20.5;35.0;55.5;;;Cadastre;A 1.0;9FZNJVYHC54V;POLYGON Z ((653556.6 6861983.3 55.5, 653557.9 6861982.9 55.5, 653556.3 6861977.4 55.5, 653555.4 6861977 55.5, 653554.3 6861972.9 55.5, 653556.4 6861972.1 55.5, 653556 6861970.8 55.5, 653555.8 6861968.7 55.5, 653556.7 6861968.5 55.5, 653555.7 6861964.4 55.5, 653543.3 6861967.6 55.5, 653545.1 6861974.7 55.5, 653547.4 6861974 55.5, 653548.8 6861978.7 55.5, 653550 6861978.4 55.5, 653550.3 6861979.5 55.5, 653550.9 6861979.3 55.5, 653551.6 6861982.1 55.5, 653547.3 6861983.3 55.5, 653547.9 6861985.5 55.5, 653556.6 6861983.3 55.5))
-"""
+        _sio = AbstractGeoDataFrameDemos._dataset(
+            "GeoDataFrameDemosB", "placeDesVosgesBuildings.csv"
         )
         return GeoDataFrameLib.read_csv(_sio)
 
@@ -224,211 +160,8 @@ BATIMENT0000000245197823;Indifférenciée;Résidentiel;Commercial et services;No
         trees = read_file("/home/tleduc/data/paris/arbres_75004-202503.shp", mask=roi)
         trees.to_csv('/tmp/paris.csv', sep=';', index=False)
         """
-        _sio = StringIO(
-            """idbase;typeemplace;domanialite;arrondissem;complementa;numero;adresse;idemplaceme;libellefran;genre;espece;varieteoucu;circonferen;hauteurenm;stadedevelo;remarquable;geometry
-135831;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000401010;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653386.1571991651 6861878.551896092)
-135873;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000303008;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653414.5407991622 6861967.162596093)
-135837;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000403006;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653396.0190991671 6861896.288696093)
-135935;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000201004;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653505.512699165 6861928.565296092)
-135818;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000402013;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653406.5209991622 6861878.149596093)
-135833;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000401009;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653382.3428991644 6861884.46129609)
-135871;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000302010;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653408.4543991673 6861963.37589609)
-135886;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000301006;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653423.2087991675 6861980.369496091)
-135913;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000201013;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653493.6192991663 6861962.517896091)
-135883;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000301007;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653418.4029991617 6861981.57879609)
-135855;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000303014;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653406.9371991667 6861938.025496092)
-135829;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000402008;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653388.5453991651 6861888.0529960925)
-135836;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000401007;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653384.7368991657 6861894.133396091)
-135890;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000303004;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653430.2748991617 6861968.383496093)
-135847;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000402003;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653395.0531991632 6861912.159796089)
-135843;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000403004;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653398.494699164 6861905.903596095)
-135778;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000103009;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653480.9266991692 6861873.702896093)
-135844;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000402004;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653393.762199162 6861907.27269609)
-135901;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000202016;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653473.096299164 6861962.672896092)
-135889;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000301005;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653428.0981991655 6861979.058896095)
-135787;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000102007;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653477.3316991628 6861859.348496092)
-135892;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000301004;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653432.7981991612 6861977.9357960895)
-135936;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000203003;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653494.4720991631 6861925.998196092)
-135926;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000201007;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653509.2679991655 6861942.913596091)
-135770;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000101014;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653493.0621991683 6861880.661396091)
-135848;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000401003;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653389.9031991645 6861913.345996092)
-135929;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000201006;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653507.9454991674 6861938.267296092)
-135865;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000302012;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653406.0079991657 6861953.962796095)
-135810;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000401017;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653419.8782991683 6861869.570396093)
-135949;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000502001;Marronnier;Aesculus;hippocastanum;;196;18;;NON;POINT (653446.1779991682 6861906.623996092)
-135762;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000102016;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653492.0675991628 6861896.556296093)
-135766;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000103013;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653485.9517991694 6861892.933496094)
-135822;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000401013;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653400.5529991674 6861874.613196092)
-135802;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000103002;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653454.431499168 6861870.5364960935)
-135815;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000402014;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653411.4717991638 6861876.810596091)
-135898;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000303001;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653444.8293991679 6861964.582896094)
-135781;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000103008;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653479.7951991634 6861868.958196089)
-135922;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000202009;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653505.6625991693 6861948.8721960895)
-135912;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000202013;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653492.3514991631 6861957.70229609)
-135950;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000501001;Marronnier;Aesculus;hippocastanum;;150;18;;NON;POINT (653446.0703991647 6861900.8550960915)
-135832;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000401008;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653383.5353991671 6861889.420596087)
-135962;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000203014;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653471.7755991668 6861957.666296092)
-135948;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000501009;Marronnier;Aesculus;hippocastanum;;200;18;;NON;POINT (653438.3437991658 6861904.142996093)
-135841;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000402005;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653392.395799166 6861902.482696092)
-135816;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000401015;Tilleul;Tilia;x europaea;;30;8;;NON;POINT (653410.0411991614 6861872.118096091)
-135934;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000202004;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653500.7877991651 6861929.714496093)
-135943;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000202001;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653496.8171991636 6861914.980196093)
-135958;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000502005;Marronnier;Aesculus;hippocastanum;;212;18;;NON;POINT (653455.9768991617 6861925.994596091)
-135771;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000102013;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653488.3055991682 6861882.031996091)
-135786;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000102008;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653482.1625991688 6861858.083996089)
-135905;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000203012;Tilleul;Tilia;x europaea;;40;8;;NON;POINT (653481.1687991621 6861955.137196092)
-135864;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000303011;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653410.7109991673 6861952.62549609)
-135768;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000102014;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653489.6223991665 6861886.837296092)
-135941;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000201002;Tilleul;Tilia;x europaea;;30;8;;NON;POINT (653503.0173991626 6861918.752196093)
-135813;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000401016;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653414.9347991635 6861870.890996092)
-135784;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000103007;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653478.5046991634 6861864.0162960915)
-135884;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000303006;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653420.6946991673 6861970.745096094)
-135919;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000203008;Tilleul;Tilia;x europaea;;30;8;;NON;POINT (653500.8824991663 6861950.16269609)
-135814;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000403012;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653412.6107991625 6861881.64819609)
-135932;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000201005;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653506.7437991656 6861933.286496093)
-135908;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000203011;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653486.4047991636 6861953.901496091)
-135782;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000101010;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653488.0903991688 6861861.574196089)
-135881;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000301009;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653407.3362991649 6861979.360296091)
-135823;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000403009;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653398.2798991636 6861885.386196091)
-135918;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000202011;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653502.2100991687 6861955.297096096)
-135850;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000402002;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653396.1912991614 6861917.009896093)
-135946;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000502008;Marronnier;Aesculus;hippocastanum;;186;18;;NON;POINT (653435.5398991622 6861918.612896093)
-135773;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000101013;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653491.8656991649 6861875.931096093)
-135951;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000501002;Marronnier;Aesculus;hippocastanum;;243;18;;NON;POINT (653453.0679991689 6861901.850796093)
-135924;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000201008;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653510.4849991656 6861947.638396094)
-135956;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000501005;Marronnier;Aesculus;hippocastanum;;172;18;;NON;POINT (653464.2209991661 6861917.06559609)
-135882;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000301008;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653413.6572991674 6861982.805496091)
-135915;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000202012;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653497.2064991673 6861956.515296092)
-135797;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000102004;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653462.9106991661 6861863.211496087)
-135763;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000103014;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653487.1612991693 6861897.70339609)
-135903;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000203013;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653476.6528991685 6861956.298296093)
-135876;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000303007;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653415.8135991682 6861972.027496092)
-135897;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000301002;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653442.476499162 6861975.555396092)
-135894;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000302002;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653436.3950991624 6861971.89909609)
-135794;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000102005;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653467.7135991676 6861861.922896091)
-135923;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000201009;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653511.7840991698 6861952.822796092)
-135891;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000302003;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653431.6303991667 6861973.108596089)
-135769;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000103012;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653484.7446991655 6861888.198196091)
-135893;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000303003;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653435.1910991662 6861967.029496089)
-135887;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000303005;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653425.5570991626 6861969.511796091)
-135776;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000101012;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653490.5034991655 6861871.16169609)
-135826;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000403008;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653393.4952991665 6861886.826496089)
-135907;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000201015;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653483.9893991651 6861964.922896093)
-135811;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000403013;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653417.5211991658 6861880.247596091)
-135799;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000103003;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653459.2364991677 6861869.294196092)
-135803;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000102002;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653453.2630991634 6861865.76909609)
-135859;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000302014;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653403.3572991627 6861944.385496091)
-135767;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000101015;Tilleul;Tilia;x europaea;;60;8;;NON;POINT (653494.4334991652 6861885.499696089)
-135906;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000202015;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653482.7523991691 6861960.137696094)
-135895;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000301003;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653437.6231991643 6861976.752796091)
-135792;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000101006;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653471.2120991647 6861855.650696091)
-135869;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000301013;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653402.233199163 6861959.96549609)
-135953;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000502002;Marronnier;Aesculus;hippocastanum;;163;18;;NON;POINT (653454.9383991655 6861909.234296092)
-135808;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000403014;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653422.3216991639 6861878.98659609)
-135872;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000301012;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653403.3697991658 6861964.582396091)
-135925;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000202008;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653504.4658991626 6861944.152296089)
-135812;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000402015;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653416.3305991654 6861875.402296089)
-135789;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000101007;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653475.989899166 6861854.336296092)
-135790;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000103006;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653473.5649991632 6861865.407296091)
-135796;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000103004;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653464.1101991682 6861867.915296089)
-135868;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000302011;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653407.2826991666 6861958.645396092)
-135877;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000302008;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653411.0994991648 6861973.229396091)
-135938;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000201003;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653504.2369991696 6861923.637496094)
-135828;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000401011;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653390.9548991607 6861877.15539609)
-135830;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000402009;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653387.3892991677 6861882.975796092)
-135825;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000401012;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653395.8013991625 6861875.906196091)
-135852;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000403001;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653402.2801991614 6861920.642596094)
-135904;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000201016;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653479.187199168 6861966.207896091)
-135809;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000402016;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653420.9687991655 6861874.257296088)
-135821;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000402012;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653401.7227991658 6861879.332696091)
-135931;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000202006;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653502.0190991691 6861934.562896092)
-135798;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000101004;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653461.630699165 6861858.304996092)
-135878;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000301010;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653406.0999991659 6861974.534296093)
-135772;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000103011;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653483.4904991689 6861883.373896093)
-135952;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000501003;Marronnier;Aesculus;hippocastanum;;230;18;;NON;POINT (653458.248099163 6861905.4236960905)
-135863;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000301015;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653399.593999161 6861950.345696094)
-135849;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000403002;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653401.0594991656 6861915.79189609)
-135777;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000102011;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653485.7149991693 6861872.343296094)
-135960;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000502007;Marronnier;Aesculus;hippocastanum;;175;18;;NON;POINT (653443.2722991626 6861929.317996093)
-135838;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000402006;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653391.0458991663 6861897.618996092)
-135800;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000102003;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653458.1176991684 6861864.46239609)
-135857;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000301017;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653397.3080991642 6861940.605996092)
-135783;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000102009;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653483.3843991684 6861862.785096091)
-135909;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000202014;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653487.5937991666 6861958.955196092)
-135806;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000102001;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653448.3062991644 6861867.013396092)
-135867;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000303010;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653411.9879991625 6861957.517596094)
-135834;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000403007;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653394.6948991627 6861891.481196091)
-135854;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000401001;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653392.3841991633 6861923.318696091)
-135928;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000202007;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653503.208299168 6861939.295696094)
-135902;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000201017;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653474.3206991629 6861967.42219609)
-135804;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000101002;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653451.8724991676 6861860.82179609)
-135788;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000101008;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653480.7639991642 6861853.04849609)
-135944;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000201001;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653501.7769991686 6861913.931296091)
-135937;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000202003;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653499.3619991695 6861924.8556960905)
-135851;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000401002;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653391.1674991609 6861918.343696093)
-135957;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000501006;Marronnier;Aesculus;hippocastanum;;219;18;;NON;POINT (653462.9272991641 6861923.601096093)
-135842;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000401005;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653387.2791991666 6861903.868996091)
-135940;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000202002;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653498.1697991644 6861920.007096091)
-135846;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000403003;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653399.7045991631 6861910.706596091)
-135959;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000502006;Marronnier;Aesculus;hippocastanum;;185;18;;NON;POINT (653448.1221991624 6861929.6691960925)
-135807;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000101001;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653447.071999162 6861862.084896094)
-135791;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000102006;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653472.4323991686 6861860.631596093)
-135927;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000203006;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653498.3357991655 6861940.494696094)
-135761;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000101017;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653496.8526991685 6861895.155096091)
-135819;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000401014;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653405.4245991621 6861873.364696089)
-135845;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000401004;Tilleul;Tilia;x europaea;;30;8;;NON;POINT (653388.5785991609 6861908.41359609)
-135785;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000101009;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653486.9400991651 6861856.774996091)
-135824;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000402011;Tilleul;Tilia;x europaea;;30;8;;NON;POINT (653397.0738991634 6861880.48729609)
-135853;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000402001;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653397.4356991636 6861921.92459609)
-135870;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000303009;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653413.292399167 6861962.196496092)
-135933;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000203004;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653495.8114991639 6861931.095096087)
-135955;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000502004;Marronnier;Aesculus;hippocastanum;;126;18;;NON;POINT (653458.863799162 6861917.970796091)
-135947;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000501008;Marronnier;Aesculus;hippocastanum;;260;18;;NON;POINT (653433.8286991634 6861907.346396094)
-135888;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000302004;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653426.7965991638 6861974.335496089)
-135920;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000201010;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653508.1228991678 6861958.844696091)
-135896;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000303002;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653439.9757991651 6861965.779796091)
-135942;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000203001;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653491.9343991656 6861916.141996089)
-135860;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000301016;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653398.4325991631 6861945.479696091)
-135779;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000101011;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653489.3690991629 6861866.3922960935)
-135840;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000403005;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653397.3890991645 6861901.18759609)
-135917;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000201011;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653503.4722991666 6861960.029396094)
-135817;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000403011;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653407.9300991658 6861882.817596091)
-135961;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000502003;Marronnier;Aesculus;hippocastanum;;157;18;;NON;POINT (653457.8507991654 6861913.162296091)
-135839;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000401006;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653386.1488991661 6861898.86609609)
-135827;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000402010;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653392.1888991655 6861881.7788960915)
-135835;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000402007;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653389.797799161 6861892.662896088)
-135885;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000302005;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653421.8874991676 6861975.496096092)
-135856;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000302015;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653402.1100991654 6861939.315796094)
-135793;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000103005;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653468.8682991639 6861866.648096094)
-135963;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000203007;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653499.6745991637 6861945.448596093)
-135764;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000101016;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653495.556599163 6861890.381496091)
-135954;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000501004;Marronnier;Aesculus;hippocastanum;;140;18;;NON;POINT (653461.9559991655 6861910.4356960915)
-135899;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000302001;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653446.0776991616 6861969.560896092)
-135780;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000102010;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653484.6281991678 6861867.676396091)
-135775;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000103010;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653482.2882991659 6861878.52299609)
-135910;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000201014;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653488.8755991685 6861963.635496091)
-135900;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000301001;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653447.3424991663 6861974.320096091)
-135805;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000103001;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653449.7281991687 6861871.811596093)
-135939;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000203002;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653493.1850991625 6861921.2103960905)
-135866;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000301014;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653401.0313991668 6861955.29059609)
-135795;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000101005;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653466.3444991632 6861856.933696092)
-135914;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000203009;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653495.8275991683 6861951.567196091)
-135858;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000303013;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653408.1913991633 6861943.118596093)
-135774;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000102012;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653487.0502991679 6861877.2706960905)
-135875;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000301011;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653404.6913991632 6861969.51659609)
-135911;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000203010;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653491.031199165 6861952.669196093)
-135801;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000101003;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653456.7039991689 6861859.493096092)
-135930;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000203005;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653497.1373991672 6861935.87769609)
-135861;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000303012;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653409.4585991639 6861947.9728960935)
-135820;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000403010;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653403.0392991664 6861884.1242960915)
-135765;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000102015;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653490.7116991658 6861891.763196091)
-135921;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000202010;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653506.9966991625 6861954.120996093)
-135880;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000302007;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653412.3914991681 6861977.967496092)
-135862;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000302013;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653404.6802991617 6861949.043596089)
-135874;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000302009;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653409.7466991607 6861968.399896089)
-135945;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000501007;Marronnier;Aesculus;hippocastanum;;207;18;;NON;POINT (653431.8735991635 6861926.07229609)
-135879;Arbre;Jardin;PARIS 4E ARRDT;;;SQUARE LOUIS XIII / 1M PLACE DES VOSGES;000302006;Tilleul;Tilia;x europaea;;70;8;;NON;POINT (653417.1481991624 6861976.74409609)
-"""
+        _sio = AbstractGeoDataFrameDemos._dataset(
+            "GeoDataFrameDemosB", "placeDesVosgesTrees.csv"
         )
         return GeoDataFrameLib.read_csv(_sio)
 
@@ -23,7 +23,6 @@ along with t4gpd.  If not, see <https://www.gnu.org/licenses/>.
 import matplotlib.pyplot as plt
 from t4gpd.demos.AbstractGeoDataFrameDemos import AbstractGeoDataFrameDemos
 from t4gpd.commons.GeoDataFrameLib import GeoDataFrameLib
-from io import StringIO
 
 
 class GeoDataFrameDemosC(AbstractGeoDataFrameDemos):
@@ -55,9 +54,9 @@ class GeoDataFrameDemosC(AbstractGeoDataFrameDemos):
         iris.reset_index(drop=True, inplace=True)
         iris.to_csv('/tmp/tastavin.csv', sep=';', index=False)
         '''
-        _sio = StringIO("""INSEE_COM;NOM_COM;IRIS;CODE_IRIS;NOM_IRIS;TYP_IRIS;geometry
-34172;Montpellier;1202;341721202;Tastavin;H;POLYGON ((770124.6 6277788.2, 770131 6277797.1, 770135.2 6277802.7, 770142 6277809.5, 770154 6277828.2, 770157.4 6277834.7, 770158.5 6277837.4, 770159.4 6277843.5, 770161.7 6277848.2, 770162.4 6277852, 770162.6 6277857.5, 770162.8 6277863.6, 770163.2 6277869.2, 770162.7 6277881.3, 770161.9 6277897.5, 770162.3 6277901.2, 770163.4 6277904.6, 770165 6277907.9, 770169.4 6277918.3, 770173.7 6277925.2, 770181.8 6277936.8, 770183.4 6277938.9, 770185.5 6277940, 770188.4 6277940.9, 770191.3 6277940.6, 770193.9 6277939.4, 770199.7 6277935.8, 770205 6277933.1, 770212.1 6277930.6, 770220.4 6277928.8, 770228.5 6277929.7, 770236.9 6277931.3, 770243.4 6277933.9, 770250.8 6277938, 770258.3 6277943.6, 770265.8 6277950.8, 770295.5 6277983, 770307.5 6277994.6, 770321.9 6278006.7, 770350.1 6278030.6, 770364.7 6278040.1, 770375.7 6278029.7, 770417.4 6277990.6, 770465.6 6277945.3, 770474.6 6277936.9, 770523 6277891.6, 770531.7 6277882.3, 770558.7 6277853.7, 770567.4 6277845.2, 770565.9 6277852.4, 770571 6277852.2, 770579.2 6277854, 770588.8 6277857.2, 770590.5 6277857.2, 770592.7 6277838.7, 770598.6 6277821.6, 770604.9 6277810.8, 770613.2 6277802.6, 770657.3 6277759.3, 770661.1 6277755.6, 770694.9 6277721.9, 770704.3 6277712.2, 770719.3 6277700.1, 770749.1 6277675.7, 770753.9 6277684.4, 770760.4 6277697.5, 770781.1 6277670.8, 770781.6 6277663.3, 770782.2 6277618.8, 770781.5 6277586.8, 770773 6277472.1, 770770.4 6277444.4, 770692.6 6277472.3, 770691.9 6277470.5, 770691 6277470.2, 770674.8 6277475.7, 770668 6277478.8, 770660.7 6277485.2, 770652 6277487.8, 770634.3 6277495.8, 770630.9 6277496.6, 770625.6 6277499, 770620.1 6277502.4, 770596.3 6277521.8, 770565.8 6277545.8, 770563.5 6277547.7, 770556.7 6277553.7, 770509.4 6277591.1, 770482.2 6277612.5, 770475.5 6277617.9, 770470.4 6277621.3, 770465.2 6277624, 770459.4 6277626.2, 770455 6277627, 770447 6277630.6, 770442.6 6277635.1, 770420.2 6277653.1, 770397.2 6277671.9, 770394.3 6277674.2, 770392 6277676.3, 770388.1 6277679.9, 770384.7 6277681.3, 770379.9 6277682.4, 770367.7 6277691.9, 770365.3 6277693.2, 770361.1 6277695.5, 770358.4 6277695.9, 770354.1 6277696.4, 770346.6 6277697.1, 770343.3 6277697.3, 770338.6 6277697.6, 770330.3 6277697.9, 770304.6 6277699, 770287.9 6277699.7, 770272.5 6277701.8, 770259 6277707.7, 770247 6277717.6, 770243 6277721.5, 770233.1 6277731, 770228.9 6277735, 770222.5 6277740.9, 770216 6277746.4, 770205.4 6277756.6, 770187.9 6277771.8, 770174 6277776.9, 770168.2 6277779.5, 770166.2 6277780.4, 770153.7 6277786.7, 770145.1 6277791.3, 770139.6 6277792.9, 770136.8 6277792.7, 770131.4 6277791.3, 770124.6 6277788.2))
-""")
+        _sio = AbstractGeoDataFrameDemos._dataset(
+            "GeoDataFrameDemosC", "irisTastavin.csv"
+        )
         return GeoDataFrameLib.read_csv(_sio)
         
     @staticmethod
@@ -75,185 +74,9 @@ BATI/BATIMENT.shp", mask=iris)
         buildings = clip(buildings, iris, keep_geom_type=True)
         buildings.to_csv('/tmp/tastavin.csv', sep=';', index=False)
         '''
-        _sio = StringIO("""ID;NATURE;USAGE1;USAGE2;LEGER;ETAT;DATE_CREAT;DATE_MAJ;DATE_APP;DATE_CONF;SOURCE;ID_SOURCE;ACQU_PLANI;PREC_PLANI;ACQU_ALTI;PREC_ALTI;NB_LOGTS;NB_ETAGES;MAT_MURS;MAT_TOITS;HAUTEUR;Z_MIN_SOL;Z_MIN_TOIT;Z_MAX_TOIT;Z_MAX_SOL;ORIGIN_BAT;APP_FF;geometry
-BATIMENT0000000211120434;Indifférenciée;Commercial et services;;Non;En service;2008-11-18 15:28:19;2019-04-08 10:00:52;;;;;BDParcellaire recalée;3.0;Corrélation;1.0;0.0;1.0;;;5.9;19.7;25.6;26.2;20.5;Cadastre;C 0.3;POLYGON Z ((770762.1 6277456.6 25.5, 770733 6277467.8 25.5, 770736.3 6277476.4 25.5, 770765.2 6277465 25.5, 770762.1 6277456.6 25.5))
-BATIMENT0000000211120410;Indifférenciée;Résidentiel;Annexe;Non;En service;2008-11-18 15:28:19;2019-04-08 10:00:52;1974-01-01;;;;BDParcellaire recalée;3.0;Interpolation bâti BDTopo;2.5;2.0;2.0;49;10;6.6;21.5;28.1;;;Cadastre;A 1.0;POLYGON Z ((770723 6277498.8 28.1, 770719.7 6277490.4 28.1, 770711.5 6277493.7 28.1, 770711.9 6277494.7 28.1, 770704.7 6277497.5 28.1, 770707.7 6277504.9 28.1, 770710.3 6277503.9 28.1, 770723 6277498.8 28.1))
-BATIMENT0000000044598816;Indifférenciée;Annexe;;Non;En service;2006-12-12 11:20:44;2019-04-08 10:00:52;1967-01-01;;;;BDTopo;2.5;BDTopo;1.5;0.0;1.0;00;00;2.4;22.0;;;;Imagerie aérienne;C 0.2;POLYGON Z ((770735.4 6277500.4 24.3, 770734.6 6277498 24.3, 770740.8 6277495.8 24.3, 770739.7 6277492.8 24.3, 770725.8 6277498.1 24.4, 770727.6 6277502.9 24.2, 770735.4 6277500.4 24.3))
-BATIMENT0000000211120356;Indifférenciée;Résidentiel;Commercial et services;Non;En service;2008-11-18 15:28:19;2019-04-08 10:00:52;1963-01-01;;;;BDParcellaire recalée;3.0;Interpolation bâti BDTopo;2.5;1.0;2.0;10;10;5.6;21.5;27.1;27.2;;Cadastre;A 1.0;POLYGON Z ((770703.2 6277501.2 27.1, 770699.4 6277502.6 27.1, 770698.1 6277499.4 27.1, 770685.9 6277504 27.1, 770689.2 6277512.1 27.1, 770705.1 6277505.9 27.1, 770703.2 6277501.2 27.1))
-BATIMENT0000000211120375;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:28:19;2019-04-08 10:00:52;1963-01-01;;;;BDParcellaire recalée;3.0;Interpolation bâti BDTopo;2.5;1.0;2.0;30;10;5.0;22.0;27.0;28.0;;Cadastre;A 1.0;POLYGON Z ((770652.8 6277513 27, 770647 6277506.4 27, 770639.6 6277513.3 27, 770645.4 6277519.8 27, 770652.8 6277513 27))
-BATIMENT0000000211120357;Indifférenciée;Commercial et services;Résidentiel;Non;En service;2008-11-18 15:28:19;2019-04-08 10:00:52;1967-01-01;;;;BDParcellaire recalée;3.0;Interpolation bâti BDTopo;2.5;1.0;2.0;;;6.0;21.3;27.3;28.8;;Cadastre;C 0.5;POLYGON Z ((770710.3 6277503.9 27.3, 770707.7 6277504.9 27.3, 770705.1 6277505.9 27.3, 770689.2 6277512.1 27.3, 770693.6 6277523.3 27.3, 770714.7 6277515 27.3, 770710.3 6277503.9 27.3))
-BATIMENT0000002275536127;Indifférenciée;Résidentiel;;Oui;En service;2021-12-17 15:40:19;2023-03-22 21:39:05;;;DGFiP;;BDParcellaire;5.0;Corrélation;1.0;;;;;2.0;20.5;22.5;23.5;21.0;Cadastre;;POLYGON Z ((770650.6 6277519.7 22.5, 770642.7 6277526.7 22.5, 770643.7 6277527.7 22.5, 770645.6 6277526.1 22.5, 770646.9 6277527.5 22.5, 770652.7 6277521.9 22.5, 770650.6 6277519.7 22.5))
-BATIMENT0000000211120432;Indifférenciée;Commercial et services;Résidentiel;Non;En service;2008-11-18 15:28:19;2019-04-08 10:00:52;1987-01-01;;;;BDParcellaire recalée;3.0;Interpolation bâti BDTopo;2.5;1.0;1.0;;;6.5;21.0;27.5;;;Cadastre;A 1.0;POLYGON Z ((770717.9 6277528.5 27.5, 770714.7 6277520 27.5, 770698.7 6277525.8 27.5, 770697.4 6277528.8 27.5, 770700 6277535.5 27.5, 770717.9 6277528.5 27.5))
-BATIMENT0000000211120368;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:28:19;2021-12-17 15:40:19;1961-01-01;;;;BDParcellaire recalée;3.0;Interpolation bâti BDTopo;2.5;1.0;2.0;20;10;6.5;21.2;27.7;;;Cadastre;A 1.0;POLYGON Z ((770656.2 6277522.9 27.7, 770655.2 6277523.9 27.7, 770653.1 6277521.7 27.7, 770652.7 6277521.9 27.7, 770646.9 6277527.5 27.7, 770652.6 6277533.8 27.7, 770660.1 6277527 27.7, 770656.2 6277522.9 27.7))
-BATIMENT0000000211120367;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:28:19;2021-12-17 15:40:19;1961-01-01;;;;BDParcellaire recalée;3.0;Interpolation bâti BDTopo;2.5;1.0;2.0;50;10;6.4;21.3;27.7;28.0;;Cadastre;A 1.0;POLYGON Z ((770664.9 6277534.6 27.7, 770662.9 6277532.4 27.7, 770664.1 6277531.3 27.7, 770660.1 6277527 27.7, 770652.6 6277533.8 27.7, 770658.6 6277540.4 27.7, 770664.9 6277534.6 27.7))
-BATIMENT0000000211120374;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:28:19;2019-04-08 10:00:52;1962-01-01;;;;BDParcellaire recalée;3.0;Interpolation bâti BDTopo;2.5;1.0;2.0;40;10;4.9;22.0;26.9;28.0;;Cadastre;C 0.7;POLYGON Z ((770647 6277506.4 26.9, 770643.4 6277502.4 26.9, 770642.2 6277503.3 26.9, 770640.3 6277501.2 26.9, 770633.9 6277507.1 26.9, 770639.6 6277513.3 26.9, 770647 6277506.4 26.9))
-BATIMENT0000000211120387;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:28:19;2019-04-08 10:00:52;1964-01-01;;;;BDParcellaire recalée;3.0;Interpolation bâti BDTopo;2.5;1.0;2.0;45;10;5.2;21.4;26.6;28.2;21.4;Cadastre;A 1.0;POLYGON Z ((770623.3 6277526.5 26.6, 770629.9 6277520.6 26.6, 770624.5 6277514.3 26.6, 770622.1 6277516.5 26.6, 770621.2 6277515.5 26.6, 770616.9 6277519.3 26.6, 770623.3 6277526.5 26.6))
-BATIMENT0000000211120386;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:28:19;2019-04-08 10:00:52;1964-01-01;;;;BDParcellaire recalée;3.0;Interpolation bâti BDTopo;2.5;1.0;2.0;34;10;6.2;20.5;26.7;28.4;20.7;Cadastre;A 1.0;POLYGON Z ((770623.3 6277526.5 26.7, 770616.9 6277519.3 26.7, 770612.7 6277523.1 26.7, 770613.6 6277524.1 26.7, 770611.5 6277526.1 26.7, 770616.8 6277532.3 26.7, 770623.3 6277526.5 26.7))
-BATIMENT0000000211120385;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:28:19;2019-04-08 10:00:52;1964-01-01;;;;BDParcellaire recalée;3.0;Interpolation bâti BDTopo;2.5;1.0;2.0;40;10;6.0;20.7;26.7;28.4;20.7;Cadastre;A 1.0;POLYGON Z ((770616.8 6277532.3 26.7, 770611.5 6277526.1 26.7, 770609.1 6277528.2 26.7, 770608.2 6277527.2 26.7, 770603.8 6277531 26.7, 770610.1 6277538.2 26.7, 770611.8 6277540.1 26.7, 770615.6 6277536.7 26.7, 770613.9 6277534.9 26.7, 770616.8 6277532.3 26.7))
-BATIMENT0000000211120384;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:28:19;2019-04-08 10:00:52;1964-01-01;;;;BDParcellaire recalée;3.0;Interpolation bâti BDTopo;2.5;1.0;2.0;46;10;6.0;20.7;26.7;28.2;20.7;Cadastre;A 1.0;POLYGON Z ((770612.5 6277540.9 26.7, 770611.8 6277540.1 26.7, 770610.1 6277538.2 26.7, 770603.8 6277531 26.7, 770599.5 6277535 26.7, 770600.5 6277536 26.7, 770598.4 6277537.9 26.7, 770603.8 6277544 26.7, 770606.1 6277546.6 26.7, 770612.5 6277540.9 26.7))
-BATIMENT0000000211120383;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:28:19;2019-04-08 10:00:52;1964-01-01;;;;BDParcellaire recalée;3.0;Interpolation bâti BDTopo;2.5;1.0;2.0;40;10;6.2;20.5;26.7;28.4;20.6;Cadastre;A 1.0;POLYGON Z ((770597.3 6277549.7 26.7, 770603.8 6277544 26.7, 770598.4 6277537.9 26.7, 770596.1 6277539.9 26.7, 770595.1 6277538.9 26.7, 770591.1 6277542.6 26.7, 770597.3 6277549.7 26.7))
-BATIMENT0000000211120382;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:28:19;2019-04-08 10:00:52;1964-01-01;;;;BDParcellaire recalée;3.0;Interpolation bâti BDTopo;2.5;1.0;2.0;40;10;6.2;20.5;26.7;28.3;20.6;Cadastre;A 1.0;POLYGON Z ((770597.3 6277549.7 26.7, 770591.1 6277542.6 26.7, 770586.6 6277546.6 26.7, 770587.5 6277547.5 26.7, 770585.2 6277549.5 26.7, 770590.6 6277555.7 26.7, 770597.3 6277549.7 26.7))
-BATIMENT0000000211120286;Indifférenciée;Indifférencié;;Non;En service;2008-11-18 15:28:19;2017-03-30 10:33:07;;;;;BDParcellaire recalée;3.0;Corrélation;1.0;;;;;3.2;20.3;23.5;24.2;20.3;Cadastre;;POLYGON Z ((770622.4 6277554.7 23.4, 770624.6 6277557.2 23.4, 770626.2 6277555.9 23.4, 770627.5 6277554.8 23.4, 770625.2 6277552.2 23.4, 770623.6 6277553.7 23.4, 770622.4 6277554.7 23.4))
-BATIMENT0000000211120288;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:28:19;2019-04-08 10:00:52;1962-01-01;;;;BDParcellaire recalée;3.0;Corrélation;1.0;1.0;2.0;50;10;7.2;20.2;27.4;28.4;20.3;Cadastre;C 0.2;POLYGON Z ((770640.5 6277554.6 27.4, 770634.6 6277548.2 27.4, 770628.4 6277554.1 27.4, 770630.4 6277556.3 27.4, 770629.2 6277557.4 27.4, 770633 6277561.5 27.4, 770640.5 6277554.6 27.4))
-BATIMENT0000000211120381;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:28:19;2019-04-08 10:00:52;1964-01-01;;;;BDParcellaire recalée;3.0;Interpolation bâti BDTopo;2.5;1.0;2.0;40;10;6.2;20.5;26.7;28.6;20.7;Cadastre;A 1.0;POLYGON Z ((770585.2 6277549.5 26.7, 770582.9 6277551.6 26.7, 770582.1 6277550.6 26.7, 770578 6277554.2 26.7, 770584.2 6277561.4 26.7, 770590.6 6277555.7 26.7, 770585.2 6277549.5 26.7))
-BATIMENT0000000211120433;Indifférenciée;Commercial et services;Résidentiel;Non;En service;2008-11-18 15:28:19;2019-04-08 10:00:52;;;;;BDParcellaire recalée;3.0;Interpolation bâti BDTopo;2.5;1.0;2.0;;;7.2;21.0;28.2;;;Cadastre;A 1.0;POLYGON Z ((770724.2 6277535.1 28.2, 770722.6 6277531 28.2, 770725.3 6277530 28.2, 770724 6277526.1 28.2, 770717.9 6277528.5 28.2, 770700 6277535.5 28.2, 770702.4 6277541.6 28.2, 770705.2 6277543.2 28.2, 770721.1 6277536.8 28.2, 770720.9 6277536.3 28.2, 770724.2 6277535.1 28.2))
-BATIMENT0000000211120366;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:28:19;2021-12-17 15:40:19;1962-01-01;;;;BDParcellaire recalée;3.0;Interpolation bâti BDTopo;2.5;1.0;2.0;50;10;6.4;21.3;27.7;27.8;;Cadastre;A 1.0;POLYGON Z ((770672 6277540.1 27.7, 770668.2 6277535.9 27.7, 770667 6277536.8 27.7, 770664.9 6277534.6 27.7, 770658.6 6277540.4 27.7, 770664.6 6277546.9 27.7, 770672 6277540.1 27.7))
-BATIMENT0000000211120365;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:28:19;2021-12-17 15:40:19;1961-01-01;;;;BDParcellaire recalée;3.0;Interpolation bâti BDTopo;2.5;1.0;2.0;50;10;6.4;21.3;27.7;27.8;;Cadastre;A 1.0;POLYGON Z ((770670.7 6277553.5 27.7, 770676.9 6277547.8 27.7, 770674.8 6277545.3 27.7, 770675.9 6277544.4 27.7, 770672 6277540.1 27.7, 770664.6 6277546.9 27.7, 770670.7 6277553.5 27.7))
-BATIMENT0000000211120412;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:28:19;2019-04-08 10:00:52;1981-01-01;;;;BDParcellaire recalée;3.0;Interpolation bâti BDTopo;2.5;1.0;1.0;50;10;3.9;21.3;25.2;;;Cadastre;B 0.4;POLYGON Z ((770748.6 6277552.3 25.2, 770748.8 6277553.8 25.2, 770753.7 6277553.1 25.2, 770752.9 6277547.8 25.2, 770754.1 6277547.6 25.2, 770753 6277539.6 25.2, 770748.7 6277540.2 25.2, 770749.1 6277543.4 25.2, 770737.7 6277544.9 25.2, 770739.1 6277554.9 25.2, 770742.8 6277554.4 25.2, 770742.6 6277553.1 25.2, 770746.3 6277552.6 25.2, 770746.2 6277551.6 25.2, 770748.4 6277551.3 25.2, 770748.6 6277552.3 25.2))
-BATIMENT0000000211120414;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:28:19;2017-03-30 10:33:07;;;;;BDParcellaire recalée;3.0;Corrélation;1.0;;;;;5.2;20.1;25.3;27.2;20.2;Cadastre;;POLYGON Z ((770709.4 6277547.2 25.2, 770710.3 6277549.5 25.2, 770714.7 6277547.9 25.2, 770713.7 6277545.6 25.2, 770709.4 6277547.2 25.2))
-BATIMENT0000000211120395;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:28:19;2017-03-30 10:33:07;;;;;BDParcellaire;5.0;Corrélation;1.0;;;;;2.8;20.2;23.0;23.4;20.2;Cadastre;;POLYGON Z ((770654.8 6277548.6 23, 770652.8 6277546.5 23, 770650.7 6277548.5 23, 770652.6 6277550.5 23, 770654.8 6277548.6 23))
-BATIMENT0000000211120411;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:28:19;2018-02-20 09:16:47;;;;;BDParcellaire recalée;3.0;Interpolation bâti BDTopo;2.5;;;;;4.1;21.3;25.4;;;Cadastre;;POLYGON Z ((770748.4 6277551.3 25.4, 770746.2 6277551.6 25.4, 770746.3 6277552.6 25.4, 770748.6 6277552.3 25.4, 770748.4 6277551.3 25.4))
-BATIMENT0000000211120396;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:28:19;2017-03-30 10:33:07;;;;;BDParcellaire;5.0;Corrélation;1.0;;;;;2.3;20.2;22.5;22.6;20.2;Cadastre;;POLYGON Z ((770653.4 6277553.2 22.4, 770651.6 6277551.3 22.4, 770650.1 6277552.8 22.4, 770651.8 6277554.6 22.4, 770653.4 6277553.2 22.4))
-BATIMENT0000000211120415;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:28:19;2019-04-08 10:00:52;1900-01-01;;;;BDParcellaire recalée;3.0;Interpolation bâti BDTopo;2.5;1.0;2.0;20;10;6.2;21.0;27.2;28.0;21.0;Cadastre;B 0.6;POLYGON Z ((770707.1 6277550.9 27.2, 770710.6 6277559.5 27.2, 770718.1 6277556.7 27.2, 770714.7 6277547.9 27.2, 770710.3 6277549.5 27.2, 770707.1 6277550.9 27.2))
-BATIMENT0000000211120394;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:28:19;2017-03-30 10:33:07;;;;;BDParcellaire;5.0;Corrélation;1.0;;;;;2.3;20.2;22.5;23.0;20.2;Cadastre;;POLYGON Z ((770656.5 6277560.1 22.5, 770654 6277557.4 22.5, 770651.6 6277559.5 22.5, 770654.1 6277562.3 22.5, 770656.5 6277560.1 22.5))
-BATIMENT0000000211120287;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:28:19;2018-02-20 11:33:35;;;;;BDParcellaire recalée;3.0;Interpolation bâti BDTopo;2.5;;;;;4.4;21.0;25.4;27.0;21.0;Cadastre;;POLYGON Z ((770633 6277561.5 25.4, 770629.2 6277557.4 25.4, 770630.4 6277556.3 25.4, 770628.4 6277554.1 25.4, 770627.5 6277554.8 25.4, 770626.2 6277555.9 25.4, 770632.2 6277562.3 25.4, 770633 6277561.5 25.4))
-BATIMENT0000000211120289;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:28:19;2019-04-08 10:00:52;1962-01-01;;;;BDParcellaire recalée;3.0;Interpolation bâti BDTopo;2.5;1.0;2.0;50;10;4.5;21.1;25.6;28.2;21.1;Cadastre;C 0.6;POLYGON Z ((770636.9 6277565.6 25.6, 770638 6277564.7 25.6, 770640 6277566.9 25.6, 770646.4 6277561 25.6, 770640.5 6277554.6 25.6, 770633 6277561.5 25.6, 770636.9 6277565.6 25.6))
-BATIMENT0000000211120380;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:28:19;2019-04-08 10:00:52;1964-01-01;;;;BDParcellaire recalée;3.0;Interpolation bâti BDTopo;2.5;1.0;2.0;40;10;6.2;20.5;26.7;28.7;20.7;Cadastre;A 1.0;POLYGON Z ((770578 6277554.2 26.7, 770573.3 6277558.3 26.7, 770574.2 6277559.3 26.7, 770572 6277561.3 26.7, 770577.5 6277567.4 26.7, 770584.2 6277561.4 26.7, 770578 6277554.2 26.7))
-BATIMENT0000000211120378;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:28:19;2019-04-08 10:00:52;1964-01-01;;;;BDParcellaire recalée;3.0;Interpolation bâti BDTopo;2.5;1.0;2.0;40;10;5.8;21.0;26.8;28.7;21.0;Cadastre;A 1.0;POLYGON Z ((770570.9 6277573.4 26.8, 770577.5 6277567.4 26.8, 770572 6277561.3 26.8, 770569.8 6277563.3 26.8, 770569 6277562.4 26.8, 770564.7 6277566.3 26.8, 770570.9 6277573.4 26.8))
-BATIMENT0000000211120301;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:28:19;2019-04-08 10:00:52;1962-01-01;;;;BDParcellaire recalée;3.0;Corrélation;1.0;1.0;2.0;50;10;7.2;20.3;27.5;28.2;20.4;Cadastre;C 1.0;POLYGON Z ((770612.4 6277574.2 27.5, 770611.2 6277575.2 27.5, 770609.3 6277573.2 27.5, 770603.2 6277578.8 27.5, 770608.7 6277584.7 27.5, 770616 6277578 27.5, 770612.4 6277574.2 27.5))
-BATIMENT0000000211120299;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:28:19;2019-04-08 10:00:52;1963-01-01;;;;BDParcellaire recalée;3.0;Corrélation;1.0;1.0;2.0;50;10;7.2;20.3;27.5;28.5;20.4;Cadastre;C 1.0;POLYGON Z ((770620.9 6277585.7 27.5, 770618.9 6277583.4 27.5, 770620.1 6277582.3 27.5, 770616 6277578 27.5, 770608.7 6277584.7 27.5, 770614.9 6277591.3 27.5, 770620.9 6277585.7 27.5))
-BATIMENT0000000211120297;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:28:19;2019-04-08 10:00:52;1962-01-01;;;;BDParcellaire recalée;3.0;Corrélation;1.0;1.0;2.0;50;10;7.2;20.3;27.5;28.4;20.4;Cadastre;C 1.0;POLYGON Z ((770620.9 6277597.7 27.4, 770628.2 6277591.1 27.4, 770624.2 6277587 27.4, 770623 6277587.9 27.4, 770620.9 6277585.7 27.4, 770614.9 6277591.3 27.4, 770620.9 6277597.7 27.4))
-BATIMENT0000000211120390;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:28:19;2017-03-30 10:33:07;;;;;BDParcellaire;5.0;Corrélation;1.0;;;;;6.7;20.6;27.3;29.5;20.7;Cadastre;;POLYGON Z ((770585.2 6277592 27.2, 770582.7 6277589.2 27.2, 770580.3 6277591.5 27.2, 770582.8 6277594.2 27.2, 770585.2 6277592 27.2))
-BATIMENT0000000211120393;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:28:19;2017-03-30 10:33:07;;;;;BDParcellaire;5.0;Corrélation;1.0;;;;;1.9;20.4;22.3;23.0;20.4;Cadastre;;POLYGON Z ((770609.2 6277593.8 22.2, 770607.1 6277591.6 22.2, 770605.5 6277593.1 22.2, 770607.8 6277595.4 22.2, 770609.2 6277593.8 22.2))
-BATIMENT0000000211120391;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:28:19;2017-03-30 10:33:07;;;;;BDParcellaire;5.0;Corrélation;1.0;;;;;4.4;20.6;25.0;27.3;20.7;Cadastre;;POLYGON Z ((770582 6277595.1 25, 770579.7 6277592.7 25, 770577.6 6277594.6 25, 770579.8 6277597.2 25, 770582 6277595.1 25))
-BATIMENT0000000211120295;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:28:19;2019-04-08 10:00:52;1961-01-01;;;;BDParcellaire recalée;3.0;Interpolation bâti BDTopo;2.5;1.0;2.0;30;10;5.9;21.0;26.9;27.8;21.0;Cadastre;A 1.0;POLYGON Z ((770681.1 6277565.3 26.9, 770682.6 6277563.9 26.9, 770678.5 6277559.6 26.9, 770677.5 6277560.6 26.9, 770675.1 6277558.2 26.9, 770673.6 6277559.6 26.9, 770667.3 6277565.7 26.9, 770673.7 6277572.3 26.9, 770681.1 6277565.3 26.9))
-BATIMENT0000000211120290;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:28:19;2019-04-08 10:00:52;1962-01-01;;;;BDParcellaire recalée;3.0;Interpolation bâti BDTopo;2.5;1.0;2.0;50;10;4.7;21.0;25.7;28.1;21.0;Cadastre;C 0.7;POLYGON Z ((770654 6277565.4 25.7, 770648.4 6277559.2 25.7, 770646.4 6277561 25.7, 770640 6277566.9 25.7, 770642.1 6277569.2 25.7, 770641 6277570.1 25.7, 770644.6 6277574 25.7, 770652 6277567.2 25.7, 770654 6277565.4 25.7))
-BATIMENT0000000211120294;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:28:19;2019-04-08 10:00:52;1962-01-01;;;;BDParcellaire recalée;3.0;Interpolation bâti BDTopo;2.5;1.0;2.0;30;10;5.9;21.0;26.9;27.8;21.0;Cadastre;A 1.0;POLYGON Z ((770680.1 6277578.8 26.9, 770686.2 6277572.8 26.9, 770684.3 6277570.8 26.9, 770685.3 6277569.8 26.9, 770681.1 6277565.3 26.9, 770673.7 6277572.3 26.9, 770680.1 6277578.8 26.9))
-BATIMENT0000000211120291;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:28:19;2019-04-08 10:00:52;1962-01-01;;;;BDParcellaire recalée;3.0;Interpolation bâti BDTopo;2.5;1.0;2.0;50;10;5.2;21.0;26.2;28.2;21.0;Cadastre;C 0.2;POLYGON Z ((770648.6 6277578.5 26.2, 770649.9 6277577.5 26.2, 770651.8 6277579.6 26.2, 770655.2 6277576.5 26.2, 770658.1 6277573.9 26.2, 770652 6277567.2 26.2, 770644.6 6277574 26.2, 770648.6 6277578.5 26.2))
-BATIMENT0000002000330691;Indifférenciée;Résidentiel;Annexe;Non;En service;2016-11-10 15:17:04;2019-04-08 10:00:52;2014-01-01;2015-07-01;;;Photogrammétrie;2.5;Photogrammétrie;1.5;34.0;6.0;00;00;19.1;18.9;;;;Imagerie aérienne;A 1.0;POLYGON Z ((770724 6277585.2 37.1, 770733.8 6277585.2 37.1, 770733.7 6277587.5 34.8, 770737.9 6277587.5 34.8, 770737.7 6277585.2 38, 770737.7 6277583.6 38, 770742.6 6277583.4 38, 770742.6 6277585.3 38, 770744.4 6277585.3 38, 770744.4 6277587.4 36.9, 770756.4 6277587.3 36.9, 770756.3 6277585.2 37.9, 770756.2 6277569.6 37.9, 770756 6277567.4 36.4, 770740.3 6277567.3 36.4, 770740.3 6277569.3 37.2, 770723.8 6277569.3 37, 770724 6277585.2 37.1))
-BATIMENT0000000211120292;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:28:19;2019-04-08 10:00:52;1962-01-01;;;;BDParcellaire recalée;3.0;Interpolation bâti BDTopo;2.5;1.0;2.0;50;10;5.4;21.0;26.4;28.2;21.0;Cadastre;C 0.6;POLYGON Z ((770661.2 6277582.9 26.4, 770655.2 6277576.5 26.4, 770651.8 6277579.6 26.4, 770649 6277582.3 26.4, 770651.2 6277584.4 26.4, 770650.1 6277585.3 26.4, 770654 6277589.6 26.4, 770661.2 6277582.9 26.4))
-BATIMENT0000000211120293;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:28:19;2019-04-08 10:00:52;1962-01-01;;;;BDParcellaire recalée;3.0;Interpolation bâti BDTopo;2.5;1.0;2.0;50;10;4.9;21.0;25.9;28.2;21.0;Cadastre;C 0.5;POLYGON Z ((770658 6277594 25.9, 770659 6277593 25.9, 770661.1 6277595.2 25.9, 770667.2 6277589.4 25.9, 770661.2 6277582.9 25.9, 770654 6277589.6 25.9, 770658 6277594 25.9))
-BATIMENT0000000211120420;Indifférenciée;Résidentiel;Annexe;Non;En service;2008-11-18 15:28:19;2019-04-08 10:00:52;1963-01-01;;;;BDParcellaire recalée;3.0;Interpolation bâti BDTopo;2.5;25.0;4.0;34;49;13.8;21.0;34.8;;;Cadastre;A 1.0;POLYGON Z ((770762 6277609.6 34.8, 770733.3 6277609.5 34.8, 770733.4 6277621.6 34.8, 770762 6277621.7 34.8, 770762 6277609.6 34.8))
-BATIMENT0000000211120284;Indifférenciée;Résidentiel;Annexe;Non;En service;2008-11-18 15:28:19;2019-04-08 10:00:52;;;;;BDParcellaire recalée;3.0;Interpolation bâti BDTopo;2.5;58.0;6.0;00;00;19.0;21.2;40.2;41.9;21.5;Cadastre;A 1.0;POLYGON Z ((770620 6277667.2 40.2, 770624.7 6277663 40.2, 770625.3 6277663.6 40.2, 770630.7 6277658.7 40.2, 770630.2 6277658.1 40.2, 770640.1 6277649 40.2, 770640.7 6277649.6 40.2, 770646 6277644.6 40.2, 770645.5 6277644 40.2, 770654.8 6277635.2 40.2, 770655.4 6277635.8 40.2, 770660.6 6277631 40.2, 770660.2 6277630.4 40.2, 770669.7 6277621.6 40.2, 770670.2 6277622.1 40.2, 770675.7 6277617.3 40.2, 770675.3 6277616.6 40.2, 770684.7 6277607.8 40.2, 770685.4 6277608.4 40.2, 770690.4 6277603.7 40.2, 770689.9 6277602.9 40.2, 770694.6 6277598.6 40.2, 770688.6 6277592.2 40.2, 770614.1 6277660.7 40.2, 770620 6277667.2 40.2))
-BATIMENT0000000211120319;Indifférenciée;Résidentiel;Annexe;Non;En service;2008-11-18 15:28:19;2019-04-08 10:00:52;1963-01-01;;;;BDParcellaire recalée;3.0;Interpolation bâti BDTopo;2.5;20.0;5.0;40;40;17.2;21.8;39.0;;;Cadastre;C 0.4;POLYGON Z ((770645.8 6277685 39, 770648 6277687.2 39, 770654.7 6277680.8 39, 770655.1 6277681.2 39, 770657.6 6277678.9 39, 770657.3 6277678.3 39, 770670.9 6277665.4 39, 770671.4 6277665.8 39, 770673.9 6277663.6 39, 770673.5 6277663.1 39, 770687.1 6277650.1 39, 770687.6 6277650.7 39, 770689.8 6277648.5 39, 770689.4 6277648 39, 770696.5 6277641.4 39, 770700 6277645 39, 770699.5 6277645.5 39, 770701.8 6277647.7 39, 770702.4 6277647.2 39, 770706.3 6277651.4 39, 770712.6 6277645.4 39, 770701.3 6277633.4 39, 770694.9 6277639.4 39, 770690.6 6277634.9 39, 770639.8 6277682.8 39, 770643.8 6277687 39, 770645.8 6277685 39))
-BATIMENT0000000211120296;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:28:19;2019-04-08 10:00:52;1962-01-01;;;;BDParcellaire recalée;3.0;Corrélation;1.0;1.0;2.0;34;10;7.2;20.3;27.5;28.4;20.4;Cadastre;C 1.0;POLYGON Z ((770633.2 6277598.8 27.4, 770630.8 6277596.3 27.4, 770632 6277595.2 27.4, 770628.2 6277591.1 27.4, 770620.9 6277597.7 27.4, 770627.1 6277604.3 27.4, 770633.2 6277598.8 27.4))
-BATIMENT0000000211120298;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:28:19;2019-04-08 10:00:52;1963-01-01;;;;BDParcellaire recalée;3.0;Corrélation;1.0;1.0;2.0;24;10;7.3;20.3;27.6;28.4;20.5;Cadastre;C 1.0;POLYGON Z ((770640.3 6277604 27.5, 770636.2 6277599.7 27.5, 770635 6277600.8 27.5, 770633.2 6277598.8 27.5, 770627.1 6277604.3 27.5, 770633.1 6277610.6 27.5, 770640.3 6277604 27.5))
-BATIMENT0000000211120300;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:28:19;2019-04-08 10:00:52;1962-01-01;;;;BDParcellaire recalée;3.0;Corrélation;1.0;1.0;2.0;50;10;7.0;20.4;27.4;28.2;20.6;Cadastre;C 0.7;POLYGON Z ((770638.5 6277616.4 27.4, 770644.3 6277611 27.4, 770642.2 6277608.6 27.4, 770643.5 6277607.4 27.4, 770640.3 6277604 27.4, 770633.1 6277610.6 27.4, 770638.5 6277616.4 27.4))
-BATIMENT0000000211120334;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:28:19;2019-04-08 10:00:52;1963-01-01;;;;BDParcellaire recalée;3.0;Corrélation;1.0;1.0;2.0;50;10;6.9;20.6;27.5;28.2;20.7;Cadastre;C 1.0;POLYGON Z ((770626.1 6277623.5 27.4, 770625.5 6277622.5 27.4, 770627.3 6277620.8 27.4, 770621.6 6277614.5 27.4, 770615.1 6277620.6 27.4, 770621.7 6277627.6 27.4, 770626.1 6277623.5 27.4))
-BATIMENT0000000211120333;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:28:19;2019-04-08 10:00:52;1962-01-01;;;;BDParcellaire recalée;3.0;Interpolation bâti BDTopo;2.5;1.0;2.0;50;10;4.4;21.4;25.8;28.2;21.4;Cadastre;C 0.8;POLYGON Z ((770615.1 6277620.6 25.8, 770608.5 6277626.7 25.8, 770614.2 6277632.7 25.8, 770616.4 6277630.7 25.8, 770617.2 6277631.7 25.8, 770621.7 6277627.6 25.8, 770615.1 6277620.6 25.8))
-BATIMENT0000000211120331;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:28:19;2019-04-08 10:00:52;1962-01-01;;;;BDParcellaire recalée;3.0;Corrélation;1.0;1.0;2.0;50;10;7.0;20.7;27.7;28.7;20.9;Cadastre;C 0.4;POLYGON Z ((770608.5 6277626.7 27.7, 770606.6 6277628.5 27.7, 770604.7 6277630.3 27.7, 770602 6277632.8 27.7, 770608.5 6277639.8 27.7, 770612.5 6277636 27.7, 770611.8 6277635.1 27.7, 770614.2 6277632.7 27.7, 770608.5 6277626.7 27.7))
-BATIMENT0000000211120332;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:28:19;2019-04-08 10:00:52;1962-01-01;;;;BDParcellaire recalée;3.0;Interpolation bâti BDTopo;2.5;1.0;2.0;50;10;4.8;21.4;26.2;28.5;21.4;Cadastre;C 0.2;POLYGON Z ((770595.8 6277638.6 26.2, 770601.5 6277644.6 26.2, 770603.3 6277642.8 26.2, 770604.4 6277643.7 26.2, 770608.5 6277639.8 26.2, 770602 6277632.8 26.2, 770595.8 6277638.6 26.2))
-BATIMENT0000000211120326;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:28:19;2017-03-30 10:33:07;;;;;BDParcellaire recalée;3.0;Corrélation;1.0;;;;;3.3;21.0;24.3;27.3;21.3;Cadastre;;POLYGON Z ((770592.1 6277643.7 24.2, 770597.6 6277649.8 24.2, 770600.1 6277647.5 24.2, 770594.5 6277641.6 24.2, 770592.1 6277643.7 24.2))
-BATIMENT0000000211120324;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:28:19;2019-04-08 10:00:52;1963-01-01;;;;BDParcellaire recalée;3.0;Interpolation bâti BDTopo;2.5;1.0;2.0;40;10;6.6;21.4;28.0;29.0;21.5;Cadastre;A 1.0;POLYGON Z ((770598.5 6277650.7 28, 770597.6 6277649.8 28, 770592.1 6277643.7 28, 770590.6 6277641.8 28, 770584 6277648 28, 770585.6 6277649.7 28, 770592.1 6277656.7 28, 770598.5 6277650.7 28))
-BATIMENT0000000211120320;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:28:19;2017-03-30 10:33:07;;;;;BDParcellaire recalée;3.0;Corrélation;1.0;;;;;4.2;21.3;25.5;26.8;21.4;Cadastre;;POLYGON Z ((770581.6 6277653.4 25.5, 770579.8 6277651.4 25.5, 770577.4 6277653.8 25.5, 770579.2 6277655.7 25.5, 770581.6 6277653.4 25.5))
-BATIMENT0000000211120419;Indifférenciée;Indifférencié;;Non;En service;2008-11-18 15:28:19;2022-09-29 16:55:19;1870-01-01;2021-08-11;;;Photogrammétrie;2.5;Photogrammétrie;1.5;1.0;2.0;;;18.8;22.0;;30.9;22.2;Imagerie aérienne;A 1.0;POLYGON Z ((770760.9 6277673.1 40.8, 770760.1 6277649.4 40.8, 770757.6 6277645.4 40.8, 770745.4 6277645.7 40.8, 770740.1 6277649.1 40.8, 770755.8 6277676 40.8, 770760.9 6277673.1 40.8))
-BATIMENT0000000211120336;Indifférenciée;Annexe;;Non;En service;2008-11-18 15:28:19;2023-03-22 21:39:07;1963-01-01;;;;BDParcellaire recalée;3.0;Interpolation bâti BDTopo;2.5;0.0;1.0;00;00;1.9;21.9;23.8;25.8;23.2;Cadastre;C 0.4;POLYGON Z ((770709.8 6277671.6 23.8, 770696.6 6277657.7 23.8, 770644.3 6277707.9 23.8, 770657 6277721.8 23.8, 770709.8 6277671.6 23.8))
-BATIMENT0000000211120317;Indifférenciée;Résidentiel;Annexe;Non;En service;2008-11-18 15:28:19;2019-04-08 10:00:52;1963-01-01;;;;BDParcellaire recalée;3.0;Interpolation bâti BDTopo;2.5;20.0;5.0;40;40;17.2;22.4;39.6;39.6;23.2;Cadastre;C 0.7;POLYGON Z ((770624 6277706.9 39.6, 770623.6 6277707.4 39.6, 770625.6 6277709.4 39.6, 770626 6277708.9 39.6, 770635.7 6277719.4 39.6, 770635.2 6277719.8 39.6, 770637.1 6277721.8 39.6, 770637.6 6277721.3 39.6, 770647.5 6277731.8 39.6, 770647 6277732.3 39.6, 770648.7 6277733.9 39.6, 770649 6277733.5 39.6, 770654.4 6277739.1 39.6, 770661.3 6277732.5 39.6, 770667 6277738.5 39.6, 770672.1 6277733.7 39.6, 770672.7 6277734.4 39.6, 770674.4 6277732.7 39.6, 770673.9 6277732.2 39.6, 770684.6 6277722.1 39.6, 770685.1 6277722.6 39.6, 770686.9 6277721 39.6, 770686.5 6277720.3 39.6, 770697 6277710.4 39.6, 770697.5 6277711 39.6, 770699.7 6277709 39.6, 770699.2 6277708.4 39.6, 770704.6 6277703.3 39.6, 770698.2 6277696.7 39.6, 770661 6277731.9 39.6, 770626.5 6277695.1 39.6, 770619.4 6277701.7 39.6, 770624 6277706.9 39.6))
-BATIMENT0000000211120339;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:28:19;2019-04-08 10:00:52;1963-01-01;;;;BDParcellaire recalée;3.0;Interpolation bâti BDTopo;2.5;1.0;2.0;40;10;7.3;22.0;29.3;29.4;22.0;Cadastre;A 1.0;POLYGON Z ((770542.7 6277676.8 29.3, 770548.4 6277683.2 29.3, 770550.6 6277681.2 29.3, 770551.7 6277682.2 29.3, 770556.1 6277678.1 29.3, 770549.3 6277670.6 29.3, 770542.7 6277676.8 29.3))
-BATIMENT0000000211120338;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:28:19;2019-04-08 10:00:52;1963-01-01;;;;BDParcellaire recalée;3.0;Interpolation bâti BDTopo;2.5;1.0;2.0;10;10;7.3;22.0;29.3;29.7;22.0;Cadastre;B 0.6;POLYGON Z ((770539.8 6277679.5 29.3, 770536.4 6277682.7 29.3, 770543.2 6277690.1 29.3, 770547.1 6277686.4 29.3, 770546.1 6277685.2 29.3, 770548.4 6277683.2 29.3, 770542.7 6277676.8 29.3, 770539.8 6277679.5 29.3))
-BATIMENT0000000211120340;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:28:19;2019-04-08 10:00:52;1963-01-01;;;;BDParcellaire recalée;3.0;Interpolation bâti BDTopo;2.5;1.0;2.0;40;10;7.3;22.0;29.3;29.9;22.1;Cadastre;A 1.0;POLYGON Z ((770536.4 6277682.7 29.3, 770530 6277688.6 29.3, 770535.7 6277694.9 29.3, 770537.9 6277692.9 29.3, 770539 6277694 29.3, 770543.2 6277690.1 29.3, 770536.4 6277682.7 29.3))
-BATIMENT0000000211120342;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:28:19;2019-04-08 10:00:52;1963-01-01;;;;BDParcellaire recalée;3.0;Interpolation bâti BDTopo;2.5;1.0;2.0;40;10;7.3;22.0;29.3;29.8;22.3;Cadastre;A 1.0;POLYGON Z ((770534.2 6277698 29.3, 770533.4 6277697 29.3, 770535.7 6277694.9 29.3, 770530 6277688.6 29.3, 770523.3 6277694.8 29.3, 770530 6277702.1 29.3, 770534.2 6277698 29.3))
-BATIMENT0000000211120344;Indifférenciée;Annexe;;Non;En service;2008-11-18 15:28:19;2019-04-08 10:00:52;;;;;BDParcellaire recalée;3.0;Corrélation;1.0;0.0;1.0;;;2.1;22.0;24.1;25.3;22.2;Cadastre;A 0.2;POLYGON Z ((770517.6 6277698.8 24, 770515.3 6277696.4 24, 770515.8 6277696.1 24, 770514.5 6277694.9 24, 770512.9 6277696.5 24, 770516.2 6277700.1 24, 770517.6 6277698.8 24))
-BATIMENT0000000211120343;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:28:19;2019-04-08 10:00:52;1962-01-01;;;;BDParcellaire recalée;3.0;Interpolation bâti BDTopo;2.5;1.0;2.0;34;10;7.2;22.0;29.2;29.9;22.5;Cadastre;A 0.5;POLYGON Z ((770522.4 6277707 29.2, 770524.8 6277705 29.2, 770525.8 6277706 29.2, 770530 6277702.1 29.2, 770523.3 6277694.8 29.2, 770516.8 6277700.8 29.2, 770521.4 6277706 29.2, 770522.4 6277707 29.2))
-BATIMENT0000000211120401;Indifférenciée;Indifférencié;;Non;En service;2008-11-18 15:28:19;2019-04-08 10:00:52;1970-01-01;;;;BDParcellaire;5.0;Corrélation;1.0;0.0;1.0;;;7.3;22.0;29.3;34.3;22.2;Cadastre;C 0.2;POLYGON Z ((770571.2 6277707.7 29.2, 770568.3 6277704.4 29.2, 770564.9 6277707.7 29.2, 770567.8 6277710.8 29.2, 770571.2 6277707.7 29.2))
-BATIMENT0000000211120348;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:28:19;2019-04-08 10:00:52;1962-01-01;;;;BDParcellaire recalée;3.0;Interpolation bâti BDTopo;2.5;1.0;2.0;40;10;5.9;23.1;29.0;30.4;23.1;Cadastre;A 1.0;POLYGON Z ((770515 6277728.7 29, 770521.2 6277723.1 29, 770519.1 6277720.9 29, 770520.3 6277719.6 29, 770516.5 6277715.5 29, 770509.2 6277722.3 29, 770515 6277728.7 29))
-BATIMENT0000000211120347;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:28:19;2019-04-08 10:00:52;1962-01-01;;;;BDParcellaire recalée;3.0;Interpolation bâti BDTopo;2.5;1.0;2.0;34;10;5.8;23.3;29.1;30.5;23.3;Cadastre;A 1.0;POLYGON Z ((770528.5 6277728.5 29.1, 770524.4 6277724.1 29.1, 770523.2 6277725.3 29.1, 770521.2 6277723.1 29.1, 770515 6277728.7 29.1, 770521.1 6277735.3 29.1, 770528.5 6277728.5 29.1))
-BATIMENT0000000211120345;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:28:19;2017-03-30 10:33:07;;;;;BDParcellaire recalée;3.0;Corrélation;1.0;;;;;5.5;22.5;28.0;28.9;22.6;Cadastre;;POLYGON Z ((770521.1 6277735.3 28, 770515 6277728.7 28, 770513.7 6277730 28, 770519.6 6277736.6 28, 770521.1 6277735.3 28))
-BATIMENT0000000211120322;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:28:19;2019-04-08 10:00:52;1962-01-01;;;;BDParcellaire recalée;3.0;Interpolation bâti BDTopo;2.5;1.0;2.0;45;10;6.6;21.4;28.0;28.9;21.5;Cadastre;A 1.0;POLYGON Z ((770581.6 6277653.4 28, 770579.2 6277655.7 28, 770584.7 6277661.8 28, 770586.9 6277659.7 28, 770587.9 6277660.7 28, 770592.1 6277656.8 28, 770592.1 6277656.7 28, 770585.6 6277649.7 28, 770581.6 6277653.4 28))
-BATIMENT0000000211120321;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:28:19;2019-04-08 10:00:52;1963-01-01;;;;BDParcellaire recalée;3.0;Interpolation bâti BDTopo;2.5;1.0;2.0;40;10;6.5;21.4;27.9;28.9;21.5;Cadastre;A 1.0;POLYGON Z ((770572.7 6277661.7 27.9, 770579.1 6277668.7 27.9, 770583.6 6277664.6 27.9, 770582.7 6277663.6 27.9, 770584.7 6277661.8 27.9, 770579.2 6277655.7 27.9, 770572.7 6277661.7 27.9))
-BATIMENT0000000211120323;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:28:19;2019-04-08 10:00:52;1962-01-01;;;;BDParcellaire recalée;3.0;Interpolation bâti BDTopo;2.5;1.0;2.0;40;10;6.5;21.4;27.9;29.0;21.6;Cadastre;A 0.9;POLYGON Z ((770572.7 6277661.7 27.9, 770566.1 6277667.9 27.9, 770571.6 6277673.9 27.9, 770573.9 6277671.8 27.9, 770574.7 6277672.7 27.9, 770579.1 6277668.7 27.9, 770572.7 6277661.7 27.9))
-BATIMENT0000000211120325;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:28:19;2023-03-22 21:39:05;1962-01-01;;;;BDParcellaire recalée;3.0;Corrélation;1.0;0.0;2.0;40;10;2.6;21.8;24.5;24.8;22.0;Cadastre;A 0.9;POLYGON Z ((770574.7 6277672.7 24.5, 770573.9 6277671.8 24.5, 770571.6 6277673.9 24.5, 770572.4 6277674.8 24.5, 770574.7 6277672.7 24.5))
-BATIMENT0000000211120285;Indifférenciée;Résidentiel;Annexe;Non;En service;2008-11-18 15:28:19;2019-04-08 10:00:52;;;;;BDParcellaire recalée;3.0;Interpolation bâti BDTopo;2.5;40.0;10.0;00;00;23.2;21.0;44.2;53.3;23.2;Cadastre;C 0.5;POLYGON Z ((770605.2 6277736.1 44.2, 770600.6 6277731.3 44.2, 770601.5 6277730.6 44.2, 770596.9 6277725.8 44.2, 770596.1 6277726.4 44.2, 770586 6277715.9 44.2, 770586.8 6277715.1 44.2, 770582.6 6277710.7 44.2, 770581.8 6277711.3 44.2, 770577 6277706.4 44.2, 770580.2 6277703.5 44.2, 770580.8 6277703.9 44.2, 770585.8 6277699.3 44.2, 770585.4 6277698.7 44.2, 770589.9 6277694.5 44.2, 770590.2 6277694.8 44.2, 770595.2 6277690.1 44.2, 770595.9 6277690.6 44.2, 770600.7 6277686.1 44.2, 770600.2 6277685.6 44.2, 770609.8 6277676.6 44.2, 770610.5 6277677.2 44.2, 770615.6 6277672.6 44.2, 770614.8 6277671.9 44.2, 770620 6277667.2 44.2, 770614.1 6277660.7 44.2, 770569.7 6277701.5 44.2, 770575.6 6277707.9 44.2, 770570.1 6277713.2 44.2, 770598.2 6277742.7 44.2, 770605.2 6277736.1 44.2))
-BATIMENT0000000211120282;Indifférenciée;Résidentiel;Annexe;Non;En service;2008-11-18 15:28:19;2023-03-22 21:39:07;;;;;BDParcellaire recalée;3.0;Interpolation bâti BDTopo;2.5;53.0;7.0;10;10;22.3;24.7;47.0;47.0;26.3;Cadastre;C 0.6;POLYGON Z ((770541.6 6277843.5 47, 770547.4 6277849.5 47, 770576.8 6277822.1 47, 770575.2 6277820.3 47, 770616.8 6277781.2 47, 770616.2 6277780.3 47, 770617.3 6277779.2 47, 770616.1 6277777.8 47, 770614.7 6277778.9 47, 770612.2 6277776.2 47, 770637.1 6277753.1 47, 770628.9 6277744.2 47, 770603.9 6277767.3 47, 770608.9 6277772.7 47, 770567.1 6277811.9 47, 770568.7 6277813.7 47, 770539.5 6277841.2 47, 770533.7 6277835.3 47, 770513.2 6277855 47, 770520.9 6277863.2 47, 770541.6 6277843.5 47))
-BATIMENT0000000211120346;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:28:19;2019-04-08 10:00:52;1962-01-01;;;;BDParcellaire recalée;3.0;Interpolation bâti BDTopo;2.5;1.0;2.0;34;10;5.8;23.3;29.1;30.3;23.3;Cadastre;A 1.0;POLYGON Z ((770527.1 6277741.9 29.1, 770533.3 6277736.2 29.1, 770531.5 6277734.2 29.1, 770532.6 6277733 29.1, 770528.5 6277728.5 29.1, 770521.1 6277735.3 29.1, 770527.1 6277741.9 29.1))
-BATIMENT0000000211120349;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:28:19;2019-04-08 10:00:52;1963-01-01;;;;BDParcellaire recalée;3.0;Interpolation bâti BDTopo;2.5;1.0;2.0;40;10;6.1;23.1;29.2;30.4;23.1;Cadastre;A 1.0;POLYGON Z ((770540.8 6277741.9 29.2, 770536.5 6277737.2 29.2, 770535.2 6277738.3 29.2, 770533.3 6277736.2 29.2, 770527.1 6277741.9 29.2, 770533.3 6277748.6 29.2, 770540.8 6277741.9 29.2))
-BATIMENT0000000211120351;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:28:19;2019-04-08 10:00:52;1963-01-01;;;;BDParcellaire recalée;3.0;Interpolation bâti BDTopo;2.5;1.0;2.0;34;10;6.3;23.0;29.3;30.4;23.0;Cadastre;A 1.0;POLYGON Z ((770546.6 6277748.2 29.3, 770544.3 6277745.7 29.3, 770540.8 6277741.9 29.3, 770533.3 6277748.6 29.3, 770532.1 6277749.8 29.3, 770537.9 6277756.2 29.3, 770546.6 6277748.2 29.3))
-BATIMENT0000000211120327;Indifférenciée;Résidentiel;Annexe;Non;En service;2008-11-18 15:28:19;2019-04-08 10:00:52;1975-01-01;;;;BDParcellaire recalée;3.0;Interpolation bâti BDTopo;2.5;23.0;6.0;50;10;17.9;24.0;41.9;;;Cadastre;C 0.9;POLYGON Z ((770579.2 6277769.6 41.9, 770563.8 6277753.8 41.9, 770555.2 6277762 41.9, 770554.1 6277760.7 41.9, 770554.6 6277760.3 41.9, 770552.6 6277758.1 41.9, 770544.9 6277765.6 41.9, 770548 6277768.7 41.9, 770551 6277765.8 41.9, 770566.6 6277781.7 41.9, 770579.2 6277769.6 41.9))
-BATIMENT0000000211120318;Indifférenciée;Résidentiel;Annexe;Non;En service;2008-11-18 15:28:19;2019-04-08 10:00:52;1975-01-01;;;;BDParcellaire recalée;3.0;Interpolation bâti BDTopo;2.5;23.0;6.0;50;10;16.7;25.2;41.9;;;Cadastre;C 0.6;POLYGON Z ((770546.9 6277800.2 41.9, 770531.8 6277784.4 41.9, 770519.2 6277796.4 41.9, 770534.5 6277812.3 41.9, 770546.9 6277800.2 41.9))
-BATIMENT0000000211120515;Indifférenciée;Indifférencié;;Non;En service;2008-11-18 15:28:19;2019-04-08 10:00:52;1972-01-01;;;;BDParcellaire recalée;3.0;Corrélation;1.0;0.0;7.0;;;7.5;25.8;33.3;43.5;26.1;Cadastre;C 0.2;POLYGON Z ((770519.7 6277863.6 33.2, 770515.9 6277859.6 33.2, 770513.8 6277861.7 33.2, 770517.5 6277865.6 33.2, 770519.7 6277863.6 33.2))
-BATIMENT0000000211120376;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:28:19;2019-04-08 10:00:52;1964-01-01;;;;BDParcellaire recalée;3.0;Interpolation bâti BDTopo;2.5;1.0;2.0;43;14;5.7;21.2;26.9;28.7;21.2;Cadastre;A 1.0;POLYGON Z ((770560.1 6277570.4 26.9, 770560.9 6277571.3 26.9, 770558.9 6277573.2 26.9, 770564.3 6277579.3 26.9, 770570.9 6277573.4 26.9, 770564.7 6277566.3 26.9, 770560.1 6277570.4 26.9))
-BATIMENT0000000211120377;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:28:19;2019-04-08 10:00:52;1964-01-01;;;;BDParcellaire recalée;3.0;Interpolation bâti BDTopo;2.5;1.0;2.0;40;10;5.5;21.5;27.0;28.7;21.5;Cadastre;A 1.0;POLYGON Z ((770557.6 6277585.2 27, 770564.3 6277579.3 27, 770558.9 6277573.2 27, 770556.6 6277575.2 27, 770555.8 6277574.3 27, 770551.5 6277578.2 27, 770557.6 6277585.2 27))
-BATIMENT0000000211120379;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:28:19;2019-04-08 10:00:52;1964-01-01;;;;BDParcellaire recalée;3.0;Interpolation bâti BDTopo;2.5;1.0;2.0;45;10;5.3;21.8;27.1;28.7;21.8;Cadastre;A 1.0;POLYGON Z ((770557.6 6277591.8 27.1, 770554.4 6277588.1 27.1, 770557.6 6277585.2 27.1, 770551.5 6277578.2 27.1, 770546.8 6277582.4 27.1, 770547.6 6277583.3 27.1, 770545.2 6277585.3 27.1, 770554 6277595 27.1, 770557.6 6277591.8 27.1))
-BATIMENT0000000211120316;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:28:19;2019-04-08 10:00:52;1964-01-01;;;;BDParcellaire recalée;3.0;Corrélation;1.0;1.0;2.0;45;10;6.8;21.1;27.9;28.8;21.3;Cadastre;A 1.0;POLYGON Z ((770539.4 6277601.5 27.9, 770546.2 6277595.4 27.9, 770540.8 6277589.4 27.9, 770538.1 6277591.7 27.9, 770537.3 6277590.8 27.9, 770533.2 6277594.5 27.9, 770539.4 6277601.5 27.9))
-BATIMENT0000000211120315;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:28:19;2019-04-08 10:00:52;1964-01-01;;;;BDParcellaire recalée;3.0;Corrélation;1.0;1.0;1.0;40;10;7.0;21.2;28.2;28.9;21.4;Cadastre;A 1.0;POLYGON Z ((770539.4 6277601.5 28.1, 770533.2 6277594.5 28.1, 770528.5 6277598.6 28.1, 770525.5 6277595.3 28.1, 770523.3 6277597.1 28.1, 770532.6 6277607.7 28.1, 770539.4 6277601.5 28.1))
-BATIMENT0000000211120311;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:28:19;2018-02-20 11:33:35;;;;;BDParcellaire recalée;3.0;Interpolation bâti BDTopo;2.5;;;;;4.3;22.0;26.3;27.0;22.0;Cadastre;;POLYGON Z ((770524 6277602.7 26.3, 770523 6277601.7 26.3, 770518.7 6277605.7 26.3, 770519.6 6277606.6 26.3, 770524 6277602.7 26.3))
-BATIMENT0000000211120314;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:28:19;2019-04-08 10:00:52;1962-01-01;;;;BDParcellaire recalée;3.0;Corrélation;1.0;1.0;2.0;04;01;6.9;21.3;28.2;28.9;21.5;Cadastre;C 0.6;POLYGON Z ((770523.3 6277597.1 28.1, 770520.8 6277599.3 28.1, 770523 6277601.7 28.1, 770524 6277602.7 28.1, 770519.6 6277606.6 28.1, 770525.9 6277613.7 28.1, 770526.3 6277613.4 28.1, 770532.6 6277607.7 28.1, 770523.3 6277597.1 28.1))
-BATIMENT0000000211120312;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:28:19;2018-02-20 09:16:47;;;;;BDParcellaire recalée;3.0;Interpolation bâti BDTopo;2.5;;;;;4.5;22.0;26.5;;;Cadastre;;POLYGON Z ((770519.6 6277606.6 26.5, 770518.7 6277605.7 26.5, 770514.4 6277609.6 26.5, 770515.2 6277610.5 26.5, 770519.6 6277606.6 26.5))
-BATIMENT0000000231251240;Indifférenciée;Indifférencié;;Non;En service;2010-04-30 12:01:24;2018-02-20 09:16:47;;2009-07-01;;;Photogrammétrie;2.5;Photogrammétrie;1.5;;;;;3.2;22.2;;;;Imagerie aérienne;;POLYGON Z ((770526.3 6277613.4 25.4, 770528 6277615.6 24.6, 770534.7 6277610.5 24.9, 770532.6 6277607.7 25.4, 770526.3 6277613.4 25.4))
-BATIMENT0000000211120310;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:28:19;2019-04-08 10:00:52;1963-01-01;;;;BDParcellaire recalée;3.0;Corrélation;1.0;1.0;2.0;40;10;6.7;21.4;28.1;28.8;21.5;Cadastre;A 0.7;POLYGON Z ((770525.9 6277613.7 28, 770519.6 6277606.6 28, 770515.2 6277610.5 28, 770514.4 6277609.6 28, 770511.7 6277606.4 28, 770509.1 6277608.6 28, 770513.5 6277613.7 28, 770519 6277619.9 28, 770525.9 6277613.7 28))
-BATIMENT0000000211120392;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:28:19;2017-03-30 10:33:07;;;;;BDParcellaire;5.0;Corrélation;1.0;;;;;3.6;21.1;24.7;26.5;21.2;Cadastre;;POLYGON Z ((770558.3 6277616 24.6, 770555.3 6277613.1 24.6, 770552.4 6277616.2 24.6, 770555.3 6277619.1 24.6, 770558.3 6277616 24.6))
-BATIMENT0000000211120276;Indifférenciée;Annexe;;Non;En service;2008-11-18 15:28:19;2019-04-08 10:00:52;;;;;BDParcellaire;5.0;Corrélation;1.0;0.0;1.0;;;2.1;21.4;23.5;24.0;21.5;Cadastre;A 0.1;POLYGON Z ((770529.3 6277624.2 23.5, 770527.9 6277622.6 23.5, 770524.9 6277625.2 23.5, 770526.3 6277626.9 23.5, 770529.3 6277624.2 23.5))
-BATIMENT0000000211120277;Indifférenciée;Indifférencié;;Non;En service;2008-11-18 15:28:19;2017-03-30 10:33:07;;;;;BDParcellaire;5.0;Corrélation;1.0;;;;;2.9;21.4;24.3;24.4;21.5;Cadastre;;POLYGON Z ((770530 6277625 24.2, 770529.3 6277624.2 24.2, 770526.3 6277626.9 24.2, 770526.9 6277627.6 24.2, 770530 6277625 24.2))
-BATIMENT0000000211120306;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:28:19;2019-04-08 10:00:52;1966-01-01;;;;BDParcellaire recalée;3.0;Interpolation bâti BDTopo;2.5;1.0;2.0;40;10;5.7;22.0;27.7;29.3;22.0;Cadastre;C 0.3;POLYGON Z ((770540.8 6277646 27.7, 770535.2 6277639.9 27.7, 770532.8 6277642.1 27.7, 770531.9 6277641 27.7, 770527.4 6277644.9 27.7, 770533.9 6277652.3 27.7, 770540.8 6277646 27.7))
-BATIMENT0000000211120304;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:28:19;2019-04-08 10:00:52;1967-01-01;;;;BDParcellaire recalée;3.0;Interpolation bâti BDTopo;2.5;1.0;2.0;40;10;5.8;22.0;27.8;29.2;22.0;Cadastre;C 0.3;POLYGON Z ((770533.9 6277652.3 27.8, 770527.4 6277644.9 27.8, 770523.2 6277648.8 27.8, 770524.3 6277649.9 27.8, 770521.7 6277652.2 27.8, 770526.9 6277658.5 27.8, 770529.8 6277655.9 27.8, 770533.9 6277652.3 27.8))
-BATIMENT0000000211120307;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:28:19;2017-03-30 10:33:07;;;;;BDParcellaire recalée;3.0;Corrélation;1.0;;;;;3.6;21.5;25.1;26.6;21.6;Cadastre;;POLYGON Z ((770531.7 6277658 25, 770535.7 6277654.4 25, 770533.9 6277652.3 25, 770529.8 6277655.9 25, 770531.7 6277658 25))
-BATIMENT0000000211120302;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:28:19;2019-04-08 10:00:52;1966-01-01;;;;BDParcellaire recalée;3.0;Interpolation bâti BDTopo;2.5;1.0;2.0;43;10;5.8;22.0;27.8;29.3;22.0;Cadastre;C 0.2;POLYGON Z ((770526.9 6277658.5 27.8, 770521.7 6277652.2 27.8, 770519.3 6277654.4 27.8, 770518.2 6277653.1 27.8, 770513.8 6277657.2 27.8, 770520.3 6277664.6 27.8, 770526.9 6277658.5 27.8))
-BATIMENT0000000211120397;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:28:19;2017-03-30 10:33:07;;;;;BDParcellaire;5.0;Corrélation;1.0;;;;;2.9;21.6;24.5;26.8;21.7;Cadastre;;POLYGON Z ((770546.5 6277669.3 24.5, 770544.6 6277667 24.5, 770542.4 6277669 24.5, 770544.5 6277671.1 24.5, 770546.5 6277669.3 24.5))
-BATIMENT0000000211120341;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:28:19;2019-04-08 10:00:52;1963-01-01;;;;BDParcellaire recalée;3.0;Interpolation bâti BDTopo;2.5;1.0;2.0;40;10;7.3;22.0;29.3;29.5;22.0;Cadastre;A 1.0;POLYGON Z ((770556.1 6277678.1 29.3, 770560.1 6277674.4 29.3, 770559 6277673.3 29.3, 770561.3 6277671.1 29.3, 770555.5 6277664.9 29.3, 770549.3 6277670.6 29.3, 770556.1 6277678.1 29.3))
-BATIMENT0000000211120337;Indifférenciée;Annexe;;Non;En service;2008-11-18 15:28:19;2019-04-08 10:00:52;;;;;BDParcellaire recalée;3.0;Corrélation;1.0;0.0;1.0;;;4.4;21.7;26.1;26.5;21.8;Cadastre;B 0.4;POLYGON Z ((770538.5 6277672.2 26.1, 770535.7 6277674.8 26.1, 770539.8 6277679.5 26.1, 770542.7 6277676.8 26.1, 770538.5 6277672.2 26.1))
-BATIMENT0000000211120313;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:28:19;2017-03-30 10:33:07;;;;;BDParcellaire recalée;3.0;Corrélation;1.0;;;;;2.0;21.5;23.5;24.9;21.5;Cadastre;;POLYGON Z ((770511.7 6277606.4 23.5, 770507.5 6277601.7 23.5, 770505 6277603.8 23.5, 770509.1 6277608.6 23.5, 770511.7 6277606.4 23.5))
-BATIMENT0000000211120245;Indifférenciée;Résidentiel;Commercial et services;Non;En service;2008-11-18 15:28:19;2019-04-08 10:00:52;1968-01-01;;;;BDParcellaire recalée;3.0;Corrélation;1.0;39.0;5.0;30;40;16.3;21.4;37.7;38.0;21.7;Cadastre;A 1.0;POLYGON Z ((770502.1 6277605 37.6, 770498 6277608.3 37.6, 770499 6277609.6 37.6, 770490.8 6277616 37.6, 770492.9 6277618.6 37.6, 770487.1 6277623.3 37.6, 770491.7 6277628.9 37.6, 770479.2 6277638.8 37.6, 770474.6 6277633.3 37.6, 770417.5 6277678.9 37.6, 770424.7 6277687.1 37.6, 770422.5 6277689.2 37.6, 770424.1 6277691.1 37.6, 770424 6277691.3 37.6, 770428.3 6277696.5 37.6, 770430.9 6277694.4 37.6, 770432.3 6277695.8 37.6, 770509.8 6277628 37.6, 770502.3 6277619.2 37.6, 770505.3 6277616.8 37.6, 770508.4 6277620.4 37.6, 770512.4 6277617 37.6, 770505.1 6277608.5 37.6, 770502.1 6277605 37.6))
-BATIMENT0000000211120303;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:28:19;2019-04-08 10:00:52;1966-01-01;;;;BDParcellaire recalée;3.0;Interpolation bâti BDTopo;2.5;1.0;2.0;40;10;5.8;22.0;27.8;29.0;22.0;Cadastre;C 0.1;POLYGON Z ((770520.3 6277664.6 27.8, 770513.8 6277657.2 27.8, 770509.1 6277661.3 27.8, 770510.2 6277662.5 27.8, 770507.8 6277664.7 27.8, 770513.2 6277670.9 27.8, 770520.3 6277664.6 27.8))
-BATIMENT0000000211120308;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:28:19;2017-03-30 10:33:07;;;;;BDParcellaire recalée;3.0;Corrélation;1.0;;;;;3.8;21.5;25.3;26.5;21.6;Cadastre;;POLYGON Z ((770502.8 6277667.2 25.3, 770501.4 6277665.5 25.3, 770498.7 6277667.8 25.3, 770500.3 6277669.4 25.3, 770502.8 6277667.2 25.3))
-BATIMENT0000000211120305;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:28:19;2019-04-08 10:00:52;1967-01-01;;;;BDParcellaire recalée;3.0;Interpolation bâti BDTopo;2.5;1.0;2.0;40;10;5.8;22.0;27.8;29.2;22.0;Cadastre;C 0.3;POLYGON Z ((770506.5 6277676.8 27.8, 770510.1 6277673.6 27.8, 770516.7 6277680.8 27.8, 770519.6 6277678 27.8, 770513.2 6277670.9 27.8, 770507.8 6277664.7 27.8, 770506.8 6277663.7 27.8, 770502.8 6277667.2 27.8, 770500.3 6277669.4 27.8, 770506.5 6277676.8 27.8))
-BATIMENT0000000211120309;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:28:19;2019-04-08 10:00:52;1967-01-01;;;;BDParcellaire recalée;3.0;Interpolation bâti BDTopo;2.5;1.0;2.0;40;10;5.6;22.0;27.6;28.9;22.0;Cadastre;C 0.1;POLYGON Z ((770506.5 6277676.8 27.6, 770500.3 6277669.4 27.6, 770495.5 6277673.7 27.6, 770496.6 6277674.9 27.6, 770494.4 6277676.9 27.6, 770499.8 6277683 27.6, 770500.8 6277682.1 27.6, 770502.5 6277683.9 27.6, 770505.5 6277681.1 27.6, 770503.7 6277679.3 27.6, 770506.5 6277676.8 27.6))
-BATIMENT0000000211120399;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:28:19;2017-03-30 10:33:07;;;;;BDParcellaire;5.0;Corrélation;1.0;;;;;1.5;21.7;23.2;24.3;21.8;Cadastre;;POLYGON Z ((770513.8 6277679.1 23.1, 770511.9 6277676.7 23.1, 770510.9 6277677.5 23.1, 770513 6277679.9 23.1, 770513.8 6277679.1 23.1))
-BATIMENT0000000211120402;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:28:19;2017-03-30 10:33:07;;;;;BDParcellaire;5.0;Corrélation;1.0;;;;;4.7;21.6;26.3;27.2;21.7;Cadastre;;POLYGON Z ((770494.8 6277682.3 26.2, 770492.6 6277680.1 26.2, 770491.8 6277680.9 26.2, 770494 6277683.1 26.2, 770494.8 6277682.3 26.2))
-BATIMENT0000000211120255;Indifférenciée;Commercial et services;;Non;En service;2008-11-18 15:28:19;2019-04-08 10:00:52;1966-01-01;;;;BDParcellaire recalée;3.0;Interpolation bâti BDTopo;2.5;0.0;2.0;;;5.4;22.7;28.1;29.2;22.7;Cadastre;C 0.3;POLYGON Z ((770493.4 6277687.7 28.1, 770487.8 6277681.4 28.1, 770485.6 6277683.4 28.1, 770484.7 6277682.2 28.1, 770480.3 6277686.1 28.1, 770486.8 6277693.6 28.1, 770493.4 6277687.7 28.1))
-BATIMENT0000000211120398;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:28:19;2017-03-30 10:33:07;;;;;BDParcellaire;5.0;Corrélation;1.0;;;;;2.1;21.8;23.9;24.2;21.9;Cadastre;;POLYGON Z ((770503.8 6277688.3 23.8, 770501.7 6277686 23.8, 770500.6 6277687.1 23.8, 770502.7 6277689.4 23.8, 770503.8 6277688.3 23.8))
-BATIMENT0000000211120256;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:28:19;2019-04-08 10:00:52;1966-01-01;;;;BDParcellaire recalée;3.0;Interpolation bâti BDTopo;2.5;1.0;2.0;40;10;5.4;22.7;28.1;29.3;22.7;Cadastre;C 0.3;POLYGON Z ((770480 6277699.8 28.1, 770486.8 6277693.6 28.1, 770480.3 6277686.1 28.1, 770475.6 6277690.3 28.1, 770476.6 6277691.4 28.1, 770474.3 6277693.4 28.1, 770480 6277699.8 28.1))
-BATIMENT0000000211120400;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:28:19;2017-03-30 10:33:07;;;;;BDParcellaire;5.0;Corrélation;1.0;;;;;2.0;21.8;23.8;24.2;22.0;Cadastre;;POLYGON Z ((770492.6 6277699.5 23.8, 770490.4 6277697 23.8, 770489.2 6277698.1 23.8, 770491.4 6277700.6 23.8, 770492.6 6277699.5 23.8))
-BATIMENT0000000211120257;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:28:19;2019-04-08 10:00:52;1967-01-01;;;;BDParcellaire recalée;3.0;Interpolation bâti BDTopo;2.5;1.0;2.0;40;10;5.5;22.7;28.2;29.3;22.7;Cadastre;C 0.3;POLYGON Z ((770480 6277699.8 28.2, 770474.3 6277693.4 28.2, 770472.2 6277695.4 28.2, 770471.1 6277694.3 28.2, 770466.8 6277698.2 28.2, 770473.3 6277705.8 28.2, 770480 6277699.8 28.2))
-BATIMENT0000000211120258;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:28:19;2019-04-08 10:00:52;1967-01-01;;;;BDParcellaire recalée;3.0;Interpolation bâti BDTopo;2.5;1.0;2.0;40;10;5.5;22.7;28.2;29.4;22.7;Cadastre;C 0.3;POLYGON Z ((770466.8 6277698.2 28.2, 770462 6277702.4 28.2, 770463.1 6277703.6 28.2, 770461 6277705.2 28.2, 770466.7 6277711.7 28.2, 770473.3 6277705.8 28.2, 770466.8 6277698.2 28.2))
-BATIMENT0000000211120251;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:28:19;2019-04-08 10:00:52;1966-01-01;;;;BDParcellaire recalée;3.0;Interpolation bâti BDTopo;2.5;1.0;2.0;40;10;6.2;22.9;29.1;30.0;;Cadastre;C 0.3;POLYGON Z ((770454.8 6277712.7 29.1, 770449.1 6277706.2 29.1, 770442.8 6277711.8 29.1, 770444.8 6277714 29.1, 770443.9 6277714.8 29.1, 770447.7 6277719.2 29.1, 770454.8 6277712.7 29.1))
-BATIMENT0000000211120350;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:28:19;2019-04-08 10:00:52;1963-01-01;;;;BDParcellaire recalée;3.0;Interpolation bâti BDTopo;2.5;1.0;2.0;50;10;6.0;23.0;29.0;30.4;23.0;Cadastre;A 1.0;POLYGON Z ((770516.5 6277715.5 29, 770512.7 6277711.5 29, 770511.6 6277712.7 29, 770509.3 6277710.3 29, 770503.1 6277715.8 29, 770509.2 6277722.3 29, 770516.5 6277715.5 29))
-BATIMENT0000000211120273;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:28:19;2020-05-29 12:14:55;;;;;BDParcellaire;5.0;Corrélation;1.0;;;;;2.0;21.8;23.8;23.8;21.9;Cadastre;;POLYGON Z ((770465.2 6277716.5 23.7, 770464.4 6277715.6 23.7, 770462.9 6277717 23.7, 770463.7 6277717.9 23.7, 770465.2 6277716.5 23.7))
-BATIMENT0000000211120252;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:28:19;2019-04-08 10:00:52;1967-01-01;;;;BDParcellaire recalée;3.0;Interpolation bâti BDTopo;2.5;1.0;2.0;40;10;6.2;22.9;29.1;30.3;;Cadastre;C 0.3;POLYGON Z ((770461 6277719.5 29.1, 770454.8 6277712.7 29.1, 770447.7 6277719.2 29.1, 770451.4 6277723.3 29.1, 770452.3 6277722.6 29.1, 770454.6 6277725.2 29.1, 770461 6277719.5 29.1))
-BATIMENT0000000211120272;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:28:19;2017-03-30 10:33:07;;;;;BDParcellaire;5.0;Corrélation;1.0;;;;;2.8;21.9;24.7;24.7;22.1;Cadastre;;POLYGON Z ((770472.3 6277724.6 24.6, 770470.3 6277722.3 24.6, 770468.8 6277723.6 24.6, 770470.8 6277725.9 24.6, 770472.3 6277724.6 24.6))
-BATIMENT0000000211120253;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:28:19;2019-04-08 10:00:52;1967-01-01;;;;BDParcellaire recalée;3.0;Interpolation bâti BDTopo;2.5;1.0;2.0;40;10;6.3;22.9;29.2;30.3;22.9;Cadastre;C 0.3;POLYGON Z ((770461 6277719.5 29.2, 770454.6 6277725.2 29.2, 770456.6 6277727.7 29.2, 770455.8 6277728.5 29.2, 770459.6 6277732.6 29.2, 770466.7 6277726.2 29.2, 770461 6277719.5 29.2))
-BATIMENT0000000211120259;Indifférenciée;Résidentiel;Annexe;Non;En service;2008-11-18 15:28:19;2019-04-08 10:00:52;1966-01-01;;;;BDParcellaire recalée;3.0;Interpolation bâti BDTopo;2.5;24.0;6.0;40;40;13.0;22.7;35.7;;;Cadastre;C 0.1;POLYGON Z ((770440.4 6277739.7 35.7, 770400.7 6277694.1 35.7, 770394 6277700 35.7, 770398.6 6277705.2 35.7, 770397.9 6277706 35.7, 770402.4 6277711.1 35.7, 770403.1 6277710.5 35.7, 770411.8 6277720.4 35.7, 770411 6277721 35.7, 770415.8 6277726.3 35.7, 770416.4 6277725.7 35.7, 770424.7 6277735.3 35.7, 770424 6277735.9 35.7, 770428.8 6277741.3 35.7, 770429.3 6277740.8 35.7, 770433.7 6277745.7 35.7, 770440.4 6277739.7 35.7))
-BATIMENT0000000211120208;Eglise;Religieux;;Oui;En service;2008-11-18 15:28:19;;;;;;BDParcellaire recalée;3.0;Interpolation bâti BDTopo;2.5;;;;;6.2;23.0;29.2;;;Cadastre;;POLYGON Z ((770290.2 6277720.8 29.2, 770289.8 6277718.4 29.2, 770264.1 6277723.2 29.2, 770264.6 6277725.6 29.2, 770290.2 6277720.8 29.2))
-BATIMENT0000000211120207;Eglise;Religieux;;Non;En service;2008-11-18 15:28:19;;;;;;BDParcellaire recalée;3.0;Interpolation bâti BDTopo;2.5;;;;;5.9;23.0;28.9;;;Cadastre;;POLYGON Z ((770289.4 6277714.6 28.9, 770289.8 6277718.4 28.9, 770290.2 6277720.8 28.9, 770264.6 6277725.6 28.9, 770260.1 6277726.4 28.9, 770261.6 6277734.4 28.9, 770265.8 6277733.6 28.9, 770292.7 6277728.9 28.9, 770293.1 6277731.4 28.9, 770293.5 6277733.3 28.9, 770302.7 6277725.5 28.9, 770302.1 6277714 28.9, 770289.4 6277714.6 28.9))
-BATIMENT0000000211120206;Eglise;Religieux;;Oui;En service;2008-11-18 15:28:19;;;;;;BDParcellaire recalée;3.0;Interpolation bâti BDTopo;2.5;;;;;5.9;23.0;28.9;;;Cadastre;;POLYGON Z ((770292.7 6277728.9 28.9, 770265.8 6277733.6 28.9, 770266.2 6277735.9 28.9, 770293.1 6277731.4 28.9, 770292.7 6277728.9 28.9))
-BATIMENT0000000211120179;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:28:19;2019-04-08 10:00:52;;;;;BDParcellaire;5.0;Corrélation;1.0;1.0;1.0;00;00;3.4;22.7;26.1;26.4;22.8;Cadastre;C 1.0;POLYGON Z ((770275.8 6277747.4 26, 770272.8 6277743.9 26, 770270.6 6277746 26, 770273.6 6277749.4 26, 770275.8 6277747.4 26))
-BATIMENT0000000211120241;Indifférenciée;Commercial et services;;Non;En service;2008-11-18 15:28:19;2019-07-29 11:03:24;;;;;BDParcellaire recalée;3.0;Interpolation bâti BDTopo;2.5;;;;;7.3;22.9;30.2;30.6;23.2;Cadastre;;POLYGON Z ((770396.5 6277742.1 30.2, 770395.6 6277742.8 30.2, 770393.5 6277740.3 30.2, 770394.4 6277739.5 30.2, 770390.7 6277735.2 30.2, 770389.8 6277736 30.2, 770387.5 6277733.5 30.2, 770388.4 6277732.7 30.2, 770384.8 6277728.6 30.2, 770383.9 6277729.2 30.2, 770381.8 6277726.8 30.2, 770382.7 6277726 30.2, 770378.9 6277721.7 30.2, 770376.6 6277723.7 30.2, 770375.4 6277722.3 30.2, 770370 6277726.9 30.2, 770367.7 6277724.2 30.2, 770363.4 6277728 30.2, 770364.5 6277729.3 30.2, 770363.1 6277730.7 30.2, 770364.1 6277732 30.2, 770362.8 6277733.1 30.2, 770365.5 6277736.3 30.2, 770370.8 6277731.5 30.2, 770382.6 6277744.8 30.2, 770380 6277747 30.2, 770382.4 6277749.7 30.2, 770374.1 6277757 30.2, 770374 6277760.2 30.2, 770374.6 6277760.8 30.2, 770372 6277763 30.2, 770329 6277714.3 30.2, 770320.6 6277721.8 30.2, 770319.6 6277720.7 30.2, 770319.8 6277720.3 30.2, 770317 6277717 30.2, 770313.1 6277720.4 30.2, 770365.4 6277780.4 30.2, 770377.9 6277769.6 30.2, 770377 6277768.5 30.2, 770375.2 6277766.5 30.2, 770377.9 6277764.2 30.2, 770379.7 6277766.2 30.2, 770381.1 6277765.1 30.2, 770381.8 6277766.1 30.2, 770386.4 6277762 30.2, 770385.7 6277761.1 30.2, 770387.9 6277759.2 30.2, 770388.8 6277760.1 30.2, 770393.1 6277756.2 30.2, 770392.4 6277755.2 30.2, 770395 6277753 30.2, 770395.8 6277754 30.2, 770400 6277750.4 30.2, 770399 6277749.2 30.2, 770400.1 6277748.3 30.2, 770399 6277747 30.2, 770400.2 6277746.1 30.2, 770396.5 6277742.1 30.2))
-BATIMENT0000000211120240;Indifférenciée;Commercial et services;;Oui;En service;2008-11-18 15:28:19;2019-07-29 11:03:24;;;;;BDParcellaire recalée;3.0;Corrélation;1.0;;;;;12.9;22.6;35.5;38.8;22.7;Cadastre;;POLYGON Z ((770399 6277747 35.5, 770400.1 6277748.3 35.5, 770399 6277749.2 35.5, 770400 6277750.4 35.5, 770402.1 6277748.5 35.5, 770400.2 6277746.1 35.5, 770399 6277747 35.5))
-BATIMENT0000000211120270;Indifférenciée;Commercial et services;;Oui;En service;2008-11-18 15:28:19;2019-07-29 11:03:24;;;;;BDParcellaire;5.0;Corrélation;1.0;;;;;2.0;23.0;25.0;25.7;23.1;Cadastre;;POLYGON Z ((770339.4 6277758.6 24.9, 770337.8 6277756.8 24.9, 770331.7 6277762 24.9, 770333.3 6277763.9 24.9, 770339.4 6277758.6 24.9))
-BATIMENT0000000211120242;Indifférenciée;Commercial et services;;Oui;En service;2008-11-18 15:28:19;2019-07-29 11:03:24;;;;;BDParcellaire recalée;3.0;Corrélation;1.0;;;;;3.3;23.0;26.3;28.5;23.1;Cadastre;;POLYGON Z ((770379.7 6277766.2 26.2, 770377.9 6277764.2 26.2, 770375.2 6277766.5 26.2, 770377 6277768.5 26.2, 770379.7 6277766.2 26.2))
-BATIMENT0000000211120269;Indifférenciée;Commercial et services;;Oui;En service;2008-11-18 15:28:19;2019-07-29 11:03:24;;;;;BDParcellaire;5.0;Corrélation;1.0;;;;;2.4;23.0;25.4;26.0;23.2;Cadastre;;POLYGON Z ((770346.3 6277766.6 25.4, 770344.7 6277764.7 25.4, 770338.7 6277770 25.4, 770340.4 6277771.8 25.4, 770346.3 6277766.6 25.4))
-BATIMENT0000000211120254;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:28:19;2019-04-08 10:00:52;1965-01-01;;;;BDParcellaire recalée;3.0;Interpolation bâti BDTopo;2.5;1.0;2.0;40;10;6.3;23.0;29.3;29.9;23.0;Cadastre;C 0.3;POLYGON Z ((770459.6 6277732.6 29.3, 770463.7 6277737.2 29.3, 770464.4 6277736.4 29.3, 770466.4 6277738.6 29.3, 770472.7 6277733 29.3, 770466.7 6277726.2 29.3, 770459.6 6277732.6 29.3))
-BATIMENT0000000211120231;Indifférenciée;Indifférencié;;Non;En service;2008-11-18 15:28:19;2017-03-30 10:33:07;;;;;BDParcellaire;5.0;Corrélation;1.0;;;;;4.1;22.2;26.3;27.7;22.5;Cadastre;;POLYGON Z ((770443.7 6277746 26.3, 770441 6277742.9 26.3, 770437.8 6277745.8 26.3, 770440.5 6277748.9 26.3, 770443.7 6277746 26.3))
-BATIMENT0000000211120248;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:28:19;2019-04-08 10:00:52;1967-01-01;;;;BDParcellaire recalée;3.0;Interpolation bâti BDTopo;2.5;1.0;2.0;40;10;7.0;23.6;30.6;31.0;23.6;Cadastre;C 0.3;POLYGON Z ((770487.1 6277749.3 30.6, 770481.4 6277742.8 30.6, 770474.9 6277748.6 30.6, 770477.1 6277750.9 30.6, 770476 6277751.8 30.6, 770479.8 6277756 30.6, 770487.1 6277749.3 30.6))
-BATIMENT0000000211120249;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:28:19;2019-04-08 10:00:52;1967-01-01;;;;BDParcellaire recalée;3.0;Interpolation bâti BDTopo;2.5;1.0;2.0;40;10;7.0;23.6;30.6;30.8;23.6;Cadastre;C 0.3;POLYGON Z ((770483.6 6277760.3 30.6, 770484.5 6277759.5 30.6, 770486.7 6277761.9 30.6, 770493.1 6277756.2 30.6, 770487.1 6277749.3 30.6, 770479.8 6277756 30.6, 770483.6 6277760.3 30.6))
-BATIMENT0000000211120328;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:28:19;2019-04-08 10:00:52;1967-01-01;;;;BDParcellaire recalée;3.0;Interpolation bâti BDTopo;2.5;1.0;2.0;45;13;6.2;24.3;30.5;31.2;;Cadastre;C 0.2;POLYGON Z ((770497.6 6277762 30.5, 770491.2 6277767.7 30.5, 770493.2 6277769.9 30.5, 770492.2 6277770.7 30.5, 770496.1 6277775.1 30.5, 770503.6 6277768.6 30.5, 770497.6 6277762 30.5))
-BATIMENT0000000211120329;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:28:19;2019-04-08 10:00:52;1966-01-01;;;;BDParcellaire recalée;3.0;Interpolation bâti BDTopo;2.5;1.0;2.0;40;10;6.1;24.3;30.4;31.3;24.3;Cadastre;C 0.3;POLYGON Z ((770496.1 6277775.1 30.4, 770499.9 6277779.5 30.4, 770500.9 6277778.8 30.4, 770502.8 6277781.1 30.4, 770509.3 6277775.3 30.4, 770503.6 6277768.6 30.4, 770496.1 6277775.1 30.4))
-BATIMENT0000000211120250;Indifférenciée;Résidentiel;Annexe;Non;En service;2008-11-18 15:28:19;2019-04-08 10:00:52;1965-01-01;;;;BDParcellaire recalée;3.0;Interpolation bâti BDTopo;2.5;55.0;4.0;40;40;12.9;24.3;37.2;38.1;25.4;Cadastre;A 1.0;POLYGON Z ((770438.3 6277841.6 37.2, 770413.1 6277812.4 37.2, 770417.9 6277808.1 37.2, 770418.4 6277808.7 37.2, 770423.7 6277804 37.2, 770423.3 6277803.3 37.2, 770432.9 6277794.8 37.2, 770433.5 6277795.5 37.2, 770438.8 6277790.6 37.2, 770438.4 6277790 37.2, 770447.9 6277781.6 37.2, 770448.3 6277782.3 37.2, 770454.2 6277777.2 37.2, 770453.6 6277776.6 37.2, 770458.4 6277772.5 37.2, 770460.6 6277775 37.2, 770459.9 6277775.6 37.2, 770465.7 6277782 37.2, 770466.4 6277781.5 37.2, 770474.4 6277790.6 37.2, 770473.6 6277791.2 37.2, 770479.2 6277797.6 37.2, 770479.9 6277796.9 37.2, 770483.5 6277801 37.2, 770490.1 6277794.8 37.2, 770463.5 6277764.5 37.2, 770456.7 6277770.4 37.2, 770452.5 6277765.5 37.2, 770406.9 6277805.6 37.2, 770411 6277810.3 37.2, 770404.2 6277816.3 37.2, 770408 6277820.8 37.2, 770407.2 6277821.5 37.2, 770413 6277828.1 37.2, 770413.9 6277827.3 37.2, 770421.8 6277836.5 37.2, 770421.1 6277837.3 37.2, 770426.7 6277843.7 37.2, 770427.5 6277842.9 37.2, 770431.5 6277847.6 37.2, 770438.3 6277841.6 37.2))
-BATIMENT0000000211120246;Indifférenciée;Résidentiel;Annexe;Non;En service;2008-11-18 15:28:19;2019-04-08 10:00:52;;;;;BDParcellaire recalée;3.0;Interpolation bâti BDTopo;2.5;22.0;6.0;00;00;16.0;25.6;41.6;42.2;25.6;Cadastre;A 1.0;POLYGON Z ((770510.8 6277827.6 41.6, 770495.9 6277811.8 41.6, 770483.1 6277823.9 41.6, 770498.4 6277839.6 41.6, 770510.8 6277827.6 41.6))
-BATIMENT0000000211120508;Indifférenciée;Résidentiel;Annexe;Non;En service;2008-11-18 15:28:19;2019-04-08 10:00:52;1966-01-01;;;;BDParcellaire recalée;3.0;Interpolation bâti BDTopo;2.5;48.0;6.0;40;40;18.9;26.0;44.9;46.9;26.2;Cadastre;A 1.0;POLYGON Z ((770413 6277896.7 44.9, 770417.6 6277892.3 44.9, 770418.4 6277893 44.9, 770423.2 6277888.5 44.9, 770422.4 6277887.7 44.9, 770432.2 6277878.5 44.9, 770433 6277879.3 44.9, 770437.8 6277874.7 44.9, 770437 6277873.9 44.9, 770446.8 6277864.6 44.9, 770447.5 6277865.5 44.9, 770452.5 6277860.8 44.9, 770451.6 6277860.1 44.9, 770461.2 6277851 44.9, 770462 6277851.8 44.9, 770467 6277847.1 44.9, 770466.3 6277846.2 44.9, 770471.4 6277841.4 44.9, 770465.3 6277835 44.9, 770452.1 6277847 44.9, 770436.6 6277861.5 44.9, 770419.8 6277877.6 44.9, 770406.6 6277890.1 44.9, 770413 6277896.7 44.9))
-BATIMENT0000000211120504;Indifférenciée;Résidentiel;Commercial et services;Non;En service;2008-11-18 15:28:19;2019-04-08 10:00:52;1966-01-01;;;;BDParcellaire recalée;3.0;Interpolation bâti BDTopo;2.5;4.0;2.0;15;10;6.8;27.0;33.8;34.0;27.0;Cadastre;C 0.2;POLYGON Z ((770442.6 6277891.6 33.8, 770451.9 6277901.6 33.8, 770459.2 6277894.7 33.8, 770454.1 6277889 33.8, 770467.8 6277876 33.8, 770461.2 6277868.9 33.8, 770442.7 6277886.2 33.8, 770442.6 6277891.6 33.8))
-BATIMENT0000000211120203;Indifférenciée;Indifférencié;;Non;En service;2008-11-18 15:28:19;2017-03-30 10:33:07;;;;;BDParcellaire recalée;3.0;Interpolation bâti BDTopo;2.5;;;;;15.9;23.5;39.4;41.3;23.9;Cadastre;;POLYGON Z ((770213.4 6277782.5 39.4, 770215.1 6277784.3 39.4, 770239.1 6277764 39.4, 770240.3 6277765.3 39.4, 770246.6 6277760.1 39.4, 770235.6 6277747.6 39.4, 770229.3 6277752.9 39.4, 770230.8 6277754.5 39.4, 770206.9 6277774.9 39.4, 770205.2 6277773 39.4, 770190.6 6277785.4 39.4, 770198.9 6277794.6 39.4, 770213.4 6277782.5 39.4))
-BATIMENT0000000211120271;Indifférenciée;Commercial et services;;Oui;En service;2008-11-18 15:28:19;2019-07-29 11:03:24;;;;;BDParcellaire;5.0;Corrélation;1.0;;;;;3.2;23.0;26.2;26.5;23.2;Cadastre;;POLYGON Z ((770339.7 6277772 26.1, 770335.6 6277767.3 26.1, 770331.5 6277762.6 26.1, 770326.7 6277766.7 26.1, 770322.1 6277770.8 26.1, 770326 6277775.5 26.1, 770330.2 6277780.3 26.1, 770335.1 6277776.1 26.1, 770339.7 6277772 26.1))
-BATIMENT0000000211120260;Indifférenciée;Résidentiel;Annexe;Non;En service;2008-11-18 15:28:19;2019-04-08 10:00:52;1966-01-01;;;;BDParcellaire recalée;3.0;Corrélation;1.0;43.0;9.0;40;40;21.9;22.7;44.6;51.8;24.3;Cadastre;C 0.7;POLYGON Z ((770353.9 6277828.3 44.5, 770354.4 6277828.9 44.5, 770360.6 6277823.5 44.5, 770360.2 6277822.8 44.5, 770369.3 6277814.7 44.5, 770369.9 6277815.5 44.5, 770376.2 6277809.8 44.5, 770375.6 6277809.2 44.5, 770380 6277805.5 44.5, 770379.7 6277805.2 44.5, 770383.7 6277801.6 44.5, 770384.4 6277802.4 44.5, 770390.8 6277796.7 44.5, 770390.2 6277795.8 44.5, 770398.8 6277788.5 44.5, 770399.4 6277789.2 44.5, 770405.9 6277783.6 44.5, 770405.3 6277782.9 44.5, 770414.3 6277775.1 44.5, 770415 6277775.8 44.5, 770421.1 6277770.4 44.5, 770420.4 6277769.7 44.5, 770424.4 6277766.2 44.5, 770424.7 6277766.4 44.5, 770429.1 6277762.5 44.5, 770429.6 6277763.2 44.5, 770435.9 6277757.6 44.5, 770435.3 6277757 44.5, 770440 6277753 44.5, 770434 6277746.1 44.5, 770342.9 6277825.1 44.5, 770349.3 6277832.4 44.5, 770353.9 6277828.3 44.5))
-BATIMENT0000000211120219;Indifférenciée;Indifférencié;;Non;En service;2008-11-18 15:28:19;2019-04-08 10:00:52;1978-01-01;;;;BDParcellaire recalée;3.0;Interpolation bâti BDTopo;2.5;0.0;1.0;;;17.0;23.6;40.6;40.8;24.1;Cadastre;C 0.2;POLYGON Z ((770264.2 6277770.9 40.6, 770259.7 6277774.5 40.6, 770271.1 6277787.9 40.6, 770270.1 6277788.9 40.6, 770271.6 6277790.6 40.6, 770260.3 6277800.3 40.6, 770259.2 6277799 40.6, 770232.5 6277822.3 40.6, 770232.4 6277822.8 40.6, 770229.7 6277825.4 40.6, 770232.5 6277828.4 40.6, 770235.4 6277826 40.6, 770240.5 6277832 40.6, 770267.3 6277808.5 40.6, 770268.3 6277809.6 40.6, 770279.9 6277799.5 40.6, 770281.2 6277801.1 40.6, 770287.6 6277795.5 40.6, 770276 6277782.2 40.6, 770279.8 6277778.9 40.6, 770269.1 6277766.7 40.6, 770264.2 6277770.9 40.6))
-BATIMENT0000000211120464;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:28:19;2018-02-20 11:33:35;;;;;BDParcellaire recalée;3.0;Interpolation bâti BDTopo;2.5;;;;;7.1;25.0;32.1;32.7;25.0;Cadastre;;POLYGON Z ((770267.4 6277853.2 32.1, 770265.6 6277854.8 32.1, 770268.3 6277857.8 32.1, 770270 6277856.3 32.1, 770267.4 6277853.2 32.1))
-BATIMENT0000000211120465;Indifférenciée;Commercial et services;;Non;En service;2008-11-18 15:28:19;2019-04-08 10:00:52;2007-01-01;;;;BDParcellaire recalée;3.0;Interpolation bâti BDTopo;2.5;0.0;1.0;;;3.7;25.0;28.7;32.4;25.2;Cadastre;C 0.5;POLYGON Z ((770301.2 6277869.1 28.7, 770300.2 6277868 28.7, 770301.1 6277867 28.7, 770301.1 6277865 28.7, 770298.4 6277861.9 28.7, 770301.9 6277859 28.7, 770299.7 6277856.4 28.7, 770299.8 6277854.6 28.7, 770298 6277854.5 28.7, 770295.7 6277852 28.7, 770296.1 6277850.4 28.7, 770294.4 6277850.4 28.7, 770292.1 6277847.8 28.7, 770292.3 6277846.1 28.7, 770290.6 6277846.1 28.7, 770288.2 6277843.3 28.7, 770288.4 6277841.6 28.7, 770286.7 6277841.6 28.7, 770282.6 6277837.1 28.7, 770264.1 6277853.3 28.7, 770265.6 6277854.8 28.7, 770267.4 6277853.2 28.7, 770270 6277856.3 28.7, 770274 6277860.8 28.7, 770278.7 6277856.6 28.7, 770285.9 6277864.9 28.7, 770280.2 6277870.1 28.7, 770272.7 6277861.6 28.7, 770270.4 6277861.2 28.7, 770268.4 6277863 28.7, 770268.4 6277864.5 28.7, 770266.2 6277866.4 28.7, 770264.7 6277866.3 28.7, 770262.1 6277868.6 28.7, 770262 6277870 28.7, 770264 6277872.2 28.7, 770265.4 6277872.1 28.7, 770267.6 6277874.6 28.7, 770267.4 6277876 28.7, 770269.4 6277878.3 28.7, 770271.1 6277878.2 28.7, 770273.9 6277875.7 28.7, 770274.8 6277876.8 28.7, 770273.1 6277878.4 28.7, 770274.2 6277879.6 28.7, 770275.9 6277877.9 28.7, 770276.2 6277878.3 28.7, 770279.3 6277878.6 28.7, 770281.5 6277876.6 28.7, 770283.7 6277878.9 28.7, 770287.6 6277878.9 28.7, 770289.6 6277877.3 28.7, 770290.8 6277878.4 28.7, 770288.7 6277880.3 28.7, 770288.4 6277884.1 28.7, 770289.9 6277885.8 28.7, 770288.3 6277887.2 28.7, 770288.1 6277891.9 28.7, 770293.2 6277897.9 28.7, 770305.9 6277887 28.7, 770302.4 6277882.8 28.7, 770310.5 6277875.5 28.7, 770304.3 6277868.6 28.7, 770301.8 6277868.6 28.7, 770301.2 6277869.1 28.7))
-BATIMENT0000000211120488;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:28:19;2018-02-20 11:33:35;;;;;BDParcellaire recalée;3.0;Interpolation bâti BDTopo;2.5;;;;;3.5;25.0;28.5;28.5;25.0;Cadastre;;POLYGON Z ((770303.1 6277867.4 28.5, 770302.1 6277866.1 28.5, 770301.1 6277867 28.5, 770300.2 6277868 28.5, 770301.2 6277869.1 28.5, 770301.8 6277868.6 28.5, 770303.1 6277867.4 28.5))
-BATIMENT0000000211120487;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:28:19;2017-03-30 10:33:07;;;;;BDParcellaire recalée;3.0;Interpolation bâti BDTopo;2.5;;;;;3.5;25.0;28.5;28.9;25.0;Cadastre;;POLYGON Z ((770290.8 6277878.4 28.5, 770289.6 6277877.3 28.5, 770287.6 6277878.9 28.5, 770288.7 6277880.3 28.5, 770290.8 6277878.4 28.5))
-BATIMENT0000002275435066;Indifférenciée;Résidentiel;;Oui;En service;2021-12-09 16:30:40;2023-03-22 21:39:05;;;DGFiP;;BDParcellaire;5.0;Corrélation;1.0;;;;;3.2;24.9;28.1;30.6;25.2;Cadastre;;POLYGON Z ((770281.6 6277879.6 28.1, 770276.1 6277879.4 28.1, 770274.6 6277880.8 28.1, 770277 6277883.4 28.1, 770278.9 6277881.7 28.1, 770284 6277887.4 28.1, 770286.6 6277885.1 28.1, 770281.6 6277879.6 28.1))
-BATIMENT0000000211120511;Indifférenciée;Résidentiel;Annexe;Non;En service;2008-11-18 15:28:19;2019-04-08 10:00:52;1963-01-01;;;;BDParcellaire recalée;3.0;Interpolation bâti BDTopo;2.5;40.0;4.0;40;40;13.3;25.9;39.2;40.0;26.0;Cadastre;A 1.0;POLYGON Z ((770335.3 6277930.4 39.2, 770336 6277930.9 39.2, 770341.2 6277926.4 39.2, 770340.7 6277925.8 39.2, 770350.8 6277917 39.2, 770351.3 6277917.7 39.2, 770356.3 6277913.2 39.2, 770355.8 6277912.6 39.2, 770365.7 6277903.8 39.2, 770366.4 6277904.6 39.2, 770371.2 6277900.3 39.2, 770370.6 6277899.7 39.2, 770380.4 6277891 39.2, 770381.1 6277891.7 39.2, 770386.5 6277887 39.2, 770385.9 6277886.3 39.2, 770396 6277877.7 39.2, 770396.6 6277878.4 39.2, 770402 6277873.7 39.2, 770401.4 6277873 39.2, 770406.4 6277868.7 39.2, 770400.8 6277862.1 39.2, 770324.3 6277928.5 39.2, 770329.8 6277935.1 39.2, 770335.3 6277930.4 39.2))
-BATIMENT0000000211120486;Indifférenciée;Indifférencié;;Non;En service;2008-11-18 15:28:19;2017-03-30 10:33:07;;;;;BDParcellaire;5.0;Corrélation;1.0;;;;;2.6;26.2;28.8;29.0;26.6;Cadastre;;POLYGON Z ((770478.1 6277882.4 28.8, 770469.8 6277890.4 28.8, 770470.9 6277891.6 28.8, 770479.4 6277883.8 28.8, 770478.1 6277882.4 28.8))
-BATIMENT0000000211120522;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:28:19;2019-04-08 10:00:52;1957-01-01;;;;BDParcellaire recalée;3.0;Corrélation;1.0;2.0;2.0;15;10;7.6;26.4;34.0;34.8;27.0;Cadastre;A 1.0;POLYGON Z ((770506.4 6277891.3 34, 770499.5 6277884 34, 770492.3 6277890.9 34, 770499.2 6277898.4 34, 770506.4 6277891.3 34))
-BATIMENT0000000211120502;Indifférenciée;Résidentiel;Annexe;Non;En service;2008-11-18 15:28:19;2019-04-08 10:00:52;1957-01-01;;;;BDParcellaire recalée;3.0;Interpolation bâti BDTopo;2.5;2.0;2.0;50;10;5.9;27.9;33.8;35.4;27.9;Cadastre;A 1.0;POLYGON Z ((770494.6 6277904.4 33.8, 770484 6277893 33.8, 770476.8 6277899.8 33.8, 770487.4 6277911.2 33.8, 770494.6 6277904.4 33.8))
-BATIMENT0000000211120505;Indifférenciée;Résidentiel;Annexe;Non;En service;2008-11-18 15:28:19;2019-04-08 10:00:52;1958-01-01;;;;BDParcellaire recalée;3.0;Interpolation bâti BDTopo;2.5;6.0;3.0;15;10;10.3;27.8;38.1;39.8;27.9;Cadastre;A 1.0;POLYGON Z ((770480.4 6277917.9 38.1, 770473.7 6277910.8 38.1, 770475.8 6277908.7 38.1, 770471.2 6277904 38.1, 770469.3 6277905.7 38.1, 770462.3 6277898.2 38.1, 770454.7 6277905.5 38.1, 770472.9 6277925.1 38.1, 770480.4 6277917.9 38.1))
-BATIMENT0000000211120506;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:28:19;2019-04-08 10:00:52;1972-01-01;;;;BDParcellaire recalée;3.0;Interpolation bâti BDTopo;2.5;1.0;2.0;50;10;5.8;28.0;33.8;35.0;28.0;Cadastre;A 1.0;POLYGON Z ((770436.5 6277913.2 33.8, 770428.1 6277904.4 33.8, 770420.3 6277911.7 33.8, 770428.7 6277920.7 33.8, 770436.5 6277913.2 33.8))
-BATIMENT0000000211120503;Indifférenciée;Résidentiel;Annexe;Non;En service;2008-11-18 15:28:19;2019-04-08 10:00:52;1953-01-01;;;;BDParcellaire recalée;3.0;Corrélation;1.0;3.0;2.0;10;10;9.2;27.6;36.8;38.0;28.4;Cadastre;A 1.0;POLYGON Z ((770452.5 6277936.1 36.8, 770447.9 6277931.2 36.8, 770447 6277932 36.8, 770444.9 6277929.7 36.8, 770436.8 6277937.1 36.8, 770443.6 6277944.2 36.8, 770452.5 6277936.1 36.8))
-BATIMENT0000000211120510;Indifférenciée;Résidentiel;Annexe;Non;En service;2008-11-18 15:28:19;2019-04-08 10:00:52;1982-01-01;;;;BDParcellaire recalée;3.0;Interpolation bâti BDTopo;2.5;3.0;2.0;10;10;7.4;26.6;34.0;35.2;;Cadastre;A 1.0;POLYGON Z ((770313.5 6277912.6 34, 770314.5 6277913.7 34, 770327.3 6277902.4 34, 770320.2 6277893.9 34, 770304.1 6277908 34, 770310.5 6277915.2 34, 770313.5 6277912.6 34))
-BATIMENT0000000211120477;Indifférenciée;Commercial et services;;Non;En service;2008-11-18 15:28:19;2019-04-08 10:00:52;2007-01-01;;;;BDParcellaire recalée;3.0;Corrélation;1.0;0.0;1.0;;;12.8;25.1;37.9;44.5;25.7;Cadastre;C 0.4;POLYGON Z ((770282.2 6277918 37.9, 770270 6277904.1 37.9, 770256.3 6277916.2 37.9, 770268.5 6277930 37.9, 770282.2 6277918 37.9))
-BATIMENT0000000211120509;Indifférenciée;Résidentiel;Annexe;Non;En service;2008-11-18 15:28:19;2019-04-08 10:00:52;;;;;BDParcellaire recalée;3.0;Interpolation bâti BDTopo;2.5;54.0;9.0;00;00;21.3;26.9;48.2;54.4;26.9;Cadastre;A 1.0;POLYGON Z ((770362.9 6277931 48.2, 770361.9 6277929.9 48.2, 770347 6277944.2 48.2, 770353.5 6277951.2 48.2, 770358.2 6277946.8 48.2, 770359.1 6277947.3 48.2, 770363.8 6277942.7 48.2, 770363.3 6277942.1 48.2, 770373.2 6277932.8 48.2, 770373.8 6277933.5 48.2, 770378.7 6277929 48.2, 770378 6277928.4 48.2, 770387.8 6277919.4 48.2, 770388.5 6277920 48.2, 770393.4 6277915.3 48.2, 770392.9 6277914.7 48.2, 770397.5 6277910.4 48.2, 770398 6277910.9 48.2, 770402.7 6277906.4 48.2, 770403.5 6277907.2 48.2, 770408.9 6277902 48.2, 770408.2 6277901.4 48.2, 770413 6277896.7 48.2, 770406.6 6277890.1 48.2, 770362.9 6277931 48.2))
-BATIMENT0000000211120507;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:28:19;2019-04-08 10:00:52;1850-01-01;;;;BDParcellaire recalée;3.0;Corrélation;1.0;1.0;2.0;10;10;6.9;25.5;32.4;32.9;25.9;Cadastre;A 1.0;POLYGON Z ((770317.4 6277922.2 32.3, 770313.3 6277917.5 32.3, 770303.2 6277926.4 32.3, 770303.7 6277927.1 32.3, 770301.8 6277928.8 32.3, 770305.1 6277932.9 32.3, 770317.4 6277922.2 32.3))
-BATIMENT0000000231251324;Indifférenciée;Annexe;;Non;En service;2010-04-30 12:01:24;2019-04-08 10:00:52;1999-01-01;2009-07-01;;;Photogrammétrie;2.5;Photogrammétrie;1.5;0.0;1.0;00;00;4.6;26.5;;39.0;28.1;Imagerie aérienne;C 0.3;POLYGON Z ((770411.8 6277932.9 30.6, 770404.3 6277925.1 30.9, 770398.5 6277931.1 30.9, 770405.9 6277938.6 31, 770411.8 6277932.9 30.6))
-BATIMENT0000000211120491;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:28:19;2018-02-20 09:16:47;;;;;BDParcellaire recalée;3.0;Interpolation bâti BDTopo;2.5;;;;;4.6;28.2;32.8;;;Cadastre;;POLYGON Z ((770408.7 6277947.4 32.8, 770405.5 6277943.9 32.8, 770404.8 6277944.8 32.8, 770407.9 6277948.2 32.8, 770408.7 6277947.4 32.8))
-BATIMENT0000000211120482;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:28:19;2017-03-30 10:33:07;;;;;BDParcellaire recalée;3.0;Corrélation;1.0;;;;;12.1;25.9;38.0;43.0;26.1;Cadastre;;POLYGON Z ((770274.9 6277951 38, 770280 6277946.7 38, 770275.6 6277941.4 38, 770269.6 6277946.5 38, 770274.9 6277951 38))
-BATIMENT0000000211120492;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:28:19;2023-03-22 21:39:05;1986-01-01;;;;BDParcellaire recalée;3.0;Corrélation;1.0;1.0;2.0;23;10;7.4;26.6;34.0;35.1;28.1;Cadastre;A 1.0;POLYGON Z ((770404.8 6277944.8 34, 770405.5 6277943.9 34, 770400.6 6277938.4 34, 770394.2 6277944.6 34, 770399.1 6277949.8 34, 770398.3 6277950.6 34, 770401.6 6277954 34, 770407.9 6277948.2 34, 770404.8 6277944.8 34))
-BATIMENT0000000211120497;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:28:19;2019-04-08 10:00:52;1954-01-01;;;;BDParcellaire recalée;3.0;Interpolation bâti BDTopo;2.5;2.0;2.0;00;00;6.9;28.3;35.2;37.4;29.0;Cadastre;C 0.7;POLYGON Z ((770437.2 6277949.5 35.2, 770424.6 6277936.1 35.2, 770416.3 6277943.9 35.2, 770428.8 6277957.4 35.2, 770437.2 6277949.5 35.2))
-BATIMENT0000000211120483;Indifférenciée;Indifférencié;;Non;En service;2008-11-18 15:28:19;2017-03-30 10:33:07;;;;;BDParcellaire recalée;3.0;Corrélation;1.0;;;;;10.8;26.0;36.8;43.3;26.2;Cadastre;;POLYGON Z ((770284.1 6277951.2 36.7, 770280 6277946.7 36.7, 770274.9 6277951 36.7, 770279.2 6277955.2 36.7, 770284.1 6277951.2 36.7))
-BATIMENT0000000211120484;Indifférenciée;Commercial et services;Résidentiel;Non;En service;2008-11-18 15:28:19;2019-07-29 11:03:18;;;;;BDParcellaire recalée;3.0;Corrélation;1.0;9.0;5.0;01;01;9.6;26.1;35.7;38.3;26.5;Cadastre;C 0.1;POLYGON Z ((770290.8 6277966.9 35.6, 770296.2 6277961.9 35.6, 770286.2 6277949.4 35.6, 770284.1 6277951.2 35.6, 770279.2 6277955.2 35.6, 770278.2 6277956.2 35.6, 770288.5 6277967.3 35.6, 770290.8 6277966.9 35.6))
-BATIMENT0000000211120496;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:28:19;2019-04-08 10:00:52;;;;;BDParcellaire recalée;3.0;Interpolation bâti BDTopo;2.5;2.0;2.0;00;00;7.2;28.9;36.1;37.6;29.5;Cadastre;A 1.0;POLYGON Z ((770413.7 6277969 36.1, 770416.4 6277971.7 36.1, 770422.5 6277965.6 36.1, 770416 6277958.3 36.1, 770407 6277967 36.1, 770407.2 6277967.2 36.1, 770409.2 6277969.4 36.1, 770411.2 6277971.5 36.1, 770413.7 6277969 36.1))
-BATIMENT0000000211120494;Indifférenciée;Indifférencié;;Oui;En service;2008-11-18 15:28:19;2017-03-30 10:33:07;;;;;BDParcellaire recalée;3.0;Corrélation;1.0;;;;;2.9;29.2;32.1;32.3;29.5;Cadastre;;POLYGON Z ((770405.4 6277968.8 32, 770407.5 6277971 32, 770409.2 6277969.4 32, 770407.2 6277967.2 32, 770405.4 6277968.8 32))
-BATIMENT0000000211120495;Indifférenciée;Résidentiel;Annexe;Non;En service;2008-11-18 15:28:19;2019-04-08 10:00:52;1952-01-01;;;;BDParcellaire recalée;3.0;Interpolation bâti BDTopo;2.5;3.0;2.0;10;10;6.3;28.9;35.2;37.7;29.7;Cadastre;A 1.0;POLYGON Z ((770411 6277976.4 35.2, 770404.3 6277968.9 35.2, 770391.3 6277981.4 35.2, 770398 6277988.7 35.2, 770411 6277976.4 35.2))
-BATIMENT0000000211120498;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:28:19;2019-04-08 10:00:52;1956-01-01;;;;BDParcellaire recalée;3.0;Interpolation bâti BDTopo;2.5;1.0;1.0;50;10;7.2;28.6;35.8;;;Cadastre;A 1.0;POLYGON Z ((770392.4 6277992 35.8, 770378.6 6277977.2 35.8, 770370.8 6277984.4 35.8, 770384.7 6277999.2 35.8, 770392.4 6277992 35.8))
-BATIMENT0000000211117722;Indifférenciée;Résidentiel;;Non;En service;2008-11-18 15:26:42;2019-04-08 10:00:52;1973-01-01;;;;BDParcellaire recalée;3.0;Interpolation bâti BDTopo;2.5;1.0;1.0;40;10;8.4;28.6;37.0;38.7;29.4;Cadastre;A 1.0;POLYGON Z ((770378.3 6278003.2 37, 770376.9 6278001.6 37, 770380.4 6277998.5 37, 770370.9 6277988.2 37, 770363.6 6277995 37, 770374.5 6278006.7 37, 770378.3 6278003.2 37))
-""")
+        _sio = AbstractGeoDataFrameDemos._dataset(
+            "GeoDataFrameDemosC", "irisTastavinBuildings.csv"
+        )
         return GeoDataFrameLib.read_csv(_sio)
 
     @staticmethod
@@ -271,190 +94,9 @@ TRANSPORT/TRONCON_DE_ROUTE.shp", mask=iris)
         roads = clip(roads, iris, keep_geom_type=True)
         roads.to_csv('/tmp/tastavin.csv', sep=';', index=False)
         '''
-        _sio = StringIO("""ID;NATURE;NOM_COLL_G;NOM_COLL_D;IMPORTANCE;FICTIF;POS_SOL;ETAT;DATE_CREAT;DATE_MAJ;DATE_APP;DATE_CONF;SOURCE;ID_SOURCE;ACQU_PLANI;PREC_PLANI;ACQU_ALTI;PREC_ALTI;NB_VOIES;LARGEUR;IT_VERT;PRIVE;SENS;BUS;URBAIN;VIT_MOY_VL;ACCES_VL;ACCES_PED;FERMETURE;NAT_RESTR;RESTR_H;RESTR_P;RESTR_PPE;RESTR_LAR;RESTR_LON;RESTR_MAT;BORNEDEB_G;BORNEDEB_D;BORNEFIN_G;BORNEFIN_D;INSEECOM_G;INSEECOM_D;ALIAS_G;ALIAS_D;DATE_SERV;ID_VOIE_G;ID_VOIE_D;ID_RN;ID_ITI;NUMERO;NUM_EUROP;CL_ADMIN;GESTION;TOPONYME;ITI_CYCL;VOIE_VERTE;NATURE_ITI;NOM_ITI;DELESTAGE;SRC_BAN_G;SRC_BAN_D;NOM_BAN_G;NOM_BAN_D;LD_BAN_G;LD_BAN_D;ID_BAN_G;ID_BAN_D;SENS_CYC_G;SENS_CYC_D;CYCLABLE_G;CYCLABLE_D;RETOURDFCI;GAB_DFCI;IMPAS_DFCI;NDET_DFCI;OALIM_DFCI;PTMAX_DFCI;PISTE_DFCI;DFCI_DEBRO;DFCI_FOSSE;SENS_DFCI;TERR_DFCI;VIT_DFCI;CROIS_DFCI;geometry
-TRONROUT0000000044847977;Route à 1 chaussée;ALL DU BOULINGRIN;ALL DU BOULINGRIN;5;Non;0;En service;2006-12-12 11:20:44;2023-08-26 17:45:08;;2009-07-01;;;Photogrammétrie;2.5;Photogrammétrie;1.5;2.0;4.0;Non;Non;Double sens;;Oui;20;Libre;;;;;;;;;Non;1;2;141;140;34172;34172;;;;341720797;341720797;;;;;;;;;;;;;commune;commune;Allée du Boulingrin;Allée du Boulingrin;;;34172_0797;34172_0797;;;;;;;;;;;;;;;;;;LINESTRING Z (770660.7 6277485.2 20.4, 770668 6277478.8 20)
-TRONROUT0000000044847977;Route à 1 chaussée;ALL DU BOULINGRIN;ALL DU BOULINGRIN;5;Non;0;En service;2006-12-12 11:20:44;2023-08-26 17:45:08;;2009-07-01;;;Photogrammétrie;2.5;Photogrammétrie;1.5;2.0;4.0;Non;Non;Double sens;;Oui;20;Libre;;;;;;;;;Non;1;2;141;140;34172;34172;;;;341720797;341720797;;;;;;;;;;;;;commune;commune;Allée du Boulingrin;Allée du Boulingrin;;;34172_0797;34172_0797;;;;;;;;;;;;;;;;;;LINESTRING Z (770668 6277478.8 20, 770674.8 6277475.7 19.3)
-TRONROUT0000000044847977;Route à 1 chaussée;ALL DU BOULINGRIN;ALL DU BOULINGRIN;5;Non;0;En service;2006-12-12 11:20:44;2023-08-26 17:45:08;;2009-07-01;;;Photogrammétrie;2.5;Photogrammétrie;1.5;2.0;4.0;Non;Non;Double sens;;Oui;20;Libre;;;;;;;;;Non;1;2;141;140;34172;34172;;;;341720797;341720797;;;;;;;;;;;;;commune;commune;Allée du Boulingrin;Allée du Boulingrin;;;34172_0797;34172_0797;;;;;;;;;;;;;;;;;;LINESTRING Z (770674.8 6277475.7 19.3, 770691 6277470.2 19)
-TRONROUT0000000044847977;Route à 1 chaussée;ALL DU BOULINGRIN;ALL DU BOULINGRIN;5;Non;0;En service;2006-12-12 11:20:44;2023-08-26 17:45:08;;2009-07-01;;;Photogrammétrie;2.5;Photogrammétrie;1.5;2.0;4.0;Non;Non;Double sens;;Oui;20;Libre;;;;;;;;;Non;1;2;141;140;34172;34172;;;;341720797;341720797;;;;;;;;;;;;;commune;commune;Allée du Boulingrin;Allée du Boulingrin;;;34172_0797;34172_0797;;;;;;;;;;;;;;;;;;LINESTRING Z (770691 6277470.2 19, 770691.9 6277470.5 19)
-TRONROUT0000000044847977;Route à 1 chaussée;ALL DU BOULINGRIN;ALL DU BOULINGRIN;5;Non;0;En service;2006-12-12 11:20:44;2023-08-26 17:45:08;;2009-07-01;;;Photogrammétrie;2.5;Photogrammétrie;1.5;2.0;4.0;Non;Non;Double sens;;Oui;20;Libre;;;;;;;;;Non;1;2;141;140;34172;34172;;;;341720797;341720797;;;;;;;;;;;;;commune;commune;Allée du Boulingrin;Allée du Boulingrin;;;34172_0797;34172_0797;;;;;;;;;;;;;;;;;;LINESTRING Z (770691.9 6277470.5 19, 770692.6 6277472.4 19, 770698.8 6277490.2 19.9, 770699.7 6277491.3 19.9, 770702.3 6277491.6 19.9, 770760.1 6277469.4 19.9)
-TRONROUT0000000240978829;Route à 1 chaussée;AV DE MAURIN;AV DE MAURIN;4;Non;0;En service;2010-07-16 14:01:58;2023-08-26 17:45:08;;2009-07-01;;;Photogrammétrie;2.5;Photogrammétrie;1.5;1.0;4.0;Non;Non;Sens inverse;;Oui;30;Libre;;;;;;;;;Non;1392;;1356;;34172;34172;;;;341723665;341723665;;;;;;;;;;;;;commune;commune;Avenue de Maurin;Avenue de Maurin;;;34172_3665;34172_3665;;;;;;;;;;;;;;;;;;LINESTRING Z (770651.3720822622 6277488.083804627 20.3, 770657.1 6277499.8 20.3)
-TRONROUT0000000044848012;Route à 1 chaussée;BD PEDRO DE LUNA;BD PEDRO DE LUNA;5;Non;0;En service;2006-12-12 11:20:44;2023-08-26 17:45:08;;2009-07-01;;;Photogrammétrie;2.5;Photogrammétrie;1.5;2.0;4.0;Non;Non;Double sens;;Oui;5;Libre;;;;;;;;;Non;515;516;631;630;34172;34172;;;;341724240;341724240;;;;;;;;;;;;;commune;commune;Boulevard Pedro de Luna;Boulevard Pedro de Luna;;;34172_4240;34172_4240;;;;;;;;;;;;;;;;;;LINESTRING Z (770563.5 6277547.7 20.9, 770565.8 6277545.8 20.7)
-TRONROUT0000000044848012;Route à 1 chaussée;BD PEDRO DE LUNA;BD PEDRO DE LUNA;5;Non;0;En service;2006-12-12 11:20:44;2023-08-26 17:45:08;;2009-07-01;;;Photogrammétrie;2.5;Photogrammétrie;1.5;2.0;4.0;Non;Non;Double sens;;Oui;5;Libre;;;;;;;;;Non;515;516;631;630;34172;34172;;;;341724240;341724240;;;;;;;;;;;;;commune;commune;Boulevard Pedro de Luna;Boulevard Pedro de Luna;;;34172_4240;34172_4240;;;;;;;;;;;;;;;;;;LINESTRING Z (770565.8 6277545.8 20.7, 770596.3 6277521.8 20.4)
-TRONROUT0000000044848012;Route à 1 chaussée;BD PEDRO DE LUNA;BD PEDRO DE LUNA;5;Non;0;En service;2006-12-12 11:20:44;2023-08-26 17:45:08;;2009-07-01;;;Photogrammétrie;2.5;Photogrammétrie;1.5;2.0;4.0;Non;Non;Double sens;;Oui;5;Libre;;;;;;;;;Non;515;516;631;630;34172;34172;;;;341724240;341724240;;;;;;;;;;;;;commune;commune;Boulevard Pedro de Luna;Boulevard Pedro de Luna;;;34172_4240;34172_4240;;;;;;;;;;;;;;;;;;LINESTRING Z (770596.3 6277521.8 20.4, 770620.1 6277502.4 20.4)
-TRONROUT0000000044848012;Route à 1 chaussée;BD PEDRO DE LUNA;BD PEDRO DE LUNA;5;Non;0;En service;2006-12-12 11:20:44;2023-08-26 17:45:08;;2009-07-01;;;Photogrammétrie;2.5;Photogrammétrie;1.5;2.0;4.0;Non;Non;Double sens;;Oui;5;Libre;;;;;;;;;Non;515;516;631;630;34172;34172;;;;341724240;341724240;;;;;;;;;;;;;commune;commune;Boulevard Pedro de Luna;Boulevard Pedro de Luna;;;34172_4240;34172_4240;;;;;;;;;;;;;;;;;;LINESTRING Z (770620.1 6277502.4 20.4, 770625.6 6277499 20)
-TRONROUT0000000044848012;Route à 1 chaussée;BD PEDRO DE LUNA;BD PEDRO DE LUNA;5;Non;0;En service;2006-12-12 11:20:44;2023-08-26 17:45:08;;2009-07-01;;;Photogrammétrie;2.5;Photogrammétrie;1.5;2.0;4.0;Non;Non;Double sens;;Oui;5;Libre;;;;;;;;;Non;515;516;631;630;34172;34172;;;;341724240;341724240;;;;;;;;;;;;;commune;commune;Boulevard Pedro de Luna;Boulevard Pedro de Luna;;;34172_4240;34172_4240;;;;;;;;;;;;;;;;;;LINESTRING Z (770625.6 6277499 20, 770630.9 6277496.6 20)
-TRONROUT0000000044848012;Route à 1 chaussée;BD PEDRO DE LUNA;BD PEDRO DE LUNA;5;Non;0;En service;2006-12-12 11:20:44;2023-08-26 17:45:08;;2009-07-01;;;Photogrammétrie;2.5;Photogrammétrie;1.5;2.0;4.0;Non;Non;Double sens;;Oui;5;Libre;;;;;;;;;Non;515;516;631;630;34172;34172;;;;341724240;341724240;;;;;;;;;;;;;commune;commune;Boulevard Pedro de Luna;Boulevard Pedro de Luna;;;34172_4240;34172_4240;;;;;;;;;;;;;;;;;;LINESTRING Z (770630.9 6277496.6 20, 770636.6 6277495.3 20, 770641.5 6277494.8 20, 770647.6 6277495 20, 770652.5 6277496.8 20.2, 770657.1 6277499.8 20.3)
-TRONROUT0000000240978882;Route à 1 chaussée;AV DE MAURIN;AV DE MAURIN;4;Non;0;En service;2010-07-16 14:01:58;2023-08-26 17:45:08;;2009-07-01;;;Photogrammétrie;2.5;Photogrammétrie;1.5;1.0;3.0;Non;Non;Sens inverse;;Oui;35;Libre;;;;;;;;;Non;1356;;1278;;34172;34172;;;;341723665;341723665;;;;;;;;;;;;;commune;commune;Avenue de Maurin;Avenue de Maurin;;;34172_3665;34172_3665;;;;;;;;;;;;;;;;;;LINESTRING Z (770657.1 6277499.8 20.3, 770657.8 6277500.3 20.3, 770661 6277504.3 20.5, 770668.2 6277515.5 20.8, 770689.1 6277557.1 20.9, 770695 6277572.2 20.9)
-TRONROUT0000000240978676;Route à 1 chaussée;AV DE MAURIN;AV DE MAURIN;4;Non;0;En service;2010-07-16 14:01:58;2023-08-26 17:45:08;;2009-07-01;;;Photogrammétrie;2.5;Photogrammétrie;1.5;1.0;3.0;Non;Non;Sens direct;;Oui;35;Libre;;;;;;;;;Non;1285;1376;1285;1182;34172;34172;;;;341723665;341723665;;;;;;;;;;;;;commune;commune;Avenue de Maurin;Avenue de Maurin;;;34172_3665;34172_3665;;;;;;;;;;;;;;;;;;LINESTRING Z (770660.7 6277485.2 20.4, 770663 6277486.5 20.4, 770670 6277492.2 20.5, 770674.4 6277496.7 20.5, 770677.4 6277501.2 20.5, 770678.5 6277502.8 20.5, 770681.1 6277508.2 20.4, 770685.3 6277518.3 20.1, 770688.8 6277527.4 20.1, 770698.1 6277550.8 20.1, 770706 6277571.8 20.3, 770714.4 6277597.3 20.7, 770724.9 6277629.8 20.9, 770729.6 6277641.6 21.1, 770733.7 6277650.4 21.3, 770737.9 6277659 21.4, 770741.6 6277665.2 21.4)
-TRONROUT0000000044845894;Route à 1 chaussée;ALL DU PARC TASTAVIN;ALL DU PARC TASTAVIN;5;Non;0;En service;2006-12-12 11:20:44;2023-08-26 17:45:08;;2009-07-01;;;Photogrammétrie;2.5;Photogrammétrie;1.5;1.0;3.0;Non;Non;Sens direct;;Oui;5;Libre;;;;;;;;;Non;;1;;1;34172;34172;;;;341724123;341724123;;;;;;;;;;;;;commune;commune;Allée du Parc Tastavin;Allée du Parc Tastavin;;;34172_4123;34172_4123;;;;;;;;;;;;;;;;;;LINESTRING Z (770686.4 6277580.7 20.7, 770695 6277572.2 20.9)
-TRONROUT0000000240978838;Route à 1 chaussée;AV DE MAURIN;AV DE MAURIN;4;Non;0;En service;2010-07-16 14:01:58;2023-08-26 17:45:08;;2009-07-01;;;Photogrammétrie;2.5;Photogrammétrie;1.5;1.0;3.0;Non;Non;Sens direct;;Oui;25;Libre;;;;;;;;;Non;;1268;;1278;34172;34172;;;;341723665;341723665;;;;;;;;;;;;;commune;commune;Avenue de Maurin;Avenue de Maurin;;;34172_3665;34172_3665;;;;;;;;;;;;;;;;;;LINESTRING Z (770700 6277585.3 20.9, 770699.6 6277584.1 20.9, 770696.2 6277575.3 20.9, 770695 6277572.2 20.9)
-TRONROUT0000000240978103;Route à 1 chaussée;ALL DU PARC TASTAVIN;ALL DU PARC TASTAVIN;5;Non;0;En service;2010-07-16 14:01:58;2023-08-26 17:45:08;;2009-07-01;;;Photogrammétrie;2.5;Photogrammétrie;1.5;1.0;3.0;Non;Non;Sens direct;;Oui;5;Libre;;;;;;;;;Non;;;;;34172;34172;;;;341724123;341724123;;;;;;;;;;;;;commune;commune;Allée du Parc Tastavin;Allée du Parc Tastavin;;;34172_4123;34172_4123;;;;;;;;;;;;;;;;;;LINESTRING Z (770700 6277585.3 20.9, 770695.6 6277583 20.7, 770690.9 6277581.4 20.7, 770686.4 6277580.7 20.7)
-TRONROUT0000000044845857;Route à 1 chaussée;IMP JULES VERNE;IMP JULES VERNE;5;Non;0;En service;2006-12-12 11:20:44;2023-08-26 17:45:08;;;;;BDTopo;2.5;BDTopo;1.5;2.0;4.0;Non;Non;Double sens;;Oui;20;Libre;;;;;;;;;Non;12;11;2;1;34172;34172;;;;341723097;341723097;;;;;;;;;;;;;commune;commune;Impasse Jules Verne;Impasse Jules Verne;;;34172_3097;34172_3097;;;;;;;;;;;;;;;;;;LINESTRING Z (770620.4 6277569.7 23, 770655 6277609.9 21.8)
-TRONROUT0000000044845913;Route à 1 chaussée;BD PEDRO DE LUNA;BD PEDRO DE LUNA;5;Non;0;En service;2006-12-12 11:20:44;2023-08-26 17:45:08;;2009-07-01;;;Photogrammétrie;2.5;Photogrammétrie;1.5;2.0;4.0;Non;Non;Double sens;;Oui;20;Libre;;;;;;;;;Non;369;370;515;516;34172;34172;;;;341724240;341724240;;;;;;;;;;;;;commune;commune;Boulevard Pedro de Luna;Boulevard Pedro de Luna;;;34172_4240;34172_4240;;;;;;;;;;;;;;;;;;LINESTRING Z (770447 6277630.6 22.5, 770455 6277627 22.5)
-TRONROUT0000000044845913;Route à 1 chaussée;BD PEDRO DE LUNA;BD PEDRO DE LUNA;5;Non;0;En service;2006-12-12 11:20:44;2023-08-26 17:45:08;;2009-07-01;;;Photogrammétrie;2.5;Photogrammétrie;1.5;2.0;4.0;Non;Non;Double sens;;Oui;20;Libre;;;;;;;;;Non;369;370;515;516;34172;34172;;;;341724240;341724240;;;;;;;;;;;;;commune;commune;Boulevard Pedro de Luna;Boulevard Pedro de Luna;;;34172_4240;34172_4240;;;;;;;;;;;;;;;;;;LINESTRING Z (770455 6277627 22.5, 770459.4 6277626.2 21.5)
-TRONROUT0000000044845913;Route à 1 chaussée;BD PEDRO DE LUNA;BD PEDRO DE LUNA;5;Non;0;En service;2006-12-12 11:20:44;2023-08-26 17:45:08;;2009-07-01;;;Photogrammétrie;2.5;Photogrammétrie;1.5;2.0;4.0;Non;Non;Double sens;;Oui;20;Libre;;;;;;;;;Non;369;370;515;516;34172;34172;;;;341724240;341724240;;;;;;;;;;;;;commune;commune;Boulevard Pedro de Luna;Boulevard Pedro de Luna;;;34172_4240;34172_4240;;;;;;;;;;;;;;;;;;LINESTRING Z (770459.4 6277626.2 21.5, 770465.2 6277624 21.5)
-TRONROUT0000000044845913;Route à 1 chaussée;BD PEDRO DE LUNA;BD PEDRO DE LUNA;5;Non;0;En service;2006-12-12 11:20:44;2023-08-26 17:45:08;;2009-07-01;;;Photogrammétrie;2.5;Photogrammétrie;1.5;2.0;4.0;Non;Non;Double sens;;Oui;20;Libre;;;;;;;;;Non;369;370;515;516;34172;34172;;;;341724240;341724240;;;;;;;;;;;;;commune;commune;Boulevard Pedro de Luna;Boulevard Pedro de Luna;;;34172_4240;34172_4240;;;;;;;;;;;;;;;;;;LINESTRING Z (770465.2 6277624 21.5, 770470.4 6277621.3 21.6)
-TRONROUT0000000044845913;Route à 1 chaussée;BD PEDRO DE LUNA;BD PEDRO DE LUNA;5;Non;0;En service;2006-12-12 11:20:44;2023-08-26 17:45:08;;2009-07-01;;;Photogrammétrie;2.5;Photogrammétrie;1.5;2.0;4.0;Non;Non;Double sens;;Oui;20;Libre;;;;;;;;;Non;369;370;515;516;34172;34172;;;;341724240;341724240;;;;;;;;;;;;;commune;commune;Boulevard Pedro de Luna;Boulevard Pedro de Luna;;;34172_4240;34172_4240;;;;;;;;;;;;;;;;;;LINESTRING Z (770470.4 6277621.3 21.6, 770475.5 6277617.9 21.6)
-TRONROUT0000000044845913;Route à 1 chaussée;BD PEDRO DE LUNA;BD PEDRO DE LUNA;5;Non;0;En service;2006-12-12 11:20:44;2023-08-26 17:45:08;;2009-07-01;;;Photogrammétrie;2.5;Photogrammétrie;1.5;2.0;4.0;Non;Non;Double sens;;Oui;20;Libre;;;;;;;;;Non;369;370;515;516;34172;34172;;;;341724240;341724240;;;;;;;;;;;;;commune;commune;Boulevard Pedro de Luna;Boulevard Pedro de Luna;;;34172_4240;34172_4240;;;;;;;;;;;;;;;;;;LINESTRING Z (770475.5 6277617.9 21.6, 770482.2 6277612.5 21.7)
-TRONROUT0000000044845913;Route à 1 chaussée;BD PEDRO DE LUNA;BD PEDRO DE LUNA;5;Non;0;En service;2006-12-12 11:20:44;2023-08-26 17:45:08;;2009-07-01;;;Photogrammétrie;2.5;Photogrammétrie;1.5;2.0;4.0;Non;Non;Double sens;;Oui;20;Libre;;;;;;;;;Non;369;370;515;516;34172;34172;;;;341724240;341724240;;;;;;;;;;;;;commune;commune;Boulevard Pedro de Luna;Boulevard Pedro de Luna;;;34172_4240;34172_4240;;;;;;;;;;;;;;;;;;LINESTRING Z (770482.2 6277612.5 21.7, 770509.4 6277591.1 21.8)
-TRONROUT0000000044845913;Route à 1 chaussée;BD PEDRO DE LUNA;BD PEDRO DE LUNA;5;Non;0;En service;2006-12-12 11:20:44;2023-08-26 17:45:08;;2009-07-01;;;Photogrammétrie;2.5;Photogrammétrie;1.5;2.0;4.0;Non;Non;Double sens;;Oui;20;Libre;;;;;;;;;Non;369;370;515;516;34172;34172;;;;341724240;341724240;;;;;;;;;;;;;commune;commune;Boulevard Pedro de Luna;Boulevard Pedro de Luna;;;34172_4240;34172_4240;;;;;;;;;;;;;;;;;;LINESTRING Z (770509.4 6277591.1 21.8, 770556.7 6277553.7 21.4)
-TRONROUT0000000044845913;Route à 1 chaussée;BD PEDRO DE LUNA;BD PEDRO DE LUNA;5;Non;0;En service;2006-12-12 11:20:44;2023-08-26 17:45:08;;2009-07-01;;;Photogrammétrie;2.5;Photogrammétrie;1.5;2.0;4.0;Non;Non;Double sens;;Oui;20;Libre;;;;;;;;;Non;369;370;515;516;34172;34172;;;;341724240;341724240;;;;;;;;;;;;;commune;commune;Boulevard Pedro de Luna;Boulevard Pedro de Luna;;;34172_4240;34172_4240;;;;;;;;;;;;;;;;;;LINESTRING Z (770556.7 6277553.7 21.4, 770563.5 6277547.7 20.9)
-TRONROUT0000000109698649;Route à 1 chaussée;BD PEDRO DE LUNA;BD PEDRO DE LUNA;5;Non;0;En service;2007-12-13 12:17:21;2023-08-26 17:45:08;;2009-07-01;;;Photogrammétrie;2.5;Photogrammétrie;1.5;2.0;4.0;Non;Non;Sens inverse;;Oui;20;Libre;;;;;;;;;Non;297;296;369;368;34172;34172;;;;341724240;341724240;;;;;;;;;;;;;commune;commune;Boulevard Pedro de Luna;Boulevard Pedro de Luna;;;34172_4240;34172_4240;;;;;;;;;;;;;;;;;;LINESTRING Z (770397.2 6277671.9 22.8, 770420.2 6277653.1 22.5)
-TRONROUT0000000109698649;Route à 1 chaussée;BD PEDRO DE LUNA;BD PEDRO DE LUNA;5;Non;0;En service;2007-12-13 12:17:21;2023-08-26 17:45:08;;2009-07-01;;;Photogrammétrie;2.5;Photogrammétrie;1.5;2.0;4.0;Non;Non;Sens inverse;;Oui;20;Libre;;;;;;;;;Non;297;296;369;368;34172;34172;;;;341724240;341724240;;;;;;;;;;;;;commune;commune;Boulevard Pedro de Luna;Boulevard Pedro de Luna;;;34172_4240;34172_4240;;;;;;;;;;;;;;;;;;LINESTRING Z (770420.2 6277653.1 22.5, 770442.6 6277635.1 22.5)
-TRONROUT0000000109698649;Route à 1 chaussée;BD PEDRO DE LUNA;BD PEDRO DE LUNA;5;Non;0;En service;2007-12-13 12:17:21;2023-08-26 17:45:08;;2009-07-01;;;Photogrammétrie;2.5;Photogrammétrie;1.5;2.0;4.0;Non;Non;Sens inverse;;Oui;20;Libre;;;;;;;;;Non;297;296;369;368;34172;34172;;;;341724240;341724240;;;;;;;;;;;;;commune;commune;Boulevard Pedro de Luna;Boulevard Pedro de Luna;;;34172_4240;34172_4240;;;;;;;;;;;;;;;;;;LINESTRING Z (770442.6 6277635.1 22.5, 770447 6277630.6 22.5)
-TRONROUT0000000044845873;Route à 1 chaussée;R DE CAMARGUE;R DE CAMARGUE;5;Non;0;En service;2006-12-12 11:20:44;2023-08-26 17:45:08;;2009-07-01;;;Photogrammétrie;2.5;Photogrammétrie;1.5;2.0;4.0;Non;Non;Double sens;;Oui;20;Libre;;;;;;;;;Non;1;2;19;10;34172;34172;;;;341720933;341720933;;;;;;;;;;;;;commune;commune;Rue de Camargue;Rue de Camargue;;;34172_0933;34172_0933;;;;;;;;;;;;;;;;;;LINESTRING Z (770426.4 6277714.1 22.6, 770467.4 6277677.1 22.1, 770521.1 6277629 22.3)
-TRONROUT0000000044845823;Route à 1 chaussée;ALL DU PARC TASTAVIN;ALL DU PARC TASTAVIN;5;Non;0;En service;2006-12-12 11:20:44;2023-08-26 17:45:08;;;;;Géoroute;20.0;Z corrigé;2.5;2.0;4.0;Non;Non;Double sens;;Oui;20;Libre;;;;;;;;;Non;12;;8;;34172;34172;;;;341724123;341724123;;;;;;;;;;;;;commune;commune;Allée du Parc Tastavin;Allée du Parc Tastavin;;;34172_4123;34172_4123;;;;;;;;;;;;;;;;;;LINESTRING Z (770522 6277709.8 23.3, 770534.9 6277723.6 23.3)
-TRONROUT0000000240977666;Route à 1 chaussée;ALL DU PARC TASTAVIN;ALL DU PARC TASTAVIN;5;Non;0;En service;2010-07-16 14:01:58;2023-08-26 17:45:08;;;;;BDTopo;2.5;BDTopo;1.5;2.0;4.0;Non;Non;Double sens;;Oui;15;Libre;;;;;;;;;Non;31;;33;;34172;34172;;;;341724123;341724123;;;;;;;;;;;;;commune;commune;Allée du Parc Tastavin;Allée du Parc Tastavin;;;34172_4123;34172_4123;;;;;;;;;;;;;;;;;;LINESTRING Z (770546 6277713.1 23.1, 770534.9 6277723.6 23.3)
-TRONROUT0000000044845917;Route à 1 chaussée;ALL DU PARC TASTAVIN;ALL DU PARC TASTAVIN;5;Non;0;En service;2006-12-12 11:20:44;2023-08-26 17:45:08;;2009-07-01;;;Photogrammétrie;2.5;Photogrammétrie;1.5;2.0;4.0;Non;Non;Double sens;;Oui;10;Libre;;;;;;;;;Non;8;;2;;34172;34172;;;;341724123;341724123;;;;;;;;;;;;;commune;commune;Allée du Parc Tastavin;Allée du Parc Tastavin;;;34172_4123;34172_4123;;;;;;;;;;;;;;;;;;LINESTRING Z (770546 6277713.1 23.1, 770556.5 6277728 23.6, 770557 6277730.3 23.1, 770555.1 6277733.3 22.5, 770551.6 6277735.8 22.5, 770548.9 6277735.6 22.5, 770546.3 6277734.8 22.5, 770534.9 6277723.6 23.3)
-TRONROUT0000000044845915;Route à 1 chaussée;R VINCENT EUVRARD;R VINCENT EUVRARD;5;Non;0;En service;2006-12-12 11:20:44;2023-08-26 17:45:08;;2009-07-01;;;Photogrammétrie;2.5;Photogrammétrie;1.5;2.0;4.0;Non;Non;Double sens;;Oui;20;Libre;;;;;;;;;Non;45;44;95;94;34172;34172;;;;341722579;341722579;;;;;;;;;;;;;commune;commune;Rue Vincent Euvrard;Rue Vincent Euvrard;;;34172_2579;34172_2579;;;;;;;;;;;;;;;;;;LINESTRING Z (770426.4 6277714.1 22.6, 770455.2 6277747.4 23)
-TRONROUT0000000240978819;Route à 1 chaussée;ALL DU PARC TASTAVIN;ALL DU PARC TASTAVIN;5;Non;0;En service;2010-07-16 14:01:58;2023-08-26 17:45:08;;2009-07-01;;;Photogrammétrie;2.5;Photogrammétrie;1.5;2.0;4.0;Non;Non;Double sens;;Oui;20;Libre;;;;;;;;;Non;;3;;3;34172;34172;;;;341724123;341724123;;;;;;;;;;;;;commune;commune;Allée du Parc Tastavin;Allée du Parc Tastavin;;;34172_4123;34172_4123;;;;;;;;;;;;;;;;;;LINESTRING Z (770655 6277609.9 21.8, 770685.7 6277581.4 20.7, 770686.4 6277580.7 20.7)
-TRONROUT0000000044845900;Route à 1 chaussée;AV DE MAURIN;AV DE MAURIN;4;Non;0;En service;2006-12-12 11:20:44;2023-08-26 17:45:08;;2009-07-01;;;Photogrammétrie;2.5;Photogrammétrie;1.5;1.0;3.0;Non;Non;Sens inverse;;Oui;25;Libre;;;;;;;;;Non;1266;;1246;;34172;34172;;;;341723665;341723665;;;;;;;;;;;;;commune;commune;Avenue de Maurin;Avenue de Maurin;;;34172_3665;34172_3665;;;;;;;;;;;;;;;;;;LINESTRING Z (770700 6277585.3 20.9, 770706.2 6277605.4 20.9)
-TRONROUT0000000201934075;Route à 1 chaussée;AV DE MAURIN;AV DE MAURIN;4;Non;0;En service;2008-07-30 13:46:27;2023-08-26 17:45:08;;2009-07-01;;;Photogrammétrie;2.5;Photogrammétrie;1.5;1.0;3.0;Non;Non;Sens inverse;;Oui;35;Libre;;;;;;;;;Non;1246;;1182;;34172;34172;;;;341723665;341723665;;;;;;;;;;;;;commune;commune;Avenue de Maurin;Avenue de Maurin;;;34172_3665;34172_3665;;;;;;;;;;;;;;;;;;LINESTRING Z (770706.2 6277605.4 20.9, 770707 6277607.9 20.9, 770716.8 6277638.1 20.9, 770721.5 6277652 21.4, 770723.9 6277658.6 21.6, 770725.4 6277664.6 21.6, 770725.7 6277668.6 21.6, 770725.6 6277669.6 21.6)
-TRONROUT0000000044845937;Route à 1 chaussée;R MONGE;R MONGE;5;Non;0;En service;2006-12-12 11:20:44;2023-08-26 17:45:08;;2009-07-01;;;Photogrammétrie;2.5;Photogrammétrie;1.5;2.0;4.0;Non;Non;Double sens;;Oui;10;Libre;;;;;;;;;Non;6;13;2;1;34172;34172;;;;341723782;341723782;;;;;;;;;;;;;commune;commune;Rue Monge;Rue Monge;;;34172_3782;34172_3782;;;;;;;;;;;;;;;;;;LINESTRING Z (770604.3 6277698.1 23.4, 770634.4 6277671.1 21, 770688.6 6277620.4 20.4, 770701.7 6277609.7 20.6, 770706.2 6277605.4 20.9)
-TRONROUT0000000240977790;Route à 1 chaussée;;;5;Non;0;En service;2010-07-16 14:01:58;2023-08-26 17:45:08;;2009-07-01;;;Photogrammétrie;2.5;Photogrammétrie;1.5;1.0;3.0;Non;Non;Double sens;;Oui;20;Libre;;;;;;;;;Non;;;;;34172;34172;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;LINESTRING Z (770781.0810751509 6277670.824410313 24.003784969834356, 770781.6 6277663.3 23.9)
-TRONROUT0000000240977790;Route à 1 chaussée;;;5;Non;0;En service;2010-07-16 14:01:58;2023-08-26 17:45:08;;2009-07-01;;;Photogrammétrie;2.5;Photogrammétrie;1.5;1.0;3.0;Non;Non;Double sens;;Oui;20;Libre;;;;;;;;;Non;;;;;34172;34172;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;LINESTRING Z (770781.6 6277663.3 23.9, 770782.2 6277618.8 24.1)
-TRONROUT0000000240977790;Route à 1 chaussée;;;5;Non;0;En service;2010-07-16 14:01:58;2023-08-26 17:45:08;;2009-07-01;;;Photogrammétrie;2.5;Photogrammétrie;1.5;1.0;3.0;Non;Non;Double sens;;Oui;20;Libre;;;;;;;;;Non;;;;;34172;34172;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;LINESTRING Z (770782.2 6277618.8 24.1, 770781.4 6277587 24.1, 770781.5 6277586.8 24.1)
-TRONROUT0000000044845902;Route à 1 chaussée;ALL DU PARC TASTAVIN;ALL DU PARC TASTAVIN;5;Non;0;En service;2006-12-12 11:20:44;2023-08-26 17:45:08;;;;;BDTopo;2.5;BDTopo;1.5;2.0;4.0;Non;Non;Double sens;;Oui;20;Libre;;;;;;;;;Non;5;;29;;34172;34172;;;;341724123;341724123;;;;;;;;;;;;;commune;commune;Allée du Parc Tastavin;Allée du Parc Tastavin;;;34172_4123;34172_4123;;;;;;;;;;;;;;;;;;LINESTRING Z (770655 6277609.9 21.8, 770546 6277713.1 23.1)
-TRONROUT0000000201934073;Route à 1 chaussée;AV DE MAURIN;AV DE MAURIN;4;Non;0;En service;2008-07-30 13:46:27;2023-08-26 17:45:08;;2009-07-01;;;Photogrammétrie;2.5;Photogrammétrie;1.5;1.0;3.0;Non;Non;Sens inverse;;Oui;25;Libre;;;;;;;;;Non;;;;;34172;34172;;;;341723665;341723665;;;;;;;;;;;;;commune;commune;Avenue de Maurin;Avenue de Maurin;;;34172_3665;34172_3665;;;;;;;;;;;;;;;;;;LINESTRING Z (770741.6 6277665.2 21.4, 770734.2 6277666.6 21.5, 770728.4 6277667.7 21.5, 770725.6 6277669.6 21.6)
-TRONROUT0000000240977939;Route à 1 chaussée;AV DE MAURIN;AV DE MAURIN;4;Non;0;En service;2010-07-16 14:01:58;2023-08-26 17:45:08;;2009-07-01;;;Photogrammétrie;2.5;Photogrammétrie;1.5;1.0;3.0;Non;Non;Sens inverse;;Oui;30;Libre;;;;;;;;;Non;1138;;1183;;34172;34172;;;;341723665;341723665;;;;;;;;;;;;;commune;commune;Avenue de Maurin;Avenue de Maurin;;;34172_3665;34172_3665;;;;;;;;;;;;;;;;;;LINESTRING Z (770721.3573665497 6277698.415444838 21.772811387814933, 770724.9 6277694.7 21.6, 770728 6277689.4 21.4, 770730.3 6277683.3 21.5, 770732.3 6277678 21.6, 770734.9 6277673.2 21.5, 770741.6 6277665.2 21.4)
-TRONROUT0000000044845890;Route à 1 chaussée;AV DE MAURIN;AV DE MAURIN;4;Non;0;En service;2006-12-12 11:20:44;2023-08-26 17:45:08;;2009-07-01;;;Photogrammétrie;2.5;Photogrammétrie;1.5;1.0;3.0;Non;Non;Sens inverse;;Oui;30;Libre;;;;;;;;;Non;1182;;1138;;34172;34172;;;;341723665;341723665;;;;;;;;;;;;;commune;commune;Avenue de Maurin;Avenue de Maurin;;;34172_3665;34172_3665;;;;;;;;;;;;;;;;;;LINESTRING Z (770725.6 6277669.6 21.6, 770725 6277674 21.7, 770723.3 6277681.5 21.7, 770720.1 6277690.7 21.9, 770717.1 6277696.6 22.1, 770713.7 6277702 22.3, 770709.7 6277706.8 22.5, 770704.3 6277712.2 23.2)
-TRONROUT0000000044845909;Route à 1 chaussée;R JOSEPH CUGNOT;R JOSEPH CUGNOT;4;Non;0;En service;2006-12-12 11:20:44;2023-08-26 17:45:08;;2009-07-01;;;Photogrammétrie;2.5;Photogrammétrie;1.5;1.0;3.0;Non;Non;Sens direct;;Oui;35;Libre;;;;;;;;;Non;;;;;34172;34172;;;;341723061;341723061;;;;;;;;;;;;;commune;commune;Rue Joseph Cugnot;Rue Joseph Cugnot;;;34172_3061;34172_3061;;;;;;;;;;;;;;;;;;LINESTRING Z (770741.6 6277665.2 21.4, 770745.5 6277670.5 21.4, 770748.9 6277675.4 21.8, 770749.0770886724 6277675.71875961 21.81416709377949)
-TRONROUT0000000240978879;Route à 1 chaussée;R MONGE;R MONGE;5;Non;0;En service;2010-07-16 14:01:58;2023-08-26 17:45:08;;2009-07-01;;;Photogrammétrie;2.5;Photogrammétrie;1.5;2.0;4.0;Non;Non;Double sens;;Oui;20;Libre;;;;;;;;;Non;8;17;8;15;34172;34172;;;;341723782;341723782;;;;;;;;;;;;;commune;commune;Rue Monge;Rue Monge;;;34172_3782;34172_3782;;;;;;;;;;;;;;;;;;LINESTRING Z (770610.6 6277723.7 23.9, 770597.6 6277711.6 22.9, 770596.4 6277708.9 22.9, 770596.3 6277706.5 22.9, 770597.6 6277703.5 22.9, 770604.3 6277698.1 23.4)
-TRONROUT0000000240978477;Route à 1 chaussée;;;5;Non;0;En service;2010-07-16 14:01:58;2023-08-26 17:45:08;;2009-07-01;;;Photogrammétrie;2.5;Photogrammétrie;1.5;2.0;5.0;Non;Non;Double sens;;Oui;15;Libre;;;;;;;;;Non;;;;;34172;34172;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;LINESTRING Z (770630.8 6277726.6 22.8, 770613 6277707.5 22.6, 770604.3 6277698.1 23.4)
-TRONROUT0000000240977856;Route à 1 chaussée;;;5;Non;0;En service;2010-07-16 14:01:58;2023-08-26 17:45:08;;2009-07-01;;;Photogrammétrie;2.5;Photogrammétrie;1.5;2.0;5.0;Non;Non;Double sens;;Oui;20;Libre;;;;;;;;;Non;;;;;34172;34172;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;LINESTRING Z (770622 6277735.1 23.1, 770630.8 6277726.6 22.8)
-TRONROUT0000000240978941;Route à 1 chaussée;AV DE MAURIN;AV DE MAURIN;4;Non;0;En service;2010-07-16 14:01:58;2023-08-26 17:45:08;;2009-07-01;;;Photogrammétrie;2.5;Photogrammétrie;1.5;2.0;6.0;Non;Non;Double sens;;Oui;25;Libre;;;;;;;;;Non;1138;1139;1062;1063;34172;34172;;;;341723665;341723665;;;;;;;;;;;;;commune;commune;Avenue de Maurin;Avenue de Maurin;;;34172_3665;34172_3665;;;;;;;;;;;;;;;;;;LINESTRING Z (770704.3 6277712.2 23.2, 770694.9 6277721.9 24.3)
-TRONROUT0000000240978941;Route à 1 chaussée;AV DE MAURIN;AV DE MAURIN;4;Non;0;En service;2010-07-16 14:01:58;2023-08-26 17:45:08;;2009-07-01;;;Photogrammétrie;2.5;Photogrammétrie;1.5;2.0;6.0;Non;Non;Double sens;;Oui;25;Libre;;;;;;;;;Non;1138;1139;1062;1063;34172;34172;;;;341723665;341723665;;;;;;;;;;;;;commune;commune;Avenue de Maurin;Avenue de Maurin;;;34172_3665;34172_3665;;;;;;;;;;;;;;;;;;LINESTRING Z (770694.9 6277721.9 24.3, 770661.1 6277755.6 24.8)
-TRONROUT0000000044845832;Route à 1 chaussée;R MONGE;R MONGE;5;Non;0;En service;2006-12-12 11:20:44;2023-08-26 17:45:08;;2009-07-01;;;Photogrammétrie;2.5;Photogrammétrie;1.5;2.0;4.0;Non;Non;Double sens;;Oui;5;Libre;;;;;;;;;Non;14;;12;;34172;34172;;;;341723782;341723782;;;;;;;;;;;;;commune;commune;Rue Monge;Rue Monge;;;34172_3782;34172_3782;;;;;;;;;;;;;;;;;;LINESTRING Z (770661.1 6277755.6 24.8, 770634 6277730.1 22.8, 770630.8 6277726.6 22.8)
-TRONROUT0000000240977948;Route à 1 chaussée;AV DE MAURIN;AV DE MAURIN;4;Non;0;En service;2010-07-16 14:01:58;2023-08-26 17:45:08;;;;;BDTopo;2.5;BDTopo;1.5;2.0;6.0;Non;Non;Double sens;;Oui;30;Libre;;;;;;;;;Non;;;;;34172;34172;;;;341723665;341723665;;;;;;;;;;;;;commune;commune;Avenue de Maurin;Avenue de Maurin;;;34172_3665;34172_3665;;;;;;;;;;;;;;;;;;LINESTRING Z (770661.1 6277755.6 24.8, 770657.3 6277759.3 24.9)
-TRONROUT0000000044845860;Route à 1 chaussée;AV DE MAURIN;AV DE MAURIN;4;Non;0;En service;2006-12-12 11:20:44;2023-08-26 17:45:08;;;;;BDTopo;2.5;BDTopo;1.5;2.0;6.0;Non;Non;Double sens;;Oui;30;Libre;;;;;;;;;Non;989;990;1063;1062;34172;34172;;;;341723665;341723665;;;;;;;;;;;;;commune;commune;Avenue de Maurin;Avenue de Maurin;;;34172_3665;34172_3665;;;;;;;;;;;;;;;;;;LINESTRING Z (770613.2 6277802.6 25.5, 770657.3 6277759.3 24.9)
-TRONROUT0000000044845868;Route à 1 chaussée;AV DE MAURIN;AV DE MAURIN;4;Non;0;En service;2006-12-12 11:20:44;2023-08-26 17:45:08;;;;;BDTopo;2.5;BDTopo;1.5;2.0;6.0;Non;Non;Double sens;;Oui;30;Libre;;;;;;;;;Non;990;989;938;937;34172;34172;;;;341723665;341723665;;;;;;;;;;;;;commune;commune;Avenue de Maurin;Avenue de Maurin;;;34172_3665;34172_3665;;;;;;;;;;;;;;;;;;LINESTRING Z (770613.2 6277802.6 25.5, 770567.4 6277845.2 27.3)
-TRONROUT0000000044845928;Route à 1 chaussée;AV DE MAURIN;AV DE MAURIN;4;Non;0;En service;2006-12-12 11:20:44;2023-08-26 17:45:08;;;;;BDTopo;2.5;BDTopo;1.5;1.0;3.0;Non;Non;Sens inverse;;Oui;25;Libre;;;;;;;;;Non;;;;;34172;34172;;;;341723665;341723665;;;;;;;;;;;;;commune;commune;Avenue de Maurin;Avenue de Maurin;;;34172_3665;34172_3665;;;;;;;;;;;;;;;;;;LINESTRING Z (770590.5 6277857.2 26.6, 770592.7 6277838.7 27)
-TRONROUT0000000044845928;Route à 1 chaussée;AV DE MAURIN;AV DE MAURIN;4;Non;0;En service;2006-12-12 11:20:44;2023-08-26 17:45:08;;;;;BDTopo;2.5;BDTopo;1.5;1.0;3.0;Non;Non;Sens inverse;;Oui;25;Libre;;;;;;;;;Non;;;;;34172;34172;;;;341723665;341723665;;;;;;;;;;;;;commune;commune;Avenue de Maurin;Avenue de Maurin;;;34172_3665;34172_3665;;;;;;;;;;;;;;;;;;LINESTRING Z (770592.7 6277838.7 27, 770598.6 6277821.6 26.4)
-TRONROUT0000000044845928;Route à 1 chaussée;AV DE MAURIN;AV DE MAURIN;4;Non;0;En service;2006-12-12 11:20:44;2023-08-26 17:45:08;;;;;BDTopo;2.5;BDTopo;1.5;1.0;3.0;Non;Non;Sens inverse;;Oui;25;Libre;;;;;;;;;Non;;;;;34172;34172;;;;341723665;341723665;;;;;;;;;;;;;commune;commune;Avenue de Maurin;Avenue de Maurin;;;34172_3665;34172_3665;;;;;;;;;;;;;;;;;;LINESTRING Z (770598.6 6277821.6 26.4, 770604.9 6277810.8 26.1)
-TRONROUT0000000044845928;Route à 1 chaussée;AV DE MAURIN;AV DE MAURIN;4;Non;0;En service;2006-12-12 11:20:44;2023-08-26 17:45:08;;;;;BDTopo;2.5;BDTopo;1.5;1.0;3.0;Non;Non;Sens inverse;;Oui;25;Libre;;;;;;;;;Non;;;;;34172;34172;;;;341723665;341723665;;;;;;;;;;;;;commune;commune;Avenue de Maurin;Avenue de Maurin;;;34172_3665;34172_3665;;;;;;;;;;;;;;;;;;LINESTRING Z (770604.9 6277810.8 26.1, 770613.2 6277802.6 25.5)
-TRONROUT0000000044845908;Route à 1 chaussée;R VINCENT EUVRARD;R VINCENT EUVRARD;5;Non;0;En service;2006-12-12 11:20:44;2023-08-26 17:45:08;;2009-07-01;;;Photogrammétrie;2.5;Photogrammétrie;1.5;2.0;4.0;Non;Non;Double sens;;Oui;20;Libre;;;;;;;;;Non;95;94;151;150;34172;34172;;;;341722579;341722579;;;;;;;;;;;;;commune;commune;Rue Vincent Euvrard;Rue Vincent Euvrard;;;34172_2579;34172_2579;;;;;;;;;;;;;;;;;;LINESTRING Z (770455.2 6277747.4 23, 770503 6277802.8 24.6)
-TRONROUT0000000044845889;Route à 1 chaussée;R LAVOISIER;R LAVOISIER;5;Non;0;En service;2006-12-12 11:20:44;2023-08-26 17:45:08;;2009-07-01;;;Photogrammétrie;2.5;Photogrammétrie;1.5;2.0;4.0;Non;Non;Double sens;;Oui;20;Libre;;;;;;;;;Non;;4;;6;34172;34172;;;;341723202;341723202;;;;;;;;;;;;;commune;commune;Rue Lavoisier;Rue Lavoisier;;;34172_3202;34172_3202;;;;;;;;;;;;;;;;;;LINESTRING Z (770527.6 6277831.3 24.4, 770596.3 6277766.3 24.2, 770597.9 6277764 24.2, 770598.2 6277760.8 23.9, 770598.9 6277757.6 23.8, 770622 6277735.1 23.1)
-TRONROUT0000000044845907;Route à 1 chaussée;R VINCENT EUVRARD;R VINCENT EUVRARD;5;Non;0;En service;2006-12-12 11:20:44;2023-08-26 17:45:08;;2009-07-01;;;Photogrammétrie;2.5;Photogrammétrie;1.5;2.0;4.0;Non;Non;Double sens;;Oui;20;Libre;;;;;;;;;Non;159;160;199;200;34172;34172;;;;341722579;341722579;;;;;;;;;;;;;commune;commune;Rue Vincent Euvrard;Rue Vincent Euvrard;;;34172_2579;34172_2579;;;;;;;;;;;;;;;;;;LINESTRING Z (770503 6277802.8 24.5, 770521.1 6277823.3 25.3, 770525.4 6277828.6 25.2, 770527.6 6277831.3 24.4)
-TRONROUT0000000044845896;Route à 1 chaussée;R LAVOISIER;R LAVOISIER;5;Non;0;En service;2006-12-12 11:20:44;2023-08-26 17:45:08;;;;;BDTopo;2.5;BDTopo;1.5;2.0;4.0;Non;Non;Double sens;;Oui;20;Libre;;;;;;;;;Non;2;;2;;34172;34172;;;;341723202;341723202;;;;;;;;;;;;;commune;commune;Rue Lavoisier;Rue Lavoisier;;;34172_3202;34172_3202;;;;;;;;;;;;;;;;;;LINESTRING Z (770527.6 6277831.3 24.4, 770496 6277864.5 26)
-TRONROUT0000000044845879;Route à 1 chaussée;AV DE MAURIN;AV DE MAURIN;4;Non;0;En service;2006-12-12 11:20:44;2023-08-26 17:45:08;;;;;BDTopo;2.5;BDTopo;1.5;1.0;3.0;Non;Non;Sens inverse;;Oui;20;Libre;;;;;;;;;Non;;;;;34172;34172;;;;341723665;341723665;;;;;;;;;;;;;commune;commune;Avenue de Maurin;Avenue de Maurin;;;34172_3665;34172_3665;;;;;;;;;;;;;;;;;;LINESTRING Z (770567.4 6277845.2 27.3, 770565.9 6277852.4 26.6)
-TRONROUT0000000044845811;Route à 1 chaussée;AV DE MAURIN;AV DE MAURIN;4;Non;0;En service;2006-12-12 11:20:44;2023-08-26 17:45:08;;;;;BDTopo;2.5;BDTopo;1.5;2.0;6.0;Non;Non;Double sens;;Oui;20;Libre;;;;;;;;;Non;938;937;924;925;34172;34172;;;;341723665;341723665;;;;;;;;;;;;;commune;commune;Avenue de Maurin;Avenue de Maurin;;;34172_3665;34172_3665;;;;;;;;;;;;;;;;;;LINESTRING Z (770567.4 6277845.2 27.3, 770558.7 6277853.7 26.9)
-TRONROUT0000000044845920;Route à 1 chaussée;;;4;Non;0;En service;2006-12-12 11:20:44;2023-08-26 17:45:08;;;;;BDTopo;2.5;BDTopo;1.5;1.0;3.0;Non;Non;Sens direct;;Oui;25;Libre;;;;;;;;;Non;;;;;34172;34172;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;LINESTRING Z (770565.9 6277852.4 26.6, 770571 6277852.2 27)
-TRONROUT0000000044845920;Route à 1 chaussée;;;4;Non;0;En service;2006-12-12 11:20:44;2023-08-26 17:45:08;;;;;BDTopo;2.5;BDTopo;1.5;1.0;3.0;Non;Non;Sens direct;;Oui;25;Libre;;;;;;;;;Non;;;;;34172;34172;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;LINESTRING Z (770571 6277852.2 27, 770579.2 6277854 27)
-TRONROUT0000000044845920;Route à 1 chaussée;;;4;Non;0;En service;2006-12-12 11:20:44;2023-08-26 17:45:08;;;;;BDTopo;2.5;BDTopo;1.5;1.0;3.0;Non;Non;Sens direct;;Oui;25;Libre;;;;;;;;;Non;;;;;34172;34172;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;LINESTRING Z (770579.2 6277854 27, 770588.8 6277857.2 27.8)
-TRONROUT0000000044845920;Route à 1 chaussée;;;4;Non;0;En service;2006-12-12 11:20:44;2023-08-26 17:45:08;;;;;BDTopo;2.5;BDTopo;1.5;1.0;3.0;Non;Non;Sens direct;;Oui;25;Libre;;;;;;;;;Non;;;;;34172;34172;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;LINESTRING Z (770588.8 6277857.2 27.8, 770590.5 6277857.2 26.6)
-TRONROUT0000000044845888;Route à 1 chaussée;AV DE MAURIN;AV DE MAURIN;4;Non;0;En service;2006-12-12 11:20:44;2023-08-26 17:45:08;;;;;BDTopo;2.5;BDTopo;1.5;2.0;6.0;Non;Non;Double sens;;Oui;25;Libre;;;;;;;;;Non;924;925;886;887;34172;34172;;;;341723665;341723665;;;;;;;;;;;;;commune;commune;Avenue de Maurin;Avenue de Maurin;;;34172_3665;34172_3665;;;;;;;;;;;;;;;;;;LINESTRING Z (770558.7 6277853.7 26.9, 770531.7 6277882.3 27.3)
-TRONROUT0000000044845837;Route à 1 chaussée;R SAINTE-VERONIQUE;R SAINTE-VERONIQUE;5;Non;0;En service;2006-12-12 11:20:44;2023-08-26 17:45:08;;;;;Photogrammétrie;2.5;Photogrammétrie;1.5;2.0;7.0;Non;Non;Double sens;;Oui;15;Libre;;;;;;;;;Non;37;38;117;118;34172;34172;;;;341725252;341725252;;;;;;;;;;;;;commune;commune;Rue Sainte Véronique;Rue Sainte Véronique;;;34172_5252;34172_5252;;;;;;;;;;;;;;;;;;LINESTRING Z (770496 6277864.5 26.1, 770492.6 6277866.7 26.8, 770489.7 6277867.9 26.8, 770486.7 6277868.3 26.8, 770482.7 6277867.4 26.8, 770475.2 6277862.9 26.8, 770470.7 6277861.4 26.8, 770468.5 6277860.9 26.8, 770466.2 6277861.4 26.8, 770464.1 6277862.8 26.8, 770432.7 6277891.8 27.2)
-TRONROUT0000000044845826;Route à 1 chaussée;R SAINTE-VERONIQUE;R SAINTE-VERONIQUE;5;Non;0;En service;2006-12-12 11:20:44;2023-08-26 17:45:08;;;;;BDTopo;2.5;BDTopo;1.5;2.0;4.0;Non;Non;Double sens;;Oui;5;Libre;;;;;;;;;Non;38;37;2;1;34172;34172;;;;341725252;341725252;;;;;;;;;;;;;commune;commune;Rue Sainte Véronique;Rue Sainte Véronique;;;34172_5252;34172_5252;;;;;;;;;;;;;;;;;;LINESTRING Z (770496 6277864.5 26.1, 770523 6277891.6 27.8)
-TRONROUT0000000044845940;Route à 1 chaussée;R SAINT-CLEOPHAS;R SAINT-CLEOPHAS;4;Non;0;En service;2006-12-12 11:20:44;2023-08-26 17:45:08;;;;;BDTopo;2.5;BDTopo;1.5;2.0;6.0;Non;Non;Double sens;;Oui;20;Libre;;;;;;;;;Non;;55A;;55;34172;34172;;;;341725055;341725055;;;;;;;;;;;;;commune;commune;Rue Saint Cléophas;Rue Saint Cléophas;;;34172_5055;34172_5055;;;;;;;;;;;;;;;;;;LINESTRING Z (770531.7 6277882.3 27.3, 770523 6277891.6 27.8)
-TRONROUT0000000044845916;Route à 1 chaussée;R SAINT-CLEOPHAS;R SAINT-CLEOPHAS;4;Non;0;En service;2006-12-12 11:20:44;2023-08-26 17:45:08;;;;;BDTopo;2.5;BDTopo;1.5;2.0;6.0;Non;Non;Double sens;;Oui;30;Libre;;;;;;;;;Non;55;34;55;38;34172;34172;;;;341725055;341725055;;;;;;;;;;;;;commune;commune;Rue Saint Cléophas;Rue Saint Cléophas;;;34172_5055;34172_5055;;;;;;;;;;;;;;;;;;LINESTRING Z (770474.6 6277936.9 28.8, 770523 6277891.6 27.8)
-TRONROUT0000000044845891;Route à 1 chaussée;R SAINTE-MONIQUE;R SAINTE-MONIQUE;5;Non;0;En service;2006-12-12 11:20:44;2023-08-26 17:45:08;;;;;BDTopo;2.5;BDTopo;1.5;2.0;4.0;Non;Non;Double sens;;Oui;5;Libre;;;;;;;;;Non;1;2;5;2;34172;34172;;;;341725248;341725248;;;;;;;;;;;;;commune;commune;Rue Sainte Monique;Rue Sainte Monique;;;34172_5248;34172_5248;;;;;;;;;;;;;;;;;;LINESTRING Z (770474.6 6277936.9 28.8, 770432.7 6277891.8 27.2)
-TRONROUT0000000044843639;Route à 1 chaussée;R SAINT-CLEOPHAS;R SAINT-CLEOPHAS;4;Non;0;En service;2006-12-12 11:20:44;2023-08-26 17:45:08;;;;;BDTopo;2.5;BDTopo;1.5;2.0;6.0;Non;Non;Double sens;;Oui;25;Libre;;;;;;;;;Non;;;;;34172;34172;;;;341725055;341725055;;;;;;;;;;;;;commune;commune;Rue Saint Cléophas;Rue Saint Cléophas;;;34172_5055;34172_5055;;;;;;;;;;;;;;;;;;LINESTRING Z (770474.6 6277936.9 28.8, 770465.6 6277945.3 28.8)
-TRONROUT0000000044843690;Route à 1 chaussée;R SAINT-CLEOPHAS;R SAINT-CLEOPHAS;4;Non;0;En service;2006-12-12 11:20:44;2023-08-26 17:45:08;;;;;BDTopo;2.5;BDTopo;1.5;2.0;6.0;Non;Non;Double sens;;Oui;30;Libre;;;;;;;;;Non;32;53;26B;51;34172;34172;;;;341725055;341725055;;;;;;;;;;;;;commune;commune;Rue Saint Cléophas;Rue Saint Cléophas;;;34172_5055;34172_5055;;;;;;;;;;;;;;;;;;LINESTRING Z (770465.6 6277945.3 28.8, 770417.4 6277990.6 29)
-TRONROUT0000000240978890;Route à 1 chaussée;BD PEDRO DE LUNA;BD PEDRO DE LUNA;5;Non;0;En service;2010-07-16 14:01:58;2023-08-26 17:45:08;;2009-07-01;;;Photogrammétrie;2.5;Photogrammétrie;1.5;2.0;4.0;Non;Non;Sens direct;;Oui;15;Libre;;;;;;;;;Non;;;;;34172;34172;;;;341724240;341724240;;;;;;;;;;;;;commune;commune;Boulevard Pedro de Luna;Boulevard Pedro de Luna;;;34172_4240;34172_4240;;;;;;;;;;;;;;;;;;LINESTRING Z (770397.2 6277671.9 22.8, 770394.3 6277674.2 22.8)
-TRONROUT0000000240978890;Route à 1 chaussée;BD PEDRO DE LUNA;BD PEDRO DE LUNA;5;Non;0;En service;2010-07-16 14:01:58;2023-08-26 17:45:08;;2009-07-01;;;Photogrammétrie;2.5;Photogrammétrie;1.5;2.0;4.0;Non;Non;Sens direct;;Oui;15;Libre;;;;;;;;;Non;;;;;34172;34172;;;;341724240;341724240;;;;;;;;;;;;;commune;commune;Boulevard Pedro de Luna;Boulevard Pedro de Luna;;;34172_4240;34172_4240;;;;;;;;;;;;;;;;;;LINESTRING Z (770394.3 6277674.2 22.8, 770392 6277676.3 22.8)
-TRONROUT0000000240978890;Route à 1 chaussée;BD PEDRO DE LUNA;BD PEDRO DE LUNA;5;Non;0;En service;2010-07-16 14:01:58;2023-08-26 17:45:08;;2009-07-01;;;Photogrammétrie;2.5;Photogrammétrie;1.5;2.0;4.0;Non;Non;Sens direct;;Oui;15;Libre;;;;;;;;;Non;;;;;34172;34172;;;;341724240;341724240;;;;;;;;;;;;;commune;commune;Boulevard Pedro de Luna;Boulevard Pedro de Luna;;;34172_4240;34172_4240;;;;;;;;;;;;;;;;;;LINESTRING Z (770392 6277676.3 22.8, 770388.2 6277679.9 22.9)
-TRONROUT0000000044845895;Route à 1 chaussée;R VINCENT EUVRARD;R VINCENT EUVRARD;5;Non;0;En service;2006-12-12 11:20:44;2023-08-26 17:45:08;;2009-07-01;;;Photogrammétrie;2.5;Photogrammétrie;1.5;1.0;3.0;Non;Non;Sens direct;;Oui;15;Libre;;;;;;;;;Non;;;;;34172;34172;;;;341722579;341722579;;;;;;;;;;;;;commune;commune;Rue Vincent Euvrard;Rue Vincent Euvrard;;;34172_2579;34172_2579;;;;;;;;;;;;;;;;;;LINESTRING Z (770397.2 6277671.9 22.8, 770396.9 6277676.3 23, 770396.8 6277680.8 22.8)
-TRONROUT0000000240978435;Route à 1 chaussée;R VINCENT EUVRARD;R VINCENT EUVRARD;5;Non;0;En service;2010-07-16 14:01:58;2023-08-26 17:45:08;;2009-07-01;;;Photogrammétrie;2.5;Photogrammétrie;1.5;1.0;3.0;Non;Non;Sens direct;;Oui;15;Libre;;;;;;;;;Non;;;;;34172;34172;;;;341722579;341722579;;;;;;;;;;;;;commune;commune;Rue Vincent Euvrard;Rue Vincent Euvrard;;;34172_2579;34172_2579;;;;;;;;;;;;;;;;;;LINESTRING Z (770396.8 6277680.8 22.8, 770392.8 6277680.6 22.9, 770388.2 6277679.9 22.9)
-TRONROUT0000000240978812;Route à 1 chaussée;BD PEDRO DE LUNA;BD PEDRO DE LUNA;5;Non;0;En service;2010-07-16 14:01:58;2023-08-26 17:45:08;;2009-07-01;;;Photogrammétrie;2.5;Photogrammétrie;1.5;2.0;4.0;Non;Non;Sens inverse;;Oui;15;Libre;;;;;;;;;Non;283;284;297;296;34172;34172;;;;341724240;341724240;;;;;;;;;;;;;commune;commune;Boulevard Pedro de Luna;Boulevard Pedro de Luna;;;34172_4240;34172_4240;;;;;;;;;;;;;;;;;;LINESTRING Z (770379.9 6277682.4 22.5, 770384.7 6277681.3 22.9)
-TRONROUT0000000240978812;Route à 1 chaussée;BD PEDRO DE LUNA;BD PEDRO DE LUNA;5;Non;0;En service;2010-07-16 14:01:58;2023-08-26 17:45:08;;2009-07-01;;;Photogrammétrie;2.5;Photogrammétrie;1.5;2.0;4.0;Non;Non;Sens inverse;;Oui;15;Libre;;;;;;;;;Non;283;284;297;296;34172;34172;;;;341724240;341724240;;;;;;;;;;;;;commune;commune;Boulevard Pedro de Luna;Boulevard Pedro de Luna;;;34172_4240;34172_4240;;;;;;;;;;;;;;;;;;LINESTRING Z (770384.7 6277681.3 22.9, 770388.1 6277680 22.9, 770388.2 6277679.9 22.9)
-TRONROUT0000000109698644;Route à 1 chaussée;BD PEDRO DE LUNA;BD PEDRO DE LUNA;5;Non;0;En service;2007-12-13 12:17:21;2023-08-26 17:45:08;;;;;Photogrammétrie;2.5;Photogrammétrie;1.5;2.0;4.0;Non;Non;Double sens;;Oui;15;Libre;;;;;;;;;Non;269;268;283;284;34172;34172;;;;341724240;341724240;;;;;;;;;;;;;commune;commune;Boulevard Pedro de Luna;Boulevard Pedro de Luna;;;34172_4240;34172_4240;;;;;;;;;;;;;;;;;;LINESTRING Z (770367.7 6277691.9 22.7, 770379.9 6277682.4 22.5)
-TRONROUT0000000201979442;Route à 1 chaussée;BD PEDRO DE LUNA;BD PEDRO DE LUNA;5;Non;0;En service;2008-07-31 11:14:36;2023-08-26 17:45:08;;;;;Levé GPS;2.5;Levé GPS;1.5;2.0;4.0;Non;Non;Double sens;;Oui;15;Libre;;;;;;;;;Non;243;242;269;268;34172;34172;;;;341724240;341724240;;;;;;;;;;;;;commune;commune;Boulevard Pedro de Luna;Boulevard Pedro de Luna;;;34172_4240;34172_4240;;;;;;;;;;;;;;;;;;LINESTRING Z (770343.3 6277697.3 22.3, 770346.6 6277697.1 22.2)
-TRONROUT0000000201979442;Route à 1 chaussée;BD PEDRO DE LUNA;BD PEDRO DE LUNA;5;Non;0;En service;2008-07-31 11:14:36;2023-08-26 17:45:08;;;;;Levé GPS;2.5;Levé GPS;1.5;2.0;4.0;Non;Non;Double sens;;Oui;15;Libre;;;;;;;;;Non;243;242;269;268;34172;34172;;;;341724240;341724240;;;;;;;;;;;;;commune;commune;Boulevard Pedro de Luna;Boulevard Pedro de Luna;;;34172_4240;34172_4240;;;;;;;;;;;;;;;;;;LINESTRING Z (770346.6 6277697.1 22.2, 770354.1 6277696.4 22)
-TRONROUT0000000201979442;Route à 1 chaussée;BD PEDRO DE LUNA;BD PEDRO DE LUNA;5;Non;0;En service;2008-07-31 11:14:36;2023-08-26 17:45:08;;;;;Levé GPS;2.5;Levé GPS;1.5;2.0;4.0;Non;Non;Double sens;;Oui;15;Libre;;;;;;;;;Non;243;242;269;268;34172;34172;;;;341724240;341724240;;;;;;;;;;;;;commune;commune;Boulevard Pedro de Luna;Boulevard Pedro de Luna;;;34172_4240;34172_4240;;;;;;;;;;;;;;;;;;LINESTRING Z (770354.1 6277696.4 22, 770358.4 6277695.9 22.7)
-TRONROUT0000000201979442;Route à 1 chaussée;BD PEDRO DE LUNA;BD PEDRO DE LUNA;5;Non;0;En service;2008-07-31 11:14:36;2023-08-26 17:45:08;;;;;Levé GPS;2.5;Levé GPS;1.5;2.0;4.0;Non;Non;Double sens;;Oui;15;Libre;;;;;;;;;Non;243;242;269;268;34172;34172;;;;341724240;341724240;;;;;;;;;;;;;commune;commune;Boulevard Pedro de Luna;Boulevard Pedro de Luna;;;34172_4240;34172_4240;;;;;;;;;;;;;;;;;;LINESTRING Z (770358.4 6277695.9 22.7, 770361.1 6277695.5 22.7)
-TRONROUT0000000201979442;Route à 1 chaussée;BD PEDRO DE LUNA;BD PEDRO DE LUNA;5;Non;0;En service;2008-07-31 11:14:36;2023-08-26 17:45:08;;;;;Levé GPS;2.5;Levé GPS;1.5;2.0;4.0;Non;Non;Double sens;;Oui;15;Libre;;;;;;;;;Non;243;242;269;268;34172;34172;;;;341724240;341724240;;;;;;;;;;;;;commune;commune;Boulevard Pedro de Luna;Boulevard Pedro de Luna;;;34172_4240;34172_4240;;;;;;;;;;;;;;;;;;LINESTRING Z (770361.1 6277695.5 22.7, 770365.3 6277693.2 22.7)
-TRONROUT0000000201979442;Route à 1 chaussée;BD PEDRO DE LUNA;BD PEDRO DE LUNA;5;Non;0;En service;2008-07-31 11:14:36;2023-08-26 17:45:08;;;;;Levé GPS;2.5;Levé GPS;1.5;2.0;4.0;Non;Non;Double sens;;Oui;15;Libre;;;;;;;;;Non;243;242;269;268;34172;34172;;;;341724240;341724240;;;;;;;;;;;;;commune;commune;Boulevard Pedro de Luna;Boulevard Pedro de Luna;;;34172_4240;34172_4240;;;;;;;;;;;;;;;;;;LINESTRING Z (770365.3 6277693.2 22.7, 770367.7 6277691.9 22.7)
-TRONROUT0000000240978935;Route à 1 chaussée;R VINCENT EUVRARD;R VINCENT EUVRARD;5;Non;0;En service;2010-07-16 14:01:58;2023-08-26 17:45:08;;2009-07-01;;;Photogrammétrie;2.5;Photogrammétrie;1.5;2.0;4.0;Non;Non;Double sens;;Oui;20;Libre;;;;;;;;;Non;1;2;45;44;34172;34172;;;;341722579;341722579;;;;;;;;;;;;;commune;commune;Rue Vincent Euvrard;Rue Vincent Euvrard;;;34172_2579;34172_2579;;;;;;;;;;;;;;;;;;LINESTRING Z (770396.8 6277680.8 22.8, 770425 6277712.5 22.6, 770426.4 6277714.1 22.6)
-TRONROUT0000000044845871;Route à 1 chaussée;R SAINT-JACQUES;R SAINT-JACQUES;5;Non;0;En service;2006-12-12 11:20:44;2023-08-26 17:45:08;;2009-07-01;;;Photogrammétrie;2.5;Photogrammétrie;1.5;2.0;4.0;Non;Non;Double sens;;Oui;20;Libre;;;;;;;;;Non;94;93;2;1;34172;34172;;;;341725126;341725126;;;;;;;;;;;;;commune;commune;Rue Saint Jacques;Rue Saint Jacques;;;34172_5126;34172_5126;;;;;;;;;;;;;;;;;;LINESTRING Z (770384.3 6277810.1 24.3, 770399.8 6277797.1 23.7, 770442.3 6277758.6 23.4, 770453.9 6277748.4 23.2, 770455.2 6277747.4 23)
-TRONROUT0000000201979445;Route à 1 chaussée;BD PEDRO DE LUNA;BD PEDRO DE LUNA;5;Non;0;En service;2008-07-31 11:14:36;2023-08-26 17:45:08;;;;;Levé GPS;2.5;Levé GPS;1.5;2.0;4.0;Non;Non;Double sens;;Oui;20;Libre;;;;;;;;;Non;135;136;243;242;34172;34172;;;;341724240;341724240;;;;;;;;;;;;;commune;commune;Boulevard Pedro de Luna;Boulevard Pedro de Luna;;;34172_4240;34172_4240;;;;;;;;;;;;;;;;;;LINESTRING Z (770243 6277721.5 22.4, 770247 6277717.6 22.4)
-TRONROUT0000000201979445;Route à 1 chaussée;BD PEDRO DE LUNA;BD PEDRO DE LUNA;5;Non;0;En service;2008-07-31 11:14:36;2023-08-26 17:45:08;;;;;Levé GPS;2.5;Levé GPS;1.5;2.0;4.0;Non;Non;Double sens;;Oui;20;Libre;;;;;;;;;Non;135;136;243;242;34172;34172;;;;341724240;341724240;;;;;;;;;;;;;commune;commune;Boulevard Pedro de Luna;Boulevard Pedro de Luna;;;34172_4240;34172_4240;;;;;;;;;;;;;;;;;;LINESTRING Z (770247 6277717.6 22.4, 770259 6277707.7 22.1)
-TRONROUT0000000201979445;Route à 1 chaussée;BD PEDRO DE LUNA;BD PEDRO DE LUNA;5;Non;0;En service;2008-07-31 11:14:36;2023-08-26 17:45:08;;;;;Levé GPS;2.5;Levé GPS;1.5;2.0;4.0;Non;Non;Double sens;;Oui;20;Libre;;;;;;;;;Non;135;136;243;242;34172;34172;;;;341724240;341724240;;;;;;;;;;;;;commune;commune;Boulevard Pedro de Luna;Boulevard Pedro de Luna;;;34172_4240;34172_4240;;;;;;;;;;;;;;;;;;LINESTRING Z (770259 6277707.7 22.1, 770272.5 6277701.8 22)
-TRONROUT0000000201979445;Route à 1 chaussée;BD PEDRO DE LUNA;BD PEDRO DE LUNA;5;Non;0;En service;2008-07-31 11:14:36;2023-08-26 17:45:08;;;;;Levé GPS;2.5;Levé GPS;1.5;2.0;4.0;Non;Non;Double sens;;Oui;20;Libre;;;;;;;;;Non;135;136;243;242;34172;34172;;;;341724240;341724240;;;;;;;;;;;;;commune;commune;Boulevard Pedro de Luna;Boulevard Pedro de Luna;;;34172_4240;34172_4240;;;;;;;;;;;;;;;;;;LINESTRING Z (770272.5 6277701.8 22, 770287.9 6277699.7 22)
-TRONROUT0000000201979445;Route à 1 chaussée;BD PEDRO DE LUNA;BD PEDRO DE LUNA;5;Non;0;En service;2008-07-31 11:14:36;2023-08-26 17:45:08;;;;;Levé GPS;2.5;Levé GPS;1.5;2.0;4.0;Non;Non;Double sens;;Oui;20;Libre;;;;;;;;;Non;135;136;243;242;34172;34172;;;;341724240;341724240;;;;;;;;;;;;;commune;commune;Boulevard Pedro de Luna;Boulevard Pedro de Luna;;;34172_4240;34172_4240;;;;;;;;;;;;;;;;;;LINESTRING Z (770287.9 6277699.7 22, 770304.6 6277699 21.9)
-TRONROUT0000000201979445;Route à 1 chaussée;BD PEDRO DE LUNA;BD PEDRO DE LUNA;5;Non;0;En service;2008-07-31 11:14:36;2023-08-26 17:45:08;;;;;Levé GPS;2.5;Levé GPS;1.5;2.0;4.0;Non;Non;Double sens;;Oui;20;Libre;;;;;;;;;Non;135;136;243;242;34172;34172;;;;341724240;341724240;;;;;;;;;;;;;commune;commune;Boulevard Pedro de Luna;Boulevard Pedro de Luna;;;34172_4240;34172_4240;;;;;;;;;;;;;;;;;;LINESTRING Z (770304.6 6277699 21.9, 770330.3 6277697.9 22.3)
-TRONROUT0000000201979445;Route à 1 chaussée;BD PEDRO DE LUNA;BD PEDRO DE LUNA;5;Non;0;En service;2008-07-31 11:14:36;2023-08-26 17:45:08;;;;;Levé GPS;2.5;Levé GPS;1.5;2.0;4.0;Non;Non;Double sens;;Oui;20;Libre;;;;;;;;;Non;135;136;243;242;34172;34172;;;;341724240;341724240;;;;;;;;;;;;;commune;commune;Boulevard Pedro de Luna;Boulevard Pedro de Luna;;;34172_4240;34172_4240;;;;;;;;;;;;;;;;;;LINESTRING Z (770330.3 6277697.9 22.3, 770338.6 6277697.6 22.5)
-TRONROUT0000000201979445;Route à 1 chaussée;BD PEDRO DE LUNA;BD PEDRO DE LUNA;5;Non;0;En service;2008-07-31 11:14:36;2023-08-26 17:45:08;;;;;Levé GPS;2.5;Levé GPS;1.5;2.0;4.0;Non;Non;Double sens;;Oui;20;Libre;;;;;;;;;Non;135;136;243;242;34172;34172;;;;341724240;341724240;;;;;;;;;;;;;commune;commune;Boulevard Pedro de Luna;Boulevard Pedro de Luna;;;34172_4240;34172_4240;;;;;;;;;;;;;;;;;;LINESTRING Z (770338.6 6277697.6 22.5, 770343.3 6277697.3 22.3)
-TRONROUT0000000201979444;Route à 1 chaussée;BD PEDRO DE LUNA;BD PEDRO DE LUNA;5;Non;0;En service;2008-07-31 11:14:36;2023-08-26 17:45:08;;;;;Levé GPS;2.5;Levé GPS;1.5;2.0;4.0;Non;Non;Double sens;;Oui;15;Libre;;;;;;;;;Non;123;122;135;136;34172;34172;;;;341724240;341724240;;;;;;;;;;;;;commune;commune;Boulevard Pedro de Luna;Boulevard Pedro de Luna;;;34172_4240;34172_4240;;;;;;;;;;;;;;;;;;LINESTRING Z (770233.1 6277731 22.4, 770243 6277721.5 22.4)
-TRONROUT0000000201979447;Route à 1 chaussée;BD PEDRO DE LUNA;BD PEDRO DE LUNA;5;Non;0;En service;2008-07-31 11:14:36;2023-08-26 17:45:08;;;;;Levé GPS;2.5;Levé GPS;1.5;2.0;4.0;Non;Non;Double sens;;Oui;15;Libre;;;;;;;;;Non;99;100;123;122;34172;34172;;;;341724240;341724240;;;;;;;;;;;;;commune;commune;Boulevard Pedro de Luna;Boulevard Pedro de Luna;;;34172_4240;34172_4240;;;;;;;;;;;;;;;;;;LINESTRING Z (770216 6277746.4 22.1, 770222.5 6277740.9 22.1)
-TRONROUT0000000201979447;Route à 1 chaussée;BD PEDRO DE LUNA;BD PEDRO DE LUNA;5;Non;0;En service;2008-07-31 11:14:36;2023-08-26 17:45:08;;;;;Levé GPS;2.5;Levé GPS;1.5;2.0;4.0;Non;Non;Double sens;;Oui;15;Libre;;;;;;;;;Non;99;100;123;122;34172;34172;;;;341724240;341724240;;;;;;;;;;;;;commune;commune;Boulevard Pedro de Luna;Boulevard Pedro de Luna;;;34172_4240;34172_4240;;;;;;;;;;;;;;;;;;LINESTRING Z (770222.5 6277740.9 22.1, 770228.9 6277735 22.4)
-TRONROUT0000000201979447;Route à 1 chaussée;BD PEDRO DE LUNA;BD PEDRO DE LUNA;5;Non;0;En service;2008-07-31 11:14:36;2023-08-26 17:45:08;;;;;Levé GPS;2.5;Levé GPS;1.5;2.0;4.0;Non;Non;Double sens;;Oui;15;Libre;;;;;;;;;Non;99;100;123;122;34172;34172;;;;341724240;341724240;;;;;;;;;;;;;commune;commune;Boulevard Pedro de Luna;Boulevard Pedro de Luna;;;34172_4240;34172_4240;;;;;;;;;;;;;;;;;;LINESTRING Z (770228.9 6277735 22.4, 770233.1 6277731 22.4)
-TRONROUT0000000240978930;Route à 1 chaussée;BD PEDRO DE LUNA;BD PEDRO DE LUNA;5;Non;0;En service;2010-07-16 14:01:58;2023-08-26 17:45:08;;2009-07-01;;;Photogrammétrie;2.5;Photogrammétrie;1.5;2.0;4.0;Non;Non;Double sens;;Oui;15;Libre;;;;;;;;;Non;63;64;99;100;34172;34172;;;;341724240;341724240;;;;;;;;;;;;;commune;commune;Boulevard Pedro de Luna;Boulevard Pedro de Luna;;;34172_4240;34172_4240;;;;;;;;;;;;;;;;;;LINESTRING Z (770187.9 6277771.8 23.1, 770205.4 6277756.6 23.1)
-TRONROUT0000000240978930;Route à 1 chaussée;BD PEDRO DE LUNA;BD PEDRO DE LUNA;5;Non;0;En service;2010-07-16 14:01:58;2023-08-26 17:45:08;;2009-07-01;;;Photogrammétrie;2.5;Photogrammétrie;1.5;2.0;4.0;Non;Non;Double sens;;Oui;15;Libre;;;;;;;;;Non;63;64;99;100;34172;34172;;;;341724240;341724240;;;;;;;;;;;;;commune;commune;Boulevard Pedro de Luna;Boulevard Pedro de Luna;;;34172_4240;34172_4240;;;;;;;;;;;;;;;;;;LINESTRING Z (770205.4 6277756.6 23.1, 770216 6277746.4 22.1)
-TRONROUT0000000044845846;Route à 1 chaussée;R EMILE CHARTIER DIT ALAIN;R EMILE CHARTIER DIT ALAIN;5;Non;0;En service;2006-12-12 11:20:44;2023-08-26 17:45:08;;;;;BDTopo;2.5;BDTopo;1.5;2.0;4.0;Non;Non;Double sens;;Oui;20;Libre;;;;;;;;;Non;1;2;103;104;34172;34172;;;;341720134;341720134;;;;;;;;;;;;;commune;commune;Rue Emile Chartier dit Alain;Rue Emile Chartier dit Alain;;;34172_0134;34172_0134;;;;;;;;;;;;;;;;;;LINESTRING Z (770243 6277721.5 23.5, 770276.5 6277759.2 20.4, 770315.6 6277804 16.3)
-TRONROUT0000000240978265;Route à 1 chaussée;BD PEDRO DE LUNA;BD PEDRO DE LUNA;5;Non;0;En service;2010-07-16 14:01:58;2023-08-26 17:45:08;;2009-07-01;;;Photogrammétrie;2.5;Photogrammétrie;1.5;1.0;3.0;Non;Non;Sens direct;;Oui;20;Libre;;;;;;;;;Non;;2;;62;34172;34172;;;;341724240;341724240;;;;;;;;;;;;;commune;commune;Boulevard Pedro de Luna;Boulevard Pedro de Luna;;;34172_4240;34172_4240;;;;;;;;;;;;;;;;;;LINESTRING Z (770139.6 6277792.9 24.5, 770145.1 6277791.3 24.1)
-TRONROUT0000000240978265;Route à 1 chaussée;BD PEDRO DE LUNA;BD PEDRO DE LUNA;5;Non;0;En service;2010-07-16 14:01:58;2023-08-26 17:45:08;;2009-07-01;;;Photogrammétrie;2.5;Photogrammétrie;1.5;1.0;3.0;Non;Non;Sens direct;;Oui;20;Libre;;;;;;;;;Non;;2;;62;34172;34172;;;;341724240;341724240;;;;;;;;;;;;;commune;commune;Boulevard Pedro de Luna;Boulevard Pedro de Luna;;;34172_4240;34172_4240;;;;;;;;;;;;;;;;;;LINESTRING Z (770145.1 6277791.3 24.1, 770153.7 6277786.7 23.5)
-TRONROUT0000000240978265;Route à 1 chaussée;BD PEDRO DE LUNA;BD PEDRO DE LUNA;5;Non;0;En service;2010-07-16 14:01:58;2023-08-26 17:45:08;;2009-07-01;;;Photogrammétrie;2.5;Photogrammétrie;1.5;1.0;3.0;Non;Non;Sens direct;;Oui;20;Libre;;;;;;;;;Non;;2;;62;34172;34172;;;;341724240;341724240;;;;;;;;;;;;;commune;commune;Boulevard Pedro de Luna;Boulevard Pedro de Luna;;;34172_4240;34172_4240;;;;;;;;;;;;;;;;;;LINESTRING Z (770153.7 6277786.7 23.5, 770166.2 6277780.4 23.5)
-TRONROUT0000000240978265;Route à 1 chaussée;BD PEDRO DE LUNA;BD PEDRO DE LUNA;5;Non;0;En service;2010-07-16 14:01:58;2023-08-26 17:45:08;;2009-07-01;;;Photogrammétrie;2.5;Photogrammétrie;1.5;1.0;3.0;Non;Non;Sens direct;;Oui;20;Libre;;;;;;;;;Non;;2;;62;34172;34172;;;;341724240;341724240;;;;;;;;;;;;;commune;commune;Boulevard Pedro de Luna;Boulevard Pedro de Luna;;;34172_4240;34172_4240;;;;;;;;;;;;;;;;;;LINESTRING Z (770166.2 6277780.4 23.5, 770168.2 6277779.5 23.5)
-TRONROUT0000000240978265;Route à 1 chaussée;BD PEDRO DE LUNA;BD PEDRO DE LUNA;5;Non;0;En service;2010-07-16 14:01:58;2023-08-26 17:45:08;;2009-07-01;;;Photogrammétrie;2.5;Photogrammétrie;1.5;1.0;3.0;Non;Non;Sens direct;;Oui;20;Libre;;;;;;;;;Non;;2;;62;34172;34172;;;;341724240;341724240;;;;;;;;;;;;;commune;commune;Boulevard Pedro de Luna;Boulevard Pedro de Luna;;;34172_4240;34172_4240;;;;;;;;;;;;;;;;;;LINESTRING Z (770168.2 6277779.5 23.5, 770174 6277776.9 23.5)
-TRONROUT0000000240978265;Route à 1 chaussée;BD PEDRO DE LUNA;BD PEDRO DE LUNA;5;Non;0;En service;2010-07-16 14:01:58;2023-08-26 17:45:08;;2009-07-01;;;Photogrammétrie;2.5;Photogrammétrie;1.5;1.0;3.0;Non;Non;Sens direct;;Oui;20;Libre;;;;;;;;;Non;;2;;62;34172;34172;;;;341724240;341724240;;;;;;;;;;;;;commune;commune;Boulevard Pedro de Luna;Boulevard Pedro de Luna;;;34172_4240;34172_4240;;;;;;;;;;;;;;;;;;LINESTRING Z (770174 6277776.9 23.5, 770187.9 6277771.8 23.1)
-TRONROUT0000000201979451;Route à 1 chaussée;BD PEDRO DE LUNA;BD PEDRO DE LUNA;5;Non;0;En service;2008-07-31 11:14:36;2023-08-26 17:45:08;;2009-07-01;;;Photogrammétrie;2.5;Photogrammétrie;1.5;2.0;4.0;Non;Non;Sens direct;;Oui;5;Libre;;;;;;;;;Non;;61;;1;34172;34172;;;;341724240;341724240;;;;;;;;;;;;;commune;commune;Boulevard Pedro de Luna;Boulevard Pedro de Luna;;;34172_4240;34172_4240;;;;;;;;;;;;;;;;;;LINESTRING Z (770187.9 6277771.8 23.1, 770187.1 6277772.4 23.1, 770180.1 6277777.8 23.2, 770171.6 6277783.7 23.4, 770171.4 6277783.9 23.4, 770156.3 6277792.2 23.4, 770146.1 6277798.5 23.5, 770140.1 6277800.9 23.2, 770135.2 6277802.7 24.7)
-TRONROUT0000000240978464;Route à 1 chaussée;;;5;Non;0;En service;2010-07-16 14:01:58;2023-08-26 17:45:08;;2009-07-01;;;Photogrammétrie;2.5;Photogrammétrie;1.5;2.0;5.0;Non;Non;Double sens;;Oui;20;Libre;;;;;;;;;Non;;;;;34172;34172;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;LINESTRING Z (770387.4 6277814.2 24.7, 770384.3 6277810.1 24.3)
-TRONROUT0000000115739992;Route à 1 chaussée;PL ROMAIN ROLLAND;PL ROMAIN ROLLAND;5;Non;0;En service;2008-02-08 11:05:31;2023-08-26 17:45:08;;;;;Photogrammétrie;2.5;Photogrammétrie;1.5;2.0;7.0;Non;Non;Double sens;;Oui;20;Libre;;;;;;;;;Non;;;;;34172;34172;;;;341724933;341724933;;;;;;;;;;;;;commune;commune;Place Romain Rolland;Place Romain Rolland;;;34172_4933;34172_4933;;;;;;;;;;;;;;;;;;LINESTRING Z (770387.4 6277814.2 24.7, 770396.3 6277825.7 24.8)
-TRONROUT0000000044845899;Route à 1 chaussée;R EMILE CHARTIER DIT ALAIN;R EMILE CHARTIER DIT ALAIN;5;Non;0;En service;2006-12-12 11:20:44;2023-08-26 17:45:08;;;;;Photogrammétrie;2.5;Photogrammétrie;1.5;2.0;4.0;Non;Non;Double sens;;Oui;20;Libre;;;;;;;;;Non;103;104;159;158;34172;34172;;;;341720134;341720134;;;;;;;;;;;;;commune;commune;Rue Emile Chartier dit Alain;Rue Emile Chartier dit Alain;;;34172_0134;34172_0134;;;;;;;;;;;;;;;;;;LINESTRING Z (770315.6 6277804 24.6, 770348.4 6277840.6 25.3)
-TRONROUT0000000044845821;Route à 1 chaussée;R SAINT-JACQUES;R SAINT-JACQUES;5;Non;0;En service;2006-12-12 11:20:44;2023-08-26 17:45:08;;2009-07-01;;;Photogrammétrie;2.5;Photogrammétrie;1.5;2.0;4.0;Non;Non;Double sens;;Oui;20;Libre;;;;;;;;;Non;140;141;94;93;34172;34172;;;;341725126;341725126;;;;;;;;;;;;;commune;commune;Rue Saint Jacques;Rue Saint Jacques;;;34172_5126;34172_5126;;;;;;;;;;;;;;;;;;LINESTRING Z (770348.4 6277840.6 25.3, 770375.9 6277817 24.6, 770384.3 6277810.1 24.3)
-TRONROUT0000000044845912;Route à 1 chaussée;PL ROMAIN ROLLAND;PL ROMAIN ROLLAND;5;Non;0;En service;2006-12-12 11:20:44;2023-08-26 17:45:08;;;;;Photogrammétrie;2.5;Photogrammétrie;1.5;2.0;7.0;Non;Non;Double sens;;Oui;15;Libre;;;;;;;;;Non;;3;;1;34172;34172;;;;341724933;341724933;;;;;;;;;;;;;commune;commune;Place Romain Rolland;Place Romain Rolland;;;34172_4933;34172_4933;;;;;;;;;;;;;;;;;;LINESTRING Z (770396.3 6277825.7 24.8, 770407.7 6277840.4 24.9)
-TRONROUT0000000115739993;Route à 1 chaussée;PL ROMAIN ROLLAND;PL ROMAIN ROLLAND;5;Non;0;En service;2008-02-08 11:05:31;2023-08-26 17:45:08;;;;;Photogrammétrie;2.5;Photogrammétrie;1.5;2.0;7.0;Non;Non;Double sens;;Oui;20;Libre;;;;;;;;;Non;;;;;34172;34172;;;;341724933;341724933;;;;;;;;;;;;;commune;commune;Place Romain Rolland;Place Romain Rolland;;;34172_4933;34172_4933;;;;;;;;;;;;;;;;;;LINESTRING Z (770396.3 6277825.7 24.8, 770361 6277854.7 25.4)
-TRONROUT0000000240977397;Route à 1 chaussée;R EMILE CHARTIER DIT ALAIN;R EMILE CHARTIER DIT ALAIN;5;Non;0;En service;2010-07-16 14:01:58;2023-08-26 17:45:08;;;;;Photogrammétrie;2.5;Photogrammétrie;1.5;2.0;4.0;Non;Non;Double sens;;Oui;20;Libre;;;;;;;;;Non;;;;;34172;34172;;;;341720134;341720134;;;;;;;;;;;;;commune;commune;Rue Emile Chartier dit Alain;Rue Emile Chartier dit Alain;;;34172_0134;34172_0134;;;;;;;;;;;;;;;;;;LINESTRING Z (770348.4 6277840.6 25.3, 770352.4 6277845 25.4)
-TRONROUT0000000115739991;Route à 1 chaussée;PL ROMAIN ROLLAND;PL ROMAIN ROLLAND;5;Non;0;En service;2008-02-08 11:05:31;2023-08-26 17:45:08;;;;;Photogrammétrie;2.5;Photogrammétrie;1.5;2.0;7.0;Non;Non;Double sens;;Oui;15;Libre;;;;;;;;;Non;1;;1;;34172;34172;;;;341724933;341724933;;;;;;;;;;;;;commune;commune;Place Romain Rolland;Place Romain Rolland;;;34172_4933;34172_4933;;;;;;;;;;;;;;;;;;LINESTRING Z (770398.6 6277848.6 25, 770407.7 6277840.4 24.9)
-TRONROUT0000000044845822;Route à 1 chaussée;R EMILE CHARTIER DIT ALAIN;R EMILE CHARTIER DIT ALAIN;5;Non;0;En service;2006-12-12 11:20:44;2023-08-26 17:45:08;;;;;BDTopo;2.5;BDTopo;1.5;2.0;4.0;Non;Non;Double sens;;Oui;20;Libre;;;;;;;;;Non;172;171;158;159;34172;34172;;;;341720134;341720134;;;;;;;;;;;;;commune;commune;Rue Emile Chartier dit Alain;Rue Emile Chartier dit Alain;;;34172_0134;34172_0134;;;;;;;;;;;;;;;;;;LINESTRING Z (770361 6277854.7 25.4, 770357.6 6277850.9 25.4, 770352.4 6277845 25.4)
-TRONROUT0000000115739990;Route à 1 chaussée;PL ROMAIN ROLLAND;PL ROMAIN ROLLAND;5;Non;0;En service;2008-02-08 11:05:31;2023-08-26 17:45:08;;;;;Photogrammétrie;2.5;Photogrammétrie;1.5;2.0;7.0;Non;Non;Double sens;;Oui;20;Libre;;;;;;;;;Non;;;;;34172;34172;;;;341724933;341724933;;;;;;;;;;;;;commune;commune;Place Romain Rolland;Place Romain Rolland;;;34172_4933;34172_4933;;;;;;;;;;;;;;;;;;LINESTRING Z (770407.7 6277840.4 24.9, 770408.9 6277842 24.9, 770423.3 6277860 25.1)
-TRONROUT0000000240979105;Route à 1 chaussée;BD PEDRO DE LUNA;BD PEDRO DE LUNA;5;Non;0;En service;2010-07-16 14:01:58;2023-08-26 17:45:08;;2009-07-01;;;Photogrammétrie;2.5;Photogrammétrie;1.5;1.0;3.0;Non;Non;Sens direct;;Oui;5;Libre;;;;;;;;;Non;;;;;34172;34172;;;;341724240;341724240;;;;;;;;;;;;;commune;commune;Boulevard Pedro de Luna;Boulevard Pedro de Luna;;;34172_4240;34172_4240;;;;;;;;;;;;;;;;;;LINESTRING Z (770124.6 6277788.2 25.3, 770131.4 6277791.3 24.1)
-TRONROUT0000000240979105;Route à 1 chaussée;BD PEDRO DE LUNA;BD PEDRO DE LUNA;5;Non;0;En service;2010-07-16 14:01:58;2023-08-26 17:45:08;;2009-07-01;;;Photogrammétrie;2.5;Photogrammétrie;1.5;1.0;3.0;Non;Non;Sens direct;;Oui;5;Libre;;;;;;;;;Non;;;;;34172;34172;;;;341724240;341724240;;;;;;;;;;;;;commune;commune;Boulevard Pedro de Luna;Boulevard Pedro de Luna;;;34172_4240;34172_4240;;;;;;;;;;;;;;;;;;LINESTRING Z (770131.4 6277791.3 24.1, 770136.8 6277792.7 24.1)
-TRONROUT0000000240979105;Route à 1 chaussée;BD PEDRO DE LUNA;BD PEDRO DE LUNA;5;Non;0;En service;2010-07-16 14:01:58;2023-08-26 17:45:08;;2009-07-01;;;Photogrammétrie;2.5;Photogrammétrie;1.5;1.0;3.0;Non;Non;Sens direct;;Oui;5;Libre;;;;;;;;;Non;;;;;34172;34172;;;;341724240;341724240;;;;;;;;;;;;;commune;commune;Boulevard Pedro de Luna;Boulevard Pedro de Luna;;;34172_4240;34172_4240;;;;;;;;;;;;;;;;;;LINESTRING Z (770136.8 6277792.7 24.1, 770139.6 6277792.9 24.5)
-TRONROUT0000000201979450;Route à 1 chaussée;AV DE VILLENEUVE ANGOULEME;AV DE VILLENEUVE ANGOULEME;4;Non;0;En service;2008-07-31 11:14:36;2023-08-26 17:45:08;;;;;Levé GPS;2.5;Levé GPS;1.5;1.0;3.0;Non;Non;Sens direct;;Oui;25;Libre;;;;;;;;;Non;618;619;600;601;34172;34172;;;;341725850;341725850;;;;;;;;;;;;;commune;commune;Avenue de Villeneuve-Angoulème;Avenue de Villeneuve-Angoulème;;;34172_5850;34172_5850;;;;;;;;;;;;;;;;;;LINESTRING Z (770124.6 6277788.2 25.3, 770131 6277797.1 25.5)
-TRONROUT0000000201979450;Route à 1 chaussée;AV DE VILLENEUVE ANGOULEME;AV DE VILLENEUVE ANGOULEME;4;Non;0;En service;2008-07-31 11:14:36;2023-08-26 17:45:08;;;;;Levé GPS;2.5;Levé GPS;1.5;1.0;3.0;Non;Non;Sens direct;;Oui;25;Libre;;;;;;;;;Non;618;619;600;601;34172;34172;;;;341725850;341725850;;;;;;;;;;;;;commune;commune;Avenue de Villeneuve-Angoulème;Avenue de Villeneuve-Angoulème;;;34172_5850;34172_5850;;;;;;;;;;;;;;;;;;LINESTRING Z (770131 6277797.1 25.5, 770135.2 6277802.7 24.7)
-TRONROUT0000000240979102;Route à 1 chaussée;BD PEDRO DE LUNA;BD PEDRO DE LUNA;5;Non;0;En service;2010-07-16 14:01:58;2023-08-26 17:45:08;;2009-07-01;;;Photogrammétrie;2.5;Photogrammétrie;1.5;1.0;3.0;Non;Non;Sens direct;;Oui;5;Libre;;;;;;;;;Non;;;;;34172;34172;;;;341724240;341724240;;;;;;;;;;;;;commune;commune;Boulevard Pedro de Luna;Boulevard Pedro de Luna;;;34172_4240;34172_4240;;;;;;;;;;;;;;;;;;LINESTRING Z (770135.2 6277802.7 24.7, 770139.6 6277792.9 24.5)
-TRONROUT0000000201979448;Route à 1 chaussée;AV DE VILLENEUVE ANGOULEME;AV DE VILLENEUVE ANGOULEME;4;Non;0;En service;2008-07-31 11:14:36;2023-08-26 17:45:08;;2009-07-01;;;Photogrammétrie;2.5;Photogrammétrie;1.5;1.0;3.0;Non;Non;Sens direct;;Oui;25;Libre;;;;;;;;;Non;;601;;553;34172;34172;;;;341725850;341725850;;;;;;;;;;;;;commune;commune;Avenue de Villeneuve-Angoulème;Avenue de Villeneuve-Angoulème;;;34172_5850;34172_5850;;;;;;;;;;;;;;;;;;LINESTRING Z (770135.2 6277802.7 24.7, 770142 6277809.5 24.9)
-TRONROUT0000000201979448;Route à 1 chaussée;AV DE VILLENEUVE ANGOULEME;AV DE VILLENEUVE ANGOULEME;4;Non;0;En service;2008-07-31 11:14:36;2023-08-26 17:45:08;;2009-07-01;;;Photogrammétrie;2.5;Photogrammétrie;1.5;1.0;3.0;Non;Non;Sens direct;;Oui;25;Libre;;;;;;;;;Non;;601;;553;34172;34172;;;;341725850;341725850;;;;;;;;;;;;;commune;commune;Avenue de Villeneuve-Angoulème;Avenue de Villeneuve-Angoulème;;;34172_5850;34172_5850;;;;;;;;;;;;;;;;;;LINESTRING Z (770142 6277809.5 24.9, 770154 6277828.2 24.6)
-TRONROUT0000000201979448;Route à 1 chaussée;AV DE VILLENEUVE ANGOULEME;AV DE VILLENEUVE ANGOULEME;4;Non;0;En service;2008-07-31 11:14:36;2023-08-26 17:45:08;;2009-07-01;;;Photogrammétrie;2.5;Photogrammétrie;1.5;1.0;3.0;Non;Non;Sens direct;;Oui;25;Libre;;;;;;;;;Non;;601;;553;34172;34172;;;;341725850;341725850;;;;;;;;;;;;;commune;commune;Avenue de Villeneuve-Angoulème;Avenue de Villeneuve-Angoulème;;;34172_5850;34172_5850;;;;;;;;;;;;;;;;;;LINESTRING Z (770154 6277828.2 24.6, 770157.4 6277834.7 24.6)
-TRONROUT0000000201979448;Route à 1 chaussée;AV DE VILLENEUVE ANGOULEME;AV DE VILLENEUVE ANGOULEME;4;Non;0;En service;2008-07-31 11:14:36;2023-08-26 17:45:08;;2009-07-01;;;Photogrammétrie;2.5;Photogrammétrie;1.5;1.0;3.0;Non;Non;Sens direct;;Oui;25;Libre;;;;;;;;;Non;;601;;553;34172;34172;;;;341725850;341725850;;;;;;;;;;;;;commune;commune;Avenue de Villeneuve-Angoulème;Avenue de Villeneuve-Angoulème;;;34172_5850;34172_5850;;;;;;;;;;;;;;;;;;LINESTRING Z (770157.4 6277834.7 24.6, 770158.5 6277837.4 25.2)
-TRONROUT0000000201979448;Route à 1 chaussée;AV DE VILLENEUVE ANGOULEME;AV DE VILLENEUVE ANGOULEME;4;Non;0;En service;2008-07-31 11:14:36;2023-08-26 17:45:08;;2009-07-01;;;Photogrammétrie;2.5;Photogrammétrie;1.5;1.0;3.0;Non;Non;Sens direct;;Oui;25;Libre;;;;;;;;;Non;;601;;553;34172;34172;;;;341725850;341725850;;;;;;;;;;;;;commune;commune;Avenue de Villeneuve-Angoulème;Avenue de Villeneuve-Angoulème;;;34172_5850;34172_5850;;;;;;;;;;;;;;;;;;LINESTRING Z (770158.5 6277837.4 25.2, 770159.4 6277843.5 25.2)
-TRONROUT0000000044845854;Route à 1 chaussée;PL DU CARDINAL VERDIER;PL DU CARDINAL VERDIER;5;Non;0;En service;2006-12-12 11:20:44;2023-08-26 17:45:08;;;;;Photogrammétrie;2.5;Photogrammétrie;1.5;2.0;5.0;Non;Non;Double sens;;Oui;20;Libre;;;;;;;;;Non;82;;82;;34172;34172;;;;341721028;341721028;;;;;;;;;;;;;non commune;non commune;Place Cardinal Verdier;Place Cardinal Verdier;;;34172_1028;34172_1028;;;;;;;;;;;;;;;;;;LINESTRING Z (770194.3 6277798.2 25.8, 770247 6277860.6 25.3, 770315.6 6277804 24.6)
-TRONROUT0000000240978905;Route à 1 chaussée;AV DE VILLENEUVE ANGOULEME;AV DE VILLENEUVE ANGOULEME;4;Non;0;En service;2010-07-16 14:01:58;2023-09-08 09:28:10;;2009-07-01;;;Photogrammétrie;2.5;Photogrammétrie;1.5;2.0;6.0;Non;Non;Double sens;;Oui;35;Libre;;;;;;;;;Non;487;488;551;552;34172;34172;;;;341725850;341725850;;;;;;;;;;;;;commune;commune;Avenue de Villeneuve-Angoulème;Avenue de Villeneuve-Angoulème;;;34172_5850;34172_5850;;;;;;;;;;;;;;;;;;LINESTRING Z (770166.4 6277909.1 25.3, 770163.4 6277904.6 24.9)
-TRONROUT0000000240978905;Route à 1 chaussée;AV DE VILLENEUVE ANGOULEME;AV DE VILLENEUVE ANGOULEME;4;Non;0;En service;2010-07-16 14:01:58;2023-09-08 09:28:10;;2009-07-01;;;Photogrammétrie;2.5;Photogrammétrie;1.5;2.0;6.0;Non;Non;Double sens;;Oui;35;Libre;;;;;;;;;Non;487;488;551;552;34172;34172;;;;341725850;341725850;;;;;;;;;;;;;commune;commune;Avenue de Villeneuve-Angoulème;Avenue de Villeneuve-Angoulème;;;34172_5850;34172_5850;;;;;;;;;;;;;;;;;;LINESTRING Z (770163.4 6277904.6 24.9, 770162.3 6277901.2 24.9)
-TRONROUT0000000240978905;Route à 1 chaussée;AV DE VILLENEUVE ANGOULEME;AV DE VILLENEUVE ANGOULEME;4;Non;0;En service;2010-07-16 14:01:58;2023-09-08 09:28:10;;2009-07-01;;;Photogrammétrie;2.5;Photogrammétrie;1.5;2.0;6.0;Non;Non;Double sens;;Oui;35;Libre;;;;;;;;;Non;487;488;551;552;34172;34172;;;;341725850;341725850;;;;;;;;;;;;;commune;commune;Avenue de Villeneuve-Angoulème;Avenue de Villeneuve-Angoulème;;;34172_5850;34172_5850;;;;;;;;;;;;;;;;;;LINESTRING Z (770162.3 6277901.2 24.9, 770161.9 6277897.5 24.9)
-TRONROUT0000000240978905;Route à 1 chaussée;AV DE VILLENEUVE ANGOULEME;AV DE VILLENEUVE ANGOULEME;4;Non;0;En service;2010-07-16 14:01:58;2023-09-08 09:28:10;;2009-07-01;;;Photogrammétrie;2.5;Photogrammétrie;1.5;2.0;6.0;Non;Non;Double sens;;Oui;35;Libre;;;;;;;;;Non;487;488;551;552;34172;34172;;;;341725850;341725850;;;;;;;;;;;;;commune;commune;Avenue de Villeneuve-Angoulème;Avenue de Villeneuve-Angoulème;;;34172_5850;34172_5850;;;;;;;;;;;;;;;;;;LINESTRING Z (770161.9 6277897.5 24.9, 770162.7 6277881.3 25.4)
-TRONROUT0000000240978905;Route à 1 chaussée;AV DE VILLENEUVE ANGOULEME;AV DE VILLENEUVE ANGOULEME;4;Non;0;En service;2010-07-16 14:01:58;2023-09-08 09:28:10;;2009-07-01;;;Photogrammétrie;2.5;Photogrammétrie;1.5;2.0;6.0;Non;Non;Double sens;;Oui;35;Libre;;;;;;;;;Non;487;488;551;552;34172;34172;;;;341725850;341725850;;;;;;;;;;;;;commune;commune;Avenue de Villeneuve-Angoulème;Avenue de Villeneuve-Angoulème;;;34172_5850;34172_5850;;;;;;;;;;;;;;;;;;LINESTRING Z (770162.7 6277881.3 25.4, 770163.2 6277869.2 25.4)
-TRONROUT0000000240978905;Route à 1 chaussée;AV DE VILLENEUVE ANGOULEME;AV DE VILLENEUVE ANGOULEME;4;Non;0;En service;2010-07-16 14:01:58;2023-09-08 09:28:10;;2009-07-01;;;Photogrammétrie;2.5;Photogrammétrie;1.5;2.0;6.0;Non;Non;Double sens;;Oui;35;Libre;;;;;;;;;Non;487;488;551;552;34172;34172;;;;341725850;341725850;;;;;;;;;;;;;commune;commune;Avenue de Villeneuve-Angoulème;Avenue de Villeneuve-Angoulème;;;34172_5850;34172_5850;;;;;;;;;;;;;;;;;;LINESTRING Z (770163.2 6277869.2 25.4, 770162.8 6277863.6 25.4)
-TRONROUT0000000240978905;Route à 1 chaussée;AV DE VILLENEUVE ANGOULEME;AV DE VILLENEUVE ANGOULEME;4;Non;0;En service;2010-07-16 14:01:58;2023-09-08 09:28:10;;2009-07-01;;;Photogrammétrie;2.5;Photogrammétrie;1.5;2.0;6.0;Non;Non;Double sens;;Oui;35;Libre;;;;;;;;;Non;487;488;551;552;34172;34172;;;;341725850;341725850;;;;;;;;;;;;;commune;commune;Avenue de Villeneuve-Angoulème;Avenue de Villeneuve-Angoulème;;;34172_5850;34172_5850;;;;;;;;;;;;;;;;;;LINESTRING Z (770162.8 6277863.6 25.4, 770162.6 6277857.5 25.3)
-TRONROUT0000000240978905;Route à 1 chaussée;AV DE VILLENEUVE ANGOULEME;AV DE VILLENEUVE ANGOULEME;4;Non;0;En service;2010-07-16 14:01:58;2023-09-08 09:28:10;;2009-07-01;;;Photogrammétrie;2.5;Photogrammétrie;1.5;2.0;6.0;Non;Non;Double sens;;Oui;35;Libre;;;;;;;;;Non;487;488;551;552;34172;34172;;;;341725850;341725850;;;;;;;;;;;;;commune;commune;Avenue de Villeneuve-Angoulème;Avenue de Villeneuve-Angoulème;;;34172_5850;34172_5850;;;;;;;;;;;;;;;;;;LINESTRING Z (770162.6 6277857.5 25.3, 770162.4 6277852 25.3)
-TRONROUT0000000240978905;Route à 1 chaussée;AV DE VILLENEUVE ANGOULEME;AV DE VILLENEUVE ANGOULEME;4;Non;0;En service;2010-07-16 14:01:58;2023-09-08 09:28:10;;2009-07-01;;;Photogrammétrie;2.5;Photogrammétrie;1.5;2.0;6.0;Non;Non;Double sens;;Oui;35;Libre;;;;;;;;;Non;487;488;551;552;34172;34172;;;;341725850;341725850;;;;;;;;;;;;;commune;commune;Avenue de Villeneuve-Angoulème;Avenue de Villeneuve-Angoulème;;;34172_5850;34172_5850;;;;;;;;;;;;;;;;;;LINESTRING Z (770162.4 6277852 25.3, 770161.7 6277848.2 25.3)
-TRONROUT0000000240978905;Route à 1 chaussée;AV DE VILLENEUVE ANGOULEME;AV DE VILLENEUVE ANGOULEME;4;Non;0;En service;2010-07-16 14:01:58;2023-09-08 09:28:10;;2009-07-01;;;Photogrammétrie;2.5;Photogrammétrie;1.5;2.0;6.0;Non;Non;Double sens;;Oui;35;Libre;;;;;;;;;Non;487;488;551;552;34172;34172;;;;341725850;341725850;;;;;;;;;;;;;commune;commune;Avenue de Villeneuve-Angoulème;Avenue de Villeneuve-Angoulème;;;34172_5850;34172_5850;;;;;;;;;;;;;;;;;;LINESTRING Z (770161.7 6277848.2 25.3, 770159.4 6277843.5 25.2)
-TRONROUT0000000116207180;Route à 1 chaussée;AV DE VILLENEUVE ANGOULEME;AV DE VILLENEUVE ANGOULEME;4;Non;0;En service;2008-02-15 13:40:18;2023-09-08 09:28:10;;;;;Photogrammétrie;2.5;Photogrammétrie;1.5;1.0;4.0;Non;Non;Sens direct;;Oui;25;Libre;;;;;;;;;Non;;;;;34172;34172;;;;341725850;341725850;;;;;;;;;;;;;commune;commune;Avenue de Villeneuve-Angoulème;Avenue de Villeneuve-Angoulème;;;34172_5850;34172_5850;;;;;;;;;;;;;;;;;;LINESTRING Z (770166.4 6277909.1 25.3, 770171.4 6277913.8 25.5, 770175.4 6277917.4 25.5, 770178.9 6277920.1 25.6, 770183.5 6277923.3 25.6, 770186.9 6277925.6 25.3)
-TRONROUT0000000116207179;Route à 1 chaussée;AV DE VILLENEUVE ANGOULEME;AV DE VILLENEUVE ANGOULEME;4;Non;0;En service;2008-02-15 13:40:18;2023-09-08 09:28:10;;;;;Photogrammétrie;2.5;Photogrammétrie;1.5;1.0;4.0;Non;Non;Sens direct;;Oui;10;Libre;;;;;;;;;Non;455;454;487;488;34172;34172;;;;341725850;341725850;;;;;;;;;;;;;commune;commune;Avenue de Villeneuve-Angoulème;Avenue de Villeneuve-Angoulème;;;34172_5850;34172_5850;;;;;;;;;;;;;;;;;;LINESTRING Z (770180.9 6277932.9 25.3, 770178.5 6277930.3 25.3, 770175.7 6277926.9 25.3, 770173.5 6277924.2 25.2, 770171.3 6277921.3 25.2, 770169.5 6277918.1 25.2, 770168.3 6277915.4 25.2, 770167.4 6277913 25.2, 770166.4 6277909.1 25.3)
-TRONROUT0000000116207183;Rond-point;;;4;Non;0;En service;2008-02-15 13:40:18;2023-09-13 10:06:32;;;;;Photogrammétrie;2.5;Photogrammétrie;1.5;2.0;5.0;Non;Non;Sens direct;;Oui;15;Libre;;;;;;;;;Non;;;;;34172;34172;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;LINESTRING Z (770186.9 6277925.6 25.3, 770188.3 6277925.5 25.3, 770189.7 6277925.6 25.3, 770191.1 6277926 25.3, 770192.4 6277926.7 25.3)
-TRONROUT0000000116207185;Route à 1 chaussée;AV DE VILLENEUVE ANGOULEME;AV DE VILLENEUVE ANGOULEME;4;Non;0;En service;2008-02-15 13:40:18;2023-09-08 09:28:10;;;;;Photogrammétrie;2.5;Photogrammétrie;1.5;2.0;4.0;Non;Non;Sens inverse;;Oui;10;Libre;;;;;;;;;Non;;;;;34172;34172;;;;341725850;341725850;;;;;;;;;;;;;commune;commune;Avenue de Villeneuve-Angoulème;Avenue de Villeneuve-Angoulème;;;34172_5850;34172_5850;;;;;;;;;;;;;;;;;;LINESTRING Z (770220.4 6277928.8 25.7, 770211.6 6277928 25.3, 770205.1 6277927.7 25.3, 770199.1 6277927.3 25.3, 770194.9 6277927 25.3, 770192.4 6277926.7 25.3)
-TRONROUT0000000116207182;Rond-point;;;4;Non;0;En service;2008-02-15 13:40:18;2023-09-07 13:30:06;;;;;Photogrammétrie;2.5;Photogrammétrie;1.5;2.0;5.0;Non;Non;Sens direct;;Oui;20;Libre;;;;;;;;;Non;;;;;34172;34172;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;LINESTRING Z (770180.9 6277932.9 25.3, 770181 6277931.5 25.3, 770181.4 6277930.1 25.3, 770182.1 6277928.8 25.3, 770183 6277927.6 25.3, 770184.2 6277926.7 25.3, 770185.5 6277926 25.3, 770186.9 6277925.6 25.3)
-TRONROUT0000000116207186;Rond-point;;;4;Non;0;En service;2008-02-15 13:40:18;2023-09-07 13:30:06;;;;;Photogrammétrie;2.5;Photogrammétrie;1.5;2.0;5.0;Non;Non;Sens direct;;Oui;20;Libre;;;;;;;;;Non;;;;;34172;34172;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;LINESTRING Z (770192.4 6277926.7 25.3, 770194.5 6277928.8 25.3, 770195.2 6277930.1 25.3, 770195.6 6277931.5 25.3, 770195.7 6277932.9 25.3, 770195.6 6277934.3 25.3, 770195.2 6277935.7 25.3, 770194.5 6277937 25.3, 770193.6 6277938.2 25.3, 770192.4 6277939.1 25.3)
-TRONROUT0000000116207184;Route à 1 chaussée;AV DE VILLENEUVE ANGOULEME;AV DE VILLENEUVE ANGOULEME;4;Non;0;En service;2008-02-15 13:40:18;2023-09-08 09:28:10;;;;;Photogrammétrie;2.5;Photogrammétrie;1.5;2.0;4.0;Non;Non;Sens direct;;Oui;10;Libre;;;;;;;;;Non;;;;;34172;34172;;;;341725850;341725850;;;;;;;;;;;;;commune;commune;Avenue de Villeneuve-Angoulème;Avenue de Villeneuve-Angoulème;;;34172_5850;34172_5850;;;;;;;;;;;;;;;;;;LINESTRING Z (770220.4 6277928.8 25.7, 770212.1 6277930.6 25.8)
-TRONROUT0000000116207184;Route à 1 chaussée;AV DE VILLENEUVE ANGOULEME;AV DE VILLENEUVE ANGOULEME;4;Non;0;En service;2008-02-15 13:40:18;2023-09-08 09:28:10;;;;;Photogrammétrie;2.5;Photogrammétrie;1.5;2.0;4.0;Non;Non;Sens direct;;Oui;10;Libre;;;;;;;;;Non;;;;;34172;34172;;;;341725850;341725850;;;;;;;;;;;;;commune;commune;Avenue de Villeneuve-Angoulème;Avenue de Villeneuve-Angoulème;;;34172_5850;34172_5850;;;;;;;;;;;;;;;;;;LINESTRING Z (770212.1 6277930.6 25.8, 770205 6277933.1 25.7)
-TRONROUT0000000116207184;Route à 1 chaussée;AV DE VILLENEUVE ANGOULEME;AV DE VILLENEUVE ANGOULEME;4;Non;0;En service;2008-02-15 13:40:18;2023-09-08 09:28:10;;;;;Photogrammétrie;2.5;Photogrammétrie;1.5;2.0;4.0;Non;Non;Sens direct;;Oui;10;Libre;;;;;;;;;Non;;;;;34172;34172;;;;341725850;341725850;;;;;;;;;;;;;commune;commune;Avenue de Villeneuve-Angoulème;Avenue de Villeneuve-Angoulème;;;34172_5850;34172_5850;;;;;;;;;;;;;;;;;;LINESTRING Z (770205 6277933.1 25.7, 770199.7 6277935.8 25.7)
-TRONROUT0000000116207184;Route à 1 chaussée;AV DE VILLENEUVE ANGOULEME;AV DE VILLENEUVE ANGOULEME;4;Non;0;En service;2008-02-15 13:40:18;2023-09-08 09:28:10;;;;;Photogrammétrie;2.5;Photogrammétrie;1.5;2.0;4.0;Non;Non;Sens direct;;Oui;10;Libre;;;;;;;;;Non;;;;;34172;34172;;;;341725850;341725850;;;;;;;;;;;;;commune;commune;Avenue de Villeneuve-Angoulème;Avenue de Villeneuve-Angoulème;;;34172_5850;34172_5850;;;;;;;;;;;;;;;;;;LINESTRING Z (770199.7 6277935.8 25.7, 770192.4 6277939.1 25.3)
-TRONROUT0000002334351182;Rond-point;;;4;Non;0;En service;2023-09-07 13:30:06;;;;;;Photogrammétrie;2.5;Photogrammétrie;1.5;2.0;5.0;Non;Non;Sens direct;;Oui;20;Libre;;;;;;;;;Non;;;;;34172;34172;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;LINESTRING Z (770185.5 6277939.8 25.3, 770184.2 6277939.1 25.3, 770183 6277938.2 25.3, 770182.1 6277937 25.3, 770181.4 6277935.7 25.3, 770181 6277934.3 25.3, 770180.9 6277932.9 25.3)
-TRONROUT0000000116207181;Rond-point;;;4;Non;0;En service;2008-02-15 13:40:18;2023-09-07 13:30:06;;;;;Photogrammétrie;2.5;Photogrammétrie;1.5;2.0;5.0;Non;Non;Sens direct;;Oui;20;Libre;;;;;;;;;Non;;;;;34172;34172;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;LINESTRING Z (770192.4 6277939.1 25.3, 770191.1 6277939.8 25.3, 770189.7 6277940.2 25.3, 770188.3 6277940.3 25.3, 770186.9 6277940.2 25.3, 770185.5 6277939.8 25.3)
-TRONROUT0000000116207189;Route à 1 chaussée;;;5;Non;0;En service;2008-02-15 13:40:18;2023-09-07 13:30:06;;;;;Photogrammétrie;2.5;Photogrammétrie;1.5;2.0;4.0;Non;Non;Double sens;;Oui;5;Libre;;;;;;;;;Non;;;;;34172;34172;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;LINESTRING Z (770192.9652061858 6277939.831443299 25.344329896912157, 770192.4 6277939.1 25.3)
-TRONROUT0000000116207187;Route à 1 chaussée;R DU MAS DE LEMASSON;R DU MAS DE LEMASSON;4;Non;0;En service;2008-02-15 13:40:18;2023-09-08 09:28:10;;;;;Photogrammétrie;2.5;Photogrammétrie;1.5;2.0;6.0;Non;Non;Sens inverse;;Oui;20;Libre;;;;;;;;;Non;;;;;34172;34172;;;;341723595;341723595;;;;;;;;;;;;;commune;commune;Rue du Mas de Lemasson;Rue du Mas de Lemasson;;;34172_3595;34172_3595;;;;;;;;;;;;;;;;;;LINESTRING Z (770185.5 6277939.8 25.3, 770185.4679389313 6277939.983206107 25.3)
-TRONROUT0000000294020592;Route à 1 chaussée;PL ROMAIN ROLLAND;PL ROMAIN ROLLAND;5;Non;0;En service;2012-01-10 15:17:41;2023-08-26 17:45:08;;;;;Photogrammétrie;2.5;Photogrammétrie;1.5;2.0;7.0;Non;Non;Double sens;;Oui;15;Libre;;;;;;;;;Non;1;;1;;34172;34172;;;;341724933;341724933;;;;;;;;;;;;;commune;commune;Place Romain Rolland;Place Romain Rolland;;;34172_4933;34172_4933;;;;;;;;;;;;;;;;;;LINESTRING Z (770374.5 6277870 25.6, 770398.6 6277848.6 25)
-TRONROUT0000000115739995;Route à 1 chaussée;R EMILE CHARTIER DIT ALAIN;R EMILE CHARTIER DIT ALAIN;5;Non;0;En service;2008-02-08 11:05:31;2023-08-26 17:45:08;;;;;BDTopo;2.5;BDTopo;1.5;2.0;4.0;Non;Non;Double sens;;Oui;15;Libre;;;;;;;;;Non;192;191;172;171;34172;34172;;;;341720134;341720134;;;;;;;;;;;;;commune;commune;Rue Emile Chartier dit Alain;Rue Emile Chartier dit Alain;;;34172_0134;34172_0134;;;;;;;;;;;;;;;;;;LINESTRING Z (770374.5 6277870 25.6, 770361 6277854.7 25.4)
-TRONROUT0000000115739994;Route à 1 chaussée;R EMILE CHARTIER DIT ALAIN;R EMILE CHARTIER DIT ALAIN;5;Non;0;En service;2008-02-08 11:05:31;2023-08-26 17:45:08;;;;;BDTopo;2.5;BDTopo;1.5;2.0;4.0;Non;Non;Double sens;;Oui;20;Libre;;;;;;;;;Non;198;197;192;191;34172;34172;;;;341720134;341720134;;;;;;;;;;;;;commune;commune;Rue Emile Chartier dit Alain;Rue Emile Chartier dit Alain;;;34172_0134;34172_0134;;;;;;;;;;;;;;;;;;LINESTRING Z (770378.3 6277874.3 25.6, 770374.5 6277870 25.6)
-TRONROUT0000000294020591;Route à 1 chaussée;;;5;Non;0;En service;2012-01-10 15:17:41;2023-08-26 17:45:08;;;;;Orthophotographie;3.0;Lidar;0.5;1.0;3.0;Non;Non;Sens direct;;Oui;10;Libre;;;;;;;;;Non;;;;;34172;34172;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;LINESTRING Z (770398.6 6277848.6 25.1, 770413.5 6277867.8 25.7, 770340.7 6277935 26.5, 770326.2 6277940.2 26.7, 770314.1 6277935 26.6, 770312.1 6277933.1 26.6)
-TRONROUT0000000044845877;Route à 1 chaussée;LES ORMEAUX 2;LES ORMEAUX 2;5;Non;0;En service;2006-12-12 11:20:44;2023-08-26 17:45:08;;;;;BDTopo;2.5;BDTopo;1.5;2.0;4.0;Non;Non;Double sens;;Oui;20;Libre;;;;;;;;;Non;;;;;34172;34172;;;;34172#03X;34172#03X;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;LINESTRING Z (770312.1 6277933.1 27.1, 770378.5 6277874.6 25.6, 770378.3 6277874.3 25.6)
-TRONROUT0000000044845858;Route à 1 chaussée;R SAINTE-VERONIQUE;R SAINTE-VERONIQUE;5;Non;0;En service;2006-12-12 11:20:44;2023-08-26 17:45:08;;;;;Photogrammétrie;2.5;Photogrammétrie;1.5;2.0;7.0;Non;Non;Double sens;;Oui;20;Libre;;;;;;;;;Non;117;118;219;218;34172;34172;;;;341725252;341725252;;;;;;;;;;;;;commune;commune;Rue Sainte Véronique;Rue Sainte Véronique;;;34172_5252;34172_5252;;;;;;;;;;;;;;;;;;LINESTRING Z (770432.7 6277891.8 27.2, 770354.3 6277964 27.8, 770351.2 6277966.4 27.8, 770341.5 6277969.7 27.4)
-TRONROUT0000000044845878;Route empierrée;ALL MAURICE BONAFOS;ALL MAURICE BONAFOS;5;Non;0;En service;2006-12-12 11:20:44;2022-12-10 12:02:02;;2009-07-01;;;Photogrammétrie;2.5;Photogrammétrie;1.5;;;Non;Non;Double sens;;Oui;0;Restreint aux ayants droit;;;;;;;;;Non;;135;;135;34172;34172;;;;341723668;341723668;;;;;;;;;;;;;commune;commune;Allées Maurice Bonafos;Allées Maurice Bonafos;;;34172_3668;34172_3668;;;;;;;;;;;;;;;;;;LINESTRING Z (770305.9 6277957.2 26.7, 770375.7 6278029.7 29.3)
-TRONROUT0000000044843696;Route à 1 chaussée;R SAINT-CLEOPHAS;R SAINT-CLEOPHAS;4;Non;0;En service;2006-12-12 11:20:44;2023-08-26 17:45:08;;;;;BDTopo;2.5;BDTopo;1.5;2.0;6.0;Non;Non;Double sens;;Oui;35;Libre;;;;;;;;;Non;45;20;49;26B;34172;34172;;;;341725055;341725055;;;;;;;;;;;;;commune;commune;Rue Saint Cléophas;Rue Saint Cléophas;;;34172_5055;34172_5055;;;;;;;;;;;;;;;;;;LINESTRING Z (770375.7 6278029.7 29.3, 770417.4 6277990.6 29)
-TRONROUT0000000044843668;Route à 1 chaussée;R SAINT-CLEOPHAS;R SAINT-CLEOPHAS;4;Non;0;En service;2006-12-12 11:20:44;2023-08-26 17:45:08;;;;;BDTopo;2.5;BDTopo;1.5;2.0;6.0;Non;Non;Double sens;;Oui;10;Libre;;;;;;;;;Non;45;;45;;34172;34172;;;;341725055;341725055;;;;;;;;;;;;;commune;commune;Rue Saint Cléophas;Rue Saint Cléophas;;;34172_5055;34172_5055;;;;;;;;;;;;;;;;;;LINESTRING Z (770364.7 6278040.1 29.5, 770375.7 6278029.7 29.3)
-TRONROUT0000000044845892;Route à 1 chaussée;AV DE VILLENEUVE ANGOULEME;AV DE VILLENEUVE ANGOULEME;4;Non;0;En service;2006-12-12 11:20:44;2023-08-26 17:45:08;;;;;Photogrammétrie;2.5;Photogrammétrie;1.5;2.0;5.0;Non;Non;Sens inverse;;Oui;15;Libre;;;;;;;;;Non;267;266;453;454;34172;34172;;;;341725850;341725850;;;;;;;;;;;;;commune;commune;Avenue de Villeneuve-Angoulème;Avenue de Villeneuve-Angoulème;;;34172_5850;34172_5850;;;;;;;;;;;;;;;;;;LINESTRING Z (770364.7 6278040.1 29.5, 770350.1 6278030.6 29.6)
-TRONROUT0000000044845892;Route à 1 chaussée;AV DE VILLENEUVE ANGOULEME;AV DE VILLENEUVE ANGOULEME;4;Non;0;En service;2006-12-12 11:20:44;2023-08-26 17:45:08;;;;;Photogrammétrie;2.5;Photogrammétrie;1.5;2.0;5.0;Non;Non;Sens inverse;;Oui;15;Libre;;;;;;;;;Non;267;266;453;454;34172;34172;;;;341725850;341725850;;;;;;;;;;;;;commune;commune;Avenue de Villeneuve-Angoulème;Avenue de Villeneuve-Angoulème;;;34172_5850;34172_5850;;;;;;;;;;;;;;;;;;LINESTRING Z (770350.1 6278030.6 29.6, 770321.9 6278006.7 28.1)
-TRONROUT0000000044845892;Route à 1 chaussée;AV DE VILLENEUVE ANGOULEME;AV DE VILLENEUVE ANGOULEME;4;Non;0;En service;2006-12-12 11:20:44;2023-08-26 17:45:08;;;;;Photogrammétrie;2.5;Photogrammétrie;1.5;2.0;5.0;Non;Non;Sens inverse;;Oui;15;Libre;;;;;;;;;Non;267;266;453;454;34172;34172;;;;341725850;341725850;;;;;;;;;;;;;commune;commune;Avenue de Villeneuve-Angoulème;Avenue de Villeneuve-Angoulème;;;34172_5850;34172_5850;;;;;;;;;;;;;;;;;;LINESTRING Z (770321.9 6278006.7 28.1, 770307.5 6277994.6 27.9)
-TRONROUT0000000044845892;Route à 1 chaussée;AV DE VILLENEUVE ANGOULEME;AV DE VILLENEUVE ANGOULEME;4;Non;0;En service;2006-12-12 11:20:44;2023-08-26 17:45:08;;;;;Photogrammétrie;2.5;Photogrammétrie;1.5;2.0;5.0;Non;Non;Sens inverse;;Oui;15;Libre;;;;;;;;;Non;267;266;453;454;34172;34172;;;;341725850;341725850;;;;;;;;;;;;;commune;commune;Avenue de Villeneuve-Angoulème;Avenue de Villeneuve-Angoulème;;;34172_5850;34172_5850;;;;;;;;;;;;;;;;;;LINESTRING Z (770307.5 6277994.6 27.9, 770295.5 6277983 27)
-TRONROUT0000000044845892;Route à 1 chaussée;AV DE VILLENEUVE ANGOULEME;AV DE VILLENEUVE ANGOULEME;4;Non;0;En service;2006-12-12 11:20:44;2023-08-26 17:45:08;;;;;Photogrammétrie;2.5;Photogrammétrie;1.5;2.0;5.0;Non;Non;Sens inverse;;Oui;15;Libre;;;;;;;;;Non;267;266;453;454;34172;34172;;;;341725850;341725850;;;;;;;;;;;;;commune;commune;Avenue de Villeneuve-Angoulème;Avenue de Villeneuve-Angoulème;;;34172_5850;34172_5850;;;;;;;;;;;;;;;;;;LINESTRING Z (770295.5 6277983 27, 770265.8 6277950.8 26.2)
-TRONROUT0000000044845892;Route à 1 chaussée;AV DE VILLENEUVE ANGOULEME;AV DE VILLENEUVE ANGOULEME;4;Non;0;En service;2006-12-12 11:20:44;2023-08-26 17:45:08;;;;;Photogrammétrie;2.5;Photogrammétrie;1.5;2.0;5.0;Non;Non;Sens inverse;;Oui;15;Libre;;;;;;;;;Non;267;266;453;454;34172;34172;;;;341725850;341725850;;;;;;;;;;;;;commune;commune;Avenue de Villeneuve-Angoulème;Avenue de Villeneuve-Angoulème;;;34172_5850;34172_5850;;;;;;;;;;;;;;;;;;LINESTRING Z (770265.8 6277950.8 26.2, 770258.3 6277943.6 26.2)
-TRONROUT0000000044845892;Route à 1 chaussée;AV DE VILLENEUVE ANGOULEME;AV DE VILLENEUVE ANGOULEME;4;Non;0;En service;2006-12-12 11:20:44;2023-08-26 17:45:08;;;;;Photogrammétrie;2.5;Photogrammétrie;1.5;2.0;5.0;Non;Non;Sens inverse;;Oui;15;Libre;;;;;;;;;Non;267;266;453;454;34172;34172;;;;341725850;341725850;;;;;;;;;;;;;commune;commune;Avenue de Villeneuve-Angoulème;Avenue de Villeneuve-Angoulème;;;34172_5850;34172_5850;;;;;;;;;;;;;;;;;;LINESTRING Z (770258.3 6277943.6 26.2, 770250.8 6277938 26.2)
-TRONROUT0000000044845892;Route à 1 chaussée;AV DE VILLENEUVE ANGOULEME;AV DE VILLENEUVE ANGOULEME;4;Non;0;En service;2006-12-12 11:20:44;2023-08-26 17:45:08;;;;;Photogrammétrie;2.5;Photogrammétrie;1.5;2.0;5.0;Non;Non;Sens inverse;;Oui;15;Libre;;;;;;;;;Non;267;266;453;454;34172;34172;;;;341725850;341725850;;;;;;;;;;;;;commune;commune;Avenue de Villeneuve-Angoulème;Avenue de Villeneuve-Angoulème;;;34172_5850;34172_5850;;;;;;;;;;;;;;;;;;LINESTRING Z (770250.8 6277938 26.2, 770243.4 6277933.9 26.2)
-TRONROUT0000000044845892;Route à 1 chaussée;AV DE VILLENEUVE ANGOULEME;AV DE VILLENEUVE ANGOULEME;4;Non;0;En service;2006-12-12 11:20:44;2023-08-26 17:45:08;;;;;Photogrammétrie;2.5;Photogrammétrie;1.5;2.0;5.0;Non;Non;Sens inverse;;Oui;15;Libre;;;;;;;;;Non;267;266;453;454;34172;34172;;;;341725850;341725850;;;;;;;;;;;;;commune;commune;Avenue de Villeneuve-Angoulème;Avenue de Villeneuve-Angoulème;;;34172_5850;34172_5850;;;;;;;;;;;;;;;;;;LINESTRING Z (770243.4 6277933.9 26.2, 770236.9 6277931.3 26.1)
-TRONROUT0000000044845892;Route à 1 chaussée;AV DE VILLENEUVE ANGOULEME;AV DE VILLENEUVE ANGOULEME;4;Non;0;En service;2006-12-12 11:20:44;2023-08-26 17:45:08;;;;;Photogrammétrie;2.5;Photogrammétrie;1.5;2.0;5.0;Non;Non;Sens inverse;;Oui;15;Libre;;;;;;;;;Non;267;266;453;454;34172;34172;;;;341725850;341725850;;;;;;;;;;;;;commune;commune;Avenue de Villeneuve-Angoulème;Avenue de Villeneuve-Angoulème;;;34172_5850;34172_5850;;;;;;;;;;;;;;;;;;LINESTRING Z (770236.9 6277931.3 26.1, 770228.5 6277929.7 25.8)
-TRONROUT0000000044845892;Route à 1 chaussée;AV DE VILLENEUVE ANGOULEME;AV DE VILLENEUVE ANGOULEME;4;Non;0;En service;2006-12-12 11:20:44;2023-08-26 17:45:08;;;;;Photogrammétrie;2.5;Photogrammétrie;1.5;2.0;5.0;Non;Non;Sens inverse;;Oui;15;Libre;;;;;;;;;Non;267;266;453;454;34172;34172;;;;341725850;341725850;;;;;;;;;;;;;commune;commune;Avenue de Villeneuve-Angoulème;Avenue de Villeneuve-Angoulème;;;34172_5850;34172_5850;;;;;;;;;;;;;;;;;;LINESTRING Z (770228.5 6277929.7 25.8, 770220.4 6277928.8 25.7)
-""")
+        _sio = AbstractGeoDataFrameDemos._dataset(
+            "GeoDataFrameDemosC", "irisTastavinRoads.csv"
+        )
         return GeoDataFrameLib.read_csv(_sio)
 
     @staticmethod
@@ -467,265 +109,9 @@ TRONROUT0000000044845892;Route à 1 chaussée;AV DE VILLENEUVE ANGOULEME;AV DE V
         streetlights = read_file("./MMM_MMM_EclairagePublic.shp", mask=iris)
         streetlights.to_csv('/tmp/tastavin.csv', sep=';', index=False)
         '''
-        _sio = StringIO("""objectid;patri_id;type;gid_rue;code;gid_depart;ordre;geometry
-1296;648411;Habillage;11557.0;1155;;;POINT (770643.8680000007 6277763.849100001)
-1305;648417;Habillage;13262.0;1161;;;POINT (770304.9600000009 6277940.976500001)
-1371;648498;Habillage;;1242;;;POINT (770268.1600999981 6277900.636700001)
-1372;648499;Habillage;;1243;;;POINT (770227.1154000014 6277884.536699999)
-1373;648500;Habillage;;1244;;;POINT (770240.9980999976 6277872.255199999)
-1376;648503;Habillage;;1247;;;POINT (770440.3606000021 6277892.130600002)
-1502;648665;Habillage;;3699;;;POINT (770186.3470000029 6277809.8675)
-2242;649620;Habillage;;2498;;;POINT (770699.1437999979 6277690.414799999)
-3315;653832;Habillage;11557.0;653832;;;POINT (770665.8216999993 6277521.289099999)
-3345;653833;Habillage;12589.0;653833;;;POINT (770737.576700002 6277480.225699998)
-3362;658955;Habillage;13967.0;658955;;;POINT (770177.804899998 6277853.732299998)
-3363;658956;Habillage;13967.0;658956;;;POINT (770164.4170000032 6277837.804299999)
-4116;653827;Habillage;11557.0;653827;;;POINT (770647.7937999964 6277759.506000001)
-4196;875433;Habillage;13302.0;705521;;;POINT (770412.5358000025 6277692.6763)
-4276;648398;Habillage;13262.0;1142;;;POINT (770334.9328000024 6277976.2399)
-4387;472172;Poste;11638.0;;;;POINT (770516.1969000027 6277862.473299999)
-5379;472669;Armoire;11138.0;105;;;POINT (770639.5125999972 6277685.8891)
-5574;472617;Armoire;13491.0;104;;;POINT (770516.0802000016 6277865.4364)
-5971;472668;Armoire;13302.0;107;;;POINT (770424.6699000001 6277693.814399999)
-8984;569319;Coffret;13262.0;DER_;;;POINT (770267.9618000016 6277930.3233)
-10132;875304;Coffret;14007.0;;;;POINT (770276.1159000024 6277764.1215)
-10796;996597;Coffret;13036.0;;;;POINT (770524.0603 6277876.9750000015)
-10797;996598;Coffret;13036.0;;;;POINT (770544.1000000015 6277858.1576000005)
-13922;578309;Regard;12710.0;REG_REG_578309;;;POINT (770150.9659999982 6277790.659600001)
-13923;578310;Regard;12710.0;REG_REG_578310;;;POINT (770152.4019000009 6277800.6622)
-13924;578311;Regard;;REG_REG_578311;;;POINT (770155.5987000018 6277809.7760999985)
-13926;578313;Regard;;REG_REG_578313;;;POINT (770174.5596999973 6277799.742400002)
-13927;578314;Regard;;REG_REG_578314;;;POINT (770184.2660000026 6277805.392499998)
-13928;578315;Regard;;REG_REG_578315;;;POINT (770168.6471000016 6277818.194600001)
-13930;578317;Regard;;REG_REG_578317;;;POINT (770211.4580999985 6277869.747299999)
-13931;578318;Regard;;REG_REG_578318;;;POINT (770225.6114000008 6277868.373199999)
-13932;578319;Regard;;REG_REG_578319;;;POINT (770228.3213 6277855.258699998)
-14884;572935;Regard;13036.0;REG_REG_572935;;;POINT (770374.3334000036 6278020.932300001)
-14885;572936;Regard;13262.0;REG_REG_572936;;;POINT (770306.7053000033 6277953.400800001)
-14886;572937;Regard;13262.0;REG_REG_572937;;;POINT (770286.7819999978 6277919.3411)
-15717;575710;Regard;11557.0;REG_REG_575710;;;POINT (770683.938699998 6277534.542599998)
-15718;575711;Regard;11557.0;REG_REG_575711;;;POINT (770692.5956000015 6277553.9804)
-15721;575720;Regard;11557.0;REG_REG_575720;;;POINT (770719.7858000025 6277680.7239000015)
-15722;575721;Regard;11557.0;REG_REG_575721;;;POINT (770725.5161999986 6277681.606199998)
-15941;575051;Regard;11138.0;REG_REG_575051;;;POINT (770699.0606999993 6277616.552299999)
-16034;575875;Regard;11557.0;REG_REG_575875;;;POINT (770700.9337000027 6277575.082600001)
-17923;575447;Regard;13967.0;REG_REG_575447;;;POINT (770148.7273000032 6277812.930399999)
-17924;575448;Regard;12710.0;REG_REG_575448;;;POINT (770214.4117000028 6277764.109299999)
-18088;653630;Regard;;REG_653630;;;POINT (770635.5451999977 6277680.943)
-18089;653631;Regard;;REG_653631;;;POINT (770654.878200002 6277654.827399999)
-18090;653632;Regard;;REG_653632;;;POINT (770698.5006000027 6277614.6182)
-18091;653633;Regard;;REG_653633;;;POINT (770707.2113000005 6277618.197799999)
-18092;653634;Regard;;REG_653634;;;POINT (770715.1921999976 6277618.727499999)
-18093;653635;Regard;;REG_653635;;;POINT (770722.4280999973 6277640.098700002)
-18094;653636;Regard;;REG_653636;;;POINT (770723.4601999968 6277642.9098000005)
-18095;653637;Regard;;REG_653637;;;POINT (770729.3018999994 6277657.386799999)
-18096;653638;Regard;;REG_653638;;;POINT (770725.6579999998 6277658.918000001)
-18097;653639;Regard;;REG_653639;;;POINT (770739.7836000025 6277654.0634)
-18098;653640;Regard;;REG_653640;;;POINT (770722.7320000008 6277665.3836)
-18099;653641;Regard;;REG_653641;;;POINT (770734.1686000004 6277682.068399999)
-18193;653655;Regard;;REG_653655;;;POINT (770743.8202999979 6277675.759399999)
-18194;653656;Regard;;REG_653656;;;POINT (770752.375 6277671.766199999)
-18195;653657;Regard;;REG_653657;;;POINT (770733.7930999994 6277655.2903)
-18196;653658;Regard;;REG_653658;;;POINT (770675.7986999974 6277586.836800002)
-18197;653659;Regard;;REG_653659;;;POINT (770693.0190000013 6277578.427499998)
-18198;653660;Regard;;REG_653660;;;POINT (770699.2901000008 6277598.872900002)
-18199;653662;Regard;;REG_653662;;;POINT (770667.3945000023 6277510.244899999)
-18200;653663;Regard;;REG_653663;;;POINT (770670.9871999994 6277507.679099999)
-18201;653664;Regard;;REG_653664;;;POINT (770671.8896000013 6277509.2368)
-18202;653665;Regard;;REG_653665;;;POINT (770676.074500002 6277504.462299999)
-18203;653666;Regard;;REG_653666;;;POINT (770680.8769000024 6277501.808699999)
-18204;653667;Regard;;REG_653667;;;POINT (770708.1035000011 6277596.447999999)
-18205;653668;Regard;;REG_653668;;;POINT (770669.4637999982 6277486.531100001)
-18213;653687;Regard;;REG_653687;;;POINT (770711.8378000036 6277490.118000001)
-18570;658950;Regard;;REG_658950;;;POINT (770211.5785000026 6277892.872200001)
-20928;875305;Regard;11557.0;;;;POINT (770664.4866999984 6277515.443700001)
-20929;875306;Regard;12710.0;;;;POINT (770646.2572000027 6277499.055399999)
-20930;875307;Regard;12710.0;;;;POINT (770640.1149000004 6277497.912599999)
-20937;875314;Regard;12710.0;;;;POINT (770573.2562000006 6277544.354600001)
-20944;875321;Regard;12710.0;;;;POINT (770482.320100002 6277617.3664)
-20945;875322;Regard;12710.0;;;;POINT (770475.796099998 6277623.286499999)
-20946;875323;Regard;12710.0;;;;POINT (770467.4724000022 6277628.293299999)
-20947;875324;Regard;12710.0;;;;POINT (770446.3640000001 6277647.401700001)
-20948;875325;Regard;12710.0;;;;POINT (770409.5485000014 6277676.666299999)
-20949;875326;Regard;12710.0;;;;POINT (770403.2631999999 6277669.6534)
-20958;875335;Regard;14007.0;;;;POINT (770244.6881000027 6277736.941599999)
-20959;875336;Regard;14007.0;;;;POINT (770248.7413000017 6277735.807500001)
-20960;875337;Regard;14007.0;;;;POINT (770257.8319000006 6277728.681299999)
-20961;875338;Regard;12710.0;;;;POINT (770258.9616999999 6277724.8926)
-20962;875339;Regard;12710.0;;;;POINT (770272.9522999972 6277715.937399998)
-20963;875340;Regard;12710.0;;;;POINT (770290.0874999985 6277713.109200001)
-20964;875341;Regard;12710.0;;;;POINT (770316.235299997 6277711.3376)
-20965;875342;Regard;12710.0;;;;POINT (770344.2075999975 6277710.273800001)
-20966;875343;Regard;12710.0;;;;POINT (770378.4974000007 6277701.509300001)
-20967;875344;Regard;13302.0;;;;POINT (770397.7899999991 6277688.195999999)
-20968;875345;Regard;13302.0;;;;POINT (770404.4195000008 6277683.120099999)
-20969;875346;Regard;13302.0;;;;POINT (770416.9219999984 6277697.9076000005)
-20970;875347;Regard;13302.0;;;;POINT (770422.8794 6277693.825599998)
-20971;875348;Regard;;;;;POINT (770293.9992000014 6277834.796700001)
-20972;875349;Regard;14007.0;;;;POINT (770314.1595999971 6277814.884199999)
-20973;875350;Regard;;;;;POINT (770317.6557999998 6277858.8336)
-20977;875354;Regard;11557.0;;;;POINT (770665.4848999977 6277519.1017)
-22626;996601;Regard;13491.0;;;;POINT (770521.1472000033 6277879.410700001)
-22627;996602;Regard;11638.0;;;;POINT (770515.2617999986 6277864.052099999)
-22628;996603;Regard;13491.0;;;;POINT (770511.867399998 6277870.181499999)
-97718;485310;Support;13262.0;098.3.001;;;POINT (770362.2829999998 6278018.0064)
-97719;485316;Support;13262.0;098.3.007;;;POINT (770332.1026000008 6277975.4278)
-97720;485320;Support;13262.0;098.3.011;;;POINT (770308.2158000022 6277949.1686)
-97721;485323;Support;13262.0;098.3.018;;;POINT (770291.4284000024 6277941.237399999)
-97737;658935;Support;13328.0;098.4.032;;;POINT (770192.8844999969 6277905.8456999995)
-97738;658947;Support;13328.0;098.4.035;;;POINT (770181.622299999 6277858.2261000015)
-118218;484951;Support;13491.0;104.1.002;;;POINT (770487.6906000003 6277862.774900001)
-118219;484952;Support;13491.0;104.1.003;;;POINT (770466.7515999973 6277856.248100001)
-118272;484961;Support;11557.0;104.2.004;;;POINT (770592.7468999997 6277811.936900001)
-118273;484964;Support;11557.0;104.2.006;;;POINT (770642.1611000001 6277765.2861)
-118970;501600;Support;;101.4.010;;;POINT (770227.5235999972 6277855.783300001)
-119028;485311;Support;13262.0;098.3.002;;;POINT (770361.747299999 6278008.865499999)
-119029;485312;Support;13262.0;098.3.003;;;POINT (770352.5680999979 6278007.374400001)
-119030;485313;Support;13262.0;098.3.004;;;POINT (770352.7967000008 6277999.136100002)
-119031;485314;Support;13262.0;098.3.005;;;POINT (770342.1105000004 6277986.438700002)
-119035;485315;Support;13262.0;098.3.006;;;POINT (770336.7850999981 6277991.292199999)
-119036;485317;Support;13262.0;098.3.008;;;POINT (770326.7810000032 6277980.252099998)
-119037;485318;Support;13262.0;098.3.009;;;POINT (770322.3382999972 6277964.627099998)
-119038;485319;Support;13262.0;098.3.010;;;POINT (770317.0090000033 6277969.500599999)
-119039;485324;Support;13262.0;098.3.021;;;POINT (770267.9206999987 6277933.131000001)
-119040;485325;Support;13262.0;098.3.022;;;POINT (770283.7771999985 6277919.001800001)
-119041;485327;Support;13262.0;098.3.024;;;POINT (770252.8052999973 6277915.9012)
-119042;485328;Support;13328.0;098.3.025;;;POINT (770240.3532999977 6277899.6395)
-119043;485329;Support;13328.0;098.3.026;;;POINT (770254.3649000004 6277887.4750000015)
-119044;485330;Support;13328.0;098.3.028;;;POINT (770242.0075000003 6277873.5176)
-119045;485331;Support;13328.0;098.3.027;;;POINT (770227.9470999986 6277885.7115)
-119050;485338;Support;13037.0;098.4.003;;;POINT (770441.5253999978 6277893.532499999)
-119088;485321;Support;13262.0;098.3.012;;;POINT (770302.990199998 6277953.992199998)
-119089;485322;Support;13262.0;098.3.015;;;POINT (770296.5684999973 6277936.357299998)
-119659;485326;Support;13262.0;098.3.023;;;POINT (770269.1215000004 6277902.1105)
-119660;485337;Support;13037.0;098.4.002;;;POINT (770456.7302000001 6277923.9844)
-120728;653774;Support;;105.5.099;;;POINT (770699.2562000006 6277619.250999998)
-128647;490699;Support;13967.0;098.4.031;;;POINT (770165.4773999974 6277843.2195000015)
-128648;490700;Support;13967.0;098.4.030;;;POINT (770169.8272999972 6277873.3334)
-128649;490701;Support;13328.0;098.4.028;;;POINT (770190.9780000001 6277919.423599999)
-128650;490702;Support;13967.0;098.4.029;;;POINT (770170.8620000035 6277903.800099999)
-128971;501592;Support;;101.4.001;;;POINT (770174.6894000024 6277824.769000001)
-128972;501593;Support;;101.4.002;;;POINT (770170.7898000032 6277819.7762)
-128973;501594;Support;;101.4.004;;;POINT (770182.2968000025 6277833.638900001)
-128974;501595;Support;;101.4.005;;;POINT (770190.258100003 6277842.852400001)
-128975;501596;Support;;101.4.006;;;POINT (770198.4099000022 6277852.392999999)
-128976;501597;Support;;101.4.007;;;POINT (770206.2974999994 6277861.475200001)
-128977;501598;Support;;101.4.008;;;POINT (770212.6881000027 6277868.5944)
-128978;501599;Support;;101.4.009;;;POINT (770225.4985999987 6277872.416200001)
-128979;501601;Support;;101.4.011;;;POINT (770220.9200000018 6277848.190900002)
-128980;501602;Support;;101.4.012;;;POINT (770213.0423000008 6277839.144699998)
-128981;501603;Support;;101.4.013;;;POINT (770204.7528999969 6277829.739)
-128982;501604;Support;;101.4.014;;;POINT (770196.8801999986 6277820.598099999)
-128983;501605;Support;;101.4.015;;;POINT (770189.0896999985 6277811.520100001)
-128984;501606;Support;;101.4.003;;;POINT (770185.9943000004 6277807.511)
-132412;653401;Support;12659.0;105.3.001;;;POINT (770742.3827999979 6277653.653499998)
-132413;653405;Support;12659.0;105.3.002;;;POINT (770743.6620000005 6277674.768599998)
-132425;653453;Support;11557.0;105.4.001;;;POINT (770715.0890000015 6277616.610300001)
-132426;653459;Support;11557.0;105.4.003;;;POINT (770722.1952999979 6277638.3653)
-132427;653465;Support;11557.0;105.4.005;;;POINT (770708.0196999982 6277594.6732)
-132428;653471;Support;11557.0;105.4.007;;;POINT (770700.9231000021 6277573.883099999)
-132429;653477;Support;11557.0;105.4.009;;;POINT (770692.4333000034 6277552.5978000015)
-132430;653483;Support;11557.0;105.4.011;;;POINT (770683.8738999963 6277533.375999998)
-132431;653489;Support;12589.0;105.4.013;;;POINT (770685.5442999974 6277510.144000001)
-132432;653493;Support;11557.0;105.4.014;;;POINT (770665.4472000003 6277519.059)
-132433;653497;Support;12589.0;105.4.015;;;POINT (770692.3465000018 6277497.4342)
-132434;653501;Support;12589.0;105.4.016;;;POINT (770709.7013000026 6277490.934900001)
-132435;653505;Support;12589.0;105.4.017;;;POINT (770734.4448999986 6277481.513999999)
-132445;653545;Support;11557.0;105.5.005;;;POINT (770682.2475999966 6277727.702500001)
-132446;653549;Support;11557.0;105.5.006;;;POINT (770703.1661000028 6277708.112100001)
-132455;653585;Support;11138.0;105.5.015;;;POINT (770658.5427000001 6277658.8598)
-132456;653589;Support;11138.0;105.5.016;;;POINT (770682.5780000016 6277636.6063)
-132457;653593;Support;13403.0;105.5.017;;;POINT (770674.4496000037 6277587.1785)
-132458;653597;Support;13403.0;105.5.018;;;POINT (770658.5252000019 6277601.930599999)
-132459;653601;Support;12052.0;105.5.019;;;POINT (770635.5433000028 6277582.763900001)
-132460;653605;Support;12052.0;105.5.020;;;POINT (770616.9038000032 6277561.436799999)
-132462;653609;Support;13403.0;105.5.021;;;POINT (770634.6621000022 6277624.0375000015)
-132463;653613;Support;13403.0;105.5.022;;;POINT (770613.1479000002 6277644.073600002)
-132464;653617;Support;13403.0;105.5.023;;;POINT (770582.6451999992 6277672.339499999)
-132465;653621;Support;13403.0;105.5.024;;;POINT (770552.5722000003 6277700.235300001)
-132466;653625;Support;13403.0;105.5.025;;;POINT (770531.4540000036 6277725.689599998)
-134371;488839;Support;13967.0;101.5.014;;;POINT (770152.3809999973 6277811.1512)
-134372;488842;Support;12710.0;101.5.017;;;POINT (770185.5967999995 6277790.927700002)
-134373;488843;Support;12710.0;101.5.018;;;POINT (770201.1493000016 6277775.076900002)
-134374;488844;Support;12710.0;101.5.019;;;POINT (770215.2902000025 6277763.320799999)
-134388;488841;Support;;101.5.016;;;POINT (770175.2268999964 6277800.558400001)
-136044;658939;Support;13328.0;098.4.033;;;POINT (770217.2522 6277899.953200001)
-136045;658943;Support;13328.0;098.4.034;;;POINT (770201.2805999964 6277881.2124999985)
-136485;653303;Support;;105.1.001;;;POINT (770639.0669 6277703.616)
-136486;653307;Support;;105.1.002;;;POINT (770667.4591000006 6277677.641399998)
-136487;653311;Support;;105.1.003;;;POINT (770693.2783999965 6277654.101199999)
-136488;653315;Support;;105.1.004;;;POINT (770660.3122999966 6277726.381499998)
-136489;653319;Support;;105.1.005;;;POINT (770694.8981000036 6277694.011799999)
-136490;653325;Support;11557.0;105.2.001;;;POINT (770721.0199000016 6277664.067499999)
-136491;653329;Support;11557.0;105.2.002;;;POINT (770718.6204999983 6277682.947700001)
-152932;488867;Support;13302.0;107.1.001;;;POINT (770404.6388999969 6277681.061099999)
-152933;488877;Support;12710.0;107.1.002;;;POINT (770417.9139000028 6277670.5262)
-152934;488876;Support;12710.0;107.1.003;;;POINT (770430.8363000005 6277660.100299999)
-152935;488875;Support;12710.0;107.1.004;;;POINT (770444.4675000012 6277650.066199999)
-152936;488874;Support;12710.0;107.1.005;;;POINT (770453.492399998 6277641.626800001)
-152937;488873;Support;12710.0;107.1.006;;;POINT (770461.7774000019 6277634.872200001)
-152941;488871;Support;12710.0;107.1.010;;;POINT (770569.2787000015 6277549.336800002)
-152960;488868;Support;12710.0;107.1.014;;;POINT (770647.3071999997 6277500.117899999)
-152961;488878;Support;12710.0;107.2.001;;;POINT (770385.925499998 6277695.683400001)
-152962;488879;Support;12710.0;107.2.002;;;POINT (770367.6344999969 6277708.101300001)
-152963;875297;Support;;107.2.003;;;POINT (770356.5512000024 6277709.9629999995)
-152964;488880;Support;12710.0;107.2.004;;;POINT (770345.7652999982 6277710.5537)
-152965;488881;Support;12710.0;107.2.005;;;POINT (770330.7771999985 6277711.2423)
-152966;488882;Support;12710.0;107.2.006;;;POINT (770310.8215000033 6277712.343600001)
-152967;488883;Support;12710.0;107.2.007;;;POINT (770291.3936000019 6277713.293099999)
-152968;488884;Support;12710.0;107.2.008;;;POINT (770273.2868999988 6277716.679400001)
-152969;488885;Support;12710.0;107.2.009;;;POINT (770257.7427999973 6277726.740200002)
-152970;488886;Support;12710.0;107.2.010;;;POINT (770243.7867000028 6277738.671399999)
-152971;488887;Support;12710.0;107.2.011;;;POINT (770230.6599000022 6277750.183699999)
-152996;875301;Support;;107.5.001;;;POINT (770419.7131000012 6277700.520199999)
-152997;490268;Support;11869.0;107.5.002;;;POINT (770432.5175999999 6277713.419)
-152998;490285;Support;11869.0;107.5.003;;;POINT (770454.8642000034 6277693.194800001)
-152999;490284;Support;11869.0;107.5.004;;;POINT (770479.753899999 6277671.361000001)
-153000;490283;Support;11869.0;107.5.005;;;POINT (770505.2885000035 6277648.851599999)
-153001;490267;Support;11869.0;107.5.006;;;POINT (770527.5 6277629.382100001)
-153002;490269;Support;13302.0;107.5.007;;;POINT (770458.4012999982 6277745.415899999)
-153003;490286;Support;13302.0;107.5.008;;;POINT (770475.5421999991 6277764.3609)
-153004;490287;Support;13302.0;107.5.009;;;POINT (770495.5355999991 6277787.184799999)
-153005;490289;Support;13302.0;107.5.010;;;POINT (770518.8422999978 6277813.7993)
-153006;490270;Support;11638.0;107.5.011;;;POINT (770534.4433000013 6277832.378699999)
-153007;490288;Support;12730.0;107.5.012;;;POINT (770426.421099998 6277767.839899998)
-153008;490271;Support;12730.0;107.5.013;;;POINT (770395.4888999984 6277795.181600001)
-153009;490272;Support;12730.0;107.5.014;;;POINT (770366.3827999979 6277820.4617)
-153010;490290;Support;13032.0;107.5.015;;;POINT (770393.2631999999 6277818.9318)
-153011;490291;Support;13032.0;107.5.016;;;POINT (770412.9060000032 6277841.9366)
-153012;490292;Support;13032.0;107.5.017;;;POINT (770387.864699997 6277863.8411)
-153013;490273;Support;13032.0;107.5.018;;;POINT (770371.2413000017 6277873.0320000015)
-153014;490293;Support;;107.5.019;;;POINT (770367.5498000011 6277887.0614)
-153015;490294;Support;;107.5.020;;;POINT (770337.9605000019 6277912.940000001)
-153016;490274;Support;;107.5.021;;;POINT (770307.2153000012 6277939.454999998)
-153017;490295;Support;14007.0;107.5.022;;;POINT (770339.1564000025 6277836.0317)
-153018;490281;Support;14007.0;107.5.023;;;POINT (770318.1454000026 6277811.780000001)
-153019;490297;Support;14007.0;107.5.024;;;POINT (770291.8570000008 6277781.7806)
-153020;490298;Support;14007.0;107.5.025;;;POINT (770276.1159000024 6277764.1215)
-153021;490275;Support;14007.0;107.5.026;;;POINT (770256.7897000015 6277742.068799999)
-153022;490279;Support;14007.0;107.5.027;;;POINT (770321.9258999974 6277821.8444)
-153023;490280;Support;13032.0;107.5.028;;;POINT (770340.3295999989 6277842.470400002)
-153044;490277;Support;;107.5.029;;;POINT (770286.0314000025 6277824.570500001)
-153045;490276;Support;;107.5.030;;;POINT (770300.420599997 6277812.238400001)
-153046;490282;Support;;107.5.031;;;POINT (770310.4399000034 6277869.659699999)
-153048;490296;Support;;107.5.032;;;POINT (770269.1001000032 6277838.934700001)
-153050;490278;Support;;107.5.033;;;POINT (770252.5802000016 6277853.1219)
-158823;996578;Support;;104.1.001;;;POINT (770506.5188999996 6277859.697700001)
-158824;484953;Support;13491.0;104.1.004;;;POINT (770442.4196999967 6277876.275600001)
-158825;484954;Support;13491.0;104.1.005;;;POINT (770419.747299999 6277897.3935)
-158826;484955;Support;13491.0;104.1.006;;;POINT (770392.5879999995 6277922.589299999)
-158827;484956;Support;13491.0;104.1.007;;;POINT (770363.5363999978 6277949.565699998)
-158828;484957;Support;13262.0;104.1.008;;;POINT (770336.9211999997 6277974.0174)
-158829;996582;Support;;104.2.001;;;POINT (770524.0734999999 6277876.640700001)
-158831;996592;Support;;104.2.005;;;POINT (770616.576700002 6277789.260600001)
-158832;653541;Support;11557.0;105.5.004;;;POINT (770659.5574999973 6277747.0757)
-158833;996595;Support;;;;;POINT (770568.1199000031 6277835.1908)
-158834;996596;Support;;;;;POINT (770544.1000000015 6277858.1576000005)
-158902;653537;Support;11138.0;105.5.003;;;POINT (770637.9250999987 6277725.940099999)
-158903;653533;Support;11138.0;105.5.002;;;POINT (770614.0710999966 6277700.226500001)
-158904;653529;Support;11138.0;105.5.001;;;POINT (770636.2166000009 6277679.458900001)
-160591;488840;Support;;101.5.015;;;POINT (770165.3537999988 6277808.582899999)
-""")
+        _sio = AbstractGeoDataFrameDemos._dataset(
+            "GeoDataFrameDemosC", "irisTastavinStreetlights.csv"
+        )
         return GeoDataFrameLib.read_csv(_sio)
 
     @staticmethod
@@ -738,214 +124,9 @@ TRONROUT0000000044845892;Route à 1 chaussée;AV DE VILLENEUVE ANGOULEME;AV DE V
         trees = read_file("./MMM_MTP_Arbres.shp", mask=iris)
         trees.to_csv('/tmp/tastavin.csv', sep=';', index=False)
         '''
-        _sio = StringIO("""id_arbre;adresse;quartier;secteur;commune;nom_commun;nom_latin;type;geometry
-94.29;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770245.3883999749 6277875.102402575)
-94.34;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770223.6037999704 6277849.006302574)
-94.102;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770156.2077999726 6277820.981302574)
-94.104;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770218.1576999738 6277872.9466025755)
-94.106;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770229.5037999689 6277863.302402575)
-94.107;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770234.2691999688 6277869.429302573)
-174.13;Boulevard Pedro de Luna;Sud;Croix d'Argent;Montpellier;Palmier à jupon;Washingtonia filifera;;POINT (770441.1091999724 6277652.945102572)
-94.2;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770196.4865999683 6277803.281302576)
-94.4;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770203.8614999742 6277812.131302573)
-94.5;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770207.492299968 6277816.6698025735)
-94.6;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770211.236499974 6277821.208202574)
-94.8;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770218.7249999731 6277830.171702576)
-94.9;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770222.3556999727 6277834.710102572)
-94.10;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770225.986499974 6277839.248602573)
-94.11;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770233.5883999704 6277848.325502574)
-94.12;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770237.2191999718 6277852.750502577)
-94.13;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770240.736499974 6277857.175502577)
-94.14;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770244.7075999691 6277861.827402574)
-94.15;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770251.5152999698 6277870.223502573)
-94.16;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770255.5998999714 6277875.102402575)
-94.17;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770259.5710999682 6277879.981202574)
-94.18;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770263.5421999707 6277884.860002575)
-94.19;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770267.7402999713 6277889.852302575)
-94.20;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770271.7113999738 6277894.844602575)
-94.21;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770278.2921999707 6277902.786902575)
-94.23;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770288.6171999737 6277915.381102574)
-94.24;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770293.8363999738 6277921.5080025755)
-94.25;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770266.0383999735 6277899.723502574)
-94.26;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770257.6421999722 6277889.8523025755)
-94.27;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770253.5575999706 6277884.973502573)
-94.28;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770249.6998999729 6277880.094702576)
-94.31;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770238.5806999742 6277866.933102575)
-94.33;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770227.2345999718 6277853.431202576)
-94.36;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770216.1153999731 6277840.156302575)
-94.37;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770212.3710999726 6277835.617802574)
-94.39;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770204.8826999753 6277826.654402574)
-94.40;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770201.0249999702 6277822.002502576)
-94.42;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770193.8769999682 6277813.379402574)
-94.44;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770186.1615999728 6277804.1890025735)
-94.45;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770182.5307999715 6277799.764002574)
-94.46;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770159.2711999728 6277810.996702574)
-94.47;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770162.9019999742 6277815.421702577)
-94.48;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770166.532799968 6277819.846702577)
-94.49;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770170.2769999743 6277824.385102575)
-94.50;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770173.7942999691 6277828.696702573)
-94.51;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770177.3115999714 6277833.008202576)
-94.52;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770180.9423999727 6277837.433202576)
-94.54;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770188.2038999737 6277846.283202575)
-94.55;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770192.0615999713 6277850.821602577)
-94.56;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770195.6922999709 6277855.246602573)
-94.57;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770199.0961999685 6277859.558202577)
-94.59;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770206.2441999704 6277868.181202576)
-94.60;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770209.7614999725 6277872.4927025745)
-94.61;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770213.392299974 6277876.804302573)
-94.63;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770220.4268999711 6277885.540802576)
-94.64;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770224.2845999687 6277890.079302575)
-94.65;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770228.142299974 6277894.844602574)
-94.67;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770236.1979999706 6277904.3754025735)
-94.69;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770246.6364999725 6277915.721502578)
-94.70;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770250.4941999703 6277919.806102574)
-94.72;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770258.3229999705 6277928.088802572)
-94.73;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770262.747999975 6277932.854202577)
-94.74;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770267.8536999687 6277946.1292025745)
-94.76;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770257.9825999751 6277937.392602575)
-94.77;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770252.8767999723 6277933.421502575)
-94.82;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770230.5249999701 6277909.140802573)
-94.83;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770226.3268999695 6277904.035002573)
-94.84;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770222.4691999718 6277899.496502575)
-94.85;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770218.4980999692 6277894.958102575)
-94.87;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770210.7826999738 6277886.221602574)
-94.88;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770207.2653999715 6277882.023502573)
-94.89;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770203.7480999694 6277877.598502574)
-94.93;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770189.2249999732 6277860.579302575)
-94.94;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770185.5942999736 6277856.154302574)
-94.95;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770181.8500999748 6277851.615902574)
-94.96;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770178.1057999744 6277847.077402574)
-94.97;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770174.4750999749 6277842.879302575)
-94.98;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770170.9577999726 6277838.454302576)
-94.99;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770167.3269999713 6277834.142802575)
-94.101;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770159.9519999713 6277825.406302576)
-94.108;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770230.4114999711 6277872.719702575)
-94.109;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770226.6672999724 6277875.896602576)
-94.110;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770222.8095999747 6277879.073502575)
-94.112;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770281.0152999698 6277924.0042025745)
-94.114;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770286.1209999709 6277944.540702575)
-94.116;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770310.0613999679 6277962.127202576)
-94.117;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770314.4863999723 6277967.006002574)
-94.118;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770323.4497999712 6277976.763702576)
-94.120;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770332.867099972 6277986.748302575)
-94.121;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770337.0651999726 6277991.286802575)
-94.123;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770347.16319997 6278001.838702574)
-94.125;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770358.7362999707 6278014.432902575)
-94.126;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770364.2958999737 6278020.332902573)
-94.128;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770366.5650999709 6278007.965602573)
-94.129;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770359.7573999702 6278000.477102574)
-94.130;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770354.6516999691 6277994.917502575)
-94.131;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770349.4323999747 6277989.698302575)
-94.132;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770344.4400999709 6277984.138702574)
-94.134;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770334.7958999737 6277975.629102573)
-94.135;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770330.1439999728 6277970.636802573)
-94.103;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770152.6904999703 6277816.6698025735)
-174.14;Boulevard Pedro de Luna;Sud;Croix d'Argent;Montpellier;Palmier à jupon;Washingtonia filifera;;POINT (770434.1880999743 6277658.277702574)
-174.15;Boulevard Pedro de Luna;Sud;Croix d'Argent;Montpellier;Palmier à jupon;Washingtonia filifera;;POINT (770428.1745999693 6277663.837302575)
-174.16;Boulevard Pedro de Luna;Sud;Croix d'Argent;Montpellier;Palmier à jupon;Washingtonia filifera;;POINT (770420.6861999719 6277669.510402575)
-94.133;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770339.3343999698 6277980.621402574)
-512.15;Rue Vincent Euvrard;Sud;Croix d'Argent;Montpellier;Peuplier d'Italie;Populus nigra 'Italica';;POINT (770381.3150999709 6277716.710302575)
-406.5;Rue Émile Chartier dit Alain;Sud;Croix d'Argent;Montpellier;Tilleul argenté;Tilia tomentosa;;POINT (770293.155599968 6277828.9236025745)
-406.7;Rue Émile Chartier dit Alain;Sud;Croix d'Argent;Montpellier;Tilleul argenté;Tilia tomentosa;;POINT (770303.480599971 6277840.8370025745)
-406.9;Rue Émile Chartier dit Alain;Sud;Croix d'Argent;Montpellier;Tilleul argenté;Tilia tomentosa;;POINT (770310.1747999727 6277834.710102574)
-406.23;Rue Émile Chartier dit Alain;Sud;Croix d'Argent;Montpellier;Tilleul argenté;Tilia tomentosa;;POINT (770341.1497999742 6277869.542802575)
-406.27;Rue Émile Chartier dit Alain;Sud;Croix d'Argent;Montpellier;Tilleul argenté;Tilia tomentosa;;POINT (770322.0882999687 6277885.087002577)
-409.1;Rue Émile Chartier dit Alain;Sud;Croix d'Argent;Montpellier;Prunier de Pissard;Prunus cerasifera 'Pissardii';;POINT (770257.188399972 6277746.664102572)
-409.2;Rue Émile Chartier dit Alain;Sud;Croix d'Argent;Montpellier;Prunier de Pissard;Prunus cerasifera 'Pissardii';;POINT (770261.613399969 6277751.656402574)
-94.105;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770225.6460999713 6277866.592802574)
-94.78;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770248.9056999699 6277929.336902574)
-94.113;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770280.4479999705 6277938.300302573)
-94.7;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770215.0941999718 6277825.746702575)
-94.71;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770254.4652999728 6277923.890702575)
-406.12;Rue Émile Chartier dit Alain;Sud;Croix d'Argent;Montpellier;Tilleul argenté;Tilia tomentosa;;POINT (770322.655599968 6277846.850502574)
-406.20;Rue Émile Chartier dit Alain;Sud;Croix d'Argent;Montpellier;Tilleul argenté;Tilia tomentosa;;POINT (770343.7593999743 6277851.956202573)
-512.4;Rue Vincent Euvrard;Sud;Croix d'Argent;Montpellier;Sophora du Japon;Sophora japonica;;POINT (770357.7150999694 6277734.296802574)
-512.6;Rue Vincent Euvrard;Sud;Croix d'Argent;Montpellier;Pin d'Alep;Pinus halepensis;;POINT (770342.2843999728 6277722.610302576)
-512.8;Rue Vincent Euvrard;Sud;Croix d'Argent;Montpellier;Laurier;Laurus nobilis;;POINT (770339.6747999727 6277714.6680025775)
-512.9;Rue Vincent Euvrard;Sud;Croix d'Argent;Montpellier;Prunier de Pissard;Prunus cerasifera 'Pissardii';;POINT (770353.5170999705 6277716.710302574)
-512.13;Rue Vincent Euvrard;Sud;Croix d'Argent;Montpellier;Prunier de Pissard;Prunus cerasifera 'Pissardii';;POINT (770372.6919999733 6277716.143002573)
-512.16;Rue Vincent Euvrard;Sud;Croix d'Argent;Montpellier;Pin d'Alep;Pinus halepensis;;POINT (770383.8111999719 6277719.773802577)
-512.19;Rue Vincent Euvrard;Sud;Croix d'Argent;Montpellier;Pin d'Alep;Pinus halepensis;;POINT (770394.4765999704 6277731.119902574)
-512.20;Rue Vincent Euvrard;Sud;Croix d'Argent;Montpellier;Pin d'Alep;Pinus halepensis;;POINT (770397.8803999736 6277740.196802576)
-512.22;Rue Vincent Euvrard;Sud;Croix d'Argent;Montpellier;Pin d'Alep;Pinus halepensis;;POINT (770402.4188999697 6277745.302602574)
-512.23;Rue Vincent Euvrard;Sud;Croix d'Argent;Montpellier;Pin d'Alep;Pinus halepensis;;POINT (770403.8938999712 6277740.196802576)
-512.24;Rue Vincent Euvrard;Sud;Croix d'Argent;Montpellier;Pin d'Alep;Pinus halepensis;;POINT (770406.2765999748 6277749.500702576)
-512.1;Rue Vincent Euvrard;Sud;Croix d'Argent;Montpellier;Robinier faux-acacia;Robinia pseudoacacia;;POINT (770340.4689999684 6277807.819802577)
-566.1;;Sud;Croix d'Argent;Montpellier;Érable negundo;Acer negundo;;POINT (770281.4690999702 6277863.415802575)
-566.2;;Sud;Croix d'Argent;Montpellier;Lilas des Indes;Lagerstroemia indica;;POINT (770277.8382999687 6277860.238902574)
-406.10;Rue Émile Chartier dit Alain;Sud;Croix d'Argent;Montpellier;Tilleul argenté;Tilia tomentosa;;POINT (770314.2593999743 6277831.646702573)
-406.18;Rue Émile Chartier dit Alain;Sud;Croix d'Argent;Montpellier;Tilleul argenté;Tilia tomentosa;;POINT (770333.2074999749 6277859.898502572)
-94.79;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770244.8210999683 6277925.138802573)
-94.92;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770192.9692999736 6277864.890802573)
-406.24;Rue Émile Chartier dit Alain;Sud;Croix d'Argent;Montpellier;Tilleul argenté;Tilia tomentosa;;POINT (770336.1574999704 6277873.854302575)
-94.124;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770352.1554999738 6278007.398302574)
-94.91;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770196.4865999683 6277869.202402573)
-94.115;Allée Maurice Bonafos;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770300.98449997 6277970.977202577)
-406.4;Rue Émile Chartier dit Alain;Sud;Croix d'Argent;Montpellier;Tilleul argenté;Tilia tomentosa;;POINT (770297.0132999732 6277824.725502575)
-94.3;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770200.2307999744 6277807.706302577)
-94.30;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770241.9845999718 6277871.017702576)
-94.35;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770219.8595999718 6277844.467802573)
-94.38;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770208.740399973 6277831.079402574)
-94.66;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770231.8864999725 6277899.4965025745)
-94.75;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770263.3152999743 6277942.044502575)
-94.122;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770342.1708999737 6277996.506002575)
-94.136;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770325.605599971 6277965.758002575)
-94.100;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770163.809699969 6277829.944702574)
-94.111;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770273.4132999717 6277930.6984025715)
-512.10;Rue Vincent Euvrard;Sud;Croix d'Argent;Montpellier;Prunier de Pissard;Prunus cerasifera 'Pissardii';;POINT (770361.1189999743 6277716.596902575)
-512.12;Rue Vincent Euvrard;Sud;Croix d'Argent;Montpellier;Mûrier platane;Morus australis;;POINT (770369.6285999729 6277719.887202577)
-406.8;Rue Émile Chartier dit Alain;Sud;Croix d'Argent;Montpellier;Tilleul argenté;Tilia tomentosa;;POINT (770307.2247999697 6277837.887002572)
-406.14;Rue Émile Chartier dit Alain;Sud;Croix d'Argent;Montpellier;Tilleul argenté;Tilia tomentosa;;POINT (770314.8266999735 6277853.885102574)
-406.16;Rue Émile Chartier dit Alain;Sud;Croix d'Argent;Montpellier;Tilleul argenté;Tilia tomentosa;;POINT (770325.9458999722 6277866.365802577)
-512.7;Rue Vincent Euvrard;Sud;Croix d'Argent;Montpellier;Pin d'Alep;Pinus halepensis;;POINT (770334.4554999708 6277713.873802572)
-512.21;Rue Vincent Euvrard;Sud;Croix d'Argent;Montpellier;Pin d'Alep;Pinus halepensis;;POINT (770401.2842999711 6277737.133402576)
-94.22;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770283.3978999718 6277909.140802574)
-406.3;Rue Émile Chartier dit Alain;Sud;Croix d'Argent;Montpellier;Tilleul argenté;Tilia tomentosa;;POINT (770301.0978999748 6277821.094802572)
-406.11;Rue Émile Chartier dit Alain;Sud;Croix d'Argent;Montpellier;Tilleul argenté;Tilia tomentosa;;POINT (770325.9458999722 6277843.900502576)
-406.26;Rue Émile Chartier dit Alain;Sud;Croix d'Argent;Montpellier;Tilleul argenté;Tilia tomentosa;;POINT (770325.605599971 6277882.3639025735)
-94.32;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770234.722999969 6277862.394702573)
-94.41;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770197.2807999714 6277817.577502576)
-406.2;Rue Émile Chartier dit Alain;Sud;Croix d'Argent;Montpellier;Tilleul argenté;Tilia tomentosa;;POINT (770304.5017999723 6277818.371702576)
-512.5;Rue Vincent Euvrard;Sud;Croix d'Argent;Montpellier;Cyprès d'Italie;Cupressus sempervirens 'Stricta';;POINT (770371.8977999701 6277734.864102578)
-94.1;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770192.742299968 6277798.742902573)
-406.1;Rue Émile Chartier dit Alain;Sud;Croix d'Argent;Montpellier;Tilleul argenté;Tilia tomentosa;;POINT (770310.5151999681 6277814.173602574)
-94.43;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770189.9057999714 6277808.614002577)
-94.86;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770214.753799969 6277890.419602573)
-94.137;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770321.180599974 6277960.879102575)
-406.15;Rue Émile Chartier dit Alain;Sud;Croix d'Argent;Montpellier;Tilleul argenté;Tilia tomentosa;;POINT (770322.0882999687 6277869.656202573)
-406.21;Rue Émile Chartier dit Alain;Sud;Croix d'Argent;Montpellier;Tilleul argenté;Tilia tomentosa;;POINT (770349.5458999737 6277861.713902575)
-512.18;Rue Vincent Euvrard;Sud;Croix d'Argent;Montpellier;Pin d'Alep;Pinus halepensis;;POINT (770389.2573999702 6277732.821802576)
-94.58;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770202.6134999708 6277863.869702574)
-566.3;;Sud;Croix d'Argent;Montpellier;Lilas des Indes;Lagerstroemia indica;;POINT (770262.0671999692 6277875.442702575)
-406.6;Rue Émile Chartier dit Alain;Sud;Croix d'Argent;Montpellier;Tilleul argenté;Tilia tomentosa;;POINT (770289.184499973 6277832.214002577)
-512.17;Rue Vincent Euvrard;Sud;Croix d'Argent;Montpellier;Pin d'Alep;Pinus halepensis;;POINT (770386.9880999713 6277723.518002575)
-406.13;Rue Émile Chartier dit Alain;Sud;Croix d'Argent;Montpellier;Tilleul argenté;Tilia tomentosa;;POINT (770318.5709999739 6277850.367802576)
-406.17;Rue Émile Chartier dit Alain;Sud;Croix d'Argent;Montpellier;Tilleul argenté;Tilia tomentosa;;POINT (770329.4631999745 6277864.096602574)
-406.19;Rue Émile Chartier dit Alain;Sud;Croix d'Argent;Montpellier;Tilleul argenté;Tilia tomentosa;;POINT (770337.6324999719 6277856.040902575)
-406.22;Rue Émile Chartier dit Alain;Sud;Croix d'Argent;Montpellier;Tilleul argenté;Tilia tomentosa;;POINT (770345.9150999724 6277865.458102574)
-94.81;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770236.7652999698 6277916.629202576)
-94.119;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770327.9882999747 6277981.642602573)
-94.138;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770316.7555999695 6277956.1138025755)
-406.25;Rue Émile Chartier dit Alain;Sud;Croix d'Argent;Montpellier;Tilleul argenté;Tilia tomentosa;;POINT (770331.2785999714 6277878.506202576)
-94.80;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770240.8498999714 6277921.054202576)
-94.127;;Sud;Croix d'Argent;Montpellier;Platane;Platanus sp.;;POINT (770371.6708999737 6278013.5252025705)
-512.2;Rue Vincent Euvrard;Sud;Croix d'Argent;Montpellier;Érable negundo;Acer negundo;;POINT (770371.7842999711 6277748.819902574)
-512.30;Rue Vincent Euvrard;Sud;Croix d'Argent;Montpellier;;;;POINT (770330.9611999705 6277807.246702575)
-512.31;Rue Vincent Euvrard;Sud;Croix d'Argent;Montpellier;;;;POINT (770341.7892999738 6277797.378002574)
-512.32;Rue Vincent Euvrard;Sud;Croix d'Argent;Montpellier;;;;POINT (770326.300899969 6277797.9263025755)
-512.33;Rue Vincent Euvrard;Sud;Croix d'Argent;Montpellier;;;;POINT (770333.8394999742 6277791.758302573)
-512.34;Rue Vincent Euvrard;Sud;Croix d'Argent;Montpellier;;;;POINT (770340.6927999719 6277776.132802576)
-512.35;Rue Vincent Euvrard;Sud;Croix d'Argent;Montpellier;;;;POINT (770349.739199975 6277778.737102575)
-512.36;Rue Vincent Euvrard;Sud;Croix d'Argent;Montpellier;;;;POINT (770320.4070999711 6277787.372202576)
-512.3;Rue Vincent Euvrard;Sud;Croix d'Argent;Montpellier;;;;POINT (770326.0267999708 6277781.204202573)
-512.11;Rue Vincent Euvrard;Sud;Croix d'Argent;Montpellier;;;;POINT (770303.6850999682 6277773.391502574)
-512.14;Rue Vincent Euvrard;Sud;Croix d'Argent;Montpellier;;;;POINT (770318.0769999712 6277761.466802576)
-512.25;Rue Vincent Euvrard;Sud;Croix d'Argent;Montpellier;;;;POINT (770326.0267999708 6277753.928202574)
-512.26;Rue Vincent Euvrard;Sud;Croix d'Argent;Montpellier;;;;POINT (770292.5827999725 6277765.715802573)
-512.27;Rue Vincent Euvrard;Sud;Croix d'Argent;Montpellier;;;;POINT (770299.298999974 6277765.030502573)
-512.28;Rue Vincent Euvrard;Sud;Croix d'Argent;Montpellier;;;;POINT (770305.3298999681 6277758.451402574)
-512.29;Rue Vincent Euvrard;Sud;Croix d'Argent;Montpellier;;;;POINT (770323.0113999709 6277740.769902577)
-""")
+        _sio = AbstractGeoDataFrameDemos._dataset(
+            "GeoDataFrameDemosC", "irisTastavinTrees.csv"
+        )
         return GeoDataFrameLib.read_csv(_sio)
 
     @staticmethod
@@ -21,7 +21,6 @@ You should have received a copy of the GNU General Public License
 along with t4gpd.  If not, see <https://www.gnu.org/licenses/>.
 '''
 import matplotlib.pyplot as plt
-from io import StringIO
 
 from t4gpd.commons.GeoDataFrameLib import GeoDataFrameLib
 from t4gpd.demos.AbstractGeoDataFrameDemos import AbstractGeoDataFrameDemos
@@ -54,9 +53,9 @@ BDT_3-3_SHP_LAMB93_D035-ED2024-03-15/ADMINISTRATIF/EPCI.shp")
         roi.reset_index(drop=True, inplace=True)
         roi.to_csv('/tmp/metropole.csv', sep=';', index=False)
         '''
-        _sio = StringIO("""ID;CODE_SIREN;NATURE;NOM;DATE_CREAT;DATE_MAJ;DATE_APP;DATE_CONF;ID_AUT_ADM;geometry
-EPCI____0000002150236854;243500139;Métropole;Rennes Métropole;2018-11-24 00:00:00;2024-02-09 11:33:33;;;SURFACTI0000000114555924;POLYGON ((331201.9 6784001.1, 331174.1 6784119.7, 331179.6 6784174.6, 331195 6784224.4, 331195.4 6784279.4, 331176.1 6784359.5, 331176.8 6784452.8, 331177 6784469.4, 331182.3 6784504.3, 331177.6 6784539.4, 331158.1 6784561, 331128 6784594.7, 331123.2 6784619.7, 331083.5 6784645.1, 331058.8 6784680.2, 331044.3 6784740.3, 331033.3 6784860.3, 331032.2 6784883.1, 331026.5 6785005.3, 331006.8 6785040.4, 330937.2 6785090.9, 330922.5 6785126, 330867.8 6785156.5, 330809.6 6785226.1, 330805.9 6785233.8, 330758.8 6785272.3, 330724.1 6785297.5, 330664.1 6785303, 330658.5 6785353.2, 330659.7 6785353.1, 330659.9 6785378.1, 330660 6785393.7, 330663.2 6785406.2, 330671 6785410.8, 330692.9 6785410.6, 330710.2 6785418.3, 330738.4 6785433.6, 330757.3 6785449.2, 330779.2 6785458.3, 330790.2 6785469.2, 330798.1 6785480, 330809 6785484.6, 330820 6785484.5, 330826.3 6785490.7, 330831 6785493.8, 330838.8 6785493.8, 330857.6 6785492, 330867 6785493.5, 330873.3 6785507.5, 330879.6 6785513.7, 330887.5 6785524.6, 330895.4 6785532.3, 330900.1 6785541.6, 330900.2 6785554.1, 330900.3 6785563.5, 330905 6785568.2, 330917.5 6785568.1, 330931.5 6785564.8, 330939.3 6785560.1, 330948.6 6785555.3, 330954.9 6785550.6, 330962.6 6785544.2, 330968 6785549.2, 330981.4 6785561.3, 330987.8 6785567.5, 330998.7 6785573.6, 331015.9 6785575.1, 331022.2 6785581.2, 331026.9 6785585.9, 331037.9 6785588.9, 331042.6 6785592, 331047.4 6785613.8, 331049.1 6785623.2, 331061.7 6785638.7, 331069.6 6785649.6, 331071.3 6785660.5, 331066.6 6785665.2, 331066.7 6785676.1, 331077.7 6785685.4, 331087.2 6785694.7, 331101.8 6785700.7, 331115.9 6785697.4, 331126.7 6785697.3, 331131.5 6785701.9, 331128.5 6785717.7, 331122.3 6785723.9, 331122.3 6785731.7, 331128.7 6785742.6, 331133.5 6785753.5, 331133.6 6785769.1, 331136.8 6785781.5, 331144.7 6785794, 331147.9 6785806.4, 331149.6 6785818.9, 331157.5 6785832.9, 331160.8 6785850.1, 331164.1 6785864.1, 331168.8 6785870.3, 331179.7 6785867.1, 331192.2 6785867, 331198.4 6785870.1, 331201.7 6785877.8, 331203.3 6785890.3, 331198.7 6785899.8, 331190.9 6785909.1, 331178.5 6785917.1, 331173.9 6785924.9, 331170.8 6785932.8, 331170.9 6785940.6, 331175.7 6785957.7, 331188.4 6785976.3, 331191.6 6785988.8, 331196.4 6785998.1, 331215.2 6786010.4, 331234.1 6786029.1, 331243.6 6786043, 331253.1 6786052.3, 331260.8 6786077.6, 331270.2 6786085.4, 331279.5 6786080.7, 331290.4 6786075.9, 331299.7 6786075.8, 331307.7 6786086.6, 331307.8 6786100.7, 331306.3 6786111.6, 331311.1 6786117.9, 331317.3 6786119.3, 331325 6786116.2, 331337.5 6786108.3, 331348.4 6786097.3, 331354.5 6786091, 331362.3 6786090.9, 331373.4 6786098.6, 331384.3 6786106.3, 331387.5 6786115.7, 331396.9 6786115.6, 331415.7 6786113.8, 331425 6786115.4, 331434.4 6786120, 331442.3 6786127.7, 331448.6 6786130.8, 331453.2 6786124.5, 331461 6786118.2, 331470.4 6786118.1, 331473.5 6786122.8, 331476.7 6786132.1, 331475.2 6786147.7, 331476.9 6786157.1, 331484.7 6786161.7, 331495.7 6786161.7, 331501.9 6786164.7, 331503.6 6786174.1, 331506.7 6786180.3, 331511.5 6786184.9, 331517.7 6786186.5, 331524 6786184.8, 331530.1 6786175.4, 331542.5 6786162.8, 331553.4 6786154.9, 331562.7 6786151.7, 331569 6786153.3, 331578.4 6786161, 331586.3 6786170.3, 331594.2 6786184.2, 331600.5 6786198.3, 331613.3 6786237.1, 331626.1 6786271.4, 331634.2 6786301, 331640.7 6786332.3, 331644 6786360.3, 331648.9 6786388.3, 331649 6786396.1, 331656.9 6786407.1, 331671 6786410.1, 331686.6 6786409.9, 331692.9 6786413, 331702.9 6786419, 331713.3 6786425.3, 331727.4 6786436.1, 331746.2 6786442.2, 331764.9 6786446.8, 331783.7 6786443.5, 331791.4 6786435.6, 331802.3 6786432.4, 331810.2 6786437, 331816.5 6786441.6, 331825.9 6786443.2, 331841.4 6786432, 331855.4 6786424.1, 331867.9 6786419.3, 331877.2 6786428.7, 331888.3 6786442.7, 331899.3 6786453.5, 331914.9 6786456.4, 331929 6786457.9, 331938.5 6786462.5, 331946.2 6786459.3, 331955.6 6786454.6, 331969.6 6786463.8, 331976 6786476.2, 331983.9 6786480.9, 331993.3 6786482.4, 331999.4 6786476, 331997.8 6786465.1, 331999.2 6786454.2, 332005.5 6786447.9, 332016.4 6786447.8, 332030.5 6786454, 332049.3 6786461.6, 332063.4 6786467.7, 332077.5 6786477, 332083.9 6786489.4, 332090.1 6786495.6, 332107.3 6786497, 332118.3 6786496.9, 332146.5 6786504.5, 332163.7 6786516.9, 332177.9 6786530.8, 332184.3 6786543.3, 332190.6 6786566.6, 332192.3 6786576, 332197.1 6786582.1, 332204.9 6786586.8, 332206.5 6786593.1, 332206.6 6786602.5, 332205.1 6786607.1, 332206.7 6786611.7, 332222.3 6786610.1, 332234.8 6786610, 332242.6 6786614.6, 332244.9 6786618.4, 332250.5 6786627.1, 332258.4 6786645.7, 332261.8 6786664.5, 332265 6786672.2, 332269.7 6786676.9, 332282.2 6786679.9, 332293 6786670.4, 332300.7 6786659.4, 332310.1 6786651.6, 332317.9 6786653, 332319.5 6786662.4, 332325.8 6786667, 332336.7 6786662.2, 332346 6786657.5, 332357 6786660.5, 332358.6 6786671.5, 332358.7 6786687.1, 332358.8 6786701.1, 332352.7 6786712.1, 332349.7 6786718.3, 332348.1 6786727.7, 332354.4 6786732.4, 332368.5 6786730.6, 332384.1 6786732.1, 332406.7 6786729.5, 332427.1 6786726.3, 332445.8 6786727.7, 332453.5 6786715.2, 332469 6786702.5, 332486.1 6786699.2, 332509.6 6786703.7, 332519 6786716.1, 332530.1 6786727, 332539.6 6786733.1, 332548.9 6786736.2, 332556.7 6786734.6, 332556.5 6786720.5, 332561.1 6786700.2, 332570.4 6786687.6, 332589.1 6786679.7, 332610.9 6786679.5, 332623.4 6786687.2, 332629.9 6786702.7, 332637.7 6786705.8, 332647.1 6786705.7, 332654.8 6786702.5, 332665.8 6786716.5, 332669.1 6786730.5, 332667.7 6786749.3, 332664.8 6786774.3, 332677.3 6786791, 332677.9 6786798.9, 332679.5 6786809.4, 332681.4 6786811.8, 332682.4 6786816.6, 332683.2 6786821.5, 332682.9 6786825, 332682.2 6786828.7, 332681.2 6786832.3, 332678.9 6786835.9, 332676 6786838.6, 332673.7 6786840.2, 332670.4 6786843.1, 332667.8 6786845.8, 332664.8 6786848.8, 332662.3 6786851.2, 332660.5 6786854, 332659.4 6786857, 332659.5 6786860.6, 332660.2 6786863.7, 332661.5 6786866, 332663.2 6786868.7, 332665.1 6786870.9, 332666.9 6786873, 332668.8 6786874.6, 332670 6786876.2, 332670.2 6786878.4, 332668.9 6786880.6, 332665.9 6786882.2, 332662.7 6786883.6, 332659.9 6786885.6, 332658.5 6786888.3, 332659.3 6786891.6, 332660.5 6786895.5, 332661.6 6786899.9, 332662 6786903.3, 332661.5 6786906.3, 332660.6 6786908.9, 332658.9 6786911.9, 332656.8 6786913.6, 332654.2 6786913.9, 332650.5 6786914.8, 332646.6 6786916.3, 332643.1 6786918.6, 332639.5 6786922.3, 332636.1 6786926.6, 332634.6 6786929.8, 332633.7 6786933.1, 332632.8 6786936.6, 332632.1 6786940.5, 332632.2 6786944, 332632.4 6786947.1, 332633.1 6786949.5, 332635.2 6786952.5, 332638.2 6786955.3, 332642.5 6786957.8, 332647.2 6786959.6, 332652.3 6786961.3, 332658.2 6786964, 332660.4 6786964.9, 332662.4 6786966.9, 332663.2 6786969.2, 332663.6 6786971.9, 332663.9 6786973.2, 332666 6786976.9, 332667.9 6786978.6, 332672.8 6786980, 332674.4 6786979.8, 332677.3 6786980.9, 332678.2 6786983.2, 332678.5 6786986.5, 332678.7 6786989.4, 332678.4 6786991.4, 332677.3 6786993.3, 332675.3 6786995.3, 332672.9 6786997.1, 332670.3 6786998.3, 332667.7 6786999.1, 332664.4 6787000.2, 332661.2 6787000.5, 332656.9 6787000.7, 332653.4 6787000.9, 332650.1 6787001.2, 332646.9 6787001.6, 332644.2 6787001.9, 332641.8 6787003.6, 332640.2 6787005.8, 332640.4 6787007.9, 332641.3 6787011.3, 332642.3 6787014.9, 332643.9 6787018.6, 332645.5 6787021.7, 332648.4 6787025, 332650.9 6787027.6, 332653.8 6787029.9, 332655.7 6787031.3, 332663.3 6787038.6, 332666.6 6787038.7, 332671.5 6787040.4, 332675.7 6787042.6, 332681.5 6787045.9, 332688.4 6787051, 332693.9 6787053.6, 332697.2 6787054.9, 332697.9 6787055.2, 332742.1 6787068.9, 332767.2 6787082.7, 332779.7 6787090.4, 332787.6 6787095.1, 332795.3 6787093.4, 332800 6787085.6, 332809.3 6787076.1, 332829.2 6787072.8, 332837.1 6787071.6, 332875.9 6787061.8, 332919.8 6787047.5, 332931 6787044, 332944.3 6787036.3, 332979.2 6787010.1, 333000.7 6786997.5, 333027.4 6786979.2, 333035.4 6786976.2, 333037.6 6786975.4, 333056.7 6786977.3, 333075.5 6786980.3, 333091 6786963, 333101.9 6786953.5, 333093.8 6786934.8, 333093.7 6786922.3, 333110.9 6786917.6, 333123.3 6786912.8, 333131.1 6786908, 333146.8 6786904.8, 333170.2 6786909.2, 333177.9 6786906, 333182.7 6786909.1, 333189 6786915.3, 333196.8 6786920, 333207.7 6786918.3, 333229.6 6786916.6, 333245.2 6786918, 333259.3 6786917.8, 333271.8 6786919.3, 333288.3 6786915.6, 333301.4 6786912.8, 333320.1 6786914.3, 333353 6786924.9, 333381.1 6786929.3, 333393.6 6786926.1, 333415.4 6786915.1, 333430.9 6786910.2, 333445 6786910.1, 333454.5 6786919.4, 333474.8 6786925.5, 333487.2 6786919.1, 333495 6786909.7, 333497.9 6786894, 333504.1 6786881.5, 333510.3 6786883, 333513.6 6786895.5, 333515.3 6786911.1, 333521.6 6786920.4, 333534.2 6786928.1, 333542 6786926.5, 333548.1 6786917.1, 333560.6 6786917, 333565.3 6786923.1, 333571.7 6786934.1, 333577.9 6786938.7, 333584.2 6786929.3, 333594.9 6786913.6, 333604.3 6786905.6, 333629.3 6786913.3, 333640.3 6786930.3, 333652.9 6786944.3, 333667.1 6786953.6, 333676.5 6786956.6, 333689 6786956.5, 333709.2 6786947, 333721.7 6786945.4, 333745.2 6786956.1, 333767.1 6786965.3, 333790.6 6786979.1, 333809.5 6786993, 333814.3 6787000.8, 333814.4 6787013.2, 333814.5 6787027.3, 333814.7 6787047.6, 333817.9 6787057, 333824.1 6787061.6, 333839.7 6787053.6, 333859.9 6787042.6, 333881.7 6787037.7, 333859.1 6786987.6, 333857.9 6786970.1, 333857.4 6786945.5, 333857.1 6786914.8, 333858.5 6786889.1, 333867.5 6786863.5, 333899.7 6786868.5, 333924.8 6786875.3, 333954.9 6786785.6, 333959 6786772.9, 333960.5 6786762.9, 333961 6786758.7, 333963.3 6786734.6, 333967.4 6786709.7, 333970.6 6786691.9, 333972.8 6786674, 333974.5 6786657.6, 333976.1 6786639.8, 333978.6 6786616.3, 333982 6786597.6, 333983.9 6786584.5, 333984.1 6786570.7, 333981.8 6786557.8, 333977.9 6786542.6, 333973.4 6786526.4, 333969.3 6786513.7, 333964.2 6786495, 333958.4 6786474.2, 333953.8 6786455.1, 333949.5 6786438.4, 333945.7 6786419.5, 333942.4 6786402.3, 333938.2 6786384.7, 333934.4 6786365.2, 333930.3 6786345.2, 333926.3 6786327.2, 333922.5 6786311.7, 333918.4 6786293.2, 333913.8 6786277.4, 333908.1 6786256.8, 333902.5 6786241.6, 333897.2 6786227.2, 333894.5 6786221.2, 333891.2 6786214.3, 333886.1 6786198.7, 333881.6 6786183.1, 333876 6786168.1, 333868.4 6786141.7, 333861.5 6786118.1, 333853.5 6786094.9, 333845.8 6786073.9, 333837.5 6786047.2, 333834.5 6786033.2, 333830.4 6786015.2, 333826 6786000.8, 333821.9 6785982.5, 333820.7 6785968.1, 333821.2 6785954, 333821.4 6785939.7, 333821.3 6785925.3, 333820.6 6785908.9, 333818.4 6785890.9, 333815.7 6785871.2, 333814.1 6785853.8, 333812 6785836.8, 333811.2 6785817.6, 333812.5 6785804.3, 333815.5 6785793.8, 333821.4 6785783.1, 333828.7 6785773.9, 333837.4 6785764.8, 333846.4 6785754.4, 333854.6 6785743.9, 333860.7 6785734.5, 333867.9 6785722.7, 333872.7 6785715.8, 333870.9 6785705.2, 333869.4 6785696.9, 333866.7 6785686.1, 333862.7 6785673.1, 333858.1 6785659.9, 333852.2 6785645.6, 333846.7 6785632.1, 333841.7 6785616.8, 333837.4 6785600.6, 333835.3 6785588.5, 333834.5 6785577.4, 333834.5 6785576.3, 333831.7 6785562.9, 333826.3 6785549.4, 333820.9 6785536, 333815.4 6785523.6, 333808.1 6785507.2, 333802.1 6785492.2, 333796.3 6785475.2, 333792.6 6785463.6, 333788.1 6785447.5, 333782.1 6785432.7, 333777.1 6785417.9, 333773.2 6785403.6, 333768.9 6785385.1, 333763 6785363, 333757.2 6785341, 333752.4 6785319.4, 333749.9 6785300.7, 333749.4 6785285.4, 333748.5 6785270.2, 333747.1 6785256.3, 333744.7 6785238.9, 333743.2 6785225.1, 333740.9 6785204.8, 333739.1 6785186.6, 333738.1 6785168.1, 333738.8 6785150.2, 333738.9 6785135.7, 333739.3 6785115.7, 333740.3 6785098.7, 333740.9 6785084.8, 333739.3 6785080.7, 333734.3 6784963.2, 333717.4 6784820.1, 333717.2 6784808.8, 333716.5 6784797.9, 333714.3 6784784.5, 333711 6784770.3, 333707 6784754.6, 333702.8 6784738.8, 333698.8 6784722.1, 333695.9 6784705.3, 333692 6784687, 333688.6 6784671.8, 333686.1 6784658.1, 333684.4 6784645.6, 333681.7 6784631.5, 333679.6 6784618.9, 333677 6784605.7, 333675.2 6784594.5, 333673.5 6784583, 333672.9 6784571.8, 333673 6784560.9, 333673.9 6784547.9, 333676.4 6784537.4, 333677.2 6784527.4, 333676.2 6784521.8, 333789.5 6784574.1, 333973.2 6784556.9, 334008.5 6784569.7, 334035.7 6784559.3, 334418.8 6784626.7, 334674.9 6784670.6, 334682.1 6784650.6, 334691 6784633.7, 335071.8 6784782.8, 335096.2 6784774.4, 335109.6 6784851.4, 335186.5 6784886.3, 335267.9 6784972.9, 335369 6785237.8, 335681 6785417.9, 335855.5 6785556.2, 335987.7 6785554.8, 336036.1 6785553, 336095.7 6785497.8, 336131 6785552.1, 336147.3 6785530.4, 336161.7 6785549.3, 336182.5 6785525.4, 336232.9 6785543.9, 336237.4 6785528, 336282.6 6785524, 336797.6 6785574, 336930.9 6785609.7, 337089 6785755.7, 337080.9 6785754.7, 337073.4 6785754.7, 337064.9 6785756.1, 337057 6785758.3, 337048.6 6785761.8, 337034.5 6785768.9, 337022.4 6785776, 337001.2 6785790.3, 336979.2 6785806.2, 336963.1 6785819.1, 336955.9 6785826.3, 336950.7 6785834.9, 336945.7 6785848.2, 336942.8 6785861.8, 336939.5 6785880.5, 336935.3 6785899.2, 336932.2 6785910.3, 336924.7 6785929.1, 336918.3 6785946.2, 336914.7 6785963.2, 336910.9 6785983.1, 336906.4 6785998.7, 336900.8 6786017.2, 336897.8 6786028.3, 336895 6786038.3, 336892.1 6786046.6, 336889.9 6786052.1, 336887.2 6786056.9, 336884.8 6786059.6, 336881.3 6786062.2, 336876.9 6786063.7, 336872.4 6786064.3, 336865.4 6786064.3, 336860.8 6786063.5, 336855 6786062.6, 336846.5 6786061.7, 336841 6786061.4, 336830.1 6786061.7, 336820.1 6786062.4, 336803.8 6786064.8, 336788.8 6786066.9, 336780.3 6786067.2, 336769.3 6786066.7, 336765.1 6786066.1, 336753.5 6786064.1, 336736.8 6786060.6, 336728.4 6786059.6, 336716.9 6786061.3, 336702.1 6786066.1, 336694.9 6786070.2, 336689.1 6786075.4, 336670.9 6786097.3, 336655 6786114.6, 336638.6 6786127.9, 336628.6 6786134.3, 336600.2 6786147.3, 336576.9 6786155.2, 336551.1 6786166.5, 336540.8 6786175.3, 336525.2 6786190.2, 336494 6786209.4, 336481.2 6786215, 336469.8 6786217.4, 336461 6786220.1, 336454.2 6786223.6, 336444.9 6786232.3, 336414.4 6786264.9, 336394.8 6786285.3, 336382.8 6786301.2, 336374.9 6786317.9, 336366.9 6786338.5, 336359.5 6786353.2, 336345.9 6786372.2, 336327.6 6786393.4, 336319.5 6786406.9, 336319.2 6786422.2, 336322.9 6786443.3, 336325.2 6786460.7, 336325.2 6786473.4, 336323 6786485.5, 336320.3 6786517, 336321.7 6786546.2, 336322.3 6786551.1, 336335.5 6786612.5, 336340.3 6786625.4, 336343.7 6786641, 336345.5 6786654.3, 336347.2 6786667, 336347.9 6786680.6, 336347 6786701, 336341.8 6786721.8, 336333.8 6786742.1, 336327.6 6786750.6, 336318.8 6786755.1, 336313.6 6786756.2, 336305.9 6786756.9, 336299.2 6786757.2, 336290.3 6786757.7, 336284.6 6786758.2, 336277.2 6786762.8, 336273.1 6786764.9, 336270 6786767.1, 336266.8 6786769.9, 336264.4 6786772.6, 336260.2 6786781.3, 336256.8 6786794, 336257 6786830.7, 336263 6786861.6, 336266.2 6786888.7, 336266.1 6786918.4, 336259.4 6786963.1, 336254.8 6786996.6, 336247.7 6787026.9, 336242.9 6787049, 336237.4 6787066.4, 336230.8 6787081.6, 336220.7 6787098.5, 336205.9 6787114.1, 336192.2 6787127.5, 336181.2 6787140.8, 336175.1 6787159.9, 336172 6787182.3, 336168.4 6787197.3, 336162.2 6787212.8, 336151.1 6787228.4, 336139.5 6787242.3, 336126.9 6787254.1, 336110.4 6787264.1, 336092.2 6787273.5, 336072.6 6787278.7, 336045.6 6787284.4, 336025 6787291.9, 335999.6 6787303.5, 335975 6787312.9, 335945.8 6787319.5, 335921.4 6787324.5, 335894.6 6787327, 335872.1 6787324.9, 335854.8 6787320.2, 335837.7 6787308.9, 335823 6787293.1, 335810.7 6787285.7, 335799.8 6787283.5, 335792.2 6787284.7, 335785.4 6787291.8, 335777.2 6787307.5, 335767.3 6787322.8, 335761.8 6787332.6, 335750.3 6787340, 335735.8 6787345.9, 335721.7 6787352.1, 335707.8 6787359.2, 335695.2 6787367.9, 335681.1 6787375.7, 335669.9 6787385.9, 335664 6787394, 335662.5 6787400.5, 335663.6 6787411.9, 335665.6 6787428.5, 335664 6787445.5, 335661 6787465.2, 335657.5 6787474.6, 335652.5 6787479.1, 335644.6 6787481, 335624 6787482.8, 335606 6787486, 335595.8 6787491.9, 335583.6 6787501.7, 335570.8 6787511.7, 335559.3 6787517.9, 335526.3 6787535.4, 335519.7 6787538.9, 335517.3 6787540.3, 335515.7 6787544.3, 335515.1 6787550.7, 335515.5 6787565.8, 335517.3 6787579.5, 335518.5 6787596.1, 335517 6787610.1, 335514.4 6787619.3, 335508.6 6787627.6, 335498.9 6787636.1, 335486.9 6787644.6, 335469.7 6787654.2, 335451.6 6787668.3, 335436.2 6787682.5, 335427.3 6787696.5, 335421.3 6787711.8, 335418.8 6787731.2, 335419.9 6787741.4, 335424.9 6787752.1, 335431.1 6787765, 335433.8 6787776.8, 335433.3 6787781.6, 335431.5 6787786.4, 335424.2 6787793.2, 335415 6787797.5, 335402.6 6787801.3, 335388.9 6787804.2, 335375.3 6787809.3, 335363.3 6787817.1, 335354.1 6787825.1, 335349 6787834.8, 335348.8 6787844, 335351.5 6787854.5, 335355.7 6787870.5, 335358.3 6787884.8, 335357.2 6787895.3, 335352.5 6787908.4, 335344 6787922.8, 335334.5 6787938.7, 335326.5 6787954.1, 335319.9 6787968.9, 335313.9 6787980.6, 335300.9 6787996.2, 335286.3 6788015, 335273.9 6788026.2, 335267.1 6788030.1, 335257 6788029.8, 335241.3 6788026.5, 335219.6 6788022.7, 335205.8 6788023.2, 335198.9 6788024.8, 335191.9 6788030.4, 335185.5 6788040.1, 335178.1 6788056.1, 335171.8 6788075.4, 335168.1 6788090.8, 335165.5 6788110.5, 335164.6 6788125.8, 335165.1 6788147.8, 335164.6 6788165.8, 335161.8 6788188.1, 335158.6 6788207.8, 335153.1 6788225, 335146 6788242.4, 335141.1 6788254.7, 335133.1 6788265.5, 335120 6788276, 335106.3 6788285.9, 335091.6 6788296.5, 335080.3 6788308.9, 335070.5 6788324.7, 335067.3 6788336.8, 335066.8 6788351.5, 335067.3 6788368.4, 335065.7 6788387.9, 335062.1 6788403.9, 335055.5 6788420.2, 335050 6788434.7, 335040.6 6788446.1, 335028.7 6788452.4, 335013.3 6788457.8, 334999.9 6788462.2, 334984.9 6788471.2, 334968 6788482.8, 334948.4 6788491.5, 334930.3 6788500, 334915 6788509.4, 334901 6788521.3, 334883.9 6788537.2, 334867.3 6788553, 334850 6788566.2, 334831.6 6788579.4, 334819 6788592.3, 334806.5 6788610.3, 334796.7 6788629.3, 334787.8 6788652.8, 334781 6788674.6, 334774.2 6788695.6, 334770.8 6788713.6, 334768.5 6788732.5, 334768.9 6788745.9, 334771.2 6788768.4, 334772.6 6788792.7, 334771.7 6788808.5, 334769.4 6788827.2, 334765.9 6788844.6, 334762.8 6788870.4, 334761.3 6788898.4, 334760.8 6788903.1, 334758.6 6788940.7, 334758.5 6788969.5, 334759.4 6788998.3, 334761.3 6789022.5, 334764.4 6789035.5, 334773.2 6789047.9, 334787.7 6789059.7, 334803.2 6789070.6, 334818.8 6789076.8, 334840.4 6789083.7, 334862.3 6789091.2, 334881.3 6789098.3, 334894.4 6789105.8, 334907.6 6789118.5, 334917.9 6789131.9, 334925.8 6789146.5, 334931.2 6789163, 334933.7 6789185.5, 334933.3 6789207.8, 334930 6789223.9, 334923.6 6789242.3, 334916.4 6789259.4, 334909.6 6789275.2, 334905.2 6789295.2, 334903.3 6789321.5, 334903.6 6789340.8, 334904.8 6789355.1, 334906.6 6789363.6, 334912.8 6789369.5, 334923.6 6789374.5, 334933.6 6789381.2, 334939.6 6789389.2, 334942.9 6789398.4, 334944 6789409.3, 334943 6789418.4, 334940.6 6789424.1, 334934.6 6789431.6, 334927 6789436.3, 334916.3 6789440.3, 334905.7 6789445.7, 334899.8 6789451.4, 334896.7 6789457.7, 334895.3 6789467.6, 334894.9 6789480.9, 334895.9 6789490.5, 334904.3 6789506.6, 334915.5 6789522.2, 334920.1 6789535, 334920.1 6789544.3, 334918 6789553.1, 334915.3 6789559.8, 334908.7 6789567.6, 334902.5 6789571.8, 334888.9 6789578.6, 334878.6 6789583.3, 334866.2 6789586.7, 334853 6789587.7, 334842 6789586, 334818.5 6789578.9, 334798.5 6789571.7, 334781.7 6789564.5, 334769.7 6789559.5, 334758 6789556.3, 334747.6 6789555.4, 334736.3 6789557.4, 334724.6 6789561.5, 334716.1 6789568.1, 334703.2 6789582.4, 334692.4 6789596.6, 334682.6 6789606.7, 334673.7 6789611.6, 334662.8 6789614.8, 334649.4 6789617.9, 334637.4 6789622.8, 334622.4 6789633.6, 334611.7 6789641.9, 334601.7 6789650.3, 334589.9 6789662, 334579.4 6789674.8, 334570 6789687.4, 334563.9 6789706.8, 334560.5 6789724.7, 334559.8 6789727.3, 334557.9 6789734, 334556.6 6789739.4, 334550.8 6789755.2, 334542.9 6789775.5, 334538 6789785.4, 334534 6789802.5, 334533.5 6789804.9, 334540.9 6789854.5, 334543.6 6789878.4, 334540 6789902.5, 334533.1 6789936.4, 334525.9 6789960.6, 334522.7 6789994.3, 334522.1 6790023.4, 334522.9 6790052, 334527.3 6790074.2, 334536.7 6790102.2, 334546.2 6790137.7, 334555.2 6790168.5, 334561.1 6790190.9, 334565.5 6790217.4, 334569.6 6790239.6, 334575.4 6790257.6, 334580.7 6790270.6, 334592.3 6790286, 334604.9 6790302.5, 334620.8 6790325.2, 334636 6790351.5, 334644.8 6790369.8, 334645.9 6790383.5, 334642.6 6790402.2, 334637.6 6790427.4, 334630.3 6790448.7, 334623.3 6790463.1, 334612.9 6790474.2, 334602.4 6790481.6, 334594.5 6790485.5, 334579.6 6790487.6, 334566.1 6790486.5, 334550.9 6790485.6, 334536.3 6790481.1, 334521.9 6790478.5, 334513.1 6790479.2, 334506.9 6790482, 334501.7 6790489.9, 334499.1 6790500.3, 334497.7 6790511.5, 334491.8 6790521.6, 334482.1 6790530, 334463.4 6790544.2, 334445.4 6790556.3, 334432.1 6790564, 334424 6790569.6, 334410.6 6790573.6, 334399.2 6790573, 334390.2 6790568.1, 334379.4 6790556.6, 334373.3 6790552.3, 334362.7 6790550.1, 334343.4 6790554.7, 334329.4 6790562.1, 334322.7 6790567.5, 334313.5 6790585.8, 334309.6 6790594.6, 334314.2 6790607.7, 334356 6790734.2, 334340.1 6790739.2, 334216 6790778.7, 334223.4 6790792.6, 334236.1 6790806, 334251.2 6790819.5, 334269.3 6790832, 334285.5 6790843.6, 334303.4 6790858, 334320.5 6790872.8, 334337.4 6790887.6, 334355.2 6790903, 334373.7 6790917.2, 334391.5 6790929.6, 334403.5 6790937.5, 334414.5 6790947.6, 334424.7 6790959.5, 334438.9 6790977.1, 334449.3 6790990, 334528 6790982.6, 334703.6 6791076.1, 334897.1 6791109.2, 334898.7 6791109.5, 335020.6 6791176.5, 335050.8 6791183.5, 335080.4 6791184.9, 335122.7 6791201.7, 335143.1 6791210.9, 335164.9 6791212.3, 335188.5 6791219.9, 335244.9 6791252.2, 335274.7 6791267.6, 335296.8 6791290.8, 335317.1 6791298.5, 335334.3 6791298.3, 335354.6 6791298.1, 335382.8 6791310.4, 335394.9 6791317.9, 335408.5 6791326.4, 335419.3 6791330.4, 335429.6 6791335.3, 335439.4 6791342.9, 335451.9 6791352.1, 335466.8 6791363.7, 335485.7 6791379, 335493.3 6791382.1, 335498.5 6791382.6, 335504.2 6791381.6, 335512 6791377.8, 335525.3 6791371.9, 335538.3 6791364.8, 335551.8 6791359.3, 335561.8 6791354.3, 335572.5 6791347.1, 335580.3 6791341.1, 335588.9 6791332.2, 335599.4 6791320.1, 335605.6 6791309.6, 335612 6791296.6, 335620.6 6791282.9, 335628 6791267.9, 335633.7 6791256.4, 335641.8 6791242.6, 335649.4 6791233.7, 335658.4 6791225.6, 335667.9 6791218.2, 335676.1 6791209.5, 335680.6 6791198.8, 335681.2 6791192.1, 335682.6 6791191.2, 335686.8 6791189, 335697.1 6791188.4, 335708.1 6791187.6, 335720.1 6791187, 335732.9 6791186.8, 335744.7 6791187.8, 335758.6 6791192, 335774.1 6791198.1, 335789.2 6791205.5, 335800.3 6791211.7, 335810.8 6791219.8, 335826 6791230.7, 335841.7 6791241.9, 335851.7 6791247.2, 335866.1 6791253.7, 335883.2 6791260.8, 335901.6 6791267.6, 335911.7 6791271.4, 335923.1 6791273.4, 335937.7 6791272.6, 335957.4 6791269.8, 335967.2 6791268.8, 335974.2 6791269.5, 335986.9 6791272.5, 336003 6791276.8, 336019.7 6791280.9, 336099.5 6791299.6, 336134.9 6791316, 336136.9 6791316.9, 336224.7 6791357.9, 336227.6 6791358.9, 336230.2 6791363.2, 336232.4 6791374.8, 336235.3 6791389, 336240.4 6791410.9, 336247.1 6791428.8, 336255.3 6791445.7, 336263.5 6791459.8, 336268.9 6791470.9, 336276.9 6791488.2, 336282.7 6791506.1, 336294.7 6791538, 336301.9 6791560.6, 336309.8 6791559.9, 336338.7 6791556.9, 336368.2 6791553.5, 336400.8 6791549.8, 336436.4 6791545.8, 336467.7 6791542, 336505.7 6791538, 336539.3 6791533.9, 336569 6791530.5, 336608.7 6791526, 336608.3 6791543.6, 336607.3 6791557.1, 336604.1 6791575.1, 336601.5 6791591.3, 336597.2 6791611.8, 336593 6791630.9, 336589.2 6791646.1, 336581.9 6791662.5, 336573.4 6791679.5, 336564.5 6791694.9, 336559.8 6791709.3, 336607.6 6791715.1, 336627.9 6791764.9, 336618.6 6791840, 336613.9 6791885, 336639.2 6791924.7, 336704.7 6791989.2, 336705.4 6791988.8, 336726.8 6791979.7, 336764.5 6791963.7, 336834.4 6791958.1, 336835.6 6791960.6, 336854.7 6791997.9, 336880.2 6792057.7, 336870.3 6792072.7, 336815.7 6792118.2, 336805.8 6792133.2, 336807.1 6792209.5, 336882.1 6792292.5, 336929.7 6792350.3, 336897.3 6792352.3, 336870.7 6792355.7, 336841.2 6792365.3, 336808.4 6792378, 336786.8 6792390.7, 336757.1 6792398.8, 336719.7 6792408.4, 336676 6792416.6, 336653.5 6792424.2, 336646.6 6792426.2, 336636.7 6792433.7, 336629.5 6792442.5, 336621.5 6792451.1, 336612.9 6792460.7, 336601.6 6792469.3, 336588.4 6792477.4, 336576.6 6792483.9, 336560.7 6792490.7, 336544.8 6792495.6, 336526.9 6792500.9, 336514.7 6792503.3, 336507.7 6792502.5, 336499.7 6792497.2, 336488.2 6792488.4, 336475.7 6792479.5, 336468.5 6792477, 336464.1 6792476.5, 336454.1 6792478, 336435 6792480.8, 336413 6792485.1, 336386.3 6792491.5, 336376 6792496.6, 336383.8 6792506.7, 336391.2 6792524.3, 336398.4 6792544.7, 336403.6 6792559.1, 336409 6792576.2, 336413.5 6792589, 336417 6792600.7, 336420.8 6792612.9, 336422 6792621.5, 336421.3 6792629.1, 336419.9 6792634.6, 336415.9 6792641.7, 336403.9 6792651.6, 336386.7 6792663.6, 336369.7 6792674.7, 336352.5 6792687.8, 336331 6792701.8, 336316.6 6792711.7, 336302.8 6792722, 336291.2 6792730.3, 336279.5 6792738.9, 336269.4 6792748.7, 336263.2 6792758.1, 336254.7 6792771, 336246.9 6792783.4, 336239.3 6792795.3, 336233 6792805.2, 336227.3 6792813.5, 336220 6792820.9, 336212.2 6792827.1, 336203.4 6792834.4, 336195.9 6792840.2, 336188 6792844.9, 336181.1 6792849.5, 336174.8 6792858.5, 336163.8 6792880.8, 336173.9 6792885.3, 336222.6 6792907.5, 336248.5 6792926.1, 336353.2 6793001.3, 336378.5 6793031.1, 336333.7 6793061.5, 336333.9 6793076.4, 336349.1 6793111.3, 336374.8 6793191, 336390 6793215.9, 336565.8 6793334.4, 336581 6793354.2, 336558.2 6793382.9, 336545.2 6793399.4, 336549.5 6793402.8, 336552.2 6793406.7, 336557 6793410.6, 336564 6793411.7, 336574.6 6793412.1, 336580.4 6793413.5, 336584.2 6793415.1, 336587.4 6793417.3, 336590.5 6793421.7, 336608.5 6793422.2, 336656.5 6793423.6, 336656.6 6793438.6, 336632.2 6793508.7, 336628.8 6793520.2, 336603 6793608.9, 336598.7 6793693.9, 336635.1 6793863.9, 336642.3 6793879.7, 336650.6 6793903.5, 336657.4 6793924.3, 336663.9 6793946.3, 336669.9 6793965.5, 336672.5 6793973.2, 336673.2 6793978.9, 336671.7 6793981.4, 336654.8 6793982.4, 336661.7 6794068.1, 336761.8 6794077.3, 336776.8 6794087.1, 336757.5 6794172.2, 336778.9 6794178.1, 336792.6 6794181.9, 336792 6794186.8, 336788 6794225.9, 336778.7 6794317, 336793.7 6794321.8, 336818.6 6794301.7, 336873.3 6794276.2, 336873.5 6794301.2, 336859.8 6794461.2, 336862.4 6794466.8, 336920.8 6794590.6, 337027.9 6794844.6, 337058.2 6794889.3, 337047.4 6794925.4, 337034.8 6794968.2, 337033.7 6794978.3, 337032.3 6794992, 337030.7 6795007, 337029.7 6795015.9, 337028.6 6795023.7, 337027.5 6795031.7, 337026.7 6795036.7, 337012 6795188, 337024.4 6795184.7, 337052.6 6795198.5, 337076.2 6795213.9, 337098 6795216.9, 337119.9 6795215.1, 337132.4 6795208.8, 337149.6 6795211.7, 337192.6 6795195.6, 337241.6 6795193.1, 337251.4 6795135.6, 337340.1 6795104.4, 337351.1 6795174.8, 337353.5 6795310.6, 337361.5 6795346.7, 337355.4 6795369.3, 337343.1 6795386.6, 337320.2 6795413, 337300.9 6795444.2, 337295.3 6795455.3, 337290.4 6795466.8, 337287.9 6795476.6, 337287.1 6795486.4, 337288.9 6795500.5, 337292.7 6795514.8, 337296.5 6795525.2, 337298.8 6795533.1, 337298.4 6795538.4, 337294.1 6795544.1, 337289.1 6795549.7, 337279.9 6795561.3, 337270.8 6795572.6, 337262.4 6795587, 337255.9 6795602.2, 337251.3 6795621.5, 337249.7 6795636.5, 337251.3 6795651.2, 337257.7 6795672.8, 337264 6795693.3, 337265.7 6795696.1, 337301.5 6795749.6, 337317.8 6795768.5, 337350.5 6795806.3, 337380.7 6795831, 337401 6795865.8, 337406.3 6795905.8, 337416.2 6795927.9, 337440.6 6795950.4, 337437.3 6795954.1, 337433.6 6795959.3, 337431.1 6795964.8, 337428.9 6795968.5, 337426.2 6795976.9, 337422.8 6795981.4, 337418.1 6795984.5, 337415.6 6795986.4, 337411 6795989.2, 337409.4 6795992.2, 337409.9 6795997.6, 337411.7 6796004.4, 337411.9 6796010, 337417.9 6796022.5, 337424.6 6796036.6, 337430.1 6796047.8, 337432.3 6796056.9, 337432.3 6796065.4, 337431.9 6796074.2, 337429.5 6796077.4, 337423.6 6796084.4, 337418.6 6796093.9, 337395.7 6796108.4, 337343.2 6796141.1, 337343.6 6796191.1, 337351.4 6796206.2, 337344.6 6796217.8, 337316.9 6796268.5, 337295.4 6796308.8, 337272.9 6796349.5, 337257.7 6796376.9, 337245.5 6796402, 337243.6 6796406.3, 337237.4 6796420.2, 337235.5 6796430.5, 337232.2 6796454.6, 337228.1 6796492.1, 337225.6 6796512.3, 337226 6796520.5, 337228.3 6796525.4, 337237.6 6796538.9, 337250.2 6796560.2, 337265.6 6796585.6, 337286.8 6796619.7, 337316.4 6796668.5, 337334.2 6796695.7, 337341.1 6796702.4, 337348.3 6796709.2, 337358.6 6796719.1, 337392.5 6796751.8, 337398.6 6796757.8, 337407.8 6796766.5, 337410.9 6796770.9, 337413.5 6796774.7, 337416 6796778.7, 337418.7 6796782.3, 337420.7 6796786, 337422.3 6796789.8, 337423.6 6796793.4, 337424.6 6796795.8, 337427.3 6796799.4, 337430.4 6796801.3, 337432.5 6796803.3, 337433.6 6796806, 337434.5 6796808.4, 337436.3 6796811.1, 337437.8 6796813.5, 337440 6796816.4, 337442.7 6796819.6, 337445.3 6796823.2, 337450.1 6796826.3, 337454.1 6796828.9, 337458.4 6796831, 337461.7 6796832, 337465 6796832.7, 337468 6796833.5, 337471.4 6796834.5, 337478.1 6796837.8, 337481.7 6796840.1, 337484.9 6796841.5, 337489.1 6796844.8, 337492.3 6796847.3, 337496.5 6796852.2, 337498.5 6796856.3, 337499.7 6796859.1, 337500.2 6796862.8, 337500 6796866.7, 337499.6 6796870.7, 337500 6796874.2, 337500.6 6796877.5, 337502.1 6796881.1, 337504.5 6796884.3, 337506.6 6796887.2, 337508.6 6796891.2, 337510.3 6796894.4, 337512.1 6796897.6, 337513.9 6796900.5, 337516 6796903.8, 337517.7 6796907.4, 337519.8 6796911.3, 337522.4 6796915.8, 337524.7 6796920.5, 337526.4 6796924.1, 337527.6 6796927.1, 337529.2 6796929.6, 337531 6796933.3, 337533.6 6796938.2, 337535.3 6796941.6, 337536.8 6796944.5, 337538.7 6796949.5, 337541.5 6796954.6, 337544.3 6796959.7, 337546 6796963.4, 337548.3 6796967.4, 337552 6796971.6, 337554.9 6796975.4, 337556.7 6796978.6, 337560.4 6796981.1, 337563.5 6796984.3, 337566.3 6796987.4, 337569.9 6796990.2, 337571.8 6796992, 337573.9 6796994.5, 337575.6 6796998.3, 337577.2 6797002.1, 337578.8 6797005, 337581.2 6797007.6, 337584.5 6797010.5, 337587.4 6797012.4, 337589.9 6797014.9, 337592.4 6797018.2, 337596 6797021.7, 337599.1 6797024.5, 337603.6 6797027.7, 337607.2 6797030.3, 337610 6797031.9, 337613.5 6797033.8, 337617.7 6797034.7, 337621.9 6797034.5, 337626.9 6797033.8, 337633.3 6797033.1, 337641.1 6797032.6, 337644 6797033.5, 337647.1 6797035.2, 337649.8 6797036.6, 337651.6 6797038.7, 337652.2 6797041.6, 337652.3 6797045.3, 337652.3 6797048.9, 337652.2 6797053.4, 337653.1 6797057.3, 337654.6 6797061, 337659.3 6797064.7, 337664.2 6797066.3, 337669.9 6797068.3, 337671.2 6797071.1, 337671.7 6797075.4, 337671.2 6797079.2, 337669.5 6797083.6, 337668.3 6797088.6, 337668.4 6797092.1, 337669.5 6797095, 337672.5 6797097.5, 337676.8 6797100.7, 337681.6 6797101.8, 337686.2 6797103, 337690.7 6797104.2, 337693.3 6797105.4, 337701.5 6797109.8, 337709.5 6797113.8, 337720.8 6797119.7, 337730.7 6797123.7, 337739.8 6797127.5, 337768.7 6797108.3, 337786.8 6797121.5, 337808.4 6797136.3, 337826.7 6797146.9, 337845.8 6797161.8, 337849.2 6797163.6, 337852.1 6797164.9, 337855 6797166, 337859 6797168.5, 337862.4 6797169.8, 337865.7 6797170.4, 337868.9 6797172, 337871.7 6797173.2, 337874.4 6797175.6, 337877.2 6797176.8, 337880.5 6797177.6, 337885.3 6797178.8, 337893.8 6797180.8, 337896.8 6797181.8, 337899 6797182.5, 337900.5 6797184.2, 337901.5 6797186.7, 337902.6 6797190, 337903.5 6797194, 337904.3 6797197.1, 337906.1 6797198.8, 337907.7 6797200.8, 337908.5 6797203, 337909.9 6797204.7, 337912.6 6797206.4, 337915.3 6797207.4, 337916.9 6797208.6, 337916.8 6797211.1, 337916.2 6797215.1, 337915.6 6797220.4, 337915.4 6797224.8, 337918.2 6797227.2, 337922.8 6797227.5, 337930.6 6797227, 337940.4 6797226, 337950.1 6797227.2, 337958.2 6797228.9, 337966.9 6797228.8, 337982.4 6797229.2, 337990.4 6797229.3, 337993.5 6797229.4, 337995.4 6797217.5, 338046.8 6797249.6, 338147.2 6797303.8, 338170.7 6797315.9, 338180.2 6797361.3, 338178.7 6797379.4, 338178.4 6797448.4, 338179.6 6797466.1, 338213.9 6797518.1, 338215.5 6797529, 338219.1 6797553.7, 338222.7 6797578.5, 338226.2 6797603.1, 338229.8 6797627.9, 338250.3 6797687.7, 338245.5 6797712.7, 338235.7 6797732.8, 338241 6797772.7, 338251.2 6797797.6, 338231.6 6797852.7, 338230.1 6797870.6, 338226.9 6797894.4, 338225.4 6797920, 338223.9 6797942.5, 338227.1 6797956.9, 338232.4 6797974.5, 338208.1 6798032.8, 338208.2 6798042.8, 338242.3 6798059.5, 338248.3 6798062.4, 338245.3 6798080.3, 338234 6798147.5, 338186.9 6798282.7, 338185.2 6798287.8, 338175.5 6798322.9, 338220.7 6798347.5, 338225.8 6798367.4, 338226.6 6798462.3, 338207.2 6798532.5, 338342.3 6798551.3, 338397.1 6798530.9, 338467 6798530.3, 338547.1 6798544.7, 338603.1 6798608.9, 338670 6798634.3, 338658.9 6798668.5, 338690.7 6798676.5, 338698.7 6798676.5, 338732.9 6798694.7, 338763.2 6798703.5, 338795.8 6798717.8, 338910.5 6798744.8, 339024.3 6798777.4, 339175.6 6798793.3, 339215.4 6798790.1, 339234.6 6798811.6, 339302.2 6798797.3, 339333.3 6798782.2, 339397 6798773.4, 339418.4 6798777.4, 339451 6798786.9, 339496.4 6798786.9, 339542.6 6798778.2, 339583.2 6798753.5, 339658 6798727.3, 339692.3 6798705.8, 339757.7 6798676.8, 339765 6798674.1, 339777.4 6798669.5, 339793.1 6798661.3, 339808.5 6798652.9, 339824.5 6798642.9, 339843.3 6798629.2, 339860.3 6798614.8, 339879.4 6798599.2, 339894.9 6798587.4, 339909.3 6798577.2, 339921 6798563.4, 339931.4 6798551.9, 339944.4 6798534.9, 339961.5 6798512.4, 339973.4 6798497.9, 339987.1 6798482, 340060.8 6798415.7, 340162 6798358.5, 340178.5 6798352.9, 340187.2 6798428.4, 340203.2 6798452.3, 340274 6798641.5, 340285.9 6798678.9, 340305.8 6798739.3, 340321.7 6798758.3, 340326.4 6798801.2, 340326.4 6798872, 340336.7 6798876.8, 340329.6 6798898.2, 340334.8 6798922, 340330.8 6798936.8, 340327.3 6798949.4, 340316.3 6798993.7, 340316.2 6799002.5, 340313 6799008.6, 340305.5 6799018.3, 340292.5 6799033, 340281.6 6799047.1, 340276.6 6799067.1, 340268.1 6799102.2, 340255.1 6799154.9, 340249.9 6799176.1, 340250.6 6799185.5, 340253.1 6799199.9, 340257.5 6799221.1, 340265.2 6799258.9, 340272 6799290.8, 340279.5 6799322.2, 340282.7 6799342.6, 340282.9 6799343.9, 340284.8 6799365.9, 340289.4 6799400.4, 340296.5 6799440.3, 340305.1 6799488, 340306.9 6799512.5, 340298.2 6799515.1, 340301.4 6799564.1, 340304.7 6799602.8, 340308.4 6799631.9, 340312.4 6799659.6, 340315.3 6799692.1, 340317.6 6799723, 340318.8 6799745.2, 340314.9 6799760.2, 340305.7 6799778.7, 340295.3 6799799.9, 340286.3 6799815.1, 340269.8 6799821.2, 340267 6799861.3, 340262.1 6799885.9, 340252.3 6799934.8, 340241.5 6799952.3, 340227.7 6799975, 340224.6 6799992.4, 340220.4 6800017, 340216.1 6800041.6, 340199 6800140.1, 340184.1 6800150.2, 340169.1 6800150.4, 340131.1 6800147.8, 340122.9 6800150.7, 340107.7 6800159, 340086.4 6800174.1, 340056.3 6800195.4, 340025.3 6800215.3, 339992.4 6800238.3, 339977.9 6800214.5, 339955 6800228.1, 339933.1 6800241, 339914.9 6800252.1, 339896.2 6800258.5, 339878.8 6800262.4, 339860.5 6800262.7, 339835 6800260.5, 339805.5 6800256.9, 339775.5 6800252.9, 339740.6 6800262.1, 339614.9 6800194.8, 339544.7 6800165.4, 339489 6800080.9, 339449 6800076.3, 339344.3 6800102.1, 339119.2 6800074, 338984.3 6800070.1, 338935.5 6800082.7, 338784.8 6800121.7, 338691.1 6800125.4, 338630 6800127.9, 338615 6800133, 338560.1 6800133.5, 338483.8 6800130.9, 338448.1 6800124.6, 338393.7 6800109.3, 338384.8 6800106.5, 338354.3 6800095.4, 338327.1 6800086.8, 338304.5 6800082, 338287.1 6800079.6, 338271 6800077.8, 338261.1 6800075.7, 338251.1 6800072.8, 338243.1 6800069.5, 338236.9 6800063.7, 338233.8 6800057.2, 338233.3 6800049.3, 338233.5 6800041.2, 338232.6 6800032.4, 338231.2 6800028, 338227.2 6800024, 338222.1 6800021.9, 338211.3 6800018.9, 338200.2 6800015.3, 338178.6 6800008.4, 338149.2 6800005.9, 338122.6 6800007.8, 338098.2 6800011.6, 338075.5 6800013.7, 338055.5 6800014.4, 338030.9 6800013, 338003.7 6800011.5, 337981 6800009.2, 337962.3 6800008.4, 337942.3 6800006.1, 337931 6800006.8, 337920.6 6800009.7, 337908.9 6800014.9, 337899.4 6800018.6, 337889 6800020.5, 337877.5 6800019.9, 337862.8 6800019.3, 337850.5 6800017.2, 337835.5 6800015.7, 337825.2 6800017, 337816 6800019.6, 337801.9 6800023.1, 337787.6 6800027.1, 337775.1 6800031.3, 337762.1 6800037.3, 337752.3 6800044.5, 337743.3 6800051.9, 337734.1 6800055.1, 337723.5 6800056.6, 337714.3 6800056.6, 337702.6 6800056.6, 337693.6 6800053.7, 337683.4 6800051.5, 337672.9 6800047.7, 337666 6800047, 337659.2 6800044.5, 337648.1 6800036.6, 337633.7 6800026.4, 337620 6800018.1, 337601.9 6800009.7, 337588.4 6800001.5, 337571.6 6799995.1, 337557.4 6799991.8, 337538.2 6799987.7, 337525.6 6799988.7, 337509.5 6799990.1, 337497 6799991.7, 337486.1 6799993.9, 337475.7 6799997.3, 337468.4 6799999.7, 337458.3 6800001.5, 337452 6800002.4, 337440.7 6800004.9, 337419.1 6800034.1, 337416 6800041.6, 337408.2 6800046.3, 337373.4 6800052.5, 337341.3 6800058, 337315.8 6800061.5, 337294 6800063.1, 337274.7 6800063.9, 337255.2 6800063.5, 337247.1 6800064.5, 337244.7 6800064.8, 337225.4 6800054.9, 337141.8 6800071.2, 337109.1 6800084, 337085.8 6800087.3, 337070.1 6800085.9, 337043.8 6800054.7, 337036.7 6800053.6, 337031 6800054.2, 337024.2 6800056.7, 337014.3 6800056.8, 337003.8 6800056.4, 336994.8 6800056.3, 336988.3 6800056.7, 336981.9 6800058.3, 336970.7 6800065.3, 336961.7 6800071, 336958.6 6800071.7, 336949 6800070.1, 336938.5 6800065.4, 336933.4 6800064.6, 336924.2 6800066.1, 336920.3 6800056.5, 336900.1 6800007.1, 336885 6799992.3, 336824.9 6799972.8, 336808.8 6799953.7, 336799.7 6799943, 336775.6 6799936.3, 336764.6 6799933.3, 336718 6799924.5, 336715.6 6799918.3, 336711.2 6799907, 336704.3 6799893.8, 336697.2 6799883.6, 336688.8 6799871, 336680.6 6799858.6, 336675.4 6799853.7, 336671.9 6799853.1, 336669 6799849.7, 336666.5 6799840, 336662.6 6799830.4, 336656.1 6799815.1, 336648.5 6799789.3, 336643.3 6799759.4, 336613.1 6799734.6, 336592.6 6799669.9, 336562.4 6799650.1, 336562 6799595.2, 336550.6 6799572.9, 336541.7 6799555.3, 336516.8 6799553.1, 336491.7 6799550.8, 336470.2 6799538, 336448.6 6799525.4, 336441.5 6799521.2, 336443.2 6799532, 336447.1 6799548.1, 336447.8 6799557.2, 336443.5 6799572.2, 336437 6799575.4, 336432 6799581.2, 336432.5 6799599.5, 336419.2 6799618.6, 336410.1 6799628.7, 336392.5 6799646.5, 336391.1 6799656.8, 336387.8 6799681.5, 336380.8 6799685.9, 336338.1 6799711.9, 336313.4 6799742.1, 336258.8 6799797.5, 336134.4 6799858.5, 336099.2 6799863, 336080 6799888.5, 336017 6799917.5, 336005.2 6799939.5, 335995 6799938.1, 335970.2 6799934.8, 335955.3 6799944.9, 335950.5 6799969.9, 335930.7 6799995, 335890.7 6800000.4, 335885.8 6800010.4, 335891 6800030.3, 335876.3 6800070.4, 335846.7 6800094.3, 335841.7 6800098.4, 335821.4 6800114.8, 335792.2 6800171, 335797.5 6800204.5, 335800.8 6800225.7, 335805.4 6800254.8, 335806 6800258.6, 335808 6800270.9, 335818.8 6800365.7, 335779.9 6800495.9, 335777.8 6800513.4, 335747.2 6800781, 335724.7 6800803.8, 335697.7 6800831.4, 335663.1 6800886.6, 335613.6 6800937, 335613.8 6800962, 335614 6800987, 335604.5 6800996.7, 335586.9 6801014.5, 335569.4 6801032.3, 335547.6 6801038.8, 335523.5 6801045.8, 335499.6 6801052.9, 335492.1 6801066.2, 335479.9 6801088, 335464 6801101.8, 335445.2 6801118.3, 335442.6 6801123.6, 335431.6 6801145.9, 335420.6 6801168.4, 335408.4 6801180.8, 335390.9 6801198.6, 335377.1 6801204.6, 335354.1 6801214.3, 335331.1 6801224.1, 335320.6 6801227.4, 335201.5 6801265.1, 335131.9 6801305.7, 335077.4 6801356.1, 335018 6801431.5, 334988.5 6801486.7, 334973.9 6801541.8, 334949.3 6801587, 334914.6 6801612.3, 334854.8 6801637.7, 334815.1 6801668, 334747.2 6801694.6, 334712.7 6801719.6, 334663.9 6801742.1, 334662 6801754.6, 334667.6 6801774.7, 334697.7 6801832.2, 334730.9 6801892.2, 334735.9 6801893.5, 334752.8 6801917.9, 334947.6 6802026.7, 334953.2 6802027.9, 335006.4 6802125.5, 335036.5 6802171.1, 335046.5 6802206.2, 335060.3 6802241.2, 335097.2 6802351.8, 335100.3 6802354.4, 335098.5 6802357.9, 335097.6 6802360.4, 335097.4 6802364.2, 335096.2 6802367.8, 335093.9 6802372.8, 335092.2 6802376.9, 335091.7 6802382.6, 335091.1 6802386.9, 335090.1 6802391, 335088.4 6802395.1, 335086.4 6802398.9, 335084.5 6802402.6, 335083.3 6802407.2, 335082.2 6802412.1, 335082 6802415.1, 335082.3 6802418.2, 335083.5 6802422.5, 335085 6802426.1, 335086.5 6802431.5, 335087.1 6802435.3, 335086.8 6802438, 335085.3 6802443.7, 335084.2 6802448.2, 335083.2 6802453.7, 335089.9 6802463.8, 335091.9 6802520.2, 335107 6802535.1, 335109.1 6802535.7, 335133.1 6802542.7, 335157.1 6802549.7, 335158.6 6802559.9, 335162.3 6802584.6, 335168.5 6802593.7, 335182.6 6802614.4, 335227.6 6802624, 335258.1 6802683.7, 335258.5 6802738.7, 335278.9 6802788.5, 335274.3 6802838.5, 335259.5 6802858.6, 335244.7 6802878.7, 335241.7 6802889.7, 335235 6802913.8, 335210.4 6802963.9, 335210.7 6803003.9, 335215.8 6803013.9, 335216.2 6803063.8, 335201.9 6803097.8, 335202.6 6803105.5, 335204.8 6803115.3, 335206.4 6803124.3, 335206.1 6803132.2, 335202.5 6803141.8, 335194.3 6803154, 335182.9 6803170, 335172.3 6803183.8, 335167.9 6803185.5, 335162.6 6803184.7, 335156.6 6803183.6, 335151.9 6803184.7, 335145.6 6803193.7, 335135.8 6803204.6, 335123.3 6803219, 335110.2 6803231.8, 335098.5 6803246.9, 335092.2 6803257.8, 335087.1 6803269.2, 335083.3 6803282.1, 335080.7 6803295.2, 335075.7 6803309.1, 335074.6 6803318.7, 335069 6803331, 335060.2 6803347.2, 335057.1 6803359.7, 335057.2 6803361.1, 335057.8 6803367.8, 335059.7 6803374.2, 335065.8 6803386.7, 335071.5 6803398, 335080.3 6803414.1, 335099.4 6803449.5, 335104.7 6803484.5, 335124.9 6803504.3, 335129.8 6803518.6, 335132.1 6803525.5, 335142.8 6803544.8, 335145.3 6803570.4, 335145.9 6803576.7, 335153.1 6803649.1, 335151.2 6803674, 335156 6803694.5, 335161 6803716.3, 335161.6 6803718.8, 335159.5 6803722.5, 335146.8 6803743.9, 335146.9 6803748.9, 335147 6803763.9, 335162.2 6803788.8, 335162.3 6803798.8, 335162.5 6803823.8, 335177.5 6803828.6, 335177.6 6803843.6, 335176.2 6803853.9, 335172.9 6803878.6, 335177.3 6803884.1, 335193.1 6803903.5, 335198.2 6803923.4, 335196.5 6803924.1, 335173.3 6803933.6, 335153.5 6803948.8, 335154 6804008.7, 335164.3 6804043.6, 335194.5 6804073.3, 335194.6 6804088.3, 335164.9 6804123.5, 335165.3 6804173.5, 335185.7 6804218.3, 335211.2 6804288.1, 335236.4 6804317.8, 335236.6 6804337.8, 335221.9 6804372.9, 335237.2 6804407.8, 335237.5 6804442.7, 335257.7 6804472.6, 335258.6 6804587.5, 335269 6804632.4, 335269.3 6804637.4, 335271.2 6804662.3, 335261.7 6804673.5, 335245.5 6804692.5, 335250.6 6804707.5, 335259.6 6804725, 335270.9 6804747.3, 335271.1 6804767.2, 335271.3 6804792.2, 335271.5 6804817.2, 335281.5 6804839.3, 335291.9 6804862, 335305.7 6804877.9, 335322.1 6804896.7, 335372.4 6804931.3, 335432.8 6804990.8, 335473.2 6805036.4, 335523.3 6805056, 335568.4 6805070.6, 335642.8 6805150.9, 335668.1 6805169.7, 335680.7 6805194.6, 335685.5 6805202.2, 335728.2 6805189.2, 335808.5 6805223.6, 335833.8 6805268.3, 335839.5 6805358.2, 335835.2 6805433.2, 335865.6 6805493.9, 335880.8 6805518.8, 335870.7 6805628.8, 335891.1 6805668.6, 335966.6 6805742.9, 336067 6805797.1, 336066.6 6805910.8, 336052.8 6805912.7, 336036.2 6805919.4, 336016.4 6805934.4, 335958.9 6805982.1, 335922.1 6806012.2, 335893.3 6806035.3, 335861.5 6806062.8, 335841 6806079.2, 335808.5 6806106.1, 335787.6 6806125.6, 335771.2 6806146.6, 335754.4 6806170, 335594.9 6806234.6, 335590 6806249.7, 335579.4 6806267.8, 335575 6806275.5, 335540.7 6806335, 335487.3 6806418, 335490.1 6806426.8, 335495.1 6806441.2, 335523.5 6806517, 335513.8 6806531.1, 335499.9 6806551.3, 335488 6806569.4, 335474.8 6806589.1, 335461 6806609.3, 335448.1 6806628.2, 335434.7 6806648.8, 335421.8 6806668, 335408.7 6806687, 335395.9 6806705.6, 335386.1 6806720.5, 335374.5 6806737.3, 335361.8 6806756.2, 335350.8 6806771.5, 335340.5 6806787.5, 335330.6 6806803.1, 335316.2 6806820.8, 335306.6 6806832.9, 335292.8 6806847.4, 335274 6806864.6, 335262 6806874.4, 335245.8 6806887.3, 335228.3 6806901.4, 335210.2 6806915.5, 335195.5 6806928.4, 335177.6 6806942.2, 335161.2 6806953.1, 335146.1 6806962.2, 335128.8 6806972.5, 335110.8 6806982, 335096 6806989.6, 335078.3 6806999.3, 335065.7 6807007.1, 335062 6807009.4, 335047.1 6807019.2, 335029.7 6807033.7, 335016.3 6807044.3, 335000.4 6807057.3, 334985.4 6807069.7, 334971.5 6807080.6, 334957.1 6807092.5, 334941.5 6807105.6, 334927 6807116.4, 334912.7 6807127.5, 334900.5 6807137.4, 334888 6807147.5, 334873.8 6807159.6, 334859.6 6807171.3, 334844.8 6807184.1, 334831.2 6807197, 334817.3 6807210.3, 334801.4 6807224.9, 334787.8 6807236.6, 334772.6 6807249.4, 334756.9 6807259.7, 334740.9 6807269.9, 334724.6 6807280.1, 334705.6 6807292.5, 334693.7 6807300.7, 334692.1 6807301.7, 334676.2 6807311.2, 334660.5 6807320.7, 334646.9 6807330, 334635.5 6807337.8, 334625.7 6807347.3, 334619.2 6807356.4, 334614.1 6807367, 334611 6807378.2, 334609.3 6807395.2, 334609 6807415.7, 334609.2 6807452.4, 334492.9 6807499.8, 334488 6807514.8, 334513.2 6807535.6, 334518.3 6807550.5, 334516.2 6807553.2, 334468.9 6807614.9, 334418.8 6807725.2, 334372.2 6807812.5, 334366.7 6807819.8, 334360.6 6807829, 334350.2 6807837.3, 334339.1 6807842.8, 334333.4 6807846.6, 334321.2 6807856.4, 334306.7 6807866.7, 334290.8 6807877.6, 334276.4 6807888.1, 334263.6 6807895.3, 334249.2 6807902.3, 334234.8 6807907.3, 334223.2 6807912.4, 334210.3 6807917.3, 334200.4 6807920.1, 334187.1 6807920.9, 334172.4 6807919.9, 334157.8 6807918.5, 334143.5 6807918.3, 334128.8 6807920, 334113.8 6807923.6, 334097.9 6807928.8, 334085.5 6807934.4, 334073 6807942.2, 334071.8 6807943, 334059.1 6807952.2, 334044.6 6807961.8, 334039.5 6807965.2, 334031.9 6807970.2, 334017.5 6807980.1, 334002.6 6807967, 333986.8 6807954.7, 333974.9 6807946.7, 333962.7 6807941.5, 333951.6 6807939.1, 333936.9 6807938.9, 333918.2 6807941.1, 333905 6807943.7, 333896.5 6807945.3, 333874.5 6807949.7, 333855.2 6807952.8, 333845.7 6807954.4, 333776.5 6808004.3, 333691.5 6807995, 333676.6 6808005.1, 333536.7 6808010.3, 333486.8 6808020.7, 333486.3 6808080.6, 333478.7 6808082.5, 333321.8 6808121.9, 333282 6808142.3, 333168.3 6808292.1, 333118.5 6808322.5, 333058.6 6808328, 332943.7 6808323.9, 332913.7 6808444.1, 332914.4 6808529, 332904.5 6808544.1, 332879.6 6808559.3, 332840 6808604.6, 332841 6808719.5, 332816.8 6808713.1, 332781.5 6808703.9, 332765.2 6808699.3, 332743.9 6808693.3, 332704.8 6808684.2, 332673.3 6808683.9, 332610.2 6808682.9, 332386.4 6808713, 332368.3 6808781.6, 332328.7 6808809.6, 332351.7 6808892.3, 332391.7 6808897, 332396.9 6808917, 332477.3 6808976.3, 332472.4 6808986.3, 332314.3 6808996.4, 332324.9 6809003.6, 332330.8 6809010.6, 332340.3 6809027.4, 332345.1 6809031.8, 332349.5 6809037.6, 332360.5 6809049.4, 332366.3 6809055.2, 332383.2 6809071.3, 332395.1 6809080.7, 332401.7 6809084.3, 332406.4 6809087, 332410.6 6809090.3, 332413.9 6809094.6, 332417.7 6809100.4, 332423.6 6809112.8, 332428 6809123, 332431.9 6809130.6, 332435.7 6809141.6, 332439.3 6809156.8, 332442.9 6809199.1, 332447.1 6809236.7, 332451.7 6809273.1, 332458.4 6809302.4, 332472.6 6809358.6, 332478.2 6809383.1, 332494.4 6809443.6, 332502.5 6809473.5, 332507.5 6809494.3, 332508.8 6809500.3, 332509.1 6809503, 332508.2 6809506.9, 332509.9 6809509.2, 332514.7 6809517.5, 332522.5 6809529, 332532.2 6809541.1, 332543.7 6809554.7, 332554.2 6809569.9, 332567.4 6809591.7, 332585.8 6809622.1, 332592.3 6809637.5, 332593.5 6809642.1, 332593.8 6809645.9, 332597.2 6809656.6, 332602.1 6809688.7, 332608.1 6809731.2, 332621.6 6809808.3, 332624.5 6809827.8, 332628.7 6809857.3, 332633.4 6809898.6, 332636.6 6809923.7, 332638 6809930.2, 332636.1 6809939.6, 332629.4 6809947.1, 332628.7 6809984.4, 332636.8 6810046.1, 332643.9 6810109.8, 332646.2 6810116.6, 332644 6810152.7, 332643 6810165.3, 332642.4 6810176.5, 332635.3 6810293.5, 332630 6810366, 332628.8 6810398, 332628.7 6810399.9, 332628.6 6810417.3, 332638 6810417.8, 332649.6 6810419.1, 332650.7 6810415.3, 332652.2 6810411.6, 332654 6810403.1, 332657.5 6810391.9, 332660.5 6810381.4, 332662.8 6810376.2, 332665.1 6810372.1, 332669.1 6810368.8, 332672.3 6810367.5, 332677.1 6810366.9, 332683 6810366.7, 332689.6 6810366.9, 332699.2 6810366.8, 332834 6810396.8, 332840.7 6810398.4, 332920.7 6810407.7, 332989.9 6810411.4, 333000.7 6810412, 333031.5 6810421.7, 333178.9 6810454.6, 333201 6810459.6, 333246.6 6810478.8, 333245.1 6810483, 333245.3 6810489.7, 333246.4 6810526, 333191.5 6810644.7, 333188.3 6810646.6, 333180.3 6810655.6, 333168.6 6810667.5, 333160.6 6810691, 333155.5 6810708.6, 333151.5 6810728.4, 333148.4 6810749.6, 333167.8 6810806.4, 333232.2 6810942.5, 333298.3 6811009.9, 333300 6811011.2, 333299.9 6811075.6, 333299.8 6811092.7, 333299.8 6811190.1, 333363 6811224.2, 333371.5 6811226.4, 333382.3 6811231.8, 333394.7 6811237.2, 333409.1 6811243.9, 333426.5 6811252.4, 333442.3 6811259.7, 333461.8 6811269, 333480.2 6811276.8, 333497.3 6811281.6, 333495.7 6811288.8, 333510.7 6811294.5, 333526.9 6811302.8, 333550.5 6811312.8, 333570.6 6811321.1, 333571.8 6811322.2, 333589.9 6811316.2, 333601.4 6811314.6, 333610.3 6811312.3, 333710.8 6811342.6, 333755.8 6811363, 333763.6 6811366.4, 333776 6811372.1, 333800.1 6811379.1, 333809.2 6811381.7, 333826.1 6811386.7, 333911.5 6811440.9, 333910.6 6811450.9, 333963.8 6811492.5, 333972.1 6811483.8, 333984.2 6811469.9, 333989 6811464.4, 334000.4 6811451.9, 334001.1 6811452.8, 334005.4 6811460.4, 334019.6 6811451.4, 334043.3 6811434.5, 334056.6 6811424, 334064.5 6811417.7, 334082.3 6811404.6, 334100 6811390.1, 334119.3 6811373.5, 334133.5 6811360.9, 334150.3 6811344.8, 334183.3 6811320.3, 334212.1 6811299.8, 334222.3 6811293.4, 334229.1 6811289, 334246.1 6811278.8, 334247.2 6811277.9, 334259.7 6811266.1, 334293.4 6811275.9, 334317.7 6811292.1, 334342.2 6811311.5, 334347.7 6811327, 334357.1 6811336.4, 334357.7 6811351, 334399.4 6811418.5, 334400.8 6811419.9, 334409.8 6811428.8, 334451 6811466.3, 334501.6 6811497.5, 334510.6 6811503, 334560.9 6811532.6, 334576.7 6811541.8, 334585.9 6811547.4, 334634.8 6811581.6, 334647.2 6811590.4, 334656.3 6811596.7, 334673.2 6811615.1, 334690.2 6811633.4, 334706.7 6811651.3, 334751.3 6811669.2, 334756.3 6811672.2, 334759 6811676, 334762.5 6811678.9, 334769.5 6811682.5, 334778.2 6811685.8, 334784.6 6811690.5, 334789.1 6811697.1, 334794 6811706.8, 334798.8 6811717.8, 334802.4 6811726.7, 334805.7 6811732.5, 334808.6 6811735.7, 334812.3 6811737.7, 334814.6 6811739, 334819.3 6811746, 334823.6 6811752.6, 334827.1 6811758.8, 334830.6 6811762.8, 334836.3 6811766.9, 334839 6811766.7, 334843.9 6811771.2, 334848.6 6811775.7, 334854.1 6811777.9, 334860.4 6811782.4, 334867.1 6811785.9, 334872.1 6811789.2, 334876.6 6811793.6, 334881.5 6811799.4, 334883.3 6811804.3, 334885 6811807.2, 334888.8 6811808.4, 334892 6811809.3, 334895.1 6811810.7, 334898.2 6811812, 334900.9 6811813.6, 334905 6811815.9, 334909.2 6811819, 334911.5 6811822.3, 334912.2 6811825, 334912.5 6811829.8, 334913.7 6811835.4, 334916.8 6811838.6, 334918.9 6811842.9, 334920.5 6811848.8, 334922 6811856.1, 334923.7 6811861.4, 334924.6 6811867.5, 334925.3 6811872.2, 334925.9 6811875, 334927.2 6811877.7, 334929.4 6811880.1, 334931.9 6811881.2, 334961 6811881.1, 335007.1 6811888.1, 335040.1 6811890.7, 335069.5 6811893.8, 335096 6811899.1, 335099.1 6811899.6, 335105.2 6811909.3, 335110.5 6811920.6, 335116 6811930.8, 335121.8 6811940.5, 335126.3 6811945.5, 335129.7 6811953.2, 335132.1 6811961.8, 335135.6 6811969.9, 335136.5 6811975.3, 335145 6812004.8, 335149.7 6812015, 335233.2 6812003.8, 335307.9 6811968.2, 335382 6811946.9, 335391.5 6811934, 335401.7 6811915.4, 335409.2 6811898.7, 335420.5 6811874.6, 335430.4 6811851.2, 335435.9 6811837.6, 335458.8 6811850.3, 335485.3 6811864.1, 335513 6811871.6, 335537.9 6811871.4, 335672 6811771.3, 335776.5 6811710.5, 335851.2 6811684.9, 335876 6811659.7, 335940.6 6811499.3, 335984 6811501.9, 336000.7 6811501.5, 336038.9 6811500.6, 336059.4 6811497.1, 336066.9 6811492.1, 336072 6811487, 336073.4 6811478.3, 336073.3 6811458.7, 336075.2 6811432.4, 336082 6811412.6, 336087.9 6811404.2, 336097.9 6811396.8, 336110.8 6811390.5, 336125.5 6811384.9, 336139.2 6811380.5, 336156.3 6811374.4, 336170.6 6811367, 336182.6 6811358.6, 336195.3 6811347.6, 336206.8 6811335.9, 336221 6811323.1, 336231.7 6811309.2, 336238.9 6811297.8, 336246.7 6811283.5, 336252.4 6811270.3, 336260.2 6811254.3, 336268.1 6811238.7, 336278.4 6811221.8, 336292 6811204.2, 336305.4 6811186.1, 336318.4 6811166.3, 336329.9 6811149.2, 336341.1 6811132.7, 336351.3 6811123.1, 336356.6 6811117.2, 336363.6 6811115.1, 336371.1 6811112.4, 336378.7 6811110.1, 336390 6811106.6, 336399 6811103.2, 336410.2 6811099.6, 336429.2 6811096.4, 336446.9 6811092.5, 336460.5 6811088.7, 336471.5 6811086.2, 336482.6 6811084.2, 336484.1 6811084, 336484.3 6811082.4, 336483.2 6811073.3, 336482 6811063.2, 336480.6 6811054.3, 336478.7 6811046, 336475.8 6811037.5, 336472.5 6811032, 336470.1 6811026, 336469.7 6811017.6, 336469.4 6811011.5, 336465.6 6811004.5, 336458.9 6810995.2, 336454.5 6810988.1, 336449.8 6810980.6, 336446.1 6810972.8, 336441.4 6810961.8, 336440.3 6810955.6, 336438.2 6810948.8, 336434.1 6810936.8, 336436.3 6810932, 336434.6 6810915.1, 336409.9 6810899.8, 336399.4 6810876, 336381.7 6810849.2, 336366 6810841.3, 336354.8 6810829.7, 336343.9 6810814.9, 336331.5 6810812.4, 336314.9 6810776.8, 336310.5 6810765.7, 336313.4 6810757.6, 336315.3 6810745.4, 336314.2 6810741.4, 336310.5 6810723.9, 336314.9 6810708.2, 336318.1 6810695.2, 336282.3 6810659.8, 336270.5 6810648.2, 336254 6810638.1, 336232.7 6810625, 336190.1 6810598.9, 336164.9 6810564.1, 336156.9 6810533.5, 336188.8 6810434, 336160.4 6810355.6, 336148 6810358.9, 336132.3 6810349.7, 336107.2 6810334.2, 336082.2 6810325.1, 336054 6810316, 335989.2 6810202.2, 335828.5 6809920, 335820.4 6809903.3, 335815.1 6809892.2, 335807.4 6809876.1, 335797.9 6809856.3, 335788.2 6809835.6, 335777.3 6809814, 335771.8 6809801.2, 335768.6 6809790.3, 335764.7 6809777.7, 335759.6 6809764.6, 335751.7 6809750.9, 335742.6 6809739, 335734.5 6809728.7, 335722.8 6809717.6, 335717.3 6809711.7, 335708.3 6809702.1, 335701.6 6809690, 335700.9 6809684.1, 335659 6809566.9, 335713.7 6809527.5, 335733.5 6809502.3, 335807.9 6809436.8, 335832.6 6809401.6, 335883.2 6809361.2, 335902.7 6809301.1, 335957.2 6809240.7, 335962.1 6809230.6, 335976.8 6809200.5, 336006.5 6809160.3, 336010.9 6809090.3, 336035.8 6809080.1, 336078.3 6809045.4, 336085.5 6809039.8, 336100.5 6809049.6, 336135.7 6809098.8, 336139.8 6809090.4, 336147.6 6809079.7, 336155.6 6809070.8, 336166.3 6809060, 336177 6809049.5, 336189.1 6809038.1, 336201.5 6809024.8, 336206.9 6809018.4, 336230.7 6808959.6, 336229.9 6808859.7, 336249.4 6808794.6, 336248.5 6808684.7, 336228 6808505, 336232.3 6808425, 336231.5 6808316.2, 336231.3 6808300.1, 336276.2 6808284.7, 336276.1 6808274.7, 336183.2 6807940.9, 336195.1 6807933.9, 336216.5 6807926.1, 336234.3 6807921.2, 336255.3 6807914, 336274.2 6807905.4, 336295.3 6807894.8, 336316.2 6807884.6, 336343.4 6807871.2, 336283.1 6807790, 336273 6807770.1, 336302.6 6807729.9, 336352.9 6807713.7, 336398.3 6807699.1, 336467.9 6807653.6, 336487.8 6807643.4, 336497.7 6807628.3, 336517.6 6807623.2, 336622.1 6807572.4, 336721.9 6807552.6, 336736.9 6807552.4, 336758.1 6807600.7, 336767.4 6807622.1, 336812.8 6807671.7, 336847.8 6807671.4, 336863 6807696.3, 336882.3 6807736.1, 336952.3 6807745.5, 336988.2 6807860.2, 336963.4 6807875.4, 336978.5 6807895.2, 337023.5 6807899.9, 337083.4 6807885.4, 337158 6807878, 337182.8 6807875.5, 337193.2 6807874.5, 337245.4 6807861.7, 337262.3 6807855.8, 337312.4 6807867.9, 337387.4 6807879.8, 337411 6807883.5, 337462.5 6807891.7, 337475.4 6807892.5, 337503.1 6807894.5, 337554.6 6807906.5, 337580.5 6807909.9, 337600.8 6807906.8, 337637.7 6807907.4, 337643.2 6807911.8, 337698.3 6807921.3, 337713.4 6807941.2, 337748.7 6807975.9, 337773.7 6807985.7, 337793.7 6807985.5, 337817.8 6807978.7, 337841.8 6807972, 337895.2 6807971.8, 337928.3 6807952.6, 337964.2 6807947.2, 337978.3 6807945, 337924.5 6808090.4, 337954.8 6808130.1, 337920 6808245.6, 337942 6808296.6, 337945.2 6808301.9, 337952.1 6808316.7, 337959.4 6808345.3, 337968.3 6808383, 337977.8 6808423, 337989 6808469.4, 338001.7 6808522.9, 338011.1 6808563.1, 338018.3 6808591.7, 338027.4 6808630.2, 338036.9 6808669.7, 338042.3 6808690.3, 338047.3 6808708.9, 338061.4 6808706.4, 338065.3 6808705.6, 338094 6808700.1, 338126.3 6808693.6, 338153.4 6808688.6, 338179.7 6808683.3, 338207.1 6808677.2, 338231.9 6808671, 338256.7 6808663.3, 338280.6 6808654.4, 338309.1 6808643.6, 338333.3 6808634.3, 338364.3 6808621.6, 338399.1 6808608.9, 338426.2 6808598, 338459.8 6808584.8, 338482 6808576.7, 338500.5 6808569.4, 338502.1 6808568.7, 338519.1 6808561.6, 338536.1 6808553.1, 338558 6808541.8, 338568.3 6808536.2, 338578.3 6808560.7, 338587.9 6808585.8, 338598.9 6808613.2, 338609 6808637.8, 338619 6808661.5, 338627.9 6808685, 338634.9 6808703.7, 338638.1 6808712.1, 338648.6 6808737.6, 338659.2 6808761.2, 338670.4 6808781.8, 338680.7 6808798.6, 338691.9 6808814.7, 338703.1 6808831.9, 338713 6808848.5, 338722.7 6808867.9, 338732.5 6808888.4, 338742.9 6808912.6, 338752.8 6808937, 338762.8 6808959.6, 338775.6 6808981.6, 338789.2 6808984.7, 338928.3 6809015.5, 339009.5 6809037.9, 339094.1 6808997.2, 339143.8 6808961.9, 339173.7 6808951.6, 339203.7 6808952.4, 339253.7 6808962, 339273.9 6808976.8, 339304.1 6809011.5, 339329.3 6809036.3, 339354.3 6809036.1, 339364.3 6809036, 339388.8 6809031.2, 339413.4 6809026.4, 339437.8 6809021.6, 339444.1 6809020.4, 339456.6 6809020.3, 339469.1 6809020.2, 339484.1 6809020, 339507.5 6809025.5, 339530 6809029.5, 339561.9 6809028.2, 339579.8 6809026.9, 339588.9 6809026.3, 339647.6 6809035.3, 339709.2 6809046.8, 339741.3 6809047.6, 339747.2 6809047.2, 339750.5 6809047, 339760.6 6809046.4, 339770.6 6809045.8, 339782.9 6809044.7, 339787.8 6809044.5, 339792.9 6809045.2, 339798 6809049.3, 339800.8 6809052, 339804.2 6809053.3, 339807.9 6809054.2, 339812.3 6809054.4, 339816 6809054.1, 339821.5 6809053.8, 339825 6809054.1, 339829.3 6809056.7, 339832.8 6809058.1, 339836.7 6809059.6, 339840.6 6809060.5, 339845.2 6809061.5, 339851.1 6809061.9, 339856.5 6809062.7, 339861.9 6809062.8, 339867.7 6809063.2, 339871.7 6809063.8, 339875.4 6809064.7, 339879.1 6809066.5, 339883.4 6809068.3, 339887.8 6809067.6, 339892.3 6809066.6, 339895.8 6809065.5, 339899.4 6809064.3, 339903.8 6809063.3, 339909.7 6809063.5, 339921.9 6809066, 339929.5 6809068.4, 339935.5 6809070, 339940.2 6809072.5, 339944.6 6809075.3, 339947.7 6809077.2, 339952.8 6809082.2, 339954.7 6809085.6, 339958 6809090.1, 339964.5 6809096, 339968.1 6809099.7, 339972.2 6809103.3, 339975.9 6809106.6, 339980.5 6809109.5, 339986 6809115.1, 339989.3 6809118.1, 339993.1 6809122, 339996.9 6809125.6, 340001.1 6809128.7, 340005.2 6809131.7, 340009.2 6809133.8, 340015.4 6809138.7, 340020.8 6809142.9, 340026.2 6809145.7, 340029.3 6809148.5, 340033.8 6809151.3, 340040 6809155.7, 340043.9 6809158, 340047.1 6809161.1, 340051.9 6809165.4, 340056.2 6809167.5, 340061 6809170.3, 340065.3 6809174.3, 340068 6809177.4, 340071.4 6809181.1, 340073.9 6809184.5, 340077.2 6809190.2, 340080.3 6809196.2, 340084 6809202.1, 340087.3 6809207.8, 340090.8 6809214, 340092.3 6809216.8, 340093.6 6809219.1, 340095.7 6809224.2, 340098.3 6809228.9, 340101.2 6809234.5, 340103.5 6809238.9, 340106.2 6809244.2, 340109.6 6809248.7, 340112.4 6809252.8, 340117 6809260.2, 340121.6 6809266.1, 340126.1 6809272.4, 340130.8 6809279.9, 340133.3 6809284.4, 340136.5 6809289.7, 340140.2 6809296.1, 340143.4 6809302.2, 340146 6809306.4, 340148.4 6809310.6, 340150.1 6809314.5, 340152.8 6809318.5, 340156 6809322.5, 340160 6809327.4, 340162.1 6809330, 340163.6 6809331.5, 340168.8 6809337.2, 340172.1 6809339.8, 340176.6 6809341, 340180.2 6809342.8, 340183.1 6809344.7, 340185.2 6809346, 340187.7 6809346.3, 340190.3 6809345.8, 340193.7 6809344.1, 340196.7 6809342.7, 340199.7 6809341.1, 340202.9 6809339.7, 340206.4 6809339, 340210.7 6809339.6, 340214.2 6809340.5, 340219.6 6809341.1, 340226.1 6809341.4, 340234.9 6809340.9, 340240.5 6809340.1, 340244.4 6809339.4, 340248.5 6809338.5, 340255 6809337.9, 340259.4 6809337.8, 340263.6 6809338.6, 340267.9 6809339.9, 340271.8 6809341.4, 340275.6 6809343.7, 340280.2 6809348.9, 340285.3 6809354.5, 340290.3 6809359.8, 340294.6 6809364.2, 340302.1 6809371, 340307.8 6809375.3, 340313 6809379.6, 340318 6809383.5, 340325.5 6809390.1, 340330 6809393.2, 340336.6 6809397.8, 340339.9 6809400.3, 340343.9 6809403.1, 340347.8 6809405.9, 340350.7 6809407.6, 340353.6 6809409.8, 340356 6809412.2, 340356.5 6809413.3, 340363.4 6809407.6, 340385.7 6809405, 340406.7 6809402.4, 340435.4 6809398.7, 340440.2 6809359, 340510.1 6809344.5, 340514.2 6809239.5, 340664.1 6809238.3, 340678.9 6809223.2, 340789.9 6809222.4, 340795.4 6809225.9, 340808.8 6809234.1, 340814.2 6809237.6, 340847.6 6809248.4, 340851 6809250.6, 340852.3 6809253.2, 340852.4 6809256.4, 340974.4 6809296.7, 341120.1 6809405.4, 341185.5 6809454.9, 341270.9 6809509.1, 341366 6809534.3, 341541 6809542.9, 341656 6809547, 341661.8 6809646.9, 341665.9 6809661.8, 341811.7 6809651.6, 341891.6 6809641, 341891.3 6809611, 341951.3 6809610.5, 342039.4 6809613.7, 342045 6809595.6, 342051 6809575.1, 342056.8 6809557.9, 342065.6 6809550.2, 342085.6 6809534.5, 342125.5 6809524.2, 342129.8 6809449.2, 342123.9 6809329.3, 342198.6 6809303.7, 342233.3 6809264.4, 342239.1 6809239.4, 342223.6 6809179.6, 342156.8 6809082.9, 342181.8 6809076.5, 342209.7 6809063.8, 342236.2 6809051.1, 342248.3 6809045.1, 342246.7 6808949.5, 342271.1 6808879.4, 342281 6808864.3, 342255.7 6808834.5, 342240.7 6808829.7, 342155.8 6808839.4, 342135.8 6808829.5, 342106.2 6808754.8, 342085.6 6808680, 342095.4 6808655, 342051.1 6808618.7, 342035 6808605.5, 342009.7 6808565.7, 342009.6 6808559, 342009.1 6808495.8, 341933.1 6808366.5, 341858.5 6808282.2, 341794.5 6808313.2, 341787 6808319.3, 341749.7 6808339.9, 341726.4 6808352.6, 341704.6 6808363.7, 341681.4 6808376.3, 341668.9 6808384.2, 341647.2 6808398.5, 341633.1 6808403.3, 341612.9 6808416, 341594.3 6808423.9, 341578.7 6808428.7, 341552.2 6808430.5, 341513.2 6808438.6, 341494 6808444, 341429.4 6808479.5, 341385.3 6808484.7, 341384.5 6808484.9, 341379.4 6808479.9, 341342.7 6808460.3, 341334.5 6808443.4, 341326.1 6808426.1, 341317.8 6808415.5, 341307 6808403.2, 341295.9 6808393.1, 341290 6808387.8, 341265.2 6808370.2, 341246.9 6808355.7, 341226.9 6808334.6, 341209.1 6808312.2, 341192.2 6808291.4, 341176.8 6808269.3, 341173 6808263.7, 341119.9 6808199.5, 341102.7 6808181.2, 341105.1 6808135, 341103.7 6808122.8, 341098.9 6808078.8, 341099.8 6808002.2, 341107.7 6807894.4, 341081.6 6807892.3, 341020.8 6807887.3, 340871.7 6807867.5, 340871.3 6807817.5, 340911.3 6807812.2, 340910.7 6807747.2, 340900.3 6807697.4, 340875 6807652.6, 340877.8 6807539.4, 340878.2 6807523.3, 340878.5 6807509.2, 340878.7 6807484.3, 340878.8 6807458.5, 340879.3 6807431.1, 340878.7 6807407.9, 340877.4 6807387.6, 340874.2 6807367.2, 340868.6 6807351.5, 340859.2 6807334.7, 340848.9 6807316.3, 340869.1 6807303.3, 340894.4 6807286.3, 340913.9 6807273.9, 340932.7 6807259.7, 340947.2 6807248.1, 340965.1 6807230.7, 340984.5 6807209.4, 341004.9 6807187.4, 341024.4 6807164.7, 341051.7 6807133.8, 341059.9 6807125, 341061.9 6807122.8, 341078.9 6807104.2, 341083.7 6807098.7, 341096.9 6807084, 341117.2 6807062.1, 341137.2 6807038.8, 341154.9 6807018.5, 341174.6 6806996.6, 341192.9 6806974.6, 341212.6 6806951.5, 341233.9 6806926.5, 341257.5 6806898.8, 341278.4 6806873.8, 341300.5 6806847.4, 341321.1 6806823.7, 341336 6806806.2, 341348 6806791.9, 341362.4 6806775.9, 341363.1 6806775.1, 341357.4 6806759.2, 341349.4 6806706.7, 341344.5 6806669.6, 341338.3 6806630.4, 341334.3 6806606.8, 341332.3 6806587.4, 341333.9 6806573.4, 341337.6 6806559.8, 341339.2 6806548.7, 341337.9 6806541.2, 341336.4 6806536.3, 341332.3 6806533.4, 341312.8 6806536.1, 341322.5 6806410.8, 341362.4 6806395.5, 341406.2 6806250.2, 341413.3 6806237.3, 341425.9 6806215.1, 341505.8 6806215.4, 341540.1 6805957.3, 341542.5 6805939.4, 341546.5 6805909.8, 341549.1 6805890.3, 341548.7 6805835.3, 341518.4 6805800.6, 341478.5 6805800.9, 341314.1 6805861.2, 341244.2 6805871.8, 341064.1 6805912.9, 341060.2 6805908.3, 341048.4 6805895.5, 341040.1 6805887.2, 341022.2 6805870.8, 341011.7 6805860.6, 340990.6 6805841.7, 340973.4 6805825.7, 340957.8 6805811.9, 340943.2 6805798.8, 340923 6805781.6, 340908.1 6805770, 340892.8 6805757.2, 340877 6805743.8, 340853.8 6805723.7, 340841.6 6805706.4, 340819.3 6805673.9, 340791.1 6805634.7, 340769.9 6805602.2, 340752.1 6805576, 340736.5 6805550.6, 340726.2 6805533.1, 340716.9 6805516.5, 340708.1 6805500.5, 340704.9 6805492.3, 340731 6805482.3, 340767.2 6805469.9, 340797 6805449.7, 340801.8 6805419.7, 340816.6 6805404.6, 340836.6 6805394.4, 340866.4 6805374.2, 340881.2 6805349.1, 340888.2 6805325.1, 340895.2 6805301.1, 340895.7 6805299, 340915.1 6805283.2, 340920.6 6805278.8, 340970.6 6805265.2, 340990.4 6805257.9, 340998.6 6805255, 341000.3 6805252.2, 341004.4 6805245.9, 341006.4 6805232.9, 341008.2 6805227.3, 341011.6 6805225.2, 341013.5 6805223, 341013.2 6805220.8, 341013.1 6805218.4, 341017 6805210.7, 341024.5 6805199.5, 341025.9 6805196.8, 341026.7 6805194.3, 341027.1 6805191.4, 341030 6805188.8, 341041.8 6805183, 341043.3 6805181.1, 341046.8 6805176.5, 341050.6 6805172.5, 341055.3 6805168.8, 341059.2 6805165.4, 341063.8 6805162.6, 341070 6805160.2, 341075.2 6805158.2, 341082.7 6805154, 341085.9 6805152.3, 341090.5 6805150.4, 341094.2 6805148.6, 341096.9 6805145.6, 341098.7 6805142.8, 341101.2 6805140.9, 341104.7 6805139.6, 341108.5 6805137.8, 341111.4 6805135.1, 341112.2 6805132.1, 341112.8 6805129, 341115.2 6805126.2, 341118 6805123.5, 341120.9 6805121.9, 341123.8 6805120.2, 341126.5 6805116.9, 341129.4 6805113.3, 341132.9 6805111.2, 341137.2 6805108.9, 341142.8 6805106.3, 341146.8 6805104.4, 341151.3 6805100.3, 341154.7 6805097.2, 341158.2 6805096.8, 341161 6805097.8, 341177.2 6805077.9, 341179.5 6805052.8, 341199.3 6805027.7, 341193.7 6804957.8, 341193.5 6804932.8, 341193.4 6804912.8, 341222.6 6804872.8, 341227 6804869.9, 341233.8 6804863.4, 341236.2 6804860.1, 341238.2 6804857, 341239.8 6804853.8, 341242.3 6804851.2, 341245.2 6804848.4, 341246.2 6804845.4, 341246.7 6804842.8, 341249.3 6804839.4, 341252 6804836, 341255 6804833.9, 341257.2 6804830.9, 341257.4 6804827.6, 341257.9 6804824.9, 341258.5 6804821.2, 341259 6804817.5, 341259.8 6804814.5, 341260.6 6804811.5, 341261.5 6804808.3, 341262.6 6804805.5, 341264.4 6804802.4, 341267.4 6804800.3, 341270.8 6804799, 341274.9 6804797.3, 341280.1 6804796.3, 341284.8 6804795.2, 341288.5 6804793.6, 341297.6 6804790.6, 341301.3 6804789.2, 341306.9 6804786.2, 341311.2 6804784.6, 341314.5 6804783, 341318.6 6804781.6, 341323.8 6804779.6, 341329.5 6804777.2, 341336.3 6804774, 341339.3 6804772.6, 341346 6804769.8, 341352.4 6804766.2, 341355.8 6804764.8, 341358.7 6804762.4, 341362.4 6804759.9, 341366.5 6804758.5, 341369.7 6804755.6, 341372.9 6804753.6, 341377.2 6804751.2, 341381.8 6804749.3, 341384.3 6804748.7, 341387.8 6804746.8, 341392 6804744.2, 341395 6804742.8, 341397.2 6804741.4, 341399.2 6804741, 341402.7 6804743.3, 341406.5 6804746.1, 341442.9 6804755.9, 341482.8 6804740.6, 341492.7 6804725.5, 341532.5 6804711.2, 341562.1 6804702.5, 341567.4 6804700.9, 341587.5 6804715.7, 341593 6804770.7, 341618.1 6804785.4, 341722.5 6804729.6, 341742.5 6804724.5, 341772.6 6804739.2, 341832.5 6804738.7, 341867.4 6804723.4, 341891.6 6804717.5, 341916 6804711.6, 341940.2 6804705.6, 341947.2 6804703.8, 341966 6804687.4, 341981.9 6804673.5, 342006.9 6804673.3, 342031.9 6804673.1, 342056.9 6804672.9, 342061.8 6804672.9, 342086.2 6804667.3, 342106.7 6804662.5, 342131.3 6804658, 342155.8 6804653.4, 342205.1 6804618.9, 342206 6804631.4, 342223.1 6804696.6, 342228.3 6804715.4, 342366.3 6804709.4, 342387.9 6804700.3, 342399.5 6804714.7, 342383.6 6804718.6, 342383.6 6804724.8, 342410.6 6804736.4, 342389.4 6804754.2, 342395.6 6804765.7, 342385.1 6804783.1, 342374.5 6804778.2, 342372.1 6804806.6, 342380.2 6804836.5, 342369.7 6804867.3, 342379.8 6804892.8, 342400 6804910.1, 342413 6804907.2, 342435.1 6804878.4, 342458.8 6804885.8, 342493.8 6804873, 342558 6804854.7, 342582.9 6804844.5, 342597.9 6804844.4, 342608.1 6804864.3, 342747.8 6804843.2, 342787.8 6804847.9, 342813 6804960.7, 342824.3 6804960, 342855.4 6804956.6, 342896.6 6804952.4, 342944.5 6804946.9, 343012.8 6804939.3, 343056.5 6804934.7, 343095.2 6804929.7, 343119.3 6804927.3, 343131.3 6804926.1, 343203.7 6804917.7, 343259 6804910.7, 343303.3 6804905.1, 343318.7 6804903.1, 343330.1 6804901.6, 343377.9 6804894.8, 343399.8 6804890.1, 343414.4 6804884.8, 343427.5 6804878.3, 343450.6 6804866.5, 343475.1 6804853.8, 343511.3 6804838.8, 343551.3 6804827.5, 343592.5 6804817.6, 343619.4 6804811.5, 343635.9 6804809.4, 343655.6 6804806.7, 343683.8 6804804.6, 343701.4 6804802.6, 343703.2 6804802.4, 343720.1 6804799.5, 343751.3 6804793.1, 343794 6804782.8, 343806.9 6804779.9, 343818.9 6804777.2, 343825 6804775.8, 343842.8 6804771.8, 343850.4 6804770.1, 343854.3 6804769.3, 343863.9 6804767.2, 343914.7 6804756.2, 343922.8 6804754.3, 344002.5 6804734.9, 344011.5 6804733, 344017.6 6804734.5, 344020.9 6804730.8, 344025.3 6804727.7, 344035.1 6804722.9, 344053.1 6804715.2, 344064 6804709.4, 344081.4 6804702.2, 344097.1 6804697.2, 344114.4 6804692, 344131.6 6804687.4, 344158.7 6804680.1, 344192.4 6804670.9, 344236 6804745.1, 344296.1 6804759.6, 344331 6804754.3, 344362.6 6804744.8, 344368.3 6804730.2, 344390.4 6804688.9, 344395.4 6804683.8, 344655.2 6804682.7, 344644.9 6804647.8, 344619.6 6804608.1, 344614.3 6804568.1, 344613.9 6804522.8, 344613.8 6804503.2, 344568.9 6804397.6, 344558.4 6804332.7, 344572.5 6804222.7, 344616.6 6804113.4, 344607.6 6804069.2, 344609 6804062.5, 344602.8 6804013.5, 344629.4 6804013.2, 344640.4 6804015.5, 344661.7 6804016, 344706.5 6804016.1, 344713.3 6804013.7, 344727.7 6804016, 344736.9 6804019.9, 344743.4 6804015.9, 344755.4 6804008.1, 344771.4 6804008.9, 344782.8 6804004.4, 344824.7 6803994.6, 344834.1 6803991.9, 344848.6 6803993.7, 344868.3 6803993.1, 344887.1 6803995.3, 344892.5 6803998.2, 344902.8 6804010.9, 344913.8 6804017.9, 344920 6804020, 344927 6804013.8, 344929.9 6804003.5, 344935.5 6803996.2, 344943.3 6803993.9, 344951.1 6803995.3, 344980.7 6804009.1, 344985.7 6804013.9, 344985.2 6804018.1, 344978.1 6804029.3, 344975.1 6804046.8, 344973.9 6804061.4, 344965.6 6804066.7, 344966.2 6804071.7, 344974.2 6804075, 345006.9 6804074.8, 345031.6 6804078.4, 345056.3 6804082, 345081 6804085.6, 345083.2 6804089.2, 345096.2 6804110.5, 345131.2 6804110.2, 345141.3 6804120.1, 345156.8 6804185, 345172 6804214.8, 345192.1 6804224.6, 345216.8 6804184.5, 345295.5 6804214.5, 345302.2 6804248.7, 345302.4 6804268.7, 345326.8 6804273.6, 345368.7 6804268.8, 345404.6 6804259.1, 345435.6 6804244.7, 345460.4 6804225.9, 345465 6804213.3, 345464.9 6804202.4, 345466.5 6804193, 345482 6804180.4, 345500.5 6804166.2, 345517.6 6804145.7, 345540.8 6804119, 345570.2 6804085.9, 345610.5 6804045, 345612.9 6804008.3, 345613.5 6804005.6, 345602.3 6804002.4, 345547.1 6803991.7, 345452.3 6803972.2, 345427 6803967.7, 345381.4 6803955, 345367.5 6803949.2, 345369.7 6803926.2, 345369.1 6803846.5, 345367.4 6803820.7, 345368.2 6803792.9, 345370.8 6803755.3, 345382.3 6803680.4, 345392.6 6803612.3, 345399.9 6803579.5, 345410.6 6803569, 345427.4 6803557.1, 345447.8 6803489.6, 345451.3 6803477.9, 345451.8 6803476.1, 345488.7 6803489.6, 345492.5 6803485.6, 345519.8 6803441.2, 345515 6803425.8, 345522.5 6803417.1, 345557.3 6803388.8, 345578.8 6803372.4, 345614.4 6803335.6, 345654.9 6803289.7, 345661.6 6803284.1, 345669.9 6803274.3, 345721.7 6803235, 345663.3 6803143.8, 345649.5 6803120.8, 345633.3 6803097.2, 345610.6 6803078.1, 345614.4 6803070.9, 345615.3 6803063.8, 345613.9 6803054.1, 345596.4 6802990.2, 345588.6 6802986.8, 345570.9 6802979.3, 345567.6 6802973.4, 345564.1 6802959.6, 345559.3 6802904.7, 345561.7 6802878.9, 345563.6 6802869.9, 345569.6 6802856.7, 345590.3 6802829.8, 345602.9 6802815.9, 345604.8 6802808, 345605.9 6802791, 345594.1 6802791.4, 345597.5 6802701.3, 345593.6 6802701.7, 345592.2 6802687.7, 345593 6802687.6, 345592.2 6802642.3, 345593.1 6802621.1, 345596.8 6802624.3, 345626 6802631.2, 345626.5 6802612.6, 345631.4 6802565.8, 345634.4 6802561.5, 345669 6802544.1, 345681 6802544.5, 345700.4 6802540.3, 345723 6802539, 345746.1 6802532.8, 345761.6 6802534, 345762.9 6802531.5, 345764.2 6802518.6, 345760.5 6802496.2, 345748.6 6802448.9, 345725.9 6802329.4, 345726.9 6802322.7, 345719.9 6802282.7, 345711.1 6802226.4, 345675.7 6802089.9, 345751.9 6802086.7, 345781.6 6802081.6, 345763.1 6801997.8, 345804.2 6801987.8, 345893.5 6801957.5, 345907.2 6801953.3, 345944.7 6801947.2, 345991.4 6801936.2, 346035.1 6801927, 346088 6801913.9, 346111.3 6801906.7, 346102.4 6801878.6, 346174.5 6801848.5, 346240.1 6801822.4, 346256.7 6801812.7, 346260.5 6801807.8, 346266 6801807.7, 346303.9 6801791.2, 346292.3 6801770.5, 346267.2 6801736.1, 346254.4 6801721.5, 346241.6 6801710.9, 346240.7 6801710.6, 346226.3 6801707, 346179.3 6801666.1, 346171.5 6801661, 346168.7 6801659.1, 346166 6801651.5, 346169.1 6801641.7, 346189.3 6801628.6, 346221.6 6801610.5, 346227.1 6801607.3, 346248.1 6801593.5, 346268.6 6801582.8, 346283.7 6801569.9, 346291.9 6801553.4, 346305.9 6801540.1, 346332.4 6801526.8, 346353.7 6801516.3, 346366.6 6801511.5, 346395.9 6801503.4, 346415.6 6801496.1, 346432.3 6801489.9, 346421 6801451.5, 346426.5 6801449.1, 346406.6 6801434.1, 346399.3 6801424.9, 346386.4 6801402.8, 346374.5 6801402.9, 346353.7 6801401.7, 346345.8 6801395.4, 346336.1 6801384.9, 346331 6801370.9, 346324.9 6801348.4, 346314.8 6801329.2, 346303.3 6801301.1, 346300.2 6801281.4, 346292.7 6801266.5, 346287.4 6801258.5, 346267.5 6801243.8, 346250.1 6801226.9, 346223.2 6801209.6, 346216.3 6801203.1, 346198.7 6801191.8, 346188.6 6801178.3, 346171.1 6801162.6, 346160.7 6801155.2, 346155.8 6801151.9, 346136.7 6801154, 346102.5 6801153.9, 346085.3 6801157.3, 346069 6801158, 346026.2 6801159.5, 346015.4 6801158.2, 346025.5 6801133.3, 346025.8 6801127.1, 346015.3 6801115.2, 346007.8 6801111.4, 345998.3 6801106.4, 345985.3 6801094.4, 345960.6 6801056.7, 345955.7 6801050.9, 345944.3 6801033.9, 345991.3 6801004.2, 346011.1 6800989.5, 346063.8 6800950.8, 346093.5 6800931.3, 346126 6800910.2, 346212.9 6800858.3, 346284 6800819.6, 346339.6 6800787.1, 346397.2 6800752, 346417.8 6800738.1, 346451.5 6800714.2, 346486.7 6800689.9, 346495.9 6800682.2, 346525 6800664.9, 346526.3 6800664.1, 346552.4 6800650.7, 346579.5 6800639.1, 346582 6800638, 346622.7 6800621.8, 346710.1 6800586.3, 346740.3 6800574, 346741.4 6800573.5, 346751.7 6800568.9, 346765.7 6800562.3, 346805.4 6800540.8, 346836.3 6800519.4, 346869.3 6800494.8, 346901.3 6800472.4, 346916 6800463.3, 346931.8 6800453.7, 346944.3 6800446.2, 346987.4 6800422.4, 347047.8 6800389.6, 347133 6800335.7, 347173.9 6800309.2, 347251.1 6800262.8, 347290.4 6800241.3, 347325.5 6800220.4, 347374.3 6800189, 347467.4 6800124, 347487.8 6800110, 347496 6800104, 347487.4 6800091.7, 347456.9 6800056.9, 347450.2 6800051.7, 347411.2 6800030.6, 347397.2 6800026, 347384.3 6800017.4, 347354.1 6800002.1, 347334.3 6799998.9, 347325.1 6799995.8, 347319.7 6799992.6, 347316 6799987.1, 347309.2 6799982.4, 347303.6 6799980.8, 347287.1 6799969, 347283.8 6799953.4, 347279.8 6799949.5, 347210.9 6799908.8, 347204.9 6799905.9, 347196.5 6799905, 347192 6799901.4, 347189.8 6799896.5, 347185.8 6799892.8, 347168.6 6799895.3, 347165.6 6799891.1, 347164.5 6799886.5, 347152.3 6799880.2, 347146.7 6799880.3, 347130.3 6799884.2, 347114.8 6799889, 347113 6799891.7, 347110.1 6799903.9, 347106.9 6799905.1, 347086.8 6799902, 347078.7 6799902.6, 347031.9 6799901.9, 347005.4 6799903.6, 346988 6799903, 346984.6 6799883.4, 346983.8 6799870, 346980.6 6799867.7, 346979.3 6799867.6, 346975 6799867.1, 346964.1 6799869.5, 346957.2 6799873.2, 346945.7 6799873.4, 346923.5 6799868.1, 346851.8 6799849.8, 346851.2 6799890.2, 346853.6 6799900, 346852.7 6799909, 346849.8 6799914, 346846.4 6799925.4, 346826.7 6799937.5, 346814.7 6799940.6, 346811.3 6799942, 346811.1 6799943.6, 346809 6799943.3, 346778.8 6799951.5, 346732 6799965.1, 346712.8 6799973.4, 346710.5 6799973.4, 346702.8 6799958.6, 346699 6799958.8, 346677.7 6799953.5, 346673.6 6799949.6, 346663.1 6799936, 346654.2 6799918.5, 346637.8 6799886, 346536.9 6799878, 346469 6799849.9, 346267.1 6799835.8, 346240.5 6799871.3, 346161.1 6799854.3, 346143.8 6799850.6, 346131.1 6799839.9, 346078 6799823.8, 346060.2 6799820.3, 346056.2 6799821.9, 346053.9 6799831.3, 346050.5 6799833.4, 346031.6 6799834.8, 346024.1 6799848.9, 346018.5 6799852.3, 346011.6 6799854.4, 345995.1 6799852.1, 345989.9 6799854.1, 345983.6 6799850.7, 345970.4 6799847.7, 345959.3 6799845.3, 345947.5 6799839.6, 345938.1 6799832.6, 345937.5 6799826, 345932.3 6799813.8, 345919.3 6799799.5, 345919.2 6799795, 345924 6799790.5, 345925.1 6799786.9, 345923.5 6799781.7, 345917.1 6799776.6, 345876.4 6799756, 345858.2 6799749.5, 345834.7 6799738.5, 345831.7 6799705.3, 345827.9 6799702.2, 345785.4 6799709, 345777.2 6799708.5, 345760.8 6799704.7, 345750.3 6799698.6, 345734.7 6799698.1, 345726.1 6799696.2, 345668.5 6799692.1, 345643.7 6799689.5, 345639.9 6799688.1, 345620.9 6799690.2, 345616.5 6799689.2, 345615 6799683.8, 345608.1 6799683.9, 345595.4 6799675.8, 345517.7 6799600.6, 345514 6799599.8, 345510.2 6799598.7, 345505.9 6799599.2, 345500.6 6799597.4, 345496.2 6799592.9, 345493.7 6799587.1, 345494.3 6799579.8, 345496.4 6799572.4, 345496.6 6799565.1, 345495.8 6799559.7, 345493.3 6799554.7, 345489.2 6799550.1, 345484.6 6799546.5, 345473.9 6799541.8, 345471.1 6799537, 345467.3 6799532.1, 345461.8 6799526.3, 345457.8 6799522.5, 345456 6799518.2, 345454 6799516.6, 345450 6799516.2, 345446.1 6799517.2, 345441.5 6799519.6, 345436.3 6799513.9, 345430.9 6799510.3, 345414.9 6799502.1, 345414.6 6799499, 345413.8 6799496.4, 345407.4 6799493.5, 345406.2 6799490.6, 345403.4 6799488.4, 345397.5 6799484.2, 345392.3 6799480.3, 345386.3 6799473.6, 345381.6 6799469.3, 345376 6799466.5, 345370.6 6799462.4, 345367.1 6799457.4, 345362 6799451.3, 345358.9 6799446.4, 345354.5 6799445.3, 345351.1 6799445.5, 345350.1 6799442.7, 345348.2 6799440.5, 345345.3 6799439.3, 345345.3 6799435.8, 345343.2 6799434.3, 345340 6799434.6, 345335.9 6799436.4, 345333.1 6799435.3, 345330.7 6799433.4, 345325.6 6799432.1, 345316.2 6799428.7, 345311 6799427.5, 345308.6 6799425.1, 345305.9 6799421.3, 345303.9 6799419.8, 345301.2 6799420.1, 345291.2 6799411.5, 345285.1 6799405.1, 345280.7 6799403.1, 345279.3 6799400, 345284.7 6799381, 345290 6799352.7, 345291.1 6799343, 345293.7 6799336.8, 345295 6799327.4, 345297.4 6799286.7, 345295.3 6799263.8, 345289.4 6799234.7, 345287.4 6799215.9, 345278.6 6799214.5, 345272.7 6799213.2, 345267.9 6799211.5, 345263.2 6799207, 345261.1 6799204.3, 345257.4 6799203.6, 345253.2 6799201.6, 345248.7 6799198.3, 345245.6 6799195.1, 345238 6799184.8, 345235.3 6799183, 345232.1 6799183.5, 345228.5 6799185.7, 345222.7 6799185.7, 345220.3 6799184.4, 345219 6799181.9, 345216.7 6799182.5, 345212.9 6799184.8, 345208.3 6799185.4, 345202.5 6799184.2, 345196.4 6799181.9, 345187.6 6799179.7, 345180 6799178.8, 345171.6 6799179.8, 345158.6 6799181.8, 345153.8 6799181.6, 345147 6799179, 345137.3 6799174.3, 345135.4 6799173.4, 345129.3 6799171.7, 345125.3 6799172.5, 345121.9 6799174.2, 345117.2 6799173.1, 345114.2 6799171.7, 345107.2 6799173.5, 345104.1 6799172.9, 345102.5 6799170.2, 345101.7 6799165.8, 345090.5 6799165.3, 345086.2 6799163, 345083.9 6799158.3, 345081.8 6799156, 345078.7 6799154.3, 345074.7 6799148.8, 345069.1 6799151.8, 345064.8 6799156.8, 345059.6 6799166.2, 345054.4 6799183.3, 345047.7 6799183.9, 344996.3 6799178.6, 344986.8 6799176.3, 344967.6 6799175.1, 344952.9 6799172.7, 344949 6799173.2, 344945.2 6799175.3, 344944.2 6799178.9, 344942.2 6799180.3, 344940.2 6799178.7, 344938.4 6799176.7, 344936.8 6799177.6, 344936.8 6799180, 344935.8 6799182.7, 344932.9 6799183.5, 344930.1 6799181.7, 344925.1 6799181.4, 344926.1 6799178, 344926.2 6799170.6, 344923.7 6799160, 344917.2 6799155.9, 344913 6799149.1, 344906 6799143.4, 344900.4 6799135.6, 344897.9 6799132.2, 344896.7 6799125.3, 344903.2 6799114.2, 344906.7 6799078.5, 344912.2 6799070.8, 344921.1 6799065.7, 344922.3 6799061.5, 344971.3 6798994.4, 345002.9 6798950.5, 345047.4 6798875.5, 345033.1 6798860.4, 345020 6798854.2, 345015.6 6798852.5, 345028.5 6798845, 345034.7 6798842.2, 345040.9 6798841.4, 345051.2 6798835.3, 345060.6 6798834.4, 345066 6798836.4, 345070 6798826.4, 345072.4 6798815.2, 345070.3 6798787.3, 345071.6 6798779.5, 345076.5 6798777.2, 345102.5 6798774.7, 345112.7 6798770.7, 345117.4 6798767, 345119.6 6798761.4, 345121.3 6798750, 345121.6 6798733.2, 345124.2 6798725.6, 345130.9 6798712.9, 345135.6 6798708.5, 345143.8 6798706.4, 345160.2 6798706.2, 345162.6 6798705, 345164.9 6798698.2, 345166.4 6798682.4, 345163.4 6798673.3, 345162.4 6798663.6, 345164.7 6798654.6, 345170.7 6798641, 345171 6798636.2, 345168.6 6798626.2, 345168.5 6798623.8, 345171.1 6798618, 345177.2 6798608.1, 345176 6798599.1, 345167.1 6798588, 345164.3 6798586.6, 345156.1 6798587, 345151.7 6798585.2, 345149.7 6798581.9, 345149.9 6798578.7, 345152.4 6798575, 345156 6798564.6, 345153 6798560, 345145.4 6798554.5, 345136.6 6798554.2, 345134.1 6798549.8, 345136.5 6798538.9, 345136.8 6798534.6, 345133.4 6798527.4, 345135.1 6798511.4, 345133.5 6798506.4, 345130.3 6798501.9, 345128.2 6798494.7, 345125.2 6798467.8, 345121.6 6798457, 345113.9 6798446.1, 345110.3 6798443.4, 345099.8 6798435.1, 345096 6798435.7, 345089.5 6798448.3, 345085.8 6798451, 345077.8 6798451.6, 345068.4 6798448.8, 345056.1 6798442.9, 345046.7 6798435.2, 345026.3 6798423.3, 345019.6 6798414.3, 345002.8 6798401.7, 345002.3 6798399.9, 345003.9 6798397.1, 345018.6 6798393.6, 345034.6 6798387.3, 345039.5 6798383.7, 345050.9 6798371.6, 345051.8 6798358.2, 345042.5 6798332.7, 345039.4 6798320.6, 345029.8 6798306.3, 345027.3 6798299.4, 345026 6798289, 345028.2 6798278.6, 345032.3 6798272.2, 345036.9 6798271.4, 345041.1 6798273.2, 345044.2 6798276.3, 345049.8 6798293.7, 345050.8 6798295.9, 345052.3 6798295.8, 345070.7 6798288.9, 345080.2 6798280.5, 345089.1 6798269.7, 345098.2 6798262.8, 345132.1 6798261, 345166.1 6798259.4, 345176.5 6798257.8, 345180.5 6798250.8, 345196.7 6798239.8, 345204.8 6798229.9, 345208.8 6798209.7, 345218.6 6798198.8, 345238.7 6798182.4, 345249.7 6798168.3, 345253.5 6798157, 345264.6 6798158.9, 345361 6798135.4, 345365.8 6798153.1, 345369.1 6798176, 345447.4 6798168, 345474.7 6798163.1, 345499.2 6798157.5, 345529.3 6798148.6, 345573.3 6798131.3, 345606.6 6798118.6, 345678.9 6798097.1, 345709.9 6798097.3, 345723.6 6798094.6, 345791.4 6798071.9, 345905.3 6798029.4, 345894.8 6797985.9, 346004.8 6797959.8, 346058.7 6797951.8, 346082 6797944.8, 346090.9 6797937.6, 346094.6 6797957.9, 346098 6797999.5, 346095.8 6798023.2, 346088.2 6798072.1, 346075.4 6798078.2, 346076.1 6798089.3, 346119.3 6798076.9, 346153.8 6798069.3, 346180 6798061.7, 346275.7 6798039.6, 346324.5 6798033.5, 346370.4 6798022.9, 346401.1 6798018.8, 346446.5 6798015, 346480.3 6798016.4, 346533.5 6798025.2, 346546.7 6798032.7, 346558.2 6798045.1, 346570.4 6798050.6, 346575.4 6798055.4, 346602 6798074, 346613.1 6798085.6, 346646.3 6798110.6, 346662.2 6798126.7, 346678.5 6798142.8, 346688.5 6798146.8, 346693.1 6798148.9, 346700.3 6798149.8, 346724.1 6798142.9, 346740.4 6798135.2, 346752.4 6798161.3, 346785.2 6798261, 346802.3 6798292.3, 346835.4 6798338.4, 346856.6 6798383.8, 346866.4 6798409.1, 346882.4 6798450.3, 346913 6798444.6, 346944.3 6798433.8, 346975.6 6798419.1, 346980.9 6798404, 347121.8 6798439.8, 347159.7 6798446.8, 347164.4 6798510.9, 347192.7 6798503.6, 347228.7 6798499.6, 347229.1 6798640.1, 347260.8 6798633, 347288.4 6798632, 347350.3 6798624.1, 347365.5 6798766.7, 347389.7 6798762.1, 347403.5 6798803.6, 347426 6798777.5, 347440.5 6798788.6, 347456.1 6798800.5, 347479.4 6798823.8, 347491.3 6798831.9, 347506.3 6798834.6, 347517.5 6798832.2, 347536.5 6798817.8, 347615.3 6798741.8, 347708.1 6798653.1, 347778.4 6798590.5, 347815 6798557.7, 347956.1 6798428.2, 348003 6798468.6, 348020.7 6798485.5, 348128.4 6798479.5, 348143 6798554, 348319.5 6798560.8, 348339.9 6798561.6, 348372.7 6798564.8, 348374.3 6798561.8, 348382.2 6798545.5, 348403.4 6798549.4, 348426.7 6798550.9, 348471.1 6798550.3, 348490.2 6798548.9, 348523.9 6798546.5, 348529.1 6798534.3, 348535.6 6798531.9, 348592.7 6798521.6, 348595.1 6798521, 348610.4 6798517.5, 348680.2 6798536.7, 348757.6 6798560.9, 348760.2 6798553.5, 348767.9 6798531.5, 348779.4 6798489, 348784.7 6798471.3, 348790.4 6798457.2, 348798.9 6798435.2, 348804.2 6798416.3, 348826.3 6798352.4, 348829.3 6798343.7, 348849.8 6798276.8, 348912 6798082.8, 348921.7 6798051.9, 348950.4 6797959.9, 348953.7 6797949.1, 348972 6797896.6, 348979.9 6797876.3, 348984.3 6797858.8, 348989.1 6797844.6, 349005.6 6797796.1, 349018.3 6797759.5, 349042.8 6797678.8, 349056.7 6797635.2, 349070.3 6797574.4, 349073.3 6797561.2, 349104.5 6797411.5, 349106.8 6797395.7, 349111.3 6797369.2, 349115.5 6797348.9, 349133.9 6797363.2, 349146.2 6797372.4, 349154.6 6797380.7, 349175.6 6797396, 349219.2 6797422.9, 349229.5 6797429.1, 349248.2 6797439.6, 349268.1 6797451.1, 349270.9 6797452.8, 349291.8 6797464.5, 349325.9 6797485.6, 349360.9 6797503.2, 349367.1 6797506.6, 349379.4 6797513.8, 349390.4 6797520.1, 349402.5 6797525.6, 349445 6797546, 349480.8 6797571.2, 349506.1 6797504.4, 349552.8 6797369.2, 349557.1 6797364.7, 349561.7 6797359.6, 349573.8 6797336.6, 349632.9 6797369.2, 349678.5 6797377.4, 349709.6 6797306.6, 349763.8 6797339.5, 349784.3 6797336.9, 349818.2 6797334.7, 349818.5 6797340.1, 349836.4 6797406.1, 349925.8 6797453.4, 349964.1 6797473.8, 349949.7 6797616.7, 349943 6797635.7, 349936.3 6797650.3, 349928.4 6797663.8, 349946.9 6797669.3, 349945.6 6797680.3, 349935.6 6797704.7, 349931.6 6797723, 349930.4 6797733.7, 350072.5 6797755.6, 350073 6797772.3, 350133.8 6797790.7, 350134.7 6797799.5, 350160.9 6797821.5, 350186.1 6797805, 350194.2 6797792.9, 350195.1 6797786.5, 350196.1 6797780, 350310.9 6797789.7, 350314.1 6797798, 350345.5 6797816.2, 350347.6 6797815.3, 350365.6 6797807.7, 350389.4 6797797.6, 350393.5 6797769.9, 350392.7 6797760.6, 350389.2 6797751.3, 350391.3 6797749.5, 350439.9 6797708.2, 350447.5 6797700.9, 350484.6 6797671.4, 350496.1 6797668.2, 350515.7 6797650.3, 350547.1 6797618.5, 350542.6 6797607.6, 350541.7 6797590.6, 350549 6797557.2, 350558.7 6797524.7, 350576.3 6797490.7, 350587.2 6797475, 350609.9 6797437.4, 350615.8 6797433.6, 350632.5 6797423.2, 350641.2 6797414.9, 350647.9 6797405.3, 350671.6 6797384, 350685.9 6797374.3, 350715.4 6797364.7, 350723 6797308.5, 350728.2 6797279.9, 350729.6 6797263.6, 350731.7 6797240.1, 350789.2 6797234, 350831.2 6797218.6, 350871.1 6797205.6, 350941.2 6797182.7, 350959.6 6797175.4, 350986.9 6797165.1, 351010.8 6797158.1, 351032.9 6797149.6, 351091 6797130.6, 351103.8 6797126.1, 351103.5 6797143.7, 351105.8 6797166.1, 351110.2 6797190.2, 351120.4 6797231.7, 351123 6797242.7, 351125 6797251.8, 351136.5 6797300.2, 351155.4 6797376, 351183.2 6797467.6, 351201.3 6797501.5, 351247.8 6797575.1, 351263.3 6797604.5, 351287.3 6797644.5, 351317.8 6797681.9, 351334.8 6797702.4, 351346 6797715.5, 351352.8 6797725.3, 351359.9 6797740.8, 351364.4 6797757.2, 351365.3 6797765.8, 351398.4 6797764.6, 351477.2 6797736.5, 351479 6797742, 351483.6 6797755.7, 351486.7 6797765, 351519.9 6797758, 351527.8 6797781.8, 351537.8 6797812.1, 351562.5 6797900.7, 351574.1 6797927, 351589.3 6797972.7, 351636.9 6798108.9, 351648.3 6798136.2, 351668.5 6798134.1, 351704.7 6798128.9, 351727 6798124.2, 351738.6 6798119.6, 351784.5 6798099, 351810.5 6798088.9, 351854.7 6798066.7, 351874.6 6798057.9, 351899.3 6798050.4, 351915.1 6798105.6, 351923.7 6798129.8, 351933.2 6798154.6, 351952.1 6798196.2, 351974.1 6798194.8, 352001.6 6798193.1, 352010.9 6798215, 352016.2 6798232.6, 352037.7 6798271.2, 352042.8 6798288.6, 352047.6 6798299.4, 352059.4 6798320.3, 352061.6 6798322.2, 352077.4 6798337, 352109.8 6798378.8, 352128 6798404.8, 352156.2 6798449.2, 352186.7 6798501.6, 352210.1 6798540.2, 352231.2 6798571, 352256.9 6798610.3, 352270.2 6798640.6, 352289.1 6798675.9, 352300.5 6798708.6, 352299.1 6798725, 352298.8 6798733, 352313.1 6798748.5, 352392.8 6798785.1, 352403 6798789.2, 352509.6 6798834.4, 352603.2 6798878.3, 352621.7 6798886.9, 352637.8 6798888.5, 352758.8 6798951.9, 352752.7 6798966.3, 352749.1 6799007.5, 352751.2 6799018.1, 352757.3 6799050.4, 352780.4 6799133.4, 352783.1 6799143.9, 352792.2 6799199.4, 352812.2 6799196.1, 352817.4 6799198.8, 352839.4 6799196.3, 352865.8 6799196.7, 352875.6 6799192.9, 352892.6 6799195.6, 352917.7 6799253.8, 352941.3 6799251, 352973.3 6799251.4, 352985.8 6799250.5, 352990.4 6799242.7, 352999.5 6799240.1, 353006.6 6799242.5, 353017 6799240.8, 353026.2 6799232.9, 353040.5 6799234.4, 353050.7 6799238, 353060.5 6799242.9, 353068.3 6799239.7, 353082.4 6799230.7, 353089.7 6799225.6, 353089.4 6799214.7, 353096.5 6799202.2, 353109.5 6799193.9, 353143.2 6799185, 353173.7 6799180.2, 353191.1 6799180.2, 353201.4 6799178.6, 353223.4 6799175, 353238.7 6799175.5, 353256.5 6799182.2, 353274.3 6799182.5, 353296 6799187.8, 353329.3 6799189, 353335 6799178.9, 353341.8 6799172.5, 353352.4 6799178.6, 353360.7 6799169.9, 353370.3 6799162.7, 353381.5 6799161.7, 353394 6799161.6, 353421.5 6799151.4, 353461.3 6799142.4, 353468.3 6799140.8, 353483.1 6799143.2, 353501.8 6799133.4, 353515.8 6799133.5, 353533.2 6799129.7, 353547.9 6799122.7, 353565.9 6799120, 353581.3 6799121.7, 353587.2 6799120, 353590.7 6799119, 353611.3 6799106.4, 353653.7 6799084.4, 353723.3 6799051.7, 353774.1 6799024.1, 353812.6 6799007.3, 353817.5 6799020.4, 353824.3 6799038.5, 353827.7 6799048.1, 353763.7 6799075.6, 353736.9 6799097.8, 353752.2 6799160.1, 353760.5 6799221.4, 353751.3 6799225.6, 353762 6799263.3, 353774.9 6799291.5, 353849 6799365.5, 353867.7 6799413.6, 353882.2 6799430, 353895.8 6799443.1, 353913.2 6799468.3, 353924.2 6799493.3, 353954.9 6799491.7, 354038.2 6799491.5, 354066.4 6799490.3, 354103.3 6799486.7, 354134.6 6799481.5, 354138.9 6799512.4, 354140.8 6799517.9, 354150.7 6799548.2, 354161 6799567.1, 354174.6 6799620.2, 354182.6 6799641.2, 354187.4 6799647.2, 354198.3 6799690.8, 354239 6799828, 354234.3 6799828.3, 354243.2 6799832.3, 354245.2 6799852.6, 354239.1 6799880.5, 354223.4 6799897, 354218 6799913.7, 354221.7 6799954.2, 354227.1 6799993.1, 354241.4 6800063.1, 354249.1 6800134.4, 354250.9 6800168.6, 354251.7 6800186.4, 354252 6800195.2, 354257.5 6800228, 354271.5 6800259.5, 354283.5 6800287.8, 354291.8 6800312.9, 354297.8 6800325.8, 354307 6800323.3, 354317 6800348.7, 354339.5 6800392.9, 354362.6 6800425.8, 354384.9 6800470.4, 354402.2 6800518, 354444.7 6800605.4, 354462.5 6800652, 354475.2 6800695.3, 354478.3 6800727, 354487.5 6800727.5, 354490.6 6800742.2, 354496.1 6800782.4, 354503.5 6800882.4, 354511.9 6800924.3, 354513.1 6800960.4, 354512.6 6800981.1, 354517.8 6801006.2, 354541.2 6801046.9, 354566.3 6801083.6, 354653.5 6801202.2, 354715.7 6801280.3, 354741.4 6801319.4, 354756.6 6801354.3, 354762.6 6801368, 354778.1 6801417.2, 354780.9 6801429.5, 354789.8 6801469.4, 354792.4 6801487, 354796.9 6801516.1, 354806.1 6801551.4, 354808 6801556.4, 354813.2 6801569.5, 354814 6801575.2, 354824.8 6801602.5, 354829.6 6801613.1, 354841.8 6801641.2, 354928.6 6801817.2, 354940.2 6801839.9, 355013 6801967.8, 355036.5 6802008.6, 355080 6802068.9, 355179.6 6802344.7, 355182.9 6802356.1, 355185.6 6802361.9, 355195.3 6802381.6, 355200.8 6802397.6, 355212.1 6802423, 355274.1 6802594.9, 355277.3 6802603.6, 355287.6 6802640.4, 355291.2 6802648.3, 355299.5 6802666.3, 355275.5 6802714.4, 355294.8 6802724.9, 355302.5 6802729.9, 355305.2 6802731.6, 355317.5 6802744.1, 355318.4 6802746, 355342.2 6802795.4, 355309 6802820.7, 355283.1 6802845, 355266.1 6802865.1, 355255.6 6802888, 355253.7 6802902.1, 355252.8 6802909.5, 355252.6 6802923.4, 355252.5 6802927.8, 355245.6 6802948.9, 355200.1 6803012.4, 355181.5 6803027.5, 355165.1 6803048.6, 355160.2 6803105.8, 355170.7 6803147.1, 355190.1 6803160.5, 355191.2 6803201.3, 355197.3 6803224.7, 355199.2 6803249.5, 355238.6 6803277.4, 355241.7 6803304.2, 355255.6 6803317.5, 355277.6 6803311.7, 355290.6 6803314.1, 355297 6803323, 355291.4 6803342.7, 355293.3 6803367.4, 355292.2 6803392.4, 355301.1 6803429.5, 355296.4 6803444.9, 355300 6803451.4, 355307.5 6803465, 355307.9 6803466.5, 355366.9 6803458.8, 355383.6 6803456.6, 355385.6 6803475.4, 355388.7 6803498.1, 355400.6 6803572.6, 355406.9 6803606.8, 355410.2 6803632.4, 355414.9 6803655.8, 355416.1 6803660.6, 355418.6 6803664.4, 355423.1 6803667.3, 355448.4 6803744.2, 355492.9 6803869, 355483.9 6803871.7, 355457.1 6803879.6, 355403.5 6803896.7, 355354.1 6803943.8, 355369.6 6804003.7, 355440.4 6804114, 355470.6 6804133.8, 355530.7 6804153.3, 355571.1 6804212.9, 355600.7 6804288.1, 355622.2 6804342.4, 355623.7 6804350.7, 355642 6804447.2, 355642.8 6804547.1, 355628 6804608, 355623.5 6804627.2, 355619.3 6804722.2, 355490.9 6804785.1, 355487.9 6804801.2, 355485.2 6804820.3, 355484.1 6804831.1, 355483.8 6804839, 355485.1 6804850.5, 355487.9 6804863.9, 355493.4 6804885.8, 355503.7 6804924.6, 355510.7 6804949.1, 355517.4 6804966.2, 355523 6804980.3, 355528.5 6804986.8, 355533.5 6804993.5, 355536.4 6804997.6, 355539.5 6805002.9, 355542.9 6805009, 355561 6804995.1, 355566.8 6804992.8, 355574.1 6804990.3, 355581.7 6804988, 355589.8 6804986.2, 355599.2 6804984.6, 355608.3 6804983.4, 355617.6 6804982.6, 355629.5 6804981.1, 355637.6 6804980, 355646.7 6804978.3, 355660 6804975.9, 355668.7 6804974.7, 355676.1 6804974.1, 355684.5 6804974.1, 355688.7 6804974.5, 355691.3 6804976.8, 355691.8 6804980.5, 355693.1 6804985, 355697 6804987.8, 355703.8 6804988.3, 355715.1 6804987.7, 355723.5 6804987.5, 355732.6 6804987.1, 355742.1 6804986.5, 355749.6 6804986.2, 355756.5 6804986.8, 355763.5 6804987.7, 355767.8 6804989.1, 355794.1 6805008.9, 355815.5 6805016.4, 355870.5 6805010.9, 355918.2 6804996.1, 355920.3 6804995.5, 356000.4 6804986.1, 356027.3 6804982.9, 356103.4 6804973.9, 356104.5 6804973.8, 356128.5 6804971, 356136.1 6804968.2, 356142.2 6804964.8, 356149.5 6804960.4, 356156.6 6804958.1, 356166.9 6804953.9, 356174.2 6804950.6, 356180.7 6804947.4, 356188.5 6804943.6, 356195.1 6804940.2, 356202 6804937.3, 356208.7 6804934.9, 356214.5 6804933.6, 356219.7 6804933.3, 356226.8 6804932.7, 356231.9 6804931, 356237.4 6804927.8, 356271.9 6804918.6, 356309.3 6804908.4, 356376.2 6804874.6, 356398.5 6804863.3, 356409.9 6804857.6, 356408.7 6804853.6, 356389.3 6804787.8, 356359 6804753.1, 356337.7 6804707.9, 356328.5 6804688.4, 356329.2 6804663.4, 356329.9 6804638.4, 356325.3 6804595.7, 356324.9 6804593.1, 356324 6804581.7, 356327 6804564.1, 356328 6804557.9, 356329.9 6804552.7, 356332.2 6804547.7, 356333.3 6804542.2, 356336.4 6804536.6, 356337.5 6804532.1, 356339 6804525.8, 356340.9 6804520.6, 356343.8 6804515.5, 356346.8 6804510.4, 356348.5 6804504.1, 356348.8 6804497.6, 356348.6 6804495.2, 356349 6804473.6, 356341.2 6804408.5, 356349.4 6804384.9, 356353.3 6804382.3, 356365.9 6804374, 356428.1 6804333.2, 356437.6 6804331.2, 356456.5 6804327.6, 356461.4 6804317.6, 356470.3 6804304.5, 356511.7 6804242.1, 356525.6 6804221.3, 356560.6 6804167, 356561.8 6804137.1, 356559.7 6804121.9, 356549.5 6804092, 356549 6804032, 356553.8 6804012, 356592.2 6803922.1, 356619.6 6803927.9, 356648.7 6803938.2, 356653.9 6803937.8, 356659 6803936.1, 356668.2 6803934, 356674.7 6803932.5, 356685.8 6803930.1, 356695.5 6803928, 356707.5 6803925.8, 356717.7 6803923.4, 356724.4 6803920.8, 356732.1 6803917.4, 356737.5 6803914.6, 356743.7 6803911.8, 356765.8 6803898, 356786.7 6803885.3, 356816.8 6803868.2, 356844.4 6803848.3, 356856.5 6803841, 356864.4 6803836.4, 356876.9 6803827.4, 356949.3 6803801.7, 356946.7 6803787.9, 356946.4 6803787, 356942.3 6803762.8, 356942.1 6803759.6, 356942.4 6803756.5, 356943.2 6803753.7, 356944.3 6803751.2, 356947.3 6803746.7, 356954 6803737.1, 356965.7 6803720.6, 356972.2 6803711.8, 356978.9 6803703.2, 356986.9 6803693.9, 356991.9 6803688.4, 357000 6803680, 357007.8 6803672, 357018.1 6803661.6, 357035.7 6803644.1, 357043.6 6803636.4, 357048.3 6803632.4, 357055.4 6803627, 357061.1 6803622.9, 357067.8 6803618.4, 357072.9 6803614.7, 357074 6803613.8, 357074.6 6803612.6, 357074.9 6803610.1, 357074.8 6803607.2, 357074.3 6803604.2, 357072.1 6803597.1, 357069.9 6803590.3, 357068.5 6803583.2, 357068.5 6803580.2, 357069.8 6803571.9, 357078.4 6803571, 357090.7 6803567.4, 357101.7 6803565.1, 357117.6 6803561.5, 357120.9 6803560.1, 357125.5 6803557.4, 357151.2 6803541.1, 357164.6 6803532.6, 357186.2 6803520.9, 357195.4 6803516.1, 357190.2 6803505.6, 357185 6803495.1, 357178.7 6803482.7, 357173 6803471.4, 357167.7 6803460, 357164 6803451.2, 357161.4 6803444, 357157.1 6803431.2, 357154 6803421.9, 357147.6 6803401.9, 357140.2 6803378.3, 357137.2 6803368.9, 357133.7 6803356.4, 357130.2 6803343.4, 357126.4 6803322.4, 357116.1 6803286.7, 357114.2 6803271.1, 357112.1 6803248.2, 357110.4 6803132.8, 357104.6 6803094.5, 357095.2 6803065.6, 357089.6 6803052.9, 357072.4 6803017, 357070.3 6803013, 357062 6802997.4, 357051.5 6802967.7, 357043.1 6802928.6, 357037.4 6802887.2, 357016.3 6802723.1, 357016.1 6802721.3, 356999.4 6802585.6, 356987.6 6802484, 356979.4 6802418.8, 356963.4 6802303.6, 356955.7 6802247.8, 356944.9 6802154.4, 356941.6 6802119.5, 356929.3 6802013.7, 356928.4 6802007.2, 356912.1 6801897.2, 356909.6 6801879.6, 356903.9 6801840.1, 356896.6 6801768, 356889.1 6801694.3, 356882.1 6801635, 356875.7 6801579.5, 356874.6 6801570.8, 356862.5 6801468.5, 356860.9 6801455, 356851.9 6801378.6, 356836.8 6801252, 356822.2 6801131.2, 356806.8 6801031.5, 356795 6800921.8, 356794.3 6800913.3, 356772.2 6800743.6, 356762.1 6800652.8, 356755.2 6800598.1, 356739.7 6800470.1, 356730.2 6800388.4, 356717.7 6800299, 356711.3 6800262.1, 356703.4 6800200.7, 356689.9 6800142.7, 356682 6800114.7, 356666.2 6800058, 356656.8 6800006.9, 356648.5 6799972.1, 356646.6 6799964.9, 356643.1 6799950.2, 356634.5 6799910.9, 356618.7 6799850.6, 356616.7 6799841.9, 356591.8 6799772.5, 356581.6 6799745.3, 356573.8 6799717.7, 356568.6 6799693.5, 356556.7 6799639.8, 356546.2 6799615.2, 356533.7 6799591.1, 356528.4 6799583.8, 356577.6 6799549.9, 356612.4 6799527.9, 356638.3 6799509.1, 356685.9 6799475, 356711.9 6799442.2, 356732.1 6799411.8, 356741.7 6799391.1, 356755.6 6799369.1, 356758.5 6799360, 356763.2 6799364.3, 356779.2 6799368.4, 356797.6 6799376.5, 356810.4 6799372, 356819.1 6799356.3, 356826.5 6799339.5, 356838.7 6799299.7, 356851.7 6799285.8, 356859.7 6799281.3, 356870 6799275.5, 356910.2 6799258.7, 356930.1 6799247.2, 356941.9 6799234.9, 356943 6799222.3, 356948.3 6799214.3, 356960.1 6799216, 356969.3 6799217.3, 356979.9 6799218.6, 356995.9 6799215.2, 357035.3 6799188.8, 357040.4 6799188.6, 357046.1 6799188.5, 357061.4 6799193.6, 357073.9 6799190.4, 357085.3 6799184.5, 357100.7 6799184.1, 357105.3 6799183.9, 357118.8 6799188.3, 357133.7 6799193.8, 357161.3 6799196.8, 357182.6 6799203.4, 357188.7 6799205.4, 357207.9 6799216.6, 357217.2 6799223.3, 357241.5 6799243.3, 357244.8 6799246, 357266.6 6799257.3, 357273.1 6799258.8, 357290.8 6799262.9, 357313.6 6799266.3, 357334.2 6799274.7, 357348.7 6799284.8, 357351.9 6799287, 357367.7 6799290.5, 357412.4 6799294.6, 357427.4 6799306.7, 357438.7 6799349.8, 357449.3 6799366, 357466.6 6799375, 357513.1 6799390.5, 357518.6 6799394.3, 357548.7 6799357.6, 357554.1 6799346.7, 357590.9 6799273.4, 357616.8 6799215, 357634 6799170.4, 357639.1 6799151.6, 357656.5 6799107.8, 357669.7 6799112.9, 357720 6799139, 357770 6799085.7, 357787 6799059.8, 357793.8 6799053.9, 357802.3 6799058.2, 357819 6799042.8, 357838.3 6799036.1, 357865.4 6799028.8, 357894.5 6799023.5, 357894.1 6799010.6, 357885.4 6798984, 357958.2 6798931, 357992.4 6798911.7, 358034.9 6798888.1, 358107.4 6798859.6, 358101.6 6798847, 358091.6 6798817.8, 358097.9 6798819.4, 358115.3 6798811.5, 358143.2 6798792, 358160.6 6798777.4, 358180.9 6798760.3, 358193.1 6798755.1, 358234.8 6798737.5, 358292.9 6798720.1, 358326 6798715.2, 358321.2 6798749.4, 358356.1 6798745, 358357.1 6798748.7, 358425.1 6798736.8, 358420.5 6798709.5, 358417.2 6798690.2, 358539.1 6798661.2, 358547.1 6798674.8, 358569.5 6798710.8, 358597 6798754.5, 358602.9 6798764.2, 358633.4 6798815.7, 358678.9 6798894.2, 358690 6798910.4, 358718.9 6798961.8, 358720.1 6798964.1, 358746.4 6799017.8, 358805.9 6799127.8, 358811.3 6799139.5, 358818 6799153.8, 358823.3 6799169.2, 358845.5 6799206.6, 358859.8 6799232.1, 358870.7 6799248.7, 358893.4 6799299.5, 358903.3 6799313.7, 358907.6 6799319.4, 358912.6 6799327.7, 358920.9 6799353, 358925 6799361.1, 358926.6 6799369.9, 358959.2 6799440.3, 359001 6799539.1, 359017 6799586.1, 359018.9 6799592, 359023.9 6799608.4, 359030.3 6799628.1, 359038.5 6799650, 359037.2 6799653.7, 359048.5 6799685.5, 359050.2 6799690.3, 359069.4 6799744.4, 359104.8 6799837.4, 359112.8 6799862.5, 359115.3 6799870.4, 359121.6 6799893, 359134 6799929.5, 359142 6799955.9, 359150.8 6799981.6, 359164.6 6800010.3, 359162.3 6800041.9, 359162.3 6800087.4, 359162.2 6800117.8, 359165.4 6800191.1, 359166.2 6800198, 359172.5 6800256.7, 359181.9 6800347.7, 359226.9 6800345.3, 359287.7 6800337.1, 359321.6 6800336.7, 359354.8 6800334.7, 359377 6800335.9, 359405.6 6800339.3, 359425.6 6800342.3, 359452 6800343.5, 359463 6800338.2, 359527.7 6800397.4, 359540.2 6800405.7, 359556.9 6800414.6, 359554.8 6800432.3, 359559.1 6800479.2, 359564.1 6800479.8, 359563.3 6800498.9, 359571.2 6800498.7, 359574 6800526, 359571.6 6800636, 359572.2 6800693.6, 359588.4 6800684.7, 359609.9 6800678.5, 359626.8 6800671.2, 359654.6 6800662.5, 359664.5 6800656.2, 359698.3 6800641.3, 359724.2 6800635, 359775.7 6800623.9, 359814.4 6800617.9, 359827.9 6800613.3, 359849.2 6800602.2, 359852.7 6800617.8, 359854 6800634.3, 359870.5 6800714.6, 359875 6800736.1, 359878.3 6800751.9, 359880 6800760.3, 359882.6 6800771.3, 359884.4 6800777.4, 359886.9 6800785.8, 359890.3 6800796.7, 359894.4 6800810.3, 359922 6800900.5, 359927.3 6800906.8, 359945.9 6801012.3, 359958.9 6801108, 360008 6801164.4, 360021.9 6801180.2, 360077.5 6801252.6, 360083.7 6801266.7, 360091.5 6801274.4, 360096.8 6801279.7, 360108.3 6801287.2, 360115.7 6801288.8, 360115.3 6801306.3, 360118.3 6801309.4, 360179.5 6801371.9, 360180.6 6801372.7, 360206.9 6801392.9, 360215.9 6801414, 360240.2 6801428.9, 360250.9 6801437.2, 360255.5 6801447.4, 360258 6801457.8, 360258.6 6801460.7, 360267.3 6801470.3, 360287.9 6801477, 360295.6 6801483.3, 360299 6801491.1, 360298.3 6801497.9, 360291.3 6801518.9, 360300.5 6801547.2, 360298.8 6801558.4, 360293.7 6801569.3, 360291.1 6801581.3, 360292.8 6801594.5, 360297.3 6801610.2, 360295.2 6801622, 360288.2 6801634.1, 360285.1 6801636.1, 360282.5 6801639.8, 360282.6 6801658.9, 360278.5 6801685.9, 360272.7 6801708.9, 360252.5 6801768.6, 360249.2 6801794, 360252.8 6801868.5, 360257 6801889.5, 360288.5 6801972.6, 360340.3 6802119.2, 360330.9 6802124.4, 360370.3 6802183.6, 360395.6 6802169.9, 360476.4 6802135, 360575.9 6802083.4, 360612.4 6802065.8, 360641.2 6802055.7, 360684.9 6802048.5, 360694.7 6802046.2, 360715.4 6802041.2, 360750.3 6802030.2, 360796.1 6802021.9, 360839.8 6802011.3, 360854 6802007.2, 360863 6802002.9, 360910.2 6801979, 360944.7 6801962.4, 360953.9 6801958.2, 361025.3 6801921.9, 361038.9 6801914.9, 361088 6801886.9, 361131.9 6801859.6, 361193.3 6801817.6, 361251.3 6801778.4, 361330.4 6801733.6, 361343.2 6801726.5, 361364.2 6801711.1, 361370.4 6801706.7, 361385.8 6801695.7, 361427.7 6801659.9, 361457.5 6801635.9, 361504.1 6801599.9, 361556.9 6801559.2, 361611.3 6801514.3, 361640.7 6801484.9, 361652.4 6801469.3, 361661.4 6801459.7, 361681.8 6801440.8, 361696.6 6801431.7, 361720.5 6801419, 361739.6 6801405.4, 361821 6801353.4, 361935.8 6801274.9, 361938.2 6801271.3, 361909.1 6801205.5, 361888 6801171.4, 361834.1 6801081.3, 361815.8 6801054.1, 361800.1 6801032.5, 361783.6 6801017.1, 361781.1 6800998.5, 361800.8 6800990.5, 361805 6800925.5, 361813.5 6800848, 361814.6 6800832.1, 361812.6 6800775.8, 361831.9 6800730.2, 361841.4 6800687.1, 361843.4 6800661.5, 361838.4 6800633.8, 361825.5 6800593.3, 361805.6 6800543.4, 361788.8 6800521.1, 361783.1 6800508.2, 361770.6 6800489.4, 361748.3 6800435.6, 361718.5 6800366.2, 361688.2 6800307.4, 361666.7 6800274.2, 361671.5 6800256, 361693 6800227.3, 361716.7 6800203.3, 361740 6800186.7, 361766.6 6800170.7, 361823.7 6800144.2, 361689 6799958, 361666.1 6799928.1, 361655.3 6799914, 361645.8 6799910.3, 361610.2 6799918.5, 361591 6799926.3, 361526.4 6799957.9, 361509.2 6799960.5, 361431.7 6799903.9, 361367.3 6799864, 361340.3 6799844.7, 361306.5 6799825.1, 361269.6 6799808.1, 361258.1 6799802.7, 361272.8 6799752.9, 361296.9 6799702.6, 361311.8 6799680.7, 361329.8 6799660.9, 361344.2 6799651.4, 361430.1 6799644.7, 361429.9 6799633.3, 361417.7 6799614.3, 361397.2 6799590.1, 361380.1 6799574.6, 361314.1 6799548, 361304.8 6799544.3, 361278.2 6799536.9, 361271.6 6799537.4, 361240.2 6799540.1, 361208.9 6799548.6, 361187.5 6799558.9, 361171.8 6799575, 361156.5 6799596.7, 361122.7 6799634.9, 361112.5 6799651, 361115.6 6799699.5, 361124.1 6799749, 361138.9 6799807.7, 361145.9 6799842.3, 361145.5 6799871.4, 361143.8 6799890.4, 361138.2 6799917.7, 361115.5 6799979.3, 361109.8 6799989.9, 361088.7 6800007.9, 361072 6800019.7, 361048.7 6800030.9, 361032.8 6800041.7, 360989.7 6800063.4, 360970.4 6800071.6, 360969.6 6800072, 360949.7 6800012.7, 360940.2 6799975.1, 360934.5 6799957.4, 360926.8 6799942.1, 360905.7 6799909.6, 360894.8 6799903.9, 360883.3 6799907.6, 360873.4 6799917.6, 360862.5 6799946.7, 360838.2 6799960.4, 360810.9 6799981.1, 360795.4 6799995.8, 360774 6800022.6, 360765.1 6800038.2, 360759.2 6800051.6, 360726.8 6800081.6, 360720.2 6800085.9, 360701.2 6800086.5, 360697.5 6800084.4, 360694.8 6800082.8, 360702.9 6800054.1, 360712.6 6800024.5, 360719.6 6800007.9, 360722.7 6799995.5, 360730.3 6799936.1, 360726.9 6799797.8, 360723.8 6799785.6, 360722.4 6799754.3, 360726.5 6799724.7, 360724.3 6799709.5, 360725.2 6799694.3, 360733 6799682.6, 360757.8 6799653.5, 360741.9 6799603, 360736.3 6799551.2, 360738.2 6799514.2, 360738.6 6799466.1, 360763.2 6799456.9, 360821.4 6799437.9, 360864.5 6799421.1, 360841.1 6799270.9, 360834.8 6799236.7, 360830.6 6799222.4, 360785.5 6799222.6, 360727 6799214.3, 360714 6799212.5, 360684.8 6799199.2, 360672.6 6799189, 360667.6 6799183, 360630.3 6799124.5, 360609.8 6799084.7, 360598.2 6799065.2, 360569.1 6798996.6, 360564.4 6798982.4, 360559.3 6798952.7, 360552.6 6798874.2, 360547.6 6798873, 360534 6798869.5, 360508.3 6798854.5, 360482.9 6798836.1, 360463.2 6798817.3, 360480.5 6798770.5, 360461.9 6798751.1, 360430 6798725.1, 360412.6 6798707.7, 360359.2 6798656.1, 360297.6 6798599, 360257.3 6798560.2, 360234.1 6798534.6, 360192.5 6798483.4, 360172.1 6798454.5, 360076.7 6798341.8, 360019.8 6798292.6, 359978.6 6798252.9, 359945.3 6798218.7, 359943.1 6798215.3, 359871.1 6798221.2, 359804.9 6798229, 359794.6 6798225.2, 359790.2 6798219.1, 359788 6798218.7, 359760.8 6798222, 359704.2 6798215.9, 359629.4 6798212.2, 359611.2 6798212.3, 359596.5 6798214.5, 359551 6798222.7, 359492.1 6798240.3, 359486.5 6798241.2, 359453.7 6798248.4, 359415.4 6798259.7, 359376.3 6798266.3, 359336.1 6798275.7, 359327.5 6798277.8, 359298 6798285.5, 359267.9 6798291.6, 359215.6 6798302.1, 359022 6798350.2, 358916 6798376.3, 358861.6 6798391.9, 358806.2 6798403.4, 358761.1 6798413.5, 358747.9 6798417.5, 358702.9 6798431.1, 358657.6 6798441.3, 358613.5 6798450.7, 358533.4 6798468.4, 358467.6 6798482.5, 358435.2 6798489.1, 358354.5 6798366.8, 358221.9 6798152.7, 358208.6 6798131.2, 358195.6 6798109.2, 358143.9 6798023.5, 358112.7 6797976.7, 358016.4 6797815.4, 357947.4 6797708.1, 357933.6 6797684.8, 357929 6797676.8, 357922.5 6797665.7, 357916.9 6797656.2, 357882.7 6797615.2, 357795.3 6797503.3, 357684.2 6797365.4, 357618.9 6797280.7, 357601.5 6797257.4, 357551.2 6797200, 357547.4 6797195.5, 357481.6 6797140, 357464 6797123.9, 357420.1 6797087.2, 357358.9 6797035, 357390.7 6797001.4, 357416.3 6796973.4, 357421.7 6796966.3, 357347.8 6796836.8, 357343.7 6796828.2, 357315.8 6796782.6, 357313.4 6796775.3, 357330.4 6796766.8, 357219 6796574, 357227.7 6796573.8, 357265.3 6796572.2, 357332.9 6796567.6, 357459 6796569.1, 357495.9 6796570.5, 357521.9 6796573, 357560.5 6796587.1, 357580.8 6796592.4, 357601.5 6796592.8, 357621.3 6796586.9, 357634 6796574, 357650.4 6796549.9, 357665.7 6796523.7, 357700.8 6796453.5, 357718.7 6796421.8, 357739.6 6796384.7, 357776.5 6796314, 357830.8 6796332, 357902.5 6796365, 357942.2 6796380, 358015.3 6796410, 358029.1 6796414.5, 358054.4 6796423.8, 358066.9 6796430, 358121 6796449.9, 358217 6796488.1, 358224.8 6796490.6, 358264.4 6796496.9, 358456.5 6796495, 358526.1 6796495.8, 358613.2 6796495.2, 358634.7 6796495.1, 358664.5 6796498, 358658.2 6796480.7, 358622.8 6796401, 358620.3 6796397.8, 358604 6796357.8, 358596.1 6796334.5, 358557.2 6796211.5, 358547.7 6796187.8, 358530.7 6796135.1, 358520.9 6796112.6, 358513.1 6796088.9, 358508.3 6796069.2, 358504 6796042.8, 358502.1 6796018.6, 358501.7 6795992, 358503 6795936.3, 358506.5 6795882.1, 358510.1 6795723.7, 358510.9 6795694.6, 358512 6795660.4, 358518.6 6795411.1, 358516.8 6795354.1, 358514.2 6795350.1, 358536.4 6795313.5, 358656.7 6795074.9, 358681.8 6795034.6, 358714.8 6794987.6, 358749.6 6794943.8, 358756.9 6794932.9, 358809 6794976.1, 358828.1 6794991.7, 358839.3 6795002.5, 358849.2 6795012.1, 358877.9 6795036.2, 358957 6795108.3, 358987.2 6795132, 359093.6 6795224.3, 359101.4 6795231, 359118.5 6795223.4, 359124.3 6795222.4, 359136.7 6795211.7, 359140.7 6795204.7, 359141.1 6795196.4, 359160.4 6795190.4, 359163.1 6795189.6, 359224.5 6795203.8, 359243.3 6795209.9, 359259.3 6795217, 359280.8 6795224.4, 359299.8 6795233.3, 359338.9 6795247.5, 359359.1 6795248.1, 359382.6 6795253, 359423.8 6795263.8, 359463.3 6795271.3, 359513.2 6795286.8, 359526.4 6795282.3, 359531 6795264.3, 359545.6 6795161.1, 359556.7 6795103.1, 359572.6 6795067, 359576.3 6795051.6, 359576.7 6795049.8, 359629.4 6795093.6, 359670.2 6795134.4, 359667.5 6795152.2, 359755.1 6795283.4, 359756.5 6795285.5, 359795.6 6795275.9, 359814.9 6795272.8, 359943.7 6795257, 359979.3 6795258.9, 360055.5 6795225, 360078.2 6795213.2, 360085.7 6795209, 360106.1 6795190.9, 360143.9 6795226, 360146.6 6795228.6, 360168.1 6795248.3, 360226.1 6795301.8, 360297.9 6795370, 360349.6 6795421.2, 360359.9 6795428.8, 360384.2 6795451.8, 360482.6 6795545.6, 360487.3 6795535.3, 360496.2 6795516.2, 360507.2 6795496.7, 360513.8 6795481.2, 360521.7 6795470.7, 360532.3 6795457.1, 360548.3 6795447.7, 360608.7 6795421.9, 360626.5 6795416.5, 360644.8 6795413.4, 360668.4 6795410.3, 360688.6 6795410.5, 360726.8 6795412.6, 360890.1 6795414, 360985.3 6795416.8, 361243.3 6795420.3, 361300 6795419.9, 361358 6795422.4, 361558.8 6795418.1, 361690.8 6795411.5, 361695.2 6795410.7, 361702 6795406.5, 361706.1 6795400.6, 361694.2 6795390.9, 361669.5 6795370.7, 361636.6 6795344.1, 361599.8 6795314.5, 361571.4 6795291.7, 361544.4 6795269.5, 361482.6 6795219.8, 361458.4 6795200.2, 361429.3 6795176.8, 361404.3 6795157, 361374.9 6795132.9, 361351.2 6795113.8, 361325.6 6795093.3, 361298.3 6795071.4, 361274.1 6795051.5, 361249 6795030.8, 361217.2 6795005.8, 361192.1 6794985.8, 361171.3 6794968.8, 361159 6794958.3, 361150.6 6794950.5, 361170.4 6794955.2, 361177.5 6794955, 361225.7 6794959.9, 361252.3 6794956.2, 361273 6794951.2, 361302.2 6794947.2, 361324.7 6794941.9, 361343.8 6794935.5, 361396 6794923.3, 361450.1 6794904.3, 361490 6794886, 361537.1 6794855.8, 361553.3 6794843.4, 361569.8 6794834.1, 361604.5 6794802.9, 361631.5 6794775.6, 361656.9 6794749.8, 361675.7 6794733.1, 361679.4 6794730.2, 361680.9 6794731.4, 361698.3 6794723.7, 361788.7 6794662.9, 361797 6794655.8, 361819.3 6794631.5, 361836.1 6794603.7, 361851.2 6794586.5, 361860.9 6794576.1, 361863.5 6794569.3, 361867.1 6794560.1, 361898.4 6794513, 361915.1 6794492.2, 361927.4 6794479.6, 361934.1 6794471.1, 361941.8 6794457.7, 361947.4 6794460.3, 361908.4 6794563.8, 361919.3 6794563.6, 362094.9 6794544.1, 362101.9 6794544.6, 362126.7 6794553.2, 362139.7 6794558.7, 362144.3 6794563, 362150.1 6794567.2, 362156.8 6794571.7, 362172.7 6794580.7, 362201.7 6794596.7, 362233.9 6794615, 362265 6794632.3, 362295.6 6794649, 362306 6794655.5, 362371.8 6794694, 362454 6794736.6, 362500.1 6794763.3, 362559.3 6794794.6, 362574 6794803.2, 362618.3 6794834.4, 362636.9 6794852, 362698.1 6794896.7, 362706.6 6794905, 362716.7 6794914.7, 362734 6794932.2, 362749.4 6794945.5, 362799.8 6794988.4, 362847.1 6795025.9, 362864.1 6795043.1, 362883.2 6795058.2, 362899.5 6795073.1, 362920.7 6795089.3, 362938.9 6795106.1, 362957.3 6795119.1, 362977.5 6795128.6, 363062.1 6795138.9, 363100.8 6795145.8, 363178 6795164.6, 363202.2 6795171.2, 363240 6795189.5, 363265 6795199.4, 363296.6 6795207.1, 363323.4 6795213.8, 363333.1 6795216.3, 363396.8 6795234.4, 363409.1 6795237.9, 363466 6795253.8, 363473.4 6795255.7, 363512.4 6795271.1, 363524.5 6795275.6, 363546.3 6795286.7, 363595.1 6795314, 363617.7 6795321.8, 363674.5 6795335, 363740 6795349.4, 363873.5 6795379.2, 363930.2 6795389.1, 363934.1 6795389.7, 363940 6795370.9, 363983 6795339.8, 363999.3 6795330.2, 364031.4 6795305.9, 364069.2 6795282, 364123.5 6795247.2, 364135 6795234.1, 364145.5 6795219, 364150.2 6795210.9, 364165.9 6795184, 364174.5 6795171.1, 364179.1 6795166.4, 364182.4 6795166.2, 364186 6795166.1, 364192.4 6795171.6, 364208.1 6795180.2, 364216.3 6795182.6, 364228.2 6795183.6, 364288.1 6795179, 364346.6 6795176.7, 364361 6795176.3, 364371.5 6795176.2, 364372 6795168, 364399.9 6795163.6, 364484.1 6795157.6, 364511.7 6795153.4, 364538.9 6795152.3, 364572.3 6795154.2, 364587.5 6795157.8, 364606.5 6795166.6, 364609.7 6795161.9, 364622 6795153.6, 364625.6 6795152.6, 364639 6795148.9, 364654.2 6795147.6, 364700.5 6795149.4, 364709.4 6795149.9, 364722.9 6795146, 364735.6 6795139.3, 364744 6795132.6, 364758.5 6795119.4, 364782 6795103.9, 364854.2 6795064.1, 364924.1 6795030, 364966.6 6795002.3, 365016.5 6794975.4, 365076.4 6794946.4, 365090.5 6794941.3, 365203.5 6794864.5, 365208.5 6794871.5, 365218.8 6794877.2, 365228 6794886.5, 365235 6794897.8, 365244.7 6794904.8, 365258.7 6794905.1, 365273.5 6794907.6, 365288.3 6794915, 365297.8 6794923.3, 365314.5 6794949.9, 365324.6 6794957.2, 365366.5 6794975.8, 365374.5 6794987.1, 365378.2 6795002.6, 365379.5 6795017.6, 365382.6 6795029.9, 365391.4 6795040.4, 365425.2 6795068.3, 365433.4 6795076.8, 365437.4 6795085.9, 365443.9 6795113.9, 365447 6795120.9, 365449.2 6795125.4, 365453.4 6795128.9, 365458.7 6795133.1, 365479.1 6795135, 365515.6 6795134.5, 365522.5 6795137.6, 365560 6795156, 365568.5 6795160.8, 365570.4 6795163.7, 365574.5 6795169.7, 365571.5 6795180.7, 365570.8 6795192.7, 365575.9 6795204.2, 365586.2 6795212.7, 365598.4 6795215.2, 365609.2 6795210.8, 365621.6 6795214.9, 365630.8 6795223.9, 365635.3 6795237.4, 365635.8 6795253.2, 365640.9 6795268.8, 365658.8 6795295.8, 365665.1 6795308, 365677.2 6795318.1, 365711.3 6795325.6, 365734.8 6795334.9, 365746.5 6795344.8, 365752 6795356.6, 365758.8 6795378.8, 365766.1 6795389.7, 365779.1 6795419.8, 365784.7 6795427.5, 365789.7 6795434.4, 365801.3 6795410.5, 365817.2 6795382.3, 365821.2 6795371.2, 365833.6 6795347.1, 365868.1 6795289.8, 365883.9 6795259.9, 365895 6795246.2, 365903.6 6795232, 365904.7 6795223.4, 365915.9 6795218.8, 365920.5 6795202.3, 365947.9 6795179.8, 365958.5 6795179.9, 365969.9 6795192.3, 365969.4 6795197.2, 365973.2 6795205.5, 365979.3 6795211, 365993.2 6795182.8, 366015.7 6795125.1, 366049.1 6795052.1, 366057.9 6795035.6, 366069.9 6795017.7, 366081.9 6795002.4, 366097.4 6794991.6, 366117.9 6794984.8, 366173.1 6794972.3, 366192.9 6794966.2, 366210.4 6794958.5, 366225.1 6794947.4, 366236.9 6794933.2, 366277.7 6794889.9, 366305.9 6794856.8, 366341.1 6794821.2, 366348.2 6794816.1, 366418 6794856.1, 366462.3 6794884.2, 366470.7 6794882.7, 366495.4 6794863.6, 366502.5 6794858.7, 366515.8 6794849.2, 366515.7 6794845.4, 366512.6 6794807.1, 366512.3 6794803.9, 366507 6794759.1, 366496.9 6794711.4, 366491.3 6794693.1, 366487.6 6794651.5, 366558 6794588.2, 366732.5 6794443.1, 366746.1 6794431.5, 366787.6 6794427.3, 366845.1 6794417.2, 366866.2 6794417.6, 366855.9 6794474.9, 366848.4 6794506.2, 366841.2 6794569.2, 366838.5 6794604.5, 366835 6794657.8, 366834.5 6794694, 366876.7 6794682.6, 366911 6794676.1, 366937.6 6794674.8, 366968.1 6794671.3, 367006.2 6794657.5, 367022.1 6794654, 367051 6794644.6, 367093.4 6794633.9, 367123.4 6794631, 367137 6794628, 367158.4 6794619.7, 367168.4 6794502.5, 367169.8 6794476, 367170.3 6794422, 367171.7 6794419.3, 367156.9 6794408.7, 367175.6 6794336.7, 367217 6794220.9, 367242.2 6794159.1, 367249.8 6794147.5, 367262.5 6794146.4, 367279.3 6794141.5, 367326.4 6794118, 367343.1 6794112.4, 367392.3 6794091.3, 367443.8 6794073.8, 367475.9 6794059.9, 367544.9 6794036.4, 367564.8 6794028, 367642.8 6793992.7, 367633.2 6793932, 367615.2 6793851.4, 367592.7 6793738, 367585.9 6793693.1, 367583.9 6793668.8, 367589.3 6793661, 367608.7 6793621.1, 367626.6 6793579.4, 367668.5 6793455.7, 367700.5 6793371.5, 367712.6 6793327.5, 367726 6793291.4, 367748 6793223.9, 367762.3 6793184.4, 367767.6 6793163.7, 367814.8 6793029.7, 367817.7 6793013.1, 367817.3 6793009.8, 367827.7 6792976, 367872.1 6792875.5, 367879.6 6792864.6, 367889.2 6792856.1, 367869.6 6792835.9, 367847.3 6792803.2, 367830.1 6792785.9, 367814 6792767.5, 367796.3 6792751.7, 367782.8 6792735.4, 367777.4 6792726.7, 367759.6 6792707.4, 367691.2 6792647.4, 367680.8 6792638, 367633.6 6792600.9, 367638.9 6792574.7, 367633.9 6792541.5, 367629.5 6792510.8, 367625.6 6792497, 367595.7 6792480, 367577.5 6792471.4, 367537.8 6792473.5, 367530.5 6792472.5, 367521.8 6792471.1, 367517.1 6792472.5, 367503 6792495.3, 367494.3 6792500.6, 367487.1 6792502.5, 367482.8 6792501.5, 367460.8 6792484.4, 367444.9 6792474.1, 367429.3 6792468.4, 367425.7 6792460.3, 367438 6792443.6, 367440.4 6792436.3, 367439.6 6792430.2, 367434.9 6792421.1, 367428.3 6792416.1, 367412.9 6792406.9, 367399.6 6792402.2, 367359.7 6792406.4, 367300.2 6792401.8, 367291.3 6792397.3, 367282.4 6792374.1, 367245.6 6792356.7, 367228.4 6792346.4, 367211.1 6792339.3, 367205.1 6792336.7, 367195.3 6792329.1, 367187.6 6792323, 367150 6792293.5, 367107 6792252.7, 367080.6 6792229.8, 367022.2 6792183.7, 367006.1 6792172.5, 366991.6 6792166.1, 366868.1 6792149.7, 366860.7 6792150.9, 366854.2 6792151.7, 366847.9 6792150.9, 366830.2 6792144.2, 366819.2 6792142.5, 366806.4 6792143, 366791.5 6792146, 366766.5 6792154.4, 366753.8 6792156.9, 366717.6 6792159.7, 366706.8 6792157.9, 366692.3 6792144.6, 366684.9 6792140.5, 366674.5 6792137.8, 366666.3 6792137.3, 366654.7 6792136.7, 366646.7 6792134.3, 366643.8 6792131.6, 366637.5 6792123.9, 366629.4 6792111.9, 366628.8 6792091.3, 366627 6792081.5, 366619.3 6792075.6, 366613.1 6792067.2, 366609.4 6792054.5, 366608.9 6792033.6, 366603.2 6792019.9, 366602.9 6792014.6, 366602.8 6792012.3, 366600.6 6791982.1, 366595.4 6791958, 366584.2 6791935.3, 366561 6791909.2, 366539.5 6791886.2, 366536.6 6791877.2, 366539.9 6791857.8, 366539.6 6791851.3, 366522.6 6791856.6, 366504.5 6791840.7, 366483.4 6791840.2, 366449.4 6791843.1, 366430.6 6791833.7, 366439.4 6791787.9, 366444.2 6791731.3, 366442.7 6791711, 366442.4 6791705.6, 366438.5 6791650.4, 366439.4 6791635, 366442.7 6791621.9, 366467.6 6791575.3, 366522.6 6791453.6, 366529.5 6791437.8, 366531.9 6791430.1, 366530.4 6791421, 366533.3 6791413.1, 366538.2 6791405.5, 366538 6791381.3, 366536.4 6791329.4, 366542 6791269.8, 366562.9 6791168.2, 366564.2 6791137, 366560.2 6791116.6, 366557.2 6791108.8, 366555.9 6791105.5, 366551.2 6791060.2, 366547.5 6791048.7, 366544.3 6791042.7, 366541.4 6791037.5, 366542.9 6791026.9, 366547.8 6791017.5, 366546.5 6791003.1, 366539.5 6790975.6, 366538.6 6790964.8, 366533.4 6790957.8, 366529.9 6790939.1, 366522.3 6790914.4, 366521.4 6790900.6, 366524.8 6790890.4, 366523.9 6790886.5, 366661.5 6790856.6, 366672.3 6790855.1, 366703.8 6790854.5, 366744.8 6790858.1, 366758.7 6790861.2, 366755.1 6790848, 366719.8 6790844.5, 366722.9 6790822.8, 366722.1 6790804.4, 366721.2 6790790.4, 366717 6790752.7, 366718.1 6790737.9, 366722.3 6790729.7, 366735.6 6790719.7, 366750 6790714.1, 366756.7 6790708.5, 366747.7 6790668.2, 366729.8 6790612.5, 366714.8 6790561.6, 366711.9 6790543.8, 366692.5 6790506.6, 366691.7 6790495.5, 366693.4 6790466.6, 366694.8 6790451.1, 366693.7 6790433.3, 366692.6 6790417.5, 366689.1 6790402.2, 366667.7 6790359.8, 366645.1 6790300.5, 366622.3 6790254.8, 366602.5 6790228.4, 366552.1 6790173.7, 366539.3 6790158.1, 366527.8 6790144.4, 366524.3 6790138.1, 366516.5 6790119.9, 366506.2 6790106.2, 366479.6 6790064.2, 366473.1 6790049.6, 366462.8 6789998.6, 366459 6789986, 366452.8 6789966.1, 366440.1 6789914.9, 366434.8 6789898.4, 366421.8 6789869.1, 366405.5 6789838.8, 366385.5 6789785.7, 366364.8 6789749.7, 366360.9 6789733.8, 366361 6789719.6, 366366.6 6789694.2, 366382.3 6789696.4, 366400.6 6789692.6, 366506.7 6789668.3, 366519.1 6789662.8, 366553.9 6789651.1, 366618.2 6789628.6, 366650.5 6789615.9, 366667.1 6789611.6, 366718.4 6789603.6, 366732.6 6789599.8, 366740.6 6789597.2, 366738.1 6789591.3, 366805.8 6789570.8, 366789.7 6789546.7, 366778.5 6789528.4, 366760.5 6789468.3, 366752 6789433, 366740.7 6789393.7, 366729.3 6789346, 366722.8 6789279.7, 366717.3 6789215.2, 366713 6789144.8, 366708.1 6789097.8, 366703.4 6789044.1, 366702.1 6789007.3, 366700.4 6788981, 366688.2 6788913, 366682.4 6788861.9, 366704.9 6788841.3, 366723.1 6788821.8, 366730 6788812.4, 366733.1 6788800, 366733.4 6788777.2, 366737.7 6788768.9, 366740.4 6788769.3, 366760.4 6788778.7, 366786.5 6788783.8, 366804 6788787.3, 366800 6788790.9, 366801.8 6788796.5, 366806.8 6788801.3, 366818.9 6788804, 366829.1 6788804, 366832.8 6788801.1, 366835.9 6788804.2, 366840.5 6788804.7, 366841.3 6788804.5, 366847.4 6788803.1, 366851.2 6788799.8, 366855.2 6788796.4, 366868.7 6788803.8, 366876.6 6788806.5, 366885.9 6788808.9, 366898.4 6788810.2, 366919.9 6788806.6, 366929 6788801.7, 366933.7 6788794.7, 366939.9 6788751, 366942.9 6788743.6, 366949.8 6788734.3, 366959 6788733.2, 366986.7 6788752.6, 367004.6 6788768.4, 367011.9 6788777.1, 367017.9 6788785.9, 367020.9 6788796.5, 367023.2 6788826.2, 367022.4 6788838.7, 367018.3 6788850.7, 367015.2 6788885.5, 367026.1 6788922.2, 367031.8 6788926.6, 367078.2 6788935.3, 367095 6788941.5, 367112.4 6788953.2, 367132.5 6788973.2, 367155.9 6788989.4, 367161.5 6788999.2, 367186 6789061.1, 367195.3 6789069.6, 367205.3 6789072.5, 367213.7 6789073.3, 367232.2 6789069.6, 367242 6789066.1, 367255.3 6789056.8, 367265.6 6789042.9, 367313.2 6788962, 367319.1 6788952.8, 367326.5 6788944.5, 367337.5 6788937.7, 367349.7 6788933.2, 367362.5 6788931.8, 367375.5 6788928.3, 367415.6 6788929.8, 367430.2 6788933.4, 367429.9 6788923.3, 367435.5 6788888.7, 367449 6788857.6, 367467.9 6788825.2, 367472.3 6788813.8, 367474.6 6788803.5, 367480 6788797.5, 367489 6788798, 367496 6788801.3, 367503.4 6788800.5, 367509.2 6788802.6, 367515.6 6788808.2, 367524.5 6788811.6, 367535.8 6788814.3, 367547.1 6788814.6, 367560.6 6788810.1, 367587.1 6788798.7, 367589.1 6788797.8, 367590.4 6788789.8, 367585 6788747.2, 367589.7 6788731.4, 367584.9 6788697.3, 367589.6 6788688.4, 367599.3 6788682.6, 367622.7 6788680.1, 367630.9 6788676.6, 367632.5 6788669.6, 367618.5 6788639.1, 367616.6 6788616.2, 367607.4 6788595.5, 367603.1 6788571.6, 367595.8 6788551.5, 367592.5 6788531.1, 367592.2 6788520.1, 367587.9 6788499.2, 367586.9 6788493.3, 367586.9 6788490.5, 367587.9 6788479.4, 367590 6788471.3, 367592.4 6788461.2, 367590 6788455.8, 367577.7 6788434.3, 367575.4 6788422.5, 367571.8 6788413.2, 367555.8 6788398, 367548.2 6788388.5, 367547.4 6788379.7, 367554.3 6788371, 367565.1 6788370.2, 367567.7 6788364.8, 367562.8 6788355.9, 367566.7 6788351, 367585.1 6788350.1, 367582.9 6788343.3, 367574.7 6788335, 367568 6788324.9, 367564.4 6788314.9, 367565.4 6788310.9, 367567.8 6788302.1, 367570.2 6788298.6, 367581.4 6788279.2, 367598.3 6788236.5, 367611.1 6788214.1, 367615.8 6788201.6, 367619 6788187.8, 367617 6788162.9, 367621.1 6788140.4, 367627.5 6788119.2, 367628.3 6788111.9, 367628.3 6788095.4, 367627 6788090.4, 367622.7 6788083.7, 367626.6 6788075.2, 367632.4 6788068.4, 367632.9 6788059.8, 367638.4 6788053, 367641.3 6788042.5, 367640.9 6788017.8, 367639.1 6788004.6, 367632 6787997.6, 367631.1 6787988.3, 367638.5 6787963, 367637.9 6787952.4, 367627.9 6787945.7, 367608.7 6787943.1, 367602.4 6787932.9, 367597.5 6787923.7, 367599.5 6787916.5, 367600.1 6787907, 367594.6 6787901.3, 367591.8 6787893.3, 367585 6787890, 367582.3 6787882, 367584 6787872.8, 367579.3 6787865.1, 367570.9 6787846, 367567.6 6787835, 367568.4 6787833.7, 367572.2 6787827.6, 367578.7 6787820.5, 367583.1 6787811.1, 367589.5 6787804.8, 367597.2 6787803.2, 367600.4 6787797.8, 367600.8 6787775.9, 367603.2 6787756.6, 367607.9 6787748, 367627.7 6787720.7, 367628.3 6787713.3, 367636.6 6787699.2, 367639.9 6787691, 367642.2 6787680.4, 367643.4 6787667.4, 367642.7 6787655, 367636.2 6787646.1, 367618.7 6787631.6, 367613.8 6787623.7, 367613.5 6787614.5, 367613.5 6787606.3, 367613.6 6787603.1, 367613.7 6787598.5, 367614.1 6787580.6, 367615.8 6787565, 367616.7 6787557.3, 367616.8 6787539.1, 367619 6787511.1, 367621.7 6787496.7, 367634.5 6787438.4, 367638.7 6787426.1, 367646.7 6787411.8, 367651.7 6787403.4, 367653 6787391.4, 367650.6 6787377.4, 367639.4 6787333.3, 367634.7 6787321, 367627.8 6787311.9, 367622.3 6787301.8, 367610.5 6787274.2, 367595.4 6787243.1, 367591.7 6787229, 367590.7 6787219.1, 367594.2 6787209.3, 367599.7 6787201.6, 367603.3 6787193.4, 367604.7 6787184.4, 367599.7 6787159.9, 367599 6787155.1, 367599.2 6787145.9, 367600.7 6787138.9, 367609.5 6787128.8, 367624.8 6787117.1, 367626.6 6787110.9, 367628.2 6787108.4, 367631.3 6787104.9, 367631.9 6787102.7, 367631.7 6787100, 367631 6787098.4, 367629.2 6787096.4, 367627.5 6787095.2, 367622.2 6787089.9, 367621.9 6787085.4, 367623.1 6787081.2, 367624.6 6787079.1, 367625.6 6787075.9, 367627.7 6787074.7, 367632.6 6787074.2, 367633.6 6787073.9, 367634.4 6787073, 367636.4 6787068.6, 367636.5 6787062.3, 367635.8 6787060.8, 367631.3 6787059.6, 367630.1 6787058.7, 367630.2 6787054.3, 367626.4 6787052.8, 367621.6 6787049.9, 367617.8 6787045.6, 367613.2 6787043, 367607.1 6787039.2, 367602.7 6787036.8, 367600.6 6787034, 367598.2 6787032.3, 367595.8 6787031.5, 367593.4 6787030.3, 367588.8 6787026.4, 367586.6 6787025.3, 367579.5 6787022.8, 367559.5 6787011.6, 367555 6787010.7, 367554.5 6787019.9, 367552.5 6787027.1, 367543.7 6787027.3, 367507.8 6786994.1, 367490.1 6786981.3, 367481.6 6786971.8, 367475 6786954.9, 367470.7 6786949.2, 367452 6786927.1, 367441.9 6786919.4, 367414.8 6786893.2, 367383.9 6786868.3, 367363.8 6786852.1, 367343.7 6786833.7, 367321.7 6786810.4, 367287.2 6786785.5, 367264.8 6786766.6, 367242.3 6786736.6, 367231.7 6786728.8, 367204.1 6786720.2, 367179 6786707.5, 367175.5 6786703, 367171.8 6786698, 367167.3 6786687.2, 367157 6786679.3, 367142.5 6786659.6, 367127.5 6786654.7, 367113.6 6786656.4, 367104.4 6786655.8, 367091.8 6786652.7, 367052.7 6786648, 367036.3 6786641.4, 367023.5 6786629.5, 367013.4 6786617.6, 367009.7 6786611.8, 367005.1 6786604.7, 366995.1 6786597.1, 366966.9 6786583.3, 366957.6 6786573.2, 366947.7 6786566.8, 366944.7 6786564.9, 366912.7 6786563.9, 366864.5 6786552.2, 366847.1 6786551, 366831.2 6786543.8, 366818.9 6786535.9, 366805 6786530, 366793.2 6786522.8, 366774 6786514.7, 366763.3 6786508.5, 366755 6786497.2, 366744.6 6786488.3, 366737.5 6786476.4, 366724 6786466.2, 366717.1 6786461.2, 366702.2 6786449.8, 366697.3 6786436, 366698.7 6786420.4, 366647.7 6786400, 366647.2 6786397.6, 366632.1 6786389.5, 366614.1 6786388.9, 366596.7 6786390.3, 366579.7 6786384.4, 366563.4 6786375.8, 366547.3 6786371.5, 366533.6 6786409.1, 366503.1 6786476, 366494.9 6786508.1, 366492.7 6786549.8, 366498.7 6786567.8, 366507.3 6786580.6, 366511.9 6786593, 366514.7 6786602.8, 366520.8 6786613, 366524.1 6786622.2, 366530.3 6786635.6, 366524 6786660.8, 366515.3 6786676.2, 366507.1 6786694.4, 366488.7 6786743.7, 366483.5 6786762.6, 366480.2 6786781.6, 366478.3 6786805, 366473.5 6786824.9, 366470.6 6786831.5, 366465.3 6786843.8, 366453.9 6786858.5, 366440.8 6786869.6, 366400.3 6786897.1, 366394 6786901.6, 366366 6786928.5, 366354.6 6786941.8, 366337.6 6786966.1, 366325.9 6786991.7, 366318.4 6787001, 366299.8 6787031.3, 366280.8 6787058.7, 366254.8 6787087.9, 366220.3 6787136.1, 366196.6 6787166.2, 366191.4 6787177.9, 366190.5 6787190.8, 366193 6787240.5, 366196.3 6787255.7, 366201.1 6787267.2, 366209.4 6787284.7, 366209.6 6787301.9, 366207.7 6787305.6, 366202.6 6787316, 366194.1 6787326.9, 366182.9 6787337.4, 366171.8 6787355, 366189.5 6787410.8, 366189.1 6787422.6, 366192.8 6787445.8, 366196 6787459.2, 366197.3 6787484.2, 366203.6 6787501.9, 366217.9 6787554.4, 366220.1 6787569.4, 366219.4 6787581.4, 366215.7 6787590.1, 366212.5 6787602.8, 366175.7 6787607.3, 366018.9 6787626.5, 365955.8 6787634.2, 365818 6787650.3, 365687.1 6787662.6, 365626.7 6787669.9, 365570.9 6787679.6, 365514.6 6787695, 365441.9 6787720.4, 365376.1 6787748.4, 365246.9 6787806.3, 365125.9 6787856.8, 365079.4 6787876.4, 365028.1 6787898.1, 364886.6 6787962, 364814.3 6787995.1, 364766.4 6788016.9, 364690 6788044.9, 364664.3 6788055.9, 364601.2 6788076.8, 364514.2 6788105.6, 364507.4 6788113, 364497.9 6788128.3, 364492.1 6788138.4, 364487.1 6788147, 364473.1 6788167.9, 364464.4 6788184.6, 364448.1 6788199.3, 364434.9 6788215.9, 364430.1 6788222, 364423.7 6788231.7, 364416.6 6788242.6, 364410 6788254.3, 364402.7 6788267.2, 364399.7 6788272.5, 364383.8 6788292.4, 364381 6788295.8, 364374.7 6788307.1, 364375.7 6788319.5, 364374.9 6788324.8, 364359.3 6788324.7, 364348.9 6788331.1, 364348.3 6788331.4, 364327 6788358.6, 364315.3 6788366.9, 364280.7 6788387.6, 364261.4 6788396.9, 364221.7 6788413.5, 364198.9 6788421.3, 364191.7 6788423.8, 364136.2 6788442.7, 364010 6788472.7, 363983.6 6788478.4, 363929.6 6788490.2, 363925.8 6788493.5, 363917.9 6788500.5, 363908.5 6788515.4, 363894.4 6788532.5, 363857.8 6788577.9, 363848.1 6788589, 363840 6788602.3, 363839 6788607.3, 363840.6 6788618, 363847.6 6788621.5, 363865.9 6788626.1, 363876.8 6788627.3, 363878.5 6788627.5, 363894.4 6788628.9, 363923.9 6788633.8, 363939.9 6788637.6, 363954.3 6788644.9, 363968.3 6788655.3, 363979.2 6788668, 363986.6 6788683.3, 363990.3 6788699.5, 363992.3 6788727.4, 363979.8 6788729.9, 363963.9 6788735.9, 363950.2 6788746.1, 363937.5 6788765.2, 363929.6 6788785.2, 363922.4 6788798.5, 363912.1 6788807.6, 363887.8 6788834, 363867.5 6788847.4, 363854.8 6788870.3, 363845.7 6788905.2, 363839.9 6788906.4, 363848.5 6788921.6, 363866.4 6788948, 363914.4 6789008.1, 363920.5 6789017.5, 364030.6 6789094, 364062.6 6789099.4, 364081.2 6789103.9, 364121.9 6789116.8, 364168.9 6789131.6, 364168.3 6789137.7, 364171.5 6789157, 364181.2 6789189, 364187.3 6789223.9, 364190.8 6789257.7, 364204.8 6789299.3, 364228.1 6789358.3, 364234.5 6789370.4, 364241.1 6789393, 364246.4 6789420.9, 364260.2 6789459.9, 364270.6 6789530.2, 364270.7 6789537.4, 364248.2 6789534.7, 364201 6789545.7, 364163.1 6789561, 364118.1 6789582.5, 364084.4 6789602.8, 364032.4 6789615.1, 364012.5 6789625.2, 363999.7 6789644.3, 363997.3 6789651.9, 363993.2 6789659.6, 363987.7 6789672.7, 363982.8 6789686.7, 363972.4 6789705.7, 363968.2 6789717.8, 363959.8 6789750.3, 363963.4 6789765.8, 363974.3 6789779.9, 363990 6789792.2, 364015 6789806.3, 364027.5 6789816.6, 364035.2 6789819.3, 364049 6789828.4, 364053.4 6789843.6, 364051.4 6789852.3, 364046.7 6789859.9, 364034.1 6789870.6, 364025.9 6789875.3, 364006.9 6789883, 363994.6 6789892.4, 363985.2 6789895.8, 363944.3 6789903.7, 363933.3 6789907.6, 363926.3 6789912.3, 363922.3 6789917.1, 363921.8 6789925, 363924.1 6789934.1, 363927.8 6789941.1, 363934.5 6789948.2, 363949.6 6789978.3, 363948.4 6789994.3, 363946.5 6789999.6, 363937.9 6790012.7, 363924.2 6790023.4, 363915.3 6790029.1, 363881.5 6790043.1, 363863.4 6790046.4, 363857.6 6790051, 363853 6790059.5, 363850.4 6790082.6, 363853.3 6790093.9, 363855 6790135.9, 363858.7 6790148.3, 363871.9 6790176.9, 363884.2 6790198.9, 363899.9 6790218.4, 363921.1 6790240, 363923.6 6790246.2, 363922.9 6790262.9, 363911.2 6790295.2, 363881.4 6790354.3, 363878.2 6790364.8, 363870.4 6790380, 363866.4 6790393.2, 363850.8 6790427.6, 363842 6790436.6, 363835.5 6790441, 363814.7 6790452, 363791.4 6790460.8, 363767.1 6790475.7, 363753.7 6790488.9, 363751.5 6790502.4, 363753.1 6790507.8, 363776.6 6790526.4, 363783.8 6790534.4, 363788.1 6790541.8, 363792 6790552.4, 363791 6790560.8, 363782.5 6790590.3, 363762 6790623.7, 363750.3 6790639, 363713.5 6790681.4, 363706.4 6790685.6, 363698.3 6790697.5, 363668.6 6790761.2, 363651.6 6790803.7, 363643.8 6790818.3, 363637.6 6790827.1, 363625.6 6790836.6, 363584.8 6790857.7, 363565.4 6790870.8, 363557.4 6790883.8, 363553.6 6790895.3, 363549 6790903.7, 363543.5 6790911, 363530.1 6790921.8, 363523.3 6790923.9, 363515.7 6790924.9, 363487.2 6790921.1, 363469.9 6790915, 363459.1 6790906, 363454 6790894.4, 363452.6 6790880.9, 363453.2 6790857.3, 363449 6790824.6, 363444.8 6790809.6, 363428.2 6790789.5, 363419 6790785.9, 363384.9 6790788.8, 363382.9 6790788.9, 363319.8 6790805.3, 363291.6 6790809.6, 363254.5 6790804.8, 363248.9 6790798.2, 363235.7 6790759, 363231.3 6790749.6, 363222.6 6790745.6, 363209.4 6790745.9, 363190.6 6790752.4, 363154.2 6790779.3, 363122.1 6790797.8, 363101.8 6790804.7, 363092.9 6790806.6, 363050.3 6790822.3, 363042 6790827.2, 363024.5 6790842.1, 362970.7 6790890.4, 362955.5 6790899.1, 362939.1 6790905.4, 362900.7 6790907.6, 362874.3 6790905, 362856.1 6790901.2, 362851.1 6790900.1, 362832.2 6790890.4, 362804.6 6790867.1, 362792.6 6790858.9, 362787 6790854.9, 362775.6 6790850.1, 362749.9 6790843.7, 362735.9 6790844, 362698.3 6790840.4, 362659.7 6790840.1, 362629.4 6790836.3, 362617.7 6790832.8, 362554.3 6790799.5, 362529.4 6790784.1, 362497.3 6790767.1, 362476.1 6790751.2, 362458.5 6790734.3, 362449.1 6790721.7, 362419.8 6790689.7, 362402.6 6790662.8, 362383.7 6790640.6, 362354.9 6790612.9, 362327.3 6790591, 362280.7 6790541.7, 362265.3 6790528.1, 362234.9 6790504.5, 362229.3 6790498.2, 362226.5 6790492.1, 362224.6 6790478.6, 362225.4 6790469.7, 362229.3 6790444.9, 362240.5 6790416.6, 362247.4 6790391.4, 362249.4 6790379.2, 362248 6790367.8, 362228.8 6790334.9, 362201.1 6790299.5, 362185.3 6790282.4, 362176.8 6790271.2, 362148.1 6790230.3, 362142.9 6790220.8, 362136.9 6790198.9, 362126.9 6790173.3, 362123.1 6790151.8, 362123.1 6790133.8, 362118.4 6790121.3, 362113 6790111.5, 362107.8 6790103.6, 362082.3 6790079.4, 362016.4 6790025.2, 361996.9 6790006.1, 361975.2 6789980.1, 361956.3 6789960.2, 361939.4 6789937.1, 361908.1 6789902.8, 361882.3 6789868.4, 361865.6 6789849.6, 361852.9 6789847.6, 361831.8 6789846.7, 361819.9 6789848.8, 361756.1 6789853.6, 361722.6 6789860.6, 361661 6789864.5, 361642.1 6789864.7, 361625.4 6789861.7, 361613.9 6789857.5, 361596.3 6789848.8, 361567.8 6789831.4, 361535.8 6789805.7, 361498.8 6789772.4, 361505.9 6789762.4, 361529.6 6789727.3, 361537.2 6789718, 361546.6 6789700.2, 361552.4 6789695.1, 361579.8 6789695.8, 361576.7 6789681.2, 361573.1 6789653.2, 361572.2 6789639.1, 361566.7 6789608.5, 361556.9 6789582, 361549.8 6789568.4, 361541.6 6789558.3, 361531.4 6789549.7, 361521 6789544.8, 361502.4 6789539, 361488.2 6789519.5, 361483.1 6789506.8, 361480.5 6789487.5, 361478.2 6789479, 361470.6 6789469.1, 361465 6789461.5, 361461.4 6789449, 361456.8 6789426.7, 361433.5 6789367.3, 361428.8 6789352, 361425.7 6789328.2, 361424.6 6789310.2, 361427.2 6789292.7, 361437 6789284.4, 361440.6 6789280.9, 361440.4 6789270.5, 361440.2 6789266.6, 361440.1 6789262, 361437 6789250.4, 361436.6 6789246.7, 361436.9 6789243.3, 361438.6 6789240.4, 361442.6 6789238, 361453.1 6789231.3, 361458.5 6789227.3, 361468.8 6789222.4, 361476.2 6789220.2, 361490 6789219.3, 361495 6789219.3, 361507.1 6789219.5, 361539 6789207, 361540.7 6789205.8, 361543.7 6789198.8, 361546.5 6789188.5, 361547.6 6789176.9, 361546.5 6789151.9, 361544.8 6789135.2, 361532.5 6789080.3, 361527.2 6789062.8, 361523.7 6789032.3, 361522.6 6789021.6, 361518.6 6789007.3, 361516.4 6788999.5, 361514.6 6788992.8, 361508.5 6788970.5, 361506.9 6788964.6, 361501.7 6788945.6, 361493.9 6788914.5, 361484.7 6788877.5, 361545.5 6788847.7, 361544.8 6788843.9, 361521.8 6788714.6, 361514.7 6788687.5, 361501.6 6788652.5, 361484.9 6788655.3, 361446.8 6788659.1, 361415.1 6788659.8, 361395.4 6788658.8, 361386 6788657.5, 361378.3 6788654.9, 361369 6788647.2, 361368.1 6788645, 361365.3 6788637.4, 361362.5 6788613.2, 361357.8 6788604.3, 361354.6 6788603.2, 361345.9 6788600.4, 361293.2 6788614.3, 361284.2 6788613.6, 361277.7 6788609.2, 361271.4 6788599.4, 361260.2 6788575.5, 361253.4 6788566.7, 361244.3 6788562.2, 361246.9 6788555.2, 361284.5 6788494.2, 361312.3 6788459.2, 361335.6 6788424.6, 361346.6 6788385.3, 361349.3 6788344.1, 361381.7 6788265.6, 361313 6788249.3, 361245.3 6788255.3, 361143.9 6788264.3, 361093.6 6788268.7, 361095.1 6788263.7, 361094.9 6788247.8, 361091.6 6788217, 361079.9 6788171.7, 361076.8 6788148.5, 361068.9 6788149, 361057.3 6788111.2, 361045.8 6788052.1, 361041.3 6788034.4, 361035.3 6787999.7, 361030.2 6787944.6, 361028.3 6787915.1, 361019.9 6787762.2, 361014.5 6787762.9, 361011 6787754, 361004.5 6787727.4, 360997.4 6787685.3, 360996.2 6787671.1, 360996.6 6787662.4, 360996.6 6787655.6, 361001.1 6787632.9, 361007.7 6787608.6, 361009 6787603.7, 361017.2 6787581.5, 361026.9 6787549.1, 361031.4 6787521.3, 361032.5 6787506.5, 361031.1 6787476.3, 361025.2 6787447.6, 361023.1 6787440.3, 361009 6787393.6, 361006.4 6787382.1, 361005.3 6787368.7, 361006.4 6787357.3, 360985.7 6787295.6, 360973.1 6787296.6, 360898.8 6787162.8, 360890.1 6787147.8, 360859.2 6787093.6, 360784.6 6787056.7, 360781 6787057.9, 360771.6 6787052.4, 360762.7 6787044.4, 360749.2 6787025.7, 360747.6 6787019.1, 360738.4 6787014.4, 360716.4 6786998.3, 360701.2 6786980.4, 360678.5 6786971.7, 360638 6786946.5, 360619.3 6786939.1, 360598 6786938.5, 360582.8 6786931.6, 360575.3 6786916.3, 360572.9 6786879.2, 360556.5 6786844, 360536.4 6786803.6, 360522 6786794.2, 360481.4 6786691.8, 360458.2 6786686.9, 360435.2 6786689.7, 360386.8 6786700.2, 360370.2 6786704.8, 360331.2 6786719.4, 360310.3 6786729.2, 360296.4 6786740.3, 360283.3 6786745.9, 360242.1 6786748.5, 360201.4 6786752.8, 360127.3 6786764.3, 360124.9 6786759.5, 360111.7 6786754.4, 360095.9 6786754.6, 360080.9 6786757.9, 360052.3 6786761.2, 360060.9 6786751.9, 360074.7 6786718.4, 360085 6786704.2, 360090.6 6786685.1, 360089 6786667.1, 360082 6786648, 360073.2 6786630.9, 360061.9 6786594.2, 360054.3 6786580.8, 360043.6 6786570.7, 360043.5 6786558.7, 360033.8 6786510.6, 360029.5 6786497.6, 360026.8 6786490.9, 360020.5 6786483.1, 360006.2 6786468.7, 359996.3 6786452.9, 360012 6786438, 360018.3 6786423.2, 360025.3 6786387.6, 360031.2 6786370.7, 360034.7 6786351.9, 360037 6786335.5, 360036.5 6786321.6, 360072 6786297.8, 360097.2 6786280.6, 360109.1 6786270.7, 360132.1 6786258.1, 360168.5 6786244, 360207.2 6786235.8, 360254.4 6786230.1, 360306.1 6786228.4, 360343.5 6786227.3, 360350.1 6786041.2, 360352.3 6786023.9, 360356.6 6786022.8, 360360.6 6786011.6, 360358.8 6785968.9, 360359.1 6785963.6, 360359.8 6785956.2, 360369.4 6785928.5, 360370.6 6785923.8, 360411.5 6785828.9, 360414.7 6785812.1, 360412.3 6785771.3, 360409.1 6785746.3, 360408.2 6785741.8, 360406.6 6785737.8, 360394.8 6785700.7, 360374.1 6785646.6, 360365.2 6785626.5, 360359.3 6785607.6, 360356.9 6785592.6, 360351 6785545.2, 360349.4 6785488.8, 360351.1 6785457.1, 360360.8 6785356.3, 360367.8 6785350.9, 360197.3 6785372.3, 360174.2 6785371.8, 360159.9 6785368.7, 360142.6 6785357, 360139.6 6785352.6, 360120.3 6785310.4, 360078.4 6785234.7, 360074 6785212.3, 360069.4 6785193.8, 360069.1 6785172, 360085.8 6785132.9, 360084.8 6785086.9, 360080.8 6785065, 360072.3 6785044.9, 360063.5 6785029, 360052.2 6785017.7, 360027.4 6784985.4, 360015.7 6784975.7, 359989.4 6784944.4, 359976.7 6784925.7, 359959.7 6784891.7, 359905.4 6784898.9, 359902.7 6784886.2, 359899.8 6784856.6, 359889.3 6784811.3, 359882.3 6784719.2, 359883.6 6784667.9, 359890.8 6784616.7, 359894.3 6784599.3, 359906.9 6784564.4, 359900.5 6784548, 359910.4 6784500.4, 359896 6784453.2, 359947.9 6784418, 359943 6784390.1, 359924.3 6784256.1, 359921 6784238.2, 359913.2 6784213.5, 359910.6 6784207.5, 359903.8 6784197.7, 359859.7 6784158.5, 359845.5 6784145.1, 359819.7 6784125.4, 359814.8 6784132.1, 359810.7 6784132.6, 359802.8 6784133.6, 359786.4 6784130.2, 359753 6784113.3, 359740.5 6784102.1, 359720 6784078.1, 359709.5 6784075.6, 359682.5 6784078.7, 359669.2 6784084.4, 359653.7 6784094.1, 359594.2 6784138.6, 359540.1 6784188.9, 359529.2 6784203.2, 359528.2 6784207.2, 359493.5 6784210.2, 359478.9 6784204.7, 359464.8 6784193.1, 359451.8 6784179.4, 359439.9 6784164.1, 359421.2 6784132.5, 359417.4 6784120.4, 359422.9 6784080.7, 359427.3 6784063.3, 359431.8 6784052.7, 359367.9 6783887, 359372 6783883.8, 359479.1 6783809.4, 359542.4 6783753, 359554.1 6783741.6, 359609.6 6783695, 359629.8 6783678.1, 359638.1 6783668.8, 359694.5 6783602, 359709.5 6783581.5, 359726.6 6783561.7, 359793.5 6783475.8, 359800.2 6783467.9, 359817.3 6783446.8, 359840.4 6783408.1, 359855.1 6783390.7, 359883 6783351.3, 359927.2 6783280.1, 359941.1 6783252.6, 359947.5 6783243.4, 360017 6783162.2, 360076.4 6783112.9, 360111 6783069, 360110.8 6783044, 360059.7 6782914.5, 360048.8 6782804.7, 359993.8 6782790.1, 359993 6782700.2, 360018.4 6782706, 360024.7 6782704.8, 360033.7 6782704.3, 360051 6782704.1, 360053.7 6782700.5, 360057.9 6782704.5, 360073.5 6782711.9, 360080.8 6782714, 360089 6782716.1, 360096.1 6782718.4, 360099.9 6782719.1, 360116.4 6782718.7, 360118.6 6782718.9, 360124.7 6782719.5, 360128.7 6782720.8, 360130.2 6782721.1, 360132.5 6782721.3, 360134.3 6782721.3, 360136.4 6782721.2, 360147 6782720.1, 360150.1 6782718.7, 360153.1 6782717.1, 360164.1 6782707.6, 360170.1 6782702.2, 360175.2 6782697, 360181.5 6782689, 360183.4 6782686.2, 360186.7 6782681, 360188.2 6782677, 360189.1 6782673.8, 360192 6782660.7, 360193 6782655.7, 360194.8 6782644.6, 360195.2 6782638.9, 360195.3 6782631.7, 360194.9 6782630.1, 360196.5 6782625.2, 360198.3 6782622.4, 360201.6 6782619.8, 360202.1 6782619.3, 360211.3 6782612.1, 360219.4 6782608.5, 360221 6782608.3, 360222.1 6782608.1, 360224 6782607.6, 360226.9 6782606.4, 360230.5 6782605.1, 360231.8 6782604.6, 360237.2 6782603.8, 360241.1 6782603, 360243.9 6782601.8, 360245.2 6782600.6, 360249.2 6782593.5, 360252.3 6782586.2, 360255.3 6782572.7, 360258.1 6782562.6, 360260.5 6782552.7, 360264.6 6782541, 360266.2 6782530.7, 360268 6782515.8, 360270.8 6782503.2, 360273.6 6782493.1, 360280.7 6782478.1, 360289.4 6782463.4, 360295.6 6782427.9, 360295.5 6782412.9, 360322.7 6782405.3, 360349.2 6782414.4, 360378.9 6782412.7, 360400.7 6782396.8, 360422.4 6782382.6, 360497.3 6782372.6, 360573.6 6782354.8, 360609.4 6782332.6, 360635.7 6782305.9, 360654.2 6782280.8, 360677.4 6782250.9, 360679.7 6782229.7, 360683.7 6782224.9, 360685.5 6782223.3, 360708.4 6782203.9, 360725.5 6782194.4, 360747.2 6782188, 360755.1 6782187.9, 360767.5 6782187.9, 360791.6 6782181.4, 360815.8 6782174.9, 360839.9 6782168.5, 360858.1 6782163.5, 360892.5 6782182.1, 360917.6 6782183.5, 360950.6 6782209.8, 360967.8 6782220.6, 360975.1 6782217.5, 360976.5 6782206.1, 360978.2 6782203.6, 360989.6 6782192.1, 360992.9 6782190.1, 360995.9 6782188.6, 360999.2 6782184.5, 361006.3 6782160.9, 361001.6 6782140.6, 361017 6782120.2, 361017.3 6782087.3, 361021.1 6782087, 361025.5 6782085.8, 361030.2 6782081.1, 361039.3 6782076, 361046.9 6782067.7, 361051.4 6782063.1, 361049.3 6782056.9, 361058.7 6782049.6, 361067.8 6782037, 361094.5 6782029.2, 361100.2 6782030.8, 361102.9 6782036.7, 361116.8 6782037.1, 361130.6 6782038, 361142.1 6782038.8, 361153.9 6782040.4, 361164 6782041.6, 361170.9 6782042.8, 361177.7 6782044.3, 361188 6782045.5, 361193.1 6782045.3, 361202.8 6782044.4, 361211.1 6782044.9, 361218.7 6782045.2, 361223 6782045.3, 361232.8 6782044.5, 361232.8 6782041.6, 361247.5 6782037.7, 361252 6782037, 361259.9 6782034.9, 361262.5 6782034.3, 361272.4 6782032.9, 361278.7 6782030.4, 361287.4 6782027.4, 361289.7 6782026.4, 361297.3 6782023, 361299.8 6782022.2, 361299.3 6782018.6, 361298.2 6782011.4, 361296.4 6782006.7, 361294.6 6782001.6, 361294.2 6781988.7, 361296.3 6781985, 361296.1 6781960.1, 361295.9 6781935.1, 361295.8 6781930.1, 361287.8 6781906.5, 361285.6 6781900.2, 361277.8 6781883.4, 361279.2 6781877.4, 361287 6781867.4, 361299.3 6781850.2, 361295.5 6781849.2, 361293.6 6781844.6, 361291.7 6781841.8, 361294.5 6781839.7, 361338.2 6781806.7, 361352.3 6781794.3, 361376.6 6781772.7, 361398.3 6781753.4, 361438.9 6781711.2, 361450 6781694.3, 361607.2 6781552.2, 361647.6 6781529, 361659.2 6781520.3, 361702.8 6781478.1, 361769.1 6781424.7, 361781.3 6781416.5, 362004.4 6781204.8, 362153 6781038.7, 362238.9 6780959.4, 362220.9 6780922.9, 362271 6780898.2, 362311.5 6780877.9, 362338.9 6780860.7, 362353.8 6780850.9, 362369.8 6780842.9, 362391.4 6780833.7, 362418.6 6780822.3, 362450.6 6780810.2, 362497.7 6780796.7, 362547.3 6780786.3, 362568.6 6780781.9, 362603.3 6780778.6, 362600.7 6780771.6, 362595.2 6780759.9, 362589.8 6780750.2, 362582.4 6780740.6, 362576 6780733.8, 362571.1 6780727.6, 362562.7 6780713.8, 362557.6 6780698.5, 362554.2 6780694, 362571.2 6780680.2, 362617.5 6780642.2, 362637.8 6780623.8, 362671.6 6780591.5, 362707.3 6780556.4, 362735.8 6780530.7, 362753.4 6780515.6, 362779.5 6780494.2, 362796.3 6780480.3, 362806.2 6780470.4, 362815.3 6780458.7, 362826.5 6780438.3, 362836.9 6780417.5, 362847.5 6780396.1, 362856.9 6780380.3, 362864.8 6780370.5, 362873.4 6780363.7, 362885 6780358, 362903.4 6780350.6, 362914.2 6780345.4, 362926.2 6780340.1, 362949.1 6780334.4, 362959.2 6780331.1, 362976.4 6780325.4, 362998.5 6780317.9, 363021.4 6780309.6, 363044.9 6780301.5, 363063.3 6780295, 363079.1 6780288.8, 363090.1 6780286.1, 363100.2 6780283.7, 363121.2 6780279.6, 363130.4 6780278.3, 363141.3 6780276.7, 363154.2 6780275.6, 363169 6780273.9, 363184.4 6780271, 363198.6 6780269.3, 363213.1 6780266.1, 363231 6780262.1, 363249.3 6780257.9, 363252.1 6780257.4, 363266.5 6780254.4, 363280.4 6780250, 363293.4 6780246.2, 363304.7 6780243.7, 363315.9 6780241.4, 363325.4 6780239.6, 363335.6 6780237.8, 363346 6780235.9, 363363.5 6780232.5, 363377.1 6780229.9, 363385.2 6780228.5, 363395.5 6780226.7, 363415.3 6780223.1, 363422.8 6780221.8, 363440.3 6780219.4, 363461.5 6780216.6, 363479.5 6780214.7, 363498.3 6780212.6, 363507.8 6780211.5, 363521.5 6780209.7, 363534.2 6780208.1, 363538.5 6780207.4, 363548.2 6780205.1, 363557.3 6780202.3, 363565 6780199.2, 363571.7 6780195.8, 363579.3 6780191.2, 363587.1 6780185.4, 363595.4 6780178.5, 363603.8 6780170.6, 363613 6780161, 363624.1 6780148.8, 363630.9 6780140.7, 363629.9 6780133.4, 363618.3 6780052.3, 363618.3 6780049.2, 363619 6780046.2, 363619.9 6780044.2, 363620.5 6780043.3, 363701.4 6780014.7, 363728.7 6780004.9, 363734.6 6780003.7, 363738.7 6780000.3, 363747.2 6779990, 363758.8 6779976.7, 363766.5 6779968.4, 363772.3 6779962.9, 363777.4 6779958.5, 363783.9 6779954.1, 363790.9 6779949.8, 363798.1 6779946.2, 363806.1 6779942.6, 363813.1 6779940.2, 363824.1 6779937.3, 363836.8 6779934.6, 363859.2 6779930.7, 363880.1 6779927.6, 363895.1 6779926, 363930.3 6779922.5, 363962.1 6779919.4, 363984.5 6779917.4, 363982.1 6779908.1, 363980 6779901.1, 363978.8 6779898, 363976.7 6779894.8, 363970.4 6779886.7, 363957.7 6779870.4, 363944.6 6779853.6, 363930.7 6779835.9, 363917 6779818.4, 363907 6779805.8, 363897.1 6779793.3, 363890.9 6779785.3, 363886.9 6779780, 363877.2 6779767.6, 363868.2 6779756.9, 363858.3 6779745.3, 363854.5 6779740.5, 363851.5 6779737.1, 363847.4 6779733.1, 363844.2 6779730.6, 363841.5 6779722.7, 363838.8 6779713.4, 363836.6 6779696.1, 363835.8 6779679, 363835.7 6779666.3, 363837.5 6779665.2, 363837.5 6779658.2, 363854.5 6779657.6, 363853 6779644, 363862.6 6779615, 363867.7 6779589.4, 363867 6779581.7, 363887.5 6779580, 363921.5 6779574.9, 363930 6779573.6, 363946.5 6779573, 363981.6 6779571.4, 363999.4 6779564.6, 364038.7 6779563.9, 364065.1 6779563.4, 364079.9 6779563.2, 364075.7 6779531, 364099 6779527.4, 364161.3 6779511.4, 364163.2 6779510.9, 364223.5 6779494.7, 364217.6 6779389, 364217 6779378.2, 364216.1 6779355.6, 364215.9 6779333, 364216.3 6779310.4, 364245.4 6779207.8, 364255.5 6779171.7, 364260.4 6779153.9, 364267 6779130, 364276.8 6779103.1, 364274.4 6779090.4, 364272 6779077.3, 364267.8 6779054.8, 364263.5 6779032.3, 364258.9 6779008, 364254.4 6778983.9, 364248.7 6778954.1, 364243.1 6778924.9, 364236.9 6778890.2, 364230.6 6778854.9, 364225.2 6778825.6, 364222.4 6778810.3, 364219.2 6778794.1, 364204.1 6778712.9, 364198.3 6778681.8, 364195.7 6778667.4, 364192.6 6778667.3, 364179.5 6778667.5, 364161.9 6778668.6, 364154.3 6778669.8, 364148.8 6778672, 364136.6 6778678.9, 364122.2 6778687.8, 364106.8 6778697.6, 364090.2 6778706.7, 364081.2 6778712.6, 364073 6778721.1, 364060.6 6778737.5, 364053.2 6778748.7, 364039.6 6778771.1, 364032 6778784.3, 364024.3 6778797.7, 364012.5 6778816.7, 364002.5 6778833.2, 363996.7 6778844.7, 363990 6778859.7, 363983.9 6778874.9, 363979.5 6778887.8, 363976.4 6778899.3, 363974.2 6778911.1, 363973.3 6778921.8, 363972.5 6778932.7, 363968.4 6778956.8, 363965.6 6778966.7, 363959.9 6778976.5, 363949.8 6778987.7, 363932.8 6779001.9, 363916.7 6779012.4, 363904.9 6779017.5, 363886.5 6779022.8, 363871.2 6779025.6, 363850.2 6779028.1, 363833.9 6779028.8, 363815.5 6779029.3, 363806.2 6779030.2, 363801.9 6779031.2, 363788.1 6779036.3, 363775.8 6779042.3, 363764.2 6779049.5, 363750.8 6779059.6, 363747.2 6779062.9, 363744.1 6779066.9, 363742.1 6779069.3, 363739.5 6779071.2, 363732.7 6779074, 363715.1 6779078.8, 363702.8 6779081.1, 363693.4 6779083.2, 363685 6779086.8, 363675.9 6779092, 363656 6779106.9, 363647.9 6779113.3, 363639.1 6779118.9, 363630.3 6779122.9, 363620.2 6779125, 363611.3 6779125, 363601 6779123, 363593.1 6779120, 363580.2 6779114, 363549.5 6779100.7, 363538.9 6779096.3, 363528.8 6779093.5, 363521.7 6779091.1, 363511.6 6779085, 363500.2 6779076, 363494.2 6779070.4, 363481.1 6779056.7, 363474 6779048.3, 363468.5 6779042.7, 363462.5 6779038.1, 363456.9 6779035.4, 363447.1 6779032.3, 363436.9 6779030, 363428.9 6779028.2, 363421.3 6779025.3, 363411.3 6779019.5, 363399.2 6779009.4, 363391.6 6779001, 363383.5 6778989.5, 363379.8 6778983, 363376.9 6778976.1, 363374.6 6778970.9, 363371.6 6778966, 363363.1 6778957.1, 363350.8 6778947.4, 363337.2 6778938.9, 363325.6 6778934.1, 363310.1 6778930.2, 363293.6 6778927.7, 363284 6778926.2, 363271.6 6778925.1, 363264.1 6778925.7, 363255.6 6778928.4, 363240.6 6778935.3, 363225.6 6778944.2, 363220.4 6778947.5, 363214.7 6778950, 363210.3 6778950.9, 363197.9 6778951, 363186.2 6778950.6, 363183.8 6778949.7, 363171.9 6778938.8, 363161.8 6778927.5, 363147.7 6778913.4, 363139.4 6778907.8, 363121.3 6778901.8, 363107.1 6778897.5, 363096.3 6778896.1, 363085.2 6778897.7, 363078 6778903.1, 363067.5 6778907.7, 363055.4 6778910.7, 363044.6 6778911.1, 363031.7 6778911.4, 363017.7 6778911, 363004 6778910.1, 362987.5 6778909.1, 362974.6 6778907.8, 362961.3 6778907.8, 362950.9 6778907.9, 362940.1 6778908.8, 362929.2 6778909.9, 362916.7 6778912, 362906.4 6778915.5, 362894.2 6778918.6, 362882.9 6778920.4, 362875.5 6778920.9, 362863.2 6778920, 362851.9 6778919, 362840.5 6778917.5, 362830 6778914.9, 362818.5 6778911.6, 362808 6778906.4, 362798.5 6778901.9, 362784.5 6778894.7, 362779.3 6778892.8, 362770 6778892.6, 362759 6778894.5, 362748.6 6778898, 362737.5 6778902.6, 362730 6778908.8, 362722.9 6778912.5, 362714.8 6778914.9, 362707.1 6778916.3, 362695.2 6778917.1, 362686.4 6778917.6, 362677.6 6778915, 362669.2 6778910.9, 362662.4 6778908.1, 362654.4 6778903.2, 362631.6 6778885.3, 362624.4 6778876.7, 362611.1 6778864.3, 362603.8 6778858.5, 362595.3 6778854.5, 362582.7 6778848.4, 362599.3 6778796.6, 362701.8 6778500.9, 362770.6 6778355.5, 362781.5 6778263.8, 362781.2 6778251.6, 362781.2 6778235.4, 362780.4 6778227.9, 362778.8 6778215.5, 362776.5 6778200.8, 362774.3 6778187.3, 362772.6 6778173.8, 362771.7 6778162.7, 362770.2 6778149.8, 362769.7 6778136.8, 362769.6 6778119.6, 362769.4 6778101.9, 362769.2 6778090.9, 362768.4 6778085.5, 362765 6778077.5, 362757.7 6778024.1, 362755 6778000.7, 362751.9 6777971.3, 362747 6777933.9, 362743.9 6777906.2, 362740.7 6777881.9, 362735.4 6777834.3, 362733.1 6777815.1, 362732.1 6777802.4, 362730.8 6777789.1, 362729.8 6777777.7, 362728.6 6777765.9, 362724.6 6777734.9, 362721.4 6777709.8, 362718.2 6777682.8, 362713.3 6777643.1, 362706.4 6777589.1, 362699.5 6777535.4, 362693.1 6777480.1, 362685.5 6777420.4, 362680.1 6777378, 362676.7 6777354, 362673.8 6777327.7, 362673.3 6777319.5, 362670.5 6777280.7, 362668.2 6777249.1, 362664 6777209.2, 362659.4 6777160.5, 362656.9 6777129.5, 362653.8 6777095.2, 362650.9 6777067.9, 362648.5 6777059.2, 362645.2 6777051.1, 362644.3 6777049.8, 362648.8 6776907.4, 362624 6776765.8, 362621.8 6776764.9, 362620.1 6776761.8, 362617.8 6776739.8, 362616.5 6776725.8, 362614.8 6776708.7, 362611.9 6776689.6, 362606 6776660.4, 362602.6 6776642.6, 362591.1 6776568.1, 362575.2 6776458.3, 362584.7 6776403.3, 362619.3 6776358.1, 362672 6776287.8, 362873.1 6775978.2, 362879.7 6775936.6, 362889.3 6775869.6, 362902.4 6775780.1, 362903.2 6775746.4, 362886.4 6775743.6, 362856.6 6775740.7, 362821.1 6775736.6, 362712.2 6775728.5, 362708.1 6775591.8, 362648.2 6775516.2, 362615.1 6775512.4, 362603.2 6775513.1, 362593.1 6775502.4, 362580.6 6775503.7, 362567.5 6775501.8, 362552.4 6775493.7, 362523 6775495.6, 362515.3 6775491.8, 362512.9 6775498.2, 362512.9 6775516.8, 362513.5 6775525.3, 362513.7 6775532.6, 362513.3 6775538.3, 362508.9 6775542.7, 362502 6775546.9, 362493.9 6775549.1, 362485.7 6775550.3, 362478.8 6775551.3, 362466.3 6775554.1, 362453.9 6775556.8, 362440.8 6775559.3, 362429.7 6775560.8, 362422.5 6775560.9, 362416.3 6775560.8, 362410.8 6775559.7, 362398.9 6775555.6, 362392.8 6775552.9, 362377.9 6775542.8, 362362.1 6775530.4, 362327.1 6775559.4, 362339.8 6775572.1, 362272 6775663.8, 362196.4 6775728.6, 362192.2 6775742, 362170.3 6775763.9, 362151.9 6775778, 362111.7 6775790.7, 362077.8 6775796.3, 362017.7 6775773.1, 361993 6775746.3, 361981 6775737.1, 361967.6 6775727.9, 361960.5 6775711, 361963.8 6775668, 361965.9 6775653.5, 361969.4 6775644.7, 361971.5 6775636.4, 361973.2 6775630.3, 361973.6 6775623.5, 361973.8 6775616.3, 361968.3 6775587, 361953.1 6775563.2, 362013.9 6775489.1, 362038.3 6775470.4, 362043.2 6775463.5, 362048.8 6775460.8, 362054.6 6775459.7, 362062.7 6775455.7, 362072.8 6775448.4, 362083.1 6775440.5, 362093.9 6775432.3, 362105.5 6775420.4, 362110.3 6775413, 362117.7 6775398.1, 362121.5 6775392.4, 362127.2 6775386.7, 362132.7 6775382.4, 362134.2 6775376, 362135.1 6775368.6, 362135.7 6775360.1, 362136.4 6775350.2, 362138.5 6775339.8, 362142.1 6775332.8, 362147.9 6775324.8, 362154.6 6775320, 362163 6775314.5, 362172.7 6775309.8, 362185.4 6775303.1, 362196.4 6775297.7, 362202.1 6775294.9, 362205.1 6775289.5, 362208.5 6775282.7, 362212.6 6775276.1, 362217.4 6775269.1, 362223.8 6775262.1, 362230.8 6775258.9, 362238.8 6775256.5, 362245.9 6775255.1, 362252 6775254.3, 362258.1 6775253, 362263.8 6775251.4, 362267.9 6775247.6, 362268.5 6775241, 362268.3 6775233.9, 362266.3 6775205.2, 362266.7 6775198.5, 362269.2 6775194.1, 362272.7 6775189.9, 362272.8 6775182, 362270.8 6775171.4, 362269.6 6775164.9, 362270.3 6775161.5, 362269.2 6775152.5, 362267.5 6775140.6, 362265.1 6775129.5, 362263.1 6775112.2, 362260.4 6775100.8, 362251.6 6775087.2, 362245 6775072.5, 362242.3 6775062.9, 362234.5 6775040.5, 362225.6 6775020.6, 362215.9 6775004.2, 362207.4 6774995.7, 362204.3 6774988.7, 362183 6774942.6, 362182.7 6774902.6, 362182.8 6774902.1, 362180.7 6774876.7, 362175.6 6774863.6, 362168.2 6774847.7, 362162.9 6774838.4, 362156.5 6774819, 362153.3 6774807.5, 362155.5 6774798.4, 362150.3 6774798.1, 362146.4 6774797.8, 362134.1 6774795.6, 362110.9 6774773, 362097.6 6774751.5, 362091.3 6774728.5, 362079.9 6774667, 361886.1 6774685.2, 361870.2 6774570.4, 361830.2 6774565.7, 361807.3 6774510.5, 361804 6774502.5, 361801.9 6774497, 361800.1 6774491.1, 361796.6 6774479.2, 361795.2 6774473, 361792.8 6774465.5, 361790.1 6774458.6, 361786.9 6774452.5, 361783.3 6774444.7, 361779.1 6774437.4, 361775.2 6774430.8, 361772.1 6774425.1, 361767.2 6774419.1, 361763 6774410.6, 361759.1 6774405.1, 361755 6774397.9, 361752.2 6774392.3, 361750.8 6774387.3, 361750.2 6774382.2, 361750.2 6774372.3, 361750.7 6774357.7, 361752.1 6774344.1, 361751.5 6774336.5, 361747 6774313.9, 361742.5 6774293.6, 361738.7 6774272.2, 361735.3 6774248.8, 361732.3 6774224, 361726.4 6774188.2, 361718.8 6774151.2, 361714.4 6774134.8, 361707.2 6774119.1, 361706.9 6774118.3, 361698.4 6774095.3, 361681.2 6774030.5, 361679.9 6774021, 361680.2 6774017, 361660.2 6773947.6, 361629.1 6773807.9, 361598.6 6773743.2, 361578.1 6773678.4, 361587.3 6773583.4, 361567 6773543.6, 361561.6 6773498.7, 361540.6 6773378.9, 361447 6773395.2, 361395.7 6773414.3, 361351.4 6773430.8, 361322.5 6773399.4, 361318.9 6773402.2, 361315.3 6773405.1, 361311.8 6773408.1, 361308.5 6773411, 361303 6773415.5, 361293.7 6773423, 361285.2 6773429.6, 361276.4 6773436.8, 361261.6 6773425.9, 361247.1 6773415.1, 361238.8 6773408.9, 361233.3 6773413.4, 361227.4 6773418.3, 361215.6 6773427.8, 361203.8 6773437.3, 361192.6 6773446.7, 361181.8 6773455.7, 361169.8 6773465.3, 361161 6773472.1, 361154.2 6773476.8, 361143.2 6773484.2, 361140.6 6773485.9, 361136.8 6773487.1, 361123.8 6773496.7, 361120 6773498.6, 361115.6 6773500.6, 361110.9 6773503.5, 361106.5 6773506.1, 361098.1 6773510.1, 361088.1 6773514.7, 361071.8 6773521.9, 361051 6773530.7, 361031.7 6773538.7, 361012.2 6773546.7, 360993.4 6773554.7, 360974.4 6773562.7, 360961.8 6773567.7, 360942.1 6773576.5, 360919.1 6773586.6, 360899.6 6773572.6, 360892.3 6773579, 360885.9 6773583.9, 360879.5 6773587.8, 360872.7 6773590.9, 360841.7 6773601.2, 360798.7 6773617.1, 360747.4 6773637, 360732.1 6773643.6, 360712.1 6773653.8, 360705.4 6773656.4, 360686.4 6773660, 360620.6 6773668.5, 360603.6 6773672.7, 360596.5 6773655.3, 360585.3 6773630, 360329.1 6773723.4, 360314.6 6773723.6, 360295.6 6773724.6, 360285.2 6773726.1, 360272.7 6773727.6, 360088.5 6773751, 359984.2 6773701.2, 359954.3 6773671.2, 359943.4 6773660.2, 359942.6 6773658.9, 359931.4 6773641.4, 359921 6773625.2, 359907.3 6773598.1, 359901.2 6773589.2, 359897.7 6773584.2, 359892.9 6773580.4, 359889.5 6773574.4, 359888.2 6773569.1, 359887 6773563.5, 359884.4 6773558.8, 359879.2 6773553.4, 359875.8 6773547.6, 359872.9 6773542.3, 359871.1 6773536.3, 359870.7 6773530.7, 359869.1 6773527.2, 359867.3 6773523.5, 359865.8 6773518.2, 359863.2 6773513.4, 359858.7 6773508.2, 359855 6773503, 359850.6 6773497, 359850 6773490.6, 359850.7 6773483.9, 359852.6 6773477, 359852.8 6773472.2, 359850.6 6773466.2, 359847.3 6773461, 359842.2 6773457.6, 359837.6 6773452.3, 359835.1 6773443.8, 359830 6773431.8, 359827 6773420.5, 359823.6 6773415.6, 359819.2 6773412.3, 359787.7 6773401.8, 359754.7 6773352.4, 359755.5 6773347.9, 359756.1 6773343.3, 359757.4 6773330.5, 359758.6 6773317.3, 359759.9 6773307.3, 359760.8 6773298.5, 359760.9 6773295.4, 359760.5 6773292.2, 359780.8 6773248.4, 359750 6773153.7, 359740.8 6773076.6, 359739.3 6773063.9, 359733 6772909, 359618.1 6772905, 359616.5 6772710.1, 359595.4 6772575.4, 359561.7 6772486.8, 359544.3 6772440.9, 359483.3 6772311.5, 359481.9 6772136.6, 359439.9 6771931.8, 359439.3 6771927.9, 359438.6 6771924, 359436.6 6771915.2, 359435.2 6771910.2, 359433.4 6771904.9, 359429.7 6771895.4, 359428.5 6771892.5, 359425.7 6771886, 359422.2 6771878.2, 359421 6771875.5, 359416.9 6771868, 359412.8 6771860.8, 359406.6 6771859.7, 359244.5 6771833.8, 359209.4 6771819.1, 359183.9 6771818.3, 359179.9 6771812, 359174.7 6771807, 359170 6771804, 359156.5 6771797.5, 359133.8 6771786.7, 359100.2 6771770.5, 359067.2 6771754.5, 359055.9 6771748.2, 359027.7 6771734.5, 359013 6771727.3, 358998.6 6771720, 358987.3 6771713.7, 358976.3 6771707.6, 358973.2 6771706.3, 358970.6 6771705.4, 358968.8 6771705.1, 358965 6771704.9, 358961.5 6771704.9, 358958.9 6771705, 358955.9 6771705.3, 358952.2 6771705.8, 358949.2 6771706.6, 358945.8 6771707.4, 358942.3 6771708.1, 358940.1 6771708.5, 358937.5 6771708.9, 358933.7 6771709.2, 358929.9 6771709.5, 358928 6771709.5, 358926.4 6771709.5, 358923.3 6771708.9, 358920.4 6771708.4, 358918 6771707.8, 358915.7 6771707.2, 358913.9 6771706.6, 358910.7 6771705.2, 358901 6771701.1, 358892.4 6771697.2, 358884.7 6771694, 358881 6771692.6, 358874.9 6771690.6, 358866.5 6771687.9, 358856.6 6771685.7, 358698.4 6771653.4, 358538.4 6771629.7, 358403.5 6771635.8, 358393.3 6771615.9, 358402.2 6771475.9, 358392 6771456, 358271.9 6771427, 358132 6771433.1, 358077.2 6771453.6, 358052.4 6771473.8, 357972.9 6771524.4, 357973 6771534.4, 357973.8 6771639.3, 357954.1 6771674.4, 357929.2 6771684.6, 357894.4 6771709.9, 357890.1 6771789.9, 357880.6 6771854.9, 357810.7 6771855.5, 357765.6 6771835.9, 357715.6 6771836.3, 357655.9 6771871.7, 357609.3 6771891.7, 357608.4 6771890.2, 357603.6 6771884.3, 357594.3 6771875.6, 357559.4 6771843.1, 357548.5 6771833.4, 357539.7 6771826.1, 357531.2 6771815.8, 357525.3 6771807.7, 357523.4 6771804.8, 357507.9 6771780.6, 357485 6771740.9, 357473 6771707.5, 357464.5 6771683.4, 357453.7 6771674.5, 357438.3 6771666.4, 357428.1 6771660.8, 357404.4 6771668.9, 357376.1 6771697.3, 357351.9 6771699.9, 357328.4 6771693.8, 357314.3 6771679.2, 357292.2 6771655.1, 357279.9 6771680.9, 357239.6 6771680.3, 357212 6771687.8, 357194 6771676.2, 357179 6771652.1, 357156.4 6771653.9, 357144.3 6771631.1, 357144.1 6771606.1, 357158.9 6771581, 357142.2 6771559, 357119.5 6771566.4, 357098.1 6771526.6, 357035.7 6771556.6, 356989.2 6771562.1, 356863.8 6771530.3, 356863 6771572.7, 356852.9 6771574.7, 356830.2 6771579.3, 356794.4 6771593.6, 356754 6771608, 356710.4 6771625.5, 356691.8 6771635.1, 356671.6 6771657, 356660.7 6771660.3, 356640.4 6771663.6, 356617 6771660.7, 356601.4 6771662.3, 356587.4 6771671.8, 356571.8 6771673.5, 356554.6 6771672.1, 356535.8 6771667.5, 356515.5 6771659.9, 356496.7 6771652.3, 356471.7 6771649.4, 356448.2 6771648, 356429.5 6771640.3, 356351.6 6771847.4, 356312.2 6771912.7, 356304.2 6771935.4, 356234.1 6772138.2, 356264.1 6772147.9, 356288.5 6772142.3, 356309 6772137.6, 356333.8 6772140.9, 356344 6772142.3, 356367.1 6772152, 356379.1 6772157, 356399.2 6772171.8, 356419.4 6772186.6, 356439.5 6772201.5, 356458.1 6772215.2, 356459.6 6772216.3, 356492.6 6772240.6, 356506 6772248.3, 356524 6772255.4, 356547.6 6772270.8, 356571.1 6772280, 356583.7 6772297.1, 356591.8 6772323.5, 356595 6772337.6, 356598.2 6772348.5, 356604.7 6772373.4, 356609.5 6772392.1, 356606 6772402.8, 356587.2 6772434.8, 356583.3 6772459.4, 356579.4 6772484.1, 356576.8 6772500.1, 356569.1 6772523.9, 356561.4 6772547.6, 356557.3 6772560.2, 356557.5 6772585.2, 356557.7 6772610.2, 356567.2 6772633.3, 356576.7 6772656.4, 356578.1 6772660, 356572.2 6772684.3, 356569.1 6772697.2, 356568.5 6772700.1, 356584.2 6772719.4, 356588.6 6772724.9, 356611.1 6772735.9, 356628.8 6772744.5, 356646.6 6772762.1, 356664.4 6772779.6, 356674.1 6772789.1, 356697.4 6772798.2, 356720.6 6772807.3, 356724.2 6772808.7, 356739.4 6772828.6, 356742.7 6772853.3, 356744.7 6772868.5, 356748.6 6772938.2, 356767.2 6773277.8, 356763.1 6773282.9, 356757.8 6773297.4, 356754.2 6773314.6, 356750.9 6773331.5, 356747.3 6773349.8, 356744.9 6773365.2, 356744 6773384.2, 356743.6 6773401.7, 356742.1 6773420.3, 356741.4 6773432.2, 356740.9 6773444.1, 356739.3 6773452, 356735.4 6773459, 356730.8 6773461.7, 356722.2 6773464, 356715.3 6773466.3, 356709.6 6773468.4, 356702.9 6773476.2, 356642.8 6773500.8, 356621.2 6773501, 356575.3 6773510.3, 356540.8 6773519.5, 356509.6 6773531.1, 356486.3 6773541.5, 356468.6 6773556.3, 356452.6 6773577.2, 356442.1 6773604.4, 356434.4 6773625.1, 356420.8 6773636.7, 356405.2 6773645.1, 356389.4 6773649.9, 356361.5 6773655.2, 356333.5 6773653.4, 356317.5 6773650.8, 356292.5 6773643, 356264.9 6773629.5, 356231.9 6773614.5, 356206.6 6773605.2, 356191.7 6773601.4, 356171 6773599.6, 356151.3 6773599.3, 356133.8 6773602, 356119.5 6773606.2, 356104.9 6773613.6, 356092.9 6773625.1, 356075.6 6773646.3, 356072.6 6773650.5, 356067.6 6773657.3, 356021.9 6773683.9, 356003.8 6773687.2, 355986.9 6773689.1, 355941.8 6773664.5, 355871.8 6773665.1, 355775.8 6773702.3, 355776.3 6773719.4, 355778.3 6773748, 355779.6 6773778.3, 355756.6 6773816.1, 355765.2 6773840.2, 355763.8 6773841.8, 355756.1 6773857.4, 355739 6773866.9, 355729.7 6773877.9, 355708 6773889.1, 355695.5 6773893.8, 355689.3 6773901.7, 355662.9 6773909.7, 355658.3 6773920.7, 355653.6 6773928.5, 355644.3 6773931.7, 355636.5 6773930.2, 355631.8 6773938.1, 355621 6773946, 355605.4 6773953.9, 355592.9 6773958.7, 355579 6773966.6, 355569.7 6773974.5, 355554.1 6773977.8, 355544.8 6773991.8, 355523 6773993.6, 355516.7 6773989, 355505.7 6773987.5, 355501.2 6774001.6, 355484.1 6774004.8, 355476.2 6773998.7, 355477.7 6773989.3, 355476.1 6773979.9, 355469.8 6773978.5, 355458.9 6773975.4, 355447.8 6773967.7, 355435.3 6773961.6, 355424.3 6773958.5, 355418.1 6773969.5, 355401.1 6773971.1, 355385.3 6773963.5, 355377.4 6773952.6, 355371.1 6773938.6, 355371 6773919.9, 355378.6 6773899.6, 355367.5 6773893.4, 355345.7 6773892, 355334.7 6773879.6, 355322.1 6773875, 355306.5 6773875.2, 355295.5 6773861.2, 355284.5 6773859.7, 355273.7 6773872.2, 355261.2 6773866.1, 355247 6773855.4, 355237.7 6773850.8, 355225.2 6773855.6, 355212.8 6773858.8, 355200.2 6773854.2, 355198.5 6773840.1, 355193.7 6773830.8, 355187.5 6773827.7, 355171.8 6773823.1, 355162.4 6773809.2, 355160.7 6773796.7, 355152.8 6773789, 355135.6 6773784.4, 355118.3 6773775.2, 355096.4 6773769.2, 355079.1 6773759.9, 355069.8 6773750.6, 355058.7 6773738.2, 355041.4 6773727.4, 355024.3 6773730.7, 355010.3 6773738.6, 354993.1 6773738.7, 354979.1 6773746.6, 354963.5 6773749.9, 354955.7 6773739, 354950.9 6773726.6, 354940 6773726.7, 354933.8 6773737.6, 354916.6 6773742.5, 354904.1 6773741.1, 354902.5 6773731.7, 354907.1 6773717.5, 354913.2 6773706.6, 354911.3 6773692.5, 354896.5 6773683.6, 354885.2 6773678, 354859.5 6773665, 354833.4 6773652, 354795.7 6773633.4, 354782.2 6773622.9, 354774.9 6773616, 354770.4 6773610.4, 354750.3 6773585.6, 354728.1 6773559.8, 354714.6 6773543.2, 354714.6 6773536.6, 354718.3 6773521, 354722.3 6773503.4, 354726.5 6773480, 354726.8 6773462.9, 354726 6773438, 354726 6773427.3, 354724.4 6773419.9, 354721.7 6773417.6, 354716 6773413.2, 354707.7 6773410.5, 354698.4 6773402.2, 354690 6773392.7, 354682.1 6773381.9, 354676.1 6773367.8, 354672.7 6773355.6, 354667.6 6773340.8, 354661.6 6773320.5, 354657.3 6773300.9, 354652.1 6773284.8, 354645.7 6773274.3, 354639.7 6773266.3, 354635.5 6773259, 354633.6 6773250.2, 354632.2 6773240.3, 354628.8 6773230, 354621.7 6773220.9, 354616.7 6773218.2, 354615.4 6773217.8, 354607.7 6773215.9, 354599.7 6773209.9, 354582.2 6773194.7, 354560.5 6773173.9, 354536.6 6773151.2, 354515.1 6773128.6, 354498.3 6773110.6, 354493.3 6773097, 354492.4 6773084.2, 354493.7 6773078.3, 354495.1 6773071.8, 354504.1 6773058.9, 354514 6773029.9, 354515.7 6773021, 354520.2 6773010.1, 354527.3 6772990.9, 354536.1 6772969.2, 354549.4 6772944.7, 354560.8 6772924.2, 354572.4 6772902.6, 354583.2 6772883.2, 354594.1 6772872.5, 354613.3 6772857.2, 354626.5 6772846.1, 354637.2 6772830.9, 354653.6 6772806.9, 354775.1 6772754.7, 354858.5 6772569.1, 354907.9 6772498.8, 354897.7 6772468.9, 354899.6 6772398.1, 354967 6772388.4, 355007.1 6772403, 355027.1 6772402.9, 355056.5 6772332.7, 355065.7 6772242.7, 355080.2 6772182.6, 355125.3 6772096.2, 355089.4 6772077.6, 355009.2 6772053.3, 354899.2 6772039.2, 354895.2 6772038.2, 354865.5 6772028.3, 354783.9 6772000.1, 354779 6772005.2, 354775.3 6772012.8, 354764.2 6772035.3, 354724.3 6772035.6, 354659.2 6772026.1, 354548.7 6771947.1, 354536 6771916.5, 354530.1 6771916.9, 354523.3 6771916.2, 354517.2 6771916.1, 354512.7 6771915.8, 354472.6 6771912.9, 354460.3 6771912.2, 354444.4 6771912.4, 354325.3 6771889.7, 354243.4 6771889.6, 354238 6771834.7, 354166.2 6771821.8, 354165.9 6771820, 354165.3 6771817.8, 354164.3 6771816, 354162.3 6771813.5, 354145.4 6771795.3, 354134.5 6771783.7, 354117.7 6771765.4, 354109.8 6771756.1, 354101.8 6771742.9, 354092.3 6771726.5, 354085.2 6771716.2, 354078.9 6771708.6, 354069.2 6771698.9, 354060.4 6771692.1, 354051.9 6771686.6, 354042.6 6771682.1, 354031 6771677.6, 354017.2 6771672.6, 354005 6771667.7, 353996.6 6771664.1, 353988.5 6771659.1, 353980.4 6771654.7, 353968.1 6771648, 353959.2 6771644, 353943.4 6771638.1, 353927.7 6771632.1, 353904.9 6771624.3, 353888.8 6771619.7, 353876.5 6771615.3, 353868.2 6771612.9, 353710.5 6771423.7, 353709.2 6771426.8, 353707.2 6771432.8, 353702.8 6771449.7, 353699.5 6771465.3, 353697.5 6771478, 353694.4 6771498.7, 353692.2 6771514.6, 353688.4 6771535.8, 353684.1 6771555.3, 353680.3 6771571.9, 353673.3 6771591.8, 353664.6 6771613.2, 353660.6 6771625.3, 353638.5 6771684.1, 353622.9 6771728.5, 353615.8 6771749.1, 353613 6771757.4, 353609.6 6771765.4, 353606.4 6771771.9, 353602.2 6771779.9, 353597.2 6771790.1, 353592.1 6771800.5, 353588.8 6771807.1, 353583.6 6771817.8, 353579.1 6771826.5, 353574.9 6771835.1, 353568.4 6771848.2, 353565.5 6771854.5, 353562.1 6771862.4, 353557.3 6771874.9, 353554 6771883.1, 353551.1 6771891.1, 353547.1 6771902.4, 353543.1 6771914.4, 353537.4 6771930.9, 353535.4 6771936.5, 353529.5 6771951.7, 353523.2 6771967.9, 353517.8 6771982.1, 353512.4 6771995.9, 353507 6772009.6, 353500 6772026.8, 353492.4 6772045.7, 353486.2 6772060.7, 353478.4 6772079.3, 353470.4 6772098, 353463.6 6772114.6, 353460.2 6772123.2, 353456.3 6772133.7, 353452.4 6772144.9, 353447.7 6772157.2, 353442.9 6772169.7, 353437.9 6772183.8, 353433 6772197.1, 353429.5 6772205.5, 353422.4 6772222.4, 353415 6772239.5, 353408 6772255.9, 353401 6772272.9, 353396.6 6772284.6, 353393.3 6772294.4, 353389.6 6772306.6, 353386 6772319.7, 353383.7 6772329.7, 353376.4 6772330.1, 353364.5 6772330.6, 353360.4 6772330.8, 353349.4 6772331.1, 353342.1 6772331.1, 353339.4 6772330.7, 353334.4 6772329.4, 353330.7 6772327.9, 353325.4 6772325.1, 353283.6 6772447.1, 353264 6772492.2, 353248.4 6772538.8, 353249.3 6772549.3, 353252.1 6772559.8, 353257 6772575.5, 353262.2 6772591.2, 353264.3 6772597.5, 353266.1 6772603.8, 353268 6772611.4, 353269.5 6772619.1, 353271.2 6772635, 353271 6772651.1, 353270.3 6772665.4, 353269.7 6772678.4, 353269.4 6772686.7, 353270 6772691, 353271.8 6772696.6, 353272.4 6772699.5, 353261.6 6772807, 353246.4 6772935.5, 353178.7 6773052.5, 353129.2 6773112.9, 353054.8 6773178.5, 352965.2 6773229.2, 352952.4 6773242.2, 352940.5 6773254.4, 352891.4 6773364.7, 352817.5 6773495.2, 352738.3 6773585.8, 352710.5 6773641.2, 352668.3 6773633.7, 352608.7 6773621.8, 352548.6 6773602.3, 352483.3 6773562.9, 352403.9 6773573.4, 352330.3 6773546.7, 352313.5 6773521.4, 352300.5 6773558, 352293.2 6773578.7, 352287.9 6773591, 352284.4 6773598, 352279.2 6773607, 352271.7 6773615.5, 352253.8 6773631.7, 352231 6773652.5, 352206.5 6773675.2, 352184.6 6773696.1, 352166.1 6773714.6, 352149.3 6773732.4, 352126.3 6773759.9, 352093.5 6773804.8, 352080.6 6773822.2, 352074.8 6773829, 352067.1 6773835.2, 352049.9 6773847.6, 352039.6 6773847.9, 352025.8 6773826.4, 351984 6773773.5, 351908.6 6773716.4, 351754.3 6773618.8, 351588.4 6773495.2, 351582.5 6773390.4, 351577.4 6773362, 351574.8 6773347.5, 351574.7 6773343.8, 351574.6 6773339.2, 351574.6 6773336.6, 351574.4 6773332.9, 351574.3 6773327.1, 351574 6773322.1, 351573.4 6773316.5, 351572.7 6773307.6, 351572.4 6773301.8, 351571.6 6773291.9, 351571.4 6773280.2, 351569.3 6773259.1, 351566.3 6773242.1, 351564.7 6773232.7, 351563.1 6773225, 351562.5 6773220.5, 351561.8 6773215.1, 351561.1 6773210.3, 351559.8 6773205.6, 351558.3 6773200.9, 351556.6 6773196.4, 351554.4 6773193, 351553.3 6773189.6, 351552.9 6773185.7, 351552.6 6773182.3, 351552.2 6773177.7, 351552.1 6773173.8, 351552.3 6773169.4, 351552.6 6773163.4, 351552.5 6773157.5, 351552.4 6773153.6, 351551.4 6773149.4, 351550.2 6773143, 351549.5 6773134.6, 351546.2 6773103.7, 351539.2 6773052.3, 351537.6 6773043.2, 351535.9 6773037.1, 351534.1 6773027.7, 351531.7 6773020.8, 351526.1 6773008.3, 351521.2 6772994.4, 351516.7 6772982.6, 351467 6772852.1, 351463.9 6772835.6, 351463.3 6772831.2, 351462.2 6772825.5, 351460.5 6772820.1, 351458.3 6772815.9, 351454.4 6772811.9, 351450.1 6772808, 351446.3 6772804.9, 351442.7 6772802.2, 351439.3 6772797.7, 351435 6772789.2, 351429.8 6772777, 351424.7 6772767.7, 351421.3 6772759.5, 351415.4 6772746.7, 351409.4 6772731.8, 351406.3 6772727.5, 351340.4 6772507.9, 351313.4 6772253.3, 351292.9 6772193.6, 351272.7 6772163.7, 351137 6772069.9, 351111.4 6771980.7, 351141.1 6771955, 351210.4 6771879.4, 351250.1 6771849.1, 351424.3 6771757.8, 351499.1 6771742.2, 351528.8 6771712, 351533.5 6771676.9, 351523.1 6771627.1, 351437.3 6771517.8, 351432 6771487.9, 351461.7 6771447.7, 351546.1 6771387, 351729.7 6771225.6, 351790.7 6771152.5, 351794 6771148.4, 351796.8 6771144.7, 351774 6771140.3, 351718.8 6771115.8, 351693.6 6771091, 351673.3 6771051.2, 351672.2 6771038.2, 351668.2 6770986.6, 351666.2 6770977, 351657.4 6770951.5, 351653.6 6770941.2, 351649.6 6770929.9, 351621.7 6770851.8, 351596.3 6770797, 351554.8 6770746.3, 351548.2 6770739.9, 351546.1 6770737.8, 351530.7 6770722.6, 351515.5 6770692.8, 351504.6 6770644, 351503.3 6770638.8, 351499.9 6770622.9, 351485.3 6770602.8, 351483.6 6770600.6, 351474.6 6770588.2, 351464.6 6770583.3, 351461.6 6770558.5, 351458.7 6770533.6, 351456.9 6770519.4, 351455.8 6770510.1, 351455.7 6770508.9, 351453.6 6770492.8, 351448.8 6770469, 351448.7 6770468.5, 351428.3 6770454.1, 351413.5 6770443.8, 351413.3 6770418.8, 351413.2 6770408.8, 351417.1 6770384.1, 351418 6770378.8, 351402.2 6770359.4, 351397.8 6770354, 351406.6 6770330.6, 351415.4 6770307.2, 351422.2 6770288.8, 351423.9 6770263.9, 351425.6 6770239, 351426.7 6770223.8, 351426.5 6770198.8, 351426.3 6770173.9, 351426.1 6770148.9, 351426 6770143.9, 351408.2 6770126.3, 351405.3 6770123.5, 351400.9 6770119.1, 351395.8 6770109.1, 351389.5 6770084.9, 351385.5 6770069.3, 351367.3 6770031.5, 351362.9 6770022.4, 351353 6770001.7, 351344.8 6769984.7, 351340.2 6769971.2, 351336.7 6769961, 351334.6 6769954.8, 351334.4 6769929.8, 351334.1 6769904.8, 351333.9 6769879.8, 351333.8 6769863.7, 351333.7 6769854.8, 351333.5 6769829.9, 351327.2 6769805.6, 351323.2 6769790, 351315.5 6769787.6, 351223.6 6769759.7, 351212.5 6769756.3, 351162.9 6769741.3, 351125.8 6769732.7, 351120.4 6769731.5, 351114.4 6769730.1, 351079.6 6769731.3, 351017.8 6769755.4, 350926.7 6769775.7, 350873.7 6769808.6, 350799.7 6769820.9, 350778.9 6769824.4, 350755.4 6769832.7, 350731.7 6769841.1, 350708.2 6769849.4, 350684.6 6769857.6, 350661.1 6769865.9, 350637.5 6769874.3, 350619.4 6769880.7, 350596.1 6769889.6, 350572.8 6769898.6, 350549.5 6769907.5, 350526.2 6769916.5, 350502.9 6769925.5, 350499.9 6769926.6, 350482.4 6769944.4, 350436.7 6769989.8, 350421.4 6769992.5, 350409.1 6769995.4, 350401.9 6769996.5, 350395.8 6769997, 350391.9 6769996.9, 350388.6 6769995.7, 350383.9 6769994, 350378.6 6769993.8, 350373.5 6769993.9, 350366.4 6769992.6, 350358.5 6769991.7, 350353.1 6769990.4, 350350.5 6769986.2, 350349.6 6769979.5, 350347.6 6769974.1, 350343.7 6769973.5, 350340.3 6769976.9, 350335.5 6769984.9, 350332.3 6769987.3, 350327.8 6769988.9, 350323.7 6769992.7, 350319.7 6769993.5, 350314.9 6769993, 350308.8 6769995.1, 350304.1 6769997.7, 350298.9 6769996.9, 350293.5 6769992, 350287.8 6769991.2, 350282.6 6769992.4, 350277 6769991.2, 350270.3 6769990.6, 350263.6 6769992.7, 350256.7 6769994.7, 350251.9 6769994.8, 350247 6769992.3, 350241.2 6769991.3, 350236 6769992.7, 350230.5 6769991.6, 350226.7 6769991.2, 350222.1 6769993.2, 350217.7 6769993.5, 350213.5 6769992.1, 350208.7 6769993.6, 350199.6 6769990.4, 350190.4 6769993.2, 350178.4 6769991.7, 350152.7 6769988, 350145.3 6769988.1, 350138.6 6769989.2, 350135.1 6769991.7, 350129.8 6769992.6, 350124.8 6769991.3, 350123.1 6769987.9, 350118.7 6769984.2, 350111.1 6769983.5, 350110.5 6769979.2, 350111.4 6769974.2, 350109 6769970.6, 350103.6 6769970, 350096.8 6769971.7, 350091.9 6769974, 350087.5 6769975.2, 350081.4 6769973.7, 350073.8 6769972, 350070 6769967.8, 350066.4 6769961, 350064.1 6769955.9, 350060.4 6769952.1, 350054.9 6769949.7, 350043.3 6769949.5, 350029.6 6769950.4, 350011.8 6769951.4, 349995.3 6769952.1, 349969.5 6769951.8, 349946.6 6769930, 349885.2 6769916.6, 349850.3 6769916.9, 349795.3 6769922.4, 349725.4 6769922.9, 349534.6 6769918.3, 349430.6 6769920.3, 349380.6 6769920.8, 349300.3 6769876.4, 349250.3 6769866.9, 349225.3 6769867.1, 349200.3 6769867.3, 349175.3 6769867.5, 349150.3 6769867.7, 349135.3 6769867.8, 349111.5 6769875.2, 349087.6 6769882.6, 349063.8 6769890, 349039.9 6769897.3, 349035.7 6769898.6, 349011.1 6769903.4, 348986.7 6769908.2, 348962.1 6769913, 348937.6 6769917.8, 348913 6769922.6, 348888.6 6769927.4, 348876 6769929.9, 348851.1 6769930.1, 348828.1 6769937.1, 348807.9 6769941.9, 348792.2 6769940.5, 348776.5 6769925, 348755.9 6769905.9, 348716.4 6769912.3, 348697.2 6769917.1, 348686.1 6769922.8, 348671.3 6769933.3, 348665.9 6769937.2, 348653.1 6769947.4, 348633.3 6769954.2, 348621.1 6769954.3, 348603.4 6769956.7, 348581.3 6769956.9, 348551.5 6769956, 348534.9 6769953.9, 348511.5 6769949.6, 348492.8 6769950.9, 348472.9 6769952.2, 348456.4 6769959, 348442.1 6769969.1, 348428.8 6769975.8, 348417.8 6769980.3, 348402.3 6769982.6, 348386.8 6769980.5, 348375.8 6769985, 348364.7 6769985.1, 348356.9 6769985.2, 348349.2 6769985.2, 348342.7 6769990.9, 348340.6 6770010.8, 348339.6 6770021.9, 348334.1 6770025.2, 348311.9 6770013.2, 348290.7 6769997.9, 348272.9 6769984.8, 348251.8 6769970.7, 348237.3 6769957.5, 348225 6769946.5, 348212.7 6769934.4, 348201.6 6769920.1, 348190.4 6769908.1, 348178.2 6769901.5, 348163.8 6769897.2, 348149.5 6769899.5, 348129.5 6769900.8, 348108.5 6769901, 348096.3 6769898.9, 348088.6 6769896.7, 348080.3 6769893.3, 348069.8 6769889.1, 348043.2 6769889.3, 348026.6 6769890.5, 348016.6 6769891.7, 348012.2 6769886.3, 348009.6 6769862.1, 347960.2 6769844.4, 347956.8 6769845.3, 347952.6 6769846, 347948.5 6769847.4, 347944.6 6769849.3, 347941.1 6769851.9, 347937.3 6769855.8, 347933.1 6769857.6, 347929.5 6769858, 347926.3 6769856.5, 347923.7 6769854, 347921.9 6769851.7, 347919 6769850.2, 347916 6769848.7, 347914.4 6769846.7, 347912.3 6769844.6, 347909.8 6769844.1, 347906.5 6769844.4, 347902.5 6769845.4, 347897.1 6769846.5, 347892 6769847.3, 347886.5 6769847.9, 347883.1 6769848.3, 347881.7 6769848.4, 347876.5 6769848.2, 347871.8 6769847.6, 347868.8 6769848.7, 347866.5 6769851.4, 347863.6 6769854, 347860.5 6769855.5, 347856.3 6769856.6, 347852.8 6769856, 347849.9 6769854.5, 347846.6 6769853.7, 347843.4 6769853.9, 347836.1 6769856.6, 347794.1 6769874.1, 347775.5 6769896.1, 347760 6769907.1, 347735.2 6769924.5, 347710.3 6769943.5, 347694.9 6769960.8, 347679.3 6769976.5, 347665.5 6770000, 347665.7 6770023.5, 347672.1 6770046.8, 347672.7 6770050.5, 347677 6770071.8, 347694.4 6770090.4, 347700.8 6770104.4, 347710.2 6770121.5, 347718.1 6770140.2, 347729.3 6770160.4, 347737.2 6770177.5, 347743.5 6770186.8, 347756.1 6770193, 347770.2 6770202.2, 347782.8 6770213, 347782.9 6770223.9, 347781.4 6770236.4, 347778.7 6770248.9, 347764 6770271.4, 347742.8 6770282, 347688.8 6770302.7, 347665 6770309.3, 347658.5 6770304.5, 347647.6 6770295.2, 347628.8 6770296.9, 347621 6770293.9, 347610 6770284.6, 347605.2 6770276.8, 347581.9 6770277, 347555.3 6770281.9, 347535.1 6770288.3, 347513.3 6770304.2, 347501 6770319.9, 347487 6770340.3, 347471.7 6770365.4, 347460.9 6770385.7, 347448.6 6770406.1, 347439.3 6770420.3, 347427 6770434.4, 347414.6 6770445.5, 347406.8 6770453.3, 347392.8 6770462.8, 347357 6770469.3, 347321.1 6770472.7, 347305.5 6770472.8, 347286.8 6770473, 347261.8 6770470.1, 347241.5 6770467.2, 347221.2 6770467.3, 347197.7 6770473.7, 347174.1 6770487.4, 347160.4 6770494.4, 347140.2 6770497.7, 347121.5 6770504, 347104.4 6770508.9, 347088.8 6770524.6, 347076.4 6770538.8, 347065.9 6770545.9, 347048.5 6770557.8, 347026.7 6770570.5, 346994.1 6770589.4, 346972.4 6770599, 346950.6 6770610, 346935.1 6770622.7, 346921.1 6770635.3, 346913.5 6770649.4, 346905.8 6770660.4, 346896.5 6770671.5, 346888.7 6770677.7, 346870 6770689, 346862.9 6770689.6, 346856.8 6770690.1, 346852 6770689.8, 346847.4 6770689.5, 346839.9 6770687.7, 346836.8 6770685.6, 346834.8 6770683.2, 346833.2 6770679.6, 346831.6 6770675.1, 346830 6770669.9, 346828.1 6770665.8, 346827.4 6770664.6, 346825.4 6770660.4, 346822.4 6770656.9, 346819.7 6770654.2, 346816.7 6770653, 346812.3 6770652.3, 346808.1 6770652.5, 346804.1 6770653.1, 346800.3 6770654.7, 346797.8 6770655.9, 346794.8 6770656.8, 346789.8 6770657.6, 346783.8 6770658.8, 346778.6 6770660.2, 346774.9 6770662, 346771.3 6770663.8, 346768.2 6770666, 346764.8 6770669, 346761.6 6770673.8, 346757.7 6770677.6, 346754 6770680.9, 346748.2 6770686.1, 346741.3 6770686.4, 346703.7 6770678.3, 346688.6 6770677.2, 346670.4 6770673.2, 346623.6 6770662.8, 346593.8 6770683, 346574 6770713.2, 346544.5 6770773.4, 346465.3 6770858.9, 346430.8 6770914.2, 346396.6 6771019.4, 346385 6771041.6, 346373.5 6771063.7, 346361.9 6771085.8, 346357.3 6771094.7, 346341.9 6771114.3, 346326.4 6771134, 346311 6771153.6, 346297.9 6771170.1, 346279.7 6771187.1, 346261.4 6771204.2, 346243.1 6771221.2, 346238.4 6771225.5, 346227.4 6771248, 346218.8 6771265.7, 346212.4 6771289.8, 346206.1 6771314, 346187.9 6771339.7, 346169.6 6771361, 346109.9 6771396.5, 346094.5 6771416.1, 346079.1 6771435.8, 346070.4 6771446.8, 346044.8 6771500.4, 346033.9 6771507.9, 346024.9 6771510.8, 346019.5 6771512.2, 346014.5 6771513.7, 346012.7 6771514.1, 345991.9 6771524.3, 345981.5 6771520.8, 345968.9 6771517.4, 345955.8 6771511.1, 345942.3 6771502.1, 345930.4 6771492.6, 345914.2 6771482, 345908.5 6771479.6, 345885 6771473.3, 345879 6771468.5, 345863.2 6771456.3, 345836.7 6771456.5, 345817.9 6771458.1, 345789.9 6771466.1, 345765.8 6771474.2, 345750.6 6771489.8, 345713.7 6771528, 345703.2 6771538.9, 345701.1 6771547.7, 345699.3 6771554.5, 345698.7 6771561.5, 345700.3 6771566.4, 345702.9 6771571.6, 345705.5 6771576.6, 345706.4 6771581.2, 345706 6771585.9, 345704.9 6771591.2, 345703.6 6771597.7, 345702.8 6771608.4, 345703 6771614.3, 345704.3 6771627.7, 345704.4 6771635, 345703.5 6771642, 345701.3 6771648.6, 345698.5 6771657.5, 345696.1 6771663, 345693.2 6771666.7, 345689.4 6771668.8, 345685.1 6771669.8, 345680.8 6771669.6, 345676.3 6771668.7, 345670.4 6771667.7, 345662.5 6771667.2, 345636.1 6771665.9, 345640.9 6771688.5, 345650.1 6771720.1, 345661.3 6771754.9, 345670.4 6771785.6, 345680.2 6771813, 345701.4 6771870.1, 345707.6 6771886.8, 345718.6 6771912.7, 345731.8 6771942.2, 345745.5 6771967.5, 345761.8 6771994.6, 345770.2 6772007.6, 345775.5 6772016.1, 345791.9 6772042.4, 345811.5 6772067.7, 345828.8 6772091.9, 345843.4 6772111.6, 345858.9 6772135.1, 345870.4 6772155.6, 345879.6 6772176.2, 345890.3 6772205.4, 345895.6 6772223.6, 345904.4 6772259.1, 345911.3 6772288.8, 345916.1 6772317.8, 345919.2 6772345.5, 345921.2 6772371.3, 345920.5 6772399.1, 345918.9 6772428.1, 345915.6 6772458.8, 345912.3 6772488, 345910 6772523.7, 345909.6 6772554.1, 345910.3 6772583.9, 345911.5 6772610.2, 345915 6772637.7, 345918.4 6772663.3, 345920.8 6772685.4, 345922.4 6772710.4, 345922.3 6772738.3, 345920.7 6772766.7, 345916.4 6772795.9, 345912.6 6772823.7, 345911.3 6772850, 345912.4 6772874.8, 345919.8 6772896.9, 345929.9 6772915.5, 345941.4 6772932.5, 345955.8 6772950.7, 345970.6 6772969.1, 345990.1 6772991.4, 346010 6773014.9, 346026.9 6773037.6, 346041.9 6773059.4, 346055.4 6773081.1, 346068.8 6773104.9, 346079.4 6773128, 346089.6 6773154.2, 346097.6 6773179.5, 346104.7 6773203.8, 346112.6 6773223.8, 346123 6773247.8, 346130.6 6773269.8, 346136.5 6773293.8, 346141 6773316.7, 346144.1 6773341.2, 346144.1 6773365.7, 346139.7 6773389.1, 346132.8 6773411.6, 346123.1 6773437.1, 346114 6773456.1, 346106.8 6773474, 346094.6 6773495.5, 346079.9 6773518.8, 346052.7 6773554.7, 346038.8 6773576.6, 346026.3 6773600.1, 345995.1 6773652.8, 345972.2 6773693.8, 345962.9 6773712.7, 345954.1 6773731.5, 345945.3 6773751.8, 345936.3 6773774, 345931.6 6773787, 345914.7 6773829.3, 345907.7 6773856.6, 345902.6 6773879.9, 345899.5 6773899.6, 345896.5 6773920.2, 345892.9 6773936.6, 345889.7 6773953.8, 345886.8 6773971.5, 345885.5 6773991.6, 345886.4 6774013.2, 345888.9 6774033.4, 345892.5 6774048.8, 345893.5 6774092.9, 345889.7 6774121.2, 345886.4 6774143.6, 345883.4 6774164.1, 345882.8 6774168.3, 345879.7 6774190, 345875.9 6774212.9, 345871.8 6774236, 345868.1 6774254.6, 345863.7 6774271.8, 345859.6 6774287.4, 345855.5 6774302.4, 345850.9 6774317.6, 345845.1 6774333.5, 345839.1 6774348.3, 345832.3 6774363.3, 345824.8 6774376.7, 345818.2 6774390.8, 345811.7 6774404.8, 345807.2 6774418.6, 345804 6774431.6, 345801.8 6774444.7, 345800.8 6774458.5, 345801.7 6774471.9, 345803.6 6774488.2, 345805.9 6774506.3, 345807.4 6774522.7, 345808.2 6774538.5, 345807.8 6774553.6, 345806 6774568.4, 345804 6774579.9, 345801 6774593, 345797.8 6774606.1, 345791.6 6774624.4, 345790.5 6774627.6, 345783.4 6774644, 345777.6 6774656, 345770.7 6774667.2, 345761.6 6774681.4, 345751.4 6774696.1, 345676.6 6774800.5, 345665.4 6774815.7, 345657.1 6774827.1, 345649.4 6774839.3, 345643 6774851.6, 345635.9 6774866.1, 345630.4 6774879.5, 345624.6 6774895.2, 345620.7 6774909.1, 345617.1 6774923.6, 345613.8 6774939.1, 345610.5 6774956.6, 345607.2 6774970.7, 345602.2 6774986.8, 345596.6 6775000.3, 345589.1 6775015.3, 345584.1 6775025.7, 345571 6775050.2, 345564.7 6775065.1, 345559.2 6775081.5, 345551.7 6775101.3, 345543.5 6775122.9, 345535.1 6775144, 345515.1 6775192.6, 345509 6775207.7, 345502.8 6775225, 345496.7 6775241.7, 345484.4 6775280.7, 345477.7 6775301.1, 345470.3 6775319.1, 345421.5 6775423.5, 345408.3 6775453.7, 345402.6 6775472.4, 345396.4 6775492.6, 345389.9 6775511.2, 345382.6 6775530.4, 345374.5 6775546.9, 345367.1 6775561.4, 345353.5 6775590.3, 345343.2 6775606.2, 345322.2 6775645.2, 345311.9 6775666.6, 345304.6 6775684.4, 345302.6 6775690.8, 345293.3 6775714.3, 345286.8 6775730.7, 345282.2 6775743.8, 345278 6775757.8, 345273.4 6775771.5, 345269.1 6775787.5, 345265.4 6775802.6, 345262.3 6775817.7, 345259.9 6775833.2, 345256.9 6775849, 345255.4 6775861.7, 345254.2 6775875, 345252.2 6775903, 345252.1 6775918.9, 345251.7 6775931.5, 345251.8 6775944.1, 345253.1 6775953.4, 345255.9 6775961.4, 345261.6 6775970, 345270.1 6775978.6, 345280.1 6775988.9, 345290.3 6776001, 345300.2 6776012.4, 345307.4 6776022.3, 345316.3 6776035.5, 345323.7 6776046.7, 345330.2 6776058.8, 345344.8 6776088.6, 345353.6 6776105.8, 345380.3 6776153.1, 345397.8 6776184.1, 345407.5 6776200, 345415.4 6776213.3, 345416.2 6776214.7, 345417.2 6776216.4, 345425.3 6776230.3, 345440.2 6776252.3, 345454.3 6776269.2, 345466.6 6776282.3, 345486.4 6776306.9, 345502.9 6776328.6, 345514.1 6776351.4, 345516.6 6776369.7, 345517.6 6776382.1, 345518.4 6776391.2, 345521.6 6776403.9, 345530.1 6776427.2, 345536.9 6776438.6, 345548.9 6776455.3, 345552.4 6776460.2, 345567.1 6776480.2, 345569 6776484.8, 345578.7 6776507.5, 345586.2 6776523.6, 345592.2 6776536.4, 345599.4 6776543.1, 345605.6 6776548.9, 345618.6 6776562, 345629.2 6776570.7, 345641.2 6776580.5, 345652.2 6776589.4, 345658.5 6776594.4, 345664.2 6776598.9, 345675.9 6776608.3, 345687.2 6776617.1, 345700.1 6776625.2, 345714.6 6776633.8, 345726.9 6776640.7, 345742.5 6776650.2, 345758.7 6776658.5, 345768.2 6776664.8, 345777.1 6776670.8, 345786.9 6776678.2, 345797 6776688.3, 345803.5 6776696.7, 345808.6 6776705.3, 345809.9 6776707.6, 345814.5 6776717.9, 345818.5 6776730.7, 345821.2 6776746.1, 345822.3 6776757.4, 345823 6776770.1, 345822.8 6776781.8, 345822.1 6776792.6, 345820.5 6776804.8, 345818.3 6776816.3, 345815.7 6776826.2, 345812.1 6776836.5, 345809.7 6776842.5, 345807.8 6776847.2, 345802.7 6776858.8, 345792.4 6776876.2, 345778.5 6776896.1, 345771 6776905.3, 345763.2 6776912.7, 345761.5 6776913.9, 345756 6776918.6, 345746.6 6776924.1, 345736.6 6776930.2, 345716.8 6776940, 345713.1 6776941.7, 345691.8 6776951.5, 345679.9 6776956.6, 345666.5 6776961.5, 345655.1 6776964.8, 345642.3 6776967.9, 345623.9 6776971.9, 345607.9 6776974.9, 345590.7 6776977.8, 345574.9 6776980.9, 345560.3 6776983.5, 345549.7 6776984.9, 345541.9 6776986, 345528.4 6776987.5, 345508.7 6776988.8, 345489 6776989.3, 345469.8 6776989.7, 345448.5 6776991.6, 345400.2 6776996.8, 345370.4 6777000.1, 345339.9 6777003.2, 345307.2 6777007.3, 345242.2 6777015.3, 345211.4 6777020.1, 345189 6777022.4, 345171.4 6777024.1, 345134.3 6777026.3, 345114.7 6777028.2, 345099.6 6777031.6, 345086.8 6777035.4, 345072.9 6777041, 345061.9 6777045.8, 345051.5 6777052.4, 345041.6 6777058.7, 345029.7 6777067.1, 345017.8 6777075.6, 345005.9 6777080.8, 344989.8 6777085.4, 344974.5 6777089.3, 344961.2 6777093, 344949.1 6777097.5, 344938.1 6777102.6, 344927.2 6777108.9, 344915.7 6777115.5, 344903.4 6777123, 344890.8 6777131.6, 344878.4 6777138.6, 344866.5 6777146.2, 344856.8 6777155.8, 344848.9 6777166, 344843.5 6777176.9, 344841.3 6777185.9, 344840.4 6777196.2, 344840.9 6777207, 344842.5 6777215.1, 344845.6 6777222, 344852.1 6777229, 344862.9 6777235.3, 344875.6 6777239.8, 344889.7 6777243.4, 344905.2 6777247.2, 344918.8 6777250.1, 344931.8 6777253.1, 344943.6 6777257.1, 344954.5 6777261, 344964.2 6777267, 344974.3 6777274.7, 344984.3 6777284.7, 344993.3 6777293.2, 345003.4 6777304.9, 345013.3 6777318.3, 345040.1 6777357.9, 345049.4 6777371.4, 345057.4 6777383.7, 345062.6 6777394.1, 345067.4 6777405.1, 345071.6 6777418.3, 345073.8 6777430.2, 345075.7 6777442, 345076.6 6777455, 345076.5 6777466.5, 345074.4 6777477.3, 345069.8 6777487.7, 345065.2 6777497.1, 345059.2 6777506.2, 345052.2 6777514.3, 345043.4 6777522.6, 345021.7 6777540.2, 345012.1 6777548, 345002 6777553.6, 344990.6 6777557.7, 344977.4 6777560.7, 344965.5 6777562.1, 344949.8 6777562.5, 344932.9 6777561.8, 344917.5 6777561.7, 344899.6 6777561.6, 344881.3 6777561.7, 344866 6777563.6, 344849.3 6777567.5, 344834.6 6777571.6, 344818.8 6777576.7, 344800.6 6777583.2, 344783.3 6777589.5, 344766.6 6777596.6, 344749 6777604.1, 344733.4 6777609.7, 344716.7 6777614.8, 344700.4 6777618.6, 344685.2 6777621.6, 344672.2 6777623.5, 344659.9 6777624.9, 344649.7 6777624.8, 344640.4 6777624.1, 344629.8 6777622.4, 344617.8 6777620, 344593.1 6777614.3, 344573.6 6777609.7, 344550.7 6777608, 344535.9 6777608, 344500.8 6777612.1, 344435.6 6777622.1, 344373.5 6777633.3, 344325.4 6777641.9, 344277.9 6777650.8, 344237.3 6777658.3, 344198.8 6777664.7, 344155.3 6777673.8, 344120.5 6777681.4, 344096.8 6777684.8, 344095.2 6777685.1, 344075.8 6777686.3, 344050.1 6777687.2, 344018.6 6777689.3, 344010.1 6777689.8, 344009.3 6777690.5, 344001.5 6777698, 343978.6 6777719.8, 343951.4 6777733.7, 343947 6777735.3, 343926 6777738.9, 343902.8 6777743.2, 343901 6777743.5, 343869.7 6777750, 343862.6 6777751.1, 343860.2 6777751.5, 343851.1 6777753.5, 343827.7 6777764.2, 343806.9 6777777.9, 343788.3 6777793.4, 343767.4 6777814, 343766.3 6777815.1, 343751.4 6777832, 343737 6777843.5, 343728.2 6777846, 343714.2 6777845.3, 343702 6777841.5, 343688.9 6777835.1, 343677.7 6777821.8, 343666.8 6777807.1, 343656.9 6777800.1, 343621 6777798.6, 343579.2 6777790.4, 343555.5 6777781.8, 343535.3 6777773.5, 343518.6 6777766.7, 343504.3 6777762.3, 343497.4 6777762.4, 343472.7 6777776.3, 343449.9 6777788, 343427.7 6777801.1, 343409.6 6777819.6, 343400.9 6777832.1, 343393.8 6777850.7, 343388.3 6777869.1, 343384.5 6777889.3, 343380.5 6777914.8, 343378.6 6777949.7, 343373 6777990.6, 343368.3 6778039.5, 343363.8 6778081.9, 343365.3 6778126.3, 343366.4 6778160.5, 343369.1 6778186.7, 343378.4 6778230.5, 343387.1 6778271.3, 343395 6778291.9, 343408.7 6778311, 343430.8 6778324.1, 343436.1 6778327.2, 343449.6 6778346.1, 343457.9 6778356.7, 343466.1 6778367.1, 343483.3 6778392.6, 343490.9 6778419.9, 343495.9 6778445.1, 343500.2 6778471.7, 343506.3 6778495.6, 343516.3 6778516.5, 343529.8 6778540.9, 343539.5 6778563.1, 343547.8 6778586.1, 343554.6 6778624.2, 343567.2 6778688, 343578.4 6778729.4, 343590.1 6778756.9, 343600.9 6778779, 343614.1 6778802.2, 343632.6 6778839.7, 343650.6 6778881.2, 343662.7 6778912.1, 343667.8 6778931.4, 343670.5 6778948.5, 343670.4 6778957.8, 343668.6 6778969.5, 343663.9 6778986.6, 343657.1 6779014.3, 343651.5 6779037.3, 343646.9 6779056.3, 343645.7 6779070.5, 343644.7 6779083.9, 343652.1 6779114.1, 343655.4 6779139.1, 343659.9 6779158.3, 343666.3 6779179.5, 343672.2 6779194.4, 343684.7 6779218.4, 343699.2 6779242.2, 343711.2 6779257.2, 343728.8 6779270.9, 343747.3 6779283.9, 343768.8 6779298.3, 343785 6779309.6, 343802 6779321.2, 343819.5 6779330.6, 343836 6779339.9, 343850.4 6779350.5, 343865.9 6779361.7, 343870.7 6779365.8, 343895.7 6779388.8, 343909.8 6779405.3, 343919.2 6779417.4, 343928.9 6779433.2, 343937.1 6779447.1, 343954.7 6779469.3, 343972.5 6779493.7, 343996.8 6779524.5, 344012.5 6779544.8, 344027.4 6779566.4, 344048.8 6779593.2, 344069.8 6779616.4, 344088.4 6779636, 344105.2 6779653.9, 344126.1 6779674.2, 344142.6 6779688.9, 344157.9 6779702.8, 344173.9 6779718.7, 344189.1 6779733.3, 344201.7 6779746.6, 344211.7 6779760.7, 344221.6 6779776.5, 344228.5 6779791.5, 344234.3 6779804.5, 344239.4 6779816, 344244.7 6779835.5, 344250.1 6779853, 344258.5 6779874.5, 344264.7 6779892.3, 344270.2 6779910, 344276.7 6779927.7, 344277.4 6779945.6, 344278.4 6779963.8, 344284 6779977.6, 344290.1 6779990, 344297 6780001.3, 344307.3 6780017.3, 344314.1 6780029.5, 344326.3 6780043.5, 344334.6 6780054.1, 344344.6 6780063.7, 344352.7 6780075.3, 344359.2 6780084.7, 344369.4 6780101.3, 344373.8 6780110.6, 344380.1 6780130.5, 344383.7 6780145.7, 344385.7 6780162.4, 344387.1 6780185.6, 344386.6 6780211.6, 344386.4 6780228.5, 344386.2 6780240.4, 344386.1 6780249.6, 344387.2 6780266.9, 344387.5 6780277.3, 344387.5 6780291.6, 344386.6 6780303.8, 344382.7 6780320.2, 344380.3 6780336, 344378.2 6780351.1, 344374.7 6780371.3, 344372.2 6780388.9, 344370.9 6780409.3, 344369.3 6780427.9, 344366.5 6780451.2, 344364.3 6780468, 344360.8 6780485.9, 344358.8 6780498.3, 344356 6780509, 344352.9 6780519.5, 344346.3 6780532.3, 344338.7 6780542, 344328.6 6780552.3, 344317.5 6780561.3, 344304.5 6780568.2, 344288 6780576.1, 344272.2 6780583.5, 344253.5 6780592.8, 344235.2 6780602.7, 344217.6 6780612.2, 344199.5 6780621.9, 344178.6 6780631.9, 344158 6780641.8, 344144 6780648.3, 344125.9 6780660.9, 344108.9 6780676, 344094.8 6780692.2, 344088.2 6780706.7, 344085.4 6780717.6, 344084.2 6780731.5, 344084.5 6780736.8, 344084.9 6780743.1, 344085 6780748.6, 344085.3 6780757, 344099.1 6780786.5, 344107.8 6780802.2, 344119 6780820.4, 344133.3 6780834.4, 344148.7 6780845.3, 344160.8 6780848.7, 344175.6 6780851.8, 344181.8 6780852.8, 344183.8 6780884.3, 344182.1 6780904.3, 344169.9 6780922.2, 344146.6 6780940.6, 344117.5 6780968.4, 344098.2 6780997.4, 344089.7 6781008, 344084.8 6781021, 344082.5 6781036.3, 344080.8 6781046.8, 344075.7 6781059.6, 344068.5 6781067, 344052.4 6781075.7, 344043.5 6781079.4, 344026.9 6781083.1, 344008.4 6781087, 343987.3 6781090.7, 343969.6 6781094.3, 343950.1 6781099.2, 343929.8 6781101.8, 343910.8 6781103.5, 343891.4 6781105.1, 343871 6781106.2, 343852.1 6781106.9, 343824.5 6781104.6, 343808.8 6781105.1, 343794.1 6781109.1, 343775.2 6781115.4, 343761.3 6781122.2, 343747.6 6781130.4, 343731.4 6781142.1, 343718.9 6781150.4, 343699.1 6781162.2, 343684.3 6781168.8, 343667.6 6781170.6, 343648.3 6781171.3, 343631.6 6781166.9, 343611.7 6781162.9, 343589.3 6781158.7, 343570.6 6781154, 343545.1 6781149.5, 343522.8 6781146, 343510.9 6781145.8, 343506.4 6781145.7, 343501.6 6781145.7, 343457.7 6781153.5, 343439.7 6781158.8, 343397.8 6781173.4, 343378.7 6781178.7, 343358.7 6781182.2, 343338.7 6781183.9, 343335.4 6781184.2, 343314 6781184.5, 343295.4 6781185.6, 343278.9 6781190.1, 343263.2 6781193.4, 343248 6781194.4, 343228.7 6781196.6, 343208.3 6781200, 343195 6781203.1, 343176 6781215.1, 343162.4 6781228.8, 343148.6 6781242.7, 343132.6 6781258.5, 343121.3 6781268.2, 343098.1 6781279.1, 343084.7 6781285.1, 343075.5 6781291.1, 343063.1 6781304.7, 343054.9 6781314.9, 343047.7 6781327.4, 343042.1 6781339.7, 343037 6781352, 343021.4 6781371.9, 343008.2 6781387.9, 342996.4 6781401.4, 342984.1 6781410.8, 342973.3 6781416.3, 342956.4 6781420.7, 342941.6 6781421.4, 342928.7 6781420.1, 342916.2 6781412, 342903.1 6781400.9, 342889.8 6781393.6, 342876.3 6781394.2, 342865.3 6781397.4, 342828.6 6781407.6, 342813.2 6781417.7, 342809.4 6781438.5, 342805.2 6781453, 342802.7 6781469.9, 342796.3 6781491, 342789.8 6781507.6, 342781.3 6781526.7, 342772.6 6781546.1, 342760.9 6781565.5, 342752.3 6781586.2, 342748.2 6781603.7, 342745.6 6781625.4, 342742.4 6781646.1, 342736.7 6781666.8, 342732.7 6781684.7, 342730 6781702.7, 342721.6 6781724.1, 342714 6781740, 342705.1 6781752.3, 342693.2 6781763.3, 342680.7 6781777.6, 342671.2 6781793.5, 342663.2 6781807.5, 342657.1 6781824.1, 342650.4 6781842.4, 342646.5 6781860.5, 342642.9 6781876.5, 342640.2 6781891.5, 342640.9 6781904.3, 342642.6 6781922.2, 342643.2 6781938.3, 342638.6 6781951.9, 342628.6 6781966.7, 342620.3 6781979.6, 342618.5 6781993.1, 342618.3 6782006.1, 342617.4 6782026, 342618.9 6782038.5, 342621.6 6782050.8, 342626.5 6782058.6, 342635.6 6782068.6, 342646.1 6782073.4, 342658.4 6782080, 342666.4 6782089, 342676.8 6782103.2, 342680.6 6782115.6, 342686.7 6782147, 342688.4 6782166, 342689.1 6782187.9, 342688.5 6782202.9, 342687 6782224.6, 342686.3 6782240.8, 342684.1 6782268.2, 342678.5 6782308.2, 342673.6 6782327.4, 342670.3 6782344.2, 342664.9 6782357.6, 342649.1 6782377.4, 342633.2 6782395.7, 342616.4 6782411.1, 342601.5 6782426.8, 342584.4 6782445.1, 342569.6 6782461.8, 342553.5 6782477.5, 342542.3 6782492.2, 342523.1 6782508.7, 342503.5 6782525.3, 342486.2 6782541.8, 342462.1 6782561.8, 342412.7 6782594.3, 342385 6782613.9, 342370.8 6782617, 342344.7 6782624.6, 342338.7 6782626.1, 342337.5 6782626.4, 342333.5 6782628.7, 342328.4 6782630.9, 342322.8 6782634.9, 342315.9 6782639.3, 342307.4 6782643, 342298.9 6782645, 342290.4 6782646.9, 342280.3 6782647.3, 342262.2 6782647.7, 342251.8 6782648.8, 342240.6 6782650.9, 342228.6 6782653.7, 342217.6 6782655.3, 342209.7 6782656.9, 342197.9 6782658.4, 342187.5 6782660.7, 342186.2 6782661, 342174 6782662.7, 342163.7 6782661.9, 342154.7 6782661.2, 342145.4 6782659.9, 342136 6782658.3, 342127.3 6782654.5, 342119.5 6782649.1, 342111.1 6782644.3, 342102.9 6782637.6, 342095 6782630.5, 342086 6782622.3, 342078.7 6782615.8, 342070.6 6782611.3, 342062.6 6782607.4, 342054.4 6782603, 342045 6782598.7, 342034.1 6782594.6, 342024.6 6782592, 342007.6 6782586.4, 341990.3 6782582.6, 341978.8 6782580.5, 341969 6782577.5, 341956.8 6782574.8, 341944.9 6782573.6, 341933.6 6782572.5, 341920.3 6782569, 341907.6 6782566.5, 341898 6782564.1, 341887.6 6782561.9, 341878.8 6782560.6, 341870.4 6782558, 341853.8 6782547.3, 341846.3 6782541.1, 341830 6782526.3, 341823.1 6782520.8, 341815.9 6782513.8, 341810.7 6782507.2, 341804.8 6782500.7, 341797.5 6782494.9, 341789.8 6782489.7, 341781.6 6782485, 341773.9 6782479.4, 341765.7 6782473.6, 341756.8 6782467.8, 341748.3 6782463.1, 341738.4 6782459, 341725.4 6782453.6, 341717.5 6782450.4, 341697.7 6782439.1, 341687.8 6782433.3, 341680.9 6782428.8, 341674.7 6782426.4, 341667.8 6782424.6, 341659.6 6782422.3, 341651.4 6782421.4, 341643.2 6782422, 341635 6782423.1, 341627.7 6782426.7, 341621.2 6782431.3, 341614.3 6782436.3, 341607.8 6782442.5, 341598.3 6782454, 341593.4 6782461.8, 341586.5 6782472.9, 341582.3 6782481.2, 341577.6 6782489.7, 341572.7 6782497.5, 341568.4 6782504.7, 341561.3 6782515, 341556.3 6782523.1, 341551.1 6782532, 341547.1 6782541.1, 341543.6 6782550.2, 341541.2 6782557.6, 341536.6 6782568.3, 341534.6 6782576.3, 341531.9 6782588, 341531.3 6782597.1, 341530 6782606.9, 341528 6782616.1, 341525.2 6782627.3, 341523.9 6782639.7, 341522.9 6782649.5, 341522.2 6782659.8, 341521.5 6782668.7, 341519.7 6782679, 341517.2 6782686.6, 341515.1 6782693.3, 341511.5 6782699.8, 341497.2 6782709.8, 341490.4 6782713.6, 341484.3 6782717.2, 341469.1 6782724.9, 341459.2 6782726.5, 341443.3 6782726.7, 341431.5 6782725.8, 341410.1 6782725.3, 341405.1 6782725.7, 341397.1 6782728.6, 341384.1 6782733.8, 341376 6782739.2, 341368.6 6782742.8, 341361.2 6782747.9, 341353.8 6782756.5, 341350.1 6782763.7, 341348.2 6782770.9, 341344.3 6782779.4, 341340.7 6782787.4, 341338.5 6782795.4, 341337.8 6782801.8, 341333.6 6782809.1, 341328.5 6782816.2, 341321.1 6782820.1, 341313.3 6782823.2, 341305.8 6782825.4, 341297.6 6782825.9, 341288.6 6782825.5, 341253.8 6782821.5, 341239.8 6782819.2, 341231.8 6782818.5, 341218.8 6782818.1, 341209.3 6782817.4, 341199.1 6782816.6, 341169.6 6782814.2, 341154.8 6782813.4, 341143.8 6782813, 341134 6782811.6, 341120.8 6782809.7, 341109 6782809.5, 341099.4 6782808.4, 341090.1 6782807.5, 341081.7 6782807.8, 341068.8 6782807.1, 341059.7 6782807.1, 341051.8 6782807.4, 341043.2 6782807.7, 341034.7 6782808.1, 341027.2 6782810.4, 341018.7 6782813.4, 341009.6 6782818.5, 341002.6 6782823.9, 340995.5 6782829.5, 340988.9 6782835.2, 340982.2 6782842.4, 340975.7 6782848.8, 340969.4 6782854.6, 340958.7 6782865.2, 340951.6 6782869.8, 340944.4 6782875.8, 340937.5 6782879, 340921.2 6782896, 340914.8 6782903.7, 340907.7 6782910.9, 340901 6782916.1, 340893.9 6782921.8, 340887.3 6782926.8, 340879.1 6782933.4, 340871.8 6782941.8, 340864.9 6782947.2, 340858.9 6782952.3, 340851.8 6782958.9, 340846.8 6782965.2, 340839.5 6782974.9, 340833.9 6782983.3, 340828.9 6782991.1, 340824.4 6782997.5, 340820 6783004.9, 340814.6 6783012.3, 340811.4 6783020, 340807.4 6783028.3, 340803.2 6783036.3, 340800.2 6783044, 340796.2 6783049.9, 340793.9 6783056.6, 340793.3 6783064.3, 340791.3 6783072.3, 340790 6783080.3, 340788 6783090.1, 340786.4 6783098.2, 340785.9 6783106, 340785.7 6783114.8, 340785.3 6783132.3, 340785.1 6783140.4, 340784.9 6783149, 340785 6783163.6, 340785.7 6783171.6, 340786.4 6783179.3, 340788 6783187.1, 340790.2 6783193.7, 340794.1 6783202.2, 340799 6783207.6, 340803.2 6783212.8, 340807.1 6783215.3, 340807 6783220.2, 340807.6 6783226.1, 340810 6783231.5, 340817.6 6783238, 340822.2 6783242.5, 340832.4 6783247.4, 340844.8 6783252.8, 340846.9 6783253.5, 340855.3 6783255.8, 340864.5 6783258.8, 340873.4 6783260.4, 340879.6 6783258, 340887.4 6783254.8, 340899.2 6783254.3, 340903.1 6783260.2, 340907.4 6783265.5, 340909.7 6783271.5, 340912 6783280.7, 340912.8 6783287.8, 340915 6783302, 340916.1 6783315.3, 340917.1 6783325.1, 340918.1 6783335, 340919 6783344.7, 340919.6 6783354.9, 340920.2 6783368.2, 340919.7 6783382.1, 340919.5 6783391.4, 340918.9 6783401.4, 340919.1 6783411.1, 340919.2 6783419.9, 340918.7 6783428.3, 340917.6 6783438.6, 340916.4 6783448.6, 340915.1 6783457.7, 340913.3 6783466.9, 340911.7 6783476.5, 340909.6 6783484.8, 340906.8 6783496.7, 340906.3 6783504.9, 340904.3 6783513.2, 340902.4 6783521.2, 340903.9 6783528.3, 340906.5 6783535, 340911.5 6783541.8, 340917.3 6783547.9, 340923.3 6783554, 340928 6783561.4, 340932.3 6783567.9, 340935.8 6783575.9, 340939 6783583.6, 340943.7 6783595.6, 340947.2 6783603.5, 340950.3 6783611.7, 340952.9 6783620.7, 340954.7 6783627.3, 340961.6 6783642.4, 340966.9 6783651.1, 340972.9 6783661.7, 340975.9 6783671.2, 340992 6783693.6, 340996.9 6783713.9, 340998.4 6783729.4, 340999.4 6783744.7, 340982.4 6783755.9, 340959.1 6783760.5, 340941.4 6783780.9, 340938.8 6783800.2, 340947.5 6783830.4, 340947.2 6783837.4, 340948.3 6783846.1, 340952.5 6783856.4, 340960.5 6783865.5, 340972.8 6783872.6, 340986.1 6783874.4, 341008.4 6783874, 341025.1 6783875.2, 341041.4 6783880.4, 341064.4 6783893.2, 341076.1 6783903.4, 341089.3 6783916.3, 341103.6 6783930, 341111.6 6783942.1, 341118.7 6783952.7, 341122.9 6783964.3, 341126 6783974.9, 341127 6783984.1, 341130.6 6783996.2, 341141.1 6784010.6, 341161.8 6784032.1, 341176.4 6784043.6, 341189.7 6784048.7, 341208.9 6784057.8, 341213.1 6784064.5, 341218.5 6784072.5, 341222.6 6784082.7, 341228.3 6784104.1, 341231 6784112.2, 341236.4 6784122.8, 341246.2 6784132.1, 341260.3 6784140.6, 341275.1 6784149.4, 341290.8 6784163.7, 341295.4 6784170.5, 341297.5 6784176.5, 341299.4 6784185, 341300.5 6784192.5, 341299.8 6784200.5, 341296.7 6784208.3, 341290.9 6784217.5, 341287.1 6784226.4, 341284.9 6784232.6, 341278.2 6784240.1, 341269.6 6784244.4, 341256.3 6784247.7, 341248.2 6784251.6, 341240.5 6784255.4, 341231.3 6784261.8, 341222.4 6784269, 341215.8 6784277.2, 341210.7 6784285.7, 341208.3 6784291.3, 341206.5 6784297.9, 341205.4 6784306.5, 341205.5 6784322.9, 341205.5 6784330.9, 341204.5 6784340.8, 341202.8 6784348.7, 341201.8 6784355.1, 341196.8 6784372.1, 341193 6784378.2, 341189.1 6784385.2, 341184.4 6784396.5, 341182.9 6784400.9, 341181.2 6784406.8, 341179 6784414.5, 341176.8 6784420.9, 341173 6784430.2, 341167.9 6784436.9, 341162.2 6784440.3, 341154.8 6784444.6, 341147.6 6784447.6, 341138.8 6784450.1, 341130 6784453, 341122.9 6784455.2, 341114.5 6784458.1, 341106.2 6784460.5, 341102.7 6784462, 341102 6784468.1, 341097.7 6784475.7, 341094.4 6784483.2, 341092.9 6784489.6, 341091 6784494.3, 341090.5 6784495.4, 341083.9 6784500.6, 341076.4 6784503.1, 341071.8 6784503.6, 341067 6784502.3, 341062.4 6784496.8, 341054.4 6784487.3, 341041.7 6784490.9, 341036.7 6784492.3, 341023.6 6784502.4, 341018.8 6784514, 341018.6 6784530, 341020.6 6784547.4, 341022.7 6784563.4, 341024.5 6784577.5, 341024 6784587.6, 341021.7 6784597.4, 341018.8 6784605.4, 341010.7 6784616.4, 340993.5 6784627.3, 340973.9 6784638.8, 340951.5 6784651.4, 340938.1 6784662.4, 340928.4 6784678.6, 340926.1 6784692.7, 340928.5 6784704.6, 340940.1 6784717.1, 340951.2 6784728.6, 340966.6 6784736.3, 340989.6 6784742.9, 341015.3 6784748.5, 341038.2 6784754.4, 341047.6 6784759.3, 341061 6784772.6, 341068.5 6784784.6, 341071.8 6784798, 341072.3 6784808.7, 341070.1 6784832.2, 341065.5 6784860.8, 341061.7 6784877.2, 341057.2 6784887, 341051.1 6784894.5, 341042.4 6784899.8, 341032 6784902.6, 341016.7 6784901.9, 340999.6 6784898, 340980.8 6784893, 340962.7 6784892.3, 340943.5 6784894, 340928.4 6784897.2, 340915.4 6784904.8, 340904 6784915.5, 340890.7 6784934.6, 340882.4 6784949.7, 340870.3 6784961, 340849 6784975.3, 340832 6784984.7, 340824.9 6784992.2, 340820.5 6784996.7, 340814.8 6785008, 340812.8 6785018.1, 340810.3 6785034, 340810 6785035.9, 340808.5 6785044.5, 340806.8 6785054.5, 340805.1 6785064.4, 340802.8 6785078.4, 340801.9 6785083.7, 340798.2 6785104.9, 340792.5 6785120.3, 340781.9 6785136.3, 340768.5 6785146.5, 340751.6 6785157.2, 340732.1 6785164.3, 340716.2 6785166.5, 340697.7 6785167.2, 340679.9 6785165.5, 340664.2 6785163.2, 340646 6785161.9, 340626.6 6785162.3, 340607.5 6785163.5, 340592.8 6785164.8, 340577.9 6785168.1, 340565.3 6785172, 340550.4 6785175.5, 340538.9 6785178.4, 340526.5 6785181.3, 340525.4 6785181.1, 340515.8 6785179.1, 340502.9 6785173.4, 340492.3 6785167.1, 340481.5 6785159.7, 340468.4 6785152.5, 340453.4 6785143.3, 340441 6785138.5, 340428.5 6785135.4, 340414.7 6785132.3, 340403.8 6785129.7, 340402.7 6785129.4, 340388.7 6785124, 340368.1 6785118.1, 340346.8 6785111.7, 340324.7 6785103.8, 340307.9 6785098.1, 340291.4 6785093.3, 340277.3 6785088.8, 340265.9 6785083, 340255.5 6785075.5, 340244.1 6785065.1, 340233.9 6785057.6, 340222.8 6785050.9, 340215.5 6785048.8, 340213.5 6785048.3, 340201.3 6785046.7, 340185.1 6785046.3, 340173.6 6785049.5, 340162.2 6785054.9, 340152.1 6785060.1, 340139.6 6785064.3, 340123.7 6785066.5, 340109.4 6785066.2, 340096 6785065.1, 340085.5 6785060.7, 340079.3 6785052.8, 340078.1 6785049.3, 340071.9 6785038.3, 340064.2 6785024.7, 340057.7 6785013.4, 340034.5 6784972.2, 340030.2 6784964.5, 340018.2 6784964, 340001.9 6784962.7, 339996.1 6784961.4, 339983.7 6784955.5, 339972.9 6784947.5, 339966.2 6784940.6, 339944.7 6784914.9, 339919.6 6784885.6, 339909.8 6784873.5, 339898 6784857.3, 339884.1 6784836.6, 339873.3 6784818.4, 339862.7 6784800.9, 339851 6784783.7, 339846.2 6784779.2, 339843.2 6784778.4, 339827.2 6784778.8, 339816.7 6784779.2, 339810.2 6784779.9, 339799.4 6784782.2, 339781.6 6784786.7, 339772 6784789.7, 339764 6784792, 339755.2 6784793.4, 339750.2 6784793.1, 339739.6 6784790.7, 339702.7 6784780.6, 339671.6 6784772.5, 339661.2 6784769.6, 339639.8 6784761.6, 339622.4 6784755.9, 339615.8 6784755, 339602.7 6784755.4, 339594.8 6784756.1, 339590.7 6784757.4, 339589.2 6784758.4, 339584.9 6784761.3, 339580 6784766.7, 339575.6 6784774.2, 339569.3 6784787.8, 339559.4 6784813.4, 339551 6784833.8, 339542.6 6784847.9, 339535.6 6784855.3, 339527.2 6784859.9, 339512.3 6784863.8, 339498.1 6784865.8, 339461.6 6784869.3, 339446.4 6784870.4, 339432.6 6784871.6, 339424.5 6784873.3, 339417.9 6784874.6, 339411.3 6784874.2, 339401.2 6784873.2, 339388.1 6784872.4, 339381.6 6784872.3, 339368.3 6784872.7, 339361 6784873.7, 339346 6784878, 339340.1 6784881.5, 339337.6 6784884.5, 339335.7 6784888.1, 339331.3 6784902.4, 339330.4 6784911.7, 339332 6784917.1, 339334.9 6784919.8, 339345.8 6784925.9, 339352.9 6784929.2, 339360.3 6784931.5, 339363.6 6784932.9, 339366.3 6784935.1, 339368.5 6784938, 339370 6784941.5, 339372.9 6784955.2, 339373.3 6784966, 339371.5 6784975, 339367.4 6784984, 339359.1 6784996.3, 339348.2 6785009.5, 339339.1 6785018, 339329.6 6785024.1, 339319.1 6785028.3, 339313.6 6785028.7, 339306.9 6785027.1, 339300.1 6785023.3, 339290.7 6785017.2, 339281.6 6785012.6, 339274.4 6785009.7, 339267.4 6785007.6, 339258.5 6785005.8, 339247.5 6785004.1, 339226.6 6785001.6, 339212.1 6785000.2, 339201.8 6784998.8, 339191 6784995.6, 339176.7 6784990.9, 339169.4 6784988.9, 339165.8 6784988.3, 339156.9 6784987.8, 339154.1 6784988.7, 339149.4 6784993.6, 339146.1 6785001.9, 339145 6785012.4, 339164.4 6785034.6, 339167.1 6785036.9, 339174.7 6785043.1, 339179 6785047.1, 339180 6785049, 339181.7 6785054.2, 339182.2 6785056.5, 339183.2 6785062.1, 339184.2 6785067.6, 339184.5 6785070.1, 339184.6 6785073.7, 339184.7 6785076.9, 339184.7 6785078.4, 339184.4 6785083.3, 339184.1 6785088.2, 339184 6785088.7, 339184.1 6785095.6, 339184.2 6785100.2, 339184.7 6785104.5, 339185.6 6785109.3, 339186.5 6785113.3, 339188 6785118, 339189.7 6785123, 339191.6 6785127.5, 339197.4 6785140.2, 339202.6 6785151.8, 339213.8 6785179.3, 339217.9 6785183.6, 339222.7 6785188.3, 339226 6785193.8, 339227.2 6785200.2, 339227.8 6785207.2, 339227.1 6785215.7, 339225.3 6785223.9, 339215.8 6785230.7, 339202.4 6785235.9, 339206.3 6785239.8, 339213.4 6785247.1, 339217.8 6785251.3, 339222.6 6785255.1, 339226.1 6785259.6, 339228.6 6785263.7, 339233 6785279, 339211.2 6785289.1, 339206.2 6785295.4, 339201.6 6785302, 339191.5 6785317, 339186.8 6785325.3, 339185.1 6785329.6, 339183 6785338.1, 339182.4 6785341.4, 339181.6 6785349.4, 339180.8 6785355.4, 339180.7 6785357.7, 339150.4 6785333.9, 339132.6 6785319.8, 339131.2 6785318.9, 339127.1 6785316.4, 339119.6 6785310.9, 339112.7 6785307.2, 339106.4 6785303.7, 339078.4 6785291.4, 339065.7 6785287.9, 339050.4 6785285.7, 339036.3 6785287.8, 339025.1 6785292.1, 339008.9 6785297.6, 338992.9 6785299.8, 338976.4 6785299.7, 338962 6785302, 338946.2 6785305.4, 338927 6785308, 338912.6 6785306.8, 338897.9 6785303.8, 338884.2 6785301.1, 338871.2 6785300.7, 338859.4 6785301.6, 338850.2 6785304.9, 338840.1 6785313.3, 338828.2 6785322, 338815.3 6785330.7, 338802.6 6785338.7, 338788.5 6785347.3, 338773.8 6785352.3, 338759.7 6785356.1, 338743.6 6785358.6, 338728.5 6785361, 338715.6 6785364.3, 338706.7 6785367.2, 338705.2 6785368.1, 338700.4 6785370.8, 338695.2 6785375.8, 338691.2 6785382.3, 338688.4 6785395.7, 338687.7 6785398.8, 338681.9 6785409.7, 338680.2 6785425.8, 338680.7 6785445.5, 338682 6785467.5, 338683.2 6785487.5, 338684.1 6785499.6, 338685.7 6785526.7, 338693.2 6785558.6, 338683 6785591.1, 338677.1 6785636.2, 338669.6 6785692, 338665.9 6785717.3, 338663.3 6785730.9, 338660.5 6785738.5, 338654.4 6785748.7, 338644.9 6785760.7, 338620.7 6785786.9, 338603.8 6785802.6, 338586.3 6785815.1, 338577.7 6785819.8, 338569 6785823.7, 338562.1 6785825.9, 338555 6785827.3, 338535.9 6785828.8, 338510.2 6785827.9, 338475.6 6785824.5, 338457.3 6785821, 338437.6 6785817, 338415.1 6785814.4, 338390.5 6785812.5, 338372.2 6785811.9, 338338.5 6785811.5, 338315.7 6785811.3, 338307.3 6785811.8, 338290.3 6785814.8, 338276.6 6785819.1, 338258.6 6785828.1, 338233.1 6785842, 338208.9 6785854.8, 338201.4 6785858.1, 338179.8 6785865, 338157.5 6785870, 338135.8 6785872.9, 338117.4 6785873, 338094.4 6785870.4, 338077.2 6785866.5, 338070.4 6785865, 338052.1 6785858.6, 338037.8 6785850.9, 338021.9 6785838.5, 338005.3 6785822, 337999 6785812.9, 337994.5 6785802.3, 337993.5 6785797.3, 337991.3 6785775.3, 337990.2 6785762.8, 337989 6785755.2, 337984.2 6785740.5, 337978 6785723.1, 337974.8 6785711.3, 337970.1 6785691.9, 337968.6 6785684.9, 337967.3 6785677.8, 337965.2 6785669.9, 337963.3 6785663.5, 337960.6 6785656.4, 337958.3 6785651.1, 337948 6785631.6, 337943 6785623.8, 337937.8 6785619.2, 337930.7 6785616, 337916.2 6785613, 337899.3 6785611.7, 337888.8 6785612, 337856.8 6785614.1, 337839.1 6785615.3, 337832.3 6785615.9, 337822.1 6785618.4, 337811.6 6785621, 337801.4 6785622.3, 337789.6 6785622.8, 337777.1 6785622.1, 337765.8 6785621.7, 337754.9 6785622.5, 337745.5 6785624.4, 337736.4 6785627.6, 337731.8 6785630.6, 337729.5 6785633.4, 337727.8 6785636.7, 337725.6 6785641.8, 337722.5 6785646.4, 337708.5 6785664.2, 337699.6 6785673.5, 337690.7 6785679.7, 337677.7 6785686, 337672.9 6785687.3, 337665 6785687.5, 337650.1 6785686.6, 337641.5 6785684.9, 337634.8 6785682.5, 337628.5 6785679.3, 337612.4 6785671.8, 337594.5 6785665.6, 337581.7 6785662.4, 337557.9 6785658.8, 337531 6785656.4, 337525 6785656.6, 337511.7 6785658.2, 337501.1 6785660.1, 337489.9 6785662.1, 337474.1 6785664.3, 337467.2 6785664.8, 337456.5 6785663.6, 337445.1 6785662.3, 337421.6 6785663, 337396.8 6785663.9, 337384.5 6785663.5, 337372.3 6785662.2, 337365 6785661.8, 337357.7 6785662.5, 337350.5 6785665.2, 337340.5 6785673.2, 337333 6785681.8, 337322 6785696.5, 337308.6 6785713.2, 337304.4 6785717.7, 337298.2 6785722.5, 337291.4 6785726.6, 337284.4 6785730.7, 337277.7 6785735.8, 337271.5 6785741.7, 337265.8 6785748.3, 337260.1 6785755, 337253.7 6785761.1, 337246.2 6785766.6, 337235 6785772.7, 337222.3 6785778.3, 337211.7 6785781.7, 337189.7 6785768.7, 337165.2 6785756.6, 337159.5 6785752.9, 337154.2 6785751.6, 337140.8 6785748.8, 337122.4 6785743.5, 337117.6 6785739.6, 337112.3 6785731.6, 337111.2 6785725.9, 337108.6 6785719.9, 337104.9 6785713.5, 337101.3 6785702, 337100.7 6785694.5, 337100.2 6785686.1, 337100.4 6785679.2, 337101 6785672.5, 337099.4 6785669.1, 337096 6785667.5, 337091.8 6785667.5, 337086.6 6785668.3, 337081.2 6785670, 337076.8 6785673.3, 337074.4 6785677.6, 337072.4 6785681.9, 337069.9 6785687.7, 337067.7 6785692, 337063.9 6785694.4, 337059.3 6785694.9, 337054 6785693.8, 337047.8 6785689.1, 337045.5 6785684.4, 337045.2 6785679.1, 337046.4 6785673.7, 337047.7 6785668.8, 337049.5 6785663.6, 337049.6 6785659.8, 337046.8 6785657.9, 337041.9 6785657.6, 337036.4 6785658, 337029.5 6785658.9, 337027.4 6785658.9, 337049.2 6785617.9, 337051.1 6785614.2, 337052.1 6785606.5, 337048.2 6785596.4, 337041.9 6785585.8, 337033.5 6785572, 337027.8 6785566.9, 337014.5 6785564.5, 337006.9 6785563.3, 336998.7 6785560.3, 336988 6785560.3, 336984.2 6785564.8, 336981.1 6785571.1, 336969.8 6785577.5, 336956 6785583.3, 336944.6 6785588.5, 336934.6 6785588.6, 336928.8 6785582.9, 336927.5 6785574, 336926.1 6785562, 336920.4 6785555.8, 336902.7 6785553.4, 336889.5 6785549.2, 336880.7 6785535.9, 336870 6785533.3, 336862.7 6785533.8, 336846.2 6785534.4, 336831.5 6785534.2, 336817.6 6785533.6, 336806.5 6785532.5, 336786.2 6785531.2, 336770.8 6785530.1, 336754.6 6785529.4, 336738.7 6785528.3, 336717.7 6785527.1, 336690 6785524.9, 336670.8 6785525.1, 336661.5 6785527.8, 336648.7 6785528.6, 336632.6 6785526.1, 336615.1 6785523.2, 336598.5 6785520.7, 336573.9 6785518, 336557.7 6785517.4, 336545 6785516.7, 336525.2 6785512.5, 336504.4 6785508.5, 336487.4 6785506.6, 336481.2 6785505, 336475.9 6785501.2, 336470.8 6785498.2, 336465.4 6785498, 336459.8 6785498.1, 336451.5 6785498.9, 336445.2 6785501.3, 336439.8 6785503.5, 336432 6785504.3, 336430.3 6785504.2, 336423.6 6785503.9, 336418.7 6785502.6, 336404.4 6785500.1, 336383.7 6785494.7, 336371.6 6785494.1, 336362.6 6785493.7, 336355.7 6785495, 336348.7 6785498.6, 336341.6 6785500.8, 336332.4 6785500.2, 336324.8 6785498.3, 336317.3 6785497.3, 336308.6 6785498.3, 336301.6 6785501.3, 336293.9 6785504.4, 336287.8 6785505, 336282.1 6785503.2, 336275 6785503.5, 336266.3 6785505.8, 336258 6785508.3, 336248.7 6785511.3, 336237.8 6785514.7, 336228.6 6785517.3, 336219.4 6785519.8, 336209.6 6785520.9, 336200.4 6785520.9, 336194.8 6785519.3, 336189.5 6785516.9, 336184 6785512.4, 336181.1 6785509.4, 336179.6 6785507.7, 336176.1 6785503.3, 336172.3 6785500.2, 336168.7 6785498.8, 336163.4 6785498.1, 336149 6785505.9, 336141.3 6785508.1, 336134.2 6785508.9, 336126.7 6785503.2, 336116.8 6785495.9, 336107.1 6785490.4, 336099.7 6785486.2, 336096.4 6785486.7, 336084.7 6785494.9, 336072.1 6785504.8, 336058.7 6785514, 336040.3 6785530.8, 336034.1 6785537.4, 336029.6 6785540.4, 336025.9 6785540.9, 336019.9 6785542.6, 336012.5 6785543.3, 336001.5 6785542.4, 335992.8 6785540.5, 335979.7 6785535.6, 335968.9 6785531.6, 335958.9 6785525.9, 335949.8 6785519.8, 335940.6 6785511.9, 335934.4 6785506.1, 335926.5 6785499.7, 335922.3 6785493, 335921.9 6785486.5, 335917.8 6785480, 335910.4 6785473.1, 335904.1 6785470.9, 335896.2 6785477.9, 335890.4 6785491.5, 335883.5 6785501.9, 335876.2 6785509.3, 335864.7 6785515.6, 335854.8 6785516.7, 335842.5 6785512.1, 335828.1 6785504.9, 335813.9 6785495.8, 335806 6785484, 335804.8 6785478.9, 335802.4 6785472.2, 335798.7 6785468.1, 335792.1 6785463.7, 335782.5 6785458.8, 335772.8 6785452.8, 335759.4 6785443.5, 335742.1 6785435.9, 335733.2 6785432.1, 335722.9 6785427.3, 335718.7 6785425.2, 335713.6 6785421.5, 335707 6785417.3, 335702.9 6785411.6, 335700.3 6785406.1, 335698 6785401, 335695.9 6785394.9, 335691 6785386.1, 335686.2 6785380.4, 335679.7 6785375.1, 335672.4 6785368.4, 335660.4 6785360.5, 335651.5 6785356.3, 335643.5 6785351.9, 335639.5 6785347.3, 335635.9 6785340.9, 335634.9 6785336.3, 335630.3 6785329.3, 335617 6785339.1, 335603 6785343.9, 335593.5 6785342.5, 335587.4 6785342.5, 335576.3 6785336.3, 335567 6785330.2, 335555.9 6785322.4, 335538.7 6785321, 335526.2 6785316.4, 335519.9 6785310.2, 335507.3 6785296.3, 335496.4 6785288.6, 335471.4 6785284.1, 335450.9 6785276.5, 335433.7 6785267.2, 335413 6785250.7, 335402.9 6785209.6, 335398.5 6785200.1, 335388.4 6785184.1, 335382.4 6785169.1, 335376.7 6785154.5, 335370.9 6785137.9, 335361.4 6785114.2, 335350.4 6785087.9, 335342.3 6785066.9, 335337.6 6785044.7, 335333.8 6785013.4, 335332.9 6784997.4, 335330.4 6784993.8, 335302.8 6784991, 335295.6 6784989, 335288.8 6784983.6, 335269.6 6784962.4, 335254.3 6784941.5, 335241.9 6784926.2, 335228.1 6784909.4, 335212.5 6784889.9, 335197.3 6784873.7, 335188.1 6784863.7, 335182.4 6784856.2, 335176.4 6784848.8, 335168.3 6784842.7, 335160.1 6784835, 335149.3 6784829.4, 335135.3 6784818.8, 335131.7 6784814.3, 335128.6 6784810.4, 335128.8 6784806.4, 335134.8 6784792.5, 335141.8 6784771.8, 335141.6 6784768.4, 335139.1 6784766, 335135.8 6784765.2, 335130.3 6784765.5, 335124.2 6784766.1, 335121.2 6784766.1, 335066.8 6784767.5, 335064.7 6784765.1, 335031.5 6784727.8, 334991.4 6784713.1, 334987.5 6784705.6, 334966 6784678.4, 334906.2 6784678.8, 334891.2 6784674, 334840.9 6784639.4, 334831.2 6784629.5, 334813.7 6784611.6, 334810.9 6784610, 334789.6 6784596.8, 334780.6 6784594.9, 334720.7 6784605.4, 334705.6 6784590.5, 334660.8 6784610.9, 334645 6784613.1, 334620.3 6784616.5, 334595.5 6784619.9, 334570.8 6784623.4, 334546 6784626.8, 334444.2 6784612.9, 334413.5 6784602, 334369.9 6784602.7, 334345.1 6784599.3, 334320.4 6784595.9, 334295.6 6784592.5, 334270.9 6784589.1, 334255.5 6784585.5, 334231 6784579.9, 334206.7 6784574.3, 334182.4 6784568.8, 334158 6784563.2, 334133.7 6784557.6, 334110.6 6784556.9, 334090.9 6784555.2, 334051.8 6784550.2, 334030.2 6784548.5, 334008.1 6784546.8, 333950.9 6784543.2, 333940.6 6784542.9, 333899 6784540.2, 333880.7 6784539.5, 333835.6 6784541.5, 333807.5 6784541.7, 333781 6784549.7, 333765.4 6784554.5, 333743.5 6784550, 333732.5 6784534.5, 333710.5 6784520.6, 333705.7 6784505.1, 333697.9 6784505.1, 333683.8 6784509.9, 333677.8 6784503.9, 333665 6784491.3, 333657.1 6784474.3, 333655.4 6784454, 333638.1 6784443.2, 333613.1 6784437.2, 333578.6 6784421.9, 333536.2 6784397.2, 333504.8 6784370.9, 333471.6 6784318.1, 333458.5 6784299.8, 333441.6 6784276.2, 333410.1 6784254.5, 333380.3 6784236.1, 333359.8 6784214.4, 333323.9 6784203.8, 333280 6784197.8, 333241 6784192, 333211.3 6784187.5, 333186.3 6784179.9, 333148.7 6784170.8, 333119 6784166.4, 333079.8 6784152.6, 333045.4 6784131.1, 333013.9 6784114.2, 332993.4 6784086.2, 332968.5 6784088, 332945.2 6784099.1, 332940.4 6784103.5, 332929.7 6784113.4, 332906.4 6784132.3, 332890.9 6784141.8, 332867.5 6784148.2, 332847.2 6784156.2, 332836.4 6784168.8, 332816.3 6784187.6, 332793 6784201.9, 332766.5 6784214.6, 332741.6 6784216.4, 332718.2 6784216.6, 332691.5 6784202.7, 332668 6784185.7, 332647.4 6784165.6, 332617.7 6784145.6, 332587.8 6784119.2, 332548.5 6784094.6, 332503.1 6784073.2, 332482.7 6784068.6, 332448.3 6784064.2, 332415.6 6784066, 332387.5 6784072.5, 332354.8 6784072.8, 332321.8 6784059, 332292.1 6784045.2, 332268.5 6784029.7, 332248.2 6784028.4, 332223.2 6784030.1, 332187.3 6784033.6, 332159.2 6784041.6, 332134.4 6784055.8, 332114.1 6784052.9, 332093.7 6784040.5, 332062.3 6784023.6, 332042 6784022.3, 332026.4 6784023.9, 332003.1 6784036.6, 331979.8 6784043.1, 331954.8 6784048, 331926.7 6784051.3, 331904.9 6784051.5, 331884.4 6784037.5, 331856.3 6784036.3, 331840.7 6784037.9, 331837.5 6784023.9, 331824.9 6784013, 331806.1 6784008.5, 331785.8 6784004.1, 331767 6783991.7, 331746.5 6783982.5, 331729.3 6783967.1, 331705.8 6783962.5, 331677.7 6783961.2, 331654.3 6783961.4, 331638.7 6783974, 331634.2 6783992.8, 331631.2 6784009.9, 331617.3 6784017.9, 331603.3 6784025.8, 331583.1 6784035.3, 331567.6 6784051.1, 331548.9 6784056, 331523.9 6784059.3, 331502 6784051.7, 331480.1 6784042.4, 331464.3 6784027, 331436.2 6784005.4, 331407.8 6783977.6, 331392 6783951.1, 331384 6783924.7, 331366.8 6783918.5, 331343.4 6783921.8, 331310.7 6783934.6, 331296.8 6783955.1, 331275.1 6783972.4, 331237.8 6783993, 331201.9 6784001.1))
-""")
+        _sio = AbstractGeoDataFrameDemos._dataset(
+            "GeoDataFrameDemosD", "rennesMetropole.csv"
+        )
         return GeoDataFrameLib.read_csv(_sio)
 
     @staticmethod
@@ -73,14 +72,16 @@ BDT_3-3_SHP_LAMB93_D035-ED2024-03-15/ADMINISTRATIF/COMMUNE.shp")
         roi.reset_index(drop=True, inplace=True)
         roi.to_csv('/tmp/commune.csv', sep=';', index=False)
         '''
-        _sio = StringIO("""ID;INSEE_COM;INSEE_ARR;INSEE_COL;INSEE_DEP;INSEE_REG;POPULATION;SURFACE_HA;DATE_CREAT;DATE_MAJ;DATE_APP;DATE_CONF;CODE_POST;NOM;CL_ARROND;CL_COLLTER;CL_DEPART;CL_REGION;CAPITALE;DATE_RCT;RECENSEUR;SIREN_EPCI;ID_CH_LIEU;ID_AUT_ADM;CODE_SIREN;geometry
-COMMUNE_0000000009741400;35238;3;35D;35;53;225081;5039;2006-08-02 08:36:54;2024-02-12 18:17:52;;;35000;Rennes;Oui;Oui;Oui;Oui;Non;2021-01-01;INSEE;243500139;PAIHABIT0000000046972122;SURFACTI0000000046891488;213502388;POLYGON ((351041.3 6791859.2, 351064.8 6791835.2, 351089.9 6791805.6, 351090.3 6791805.2, 351112.8 6791778.4, 351123.9 6791761.8, 351138.9 6791739.3, 351193.8 6791787, 351211.4 6791801.6, 351217.1 6791806.3, 351240.2 6791825, 351251.5 6791832.3, 351285.3 6791852.4, 351297 6791861.8, 351298.8 6791859.2, 351306.6 6791862.5, 351333.1 6791873.7, 351337.8 6791875.8, 351348.9 6791881.9, 351364 6791895.5, 351373.1 6791907.8, 351384.9 6791930.8, 351386.6 6791934.7, 351395.1 6791935.2, 351441.4 6791930.5, 351448.1 6791929.2, 351466 6791925.9, 351523.1 6791916.8, 351530.4 6791917, 351540.6 6791917.2, 351549.9 6791917.5, 351591 6791917.8, 351602.7 6791919.4, 351620.1 6791918, 351642.2 6791919.4, 351649.8 6791919.9, 351719.8 6791923, 351718.6 6791928.9, 351717.8 6791933, 351741.4 6791934.7, 351779.7 6791939.8, 351797.2 6791941.6, 351835.3 6791948.9, 351834 6791963.1, 351862.4 6791960.2, 351881.8 6791956.6, 351931.5 6791940.2, 351934 6791939.1, 351948.8 6791933.6, 351964.9 6791927.6, 351980.9 6791920.9, 351986 6791919.6, 351994.8 6791917.5, 351999.5 6791917.5, 352020.7 6791912, 352038.5 6791906.5, 352060.5 6791899.6, 352064 6791898.6, 352073.1 6791895.7, 352086.2 6791909.3, 352102.6 6791922.7, 352141.8 6791947.5, 352222.1 6791990.4, 352264.2 6792016.5, 352310.7 6792052.2, 352326.5 6792066.5, 352372.1 6792119.7, 352381.3 6792134.7, 352397.4 6792170.6, 352414.6 6792214.6, 352428.9 6792204.4, 352435.1 6792200.2, 352441.8 6792195.6, 352451.4 6792203.1, 352462.6 6792208.6, 352482 6792179.3, 352498.3 6792144.5, 352507.5 6792118.5, 352495.2 6792092.9, 352508.2 6792086.5, 352547.6 6792076.3, 352556.5 6792072.2, 352603 6792102, 352625.7 6792112.7, 352628 6792114.8, 352634.8 6792113.9, 352660.3 6792110.1, 352673.4 6792110, 352674.1 6792110, 352679.6 6792110.9, 352683.6 6792115.9, 352698 6792137.3, 352698.5 6792138, 352704.4 6792147.4, 352715.3 6792165.1, 352723 6792177.4, 352734.4 6792195.8, 352741.5 6792210.2, 352760 6792207, 352769.9 6792201.7, 352783.3 6792179.8, 352790.4 6792173.1, 352802.6 6792167.6, 352846.2 6792153.5, 352851.7 6792151.8, 352858.4 6792166.4, 352862.4 6792173.8, 352866.8 6792178.8, 352878.9 6792186.1, 352877.9 6792190.1, 352879.7 6792203.8, 352880 6792205.9, 352886.1 6792223.2, 352899.9 6792247.9, 352904.2 6792252.4, 352910.4 6792254.2, 352920.5 6792265.6, 352917.7 6792270.5, 352917.1 6792282.8, 352927.3 6792325.6, 352929.5 6792330.1, 352932.8 6792332.2, 352958.5 6792328.5, 352970.5 6792333.7, 352980 6792344.3, 352989.7 6792357.4, 353000 6792376.5, 353005.9 6792387, 353008 6792398.7, 353008.5 6792403.8, 353008.9 6792412.3, 353008.5 6792421.3, 353008.2 6792431.6, 353029.1 6792445.2, 353047.7 6792453, 353051.7 6792454.8, 353096.2 6792464.1, 353099.6 6792464.8, 353101.4 6792465.2, 353102.6 6792477.6, 353105.5 6792509.2, 353105.8 6792514, 353107.6 6792532, 353108.3 6792540.8, 353120.7 6792541.2, 353124 6792583.2, 353123.2 6792612.7, 353116.7 6792616.1, 353116.8 6792622.7, 353117.1 6792635.7, 353121.1 6792635.5, 353161.8 6792632.8, 353184.7 6792629.9, 353298.3 6792620.6, 353311.5 6792619.5, 353325 6792620.2, 353328 6792625.1, 353337.8 6792639.4, 353357.3 6792673.2, 353395.9 6792755.4, 353398.2 6792755.2, 353447.8 6792722.1, 353453 6792718.5, 353481.8 6792696.9, 353497.4 6792714.2, 353535.4 6792716.4, 353557 6792715.9, 353574.7 6792713, 353590.3 6792706.9, 353603.1 6792710.2, 353607.8 6792723.1, 353608.1 6792745.1, 353608.5 6792752.5, 353632.1 6792750, 353672.8 6792739.5, 353689.9 6792735.7, 353737.3 6792726.8, 353763.1 6792724.7, 353810.5 6792723.6, 353804.7 6792696.3, 353845.4 6792686, 353862 6792685.3, 353885.2 6792686.9, 353906.5 6792684.6, 353927.3 6792677.5, 353942.2 6792670.6, 353943.6 6792661.1, 354035.6 6792646.9, 354073.2 6792635.9, 354078 6792640.1, 354086.6 6792650.8, 354092.5 6792651.6, 354094.8 6792538.9, 354095 6792513.9, 354106.5 6792513.3, 354106.1 6792503.5, 354161.2 6792498.8, 354187.3 6792498, 354226.3 6792495.2, 354220.4 6792435.2, 354219.1 6792425.1, 354217.8 6792422.8, 354221.5 6792424.1, 354269.9 6792444.2, 354308.5 6792462.5, 354322.1 6792468.5, 354344 6792483.8, 354360.9 6792498, 354408.3 6792546.9, 354439.9 6792584.3, 354443.6 6792582.3, 354445.6 6792591.5, 354451.6 6792600, 354455.2 6792607.8, 354473.6 6792643.9, 354481.8 6792660.9, 354486.3 6792677.6, 354496.4 6792703.7, 354505.8 6792721.2, 354515.4 6792736.9, 354550.6 6792779.5, 354557 6792794.9, 354563 6792813, 354567.7 6792833.1, 354574.4 6792870.9, 354579.1 6792909.3, 354580.2 6792948.6, 354604.1 6792948.4, 354645.4 6792944.2, 354666.8 6792940.3, 354685.7 6792934.8, 354705.4 6792928.6, 354741.9 6792914.8, 354759.1 6792910, 354861.6 6792894.2, 354901.1 6792890.6, 354914.6 6792919.8, 354927.4 6792939.7, 354957.6 6792981.5, 354986.8 6793017.1, 355019.5 6793052.1, 355035.3 6793071.6, 355050 6793092.3, 355070.6 6793129.3, 355072.1 6793132.3, 355023.2 6793252.7, 355072.9 6793285.6, 355109.3 6793315, 355186 6793345, 355180.1 6793367.2, 355170.4 6793399.2, 355165.5 6793425.1, 355158.5 6793451.5, 355151.9 6793486.5, 355145.7 6793509.7, 355148.2 6793517, 355165.3 6793534.8, 355170.3 6793545.2, 355165.3 6793556.6, 355163.7 6793560.3, 355165.2 6793565.3, 355172.6 6793557.5, 355178.2 6793551.3, 355190.9 6793548.7, 355209.5 6793549.5, 355226.5 6793547.7, 355227.7 6793522.3, 355233.7 6793486.5, 355231.8 6793480.3, 355229.8 6793429.2, 355227 6793415, 355226.5 6793402.3, 355229 6793388.1, 355257.5 6793395.8, 355279.9 6793398.5, 355297.4 6793393, 355300.5 6793389.2, 355309.3 6793378.4, 355313.8 6793363.6, 355313.1 6793354.2, 355335 6793351.8, 355397.8 6793354, 355415.1 6793346.3, 355432.4 6793340.6, 355451 6793343, 355469.9 6793347.2, 355476.1 6793322.8, 355484.5 6793325.3, 355494.8 6793325.1, 355516.4 6793324.5, 355533 6793327.6, 355561.8 6793338.7, 355565.8 6793340.1, 355560.6 6793359.6, 355556.7 6793364.9, 355558.5 6793373.9, 355565.7 6793379.2, 355598.4 6793392.4, 355629.5 6793401.3, 355659.1 6793407.6, 355661.6 6793408.4, 355669.5 6793418.7, 355712.4 6793511.4, 355724.4 6793544.9, 355737.3 6793559.7, 355753.6 6793572.7, 355768.1 6793587, 355775.6 6793598.7, 355786.5 6793620.9, 355796.7 6793663.7, 355794.5 6793665.2, 355795.6 6793673.2, 355806.8 6793704.7, 355813.9 6793720.5, 355823.9 6793735.2, 355848.3 6793763.8, 355857.1 6793777.9, 355863.3 6793778.4, 355868.4 6793793.1, 355882.6 6793823.4, 355890.1 6793843, 355898.5 6793885.5, 355902.7 6793897.4, 355912.7 6793917.4, 355921.1 6793920.9, 355944.9 6793920.9, 356016.6 6793916.5, 356068.9 6793910.7, 356135.6 6793904.2, 356160.3 6793903.5, 356180 6793904.5, 356219.2 6793909.7, 356277.9 6793915, 356294.7 6793915.3, 356293.1 6793853.2, 356292.1 6793775.4, 356292.1 6793773.2, 356290.4 6793696.3, 356290.6 6793641.1, 356290.6 6793632, 356291.4 6793605.9, 356288 6793448, 356284.4 6793360.5, 356282.2 6793302.2, 356279.9 6793289.3, 356281.8 6793263.2, 356281.3 6793212.5, 356276.6 6793159.5, 356271.8 6793126.2, 356265.5 6793089.6, 356251.8 6793034.2, 356242.6 6792997, 356238.3 6792980.1, 356232.9 6792958.5, 356224.4 6792925.2, 356224.4 6792907.7, 356226.5 6792905.6, 356217.2 6792892.3, 356214.6 6792888.4, 356199.8 6792883.3, 356183.2 6792883.9, 356147 6792888.9, 356099.1 6792899, 356037.4 6792910.3, 356005 6792910.7, 355975 6792907.9, 355968 6792910.6, 355952.4 6792907.2, 355918.6 6792902.6, 355901.9 6792895.3, 355892.7 6792885.4, 355889.6 6792881.3, 355881.6 6792865.5, 355861.1 6792813.6, 355838.7 6792758.9, 355835 6792750, 355823 6792720.9, 355798.8 6792662.5, 355787.5 6792632.8, 355777.7 6792607.1, 355767.2 6792581.4, 355754.9 6792550.4, 355749.3 6792536.2, 355719.5 6792463.8, 355701.4 6792418.9, 355679 6792364.4, 355668.1 6792347, 355650 6792323.3, 355638.4 6792309.3, 355618.2 6792288, 355577.4 6792241.4, 355514.2 6792169.5, 355504.1 6792156.2, 355478.9 6792118.7, 355461.1 6792089.1, 355429.6 6792041, 355412 6792011.2, 355394.9 6791984.6, 355386.2 6791971.1, 355358 6791927.6, 355331 6791886.6, 355281.1 6791815.3, 355285.8 6791786.6, 355298.7 6791730.7, 355309.5 6791704.7, 355323.1 6791681, 355329.2 6791671.4, 355344.7 6791653, 355352.3 6791644.3, 355357.2 6791635.3, 355359.1 6791625.5, 355358.9 6791614.1, 355356.4 6791600.7, 355348 6791577.8, 355345.5 6791567.2, 355345.2 6791556.2, 355353.1 6791531, 355372.8 6791494, 355398.8 6791429.7, 355399.7 6791427.4, 355467.9 6791457.7, 355488.3 6791464.8, 355520.8 6791473.3, 355529.3 6791475.6, 355530.2 6791455.2, 355533.9 6791424, 355539.4 6791394.9, 355545.2 6791374.2, 355550.8 6791357.9, 355562.5 6791331.6, 355576.1 6791307.8, 355617.7 6791243.4, 355685.6 6791137.7, 355710.8 6791100.3, 355728.1 6791070, 355747.7 6791029.5, 355759 6790999.9, 355791.7 6790902.6, 355804 6790856.8, 355809.7 6790833.2, 355840 6790730.4, 355859.5 6790654, 355862.1 6790631.5, 355861.3 6790616.1, 355859.1 6790598.6, 355854.1 6790578.8, 355840.9 6790534.2, 355826 6790497.1, 355811.9 6790459.3, 355807.3 6790441.8, 355804.6 6790422.6, 355803.1 6790374.8, 355798.9 6790333.3, 355795.4 6790318.6, 355790.3 6790304.2, 355782 6790290.1, 355775 6790281.2, 355761.9 6790264.8, 355739.7 6790242.4, 355725.7 6790233.2, 355682.4 6790210.5, 355669.2 6790202.4, 355662.4 6790196.6, 355620.3 6790157.5, 355610.2 6790146.4, 355599.8 6790132.7, 355582.5 6790104, 355568.3 6790070, 355560.1 6790044.2, 355550.3 6789971.3, 355539.8 6789919.1, 355528.2 6789885.7, 355519.5 6789868.3, 355511.8 6789848.2, 355501 6789815.7, 355475.4 6789756.1, 355461.5 6789718, 355416.2 6789606.5, 355407.5 6789585.8, 355392.5 6789545.7, 355375.9 6789507.1, 355352.8 6789438.8, 355350.8 6789436, 355347.2 6789416.4, 355335 6789417.9, 355177.9 6789423.4, 355180.1 6789371.5, 355180.5 6789349.2, 355186.4 6789342.9, 355203.9 6789316.7, 355231.6 6789276.9, 355244.4 6789228.7, 355247.9 6789219.4, 355263.1 6789177.1, 355265.3 6789171.1, 355273 6789154.3, 355289.8 6789126.7, 355310.3 6789098.7, 355321.2 6789085.2, 355330.1 6789076.1, 355354.5 6789051.1, 355363.9 6789039.2, 355361.5 6789035.3, 355362.7 6789030, 355357.3 6789022.7, 355349.9 6789014.2, 355345.7 6789006.4, 355328.1 6788975.8, 355322.7 6788964.6, 355318.6 6788951.4, 355315.9 6788940.4, 355314 6788926.6, 355312.5 6788910.5, 355311.5 6788894.8, 355310.7 6788876.7, 355310.4 6788858.3, 355312.3 6788831, 355310.3 6788824.1, 355308.6 6788820.4, 355306.8 6788817.5, 355303.3 6788815.8, 355301.7 6788797.5, 355300.9 6788788.4, 355299.9 6788775.8, 355298.1 6788751.3, 355297.9 6788748.1, 355297.5 6788741.9, 355297.2 6788737.6, 355296.3 6788725.3, 355294.9 6788701.8, 355293.4 6788676.1, 355292.8 6788666.3, 355292.5 6788657.6, 355291.9 6788648.2, 355290.5 6788626.7, 355289.2 6788606.2, 355287.9 6788587.7, 355218.7 6788568.3, 355219.1 6788565.7, 355220.4 6788556.8, 355221.3 6788550.4, 355225.5 6788521.9, 355226 6788518.4, 355228.9 6788498.1, 355230.4 6788487.9, 355231.3 6788482, 355232 6788476.6, 355233.5 6788466.2, 355233.7 6788465.1, 355234.2 6788461.9, 355257.8 6788463.4, 355260.4 6788456.7, 355293.2 6788372.1, 355330.9 6788275.1, 355340.1 6788274.1, 355341.4 6788264.8, 355342.5 6788257.6, 355346.6 6788228.4, 355347.8 6788221, 355349.1 6788211.4, 355354.8 6788169.1, 355355.6 6788163.1, 355386.2 6788120.9, 355396.5 6788123.6, 355410.2 6788130.5, 355453.8 6788073.1, 355549.4 6788008.5, 355561.4 6788016.9, 355565.9 6788020.1, 355575.6 6788014.2, 355586 6788004.9, 355594.8 6787995.1, 355606.5 6787988.2, 355621.5 6787986.2, 355649.9 6787986, 355658.7 6787986, 355662.2 6787983.8, 355672.9 6787977.2, 355680.1 6787972.7, 355719.8 6787947.5, 355729.3 6787937.6, 355755.6 6787903.5, 355757.8 6787900.7, 355765.3 6787895.2, 355767.4 6787893.5, 355778.8 6787888.3, 355792.9 6787882.8, 355868.4 6787853.7, 355880.6 6787845.7, 355898.4 6787830.1, 355921.6 6787819, 355948.7 6787807.5, 355951.3 6787806.5, 355921 6787754.7, 355911.9 6787739, 355900.3 6787740.9, 355893.1 6787742, 355876.6 6787692, 355866.9 6787666.4, 355864.9 6787661.2, 355862.4 6787654.4, 355847.5 6787622.1, 355831.2 6787590.5, 355830.5 6787586.2, 355826.4 6787546.5, 355824.1 6787532, 355816.9 6787516, 355819.2 6787500.6, 355817.2 6787456.9, 355820.6 6787439.1, 355819.3 6787356.4, 355818.3 6787296, 355816 6787269.8, 355801.9 6787255, 355788.5 6787241.6, 355786.1 6787228, 355789 6787228.8, 355795.3 6787227.6, 355787.8 6787204.8, 355778.6 6787176.5, 355776.5 6787169.9, 355772.9 6787158.7, 355770.2 6787150.5, 355753.4 6787084.2, 355741.2 6787035.8, 355736.8 6787018.1, 355731.3 6786994.2, 355723.9 6786956.5, 355720.8 6786935.1, 355722.2 6786916.8, 355722.2 6786902.1, 355722.2 6786885.5, 355727.3 6786882.4, 355726.5 6786878, 355725.5 6786872.7, 355722.7 6786858.8, 355719.7 6786843.9, 355707.8 6786820.1, 355701.4 6786798.8, 355695.8 6786787.4, 355693.7 6786781.9, 355682.3 6786757.9, 355682.8 6786744.4, 355669.2 6786707.2, 355655 6786668.7, 355668.3 6786660.8, 355683 6786652.2, 355671.7 6786629.7, 355662.2 6786634.1, 355646.4 6786643.1, 355639.8 6786642.7, 355624.9 6786627.9, 355591.8 6786597, 355587.2 6786582.8, 355591.9 6786552.9, 355584.9 6786543.3, 355571.8 6786532.4, 355566.3 6786527.6, 355559.6 6786524.5, 355550.7 6786521.7, 355540.9 6786517, 355532.7 6786509.2, 355531.9 6786504.3, 355521 6786497, 355502.3 6786471.1, 355464.3 6786443.5, 355430.3 6786425, 355412.1 6786413.7, 355391.3 6786403.2, 355376.7 6786399.5, 355361.5 6786399.6, 355344.2 6786403.9, 355257.5 6786435.2, 355232.7 6786437.9, 355220.9 6786431.8, 355187.3 6786426, 355169.6 6786419.1, 355153.4 6786411.5, 355106.5 6786380, 355061.9 6786359.1, 355048.6 6786351.1, 355077.5 6786265.6, 355060.5 6786265.5, 355060.5 6786228.6, 355054.9 6786168.5, 355049.6 6786169.5, 355042.5 6786108.3, 355017.7 6786113.9, 355008.1 6786108.4, 354996.8 6786094.2, 354972.4 6786114.4, 354962.8 6786117.6, 354951.4 6786118.8, 354940.9 6786125.3, 354931.1 6786134.4, 354923.7 6786136.8, 354918.9 6786135.8, 354912.9 6786134.5, 354903.9 6786130.3, 354855.2 6786140.2, 354850.7 6786100.7, 354846.9 6786089.7, 354836.2 6786074.4, 354835 6786072.4, 354837.5 6786064, 354850.3 6786043.7, 354851 6786042.5, 354827.3 6785964.9, 354813 6785965.9, 354805 6785966.8, 354798 6785969.4, 354794.2 6785970.9, 354785.6 6785971.4, 354748.6 6785962.8, 354729 6785967.9, 354716.2 6785968.3, 354676.5 6785967.9, 354670.1 6785964.4, 354662.1 6785954.9, 354656.6 6785943.9, 354651.2 6785937.9, 354643.6 6785929.1, 354642.7 6785928.1, 354613.3 6785927.6, 354601.5 6785924.9, 354593.6 6785920.6, 354591.8 6785912, 354595.6 6785901, 354603.7 6785895.5, 354610.6 6785878.9, 354617.7 6785871.8, 354619.1 6785863.8, 354617.8 6785842.8, 354613.3 6785837.7, 354609.1 6785838.3, 354599.8 6785839.6, 354568.7 6785852.7, 354558.3 6785854.6, 354549.3 6785852.1, 354506.9 6785848.9, 354495.7 6785852.8, 354484.8 6785861.8, 354475.7 6785866.3, 354425.2 6785854, 354413 6785854.1, 354403.5 6785834.8, 354384.1 6785801.9, 354376.5 6785795.1, 354340.9 6785774.7, 354335.3 6785765.8, 354335.3 6785760.8, 354363.8 6785745.5, 354348.4 6785729, 354346.5 6785726, 354344.2 6785723.3, 354334.7 6785713.7, 354331.8 6785711.7, 354326.5 6785708.4, 354313.2 6785704.4, 354299.7 6785698.2, 354286.9 6785688.5, 354273.8 6785681.6, 354268.2 6785679.7, 354262.1 6785678.9, 354259 6785678.7, 354254.2 6785679.2, 354247.1 6785680, 354240.7 6785681.4, 354231.3 6785685, 354220.3 6785687.6, 354215.7 6785689.7, 354212.9 6785691.4, 354204.4 6785693.9, 354195.2 6785689.7, 354182.5 6785687.2, 354168.4 6785681.9, 354151.1 6785672.4, 354131.6 6785663.7, 354121.4 6785672, 354094.1 6785694.7, 354070.3 6785688.4, 354056.3 6785688.9, 354041.1 6785695, 354029.5 6785699.7, 354016.4 6785703.5, 354003.6 6785703.8, 353990.4 6785700.8, 353975.7 6785694.4, 353960.6 6785691.1, 353953.5 6785691.6, 353930.2 6785690.5, 353918 6785692, 353906.7 6785695.4, 353883.1 6785697.1, 353852.6 6785702.4, 353850.1 6785707, 353846.8 6785739.4, 353843.2 6785755.5, 353837.5 6785769.6, 353831.6 6785774.4, 353805.6 6785778.8, 353798.7 6785783.7, 353793.7 6785794.2, 353790.3 6785819.2, 353778.5 6785825.9, 353759.9 6785799.7, 353734.2 6785772.8, 353730 6785776.4, 353704 6785798.5, 353710.6 6785829.5, 353716.4 6785849.1, 353716.6 6785862.9, 353716.1 6785877.2, 353717.2 6785889, 353717.7 6785894.1, 353716.3 6785903.4, 353710.1 6785909.5, 353701.8 6785915.6, 353698.6 6785921.4, 353694.4 6785927.3, 353691 6785929.6, 353680.3 6785934.3, 353675.2 6785934.6, 353656.8 6785932.3, 353644.3 6785930.8, 353629.7 6785930.8, 353614.3 6785928.8, 353593.8 6785930.1, 353562.5 6785928.9, 353555.3 6785929.4, 353547.7 6785928.2, 353531.2 6785919.4, 353524.4 6785916, 353514.3 6785914.8, 353502.3 6785909.6, 353500.9 6785893.9, 353499.6 6785893.6, 353479.5 6785890, 353472.1 6785890.6, 353415 6785882.3, 353387.3 6785876.9, 353366.7 6785873.8, 353350.7 6785874.8, 353338.7 6785878.2, 353333.2 6785883, 353329 6785891.2, 353328.9 6785897.4, 353329.7 6785910.8, 353332.8 6785920.4, 353333.4 6785931.8, 353333.2 6785937.2, 353330 6785942.7, 353324.2 6785947.9, 353322.8 6785963.1, 353323.6 6785969.2, 353339.4 6785977.2, 353339.1 6785982.5, 353336.7 6786011.5, 353321 6786012.1, 353311.9 6786016.1, 353306.9 6786020.1, 353297.2 6786027.8, 353293 6786030.9, 353289.7 6786032.1, 353284.2 6786033.9, 353270.2 6786036.3, 353271.3 6786040.3, 353228.3 6786034.2, 353228.8 6786038.7, 353237.2 6786055.4, 353231.2 6786070.7, 353180.7 6786056.8, 353173.9 6786055, 353173 6786048.1, 353166.8 6786034.8, 353161.7 6786033.3, 353159 6786032.8, 353154.5 6786037.2, 353145.9 6786040.8, 353142.6 6786040.4, 353137.5 6786036.6, 353126.8 6786031.9, 353098.1 6786080.6, 353028.4 6786075.8, 353011.1 6786074.6, 352991.5 6786060, 352986.8 6786056, 352978.9 6786046, 352973.7 6786035.1, 352975 6786018, 352979 6786008, 353017.1 6785904.4, 353024.9 6785877.7, 353021 6785818.4, 353024.8 6785811.3, 353034.5 6785722.1, 353046.7 6785663.4, 353051.3 6785645.4, 353069.6 6785597, 353077.1 6785580, 353086.9 6785545.3, 352982.4 6785518.5, 352927.6 6785508.7, 352755.5 6785468.7, 352729.1 6785464.2, 352715.8 6785461.9, 352668.4 6785458.8, 352581.6 6785457.5, 352544.4 6785456.9, 352513.1 6785456.2, 352424.7 6785454.3, 352369.2 6785453.5, 352316.9 6785454.4, 352323.5 6785485.8, 352252.7 6785496.9, 352240.1 6785498.7, 352215.1 6785499.6, 352215.7 6785508, 352199.2 6785513.4, 352177.4 6785522.9, 352155.2 6785538.3, 352151.2 6785540.1, 352144.6 6785543.3, 352116.6 6785565.1, 352107.1 6785569.1, 352101.6 6785575.4, 352097.5 6785576.4, 352093.9 6785576.2, 352087.4 6785573.3, 352075 6785565, 352066.4 6785561.2, 352047.5 6785558.2, 352038.3 6785559.2, 352036.3 6785559.3, 352030.7 6785559.7, 352020.1 6785560.5, 352012.2 6785558.2, 352001.4 6785555.1, 351961.6 6785549.1, 351915.7 6785540.2, 351876.6 6785534.8, 351832.6 6785532.3, 351780.7 6785531.1, 351769.1 6785530.8, 351760 6785645, 351758.2 6785668.2, 351744.1 6785845.5, 351742.8 6785862.1, 351740.5 6785890.2, 351735.3 6785957.3, 351742 6785967.4, 351732.2 6785982, 351727.3 6785980.9, 351720 6785986.3, 351716.7 6785990.9, 351712.9 6785996.1, 351695 6786037.5, 351692.8 6786046.1, 351691.6 6786070.2, 351662 6786065.3, 351652.6 6786066.2, 351635.9 6786063.7, 351624.6 6786059.9, 351618.9 6786056.3, 351606.1 6786048.4, 351587.7 6786032.2, 351585.2 6786029, 351575.8 6786017.2, 351571.8 6786012.4, 351564.7 6786007.4, 351561.2 6786001.5, 351558 6785981.1, 351552.5 6785977.4, 351535.5 6785973.3, 351517.7 6785960.9, 351502.4 6785954.5, 351493.6 6785952.5, 351416.4 6785933.7, 351403.8 6785908.5, 351397 6785897.3, 351368 6785887, 351359.8 6785885.7, 351342 6785886.6, 351310.5 6785891.2, 351300.2 6785892.9, 351284.7 6785901.3, 351280.7 6785905.3, 351276.8 6785909.2, 351269.9 6785918.2, 351260.5 6785926.2, 351252.7 6785930.1, 351219.9 6785929.5, 351160 6785923.7, 351138.6 6785928.2, 351123.5 6785937.7, 351114.6 6785940.1, 351104.7 6785938.9, 351083.6 6785931.4, 351072.6 6785931.4, 351065.9 6785931.5, 351053.7 6785932.1, 351021.2 6785933.8, 351004.8 6785934.7, 350967.6 6785936.7, 350966.1 6785939.7, 350956.3 6785959.4, 350951.6 6785967.6, 350939.1 6785982.4, 350919.5 6786005.5, 350917.4 6786007.9, 350904.7 6786023, 350896.2 6786033, 350891.1 6786039, 350889.5 6786040.8, 350865.1 6786052.8, 350863.2 6786042.6, 350858.1 6786037.6, 350844 6786032.4, 350838.6 6786026.7, 350813.7 6786018.4, 350808.7 6786018.2, 350792.2 6786029.7, 350786.6 6786033.6, 350759.8 6786043.2, 350751.9 6786045.4, 350748 6786046.1, 350739.6 6786047.8, 350729.5 6786049.1, 350725.8 6786048.9, 350709.6 6786048.3, 350682.7 6786051.8, 350673.8 6786055.2, 350665.4 6786058.5, 350663.4 6786048.5, 350655.1 6786007.9, 350650.8 6785986.8, 350615.3 6785983, 350608.4 6785982.2, 350594.5 6785979.4, 350587.1 6785977.2, 350582.4 6785975.7, 350578.3 6785974.5, 350549.5 6785965.8, 350544.5 6785966.7, 350534.9 6785969.9, 350508.2 6785975.2, 350491.9 6785976.7, 350483.7 6785977.3, 350459.6 6785972.7, 350448.1 6785969.7, 350438.7 6785968.6, 350434.4 6785968.3, 350424.7 6785967.5, 350282.4 6785976.3, 350270.5 6785981.6, 350251.8 6785993.9, 350131.5 6786060.6, 350128 6786074.9, 350118.3 6786097.6, 350114.7 6786102.6, 350104.8 6786110.8, 350098.7 6786114.2, 350075.1 6786113.7, 350049.3 6786108.3, 350031.9 6786103, 350015.7 6786094.4, 350007.8 6786097, 350003.2 6786103.3, 349974 6786140.4, 349962.6 6786151.9, 349955.7 6786152.6, 349948.6 6786150.7, 349939.4 6786143.9, 349922.6 6786142.9, 349932.5 6786154.6, 349940.7 6786167.8, 349950 6786186.9, 349956 6786204.5, 349957 6786211, 349956.2 6786217.9, 349950.7 6786230.6, 349949.9 6786235, 349951.2 6786242.8, 349984.3 6786324.8, 349992.9 6786350.9, 350022.1 6786399.5, 350058.6 6786448.2, 350196.3 6786523.1, 350200.7 6786525.5, 350236.7 6786545.1, 350259.4 6786557.4, 350269.8 6786564.9, 350278.8 6786571.3, 350283.7 6786574.8, 350315.5 6786597.6, 350328.6 6786607, 350380.8 6786644.3, 350381.9 6786646.9, 350385.4 6786652.8, 350391.2 6786657.9, 350403.1 6786662.8, 350499.2 6786676.8, 350504.6 6786679.2, 350508.4 6786684.3, 350532 6786674.8, 350552.9 6786667.5, 350564.2 6786659, 350567.3 6786655.1, 350569.6 6786647.9, 350568 6786626.3, 350621.1 6786618.4, 350665.2 6786619.2, 350675.2 6786645.5, 350695.4 6786645.9, 350720 6786646.4, 350729.6 6786646.6, 350743 6786647.6, 350780.2 6786650.6, 350780.6 6786655.5, 350782.4 6786676.3, 350783.3 6786687.1, 350784.3 6786699, 350785.2 6786709.5, 350786.9 6786730.6, 350788.1 6786744.1, 350787.4 6786839.5, 350789.9 6786848.2, 350794.1 6786863.2, 350794.8 6786865.6, 350796.4 6786871, 350810.2 6786926.2, 350817.7 6786941.1, 350828 6786982.3, 350824.4 6786994.6, 350823.6 6787005.4, 350819.8 6787022, 350817.8 6787038.6, 350819.3 6787041.6, 350838.2 6787082.2, 350906.1 6787225.7, 350923.9 6787264, 350960.7 6787341.4, 350966.8 6787354.3, 350985.6 6787395, 350999.5 6787426.1, 351021.4 6787482.9, 351027.7 6787498.4, 351035 6787516.3, 351066.5 6787594.1, 351096.3 6787669.1, 351114.6 6787709.6, 351095.2 6787716.4, 351084.4 6787720.1, 351083.1 6787720.5, 351084.2 6787727.6, 351082.5 6787727.9, 351076.9 6787728.7, 351038.5 6787737.5, 351032.2 6787739.1, 350999.8 6787747.1, 350988.3 6787749.9, 350975.7 6787753.1, 350968 6787750, 350946.3 6787741.2, 350938.3 6787758.2, 350934.6 6787766.3, 350933.9 6787767.7, 350897.3 6787755.3, 350893.5 6787765.4, 350878.5 6787765.3, 350865.6 6787765.3, 350854.7 6787766.2, 350831.2 6787781.5, 350819.8 6787789.2, 350799 6787804.2, 350781 6787815, 350779.2 6787810.6, 350775.5 6787805.2, 350766.5 6787810.3, 350752.6 6787818.2, 350738.7 6787826, 350732 6787824.3, 350694.1 6787821.9, 350634.2 6787819, 350592.9 6787813.1, 350589.7 6787812.6, 350549.1 6787806.8, 350540.5 6787805.8, 350524.2 6787804.2, 350491.2 6787800.8, 350491.5 6787806.9, 350486.3 6787806.4, 350484.2 6787805.4, 350439.2 6787801, 350436.4 6787788.7, 350405.7 6787780.4, 350309.2 6787757.2, 350303 6787755.7, 350232.3 6787736.5, 350189.9 6787730.7, 350070.2 6787714.2, 350041 6787710.3, 350000.3 6787704.7, 349867.2 6787686.4, 349789 6787670.5, 349729.9 6787657.9, 349552.8 6787620, 349549.2 6787619.5, 349532.6 6787616.8, 349528.1 6787616.6, 349519.3 6787616.1, 349513.8 6787615.7, 349511.2 6787614.5, 349497.6 6787608.2, 349479.3 6787598.4, 349336.4 6787520.7, 349328.5 6787516.4, 349319.3 6787511.4, 349318 6787510.7, 349310.8 6787506.8, 349276.1 6787480.1, 349215 6787433.1, 349209.8 6787426.6, 349201.8 6787419.4, 349171.1 6787398.2, 349145.2 6787387, 349127.2 6787381.9, 349103.6 6787371.3, 349058.5 6787353.9, 349024.4 6787338.7, 348970.8 6787319.3, 348877.3 6787280.6, 348821.1 6787247.5, 348780.5 6787216.7, 348699.8 6787147.2, 348651.3 6787103.3, 348585.8 6787043.4, 348533.1 6787000.5, 348529.3 6786997.5, 348524.7 6786993.8, 348466.1 6786947.4, 348451.6 6786933.1, 348434.9 6786911.9, 348388.2 6786841.9, 348369.2 6786808, 348364.7 6786790.7, 348364.9 6786775.4, 348360 6786772.1, 348350.4 6786757.6, 348347.6 6786752.8, 348343.6 6786755.8, 348341.6 6786757.3, 348321 6786778.2, 348308.7 6786785.9, 348301.7 6786787.4, 348286.1 6786788.3, 348266.8 6786793.6, 348261.6 6786796.7, 348247.3 6786805.9, 348237.2 6786815.6, 348217.3 6786790.8, 348203.1 6786772.8, 348165.8 6786748.6, 348098.7 6786710.8, 348113 6786686.6, 348150.7 6786606.9, 348154 6786597.4, 348131.1 6786588, 348096.7 6786569.4, 348086 6786561.7, 348080.3 6786567, 348038.3 6786549.4, 348035.2 6786553, 348018.5 6786543.7, 347986.7 6786530.9, 347956.3 6786519.5, 347917.6 6786502.3, 347924.5 6786490.7, 347873.1 6786473.8, 347777.2 6786445.2, 347750.1 6786434.2, 347733.9 6786425.6, 347720.6 6786419.2, 347699.4 6786411.3, 347637.1 6786390.3, 347625.9 6786386.8, 347619.8 6786384.7, 347598.3 6786377.1, 347559.1 6786359.4, 347540 6786349.3, 347508 6786326.7, 347473.4 6786307.3, 347452.8 6786297.4, 347407 6786277.7, 347388.3 6786268.8, 347354.8 6786248.7, 347307.4 6786223.2, 347300.6 6786220.1, 347280.5 6786211, 347274.2 6786208.2, 347236.3 6786187, 347230.8 6786182.8, 347192 6786154.3, 347168.6 6786139.6, 347142.1 6786120.2, 347129.4 6786114.1, 347121.5 6786108.3, 347117.2 6786114.3, 347108.3 6786120.4, 347092.6 6786133, 347057.8 6786152.9, 347048.9 6786158.6, 347029.3 6786175.6, 347019.8 6786181.9, 346959.6 6786222.3, 346956.1 6786224.7, 346857.4 6786237.6, 346834.9 6786240.5, 346705 6786256.3, 346643 6786262.6, 346621.7 6786267.8, 346607.3 6786271.7, 346480.7 6786318.1, 346434.2 6786336.5, 346409.9 6786346.1, 346401.6 6786349.3, 346387.4 6786354.9, 346398 6786395.7, 346417.1 6786435.2, 346439.2 6786486.7, 346463.4 6786549.1, 346469.2 6786582.3, 346479.1 6786590.5, 346501 6786607.6, 346517.7 6786618.5, 346528 6786633.7, 346543.6 6786686.5, 346545.7 6786703.3, 346545.3 6786712.6, 346545.2 6786714.7, 346544.2 6786722.3, 346543.4 6786729.4, 346541.2 6786733.3, 346536.7 6786741.5, 346525.9 6786755.5, 346522.8 6786757.2, 346470.4 6786784.9, 346464.9 6786789.7, 346462.9 6786791.6, 346452.4 6786800.6, 346450 6786802.7, 346437.5 6786812.9, 346424.2 6786821.6, 346416.4 6786845.7, 346385.3 6786904.8, 346370.8 6786937, 346357 6786988.6, 346357.8 6787012, 346361.5 6787051.5, 346373.8 6787094.3, 346381.4 6787133.8, 346386.3 6787167.8, 346406.1 6787244.7, 346424.7 6787327, 346440.6 6787417.3, 346456.3 6787454.6, 346486.6 6787493.3, 346516.2 6787521.9, 346536.4 6787539.8, 346629.2 6787602.9, 346652.1 6787627.5, 346679.4 6787652.1, 346716.9 6787691.5, 346783.5 6787747.3, 346805.1 6787767.5, 346825 6787795.9, 346842.9 6787826.1, 346847.1 6787844.2, 346853.6 6787858, 346857.9 6787870.7, 346859.8 6787908.4, 346859.2 6787922.2, 346862.4 6787935.1, 346868.2 6787948.7, 346876.8 6787962.9, 346907.7 6788003.9, 346923.9 6788018.4, 346946.5 6788042, 346962 6788069.3, 347017.4 6788134.4, 347061 6788207.4, 347067.3 6788218.4, 347096.3 6788255.8, 347121.1 6788282, 347126.4 6788291.3, 347135.5 6788285.4, 347143.1 6788283, 347152.7 6788279.6, 347165.3 6788273.6, 347186.4 6788264.4, 347191.4 6788262.2, 347210 6788257.3, 347217.1 6788262.9, 347222.3 6788294.4, 347224.1 6788305.9, 347222.3 6788319.6, 347220.2 6788334.5, 347219.7 6788339.9, 347219.1 6788349.8, 347218.8 6788356.1, 347215.4 6788368.4, 347250 6788395.4, 347265.2 6788404.4, 347306.4 6788432.6, 347335.4 6788444.3, 347349.5 6788447.7, 347396.2 6788465.9, 347415.2 6788473.7, 347424.2 6788477.4, 347439.2 6788485.7, 347470.7 6788498.2, 347507.5 6788510.5, 347538 6788522.3, 347575.4 6788533.7, 347624.4 6788552, 347640.1 6788564.7, 347675.4 6788593.4, 347683 6788599.6, 347698.9 6788612.5, 347720.6 6788630.1, 347731.4 6788638.9, 347743 6788648.2, 347752.5 6788656, 347767.6 6788668.3, 347808 6788700.9, 347834.4 6788722.3, 347809.1 6788869.4, 347784.2 6788883.7, 347762.1 6788875.8, 347754.2 6788898.5, 347696.5 6788913.1, 347689.3 6788945.9, 347696.6 6788948.6, 347694 6788963.3, 347684.7 6788996.2, 347699.1 6789009.1, 347698.1 6789016.9, 347693.7 6789029.3, 347669.4 6789097.7, 347696.4 6789151.9, 347698.7 6789152.5, 347703 6789153.6, 347710 6789157.8, 347713.2 6789162, 347716.6 6789168.5, 347718.3 6789178.8, 347717.3 6789191.8, 347708.6 6789211.4, 347707.3 6789213.5, 347702.8 6789221.1, 347706.7 6789227.3, 347708.6 6789233.9, 347708.4 6789253.3, 347697.2 6789354.1, 347692.2 6789393.7, 347691.1 6789401.3, 347691.7 6789409.7, 347746.9 6789415, 348061.3 6789443.2, 348096.5 6789448.1, 348216.1 6789458.2, 348289.4 6789463.6, 348297.3 6789469.4, 348304.3 6789477.5, 348314.7 6789493.8, 348322.1 6789510.3, 348322 6789526.1, 348319 6789533.9, 348312.1 6789543.4, 348305.4 6789549.2, 348287.6 6789559.3, 348278.6 6789566.5, 348272.3 6789575, 348264.6 6789590.4, 348251.1 6789632.7, 348236.7 6789668.8, 348232.2 6789681.3, 348227.2 6789701.3, 348223.3 6789731.1, 348216.1 6789761.2, 348204.7 6789803.7, 348194.7 6789830.2, 348186.6 6789845.3, 348154.8 6789904.8, 348125.7 6789947.6, 348125.4 6789953.2, 348127.1 6789957, 348135.7 6789968.3, 348156.9 6789987.4, 348224 6790033.1, 348246.5 6790050.5, 348316.2 6790104.9, 348363.6 6790137.6, 348392.6 6790149.1, 348447.7 6790160.9, 348459.7 6790164.8, 348469.5 6790172.1, 348534.3 6790147.9, 348544.7 6790168.3, 348573.9 6790233.8, 348581.3 6790248.1, 348589.2 6790261.8, 348605.9 6790290.8, 348622.9 6790326, 348631.7 6790348.7, 348633.8 6790356.5, 348644.8 6790398.2, 348648 6790415.9, 348653 6790473.6, 348661.7 6790523.8, 348667.2 6790546.8, 348669.6 6790559.4, 348670.5 6790564.4, 348672.1 6790577.9, 348678.9 6790592.8, 348696.3 6790640.7, 348700.6 6790647.8, 348708.1 6790654, 348687.4 6790678, 348674.9 6790689.6, 348663.7 6790697.5, 348650 6790707.3, 348597.4 6790734.4, 348574.4 6790744.5, 348537.9 6790760.6, 348471 6790786.5, 348388.6 6790816.3, 348320.2 6790841.6, 348288.8 6790856.1, 348263.2 6790872.4, 348287.8 6790909.5, 348300.9 6790926.5, 348336.4 6790978.1, 348348.8 6790996.3, 348390.9 6791063.6, 348399 6791083.6, 348404 6791087.1, 348382.2 6791106.2, 348375.8 6791109.3, 348354.2 6791111.8, 348346.2 6791114.6, 348346 6791140.4, 348342.6 6791147.4, 348336.5 6791153.5, 348320.8 6791164.4, 348301.5 6791189.8, 348279.6 6791209, 348273 6791213.8, 348265.1 6791217.3, 348250.1 6791218.5, 348247.7 6791220.9, 348246.1 6791242.5, 348243.9 6791246, 348231.4 6791255.4, 348190 6791281.1, 348132.3 6791318.6, 348117.4 6791324.9, 348097.4 6791334.9, 348079.9 6791342.9, 348064.3 6791349.3, 348052.1 6791355.2, 348044.7 6791358.9, 347908 6791464.1, 347892.9 6791473.5, 347894.6 6791478.5, 347901 6791498.8, 347892.6 6791503.9, 347882.8 6791513, 347867.5 6791524.3, 347841 6791548.5, 347830.8 6791559.6, 347818.4 6791567.7, 347803.9 6791576.4, 347795 6791578, 347769.1 6791612.4, 347760.6 6791624.3, 347748 6791646.7, 347743.7 6791653.7, 347716.4 6791676, 347680.8 6791701.5, 347629.3 6791732.9, 347640.7 6791762.1, 347590.5 6791798.6, 347628.3 6791873.8, 347645.2 6791929.8, 347657 6791952.4, 347662.4 6791962.5, 347688.5 6792033.5, 347698 6792063.3, 347728 6792067.6, 347762.3 6792200.9, 347788 6792191.1, 347863.2 6792170.7, 347869 6792196.5, 347892 6792275.5, 347978.4 6792250.8, 347987.5 6792270.3, 348008.7 6792338.1, 348029.5 6792337.1, 348045.6 6792332.5, 348064 6792321.2, 348076.6 6792334, 348093.9 6792365.6, 348108.8 6792369, 348123 6792363.3, 348141.7 6792353.3, 348162.4 6792338.5, 348175.9 6792333, 348192.1 6792328.3, 348228.9 6792325, 348249 6792324.7, 348256.6 6792322.2, 348260.9 6792315.9, 348265 6792306.5, 348276.3 6792298, 348284.8 6792293.2, 348299.4 6792287.5, 348314.1 6792278.2, 348319.6 6792280.1, 348346.2 6792297.6, 348353.3 6792300.9, 348359.1 6792302.3, 348363.5 6792301.1, 348368.6 6792298.9, 348383.2 6792287.9, 348389.4 6792283.4, 348400.3 6792272.3, 348410 6792259.8, 348421.1 6792251.4, 348436.4 6792243.7, 348463 6792233.6, 348473.5 6792227.2, 348496.8 6792206, 348508.5 6792195.5, 348518.9 6792220, 348526.8 6792243.4, 348529.1 6792255.3, 348529.4 6792288.2, 348533.6 6792346.2, 348532.7 6792374.2, 348532.4 6792386.8, 348530.9 6792394.4, 348525 6792409.1, 348529.1 6792450.9, 348530.5 6792465.8, 348519.8 6792497.6, 348516.9 6792519.4, 348513.9 6792536.2, 348514.8 6792551.4, 348514.2 6792565.3, 348513.8 6792574, 348514.3 6792595.3, 348509.8 6792620.2, 348523.6 6792619.9, 348538.7 6792623.9, 348559.5 6792624.1, 348546 6792649.7, 348522.9 6792688.5, 348514.3 6792702.2, 348502.9 6792716.6, 348512.6 6792739.5, 348544.9 6792817.7, 348546.4 6792821.4, 348579.1 6792902.3, 348585.4 6792915, 348589.6 6792936.7, 348595.6 6792949.9, 348614 6792975, 348643.7 6793008.1, 348674.4 6793047.9, 348697 6793079, 348705.5 6793093.9, 348716.1 6793103.4, 348740.2 6793125.9, 348755.2 6793144, 348772.4 6793160.8, 348871.1 6793097.5, 348886.7 6793111.8, 349081 6793013.3, 349119.5 6792995.8, 349152.1 6792979.1, 349159 6792975.6, 349182.5 6792962, 349188.8 6792956.7, 349204 6792962.8, 349217.2 6792967.5, 349239.5 6792967.8, 349271.4 6792962.9, 349295.9 6792956.3, 349313 6792950.7, 349319.4 6792950.8, 349331.6 6792951.1, 349359.3 6792961.4, 349381.9 6792966.3, 349400.3 6792970.3, 349410 6792950.9, 349578.8 6793009, 349608 6793018.9, 349625.8 6793015.8, 349660.2 6793014, 349664.8 6792932.5, 349718.6 6792937, 349741 6792940.5, 349762.8 6792941.5, 349769.3 6792946.6, 349780.1 6792956.3, 349825.1 6792974.4, 349832.2 6792982.7, 349933.4 6793026.8, 349983.5 6793050.4, 349983.6 6793058, 349985.4 6793055.5, 350029 6793066.1, 350050.5 6793069.2, 350088.8 6793072.1, 350144.3 6793073.4, 350177.3 6793072.6, 350189.3 6793070.9, 350250.5 6793059.7, 350272.5 6793053.4, 350278.2 6793051.8, 350298.9 6793043.9, 350316.1 6793038.2, 350334.4 6793034.9, 350351 6793033.7, 350415.5 6793043, 350440.8 6793048.3, 350450.4 6793012, 350454.2 6792998.3, 350466.4 6792946.1, 350469.4 6792932.7, 350485 6792881.9, 350488.8 6792868, 350506.4 6792824.1, 350552.5 6792726.8, 350556 6792719.6, 350557.9 6792715.4, 350568.1 6792694.9, 350618.5 6792606.2, 350628.2 6792588.7, 350655.1 6792538.3, 350677.8 6792492.2, 350680.4 6792486.8, 350686.3 6792474.6, 350689.3 6792468.1, 350691.2 6792464.1, 350693.2 6792460, 350713.6 6792413.5, 350722.5 6792390.4, 350736.7 6792350.4, 350758.5 6792277.5, 350766.3 6792255.1, 350776.5 6792231.7, 350798.2 6792192.8, 350802.9 6792184.5, 350832.4 6792139, 350836.1 6792133.4, 350891.2 6792048.5, 350929 6791990.1, 350942.2 6791969.8, 350947.9 6791960.8, 350953.7 6791953.8, 350970.5 6791933.2, 351005.1 6791895.5, 351011.2 6791888.7, 351031.4 6791869.3, 351034 6791866.6, 351041.3 6791859.2))""")
+        _sio = AbstractGeoDataFrameDemos._dataset(
+            "GeoDataFrameDemosD", "villeDeRennes.csv"
+        )
         return GeoDataFrameLib.read_csv(_sio)
 
     @staticmethod
     def intraPeripheriqueRennes():
-        _sio = StringIO("""geometry
-POLYGON ((348847.70000000001164153 6790471.90000000037252903 50.89999999999999858, 348957.70000000001164153 6790417.79999999981373549 46, 348961.40000000002328306 6790416 45.89999999999999858, 348963.09999999997671694 6790415 45.79999999999999716, 348966.09999999997671694 6790413.70000000018626451 45.79999999999999716, 348968.5 6790412.5 45.89999999999999858, 348968.20000000001164153 6790418.29999999981373549 46.89999999999999858, 348968.40000000002328306 6790423.59999999962747097 45.79999999999999716, 348970.29999999998835847 6790422.79999999981373549 45.79999999999999716, 348972.5 6790421.79999999981373549 45.79999999999999716, 348973.5 6790437.90000000037252903 51.60000000000000142, 348973.79999999998835847 6790439.70000000018626451 51.70000000000000284, 348974.59999999997671694 6790446 51.70000000000000284, 348975.40000000002328306 6790457 51.79999999999999716, 348979.29999999998835847 6790480.40000000037252903 52, 348990.59999999997671694 6790544.09999999962747097 52.5, 348991.70000000001164153 6790548.79999999981373549 52.60000000000000142, 348992.5 6790552.29999999981373549 48.79999999999999716, 348994.40000000002328306 6790559.40000000037252903 52.70000000000000284, 348999.40000000002328306 6790574.20000000018626451 52.79999999999999716, 349002.20000000001164153 6790585.09999999962747097 52.79999999999999716, 349004.40000000002328306 6790590.70000000018626451 52.79999999999999716, 349010.59999999997671694 6790609.70000000018626451 52.89999999999999858, 349015 6790632.90000000037252903 51.79999999999999716, 349021.20000000001164153 6790651.90000000037252903 50.89999999999999858, 349028.20000000001164153 6790667.79999999981373549 51, 349036.90000000002328306 6790687.20000000018626451 51.20000000000000284, 349050.40000000002328306 6790718.29999999981373549 52.60000000000000142, 349062.40000000002328306 6790743.09999999962747097 53.89999999999999858, 349075 6790763.90000000037252903 54.29999999999999716, 349077.90000000002328306 6790768.20000000018626451 54.39999999999999858, 349081.5 6790773.79999999981373549 54.39999999999999858, 349085.20000000001164153 6790779.70000000018626451 54.39999999999999858, 349096.79999999998835847 6790797.29999999981373549 53.79999999999999716, 349122.90000000002328306 6790831 52.79999999999999716, 349127.40000000002328306 6790836.79999999981373549 52.79999999999999716, 349140 6790855.59999999962747097 52.79999999999999716, 349142.79999999998835847 6790863.09999999962747097 52.79999999999999716, 349144.90000000002328306 6790870 52.89999999999999858, 349145.90000000002328306 6790881.20000000018626451 53, 349143.20000000001164153 6790898.20000000018626451 53, 349132.59999999997671694 6790918.29999999981373549 53.20000000000000284, 349130.59999999997671694 6790922 53.29999999999999716, 349121.40000000002328306 6790939.09999999962747097 53.79999999999999716, 349117.90000000002328306 6790946.29999999981373549 54, 349115.40000000002328306 6790963 56, 349116.29999999998835847 6790972.70000000018626451 55.79999999999999716, 349119.59999999997671694 6790986.59999999962747097 56.29999999999999716, 349122.5 6790993.09999999962747097 56.5, 349126.29999999998835847 6790999.70000000018626451 56.60000000000000142, 349136.09999999997671694 6791010.79999999981373549 56.89999999999999858, 349148.20000000001164153 6791019.09999999962747097 57.20000000000000284, 349162 6791024.29999999981373549 57.70000000000000284, 349169.29999999998835847 6791025.59999999962747097 57.89999999999999858, 349183.90000000002328306 6791025.5 57.89999999999999858, 349191.40000000002328306 6791024.20000000018626451 58, 349208.29999999998835847 6791018.79999999981373549 58.20000000000000284, 349237.20000000001164153 6791007.5 58.89999999999999858, 349261.09999999997671694 6790998.09999999962747097 59.39999999999999858, 349272.5 6790993.70000000018626451 59.39999999999999858, 349281.90000000002328306 6790990.09999999962747097 59.5, 349283.5 6790989.40000000037252903 59.70000000000000284, 349298 6791004.59999999962747097 54.10000000000000142, 349307.70000000001164153 6791014.70000000018626451 54.10000000000000142, 349311.59999999997671694 6791018.90000000037252903 54.10000000000000142, 349321.20000000001164153 6791028.90000000037252903 54.10000000000000142, 349349 6791056.90000000037252903 54.20000000000000284, 349395.09999999997671694 6791106.40000000037252903 54.29999999999999716, 349403.33788300794549286 6791115.04062395542860031 49.3805459610006352, 349417.59999999997671694 6791130 54.39999999999999858, 349440.20000000001164153 6791153.5 54.5, 349477.90000000002328306 6791194.90000000037252903 54.60000000000000142, 349524.90000000002328306 6791246.59999999962747097 54.60000000000000142, 349587.59999999997671694 6791319.59999999962747097 54.89999999999999858, 349624.79999999998835847 6791362.09999999962747097 55.70000000000000284, 349649.70000000001164153 6791392.59999999962747097 56.29999999999999716, 349673.40000000002328306 6791423.70000000018626451 56.89999999999999858, 349664.12698569317581132 6791431.64829797763377428 56.96660468294926716, 349678.29999999998835847 6791448.20000000018626451 55.39999999999999858, 349702.90000000002328306 6791475 54.39999999999999858, 349740.79999999998835847 6791517.09999999962747097 55.5, 349766.29999999998835847 6791548.40000000037252903 55.79999999999999716, 349793.09999999997671694 6791582.20000000018626451 55.60000000000000142, 349832.70000000001164153 6791630.79999999981373549 56.79999999999999716, 349875.79999999998835847 6791689.79999999981373549 56.79999999999999716, 349932.29999999998835847 6791768.5 58.60000000000000142, 349932.39526350906817243 6791768.65690460335463285 58.44563042019541399, 349934 6791771.29999999981373549 56.70000000000000284, 349957.79999999998835847 6791804.20000000018626451 56.5, 350013.90000000002328306 6791883.09999999962747097 55.89999999999999858, 350092.09999999997671694 6791992.40000000037252903 55.29999999999999716, 350122 6792032.29999999981373549 55, 350152.20000000001164153 6792070.79999999981373549 54.89999999999999858, 350200.79999999998835847 6792127.20000000018626451 54.70000000000000284, 350215.5 6792143.70000000018626451 54.39999999999999858, 350274 6792202.59999999962747097 53.70000000000000284, 350322.79999999998835847 6792247.79999999981373549 53.39999999999999858, 350352.40000000002328306 6792273.09999999962747097 53.29999999999999716, 350378.29999999998835847 6792294.79999999981373549 53.29999999999999716, 350426.59999999997671694 6792331.40000000037252903 53.10000000000000142, 350458.20000000001164153 6792353.90000000037252903 52.29999999999999716, 350510.59999999997671694 6792389.20000000018626451 52.79999999999999716, 350566.79999999998835847 6792423.70000000018626451 52.39999999999999858, 350595.40000000002328306 6792439.5 52, 350642.40000000002328306 6792463.79999999981373549 52, 350671.79999999998835847 6792484.40000000037252903 50.5, 350679.40000000002328306 6792488.70000000018626451 50.20000000000000284, 350689.90000000002328306 6792494.70000000018626451 50.10000000000000142, 350712.70000000001164153 6792508.5 49.60000000000000142, 350723.90000000002328306 6792515.29999999981373549 49.39999999999999858, 350737 6792527.40000000037252903 48.60000000000000142, 350739.5 6792530.79999999981373549 48.39999999999999858, 350745 6792538 48, 350749.90000000002328306 6792549.09999999962747097 47.5, 350757.5 6792564.59999999962747097 46.79999999999999716, 350766.70000000001164153 6792586.20000000018626451 46, 350780.79999999998835847 6792637.20000000018626451 44.20000000000000284, 350787.90000000002328306 6792663.20000000018626451 43.39999999999999858, 350799.79999999998835847 6792707.29999999981373549 42.20000000000000284, 350800 6792723.29999999981373549 39.60000000000000142, 350797.59999999997671694 6792734.20000000018626451 39.70000000000000284, 350789.70000000001164153 6792749.20000000018626451 39.79999999999999716, 350780.5 6792760.20000000018626451 39.89999999999999858, 350767.79999999998835847 6792771.70000000018626451 40.39999999999999858, 350751.70000000001164153 6792785.79999999981373549 41.29999999999999716, 350733.20000000001164153 6792801.5 42, 350716.90000000002328306 6792816.90000000037252903 43.10000000000000142, 350705.70000000001164153 6792830.29999999981373549 43.60000000000000142, 350698.5 6792842.09999999962747097 44.10000000000000142, 350695.20000000001164153 6792851.59999999962747097 44.79999999999999716, 350693.70000000001164153 6792864 45.29999999999999716, 350694.20000000001164153 6792875.40000000037252903 45.70000000000000284, 350696.29999999998835847 6792884.20000000018626451 45.89999999999999858, 350699.5 6792894 46.79999999999999716, 350704.79999999998835847 6792904 48, 350712.59999999997671694 6792912.5 49.60000000000000142, 350723.29999999998835847 6792920.40000000037252903 50, 350735.59999999997671694 6792926 50.29999999999999716, 350748.90000000002328306 6792929.20000000018626451 50.5, 350762.90000000002328306 6792930.20000000018626451 50.70000000000000284, 350777.09999999997671694 6792930.20000000018626451 50.70000000000000284, 350771.20000000001164153 6792959.70000000018626451 52, 350787.59999999997671694 6792956.20000000018626451 51.89999999999999858, 350778.70000000001164153 6792994.79999999981373549 44.10000000000000142, 350772.90000000002328306 6793022 44.39999999999999858, 350764.09999999997671694 6793074.5 44.79999999999999716, 350759.09999999997671694 6793110.40000000037252903 48.70000000000000284, 350754.59999999997671694 6793161.09999999962747097 48.70000000000000284, 350752.59999999997671694 6793192.79999999981373549 49.39999999999999858, 350748.90000000002328306 6793252.29999999981373549 49.79999999999999716, 350745.70000000001164153 6793289 50.10000000000000142, 350741.29999999998835847 6793395.70000000018626451 50.60000000000000142, 350746.09999999997671694 6793345.90000000037252903 51.10000000000000142, 350747.29999999998835847 6793325.09999999962747097 51, 350748.59999999997671694 6793304.59999999962747097 50.89999999999999858, 350749.79999999998835847 6793284.40000000037252903 50.70000000000000284, 350751.20000000001164153 6793264.59999999962747097 50.60000000000000142, 350752.79999999998835847 6793245.40000000037252903 50.39999999999999858, 350754.40000000002328306 6793226.79999999981373549 50.10000000000000142, 350756.20000000001164153 6793208.70000000018626451 49.89999999999999858, 350758.79999999998835847 6793191.20000000018626451 49.70000000000000284, 350762.59999999997671694 6793174.20000000018626451 49.39999999999999858, 350767.40000000002328306 6793157.70000000018626451 49.10000000000000142, 350773.09999999997671694 6793141.90000000037252903 48.89999999999999858, 350779.90000000002328306 6793126.79999999981373549 48.60000000000000142, 350787.59999999997671694 6793112.09999999962747097 48.39999999999999858, 350796.20000000001164153 6793097.90000000037252903 48.10000000000000142, 350806 6793084 47.89999999999999858, 350817.09999999997671694 6793070.59999999962747097 47.60000000000000142, 350829.20000000001164153 6793057.79999999981373549 47.39999999999999858, 350842.59999999997671694 6793045.29999999981373549 47.10000000000000142, 350856.79999999998835847 6793033.09999999962747097 46.89999999999999858, 350871.29999999998835847 6793020.90000000037252903 46.70000000000000284, 350885.90000000002328306 6793008.90000000037252903 46.29999999999999716, 350900.40000000002328306 6792996.59999999962747097 46.10000000000000142, 350914.09999999997671694 6792983.20000000018626451 45.89999999999999858, 350926.90000000002328306 6792969.29999999981373549 45.60000000000000142, 350938.79999999998835847 6792954.29999999981373549 45.39999999999999858, 350949.09999999997671694 6792938.59999999962747097 45.29999999999999716, 350958.40000000002328306 6792922 45.20000000000000284, 350966.59999999997671694 6792905.09999999962747097 45, 350974.09999999997671694 6792887.59999999962747097 44.79999999999999716, 350981.40000000002328306 6792870.20000000018626451 44.70000000000000284, 350988.5 6792852.59999999962747097 44.60000000000000142, 350995.59999999997671694 6792835.29999999981373549 44.5, 351002.70000000001164153 6792818.09999999962747097 44.29999999999999716, 351010 6792800.79999999981373549 44.20000000000000284, 351017.09999999997671694 6792783.70000000018626451 44.10000000000000142, 351024.09999999997671694 6792766.5 44, 351031.59999999997671694 6792749.29999999981373549 43.79999999999999716, 351040.59999999997671694 6792732.59999999962747097 43.60000000000000142, 351050.70000000001164153 6792716.90000000037252903 43.5, 351062.09999999997671694 6792702 43.29999999999999716, 351075.29999999998835847 6792688.20000000018626451 43.20000000000000284, 351089.79999999998835847 6792675.5 43, 351105.40000000002328306 6792664.40000000037252903 42.79999999999999716, 351121.90000000002328306 6792655 42.60000000000000142, 351139.29999999998835847 6792647 42.29999999999999716, 351157.90000000002328306 6792640.5 42, 351177.40000000002328306 6792635.59999999962747097 41.70000000000000284, 351197.70000000001164153 6792632.5 41.39999999999999858, 351218.20000000001164153 6792630.40000000037252903 41.20000000000000284, 351239.20000000001164153 6792629.29999999981373549 40.89999999999999858, 351260.79999999998835847 6792629.20000000018626451 40.60000000000000142, 351283 6792629.29999999981373549 40.20000000000000284, 351305.79999999998835847 6792629.29999999981373549 39.79999999999999716, 351329 6792629.20000000018626451 39.60000000000000142, 351352.20000000001164153 6792629 39.29999999999999716, 351375.5 6792628.79999999981373549 39.10000000000000142, 351398.79999999998835847 6792628.59999999962747097 38.89999999999999858, 351410.59999999997671694 6792627.70000000018626451 39.29999999999999716, 351453.09999999997671694 6792628 36.29999999999999716, 351503.09999999997671694 6792627.59999999962747097 36.10000000000000142, 351552.5 6792627.70000000018626451 36, 351553.70000000001164153 6792627.70000000018626451 36, 351590 6792627.20000000018626451 36.10000000000000142, 351609.79999999998835847 6792627.5 42.60000000000000142, 351628.20000000001164153 6792628 36.10000000000000142, 351667.20000000001164153 6792628.90000000037252903 36.10000000000000142, 351703.09999999997671694 6792629 36.10000000000000142, 351748.59999999997671694 6792629.5 36.29999999999999716, 351787.59999999997671694 6792629.59999999962747097 36.20000000000000284, 351815.90000000002328306 6792629.70000000018626451 36.10000000000000142, 351864.5 6792630.20000000018626451 36.29999999999999716, 351922.40000000002328306 6792630.59999999962747097 36.20000000000000284, 351969.29999999998835847 6792631.40000000037252903 36.39999999999999858, 352015.90000000002328306 6792631.59999999962747097 36.5, 352063.29999999998835847 6792631.09999999962747097 36.5, 352122.79999999998835847 6792632 36.5, 352162.79999999998835847 6792633 36.5, 352192.59999999997671694 6792633.09999999962747097 36.70000000000000284, 352222 6792633.29999999981373549 36.70000000000000284, 352224.59999999997671694 6792633.29999999981373549 36.70000000000000284, 352251.09999999997671694 6792633.59999999962747097 36.79999999999999716, 352252.29999999998835847 6792633.59999999962747097 36.79999999999999716, 352279 6792633.70000000018626451 36.70000000000000284, 352290.20000000001164153 6792633.70000000018626451 36.60000000000000142, 352311.5 6792633.79999999981373549 36.60000000000000142, 352367.79999999998835847 6792634 36.70000000000000284, 352425.20000000001164153 6792634.59999999962747097 37, 352469.40000000002328306 6792634.90000000037252903 36.89999999999999858, 352488.5 6792635 36.89999999999999858, 352523 6792635.40000000037252903 36.89999999999999858, 352538.90000000002328306 6792635.59999999962747097 37, 352543.59999999997671694 6792635.70000000018626451 37, 352582.59999999997671694 6792636 37.10000000000000142, 352596.70000000001164153 6792636.20000000018626451 37.10000000000000142, 352630.90000000002328306 6792636.29999999981373549 37.29999999999999716, 352653.59999999997671694 6792636.40000000037252903 37.39999999999999858, 352702.70000000001164153 6792637.59999999962747097 37.79999999999999716, 352709 6792637.40000000037252903 37.79999999999999716, 352712.5 6792637.20000000018626451 37.79999999999999716, 352719.20000000001164153 6792637.09999999962747097 37.79999999999999716, 352756.90000000002328306 6792637.5 38, 352802.79999999998835847 6792637.90000000037252903 38.20000000000000284, 352820.79999999998835847 6792638 38.5, 352851.90000000002328306 6792638.20000000018626451 39.10000000000000142, 352855.09999999997671694 6792638.29999999981373549 39.20000000000000284, 352895.59999999997671694 6792639.09999999962747097 39.5, 352907.59999999997671694 6792639.40000000037252903 39.60000000000000142, 352961.70000000001164153 6792639.79999999981373549 40.20000000000000284, 353025.40000000002328306 6792640.09999999962747097 41.10000000000000142, 353063.70000000001164153 6792640.09999999962747097 41.20000000000000284, 353087.90000000002328306 6792640.29999999981373549 42, 353127 6792648.09999999962747097 42.10000000000000142, 353157.20000000001164153 6792652.5 42.70000000000000284, 353178.20000000001164153 6792655.90000000037252903 43.60000000000000142, 353200.59999999997671694 6792660.70000000018626451 44.79999999999999716, 353229.09999999997671694 6792666.29999999981373549 46.39999999999999858, 353260.29999999998835847 6792671.70000000018626451 48.10000000000000142, 353291.40000000002328306 6792677.79999999981373549 48.79999999999999716, 353307.20000000001164153 6792680.90000000037252903 49.20000000000000284, 353326.5 6792687.40000000037252903 49.5, 353336.09999999997671694 6792691.59999999962747097 49.60000000000000142, 353351.70000000001164153 6792695.70000000018626451 49.70000000000000284, 353358 6792706 49.70000000000000284, 353363.5 6792716.29999999981373549 49.89999999999999858, 353376.5 6792744.29999999981373549 48.89999999999999858, 353375.40000000002328306 6792728 50.5, 353375.79999999998835847 6792713 49.79999999999999716, 353376.90000000002328306 6792705.79999999981373549 50, 353381.29999999998835847 6792694 50.10000000000000142, 353390.40000000002328306 6792691.20000000018626451 50.10000000000000142, 353398.90000000002328306 6792686.40000000037252903 50.10000000000000142, 353405.90000000002328306 6792680.09999999962747097 50.60000000000000142, 353411.79999999998835847 6792673.29999999981373549 50.5, 353427.40000000002328306 6792671.59999999962747097 50.5, 353444.20000000001164153 6792669.40000000037252903 50.39999999999999858, 353467.79999999998835847 6792669.70000000018626451 50.20000000000000284, 353480.79999999998835847 6792668.59999999962747097 49.89999999999999858, 353494.59999999997671694 6792666.59999999962747097 49.39999999999999858, 353527.40000000002328306 6792660.29999999981373549 48, 353567.40000000002328306 6792655 47, 353585.40000000002328306 6792653.20000000018626451 46.79999999999999716, 353661.59999999997671694 6792645.29999999981373549 47.70000000000000284, 353670.59999999997671694 6792645.29999999981373549 47.60000000000000142, 353677.70000000001164153 6792645.40000000037252903 47.60000000000000142, 353690.40000000002328306 6792645.5 47.60000000000000142, 353746.5 6792646.5 48.10000000000000142, 353787.90000000002328306 6792646.40000000037252903 53.20000000000000284, 353801.59999999997671694 6792646.40000000037252903 48.70000000000000284, 353848.5 6792647.5 49, 353903.20000000001164153 6792647.5 49.5, 353926.90000000002328306 6792647.79999999981373549 49.70000000000000284, 353955.90000000002328306 6792648.09999999962747097 50, 354007.09999999997671694 6792647.79999999981373549 50.89999999999999858, 354058.5 6792648.5 51, 354113.40000000002328306 6792649.5 51.60000000000000142, 354165.5 6792648.59999999962747097 52.20000000000000284, 354217.20000000001164153 6792647.09999999962747097 52.60000000000000142, 354268.79999999998835847 6792643.79999999981373549 53, 354324.70000000001164153 6792639.70000000018626451 53.70000000000000284, 354375.09999999997671694 6792634.5 54.20000000000000284, 354400 6792631 54.5, 354426.90000000002328306 6792627.29999999981373549 54.89999999999999858, 354468.79999999998835847 6792619.90000000037252903 63.29999999999999716, 354475.70000000001164153 6792618.90000000037252903 55.39999999999999858, 354528.29999999998835847 6792609.59999999962747097 55.89999999999999858, 354581.09999999997671694 6792598.40000000037252903 56.29999999999999716, 354632.09999999997671694 6792586 56.79999999999999716, 354681.29999999998835847 6792572.79999999981373549 57.39999999999999858, 354734.09999999997671694 6792557.70000000018626451 57.89999999999999858, 354782.20000000001164153 6792541.79999999981373549 58.60000000000000142, 354834.29999999998835847 6792522.79999999981373549 59.20000000000000284, 354884.09999999997671694 6792503.59999999962747097 59.60000000000000142, 354939.59999999997671694 6792482.20000000018626451 60.20000000000000284, 355001.29999999998835847 6792457.59999999962747097 60.79999999999999716, 355093.90000000002328306 6792419.79999999981373549 62, 355172.79999999998835847 6792389.29999999981373549 63, 355241.29999999998835847 6792365.40000000037252903 64, 355297.09999999997671694 6792348.59999999962747097 64.59999999999999432, 355335.90000000002328306 6792338.59999999962747097 65, 355379.70000000001164153 6792328.20000000018626451 65.40000000000000568, 355427.5 6792319 65.70000000000000284, 355478.5 6792311.5 65.90000000000000568, 355523.90000000002328306 6792306.40000000037252903 65.90000000000000568, 355565.20000000001164153 6792303.79999999981373549 66, 355589 6792302.5 70.79999999999999716, 355615.79999999998835847 6792301.79999999981373549 66.20000000000000284, 355628 6792301.59999999962747097 66.20000000000000284, 355631.90000000002328306 6792301.59999999962747097 66.20000000000000284, 355657.70000000001164153 6792304.09999999962747097 66.20000000000000284, 355689.79999999998835847 6792307.09999999962747097 66.29999999999999716, 355724.79999999998835847 6792309.90000000037252903 65.79999999999999716, 355767.5 6792316.29999999981373549 65.70000000000000284, 355787.29999999998835847 6792320.5 65.79999999999999716, 355807.40000000002328306 6792325.20000000018626451 66.40000000000000568, 355832.40000000002328306 6792332.79999999981373549 67.59999999999999432, 355868.79999999998835847 6792344.40000000037252903 69.09999999999999432, 355910.40000000002328306 6792358.29999999981373549 70.79999999999999716, 355921.59999999997671694 6792363.79999999981373549 70.79999999999999716, 355930.5 6792366.20000000018626451 70.70000000000000284, 355934.5 6792372.90000000037252903 71, 355942.90000000002328306 6792384.09999999962747097 70.90000000000000568, 355952.70000000001164153 6792392 70.70000000000000284, 355962.70000000001164153 6792397.79999999981373549 70.5, 355980.59999999997671694 6792402.90000000037252903 70.29999999999999716, 355991.70000000001164153 6792403.20000000018626451 70.20000000000000284, 356001.20000000001164153 6792402.5 70.20000000000000284, 356011 6792400.20000000018626451 70.40000000000000568, 356018.59999999997671694 6792396.90000000037252903 70.40000000000000568, 356027.40000000002328306 6792391.09999999962747097 70.5, 356046.29999999998835847 6792393.90000000037252903 70.29999999999999716, 356067.59999999997671694 6792402 69.70000000000000284, 356088 6792408.09999999962747097 69.5, 356113 6792414.09999999962747097 68.5, 356150.59999999997671694 6792423.20000000018626451 66.79999999999999716, 356176.40000000002328306 6792431.20000000018626451 65.29999999999999716, 356199.59999999997671694 6792440 64.40000000000000568, 356226.59999999997671694 6792451.20000000018626451 63.89999999999999858, 356279.40000000002328306 6792475.79999999981373549 63.5, 356338.90000000002328306 6792506 63.20000000000000284, 356358.79999999998835847 6792519.20000000018626451 63.10000000000000142, 356386.09999999997671694 6792537.79999999981373549 63, 356419 6792561.59999999962747097 62.89999999999999858, 356446.29999999998835847 6792582.90000000037252903 62.89999999999999858, 356478.20000000001164153 6792609.20000000018626451 62.70000000000000284, 356499 6792626.29999999981373549 62.60000000000000142, 356530.29999999998835847 6792655.09999999962747097 62.5, 356561.29999999998835847 6792687.09999999962747097 62.29999999999999716, 356595.59999999997671694 6792721.79999999981373549 62.10000000000000142, 356646.59999999997671694 6792778.5 61.70000000000000284, 356749.90000000002328306 6792892.5 61, 356807 6792947.59999999962747097 60.79999999999999716, 356865.90000000002328306 6792997.79999999981373549 60.5, 356931.29999999998835847 6793047.70000000018626451 60.5, 356985.79999999998835847 6793084.40000000037252903 60.60000000000000142, 357042.79999999998835847 6793119.90000000037252903 61, 357091.29999999998835847 6793145.79999999981373549 61.29999999999999716, 357098.70000000001164153 6793149.20000000018626451 61.29999999999999716, 357140.09999999997671694 6793168.70000000018626451 61.60000000000000142, 357165.59999999997671694 6793179.70000000018626451 61.5, 357189.20000000001164153 6793189.90000000037252903 61.5, 357205.20000000001164153 6793195.40000000037252903 61.89999999999999858, 357258.29999999998835847 6793213.70000000018626451 62, 357305.29999999998835847 6793228.59999999962747097 62.39999999999999858, 357351.59999999997671694 6793241.59999999962747097 62.39999999999999858, 357393.79999999998835847 6793252.5 62.39999999999999858, 357438.40000000002328306 6793261.70000000018626451 62.29999999999999716, 357480.70000000001164153 6793269.40000000037252903 62.20000000000000284, 357520.59999999997671694 6793275.20000000018626451 62, 357558.59999999997671694 6793279.5 61.89999999999999858, 357597 6793282.70000000018626451 61.89999999999999858, 357633.09999999997671694 6793284.70000000018626451 61.5, 357674.20000000001164153 6793285.90000000037252903 60.70000000000000284, 357695 6793285.70000000018626451 60.39999999999999858, 357700.09999999997671694 6793285.59999999962747097 60.39999999999999858, 357730.40000000002328306 6793285.40000000037252903 60.10000000000000142, 357762.90000000002328306 6793284 60, 357794.29999999998835847 6793282 59.79999999999999716, 357837.79999999998835847 6793277.79999999981373549 59.60000000000000142, 357876.5 6793272.79999999981373549 59.20000000000000284, 357915.20000000001164153 6793266.59999999962747097 58.70000000000000284, 357957.90000000002328306 6793258.09999999962747097 58.20000000000000284, 357983.90000000002328306 6793252.09999999962747097 58, 357997.90000000002328306 6793264.79999999981373549 63.79999999999999716, 358001.59999999997671694 6793268.20000000018626451 63.79999999999999716, 358091.40000000002328306 6793349.70000000018626451 61.5, 358114.29999999998835847 6793370.29999999981373549 60.70000000000000284, 358123.70000000001164153 6793378.79999999981373549 60.39999999999999858, 358129.59999999997671694 6793384 60.20000000000000284, 358132.5 6793377.90000000037252903 67.40000000000000568, 358141.59999999997671694 6793355.90000000037252903 66.40000000000000568, 358148.70000000001164153 6793342.40000000037252903 65.40000000000000568, 358161.59999999997671694 6793318.70000000018626451 63.79999999999999716, 358165.90000000002328306 6793311.59999999962747097 63.29999999999999716, 358176.70000000001164153 6793294.5 62.29999999999999716, 358179.70000000001164153 6793290.20000000018626451 62, 358199.09999999997671694 6793262.5 60.5, 358218.5 6793238.20000000018626451 59.29999999999999716, 358239.79999999998835847 6793213.79999999981373549 58, 358266.79999999998835847 6793185.40000000037252903 56.5, 358299.40000000002328306 6793158.40000000037252903 55.10000000000000142, 358332.70000000001164153 6793132.90000000037252903 54.29999999999999716, 358399.29999999998835847 6793085.29999999981373549 53.60000000000000142, 358455.59999999997671694 6793046.90000000037252903 53.20000000000000284, 358496.29999999998835847 6793015.70000000018626451 52.5, 358523.40000000002328306 6792988.09999999962747097 51.79999999999999716, 358560.29999999998835847 6792956.09999999962747097 51.29999999999999716, 358595 6792923.90000000037252903 50.79999999999999716, 358627.79999999998835847 6792890.79999999981373549 50.39999999999999858, 358670 6792846.40000000037252903 50, 358677.59999999997671694 6792837.59999999962747097 55.89999999999999858, 358682.09999999997671694 6792832.59999999962747097 49.70000000000000284, 358722.5 6792786.59999999962747097 49, 358730.70000000001164153 6792777.29999999981373549 48.89999999999999858, 358829.20000000001164153 6792662.90000000037252903 47.5, 358988.90000000002328306 6792477.29999999981373549 43.5, 359000 6792464.5 43, 359039.79999999998835847 6792418.59999999962747097 41.89999999999999858, 359087.29999999998835847 6792364.09999999962747097 40.5, 359131.90000000002328306 6792319.59999999962747097 40, 359160.09999999997671694 6792290.70000000018626451 38.89999999999999858, 359188.70000000001164153 6792264.59999999962747097 38.10000000000000142, 359199.90000000002328306 6792255.5 37.89999999999999858, 359215.20000000001164153 6792243.5 37.60000000000000142, 359237.70000000001164153 6792227.5 37.39999999999999858, 359272.79999999998835847 6792205.20000000018626451 37.5, 359326.79999999998835847 6792173 38.20000000000000284, 359381.29999999998835847 6792140.79999999981373549 39.89999999999999858, 359397.79999999998835847 6792130.5 40.39999999999999858, 359407 6792130.09999999962747097 40, 359417.40000000002328306 6792128.29999999981373549 39.89999999999999858, 359427.20000000001164153 6792125.09999999962747097 39.89999999999999858, 359436.29999999998835847 6792120.29999999981373549 39.89999999999999858, 359443.59999999997671694 6792113.79999999981373549 39.70000000000000284, 359455.59999999997671694 6792113.40000000037252903 39.20000000000000284, 359471.40000000002328306 6792116.59999999962747097 37.89999999999999858, 359486.40000000002328306 6792119.5 37, 359504.40000000002328306 6792126.5 35.5, 359511.70000000001164153 6792128.40000000037252903 35.10000000000000142, 359514.90000000002328306 6792121 35, 359518.20000000001164153 6792118.29999999981373549 34.79999999999999716, 359533.40000000002328306 6792118 34.10000000000000142, 359545.59999999997671694 6792117 33.89999999999999858, 359553.59999999997671694 6792115.70000000018626451 33.79999999999999716, 359559.40000000002328306 6792112.29999999981373549 33.39999999999999858, 359563.59999999997671694 6792105.29999999981373549 32.89999999999999858, 359597.40000000002328306 6792016.5 32.10000000000000142, 359613.40000000002328306 6791978.79999999981373549 31.80000000000000071, 359635.79999999998835847 6791938.40000000037252903 31, 359648.20000000001164153 6791914.40000000037252903 30.89999999999999858, 359653.70000000001164153 6791904.40000000037252903 30.89999999999999858, 359654.70000000001164153 6791898.09999999962747097 30.80000000000000071, 359651.5 6791893.5 30.89999999999999858, 359626.20000000001164153 6791874 30.19999999999999929, 359620 6791869.40000000037252903 33.29999999999999716, 359635.20000000001164153 6791847.29999999981373549 33.39999999999999858, 359644.70000000001164153 6791835.29999999981373549 33.5, 359651.40000000002328306 6791825.70000000018626451 33.5, 359654.90000000002328306 6791814.90000000037252903 33.5, 359660.29999999998835847 6791806.90000000037252903 33.5, 359680.20000000001164153 6791779.09999999962747097 33.39999999999999858, 359708.59999999997671694 6791734.70000000018626451 33.20000000000000284, 359734.29999999998835847 6791692.59999999962747097 33, 359755.40000000002328306 6791655.5 33, 359766 6791634.5 33, 359766.70000000001164153 6791633.20000000018626451 33, 359772.70000000001164153 6791622.29999999981373549 32.89999999999999858, 359781.09999999997671694 6791603.79999999981373549 32.70000000000000284, 359791.29999999998835847 6791581.09999999962747097 32.60000000000000142, 359812.09999999997671694 6791530.70000000018626451 32.60000000000000142, 359813.90000000002328306 6791526.29999999981373549 32.60000000000000142, 359832.20000000001164153 6791475.70000000018626451 32.79999999999999716, 359846.79999999998835847 6791433.20000000018626451 33, 359857.90000000002328306 6791394.70000000018626451 33.10000000000000142, 359869.70000000001164153 6791344.29999999981373549 33.10000000000000142, 359881.29999999998835847 6791294.09999999962747097 32.89999999999999858, 359887.20000000001164153 6791258 33.39999999999999858, 359892.90000000002328306 6791224.09999999962747097 33.5, 359897.90000000002328306 6791185.5 33.5, 359900.70000000001164153 6791149.20000000018626451 33.70000000000000284, 359903.20000000001164153 6791112.5 34.29999999999999716, 359904.40000000002328306 6791086.90000000037252903 34.20000000000000284, 359905.70000000001164153 6791060 34.10000000000000142, 359905.59999999997671694 6791033.09999999962747097 34.29999999999999716, 359904.70000000001164153 6791004.20000000018626451 34.5, 359903.90000000002328306 6790981.5 34.39999999999999858, 359903.59999999997671694 6790978.29999999981373549 34.29999999999999716, 359903.40442915062885731 6790967.02208101935684681 36.70000000000000284, 359916.40000000002328306 6790964.09999999962747097 39.10000000000000142, 359929 6790961.20000000018626451 39.10000000000000142, 359961.59999999997671694 6790951.70000000018626451 39.20000000000000284, 359967.09999999997671694 6790950.09999999962747097 39.10000000000000142, 359971.29999999998835847 6790948 39.20000000000000284, 359976.40000000002328306 6790936.79999999981373549 39.20000000000000284, 359985.70000000001164153 6790907.70000000018626451 39.20000000000000284, 359996.40000000002328306 6790901.79999999981373549 39.20000000000000284, 360010.40000000002328306 6790900.20000000018626451 39.20000000000000284, 360039.20000000001164153 6790899.29999999981373549 39, 360036.70000000001164153 6790856.79999999981373549 41.5, 360031.5 6790801.70000000018626451 43, 360018.20000000001164153 6790659.59999999962747097 46, 360013.20000000001164153 6790617.20000000018626451 48.10000000000000142, 360010 6790605 48.70000000000000284, 360001.5 6790589.29999999981373549 48.70000000000000284, 359971.79999999998835847 6790524.70000000018626451 49.10000000000000142, 359911.20000000001164153 6790393.90000000037252903 50.70000000000000284, 359906.59999999997671694 6790395.09999999962747097 50.70000000000000284, 359896.5 6790397.5 50.79999999999999716, 359889.20000000001164153 6790398.5 50.89999999999999858, 359886.40000000002328306 6790398.70000000018626451 50.89999999999999858, 359880.5 6790399.29999999981373549 50.89999999999999858, 359858.09999999997671694 6790401.20000000018626451 44.5, 359858.90000000002328306 6790391.90000000037252903 44.79999999999999716, 359861 6790373.70000000018626451 45.20000000000000284, 359863 6790355.20000000018626451 45.60000000000000142, 359869.29999999998835847 6790312.70000000018626451 47, 359879.5 6790248.09999999962747097 48.89999999999999858, 359902.29999999998835847 6790134.90000000037252903 51.89999999999999858, 359919.20000000001164153 6790039.5 52.89999999999999858, 359935.40000000002328306 6789951 53.79999999999999716, 359952.40000000002328306 6789858.90000000037252903 53.39999999999999858, 359957.59999999997671694 6789836.70000000018626451 53.39999999999999858, 359957.90000000002328306 6789835.40000000037252903 53.29999999999999716, 359962 6789820.70000000018626451 53.20000000000000284, 359964.40000000002328306 6789812.40000000037252903 53.20000000000000284, 359965.70000000001164153 6789807.90000000037252903 53.20000000000000284, 359978.90000000002328306 6789776.5 52.39999999999999858, 359998.40000000002328306 6789741.40000000037252903 51.60000000000000142, 359999.6663585951901041 6789738.82643253263086081 -474.22042513863073054, 360008.79999999998835847 6789740.70000000018626451 -1000, 360028.20000000001164153 6789744.09999999962747097 -1000, 360047.5 6789747.70000000018626451 -1000, 360062.70000000001164153 6789748.70000000018626451 -1000, 360072.90000000002328306 6789748.59999999962747097 -1000, 360093.29999999998835847 6789747.09999999962747097 -1000, 360114.59999999997671694 6789742.59999999962747097 -1000, 360133.20000000001164153 6789735.40000000037252903 -1000, 360150.5 6789726.29999999981373549 -1000, 360159.40000000002328306 6789720.59999999962747097 -1000, 360186.29999999998835847 6789698.09999999962747097 -1000, 360222.40000000002328306 6789668 -1000, 360242.90000000002328306 6789651 -1000, 360258.79999999998835847 6789640.40000000037252903 -1000, 360269.20000000001164153 6789635.79999999981373549 -1000, 360279.40000000002328306 6789635.90000000037252903 -1000, 360285.40000000002328306 6789636.5 -1000, 360293.29999999998835847 6789635.70000000018626451 -1000, 360299.20000000001164153 6789633.59999999962747097 -1000, 360305.59999999997671694 6789628.90000000037252903 -1000, 360310.70000000001164153 6789622.5 -1000, 360314.29999999998835847 6789614.09999999962747097 -1000, 360318.29999999998835847 6789610.70000000018626451 -1000, 360381.59999999997671694 6789593.70000000018626451 -1000, 360379.90000000002328306 6789587.79999999981373549 50.70000000000000284, 360349.70000000001164153 6789592.5 53.5, 360331.70000000001164153 6789596.79999999981373549 54, 360307.79999999998835847 6789602.29999999981373549 54.20000000000000284, 360306.90000000002328306 6789599.09999999962747097 53.79999999999999716, 360304.5 6789593.90000000037252903 53.89999999999999858, 360300.70000000001164153 6789589.40000000037252903 53.89999999999999858, 360297.59999999997671694 6789586.5 53.79999999999999716, 360294.79999999998835847 6789585.79999999981373549 53.70000000000000284, 360290.29999999998835847 6789570.90000000037252903 52.79999999999999716, 360289 6789561 52.79999999999999716, 360287.09999999997671694 6789542.70000000018626451 52.60000000000000142, 360285.79999999998835847 6789510 52.70000000000000284, 360285.09999999997671694 6789476.29999999981373549 53.60000000000000142, 360287.90000000002328306 6789448.5 54.60000000000000142, 360294.40000000002328306 6789422.79999999981373549 56.10000000000000142, 360308 6789396.20000000018626451 56.79999999999999716, 360349.70000000001164153 6789344.29999999981373549 60, 360353.20000000001164153 6789341.70000000018626451 59.29999999999999716, 360383.59999999997671694 6789320.40000000037252903 60.5, 360412.29999999998835847 6789304.20000000018626451 61.89999999999999858, 360441.09999999997671694 6789287.70000000018626451 62.29999999999999716, 360475.29999999998835847 6789271.59999999962747097 63.5, 360527.20000000001164153 6789252.5 65.20000000000000284, 360570.59999999997671694 6789238.29999999981373549 66.29999999999999716, 360611.20000000001164153 6789227.29999999981373549 67.5, 360662.20000000001164153 6789213.29999999981373549 68.29999999999999716, 360753.79999999998835847 6789187.09999999962747097 68.90000000000000568, 360852.70000000001164153 6789158 69.09999999999999432, 360729.09999999997671694 6789186.09999999962747097 69.09999999999999432, 360595.5 6789218.29999999981373549 67.09999999999999432, 360513.20000000001164153 6789238.29999999981373549 65.5, 360449.79999999998835847 6789254.59999999962747097 64, 360396.09999999997671694 6789267.20000000018626451 62.70000000000000284, 360349.09999999997671694 6789278.09999999962747097 62.20000000000000284, 360305 6789288.09999999962747097 60.89999999999999858, 360265.79999999998835847 6789295.20000000018626451 60.29999999999999716, 360232.20000000001164153 6789300.29999999981373549 60, 360206.90000000002328306 6789303.90000000037252903 59.89999999999999858, 360193.5 6789305.79999999981373549 59.79999999999999716, 360165.79999999998835847 6789308.20000000018626451 59.39999999999999858, 360164.09999999997671694 6789308.29999999981373549 59.39999999999999858, 360153.70000000001164153 6789309.40000000037252903 59.29999999999999716, 360146 6789292.79999999981373549 59, 360159.59999999997671694 6789291.59999999962747097 59.20000000000000284, 360189.40000000002328306 6789289.29999999981373549 59.70000000000000284, 360222.29999999998835847 6789284.90000000037252903 59.70000000000000284, 360223 6789284.79999999981373549 59.70000000000000284, 360240.40000000002328306 6789281.70000000018626451 59.89999999999999858, 360281.09999999997671694 6789274.59999999962747097 60.29999999999999716, 360293.59999999997671694 6789272.40000000037252903 60.5, 360378.29999999998835847 6789253.59999999962747097 62, 360480.20000000001164153 6789228.29999999981373549 64.5, 360570.79999999998835847 6789206.40000000037252903 64.79999999999999716, 360605.79999999998835847 6789197.40000000037252903 66.20000000000000284, 360655.90000000002328306 6789185.29999999981373549 67, 360799 6789147.09999999962747097 68.90000000000000568, 360705.5 6789167.09999999962747097 68.5, 360637.59999999997671694 6789181.70000000018626451 68.20000000000000284, 360588.29999999998835847 6789191.90000000037252903 66.79999999999999716, 360570.29999999998835847 6789195.29999999981373549 66.70000000000000284, 360531.5 6789200.70000000018626451 65.29999999999999716, 360510 6789203 64.90000000000000568, 360493.40000000002328306 6789204.20000000018626451 64.40000000000000568, 360466.40000000002328306 6789205.29999999981373549 63.5, 360444.29999999998835847 6789205.29999999981373549 62.5, 360425.90000000002328306 6789204.59999999962747097 61.79999999999999716, 360406.29999999998835847 6789203 59.29999999999999716, 360386.70000000001164153 6789201.29999999981373549 56.89999999999999858, 360344 6789191.40000000037252903 56.5, 360292.59999999997671694 6789179.5 56.10000000000000142, 360276.29999999998835847 6789174.40000000037252903 55.60000000000000142, 360205 6789151.79999999981373549 53.39999999999999858, 360169.09999999997671694 6789139.59999999962747097 52.89999999999999858, 360125.5 6789129.09999999962747097 53.10000000000000142, 360068 6789119.90000000037252903 54.29999999999999716, 360028.59999999997671694 6789118.09999999962747097 55.29999999999999716, 359995.90000000002328306 6789118.29999999981373549 55.89999999999999858, 359968.20000000001164153 6789120.20000000018626451 56.10000000000000142, 359951.40000000002328306 6789122.20000000018626451 56.79999999999999716, 359964.5 6789107.90000000037252903 56.10000000000000142, 359932.09999999997671694 6789116.59999999962747097 56.10000000000000142, 359917.70000000001164153 6789122.09999999962747097 56.5, 359878.79999999998835847 6789139.20000000018626451 56.60000000000000142, 359818.29999999998835847 6789159 56, 359785.09999999997671694 6789169.20000000018626451 55.60000000000000142, 359754.5 6789177.40000000037252903 55, 359727.5 6789182.70000000018626451 54.79999999999999716, 359699.20000000001164153 6789186 54.5, 359680.70000000001164153 6789187.5 54.29999999999999716, 359666.40000000002328306 6789187.5 54.29999999999999716, 359652.40000000002328306 6789187 54.20000000000000284, 359632.59999999997671694 6789185.90000000037252903 54.20000000000000284, 359601.5 6789181.59999999962747097 53.79999999999999716, 359561.90000000002328306 6789172.70000000018626451 54.10000000000000142, 359536.70000000001164153 6789164.59999999962747097 53.89999999999999858, 359469 6789140.79999999981373549 55.5, 359393.90000000002328306 6789111.70000000018626451 57.29999999999999716, 359287.20000000001164153 6789069.79999999981373549 59.39999999999999858, 359218.09999999997671694 6789042.79999999981373549 60.79999999999999716, 359163.29999999998835847 6789018.5 61.70000000000000284, 359130.29999999998835847 6788999.29999999981373549 61.29999999999999716, 359119.79999999998835847 6788988 61, 359113.5 6788978 60.79999999999999716, 359103.40000000002328306 6788957 60.60000000000000142, 359086.79999999998835847 6788916.59999999962747097 58.29999999999999716, 359075.90000000002328306 6788894.70000000018626451 56.89999999999999858, 359057.59999999997671694 6788873.70000000018626451 54.60000000000000142, 359041.29999999998835847 6788860.5 54.10000000000000142, 359026.29999999998835847 6788852.20000000018626451 53.79999999999999716, 359012.29999999998835847 6788847.5 53.20000000000000284, 358997 6788840.70000000018626451 52.89999999999999858, 358987.29999999998835847 6788836 52.29999999999999716, 358981.29999999998835847 6788831.29999999981373549 52.5, 358978.29999999998835847 6788828.29999999981373549 52.5, 358977.70000000001164153 6788825.79999999981373549 52.5, 358975.40000000002328306 6788819.20000000018626451 52.10000000000000142, 358971.70000000001164153 6788815.59999999962747097 51.5, 358972 6788806.29999999981373549 50.5, 358973.90000000002328306 6788798 50.10000000000000142, 358980.40000000002328306 6788779.09999999962747097 49.60000000000000142, 358995.90000000002328306 6788757.5 49.20000000000000284, 359008.79999999998835847 6788742.5 48.5, 359002.20000000001164153 6788743.70000000018626451 48.5, 358992.09999999997671694 6788754.90000000037252903 -1000, 358973.40000000002328306 6788778.59999999962747097 -1000, 358959 6788795.59999999962747097 -1000, 358951.59999999997671694 6788801.29999999981373549 -1000, 358942.5 6788805.59999999962747097 -1000, 358933.70000000001164153 6788810.29999999981373549 -1000, 358926.20000000001164153 6788817 -1000, 358923.29999999998835847 6788826.09999999962747097 -1000, 358916.59999999997671694 6788827.5 50.20000000000000284, 358907.70000000001164153 6788829 50.20000000000000284, 358859.20000000001164153 6788834.5 50.39999999999999858, 358778.40000000002328306 6788843.59999999962747097 50.89999999999999858, 358761.5 6788846 50.89999999999999858, 358747.40000000002328306 6788847.20000000018626451 50.89999999999999858, 358728.79999999998835847 6788847 50.89999999999999858, 358714.20000000001164153 6788846 50.89999999999999858, 358695.20000000001164153 6788843.40000000037252903 51, 358642 6788827.90000000037252903 50.79999999999999716, 358618.29999999998835847 6788817.09999999962747097 50.29999999999999716, 358588.29999999998835847 6788804.29999999981373549 48.60000000000000142, 358546.79999999998835847 6788784 48.39999999999999858, 358517 6788770.79999999981373549 48.29999999999999716, 358491.20000000001164153 6788758.40000000037252903 48.20000000000000284, 358466.20000000001164153 6788746.20000000018626451 48.10000000000000142, 358422.90000000002328306 6788726.20000000018626451 48, 358394 6788712.90000000037252903 47.79999999999999716, 358363.40000000002328306 6788697.40000000037252903 47.70000000000000284, 358275.09999999997671694 6788651.29999999981373549 47.39999999999999858, 358232.70000000001164153 6788632.59999999962747097 42.39999999999999858, 357895.20000000001164153 6788453.09999999962747097 36.20000000000000284, 357870.09999999997671694 6788438.40000000037252903 36.20000000000000284, 357839.5 6788421.09999999962747097 36.20000000000000284, 357790.79999999998835847 6788390.5 36.20000000000000284, 357719.20000000001164153 6788348.40000000037252903 37.29999999999999716, 357684.90000000002328306 6788328 37.60000000000000142, 357579.29999999998835847 6788258.09999999962747097 37.89999999999999858, 357517.5 6788215.79999999981373549 38.29999999999999716, 357506.5 6788208.29999999981373549 38.29999999999999716, 357496.40000000002328306 6788201.29999999981373549 38.29999999999999716, 357476.59999999997671694 6788187.70000000018626451 38.39999999999999858, 357451 6788169.90000000037252903 39, 357416.5 6788144.20000000018626451 40.20000000000000284, 357326.59999999997671694 6788074.29999999981373549 43.60000000000000142, 357209.29999999998835847 6787981.5 48.60000000000000142, 357203.79999999998835847 6787973.90000000037252903 48.60000000000000142, 357198.29999999998835847 6787967.29999999981373549 48.60000000000000142, 357192.40000000002328306 6787963.29999999981373549 49.5, 357192.20000000001164153 6787958.70000000018626451 48.89999999999999858, 357191.09999999997671694 6787949 49.20000000000000284, 357188.90000000002328306 6787939 49.39999999999999858, 357185.09999999997671694 6787929.5 49.5, 357179.79999999998835847 6787920.20000000018626451 49.60000000000000142, 357173.5 6787910.70000000018626451 49.60000000000000142, 357166.20000000001164153 6787902.70000000018626451 49.79999999999999716, 357166.29999999998835847 6787889.5 49.60000000000000142, 357165.79999999998835847 6787879 49.5, 357166.59999999997671694 6787866.29999999981373549 49, 357168.59999999997671694 6787854.20000000018626451 48.89999999999999858, 357159.59999999997671694 6787865.5 49.5, 357152.90000000002328306 6787871.70000000018626451 49.60000000000000142, 357147.40000000002328306 6787875.20000000018626451 49.70000000000000284, 357143.40000000002328306 6787877.5 49.70000000000000284, 357133.09999999997671694 6787882.59999999962747097 50, 357127.59999999997671694 6787881 50.29999999999999716, 357117.59999999997671694 6787879.59999999962747097 50.39999999999999858, 357107.79999999998835847 6787878.79999999981373549 50.60000000000000142, 357098.29999999998835847 6787879 50.79999999999999716, 357088.5 6787880.09999999962747097 50.79999999999999716, 357076.29999999998835847 6787883.5 50.89999999999999858, 357067.70000000001164153 6787878.5 51.10000000000000142, 357062.40000000002328306 6787876.59999999962747097 50.70000000000000284, 357052.29999999998835847 6787872.09999999962747097 50.60000000000000142, 357033.59999999997671694 6787859 49.70000000000000284, 356988.90000000002328306 6787827.29999999981373549 48.39999999999999858, 356959.79999999998835847 6787806.90000000037252903 47.89999999999999858, 356943 6787795.5 47.89999999999999858, 356919.5 6787780.79999999981373549 47.29999999999999716, 356886.79999999998835847 6787763.90000000037252903 47.29999999999999716, 356837.09999999997671694 6787737.90000000037252903 47.20000000000000284, 356804.09999999997671694 6787719.20000000018626451 48, 356777.59999999997671694 6787702.40000000037252903 48.5, 356733.79999999998835847 6787673.29999999981373549 49.10000000000000142, 356724.59999999997671694 6787667.40000000037252903 48.79999999999999716, 356657.09999999997671694 6787624.29999999981373549 46.89999999999999858, 356599.5 6787581.70000000018626451 46.89999999999999858, 356415.29999999998835847 6787445.09999999962747097 49.79999999999999716, 356390.79999999998835847 6787426.90000000037252903 49.89999999999999858, 356311.90000000002328306 6787368.79999999981373549 50.5, 356310.96859205787768587 6787368.17906137183308601 54.03537906137125901, 356310.40000000002328306 6787367.79999999981373549 50.5, 356280.40000000002328306 6787345.40000000037252903 50.89999999999999858, 356235.70000000001164153 6787312.20000000018626451 51.5, 356175 6787265.5 51.60000000000000142, 356109.09999999997671694 6787218.79999999981373549 51.60000000000000142, 356023.09999999997671694 6787152.90000000037252903 52.79999999999999716, 355978.40000000002328306 6787118.5 53.39999999999999858, 355970.40000000002328306 6787110.40000000037252903 53.39999999999999858, 355851.5 6787008.20000000018626451 53.89999999999999858, 355813.70000000001164153 6786974.09999999962747097 53.70000000000000284, 355750.40000000002328306 6786921.09999999962747097 50, 355747.20000000001164153 6786915.29999999981373549 49.29999999999999716, 355744.09999999997671694 6786898.90000000037252903 49.29999999999999716, 355749.29999999998835847 6786884.5 49.5, 355762.59999999997671694 6786866.20000000018626451 49.29999999999999716, 355770.40000000002328306 6786860.79999999981373549 49.29999999999999716, 355778 6786855.09999999962747097 49.29999999999999716, 355792.29999999998835847 6786843.29999999981373549 49.29999999999999716, 355804.29999999998835847 6786831.70000000018626451 49.29999999999999716, 355811 6786825.29999999981373549 49.29999999999999716, 355816.70000000001164153 6786817.40000000037252903 49.29999999999999716, 355824.5 6786805.5 49.29999999999999716, 355831.90000000002328306 6786794.09999999962747097 49.79999999999999716, 355837.79999999998835847 6786783.79999999981373549 50.39999999999999858, 355844.29999999998835847 6786771.70000000018626451 51, 355846.90000000002328306 6786766.79999999981373549 50.89999999999999858, 355851.09999999997671694 6786757.90000000037252903 50.79999999999999716, 355840 6786754.09999999962747097 50.79999999999999716, 355847.20000000001164153 6786735.79999999981373549 49.70000000000000284, 355850 6786728.70000000018626451 49.29999999999999716, 355854.90000000002328306 6786707.70000000018626451 49.29999999999999716, 355858.20000000001164153 6786691.09999999962747097 49.29999999999999716, 355861.20000000001164153 6786667.29999999981373549 49.29999999999999716, 355862.29999999998835847 6786639.09999999962747097 49.29999999999999716, 355862.29999999998835847 6786638.59999999962747097 49.29999999999999716, 355853.70000000001164153 6786619.29999999981373549 50.5, 355847.09999999997671694 6786614.40000000037252903 50.5, 355841.09999999997671694 6786612.29999999981373549 50.60000000000000142, 355834.20000000001164153 6786611.29999999981373549 50.60000000000000142, 355827.70000000001164153 6786611.5 50.5, 355821.59999999997671694 6786612.90000000037252903 50.29999999999999716, 355811.09999999997671694 6786617.90000000037252903 50.20000000000000284, 355798.59999999997671694 6786624.59999999962747097 50, 355793.29999999998835847 6786629.79999999981373549 49.79999999999999716, 355790.40000000002328306 6786634 49.79999999999999716, 355789 6786636 49.39999999999999858, 355785.79999999998835847 6786638.40000000037252903 48.89999999999999858, 355783.70000000001164153 6786634.20000000018626451 48.89999999999999858, 355779.40000000002328306 6786632 48.89999999999999858, 355774.09999999997671694 6786631.79999999981373549 48.89999999999999858, 355769.09999999997671694 6786633.90000000037252903 48.79999999999999716, 355765.90000000002328306 6786636.59999999962747097 48.79999999999999716, 355764 6786640.79999999981373549 48.79999999999999716, 355763.5 6786645 48.79999999999999716, 355766 6786649.20000000018626451 48.5, 355770.40000000002328306 6786651.5 48.60000000000000142, 355773.20000000001164153 6786664.79999999981373549 47.70000000000000284, 355776.90000000002328306 6786680.79999999981373549 47.20000000000000284, 355779.09999999997671694 6786692.59999999962747097 47.5, 355771.5 6786719.09999999962747097 47.29999999999999716, 355757.20000000001164153 6786761 47.5, 355748.40000000002328306 6786789.29999999981373549 47.39999999999999858, 355768.70000000001164153 6786796.70000000018626451 -1000, 355776.09999999997671694 6786799.29999999981373549 -1000, 355783 6786798.59999999962747097 -1000, 355789 6786789.79999999981373549 -1000, 355799 6786770.40000000037252903 -1000, 355807.29999999998835847 6786756.09999999962747097 -1000, 355816.90000000002328306 6786750.59999999962747097 -1000, 355828.5 6786752.20000000018626451 -1000, 355831.70000000001164153 6786752.70000000018626451 -1000, 355826.70000000001164153 6786761.59999999962747097 -1000, 355819.70000000001164153 6786774.5 -1000, 355800.09999999997671694 6786805 -1000, 355785.40000000002328306 6786820.5 -1000, 355778.29999999998835847 6786826.79999999981373549 -1000, 355761.59999999997671694 6786840.59999999962747097 -1000, 355752.40000000002328306 6786848.90000000037252903 -1000, 355741.59999999997671694 6786854.90000000037252903 -1000, 355734.40000000002328306 6786859 -1000, 355732.59999999997671694 6786863.29999999981373549 -1000, 355729.20000000001164153 6786863.40000000037252903 51.79999999999999716, 355716.20000000001164153 6786858.40000000037252903 52, 355690.09999999997671694 6786851.40000000037252903 52.10000000000000142, 355659.70000000001164153 6786844.5 52.29999999999999716, 355650.70000000001164153 6786841.79999999981373549 54.39999999999999858, 355608.79999999998835847 6786826 55.60000000000000142, 355570.70000000001164153 6786805.09999999962747097 56.10000000000000142, 355557.79999999998835847 6786797.70000000018626451 56.29999999999999716, 355541.40000000002328306 6786787.79999999981373549 56.10000000000000142, 355535.70000000001164153 6786784.40000000037252903 56, 355524.09999999997671694 6786779.70000000018626451 55.60000000000000142, 355507.09999999997671694 6786768.59999999962747097 55.39999999999999858, 355504.29999999998835847 6786766.5 55.5, 355495.70000000001164153 6786761.5 54.20000000000000284, 355493.40000000002328306 6786759.79999999981373549 53.89999999999999858, 355484 6786752.5 55, 355482.40000000002328306 6786751.29999999981373549 55.20000000000000284, 355387.20000000001164153 6786681.5 51.70000000000000284, 355278.70000000001164153 6786603.59999999962747097 46.70000000000000284, 355115.09999999997671694 6786488.79999999981373549 40.89999999999999858, 354941.20000000001164153 6786369.79999999981373549 39.89999999999999858, 354785.09999999997671694 6786264.09999999962747097 39.10000000000000142, 354771 6786253.29999999981373549 39, 354768.5 6786251.5 38.89999999999999858, 354690.59999999997671694 6786199.20000000018626451 38.79999999999999716, 354643.20000000001164153 6786167.5 38.89999999999999858, 354638.20000000001164153 6786164.09999999962747097 39, 354630.40000000002328306 6786158.90000000037252903 38.89999999999999858, 354506 6786075.59999999962747097 38.10000000000000142, 354501.90000000002328306 6786072.90000000037252903 38.10000000000000142, 354495.40000000002328306 6786068.59999999962747097 37.39999999999999858, 354490.5 6786065 37.10000000000000142, 354486.59999999997671694 6786062.09999999962747097 37.10000000000000142, 354472.40000000002328306 6786052.09999999962747097 37.10000000000000142, 354402.5 6786006.79999999981373549 36.79999999999999716, 354379.79999999998835847 6785993.5 36.70000000000000284, 354358.29999999998835847 6785981 36.5, 354293.20000000001164153 6785947.70000000018626451 36.10000000000000142, 354241.5 6785927.09999999962747097 35.89999999999999858, 354190.20000000001164153 6785910.29999999981373549 35.89999999999999858, 354167.09999999997671694 6785903.90000000037252903 35.89999999999999858, 354125.90000000002328306 6785893.20000000018626451 35.39999999999999858, 354119.40000000002328306 6785892.29999999981373549 35.39999999999999858, 354082.79999999998835847 6785886.5 35.39999999999999858, 354046.29999999998835847 6785882.20000000018626451 35.39999999999999858, 353984.09999999997671694 6785878.20000000018626451 35, 353938.09999999997671694 6785877.70000000018626451 34.89999999999999858, 353861.20000000001164153 6785878.59999999962747097 34.5, 353771.09999999997671694 6785880.90000000037252903 34.5, 353717.59999999997671694 6785881.79999999981373549 34.5, 353538.90000000002328306 6785885.5 33.60000000000000142, 353533.09999999997671694 6785885.90000000037252903 33.70000000000000284, 353499.5 6785887 34.29999999999999716, 353363.29999999998835847 6785890.09999999962747097 33.5, 353328.79999999998835847 6785890.79999999981373549 33.5, 353135.40000000002328306 6785894.70000000018626451 33.10000000000000142, 353116.29999999998835847 6785895.09999999962747097 33.10000000000000142, 353112.51870385557413101 6785895.19950779248028994 36.55995077932738013, 353040.29999999998835847 6785897.09999999962747097 33.5, 353017 6785897.79999999981373549 33.10000000000000142, 352753.5 6785903.29999999981373549 32.89999999999999858, 352623.09999999997671694 6785904.09999999962747097 32.60000000000000142, 352569.29999999998835847 6785902.79999999981373549 32.10000000000000142, 352522.59999999997671694 6785897.79999999981373549 31.39999999999999858, 352475.40000000002328306 6785895.90000000037252903 30.80000000000000071, 352442.40000000002328306 6785891.79999999981373549 30.39999999999999858, 352382.29999999998835847 6785876 31.5, 352339.09999999997671694 6785857.79999999981373549 31.80000000000000071, 352329.5 6785852.5 32.10000000000000142, 352307.5 6785837.09999999962747097 32.29999999999999716, 352277.90000000002328306 6785812.09999999962747097 32.60000000000000142, 352208.59999999997671694 6785748.79999999981373549 33.29999999999999716, 352184.90000000002328306 6785725.90000000037252903 33.39999999999999858, 352166.79999999998835847 6785706.29999999981373549 33.79999999999999716, 352153.90000000002328306 6785690.90000000037252903 33.60000000000000142, 352133.20000000001164153 6785660.29999999981373549 33.60000000000000142, 352123.70000000001164153 6785643.5 33.60000000000000142, 352114.29999999998835847 6785624.59999999962747097 33.29999999999999716, 352101.29999999998835847 6785599.09999999962747097 33, 352088.79999999998835847 6785573.09999999962747097 32.70000000000000284, 352080.5 6785556.5 32.5, 352063.79999999998835847 6785523 32.5, 352057 6785508.59999999962747097 32.29999999999999716, 352050.40000000002328306 6785490.70000000018626451 32.20000000000000284, 352044.79999999998835847 6785471.70000000018626451 32.10000000000000142, 352039.90000000002328306 6785448.79999999981373549 32.10000000000000142, 352035.20000000001164153 6785425 33.20000000000000284, 352029 6785393.09999999962747097 32.10000000000000142, 352015.70000000001164153 6785336.90000000037252903 32.39999999999999858, 352023 6785387.5 32.70000000000000284, 352036 6785463.20000000018626451 32.70000000000000284, 352041.5 6785488.59999999962747097 32.79999999999999716, 352048.70000000001164153 6785513 32.89999999999999858, 352061.79999999998835847 6785547.29999999981373549 33.10000000000000142, 352070.90000000002328306 6785570.5 33.29999999999999716, 352077.5 6785593.29999999981373549 33.5, 352083.20000000001164153 6785616.29999999981373549 33.5, 352086.79999999998835847 6785636.09999999962747097 33.60000000000000142, 352088.79999999998835847 6785652.5 33.89999999999999858, 352089.79999999998835847 6785672.70000000018626451 34.20000000000000284, 352089.59999999997671694 6785692.90000000037252903 34.39999999999999858, 352088 6785712.40000000037252903 34.5, 352085.90000000002328306 6785730.40000000037252903 35, 352084.59999999997671694 6785749.5 35.10000000000000142, 352079.59999999997671694 6785772.20000000018626451 35.39999999999999858, 352077.59999999997671694 6785782.29999999981373549 35.60000000000000142, 352074.79999999998835847 6785795.5 35.79999999999999716, 352072 6785818.40000000037252903 36.5, 352071.90000000002328306 6785838.59999999962747097 36.5, 352073 6785852.70000000018626451 36.60000000000000142, 352073.90000000002328306 6785861.09999999962747097 36.79999999999999716, 352075.20000000001164153 6785873.40000000037252903 36.39999999999999858, 352065.70000000001164153 6785872.79999999981373549 35.10000000000000142, 352064.09999999997671694 6785852.5 35.20000000000000284, 352061.09999999997671694 6785823.09999999962747097 35.79999999999999716, 352059.09999999997671694 6785801.79999999981373549 35.70000000000000284, 352050.90000000002328306 6785700.29999999981373549 34.20000000000000284, 352043.09999999997671694 6785621.09999999962747097 33.29999999999999716, 352038.29999999998835847 6785577.79999999981373549 32.89999999999999858, 352038.09999999997671694 6785576.20000000018626451 32.89999999999999858, 352036.29999999998835847 6785559.29999999981373549 32.70000000000000284, 352030.20000000001164153 6785521.5 32.5, 352030.09999999997671694 6785560.09999999962747097 32.79999999999999716, 352029.59999999997671694 6785586.79999999981373549 32.89999999999999858, 352030.59999999997671694 6785615.40000000037252903 33, 352028.29999999998835847 6785639.79999999981373549 33.10000000000000142, 352025.20000000001164153 6785656.79999999981373549 33.20000000000000284, 352019.5 6785679.59999999962747097 33.20000000000000284, 352012.59999999997671694 6785696.09999999962747097 33.20000000000000284, 351998.29999999998835847 6785718.40000000037252903 32.60000000000000142, 351983.09999999997671694 6785734.09999999962747097 32.20000000000000284, 351962.79999999998835847 6785752.20000000018626451 31.89999999999999858, 351929.20000000001164153 6785777.59999999962747097 31.60000000000000142, 351883 6785808.79999999981373549 31.10000000000000142, 351862.70000000001164153 6785821.40000000037252903 30.69999999999999929, 351845 6785830.09999999962747097 30.60000000000000142, 351826.20000000001164153 6785837.59999999962747097 30.10000000000000142, 351809.5 6785841.70000000018626451 29.89999999999999858, 351796.5 6785843.5 29.60000000000000142, 351771.59999999997671694 6785844.79999999981373549 29.80000000000000071, 351744.09999999997671694 6785845.5 30.10000000000000142, 351672.79999999998835847 6785848.70000000018626451 30.10000000000000142, 351620.29999999998835847 6785844 30, 351476.59999999997671694 6785831.59999999962747097 30.39999999999999858, 351262.5 6785812.40000000037252903 30.39999999999999858, 351120.5 6785800.29999999981373549 30.39999999999999858, 351049.79999999998835847 6785794.09999999962747097 30.39999999999999858, 351025 6785790.70000000018626451 30.10000000000000142, 351015.09999999997671694 6785789.90000000037252903 30, 351010.29999999998835847 6785789.79999999981373549 30.19999999999999929, 350996.40000000002328306 6785788.70000000018626451 30.30000000000000071, 350984.70000000001164153 6785787 29.5, 350959.20000000001164153 6785781.70000000018626451 29.5, 350942.09999999997671694 6785778.90000000037252903 29.5, 350889.5 6785773.79999999981373549 29.60000000000000142, 350838.09999999997671694 6785766.40000000037252903 30.30000000000000071, 350793.70000000001164153 6785754.90000000037252903 31.10000000000000142, 350770.90000000002328306 6785744.09999999962747097 31.39999999999999858, 350752.09999999997671694 6785734.09999999962747097 31.80000000000000071, 350738.29999999998835847 6785724.29999999981373549 32, 350724.40000000002328306 6785714.59999999962747097 32.20000000000000284, 350716.70000000001164153 6785709.5 32.29999999999999716, 350685 6785682.40000000037252903 32.89999999999999858, 350661.79999999998835847 6785655.90000000037252903 33.79999999999999716, 350644.70000000001164153 6785637.20000000018626451 34.29999999999999716, 350639.79999999998835847 6785629.20000000018626451 34.5, 350626.70000000001164153 6785606.79999999981373549 35.10000000000000142, 350620.90000000002328306 6785594.70000000018626451 35.39999999999999858, 350610.29999999998835847 6785565.40000000037252903 36.39999999999999858, 350612.20000000001164153 6785558.40000000037252903 36.60000000000000142, 350612.29999999998835847 6785550.79999999981373549 36.79999999999999716, 350610.79999999998835847 6785543.40000000037252903 37, 350607.90000000002328306 6785537.20000000018626451 37.10000000000000142, 350603.59999999997671694 6785531.70000000018626451 37.39999999999999858, 350597.79999999998835847 6785527.09999999962747097 37.39999999999999858, 350591 6785523.90000000037252903 37.60000000000000142, 350583.40000000002328306 6785522.40000000037252903 37.79999999999999716, 350576 6785522.59999999962747097 37.70000000000000284, 350569.5 6785524.09999999962747097 37.70000000000000284, 350563.70000000001164153 6785527 37.70000000000000284, 350553.79999999998835847 6785537.09999999962747097 37.60000000000000142, 350549.40000000002328306 6785523.40000000037252903 37.79999999999999716, 350544.79999999998835847 6785510.70000000018626451 38.29999999999999716, 350538.09999999997671694 6785497.09999999962747097 38.70000000000000284, 350531.5 6785482 39.29999999999999716, 350525.20000000001164153 6785465.40000000037252903 39.79999999999999716, 350513.40000000002328306 6785439.40000000037252903 41, 350526.20000000001164153 6785495.40000000037252903 39.70000000000000284, 350531.79999999998835847 6785533.29999999981373549 38.89999999999999858, 350533 6785569.5 38, 350531.5 6785589.29999999981373549 37.5, 350528.70000000001164153 6785609.40000000037252903 37, 350523.09999999997671694 6785638.09999999962747097 36.39999999999999858, 350518.79999999998835847 6785658.20000000018626451 36, 350506.29999999998835847 6785713.59999999962747097 34.5, 350504.70000000001164153 6785719.90000000037252903 34.39999999999999858, 350478.5 6785824.40000000037252903 33.20000000000000284, 350470.29999999998835847 6785859.29999999981373549 32.89999999999999858, 350461.29999999998835847 6785893.20000000018626451 32.70000000000000284, 350457.5 6785907.09999999962747097 32.70000000000000284, 350441.40000000002328306 6785955.70000000018626451 32.70000000000000284, 350434.20000000001164153 6785975.59999999962747097 32.70000000000000284, 350422.40000000002328306 6786005.59999999962747097 32.60000000000000142, 350414.09999999997671694 6786030.09999999962747097 32.60000000000000142, 350409.40000000002328306 6786050.20000000018626451 32.60000000000000142, 350406.40000000002328306 6786062 32.60000000000000142, 350401 6786092.20000000018626451 31.39999999999999858, 350399.79999999998835847 6786097.29999999981373549 32.29999999999999716, 350399 6786102.20000000018626451 32.20000000000000284, 350355.40000000002328306 6786277.90000000037252903 39.39999999999999858, 350349 6786300.79999999981373549 39.70000000000000284, 350342.59999999997671694 6786325.5 40.20000000000000284, 350335.09999999997671694 6786348.90000000037252903 40.70000000000000284, 350323.79999999998835847 6786389.5 41.20000000000000284, 350309.20000000001164153 6786434.20000000018626451 42.79999999999999716, 350287.70000000001164153 6786496.90000000037252903 44, 350270.59999999997671694 6786542.5 44.5, 350263.29999999998835847 6786562.20000000018626451 44.89999999999999858, 350241.59999999997671694 6786615.20000000018626451 45.29999999999999716, 350221.5 6786657 45.79999999999999716, 350200.29999999998835847 6786695.40000000037252903 46, 350197 6786700.90000000037252903 46.10000000000000142, 350186.90000000002328306 6786688.79999999981373549 39.29999999999999716, 350180.59999999997671694 6786682.70000000018626451 39.20000000000000284, 350173.70000000001164153 6786675.90000000037252903 39.10000000000000142, 350163 6786669 38.70000000000000284, 350152.40000000002328306 6786664.09999999962747097 38.70000000000000284, 350137.70000000001164153 6786656.70000000018626451 37.89999999999999858, 350137.79999999998835847 6786655.70000000018626451 37.89999999999999858, 350137.59999999997671694 6786654 37.89999999999999858, 350137.09999999997671694 6786652.59999999962747097 37.89999999999999858, 350136.09999999997671694 6786650.70000000018626451 37.89999999999999858, 350134 6786649.5 37.89999999999999858, 350132.20000000001164153 6786649.09999999962747097 37.89999999999999858, 350133.59999999997671694 6786642.70000000018626451 38.10000000000000142, 350133.09999999997671694 6786636.09999999962747097 38.10000000000000142, 350130.79999999998835847 6786627.09999999962747097 38.10000000000000142, 350123 6786603.5 39.20000000000000284, 350107.79999999998835847 6786553.20000000018626451 37.5, 350104.09999999997671694 6786540.70000000018626451 37.10000000000000142, 350102 6786535 36.79999999999999716, 350097.79999999998835847 6786523.5 36.10000000000000142, 350096 6786519.40000000037252903 35.89999999999999858, 350083.20000000001164153 6786490.5 35.10000000000000142, 350078.70000000001164153 6786480.5 34.70000000000000284, 350069.59999999997671694 6786463.20000000018626451 34, 350065.79999999998835847 6786457.90000000037252903 33.79999999999999716, 350062.90000000002328306 6786455.5 33.70000000000000284, 350053.40000000002328306 6786459.09999999962747097 31.19999999999999929, 350027 6786468.5 32.20000000000000284, 349996 6786479.90000000037252903 32.39999999999999858, 349982.5 6786485.09999999962747097 32.39999999999999858, 349986.70000000001164153 6786497.20000000018626451 -1000, 349989.59999999997671694 6786503.79999999981373549 -1000, 349990.29999999998835847 6786504.29999999981373549 -1000, 349987.79999999998835847 6786508.59999999962747097 -1000, 349988.20000000001164153 6786512.90000000037252903 -1000, 349980.90000000002328306 6786515.70000000018626451 -1000, 349975.40000000002328306 6786518.70000000018626451 -1000, 349974.90000000002328306 6786523.40000000037252903 -1000, 349971.59999999997671694 6786526.40000000037252903 -1000, 349967.40000000002328306 6786528 -1000, 349965.29999999998835847 6786531.70000000018626451 -1000, 349968.09999999997671694 6786542.90000000037252903 -1000, 349977.20000000001164153 6786568.79999999981373549 -1000, 349980.79999999998835847 6786581.09999999962747097 -1000, 349991.59999999997671694 6786620.79999999981373549 37.29999999999999716, 350002.90000000002328306 6786656.40000000037252903 37.5, 350006.59999999997671694 6786661.70000000018626451 37.79999999999999716, 350008.40000000002328306 6786665.5 37.79999999999999716, 350011 6786672.59999999962747097 38.29999999999999716, 350008.90000000002328306 6786672.90000000037252903 38.29999999999999716, 350007.09999999997671694 6786674.20000000018626451 38.29999999999999716, 350006.09999999997671694 6786675.29999999981373549 38.29999999999999716, 350005.5 6786676.79999999981373549 38.29999999999999716, 350005.40000000002328306 6786678.79999999981373549 38.29999999999999716, 350006 6786680.5 38.29999999999999716, 349999.79999999998835847 6786681.79999999981373549 41.10000000000000142, 349946 6786692.29999999981373549 43.79999999999999716, 349930.09999999997671694 6786695.5 43.70000000000000284, 349910.40000000002328306 6786699.29999999981373549 43.60000000000000142, 349829.5 6786715.29999999981373549 37, 349819.70000000001164153 6786717 36.20000000000000284, 349801.09999999997671694 6786719.90000000037252903 35, 349789.09999999997671694 6786720.79999999981373549 34.39999999999999858, 349787.09999999997671694 6786711.79999999981373549 33.5, 349784.70000000001164153 6786701.5 32.79999999999999716, 349781.40000000002328306 6786686.59999999962747097 31.89999999999999858, 349764.79999999998835847 6786652.20000000018626451 30, 349740.29999999998835847 6786598.70000000018626451 31, 349712.90000000002328306 6786535.90000000037252903 25.89999999999999858, 349702.20000000001164153 6786540 27.30000000000000071, 349697 6786541.70000000018626451 27.30000000000000071, 349692.09999999997671694 6786543.59999999962747097 27.30000000000000071, 349687.40000000002328306 6786545.70000000018626451 26.89999999999999858, 349682.59999999997671694 6786547.70000000018626451 27, 349677.90000000002328306 6786549.70000000018626451 26.80000000000000071, 349673.09999999997671694 6786551.90000000037252903 26.5, 349667.79999999998835847 6786554.09999999962747097 26.30000000000000071, 349662.5 6786556.70000000018626451 26.30000000000000071, 349656.70000000001164153 6786559.29999999981373549 26.39999999999999858, 349650.59999999997671694 6786562.09999999962747097 26.19999999999999929, 349644.59999999997671694 6786564.09999999962747097 25.80000000000000071, 349639.70000000001164153 6786566 27.30000000000000071, 349635.5 6786567.59999999962747097 28.80000000000000071, 349631.20000000001164153 6786569.29999999981373549 25.39999999999999858, 349626.5 6786571.59999999962747097 27.69999999999999929, 349629.70000000001164153 6786578 30.39999999999999858, 349655.29999999998835847 6786626.20000000018626451 31.30000000000000071, 349664.29999999998835847 6786638.90000000037252903 31.89999999999999858, 349668.29999999998835847 6786646.09999999962747097 31.39999999999999858, 349672.29999999998835847 6786653.5 31.5, 349676.29999999998835847 6786660.79999999981373549 31.80000000000000071, 349681 6786667.90000000037252903 32, 349687 6786674.40000000037252903 32.20000000000000284, 349693.70000000001164153 6786680.59999999962747097 32.39999999999999858, 349700.29999999998835847 6786686.70000000018626451 32.5, 349706.59999999997671694 6786692.59999999962747097 32.70000000000000284, 349712.20000000001164153 6786699.40000000037252903 32.79999999999999716, 349716.79999999998835847 6786707.09999999962747097 33, 349718 6786709.5 33, 349693.20000000001164153 6786721.59999999962747097 32, 349686.90000000002328306 6786724.70000000018626451 32.10000000000000142, 349689.09999999997671694 6786731.29999999981373549 32, 349679.29999999998835847 6786738.70000000018626451 -1000, 349702.70000000001164153 6786742.40000000037252903 32.39999999999999858, 349704.09999999997671694 6786745.09999999962747097 32.39999999999999858, 349706.70000000001164153 6786751.40000000037252903 32.5, 349709.20000000001164153 6786757.20000000018626451 32.5, 349711.70000000001164153 6786762.79999999981373549 32.70000000000000284, 349714.09999999997671694 6786768 32.79999999999999716, 349716.29999999998835847 6786772.70000000018626451 32.79999999999999716, 349718.40000000002328306 6786777.09999999962747097 32.89999999999999858, 349720.09999999997671694 6786781.09999999962747097 33, 349721.59999999997671694 6786784.40000000037252903 33, 349723 6786787.29999999981373549 33.20000000000000284, 349724.40000000002328306 6786790.20000000018626451 33.29999999999999716, 349733.90000000002328306 6786821.29999999981373549 34.70000000000000284, 349742.40000000002328306 6786842.59999999962747097 34.70000000000000284, 349753.40000000002328306 6786861.90000000037252903 34.70000000000000284, 349763.70000000001164153 6786879.5 35, 349772 6786891.79999999981373549 35.79999999999999716, 349764.70000000001164153 6786896.5 37.39999999999999858, 349767.59999999997671694 6786901 -1000, 349785.5 6786936.40000000037252903 -1000, 349798.90000000002328306 6786965.70000000018626451 -1000, 349806.29999999998835847 6786985.29999999981373549 -1000, 349807.59999999997671694 6786996.20000000018626451 -1000, 349806.90000000002328306 6787006.29999999981373549 -1000, 349813.90000000002328306 6787008.09999999962747097 36.20000000000000284, 349811 6787020.09999999962747097 36.20000000000000284, 349799.79999999998835847 6787061.09999999962747097 37.89999999999999858, 349793.59999999997671694 6787079.70000000018626451 37.89999999999999858, 349787.29999999998835847 6787100 38.10000000000000142, 349783.40000000002328306 6787119.40000000037252903 38.29999999999999716, 349782.90000000002328306 6787129.29999999981373549 37.39999999999999858, 349779 6787149.5 38.70000000000000284, 349765.5 6787210.70000000018626451 39.5, 349753.29999999998835847 6787252.59999999962747097 39.29999999999999716, 349751.5 6787257 39.29999999999999716, 349743.70000000001164153 6787277.90000000037252903 39.20000000000000284, 349732.70000000001164153 6787296.90000000037252903 38.70000000000000284, 349714.79999999998835847 6787323.70000000018626451 37.89999999999999858, 349700.90000000002328306 6787343.79999999981373549 37.10000000000000142, 349678.79999999998835847 6787377.79999999981373549 36.79999999999999716, 349675.5 6787387.09999999962747097 35.70000000000000284, 349657.20000000001164153 6787410.59999999962747097 34.89999999999999858, 349653.40000000002328306 6787415.79999999981373549 34.70000000000000284, 349618.5 6787461.20000000018626451 33.39999999999999858, 349594.70000000001164153 6787493.90000000037252903 32.60000000000000142, 349563.90000000002328306 6787536.20000000018626451 31.69999999999999929, 349520.09999999997671694 6787601 30.39999999999999858, 349512.79999999998835847 6787611.90000000037252903 30.19999999999999929, 349462.90000000002328306 6787692 29.30000000000000071, 349431.90000000002328306 6787745.59999999962747097 28.80000000000000071, 349429.90000000002328306 6787749 28.80000000000000071, 349427.90000000002328306 6787752.70000000018626451 28.69999999999999929, 349427.69908116402802989 6787753.05160796362906694 28.69999999999999929, 349427.40000000002328306 6787752.79999999981373549 28.69999999999999929, 349415.20000000001164153 6787742.29999999981373549 34.10000000000000142, 349411.40000000002328306 6787738.70000000018626451 31.80000000000000071, 349409.20000000001164153 6787742.5 32.39999999999999858, 349371.59999999997671694 6787709.5 33, 349373.40000000002328306 6787727.90000000037252903 33, 349359 6787739.79999999981373549 32.10000000000000142, 349350.79999999998835847 6787747.79999999981373549 32.5, 349335.79999999998835847 6787764.40000000037252903 32.39999999999999858, 349327.40000000002328306 6787776.5 32.39999999999999858, 349337.5 6787783.5 31.5, 349335 6787803.09999999962747097 31.89999999999999858, 349336.70000000001164153 6787810.09999999962747097 31.89999999999999858, 349341.09999999997671694 6787816 31.89999999999999858, 349347.40000000002328306 6787819.59999999962747097 31.89999999999999858, 349354.59999999997671694 6787820.40000000037252903 32, 349360.90000000002328306 6787820.40000000037252903 33, 349365.70000000001164153 6787815.70000000018626451 33, 349365.79999999998835847 6787810.79999999981373549 33, 349365.40000000002328306 6787799.70000000018626451 33, 349365.40000000002328306 6787794.29999999981373549 33, 349367.70000000001164153 6787791.40000000037252903 33, 349371.29999999998835847 6787790.5 33, 349383.90000000002328306 6787787.70000000018626451 -1000, 349336.59999999997671694 6787887.20000000018626451 32, 349324.70000000001164153 6787914.20000000018626451 31.89999999999999858, 349251.59999999997671694 6787923.70000000018626451 30, 349233.59999999997671694 6787928.79999999981373549 30, 349244.90000000002328306 6787948.79999999981373549 30, 349256.70000000001164153 6787968.79999999981373549 30.80000000000000071, 349261.09999999997671694 6787978.09999999962747097 29.89999999999999858, 349277.59999999997671694 6788010.20000000018626451 31.30000000000000071, 349273.90000000002328306 6788013.79999999981373549 31.30000000000000071, 349263.29999999998835847 6788022.79999999981373549 31.30000000000000071, 349263.70000000001164153 6788034.09999999962747097 31.30000000000000071, 349263.90000000002328306 6788046.20000000018626451 31.39999999999999858, 349271.79999999998835847 6788046.70000000018626451 31.39999999999999858, 349287.20000000001164153 6788047.29999999981373549 28.30000000000000071, 349282.59999999997671694 6788059 28.10000000000000142, 349263 6788109.90000000037252903 27.10000000000000142, 349232.40000000002328306 6788197.40000000037252903 26.80000000000000071, 349211.59999999997671694 6788262.90000000037252903 26.60000000000000142, 349203.79999999998835847 6788285.59999999962747097 26.5, 349186.79999999998835847 6788351 26.19999999999999929, 349179.59999999997671694 6788381.79999999981373549 26, 349166 6788440.59999999962747097 25.60000000000000142, 349165.5 6788443 25.89999999999999858, 349162.09999999997671694 6788459.59999999962747097 25.80000000000000071, 349151.20000000001164153 6788512.09999999962747097 25.69999999999999929, 349138.40000000002328306 6788589.20000000018626451 25.60000000000000142, 349123.79999999998835847 6788689.29999999981373549 26.19999999999999929, 349114.5 6788771.90000000037252903 27.89999999999999858, 349112.90000000002328306 6788780.79999999981373549 28.30000000000000071, 349111.79999999998835847 6788787.70000000018626451 28.19999999999999929, 349111.09999999997671694 6788793.79999999981373549 28, 349110.59999999997671694 6788798.20000000018626451 27.80000000000000071, 349110.29999999998835847 6788801.59999999962747097 27.60000000000000142, 349110 6788805.59999999962747097 27.39999999999999858, 349109.59999999997671694 6788809 27.39999999999999858, 349108.70000000001164153 6788816.79999999981373549 27.30000000000000071, 349107.90000000002328306 6788824.5 27.19999999999999929, 349107.20000000001164153 6788831.79999999981373549 27.19999999999999929, 349106.79999999998835847 6788834.29999999981373549 27, 349106.09999999997671694 6788841 26.80000000000000071, 349106.20000000001164153 6788841.5 26.60000000000000142, 349105.40000000002328306 6788848.40000000037252903 26.39999999999999858, 349104.90000000002328306 6788852.29999999981373549 27, 349104 6788854.09999999962747097 25, 349102.79999999998835847 6788858 25, 349100.5 6788872.79999999981373549 25, 349088.29999999998835847 6788931.70000000018626451 30.19999999999999929, 349082.5 6788956.40000000037252903 29.80000000000000071, 349073.40000000002328306 6788990.29999999981373549 28.19999999999999929, 349068.29999999998835847 6789001 27.39999999999999858, 349064.70000000001164153 6789005.70000000018626451 27.10000000000000142, 349058.20000000001164153 6789010.90000000037252903 26.69999999999999929, 349055.40000000002328306 6789013.09999999962747097 26.60000000000000142, 349047.59999999997671694 6789016.09999999962747097 26.39999999999999858, 349042.09999999997671694 6789017.90000000037252903 26.30000000000000071, 348978.5 6789024.40000000037252903 26, 349024.79999999998835847 6789026.5 25.89999999999999858, 349007.70000000001164153 6789031.09999999962747097 25.89999999999999858, 349001.90000000002328306 6789036.09999999962747097 25.89999999999999858, 348944 6789037.40000000037252903 26.30000000000000071, 348972.40000000002328306 6789042.59999999962747097 26.30000000000000071, 348984 6789049.09999999962747097 26.5, 348987.90000000002328306 6789054.5 26.30000000000000071, 348990.79999999998835847 6789059.79999999981373549 26.10000000000000142, 348993 6789066.5 26, 348996.20000000001164153 6789086.09999999962747097 25.80000000000000071, 348998.29999999998835847 6789188.59999999962747097 26.89999999999999858, 349002.09999999997671694 6789214.90000000037252903 27.10000000000000142, 349007.90000000002328306 6789232.90000000037252903 27.30000000000000071, 349023.40000000002328306 6789269 27.5, 349037.09999999997671694 6789298.29999999981373549 27.60000000000000142, 349045.79999999998835847 6789317.5 27.69999999999999929, 349049.70000000001164153 6789329.90000000037252903 27.60000000000000142, 349051.09999999997671694 6789337 27.60000000000000142, 349053.59999999997671694 6789356.29999999981373549 27.39999999999999858, 349053.70000000001164153 6789366.5 27.30000000000000071, 349051.70000000001164153 6789422 26.80000000000000071, 349054.20000000001164153 6789447.09999999962747097 27.39999999999999858, 349050.5 6789487.5 26.89999999999999858, 349048.90000000002328306 6789509.59999999962747097 26.69999999999999929, 349046.79999999998835847 6789538.79999999981373549 26.5, 349046.29999999998835847 6789542.79999999981373549 26.5, 349036.79999999998835847 6789637.20000000018626451 28.89999999999999858, 349025.70000000001164153 6789738.5 31.60000000000000142, 349024 6789759.40000000037252903 32.10000000000000142, 349018.70000000001164153 6789805.90000000037252903 33.70000000000000284, 349013.79999999998835847 6789868.40000000037252903 35.79999999999999716, 349011.70000000001164153 6789888.79999999981373549 36.5, 348999.29999999998835847 6790015.40000000037252903 41, 348999.20000000001164153 6790016.09999999962747097 40.70000000000000284, 348998.90000000002328306 6790020.09999999962747097 41, 348998.70000000001164153 6790021.79999999981373549 35.39999999999999858, 348997.90000000002328306 6790029.29999999981373549 41.60000000000000142, 348997.79999999998835847 6790029.70000000018626451 40.89999999999999858, 348994.90000000002328306 6790067.59999999962747097 42.5, 348992.70000000001164153 6790094.70000000018626451 43.70000000000000284, 348990 6790132.90000000037252903 44.79999999999999716, 348989.79999999998835847 6790134.29999999981373549 44.79999999999999716, 348988.29999999998835847 6790150.90000000037252903 45.20000000000000284, 348986.09999999997671694 6790159.70000000018626451 45.39999999999999858, 348980.09999999997671694 6790193.20000000018626451 46.79999999999999716, 348946.29999999998835847 6790330.79999999981373549 47.70000000000000284, 348932.09999999997671694 6790375.5 48.39999999999999858, 348924.5 6790396.5 48.29999999999999716, 348915.5 6790412.79999999981373549 48.29999999999999716, 348909.40000000002328306 6790421.5 48.29999999999999716, 348901.90000000002328306 6790430 48.29999999999999716, 348889.20000000001164153 6790441.40000000037252903 48.79999999999999716, 348853.40000000002328306 6790467.09999999962747097 51.29999999999999716, 348847.70000000001164153 6790471.90000000037252903 50.89999999999999858))""")
+        _sio = AbstractGeoDataFrameDemos._dataset(
+            "GeoDataFrameDemosD", "intraPeripheriqueRennes.csv"
+        )
         return GeoDataFrameLib.read_csv(_sio)
 
     @staticmethod
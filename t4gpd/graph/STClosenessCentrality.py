@@ -31,14 +31,28 @@ class STClosenessCentrality(GeoProcess):
     classdocs
     '''
 
-    def __init__(self, roads):
+    def __init__(self, roads, k=None, seed=None, radius=None, ncpus=1,
+                 method="networkx"):
         '''
         Constructor
+        :param k: number of sampled source pivots (exact centrality if None)
+        :param seed: seed of the pivot sampling
+        :param radius: if set, local centrality within this network distance
+        :param ncpus: number of processes (all CPUs if None)
+        :param method: 'networkx' or 'csr' graph backend
         '''
         if not isinstance(roads, GeoDataFrame):
             raise IllegalArgumentTypeException(roads, "GeoDataFrame")
+        if not method in ["networkx", "csr"]:
+            raise IllegalArgumentTypeException(method, "'networkx' or 'csr'")
         self.roads = roads
+        self.k = k
+        self.seed = seed
+        self.radius = radius
+        self.ncpus = ncpus
+        self.method = method
 
     def run(self):
-        ug = UrbanGraphFactory.create(self.roads, method="networkx")
-        return ug.closeness_centrality()
+        ug = UrbanGraphFactory.create(self.roads, method=self.method)
+        return ug.closeness_centrality(k=self.k, seed=self.seed, radius=self.radius,
+                                     ncpus=self.ncpus)
@@ -31,14 +31,17 @@ class STMinimumSpanningTree(GeoProcess):
     classdocs
     '''
 
-    def __init__(self, roads):
+    def __init__(self, roads, method="networkx"):
         '''
         Constructor
         '''
         if not isinstance(roads, GeoDataFrame):
             raise IllegalArgumentTypeException(roads, "GeoDataFrame")
+        if not method in ["networkx", "csr"]:
+            raise IllegalArgumentTypeException(method, "'networkx' or 'csr'")
         self.roads = roads
+        self.method = method
 
     def run(self):
-        ug = UrbanGraphFactory.create(self.roads, method="networkx")
+        ug = UrbanGraphFactory.create(self.roads, method=self.method)
         return ug.minimum_spanning_tree()
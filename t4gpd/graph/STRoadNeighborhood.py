@@ -32,7 +32,7 @@ class STRoadNeighborhood(GeoProcess):
     classdocs
     '''
 
-    def __init__(self, roads, fromPoints, maxDists):
+    def __init__(self, roads, fromPoints, maxDists, ncpus=1):
         '''
         Constructor
         '''
@@ -46,6 +46,7 @@ class STRoadNeighborhood(GeoProcess):
                 maxDists, "String fieldname, float or int values")
 
         self.roads = roads
+        self.ncpus = ncpus
 
         if isinstance(fromPoints, GeoDataFrame):
             if maxDists in fromPoints:
@@ -55,20 +56,21 @@ class STRoadNeighborhood(GeoProcess):
                 self.fromPointsAndMaxDists = list(
                     zip(fromPoints.centroid, [maxDists] * len(fromPoints)))
         elif isinstance(maxDists, (float, int)):
-            self.fromPointsAndMaxDists = [fromPoints, maxDists]
+            self.fromPointsAndMaxDists = [(fromPoints, maxDists)]
         else:
             raise Exception(
                 "{maxDists} is neither a float value nor a fromPoints fieldname!")
 
     def run(self):
+        geoms = NeighborhoodLib.neighborhoods(
+            self.roads, self.fromPointsAndMaxDists, ncpus=self.ncpus)
         rows = []
-        for gid, (fromPoint, maxDist) in enumerate(self.fromPointsAndMaxDists):
-            gdf = NeighborhoodLib.neighborhood(self.roads, fromPoint, maxDist)
+        for gid, ((fromPoint, maxDist), geom) in enumerate(
+                zip(self.fromPointsAndMaxDists, geoms)):
             rows.append({
                 "gid": gid,
                 "fromPoint": fromPoint.wkt,
                 "maxDist": maxDist,
-                "geometry": gdf.geometry.squeeze()
+                "geometry": geom
             })
-            gid += 1
         return GeoDataFrame(rows, crs=self.roads.crs)
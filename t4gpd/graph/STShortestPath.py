@@ -21,11 +21,10 @@ You should have received a copy of the GNU General Public License
 along with t4gpd.  If not, see <https://www.gnu.org/licenses/>.
 '''
 from geopandas import GeoDataFrame
-from pandas import concat
 from shapely.geometry import Point
 from t4gpd.commons.GeoProcess import GeoProcess
 from t4gpd.commons.IllegalArgumentTypeException import IllegalArgumentTypeException
-from t4gpd.commons.graph.UrbanGraphFactory import UrbanGraphFactory
+from t4gpd.commons.graph.ODMatrixLib import ODMatrixLib
 
 
 class STShortestPath(GeoProcess):
@@ -33,7 +32,7 @@ class STShortestPath(GeoProcess):
     classdocs
     '''
 
-    def __init__(self, roads, fromPoints, toPoints):
+    def __init__(self, roads, fromPoints, toPoints, ncpus=1):
         '''
         Constructor
         '''
@@ -46,9 +45,8 @@ class STShortestPath(GeoProcess):
             raise IllegalArgumentTypeException(
                 toPoints, "GeoDataFrame or single Point")
 
-        self.graph = UrbanGraphFactory.create(roads, method="networkx")
-
         self.roads = roads
+        self.ncpus = ncpus
 
         if isinstance(fromPoints, GeoDataFrame):
             self.fromPoints = list(fromPoints.centroid)
@@ -61,11 +59,10 @@ class STShortestPath(GeoProcess):
             self.toPoints = [toPoints]
 
     def run(self):
-        gdfs = []
-        for fromPoint in self.fromPoints:
-            for toPoint in self.toPoints:
-                gdfs.append(self.graph.shortest_path(fromPoint, toPoint))
+        _, result = ODMatrixLib.odMatrix(
+            self.roads, self.fromPoints, self.toPoints, withPaths=True,
+            ncpus=self.ncpus)
 
-        result = GeoDataFrame(concat(gdfs), crs=self.roads.crs)
+        result = result.drop(columns=["fromIdx", "toIdx"])
         result["gid"] = range(len(result))
         return result
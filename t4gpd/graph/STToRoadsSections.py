@@ -31,17 +31,21 @@ class STToRoadsSections(GeoProcess):
     classdocs
     '''
 
-    def __init__(self, inputGdf, withoutCulDeSac=False):
+    def __init__(self, inputGdf, withoutCulDeSac=False, iterative=False):
         '''
         Constructor
+        :param withoutCulDeSac: if True, the cul-de-sacs are removed
+        :param iterative: if True, the degree-1 branches are pruned
+            iteratively, and the remaining chains are merged again
         '''
         if not isinstance(inputGdf, GeoDataFrame):
             raise IllegalArgumentTypeException(inputGdf, "GeoDataFrame")
         self.inputGdf = inputGdf
         self.withoutCulDeSac = withoutCulDeSac
+        self.iterative = iterative
 
     def run(self):
-        ug = UrbanGraphFactory.create(self.inputGdf, method=None)
+        ug = UrbanGraphFactory.create(self.inputGdf, method="csr")
         if self.withoutCulDeSac:
-            return ug.getUniqueRoadsSectionsWithoutCulDeSac()
+            return ug.getUniqueRoadsSectionsWithoutCulDeSac(self.iterative)
         return ug.getUniqueRoadsSections()
@@ -40,5 +40,5 @@ class STToRoadsSectionsNodes(GeoProcess):
         self.inputGdf = inputGdf
 
     def run(self):
-        ug = UrbanGraphFactory.create(self.inputGdf, method=None)
+        ug = UrbanGraphFactory.create(self.inputGdf, method="csr")
         return ug.getUniqueRoadsSectionsNodes()
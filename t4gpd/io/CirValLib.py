@@ -0,0 +1,384 @@
+'''
+Created on 19 Oct. 2026
+
+@author: tleduc
+
+Copyright 2020-2026 Thomas Leduc
+
+This file is part of t4gpd.
+
+t4gpd is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+t4gpd is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with t4gpd.  If not, see <https://www.gnu.org/licenses/>.
+'''
+from itertools import chain, islice
+
+from geopandas import GeoDataFrame
+from numpy import (arange, array, asarray, char, column_stack, cross, cumsum, diff, divide,
+                   empty, flatnonzero, float32, float64, fmax, fmin, full, isnan, lexsort,
+                   load, nan, nan_to_num, nansum, repeat, searchsorted, sqrt, unique,
+                   where, zeros)
+from numpy.lib.format import open_memmap
+from pandas import Series
+from shapely import is_ccw, linearrings, polygons
+from t4gpd.commons.ArrayCoding import ArrayCoding
+from t4gpd.io.AbstractReader import AbstractReader
+
+
+class CirValLib(object):
+    '''
+    classdocs
+
+    Solene .cir (geometry) and .val (values) files are tokenized once, the
+    coordinates and values being converted into NumPy arrays in bulk, and
+    the polygons are built from offset arrays. The iter* methods stream the
+    files chunk by chunk, for meshes that do not fit in memory.
+    '''
+
+    @staticmethod
+    def __tokens(inputFile, streaming):
+        with AbstractReader.opener(inputFile) as f:
+            if streaming:
+                yield from chain.from_iterable(line.split() for line in f)
+            else:
+                yield from f.read().split()
+
+    @staticmethod
+    def __count(token):
+        return int(float(token))
+
+    @staticmethod
+    def __cirId(faceNumber, nbContours, ctrNumber):
+        return ArrayCoding.encode(
+            [faceNumber] if (1 == nbContours) else [faceNumber, ctrNumber])
+
+    @staticmethod
+    def __toGeoDataFrame(cirIds, coords, ringSizes, ringPolygons):
+        xyz = array(coords, dtype=float).reshape(-1, 3)
+        rings = linearrings(xyz, indices=repeat(arange(len(ringSizes)), ringSizes))
+        geoms = polygons(rings, indices=ringPolygons) if len(rings) else empty(0, dtype=object)
+        return GeoDataFrame({'cir_id': cirIds, 'geometry': geoms})
+
+    @staticmethod
+    def iterCir(inputFile, chunksize=100000, streaming=True):
+        '''
+        :param inputFile: .cir filename or StringIO
+        :param chunksize: number of faces per chunk
+        :return: generator of GeoDataFrames (cir_id, geometry)
+        '''
+        it = CirValLib.__tokens(inputFile, streaming)
+        nbFaces = next(it, None)
+        if nbFaces is None:
+            return
+        # Skip the sup. number of faces and the bounding box
+        next(islice(it, 11, 11), None)
+        nbFaces = CirValLib.__count(nbFaces)
+
+        cirIds, coords, ringSizes, ringPolygons = [], [], [], []
+        for faceIdx in range(nbFaces):
+            faceNumber = int(next(it)[1:])
+            nbContours = CirValLib.__count(next(it))
+            # Skip the normal vector
+            next(islice(it, 3, 3), None)
+
+            for ctrNumber in range(nbContours):
+                nbHoles = int(next(it)[1:])
+                nbRings = 1 + nbHoles
+                for ringIdx in range(nbRings):
+                    if (0 < ringIdx) and ('t' != next(it)):
+                        continue
+                    nbOfNodes = CirValLib.__count(next(it))
+                    coords.extend(islice(it, 3 * nbOfNodes))
+                    ringSizes.append(nbOfNodes)
+                    ringPolygons.append(len(cirIds))
+                cirIds.append(CirValLib.__cirId(faceNumber, nbContours, ctrNumber))
+
+            if (0 == (faceIdx + 1) % chunksize) or (faceIdx + 1 == nbFaces):
+                yield CirValLib.__toGeoDataFrame(cirIds, coords, ringSizes, ringPolygons)
+                cirIds, coords, ringSizes, ringPolygons = [], [], [], []
+
+    @staticmethod
+    def readCir(inputFile):
+        '''
+        :param inputFile: .cir filename or StringIO
+        :return: GeoDataFrame (cir_id, geometry) of 3D polygons
+        '''
+        chunks = list(CirValLib.iterCir(inputFile, chunksize=float('inf'), streaming=False))
+        return chunks[0] if chunks else GeoDataFrame(columns=['cir_id', 'geometry'])
+
+    @staticmethod
+    def __normals(xyz, starts, ends):
+        # Same choice of the two radii as GeomLib3D.getFaceNormalVector, for
+        # all the (closed) rings xyz[starts[k]:ends[k]] at once
+        sizes = ends - starts - 2
+        grp = repeat(arange(len(sizes)), sizes)
+        local = arange(len(grp)) - repeat(cumsum(sizes) - sizes, sizes) + 1
+        idx = repeat(starts, sizes) + local
+        radii = xyz[idx] - xyz[repeat(starts, sizes)]
+
+        # First node the farthest from the first one
+        d2 = (radii ** 2).sum(axis=1)
+        order = lexsort((local, -d2, grp))
+        firsts = order[searchsorted(grp[order], arange(len(sizes)))]
+        first, maxDiamIdx = radii[firsts], local[firsts]
+
+        # Greatest cross product with the first radius
+        products = cross(repeat(first, sizes, axis=0), radii)
+        products[local < repeat(maxDiamIdx, sizes)] *= -1
+        norm2 = (products ** 2).sum(axis=1)
+        norm2[local == repeat(maxDiamIdx, sizes)] = -1.0
+        order = lexsort((local, -norm2, grp))
+        best = products[order[searchsorted(grp[order], arange(len(sizes)))]]
+        return best / sqrt((best ** 2).sum(axis=1))[:, None]
+
+    @staticmethod
+    def __cirChunk(xyz, ringOffsets, polygonOffsets, faceOffsets, normals, f0):
+        nFaces, nRings = len(faceOffsets) - 1, len(ringOffsets) - 1
+        ringSizes = diff(ringOffsets)
+        isExterior = zeros(nRings, dtype=bool)
+        isExterior[polygonOffsets[:-1]] = True
+        isFirst = zeros(nRings, dtype=bool)
+        isFirst[polygonOffsets[faceOffsets[:-1]]] = True
+
+        # One template per ring: [face header] polygon header or 't', ring
+        faceHead, ringHeads = 'f%d %d\r\n\t%g\t%g\t%g\r\n', {True: 'c%d\r\n', False: 't\r\n'}
+        templates = {k: '%d\r\n' + '\t%g\t%g\t%g\r\n' * k for k in unique(ringSizes).tolist()}
+        fmt = ''.join([
+            (faceHead if first else '') + ringHeads[exterior] + templates[k]
+            for first, exterior, k in zip(isFirst.tolist(), isExterior.tolist(), ringSizes.tolist())])
+
+        # All the values, in the order of the template
+        counts = 5 * isFirst + isExterior + 1 + 3 * ringSizes
+        starts = cumsum(counts) - counts
+        values = empty(counts.sum())
+        pos = starts[isFirst][:, None] + arange(5)
+        values[pos] = column_stack([
+            arange(f0 + 1, f0 + nFaces + 1), diff(faceOffsets), normals])
+        pos = starts + 5 * isFirst
+        values[pos[isExterior]] = diff(polygonOffsets) - 1
+        pos += isExterior
+        values[pos] = ringSizes
+        pos += 1
+        values[repeat(pos, 3 * ringSizes) + arange(3 * len(xyz)) -
+               repeat(3 * ringOffsets[:-1], 3 * ringSizes)] = xyz.ravel()
+        return fmt % tuple(values.tolist())
+
+    @staticmethod
+    def writeCir(outputFile, xyz, ringOffsets, polygonOffsets, faceOffsets, chunksize=10000):
+        '''
+        Nested offset arrays, as given by shapely.to_ragged_array for
+        MultiPolygons: the k-th ring spans xyz[ringOffsets[k]:ringOffsets[k + 1]],
+        the first ring of each polygon being its exterior ring, etc.
+        :param outputFile: .cir filename
+        :param xyz: (n, 3) array of the (closed) rings' coordinates, z being
+            NaN for 2D faces (their normal vector is then (0, 0, +/-1))
+        :param ringOffsets: rings of the polygons
+        :param polygonOffsets: polygons of the faces
+        :param faceOffsets: faces
+        :param chunksize: number of faces formatted and written at once
+        '''
+        xyz, ringOffsets = asarray(xyz, dtype=float64), asarray(ringOffsets)
+        polygonOffsets, faceOffsets = asarray(polygonOffsets), asarray(faceOffsets)
+        nFaces = len(faceOffsets) - 1
+
+        # Normal vectors of the exterior ring of the first polygon of each face
+        rings = polygonOffsets[faceOffsets[:-1]]
+        starts, ends = ringOffsets[rings], ringOffsets[rings + 1]
+        is2D = isnan(xyz[starts, 2]) if nFaces else zeros(0, dtype=bool)
+        normals = zeros((nFaces, 3))
+        if is2D.any():
+            ccw = is_ccw(linearrings(xyz[:, :2], indices=repeat(
+                arange(len(ringOffsets) - 1), diff(ringOffsets)))[rings[is2D]])
+            normals[is2D, 2] = where(ccw, 1, -1)
+        normals[~is2D] = CirValLib.__normals(xyz, starts[~is2D], ends[~is2D])
+        xyz = nan_to_num(xyz, nan=0.0)
+
+        with open(outputFile, 'w') as f:
+            f.write('%d\t%d\r\n%s' % (nFaces, nFaces, '\t99999\t99999\r\n' * 5))
+            for f0 in range(0, nFaces, chunksize):
+                f1 = min(f0 + chunksize, nFaces)
+                p0, p1 = faceOffsets[f0], faceOffsets[f1]
+                r0, r1 = polygonOffsets[p0], polygonOffsets[p1]
+                c0, c1 = ringOffsets[r0], ringOffsets[r1]
+                f.write(CirValLib.__cirChunk(
+                    xyz[c0:c1], ringOffsets[r0:r1 + 1] - c0, polygonOffsets[p0:p1 + 1] - r0,
+                    faceOffsets[f0:f1 + 1] - p0, normals[f0:f1], f0))
+
+    @staticmethod
+    def __valArrays(tokens):
+        # Each face is given by: fN nbContours value_1 ... value_nbContours
+        tokens = array(tokens)
+        facePos = flatnonzero(char.startswith(tokens, 'f'))
+        faceNumbers = char.lstrip(tokens[facePos], 'f').astype(int)
+        nbContours = tokens[facePos + 1].astype(float).astype(int)
+
+        ctrNumbers = arange(nbContours.sum()) - repeat(cumsum(nbContours) - nbContours, nbContours)
+        values = tokens[repeat(facePos + 2, nbContours) + ctrNumbers].astype(float)
+
+        cirIds = repeat(faceNumbers, nbContours).astype(str)
+        multi = repeat(1 < nbContours, nbContours)
+        cirIds[multi] = char.add(char.add(cirIds[multi], '#'), ctrNumbers[multi].astype(str))
+        return cirIds.astype(object), values
+
+    @staticmethod
+    def iterVal(inputFile, chunksize=100000):
+        '''
+        :param inputFile: .val filename or StringIO
+        :param chunksize: number of faces per chunk
+        :return: generator of (cirIds, values) arrays
+        '''
+        it = CirValLib.__tokens(inputFile, True)
+        # Skip the number of faces, the sup. number of faces, min. and max. values
+        header = list(islice(it, 4))
+        if 4 > len(header):
+            return
+
+        buf, nFaces = [], 0
+        for token in it:
+            if token.startswith('f'):
+                if chunksize == nFaces:
+                    yield CirValLib.__valArrays(buf)
+                    buf, nFaces = [], 0
+                nFaces += 1
+            buf.append(token)
+        if buf:
+            yield CirValLib.__valArrays(buf)
+
+    @staticmethod
+    def readVal(inputFile):
+        '''
+        :param inputFile: .val filename or StringIO
+        :return: (cirIds, values) arrays
+        '''
+        tokens = list(CirValLib.__tokens(inputFile, False))
+        if 4 >= len(tokens):
+            return empty(0, dtype=object), empty(0)
+        return CirValLib.__valArrays(tokens[4:])
+
+    @staticmethod
+    def align(refIds, cirIds, values):
+        '''
+        :return: the values reordered along refIds (NaN where missing), without
+            any lookup when both share the same order of cir_id
+        '''
+        refIds = asarray(refIds)
+        if (len(refIds) == len(cirIds)) and (refIds == cirIds).all():
+            return values
+        return Series(values, index=cirIds).groupby(level=0).first().reindex(
+            refIds).to_numpy()
+
+    @staticmethod
+    def joinVal(gdf, cirIds, values, fieldname):
+        '''
+        Attach the values to the faces of gdf
+        '''
+        gdf[fieldname] = CirValLib.align(gdf.cir_id.to_numpy(), cirIds, values)
+        return gdf
+
+    @staticmethod
+    def readValMatrix(refIds, valFilenames, outputFile=None):
+        '''
+        Read the .val files as one (nFaces, nSteps) float32 matrix, in Fortran
+        order so that each step is a contiguous column
+        :param refIds: cir_id of the faces (i.e. rows of the matrix)
+        :param valFilenames: .val filenames (i.e. columns of the matrix)
+        :param outputFile: if given, the matrix is a memory-mapped .npy file,
+            filled one step at a time
+        :return: matrix
+        '''
+        shape = (len(refIds), len(valFilenames))
+        if outputFile is None:
+            matrix = empty(shape, dtype=float32, order='F')
+        else:
+            matrix = open_memmap(outputFile, mode='w+', dtype=float32, shape=shape,
+                                 fortran_order=True)
+        for j, filename in enumerate(valFilenames):
+            cirIds, values = CirValLib.readVal(filename)
+            matrix[:, j] = CirValLib.align(refIds, cirIds, values)
+        if outputFile is not None:
+            matrix.flush()
+        return matrix
+
+    @staticmethod
+    def loadValMatrix(inputFile):
+        '''
+        :param inputFile: .npy file written by readValMatrix
+        :return: read-only memory-mapped matrix
+        '''
+        return load(inputFile, mmap_mode='r')
+
+    @staticmethod
+    def writeParquet(matrix, fieldnames, outputFile):
+        '''
+        Store the matrix in a Parquet file, one column per step
+        '''
+        from pyarrow import table
+        from pyarrow.parquet import write_table
+
+        write_table(table({fieldname: asarray(matrix[:, j])
+                           for j, fieldname in enumerate(fieldnames)}), outputFile)
+
+    @staticmethod
+    def readParquet(inputFile, fieldnames=None):
+        '''
+        :param fieldnames: steps to read (all of them by default)
+        :return: matrix, fieldnames
+        '''
+        from pyarrow.parquet import read_table
+
+        tbl = read_table(inputFile, columns=fieldnames)
+        matrix = empty((tbl.num_rows, tbl.num_columns), dtype=float32, order='F')
+        for j, column in enumerate(tbl.columns):
+            matrix[:, j] = column.to_numpy()
+        return matrix, tbl.column_names
+
+    @staticmethod
+    def __steps(matrix, chunksize):
+        for j in range(0, matrix.shape[1], chunksize):
+            yield asarray(matrix[:, j:j + chunksize], dtype=float64)
+
+    @staticmethod
+    def aggregate(matrix, func='mean', chunksize=64):
+        '''
+        Per face aggregation over the steps, NaN values being ignored; the
+        matrix (possibly memory-mapped) is read chunksize steps at a time
+        :param func: 'mean', 'sum', 'min' or 'max'
+        :return: (nFaces,) array
+        '''
+        nFaces = matrix.shape[0]
+        if func in ('mean', 'sum'):
+            total, count = zeros(nFaces), zeros(nFaces, dtype=int)
+            for block in CirValLib.__steps(matrix, chunksize):
+                total += nansum(block, axis=1)
+                count += (~isnan(block)).sum(axis=1)
+            if 'sum' == func:
+                return total
+            return divide(total, count, out=full(nFaces, nan), where=0 < count)
+        if func in ('min', 'max'):
+            ufunc = fmin if ('min' == func) else fmax
+            result = full(nFaces, nan)
+            for block in CirValLib.__steps(matrix, chunksize):
+                result = ufunc(result, ufunc.reduce(block, axis=1))
+            return result
+        raise Exception(f'{func} is not a relevant aggregation function!')
+
+    @staticmethod
+    def hoursAbove(matrix, threshold, stepDuration=1.0, chunksize=64):
+        '''
+        :param threshold: threshold value
+        :param stepDuration: duration of a step, in hours
+        :return: (nFaces,) array of the durations with values above threshold
+        '''
+        result = zeros(matrix.shape[0])
+        for block in CirValLib.__steps(matrix, chunksize):
+            result += (block > threshold).sum(axis=1)
+        return stepDuration * result
@@ -0,0 +1,65 @@
+'''
+Created on 19 Oct. 2026
+
+@author: tleduc
+
+Copyright 2020-2026 Thomas Leduc
+
+This file is part of t4gpd.
+
+t4gpd is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+t4gpd is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with t4gpd.  If not, see <https://www.gnu.org/licenses/>.
+'''
+from os.path import basename, splitext
+
+from t4gpd.io.AbstractReader import AbstractReader
+from t4gpd.io.CirValLib import CirValLib
+
+
+class CirValMatrixReader(AbstractReader):
+    '''
+    classdocs
+
+    Columnar counterpart of CirValReader, for long simulation time series:
+    the geometry is returned once, and the .val files as one (nFaces, nSteps)
+    float32 matrix instead of nSteps columns of a GeoDataFrame.
+    '''
+
+    def __init__(self, cirFilename, *valFilenames, outputFile=None):
+        '''
+        Constructor
+        :param outputFile: if given, .npy file where the matrix is memory-mapped
+        '''
+        self.cirFilename = cirFilename
+        self.valFilenames = valFilenames
+        self.outputFile = outputFile
+
+    def run(self):
+        gdf = CirValLib.readCir(self.cirFilename)
+        fieldnames = [basename(splitext(filename)[0]) for filename in self.valFilenames]
+        matrix = CirValLib.readValMatrix(
+            gdf.cir_id.to_numpy(), self.valFilenames, self.outputFile)
+        return gdf, matrix, fieldnames
+
+
+"""
+from glob import glob
+
+dirName = "/home/tleduc/prj/solene/annual_run"
+gdf, matrix, fieldnames = CirValMatrixReader(
+    f"{dirName}/scene.cir", *sorted(glob(f"{dirName}/flux_*.val")),
+    outputFile="/tmp/flux.npy").run()
+
+gdf["mean"] = CirValLib.aggregate(matrix, "mean")
+gdf["h_above_300"] = CirValLib.hoursAbove(matrix, 300.0)
+"""
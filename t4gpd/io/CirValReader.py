@@ -20,9 +20,10 @@ GNU General Public License for more details.
 You should have received a copy of the GNU General Public License
 along with t4gpd.  If not, see <https://www.gnu.org/licenses/>.
 '''
+from os.path import basename, splitext
+
 from t4gpd.io.AbstractReader import AbstractReader
-from t4gpd.io.CirReader import CirReader
-from t4gpd.io.ValReader import ValReader
+from t4gpd.io.CirValLib import CirValLib
 
 
 class CirValReader(AbstractReader):
@@ -38,8 +39,10 @@ class CirValReader(AbstractReader):
         self.valFilenames = valFilenames
 
     def run(self):
-        gdf = CirReader(self.cirFilename).run()
+        # The geometry is parsed once, whatever the number of .val files
+        gdf = CirValLib.readCir(self.cirFilename)
         for filename in self.valFilenames:
-            df = ValReader(filename).run()
-            gdf = gdf.merge(df, how='left', on='cir_id')
+            cirIds, values = CirValLib.readVal(filename)
+            fieldname = basename(splitext(filename)[0])
+            gdf = CirValLib.joinVal(gdf, cirIds, values, fieldname)
         return gdf
@@ -21,11 +21,11 @@ You should have received a copy of the GNU General Public License
 along with t4gpd.  If not, see <https://www.gnu.org/licenses/>.
 '''
 from geopandas.geodataframe import GeoDataFrame
-from shapely.geometry import MultiPolygon, Polygon
+from numpy import arange, flatnonzero, isin, zeros
+from shapely import GeometryType, get_type_id, to_ragged_array
 from t4gpd.commons.GeoProcess import GeoProcess
-from t4gpd.commons.GeomLib import GeomLib
-from t4gpd.commons.GeomLib3D import GeomLib3D
 from t4gpd.commons.IllegalArgumentTypeException import IllegalArgumentTypeException
+from t4gpd.io.CirValLib import CirValLib
 
 
 class CirWriter(GeoProcess):
@@ -33,9 +33,11 @@ class CirWriter(GeoProcess):
     classdocs
     '''
 
-    def __init__(self, inputGdf, outputFile, translate=False):
+    def __init__(self, inputGdf, outputFile, translate=False, chunksize=10000):
         '''
         Constructor
+
+        :param chunksize: number of faces formatted and written at once
         '''
         if not isinstance(inputGdf, GeoDataFrame):
             raise IllegalArgumentTypeException(inputGdf, 'GeoDataFrame')
@@ -44,54 +46,24 @@ class CirWriter(GeoProcess):
 
         minx, miny, _, _ = self.inputGdf.total_bounds
         self.llc = [minx, miny] if translate else [0, 0]
-
-    def __printCoordinates(self, coord, llc=[0, 0]):
-        return '\t%g\t%g\t%g' % (coord[0] - llc[0], coord[1] - llc[1], coord[2])
-
-    def __printHeader(self):
-        return '%d\t%d\r\n%s' % (
-            len(self.inputGdf),
-            len(self.inputGdf),
-            '\t99999\t99999\r\n' * 5)
-
-    def __printGeometry(self, faceIdx, geometry):
-        if GeomLib.isPolygonal(geometry):
-            if isinstance(geometry, Polygon):
-                nCtrs = 1
-                _polygons = [geometry]
-
-            elif isinstance(geometry, MultiPolygon):
-                nCtrs = len(geometry.geoms)
-                _polygons = geometry.geoms
-
-            _normal = GeomLib3D.getFaceNormalVector(_polygons[0])
-            result = 'f%d %d\r\n%s\r\n' % (faceIdx, nCtrs, self.__printCoordinates(_normal))
-            for _geom in _polygons:
-                result += self.__printPolygon(_geom)
-            return result
-
-        raise IllegalArgumentTypeException(geometry, 'Polygon or MultiPolygon')
-
-    def __printPolygon(self, polygon):
-        result = 'c%d\r\n' % (len(polygon.interiors))
-        result += self.__printRing(polygon.exterior)
-        for hole in polygon.interiors:
-            result += 't\r\n'
-            result += self.__printRing(hole)
-        return result
-
-    def __printRing(self, ring):
-        ring = GeomLib.addZCoordinateIfNecessary(ring)
-        return '%d\r\n%s\r\n' % (
-            len(ring.coords),
-            '\r\n'.join([self.__printCoordinates(c, self.llc) for c in ring.coords]))
+        self.chunksize = chunksize
 
     def run(self):
-        with open(self.outputFile, 'w') as f:
-            f.write(self.__printHeader())
-
-            faceIdx = 1
-            for _, row in self.inputGdf.iterrows():
-                _geom = row.geometry
-                f.write(self.__printGeometry(faceIdx, _geom))
-                faceIdx += 1
+        geoms = self.inputGdf.geometry.values
+        notPolygonal = flatnonzero(~isin(get_type_id(geoms), [3, 6]))
+        if 0 < len(notPolygonal):
+            raise IllegalArgumentTypeException(geoms[notPolygonal[0]], 'Polygon or MultiPolygon')
+
+        if 0 == len(geoms):
+            xyz, ringOffsets, polygonOffsets, faceOffsets = zeros((0, 3)), [0], [0], [0]
+        else:
+            geomType, xyz, offsets = to_ragged_array(geoms, include_z=True)
+            if GeometryType.POLYGON == geomType:
+                # One polygon per face
+                offsets = offsets + (arange(len(geoms) + 1),)
+            ringOffsets, polygonOffsets, faceOffsets = offsets
+            xyz[:, 0] -= self.llc[0]
+            xyz[:, 1] -= self.llc[1]
+
+        CirValLib.writeCir(self.outputFile, xyz, ringOffsets, polygonOffsets,
+                           faceOffsets, self.chunksize)
@@ -0,0 +1,232 @@
+'''
+Created on 19 Oct. 2026
+
+@author: tleduc
+
+Copyright 2020-2026 Thomas Leduc
+
+This file is part of t4gpd.
+
+t4gpd is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+t4gpd is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with t4gpd.  If not, see <https://www.gnu.org/licenses/>.
+'''
+from io import BytesIO
+from functools import lru_cache
+from itertools import chain
+from mmap import ACCESS_READ, mmap
+from multiprocessing import cpu_count, Pool
+from re import compile as re_compile
+from xml.etree.ElementTree import iterparse
+
+from geopandas import GeoDataFrame
+from numpy import arange, array, concatenate, fromstring, repeat
+from pandas import concat
+from shapely import linearrings, polygons
+from t4gpd.commons.GeoProcess import GeoProcess
+
+
+class CityGMLStreamReader(GeoProcess):
+    '''
+    classdocs
+
+    Streaming counterpart of CityGMLReader: the file is parsed incrementally,
+    one city object (i.e. cityObjectMember) at a time, with early filtering by
+    bbox and by surface type, and the polygons are yielded by batches. Large
+    files can be split into chunks of city objects parsed in parallel.
+    '''
+    SURFACES = ('GroundSurface', 'RoofSurface', 'WallSurface', 'ClosureSurface',
+                'OuterCeilingSurface', 'OuterFloorSurface')
+    OPENINGS = ('Door', 'Window')
+    FIELDNAMES = ['type', 'objectId', 'subType', 'subObjectId', 'subSubType',
+                  'polygonId', 'geometry']
+    RE_MEMBER = re_compile(rb'<(\w+:)?cityObjectMember[\s>]')
+    RE_ROOT_END = re_compile(rb'</(\w+:)?CityModel\s*>')
+
+    def __init__(self, inputFile, srcEpsgCode='EPSG:4326', dstEpsgCode=None,
+                 bbox=None, surfaceTypes=None, batchsize=10000, ncpus=1, chunksize=1000):
+        '''
+        Constructor
+        :param bbox: (minx, miny, maxx, maxy) in srcEpsgCode, city objects and
+            polygons outside the bbox are skipped
+        :param surfaceTypes: e.g. ['RoofSurface', 'WallSurface'], polygons of
+            other (or without) boundary surfaces are skipped
+        :param batchsize: minimum number of polygons per yielded GeoDataFrame
+            (but the last one), city objects not being split between batches
+        :param ncpus: number of processes (all CPUs if None); parallel parsing
+            requires a filename
+        :param chunksize: number of city objects per parallel chunk
+        '''
+        self.inputFile = inputFile
+        self.crs = srcEpsgCode
+        self.dstEpsgCode = dstEpsgCode
+        self.bbox = bbox
+        self.surfaceTypes = None if surfaceTypes is None else set(surfaceTypes)
+        self.batchsize = batchsize
+        self.ncpus = cpu_count() if ncpus is None else ncpus
+        self.chunksize = chunksize
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def __tagname(tag):
+        return tag.rsplit('}', 1)[-1]
+
+    @staticmethod
+    def __localname(elem):
+        return CityGMLStreamReader.__tagname(elem.tag)
+
+    @staticmethod
+    def __children(elem, localname):
+        return [child for child in elem if localname == CityGMLStreamReader.__localname(child)]
+
+    def __isOutside(self, minx, miny, maxx, maxy):
+        return (self.bbox is not None) and (
+            (maxx < self.bbox[0]) or (maxy < self.bbox[1]) or
+            (self.bbox[2] < minx) or (self.bbox[3] < miny))
+
+    def __envelopeIsOutside(self, obj):
+        # City objects usually carry their envelope: no need to parse them
+        for boundedBy in CityGMLStreamReader.__children(obj, 'boundedBy'):
+            for envelope in CityGMLStreamReader.__children(boundedBy, 'Envelope'):
+                lower = CityGMLStreamReader.__children(envelope, 'lowerCorner')
+                upper = CityGMLStreamReader.__children(envelope, 'upperCorner')
+                if lower and upper:
+                    lower = fromstring(lower[0].text, sep=' ')
+                    upper = fromstring(upper[0].text, sep=' ')
+                    return self.__isOutside(lower[0], lower[1], upper[0], upper[1])
+        return False
+
+    @staticmethod
+    def __ring(ring):
+        # A LinearRing is given by a posList or by a sequence of pos
+        posList = CityGMLStreamReader.__children(ring, 'posList')
+        if posList:
+            dim = int(posList[0].get('srsDimension', 3))
+            return fromstring(posList[0].text, sep=' ').reshape(-1, dim)
+        return array([fromstring(pos.text, sep=' ')
+                      for pos in CityGMLStreamReader.__children(ring, 'pos')])
+
+    def __polygon(self, polygon):
+        rings = []
+        for boundary in chain(CityGMLStreamReader.__children(polygon, 'exterior'),
+                              CityGMLStreamReader.__children(polygon, 'interior')):
+            for ring in CityGMLStreamReader.__children(boundary, 'LinearRing'):
+                rings.append(CityGMLStreamReader.__ring(ring))
+        if (0 == len(rings)) or (0 == len(rings[0])):
+            return None
+        (minx, miny), (maxx, maxy) = rings[0][:, :2].min(axis=0), rings[0][:, :2].max(axis=0)
+        if self.__isOutside(minx, miny, maxx, maxy):
+            return None
+        return rings
+
+    def __walk(self, elem, context, batch):
+        localname = CityGMLStreamReader.__localname(elem)
+        if localname in CityGMLStreamReader.SURFACES:
+            if (self.surfaceTypes is not None) and (localname not in self.surfaceTypes):
+                return
+            context = context[:2] + (localname, elem.get(self.gmlId), None)
+        elif localname in CityGMLStreamReader.OPENINGS:
+            context = context[:4] + (localname,)
+        elif localname in ('Polygon', 'Triangle'):
+            if (self.surfaceTypes is None) or (context[2] is not None):
+                rings = self.__polygon(elem)
+                if rings is not None:
+                    batch.append(context + (elem.get(self.gmlId), rings))
+            return
+        for child in elem:
+            self.__walk(child, context, batch)
+
+    def __cityObject(self, obj, batch):
+        if self.__envelopeIsOutside(obj):
+            return
+        context = (CityGMLStreamReader.__localname(obj), obj.get(self.gmlId), None, None, None)
+        for child in obj:
+            self.__walk(child, context, batch)
+
+    def __toGeoDataFrame(self, batch):
+        rings = [ring for row in batch for ring in row[-1]]
+        nRings = [len(row[-1]) for row in batch]
+        xyz = concatenate(rings)
+        geoms = polygons(
+            linearrings(xyz, indices=repeat(arange(len(rings)), [len(ring) for ring in rings])),
+            indices=repeat(arange(len(batch)), nRings))
+        gdf = GeoDataFrame([row[:-1] for row in batch], columns=self.FIELDNAMES[:-1])
+        return GeoDataFrame(gdf, geometry=geoms, crs=self.crs)
+
+    def _iterparse(self, source):
+        batch, root = [], None
+        self.gmlId = '{http://www.opengis.net/gml}id'
+        for event, elem in iterparse(source, events=('start-ns', 'start', 'end')):
+            if 'start-ns' == event:
+                # The gml namespace depends on the version of CityGML
+                if elem[1].startswith('http://www.opengis.net/gml'):
+                    self.gmlId = '{%s}id' % elem[1]
+            elif root is None:
+                root = elem
+            elif ('end' == event) and elem.tag.endswith('cityObjectMember'):
+                for obj in elem:
+                    self.__cityObject(obj, batch)
+                # Free the memory of the already parsed city objects
+                root.clear()
+                if self.batchsize <= len(batch):
+                    yield self.__toGeoDataFrame(batch)
+                    batch = []
+        if batch:
+            yield self.__toGeoDataFrame(batch)
+
+    def __chunks(self):
+        # Byte offsets of the city objects, the header and footer being
+        # copied into each chunk to keep it a well-formed CityGML document
+        with open(self.inputFile, 'rb') as f, mmap(f.fileno(), 0, access=ACCESS_READ) as mm:
+            offsets = [match.start() for match in self.RE_MEMBER.finditer(mm)]
+            end = mm.rfind(b'</')
+            if (0 == len(offsets)) or (-1 == end) or (not self.RE_ROOT_END.match(mm, end)):
+                return []
+        bounds = offsets[::self.chunksize] + [end]
+        return [(bounds[0], bounds[i], bounds[i + 1], end) for i in range(len(bounds) - 1)]
+
+    def _parseChunk(self, chunk):
+        headerEnd, start, stop, end = chunk
+        with open(self.inputFile, 'rb') as f:
+            header = f.read(headerEnd)
+            f.seek(start)
+            body = f.read(stop - start)
+            f.seek(end)
+            footer = f.read()
+        batches = list(self._iterparse(BytesIO(header + body + footer)))
+        return concat(batches, ignore_index=True) if batches else None
+
+    def __batches(self):
+        if (1 == self.ncpus) or not isinstance(self.inputFile, str):
+            yield from self._iterparse(self.inputFile)
+        else:
+            with Pool(self.ncpus) as pool:
+                # imap keeps the order of the city objects
+                for gdf in pool.imap(self._parseChunk, self.__chunks()):
+                    if gdf is not None:
+                        yield gdf
+
+    def iterrun(self):
+        '''
+        :return: generator of GeoDataFrames of polygons
+        '''
+        for gdf in self.__batches():
+            if self.dstEpsgCode is not None:
+                gdf = gdf.to_crs(self.dstEpsgCode)
+            yield gdf
+
+    def run(self):
+        batches = list(self.iterrun())
+        if 0 == len(batches):
+            crs = self.crs if (self.dstEpsgCode is None) else self.dstEpsgCode
+            return GeoDataFrame(columns=self.FIELDNAMES, geometry='geometry', crs=crs)
+        return GeoDataFrame(concat(batches, ignore_index=True))
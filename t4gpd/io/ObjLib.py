@@ -0,0 +1,170 @@
+'''
+Created on 19 Oct. 2026
+
+@author: tleduc
+
+Copyright 2020-2026 Thomas Leduc
+
+This file is part of t4gpd.
+
+t4gpd is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+t4gpd is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with t4gpd.  If not, see <https://www.gnu.org/licenses/>.
+'''
+from numpy import (arange, array, asarray, char, concatenate, cumsum, diff, empty, nan_to_num,
+                   ones, repeat, unique, where)
+from pandas import DataFrame
+from shapely import (get_coordinates, get_exterior_ring, get_type_id, linearrings,
+                     linestrings, polygons)
+
+
+class ObjLib(object):
+    '''
+    classdocs
+
+    Wavefront OBJ files as arrays: an (n, 3) array of vertices, and, for the
+    faces (f records) and polylines (l records) of any number of vertices,
+    a flat array of 0-based vertex indices plus an offsets array (the k-th
+    element spans indices[offsets[k]:offsets[k + 1]]). Geometries are only
+    built on demand.
+    '''
+
+    @staticmethod
+    def __indices(tokens, sizes, bases):
+        if 0 == len(sizes):
+            return empty(0, dtype=int), array([0])
+        tokens = array(tokens)
+        # v/vt/vn triples: only the vertex index is kept
+        if char.find(tokens, '/').max() >= 0:
+            tokens = char.partition(tokens, '/')[:, 0]
+        indices = tokens.astype(int)
+        # Negative indices are relative to the vertices already read
+        indices = where(indices < 0, repeat(bases, sizes) + indices, indices - 1)
+        return indices, concatenate([[0], cumsum(sizes)])
+
+    @staticmethod
+    def read(inputFile):
+        '''
+        :param inputFile: .obj filename
+        :return: vertices, (faceIndices, faceOffsets), (lineIndices, lineOffsets)
+        '''
+        vTokens = []
+        fTokens, fSizes, fBases = [], [], []
+        lTokens, lSizes, lBases = [], [], []
+
+        with open(inputFile, 'r') as f:
+            for line in f:
+                tokens = line.split()
+                if 0 == len(tokens):
+                    continue
+                key = tokens[0]
+                if 'v' == key:
+                    vTokens.extend(tokens[1:4])
+                elif 'f' == key:
+                    fTokens.extend(tokens[1:])
+                    fSizes.append(len(tokens) - 1)
+                    fBases.append(len(vTokens) // 3)
+                elif 'l' == key:
+                    lTokens.extend(tokens[1:])
+                    lSizes.append(len(tokens) - 1)
+                    lBases.append(len(vTokens) // 3)
+
+        vertices = array(vTokens, dtype=float).reshape(-1, 3)
+        return (vertices,
+                ObjLib.__indices(fTokens, fSizes, fBases),
+                ObjLib.__indices(lTokens, lSizes, lBases))
+
+    @staticmethod
+    def polygons(vertices, indices, offsets):
+        '''
+        :return: array of the Polygons of the faces
+        '''
+        sizes = diff(offsets)
+        rings = linearrings(vertices[indices], indices=repeat(arange(len(sizes)), sizes))
+        return polygons(rings)
+
+    @staticmethod
+    def linestrings(vertices, indices, offsets):
+        '''
+        :return: array of the LineStrings of the polylines
+        '''
+        sizes = diff(offsets)
+        return linestrings(vertices[indices], indices=repeat(arange(len(sizes)), sizes))
+
+    @staticmethod
+    def fromGeometries(geoms):
+        '''
+        Deduplicate the vertices of the geometries through a hash of their
+        coordinates, the vertices being numbered in order of appearance
+        :param geoms: array of Polygons (exterior rings) and LineStrings
+        :return: vertices, (faceIndices, faceOffsets), (lineIndices, lineOffsets)
+        '''
+        geoms = asarray(geoms)
+        typeIds = get_type_id(geoms)
+        # As z is NaN for 2D geometries, (x, y) and (x, y, 0) are distinct vertices
+        allXyz = get_coordinates(geoms, include_z=True)
+        faceXyz, faceIds = get_coordinates(
+            get_exterior_ring(geoms[3 == typeIds]), include_z=True, return_index=True)
+        lineXyz, lineIds = get_coordinates(
+            geoms[(1 == typeIds) | (2 == typeIds)], include_z=True, return_index=True)
+
+        # 0.0 is added to identify -0.0 and 0.0
+        codes = DataFrame(concatenate([allXyz, faceXyz, lineXyz]) + 0.0).groupby(
+            [0, 1, 2], sort=False, dropna=False).ngroup().to_numpy()
+        _, firsts = unique(codes[:len(allXyz)], return_index=True)
+        vertices = nan_to_num(allXyz[firsts], nan=0.0)
+
+        nAll, nFace = len(allXyz), len(faceXyz)
+        faceOffsets = concatenate([[0], cumsum(unique(faceIds, return_counts=True)[1])])
+        lineOffsets = concatenate([[0], cumsum(unique(lineIds, return_counts=True)[1])])
+        return (vertices,
+                (codes[nAll:nAll + nFace], faceOffsets),
+                (codes[nAll + nFace:], lineOffsets))
+
+    @staticmethod
+    def __format(indices, offsets, head, numbered):
+        # One format string for all the elements, whatever their sizes
+        sizes = diff(offsets)
+        templates = {k: head + ' %d' * k + '\n' for k in unique(sizes).tolist()}
+        fmt = ''.join([templates[k] for k in sizes.tolist()])
+
+        if not numbered:
+            return fmt, indices + 1
+        # Each element is preceded by its (1-based) number
+        values = empty(len(sizes) + len(indices), dtype=int)
+        isIndex = ones(len(values), dtype=bool)
+        isIndex[offsets[:-1] + arange(len(sizes))] = False
+        values[~isIndex] = arange(1, len(sizes) + 1)
+        values[isIndex] = indices + 1
+        return fmt, values
+
+    @staticmethod
+    def write(outputFile, vertices, faces=None, lines=None, header=''):
+        '''
+        :param vertices: (n, 3) array
+        :param faces: (faceIndices, faceOffsets) with 0-based indices
+        :param lines: (lineIndices, lineOffsets) with 0-based indices
+        '''
+        with open(outputFile, 'w') as out:
+            out.write(header)
+            out.write('# ===== %d vertices =====\n\n' % (len(vertices)))
+            out.write(('v %.5f %.5f %.5f\n' * len(vertices)) % tuple(vertices.ravel().tolist()))
+
+            if (faces is not None) and (1 < len(faces[1])):
+                fmt, values = ObjLib.__format(*faces, '\ng %d\nf', True)
+                out.write('\n# ===== %d face(s) =====\n' % (len(faces[1]) - 1))
+                out.write(fmt % tuple(values.tolist()))
+
+            if (lines is not None) and (1 < len(lines[1])):
+                fmt, values = ObjLib.__format(*lines, 'l', False)
+                out.write('\n# ===== %d polyline(s) =====\n\n' % (len(lines[1]) - 1))
+                out.write(fmt % tuple(values.tolist()))
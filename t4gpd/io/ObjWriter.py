@@ -20,15 +20,14 @@ GNU General Public License for more details.
 You should have received a copy of the GNU General Public License
 along with t4gpd.  If not, see <https://www.gnu.org/licenses/>.
 '''
-from builtins import isinstance
 from datetime import datetime
 from warnings import warn
 
 from geopandas.geodataframe import GeoDataFrame
-from shapely.geometry import LineString, Polygon
+from shapely import get_type_id
 from t4gpd.commons.GeoProcess import GeoProcess
-from t4gpd.commons.GeomLib import GeomLib
 from t4gpd.commons.IllegalArgumentTypeException import IllegalArgumentTypeException
+from t4gpd.io.ObjLib import ObjLib
 
 
 class ObjWriter(GeoProcess):
@@ -46,52 +45,13 @@ class ObjWriter(GeoProcess):
 
         self.outputFile = outputFile
 
-    def __dumpVertex(self, coords):
-        z = 0.0
-        if 2 == len(coords):
-            x, y = coords
-        elif 3 == len(coords):
-            x, y, z = coords
-        return 'v %.5f %.5f %.5f\n' % (x, y, z)
-        # return 'v %g %g %g\n' % (x, y, z)
-
-    def __dumpListOfVertices(self, myDictOfVertices, vertices):
-        return ' '.join([str(myDictOfVertices[vtx]) for vtx in vertices])
-
     def run(self):
-        myDictOfVertices, myListOfLines, myListOfFaces = dict(), [], []
-
-        for _, row in self.inputGdf.iterrows():
-            geom = row.geometry
-
-            points = GeomLib.getListOfShapelyPoints(geom)
-            for _p in points:
-                p = _p.coords[0]
-                if p not in myDictOfVertices:
-                    myDictOfVertices[p] = 1 + len(myDictOfVertices)
-
-            if isinstance(geom, Polygon):
-                myListOfFaces.append(list(geom.exterior.coords))
-            elif isinstance(geom, LineString):
-                myListOfLines.append(geom.coords)
-            else:
-                warn('ObjWriter deals only with LineString and Polygon!')
-
-        with open(self.outputFile, 'w') as out:
-            out.write('# t4gpd.io.ObjWriter - dev. in 2020, by T. Leduc, AAU-CRENAU\n')
-            out.write('# OBJ generated on %s\n\n' % (datetime.now().strftime("%d.%m.%Y at %H:%M:%S")))
-            out.write('# ===== %d vertices =====\n\n' % (len(myDictOfVertices)))
-
-            for p, _ in sorted(myDictOfVertices.items(), key=lambda kv:kv[1]):
-                out.write(self.__dumpVertex(p))
+        geoms = self.inputGdf.geometry.values
+        if not ((0 < get_type_id(geoms)) & (get_type_id(geoms) < 4)).all():
+            warn('ObjWriter deals only with LineString and Polygon!')
 
-            if 0 < len(myListOfFaces):
-                out.write('\n# ===== %d face(s) =====\n' % (len(myListOfFaces)))
-                for i, f in enumerate(myListOfFaces, start=1):
-                    out.write('\ng %d\n' % (i))
-                    out.write('f %s\n' % (self.__dumpListOfVertices(myDictOfVertices, f)))
+        vertices, faces, lines = ObjLib.fromGeometries(geoms)
 
-            if 0 < len(myListOfLines):
-                out.write('\n# ===== %d polyline(s) =====\n\n' % (len(myListOfLines)))
-                for l in myListOfLines:
-                    out.write('l %s\n' % (self.__dumpListOfVertices(myDictOfVertices, l)))
+        header = '# t4gpd.io.ObjWriter - dev. in 2020, by T. Leduc, AAU-CRENAU\n'
+        header += '# OBJ generated on %s\n\n' % (datetime.now().strftime("%d.%m.%Y at %H:%M:%S"))
+        ObjLib.write(self.outputFile, vertices, faces, lines, header)
@@ -0,0 +1,162 @@
+'''
+Created on 19 Oct. 2026
+
+@author: tleduc
+
+Copyright 2020-2026 Thomas Leduc
+
+This file is part of t4gpd.
+
+t4gpd is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+t4gpd is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with t4gpd.  If not, see <https://www.gnu.org/licenses/>.
+'''
+from glob import glob
+import json
+from os import makedirs, remove, replace
+from os.path import exists, join
+
+from geopandas import GeoDataFrame, GeoSeries, read_feather, read_parquet
+from pandas import DataFrame
+from pandas import read_parquet as pd_read_parquet
+from shapely.geometry.base import BaseGeometry
+from t4gpd.commons.Checksum import Checksum
+
+
+class ResultCache(object):
+    '''
+    classdocs
+
+    Cache of expensive intermediate products (GeoDataFrames, DataFrames, or
+    tuples of them) on disk, as GeoParquet or Feather files: list or array
+    columns (angles, ray lengths, etc.) are stored natively, and read back
+    as NumPy arrays. Entries are keyed by a digest of the inputs (see
+    Checksum.md5Of), so that a repeat run with the same scene and the same
+    parameters reuses the stored result instead of recomputing it.
+
+    Example:
+        cache = ResultCache('/tmp/t4gpd_cache')
+        isovRaysField, isovField = cache.run(
+            STIsovistField2D, buildings, viewpoints, nRays=64, rayLength=100.0)
+    '''
+    FORMATS = ('parquet', 'feather')
+
+    def __init__(self, cacheDir, format='parquet'):
+        '''
+        Constructor
+        '''
+        if format not in ResultCache.FORMATS:
+            raise Exception(f'{format} must be one of {ResultCache.FORMATS}!')
+        self.cacheDir = cacheDir
+        self.format = format
+        makedirs(cacheDir, exist_ok=True)
+
+    @staticmethod
+    def key(*args, **kwargs):
+        '''
+        :return: digest of the inputs (GeoDataFrames, parameters, etc.)
+        '''
+        return Checksum.md5Of(*args, **kwargs)
+
+    def __manifest(self, key):
+        return join(self.cacheDir, f'{key}_{self.format}.json')
+
+    def __filename(self, key, i):
+        return join(self.cacheDir, f'{key}_{i}.{self.format}')
+
+    def __contains__(self, key):
+        return exists(self.__manifest(key))
+
+    @staticmethod
+    def __writable(df):
+        # Geometry columns that are not GeoSeries are converted into GeoSeries
+        df = df.copy()
+        for fieldname in df.columns:
+            column = df[fieldname]
+            if (object == column.dtype) and not isinstance(column, GeoSeries):
+                values = column.dropna()
+                if (0 < len(values)) and isinstance(values.iloc[0], BaseGeometry):
+                    df[fieldname] = GeoSeries(column, crs=getattr(df, 'crs', None))
+        return df
+
+    def __write(self, df, filename):
+        tmpFilename = f'{filename}.tmp'
+        df = ResultCache.__writable(df)
+        if 'parquet' == self.format:
+            df.to_parquet(tmpFilename)
+        elif isinstance(df, GeoDataFrame):
+            df.to_feather(tmpFilename)
+        else:
+            from pyarrow import Table, feather
+            feather.write_feather(Table.from_pandas(df), tmpFilename)
+        replace(tmpFilename, filename)
+
+    def __read(self, filename, geo):
+        if geo:
+            return (read_parquet if ('parquet' == self.format) else read_feather)(filename)
+        if 'parquet' == self.format:
+            return pd_read_parquet(filename)
+        from pyarrow import feather
+        return feather.read_table(filename).to_pandas()
+
+    def load(self, key):
+        '''
+        :return: the cached result, or None if there is no such entry
+        '''
+        if key not in self:
+            return None
+        with open(self.__manifest(key), 'r') as f:
+            manifest = json.load(f)
+        result = [
+            self.__read(self.__filename(key, i), geo) for i, geo in enumerate(manifest['geo'])]
+        return tuple(result) if manifest['tuple'] else result[0]
+
+    def save(self, key, result):
+        '''
+        :param result: GeoDataFrame, DataFrame, or tuple of them
+        '''
+        isTuple = isinstance(result, (list, tuple))
+        dfs = list(result) if isTuple else [result]
+        for df in dfs:
+            if not isinstance(df, DataFrame):
+                raise Exception(f'ResultCache does not handle {type(df).__name__}!')
+
+        for i, df in enumerate(dfs):
+            self.__write(df, self.__filename(key, i))
+        # The manifest is written last: an entry is complete once it exists
+        with open(self.__manifest(key), 'w') as f:
+            json.dump({
+                'tuple': isTuple,
+                'geo': [isinstance(df, GeoDataFrame) for df in dfs]}, f)
+
+    def run(self, processClass, *args, **kwargs):
+        '''
+        Reuse the cached result of processClass(*args, **kwargs).run(), or
+        compute and store it. The key is computed from the constructor
+        arguments, so that the (possibly expensive) preprocessing of the
+        constructor is also avoided on repeat runs.
+        '''
+        key = ResultCache.key(
+            f'{processClass.__module__}.{processClass.__qualname__}', *args, **kwargs)
+        result = self.load(key)
+        if result is None:
+            result = processClass(*args, **kwargs).run()
+            self.save(key, result)
+        return result
+
+    def clear(self):
+        '''
+        Remove all the cached entries
+        '''
+        for ext in ('json',) + ResultCache.FORMATS:
+            for filename in glob(join(self.cacheDir, f'*.{ext}')):
+                remove(filename)
@@ -24,14 +24,18 @@ from datetime import datetime
 from os.path import splitext
 
 from geopandas.geodataframe import GeoDataFrame
+from numpy import nan_to_num, savez, zeros
+from shapely import get_type_id, to_ragged_array
 from t4gpd.commons.GeoProcess import GeoProcess
-from t4gpd.commons.GeomLib import GeomLib
 from t4gpd.commons.IllegalArgumentTypeException import IllegalArgumentTypeException
 
 
 class SalomeWriter(GeoProcess):
     '''
     classdocs
+
+    The coordinates of the polygons are saved once, as flat arrays, in a
+    sidecar .npz file that the (compact) SALOME script loads and iterates.
     '''
 
     def __init__(self, inputGdf, outputFile, withFaceIds=False, exportBrep=True):
@@ -45,15 +49,54 @@ class SalomeWriter(GeoProcess):
         self.withFaceIds = withFaceIds
         self.exportBrep = exportBrep
 
-    def _dumpBody(self, out):
-        cntFaces, cntCtrs, cntNodes = 1, 1, 1
-        
-        for _, row in self.inputGdf.iterrows():
-            geom = row.geometry
-            if ('Polygon' == geom.geom_type):
-                cntFaces, cntCtrs, cntNodes = self._dumpPolygon(out, geom, cntFaces, cntCtrs, cntNodes)
-            else:
-                print(f'SalomeWriter does not handle {geom.geom_type}!')
+    def _arrays(self):
+        '''
+        :return: dict of the arrays of the sidecar file: xyz, ringOffsets and
+            polygonOffsets (the first ring of each polygon is its exterior)
+        '''
+        geoms = self.inputGdf.geometry.values
+        isPolygon = (3 == get_type_id(geoms))
+        for geom in geoms[~isPolygon]:
+            print(f'SalomeWriter does not handle {geom.geom_type}!')
+
+        if not isPolygon.any():
+            return {'xyz': zeros((0, 3)), 'ringOffsets': [0], 'polygonOffsets': [0]}
+        _, xyz, (ringOffsets, polygonOffsets) = to_ragged_array(
+            geoms[isPolygon], include_z=True)
+        return {'xyz': nan_to_num(xyz, nan=0.0), 'ringOffsets': ringOffsets,
+                'polygonOffsets': polygonOffsets}
+
+    def _dumpBody(self, out, keys):
+        out.write(f"import numpy\ndata = numpy.load('{self.outputFile}.npz')\n")
+        out.writelines([f"{key} = data['{key}'].tolist()\n" for key in keys])
+        out.write('''
+def makeFace(r):
+    # The last node of a ring repeats the first one
+    pts = [geompy.MakeVertex(x, y, z) for x, y, z in xyz[ringOffsets[r]:ringOffsets[r + 1] - 1]]
+    polyline = geompy.MakePolyline(pts + pts[:1])
+    return geompy.MakeFace(polyline, isPlanarWanted)
+
+faces = []
+for p in range(len(polygonOffsets) - 1):
+    face = makeFace(polygonOffsets[p])
+    # Subtract the holes
+    for r in range(polygonOffsets[p] + 1, polygonOffsets[p + 1]):
+        face = geompy.MakeCut(face, makeFace(r))
+    faces.append(face)
+''')
+        if self.withFaceIds:
+            out.write('''
+    id_face = geompy.addToStudy(face, 'Face_%d' % (p + 1))
+    gg.createAndDisplayGO(id_face)
+    gg.setDisplayMode(id_face, 1)
+''')
+        self._dumpLoopBody(out)
+        out.write('''
+allBuildFaces = geompy.MakeFuseList(faces) if (1 < len(faces)) else faces[0]
+''')
+
+    def _dumpLoopBody(self, out):
+        pass
 
     def _dumpFooter(self, out):
         out.write(f'''
@@ -87,53 +130,11 @@ isPlanarWanted = 1
 # ================================================================
 ''')
 
-    def _dumpPolygon(self, out, geom, cntFaces, cntCtrs, cntNodes):
-        out.write(f'\n# ===== FACE {cntFaces}: CONTOUR {cntCtrs} =====\n')
-        cntFaces, cntCtrs, cntNodes = self._dumpLinearRing(
-            out, geom.exterior, cntFaces, cntCtrs, cntNodes, lbl=str(cntFaces))
-
-        if GeomLib.isHoled(geom):
-            nHoles = len(geom.interiors)
-            out.write(f'\n# -- Subtract {nHoles} hole(s) --\n')
-            for numHole, hole in enumerate(geom.interiors, start=1):
-                lbl = f'{cntFaces}_H{numHole}'
-                cntFaces, cntCtrs, cntNodes = self._dumpLinearRing(
-                    out, hole, cntFaces, cntCtrs, cntNodes, lbl)
-                out.write(f'face{cntFaces} = geompy.MakeCut(face{cntFaces}, face{lbl})\n\n')
-
-        if self.withFaceIds:
-            out.write(f'''
-id_face{cntFaces} = geompy.addToStudy(face{cntFaces}, 'Face_{cntFaces}')
-gg.createAndDisplayGO(id_face{cntFaces})
-gg.setDisplayMode(id_face{cntFaces}, 1)
-''')
-        if (1 == cntFaces):
-            out.write(f'allBuildFaces = face1\n')
-        else:
-            out.write(f'allBuildFaces = geompy.MakeFuse(allBuildFaces, face{cntFaces})\n')
-
-        cntFaces += 1
-        return cntFaces, cntCtrs, cntNodes
-
-    def _dumpLinearRing(self, out, contour, cntFaces, cntCtrs, cntNodes, lbl):
-        iStart, iStop = cntNodes, cntNodes + len(contour.coords) - 1
-        for coord in contour.coords[:-1]:
-            x, y, z = coord if (3 == len(coord)) else (coord[0], coord[1], 0)
-            out.write(f'pt{cntNodes} = geompy.MakeVertex({x}, {y}, {z})\n')
-            cntNodes += 1
-
-        lstOfPts = [f'pt{i}' for i in range(iStart, iStop)] + [f'pt{iStart}']
-        out.write(f'''polyline{cntCtrs} = geompy.MakePolyline([ {", ".join(lstOfPts)} ])
-face{lbl} = geompy.MakeFace(polyline{cntCtrs}, isPlanarWanted)
-''')
-        cntCtrs += 1
-        return cntFaces, cntCtrs, cntNodes
-
     def run(self):
-        with open(f'{self.outputFile}.py', 'w') as out: 
-        # if True:
-            # out = sys.stdout
+        arrays = self._arrays()
+        savez(f'{self.outputFile}.npz', **arrays)
+        with open(f'{self.outputFile}.py', 'w') as out:
             self._dumpHeader(out)
-            self._dumpBody(out)
+            self._dumpBody(out, arrays.keys())
             self._dumpFooter(out)
-        print(f'{self.outputFile}.py has been written!')
+        print(f'{self.outputFile}.py and {self.outputFile}.npz have been written!')
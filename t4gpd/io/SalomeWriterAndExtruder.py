@@ -24,7 +24,7 @@ from datetime import datetime
 from os.path import splitext
 
 from geopandas.geodataframe import GeoDataFrame
-from t4gpd.commons.GeomLib import GeomLib
+from shapely import get_type_id
 from t4gpd.commons.IllegalArgumentTypeException import IllegalArgumentTypeException
 
 from t4gpd.io.SalomeWriter import SalomeWriter
@@ -53,16 +53,19 @@ class SalomeWriterAndExtruder(SalomeWriter):
         self.withFaceIds = withFaceIds
         self.exportBrep = exportBrep
 
-    def _dumpBody(self, out):
-        cntFaces, cntCtrs, cntNodes = 1, 1, 1
-        
-        for _, row in self.inputGdf.iterrows():
-            geom = row.geometry
-            elevation = row[self.elevationFieldname]
-            if ('Polygon' == geom.geom_type):
-                cntFaces, cntCtrs, cntNodes = self._dumpPolygon(out, geom, elevation, cntFaces, cntCtrs, cntNodes)
-            else:
-                print(f'SalomeWriter does not handle {geom.geom_type}!')
+    def _arrays(self):
+        arrays = super()._arrays()
+        isPolygon = (3 == get_type_id(self.inputGdf.geometry.values))
+        arrays['elevations'] = self.inputGdf[self.elevationFieldname].to_numpy(float)[isPolygon]
+        return arrays
+
+    def _dumpLoopBody(self, out):
+        out.write('''
+    x, y, z = xyz[ringOffsets[polygonOffsets[p]]]
+    building = geompy.MakePrism(face, geompy.MakeVertex(x, y, z), geompy.MakeVertex(x, y, z + elevations[p]))
+    id_building = geompy.addToStudy(building, 'Building_%d' % (p + 1))
+    gg.createAndDisplayGO(id_building)
+''')
 
     def _dumpHeader(self, out):
         out.write(f'''"""
@@ -86,44 +89,6 @@ isPlanarWanted = 1
 # ================================================================
 ''')
 
-    def _dumpPolygon(self, out, geom, elevation, cntFaces, cntCtrs, cntNodes):
-        out.write(f'\n# ===== FACE {cntFaces}: CONTOUR {cntCtrs} =====\n')
-        cntNode0 = cntNodes
-        cntFaces, cntCtrs, cntNodes = self._dumpLinearRing(
-            out, geom.exterior, cntFaces, cntCtrs, cntNodes, lbl=str(cntFaces))
-
-        if GeomLib.isHoled(geom):
-            nHoles = len(geom.interiors)
-            out.write(f'\n# -- Subtract {nHoles} hole(s) --\n')
-            for numHole, hole in enumerate(geom.interiors, start=1):
-                lbl = f'{cntFaces}_H{numHole}'
-                cntFaces, cntCtrs, cntNodes = self._dumpLinearRing(
-                    out, hole, cntFaces, cntCtrs, cntNodes, lbl)
-                out.write(f'face{cntFaces} = geompy.MakeCut(face{cntFaces}, face{lbl})\n\n')
-
-        if self.withFaceIds:
-            out.write(f'''
-id_face{cntFaces} = geompy.addToStudy(face{cntFaces}, 'Face_{cntFaces}')
-gg.createAndDisplayGO(id_face{cntFaces})
-gg.setDisplayMode(id_face{cntFaces}, 1)
-''')
-        if (1 == cntFaces):
-            out.write(f'allBuildFaces = face1\n')
-        else:
-            out.write(f'allBuildFaces = geompy.MakeFuse(allBuildFaces, face{cntFaces})\n')
-
-        coords = geom.exterior.coords[0]
-        x, y, z = coords[0], coords[1], (0 if (2 == len(coords)) else coords[2]) + elevation
-        out.write(f'''
-ptZ{cntNode0} = geompy.MakeVertex({x}, {y}, {z})
-building{cntFaces} = geompy.MakePrism(face{cntFaces}, pt{cntNode0}, ptZ{cntNode0})
-id_building{cntFaces} = geompy.addToStudy(building{cntFaces}, 'Building_{cntFaces}')
-gg.createAndDisplayGO(id_building{cntFaces})
-''')
-
-        cntFaces += 1
-        return cntFaces, cntCtrs, cntNodes
-
 '''
 from t4gpd.commons.GeomLib import GeomLib
 from t4gpd.demos.GeoDataFrameDemos import GeoDataFrameDemos
@@ -0,0 +1,241 @@
+'''
+Created on 19 Oct. 2026
+
+@author: tleduc
+
+Copyright 2020-2026 Thomas Leduc
+
+This file is part of t4gpd.
+
+t4gpd is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+t4gpd is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with t4gpd.  If not, see <https://www.gnu.org/licenses/>.
+'''
+from base64 import b64encode
+from os.path import basename, splitext
+
+from numpy import (asarray, bincount, cumsum, float32, float64, int32,
+                   isin, nan_to_num, uint8, uint64, unique)
+from pandas import DataFrame
+from shapely import get_coordinates, get_exterior_ring, get_parts, get_type_id, is_empty
+
+
+class VTULib(object):
+    '''
+    classdocs
+
+    VTK unstructured grids (.vtu) as arrays: an (n, 3) array of points, the
+    connectivity, offsets (end of each cell in the connectivity) and types
+    arrays of the cells, and a dict of cell-data arrays. Data arrays are
+    either written as ASCII, or appended as raw or base64 binary blocks.
+
+    For more information, please see
+    https://www.vtk.org/wp-content/uploads/2015/04/file-formats.pdf
+    '''
+    VTK_VERTEX, VTK_POLY_LINE, VTK_POLYGON = 1, 4, 7
+    VTKTYPES = {0: VTK_VERTEX, 1: VTK_POLY_LINE, 3: VTK_POLYGON}
+    ENCODINGS = ('ascii', 'raw', 'base64')
+
+    @staticmethod
+    def fromGeometries(geoms):
+        '''
+        One cell per Point, LineString and Polygon (exterior ring) part of
+        the geometries. The points are deduplicated through a hash of their
+        coordinates and numbered in order of appearance.
+        :param geoms: array of geometries
+        :return: points, connectivity, offsets, types, rowIndex (the index
+            in geoms of each cell)
+        '''
+        parts, rowIndex = get_parts(asarray(geoms), return_index=True)
+        typeIds = get_type_id(parts)
+        keep = isin(typeIds, list(VTULib.VTKTYPES)) & ~is_empty(parts)
+        parts, rowIndex, typeIds = parts[keep], rowIndex[keep], typeIds[keep]
+
+        isPolygon = (3 == typeIds)
+        parts[isPolygon] = get_exterior_ring(parts[isPolygon])
+        xyz, cellIndex = get_coordinates(parts, include_z=True, return_index=True)
+        # 2D coordinates get z = 0, and 0.0 is added to identify -0.0 and 0.0
+        xyz = nan_to_num(xyz, nan=0.0) + 0.0
+
+        connectivity = DataFrame(xyz).groupby(
+            [0, 1, 2], sort=False).ngroup().to_numpy().astype(int32)
+        _, firsts = unique(connectivity, return_index=True)
+        offsets = cumsum(bincount(cellIndex, minlength=len(parts))).astype(int32)
+        types = asarray([VTULib.VTKTYPES.get(t, 0) for t in range(4)], dtype=uint8)[typeIds]
+        return xyz[firsts], connectivity, offsets, types, rowIndex
+
+    @staticmethod
+    def cellData(gdf, rowIndex=None):
+        '''
+        :param gdf: DataFrame
+        :param rowIndex: the row of each cell (one cell per row by default)
+        :return: dict of the integer and float fields of gdf, per cell
+        '''
+        result = dict()
+        for fieldname in gdf.columns:
+            # String fields seem to make ParaView crash
+            if gdf[fieldname].dtype.kind in 'iuf':
+                values = gdf[fieldname].to_numpy()
+                result[fieldname] = values if rowIndex is None else values[rowIndex]
+        return result
+
+    @staticmethod
+    def __vtkType(values):
+        if uint8 == values.dtype:
+            return 'UInt8', uint8
+        if values.dtype.kind in 'iu':
+            return 'Int32', int32
+        if values.dtype == float64 and 2 == values.ndim:
+            return 'Float64', float64
+        return 'Float32', float32
+
+    @staticmethod
+    def __ascii(values):
+        if 'f' == values.dtype.kind and 2 == values.ndim:
+            return ('%f %f %f\n' * len(values)) % tuple(values.ravel().tolist())
+        return ' '.join(map(str, values.tolist())) + '\n'
+
+    @staticmethod
+    def __block(values, encoding):
+        data = values.tobytes()
+        block = asarray([len(data)], dtype=uint64).tobytes() + data
+        return block if ('raw' == encoding) else b64encode(block)
+
+    @staticmethod
+    def __dataArrays(arrays, encoding, offset=0):
+        # XML elements (and binary blocks) of [(name, values), ...]
+        elements, blocks = dict(), []
+        for name, values in arrays:
+            values = asarray(values)
+            vtkType, dtype = VTULib.__vtkType(values)
+            attrs = "type='%s'" % vtkType
+            if name.startswith('#'):
+                # Points: no name, 3 components
+                attrs += " NumberOfComponents='3'"
+            else:
+                attrs += " Name='%s'" % name
+
+            if 'ascii' == encoding:
+                elements[name] = "<DataArray %s format='ascii'>\n%s</DataArray>\n" % (
+                    attrs, VTULib.__ascii(values))
+            else:
+                block = VTULib.__block(values.astype(dtype, copy=False), encoding)
+                elements[name] = "<DataArray %s format='appended' offset='%d'/>\n" % (
+                    attrs, offset)
+                blocks.append(block)
+                offset += len(block)
+        return elements, blocks, offset
+
+    @staticmethod
+    def __piece(geomElements, fieldElements, nPoints, nCells):
+        xml = ["\t\t<Piece NumberOfPoints='%d' NumberOfCells='%d'>\n" % (nPoints, nCells)]
+        xml.append("\t\t\t<CellData Scalars='scalars'>\n")
+        xml.extend(['\t\t\t\t' + e for e in fieldElements.values()])
+        xml.append("\t\t\t</CellData>\n")
+        xml.append("\t\t\t<Points>\n\t\t\t\t%s\t\t\t</Points>\n" % geomElements['#points'])
+        xml.append("\t\t\t<Cells>\n")
+        xml.extend(['\t\t\t\t' + geomElements[k] for k in ('connectivity', 'offsets', 'types')])
+        xml.append("\t\t\t</Cells>\n")
+        xml.append("\t\t</Piece>\n")
+        return ''.join(xml)
+
+    @staticmethod
+    def __geometry(points, connectivity, offsets, types, encoding):
+        return VTULib.__dataArrays([
+            ('#points', asarray(points, dtype=float64)),
+            ('connectivity', connectivity), ('offsets', offsets), ('types', types)],
+            encoding)
+
+    @staticmethod
+    def __write(outputFile, geometry, cellData, nPoints, nCells, encoding):
+        geomElements, geomBlocks, offset = geometry
+        fieldElements, fieldBlocks, _ = VTULib.__dataArrays(
+            cellData.items(), encoding, offset)
+
+        with open(outputFile, 'wb') as f:
+            f.write(b"<VTKFile type='UnstructuredGrid' version='1.0' "
+                    b"byte_order='LittleEndian' header_type='UInt64'>\n")
+            f.write(b"\t<UnstructuredGrid>\n")
+            f.write(VTULib.__piece(geomElements, fieldElements, nPoints, nCells).encode())
+            f.write(b"\t</UnstructuredGrid>\n")
+            if 'ascii' != encoding:
+                f.write(b"\t<AppendedData encoding='%s'>\n_" % encoding.encode())
+                f.writelines(geomBlocks + fieldBlocks)
+                f.write(b"\n\t</AppendedData>\n")
+            f.write(b"</VTKFile>\n")
+
+    @staticmethod
+    def write(outputFile, points, connectivity, offsets, types, cellData=None,
+              encoding='raw'):
+        '''
+        :param points: (n, 3) array
+        :param connectivity: point indices of the cells
+        :param offsets: end of each cell in the connectivity array
+        :param types: VTK cell types
+        :param cellData: dict of arrays (one value per cell)
+        :param encoding: 'ascii', 'raw' or 'base64'
+        '''
+        if encoding not in VTULib.ENCODINGS:
+            raise Exception(f'{encoding} must be one of {VTULib.ENCODINGS}!')
+        geometry = VTULib.__geometry(points, connectivity, offsets, types, encoding)
+        VTULib.__write(outputFile, geometry, dict() if cellData is None else cellData,
+                       len(points), len(types), encoding)
+
+    @staticmethod
+    def writePVD(outputFile, filenames, timesteps):
+        '''
+        :param outputFile: .pvd filename
+        :param filenames: the .vtu files of the collection, relative to outputFile
+        :param timesteps: their time steps
+        '''
+        with open(outputFile, 'w') as f:
+            f.write("<?xml version='1.0'?>\n")
+            f.write("<VTKFile type='Collection' version='0.1' byte_order='LittleEndian'>\n")
+            f.write("\t<Collection>\n")
+            f.writelines([
+                "\t\t<DataSet timestep='%s' group='' part='0' file='%s'/>\n" % (t, fn)
+                for t, fn in zip(timesteps, filenames)])
+            f.write("\t</Collection>\n")
+            f.write("</VTKFile>\n")
+
+    @staticmethod
+    def writeSeries(outputFile, points, connectivity, offsets, types, frames,
+                    timesteps=None, encoding='raw'):
+        '''
+        Time series as a PVD collection of .vtu files sharing the same mesh,
+        whose arrays are only encoded once.
+        :param outputFile: .pvd filename, the i-th .vtu file is named after it
+            (e.g. "foo_0001.vtu" for "foo.pvd")
+        :param frames: iterable of cellData dicts, one per time step (when
+            timesteps are given, frames may be a generator, so that only one
+            time step at a time is held in memory)
+        :param timesteps: time step values (0, 1, 2, etc. by default)
+        :return: the list of the .vtu filenames
+        '''
+        if encoding not in VTULib.ENCODINGS:
+            raise Exception(f'{encoding} must be one of {VTULib.ENCODINGS}!')
+        if timesteps is None:
+            frames = list(frames)
+            timesteps = range(len(frames))
+
+        geometry = VTULib.__geometry(points, connectivity, offsets, types, encoding)
+        prefix, ndigits = splitext(outputFile)[0], len(str(max(len(timesteps) - 1, 0)))
+        filenames = []
+        for i, cellData in enumerate(frames):
+            filename = f'{prefix}_{i:0{ndigits}d}.vtu'
+            VTULib.__write(filename, geometry, cellData, len(points), len(types), encoding)
+            filenames.append(filename)
+        if len(timesteps) != len(filenames):
+            raise Exception('There must be as many time steps as frames!')
+
+        VTULib.writePVD(outputFile, [basename(fn) for fn in filenames], timesteps)
+        return filenames
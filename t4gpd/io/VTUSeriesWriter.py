@@ -0,0 +1,82 @@
+'''
+Created on 19 Oct. 2026
+
+@author: tleduc
+
+Copyright 2020-2026 Thomas Leduc
+
+This file is part of t4gpd.
+
+t4gpd is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+t4gpd is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with t4gpd.  If not, see <https://www.gnu.org/licenses/>.
+'''
+from geopandas.geodataframe import GeoDataFrame
+from numpy import arange, asarray
+from t4gpd.commons.GeoProcess import GeoProcess
+from t4gpd.commons.IllegalArgumentTypeException import IllegalArgumentTypeException
+from t4gpd.io.VTULib import VTULib
+
+
+class VTUSeriesWriter(GeoProcess):
+    '''
+    classdocs
+
+    Write a time series of cell-data fields (e.g. the annual results of a
+    simulation) as a ParaView PVD collection of binary .vtu files. The mesh
+    is built and encoded once, and only one time step at a time is held in
+    memory.
+    '''
+
+    def __init__(self, inputGdf, outputFile, values, fieldname='values',
+                 timesteps=None, encoding='raw'):
+        '''
+        Constructor
+
+        :param inputGdf: GeoDataFrame of the mesh
+        :param outputFile: .pvd filename
+        :param values: either a list of the inputGdf field names (one per time
+            step), or a (len(inputGdf), nTimesteps) array, such as the matrix
+            of CirValMatrixReader
+        :param fieldname: name of the cell-data field in the .vtu files
+        :param timesteps: time step values (0, 1, 2, etc. by default)
+        :param encoding: 'raw', 'base64' or 'ascii'
+        '''
+        if not isinstance(inputGdf, GeoDataFrame):
+            raise IllegalArgumentTypeException(inputGdf, 'GeoDataFrame')
+        self.inputGdf = inputGdf
+
+        if isinstance(values, (list, tuple)) and all([isinstance(v, str) for v in values]):
+            values = self.inputGdf[list(values)].to_numpy()
+        self.values = asarray(values)
+        if (2 != self.values.ndim) or (len(self.inputGdf) != len(self.values)):
+            raise Exception('values must be a (len(inputGdf), nTimesteps) array!')
+
+        if encoding not in VTULib.ENCODINGS:
+            raise Exception(f'{encoding} must be one of {VTULib.ENCODINGS}!')
+        self.outputFile = outputFile
+        self.fieldname = fieldname
+        self.timesteps = arange(self.values.shape[1]) if timesteps is None else timesteps
+        self.encoding = encoding
+
+    def run(self):
+        points, connectivity, offsets, types, rowIndex = VTULib.fromGeometries(
+            self.inputGdf.geometry.values)
+
+        frames = ({self.fieldname: self.values[rowIndex, j]}
+                  for j in range(self.values.shape[1]))
+        filenames = VTULib.writeSeries(
+            self.outputFile, points, connectivity, offsets, types, frames,
+            self.timesteps, self.encoding)
+
+        print('%s has been written!' % self.outputFile)
+        return filenames
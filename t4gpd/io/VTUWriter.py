@@ -21,10 +21,11 @@ You should have received a copy of the GNU General Public License
 along with t4gpd.  If not, see <https://www.gnu.org/licenses/>.
 '''
 from geopandas.geodataframe import GeoDataFrame
-from shapely.geometry import Point, Polygon
+from numpy import where
+from shapely import area, convex_hull, get_num_interior_rings, get_parts, get_type_id
 from t4gpd.commons.GeoProcess import GeoProcess
-from t4gpd.commons.GeomLib import GeomLib
 from t4gpd.commons.IllegalArgumentTypeException import IllegalArgumentTypeException
+from t4gpd.io.VTULib import VTULib
 
 
 class VTUWriter(GeoProcess):
@@ -36,127 +37,40 @@ class VTUWriter(GeoProcess):
     '''
     VTKTYPE = 7  # VTK_POLYGON=7, VTK_POLY_LINE=4, VTK_POLY_VERTEX=2
 
-    def __init__(self, inputGdf, outputFile):
+    def __init__(self, inputGdf, outputFile, encoding='ascii'):
         '''
         Constructor
+
+        :param encoding: 'ascii', or 'raw' or 'base64' for (much smaller and
+            faster) appended binary data
         '''
         if not isinstance(inputGdf, GeoDataFrame):
             raise IllegalArgumentTypeException(inputGdf, 'GeoDataFrame')
         self.inputGdf = inputGdf
 
-        self.cellData = dict()
-        for fname in self.inputGdf.columns:
-            ftype = str(self.inputGdf.dtypes[fname])
-            if 'int64' == ftype:
-                self.cellData[fname] = { 'type':'Int32', 'values':[] }
-            elif 'float64' == ftype:
-                self.cellData[fname] = { 'type':'Float32', 'values':[] }
-            # LE CHARGEMENT DE CHAMPS DE TYPES STRING SEMBLE PLANTER PARAVIEW
-            # elif (object == ftype):
-                # self.cellData[fname] = { 'type':'String', 'values':[] }
+        if encoding not in VTULib.ENCODINGS:
+            raise Exception(f'{encoding} must be one of {VTULib.ENCODINGS}!')
+        self.encoding = encoding
 
         self.outputFile = outputFile
 
-    def __addAndGetANode(self, x, y, z=0.0):
-        hashCoord = GeomLib.hashCoords(x, y, z)
-        if hashCoord in self.ciVertices:
-            nodeIndex = self.ciVertices[hashCoord]
-        else:
-            nodeIndex = len(self.ciVertices)
-            self.ciVertices[hashCoord] = nodeIndex
-            self.icVertices[nodeIndex] = [x, y, z]
-        return nodeIndex           
-
-    def __addContour(self, geom):
-        contour = []
-        if isinstance(geom, Polygon):
-            if (GeomLib.isHoled(geom)):
-                print("*** Holed polygon:: %s" % geom.wkt)
-            elif not GeomLib.isConvex(geom):
-                print("*** Concave polygon:: %s" % geom.wkt)
-
-            for xyz in geom.exterior.coords:
-                p = Point(xyz)
-                if p.has_z:
-                    nodeIndex = self.__addAndGetANode(p.x, p.y, p.z)
-                else:
-                    nodeIndex = self.__addAndGetANode(p.x, p.y)
-                contour.append(nodeIndex)
-
-        return contour
-        # Remove final point
-        # return contour[:-1]
+    @staticmethod
+    def __warnings(geoms):
+        parts = get_parts(geoms)
+        parts = parts[3 == get_type_id(parts)]
+        holed = 0 < get_num_interior_rings(parts)
+        concave = ~holed & (area(parts) < area(convex_hull(parts)) * (1 - 1e-9))
+        for i in where(holed | concave)[0]:
+            print("*** %s polygon:: %s" % (
+                'Holed' if holed[i] else 'Concave', parts[i].wkt))
 
     def run(self):
-        self.ciVertices = dict()
-        self.icVertices = dict()
-        contours, offsets = [], []
-
-        for _, row in self.inputGdf.iterrows():
-            for fieldname in self.cellData:
-                self.cellData[fieldname]['values'].append(row[fieldname])
-
-            geom = row.geometry
-            if GeomLib.isMultipart(geom):
-                for g in geom.geoms:
-                    ctr = self.__addContour(g)
-                    contours.append(ctr)
-
-                    if (0 == len(offsets)):
-                        offsets.append(len(ctr))
-                    else:
-                        offsets.append(offsets[-1] + len(ctr))
-            else:
-                ctr = self.__addContour(geom)
-                contours.append(ctr)
-
-                if (0 == len(offsets)):
-                    offsets.append(len(ctr))
-                else:
-                    offsets.append(offsets[-1] + len(ctr))
-
-        with open(self.outputFile, 'w') as f: 
-            f.write("<VTKFile type='UnstructuredGrid' version='0.1'>\n")
-            f.write("\t<UnstructuredGrid>\n")
-            f.write("\t\t<Piece NumberOfPoints='%d' NumberOfCells='%d'>\n" % (len(self.icVertices), len(contours)))
-
-            # ===== CELLDATA =====
-            f.write("\t\t\t<CellData Scalars='scalars'>\n")
-            f.writelines([
-                "\t\t\t\t<DataArray Name='%s' type='%s' format='ascii'>\n%s\t\t\t\t</DataArray>\n" % 
-                    (k, v['type'], ' '.join(str(i) for i in v['values']))
-                for k, v in list(self.cellData.items())
-            ])
-            '''
-            f.writelines(
-                map(lambda(k, v): 
-                    "\t\t\t\t<DataArray Name='%s' type='%s' format='ascii'>\n%s\t\t\t\t</DataArray>\n" % 
-                    (k, v['type'], ' '.join(str(i) for i in v['values'])), self.cellData.iteritems())
-                )
-            '''
-            f.write("\t\t\t</CellData>\n")
-
-            f.write("\t\t\t<Points>\n")
-            f.write("\t\t\t\t<DataArray type='Float32' NumberOfComponents='3' format='ascii'>\n")
-            f.writelines([
-                '%f %f %f\n' % (v[0], v[1], v[2]) for k, v in sorted(self.icVertices.items())
-            ])
-            # f.writelines(map(lambda(k, v): '%f %f %f\n' % (v[0], v[1], v[2]), sorted(self.icVertices.iteritems())))  # COORDS
-            f.write("\t\t\t\t</DataArray>\n")
-            f.write("\t\t\t</Points>\n")
-            f.write("\t\t\t<Cells>\n")
-            f.write("\t\t\t\t<DataArray type='Int32' Name='connectivity' format='ascii'>\n")
-            f.writelines([' '.join(str(i) for i in ctr) + ' ' for ctr in contours] + ['\n'])  # CONNECTIVITY
-            f.write("\t\t\t\t</DataArray>\n")
-            f.write("\t\t\t\t<DataArray type='Int32' Name='offsets' format='ascii'>\n")
-            f.writelines(['%d ' % i for i in offsets] + ['\n'])  # OFFSETS
-            f.write("\t\t\t\t</DataArray>\n")
-            f.write("\t\t\t\t<DataArray type='Int32' Name='types' format='ascii'>\n")
-            f.writelines(['%d ' % (VTUWriter.VTKTYPE) for _ in range(len(contours))] + ['\n'])  # TYPES
-            f.write("\t\t\t\t</DataArray>\n")
-            f.write("\t\t\t</Cells>\n")
-            f.write("\t\t</Piece>\n")
-            f.write("\t</UnstructuredGrid>\n")
-            f.write("</VTKFile>\n")
-
-            print('%s has been written!' % self.outputFile)
+        geoms = self.inputGdf.geometry.values
+        VTUWriter.__warnings(geoms)
+
+        points, connectivity, offsets, types, rowIndex = VTULib.fromGeometries(geoms)
+        cellData = VTULib.cellData(self.inputGdf, rowIndex)
+        VTULib.write(self.outputFile, points, connectivity, offsets, types,
+                     cellData, self.encoding)
+
+        print('%s has been written!' % self.outputFile)
@@ -24,10 +24,12 @@ from shapely.geometry import LineString
 from shapely.ops import substring
 
 from geopandas.geodataframe import GeoDataFrame
-from numpy import abs, round
+from numpy import abs, maximum, minimum, round
+from shapely.geometry import box, Point
 from t4gpd.commons.GeoProcess import GeoProcess
 from t4gpd.commons.GeomLib import GeomLib
 from t4gpd.commons.IllegalArgumentTypeException import IllegalArgumentTypeException
+from t4gpd.commons.raster.DistanceTransformLib import DistanceTransformLib
 
 
 class STGradientOfDistancesToBuildings(GeoProcess):
@@ -35,9 +37,12 @@ class STGradientOfDistancesToBuildings(GeoProcess):
     classdocs
     '''
 
-    def __init__(self, lines, buildings, sampleDist, pathidFieldname=None, threshold=0.1, order=1):
+    def __init__(self, lines, buildings, sampleDist, pathidFieldname=None, threshold=0.1, order=1, dx=None):
         '''
         Constructor
+
+        dx: if not None, distances to buildings are sampled in a Euclidean
+        distance transform of the buildings rasterized at this resolution
         '''
         if not isinstance(lines, GeoDataFrame):
             raise IllegalArgumentTypeException(lines, 'GeoDataFrame')
@@ -58,6 +63,7 @@ class STGradientOfDistancesToBuildings(GeoProcess):
         if not order in (1, 2, 3):
             raise IllegalArgumentTypeException(order, '(1, 2, 3)')
         self.fieldToTest = 'r_deriv%d' % (order)
+        self.dx = dx
 
     def __getType(self, _nodeRow):
         _value = _nodeRow[self.fieldToTest]
@@ -65,7 +71,26 @@ class STGradientOfDistancesToBuildings(GeoProcess):
             return 'canyon'
         return 'square'
 
+    def __distanceField(self):
+        minx, miny = minimum(self.lines.total_bounds[:2], self.buildings.total_bounds[:2])
+        maxx, maxy = maximum(self.lines.total_bounds[2:], self.buildings.total_bounds[2:])
+        roi = GeoDataFrame(geometry=[box(minx, miny, maxx, maxy)], crs=self.buildings.crs)
+        return DistanceTransformLib.distance_field(
+            self.buildings, self.dx, roi=roi, withNearest=True, contour=False)
+
+    def __nearestFeatures(self, _sampleGeoms, field):
+        if field is None:
+            return [GeomLib.getNearestFeature(self.buildings, _sampleGeom)[0:2]
+                    for _sampleGeom in _sampleGeoms]
+        raster_data, raster_profile = field
+        _r = DistanceTransformLib.sample(
+            raster_data[0], raster_profile, [g.coords[0] for g in _sampleGeoms])[0]
+        _xy = DistanceTransformLib.sample(
+            raster_data[3:5], raster_profile, [g.coords[0] for g in _sampleGeoms], order=0)
+        return [(r, Point(x, y)) for r, x, y in zip(_r, _xy[0], _xy[1])]
+
     def run(self):
+        field = None if self.dx is None else self.__distanceField()
 
         nodesRows, segmentsRows, linesRows = [], [], []
         for _id, row in self.lines.iterrows():
@@ -77,11 +102,13 @@ class STGradientOfDistancesToBuildings(GeoProcess):
                 _nSegm = int(round(_lineLen / self.sampleDist))
                 _sampleDist = _lineLen / _nSegm
 
+                _sampleGeoms = [_line.interpolate(i * _sampleDist) for i in range(0, _nSegm + 1)]
+                _nearestFeatures = self.__nearestFeatures(_sampleGeoms, field)
+
                 _nodesRows, _segmentsRows = [], []
                 for i in range(0, _nSegm + 1):
-                    _sampleGeom = _line.interpolate(i * _sampleDist)
-                    _r, _nearestPoint, _ = GeomLib.getNearestFeature(
-                        self.buildings, _sampleGeom)
+                    _sampleGeom = _sampleGeoms[i]
+                    _r, _nearestPoint = _nearestFeatures[i]
                     _nodesRows.append({
                         'pathid': _pathid,
                         'nodeid': i,
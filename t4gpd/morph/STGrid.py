@@ -32,7 +32,7 @@ class STGrid(GeoProcess):
     '''
 
     def __init__(self, gdf, dx, dy=None, indoor=None, intoPoint=True,
-                 encode=True, withDist=False, roi=None):
+                 encode=True, withDist=False, roi=None, distDx=None):
         '''
         Constructor
         '''
@@ -51,6 +51,7 @@ class STGrid(GeoProcess):
         self.encode = encode
         self.withDist = withDist
         self.roi = roi
+        self.distDx = distDx
 
     def run(self):
         if self.roi is None:
@@ -74,7 +75,8 @@ class STGrid(GeoProcess):
             if (0 == len(self.gdf)):
                 grid["dist_to_ctr"] = float("inf")
             else:
-                grid = GridLib.getDistanceToNearestContour(self.gdf, grid)
+                grid = GridLib.getDistanceToNearestContour(
+                    self.gdf, grid, dx=self.distDx)
 
         return grid
 
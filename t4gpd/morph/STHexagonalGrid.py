@@ -31,7 +31,16 @@ class STHexagonalGrid(GeoProcess):
     classdocs
     """
 
-    __slots__ = ("gdf", "dx", "dy", "indoor", "intoPoint", "encode", "withDist")
+    __slots__ = (
+        "gdf",
+        "dx",
+        "dy",
+        "indoor",
+        "intoPoint",
+        "encode",
+        "withDist",
+        "withAxialCoords",
+    )
 
     def __init__(
         self,
@@ -42,6 +51,7 @@ class STHexagonalGrid(GeoProcess):
         intoPoint=True,
         encode=True,
         withDist=False,
+        withAxialCoords=False,
     ):
         """
         Constructor
@@ -61,6 +71,7 @@ class STHexagonalGrid(GeoProcess):
         self.intoPoint = intoPoint
         self.encode = encode
         self.withDist = withDist
+        self.withAxialCoords = withAxialCoords
 
     def run(self):
         gridLib = HexagonalTilingLib(self.gdf, self.dx, self.dy, self.encode)
@@ -74,6 +85,9 @@ class STHexagonalGrid(GeoProcess):
         else:
             grid = gridLib.outdoorGrid()
 
+        if self.withAxialCoords:
+            grid["q"], grid["r"] = gridLib.axialCoordinates(grid.gid)
+
         if self.intoPoint:
             grid.geometry = grid.centroid
 
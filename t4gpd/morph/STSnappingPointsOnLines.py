@@ -23,8 +23,8 @@ along with t4gpd.  If not, see <https://www.gnu.org/licenses/>.
 from geopandas.geodataframe import GeoDataFrame
 
 from t4gpd.commons.GeoProcess import GeoProcess
-from t4gpd.commons.GeomLib import GeomLib
 from t4gpd.commons.IllegalArgumentTypeException import IllegalArgumentTypeException
+from t4gpd.commons.SnappingLib import SnappingLib
 
 
 class STSnappingPointsOnLines(GeoProcess):
@@ -58,25 +58,14 @@ class STSnappingPointsOnLines(GeoProcess):
             prevStepCount, prevCurvAbsc = stepCount, checksum[stepCount]
 
     def run(self):
-        checksum, rows = dict(), []
-        for _, rowPoint in self.pointsGdf.iterrows():
-            geomPoint = rowPoint.geometry
-            buffDist = 40.0
-            minDist, nearestPoint, nearestRow = GeomLib.getNearestFeature(
-                self.linesGdf, geomPoint)
-
-            nearestLine = nearestRow.geometry
-            curvilinearAbscissa = nearestLine.project(nearestPoint)
-            if self.stepCountFieldname is not None:
-                checksum[rowPoint[self.stepCountFieldname]] = curvilinearAbscissa
-
-            rows.append(self.updateOrAppend(rowPoint, {
-                # 'geometry': LineString((geomPoint, nearestPoint)),
-                'geometry': nearestPoint,
-                'dist_to_l': minDist,
-                'curv_absc': curvilinearAbscissa 
-                }))
+        _, curvAbscs, nearestPoints, minDists = SnappingLib.snap(
+            self.pointsGdf.geometry.values, self.linesGdf.geometry.values)
 
         if self.stepCountFieldname is not None:
-            self.__check(checksum)
-        return GeoDataFrame(rows, crs=self.pointsGdf.crs)
+            self.__check(dict(zip(self.pointsGdf[self.stepCountFieldname], curvAbscs)))
+
+        result = self.pointsGdf.copy()
+        result['geometry'] = nearestPoints
+        result['dist_to_l'] = minDists
+        result['curv_absc'] = curvAbscs
+        return GeoDataFrame(result, crs=self.pointsGdf.crs)
@@ -21,10 +21,13 @@ You should have received a copy of the GNU General Public License
 along with t4gpd.  If not, see <https://www.gnu.org/licenses/>.
 '''
 from geopandas.geodataframe import GeoDataFrame
+from numpy import arange, concatenate, cumsum, full, searchsorted, sort
 from pandas import DataFrame
+from shapely import distance
 from shapely.geometry import Point
 from t4gpd.commons.GeoProcess import GeoProcess
 from t4gpd.commons.IllegalArgumentTypeException import IllegalArgumentTypeException
+from t4gpd.commons.SnappingLib import SnappingLib
 
 
 class STSnappingPointsOnLines2(GeoProcess):
@@ -68,12 +71,12 @@ class STSnappingPointsOnLines2(GeoProcess):
         pathGeom = self.linesGdf.geometry.squeeze()
 
         # 1st STEP: PROJECT WAYPOINTS ONTO THE LINES
-        projWayPoints = dict()
-        for _, wayPoint in self.wayPointsGdf.iterrows():
-            wayPointId = wayPoint[self.wayPointsIdFieldname]
-            wayPointCurvDist = pathGeom.project(wayPoint.geometry)
-            wayPointGeom = pathGeom.interpolate(wayPointCurvDist)
+        _, wayPointsCurvDist, wayPointsGeom, _ = SnappingLib.snap(
+            self.wayPointsGdf.geometry.values, [pathGeom])
 
+        projWayPoints = dict()
+        for wayPointId, wayPointCurvDist, wayPointGeom in zip(
+                self.wayPointsGdf[self.wayPointsIdFieldname], wayPointsCurvDist, wayPointsGeom):
             projWayPoints[wayPointId] = {
                 'gid': wayPointId,
                 'curv_absc': wayPointCurvDist,
@@ -118,11 +121,11 @@ class STSnappingPointsOnLines2(GeoProcess):
             }
 
         # 3rd STEP: COUNT MEASURE POINTS PER PAIR OF WAYPOINTS
-        for _, point in self.pointsGdf.iterrows():
-            stepCount = point[self.stepCountFieldname]
-            for tagName in projWayPoints.keys():
-                if (projWayPoints[tagName]['startStepCount'] <= stepCount <= projWayPoints[tagName]['stopStepCount']):
-                    projWayPoints[tagName]['nPoints'] += 1
+        stepCounts = sort(self.pointsGdf[self.stepCountFieldname].to_numpy())
+        for tagName in projWayPoints.keys():
+            projWayPoints[tagName]['nPoints'] = int(
+                searchsorted(stepCounts, projWayPoints[tagName]['stopStepCount'], side='right') - 
+                searchsorted(stepCounts, projWayPoints[tagName]['startStepCount'], side='left'))
 
         for tagName in list(projWayPoints.keys()):
             if (0 == projWayPoints[tagName]['nPoints']):
@@ -131,28 +134,27 @@ class STSnappingPointsOnLines2(GeoProcess):
                 projWayPoints[tagName]['deltaL'] = projWayPoints[tagName]['deltaL'] / projWayPoints[tagName]['nPoints']
 
         # 4th STEP: POPULATE THE OUTPUT ROWS RESULT
-        inputMeasurePoints = dict()
-        for _, point in self.pointsGdf.iterrows():
-            stepCount = point[self.stepCountFieldname]
-            inputMeasurePoints[stepCount] = point
+        inputMeasurePoints = self.pointsGdf.drop_duplicates(
+            self.stepCountFieldname, keep='last').set_index(self.stepCountFieldname, drop=False)
 
-        initialStartStepCount = min(inputMeasurePoints.keys())
-        currCurvAbsc, startStepCount, rows = 0, initialStartStepCount, []
+        initialStartStepCount = inputMeasurePoints.index.min()
+        startStepCount, steps, incCurvAbscs = initialStartStepCount, [], []
         for tagName in sorted(projWayPoints.keys()):
-            incCurvAbsc = projWayPoints[tagName]['deltaL']
             stopStepCount = projWayPoints[tagName]['stopStepCount']
+            steps.append(arange(startStepCount, stopStepCount + 1))
+            incCurvAbscs.append(full(len(steps[-1]), projWayPoints[tagName]['deltaL']))
+            startStepCount = stopStepCount + 1
 
-            for stepCount in range(startStepCount, stopStepCount + 1):
-                if initialStartStepCount < stepCount:
-                    currCurvAbsc += incCurvAbsc
-                row = inputMeasurePoints[stepCount].to_dict()
-                projPoint = pathGeom.interpolate(currCurvAbsc)
-                dist_to_l = row['geometry'].distance(projPoint) if ('geometry' in row) else None    
-                row['geometry'] = projPoint
-                row['dist_to_l'] = dist_to_l
-                row['curv_absc'] = currCurvAbsc
-                rows.append(row)
+        steps, incCurvAbscs = concatenate(steps), concatenate(incCurvAbscs)
+        incCurvAbscs[steps == initialStartStepCount] = 0.0
+        currCurvAbscs = cumsum(incCurvAbscs)
 
-            startStepCount = stopStepCount + 1
+        result = inputMeasurePoints.loc[steps].reset_index(drop=True)
+        projPoints = SnappingLib.interpolate([pathGeom], full(len(steps), 0), currCurvAbscs)
+        result['dist_to_l'] = distance(result['geometry'].to_numpy(), projPoints) \
+            if ('geometry' in result) else None
+        result['geometry'] = projPoints
+        result['curv_absc'] = currCurvAbscs
+        result = result[[c for c in result if c not in ('dist_to_l', 'curv_absc')] + ['dist_to_l', 'curv_absc']]
 
-        return GeoDataFrame(rows, crs=self.wayPointsGdf.crs)
+        return GeoDataFrame(result, crs=self.wayPointsGdf.crs)
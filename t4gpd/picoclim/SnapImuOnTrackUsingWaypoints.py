@@ -21,10 +21,12 @@ You should have received a copy of the GNU General Public License
 along with t4gpd.  If not, see <https://www.gnu.org/licenses/>.
 '''
 from geopandas import GeoDataFrame
-from numpy import isnan, nan
+from numpy import arange, flatnonzero, full, isnan, nan
+from shapely import distance, to_wkt
 from t4gpd.commons.GeoDataFrameLib import GeoDataFrameLib
 from t4gpd.commons.GeoProcess import GeoProcess
 from t4gpd.commons.IllegalArgumentTypeException import IllegalArgumentTypeException
+from t4gpd.commons.SnappingLib import SnappingLib
 
 
 class SnapImuOnTrackUsingWaypoints(GeoProcess):
@@ -68,71 +70,55 @@ class SnapImuOnTrackUsingWaypoints(GeoProcess):
 
         # ==============================================================
         # 1st STEP: IDENTIFY THE TRACK TO PROJECT ON
-        imu["track"], imu["curv_absc"], imu["n_curv_absc"] = None, None, None
-
-        prev, cnt1, rows, cnts = nan, nan, [], []
-        for cnt2, (_, row) in enumerate(imu.iterrows()):
-            curr = row.TagName
-            if isnan(prev):
-                prev, cnt1 = (nan, nan) if isnan(curr) else (curr, 0)
-                row.track, row.curv_absc = prev, cnt1
-                if not isnan(curr):
-                    cnts.append(cnt2)
-
+        tagNames = imu.TagName.to_numpy(dtype=float)
+        tagPos = flatnonzero(~isnan(tagNames))
+        nRows, nTags = len(imu), len(tagPos)
+
+        track, curv_absc, n_curv_absc = full(nRows, nan), full(nRows, nan), full(nRows, nan)
+        isActive = False
+        for k, i in enumerate(tagPos):
+            curr = tagNames[i]
+            # The measures of the track lie between this tag and the next one
+            j = tagPos[k + 1] if (k + 1 < nTags) else nRows
+            n = (j - i) if (k + 1 < nTags) else nan
+
+            track[i], curv_absc[i] = curr, 0
+            if isActive:
+                n_curv_absc[i] = i - tagPos[k - 1]
+                isActive = curr not in maxTagNames
             else:
-                if isnan(curr):
-                    cnts.append(cnt2)
-                    cnt1 += 1
-                    row.track, row.curv_absc = prev, cnt1
-                else:
-
-                    row.track, row.curv_absc = curr, 0
-                    row.n_curv_absc = cnt1 + 1
-                    for _cnt in cnts:
-                        rows[_cnt].n_curv_absc = cnt1 + 1
-                    cnts = []
-
-                    if curr in maxTagNames:
-                        prev, cnt1 = nan, nan
-                    else:
-                        prev, cnt1 = curr, 0
-
-            rows.append(row)
-        imu = GeoDataFrame(rows, crs=self.crs)
+                n_curv_absc[i] = n
+                isActive = True
+
+            if isActive:
+                track[i + 1:j], curv_absc[i + 1:j], n_curv_absc[i + 1:j] = curr, arange(1, j - i), n
 
         # ==============================================================
         # 2nd STEP: ASSESS THE CURVILINEAR ABSCISSA OF THE PROJECTED POINT
-        wpDict = self.waypoints.set_index("id").to_dict(orient="index")
-
-        imu.curv_absc = imu.apply(lambda row: None
-                                  if isnan(row.track)
-                                  else wpDict[row.track]["curv_absc"] + (row.curv_absc * wpDict[row.track]["delta_curv_absc"]) / row.n_curv_absc,
-                                  axis=1)
-        for tn in maxTagNames:
-            imu.loc[ imu[imu.TagName == tn].index, "curv_absc" ] = 1.0
+        wp = self.waypoints.drop_duplicates("id", keep="last").set_index("id")
+        wp = wp.reindex(track)
+        imu["track"] = track
+        imu["curv_absc"] = wp.curv_absc.to_numpy() + (
+            curv_absc * wp.delta_curv_absc.to_numpy()) / n_curv_absc
+        imu.loc[imu.TagName.isin(maxTagNames), "curv_absc"] = 1.0
 
         # ==============================================================
         # 3rd STEP: ASSESS THE COORDINATES OF THE PROJECTED POINT
-        trDict = {row.id: row.geometry for _, row in self.tracks.iterrows()}
-
-        imu.track = imu.track.apply(lambda v: v if isnan(v) else int(v // 100))
-        imu["snap_geometry"] = imu.apply(lambda row: None
-                                         if isnan(row.track)
-                                         else trDict[row.track].interpolate(row.curv_absc, normalized=True),
-                                         axis=1)
- 
+        trPos = {_id: i for i, _id in enumerate(self.tracks.id)}
+
+        imu.track = imu.track // 100
+        lineIds = imu.track.map(trPos).fillna(-1).to_numpy(dtype=int)
+        imu["snap_geometry"] = SnappingLib.interpolate(
+            self.tracks.geometry.values, lineIds, imu.curv_absc.to_numpy(), normalized=True)
+
         # ==============================================================
         # 4th STEP: ASSESS THE DISTANCE (DRIFT) BETWEEN THE GNSS POINT AND 
         # ITS CORRESPONDING PROJECTED POINT
         imu.rename(columns={"geometry": "gnss_geom", "snap_geometry": "geometry"}, inplace=True)
-        imu.drop(columns=["n_curv_absc"], inplace=True)
-
-        imu["drift"] = imu.apply(lambda row: nan 
-                                 if ((row.gnss_geom is None) or (row.geometry is None))
-                                 else row.gnss_geom.distance(row.geometry),
-                                 axis=1)
-        imu.gnss_geom = imu.gnss_geom.apply(lambda g: g.wkt)
-        imu.set_crs(self.crs, inplace=True)
+
+        imu["drift"] = distance(imu.gnss_geom.values, imu.geometry.values)
+        imu.gnss_geom = to_wkt(imu.gnss_geom.values, rounding_precision=-1)
+        imu = GeoDataFrame(imu, geometry="geometry", crs=self.crs)
 
         imu.drop(index=imu[imu.geometry.isna()].index, inplace=True)
         imu.reset_index(drop=True, inplace=True)
@@ -21,10 +21,12 @@ You should have received a copy of the GNU General Public License
 along with t4gpd.  If not, see <https://www.gnu.org/licenses/>.
 '''
 from geopandas import GeoDataFrame
-from pandas import DataFrame, Interval, IntervalIndex
+from numpy import zeros
+from pandas import DataFrame, IntervalIndex
 from t4gpd.commons.GeoDataFrameLib import GeoDataFrameLib
 from t4gpd.commons.GeoProcess import GeoProcess
 from t4gpd.commons.IllegalArgumentTypeException import IllegalArgumentTypeException
+from t4gpd.commons.SnappingLib import SnappingLib
 
 
 class SnapUclimOnTrackUsingWaypoints(GeoProcess):
@@ -66,32 +68,20 @@ class SnapUclimOnTrackUsingWaypoints(GeoProcess):
         self.crs = tracks.crs
 
     def _buildIntervalIndex(self):
-        intervals, rows = [], []
-        for _, row in self.dfUclim.iterrows():
-            wp1, dts = row.wp1, row.timestamps
-            for idx2 in range(0, len(dts), 2):
-                intervals.append(
-                    Interval(left=dts[idx2], right=dts[idx2 + 1], closed="right"))
-                rows.append(wp1)
-        return DataFrame(data=rows, columns=["wp1"], index=IntervalIndex(intervals))
-
-    def _getWps(self, intervals, dt):
-        idx = intervals.index.get_loc(dt)
-        row = intervals.iloc[idx]
-        return row.wp1
+        # Each row holds a flat list of (start, stop) timestamps
+        dts = self.dfUclim.timestamps.explode().dropna()
+        lefts, rights = dts.iloc[0::2], dts.iloc[1::2]
+        return DataFrame(
+            data=self.dfUclim.loc[lefts.index, "wp1"].to_numpy(), columns=["wp1"],
+            index=IntervalIndex.from_arrays(lefts.to_list(), rights.to_list(), closed="right"))
 
     def run(self):
         intervals = self._buildIntervalIndex()
 
-        def _isInIntervalIndex(intervals, dt): return any(
-            intervals.index.contains(dt))
-
         # SELECTION FROM THE SET OF MEASUREMENTS OF THOSE THAT FALL WITHIN THE INTERVALS
-        measures1 = self.dfMob[self.dfMob.timestamp.apply(
-            lambda dt: _isInIntervalIndex(intervals, dt))]
-        measures1 = measures1[["timestamp"]]
-        measures1["wp1"] = measures1.timestamp.apply(
-            lambda dt: self._getWps(intervals, dt))
+        idx = intervals.index.get_indexer(self.dfMob.timestamp)
+        measures1 = self.dfMob.loc[0 <= idx, ["timestamp"]]
+        measures1["wp1"] = intervals.wp1.to_numpy()[idx[0 <= idx]]
         measures1["inc"] = 1
 
         measures2 = measures1.groupby(by="wp1").\
@@ -104,8 +94,7 @@ class SnapUclimOnTrackUsingWaypoints(GeoProcess):
         wp = self.dfUclim[["warning", "actual_elapsed_time"]].merge(
             self.waypoints[["id", "curv_absc", "sect_len"]],
             how="left", left_index=True, right_index=True)
-        wp["sect_speed"] = wp.apply(
-            lambda row: row.sect_len/row.actual_elapsed_time, axis=1)
+        wp["sect_speed"] = wp.sect_len / wp.actual_elapsed_time
 
         # ATTRIBUTE JOIN BETWEEN SELECTED MEASUREMENTS AND ALL WAYPOINTS
         measures2 = measures2.merge(wp[["curv_absc", "sect_len", "actual_elapsed_time", "sect_speed", "warning"]],
@@ -115,11 +104,10 @@ class SnapUclimOnTrackUsingWaypoints(GeoProcess):
 
         # DISTRIBUTION OF MEASUREMENTS ON THE POLYLINE ACCORDING TO THEIR CURVILINEAR ABSCISSA VALUE
         measures2["track"] = 1
-        measures2["curv_absc"] = measures2.apply(
-            lambda row: row.curv_absc0 + (row.inc * row.sect_len) / row.total,
-            axis=1)
-        measures2["geometry"] = measures2.curv_absc.apply(
-            lambda x: self.track_geom.interpolate(x, normalized=False))
+        measures2["curv_absc"] = measures2.curv_absc0 + \
+            (measures2.inc * measures2.sect_len) / measures2.total
+        measures2["geometry"] = SnappingLib.interpolate(
+            [self.track_geom], zeros(len(measures2), dtype=int), measures2.curv_absc)
 
         # ADD COLUMNS "ptid" AND "timestamp" TO THE MEASUREMENTS DATAFRAME
         measures3 = measures2[["track", "inc", "curv_absc", "sect_len",
@@ -20,12 +20,11 @@ GNU General Public License for more details.
 You should have received a copy of the GNU General Public License
 along with t4gpd.  If not, see <https://www.gnu.org/licenses/>.
 '''
-import os
 import rasterio
 from numpy.random import default_rng
 from os import remove
 from os.path import exists
-from tempfile import TemporaryDirectory
+from rasterio.io import MemoryFile
 from t4gpd.commons.GeoProcess import GeoProcess
 
 
@@ -48,12 +47,12 @@ class AbstractRasterGeoProcess(GeoProcess):
                     dst.write(array, indexes=1)
             result = rasterio.open(ofile)
         else:
-            with TemporaryDirectory() as tmpdir:
-                ofile = f"{tmpdir}/temporary.tif"
-                with rasterio.open(ofile, "w", **metadata) as dst:
-                    if indexes is None:
-                        dst.write(array)
-                    else:
-                        dst.write(array, indexes=indexes)
-                result = rasterio.open(ofile)
+            # In-memory chaining: no temporary GeoTIFF on disk
+            memfile = MemoryFile()
+            with memfile.open(**metadata) as dst:
+                if indexes is None:
+                    dst.write(array)
+                else:
+                    dst.write(array, indexes=indexes)
+            result = memfile.open()
         return result
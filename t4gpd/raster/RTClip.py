@@ -24,9 +24,13 @@ along with t4gpd.  If not, see <https://www.gnu.org/licenses/>.
 import warnings
 import json
 from geopandas import GeoDataFrame
+from numpy import where
+from numpy.random import default_rng
+from rasterio.features import geometry_mask, geometry_window
 from rasterio.io import DatasetReader
-from rasterio.mask import mask
+from rasterio.windows import transform as window_transform
 from t4gpd.commons.IllegalArgumentTypeException import IllegalArgumentTypeException
+from t4gpd.commons.raster.RasterLib import RasterLib
 from t4gpd.commons.WarnUtils import WarnUtils
 from t4gpd.raster.AbstractRasterGeoProcess import AbstractRasterGeoProcess
 
@@ -36,7 +40,7 @@ class RTClip(AbstractRasterGeoProcess):
     classdocs
     """
 
-    def __init__(self, raster, roi, debug=False):
+    def __init__(self, raster, roi, debug=False, blocksize=512):
         """
         Constructor
         """
@@ -50,6 +54,7 @@ class RTClip(AbstractRasterGeoProcess):
             raise IllegalArgumentTypeException(raster, "DatasetReader")
         self.raster = raster
         self.debug = debug
+        self.blocksize = blocksize
 
     @staticmethod
     def __getFeatures(gdf):
@@ -59,20 +64,30 @@ class RTClip(AbstractRasterGeoProcess):
         return [json.loads(gdf.to_json())["features"][0]["geometry"]]
 
     def run(self):
-        out_img, out_transform = mask(
-            self.raster, shapes=self.__getFeatures(self.roi), crop=True
+        shapes = self.__getFeatures(self.roi)
+        window = geometry_window(self.raster, shapes)
+        out_transform = self.raster.window_transform(window)
+        ndv = 0 if self.raster.nodata is None else self.raster.nodata
+
+        def __masking(block, _window):
+            outside = geometry_mask(
+                shapes,
+                out_shape=block.shape[1:],
+                transform=window_transform(_window, out_transform),
+            )
+            return where(outside, ndv, block)
+
+        ofile = (
+            f"__temporary__{default_rng().integers(1e12)}.tif" if self.debug else None
         )
-        out_meta = self.raster.meta.copy()
-        out_meta.update(
-            {
-                "driver": "GTiff",
-                "height": out_img.shape[1],
-                "width": out_img.shape[2],
-                "transform": out_transform,
-                "crs": self.roi.crs,
-            }
+        result = RasterLib.apply_by_block(
+            self.raster,
+            __masking,
+            profile={"crs": self.roi.crs},
+            ofile=ofile,
+            blocksize=self.blocksize,
+            window=window,
         )
-        result = self._write_and_load(out_img, out_meta, self.debug, indexes=None)
         return result
 
     @staticmethod
@@ -21,8 +21,10 @@ You should have received a copy of the GNU General Public License
 along with t4gpd.  If not, see <https://www.gnu.org/licenses/>.
 '''
 import rasterio
-from numpy import nan, seterr
+from numpy import errstate, float64, nan
+from numpy.random import default_rng
 from t4gpd.commons.IllegalArgumentTypeException import IllegalArgumentTypeException
+from t4gpd.commons.raster.RasterLib import RasterLib
 from t4gpd.raster.AbstractRasterGeoProcess import AbstractRasterGeoProcess
 
 
@@ -31,7 +33,7 @@ class RTNdvi(AbstractRasterGeoProcess):
     classdocs
     '''
 
-    def __init__(self, filename, debug=False):
+    def __init__(self, filename, debug=False, blocksize=512):
         '''
         Constructor
         '''
@@ -40,9 +42,10 @@ class RTNdvi(AbstractRasterGeoProcess):
                 filename, "input filename (str)")
         self.filename = filename
         self.debug = debug
+        self.blocksize = blocksize
 
     @staticmethod
-    def __ndvi(filename):
+    def __ndvi(block, window=None):
         '''
         NDVI is a spectral approach used to assess vegetation.
 
@@ -55,36 +58,35 @@ class RTNdvi(AbstractRasterGeoProcess):
             Band 2 - Green
             Band 3 - Red
             Band 4 - Near Infrared
+
+        block: (2, h, w) array of the red and near infrared bands
         '''
-        with rasterio.open(filename, mode="r", nodata=0) as raster:
-            red = raster.read(3).astype(float)
-            nir = raster.read(4).astype(float)
+        red = block[0].astype(float)
+        nir = block[1].astype(float)
 
-            # Allow NumPy division by zero
-            seterr(divide="ignore", invalid="ignore")
+        # Allow NumPy division by zero
+        with errstate(divide="ignore", invalid="ignore"):
             ndvi = (nir - red) / (nir + red)
 
-            # Set pixels whose values are outside the NDVI range (-1, 1) to NaN
-            # Likely due to errors in the Landsat imagery
-            ndvi[ndvi > 1] = nan
-            ndvi[ndvi < -1] = nan
-
-            out_meta = raster.meta.copy()
-            out_meta.update({
-                "driver": "GTiff",
-                "height": raster.height,
-                "width": raster.width,
-                "transform": raster.transform,
-                "crs": raster.crs,
-                "count": 1,
-                "dtype": ndvi.dtype,
-            })
-
-        return out_meta, ndvi
+        # Set pixels whose values are outside the NDVI range (-1, 1) to NaN
+        # Likely due to errors in the Landsat imagery
+        ndvi[ndvi > 1] = nan
+        ndvi[ndvi < -1] = nan
+        return ndvi
 
     def run(self):
-        out_meta, ndvi = RTNdvi.__ndvi(self.filename)
-        result = self._write_and_load(ndvi, out_meta, self.debug)
+        ofile = (
+            f"__temporary__{default_rng().integers(1e12)}.tif" if self.debug else None
+        )
+        with rasterio.open(self.filename, mode="r", nodata=0) as raster:
+            result = RasterLib.apply_by_block(
+                raster,
+                RTNdvi.__ndvi,
+                profile={"count": 1, "dtype": float64},
+                ofile=ofile,
+                indexes=[3, 4],
+                blocksize=self.blocksize,
+            )
         return result
 
 
@@ -29,6 +29,7 @@ from rasterio import features
 from rasterio.io import DatasetReader
 from t4gpd.commons.IllegalArgumentTypeException import IllegalArgumentTypeException
 from t4gpd.commons.WarnUtils import WarnUtils
+from t4gpd.commons.raster.RasterLib import RasterLib
 from t4gpd.raster.AbstractRasterGeoProcess import AbstractRasterGeoProcess
 
 
@@ -37,7 +38,7 @@ class STRasterize(AbstractRasterGeoProcess):
     classdocs
     """
 
-    def __init__(self, gdf, raster, attr=None, debug=False):
+    def __init__(self, gdf, raster, attr=None, debug=False, tilesize=None, ncpus=None):
         """
         Constructor
         """
@@ -57,9 +58,26 @@ class STRasterize(AbstractRasterGeoProcess):
             raise IllegalArgumentTypeException(raster, "DatasetReader")
         self.raster = raster
         self.debug = debug
+        self.tilesize = tilesize
+        self.ncpus = ncpus
 
     def run(self):
-        if self.attr is None:
+        if self.tilesize is not None:
+            rasterized = RasterLib.tiled_rasterize(
+                self.gdf.geometry.values,
+                None if self.attr is None else self.gdf[self.attr].values,
+                {
+                    "height": self.raster.height,
+                    "width": self.raster.width,
+                    "transform": self.raster.transform,
+                    "dtype": float32,
+                    "nodata": 0,
+                },
+                tilesize=self.tilesize,
+                ncpus=self.ncpus,
+            )
+
+        elif self.attr is None:
             geoms = self.gdf.geometry.to_list()
             rasterized = features.rasterize(
                 geoms,
@@ -22,9 +22,8 @@ along with t4gpd.  If not, see <https://www.gnu.org/licenses/>.
 """
 
 from datetime import datetime
-from numpy import isnan
+from numpy import isnan, stack
 from pandas import DataFrame, concat, to_datetime
-from pymap3d.aer import ecef2aer
 from pytz import timezone
 from t4gpd.commons.GeoProcess import GeoProcess
 from t4gpd.commons.ListUtilities import ListUtilities
@@ -92,25 +91,21 @@ class STECEF2AERSatelliteReader(GeoProcess):
             ]
         raise Exception("Unreachable instruction!")
 
-    def __ecef2aer(self, row, h0, version, ell=SatelliteLib.WGS84):
+    def __ecef2aer(self, h0, version, ell=SatelliteLib.WGS84):
         # ECEF: earth-centered, earth-fixed frame
         # AER: azimuth, elevation, slant range
-        # ECEF -> AER
-        vp, lat0, lon0 = row.geometry, row[self.lat], row[self.lon]
-
-        nsat, rows = 0, []
-        for x, y, z in STECEF2AERSatelliteReader.__get_XYZ_fieldnames(version):
-            x, y, z = row[x], row[y], row[z]
-
-            az, el, srange = None, None, None
-            if not (isnan(x) or isnan(y) or isnan(z)):
-                nsat += 1
-                # https://geospace-code.github.io/pymap3d/aer.html#pymap3d.aer.ecef2aer
-                az, el, srange = ecef2aer(x, y, z, lat0, lon0, h0, ell=ell, deg=True)
-            rows.extend([az, el, srange])
-
-        rows.append(nsat)
-        return rows
+        # ECEF -> AER, for all (sensors x satellites) pairs at once
+        fieldnames = STECEF2AERSatelliteReader.__get_XYZ_fieldnames(version)
+        x, y, z = [
+            self.sensors[list(_fieldnames)].to_numpy(dtype=float)
+            for _fieldnames in zip(*fieldnames)
+        ]
+        lat0 = self.sensors[self.lat].to_numpy(dtype=float)[:, None]
+        lon0 = self.sensors[self.lon].to_numpy(dtype=float)[:, None]
+
+        az, el, srange = SatelliteLib.ecef2aer(x, y, z, lat0, lon0, h0, ell=ell)
+        nsat = (~(isnan(x) | isnan(y) | isnan(z))).sum(axis=1)
+        return stack([az, el, srange], axis=2).reshape(len(self.sensors), -1), nsat
 
     @staticmethod
     def __get_colnames(version):
@@ -286,12 +281,10 @@ class STECEF2AERSatelliteReader(GeoProcess):
         version = STECEF2AERSatelliteReader.__get_version(self.sensors)
 
         h0 = self.sensors.loc[0, self.alt]
-        df = self.sensors.apply(lambda row: self.__ecef2aer(row, h0, version), axis=1)
-        df = df.to_frame(name="satellites")
-        df = DataFrame(
-            df.satellites.to_list(),
-            columns=STECEF2AERSatelliteReader.__get_colnames(version),
-        )
+        aer, nsat = self.__ecef2aer(h0, version)
+        colnames = STECEF2AERSatelliteReader.__get_colnames(version)
+        df = DataFrame(aer, columns=colnames[:-1])
+        df[colnames[-1]] = nsat
         df = concat([self.sensors, df], axis=1)
 
         if not self.timestampFieldName is None:
@@ -22,14 +22,23 @@ along with t4gpd.  If not, see <https://www.gnu.org/licenses/>.
 """
 
 import gzip
-from datetime import datetime
 from geopandas import GeoDataFrame
 from glob import glob
-from os.path import isdir, isfile
-from pandas import DataFrame, Timedelta, Timestamp, concat, date_range, merge_asof
+from numpy import arange, array, clip, cumsum, empty, int64, nan, searchsorted, stack
+from os import replace
+from os.path import basename, dirname, getmtime, isdir, isfile, join
+from pandas import (
+    DataFrame,
+    Series,
+    Timedelta,
+    concat,
+    date_range,
+    merge_asof,
+    read_parquet,
+    to_datetime,
+    to_timedelta,
+)
 from pandas.core.common import flatten
-from pymap3d import Ellipsoid
-from pymap3d.aer import ecef2aer
 from t4gpd.commons.GeoProcess import GeoProcess
 from t4gpd.commons.IllegalArgumentTypeException import IllegalArgumentTypeException
 from t4gpd.resilientgaia.SatelliteLib import SatelliteLib
@@ -40,11 +49,35 @@ class STSP3GnssReader(GeoProcess):
     classdocs
     """
 
+    FIELDS = {
+        "x": "satcoordX_{}",
+        "y": "satcoordY_{}",
+        "z": "satcoordZ_{}",
+        "az": "{}_az",
+        "el": "{}_el",
+        "sr": "{}_sr",
+    }
+
     def __init__(
-        self, sensors, dtFieldName, sp3_files_or_dirname, freq=None, filter=None
+        self,
+        sensors,
+        dtFieldName,
+        sp3_files_or_dirname,
+        freq=None,
+        filter=None,
+        interpolation="lagrange",
+        order=9,
+        cache=True,
+        cachedir=None,
     ):
         """
         Constructor
+
+        interpolation: "lagrange" interpolates the satellite positions at the
+        sensors' timestamps (polynomial of the given order over the SP3 epochs),
+        "nearest" keeps the positions of the nearest SP3 epoch (within 5 min).
+        cache: if True, the parsed orbits of each SP3 file are stored in a
+        Parquet file, in cachedir (the SP3 file's directory by default).
         """
         if not isinstance(sensors, GeoDataFrame):
             raise IllegalArgumentTypeException(sensors, "GeoDataFrame")
@@ -59,53 +92,93 @@ class STSP3GnssReader(GeoProcess):
         self.freq = freq  # "5min", "1h"
         self.filter = filter
 
+        if not interpolation in ("lagrange", "nearest"):
+            raise IllegalArgumentTypeException(
+                interpolation, "interpolation must be 'lagrange' or 'nearest'"
+            )
+        self.interpolation = interpolation
+        self.order = order
+        self.cache = cache
+        self.cachedir = cachedir
+
     @staticmethod
-    def __read_aux(sp3_filename):
-        with gzip.open(sp3_filename, "rt") as f:
-            lines = f.readlines()
-
-        # Lecture des positions satellites dans le SP3
-        sat_positions = []
-        for line in lines:
-            if line.startswith("*"):
-                dt = " ".join(line[1:-3].split())
-                dt = Timestamp(datetime.strptime(dt, "%Y %m %d %H %M %S.%f"))
-            elif line.startswith("P"):
-                satname, x, y, z, clock_corr = line[1:].split()[:5]
-                # Convertir les coordonnées de kilomètres en mètres
-                x, y, z = 1e3 * float(x), 1e3 * float(y), 1e3 * float(z)
-
-                sat_positions.append(
-                    {
-                        "sat_dt": dt,
-                        "sat_name": satname,
-                        "x": x,
-                        "y": y,
-                        "z": z,
-                    }
-                )
-        sat_positions = DataFrame(sat_positions)
-        sat_positions.sat_dt = sat_positions.sat_dt.dt.tz_localize("UTC")
+    def __parse(sp3_filename):
+        with gzip.open(sp3_filename, "rb") as f:
+            lines = array(f.read().splitlines(), dtype="S80")
+        # SP3 records are fixed-width lines of (at most) 80 characters
+        chars = lines.view("S1").reshape(len(lines), -1)
+        isEpoch, isPos = (b"*" == chars[:, 0]), (b"P" == chars[:, 0])
+
+        # Epoch records: "*  YYYY MM DD hh mm ss.ssssssss"
+        epochs = array(b" ".join(lines[isEpoch]).split()).reshape(-1, 7)[:, 1:]
+        epochs = to_datetime(
+            DataFrame(
+                epochs[:, :5].astype(int),
+                columns=["year", "month", "day", "hour", "minute"],
+            )
+        ) + to_timedelta((1e6 * epochs[:, 5].astype(float)).astype(int64), unit="us")
+        epochs = epochs.to_numpy()[cumsum(isEpoch)[isPos] - 1]
+
+        # Position records: "PSNN" followed by x, y, z (in km) in 14-column fields
+        satNames = chars[isPos, 1:4].copy().view("S3").ravel().astype(str)
+        xyz = chars[isPos, 4:46].copy().view("S14").astype(float)
+        # Convertir les coordonnées de kilomètres en mètres
+        xyz = 1e3 * xyz
+
+        sat_positions = DataFrame(
+            {
+                "sat_dt": epochs,
+                "sat_name": satNames,
+                "x": xyz[:, 0],
+                "y": xyz[:, 1],
+                "z": xyz[:, 2],
+            }
+        )
+        sat_positions.sat_dt = (
+            sat_positions.sat_dt.astype("datetime64[us]").dt.tz_localize("UTC")
+        )
         return sat_positions
 
     @staticmethod
-    def _read(sp3_files_or_dirname, freq=None, filter=None):
+    def __read_aux(sp3_filename, cache=True, cachedir=None):
+        if not cache:
+            return STSP3GnssReader.__parse(sp3_filename)
+
+        cachedir = dirname(sp3_filename) if cachedir is None else cachedir
+        cachefile = join(cachedir, f"{basename(sp3_filename)}.parquet")
+        if isfile(cachefile) and (getmtime(sp3_filename) <= getmtime(cachefile)):
+            return read_parquet(cachefile)
+
+        sat_positions = STSP3GnssReader.__parse(sp3_filename)
+        try:
+            # Write then rename, so that a concurrent reader never sees a
+            # partial file
+            tmpfile = f"{cachefile}.tmp"
+            sat_positions.to_parquet(tmpfile, index=False)
+            replace(tmpfile, cachefile)
+        except (ImportError, OSError):
+            # No Parquet engine or read-only directory: no cache
+            pass
+        return sat_positions
+
+    @staticmethod
+    def _read(sp3_files_or_dirname, freq=None, filter=None, cache=True, cachedir=None):
         if isinstance(sp3_files_or_dirname, (list, tuple)):
-            sp3 = []
-            for sp3_filename in sp3_files_or_dirname:
-                if isfile(sp3_filename):
-                    _sp3 = STSP3GnssReader.__read_aux(sp3_filename)
-                sp3.append(_sp3)
+            sp3 = [
+                STSP3GnssReader.__read_aux(sp3_filename, cache, cachedir)
+                for sp3_filename in sp3_files_or_dirname
+                if isfile(sp3_filename)
+            ]
             sp3 = concat(sp3, ignore_index=True)
 
         elif isfile(sp3_files_or_dirname):
-            sp3 = STSP3GnssReader.__read_aux(sp3_files_or_dirname)
+            sp3 = STSP3GnssReader.__read_aux(sp3_files_or_dirname, cache, cachedir)
 
         elif isdir(sp3_files_or_dirname):
-            sp3 = []
-            for sp3_filename in glob(f"{sp3_files_or_dirname}/*.SP3.gz"):
-                _sp3 = STSP3GnssReader.__read_aux(sp3_filename)
-                sp3.append(_sp3)
+            sp3 = [
+                STSP3GnssReader.__read_aux(sp3_filename, cache, cachedir)
+                for sp3_filename in glob(f"{sp3_files_or_dirname}/*.SP3.gz")
+            ]
             sp3 = concat(sp3, ignore_index=True)
 
         else:
@@ -124,6 +197,53 @@ class STSP3GnssReader(GeoProcess):
         sp3.sort_values(by="sat_dt", inplace=True)
         return sp3
 
+    @staticmethod
+    def _interpolate(sat_positions, dts, order=9, chunksize=8192):
+        """
+        Lagrange interpolation of the satellite positions at the given
+        timestamps, over the order+1 SP3 epochs surrounding each of them.
+        A missing or null (0, 0, 0) position within the window, as well as a
+        timestamp outside the SP3 time span, results in NaN.
+        :return: satellite names, (len(dts), len(satNames), 3) array of
+            ECEF coordinates
+        """
+        npts = order + 1
+        cube = sat_positions.drop_duplicates(
+            subset=["sat_dt", "sat_name"], keep="last"
+        ).pivot(index="sat_dt", columns="sat_name", values=["x", "y", "z"])
+        if len(cube) < npts:
+            raise Exception(
+                f"At least {npts} SP3 epochs are required to interpolate with order {order}!"
+            )
+        satNames = cube["x"].columns.to_list()
+        xyz = stack([cube[c].to_numpy(dtype=float) for c in "xyz"], axis=2)
+        xyz[(0.0 == xyz).all(axis=2)] = nan
+
+        dt0 = cube.index[0]
+        T = (Series(cube.index) - dt0).dt.total_seconds().to_numpy()
+        t = (to_datetime(Series(dts), utc=True) - dt0).dt.total_seconds().to_numpy()
+
+        # First epoch of the window centred on each timestamp
+        k0 = clip(searchsorted(T, t) - npts // 2, 0, len(T) - npts)
+        diag = arange(npts)
+
+        result = empty((len(t), len(satNames), 3))
+        for i in range(0, len(t), chunksize):
+            _t = t[i : i + chunksize, None, None]
+            K = k0[i : i + chunksize, None] + diag
+            Tk = T[K]
+            # L[:, j] = prod_{m != j} (t - T_m) / (T_j - T_m)
+            ratios = (_t - Tk[:, None, :]) / (
+                Tk[:, :, None] - Tk[:, None, :] + (diag[:, None] == diag)
+            )
+            ratios[:, diag, diag] = 1.0
+            L = ratios.prod(axis=2)
+            result[i : i + chunksize] = sum(
+                L[:, j, None, None] * xyz[K[:, j]] for j in range(npts)
+            )
+        result[~((T[0] <= t) & (t <= T[-1]))] = nan
+        return satNames, result
+
     @staticmethod
     def _merge_asof(sat_positions, sensors, timestampFieldName):
         joinTable = merge_asof(
@@ -134,44 +254,33 @@ class STSP3GnssReader(GeoProcess):
             tolerance=Timedelta("5min"),
             direction="nearest",
         )
-
-        gdfs = []
-        for _, row in joinTable.iterrows():
-            dtViewpoint, geometry = row[timestampFieldName], row["geometry"]
-            dtSat = row["sat_dt"]
-            gdf = concat(
-                [
-                    DataFrame(columns=[timestampFieldName, "geometry"]),
-                    sat_positions.query("sat_dt == @dtSat").copy(deep=True),
-                ]
-            )
-            gdf[timestampFieldName] = dtViewpoint
-            gdf.geometry = geometry
-            gdfs.append(gdf)
-
-        gdfs = GeoDataFrame(concat(gdfs, ignore_index=True), crs=sensors.crs)
-        return gdfs
+        gdfs = joinTable.merge(sat_positions, on="sat_dt", how="inner")
+        return GeoDataFrame(gdfs, geometry="geometry", crs=sensors.crs)
 
     @staticmethod
     def _ecef_to_aer(ecef_positions, h0):
         """Convert ECEF coordinates to AER (azimuth, elevation, slant range)"""
 
-        def __ecef2aer_row(row, h0, ell):
-            # https://geospace-code.github.io/pymap3d/aer.html#pymap3d.aer.ecef2aer
-            lat0, lon0 = row.geometry.y, row.geometry.x
-            az, el, srange = ecef2aer(
-                row.x, row.y, row.z, lat0, lon0, h0, ell=ell, deg=True
-            )
-            return lat0, lon0, h0, az, el, srange
-
-        ell = Ellipsoid.from_name("wgs84")
-
         aer_positions = ecef_positions.to_crs("epsg:4326").copy(deep=True)
+        lat0 = aer_positions.geometry.y.to_numpy()
+        lon0 = aer_positions.geometry.x.to_numpy()
+        az, el, srange = SatelliteLib.ecef2aer(
+            aer_positions.x.to_numpy(dtype=float),
+            aer_positions.y.to_numpy(dtype=float),
+            aer_positions.z.to_numpy(dtype=float),
+            lat0,
+            lon0,
+            h0,
+        )
         _df = DataFrame(
-            aer_positions.apply(
-                lambda row: __ecef2aer_row(row, h0, ell=ell), axis=1
-            ).to_list(),
-            columns=["lat0", "lon0", "h0", "az", "el", "sr"],
+            {
+                "lat0": lat0,
+                "lon0": lon0,
+                "h0": h0,
+                "az": az,
+                "el": el,
+                "sr": srange,
+            }
         )
         aer_positions = concat([aer_positions.reset_index(drop=True), _df], axis=1)
         aer_positions = GeoDataFrame(aer_positions, crs="epsg:4326").to_crs(
@@ -183,45 +292,81 @@ class STSP3GnssReader(GeoProcess):
         return aer_positions
 
     @staticmethod
-    def _transform_wide(aer_positions, timestampFieldName):
+    def __to_wide(keys, timestampFieldName, satNames, fields, crs):
+        # keys: one row (timestamp, geometry) per output row
+        # fields: (len(keys), len(satNames)) array for each key of FIELDS
         columns = list(
             flatten(
                 ["gid", timestampFieldName, "geometry"]
                 + [
-                    (
-                        f"satcoordX_{sat}",
-                        f"satcoordY_{sat}",
-                        f"satcoordZ_{sat}",
-                        f"{sat}_az",
-                        f"{sat}_el",
-                        f"{sat}_sr",
-                    )
+                    [pattern.format(sat) for pattern in STSP3GnssReader.FIELDS.values()]
                     for sat in SatelliteLib.get_satellite_names(version=2)
                 ]
             )
         )
-        ht = {}
-        for _, row in aer_positions.iterrows():
-            key, sat = row[timestampFieldName], row["sat_name"]
-            if not key in ht:
-                ht[key] = {"timeUTC": key, "geometry": row["geometry"]}
-
-            ht[key][f"{sat}_az"] = row["az"]
-            ht[key][f"{sat}_el"] = row["el"]
-            ht[key][f"{sat}_sr"] = row["sr"]
-
-        rows = []
-        for gid, (k, v) in enumerate(ht.items()):
-            v.update({"gid": gid})
-            rows.append(v)
+        data = {
+            "gid": arange(len(keys)),
+            timestampFieldName: keys[timestampFieldName].reset_index(drop=True),
+            "geometry": keys.geometry.values,
+        }
+        for field, pattern in STSP3GnssReader.FIELDS.items():
+            for j, sat in enumerate(satNames):
+                data[pattern.format(sat)] = fields[field][:, j]
         return GeoDataFrame(
-            rows, columns=columns, geometry="geometry", crs=aer_positions.crs
+            DataFrame(data).reindex(columns=columns), geometry="geometry", crs=crs
+        )
+
+    @staticmethod
+    def _transform_wide(aer_positions, timestampFieldName):
+        # One row per timestamp, with the last values of each satellite
+        keys = aer_positions.drop_duplicates(subset=timestampFieldName)
+        wide = aer_positions.drop_duplicates(
+            subset=[timestampFieldName, "sat_name"], keep="last"
+        ).pivot(
+            index=timestampFieldName,
+            columns="sat_name",
+            values=list(STSP3GnssReader.FIELDS),
+        )
+        wide = wide.reindex(index=keys[timestampFieldName])
+        satNames = wide["az"].columns.to_list()
+        fields = {
+            field: wide[field].to_numpy(dtype=float) for field in STSP3GnssReader.FIELDS
+        }
+        return STSP3GnssReader.__to_wide(
+            keys, timestampFieldName, satNames, fields, aer_positions.crs
+        )
+
+    def __interpolate_and_transform(self, sat_positions, h0):
+        satNames, xyz = STSP3GnssReader._interpolate(
+            sat_positions, self.sensors[self.dtFieldName], self.order
+        )
+        geoms = self.sensors.geometry.to_crs("epsg:4326")
+        x, y, z = xyz[..., 0], xyz[..., 1], xyz[..., 2]
+        az, el, sr = SatelliteLib.ecef2aer(
+            x, y, z, geoms.y.to_numpy()[:, None], geoms.x.to_numpy()[:, None], h0
+        )
+        # Satellites below the horizon are ignored, as are the sensors that
+        # see none of them
+        visible = 0 <= el
+        rows = visible.any(axis=1)
+        fields = {
+            field: array(values, dtype=float)
+            for field, values in zip(STSP3GnssReader.FIELDS, (x, y, z, az, el, sr))
+        }
+        for values in fields.values():
+            values[~visible] = nan
+        fields = {field: values[rows] for field, values in fields.items()}
+        return STSP3GnssReader.__to_wide(
+            self.sensors[rows], self.dtFieldName, satNames, fields, self.sensors.crs
         )
 
     def run(self):
         sat_positions = STSP3GnssReader._read(
-            self.sp3_files_or_dirname, self.freq, self.filter
+            self.sp3_files_or_dirname, self.freq, self.filter, self.cache, self.cachedir
         )
+        if "lagrange" == self.interpolation:
+            return self.__interpolate_and_transform(sat_positions, h0=0.0)
+
         ecef_positions = STSP3GnssReader._merge_asof(
             sat_positions, self.sensors, self.dtFieldName
         )
@@ -21,6 +21,18 @@ You should have received a copy of the GNU General Public License
 along with t4gpd.  If not, see <https://www.gnu.org/licenses/>.
 """
 from datetime import date, datetime, timedelta
+from numpy import (
+    arctan2,
+    asarray,
+    cos,
+    degrees,
+    errstate,
+    hypot,
+    pi,
+    radians,
+    sin,
+    where,
+)
 from pymap3d import Ellipsoid
 from t4gpd.commons.IllegalArgumentTypeException import IllegalArgumentTypeException
 
@@ -62,6 +74,65 @@ class SatelliteLib:
             ]
         raise Exception("Unknown version!")
 
+    @staticmethod
+    def ecef2enu(x, y, z, lat0, lon0, h0, ell=WGS84):
+        """
+        NumPy-broadcast counterpart of pymap3d.ecef2enu (degrees)
+        :param x, y, z: ECEF coordinates of the targets, e.g. (nsensors, nsats) arrays
+        :param lat0, lon0, h0: geodetic coordinates of the observers, e.g.
+            (nsensors, 1) arrays
+        :return: east, north, up arrays (NaN where a target is absent)
+        """
+        lat0, lon0 = radians(lat0), radians(lon0)
+        coslat, sinlat = cos(lat0), sin(lat0)
+        coslon, sinlon = cos(lon0), sin(lon0)
+
+        # Observers in ECEF (pymap3d.geodetic2ecef)
+        a, b = ell.semimajor_axis, ell.semiminor_axis
+        N = a**2 / hypot(a * coslat, b * sinlat)
+        x0 = (N + h0) * coslat * coslon
+        y0 = (N + h0) * coslat * sinlon
+        z0 = (N * (b / a) ** 2 + h0) * sinlat
+
+        # ECEF -> ENU (pymap3d.uvw2enu)
+        u, v, w = asarray(x) - x0, asarray(y) - y0, asarray(z) - z0
+        t = coslon * u + sinlon * v
+        east = -sinlon * u + coslon * v
+        up = coslat * t + sinlat * w
+        north = -sinlat * t + coslat * w
+        return east, north, up
+
+    @staticmethod
+    def enu2aer(east, north, up):
+        """
+        NumPy-broadcast counterpart of pymap3d.enu2aer (degrees)
+        :return: azimuth, elevation, slant range arrays
+        """
+        # 1 millimeter precision for singularity stability, as pymap3d
+        with errstate(invalid="ignore"):
+            east = where(abs(east) < 1e-3, 0.0, east)
+            north = where(abs(north) < 1e-3, 0.0, north)
+            up = where(abs(up) < 1e-3, 0.0, up)
+
+        r = hypot(east, north)
+        srange = hypot(r, up)
+        el = degrees(arctan2(up, r))
+        az = degrees(arctan2(east, north) % (2 * pi))
+        return az, el, srange
+
+    @staticmethod
+    def ecef2aer(x, y, z, lat0, lon0, h0, ell=WGS84):
+        """
+        NumPy-broadcast ECEF -> ENU -> AER transform (degrees), i.e. one
+        call for a whole (sensors x satellites) table instead of one
+        pymap3d.ecef2aer call per pair. Absent satellites (NaN
+        coordinates) remain NaN.
+        :return: azimuth, elevation, slant range arrays
+        """
+        return SatelliteLib.enu2aer(
+            *SatelliteLib.ecef2enu(x, y, z, lat0, lon0, h0, ell)
+        )
+
     @staticmethod
     def get_gps_week(d):
         delta = d - SatelliteLib.GPS_START
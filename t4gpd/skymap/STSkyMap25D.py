@@ -21,16 +21,18 @@ You should have received a copy of the GNU General Public License
 along with t4gpd.  If not, see <https://www.gnu.org/licenses/>.
 """
 
-from geopandas import GeoDataFrame
+from geopandas import GeoDataFrame, GeoSeries
 from numpy import arctan2, asarray, linspace, pi
 from shapely import Point, Polygon
 from t4gpd.commons.ArrayCoding import ArrayCoding
+from t4gpd.commons.Checksum import Checksum
 from t4gpd.commons.DataFrameLib import DataFrameLib
 from t4gpd.commons.GeoDataFrameLib import GeoDataFrameLib
 from t4gpd.commons.GeomLib import GeomLib
 from t4gpd.commons.GeomLib3D import GeomLib3D
 from t4gpd.commons.GeoProcess import GeoProcess
 from t4gpd.commons.IllegalArgumentTypeException import IllegalArgumentTypeException
+from t4gpd.commons.Memoizer import Memoizer
 from t4gpd.commons.proj.AEProjectionLib import AEProjectionLib
 from t4gpd.commons.raycasting.RayCasting25DLib import RayCasting25DLib
 
@@ -95,16 +97,10 @@ class STSkyMap25D(GeoProcess):
                     "There is at least one NaN value in the elevation column of the buildings dataframe!"
                 )
 
-            # CLEAN GEOMETRIES
-            self.buildings.geometry = self.buildings.geometry.apply(
-                lambda g: g.buffer(0)
-            )
-            self.buildings.geometry = self.buildings.apply(
-                lambda row: GeomLib.forceZCoordinateToZ0(
-                    row.geometry, row[self.elevationFieldname]
-                ),
-                axis=1,
-            )
+            # CLEAN GEOMETRIES (ONCE PER SCENE)
+            self.buildings.geometry = STSkyMap25D.__cleanGeometries(
+                self.buildings, self.elevationFieldname
+            ).copy()
 
         self.nRays = nRays
         self.rayLength = rayLength
@@ -122,6 +118,30 @@ class STSkyMap25D(GeoProcess):
         self.encode = encode
         self.threshold = threshold
 
+    @staticmethod
+    def __cleanGeometries(buildings, elevationFieldname):
+        memo = Memoizer.shared()
+        key = ("STSkyMap25D.buildings", Checksum.fingerprint(buildings, [elevationFieldname]))
+        result = memo.get(key)
+        if result is None:
+            geoms = buildings.geometry.apply(lambda g: g.buffer(0))
+            result = GeoSeries(
+                [
+                    GeomLib.forceZCoordinateToZ0(g, z)
+                    for g, z in zip(geoms, buildings[elevationFieldname])
+                ],
+                crs=buildings.crs,
+            ).values
+            memo.put(key, result)
+            # As buildings are cleaned in place, the cleaned scene is
+            # registered too
+            cleaned = buildings[[elevationFieldname]].set_geometry(result)
+            memo.put(
+                ("STSkyMap25D.buildings", Checksum.fingerprint(cleaned, [elevationFieldname])),
+                result,
+            )
+        return result
+
     def __angles(self, heights, widths):
         return [arctan2(h, w) for h, w in zip(heights, widths)]
 
@@ -186,7 +206,11 @@ class STSkyMap25D(GeoProcess):
 
         if self.encode:
             smapRaysField.viewpoint = smapRaysField.viewpoint.apply(lambda vp: vp.wkt)
-            if "angles" in smapRaysField:
+            if ("angles" in smapRaysField) and ("base64" == self.encode):
+                smapRaysField.angles = ArrayCoding.encodeColumn(
+                    smapRaysField.angles, dtype="float32"
+                )
+            elif "angles" in smapRaysField:
                 smapRaysField.angles = smapRaysField.angles.apply(
                     lambda a: ArrayCoding.encode(a)
                 )
@@ -21,7 +21,9 @@ You should have received a copy of the GNU General Public License
 along with t4gpd.  If not, see <https://www.gnu.org/licenses/>.
 '''
 from geopandas.geodataframe import GeoDataFrame
+from t4gpd.commons.Checksum import Checksum
 from t4gpd.commons.IllegalArgumentTypeException import IllegalArgumentTypeException
+from t4gpd.commons.Memoizer import Memoizer
 from t4gpd.commons.sun.SunLib import SunLib
 from t4gpd.sun.geoProcesses.AbstractSunshineDuration import AbstractSunshineDuration
 
@@ -38,15 +40,21 @@ class SunshineDuration(AbstractSunshineDuration):
         if not isinstance(masksGdf, GeoDataFrame):
             raise IllegalArgumentTypeException(masksGdf, 'GeoDataFrame')
         self.masksGdf = masksGdf
-        self.masksSIdx = masksGdf.sindex
 
         if maskElevationFieldname not in masksGdf:
             raise Exception('%s is not a relevant field name!' % (maskElevationFieldname))
         self.maskElevationFieldname = maskElevationFieldname
         maxElevation = max(self.masksGdf[self.maskElevationFieldname])  #===========
 
+        # Spatial index and sun positions are computed once per scene
+        memo = Memoizer.shared()
+        fingerprint = Checksum.fingerprint(masksGdf, [maskElevationFieldname])
+        self.masksSIdx = memo.get(('SunshineDuration.sindex', fingerprint), lambda: masksGdf.sindex)
+
         self.sunModel = SunLib(masksGdf, model)
-        self.sunPositions = self._getAllSunPositions(datetimes, maxElevation)
+        self.sunPositions = memo.get(
+            ('SunshineDuration.sunPositions', fingerprint, model, Checksum.md5Of(datetimes)),
+            lambda: self._getAllSunPositions(datetimes, maxElevation))
         self.nSunPositions = len(self.sunPositions)
 
     def runWithArgs(self, row):
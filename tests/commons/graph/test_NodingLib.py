@@ -0,0 +1,80 @@
+"""
+Created on 19 Oct. 2026
+
+@author: tleduc
+
+Copyright 2020-2026 Thomas Leduc
+
+This file is part of t4gpd.
+
+t4gpd is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+t4gpd is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with t4gpd.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import unittest
+
+from numpy import array
+from shapely import LineString, MultiLineString, Polygon
+from t4gpd.commons.graph.NodingLib import NodingLib
+
+
+class NodingLibTest(unittest.TestCase):
+    def setUp(self):
+        # A cross, a T-junction and a duplicated (reversed) segment
+        self.geoms = array([
+            LineString([(0, 5), (10, 5)]),
+            LineString([(5, 0), (5, 10)]),
+            MultiLineString([[(10, 0), (10, 10)], [(10, 5), (15, 5)]]),
+            LineString([(15, 5), (10, 5)]),
+        ])
+
+    def tearDown(self):
+        pass
+
+    def testBipoints(self):
+        result = NodingLib.bipoints(self.geoms)
+        self.assertEqual((5, 2, 2), result.shape, "Test shape (1)")
+
+        result = NodingLib.bipoints(array([Polygon([(0, 0), (1, 0), (1, 1)])]))
+        self.assertEqual((3, 2, 2), result.shape, "Test shape (2)")
+
+    def testNode(self):
+        bipoints = NodingLib.bipoints(self.geoms)
+        for tilesize in [None, 4, 100]:
+            result = NodingLib.node(bipoints, tilesize=tilesize)
+            # 2 + 2 + 2 + 1 bipoints, the duplicate being removed
+            self.assertEqual((7, 2, 2), result.shape, "Test shape")
+            self.assertAlmostEqual(35, sum(
+                LineString(bp).length for bp in result), None,
+                "Test total length", 1e-6)
+
+    def testNodeAgainst(self):
+        others = NodingLib.node(NodingLib.bipoints(self.geoms[:2]))
+        bipoints = NodingLib.bipoints(self.geoms[2:])
+        noded, cutIds, parts = NodingLib.node_against(bipoints, others)
+
+        self.assertEqual((3, 2, 2), noded.shape, "Test shape (1)")
+        # (0, 5)-(10, 5) ends at (10, 5): it is only touched
+        self.assertEqual(0, len(cutIds), "Count cut bipoints")
+        self.assertEqual(0, len(parts), "Count parts")
+
+        bipoints = NodingLib.bipoints(array([LineString([(2, -1), (2, 11)])]))
+        noded, cutIds, parts = NodingLib.node_against(bipoints, others)
+        self.assertEqual((2, 2, 2), noded.shape, "Test shape (2)")
+        self.assertEqual(1, len(cutIds), "Count cut bipoints")
+        self.assertEqual((2, 2, 2), parts.shape, "Test shape (3)")
+
+
+if __name__ == "__main__":
+    # import sys;sys.argv = ['', 'Test.testName']
+    unittest.main()
@@ -0,0 +1,89 @@
+"""
+Created on 19 Oct. 2026
+
+@author: tleduc
+
+Copyright 2020-2026 Thomas Leduc
+
+This file is part of t4gpd.
+
+t4gpd is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+t4gpd is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with t4gpd.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import unittest
+
+from geopandas import GeoDataFrame
+from numpy import inf, ndarray
+from shapely import LineString, Point
+from t4gpd.commons.graph.ODMatrixLib import ODMatrixLib
+
+
+class ODMatrixLibTest(unittest.TestCase):
+    def setUp(self):
+        # A 2x1 ladder and an isolated segment
+        self.roads = GeoDataFrame(
+            geometry=[
+                LineString([(0, 0), (10, 0), (20, 0)]),
+                LineString([(0, 10), (10, 10), (20, 10)]),
+                LineString([(0, 0), (0, 10)]),
+                LineString([(10, 0), (10, 10)]),
+                LineString([(20, 0), (20, 10)]),
+                LineString([(50, 0), (50, 10)]),
+            ],
+            crs="epsg:2154",
+        )
+        self.fromPoints = [Point(5, -1), Point(0, 10)]
+        self.toPoints = [Point(15, 11), Point(5, -2), Point(51, 5)]
+
+    def tearDown(self):
+        pass
+
+    def testOdMatrix(self):
+        result = ODMatrixLib.odMatrix(self.roads, self.fromPoints, self.toPoints)
+
+        self.assertIsInstance(result, ndarray, "Is a ndarray")
+        self.assertEqual((2, 3), result.shape, "Test shape")
+        # (5, -1) -> (5, 0) -> (10, 0) -> (10, 10) -> (15, 10) -> (15, 11)
+        self.assertAlmostEqual(22, result[0, 0], None, "Test distance (1)", 1e-6)
+        # Both points are snapped onto the same segment
+        self.assertAlmostEqual(3, result[0, 1], None, "Test distance (2)", 1e-6)
+        self.assertEqual(inf, result[0, 2], "Test distance (3)")
+        self.assertAlmostEqual(16, result[1, 0], None, "Test distance (4)", 1e-6)
+        self.assertAlmostEqual(17, result[1, 1], None, "Test distance (5)", 1e-6)
+        self.assertEqual(inf, result[1, 2], "Test distance (6)")
+
+    def testOdMatrixWithPaths(self):
+        distances, paths = ODMatrixLib.odMatrix(
+            self.roads, self.fromPoints, self.toPoints, withPaths=True, ncpus=2
+        )
+
+        self.assertIsInstance(paths, GeoDataFrame, "Is a GeoDataFrame")
+        self.assertEqual(4, len(paths), "Count rows")
+        self.assertEqual(7, len(paths.columns), "Count columns")
+        for _, row in paths.iterrows():
+            self.assertAlmostEqual(
+                distances[row.fromIdx, row.toIdx], row.pathLen, None,
+                "Test path length (1)", 1e-6)
+            self.assertAlmostEqual(
+                row.pathLen, row.geometry.length, None,
+                "Test path length (2)", 1e-6)
+            self.assertEqual(
+                self.fromPoints[row.fromIdx].wkt, row.fromPoint, "Test origin")
+            self.assertEqual(
+                self.toPoints[row.toIdx].wkt, row.toPoint, "Test destination")
+
+
+if __name__ == "__main__":
+    # import sys;sys.argv = ['', 'Test.testName']
+    unittest.main()
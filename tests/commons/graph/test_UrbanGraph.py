@@ -0,0 +1,185 @@
+"""
+Created on 19 Oct. 2026
+
+@author: tleduc
+
+Copyright 2020-2026 Thomas Leduc
+
+This file is part of t4gpd.
+
+t4gpd is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+t4gpd is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with t4gpd.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import unittest
+
+from geopandas import GeoDataFrame
+from numpy import ndarray
+from scipy.sparse import csr_matrix
+from shapely import LineString, Point
+from t4gpd.commons.graph.UrbanGraphFactory import UrbanGraphFactory
+
+
+class UrbanGraphTest(unittest.TestCase):
+    def setUp(self):
+        # A 2x1 ladder with a doubled rung, and an isolated segment
+        self.roads = GeoDataFrame(
+            geometry=[
+                LineString([(0, 0), (10, 0), (20, 0)]),
+                LineString([(0, 10), (10, 10), (20, 10)]),
+                LineString([(0, 0), (0, 10)]),
+                LineString([(10, 0), (10, 10)]),
+                LineString([(10, 10), (10, 0)]),
+                LineString([(20, 0), (20, 10)]),
+                LineString([(50, 0), (50, 10)]),
+            ],
+            crs="epsg:2154",
+        )
+
+    def tearDown(self):
+        pass
+
+    def testCreateCsr(self):
+        ug = UrbanGraphFactory.create(self.roads, method="csr")
+
+        self.assertEqual("csr", ug.method, "Test method")
+        self.assertIsInstance(ug.coords, ndarray, "Is a ndarray (1)")
+        self.assertIsInstance(ug.bipoints, ndarray, "Is a ndarray (2)")
+        self.assertIsInstance(ug.csr_graph, csr_matrix, "Is a CSR matrix")
+        self.assertEqual((8, 2), ug.coords.shape, "Count vertices")
+        self.assertEqual((8, 8), ug.csr_graph.shape, "Test matrix shape")
+        # The doubled rung is a single edge
+        self.assertEqual(2 * 8, ug.csr_graph.nnz, "Count edges")
+        self.assertAlmostEqual(
+            2 * 80, ug.csr_graph.sum(), None, "Test edge lengths", 1e-6)
+
+    def testCreateTiledAndAppend(self):
+        for method in ["networkx", "csr"]:
+            ug1 = UrbanGraphFactory.create(self.roads, method=method)
+            ug2 = UrbanGraphFactory.create(self.roads, method=method, tilesize=8)
+            ug3 = UrbanGraphFactory.create(
+                self.roads.iloc[:4], method=method, tilesize=8)
+            # The appended roads cross the existing ones
+            self.assertIs(ug3, UrbanGraphFactory.append(
+                ug3, self.roads.iloc[4:], tilesize=8), "Test identity")
+
+            for ug in [ug1, ug2, ug3]:
+                result = ug.shortest_path(Point(5, -1), Point(15, 11))
+                self.assertAlmostEqual(22, result.pathLen.squeeze(), None,
+                                       f"Test path length ({method})", 1e-6)
+                self.assertAlmostEqual(60, ug.minimum_spanning_tree().weight.sum(),
+                                       None, f"Test MST ({method})", 1e-6)
+
+    def testRoadsSections(self):
+        # A small tree hung on the ladder
+        roads = GeoDataFrame(geometry=list(self.roads.geometry) + [
+            LineString([(20, 10), (30, 10), (40, 10)]),
+            LineString([(30, 10), (30, 20)]),
+        ], crs=self.roads.crs)
+        ug = UrbanGraphFactory.create(roads, method="csr")
+
+        result = ug.getUniqueRoadsSections()
+        self.assertIsInstance(result, GeoDataFrame, "Is a GeoDataFrame")
+        self.assertEqual(3, len(result.columns), "Count columns")
+        self.assertEqual(8, len(result), "Count sections (1)")
+        self.assertAlmostEqual(110, result["distance"].sum(), None,
+                               "Test total length (1)", 1e-6)
+
+        result = ug.getUniqueRoadsSectionsNodes()
+        self.assertEqual(8, len(result), "Count nodes")
+        self.assertEqual([1, 1, 1, 1, 3, 3, 3, 3], sorted(result.valency),
+                         "Test valencies")
+
+        result = ug.getUniqueRoadsSectionsWithoutCulDeSac()
+        self.assertEqual(5, len(result), "Count sections (2)")
+
+        result = ug.getUniqueRoadsSectionsWithoutCulDeSac(iterative=True)
+        self.assertEqual(3, len(result), "Count sections (3)")
+        self.assertAlmostEqual(70, result["distance"].sum(), None,
+                               "Test total length (2)", 1e-6)
+
+    def testConnectedComponents(self):
+        for method in ["networkx", "csr"]:
+            result = UrbanGraphFactory.create(
+                self.roads, method=method).connected_components()
+            self.assertIsInstance(result, GeoDataFrame, "Is a GeoDataFrame")
+            self.assertEqual(8, len(result), "Count rows")
+            self.assertEqual(3, len(result.columns), "Count columns")
+            self.assertEqual(2, result.component.nunique(), "Count components")
+            self.assertEqual(
+                2, result.component.value_counts().min(), "Isolated segment")
+
+    def testMinimumSpanningTree(self):
+        result1 = UrbanGraphFactory.create(
+            self.roads, method="networkx").minimum_spanning_tree()
+        result2 = UrbanGraphFactory.create(
+            self.roads, method="csr").minimum_spanning_tree()
+
+        self.assertEqual(len(result1), len(result2), "Count rows")
+        self.assertEqual(6, len(result2), "Count edges")
+        self.assertAlmostEqual(60, result2.weight.sum(), None,
+                               "Test total weight", 1e-6)
+        for _, row in result2.iterrows():
+            self.assertAlmostEqual(row.geometry.length, row.weight, None,
+                                   "Test weight", 1e-6)
+
+    def testShortestPath(self):
+        ug1 = UrbanGraphFactory.create(self.roads, method="networkx")
+        ug2 = UrbanGraphFactory.create(self.roads, method="csr")
+
+        for fromPoint, toPoint, expected in [
+            (Point(5, -1), Point(15, 11), 22),
+            (Point(5, -1), Point(8, -2), 6),
+            (Point(0, 10), Point(20, 0), 30),
+        ]:
+            result1 = ug1.shortest_path(fromPoint, toPoint)
+            result2 = ug2.shortest_path(fromPoint, toPoint)
+            self.assertAlmostEqual(expected, result1.pathLen.squeeze(), None,
+                                   "Test path length (1)", 1e-6)
+            self.assertAlmostEqual(expected, result2.pathLen.squeeze(), None,
+                                   "Test path length (2)", 1e-6)
+            self.assertAlmostEqual(
+                expected, result2.geometry.length.squeeze(), None,
+                "Test path length (3)", 1e-6)
+
+        result = ug2.shortest_path(Point(5, -1), Point(51, 5))
+        self.assertEqual(0, len(result), "No path")
+
+    def testSampledCentralities(self):
+        ug1 = UrbanGraphFactory.create(self.roads, method="networkx")
+        ug2 = UrbanGraphFactory.create(self.roads, method="csr")
+
+        for label in ["betweenness", "closeness"]:
+            exact = getattr(ug1, f"{label}_centrality")()
+            # All the vertices are pivots
+            result = getattr(ug1, f"{label}_centrality")(ncpus=2)
+            self.assertEqual(5, len(result.columns), "Count columns")
+            for gid, row in result.iterrows():
+                self.assertAlmostEqual(exact.loc[gid, label], row[label], None,
+                                       f"Test {label} (1)", 1e-9)
+                self.assertAlmostEqual(0, row[f"{label}_err"], None,
+                                       f"Test {label} error", 1e-9)
+
+            result = getattr(ug2, f"{label}_centrality")(k=4, seed=0)
+            self.assertEqual(8, len(result), "Count rows")
+            self.assertTrue((0 <= result[f"{label}_err"]).all(),
+                            f"Test {label} error")
+
+            # Radius-limited centrality of the isolated segment
+            result = getattr(ug1, f"{label}_centrality")(radius=5)
+            self.assertEqual(0, result[label].iloc[-1], f"Test {label} (2)")
+
+
+if __name__ == "__main__":
+    # import sys;sys.argv = ['', 'Test.testName']
+    unittest.main()
@@ -24,6 +24,7 @@ import unittest
 
 from geopandas import GeoDataFrame
 from shapely import Polygon
+from shapely import points as to_points
 from t4gpd.commons.ArrayCoding import ArrayCoding
 from t4gpd.commons.grid.HexagonalTilingLib import HexagonalTilingLib
 from t4gpd.demos.GeoDataFrameDemos import GeoDataFrameDemos
@@ -81,6 +82,45 @@ class HexagonalTilingLibTest(unittest.TestCase):
             )
         # self.__plot(result, title="testGrid")
 
+    def testGridWithAxialCoords(self):
+        gridLib = HexagonalTilingLib(self.gdf, dx=10, dy=None, encode=False)
+        result = gridLib.grid(withAxialCoords=True)
+
+        self.assertIsInstance(result, GeoDataFrame, "Is a GeoDataFrame")
+        self.assertEqual(110, len(result), "Count rows")
+        self.assertEqual(5, len(result.columns), "Count columns")
+        self.assertTrue(
+            (result.gid == gridLib.gids(result.q, result.r)).all(),
+            "Test gids(q, r)",
+        )
+        for _, row in result.iterrows():
+            for nghb in row.neighbors6:
+                if -1 < nghb:
+                    nghbGeom = result.loc[result.gid == nghb].geometry.squeeze()
+                    self.assertAlmostEqual(
+                        0.0,
+                        row.geometry.distance(nghbGeom),
+                        msg="Test neighbors6 are adjacent hexagons",
+                    )
+
+    def testHexbin(self):
+        gridLib = HexagonalTilingLib(self.gdf, dx=10, dy=None, encode=True)
+        grid = gridLib.grid()
+        points = GeoDataFrame(
+            {"value": range(len(grid))},
+            geometry=to_points(grid.representative_point().get_coordinates()),
+            crs=self.gdf.crs,
+        )
+        self.assertTrue(
+            (grid.gid.values == gridLib.locate(points)).all(), "Test locate"
+        )
+
+        result = gridLib.hexbin(points, "value", aggfunc="mean")
+        self.assertIsInstance(result, GeoDataFrame, "Is a GeoDataFrame")
+        self.assertEqual(110, len(result), "Count rows")
+        self.assertEqual(5, len(result.columns), "Count columns")
+        self.assertEqual(110, result["count"].sum(), "Test count attribute values")
+
     def testIndoorGrid(self):
         result = HexagonalTilingLib(self.gdf, dx=10, dy=None, encode=True).indoorGrid()
 
@@ -0,0 +1,81 @@
+"""
+Created on 19 Oct. 2026
+
+@author: tleduc
+
+Copyright 2020-2026 Thomas Leduc
+
+This file is part of t4gpd.
+
+t4gpd is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+t4gpd is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with t4gpd.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import unittest
+
+from geopandas import GeoDataFrame
+from numpy import ndarray
+from shapely import box
+from t4gpd.commons.grid.FastGridLib import FastGridLib
+from t4gpd.commons.grid.GridLib import GridLib
+from t4gpd.commons.raster.DistanceTransformLib import DistanceTransformLib
+
+
+class DistanceTransformLibTest(unittest.TestCase):
+    def setUp(self):
+        self.buildings = GeoDataFrame(
+            {"HAUTEUR": [10.0, 20.0, 5.0]},
+            geometry=[box(0, 0, 30, 20), box(50, 10, 70, 50), box(10, 60, 40, 80)],
+            crs="epsg:2154",
+        )
+
+    def tearDown(self):
+        pass
+
+    def testDistance_field(self):
+        dx = 0.5
+        actual_data, actual_profile = DistanceTransformLib.distance_field(
+            self.buildings, dx=dx, withNearest=True
+        )
+        self.assertIsInstance(actual_data, ndarray, "Is a ndarray")
+        self.assertEqual(5, actual_profile.get("count"), "Check raster_profile count")
+        self.assertEqual(
+            (5, actual_profile.get("height"), actual_profile.get("width")),
+            actual_data.shape,
+            "Check raster_data shape",
+        )
+
+        # Between the first two buildings, along y = 15
+        actual = DistanceTransformLib.sample(
+            actual_data, actual_profile, [(40, 15), (15, 10)]
+        )
+        self.assertAlmostEqual(10.0, actual[0, 0], delta=dx, msg="Check distance")
+        self.assertAlmostEqual(0.0, actual[1, 0], delta=0.1, msg="Check grad_x")
+        self.assertAlmostEqual(10.0, actual[0, 1], delta=dx, msg="Check inner distance")
+
+    def testGetDistanceToNearestContour(self):
+        grid = FastGridLib.grid(self.buildings, dx=5, intoPoint=True)
+        grid["gid"] = range(len(grid))
+        expected = GridLib.getDistanceToNearestContour(self.buildings, grid.copy())
+        actual = GridLib.getDistanceToNearestContour(
+            self.buildings, grid.copy(), dx=0.25
+        )
+        self.assertEqual(len(expected), len(actual), "Count rows")
+        expected = expected.set_index("gid").dist_to_ctr
+        actual = actual.set_index("gid").dist_to_ctr.loc[expected.index]
+        self.assertLessEqual((expected - actual).abs().max(), 0.25, "Check distances")
+
+
+if __name__ == "__main__":
+    # import sys;sys.argv = ['', 'Test.testName']
+    unittest.main()
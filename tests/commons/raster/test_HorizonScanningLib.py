@@ -0,0 +1,96 @@
+"""
+Created on 19 Oct. 2026
+
+@author: tleduc
+
+Copyright 2020-2026 Thomas Leduc
+
+This file is part of t4gpd.
+
+t4gpd is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+t4gpd is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with t4gpd.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import unittest
+
+from geopandas import GeoDataFrame
+from numpy import arctan, float32
+from shapely import box
+from t4gpd.commons.SVFLib import SVFLib
+from t4gpd.commons.raster.HorizonScanningLib import HorizonScanningLib
+
+
+class HorizonScanningLibTest(unittest.TestCase):
+    def setUp(self):
+        # An East-West street canyon: H = 10 m, W = 20 m
+        self.buildings = GeoDataFrame(
+            {"HAUTEUR": [10, 10]},
+            geometry=[box(0, 0, 400, 20), box(0, 40, 400, 60)],
+            crs="epsg:2154",
+        )
+        self.dsm, self.profile = HorizonScanningLib.dsm(self.buildings, dx=1.0)
+        self.r, self.c = 30, 200
+
+    def tearDown(self):
+        pass
+
+    def testDsm(self):
+        self.assertEqual((60, 400), self.dsm.shape, "Check DSM shape")
+        self.assertEqual(float32, self.dsm.dtype, "Check DSM dtype")
+        self.assertEqual(10.0, self.dsm.max(), "Check DSM max")
+
+    def testHorizon_angles(self):
+        actual = HorizonScanningLib.horizon_angles(
+            self.dsm, dx=1.0, nRays=4, maxDist=100.0
+        )
+        self.assertEqual((4, 60, 400), actual.shape, "Check angles shape")
+        self.assertAlmostEqual(0.0, actual[0, self.r, self.c], msg="East")
+        self.assertAlmostEqual(
+            arctan(10 / 11), actual[1, self.r, self.c], places=5, msg="North"
+        )
+        self.assertAlmostEqual(0.0, actual[2, self.r, self.c], msg="West")
+        self.assertAlmostEqual(
+            arctan(10 / 10), actual[3, self.r, self.c], places=5, msg="South"
+        )
+
+    def testSvf(self):
+        angles = HorizonScanningLib.horizon_angles(
+            self.dsm, dx=1.0, nRays=64, maxDist=50.0
+        )
+        for method, func in [
+            (1981, SVFLib.svfAngles1981),
+            (2018, SVFLib.svfAngles2018),
+        ]:
+            actual = HorizonScanningLib.svf(
+                self.dsm, dx=1.0, nRays=64, maxDist=50.0, method=method, blocksize=17
+            )
+            self.assertEqual(self.dsm.shape, actual.shape, "Check SVF shape")
+            self.assertAlmostEqual(
+                func(angles[:, self.r, self.c]),
+                actual[self.r, self.c],
+                places=5,
+                msg=f"Check SVF ({method})",
+            )
+
+    def testSunlit(self):
+        # Sun in the North, 45 degrees high
+        actual = HorizonScanningLib.sunlit(self.dsm, dx=1.0, radiationDirection=(0, 1, 1))
+        self.assertFalse(actual[25, self.c], "Shaded by the northern building")
+        self.assertTrue(actual[35, self.c], "Sunlit")
+        actual = HorizonScanningLib.sunlit(self.dsm, dx=1.0, radiationDirection=(0, 1, -1))
+        self.assertFalse(actual.any(), "Sun below the horizon")
+
+
+if __name__ == "__main__":
+    # import sys;sys.argv = ['', 'Test.testName']
+    unittest.main()
@@ -86,6 +86,34 @@ class RasterLibTest(unittest.TestCase):
         plt.savefig(f"/tmp/RasterLibTest.{title}.png", bbox_inches="tight")
         plt.close(fig)
 
+    def testApplyByBlock(self):
+        raster_data, raster_profile = RasterLib.rasterize(
+            self.buildings,
+            dx=1,
+            attr="HAUTEUR",
+            roi=None,
+            ndv=0,
+        )
+        memraster = RasterLib.raster_data_profile_2_memory_raster(
+            raster_data, raster_profile
+        )
+        with memraster.open() as dataset:
+            actual = RasterLib.apply_by_block(
+                dataset, lambda block, _: 2 * block, blocksize=16
+            )
+        self.assertEqual(raster_data.shape, actual.shape, "Check output shape")
+        self.assertEqual(
+            raster_profile.get("transform"), actual.transform, "Check transform"
+        )
+        self.assertTrue((2 * raster_data == actual.read(1)).all(), "Check values")
+
+    def testBlockWindows(self):
+        windows = list(RasterLib.block_windows(10, 7, blocksize=4))
+        self.assertEqual(6, len(windows), "Check number of windows")
+        self.assertEqual(
+            70, sum([w.height * w.width for w in windows]), "Check covered area"
+        )
+
     def testFastRasterize(self):
         actual_data, actual_profile = RasterLib.fast_rasterize(
             self.buildings,
@@ -153,6 +181,17 @@ class RasterLibTest(unittest.TestCase):
         )
         self.__plot(actual_data, actual_profile, title="testRasterize")
 
+    def testRasterizeTiledMode(self):
+        expected_data, expected_profile = RasterLib.rasterize(
+            self.buildings, dx=1, attr="HAUTEUR", roi=None, ndv=0
+        )
+        actual_data, actual_profile = RasterLib.rasterize(
+            self.buildings, dx=1, attr="HAUTEUR", roi=None, ndv=0, tilesize=32, ncpus=2
+        )
+        self.__common_tests(actual_data, actual_profile)
+        self.assertEqual(expected_profile, actual_profile, "Check raster_profile")
+        self.assertTrue((expected_data == actual_data).all(), "Check raster_data")
+
 
 if __name__ == "__main__":
     # import sys;sys.argv = ['', 'Test.testName']
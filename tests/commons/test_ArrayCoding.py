@@ -21,7 +21,8 @@ You should have received a copy of the GNU General Public License
 along with t4gpd.  If not, see <https://www.gnu.org/licenses/>.
 '''
 import unittest
-from numpy import array, nan
+from numpy import array, nan, pi
+from numpy.testing import assert_allclose, assert_array_equal
 from geopandas import GeoDataFrame
 from pandas import isna
 from shapely import Point
@@ -73,6 +74,56 @@ class ArrayCodingTest(unittest.TestCase):
                         "Test encode + decode")
         print(f"{expected}\n\n{actual}")
 
+    def testEncodeDecodeColumn(self):
+        values = [[0.0, 1.5, 3.0], None, [-1.0, 0.25, 10.0], nan]
+        expected = [[0.0, 1.5, 3.0], [nan] * 3, [-1.0, 0.25, 10.0], [nan] * 3]
+
+        encoded = ArrayCoding.encodeColumn(values)
+        self.assertEqual("AAAAAAAAwD8AAEBA", encoded[0], "Test base64 float32")
+        self.assertTrue(isna(encoded[1]) and isna(encoded[3]), "Test missing rows")
+        assert_array_equal(expected, ArrayCoding.decodeColumn(encoded))
+
+        encoded = ArrayCoding.encodeColumn(values, dtype="float64", raw=True)
+        self.assertEqual(24, len(encoded[0]), "Test raw float64")
+        actual = ArrayCoding.decodeColumn(encoded, dtype="float64")
+        assert_array_equal(expected, actual)
+
+        flags = ArrayCoding.encodeColumn(array([[1, 0, 1], [0, 0, 1]]), dtype="uint8")
+        self.assertEqual(["AQAB", "AAAB"], list(flags), "Test base64 uint8")
+        actual = ArrayCoding.decodeColumn(flags, dtype="uint8")
+        assert_array_equal([[1, 0, 1], [0, 0, 1]], actual)
+
+    def testEncodeDecodeColumnWithQuantization(self):
+        angles = array([[0.0, pi / 4, pi / 2], [0.1, nan, 1.0]])
+        encoded = ArrayCoding.encodeColumn(angles, dtype="uint16", vmin=0, vmax=pi / 2)
+        self.assertEqual(8, len(encoded[0]), "Test base64 uint16")
+        actual = ArrayCoding.decodeColumn(encoded, dtype="uint16", vmin=0, vmax=pi / 2)
+        assert_allclose(angles, actual, atol=pi / 2 / 65534)
+
+        actual = ArrayCoding.decodeColumn(
+            ArrayCoding.encodeColumn(angles, dtype="uint8", vmin=0, vmax=pi / 2),
+            dtype="uint8",
+            vmin=0,
+            vmax=pi / 2,
+        )
+        assert_allclose(angles, actual, atol=pi / 2 / 254)
+
+        with self.assertRaises(Exception):
+            ArrayCoding.encodeColumn(angles, dtype="float32", vmin=0, vmax=pi / 2)
+        with self.assertRaises(Exception):
+            ArrayCoding.encodeColumn([[0.0], [1.0, 2.0]])
+
+    def testDecodeJoinedColumn(self):
+        actual = ArrayCoding.decodeJoinedColumn(["123#12.3", None, "1#2"])
+        assert_array_equal([[123, 12.3], [nan, nan], [1, 2]], actual)
+
+        actual = ArrayCoding.decodeJoinedColumn(["1:2", "3:4"], int, separator=":")
+        self.assertEqual(int, actual.dtype, "Test decode int")
+        assert_array_equal([[1, 2], [3, 4]], actual)
+
+        with self.assertRaises(Exception):
+            ArrayCoding.decodeJoinedColumn(["1#2", "3"])
+
 
 if __name__ == "__main__":
     # import sys;sys.argv = ['', 'Test.testName']
@@ -0,0 +1,66 @@
+'''
+Created on 19 Oct. 2026
+
+@author: tleduc
+
+Copyright 2020-2026 Thomas Leduc
+
+This file is part of t4gpd.
+
+t4gpd is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+t4gpd is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with t4gpd.  If not, see <https://www.gnu.org/licenses/>.
+'''
+import unittest
+
+from geopandas import GeoDataFrame
+from numpy import arange
+from shapely import Point, box
+from t4gpd.commons.Checksum import Checksum
+
+
+class ChecksumTest(unittest.TestCase):
+
+    def setUp(self):
+        self.gdf = GeoDataFrame({'gid': [1, 2], 'angles': [[0.0, 1.0], [2.0]]},
+                                geometry=[box(0, 0, 1, 1), Point(2, 2)], crs='epsg:2154')
+
+    def tearDown(self):
+        pass
+
+    def testMd5Of(self):
+        expected = Checksum.md5Of(self.gdf, nRays=64)
+
+        self.assertEqual(32, len(expected), 'Test hexdigest')
+        self.assertEqual(expected, Checksum.md5Of(self.gdf.copy(), nRays=64), 'Test same content')
+        self.assertNotEqual(expected, Checksum.md5Of(self.gdf, nRays=32), 'Test parameters')
+        self.assertNotEqual(expected, Checksum.md5Of(self.gdf, rayLength=64), 'Test parameter names')
+        self.assertNotEqual(expected, Checksum.md5Of(self.gdf.to_crs('epsg:4326'), nRays=64), 'Test crs')
+        self.assertNotEqual(expected, Checksum.md5Of(self.gdf.translate(1e-9), nRays=64), 'Test geometries')
+        self.assertNotEqual(expected, Checksum.md5Of(self.gdf.assign(gid=[1, 3]), nRays=64), 'Test attributes')
+        self.assertNotEqual(Checksum.md5Of(arange(3)), Checksum.md5Of([0, 1, 2]), 'Test types')
+        self.assertEqual(Checksum.md5Of(a=1, b=2), Checksum.md5Of(b=2, a=1), 'Test keyword order')
+
+    def testFingerprint(self):
+        expected = Checksum.fingerprint(self.gdf)
+
+        self.assertEqual(32, len(expected), 'Test hexdigest')
+        self.assertEqual(expected, Checksum.fingerprint(self.gdf.set_index('gid')), 'Test index is ignored')
+        self.assertEqual(expected, Checksum.fingerprint(self.gdf.assign(gid=[3, 4])), 'Test other columns')
+        self.assertNotEqual(expected, Checksum.fingerprint(self.gdf, ['gid']), 'Test relevant columns')
+        self.assertNotEqual(expected, Checksum.fingerprint(self.gdf.iloc[::-1]), 'Test geometries order')
+        self.assertEqual(expected, Checksum.fingerprint(self.gdf.geometry), 'Test GeoSeries')
+
+
+if __name__ == "__main__":
+    # import sys;sys.argv = ['', 'Test.testName']
+    unittest.main()
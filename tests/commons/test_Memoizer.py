@@ -0,0 +1,76 @@
+'''
+Created on 19 Oct. 2026
+
+@author: tleduc
+
+Copyright 2020-2026 Thomas Leduc
+
+This file is part of t4gpd.
+
+t4gpd is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+t4gpd is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with t4gpd.  If not, see <https://www.gnu.org/licenses/>.
+'''
+import unittest
+
+from numpy import zeros
+from t4gpd.commons.Memoizer import Memoizer
+
+
+class MemoizerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.memo = Memoizer(maxsize=2500)
+        self.calls = []
+
+    def tearDown(self):
+        pass
+
+    def __factory(self, n):
+        def factory():
+            self.calls.append(n)
+            return zeros(n, dtype='uint8')
+        return factory
+
+    def testGet(self):
+        first = self.memo.get('a', self.__factory(1000))
+        self.assertIs(first, self.memo.get('a', self.__factory(1000)), 'Test memoized value')
+        self.assertEqual([1000], self.calls, 'Test single computation')
+        self.assertEqual((1, 1), (self.memo.hits, self.memo.misses), 'Test hits and misses')
+        self.assertIsNone(self.memo.get('b'), 'Test lookup only')
+
+    def testSizeBasedEviction(self):
+        self.memo.get('a', self.__factory(1000))
+        self.memo.get('b', self.__factory(1000))
+        # 'a' becomes the most recently used entry
+        self.memo.get('a')
+        self.memo.get('c', self.__factory(1000))
+
+        self.assertEqual(2000, self.memo.nbytes, 'Test total size')
+        self.assertNotIn('b', self.memo, 'Test LRU entry is evicted')
+        self.assertIn('a', self.memo, 'Test recently used entry')
+        self.assertIn('c', self.memo, 'Test new entry')
+
+        self.memo.get('d', self.__factory(3000))
+        self.assertNotIn('d', self.memo, 'Test too large value is not memoized')
+        self.assertEqual(2, len(self.memo), 'Count entries')
+
+        self.memo.clear()
+        self.assertEqual((0, 0), (len(self.memo), self.memo.nbytes), 'Test clear')
+
+    def testShared(self):
+        self.assertIs(Memoizer.shared(), Memoizer.shared(), 'Test shared memo')
+
+
+if __name__ == "__main__":
+    # import sys;sys.argv = ['', 'Test.testName']
+    unittest.main()
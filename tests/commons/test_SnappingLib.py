@@ -0,0 +1,92 @@
+"""
+Created on 19 Oct. 2026
+
+@author: tleduc
+
+Copyright 2020-2026 Thomas Leduc
+
+This file is part of t4gpd.
+
+t4gpd is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+t4gpd is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with t4gpd.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import unittest
+
+import numpy as np
+from shapely import LineString, MultiLineString, Point, points
+from t4gpd.commons.SnappingLib import SnappingLib
+
+
+class SnappingLibTest(unittest.TestCase):
+
+    def setUp(self):
+        self.lines = [
+            LineString([(0, 0), (10, 0), (10, 10)]),
+            MultiLineString([[(20, 0), (30, 0)], [(30, 10), (20, 10)]]),
+        ]
+
+    def tearDown(self):
+        pass
+
+    def testSegments(self):
+        segments, lineIds, offsets = SnappingLib.segments(self.lines)
+        self.assertEqual((4, 2, 2), segments.shape, "Test segments shape")
+        self.assertEqual([0, 0, 1, 1], lineIds.tolist(), "Test line ids")
+        self.assertEqual([0, 10, 0, 10], offsets.tolist(), "Test offsets")
+
+    def testSnap(self):
+        pts = [Point(5, 2), Point(12, 7), Point(25, 9), Point(50, 50)]
+        lineIds, abscissae, snapped, distances = SnappingLib.snap(
+            pts, self.lines, maxDist=10.0
+        )
+        self.assertEqual([0, 0, 1, -1], lineIds.tolist(), "Test line ids")
+        np.testing.assert_allclose(
+            [5, 17, 15], abscissae[:3], err_msg="Test abscissae"
+        )
+        self.assertTrue(np.isnan(abscissae[3]), "Test abscissa (not snapped)")
+        np.testing.assert_allclose(
+            [2, 2, 1], distances[:3], err_msg="Test distances"
+        )
+        self.assertTrue(
+            snapped[1].equals(Point(10, 7)), "Test snapped point"
+        )
+        self.assertIsNone(snapped[3], "Test snapped point (not snapped)")
+
+    def testSnapAgainstProject(self):
+        rng = np.random.default_rng(0)
+        lines = [LineString(rng.uniform(0, 100, (10, 2))) for _ in range(10)]
+        pts = points(rng.uniform(0, 100, (500, 2)))
+        lineIds, abscissae, snapped, distances = SnappingLib.snap(pts, lines)
+
+        expected = np.array([min(p.distance(l) for l in lines) for p in pts])
+        np.testing.assert_allclose(expected, distances, err_msg="Test distances")
+        for lineId, absc, pt in zip(lineIds, abscissae, snapped):
+            self.assertAlmostEqual(
+                0.0, lines[lineId].distance(pt), None, "Test snapped point", 1e-9
+            )
+            self.assertTrue(
+                pt.equals_exact(lines[lineId].interpolate(absc), 1e-9),
+                "Test abscissa",
+            )
+
+    def testInterpolate(self):
+        actual = SnappingLib.interpolate(self.lines, [0, 1, -1], [15, 12, 3])
+        self.assertTrue(actual[0].equals(Point(10, 5)), "Test interpolate (1)")
+        self.assertTrue(actual[1].equals(Point(28, 10)), "Test interpolate (2)")
+        self.assertIsNone(actual[2], "Test interpolate (3)")
+
+
+if __name__ == "__main__":
+    # import sys;sys.argv = ['', 'Test.testName']
+    unittest.main()
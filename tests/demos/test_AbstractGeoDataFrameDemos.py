@@ -0,0 +1,77 @@
+'''
+Created on 19 Oct. 2026
+
+@author: tleduc
+
+Copyright 2020-2026 Thomas Leduc
+
+This file is part of t4gpd.
+
+t4gpd is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+t4gpd is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with t4gpd.  If not, see <https://www.gnu.org/licenses/>.
+'''
+import unittest
+
+from glob import glob
+from os import path
+from geopandas import GeoDataFrame
+from t4gpd.demos.AbstractGeoDataFrameDemos import AbstractGeoDataFrameDemos
+from t4gpd.demos.GeoDataFrameDemos5 import GeoDataFrameDemos5
+from t4gpd.demos.GeoDataFrameDemosD import GeoDataFrameDemosD
+
+
+class AbstractGeoDataFrameDemosTest(unittest.TestCase):
+
+    def setUp(self):
+        pass
+
+    def tearDown(self):
+        pass
+
+    def testDataset(self):
+        sio1 = AbstractGeoDataFrameDemos._dataset(
+            "GeoDataFrameDemosD", "villeDeRennes.csv"
+        )
+        sio2 = AbstractGeoDataFrameDemos._dataset(
+            "GeoDataFrameDemosD", "villeDeRennes.csv"
+        )
+        self.assertIsNot(sio1, sio2, "Test fresh StringIO")
+        self.assertEqual(sio1.getvalue(), sio2.getvalue(), "Test same content")
+        self.assertTrue(sio1.read().startswith("ID;INSEE_COM;"), "Test content")
+
+        with self.assertRaises(FileNotFoundError):
+            AbstractGeoDataFrameDemos._dataset("GeoDataFrameDemosD", "unknown.csv")
+
+    def testAllDatasets(self):
+        datadir = path.join(path.dirname(__file__), "../../t4gpd/demos/data")
+        ifiles = glob(path.join(datadir, "*/*.xz"))
+        self.assertEqual(62, len(ifiles), "Count datasets")
+        for ifile in ifiles:
+            module = path.basename(path.dirname(ifile))
+            filename = path.basename(ifile)[:-3]
+            sio = AbstractGeoDataFrameDemos._dataset(module, filename)
+            self.assertLess(0, len(sio.getvalue()), f"Test {module}/{filename}")
+
+    def testDemos(self):
+        actual = GeoDataFrameDemos5.cirSceneMasque1()
+        self.assertIsInstance(actual, GeoDataFrame, "Test is a GeoDataFrame (1)")
+        self.assertEqual(370, len(actual), "Test count rows (1)")
+
+        actual = GeoDataFrameDemosD.villeDeRennes()
+        self.assertIsInstance(actual, GeoDataFrame, "Test is a GeoDataFrame (2)")
+        self.assertEqual(1, len(actual), "Test count rows (2)")
+
+
+if __name__ == "__main__":
+    # import sys;sys.argv = ['', 'Test.testName']
+    unittest.main()
@@ -63,6 +63,21 @@ class STBetweennessCentralityTest(unittest.TestCase):
                             "betweenness attribute values")
         # self.__plot(result)
 
+    def testRunSampled(self):
+        exact = STBetweennessCentrality(self.roads).run()
+        result = STBetweennessCentrality(
+            self.roads, k=8, seed=0, ncpus=2).run()
+        self.assertIsInstance(result, GeoDataFrame, "Is a GeoDataFrame")
+        self.assertEqual(16, len(result), "Count rows")
+        self.assertEqual(5, len(result.columns), "Count columns")
+
+        for gid, row in result.iterrows():
+            self.assertTrue(0 <= row["betweenness_err"],
+                            "betweenness_err attribute values")
+            self.assertAlmostEqual(
+                exact.loc[gid, "betweenness"], row["betweenness"], None,
+                "Test estimated betweenness", 4 * row["betweenness_err"] + 0.1)
+
 
 if __name__ == "__main__":
     # import sys;sys.argv = ['', 'Test.testName']
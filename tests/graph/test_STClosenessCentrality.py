@@ -63,6 +63,21 @@ class STClosenessCentralityTest(unittest.TestCase):
                             "closeness attribute values")
         # self.__plot(result)
 
+    def testRunSampled(self):
+        exact = STClosenessCentrality(self.roads).run()
+        result = STClosenessCentrality(
+            self.roads, k=8, seed=0, ncpus=2).run()
+        self.assertIsInstance(result, GeoDataFrame, "Is a GeoDataFrame")
+        self.assertEqual(16, len(result), "Count rows")
+        self.assertEqual(5, len(result.columns), "Count columns")
+
+        for gid, row in result.iterrows():
+            self.assertTrue(0 <= row["closeness_err"],
+                            "closeness_err attribute values")
+            self.assertAlmostEqual(
+                exact.loc[gid, "closeness"], row["closeness"], None,
+                "Test estimated closeness", 4 * row["closeness_err"] + 0.1)
+
 
 if __name__ == "__main__":
     # import sys;sys.argv = ['', 'Test.testName']
@@ -69,6 +69,15 @@ class STMinimumSpanningTreeTest(unittest.TestCase):
 
         # self.__plot(result)
 
+    def testRunWithCsr(self):
+        result1 = STMinimumSpanningTree(self.roads).run()
+        result2 = STMinimumSpanningTree(self.roads, method="csr").run()
+        self.assertIsInstance(result2, GeoDataFrame, "Is a GeoDataFrame")
+        self.assertEqual(15, len(result2), "Count rows")
+        self.assertEqual(4, len(result2.columns), "Count columns")
+        self.assertAlmostEqual(result1.weight.sum(), result2.weight.sum(),
+                               None, "Check total weight", 1e-6)
+
 
 if __name__ == "__main__":
     # import sys;sys.argv = ['', 'Test.testName']
@@ -73,6 +73,20 @@ class STRoadNeighborhoodTest(unittest.TestCase):
                                  "Test attribute value (3)")
         # self.__plot(result)
 
+    def testRunInParallel(self):
+        result1 = STRoadNeighborhood(
+            self.roads, self.fromPointsAndMaxDists, "maxDist").run()
+        result2 = STRoadNeighborhood(
+            self.roads, self.fromPointsAndMaxDists, "maxDist", ncpus=2).run()
+
+        self.assertIsInstance(result2, GeoDataFrame, "Is a GeoDataFrame")
+        self.assertEqual(2, len(result2), "Count rows")
+        self.assertEqual(4, len(result2.columns), "Count columns")
+        for gid in range(2):
+            self.assertTrue(
+                result1.geometry[gid].equals(result2.geometry[gid]),
+                "Test geometry")
+
 
 if __name__ == "__main__":
     # import sys;sys.argv = ['', 'Test.testName']
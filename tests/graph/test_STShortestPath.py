@@ -155,6 +155,19 @@ class STShortestPathTest(unittest.TestCase):
                                  row.geometry.length, "Test path length (2)")
         # self.__plot(result)
 
+    def testRun6(self):
+        # Both points are snapped onto the same road segment
+        fromPoint, toPoint = Point((1.2, -1)), Point((3.5, -1))
+        result = STShortestPath(self.roads, fromPoint, toPoint).run()
+
+        self.assertIsInstance(result, GeoDataFrame, "Is a GeoDataFrame")
+        self.assertEqual(1, len(result), "Count rows")
+        self.assertAlmostEqual(4.3, result.pathLen.squeeze(), None,
+                               "Test path length", 1e-6)
+        self.assertEqual(4, len(result.geometry.squeeze().coords),
+                         "Test path vertices")
+        # self.__plot(result)
+
 
 if __name__ == "__main__":
     # import sys;sys.argv = ['', 'Test.testName']
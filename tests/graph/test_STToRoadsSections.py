@@ -81,6 +81,19 @@ class STToRoadsSectionsTest(unittest.TestCase):
         # self.__plot(result)
         # result.to_file("/tmp/xxx.shp")
 
+    def testRunWithoutCulDeSacIterative(self):
+        result = STToRoadsSections(
+            self.roads, withoutCulDeSac=True, iterative=True).run()
+        self.assertIsInstance(result, GeoDataFrame, "Is a GeoDataFrame")
+        # Once the cul-de-sac is pruned, the two sections it was hung on merge
+        self.assertEqual(9, len(result), "Count rows")
+        self.assertEqual(3, len(result.columns), "Count columns")
+
+        for _, row in result.iterrows():
+            self.assertIsInstance(row.geometry, LineString,
+                                  "Is a GeoDataFrame of LineStrings")
+        # self.__plot(result)
+
 
 if __name__ == "__main__":
     # import sys;sys.argv = ['', 'Test.testName']
@@ -0,0 +1,185 @@
+'''
+Created on 19 Oct. 2026
+
+@author: tleduc
+
+Copyright 2020-2026 Thomas Leduc
+
+This file is part of t4gpd.
+
+t4gpd is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+t4gpd is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with t4gpd.  If not, see <https://www.gnu.org/licenses/>.
+'''
+from io import StringIO
+from os.path import join
+from tempfile import TemporaryDirectory
+import unittest
+
+from geopandas.geodataframe import GeoDataFrame
+from numpy import asfortranarray, concatenate, float32, nan
+from numpy.testing import assert_array_equal
+from shapely import MultiPolygon
+from t4gpd.io.CirValLib import CirValLib
+from t4gpd.io.CirValReader import CirValReader
+from t4gpd.io.CirWriter import CirWriter
+
+
+class CirValLibTest(unittest.TestCase):
+
+    def setUp(self):
+        self.cir = '''2 2
+0 10 0 10 0 0 0 0 0 0
+f1 2
+0 0 1
+c0
+5
+0 0 0
+4 0 0
+4 4 0
+0 4 0
+0 0 0
+c1
+5
+10 0 0
+14 0 0
+14 4 0
+10 4 0
+10 0 0
+t
+4
+11 1 0
+12 1 0
+12 2 0
+11 1 0
+f2 1
+0 0 1
+c0
+4
+0 10 0
+1 10 0
+0 11 0
+0 10 0
+'''
+        self.val1 = '''2 2
+0.5 3.0
+f1 2
+0.5
+1.5
+f2 1
+3.0
+'''
+        self.val2 = '''2 2
+-1 1
+f2 1
+1
+f1 2
+-1
+0
+'''
+
+    def tearDown(self):
+        pass
+
+    def testReadCir(self):
+        result = CirValLib.readCir(StringIO(self.cir))
+
+        self.assertIsInstance(result, GeoDataFrame, 'Is a GeoDataFrame')
+        self.assertEqual(['1#0', '1#1', '2'], result.cir_id.to_list(), 'Test cir_id')
+        self.assertEqual([16.0, 15.5, 0.5], result.area.to_list(), 'Test areas')
+        self.assertEqual([0, 1, 0], [len(g.interiors) for g in result.geometry], 'Test holes')
+        self.assertTrue(all(result.geometry.has_z), 'Is a GeoDataFrame of 3D Polygons')
+
+    def testIterCir(self):
+        chunks = list(CirValLib.iterCir(StringIO(self.cir), chunksize=1))
+        self.assertEqual(2, len(chunks), 'Count chunks')
+        self.assertEqual(['1#0', '1#1'], chunks[0].cir_id.to_list(), 'Test chunk (1)')
+        self.assertEqual(['2'], chunks[1].cir_id.to_list(), 'Test chunk (2)')
+
+    def testWriteCir(self):
+        expected = CirValLib.readCir(StringIO(self.cir))
+        faces = GeoDataFrame(geometry=[MultiPolygon(expected.geometry[:2].to_list()), expected.geometry[2]])
+        with TemporaryDirectory() as dirName:
+            outputFile = join(dirName, 'scene.cir')
+            CirWriter(faces, outputFile, chunksize=1).run()
+            with open(outputFile, 'r', newline='') as f:
+                content = f.read()
+            result = CirValLib.readCir(outputFile)
+
+        self.assertTrue(content.startswith('2\t2\r\n'), 'Test header')
+        self.assertIn('f1 2\r\n', content, 'Test first face')
+        self.assertIn('\t1\r\nc0\r\n5\r\n\t0\t0\t0\r\n', content, 'Test normal vector and first contour')
+        self.assertEqual(expected.cir_id.to_list(), result.cir_id.to_list(), 'Test cir_id')
+        self.assertTrue(result.geom_equals_exact(expected, 0).all(), 'Test round trip')
+
+    def testReadVal(self):
+        cirIds, values = CirValLib.readVal(StringIO(self.val1))
+        assert_array_equal(['1#0', '1#1', '2'], cirIds, 'Test cir_id')
+        assert_array_equal([0.5, 1.5, 3.0], values, 'Test values')
+
+        chunks = list(CirValLib.iterVal(StringIO(self.val1), chunksize=1))
+        self.assertEqual(2, len(chunks), 'Count chunks')
+        assert_array_equal(values, concatenate([v for _, v in chunks]), 'Test iterVal')
+
+    def testCirValReader(self):
+        with TemporaryDirectory() as dirName:
+            filenames = []
+            for basename, content in [('scene.cir', self.cir), ('flux1.val', self.val1),
+                                      ('flux2.val', self.val2)]:
+                filenames.append(join(dirName, basename))
+                with open(filenames[-1], 'w') as f:
+                    f.write(content)
+            result = CirValReader(*filenames).run()
+
+        self.assertIsInstance(result, GeoDataFrame, 'Is a GeoDataFrame')
+        self.assertEqual(['cir_id', 'geometry', 'flux1', 'flux2'], list(result.columns), 'Test columns')
+        self.assertEqual([0.5, 1.5, 3.0], result.flux1.to_list(), 'Test flux1 values')
+        self.assertEqual([-1.0, 0.0, 1.0], result.flux2.to_list(), 'Test flux2 values (joined by cir_id)')
+
+    def testAggregations(self):
+        matrix = asfortranarray([[1, 2, 3, 4], [0, nan, 10, 20]], dtype=float32)
+
+        assert_array_equal([2.5, 10.0], CirValLib.aggregate(matrix, 'mean', chunksize=3), 'Test mean')
+        assert_array_equal([10.0, 30.0], CirValLib.aggregate(matrix, 'sum'), 'Test sum')
+        assert_array_equal([1.0, 0.0], CirValLib.aggregate(matrix, 'min', chunksize=1), 'Test min')
+        assert_array_equal([4.0, 20.0], CirValLib.aggregate(matrix, 'max'), 'Test max')
+        assert_array_equal([0.5, 1.0], CirValLib.hoursAbove(matrix, 3.5, stepDuration=0.5, chunksize=2),
+                           'Test hoursAbove')
+
+    def testValMatrixStorage(self):
+        refIds = ['1#0', '1#1', '2']
+        with TemporaryDirectory() as dirName:
+            filenames = []
+            for basename, content in [('flux1.val', self.val1), ('flux2.val', self.val2)]:
+                filenames.append(join(dirName, basename))
+                with open(filenames[-1], 'w') as f:
+                    f.write(content)
+
+            npyFile = join(dirName, 'flux.npy')
+            matrix = CirValLib.readValMatrix(refIds, filenames, npyFile)
+            del matrix
+            matrix = CirValLib.loadValMatrix(npyFile)
+            self.assertEqual((3, 2), matrix.shape, 'Test matrix shape')
+            self.assertTrue(matrix.flags.f_contiguous, 'Test contiguous steps')
+            assert_array_equal([[0.5, -1], [1.5, 0], [3, 1]], matrix, 'Test npy matrix')
+
+            parquetFile = join(dirName, 'flux.parquet')
+            CirValLib.writeParquet(matrix, ['flux1', 'flux2'], parquetFile)
+            actual, fieldnames = CirValLib.readParquet(parquetFile, ['flux2'])
+            self.assertEqual(['flux2'], fieldnames, 'Test parquet columns')
+            assert_array_equal([[-1], [0], [1]], actual, 'Test parquet matrix')
+            del matrix
+
+
+if __name__ == "__main__":
+    # import sys;sys.argv = ['', 'Test.testName']
+    unittest.main()
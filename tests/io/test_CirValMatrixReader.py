@@ -0,0 +1,76 @@
+'''
+Created on 19 Oct. 2026
+
+@author: tleduc
+
+Copyright 2020-2026 Thomas Leduc
+
+This file is part of t4gpd.
+
+t4gpd is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+t4gpd is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with t4gpd.  If not, see <https://www.gnu.org/licenses/>.
+'''
+from os.path import join
+from tempfile import TemporaryDirectory
+import unittest
+
+from geopandas.geodataframe import GeoDataFrame
+from numpy import float32
+from numpy.testing import assert_array_equal
+from t4gpd.io.CirValMatrixReader import CirValMatrixReader
+from t4gpd.io.CirValReader import CirValReader
+
+
+class CirValMatrixReaderTest(unittest.TestCase):
+
+    def setUp(self):
+        self.dirName = TemporaryDirectory()
+        self.cirFilename = join(self.dirName.name, 'scene.cir')
+        with open(self.cirFilename, 'w') as f:
+            f.write('2 2\n0 1 0 1 0 1 0 0 0 0\n')
+            for faceNumber in (1, 2):
+                f.write(f'f{faceNumber} 1\n0 0 1\nc0\n4\n0 0 {faceNumber}\n1 0 {faceNumber}\n0 1 {faceNumber}\n0 0 {faceNumber}\n')
+
+        self.valFilenames = []
+        for step in range(5):
+            self.valFilenames.append(join(self.dirName.name, f'step_{step}.val'))
+            with open(self.valFilenames[-1], 'w') as f:
+                f.write(f'2 2\n{step} {10 * step}\nf1 1\n{step}\nf2 1\n{10 * step}\n')
+
+    def tearDown(self):
+        self.dirName.cleanup()
+
+    def testRun(self):
+        gdf, matrix, fieldnames = CirValMatrixReader(self.cirFilename, *self.valFilenames).run()
+
+        self.assertIsInstance(gdf, GeoDataFrame, 'Is a GeoDataFrame')
+        self.assertEqual(['cir_id', 'geometry'], list(gdf.columns), 'Test columns')
+        self.assertEqual((2, 5), matrix.shape, 'Test matrix shape')
+        self.assertEqual(float32, matrix.dtype, 'Test matrix dtype')
+        self.assertEqual([f'step_{step}' for step in range(5)], fieldnames, 'Test fieldnames')
+
+        expected = CirValReader(self.cirFilename, *self.valFilenames).run()
+        assert_array_equal(expected[fieldnames].to_numpy(), matrix, 'Test matrix values')
+
+    def testRunMemoryMapped(self):
+        outputFile = join(self.dirName.name, 'steps.npy')
+        _, matrix, _ = CirValMatrixReader(
+            self.cirFilename, *self.valFilenames, outputFile=outputFile).run()
+
+        assert_array_equal([[0, 1, 2, 3, 4], [0, 10, 20, 30, 40]], matrix, 'Test matrix values')
+        del matrix
+
+
+if __name__ == "__main__":
+    # import sys;sys.argv = ['', 'Test.testName']
+    unittest.main()
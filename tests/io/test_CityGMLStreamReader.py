@@ -0,0 +1,120 @@
+'''
+Created on 19 Oct. 2026
+
+@author: tleduc
+
+Copyright 2020-2026 Thomas Leduc
+
+This file is part of t4gpd.
+
+t4gpd is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+t4gpd is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with t4gpd.  If not, see <https://www.gnu.org/licenses/>.
+'''
+from io import BytesIO
+from os.path import join
+from tempfile import TemporaryDirectory
+import unittest
+
+from geopandas.geodataframe import GeoDataFrame
+from shapely.geometry import Polygon
+from t4gpd.io.CityGMLStreamReader import CityGMLStreamReader
+
+
+class CityGMLStreamReaderTest(unittest.TestCase):
+
+    def __building(self, gid, x0):
+        def _surface(name, sid, coords):
+            posList = ' '.join(f'{x} {y} {z}' for x, y, z in coords)
+            return f'''
+      <bldg:boundedBy>
+        <bldg:{name} gml:id="{sid}">
+          <bldg:lod2MultiSurface><gml:MultiSurface><gml:surfaceMember>
+            <gml:Polygon gml:id="{sid}_poly">
+              <gml:exterior><gml:LinearRing>
+                <gml:posList srsDimension="3">{posList}</gml:posList>
+              </gml:LinearRing></gml:exterior>
+            </gml:Polygon>
+          </gml:surfaceMember></gml:MultiSurface></bldg:lod2MultiSurface>
+        </bldg:{name}>
+      </bldg:boundedBy>'''
+
+        x1 = x0 + 10
+        return f'''
+  <core:cityObjectMember>
+    <bldg:Building gml:id="{gid}">
+      <gml:boundedBy><gml:Envelope srsDimension="3">
+        <gml:lowerCorner>{x0} 0 0</gml:lowerCorner>
+        <gml:upperCorner>{x1} 10 5</gml:upperCorner>
+      </gml:Envelope></gml:boundedBy>''' + \
+            _surface('GroundSurface', f'{gid}_ground', [(x0, 0, 0), (x0, 10, 0), (x1, 10, 0), (x1, 0, 0), (x0, 0, 0)]) + \
+            _surface('RoofSurface', f'{gid}_roof', [(x0, 0, 5), (x1, 0, 5), (x1, 10, 5), (x0, 10, 5), (x0, 0, 5)]) + \
+            _surface('WallSurface', f'{gid}_wall', [(x0, 0, 0), (x1, 0, 0), (x1, 0, 5), (x0, 0, 5), (x0, 0, 0)]) + '''
+    </bldg:Building>
+  </core:cityObjectMember>'''
+
+    def setUp(self):
+        self.content = ('''<?xml version="1.0" encoding="UTF-8"?>
+<core:CityModel xmlns:core="http://www.opengis.net/citygml/2.0"
+  xmlns:bldg="http://www.opengis.net/citygml/building/2.0"
+  xmlns:gml="http://www.opengis.net/gml">''' +
+            ''.join(self.__building(f'BLD_{i}', 20 * i) for i in range(5)) + '''
+</core:CityModel>
+''').encode()
+        self.dirName = TemporaryDirectory()
+        self.inputFile = join(self.dirName.name, 'district.gml')
+        with open(self.inputFile, 'wb') as f:
+            f.write(self.content)
+
+    def tearDown(self):
+        self.dirName.cleanup()
+
+    def testRun(self):
+        result = CityGMLStreamReader(self.inputFile, srcEpsgCode='EPSG:2154').run()
+
+        self.assertIsInstance(result, GeoDataFrame, 'Is a GeoDataFrame')
+        self.assertEqual(15, len(result), 'Count rows')
+        self.assertEqual(CityGMLStreamReader.FIELDNAMES, list(result.columns), 'Test columns')
+        self.assertEqual('EPSG:2154', result.crs, 'Test crs')
+        self.assertEqual({'Building'}, set(result['type']), 'Test type')
+        self.assertEqual('BLD_0', result.objectId[0], 'Test objectId')
+        self.assertEqual(['GroundSurface', 'RoofSurface', 'WallSurface'],
+                         result.subType[:3].to_list(), 'Test subType')
+        self.assertEqual('BLD_0_roof_poly', result.polygonId[1], 'Test polygonId')
+        for geom in result.geometry:
+            self.assertIsInstance(geom, Polygon, 'Is a GeoDataFrame of Polygons')
+            self.assertTrue(geom.has_z, 'Is a GeoDataFrame of 3D Polygons')
+
+    def testIterrunFiltered(self):
+        batches = list(CityGMLStreamReader(
+            BytesIO(self.content), bbox=(15, 0, 50, 10),
+            surfaceTypes=['RoofSurface', 'WallSurface'], batchsize=2).iterrun())
+
+        self.assertEqual([2, 2], [len(gdf) for gdf in batches], 'Count rows per batch')
+        self.assertEqual(['BLD_1', 'BLD_1', 'BLD_2', 'BLD_2'],
+                         [_id for gdf in batches for _id in gdf.objectId], 'Test bbox filter')
+        self.assertEqual({'RoofSurface', 'WallSurface'},
+                         {t for gdf in batches for t in gdf.subType}, 'Test surfaceTypes filter')
+
+    def testRunInParallel(self):
+        expected = CityGMLStreamReader(self.inputFile).run()
+        actual = CityGMLStreamReader(self.inputFile, ncpus=2, chunksize=2).run()
+
+        self.assertTrue(expected.drop(columns='geometry').equals(actual.drop(columns='geometry')),
+                        'Test attributes')
+        self.assertTrue(expected.geometry.geom_equals_exact(actual.geometry, 0).all(),
+                        'Test geometries')
+
+
+if __name__ == "__main__":
+    # import sys;sys.argv = ['', 'Test.testName']
+    unittest.main()
@@ -0,0 +1,100 @@
+'''
+Created on 19 Oct. 2026
+
+@author: tleduc
+
+Copyright 2020-2026 Thomas Leduc
+
+This file is part of t4gpd.
+
+t4gpd is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+t4gpd is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with t4gpd.  If not, see <https://www.gnu.org/licenses/>.
+'''
+from os.path import join
+from tempfile import TemporaryDirectory
+import unittest
+
+from numpy.testing import assert_array_equal
+from shapely import LineString, Polygon
+from t4gpd.commons.TestUtils import TestUtils
+from t4gpd.io.ObjLib import ObjLib
+
+
+class ObjLibTest(unittest.TestCase):
+
+    def setUp(self):
+        self.dirName = TemporaryDirectory()
+        self.inputFile = join(self.dirName.name, 'mixed.obj')
+        with open(self.inputFile, 'w') as f:
+            f.write('''# quad, triangle, polyline
+o mixed
+v 0 0 0
+v 1 0 0
+v 1 1 0
+v 0 1 0
+vn 0 0 1
+f 1//1 2//1 3//1 4//1
+v 2 0 1
+f -3/1/1 -1/1/1 2/1/1
+l 1 3 5
+''')
+
+    def tearDown(self):
+        self.dirName.cleanup()
+
+    def testRead(self):
+        vertices, (faceIndices, faceOffsets), (lineIndices, lineOffsets) = ObjLib.read(self.inputFile)
+
+        self.assertEqual((5, 3), vertices.shape, 'Test vertices shape')
+        assert_array_equal([0, 1, 2, 3, 2, 4, 1], faceIndices, 'Test face indices')
+        assert_array_equal([0, 4, 7], faceOffsets, 'Test face offsets')
+        assert_array_equal([0, 2, 4], lineIndices, 'Test line indices')
+        assert_array_equal([0, 3], lineOffsets, 'Test line offsets')
+
+        faces = ObjLib.polygons(vertices, faceIndices, faceOffsets)
+        self.assertTrue(faces[0].equals(Polygon([(0, 0, 0), (1, 0, 0), (1, 1, 0), (0, 1, 0)])), 'Test quad')
+        self.assertTrue(faces[1].equals(Polygon([(1, 1, 0), (2, 0, 1), (1, 0, 0)])), 'Test triangle')
+        lines = ObjLib.linestrings(vertices, lineIndices, lineOffsets)
+        self.assertTrue(lines[0].equals(LineString([(0, 0, 0), (1, 1, 0), (2, 0, 1)])), 'Test polyline')
+
+    def testReadSurfaceWithHole(self):
+        inputFile = TestUtils.getDataSetFilename('tests/data', 'surfaceWithHole.obj')
+        vertices, faces, lines = ObjLib.read(inputFile)
+
+        self.assertEqual((108, 3), vertices.shape, 'Test vertices shape')
+        self.assertEqual(173, len(faces[1]), 'Count faces')
+        self.assertTrue((3 == faces[1][1:] - faces[1][:-1]).all(), 'Is a mesh of triangles')
+        self.assertEqual(1, len(lines[1]), 'Count polylines')
+
+    def testFromGeometriesAndWrite(self):
+        geoms = [Polygon([(0, 0, 0), (1, 0, 0), (1, 1, 1)]),
+                 Polygon([(1, 0, 0), (1, 1, 1), (2, 0, 0), (2, -1, 0)]),
+                 LineString([(0, 0, 0), (1, 1, 1)])]
+        vertices, faces, lines = ObjLib.fromGeometries(geoms)
+
+        self.assertEqual((5, 3), vertices.shape, 'Test vertices deduplication')
+        assert_array_equal([0, 1, 2, 0, 1, 2, 3, 4, 1], faces[0], 'Test face indices')
+        assert_array_equal([0, 4, 9], faces[1], 'Test face offsets')
+        assert_array_equal([0, 2], lines[0], 'Test line indices')
+
+        outputFile = join(self.dirName.name, 'written.obj')
+        ObjLib.write(outputFile, vertices, faces, lines)
+        _vertices, _faces, _lines = ObjLib.read(outputFile)
+        assert_array_equal(vertices, _vertices, 'Test round trip (vertices)')
+        for expected, actual in zip(faces + lines, _faces + _lines):
+            assert_array_equal(expected, actual, 'Test round trip (indices)')
+
+
+if __name__ == "__main__":
+    # import sys;sys.argv = ['', 'Test.testName']
+    unittest.main()
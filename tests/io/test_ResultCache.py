@@ -0,0 +1,105 @@
+'''
+Created on 19 Oct. 2026
+
+@author: tleduc
+
+Copyright 2020-2026 Thomas Leduc
+
+This file is part of t4gpd.
+
+t4gpd is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+t4gpd is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with t4gpd.  If not, see <https://www.gnu.org/licenses/>.
+'''
+from tempfile import TemporaryDirectory
+import unittest
+
+from geopandas import GeoDataFrame
+from numpy import arange
+from numpy.testing import assert_array_equal
+from pandas import DataFrame
+from shapely import Point, box
+from t4gpd.io.ResultCache import ResultCache
+
+
+class RayLengths(object):
+    '''
+    Process with per-row array columns, counting its instantiations
+    '''
+    count = 0
+
+    def __init__(self, viewpoints, nRays):
+        RayLengths.count += 1
+        self.viewpoints, self.nRays = viewpoints, nRays
+
+    def run(self):
+        result = self.viewpoints.copy()
+        result['lengths'] = [arange(self.nRays) * (i + 1.0) for i in range(len(result))]
+        result['footprint'] = result.geometry.buffer(1.0)
+        return result, DataFrame({'nRays': [self.nRays]}, index=['x'])
+
+
+class ResultCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.dirName = TemporaryDirectory()
+        self.viewpoints = GeoDataFrame({'gid': [1, 2]}, geometry=[Point(0, 0), Point(10, 0)],
+                                       crs='epsg:2154')
+        RayLengths.count = 0
+
+    def tearDown(self):
+        self.dirName.cleanup()
+
+    def testRun(self):
+        for fmt in ResultCache.FORMATS:
+            cache = ResultCache(self.dirName.name, format=fmt)
+            expected = cache.run(RayLengths, self.viewpoints, nRays=4)
+            result = cache.run(RayLengths, self.viewpoints.copy(), nRays=4)
+
+            self.assertEqual(1, RayLengths.count, f'Test reuse ({fmt})')
+            self.assertIsInstance(result, tuple, f'Is a tuple ({fmt})')
+            self.assertIsInstance(result[0], GeoDataFrame, f'Is a GeoDataFrame ({fmt})')
+            self.assertEqual(self.viewpoints.crs, result[0].crs, f'Test crs ({fmt})')
+            self.assertEqual(list(expected[0].columns), list(result[0].columns), f'Test columns ({fmt})')
+            assert_array_equal([0.0, 2.0, 4.0, 6.0], result[0].lengths[1], f'Test array column ({fmt})')
+            self.assertTrue(result[0].footprint.geom_equals(expected[0].footprint).all(),
+                            f'Test second geometry column ({fmt})')
+            self.assertEqual(['x'], result[1].index.to_list(), f'Test DataFrame index ({fmt})')
+
+            cache.run(RayLengths, self.viewpoints, nRays=8)
+            self.assertEqual(2, RayLengths.count, f'Test new parameters ({fmt})')
+            moved = self.viewpoints.translate(1.0, 0.0).to_frame('geometry')
+            cache.run(RayLengths, GeoDataFrame(moved.assign(gid=[1, 2])), nRays=8)
+            self.assertEqual(3, RayLengths.count, f'Test new scene ({fmt})')
+
+            cache.clear()
+            RayLengths.count = 0
+
+    def testSaveAndLoad(self):
+        cache = ResultCache(self.dirName.name)
+        key = ResultCache.key(box(0, 0, 1, 1), angles=[1, 2])
+        self.assertNotIn(key, cache, 'Test missing entry')
+        self.assertIsNone(cache.load(key), 'Test missing entry')
+
+        cache.save(key, self.viewpoints)
+        self.assertIn(key, cache, 'Test entry')
+        self.assertTrue(self.viewpoints.geom_equals(cache.load(key)).all(), 'Test single GeoDataFrame')
+
+        with self.assertRaises(Exception):
+            cache.save(key, [self.viewpoints, 1.0])
+        with self.assertRaises(Exception):
+            ResultCache(self.dirName.name, format='csv')
+
+
+if __name__ == "__main__":
+    # import sys;sys.argv = ['', 'Test.testName']
+    unittest.main()
@@ -0,0 +1,79 @@
+'''
+Created on 19 Oct. 2026
+
+@author: tleduc
+
+Copyright 2020-2026 Thomas Leduc
+
+This file is part of t4gpd.
+
+t4gpd is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+t4gpd is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with t4gpd.  If not, see <https://www.gnu.org/licenses/>.
+'''
+from os.path import join
+from tempfile import TemporaryDirectory
+import unittest
+
+from geopandas import GeoDataFrame
+from numpy import load
+from numpy.testing import assert_array_equal
+from shapely import LineString, Polygon
+from t4gpd.io.SalomeWriter import SalomeWriter
+from t4gpd.io.SalomeWriterAndExtruder import SalomeWriterAndExtruder
+
+
+class SalomeWriterTest(unittest.TestCase):
+
+    def setUp(self):
+        self.dirName = TemporaryDirectory()
+        holed = Polygon([(0, 0), (4, 0), (4, 4), (0, 4)], [[(1, 1), (2, 1), (2, 2), (1, 2)]])
+        triangle = Polygon([(5, 5, 1), (6, 5, 1), (6, 6, 1)])
+        self.gdf = GeoDataFrame({'HAUTEUR': [3, 5, 7]},
+                                geometry=[holed, LineString([(0, 0), (1, 1)]), triangle])
+
+    def tearDown(self):
+        self.dirName.cleanup()
+
+    def testRun(self):
+        outputFile = join(self.dirName.name, 'scene.py')
+        SalomeWriter(self.gdf, outputFile, withFaceIds=True).run()
+
+        with load(join(self.dirName.name, 'scene.npz')) as data:
+            self.assertEqual(['xyz', 'ringOffsets', 'polygonOffsets'], data.files, 'Test sidecar arrays')
+            self.assertEqual((14, 3), data['xyz'].shape, 'Test xyz shape')
+            assert_array_equal([0, 5, 10, 14], data['ringOffsets'], 'Test ring offsets')
+            assert_array_equal([0, 2, 3], data['polygonOffsets'], 'Test polygon offsets')
+            assert_array_equal([2, 2, 0], data['xyz'][7], 'Test 2D node')
+
+        with open(outputFile, 'r') as f:
+            script = f.read()
+        self.assertNotIn('geompy.MakeVertex(0', script, 'Test compact script')
+        self.assertIn("addToStudy(face, 'Face_%d' % (p + 1))", script, 'Test face ids')
+        self.assertIn('MakeFuseList(faces)', script, 'Test fuse')
+
+    def testRunWithExtruder(self):
+        outputFile = join(self.dirName.name, 'scene.py')
+        SalomeWriterAndExtruder(self.gdf, outputFile, exportBrep=False).run()
+
+        with load(join(self.dirName.name, 'scene.npz')) as data:
+            assert_array_equal([3, 7], data['elevations'], 'Test elevations')
+        with open(outputFile, 'r') as f:
+            script = f.read()
+        self.assertIn("elevations = data['elevations'].tolist()", script, 'Test elevations loading')
+        self.assertIn('geompy.MakePrism(face', script, 'Test prisms')
+        self.assertNotIn('ExportBREP', script, 'Test no BREP export')
+
+
+if __name__ == "__main__":
+    # import sys;sys.argv = ['', 'Test.testName']
+    unittest.main()
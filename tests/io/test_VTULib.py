@@ -0,0 +1,144 @@
+'''
+Created on 19 Oct. 2026
+
+@author: tleduc
+
+Copyright 2020-2026 Thomas Leduc
+
+This file is part of t4gpd.
+
+t4gpd is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+t4gpd is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with t4gpd.  If not, see <https://www.gnu.org/licenses/>.
+'''
+from base64 import b64decode
+from os.path import exists, join
+import re
+from tempfile import TemporaryDirectory
+import unittest
+
+from geopandas import GeoDataFrame
+from numpy import dtype, frombuffer, uint64
+from numpy.testing import assert_array_equal
+from shapely import LineString, MultiPolygon, Point, Polygon
+from t4gpd.io.VTULib import VTULib
+from t4gpd.io.VTUSeriesWriter import VTUSeriesWriter
+from t4gpd.io.VTUWriter import VTUWriter
+
+
+class VTULibTest(unittest.TestCase):
+
+    def setUp(self):
+        self.dirName = TemporaryDirectory()
+        square = Polygon([(0, 0), (1, 0), (1, 1), (0, 1)])
+        triangle = Polygon([(1, 0), (2, 0), (1, 1)])
+        self.gdf = GeoDataFrame({
+            'gid': [10, 20, 30],
+            'value': [0.5, 1.5, 2.5],
+            'label': ['a', 'b', 'c'],
+            }, geometry=[MultiPolygon([square, triangle]), LineString([(0, 0, 0), (2, 0, 1)]), Point(1, 1)])
+
+    def tearDown(self):
+        self.dirName.cleanup()
+
+    @staticmethod
+    def __read(filename):
+        # Decode the appended arrays of a .vtu file
+        with open(filename, 'rb') as f:
+            content = f.read()
+        xml, _, data = content.partition(b"<AppendedData encoding='")
+        encoding, _, data = data.partition(b"'>\n_")
+        types = {'UInt8': 'u1', 'Int32': 'i4', 'Float32': 'f4', 'Float64': 'f8'}
+
+        result = dict()
+        for attrs in re.findall(r"<DataArray ([^>]*)/>", xml.decode()):
+            attrs = dict(re.findall(r"(\w+)='([^']*)'", attrs))
+            offset = int(attrs['offset'])
+            if b'base64' == encoding:
+                nbytes = int(frombuffer(b64decode(data[offset:offset + 12])[:8], dtype=uint64)[0])
+                block = b64decode(data[offset:offset + 4 * ((8 + nbytes + 2) // 3)])
+            else:
+                nbytes = int(frombuffer(data[offset:offset + 8], dtype=uint64)[0])
+                block = data[offset:offset + 8 + nbytes]
+            result[attrs.get('Name', 'points')] = frombuffer(block[8:], dtype=dtype(types[attrs['type']]))
+        return result
+
+    def testFromGeometries(self):
+        points, connectivity, offsets, types, rowIndex = VTULib.fromGeometries(self.gdf.geometry.values)
+
+        self.assertEqual((6, 3), points.shape, 'Test points shape (shared vertices)')
+        assert_array_equal([0, 1, 2, 3, 0, 1, 4, 2, 1, 0, 5, 2], connectivity, 'Test connectivity')
+        assert_array_equal([5, 9, 11, 12], offsets, 'Test offsets')
+        assert_array_equal([VTULib.VTK_POLYGON, VTULib.VTK_POLYGON, VTULib.VTK_POLY_LINE, VTULib.VTK_VERTEX],
+                           types, 'Test types')
+        assert_array_equal([0, 0, 1, 2], rowIndex, 'Test row index')
+        assert_array_equal([2, 0, 1], points[5], 'Test 3D point')
+
+        cellData = VTULib.cellData(self.gdf, rowIndex)
+        self.assertEqual(['gid', 'value'], list(cellData), 'Test cell data fields')
+        assert_array_equal([10, 10, 20, 30], cellData['gid'], 'Test cell data values')
+
+    def testWrite(self):
+        points, connectivity, offsets, types, rowIndex = VTULib.fromGeometries(self.gdf.geometry.values)
+        cellData = VTULib.cellData(self.gdf, rowIndex)
+
+        for encoding in ['raw', 'base64']:
+            outputFile = join(self.dirName.name, f'{encoding}.vtu')
+            VTULib.write(outputFile, points, connectivity, offsets, types, cellData, encoding)
+            arrays = VTULibTest.__read(outputFile)
+
+            assert_array_equal(points.ravel(), arrays['points'], f'Test points ({encoding})')
+            assert_array_equal(connectivity, arrays['connectivity'], f'Test connectivity ({encoding})')
+            assert_array_equal(offsets, arrays['offsets'], f'Test offsets ({encoding})')
+            assert_array_equal(types, arrays['types'], f'Test types ({encoding})')
+            assert_array_equal([10, 10, 20, 30], arrays['gid'], f'Test gid ({encoding})')
+            assert_array_equal([0.5, 0.5, 1.5, 2.5], arrays['value'], f'Test value ({encoding})')
+
+        with self.assertRaises(Exception):
+            VTULib.write(outputFile, points, connectivity, offsets, types, cellData, 'binary')
+
+    def testVTUWriter(self):
+        outputFile = join(self.dirName.name, 'ascii.vtu')
+        VTUWriter(self.gdf, outputFile).run()
+        with open(outputFile, 'r') as f:
+            content = f.read()
+        self.assertIn("NumberOfPoints='6' NumberOfCells='4'", content, 'Test piece')
+        self.assertIn("\n10 10 20 30\n", content, 'Test ascii cell data')
+        self.assertNotIn('AppendedData', content, 'Test ascii')
+
+        outputFile = join(self.dirName.name, 'raw.vtu')
+        VTUWriter(self.gdf, outputFile, encoding='raw').run()
+        assert_array_equal([5, 9, 11, 12], VTULibTest.__read(outputFile)['offsets'], 'Test raw offsets')
+
+    def testVTUSeriesWriter(self):
+        outputFile = join(self.dirName.name, 'series.pvd')
+        values = [[1.0, 2.0], [3.0, 4.0], [5.0, 6.0]]
+        filenames = VTUSeriesWriter(self.gdf, outputFile, values, fieldname='tmrt',
+                                    timesteps=[0.5, 1.5]).run()
+
+        self.assertEqual([join(self.dirName.name, f'series_{i}.vtu') for i in range(2)], filenames,
+                         'Test filenames')
+        self.assertTrue(all([exists(fn) for fn in filenames]), 'Test .vtu files')
+        assert_array_equal([1.0, 1.0, 3.0, 5.0], VTULibTest.__read(filenames[0])['tmrt'], 'Test 1st time step')
+        assert_array_equal([2.0, 2.0, 4.0, 6.0], VTULibTest.__read(filenames[1])['tmrt'], 'Test 2nd time step')
+
+        with open(outputFile, 'r') as f:
+            content = f.read()
+        self.assertIn("<DataSet timestep='1.5' group='' part='0' file='series_1.vtu'/>", content, 'Test PVD')
+
+        filenames = VTUSeriesWriter(self.gdf, outputFile, ['gid', 'value']).run()
+        assert_array_equal([0.5, 0.5, 1.5, 2.5], VTULibTest.__read(filenames[1])['values'], 'Test field names')
+
+
+if __name__ == "__main__":
+    # import sys;sys.argv = ['', 'Test.testName']
+    unittest.main()
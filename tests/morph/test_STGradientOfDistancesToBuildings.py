@@ -96,6 +96,17 @@ class STGradientOfDistancesToBuildingsTest(unittest.TestCase):
         # result2.to_file('/tmp/xx2.shp')
         # result3.to_file('/tmp/xx3.shp')
 
+    def testRunWithDx(self):
+        expected1, _, _ = STGradientOfDistancesToBuildings(
+            self.lines, self.buildings, sampleDist=10.0, threshold=0.05, order=1).run()
+        result1, result2, _ = STGradientOfDistancesToBuildings(
+            self.lines, self.buildings, sampleDist=10.0, threshold=0.05, order=1, dx=0.25).run()
+
+        self.assertIsInstance(result1, GeoDataFrame, 'Is a GeoDataFrame')
+        self.assertEqual(154, len(result1), 'Count rows')
+        self.assertEqual(154, len(result2), 'Count rows')
+        self.assertLessEqual((expected1.r - result1.r).abs().max(), 0.25, 'Test "r" attribute values')
+
 
 if __name__ == "__main__":
     # import sys;sys.argv = ['', 'Test.testName']
@@ -0,0 +1,152 @@
+"""
+Created on 19 oct. 2026
+
+@author: tleduc
+
+Copyright 2020-2026 Thomas Leduc
+
+This file is part of t4gpd.
+
+t4gpd is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+t4gpd is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with t4gpd.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import gzip
+import unittest
+from datetime import datetime, timedelta
+from geopandas import GeoDataFrame
+from numpy import array, cos, isnan, pi, sin
+from numpy.testing import assert_allclose
+from os import utime
+from os.path import getmtime, isfile
+from pandas import Timestamp, date_range
+from shapely import Point
+from tempfile import TemporaryDirectory
+from t4gpd.resilientgaia.STSP3GnssReader import STSP3GnssReader
+
+
+class STSP3GnssReaderTest(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = TemporaryDirectory()
+        self.sp3file = f"{self.tmpdir.name}/TEST.SP3.gz"
+        self.dt0, self.nepochs, self.step = datetime(2024, 12, 18), 48, 900
+        self.satNames = ["G01", "R07", "E15"]
+
+        lines = ["#dP2024 12 18  0  0  0.00000000      48 ORBIT IGS20 HLM  COD"]
+        for k in range(self.nepochs):
+            dt = self.dt0 + timedelta(seconds=k * self.step)
+            lines.append(
+                f"*  {dt.year:4d} {dt.month:2d} {dt.day:2d} {dt.hour:2d} {dt.minute:2d} {dt.second:11.8f}"
+            )
+            for i, satName in enumerate(self.satNames):
+                x, y, z = 1e-3 * self.__orbit(k * self.step, i)
+                if (3, "G01") == (k, satName):
+                    x, y, z = 0.0, 0.0, 0.0
+                lines.append(f"P{satName}{x:14.6f}{y:14.6f}{z:14.6f}{-5.440231:14.6f}")
+        lines.append("EOF")
+        with gzip.open(self.sp3file, "wt") as f:
+            f.write("\n".join(lines) + "\n")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    @staticmethod
+    def __orbit(seconds, i):
+        # Circular orbit, in meters
+        R, T, inc = 26560e3, 43080.0, 0.96 + 0.1 * i
+        w = 2 * pi * seconds / T + i
+        return array([R * cos(w), R * sin(w) * cos(inc), R * sin(w) * sin(inc)])
+
+    def testRead(self):
+        actual = STSP3GnssReader._read(self.sp3file, cache=False)
+        self.assertEqual((self.nepochs * 3, 5), actual.shape, "Test read (shape)")
+        self.assertEqual(
+            ["sat_dt", "sat_name", "x", "y", "z"],
+            actual.columns.to_list(),
+            "Test read (columns)",
+        )
+        self.assertEqual("UTC", str(actual.sat_dt.dt.tz), "Test read (time zone)")
+
+        row = actual.query("sat_name == 'E15'").iloc[5]
+        self.assertEqual(
+            self.dt0 + timedelta(seconds=5 * self.step),
+            row.sat_dt.to_pydatetime().replace(tzinfo=None),
+            "Test read (sat_dt)",
+        )
+        assert_allclose(
+            row[["x", "y", "z"]].to_numpy(dtype=float),
+            self.__orbit(5 * self.step, 2),
+            atol=1e-3,
+        )
+
+    def testReadCache(self):
+        cachefile = f"{self.sp3file}.parquet"
+        expected = STSP3GnssReader._read(self.sp3file, cache=False)
+        self.assertFalse(isfile(cachefile), "Test no cache file")
+
+        actual1 = STSP3GnssReader._read(self.sp3file)
+        self.assertTrue(isfile(cachefile), "Test cache file")
+        # The cache file, newer than the SP3 file, is read instead of it
+        mtime = getmtime(self.sp3file)
+        with gzip.open(self.sp3file, "wt") as f:
+            f.write("")
+        utime(self.sp3file, (mtime, mtime))
+        actual2 = STSP3GnssReader._read(self.sp3file)
+        for actual in [actual1, actual2]:
+            self.assertTrue(expected.equals(actual), "Test read with cache")
+
+    def testInterpolate(self):
+        sat_positions = STSP3GnssReader._read(self.sp3file, cache=False)
+        seconds = array([0.0, 1234.5, 7 * 900, 20000.0, 47 * 900, 47 * 900 + 1])
+        dts = [Timestamp(self.dt0 + timedelta(seconds=s), tz="UTC") for s in seconds]
+
+        satNames, actual = STSP3GnssReader._interpolate(sat_positions, dts, order=9)
+        self.assertEqual(sorted(self.satNames), satNames, "Test satellite names")
+        self.assertEqual((6, 3, 3), actual.shape, "Test interpolation (shape)")
+
+        for i, satName in enumerate(self.satNames):
+            j = satNames.index(satName)
+            for k, s in enumerate(seconds[:-1]):
+                if ("G01" == satName) and (8 * 900 >= s):
+                    # Null position at the 4th epoch, within the 10 epochs window
+                    self.assertTrue(isnan(actual[k, j]).all(), "Test null position")
+                else:
+                    assert_allclose(actual[k, j], self.__orbit(s, i), atol=1e-2)
+        self.assertTrue(isnan(actual[-1]).all(), "Test outside the time span")
+
+    def testRun(self):
+        dts = date_range("2024-12-18 01:00:07", periods=40, freq="7min", tz="UTC")
+        sensors = GeoDataFrame(
+            {
+                "timeUTC": dts,
+                "geometry": [Point(355000 + 10 * i, 6689000) for i in range(40)],
+            },
+            crs="epsg:2154",
+        )
+        for interpolation in ["lagrange", "nearest"]:
+            actual = STSP3GnssReader(
+                sensors, "timeUTC", self.sp3file, interpolation=interpolation, cache=False
+            ).run()
+            self.assertIsInstance(actual, GeoDataFrame, "Test run (type)")
+            self.assertEqual(sensors.crs, actual.crs, "Test run (crs)")
+            self.assertEqual(3 + 94 * 6, len(actual.columns), "Test run (columns)")
+            self.assertLessEqual(len(actual), len(sensors), "Test run (rows)")
+            self.assertTrue(0 <= actual.filter(like="_el").min().min(), "Test el")
+
+        lagrange = STSP3GnssReader(sensors, "timeUTC", self.sp3file, cache=False).run()
+        lagrange = lagrange.dropna(axis=1, how="all")
+        self.assertIn("R07_az", lagrange, "Test visible satellite")
+        self.assertIn("satcoordX_R07", lagrange, "Test satellite coordinates")
+
+
+if __name__ == "__main__":
+    unittest.main()
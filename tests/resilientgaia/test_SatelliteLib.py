@@ -22,6 +22,9 @@ along with t4gpd.  If not, see <https://www.gnu.org/licenses/>.
 '''
 import unittest
 
+from numpy import array, isnan, nan
+from numpy.testing import assert_allclose
+from pymap3d.aer import ecef2aer
 from t4gpd.resilientgaia.SatelliteLib import SatelliteLib
 
 
@@ -52,6 +55,30 @@ class SatelliteLibTest(unittest.TestCase):
             actual = SatelliteLib.get_satellite_name(satName)
             self.assertEqual(actual, expected, "Test get_satellite_name")
 
+    def testEcef2aer(self):
+        # 2 sensors x 3 satellites, the last one being absent
+        x = array([[15064118.05, 6682831.63, nan], [23302373.04, -6685543.51, nan]])
+        y = array([[-8547444.10, 14340237.09, nan], [-12300917.41, -13429837.82, nan]])
+        z = array([[19972116.83, 21826961.10, nan], [-3009605.63, 21928089.97, nan]])
+        lat0, lon0, h0 = array([[47.156], [47.216]]), array([[-1.640], [-1.539]]), 31.0
+
+        az, el, srange = SatelliteLib.ecef2aer(x, y, z, lat0, lon0, h0)
+        self.assertEqual((2, 3), az.shape, "Test shape")
+        self.assertTrue(isnan(az[:, 2]).all(), "Test absent satellite (az)")
+        self.assertTrue(isnan(el[:, 2]).all(), "Test absent satellite (el)")
+        self.assertTrue(isnan(srange[:, 2]).all(), "Test absent satellite (sr)")
+
+        for i in range(2):
+            for j in range(2):
+                expected = ecef2aer(
+                    x[i, j], y[i, j], z[i, j], lat0[i, 0], lon0[i, 0], h0,
+                    ell=SatelliteLib.WGS84, deg=True,
+                )
+                actual = (az[i, j], el[i, j], srange[i, j])
+                assert_allclose(actual, expected, rtol=1e-12)
+        self.assertAlmostEqual(286.37, az[0, 0], places=1, msg="Test az value")
+        self.assertAlmostEqual(65.65, el[0, 0], places=1, msg="Test el value")
+
 
 if __name__ == "__main__":
     # import sys; sys.argv = ['', 'Test.testRun']